@@ -0,0 +1,116 @@
+import argparse
+import collections.abc
+import json
+import pathlib
+import sys
+import time
+import zlib
+
+import lxml.html
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import ocremixdata
+
+# saved remix pages with the parts of the site around them, including pages with
+# several artists, lyrics, and no game link; expected.json has what each one
+# parses to
+PAGES = pathlib.Path(__file__).resolve().parent / "pages"
+
+
+def parse_per_field(html: lxml.html.HtmlElement) -> dict:
+    # the page dict as it was built before parse_remix_page did a single pass
+    primary_game = ocremixdata.parse_remix_primary_game(html)
+    return {
+        "artists": ocremixdata.parse_remix_artists(html),
+        "game": primary_game,
+        "remix": {
+            "download_url": ocremixdata.parse_download_url(html),
+            "has_lyrics": 1 if ocremixdata.parse_has_lyrics(html) else 0,
+            "primary_game": primary_game.get("name"),
+            "primary_game_id": primary_game.get("id"),
+            "title": ocremixdata.parse_remix_title(html),
+            "youtube_url": ocremixdata.parse_youtube_url(html),
+        },
+        "tags": ocremixdata.parse_remix_tags(html),
+    }
+
+
+def get_outcome(
+    parser: collections.abc.Callable, tree: lxml.html.HtmlElement
+) -> object:
+    # the page dict, or the name of the error for a page that cannot be parsed
+    try:
+        return parser(tree)
+    except (AttributeError, IndexError, TypeError, ValueError) as e:
+        return type(e).__name__
+
+
+def get_pages(source: pathlib.Path) -> list[tuple[str, bytes]]:
+    # a directory of saved pages, or a page archive (.cache/pages.db)
+    if source.is_dir():
+        return [(p.name, p.read_bytes()) for p in sorted(source.glob("*.html"))]
+    archive = ocremixdata.get_archive_cnx(source)
+    pages = [
+        (f"OCR{remix_id:05}", zlib.decompress(body))
+        for remix_id, _, body in ocremixdata.get_archived_pages(archive)
+    ]
+    archive.close()
+    return pages
+
+
+def time_parser(parser: collections.abc.Callable, trees: list, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for tree in trees:
+            parser(tree)
+    return len(trees) * rounds / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare parse_remix_page with the per-field parse functions"
+    )
+    parser.add_argument(
+        "pages",
+        default=PAGES,
+        help="a directory of saved remix pages (*.html) or a page archive "
+        "(.cache/pages.db); by default the saved pages in benchmarks/pages",
+        nargs="?",
+        type=pathlib.Path,
+    )
+    parser.add_argument("--rounds", default=5, type=int)
+    args = parser.parse_args()
+
+    pages = get_pages(args.pages)
+    if not pages:
+        print(f"No pages in {args.pages}")
+        return 1
+    expected = {}
+    if (args.pages / "expected.json").is_file():
+        expected = json.loads((args.pages / "expected.json").read_text())
+
+    mismatches = 0
+    trees = []
+    for name, body in pages:
+        tree = lxml.html.fromstring(body)
+        outcome = get_outcome(ocremixdata.parse_remix_page, tree)
+        if outcome != get_outcome(parse_per_field, tree):
+            print(f"Mismatch: {name}")
+            mismatches += 1
+        elif name in expected and outcome != expected.get(name):
+            print(f"Not what was expected: {name}")
+            mismatches += 1
+        if isinstance(outcome, dict):
+            trees.append(tree)
+    print(f"{len(pages)} pages, {mismatches} mismatches")
+
+    single = time_parser(ocremixdata.parse_remix_page, trees, args.rounds)
+    per_field = time_parser(parse_per_field, trees, args.rounds)
+    print(f"parse_remix_page: {single:,.0f} pages/sec")
+    print(f"per-field:        {per_field:,.0f} pages/sec ({single / per_field:.2f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import argparse
+import datetime
+import heapq
+import pathlib
+import random
+import statistics
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import ocremixdata
+
+# how often simulated ReMixes change: most never do once published, some get
+# an occasional fix, and a few (usually new ones) are edited every week or two
+CHANGE_RATES = (
+    (0.80, 0.0),
+    (0.15, 1 / 180),
+    (0.05, 1 / 10),
+)
+
+
+def pick_oldest(
+    checks: list[ocremixdata.RemixCheck], limit: int, now: datetime.datetime
+) -> list[int]:
+    # the same choice as get_remix_ids_first_imported
+    return [
+        check.remix_id
+        for check in heapq.nsmallest(limit, checks, key=lambda c: c.check_datetime)
+    ]
+
+
+def simulate(args: argparse.Namespace, policy: str) -> dict:
+    rng = random.Random(args.seed)  # noqa: S311
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    hour = datetime.timedelta(hours=1)
+    max_age = datetime.timedelta(days=args.max_age)
+
+    # start from a round-robin state: checked once each over the last cycle, with
+    # no change history yet
+    cycle = args.remixes / args.budget
+    rates = []
+    checked = []
+    for i in range(args.remixes):
+        roll = rng.random()
+        for share, rate in CHANGE_RATES:
+            if roll < share:
+                break
+            roll -= share
+        rates.append(rate / 24)
+        checked.append(start - hour * (cycle * i / args.remixes))
+    next_change = [start + hour * rng.expovariate(r) if r else None for r in rates]
+    checks = [
+        ocremixdata.RemixCheck(i, t.isoformat(), None, 0) for i, t in enumerate(checked)
+    ]
+
+    delays = []
+    gaps = []
+    for step in range(1, int(args.days * 24) + 1):
+        now = start + hour * step
+        if policy == "oldest":
+            picked = pick_oldest(checks, args.budget, now)
+        else:
+            picked = ocremixdata.make_check_schedule(
+                checks, args.budget, now, max_age=max_age
+            )
+        for i in picked:
+            changed = next_change[i] is not None and next_change[i] <= now
+            if changed:
+                delays.append((now - next_change[i]) / hour)
+                next_change[i] = now + hour * rng.expovariate(rates[i])
+            gaps.append((now - checked[i]) / hour)
+            checked[i] = now
+            check = checks[i]
+            checks[i] = check._replace(
+                check_datetime=now.isoformat(),
+                first_check_datetime=check.first_check_datetime or now.isoformat(),
+                changes=check.changes + changed,
+            )
+    end = start + hour * int(args.days * 24)
+    missed = [(end - t) / hour for t in next_change if t is not None and t <= end]
+    return {
+        "changes found": len(delays),
+        "changes pending at end": len(missed),
+        "mean delay (days)": statistics.fmean(delays) / 24 if delays else 0,
+        "median delay (days)": statistics.median(delays) / 24 if delays else 0,
+        "90th percentile delay (days)": (
+            statistics.quantiles(delays, n=10)[-1] / 24 if len(delays) > 1 else 0
+        ),
+        "longest gap between checks (days)": max(gaps, default=0) / 24,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare refresh policies for the update job on a simulated "
+        "catalogue"
+    )
+    parser.add_argument("--budget", default=10, help="checks per hour", type=int)
+    parser.add_argument("--days", default=60.0, type=float)
+    parser.add_argument("--max-age", default=30.0, type=float)
+    parser.add_argument("--remixes", default=4900, type=int)
+    parser.add_argument("--seed", default=1, type=int)
+    args = parser.parse_args()
+
+    results = {policy: simulate(args, policy) for policy in ("oldest", "adaptive")}
+    print(f"{'':36} {'oldest':>10} {'adaptive':>10}")
+    for name in results.get("oldest"):
+        oldest = results.get("oldest").get(name)
+        adaptive = results.get("adaptive").get(name)
+        print(f"{name:36} {oldest:>10,.2f} {adaptive:>10,.2f}")
+
+
+if __name__ == "__main__":
+    main()
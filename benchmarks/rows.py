@@ -0,0 +1,141 @@
+import argparse
+import collections
+import collections.abc
+import contextlib
+import io
+import os
+import pathlib
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest.mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import ocremixdata
+
+# the tags of every ReMix, the biggest of the child streams build-pages reads
+SQL = """
+    select rt.remix_id, t.id, t.path, t.url
+    from remix_tag rt join tag t on t.id = rt.tag_id
+    order by rt.remix_id, rt.tag_id
+"""
+
+
+def uncached_namedtuple_factory(cursor: sqlite3.Cursor, row: tuple) -> tuple:
+    # what namedtuple_factory did before: a new class for every row
+    fields = [column[0] for column in cursor.description]
+    return collections.namedtuple("Row", fields)(*row)
+
+
+def uncached_execute_records(
+    cnx: sqlite3.Connection,
+    record: type,
+    sql: str,
+    params: dict | None = None,
+    *,
+    keyed: bool = False,
+) -> sqlite3.Cursor:
+    # what the queries returned before the records: a new class for every row, with
+    # the parent id as the first column of a child row
+    del record
+    cursor = cnx.cursor()
+    if keyed:
+        cursor.row_factory = lambda c, row: (
+            row[0],
+            collections.namedtuple("Row", [d[0] for d in c.description[1:]])(*row[1:]),
+        )
+    else:
+        cursor.row_factory = uncached_namedtuple_factory
+    return cursor.execute(sql, params or {})
+
+
+def time_build_pages(repeat: int, *, uncached: bool) -> float:
+    # the best time for a full build-pages without compression, so the time spent
+    # on rows is not hidden behind gzip and brotli; the first run only fills the
+    # cache directory with a snapshot
+    patches = {}
+    if uncached:
+        patches = {
+            "execute_records": uncached_execute_records,
+            "namedtuple_factory": uncached_namedtuple_factory,
+        }
+    best = None
+    with (
+        tempfile.TemporaryDirectory() as work,
+        unittest.mock.patch.dict(os.environ, {"OCREMIX_DATA_CACHE": work}),
+        unittest.mock.patch.dict(vars(ocremixdata), patches),
+    ):
+        output = pathlib.Path(work) / "output"
+        argv = ["build-pages", "--full", "--no-compress", "-d", str(output)]
+        with unittest.mock.patch.object(sys, "argv", ["ocremixdata.py", *argv]):
+            args = ocremixdata.parse_args()
+        for i in range(repeat + 1):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                args.func(args)
+                elapsed = time.perf_counter() - start
+            if i:
+                best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_rows(
+    cnx: sqlite3.Connection, repeat: int, execute: collections.abc.Callable
+) -> tuple[int, float]:
+    # the number of rows, and the best time per row over repeat runs
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = execute(cnx).fetchall()
+        elapsed = (time.perf_counter() - start) / len(rows)
+        best = elapsed if best is None else min(best, elapsed)
+    return len(rows), best
+
+
+def with_factory(factory: collections.abc.Callable | None) -> collections.abc.Callable:
+    def execute(cnx: sqlite3.Connection) -> sqlite3.Cursor:
+        cursor = cnx.cursor()
+        cursor.row_factory = factory
+        return cursor.execute(SQL)
+
+    return execute
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the row factories over the join of every ReMix with its "
+        "tags, and a full build-pages, before and after namedtuple classes were "
+        "cached and queries returned records"
+    )
+    parser.add_argument("--repeat", default=5, type=int, help="the best run counts")
+    parser.add_argument(
+        "--builds",
+        default=3,
+        type=int,
+        help="the best of this many build-pages runs counts, 0 to skip them",
+    )
+    args = parser.parse_args()
+
+    cnx = sqlite3.connect(":memory:")
+    ocremixdata.read_source(cnx, ocremixdata.get_data_source())
+    cases = {
+        "plain tuples": with_factory(None),
+        "uncached namedtuple": with_factory(uncached_namedtuple_factory),
+        "namedtuple_factory": with_factory(ocremixdata.namedtuple_factory),
+        "execute_records": lambda cnx: ocremixdata.execute_records(
+            cnx, ocremixdata.Tag, SQL, keyed=True
+        ),
+    }
+    for name, execute in cases.items():
+        count, seconds = time_rows(cnx, args.repeat, execute)
+        print(f"{name:20} {count:>8,} rows {seconds * 1e6:>8.2f} us/row")
+    if args.builds:
+        for name, uncached in (("uncached namedtuple", True), ("records", False)):
+            seconds = time_build_pages(args.builds, uncached=uncached)
+            print(f"{name:20} build-pages {seconds:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import html
+import pathlib
+import sqlite3
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import ocremixdata
+
+# copy k of an artist or game gets id + k * offset, where offset is the power of
+# ten above the largest id; copies of ReMixes follow on from the last id, so the
+# ids stay dense like the real catalogue
+_SQL_COPY = (
+    """
+        insert into artist (id, name, url)
+        select id + :k * :artist_offset, name || ' ' || (:k + 1),
+            'https://ocremix.org/artist/' || (id + :k * :artist_offset) || '/copy'
+        from artist where id < :artist_offset
+    """,
+    """
+        insert into game (id, name, url)
+        select id + :k * :game_offset, name || ' ' || (:k + 1),
+            'https://ocremix.org/game/' || (id + :k * :game_offset) || '/copy'
+        from game where id < :game_offset
+    """,
+    """
+        insert into tag (id, path, url)
+        select id || '-' || :k, path || ' ' || (:k + 1),
+            url || '-' || :k
+        from tag where rowid <= :tag_rows
+    """,
+    """
+        insert into remix (
+            id, title, primary_game, import_datetime, youtube_url, primary_game_id,
+            download_url, has_lyrics
+        )
+        select id + :k * :remix_offset, title || ' ' || (:k + 1),
+            primary_game || ' ' || (:k + 1), import_datetime, youtube_url,
+            primary_game_id + :k * :game_offset,
+            replace(download_url, '_OC_ReMix', '_' || (:k + 1) || '_OC_ReMix'),
+            has_lyrics
+        from remix where id <= :remix_offset
+    """,
+    # one link in ten goes to the same artist in another copy, so the artists of
+    # each copy also appear next to artists of other copies
+    """
+        insert into remix_artist (remix_id, artist_id, _synced)
+        select remix_id + :k * :remix_offset,
+            artist_id + :artist_offset * case
+                when (remix_id * 7919 + artist_id) % 10 = 0
+                then (:k + 1 + remix_id % (:factor - 1)) % :factor
+                else :k
+            end,
+            _synced
+        from remix_artist where remix_id <= :remix_offset
+    """,
+    """
+        insert into remix_tag (remix_id, tag_id, _synced)
+        select remix_id + :k * :remix_offset, tag_id || '-' || :k, _synced
+        from remix_tag where remix_id <= :remix_offset
+    """,
+)
+
+
+def get_offset(cnx: sqlite3.Connection, table: str) -> int:
+    max_id = cnx.execute(f"select max(id) from {table}").fetchone()[0] or 0  # noqa: S608
+    return 10 ** len(str(max_id))
+
+
+def make_scaled_cnx(source: sqlite3.Connection, factor: int) -> sqlite3.Connection:
+    # every artist, game, tag and ReMix is copied factor - 1 times, along with the
+    # links between them, so the counts go up by factor and each copy keeps the
+    # real number of artists and tags per ReMix and ReMixes per artist and tag
+    cnx = sqlite3.connect(":memory:")
+    source.backup(cnx)
+    params = {
+        "artist_offset": get_offset(cnx, "artist"),
+        "factor": factor,
+        "game_offset": get_offset(cnx, "game"),
+        "remix_offset": cnx.execute("select max(id) from remix").fetchone()[0],
+        "tag_rows": cnx.execute("select max(rowid) from tag").fetchone()[0],
+    }
+    cnx.execute("begin")
+    for k in range(1, factor):
+        for sql in _SQL_COPY:
+            cnx.execute(sql, params | {"k": k})
+    cnx.commit()
+    return cnx
+
+
+def render_remix_page(cnx: sqlite3.Connection, ocr_id: int) -> str:
+    # a page with the markup parse_remix_page reads on ocremix.org, for when
+    # there are no saved pages to use
+    e = html.escape
+    remix = ocremixdata.get_remix_data(cnx, ocr_id)
+    game_url = cnx.execute(
+        "select url from game where id = (select primary_game_id from remix where id = ?)",
+        (ocr_id,),
+    ).fetchone()[0]
+    game_link = (
+        f'<a href="{e(game_url.removeprefix("https://ocremix.org"))}">'
+        f"{e(remix.get('primary_game'))}</a>"
+    )
+    lines = [
+        "<html><body>",
+        f'<h1>ReMix: {game_link} "{e(remix.get("title"))}" </h1>',
+        "<h2>By "
+        + ", ".join(
+            f'<a href="{e(a.get("url").removeprefix("https://ocremix.org"))}">'
+            f"{e(a.get('name'))}</a>"
+            for a in remix.get("artists")
+        )
+        + "</h2>",
+    ]
+    if remix.get("has_lyrics"):
+        lines.append('<a href="#tab-lyrics">Lyrics</a>')
+    if remix.get("youtube_url"):
+        lines.append(f'<a data-preview="{e(remix.get("youtube_url"))}">YouTube</a>')
+    lines.append(
+        f'<div id="modalDownload"><ul><li><a href="{e(remix.get("download_url"))}">'
+        "Download</a></li></ul></div>"
+    )
+    lines.extend(
+        f'<a href="{e(t.get("url").removeprefix("https://ocremix.org"))}" '
+        f'title=" {e(t.get("path"))} ">{e(t.get("id"))}</a>'
+        for t in remix.get("tags")
+    )
+    lines.append("</body></html>")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Write a copy of the local data with factor times the ReMixes, "
+        "artists, games and tags"
+    )
+    parser.add_argument("factor", type=int, help="for example 10 or 100")
+    parser.add_argument(
+        "target",
+        type=pathlib.Path,
+        help="a .sql file to write a single-file dump, or a directory to write "
+        "shards to",
+    )
+    parser.add_argument(
+        "--pages",
+        type=pathlib.Path,
+        help="also write a page for every ReMix in the local data to this directory",
+    )
+    args = parser.parse_args()
+
+    source = sqlite3.connect(":memory:")
+    source.row_factory = ocremixdata.namedtuple_factory
+    ocremixdata.read_source(source, ocremixdata.get_data_source())
+    cnx = make_scaled_cnx(source, args.factor)
+    cnx.row_factory = ocremixdata.namedtuple_factory
+    if args.target.suffix == ".sql":
+        ocremixdata.write_dump(cnx, args.target)
+    else:
+        ocremixdata.write_shards(cnx, args.target)
+    counts = {
+        table: cnx.execute(f"select count(*) n from {table}").fetchone().n  # noqa: S608
+        for table in ("remix", "artist", "game", "tag", "remix_artist", "remix_tag")
+    }
+    print(", ".join(f"{count:,} {table}" for table, count in counts.items()))
+    if args.pages:
+        args.pages.mkdir(parents=True, exist_ok=True)
+        for (ocr_id,) in source.execute("select id from remix"):
+            target = args.pages / f"OCR{ocr_id:05}.html"
+            target.write_text(render_remix_page(cnx, ocr_id), encoding="utf_8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import http.client
+import pathlib
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import ocremixdata
+
+# throughput target: with the server and this client sharing a single core, serve
+# should keep up at least 900 requests/s from the LRU cache, with or without gzip;
+# that is the hot set, a few paths that all fit in the cache. The cold set is
+# every remix and tag, more paths than the default cache holds, so most requests
+# encode a response again
+
+
+def get_paths() -> list[str]:
+    cnx = ocremixdata.get_cnx()
+    paths = [
+        f"/remix/OCR{row[0]:05}.json" for row in cnx.execute("select id from remix")
+    ]
+    paths.extend(f"/tag/{row[0]}.json" for row in cnx.execute("select id from tag"))
+    cnx.close()
+    return paths
+
+
+def run_client(
+    args: argparse.Namespace, paths: list[str], seed: int, latencies: list[float]
+) -> None:
+    # one keep-alive connection making requests back to back until the time is up
+    rng = random.Random(seed)  # noqa: S311
+    headers = {"Accept-Encoding": "gzip"} if args.gzip else {}
+    conn = http.client.HTTPConnection(args.host, args.port)
+    end = time.perf_counter() + args.duration
+    while (start := time.perf_counter()) < end:
+        conn.request("GET", rng.choice(paths), headers=headers)
+        response = conn.getresponse()
+        response.read()
+        if response.status != 200:
+            msg = f"{response.status} {response.reason}"
+            raise RuntimeError(msg)
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run_load(args: argparse.Namespace, paths: list[str]) -> None:
+    results = [[] for _ in range(args.connections)]
+    threads = [
+        threading.Thread(target=run_client, args=(args, paths, args.seed + i, result))
+        for i, result in enumerate(results)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for result in results for latency in result)
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"  paths:         {len(paths):,}")
+    print(f"  requests:      {len(latencies):,}")
+    print(f"  requests/s:    {len(latencies) / elapsed:,.0f}")
+    print(f"  p50 latency:   {percentiles[49] * 1000:.2f} ms")
+    print(f"  p99 latency:   {percentiles[98] * 1000:.2f} ms")
+
+
+def warm(args: argparse.Namespace, paths: list[str]) -> None:
+    # one request for every path, so the hot set is in the cache before timing
+    headers = {"Accept-Encoding": "gzip"} if args.gzip else {}
+    conn = http.client.HTTPConnection(args.host, args.port)
+    for path in paths:
+        conn.request("GET", path, headers=headers)
+        conn.getresponse().read()
+    conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load test a running `ocremixdata.py serve` with random remix and "
+        "tag requests"
+    )
+    parser.add_argument("--connections", default=8, type=int)
+    parser.add_argument("--duration", default=10.0, type=float)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument(
+        "--hot-paths",
+        default=256,
+        type=int,
+        help="the size of the hot set, which has to fit in the cache of the server",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", default=8000, type=int)
+    parser.add_argument("--seed", default=1, type=int)
+    args = parser.parse_args()
+
+    paths = get_paths()
+    rng = random.Random(args.seed)  # noqa: S311
+    hot = rng.sample(paths, min(args.hot_paths, len(paths)))
+    warm(args, hot)
+    print("hot set (cache hits):")
+    run_load(args, hot)
+    print("cold set (every remix and tag):")
+    run_load(args, paths)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+import argparse
+import collections.abc
+import contextlib
+import datetime
+import io
+import json
+import os
+import pathlib
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+
+import lxml.html
+import scale
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import ocremixdata
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def get_pages(
+    source: pathlib.Path | None, cnx: sqlite3.Connection
+) -> tuple[str, list[tuple[int, str]]]:
+    # saved pages from a directory of OCRnnnnn.html files or a page archive, or
+    # pages rendered from the data when there are none
+    if source is not None and source.is_dir():
+        return str(source), [
+            (int(p.stem.removeprefix("OCR")), p.read_text(encoding="utf_8"))
+            for p in sorted(source.glob("OCR*.html"))
+        ]
+    if source is not None:
+        archive = ocremixdata.get_archive_cnx(source)
+        pages = [
+            (remix_id, zlib.decompress(body).decode())
+            for remix_id, _, body in ocremixdata.get_archived_pages(archive)
+        ]
+        archive.close()
+        return str(source), pages
+    sql = "select id from remix order by id limit 1000"
+    return "rendered", [
+        (row.id, scale.render_remix_page(cnx, row.id)) for row in cnx.execute(sql)
+    ]
+
+
+def time_best(
+    func: collections.abc.Callable,
+    repeat: int,
+    setup: collections.abc.Callable | None = None,
+) -> float:
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(args: argparse.Namespace, work: pathlib.Path) -> dict:
+    # the data is written in the same format as the repository has it
+    os.chdir(ROOT)
+    source = ocremixdata.get_data_source()
+    target = work / source.name
+    cnx = sqlite3.connect(":memory:")
+    cnx.row_factory = ocremixdata.namedtuple_factory
+    ocremixdata.read_source(cnx, source)
+    if args.scale > 1:
+        cnx = scale.make_scaled_cnx(cnx, args.scale)
+        cnx.row_factory = ocremixdata.namedtuple_factory
+    if source.is_dir():
+        ocremixdata.write_shards(cnx, target)
+    else:
+        ocremixdata.write_dump(cnx, target)
+    cnx.close()
+    shutil.copy(ROOT / "package.json", work / "package.json")
+    os.chdir(work)
+    os.environ["OCREMIX_DATA_CACHE"] = str(work / ".cache")
+    cache_dir = ocremixdata.get_cache_dir()
+    build = argparse.Namespace(
+        compress=args.compress, directory=work / "output", full=True, minify=False
+    )
+    results = {}
+
+    results["load"] = time_best(
+        ocremixdata.get_cnx,
+        args.repeat,
+        setup=lambda: shutil.rmtree(cache_dir, ignore_errors=True),
+    )
+    results["load (snapshot)"] = time_best(ocremixdata.get_cnx, args.repeat)
+    cnx = ocremixdata.get_cnx()
+    # everything, as if the data had just been converted
+    if source.is_dir():
+        results["dump"] = time_best(
+            lambda: ocremixdata.write_shards(cnx, target),
+            args.repeat,
+            setup=lambda: shutil.rmtree(target),
+        )
+    else:
+        results["dump"] = time_best(lambda: ocremixdata.write_data(cnx), args.repeat)
+
+    pages_source, pages = get_pages(args.pages, cnx)
+    parsed = []
+    results["parse"] = time_best(
+        lambda: parsed.extend(
+            (ocr_id, ocremixdata.parse_remix_page(lxml.html.fromstring(text)))
+            for ocr_id, text in pages
+        ),
+        args.repeat,
+        setup=parsed.clear,
+    )
+
+    def import_pages() -> None:
+        # the same writes as reparse, in one transaction; a new import time each
+        # run, so every run changes every imported ReMix
+        import_datetime = datetime.datetime.now(tz=datetime.UTC).isoformat()
+        cnx.execute("begin")
+        for ocr_id, page in parsed:
+            ocremixdata.write_remix_page(cnx, ocr_id, page, import_datetime)
+        cnx.commit()
+
+    results["import"] = time_best(import_pages, args.repeat)
+    # only what the import touched
+    results["dump (after import)"] = time_best(
+        lambda: ocremixdata.write_data(cnx), args.repeat, setup=import_pages
+    )
+    if source.is_dir():
+        results["compact (after import)"] = time_best(
+            lambda: ocremixdata.do_compact(cnx, target),
+            args.repeat,
+            setup=lambda: (import_pages(), ocremixdata.write_data(cnx)),
+        )
+
+    results["build-pages"] = time_best(
+        lambda: ocremixdata.cli_build_pages(build),
+        args.repeat,
+        setup=lambda: shutil.rmtree(build.directory, ignore_errors=True),
+    )
+    build.full = False
+    results["build-pages (no changes)"] = time_best(
+        lambda: ocremixdata.cli_build_pages(build), args.repeat
+    )
+    results["write-sqlite"] = time_best(
+        lambda: ocremixdata.do_write_sqlite(cnx, work / "ocremix-data.db"),
+        args.repeat,
+    )
+
+    counts = {
+        table: cnx.execute(f"select count(*) n from {table}").fetchone().n  # noqa: S608
+        for table in ("remix", "artist", "tag", "remix_artist", "remix_tag")
+    }
+    cnx.close()
+    return {
+        "counts": counts | {"pages": len(pages)},
+        "environment": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+        },
+        "pages": pages_source,
+        "results": results,
+        "scale": args.scale,
+        "version": 1,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    # the benchmarks that took more than (1 + threshold) times as long as in the
+    # baseline
+    regressions = []
+    print(f"{'':28} {'baseline':>10} {'current':>10} {'ratio':>8}")
+    for name, seconds in current.get("results").items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"{name:28} {'':>10} {seconds:>10.3f}")
+            continue
+        ratio = seconds / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  slower"
+        print(f"{name:28} {before:>10.3f} {seconds:>10.3f} {ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time load, dump, parse, import, build-pages and write-sqlite "
+        "offline, on the local data or a scaled-up copy of it"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=pathlib.Path,
+        help="results of an earlier run to compare with; the exit status is 1 if "
+        "anything is slower than the threshold allows",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="time build-pages with compressed copies, as it runs by default",
+    )
+    parser.add_argument(
+        "--output", type=pathlib.Path, help="write the results to this JSON file"
+    )
+    parser.add_argument(
+        "--pages",
+        type=pathlib.Path,
+        help="a directory of saved remix pages (OCRnnnnn.html) or a page archive "
+        "(.cache/pages.db); by default pages are rendered from the data",
+    )
+    parser.add_argument("--repeat", default=3, type=int, help="the best run counts")
+    parser.add_argument(
+        "--scale",
+        default=1,
+        help="how many times the ReMixes, artists and tags to benchmark with, "
+        "for example 10 or 100",
+        type=int,
+    )
+    parser.add_argument(
+        "--threshold",
+        default=0.25,
+        help="how much slower than the baseline counts as a regression, default 0.25",
+        type=float,
+    )
+    args = parser.parse_args()
+    if args.pages is not None:
+        args.pages = args.pages.resolve()
+    if args.output is not None:
+        args.output = args.output.resolve()
+    cwd = pathlib.Path.cwd()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            current = run(args, pathlib.Path(tmp))
+        finally:
+            os.chdir(cwd)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(current, indent=4, sort_keys=True) + "\n")
+    if args.baseline is None:
+        for name, seconds in current.get("results").items():
+            print(f"{name:28} {seconds:>10.3f} s")
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("counts") != current.get("counts"):
+        print(f"The baseline was run on different data: {baseline.get('counts')}")
+        return 1
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"Slower than the baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
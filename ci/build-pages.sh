@@ -1,3 +1,3 @@
 pip install uv
-uv run --no-dev ocremixdata.py build-pages
+uv run --no-dev --extra brotli ocremixdata.py build-pages
 uv run --no-dev gen-openapi-spec.py
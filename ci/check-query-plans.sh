@@ -0,0 +1,2 @@
+pip install uv
+uv run --no-dev ocremixdata.py check-query-plans
@@ -46,14 +46,12 @@ CREATE TABLE remix (
 CREATE TABLE remix_artist (
     remix_id integer not null,
     artist_id integer not null,
-    _synced integer,
     primary key (remix_id, artist_id)
 ) strict;
 
 CREATE TABLE remix_tag (
     remix_id integer not null,
     tag_id text not null,
-    _synced integer,
     primary key (remix_id, tag_id)
 ) strict;
 
@@ -62,7 +60,26 @@ CREATE TABLE tag (
     path text not null,
     url text not null
 ) strict;
+
+CREATE INDEX remix_artist_artist_id on remix_artist (artist_id, remix_id);
+CREATE INDEX remix_tag_tag_id on remix_tag (tag_id, remix_id);
+CREATE INDEX remix_primary_game_id on remix (primary_game_id, id);
+
+CREATE VIRTUAL TABLE remix_search USING fts5 (
+    title, primary_game, artists, tags,
+    tokenize = 'unicode61 remove_diacritics 2', content = ''
+);
 ```
+
+`remix_search` is a contentless full-text index of every remix, with the remix ID as
+its rowid; it holds no text of its own, so join it to `remix` for the columns. For
+example, `select r.id, r.title from remix_search s join remix r on r.id = s.rowid
+where remix_search match 'zelda' order by s.rank` lists the best matches first.
+
+The file includes `ANALYZE` statistics and is vacuumed with a page size of 1024
+bytes in rollback-journal mode (no WAL). It can be opened read-only with the
+`immutable=1` URI parameter, and queried in place by readers that fetch database
+pages with HTTP range requests, such as sql.js-httpvfs.
 """
 
 remix_json_properties = {
@@ -193,6 +210,89 @@ spec = {
                 }
             ],
         },
+        "/remix-index.json": {
+            "get": {
+                "tags": ["Endpoints"],
+                "description": "Returns the title and primary game of every remix, "
+                "keyed by remix ID",
+                "responses": {
+                    "200": {
+                        "description": "An index of all remixes",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "additionalProperties": {
+                                        "type": "object",
+                                        "properties": {
+                                            "primary_game": remix_json_properties[
+                                                "primary_game"
+                                            ],
+                                            "title": remix_json_properties["title"],
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    }
+                },
+            }
+        },
+        "/remixes.ndjson": {
+            "get": {
+                "tags": ["Endpoints"],
+                "description": "Returns every remix as newline-delimited JSON, one "
+                "remix per line in ID order, with the same information as "
+                "`/remix/{remix_id}.json`",
+                "responses": {
+                    "200": {
+                        "description": "All remixes, one JSON object per line",
+                        "content": {
+                            "application/x-ndjson": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": remix_json_properties,
+                                }
+                            }
+                        },
+                    }
+                },
+            }
+        },
+        "/remixes/{remix_range}.json": {
+            "get": {
+                "tags": ["Endpoints"],
+                "description": "Returns every remix in a range of 500 remix IDs, "
+                "with the same information as `/remix/{remix_id}.json`; ranges start "
+                "at OCR00001, OCR00501, OCR01001 and so on",
+                "responses": {
+                    "200": {
+                        "description": "The remixes in one range of IDs",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": remix_json_properties,
+                                    },
+                                }
+                            }
+                        },
+                    }
+                },
+            },
+            "parameters": [
+                {
+                    "name": "remix_range",
+                    "in": "path",
+                    "description": "The first and last remix ID in the range",
+                    "required": True,
+                    "schema": {"type": "string"},
+                    "example": "OCR00001-OCR00500",
+                }
+            ],
+        },
         "/tag/{tag_id}.json": {
             "get": {
                 "tags": ["Endpoints"],
@@ -0,0 +1,672 @@
+INSERT INTO "artist" VALUES(21,'Grant Kirkhope','https://ocremix.org/artist/21/grant-kirkhope');
+INSERT INTO "artist" VALUES(36,'Jake Kaufman','https://ocremix.org/artist/36/jake-kaufman');
+INSERT INTO "artist" VALUES(51,'Jeremy Soule','https://ocremix.org/artist/51/jeremy-soule');
+INSERT INTO "artist" VALUES(68,'George Alistair Sanger','https://ocremix.org/artist/68/george-alistair-sanger');
+INSERT INTO "artist" VALUES(100,'David Wise','https://ocremix.org/artist/100/david-wise');
+INSERT INTO "artist" VALUES(102,'Robin Beanland','https://ocremix.org/artist/102/robin-beanland');
+INSERT INTO "artist" VALUES(138,'Tommy Tallarico','https://ocremix.org/artist/138/tommy-tallarico');
+INSERT INTO "artist" VALUES(171,'Joe McDermott','https://ocremix.org/artist/171/joe-mcdermott');
+INSERT INTO "artist" VALUES(177,'Alexander Brandon','https://ocremix.org/artist/177/alexander-brandon');
+INSERT INTO "artist" VALUES(226,'Dave Govett','https://ocremix.org/artist/226/dave-govett');
+INSERT INTO "artist" VALUES(328,'K. Weston Phelan','https://ocremix.org/artist/328/k-weston-phelan');
+INSERT INTO "artist" VALUES(3617,'Chad Seiter','https://ocremix.org/artist/3617/chad-seiter');
+INSERT INTO "artist" VALUES(4161,'Arrow','https://ocremix.org/artist/4161/arrow');
+INSERT INTO "artist" VALUES(4168,'Dr. Fruitcake','https://ocremix.org/artist/4168/dr-fruitcake');
+INSERT INTO "artist" VALUES(4174,'Tony Thai','https://ocremix.org/artist/4174/tony-thai');
+INSERT INTO "artist" VALUES(4279,'djpretzel','https://ocremix.org/artist/4279/djpretzel');
+INSERT INTO "artist" VALUES(4280,'MkVaff','https://ocremix.org/artist/4280/mkvaff');
+INSERT INTO "artist" VALUES(4281,'AmIEviL','https://ocremix.org/artist/4281/amievil');
+INSERT INTO "artist" VALUES(4282,'Alexander Prievert','https://ocremix.org/artist/4282/alexander-prievert');
+INSERT INTO "artist" VALUES(4283,'Children of the Monkey Machine','https://ocremix.org/artist/4283/children-of-the-monkey-machine');
+INSERT INTO "artist" VALUES(4284,'A_Rival','https://ocremix.org/artist/4284/a-rival');
+INSERT INTO "artist" VALUES(4285,'Disco Dan','https://ocremix.org/artist/4285/disco-dan');
+INSERT INTO "artist" VALUES(4286,'Malcos','https://ocremix.org/artist/4286/malcos');
+INSERT INTO "artist" VALUES(4287,'Jivemaster','https://ocremix.org/artist/4287/jivemaster');
+INSERT INTO "artist" VALUES(4288,'K. Praslowicz','https://ocremix.org/artist/4288/k-praslowicz');
+INSERT INTO "artist" VALUES(4289,'Liquid Neon','https://ocremix.org/artist/4289/liquid-neon');
+INSERT INTO "artist" VALUES(4290,'posu yan','https://ocremix.org/artist/4290/posu-yan');
+INSERT INTO "artist" VALUES(4291,'injury','https://ocremix.org/artist/4291/injury');
+INSERT INTO "artist" VALUES(4292,'Zeratul','https://ocremix.org/artist/4292/zeratul');
+INSERT INTO "artist" VALUES(4293,'Protricity','https://ocremix.org/artist/4293/protricity');
+INSERT INTO "artist" VALUES(4294,'Gux','https://ocremix.org/artist/4294/gux');
+INSERT INTO "artist" VALUES(4295,'Joe Redifer','https://ocremix.org/artist/4295/joe-redifer');
+INSERT INTO "artist" VALUES(4296,'Orkybash','https://ocremix.org/artist/4296/orkybash');
+INSERT INTO "artist" VALUES(4297,'Rayza','https://ocremix.org/artist/4297/rayza');
+INSERT INTO "artist" VALUES(4298,'The Pancake Chef','https://ocremix.org/artist/4298/the-pancake-chef');
+INSERT INTO "artist" VALUES(4299,'Steve Pordon','https://ocremix.org/artist/4299/steve-pordon');
+INSERT INTO "artist" VALUES(4300,'Mr_44','https://ocremix.org/artist/4300/mr-44');
+INSERT INTO "artist" VALUES(4301,'jaxx','https://ocremix.org/artist/4301/jaxx');
+INSERT INTO "artist" VALUES(4302,'Project X','https://ocremix.org/artist/4302/project-x');
+INSERT INTO "artist" VALUES(4303,'Deimos','https://ocremix.org/artist/4303/deimos');
+INSERT INTO "artist" VALUES(4304,'Mustin','https://ocremix.org/artist/4304/mustin');
+INSERT INTO "artist" VALUES(4305,'Hazama','https://ocremix.org/artist/4305/hazama');
+INSERT INTO "artist" VALUES(4306,'Tansunn','https://ocremix.org/artist/4306/tansunn');
+INSERT INTO "artist" VALUES(4307,'Chako','https://ocremix.org/artist/4307/chako');
+INSERT INTO "artist" VALUES(4308,'Rob Saunders','https://ocremix.org/artist/4308/rob-saunders');
+INSERT INTO "artist" VALUES(4309,'4-Eyes','https://ocremix.org/artist/4309/4-eyes');
+INSERT INTO "artist" VALUES(4310,'Daknit','https://ocremix.org/artist/4310/daknit');
+INSERT INTO "artist" VALUES(4311,'Evil Horde','https://ocremix.org/artist/4311/evil-horde');
+INSERT INTO "artist" VALUES(4312,'Mike McGann','https://ocremix.org/artist/4312/mike-mcgann');
+INSERT INTO "artist" VALUES(4313,'Mazedude','https://ocremix.org/artist/4313/mazedude');
+INSERT INTO "artist" VALUES(4314,'Chris J. Hampton','https://ocremix.org/artist/4314/chris-j-hampton');
+INSERT INTO "artist" VALUES(4315,'DJ Cyker','https://ocremix.org/artist/4315/dj-cyker');
+INSERT INTO "artist" VALUES(4316,'Prince Vejita','https://ocremix.org/artist/4316/prince-vejita');
+INSERT INTO "artist" VALUES(4317,'T.M. Revolutionary','https://ocremix.org/artist/4317/tm-revolutionary');
+INSERT INTO "artist" VALUES(4318,'Dale North','https://ocremix.org/artist/4318/dale-north');
+INSERT INTO "artist" VALUES(4319,'Rimco','https://ocremix.org/artist/4319/rimco');
+INSERT INTO "artist" VALUES(4320,'Tim Sheehy','https://ocremix.org/artist/4320/tim-sheehy');
+INSERT INTO "artist" VALUES(4321,'Nines','https://ocremix.org/artist/4321/nines');
+INSERT INTO "artist" VALUES(4322,'Pasq242','https://ocremix.org/artist/4322/pasq242');
+INSERT INTO "artist" VALUES(4323,'DarkCecil13','https://ocremix.org/artist/4323/darkcecil13');
+INSERT INTO "artist" VALUES(4324,'FFmusic Dj','https://ocremix.org/artist/4324/ffmusic-dj');
+INSERT INTO "artist" VALUES(4325,'Khalal','https://ocremix.org/artist/4325/khalal');
+INSERT INTO "artist" VALUES(4326,'NoppZ','https://ocremix.org/artist/4326/noppz');
+INSERT INTO "artist" VALUES(4327,'Lau','https://ocremix.org/artist/4327/lau');
+INSERT INTO "artist" VALUES(4328,'Ailsean','https://ocremix.org/artist/4328/ailsean');
+INSERT INTO "artist" VALUES(4329,'Isopropyl','https://ocremix.org/artist/4329/isopropyl');
+INSERT INTO "artist" VALUES(4330,'Rosencrantz & guildensterN','https://ocremix.org/artist/4330/rosencrantz-and-guildenstern');
+INSERT INTO "artist" VALUES(4331,'Beatdrop','https://ocremix.org/artist/4331/beatdrop');
+INSERT INTO "artist" VALUES(4332,'Franz Keller','https://ocremix.org/artist/4332/franz-keller');
+INSERT INTO "artist" VALUES(4333,'efsisos','https://ocremix.org/artist/4333/efsisos');
+INSERT INTO "artist" VALUES(4334,'JV','https://ocremix.org/artist/4334/jv');
+INSERT INTO "artist" VALUES(4335,'Scott Peeples','https://ocremix.org/artist/4335/scott-peeples');
+INSERT INTO "artist" VALUES(4336,'Drisak Kanan','https://ocremix.org/artist/4336/drisak-kanan');
+INSERT INTO "artist" VALUES(4337,'Aetherius','https://ocremix.org/artist/4337/aetherius');
+INSERT INTO "artist" VALUES(4338,'mutagene','https://ocremix.org/artist/4338/mutagene');
+INSERT INTO "artist" VALUES(4339,'Instant Remedy','https://ocremix.org/artist/4339/instant-remedy');
+INSERT INTO "artist" VALUES(4340,'Subliminal Labs','https://ocremix.org/artist/4340/subliminal-labs');
+INSERT INTO "artist" VALUES(4341,'Chris Abbott','https://ocremix.org/artist/4341/chris-abbott');
+INSERT INTO "artist" VALUES(4343,'Peterrian Productions','https://ocremix.org/artist/4343/peterrian-productions');
+INSERT INTO "artist" VALUES(4344,'Memblers','https://ocremix.org/artist/4344/memblers');
+INSERT INTO "artist" VALUES(4345,'Insomnic','https://ocremix.org/artist/4345/insomnic');
+INSERT INTO "artist" VALUES(4346,'U-ji','https://ocremix.org/artist/4346/u-ji');
+INSERT INTO "artist" VALUES(4347,'mellogear','https://ocremix.org/artist/4347/mellogear');
+INSERT INTO "artist" VALUES(4348,'DJ 3dn3r','https://ocremix.org/artist/4348/dj-3dn3r');
+INSERT INTO "artist" VALUES(4349,'JazzFlight','https://ocremix.org/artist/4349/jazzflight');
+INSERT INTO "artist" VALUES(4350,'Slow Poison','https://ocremix.org/artist/4350/slow-poison');
+INSERT INTO "artist" VALUES(4351,'Chikusho Sound Team','https://ocremix.org/artist/4351/chikusho-sound-team');
+INSERT INTO "artist" VALUES(4352,'DJ Intermodal','https://ocremix.org/artist/4352/dj-intermodal');
+INSERT INTO "artist" VALUES(4353,'fuzznec','https://ocremix.org/artist/4353/fuzznec');
+INSERT INTO "artist" VALUES(4354,'LeeBro','https://ocremix.org/artist/4354/leebro');
+INSERT INTO "artist" VALUES(4355,'Fairlight','https://ocremix.org/artist/4355/fairlight');
+INSERT INTO "artist" VALUES(4356,'CheDDer Nardz','https://ocremix.org/artist/4356/chedder-nardz');
+INSERT INTO "artist" VALUES(4357,'Shael Riley','https://ocremix.org/artist/4357/shael-riley');
+INSERT INTO "artist" VALUES(4358,'Minibosses','https://ocremix.org/artist/4358/minibosses');
+INSERT INTO "artist" VALUES(4359,'Juverna','https://ocremix.org/artist/4359/juverna');
+INSERT INTO "artist" VALUES(4360,'Trace Dragon XVI K','https://ocremix.org/artist/4360/trace-dragon-xvi-k');
+INSERT INTO "artist" VALUES(4361,'F4T4L_3RR0R','https://ocremix.org/artist/4361/f4t4l-3rr0r');
+INSERT INTO "artist" VALUES(4362,'aneurySm','https://ocremix.org/artist/4362/aneurysm');
+INSERT INTO "artist" VALUES(4363,'MIDIman','https://ocremix.org/artist/4363/midiman');
+INSERT INTO "artist" VALUES(4364,'Jose Acosta','https://ocremix.org/artist/4364/jose-acosta');
+INSERT INTO "artist" VALUES(4365,'Sonic Blade','https://ocremix.org/artist/4365/sonic-blade');
+INSERT INTO "artist" VALUES(4366,'Bart Klepka','https://ocremix.org/artist/4366/bart-klepka');
+INSERT INTO "artist" VALUES(4367,'Stephen Kennedy','https://ocremix.org/artist/4367/stephen-kennedy');
+INSERT INTO "artist" VALUES(4368,'d0d0','https://ocremix.org/artist/4368/d0d0');
+INSERT INTO "artist" VALUES(4369,'Big Lux','https://ocremix.org/artist/4369/big-lux');
+INSERT INTO "artist" VALUES(4370,'Chuck Dodgers','https://ocremix.org/artist/4370/chuck-dodgers');
+INSERT INTO "artist" VALUES(4371,'JHVH-1','https://ocremix.org/artist/4371/jhvh-1');
+INSERT INTO "artist" VALUES(4372,'wRenchpilot','https://ocremix.org/artist/4372/wrenchpilot');
+INSERT INTO "artist" VALUES(4373,'Charles Blachly','https://ocremix.org/artist/4373/charles-blachly');
+INSERT INTO "artist" VALUES(4374,'Kumeelyun','https://ocremix.org/artist/4374/kumeelyun');
+INSERT INTO "artist" VALUES(4375,'Cuddly Battleship Kattywampus','https://ocremix.org/artist/4375/cuddly-battleship-kattywampus');
+INSERT INTO "artist" VALUES(4376,'Rubbish','https://ocremix.org/artist/4376/rubbish');
+INSERT INTO "artist" VALUES(4377,'Wintermute','https://ocremix.org/artist/4377/wintermute');
+INSERT INTO "artist" VALUES(4378,'Greg Kennedy','https://ocremix.org/artist/4378/greg-kennedy');
+INSERT INTO "artist" VALUES(4379,'Stevie-Keyz','https://ocremix.org/artist/4379/stevie-keyz');
+INSERT INTO "artist" VALUES(4380,'Nominuke','https://ocremix.org/artist/4380/nominuke');
+INSERT INTO "artist" VALUES(4381,'Steffan Andrews','https://ocremix.org/artist/4381/steffan-andrews');
+INSERT INTO "artist" VALUES(4382,'Electron','https://ocremix.org/artist/4382/electron');
+INSERT INTO "artist" VALUES(4383,'Compyfox','https://ocremix.org/artist/4383/compyfox');
+INSERT INTO "artist" VALUES(4384,'Brian Duque','https://ocremix.org/artist/4384/brian-duque');
+INSERT INTO "artist" VALUES(4385,'Scott','https://ocremix.org/artist/4385/scott');
+INSERT INTO "artist" VALUES(4386,'Cyborg Jeff','https://ocremix.org/artist/4386/cyborg-jeff');
+INSERT INTO "artist" VALUES(4387,'Parn','https://ocremix.org/artist/4387/parn');
+INSERT INTO "artist" VALUES(4388,'Jared Hudson','https://ocremix.org/artist/4388/jared-hudson');
+INSERT INTO "artist" VALUES(4389,'badlsdtrip','https://ocremix.org/artist/4389/badlsdtrip');
+INSERT INTO "artist" VALUES(4390,'alk','https://ocremix.org/artist/4390/alk');
+INSERT INTO "artist" VALUES(4391,'lazygecko','https://ocremix.org/artist/4391/lazygecko');
+INSERT INTO "artist" VALUES(4392,'Nilvah','https://ocremix.org/artist/4392/nilvah');
+INSERT INTO "artist" VALUES(4393,'SnowBro','https://ocremix.org/artist/4393/snowbro');
+INSERT INTO "artist" VALUES(4394,'Shanecapella','https://ocremix.org/artist/4394/shanecapella');
+INSERT INTO "artist" VALUES(4395,'SFLaValle','https://ocremix.org/artist/4395/sflavalle');
+INSERT INTO "artist" VALUES(4396,'Sinergia','https://ocremix.org/artist/4396/sinergia');
+INSERT INTO "artist" VALUES(4397,'The Dead Guys','https://ocremix.org/artist/4397/the-dead-guys');
+INSERT INTO "artist" VALUES(4398,'Roggah','https://ocremix.org/artist/4398/roggah');
+INSERT INTO "artist" VALUES(4399,'Juan Huayamares','https://ocremix.org/artist/4399/juan-huayamares');
+INSERT INTO "artist" VALUES(4400,'Zyron','https://ocremix.org/artist/4400/zyron');
+INSERT INTO "artist" VALUES(4401,'SheerDark','https://ocremix.org/artist/4401/sheerdark');
+INSERT INTO "artist" VALUES(4402,'Avien','https://ocremix.org/artist/4402/avien');
+INSERT INTO "artist" VALUES(4403,'Star Salzman','https://ocremix.org/artist/4403/star-salzman');
+INSERT INTO "artist" VALUES(4404,'DarK PurPLe','https://ocremix.org/artist/4404/dark-purple');
+INSERT INTO "artist" VALUES(4405,'The Frivolous Funk','https://ocremix.org/artist/4405/the-frivolous-funk');
+INSERT INTO "artist" VALUES(4406,'M.S. Mehawich','https://ocremix.org/artist/4406/ms-mehawich');
+INSERT INTO "artist" VALUES(4407,'DJ Jake','https://ocremix.org/artist/4407/dj-jake');
+INSERT INTO "artist" VALUES(4408,'Mode7','https://ocremix.org/artist/4408/mode7');
+INSERT INTO "artist" VALUES(4409,'Jayson Litrio','https://ocremix.org/artist/4409/jayson-litrio');
+INSERT INTO "artist" VALUES(4410,'XenNexus','https://ocremix.org/artist/4410/xennexus');
+INSERT INTO "artist" VALUES(4412,'MC','https://ocremix.org/artist/4412/mc');
+INSERT INTO "artist" VALUES(4413,'LaRux','https://ocremix.org/artist/4413/larux');
+INSERT INTO "artist" VALUES(4414,'Grodan Grobi','https://ocremix.org/artist/4414/grodan-grobi');
+INSERT INTO "artist" VALUES(4415,'Collaborator','https://ocremix.org/artist/4415/collaborator');
+INSERT INTO "artist" VALUES(4416,'Roddy Toomim','https://ocremix.org/artist/4416/roddy-toomim');
+INSERT INTO "artist" VALUES(4417,'MangaX','https://ocremix.org/artist/4417/mangax');
+INSERT INTO "artist" VALUES(4418,'Estradasphere','https://ocremix.org/artist/4418/estradasphere');
+INSERT INTO "artist" VALUES(4419,'Ryu7x','https://ocremix.org/artist/4419/ryu7x');
+INSERT INTO "artist" VALUES(4420,'The Wingless','https://ocremix.org/artist/4420/the-wingless');
+INSERT INTO "artist" VALUES(4421,'The Rabbit Joint','https://ocremix.org/artist/4421/the-rabbit-joint');
+INSERT INTO "artist" VALUES(4422,'Dandy-J','https://ocremix.org/artist/4422/dandy-j');
+INSERT INTO "artist" VALUES(4423,'The Sheriff','https://ocremix.org/artist/4423/the-sheriff');
+INSERT INTO "artist" VALUES(4424,'Joshie','https://ocremix.org/artist/4424/joshie');
+INSERT INTO "artist" VALUES(4425,'Kassi','https://ocremix.org/artist/4425/kassi');
+INSERT INTO "artist" VALUES(4426,'EgM','https://ocremix.org/artist/4426/egm');
+INSERT INTO "artist" VALUES(4427,'Nate Cloud','https://ocremix.org/artist/4427/nate-cloud');
+INSERT INTO "artist" VALUES(4428,'Aquas','https://ocremix.org/artist/4428/aquas');
+INSERT INTO "artist" VALUES(4429,'prozax','https://ocremix.org/artist/4429/prozax');
+INSERT INTO "artist" VALUES(4430,'nyKad','https://ocremix.org/artist/4430/nykad');
+INSERT INTO "artist" VALUES(4432,'Xaleph','https://ocremix.org/artist/4432/xaleph');
+INSERT INTO "artist" VALUES(4433,'Israfel','https://ocremix.org/artist/4433/israfel');
+INSERT INTO "artist" VALUES(4434,'mp','https://ocremix.org/artist/4434/mp');
+INSERT INTO "artist" VALUES(4435,'DJ Meiji','https://ocremix.org/artist/4435/dj-meiji');
+INSERT INTO "artist" VALUES(4436,'Pisces','https://ocremix.org/artist/4436/pisces');
+INSERT INTO "artist" VALUES(4437,'dimmer','https://ocremix.org/artist/4437/dimmer');
+INSERT INTO "artist" VALUES(4438,'kLuTz','https://ocremix.org/artist/4438/klutz');
+INSERT INTO "artist" VALUES(4439,'Game Over','https://ocremix.org/artist/4439/game-over');
+INSERT INTO "artist" VALUES(4440,'bLiNd','https://ocremix.org/artist/4440/blind');
+INSERT INTO "artist" VALUES(4441,'CrimsonZeal','https://ocremix.org/artist/4441/crimsonzeal');
+INSERT INTO "artist" VALUES(4442,'SgtRama','https://ocremix.org/artist/4442/sgtrama');
+INSERT INTO "artist" VALUES(4443,'Russell Cox','https://ocremix.org/artist/4443/russell-cox');
+INSERT INTO "artist" VALUES(4444,'Main Finger','https://ocremix.org/artist/4444/main-finger');
+INSERT INTO "artist" VALUES(4445,'Thumper','https://ocremix.org/artist/4445/thumper');
+INSERT INTO "artist" VALUES(4446,'MetaZero','https://ocremix.org/artist/4446/metazero');
+INSERT INTO "artist" VALUES(4447,'Joe Bommarito','https://ocremix.org/artist/4447/joe-bommarito');
+INSERT INTO "artist" VALUES(4448,'Jupiter Crayons','https://ocremix.org/artist/4448/jupiter-crayons');
+INSERT INTO "artist" VALUES(4449,'Double A Ron','https://ocremix.org/artist/4449/double-a-ron');
+INSERT INTO "artist" VALUES(4450,'Ghetto Lee Lewis','https://ocremix.org/artist/4450/ghetto-lee-lewis');
+INSERT INTO "artist" VALUES(4451,'Kailem','https://ocremix.org/artist/4451/kailem');
+INSERT INTO "artist" VALUES(4452,'Cloud','https://ocremix.org/artist/4452/cloud');
+INSERT INTO "artist" VALUES(4453,'Norrin_Radd','https://ocremix.org/artist/4453/norrin-radd');
+INSERT INTO "artist" VALUES(4454,'Malc Jennings','https://ocremix.org/artist/4454/malc-jennings');
+INSERT INTO "artist" VALUES(4455,'Ryan8bit','https://ocremix.org/artist/4455/ryan8bit');
+INSERT INTO "artist" VALUES(4456,'vail','https://ocremix.org/artist/4456/vail');
+INSERT INTO "artist" VALUES(4458,'Vic Viper','https://ocremix.org/artist/4458/vic-viper');
+INSERT INTO "artist" VALUES(4459,'A Scholar & A Physician','https://ocremix.org/artist/4459/a-scholar-and-a-physician');
+INSERT INTO "artist" VALUES(4460,'Leifo','https://ocremix.org/artist/4460/leifo');
+INSERT INTO "artist" VALUES(4461,'texx sound','https://ocremix.org/artist/4461/texx-sound');
+INSERT INTO "artist" VALUES(4462,'munky','https://ocremix.org/artist/4462/munky');
+INSERT INTO "artist" VALUES(4463,'Quinn Fox','https://ocremix.org/artist/4463/quinn-fox');
+INSERT INTO "artist" VALUES(4464,'Mattias Holmgren','https://ocremix.org/artist/4464/mattias-holmgren');
+INSERT INTO "artist" VALUES(4465,'Aureolius','https://ocremix.org/artist/4465/aureolius');
+INSERT INTO "artist" VALUES(4466,'Ryce Beetz','https://ocremix.org/artist/4466/ryce-beetz');
+INSERT INTO "artist" VALUES(4467,'lasombra','https://ocremix.org/artist/4467/lasombra');
+INSERT INTO "artist" VALUES(4468,'BenCousins','https://ocremix.org/artist/4468/bencousins');
+INSERT INTO "artist" VALUES(4469,'Midee','https://ocremix.org/artist/4469/midee');
+INSERT INTO "artist" VALUES(4470,'Nicholai Duval','https://ocremix.org/artist/4470/nicholai-duval');
+INSERT INTO "artist" VALUES(4471,'Gaffeizil','https://ocremix.org/artist/4471/gaffeizil');
+INSERT INTO "artist" VALUES(4472,'Kooper909','https://ocremix.org/artist/4472/kooper909');
+INSERT INTO "artist" VALUES(4473,'Richard and Lyndsay','https://ocremix.org/artist/4473/richard-and-lyndsay');
+INSERT INTO "artist" VALUES(4474,'Vicks Cornatto','https://ocremix.org/artist/4474/vicks-cornatto');
+INSERT INTO "artist" VALUES(4475,'Neostorm','https://ocremix.org/artist/4475/neostorm');
+INSERT INTO "artist" VALUES(4476,'Selecta Novel','https://ocremix.org/artist/4476/selecta-novel');
+INSERT INTO "artist" VALUES(4477,'Brad Smith','https://ocremix.org/artist/4477/brad-smith');
+INSERT INTO "artist" VALUES(4478,'Xenepp','https://ocremix.org/artist/4478/xenepp');
+INSERT INTO "artist" VALUES(4479,'Jovette Rivera','https://ocremix.org/artist/4479/jovette-rivera');
+INSERT INTO "artist" VALUES(4480,'Sideways Staircase','https://ocremix.org/artist/4480/sideways-staircase');
+INSERT INTO "artist" VALUES(4481,'Tamimi','https://ocremix.org/artist/4481/tamimi');
+INSERT INTO "artist" VALUES(4482,'DarkeSword','https://ocremix.org/artist/4482/darkesword');
+INSERT INTO "artist" VALUES(4483,'Trance-Canada','https://ocremix.org/artist/4483/trance-canada');
+INSERT INTO "artist" VALUES(4484,'Tyler Heath','https://ocremix.org/artist/4484/tyler-heath');
+INSERT INTO "artist" VALUES(4485,'Wesley Hopper','https://ocremix.org/artist/4485/wesley-hopper');
+INSERT INTO "artist" VALUES(4486,'Ziwtra','https://ocremix.org/artist/4486/ziwtra');
+INSERT INTO "artist" VALUES(4487,'Dan Studnicky','https://ocremix.org/artist/4487/dan-studnicky');
+INSERT INTO "artist" VALUES(4488,'Strike911','https://ocremix.org/artist/4488/strike911');
+INSERT INTO "artist" VALUES(4489,'Fuzz','https://ocremix.org/artist/4489/fuzz');
+INSERT INTO "artist" VALUES(4490,'Cimarron','https://ocremix.org/artist/4490/cimarron');
+INSERT INTO "artist" VALUES(4491,'Draggor','https://ocremix.org/artist/4491/draggor');
+INSERT INTO "artist" VALUES(4492,'Hermit','https://ocremix.org/artist/4492/hermit');
+INSERT INTO "artist" VALUES(4493,'Evan Pattison','https://ocremix.org/artist/4493/evan-pattison');
+INSERT INTO "artist" VALUES(4494,'Beej','https://ocremix.org/artist/4494/beej');
+INSERT INTO "artist" VALUES(4495,'master','https://ocremix.org/artist/4495/master');
+INSERT INTO "artist" VALUES(4496,'PxFury','https://ocremix.org/artist/4496/pxfury');
+INSERT INTO "artist" VALUES(4497,'Trapezzoid','https://ocremix.org/artist/4497/trapezzoid');
+INSERT INTO "artist" VALUES(4498,'djcubez','https://ocremix.org/artist/4498/djcubez');
+INSERT INTO "artist" VALUES(4499,'Potshot','https://ocremix.org/artist/4499/potshot');
+INSERT INTO "artist" VALUES(4500,'Digimatic','https://ocremix.org/artist/4500/digimatic');
+INSERT INTO "artist" VALUES(4501,'Danny Baranowsky','https://ocremix.org/artist/4501/danny-baranowsky');
+INSERT INTO "artist" VALUES(4502,'Scratty411','https://ocremix.org/artist/4502/scratty411');
+INSERT INTO "artist" VALUES(4503,'Sine','https://ocremix.org/artist/4503/sine');
+INSERT INTO "artist" VALUES(4504,'Ceracryst','https://ocremix.org/artist/4504/ceracryst');
+INSERT INTO "artist" VALUES(4505,'Rize','https://ocremix.org/artist/4505/rize');
+INSERT INTO "artist" VALUES(4506,'Faze','https://ocremix.org/artist/4506/faze');
+INSERT INTO "artist" VALUES(4507,'Oceanfire','https://ocremix.org/artist/4507/oceanfire');
+INSERT INTO "artist" VALUES(4508,'ABG','https://ocremix.org/artist/4508/abg');
+INSERT INTO "artist" VALUES(4509,'Nex','https://ocremix.org/artist/4509/nex');
+INSERT INTO "artist" VALUES(4510,'The Coop','https://ocremix.org/artist/4510/the-coop');
+INSERT INTO "artist" VALUES(4511,'SGX','https://ocremix.org/artist/4511/sgx');
+INSERT INTO "artist" VALUES(4512,'goat','https://ocremix.org/artist/4512/goat');
+INSERT INTO "artist" VALUES(4513,'Mark Vera','https://ocremix.org/artist/4513/mark-vera');
+INSERT INTO "artist" VALUES(4514,'Dev','https://ocremix.org/artist/4514/dev');
+INSERT INTO "artist" VALUES(4515,'Suzumebachi','https://ocremix.org/artist/4515/suzumebachi');
+INSERT INTO "artist" VALUES(4516,'GrayLightning','https://ocremix.org/artist/4516/graylightning');
+INSERT INTO "artist" VALUES(4517,'gutzalpus','https://ocremix.org/artist/4517/gutzalpus');
+INSERT INTO "artist" VALUES(4518,'analoq','https://ocremix.org/artist/4518/analoq');
+INSERT INTO "artist" VALUES(4519,'EmptyMy','https://ocremix.org/artist/4519/emptymy');
+INSERT INTO "artist" VALUES(4520,'Krispy','https://ocremix.org/artist/4520/krispy');
+INSERT INTO "artist" VALUES(4521,'Zid','https://ocremix.org/artist/4521/zid');
+INSERT INTO "artist" VALUES(4522,'Remorse','https://ocremix.org/artist/4522/remorse');
+INSERT INTO "artist" VALUES(4523,'Saiko','https://ocremix.org/artist/4523/saiko');
+INSERT INTO "artist" VALUES(4524,'Vig','https://ocremix.org/artist/4524/vig');
+INSERT INTO "artist" VALUES(4525,'k-wix','https://ocremix.org/artist/4525/k-wix');
+INSERT INTO "artist" VALUES(4526,'Wizard Magic','https://ocremix.org/artist/4526/wizard-magic');
+INSERT INTO "artist" VALUES(4527,'Chaos','https://ocremix.org/artist/4527/chaos');
+INSERT INTO "artist" VALUES(4528,'Unipulator','https://ocremix.org/artist/4528/unipulator');
+INSERT INTO "artist" VALUES(4529,'ella guro','https://ocremix.org/artist/4529/ella-guro');
+INSERT INTO "artist" VALUES(4530,'MarcstaR','https://ocremix.org/artist/4530/marcstar');
+INSERT INTO "artist" VALUES(4531,'Jaroban','https://ocremix.org/artist/4531/jaroban');
+INSERT INTO "artist" VALUES(4532,'J:/Drive','https://ocremix.org/artist/4532/jdrive');
+INSERT INTO "artist" VALUES(4533,'MexieuS','https://ocremix.org/artist/4533/mexieus');
+INSERT INTO "artist" VALUES(4534,'LastUnicron','https://ocremix.org/artist/4534/lastunicron');
+INSERT INTO "artist" VALUES(4535,'Action Music','https://ocremix.org/artist/4535/action-music');
+INSERT INTO "artist" VALUES(4536,'Gman','https://ocremix.org/artist/4536/gman');
+INSERT INTO "artist" VALUES(4537,'Makke','https://ocremix.org/artist/4537/makke');
+INSERT INTO "artist" VALUES(4538,'klm09','https://ocremix.org/artist/4538/klm09');
+INSERT INTO "artist" VALUES(4539,'ocean','https://ocremix.org/artist/4539/ocean');
+INSERT INTO "artist" VALUES(4540,'JJT','https://ocremix.org/artist/4540/jjt');
+INSERT INTO "artist" VALUES(4541,'DJComet','https://ocremix.org/artist/4541/djcomet');
+INSERT INTO "artist" VALUES(4542,'Nintendo Guru','https://ocremix.org/artist/4542/nintendo-guru');
+INSERT INTO "artist" VALUES(4543,'Sir_NutS','https://ocremix.org/artist/4543/sir-nuts');
+INSERT INTO "artist" VALUES(4544,'Disturbed','https://ocremix.org/artist/4544/disturbed');
+INSERT INTO "artist" VALUES(4545,'Gustav Taxén','https://ocremix.org/artist/4545/gustav-taxen');
+INSERT INTO "artist" VALUES(4546,'Shadow','https://ocremix.org/artist/4546/shadow');
+INSERT INTO "artist" VALUES(4547,'mv','https://ocremix.org/artist/4547/mv');
+INSERT INTO "artist" VALUES(4548,'Neskvartetten','https://ocremix.org/artist/4548/neskvartetten');
+INSERT INTO "artist" VALUES(4549,'James George','https://ocremix.org/artist/4549/james-george');
+INSERT INTO "artist" VALUES(4550,'Jason Brian Merrill','https://ocremix.org/artist/4550/jason-brian-merrill');
+INSERT INTO "artist" VALUES(4551,'Chronosis','https://ocremix.org/artist/4551/chronosis');
+INSERT INTO "artist" VALUES(4552,'RocketMermaid','https://ocremix.org/artist/4552/rocketmermaid');
+INSERT INTO "artist" VALUES(4553,'Joshua Morse','https://ocremix.org/artist/4553/joshua-morse');
+INSERT INTO "artist" VALUES(4554,'Nigel Simmons','https://ocremix.org/artist/4554/nigel-simmons');
+INSERT INTO "artist" VALUES(4555,'E-Bison','https://ocremix.org/artist/4555/e-bison');
+INSERT INTO "artist" VALUES(4556,'Heath Morris','https://ocremix.org/artist/4556/heath-morris');
+INSERT INTO "artist" VALUES(4557,'SpookyBlue','https://ocremix.org/artist/4557/spookyblue');
+INSERT INTO "artist" VALUES(4558,'zykO','https://ocremix.org/artist/4558/zyko');
+INSERT INTO "artist" VALUES(4559,'Jeremy Robson','https://ocremix.org/artist/4559/jeremy-robson');
+INSERT INTO "artist" VALUES(4560,'Sadorf','https://ocremix.org/artist/4560/sadorf');
+INSERT INTO "artist" VALUES(4561,'DarkPrinceLuca','https://ocremix.org/artist/4561/darkprinceluca');
+INSERT INTO "artist" VALUES(4562,'Freemind','https://ocremix.org/artist/4562/freemind');
+INSERT INTO "artist" VALUES(4563,'Kevin "Lorenzo" Sisk','https://ocremix.org/artist/4563/kevin-lorenzo-sisk');
+INSERT INTO "artist" VALUES(4564,'ProFiction','https://ocremix.org/artist/4564/profiction');
+INSERT INTO "artist" VALUES(4565,'BiTMaP','https://ocremix.org/artist/4565/bitmap');
+INSERT INTO "artist" VALUES(4566,'bazooie','https://ocremix.org/artist/4566/bazooie');
+INSERT INTO "artist" VALUES(4567,'Disciple of the Mix','https://ocremix.org/artist/4567/disciple-of-the-mix');
+INSERT INTO "artist" VALUES(4568,'Spyder','https://ocremix.org/artist/4568/spyder');
+INSERT INTO "artist" VALUES(4569,'SAiNT 420','https://ocremix.org/artist/4569/saint-420');
+INSERT INTO "artist" VALUES(4570,'Marsland Brotherhood','https://ocremix.org/artist/4570/marsland-brotherhood');
+INSERT INTO "artist" VALUES(4571,'Urza','https://ocremix.org/artist/4571/urza');
+INSERT INTO "artist" VALUES(4572,'Shion Tanaka','https://ocremix.org/artist/4572/shion-tanaka');
+INSERT INTO "artist" VALUES(4573,'jcd','https://ocremix.org/artist/4573/jcd');
+INSERT INTO "artist" VALUES(4574,'Vampire Hunter Dan','https://ocremix.org/artist/4574/vampire-hunter-dan');
+INSERT INTO "artist" VALUES(4575,'Dj Orange','https://ocremix.org/artist/4575/dj-orange');
+INSERT INTO "artist" VALUES(4576,'Sonicade','https://ocremix.org/artist/4576/sonicade');
+INSERT INTO "artist" VALUES(4577,'Symphonic Chronicles','https://ocremix.org/artist/4577/symphonic-chronicles');
+INSERT INTO "artist" VALUES(4578,'Blak_Omen','https://ocremix.org/artist/4578/blak-omen');
+INSERT INTO "artist" VALUES(4579,'Dhsu','https://ocremix.org/artist/4579/dhsu');
+INSERT INTO "artist" VALUES(4580,'Rayagon','https://ocremix.org/artist/4580/rayagon');
+INSERT INTO "artist" VALUES(4581,'Spinning Images','https://ocremix.org/artist/4581/spinning-images');
+INSERT INTO "artist" VALUES(4582,'aluminum','https://ocremix.org/artist/4582/aluminum');
+INSERT INTO "artist" VALUES(4583,'Mia Sharp','https://ocremix.org/artist/4583/mia-sharp');
+INSERT INTO "artist" VALUES(4584,'Nixdorux','https://ocremix.org/artist/4584/nixdorux');
+INSERT INTO "artist" VALUES(4585,'SkyHigh','https://ocremix.org/artist/4585/skyhigh');
+INSERT INTO "artist" VALUES(4586,'Trenthian','https://ocremix.org/artist/4586/trenthian');
+INSERT INTO "artist" VALUES(4587,'sephfire','https://ocremix.org/artist/4587/sephfire');
+INSERT INTO "artist" VALUES(4588,'Palpable','https://ocremix.org/artist/4588/palpable');
+INSERT INTO "artist" VALUES(4589,'Destiny','https://ocremix.org/artist/4589/destiny');
+INSERT INTO "artist" VALUES(4590,'Asterin','https://ocremix.org/artist/4590/asterin');
+INSERT INTO "artist" VALUES(4591,'McNoods','https://ocremix.org/artist/4591/mcnoods');
+INSERT INTO "artist" VALUES(4592,'Sal','https://ocremix.org/artist/4592/sal');
+INSERT INTO "artist" VALUES(4593,'Dj Redlight','https://ocremix.org/artist/4593/dj-redlight');
+INSERT INTO "artist" VALUES(4594,'DigiE','https://ocremix.org/artist/4594/digie');
+INSERT INTO "artist" VALUES(4595,'Diggi Dis','https://ocremix.org/artist/4595/diggi-dis');
+INSERT INTO "artist" VALUES(4596,'COUCOU','https://ocremix.org/artist/4596/coucou');
+INSERT INTO "artist" VALUES(4597,'XenoCross','https://ocremix.org/artist/4597/xenocross');
+INSERT INTO "artist" VALUES(4598,'José the Bronx Rican','https://ocremix.org/artist/4598/jose-the-bronx-rican');
+INSERT INTO "artist" VALUES(4599,'Noir','https://ocremix.org/artist/4599/noir');
+INSERT INTO "artist" VALUES(4600,'Bloomer','https://ocremix.org/artist/4600/bloomer');
+INSERT INTO "artist" VALUES(4601,'Will Buck','https://ocremix.org/artist/4601/will-buck');
+INSERT INTO "artist" VALUES(4602,'spacepony','https://ocremix.org/artist/4602/spacepony');
+INSERT INTO "artist" VALUES(4603,'Spaceroast','https://ocremix.org/artist/4603/spaceroast');
+INSERT INTO "artist" VALUES(4604,'Sleepy Emp','https://ocremix.org/artist/4604/sleepy-emp');
+INSERT INTO "artist" VALUES(4605,'Theophany','https://ocremix.org/artist/4605/theophany');
+INSERT INTO "artist" VALUES(4606,'Edgen Animations','https://ocremix.org/artist/4606/edgen-animations');
+INSERT INTO "artist" VALUES(4607,'Binster','https://ocremix.org/artist/4607/binster');
+INSERT INTO "artist" VALUES(4608,'Reuben Kee','https://ocremix.org/artist/4608/reuben-kee');
+INSERT INTO "artist" VALUES(4609,'Arkimedes','https://ocremix.org/artist/4609/arkimedes');
+INSERT INTO "artist" VALUES(4610,'MENBAH!','https://ocremix.org/artist/4610/menbah');
+INSERT INTO "artist" VALUES(4611,'destructo','https://ocremix.org/artist/4611/destructo');
+INSERT INTO "artist" VALUES(4612,'Eradicate','https://ocremix.org/artist/4612/eradicate');
+INSERT INTO "artist" VALUES(4613,'tefnek','https://ocremix.org/artist/4613/tefnek');
+INSERT INTO "artist" VALUES(4614,'Select Start','https://ocremix.org/artist/4614/select-start');
+INSERT INTO "artist" VALUES(4615,'sedure','https://ocremix.org/artist/4615/sedure');
+INSERT INTO "artist" VALUES(4616,'Aurora','https://ocremix.org/artist/4616/aurora');
+INSERT INTO "artist" VALUES(4617,'moonove','https://ocremix.org/artist/4617/moonove');
+INSERT INTO "artist" VALUES(4618,'Rellik','https://ocremix.org/artist/4618/rellik');
+INSERT INTO "artist" VALUES(4619,'The Orichalcon','https://ocremix.org/artist/4619/the-orichalcon');
+INSERT INTO "artist" VALUES(4620,'BogusRed','https://ocremix.org/artist/4620/bogusred');
+INSERT INTO "artist" VALUES(4621,'The Risen Dayspring','https://ocremix.org/artist/4621/the-risen-dayspring');
+INSERT INTO "artist" VALUES(4622,'ArseAssassin','https://ocremix.org/artist/4622/arseassassin');
+INSERT INTO "artist" VALUES(4623,'Shane Barber','https://ocremix.org/artist/4623/shane-barber');
+INSERT INTO "artist" VALUES(4624,'LindsayAnne Pepper','https://ocremix.org/artist/4624/lindsayanne-pepper');
+INSERT INTO "artist" VALUES(4625,'SnappleMan','https://ocremix.org/artist/4625/snappleman');
+INSERT INTO "artist" VALUES(4626,'Fray','https://ocremix.org/artist/4626/fray');
+INSERT INTO "artist" VALUES(4627,'Shnabubula','https://ocremix.org/artist/4627/shnabubula');
+INSERT INTO "artist" VALUES(4628,'zircon','https://ocremix.org/artist/4628/zircon');
+INSERT INTO "artist" VALUES(4629,'Zoltan Vegvari','https://ocremix.org/artist/4629/zoltan-vegvari');
+INSERT INTO "artist" VALUES(4630,'Fatty Acid','https://ocremix.org/artist/4630/fatty-acid');
+INSERT INTO "artist" VALUES(4631,'Tuba Lin','https://ocremix.org/artist/4631/tuba-lin');
+INSERT INTO "artist" VALUES(4632,'FIDGAF','https://ocremix.org/artist/4632/fidgaf');
+INSERT INTO "artist" VALUES(4633,'lightwarmth','https://ocremix.org/artist/4633/lightwarmth');
+INSERT INTO "artist" VALUES(4634,'Flik','https://ocremix.org/artist/4634/flik');
+INSERT INTO "artist" VALUES(4635,'Big Giant Circles','https://ocremix.org/artist/4635/big-giant-circles');
+INSERT INTO "artist" VALUES(4636,'Neil Benjamin','https://ocremix.org/artist/4636/neil-benjamin');
+INSERT INTO "artist" VALUES(4637,'Darangen','https://ocremix.org/artist/4637/darangen');
+INSERT INTO "artist" VALUES(4638,'ParagonX9','https://ocremix.org/artist/4638/paragonx9');
+INSERT INTO "artist" VALUES(4639,'CarboHydroM','https://ocremix.org/artist/4639/carbohydrom');
+INSERT INTO "artist" VALUES(4640,'Bladiator','https://ocremix.org/artist/4640/bladiator');
+INSERT INTO "artist" VALUES(4641,'jdproject','https://ocremix.org/artist/4641/jdproject');
+INSERT INTO "artist" VALUES(4642,'Blake Perdue','https://ocremix.org/artist/4642/blake-perdue');
+INSERT INTO "artist" VALUES(4643,'Uboichi','https://ocremix.org/artist/4643/uboichi');
+INSERT INTO "artist" VALUES(4644,'Oak Thielbar','https://ocremix.org/artist/4644/oak-thielbar');
+INSERT INTO "artist" VALUES(4645,'trickwaters','https://ocremix.org/artist/4645/trickwaters');
+INSERT INTO "artist" VALUES(4646,'Kevin Lau','https://ocremix.org/artist/4646/kevin-lau');
+INSERT INTO "artist" VALUES(4647,'BrainCells','https://ocremix.org/artist/4647/braincells');
+INSERT INTO "artist" VALUES(4648,'Taika','https://ocremix.org/artist/4648/taika');
+INSERT INTO "artist" VALUES(4649,'Christian Pacaud','https://ocremix.org/artist/4649/christian-pacaud');
+INSERT INTO "artist" VALUES(4650,'Jason Covenant','https://ocremix.org/artist/4650/jason-covenant');
+INSERT INTO "artist" VALUES(4651,'Ben Briggs','https://ocremix.org/artist/4651/ben-briggs');
+INSERT INTO "artist" VALUES(4652,'N-Joy','https://ocremix.org/artist/4652/n-joy');
+INSERT INTO "artist" VALUES(4653,'Simona','https://ocremix.org/artist/4653/simona');
+INSERT INTO "artist" VALUES(4654,'Dennis Mott','https://ocremix.org/artist/4654/dennis-mott');
+INSERT INTO "artist" VALUES(4655,'Rexy','https://ocremix.org/artist/4655/rexy');
+INSERT INTO "artist" VALUES(4656,'NoTuX','https://ocremix.org/artist/4656/notux');
+INSERT INTO "artist" VALUES(4657,'Awesome-A','https://ocremix.org/artist/4657/awesome-a');
+INSERT INTO "artist" VALUES(4658,'PriZm','https://ocremix.org/artist/4658/prizm');
+INSERT INTO "artist" VALUES(4659,'Jillian Aversa','https://ocremix.org/artist/4659/jillian-aversa');
+INSERT INTO "artist" VALUES(4660,'AkumajoBelmont','https://ocremix.org/artist/4660/akumajobelmont');
+INSERT INTO "artist" VALUES(4661,'Harmony','https://ocremix.org/artist/4661/harmony');
+INSERT INTO "artist" VALUES(4662,'Dragonlord','https://ocremix.org/artist/4662/dragonlord');
+INSERT INTO "artist" VALUES(4663,'OverCoat','https://ocremix.org/artist/4663/overcoat');
+INSERT INTO "artist" VALUES(4664,'ktriton','https://ocremix.org/artist/4664/ktriton');
+INSERT INTO "artist" VALUES(4665,'MAG','https://ocremix.org/artist/4665/mag');
+INSERT INTO "artist" VALUES(4666,'Navi','https://ocremix.org/artist/4666/navi');
+INSERT INTO "artist" VALUES(4667,'Ashane','https://ocremix.org/artist/4667/ashane');
+INSERT INTO "artist" VALUES(4668,'DCT','https://ocremix.org/artist/4668/dct');
+INSERT INTO "artist" VALUES(4669,'Just Us','https://ocremix.org/artist/4669/just-us');
+INSERT INTO "artist" VALUES(4670,'Sefiros','https://ocremix.org/artist/4670/sefiros');
+INSERT INTO "artist" VALUES(4671,'housethegrate','https://ocremix.org/artist/4671/housethegrate');
+INSERT INTO "artist" VALUES(4672,'Adam Dachis','https://ocremix.org/artist/4672/adam-dachis');
+INSERT INTO "artist" VALUES(4673,'Vurez','https://ocremix.org/artist/4673/vurez');
+INSERT INTO "artist" VALUES(4674,'Rubbler','https://ocremix.org/artist/4674/rubbler');
+INSERT INTO "artist" VALUES(4675,'tycho','https://ocremix.org/artist/4675/tycho');
+INSERT INTO "artist" VALUES(4676,'Xtormrage','https://ocremix.org/artist/4676/xtormrage');
+INSERT INTO "artist" VALUES(4677,'DHS','https://ocremix.org/artist/4677/dhs');
+INSERT INTO "artist" VALUES(4678,'N-JekteD','https://ocremix.org/artist/4678/n-jekted');
+INSERT INTO "artist" VALUES(4679,'Hale-Bopp','https://ocremix.org/artist/4679/hale-bopp');
+INSERT INTO "artist" VALUES(4680,'Matt Drouin','https://ocremix.org/artist/4680/matt-drouin');
+INSERT INTO "artist" VALUES(4681,'MaJIN_SaN','https://ocremix.org/artist/4681/majin-san');
+INSERT INTO "artist" VALUES(4682,'ambient','https://ocremix.org/artist/4682/ambient');
+INSERT INTO "artist" VALUES(4683,'tomatsu','https://ocremix.org/artist/4683/tomatsu');
+INSERT INTO "artist" VALUES(4684,'DZComposer','https://ocremix.org/artist/4684/dzcomposer');
+INSERT INTO "artist" VALUES(4685,'Juan Medrano','https://ocremix.org/artist/4685/juan-medrano');
+INSERT INTO "artist" VALUES(4686,'DistantJ','https://ocremix.org/artist/4686/distantj');
+INSERT INTO "artist" VALUES(4687,'GaMeBoX','https://ocremix.org/artist/4687/gamebox');
+INSERT INTO "artist" VALUES(4688,'Revolver Project','https://ocremix.org/artist/4688/revolver-project');
+INSERT INTO "artist" VALUES(4690,'D-Lux','https://ocremix.org/artist/4690/d-lux');
+INSERT INTO "artist" VALUES(4691,'Red Tailed Fox','https://ocremix.org/artist/4691/red-tailed-fox');
+INSERT INTO "artist" VALUES(4692,'Tepid','https://ocremix.org/artist/4692/tepid');
+INSERT INTO "artist" VALUES(4693,'zylance','https://ocremix.org/artist/4693/zylance');
+INSERT INTO "artist" VALUES(4694,'Geoffrey Taucer','https://ocremix.org/artist/4694/geoffrey-taucer');
+INSERT INTO "artist" VALUES(4695,'prophetik music','https://ocremix.org/artist/4695/prophetik-music');
+INSERT INTO "artist" VALUES(4696,'Zas','https://ocremix.org/artist/4696/zas');
+INSERT INTO "artist" VALUES(4697,'Abadoss','https://ocremix.org/artist/4697/abadoss');
+INSERT INTO "artist" VALUES(4698,'Usa','https://ocremix.org/artist/4698/usa');
+INSERT INTO "artist" VALUES(4699,'ilp0','https://ocremix.org/artist/4699/ilp0');
+INSERT INTO "artist" VALUES(4700,'Shonen Samurai','https://ocremix.org/artist/4700/shonen-samurai');
+INSERT INTO "artist" VALUES(4701,'Adrian Holovaty','https://ocremix.org/artist/4701/adrian-holovaty');
+INSERT INTO "artist" VALUES(4702,'Koelsch1','https://ocremix.org/artist/4702/koelsch1');
+INSERT INTO "artist" VALUES(4703,'RoeTaKa','https://ocremix.org/artist/4703/roetaka');
+INSERT INTO "artist" VALUES(4704,'Jormungand','https://ocremix.org/artist/4704/jormungand');
+INSERT INTO "artist" VALUES(4705,'Random Hero','https://ocremix.org/artist/4705/random-hero');
+INSERT INTO "artist" VALUES(4706,'Erik S','https://ocremix.org/artist/4706/erik-s');
+INSERT INTO "artist" VALUES(4707,'R3FORGED','https://ocremix.org/artist/4707/r3forged');
+INSERT INTO "artist" VALUES(4708,'richBRF','https://ocremix.org/artist/4708/richbrf');
+INSERT INTO "artist" VALUES(4709,'cheez80','https://ocremix.org/artist/4709/cheez80');
+INSERT INTO "artist" VALUES(4710,'Dani','https://ocremix.org/artist/4710/dani');
+INSERT INTO "artist" VALUES(4711,'Eric Dude','https://ocremix.org/artist/4711/eric-dude');
+INSERT INTO "artist" VALUES(4712,'MC Mouse the Mighty','https://ocremix.org/artist/4712/mc-mouse-the-mighty');
+INSERT INTO "artist" VALUES(4713,'Rydia of Mist','https://ocremix.org/artist/4713/rydia-of-mist');
+INSERT INTO "artist" VALUES(4714,'Warmth','https://ocremix.org/artist/4714/warmth');
+INSERT INTO "artist" VALUES(4715,'djbrilliant','https://ocremix.org/artist/4715/djbrilliant');
+INSERT INTO "artist" VALUES(4716,'kobash','https://ocremix.org/artist/4716/kobash');
+INSERT INTO "artist" VALUES(4717,'VIRTUALVIBE','https://ocremix.org/artist/4717/virtualvibe');
+INSERT INTO "artist" VALUES(4718,'Corran','https://ocremix.org/artist/4718/corran');
+INSERT INTO "artist" VALUES(4719,'Sukotto42','https://ocremix.org/artist/4719/sukotto42');
+INSERT INTO "artist" VALUES(4720,'LuIzA','https://ocremix.org/artist/4720/luiza');
+INSERT INTO "artist" VALUES(4721,'Pot Hocket','https://ocremix.org/artist/4721/pot-hocket');
+INSERT INTO "artist" VALUES(4722,'Patrick Burns','https://ocremix.org/artist/4722/patrick-burns');
+INSERT INTO "artist" VALUES(4723,'AeroZ','https://ocremix.org/artist/4723/aeroz');
+INSERT INTO "artist" VALUES(4724,'DrumUltimA','https://ocremix.org/artist/4724/drumultima');
+INSERT INTO "artist" VALUES(4725,'PLBenjaminZ','https://ocremix.org/artist/4725/plbenjaminz');
+INSERT INTO "artist" VALUES(4726,'DragonAvenger','https://ocremix.org/artist/4726/dragonavenger');
+INSERT INTO "artist" VALUES(4727,'EFields','https://ocremix.org/artist/4727/efields');
+INSERT INTO "artist" VALUES(4728,'Jredd','https://ocremix.org/artist/4728/jredd');
+INSERT INTO "artist" VALUES(4729,'OceansAndrew','https://ocremix.org/artist/4729/oceansandrew');
+INSERT INTO "artist" VALUES(4730,'Tweex','https://ocremix.org/artist/4730/tweex');
+INSERT INTO "artist" VALUES(4731,'ezpRado','https://ocremix.org/artist/4731/ezprado');
+INSERT INTO "artist" VALUES(4732,'David L. Puga','https://ocremix.org/artist/4732/david-l-puga');
+INSERT INTO "artist" VALUES(4733,'Maxo','https://ocremix.org/artist/4733/maxo');
+INSERT INTO "artist" VALUES(4734,'about:blank','https://ocremix.org/artist/4734/aboutblank');
+INSERT INTO "artist" VALUES(4735,'Justus Johnston','https://ocremix.org/artist/4735/justus-johnston');
+INSERT INTO "artist" VALUES(4736,'phoenixdk','https://ocremix.org/artist/4736/phoenixdk');
+INSERT INTO "artist" VALUES(4737,'GSlicer','https://ocremix.org/artist/4737/gslicer');
+INSERT INTO "artist" VALUES(4738,'Derek Oren','https://ocremix.org/artist/4738/derek-oren');
+INSERT INTO "artist" VALUES(4739,'chumble spuzz','https://ocremix.org/artist/4739/chumble-spuzz');
+INSERT INTO "artist" VALUES(4740,'ceili','https://ocremix.org/artist/4740/ceili');
+INSERT INTO "artist" VALUES(4741,'Ryo Lion','https://ocremix.org/artist/4741/ryo-lion');
+INSERT INTO "artist" VALUES(4742,'The Legendary Zoltan','https://ocremix.org/artist/4742/the-legendary-zoltan');
+INSERT INTO "artist" VALUES(4743,'Skrypnyk','https://ocremix.org/artist/4743/skrypnyk');
+INSERT INTO "artist" VALUES(4744,'XMark','https://ocremix.org/artist/4744/xmark');
+INSERT INTO "artist" VALUES(4745,'Danneman & Silverknekt','https://ocremix.org/artist/4745/danneman-and-silverknekt');
+INSERT INTO "artist" VALUES(4746,'Polar','https://ocremix.org/artist/4746/polar');
+INSERT INTO "artist" VALUES(4747,'zohar','https://ocremix.org/artist/4747/zohar');
+INSERT INTO "artist" VALUES(4748,'Sole Signal','https://ocremix.org/artist/4748/sole-signal');
+INSERT INTO "artist" VALUES(4749,'bustatunez','https://ocremix.org/artist/4749/bustatunez');
+INSERT INTO "artist" VALUES(4750,'Hemophiliac','https://ocremix.org/artist/4750/hemophiliac');
+INSERT INTO "artist" VALUES(4751,'Mattias Häggström Gerdt','https://ocremix.org/artist/4751/mattias-haggstrom-gerdt');
+INSERT INTO "artist" VALUES(4752,'Hy Bound','https://ocremix.org/artist/4752/hy-bound');
+INSERT INTO "artist" VALUES(4753,'norg','https://ocremix.org/artist/4753/norg');
+INSERT INTO "artist" VALUES(4754,'Fishy','https://ocremix.org/artist/4754/fishy');
+INSERT INTO "artist" VALUES(4755,'Liontamer','https://ocremix.org/artist/4755/liontamer');
+INSERT INTO "artist" VALUES(4756,'Prasa U.','https://ocremix.org/artist/4756/prasa-u');
+INSERT INTO "artist" VALUES(4757,'Evan Arnett','https://ocremix.org/artist/4757/evan-arnett');
+INSERT INTO "artist" VALUES(4758,'Beckett007','https://ocremix.org/artist/4758/beckett007');
+INSERT INTO "artist" VALUES(4759,'Radiowar','https://ocremix.org/artist/4759/radiowar');
+INSERT INTO "artist" VALUES(4760,'Danimal Cannon','https://ocremix.org/artist/4760/danimal-cannon');
+INSERT INTO "artist" VALUES(4761,'Cerrax','https://ocremix.org/artist/4761/cerrax');
+INSERT INTO "artist" VALUES(4762,'B33J','https://ocremix.org/artist/4762/b33j');
+INSERT INTO "artist" VALUES(4763,'nonsensicalexis','https://ocremix.org/artist/4763/nonsensicalexis');
+INSERT INTO "artist" VALUES(4764,'Nick Singer','https://ocremix.org/artist/4764/nick-singer');
+INSERT INTO "artist" VALUES(4765,'Scaredsim','https://ocremix.org/artist/4765/scaredsim');
+INSERT INTO "artist" VALUES(4766,'DarkMessenger','https://ocremix.org/artist/4766/darkmessenger');
+INSERT INTO "artist" VALUES(4767,'Ross Kmet','https://ocremix.org/artist/4767/ross-kmet');
+INSERT INTO "artist" VALUES(4768,'8 Bit Instrumental','https://ocremix.org/artist/4768/8-bit-instrumental');
+INSERT INTO "artist" VALUES(4769,'Anthony Lofton','https://ocremix.org/artist/4769/anthony-lofton');
+INSERT INTO "artist" VALUES(4770,'Long Dao','https://ocremix.org/artist/4770/long-dao');
+INSERT INTO "artist" VALUES(4771,'The Megas','https://ocremix.org/artist/4771/the-megas');
+INSERT INTO "artist" VALUES(4772,'Platonist','https://ocremix.org/artist/4772/platonist');
+INSERT INTO "artist" VALUES(4773,'Kidd Cabbage','https://ocremix.org/artist/4773/kidd-cabbage');
+INSERT INTO "artist" VALUES(4774,'Fru','https://ocremix.org/artist/4774/fru');
+INSERT INTO "artist" VALUES(4775,'Nav','https://ocremix.org/artist/4775/nav');
+INSERT INTO "artist" VALUES(4776,'ellywu2','https://ocremix.org/artist/4776/ellywu2');
+INSERT INTO "artist" VALUES(4777,'Avaris','https://ocremix.org/artist/4777/avaris');
+INSERT INTO "artist" VALUES(4778,'Steppo','https://ocremix.org/artist/4778/steppo');
+INSERT INTO "artist" VALUES(4779,'Musicalman','https://ocremix.org/artist/4779/musicalman');
+INSERT INTO "artist" VALUES(4780,'MomUltimA','https://ocremix.org/artist/4780/momultima');
+INSERT INTO "artist" VALUES(4781,'PrototypeRaptor','https://ocremix.org/artist/4781/prototyperaptor');
+INSERT INTO "artist" VALUES(4782,'Paul Levasseur','https://ocremix.org/artist/4782/paul-levasseur');
+INSERT INTO "artist" VALUES(4783,'Lifeformed','https://ocremix.org/artist/4783/lifeformed');
+INSERT INTO "artist" VALUES(4784,'Ekaj','https://ocremix.org/artist/4784/ekaj');
+INSERT INTO "artist" VALUES(4785,'Kabukibear','https://ocremix.org/artist/4785/kabukibear');
+INSERT INTO "artist" VALUES(4786,'Olarin','https://ocremix.org/artist/4786/olarin');
+INSERT INTO "artist" VALUES(4787,'Nutritious','https://ocremix.org/artist/4787/nutritious');
+INSERT INTO "artist" VALUES(4788,'Johan Krafft','https://ocremix.org/artist/4788/johan-krafft');
+INSERT INTO "artist" VALUES(4789,'Nekofrog','https://ocremix.org/artist/4789/nekofrog');
+INSERT INTO "artist" VALUES(4790,'John Revoredo','https://ocremix.org/artist/4790/john-revoredo');
+INSERT INTO "artist" VALUES(4791,'Evahn','https://ocremix.org/artist/4791/evahn');
+INSERT INTO "artist" VALUES(4792,'OneUp','https://ocremix.org/artist/4792/oneup');
+INSERT INTO "artist" VALUES(4793,'halc','https://ocremix.org/artist/4793/halc');
+INSERT INTO "artist" VALUES(4794,'CarnCarby','https://ocremix.org/artist/4794/carncarby');
+INSERT INTO "artist" VALUES(4795,'Rozovian','https://ocremix.org/artist/4795/rozovian');
+INSERT INTO "artist" VALUES(4796,'Theory of N','https://ocremix.org/artist/4796/theory-of-n');
+INSERT INTO "artist" VALUES(4797,'The Vagrance','https://ocremix.org/artist/4797/the-vagrance');
+INSERT INTO "artist" VALUES(4798,'Jewbei','https://ocremix.org/artist/4798/jewbei');
+INSERT INTO "artist" VALUES(4799,'Meteo Xavier','https://ocremix.org/artist/4799/meteo-xavier');
+INSERT INTO "artist" VALUES(4800,'Battlerager','https://ocremix.org/artist/4800/battlerager');
+INSERT INTO "artist" VALUES(4802,'Dead Lovers'' Consort','https://ocremix.org/artist/4802/dead-lovers-consort');
+INSERT INTO "artist" VALUES(4803,'The OneUps','https://ocremix.org/artist/4803/the-oneups');
+INSERT INTO "artist" VALUES(4804,'Standby','https://ocremix.org/artist/4804/standby');
+INSERT INTO "artist" VALUES(4805,'LSD','https://ocremix.org/artist/4805/lsd');
+INSERT INTO "artist" VALUES(4807,'Armcannon','https://ocremix.org/artist/4807/armcannon');
+INSERT INTO "artist" VALUES(4808,'PlanetSkill','https://ocremix.org/artist/4808/planetskill');
+INSERT INTO "artist" VALUES(4809,'The Grammar Club','https://ocremix.org/artist/4809/the-grammar-club');
+INSERT INTO "artist" VALUES(4846,'Nicole Adams','https://ocremix.org/artist/4846/nicole-adams');
+INSERT INTO "artist" VALUES(4961,'Goomin Nam','https://ocremix.org/artist/4961/goomin-nam');
+INSERT INTO "artist" VALUES(4967,'ptitteri','https://ocremix.org/artist/4967/ptitteri');
+INSERT INTO "artist" VALUES(4986,'Brand New Retro','https://ocremix.org/artist/4986/brand-new-retro');
+INSERT INTO "artist" VALUES(4994,'TheDeath','https://ocremix.org/artist/4994/thedeath');
+INSERT INTO "artist" VALUES(5009,'Ryan Probst','https://ocremix.org/artist/5009/ryan-probst');
+INSERT INTO "artist" VALUES(5012,'Joren de Bruin','https://ocremix.org/artist/5012/joren-de-bruin');
+INSERT INTO "artist" VALUES(5033,'Akira Wing','https://ocremix.org/artist/5033/akira-wing');
+INSERT INTO "artist" VALUES(5034,'Argitoth','https://ocremix.org/artist/5034/argitoth');
+INSERT INTO "artist" VALUES(5035,'Commandcom','https://ocremix.org/artist/5035/commandcom');
+INSERT INTO "artist" VALUES(5036,'Fredrik Häthén','https://ocremix.org/artist/5036/fredrik-hathen');
+INSERT INTO "artist" VALUES(5037,'Gamer Symphony Orchestra','https://ocremix.org/artist/5037/gamer-symphony-orchestra');
+INSERT INTO "artist" VALUES(5038,'Jennerstein','https://ocremix.org/artist/5038/jennerstein');
+INSERT INTO "artist" VALUES(5039,'Kadmium','https://ocremix.org/artist/5039/kadmium');
+INSERT INTO "artist" VALUES(5040,'katethegreat19','https://ocremix.org/artist/5040/katethegreat19');
+INSERT INTO "artist" VALUES(5041,'Prince uf Darkness','https://ocremix.org/artist/5041/prince-uf-darkness');
+INSERT INTO "artist" VALUES(5042,'The Runaway Five','https://ocremix.org/artist/5042/the-runaway-five');
+INSERT INTO "artist" VALUES(5043,'WillRock','https://ocremix.org/artist/5043/willrock');
+INSERT INTO "artist" VALUES(5071,'AJiLe','https://ocremix.org/artist/5071/ajile');
+INSERT INTO "artist" VALUES(5095,'Andreas Wallström','https://ocremix.org/artist/5095/andreas-wallstrom');
+INSERT INTO "artist" VALUES(5096,'Paul Baxter','https://ocremix.org/artist/5096/paul-baxter');
+INSERT INTO "artist" VALUES(5097,'Brothersynthe','https://ocremix.org/artist/5097/brothersynthe');
+INSERT INTO "artist" VALUES(5127,'Gorgonian','https://ocremix.org/artist/5127/gorgonian');
+INSERT INTO "artist" VALUES(5128,'Nurykabe','https://ocremix.org/artist/5128/nurykabe');
+INSERT INTO "artist" VALUES(5130,'Blue.Nocturne','https://ocremix.org/artist/5130/bluenocturne');
+INSERT INTO "artist" VALUES(5131,'metaphist','https://ocremix.org/artist/5131/metaphist');
+INSERT INTO "artist" VALUES(5132,'Marc Junker','https://ocremix.org/artist/5132/marc-junker');
+INSERT INTO "artist" VALUES(5138,'DJ Goyim','https://ocremix.org/artist/5138/dj-goyim');
+INSERT INTO "artist" VALUES(5176,'Effinjerk','https://ocremix.org/artist/5176/effinjerk');
+INSERT INTO "artist" VALUES(5177,'Cliff Hooper','https://ocremix.org/artist/5177/cliff-hooper');
+INSERT INTO "artist" VALUES(5178,'PROTO·DOME','https://ocremix.org/artist/5178/protodome');
+INSERT INTO "artist" VALUES(5179,'Monkey Kong','https://ocremix.org/artist/5179/monkey-kong');
+INSERT INTO "artist" VALUES(5180,'Nase','https://ocremix.org/artist/5180/nase');
+INSERT INTO "artist" VALUES(5181,'KBart','https://ocremix.org/artist/5181/kbart');
+INSERT INTO "artist" VALUES(5182,'Stemage','https://ocremix.org/artist/5182/stemage');
+INSERT INTO "artist" VALUES(5183,'Monobrow','https://ocremix.org/artist/5183/monobrow');
+INSERT INTO "artist" VALUES(5184,'Diodes','https://ocremix.org/artist/5184/diodes');
+INSERT INTO "artist" VALUES(5185,'ISAO','https://ocremix.org/artist/5185/isao');
+INSERT INTO "artist" VALUES(5186,'Tuned Logic','https://ocremix.org/artist/5186/tuned-logic');
+INSERT INTO "artist" VALUES(5187,'The Dual Dragons','https://ocremix.org/artist/5187/the-dual-dragons');
+INSERT INTO "artist" VALUES(5198,'audio fidelity','https://ocremix.org/artist/5198/audio-fidelity');
+INSERT INTO "artist" VALUES(5199,'Loka LaFevre','https://ocremix.org/artist/5199/loka-lafevre');
+INSERT INTO "artist" VALUES(5200,'The Fabul Men''s Choir','https://ocremix.org/artist/5200/the-fabul-mens-choir');
+INSERT INTO "artist" VALUES(5201,'theultravisitor','https://ocremix.org/artist/5201/theultravisitor');
+INSERT INTO "artist" VALUES(5269,'Andrew Thompson','https://ocremix.org/artist/5269/andrew-thompson');
+INSERT INTO "artist" VALUES(5315,'Dr. Manhattan','https://ocremix.org/artist/5315/dr-manhattan');
+INSERT INTO "artist" VALUES(5320,'Ari Kessler','https://ocremix.org/artist/5320/ari-kessler');
+INSERT INTO "artist" VALUES(5321,'Marshall Skinner','https://ocremix.org/artist/5321/marshall-skinner');
+INSERT INTO "artist" VALUES(5322,'Keith Maxwell Button','https://ocremix.org/artist/5322/keith-maxwell-button');
+INSERT INTO "artist" VALUES(5386,'jmr','https://ocremix.org/artist/5386/jmr');
+INSERT INTO "artist" VALUES(5390,'Khemael','https://ocremix.org/artist/5390/khemael');
+INSERT INTO "artist" VALUES(5391,'GuitarBizarre','https://ocremix.org/artist/5391/guitarbizarre');
+INSERT INTO "artist" VALUES(5392,'Matt E. Waldman','https://ocremix.org/artist/5392/matt-e-waldman');
+INSERT INTO "artist" VALUES(5393,'The University of Toronto 10 O''Clock Big Band','https://ocremix.org/artist/5393/the-university-of-toronto-10-oclock-big-band');
+INSERT INTO "artist" VALUES(5394,'Ashleigh Coryell','https://ocremix.org/artist/5394/ashleigh-coryell');
+INSERT INTO "artist" VALUES(5396,'Xenon Odyssey','https://ocremix.org/artist/5396/xenon-odyssey');
+INSERT INTO "artist" VALUES(5405,'SREYAS','https://ocremix.org/artist/5405/sreyas');
+INSERT INTO "artist" VALUES(5406,'Josh Whelchel','https://ocremix.org/artist/5406/josh-whelchel');
+INSERT INTO "artist" VALUES(5409,'Brandon Strader','https://ocremix.org/artist/5409/brandon-strader');
+INSERT INTO "artist" VALUES(5415,'Vyper','https://ocremix.org/artist/5415/vyper');
+INSERT INTO "artist" VALUES(5420,'Level 99','https://ocremix.org/artist/5420/level-99');
+INSERT INTO "artist" VALUES(5425,'Justin Tense','https://ocremix.org/artist/5425/justin-tense');
+INSERT INTO "artist" VALUES(5473,'Cyril the Wolf','https://ocremix.org/artist/5473/cyril-the-wolf');
+INSERT INTO "artist" VALUES(5474,'M-One','https://ocremix.org/artist/5474/m-one');
+INSERT INTO "artist" VALUES(5496,'Moonlapse','https://ocremix.org/artist/5496/moonlapse');
+INSERT INTO "artist" VALUES(5511,'Phrakture','https://ocremix.org/artist/5511/phrakture');
+INSERT INTO "artist" VALUES(5548,'adrian','https://ocremix.org/artist/5548/adrian');
+INSERT INTO "artist" VALUES(5549,'Eric Jadi','https://ocremix.org/artist/5549/eric-jadi');
+INSERT INTO "artist" VALUES(5569,'Seventh Epic','https://ocremix.org/artist/5569/seventh-epic');
+INSERT INTO "artist" VALUES(5628,'AMT','https://ocremix.org/artist/5628/amt');
+INSERT INTO "artist" VALUES(5643,'Pyro Paper Planes','https://ocremix.org/artist/5643/pyro-paper-planes');
+INSERT INTO "artist" VALUES(5653,'Nubioso','https://ocremix.org/artist/5653/nubioso');
+INSERT INTO "artist" VALUES(5654,'Dazey','https://ocremix.org/artist/5654/dazey');
+INSERT INTO "artist" VALUES(5655,'Flexstyle','https://ocremix.org/artist/5655/flexstyle');
+INSERT INTO "artist" VALUES(5706,'M.J. Ault','https://ocremix.org/artist/5706/mj-ault');
+INSERT INTO "artist" VALUES(5707,'Flickerfall','https://ocremix.org/artist/5707/flickerfall');
+INSERT INTO "artist" VALUES(5717,'The Scuba Divers','https://ocremix.org/artist/5717/the-scuba-divers');
+INSERT INTO "artist" VALUES(5748,'Peach','https://ocremix.org/artist/5748/peach');
+INSERT INTO "artist" VALUES(5792,'Mrmilkcarton','https://ocremix.org/artist/5792/mrmilkcarton');
+INSERT INTO "artist" VALUES(5793,'Harjawaldar','https://ocremix.org/artist/5793/harjawaldar');
+INSERT INTO "artist" VALUES(5826,'David Saulesco','https://ocremix.org/artist/5826/david-saulesco');
+INSERT INTO "artist" VALUES(5876,'elzfernomusic','https://ocremix.org/artist/5876/elzfernomusic');
+INSERT INTO "artist" VALUES(5877,'blackguitar','https://ocremix.org/artist/5877/blackguitar');
+INSERT INTO "artist" VALUES(5878,'Luhny','https://ocremix.org/artist/5878/luhny');
+INSERT INTO "artist" VALUES(5879,'brentalfloss','https://ocremix.org/artist/5879/brentalfloss');
+INSERT INTO "artist" VALUES(5900,'Jeremy Johnson','https://ocremix.org/artist/5900/jeremy-johnson');
+INSERT INTO "artist" VALUES(5901,'Jennifer Graham','https://ocremix.org/artist/5901/jennifer-graham');
+INSERT INTO "artist" VALUES(5902,'Lisa Leamons','https://ocremix.org/artist/5902/lisa-leamons');
+INSERT INTO "artist" VALUES(5903,'Tim Yarbrough','https://ocremix.org/artist/5903/tim-yarbrough');
+INSERT INTO "artist" VALUES(5939,'Poolside','https://ocremix.org/artist/5939/poolside');
+INSERT INTO "artist" VALUES(5940,'Melinda Hershey','https://ocremix.org/artist/5940/melinda-hershey');
+INSERT INTO "artist" VALUES(6002,'George R. Powell','https://ocremix.org/artist/6002/george-r-powell');
+INSERT INTO "artist" VALUES(6015,'Claado Shou','https://ocremix.org/artist/6015/claado-shou');
+INSERT INTO "artist" VALUES(6016,'vertexguy','https://ocremix.org/artist/6016/vertexguy');
+INSERT INTO "artist" VALUES(6106,'BlackPanther','https://ocremix.org/artist/6106/blackpanther');
+INSERT INTO "artist" VALUES(6107,'HALO_ZERO','https://ocremix.org/artist/6107/halo-zero');
+INSERT INTO "artist" VALUES(6112,'Dr. Velvet','https://ocremix.org/artist/6112/dr-velvet');
+INSERT INTO "artist" VALUES(6113,'Nick Perrin','https://ocremix.org/artist/6113/nick-perrin');
+INSERT INTO "artist" VALUES(6114,'MMvsUSAF','https://ocremix.org/artist/6114/mmvsusaf');
+INSERT INTO "artist" VALUES(6126,'RushJet1','https://ocremix.org/artist/6126/rushjet1');
+INSERT INTO "artist" VALUES(6131,'Jared Dunn','https://ocremix.org/artist/6131/jared-dunn');
+INSERT INTO "artist" VALUES(6132,'William Reyes','https://ocremix.org/artist/6132/william-reyes');
+INSERT INTO "artist" VALUES(6144,'Chickenwarlord','https://ocremix.org/artist/6144/chickenwarlord');
+INSERT INTO "artist" VALUES(8119,'Iggy Koopa','https://ocremix.org/artist/8119/iggy-koopa');
+INSERT INTO "artist" VALUES(8353,'2P','https://ocremix.org/artist/8353/2p');
+INSERT INTO "artist" VALUES(8358,'Steve Lella','https://ocremix.org/artist/8358/steve-lella');
+INSERT INTO "artist" VALUES(8359,'The Crakaz','https://ocremix.org/artist/8359/the-crakaz');
+INSERT INTO "artist" VALUES(8361,'Jean Of mArc','https://ocremix.org/artist/8361/jean-of-marc');
+INSERT INTO "artist" VALUES(8498,'Mega Ran','https://ocremix.org/artist/8498/mega-ran');
+INSERT INTO "artist" VALUES(8587,'RGM_burai','https://ocremix.org/artist/8587/rgm-burai');
+INSERT INTO "artist" VALUES(8640,'Wiesty','https://ocremix.org/artist/8640/wiesty');
+INSERT INTO "artist" VALUES(8893,'Anticitizen','https://ocremix.org/artist/8893/anticitizen');
+INSERT INTO "artist" VALUES(8981,'Dummy','https://ocremix.org/artist/8981/dummy');
+INSERT INTO "artist" VALUES(8998,'Lemonectric','https://ocremix.org/artist/8998/lemonectric');
+INSERT INTO "artist" VALUES(9047,'Guifrog','https://ocremix.org/artist/9047/guifrog');
+INSERT INTO "artist" VALUES(9076,'Hyadain','https://ocremix.org/artist/9076/hyadain');
+INSERT INTO "artist" VALUES(9079,'Brynner Agassi','https://ocremix.org/artist/9079/brynner-agassi');
+INSERT INTO "artist" VALUES(9080,'Elation','https://ocremix.org/artist/9080/elation');
+INSERT INTO "artist" VALUES(9264,'Alexander Bornstein','https://ocremix.org/artist/9264/alexander-bornstein');
+INSERT INTO "artist" VALUES(9282,'Washudoll','https://ocremix.org/artist/9282/washudoll');
+INSERT INTO "artist" VALUES(9498,'Monster Iestyn','https://ocremix.org/artist/9498/monster-iestyn');
+INSERT INTO "artist" VALUES(9511,'dannyshock','https://ocremix.org/artist/9511/dannyshock');
+INSERT INTO "artist" VALUES(9512,'Wild','https://ocremix.org/artist/9512/wild');
+INSERT INTO "artist" VALUES(9514,'Southwestern College Afro-Cuban Jazz Ensemble','https://ocremix.org/artist/9514/southwestern-college-afro-cuban-jazz-ensemble');
+INSERT INTO "artist" VALUES(9516,'Sergiu Muresan','https://ocremix.org/artist/9516/sergiu-muresan');
+INSERT INTO "artist" VALUES(9520,'Jago','https://ocremix.org/artist/9520/jago');
+INSERT INTO "artist" VALUES(9528,'Laura Shigihara','https://ocremix.org/artist/9528/laura-shigihara');
+INSERT INTO "artist" VALUES(9690,'tibonev','https://ocremix.org/artist/9690/tibonev');
+INSERT INTO "artist" VALUES(9847,'Pavos','https://ocremix.org/artist/9847/pavos');
+INSERT INTO "artist" VALUES(9851,'Nicholas Tam','https://ocremix.org/artist/9851/nicholas-tam');
+INSERT INTO "artist" VALUES(9939,'Light Pillar','https://ocremix.org/artist/9939/light-pillar');
+INSERT INTO "artist" VALUES(9947,'Insert Rupee','https://ocremix.org/artist/9947/insert-rupee');
+INSERT INTO "artist" VALUES(9962,'Miearth','https://ocremix.org/artist/9962/miearth');
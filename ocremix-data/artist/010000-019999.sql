@@ -0,0 +1,971 @@
+INSERT INTO "artist" VALUES(10007,'TJ Nekko','https://ocremix.org/artist/10007/tj-nekko');
+INSERT INTO "artist" VALUES(10032,'Farkle','https://ocremix.org/artist/10032/farkle');
+INSERT INTO "artist" VALUES(10123,'AlteredBeats','https://ocremix.org/artist/10123/alteredbeats');
+INSERT INTO "artist" VALUES(10124,'ansgaros','https://ocremix.org/artist/10124/ansgaros');
+INSERT INTO "artist" VALUES(10125,'MetalvaniaX','https://ocremix.org/artist/10125/metalvaniax');
+INSERT INTO "artist" VALUES(10136,'Archangel','https://ocremix.org/artist/10136/archangel');
+INSERT INTO "artist" VALUES(10172,'DarkSim','https://ocremix.org/artist/10172/darksim');
+INSERT INTO "artist" VALUES(10202,'Juha Vilmi','https://ocremix.org/artist/10202/juha-vilmi');
+INSERT INTO "artist" VALUES(10203,'Zero Division','https://ocremix.org/artist/10203/zero-division');
+INSERT INTO "artist" VALUES(10204,'Souliarc','https://ocremix.org/artist/10204/souliarc');
+INSERT INTO "artist" VALUES(10221,'Knight of the Round','https://ocremix.org/artist/10221/knight-of-the-round');
+INSERT INTO "artist" VALUES(10222,'Dj Mystix','https://ocremix.org/artist/10222/dj-mystix');
+INSERT INTO "artist" VALUES(10223,'Kenogu Labz','https://ocremix.org/artist/10223/kenogu-labz');
+INSERT INTO "artist" VALUES(10224,'DJ-AKX','https://ocremix.org/artist/10224/dj-akx');
+INSERT INTO "artist" VALUES(10225,'3R2','https://ocremix.org/artist/10225/3r2');
+INSERT INTO "artist" VALUES(10226,'Mikeaudio','https://ocremix.org/artist/10226/mikeaudio');
+INSERT INTO "artist" VALUES(10270,'Eric Griffin','https://ocremix.org/artist/10270/eric-griffin');
+INSERT INTO "artist" VALUES(10271,'Derek Meler','https://ocremix.org/artist/10271/derek-meler');
+INSERT INTO "artist" VALUES(10272,'Marcus Affeldt','https://ocremix.org/artist/10272/marcus-affeldt');
+INSERT INTO "artist" VALUES(10273,'Alex Jones','https://ocremix.org/artist/10273/alex-jones');
+INSERT INTO "artist" VALUES(10274,'Stacy Morse','https://ocremix.org/artist/10274/stacy-morse');
+INSERT INTO "artist" VALUES(10277,'Squint','https://ocremix.org/artist/10277/squint');
+INSERT INTO "artist" VALUES(10319,'The Cynic Project','https://ocremix.org/artist/10319/the-cynic-project');
+INSERT INTO "artist" VALUES(10576,'C418','https://ocremix.org/artist/10576/c418');
+INSERT INTO "artist" VALUES(10656,'Wild_Cat','https://ocremix.org/artist/10656/wild-cat');
+INSERT INTO "artist" VALUES(10660,'P.M. Crockett','https://ocremix.org/artist/10660/pm-crockett');
+INSERT INTO "artist" VALUES(10661,'Fallen Seraph','https://ocremix.org/artist/10661/fallen-seraph');
+INSERT INTO "artist" VALUES(10662,'The OverClocked Plaid Muffins','https://ocremix.org/artist/10662/the-overclocked-plaid-muffins');
+INSERT INTO "artist" VALUES(10663,'Nabeel Ansari','https://ocremix.org/artist/10663/nabeel-ansari');
+INSERT INTO "artist" VALUES(10664,'Steel Battalion','https://ocremix.org/artist/10664/steel-battalion');
+INSERT INTO "artist" VALUES(10665,'TGH','https://ocremix.org/artist/10665/tgh');
+INSERT INTO "artist" VALUES(10666,'Commando 64','https://ocremix.org/artist/10666/commando-64');
+INSERT INTO "artist" VALUES(10667,'Lastair','https://ocremix.org/artist/10667/lastair');
+INSERT INTO "artist" VALUES(10668,'Dave Kellogg','https://ocremix.org/artist/10668/dave-kellogg');
+INSERT INTO "artist" VALUES(10669,'Anti-Syne','https://ocremix.org/artist/10669/anti-syne');
+INSERT INTO "artist" VALUES(10670,'Doc Nano','https://ocremix.org/artist/10670/doc-nano');
+INSERT INTO "artist" VALUES(10671,'Chris ~ Amaterasu','https://ocremix.org/artist/10671/chris-amaterasu');
+INSERT INTO "artist" VALUES(10672,'Jonah-B','https://ocremix.org/artist/10672/jonah-b');
+INSERT INTO "artist" VALUES(10674,'The Key to Progression','https://ocremix.org/artist/10674/the-key-to-progression');
+INSERT INTO "artist" VALUES(10681,'Kain Minter','https://ocremix.org/artist/10681/kain-minter');
+INSERT INTO "artist" VALUES(10682,'Disasterpeace','https://ocremix.org/artist/10682/disasterpeace');
+INSERT INTO "artist" VALUES(10683,'Jeff Ball','https://ocremix.org/artist/10683/jeff-ball');
+INSERT INTO "artist" VALUES(10684,'SenPi','https://ocremix.org/artist/10684/senpi');
+INSERT INTO "artist" VALUES(10685,'JH Sounds','https://ocremix.org/artist/10685/jh-sounds');
+INSERT INTO "artist" VALUES(10690,'Emunator','https://ocremix.org/artist/10690/emunator');
+INSERT INTO "artist" VALUES(10691,'Mr. Jones','https://ocremix.org/artist/10691/mr-jones');
+INSERT INTO "artist" VALUES(10692,'melody','https://ocremix.org/artist/10692/melody');
+INSERT INTO "artist" VALUES(10693,'Erik Kristofferson','https://ocremix.org/artist/10693/erik-kristofferson');
+INSERT INTO "artist" VALUES(10694,'Thomas Gustafson','https://ocremix.org/artist/10694/thomas-gustafson');
+INSERT INTO "artist" VALUES(10704,'Kiamet','https://ocremix.org/artist/10704/kiamet');
+INSERT INTO "artist" VALUES(10708,'Todd Goldfinger','https://ocremix.org/artist/10708/todd-goldfinger');
+INSERT INTO "artist" VALUES(10709,'WhoAmI?','https://ocremix.org/artist/10709/whoami');
+INSERT INTO "artist" VALUES(10710,'Teaganbear','https://ocremix.org/artist/10710/teaganbear');
+INSERT INTO "artist" VALUES(10711,'Z.','https://ocremix.org/artist/10711/z');
+INSERT INTO "artist" VALUES(10712,'Shael Riley and the Double Ice Backfire','https://ocremix.org/artist/10712/shael-riley-and-the-double-ice-backfire');
+INSERT INTO "artist" VALUES(10723,'Draconiator','https://ocremix.org/artist/10723/draconiator');
+INSERT INTO "artist" VALUES(10724,'Captain Hogan','https://ocremix.org/artist/10724/captain-hogan');
+INSERT INTO "artist" VALUES(10771,'Tryezz','https://ocremix.org/artist/10771/tryezz');
+INSERT INTO "artist" VALUES(10772,'DiGi Valentine','https://ocremix.org/artist/10772/digi-valentine');
+INSERT INTO "artist" VALUES(10773,'Danielle Messina','https://ocremix.org/artist/10773/danielle-messina');
+INSERT INTO "artist" VALUES(10774,'Ryan C. Connelly','https://ocremix.org/artist/10774/ryan-c-connelly');
+INSERT INTO "artist" VALUES(10866,'Gario','https://ocremix.org/artist/10866/gario');
+INSERT INTO "artist" VALUES(10893,'J Damashii','https://ocremix.org/artist/10893/j-damashii');
+INSERT INTO "artist" VALUES(10894,'ladyWildfire','https://ocremix.org/artist/10894/ladywildfire');
+INSERT INTO "artist" VALUES(10895,'Midgarian Sky','https://ocremix.org/artist/10895/midgarian-sky');
+INSERT INTO "artist" VALUES(10896,'Evory','https://ocremix.org/artist/10896/evory');
+INSERT INTO "artist" VALUES(10897,'C7','https://ocremix.org/artist/10897/c7');
+INSERT INTO "artist" VALUES(10898,'Drakken','https://ocremix.org/artist/10898/drakken');
+INSERT INTO "artist" VALUES(10899,'Entheogen','https://ocremix.org/artist/10899/entheogen');
+INSERT INTO "artist" VALUES(10900,'Sam Dillard','https://ocremix.org/artist/10900/sam-dillard');
+INSERT INTO "artist" VALUES(10901,'C-GPO','https://ocremix.org/artist/10901/c-gpo');
+INSERT INTO "artist" VALUES(10902,'Gabe Terracciano','https://ocremix.org/artist/10902/gabe-terracciano');
+INSERT INTO "artist" VALUES(10988,'CFX','https://ocremix.org/artist/10988/cfx');
+INSERT INTO "artist" VALUES(10989,'A.COE','https://ocremix.org/artist/10989/acoe');
+INSERT INTO "artist" VALUES(10990,'DjjD','https://ocremix.org/artist/10990/djjd');
+INSERT INTO "artist" VALUES(10994,'sci','https://ocremix.org/artist/10994/sci');
+INSERT INTO "artist" VALUES(10995,'ZelterXC','https://ocremix.org/artist/10995/zelterxc');
+INSERT INTO "artist" VALUES(11002,'University of Manitoba Symphony Orchestra','https://ocremix.org/artist/11002/university-of-manitoba-symphony-orchestra');
+INSERT INTO "artist" VALUES(11028,'Zzr','https://ocremix.org/artist/11028/zzr');
+INSERT INTO "artist" VALUES(11082,'Khakolak Boy','https://ocremix.org/artist/11082/khakolak-boy');
+INSERT INTO "artist" VALUES(11143,'HyperDuck SoundWorks','https://ocremix.org/artist/11143/hyperduck-soundworks');
+INSERT INTO "artist" VALUES(11240,'Skummel Maske','https://ocremix.org/artist/11240/skummel-maske');
+INSERT INTO "artist" VALUES(11356,'Mike Saint-Jules','https://ocremix.org/artist/11356/mike-saint-jules');
+INSERT INTO "artist" VALUES(11429,'Brent Kennedy','https://ocremix.org/artist/11429/brent-kennedy');
+INSERT INTO "artist" VALUES(11479,'Janna McKinley','https://ocremix.org/artist/11479/janna-mckinley');
+INSERT INTO "artist" VALUES(11480,'Jonathan Mills','https://ocremix.org/artist/11480/jonathan-mills');
+INSERT INTO "artist" VALUES(11481,'Thunder Thouin','https://ocremix.org/artist/11481/thunder-thouin');
+INSERT INTO "artist" VALUES(11489,'Dasgust','https://ocremix.org/artist/11489/dasgust');
+INSERT INTO "artist" VALUES(11490,'Kevin Penkin','https://ocremix.org/artist/11490/kevin-penkin');
+INSERT INTO "artist" VALUES(11493,'4 Keys','https://ocremix.org/artist/11493/4-keys');
+INSERT INTO "artist" VALUES(11494,'CJthemusicdude','https://ocremix.org/artist/11494/cjthemusicdude');
+INSERT INTO "artist" VALUES(11495,'Waveformer','https://ocremix.org/artist/11495/waveformer');
+INSERT INTO "artist" VALUES(11496,'Hot Freaks','https://ocremix.org/artist/11496/hot-freaks');
+INSERT INTO "artist" VALUES(11497,'The Griever','https://ocremix.org/artist/11497/the-griever');
+INSERT INTO "artist" VALUES(11498,'HoboKa','https://ocremix.org/artist/11498/hoboka');
+INSERT INTO "artist" VALUES(11499,'BONKERS','https://ocremix.org/artist/11499/bonkers');
+INSERT INTO "artist" VALUES(11501,'Mordi','https://ocremix.org/artist/11501/mordi');
+INSERT INTO "artist" VALUES(11503,'Gibs','https://ocremix.org/artist/11503/gibs');
+INSERT INTO "artist" VALUES(11510,'Avitron','https://ocremix.org/artist/11510/avitron');
+INSERT INTO "artist" VALUES(11551,'Senescence','https://ocremix.org/artist/11551/senescence');
+INSERT INTO "artist" VALUES(11582,'Jenny Fae Davis','https://ocremix.org/artist/11582/jenny-fae-davis');
+INSERT INTO "artist" VALUES(11677,'Abram McCalment','https://ocremix.org/artist/11677/abram-mccalment');
+INSERT INTO "artist" VALUES(11773,'anterroir','https://ocremix.org/artist/11773/anterroir');
+INSERT INTO "artist" VALUES(11774,'DusK','https://ocremix.org/artist/11774/dusk');
+INSERT INTO "artist" VALUES(11775,'FaytxStay','https://ocremix.org/artist/11775/faytxstay');
+INSERT INTO "artist" VALUES(11776,'Sockpuppet','https://ocremix.org/artist/11776/sockpuppet');
+INSERT INTO "artist" VALUES(11777,'Matt R.','https://ocremix.org/artist/11777/matt-r');
+INSERT INTO "artist" VALUES(11778,'S. Battle','https://ocremix.org/artist/11778/s-battle');
+INSERT INTO "artist" VALUES(11779,'Jeffrey Hayat','https://ocremix.org/artist/11779/jeffrey-hayat');
+INSERT INTO "artist" VALUES(11780,'LemonLime','https://ocremix.org/artist/11780/lemonlime');
+INSERT INTO "artist" VALUES(11781,'liquid wind','https://ocremix.org/artist/11781/liquid-wind');
+INSERT INTO "artist" VALUES(11782,'Mak Eightman','https://ocremix.org/artist/11782/mak-eightman');
+INSERT INTO "artist" VALUES(11785,'Jabzizi','https://ocremix.org/artist/11785/jabzizi');
+INSERT INTO "artist" VALUES(11797,'Omni-Psyence','https://ocremix.org/artist/11797/omni-psyence');
+INSERT INTO "artist" VALUES(11799,'Martin Villanueva','https://ocremix.org/artist/11799/martin-villanueva');
+INSERT INTO "artist" VALUES(11800,'Dominic Ninmark','https://ocremix.org/artist/11800/dominic-ninmark');
+INSERT INTO "artist" VALUES(11879,'StrangeJam','https://ocremix.org/artist/11879/strangejam');
+INSERT INTO "artist" VALUES(11895,'Block Party','https://ocremix.org/artist/11895/block-party');
+INSERT INTO "artist" VALUES(11899,'Brushfire','https://ocremix.org/artist/11899/brushfire');
+INSERT INTO "artist" VALUES(11914,'ZorlaxSeven','https://ocremix.org/artist/11914/zorlaxseven');
+INSERT INTO "artist" VALUES(11915,'Sabivee','https://ocremix.org/artist/11915/sabivee');
+INSERT INTO "artist" VALUES(11928,'Daybreaker','https://ocremix.org/artist/11928/daybreaker');
+INSERT INTO "artist" VALUES(11929,'Magellanic','https://ocremix.org/artist/11929/magellanic');
+INSERT INTO "artist" VALUES(11930,'Moomba','https://ocremix.org/artist/11930/moomba');
+INSERT INTO "artist" VALUES(11931,'Luke Keever','https://ocremix.org/artist/11931/luke-keever');
+INSERT INTO "artist" VALUES(11932,'Rockos','https://ocremix.org/artist/11932/rockos');
+INSERT INTO "artist" VALUES(11937,'Artem Bank','https://ocremix.org/artist/11937/artem-bank');
+INSERT INTO "artist" VALUES(11938,'bXmMusic','https://ocremix.org/artist/11938/bxmmusic');
+INSERT INTO "artist" VALUES(11939,'Pete Lepley','https://ocremix.org/artist/11939/pete-lepley');
+INSERT INTO "artist" VALUES(11940,'DaMonz','https://ocremix.org/artist/11940/damonz');
+INSERT INTO "artist" VALUES(11941,'Izkemia','https://ocremix.org/artist/11941/izkemia');
+INSERT INTO "artist" VALUES(11942,'Super Guitar Bros.','https://ocremix.org/artist/11942/super-guitar-bros');
+INSERT INTO "artist" VALUES(11943,'Devastus','https://ocremix.org/artist/11943/devastus');
+INSERT INTO "artist" VALUES(11944,'Zoned','https://ocremix.org/artist/11944/zoned');
+INSERT INTO "artist" VALUES(11945,'Psycho Crusher','https://ocremix.org/artist/11945/psycho-crusher');
+INSERT INTO "artist" VALUES(11959,'Mega Beardo','https://ocremix.org/artist/11959/mega-beardo');
+INSERT INTO "artist" VALUES(11960,'fredrikd','https://ocremix.org/artist/11960/fredrikd');
+INSERT INTO "artist" VALUES(11961,'Preenus','https://ocremix.org/artist/11961/preenus');
+INSERT INTO "artist" VALUES(11962,'Torzelan','https://ocremix.org/artist/11962/torzelan');
+INSERT INTO "artist" VALUES(11963,'DDRKirby(ISQ)','https://ocremix.org/artist/11963/ddrkirbyisq');
+INSERT INTO "artist" VALUES(11967,'Dj Mokram','https://ocremix.org/artist/11967/dj-mokram');
+INSERT INTO "artist" VALUES(12064,'XPRTNovice','https://ocremix.org/artist/12064/xprtnovice');
+INSERT INTO "artist" VALUES(12065,'aivi','https://ocremix.org/artist/12065/aivi');
+INSERT INTO "artist" VALUES(12106,'Claire Yaxley','https://ocremix.org/artist/12106/claire-yaxley');
+INSERT INTO "artist" VALUES(12107,'Kevvviiinnn','https://ocremix.org/artist/12107/kevvviiinnn');
+INSERT INTO "artist" VALUES(12131,'Chris Belair','https://ocremix.org/artist/12131/chris-belair');
+INSERT INTO "artist" VALUES(12149,'Sunil Carris','https://ocremix.org/artist/12149/sunil-carris');
+INSERT INTO "artist" VALUES(12312,'AlanGee15','https://ocremix.org/artist/12312/alangee15');
+INSERT INTO "artist" VALUES(12314,'PsyNES','https://ocremix.org/artist/12314/psynes');
+INSERT INTO "artist" VALUES(12315,'Elrinth','https://ocremix.org/artist/12315/elrinth');
+INSERT INTO "artist" VALUES(12316,'Chiwalker','https://ocremix.org/artist/12316/chiwalker');
+INSERT INTO "artist" VALUES(12317,'Rukunetsu','https://ocremix.org/artist/12317/rukunetsu');
+INSERT INTO "artist" VALUES(12318,'David Lindskog','https://ocremix.org/artist/12318/david-lindskog');
+INSERT INTO "artist" VALUES(12319,'Chris Lundberg','https://ocremix.org/artist/12319/chris-lundberg');
+INSERT INTO "artist" VALUES(12320,'Jackson Stevens','https://ocremix.org/artist/12320/jackson-stevens');
+INSERT INTO "artist" VALUES(12321,'Kevin Matthews','https://ocremix.org/artist/12321/kevin-matthews');
+INSERT INTO "artist" VALUES(12322,'Rose Martin','https://ocremix.org/artist/12322/rose-martin');
+INSERT INTO "artist" VALUES(12351,'CrimzonWolf777','https://ocremix.org/artist/12351/crimzonwolf777');
+INSERT INTO "artist" VALUES(12352,'Leandro Abreu','https://ocremix.org/artist/12352/leandro-abreu');
+INSERT INTO "artist" VALUES(12355,'DR.WELI','https://ocremix.org/artist/12355/drweli');
+INSERT INTO "artist" VALUES(12359,'Acadia Percussion Ensemble','https://ocremix.org/artist/12359/acadia-percussion-ensemble');
+INSERT INTO "artist" VALUES(12364,'ad.mixx','https://ocremix.org/artist/12364/admixx');
+INSERT INTO "artist" VALUES(12366,'Jackson Lawhead','https://ocremix.org/artist/12366/jackson-lawhead');
+INSERT INTO "artist" VALUES(12421,'OverClocked University','https://ocremix.org/artist/12421/overclocked-university');
+INSERT INTO "artist" VALUES(12422,'Forrest Fire','https://ocremix.org/artist/12422/forrest-fire');
+INSERT INTO "artist" VALUES(12480,'The Scarborough Joker','https://ocremix.org/artist/12480/the-scarborough-joker');
+INSERT INTO "artist" VALUES(12481,'Paul Capps','https://ocremix.org/artist/12481/paul-capps');
+INSERT INTO "artist" VALUES(12483,'Ergosonic','https://ocremix.org/artist/12483/ergosonic');
+INSERT INTO "artist" VALUES(12484,'Daniel Rosenqvist','https://ocremix.org/artist/12484/daniel-rosenqvist');
+INSERT INTO "artist" VALUES(12540,'Chernabogue','https://ocremix.org/artist/12540/chernabogue');
+INSERT INTO "artist" VALUES(12541,'Argle','https://ocremix.org/artist/12541/argle');
+INSERT INTO "artist" VALUES(12542,'Midioker','https://ocremix.org/artist/12542/midioker');
+INSERT INTO "artist" VALUES(12546,'David Erick Ramos','https://ocremix.org/artist/12546/david-erick-ramos');
+INSERT INTO "artist" VALUES(12547,'FunkyEntropy','https://ocremix.org/artist/12547/funkyentropy');
+INSERT INTO "artist" VALUES(12559,'Anton Corazza','https://ocremix.org/artist/12559/anton-corazza');
+INSERT INTO "artist" VALUES(12560,'Scott Buckley','https://ocremix.org/artist/12560/scott-buckley');
+INSERT INTO "artist" VALUES(12701,'D.L. Infamous','https://ocremix.org/artist/12701/dl-infamous');
+INSERT INTO "artist" VALUES(12702,'Dirty Delay','https://ocremix.org/artist/12702/dirty-delay');
+INSERT INTO "artist" VALUES(12703,'Redg','https://ocremix.org/artist/12703/redg');
+INSERT INTO "artist" VALUES(12704,'Brandon Snell','https://ocremix.org/artist/12704/brandon-snell');
+INSERT INTO "artist" VALUES(12705,'MEGAROCKMAN','https://ocremix.org/artist/12705/megarockman');
+INSERT INTO "artist" VALUES(12706,'PirateCrab','https://ocremix.org/artist/12706/piratecrab');
+INSERT INTO "artist" VALUES(12707,'SuperiorX','https://ocremix.org/artist/12707/superiorx');
+INSERT INTO "artist" VALUES(12708,'The Distortionist','https://ocremix.org/artist/12708/the-distortionist');
+INSERT INTO "artist" VALUES(12710,'Eino Keskitalo','https://ocremix.org/artist/12710/eino-keskitalo');
+INSERT INTO "artist" VALUES(12711,'Pumpkin King','https://ocremix.org/artist/12711/pumpkin-king');
+INSERT INTO "artist" VALUES(12712,'The Duke','https://ocremix.org/artist/12712/the-duke');
+INSERT INTO "artist" VALUES(12783,'Jamphibious','https://ocremix.org/artist/12783/jamphibious');
+INSERT INTO "artist" VALUES(12785,'Square Law','https://ocremix.org/artist/12785/square-law');
+INSERT INTO "artist" VALUES(12786,'Dorothy Hayden','https://ocremix.org/artist/12786/dorothy-hayden');
+INSERT INTO "artist" VALUES(12787,'Andrew McLaren','https://ocremix.org/artist/12787/andrew-mclaren');
+INSERT INTO "artist" VALUES(12788,'David Lane','https://ocremix.org/artist/12788/david-lane');
+INSERT INTO "artist" VALUES(12789,'Ryan Billington','https://ocremix.org/artist/12789/ryan-billington');
+INSERT INTO "artist" VALUES(12803,'Dj CUTMAN','https://ocremix.org/artist/12803/dj-cutman');
+INSERT INTO "artist" VALUES(12932,'TeraCMusic','https://ocremix.org/artist/12932/teracmusic');
+INSERT INTO "artist" VALUES(12941,'Forrest Powell','https://ocremix.org/artist/12941/forrest-powell');
+INSERT INTO "artist" VALUES(12942,'Laura Intravia','https://ocremix.org/artist/12942/laura-intravia');
+INSERT INTO "artist" VALUES(12943,'Leitbur','https://ocremix.org/artist/12943/leitbur');
+INSERT INTO "artist" VALUES(12944,'Tommy Pedrini','https://ocremix.org/artist/12944/tommy-pedrini');
+INSERT INTO "artist" VALUES(12953,'Calum Bowen','https://ocremix.org/artist/12953/calum-bowen');
+INSERT INTO "artist" VALUES(12956,'BardicKnowledge','https://ocremix.org/artist/12956/bardicknowledge');
+INSERT INTO "artist" VALUES(12957,'Xarnax42','https://ocremix.org/artist/12957/xarnax42');
+INSERT INTO "artist" VALUES(12958,'finbeard','https://ocremix.org/artist/12958/finbeard');
+INSERT INTO "artist" VALUES(13042,'worldsbestgrandpa','https://ocremix.org/artist/13042/worldsbestgrandpa');
+INSERT INTO "artist" VALUES(13043,'rebrained','https://ocremix.org/artist/13043/rebrained');
+INSERT INTO "artist" VALUES(13044,'bryface','https://ocremix.org/artist/13044/bryface');
+INSERT INTO "artist" VALUES(13045,'Ivan Hakštok','https://ocremix.org/artist/13045/ivan-hakstok');
+INSERT INTO "artist" VALUES(13046,'Chimpazilla','https://ocremix.org/artist/13046/chimpazilla');
+INSERT INTO "artist" VALUES(13047,'Melodious Punk','https://ocremix.org/artist/13047/melodious-punk');
+INSERT INTO "artist" VALUES(13048,'RiverSound','https://ocremix.org/artist/13048/riversound');
+INSERT INTO "artist" VALUES(13049,'Arceace','https://ocremix.org/artist/13049/arceace');
+INSERT INTO "artist" VALUES(13050,'Blen','https://ocremix.org/artist/13050/blen');
+INSERT INTO "artist" VALUES(13051,'Aviators','https://ocremix.org/artist/13051/aviators');
+INSERT INTO "artist" VALUES(13052,'Lashmush','https://ocremix.org/artist/13052/lashmush');
+INSERT INTO "artist" VALUES(13053,'Jordanrooben','https://ocremix.org/artist/13053/jordanrooben');
+INSERT INTO "artist" VALUES(13054,'Trainbeat','https://ocremix.org/artist/13054/trainbeat');
+INSERT INTO "artist" VALUES(13055,'Joshua Kruszyna','https://ocremix.org/artist/13055/joshua-kruszyna');
+INSERT INTO "artist" VALUES(13056,'Jordi Storm','https://ocremix.org/artist/13056/jordi-storm');
+INSERT INTO "artist" VALUES(13057,'YamaYama','https://ocremix.org/artist/13057/yamayama');
+INSERT INTO "artist" VALUES(13080,'ectogemia','https://ocremix.org/artist/13080/ectogemia');
+INSERT INTO "artist" VALUES(13081,'Source X','https://ocremix.org/artist/13081/source-x');
+INSERT INTO "artist" VALUES(13147,'timaeus222','https://ocremix.org/artist/13147/timaeus222');
+INSERT INTO "artist" VALUES(13148,'Dweezil Zappa','https://ocremix.org/artist/13148/dweezil-zappa');
+INSERT INTO "artist" VALUES(13213,'That Andy Guy','https://ocremix.org/artist/13213/that-andy-guy');
+INSERT INTO "artist" VALUES(13214,'begoma','https://ocremix.org/artist/13214/begoma');
+INSERT INTO "artist" VALUES(13216,'BrothaDom','https://ocremix.org/artist/13216/brothadom');
+INSERT INTO "artist" VALUES(13217,'OverClocked Assembled','https://ocremix.org/artist/13217/overclocked-assembled');
+INSERT INTO "artist" VALUES(13290,'notMe','https://ocremix.org/artist/13290/notme');
+INSERT INTO "artist" VALUES(13361,'Critical Hit','https://ocremix.org/artist/13361/critical-hit');
+INSERT INTO "artist" VALUES(13420,'Helicopter Knife Fight','https://ocremix.org/artist/13420/helicopter-knife-fight');
+INSERT INTO "artist" VALUES(13432,'Viking Guitar','https://ocremix.org/artist/13432/viking-guitar');
+INSERT INTO "artist" VALUES(13434,'Andy Tunstall','https://ocremix.org/artist/13434/andy-tunstall');
+INSERT INTO "artist" VALUES(13435,'Portanexus','https://ocremix.org/artist/13435/portanexus');
+INSERT INTO "artist" VALUES(13436,'Funk Fiction','https://ocremix.org/artist/13436/funk-fiction');
+INSERT INTO "artist" VALUES(13437,'Rabcandy','https://ocremix.org/artist/13437/rabcandy');
+INSERT INTO "artist" VALUES(13496,'Kruai','https://ocremix.org/artist/13496/kruai');
+INSERT INTO "artist" VALUES(13499,'nervous_testpilot','https://ocremix.org/artist/13499/nervous-testpilot');
+INSERT INTO "artist" VALUES(13500,'jnWake','https://ocremix.org/artist/13500/jnwake');
+INSERT INTO "artist" VALUES(13511,'MC Final Sigma','https://ocremix.org/artist/13511/mc-final-sigma');
+INSERT INTO "artist" VALUES(13512,'J.ME the Sista'' Damashii','https://ocremix.org/artist/13512/jme-the-sista-damashii');
+INSERT INTO "artist" VALUES(13576,'mXenon','https://ocremix.org/artist/13576/mxenon');
+INSERT INTO "artist" VALUES(13577,'Garoad','https://ocremix.org/artist/13577/garoad');
+INSERT INTO "artist" VALUES(13578,'Skolar','https://ocremix.org/artist/13578/skolar');
+INSERT INTO "artist" VALUES(13663,'7bit Hero','https://ocremix.org/artist/13663/7bit-hero');
+INSERT INTO "artist" VALUES(13664,'3P0P','https://ocremix.org/artist/13664/3p0p');
+INSERT INTO "artist" VALUES(13665,'T1lTED','https://ocremix.org/artist/13665/t1lted');
+INSERT INTO "artist" VALUES(13666,'KingTiger','https://ocremix.org/artist/13666/kingtiger');
+INSERT INTO "artist" VALUES(13667,'ZackParrish','https://ocremix.org/artist/13667/zackparrish');
+INSERT INTO "artist" VALUES(13668,'Bluelighter','https://ocremix.org/artist/13668/bluelighter');
+INSERT INTO "artist" VALUES(13669,'Kelly Andrew','https://ocremix.org/artist/13669/kelly-andrew');
+INSERT INTO "artist" VALUES(13670,'wauterboi','https://ocremix.org/artist/13670/wauterboi');
+INSERT INTO "artist" VALUES(13671,'Boyinaband','https://ocremix.org/artist/13671/boyinaband');
+INSERT INTO "artist" VALUES(13672,'None Like Joshua','https://ocremix.org/artist/13672/none-like-joshua');
+INSERT INTO "artist" VALUES(13677,'Tuberz McGee','https://ocremix.org/artist/13677/tuberz-mcgee');
+INSERT INTO "artist" VALUES(13678,'The SnuggleMen','https://ocremix.org/artist/13678/the-snugglemen');
+INSERT INTO "artist" VALUES(13740,'HeavenWraith','https://ocremix.org/artist/13740/heavenwraith');
+INSERT INTO "artist" VALUES(13748,'Bekah Jones','https://ocremix.org/artist/13748/bekah-jones');
+INSERT INTO "artist" VALUES(13845,'Garrett Williamson','https://ocremix.org/artist/13845/garrett-williamson');
+INSERT INTO "artist" VALUES(13849,'Nostalvania','https://ocremix.org/artist/13849/nostalvania');
+INSERT INTO "artist" VALUES(13850,'Byproduct','https://ocremix.org/artist/13850/byproduct');
+INSERT INTO "artist" VALUES(13851,'AngelCityOutlaw','https://ocremix.org/artist/13851/angelcityoutlaw');
+INSERT INTO "artist" VALUES(13852,'nckmusic','https://ocremix.org/artist/13852/nckmusic');
+INSERT INTO "artist" VALUES(13853,'C-Curt','https://ocremix.org/artist/13853/c-curt');
+INSERT INTO "artist" VALUES(13854,'Sauraen','https://ocremix.org/artist/13854/sauraen');
+INSERT INTO "artist" VALUES(13856,'Blue Streaks','https://ocremix.org/artist/13856/blue-streaks');
+INSERT INTO "artist" VALUES(13920,'GrayFox1217','https://ocremix.org/artist/13920/grayfox1217');
+INSERT INTO "artist" VALUES(13921,'Yffisch','https://ocremix.org/artist/13921/yffisch');
+INSERT INTO "artist" VALUES(14011,'RJ remixes','https://ocremix.org/artist/14011/rj-remixes');
+INSERT INTO "artist" VALUES(14037,'Basheman','https://ocremix.org/artist/14037/basheman');
+INSERT INTO "artist" VALUES(14038,'Shinray','https://ocremix.org/artist/14038/shinray');
+INSERT INTO "artist" VALUES(14039,'Solkrieg','https://ocremix.org/artist/14039/solkrieg');
+INSERT INTO "artist" VALUES(14040,'Joey Grady','https://ocremix.org/artist/14040/joey-grady');
+INSERT INTO "artist" VALUES(14041,'Brendan Hannigan','https://ocremix.org/artist/14041/brendan-hannigan');
+INSERT INTO "artist" VALUES(14047,'Tspeiro','https://ocremix.org/artist/14047/tspeiro');
+INSERT INTO "artist" VALUES(14053,'JD Harding','https://ocremix.org/artist/14053/jd-harding');
+INSERT INTO "artist" VALUES(14054,'Ben Prunty','https://ocremix.org/artist/14054/ben-prunty');
+INSERT INTO "artist" VALUES(14061,'Annette DiMedio','https://ocremix.org/artist/14061/annette-dimedio');
+INSERT INTO "artist" VALUES(14062,'Zone Runners','https://ocremix.org/artist/14062/zone-runners');
+INSERT INTO "artist" VALUES(14064,'GlacialSpoon','https://ocremix.org/artist/14064/glacialspoon');
+INSERT INTO "artist" VALUES(14126,'Laura Platt','https://ocremix.org/artist/14126/laura-platt');
+INSERT INTO "artist" VALUES(14127,'Pearl Pixel','https://ocremix.org/artist/14127/pearl-pixel');
+INSERT INTO "artist" VALUES(14128,'E. Jesús Chic Acevedo','https://ocremix.org/artist/14128/e-jesus-chic-acevedo');
+INSERT INTO "artist" VALUES(14129,'Arth4da','https://ocremix.org/artist/14129/arth4da');
+INSERT INTO "artist" VALUES(14130,'Dj ThirdEye','https://ocremix.org/artist/14130/dj-thirdeye');
+INSERT INTO "artist" VALUES(14131,'WiFiSunset','https://ocremix.org/artist/14131/wifisunset');
+INSERT INTO "artist" VALUES(14133,'Paul Hadame','https://ocremix.org/artist/14133/paul-hadame');
+INSERT INTO "artist" VALUES(14134,'Tetrimino','https://ocremix.org/artist/14134/tetrimino');
+INSERT INTO "artist" VALUES(14137,'mklachu','https://ocremix.org/artist/14137/mklachu');
+INSERT INTO "artist" VALUES(14139,'GaMetal','https://ocremix.org/artist/14139/gametal');
+INSERT INTO "artist" VALUES(14143,'jdaster64','https://ocremix.org/artist/14143/jdaster64');
+INSERT INTO "artist" VALUES(14148,'DarkDjinn','https://ocremix.org/artist/14148/darkdjinn');
+INSERT INTO "artist" VALUES(14328,'Sebastien Skaf','https://ocremix.org/artist/14328/sebastien-skaf');
+INSERT INTO "artist" VALUES(14329,'Thomas B. Yee','https://ocremix.org/artist/14329/thomas-b-yee');
+INSERT INTO "artist" VALUES(14330,'Marc-André Tremblay','https://ocremix.org/artist/14330/marc-andre-tremblay');
+INSERT INTO "artist" VALUES(14332,'RoBKTA','https://ocremix.org/artist/14332/robkta');
+INSERT INTO "artist" VALUES(14333,'guitarman','https://ocremix.org/artist/14333/guitarman');
+INSERT INTO "artist" VALUES(14336,'Fratto','https://ocremix.org/artist/14336/fratto');
+INSERT INTO "artist" VALUES(14337,'The OC Jazz Collective','https://ocremix.org/artist/14337/the-oc-jazz-collective');
+INSERT INTO "artist" VALUES(14338,'Lazerwolph','https://ocremix.org/artist/14338/lazerwolph');
+INSERT INTO "artist" VALUES(14339,'mr_n00b','https://ocremix.org/artist/14339/mr-n00b');
+INSERT INTO "artist" VALUES(14356,'Megalixir','https://ocremix.org/artist/14356/megalixir');
+INSERT INTO "artist" VALUES(14357,'Deedubs','https://ocremix.org/artist/14357/deedubs');
+INSERT INTO "artist" VALUES(14360,'Merrigan','https://ocremix.org/artist/14360/merrigan');
+INSERT INTO "artist" VALUES(14361,'Txai','https://ocremix.org/artist/14361/txai');
+INSERT INTO "artist" VALUES(14366,'GENTLE LOVE','https://ocremix.org/artist/14366/gentle-love');
+INSERT INTO "artist" VALUES(14369,'faRk','https://ocremix.org/artist/14369/fark');
+INSERT INTO "artist" VALUES(14372,'Dynamite Pleasure Chair','https://ocremix.org/artist/14372/dynamite-pleasure-chair');
+INSERT INTO "artist" VALUES(14373,'Little V','https://ocremix.org/artist/14373/little-v');
+INSERT INTO "artist" VALUES(14374,'APZX','https://ocremix.org/artist/14374/apzx');
+INSERT INTO "artist" VALUES(14375,'RebeccaETripp','https://ocremix.org/artist/14375/rebeccaetripp');
+INSERT INTO "artist" VALUES(14376,'SOuNDSNC','https://ocremix.org/artist/14376/soundsnc');
+INSERT INTO "artist" VALUES(14379,'Chidi Enyia','https://ocremix.org/artist/14379/chidi-enyia');
+INSERT INTO "artist" VALUES(14380,'Samara Smith','https://ocremix.org/artist/14380/samara-smith');
+INSERT INTO "artist" VALUES(14381,'Roqsteady','https://ocremix.org/artist/14381/roqsteady');
+INSERT INTO "artist" VALUES(14387,'IanFitC','https://ocremix.org/artist/14387/ianfitc');
+INSERT INTO "artist" VALUES(14388,'PacificPoem','https://ocremix.org/artist/14388/pacificpoem');
+INSERT INTO "artist" VALUES(14461,'Jorito','https://ocremix.org/artist/14461/jorito');
+INSERT INTO "artist" VALUES(14463,'sschafi1','https://ocremix.org/artist/14463/sschafi1');
+INSERT INTO "artist" VALUES(14464,'streifig','https://ocremix.org/artist/14464/streifig');
+INSERT INTO "artist" VALUES(14465,'Marshall Art','https://ocremix.org/artist/14465/marshall-art');
+INSERT INTO "artist" VALUES(14466,'AndyP','https://ocremix.org/artist/14466/andyp');
+INSERT INTO "artist" VALUES(14473,'Giles Teskey','https://ocremix.org/artist/14473/giles-teskey');
+INSERT INTO "artist" VALUES(14481,'Richard Daskas','https://ocremix.org/artist/14481/richard-daskas');
+INSERT INTO "artist" VALUES(14483,'Dan Bryant','https://ocremix.org/artist/14483/dan-bryant');
+INSERT INTO "artist" VALUES(14484,'Chaeley','https://ocremix.org/artist/14484/chaeley');
+INSERT INTO "artist" VALUES(14485,'Adam Higgins','https://ocremix.org/artist/14485/adam-higgins');
+INSERT INTO "artist" VALUES(14486,'Ludiotic','https://ocremix.org/artist/14486/ludiotic');
+INSERT INTO "artist" VALUES(14490,'huile_smith','https://ocremix.org/artist/14490/huile-smith');
+INSERT INTO "artist" VALUES(14491,'Nate Tronerud','https://ocremix.org/artist/14491/nate-tronerud');
+INSERT INTO "artist" VALUES(14492,'Fxsnowy','https://ocremix.org/artist/14492/fxsnowy');
+INSERT INTO "artist" VALUES(14493,'Daniel Ran','https://ocremix.org/artist/14493/daniel-ran');
+INSERT INTO "artist" VALUES(14494,'The_Wizard_Lakmir','https://ocremix.org/artist/14494/the-wizard-lakmir');
+INSERT INTO "artist" VALUES(14495,'B-laze','https://ocremix.org/artist/14495/b-laze');
+INSERT INTO "artist" VALUES(14496,'Toni Leys','https://ocremix.org/artist/14496/toni-leys');
+INSERT INTO "artist" VALUES(14497,'Esteban Bellucci','https://ocremix.org/artist/14497/esteban-bellucci');
+INSERT INTO "artist" VALUES(14498,'Artificial Fear','https://ocremix.org/artist/14498/artificial-fear');
+INSERT INTO "artist" VALUES(14499,'Erik Vreven','https://ocremix.org/artist/14499/erik-vreven');
+INSERT INTO "artist" VALUES(14501,'ZiSotto','https://ocremix.org/artist/14501/zisotto');
+INSERT INTO "artist" VALUES(14572,'Seth Tallman','https://ocremix.org/artist/14572/seth-tallman');
+INSERT INTO "artist" VALUES(14577,'Stephan Wells','https://ocremix.org/artist/14577/stephan-wells');
+INSERT INTO "artist" VALUES(14579,'Neurophonic','https://ocremix.org/artist/14579/neurophonic');
+INSERT INTO "artist" VALUES(14580,'Thrace','https://ocremix.org/artist/14580/thrace');
+INSERT INTO "artist" VALUES(14582,'Abreu Project','https://ocremix.org/artist/14582/abreu-project');
+INSERT INTO "artist" VALUES(14583,'Frederic Petitpas','https://ocremix.org/artist/14583/frederic-petitpas');
+INSERT INTO "artist" VALUES(14593,'shredd','https://ocremix.org/artist/14593/shredd');
+INSERT INTO "artist" VALUES(14594,'Pokérus Project','https://ocremix.org/artist/14594/pokerus-project');
+INSERT INTO "artist" VALUES(14595,'Chris Bess','https://ocremix.org/artist/14595/chris-bess');
+INSERT INTO "artist" VALUES(14596,'MrKyle','https://ocremix.org/artist/14596/mrkyle');
+INSERT INTO "artist" VALUES(14605,'Existence Zero','https://ocremix.org/artist/14605/existence-zero');
+INSERT INTO "artist" VALUES(14606,'Bloodaxe','https://ocremix.org/artist/14606/bloodaxe');
+INSERT INTO "artist" VALUES(14607,'Sbeast','https://ocremix.org/artist/14607/sbeast');
+INSERT INTO "artist" VALUES(14733,'Sibling','https://ocremix.org/artist/14733/sibling');
+INSERT INTO "artist" VALUES(14734,'YoshiBlade','https://ocremix.org/artist/14734/yoshiblade');
+INSERT INTO "artist" VALUES(14736,'Slimy','https://ocremix.org/artist/14736/slimy');
+INSERT INTO "artist" VALUES(14737,'meganeko','https://ocremix.org/artist/14737/meganeko');
+INSERT INTO "artist" VALUES(14858,'Desert Catz','https://ocremix.org/artist/14858/desert-catz');
+INSERT INTO "artist" VALUES(14923,'Flameing Daeth Fearies','https://ocremix.org/artist/14923/flameing-daeth-fearies');
+INSERT INTO "artist" VALUES(14924,'Katskachi','https://ocremix.org/artist/14924/katskachi');
+INSERT INTO "artist" VALUES(14925,'Ryan Davis Music','https://ocremix.org/artist/14925/ryan-davis-music');
+INSERT INTO "artist" VALUES(14927,'LongBoxofChocolate','https://ocremix.org/artist/14927/longboxofchocolate');
+INSERT INTO "artist" VALUES(14928,'ToxicxEternity','https://ocremix.org/artist/14928/toxicxeternity');
+INSERT INTO "artist" VALUES(14930,'EAR','https://ocremix.org/artist/14930/ear');
+INSERT INTO "artist" VALUES(14931,'starlight buffalo','https://ocremix.org/artist/14931/starlight-buffalo');
+INSERT INTO "artist" VALUES(14932,'Benjaipod','https://ocremix.org/artist/14932/benjaipod');
+INSERT INTO "artist" VALUES(14937,'Averruncus','https://ocremix.org/artist/14937/averruncus');
+INSERT INTO "artist" VALUES(14938,'Peter Fernandes','https://ocremix.org/artist/14938/peter-fernandes');
+INSERT INTO "artist" VALUES(14939,'Brett Garsed','https://ocremix.org/artist/14939/brett-garsed');
+INSERT INTO "artist" VALUES(14940,'Ric Fierabracci','https://ocremix.org/artist/14940/ric-fierabracci');
+INSERT INTO "artist" VALUES(14941,'Richard Hallebeek','https://ocremix.org/artist/14941/richard-hallebeek');
+INSERT INTO "artist" VALUES(14942,'Shane Gaalaas','https://ocremix.org/artist/14942/shane-gaalaas');
+INSERT INTO "artist" VALUES(14944,'MasterGi','https://ocremix.org/artist/14944/mastergi');
+INSERT INTO "artist" VALUES(14964,'SuperTonic64','https://ocremix.org/artist/14964/supertonic64');
+INSERT INTO "artist" VALUES(14976,'FoxyPanda','https://ocremix.org/artist/14976/foxypanda');
+INSERT INTO "artist" VALUES(14979,'Steele','https://ocremix.org/artist/14979/steele');
+INSERT INTO "artist" VALUES(14980,'Furilas','https://ocremix.org/artist/14980/furilas');
+INSERT INTO "artist" VALUES(14983,'neshead80','https://ocremix.org/artist/14983/neshead80');
+INSERT INTO "artist" VALUES(14985,'Mirby','https://ocremix.org/artist/14985/mirby');
+INSERT INTO "artist" VALUES(15046,'Netrum','https://ocremix.org/artist/15046/netrum');
+INSERT INTO "artist" VALUES(15047,'Just Coffee','https://ocremix.org/artist/15047/just-coffee');
+INSERT INTO "artist" VALUES(15056,'OC/DC','https://ocremix.org/artist/15056/ocdc');
+INSERT INTO "artist" VALUES(15058,'Manji','https://ocremix.org/artist/15058/manji');
+INSERT INTO "artist" VALUES(15059,'nokbient','https://ocremix.org/artist/15059/nokbient');
+INSERT INTO "artist" VALUES(15060,'Laarx','https://ocremix.org/artist/15060/laarx');
+INSERT INTO "artist" VALUES(15061,'Kaiyoti','https://ocremix.org/artist/15061/kaiyoti');
+INSERT INTO "artist" VALUES(15062,'Outset Initiative','https://ocremix.org/artist/15062/outset-initiative');
+INSERT INTO "artist" VALUES(15066,'Ganaé','https://ocremix.org/artist/15066/ganae');
+INSERT INTO "artist" VALUES(15067,'HeavyViper','https://ocremix.org/artist/15067/heavyviper');
+INSERT INTO "artist" VALUES(15136,'N4L4','https://ocremix.org/artist/15136/n4l4');
+INSERT INTO "artist" VALUES(15137,'Birgitta Susi','https://ocremix.org/artist/15137/birgitta-susi');
+INSERT INTO "artist" VALUES(15199,'Marc Papeghin','https://ocremix.org/artist/15199/marc-papeghin');
+INSERT INTO "artist" VALUES(15200,'Nuri Tett','https://ocremix.org/artist/15200/nuri-tett');
+INSERT INTO "artist" VALUES(15201,'Charles Ritz','https://ocremix.org/artist/15201/charles-ritz');
+INSERT INTO "artist" VALUES(15202,'Dutcher Snedeker','https://ocremix.org/artist/15202/dutcher-snedeker');
+INSERT INTO "artist" VALUES(15203,'Thennecan','https://ocremix.org/artist/15203/thennecan');
+INSERT INTO "artist" VALUES(15204,'David Peacock','https://ocremix.org/artist/15204/david-peacock');
+INSERT INTO "artist" VALUES(15205,'shaboogen','https://ocremix.org/artist/15205/shaboogen');
+INSERT INTO "artist" VALUES(15232,'Kylok','https://ocremix.org/artist/15232/kylok');
+INSERT INTO "artist" VALUES(15234,'Bowlerhat','https://ocremix.org/artist/15234/bowlerhat');
+INSERT INTO "artist" VALUES(15298,'Von Nebo','https://ocremix.org/artist/15298/von-nebo');
+INSERT INTO "artist" VALUES(15304,'dabedaab','https://ocremix.org/artist/15304/dabedaab');
+INSERT INTO "artist" VALUES(15305,'BKM','https://ocremix.org/artist/15305/bkm');
+INSERT INTO "artist" VALUES(15307,'SixteenInMono','https://ocremix.org/artist/15307/sixteeninmono');
+INSERT INTO "artist" VALUES(15308,'Mahika','https://ocremix.org/artist/15308/mahika');
+INSERT INTO "artist" VALUES(15309,'Faseeh','https://ocremix.org/artist/15309/faseeh');
+INSERT INTO "artist" VALUES(15311,'Sentient Pulse','https://ocremix.org/artist/15311/sentient-pulse');
+INSERT INTO "artist" VALUES(15315,'nelward','https://ocremix.org/artist/15315/nelward');
+INSERT INTO "artist" VALUES(15316,'Tomo Club','https://ocremix.org/artist/15316/tomo-club');
+INSERT INTO "artist" VALUES(15320,'Stephen Kelly','https://ocremix.org/artist/15320/stephen-kelly');
+INSERT INTO "artist" VALUES(15458,'GlitchmanVGM','https://ocremix.org/artist/15458/glitchmanvgm');
+INSERT INTO "artist" VALUES(15461,'Paper Coelacanth','https://ocremix.org/artist/15461/paper-coelacanth');
+INSERT INTO "artist" VALUES(15462,'Kuro','https://ocremix.org/artist/15462/kuro');
+INSERT INTO "artist" VALUES(15465,'James Wong','https://ocremix.org/artist/15465/james-wong');
+INSERT INTO "artist" VALUES(15467,'Schtiffles','https://ocremix.org/artist/15467/schtiffles');
+INSERT INTO "artist" VALUES(15468,'Blake Inc.','https://ocremix.org/artist/15468/blake-inc');
+INSERT INTO "artist" VALUES(15473,'JohnStacy','https://ocremix.org/artist/15473/johnstacy');
+INSERT INTO "artist" VALUES(15474,'The JohnStacy Orchestra','https://ocremix.org/artist/15474/the-johnstacy-orchestra');
+INSERT INTO "artist" VALUES(15475,'Tyler Krug','https://ocremix.org/artist/15475/tyler-krug');
+INSERT INTO "artist" VALUES(15476,'Mary Horst','https://ocremix.org/artist/15476/mary-horst');
+INSERT INTO "artist" VALUES(15481,'WASD','https://ocremix.org/artist/15481/wasd');
+INSERT INTO "artist" VALUES(15557,'OverShield','https://ocremix.org/artist/15557/overshield');
+INSERT INTO "artist" VALUES(15559,'Chris Muggli-Miller','https://ocremix.org/artist/15559/chris-muggli-miller');
+INSERT INTO "artist" VALUES(15560,'AJ DiSpirito','https://ocremix.org/artist/15560/aj-dispirito');
+INSERT INTO "artist" VALUES(15561,'BlueDrak3','https://ocremix.org/artist/15561/bluedrak3');
+INSERT INTO "artist" VALUES(15562,'Mike Norvak','https://ocremix.org/artist/15562/mike-norvak');
+INSERT INTO "artist" VALUES(15564,'freezetag','https://ocremix.org/artist/15564/freezetag');
+INSERT INTO "artist" VALUES(15581,'Scandal Jay Kneel','https://ocremix.org/artist/15581/scandal-jay-kneel');
+INSERT INTO "artist" VALUES(15582,'tymime','https://ocremix.org/artist/15582/tymime');
+INSERT INTO "artist" VALUES(15583,'mlho7','https://ocremix.org/artist/15583/mlho7');
+INSERT INTO "artist" VALUES(15586,'J Psycle','https://ocremix.org/artist/15586/j-psycle');
+INSERT INTO "artist" VALUES(15587,'Maverick Astley','https://ocremix.org/artist/15587/maverick-astley');
+INSERT INTO "artist" VALUES(15612,'Audio Mocha','https://ocremix.org/artist/15612/audio-mocha');
+INSERT INTO "artist" VALUES(15618,'Hank "The Spank Tank" Jankerson','https://ocremix.org/artist/15618/hank-the-spank-tank-jankerson');
+INSERT INTO "artist" VALUES(15680,'Lauren the Flute','https://ocremix.org/artist/15680/lauren-the-flute');
+INSERT INTO "artist" VALUES(15681,'JoyDreamer','https://ocremix.org/artist/15681/joydreamer');
+INSERT INTO "artist" VALUES(15682,'Trev Wignall','https://ocremix.org/artist/15682/trev-wignall');
+INSERT INTO "artist" VALUES(15684,'Yusef Kelliebrew','https://ocremix.org/artist/15684/yusef-kelliebrew');
+INSERT INTO "artist" VALUES(15685,'DoD Music Factory','https://ocremix.org/artist/15685/dod-music-factory');
+INSERT INTO "artist" VALUES(15747,'Smooth4Lyfe','https://ocremix.org/artist/15747/smooth4lyfe');
+INSERT INTO "artist" VALUES(15749,'Alex Moukala','https://ocremix.org/artist/15749/alex-moukala');
+INSERT INTO "artist" VALUES(15750,'Steven Melin','https://ocremix.org/artist/15750/steven-melin');
+INSERT INTO "artist" VALUES(15751,'mikedm92','https://ocremix.org/artist/15751/mikedm92');
+INSERT INTO "artist" VALUES(15761,'DarkEco','https://ocremix.org/artist/15761/darkeco');
+INSERT INTO "artist" VALUES(15767,'ibeginwiththeendinmind','https://ocremix.org/artist/15767/ibeginwiththeendinmind');
+INSERT INTO "artist" VALUES(15768,'Andy Gillion','https://ocremix.org/artist/15768/andy-gillion');
+INSERT INTO "artist" VALUES(15769,'zachaction','https://ocremix.org/artist/15769/zachaction');
+INSERT INTO "artist" VALUES(15770,'744','https://ocremix.org/artist/15770/744');
+INSERT INTO "artist" VALUES(15771,'Final Kingdom','https://ocremix.org/artist/15771/final-kingdom');
+INSERT INTO "artist" VALUES(15772,'Azzykay316','https://ocremix.org/artist/15772/azzykay316');
+INSERT INTO "artist" VALUES(15833,'Arvangath','https://ocremix.org/artist/15833/arvangath');
+INSERT INTO "artist" VALUES(15835,'Jer Roque','https://ocremix.org/artist/15835/jer-roque');
+INSERT INTO "artist" VALUES(15839,'Lindsay M. Orsini','https://ocremix.org/artist/15839/lindsay-m-orsini');
+INSERT INTO "artist" VALUES(15840,'The Nikanoru','https://ocremix.org/artist/15840/the-nikanoru');
+INSERT INTO "artist" VALUES(15849,'Yoann Turpin','https://ocremix.org/artist/15849/yoann-turpin');
+INSERT INTO "artist" VALUES(15850,'Denis Bluteau','https://ocremix.org/artist/15850/denis-bluteau');
+INSERT INTO "artist" VALUES(15851,'Kristin Naigus','https://ocremix.org/artist/15851/kristin-naigus');
+INSERT INTO "artist" VALUES(15912,'Schmoo','https://ocremix.org/artist/15912/schmoo');
+INSERT INTO "artist" VALUES(15913,'Matheus Souza','https://ocremix.org/artist/15913/matheus-souza');
+INSERT INTO "artist" VALUES(15914,'DrThrex','https://ocremix.org/artist/15914/drthrex');
+INSERT INTO "artist" VALUES(15920,'DiscoCactus','https://ocremix.org/artist/15920/discocactus');
+INSERT INTO "artist" VALUES(15921,'Vijay van der Weijden','https://ocremix.org/artist/15921/vijay-van-der-weijden');
+INSERT INTO "artist" VALUES(15922,'Job Wijkamp','https://ocremix.org/artist/15922/job-wijkamp');
+INSERT INTO "artist" VALUES(15923,'Iron Mage','https://ocremix.org/artist/15923/iron-mage');
+INSERT INTO "artist" VALUES(15984,'ninecoins','https://ocremix.org/artist/15984/ninecoins');
+INSERT INTO "artist" VALUES(15985,'Jehm Faulking','https://ocremix.org/artist/15985/jehm-faulking');
+INSERT INTO "artist" VALUES(15998,'Pixel Noise','https://ocremix.org/artist/15998/pixel-noise');
+INSERT INTO "artist" VALUES(15999,'PurpleSchala','https://ocremix.org/artist/15999/purpleschala');
+INSERT INTO "artist" VALUES(16101,'ThePlasmas','https://ocremix.org/artist/16101/theplasmas');
+INSERT INTO "artist" VALUES(16102,'Tiago Rodrigues','https://ocremix.org/artist/16102/tiago-rodrigues');
+INSERT INTO "artist" VALUES(16103,'Andrew Steffen','https://ocremix.org/artist/16103/andrew-steffen');
+INSERT INTO "artist" VALUES(16104,'Shipluss','https://ocremix.org/artist/16104/shipluss');
+INSERT INTO "artist" VALUES(16112,'SirCorn','https://ocremix.org/artist/16112/sircorn');
+INSERT INTO "artist" VALUES(16113,'DS','https://ocremix.org/artist/16113/ds');
+INSERT INTO "artist" VALUES(16114,'Bree','https://ocremix.org/artist/16114/bree');
+INSERT INTO "artist" VALUES(16117,'VGcellomusic','https://ocremix.org/artist/16117/vgcellomusic');
+INSERT INTO "artist" VALUES(16118,'Sagnewshreds','https://ocremix.org/artist/16118/sagnewshreds');
+INSERT INTO "artist" VALUES(16119,'Lucas Guimaraes','https://ocremix.org/artist/16119/lucas-guimaraes');
+INSERT INTO "artist" VALUES(16180,'halfwalk','https://ocremix.org/artist/16180/halfwalk');
+INSERT INTO "artist" VALUES(16181,'Rodok','https://ocremix.org/artist/16181/rodok');
+INSERT INTO "artist" VALUES(16182,'Joe November','https://ocremix.org/artist/16182/joe-november');
+INSERT INTO "artist" VALUES(16183,'Ophanin','https://ocremix.org/artist/16183/ophanin');
+INSERT INTO "artist" VALUES(16188,'SuprMelO','https://ocremix.org/artist/16188/suprmelo');
+INSERT INTO "artist" VALUES(16190,'Moiré Effect','https://ocremix.org/artist/16190/moire-effect');
+INSERT INTO "artist" VALUES(16191,'Conservatorium Maastricht Big Band','https://ocremix.org/artist/16191/conservatorium-maastricht-big-band');
+INSERT INTO "artist" VALUES(16192,'Mellow Sonic','https://ocremix.org/artist/16192/mellow-sonic');
+INSERT INTO "artist" VALUES(16193,'Nightswim','https://ocremix.org/artist/16193/nightswim');
+INSERT INTO "artist" VALUES(16194,'Stam','https://ocremix.org/artist/16194/stam');
+INSERT INTO "artist" VALUES(16195,'Tyler Gill','https://ocremix.org/artist/16195/tyler-gill');
+INSERT INTO "artist" VALUES(16196,'Leo Quintão','https://ocremix.org/artist/16196/leo-quintao');
+INSERT INTO "artist" VALUES(16197,'Helton Lima','https://ocremix.org/artist/16197/helton-lima');
+INSERT INTO "artist" VALUES(16198,'Marco Lima','https://ocremix.org/artist/16198/marco-lima');
+INSERT INTO "artist" VALUES(16199,'André Pastore','https://ocremix.org/artist/16199/andre-pastore');
+INSERT INTO "artist" VALUES(16200,'Thiago Quintino','https://ocremix.org/artist/16200/thiago-quintino');
+INSERT INTO "artist" VALUES(16204,'Batistella','https://ocremix.org/artist/16204/batistella');
+INSERT INTO "artist" VALUES(16269,'LONELYROLLINGSTARS','https://ocremix.org/artist/16269/lonelyrollingstars');
+INSERT INTO "artist" VALUES(16343,'Patrick Lanier','https://ocremix.org/artist/16343/patrick-lanier');
+INSERT INTO "artist" VALUES(16412,'Ridiculously Garrett','https://ocremix.org/artist/16412/ridiculously-garrett');
+INSERT INTO "artist" VALUES(16413,'Got Item!','https://ocremix.org/artist/16413/got-item');
+INSERT INTO "artist" VALUES(16414,'Jacob Martinez','https://ocremix.org/artist/16414/jacob-martinez');
+INSERT INTO "artist" VALUES(16415,'Tonalysis','https://ocremix.org/artist/16415/tonalysis');
+INSERT INTO "artist" VALUES(16416,'GCJ','https://ocremix.org/artist/16416/gcj');
+INSERT INTO "artist" VALUES(16417,'Harmsing','https://ocremix.org/artist/16417/harmsing');
+INSERT INTO "artist" VALUES(16418,'Kristy Mezines','https://ocremix.org/artist/16418/kristy-mezines');
+INSERT INTO "artist" VALUES(16419,'Fernando Valencia','https://ocremix.org/artist/16419/fernando-valencia');
+INSERT INTO "artist" VALUES(16422,'Gaius Christianus Canorus','https://ocremix.org/artist/16422/gaius-christianus-canorus');
+INSERT INTO "artist" VALUES(16423,'Mighty Bear 7','https://ocremix.org/artist/16423/mighty-bear-7');
+INSERT INTO "artist" VALUES(16424,'Austin DiPietro','https://ocremix.org/artist/16424/austin-dipietro');
+INSERT INTO "artist" VALUES(16425,'Theodore Hogan','https://ocremix.org/artist/16425/theodore-hogan');
+INSERT INTO "artist" VALUES(16426,'Stu Kennedy','https://ocremix.org/artist/16426/stu-kennedy');
+INSERT INTO "artist" VALUES(16427,'Martin Schiller','https://ocremix.org/artist/16427/martin-schiller');
+INSERT INTO "artist" VALUES(16428,'BMC_WarMachine','https://ocremix.org/artist/16428/bmc-warmachine');
+INSERT INTO "artist" VALUES(16429,'Glejs','https://ocremix.org/artist/16429/glejs');
+INSERT INTO "artist" VALUES(16430,'Reuben Spiers','https://ocremix.org/artist/16430/reuben-spiers');
+INSERT INTO "artist" VALUES(16431,'Brian Westbrook','https://ocremix.org/artist/16431/brian-westbrook');
+INSERT INTO "artist" VALUES(16432,'Mike Dreher','https://ocremix.org/artist/16432/mike-dreher');
+INSERT INTO "artist" VALUES(16433,'Tony Barhoum','https://ocremix.org/artist/16433/tony-barhoum');
+INSERT INTO "artist" VALUES(16435,'That Headband Guy','https://ocremix.org/artist/16435/that-headband-guy');
+INSERT INTO "artist" VALUES(16436,'Bryan EL','https://ocremix.org/artist/16436/bryan-el');
+INSERT INTO "artist" VALUES(16437,'Philippe Delage','https://ocremix.org/artist/16437/philippe-delage');
+INSERT INTO "artist" VALUES(16438,'Rotten Eggplant','https://ocremix.org/artist/16438/rotten-eggplant');
+INSERT INTO "artist" VALUES(16517,'Magnetic Ether','https://ocremix.org/artist/16517/magnetic-ether');
+INSERT INTO "artist" VALUES(16518,'The Hit Points','https://ocremix.org/artist/16518/the-hit-points');
+INSERT INTO "artist" VALUES(16519,'Eli Bishop','https://ocremix.org/artist/16519/eli-bishop');
+INSERT INTO "artist" VALUES(16525,'Jordan Chin','https://ocremix.org/artist/16525/jordan-chin');
+INSERT INTO "artist" VALUES(16526,'Katajun','https://ocremix.org/artist/16526/katajun');
+INSERT INTO "artist" VALUES(16530,'Triforce Quartet','https://ocremix.org/artist/16530/triforce-quartet');
+INSERT INTO "artist" VALUES(16533,'Matheus Manente','https://ocremix.org/artist/16533/matheus-manente');
+INSERT INTO "artist" VALUES(16540,'heymagurany','https://ocremix.org/artist/16540/heymagurany');
+INSERT INTO "artist" VALUES(16541,'Thomas Colegrove','https://ocremix.org/artist/16541/thomas-colegrove');
+INSERT INTO "artist" VALUES(16610,'Fusion42','https://ocremix.org/artist/16610/fusion42');
+INSERT INTO "artist" VALUES(16615,'Gamer of the Winds','https://ocremix.org/artist/16615/gamer-of-the-winds');
+INSERT INTO "artist" VALUES(16616,'Abi Coffer','https://ocremix.org/artist/16616/abi-coffer');
+INSERT INTO "artist" VALUES(16619,'Mozzaratti','https://ocremix.org/artist/16619/mozzaratti');
+INSERT INTO "artist" VALUES(16693,'MrHassanSan','https://ocremix.org/artist/16693/mrhassansan');
+INSERT INTO "artist" VALUES(16694,'Inrudiment','https://ocremix.org/artist/16694/inrudiment');
+INSERT INTO "artist" VALUES(16696,'M Benson','https://ocremix.org/artist/16696/m-benson');
+INSERT INTO "artist" VALUES(16843,'Ezavskih','https://ocremix.org/artist/16843/ezavskih');
+INSERT INTO "artist" VALUES(16844,'Earth Kid','https://ocremix.org/artist/16844/earth-kid');
+INSERT INTO "artist" VALUES(16845,'Christine Giguère','https://ocremix.org/artist/16845/christine-giguere');
+INSERT INTO "artist" VALUES(16846,'Juke','https://ocremix.org/artist/16846/juke');
+INSERT INTO "artist" VALUES(16847,'Vylent','https://ocremix.org/artist/16847/vylent');
+INSERT INTO "artist" VALUES(16848,'TSori','https://ocremix.org/artist/16848/tsori');
+INSERT INTO "artist" VALUES(16850,'Darkflamewolf','https://ocremix.org/artist/16850/darkflamewolf');
+INSERT INTO "artist" VALUES(16851,'Peíorele','https://ocremix.org/artist/16851/peiorele');
+INSERT INTO "artist" VALUES(16852,'Aster','https://ocremix.org/artist/16852/aster');
+INSERT INTO "artist" VALUES(16853,'Ronin Op F','https://ocremix.org/artist/16853/ronin-op-f');
+INSERT INTO "artist" VALUES(16854,'Keadrin Cain','https://ocremix.org/artist/16854/keadrin-cain');
+INSERT INTO "artist" VALUES(16855,'Damian Nguyen','https://ocremix.org/artist/16855/damian-nguyen');
+INSERT INTO "artist" VALUES(16856,'Bassoonify','https://ocremix.org/artist/16856/bassoonify');
+INSERT INTO "artist" VALUES(16858,'Leisurebeam','https://ocremix.org/artist/16858/leisurebeam');
+INSERT INTO "artist" VALUES(16933,'Tacorina of Time','https://ocremix.org/artist/16933/tacorina-of-time');
+INSERT INTO "artist" VALUES(16934,'Black Ace','https://ocremix.org/artist/16934/black-ace');
+INSERT INTO "artist" VALUES(16935,'StormSkuggan','https://ocremix.org/artist/16935/stormskuggan');
+INSERT INTO "artist" VALUES(16936,'Wyrgan','https://ocremix.org/artist/16936/wyrgan');
+INSERT INTO "artist" VALUES(16937,'Medllix','https://ocremix.org/artist/16937/medllix');
+INSERT INTO "artist" VALUES(16939,'Kade Kalka','https://ocremix.org/artist/16939/kade-kalka');
+INSERT INTO "artist" VALUES(16940,'Hypetreme','https://ocremix.org/artist/16940/hypetreme');
+INSERT INTO "artist" VALUES(16941,'Miso29','https://ocremix.org/artist/16941/miso29');
+INSERT INTO "artist" VALUES(16943,'bGevko','https://ocremix.org/artist/16943/bgevko');
+INSERT INTO "artist" VALUES(16946,'Czyszy','https://ocremix.org/artist/16946/czyszy');
+INSERT INTO "artist" VALUES(16949,'Slaygon','https://ocremix.org/artist/16949/slaygon');
+INSERT INTO "artist" VALUES(16950,'Janna McKnight','https://ocremix.org/artist/16950/janna-mcknight');
+INSERT INTO "artist" VALUES(16951,'NyxTheShield','https://ocremix.org/artist/16951/nyxtheshield');
+INSERT INTO "artist" VALUES(17020,'Tune in with Chewie','https://ocremix.org/artist/17020/tune-in-with-chewie');
+INSERT INTO "artist" VALUES(17021,'HOUNDTRACK','https://ocremix.org/artist/17021/houndtrack');
+INSERT INTO "artist" VALUES(17026,'Lampje4life','https://ocremix.org/artist/17026/lampje4life');
+INSERT INTO "artist" VALUES(17031,'Tanner Johnson','https://ocremix.org/artist/17031/tanner-johnson');
+INSERT INTO "artist" VALUES(17032,'Emily Misura','https://ocremix.org/artist/17032/emily-misura');
+INSERT INTO "artist" VALUES(17033,'Daniel Cortes','https://ocremix.org/artist/17033/daniel-cortes');
+INSERT INTO "artist" VALUES(17034,'Sarah Overton','https://ocremix.org/artist/17034/sarah-overton');
+INSERT INTO "artist" VALUES(17035,'Elliot May','https://ocremix.org/artist/17035/elliot-may');
+INSERT INTO "artist" VALUES(17036,'Younes Elbayad','https://ocremix.org/artist/17036/younes-elbayad');
+INSERT INTO "artist" VALUES(17037,'Alex Hill','https://ocremix.org/artist/17037/alex-hill');
+INSERT INTO "artist" VALUES(17038,'dannymusic','https://ocremix.org/artist/17038/dannymusic');
+INSERT INTO "artist" VALUES(17039,'Gabriel Tripp','https://ocremix.org/artist/17039/gabriel-tripp');
+INSERT INTO "artist" VALUES(17042,'Retro Brothers','https://ocremix.org/artist/17042/retro-brothers');
+INSERT INTO "artist" VALUES(17048,'One Man Dan Band','https://ocremix.org/artist/17048/one-man-dan-band');
+INSERT INTO "artist" VALUES(17049,'Forest Elves','https://ocremix.org/artist/17049/forest-elves');
+INSERT INTO "artist" VALUES(17051,'GLASYS','https://ocremix.org/artist/17051/glasys');
+INSERT INTO "artist" VALUES(17052,'GuitarSVD','https://ocremix.org/artist/17052/guitarsvd');
+INSERT INTO "artist" VALUES(17053,'RichGC','https://ocremix.org/artist/17053/richgc');
+INSERT INTO "artist" VALUES(17054,'katastrophe_owlz','https://ocremix.org/artist/17054/katastrophe-owlz');
+INSERT INTO "artist" VALUES(17055,'Joni Fuller','https://ocremix.org/artist/17055/joni-fuller');
+INSERT INTO "artist" VALUES(17056,'RVCHL','https://ocremix.org/artist/17056/rvchl');
+INSERT INTO "artist" VALUES(17057,'bsolmaz13','https://ocremix.org/artist/17057/bsolmaz13');
+INSERT INTO "artist" VALUES(17058,'Psamathes','https://ocremix.org/artist/17058/psamathes');
+INSERT INTO "artist" VALUES(17059,'jmabate','https://ocremix.org/artist/17059/jmabate');
+INSERT INTO "artist" VALUES(17060,'Kalu4ii Plays','https://ocremix.org/artist/17060/kalu4ii-plays');
+INSERT INTO "artist" VALUES(17061,'Danilo Ciaffi','https://ocremix.org/artist/17061/danilo-ciaffi');
+INSERT INTO "artist" VALUES(17062,'Eliott Tordo','https://ocremix.org/artist/17062/eliott-tordo');
+INSERT INTO "artist" VALUES(17063,'ImAFutureGuitarHero','https://ocremix.org/artist/17063/imafutureguitarhero');
+INSERT INTO "artist" VALUES(17064,'Hyli','https://ocremix.org/artist/17064/hyli');
+INSERT INTO "artist" VALUES(17068,'Respawn Collective','https://ocremix.org/artist/17068/respawn-collective');
+INSERT INTO "artist" VALUES(17070,'sleffy','https://ocremix.org/artist/17070/sleffy');
+INSERT INTO "artist" VALUES(17146,'Pyrus','https://ocremix.org/artist/17146/pyrus');
+INSERT INTO "artist" VALUES(17147,'salle','https://ocremix.org/artist/17147/salle');
+INSERT INTO "artist" VALUES(17148,'Goathead','https://ocremix.org/artist/17148/goathead');
+INSERT INTO "artist" VALUES(17158,'Michael Hudak','https://ocremix.org/artist/17158/michael-hudak');
+INSERT INTO "artist" VALUES(17160,'EsperPhoenix','https://ocremix.org/artist/17160/esperphoenix');
+INSERT INTO "artist" VALUES(17237,'Kain White','https://ocremix.org/artist/17237/kain-white');
+INSERT INTO "artist" VALUES(17239,'Stahalamora','https://ocremix.org/artist/17239/stahalamora');
+INSERT INTO "artist" VALUES(17240,'Clément Panchout','https://ocremix.org/artist/17240/clement-panchout');
+INSERT INTO "artist" VALUES(17241,'Sirenstar','https://ocremix.org/artist/17241/sirenstar');
+INSERT INTO "artist" VALUES(17244,'Troyificus','https://ocremix.org/artist/17244/troyificus');
+INSERT INTO "artist" VALUES(17245,'Gnegon Galek','https://ocremix.org/artist/17245/gnegon-galek');
+INSERT INTO "artist" VALUES(17246,'Catie Williams','https://ocremix.org/artist/17246/catie-williams');
+INSERT INTO "artist" VALUES(17247,'Richard Spencer','https://ocremix.org/artist/17247/richard-spencer');
+INSERT INTO "artist" VALUES(17316,'Andre Beller','https://ocremix.org/artist/17316/andre-beller');
+INSERT INTO "artist" VALUES(17317,'DavidRussell323','https://ocremix.org/artist/17317/davidrussell323');
+INSERT INTO "artist" VALUES(17318,'Dean Nguyen','https://ocremix.org/artist/17318/dean-nguyen');
+INSERT INTO "artist" VALUES(17319,'Atsumu','https://ocremix.org/artist/17319/atsumu');
+INSERT INTO "artist" VALUES(17320,'Harpsona','https://ocremix.org/artist/17320/harpsona');
+INSERT INTO "artist" VALUES(17321,'mkafie','https://ocremix.org/artist/17321/mkafie');
+INSERT INTO "artist" VALUES(17322,'Travis Kindred','https://ocremix.org/artist/17322/travis-kindred');
+INSERT INTO "artist" VALUES(17323,'Catboss.','https://ocremix.org/artist/17323/catboss');
+INSERT INTO "artist" VALUES(17324,'Chromatic Apparatus','https://ocremix.org/artist/17324/chromatic-apparatus');
+INSERT INTO "artist" VALUES(17325,'Luke Jansen','https://ocremix.org/artist/17325/luke-jansen');
+INSERT INTO "artist" VALUES(17328,'Brink-of-Time','https://ocremix.org/artist/17328/brink-of-time');
+INSERT INTO "artist" VALUES(17329,'Felix Brassel','https://ocremix.org/artist/17329/felix-brassel');
+INSERT INTO "artist" VALUES(17330,'Pierre Vyncke','https://ocremix.org/artist/17330/pierre-vyncke');
+INSERT INTO "artist" VALUES(17331,'Gregory Ksiondzyk','https://ocremix.org/artist/17331/gregory-ksiondzyk');
+INSERT INTO "artist" VALUES(17332,'Dirk Bosman','https://ocremix.org/artist/17332/dirk-bosman');
+INSERT INTO "artist" VALUES(17333,'David Jans','https://ocremix.org/artist/17333/david-jans');
+INSERT INTO "artist" VALUES(17334,'Chae Yeon Lee','https://ocremix.org/artist/17334/chae-yeon-lee');
+INSERT INTO "artist" VALUES(17335,'HeeHyun Lee','https://ocremix.org/artist/17335/heehyun-lee');
+INSERT INTO "artist" VALUES(17336,'Louise van den Heuvel','https://ocremix.org/artist/17336/louise-van-den-heuvel');
+INSERT INTO "artist" VALUES(17337,'Arno Grootaers','https://ocremix.org/artist/17337/arno-grootaers');
+INSERT INTO "artist" VALUES(17338,'Rebecca Driesmans','https://ocremix.org/artist/17338/rebecca-driesmans');
+INSERT INTO "artist" VALUES(17339,'Hanging Waters','https://ocremix.org/artist/17339/hanging-waters');
+INSERT INTO "artist" VALUES(17459,'TPR','https://ocremix.org/artist/17459/tpr');
+INSERT INTO "artist" VALUES(17461,'Fernito','https://ocremix.org/artist/17461/fernito');
+INSERT INTO "artist" VALUES(17467,'Astral Tales','https://ocremix.org/artist/17467/astral-tales');
+INSERT INTO "artist" VALUES(17468,'Kamex','https://ocremix.org/artist/17468/kamex');
+INSERT INTO "artist" VALUES(17473,'thebitterroost','https://ocremix.org/artist/17473/thebitterroost');
+INSERT INTO "artist" VALUES(17475,'Nirias','https://ocremix.org/artist/17475/nirias');
+INSERT INTO "artist" VALUES(17476,'Staticaster','https://ocremix.org/artist/17476/staticaster');
+INSERT INTO "artist" VALUES(17478,'Seizure Machine','https://ocremix.org/artist/17478/seizure-machine');
+INSERT INTO "artist" VALUES(17482,'Fiddledo','https://ocremix.org/artist/17482/fiddledo');
+INSERT INTO "artist" VALUES(17483,'subversiveasset','https://ocremix.org/artist/17483/subversiveasset');
+INSERT INTO "artist" VALUES(17484,'P2 Sue','https://ocremix.org/artist/17484/p2-sue');
+INSERT INTO "artist" VALUES(17485,'Eladar','https://ocremix.org/artist/17485/eladar');
+INSERT INTO "artist" VALUES(17486,'Siolfor the Jackal','https://ocremix.org/artist/17486/siolfor-the-jackal');
+INSERT INTO "artist" VALUES(17488,'Spy Girls','https://ocremix.org/artist/17488/spy-girls');
+INSERT INTO "artist" VALUES(17489,'Alejandro Espinosa','https://ocremix.org/artist/17489/alejandro-espinosa');
+INSERT INTO "artist" VALUES(17490,'Jake Kargl','https://ocremix.org/artist/17490/jake-kargl');
+INSERT INTO "artist" VALUES(17491,'Nathan Madsen','https://ocremix.org/artist/17491/nathan-madsen');
+INSERT INTO "artist" VALUES(17578,'Key Jay','https://ocremix.org/artist/17578/key-jay');
+INSERT INTO "artist" VALUES(17579,'Neverback Music','https://ocremix.org/artist/17579/neverback-music');
+INSERT INTO "artist" VALUES(17581,'PSK','https://ocremix.org/artist/17581/psk');
+INSERT INTO "artist" VALUES(17582,'Trohnics','https://ocremix.org/artist/17582/trohnics');
+INSERT INTO "artist" VALUES(17583,'Manny','https://ocremix.org/artist/17583/manny');
+INSERT INTO "artist" VALUES(17584,'Lea Baumert','https://ocremix.org/artist/17584/lea-baumert');
+INSERT INTO "artist" VALUES(17585,'Andrew Filipski','https://ocremix.org/artist/17585/andrew-filipski');
+INSERT INTO "artist" VALUES(17586,'slamb0b','https://ocremix.org/artist/17586/slamb0b');
+INSERT INTO "artist" VALUES(17589,'Glyn R Brown','https://ocremix.org/artist/17589/glyn-r-brown');
+INSERT INTO "artist" VALUES(17594,'Aesaire','https://ocremix.org/artist/17594/aesaire');
+INSERT INTO "artist" VALUES(17596,'Minnie Moog','https://ocremix.org/artist/17596/minnie-moog');
+INSERT INTO "artist" VALUES(17599,'Tikaal','https://ocremix.org/artist/17599/tikaal');
+INSERT INTO "artist" VALUES(17600,'Mental','https://ocremix.org/artist/17600/mental');
+INSERT INTO "artist" VALUES(17601,'Gunderslam','https://ocremix.org/artist/17601/gunderslam');
+INSERT INTO "artist" VALUES(17920,'Justin Lassen','https://ocremix.org/artist/17920/justin-lassen');
+INSERT INTO "artist" VALUES(17929,'Gaspode','https://ocremix.org/artist/17929/gaspode');
+INSERT INTO "artist" VALUES(17930,'Infinity Tone','https://ocremix.org/artist/17930/infinity-tone');
+INSERT INTO "artist" VALUES(17937,'Ridley Snipes','https://ocremix.org/artist/17937/ridley-snipes');
+INSERT INTO "artist" VALUES(17939,'AlmightyArceus','https://ocremix.org/artist/17939/almightyarceus');
+INSERT INTO "artist" VALUES(17940,'The Geeky Guitarist','https://ocremix.org/artist/17940/the-geeky-guitarist');
+INSERT INTO "artist" VALUES(17941,'SpaceGhost','https://ocremix.org/artist/17941/spaceghost');
+INSERT INTO "artist" VALUES(17942,'ymK','https://ocremix.org/artist/17942/ymk');
+INSERT INTO "artist" VALUES(17946,'theStyg','https://ocremix.org/artist/17946/thestyg');
+INSERT INTO "artist" VALUES(17947,'Parker Walker','https://ocremix.org/artist/17947/parker-walker');
+INSERT INTO "artist" VALUES(17948,'MET∆TRON','https://ocremix.org/artist/17948/metatron');
+INSERT INTO "artist" VALUES(17966,'Julien Mulard','https://ocremix.org/artist/17966/julien-mulard');
+INSERT INTO "artist" VALUES(17976,'Schneider Souza','https://ocremix.org/artist/17976/schneider-souza');
+INSERT INTO "artist" VALUES(17977,'Grospixels','https://ocremix.org/artist/17977/grospixels');
+INSERT INTO "artist" VALUES(17980,'Kev Ragone','https://ocremix.org/artist/17980/kev-ragone');
+INSERT INTO "artist" VALUES(17982,'darmock','https://ocremix.org/artist/17982/darmock');
+INSERT INTO "artist" VALUES(18029,'Kenny Jr.','https://ocremix.org/artist/18029/kenny-jr');
+INSERT INTO "artist" VALUES(18030,'Saxxon Fox','https://ocremix.org/artist/18030/saxxon-fox');
+INSERT INTO "artist" VALUES(18031,'Amerlyn Zeta','https://ocremix.org/artist/18031/amerlyn-zeta');
+INSERT INTO "artist" VALUES(18032,'Andrew Stern','https://ocremix.org/artist/18032/andrew-stern');
+INSERT INTO "artist" VALUES(18033,'Yuki K','https://ocremix.org/artist/18033/yuki-k');
+INSERT INTO "artist" VALUES(18034,'Dewey Newt','https://ocremix.org/artist/18034/dewey-newt');
+INSERT INTO "artist" VALUES(18063,'mikeHEARTu','https://ocremix.org/artist/18063/mikeheartu');
+INSERT INTO "artist" VALUES(18166,'Vivian Reeves','https://ocremix.org/artist/18166/vivian-reeves');
+INSERT INTO "artist" VALUES(18198,'KezyCP','https://ocremix.org/artist/18198/kezycp');
+INSERT INTO "artist" VALUES(18204,'Masikus','https://ocremix.org/artist/18204/masikus');
+INSERT INTO "artist" VALUES(18206,'Akmigone','https://ocremix.org/artist/18206/akmigone');
+INSERT INTO "artist" VALUES(18207,'Anthony Morgan','https://ocremix.org/artist/18207/anthony-morgan');
+INSERT INTO "artist" VALUES(18291,'Samantha Ballard','https://ocremix.org/artist/18291/samantha-ballard');
+INSERT INTO "artist" VALUES(18292,'May Claire La Plante','https://ocremix.org/artist/18292/may-claire-la-plante');
+INSERT INTO "artist" VALUES(18293,'PitTan','https://ocremix.org/artist/18293/pittan');
+INSERT INTO "artist" VALUES(18294,'Meowsical','https://ocremix.org/artist/18294/meowsical');
+INSERT INTO "artist" VALUES(18295,'Tiggs','https://ocremix.org/artist/18295/tiggs');
+INSERT INTO "artist" VALUES(18296,'Julia Henderson','https://ocremix.org/artist/18296/julia-henderson');
+INSERT INTO "artist" VALUES(18297,'MatcHey','https://ocremix.org/artist/18297/matchey');
+INSERT INTO "artist" VALUES(18298,'Chris Kohler','https://ocremix.org/artist/18298/chris-kohler');
+INSERT INTO "artist" VALUES(18300,'Cory Johnson','https://ocremix.org/artist/18300/cory-johnson');
+INSERT INTO "artist" VALUES(18301,'Evan Wardell','https://ocremix.org/artist/18301/evan-wardell');
+INSERT INTO "artist" VALUES(18305,'Phoenix Up','https://ocremix.org/artist/18305/phoenix-up');
+INSERT INTO "artist" VALUES(18311,'MaripaPls','https://ocremix.org/artist/18311/maripapls');
+INSERT INTO "artist" VALUES(18312,'wildcaml','https://ocremix.org/artist/18312/wildcaml');
+INSERT INTO "artist" VALUES(18313,'The Good Ice','https://ocremix.org/artist/18313/the-good-ice');
+INSERT INTO "artist" VALUES(18314,'dPoten','https://ocremix.org/artist/18314/dpoten');
+INSERT INTO "artist" VALUES(18315,'ardklaw','https://ocremix.org/artist/18315/ardklaw');
+INSERT INTO "artist" VALUES(18326,'General Grunt','https://ocremix.org/artist/18326/general-grunt');
+INSERT INTO "artist" VALUES(18328,'Neon X','https://ocremix.org/artist/18328/neon-x');
+INSERT INTO "artist" VALUES(18329,'Spad3s','https://ocremix.org/artist/18329/spad3s');
+INSERT INTO "artist" VALUES(18332,'Ben Oz','https://ocremix.org/artist/18332/ben-oz');
+INSERT INTO "artist" VALUES(18333,'PhrygianFingers','https://ocremix.org/artist/18333/phrygianfingers');
+INSERT INTO "artist" VALUES(18335,'Soul in Sadness','https://ocremix.org/artist/18335/soul-in-sadness');
+INSERT INTO "artist" VALUES(18340,'MusicallyInspired','https://ocremix.org/artist/18340/musicallyinspired');
+INSERT INTO "artist" VALUES(18341,'Pixel Pirates','https://ocremix.org/artist/18341/pixel-pirates');
+INSERT INTO "artist" VALUES(18344,'Bobbie Jane Desforges','https://ocremix.org/artist/18344/bobbie-jane-desforges');
+INSERT INTO "artist" VALUES(18345,'Tyler Mire','https://ocremix.org/artist/18345/tyler-mire');
+INSERT INTO "artist" VALUES(18360,'Multiplayer Big Band','https://ocremix.org/artist/18360/multiplayer-big-band');
+INSERT INTO "artist" VALUES(18361,'Bonnie Bogovich','https://ocremix.org/artist/18361/bonnie-bogovich');
+INSERT INTO "artist" VALUES(18362,'Ian Martyn','https://ocremix.org/artist/18362/ian-martyn');
+INSERT INTO "artist" VALUES(18363,'Peter Jones','https://ocremix.org/artist/18363/peter-jones');
+INSERT INTO "artist" VALUES(18364,'Capt''n Shred','https://ocremix.org/artist/18364/captn-shred');
+INSERT INTO "artist" VALUES(18367,'LHEH','https://ocremix.org/artist/18367/lheh');
+INSERT INTO "artist" VALUES(18372,'227','https://ocremix.org/artist/18372/227');
+INSERT INTO "artist" VALUES(18376,'Tremendouz','https://ocremix.org/artist/18376/tremendouz');
+INSERT INTO "artist" VALUES(18377,'Mirasol','https://ocremix.org/artist/18377/mirasol');
+INSERT INTO "artist" VALUES(18378,'GreatBlakes','https://ocremix.org/artist/18378/greatblakes');
+INSERT INTO "artist" VALUES(18379,'Bortcle','https://ocremix.org/artist/18379/bortcle');
+INSERT INTO "artist" VALUES(18380,'Akidna','https://ocremix.org/artist/18380/akidna');
+INSERT INTO "artist" VALUES(18382,'Woody/mC','https://ocremix.org/artist/18382/woodymc');
+INSERT INTO "artist" VALUES(18386,'Black SeeD','https://ocremix.org/artist/18386/black-seed');
+INSERT INTO "artist" VALUES(18387,'donut','https://ocremix.org/artist/18387/donut');
+INSERT INTO "artist" VALUES(18388,'Sean R. Hanson','https://ocremix.org/artist/18388/sean-r-hanson');
+INSERT INTO "artist" VALUES(18389,'insaneintherainmusic','https://ocremix.org/artist/18389/insaneintherainmusic');
+INSERT INTO "artist" VALUES(18391,'Deckels','https://ocremix.org/artist/18391/deckels');
+INSERT INTO "artist" VALUES(18392,'Andy-Ru','https://ocremix.org/artist/18392/andy-ru');
+INSERT INTO "artist" VALUES(18393,'Ji Young Lee','https://ocremix.org/artist/18393/ji-young-lee');
+INSERT INTO "artist" VALUES(18394,'Anton Platonov','https://ocremix.org/artist/18394/anton-platonov');
+INSERT INTO "artist" VALUES(18402,'Justin Thornburgh','https://ocremix.org/artist/18402/justin-thornburgh');
+INSERT INTO "artist" VALUES(18403,'H36T','https://ocremix.org/artist/18403/h36t');
+INSERT INTO "artist" VALUES(18408,'ExperimentalSoundLab','https://ocremix.org/artist/18408/experimentalsoundlab');
+INSERT INTO "artist" VALUES(18412,'Mosh Bits','https://ocremix.org/artist/18412/mosh-bits');
+INSERT INTO "artist" VALUES(18413,'BeanJammin','https://ocremix.org/artist/18413/beanjammin');
+INSERT INTO "artist" VALUES(18579,'Ben Cureton','https://ocremix.org/artist/18579/ben-cureton');
+INSERT INTO "artist" VALUES(18580,'Joshua Du Chene','https://ocremix.org/artist/18580/joshua-du-chene');
+INSERT INTO "artist" VALUES(18581,'Ryan Ike','https://ocremix.org/artist/18581/ryan-ike');
+INSERT INTO "artist" VALUES(18589,'Tab Newflax','https://ocremix.org/artist/18589/tab-newflax');
+INSERT INTO "artist" VALUES(18590,'Steven Higbee','https://ocremix.org/artist/18590/steven-higbee');
+INSERT INTO "artist" VALUES(18591,'PrismaticBlack','https://ocremix.org/artist/18591/prismaticblack');
+INSERT INTO "artist" VALUES(18593,'Facemelting Solos','https://ocremix.org/artist/18593/facemelting-solos');
+INSERT INTO "artist" VALUES(18594,'SableProvidence','https://ocremix.org/artist/18594/sableprovidence');
+INSERT INTO "artist" VALUES(18595,'Anna Hanabi','https://ocremix.org/artist/18595/anna-hanabi');
+INSERT INTO "artist" VALUES(18596,'dpMusicman','https://ocremix.org/artist/18596/dpmusicman');
+INSERT INTO "artist" VALUES(18597,'Khoo Sze Ning','https://ocremix.org/artist/18597/khoo-sze-ning');
+INSERT INTO "artist" VALUES(18600,'AzureKevin','https://ocremix.org/artist/18600/azurekevin');
+INSERT INTO "artist" VALUES(18601,'Shea''s Violin','https://ocremix.org/artist/18601/sheas-violin');
+INSERT INTO "artist" VALUES(18602,'Treyt','https://ocremix.org/artist/18602/treyt');
+INSERT INTO "artist" VALUES(18604,'Warp Whistles Music','https://ocremix.org/artist/18604/warp-whistles-music');
+INSERT INTO "artist" VALUES(18605,'MegadudeXD','https://ocremix.org/artist/18605/megadudexd');
+INSERT INTO "artist" VALUES(18606,'The Vodoú Queen','https://ocremix.org/artist/18606/the-vodou-queen');
+INSERT INTO "artist" VALUES(18607,'Nwgo','https://ocremix.org/artist/18607/nwgo');
+INSERT INTO "artist" VALUES(18608,'Torby Brand','https://ocremix.org/artist/18608/torby-brand');
+INSERT INTO "artist" VALUES(18609,'LemonheadVGM','https://ocremix.org/artist/18609/lemonheadvgm');
+INSERT INTO "artist" VALUES(18610,'Joshua Taipale','https://ocremix.org/artist/18610/joshua-taipale');
+INSERT INTO "artist" VALUES(18611,'Scott Semanski','https://ocremix.org/artist/18611/scott-semanski');
+INSERT INTO "artist" VALUES(18612,'feraldreams.','https://ocremix.org/artist/18612/feraldreams');
+INSERT INTO "artist" VALUES(18615,'Sorven','https://ocremix.org/artist/18615/sorven');
+INSERT INTO "artist" VALUES(18616,'Techie Jessie','https://ocremix.org/artist/18616/techie-jessie');
+INSERT INTO "artist" VALUES(18619,'Calem Destiny','https://ocremix.org/artist/18619/calem-destiny');
+INSERT INTO "artist" VALUES(18621,'Flake','https://ocremix.org/artist/18621/flake');
+INSERT INTO "artist" VALUES(18622,'CNDR','https://ocremix.org/artist/18622/cndr');
+INSERT INTO "artist" VALUES(18623,'colorado weeks','https://ocremix.org/artist/18623/colorado-weeks');
+INSERT INTO "artist" VALUES(18624,'optimizasean','https://ocremix.org/artist/18624/optimizasean');
+INSERT INTO "artist" VALUES(18629,'Daphne F.','https://ocremix.org/artist/18629/daphne-f');
+INSERT INTO "artist" VALUES(18630,'William Sandberg','https://ocremix.org/artist/18630/william-sandberg');
+INSERT INTO "artist" VALUES(18631,'KestrelGirl','https://ocremix.org/artist/18631/kestrelgirl');
+INSERT INTO "artist" VALUES(18632,'Mel Decision','https://ocremix.org/artist/18632/mel-decision');
+INSERT INTO "artist" VALUES(18633,'Jabo','https://ocremix.org/artist/18633/jabo');
+INSERT INTO "artist" VALUES(18634,'metamoogle','https://ocremix.org/artist/18634/metamoogle');
+INSERT INTO "artist" VALUES(18635,'Serrin''s Toes','https://ocremix.org/artist/18635/serrins-toes');
+INSERT INTO "artist" VALUES(18636,'Drakeld','https://ocremix.org/artist/18636/drakeld');
+INSERT INTO "artist" VALUES(18637,'Wurtzel','https://ocremix.org/artist/18637/wurtzel');
+INSERT INTO "artist" VALUES(18638,'Dionté George','https://ocremix.org/artist/18638/dionte-george');
+INSERT INTO "artist" VALUES(18639,'Becky Reid','https://ocremix.org/artist/18639/becky-reid');
+INSERT INTO "artist" VALUES(18640,'John Bishop','https://ocremix.org/artist/18640/john-bishop');
+INSERT INTO "artist" VALUES(18642,'Numoon','https://ocremix.org/artist/18642/numoon');
+INSERT INTO "artist" VALUES(18643,'Erika Richards','https://ocremix.org/artist/18643/erika-richards');
+INSERT INTO "artist" VALUES(18648,'sui','https://ocremix.org/artist/18648/sui');
+INSERT INTO "artist" VALUES(18651,'Error 47','https://ocremix.org/artist/18651/error-47');
+INSERT INTO "artist" VALUES(18652,'shieldeater','https://ocremix.org/artist/18652/shieldeater');
+INSERT INTO "artist" VALUES(18653,'TheManPF','https://ocremix.org/artist/18653/themanpf');
+INSERT INTO "artist" VALUES(18654,'Zach Chapman','https://ocremix.org/artist/18654/zach-chapman');
+INSERT INTO "artist" VALUES(18655,'newmajoe','https://ocremix.org/artist/18655/newmajoe');
+INSERT INTO "artist" VALUES(18656,'Rux Ton','https://ocremix.org/artist/18656/rux-ton');
+INSERT INTO "artist" VALUES(18659,'jneen collective','https://ocremix.org/artist/18659/jneen-collective');
+INSERT INTO "artist" VALUES(18660,'Ryan Buell','https://ocremix.org/artist/18660/ryan-buell');
+INSERT INTO "artist" VALUES(18662,'ErichWK','https://ocremix.org/artist/18662/erichwk');
+INSERT INTO "artist" VALUES(18663,'Kiragon o Bardo','https://ocremix.org/artist/18663/kiragon-o-bardo');
+INSERT INTO "artist" VALUES(18664,'Kyana','https://ocremix.org/artist/18664/kyana');
+INSERT INTO "artist" VALUES(18665,'MarimbaMatt','https://ocremix.org/artist/18665/marimbamatt');
+INSERT INTO "artist" VALUES(18666,'Evan Carville','https://ocremix.org/artist/18666/evan-carville');
+INSERT INTO "artist" VALUES(18667,'myuik','https://ocremix.org/artist/18667/myuik');
+INSERT INTO "artist" VALUES(18668,'Xander','https://ocremix.org/artist/18668/xander');
+INSERT INTO "artist" VALUES(18670,'PIT Game Music','https://ocremix.org/artist/18670/pit-game-music');
+INSERT INTO "artist" VALUES(18671,'JuKayVid','https://ocremix.org/artist/18671/jukayvid');
+INSERT INTO "artist" VALUES(18684,'Erik McClure','https://ocremix.org/artist/18684/erik-mcclure');
+INSERT INTO "artist" VALUES(18685,'Audiomint','https://ocremix.org/artist/18685/audiomint');
+INSERT INTO "artist" VALUES(18686,'Rekkinom','https://ocremix.org/artist/18686/rekkinom');
+INSERT INTO "artist" VALUES(18693,'Artificial Eye','https://ocremix.org/artist/18693/artificial-eye');
+INSERT INTO "artist" VALUES(18694,'Amaury Sabau','https://ocremix.org/artist/18694/amaury-sabau');
+INSERT INTO "artist" VALUES(18695,'Maxime Marion','https://ocremix.org/artist/18695/maxime-marion');
+INSERT INTO "artist" VALUES(18696,'François Kukla','https://ocremix.org/artist/18696/francois-kukla');
+INSERT INTO "artist" VALUES(18697,'Lydie Berthet','https://ocremix.org/artist/18697/lydie-berthet');
+INSERT INTO "artist" VALUES(18698,'Biggoron','https://ocremix.org/artist/18698/biggoron');
+INSERT INTO "artist" VALUES(18701,'Roph','https://ocremix.org/artist/18701/roph');
+INSERT INTO "artist" VALUES(18702,'Harpsibored','https://ocremix.org/artist/18702/harpsibored');
+INSERT INTO "artist" VALUES(18703,'Dawnaria','https://ocremix.org/artist/18703/dawnaria');
+INSERT INTO "artist" VALUES(18704,'Charlie Atom','https://ocremix.org/artist/18704/charlie-atom');
+INSERT INTO "artist" VALUES(18705,'VARIA','https://ocremix.org/artist/18705/varia');
+INSERT INTO "artist" VALUES(18706,'Jess Destramp','https://ocremix.org/artist/18706/jess-destramp');
+INSERT INTO "artist" VALUES(18707,'Thomas Kresge','https://ocremix.org/artist/18707/thomas-kresge');
+INSERT INTO "artist" VALUES(18708,'Daniel Caton','https://ocremix.org/artist/18708/daniel-caton');
+INSERT INTO "artist" VALUES(18710,'pixelseph','https://ocremix.org/artist/18710/pixelseph');
+INSERT INTO "artist" VALUES(18711,'paradiddlesjosh','https://ocremix.org/artist/18711/paradiddlesjosh');
+INSERT INTO "artist" VALUES(18712,'Pixels and Paradiddles','https://ocremix.org/artist/18712/pixels-and-paradiddles');
+INSERT INTO "artist" VALUES(18713,'Jeremy Lim','https://ocremix.org/artist/18713/jeremy-lim');
+INSERT INTO "artist" VALUES(18714,'Rahul Vanamali','https://ocremix.org/artist/18714/rahul-vanamali');
+INSERT INTO "artist" VALUES(18715,'Teil Buck','https://ocremix.org/artist/18715/teil-buck');
+INSERT INTO "artist" VALUES(18716,'Terminated Weasel','https://ocremix.org/artist/18716/terminated-weasel');
+INSERT INTO "artist" VALUES(18717,'Matt Berra','https://ocremix.org/artist/18717/matt-berra');
+INSERT INTO "artist" VALUES(18718,'ViolinGamer','https://ocremix.org/artist/18718/violingamer');
+INSERT INTO "artist" VALUES(18723,'Manuel Hirner','https://ocremix.org/artist/18723/manuel-hirner');
+INSERT INTO "artist" VALUES(18724,'minusworld','https://ocremix.org/artist/18724/minusworld');
+INSERT INTO "artist" VALUES(18725,'Graham Hardaway','https://ocremix.org/artist/18725/graham-hardaway');
+INSERT INTO "artist" VALUES(18727,'Onirik Dreamer','https://ocremix.org/artist/18727/onirik-dreamer');
+INSERT INTO "artist" VALUES(18728,'Extrinzic','https://ocremix.org/artist/18728/extrinzic');
+INSERT INTO "artist" VALUES(18729,'evilsonic','https://ocremix.org/artist/18729/evilsonic');
+INSERT INTO "artist" VALUES(18730,'DakotaCityRag','https://ocremix.org/artist/18730/dakotacityrag');
+INSERT INTO "artist" VALUES(18731,'Chocobao','https://ocremix.org/artist/18731/chocobao');
+INSERT INTO "artist" VALUES(18732,'Kyaku','https://ocremix.org/artist/18732/kyaku');
+INSERT INTO "artist" VALUES(18733,'SynthSage','https://ocremix.org/artist/18733/synthsage');
+INSERT INTO "artist" VALUES(18734,'Marissa Turnage','https://ocremix.org/artist/18734/marissa-turnage');
+INSERT INTO "artist" VALUES(18735,'Jett Swole','https://ocremix.org/artist/18735/jett-swole');
+INSERT INTO "artist" VALUES(18736,'JSABlixer','https://ocremix.org/artist/18736/jsablixer');
+INSERT INTO "artist" VALUES(18737,'Brandon Harnish','https://ocremix.org/artist/18737/brandon-harnish');
+INSERT INTO "artist" VALUES(18738,'AarekMG','https://ocremix.org/artist/18738/aarekmg');
+INSERT INTO "artist" VALUES(18739,'DeLuxDolemite','https://ocremix.org/artist/18739/deluxdolemite');
+INSERT INTO "artist" VALUES(18741,'ThisIsJayC','https://ocremix.org/artist/18741/thisisjayc');
+INSERT INTO "artist" VALUES(18742,'Nemo Fairlight','https://ocremix.org/artist/18742/nemo-fairlight');
+INSERT INTO "artist" VALUES(18744,'Janne Sala','https://ocremix.org/artist/18744/janne-sala');
+INSERT INTO "artist" VALUES(18749,'Muffin Tunes','https://ocremix.org/artist/18749/muffin-tunes');
+INSERT INTO "artist" VALUES(18750,'Valse39','https://ocremix.org/artist/18750/valse39');
+INSERT INTO "artist" VALUES(18751,'Bandit the Raccoon','https://ocremix.org/artist/18751/bandit-the-raccoon');
+INSERT INTO "artist" VALUES(18752,'LXE','https://ocremix.org/artist/18752/lxe');
+INSERT INTO "artist" VALUES(18756,'Cradius','https://ocremix.org/artist/18756/cradius');
+INSERT INTO "artist" VALUES(18757,'Leo Miyata','https://ocremix.org/artist/18757/leo-miyata');
+INSERT INTO "artist" VALUES(18785,'lisabela','https://ocremix.org/artist/18785/lisabela');
+INSERT INTO "artist" VALUES(18786,'Voices of the Blue Planet','https://ocremix.org/artist/18786/voices-of-the-blue-planet');
+INSERT INTO "artist" VALUES(18792,'Dane Jacobs','https://ocremix.org/artist/18792/dane-jacobs');
+INSERT INTO "artist" VALUES(18793,'T.O. Bassett','https://ocremix.org/artist/18793/to-bassett');
+INSERT INTO "artist" VALUES(18794,'Dagger_G','https://ocremix.org/artist/18794/dagger-g');
+INSERT INTO "artist" VALUES(18795,'Don_Bozzi','https://ocremix.org/artist/18795/don-bozzi');
+INSERT INTO "artist" VALUES(18802,'Sebastian Mårtensson','https://ocremix.org/artist/18802/sebastian-martensson');
+INSERT INTO "artist" VALUES(18803,'Tove Petersson','https://ocremix.org/artist/18803/tove-petersson');
+INSERT INTO "artist" VALUES(18804,'Niki Yaghmaee','https://ocremix.org/artist/18804/niki-yaghmaee');
+INSERT INTO "artist" VALUES(18805,'BadHairlineProductions','https://ocremix.org/artist/18805/badhairlineproductions');
+INSERT INTO "artist" VALUES(18806,'Insane Cup Posse','https://ocremix.org/artist/18806/insane-cup-posse');
+INSERT INTO "artist" VALUES(18810,'Crashlander','https://ocremix.org/artist/18810/crashlander');
+INSERT INTO "artist" VALUES(18812,'Aeroprism','https://ocremix.org/artist/18812/aeroprism');
+INSERT INTO "artist" VALUES(18814,'Chelsea McBride','https://ocremix.org/artist/18814/chelsea-mcbride');
+INSERT INTO "artist" VALUES(18815,'John Robert Matz','https://ocremix.org/artist/18815/john-robert-matz');
+INSERT INTO "artist" VALUES(18816,'Blujak','https://ocremix.org/artist/18816/blujak');
+INSERT INTO "artist" VALUES(18817,'Ordonis','https://ocremix.org/artist/18817/ordonis');
+INSERT INTO "artist" VALUES(18818,'Yami','https://ocremix.org/artist/18818/yami');
+INSERT INTO "artist" VALUES(18819,'Michelle Dreyband','https://ocremix.org/artist/18819/michelle-dreyband');
+INSERT INTO "artist" VALUES(18821,'endlessrepeat','https://ocremix.org/artist/18821/endlessrepeat');
+INSERT INTO "artist" VALUES(18823,'SovRin','https://ocremix.org/artist/18823/sovrin');
+INSERT INTO "artist" VALUES(18824,'bash explode','https://ocremix.org/artist/18824/bash-explode');
+INSERT INTO "artist" VALUES(18828,'Development of Avoid','https://ocremix.org/artist/18828/development-of-avoid');
+INSERT INTO "artist" VALUES(18829,'ShinobiSyntax','https://ocremix.org/artist/18829/shinobisyntax');
+INSERT INTO "artist" VALUES(18830,'NiKo Vargas','https://ocremix.org/artist/18830/niko-vargas');
+INSERT INTO "artist" VALUES(18831,'Hashel','https://ocremix.org/artist/18831/hashel');
+INSERT INTO "artist" VALUES(18832,'7DD9','https://ocremix.org/artist/18832/7dd9');
+INSERT INTO "artist" VALUES(18836,'Andromeda','https://ocremix.org/artist/18836/andromeda');
+INSERT INTO "artist" VALUES(18837,'Nicole Chang','https://ocremix.org/artist/18837/nicole-chang');
+INSERT INTO "artist" VALUES(18839,'Mattmatatt','https://ocremix.org/artist/18839/mattmatatt');
+INSERT INTO "artist" VALUES(18840,'Hotline Sehwani','https://ocremix.org/artist/18840/hotline-sehwani');
+INSERT INTO "artist" VALUES(18843,'Peter Wendin','https://ocremix.org/artist/18843/peter-wendin');
+INSERT INTO "artist" VALUES(18844,'100%ROEMER','https://ocremix.org/artist/18844/100-percentroemer');
+INSERT INTO "artist" VALUES(18845,'lunarice','https://ocremix.org/artist/18845/lunarice');
+INSERT INTO "artist" VALUES(18846,'Ronald Poe','https://ocremix.org/artist/18846/ronald-poe');
+INSERT INTO "artist" VALUES(18847,'Moebius','https://ocremix.org/artist/18847/moebius');
+INSERT INTO "artist" VALUES(18852,'Na Daoine Laghairt','https://ocremix.org/artist/18852/na-daoine-laghairt');
+INSERT INTO "artist" VALUES(18855,'Valentino Francavilla','https://ocremix.org/artist/18855/valentino-francavilla');
+INSERT INTO "artist" VALUES(18856,'Susanna Gray-Jones','https://ocremix.org/artist/18856/susanna-gray-jones');
+INSERT INTO "artist" VALUES(18857,'Chromatic Walnut','https://ocremix.org/artist/18857/chromatic-walnut');
+INSERT INTO "artist" VALUES(18858,'LadyReemz','https://ocremix.org/artist/18858/ladyreemz');
+INSERT INTO "artist" VALUES(18859,'Louie Aronowitz','https://ocremix.org/artist/18859/louie-aronowitz');
+INSERT INTO "artist" VALUES(18860,'gravitygauntlet','https://ocremix.org/artist/18860/gravitygauntlet');
+INSERT INTO "artist" VALUES(18861,'Stephanie Renshaw','https://ocremix.org/artist/18861/stephanie-renshaw');
+INSERT INTO "artist" VALUES(18862,'zmand97','https://ocremix.org/artist/18862/zmand97');
+INSERT INTO "artist" VALUES(18863,'Andrew Gossett','https://ocremix.org/artist/18863/andrew-gossett');
+INSERT INTO "artist" VALUES(18864,'AnimeVivi','https://ocremix.org/artist/18864/animevivi');
+INSERT INTO "artist" VALUES(18865,'Kalen Scott Thomas','https://ocremix.org/artist/18865/kalen-scott-thomas');
+INSERT INTO "artist" VALUES(18866,'iCrescendo','https://ocremix.org/artist/18866/icrescendo');
+INSERT INTO "artist" VALUES(18868,'Whispy Woodwinds','https://ocremix.org/artist/18868/whispy-woodwinds');
+INSERT INTO "artist" VALUES(18869,'pointblanket','https://ocremix.org/artist/18869/pointblanket');
+INSERT INTO "artist" VALUES(18886,'Connor Engstrom','https://ocremix.org/artist/18886/connor-engstrom');
+INSERT INTO "artist" VALUES(18889,'The Rocket Knights','https://ocremix.org/artist/18889/the-rocket-knights');
+INSERT INTO "artist" VALUES(18890,'Flávio Teles','https://ocremix.org/artist/18890/flavio-teles');
+INSERT INTO "artist" VALUES(18895,'Docjekyll','https://ocremix.org/artist/18895/docjekyll');
+INSERT INTO "artist" VALUES(18896,'SupremoMusico400','https://ocremix.org/artist/18896/supremomusico400');
+INSERT INTO "artist" VALUES(18898,'Pipko Fanfare','https://ocremix.org/artist/18898/pipko-fanfare');
+INSERT INTO "artist" VALUES(18899,'com_poser','https://ocremix.org/artist/18899/com-poser');
+INSERT INTO "artist" VALUES(18900,'shodan','https://ocremix.org/artist/18900/shodan');
+INSERT INTO "artist" VALUES(18901,'Inwayn','https://ocremix.org/artist/18901/inwayn');
+INSERT INTO "artist" VALUES(18904,'Unknown Pseudoartist','https://ocremix.org/artist/18904/unknown-pseudoartist');
+INSERT INTO "artist" VALUES(18906,'p4p3r','https://ocremix.org/artist/18906/p4p3r');
+INSERT INTO "artist" VALUES(18907,'SQORE','https://ocremix.org/artist/18907/sqore');
+INSERT INTO "artist" VALUES(18908,'Giorgos Panagiotou','https://ocremix.org/artist/18908/giorgos-panagiotou');
+INSERT INTO "artist" VALUES(18909,'M. Bulteau','https://ocremix.org/artist/18909/m-bulteau');
+INSERT INTO "artist" VALUES(18913,'Roland N. Laracuente Martínez','https://ocremix.org/artist/18913/roland-n-laracuente-martinez');
+INSERT INTO "artist" VALUES(18925,'BANANA TRASH','https://ocremix.org/artist/18925/banana-trash');
+INSERT INTO "artist" VALUES(18926,'Seveneyes','https://ocremix.org/artist/18926/seveneyes');
+INSERT INTO "artist" VALUES(18927,'Sly Man','https://ocremix.org/artist/18927/sly-man');
+INSERT INTO "artist" VALUES(18928,'angrypolarbear','https://ocremix.org/artist/18928/angrypolarbear');
+INSERT INTO "artist" VALUES(18929,'Audiomancer','https://ocremix.org/artist/18929/audiomancer');
+INSERT INTO "artist" VALUES(18930,'CeCe Ennui','https://ocremix.org/artist/18930/cece-ennui');
+INSERT INTO "artist" VALUES(18938,'maclaine grace','https://ocremix.org/artist/18938/maclaine-grace');
+INSERT INTO "artist" VALUES(18940,'Dog Food for Bananas','https://ocremix.org/artist/18940/dog-food-for-bananas');
+INSERT INTO "artist" VALUES(18941,'mo.oorgan','https://ocremix.org/artist/18941/mooorgan');
+INSERT INTO "artist" VALUES(18942,'DJ-J-RAD','https://ocremix.org/artist/18942/dj-j-rad');
+INSERT INTO "artist" VALUES(18943,'Alex Robinson','https://ocremix.org/artist/18943/alex-robinson');
+INSERT INTO "artist" VALUES(18962,'PRIDASK','https://ocremix.org/artist/18962/pridask');
+INSERT INTO "artist" VALUES(18963,'Fataloror','https://ocremix.org/artist/18963/fataloror');
+INSERT INTO "artist" VALUES(18964,'Triple B Music','https://ocremix.org/artist/18964/triple-b-music');
+INSERT INTO "artist" VALUES(18965,'Linnea Burr','https://ocremix.org/artist/18965/linnea-burr');
+INSERT INTO "artist" VALUES(18966,'Dylan William van de Wal','https://ocremix.org/artist/18966/dylan-william-van-de-wal');
+INSERT INTO "artist" VALUES(18967,'David Lallande','https://ocremix.org/artist/18967/david-lallande');
+INSERT INTO "artist" VALUES(18968,'Bharat Raman','https://ocremix.org/artist/18968/bharat-raman');
+INSERT INTO "artist" VALUES(18969,'Ariane Marchese','https://ocremix.org/artist/18969/ariane-marchese');
+INSERT INTO "artist" VALUES(18971,'Slowly Crushed','https://ocremix.org/artist/18971/slowly-crushed');
+INSERT INTO "artist" VALUES(18980,'Duel Tech','https://ocremix.org/artist/18980/duel-tech');
+INSERT INTO "artist" VALUES(18983,'Xander Plute','https://ocremix.org/artist/18983/xander-plute');
+INSERT INTO "artist" VALUES(18984,'Unfocused in IA','https://ocremix.org/artist/18984/unfocused-in-ia');
+INSERT INTO "artist" VALUES(18988,'Rally Cat','https://ocremix.org/artist/18988/rally-cat');
+INSERT INTO "artist" VALUES(18989,'The Key Combo','https://ocremix.org/artist/18989/the-key-combo');
+INSERT INTO "artist" VALUES(18991,'Dom Palombi','https://ocremix.org/artist/18991/dom-palombi');
+INSERT INTO "artist" VALUES(18992,'Steven Hewitt','https://ocremix.org/artist/18992/steven-hewitt');
+INSERT INTO "artist" VALUES(18995,'Justin Wilbanks','https://ocremix.org/artist/18995/justin-wilbanks');
+INSERT INTO "artist" VALUES(18997,'roqdrummer','https://ocremix.org/artist/18997/roqdrummer');
+INSERT INTO "artist" VALUES(18998,'Nivan Sharma','https://ocremix.org/artist/18998/nivan-sharma');
+INSERT INTO "artist" VALUES(18999,'Seth Skoda','https://ocremix.org/artist/18999/seth-skoda');
+INSERT INTO "artist" VALUES(19000,'The Crazy 8ths','https://ocremix.org/artist/19000/the-crazy-8ths');
+INSERT INTO "artist" VALUES(19007,'Azina','https://ocremix.org/artist/19007/azina');
+INSERT INTO "artist" VALUES(19008,'Mark van Mechelen','https://ocremix.org/artist/19008/mark-van-mechelen');
+INSERT INTO "artist" VALUES(19009,'A.C. Menes','https://ocremix.org/artist/19009/ac-menes');
+INSERT INTO "artist" VALUES(19010,'N. Fanning','https://ocremix.org/artist/19010/n-fanning');
+INSERT INTO "artist" VALUES(19011,'Tomás Costa','https://ocremix.org/artist/19011/tomas-costa');
+INSERT INTO "artist" VALUES(19017,'sallekhana','https://ocremix.org/artist/19017/sallekhana');
+INSERT INTO "artist" VALUES(19018,'Dyluck','https://ocremix.org/artist/19018/dyluck');
+INSERT INTO "artist" VALUES(19019,'pixeltea','https://ocremix.org/artist/19019/pixeltea');
+INSERT INTO "artist" VALUES(19020,'LANparty','https://ocremix.org/artist/19020/lanparty');
+INSERT INTO "artist" VALUES(19021,'Theology','https://ocremix.org/artist/19021/theology');
+INSERT INTO "artist" VALUES(19028,'Lady Varda','https://ocremix.org/artist/19028/lady-varda');
+INSERT INTO "artist" VALUES(19030,'Audio Processing Unit','https://ocremix.org/artist/19030/audio-processing-unit');
+INSERT INTO "artist" VALUES(19035,'Barbell Yaga','https://ocremix.org/artist/19035/barbell-yaga');
+INSERT INTO "artist" VALUES(19042,'Cinnamon Stone','https://ocremix.org/artist/19042/cinnamon-stone');
+INSERT INTO "artist" VALUES(19049,'Bryan Alvarez','https://ocremix.org/artist/19049/bryan-alvarez');
+INSERT INTO "artist" VALUES(19050,'Sybil Grace','https://ocremix.org/artist/19050/sybil-grace');
+INSERT INTO "artist" VALUES(19051,'Riley Zielinski','https://ocremix.org/artist/19051/riley-zielinski');
+INSERT INTO "artist" VALUES(19056,'Eltwish','https://ocremix.org/artist/19056/eltwish');
+INSERT INTO "artist" VALUES(19084,'NarnianWarrior','https://ocremix.org/artist/19084/narnianwarrior');
+INSERT INTO "artist" VALUES(19094,'Cameron Seitzman','https://ocremix.org/artist/19094/cameron-seitzman');
+INSERT INTO "artist" VALUES(19095,'PerksJFP','https://ocremix.org/artist/19095/perksjfp');
@@ -0,0 +1,883 @@
+INSERT INTO "game" VALUES(1,'Mega Man','https://ocremix.org/game/1/mega-man-nes');
+INSERT INTO "game" VALUES(2,'Mega Man 2','https://ocremix.org/game/2/mega-man-2-nes');
+INSERT INTO "game" VALUES(3,'Mega Man 3','https://ocremix.org/game/3/mega-man-3-nes');
+INSERT INTO "game" VALUES(4,'Mega Man 4','https://ocremix.org/game/4/mega-man-4-nes');
+INSERT INTO "game" VALUES(6,'Final Fantasy VI','https://ocremix.org/game/6/final-fantasy-vi-snes');
+INSERT INTO "game" VALUES(7,'Final Fantasy VII','https://ocremix.org/game/7/final-fantasy-vii-ps1');
+INSERT INTO "game" VALUES(8,'Final Fantasy','https://ocremix.org/game/8/final-fantasy-nes');
+INSERT INTO "game" VALUES(10,'Final Fantasy III','https://ocremix.org/game/10/final-fantasy-iii-nes');
+INSERT INTO "game" VALUES(11,'Final Fantasy IV','https://ocremix.org/game/11/final-fantasy-iv-snes');
+INSERT INTO "game" VALUES(12,'Final Fantasy V','https://ocremix.org/game/12/final-fantasy-v-snes');
+INSERT INTO "game" VALUES(13,'Final Fantasy VIII','https://ocremix.org/game/13/final-fantasy-viii-ps1');
+INSERT INTO "game" VALUES(14,'Final Fantasy IX','https://ocremix.org/game/14/final-fantasy-ix-ps1');
+INSERT INTO "game" VALUES(15,'Final Fantasy X','https://ocremix.org/game/15/final-fantasy-x-ps2');
+INSERT INTO "game" VALUES(16,'Chrono Trigger','https://ocremix.org/game/16/chrono-trigger-snes');
+INSERT INTO "game" VALUES(17,'Chrono Cross','https://ocremix.org/game/17/chrono-cross-ps1');
+INSERT INTO "game" VALUES(18,'Castlevania','https://ocremix.org/game/18/castlevania-nes');
+INSERT INTO "game" VALUES(19,'Castlevania II: Simon''s Quest','https://ocremix.org/game/19/castlevania-ii-simons-quest-nes');
+INSERT INTO "game" VALUES(20,'Super Castlevania IV','https://ocremix.org/game/20/super-castlevania-iv-snes');
+INSERT INTO "game" VALUES(21,'Contra','https://ocremix.org/game/21/contra-nes');
+INSERT INTO "game" VALUES(22,'Sonic the Hedgehog','https://ocremix.org/game/22/sonic-the-hedgehog-gen');
+INSERT INTO "game" VALUES(23,'Sonic the Hedgehog 2','https://ocremix.org/game/23/sonic-the-hedgehog-2-gen');
+INSERT INTO "game" VALUES(24,'Sonic the Hedgehog 3','https://ocremix.org/game/24/sonic-the-hedgehog-3-gen');
+INSERT INTO "game" VALUES(25,'ActRaiser','https://ocremix.org/game/25/actraiser-snes');
+INSERT INTO "game" VALUES(27,'Alex Kidd in Miracle World','https://ocremix.org/game/27/alex-kidd-in-miracle-world-sms');
+INSERT INTO "game" VALUES(28,'Altered Beast','https://ocremix.org/game/28/altered-beast-gen');
+INSERT INTO "game" VALUES(31,'Arkanoid','https://ocremix.org/game/31/arkanoid-c64');
+INSERT INTO "game" VALUES(32,'Art of Fighting 2','https://ocremix.org/game/32/art-of-fighting-2-ng');
+INSERT INTO "game" VALUES(33,'Astyanax','https://ocremix.org/game/33/astyanax-nes');
+INSERT INTO "game" VALUES(34,'Axelay','https://ocremix.org/game/34/axelay-snes');
+INSERT INTO "game" VALUES(35,'Banana','https://ocremix.org/game/35/banana-nes');
+INSERT INTO "game" VALUES(36,'Banjo-Kazooie','https://ocremix.org/game/36/banjo-kazooie-n64');
+INSERT INTO "game" VALUES(37,'Batman','https://ocremix.org/game/37/batman-nes');
+INSERT INTO "game" VALUES(38,'Bionic Commando','https://ocremix.org/game/38/bionic-commando-nes');
+INSERT INTO "game" VALUES(39,'Blaster Master','https://ocremix.org/game/39/blaster-master-nes');
+INSERT INTO "game" VALUES(40,'Blazing Lazers','https://ocremix.org/game/40/blazing-lazers-tg16');
+INSERT INTO "game" VALUES(42,'Bomberman','https://ocremix.org/game/42/bomberman-nes');
+INSERT INTO "game" VALUES(44,'Bonk''s Adventure','https://ocremix.org/game/44/bonks-adventure-tg16');
+INSERT INTO "game" VALUES(45,'Boogerman: A Pick and Flick Adventure','https://ocremix.org/game/45/boogerman-a-pick-and-flick-adventure-snes');
+INSERT INTO "game" VALUES(46,'Bubble Bobble','https://ocremix.org/game/46/bubble-bobble-nes');
+INSERT INTO "game" VALUES(47,'Donkey Kong Country','https://ocremix.org/game/47/donkey-kong-country-snes');
+INSERT INTO "game" VALUES(48,'Donkey Kong Country 2: Diddy''s Kong Quest','https://ocremix.org/game/48/donkey-kong-country-2-diddys-kong-quest-snes');
+INSERT INTO "game" VALUES(49,'Dragon Warrior','https://ocremix.org/game/49/dragon-warrior-nes');
+INSERT INTO "game" VALUES(50,'DuckTales','https://ocremix.org/game/50/ducktales-nes');
+INSERT INTO "game" VALUES(51,'EarthBound','https://ocremix.org/game/51/earthbound-snes');
+INSERT INTO "game" VALUES(52,'Ecco the Dolphin','https://ocremix.org/game/52/ecco-the-dolphin-gen');
+INSERT INTO "game" VALUES(53,'Radical Dreamers: Nusumenai Houseki','https://ocremix.org/game/53/radical-dreamers-nusumenai-houseki-snes');
+INSERT INTO "game" VALUES(54,'Street Fighter II: The World Warrior','https://ocremix.org/game/54/street-fighter-ii-the-world-warrior-arc');
+INSERT INTO "game" VALUES(55,'Street Fighter II'': Champion Edition','https://ocremix.org/game/55/street-fighter-ii-champion-edition-arc');
+INSERT INTO "game" VALUES(56,'Super Mario Bros.','https://ocremix.org/game/56/super-mario-bros-nes');
+INSERT INTO "game" VALUES(57,'Super Mario Bros. 2','https://ocremix.org/game/57/super-mario-bros-2-nes');
+INSERT INTO "game" VALUES(58,'Super Mario Bros. 3','https://ocremix.org/game/58/super-mario-bros-3-nes');
+INSERT INTO "game" VALUES(59,'Super Mario 64','https://ocremix.org/game/59/super-mario-64-n64');
+INSERT INTO "game" VALUES(61,'Secret of Mana','https://ocremix.org/game/61/secret-of-mana-snes');
+INSERT INTO "game" VALUES(62,'Silent Hill','https://ocremix.org/game/62/silent-hill-ps1');
+INSERT INTO "game" VALUES(63,'Silent Hill 2','https://ocremix.org/game/63/silent-hill-2-ps2');
+INSERT INTO "game" VALUES(64,'The Legend of Zelda','https://ocremix.org/game/64/legend-of-zelda-nes');
+INSERT INTO "game" VALUES(65,'Zelda II: The Adventure of Link','https://ocremix.org/game/65/zelda-ii-the-adventure-of-link-nes');
+INSERT INTO "game" VALUES(66,'The Legend of Zelda: A Link to the Past','https://ocremix.org/game/66/legend-of-zelda-a-link-to-the-past-snes');
+INSERT INTO "game" VALUES(67,'The Legend of Zelda: Ocarina of Time','https://ocremix.org/game/67/legend-of-zelda-ocarina-of-time-n64');
+INSERT INTO "game" VALUES(68,'The Legend of Zelda: Link''s Awakening','https://ocremix.org/game/68/legend-of-zelda-links-awakening-gb');
+INSERT INTO "game" VALUES(69,'Zanac','https://ocremix.org/game/69/zanac-nes');
+INSERT INTO "game" VALUES(70,'Xenogears','https://ocremix.org/game/70/xenogears-ps1');
+INSERT INTO "game" VALUES(71,'Super Mario World 2: Yoshi''s Island','https://ocremix.org/game/71/super-mario-world-2-yoshis-island-snes');
+INSERT INTO "game" VALUES(72,'Ys','https://ocremix.org/game/72/ys-nes');
+INSERT INTO "game" VALUES(73,'Metroid','https://ocremix.org/game/73/metroid-nes');
+INSERT INTO "game" VALUES(74,'Super Metroid','https://ocremix.org/game/74/super-metroid-snes');
+INSERT INTO "game" VALUES(75,'Command & Conquer: Red Alert','https://ocremix.org/game/75/command-and-conquer-red-alert-win');
+INSERT INTO "game" VALUES(77,'Lunar: The Silver Star','https://ocremix.org/game/77/lunar-the-silver-star-scd');
+INSERT INTO "game" VALUES(79,'Streets of Rage','https://ocremix.org/game/79/streets-of-rage-gen');
+INSERT INTO "game" VALUES(80,'Streets of Rage 2','https://ocremix.org/game/80/streets-of-rage-2-gen');
+INSERT INTO "game" VALUES(81,'Shinobi','https://ocremix.org/game/81/shinobi-sms');
+INSERT INTO "game" VALUES(82,'The Revenge of Shinobi','https://ocremix.org/game/82/revenge-of-shinobi-gen');
+INSERT INTO "game" VALUES(83,'Parasite Eve','https://ocremix.org/game/83/parasite-eve-ps1');
+INSERT INTO "game" VALUES(84,'Super Mario RPG: Legend of the Seven Stars','https://ocremix.org/game/84/super-mario-rpg-legend-of-the-seven-stars-snes');
+INSERT INTO "game" VALUES(85,'Lemmings','https://ocremix.org/game/85/lemmings-c64');
+INSERT INTO "game" VALUES(88,'Frogger','https://ocremix.org/game/88/frogger-arc');
+INSERT INTO "game" VALUES(89,'F-Zero','https://ocremix.org/game/89/f-zero-snes');
+INSERT INTO "game" VALUES(90,'Golden Axe','https://ocremix.org/game/90/golden-axe-gen');
+INSERT INTO "game" VALUES(91,'Gradius','https://ocremix.org/game/91/gradius-nes');
+INSERT INTO "game" VALUES(92,'The King of Fighters ''98: The Slugfest','https://ocremix.org/game/92/king-of-fighters-98-the-slugfest-ng');
+INSERT INTO "game" VALUES(93,'Phantasy Star','https://ocremix.org/game/93/phantasy-star-sms');
+INSERT INTO "game" VALUES(94,'Phantasy Star II','https://ocremix.org/game/94/phantasy-star-ii-gen');
+INSERT INTO "game" VALUES(95,'Phantasy Star III: Generations of Doom','https://ocremix.org/game/95/phantasy-star-iii-generations-of-doom-gen');
+INSERT INTO "game" VALUES(96,'Phantasy Star IV: The End of the Millennium','https://ocremix.org/game/96/phantasy-star-iv-the-end-of-the-millennium-gen');
+INSERT INTO "game" VALUES(97,'Space Harrier','https://ocremix.org/game/97/space-harrier-sms');
+INSERT INTO "game" VALUES(98,'Super Mario World','https://ocremix.org/game/98/super-mario-world-snes');
+INSERT INTO "game" VALUES(99,'ToeJam & Earl','https://ocremix.org/game/99/toejam-and-earl-gen');
+INSERT INTO "game" VALUES(100,'Space Harrier II','https://ocremix.org/game/100/space-harrier-ii-gen');
+INSERT INTO "game" VALUES(101,'Tetris','https://ocremix.org/game/101/tetris-nes');
+INSERT INTO "game" VALUES(102,'Wizards & Warriors','https://ocremix.org/game/102/wizards-and-warriors-nes');
+INSERT INTO "game" VALUES(104,'Castlevania','https://ocremix.org/game/104/castlevania-n64');
+INSERT INTO "game" VALUES(105,'Castlevania: Symphony of the Night','https://ocremix.org/game/105/castlevania-symphony-of-the-night-ps1');
+INSERT INTO "game" VALUES(107,'Deflektor','https://ocremix.org/game/107/deflektor-c64');
+INSERT INTO "game" VALUES(108,'Diablo','https://ocremix.org/game/108/diablo-win');
+INSERT INTO "game" VALUES(109,'Diablo II','https://ocremix.org/game/109/diablo-ii-win');
+INSERT INTO "game" VALUES(112,'Akumajo Dracula X: Rondo of Blood','https://ocremix.org/game/112/akumajo-dracula-x-rondo-of-blood-tgcd');
+INSERT INTO "game" VALUES(114,'Faxanadu','https://ocremix.org/game/114/faxanadu-nes');
+INSERT INTO "game" VALUES(115,'Final Fantasy Adventure','https://ocremix.org/game/115/final-fantasy-adventure-gb');
+INSERT INTO "game" VALUES(116,'Final Fantasy Legend II','https://ocremix.org/game/116/final-fantasy-legend-ii-gb');
+INSERT INTO "game" VALUES(118,'Ghouls''n Ghosts','https://ocremix.org/game/118/ghoulsn-ghosts-gen');
+INSERT INTO "game" VALUES(119,'Ghosts''n Goblins','https://ocremix.org/game/119/ghostsn-goblins-nes');
+INSERT INTO "game" VALUES(120,'GoldenEye 007','https://ocremix.org/game/120/goldeneye-007-n64');
+INSERT INTO "game" VALUES(121,'Kid Icarus','https://ocremix.org/game/121/kid-icarus-nes');
+INSERT INTO "game" VALUES(122,'Killer Instinct','https://ocremix.org/game/122/killer-instinct-snes');
+INSERT INTO "game" VALUES(123,'The Killing Game Show','https://ocremix.org/game/123/killing-game-show-amiga');
+INSERT INTO "game" VALUES(124,'Little Nemo: The Dream Master','https://ocremix.org/game/124/little-nemo-the-dream-master-nes');
+INSERT INTO "game" VALUES(125,'Maniac Mansion','https://ocremix.org/game/125/maniac-mansion-nes');
+INSERT INTO "game" VALUES(126,'Mario Paint','https://ocremix.org/game/126/mario-paint-snes');
+INSERT INTO "game" VALUES(128,'Star Fox','https://ocremix.org/game/128/star-fox-snes');
+INSERT INTO "game" VALUES(129,'StarTropics','https://ocremix.org/game/129/startropics-nes');
+INSERT INTO "game" VALUES(130,'Spy vs. Spy','https://ocremix.org/game/130/spy-vs-spy-nes');
+INSERT INTO "game" VALUES(131,'Ristar','https://ocremix.org/game/131/ristar-gen');
+INSERT INTO "game" VALUES(132,'M.C. Kids','https://ocremix.org/game/132/mc-kids-nes');
+INSERT INTO "game" VALUES(134,'Ninja Gaiden','https://ocremix.org/game/134/ninja-gaiden-nes');
+INSERT INTO "game" VALUES(135,'Ninja Gaiden II: The Dark Sword of Chaos','https://ocremix.org/game/135/ninja-gaiden-ii-the-dark-sword-of-chaos-nes');
+INSERT INTO "game" VALUES(136,'NiGHTS into dreams...','https://ocremix.org/game/136/nights-into-dreams-sat');
+INSERT INTO "game" VALUES(137,'Moon Patrol','https://ocremix.org/game/137/moon-patrol-arc');
+INSERT INTO "game" VALUES(138,'Mega Man X','https://ocremix.org/game/138/mega-man-x-snes');
+INSERT INTO "game" VALUES(139,'OutRun','https://ocremix.org/game/139/outrun-arc');
+INSERT INTO "game" VALUES(140,'Metal Gear','https://ocremix.org/game/140/metal-gear-nes');
+INSERT INTO "game" VALUES(141,'Punch-Out!!','https://ocremix.org/game/141/punch-out-nes');
+INSERT INTO "game" VALUES(142,'Pac-Man','https://ocremix.org/game/142/pac-man-arc');
+INSERT INTO "game" VALUES(143,'Super Street Fighter II: The New Challengers','https://ocremix.org/game/143/super-street-fighter-ii-the-new-challengers-snes');
+INSERT INTO "game" VALUES(144,'Top Gear','https://ocremix.org/game/144/top-gear-snes');
+INSERT INTO "game" VALUES(145,'Super Mario Land','https://ocremix.org/game/145/super-mario-land-gb');
+INSERT INTO "game" VALUES(146,'Sonic CD','https://ocremix.org/game/146/sonic-cd-scd');
+INSERT INTO "game" VALUES(147,'Sonic & Knuckles','https://ocremix.org/game/147/sonic-and-knuckles-gen');
+INSERT INTO "game" VALUES(148,'Shenmue','https://ocremix.org/game/148/shenmue-dc');
+INSERT INTO "game" VALUES(149,'Seiken Densetsu 3','https://ocremix.org/game/149/seiken-densetsu-3-snes');
+INSERT INTO "game" VALUES(150,'Rygar','https://ocremix.org/game/150/rygar-nes');
+INSERT INTO "game" VALUES(151,'Shadow of the Beast','https://ocremix.org/game/151/shadow-of-the-beast-amiga');
+INSERT INTO "game" VALUES(152,'Shadowgate','https://ocremix.org/game/152/shadowgate-nes');
+INSERT INTO "game" VALUES(153,'Gun.Smoke','https://ocremix.org/game/153/gunsmoke-nes');
+INSERT INTO "game" VALUES(154,'Journey to Silius','https://ocremix.org/game/154/journey-to-silius-nes');
+INSERT INTO "game" VALUES(156,'Lufia & The Fortress of Doom','https://ocremix.org/game/156/lufia-and-the-fortress-of-doom-snes');
+INSERT INTO "game" VALUES(157,'Lufia II: Rise of the Sinistrals','https://ocremix.org/game/157/lufia-ii-rise-of-the-sinistrals-snes');
+INSERT INTO "game" VALUES(158,'Sonic 3D Blast','https://ocremix.org/game/158/sonic-3d-blast-sat');
+INSERT INTO "game" VALUES(159,'Christmas NiGHTS into dreams...','https://ocremix.org/game/159/christmas-nights-into-dreams-sat');
+INSERT INTO "game" VALUES(160,'Mega Man 8','https://ocremix.org/game/160/mega-man-8-ps1');
+INSERT INTO "game" VALUES(161,'The Legend of the Mystical Ninja','https://ocremix.org/game/161/legend-of-the-mystical-ninja-snes');
+INSERT INTO "game" VALUES(162,'Panzer Dragoon','https://ocremix.org/game/162/panzer-dragoon-sat');
+INSERT INTO "game" VALUES(164,'M.U.S.H.A.','https://ocremix.org/game/164/musha-gen');
+INSERT INTO "game" VALUES(165,'Shadow of the Beast II','https://ocremix.org/game/165/shadow-of-the-beast-ii-amiga');
+INSERT INTO "game" VALUES(166,'Shadow of the Beast III','https://ocremix.org/game/166/shadow-of-the-beast-iii-amiga');
+INSERT INTO "game" VALUES(167,'Quartet','https://ocremix.org/game/167/quartet-sms');
+INSERT INTO "game" VALUES(168,'Soul Blade','https://ocremix.org/game/168/soul-blade-ps1');
+INSERT INTO "game" VALUES(169,'Super Star Soldier','https://ocremix.org/game/169/super-star-soldier-tg16');
+INSERT INTO "game" VALUES(170,'Gaiares','https://ocremix.org/game/170/gaiares-gen');
+INSERT INTO "game" VALUES(171,'Super R-Type','https://ocremix.org/game/171/super-r-type-snes');
+INSERT INTO "game" VALUES(172,'Icewind Dale','https://ocremix.org/game/172/icewind-dale-win');
+INSERT INTO "game" VALUES(173,'VectorMan','https://ocremix.org/game/173/vectorman-gen');
+INSERT INTO "game" VALUES(174,'Valis III','https://ocremix.org/game/174/valis-iii-gen');
+INSERT INTO "game" VALUES(175,'Herzog Zwei','https://ocremix.org/game/175/herzog-zwei-gen');
+INSERT INTO "game" VALUES(177,'Mega Man X3','https://ocremix.org/game/177/mega-man-x3-snes');
+INSERT INTO "game" VALUES(178,'Gauntlet','https://ocremix.org/game/178/gauntlet-nes');
+INSERT INTO "game" VALUES(180,'Ultraman 2: Shutsugeki Katoku Tai','https://ocremix.org/game/180/ultraman-2-shutsugeki-katoku-tai-nes');
+INSERT INTO "game" VALUES(181,'Rolling Thunder','https://ocremix.org/game/181/rolling-thunder-arc');
+INSERT INTO "game" VALUES(182,'Bust a Groove','https://ocremix.org/game/182/bust-a-groove-ps1');
+INSERT INTO "game" VALUES(184,'Cybernoid II: The Revenge','https://ocremix.org/game/184/cybernoid-ii-the-revenge-c64');
+INSERT INTO "game" VALUES(185,'Deadly Towers','https://ocremix.org/game/185/deadly-towers-nes');
+INSERT INTO "game" VALUES(186,'Dig Dug','https://ocremix.org/game/186/dig-dug-arc');
+INSERT INTO "game" VALUES(187,'Dr. Robotnik''s Mean Bean Machine','https://ocremix.org/game/187/dr-robotniks-mean-bean-machine-gen');
+INSERT INTO "game" VALUES(188,'Dune','https://ocremix.org/game/188/dune-dos');
+INSERT INTO "game" VALUES(189,'Earthworm Jim 2','https://ocremix.org/game/189/earthworm-jim-2-gen');
+INSERT INTO "game" VALUES(190,'F-Zero: Maximum Velocity','https://ocremix.org/game/190/f-zero-maximum-velocity-gba');
+INSERT INTO "game" VALUES(191,'Fury of the Furries','https://ocremix.org/game/191/fury-of-the-furries-dos');
+INSERT INTO "game" VALUES(194,'The Great Giana Sisters','https://ocremix.org/game/194/great-giana-sisters-c64');
+INSERT INTO "game" VALUES(195,'The Guardian Legend','https://ocremix.org/game/195/guardian-legend-nes');
+INSERT INTO "game" VALUES(196,'Heroes of Might and Magic II: The Succession Wars','https://ocremix.org/game/196/heroes-of-might-and-magic-ii-the-succession-wars-win');
+INSERT INTO "game" VALUES(197,'Jurassic Park','https://ocremix.org/game/197/jurassic-park-nes');
+INSERT INTO "game" VALUES(198,'Jurassic Park','https://ocremix.org/game/198/jurassic-park-gen');
+INSERT INTO "game" VALUES(199,'Kirby Super Star','https://ocremix.org/game/199/kirby-super-star-snes');
+INSERT INTO "game" VALUES(200,'Kung Fu','https://ocremix.org/game/200/kung-fu-nes');
+INSERT INTO "game" VALUES(201,'MechWarrior 2: Mercenaries','https://ocremix.org/game/201/mechwarrior-2-mercenaries-win');
+INSERT INTO "game" VALUES(202,'Metroid II: Return of Samus','https://ocremix.org/game/202/metroid-ii-return-of-samus-gb');
+INSERT INTO "game" VALUES(204,'Obliterator','https://ocremix.org/game/204/obliterator-amiga');
+INSERT INTO "game" VALUES(205,'Ork','https://ocremix.org/game/205/ork-amiga');
+INSERT INTO "game" VALUES(206,'Paperboy','https://ocremix.org/game/206/paperboy-c64');
+INSERT INTO "game" VALUES(207,'Pilotwings 64','https://ocremix.org/game/207/pilotwings-64-n64');
+INSERT INTO "game" VALUES(209,'Princess Tomato in the Salad Kingdom','https://ocremix.org/game/209/princess-tomato-in-the-salad-kingdom-nes');
+INSERT INTO "game" VALUES(211,'Resident Evil 2','https://ocremix.org/game/211/resident-evil-2-ps1');
+INSERT INTO "game" VALUES(212,'The Secret of Monkey Island','https://ocremix.org/game/212/secret-of-monkey-island-dos');
+INSERT INTO "game" VALUES(216,'Skate or Die','https://ocremix.org/game/216/skate-or-die-nes');
+INSERT INTO "game" VALUES(217,'Sonic Adventure','https://ocremix.org/game/217/sonic-adventure-dc');
+INSERT INTO "game" VALUES(218,'Sonic Crackers','https://ocremix.org/game/218/sonic-crackers-gen');
+INSERT INTO "game" VALUES(219,'Speedball','https://ocremix.org/game/219/speedball-amiga');
+INSERT INTO "game" VALUES(220,'StarCraft','https://ocremix.org/game/220/starcraft-win');
+INSERT INTO "game" VALUES(221,'Stormlord','https://ocremix.org/game/221/stormlord-amiga');
+INSERT INTO "game" VALUES(222,'Super Ghouls''n Ghosts','https://ocremix.org/game/222/super-ghoulsn-ghosts-snes');
+INSERT INTO "game" VALUES(223,'Tales of Phantasia','https://ocremix.org/game/223/tales-of-phantasia-snes');
+INSERT INTO "game" VALUES(224,'Teenage Mutant Ninja Turtles','https://ocremix.org/game/224/teenage-mutant-ninja-turtles-nes');
+INSERT INTO "game" VALUES(225,'Top Gear 3000','https://ocremix.org/game/225/top-gear-3000-snes');
+INSERT INTO "game" VALUES(226,'Turok 2: Seeds of Evil','https://ocremix.org/game/226/turok-2-seeds-of-evil-n64');
+INSERT INTO "game" VALUES(227,'Turrican II: The Final Fight','https://ocremix.org/game/227/turrican-ii-the-final-fight-amiga');
+INSERT INTO "game" VALUES(228,'Ultima IV: Quest of the Avatar','https://ocremix.org/game/228/ultima-iv-quest-of-the-avatar-dos');
+INSERT INTO "game" VALUES(229,'Vortex','https://ocremix.org/game/229/vortex-snes');
+INSERT INTO "game" VALUES(230,'Wild Arms','https://ocremix.org/game/230/wild-arms-ps1');
+INSERT INTO "game" VALUES(231,'William Wobbler','https://ocremix.org/game/231/william-wobbler-c64');
+INSERT INTO "game" VALUES(232,'Wizball','https://ocremix.org/game/232/wizball-c64');
+INSERT INTO "game" VALUES(234,'Kirby''s Dream Land','https://ocremix.org/game/234/kirbys-dream-land-gb');
+INSERT INTO "game" VALUES(235,'Super Thunder Blade','https://ocremix.org/game/235/super-thunder-blade-gen');
+INSERT INTO "game" VALUES(236,'Sword of Vermilion','https://ocremix.org/game/236/sword-of-vermilion-gen');
+INSERT INTO "game" VALUES(237,'Life Force','https://ocremix.org/game/237/life-force-nes');
+INSERT INTO "game" VALUES(238,'Street Fighter III: 3rd Strike: Fight for the Future','https://ocremix.org/game/238/street-fighter-iii-3rd-strike-fight-for-the-future-arc');
+INSERT INTO "game" VALUES(239,'Knuckles'' Chaotix','https://ocremix.org/game/239/knuckles-chaotix-32x');
+INSERT INTO "game" VALUES(240,'Dragonseeds','https://ocremix.org/game/240/dragonseeds-ps1');
+INSERT INTO "game" VALUES(241,'Final Fantasy II','https://ocremix.org/game/241/final-fantasy-ii-nes');
+INSERT INTO "game" VALUES(242,'River City Ransom','https://ocremix.org/game/242/river-city-ransom-nes');
+INSERT INTO "game" VALUES(243,'Pulseman','https://ocremix.org/game/243/pulseman-gen');
+INSERT INTO "game" VALUES(245,'Suikoden II','https://ocremix.org/game/245/suikoden-ii-ps1');
+INSERT INTO "game" VALUES(246,'Battletoads','https://ocremix.org/game/246/battletoads-gb');
+INSERT INTO "game" VALUES(247,'Green Beret','https://ocremix.org/game/247/green-beret-c64');
+INSERT INTO "game" VALUES(248,'Soul Blazer','https://ocremix.org/game/248/soul-blazer-snes');
+INSERT INTO "game" VALUES(249,'The Combatribes','https://ocremix.org/game/249/combatribes-arc');
+INSERT INTO "game" VALUES(250,'Lagoon','https://ocremix.org/game/250/lagoon-snes');
+INSERT INTO "game" VALUES(251,'Sonic 3D Blast','https://ocremix.org/game/251/sonic-3d-blast-gen');
+INSERT INTO "game" VALUES(252,'Perfect Dark','https://ocremix.org/game/252/perfect-dark-n64');
+INSERT INTO "game" VALUES(253,'Tinhead','https://ocremix.org/game/253/tinhead-gen');
+INSERT INTO "game" VALUES(254,'Mega Man: The Wily Wars','https://ocremix.org/game/254/mega-man-the-wily-wars-gen');
+INSERT INTO "game" VALUES(255,'Mega Man X4','https://ocremix.org/game/255/mega-man-x4-ps1');
+INSERT INTO "game" VALUES(256,'Zillion','https://ocremix.org/game/256/zillion-sms');
+INSERT INTO "game" VALUES(257,'Terranigma','https://ocremix.org/game/257/terranigma-snes');
+INSERT INTO "game" VALUES(258,'Gunstar Heroes','https://ocremix.org/game/258/gunstar-heroes-gen');
+INSERT INTO "game" VALUES(259,'Breath of Fire','https://ocremix.org/game/259/breath-of-fire-snes');
+INSERT INTO "game" VALUES(260,'Marvel Super Heroes vs. Street Fighter','https://ocremix.org/game/260/marvel-super-heroes-vs-street-fighter-arc');
+INSERT INTO "game" VALUES(261,'M&M''s Minis Madness','https://ocremix.org/game/261/mandms-minis-madness-gbc');
+INSERT INTO "game" VALUES(262,'The Longest Journey','https://ocremix.org/game/262/longest-journey-win');
+INSERT INTO "game" VALUES(263,'RoboCop','https://ocremix.org/game/263/robocop-cpc');
+INSERT INTO "game" VALUES(264,'Mario Kart 64','https://ocremix.org/game/264/mario-kart-64-n64');
+INSERT INTO "game" VALUES(265,'Tempest 2000','https://ocremix.org/game/265/tempest-2000-jag');
+INSERT INTO "game" VALUES(266,'Jackal','https://ocremix.org/game/266/jackal-nes');
+INSERT INTO "game" VALUES(267,'Tecmo Cup','https://ocremix.org/game/267/tecmo-cup-nes');
+INSERT INTO "game" VALUES(268,'Jurassic Park','https://ocremix.org/game/268/jurassic-park-snes');
+INSERT INTO "game" VALUES(269,'Super Mario Kart','https://ocremix.org/game/269/super-mario-kart-snes');
+INSERT INTO "game" VALUES(270,'Metal Gear Solid 2: Sons of Liberty','https://ocremix.org/game/270/metal-gear-solid-2-sons-of-liberty-ps2');
+INSERT INTO "game" VALUES(271,'Rez','https://ocremix.org/game/271/rez-dc');
+INSERT INTO "game" VALUES(272,'Phantasy Star Online','https://ocremix.org/game/272/phantasy-star-online-dc');
+INSERT INTO "game" VALUES(273,'Street Fighter EX plus α','https://ocremix.org/game/273/street-fighter-ex-plus-ps1');
+INSERT INTO "game" VALUES(274,'Fear Effect','https://ocremix.org/game/274/fear-effect-ps1');
+INSERT INTO "game" VALUES(275,'Brave Fencer Musashi','https://ocremix.org/game/275/brave-fencer-musashi-ps1');
+INSERT INTO "game" VALUES(276,'Kabuki: Quantum Fighter','https://ocremix.org/game/276/kabuki-quantum-fighter-nes');
+INSERT INTO "game" VALUES(277,'Sonic Adventure 2','https://ocremix.org/game/277/sonic-adventure-2-dc');
+INSERT INTO "game" VALUES(279,'Final Fantasy Tactics','https://ocremix.org/game/279/final-fantasy-tactics-ps1');
+INSERT INTO "game" VALUES(280,'Castlevania III: Dracula''s Curse','https://ocremix.org/game/280/castlevania-iii-draculas-curse-nes');
+INSERT INTO "game" VALUES(281,'Skies of Arcadia','https://ocremix.org/game/281/skies-of-arcadia-dc');
+INSERT INTO "game" VALUES(282,'Crystalis','https://ocremix.org/game/282/crystalis-nes');
+INSERT INTO "game" VALUES(283,'Star Ocean: The Second Story','https://ocremix.org/game/283/star-ocean-the-second-story-ps1');
+INSERT INTO "game" VALUES(285,'Mach Rider','https://ocremix.org/game/285/mach-rider-nes');
+INSERT INTO "game" VALUES(286,'Marble Madness','https://ocremix.org/game/286/marble-madness-nes');
+INSERT INTO "game" VALUES(287,'Mobile Suit Gundam Wing: Endless Duel','https://ocremix.org/game/287/mobile-suit-gundam-wing-endless-duel-snes');
+INSERT INTO "game" VALUES(288,'Magical Drop III','https://ocremix.org/game/288/magical-drop-iii-ng');
+INSERT INTO "game" VALUES(289,'U.N. Squadron','https://ocremix.org/game/289/un-squadron-snes');
+INSERT INTO "game" VALUES(290,'Barbie Super Model','https://ocremix.org/game/290/barbie-super-model-snes');
+INSERT INTO "game" VALUES(291,'Castlevania: Circle of the Moon','https://ocremix.org/game/291/castlevania-circle-of-the-moon-gba');
+INSERT INTO "game" VALUES(292,'Demon''s Crest','https://ocremix.org/game/292/demons-crest-snes');
+INSERT INTO "game" VALUES(293,'Astérix & Obélix','https://ocremix.org/game/293/asterix-and-obelix-snes');
+INSERT INTO "game" VALUES(295,'Hang-On','https://ocremix.org/game/295/hang-on-sms');
+INSERT INTO "game" VALUES(296,'Mega Man 5','https://ocremix.org/game/296/mega-man-5-nes');
+INSERT INTO "game" VALUES(297,'The King of Fighters ''96','https://ocremix.org/game/297/king-of-fighters-96-ng');
+INSERT INTO "game" VALUES(298,'Plok','https://ocremix.org/game/298/plok-snes');
+INSERT INTO "game" VALUES(300,'Lotus II','https://ocremix.org/game/300/lotus-ii-gen');
+INSERT INTO "game" VALUES(301,'Lunar: Eternal Blue','https://ocremix.org/game/301/lunar-eternal-blue-scd');
+INSERT INTO "game" VALUES(302,'Monkey Island 2: LeChuck''s Revenge','https://ocremix.org/game/302/monkey-island-2-lechucks-revenge-dos');
+INSERT INTO "game" VALUES(303,'Tom Clancy''s Rainbow Six: Rogue Spear','https://ocremix.org/game/303/tom-clancys-rainbow-six-rogue-spear-win');
+INSERT INTO "game" VALUES(304,'The Adventures of Bayou Billy','https://ocremix.org/game/304/adventures-of-bayou-billy-nes');
+INSERT INTO "game" VALUES(305,'Luigi''s Mansion','https://ocremix.org/game/305/luigis-mansion-gcn');
+INSERT INTO "game" VALUES(306,'Ultima VI: The False Prophet','https://ocremix.org/game/306/ultima-vi-the-false-prophet-dos');
+INSERT INTO "game" VALUES(307,'One Must Fall 2097','https://ocremix.org/game/307/one-must-fall-2097-dos');
+INSERT INTO "game" VALUES(308,'Rockman & Forte','https://ocremix.org/game/308/rockman-and-forte-snes');
+INSERT INTO "game" VALUES(309,'Ultima Online','https://ocremix.org/game/309/ultima-online-win');
+INSERT INTO "game" VALUES(310,'Donkey Kong Country 3: Dixie Kong''s Double Trouble!','https://ocremix.org/game/310/donkey-kong-country-3-dixie-kongs-double-trouble-snes');
+INSERT INTO "game" VALUES(311,'Friday the 13th','https://ocremix.org/game/311/friday-the-13th-nes');
+INSERT INTO "game" VALUES(312,'Legendary Wings','https://ocremix.org/game/312/legendary-wings-nes');
+INSERT INTO "game" VALUES(313,'Dragon Warrior III','https://ocremix.org/game/313/dragon-warrior-iii-nes');
+INSERT INTO "game" VALUES(314,'IronSword: Wizards & Warriors II','https://ocremix.org/game/314/ironsword-wizards-and-warriors-ii-nes');
+INSERT INTO "game" VALUES(315,'Lightening Force: Quest for the Darkstar','https://ocremix.org/game/315/lightening-force-quest-for-the-darkstar-gen');
+INSERT INTO "game" VALUES(316,'Suikoden','https://ocremix.org/game/316/suikoden-ps1');
+INSERT INTO "game" VALUES(317,'Columns','https://ocremix.org/game/317/columns-gen');
+INSERT INTO "game" VALUES(318,'Double Dragon','https://ocremix.org/game/318/double-dragon-nes');
+INSERT INTO "game" VALUES(319,'Wizardry','https://ocremix.org/game/319/wizardry-c64');
+INSERT INTO "game" VALUES(320,'Dark Cloud','https://ocremix.org/game/320/dark-cloud-ps2');
+INSERT INTO "game" VALUES(321,'Mega Man 6','https://ocremix.org/game/321/mega-man-6-nes');
+INSERT INTO "game" VALUES(322,'Tomb Raider','https://ocremix.org/game/322/tomb-raider-ps1');
+INSERT INTO "game" VALUES(323,'Raiden Trad','https://ocremix.org/game/323/raiden-trad-snes');
+INSERT INTO "game" VALUES(324,'The Elder Scrolls III: Morrowind','https://ocremix.org/game/324/elder-scrolls-iii-morrowind-xbox');
+INSERT INTO "game" VALUES(325,'David Crane''s A Boy and His Blob: Trouble on Blobolonia','https://ocremix.org/game/325/david-cranes-a-boy-and-his-blob-trouble-on-blobolonia-nes');
+INSERT INTO "game" VALUES(326,'Tekken 2','https://ocremix.org/game/326/tekken-2-ps1');
+INSERT INTO "game" VALUES(327,'Battletoads & Double Dragon: The Ultimate Team','https://ocremix.org/game/327/battletoads-and-double-dragon-the-ultimate-team-gen');
+INSERT INTO "game" VALUES(328,'Metal Gear Solid','https://ocremix.org/game/328/metal-gear-solid-ps1');
+INSERT INTO "game" VALUES(329,'Illusion of Gaia','https://ocremix.org/game/329/illusion-of-gaia-snes');
+INSERT INTO "game" VALUES(330,'Ogre Battle: The March of the Black Queen','https://ocremix.org/game/330/ogre-battle-the-march-of-the-black-queen-snes');
+INSERT INTO "game" VALUES(331,'SaGa Frontier','https://ocremix.org/game/331/saga-frontier-ps1');
+INSERT INTO "game" VALUES(332,'Final Fantasy Mystic Quest','https://ocremix.org/game/332/final-fantasy-mystic-quest-snes');
+INSERT INTO "game" VALUES(333,'The Last Blade 2','https://ocremix.org/game/333/last-blade-2-ng');
+INSERT INTO "game" VALUES(334,'Lotus Turbo Challenge 2','https://ocremix.org/game/334/lotus-turbo-challenge-2-amiga');
+INSERT INTO "game" VALUES(336,'Sanxion','https://ocremix.org/game/336/sanxion-c64');
+INSERT INTO "game" VALUES(337,'Stunt Race FX','https://ocremix.org/game/337/stunt-race-fx-snes');
+INSERT INTO "game" VALUES(338,'Red Alarm','https://ocremix.org/game/338/red-alarm-vb');
+INSERT INTO "game" VALUES(340,'Bahamut Lagoon','https://ocremix.org/game/340/bahamut-lagoon-snes');
+INSERT INTO "game" VALUES(341,'Castlevania: The Adventure','https://ocremix.org/game/341/castlevania-the-adventure-gb');
+INSERT INTO "game" VALUES(342,'The Legend of Kyrandia','https://ocremix.org/game/342/legend-of-kyrandia-dos');
+INSERT INTO "game" VALUES(343,'Streets of Rage 3','https://ocremix.org/game/343/streets-of-rage-3-gen');
+INSERT INTO "game" VALUES(344,'Zombies Ate My Neighbors','https://ocremix.org/game/344/zombies-ate-my-neighbors-snes');
+INSERT INTO "game" VALUES(345,'Einhänder','https://ocremix.org/game/345/einhander-ps1');
+INSERT INTO "game" VALUES(346,'Alisia Dragoon','https://ocremix.org/game/346/alisia-dragoon-gen');
+INSERT INTO "game" VALUES(347,'Super Hang-On','https://ocremix.org/game/347/super-hang-on-gen');
+INSERT INTO "game" VALUES(348,'Final Fight CD','https://ocremix.org/game/348/final-fight-cd-scd');
+INSERT INTO "game" VALUES(349,'Breath of Fire II','https://ocremix.org/game/349/breath-of-fire-ii-snes');
+INSERT INTO "game" VALUES(350,'Crazy Comets','https://ocremix.org/game/350/crazy-comets-c64');
+INSERT INTO "game" VALUES(351,'Star Control II','https://ocremix.org/game/351/star-control-ii-dos');
+INSERT INTO "game" VALUES(352,'Socket','https://ocremix.org/game/352/socket-gen');
+INSERT INTO "game" VALUES(353,'Shinobi III: Return of the Ninja Master','https://ocremix.org/game/353/shinobi-iii-return-of-the-ninja-master-gen');
+INSERT INTO "game" VALUES(354,'Panzer Dragoon Orta','https://ocremix.org/game/354/panzer-dragoon-orta-xbox');
+INSERT INTO "game" VALUES(355,'E.V.O.: Search for Eden','https://ocremix.org/game/355/evo-search-for-eden-snes');
+INSERT INTO "game" VALUES(356,'Darkwing Duck','https://ocremix.org/game/356/darkwing-duck-nes');
+INSERT INTO "game" VALUES(357,'Wolfenstein 3D','https://ocremix.org/game/357/wolfenstein-3d-dos');
+INSERT INTO "game" VALUES(358,'Tyrian','https://ocremix.org/game/358/tyrian-dos');
+INSERT INTO "game" VALUES(359,'Mouryou Senki Madara','https://ocremix.org/game/359/mouryou-senki-madara-nes');
+INSERT INTO "game" VALUES(360,'Delta','https://ocremix.org/game/360/delta-c64');
+INSERT INTO "game" VALUES(361,'Treasure Hunter G','https://ocremix.org/game/361/treasure-hunter-g-snes');
+INSERT INTO "game" VALUES(362,'Ecco: The Tides of Time','https://ocremix.org/game/362/ecco-the-tides-of-time-scd');
+INSERT INTO "game" VALUES(363,'Cool Spot','https://ocremix.org/game/363/cool-spot-snes');
+INSERT INTO "game" VALUES(364,'Ecco: The Tides of Time','https://ocremix.org/game/364/ecco-the-tides-of-time-gg');
+INSERT INTO "game" VALUES(365,'F-Zero X Expansion Kit','https://ocremix.org/game/365/f-zero-x-expansion-kit-n64');
+INSERT INTO "game" VALUES(366,'Terminator 2: Judgment Day','https://ocremix.org/game/366/terminator-2-judgment-day-nes');
+INSERT INTO "game" VALUES(367,'The King of Fighters 2000','https://ocremix.org/game/367/king-of-fighters-2000-ng');
+INSERT INTO "game" VALUES(369,'Shining Force III','https://ocremix.org/game/369/shining-force-iii-sat');
+INSERT INTO "game" VALUES(370,'Flashback: The Quest for Identity','https://ocremix.org/game/370/flashback-the-quest-for-identity-gen');
+INSERT INTO "game" VALUES(372,'Ico','https://ocremix.org/game/372/ico-ps2');
+INSERT INTO "game" VALUES(373,'Command & Conquer: Tiberian Sun','https://ocremix.org/game/373/command-and-conquer-tiberian-sun-win');
+INSERT INTO "game" VALUES(374,'The Last Ninja','https://ocremix.org/game/374/last-ninja-c64');
+INSERT INTO "game" VALUES(375,'Hitman: Codename 47','https://ocremix.org/game/375/hitman-codename-47-win');
+INSERT INTO "game" VALUES(376,'Star Ocean','https://ocremix.org/game/376/star-ocean-snes');
+INSERT INTO "game" VALUES(377,'The Legend of Zelda: The Wind Waker','https://ocremix.org/game/377/legend-of-zelda-the-wind-waker-gcn');
+INSERT INTO "game" VALUES(378,'Darius','https://ocremix.org/game/378/darius-arc');
+INSERT INTO "game" VALUES(379,'Samurai Warrior: The Battles of Usagi Yojimbo','https://ocremix.org/game/379/samurai-warrior-the-battles-of-usagi-yojimbo-c64');
+INSERT INTO "game" VALUES(380,'Dance Dance Revolution 4th Mix','https://ocremix.org/game/380/dance-dance-revolution-4th-mix-arc');
+INSERT INTO "game" VALUES(381,'Street Fighter Alpha 2','https://ocremix.org/game/381/street-fighter-alpha-2-ps1');
+INSERT INTO "game" VALUES(382,'Final Doom','https://ocremix.org/game/382/final-doom-dos');
+INSERT INTO "game" VALUES(383,'Sonic the Hedgehog 2','https://ocremix.org/game/383/sonic-the-hedgehog-2-sms');
+INSERT INTO "game" VALUES(384,'The Battle of Olympus','https://ocremix.org/game/384/battle-of-olympus-nes');
+INSERT INTO "game" VALUES(385,'Great Greed','https://ocremix.org/game/385/great-greed-gb');
+INSERT INTO "game" VALUES(386,'Astérix','https://ocremix.org/game/386/asterix-nes');
+INSERT INTO "game" VALUES(387,'Puzzle Bobble','https://ocremix.org/game/387/puzzle-bobble-ngcd');
+INSERT INTO "game" VALUES(388,'Sorcerian','https://ocremix.org/game/388/sorcerian-dos');
+INSERT INTO "game" VALUES(389,'Extreme-G','https://ocremix.org/game/389/extreme-g-n64');
+INSERT INTO "game" VALUES(390,'Terminal Velocity','https://ocremix.org/game/390/terminal-velocity-dos');
+INSERT INTO "game" VALUES(391,'Teenage Mutant Ninja Turtles III: The Manhattan Project','https://ocremix.org/game/391/teenage-mutant-ninja-turtles-iii-the-manhattan-project-nes');
+INSERT INTO "game" VALUES(392,'Jet Grind Radio','https://ocremix.org/game/392/jet-grind-radio-dc');
+INSERT INTO "game" VALUES(393,'Halo: Combat Evolved','https://ocremix.org/game/393/halo-combat-evolved-xbox');
+INSERT INTO "game" VALUES(395,'Rush''n Attack','https://ocremix.org/game/395/rushn-attack-nes');
+INSERT INTO "game" VALUES(396,'Beatmania IIDX 7th Style','https://ocremix.org/game/396/beatmania-iidx-7th-style-arc');
+INSERT INTO "game" VALUES(397,'Slalom','https://ocremix.org/game/397/slalom-nes');
+INSERT INTO "game" VALUES(398,'Strider','https://ocremix.org/game/398/strider-gen');
+INSERT INTO "game" VALUES(399,'Ice Climber','https://ocremix.org/game/399/ice-climber-nes');
+INSERT INTO "game" VALUES(400,'Commander Keen IV: Secret of the Oracle','https://ocremix.org/game/400/commander-keen-iv-secret-of-the-oracle-dos');
+INSERT INTO "game" VALUES(401,'Beyond Good & Evil','https://ocremix.org/game/401/beyond-good-and-evil-win');
+INSERT INTO "game" VALUES(402,'F-Zero GX','https://ocremix.org/game/402/f-zero-gx-gcn');
+INSERT INTO "game" VALUES(403,'Adventure Island','https://ocremix.org/game/403/adventure-island-nes');
+INSERT INTO "game" VALUES(404,'Dragon View','https://ocremix.org/game/404/dragon-view-snes');
+INSERT INTO "game" VALUES(405,'Star Ocean: Blue Sphere','https://ocremix.org/game/405/star-ocean-blue-sphere-gbc');
+INSERT INTO "game" VALUES(406,'Lost Patrol','https://ocremix.org/game/406/lost-patrol-amiga');
+INSERT INTO "game" VALUES(407,'Laser Squad','https://ocremix.org/game/407/laser-squad-amiga');
+INSERT INTO "game" VALUES(408,'Submarine Attack','https://ocremix.org/game/408/submarine-attack-sms');
+INSERT INTO "game" VALUES(409,'Kingdom Hearts','https://ocremix.org/game/409/kingdom-hearts-ps2');
+INSERT INTO "game" VALUES(410,'Raiden II','https://ocremix.org/game/410/raiden-ii-arc');
+INSERT INTO "game" VALUES(411,'Shining Force','https://ocremix.org/game/411/shining-force-gen');
+INSERT INTO "game" VALUES(412,'Mega Man X2','https://ocremix.org/game/412/mega-man-x2-snes');
+INSERT INTO "game" VALUES(413,'Secret of Evermore','https://ocremix.org/game/413/secret-of-evermore-snes');
+INSERT INTO "game" VALUES(414,'Gargoyle''s Quest','https://ocremix.org/game/414/gargoyles-quest-gb');
+INSERT INTO "game" VALUES(415,'Ecco the Dolphin','https://ocremix.org/game/415/ecco-the-dolphin-scd');
+INSERT INTO "game" VALUES(416,'X-Out','https://ocremix.org/game/416/x-out-c64');
+INSERT INTO "game" VALUES(417,'Double Dragon II: The Revenge','https://ocremix.org/game/417/double-dragon-ii-the-revenge-nes');
+INSERT INTO "game" VALUES(418,'Sonic the Hedgehog: Triple Trouble','https://ocremix.org/game/418/sonic-the-hedgehog-triple-trouble-gg');
+INSERT INTO "game" VALUES(419,'Front Mission','https://ocremix.org/game/419/front-mission-snes');
+INSERT INTO "game" VALUES(420,'Lords of the Realm II','https://ocremix.org/game/420/lords-of-the-realm-ii-win');
+INSERT INTO "game" VALUES(421,'Teenage Mutant Ninja Turtles IV: Turtles in Time','https://ocremix.org/game/421/teenage-mutant-ninja-turtles-iv-turtles-in-time-snes');
+INSERT INTO "game" VALUES(422,'Dragon Warrior IV','https://ocremix.org/game/422/dragon-warrior-iv-nes');
+INSERT INTO "game" VALUES(423,'Dance Dance Revolution Solo 2000','https://ocremix.org/game/423/dance-dance-revolution-solo-2000-arc');
+INSERT INTO "game" VALUES(424,'Soukaigi','https://ocremix.org/game/424/soukaigi-ps1');
+INSERT INTO "game" VALUES(425,'Metroid Prime','https://ocremix.org/game/425/metroid-prime-gcn');
+INSERT INTO "game" VALUES(426,'Fire Emblem: Shadow Dragon and the Blade of Light','https://ocremix.org/game/426/fire-emblem-shadow-dragon-and-the-blade-of-light-nes');
+INSERT INTO "game" VALUES(427,'Akumajo Dracula','https://ocremix.org/game/427/akumajo-dracula-x68k');
+INSERT INTO "game" VALUES(428,'Shivers','https://ocremix.org/game/428/shivers-win');
+INSERT INTO "game" VALUES(429,'Crack Down','https://ocremix.org/game/429/crack-down-gen');
+INSERT INTO "game" VALUES(430,'Wing Commander','https://ocremix.org/game/430/wing-commander-dos');
+INSERT INTO "game" VALUES(431,'Super C','https://ocremix.org/game/431/super-c-nes');
+INSERT INTO "game" VALUES(432,'Shining in the Darkness','https://ocremix.org/game/432/shining-in-the-darkness-gen');
+INSERT INTO "game" VALUES(433,'Golden Sun','https://ocremix.org/game/433/golden-sun-gba');
+INSERT INTO "game" VALUES(434,'Mega Man Zero 2','https://ocremix.org/game/434/mega-man-zero-2-gba');
+INSERT INTO "game" VALUES(435,'Gauntlet III: The Final Quest','https://ocremix.org/game/435/gauntlet-iii-the-final-quest-c64');
+INSERT INTO "game" VALUES(436,'Road Rash','https://ocremix.org/game/436/road-rash-gen');
+INSERT INTO "game" VALUES(438,'Final Fantasy X-2','https://ocremix.org/game/438/final-fantasy-x-2-ps2');
+INSERT INTO "game" VALUES(439,'Double Dragon III: The Sacred Stones','https://ocremix.org/game/439/double-dragon-iii-the-sacred-stones-nes');
+INSERT INTO "game" VALUES(440,'Xenosaga: Episode I: Der Wille zur Macht','https://ocremix.org/game/440/xenosaga-episode-i-der-wille-zur-macht-ps2');
+INSERT INTO "game" VALUES(441,'Dizzy the Adventurer','https://ocremix.org/game/441/dizzy-the-adventurer-nes');
+INSERT INTO "game" VALUES(442,'Kirby''s Adventure','https://ocremix.org/game/442/kirbys-adventure-nes');
+INSERT INTO "game" VALUES(443,'Shatterhand','https://ocremix.org/game/443/shatterhand-nes');
+INSERT INTO "game" VALUES(444,'Marathon','https://ocremix.org/game/444/marathon-mac');
+INSERT INTO "game" VALUES(445,'Unreal Tournament','https://ocremix.org/game/445/unreal-tournament-win');
+INSERT INTO "game" VALUES(446,'Landstalker: The Treasures of King Nole','https://ocremix.org/game/446/landstalker-the-treasures-of-king-nole-gen');
+INSERT INTO "game" VALUES(447,'The Human Race','https://ocremix.org/game/447/human-race-c64');
+INSERT INTO "game" VALUES(448,'DarXide','https://ocremix.org/game/448/darxide-32x');
+INSERT INTO "game" VALUES(449,'Tsugunai: Atonement','https://ocremix.org/game/449/tsugunai-atonement-ps2');
+INSERT INTO "game" VALUES(450,'Artura','https://ocremix.org/game/450/artura-c64');
+INSERT INTO "game" VALUES(451,'Oddworld: Abe''s Oddysee','https://ocremix.org/game/451/oddworld-abes-oddysee-ps1');
+INSERT INTO "game" VALUES(452,'Solstice: The Quest for the Staff of Demnos','https://ocremix.org/game/452/solstice-the-quest-for-the-staff-of-demnos-nes');
+INSERT INTO "game" VALUES(453,'Star Fox 2','https://ocremix.org/game/453/star-fox-2-snes');
+INSERT INTO "game" VALUES(454,'Descent II','https://ocremix.org/game/454/descent-ii-win');
+INSERT INTO "game" VALUES(455,'Breath of Fire III','https://ocremix.org/game/455/breath-of-fire-iii-ps1');
+INSERT INTO "game" VALUES(456,'The Legend of Zelda: Oracle of Ages','https://ocremix.org/game/456/legend-of-zelda-oracle-of-ages-gbc');
+INSERT INTO "game" VALUES(457,'Alundra','https://ocremix.org/game/457/alundra-ps1');
+INSERT INTO "game" VALUES(458,'Commander Keen V: The Armageddon Machine','https://ocremix.org/game/458/commander-keen-v-the-armageddon-machine-dos');
+INSERT INTO "game" VALUES(459,'Yoshi''s Story','https://ocremix.org/game/459/yoshis-story-n64');
+INSERT INTO "game" VALUES(460,'Mega Man 7','https://ocremix.org/game/460/mega-man-7-snes');
+INSERT INTO "game" VALUES(461,'Shadow of the Ninja','https://ocremix.org/game/461/shadow-of-the-ninja-nes');
+INSERT INTO "game" VALUES(462,'World of Warcraft','https://ocremix.org/game/462/world-of-warcraft-win');
+INSERT INTO "game" VALUES(463,'Baldur''s Gate','https://ocremix.org/game/463/baldurs-gate-win');
+INSERT INTO "game" VALUES(464,'Castlevania: Harmony of Dissonance','https://ocremix.org/game/464/castlevania-harmony-of-dissonance-gba');
+INSERT INTO "game" VALUES(465,'Gran Turismo','https://ocremix.org/game/465/gran-turismo-ps1');
+INSERT INTO "game" VALUES(466,'Bionic Commando','https://ocremix.org/game/466/bionic-commando-gb');
+INSERT INTO "game" VALUES(467,'Grandia II','https://ocremix.org/game/467/grandia-ii-dc');
+INSERT INTO "game" VALUES(468,'Wild Arms 2','https://ocremix.org/game/468/wild-arms-2-ps1');
+INSERT INTO "game" VALUES(469,'Super Double Dragon','https://ocremix.org/game/469/super-double-dragon-snes');
+INSERT INTO "game" VALUES(470,'Rayman 2: The Great Escape','https://ocremix.org/game/470/rayman-2-the-great-escape-n64');
+INSERT INTO "game" VALUES(471,'Ghouls''n Ghosts','https://ocremix.org/game/471/ghoulsn-ghosts-c64');
+INSERT INTO "game" VALUES(472,'Super Street Fighter II Turbo','https://ocremix.org/game/472/super-street-fighter-ii-turbo-arc');
+INSERT INTO "game" VALUES(473,'Raptor: Call of the Shadows','https://ocremix.org/game/473/raptor-call-of-the-shadows-dos');
+INSERT INTO "game" VALUES(474,'Metal Slug 2: Super Vehicle-001/II','https://ocremix.org/game/474/metal-slug-2-super-vehicle-001ii-ng');
+INSERT INTO "game" VALUES(475,'Star Fox 64','https://ocremix.org/game/475/star-fox-64-n64');
+INSERT INTO "game" VALUES(476,'Awesome','https://ocremix.org/game/476/awesome-amiga');
+INSERT INTO "game" VALUES(477,'Eternal Champions','https://ocremix.org/game/477/eternal-champions-gen');
+INSERT INTO "game" VALUES(481,'Metal Gear Solid 3: Snake Eater','https://ocremix.org/game/481/metal-gear-solid-3-snake-eater-ps2');
+INSERT INTO "game" VALUES(482,'Metroid Prime 2: Echoes','https://ocremix.org/game/482/metroid-prime-2-echoes-gcn');
+INSERT INTO "game" VALUES(483,'Maniac Mansion: Day of the Tentacle','https://ocremix.org/game/483/maniac-mansion-day-of-the-tentacle-dos');
+INSERT INTO "game" VALUES(484,'Amberstar','https://ocremix.org/game/484/amberstar-amiga');
+INSERT INTO "game" VALUES(485,'Shining Force CD','https://ocremix.org/game/485/shining-force-cd-scd');
+INSERT INTO "game" VALUES(486,'Cave Story','https://ocremix.org/game/486/cave-story-win');
+INSERT INTO "game" VALUES(487,'Donkey Kong Land','https://ocremix.org/game/487/donkey-kong-land-gb');
+INSERT INTO "game" VALUES(488,'Cauldron II: The Pumpkin Strikes Back','https://ocremix.org/game/488/cauldron-ii-the-pumpkin-strikes-back-c64');
+INSERT INTO "game" VALUES(489,'New Super Mario Bros.','https://ocremix.org/game/489/new-super-mario-bros-nds');
+INSERT INTO "game" VALUES(490,'The Legend of Zelda: Majora''s Mask','https://ocremix.org/game/490/legend-of-zelda-majoras-mask-n64');
+INSERT INTO "game" VALUES(491,'Dr. Mario','https://ocremix.org/game/491/dr-mario-nes');
+INSERT INTO "game" VALUES(492,'Pictionary','https://ocremix.org/game/492/pictionary-nes');
+INSERT INTO "game" VALUES(493,'Phoenix Wright: Ace Attorney','https://ocremix.org/game/493/phoenix-wright-ace-attorney-nds');
+INSERT INTO "game" VALUES(494,'Tetris Attack','https://ocremix.org/game/494/tetris-attack-snes');
+INSERT INTO "game" VALUES(495,'Chaos Legion','https://ocremix.org/game/495/chaos-legion-ps2');
+INSERT INTO "game" VALUES(496,'Max Payne','https://ocremix.org/game/496/max-payne-win');
+INSERT INTO "game" VALUES(497,'Kirby''s Dream Land 2','https://ocremix.org/game/497/kirbys-dream-land-2-gb');
+INSERT INTO "game" VALUES(498,'Wario Land II','https://ocremix.org/game/498/wario-land-ii-gb');
+INSERT INTO "game" VALUES(499,'Earthworm Jim','https://ocremix.org/game/499/earthworm-jim-snes');
+INSERT INTO "game" VALUES(500,'Touhou Youyoumu: Perfect Cherry Blossom','https://ocremix.org/game/500/touhou-youyoumu-perfect-cherry-blossom-win');
+INSERT INTO "game" VALUES(502,'Shadow of the Colossus','https://ocremix.org/game/502/shadow-of-the-colossus-ps2');
+INSERT INTO "game" VALUES(503,'Highway Hunter','https://ocremix.org/game/503/highway-hunter-dos');
+INSERT INTO "game" VALUES(504,'God of War','https://ocremix.org/game/504/god-of-war-ps2');
+INSERT INTO "game" VALUES(505,'The Legend of Zelda: Twilight Princess','https://ocremix.org/game/505/legend-of-zelda-twilight-princess-wii');
+INSERT INTO "game" VALUES(506,'Jazz Jackrabbit 2','https://ocremix.org/game/506/jazz-jackrabbit-2-win');
+INSERT INTO "game" VALUES(507,'Guilty Gear X2','https://ocremix.org/game/507/guilty-gear-x2-ps2');
+INSERT INTO "game" VALUES(508,'Pokémon Red Version','https://ocremix.org/game/508/pokemon-red-version-gb');
+INSERT INTO "game" VALUES(509,'The Addams Family','https://ocremix.org/game/509/addams-family-snes');
+INSERT INTO "game" VALUES(510,'Tetris','https://ocremix.org/game/510/tetris-gb');
+INSERT INTO "game" VALUES(511,'Syberia','https://ocremix.org/game/511/syberia-win');
+INSERT INTO "game" VALUES(512,'Jade Cocoon: Story of the Tamamayu','https://ocremix.org/game/512/jade-cocoon-story-of-the-tamamayu-ps1');
+INSERT INTO "game" VALUES(513,'Top Gear 2','https://ocremix.org/game/513/top-gear-2-snes');
+INSERT INTO "game" VALUES(514,'Metal Slug 3','https://ocremix.org/game/514/metal-slug-3-arc');
+INSERT INTO "game" VALUES(515,'Psychonauts','https://ocremix.org/game/515/psychonauts-xbox');
+INSERT INTO "game" VALUES(516,'Snow Brothers','https://ocremix.org/game/516/snow-brothers-nes');
+INSERT INTO "game" VALUES(517,'Mario Kart DS','https://ocremix.org/game/517/mario-kart-ds-nds');
+INSERT INTO "game" VALUES(518,'Metroid Prime 3: Corruption','https://ocremix.org/game/518/metroid-prime-3-corruption-wii');
+INSERT INTO "game" VALUES(519,'Threads of Fate','https://ocremix.org/game/519/threads-of-fate-ps1');
+INSERT INTO "game" VALUES(520,'Guilty Gear X','https://ocremix.org/game/520/guilty-gear-x-dc');
+INSERT INTO "game" VALUES(521,'Animal Crossing','https://ocremix.org/game/521/animal-crossing-gcn');
+INSERT INTO "game" VALUES(522,'Breath of Fire IV','https://ocremix.org/game/522/breath-of-fire-iv-ps1');
+INSERT INTO "game" VALUES(523,'Gran Turismo 3 A-spec','https://ocremix.org/game/523/gran-turismo-3-a-spec-ps2');
+INSERT INTO "game" VALUES(524,'Cheetahmen II','https://ocremix.org/game/524/cheetahmen-ii-nes');
+INSERT INTO "game" VALUES(525,'Final Fantasy XII','https://ocremix.org/game/525/final-fantasy-xii-ps2');
+INSERT INTO "game" VALUES(526,'Conker''s Bad Fur Day','https://ocremix.org/game/526/conkers-bad-fur-day-n64');
+INSERT INTO "game" VALUES(527,'Kingdom Hearts: Chain of Memories','https://ocremix.org/game/527/kingdom-hearts-chain-of-memories-gba');
+INSERT INTO "game" VALUES(528,'Kirby & The Amazing Mirror','https://ocremix.org/game/528/kirby-and-the-amazing-mirror-gba');
+INSERT INTO "game" VALUES(529,'Myst','https://ocremix.org/game/529/myst-mac');
+INSERT INTO "game" VALUES(532,'Super Dodge Ball','https://ocremix.org/game/532/super-dodge-ball-nes');
+INSERT INTO "game" VALUES(533,'Tales of Symphonia','https://ocremix.org/game/533/tales-of-symphonia-gcn');
+INSERT INTO "game" VALUES(534,'Revolution X','https://ocremix.org/game/534/revolution-x-snes');
+INSERT INTO "game" VALUES(535,'Leisure Suit Larry in the Land of the Lounge Lizards','https://ocremix.org/game/535/leisure-suit-larry-in-the-land-of-the-lounge-lizards-aplii');
+INSERT INTO "game" VALUES(537,'Okami','https://ocremix.org/game/537/okami-ps2');
+INSERT INTO "game" VALUES(538,'Klax','https://ocremix.org/game/538/klax-nes');
+INSERT INTO "game" VALUES(539,'Myst III: Exile','https://ocremix.org/game/539/myst-iii-exile-win');
+INSERT INTO "game" VALUES(540,'Grim Fandango','https://ocremix.org/game/540/grim-fandango-win');
+INSERT INTO "game" VALUES(541,'Castlevania: Aria of Sorrow','https://ocremix.org/game/541/castlevania-aria-of-sorrow-gba');
+INSERT INTO "game" VALUES(542,'Ragnarök Online','https://ocremix.org/game/542/ragnarok-online-win');
+INSERT INTO "game" VALUES(543,'Double Dragon','https://ocremix.org/game/543/double-dragon-sms');
+INSERT INTO "game" VALUES(544,'Shadow Hearts: Covenant','https://ocremix.org/game/544/shadow-hearts-covenant-ps2');
+INSERT INTO "game" VALUES(545,'Solar Jetman: Hunt for the Golden Warpship','https://ocremix.org/game/545/solar-jetman-hunt-for-the-golden-warpship-nes');
+INSERT INTO "game" VALUES(546,'Final Fantasy XI Online','https://ocremix.org/game/546/final-fantasy-xi-online-win');
+INSERT INTO "game" VALUES(547,'Valkyrie Profile','https://ocremix.org/game/547/valkyrie-profile-ps1');
+INSERT INTO "game" VALUES(548,'Goemon''s Great Adventure','https://ocremix.org/game/548/goemons-great-adventure-n64');
+INSERT INTO "game" VALUES(549,'Kingdom Hearts II','https://ocremix.org/game/549/kingdom-hearts-ii-ps2');
+INSERT INTO "game" VALUES(550,'Jade Empire','https://ocremix.org/game/550/jade-empire-xbox');
+INSERT INTO "game" VALUES(551,'Global Gladiators','https://ocremix.org/game/551/global-gladiators-gen');
+INSERT INTO "game" VALUES(552,'Crusader of Centy','https://ocremix.org/game/552/crusader-of-centy-gen');
+INSERT INTO "game" VALUES(553,'The Elder Scrolls IV: Oblivion','https://ocremix.org/game/553/elder-scrolls-iv-oblivion-win');
+INSERT INTO "game" VALUES(554,'Splatterhouse 3','https://ocremix.org/game/554/splatterhouse-3-gen');
+INSERT INTO "game" VALUES(555,'Gradius III','https://ocremix.org/game/555/gradius-iii-snes');
+INSERT INTO "game" VALUES(556,'Live A Live','https://ocremix.org/game/556/live-a-live-snes');
+INSERT INTO "game" VALUES(557,'Romancing SaGa','https://ocremix.org/game/557/romancing-saga-ps2');
+INSERT INTO "game" VALUES(558,'Tales of Destiny','https://ocremix.org/game/558/tales-of-destiny-ps1');
+INSERT INTO "game" VALUES(559,'Skate or Die','https://ocremix.org/game/559/skate-or-die-c64');
+INSERT INTO "game" VALUES(560,'Sins of a Solar Empire','https://ocremix.org/game/560/sins-of-a-solar-empire-win');
+INSERT INTO "game" VALUES(561,'Portal','https://ocremix.org/game/561/portal-win');
+INSERT INTO "game" VALUES(562,'Ultima Online: Renaissance','https://ocremix.org/game/562/ultima-online-renaissance-win');
+INSERT INTO "game" VALUES(563,'Vagrant Story','https://ocremix.org/game/563/vagrant-story-ps1');
+INSERT INTO "game" VALUES(564,'Neverwinter Nights','https://ocremix.org/game/564/neverwinter-nights-win');
+INSERT INTO "game" VALUES(566,'Sid Meier''s Civilization IV','https://ocremix.org/game/566/sid-meiers-civilization-iv-win');
+INSERT INTO "game" VALUES(567,'SD Snatcher','https://ocremix.org/game/567/sd-snatcher-msx');
+INSERT INTO "game" VALUES(568,'Tales of Symphonia: Dawn of the New World','https://ocremix.org/game/568/tales-of-symphonia-dawn-of-the-new-world-wii');
+INSERT INTO "game" VALUES(569,'Reset Generation','https://ocremix.org/game/569/reset-generation-ngage');
+INSERT INTO "game" VALUES(570,'Pilotwings','https://ocremix.org/game/570/pilotwings-snes');
+INSERT INTO "game" VALUES(571,'Lost Odyssey','https://ocremix.org/game/571/lost-odyssey-xb360');
+INSERT INTO "game" VALUES(572,'Kirby: Canvas Curse','https://ocremix.org/game/572/kirby-canvas-curse-nds');
+INSERT INTO "game" VALUES(573,'Pokémon Crystal Version','https://ocremix.org/game/573/pokemon-crystal-version-gbc');
+INSERT INTO "game" VALUES(574,'Deus Ex','https://ocremix.org/game/574/deus-ex-win');
+INSERT INTO "game" VALUES(575,'Super Street Fighter II: The New Challengers','https://ocremix.org/game/575/super-street-fighter-ii-the-new-challengers-arc');
+INSERT INTO "game" VALUES(576,'Street Fighter Alpha 2','https://ocremix.org/game/576/street-fighter-alpha-2-arc');
+INSERT INTO "game" VALUES(577,'Kirby 64: The Crystal Shards','https://ocremix.org/game/577/kirby-64-the-crystal-shards-n64');
+INSERT INTO "game" VALUES(578,'Castlevania: Portrait of Ruin','https://ocremix.org/game/578/castlevania-portrait-of-ruin-nds');
+INSERT INTO "game" VALUES(579,'Castlevania: Order of Ecclesia','https://ocremix.org/game/579/castlevania-order-of-ecclesia-nds');
+INSERT INTO "game" VALUES(580,'Mega Man ZX','https://ocremix.org/game/580/mega-man-zx-nds');
+INSERT INTO "game" VALUES(581,'Super Mario Galaxy','https://ocremix.org/game/581/super-mario-galaxy-wii');
+INSERT INTO "game" VALUES(582,'Panzer Dragoon II Zwei','https://ocremix.org/game/582/panzer-dragoon-ii-zwei-sat');
+INSERT INTO "game" VALUES(583,'Sonic the Hedgehog','https://ocremix.org/game/583/sonic-the-hedgehog-xb360');
+INSERT INTO "game" VALUES(584,'Virtua Fighter 2','https://ocremix.org/game/584/virtua-fighter-2-sat');
+INSERT INTO "game" VALUES(585,'Aquaria','https://ocremix.org/game/585/aquaria-win');
+INSERT INTO "game" VALUES(586,'Kirby''s Block Ball','https://ocremix.org/game/586/kirbys-block-ball-gb');
+INSERT INTO "game" VALUES(587,'Touhou Kaeidzuka: Phantasmagoria of Flower View','https://ocremix.org/game/587/touhou-kaeidzuka-phantasmagoria-of-flower-view-win');
+INSERT INTO "game" VALUES(588,'SaGa Frontier 2','https://ocremix.org/game/588/saga-frontier-2-ps1');
+INSERT INTO "game" VALUES(589,'The Legend of Zelda: Four Swords Adventures','https://ocremix.org/game/589/legend-of-zelda-four-swords-adventures-gcn');
+INSERT INTO "game" VALUES(590,'Romancing SaGa 3','https://ocremix.org/game/590/romancing-saga-3-snes');
+INSERT INTO "game" VALUES(593,'Langrisser II','https://ocremix.org/game/593/langrisser-ii-gen');
+INSERT INTO "game" VALUES(594,'Fittest','https://ocremix.org/game/594/fittest-xb360');
+INSERT INTO "game" VALUES(595,'Marvel vs. Capcom: Clash of Super Heroes','https://ocremix.org/game/595/marvel-vs-capcom-clash-of-super-heroes-arc');
+INSERT INTO "game" VALUES(596,'Teen Agent','https://ocremix.org/game/596/teen-agent-dos');
+INSERT INTO "game" VALUES(597,'Mass Effect 2','https://ocremix.org/game/597/mass-effect-2-xb360');
+INSERT INTO "game" VALUES(598,'Wave Race 64','https://ocremix.org/game/598/wave-race-64-n64');
+INSERT INTO "game" VALUES(600,'Salamander','https://ocremix.org/game/600/salamander-msx');
+INSERT INTO "game" VALUES(601,'Star Fox Adventures','https://ocremix.org/game/601/star-fox-adventures-gcn');
+INSERT INTO "game" VALUES(602,'Dark Cloud 2','https://ocremix.org/game/602/dark-cloud-2-ps2');
+INSERT INTO "game" VALUES(603,'Uru: Ages Beyond Myst','https://ocremix.org/game/603/uru-ages-beyond-myst-win');
+INSERT INTO "game" VALUES(604,'Team Fortress 2','https://ocremix.org/game/604/team-fortress-2-win');
+INSERT INTO "game" VALUES(605,'Omega Five','https://ocremix.org/game/605/omega-five-xb360');
+INSERT INTO "game" VALUES(606,'Super Mario Land 2: 6 Golden Coins','https://ocremix.org/game/606/super-mario-land-2-6-golden-coins-gb');
+INSERT INTO "game" VALUES(607,'Ecco: The Tides of Time','https://ocremix.org/game/607/ecco-the-tides-of-time-gen');
+INSERT INTO "game" VALUES(608,'Golden Axe II','https://ocremix.org/game/608/golden-axe-ii-gen');
+INSERT INTO "game" VALUES(609,'Super Street Fighter IV','https://ocremix.org/game/609/super-street-fighter-iv-xb360');
+INSERT INTO "game" VALUES(610,'Castlevania: Bloodlines','https://ocremix.org/game/610/castlevania-bloodlines-gen');
+INSERT INTO "game" VALUES(611,'Contra Force','https://ocremix.org/game/611/contra-force-nes');
+INSERT INTO "game" VALUES(612,'Mega Man X5','https://ocremix.org/game/612/mega-man-x5-ps1');
+INSERT INTO "game" VALUES(613,'Mighty Morphin Power Rangers','https://ocremix.org/game/613/mighty-morphin-power-rangers-snes');
+INSERT INTO "game" VALUES(614,'One Man and His Droid','https://ocremix.org/game/614/one-man-and-his-droid-c64');
+INSERT INTO "game" VALUES(615,'Scribblenauts','https://ocremix.org/game/615/scribblenauts-nds');
+INSERT INTO "game" VALUES(616,'SimCity 2000','https://ocremix.org/game/616/simcity-2000-dos');
+INSERT INTO "game" VALUES(617,'Street Fighter 2010: The Final Fight','https://ocremix.org/game/617/street-fighter-2010-the-final-fight-nes');
+INSERT INTO "game" VALUES(618,'Sunset Riders','https://ocremix.org/game/618/sunset-riders-snes');
+INSERT INTO "game" VALUES(619,'Mass Effect','https://ocremix.org/game/619/mass-effect-xb360');
+INSERT INTO "game" VALUES(620,'Diddy Kong Racing','https://ocremix.org/game/620/diddy-kong-racing-n64');
+INSERT INTO "game" VALUES(621,'Trenches','https://ocremix.org/game/621/trenches-ios');
+INSERT INTO "game" VALUES(623,'Fallout 3','https://ocremix.org/game/623/fallout-3-ps3');
+INSERT INTO "game" VALUES(625,'Silent Line: Armored Core','https://ocremix.org/game/625/silent-line-armored-core-ps2');
+INSERT INTO "game" VALUES(626,'Armored Core 4','https://ocremix.org/game/626/armored-core-4-xb360');
+INSERT INTO "game" VALUES(630,'NBA Jam','https://ocremix.org/game/630/nba-jam-snes');
+INSERT INTO "game" VALUES(631,'Shantae: Risky''s Revenge','https://ocremix.org/game/631/shantae-riskys-revenge-nds');
+INSERT INTO "game" VALUES(632,'Touhou Koumakyou: The Embodiment of Scarlet Devil','https://ocremix.org/game/632/touhou-koumakyou-the-embodiment-of-scarlet-devil-win');
+INSERT INTO "game" VALUES(633,'DDRMAX Dance Dance Revolution','https://ocremix.org/game/633/ddrmax-dance-dance-revolution-ps2');
+INSERT INTO "game" VALUES(634,'Professor Layton and the Curious Village','https://ocremix.org/game/634/professor-layton-and-the-curious-village-nds');
+INSERT INTO "game" VALUES(635,'Pokémon Diamond Version','https://ocremix.org/game/635/pokemon-diamond-version-nds');
+INSERT INTO "game" VALUES(636,'Pokémon Sapphire Version','https://ocremix.org/game/636/pokemon-sapphire-version-gba');
+INSERT INTO "game" VALUES(637,'Contra III: The Alien Wars','https://ocremix.org/game/637/contra-iii-the-alien-wars-snes');
+INSERT INTO "game" VALUES(638,'King Kong 2: Yomigaeru Densetsu','https://ocremix.org/game/638/king-kong-2-yomigaeru-densetsu-msx');
+INSERT INTO "game" VALUES(639,'Lemmings 3D','https://ocremix.org/game/639/lemmings-3d-dos');
+INSERT INTO "game" VALUES(640,'PaRappa the Rapper','https://ocremix.org/game/640/parappa-the-rapper-ps1');
+INSERT INTO "game" VALUES(641,'Pokémon Gold Version','https://ocremix.org/game/641/pokemon-gold-version-gbc');
+INSERT INTO "game" VALUES(642,'Donkey Kong','https://ocremix.org/game/642/donkey-kong-gb');
+INSERT INTO "game" VALUES(643,'Halo 3','https://ocremix.org/game/643/halo-3-xb360');
+INSERT INTO "game" VALUES(644,'Super Meat Boy','https://ocremix.org/game/644/super-meat-boy-xb360');
+INSERT INTO "game" VALUES(645,'Duke Nukem 3D','https://ocremix.org/game/645/duke-nukem-3d-dos');
+INSERT INTO "game" VALUES(646,'Tecmo Bowl','https://ocremix.org/game/646/tecmo-bowl-nes');
+INSERT INTO "game" VALUES(647,'Dennis','https://ocremix.org/game/647/dennis-amiga');
+INSERT INTO "game" VALUES(648,'OutRun','https://ocremix.org/game/648/outrun-sms');
+INSERT INTO "game" VALUES(649,'Wild Guns','https://ocremix.org/game/649/wild-guns-snes');
+INSERT INTO "game" VALUES(650,'Chaos Field','https://ocremix.org/game/650/chaos-field-dc');
+INSERT INTO "game" VALUES(651,'Rad Racer II','https://ocremix.org/game/651/rad-racer-ii-nes');
+INSERT INTO "game" VALUES(652,'The Goonies II','https://ocremix.org/game/652/goonies-ii-nes');
+INSERT INTO "game" VALUES(653,'The Ninja Warriors','https://ocremix.org/game/653/ninja-warriors-snes');
+INSERT INTO "game" VALUES(654,'Sonic Heroes','https://ocremix.org/game/654/sonic-heroes-gcn');
+INSERT INTO "game" VALUES(655,'Mega Man 9','https://ocremix.org/game/655/mega-man-9-wii');
+INSERT INTO "game" VALUES(656,'Return All Robots!','https://ocremix.org/game/656/return-all-robots-xb360');
+INSERT INTO "game" VALUES(657,'Mega Man & Bass','https://ocremix.org/game/657/mega-man-and-bass-gba');
+INSERT INTO "game" VALUES(659,'Armored Core: Nexus','https://ocremix.org/game/659/armored-core-nexus-ps2');
+INSERT INTO "game" VALUES(660,'Armored Core: Formula Front - Extreme Battle','https://ocremix.org/game/660/armored-core-formula-front-extreme-battle-psp');
+INSERT INTO "game" VALUES(661,'Bubble Bobble','https://ocremix.org/game/661/bubble-bobble-arc');
+INSERT INTO "game" VALUES(662,'VVVVVV','https://ocremix.org/game/662/vvvvvv-win');
+INSERT INTO "game" VALUES(663,'BlazBlue: Calamity Trigger','https://ocremix.org/game/663/blazblue-calamity-trigger-arc');
+INSERT INTO "game" VALUES(664,'Tails and the Music Maker','https://ocremix.org/game/664/tails-and-the-music-maker-pico');
+INSERT INTO "game" VALUES(666,'Shinobi','https://ocremix.org/game/666/shinobi-arc');
+INSERT INTO "game" VALUES(667,'Super Smash Bros.','https://ocremix.org/game/667/super-smash-bros-n64');
+INSERT INTO "game" VALUES(668,'The Curse of Monkey Island','https://ocremix.org/game/668/curse-of-monkey-island-win');
+INSERT INTO "game" VALUES(670,'Missile Master','https://ocremix.org/game/670/missile-master-ios');
+INSERT INTO "game" VALUES(672,'Pokémon Emerald Version','https://ocremix.org/game/672/pokemon-emerald-version-gba');
+INSERT INTO "game" VALUES(673,'Pokémon Ruby Version','https://ocremix.org/game/673/pokemon-ruby-version-gba');
+INSERT INTO "game" VALUES(674,'Pokémon Silver Version','https://ocremix.org/game/674/pokemon-silver-version-gbc');
+INSERT INTO "game" VALUES(676,'Pokémon Blue Version','https://ocremix.org/game/676/pokemon-blue-version-gb');
+INSERT INTO "game" VALUES(679,'Crush','https://ocremix.org/game/679/crush-psp');
+INSERT INTO "game" VALUES(681,'Boktai: The Sun is in Your Hand','https://ocremix.org/game/681/boktai-the-sun-is-in-your-hand-gba');
+INSERT INTO "game" VALUES(682,'Harvest Moon','https://ocremix.org/game/682/harvest-moon-snes');
+INSERT INTO "game" VALUES(683,'Donkey Kong Country 3','https://ocremix.org/game/683/donkey-kong-country-3-gba');
+INSERT INTO "game" VALUES(684,'Metal Gear Solid 2: Substance','https://ocremix.org/game/684/metal-gear-solid-2-substance-ps2');
+INSERT INTO "game" VALUES(685,'Mega Man X6','https://ocremix.org/game/685/mega-man-x6-ps1');
+INSERT INTO "game" VALUES(687,'Mega Man X8','https://ocremix.org/game/687/mega-man-x8-ps2');
+INSERT INTO "game" VALUES(688,'QuackShot','https://ocremix.org/game/688/quackshot-gen');
+INSERT INTO "game" VALUES(689,'Sunset Riders','https://ocremix.org/game/689/sunset-riders-gen');
+INSERT INTO "game" VALUES(690,'Pokémon Mystery Dungeon: Explorers of Time','https://ocremix.org/game/690/pokemon-mystery-dungeon-explorers-of-time-nds');
+INSERT INTO "game" VALUES(692,'Lunar: Silver Star Story Complete','https://ocremix.org/game/692/lunar-silver-star-story-complete-ps1');
+INSERT INTO "game" VALUES(693,'Mega Turrican','https://ocremix.org/game/693/mega-turrican-gen');
+INSERT INTO "game" VALUES(694,'Final Fantasy XIII','https://ocremix.org/game/694/final-fantasy-xiii-ps3');
+INSERT INTO "game" VALUES(696,'Last Ninja 2: Back with a Vengeance','https://ocremix.org/game/696/last-ninja-2-back-with-a-vengeance-c64');
+INSERT INTO "game" VALUES(697,'Mortal Kombat 3','https://ocremix.org/game/697/mortal-kombat-3-arc');
+INSERT INTO "game" VALUES(700,'Bayonetta','https://ocremix.org/game/700/bayonetta-ps3');
+INSERT INTO "game" VALUES(701,'Cobra Triangle','https://ocremix.org/game/701/cobra-triangle-nes');
+INSERT INTO "game" VALUES(702,'Katamari Damacy','https://ocremix.org/game/702/katamari-damacy-ps2');
+INSERT INTO "game" VALUES(703,'La Tale','https://ocremix.org/game/703/la-tale-win');
+INSERT INTO "game" VALUES(704,'Half-Life','https://ocremix.org/game/704/half-life-win');
+INSERT INTO "game" VALUES(705,'Machinarium','https://ocremix.org/game/705/machinarium-mac');
+INSERT INTO "game" VALUES(706,'Mario Golf','https://ocremix.org/game/706/mario-golf-gbc');
+INSERT INTO "game" VALUES(707,'Metal Gear Solid 4: Guns of the Patriots','https://ocremix.org/game/707/metal-gear-solid-4-guns-of-the-patriots-ps3');
+INSERT INTO "game" VALUES(708,'Minecraft','https://ocremix.org/game/708/minecraft-win');
+INSERT INTO "game" VALUES(709,'Nemesis the Warlock','https://ocremix.org/game/709/nemesis-the-warlock-c64');
+INSERT INTO "game" VALUES(710,'Pokémon Trading Card Game','https://ocremix.org/game/710/pokemon-trading-card-game-gbc');
+INSERT INTO "game" VALUES(711,'Ufouria: The Saga','https://ocremix.org/game/711/ufouria-the-saga-nes');
+INSERT INTO "game" VALUES(714,'The Binding of Isaac','https://ocremix.org/game/714/binding-of-isaac-win');
+INSERT INTO "game" VALUES(715,'The Legend of Dragoon','https://ocremix.org/game/715/legend-of-dragoon-ps1');
+INSERT INTO "game" VALUES(717,'Altered Beast','https://ocremix.org/game/717/altered-beast-arc');
+INSERT INTO "game" VALUES(719,'Gitaroo Man','https://ocremix.org/game/719/gitaroo-man-ps2');
+INSERT INTO "game" VALUES(721,'The Elder Scrolls V: Skyrim','https://ocremix.org/game/721/elder-scrolls-v-skyrim-win');
+INSERT INTO "game" VALUES(723,'Castlevania: Dawn of Sorrow','https://ocremix.org/game/723/castlevania-dawn-of-sorrow-nds');
+INSERT INTO "game" VALUES(724,'G.I. Joe: A Real American Hero','https://ocremix.org/game/724/gi-joe-a-real-american-hero-nes');
+INSERT INTO "game" VALUES(725,'The Legend of Zelda: Skyward Sword','https://ocremix.org/game/725/legend-of-zelda-skyward-sword-wii');
+INSERT INTO "game" VALUES(726,'The Legend of Zelda: Oracle of Seasons','https://ocremix.org/game/726/legend-of-zelda-oracle-of-seasons-gbc');
+INSERT INTO "game" VALUES(727,'Plants vs. Zombies','https://ocremix.org/game/727/plants-vs-zombies-win');
+INSERT INTO "game" VALUES(729,'Descent','https://ocremix.org/game/729/descent-dos');
+INSERT INTO "game" VALUES(730,'Sonic Advance','https://ocremix.org/game/730/sonic-advance-gba');
+INSERT INTO "game" VALUES(731,'Dynamite Headdy','https://ocremix.org/game/731/dynamite-headdy-gen');
+INSERT INTO "game" VALUES(732,'The 7th Saga','https://ocremix.org/game/732/7th-saga-snes');
+INSERT INTO "game" VALUES(735,'Luminous Arc','https://ocremix.org/game/735/luminous-arc-nds');
+INSERT INTO "game" VALUES(736,'Shin Megami Tensei: Persona 3','https://ocremix.org/game/736/shin-megami-tensei-persona-3-ps2');
+INSERT INTO "game" VALUES(737,'Willow','https://ocremix.org/game/737/willow-nes');
+INSERT INTO "game" VALUES(738,'Ys IV: The Dawn of Ys','https://ocremix.org/game/738/ys-iv-the-dawn-of-ys-tgcd');
+INSERT INTO "game" VALUES(740,'Quest for Glory: So You Want to Be a Hero','https://ocremix.org/game/740/quest-for-glory-so-you-want-to-be-a-hero-dos');
+INSERT INTO "game" VALUES(741,'Battletoads','https://ocremix.org/game/741/battletoads-nes');
+INSERT INTO "game" VALUES(742,'NiGHTS: Journey of Dreams','https://ocremix.org/game/742/nights-journey-of-dreams-wii');
+INSERT INTO "game" VALUES(744,'Mega Man Zero 4','https://ocremix.org/game/744/mega-man-zero-4-gba');
+INSERT INTO "game" VALUES(746,'Crash Bandicoot','https://ocremix.org/game/746/crash-bandicoot-ps1');
+INSERT INTO "game" VALUES(747,'Elemental Master','https://ocremix.org/game/747/elemental-master-gen');
+INSERT INTO "game" VALUES(748,'The Sims 3','https://ocremix.org/game/748/sims-3-win');
+INSERT INTO "game" VALUES(749,'Retro City Rampage','https://ocremix.org/game/749/retro-city-rampage-xb360');
+INSERT INTO "game" VALUES(750,'Pilotwings Resort','https://ocremix.org/game/750/pilotwings-resort-3ds');
+INSERT INTO "game" VALUES(753,'Adventures of Lolo 3','https://ocremix.org/game/753/adventures-of-lolo-3-nes');
+INSERT INTO "game" VALUES(755,'Red Zone','https://ocremix.org/game/755/red-zone-gen');
+INSERT INTO "game" VALUES(756,'No More Heroes','https://ocremix.org/game/756/no-more-heroes-wii');
+INSERT INTO "game" VALUES(757,'Mega Man 10','https://ocremix.org/game/757/mega-man-10-wii');
+INSERT INTO "game" VALUES(758,'NieR','https://ocremix.org/game/758/nier-ps3');
+INSERT INTO "game" VALUES(759,'Doom Troopers: Mutant Chronicles','https://ocremix.org/game/759/doom-troopers-mutant-chronicles-gen');
+INSERT INTO "game" VALUES(761,'Puggsy','https://ocremix.org/game/761/puggsy-gen');
+INSERT INTO "game" VALUES(762,'Sonic the Hedgehog 4: Episode I','https://ocremix.org/game/762/sonic-the-hedgehog-4-episode-i-wii');
+INSERT INTO "game" VALUES(763,'Metal Gear 2: Solid Snake','https://ocremix.org/game/763/metal-gear-2-solid-snake-msx');
+INSERT INTO "game" VALUES(764,'Mega Man II','https://ocremix.org/game/764/mega-man-ii-gb');
+INSERT INTO "game" VALUES(765,'Pokémon Mystery Dungeon: Red Rescue Team','https://ocremix.org/game/765/pokemon-mystery-dungeon-red-rescue-team-gba');
+INSERT INTO "game" VALUES(766,'MapleStory','https://ocremix.org/game/766/maplestory-win');
+INSERT INTO "game" VALUES(768,'Silver Surfer','https://ocremix.org/game/768/silver-surfer-nes');
+INSERT INTO "game" VALUES(769,'Shadowrun','https://ocremix.org/game/769/shadowrun-snes');
+INSERT INTO "game" VALUES(770,'Pitfall: The Mayan Adventure','https://ocremix.org/game/770/pitfall-the-mayan-adventure-win');
+INSERT INTO "game" VALUES(800,'Bomberman II','https://ocremix.org/game/800/bomberman-ii-nes');
+INSERT INTO "game" VALUES(801,'Teenage Mutant Ninja Turtles: The Hyperstone Heist','https://ocremix.org/game/801/teenage-mutant-ninja-turtles-the-hyperstone-heist-gen');
+INSERT INTO "game" VALUES(802,'Ys III: Wanderers from Ys','https://ocremix.org/game/802/ys-iii-wanderers-from-ys-gen');
+INSERT INTO "game" VALUES(803,'Zero Wing','https://ocremix.org/game/803/zero-wing-gen');
+INSERT INTO "game" VALUES(804,'Paper Mario: The Thousand-Year Door','https://ocremix.org/game/804/paper-mario-the-thousand-year-door-gcn');
+INSERT INTO "game" VALUES(805,'Super Smash Bros. Melee','https://ocremix.org/game/805/super-smash-bros-melee-gcn');
+INSERT INTO "game" VALUES(807,'Eye of the Beholder II: The Legend of Darkmoon','https://ocremix.org/game/807/eye-of-the-beholder-ii-the-legend-of-darkmoon-dos');
+INSERT INTO "game" VALUES(808,'Age of Empires: The Rise of Rome','https://ocremix.org/game/808/age-of-empires-the-rise-of-rome-win');
+INSERT INTO "game" VALUES(809,'Escape from Monkey Island','https://ocremix.org/game/809/escape-from-monkey-island-win');
+INSERT INTO "game" VALUES(812,'Etrian Odyssey II: Heroes of Lagaard','https://ocremix.org/game/812/etrian-odyssey-ii-heroes-of-lagaard-nds');
+INSERT INTO "game" VALUES(813,'Touhou Chireiden: Subterranean Animism','https://ocremix.org/game/813/touhou-chireiden-subterranean-animism-win');
+INSERT INTO "game" VALUES(816,'Yume Nikki','https://ocremix.org/game/816/yume-nikki-win');
+INSERT INTO "game" VALUES(817,'Cardinal Quest','https://ocremix.org/game/817/cardinal-quest-win');
+INSERT INTO "game" VALUES(818,'Hedgewars','https://ocremix.org/game/818/hedgewars-mac');
+INSERT INTO "game" VALUES(819,'Impulse','https://ocremix.org/game/819/impulse-win');
+INSERT INTO "game" VALUES(821,'Final Fantasy I & II: Dawn of Souls','https://ocremix.org/game/821/final-fantasy-i-and-ii-dawn-of-souls-gba');
+INSERT INTO "game" VALUES(822,'The King of Fighters XIII','https://ocremix.org/game/822/king-of-fighters-xiii-xb360');
+INSERT INTO "game" VALUES(823,'Persona 4 Arena','https://ocremix.org/game/823/persona-4-arena-xb360');
+INSERT INTO "game" VALUES(825,'Xenoblade Chronicles','https://ocremix.org/game/825/xenoblade-chronicles-wii');
+INSERT INTO "game" VALUES(826,'Portal 2','https://ocremix.org/game/826/portal-2-win');
+INSERT INTO "game" VALUES(827,'Half-Life 2','https://ocremix.org/game/827/half-life-2-win');
+INSERT INTO "game" VALUES(829,'Half-Life: Opposing Force','https://ocremix.org/game/829/half-life-opposing-force-win');
+INSERT INTO "game" VALUES(831,'Lemmings','https://ocremix.org/game/831/lemmings-dos');
+INSERT INTO "game" VALUES(833,'Q*bert','https://ocremix.org/game/833/qbert-gbc');
+INSERT INTO "game" VALUES(834,'Sonic Colors','https://ocremix.org/game/834/sonic-colors-wii');
+INSERT INTO "game" VALUES(835,'Spy vs. Spy','https://ocremix.org/game/835/spy-vs-spy-c64');
+INSERT INTO "game" VALUES(836,'The 7th Guest','https://ocremix.org/game/836/7th-guest-dos');
+INSERT INTO "game" VALUES(837,'Bastion','https://ocremix.org/game/837/bastion-xb360');
+INSERT INTO "game" VALUES(838,'Breath of Death VII: The Beginning','https://ocremix.org/game/838/breath-of-death-vii-the-beginning-xb360');
+INSERT INTO "game" VALUES(839,'Command & Conquer','https://ocremix.org/game/839/command-and-conquer-dos');
+INSERT INTO "game" VALUES(840,'Corpse Party','https://ocremix.org/game/840/corpse-party-psp');
+INSERT INTO "game" VALUES(841,'Doom II: Hell on Earth','https://ocremix.org/game/841/doom-ii-hell-on-earth-dos');
+INSERT INTO "game" VALUES(843,'Metroid Fusion','https://ocremix.org/game/843/metroid-fusion-gba');
+INSERT INTO "game" VALUES(844,'Deus Ex: Invisible War','https://ocremix.org/game/844/deus-ex-invisible-war-win');
+INSERT INTO "game" VALUES(845,'Deus Ex: Human Revolution','https://ocremix.org/game/845/deus-ex-human-revolution-win');
+INSERT INTO "game" VALUES(846,'Perfection.','https://ocremix.org/game/846/perfection-win');
+INSERT INTO "game" VALUES(847,'Batman','https://ocremix.org/game/847/batman-gen');
+INSERT INTO "game" VALUES(850,'Pokémon X','https://ocremix.org/game/850/pokemon-x-3ds');
+INSERT INTO "game" VALUES(851,'Getsu Fuuma Den','https://ocremix.org/game/851/getsu-fuuma-den-nes');
+INSERT INTO "game" VALUES(852,'MiG-29: Soviet Fighter','https://ocremix.org/game/852/mig-29-soviet-fighter-nes');
+INSERT INTO "game" VALUES(853,'Kid Chameleon','https://ocremix.org/game/853/kid-chameleon-gen');
+INSERT INTO "game" VALUES(854,'Silent Hill 4: The Room','https://ocremix.org/game/854/silent-hill-4-the-room-ps2');
+INSERT INTO "game" VALUES(855,'Shadow Warrior','https://ocremix.org/game/855/shadow-warrior-dos');
+INSERT INTO "game" VALUES(856,'Tom Clancy''s Splinter Cell: Chaos Theory','https://ocremix.org/game/856/tom-clancys-splinter-cell-chaos-theory-win');
+INSERT INTO "game" VALUES(858,'Army Men: Air Attack','https://ocremix.org/game/858/army-men-air-attack-ps1');
+INSERT INTO "game" VALUES(859,'Choujin Sentai Jetman','https://ocremix.org/game/859/choujin-sentai-jetman-nes');
+INSERT INTO "game" VALUES(860,'SmartBall','https://ocremix.org/game/860/smartball-snes');
+INSERT INTO "game" VALUES(861,'Kirby Super Star Ultra','https://ocremix.org/game/861/kirby-super-star-ultra-nds');
+INSERT INTO "game" VALUES(862,'StarCraft II: Wings of Liberty','https://ocremix.org/game/862/starcraft-ii-wings-of-liberty-win');
+INSERT INTO "game" VALUES(864,'To the Moon','https://ocremix.org/game/864/to-the-moon-win');
+INSERT INTO "game" VALUES(867,'Street Fighter Alpha 3','https://ocremix.org/game/867/street-fighter-alpha-3-arc');
+INSERT INTO "game" VALUES(873,'Mega Man Battle Network','https://ocremix.org/game/873/mega-man-battle-network-gba');
+INSERT INTO "game" VALUES(875,'Street Fighter Alpha: Warriors'' Dreams','https://ocremix.org/game/875/street-fighter-alpha-warriors-dreams-arc');
+INSERT INTO "game" VALUES(879,'Super Smash Bros. Brawl','https://ocremix.org/game/879/super-smash-bros-brawl-wii');
+INSERT INTO "game" VALUES(880,'Tekken Tag Tournament 2','https://ocremix.org/game/880/tekken-tag-tournament-2-xb360');
+INSERT INTO "game" VALUES(883,'Mega Man Battle Network 3: Blue Version','https://ocremix.org/game/883/mega-man-battle-network-3-blue-version-gba');
+INSERT INTO "game" VALUES(884,'Final Fantasy Type-0','https://ocremix.org/game/884/final-fantasy-type-0-psp');
+INSERT INTO "game" VALUES(885,'Darksiders II','https://ocremix.org/game/885/darksiders-ii-win');
+INSERT INTO "game" VALUES(886,'Super Spike V''Ball','https://ocremix.org/game/886/super-spike-vball-nes');
+INSERT INTO "game" VALUES(887,'Yoshi Touch & Go','https://ocremix.org/game/887/yoshi-touch-and-go-nds');
+INSERT INTO "game" VALUES(890,'The Last Story','https://ocremix.org/game/890/last-story-wii');
+INSERT INTO "game" VALUES(892,'Golden Sun: The Lost Age','https://ocremix.org/game/892/golden-sun-the-lost-age-gba');
+INSERT INTO "game" VALUES(893,'Sparkster','https://ocremix.org/game/893/sparkster-gen');
+INSERT INTO "game" VALUES(900,'Kunio Kun no Nekketsu Soccer League','https://ocremix.org/game/900/kunio-kun-no-nekketsu-soccer-league-nes');
+INSERT INTO "game" VALUES(901,'Biker Mice from Mars','https://ocremix.org/game/901/biker-mice-from-mars-snes');
+INSERT INTO "game" VALUES(903,'Tehkan World Cup','https://ocremix.org/game/903/tehkan-world-cup-arc');
+INSERT INTO "game" VALUES(904,'Detana!! TwinBee','https://ocremix.org/game/904/detana-twinbee-x68k');
+INSERT INTO "game" VALUES(905,'Yu-Gi-Oh! Dark Duel Stories','https://ocremix.org/game/905/yu-gi-oh-dark-duel-stories-gbc');
+INSERT INTO "game" VALUES(910,'Mirror''s Edge','https://ocremix.org/game/910/mirrors-edge-ps3');
+INSERT INTO "game" VALUES(911,'Tenchu: Shadow Assassins','https://ocremix.org/game/911/tenchu-shadow-assassins-wii');
+INSERT INTO "game" VALUES(912,'Mega Man Soccer','https://ocremix.org/game/912/mega-man-soccer-snes');
+INSERT INTO "game" VALUES(913,'The Last of Us','https://ocremix.org/game/913/last-of-us-ps3');
+INSERT INTO "game" VALUES(916,'Puella Magi Madoka Magica Portable','https://ocremix.org/game/916/puella-magi-madoka-magica-portable-psp');
+INSERT INTO "game" VALUES(919,'Astérix','https://ocremix.org/game/919/asterix-gb');
+INSERT INTO "game" VALUES(921,'Batman','https://ocremix.org/game/921/batman-gb');
+INSERT INTO "game" VALUES(923,'Harlequin','https://ocremix.org/game/923/harlequin-amiga');
+INSERT INTO "game" VALUES(924,'Luigi''s Mansion: Dark Moon','https://ocremix.org/game/924/luigis-mansion-dark-moon-3ds');
+INSERT INTO "game" VALUES(925,'Metal Slug 4','https://ocremix.org/game/925/metal-slug-4-arc');
+INSERT INTO "game" VALUES(926,'Hotline Miami','https://ocremix.org/game/926/hotline-miami-win');
+INSERT INTO "game" VALUES(927,'Linus Spacehead','https://ocremix.org/game/927/linus-spacehead-nes');
+INSERT INTO "game" VALUES(928,'Destiny','https://ocremix.org/game/928/destiny-ps4');
+INSERT INTO "game" VALUES(930,'The Walking Dead: Season One','https://ocremix.org/game/930/walking-dead-season-one-win');
+INSERT INTO "game" VALUES(931,'Shuttle Rush','https://ocremix.org/game/931/shuttle-rush-wiiu');
+INSERT INTO "game" VALUES(933,'Mario Party 2','https://ocremix.org/game/933/mario-party-2-n64');
+INSERT INTO "game" VALUES(935,'WinBack: Covert Operations','https://ocremix.org/game/935/winback-covert-operations-n64');
+INSERT INTO "game" VALUES(937,'Super Mario Sunshine','https://ocremix.org/game/937/super-mario-sunshine-gcn');
+INSERT INTO "game" VALUES(938,'Xenophobe','https://ocremix.org/game/938/xenophobe-amiga');
+INSERT INTO "game" VALUES(939,'Akumajo Dracula X: Nocturne in the Moonlight','https://ocremix.org/game/939/akumajo-dracula-x-nocturne-in-the-moonlight-sat');
+INSERT INTO "game" VALUES(940,'Sega Rally Championship','https://ocremix.org/game/940/sega-rally-championship-sat');
+INSERT INTO "game" VALUES(941,'Mega Man Zero 3','https://ocremix.org/game/941/mega-man-zero-3-gba');
+INSERT INTO "game" VALUES(942,'3D Pinball: Space Cadet','https://ocremix.org/game/942/3d-pinball-space-cadet-win');
+INSERT INTO "game" VALUES(943,'3-D Ultra Pinball: Creep Night','https://ocremix.org/game/943/3-d-ultra-pinball-creep-night-win');
+INSERT INTO "game" VALUES(944,'Supremacy: Your Will Be Done','https://ocremix.org/game/944/supremacy-your-will-be-done-c64');
+INSERT INTO "game" VALUES(945,'Spyro: Year of the Dragon','https://ocremix.org/game/945/spyro-year-of-the-dragon-ps1');
+INSERT INTO "game" VALUES(946,'Demon''s Souls','https://ocremix.org/game/946/demons-souls-ps3');
+INSERT INTO "game" VALUES(947,'Sonic and the Black Knight','https://ocremix.org/game/947/sonic-and-the-black-knight-wii');
+INSERT INTO "game" VALUES(948,'Guild Wars 2','https://ocremix.org/game/948/guild-wars-2-win');
+INSERT INTO "game" VALUES(950,'Breath of Fire','https://ocremix.org/game/950/breath-of-fire-gba');
+INSERT INTO "game" VALUES(954,'Mega Man Battle Network 5: Team Protoman','https://ocremix.org/game/954/mega-man-battle-network-5-team-protoman-gba');
+INSERT INTO "game" VALUES(956,'.hack//Infection - Part 1','https://ocremix.org/game/956/hackinfection-part-1-ps2');
+INSERT INTO "game" VALUES(958,'King''s Quest V: Absence Makes the Heart Go Yonder','https://ocremix.org/game/958/kings-quest-v-absence-makes-the-heart-go-yonder-dos');
+INSERT INTO "game" VALUES(959,'Double Dragon','https://ocremix.org/game/959/double-dragon-arc');
+INSERT INTO "game" VALUES(961,'Bravely Default','https://ocremix.org/game/961/bravely-default-3ds');
+INSERT INTO "game" VALUES(962,'Skylanders: Spyro''s Adventure','https://ocremix.org/game/962/skylanders-spyros-adventure-win');
+INSERT INTO "game" VALUES(963,'ilomilo','https://ocremix.org/game/963/ilomilo-xb360');
+INSERT INTO "game" VALUES(964,'Balloon Fight','https://ocremix.org/game/964/balloon-fight-nes');
+INSERT INTO "game" VALUES(965,'Graffiti Kingdom','https://ocremix.org/game/965/graffiti-kingdom-ps2');
+INSERT INTO "game" VALUES(967,'Super Final Match Tennis','https://ocremix.org/game/967/super-final-match-tennis-snes');
+INSERT INTO "game" VALUES(971,'Dungeonmans','https://ocremix.org/game/971/dungeonmans-win');
+INSERT INTO "game" VALUES(973,'Super Smash Bros. for Wii U','https://ocremix.org/game/973/super-smash-bros-for-wii-u-wiiu');
+INSERT INTO "game" VALUES(974,'Guilty Gear Xrd -SIGN-','https://ocremix.org/game/974/guilty-gear-xrd-sign-ps4');
+INSERT INTO "game" VALUES(976,'Dark Souls','https://ocremix.org/game/976/dark-souls-ps3');
+INSERT INTO "game" VALUES(977,'Space Station: Silicon Valley','https://ocremix.org/game/977/space-station-silicon-valley-n64');
+INSERT INTO "game" VALUES(978,'Sonic Chaos','https://ocremix.org/game/978/sonic-chaos-gg');
+INSERT INTO "game" VALUES(979,'Sonic the Hedgehog','https://ocremix.org/game/979/sonic-the-hedgehog-gg');
+INSERT INTO "game" VALUES(981,'Viewtiful Joe','https://ocremix.org/game/981/viewtiful-joe-gcn');
+INSERT INTO "game" VALUES(982,'Dark Souls II','https://ocremix.org/game/982/dark-souls-ii-ps3');
+INSERT INTO "game" VALUES(983,'Ultra Street Fighter IV','https://ocremix.org/game/983/ultra-street-fighter-iv-xb360');
+INSERT INTO "game" VALUES(985,'Anodyne','https://ocremix.org/game/985/anodyne-win');
+INSERT INTO "game" VALUES(986,'La-Mulana','https://ocremix.org/game/986/la-mulana-win');
+INSERT INTO "game" VALUES(988,'Monarch: Heroes of a New Age','https://ocremix.org/game/988/monarch-heroes-of-a-new-age-win');
+INSERT INTO "game" VALUES(1127,'Firelord','https://ocremix.org/game/1127/firelord-c64');
+INSERT INTO "game" VALUES(1135,'Flimbo''s Quest','https://ocremix.org/game/1135/flimbos-quest-c64');
+INSERT INTO "game" VALUES(1201,'Ghosts''n Goblins','https://ocremix.org/game/1201/ghostsn-goblins-c64');
+INSERT INTO "game" VALUES(1354,'Invaders of the Lost Tomb','https://ocremix.org/game/1354/invaders-of-the-lost-tomb-c64');
+INSERT INTO "game" VALUES(1682,'Operation Wolf','https://ocremix.org/game/1682/operation-wolf-c64');
+INSERT INTO "game" VALUES(1901,'R-Type','https://ocremix.org/game/1901/r-type-c64');
+INSERT INTO "game" VALUES(2203,'Terra Cresta','https://ocremix.org/game/2203/terra-cresta-c64');
+INSERT INTO "game" VALUES(2931,'Bomberman Hero','https://ocremix.org/game/2931/bomberman-hero-n64');
+INSERT INTO "game" VALUES(2955,'Donkey Kong 64','https://ocremix.org/game/2955/donkey-kong-64-n64');
+INSERT INTO "game" VALUES(2956,'Doom 64','https://ocremix.org/game/2956/doom-64-n64');
+INSERT INTO "game" VALUES(3003,'Jet Force Gemini','https://ocremix.org/game/3003/jet-force-gemini-n64');
+INSERT INTO "game" VALUES(3022,'Mario Party','https://ocremix.org/game/3022/mario-party-n64');
+INSERT INTO "game" VALUES(3031,'Mischief Makers','https://ocremix.org/game/3031/mischief-makers-n64');
+INSERT INTO "game" VALUES(3039,'Mystical Ninja Starring Goemon','https://ocremix.org/game/3039/mystical-ninja-starring-goemon-n64');
+INSERT INTO "game" VALUES(3070,'Paper Mario','https://ocremix.org/game/3070/paper-mario-n64');
+INSERT INTO "game" VALUES(3137,'Turok: Dinosaur Hunter','https://ocremix.org/game/3137/turok-dinosaur-hunter-n64');
+INSERT INTO "game" VALUES(3206,'A Nightmare on Elm Street','https://ocremix.org/game/3206/nightmare-on-elm-street-nes');
+INSERT INTO "game" VALUES(3214,'Arkista''s Ring','https://ocremix.org/game/3214/arkistas-ring-nes');
+INSERT INTO "game" VALUES(3253,'Batman: Return of the Joker','https://ocremix.org/game/3253/batman-return-of-the-joker-nes');
+INSERT INTO "game" VALUES(3454,'The Goonies','https://ocremix.org/game/3454/goonies-nes');
+INSERT INTO "game" VALUES(3457,'Gremlins 2: The New Batch','https://ocremix.org/game/3457/gremlins-2-the-new-batch-nes');
+INSERT INTO "game" VALUES(3565,'Aleste 2','https://ocremix.org/game/3565/aleste-2-msx');
+INSERT INTO "game" VALUES(3723,'Dragon Slayer: The Legend of Heroes','https://ocremix.org/game/3723/dragon-slayer-the-legend-of-heroes-msx');
+INSERT INTO "game" VALUES(3738,'Eggerland Mystery','https://ocremix.org/game/3738/eggerland-mystery-msx');
+INSERT INTO "game" VALUES(3804,'Nemesis','https://ocremix.org/game/3804/nemesis-msx');
+INSERT INTO "game" VALUES(3848,'Illusion City','https://ocremix.org/game/3848/illusion-city-msx');
+INSERT INTO "game" VALUES(3978,'Nemesis 3: The Eve of Destruction','https://ocremix.org/game/3978/nemesis-3-the-eve-of-destruction-msx');
+INSERT INTO "game" VALUES(4036,'Quarth','https://ocremix.org/game/4036/quarth-msx');
+INSERT INTO "game" VALUES(4100,'Snatcher','https://ocremix.org/game/4100/snatcher-msx');
+INSERT INTO "game" VALUES(4164,'Uşas','https://ocremix.org/game/4164/uas-msx');
+INSERT INTO "game" VALUES(4183,'Vampire Killer','https://ocremix.org/game/4183/vampire-killer-msx');
+INSERT INTO "game" VALUES(4221,'Ys III: Wanderers from Ys','https://ocremix.org/game/4221/ys-iii-wanderers-from-ys-msx');
+INSERT INTO "game" VALUES(4248,'Lunar Pool','https://ocremix.org/game/4248/lunar-pool-nes');
+INSERT INTO "game" VALUES(4289,'Mother','https://ocremix.org/game/4289/mother-nes');
+INSERT INTO "game" VALUES(4368,'Rad Racer','https://ocremix.org/game/4368/rad-racer-nes');
+INSERT INTO "game" VALUES(4395,'Rollerball','https://ocremix.org/game/4395/rollerball-nes');
+INSERT INTO "game" VALUES(4427,'Sky Shark','https://ocremix.org/game/4427/sky-shark-nes');
+INSERT INTO "game" VALUES(4440,'Spelunker','https://ocremix.org/game/4440/spelunker-nes');
+INSERT INTO "game" VALUES(4493,'Tecmo World Wrestling','https://ocremix.org/game/4493/tecmo-world-wrestling-nes');
+INSERT INTO "game" VALUES(4495,'Teenage Mutant Ninja Turtles: Tournament Fighters','https://ocremix.org/game/4495/teenage-mutant-ninja-turtles-tournament-fighters-nes');
+INSERT INTO "game" VALUES(4541,'Uninvited','https://ocremix.org/game/4541/uninvited-nes');
+INSERT INTO "game" VALUES(4581,'Yie Ar Kung-Fu','https://ocremix.org/game/4581/yie-ar-kung-fu-nes');
+INSERT INTO "game" VALUES(4587,'Ys III: Wanderers from Ys','https://ocremix.org/game/4587/ys-iii-wanderers-from-ys-nes');
+INSERT INTO "game" VALUES(4799,'Bomberman ''93','https://ocremix.org/game/4799/bomberman-93-tg16');
+INSERT INTO "game" VALUES(5234,'Cannon Fodder','https://ocremix.org/game/5234/cannon-fodder-amiga');
+INSERT INTO "game" VALUES(5615,'Flashback','https://ocremix.org/game/5615/flashback-amiga');
+INSERT INTO "game" VALUES(6031,'Lotus III: The Ultimate Challenge','https://ocremix.org/game/6031/lotus-iii-the-ultimate-challenge-amiga');
+INSERT INTO "game" VALUES(6059,'Marble Madness','https://ocremix.org/game/6059/marble-madness-amiga');
+INSERT INTO "game" VALUES(6081,'Menace','https://ocremix.org/game/6081/menace-amiga');
+INSERT INTO "game" VALUES(6158,'Nicky Boom','https://ocremix.org/game/6158/nicky-boom-amiga');
+INSERT INTO "game" VALUES(6256,'Bio-Hazard Battle','https://ocremix.org/game/6256/bio-hazard-battle-gen');
+INSERT INTO "game" VALUES(6308,'Comix Zone','https://ocremix.org/game/6308/comix-zone-gen');
+INSERT INTO "game" VALUES(6309,'Contra: Hard Corps','https://ocremix.org/game/6309/contra-hard-corps-gen');
+INSERT INTO "game" VALUES(6476,'Lemmings','https://ocremix.org/game/6476/lemmings-gen');
+INSERT INTO "game" VALUES(6511,'Tyrants: Fight Through Time','https://ocremix.org/game/6511/tyrants-fight-through-time-gen');
+INSERT INTO "game" VALUES(6611,'Puyo Puyo','https://ocremix.org/game/6611/puyo-puyo-gen');
+INSERT INTO "game" VALUES(6653,'Shining Force II','https://ocremix.org/game/6653/shining-force-ii-gen');
+INSERT INTO "game" VALUES(6662,'Skitchin''','https://ocremix.org/game/6662/skitchin-gen');
+INSERT INTO "game" VALUES(6753,'Twin Cobra','https://ocremix.org/game/6753/twin-cobra-gen');
+INSERT INTO "game" VALUES(6763,'VectorMan 2','https://ocremix.org/game/6763/vectorman-2-gen');
+INSERT INTO "game" VALUES(6876,'Castlevania Legends','https://ocremix.org/game/6876/castlevania-legends-gb');
+INSERT INTO "game" VALUES(6929,'The Final Fantasy Legend','https://ocremix.org/game/6929/final-fantasy-legend-gb');
+INSERT INTO "game" VALUES(7140,'Wario Land: Super Mario Land 3','https://ocremix.org/game/7140/wario-land-super-mario-land-3-gb');
+INSERT INTO "game" VALUES(7279,'Final Fantasy Crystal Chronicles','https://ocremix.org/game/7279/final-fantasy-crystal-chronicles-gcn');
+INSERT INTO "game" VALUES(7334,'Kirby Air Ride','https://ocremix.org/game/7334/kirby-air-ride-gcn');
+INSERT INTO "game" VALUES(7366,'Mario Kart: Double Dash!!','https://ocremix.org/game/7366/mario-kart-double-dash-gcn');
+INSERT INTO "game" VALUES(7456,'Pikmin','https://ocremix.org/game/7456/pikmin-gcn');
+INSERT INTO "game" VALUES(7480,'Resident Evil','https://ocremix.org/game/7480/resident-evil-gcn');
+INSERT INTO "game" VALUES(7501,'Shadow the Hedgehog','https://ocremix.org/game/7501/shadow-the-hedgehog-gcn');
+INSERT INTO "game" VALUES(7693,'Pinball Dreams','https://ocremix.org/game/7693/pinball-dreams-amiga');
+INSERT INTO "game" VALUES(8023,'Space Quest III: The Pirates of Pestulon','https://ocremix.org/game/8023/space-quest-iii-the-pirates-of-pestulon-amiga');
+INSERT INTO "game" VALUES(8283,'Turrican 3','https://ocremix.org/game/8283/turrican-3-amiga');
+INSERT INTO "game" VALUES(8417,'Xenon','https://ocremix.org/game/8417/xenon-amiga');
+INSERT INTO "game" VALUES(8437,'Zool: Ninja of the "Nth" Dimension','https://ocremix.org/game/8437/zool-ninja-of-the-nth-dimension-amiga');
+INSERT INTO "game" VALUES(8748,'Thunder Force V','https://ocremix.org/game/8748/thunder-force-v-sat');
+INSERT INTO "game" VALUES(8800,'Advance Wars','https://ocremix.org/game/8800/advance-wars-gba');
+INSERT INTO "game" VALUES(9081,'The Legend of Zelda: The Minish Cap','https://ocremix.org/game/9081/legend-of-zelda-the-minish-cap-gba');
+INSERT INTO "game" VALUES(9159,'Mother 3','https://ocremix.org/game/9159/mother-3-gba');
+INSERT INTO "game" VALUES(9399,'Yu-Gi-Oh! World Championship Tournament 2004','https://ocremix.org/game/9399/yu-gi-oh-world-championship-tournament-2004-gba');
+INSERT INTO "game" VALUES(9681,'Dragon Ball Z Budokai 2','https://ocremix.org/game/9681/dragon-ball-z-budokai-2-ps2');
+INSERT INTO "game" VALUES(9684,'Dragon Ball Z: Budokai Tenkaichi 2','https://ocremix.org/game/9684/dragon-ball-z-budokai-tenkaichi-2-ps2');
+INSERT INTO "game" VALUES(9705,'Dynasty Warriors 3','https://ocremix.org/game/9705/dynasty-warriors-3-ps2');
+INSERT INTO "game" VALUES(9998,'Kingdom Hearts II Final Mix','https://ocremix.org/game/9998/kingdom-hearts-ii-final-mix-ps2');
@@ -0,0 +1,44 @@
+INSERT INTO "game" VALUES(10142,'Monster Hunter','https://ocremix.org/game/10142/monster-hunter-ps2');
+INSERT INTO "game" VALUES(10484,'Silent Hill 3','https://ocremix.org/game/10484/silent-hill-3-ps2');
+INSERT INTO "game" VALUES(10586,'Suikoden III','https://ocremix.org/game/10586/suikoden-iii-ps2');
+INSERT INTO "game" VALUES(10810,'XGIII: Extreme G Racing','https://ocremix.org/game/10810/xgiii-extreme-g-racing-ps2');
+INSERT INTO "game" VALUES(10825,'Zone of the Enders: The 2nd Runner','https://ocremix.org/game/10825/zone-of-the-enders-the-2nd-runner-ps2');
+INSERT INTO "game" VALUES(10878,'Battletoads in Battlemaniacs','https://ocremix.org/game/10878/battletoads-in-battlemaniacs-snes');
+INSERT INTO "game" VALUES(10903,'Bubsy in: Claws Encounters of the Furred Kind','https://ocremix.org/game/10903/bubsy-in-claws-encounters-of-the-furred-kind-snes');
+INSERT INTO "game" VALUES(10916,'Castlevania: Dracula X','https://ocremix.org/game/10916/castlevania-dracula-x-snes');
+INSERT INTO "game" VALUES(11016,'Fire Emblem: Genealogy of the Holy War','https://ocremix.org/game/11016/fire-emblem-genealogy-of-the-holy-war-snes');
+INSERT INTO "game" VALUES(11028,'Front Mission: Gun Hazard','https://ocremix.org/game/11028/front-mission-gun-hazard-snes');
+INSERT INTO "game" VALUES(11120,'Kirby''s Dream Course','https://ocremix.org/game/11120/kirbys-dream-course-snes');
+INSERT INTO "game" VALUES(11121,'Kirby''s Dream Land 3','https://ocremix.org/game/11121/kirbys-dream-land-3-snes');
+INSERT INTO "game" VALUES(11134,'The Lawnmower Man','https://ocremix.org/game/11134/lawnmower-man-snes');
+INSERT INTO "game" VALUES(11250,'Paladin''s Quest','https://ocremix.org/game/11250/paladins-quest-snes');
+INSERT INTO "game" VALUES(11251,'Paperboy 2','https://ocremix.org/game/11251/paperboy-2-snes');
+INSERT INTO "game" VALUES(11252,'Parodius','https://ocremix.org/game/11252/parodius-snes');
+INSERT INTO "game" VALUES(11271,'Pop''n TwinBee: Rainbow Bell Adventures','https://ocremix.org/game/11271/popn-twinbee-rainbow-bell-adventures-snes');
+INSERT INTO "game" VALUES(11278,'Prince of Persia','https://ocremix.org/game/11278/prince-of-persia-snes');
+INSERT INTO "game" VALUES(11316,'Run Saber','https://ocremix.org/game/11316/run-saber-snes');
+INSERT INTO "game" VALUES(11364,'Spider-Man and Venom: Maximum Carnage','https://ocremix.org/game/11364/spider-man-and-venom-maximum-carnage-snes');
+INSERT INTO "game" VALUES(11375,'Street Fighter II: The World Warrior','https://ocremix.org/game/11375/street-fighter-ii-the-world-warrior-snes');
+INSERT INTO "game" VALUES(11401,'Super 3D Noah''s Ark','https://ocremix.org/game/11401/super-3d-noahs-ark-snes');
+INSERT INTO "game" VALUES(12508,'After Burner','https://ocremix.org/game/12508/after-burner-sms');
+INSERT INTO "game" VALUES(12546,'Castle of Illusion','https://ocremix.org/game/12546/castle-of-illusion-sms');
+INSERT INTO "game" VALUES(12612,'Golvellius: Valley of Doom','https://ocremix.org/game/12612/golvellius-valley-of-doom-sms');
+INSERT INTO "game" VALUES(12812,'Flashback: The Quest for Identity','https://ocremix.org/game/12812/flashback-the-quest-for-identity-scd');
+INSERT INTO "game" VALUES(13271,'Gunbird 2','https://ocremix.org/game/13271/gunbird-2-dc');
+INSERT INTO "game" VALUES(13313,'Metropolis Street Racer','https://ocremix.org/game/13313/metropolis-street-racer-dc');
+INSERT INTO "game" VALUES(13345,'Plasma Sword: Nightmare of Bilstein','https://ocremix.org/game/13345/plasma-sword-nightmare-of-bilstein-dc');
+INSERT INTO "game" VALUES(13854,'Beneath a Steel Sky','https://ocremix.org/game/13854/beneath-a-steel-sky-dos');
+INSERT INTO "game" VALUES(14512,'Doom','https://ocremix.org/game/14512/doom-dos');
+INSERT INTO "game" VALUES(14871,'Gabriel Knight: Sins of the Fathers','https://ocremix.org/game/14871/gabriel-knight-sins-of-the-fathers-dos');
+INSERT INTO "game" VALUES(15050,'Heretic','https://ocremix.org/game/15050/heretic-dos');
+INSERT INTO "game" VALUES(15244,'Jazz Jackrabbit','https://ocremix.org/game/15244/jazz-jackrabbit-dos');
+INSERT INTO "game" VALUES(15247,'Jazz Jackrabbit: Holiday Hare 1995','https://ocremix.org/game/15247/jazz-jackrabbit-holiday-hare-1995-dos');
+INSERT INTO "game" VALUES(15297,'The Lord of the Rings, Vol. I','https://ocremix.org/game/15297/lord-of-the-rings-vol-i-dos');
+INSERT INTO "game" VALUES(15669,'MegaRace','https://ocremix.org/game/15669/megarace-dos');
+INSERT INTO "game" VALUES(16150,'Psycho Pinball','https://ocremix.org/game/16150/psycho-pinball-dos');
+INSERT INTO "game" VALUES(16178,'Quake','https://ocremix.org/game/16178/quake-dos');
+INSERT INTO "game" VALUES(16193,'Quest for Glory IV: Shadows of Darkness','https://ocremix.org/game/16193/quest-for-glory-iv-shadows-of-darkness-dos');
+INSERT INTO "game" VALUES(16294,'Rise of the Triad: Dark War','https://ocremix.org/game/16294/rise-of-the-triad-dark-war-dos');
+INSERT INTO "game" VALUES(16825,'System Shock','https://ocremix.org/game/16825/system-shock-dos');
+INSERT INTO "game" VALUES(18760,'Cybernoid: The Fighting Machine','https://ocremix.org/game/18760/cybernoid-the-fighting-machine-spec');
+INSERT INTO "game" VALUES(18931,'Future Games','https://ocremix.org/game/18931/future-games-spec');
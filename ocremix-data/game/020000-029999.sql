@@ -0,0 +1,12 @@
+INSERT INTO "game" VALUES(21244,'Xenon','https://ocremix.org/game/21244/xenon-st');
+INSERT INTO "game" VALUES(22756,'Mickey Saves the Day','https://ocremix.org/game/22756/mickey-saves-the-day-win');
+INSERT INTO "game" VALUES(23192,'Final Fantasy XI Online: Rise of the Zilart','https://ocremix.org/game/23192/final-fantasy-xi-online-rise-of-the-zilart-win');
+INSERT INTO "game" VALUES(24382,'Maui Mallard in Cold Shadow','https://ocremix.org/game/24382/maui-mallard-in-cold-shadow-win');
+INSERT INTO "game" VALUES(25537,'RollerCoaster Tycoon','https://ocremix.org/game/25537/rollercoaster-tycoon-win');
+INSERT INTO "game" VALUES(25584,'RuneScape','https://ocremix.org/game/25584/runescape-win');
+INSERT INTO "game" VALUES(27107,'Ys: The Oath in Felghana','https://ocremix.org/game/27107/ys-the-oath-in-felghana-win');
+INSERT INTO "game" VALUES(28094,'Dance Dance Revolution Extreme','https://ocremix.org/game/28094/dance-dance-revolution-extreme-arc');
+INSERT INTO "game" VALUES(28135,'Darkstalkers: The Night Warriors','https://ocremix.org/game/28135/darkstalkers-the-night-warriors-arc');
+INSERT INTO "game" VALUES(28149,'Daytona USA','https://ocremix.org/game/28149/daytona-usa-arc');
+INSERT INTO "game" VALUES(28497,'Fantasy Zone','https://ocremix.org/game/28497/fantasy-zone-arc');
+INSERT INTO "game" VALUES(29292,'Killer Instinct','https://ocremix.org/game/29292/killer-instinct-arc');
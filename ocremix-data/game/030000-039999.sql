@@ -0,0 +1,14 @@
+INSERT INTO "game" VALUES(30400,'Power Drift','https://ocremix.org/game/30400/power-drift-arc');
+INSERT INTO "game" VALUES(30646,'Raiden III','https://ocremix.org/game/30646/raiden-iii-arc');
+INSERT INTO "game" VALUES(32278,'Wangan Midnight Maximum Tune','https://ocremix.org/game/32278/wangan-midnight-maximum-tune-arc');
+INSERT INTO "game" VALUES(33306,'Clystron','https://ocremix.org/game/33306/clystron-c64');
+INSERT INTO "game" VALUES(38752,'Animal Crossing: Wild World','https://ocremix.org/game/38752/animal-crossing-wild-world-nds');
+INSERT INTO "game" VALUES(38763,'Brain Age: Train Your Brain in Minutes a Day!','https://ocremix.org/game/38763/brain-age-train-your-brain-in-minutes-a-day-nds');
+INSERT INTO "game" VALUES(38825,'The Legend of Zelda: Phantom Hourglass','https://ocremix.org/game/38825/legend-of-zelda-phantom-hourglass-nds');
+INSERT INTO "game" VALUES(38846,'Mega Man Star Force: Pegasus','https://ocremix.org/game/38846/mega-man-star-force-pegasus-nds');
+INSERT INTO "game" VALUES(38867,'Phoenix Wright: Ace Attorney - Justice for All','https://ocremix.org/game/38867/phoenix-wright-ace-attorney-justice-for-all-nds');
+INSERT INTO "game" VALUES(38876,'Pokémon Mystery Dungeon: Blue Rescue Team','https://ocremix.org/game/38876/pokemon-mystery-dungeon-blue-rescue-team-nds');
+INSERT INTO "game" VALUES(38902,'Sonic Rush','https://ocremix.org/game/38902/sonic-rush-nds');
+INSERT INTO "game" VALUES(38947,'Yoshi''s Island DS','https://ocremix.org/game/38947/yoshis-island-ds-nds');
+INSERT INTO "game" VALUES(39462,'Ninja Gaiden','https://ocremix.org/game/39462/ninja-gaiden-xbox');
+INSERT INTO "game" VALUES(39576,'Silent Hill 2: Restless Dreams','https://ocremix.org/game/39576/silent-hill-2-restless-dreams-xbox');
@@ -0,0 +1,30 @@
+INSERT INTO "game" VALUES(40026,'Snatcher','https://ocremix.org/game/40026/snatcher-pc88');
+INSERT INTO "game" VALUES(40165,'Ys: Ancient Ys Vanished','https://ocremix.org/game/40165/ys-ancient-ys-vanished-pc88');
+INSERT INTO "game" VALUES(40166,'Ys II: Ancient Ys Vanished - The Final Chapter','https://ocremix.org/game/40166/ys-ii-ancient-ys-vanished-the-final-chapter-pc88');
+INSERT INTO "game" VALUES(40407,'Pokémon Pinball','https://ocremix.org/game/40407/pokemon-pinball-gbc');
+INSERT INTO "game" VALUES(40735,'The Legend of Heroes V: A Cagesong of the Ocean','https://ocremix.org/game/40735/legend-of-heroes-v-a-cagesong-of-the-ocean-psp');
+INSERT INTO "game" VALUES(41542,'Command & Conquer','https://ocremix.org/game/41542/command-and-conquer-ps1');
+INSERT INTO "game" VALUES(41568,'Crash Bandicoot 2: Cortex Strikes Back','https://ocremix.org/game/41568/crash-bandicoot-2-cortex-strikes-back-ps1');
+INSERT INTO "game" VALUES(41569,'Crash Bandicoot: Warped','https://ocremix.org/game/41569/crash-bandicoot-warped-ps1');
+INSERT INTO "game" VALUES(41584,'Croc: Legend of the Gobbos','https://ocremix.org/game/41584/croc-legend-of-the-gobbos-ps1');
+INSERT INTO "game" VALUES(41698,'Digimon World','https://ocremix.org/game/41698/digimon-world-ps1');
+INSERT INTO "game" VALUES(41764,'Dragon Warrior VII','https://ocremix.org/game/41764/dragon-warrior-vii-ps1');
+INSERT INTO "game" VALUES(41871,'Final Fantasy','https://ocremix.org/game/41871/final-fantasy-ps1');
+INSERT INTO "game" VALUES(41999,'Gradius Gaiden','https://ocremix.org/game/41999/gradius-gaiden-ps1');
+INSERT INTO "game" VALUES(42022,'Guilty Gear','https://ocremix.org/game/42022/guilty-gear-ps1');
+INSERT INTO "game" VALUES(42288,'Legend of Mana','https://ocremix.org/game/42288/legend-of-mana-ps1');
+INSERT INTO "game" VALUES(42328,'Lunar 2: Eternal Blue Complete','https://ocremix.org/game/42328/lunar-2-eternal-blue-complete-ps1');
+INSERT INTO "game" VALUES(42860,'R4: Ridge Racer Type 4','https://ocremix.org/game/42860/r4-ridge-racer-type-4-ps1');
+INSERT INTO "game" VALUES(43180,'Spyro the Dragon','https://ocremix.org/game/43180/spyro-the-dragon-ps1');
+INSERT INTO "game" VALUES(43637,'Yu-Gi-Oh!: Forbidden Memories','https://ocremix.org/game/43637/yu-gi-oh-forbidden-memories-ps1');
+INSERT INTO "game" VALUES(45416,'Super Paper Mario','https://ocremix.org/game/45416/super-paper-mario-wii');
+INSERT INTO "game" VALUES(45424,'Wii Sports','https://ocremix.org/game/45424/wii-sports-wii');
+INSERT INTO "game" VALUES(45434,'Resident Evil: The Umbrella Chronicles','https://ocremix.org/game/45434/resident-evil-the-umbrella-chronicles-wii');
+INSERT INTO "game" VALUES(45659,'Mario Kart Wii','https://ocremix.org/game/45659/mario-kart-wii-wii');
+INSERT INTO "game" VALUES(47072,'Shin Megami Tensei: Persona 4','https://ocremix.org/game/47072/shin-megami-tensei-persona-4-ps2');
+INSERT INTO "game" VALUES(47232,'Kyatto Ninden Teyandee','https://ocremix.org/game/47232/kyatto-ninden-teyandee-nes');
+INSERT INTO "game" VALUES(47578,'Aah! Harimanada','https://ocremix.org/game/47578/aah-harimanada-gen');
+INSERT INTO "game" VALUES(47705,'Jeanne d''Arc','https://ocremix.org/game/47705/jeanne-darc-psp');
+INSERT INTO "game" VALUES(47752,'Snowboard Kids','https://ocremix.org/game/47752/snowboard-kids-n64');
+INSERT INTO "game" VALUES(48217,'Castle Crashers','https://ocremix.org/game/48217/castle-crashers-xb360');
+INSERT INTO "game" VALUES(49613,'One Piece: Unlimited Cruise 1 - The Treasure Beneath the Waves','https://ocremix.org/game/49613/one-piece-unlimited-cruise-1-the-treasure-beneath-the-waves-wii');
@@ -0,0 +1,14 @@
+INSERT INTO "game" VALUES(50178,'Sonic Unleashed','https://ocremix.org/game/50178/sonic-unleashed-xb360');
+INSERT INTO "game" VALUES(51128,'Mario & Luigi: Bowser''s Inside Story','https://ocremix.org/game/51128/mario-and-luigi-bowsers-inside-story-nds');
+INSERT INTO "game" VALUES(51460,'BioShock','https://ocremix.org/game/51460/bioshock-win');
+INSERT INTO "game" VALUES(51885,'Touhou Fuujinroku: Mountain of Faith','https://ocremix.org/game/51885/touhou-fuujinroku-mountain-of-faith-win');
+INSERT INTO "game" VALUES(51936,'New Super Mario Bros. Wii','https://ocremix.org/game/51936/new-super-mario-bros-wii-wii');
+INSERT INTO "game" VALUES(52074,'Brütal Legend','https://ocremix.org/game/52074/brutal-legend-ps3');
+INSERT INTO "game" VALUES(52276,'Final Fantasy IV','https://ocremix.org/game/52276/final-fantasy-iv-nds');
+INSERT INTO "game" VALUES(53998,'Dahna: Megami Tanjou','https://ocremix.org/game/53998/dahna-megami-tanjou-gen');
+INSERT INTO "game" VALUES(54064,'Earthworm Jim','https://ocremix.org/game/54064/earthworm-jim-gen');
+INSERT INTO "game" VALUES(57243,'Sonic Rush Adventure','https://ocremix.org/game/57243/sonic-rush-adventure-nds');
+INSERT INTO "game" VALUES(57617,'Pokémon Mystery Dungeon: Explorers of Sky','https://ocremix.org/game/57617/pokemon-mystery-dungeon-explorers-of-sky-nds');
+INSERT INTO "game" VALUES(57688,'The Legend of Zelda: Spirit Tracks','https://ocremix.org/game/57688/legend-of-zelda-spirit-tracks-nds');
+INSERT INTO "game" VALUES(57748,'Pokémon SoulSilver Version','https://ocremix.org/game/57748/pokemon-soulsilver-version-nds');
+INSERT INTO "game" VALUES(59073,'Katamari Forever','https://ocremix.org/game/59073/katamari-forever-ps3');
@@ -0,0 +1 @@
+INSERT INTO "game" VALUES(61403,'Tintin: Prisoners of the Sun','https://ocremix.org/game/61403/tintin-prisoners-of-the-sun-gbc');
@@ -0,0 +1 @@
+INSERT INTO "game" VALUES(70770,'Boulder Dash','https://ocremix.org/game/70770/boulder-dash-c64');
@@ -0,0 +1,156 @@
+INSERT INTO "game" VALUES(93674,'Kingdom Hearts: Birth by Sleep','https://ocremix.org/game/93674/kingdom-hearts-birth-by-sleep-psp');
+INSERT INTO "game" VALUES(94413,'Kirby''s Epic Yarn','https://ocremix.org/game/94413/kirbys-epic-yarn-wii');
+INSERT INTO "game" VALUES(94482,'Yu-Gi-Oh! 5D''s: Duel Transer','https://ocremix.org/game/94482/yu-gi-oh-5ds-duel-transer-wii');
+INSERT INTO "game" VALUES(94494,'Metroid: Other M','https://ocremix.org/game/94494/metroid-other-m-wii');
+INSERT INTO "game" VALUES(94508,'Kirby''s Return to Dream Land','https://ocremix.org/game/94508/kirbys-return-to-dream-land-wii');
+INSERT INTO "game" VALUES(94601,'Kid Icarus: Uprising','https://ocremix.org/game/94601/kid-icarus-uprising-3ds');
+INSERT INTO "game" VALUES(94625,'Shin Megami Tensei: Persona 3 FES','https://ocremix.org/game/94625/shin-megami-tensei-persona-3-fes-ps2');
+INSERT INTO "game" VALUES(94775,'Mario Kart 7','https://ocremix.org/game/94775/mario-kart-7-3ds');
+INSERT INTO "game" VALUES(94790,'Fire Emblem: Awakening','https://ocremix.org/game/94790/fire-emblem-awakening-3ds');
+INSERT INTO "game" VALUES(94800,'Animal Crossing: New Leaf','https://ocremix.org/game/94800/animal-crossing-new-leaf-3ds');
+INSERT INTO "game" VALUES(94802,'Super Mario 3D Land','https://ocremix.org/game/94802/super-mario-3d-land-3ds');
+INSERT INTO "game" VALUES(94860,'The Legend of Zelda: A Link Between Worlds','https://ocremix.org/game/94860/legend-of-zelda-a-link-between-worlds-3ds');
+INSERT INTO "game" VALUES(94861,'Super Mario 3D World','https://ocremix.org/game/94861/super-mario-3d-world-wiiu');
+INSERT INTO "game" VALUES(94868,'Kirby: Triple Deluxe','https://ocremix.org/game/94868/kirby-triple-deluxe-3ds');
+INSERT INTO "game" VALUES(94869,'Donkey Kong Country: Tropical Freeze','https://ocremix.org/game/94869/donkey-kong-country-tropical-freeze-wiiu');
+INSERT INTO "game" VALUES(94917,'Mario Kart 8','https://ocremix.org/game/94917/mario-kart-8-wiiu');
+INSERT INTO "game" VALUES(95030,'Titanfall','https://ocremix.org/game/95030/titanfall-win');
+INSERT INTO "game" VALUES(95031,'Shovel Knight','https://ocremix.org/game/95031/shovel-knight-wiiu');
+INSERT INTO "game" VALUES(95032,'Freedom Planet','https://ocremix.org/game/95032/freedom-planet-win');
+INSERT INTO "game" VALUES(95033,'FTL: Faster Than Light','https://ocremix.org/game/95033/ftl-faster-than-light-win');
+INSERT INTO "game" VALUES(95038,'Fez','https://ocremix.org/game/95038/fez-xb360');
+INSERT INTO "game" VALUES(95039,'Divekick','https://ocremix.org/game/95039/divekick-ps3');
+INSERT INTO "game" VALUES(95050,'The Witcher 2: Assassins of Kings','https://ocremix.org/game/95050/witcher-2-assassins-of-kings-win');
+INSERT INTO "game" VALUES(95051,'Splatoon','https://ocremix.org/game/95051/splatoon-wiiu');
+INSERT INTO "game" VALUES(95061,'Drakengard 3','https://ocremix.org/game/95061/drakengard-3-ps3');
+INSERT INTO "game" VALUES(95077,'Undertale','https://ocremix.org/game/95077/undertale-win');
+INSERT INTO "game" VALUES(95083,'Tiny Barbarian DX','https://ocremix.org/game/95083/tiny-barbarian-dx-win');
+INSERT INTO "game" VALUES(95099,'Pokémon Super Mystery Dungeon','https://ocremix.org/game/95099/pokemon-super-mystery-dungeon-3ds');
+INSERT INTO "game" VALUES(95152,'Bloodborne','https://ocremix.org/game/95152/bloodborne-ps4');
+INSERT INTO "game" VALUES(95154,'Threes','https://ocremix.org/game/95154/threes-ios');
+INSERT INTO "game" VALUES(95158,'Pokkén Tournament','https://ocremix.org/game/95158/pokken-tournament-wiiu');
+INSERT INTO "game" VALUES(95159,'Star Fox Zero','https://ocremix.org/game/95159/star-fox-zero-wiiu');
+INSERT INTO "game" VALUES(95160,'Bad Piggies','https://ocremix.org/game/95160/bad-piggies-ios');
+INSERT INTO "game" VALUES(95162,'Kirby: Planet Robobot','https://ocremix.org/game/95162/kirby-planet-robobot-3ds');
+INSERT INTO "game" VALUES(95163,'Mass Effect 3','https://ocremix.org/game/95163/mass-effect-3-xb360');
+INSERT INTO "game" VALUES(95212,'Pony Island','https://ocremix.org/game/95212/pony-island-win');
+INSERT INTO "game" VALUES(95277,'Paper Mario: Color Splash','https://ocremix.org/game/95277/paper-mario-color-splash-wiiu');
+INSERT INTO "game" VALUES(95278,'Spelunky','https://ocremix.org/game/95278/spelunky-xb360');
+INSERT INTO "game" VALUES(95344,'Halo 5: Guardians','https://ocremix.org/game/95344/halo-5-guardians-xbone');
+INSERT INTO "game" VALUES(95346,'Remember Me','https://ocremix.org/game/95346/remember-me-xb360');
+INSERT INTO "game" VALUES(95347,'Undeadline','https://ocremix.org/game/95347/undeadline-msx');
+INSERT INTO "game" VALUES(95349,'The Witcher 3: Wild Hunt','https://ocremix.org/game/95349/witcher-3-wild-hunt-win');
+INSERT INTO "game" VALUES(95354,'Fire Emblem Heroes','https://ocremix.org/game/95354/fire-emblem-heroes-ios');
+INSERT INTO "game" VALUES(95356,'Warframe','https://ocremix.org/game/95356/warframe-win');
+INSERT INTO "game" VALUES(95359,'The Legend of Zelda: Breath of the Wild','https://ocremix.org/game/95359/legend-of-zelda-breath-of-the-wild-swtch');
+INSERT INTO "game" VALUES(95360,'The Legend of Zelda: Breath of the Wild','https://ocremix.org/game/95360/legend-of-zelda-breath-of-the-wild-wiiu');
+INSERT INTO "game" VALUES(95446,'Dark Souls III','https://ocremix.org/game/95446/dark-souls-iii-ps4');
+INSERT INTO "game" VALUES(95449,'NieR: Automata','https://ocremix.org/game/95449/nier-automata-ps4');
+INSERT INTO "game" VALUES(95452,'Pokémon Sun','https://ocremix.org/game/95452/pokemon-sun-3ds');
+INSERT INTO "game" VALUES(95454,'Shantae and the Pirate''s Curse','https://ocremix.org/game/95454/shantae-and-the-pirates-curse-3ds');
+INSERT INTO "game" VALUES(95459,'Zelda: The Wand of Gamelon','https://ocremix.org/game/95459/zelda-the-wand-of-gamelon-cdi');
+INSERT INTO "game" VALUES(95474,'Chip''s Challenge','https://ocremix.org/game/95474/chips-challenge-win');
+INSERT INTO "game" VALUES(95475,'Bitstream','https://ocremix.org/game/95475/bitstream-ios');
+INSERT INTO "game" VALUES(95477,'The Silver Case','https://ocremix.org/game/95477/silver-case-win');
+INSERT INTO "game" VALUES(95486,'Super Mario Odyssey','https://ocremix.org/game/95486/super-mario-odyssey-swtch');
+INSERT INTO "game" VALUES(95495,'Line Defense','https://ocremix.org/game/95495/line-defense-ios');
+INSERT INTO "game" VALUES(95499,'Crypt of the NecroDancer','https://ocremix.org/game/95499/crypt-of-the-necrodancer-win');
+INSERT INTO "game" VALUES(95500,'The Wolf Among Us: Season One','https://ocremix.org/game/95500/wolf-among-us-season-one-win');
+INSERT INTO "game" VALUES(95511,'Assassin''s Creed Brotherhood','https://ocremix.org/game/95511/assassins-creed-brotherhood-ps3');
+INSERT INTO "game" VALUES(95512,'Tekken 7','https://ocremix.org/game/95512/tekken-7-arc');
+INSERT INTO "game" VALUES(95513,'Tangledeep','https://ocremix.org/game/95513/tangledeep-win');
+INSERT INTO "game" VALUES(95516,'Cat Lady','https://ocremix.org/game/95516/cat-lady-win');
+INSERT INTO "game" VALUES(95526,'Assassin''s Creed IV: Black Flag','https://ocremix.org/game/95526/assassins-creed-iv-black-flag-ps3');
+INSERT INTO "game" VALUES(95530,'Uncharted 4: A Thief''s End','https://ocremix.org/game/95530/uncharted-4-a-thiefs-end-ps4');
+INSERT INTO "game" VALUES(95531,'Sonic Mania','https://ocremix.org/game/95531/sonic-mania-swtch');
+INSERT INTO "game" VALUES(95544,'Hyper Light Drifter','https://ocremix.org/game/95544/hyper-light-drifter-win');
+INSERT INTO "game" VALUES(95554,'Hollow Knight','https://ocremix.org/game/95554/hollow-knight-win');
+INSERT INTO "game" VALUES(95557,'Deltarune','https://ocremix.org/game/95557/deltarune-win');
+INSERT INTO "game" VALUES(95560,'Octopath Traveler','https://ocremix.org/game/95560/octopath-traveler-swtch');
+INSERT INTO "game" VALUES(95562,'Sea of Thieves','https://ocremix.org/game/95562/sea-of-thieves-xbone');
+INSERT INTO "game" VALUES(95585,'Hunt: Showdown','https://ocremix.org/game/95585/hunt-showdown-win');
+INSERT INTO "game" VALUES(95587,'Animal Crossing: New Horizons','https://ocremix.org/game/95587/animal-crossing-new-horizons-swtch');
+INSERT INTO "game" VALUES(95611,'Stardew Valley','https://ocremix.org/game/95611/stardew-valley-win');
+INSERT INTO "game" VALUES(95612,'Assassin''s Creed Odyssey','https://ocremix.org/game/95612/assassins-creed-odyssey-win');
+INSERT INTO "game" VALUES(95613,'Stardew Valley','https://ocremix.org/game/95613/stardew-valley-ps4');
+INSERT INTO "game" VALUES(95615,'Pokémon Black Version','https://ocremix.org/game/95615/pokemon-black-version-nds');
+INSERT INTO "game" VALUES(95627,'God of War','https://ocremix.org/game/95627/god-of-war-ps4');
+INSERT INTO "game" VALUES(95628,'Night in the Woods','https://ocremix.org/game/95628/night-in-the-woods-win');
+INSERT INTO "game" VALUES(95630,'Amnesia: The Dark Descent','https://ocremix.org/game/95630/amnesia-the-dark-descent-win');
+INSERT INTO "game" VALUES(95636,'Celeste','https://ocremix.org/game/95636/celeste-win');
+INSERT INTO "game" VALUES(95643,'2064: Read Only Memories','https://ocremix.org/game/95643/2064-read-only-memories-ps4');
+INSERT INTO "game" VALUES(95701,'Wargroove','https://ocremix.org/game/95701/wargroove-win');
+INSERT INTO "game" VALUES(95702,'Ys VIII: Lacrimosa of Dana','https://ocremix.org/game/95702/ys-viii-lacrimosa-of-dana-vita');
+INSERT INTO "game" VALUES(95783,'Crash Bandicoot 4: It''s About Time','https://ocremix.org/game/95783/crash-bandicoot-4-its-about-time-ps4');
+INSERT INTO "game" VALUES(95784,'Metroid Prime: Federation Force','https://ocremix.org/game/95784/metroid-prime-federation-force-3ds');
+INSERT INTO "game" VALUES(95787,'The Binding of Isaac: Rebirth','https://ocremix.org/game/95787/binding-of-isaac-rebirth-win');
+INSERT INTO "game" VALUES(95810,'King''s Quest VI: Heir Today, Gone Tomorrow','https://ocremix.org/game/95810/kings-quest-vi-heir-today-gone-tomorrow-win');
+INSERT INTO "game" VALUES(95821,'Tunic','https://ocremix.org/game/95821/tunic-win');
+INSERT INTO "game" VALUES(95822,'Lyle in Cube Sector','https://ocremix.org/game/95822/lyle-in-cube-sector-win');
+INSERT INTO "game" VALUES(95823,'Pokémon Scarlet','https://ocremix.org/game/95823/pokemon-scarlet-swtch');
+INSERT INTO "game" VALUES(95825,'Ori and the Blind Forest','https://ocremix.org/game/95825/ori-and-the-blind-forest-win');
+INSERT INTO "game" VALUES(95826,'Ori and the Blind Forest: Definitive Edition','https://ocremix.org/game/95826/ori-and-the-blind-forest-definitive-edition-swtch');
+INSERT INTO "game" VALUES(95827,'Shin Megami Tensei V','https://ocremix.org/game/95827/shin-megami-tensei-v-swtch');
+INSERT INTO "game" VALUES(95828,'Atelier Shallie: Alchemists of the Dusk Sea','https://ocremix.org/game/95828/atelier-shallie-alchemists-of-the-dusk-sea-ps3');
+INSERT INTO "game" VALUES(95829,'Final Fantasy VII Remake','https://ocremix.org/game/95829/final-fantasy-vii-remake-ps4');
+INSERT INTO "game" VALUES(95830,'Stray','https://ocremix.org/game/95830/stray-win');
+INSERT INTO "game" VALUES(95831,'Yu-Gi-Oh! Duel Links','https://ocremix.org/game/95831/yu-gi-oh-duel-links-win');
+INSERT INTO "game" VALUES(95832,'Super Mario Maker 2','https://ocremix.org/game/95832/super-mario-maker-2-swtch');
+INSERT INTO "game" VALUES(95833,'Chicory: A Colorful Tale','https://ocremix.org/game/95833/chicory-a-colorful-tale-win');
+INSERT INTO "game" VALUES(95834,'The Legend of Zelda: Tears of the Kingdom','https://ocremix.org/game/95834/legend-of-zelda-tears-of-the-kingdom-swtch');
+INSERT INTO "game" VALUES(95838,'Ender Lilies: Quietus of the Knights','https://ocremix.org/game/95838/ender-lilies-quietus-of-the-knights-win');
+INSERT INTO "game" VALUES(95839,'Final Fantasy XIV','https://ocremix.org/game/95839/final-fantasy-xiv-win');
+INSERT INTO "game" VALUES(95840,'Super Smash Bros. Ultimate','https://ocremix.org/game/95840/super-smash-bros-ultimate-swtch');
+INSERT INTO "game" VALUES(95841,'Micro Mages','https://ocremix.org/game/95841/micro-mages-nes');
+INSERT INTO "game" VALUES(95842,'Child of Light','https://ocremix.org/game/95842/child-of-light-win');
+INSERT INTO "game" VALUES(95843,'Baba Is You','https://ocremix.org/game/95843/baba-is-you-win');
+INSERT INTO "game" VALUES(95845,'Gunman Clive 2','https://ocremix.org/game/95845/gunman-clive-2-3ds');
+INSERT INTO "game" VALUES(95846,'Genshin Impact','https://ocremix.org/game/95846/genshin-impact-win');
+INSERT INTO "game" VALUES(95847,'Horizon Zero Dawn','https://ocremix.org/game/95847/horizon-zero-dawn-ps4');
+INSERT INTO "game" VALUES(95852,'Cuphead','https://ocremix.org/game/95852/cuphead-win');
+INSERT INTO "game" VALUES(95857,'Finding Paradise','https://ocremix.org/game/95857/finding-paradise-win');
+INSERT INTO "game" VALUES(95858,'Flowstone Saga','https://ocremix.org/game/95858/flowstone-saga-win');
+INSERT INTO "game" VALUES(95859,'Balatro','https://ocremix.org/game/95859/balatro-win');
+INSERT INTO "game" VALUES(95860,'Super Hexagon','https://ocremix.org/game/95860/super-hexagon-ios');
+INSERT INTO "game" VALUES(95861,'Octopath Traveler II','https://ocremix.org/game/95861/octopath-traveler-ii-swtch');
+INSERT INTO "game" VALUES(95862,'Globulous','https://ocremix.org/game/95862/globulous-ios');
+INSERT INTO "game" VALUES(95865,'Bravely Second: End Layer','https://ocremix.org/game/95865/bravely-second-end-layer-3ds');
+INSERT INTO "game" VALUES(95866,'Kirby and the Forgotten Land','https://ocremix.org/game/95866/kirby-and-the-forgotten-land-swtch');
+INSERT INTO "game" VALUES(95867,'Crash Bandicoot N. Sane Trilogy','https://ocremix.org/game/95867/crash-bandicoot-n-sane-trilogy-ps4');
+INSERT INTO "game" VALUES(95868,'Signalis','https://ocremix.org/game/95868/signalis-win');
+INSERT INTO "game" VALUES(95869,'Elden Ring','https://ocremix.org/game/95869/elden-ring-win');
+INSERT INTO "game" VALUES(95873,'Inscryption','https://ocremix.org/game/95873/inscryption-win');
+INSERT INTO "game" VALUES(95874,'Ultimate Paintball Challenge','https://ocremix.org/game/95874/ultimate-paintball-challenge-win');
+INSERT INTO "game" VALUES(95876,'The Great Ace Attorney 2: Resolve','https://ocremix.org/game/95876/great-ace-attorney-2-resolve-3ds');
+INSERT INTO "game" VALUES(95877,'Baldur''s Gate III','https://ocremix.org/game/95877/baldurs-gate-iii-win');
+INSERT INTO "game" VALUES(95878,'Disco Elysium','https://ocremix.org/game/95878/disco-elysium-win');
+INSERT INTO "game" VALUES(95880,'Helldivers II','https://ocremix.org/game/95880/helldivers-ii-ps5');
+INSERT INTO "game" VALUES(95882,'Pokémon Trading Card Game Pocket','https://ocremix.org/game/95882/pokemon-trading-card-game-pocket-ios');
+INSERT INTO "game" VALUES(95884,'Final Fantasy XVI','https://ocremix.org/game/95884/final-fantasy-xvi-ps5');
+INSERT INTO "game" VALUES(95886,'Lisa: The Painful','https://ocremix.org/game/95886/lisa-the-painful-win');
+INSERT INTO "game" VALUES(95888,'Outer Wilds','https://ocremix.org/game/95888/outer-wilds-win');
+INSERT INTO "game" VALUES(95889,'Slay the Spire','https://ocremix.org/game/95889/slay-the-spire-win');
+INSERT INTO "game" VALUES(95892,'Final Fantasy VII Rebirth','https://ocremix.org/game/95892/final-fantasy-vii-rebirth-ps5');
+INSERT INTO "game" VALUES(95893,'ValiDate: Struggling Singles in Your Area','https://ocremix.org/game/95893/validate-struggling-singles-in-your-area-win');
+INSERT INTO "game" VALUES(95894,'Pokémon Sleep','https://ocremix.org/game/95894/pokemon-sleep-ios');
+INSERT INTO "game" VALUES(95896,'Bloodstained: Curse of the Moon','https://ocremix.org/game/95896/bloodstained-curse-of-the-moon-win');
+INSERT INTO "game" VALUES(95898,'Grim Dawn','https://ocremix.org/game/95898/grim-dawn-win');
+INSERT INTO "game" VALUES(95899,'Animal Well','https://ocremix.org/game/95899/animal-well-win');
+INSERT INTO "game" VALUES(95900,'A Short Hike','https://ocremix.org/game/95900/short-hike-win');
+INSERT INTO "game" VALUES(95901,'Xenoblade Chronicles X','https://ocremix.org/game/95901/xenoblade-chronicles-x-wiiu');
+INSERT INTO "game" VALUES(95902,'Crypt Custodian','https://ocremix.org/game/95902/crypt-custodian-win');
+INSERT INTO "game" VALUES(95903,'Fire Emblem Engage','https://ocremix.org/game/95903/fire-emblem-engage-swtch');
+INSERT INTO "game" VALUES(95906,'Microsoft Flight Simulator','https://ocremix.org/game/95906/microsoft-flight-simulator-win');
+INSERT INTO "game" VALUES(95907,'Persona 5','https://ocremix.org/game/95907/persona-5-ps4');
+INSERT INTO "game" VALUES(95908,'Shin Megami Tensei IV','https://ocremix.org/game/95908/shin-megami-tensei-iv-3ds');
+INSERT INTO "game" VALUES(95910,'The Oregon Trail','https://ocremix.org/game/95910/oregon-trail-win');
+INSERT INTO "game" VALUES(95911,'Look Outside','https://ocremix.org/game/95911/look-outside-win');
+INSERT INTO "game" VALUES(95913,'Pikmin 4','https://ocremix.org/game/95913/pikmin-4-swtch');
+INSERT INTO "game" VALUES(95914,'Brothers: A Tale of Two Sons','https://ocremix.org/game/95914/brothers-a-tale-of-two-sons-xb360');
+INSERT INTO "game" VALUES(95915,'I Was a Teenage Exocolonist','https://ocremix.org/game/95915/i-was-a-teenage-exocolonist-win');
+INSERT INTO "game" VALUES(95916,'Chronicon','https://ocremix.org/game/95916/chronicon-win');
+INSERT INTO "game" VALUES(95917,'Salt and Sanctuary','https://ocremix.org/game/95917/salt-and-sanctuary-ps4');
+INSERT INTO "game" VALUES(95921,'Gravity Circuit','https://ocremix.org/game/95921/gravity-circuit-win');
+INSERT INTO "game" VALUES(95925,'Neon White','https://ocremix.org/game/95925/neon-white-win');
+INSERT INTO "game" VALUES(95926,'Pyre','https://ocremix.org/game/95926/pyre-win');
+INSERT INTO "game" VALUES(95928,'Valdis Story: Abyssal City','https://ocremix.org/game/95928/valdis-story-abyssal-city-win');
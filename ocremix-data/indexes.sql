@@ -0,0 +1,3 @@
+CREATE INDEX remix_artist_artist_id on remix_artist (artist_id, remix_id);
+CREATE INDEX remix_import_datetime on remix (import_datetime);
+CREATE INDEX remix_tag_tag_id on remix_tag (tag_id, remix_id);
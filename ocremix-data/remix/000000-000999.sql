@@ -0,0 +1,882 @@
+INSERT INTO "remix" VALUES(1,'Shin Shuriken Jam','Shinobi','2026-07-31T14:59:13.701734+00:00','https://www.youtube.com/watch?v=z4D7oqxWS4M',81,'https://ocrmirror.org/files/music/remixes/Shinobi_Shin_Shuriken_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2,'Prehistoric Xmas','Bonk''s Adventure','2026-07-31T07:21:11.935569+00:00','https://www.youtube.com/watch?v=0Wqrz01KU2Q',44,'https://ocrmirror.org/files/music/remixes/Bonk''s_Adventure_Prehistoric_Xmas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3,'Dorsal Dub','Ecco the Dolphin','2026-07-30T21:42:32.535625+00:00','https://www.youtube.com/watch?v=5fwJpWMV5qs',52,'https://ocrmirror.org/files/music/remixes/Ecco_the_Dolphin_Dorsal_Dub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4,'Trance Version','Ghosts''n Goblins','2026-07-31T07:21:11.582247+00:00','https://www.youtube.com/watch?v=hqMwW7Rvg-4',1201,'https://ocrmirror.org/files/music/remixes/Ghosts''n_Goblins_Trance_Version_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5,'Instant','OutRun','2026-07-31T07:21:11.123172+00:00','https://www.youtube.com/watch?v=jw2NwSIlrQs',139,'https://ocrmirror.org/files/music/remixes/OutRun_Instant_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(6,'Legacy','Phantasy Star III: Generations of Doom','2026-07-30T20:01:30.018666+00:00','https://www.youtube.com/watch?v=7KK4a4AxuX8',95,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_3_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(7,'El Salsa','Rolling Thunder','2026-07-30T23:32:33.538827+00:00','https://www.youtube.com/watch?v=Of0O0BJpUhc',181,'https://ocrmirror.org/files/music/remixes/Rolling_Thunder_El_Salsa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(8,'1999 (2000 Mix)','Arkanoid','2026-07-31T03:59:39.746262+00:00','https://www.youtube.com/watch?v=Y14uSpTU4kM',31,'https://ocrmirror.org/files/music/remixes/Arkanoid_1999_(2000_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(9,'Disco','Space Harrier','2026-07-30T23:32:34.967412+00:00','https://www.youtube.com/watch?v=Uc-UIWWTnWM',97,'https://ocrmirror.org/files/music/remixes/Space_Harrier_Disco_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(10,'Wah-Wah','Streets of Rage','2026-07-31T03:59:40.462309+00:00','https://www.youtube.com/watch?v=4EnKauQI05c',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Wah-Wah_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(11,'Death Adder Trance','Golden Axe','2026-07-30T23:32:33.361796+00:00','https://www.youtube.com/watch?v=vKjhG6cxsS4',90,'https://ocrmirror.org/files/music/remixes/Golden_Axe_Death_Adder_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(12,'Peaperboayh','Paperboy','2026-07-30T20:01:28.565877+00:00','https://www.youtube.com/watch?v=jkdstCSfmOI',206,'https://ocrmirror.org/files/music/remixes/Paperboy_Peaperboayh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(13,'Alis Overture','Phantasy Star','2026-07-30T13:05:38.288116+00:00','https://www.youtube.com/watch?v=bQ84qViP9Pw',93,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_Alis_Overture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(14,'Slavic Roots','Tetris','2026-07-31T10:04:43.473077+00:00','https://www.youtube.com/watch?v=kfpsAq1k9Lo',510,'https://ocrmirror.org/files/music/remixes/Tetris_Slavic_Roots_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(15,'Hillbilly Rodeo','Bubble Bobble','2026-07-31T17:04:15.902167+00:00','https://www.youtube.com/watch?v=kO5ng3fWivI',46,'https://ocrmirror.org/files/music/remixes/Bubble_Bobble_Hillbilly_Rodeo_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(19,'Frivolous Funk','Super Mario Bros.','2026-07-31T14:59:13.488847+00:00','https://www.youtube.com/watch?v=r7IyFUdYmPI',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Frivolous_Funk_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(21,'64-bit','Pac-Man','2026-07-30T21:42:32.041980+00:00','https://www.youtube.com/watch?v=9qrqc3kw75I',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_64-bit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(22,'Rabbit Joint Cover','The Legend of Zelda','2026-07-31T20:41:20.736263+00:00','https://www.youtube.com/watch?v=YSUI0hNdRxo',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Rabbit_Joint_Cover_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(26,'Hyrulian','The Legend of Zelda','2026-07-31T12:26:14.210444+00:00','https://www.youtube.com/watch?v=MhAuXw5E9PQ',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Hyrulian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(28,'Sinergia','Pac-Man','2026-07-31T12:26:14.748659+00:00','https://www.youtube.com/watch?v=2mdIw6_ieV8',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_Sinergia_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(29,'Sugar High','Alex Kidd in Miracle World','2026-07-30T20:01:28.934096+00:00','https://www.youtube.com/watch?v=_sFZgncLEVQ',27,'https://ocrmirror.org/files/music/remixes/Alex_Kidd_in_Miracle_World_Sugar_High_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(30,'AMEN Reflux','Contra','2026-07-30T20:01:30.198979+00:00','https://www.youtube.com/watch?v=HMY1z543shI',21,'https://ocrmirror.org/files/music/remixes/Contra_AMEN_Reflux_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(34,'Perfect Selection','Nemesis','2026-07-30T23:32:33.716708+00:00','https://www.youtube.com/watch?v=088287OFpnE',3804,'https://ocrmirror.org/files/music/remixes/Nemesis_Perfect_Selection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(35,'X','Gradius','2026-07-30T10:37:29.655037+00:00','https://www.youtube.com/watch?v=uj89LyBxQYY',91,'https://ocrmirror.org/files/music/remixes/Gradius_X_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(37,'Jazzy','The Legend of Zelda','2026-07-30T21:42:33.025681+00:00','https://www.youtube.com/watch?v=oGdCa_V6Z3k',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Jazzy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(40,'Clan McCloud','Star Fox','2026-07-30T23:32:34.067725+00:00','https://www.youtube.com/watch?v=Cw1H1pqIF0o',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Clan_McCloud_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(41,'Horizontal Armada','Gradius','2026-07-30T21:42:32.862714+00:00','https://www.youtube.com/watch?v=ZuTSV5XiEpI',91,'https://ocrmirror.org/files/music/remixes/Gradius_Horizontal_Armada_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(42,'Passing Breeze (''97 BIT Offcut Mix)','OutRun','2026-07-30T21:42:33.188764+00:00','https://www.youtube.com/watch?v=t9IDnODmUFE',139,'https://ocrmirror.org/files/music/remixes/OutRun_Passing_Breeze_(''97_BIT_Offcut_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(44,'Trollbash','Ultima IV: Quest of the Avatar','2026-07-30T17:56:11.012259+00:00','https://www.youtube.com/watch?v=_SQBKgHA9jU',228,'https://ocrmirror.org/files/music/remixes/Ultima_4_Trollbash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(45,'AmIEviL','The Secret of Monkey Island','2026-07-31T07:21:10.588766+00:00','https://www.youtube.com/watch?v=DtNBs-7cy1I',212,'https://ocrmirror.org/files/music/remixes/Secret_of_Monkey_Island_AmIEviL_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(46,'Ambient Antiques','Spy vs. Spy','2026-07-30T17:56:11.189870+00:00','https://www.youtube.com/watch?v=XFlgYnmTbL4',835,'https://ocrmirror.org/files/music/remixes/Spy_vs_Spy_Ambient_Antiques_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(48,'ROBOVoice','Mega Man 2','2026-07-31T03:59:40.283831+00:00','https://www.youtube.com/watch?v=NUoRIQ6dUUY',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_ROBOVoice_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(50,'GET READY','Space Harrier II','2026-07-30T17:56:10.657893+00:00','https://www.youtube.com/watch?v=BUKGZiY9V_g',100,'https://ocrmirror.org/files/music/remixes/Space_Harrier_2_GET_READY_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(53,'Elec Man YPOI','Mega Man','2026-07-30T17:56:09.765610+00:00','https://www.youtube.com/watch?v=a0REBX6EZww',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Elec_Man_YPOI_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(54,'efsisos featuring Samus Aran','Metroid','2026-07-31T10:04:43.820329+00:00','https://www.youtube.com/watch?v=gxKMaTE9F54',73,'https://ocrmirror.org/files/music/remixes/Metroid_efsisos_featuring_Samus_Aran_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(55,'Jazz Plumber Trio','Super Mario Bros.','2026-07-31T14:59:12.935945+00:00','https://www.youtube.com/watch?v=MHEZePIhs_A',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Jazz_Plumber_Trio_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(58,'Hardcore Densehead','Super Star Soldier','2026-07-31T07:21:10.945908+00:00','https://www.youtube.com/watch?v=ROL5E7wSLns',169,'https://ocrmirror.org/files/music/remixes/Super_Star_Soldier_Hardcore_Densehead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(59,'Slumber Party','Banana','2026-07-30T20:01:28.753155+00:00','https://www.youtube.com/watch?v=JgDBo7iPw0s',35,'https://ocrmirror.org/files/music/remixes/Banana_Slumber_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(60,'Arrakis (Wormsign Mix)','Dune','2026-07-31T14:59:13.074979+00:00','https://www.youtube.com/watch?v=yX84N_V7nHk',188,'https://ocrmirror.org/files/music/remixes/Dune_Arrakis_(Wormsign_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(61,'Mute Radiology','F-Zero','2026-07-31T17:04:15.038966+00:00','https://www.youtube.com/watch?v=x9O3AW-Kras',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Mute_Radiology_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(62,'The Doctor Named Wily','Mega Man 2','2026-07-30T15:30:47.789916+00:00','https://www.youtube.com/watch?v=mcu_X_tPmdo',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Doctor_Named_Wily_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(63,'Final Ecstasy','Final Fantasy VII','2026-07-31T20:41:20.880615+00:00','https://www.youtube.com/watch?v=Mr6hcDB-ido',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Final_Ecstasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(64,'C Blachly','Tetris','2026-07-30T21:42:32.206134+00:00','https://www.youtube.com/watch?v=jH07dDQvx2g',101,'https://ocrmirror.org/files/music/remixes/Tetris_C_Blachly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(65,'hyrule castle dark world','The Legend of Zelda: A Link to the Past','2026-07-30T23:32:34.791050+00:00','https://www.youtube.com/watch?v=IEqOAY_Pi34',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_hyrule_castle_dark_world_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(66,'Ghetto Recursive','The King of Fighters ''98: The Slugfest','2026-07-31T14:59:12.349253+00:00','https://www.youtube.com/watch?v=62EEkY9FLf0',92,'https://ocrmirror.org/files/music/remixes/King_of_Fighters_''98_Ghetto_Recursive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(67,'Flash Fire','Mega Man 2','2026-07-31T10:04:43.996503+00:00','https://www.youtube.com/watch?v=7c0bMn4HwKc',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Flash_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(68,'North Medley','Final Fantasy VI','2026-07-31T18:52:34.607715+00:00','https://www.youtube.com/watch?v=fVsAXrWUAPg',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_North_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(69,'Contravirt','Contra','2026-07-30T17:56:09.945241+00:00','https://www.youtube.com/watch?v=isMS6bzjbuk',21,'https://ocrmirror.org/files/music/remixes/Contra_Contravirt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(71,'Blue Bomber Forever','Mega Man 3','2026-07-31T20:41:20.312955+00:00','https://www.youtube.com/watch?v=x6AIAnakuAE',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Blue_Bomber_Forever_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(72,'Belthasar','Chrono Trigger','2026-07-31T10:04:44.534549+00:00','https://www.youtube.com/watch?v=Z0tLiYdS8eY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Belthasar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(73,'Overdrive','Lotus II','2026-07-30T15:30:46.916251+00:00','https://www.youtube.com/watch?v=Y3A0bKNLxrA',300,'https://ocrmirror.org/files/music/remixes/Lotus_2_Overdrive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(76,'Wind Shear','Mega Man 2','2026-07-31T20:41:21.023122+00:00','https://www.youtube.com/watch?v=bWzvYfvwv44',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wind_Shear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(77,'Revival Day Impoetus','Chrono Trigger','2026-07-31T17:04:14.575671+00:00','https://www.youtube.com/watch?v=i80WDyOo6DI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Revival_Day_Impoetus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(78,'Funkiphibian Dub','Frogger','2026-07-31T03:59:39.388057+00:00','https://www.youtube.com/watch?v=HURDTSsVc28',88,'https://ocrmirror.org/files/music/remixes/Frogger_Funkiphibian_Dub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(80,'Shuriken Mix','Shinobi','2026-07-30T15:30:46.245812+00:00','https://www.youtube.com/watch?v=o2nGCXZZ1Ew',666,'https://ocrmirror.org/files/music/remixes/Shinobi_Shuriken_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(81,'Super Jungle Brothers','Super Mario Bros.','2026-07-31T22:32:15.676654+00:00','https://www.youtube.com/watch?v=xLdQzod-gTE',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Super_Jungle_Brothers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(82,'Thelonius Temple','Zelda II: The Adventure of Link','2026-07-31T17:04:14.393855+00:00','https://www.youtube.com/watch?v=QN_PVR7BzDw',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Thelonius_Temple_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(83,'Subcrunch','Skate or Die','2026-07-31T14:59:12.508216+00:00','https://www.youtube.com/watch?v=Tvgt_1eKfL8',216,'https://ocrmirror.org/files/music/remixes/Skate_or_Die_Subcrunch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(84,'This Is Not a True Ending','Bubble Bobble','2026-07-31T12:26:14.389113+00:00','https://www.youtube.com/watch?v=4Pq9hoymg1Q',46,'https://ocrmirror.org/files/music/remixes/Bubble_Bobble_This_Is_Not_a_True_Ending_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(85,'Breach of Contract','Herzog Zwei','2026-07-31T07:21:10.766545+00:00','https://www.youtube.com/watch?v=qTm3ApZJvxU',175,'https://ocrmirror.org/files/music/remixes/Herzog_Zwei_Breach_of_Contract_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(87,'Grim Reaper','Castlevania','2026-07-31T12:26:15.283738+00:00','https://www.youtube.com/watch?v=c0SHsxBOv3Y',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Grim_Reaper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(88,'The New Zeal','Chrono Trigger','2026-07-31T14:59:12.797856+00:00','https://www.youtube.com/watch?v=zCJU4FgQRkw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_New_Zeal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(89,'Millennial','Phantasy Star IV: The End of the Millennium','2026-07-31T10:04:44.172015+00:00','https://www.youtube.com/watch?v=DP0oRiNLOHA',96,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_4_Millennial_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(90,'Phat Musashi','Shinobi','2026-07-31T14:59:13.212368+00:00','https://www.youtube.com/watch?v=6R5vvr38t2Q',666,'https://ocrmirror.org/files/music/remixes/Shinobi_Phat_Musashi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(93,'CheDDer','Wizards & Warriors','2026-07-31T03:59:39.208404+00:00','https://www.youtube.com/watch?v=-aisxHx4byQ',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_CheDDer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(94,'CheDDer','Tetris','2026-07-30T20:01:29.114812+00:00','https://www.youtube.com/watch?v=NXB7TjXQC10',510,'https://ocrmirror.org/files/music/remixes/Tetris_CheDDer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(95,'Costa del Sol DANCE','Final Fantasy VII','2026-07-31T07:21:11.404931+00:00','https://www.youtube.com/watch?v=z8vo7zV-D9Q',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Costa_del_Sol_DANCE_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(96,'Lord PROTEKTOR','ActRaiser','2026-07-31T22:32:16.039020+00:00','https://www.youtube.com/watch?v=kwBeTbTaD4E',25,'https://ocrmirror.org/files/music/remixes/ActRaiser_Lord_PROTEKTOR_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(98,'AmIEviL Dark World','The Legend of Zelda: A Link to the Past','2026-08-01T01:02:17.783460+00:00','https://www.youtube.com/watch?v=XY1Aro8vblg',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_AmIEviL_Dark_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(100,'ASSAULT','Bionic Commando','2026-07-31T07:21:11.757908+00:00','https://www.youtube.com/watch?v=dicSLJqAga0',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_ASSAULT_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(102,'Tail Cave (Beatdown Mix)','The Legend of Zelda: Link''s Awakening','2026-08-01T01:02:17.430608+00:00','https://www.youtube.com/watch?v=IJ2mIY-opi4',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Tail_Cave_(Beatdown_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(105,'DABOMB','Lemmings','2026-07-31T22:32:16.938126+00:00','https://www.youtube.com/watch?v=6-uLl_GfLvc',831,'https://ocrmirror.org/files/music/remixes/Lemmings_DABOMB_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(109,'Gerudo Peeples','The Legend of Zelda: Ocarina of Time','2026-08-01T07:41:22.051657+00:00','https://www.youtube.com/watch?v=pDmbhArdVRo',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Gerudo_Peeples_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(110,'Chemical Juice','Sonic the Hedgehog 2','2026-07-31T22:32:16.578739+00:00','https://www.youtube.com/watch?v=8C91h41vqQU',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Chemical_Juice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(111,'Da Pipes','Super Mario Bros.','2026-07-31T10:04:43.646457+00:00','https://www.youtube.com/watch?v=tUFHgKJgMxE',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Da_Pipes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(112,'Power Puppet','Sonic 3D Blast','2026-07-31T07:21:12.112005+00:00','https://www.youtube.com/watch?v=LGc2tUXjVpQ',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Power_Puppet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(115,'It''s Boss Time','Mega Man 3','2026-07-31T12:26:13.846651+00:00','https://www.youtube.com/watch?v=GhYBuMFN8aI',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_It''s_Boss_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(118,'Bloody Tears Inspired','Castlevania II: Simon''s Quest','2026-08-01T04:50:55.287155+00:00','https://www.youtube.com/watch?v=OEssNyt4L1A',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Bloody_Tears_Inspired_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(120,'Vampire Killer (Deadcorpse)','Castlevania','2026-07-30T23:32:33.892282+00:00','https://www.youtube.com/watch?v=RtoxyZyAYL4',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Vampire_Killer_(Deadcorpse)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(122,'Wicked Orchestra','Castlevania','2026-08-01T07:41:22.396622+00:00','https://www.youtube.com/watch?v=pA7okcRWJn4',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Wicked_Orchestra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(123,'Sound Stone (C Major)','EarthBound','2026-07-31T22:32:16.219804+00:00','https://www.youtube.com/watch?v=3lQij4KKZeI',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Sound_Stone_(C_Major)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(124,'Journey','Shadow of the Beast','2026-07-31T17:04:14.829263+00:00','https://www.youtube.com/watch?v=bRQyihyzkj8',151,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Beast_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(126,'Dancehall Ragga','Super Mario Bros.','2026-07-31T17:04:15.231049+00:00','https://www.youtube.com/watch?v=6BCI91Ts91k',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Dancehall_Ragga_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(127,'AmIEviL','The 7th Guest','2026-07-31T12:26:15.462969+00:00','https://www.youtube.com/watch?v=3Lpnb_3KWlE',836,'https://ocrmirror.org/files/music/remixes/7th_Guest_AmIEviL_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(129,'Wet Grass Inspired','Diablo','2026-08-01T01:02:17.607029+00:00','https://www.youtube.com/watch?v=wordp9vBB38',108,'https://ocrmirror.org/files/music/remixes/Diablo_Wet_Grass_Inspired_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(130,'Back to Towne (Arranged)','Final Fantasy VI','2026-08-01T10:15:42.755394+00:00','https://www.youtube.com/watch?v=v-jk2aC98TI',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Back_to_Towne_(Arranged)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(132,'Laser Dance','Deflektor','2026-07-31T12:26:15.106204+00:00','https://www.youtube.com/watch?v=hpx1IWlZTHw',107,'https://ocrmirror.org/files/music/remixes/Deflektor_Laser_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(134,'Tempest Mix','Castlevania: The Adventure','2026-07-31T10:04:43.298652+00:00','https://www.youtube.com/watch?v=Ql_BkKHEIOY',341,'https://ocrmirror.org/files/music/remixes/Castlevania_The_Adventure_Tempest_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(137,'Liquid Mario','Super Mario 64','2026-08-01T04:50:55.107228+00:00','https://www.youtube.com/watch?v=Tp1qx46Tung',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Liquid_Mario_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(139,'Gau''s Lament','Final Fantasy VI','2026-07-31T03:59:39.028430+00:00','https://www.youtube.com/watch?v=ti1Dvbd_kCI',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Gau''s_Lament_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(140,'Ambient Gemini','Donkey Kong Country','2026-08-01T01:02:17.228251+00:00','https://www.youtube.com/watch?v=nFw70Bp4Gj8',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Ambient_Gemini_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(143,'Bubble Man (Electron Mix)','Mega Man 2','2026-07-31T20:41:20.454800+00:00','https://www.youtube.com/watch?v=HF_eOYybH3g',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Bubble_Man_(Electron_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(145,'Evil Horde Heat Man','Mega Man 2','2026-07-30T21:42:32.371221+00:00','https://www.youtube.com/watch?v=rUGSz2_SJXQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Evil_Horde_Heat_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(146,'Gemini Salsa','Mega Man 3','2026-07-31T20:41:21.163913+00:00','https://www.youtube.com/watch?v=OJWKmxXEu9U',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Gemini_Salsa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(148,'Facility (Hacker Mix)','GoldenEye 007','2026-08-01T01:02:17.960804+00:00','https://www.youtube.com/watch?v=G8hKxUxYDkQ',120,'https://ocrmirror.org/files/music/remixes/GoldenEye_007_Facility_(Hacker_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(149,'Hey, Mr. Honda','Street Fighter II: The World Warrior','2026-07-30T23:32:34.242240+00:00','https://www.youtube.com/watch?v=dD-QjJx3ZnU',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Hey_Mr_Honda_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(150,'River of Time','The Legend of Zelda: Ocarina of Time','2026-08-01T15:36:17.449230+00:00','https://www.youtube.com/watch?v=cK1p80EgGRw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_River_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(151,'Blanka Braziliamix','Street Fighter II: The World Warrior','2026-07-31T18:52:36.143842+00:00','https://www.youtube.com/watch?v=WPlwDAuaebY',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Blanka_Braziliamix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(152,'Melodies of Life (Arranged)','Final Fantasy IX','2026-08-01T04:50:54.746604+00:00','https://www.youtube.com/watch?v=NYMO7AG5p9I',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Melodies_of_Life_(Arranged)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(155,'MkVaffQuasi Ultimix','Tetris','2026-08-01T07:41:22.745990+00:00','https://www.youtube.com/watch?v=HTg6j44yRII',510,'https://ocrmirror.org/files/music/remixes/Tetris_MkVaffQuasi_Ultimix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(156,'Dark World Jazz','The Legend of Zelda: A Link to the Past','2026-08-01T07:41:21.530991+00:00','https://www.youtube.com/watch?v=pYzzlYWNUfw',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_World_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(157,'Port of Adia Drum Mix','Turok 2: Seeds of Evil','2026-07-31T12:26:14.569723+00:00','https://www.youtube.com/watch?v=jBnCqgxtS6o',226,'https://ocrmirror.org/files/music/remixes/Turok_2_Port_of_Adia_Drum_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(158,'Rave in the Mirror Maze','Pac-Man','2026-07-31T12:26:14.028411+00:00','https://www.youtube.com/watch?v=suUv9469YsQ',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_Rave_in_the_Mirror_Maze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(159,'Prelude (Refractive Mix)','Final Fantasy','2026-08-01T11:42:27.276544+00:00','https://www.youtube.com/watch?v=4n7z5qQF1Rc',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Prelude_(Refractive_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(160,'Resurrection by Breakbeat','Altered Beast','2026-08-01T04:50:55.466787+00:00','https://www.youtube.com/watch?v=Yk2DBU8wZEc',28,'https://ocrmirror.org/files/music/remixes/Altered_Beast_Resurrection_by_Breakbeat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(161,'Samus Strut','Metroid','2026-08-01T10:15:43.640364+00:00','https://www.youtube.com/watch?v=uxDfqWMTNpg',73,'https://ocrmirror.org/files/music/remixes/Metroid_Samus_Strut_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(162,'Dub','Shadow of the Beast','2026-07-31T10:04:42.945677+00:00','https://www.youtube.com/watch?v=vv-EZzrCypc',151,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Beast_Dub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(163,'The Atomizer','Final Fantasy VI','2026-08-01T17:32:33.225709+00:00','https://www.youtube.com/watch?v=X-trf_1-Q3M',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Atomizer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(165,'Dream Fighter','Punch-Out!!','2026-08-01T15:36:17.807629+00:00','https://www.youtube.com/watch?v=0KrtTTTX0TI',141,'https://ocrmirror.org/files/music/remixes/Punch-Out_Dream_Fighter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(166,'Ice Mountain Symphony','Super Ghouls''n Ghosts','2026-07-31T14:59:12.658152+00:00','https://www.youtube.com/watch?v=_miKgrq65Kw',222,'https://ocrmirror.org/files/music/remixes/Super_Ghouls''n_Ghosts_Ice_Mountain_Symphony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(167,'Goofy Ska','Faxanadu','2026-07-31T10:04:44.359416+00:00','https://www.youtube.com/watch?v=4na3hIhwiTY',114,'https://ocrmirror.org/files/music/remixes/Faxanadu_Goofy_Ska_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(168,'Essential Links','The Legend of Zelda','2026-07-31T14:59:13.350485+00:00','https://www.youtube.com/watch?v=RWG7Ib2APbg',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Essential_Links_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(170,'Cid (Solace Simplicity)','Final Fantasy VII','2026-07-31T18:52:34.914955+00:00','https://www.youtube.com/watch?v=Apg8xiAnkAs',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Cid_(Solace_Simplicity)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(171,'Another Inspiration','Chrono Cross','2026-08-01T14:06:17.804115+00:00','https://www.youtube.com/watch?v=amIK-VXlCSo',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Another_Inspiration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(172,'Millennial Fair 2001','Chrono Trigger','2026-08-01T15:36:17.090003+00:00','https://www.youtube.com/watch?v=4po3_912rEM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Millennial_Fair_2001_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(173,'Medieval Kaoss','Final Fantasy','2026-08-01T11:42:26.389152+00:00','https://www.youtube.com/watch?v=UBVYnOwFtQw',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Medieval_Kaoss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(175,'Shadows of Dimension Z','Shadow of the Beast II','2026-07-31T18:52:35.617986+00:00','https://www.youtube.com/watch?v=kMt_c7MD1S0',165,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Beast_2_Shadows_of_Dimension_Z_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(176,'Feena Flow','Ys','2026-07-31T17:04:14.152883+00:00','https://www.youtube.com/watch?v=zBChEFEY8R4',72,'https://ocrmirror.org/files/music/remixes/Ys_Feena_Flow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(177,'Shanecappella Vox Beat','Moon Patrol','2026-08-01T04:50:54.927834+00:00','https://www.youtube.com/watch?v=hal0nZnpdx0',137,'https://ocrmirror.org/files/music/remixes/Moon_Patrol_Shanecappella_Vox_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(178,'Relm''s Weepy Loop','Final Fantasy VI','2026-07-31T18:52:35.792713+00:00','https://www.youtube.com/watch?v=OeTGYQabWww',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Relm''s_Weepy_Loop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(179,'Purified','Shadow of the Beast III','2026-07-31T17:04:15.429610+00:00','https://www.youtube.com/watch?v=AD6neiPYtXo',166,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Beast_3_Purified_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(180,'Iron Mic Challenge','Punch-Out!!','2026-07-31T22:32:15.858576+00:00','https://www.youtube.com/watch?v=7M1I9U0Il6g',141,'https://ocrmirror.org/files/music/remixes/Punch-Out_Iron_Mic_Challenge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(181,'Badass Posse','Streets of Rage 2','2026-07-31T20:41:21.305773+00:00','https://www.youtube.com/watch?v=jfFIWRXWImI',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Badass_Posse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(182,'Burnt Mota','Phantasy Star II','2026-07-31T18:52:35.090430+00:00','https://www.youtube.com/watch?v=9W-o5OTC9TA',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_Burnt_Mota_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(183,'Forever Rachel','Final Fantasy VI','2026-08-01T01:02:16.756889+00:00','https://www.youtube.com/watch?v=Pg-_0DSbA88',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Forever_Rachel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(184,'Indian Ragga','Super Mario World 2: Yoshi''s Island','2026-07-31T22:32:17.298865+00:00','https://www.youtube.com/watch?v=_cxUD1fn5dI',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Indian_Ragga_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(186,'[go w*ld]','Maniac Mansion','2026-07-31T22:32:16.399948+00:00','https://www.youtube.com/watch?v=z9Q32spx0Yg',125,'https://ocrmirror.org/files/music/remixes/Maniac_Mansion_go_w-ld_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(188,'Bukki''s Tango','Super Mario RPG: Legend of the Seven Stars','2026-08-01T04:50:55.646592+00:00','https://www.youtube.com/watch?v=tZ-vSWhe_4U',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Bukki''s_Tango_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(189,'Spaghetti Cowboy','Gun.Smoke','2026-07-31T20:41:20.170514+00:00','https://www.youtube.com/watch?v=ci6FnyS3jUE',153,'https://ocrmirror.org/files/music/remixes/GunSmoke_Spaghetti_Cowboy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(190,'Portal','Ork','2026-08-01T07:41:21.353641+00:00','https://www.youtube.com/watch?v=V71gV-1RS3s',205,'https://ocrmirror.org/files/music/remixes/Ork_Portal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(191,'Broken Mirror Reflection','Xenogears','2026-08-01T15:36:17.269732+00:00','https://www.youtube.com/watch?v=_mG-EC6c754',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Broken_Mirror_Reflection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(192,'Metro Trans Funk','Metroid','2026-08-01T10:15:43.288219+00:00','https://www.youtube.com/watch?v=fY5jIL6HZ0I',73,'https://ocrmirror.org/files/music/remixes/Metroid_Metro_Trans_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(193,'Funky Pills','Dr. Mario','2026-07-31T03:59:38.845315+00:00','https://www.youtube.com/watch?v=9Y1NMMWQuog',491,'https://ocrmirror.org/files/music/remixes/Dr_Mario_Funky_Pills_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(194,'Jazzer Soul','Soul Blade','2026-08-01T07:41:22.224263+00:00','https://www.youtube.com/watch?v=ZKCwWo2hmgk',168,'https://ocrmirror.org/files/music/remixes/Soul_Blade_Jazzer_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(196,'Frog Jam Stomp Box','Frogger','2026-08-01T15:36:17.628576+00:00','https://www.youtube.com/watch?v=uetlaXpbz6c',88,'https://ocrmirror.org/files/music/remixes/Frogger_Frog_Jam_Stomp_Box_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(198,'This Is Not a True Ending (Asphyxiation)','Bubble Bobble','2026-08-01T10:15:44.342239+00:00','https://www.youtube.com/watch?v=mOMKbPNcq8k',46,'https://ocrmirror.org/files/music/remixes/Bubble_Bobble_This_Is_Not_a_True_Ending_(Asphyxiation)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(199,'Celces (Dance)','Final Fantasy VI','2026-08-01T15:36:16.910993+00:00','https://www.youtube.com/watch?v=3KnNa5yNWHw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Celces_(Dance)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(200,'Bonds of Sea and Fire','Xenogears','2026-07-31T18:52:35.441453+00:00','https://www.youtube.com/watch?v=IwOisKyVLnA',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Bonds_of_Sea_and_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(201,'Cut Man Sonata','Mega Man','2026-08-01T17:32:33.366896+00:00','https://www.youtube.com/watch?v=zkAH0YEiDDE',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Cut_Man_Sonata_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(202,'Manic Mugenical','Maniac Mansion','2026-08-01T01:02:16.348780+00:00','https://www.youtube.com/watch?v=nrKxx-X5ldg',125,'https://ocrmirror.org/files/music/remixes/Maniac_Mansion_Manic_Mugenical_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(203,'Late Night Lullaby','The Legend of Zelda: Ocarina of Time','2026-08-01T14:06:17.520894+00:00','https://www.youtube.com/watch?v=83wMqCaRIbg',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Late_Night_Lullaby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(204,'GAUNTLET!!','Gauntlet','2026-08-01T14:06:18.084458+00:00','https://www.youtube.com/watch?v=zogK_tuMlVc',178,'https://ocrmirror.org/files/music/remixes/Gauntlet_GAUNTLET_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(205,'Death on the Snowfield','Final Fantasy VI','2026-08-01T21:25:07.762588+00:00','https://www.youtube.com/watch?v=OfjLTYJ8Z2o',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Death_on_the_Snowfield_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(206,'Terra in Black','Final Fantasy VI','2026-08-01T23:29:15.096316+00:00','https://www.youtube.com/watch?v=8UER2C5HSbA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra_in_Black_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(208,'Eastside Interlude','Alex Kidd in Miracle World','2026-07-31T18:52:35.265624+00:00','https://www.youtube.com/watch?v=rhOsy8KkRiI',27,'https://ocrmirror.org/files/music/remixes/Alex_Kidd_in_Miracle_World_Eastside_Interlude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(209,'The Music of My Groin','The Legend of Zelda','2026-08-01T22:26:53.602749+00:00','https://www.youtube.com/watch?v=79x5dkMffxg',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Music_of_My_Groin_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(210,'Tekno Wily','Mega Man 2','2026-08-01T01:02:16.944960+00:00','https://www.youtube.com/watch?v=3W54JyJDh9c',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Tekno_Wily_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(211,'Fillmore Freestyle','ActRaiser','2026-08-01T14:06:18.645010+00:00','https://www.youtube.com/watch?v=zUnzHB6dfBo',25,'https://ocrmirror.org/files/music/remixes/ActRaiser_Fillmore_Freestyle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(212,'West Side Homies','Bubble Bobble','2026-08-01T10:15:43.818143+00:00','https://www.youtube.com/watch?v=lSFWYCB2ME8',46,'https://ocrmirror.org/files/music/remixes/Bubble_Bobble_West_Side_Homies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(213,'Funk Fusion','Faxanadu','2026-07-31T10:04:43.123834+00:00','https://www.youtube.com/watch?v=YfHPiMxNCGg',114,'https://ocrmirror.org/files/music/remixes/Faxanadu_Funk_Fusion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(214,'Singing Pretzel','Lunar: The Silver Star','2026-08-01T19:42:57.353261+00:00','https://www.youtube.com/watch?v=sxi5rTPihf8',77,'https://ocrmirror.org/files/music/remixes/Lunar_The_Silver_Star_Singing_Pretzel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(215,'Soundcheck','Super Mario Bros.','2026-08-01T07:41:21.879415+00:00','https://www.youtube.com/watch?v=AtxT2JuDmfI',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Soundcheck_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(216,'Gerudo JV','The Legend of Zelda: Ocarina of Time','2026-08-01T04:50:55.826579+00:00','https://www.youtube.com/watch?v=TJGajNw7sDo',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Gerudo_JV_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(217,'Space Orchestra','Metroid','2026-08-01T10:15:43.992677+00:00','https://www.youtube.com/watch?v=JRmJ-bsqdZA',73,'https://ocrmirror.org/files/music/remixes/Metroid_Space_Orchestra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(218,'Matsuri Madness','Shenmue','2026-07-31T07:21:10.406410+00:00','https://www.youtube.com/watch?v=Cn8p_dAoVYQ',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Matsuri_Madness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(221,'Panzer Groove','Panzer Dragoon','2026-08-01T14:06:17.662323+00:00','https://www.youtube.com/watch?v=Wos6jUHDoyk',162,'https://ocrmirror.org/files/music/remixes/Panzer_Dragoon_Panzer_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(222,'Music of Funk','Batman','2026-08-01T11:42:26.033133+00:00','https://www.youtube.com/watch?v=q7tBPUIIRg0',37,'https://ocrmirror.org/files/music/remixes/Batman_Music_of_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(224,'Mushroom Way Madness','Super Mario RPG: Legend of the Seven Stars','2026-08-01T07:41:21.707214+00:00','https://www.youtube.com/watch?v=hV-Qhj1QdC4',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Mushroom_Way_Madness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(225,'Navel Lint Dub','Arkanoid','2026-08-01T07:41:21.179343+00:00','https://www.youtube.com/watch?v=vTXsMSZgrrg',31,'https://ocrmirror.org/files/music/remixes/Arkanoid_Navel_Lint_Dub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(226,'Electric Fields','Seiken Densetsu 3','2026-08-01T11:42:27.630261+00:00','https://www.youtube.com/watch?v=9Ltlsi0IhTw',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Electric_Fields_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(227,'Controlled Jazz','GoldenEye 007','2026-08-01T10:15:43.112014+00:00','https://www.youtube.com/watch?v=f6n-DsLXylE',120,'https://ocrmirror.org/files/music/remixes/GoldenEye_007_Controlled_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(228,'Blue-Minded God','Chrono Trigger','2026-08-01T11:42:26.567341+00:00','https://www.youtube.com/watch?v=Gj2-h1zseeA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Blue-Minded_God_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(229,'Dancefloor','Shadowgate','2026-08-01T11:42:27.099952+00:00','https://www.youtube.com/watch?v=OMoXXckByJI',152,'https://ocrmirror.org/files/music/remixes/Shadowgate_Dancefloor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(231,'Doomed','Doom','2026-08-01T22:26:54.142737+00:00','https://www.youtube.com/watch?v=BtdvQkLGmGQ',14512,'https://ocrmirror.org/files/music/remixes/Doom_Doomed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(232,'2001 Elastic New Year','Super Mario World 2: Yoshi''s Island','2026-08-01T19:42:57.000264+00:00','https://www.youtube.com/watch?v=GqrUmAiN-FY',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_2001_Elastic_New_Year_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(233,'Neoteric Assembly','Final Fantasy VII','2026-08-01T14:06:18.504606+00:00','https://www.youtube.com/watch?v=a7Y1Ai6-4PA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Neoteric_Assembly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(234,'Rocket','Blaster Master','2026-07-31T22:32:17.117599+00:00','https://www.youtube.com/watch?v=Fy3PKSkCO_c',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Rocket_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(235,'Tina, Don''t Fall','Final Fantasy VI','2026-08-01T21:25:07.068117+00:00','https://www.youtube.com/watch?v=GXT3ee3MyH0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Tina_Don''t_Fall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(237,'Beach Party','StarTropics','2026-07-31T20:41:20.595431+00:00','https://www.youtube.com/watch?v=XLUGUDnvCXM',129,'https://ocrmirror.org/files/music/remixes/StarTropics_Beach_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(238,'New Age','Dragonseeds','2026-08-01T15:36:17.986513+00:00','https://www.youtube.com/watch?v=X8Hq8Q2A8zc',240,'https://ocrmirror.org/files/music/remixes/Dragonseeds_New_Age_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(239,'Devil''s Lab (Acid Mix)','Final Fantasy VI','2026-08-01T15:36:16.729931+00:00','https://www.youtube.com/watch?v=DaeP7rOTeug',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Devil''s_Lab_(Acid_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(240,'IceCapped','Sonic the Hedgehog 3','2026-08-02T01:08:31.900120+00:00','https://www.youtube.com/watch?v=Vy3hEFiXmvE',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_IceCapped_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(241,'Radical Dreamers (Angelic Mix)','Chrono Cross','2026-08-01T22:26:53.783290+00:00','https://www.youtube.com/watch?v=8leomBPSfWo',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Radical_Dreamers_(Angelic_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(245,'Dance, Richter, Dance','Akumajo Dracula X: Rondo of Blood','2026-08-01T10:15:43.464245+00:00','https://www.youtube.com/watch?v=w3-j1OcW1Ck',112,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_X_Rondo_of_Blood_Dance_Richter_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(246,'LatinSphere','Sonic the Hedgehog 3','2026-08-01T22:26:53.963036+00:00','https://www.youtube.com/watch?v=VCC4LriZ4uY',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_LatinSphere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(247,'Ancient Steps Retraced','Final Fantasy VII','2026-08-01T11:42:26.746284+00:00','https://www.youtube.com/watch?v=DrZRB5gdnHs',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Ancient_Steps_Retraced_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(248,'rAAw Battery','Sonic & Knuckles','2026-08-01T21:25:07.586591+00:00','https://www.youtube.com/watch?v=lgIDJ4jvp5I',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_rAAw_Battery_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(249,'Through the Eyes of Tragedy','Blaster Master','2026-07-31T20:41:20.027807+00:00','https://www.youtube.com/watch?v=ScNormSBRls',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Through_the_Eyes_of_Tragedy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(250,'DevilSLAB','Final Fantasy VI','2026-08-01T14:06:17.378653+00:00','https://www.youtube.com/watch?v=H3TLApXjNRQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_DevilSLAB_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(251,'Wily Metal','Mega Man 3','2026-08-02T07:48:53.574712+00:00','https://www.youtube.com/watch?v=Y2wl5qCFTSU',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Wily_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(252,'Wickedest Child','Castlevania','2026-08-01T17:32:33.790357+00:00','https://www.youtube.com/watch?v=v3C2BnWvWvs',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Wickedest_Child_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(254,'8-bit Rox','The Guardian Legend','2026-08-01T04:50:54.561430+00:00','https://www.youtube.com/watch?v=aDgVz0c1wN4',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_8-bit_Rox_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(255,'Terra (Black Crystal Mix)','Final Fantasy VI','2026-08-01T19:42:56.480543+00:00','https://www.youtube.com/watch?v=VfDsLXOp7fE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra_(Black_Crystal_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(256,'Sewer Thug','Boogerman: A Pick and Flick Adventure','2026-08-01T21:25:08.150852+00:00','https://www.youtube.com/watch?v=F_oZq646fNM',45,'https://ocrmirror.org/files/music/remixes/Boogerman_Sewer_Thug_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(257,'Oedo Pentatonic','The Legend of the Mystical Ninja','2026-08-01T10:15:42.934437+00:00','https://www.youtube.com/watch?v=SNDfp-gFqsM',161,'https://ocrmirror.org/files/music/remixes/Legend_of_the_Mystical_Ninja_Oedo_Pentatonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(258,'Techtris Type Z','Tetris','2026-08-01T21:25:07.412150+00:00','https://www.youtube.com/watch?v=f969TUhwK0w',101,'https://ocrmirror.org/files/music/remixes/Tetris_Techtris_Type_Z_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(260,'Dark Puppetry','Sonic 3D Blast','2026-07-31T18:52:34.386794+00:00','https://www.youtube.com/watch?v=PqFDfCjOn2g',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Dark_Puppetry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(261,'Magus (Temporal Rehab)','Chrono Trigger','2026-08-01T22:26:54.502341+00:00','https://www.youtube.com/watch?v=a-ktGTNp-j8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Magus_(Temporal_Rehab)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(262,'Adlehyde Castle Flow','Wild Arms','2026-08-01T22:26:55.042650+00:00','https://www.youtube.com/watch?v=H7W2n53oHgc',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Adlehyde_Castle_Flow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(263,'Palmtree Panic','Sonic CD','2026-08-01T17:32:32.798777+00:00','https://www.youtube.com/watch?v=bd05aYHAzxk',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Palmtree_Panic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(264,'Eyes on Me (Not Faye Wong)','Final Fantasy VIII','2026-08-02T10:14:20.061645+00:00','https://www.youtube.com/watch?v=z7TLdhMTHpU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Eyes_on_Me_(Not_Faye_Wong)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(268,'Insomnic','Super Mario Bros. 2','2026-08-02T04:53:54.150101+00:00','https://www.youtube.com/watch?v=oCqjYngKjs8',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Insomnic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(269,'Winds of Time','Chrono Trigger','2026-08-02T01:08:31.720120+00:00','https://www.youtube.com/watch?v=4LdhWp04xFI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Winds_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(270,'Metaltroid','Metroid','2026-08-02T01:08:30.817222+00:00','https://www.youtube.com/watch?v=lEcegckUK0Q',73,'https://ocrmirror.org/files/music/remixes/Metroid_Metaltroid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(271,'Shadow''s Theme','Final Fantasy VI','2026-08-01T23:29:16.728620+00:00','https://www.youtube.com/watch?v=srFtSiKPJqQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Shadow''s_Theme_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(273,'Schala''s Paradise','Chrono Trigger','2026-08-01T19:42:56.653812+00:00','https://www.youtube.com/watch?v=pr3OB6XapJA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Schala''s_Paradise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(274,'Chip Trip','Bomberman','2026-08-01T14:06:18.225047+00:00','https://www.youtube.com/watch?v=G-aoNEAGWf4',42,'https://ocrmirror.org/files/music/remixes/Bomberman_Chip_Trip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(275,'Island of Zeal','Chrono Trigger','2026-08-02T04:53:53.264364+00:00','https://www.youtube.com/watch?v=zw9dae8UhZA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Island_of_Zeal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(276,'Saga Prelude','Final Fantasy','2026-08-01T17:32:32.941125+00:00','https://www.youtube.com/watch?v=Xr5JDSZRPYY',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Saga_Prelude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(277,'The Best of the Best','U.N. Squadron','2026-08-01T01:02:16.553260+00:00','https://www.youtube.com/watch?v=196XH5iUNf4',289,'https://ocrmirror.org/files/music/remixes/UN_Squadron_The_Best_of_the_Best_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(278,'Static Discharge','Mega Man 3','2026-07-31T18:52:35.968183+00:00','https://www.youtube.com/watch?v=86ArGc_8ei0',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Static_Discharge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(280,'Match with Yuri','Art of Fighting 2','2026-08-01T17:32:33.084431+00:00','https://www.youtube.com/watch?v=_uJIQNdRl_M',32,'https://ocrmirror.org/files/music/remixes/Art_of_Fighting_2_Match_with_Yuri_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(282,'Nikki Learns a Song','Chrono Cross','2026-08-01T23:29:15.831444+00:00','https://www.youtube.com/watch?v=WTA_SKLmTeI',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Nikki_Learns_a_Song_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(283,'Time to Choose','Half-Life','2026-07-31T22:32:16.758031+00:00','https://www.youtube.com/watch?v=K6RKToVUjaA',704,'https://ocrmirror.org/files/music/remixes/Half-Life_Time_to_Choose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(285,'Muted Skyline','F-Zero','2026-08-01T04:50:56.187257+00:00','https://www.youtube.com/watch?v=Uz8ol5Cf5vM',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Muted_Skyline_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(286,'The Arab Painting','Final Fantasy VI','2026-08-02T01:08:31.539952+00:00','https://www.youtube.com/watch?v=qyCwZkK8Hqo',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Arab_Painting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(287,'Trance','Ninja Gaiden II: The Dark Sword of Chaos','2026-08-01T11:42:27.452888+00:00','https://www.youtube.com/watch?v=1Ap7PKVbuSw',135,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_2_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(291,'Japanese Swamp','Blaster Master','2026-08-02T01:08:32.079655+00:00','https://www.youtube.com/watch?v=3ggOt1gH0bE',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Japanese_Swamp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(292,'Bird Guy Jam','Battletoads','2026-08-01T21:25:06.718113+00:00','https://www.youtube.com/watch?v=5CSPiN_NfJI',246,'https://ocrmirror.org/files/music/remixes/Battletoads_Bird_Guy_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(294,'Phear the Monkey','Donkey Kong Country','2026-08-02T07:48:54.604039+00:00','https://www.youtube.com/watch?v=XMLzS7tm6qU',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Phear_the_Monkey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(295,'Needles','Mega Man 3','2026-08-02T17:31:25.730960+00:00','https://www.youtube.com/watch?v=or8dzBebECo',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Needles_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(296,'Radical Punks','Chrono Cross','2026-08-02T01:08:30.450816+00:00','https://www.youtube.com/watch?v=92sGOCZQw-0',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Radical_Punks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(300,'Mystery in Red','Lufia II: Rise of the Sinistrals','2026-08-01T23:29:16.038835+00:00','https://www.youtube.com/watch?v=Es-eM2HLiic',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Mystery_in_Red_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(301,'A!Bol Hardcore','Q*bert','2026-08-01T19:42:57.526087+00:00','https://www.youtube.com/watch?v=0vYqgxUyanA',833,'https://ocrmirror.org/files/music/remixes/Q-bert_A_Bol_Hardcore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(302,'vs. Brazil','Ultraman 2: Shutsugeki Katoku Tai','2026-08-01T15:36:18.344462+00:00','https://www.youtube.com/watch?v=shmmNw1ezlk',180,'https://ocrmirror.org/files/music/remixes/Ultraman_2_vs_Brazil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(303,'Hyrule Housing Inc.','Zelda II: The Adventure of Link','2026-08-01T17:32:34.073183+00:00','https://www.youtube.com/watch?v=zzA5Q1WGgXI',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Hyrule_Housing_Inc_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(304,'The Dark Reaches of SMW','Super Mario World','2026-08-02T04:53:53.441513+00:00','https://www.youtube.com/watch?v=1zWhZlI3gSc',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_The_Dark_Reaches_of_SMW_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(305,'Particle Brain','Sonic the Hedgehog','2026-08-01T22:26:54.862599+00:00','https://www.youtube.com/watch?v=CeSQLd64SVo',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Particle_Brain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(307,'Going Home','Journey to Silius','2026-08-01T21:25:06.892271+00:00','https://www.youtube.com/watch?v=mZyv1uPeoXo',154,'https://ocrmirror.org/files/music/remixes/Journey_to_Silius_Going_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(308,'Duque Battle','Final Fantasy','2026-08-01T22:26:54.681949+00:00','https://www.youtube.com/watch?v=qnys-H8RcrM',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Duque_Battle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(309,'Soft Museum Jam','NiGHTS into dreams...','2026-08-02T07:48:54.432454+00:00','https://www.youtube.com/watch?v=iw_buJq6GyQ',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Soft_Museum_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(310,'Soft Winds Cry','Xenogears','2026-08-01T04:50:56.006856+00:00','https://www.youtube.com/watch?v=wav4KB4R94E',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Soft_Winds_Cry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(311,'Red XIII Redux','Final Fantasy VII','2026-08-01T21:25:06.544391+00:00','https://www.youtube.com/watch?v=YYP594BkegM',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Red_XIII_Redux_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(312,'Schala Ancients','Chrono Trigger','2026-08-01T17:32:33.508550+00:00','https://www.youtube.com/watch?v=lbLqt4bXNes',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Schala_Ancients_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(313,'Team Gato','Chrono Trigger','2026-08-03T01:09:04.660180+00:00','https://www.youtube.com/watch?v=EpDb9VN2pFs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Team_Gato_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(314,'Geno''s Woods','Super Mario RPG: Legend of the Seven Stars','2026-08-02T15:37:11.323984+00:00','https://www.youtube.com/watch?v=etzTtkI9kB4',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Geno''s_Woods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(316,'Eyes on Me (Obsession)','Final Fantasy VIII','2026-08-02T17:31:24.678407+00:00','https://www.youtube.com/watch?v=JMdV3EERK50',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Eyes_on_Me_(Obsession)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(317,'The Knights Come Marching Home','Chrono Trigger','2026-08-02T21:24:31.079481+00:00','https://www.youtube.com/watch?v=9iL9DYKyIX0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Knights_Come_Marching_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(318,'Laputan Colony GBA Dub','F-Zero: Maximum Velocity','2026-08-02T01:08:31.358888+00:00','https://www.youtube.com/watch?v=_8qZcdgGfVg',190,'https://ocrmirror.org/files/music/remixes/F-Zero_Maximum_Velocity_Laputan_Colony_GBA_Dub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(319,'Kakariko Rave Party','The Legend of Zelda: A Link to the Past','2026-08-01T23:29:15.649229+00:00','https://www.youtube.com/watch?v=VNSExgWPSYM',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Kakariko_Rave_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(320,'Place of Return','Final Fantasy IX','2026-08-02T10:14:19.883713+00:00','https://www.youtube.com/watch?v=n6C92_xGWhM',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Place_of_Return_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(322,'Mind of the Mother Brain','Metroid','2026-08-02T01:08:31.178305+00:00','https://www.youtube.com/watch?v=t4CTGZKr_fs',73,'https://ocrmirror.org/files/music/remixes/Metroid_Mind_of_the_Mother_Brain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(323,'La Samba de Agua','Super Mario Bros. 3','2026-08-02T15:37:12.566530+00:00','https://www.youtube.com/watch?v=Au-4OWIHbXM',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_La_Samba_de_Agua_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(324,'DJ Jake','Wizards & Warriors','2026-08-01T23:29:16.426288+00:00','https://www.youtube.com/watch?v=zhnllEadiQQ',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_DJ_Jake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(325,'Industrial Promise','Radical Dreamers: Nusumenai Houseki','2026-08-01T14:06:18.364100+00:00','https://www.youtube.com/watch?v=fzKbdDyWfD8',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Industrial_Promise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(326,'Older Promises','Radical Dreamers: Nusumenai Houseki','2026-08-02T04:53:53.797584+00:00','https://www.youtube.com/watch?v=viirK7wQAE0',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Older_Promises_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(327,'No Promises Punk','Radical Dreamers: Nusumenai Houseki','2026-08-01T11:42:26.211692+00:00','https://www.youtube.com/watch?v=U1jaEY7A_lk',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_No_Promises_Punk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(328,'Grainy','Radical Dreamers: Nusumenai Houseki','2026-08-01T21:25:07.938183+00:00','https://www.youtube.com/watch?v=OW3M6YrWm98',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Grainy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(329,'Rêve d''ordinateur','Radical Dreamers: Nusumenai Houseki','2026-08-02T04:53:53.973553+00:00','https://www.youtube.com/watch?v=yHhvO_WJQ0U',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Reve_d''ordinateur_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(330,'Northern Promise','Radical Dreamers: Nusumenai Houseki','2026-08-01T22:26:54.322834+00:00','https://www.youtube.com/watch?v=X3qEF60TuO8',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Northern_Promise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(331,'Hip Dreamer','Radical Dreamers: Nusumenai Houseki','2026-08-02T04:53:53.087529+00:00','https://www.youtube.com/watch?v=NYeBYnnOVXw',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Hip_Dreamer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(332,'A Promise Too Far','Radical Dreamers: Nusumenai Houseki','2026-08-01T23:29:14.912504+00:00','https://www.youtube.com/watch?v=lxSmc4FoOeM',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_A_Promise_Too_Far_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(333,'Intonation','Radical Dreamers: Nusumenai Houseki','2026-08-01T01:02:16.104996+00:00','https://www.youtube.com/watch?v=RoA69b1pFgg',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Intonation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(334,'Tomato Juice','Princess Tomato in the Salad Kingdom','2026-08-02T10:14:20.439443+00:00','https://www.youtube.com/watch?v=VX6CB5hxZk4',209,'https://ocrmirror.org/files/music/remixes/Princess_Tomato_in_the_Salad_Kingdom_Tomato_Juice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(335,'Mysterious Groove','The Legend of Zelda: Link''s Awakening','2026-08-02T11:41:53.775359+00:00','https://www.youtube.com/watch?v=OZ4u1Po0oLE',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Mysterious_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(336,'Fear of the Flava','Secret of Mana','2026-08-02T17:31:25.556461+00:00','https://www.youtube.com/watch?v=2eSBN8_hAEI',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Fear_of_the_Flava_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(337,'Bluest Sky','Sonic the Hedgehog 2','2026-08-02T17:31:25.905528+00:00','https://www.youtube.com/watch?v=kHegSzYqBRc',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Bluest_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(338,'Devil''s Mask','Ninja Gaiden','2026-08-02T10:14:20.692646+00:00','https://www.youtube.com/watch?v=dMaOZtaLaVo',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Devil''s_Mask_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(339,'Easthaven''s Club','Icewind Dale','2026-08-02T11:41:54.127801+00:00','https://www.youtube.com/watch?v=AatdO90slfQ',172,'https://ocrmirror.org/files/music/remixes/Icewind_Dale_Easthaven''s_Club_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(340,'Intro (injury Mix)','Mega Man 3','2026-08-02T04:53:53.618328+00:00','https://www.youtube.com/watch?v=73CDLvP1vgw',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Intro_(injury_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(341,'Blobby Blob Disco','Dr. Robotnik''s Mean Bean Machine','2026-08-02T07:48:54.089500+00:00','https://www.youtube.com/watch?v=DM52qet2ZXA',187,'https://ocrmirror.org/files/music/remixes/Dr_Robotnik''s_Mean_Bean_Machine_Blobby_Blob_Disco_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(342,'Submission','Final Fantasy IV','2026-08-02T01:08:30.635004+00:00','https://www.youtube.com/watch?v=Tz9HnwVW50I',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Submission_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(343,'Timeless','Dragon Warrior','2026-08-02T11:41:53.414557+00:00','https://www.youtube.com/watch?v=GyQz3SoHEt4',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Timeless_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(344,'Good NiGHT','NiGHTS into dreams...','2026-08-01T10:15:44.167224+00:00','https://www.youtube.com/watch?v=Ev14E_Nu0ws',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Good_NiGHT_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(345,'Da Streets','Streets of Rage 2','2026-08-01T22:26:53.418315+00:00','https://www.youtube.com/watch?v=vc4aOCw84Sk',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Da_Streets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(346,'Sigmatism','Mega Man X','2026-08-02T10:14:21.439862+00:00','https://www.youtube.com/watch?v=m9T6FHtCeHA',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Sigmatism_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(347,'Reminiscence (Deep Sleep)','Suikoden II','2026-08-02T15:37:11.858043+00:00','https://www.youtube.com/watch?v=5ShJiZ289T4',245,'https://ocrmirror.org/files/music/remixes/Suikoden_2_Reminiscence_(Deep_Sleep)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(348,'Maridia Mix','Super Metroid','2026-08-02T11:41:53.229854+00:00','https://www.youtube.com/watch?v=iST_e0UkVCE',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Maridia_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(349,'Swingin'' Porno Mix','Super Mario Bros. 3','2026-08-02T19:43:09.182866+00:00','https://www.youtube.com/watch?v=FRKOvophCH0',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Swingin''_Porno_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(350,'Amphibian','Blaster Master','2026-08-02T10:14:19.521842+00:00','https://www.youtube.com/watch?v=TOC7NU_hK1k',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Amphibian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(352,'Smooth Mana','Secret of Mana','2026-08-02T04:53:52.421812+00:00','https://www.youtube.com/watch?v=9AGZni-WcRs',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Smooth_Mana_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(353,'Bubble Man (wants to get) Funked Up','Mega Man 2','2026-08-02T17:31:26.254888+00:00','https://www.youtube.com/watch?v=C3QoLBLeJjk',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Bubble_Man_(wants_to_get)_Funked_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(354,'Surface of the Moon','Final Fantasy IV','2026-08-02T11:41:53.598161+00:00','https://www.youtube.com/watch?v=VTD9YHlzbzc',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Surface_of_the_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(355,'Bloody Hell','Castlevania II: Simon''s Quest','2026-08-02T21:24:30.881618+00:00','https://www.youtube.com/watch?v=b2SngWCYniA',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Bloody_Hell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(356,'House Party','Super Castlevania IV','2026-08-02T14:07:47.435647+00:00','https://www.youtube.com/watch?v=rb03u53LRaA',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_House_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(357,'Rigor Dance','Castlevania','2026-08-02T10:14:21.248469+00:00','https://www.youtube.com/watch?v=DwMz82NWaDg',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Rigor_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(358,'Daft','The Killing Game Show','2026-08-02T10:14:20.245566+00:00','https://www.youtube.com/watch?v=Bz1Pgy4JdHw',123,'https://ocrmirror.org/files/music/remixes/Killing_Game_Show_Daft_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(360,'Ghost of St. Helens','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-02T15:37:11.679639+00:00','https://www.youtube.com/watch?v=wlXBRx4UvVg',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Ghost_of_St_Helens_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(361,'Frosty Delight','Mega Man 8','2026-08-02T17:31:25.208452+00:00','https://www.youtube.com/watch?v=rLQyAPWdl-Q',160,'https://ocrmirror.org/files/music/remixes/Mega_Man_8_Frosty_Delight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(362,'Launchface GO!','Sonic the Hedgehog 3','2026-08-02T07:48:54.261161+00:00','https://www.youtube.com/watch?v=1IZ4kw-paE4',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Launchface_GO_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(363,'Sprinting Riffs','Ninja Gaiden II: The Dark Sword of Chaos','2026-08-02T10:14:19.340726+00:00','https://www.youtube.com/watch?v=x-yxYFSFxW8',135,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_2_Sprinting_Riffs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(364,'Stainless Steel','Mega Man 2','2026-08-02T21:24:30.538892+00:00','https://www.youtube.com/watch?v=fs6VlIeUocQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Stainless_Steel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(365,'Mare Crisium','Moon Patrol','2026-08-01T19:42:57.873127+00:00','https://www.youtube.com/watch?v=xTi-inmaTaY',137,'https://ocrmirror.org/files/music/remixes/Moon_Patrol_Mare_Crisium_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(366,'X Intro','Mega Man 3','2026-08-02T07:48:53.400470+00:00','https://www.youtube.com/watch?v=1FguaD-z1Vc',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_X_Intro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(368,'Gerudo Interlude','The Legend of Zelda: Ocarina of Time','2026-08-02T23:29:46.584458+00:00','https://www.youtube.com/watch?v=xzSq-q0_YG4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Gerudo_Interlude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(369,'Oppressed Swamp Dub','Final Fantasy VII','2026-08-02T19:43:08.985161+00:00','https://www.youtube.com/watch?v=xzRaW83E0fQ',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Oppressed_Swamp_Dub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(370,'Primal Eyes (Tapeworm)','Parasite Eve','2026-08-02T07:48:53.918212+00:00','https://www.youtube.com/watch?v=mnXTnSJiROk',83,'https://ocrmirror.org/files/music/remixes/Parasite_Eve_Primal_Eyes_(Tapeworm)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(371,'Funky Dungeon','Kid Icarus','2026-08-02T11:41:54.303928+00:00','https://www.youtube.com/watch?v=cZdinmiOJco',121,'https://ocrmirror.org/files/music/remixes/Kid_Icarus_Funky_Dungeon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(372,'For the Love of 2D','M.U.S.H.A.','2026-08-02T14:07:45.844329+00:00','https://www.youtube.com/watch?v=kbmeuf7SJXE',164,'https://ocrmirror.org/files/music/remixes/MUSHA_For_the_Love_of_2D_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(373,'Eleven Tears','Stormlord','2026-08-02T04:53:52.606398+00:00','https://www.youtube.com/watch?v=Wk0ALBD7r6I',221,'https://ocrmirror.org/files/music/remixes/Stormlord_Eleven_Tears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(374,'Ballad of the Sea','Final Fantasy X','2026-08-02T17:31:24.859109+00:00','https://www.youtube.com/watch?v=WpJ6Q-pTMTI',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Ballad_of_the_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(375,'Soap and Water','Mega Man 2','2026-08-02T17:31:25.033470+00:00','https://www.youtube.com/watch?v=O4Y-5TPp-ik',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Soap_and_Water_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(376,'Magus (Decay of Hope)','Chrono Trigger','2026-08-02T22:26:53.101964+00:00','https://www.youtube.com/watch?v=Vx4NiDe7pbc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Magus_(Decay_of_Hope)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(377,'City Lights','Axelay','2026-08-02T22:26:52.923225+00:00','https://www.youtube.com/watch?v=30rqfpiKtNE',34,'https://ocrmirror.org/files/music/remixes/Axelay_City_Lights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(378,'Da Factory Funk','The Revenge of Shinobi','2026-08-02T07:48:54.775647+00:00','https://www.youtube.com/watch?v=JWR3hybvMZ8',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_Da_Factory_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(379,'Crash and Burn','Mega Man 2','2026-08-02T10:14:19.701733+00:00','https://www.youtube.com/watch?v=DHiU6sKMwtA',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Crash_and_Burn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(380,'Summer Trance','Quartet','2026-08-02T11:41:54.480501+00:00','https://www.youtube.com/watch?v=aEKiYzKcKeg',167,'https://ocrmirror.org/files/music/remixes/Quartet_Summer_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(381,'Norfair Deathmarch','Super Metroid','2026-08-02T19:43:08.282545+00:00','https://www.youtube.com/watch?v=GpI1JlgbhB8',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Norfair_Deathmarch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(382,'Ska Poppin''','Balloon Fight','2026-08-01T17:32:33.649548+00:00','https://www.youtube.com/watch?v=7WaucFjzEnA',964,'https://ocrmirror.org/files/music/remixes/Balloon_Fight_Ska_Poppin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(383,'7 Years Broken','Xenogears','2026-08-03T08:47:05.601304+00:00','https://www.youtube.com/watch?v=WMfk6AebLDQ',70,'https://ocrmirror.org/files/music/remixes/Xenogears_7_Years_Broken_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(384,'Gun and Bass','Obliterator','2026-08-02T14:07:46.728759+00:00','https://www.youtube.com/watch?v=plx7zTiW79E',204,'https://ocrmirror.org/files/music/remixes/Obliterator_Gun_and_Bass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(385,'White Claudia','Silent Hill','2026-08-02T04:53:54.327674+00:00','https://www.youtube.com/watch?v=t904dHELx30',62,'https://ocrmirror.org/files/music/remixes/Silent_Hill_White_Claudia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(386,'No Time','Chrono Trigger','2026-08-02T19:43:08.458570+00:00','https://www.youtube.com/watch?v=ZIKd7EDfL3Y',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_No_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(387,'Death Trance','Super Castlevania IV','2026-08-02T15:37:11.146271+00:00','https://www.youtube.com/watch?v=nquGdhl_Z2c',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Death_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(388,'Time Circuits High Voltage','Chrono Trigger','2026-08-02T22:26:53.632997+00:00','https://www.youtube.com/watch?v=jFL1IQblQtQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Time_Circuits_High_Voltage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(389,'Theme of Chao (Party Started)','Sonic Adventure','2026-08-02T21:24:31.294005+00:00','https://www.youtube.com/watch?v=yqRQWRG5nBE',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_Theme_of_Chao_(Party_Started)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(390,'Mode7 Medley','Zanac','2026-08-02T14:07:47.080569+00:00','https://www.youtube.com/watch?v=j0fI9cYamKg',69,'https://ocrmirror.org/files/music/remixes/Zanac_Mode7_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(391,'Ice Crystal Fields Forever','Secret of Mana','2026-08-03T05:03:07.586900+00:00','https://www.youtube.com/watch?v=yYdOM612_Is',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Ice_Crystal_Fields_Forever_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(392,'X-Buster MK-17','Mega Man X3','2026-08-02T21:24:31.487088+00:00','https://www.youtube.com/watch?v=YBu8Gw62_tk',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_X-Buster_MK-17_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(393,'Time Scars','Chrono Cross','2026-08-02T23:29:46.227905+00:00','https://www.youtube.com/watch?v=fRigfICOa7g',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Time_Scars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(394,'Dancer Master','Blaster Master','2026-08-02T21:24:30.193510+00:00','https://www.youtube.com/watch?v=XeWhIatbXWM',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Dancer_Master_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(395,'Industrial Bubbles','Blazing Lazers','2026-08-02T14:07:46.198397+00:00','https://www.youtube.com/watch?v=3ri2AmBINc8',40,'https://ocrmirror.org/files/music/remixes/Blazing_Lazers_Industrial_Bubbles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(396,'Dream Racing','Mario Kart 64','2026-08-01T19:42:56.303992+00:00','https://www.youtube.com/watch?v=8O1FPM64uLE',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Dream_Racing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(397,'Get Down','Mega Man 3','2026-08-03T05:03:07.413326+00:00','https://www.youtube.com/watch?v=vGW6-DlFbks',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Get_Down_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(398,'Prime Time','The Killing Game Show','2026-08-02T11:41:53.952249+00:00','https://www.youtube.com/watch?v=yHv_P3ohZDI',123,'https://ocrmirror.org/files/music/remixes/Killing_Game_Show_Prime_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(399,'Diddy Evolution','Donkey Kong Country','2026-08-02T23:29:46.050822+00:00','https://www.youtube.com/watch?v=MsqglPqxABE',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Diddy_Evolution_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(401,'Terra Tripmachine','Final Fantasy VI','2026-08-03T01:09:04.308758+00:00','https://www.youtube.com/watch?v=UjvUio6M6uE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra_Tripmachine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(402,'The Amazon Session','DuckTales','2026-08-03T05:03:06.888190+00:00','https://www.youtube.com/watch?v=WWhOEpoMiDU',50,'https://ocrmirror.org/files/music/remixes/DuckTales_The_Amazon_Session_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(403,'Dyluck, Come Home','Secret of Mana','2026-08-02T11:41:54.833177+00:00','https://www.youtube.com/watch?v=XacmgR0xqjk',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Dyluck_Come_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(404,'Dale of the Wind','Xenogears','2026-08-02T19:43:07.927292+00:00','https://www.youtube.com/watch?v=va7JzcAYFvc',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Dale_of_the_Wind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(405,'Sunken Suite','Super Mario 64','2026-08-03T12:41:41.859903+00:00','https://www.youtube.com/watch?v=FL80bU8VTV8',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Sunken_Suite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(406,'Reflex','Killer Instinct','2026-08-01T23:29:15.454342+00:00','https://www.youtube.com/watch?v=RVMKAKm5d98',122,'https://ocrmirror.org/files/music/remixes/Killer_Instinct_Reflex_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(407,'Raptor Waltz','Jurassic Park','2026-08-02T19:43:09.537076+00:00','https://www.youtube.com/watch?v=gwaOWvpZzt0',198,'https://ocrmirror.org/files/music/remixes/Jurassic_Park_Raptor_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(408,'Spekkio Beach Party','Chrono Trigger','2026-08-03T01:09:04.484363+00:00','https://www.youtube.com/watch?v=O0y3DrEB5wo',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Spekkio_Beach_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(409,'Shuffle','Shadowgate','2026-08-02T19:43:08.634284+00:00','https://www.youtube.com/watch?v=ODhpxrsqEVk',152,'https://ocrmirror.org/files/music/remixes/Shadowgate_Shuffle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(410,'Ocean Palace (Wave Breaker)','Chrono Trigger','2026-08-02T22:26:53.279473+00:00','https://www.youtube.com/watch?v=27bjfD10Yqc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Ocean_Palace_(Wave_Breaker)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(411,'Breezy Beats','Final Fantasy VIII','2026-08-02T17:31:26.079787+00:00','https://www.youtube.com/watch?v=uPbe2bsygcE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Breezy_Beats_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(412,'Circus Cave','Sonic the Hedgehog 2','2026-08-02T14:07:46.904050+00:00','https://www.youtube.com/watch?v=Vh8oF0gh-mM',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Circus_Cave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(413,'Set Me Up the Bomb Man','Mega Man','2026-08-02T23:29:45.341471+00:00','https://www.youtube.com/watch?v=_mBokgQLku8',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Set_Me_Up_the_Bomb_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(414,'Tatsumakisenputronic','Street Fighter II: The World Warrior','2026-08-02T22:26:52.744438+00:00','https://www.youtube.com/watch?v=9bilNsrA4q4',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Tatsumakisenputronic_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(415,'Mini Mayhem','Castlevania II: Simon''s Quest','2026-08-02T21:24:30.366670+00:00','https://www.youtube.com/watch?v=_nLixW7Mo4A',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Mini_Mayhem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(416,'Dark Promise','Radical Dreamers: Nusumenai Houseki','2026-08-02T14:07:47.259492+00:00','https://www.youtube.com/watch?v=YRcm_x_kWtE',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Dark_Promise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(417,'On the Prowl Redux','Command & Conquer','2026-08-02T23:29:45.872156+00:00','https://www.youtube.com/watch?v=JNCf0K2wnUo',839,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_On_the_Prowl_Redux_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(418,'Vega''s Ballad','Street Fighter II: The World Warrior','2026-08-03T08:47:06.490400+00:00','https://www.youtube.com/watch?v=79naQp6SRHU',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Vega''s_Ballad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(419,'Link''s Underworld Pressure Cooker','The Legend of Zelda','2026-08-03T18:16:15.772509+00:00','https://www.youtube.com/watch?v=x6jUl8qctMA',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Underworld_Pressure_Cooker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(420,'First Impressions','Metal Gear','2026-08-02T15:37:12.035159+00:00','https://www.youtube.com/watch?v=pa47Age_tL4',140,'https://ocrmirror.org/files/music/remixes/Metal_Gear_First_Impressions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(421,'SnowBro Intro','Mega Man 3','2026-08-02T14:07:46.548305+00:00','https://www.youtube.com/watch?v=hVC5wTKD5No',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_SnowBro_Intro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(422,'Town Music (Busy Life)','The Legend of Zelda: A Link to the Past','2026-08-03T05:03:07.063214+00:00','https://www.youtube.com/watch?v=yySeXacJHZI',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Town_Music_(Busy_Life)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(423,'Darkstar','Super Metroid','2026-08-01T23:29:15.276165+00:00','https://www.youtube.com/watch?v=oJ8stnhTmGU',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Darkstar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(424,'Six Feet Under','Dig Dug','2026-08-03T01:09:05.542701+00:00','https://www.youtube.com/watch?v=ZPIzcjFB4wo',186,'https://ocrmirror.org/files/music/remixes/Dig_Dug_Six_Feet_Under_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(425,'Angels on the Shore','Seiken Densetsu 3','2026-08-03T08:47:05.779072+00:00','https://www.youtube.com/watch?v=UpGAydBVAx0',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Angels_on_the_Shore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(426,'La Locura del Kefka','Final Fantasy VI','2026-08-03T18:16:16.302344+00:00','https://www.youtube.com/watch?v=RpNOkrREtLE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_La_Locura_del_Kefka_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(427,'Symphonic Ruin','Sonic 3D Blast','2026-08-03T21:40:01.030589+00:00','https://www.youtube.com/watch?v=hLPOml2lyfo',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Symphonic_Ruin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(428,'8-bit Eighties','Super Mario Bros.','2026-08-03T20:10:53.643647+00:00','https://www.youtube.com/watch?v=dAyUOIqkbWw',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_8-bit_Eighties_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(429,'A Temple of Chaos','Final Fantasy','2026-08-02T22:26:53.456020+00:00','https://www.youtube.com/watch?v=035uciG0ctc',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_A_Temple_of_Chaos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(430,'Caverns of Sagila','Rygar','2026-08-02T21:24:32.062198+00:00','https://www.youtube.com/watch?v=fmmyFnAexgw',150,'https://ocrmirror.org/files/music/remixes/Rygar_Caverns_of_Sagila_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(431,'Lost Sanctuary','Resident Evil 2','2026-08-03T08:47:05.246493+00:00','https://www.youtube.com/watch?v=rvvGxUdVtR4',211,'https://ocrmirror.org/files/music/remixes/Resident_Evil_2_Lost_Sanctuary_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(432,'Registration 4','Mega Man 3','2026-08-02T15:37:12.388373+00:00','https://www.youtube.com/watch?v=JBPHtA0NAmM',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Registration_4_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(433,'Ninja Strut','Shinobi','2026-08-02T17:31:25.382480+00:00','https://www.youtube.com/watch?v=bYU1yD4b1ic',81,'https://ocrmirror.org/files/music/remixes/Shinobi_Ninja_Strut_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(434,'Spicy Curry','Street Fighter II: The World Warrior','2026-08-02T22:26:52.564412+00:00','https://www.youtube.com/watch?v=ETgkw23ECMg',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Spicy_Curry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(435,'Wake Up!','ToeJam & Earl','2026-08-02T07:48:53.746713+00:00','https://www.youtube.com/watch?v=F-DKr3HBnwU',99,'https://ocrmirror.org/files/music/remixes/ToeJam_&_Earl_Wake_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(436,'Ground Up','Final Fantasy IV','2026-08-03T08:47:05.067757+00:00','https://www.youtube.com/watch?v=rENAisGP9ns',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Ground_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(437,'Bar Hopping','Streets of Rage 2','2026-08-02T14:07:46.022692+00:00','https://www.youtube.com/watch?v=DHPfdND0FT0',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Bar_Hopping_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(438,'Freestyle Dojo','Street Fighter II: The World Warrior','2026-08-03T20:10:53.081129+00:00','https://www.youtube.com/watch?v=ccNkJA_Kw5g',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Freestyle_Dojo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(439,'Swanky Vegas','Super Mario World','2026-08-03T18:16:16.478524+00:00','https://www.youtube.com/watch?v=7WCbMULhz_Q',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Swanky_Vegas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(440,'Aeris Summer Samba','Final Fantasy VII','2026-08-03T01:09:04.128848+00:00','https://www.youtube.com/watch?v=18gBoI0v1Gk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Aeris_Summer_Samba_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(442,'Hidden Palace (Master Emerald)','Sonic & Knuckles','2026-08-03T05:03:07.764097+00:00','https://www.youtube.com/watch?v=uIMt35QL1O0',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Hidden_Palace_(Master_Emerald)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(443,'On Rhodopa Mountain','Rygar','2026-08-03T01:09:05.366604+00:00','https://www.youtube.com/watch?v=YQlpCSJ-6h4',150,'https://ocrmirror.org/files/music/remixes/Rygar_On_Rhodopa_Mountain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(444,'Cry from the Forest','Secret of Mana','2026-08-04T03:48:01.167554+00:00','https://www.youtube.com/watch?v=I3t9sWnwIKk',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Cry_from_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(445,'Space Dance','Zanac','2026-08-02T11:41:54.656823+00:00','https://www.youtube.com/watch?v=GaFA3ZTuOSs',69,'https://ocrmirror.org/files/music/remixes/Zanac_Space_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(446,'Test of Island Courage','StarTropics','2026-08-03T05:03:06.713197+00:00','https://www.youtube.com/watch?v=llHoHkEiMVY',129,'https://ocrmirror.org/files/music/remixes/StarTropics_Test_of_Island_Courage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(447,'Hipccordian','Zelda II: The Adventure of Link','2026-08-03T05:03:07.238253+00:00','https://www.youtube.com/watch?v=ony6_nsKjaM',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Hipccordian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(448,'Stereo Superhero','Pulseman','2026-08-03T01:09:05.011750+00:00','https://www.youtube.com/watch?v=xeHJNY6ShKI',243,'https://ocrmirror.org/files/music/remixes/Pulseman_Stereo_Superhero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(449,'Venus-Signed Banana Peel','EarthBound','2026-08-03T20:10:53.221908+00:00','https://www.youtube.com/watch?v=VoF3lzWe1gE',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Venus-Signed_Banana_Peel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(450,'Metroid Sonata - Movement II','Metroid II: Return of Samus','2026-08-03T08:47:06.135363+00:00','https://www.youtube.com/watch?v=HbkJXVlo4dU',202,'https://ocrmirror.org/files/music/remixes/Metroid_2_Metroid_Sonata_Movement_II_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(451,'Static Aversion','Silent Hill 2','2026-08-03T23:35:53.220081+00:00','https://www.youtube.com/watch?v=QRnMPSPQN6A',63,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_Static_Aversion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(453,'Cammy''s London Drizzle','Super Street Fighter II: The New Challengers','2026-08-03T21:40:01.564164+00:00','https://www.youtube.com/watch?v=u6npNQFmWmk',143,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Cammy''s_London_Drizzle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(454,'The Goddess Appears (Trinity)','The Legend of Zelda: A Link to the Past','2026-08-03T20:10:52.796540+00:00','https://www.youtube.com/watch?v=Zq5jTtFgIYg',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Goddess_Appears_(Trinity)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(455,'Fighting (7/8 Jazz Spiritual)','Final Fantasy VII','2026-08-03T18:16:16.653952+00:00','https://www.youtube.com/watch?v=TTLihuIUA30',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Fighting_(7-8_Jazz_Spiritual)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(456,'What the Funk!','Super Mario World 2: Yoshi''s Island','2026-08-04T12:24:59.903299+00:00','https://www.youtube.com/watch?v=w_ZGrekaaqQ',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_What_the_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(457,'Grosse Lederhosen','Wizards & Warriors','2026-08-02T23:29:45.517623+00:00','https://www.youtube.com/watch?v=_ssZwo5NKMg',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_Grosse_Lederhosen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(458,'Ryu Interpretation','Street Fighter II: The World Warrior','2026-08-03T16:01:35.467904+00:00','https://www.youtube.com/watch?v=AwQ05Gc8kGg',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Ryu_Interpretation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(459,'Lightning Star','Sonic the Hedgehog','2026-08-04T03:48:00.988916+00:00','https://www.youtube.com/watch?v=rdgr8cY-Jrk',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Lightning_Star_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(460,'Matoya''s Grave','Final Fantasy','2026-08-02T15:37:12.211948+00:00','https://www.youtube.com/watch?v=TdRMfqWNJok',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Matoya''s_Grave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(461,'Higgins Goes to Miami','Adventure Island','2026-08-02T07:48:54.948357+00:00','https://www.youtube.com/watch?v=l86LzRMitDs',403,'https://ocrmirror.org/files/music/remixes/Adventure_Island_Higgins_Goes_to_Miami_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(462,'The Meadows','Heroes of Might and Magic II: The Succession Wars','2026-08-02T19:43:08.106612+00:00','https://www.youtube.com/watch?v=lgDh7wXdFY8',196,'https://ocrmirror.org/files/music/remixes/Heroes_of_Might_and_Magic_2_The_Meadows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(463,'Reel Big Mario','Super Mario Land','2026-08-03T21:39:59.962358+00:00','https://www.youtube.com/watch?v=3WyyrAN5XV8',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Reel_Big_Mario_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(464,'Blue Lightning','Mega Man 3','2026-08-04T10:09:35.199465+00:00','https://www.youtube.com/watch?v=1ERYq_enBRI',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Blue_Lightning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(465,'ROBOVoice','Final Fantasy V','2026-08-04T19:06:40.904563+00:00','https://www.youtube.com/watch?v=zbiujmQ-yU4',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_ROBOVoice_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(466,'Retro Russian','Street Fighter II: The World Warrior','2026-08-02T21:24:30.710027+00:00','https://www.youtube.com/watch?v=lZN1-zM5Ra4',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Retro_Russian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(467,'Psycho Underpants','Ghouls''n Ghosts','2026-08-03T16:01:36.364914+00:00','https://www.youtube.com/watch?v=0Q7NB9QQkbM',118,'https://ocrmirror.org/files/music/remixes/Ghouls''n_Ghosts_Psycho_Underpants_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(468,'Epic Diva','The Great Giana Sisters','2026-08-02T14:07:46.373482+00:00','https://www.youtube.com/watch?v=oM-dg5RV-VU',194,'https://ocrmirror.org/files/music/remixes/Great_Giana_Sisters_Epic_Diva_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(469,'Seven Degrees of Judgment ','Final Fantasy VII','2026-08-03T05:03:07.940312+00:00','https://www.youtube.com/watch?v=HvLBPktyTDU',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Seven_Degrees_of_Judgment_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(470,'Quick Draw','Mega Man 2','2026-08-03T12:41:41.008569+00:00','https://www.youtube.com/watch?v=ufWLwPPRqWc',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Quick_Draw_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(471,'CyberRubbish','Cybernoid II: The Revenge','2026-08-02T15:37:10.964790+00:00','https://www.youtube.com/watch?v=eq5M936Nzgo',184,'https://ocrmirror.org/files/music/remixes/Cybernoid_2_CyberRubbish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(472,'po! kidz','M.C. Kids','2026-08-03T08:47:05.423974+00:00','https://www.youtube.com/watch?v=tugqGQ0lo04',132,'https://ocrmirror.org/files/music/remixes/MC_Kids_po_kidz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(473,'Bubbly Cloud Cafe','Kirby''s Dream Land','2026-08-02T23:29:45.164678+00:00','https://www.youtube.com/watch?v=z0lNeNJBTxc',234,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_Bubbly_Cloud_Cafe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(474,'Ice Cap Zone (Frozen Knuckles Mix)','Sonic the Hedgehog 3','2026-08-04T07:12:51.400963+00:00','https://www.youtube.com/watch?v=bpps6M9ojSE',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Ice_Cap_Zone_(Frozen_Knuckles_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(475,'Let There Be Light','Mega Man 4','2026-08-04T07:12:50.366577+00:00','https://www.youtube.com/watch?v=2T-zymnmHOg',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Let_There_Be_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(476,'Ocean Flame Groove','Ristar','2026-08-03T16:01:35.824430+00:00','https://www.youtube.com/watch?v=viS5mLf9qPk',131,'https://ocrmirror.org/files/music/remixes/Ristar_Ocean_Flame_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(477,'Indie Rock Dajil','Xenogears','2026-08-03T05:03:06.357228+00:00','https://www.youtube.com/watch?v=2IHChjbkBzI',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Indie_Rock_Dajil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(478,'Dee Jay''s Caribbean Rave','Super Street Fighter II: The New Challengers','2026-08-03T12:41:41.578195+00:00','https://www.youtube.com/watch?v=a1tiNnoGDfQ',143,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Dee_Jay''s_Caribbean_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(479,'Dragon Hop','Dragon Warrior','2026-08-02T21:24:31.888173+00:00','https://www.youtube.com/watch?v=7KCxpAVc87U',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Dragon_Hop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(480,'Dirty Beta','Sonic Crackers','2026-08-03T18:16:16.125470+00:00','https://www.youtube.com/watch?v=G8Nm_NM3KDY',218,'https://ocrmirror.org/files/music/remixes/Sonic_Crackers_Dirty_Beta_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(481,'Y2K Style','Spy vs. Spy','2026-08-02T19:43:09.360949+00:00','https://www.youtube.com/watch?v=6C_IWRxtvLk',130,'https://ocrmirror.org/files/music/remixes/Spy_vs_Spy_Y2K_Style_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(482,'Fear and Sufferance of a Loved One in the Hands of Evil','The Legend of Zelda','2026-08-03T20:10:53.924821+00:00','https://www.youtube.com/watch?v=AW6jSuGQbUY',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Fear_and_Sufferance_of_a_Loved_One_in_the_Hands_of_Evil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(483,'The Last Dragon','Streets of Rage','2026-08-02T23:29:45.695285+00:00','https://www.youtube.com/watch?v=b3jLAl-nuEM',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_The_Last_Dragon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(484,'Losing Me Is Not an Option','Final Fantasy IX','2026-08-03T21:40:00.143527+00:00','https://www.youtube.com/watch?v=7GECYP3Ts5k',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Losing_Me_Is_Not_an_Option_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(485,'Yoshi''s Lullaby','Super Mario World 2: Yoshi''s Island','2026-08-03T21:40:00.853705+00:00','https://www.youtube.com/watch?v=IA38pkllrqU',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Yoshi''s_Lullaby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(486,'Christmas Cave','Donkey Kong Country','2026-08-03T16:01:35.286926+00:00','https://www.youtube.com/watch?v=uOaPGGU2pb0',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Christmas_Cave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(487,'Merry Little Christmas','NiGHTS into dreams...','2026-08-03T23:35:52.439754+00:00','https://www.youtube.com/watch?v=OSsZD5rq7M0',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Merry_Little_Christmas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(488,'A William Wobbler Christmas','William Wobbler','2026-08-04T03:48:00.447853+00:00','https://www.youtube.com/watch?v=FY7A1r797fs',231,'https://ocrmirror.org/files/music/remixes/William_Wobbler_A_William_Wobbler_Christmas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(489,'Snow','Sonic 3D Blast','2026-08-03T12:41:41.295952+00:00','https://www.youtube.com/watch?v=ezEm452gs1s',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Snow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(490,'Hot Flashes Man','Mega Man 2','2026-08-03T08:47:06.313243+00:00','https://www.youtube.com/watch?v=TXJHODsdNzc',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Hot_Flashes_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(491,'Furry in the Forest','Fury of the Furries','2026-08-04T10:09:35.021333+00:00','https://www.youtube.com/watch?v=VzAZCkRrM1M',191,'https://ocrmirror.org/files/music/remixes/Fury_of_the_Furries_Furry_in_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(492,'Hell March (Red Scare)','Command & Conquer: Red Alert','2026-08-03T01:09:05.190443+00:00','https://www.youtube.com/watch?v=umIVzXx-CGA',75,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Red_Alert_Hell_March_(Red_Scare)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(493,'The Italian Plumber','Super Mario Bros.','2026-08-04T10:09:34.486496+00:00','https://www.youtube.com/watch?v=Knv-nSjNUXw',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_The_Italian_Plumber_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(494,'Brambles in the Breeze','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-04T03:48:00.629416+00:00','https://www.youtube.com/watch?v=GtcAw3U6LPk',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Brambles_in_the_Breeze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(495,'Final Jungle Fantasy','Final Fantasy VIII','2026-08-04T12:24:59.725821+00:00','https://www.youtube.com/watch?v=LHwIB83xP2k',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Final_Jungle_Fantasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(496,'Groove-Mecha','Vortex','2026-08-03T01:09:03.951341+00:00','https://www.youtube.com/watch?v=6DmKGFt13oM',229,'https://ocrmirror.org/files/music/remixes/Vortex_Groove-Mecha_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(497,'ProtoVaffe','Mega Man 3','2026-08-03T01:09:04.835438+00:00','https://www.youtube.com/watch?v=FH73GqMDo7c',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_ProtoVaffe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(498,'Blue Lament','Lunar: The Silver Star','2026-08-04T10:09:33.596759+00:00','https://www.youtube.com/watch?v=qoIucT20m5Q',77,'https://ocrmirror.org/files/music/remixes/Lunar_The_Silver_Star_Blue_Lament_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(499,'Nemo for Strings','Little Nemo: The Dream Master','2026-08-03T12:41:42.284375+00:00','https://www.youtube.com/watch?v=Oqv9ZFJVkZA',124,'https://ocrmirror.org/files/music/remixes/Little_Nemo_Nemo_for_Strings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(501,'Teen Turtle Tryp','Teenage Mutant Ninja Turtles','2026-08-04T03:48:01.883165+00:00','https://www.youtube.com/watch?v=9KXDdt0EjMw',224,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_Teen_Turtle_Tryp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(502,'BIT Live Arcade','Space Harrier','2026-08-03T23:35:53.019868+00:00','https://www.youtube.com/watch?v=QkOC3giQkr4',97,'https://ocrmirror.org/files/music/remixes/Space_Harrier_BIT_Live_Arcade_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(503,'Fear and Courage','Lufia & The Fortress of Doom','2026-08-04T07:12:50.714816+00:00','https://www.youtube.com/watch?v=iaIrxPjS998',156,'https://ocrmirror.org/files/music/remixes/Lufia_&_The_Fortress_of_Doom_Fear_and_Courage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(504,'Crash Test Dummy Man','Mega Man 2','2026-08-04T17:11:51.776412+00:00','https://www.youtube.com/watch?v=ZEHzL2AE4Po',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Crash_Test_Dummy_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(505,'Track 1 (Final Nitro Mix)','Top Gear','2026-08-03T21:40:00.498642+00:00','https://www.youtube.com/watch?v=T70EnAdFzaU',144,'https://ocrmirror.org/files/music/remixes/Top_Gear_Track_1_(Final_Nitro_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(506,'Time Punk','Chrono Trigger','2026-08-04T03:48:01.704220+00:00','https://www.youtube.com/watch?v=uPvZ8NKtOU8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Time_Punk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(508,'Hot Stuff','Sonic & Knuckles','2026-08-04T12:25:00.789555+00:00','https://www.youtube.com/watch?v=DFYi3Gdy028',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Hot_Stuff_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(509,'Last Breath, First Breath','Phantasy Star IV: The End of the Millennium','2026-08-04T20:50:12.709214+00:00','https://www.youtube.com/watch?v=nC4sXnCzzH0',96,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_4_Last_Breath_First_Breath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(510,'Kefka Goes West','Final Fantasy VI','2026-08-04T15:00:25.524300+00:00','https://www.youtube.com/watch?v=fkcsZUSliw0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Kefka_Goes_West_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(511,'Mud Mix','Command & Conquer: Red Alert','2026-08-03T23:35:52.249112+00:00','https://www.youtube.com/watch?v=LM9h-EgBxmE',75,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Red_Alert_Mud_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(512,'Qu''s Marsh (Swamp Rat)','Final Fantasy IX','2026-08-03T12:41:41.718912+00:00','https://www.youtube.com/watch?v=zBx-n6zvT1w',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Qu''s_Marsh_(Swamp_Rat)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(513,'Temple Trippin''','Zelda II: The Adventure of Link','2026-08-02T19:43:08.809914+00:00','https://www.youtube.com/watch?v=JIulSl3bz4g',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Temple_Trippin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(514,'Underground Riddims','Super Mario Bros. 2','2026-08-04T07:12:51.229313+00:00','https://www.youtube.com/watch?v=fJgAl3d6b3M',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Underground_Riddims_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(515,'Goodnight, Little Nemo','Little Nemo: The Dream Master','2026-08-03T08:47:05.958202+00:00','https://www.youtube.com/watch?v=dXvNbuChoS8',124,'https://ocrmirror.org/files/music/remixes/Little_Nemo_Goodnight_Little_Nemo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(516,'Dark Racer','Top Gear','2026-08-04T17:11:51.422030+00:00','https://www.youtube.com/watch?v=9wIKxJzbcQQ',144,'https://ocrmirror.org/files/music/remixes/Top_Gear_Dark_Racer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(517,'Door into Summer','Knuckles'' Chaotix','2026-08-04T07:12:51.058103+00:00','https://www.youtube.com/watch?v=uwd0ourku0U',239,'https://ocrmirror.org/files/music/remixes/Knuckles''_Chaotix_Door_into_Summer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(518,'Something Final','Final Fantasy','2026-08-04T20:50:12.535090+00:00','https://www.youtube.com/watch?v=fYoxcBihKjo',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Something_Final_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(519,'Alexandrian Nightmare','Final Fantasy IX','2026-08-03T20:10:53.502826+00:00','https://www.youtube.com/watch?v=w663B6QxBzY',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Alexandrian_Nightmare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(520,'Der Überfrosch','Blaster Master','2026-08-03T12:41:41.438002+00:00','https://www.youtube.com/watch?v=dJo5y1bjHBc',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Der_Uberfrosh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(521,'River City Robot','River City Ransom','2026-08-03T20:10:52.654246+00:00','https://www.youtube.com/watch?v=YSjCPRmbeS8',242,'https://ocrmirror.org/files/music/remixes/River_City_Ransom_River_City_Robot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(522,'Perdition Hardcore','Final Fantasy VIII','2026-08-03T21:40:01.386479+00:00','https://www.youtube.com/watch?v=1ideXruZsdc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Perdition_Hardcore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(523,'Circuit Breaker','Mega Man','2026-08-04T12:24:59.548778+00:00','https://www.youtube.com/watch?v=gQRTekrxv_I',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Circuit_Breaker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(524,'Broken Machine','Ecco the Dolphin','2026-08-04T07:12:50.541254+00:00','https://www.youtube.com/watch?v=cn8Jof_HnVE',52,'https://ocrmirror.org/files/music/remixes/Ecco_the_Dolphin_Broken_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(525,'Airbased','Mega Man X','2026-08-04T22:35:28.128158+00:00','https://www.youtube.com/watch?v=VpBngws8K2k',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Airbased_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(526,'Hotel Rhumba (I Want to Go Home)','EarthBound','2026-08-04T10:09:33.777219+00:00','https://www.youtube.com/watch?v=HMNPyIWHRyQ',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Hotel_Rhumba_(I_Want_to_Go_Home)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(527,'TI Blasta Party','Blaster Master','2026-08-04T12:25:00.258182+00:00','https://www.youtube.com/watch?v=CMh7FMjr2wE',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_TI_Blasta_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(528,'Matador','Speedball','2026-08-03T20:10:53.784318+00:00','https://www.youtube.com/watch?v=ihd5s-JaX1o',219,'https://ocrmirror.org/files/music/remixes/Speedball_Matador_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(529,'Danger in Remlia','Astyanax','2026-08-04T03:48:02.061200+00:00','https://www.youtube.com/watch?v=-vnIas_J8VU',33,'https://ocrmirror.org/files/music/remixes/Astyanax_Danger_in_Remlia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(530,'Tight Finale','Sonic the Hedgehog 3','2026-08-03T18:16:15.949626+00:00','https://www.youtube.com/watch?v=YsC4TQ5EbYo',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Tight_Finale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(531,'Trancelude','Final Fantasy','2026-08-04T07:12:50.193079+00:00','https://www.youtube.com/watch?v=rh-t1l4FC7A',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Trancelude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(532,'Sword Evolution (Starlight)','Valis III','2026-08-03T05:03:06.537530+00:00','https://www.youtube.com/watch?v=HWitb3TVyqY',174,'https://ocrmirror.org/files/music/remixes/Valis_3_Sword_Evolution_(Starlight)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(533,'Hawaii Shoppi''n','The Legend of Zelda: Ocarina of Time','2026-08-04T10:09:34.842617+00:00','https://www.youtube.com/watch?v=rhQdJ4mXCIE',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Hawaii_Shoppi''n_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(534,'Pleasantly Dance in the Club','Phantasy Star II','2026-08-03T20:10:52.940232+00:00','https://www.youtube.com/watch?v=QqB3LX1HyWA',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_Pleasantly_Dance_in_the_Club_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(535,'Four Little Metroids','Super Metroid','2026-08-04T19:06:40.547335+00:00','https://www.youtube.com/watch?v=BWw6-R-Ae4E',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Four_Little_Metroids_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(536,'Cranium Castle','Mega Man 2','2026-08-04T10:09:34.308439+00:00','https://www.youtube.com/watch?v=S3jkEJjbrvw',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Cranium_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(537,'Load/Save the Last Trip-Hop for Me','Mario Paint','2026-08-04T12:25:00.081308+00:00','https://www.youtube.com/watch?v=NbSGB-OPT5I',126,'https://ocrmirror.org/files/music/remixes/Mario_Paint_Load_Save_the_Last_Trip-Hop_for_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(538,'Lounge Lemmings','Lemmings','2026-08-04T17:11:51.598329+00:00','https://www.youtube.com/watch?v=RpJBYAxaZIY',831,'https://ocrmirror.org/files/music/remixes/Lemmings_Lounge_Lemmings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(539,'This Valley Rocks','The Legend of Zelda: Ocarina of Time','2026-08-04T07:12:50.886478+00:00','https://www.youtube.com/watch?v=0OU8_bpTBqU',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_This_Valley_Rocks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(541,'Fill More Funk','ActRaiser','2026-08-05T04:42:18.288519+00:00','https://www.youtube.com/watch?v=YApbOp16saY',25,'https://ocrmirror.org/files/music/remixes/ActRaiser_Fill_More_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(542,'Stronghold of Chaos','Final Fantasy','2026-08-03T23:35:52.828183+00:00','https://www.youtube.com/watch?v=GJhtVdwOwzQ',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Stronghold_of_Chaos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(543,'Golden Axe 2002','Golden Axe','2026-08-04T07:12:51.572584+00:00','https://www.youtube.com/watch?v=PiT01D6UX_A',90,'https://ocrmirror.org/files/music/remixes/Golden_Axe_Golden_Axe_2002_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(544,'Dino Band Rehearsal','Super Mario World 2: Yoshi''s Island','2026-08-04T10:09:33.954706+00:00','https://www.youtube.com/watch?v=e92bBG4f7WY',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Dino_Band_Rehearsal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(545,'Gold Chocobo''s Casino','Final Fantasy IV','2026-08-03T16:01:36.004036+00:00','https://www.youtube.com/watch?v=AIi9q1gYk8Q',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Gold_Chocobo''s_Casino_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(546,'Credits Theme (One Credit Finish Mix)','Street Fighter II'': Champion Edition','2026-08-04T15:00:24.992100+00:00','https://www.youtube.com/watch?v=Ivv83fWoY-A',55,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2''_Champion_Edition_Credits_Theme_(One_Credit_Finish_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(547,'Killer Instincts Enhanced','Killer Instinct','2026-08-04T19:06:41.435874+00:00','https://www.youtube.com/watch?v=wW1-78au3EY',122,'https://ocrmirror.org/files/music/remixes/Killer_Instinct_Killer_Instincts_Enhanced_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(549,'Shop Mix','Top Gear 3000','2026-08-03T18:16:15.237205+00:00','https://www.youtube.com/watch?v=PnKPwKFnlkI',225,'https://ocrmirror.org/files/music/remixes/Top_Gear_3000_Shop_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(550,'Rydia''s Chocobo','Final Fantasy IV','2026-08-03T12:41:42.143453+00:00','https://www.youtube.com/watch?v=0fl7BAdD6RQ',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Rydia''s_Chocobo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(551,'Mystic Forest (Back to the Roots Mix)','Final Fantasy VI','2026-08-04T22:35:27.640392+00:00','https://www.youtube.com/watch?v=xIKcYC3N2z4',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Mystic_Forest_(Back_to_the_Roots_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(552,'Cursed Pirates of the Sea','Final Fantasy V','2026-08-05T04:42:18.996420+00:00','https://www.youtube.com/watch?v=OKGXWGUzr5k',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Cursed_Pirates_of_the_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(553,'Crystal Rave','Final Fantasy','2026-08-04T07:12:51.744685+00:00','https://www.youtube.com/watch?v=5-EkTEZgr_8',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Crystal_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(555,'Solitary Flight 2002','Super R-Type','2026-08-04T15:00:25.170013+00:00','https://www.youtube.com/watch?v=7a0qG5ad2-M',171,'https://ocrmirror.org/files/music/remixes/Super_R-Type_Solitary_Flight_2002_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(556,'Memories of Saria','The Legend of Zelda: Ocarina of Time','2026-08-04T22:35:27.777573+00:00','https://www.youtube.com/watch?v=KNT89aq6ipM',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Memories_of_Saria_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(557,'Whispering Prayers','Secret of Mana','2026-08-03T23:35:52.633327+00:00','https://www.youtube.com/watch?v=6vZ-2eatJGo',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Whispering_Prayers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(558,'The DarK Underground','Super Mario Bros. 2','2026-08-04T17:11:52.666327+00:00','https://www.youtube.com/watch?v=NR4uXevbLJM',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_The_DarK_Underground_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(559,'Rydia (Clean Mix)','Final Fantasy IV','2026-08-04T15:00:24.277317+00:00','https://www.youtube.com/watch?v=tYqGFEfkTIs',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Rydia_(Clean_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(560,'Stage 1 Theme (The T-Braster Mix)','Gaiares','2026-08-03T21:40:00.321247+00:00','https://www.youtube.com/watch?v=_MK6s6KlvQc',170,'https://ocrmirror.org/files/music/remixes/Gaiares_Stage_1_Theme_(The_T-Braster_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(561,'Matoya''s Hot with Destiny','Final Fantasy','2026-08-04T19:06:40.192264+00:00','https://www.youtube.com/watch?v=hcsjAH8BBv4',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Matoya''s_Hot_with_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(562,'Brambly Rivers','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-05T08:01:19.811841+00:00','https://www.youtube.com/watch?v=NYQg-yULE2k',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Brambly_Rivers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(563,'Rapid Fire','Mega Man 2','2026-08-04T17:11:52.310745+00:00','https://www.youtube.com/watch?v=gdiNLuZAYuQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Rapid_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(564,'Retouch the Boss (Short Edit)','Streets of Rage','2026-08-04T12:25:00.435945+00:00','https://www.youtube.com/watch?v=eMFKuqtajPw',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Retouch_the_Boss_(Short_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(565,'Sound Test','Kung Fu','2026-08-03T23:35:52.058441+00:00','https://www.youtube.com/watch?v=gkOGLS9-T2o',200,'https://ocrmirror.org/files/music/remixes/Kung_Fu_Sound_Test_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(567,'China Street Beat','Street Fighter II: The World Warrior','2026-08-04T20:50:12.360909+00:00','https://www.youtube.com/watch?v=7Nd8dtw1UII',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_China_Street_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(568,'Let''s Go Dance','Lemmings','2026-08-04T15:00:25.702404+00:00','https://www.youtube.com/watch?v=iNAvc8LWjAI',831,'https://ocrmirror.org/files/music/remixes/Lemmings_Let''s_Go_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(569,'Brainsick Metal','Mega Man X','2026-08-05T08:01:20.347679+00:00','https://www.youtube.com/watch?v=T-OppykeE7Y',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Brainsick_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(570,'Crashed Men','Mega Man 2','2026-08-04T10:09:34.663422+00:00','https://www.youtube.com/watch?v=OAzRVMoBV8s',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Crashed_Men_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(571,'X-Mix','Zanac','2026-08-04T03:48:00.809902+00:00','https://www.youtube.com/watch?v=a9SX478jleA',69,'https://ocrmirror.org/files/music/remixes/Zanac_X-Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(572,'Everything Remains Jurassic','Jurassic Park','2026-08-04T20:50:12.009372+00:00','https://www.youtube.com/watch?v=Fjn5Veu7jJ0',197,'https://ocrmirror.org/files/music/remixes/Jurassic_Park_Everything_Remains_Jurassic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(573,'Mega Dance Mix 2002','Super Metroid','2026-08-05T00:54:44.890565+00:00','https://www.youtube.com/watch?v=V4uPhLc7eg4',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Mega_Dance_Mix_2002_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(574,'Blue Chopper','Super Thunder Blade','2026-08-04T15:00:25.346871+00:00','https://www.youtube.com/watch?v=ZdoHp25h_B0',235,'https://ocrmirror.org/files/music/remixes/Super_Thunder_Blade_Blue_Chopper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(575,'Jamming Loneliness','Final Fantasy IX','2026-08-04T15:00:24.636101+00:00','https://www.youtube.com/watch?v=vjenl5QDGJE',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Jamming_Loneliness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(576,'Liquid Corridor (Clean Mix)','The Guardian Legend','2026-08-04T15:00:24.458089+00:00','https://www.youtube.com/watch?v=B04L-GOtcPc',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Liquid_Corridor_(Clean_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(577,'Super Buck II','Super Mario Bros. 2','2026-08-05T15:37:23.651079+00:00','https://www.youtube.com/watch?v=CotqYivpqmw',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Super_Buck_II_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(578,'Pharoah Land','Life Force','2026-08-04T20:50:11.832194+00:00','https://www.youtube.com/watch?v=rSQZVtxzYbg',237,'https://ocrmirror.org/files/music/remixes/Life_Force_Pharoah_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(580,'Barrels of Fun','Doom II: Hell on Earth','2026-08-05T00:54:44.534347+00:00','https://www.youtube.com/watch?v=pnM5CDi7-UI',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Barrels_of_Fun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(581,'Jungle Jazz','Street Fighter III: 3rd Strike: Fight for the Future','2026-08-05T10:59:41.564330+00:00','https://www.youtube.com/watch?v=Wp0QAMQ8sKA',238,'https://ocrmirror.org/files/music/remixes/Street_Fighter_3_3rd_Strike_Jungle_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(582,'Morning After (Hangover)','Final Fantasy VI','2026-08-04T15:00:25.880461+00:00','https://www.youtube.com/watch?v=7CR-VR1uL44',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Morning_After_(Hangover)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(583,'HardCore','Green Beret','2026-08-04T17:11:52.487932+00:00','https://www.youtube.com/watch?v=t0QGxQ3UFIo',247,'https://ocrmirror.org/files/music/remixes/Green_Beret_HardCore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(584,'String Machine (Corel Prison Mix)','Final Fantasy VII','2026-08-05T10:59:41.917889+00:00','https://www.youtube.com/watch?v=VGSlTWa0mHE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_String_Machine_(Corel_Prison_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(585,'Simon Belmont''s Garage','Castlevania','2026-08-04T19:06:40.001085+00:00','https://www.youtube.com/watch?v=5vcXbPGlObU',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Simon_Belmont''s_Garage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(586,'Suffering Planet','Final Fantasy VII','2026-08-05T13:09:56.572211+00:00','https://www.youtube.com/watch?v=EeB78S1Hvno',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Suffering_Planet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(587,'Tears for a Moonlit Knight','Soul Blazer','2026-08-04T19:06:41.259604+00:00','https://www.youtube.com/watch?v=8fycsj-ebB8',248,'https://ocrmirror.org/files/music/remixes/Soul_Blazer_Tears_for_a_Moonlit_Knight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(588,'Dirge for the Frosty Plains','Secret of Mana','2026-08-04T20:50:12.885575+00:00','https://www.youtube.com/watch?v=5LxqQFZ7TcU',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Dirge_for_the_Frosty_Plains_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(589,'Koiji na Shi no Genchou','Xenogears','2026-08-04T12:25:00.966292+00:00','https://www.youtube.com/watch?v=dQqRiwipmdU',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Koiji_na_Shi_no_Genchou_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(591,'Crystals of Kakariko','The Legend of Zelda: A Link to the Past','2026-08-05T08:01:19.094383+00:00','https://www.youtube.com/watch?v=fdzNqZIVqvc',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Crystals_of_Kakariko_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(592,'Uncaptured Jewel','Xenogears','2026-08-05T00:54:44.179767+00:00','https://www.youtube.com/watch?v=mVsnla6qMMY',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Uncaptured_Jewel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(593,'Mystic Piano','Shadowgate','2026-08-05T00:54:44.712514+00:00','https://www.youtube.com/watch?v=svf0YRrcknw',152,'https://ocrmirror.org/files/music/remixes/Shadowgate_Mystic_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(594,'Mechanical Swamp','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-05T04:42:19.349036+00:00','https://www.youtube.com/watch?v=D4pR5qvck08',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Mechanical_Swamp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(595,'Blue Vacation','F-Zero','2026-08-05T08:01:20.169060+00:00','https://www.youtube.com/watch?v=8c9vR6ZGmlI',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Blue_Vacation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(596,'Chinatown (Bad Sushi)','The Revenge of Shinobi','2026-08-04T17:11:52.131280+00:00','https://www.youtube.com/watch?v=jqlKrj4MQpA',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_Chinatown_(Bad_Sushi)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(597,'Death Rave','Shadowgate','2026-08-04T12:25:00.612771+00:00','https://www.youtube.com/watch?v=h3vgkf4771g',152,'https://ocrmirror.org/files/music/remixes/Shadowgate_Death_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(598,'Underworld Rock','Super Mario Bros.','2026-08-04T22:35:27.086060+00:00','https://www.youtube.com/watch?v=RXoyOZj-vFo',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Underworld_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(599,'Tale in Piano','Final Fantasy IV','2026-08-05T10:59:42.269806+00:00','https://www.youtube.com/watch?v=GzBv_il5Cd0',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Tale_in_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(600,'74 Floors','The Combatribes','2026-08-05T00:54:44.000836+00:00','https://www.youtube.com/watch?v=lL0eXEdwVUE',249,'https://ocrmirror.org/files/music/remixes/Combatribes_74_Floors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(601,'Ruined World (Eternal Derelict)','Chrono Trigger','2026-08-05T18:04:01.351414+00:00','https://www.youtube.com/watch?v=mJTRq56TbH8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Ruined_World_(Eternal_Derelict)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(602,'Dwarfunk','Lagoon','2026-08-04T19:06:39.819336+00:00','https://www.youtube.com/watch?v=BFCzYlR-1vI',250,'https://ocrmirror.org/files/music/remixes/Lagoon_Dwarfunk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(603,'To Far Away Timescapes','Chrono Trigger','2026-08-05T00:54:44.357018+00:00','https://www.youtube.com/watch?v=bPwf8vQSLqw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_To_Far_Away_Timescapes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(604,'Emulated','Ninja Gaiden','2026-08-04T22:35:27.364611+00:00','https://www.youtube.com/watch?v=BVUSZMASsg0',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Emulated_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(605,'Little Mac''s Confession','Punch-Out!!','2026-08-06T11:00:35.655313+00:00','https://www.youtube.com/watch?v=pcHmmZf_ax0',141,'https://ocrmirror.org/files/music/remixes/Punch-Out_Little_Mac''s_Confession_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(606,'Li''l Blue Bastard','Sonic CD','2026-08-05T04:42:19.525806+00:00','https://www.youtube.com/watch?v=KdA3xDFaWv0',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Li''l_Blue_Bastard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(607,'Rosenthorne','The Guardian Legend','2026-08-05T13:09:55.799416+00:00','https://www.youtube.com/watch?v=yovhtp8Nwvw',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Rosenthorne_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(608,'Overdrive','Super Thunder Blade','2026-08-04T17:11:51.954268+00:00','https://www.youtube.com/watch?v=guj4ON6zM4M',235,'https://ocrmirror.org/files/music/remixes/Super_Thunder_Blade_Overdrive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(609,'Dream of Zeal','Chrono Trigger','2026-08-05T04:42:19.878764+00:00','https://www.youtube.com/watch?v=WWUuGMP8U-o',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Dream_of_Zeal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(610,'Dark Conflict','Perfect Dark','2026-08-04T20:50:11.296608+00:00','https://www.youtube.com/watch?v=pkljMIrR0rg',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Dark_Conflict_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(611,'Blissful Eruption','Sonic 3D Blast','2026-08-05T08:01:19.634085+00:00','https://www.youtube.com/watch?v=2Un1ohYxadA',251,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Blissful_Eruption_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(612,'Green Greens (Contagious Eye Infection)','Kirby Super Star','2026-08-05T08:01:19.990629+00:00','https://www.youtube.com/watch?v=Qk3ylZDuz6o',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Green_Greens_(Contagious_Eye_Infection)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(613,'Level 1 Theme (Brain Bucket Mix)','Tinhead','2026-08-05T04:42:18.468559+00:00','https://www.youtube.com/watch?v=ATV-M6VV_8Y',253,'https://ocrmirror.org/files/music/remixes/Tinhead_Level_1_Theme_(Brain_Bucket_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(614,'Wily''s Mosh Pit','Mega Man 2','2026-08-05T10:59:42.446574+00:00','https://www.youtube.com/watch?v=zb4JlgkIF74',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wily''s_Mosh_Pit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(615,'It''s Knighttime','Wizards & Warriors','2026-08-04T12:24:59.367358+00:00','https://www.youtube.com/watch?v=qbDneSIGyGk',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_It''s_Knighttime_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(616,'Break the Beat in Half, Dr. Wily (Extra Pie Mix)','Mega Man: The Wily Wars','2026-08-04T19:06:41.082661+00:00','https://www.youtube.com/watch?v=ZR2pBA0QCh4',254,'https://ocrmirror.org/files/music/remixes/Mega_Man_The_Wily_Wars_Break_the_Beat_in_Half_Dr_Wily_(Extra_Pie_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(617,'To Zanarkand Once Again','Final Fantasy X','2026-08-05T04:42:18.644281+00:00','https://www.youtube.com/watch?v=muezcJS5Krk',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_To_Zanarkand_Once_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(618,'Secrets','Metroid','2026-08-04T15:00:24.814420+00:00','https://www.youtube.com/watch?v=pr-Z-uN_lVg',73,'https://ocrmirror.org/files/music/remixes/Metroid_Secrets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(619,'Winds of Eternity','Final Fantasy III','2026-08-04T19:06:40.369737+00:00','https://www.youtube.com/watch?v=x8gMekMy6uk',10,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_3_Winds_of_Eternity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(620,'Wily Meets Flash Man','Mega Man 2','2026-08-05T10:59:41.386612+00:00','https://www.youtube.com/watch?v=xmp6ENHb_jI',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wily_Meets_Flash_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(621,'Times of Distortion','Chrono Trigger','2026-08-05T20:07:45.401205+00:00','https://www.youtube.com/watch?v=zF8CaWbPlag',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Times_of_Distortion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(622,'Stage Select','Mega Man X4','2026-08-04T22:35:26.806312+00:00','https://www.youtube.com/watch?v=5_o7BK5xNPc',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Stage_Select_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(623,'Dubbing the Body','Chrono Cross','2026-08-05T18:04:01.880557+00:00','https://www.youtube.com/watch?v=BfSOh5W7JCE',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Dubbing_the_Body_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(624,'Melodic Trance','Zillion','2026-08-04T20:50:11.656160+00:00','https://www.youtube.com/watch?v=C7nEIQy4Ef8',256,'https://ocrmirror.org/files/music/remixes/Zillion_Melodic_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(625,'Project X2 - Title Screen','Mega Man 2','2026-08-05T13:09:56.812894+00:00','https://www.youtube.com/watch?v=FgiJMJ9ezjs',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Project_X2_Title_Screen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(626,'Crysta Dreams','Terranigma','2026-08-05T00:54:45.244641+00:00','https://www.youtube.com/watch?v=tSu45jZoXUM',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Crysta_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(627,'Deep Mine','Gunstar Heroes','2026-08-05T10:59:42.800330+00:00','https://www.youtube.com/watch?v=KoZkn8eMGk4',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Deep_Mine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(628,'Sad Melody','Breath of Fire','2026-08-05T15:37:23.947993+00:00','https://www.youtube.com/watch?v=IEQLPkRYF8A',950,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_Sad_Melody_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(629,'Project X2 - Crash Man','Mega Man 2','2026-08-04T22:35:27.502424+00:00','https://www.youtube.com/watch?v=JLRd6n8afN0',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Project_X2_Crash_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(630,'Messatsu Gou-Techno','Marvel Super Heroes vs. Street Fighter','2026-08-05T13:09:55.270641+00:00','https://www.youtube.com/watch?v=JSoR6_FnEQc',260,'https://ocrmirror.org/files/music/remixes/Marvel_Super_Heroes_vs_Street_Fighter_Messatsu_Gou-Techno_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(631,'Aphrodite Oceanus','Secret of Mana','2026-08-05T21:46:19.303210+00:00','https://www.youtube.com/watch?v=WNWwJz1Qbh8',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Aphrodite_Oceanus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(632,'Temple Trance','Zelda II: The Adventure of Link','2026-08-05T15:37:23.061485+00:00','https://www.youtube.com/watch?v=deYv8CFsPLk',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Temple_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(633,'Castlemania','Castlevania','2026-08-06T00:54:22.937507+00:00','https://www.youtube.com/watch?v=B65xuhMcz0I',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Castlemania_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(634,'Midnight Slayer (Solemn Mix)','Castlevania','2026-08-05T20:07:45.940445+00:00','https://www.youtube.com/watch?v=Of7N-FGy3cU',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Midnight_Slayer_(Solemn_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(636,'Tristram Rock','Diablo','2026-08-05T10:59:42.621761+00:00','https://www.youtube.com/watch?v=3KGzkgBtcF4',108,'https://ocrmirror.org/files/music/remixes/Diablo_Tristram_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(637,'Calbrena ~ Tumultus Puparum','Final Fantasy IV','2026-08-05T00:54:45.423082+00:00','https://www.youtube.com/watch?v=7Int5PCpeFU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Calbrena_Tumultus_Puparum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(638,'The Engineer, Cid (Factory Mix)','Final Fantasy VI','2026-08-05T18:04:01.174268+00:00','https://www.youtube.com/watch?v=TW391htBfX8',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Engineer_Cid_(Factory_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(639,'DJ Chubby C. vs. Go Go Boco!','Final Fantasy IV','2026-08-04T19:06:40.724882+00:00','https://www.youtube.com/watch?v=6-bc6c-3bnc',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_DJ_Chubby_C_vs_Go_Go_Boco_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(640,'Rape of a Planet','Final Fantasy VII','2026-08-05T23:29:07.366378+00:00','https://www.youtube.com/watch?v=dVsy-hYxz3Y',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Rape_of_a_Planet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(641,'Liberi Fatali Overhaul','Final Fantasy VIII','2026-08-05T08:01:18.913444+00:00','https://www.youtube.com/watch?v=cYEEOVYPYuc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Liberi_Fatali_Overhaul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(642,'The Beginning of the Fantasy','Final Fantasy','2026-08-05T15:37:22.912090+00:00','https://www.youtube.com/watch?v=vJ2whtS0T_s',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_The_Beginning_of_the_Fantasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(643,'Hostility','Final Fantasy','2026-08-04T20:50:11.479144+00:00','https://www.youtube.com/watch?v=q624BsLnOBM',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Hostility_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(644,'Of Sinistrals and Men','Lufia II: Rise of the Sinistrals','2026-08-05T08:01:19.456297+00:00','https://www.youtube.com/watch?v=J3GrAseAmNY',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Of_Sinistrals_and_Men_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(645,'Time Preserved ~ April Showers','Lufia II: Rise of the Sinistrals','2026-08-05T04:42:19.172851+00:00','https://www.youtube.com/watch?v=PizP7cfvqQ0',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Time_Preserved_April_Showers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(646,'Cossack Hot Steppin''','Mega Man 4','2026-08-05T21:46:19.477960+00:00','https://www.youtube.com/watch?v=Dqj0clNDTaU',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Cossack_Hot_Steppin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(647,'House Hornet','Mega Man X3','2026-08-05T23:29:06.470285+00:00','https://www.youtube.com/watch?v=pNwnM5Aqd_o',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_House_Hornet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(648,'Far Promise ~ Drama','Radical Dreamers: Nusumenai Houseki','2026-08-04T22:35:26.946382+00:00','https://www.youtube.com/watch?v=c-RScoD95CE',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Far_Promise_Drama_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(649,'Awakening (Latin Radio Edit)','Xenogears','2026-08-05T00:54:45.067643+00:00','https://www.youtube.com/watch?v=jabUgT5y4Mo',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Awakening_(Latin_Radio_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(650,'Transient Sands ~ Dazil','Xenogears','2026-08-05T13:09:55.448820+00:00','https://www.youtube.com/watch?v=CIiS9YD9W9E',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Transient_Sands_Dazil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(651,'Theme of a Sailor','Xenogears','2026-08-05T08:01:19.274511+00:00','https://www.youtube.com/watch?v=JkD2t12g8DE',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Theme_of_a_Sailor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(652,'Millennial Mountain (Delightful Disco Mix)','Chrono Trigger','2026-08-06T08:00:07.892604+00:00','https://www.youtube.com/watch?v=iSExeQUf4-8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Millennial_Mountain_(Delightful_Disco_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(653,'virt''s Madness','M&M''s Minis Madness','2026-08-05T15:37:23.355881+00:00','https://www.youtube.com/watch?v=kUVTQ1I6Mks',261,'https://ocrmirror.org/files/music/remixes/M&M''s_Minis_Madness_virt''s_Madness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(654,'Dimstar','Super Metroid','2026-08-05T18:04:00.998111+00:00','https://www.youtube.com/watch?v=P24az-ymT64',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Dimstar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(655,'No One Can Do It Better','Alex Kidd in Miracle World','2026-08-05T23:29:06.816187+00:00','https://www.youtube.com/watch?v=WRdTsZTvHUs',27,'https://ocrmirror.org/files/music/remixes/Alex_Kidd_in_Miracle_World_No_One_Can_Do_It_Better_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(656,'Safety in Numbers','Final Fantasy IX','2026-08-05T18:04:00.822431+00:00','https://www.youtube.com/watch?v=yFnJfr933Qc',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Safety_in_Numbers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(657,'Project X2 - Metal Man','Mega Man 2','2026-08-05T08:01:20.527015+00:00','https://www.youtube.com/watch?v=jOe4r5RFokI',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Project_X2_Metal_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(658,'Rings of Saturn Valley','EarthBound','2026-08-05T10:59:42.093835+00:00','https://www.youtube.com/watch?v=vdVZSq9w_-g',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Rings_of_Saturn_Valley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(659,'St. Vital''s Fresh Limestone Cutz','The Legend of Zelda: Ocarina of Time','2026-08-05T13:09:55.974530+00:00','https://www.youtube.com/watch?v=I8-YA-DMw-o',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_St_Vital''s_Fresh_Limestone_Cutz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(660,'Thou Art a DJ','Dragon Warrior','2026-08-05T20:07:46.475374+00:00','https://www.youtube.com/watch?v=mfSDYN04t0o',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Thou_Art_a_DJ_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(661,'Time in the Clouds DX','Secret of Mana','2026-08-05T04:42:18.819705+00:00','https://www.youtube.com/watch?v=w88MNQO9fxc',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Time_in_the_Clouds_DX_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(662,'Vengeance','Ninja Gaiden','2026-08-04T20:50:12.184624+00:00','https://www.youtube.com/watch?v=-kxMxtbbKOA',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Vengeance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(663,'Chu-Chu''s Flight','Xenogears','2026-08-05T23:29:05.949247+00:00','https://www.youtube.com/watch?v=quYSe6wBG2Y',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Chu-Chu''s_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(664,'SID of Rage','Streets of Rage 2','2026-08-05T10:59:41.742481+00:00','https://www.youtube.com/watch?v=63N-NyqiCs0',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_SID_of_Rage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(665,'Dub Island (Bashment Riddim Edit)','Sonic the Hedgehog 3','2026-08-05T21:46:19.828285+00:00','https://www.youtube.com/watch?v=-sOZFiGHxzQ',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Dub_Island_(Bashment_Riddim_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(666,'CPC Zone','RoboCop','2026-08-05T15:37:23.800241+00:00','https://www.youtube.com/watch?v=9ULvPAf3MPA',263,'https://ocrmirror.org/files/music/remixes/RoboCop_CPC_Zone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(667,'Hostile but Cuddly','Seiken Densetsu 3','2026-08-06T00:54:23.348888+00:00','https://www.youtube.com/watch?v=ztuRhrQi0gc',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Hostile_but_Cuddly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(668,'Beginnings','The Longest Journey','2026-08-05T20:07:46.119327+00:00','https://www.youtube.com/watch?v=fNC7BpOgExs',262,'https://ocrmirror.org/files/music/remixes/Longest_Journey_Beginnings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(670,'Metal Monkey','Escape from Monkey Island','2026-08-05T20:07:45.580892+00:00','https://www.youtube.com/watch?v=kQTd_tty0eQ',809,'https://ocrmirror.org/files/music/remixes/Escape_from_Monkey_Island_Metal_Monkey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(671,'Underground Mix','Tempest 2000','2026-08-05T13:09:55.093051+00:00','https://www.youtube.com/watch?v=1ShsvDdjGKA',265,'https://ocrmirror.org/files/music/remixes/Tempest_2000_Underground_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(673,'Molding of Destinies','Chrono Trigger','2026-08-06T08:00:07.007984+00:00','https://www.youtube.com/watch?v=qK-J3_mb_h4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Molding_of_Destinies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(674,'Inside the Roadhouse','Zillion','2026-08-06T08:00:08.422964+00:00','https://www.youtube.com/watch?v=Mvl_Ppm1Qt8',256,'https://ocrmirror.org/files/music/remixes/Zillion_Inside_the_Roadhouse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(675,'Town Tribute','Final Fantasy II','2026-08-05T18:04:01.528642+00:00','https://www.youtube.com/watch?v=u6cZ-cA1Tr8',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Town_Tribute_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(676,'Just Chill','Chrono Cross','2026-08-05T23:29:06.643430+00:00','https://www.youtube.com/watch?v=tEn7fQDNRPM',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Just_Chill_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(677,'Mounted Machine Gun Funk','Jackal','2026-08-05T23:29:06.990595+00:00','https://www.youtube.com/watch?v=wb_8RcMGT4Q',266,'https://ocrmirror.org/files/music/remixes/Jackal_Mounted_Machine_Gun_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(678,'Epitaph of Alan and Cerl','Breath of Fire','2026-08-06T04:42:53.693366+00:00','https://www.youtube.com/watch?v=hj8gtOMV0Og',259,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_Epitaph_of_Alan_and_Cerl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(680,'DownTown','Castlevania II: Simon''s Quest','2026-08-06T00:54:22.662333+00:00','https://www.youtube.com/watch?v=kDNOyY6pXfw',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_DownTown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(681,'Razors Theme (Guts Mix)','Tecmo Cup','2026-08-05T20:07:45.762167+00:00','https://www.youtube.com/watch?v=Cvehyd9D0lU',267,'https://ocrmirror.org/files/music/remixes/Tecmo_Cup_Razors_Theme_(Guts_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(682,'Taikal Drum ''n'' Ragga','Sonic Adventure','2026-08-06T08:00:06.828666+00:00','https://www.youtube.com/watch?v=ycyJmvp86Cs',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_Taikal_Drum_''n''_Ragga_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(683,'Dirty Mix','Super Mario Bros.','2026-08-07T03:28:03.306904+00:00','https://www.youtube.com/watch?v=E1ePNuonYCI',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Dirty_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(684,'Uh Oh! The Beat Have Started to Move!','Metal Gear','2026-08-06T08:00:08.245565+00:00','https://www.youtube.com/watch?v=KvUUyKWvkwA',140,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Uh_Oh_The_Beat_Have_Started_to_Move_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(685,'bLiNd Is Dah BomB!','Mario Paint','2026-08-05T15:37:23.208440+00:00','https://www.youtube.com/watch?v=5jQTpGK-rik',126,'https://ocrmirror.org/files/music/remixes/Mario_Paint_bLiNd_Is_Dah_BomB_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(686,'Trippin'' on Rainbows','Super Mario Kart','2026-08-06T13:09:23.307217+00:00','https://www.youtube.com/watch?v=Vrx3uJwEg2c',269,'https://ocrmirror.org/files/music/remixes/Super_Mario_Kart_Trippin''_on_Rainbows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(687,'Simian Symphony: Part 1','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-07T00:23:37.035775+00:00','https://www.youtube.com/watch?v=Ee3mcjt3GD8',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Simian_Symphony_Part_1_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(688,'New Age Gipsy Dance Mix','Jurassic Park','2026-08-05T21:46:18.952876+00:00','https://www.youtube.com/watch?v=p5BrRXFT9TQ',268,'https://ocrmirror.org/files/music/remixes/Jurassic_Park_New_Age_Gipsy_Dance_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(689,'SNES Battle Medley','Final Fantasy IV','2026-08-07T00:23:37.390014+00:00','https://www.youtube.com/watch?v=nTYe0fHPaiA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_SNES_Battle_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(690,'Metal Gear May Cry','Metal Gear Solid 2: Sons of Liberty','2026-08-07T05:16:20.436135+00:00','https://www.youtube.com/watch?v=8nC2dUkPbII',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Metal_Gear_May_Cry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(691,'Love Hurts','Sonic the Hedgehog','2026-08-06T11:00:34.950638+00:00','https://www.youtube.com/watch?v=umz4Wl6mg5c',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Love_Hurts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(692,'Big and Blue and Round','The Guardian Legend','2026-08-05T15:37:23.503732+00:00','https://www.youtube.com/watch?v=oMliw3RzKbc',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Big_and_Blue_and_Round_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(693,'Far from Home','Final Fantasy X','2026-08-06T11:00:35.484940+00:00','https://www.youtube.com/watch?v=r3I-TOUHvOo',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Far_from_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(694,'Fear (Arrakis: GIGA)','Rez','2026-08-06T00:54:23.485537+00:00','https://www.youtube.com/watch?v=ni7YY7_GFs4',271,'https://ocrmirror.org/files/music/remixes/Rez_Fear_(Arrakis_GIGA)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(697,'Lobby Static','Phantasy Star Online','2026-08-05T20:07:47.011790+00:00','https://www.youtube.com/watch?v=MRWMupkWCEU',272,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_Online_Lobby_Static_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(698,'Pullum Summer Trance Mix 2002','Street Fighter EX plus α','2026-08-04T22:35:27.915944+00:00','https://www.youtube.com/watch?v=Ge1m36JT_kk',273,'https://ocrmirror.org/files/music/remixes/Street_Fighter_EX_plus_a_Pullum_Summer_Trance_Mix_2002_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(699,'Let Us Dance in the Dark Phantom Phorest','Final Fantasy VI','2026-08-05T21:46:18.602972+00:00','https://www.youtube.com/watch?v=Zxf0926-Ssc',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Let_Us_Dance_in_the_Dark_Phantom_Phorest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(700,'Memory','Mega Man X3','2026-08-06T04:42:53.165921+00:00','https://www.youtube.com/watch?v=CQoqG3RdQBY',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(701,'The Endless Search','Final Fantasy VI','2026-08-06T15:42:01.692678+00:00','https://www.youtube.com/watch?v=3UiFr0LqqIU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Endless_Search_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(702,'Collision Chaos Old School','Sonic CD','2026-08-05T23:29:06.122755+00:00','https://www.youtube.com/watch?v=Jpknhgbq1g0',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Collision_Chaos_Old_School_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(703,'Cel-Shaded Geisha','Fear Effect','2026-08-05T13:09:55.624816+00:00','https://www.youtube.com/watch?v=eMbilMCu5BA',274,'https://ocrmirror.org/files/music/remixes/Fear_Effect_Cel-Shaded_Geisha_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(704,'Dr. Wily Haunts Flash Man','Mega Man 2','2026-08-06T08:00:07.717403+00:00','https://www.youtube.com/watch?v=3ySeC_SEFfo',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Dr_Wily_Haunts_Flash_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(705,'The Final Reunion','Lufia & The Fortress of Doom','2026-08-05T13:09:56.174136+00:00','https://www.youtube.com/watch?v=VXpsUCF3I4I',156,'https://ocrmirror.org/files/music/remixes/Lufia_&_The_Fortress_of_Doom_The_Final_Reunion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(706,'Diet Thirstquencher','Brave Fencer Musashi','2026-08-05T18:04:02.057214+00:00','https://www.youtube.com/watch?v=AhAt1gZyP6o',275,'https://ocrmirror.org/files/music/remixes/Brave_Fencer_Musashi_Diet_Thirstquencher_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(707,'Wandering the Wild Forest','Secret of Mana','2026-08-05T21:46:18.428107+00:00','https://www.youtube.com/watch?v=Cg8ypq9YoMI',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Wandering_the_Wild_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(708,'Requiem for a Green Revolution','Chrono Trigger','2026-08-05T21:46:19.128006+00:00','https://www.youtube.com/watch?v=wB4K3QewXao',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Requiem_for_a_Green_Revolution_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(709,'Chao Marathon','Sonic Adventure 2','2026-08-05T23:29:07.163198+00:00','https://www.youtube.com/watch?v=6D7ThjZvWB4',277,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_2_Chao_Marathon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(710,'USB Mindlink','Kabuki: Quantum Fighter','2026-08-05T21:46:18.778900+00:00','https://www.youtube.com/watch?v=HvvMJyGbBeE',276,'https://ocrmirror.org/files/music/remixes/Kabuki_Quantum_Fighter_USB_Mindlink_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(711,'There Was a Hole Here','Silent Hill 2: Restless Dreams','2026-08-05T20:07:46.297350+00:00','https://www.youtube.com/watch?v=q1razseaWAE',39576,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_There_Was_a_Hole_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(712,'Mama Brain','Phantasy Star II','2026-08-06T04:42:53.869718+00:00','https://www.youtube.com/watch?v=9px39dhnPU4',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_Mama_Brain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(713,'Floor Master Ninja','Ninja Gaiden','2026-08-05T13:09:56.359253+00:00','https://www.youtube.com/watch?v=_DdGMgLsJGQ',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Floor_Master_Ninja_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(714,'Wawoow! Training Exercises','MechWarrior 2: Mercenaries','2026-08-06T04:42:53.517372+00:00','https://www.youtube.com/watch?v=hvlb76aqgC4',201,'https://ocrmirror.org/files/music/remixes/MechWarrior_2_Mercenaries_Wawoow_Training_Exercises_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(715,'Journey to Thor','Tales of Phantasia','2026-08-06T00:54:23.213100+00:00','https://www.youtube.com/watch?v=8BYNifstTNQ',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Journey_to_Thor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(716,'Lost Woods South Central','The Legend of Zelda: A Link to the Past','2026-08-06T11:00:35.825861+00:00','https://www.youtube.com/watch?v=R5mfiqix5qc',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Lost_Woods_South_Central_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(717,'Kick My Axe','Axelay','2026-08-07T06:46:03.112033+00:00','https://www.youtube.com/watch?v=WTdgJkhzQYQ',34,'https://ocrmirror.org/files/music/remixes/Axelay_Kick_My_Axe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(718,'Oldschool Opening','Final Fantasy VI','2026-08-05T18:04:00.646281+00:00','https://www.youtube.com/watch?v=c0niQMYmfUI',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Oldschool_Opening_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(719,'Cid in the Factory','Final Fantasy VI','2026-08-07T03:28:03.834521+00:00','https://www.youtube.com/watch?v=JqG2KC0D19A',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Cid_in_the_Factory_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(720,'An Answered Cry','Final Fantasy VII','2026-08-05T23:29:06.295887+00:00','https://www.youtube.com/watch?v=F0ko2otfMus',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_An_Answered_Cry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(721,'Teach Me How to Rave','Final Fantasy Tactics','2026-08-06T00:54:22.245520+00:00','https://www.youtube.com/watch?v=5-1hTo4z2No',279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Tactics_Teach_Me_How_to_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(722,'Jungle Stomp','Donkey Kong Country','2026-08-05T20:07:46.833228+00:00','https://www.youtube.com/watch?v=ChAAoPUIehY',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Jungle_Stomp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(723,'Galvanized Boss','Final Fantasy VII','2026-08-07T00:23:37.212566+00:00','https://www.youtube.com/watch?v=ghqzMYs3D24',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Galvanized_Boss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(724,'Farewell, Star Guardian','Super Mario RPG: Legend of the Seven Stars','2026-08-07T03:28:04.010371+00:00','https://www.youtube.com/watch?v=1W-WMvYdFqQ',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Farewell_Star_Guardian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(725,'Ephemeral Evergreen','Castlevania III: Dracula''s Curse','2026-08-06T04:42:52.990022+00:00','https://www.youtube.com/watch?v=9aTM0UnfWEc',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Ephemeral_Evergreen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(726,'JENOVAD Trance','Final Fantasy VII','2026-08-06T15:42:00.982523+00:00','https://www.youtube.com/watch?v=4HamTwT77-A',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_JENOVAD_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(727,'Sweet Plum Aspara','Wizards & Warriors','2026-08-06T00:54:22.383775+00:00','https://www.youtube.com/watch?v=QrbFHpqffUg',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_Sweet_Plum_Aspara_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(728,'Rainbow Rain','Super Mario Kart','2026-08-06T08:00:08.068299+00:00','https://www.youtube.com/watch?v=E3Ovo4JJpIA',269,'https://ocrmirror.org/files/music/remixes/Super_Mario_Kart_Rainbow_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(729,'Going Up','Streets of Rage','2026-08-05T18:04:01.704900+00:00','https://www.youtube.com/watch?v=vH0Ea9wnsR0',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Going_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(730,'Dungeon Cave (Buried Alive Mix)','Skies of Arcadia','2026-08-06T11:00:36.164342+00:00','https://www.youtube.com/watch?v=BGrsCVEFwXw',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Dungeon_Cave_(Buried_Alive_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(731,'Calming the Angry Sea','Crystalis','2026-08-06T15:42:00.804390+00:00','https://www.youtube.com/watch?v=l7wPpMgCszE',282,'https://ocrmirror.org/files/music/remixes/Crystalis_Calming_the_Angry_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(732,'River City Rammstein','River City Ransom','2026-08-07T00:23:36.851192+00:00','https://www.youtube.com/watch?v=ds7m8VO5igI',242,'https://ocrmirror.org/files/music/remixes/River_City_Ransom_River_City_Rammstein_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(733,'What Hath Thou Done with This','Chrono Trigger','2026-08-06T08:00:07.541585+00:00','https://www.youtube.com/watch?v=r_yQjXb0jr4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_What_Hath_Thou_Done_with_This_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(734,'House Leaves','Crystalis','2026-08-06T13:09:22.595796+00:00','https://www.youtube.com/watch?v=EZFfPYrRTBU',282,'https://ocrmirror.org/files/music/remixes/Crystalis_House_Leaves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(735,'Rena Lanford of Arlia Village','Star Ocean: The Second Story','2026-08-07T05:16:20.186964+00:00','https://www.youtube.com/watch?v=Jmh9a1J9L3g',283,'https://ocrmirror.org/files/music/remixes/Star_Ocean_The_Second_Story_Rena_Lanford_of_Arlia_Village_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(736,'Staff Battle','Super Mario Bros. 3','2026-08-06T00:54:22.523233+00:00','https://www.youtube.com/watch?v=eQX_t7j4kQc',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Staff_Battle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(738,'Hardcore','Final Fantasy','2026-08-06T04:42:53.342345+00:00','https://www.youtube.com/watch?v=06ZTA9TvWHA',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Hardcore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(739,'Aquatic Interlude','Super Mario Bros.','2026-08-06T08:00:07.364164+00:00','https://www.youtube.com/watch?v=5_xVE91nJHM',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Aquatic_Interlude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(740,'Synthetic Demon','Doom','2026-08-06T04:42:52.637792+00:00','https://www.youtube.com/watch?v=1mN9MUz9XF4',14512,'https://ocrmirror.org/files/music/remixes/Doom_Synthetic_Demon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(741,'Fat Dance','The 7th Guest','2026-08-06T13:09:23.127342+00:00','https://www.youtube.com/watch?v=bCb0ZGYRSHQ',836,'https://ocrmirror.org/files/music/remixes/7th_Guest_Fat_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(742,'ColKaos Stoned Future','Sonic CD','2026-08-06T13:09:22.420153+00:00','https://www.youtube.com/watch?v=mTe6g6zcdmo',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_ColKaos_Stoned_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(743,'Animal Village Greenwich Village','The Legend of Zelda: Link''s Awakening','2026-08-05T18:04:00.467224+00:00','https://www.youtube.com/watch?v=Ffg1EdC62lM',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Animal_Village_Greenwich_Village_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(744,'Enchanted Esper','Final Fantasy VI','2026-08-07T03:28:03.132082+00:00','https://www.youtube.com/watch?v=NoCIrFRjmq4',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Enchanted_Esper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(745,'Thy Followers','ActRaiser','2026-08-07T05:16:19.815599+00:00','https://www.youtube.com/watch?v=Q6UfJoV4_ak',25,'https://ocrmirror.org/files/music/remixes/ActRaiser_Thy_Followers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(746,'Mach Schnell','Mach Rider','2026-08-07T05:16:19.288611+00:00','https://www.youtube.com/watch?v=00CiPBKX9lA',285,'https://ocrmirror.org/files/music/remixes/Mach_Rider_Mach_Schnell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(747,'Pilot the Yggdrasil','Xenogears','2026-08-06T13:09:23.666090+00:00','https://www.youtube.com/watch?v=t7a4YbicXQY',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Pilot_the_Yggdrasil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(748,'Ruined Skies','Final Fantasy VI','2026-08-07T03:28:02.956068+00:00','https://www.youtube.com/watch?v=YMqjfxOP5wM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Ruined_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(749,'Trippy Puppet Style','Sonic 3D Blast','2026-08-05T15:37:22.611664+00:00','https://www.youtube.com/watch?v=KQ34ugVxaxc',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Trippy_Puppet_Style_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(750,'Eres des Points','Final Fantasy VI','2026-08-07T13:48:43.562005+00:00','https://www.youtube.com/watch?v=fQALJ5QyZzY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Eres_des_Points_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(751,'Desperados','Final Fantasy VIII','2026-08-06T13:09:22.949681+00:00','https://www.youtube.com/watch?v=B7zJCZL0aek',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Desperados_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(752,'Into the Earth','Blaster Master','2026-08-05T20:07:46.654397+00:00','https://www.youtube.com/watch?v=TNnHIBFBLMY',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Into_the_Earth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(753,'Pachelbel''s Ganon','The Legend of Zelda: Ocarina of Time','2026-08-07T16:23:32.036546+00:00','https://www.youtube.com/watch?v=sYDkwMoPFTA',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Pachelbel''s_Ganon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(754,'Gothic Sandy','Doom II: Hell on Earth','2026-08-07T03:28:04.362184+00:00','https://www.youtube.com/watch?v=TfpGfB_gURQ',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Gothic_Sandy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(755,'Sphercular Kinetics','Marble Madness','2026-08-07T00:23:37.743346+00:00','https://www.youtube.com/watch?v=qhmoZUVrDSM',286,'https://ocrmirror.org/files/music/remixes/Marble_Madness_Sphercular_Kinetics_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(756,'Nay Tomorrow','Silent Hill','2026-08-07T08:33:47.591956+00:00','https://www.youtube.com/watch?v=tTKsPGZpQm0',62,'https://ocrmirror.org/files/music/remixes/Silent_Hill_Nay_Tomorrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(757,'Nial and Nowhere','Phantasy Star III: Generations of Doom','2026-08-06T11:00:35.122870+00:00','https://www.youtube.com/watch?v=d0eiRXtWwVQ',95,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_3_Nial_and_Nowhere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(758,'Heavyarms (Let Me Lift This Load)','Mobile Suit Gundam Wing: Endless Duel','2026-08-07T03:28:04.186011+00:00','https://www.youtube.com/watch?v=FQQm8bcrIvQ',287,'https://ocrmirror.org/files/music/remixes/Mobile_Suit_Gundam_Wing_Endless_Duel_Heavyarms_(Let_Me_Lift_This_Load)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(759,'Ice Attack','Sonic the Hedgehog 3','2026-08-05T21:46:19.652671+00:00','https://www.youtube.com/watch?v=coSEp2n3xfU',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Ice_Attack_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(760,'Hail to the Throne','Dragon Warrior','2026-08-06T08:00:07.187062+00:00','https://www.youtube.com/watch?v=sRX_xU9CmLQ',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Hail_to_the_Throne_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(761,'The Tallest Building','Mega Man 2','2026-08-07T08:33:48.474748+00:00','https://www.youtube.com/watch?v=1N4Pp1hxzJw',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Tallest_Building_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(762,'Enigmatic Lunacy','Magical Drop III','2026-08-06T15:42:00.626321+00:00','https://www.youtube.com/watch?v=lJ4rduIskL4',288,'https://ocrmirror.org/files/music/remixes/Magical_Drop_3_Enigmatic_Lunacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(763,'Blue','Terranigma','2026-08-06T13:09:22.244322+00:00','https://www.youtube.com/watch?v=xqBgGBJ3New',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(764,'Forest Fire','U.N. Squadron','2026-08-06T00:54:22.800206+00:00','https://www.youtube.com/watch?v=IPRYU0gkbKo',289,'https://ocrmirror.org/files/music/remixes/UN_Squadron_Forest_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(765,'Deploy','Perfect Dark','2026-08-07T00:23:36.672671+00:00','https://www.youtube.com/watch?v=fP-oCOXbhXY',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Deploy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(766,'Wormaphobic Disorder','Earthworm Jim 2','2026-08-07T00:23:36.319853+00:00','https://www.youtube.com/watch?v=Hxm79TNyYNc',189,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_2_Wormaphobic_Disorder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(767,'Bomberfuzz','Bomberman II','2026-08-07T06:46:02.230272+00:00','https://www.youtube.com/watch?v=2_ltvS_xshs',800,'https://ocrmirror.org/files/music/remixes/Bomberman_2_Bomberfuzz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(768,'Plastic Goddess','Barbie Super Model','2026-08-07T00:23:36.142188+00:00','https://www.youtube.com/watch?v=ANQ3a-RBkJM',290,'https://ocrmirror.org/files/music/remixes/Barbie_Super_Model_Plastic_Goddess_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(769,'The Temple Revisited','Zelda II: The Adventure of Link','2026-08-06T15:42:01.161207+00:00','https://www.youtube.com/watch?v=zz0QMooqTc8',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_The_Temple_Revisited_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(770,'Technomancy','Castlevania: Circle of the Moon','2026-08-07T10:25:23.941935+00:00','https://www.youtube.com/watch?v=Cu_sMPC16Yo',291,'https://ocrmirror.org/files/music/remixes/Castlevania_Circle_of_the_Moon_Technomancy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(771,'Phalanx (Possessed by Humans)','Demon''s Crest','2026-08-07T06:46:03.465849+00:00','https://www.youtube.com/watch?v=lvLLGTtMbpg',292,'https://ocrmirror.org/files/music/remixes/Demon''s_Crest_Phalanx_(Possessed_by_Humans)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(772,'Phantom Midnight','Final Fantasy VI','2026-08-07T08:33:48.826166+00:00','https://www.youtube.com/watch?v=dbKJyyaaw1A',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Phantom_Midnight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(773,'3 Ways','Astérix & Obélix','2026-08-06T15:42:02.045375+00:00','https://www.youtube.com/watch?v=QPcuj_9wa3o',293,'https://ocrmirror.org/files/music/remixes/Asterix_&_Obelix_3_Ways_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(774,'Hyperion','The Guardian Legend','2026-08-06T15:42:01.868187+00:00','https://www.youtube.com/watch?v=sEBZAbCL0YU',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Hyperion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(775,'Chocarena','Final Fantasy VII','2026-08-07T06:46:03.289854+00:00','https://www.youtube.com/watch?v=t69x3ZH1Y4U',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Chocarena_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(776,'Journey of Solitude','Dragon Warrior','2026-08-07T08:33:48.299105+00:00','https://www.youtube.com/watch?v=vbWJHaWt2DE',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Journey_of_Solitude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(777,'Concerning Daventry','King''s Quest V: Absence Makes the Heart Go Yonder','2026-08-06T11:00:35.994286+00:00','https://www.youtube.com/watch?v=4o1Q_ocQ2bE',958,'https://ocrmirror.org/files/music/remixes/King''s_Quest_5_Concerning_Daventry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(778,'Blue Vision','Donkey Kong Country','2026-08-07T08:33:47.945311+00:00','https://www.youtube.com/watch?v=fGFKdSfJxQU',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Blue_Vision_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(779,'Journey to the Finish','Hang-On','2026-08-07T05:16:18.757319+00:00','https://www.youtube.com/watch?v=sb6W-6WcOIE',295,'https://ocrmirror.org/files/music/remixes/Hang-On_Journey_to_the_Finish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(780,'Psycho Rave','The King of Fighters ''96','2026-08-06T15:42:01.338022+00:00','https://www.youtube.com/watch?v=2jD5QYDMZZA',297,'https://ocrmirror.org/files/music/remixes/King_of_Fighters_''96_Psycho_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(781,'Good Night, Li''l Man','Mega Man 5','2026-08-07T05:16:19.640374+00:00','https://www.youtube.com/watch?v=zaN7hUOKfZ8',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_Good_Night_Li''l_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(782,'Title Jam','Plok','2026-08-07T10:25:23.417287+00:00','https://www.youtube.com/watch?v=2648hn_ejqA',298,'https://ocrmirror.org/files/music/remixes/Plok_Title_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(784,'Seaside Lullaby (Wind Fish Ballade)','The Legend of Zelda: Link''s Awakening','2026-08-07T03:28:03.658827+00:00','https://www.youtube.com/watch?v=oxcFaCDiiys',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Seaside_Lullaby_(Wind_Fish_Ballade)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(785,'Taming of the Skies','Xenogears','2026-08-06T04:42:54.046145+00:00','https://www.youtube.com/watch?v=XA2dt56MIVY',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Taming_of_the_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(786,'Teardrinker','Mega Man 2','2026-08-07T12:08:30.508379+00:00','https://www.youtube.com/watch?v=KVSzH-Mg_DI',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Teardrinker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(787,'Shades of Blue','Mega Man 4','2026-08-06T15:42:00.442588+00:00','https://www.youtube.com/watch?v=-CRyXyA4o2M',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Shades_of_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(788,'Slow Moon Groove','Streets of Rage 2','2026-08-07T08:33:48.650295+00:00','https://www.youtube.com/watch?v=hLVgjy9l4NI',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Slow_Moon_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(789,'Temporal Distortion','Chrono Trigger','2026-08-07T13:48:43.834042+00:00','https://www.youtube.com/watch?v=SvuB0eZbvFI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Temporal_Distortion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(790,'Leap into the Darkness','Final Fantasy IV','2026-08-07T12:08:30.329435+00:00','https://www.youtube.com/watch?v=yJPgYA0drhw',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Leap_into_the_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(791,'Fragments of Gold','The Legend of Zelda: A Link to the Past','2026-08-07T10:25:23.061628+00:00','https://www.youtube.com/watch?v=Xp7MJAXzIyA',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Fragments_of_Gold_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(792,'Stray Donkey Strut','Donkey Kong Country','2026-08-07T16:23:31.684534+00:00','https://www.youtube.com/watch?v=ot5s6WEgT-s',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Stray_Donkey_Strut_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(793,'Kono Sekai De','Wizards & Warriors','2026-08-07T13:48:44.107477+00:00','https://www.youtube.com/watch?v=hjsumZPZ26U',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_Kono_Sekai_De_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(794,'Daughter of Evil','Chrono Trigger','2026-08-05T23:29:05.772280+00:00','https://www.youtube.com/watch?v=uv_gGKSy8p8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Daughter_of_Evil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(795,'Rose of April','Final Fantasy IX','2026-08-07T03:28:03.482598+00:00','https://www.youtube.com/watch?v=Oz5DTbIUxUQ',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Rose_of_April_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(796,'Orange October','Lunar: Eternal Blue','2026-08-07T03:28:02.776817+00:00','https://www.youtube.com/watch?v=_qVzOfdsaXo',301,'https://ocrmirror.org/files/music/remixes/Lunar_Eternal_Blue_Orange_October_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(797,'Robotnik''s Trippin'' on Ecstasy','Sonic the Hedgehog 2','2026-08-07T11:21:33.918457+00:00','https://www.youtube.com/watch?v=P5b5LMrg5Dk',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Robotnik''s_Trippin''_on_Ecstasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(798,'Man with Another Trance Machine','Final Fantasy VIII','2026-08-07T13:48:43.289140+00:00','https://www.youtube.com/watch?v=gdlVf_yeArU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Man_with_Another_Trance_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(799,'Monkey Brain Soup for the Soul','Monkey Island 2: LeChuck''s Revenge','2026-08-07T15:25:12.243497+00:00','https://www.youtube.com/watch?v=XdgUFVOvHts',302,'https://ocrmirror.org/files/music/remixes/Monkey_Island_2_Monkey_Brain_Soup_for_the_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(800,'The Trial in Concert','Chrono Trigger','2026-08-07T17:23:03.181810+00:00','https://www.youtube.com/watch?v=FLYOZUPE6o0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Trial_in_Concert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(801,'With the Quickness','Mega Man 2','2026-08-07T17:23:02.837266+00:00','https://www.youtube.com/watch?v=cEMCNKVQTI0',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_With_the_Quickness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(802,'Meribia Nights','Lunar: The Silver Star','2026-08-06T15:42:01.516081+00:00','https://www.youtube.com/watch?v=4lANLX3yIRw',77,'https://ocrmirror.org/files/music/remixes/Lunar_The_Silver_Star_Meribia_Nights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(803,'Mystery of a Planet','Tom Clancy''s Rainbow Six: Rogue Spear','2026-08-07T05:16:19.992338+00:00','https://www.youtube.com/watch?v=3Xtu_O6xiwg',303,'https://ocrmirror.org/files/music/remixes/Rainbow_Six_Rogue_Spear_Mystery_of_a_Planet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(804,'The Mellow Corridor','Chrono Trigger','2026-08-07T08:33:47.768808+00:00','https://www.youtube.com/watch?v=SQgZ8jwEm_4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Mellow_Corridor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(805,'Downwind','Chrono Trigger','2026-08-07T08:33:47.234730+00:00','https://www.youtube.com/watch?v=ZHIyY-jybJc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Downwind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(806,'Meteorave','Star Fox','2026-08-07T08:33:47.413123+00:00','https://www.youtube.com/watch?v=uh111vpEDgU',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Meteorave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(807,'Naju Overture','The Guardian Legend','2026-08-07T10:25:24.117209+00:00','https://www.youtube.com/watch?v=nMGax7FkevM',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Naju_Overture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(808,'Trippin'' on Alligators','The Adventures of Bayou Billy','2026-08-07T10:25:24.642267+00:00','https://www.youtube.com/watch?v=2cr81sURbO0',304,'https://ocrmirror.org/files/music/remixes/Adventures_of_Bayou_Billy_Trippin''_on_Alligators_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(809,'That Balcony Thing','Luigi''s Mansion','2026-08-07T15:25:11.723365+00:00','https://www.youtube.com/watch?v=KsgV4AwQI68',305,'https://ocrmirror.org/files/music/remixes/Luigi''s_Mansion_That_Balcony_Thing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(810,'Gates of Creation','Ultima VI: The False Prophet','2026-08-07T06:46:02.406788+00:00','https://www.youtube.com/watch?v=f02DMhgtfaI',306,'https://ocrmirror.org/files/music/remixes/Ultima_6_Gates_of_Creation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(811,'A World of Piano','Final Fantasy VII','2026-08-07T15:25:12.416986+00:00','https://www.youtube.com/watch?v=j-1FJwr3qlk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_A_World_of_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(812,'Snowy Caps','Sonic the Hedgehog 3','2026-08-06T04:42:52.812796+00:00','https://www.youtube.com/watch?v=9l3ehpddBDk',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Snowy_Caps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(813,'Echoes at a Distance','Final Fantasy IV','2026-08-07T05:16:19.113915+00:00','https://www.youtube.com/watch?v=KxmcB1dTqnU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Echoes_at_a_Distance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(814,'dubnofantasyaloneman','Final Fantasy IX','2026-08-07T18:11:13.788027+00:00','https://www.youtube.com/watch?v=9RhG7av_ijA',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_dubnofantasyaloneman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(815,'Hyperrock Fortissimo','Rockman & Forte','2026-08-07T12:08:30.149754+00:00','https://www.youtube.com/watch?v=_y8BXwmuz9E',308,'https://ocrmirror.org/files/music/remixes/Rockman_&_Forte_Hyperrock_Fortissimo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(816,'My Dying Ocllo','Ultima Online','2026-08-07T06:46:02.055460+00:00','https://www.youtube.com/watch?v=Bz48mpYSahU',309,'https://ocrmirror.org/files/music/remixes/Ultima_Online_My_Dying_Ocllo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(817,'Simon''s Town','Castlevania II: Simon''s Quest','2026-08-07T10:25:24.292441+00:00','https://www.youtube.com/watch?v=RF24COR25qs',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Simon''s_Town_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(818,'Blue Reflection','Mega Man 3','2026-08-07T23:05:29.099095+00:00','https://www.youtube.com/watch?v=wB-0m2R4scw',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Blue_Reflection_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(819,'Dancing in the Sky','Super Street Fighter II: The New Challengers','2026-08-07T11:21:33.743172+00:00','https://www.youtube.com/watch?v=ix-8Pe68jQ0',143,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Dancing_in_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(821,'Air Force One Is Down!','Perfect Dark','2026-08-07T11:21:34.297326+00:00','https://www.youtube.com/watch?v=GonCu2QhD5g',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Air_Force_One_Is_Down_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(822,'Met Mix Pro','Metroid','2026-08-07T10:25:23.591508+00:00','https://www.youtube.com/watch?v=UMr5CaL4SI8',73,'https://ocrmirror.org/files/music/remixes/Metroid_Met_Mix_Pro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(823,'My Red Hot Pursuit','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-07T15:25:11.895729+00:00','https://www.youtube.com/watch?v=6pcCIiYL_5o',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_My_Red_Hot_Pursuit_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(824,'Panic at Camp Crystal','Friday the 13th','2026-08-07T13:48:44.380292+00:00','https://www.youtube.com/watch?v=Ek1RpFtaf0c',311,'https://ocrmirror.org/files/music/remixes/Friday_the_13th_Panic_at_Camp_Crystal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(825,'Blood Bath','Doom II: Hell on Earth','2026-08-07T19:29:02.211337+00:00','https://www.youtube.com/watch?v=eiu5MvnFbHs',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Blood_Bath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(826,'Gift from Moscow','Tetris','2026-08-07T16:23:32.215235+00:00','https://www.youtube.com/watch?v=AwzGeBIDkF8',510,'https://ocrmirror.org/files/music/remixes/Tetris_Gift_from_Moscow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(827,'Dark Tranzition','The Legend of Zelda: A Link to the Past','2026-08-07T06:46:01.873639+00:00','https://www.youtube.com/watch?v=UaBoe61jjlM',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_Tranzition_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(828,'Heart''s Anxiety','Final Fantasy VII','2026-08-07T18:11:13.614389+00:00','https://www.youtube.com/watch?v=c5d6fFVZZRQ',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Heart''s_Anxiety_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(829,'Legendary Strings','Legendary Wings','2026-08-07T15:25:11.199879+00:00','https://www.youtube.com/watch?v=tpX-0o7G0_A',312,'https://ocrmirror.org/files/music/remixes/Legendary_Wings_Legendary_Strings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(830,'Lufia''s Dream','Lufia & The Fortress of Doom','2026-08-07T10:25:23.766029+00:00','https://www.youtube.com/watch?v=vu3j0cz3_Tg',156,'https://ocrmirror.org/files/music/remixes/Lufia_&_The_Fortress_of_Doom_Lufia''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(831,'Lost Fragments of the Past','Chrono Trigger','2026-08-07T17:23:03.009787+00:00','https://www.youtube.com/watch?v=nBtvoYgaEu4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Lost_Fragments_of_the_Past_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(832,'Flight of Destiny','Dragon Warrior III','2026-08-07T17:23:02.493405+00:00','https://www.youtube.com/watch?v=yabciLgeM6A',313,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_3_Flight_of_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(833,'Otanjoubi Cid','Final Fantasy VII','2026-08-07T19:29:02.388137+00:00','https://www.youtube.com/watch?v=BXyXjgc9uPs',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Otanjoubi_Cid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(834,'Lavos Battle (dnBoss Mix)','Chrono Trigger','2026-08-07T11:21:35.006994+00:00','https://www.youtube.com/watch?v=CGP4iwY-jrc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Lavos_Battle_(dnBoss_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(835,'Bobble Head Inspiration','Super Mario RPG: Legend of the Seven Stars','2026-08-07T12:08:29.787252+00:00','https://www.youtube.com/watch?v=HPomzlzBhQM',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Bobble_Head_Inspiration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(836,'Sword Foundry','IronSword: Wizards & Warriors II','2026-08-07T11:21:34.830567+00:00','https://www.youtube.com/watch?v=1fjfPaXGoL8',314,'https://ocrmirror.org/files/music/remixes/IronSword_Wizards_&_Warriors_2_Sword_Foundry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(837,'The Smoking Guns of Liberation','Gun.Smoke','2026-08-07T10:25:23.240949+00:00','https://www.youtube.com/watch?v=EshPvFkAWpc',153,'https://ocrmirror.org/files/music/remixes/GunSmoke_The_Smoking_Guns_of_Liberation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(838,'Bio Tech','Lightening Force: Quest for the Darkstar','2026-08-07T08:33:48.122203+00:00','https://www.youtube.com/watch?v=DLyYc5bXBDg',315,'https://ocrmirror.org/files/music/remixes/Lightening_Force_Bio_Tech_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(839,'Grand Dreams (A Hero''s Legacy)','The Legend of Zelda: A Link to the Past','2026-08-07T16:23:32.569582+00:00','https://www.youtube.com/watch?v=4kqDe0Xgtj8',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Grand_Dreams_(A_Hero''s_Legacy)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(840,'Dov''è L''amore','Wild Arms','2026-08-07T18:11:13.258659+00:00','https://www.youtube.com/watch?v=FYdig1BTv1c',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Dov''e_L''amore_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(841,'Bases Loaded','Contra','2026-08-07T15:25:11.376386+00:00','https://www.youtube.com/watch?v=QZc55oYDIDw',21,'https://ocrmirror.org/files/music/remixes/Contra_Bases_Loaded_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(842,'Save Your Game (Club Mix 2002)','Breath of Fire','2026-08-07T06:46:02.759365+00:00','https://www.youtube.com/watch?v=USfjPaE6zGk',259,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_Save_Your_Game_(Club_Mix_2002)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(843,'Forgotten Daze','Suikoden','2026-08-07T15:25:12.590569+00:00','https://www.youtube.com/watch?v=0TThDihBY4Q',316,'https://ocrmirror.org/files/music/remixes/Suikoden_Forgotten_Daze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(844,'Swimming Furries','Fury of the Furries','2026-08-07T11:21:34.096457+00:00','https://www.youtube.com/watch?v=ecpcIv304Oo',191,'https://ocrmirror.org/files/music/remixes/Fury_of_the_Furries_Swimming_Furries_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(845,'Main Theme (Blue Square Mix)','Columns','2026-08-07T13:48:43.971563+00:00','https://www.youtube.com/watch?v=i3Vc24VlODU',317,'https://ocrmirror.org/files/music/remixes/Columns_Main_Theme_(Blue_Square_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(846,'Come to Bob''s Pizza','Shenmue','2026-08-07T22:05:44.785836+00:00','https://www.youtube.com/watch?v=lpu7ykJ1TIU',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Come_to_Bob''s_Pizza_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(847,'Hammer''s Garage','Double Dragon','2026-08-07T12:08:30.866255+00:00','https://www.youtube.com/watch?v=SO8puLjgOmA',959,'https://ocrmirror.org/files/music/remixes/Double_Dragon_Hammer''s_Garage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(848,'Metal Man Goes Clubbing','Mega Man 2','2026-08-07T19:29:03.434900+00:00','https://www.youtube.com/watch?v=gwPDggICmgg',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Metal_Man_Goes_Clubbing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(849,'No Flesh Allowed','Castlevania II: Simon''s Quest','2026-08-07T16:23:31.506073+00:00','https://www.youtube.com/watch?v=hemRGWJofO4',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_No_Flesh_Allowed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(850,'Maridia (Drowned in Exile)','Super Metroid','2026-08-07T16:23:31.859913+00:00','https://www.youtube.com/watch?v=MLlfA-LD49o',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Maridia_(Drowned_in_Exile)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(851,'Stardust Beat','Sonic CD','2026-08-07T15:25:12.069061+00:00','https://www.youtube.com/watch?v=gH0RXEhIxPk',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Stardust_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(852,'Deserted Industry','Final Fantasy VI','2026-08-07T21:10:14.665387+00:00','https://www.youtube.com/watch?v=gFhNtrjQuAw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Deserted_Industry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(853,'Lost Woods Inglewood','The Legend of Zelda: Link''s Awakening','2026-08-07T10:25:24.467479+00:00','https://www.youtube.com/watch?v=nUVZarPssTE',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Lost_Woods_Inglewood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(854,'Rude Awakening','Castlevania: Circle of the Moon','2026-08-07T16:23:31.324641+00:00','https://www.youtube.com/watch?v=AAA1nhLGwOQ',291,'https://ocrmirror.org/files/music/remixes/Castlevania_Circle_of_the_Moon_Rude_Awakening_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(855,'Medieval Magic','Wizardry','2026-08-07T12:08:31.225559+00:00','https://www.youtube.com/watch?v=hbrtjxtgps8',319,'https://ocrmirror.org/files/music/remixes/Wizardry_Medieval_Magic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(856,'Gold Cartridge','The Legend of Zelda','2026-08-07T16:23:32.747021+00:00','https://www.youtube.com/watch?v=TT-YLvxZOzk',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Gold_Cartridge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(857,'La Saia''s Resting Place','Dark Cloud','2026-08-07T17:23:01.979380+00:00','https://www.youtube.com/watch?v=S0mV0Vp3rgw',320,'https://ocrmirror.org/files/music/remixes/Dark_Cloud_La_Saia''s_Resting_Place_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(858,'Spaced','Space Harrier','2026-08-07T11:21:33.565800+00:00','https://www.youtube.com/watch?v=MPZWaipHulA',97,'https://ocrmirror.org/files/music/remixes/Space_Harrier_Spaced_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(859,'Stomp the Summer Sky','Secret of Mana','2026-08-07T20:08:33.963841+00:00','https://www.youtube.com/watch?v=tO7mF1tAaYE',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Stomp_the_Summer_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(860,'Crystalline Caverns','Super Mario World 2: Yoshi''s Island','2026-08-07T20:08:34.137062+00:00','https://www.youtube.com/watch?v=ivkLHnPOyH8',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Crystalline_Caverns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(861,'Party in the Shop','The Legend of Zelda: Ocarina of Time','2026-08-07T15:25:11.550139+00:00','https://www.youtube.com/watch?v=A0oCCeUK-Is',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Party_in_the_Shop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(862,'Create Deconstruct','Ultima Online','2026-08-07T11:21:34.476192+00:00','https://www.youtube.com/watch?v=8xATfQ4DoZA',309,'https://ocrmirror.org/files/music/remixes/Ultima_Online_Create_Deconstruct_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(863,'Memories Lost in Time','Chrono Trigger','2026-08-07T16:23:32.921941+00:00','https://www.youtube.com/watch?v=raac_KJLmq0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Memories_Lost_in_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(864,'Time''s New Scar','Chrono Cross','2026-08-08T05:19:56.232274+00:00','https://www.youtube.com/watch?v=CvULqQM-pUI',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Time''s_New_Scar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(865,'aquacadence','Super Mario Bros. 3','2026-08-07T21:10:14.493484+00:00','https://www.youtube.com/watch?v=1RDi8AlUizI',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_aquacadence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(866,'Master of Flame','Mega Man 6','2026-08-07T19:29:02.912164+00:00','https://www.youtube.com/watch?v=W590ku9x1Yc',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Master_of_Flame_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(867,'Death of a Legend','Ninja Gaiden','2026-08-07T23:05:28.920882+00:00','https://www.youtube.com/watch?v=9ivYOlYHi1E',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Death_of_a_Legend_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(868,'Floating Islands of Grand Beach, Manitoba','Kirby Super Star','2026-08-07T18:11:13.086250+00:00','https://www.youtube.com/watch?v=eEJ-sAakKis',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Floating_Islands_of_Grand_Beach_Manitoba_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(869,'Adventure Is in the Air','Tomb Raider','2026-08-07T12:08:29.970149+00:00','https://www.youtube.com/watch?v=Jf2XPt3ebd0',322,'https://ocrmirror.org/files/music/remixes/Tomb_Raider_Adventure_Is_in_the_Air_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(871,'Lesser Kerubic Patchwork','Chrono Trigger','2026-08-07T20:08:33.443785+00:00','https://www.youtube.com/watch?v=vKBewB4cGrw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Lesser_Kerubic_Patchwork_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(872,'the battle of strings and a cellphone','Final Fantasy IX','2026-08-07T22:05:46.156614+00:00','https://www.youtube.com/watch?v=EESnr1kck2M',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_the_battle_of_strings_and_a_cellphone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(873,'Town Life in Piano','Chrono Trigger','2026-08-07T21:10:15.355260+00:00','https://www.youtube.com/watch?v=yo2PhnhD_UI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Town_Life_in_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(874,'Gallantry (Nobility of Spirit Mix)','Raiden Trad','2026-08-07T12:08:30.687172+00:00','https://www.youtube.com/watch?v=mQTL_2c2jvA',323,'https://ocrmirror.org/files/music/remixes/Raiden_Trad_Gallantry_(Nobility_of_Spirit_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(875,'Passing Breeze (Lounge Suite)','OutRun','2026-08-07T17:23:01.805469+00:00','https://www.youtube.com/watch?v=XMLzxwGOIGY',139,'https://ocrmirror.org/files/music/remixes/OutRun_Passing_Breeze_(Lounge_Suite)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(876,'Island of Edges','The Elder Scrolls III: Morrowind','2026-08-07T17:23:02.322394+00:00','https://www.youtube.com/watch?v=X7H5kwrz4Gk',324,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_3_Morrowind_Island_of_Edges_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(877,'Crying Mountain','Chrono Trigger','2026-08-07T22:05:44.961640+00:00','https://www.youtube.com/watch?v=yVpDFQz2ewo',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Crying_Mountain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(878,'Mega Man 2003','Mega Man 3','2026-08-07T21:10:15.527697+00:00','https://www.youtube.com/watch?v=nnvZ9QS5YFM',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Mega_Man_2003_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(879,'Influence of Koholint','The Legend of Zelda: Link''s Awakening','2026-08-07T17:23:02.151231+00:00','https://www.youtube.com/watch?v=1VBQey32qw8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Influence_of_Koholint_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(880,'To Brinstar','Metroid','2026-08-07T19:29:03.087217+00:00','https://www.youtube.com/watch?v=38XKwG9SEUI',73,'https://ocrmirror.org/files/music/remixes/Metroid_To_Brinstar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(881,'Cyborg Blobby','David Crane''s A Boy and His Blob: Trouble on Blobolonia','2026-08-07T23:58:28.695563+00:00','https://www.youtube.com/watch?v=dbg8qwuUWuM',325,'https://ocrmirror.org/files/music/remixes/A_Boy_and_His_Blob_Cyborg_Blobby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(882,'Sonik Azure','Sonic the Hedgehog 3','2026-08-07T20:08:32.920430+00:00','https://www.youtube.com/watch?v=ixhue3Tf01g',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Sonik_Azure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(883,'Green Amnesia','Chrono Trigger','2026-08-08T03:51:16.685416+00:00','https://www.youtube.com/watch?v=Ufq_iDFzbm0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Green_Amnesia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(884,'Incantation','Tekken 2','2026-08-07T18:11:12.737626+00:00','https://www.youtube.com/watch?v=CxUeZ6_Q0R8',326,'https://ocrmirror.org/files/music/remixes/Tekken_2_Incantation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(885,'Enter the Toad','Battletoads & Double Dragon: The Ultimate Team','2026-08-07T13:48:44.244916+00:00','https://www.youtube.com/watch?v=1wehhk6azUI',327,'https://ocrmirror.org/files/music/remixes/Battletoads_&_Double_Dragon_Enter_the_Toad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(886,'Ending Theme (Reflecting Mix)','Streets of Rage 2','2026-08-07T12:08:31.046028+00:00','https://www.youtube.com/watch?v=bcLgIjXKykk',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Ending_Theme_(Reflecting_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(887,'Christmas in the Village (Silver Bells)','Lufia II: Rise of the Sinistrals','2026-08-07T17:23:02.665116+00:00','https://www.youtube.com/watch?v=kawOX90pKY8',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Christmas_in_the_Village_(Silver_Bells)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(888,'Super Mario''s Sleigh Ride','Super Mario World','2026-08-08T03:51:16.513422+00:00','https://www.youtube.com/watch?v=RKMgleUxD9w',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Super_Mario''s_Sleigh_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(889,'Spekkio the Brave','Chrono Trigger','2026-08-08T02:27:32.830163+00:00','https://www.youtube.com/watch?v=aqgDuGE1ljg',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Spekkio_the_Brave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(890,'Scriabin''s Long Library','Castlevania: Symphony of the Night','2026-08-07T21:10:15.009530+00:00','https://www.youtube.com/watch?v=riXteMHBHWs',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Scriabin''s_Long_Library_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(891,'Brinstar (Dreams in Red)','Super Metroid','2026-08-08T02:27:33.703592+00:00','https://www.youtube.com/watch?v=u7bv4Jsmcxo',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Brinstar_(Dreams_in_Red)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(892,'Dreaming','Radical Dreamers: Nusumenai Houseki','2026-08-07T13:48:43.696937+00:00','https://www.youtube.com/watch?v=YPBg1FRljY4',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Dreaming_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(893,'Smooth Alexander','Final Fantasy VI','2026-08-07T16:23:32.393323+00:00','https://www.youtube.com/watch?v=I00Tw6Cw88k',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Smooth_Alexander_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(894,'Will''s Journey','Illusion of Gaia','2026-08-07T18:11:13.962328+00:00','https://www.youtube.com/watch?v=gj2NUlb5p2k',329,'https://ocrmirror.org/files/music/remixes/Illusion_of_Gaia_Will''s_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(895,'Liquid Metal','Metal Gear Solid','2026-08-07T21:10:14.150252+00:00','https://www.youtube.com/watch?v=qKMHsPyQPuI',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_Liquid_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(896,'Ghosts of the Marble Hall','Super Mario World','2026-08-07T22:05:45.985231+00:00','https://www.youtube.com/watch?v=iZn5FALIVAA',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Ghosts_of_the_Marble_Hall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(897,'Zenobia''s Grave: A Champion Has Risen','Ogre Battle: The March of the Black Queen','2026-08-08T03:51:17.369420+00:00','https://www.youtube.com/watch?v=4iH2qSKWIKw',330,'https://ocrmirror.org/files/music/remixes/Ogre_Battle_Zenobia''s_Grave_A_Champion_Has_Risen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(898,'Phantasy Is a Four Letter Word','Phantasy Star IV: The End of the Millennium','2026-08-07T20:08:33.617350+00:00','https://www.youtube.com/watch?v=LtEzDvIddm4',96,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_4_Phantasy_Is_a_Four_Letter_Word_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(899,'Dancing Madly (First Form)','Final Fantasy VI','2026-08-07T23:05:29.276152+00:00','https://www.youtube.com/watch?v=gH0iHvkdIjA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dancing_Madly_(First_Form)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(900,'Drum ''n J-pop','Magical Drop III','2026-08-07T13:48:43.425139+00:00','https://www.youtube.com/watch?v=dSu84x7d5-0',288,'https://ocrmirror.org/files/music/remixes/Magical_Drop_3_Drum_''n_J-pop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(901,'The Castle of Everlasting Night','SaGa Frontier','2026-08-07T20:08:34.311113+00:00','https://www.youtube.com/watch?v=KUvL1hMSsjI',331,'https://ocrmirror.org/files/music/remixes/SaGa_Frontier_The_Castle_of_Everlasting_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(902,'Mystic Mountain (2LATE Mix)','Final Fantasy Mystic Quest','2026-08-07T22:05:46.329565+00:00','https://www.youtube.com/watch?v=NsTV41AR4Bs',332,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Mystic_Quest_Mystic_Mountain_(2LATE_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(903,'Kizukaseru','The Last Blade 2','2026-08-08T02:27:34.228642+00:00','https://www.youtube.com/watch?v=LoWlUsuvi3c',333,'https://ocrmirror.org/files/music/remixes/Last_Blade_2_Kizukaseru_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(904,'2K3 (Nectarine Mix)','Lotus Turbo Challenge 2','2026-08-07T18:11:12.912225+00:00','https://www.youtube.com/watch?v=tb8MYogyXOI',334,'https://ocrmirror.org/files/music/remixes/Lotus_Turbo_Challenge_2_2K3_(Nectarine_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(905,'Realms of Africa','Age of Empires: The Rise of Rome','2026-08-08T05:19:56.408712+00:00','https://www.youtube.com/watch?v=bf63H1gXErs',808,'https://ocrmirror.org/files/music/remixes/Age_of_Empires_The_Rise_of_Rome_Realms_of_Africa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(906,'Overclocked','Sanxion','2026-08-07T19:29:03.260906+00:00','https://www.youtube.com/watch?v=tPYCngFPb7U',336,'https://ocrmirror.org/files/music/remixes/Sanxion_Overclocked_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(907,'Acoustic Fireworks','Final Fantasy VII','2026-08-07T23:05:29.454409+00:00','https://www.youtube.com/watch?v=uABroWQKOMk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Acoustic_Fireworks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(908,'Da Phunky Forest','Super Mario World','2026-08-07T21:10:14.321579+00:00','https://www.youtube.com/watch?v=Y-GvkT_moDQ',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Da_Phunky_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(909,'Thin Glow','Stunt Race FX','2026-08-07T18:11:13.440158+00:00','https://www.youtube.com/watch?v=zK5TwkK8lTg',337,'https://ocrmirror.org/files/music/remixes/Stunt_Race_FX_Thin_Glow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(910,'On That Day...','Final Fantasy VII','2026-08-08T06:05:32.700158+00:00','https://www.youtube.com/watch?v=R1bHUMFiU80',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_On_That_Day_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(911,'Go Back','Streets of Rage 2','2026-08-08T02:27:33.005536+00:00','https://www.youtube.com/watch?v=UKRYyuh8Aec',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Go_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(912,'Desert Snowstorm','Secret of Mana','2026-08-07T23:05:28.206556+00:00','https://www.youtube.com/watch?v=3oRZijkN1O8',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Desert_Snowstorm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(913,'Dark Madness Resurrection','Castlevania II: Simon''s Quest','2026-08-07T22:05:45.643781+00:00','https://www.youtube.com/watch?v=cQBUDjiX-Qo',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Dark_Madness_Resurrection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(914,'Red Dimension','Red Alarm','2026-08-07T21:10:15.182275+00:00','https://www.youtube.com/watch?v=6YyKlxdZgeo',338,'https://ocrmirror.org/files/music/remixes/Red_Alarm_Red_Dimension_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(916,'Ruined Landscape','Chrono Trigger','2026-08-07T20:08:33.269488+00:00','https://www.youtube.com/watch?v=5OqIKb7kJiY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Ruined_Landscape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(917,'Cross Fire','Chrono Cross','2026-08-07T23:05:28.743241+00:00','https://www.youtube.com/watch?v=MQKuxupsWSM',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Cross_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(918,'Interdit','Radical Dreamers: Nusumenai Houseki','2026-08-08T02:27:34.053461+00:00','https://www.youtube.com/watch?v=9Si-xr2iYOs',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Interdit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(919,'Dragons of Paradise','Bahamut Lagoon','2026-08-07T23:58:28.170054+00:00','https://www.youtube.com/watch?v=4DSoWPjI3Ck',340,'https://ocrmirror.org/files/music/remixes/Bahamut_Lagoon_Dragons_of_Paradise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(920,'Kyrandia Medley','The Legend of Kyrandia','2026-08-08T02:27:33.878756+00:00','https://www.youtube.com/watch?v=W114USf_cS8',342,'https://ocrmirror.org/files/music/remixes/Legend_of_Kyrandia_Kyrandia_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(921,'Quest for Conan','Deadly Towers','2026-08-07T22:05:45.814508+00:00','https://www.youtube.com/watch?v=tlPT76-QeWc',185,'https://ocrmirror.org/files/music/remixes/Deadly_Towers_Quest_for_Conan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(922,'A World Awaits Chrono','Chrono Trigger','2026-08-08T06:05:31.625570+00:00','https://www.youtube.com/watch?v=E8GCpSwIDog',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_A_World_Awaits_Chrono_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(923,'Good Ending (Blaze the Siren Mix)','Streets of Rage 3','2026-08-07T20:08:33.791014+00:00','https://www.youtube.com/watch?v=0O2j5Y2y1-g',343,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_3_Good_Ending_(Blaze_the_Siren_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(924,'Panic of the Undead','Zombies Ate My Neighbors','2026-08-08T03:51:17.027821+00:00','https://www.youtube.com/watch?v=vfMccxjcsJ4',344,'https://ocrmirror.org/files/music/remixes/Zombies_Ate_My_Neighbors_Panic_of_the_Undead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(925,'A Chocobo''s Mystic Life','Final Fantasy IV','2026-08-08T03:51:17.199086+00:00','https://www.youtube.com/watch?v=_oMxgd792Fw',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_A_Chocobo''s_Mystic_Life_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(926,'Waztelands','Einhänder','2026-08-07T20:08:33.094574+00:00','https://www.youtube.com/watch?v=IcjyQqjKAWw',345,'https://ocrmirror.org/files/music/remixes/Einhander_Waztelands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(927,'Not Alone in the World','Wild Arms','2026-08-08T07:28:46.845136+00:00','https://www.youtube.com/watch?v=VZcat8vcf9k',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Not_Alone_in_the_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(928,'Halls of Abandonment','Alisia Dragoon','2026-08-07T22:05:45.132330+00:00','https://www.youtube.com/watch?v=sfsB4-ZDTeU',346,'https://ocrmirror.org/files/music/remixes/Alisia_Dragoon_Halls_of_Abandonment_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(929,'Smooth Ride','Super Hang-On','2026-08-07T23:05:28.566045+00:00','https://www.youtube.com/watch?v=aAt5KomnvI8',347,'https://ocrmirror.org/files/music/remixes/Super_Hang-On_Smooth_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(930,'Adrenaline Rush','Final Fight CD','2026-08-07T22:05:45.302773+00:00','https://www.youtube.com/watch?v=3wwoe9ZvVEE',348,'https://ocrmirror.org/files/music/remixes/Final_Fight_CD_Adrenaline_Rush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(931,'The Zero Sacrifice','Mega Man X','2026-08-08T09:10:01.572705+00:00','https://www.youtube.com/watch?v=QOS28TJl0PQ',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_The_Zero_Sacrifice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(932,'You Must Dance','Breath of Fire II','2026-08-07T23:58:27.994719+00:00','https://www.youtube.com/watch?v=C9lfAT5ygYk',349,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_2_You_Must_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(933,'Ocean of Tears','Star Ocean: The Second Story','2026-08-07T19:29:02.562249+00:00','https://www.youtube.com/watch?v=PLD4gldadQQ',283,'https://ocrmirror.org/files/music/remixes/Star_Ocean_The_Second_Story_Ocean_of_Tears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(934,'Sudden Loss','Ninja Gaiden','2026-08-07T23:58:29.053330+00:00','https://www.youtube.com/watch?v=WdSBXU2WW2c',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Sudden_Loss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(935,'Zero the Ultimate Warrior','Mega Man X4','2026-08-07T23:58:27.819540+00:00','https://www.youtube.com/watch?v=d5dFU5Q_XgA',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Zero_the_Ultimate_Warrior_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(936,'Komet Non-Stop','Crazy Comets','2026-08-08T02:27:33.352999+00:00','https://www.youtube.com/watch?v=NNskqZ6pCtU',350,'https://ocrmirror.org/files/music/remixes/Crazy_Comets_Komet_Non-Stop_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(937,'Create Your Fantasy','Ultima Online','2026-08-08T03:51:15.823423+00:00','https://www.youtube.com/watch?v=4qZxlTfsDVA',309,'https://ocrmirror.org/files/music/remixes/Ultima_Online_Create_Your_Fantasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(938,'HyperSpace Electro Blast','Star Control II','2026-08-07T23:58:28.345001+00:00','https://www.youtube.com/watch?v=rsSc7x-p4zw',351,'https://ocrmirror.org/files/music/remixes/Star_Control_2_Hyperspace_Electro_Blast_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(939,'Trip the Light Fantastic','Socket','2026-08-08T08:07:37.266259+00:00','https://www.youtube.com/watch?v=tGddBs3qEy8',352,'https://ocrmirror.org/files/music/remixes/Socket_Trip_the_Light_Fantastic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(940,'Simon''s Symphony','Castlevania II: Simon''s Quest','2026-08-08T11:00:19.224371+00:00','https://www.youtube.com/watch?v=zyB8FWqiQ1I',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Simon''s_Symphony_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(941,'Trippin'' on Snails','Rygar','2026-08-07T23:05:27.826771+00:00','https://www.youtube.com/watch?v=7xp255xcNQc',150,'https://ocrmirror.org/files/music/remixes/Rygar_Trippin''_on_Snails_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(942,'Merriment in Morlia','Tales of Phantasia','2026-08-08T03:51:16.341169+00:00','https://www.youtube.com/watch?v=PVvERXJue-I',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Merriment_in_Morlia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(943,'Her Azure Eyes','Sonic the Hedgehog 3','2026-08-08T09:10:02.090867+00:00','https://www.youtube.com/watch?v=QwpSRwXWDFM',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Her_Azure_Eyes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(944,'Saturday Night Speedway','Sonic CD','2026-08-08T05:19:56.056760+00:00','https://www.youtube.com/watch?v=PVD1WoMYZek',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Saturday_Night_Speedway_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(945,'Big Shell West Bristol','Metal Gear Solid 2: Sons of Liberty','2026-08-08T09:10:01.918287+00:00','https://www.youtube.com/watch?v=nB9Kl-0dJrE',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Big_Shell_West_Bristol_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(946,'True (It''s Gone Now Mix)','Silent Hill 2','2026-08-08T05:19:55.882491+00:00','https://www.youtube.com/watch?v=e-1GvsG4wzg',63,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_True_(It''s_Gone_Now_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(947,'Transformation','Wizball','2026-08-07T23:05:28.027708+00:00','https://www.youtube.com/watch?v=ZgQLe6_joOY',232,'https://ocrmirror.org/files/music/remixes/Wizball_Transformation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(948,'Enter the Frog','Chrono Trigger','2026-08-08T10:02:36.656071+00:00','https://www.youtube.com/watch?v=5LW2tONWAYk',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Enter_the_Frog_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(949,'Whirlwind (Gale Force Mix)','Shinobi III: Return of the Ninja Master','2026-08-08T02:27:32.653341+00:00','https://www.youtube.com/watch?v=re8P0NZBOzA',353,'https://ocrmirror.org/files/music/remixes/Shinobi_3_Whirlwind_(Gale_Force_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(950,'Zero Sky','Mega Man X4','2026-08-08T08:07:37.777215+00:00','https://www.youtube.com/watch?v=YpzzRU_Jn9k',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Zero_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(951,'More Than a Weapon','Panzer Dragoon Orta','2026-08-08T08:07:38.118061+00:00','https://www.youtube.com/watch?v=HRHp1SzC82k',354,'https://ocrmirror.org/files/music/remixes/Panzer_Dragoon_Orta_More_Than_a_Weapon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(952,'Pearl Song','Super Mario 64','2026-08-08T09:10:01.400047+00:00','https://www.youtube.com/watch?v=mD9ENqcAmIo',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Pearl_Song_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(953,'Wanta Phanta','Phantasy Star','2026-08-08T06:05:33.049395+00:00','https://www.youtube.com/watch?v=u2YFEqkYb2w',93,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_Wanta_Phanta_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(954,'Mode Serpent','Final Fantasy VI','2026-08-07T23:58:27.645982+00:00','https://www.youtube.com/watch?v=_yfBaroqeF0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Mode_Serpent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(955,'Rosetta Refrain','Wild Arms','2026-08-08T06:05:32.379623+00:00','https://www.youtube.com/watch?v=Gn2aSTVIIzI',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Rosetta_Refrain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(956,'Cid Sends a Dream to the Undersea Palace','Final Fantasy VII','2026-08-08T08:07:37.947740+00:00','https://www.youtube.com/watch?v=RoR_LjqykP4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Cid_Sends_a_Dream_to_the_Undersea_Palace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(957,'Dancing Madly (Second Form)','Final Fantasy VI','2026-08-07T23:58:28.876392+00:00','https://www.youtube.com/watch?v=faeTeJ44C5A',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dancing_Madly_(Second_Form)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(958,'Black Block','Arkanoid','2026-08-07T20:08:32.742020+00:00','https://www.youtube.com/watch?v=V1PYFnLM8hE',31,'https://ocrmirror.org/files/music/remixes/Arkanoid_Black_Block_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(959,'Space Station of the Ancients','Final Fantasy VII','2026-08-08T05:19:57.116726+00:00','https://www.youtube.com/watch?v=VRIk1J0_3YA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Space_Station_of_the_Ancients_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(960,'Evolutionary Means','E.V.O.: Search for Eden','2026-08-08T07:28:47.725061+00:00','https://www.youtube.com/watch?v=mDZenKEYAMI',355,'https://ocrmirror.org/files/music/remixes/EVO_Evolutionary_Means_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(961,'Wounds of the Past','Phantasy Star IV: The End of the Millennium','2026-08-07T23:05:28.383104+00:00','https://www.youtube.com/watch?v=NgfRs15VPDo',96,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_4_Wounds_of_the_Past_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(962,'Water Main','Super Mario Bros.','2026-08-08T05:19:55.702143+00:00','https://www.youtube.com/watch?v=_nZy1jyINpI',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Water_Main_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(963,'Enter the Guru','Double Dragon','2026-08-07T23:58:28.520344+00:00','https://www.youtube.com/watch?v=ST1KyswfBFI',959,'https://ocrmirror.org/files/music/remixes/Double_Dragon_Enter_the_Guru_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(964,'Guile''s Theme (R.A.H. Mix)','Street Fighter II: The World Warrior','2026-08-08T05:19:55.524898+00:00','https://www.youtube.com/watch?v=PjujeJtfP3M',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Guile''s_Theme_(RAH_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(965,'Dreamer','Chrono Cross','2026-08-08T02:27:33.179155+00:00','https://www.youtube.com/watch?v=brQ4HtKt8vY',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Dreamer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(966,'Lullaby Proximitus','The Legend of Zelda: Ocarina of Time','2026-08-08T03:51:15.997954+00:00','https://www.youtube.com/watch?v=oAugcZRM0tU',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Lullaby_Proximitus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(967,'Zebesian Midnight','Super Metroid','2026-08-08T15:55:45.214320+00:00','https://www.youtube.com/watch?v=mPNAN12pWfo',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Zebesian_Midnight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(968,'Welcome to the Metropolis','Sonic the Hedgehog 2','2026-08-08T09:10:00.878424+00:00','https://www.youtube.com/watch?v=ukepFNWbqHU',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Welcome_to_the_Metropolis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(969,'Nazi Requiem','Wolfenstein 3D','2026-08-08T11:53:53.092446+00:00','https://www.youtube.com/watch?v=PbLY1m_9t0g',357,'https://ocrmirror.org/files/music/remixes/Wolfenstein_3D_Nazi_Requiem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(970,'Battle Rocks','Super Mario Bros. 3','2026-08-08T07:28:46.482218+00:00','https://www.youtube.com/watch?v=80rTcuRdRnc',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Battle_Rocks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(971,'It''s Difficult to Stand When You''re on Acid','Final Fantasy VII','2026-08-08T07:28:47.197110+00:00','https://www.youtube.com/watch?v=I_rhNrqZydA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_It''s_Difficult_to_Stand_When_You''re_on_Acid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(972,'A Rare Find','Tyrian','2026-08-08T13:26:18.869545+00:00','https://www.youtube.com/watch?v=GTalfJcVwnE',358,'https://ocrmirror.org/files/music/remixes/Tyrian_A_Rare_Find_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(973,'Forever','Chrono Trigger','2026-08-08T11:00:19.088231+00:00','https://www.youtube.com/watch?v=jbLrOwM679Q',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Forever_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(974,'Secret of Spram (8 Bells Mix)','Secret of Mana','2026-08-08T09:10:01.745465+00:00','https://www.youtube.com/watch?v=3uMnQsv0kLA',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Secret_of_Spram_(8_Bells_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(975,'Black Magic Synthesis','Final Fantasy IX','2026-08-08T07:28:47.372817+00:00','https://www.youtube.com/watch?v=dJGzTeiqpVo',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Black_Magic_Synthesis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(976,'To Madara and Back','Mouryou Senki Madara','2026-08-08T03:51:16.169130+00:00','https://www.youtube.com/watch?v=8rcGsax3uhw',359,'https://ocrmirror.org/files/music/remixes/Mouryou_Senki_Madara_To_Madara_and_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(977,'Kefka Goes Carnival','Final Fantasy VI','2026-08-08T11:53:53.265915+00:00','https://www.youtube.com/watch?v=zQ7UV0UWIfU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Kefka_Goes_Carnival_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(978,'Turbid Guidance','Lufia II: Rise of the Sinistrals','2026-08-08T05:19:56.584696+00:00','https://www.youtube.com/watch?v=rothxi2nbnM',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Turbid_Guidance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(980,'Assembly Line Apparitions','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-08T09:10:01.227247+00:00','https://www.youtube.com/watch?v=1mRzPBn0bc4',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Assembly_Line_Apparitions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(981,'Space Grind','Delta','2026-08-08T06:05:30.989858+00:00','https://www.youtube.com/watch?v=9iHxrwerBF4',360,'https://ocrmirror.org/files/music/remixes/Delta_Space_Grind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(982,'The Twinkle Park Classic','Sonic Adventure','2026-08-08T11:53:52.397672+00:00','https://www.youtube.com/watch?v=h6tDUiglNbI',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_The_Twinkle_Park_Classic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(983,'The Lost City of Shevat','Xenogears','2026-08-08T08:07:37.095750+00:00','https://www.youtube.com/watch?v=1mWP2OA3344',70,'https://ocrmirror.org/files/music/remixes/Xenogears_The_Lost_City_of_Shevat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(984,'Bus!','EarthBound','2026-08-08T07:28:46.301797+00:00','https://www.youtube.com/watch?v=KCJs8KqE5NA',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Bus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(985,'Cammy by Night','Super Street Fighter II: The New Challengers','2026-08-08T10:02:36.481312+00:00','https://www.youtube.com/watch?v=MzkJ9ET792E',143,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Cammy_by_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(986,'Green Hill Zone (Euroclub ''95 Mix)','Sonic the Hedgehog','2026-08-08T08:07:38.289645+00:00','https://www.youtube.com/watch?v=iTNI_4nL_hE',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Green_Hill_Zone_(Euroclub_''95_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(987,'Oldskool Demon','Doom II: Hell on Earth','2026-08-08T11:53:51.875027+00:00','https://www.youtube.com/watch?v=i4b5OtdcJAI',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Oldskool_Demon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(988,'The Incredible Singing Robot','Chrono Trigger','2026-08-08T14:06:22.933308+00:00','https://www.youtube.com/watch?v=UA0Ul-y-gD8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Incredible_Singing_Robot_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(989,'Link Goes to New Orleans','The Legend of Zelda','2026-08-08T09:10:02.436072+00:00','https://www.youtube.com/watch?v=AR98JolpUhg',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link_Goes_to_New_Orleans_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(990,'Rachel''s Gift','Final Fantasy VI','2026-08-08T15:55:45.923177+00:00','https://www.youtube.com/watch?v=RInpt9x8rLI',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Rachel''s_Gift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(991,'Over and Under','Final Fantasy IV','2026-08-08T14:58:10.321280+00:00','https://www.youtube.com/watch?v=QoG2ubmgHiQ',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Over_and_Under_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(992,'Time Voyager','Chrono Cross','2026-08-08T10:02:36.131325+00:00','https://www.youtube.com/watch?v=RgkQtTxQyL4',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Time_Voyager_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(993,'Trippin'' on the Bridge','Streets of Rage','2026-08-08T05:19:56.763416+00:00','https://www.youtube.com/watch?v=jHe2M-A-6HY',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Trippin''_on_the_Bridge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(994,'Where Destiny Meets','Final Fantasy VII','2026-08-08T07:28:46.120922+00:00','https://www.youtube.com/watch?v=EYdqU1iznWE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Where_Destiny_Meets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(995,'The Dark World (Crystal Abyss Mix)','Final Fantasy III','2026-08-08T08:07:37.436545+00:00','https://www.youtube.com/watch?v=FlgTigxJmRw',10,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_3_The_Dark_World_(Crystal_Abyss_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(996,'Godspeed','Star Fox','2026-08-08T14:06:23.283833+00:00','https://www.youtube.com/watch?v=Xnk-WPNlW3Y',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Godspeed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(998,'Time Management','Chrono Trigger','2026-08-08T13:26:19.213637+00:00','https://www.youtube.com/watch?v=3E4Z_Y-05xY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Time_Management_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(999,'Savage Seduction','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-08T08:07:36.750552+00:00','https://www.youtube.com/watch?v=ucp2KQPJOpk',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Savage_Seduction_OC_ReMix.mp3',0);
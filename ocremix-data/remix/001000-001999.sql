@@ -0,0 +1,992 @@
+INSERT INTO "remix" VALUES(1000,'Booster Tarantino','Super Mario RPG: Legend of the Seven Stars','2026-08-08T11:00:19.634462+00:00','https://www.youtube.com/watch?v=mtyNns77pwk',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Booster_Tarantino_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1001,'Sagat''s Moonbike','Street Fighter II: The World Warrior','2026-08-08T07:28:47.548746+00:00','https://www.youtube.com/watch?v=fAYuMWPeTnM',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Sagat''s_Moonbike_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1002,'Light and Flakey','Final Fantasy VII','2026-08-08T06:05:31.384232+00:00','https://www.youtube.com/watch?v=DhlRDT0Ux-s',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Light_and_Flakey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1003,'Linoleum Stalactites','Treasure Hunter G','2026-08-08T10:02:36.831027+00:00','https://www.youtube.com/watch?v=ZW5d_wcppZM',361,'https://ocrmirror.org/files/music/remixes/Treasure_Hunter_G_Linoleum_Stalactites_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1004,'The Fallen''s Grave','Altered Beast','2026-08-08T05:19:56.941830+00:00','https://www.youtube.com/watch?v=by-x1TFGzNM',28,'https://ocrmirror.org/files/music/remixes/Altered_Beast_The_Fallen''s_Grave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1005,'Flashbulb Junk','Maniac Mansion','2026-08-08T06:05:33.221126+00:00','https://www.youtube.com/watch?v=6IG69DIURqY',125,'https://ocrmirror.org/files/music/remixes/Maniac_Mansion_Flashbulb_Junk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1006,'sonik special','Sonic the Hedgehog','2026-08-08T14:58:11.032289+00:00','https://www.youtube.com/watch?v=nlncAUd2V48',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_sonik_special_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1007,'The Road to Tyco Station','Moon Patrol','2026-08-08T06:05:31.823565+00:00','https://www.youtube.com/watch?v=QhvvG56CS6E',137,'https://ocrmirror.org/files/music/remixes/Moon_Patrol_The_Road_to_Tyco_Station_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1008,'Of Transformants and Brevity','Final Fantasy VII','2026-08-08T13:26:19.040495+00:00','https://www.youtube.com/watch?v=D9NbNpL0JUo',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Of_Transformants_and_Brevity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1009,'Industrial Fear','Donkey Kong Country','2026-08-08T10:02:37.008219+00:00','https://www.youtube.com/watch?v=8tF55V9I13M',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Industrial_Fear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1010,'Hot Ice','Sonic the Hedgehog 3','2026-08-08T10:02:37.359972+00:00','https://www.youtube.com/watch?v=yTPypBYmkOQ',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Hot_Ice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1011,'Philharmonic Suite: Part I','Final Fantasy VII','2026-08-08T17:56:59.221677+00:00','https://www.youtube.com/watch?v=J0lUNXHafzg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Philharmonic_Suite_Part_I_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1012,'Willed Assault','Final Fantasy Adventure','2026-08-08T10:02:36.307150+00:00','https://www.youtube.com/watch?v=xZZiBQquTbc',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Willed_Assault_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1013,'Drift','Ecco: The Tides of Time','2026-08-08T10:02:35.955610+00:00','https://www.youtube.com/watch?v=UYDFFe8uuf8',362,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Drift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1014,'Prelude to Darkness','Castlevania III: Dracula''s Curse','2026-08-08T11:00:18.952244+00:00','https://www.youtube.com/watch?v=TN9jpkdjGAs',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Prelude_to_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1015,'Smileyspot','Cool Spot','2026-08-08T11:00:19.361533+00:00','https://www.youtube.com/watch?v=A24DArVwG1Q',363,'https://ocrmirror.org/files/music/remixes/Cool_Spot_Smileyspot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1016,'Deep Damp Sandcastle','Sonic & Knuckles','2026-08-08T13:26:18.697881+00:00','https://www.youtube.com/watch?v=dTIUDuCgLLw',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Deep_Damp_Sandcastle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1017,'The Final Summoning','Final Fantasy X','2026-08-08T17:56:58.255881+00:00','https://www.youtube.com/watch?v=eJWBWnsUbVY',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_The_Final_Summoning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1018,'Medusa Mix','Ecco: The Tides of Time','2026-08-08T11:00:19.770848+00:00','https://www.youtube.com/watch?v=EvnGS19oM-M',364,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Medusa_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1019,'Memories of the Sea','Seiken Densetsu 3','2026-08-08T08:07:36.923802+00:00','https://www.youtube.com/watch?v=JLcZgEBxsHY',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Memories_of_the_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1020,'Braving Tal Tal Heights','The Legend of Zelda: Link''s Awakening','2026-08-08T15:55:45.390966+00:00','https://www.youtube.com/watch?v=AmOCJyhPQCY',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Braving_Tal_Tal_Heights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1021,'Fluss der Liebe','Final Fantasy VII','2026-08-08T15:55:45.747272+00:00','https://www.youtube.com/watch?v=UixKvbaMN50',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Fluss_der_Liebe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1022,'Heartfelt Recollections','Xenogears','2026-08-08T11:00:18.816709+00:00','https://www.youtube.com/watch?v=KwxMkRLlCOU',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Heartfelt_Recollections_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1023,'Beyond Lightspeed','F-Zero X Expansion Kit','2026-08-08T08:07:37.607094+00:00','https://www.youtube.com/watch?v=PkLTg3duQM0',365,'https://ocrmirror.org/files/music/remixes/F-Zero_X_Expansion_Kit_Beyond_Lightspeed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1024,'Drifting Towards the Stars','Secret of Mana','2026-08-08T13:26:18.179799+00:00','https://www.youtube.com/watch?v=gJkwKtYUv90',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Drifting_Towards_the_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1025,'Dr. Wily''s Wedding','Mega Man 2','2026-08-08T14:58:09.796391+00:00','https://www.youtube.com/watch?v=Yr4xpIDJB-4',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Dr_Wily''s_Wedding_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1026,'CSM-101 Level One','Terminator 2: Judgment Day','2026-08-08T07:28:47.021530+00:00','https://www.youtube.com/watch?v=Tle0dsFzIhM',366,'https://ocrmirror.org/files/music/remixes/Terminator_2_CSM-101_Level_One_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1027,'Seeking Heat','Super Mario RPG: Legend of the Seven Stars','2026-08-08T10:02:37.183457+00:00','https://www.youtube.com/watch?v=jVzNS3TE66c',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Seeking_Heat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1028,'Norfair (Frailty Awaiting)','Super Metroid','2026-08-08T14:06:22.237652+00:00','https://www.youtube.com/watch?v=FHVMlSkdu80',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Norfair_(Frailty_Awaiting)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1029,'Jethro and Vash at the Fair','Chrono Trigger','2026-08-08T17:02:10.066242+00:00','https://www.youtube.com/watch?v=Y1uIb8rCrsI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Jethro_and_Vash_at_the_Fair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1030,'Ninjitsu Groove','Ninja Gaiden','2026-08-08T11:53:52.571636+00:00','https://www.youtube.com/watch?v=u07tWQL4y9I',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Ninjitsu_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1031,'May Fortune Smile Upon You','Metal Gear Solid 2: Sons of Liberty','2026-08-08T13:26:18.526447+00:00','https://www.youtube.com/watch?v=b5P2_XE-Aok',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_May_Fortune_Smile_Upon_You_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1032,'Bottled Metro','Sonic the Hedgehog 2','2026-08-08T17:02:10.240232+00:00','https://www.youtube.com/watch?v=J5TcHPHE7Q0',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Bottled_Metro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1033,'Fantasy Rush','Final Fantasy VIII','2026-08-08T09:10:02.263301+00:00','https://www.youtube.com/watch?v=M37MchthUH0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Fantasy_Rush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1034,'Wise Wizards, Old Warriors','Wizards & Warriors','2026-08-08T17:02:10.937958+00:00','https://www.youtube.com/watch?v=ne3lEthbSUw',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_Wise_Wizards_Old_Warriors_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1035,'In Mem''ry of Sir Anthony (A March Through the Plains)','Final Fantasy Tactics','2026-08-08T11:00:19.498304+00:00','https://www.youtube.com/watch?v=o48mS3TDJag',279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Tactics_In_Mem''ry_of_Sir_Anthony_(A_March_Through_the_Plains)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1036,'Sexy Trunks','Super Street Fighter II Turbo','2026-08-08T14:58:10.497828+00:00','https://www.youtube.com/watch?v=vfM7uog_AyQ',472,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Turbo_Sexy_Trunks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1037,'ReBirth','The King of Fighters 2000','2026-08-08T09:10:01.054911+00:00','https://www.youtube.com/watch?v=VRQAwXCyb-k',367,'https://ocrmirror.org/files/music/remixes/King_of_Fighters_2000_ReBirth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1038,'Skyline','Xenogears','2026-08-08T11:53:52.222905+00:00','https://www.youtube.com/watch?v=jeNH85t5R0U',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Skyline_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1039,'The Galaxy Is at Peace...','Super Metroid','2026-08-08T11:53:52.919249+00:00','https://www.youtube.com/watch?v=3IkfyKaPccI',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_The_Galaxy_Is_at_Peace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1040,'600 A.D. in Piano','Chrono Trigger','2026-08-08T19:07:50.759669+00:00','https://www.youtube.com/watch?v=BkE3ti_dPko',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_600_AD_in_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1041,'Credits Theme (ZZ Badnusty Mix)','Gaiares','2026-08-08T03:51:16.856099+00:00','https://www.youtube.com/watch?v=-nfl4hJ7pVE',170,'https://ocrmirror.org/files/music/remixes/Gaiares_Credits_Theme_(ZZ_Badnusty_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1042,'Asian Twilight','The Legend of the Mystical Ninja','2026-08-08T14:06:22.585532+00:00','https://www.youtube.com/watch?v=L2Z5eNDFPFU',161,'https://ocrmirror.org/files/music/remixes/Legend_of_the_Mystical_Ninja_Asian_Twilight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1043,'Electric Gear Solid','Metal Gear Solid 2: Sons of Liberty','2026-08-08T13:26:19.556776+00:00','https://www.youtube.com/watch?v=37KPLO4uemE',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Electric_Gear_Solid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1044,'Angel','Sonic & Knuckles','2026-08-08T19:07:50.238969+00:00','https://www.youtube.com/watch?v=ngpHdlLT8G4',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Angel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1045,'SoS','The Legend of Zelda: Ocarina of Time','2026-08-08T17:02:10.414143+00:00','https://www.youtube.com/watch?v=7q29aZeT4FY',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_SoS_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1047,'Speedy Guitar','Speedball','2026-08-08T11:53:52.045956+00:00','https://www.youtube.com/watch?v=YPrZ7suYhC4',219,'https://ocrmirror.org/files/music/remixes/Speedball_Speedy_Guitar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1048,'One Girl in All the World','Super Metroid','2026-08-08T19:07:50.411786+00:00','https://www.youtube.com/watch?v=lyjTNnQD36A',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_One_Girl_in_All_the_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1049,'Song of the Mountain','Chrono Trigger','2026-08-08T11:00:18.680425+00:00','https://www.youtube.com/watch?v=2fFRGB1cMrw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Song_of_the_Mountain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1050,'Waltz for Zora','The Legend of Zelda: A Link to the Past','2026-08-08T15:55:45.570163+00:00','https://www.youtube.com/watch?v=sbpQJFzijxc',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Waltz_for_Zora_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1052,'Force of Light','Shining Force III','2026-08-08T13:26:19.385128+00:00','https://www.youtube.com/watch?v=j_Z4mldjCLU',369,'https://ocrmirror.org/files/music/remixes/Shining_Force_3_Force_of_Light_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1053,'Zeal Love','Chrono Trigger','2026-08-08T19:53:34.523524+00:00','https://www.youtube.com/watch?v=zo0k-rGylRU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Zeal_Love_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1054,'Nostalgy Dimension','Flashback: The Quest for Identity','2026-08-08T11:53:52.746317+00:00','https://www.youtube.com/watch?v=8dVLMAvtO8g',370,'https://ocrmirror.org/files/music/remixes/Flashback_Nostalgy_Dimension_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1055,'Dream-Shore Sonata-Fantaisie','Chrono Cross','2026-08-08T14:58:10.673233+00:00','https://www.youtube.com/watch?v=gwxdjcbPjQc',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Dream-Shore_Sonata-Fantaisie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1056,'Save Me (OCR Edit)','Ico','2026-08-08T21:55:42.688708+00:00','https://www.youtube.com/watch?v=z_jQxXo0ETU',372,'https://ocrmirror.org/files/music/remixes/Ico_Save_Me_(OCR_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1057,'Midnight Altitude','Pilotwings 64','2026-08-08T14:06:21.882474+00:00','https://www.youtube.com/watch?v=dHSRO6yiMeA',207,'https://ocrmirror.org/files/music/remixes/Pilotwings_64_Midnight_Altitude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1058,'Flames of Valor','Breath of Fire','2026-08-08T17:56:57.524425+00:00','https://www.youtube.com/watch?v=bOXYCPETDuk',259,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_Flames_of_Valor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1059,'Belmont Mix','Super Castlevania IV','2026-08-08T06:05:30.817250+00:00','https://www.youtube.com/watch?v=PoRld9m4jOc',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Belmont_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1060,'Kingdom Come','Dragon Warrior','2026-08-08T13:26:19.729837+00:00','https://www.youtube.com/watch?v=OERbteeKuJY',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Kingdom_Come_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1061,'Rain in Chicago','Final Fantasy VIII','2026-08-08T14:06:23.108599+00:00','https://www.youtube.com/watch?v=1JDQtJSafl0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Rain_in_Chicago_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1062,'Live from the Yggdrasil','Xenogears','2026-08-08T17:56:59.397137+00:00','https://www.youtube.com/watch?v=f5uVVT9Je-w',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Live_from_the_Yggdrasil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1063,'Lose-Your-Way Maze','Super Mario Bros. 3','2026-08-08T11:53:51.697897+00:00','https://www.youtube.com/watch?v=gtZMksGGRxc',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Lose-Your-Way_Maze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1064,'You Are Not Confined','Final Fantasy IX','2026-08-08T19:53:33.644305+00:00','https://www.youtube.com/watch?v=H7Hhc1dTDFk',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_You_Are_Not_Confined_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1065,'Dezoris Winter','Phantasy Star II','2026-08-08T17:02:09.717515+00:00','https://www.youtube.com/watch?v=CqyjWfWAcgc',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_Dezoris_Winter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1066,'Belmont Lounge','Castlevania','2026-08-08T20:58:13.887129+00:00','https://www.youtube.com/watch?v=wDObnQNwa1w',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Belmont_Lounge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1067,'Those Chosen by the Medly','Final Fantasy VII','2026-08-08T17:56:57.703409+00:00','https://www.youtube.com/watch?v=M_5-vcmLoNk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Those_Chosen_by_the_Medly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1068,'In the Atrium','Ninja Gaiden II: The Dark Sword of Chaos','2026-08-08T22:57:22.286322+00:00','https://www.youtube.com/watch?v=KZW0Tc2LW7E',135,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_2_In_the_Atrium_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1069,'Party in the Snowland','Mario Kart 64','2026-08-08T14:06:23.457228+00:00','https://www.youtube.com/watch?v=3DMAMDu2UL8',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Party_in_the_Snowland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1071,'It''s About Time','Mega Man 2','2026-08-08T17:56:59.046111+00:00','https://www.youtube.com/watch?v=q-mv2-RlmFE',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_It''s_About_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1072,'8-bit Kamikaze','The Last Ninja','2026-08-08T15:55:46.455402+00:00','https://www.youtube.com/watch?v=S7hBI_Y9vAg',374,'https://ocrmirror.org/files/music/remixes/Last_Ninja_8-bit_Kamikaze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1073,'Waltz of Pain','Super Mario RPG: Legend of the Seven Stars','2026-08-08T20:58:12.841434+00:00','https://www.youtube.com/watch?v=4-NsUaSu738',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Waltz_of_Pain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1074,'Space Travel','Star Ocean','2026-08-08T17:56:59.572574+00:00','https://www.youtube.com/watch?v=HwvKYADRryE',376,'https://ocrmirror.org/files/music/remixes/Star_Ocean_Space_Travel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1075,'Chained to a Barcode','Hitman: Codename 47','2026-08-08T15:55:44.855869+00:00','https://www.youtube.com/watch?v=4oCQaNF_dp4',375,'https://ocrmirror.org/files/music/remixes/Hitman_Codename_47_Chained_to_a_Barcode_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1076,'Emotions Lost in Time','Tales of Phantasia','2026-08-08T21:55:43.027409+00:00','https://www.youtube.com/watch?v=3H3W5-FystI',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Emotions_Lost_in_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1077,'Inquisition','IronSword: Wizards & Warriors II','2026-08-08T19:07:51.450331+00:00','https://www.youtube.com/watch?v=Et7iw0PMavY',314,'https://ocrmirror.org/files/music/remixes/IronSword_Wizards_&_Warriors_2_Inquisition_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1078,'Climhazzard Rush','Final Fantasy VII','2026-08-08T14:58:10.857724+00:00','https://www.youtube.com/watch?v=PSAzbibjiQs',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Climhazzard_Rush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1079,'Ancient Hero','The Legend of Zelda: The Wind Waker','2026-08-08T22:57:22.806208+00:00','https://www.youtube.com/watch?v=eEOGcN-4THE',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Ancient_Hero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1080,'All the World in One Girl','Super Metroid','2026-08-08T20:58:13.016119+00:00','https://www.youtube.com/watch?v=lbUOSL69iXQ',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_All_the_World_in_One_Girl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1081,'Anthem of Exile','Final Fantasy VI','2026-08-08T21:55:41.811371+00:00','https://www.youtube.com/watch?v=ZD8LUtgkdhk',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Anthem_of_Exile_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1082,'Thunderous Dawn','Raiden Trad','2026-08-08T14:06:22.760405+00:00','https://www.youtube.com/watch?v=K0iFDN9S3sI',323,'https://ocrmirror.org/files/music/remixes/Raiden_Trad_Thunderous_Dawn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1083,'Space Cowboys','Star Fox','2026-08-08T19:07:51.277694+00:00','https://www.youtube.com/watch?v=kJgoeirlBx4',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Space_Cowboys_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1084,'Pure Lands (Total Darkness)','Secret of Mana','2026-08-08T14:58:09.621207+00:00','https://www.youtube.com/watch?v=cpF4c2mt1Ps',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Pure_Lands_(Total_Darkness)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1085,'Magnet Man Goes West','Mega Man 3','2026-08-08T19:53:34.874063+00:00','https://www.youtube.com/watch?v=Jwo9tJUnBi8',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Magnet_Man_Goes_West_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1086,'Secret Seashells','The Legend of Zelda: Link''s Awakening','2026-08-08T23:54:29.030998+00:00','https://www.youtube.com/watch?v=7rVpcHnvEpY',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Secret_Seashells_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1087,'Lava Reef Zone (Las Trompetas Maravillosas Mix)','Sonic & Knuckles','2026-08-08T15:55:45.036195+00:00','https://www.youtube.com/watch?v=ssrMdJtdBFQ',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Lava_Reef_Zone_(Las_Trompetas_Maravillosas_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1088,'Megalo Kid March','Kid Icarus','2026-08-08T14:06:22.061759+00:00','https://www.youtube.com/watch?v=AdYL0qsA70Y',121,'https://ocrmirror.org/files/music/remixes/Kid_Icarus_Megalo_Kid_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1089,'Snow Motion','Sonic the Hedgehog 3','2026-08-08T14:58:09.970343+00:00','https://www.youtube.com/watch?v=3U_ForGzQj4',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Snow_Motion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1091,'Funky Bookas','EarthBound','2026-08-08T17:56:57.878355+00:00','https://www.youtube.com/watch?v=LXhsD8Z4_WU',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Funky_Bookas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1092,'Electric Clouds','Chrono Trigger','2026-08-08T21:55:43.366400+00:00','https://www.youtube.com/watch?v=MAfV3zaLS1A',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Electric_Clouds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1093,'His First Good Deed','Breath of Fire','2026-08-08T19:53:34.172974+00:00','https://www.youtube.com/watch?v=6X2tYKkYsfE',259,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_His_First_Good_Deed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1094,'Silent Ascent','Perfect Dark','2026-08-08T14:58:10.145986+00:00','https://www.youtube.com/watch?v=nGLcCS9mViQ',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Silent_Ascent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1095,'Blue Skies over Guardia','Chrono Trigger','2026-08-08T21:55:42.858405+00:00','https://www.youtube.com/watch?v=1e1jmur2PWA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Blue_Skies_over_Guardia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1096,'Moondust','DuckTales','2026-08-08T19:53:35.049433+00:00','https://www.youtube.com/watch?v=Gblg9txAtAA',50,'https://ocrmirror.org/files/music/remixes/DuckTales_Moondust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1097,'Umaro Uematsu','Final Fantasy VI','2026-08-08T15:55:46.278711+00:00','https://www.youtube.com/watch?v=N6kMwDWSNBs',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Umaro_Uematsu_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1098,'demonik elektronik','Doom','2026-08-08T23:54:28.326582+00:00','https://www.youtube.com/watch?v=3CusTxjJR1c',14512,'https://ocrmirror.org/files/music/remixes/Doom_demonik_elektronik_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1099,'Tears for a Girl','Chrono Trigger','2026-08-08T19:53:34.699072+00:00','https://www.youtube.com/watch?v=VYEIDzaYPsQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Tears_for_a_Girl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1100,'Internal Affliction','Final Fantasy VII','2026-08-08T20:58:13.188853+00:00','https://www.youtube.com/watch?v=8NJBzm9FbIU',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Internal_Affliction_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1102,'Marble Dancefloor','Marble Madness','2026-08-08T19:53:33.997302+00:00','https://www.youtube.com/watch?v=E9cjTySuX_4',286,'https://ocrmirror.org/files/music/remixes/Marble_Madness_Marble_Dancefloor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1103,'Within the Fable','Seiken Densetsu 3','2026-08-08T17:02:09.540797+00:00','https://www.youtube.com/watch?v=dmKAq_OXFPk',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Within_the_Fable_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1104,'Nanaki Searches for Truth','Final Fantasy VII','2026-08-08T19:07:51.105519+00:00','https://www.youtube.com/watch?v=nEJ3-uA-9G8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Nanaki_Searches_for_Truth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1105,'Tickle My Wily','Mega Man 2','2026-08-09T04:46:09.546938+00:00','https://www.youtube.com/watch?v=CQE4ZjzCNEg',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Tickle_My_Wily_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1106,'Silver Hawk Legacy','Darius','2026-08-08T17:02:09.891265+00:00','https://www.youtube.com/watch?v=7e9p5VIfxaY',378,'https://ocrmirror.org/files/music/remixes/Darius_Silver_Hawk_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1107,'Frappe Cafe Vibe','Mario Kart 64','2026-08-08T21:55:42.517256+00:00','https://www.youtube.com/watch?v=Ln1pzz9l5p0',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Frappe_Cafe_Vibe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1108,'Mario''s Tropical Paradise','Super Mario RPG: Legend of the Seven Stars','2026-08-09T07:31:58.883628+00:00','https://www.youtube.com/watch?v=uPcdaedB9cQ',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Mario''s_Tropical_Paradise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1109,'Horteka Stomp','Skies of Arcadia','2026-08-08T19:07:50.932527+00:00','https://www.youtube.com/watch?v=cf3Y2b9UtPs',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Horteka_Stomp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1110,'Sector 7 Hath Wrought the Angel','Final Fantasy VII','2026-08-09T06:07:42.117852+00:00','https://www.youtube.com/watch?v=Dx5sYH-Hwfk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Sector_7_Hath_Wrought_the_Angel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1111,'Homage to Amida Buddha','Samurai Warrior: The Battles of Usagi Yojimbo','2026-08-08T19:07:50.059896+00:00','https://www.youtube.com/watch?v=XR82TyskAII',379,'https://ocrmirror.org/files/music/remixes/Samurai_Warrior_Homage_to_Amida_Buddha_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1112,'Braving the Flames','Super Metroid','2026-08-08T17:02:10.764034+00:00','https://www.youtube.com/watch?v=FMnyP2xcIu8',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Braving_the_Flames_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1113,'Hunter''s Etude-Scherzo','Final Fantasy IX','2026-08-09T04:46:09.026467+00:00','https://www.youtube.com/watch?v=zDhT63cqXfM',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Hunter''s_Etude-Scherzo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1114,'4F73R M3','Dance Dance Revolution 4th Mix','2026-08-09T07:31:58.161174+00:00','https://www.youtube.com/watch?v=fCs5BpkhAD8',380,'https://ocrmirror.org/files/music/remixes/Dance_Dance_Revolution_4th_Mix_4F73R_M3_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1115,'Another Fair','Chrono Trigger','2026-08-08T19:53:33.821657+00:00','https://www.youtube.com/watch?v=0R9D1VbJjOw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Another_Fair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1116,'Beyond Comprehension','Secret of Mana','2026-08-08T21:55:41.983651+00:00','https://www.youtube.com/watch?v=JN-EAhX_aRk',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Beyond_Comprehension_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1117,'Kasugano (Booty Mix)','Street Fighter Alpha 2','2026-08-08T22:57:22.634027+00:00','https://www.youtube.com/watch?v=UxLAJqJVbcU',381,'https://ocrmirror.org/files/music/remixes/Street_Fighter_Alpha_2_Kasugano_(Booty_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1118,'Guardian''s Sending','Final Fantasy X','2026-08-08T22:57:21.940137+00:00','https://www.youtube.com/watch?v=vilUXAqLx84',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Guardian''s_Sending_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1119,'And You Must Dance','One Must Fall 2097','2026-08-08T22:57:22.978428+00:00','https://www.youtube.com/watch?v=rjr0pZc7B6o',307,'https://ocrmirror.org/files/music/remixes/One_Must_Fall_2097_And_You_Must_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1120,'The Calling','Final Doom','2026-08-08T17:56:58.078439+00:00','https://www.youtube.com/watch?v=ijcIKd67JT0',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_The_Calling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1121,'Reich Lake','Sonic the Hedgehog 2','2026-08-08T23:54:27.798389+00:00','https://www.youtube.com/watch?v=TT06vdi1vgQ',383,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Reich_Lake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1122,'Temple of Life','Life Force','2026-08-08T20:58:13.365173+00:00','https://www.youtube.com/watch?v=UyoeozUNDF0',237,'https://ocrmirror.org/files/music/remixes/Life_Force_Temple_of_Life_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1123,'Eros','The Battle of Olympus','2026-08-08T22:57:22.460245+00:00','https://www.youtube.com/watch?v=7Nj1WG5u7pk',384,'https://ocrmirror.org/files/music/remixes/Battle_of_Olympus_Eros_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1124,'Pirates of Dragon Roost Isle','The Legend of Zelda: The Wind Waker','2026-08-08T23:54:28.678077+00:00','https://www.youtube.com/watch?v=zRyer6O1EjI',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Pirates_of_Dragon_Roost_Isle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1125,'Niggaz 4 Life','Astérix','2026-08-09T11:01:42.322837+00:00','https://www.youtube.com/watch?v=938gSDsv1KQ',386,'https://ocrmirror.org/files/music/remixes/Asterix_Niggaz_4_Life_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1126,'The Greatest Greed','Great Greed','2026-08-08T20:58:12.666604+00:00','https://www.youtube.com/watch?v=J9pYQa8BWPw',385,'https://ocrmirror.org/files/music/remixes/Great_Greed_The_Greatest_Greed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1127,'Ada''s Groove','Resident Evil 2','2026-08-08T19:07:51.622885+00:00','https://www.youtube.com/watch?v=xPGTo7e-5nc',211,'https://ocrmirror.org/files/music/remixes/Resident_Evil_2_Ada''s_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1128,'Silver Dragon''s Bubbles','Puzzle Bobble','2026-08-08T22:57:21.765714+00:00','https://www.youtube.com/watch?v=sN2JV89qDuo',387,'https://ocrmirror.org/files/music/remixes/Puzzle_Bobble_Silver_Dragon''s_Bubbles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1129,'Dream Pipe','Sonic the Hedgehog 2','2026-08-09T02:34:47.456770+00:00','https://www.youtube.com/watch?v=4S5bkHAlsSs',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Dream_Pipe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1130,'Squaresoft Variation','Final Fantasy VI','2026-08-09T06:07:41.770521+00:00','https://www.youtube.com/watch?v=b7iNyIIyLbk',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Squaresoft_Variation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1131,'Cursed Piano','Sorcerian','2026-08-08T17:56:58.513683+00:00','https://www.youtube.com/watch?v=JQVTf1cLcv8',388,'https://ocrmirror.org/files/music/remixes/Sorcerian_Cursed_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1132,'Time Chill','Chrono Trigger','2026-08-09T04:46:09.372722+00:00','https://www.youtube.com/watch?v=BAFLPG2h0lk',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Time_Chill_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1133,'Fungus Funktion','The Legend of Zelda: Link''s Awakening','2026-08-08T20:58:13.539083+00:00','https://www.youtube.com/watch?v=_S1PgcJDKoc',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Fungus_Funktion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1134,'Knuckles'' Unknown from M.C.','Sonic Adventure 2','2026-08-09T09:11:08.144563+00:00','https://www.youtube.com/watch?v=EzNrMFQ0_c0',277,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_2_Knuckles''_Unknown_from_MC_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1135,'Battle Theme (Ivory Metal Mix)','Final Fantasy VI','2026-08-09T07:31:58.339938+00:00','https://www.youtube.com/watch?v=397pLLS5cRA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Battle_Theme_(Ivory_Metal_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1136,'Property of the Crimson Corporation','Star Control II','2026-08-08T22:57:22.113530+00:00','https://www.youtube.com/watch?v=ovsRKPSC6ys',351,'https://ocrmirror.org/files/music/remixes/Star_Control_2_Property_of_the_Crimson_Corporation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1137,'G-Storm','Extreme-G','2026-08-09T06:07:40.881573+00:00','https://www.youtube.com/watch?v=Qa2grSBNgn4',389,'https://ocrmirror.org/files/music/remixes/Extreme-G_G-Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1138,'Forest Birdcussion','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-09T09:11:07.971622+00:00','https://www.youtube.com/watch?v=g2ef7Txomuw',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Forest_Birdcussion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1139,'Proxima Path','Terminal Velocity','2026-08-08T19:53:34.347080+00:00','https://www.youtube.com/watch?v=BBfdiYE3o24',390,'https://ocrmirror.org/files/music/remixes/Terminal_Velocity_Proxima_Path_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1140,'Awakened Fears of the Gerudo','The Legend of Zelda: Ocarina of Time','2026-08-08T23:54:27.973588+00:00','https://www.youtube.com/watch?v=-rHYjp8SCgU',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Awakened_Fears_of_the_Gerudo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1141,'Sweeter Than Honey','Final Fantasy VII','2026-08-08T19:07:50.586136+00:00','https://www.youtube.com/watch?v=x6yVk12Lay0',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Sweeter_Than_Honey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1143,'Silent Progression','F-Zero','2026-08-08T22:57:21.584461+00:00','https://www.youtube.com/watch?v=owWGq9z0qQI',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Silent_Progression_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1144,'Turtle Wave','Teenage Mutant Ninja Turtles III: The Manhattan Project','2026-08-09T06:07:40.706457+00:00','https://www.youtube.com/watch?v=2vqxhRIap-g',391,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_3_Turtle_Wave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1145,'Dragon''s Prayer: The Blackened Desire','Chrono Cross','2026-08-09T02:34:46.581310+00:00','https://www.youtube.com/watch?v=_GPvG3oYqoI',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Dragon''s_Prayer_The_Blackened_Desire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1146,'Late Night Sneakin''','Jet Grind Radio','2026-08-09T07:31:57.982686+00:00','https://www.youtube.com/watch?v=HOicqoDibqg',392,'https://ocrmirror.org/files/music/remixes/Jet_Grind_Radio_Late_Night_Sneakin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1147,'Super Mariocean','Super Mario World','2026-08-08T19:53:33.463119+00:00','https://www.youtube.com/watch?v=LsLo-DaLkrE',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Super_Mariocean_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1148,'Turks in Pursuit','Final Fantasy VII','2026-08-08T20:58:12.313887+00:00','https://www.youtube.com/watch?v=AI8YP5EXJZw',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Turks_in_Pursuit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1149,'Dreams Come True','Mega Man X','2026-08-09T11:01:41.978463+00:00','https://www.youtube.com/watch?v=X8LtPs4l6_k',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Dreams_Come_True_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1150,'Aquescent Symphony','The Legend of Zelda: Ocarina of Time','2026-08-08T22:57:23.158229+00:00','https://www.youtube.com/watch?v=H18-Ynp8Biw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Aquescent_Symphony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1151,'Battle at the Red Mountain','The Elder Scrolls III: Morrowind','2026-08-08T21:55:42.325714+00:00','https://www.youtube.com/watch?v=vgeQZkm14Jg',324,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_3_Morrowind_Battle_at_the_Red_Mountain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1152,'Ruined Desert','Halo: Combat Evolved','2026-08-09T02:34:46.932966+00:00','https://www.youtube.com/watch?v=Kiu5VQX3lZM',393,'https://ocrmirror.org/files/music/remixes/Halo_Ruined_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1153,'A Storm in the Desert','The Legend of Zelda: Ocarina of Time','2026-08-09T09:11:07.455503+00:00','https://www.youtube.com/watch?v=Fo9g5pFgDWk',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_A_Storm_in_the_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1154,'Space Drifter','Linus Spacehead','2026-08-09T06:07:41.071580+00:00','https://www.youtube.com/watch?v=Oto0f9PQYUU',927,'https://ocrmirror.org/files/music/remixes/Linus_Spacehead_Space_Drifter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1155,'Purple Heart','Rush''n Attack','2026-08-09T04:46:09.893496+00:00','https://www.youtube.com/watch?v=ZjgGa3W5OE4',395,'https://ocrmirror.org/files/music/remixes/Rush''n_Attack_Purple_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1156,'Kick Your A','Beatmania IIDX 7th Style','2026-08-09T07:31:59.593031+00:00','https://www.youtube.com/watch?v=lcLV03LKl4E',396,'https://ocrmirror.org/files/music/remixes/Beatmania_2DX_7th_Style_Kick_Your_A_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1157,'Icon','Ico','2026-08-09T02:34:47.282647+00:00','https://www.youtube.com/watch?v=WyjBHcy-8zA',372,'https://ocrmirror.org/files/music/remixes/Ico_Icon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1158,'Slalomicide','Slalom','2026-08-08T21:55:42.154506+00:00','https://www.youtube.com/watch?v=JDt8xiRga5k',397,'https://ocrmirror.org/files/music/remixes/Slalom_Slalomicide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1159,'Reflections','Shenmue','2026-08-08T21:55:43.197720+00:00','https://www.youtube.com/watch?v=iEVYp01YgoQ',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Reflections_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1160,'LightSpeed','Sonic Adventure','2026-08-08T23:54:28.149655+00:00','https://www.youtube.com/watch?v=tYaQoAlV70U',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_LightSpeed_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1161,'Fall from Above (You Can''t Stop)','Halo: Combat Evolved','2026-08-08T23:54:28.502124+00:00','https://www.youtube.com/watch?v=opK5xRcIHdM',393,'https://ocrmirror.org/files/music/remixes/Halo_Fall_from_Above_(You_Can''t_Stop)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1162,'Prayer','Final Fantasy VII','2026-08-09T10:04:33.423832+00:00','https://www.youtube.com/watch?v=CG0YlivnWd4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Prayer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1163,'Memoriam','Final Doom','2026-08-09T06:07:41.596002+00:00','https://www.youtube.com/watch?v=R2Rx-y_Ovs8',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_Memoriam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1164,'Jenova for Classical Piano','Final Fantasy VII','2026-08-09T11:55:35.629460+00:00','https://www.youtube.com/watch?v=5xdA5jFWEcI',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Jenova_for_Classical_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1165,'The Lost Horizon','Final Fantasy VIII','2026-08-09T09:11:07.800215+00:00','https://www.youtube.com/watch?v=UFR2wj5HCAU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Lost_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1166,'From Ghosts Emerge Beasts','The Legend of the Mystical Ninja','2026-08-08T20:58:13.712864+00:00','https://www.youtube.com/watch?v=dwmynEd_ZaU',161,'https://ocrmirror.org/files/music/remixes/Legend_of_the_Mystical_Ninja_From_Ghosts_Emerge_Beasts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1167,'Drop and Roll','Streets of Rage','2026-08-09T04:46:09.720047+00:00','https://www.youtube.com/watch?v=mODbC8MCdIQ',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Drop_and_Roll_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1168,'Vibe Victory','Strider','2026-08-09T02:34:47.107555+00:00','https://www.youtube.com/watch?v=E27q82GthG0',398,'https://ocrmirror.org/files/music/remixes/Strider_Vibe_Victory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1169,'Collision','Sonic the Hedgehog','2026-08-08T23:54:29.206913+00:00','https://www.youtube.com/watch?v=7cHA7UFu4Fg',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Collision_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1170,'This Heart','Seiken Densetsu 3','2026-08-09T04:46:10.240188+00:00','https://www.youtube.com/watch?v=bQ3xkGoej3s',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_This_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1171,'Kraid''s Hideout','Metroid','2026-08-09T13:30:21.020629+00:00','https://www.youtube.com/watch?v=p8f9Uh7x3po',73,'https://ocrmirror.org/files/music/remixes/Metroid_Kraid''s_Hideout_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1172,'Return to Elysian Lands','Secret of Mana','2026-08-09T07:31:58.706806+00:00','https://www.youtube.com/watch?v=bYiUZZxKPOY',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Return_to_Elysian_Lands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1173,'The Raven','Castlevania','2026-08-08T23:54:28.854488+00:00','https://www.youtube.com/watch?v=Llewpvyxb9E',18,'https://ocrmirror.org/files/music/remixes/Castlevania_The_Raven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1174,'AfterLife','Final Fantasy','2026-08-09T07:31:58.528581+00:00','https://www.youtube.com/watch?v=u44a9P4oegQ',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_AfterLife_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1175,'Chillout','Mega Man 2','2026-08-09T09:11:08.320077+00:00','https://www.youtube.com/watch?v=MVc49-wDOUQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Chillout_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1176,'Snow Cone Heaven','Ice Climber','2026-08-09T02:34:47.632031+00:00','https://www.youtube.com/watch?v=1nQb8vP50BY',399,'https://ocrmirror.org/files/music/remixes/Ice_Climber_Snow_Cone_Heaven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1177,'A Momentary Emotion','Xenogears','2026-08-08T23:54:27.617020+00:00','https://www.youtube.com/watch?v=qVFrhcmSj2s',70,'https://ocrmirror.org/files/music/remixes/Xenogears_A_Momentary_Emotion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1178,'Through the Dark','Chrono Trigger','2026-08-09T11:01:42.152207+00:00','https://www.youtube.com/watch?v=wNhPTkf2h7k',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Through_the_Dark_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1179,'Agony of Obscuration','Final Fantasy VI','2026-08-09T10:04:32.872304+00:00','https://www.youtube.com/watch?v=cDp0_qMCEFo',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Agony_of_Obscuration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1180,'man sieht sich galaxie','Commander Keen IV: Secret of the Oracle','2026-08-09T11:01:40.934762+00:00','https://www.youtube.com/watch?v=rYHKw1OuZUI',400,'https://ocrmirror.org/files/music/remixes/Commander_Keen_4_man_sieht_sich_galaxie_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1181,'Sonik Elektronik','Sonic the Hedgehog 3','2026-08-09T10:04:33.873208+00:00','https://www.youtube.com/watch?v=kRSStuoRr1k',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Sonik_Elektronik_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1182,'Mahabharath Highlands','Halo: Combat Evolved','2026-08-09T04:46:09.199145+00:00','https://www.youtube.com/watch?v=N6TCQEmNBvM',393,'https://ocrmirror.org/files/music/remixes/Halo_Mahabharath_Highlands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1183,'KRool Intentions','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-09T11:55:36.320711+00:00','https://www.youtube.com/watch?v=-Ujj06NWOuo',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_KRool_Intentions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1184,'Triforce Majeure','The Legend of Zelda: A Link to the Past','2026-08-09T13:30:21.538727+00:00','https://www.youtube.com/watch?v=nsTgGV2DLF4',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Triforce_Majeure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1185,'The Darkness and the Light','The Legend of Zelda: A Link to the Past','2026-08-09T11:01:41.110718+00:00','https://www.youtube.com/watch?v=z2MCzeBiZHM',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Darkness_and_the_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1186,'Consent (Make Me Dance)','The Revenge of Shinobi','2026-08-09T09:11:08.494126+00:00','https://www.youtube.com/watch?v=vMLGka3qVJ8',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_Consent_(Make_Me_Dance)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1187,'When You See the Flash Man, Duck and Cover','Mega Man 2','2026-08-09T10:04:33.280939+00:00','https://www.youtube.com/watch?v=yl4l7FrooNE',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_When_You_See_the_Flash_Man_Duck_and_Cover_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1188,'Rainbow Snowland','Mario Kart 64','2026-08-09T07:31:59.411860+00:00','https://www.youtube.com/watch?v=vgvl6IsY0R8',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Rainbow_Snowland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1189,'Frame of Mind','Beyond Good & Evil','2026-08-09T15:57:29.596393+00:00','https://www.youtube.com/watch?v=R2uMVmKkEIs',401,'https://ocrmirror.org/files/music/remixes/Beyond_Good_&_Evil_Frame_of_Mind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1190,'Through the Angles of Space','Star Control II','2026-08-09T04:46:08.854269+00:00','https://www.youtube.com/watch?v=PK9_ZlJ8VA0',351,'https://ocrmirror.org/files/music/remixes/Star_Control_2_Through_the_Angles_of_Space_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1191,'Dark Tortoise','Shinobi','2026-08-09T02:34:46.405914+00:00','https://www.youtube.com/watch?v=KP06sdI0_Yw',81,'https://ocrmirror.org/files/music/remixes/Shinobi_Dark_Tortoise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1192,'Tactile Freefall','Life Force','2026-08-09T11:01:40.758775+00:00','https://www.youtube.com/watch?v=i1sJvo9Pgm0',237,'https://ocrmirror.org/files/music/remixes/Life_Force_Tactile_Freefall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1194,'Go Home and Be a Family Man','Street Fighter II: The World Warrior','2026-08-09T11:01:41.804125+00:00','https://www.youtube.com/watch?v=vwVNBEymqoo',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Go_Home_and_Be_a_Family_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1195,'The Belmont Chill','Super Castlevania IV','2026-08-09T07:31:59.235474+00:00','https://www.youtube.com/watch?v=0TUkPSnkfF0',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_The_Belmont_Chill_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1196,'The Outer Space Machine','Sonic the Hedgehog 3','2026-08-09T11:01:41.285519+00:00','https://www.youtube.com/watch?v=1Ku-bSMJXwY',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_The_Outer_Space_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1197,'Sahasralah''s Homecoming','The Legend of Zelda: A Link to the Past','2026-08-09T11:55:35.454800+00:00','https://www.youtube.com/watch?v=GCP2TtN4r_g',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Sahasralah''s_Homecoming_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1198,'Iron Demon','Final Doom','2026-08-09T02:34:46.756726+00:00','https://www.youtube.com/watch?v=mBRYNgTN7hA',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_Iron_Demon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1199,'Phoenix Symphonic','Final Fantasy IV','2026-08-09T10:04:32.598432+00:00','https://www.youtube.com/watch?v=6NKQ40cUMC0',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Phoenix_Symphonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1200,'Into the Golden Sunset','The Legend of Zelda: A Link to the Past','2026-08-09T17:04:05.567147+00:00','https://www.youtube.com/watch?v=WU1nzHQ3adc',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Into_the_Golden_Sunset_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1201,'Truth in Forgiveness Await','Final Fantasy VII','2026-08-09T06:07:41.943360+00:00','https://www.youtube.com/watch?v=jKNVE_GAgPQ',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Truth_in_Forgiveness_Await_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1202,'Neighburgers','Zombies Ate My Neighbors','2026-08-09T13:30:20.495235+00:00','https://www.youtube.com/watch?v=LIJ8XK_zGBg',344,'https://ocrmirror.org/files/music/remixes/Zombies_Ate_My_Neighbors_Neighburgers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1203,'Tribal Warfare','Adventure Island','2026-08-09T13:30:21.192298+00:00','https://www.youtube.com/watch?v=Ot_2xju4fNg',403,'https://ocrmirror.org/files/music/remixes/Adventure_Island_Tribal_Warfare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1204,'Take the Red Pill','Kabuki: Quantum Fighter','2026-08-09T06:07:40.527759+00:00','https://www.youtube.com/watch?v=FQukGcvCBvo',276,'https://ocrmirror.org/files/music/remixes/Kabuki_Quantum_Fighter_Take_the_Red_Pill_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1205,'Dreaming While I Wake','Shenmue','2026-08-09T15:00:48.958825+00:00','https://www.youtube.com/watch?v=VRQ9Hv9FU0M',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Dreaming_While_I_Wake_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1206,'Nightmare King''s Dream','Little Nemo: The Dream Master','2026-08-09T11:01:41.458412+00:00','https://www.youtube.com/watch?v=b_sTkYolaiM',124,'https://ocrmirror.org/files/music/remixes/Little_Nemo_Nightmare_King''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1207,'The Final Stage','The Elder Scrolls III: Morrowind','2026-08-09T11:55:36.149562+00:00','https://www.youtube.com/watch?v=Qr6kSIGV37c',324,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_3_Morrowind_The_Final_Stage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1208,'Eutopia Pegasi','The Legend of Zelda','2026-08-09T17:04:06.268401+00:00','https://www.youtube.com/watch?v=RjK4oILsH9E',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Eutopia_Pegasi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1209,'A Fate Preordained','The Legend of Zelda','2026-08-09T10:04:33.730735+00:00','https://www.youtube.com/watch?v=gp1jsUDnmV8',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Fate_Preordained_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1210,'Apocryphal','Dragon View','2026-08-09T11:55:35.283611+00:00','https://www.youtube.com/watch?v=0MNc3q5fKQk',404,'https://ocrmirror.org/files/music/remixes/Dragon_View_Apocryphal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1211,'Killer Dokko','Star Ocean: Blue Sphere','2026-08-09T09:11:07.111276+00:00','https://www.youtube.com/watch?v=CqfqgX1fvYE',405,'https://ocrmirror.org/files/music/remixes/Star_Ocean_Blue_Sphere_Killer_Dokko_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1212,'Into the Corridor of Shadows','Super Castlevania IV','2026-08-09T11:55:36.492181+00:00','https://www.youtube.com/watch?v=XqzoNBOu6Ek',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Into_the_Corridor_of_Shadows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1214,'Strip Mine','Sonic the Hedgehog 2','2026-08-09T15:00:48.785566+00:00','https://www.youtube.com/watch?v=0q-XDGhMYZk',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Strip_Mine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1215,'In the Air Mix','Lost Patrol','2026-08-09T06:07:41.422489+00:00','https://www.youtube.com/watch?v=1JeowgftUpo',406,'https://ocrmirror.org/files/music/remixes/Lost_Patrol_In_the_Air_Mix_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1216,'Fear Not','The Elder Scrolls III: Morrowind','2026-08-09T11:01:41.631430+00:00','https://www.youtube.com/watch?v=A0ut_PUAxfU',324,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_3_Morrowind_Fear_Not_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1217,'Mission Recalled','Laser Squad','2026-08-09T06:07:41.246708+00:00','https://www.youtube.com/watch?v=MQLdu7H13e0',407,'https://ocrmirror.org/files/music/remixes/Laser_Squad_Mission_Recalled_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1218,'Red Spiders','The Guardian Legend','2026-08-09T09:11:07.628019+00:00','https://www.youtube.com/watch?v=NGIJ0oz9Vpo',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Red_Spiders_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1219,'Calamitous Judgment','Chrono Trigger','2026-08-09T19:57:24.560758+00:00','https://www.youtube.com/watch?v=AZUUwCI_-zo',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Calamitous_Judgment_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1220,'Distorted Star','Secret of Mana','2026-08-09T15:00:48.612435+00:00','https://www.youtube.com/watch?v=wkDH5AIxPs4',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Distorted_Star_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1221,'Intro Jazz','Mega Man 3','2026-08-09T17:04:06.617580+00:00','https://www.youtube.com/watch?v=-GClMDFKhZ0',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Intro_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1222,'Into the Deep','Submarine Attack','2026-08-09T15:57:30.271458+00:00','https://www.youtube.com/watch?v=IJug3iGsmg4',408,'https://ocrmirror.org/files/music/remixes/Submarine_Attack_Into_the_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1223,'Before Time','Jurassic Park','2026-08-09T10:04:32.734292+00:00','https://www.youtube.com/watch?v=A-f-lOoXr3k',268,'https://ocrmirror.org/files/music/remixes/Jurassic_Park_Before_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1224,'Cataclysmic Clash','Mega Man 3','2026-08-09T19:11:00.892626+00:00','https://www.youtube.com/watch?v=vN1eIQnUKcY',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Cataclysmic_Clash_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1225,'Pillar of Salt','Xenogears','2026-08-09T23:58:13.798311+00:00','https://www.youtube.com/watch?v=dXj3Fy3JSEM',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Pillar_of_Salt_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1226,'Rhodes to the Past','Chrono Trigger','2026-08-09T13:30:20.318816+00:00','https://www.youtube.com/watch?v=dvFSAxra5GM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Rhodes_to_the_Past_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1227,'Shepherd Won''t Alone','Final Fantasy IX','2026-08-09T09:11:06.933240+00:00','https://www.youtube.com/watch?v=AVkLXhRXKoA',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Shepherd_Won''t_Alone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1228,'A Foray into the Eastern Horizons','Final Fantasy VII','2026-08-09T17:04:06.093467+00:00','https://www.youtube.com/watch?v=BDLUdo3zgIk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_A_Foray_into_the_Eastern_Horizons_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1229,'Above the Rising Falls','Kingdom Hearts','2026-08-09T19:57:25.613222+00:00','https://www.youtube.com/watch?v=Kj6v2cmD8u4',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Above_the_Rising_Falls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1230,'Ryu for Four Pianos','Street Fighter II: The World Warrior','2026-08-09T17:58:39.145086+00:00','https://www.youtube.com/watch?v=QltMoz4iowo',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Ryu_for_Four_Pianos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1231,'Ganon''s Temple','The Legend of Zelda: A Link to the Past','2026-08-09T13:30:20.675681+00:00','https://www.youtube.com/watch?v=q6K3kR_Poj0',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Ganon''s_Temple_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1232,'Airborne','Raiden II','2026-08-09T10:04:33.566091+00:00','https://www.youtube.com/watch?v=OYuy2AcaIqc',410,'https://ocrmirror.org/files/music/remixes/Raiden_2_Airborne_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1233,'Armageddon','Shining Force','2026-08-09T17:04:05.743592+00:00','https://www.youtube.com/watch?v=OVvmGEP9tKQ',411,'https://ocrmirror.org/files/music/remixes/Shining_Force_Armageddon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1234,'Dreaming on Distant Shores','EarthBound','2026-08-09T19:11:01.307522+00:00','https://www.youtube.com/watch?v=_fbW5whisSw',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Dreaming_on_Distant_Shores_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1235,'Beamsabre Beat ZERO v2','Mega Man X2','2026-08-09T19:11:01.444096+00:00','https://www.youtube.com/watch?v=9gAFGyC3f_0',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Beamsabre_Beat_ZERO_v2_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1236,'I Got the Spacebeam','Space Harrier','2026-08-09T19:11:01.170674+00:00','https://www.youtube.com/watch?v=XR4sAv1i2Co',97,'https://ocrmirror.org/files/music/remixes/Space_Harrier_I_Got_the_Spacebeam_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1237,'Electrion (Guitar Mix)','Seiken Densetsu 3','2026-08-09T15:57:29.307663+00:00','https://www.youtube.com/watch?v=KzSI01eSxkw',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Electrion_(Guitar_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1238,'Messenger in the Key of Black','Final Fantasy IX','2026-08-09T10:04:33.144638+00:00','https://www.youtube.com/watch?v=gZCSV_rFkyo',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Messenger_in_the_Key_of_Black_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1239,'Sensual Ippon','Streets of Rage','2026-08-09T13:30:21.365269+00:00','https://www.youtube.com/watch?v=AGpvQ5rch-A',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Sensual_Ippon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1240,'Stained Glass Filth','Castlevania III: Dracula''s Curse','2026-08-09T11:55:35.977059+00:00','https://www.youtube.com/watch?v=xZKsnmOdJfo',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Stained_Glass_Filth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1241,'Kakariko Prom','The Legend of Zelda: A Link to the Past','2026-08-09T21:02:01.573312+00:00','https://www.youtube.com/watch?v=B9tkxTpLiPc',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Kakariko_Prom_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1242,'Beneath the Surface','Donkey Kong Country','2026-08-10T05:05:09.647910+00:00','https://www.youtube.com/watch?v=aZK4ACg3gI8',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Beneath_the_Surface_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1243,'Machina Anesthesia','Donkey Kong Country','2026-08-09T19:11:01.855523+00:00','https://www.youtube.com/watch?v=aPTg5ZgSk5I',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Machina_Anesthesia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1244,'West Coast DK Island','Donkey Kong Country','2026-08-09T15:00:48.264778+00:00','https://www.youtube.com/watch?v=WZZXtkUIHTk',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_West_Coast_DK_Island_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1245,'Begin the End of the Beginning','Final Fantasy Adventure','2026-08-09T17:04:06.967529+00:00','https://www.youtube.com/watch?v=z1aZKHQeU-Y',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Begin_the_End_of_the_Beginning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1246,'Anachronism','Secret of Evermore','2026-08-09T13:30:20.847329+00:00','https://www.youtube.com/watch?v=Ff5O--zzQb4',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_Anachronism_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1247,'To Far Away Memories','Chrono Trigger','2026-08-09T23:58:14.491190+00:00','https://www.youtube.com/watch?v=C1r8DXDvi6U',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_To_Far_Away_Memories_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1248,'Gargoyle on Broadway','Gargoyle''s Quest','2026-08-09T11:55:35.108704+00:00','https://www.youtube.com/watch?v=pKYRDDt5tjM',414,'https://ocrmirror.org/files/music/remixes/Gargoyle''s_Quest_Gargoyle_on_Broadway_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1249,'From Within','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-09T15:57:29.166349+00:00','https://www.youtube.com/watch?v=ja6hIEi8iZo',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_From_Within_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1250,'Tidal Sequence','Secret of Mana','2026-08-09T15:57:30.465603+00:00','https://www.youtube.com/watch?v=NdJg9nsOULk',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Tidal_Sequence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1251,'Blue (Shooting Star Mix)','Terranigma','2026-08-09T15:57:29.787563+00:00','https://www.youtube.com/watch?v=YPGaQjQ1NaY',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Blue_(Shooting_Star_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1252,'The Alternate Route','Super Mario 64','2026-08-09T19:57:25.088037+00:00','https://www.youtube.com/watch?v=VLFXugmVYT8',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_The_Alternate_Route_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1253,'Fight On','Final Fantasy VII','2026-08-09T19:57:24.031670+00:00','https://www.youtube.com/watch?v=t_a5NesMVV4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Fight_On_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1254,'Club del Toro','Street Fighter II: The World Warrior','2026-08-09T17:04:06.791796+00:00','https://www.youtube.com/watch?v=VMl7Ll9iaMs',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Club_del_Toro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1255,'Oedo Hop','The Legend of the Mystical Ninja','2026-08-09T10:04:33.008249+00:00','https://www.youtube.com/watch?v=4zS9C124M_M',161,'https://ocrmirror.org/files/music/remixes/Legend_of_the_Mystical_Ninja_Oedo_Hop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1256,'Cry of the Chasmal Critter Chain','Donkey Kong Country','2026-08-09T23:58:13.624024+00:00','https://www.youtube.com/watch?v=OoYlerx9Ymo',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Cry_of_the_Chasmal_Critter_Chain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1257,'Chopinesque Kirby','Kirby''s Dream Land','2026-08-09T22:59:35.303289+00:00','https://www.youtube.com/watch?v=FEZ-wKmk1fg',234,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_Chopinesque_Kirby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1258,'When All Hope Has Faded','Chrono Trigger','2026-08-10T06:50:58.013066+00:00','https://www.youtube.com/watch?v=Qrc5L-vrqMc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_When_All_Hope_Has_Faded_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1259,'Pools of Rust','Castlevania III: Dracula''s Curse','2026-08-09T15:57:29.994209+00:00','https://www.youtube.com/watch?v=4jDlN0Th370',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Pools_of_Rust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1260,'Philharmonic Suite: Finale','Final Fantasy VII','2026-08-09T19:11:01.717921+00:00','https://www.youtube.com/watch?v=9PaR8NNqYxY',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Philharmonic_Suite_Finale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1261,'Eternal Abyss','Ecco the Dolphin','2026-08-09T17:04:05.918463+00:00','https://www.youtube.com/watch?v=wspO6SfqCo8',415,'https://ocrmirror.org/files/music/remixes/Ecco_the_Dolphin_Eternal_Abyss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1262,'Ghost','Super Mario World','2026-08-09T21:02:01.924389+00:00','https://www.youtube.com/watch?v=VXuMIUcnFd8',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Ghost_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1263,'Dolls from Hell','The 7th Guest','2026-08-09T13:30:20.137035+00:00','https://www.youtube.com/watch?v=sB1yBbcK1rE',836,'https://ocrmirror.org/files/music/remixes/7th_Guest_Dolls_from_Hell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1264,'LiquidX','X-Out','2026-08-09T15:00:48.091305+00:00','https://www.youtube.com/watch?v=D82ypujAr78',416,'https://ocrmirror.org/files/music/remixes/X-Out_LiquidX_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1265,'Mean Streak on Main Street','Double Dragon II: The Revenge','2026-08-09T23:58:13.277317+00:00','https://www.youtube.com/watch?v=iY2uA3Iy_3A',417,'https://ocrmirror.org/files/music/remixes/Double_Dragon_2_Mean_Streak_on_Main_Street_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1266,'The Ken Song','Street Fighter II: The World Warrior','2026-08-10T08:56:58.418701+00:00','https://www.youtube.com/watch?v=iEpucWDZZL0',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_The_Ken_Song_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1267,'Hunter''s Community Chest','Final Fantasy IX','2026-08-09T22:59:36.135720+00:00','https://www.youtube.com/watch?v=_pjKTAhq9WY',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Hunter''s_Community_Chest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1268,'Cliff the Great Crusader','Suikoden','2026-08-09T17:04:06.442855+00:00','https://www.youtube.com/watch?v=NMuZrSFuFbY',316,'https://ocrmirror.org/files/music/remixes/Suikoden_Cliff_the_Great_Crusader_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1269,'A New Ray of Light','Sonic the Hedgehog: Triple Trouble','2026-08-09T17:58:38.635567+00:00','https://www.youtube.com/watch?v=2TQqXifhfHc',418,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Triple_Trouble_A_New_Ray_of_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1270,'Wrestling with Double Bass','Street Fighter II: The World Warrior','2026-08-09T15:00:48.438581+00:00','https://www.youtube.com/watch?v=kWGd7EAS5Qs',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Wrestling_with_Double_Bass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1271,'Boss Uniform','Phantasy Star II','2026-08-09T11:55:36.665305+00:00','https://www.youtube.com/watch?v=uDbSsgc4ZMA',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_Boss_Uniform_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1272,'Thrash the Plank','Donkey Kong Country','2026-08-09T19:57:25.438151+00:00','https://www.youtube.com/watch?v=WMsiSw2ELlg',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Thrash_the_Plank_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1273,'Reviving Zue','Terranigma','2026-08-09T22:59:36.275998+00:00','https://www.youtube.com/watch?v=OmKHy6NH8Ns',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Reviving_Zue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1274,'The Frontier','Chrono Trigger','2026-08-09T21:02:02.447374+00:00','https://www.youtube.com/watch?v=Dahz-UzSKHc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Frontier_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1275,'Infinite Natalie','Front Mission','2026-08-09T15:00:47.917791+00:00','https://www.youtube.com/watch?v=zJ9YE9zNYcA',419,'https://ocrmirror.org/files/music/remixes/Front_Mission_Infinite_Natalie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1276,'Set Sail','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-09T23:58:12.925908+00:00','https://www.youtube.com/watch?v=HykjFjvMzIk',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Set_Sail_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1277,'Invertebrate Retreat','Earthworm Jim 2','2026-08-10T10:42:48.151670+00:00','https://www.youtube.com/watch?v=wRxOGlnMtvU',189,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_2_Invertebrate_Retreat_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1278,'Fei Longer','Super Street Fighter II: The New Challengers','2026-08-09T19:11:01.580664+00:00','https://www.youtube.com/watch?v=_EHf1mngTg4',143,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Fei_Longer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1279,'The Siege of Kenilworth Castle','Lords of the Realm II','2026-08-09T19:57:25.263135+00:00','https://www.youtube.com/watch?v=VlAAL_qcxSQ',420,'https://ocrmirror.org/files/music/remixes/Lords_of_the_Realm_2_The_Siege_of_Kenilworth_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1280,'Waste Water Wipeout','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-10T02:40:33.296611+00:00','https://www.youtube.com/watch?v=F7PJEVfcJys',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Waste_Water_Wipeout_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1281,'The Grief of Aktemto','Dragon Warrior IV','2026-08-09T17:58:38.463003+00:00','https://www.youtube.com/watch?v=clHSlCfbejs',422,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_4_The_Grief_of_Aktemto_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1282,'The Wolf of the Opera','Killer Instinct','2026-08-09T15:57:30.698295+00:00','https://www.youtube.com/watch?v=aOLYBNaTnAo',122,'https://ocrmirror.org/files/music/remixes/Killer_Instinct_The_Wolf_of_the_Opera_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1283,'Dazed & Destroyed','Dance Dance Revolution Solo 2000','2026-08-09T22:59:36.555122+00:00','https://www.youtube.com/watch?v=J8aXE-qyJMc',423,'https://ocrmirror.org/files/music/remixes/Dance_Dance_Revolution_Solo_2000_Dazed_&_Destroyed_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1284,'Aftershock','Soukaigi','2026-08-09T17:58:39.314275+00:00','https://www.youtube.com/watch?v=ZdJmFG-2M6I',424,'https://ocrmirror.org/files/music/remixes/Soukaigi_Aftershock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1285,'Clairvoyant Elegy','Final Doom','2026-08-09T22:59:35.582296+00:00','https://www.youtube.com/watch?v=8nD_hl5AcsA',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_Clairvoyant_Elegy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1286,'Just a Little More (Prime Edit)','Metroid Prime','2026-08-10T02:40:33.645997+00:00','https://www.youtube.com/watch?v=AsPeMixPtTw',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Just_a_Little_More_(Prime_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1287,'Etude for Piano in F# minor','Fire Emblem: Shadow Dragon and the Blade of Light','2026-08-09T23:58:14.145046+00:00','https://www.youtube.com/watch?v=GERiBpjf8ug',426,'https://ocrmirror.org/files/music/remixes/Fire_Emblem_Etude_for_Piano_in_F-sharp_minor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1288,'Sacratus Bellator','Chrono Trigger','2026-08-10T02:40:32.066621+00:00','https://www.youtube.com/watch?v=7tT01nos69M',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Sacratus_Bellator_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1289,'Mucho Dollar Care a Junk CIA','Akumajo Dracula','2026-08-09T15:57:30.132505+00:00','https://www.youtube.com/watch?v=vbRT-fXdIgE',427,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_Mucho_Dollar_Care_a_Junk_CIA_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1290,'Duck Blur','DuckTales','2026-08-09T23:58:14.317709+00:00','https://www.youtube.com/watch?v=VLA0V0wxh_E',50,'https://ocrmirror.org/files/music/remixes/DuckTales_Duck_Blur_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1291,'Anthem of a Metroid Hunter','Metroid II: Return of Samus','2026-08-10T02:40:32.774273+00:00','https://www.youtube.com/watch?v=Whvu6uyPoXo',202,'https://ocrmirror.org/files/music/remixes/Metroid_2_Anthem_of_a_Metroid_Hunter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1292,'Cerebral Rose Jam','Shivers','2026-08-09T19:57:24.208310+00:00','https://www.youtube.com/watch?v=9BGUDapnWZI',428,'https://ocrmirror.org/files/music/remixes/Shivers_Cerebral_Rose_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1293,'Clouded Mind and Ringing Ears','Donkey Kong Country','2026-08-09T21:02:02.098865+00:00','https://www.youtube.com/watch?v=cnHP8OmxEx0',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Clouded_Mind_and_Ringing_Ears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1294,'4:20 AM','Crack Down','2026-08-09T17:04:05.390681+00:00','https://www.youtube.com/watch?v=JVDFd_uZNv8',429,'https://ocrmirror.org/files/music/remixes/Crack_Down_4-20_AM_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1295,'Aeris Lives','Final Fantasy VII','2026-08-10T06:50:57.487867+00:00','https://www.youtube.com/watch?v=GmqlgXF0g7Q',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Aeris_Lives_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1296,'Wing Theme Surf','Wing Commander','2026-08-09T23:58:13.972025+00:00','https://www.youtube.com/watch?v=T7e118bWaKM',430,'https://ocrmirror.org/files/music/remixes/Wing_Commander_Wing_Theme_Surf_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1297,'Shaolin''s Cave','Super Castlevania IV','2026-08-09T17:58:38.121148+00:00','https://www.youtube.com/watch?v=ESzrDhgZhWs',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Shaolin''s_Cave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1298,'Predetermination','Chrono Trigger','2026-08-09T22:59:36.415986+00:00','https://www.youtube.com/watch?v=0KY9_St1Mag',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Predetermination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1299,'Tuatara Swamp Jam','Commander Keen IV: Secret of the Oracle','2026-08-09T21:02:02.274086+00:00','https://www.youtube.com/watch?v=CfKhapIXQ4g',400,'https://ocrmirror.org/files/music/remixes/Commander_Keen_4_Tuatara_Swamp_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1300,'Against the Rest','Super C','2026-08-09T17:58:38.805489+00:00','https://www.youtube.com/watch?v=ZSKZFJ6c-nc',431,'https://ocrmirror.org/files/music/remixes/Super_C_Against_the_Rest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1301,'Down in the Dungeon Just Creatures and Me','Shining in the Darkness','2026-08-09T17:58:37.945739+00:00','https://www.youtube.com/watch?v=f7eFwDuW0O8',432,'https://ocrmirror.org/files/music/remixes/Shining_in_the_Darkness_Down_in_the_Dungeon_Just_Creatures_and_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1302,'Advance with Caution','Bionic Commando','2026-08-09T21:02:01.749106+00:00','https://www.youtube.com/watch?v=Wx6XJfslp28',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Advance_with_Caution_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1303,'Gifts of Mana','Final Fantasy Adventure','2026-08-09T17:58:38.291596+00:00','https://www.youtube.com/watch?v=idORjd4-ew4',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Gifts_of_Mana_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1304,'Battle on a New Continent','Final Fantasy VI','2026-08-10T08:56:58.061563+00:00','https://www.youtube.com/watch?v=V2fmOE5aRFE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Battle_on_a_New_Continent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1305,'Dirty Sam','Super Metroid','2026-08-10T02:40:33.123155+00:00','https://www.youtube.com/watch?v=Moaza1_30e0',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Dirty_Sam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1306,'Ascension to Cosmo Canyon','Final Fantasy VII','2026-08-10T08:56:59.325140+00:00','https://www.youtube.com/watch?v=af27aTI7j2M',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Ascension_to_Cosmo_Canyon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1307,'Chekan Winter','Donkey Kong Country','2026-08-10T05:05:08.781214+00:00','https://www.youtube.com/watch?v=sxjiM67q3Pk',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Chekan_Winter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1308,'A Nightmare Before Kefka','Final Fantasy VI','2026-08-10T02:40:32.949575+00:00','https://www.youtube.com/watch?v=jGmEPp28QOg',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_A_Nightmare_Before_Kefka_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1309,'Return of the Phoenix','Final Fantasy VI','2026-08-09T22:59:35.720466+00:00','https://www.youtube.com/watch?v=rrmyQ29KbtM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Return_of_the_Phoenix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1310,'The Sveldt','Final Fantasy VI','2026-08-10T10:42:47.643948+00:00','https://www.youtube.com/watch?v=F51k-x-dbWs',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Sveldt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1311,'Fleeting Ecstasy','Super Mario 64','2026-08-10T08:56:59.501986+00:00','https://www.youtube.com/watch?v=q4K_tYVtnFU',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Fleeting_Ecstasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1312,'Seneca''s Marble Pack Edit','Stormlord','2026-08-10T05:05:09.128067+00:00','https://www.youtube.com/watch?v=YljMDQqECWE',221,'https://ocrmirror.org/files/music/remixes/Stormlord_Seneca''s_Marble_Pack_Edit_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1313,'Funky Monkey Love (Valentine Edit)','Donkey Kong Country','2026-08-09T19:57:24.912060+00:00','https://www.youtube.com/watch?v=V4dNX98mKDU',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Funky_Monkey_Love_(Valentine_Edit)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1314,'The Dark Before the Dawn','Chrono Trigger','2026-08-09T19:11:01.032090+00:00','https://www.youtube.com/watch?v=AMN6fPl6Gs0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Dark_Before_the_Dawn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1315,'Sol Sanctum Guitar','Golden Sun','2026-08-09T23:58:13.103821+00:00','https://www.youtube.com/watch?v=fFKPL1nq2QQ',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Sol_Sanctum_Guitar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1316,'Stranger in the Desert','Mega Man Zero 2','2026-08-10T13:55:02.305109+00:00','https://www.youtube.com/watch?v=dIrUk_NL7TU',434,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_2_Stranger_in_the_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1317,'Cursed Bloodline','Castlevania II: Simon''s Quest','2026-08-10T15:29:52.171471+00:00','https://www.youtube.com/watch?v=zQkbLSrChfs',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Cursed_Bloodline_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1318,'Symphonic Ballade','The Legend of Zelda: Link''s Awakening','2026-08-10T02:40:32.598298+00:00','https://www.youtube.com/watch?v=ouCGAjWi9s4',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Symphonic_Ballade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1319,'Xenosphere','Xenogears','2026-08-10T08:56:59.147344+00:00','https://www.youtube.com/watch?v=Wb50enYWFDc',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Xenosphere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1320,'Blue Wizard Is About to Die','Gauntlet III: The Final Quest','2026-08-09T19:57:24.385209+00:00','https://www.youtube.com/watch?v=AmEVT7HpK9s',435,'https://ocrmirror.org/files/music/remixes/Gauntlet_3_Blue_Wizard_Is_About_to_Die_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1321,'Ashtar''s Desires','Ninja Gaiden II: The Dark Sword of Chaos','2026-08-09T22:59:35.997486+00:00','https://www.youtube.com/watch?v=g7ALtFZEBcM',135,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_2_Ashtar''s_Desires_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1322,'Legend of the Snake','Metal Gear Solid','2026-08-10T08:56:58.969356+00:00','https://www.youtube.com/watch?v=TA5dyJevpiY',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_Legend_of_the_Snake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1323,'Limitless Skies','Space Harrier','2026-08-09T21:02:01.214904+00:00','https://www.youtube.com/watch?v=47o2Wf0kkiw',97,'https://ocrmirror.org/files/music/remixes/Space_Harrier_Limitless_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1324,'Tomorrow''s Wake','Sonic & Knuckles','2026-08-10T06:50:58.363016+00:00','https://www.youtube.com/watch?v=XKYPfgRNDjI',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Tomorrow''s_Wake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1325,'New Beginnings','Kingdom Hearts','2026-08-09T21:02:00.862735+00:00','https://www.youtube.com/watch?v=Ur0jFbKwUNY',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_New_Beginnings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1326,'The Desert Rocks vs. Concerto for Laser and Enemies','Turrican II: The Final Fight','2026-08-10T02:40:32.246935+00:00','https://www.youtube.com/watch?v=ZMWLe56vMnU',227,'https://ocrmirror.org/files/music/remixes/Turrican_2_The_Desert_Rocks_vs_Concerto_for_Laser_and_Enemies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1327,'sonik metro','Sonic the Hedgehog 2','2026-08-10T10:42:47.119921+00:00','https://www.youtube.com/watch?v=CAGA4yR6Ptc',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_sonik_metro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1328,'Bowser Is Pissed','Super Mario Bros.','2026-08-10T13:55:02.128797+00:00','https://www.youtube.com/watch?v=L5NurUkRObc',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Bowser_Is_Pissed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1329,'Oxygen Flare','Mega Man 2','2026-08-10T05:05:08.954834+00:00','https://www.youtube.com/watch?v=40tktbplegI',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Oxygen_Flare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1330,'The Haunted Train Disco','Final Fantasy VI','2026-08-10T06:50:57.312716+00:00','https://www.youtube.com/watch?v=uwKEclYr6-k',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Haunted_Train_Disco_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1331,'Shadows Among the Ruins','Final Fantasy VI','2026-08-10T06:50:57.838114+00:00','https://www.youtube.com/watch?v=ZwMqwbnwsII',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Shadows_Among_the_Ruins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1332,'Grand Valse Mario','Super Mario World','2026-08-10T10:42:46.777548+00:00','https://www.youtube.com/watch?v=Wm6QvoM8vCQ',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Grand_Valse_Mario_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1333,'Prayer','The Legend of Zelda: Ocarina of Time','2026-08-10T15:29:51.998943+00:00','https://www.youtube.com/watch?v=XPZe3OTiJyg',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Prayer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1334,'The Devil Inside (Italo Disco Mix)','Castlevania: Symphony of the Night','2026-08-09T23:58:13.452413+00:00','https://www.youtube.com/watch?v=9ni1TpeafTM',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_The_Devil_Inside_(Italo_Disco_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1335,'Aquamarine','Terranigma','2026-08-10T06:50:57.662879+00:00','https://www.youtube.com/watch?v=l8v51IPEENo',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Aquamarine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1336,'NightTime Evolution','Secret of Mana','2026-08-10T08:56:58.776668+00:00','https://www.youtube.com/watch?v=LTIASBsQemU',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_NightTime_Evolution_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1337,'sierra nevada-tan','Road Rash','2026-08-10T05:05:08.609410+00:00','https://www.youtube.com/watch?v=nYTINfrtW7M',436,'https://ocrmirror.org/files/music/remixes/Road_Rash_sierra_nevada-tan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1338,'Cool Mind','Mega Man Zero 2','2026-08-10T12:07:47.958310+00:00','https://www.youtube.com/watch?v=6zc25sUzr-o',434,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_2_Cool_Mind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1339,'Warriors of Light','Final Fantasy','2026-08-09T21:02:01.397574+00:00','https://www.youtube.com/watch?v=F-XK09vh5fU',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Warriors_of_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1340,'Path-ology','Seiken Densetsu 3','2026-08-10T05:05:09.301478+00:00','https://www.youtube.com/watch?v=q_42HYLIH3Q',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Path-ology_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1341,'On the Day the World Changed...','Secret of Mana','2026-08-10T18:22:18.055599+00:00','https://www.youtube.com/watch?v=0KjyKViQSEc',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_On_the_Day_the_World_Changed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1342,'Chauffage au Gaz','Final Fantasy X-2','2026-08-10T15:29:52.860773+00:00','https://www.youtube.com/watch?v=kAK6epLf6II',438,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10-2_Chauffage_au_Gaz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1343,'A Whisper and a Shadow','Secret of Evermore','2026-08-09T22:59:35.442832+00:00','https://www.youtube.com/watch?v=00Q63x9I-hU',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_A_Whisper_and_a_Shadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1344,'Chasing the Phoenix','Xenogears','2026-08-10T17:24:49.253122+00:00','https://www.youtube.com/watch?v=H39GXA6RpeI',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Chasing_the_Phoenix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1345,'Ninjascape','Ninja Gaiden II: The Dark Sword of Chaos','2026-08-09T22:59:35.858765+00:00','https://www.youtube.com/watch?v=znclJua7Q_U',135,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_2_Ninjascape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1346,'Live at the Springyard','Sonic the Hedgehog','2026-08-10T18:22:17.520884+00:00','https://www.youtube.com/watch?v=7C4MuCuXsiE',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Live_at_the_Springyard_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1347,'Wanka Factory','Ghosts''n Goblins','2026-08-10T12:07:47.614303+00:00','https://www.youtube.com/watch?v=GOE0Zu6AFgk',119,'https://ocrmirror.org/files/music/remixes/Ghosts''n_Goblins_Wanka_Factory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1348,'Three Mushroom Dances','Super Mario RPG: Legend of the Seven Stars','2026-08-10T12:07:47.440183+00:00','https://www.youtube.com/watch?v=HZonvyYjyY4',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Three_Mushroom_Dances_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1349,'Everything = Nothing','Final Fantasy VIII','2026-08-10T16:25:20.504356+00:00','https://www.youtube.com/watch?v=5A3gO4Oy7iA',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Everything_Equals_Nothing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1350,'Memories Frozen in Time','Sonic the Hedgehog 3','2026-08-11T00:00:15.844683+00:00','https://www.youtube.com/watch?v=HUOSknSaGX0',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Memories_Frozen_in_Time_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1351,'J! Groove','Double Dragon III: The Sacred Stones','2026-08-10T02:40:32.421941+00:00','https://www.youtube.com/watch?v=vG21PvSx5jk',439,'https://ocrmirror.org/files/music/remixes/Double_Dragon_3_J_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1352,'Harvest Hoedown','Final Fantasy V','2026-08-10T08:56:57.878413+00:00','https://www.youtube.com/watch?v=PWv8j7s1m50',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Harvest_Hoedown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1353,'The Sky Was Never a Limit','Final Fantasy IV','2026-08-10T16:25:20.676153+00:00','https://www.youtube.com/watch?v=_6O7IDublCU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Sky_Was_Never_a_Limit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1354,'Insurrection','Halo: Combat Evolved','2026-08-10T08:56:58.597250+00:00','https://www.youtube.com/watch?v=FhqeldSa-Xg',393,'https://ocrmirror.org/files/music/remixes/Halo_Insurrection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1355,'Snow Field','Contra','2026-08-10T02:40:33.471350+00:00','https://www.youtube.com/watch?v=hWqWXsRbYV0',21,'https://ocrmirror.org/files/music/remixes/Contra_Snow_Field_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1356,'Seized with Fury','Final Fantasy VI','2026-08-10T17:24:49.077354+00:00','https://www.youtube.com/watch?v=Jq6L_pFupEA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Seized_with_Fury_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1357,'Under a New Moon','Final Fantasy X-2','2026-08-10T10:42:47.813719+00:00','https://www.youtube.com/watch?v=KQdEXSLxjd8',438,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10-2_Under_a_New_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1358,'Little Painter Girl','Final Fantasy VI','2026-08-10T05:05:08.263756+00:00','https://www.youtube.com/watch?v=Y3U0GixILKA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Little_Painter_Girl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1359,'Moon Dust','Dark Cloud','2026-08-10T06:50:57.136801+00:00','https://www.youtube.com/watch?v=dmjxkLq71qA',320,'https://ocrmirror.org/files/music/remixes/Dark_Cloud_Moon_Dust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1360,'Deadly Promises','Final Fantasy VI','2026-08-10T15:29:51.827338+00:00','https://www.youtube.com/watch?v=8XdzuTYmz6U',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Deadly_Promises_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1361,'Fortuna Favors the Funk','Star Fox','2026-08-10T16:25:21.364995+00:00','https://www.youtube.com/watch?v=xfWf-Ek8mCA',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Fortuna_Favors_the_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1362,'Ein Anderer Abschied','Xenosaga: Episode I: Der Wille zur Macht','2026-08-10T12:07:47.266632+00:00','https://www.youtube.com/watch?v=1SEheHMhtIM',440,'https://ocrmirror.org/files/music/remixes/Xenosaga_Episode_1_Ein_Anderer_Abschied_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1363,'Beyond Midgar','Final Fantasy VII','2026-08-10T13:55:01.596335+00:00','https://www.youtube.com/watch?v=-L010ikbRdI',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Beyond_Midgar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1364,'Anthem of a Misguided Youth','The Legend of Zelda: Ocarina of Time','2026-08-10T21:12:01.722796+00:00','https://www.youtube.com/watch?v=TD_uNl7fojc',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Anthem_of_a_Misguided_Youth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1365,'Marble Dash','Sonic the Hedgehog','2026-08-10T17:24:48.727569+00:00','https://www.youtube.com/watch?v=cinznaCMQYs',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Marble_Dash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1366,'Flurry of Frozen Fury','Mega Man 6','2026-08-10T13:55:02.837542+00:00','https://www.youtube.com/watch?v=visWU1xk3gQ',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Flurry_of_Frozen_Fury_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1367,'Mix Dizz','Dizzy the Adventurer','2026-08-10T13:55:03.015241+00:00','https://www.youtube.com/watch?v=3lXyZIQLkJ0',441,'https://ocrmirror.org/files/music/remixes/Dizzy_the_Adventurer_Mix_Dizz_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1368,'Bust This Groove ''81','Bust a Groove','2026-08-10T16:25:21.192727+00:00','https://www.youtube.com/watch?v=rDsn7bvwm24',182,'https://ocrmirror.org/files/music/remixes/Bust_a_Groove_Bust_This_Groove_''81_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1369,'Cosmic Transformations','Kirby''s Adventure','2026-08-10T18:22:18.243656+00:00','https://www.youtube.com/watch?v=GDHavKqHpco',442,'https://ocrmirror.org/files/music/remixes/Kirby''s_Adventure_Cosmic_Transformations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1370,'The Sad Fish','The Legend of Zelda: Link''s Awakening','2026-08-10T06:50:58.187499+00:00','https://www.youtube.com/watch?v=lGajpX2yiMI',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_The_Sad_Fish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1371,'Battling Organs','EarthBound','2026-08-10T19:30:04.278689+00:00','https://www.youtube.com/watch?v=qJWE57HezR8',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Battling_Organs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1372,'Shattered','Shatterhand','2026-08-10T15:29:51.646063+00:00','https://www.youtube.com/watch?v=gP1vPijosDI',443,'https://ocrmirror.org/files/music/remixes/Shatterhand_Shattered_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1373,'Neo-Pacificist','Marathon','2026-08-10T12:07:46.746440+00:00','https://www.youtube.com/watch?v=krCqYP2HeTw',444,'https://ocrmirror.org/files/music/remixes/Marathon_Neo-Pacificist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1374,'The Father of All','Mega Man X4','2026-08-10T16:25:21.021324+00:00','https://www.youtube.com/watch?v=hjPiKUMuSaw',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_The_Father_of_All_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1375,'Quick Fix','Final Doom','2026-08-10T10:42:47.303701+00:00','https://www.youtube.com/watch?v=pp-YPmmRbRo',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_Quick_Fix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1376,'Lava Reach','Sonic & Knuckles','2026-08-10T18:22:18.419872+00:00','https://www.youtube.com/watch?v=zfus3YXKmmQ',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Lava_Reach_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1377,'Atonement','Chrono Trigger','2026-08-10T20:10:11.911352+00:00','https://www.youtube.com/watch?v=Nm53E2s6lj0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Atonement_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1378,'Salsa Snake','Metal Gear Solid 2: Sons of Liberty','2026-08-10T10:42:47.474275+00:00','https://www.youtube.com/watch?v=sIZcgbJP99c',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Salsa_Snake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1379,'Club Showdown','Unreal Tournament','2026-08-10T15:29:51.471243+00:00','https://www.youtube.com/watch?v=wj0_i4Jgk8E',445,'https://ocrmirror.org/files/music/remixes/Unreal_Tournament_Club_Showdown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1380,'Rare Mineral Addict','Landstalker: The Treasures of King Nole','2026-08-10T15:29:53.032928+00:00','https://www.youtube.com/watch?v=-ZqX7tuzaT4',446,'https://ocrmirror.org/files/music/remixes/Landstalker_Rare_Mineral_Addict_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1381,'Journey''s End','Final Fantasy X','2026-08-10T23:06:05.810442+00:00','https://www.youtube.com/watch?v=xvbr0CF4dms',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Journey''s_End_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1382,'Bando alle Seghe','The Human Race','2026-08-10T16:25:19.987541+00:00','https://www.youtube.com/watch?v=4DF9qhgQ-pU',447,'https://ocrmirror.org/files/music/remixes/Human_Race_Bando_alle_Seghe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1383,'Starman (don''t lose yourself)','DarXide','2026-08-10T21:12:01.546386+00:00','https://www.youtube.com/watch?v=jmE0xxNTzdQ',448,'https://ocrmirror.org/files/music/remixes/DarXide_Starman_(don''t_lose_yourself)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1384,'Basilisk Run','Ninja Gaiden','2026-08-10T12:07:46.919687+00:00','https://www.youtube.com/watch?v=l-pI-1E9Pic',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Basilisk_Run_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1385,'Purgatory','Doom','2026-08-10T16:25:21.537572+00:00','https://www.youtube.com/watch?v=2LmwGPtVnmc',14512,'https://ocrmirror.org/files/music/remixes/Doom_Purgatory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1386,'To Times Once Forgotten','Chrono Cross','2026-08-10T16:25:20.333109+00:00','https://www.youtube.com/watch?v=rQQKXn4uMsg',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_To_Times_Once_Forgotten_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1387,'The Dark Side of Phobos','Doom','2026-08-10T19:30:04.456208+00:00','https://www.youtube.com/watch?v=Jha31UGeyps',14512,'https://ocrmirror.org/files/music/remixes/Doom_The_Dark_Side_of_Phobos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1388,'Summertime','Star Ocean','2026-08-10T18:22:17.345241+00:00','https://www.youtube.com/watch?v=3seSE6dxaU0',376,'https://ocrmirror.org/files/music/remixes/Star_Ocean_Summertime_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1389,'Fury of Medusa','Ecco: The Tides of Time','2026-08-10T08:56:58.240325+00:00','https://www.youtube.com/watch?v=KNiEjEHifgg',364,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Fury_of_Medusa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1390,'Energy Tank','Super Metroid','2026-08-10T16:25:20.161154+00:00','https://www.youtube.com/watch?v=M9ovPV075oc',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Energy_Tank_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1391,'Moontang','Final Fantasy VIII','2026-08-10T19:30:03.747124+00:00','https://www.youtube.com/watch?v=B1aaSUCtSA8',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Moontang_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1392,'Static Wonderland','Tsugunai: Atonement','2026-08-10T18:22:17.880606+00:00','https://www.youtube.com/watch?v=75z-FwbZE1U',449,'https://ocrmirror.org/files/music/remixes/Tsugunai_Static_Wonderland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1393,'Catapult','Sonic & Knuckles','2026-08-10T22:06:35.233899+00:00','https://www.youtube.com/watch?v=hd8sAPGOvX4',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Catapult_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1394,'Corner of Sunset and Keys','The Revenge of Shinobi','2026-08-10T10:42:46.605129+00:00','https://www.youtube.com/watch?v=bj2CwxfQfvk',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_Corner_of_Sunset_and_Keys_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1395,'Dublin Delight','Artura','2026-08-10T22:06:35.056180+00:00','https://www.youtube.com/watch?v=RBBc_FnXK2Y',450,'https://ocrmirror.org/files/music/remixes/Artura_Dublin_Delight_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1396,'Ghosts of Mars','Doom','2026-08-10T19:30:04.632464+00:00','https://www.youtube.com/watch?v=LNwK5jRNUR8',14512,'https://ocrmirror.org/files/music/remixes/Doom_Ghosts_of_Mars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1397,'The Monsaic','Oddworld: Abe''s Oddysee','2026-08-10T10:42:46.947481+00:00','https://www.youtube.com/watch?v=v2HgbVA6LQg',451,'https://ocrmirror.org/files/music/remixes/Oddworld_Abe''s_Oddysee_The_Monsaic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1398,'The Legend of Lightning Larry','The Guardian Legend','2026-08-10T17:24:48.023046+00:00','https://www.youtube.com/watch?v=Zf7XUvQ0Ato',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_The_Legend_of_Lightning_Larry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1399,'Electrolytic Man','Mega Man','2026-08-10T17:24:48.199012+00:00','https://www.youtube.com/watch?v=as9LnYqUt7w',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Electrolytic_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1400,'It''s My Turn to Dream','The Legend of Zelda: Link''s Awakening','2026-08-11T02:34:31.266625+00:00','https://www.youtube.com/watch?v=xT6clbhifxA',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_It''s_My_Turn_to_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1401,'A Clockwork Vampire','Castlevania III: Dracula''s Curse','2026-08-10T20:10:12.265163+00:00','https://www.youtube.com/watch?v=-voj3f6VKDk',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_A_Clockwork_Vampire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1402,'The Ballad of Sir Kibbles','Kirby''s Adventure','2026-08-10T19:30:05.165425+00:00','https://www.youtube.com/watch?v=JVFo7ZBU89U',442,'https://ocrmirror.org/files/music/remixes/Kirby''s_Adventure_The_Ballad_of_Sir_Kibbles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1403,'Glass Cage','Pac-Man','2026-08-10T22:06:35.410665+00:00','https://www.youtube.com/watch?v=6QBwvs1O3SU',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_Glass_Cage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1404,'Dragon Song','Secret of Mana','2026-08-11T06:27:01.396486+00:00','https://www.youtube.com/watch?v=B8AGE47TM4s',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Dragon_Song_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1405,'Pegasus Boots','Solstice: The Quest for the Staff of Demnos','2026-08-10T18:22:17.697353+00:00','https://www.youtube.com/watch?v=oKgu77JZ03I',452,'https://ocrmirror.org/files/music/remixes/Solstice_Pegasus_Boots_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1406,'Mercenarios de Lobo','Star Fox 2','2026-08-10T19:30:03.925546+00:00','https://www.youtube.com/watch?v=_gWbI0WxaHU',453,'https://ocrmirror.org/files/music/remixes/Star_Fox_2_Mercenarios_de_Lobo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1407,'Wicked Six','Castlevania','2026-08-10T17:24:48.376621+00:00','https://www.youtube.com/watch?v=QXz_4LOkQhE',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Wicked_Six_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1408,'Ten Rupees','The Legend of Zelda: A Link to the Past','2026-08-10T17:24:48.551045+00:00','https://www.youtube.com/watch?v=MBKRT_5XlCo',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Ten_Rupees_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1409,'Odyssey Beyond the Falls','Mega Man 6','2026-08-10T13:55:02.482227+00:00','https://www.youtube.com/watch?v=Bm-QAZh5-Jk',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Odyssey_Beyond_the_Falls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1410,'Revelation','Descent II','2026-08-10T20:10:13.491686+00:00','https://www.youtube.com/watch?v=d1-6w-aatZg',454,'https://ocrmirror.org/files/music/remixes/Descent_2_Revelation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1411,'Watermelon Flava','Breath of Fire III','2026-08-10T20:10:13.142447+00:00','https://www.youtube.com/watch?v=IbtMt6CaKlI',455,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_3_Watermelon_Flava_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1412,'River Styx','Final Doom','2026-08-10T15:29:52.514965+00:00','https://www.youtube.com/watch?v=yYTL185VknA',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_River_Styx_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1413,'Piano Concerto in A minor','Tetris','2026-08-10T20:10:12.789497+00:00','https://www.youtube.com/watch?v=Akw-b0P4mKY',510,'https://ocrmirror.org/files/music/remixes/Tetris_Piano_Concerto_in_A_minor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1414,'Memories from the Wind Scene','Chrono Trigger','2026-08-10T22:06:35.766598+00:00','https://www.youtube.com/watch?v=aqYHSS_PzVU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Memories_from_the_Wind_Scene_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1415,'Greater Alchemic Patchwork','Final Fantasy VI','2026-08-10T21:12:02.087827+00:00','https://www.youtube.com/watch?v=P4h_Iujghjc',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Greater_Alchemic_Patchwork_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1416,'Cryptic Marble','Sonic the Hedgehog','2026-08-10T22:06:35.588812+00:00','https://www.youtube.com/watch?v=Li3D9YqpTYs',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Cryptic_Marble_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1417,'Nayru''s Love','The Legend of Zelda: Oracle of Ages','2026-08-10T22:06:36.299616+00:00','https://www.youtube.com/watch?v=4MiEJa9LbjE',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Nayru''s_Love_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1418,'The Fifth Season','Mega Man 2','2026-08-10T16:25:20.849394+00:00','https://www.youtube.com/watch?v=sh-LPT_fNb0',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Fifth_Season_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1419,'Smooth Delivery','Paperboy','2026-08-10T20:10:12.967497+00:00','https://www.youtube.com/watch?v=wJJ1HC9dcHo',206,'https://ocrmirror.org/files/music/remixes/Paperboy_Smooth_Delivery_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1420,'The Mother Is in Control','Super Metroid','2026-08-10T19:30:04.810424+00:00','https://www.youtube.com/watch?v=ttdlkEfPRno',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_The_Mother_Is_in_Control_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1421,'Dreamwalker','Alundra','2026-08-10T13:55:01.950741+00:00','https://www.youtube.com/watch?v=S_hSyk_HJJA',457,'https://ocrmirror.org/files/music/remixes/Alundra_Dreamwalker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1422,'Hyrule Wimbledon','The Legend of Zelda: The Wind Waker','2026-08-10T17:24:49.604571+00:00','https://www.youtube.com/watch?v=KtTXXLA2X70',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Hyrule_Wimbledon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1423,'SnowBound','EarthBound','2026-08-10T23:06:05.639171+00:00','https://www.youtube.com/watch?v=44Bvchh0p2I',51,'https://ocrmirror.org/files/music/remixes/EarthBound_SnowBound_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1424,'Da Black Market','EarthBound','2026-08-11T11:19:22.521007+00:00','https://www.youtube.com/watch?v=MpqaVHx-tW4',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Da_Black_Market_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1425,'Aquatic Pressure','Sonic the Hedgehog 3','2026-08-10T22:06:36.476448+00:00','https://www.youtube.com/watch?v=OmKzOXOGQMk',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Aquatic_Pressure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1426,'Clash at the Mountains','The Legend of Zelda: Link''s Awakening','2026-08-10T20:10:12.615813+00:00','https://www.youtube.com/watch?v=3xjwP7xFw4w',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Clash_at_the_Mountains_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1427,'Twoson Hits the Road','EarthBound','2026-08-11T00:00:15.027939+00:00','https://www.youtube.com/watch?v=mNWeFaT4RTY',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Twoson_Hits_the_Road_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1428,'A Rose for Zelda','The Legend of Zelda: A Link to the Past','2026-08-11T06:27:01.573839+00:00','https://www.youtube.com/watch?v=-Qng7M5n3dA',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_A_Rose_for_Zelda_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1429,'Dan''s Ice Cream Truck','Street Fighter Alpha 2','2026-08-10T23:06:06.152584+00:00','https://www.youtube.com/watch?v=tncvShwIKzs',381,'https://ocrmirror.org/files/music/remixes/Street_Fighter_Alpha_2_Dan''s_Ice_Cream_Truck_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1430,'A Link to the Piano','The Legend of Zelda: A Link to the Past','2026-08-10T21:12:01.898175+00:00','https://www.youtube.com/watch?v=LW4IlDbvs-o',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_A_Link_to_the_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1431,'Jade Spawn','Doom','2026-08-10T18:22:18.769657+00:00','https://www.youtube.com/watch?v=2rAh-aX68ik',14512,'https://ocrmirror.org/files/music/remixes/Doom_Jade_Spawn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1432,'Slick Rippin'' Keen','Commander Keen V: The Armageddon Machine','2026-08-10T20:10:12.441602+00:00','https://www.youtube.com/watch?v=qsbNPofbLVA',458,'https://ocrmirror.org/files/music/remixes/Commander_Keen_5_Slick_Rippin''_Keen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1433,'Canvas of Dreams','Final Fantasy VI','2026-08-10T23:06:05.296953+00:00','https://www.youtube.com/watch?v=frqiaiNpF9E',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Canvas_of_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1434,'O! Say Can Yoshi','Yoshi''s Story','2026-08-11T02:34:30.063732+00:00','https://www.youtube.com/watch?v=iWWoiTpaAMQ',459,'https://ocrmirror.org/files/music/remixes/Yoshi''s_Story_O_Say_Can_Yoshi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1435,'Falling Back','The Legend of Zelda: Ocarina of Time','2026-08-11T11:19:22.874738+00:00','https://www.youtube.com/watch?v=Xjp2jP3nqYo',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Falling_Back_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1436,'Starflake Jazz','The Guardian Legend','2026-08-10T19:30:04.101701+00:00','https://www.youtube.com/watch?v=q9x1-mVTfBw',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Starflake_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1437,'Ace of Space','The Guardian Legend','2026-08-10T17:24:49.429633+00:00','https://www.youtube.com/watch?v=sJI5ci9A6GY',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Ace_of_Space_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1438,'Prelude','The Legend of Zelda: Ocarina of Time','2026-08-10T21:12:01.371460+00:00','https://www.youtube.com/watch?v=dm898slaKlA',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Prelude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1439,'Red Blue Sanctuary','EarthBound','2026-08-11T02:34:30.582016+00:00','https://www.youtube.com/watch?v=JrGQotKp2OA',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Red_Blue_Sanctuary_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1440,'Pure Black, or Marbles and Cream?','Sonic the Hedgehog 3','2026-08-11T00:00:15.708775+00:00','https://www.youtube.com/watch?v=lrqVgDb2f1o',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Pure_Black_or_Marbles_and_Cream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1441,'White Skies (Club Mix)','Final Fantasy X','2026-08-11T02:34:30.925587+00:00','https://www.youtube.com/watch?v=8MDhdP94TKc',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_White_Skies_(Club_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1442,'Door to the End of Time','Chrono Trigger','2026-08-10T23:06:05.466695+00:00','https://www.youtube.com/watch?v=FoB1ui0JZFU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Door_to_the_End_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1443,'Bombin'' Shade of Blue','Mega Man 7','2026-08-11T00:00:15.572577+00:00','https://www.youtube.com/watch?v=nqLI1zm5ZqQ',460,'https://ocrmirror.org/files/music/remixes/Mega_Man_7_Bombin''_Shade_of_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1444,'Not So Ordinary People','Seiken Densetsu 3','2026-08-10T20:10:13.316767+00:00','https://www.youtube.com/watch?v=tET14Gy63Xo',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Not_So_Ordinary_People_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1445,'Two Shadows Appear','Shadow of the Ninja','2026-08-10T18:22:18.595044+00:00','https://www.youtube.com/watch?v=Rlx0TI_LdVI',461,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Ninja_Two_Shadows_Appear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1446,'Tears of Contention','Chrono Trigger','2026-08-10T23:06:06.323473+00:00','https://www.youtube.com/watch?v=6Ju2YAtNYvk',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Tears_of_Contention_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1447,'All Nations Rise','World of Warcraft','2026-08-11T09:30:50.805138+00:00','https://www.youtube.com/watch?v=ZJ9A-YBKIX4',462,'https://ocrmirror.org/files/music/remixes/World_of_Warcraft_All_Nations_Rise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1448,'And He Returned Home','Final Fantasy Mystic Quest','2026-08-10T21:12:02.439203+00:00','https://www.youtube.com/watch?v=qFT_VDWTPDs',332,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Mystic_Quest_And_He_Returned_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1449,'Unleashed! The Large-Hearted Scientist Boy (and the Magical Monkey)','EarthBound','2026-08-11T00:00:15.981028+00:00','https://www.youtube.com/watch?v=AT6hZOWMWHs',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Unleashed_The_Large-Hearted_Scientist_Boy_(and_the_Magical_Monkey)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1450,'Subterranean Opus','Chrono Trigger','2026-08-11T09:30:51.147073+00:00','https://www.youtube.com/watch?v=3Qb0F7uHTbM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Subterranean_Opus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1451,'Finally Home','Final Fantasy','2026-08-10T23:06:06.494537+00:00','https://www.youtube.com/watch?v=cnKaMAfqiHs',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Finally_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1452,'At the End of All Things','Chrono Trigger','2026-08-10T22:06:36.122247+00:00','https://www.youtube.com/watch?v=kRM1IEKDipU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_At_the_End_of_All_Things_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1453,'Black Wind Rising','Chrono Trigger','2026-08-11T04:48:54.934493+00:00','https://www.youtube.com/watch?v=tRU_9ufkGj4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Black_Wind_Rising_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1454,'Child of the Murder God','Baldur''s Gate','2026-08-10T21:12:01.196465+00:00','https://www.youtube.com/watch?v=jusZ5AedpWk',463,'https://ocrmirror.org/files/music/remixes/Baldur''s_Gate_Child_of_the_Murder_God_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1455,'Victory Festival','Kirby Super Star','2026-08-11T12:08:42.867490+00:00','https://www.youtube.com/watch?v=jXdf0mDRgxo',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Victory_Festival_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1456,'Behold the Winged Cathedral','Castlevania: Harmony of Dissonance','2026-08-11T09:30:51.488263+00:00','https://www.youtube.com/watch?v=dOVhU5n3kVo',464,'https://ocrmirror.org/files/music/remixes/Castlevania_Harmony_of_Dissonance_Behold_the_Winged_Cathedral_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1457,'Stupid Damn Vehicle','Gran Turismo','2026-08-10T18:22:17.166922+00:00','https://www.youtube.com/watch?v=9GoUjeBFx3o',465,'https://ocrmirror.org/files/music/remixes/Gran_Turismo_Stupid_Damn_Vehicle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1458,'The Place We Knew','Chrono Trigger','2026-08-11T13:53:26.768787+00:00','https://www.youtube.com/watch?v=7XZhWFXVYkU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Place_We_Knew_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1459,'The Scarlet Halls of Night','The Guardian Legend','2026-08-11T00:00:15.163852+00:00','https://www.youtube.com/watch?v=wbYHuyA7qZs',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_The_Scarlet_Halls_of_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1460,'crystal potion','Mega Man 3','2026-08-11T06:27:00.688819+00:00','https://www.youtube.com/watch?v=xlxPj9P3ztU',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_crystal_potion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1461,'Intense Color','Mario Paint','2026-08-11T07:46:07.436690+00:00','https://www.youtube.com/watch?v=5mLa6C5qP0w',126,'https://ocrmirror.org/files/music/remixes/Mario_Paint_Intense_Color_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1462,'Bionic Electronica','Bionic Commando','2026-08-10T23:06:06.664729+00:00','https://www.youtube.com/watch?v=HvbIiitPn-A',466,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Bionic_Electronica_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1463,'A Deus ex Harpa (Second Seal Mix)','Grandia II','2026-08-10T21:12:01.018416+00:00','https://www.youtube.com/watch?v=0L1XSg7fOWs',467,'https://ocrmirror.org/files/music/remixes/Grandia_2_A_Deus_ex_Harpa_(Second_Seal_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1464,'Time''s Anxiety','Castlevania: Circle of the Moon','2026-08-11T04:48:56.785094+00:00','https://www.youtube.com/watch?v=sZftKqi7JVs',291,'https://ocrmirror.org/files/music/remixes/Castlevania_Circle_of_the_Moon_Time''s_Anxiety_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1465,'Lover Reef','Sonic & Knuckles','2026-08-11T19:35:22.769413+00:00','https://www.youtube.com/watch?v=36fBjDCKrfE',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Lover_Reef_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1466,'Gypsy Jazz','Super Mario Bros. 2','2026-08-11T06:27:00.865324+00:00','https://www.youtube.com/watch?v=_rnQbq8SLK4',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Gypsy_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1467,'Voices Broken','F-Zero','2026-08-10T23:06:05.119912+00:00','https://www.youtube.com/watch?v=m4C5RWYEibY',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Voices_Broken_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1468,'Metastatic Bloodline','Lufia & The Fortress of Doom','2026-08-10T22:06:34.873496+00:00','https://www.youtube.com/watch?v=jAao9r0dfWg',156,'https://ocrmirror.org/files/music/remixes/Lufia_&_The_Fortress_of_Doom_Metastatic_Bloodline_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1469,'See Sixty Funk','EarthBound','2026-08-11T11:19:22.696753+00:00','https://www.youtube.com/watch?v=PC8JFJ3SsO8',51,'https://ocrmirror.org/files/music/remixes/EarthBound_See_Sixty_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1470,'Lord Blazer, The Robot Who Chills with da Peeps','Wild Arms 2','2026-08-11T02:34:31.096333+00:00','https://www.youtube.com/watch?v=aG5JzXW1mZU',468,'https://ocrmirror.org/files/music/remixes/Wild_Arms_2_Lord_Blazer_The_Robot_Who_Chills_with_da_Peeps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1471,'Chronodyne Marine','Chrono Trigger','2026-08-11T06:27:01.219302+00:00','https://www.youtube.com/watch?v=XetWNatyUB4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Chronodyne_Marine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1472,'No. 5 (Snapdragon)','Super Double Dragon','2026-08-11T06:27:01.041790+00:00','https://www.youtube.com/watch?v=ol6h3oqAT4E',469,'https://ocrmirror.org/files/music/remixes/Super_Double_Dragon_No_5_(Snapdragon)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1473,'Brinstar Bonsai Garden','Super Metroid','2026-08-11T07:46:08.140960+00:00','https://www.youtube.com/watch?v=9NVQGauWNHM',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Brinstar_Bonsai_Garden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1474,'Concerto for Velociraptor','Jurassic Park','2026-08-11T02:34:31.437188+00:00','https://www.youtube.com/watch?v=BntJdXnLVZI',198,'https://ocrmirror.org/files/music/remixes/Jurassic_Park_Concerto_for_Velociraptor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1475,'Mirror and Transparent','Zelda II: The Adventure of Link','2026-08-11T06:27:00.509475+00:00','https://www.youtube.com/watch?v=4_FXAvRBm2M',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Mirror_and_Transparent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1476,'Disconnected','Rayman 2: The Great Escape','2026-08-11T02:34:30.410139+00:00','https://www.youtube.com/watch?v=6KWmkTb3rUg',470,'https://ocrmirror.org/files/music/remixes/Rayman_2_Disconnected_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1477,'Wily and the Deep Forest','Mega Man 2','2026-08-11T12:08:42.525483+00:00','https://www.youtube.com/watch?v=HRWuPqITkcQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wily_and_the_Deep_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1478,'Poltergeist Mix','Ghouls''n Ghosts','2026-08-11T04:48:55.823274+00:00','https://www.youtube.com/watch?v=S8Hw9X5e0YM',471,'https://ocrmirror.org/files/music/remixes/Ghouls''n_Ghosts_Poltergeist_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1479,'New Mexican Thunderbird','Super Street Fighter II Turbo','2026-08-11T04:48:55.642930+00:00','https://www.youtube.com/watch?v=xCn-Ip7nqR4',472,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Turbo_New_Mexican_Thunderbird_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1480,'Flying Heaven','Super Street Fighter II Turbo','2026-08-11T16:26:36.841835+00:00','https://www.youtube.com/watch?v=SFBIEd993ac',472,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Turbo_Flying_Heaven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1481,'PlectraSubCity','Raptor: Call of the Shadows','2026-08-11T09:30:51.659036+00:00','https://www.youtube.com/watch?v=KHemxfiTK5c',473,'https://ocrmirror.org/files/music/remixes/Raptor_PlectraSubCity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1482,'No Need to Reload','Metal Slug 2: Super Vehicle-001/II','2026-08-11T00:00:15.300292+00:00','https://www.youtube.com/watch?v=aIgi3zFKI8g',474,'https://ocrmirror.org/files/music/remixes/Metal_Slug_2_No_Need_to_Reload_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1483,'Nirvana','EarthBound','2026-08-11T04:48:55.289381+00:00','https://www.youtube.com/watch?v=FMaxIvxvM6o',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Nirvana_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1484,'Lightyears Away','Star Control II','2026-08-11T00:00:16.119872+00:00','https://www.youtube.com/watch?v=hHkCjuIQBgI',351,'https://ocrmirror.org/files/music/remixes/Star_Control_2_Lightyears_Away_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1485,'Dueling Consoles','Secret of Mana','2026-08-11T12:08:42.696042+00:00','https://www.youtube.com/watch?v=jN_mh2rx-o4',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Dueling_Consoles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1486,'Fortress of the Knight','Mega Man 6','2026-08-11T06:27:01.750929+00:00','https://www.youtube.com/watch?v=eN-qC3RYtxw',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Fortress_of_the_Knight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1487,'Dark Star Scherzo','Secret of Mana','2026-08-11T07:46:07.789193+00:00','https://www.youtube.com/watch?v=3CMK2zCKm2A',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Dark_Star_Scherzo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1488,'V to the X Power','Star Fox 64','2026-08-11T09:30:50.976211+00:00','https://www.youtube.com/watch?v=4KCYXoWkwos',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_V_to_the_X_Power_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1489,'Battle of the Hylian Hero','Zelda II: The Adventure of Link','2026-08-11T07:46:06.905201+00:00','https://www.youtube.com/watch?v=q_oN6Y-0pfM',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Battle_of_the_Hylian_Hero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1490,'Game Over (Cheeze Mix)','Awesome','2026-08-11T02:34:30.753777+00:00','https://www.youtube.com/watch?v=ALwP_7TvMRg',476,'https://ocrmirror.org/files/music/remixes/Awesome_Game_Over_(Cheeze_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1491,'Microscopism','The 7th Guest','2026-08-11T04:48:56.006079+00:00','https://www.youtube.com/watch?v=NYthpndTqxU',836,'https://ocrmirror.org/files/music/remixes/7th_Guest_Microscopism_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1492,'The Twelfth Commandment','Final Fantasy VII','2026-08-11T09:30:50.286051+00:00','https://www.youtube.com/watch?v=-lw3akf_oKo',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Twelfth_Commandment_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1493,'The Curse','Zombies Ate My Neighbors','2026-08-11T02:34:31.607651+00:00','https://www.youtube.com/watch?v=np1379yQL_M',344,'https://ocrmirror.org/files/music/remixes/Zombies_Ate_My_Neighbors_The_Curse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1494,'The Flood Plain','F-Zero','2026-08-11T11:19:21.995203+00:00','https://www.youtube.com/watch?v=L8T60eY6wzY',89,'https://ocrmirror.org/files/music/remixes/F-Zero_The_Flood_Plain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1495,'Town Life','Chrono Trigger','2026-08-11T19:35:22.245571+00:00','https://www.youtube.com/watch?v=Yc_fzNkvHJ4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Town_Life_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1496,'Hyrule''s Angel (The Sleeping Beauty)','The Legend of Zelda','2026-08-11T17:28:28.492782+00:00','https://www.youtube.com/watch?v=F0Z2Eus0JLY',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Hyrule''s_Angel_(The_Sleeping_Beauty)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1497,'Perpetual Motion','Eternal Champions','2026-08-11T11:19:21.465171+00:00','https://www.youtube.com/watch?v=CQupaA-fpY8',477,'https://ocrmirror.org/files/music/remixes/Eternal_Champions_Perpetual_Motion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1498,'I Don''t Fight Boys','Super Street Fighter II Turbo','2026-08-11T11:19:23.050279+00:00','https://www.youtube.com/watch?v=mKyEJ9rm5mc',472,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Turbo_I_Don''t_Fight_Boys_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1499,'Thirty-Plus Mix','Tetris','2026-08-11T16:26:37.018688+00:00','https://www.youtube.com/watch?v=4Iipjx1OScM',510,'https://ocrmirror.org/files/music/remixes/Tetris_Thirty-Plus_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1500,'The Koan of Drums','Tales of Phantasia','2026-08-11T21:21:07.424652+00:00','https://www.youtube.com/watch?v=k8XeBq_5z68',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_The_Koan_of_Drums_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1501,'Reminiscence of Feelings','Chrono Cross','2026-08-11T04:48:56.440590+00:00','https://www.youtube.com/watch?v=FRK21B8wR-g',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Reminiscence_of_Feelings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1502,'Milagro del Demonio','Final Doom','2026-08-10T23:06:05.980637+00:00','https://www.youtube.com/watch?v=bU1-GOeF040',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_Milagro_del_Demonio_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1503,'Into Your Kamikaze','Star Ocean: The Second Story','2026-08-11T07:46:07.613752+00:00','https://www.youtube.com/watch?v=8NF40gYEZes',283,'https://ocrmirror.org/files/music/remixes/Star_Ocean_The_Second_Story_Into_Your_Kamikaze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1504,'Chocobo!','Final Fantasy Adventure','2026-08-11T07:46:07.261442+00:00','https://www.youtube.com/watch?v=7JT_AXb9tqI',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Chocobo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1505,'Legend of the Snake 2: Snake versus Dragon','Metal Gear Solid','2026-08-11T18:26:35.334832+00:00','https://www.youtube.com/watch?v=zoGZUHb0p7Y',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_Legend_of_the_Snake_2_Snake_versus_Dragon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1506,'Twin Blood','Double Dragon II: The Revenge','2026-08-11T06:27:01.927857+00:00','https://www.youtube.com/watch?v=bNTibX1tB9c',417,'https://ocrmirror.org/files/music/remixes/Double_Dragon_2_Twin_Blood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1507,'Torvus Clockwork','Metroid Prime 2: Echoes','2026-08-11T17:28:28.665488+00:00','https://www.youtube.com/watch?v=EkfKfWMD3xE',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Torvus_Clockwork_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1508,'Froggy Mosh','Castlevania III: Dracula''s Curse','2026-08-11T11:19:22.171160+00:00','https://www.youtube.com/watch?v=a6NvxpKb1kY',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Froggy_Mosh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1509,'The Great Tentacle Pianist','Maniac Mansion: Day of the Tentacle','2026-08-11T12:08:42.009449+00:00','https://www.youtube.com/watch?v=6lMN7z4GQqY',483,'https://ocrmirror.org/files/music/remixes/Maniac_Mansion_Day_of_the_Tentacle_The_Great_Tentacle_Pianist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1510,'Antimatter','Chrono Trigger','2026-08-11T13:53:25.895587+00:00','https://www.youtube.com/watch?v=Rwogh34YOCI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Antimatter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1511,'Five-Sided Square','Shining Force CD','2026-08-11T00:00:14.889762+00:00','https://www.youtube.com/watch?v=GoCmrhYlS4g',485,'https://ocrmirror.org/files/music/remixes/Shining_Force_CD_Five-Sided_Square_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1512,'AmberTrance','Amberstar','2026-08-11T09:30:51.830378+00:00','https://www.youtube.com/watch?v=ptudePrY7k0',484,'https://ocrmirror.org/files/music/remixes/Amberstar_AmberTrance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1513,'Escape Route','Cave Story','2026-08-11T13:53:27.120324+00:00','https://www.youtube.com/watch?v=N62kngEUlGM',486,'https://ocrmirror.org/files/music/remixes/Cave_Story_Escape_Route_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1514,'Blue Balls','Mega Man 3','2026-08-11T07:46:08.316430+00:00','https://www.youtube.com/watch?v=A6-m7pzPDDM',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Blue_Balls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1515,'Fire Cross','Final Fantasy V','2026-08-12T00:06:33.365211+00:00','https://www.youtube.com/watch?v=YXKCEixDtOY',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Fire_Cross_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1516,'Super Mario Blues','Super Mario Bros.','2026-08-11T12:08:43.212416+00:00','https://www.youtube.com/watch?v=Wfvin0ty3ss',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Super_Mario_Blues_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1517,'Moisturor','Super Mario Bros.','2026-08-11T07:46:08.492098+00:00','https://www.youtube.com/watch?v=wsEzsRcBO8c',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Moisturor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1518,'How Much Longer','Final Fantasy X','2026-08-11T15:28:32.592388+00:00','https://www.youtube.com/watch?v=QPjogeZUFuc',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_How_Much_Longer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1519,'Revisiting the Ruins','Donkey Kong Land','2026-08-11T13:53:26.245401+00:00','https://www.youtube.com/watch?v=8bZdEaW34qA',487,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Land_Revisiting_the_Ruins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1520,'People Seized with Trance','Chrono Cross','2026-08-11T04:48:55.112437+00:00','https://www.youtube.com/watch?v=wCiWk88GH9Q',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_People_Seized_with_Trance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1521,'Via','Final Fantasy X','2026-08-11T21:21:07.248503+00:00','https://www.youtube.com/watch?v=1aHKPOJ7pXk',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Via_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1522,'Light in the Fortress','Mega Man X','2026-08-11T16:26:36.304981+00:00','https://www.youtube.com/watch?v=-NgQeg6nHnM',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Light_in_the_Fortress_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1523,'Too Hot for Heat Man','Mega Man 2','2026-08-11T06:27:02.104999+00:00','https://www.youtube.com/watch?v=1x-s601yHX0',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Too_Hot_for_Heat_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1524,'Moon Rhapsody','Cave Story','2026-08-11T15:28:31.543991+00:00','https://www.youtube.com/watch?v=1wVfuMjaNPU',486,'https://ocrmirror.org/files/music/remixes/Cave_Story_Moon_Rhapsody_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1525,'The Final Battle','Chrono Trigger','2026-08-11T07:46:07.965278+00:00','https://www.youtube.com/watch?v=FDZOZ-VvF7c',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Final_Battle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1526,'Knuckleduster','Sonic the Hedgehog 3','2026-08-11T23:11:48.777856+00:00','https://www.youtube.com/watch?v=1dorXOFJRug',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Knuckleduster_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1527,'Walk on Water','Sonic the Hedgehog 3','2026-08-11T21:21:07.072220+00:00','https://www.youtube.com/watch?v=o3Y0xfR9N5M',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Walk_on_Water_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1528,'Scrambled Eggman','Sonic the Hedgehog 3','2026-08-11T18:26:36.025940+00:00','https://www.youtube.com/watch?v=7ho9-svb9QE',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Scrambled_Eggman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1529,'Hyrule Party Mix','The Legend of Zelda: Ocarina of Time','2026-08-11T17:28:28.840273+00:00','https://www.youtube.com/watch?v=suIFmrXMI8w',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Hyrule_Party_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1530,'Visions of Kin','Wild Arms','2026-08-11T04:48:55.464439+00:00','https://www.youtube.com/watch?v=NpTVIWkee9w',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Visions_of_Kin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1531,'Dark World Prelude & March','The Legend of Zelda: A Link to the Past','2026-08-11T15:28:32.938770+00:00','https://www.youtube.com/watch?v=BlBAPI65lW0',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_World_Prelude_&_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1532,'At First Innocence','Seiken Densetsu 3','2026-08-11T16:26:37.372263+00:00','https://www.youtube.com/watch?v=7KjmMdKl8GM',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_At_First_Innocence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1533,'Allfactory','Final Fantasy VI','2026-08-11T15:28:32.244155+00:00','https://www.youtube.com/watch?v=RK6jLMBWc9s',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Allfactory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1534,'Twilight of the Millennium','Phantasy Star IV: The End of the Millennium','2026-08-11T11:19:21.641798+00:00','https://www.youtube.com/watch?v=4AEjrK7MOzw',96,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_4_Twilight_of_the_Millennium_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1535,'Wish Upon a Wendellian Star','Final Fantasy Adventure','2026-08-11T15:28:31.719703+00:00','https://www.youtube.com/watch?v=f34ybmtyA6Y',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Wish_Upon_a_Wendellian_Star_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1536,'It''s Binary, Baby! Album Mix','Cauldron II: The Pumpkin Strikes Back','2026-08-11T11:19:22.346785+00:00','https://www.youtube.com/watch?v=I24FQhIUAB4',488,'https://ocrmirror.org/files/music/remixes/Cauldron_2_It''s_Binary_Baby_Album_Mix_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1537,'Summoner''s Love','Final Fantasy X','2026-08-11T22:11:24.754360+00:00','https://www.youtube.com/watch?v=AfBnDh9p_6c',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Summoner''s_Love_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1538,'Sugar, Water, Purple','Metroid','2026-08-11T19:35:22.420422+00:00','https://www.youtube.com/watch?v=LQJUxIaEzMQ',73,'https://ocrmirror.org/files/music/remixes/Metroid_Sugar_Water_Purple_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1539,'Mushroom Maddness','New Super Mario Bros.','2026-08-11T16:26:35.949756+00:00','https://www.youtube.com/watch?v=2VSyHdGJUbg',489,'https://ocrmirror.org/files/music/remixes/New_Super_Mario_Bros_Mushroom_Maddness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1540,'A Dream Is Not a Mission','Final Fantasy Adventure','2026-08-11T12:08:42.181590+00:00','https://www.youtube.com/watch?v=cI71THGt1_s',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_A_Dream_Is_Not_a_Mission_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1541,'Brainshock','EarthBound','2026-08-11T09:30:50.631808+00:00','https://www.youtube.com/watch?v=VclTD7ZjSSg',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Brainshock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1542,'Koopa vs. Kefka','Super Mario World','2026-08-11T19:35:21.895110+00:00','https://www.youtube.com/watch?v=fZPiRpXpoJg',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Koopa_vs_Kefka_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1543,'PMS','Parasite Eve','2026-08-11T16:26:35.770099+00:00','https://www.youtube.com/watch?v=nzDj4wNZ5Qw',83,'https://ocrmirror.org/files/music/remixes/Parasite_Eve_PMS_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1544,'iMushroom','Sonic & Knuckles','2026-08-11T13:53:26.594739+00:00','https://www.youtube.com/watch?v=xyjK2-bV3Eo',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_iMushroom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1545,'Home Again','EarthBound','2026-08-12T00:06:34.065999+00:00','https://www.youtube.com/watch?v=3DM3yjMrvlw',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Home_Again_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1546,'The Delay','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-11T16:26:36.659309+00:00','https://www.youtube.com/watch?v=xH_mR_TWyh8',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_The_Delay_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1547,'Burning Up','Dr. Mario','2026-08-11T15:28:32.417580+00:00','https://www.youtube.com/watch?v=E1MiOtBupJc',491,'https://ocrmirror.org/files/music/remixes/Dr_Mario_Burning_Up_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1548,'Person, Place, or Groove?','Pictionary','2026-08-11T13:53:25.539807+00:00','https://www.youtube.com/watch?v=DNXozgEhFM8',492,'https://ocrmirror.org/files/music/remixes/Pictionary_Person_Place_or_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1549,'Theme of Frog''s','Chrono Trigger','2026-08-11T19:35:22.595015+00:00','https://www.youtube.com/watch?v=4l8wPuS7osc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Theme_of_Frog''s_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1550,'This Feeling','Phoenix Wright: Ace Attorney','2026-08-11T21:21:06.543393+00:00','https://www.youtube.com/watch?v=-W28kpKvYH4',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_This_Feeling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1551,'Beauty''s Abomination','Parasite Eve','2026-08-11T11:19:21.819396+00:00','https://www.youtube.com/watch?v=bi9B1dJlWFU',83,'https://ocrmirror.org/files/music/remixes/Parasite_Eve_Beauty''s_Abomination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1552,'Dreaming Still','Chrono Cross','2026-08-11T22:11:25.640365+00:00','https://www.youtube.com/watch?v=vpEHRnYI3zE',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Dreaming_Still_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1553,'Final Panic','Tetris Attack','2026-08-11T15:28:32.070826+00:00','https://www.youtube.com/watch?v=Zh9xlysP6LQ',494,'https://ocrmirror.org/files/music/remixes/Tetris_Attack_Final_Panic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1554,'Curse Curse Revolution','Super Castlevania IV','2026-08-11T18:26:35.507332+00:00','https://www.youtube.com/watch?v=DO3i9DQ7d5c',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Curse_Curse_Revolution_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1555,'Lamentations','Final Fantasy VI','2026-08-11T13:53:26.419924+00:00','https://www.youtube.com/watch?v=bDGv6eeTONM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Lamentations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1556,'Robotnik Radio','Sonic & Knuckles','2026-08-11T16:26:36.481538+00:00','https://www.youtube.com/watch?v=QIbEcykt3WI',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Robotnik_Radio_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1557,'Speed Limit','Final Fantasy VII','2026-08-11T13:53:26.944850+00:00','https://www.youtube.com/watch?v=KgdDJRCb4dY',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Speed_Limit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1558,'Monstrous Turtles!','Super Mario World','2026-08-12T12:09:45.340635+00:00','https://www.youtube.com/watch?v=LhTV7jWqTnA',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Monstrous_Turtles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1559,'Fisherman''s Revelation','Final Fantasy VIII','2026-08-11T18:26:34.986801+00:00','https://www.youtube.com/watch?v=pK83xAxB6lE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Fisherman''s_Revelation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1560,'Lake in Ontario?','Final Fantasy X','2026-08-11T17:28:29.871919+00:00','https://www.youtube.com/watch?v=GY4GwhTwOo4',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Lake_in_Ontario_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1561,'Synthpop Mix','The Great Giana Sisters','2026-08-11T19:35:21.715588+00:00','https://www.youtube.com/watch?v=k7d6FMwr2cM',194,'https://ocrmirror.org/files/music/remixes/Great_Giana_Sisters_Synthpop_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1562,'The Souls of Chaos','Chaos Legion','2026-08-11T17:28:29.013147+00:00','https://www.youtube.com/watch?v=tGwnEsC7_i8',495,'https://ocrmirror.org/files/music/remixes/Chaos_Legion_The_Souls_of_Chaos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1563,'Tragedy of a Bullet','Max Payne','2026-08-12T00:06:34.768145+00:00','https://www.youtube.com/watch?v=ZpdetnuWF9o',496,'https://ocrmirror.org/files/music/remixes/Max_Payne_Tragedy_of_a_Bullet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1564,'Breakbeat Forest','Kirby''s Dream Land 2','2026-08-11T19:35:23.118826+00:00','https://www.youtube.com/watch?v=UlQPfQJwfJQ',497,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_2_Breakbeat_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1565,'Syrup''s Secret Stash','Wario Land II','2026-08-11T12:08:43.039471+00:00','https://www.youtube.com/watch?v=7a6hUbQ9WOo',498,'https://ocrmirror.org/files/music/remixes/Wario_Land_2_Syrup''s_Secret_Stash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1566,'Eastern Ice Field','Sonic the Hedgehog 3','2026-08-11T21:21:07.780584+00:00','https://www.youtube.com/watch?v=A3jnPQsbuag',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Eastern_Ice_Field_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1567,'In the Darkness Lies','Banjo-Kazooie','2026-08-11T22:11:24.932193+00:00','https://www.youtube.com/watch?v=6KKS77GrVtk',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_In_the_Darkness_Lies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1568,'Acrophobia','Earthworm Jim','2026-08-11T22:11:24.577349+00:00','https://www.youtube.com/watch?v=o8t9cOUH7Ps',499,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_Acrophobia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1569,'Icy Peaks','Touhou Youyoumu: Perfect Cherry Blossom','2026-08-11T23:11:48.320838+00:00','https://www.youtube.com/watch?v=KtKrQbVHpII',500,'https://ocrmirror.org/files/music/remixes/Touhou_Youyoumu_Perfect_Cherry_Blossom_Icy_Peaks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1570,'Crypt Rock','Shadowgate','2026-08-11T09:30:50.460875+00:00','https://www.youtube.com/watch?v=DqFRJe2Vb80',152,'https://ocrmirror.org/files/music/remixes/Shadowgate_Crypt_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1571,'Tricky Swamp Style','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-11T21:21:06.719468+00:00','https://www.youtube.com/watch?v=pMSu7I_cX0Q',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Tricky_Swamp_Style_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1572,'Notes on a Revelation in a Public Place','Final Fantasy Adventure','2026-08-11T15:28:31.895865+00:00','https://www.youtube.com/watch?v=GfN_iLapbbY',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Notes_on_a_Revelation_in_a_Public_Place_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1573,'Forever Until Tomorrow','Chrono Trigger','2026-08-11T23:11:47.993300+00:00','https://www.youtube.com/watch?v=5P2vrkV0ETw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Forever_Until_Tomorrow_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1574,'Song of Ruin','Chrono Cross','2026-08-11T12:08:43.382672+00:00','https://www.youtube.com/watch?v=2t5L6nNASOg',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Song_of_Ruin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1575,'Epona''s Pastorale','The Legend of Zelda: Ocarina of Time','2026-08-11T12:08:42.352706+00:00','https://www.youtube.com/watch?v=hy492sBCXes',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Epona''s_Pastorale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1576,'Nothing but a Pile of Dance Moves!','Castlevania: Symphony of the Night','2026-08-11T17:28:29.619306+00:00','https://www.youtube.com/watch?v=Mlj7RoxSEpQ',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Nothing_but_a_Pile_of_Dance_Moves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1577,'Inverting the Tower Temple','The Legend of Zelda: Majora''s Mask','2026-08-12T00:06:33.186511+00:00','https://www.youtube.com/watch?v=vp6pu49bD5E',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Inverting_the_Tower_Temple_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1578,'Above Reason','Streets of Rage 2','2026-08-11T22:11:25.108877+00:00','https://www.youtube.com/watch?v=tfZbhdNknTo',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Above_Reason_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1579,'REAKTR.1','Final Fantasy VII','2026-08-11T18:26:36.374176+00:00','https://www.youtube.com/watch?v=R9Ja_ehcRps',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_REAKTR1_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1580,'Still in Your Marble Zone','Sonic the Hedgehog','2026-08-11T12:08:41.832743+00:00','https://www.youtube.com/watch?v=28KwXoESLS4',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Still_in_Your_Marble_Zone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1581,'Dark Butz','Final Fantasy V','2026-08-11T17:28:29.411584+00:00','https://www.youtube.com/watch?v=O8hh0vZ5bgk',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Dark_Butz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1582,'Cantata for Dancing: I. Mors ego sum mortis','Final Fantasy VI','2026-08-12T08:47:02.350742+00:00','https://www.youtube.com/watch?v=3GRogMz0Q8I',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Cantata_for_Dancing_I_Mors_ego_sum_mortis_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1583,'Spinlock','Super Mario 64','2026-08-11T21:21:06.187035+00:00','https://www.youtube.com/watch?v=X2ZCx5ds88Q',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Spinlock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1584,'Turd Surfers','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-11T19:35:22.069669+00:00','https://www.youtube.com/watch?v=qtH4TinSTKU',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Turd_Surfers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1585,'Lizardiño Slayer Quartet','Super Mario Bros. 2','2026-08-11T17:28:28.138956+00:00','https://www.youtube.com/watch?v=tiqfCs8O8BU',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Lizardino_Slayer_Quartet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1586,'Snowfall on Forbidden Lands','Shadow of the Colossus','2026-08-11T21:21:06.895203+00:00','https://www.youtube.com/watch?v=op2HmrV-NtI',502,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Colossus_Snowfall_on_Forbidden_Lands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1587,'Dignity Ark','Chrono Trigger','2026-08-11T23:11:49.424078+00:00','https://www.youtube.com/watch?v=970KXTFzmT8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Dignity_Ark_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1588,'Breaking the Ice','Sonic the Hedgehog 3','2026-08-11T18:26:36.199767+00:00','https://www.youtube.com/watch?v=64bBCd8MVp8',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Breaking_the_Ice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1589,'Minotaur Nightmares','God of War','2026-08-11T18:26:35.160270+00:00','https://www.youtube.com/watch?v=fItQvEYhxMg',504,'https://ocrmirror.org/files/music/remixes/God_of_War_Minotaur_Nightmares_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1590,'Fast Cars, Russian Cigars','Highway Hunter','2026-08-11T18:26:35.851841+00:00','https://www.youtube.com/watch?v=B47Pz8zlirs',503,'https://ocrmirror.org/files/music/remixes/Highway_Hunter_Fast_Cars_Russian_Cigars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1591,'Tattered Slippers','The Legend of Zelda: Twilight Princess','2026-08-12T03:04:01.526295+00:00','https://www.youtube.com/watch?v=nrMSbFrNmrA',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Tattered_Slippers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1592,'Malicious Fingers','Sonic the Hedgehog 3','2026-08-12T05:13:33.291588+00:00','https://www.youtube.com/watch?v=pPJ-XwR3RhQ',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Malicious_Fingers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1593,'The Final Stretch','Highway Hunter','2026-08-11T13:53:26.070955+00:00','https://www.youtube.com/watch?v=qpJ5rR0esyU',503,'https://ocrmirror.org/files/music/remixes/Highway_Hunter_The_Final_Stretch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1594,'Hung Like a Pinky','Final Doom','2026-08-11T13:53:25.720126+00:00','https://www.youtube.com/watch?v=SyU6pDaNXlg',382,'https://ocrmirror.org/files/music/remixes/Final_Doom_Hung_Like_a_Pinky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1595,'Feeding Frenzy','Contra','2026-08-11T17:28:28.315485+00:00','https://www.youtube.com/watch?v=PCNxql3hWAs',21,'https://ocrmirror.org/files/music/remixes/Contra_Feeding_Frenzy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1596,'Twilight of Ivory','Final Fantasy X','2026-08-11T23:11:48.134328+00:00','https://www.youtube.com/watch?v=I_tbjOq_r2s',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Twilight_of_Ivory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1597,'Amanda''s Tear','Final Fantasy Adventure','2026-08-11T18:26:35.680301+00:00','https://www.youtube.com/watch?v=HKY1OswaGyg',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Amanda''s_Tear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1598,'Jackrabbit Transformer','Jazz Jackrabbit 2','2026-08-12T03:04:01.700133+00:00','https://www.youtube.com/watch?v=iQesu5bLXOg',506,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_2_Jackrabbit_Transformer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1599,'Mario Likes Thorazine','Super Mario Bros.','2026-08-12T03:04:01.000782+00:00','https://www.youtube.com/watch?v=WIHTIMBsK9w',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Mario_Likes_Thorazine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1600,'Oil Ocean (WT-40 Mix)','Sonic the Hedgehog 2','2026-08-12T15:28:25.895996+00:00','https://www.youtube.com/watch?v=Qsr-9-6h2Dc',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Oil_Ocean_(WT-40_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1601,'Destroy Movements','Guilty Gear X2','2026-08-12T00:06:34.417899+00:00','https://www.youtube.com/watch?v=qfh-aRU8684',507,'https://ocrmirror.org/files/music/remixes/Guilty_Gear_X2_Destroy_Movements_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1602,'Back 2 Skala','Chrono Trigger','2026-08-12T03:04:01.875374+00:00','https://www.youtube.com/watch?v=KcigyV9x54Q',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Back_2_Skala_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1603,'TEEM.ROKIT','Pokémon Red Version','2026-08-12T10:34:02.613218+00:00','https://www.youtube.com/watch?v=7SKZQUkBxAI',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_TEEM-ROKIT_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1604,'Locke''s Theme for Brass Quintet','Final Fantasy VI','2026-08-11T19:35:23.293043+00:00','https://www.youtube.com/watch?v=7MBsfSrDpdc',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Locke''s_Theme_for_Brass_Quintet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1605,'Cyanide','Final Fantasy VI','2026-08-11T18:26:34.808367+00:00','https://www.youtube.com/watch?v=ftNkJNhPRXQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Cyanide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1606,'Vampire Spanker','Castlevania','2026-08-11T22:11:24.223578+00:00','https://www.youtube.com/watch?v=Yjs2pvUsX2I',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Vampire_Spanker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1607,'Giana''s Homecoming','The Great Giana Sisters','2026-08-11T19:35:22.944149+00:00','https://www.youtube.com/watch?v=AQNEoB3YPQU',194,'https://ocrmirror.org/files/music/remixes/Great_Giana_Sisters_Giana''s_Homecoming_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1608,'Nightmare on Cemetery Lane','The Addams Family','2026-08-11T15:28:31.368529+00:00','https://www.youtube.com/watch?v=40erZozmYxg',509,'https://ocrmirror.org/files/music/remixes/Addams_Family_Nightmare_on_Cemetery_Lane_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1609,'Linear Groove','Tetris','2026-08-12T06:52:47.899421+00:00','https://www.youtube.com/watch?v=Tnyk1xoQWJI',510,'https://ocrmirror.org/files/music/remixes/Tetris_Linear_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1610,'Wind Scene Concert Paraphrase','Chrono Trigger','2026-08-11T23:11:49.203242+00:00','https://www.youtube.com/watch?v=4FecybtNIUY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Wind_Scene_Concert_Paraphrase_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1611,'Devastation''s Doorway','Super Mario 64','2026-08-12T00:06:34.241780+00:00','https://www.youtube.com/watch?v=gkO7e1kSG18',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Devastation''s_Doorway_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1612,'Deliverance of the Heart','Final Fantasy VII','2026-08-12T12:09:46.250170+00:00','https://www.youtube.com/watch?v=a36L58LyKJQ',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Deliverance_of_the_Heart_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1613,'Materia Junkie','Final Fantasy VII','2026-08-12T05:13:32.940914+00:00','https://www.youtube.com/watch?v=uazxstJ0V_I',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Materia_Junkie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1614,'Full Frontal Assault','Final Fantasy VII','2026-08-11T22:11:25.285954+00:00','https://www.youtube.com/watch?v=JdsPAyQqn9M',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Full_Frontal_Assault_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1615,'Damn Those Turks!','Final Fantasy VII','2026-08-11T21:21:07.603289+00:00','https://www.youtube.com/watch?v=v7M7GwSTM_U',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Damn_Those_Turks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1616,'Valse Aeris','Final Fantasy VII','2026-08-11T23:11:48.627643+00:00','https://www.youtube.com/watch?v=WRsfdGO1H-8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Valse_Aeris_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1617,'Short Skirts','Final Fantasy VII','2026-08-12T15:28:26.749314+00:00','https://www.youtube.com/watch?v=IauAcFqocu8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Short_Skirts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1618,'Serenity','Final Fantasy VII','2026-08-12T03:04:02.049256+00:00','https://www.youtube.com/watch?v=teC6KryJV3A',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Serenity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1619,'The Crossroads','Final Fantasy VII','2026-08-12T17:31:13.751788+00:00','https://www.youtube.com/watch?v=OAPE0-49mCo',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Crossroads_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1620,'Fading Entity','Final Fantasy VII','2026-08-12T10:34:02.086771+00:00','https://www.youtube.com/watch?v=RUMER1huXSU',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Fading_Entity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1621,'Rare Square','Final Fantasy VII','2026-08-11T23:11:47.853073+00:00','https://www.youtube.com/watch?v=TnR3cJr7c3Y',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Rare_Square_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1622,'Hydrophone Breakdown','Final Fantasy VII','2026-08-12T06:52:48.073692+00:00','https://www.youtube.com/watch?v=GH4dgKYTKy8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Hydrophone_Breakdown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1623,'Black Wing Metamorphosis','Final Fantasy VII','2026-08-13T00:06:26.650647+00:00','https://www.youtube.com/watch?v=s-wbUGvPmK4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Black_Wing_Metamorphosis_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1624,'Green Lane Avenue','Sonic the Hedgehog','2026-08-12T06:52:48.773893+00:00','https://www.youtube.com/watch?v=KtcQpXe9-2k',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Green_Lane_Avenue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1625,'To the Land of the Great Mammoths','Syberia','2026-08-11T21:21:06.365892+00:00','https://www.youtube.com/watch?v=_3JF3E_oFR8',511,'https://ocrmirror.org/files/music/remixes/Syberia_To_the_Land_of_the_Great_Mammoths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1626,'Mark of the Beatsmith','Final Fantasy VII','2026-08-12T06:52:48.422338+00:00','https://www.youtube.com/watch?v=xl4uJLBQBEU',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Mark_of_the_Beatsmith_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1627,'Wicked n'' Floating','Final Fantasy V','2026-08-12T00:06:34.592186+00:00','https://www.youtube.com/watch?v=edTt21MznB0',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Wicked_n''_Floating_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1628,'Legend of Zelda Overture','The Legend of Zelda','2026-08-12T08:47:02.177009+00:00','https://www.youtube.com/watch?v=R6SLidqHgrY',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Legend_of_Zelda_Overture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1629,'People Made of Stone','Jade Cocoon: Story of the Tamamayu','2026-08-12T08:47:01.829083+00:00','https://www.youtube.com/watch?v=WcIuuEw1Su4',512,'https://ocrmirror.org/files/music/remixes/Jade_Cocoon_People_Made_of_Stone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1630,'Torn Apart','Xenogears','2026-08-12T06:52:47.726101+00:00','https://www.youtube.com/watch?v=JD4OcP6-YCM',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Torn_Apart_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1631,'Light ''Em Up','Metal Slug 3','2026-08-12T05:13:32.591839+00:00','https://www.youtube.com/watch?v=4M_w1q4lRic',514,'https://ocrmirror.org/files/music/remixes/Metal_Slug_3_Light_''Em_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1632,'Riptide','Donkey Kong Country','2026-08-12T10:34:01.906250+00:00','https://www.youtube.com/watch?v=8voKdJ9fRuk',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Riptide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1633,'Rolling Start','Top Gear 2','2026-08-11T23:11:48.471740+00:00','https://www.youtube.com/watch?v=h3X4o2VxbFY',513,'https://ocrmirror.org/files/music/remixes/Top_Gear_2_Rolling_Start_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1634,'Daydreaming Again','Final Fantasy VII','2026-08-12T03:04:02.222543+00:00','https://www.youtube.com/watch?v=pThDHy1xYpg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Daydreaming_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1635,'Gale of Ages','Chrono Trigger','2026-08-12T03:04:01.351672+00:00','https://www.youtube.com/watch?v=GIGmEKoRiYY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Gale_of_Ages_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1636,'JENOVA Celestial','Final Fantasy VII','2026-08-12T06:52:47.200477+00:00','https://www.youtube.com/watch?v=Ohesyd2Um20',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_JENOVA_Celestial_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1637,'Memory Leak Suite','Flashback: The Quest for Identity','2026-08-11T22:11:24.399354+00:00','https://www.youtube.com/watch?v=LSnNJVZZ1xQ',370,'https://ocrmirror.org/files/music/remixes/Flashback_Memory_Leak_Suite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1638,'Psychotic Censors','Psychonauts','2026-08-12T06:52:47.552976+00:00','https://www.youtube.com/watch?v=Cp2nJ3IUdRM',515,'https://ocrmirror.org/files/music/remixes/Psychonauts_Psychotic_Censors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1639,'Of Twilight and Redemption','The Legend of Zelda: Twilight Princess','2026-08-12T05:13:32.060748+00:00','https://www.youtube.com/watch?v=S1rKGxQC6P8',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Of_Twilight_and_Redemption_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1640,'Lunatic Moon','Final Fantasy VII','2026-08-12T10:34:03.137568+00:00','https://www.youtube.com/watch?v=AjNVLZJorIg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Lunatic_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1641,'Who Stole My Stars','Chrono Cross','2026-08-12T05:13:33.466945+00:00','https://www.youtube.com/watch?v=enBgHSsd_XE',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Who_Stole_My_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1642,'Leafcutter','Super Mario RPG: Legend of the Seven Stars','2026-08-12T12:09:46.102939+00:00','https://www.youtube.com/watch?v=hNN_n3Xsis0',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Leafcutter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1643,'Obsessión Nocturnal','Seiken Densetsu 3','2026-08-12T08:47:02.699276+00:00','https://www.youtube.com/watch?v=Sir1daMbTb8',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Obsession_Nocturnal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1644,'Golden Feathers','Final Fantasy VII','2026-08-12T06:52:48.246654+00:00','https://www.youtube.com/watch?v=-LESK23L82Y',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Golden_Feathers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1645,'Cantata for Dancing: II. Fuga Kefka','Final Fantasy VI','2026-08-12T17:31:14.269943+00:00','https://www.youtube.com/watch?v=vGJs4OEwSHY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Cantata_for_Dancing_II_Fuga_Kefka_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1646,'No Man Is an Island','Doom II: Hell on Earth','2026-08-12T05:13:33.641568+00:00','https://www.youtube.com/watch?v=3rq7aBmrrEs',841,'https://ocrmirror.org/files/music/remixes/Doom_2_No_Man_Is_an_Island_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1647,'Go Blow Snow for a Year','Snow Brothers','2026-08-12T00:06:33.717454+00:00','https://www.youtube.com/watch?v=pdpqHKRZQic',516,'https://ocrmirror.org/files/music/remixes/Snow_Brothers_Go_Blow_Snow_for_a_Year_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1648,'OverClocked Spot','Cool Spot','2026-08-12T05:13:32.240701+00:00','https://www.youtube.com/watch?v=494c_ZsnDbA',363,'https://ocrmirror.org/files/music/remixes/Cool_Spot_OverClocked_Spot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1649,'Scenes from a Memory','Final Fantasy VII','2026-08-12T13:56:38.880254+00:00','https://www.youtube.com/watch?v=03NqOzmWUM4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Scenes_from_a_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1650,'Clairvoyant Eulogy','Pokémon Red Version','2026-08-12T08:47:01.656412+00:00','https://www.youtube.com/watch?v=1AAXDgF_DP0',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Clairvoyant_Eulogy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1651,'Zombie Lounge','EarthBound','2026-08-12T05:13:32.415557+00:00','https://www.youtube.com/watch?v=_C0IM9FV4GE',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Zombie_Lounge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1652,'In Pieces','Super Mario World 2: Yoshi''s Island','2026-08-12T13:56:39.054907+00:00','https://www.youtube.com/watch?v=aPVkqg1yl1w',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_In_Pieces_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1653,'Charade','Mario Kart DS','2026-08-12T12:09:46.404799+00:00','https://www.youtube.com/watch?v=3TRZUtBwQII',517,'https://ocrmirror.org/files/music/remixes/Mario_Kart_DS_Charade_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1654,'Last Night a DJ Kidnapped Mallow','Super Mario RPG: Legend of the Seven Stars','2026-08-12T10:34:02.788445+00:00','https://www.youtube.com/watch?v=a6ufC_ogbRU',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Last_Night_a_DJ_Kidnapped_Mallow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1655,'Omnislash','Final Fantasy VII','2026-08-12T03:04:01.176011+00:00','https://www.youtube.com/watch?v=gMHpT_kFdYg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Omnislash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1656,'Fear My Lowering Coefficient of Friction','Blaster Master','2026-08-12T10:34:02.438307+00:00','https://www.youtube.com/watch?v=yjAOd3Pk2Xo',39,'https://ocrmirror.org/files/music/remixes/Blaster_Master_Fear_My_Lowering_Coefficient_of_Friction_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1657,'Wanderer on the Offensive (Live Edit)','Shadow of the Colossus','2026-08-12T23:10:04.360002+00:00','https://www.youtube.com/watch?v=IdhPe1udAHM',502,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Colossus_Wanderer_on_the_Offensive_(Live_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1658,'A Life Without Parole','Final Fantasy VII','2026-08-12T00:06:33.891327+00:00','https://www.youtube.com/watch?v=VqZuh83ujUw',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_A_Life_Without_Parole_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1659,'The Forerunner Mix (Alpha)','Marathon','2026-08-12T13:56:38.706069+00:00','https://www.youtube.com/watch?v=THG0LjX0J_k',444,'https://ocrmirror.org/files/music/remixes/Marathon_The_Forerunner_Mix_(Alpha)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1660,'The Forerunner Mix (Beta)','Marathon','2026-08-12T03:04:02.399776+00:00','https://www.youtube.com/watch?v=MvmcP8bpwsk',444,'https://ocrmirror.org/files/music/remixes/Marathon_The_Forerunner_Mix_(Beta)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1661,'Yellow Valkyrie','Metroid Prime 3: Corruption','2026-08-12T16:27:54.104787+00:00','https://www.youtube.com/watch?v=fl0pg5IpPfA',518,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_3_Yellow_Valkyrie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1662,'K-Pax for Evermore','Secret of Evermore','2026-08-12T17:31:14.097149+00:00','https://www.youtube.com/watch?v=owbGWCAK9EI',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_K-Pax_for_Evermore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1663,'Frozen Landscape','Final Fantasy VII','2026-08-12T05:13:32.766563+00:00','https://www.youtube.com/watch?v=Spblw6tRlyM',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Frozen_Landscape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1664,'Alpha Blade','Guilty Gear X','2026-08-12T08:47:01.479870+00:00','https://www.youtube.com/watch?v=aYV7Rdehblk',520,'https://ocrmirror.org/files/music/remixes/Guilty_Gear_X_Alpha_Blade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1665,'Wizards in My Armor (Warrior in My Long Johns)','Wizards & Warriors','2026-08-12T21:19:26.807328+00:00','https://www.youtube.com/watch?v=FARKxzJeDTY',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_Wizards_in_My_Armor_(Warrior_in_My_Long_Johns)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1666,'Mint ~ The Spirit Is Willing','Threads of Fate','2026-08-12T13:56:38.532136+00:00','https://www.youtube.com/watch?v=PiDsILraD_A',519,'https://ocrmirror.org/files/music/remixes/Threads_of_Fate_Mint_The_Spirit_Is_Willing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1667,'Too Much Fighting','Final Fantasy VII','2026-08-12T10:34:02.963230+00:00','https://www.youtube.com/watch?v=SCUwL-jIh0w',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Too_Much_Fighting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1668,'Immortal Souls','Eternal Champions','2026-08-12T12:09:46.571755+00:00','https://www.youtube.com/watch?v=hqo2w-r6G_o',477,'https://ocrmirror.org/files/music/remixes/Eternal_Champions_Immortal_Souls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1669,'Unraveling the Mystery','Myst','2026-08-12T13:56:38.182332+00:00','https://www.youtube.com/watch?v=TadOeac2GlA',529,'https://ocrmirror.org/files/music/remixes/Myst_Unraveling_the_Mystery_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1670,'The Scar-Sealing Girl','Radical Dreamers: Nusumenai Houseki','2026-08-12T19:36:46.016480+00:00','https://www.youtube.com/watch?v=-gsfn-drwlg',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_The_Scar-Sealing_Girl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1671,'Suco de Melancia','Final Fantasy VII','2026-08-12T10:34:02.263099+00:00','https://www.youtube.com/watch?v=2WhrhUNFIQE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Suco_de_Melancia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1672,'The Freedom of Zero','F-Zero','2026-08-13T03:07:11.062582+00:00','https://www.youtube.com/watch?v=QZZTXcjuYok',89,'https://ocrmirror.org/files/music/remixes/F-Zero_The_Freedom_of_Zero_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1673,'Confronto Finale','Radical Dreamers: Nusumenai Houseki','2026-08-12T06:52:47.377270+00:00','https://www.youtube.com/watch?v=9qT44Roz7pA',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Confronto_Finale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1674,'Rockabilly ~ Dark Gears ~ Surfing Gear','Top Gear','2026-08-12T12:09:45.652268+00:00','https://www.youtube.com/watch?v=NAHPeII3SKs',144,'https://ocrmirror.org/files/music/remixes/Top_Gear_Rockabilly_Dark_Gears_Surfing_Gear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1675,'Mother Brain Suite','Super Metroid','2026-08-12T15:28:26.237172+00:00','https://www.youtube.com/watch?v=uxa4WKuIlVM',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Mother_Brain_Suite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1676,'Cruise Control','Gran Turismo 3 A-spec','2026-08-12T08:47:01.134189+00:00','https://www.youtube.com/watch?v=rfIaKx4JS7s',523,'https://ocrmirror.org/files/music/remixes/Gran_Turismo_3_A-spec_Cruise_Control_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1677,'Larry''s Funky House of Lowe','Leisure Suit Larry in the Land of the Lounge Lizards','2026-08-12T13:56:37.651705+00:00','https://www.youtube.com/watch?v=EcH9CbKkIls',535,'https://ocrmirror.org/files/music/remixes/Leisure_Suit_Larry_in_the_Land_of_the_Lounge_Lizards_Larry''s_Funky_House_of_Lowe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1678,'Rhapsody in Poo','Conker''s Bad Fur Day','2026-08-12T23:10:05.272686+00:00','https://www.youtube.com/watch?v=mVqZxhmJjqg',526,'https://ocrmirror.org/files/music/remixes/Conker''s_Bad_Fur_Day_Rhapsody_in_Poo_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1679,'Music Is a Weapon','Revolution X','2026-08-12T13:56:37.833965+00:00','https://www.youtube.com/watch?v=1B8LbZVc5aU',534,'https://ocrmirror.org/files/music/remixes/Revolution_X_Music_Is_a_Weapon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1680,'Realization','Final Fantasy VIII','2026-08-12T05:13:33.117240+00:00','https://www.youtube.com/watch?v=cdLq73qk9vs',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Realization_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1681,'Lost Dark World','The Legend of Zelda: A Link to the Past','2026-08-12T17:31:13.407619+00:00','https://www.youtube.com/watch?v=4xtPnOncpH4',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Lost_Dark_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1682,'Jenova Returns','Final Fantasy VII','2026-08-12T17:31:14.614837+00:00','https://www.youtube.com/watch?v=A74Z8eoDAZI',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Jenova_Returns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1683,'Thicket','Secret of Mana','2026-08-12T13:56:38.007966+00:00','https://www.youtube.com/watch?v=RtlaPOsFFb0',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Thicket_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1684,'Traveling','Animal Crossing','2026-08-12T16:27:54.621757+00:00','https://www.youtube.com/watch?v=XR7q2DppYw0',521,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_Traveling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1685,'Dirt Devil','Final Fantasy VI','2026-08-13T03:07:10.706718+00:00','https://www.youtube.com/watch?v=loLUI3sxITk',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dirt_Devil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1686,'Harden the Duck Up!','DuckTales','2026-08-12T15:28:26.578215+00:00','https://www.youtube.com/watch?v=b8FBLFnu1t8',50,'https://ocrmirror.org/files/music/remixes/DuckTales_Harden_the_Duck_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1687,'The Annihilation of Monsteropolis','Mega Man 2','2026-08-12T21:19:27.154161+00:00','https://www.youtube.com/watch?v=0bUnYcNc6YQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Annihilation_of_Monsteropolis_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1688,'Forest of Hysteria','The Legend of Zelda: Link''s Awakening','2026-08-13T03:07:10.884910+00:00','https://www.youtube.com/watch?v=qodDoEBorCM',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Forest_of_Hysteria_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1689,'Sephiroth''s Wake','Final Fantasy VII','2026-08-12T08:47:02.526250+00:00','https://www.youtube.com/watch?v=4cmuZvLzF5k',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Sephiroth''s_Wake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1690,'The Enlightened Alaskan','Grim Fandango','2026-08-12T12:09:45.799321+00:00','https://www.youtube.com/watch?v=1C_4tRUwRTI',540,'https://ocrmirror.org/files/music/remixes/Grim_Fandango_The_Enlightened_Alaskan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1691,'Endings, Beginnings and One Hell of a Trip','Breath of Fire IV','2026-08-12T08:47:01.308034+00:00','https://www.youtube.com/watch?v=0ornmVbIrig',522,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_4_Endings_Beginnings_and_One_Hell_of_a_Trip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1692,'Cranial Syphon [Kay-raid]','Metroid','2026-08-12T08:47:02.003194+00:00','https://www.youtube.com/watch?v=YMKl4ubWYdE',73,'https://ocrmirror.org/files/music/remixes/Metroid_Cranial_Syphon_[Kay-raid]_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1693,'Demnos Inquisitor','Solstice: The Quest for the Staff of Demnos','2026-08-12T12:09:45.950438+00:00','https://www.youtube.com/watch?v=peAbTEC-zzM',452,'https://ocrmirror.org/files/music/remixes/Solstice_Demnos_Inquisitor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1694,'Adrenalyne Kyck','Final Fantasy VII','2026-08-13T06:55:45.428179+00:00','https://www.youtube.com/watch?v=aFQ4pGz7AI4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Adrenalyne_Kyck_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1695,'Keep Out the Veldt','Final Fantasy VI','2026-08-12T21:19:27.327706+00:00','https://www.youtube.com/watch?v=1juoKhn3gEw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Keep_Out_the_Veldt_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1696,'Yet Even More Fighting','Final Fantasy VII','2026-08-12T12:09:45.179534+00:00','https://www.youtube.com/watch?v=Fxjw55_XkPs',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Yet_Even_More_Fighting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1697,'A Day in the Life of a Gambler','Final Fantasy VI','2026-08-12T19:36:45.840523+00:00','https://www.youtube.com/watch?v=jQmsbk9Mvuw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_A_Day_in_the_Life_of_a_Gambler_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1698,'Livin'' Large!','Cheetahmen II','2026-08-12T22:09:47.780555+00:00','https://www.youtube.com/watch?v=esXL6BFjmHY',524,'https://ocrmirror.org/files/music/remixes/Cheetahmen_2_Livin''_Large_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1699,'Heat Man (Ignition Mix)','Mega Man 2','2026-08-12T15:28:25.547991+00:00','https://www.youtube.com/watch?v=1Z_DssewSJ0',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Heat_Man_(Ignition_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1700,'Celestial Winds from the East','Okami','2026-08-13T05:17:00.792409+00:00','https://www.youtube.com/watch?v=J1IgcwTmfwQ',537,'https://ocrmirror.org/files/music/remixes/Okami_Celestial_Winds_from_the_East_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1701,'Kirby''s Mystical Mirror','Kirby & The Amazing Mirror','2026-08-12T12:09:45.502126+00:00','https://www.youtube.com/watch?v=RFrhRa9_k18',528,'https://ocrmirror.org/files/music/remixes/Kirby_&_The_Amazing_Mirror_Kirby''s_Mystical_Mirror_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1702,'Nuclear Flash','Mega Man 2','2026-08-13T06:55:45.296233+00:00','https://www.youtube.com/watch?v=d9dXLJeqUIA',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Nuclear_Flash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1703,'H2O','Cave Story','2026-08-12T15:28:25.723430+00:00','https://www.youtube.com/watch?v=wnFypJs_Ulw',486,'https://ocrmirror.org/files/music/remixes/Cave_Story_H2O_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1704,'Harmony of Destruction','Final Fantasy VII','2026-08-12T13:56:38.357080+00:00','https://www.youtube.com/watch?v=BKyrncNjtPc',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Harmony_of_Destruction_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1705,'Babel: A Prison of Fate','Xenogears','2026-08-12T19:36:46.192072+00:00','https://www.youtube.com/watch?v=0YL4OuHswXE',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Babel_A_Prison_of_Fate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1706,'Day''s End','Mario Kart 64','2026-08-13T05:17:01.345609+00:00','https://www.youtube.com/watch?v=DCZey2P5KlI',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Day''s_End_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1707,'In the Darkness of Time','Castlevania: Aria of Sorrow','2026-08-12T15:28:26.066595+00:00','https://www.youtube.com/watch?v=x5VlnYvqlq4',541,'https://ocrmirror.org/files/music/remixes/Castlevania_Aria_of_Sorrow_In_the_Darkness_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1708,'Will Is the Lord','Illusion of Gaia','2026-08-12T17:31:13.233921+00:00','https://www.youtube.com/watch?v=DdOzjHwwtMo',329,'https://ocrmirror.org/files/music/remixes/Illusion_of_Gaia_Will_Is_the_Lord_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1709,'Nine Inch Klax','Klax','2026-08-12T21:19:26.286219+00:00','https://www.youtube.com/watch?v=q_Y1sLVL-io',538,'https://ocrmirror.org/files/music/remixes/Klax_Nine_Inch_Klax_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1710,'Groove, Sweet Groove','Final Fantasy V','2026-08-12T19:36:46.558531+00:00','https://www.youtube.com/watch?v=vC0PdEkvqd4',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Groove_Sweet_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1711,'In the Beginning There Was Jazz','Castlevania III: Dracula''s Curse','2026-08-12T17:31:13.580288+00:00','https://www.youtube.com/watch?v=cdQIbubYp1U',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_In_the_Beginning_There_Was_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1712,'Metamorphic Rock','Sonic the Hedgehog','2026-08-13T08:50:31.235367+00:00','https://www.youtube.com/watch?v=B1v3XCgm8aM',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Metamorphic_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1713,'Murder Your Friends Boogie','Super Dodge Ball','2026-08-12T22:09:47.955071+00:00','https://www.youtube.com/watch?v=AKOn5I2CZzs',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Murder_Your_Friends_Boogie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1714,'All-Star Doskpop','Super Dodge Ball','2026-08-12T19:36:46.818924+00:00','https://www.youtube.com/watch?v=k-ynmajC94w',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_All-Star_Doskpop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1715,'Son of Chaos','Final Fantasy VII','2026-08-12T17:31:13.059100+00:00','https://www.youtube.com/watch?v=-pJFpG9oJ1A',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Son_of_Chaos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1716,'Dialima tu Kafé','EarthBound','2026-08-12T19:36:45.664674+00:00','https://www.youtube.com/watch?v=u_mVLbeaPkk',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Dialima_tu_Kafe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1717,'Fuzzy Green Feeling','Super Metroid','2026-08-12T10:34:03.311887+00:00','https://www.youtube.com/watch?v=L1X931ui5Os',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Fuzzy_Green_Feeling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1718,'My Home, My Friends','Final Fantasy V','2026-08-12T16:27:53.932761+00:00','https://www.youtube.com/watch?v=BGXKYwKoqpI',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_My_Home_My_Friends_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1719,'The Winds of Inishmore','Final Fantasy XII','2026-08-12T23:10:05.697262+00:00','https://www.youtube.com/watch?v=9_2NCwvHX1E',525,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_12_The_Winds_of_Inishmore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1720,'Hamadatan','Ragnarök Online','2026-08-13T03:07:10.353187+00:00','https://www.youtube.com/watch?v=a92nSw9j59Y',542,'https://ocrmirror.org/files/music/remixes/Ragnarok_Online_Hamadatan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1721,'Afternoon Tea with SnappleMan''s Mom','Terranigma','2026-08-12T22:09:48.825130+00:00','https://www.youtube.com/watch?v=h3L-bj-p_Jo',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Afternoon_Tea_with_SnappleMan''s_Mom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1722,'No Such Thing As the Promised Land','Final Fantasy VII','2026-08-12T22:09:48.304120+00:00','https://www.youtube.com/watch?v=CSYtnyr_1Nc',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_No_Such_Thing_As_the_Promised_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1723,'The Passing of the Blue Crown','Mega Man 3','2026-08-13T16:27:34.427270+00:00','https://www.youtube.com/watch?v=ix4FsgBi2AY',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_The_Passing_of_the_Blue_Crown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1724,'Snake''s Revenge','Metal Gear','2026-08-12T16:27:54.449545+00:00','https://www.youtube.com/watch?v=0qKnFJlHXp4',140,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Snake''s_Revenge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1725,'Lanterns','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-12T16:27:54.793296+00:00','https://www.youtube.com/watch?v=nKts94hOCGg',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Lanterns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1726,'Aqueous Transgression','Chrono Trigger','2026-08-12T19:36:45.485432+00:00','https://www.youtube.com/watch?v=3HSIHX_rzGU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Aqueous_Transgression_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1727,'Revolutions','Mega Man X3','2026-08-12T23:10:05.562086+00:00','https://www.youtube.com/watch?v=CC-CtCBOmmM',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Revolutions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1728,'Legend of Arcana ~ Tale of the Nagi','Jade Cocoon: Story of the Tamamayu','2026-08-12T16:27:54.277298+00:00','https://www.youtube.com/watch?v=jXxLb79m0hI',512,'https://ocrmirror.org/files/music/remixes/Jade_Cocoon_Legend_of_Arcana_Tale_of_the_Nagi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1729,'That''s What You Get','Kingdom Hearts: Chain of Memories','2026-08-13T05:17:01.757685+00:00','https://www.youtube.com/watch?v=DS04jD4LNC0',527,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Chain_of_Memories_That''s_What_You_Get_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1730,'Subterranean Kamikaze','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-13T12:09:01.946101+00:00','https://www.youtube.com/watch?v=K9wc5l4hUjQ',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Subterranean_Kamikaze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1731,'Endless Skies','Final Fantasy X','2026-08-12T22:09:48.478280+00:00','https://www.youtube.com/watch?v=SMT9OHHwGKA',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Endless_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1732,'Mamacitas in My Valley','The Legend of Zelda: Ocarina of Time','2026-08-13T03:07:11.239839+00:00','https://www.youtube.com/watch?v=AwC4xPDTu0s',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Mamacitas_in_My_Valley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1733,'Global Empire','Jade Empire','2026-08-13T08:50:32.482287+00:00','https://www.youtube.com/watch?v=C7LyQ4TdVxg',550,'https://ocrmirror.org/files/music/remixes/Jade_Empire_Global_Empire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1734,'Escape into the Twilight','NiGHTS into dreams...','2026-08-12T17:31:14.442744+00:00','https://www.youtube.com/watch?v=XbZAs2ES0s8',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Escape_into_the_Twilight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1735,'Bumpin''','ToeJam & Earl','2026-08-12T22:09:48.129322+00:00','https://www.youtube.com/watch?v=Mb8phTONk_k',99,'https://ocrmirror.org/files/music/remixes/ToeJam_&_Earl_Bumpin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1736,'Until You See the Light in Valhalla','Valkyrie Profile','2026-08-12T21:19:26.111513+00:00','https://www.youtube.com/watch?v=VN40rehSUuw',547,'https://ocrmirror.org/files/music/remixes/Valkyrie_Profile_Until_You_See_the_Light_in_Valhalla_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1737,'A Symphonic Tale','Wild Arms','2026-08-13T10:35:26.829801+00:00','https://www.youtube.com/watch?v=reokFX9fam0',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_A_Symphonic_Tale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1738,'Day & Night','Sonic 3D Blast','2026-08-12T16:27:54.965318+00:00','https://www.youtube.com/watch?v=-jEYGuOwBsk',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Day_&_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1739,'Kindred','Super Metroid','2026-08-13T21:20:30.728742+00:00','https://www.youtube.com/watch?v=_WaKe6lGfhU',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Kindred_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1740,'Red Waltz','Doom II: Hell on Earth','2026-08-13T10:35:27.354247+00:00','https://www.youtube.com/watch?v=4L8dV6QOXVU',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Red_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1741,'Running from Evil Horde','Doom II: Hell on Earth','2026-08-12T21:19:26.633146+00:00','https://www.youtube.com/watch?v=SZ37fuJU1Io',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Running_from_Evil_Horde_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1742,'Behind the Sealed Door','Chrono Trigger','2026-08-12T21:19:26.980892+00:00','https://www.youtube.com/watch?v=m2pBjNI30Fc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Behind_the_Sealed_Door_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1743,'Crushing Headache','Doom II: Hell on Earth','2026-08-12T17:31:13.924739+00:00','https://www.youtube.com/watch?v=HHQON7uZJC4',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Crushing_Headache_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1744,'Overture Variations','Dragon Warrior','2026-08-12T13:56:39.233547+00:00','https://www.youtube.com/watch?v=E5VvxKafk5A',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_Overture_Variations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1745,'The Secrets of Sosetsuken','Double Dragon','2026-08-12T22:09:47.602715+00:00','https://www.youtube.com/watch?v=L1CJ4BS1vcU',543,'https://ocrmirror.org/files/music/remixes/Double_Dragon_The_Secrets_of_Sosetsuken_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1746,'Duet of the Keyblade Masters','Kingdom Hearts II','2026-08-12T23:10:04.707994+00:00','https://www.youtube.com/watch?v=lp_DxL4GacQ',549,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_2_Duet_of_the_Keyblade_Masters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1747,'Zebes Rising','Super Metroid','2026-08-12T22:09:48.998762+00:00','https://www.youtube.com/watch?v=XAvmeEy_U2E',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Zebes_Rising_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1748,'While San d''Oria Sleeps','Final Fantasy XI Online','2026-08-12T23:10:04.844251+00:00','https://www.youtube.com/watch?v=-Nwtj5DduXU',546,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_While_San_d''Oria_Sleeps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1749,'American Wheels of Wonder','Myst III: Exile','2026-08-12T23:10:04.498563+00:00','https://www.youtube.com/watch?v=JaEnHayYnYw',539,'https://ocrmirror.org/files/music/remixes/Myst_3_American_Wheels_of_Wonder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1750,'Sly Thai Guy','Street Fighter II: The World Warrior','2026-08-13T00:06:25.595040+00:00','https://www.youtube.com/watch?v=9F68MdQHUYY',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Sly_Thai_Guy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1751,'Puffball Promenade','Kirby''s Dream Land 2','2026-08-12T16:27:53.758880+00:00','https://www.youtube.com/watch?v=_U2xdbmifRs',497,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_2_Puffball_Promenade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1752,'Searching the Woods','Final Fantasy VI','2026-08-12T23:10:05.425865+00:00','https://www.youtube.com/watch?v=I3B1_V1kiV8',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Searching_the_Woods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1753,'Diamond Worlds','Solar Jetman: Hunt for the Golden Warpship','2026-08-13T00:06:25.412443+00:00','https://www.youtube.com/watch?v=EL2JcKEMKbQ',545,'https://ocrmirror.org/files/music/remixes/Solar_Jetman_Diamond_Worlds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1754,'Castle of Tears','Castlevania II: Simon''s Quest','2026-08-13T00:06:25.770791+00:00','https://www.youtube.com/watch?v=18CfQ1CCCxE',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Castle_of_Tears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1755,'FlowTropiks','StarTropics','2026-08-12T19:36:47.387386+00:00','https://www.youtube.com/watch?v=AIHQWa13DDw',129,'https://ocrmirror.org/files/music/remixes/StarTropics_FlowTropiks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1756,'The Heroes Emerge','Final Fantasy V','2026-08-12T22:09:47.426844+00:00','https://www.youtube.com/watch?v=EYPkIxauscc',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_The_Heroes_Emerge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1757,'Elevation [groovepump mix]','Streets of Rage','2026-08-13T12:09:01.591045+00:00','https://www.youtube.com/watch?v=meKKTMg11MQ',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Elevation_[groovepump_mix]_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1758,'Mako Eyes','Final Fantasy VII','2026-08-13T06:55:44.632054+00:00','https://www.youtube.com/watch?v=yYkNMlnI-vo',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Mako_Eyes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1759,'Lost in Jungle','Donkey Kong Country','2026-08-13T05:17:01.483136+00:00','https://www.youtube.com/watch?v=8mWCAvPhC7g',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Lost_in_Jungle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1760,'Turning Terrors','Super Mario World','2026-08-13T05:17:01.207373+00:00','https://www.youtube.com/watch?v=rcv4bXZ-wak',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Turning_Terrors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1761,'Clandestine','Perfect Dark','2026-08-12T21:19:26.460437+00:00','https://www.youtube.com/watch?v=ITcwK8gVixQ',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Clandestine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1762,'Terra Haute','Final Fantasy VI','2026-08-13T03:07:10.174789+00:00','https://www.youtube.com/watch?v=5q4mDxuDbE8',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra_Haute_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1763,'Forbidden Memory (of a Forgotten Dream)','Sonic the Hedgehog 2','2026-08-13T00:06:26.123879+00:00','https://www.youtube.com/watch?v=yyiFEOB3FIE',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Forbidden_Memory_(of_a_Forgotten_Dream)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1764,'Kabuki Frogs','Goemon''s Great Adventure','2026-08-13T00:06:25.948738+00:00','https://www.youtube.com/watch?v=eQxHpCmpf2s',548,'https://ocrmirror.org/files/music/remixes/Goemon''s_Great_Adventure_Kabuki_Frogs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1765,'Daily Training','Crusader of Centy','2026-08-12T22:09:48.651709+00:00','https://www.youtube.com/watch?v=W3TsPpl4xaE',552,'https://ocrmirror.org/files/music/remixes/Crusader_of_Centy_Daily_Training_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1766,'TimeShock','Final Fantasy VI','2026-08-13T10:35:26.654998+00:00','https://www.youtube.com/watch?v=6oRcRjPT9_U',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_TimeShock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1767,'Barrel Roll','Star Fox','2026-08-13T05:17:01.895028+00:00','https://www.youtube.com/watch?v=ifa3UwPjmmw',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Barrel_Roll_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1768,'Samurai Discotheque','Ragnarök Online','2026-08-13T05:17:01.069007+00:00','https://www.youtube.com/watch?v=VROS8tCpgFM',542,'https://ocrmirror.org/files/music/remixes/Ragnarok_Online_Samurai_Discotheque_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1769,'The Result Is Always Death','Shadow Hearts: Covenant','2026-08-13T00:06:26.298856+00:00','https://www.youtube.com/watch?v=q1Mz3Ii4Z_U',544,'https://ocrmirror.org/files/music/remixes/Shadow_Hearts_Covenant_The_Result_Is_Always_Death_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1770,'Samus Bubblebath','Super Metroid','2026-08-13T06:55:44.765344+00:00','https://www.youtube.com/watch?v=MTRKSN0LrcE',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Samus_Bubblebath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1771,'Burn, Baby, Burn!','Super Hang-On','2026-08-13T03:07:09.813257+00:00','https://www.youtube.com/watch?v=YhP63__bvHM',347,'https://ocrmirror.org/files/music/remixes/Super_Hang-On_Burn_Baby_Burn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1772,'Call of the Mask','Splatterhouse 3','2026-08-12T21:19:27.673548+00:00','https://www.youtube.com/watch?v=KMXuFxY7uOo',554,'https://ocrmirror.org/files/music/remixes/Splatterhouse_3_Call_of_the_Mask_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1773,'Malevolent Mansion','Banjo-Kazooie','2026-08-13T19:34:02.998327+00:00','https://www.youtube.com/watch?v=sSDzGIAN_fE',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_Malevolent_Mansion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1774,'Rove You Rong Time','Super Dodge Ball','2026-08-13T06:55:45.031370+00:00','https://www.youtube.com/watch?v=UBJFbY_egSU',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Rove_You_Rong_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1775,'Sexxy Thai Guy','Street Fighter II: The World Warrior','2026-08-13T03:07:10.529741+00:00','https://www.youtube.com/watch?v=iu6i26K-nD8',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Sexxy_Thai_Guy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1776,'garlic','Castlevania','2026-08-13T15:29:49.057953+00:00','https://www.youtube.com/watch?v=o74j_g-6LrU',18,'https://ocrmirror.org/files/music/remixes/Castlevania_garlic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1777,'Pirates of Oblivion','The Elder Scrolls IV: Oblivion','2026-08-13T03:07:09.996539+00:00','https://www.youtube.com/watch?v=Aavr0yJJCtA',553,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_4_Oblivion_Pirates_of_Oblivion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1778,'Of Mind and Body','Super Mario Bros. 3','2026-08-13T08:50:32.127155+00:00','https://www.youtube.com/watch?v=iSyuRGc1gpw',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Of_Mind_and_Body_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1779,'Dig This!','Lemmings','2026-08-13T08:50:32.305153+00:00','https://www.youtube.com/watch?v=T0QvBEHVYUM',85,'https://ocrmirror.org/files/music/remixes/Lemmings_Dig_This_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1780,'Sound of the Dogfish','Tetris Attack','2026-08-13T06:55:45.561184+00:00','https://www.youtube.com/watch?v=7e7-e4NrRdc',494,'https://ocrmirror.org/files/music/remixes/Tetris_Attack_Sound_of_the_Dogfish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1781,'To Lost Epochs','Chrono Trigger','2026-08-13T08:50:31.950016+00:00','https://www.youtube.com/watch?v=pXN3EGNlgY0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_To_Lost_Epochs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1782,'High-Five... Hundred','Street Fighter II: The World Warrior','2026-08-12T23:10:05.136553+00:00','https://www.youtube.com/watch?v=zXK-Lm5yUiY',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_High-Five_Hundred_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1783,'Red Cyclone','Street Fighter II: The World Warrior','2026-08-13T13:56:38.036882+00:00','https://www.youtube.com/watch?v=YR0ESexpR7w',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Red_Cyclone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1784,'Clamato Fever','Street Fighter II: The World Warrior','2026-08-13T12:09:02.122750+00:00','https://www.youtube.com/watch?v=TJ0TGL07QAE',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Clamato_Fever_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1785,'Fiddlesticks','Street Fighter II: The World Warrior','2026-08-13T00:06:26.474960+00:00','https://www.youtube.com/watch?v=jc0XkDAtGvY',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Fiddlesticks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1786,'Eat Your Own Dust','F-Zero','2026-08-13T13:56:38.745638+00:00','https://www.youtube.com/watch?v=qcmxZO2Tw2M',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Eat_Your_Own_Dust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1787,'Tant Mieux','Romancing SaGa','2026-08-13T13:56:37.686326+00:00','https://www.youtube.com/watch?v=e1CD3t2qEko',557,'https://ocrmirror.org/files/music/remixes/Romancing_SaGa_Tant_Mieux_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1788,'No Hope','The Legend of Zelda: Twilight Princess','2026-08-13T10:35:27.180178+00:00','https://www.youtube.com/watch?v=H3121Fz6qk0',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_No_Hope_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1789,'Pretension','Tales of Destiny','2026-08-13T13:56:37.861320+00:00','https://www.youtube.com/watch?v=-mqvaI0zPUE',558,'https://ocrmirror.org/files/music/remixes/Tales_of_Destiny_Pretension_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1790,'Yggdrasil Speaks to Me','Valkyrie Profile','2026-08-13T15:29:49.744458+00:00','https://www.youtube.com/watch?v=4oobQQumiZk',547,'https://ocrmirror.org/files/music/remixes/Valkyrie_Profile_Yggdrasil_Speaks_to_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1791,'Lava Dead Beat','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-13T06:55:45.163932+00:00','https://www.youtube.com/watch?v=-XUstWHq-54',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Lava_Dead_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1792,'Holiday Frappe','Mario Kart 64','2026-08-12T23:10:05.000605+00:00','https://www.youtube.com/watch?v=relIaeNODg4',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Holiday_Frappe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1793,'El Lagarto','The Adventures of Bayou Billy','2026-08-13T13:56:38.920601+00:00','https://www.youtube.com/watch?v=xn8zj1--_bg',304,'https://ocrmirror.org/files/music/remixes/Adventures_of_Bayou_Billy_El_Lagarto_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1794,'Sand in My Shoe','Sonic & Knuckles','2026-08-13T06:55:44.897849+00:00','https://www.youtube.com/watch?v=pYdHeerolZU',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Sand_in_My_Shoe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1795,'Last Chance','Lufia II: Rise of the Sinistrals','2026-08-13T12:09:01.768130+00:00','https://www.youtube.com/watch?v=k5yERSKI93I',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Last_Chance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1796,'Mechanical God: Create|Corrupt|Consume','Xenogears','2026-08-13T08:50:31.414559+00:00','https://www.youtube.com/watch?v=cqjVBQNKQew',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Mechanical_God_Create_Corrupt_Consume_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1797,'Chrono Moonstone','Chrono Trigger','2026-08-13T12:09:01.235636+00:00','https://www.youtube.com/watch?v=sGszk302sf0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Chrono_Moonstone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1798,'Purity','Final Fantasy VI','2026-08-13T05:17:00.931944+00:00','https://www.youtube.com/watch?v=GfnL57IPJHw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Purity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1799,'Flubber Mountain','Super Mario RPG: Legend of the Seven Stars','2026-08-13T13:56:39.095957+00:00','https://www.youtube.com/watch?v=jkYgS00C2XE',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Flubber_Mountain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1800,'Jade Catacombs','Super Metroid','2026-08-13T21:20:30.198262+00:00','https://www.youtube.com/watch?v=Mn-YqUQTwWE',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Jade_Catacombs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1801,'Brazzy Road','Ragnarök Online','2026-08-13T08:50:31.770439+00:00','https://www.youtube.com/watch?v=8k9BJDJOGsA',542,'https://ocrmirror.org/files/music/remixes/Ragnarok_Online_Brazzy_Road_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1802,'Claustrophobia','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-13T17:30:19.080171+00:00','https://www.youtube.com/watch?v=2Wpvt8y3hY8',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Claustrophobia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1803,'Armed and Dangerous','Bionic Commando','2026-08-13T06:55:45.693814+00:00','https://www.youtube.com/watch?v=S_X8FF94vtA',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Armed_and_Dangerous_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1804,'The Galaxy Awaits','Super Metroid','2026-08-13T15:29:49.399852+00:00','https://www.youtube.com/watch?v=n-yeaLfIndM',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_The_Galaxy_Awaits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1805,'But the Future Refused to Change','Chrono Trigger','2026-08-13T19:34:03.699834+00:00','https://www.youtube.com/watch?v=zROJkDPoBpQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_But_the_Future_Refused_to_Change_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1806,'Permutation','Donkey Kong Country','2026-08-14T03:05:56.394557+00:00','https://www.youtube.com/watch?v=tzIte4qpQMI',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Permutation_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1807,'Close Door All Way','Chrono Trigger','2026-08-13T15:29:49.915372+00:00','https://www.youtube.com/watch?v=7QX9HEz4qog',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Close_Door_All_Way_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1808,'31 Seconds','Doom II: Hell on Earth','2026-08-13T05:17:02.032327+00:00','https://www.youtube.com/watch?v=104GjEBZt1k',841,'https://ocrmirror.org/files/music/remixes/Doom_2_31_Seconds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1809,'Flowers, Life and Memory','Lufia & The Fortress of Doom','2026-08-13T00:06:27.003133+00:00','https://www.youtube.com/watch?v=GPuoDI4Qn-w',156,'https://ocrmirror.org/files/music/remixes/Lufia_&_The_Fortress_of_Doom_Flowers_Life_and_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1810,'Who''s That Child?','Castlevania','2026-08-13T08:50:31.593098+00:00','https://www.youtube.com/watch?v=EjpM2HbYvx4',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Who''s_That_Child_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1811,'Sun Ra','Ragnarök Online','2026-08-13T06:55:44.487508+00:00','https://www.youtube.com/watch?v=AT5Ud80sGyQ',542,'https://ocrmirror.org/files/music/remixes/Ragnarok_Online_Sun_Ra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1812,'The Unholy Wars','Tales of Phantasia','2026-08-13T22:10:27.341838+00:00','https://www.youtube.com/watch?v=1yoGYSIJEYY',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_The_Unholy_Wars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1813,'Strike of the Devil''s Axes','Tales of Symphonia','2026-08-13T16:27:35.299662+00:00','https://www.youtube.com/watch?v=JkeiYpn14dk',533,'https://ocrmirror.org/files/music/remixes/Tales_of_Symphonia_Strike_of_the_Devil''s_Axes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1814,'Sweet Dreams','Tales of Phantasia','2026-08-13T12:09:02.652094+00:00','https://www.youtube.com/watch?v=3d3PPA34aNY',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Sweet_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1815,'Crisis Healing Salve','Tales of Phantasia','2026-08-13T15:29:48.539223+00:00','https://www.youtube.com/watch?v=zAWA4nuXuqI',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Crisis_Healing_Salve_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1816,'Magnet Missiles','Mega Man 3','2026-08-13T17:30:19.787288+00:00','https://www.youtube.com/watch?v=-cJaXI1lVuU',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Magnet_Missiles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1817,'Just Go','Tales of Phantasia','2026-08-13T13:56:38.392433+00:00','https://www.youtube.com/watch?v=_GLWEJ1AKxA',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Just_Go_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1818,'This Hazy Place','Final Fantasy VI','2026-08-13T13:56:38.569418+00:00','https://www.youtube.com/watch?v=B1eYqkHdHUo',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_This_Hazy_Place_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1819,'Setting Sail','Tales of Phantasia','2026-08-13T19:34:03.524879+00:00','https://www.youtube.com/watch?v=pa8GwtMb3lU',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Setting_Sail_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1820,'In Your Prime','Super Metroid','2026-08-13T21:20:29.846319+00:00','https://www.youtube.com/watch?v=188xD74SpKw',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_In_Your_Prime_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1821,'Demon Seed (Corrupted Infatuation)','Castlevania III: Dracula''s Curse','2026-08-13T10:35:27.529068+00:00','https://www.youtube.com/watch?v=hzdOlG-oE-U',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Demon_Seed_(Corrupted_Infatuation)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1822,'Flying with the Funk','Donkey Kong Country','2026-08-13T21:20:30.905206+00:00','https://www.youtube.com/watch?v=HuA6QhahE-g',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Flying_with_the_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1823,'Space Cowboy','Gun.Smoke','2026-08-13T13:56:37.507969+00:00','https://www.youtube.com/watch?v=7d2gmwVPT2A',153,'https://ocrmirror.org/files/music/remixes/GunSmoke_Space_Cowboy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1824,'Transylvanian Temptation','Castlevania','2026-08-13T16:27:35.645358+00:00','https://www.youtube.com/watch?v=umvDK_q4UzE',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Transylvanian_Temptation_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1825,'Polar Star Overdrive','Cave Story','2026-08-13T08:50:31.045361+00:00','https://www.youtube.com/watch?v=r7nDaF9ETgw',486,'https://ocrmirror.org/files/music/remixes/Cave_Story_Polar_Star_Overdrive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1826,'Fight for Our Future!','Chrono Trigger','2026-08-13T17:30:18.902666+00:00','https://www.youtube.com/watch?v=OxtuVf7lt4Y',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Fight_for_Our_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1827,'Summoned Without Reason','Tales of Phantasia','2026-08-13T13:56:38.215398+00:00','https://www.youtube.com/watch?v=25hNUwdcIY8',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Summoned_Without_Reason_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1828,'Heat Vision','Super Metroid','2026-08-13T16:27:35.818647+00:00','https://www.youtube.com/watch?v=m0PJG9OS3es',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Heat_Vision_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1829,'Battle ~ Trials of a Cocoon Master','Jade Cocoon: Story of the Tamamayu','2026-08-13T15:29:49.228260+00:00','https://www.youtube.com/watch?v=BEtt2NtOo5I',512,'https://ocrmirror.org/files/music/remixes/Jade_Cocoon_Battle_Trials_of_a_Cocoon_Master_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1830,'Declaration of War','Gradius III','2026-08-13T21:20:31.081317+00:00','https://www.youtube.com/watch?v=wsHIMJ5sXq8',555,'https://ocrmirror.org/files/music/remixes/Gradius_3_Declaration_of_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1831,'Inspector Strago','Final Fantasy VI','2026-08-13T17:30:19.610837+00:00','https://www.youtube.com/watch?v=m0GfofSo0fY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Inspector_Strago_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1832,'Breakbeat Market','Super Dodge Ball','2026-08-13T12:09:02.475506+00:00','https://www.youtube.com/watch?v=jnlY3gYG6vw',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Breakbeat_Market_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1833,'I''ve Got 5 Skateboards Right Here','Skate or Die','2026-08-13T10:35:27.703807+00:00','https://www.youtube.com/watch?v=YhFPvXNpuvc',559,'https://ocrmirror.org/files/music/remixes/Skate_or_Die_I''ve_Got_5_Skateboards_Right_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1834,'Spreading the Culture','Sins of a Solar Empire','2026-08-13T12:09:02.299242+00:00','https://www.youtube.com/watch?v=2EHvTP2CL40',560,'https://ocrmirror.org/files/music/remixes/Sins_of_a_Solar_Empire_Spreading_the_Culture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1835,'Dance Nation','Top Gear 2','2026-08-13T19:34:02.459188+00:00','https://www.youtube.com/watch?v=VFaHnMFH0Bc',513,'https://ocrmirror.org/files/music/remixes/Top_Gear_2_Dance_Nation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1836,'Corrupter of Time','Chrono Trigger','2026-08-13T23:11:07.904734+00:00','https://www.youtube.com/watch?v=oupDl0isifU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Corrupter_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1837,'History of the Bell City','Ultima Online: Renaissance','2026-08-13T12:09:01.054653+00:00','https://www.youtube.com/watch?v=rDCZ5CTdBk0',562,'https://ocrmirror.org/files/music/remixes/Ultima_Online_Renaissance_History_of_the_Bell_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1838,'Live from [SUBJECT HOMETOWN HERE]','Portal','2026-08-14T03:05:56.218863+00:00','https://www.youtube.com/watch?v=TtUH80ZLqEM',561,'https://ocrmirror.org/files/music/remixes/Portal_Live_from_[SUBJECT_HOMETOWN_HERE]_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1839,'City Corner Lullaby','Final Fantasy VI','2026-08-13T17:30:19.434777+00:00','https://www.youtube.com/watch?v=B038MFcX8SU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_City_Corner_Lullaby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1840,'Mountain of Dreams','The Legend of Zelda: Link''s Awakening','2026-08-13T17:30:18.726286+00:00','https://www.youtube.com/watch?v=XfBBYFvKYHQ',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Mountain_of_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1841,'Every Story Begins with a Name','Final Fantasy VII','2026-08-13T22:10:27.865898+00:00','https://www.youtube.com/watch?v=igmUDRPunqk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Every_Story_Begins_with_a_Name_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1842,'Icon of Sinwave','Doom II: Hell on Earth','2026-08-13T15:29:50.085082+00:00','https://www.youtube.com/watch?v=pGi0AphvY_s',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Icon_of_Sinwave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1843,'Destined for Greatness','Sid Meier''s Civilization IV','2026-08-14T08:44:32.157809+00:00','https://www.youtube.com/watch?v=5HGxbWpf-5M',566,'https://ocrmirror.org/files/music/remixes/Civilization_4_Destined_for_Greatness_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1844,'JESUS CHRIST IT''S A DINOSAUR GET IN THE EPOCH','Chrono Trigger','2026-08-13T23:11:08.252157+00:00','https://www.youtube.com/watch?v=v5QSrKJXJ1o',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_JESUS_CHRIST_IT''S_A_DINOSAUR_GET_IN_THE_EPOCH_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1845,'Zelda Heineken','The Legend of Zelda','2026-08-13T19:34:02.647891+00:00','https://www.youtube.com/watch?v=vCwLvsYmCOU',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Zelda_Heineken_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1846,'Cross-Examination (Sudden Interjection)','Phoenix Wright: Ace Attorney','2026-08-13T10:35:26.294380+00:00','https://www.youtube.com/watch?v=2PoVdxv9Po4',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_Cross-Examination_(Sudden_Interjection)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1847,'The Shinra Shuffle','Final Fantasy VII','2026-08-13T22:10:28.039088+00:00','https://www.youtube.com/watch?v=bCq9XDNuRF8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Shinra_Shuffle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1848,'Kara-Turian Nights','Neverwinter Nights','2026-08-13T15:29:48.713753+00:00','https://www.youtube.com/watch?v=6umWU_VsR7E',564,'https://ocrmirror.org/files/music/remixes/Neverwinter_Nights_Kara-Turian_Nights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1849,'Ragol Weather','Phantasy Star Online','2026-08-14T03:05:56.747078+00:00','https://www.youtube.com/watch?v=Lv8evu-myAI',272,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_Online_Ragol_Weather_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1850,'Go the Distance','Tales of Symphonia: Dawn of the New World','2026-08-13T17:30:19.257595+00:00','https://www.youtube.com/watch?v=lKYysL21L6g',568,'https://ocrmirror.org/files/music/remixes/Tales_of_Symphonia_Dawn_of_the_New_World_Go_the_Distance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1851,'Devotion & Deception','Final Fantasy VIII','2026-08-13T23:11:07.558137+00:00','https://www.youtube.com/watch?v=OIbZrawujCM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Devotion_&_Deception_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1852,'The World''s Smallest Giant','Ecco: The Tides of Time','2026-08-13T16:27:35.472946+00:00','https://www.youtube.com/watch?v=Jzv8kSgH6A8',362,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_The_World''s_Smallest_Giant_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1853,'Ce pays me rend mauvais','Faxanadu','2026-08-13T16:27:34.953110+00:00','https://www.youtube.com/watch?v=iOo_jvBh8xM',114,'https://ocrmirror.org/files/music/remixes/Faxanadu_Ce_pays_me_rend_mauvais_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1854,'Don''t Mess with Rygar','Rygar','2026-08-13T15:29:49.570438+00:00','https://www.youtube.com/watch?v=RpdMIzMyN7s',150,'https://ocrmirror.org/files/music/remixes/Rygar_Don''t_Mess_with_Rygar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1855,'The Wily Malfunction','Mega Man 2','2026-08-14T05:13:58.120646+00:00','https://www.youtube.com/watch?v=WqiMjPcMvXg',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Wily_Malfunction_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1856,'Difficult Move Indeed','SD Snatcher','2026-08-13T23:11:07.731146+00:00','https://www.youtube.com/watch?v=5gdzh_KQz6M',567,'https://ocrmirror.org/files/music/remixes/SD_Snatcher_Difficult_Move_Indeed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1857,'Vision of Celes','Final Fantasy VI','2026-08-13T16:27:34.604106+00:00','https://www.youtube.com/watch?v=fF0oX1Lf1tw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Vision_of_Celes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1858,'Rockin'' the Yard','Super Dodge Ball','2026-08-13T16:27:35.992526+00:00','https://www.youtube.com/watch?v=ekp2c9tJ8Po',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Rockin''_the_Yard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1859,'The Rose General','Final Fantasy IX','2026-08-14T05:13:59.676391+00:00','https://www.youtube.com/watch?v=Bv1ayA8flDA',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_The_Rose_General_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1860,'Sunshine Through My Window','Little Nemo: The Dream Master','2026-08-13T19:34:03.350145+00:00','https://www.youtube.com/watch?v=XpinM6aInpo',124,'https://ocrmirror.org/files/music/remixes/Little_Nemo_Sunshine_Through_My_Window_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1861,'Sacred Flute','The Legend of Zelda: A Link to the Past','2026-08-13T23:11:07.207436+00:00','https://www.youtube.com/watch?v=OpO50LDGfR4',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Sacred_Flute_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1862,'Corridor of Time (Time Warp Mix)','Chrono Trigger','2026-08-14T00:07:03.839916+00:00','https://www.youtube.com/watch?v=xBTrqeUAik0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Corridor_of_Time_(Time_Warp_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1863,'Youthful Bravery','Vagrant Story','2026-08-13T10:35:27.005174+00:00','https://www.youtube.com/watch?v=Ov5MeLgLN4E',563,'https://ocrmirror.org/files/music/remixes/Vagrant_Story_Youthful_Bravery_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1864,'The Hot Pink of Blues','Final Fantasy VI','2026-08-13T23:11:08.077586+00:00','https://www.youtube.com/watch?v=jHFO71wxX_w',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Hot_Pink_of_Blues_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1865,'Asphyxiated Soul','Doom','2026-08-14T08:44:32.028871+00:00','https://www.youtube.com/watch?v=LPyTlYazfoI',14512,'https://ocrmirror.org/files/music/remixes/Doom_Asphyxiated_Soul_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1866,'Why So Serious?','Super Mario Land','2026-08-14T10:32:09.143855+00:00','https://www.youtube.com/watch?v=Uj7Zvb__axo',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Why_So_Serious_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1867,'The Dark','Final Fantasy IV','2026-08-13T15:29:48.887993+00:00','https://www.youtube.com/watch?v=sO_MRKu2kC4',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Dark_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1868,'Magicite Made My Mind Melt','Final Fantasy VI','2026-08-13T22:10:27.168325+00:00','https://www.youtube.com/watch?v=JWoLYBGx4D4',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Magicite_Made_My_Mind_Melt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1869,'Lonely Petals','Super Metroid','2026-08-14T00:07:04.016752+00:00','https://www.youtube.com/watch?v=1XgOrG8Idjk',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Lonely_Petals_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1870,'Holiday with Mia Fey','Phoenix Wright: Ace Attorney','2026-08-13T22:10:27.515289+00:00','https://www.youtube.com/watch?v=0MqgcthO2GU',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_Holiday_with_Mia_Fey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1871,'The Shining Blue Armor Descends','Valkyrie Profile','2026-08-13T21:20:30.551873+00:00','https://www.youtube.com/watch?v=rA2dMCi6oG4',547,'https://ocrmirror.org/files/music/remixes/Valkyrie_Profile_The_Shining_Blue_Armor_Descends_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1872,'Plumber''s Bane: I. Don''t Look Back!','New Super Mario Bros.','2026-08-14T03:05:55.866324+00:00','https://www.youtube.com/watch?v=snt70CyY_oU',489,'https://ocrmirror.org/files/music/remixes/New_Super_Mario_Bros_Plumber''s_Bane_I_Don''t_Look_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1873,'The Forerunner Mix (Gamma)','Marathon','2026-08-13T19:34:04.048577+00:00','https://www.youtube.com/watch?v=stjRf51p-5U',444,'https://ocrmirror.org/files/music/remixes/Marathon_The_Forerunner_Mix_(Gamma)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1874,'Giant Robot Bonanza','Live A Live','2026-08-13T17:30:18.370589+00:00','https://www.youtube.com/watch?v=fXLnrXMhHaw',556,'https://ocrmirror.org/files/music/remixes/Live_A_Live_Giant_Robot_Bonanza_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1875,'Fighting for Tomorrow','Final Fantasy IV','2026-08-14T12:07:52.983143+00:00','https://www.youtube.com/watch?v=DwXc6g4dqq8',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Fighting_for_Tomorrow_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1876,'Golbez''n Goblins','Final Fantasy IV','2026-08-14T10:32:09.499585+00:00','https://www.youtube.com/watch?v=ZhK0-gJYfcc',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Golbez''n_Goblins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1877,'Fallen Dragoon','Final Fantasy IV','2026-08-14T03:05:55.510640+00:00','https://www.youtube.com/watch?v=9c3AUMLo_k0',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Fallen_Dragoon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1878,'Survival Instinct','Final Fantasy IV','2026-08-14T00:07:03.490466+00:00','https://www.youtube.com/watch?v=brwp2rnRZcA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Survival_Instinct_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1879,'In the Land of Dwarves','Final Fantasy IV','2026-08-14T00:07:04.366482+00:00','https://www.youtube.com/watch?v=ewSrKNFqnzQ',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_In_the_Land_of_Dwarves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1880,'Somewhere to Hide','Final Fantasy IV','2026-08-14T00:07:04.191247+00:00','https://www.youtube.com/watch?v=WQM3taNNJMI',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Somewhere_to_Hide_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1881,'A Savior Ascends','Final Fantasy IV','2026-08-13T22:10:27.689014+00:00','https://www.youtube.com/watch?v=fNCAlWLQHks',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_A_Savior_Ascends_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1882,'Theme of Love for Guitar Duet','Final Fantasy IV','2026-08-13T19:34:03.175099+00:00','https://www.youtube.com/watch?v=mG64XRvzKeU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Theme_of_Love_for_Guitar_Duet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1883,'Contract Cleaner','Hitman: Codename 47','2026-08-13T16:27:34.777867+00:00','https://www.youtube.com/watch?v=YpOfJTzHre0',375,'https://ocrmirror.org/files/music/remixes/Hitman_Codename_47_Contract_Cleaner_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1884,'Hell March to the Apocalypse','Command & Conquer: Red Alert','2026-08-14T06:53:05.919416+00:00','https://www.youtube.com/watch?v=jNcw6znVZN0',75,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Red_Alert_Hell_March_to_the_Apocalypse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1885,'Kind of Green','Final Fantasy IV','2026-08-13T22:10:26.991673+00:00','https://www.youtube.com/watch?v=ZxseRPkFMt4',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Kind_of_Green_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1886,'Battling Despair at Dawn','Final Fantasy XI Online','2026-08-14T05:13:59.504377+00:00','https://www.youtube.com/watch?v=NLJfAarawVw',546,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_Battling_Despair_at_Dawn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1887,'Beyond Velocity','F-Zero GX','2026-08-14T00:07:04.717409+00:00','https://www.youtube.com/watch?v=hknNlxpAlUg',402,'https://ocrmirror.org/files/music/remixes/F-Zero_GX_Beyond_Velocity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1888,'Snowboardin'' Sonic','Sonic the Hedgehog 3','2026-08-14T13:52:44.946940+00:00','https://www.youtube.com/watch?v=AyfDseBXOvc',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Snowboardin''_Sonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1889,'Dr. Wily Symphonic','Mega Man 2','2026-08-13T21:20:30.022277+00:00','https://www.youtube.com/watch?v=_F51vKdwpuU',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Dr_Wily_Symphonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1890,'Kraid Begins','Metroid','2026-08-13T21:20:31.257002+00:00','https://www.youtube.com/watch?v=_o55Bd-Yp4g',73,'https://ocrmirror.org/files/music/remixes/Metroid_Kraid_Begins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1891,'Kid Malicious','Reset Generation','2026-08-14T03:05:56.042847+00:00','https://www.youtube.com/watch?v=sHz1kGXWPss',569,'https://ocrmirror.org/files/music/remixes/Reset_Generation_Kid_Malicious_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1892,'Éminence Grise','Final Fantasy IV','2026-08-14T10:32:09.321902+00:00','https://www.youtube.com/watch?v=xJNzrH7CcNg',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Eminence_Grise_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1893,'Wily''s Requiem','Mega Man 2','2026-08-14T06:53:05.384172+00:00','https://www.youtube.com/watch?v=zBUVIx3klSk',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wily''s_Requiem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1894,'Silent Healer','Doom II: Hell on Earth','2026-08-13T21:20:30.374497+00:00','https://www.youtube.com/watch?v=uLGE6Ri7L1s',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Silent_Healer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1895,'Fly','Pilotwings','2026-08-13T17:30:19.964107+00:00','https://www.youtube.com/watch?v=u4mYmAYehJo',570,'https://ocrmirror.org/files/music/remixes/Pilotwings_Fly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1896,'B.A.M.F. (Radio Edit)','Chrono Trigger','2026-08-14T10:32:09.852142+00:00','https://www.youtube.com/watch?v=51WTEXXxEAo',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_BAMF_(Radio_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1897,'TRIX','Reset Generation','2026-08-14T05:13:58.987144+00:00','https://www.youtube.com/watch?v=VO3xN-dAPKw',569,'https://ocrmirror.org/files/music/remixes/Reset_Generation_TRIX_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1898,'14.5 West Coast Radio (EXPN Card Required)','Pokémon Crystal Version','2026-08-14T12:07:52.632710+00:00','https://www.youtube.com/watch?v=1IUsBBw_cDs',573,'https://ocrmirror.org/files/music/remixes/Pokemon_Crystal_Version_14-5_West_Coast_Radio_(EXPN_Card_Required)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1899,'Ubon Orih, Latrom Mieht','Lost Odyssey','2026-08-13T19:34:02.823845+00:00','https://www.youtube.com/watch?v=BrkFJhin66I',571,'https://ocrmirror.org/files/music/remixes/Lost_Odyssey_Ubon_Orih_Latrom_Mieht_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1900,'Overflow','VectorMan','2026-08-14T06:53:05.561192+00:00','https://www.youtube.com/watch?v=OTtTnkBKexA',173,'https://ocrmirror.org/files/music/remixes/Vectorman_Overflow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1901,'Full of Hope','Final Fantasy VII','2026-08-14T05:13:59.159447+00:00','https://www.youtube.com/watch?v=2DmA_0QOXmk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Full_of_Hope_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1902,'I Want You Inside Me','Kirby: Canvas Curse','2026-08-14T05:13:58.297691+00:00','https://www.youtube.com/watch?v=U4eegPx_AgU',572,'https://ocrmirror.org/files/music/remixes/Kirby_Canvas_Curse_I_Want_You_Inside_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1903,'Judgement','Final Fantasy X','2026-08-13T17:30:18.550003+00:00','https://www.youtube.com/watch?v=ShJKKDl_2cg',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Judgement_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1904,'The Accursed Seal','Castlevania II: Simon''s Quest','2026-08-14T12:07:53.330006+00:00','https://www.youtube.com/watch?v=z-eIQMSOgWA',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_The_Accursed_Seal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1905,'Dark World Ballad','The Legend of Zelda: A Link to the Past','2026-08-13T22:10:26.642719+00:00','https://www.youtube.com/watch?v=BN8-eLzJDE8',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_World_Ballad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1906,'Dolphin Ride','Donkey Kong Country','2026-08-14T03:05:55.334208+00:00','https://www.youtube.com/watch?v=QElcThkIenk',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Dolphin_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1907,'The End','Final Fantasy VII','2026-08-14T13:52:44.433539+00:00','https://www.youtube.com/watch?v=W_Hgvn5PRjY',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_End_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1908,'Tree Hopper','Chrono Trigger','2026-08-14T08:44:32.425718+00:00','https://www.youtube.com/watch?v=bQ9ohwAC9mc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Tree_Hopper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1909,'Crying Planet','Final Fantasy VII','2026-08-13T19:34:03.873897+00:00','https://www.youtube.com/watch?v=eEW-xPezZ5g',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Crying_Planet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1910,'Through Time and Space','Chrono Cross','2026-08-14T03:05:56.572601+00:00','https://www.youtube.com/watch?v=WqwRg4NIEGk',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Through_Time_and_Space_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1911,'Step into the Light','Final Fantasy IV','2026-08-14T00:07:03.665554+00:00','https://www.youtube.com/watch?v=Q0bLQf0pJmI',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Step_into_the_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1912,'Ghost Grove','The Legend of Zelda: A Link to the Past','2026-08-13T23:11:07.036089+00:00','https://www.youtube.com/watch?v=qslB0H6v778',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Ghost_Grove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1913,'The Omen of Jenova','Final Fantasy VII','2026-08-14T10:32:08.433661+00:00','https://www.youtube.com/watch?v=YMmwPJ0qDyg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Omen_of_Jenova_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1914,'Siren Synapse','Deus Ex','2026-08-14T19:28:53.014093+00:00','https://www.youtube.com/watch?v=yq9xJB9_lpU',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Siren_Synapse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1915,'Dark Matter','Kirby 64: The Crystal Shards','2026-08-14T08:44:31.808135+00:00','https://www.youtube.com/watch?v=jiBWXMLkqKQ',577,'https://ocrmirror.org/files/music/remixes/Kirby_64_Dark_Matter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1916,'Braincooler','Mega Man X','2026-08-14T10:32:08.612432+00:00','https://www.youtube.com/watch?v=R_n7lgjWEF4',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Braincooler_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1917,'First Time on Outset','The Legend of Zelda: The Wind Waker','2026-08-14T13:52:44.262923+00:00','https://www.youtube.com/watch?v=j7RGK_evXjc',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_First_Time_on_Outset_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1918,'Zeno Paradox','Xenogears','2026-08-14T16:22:57.935833+00:00','https://www.youtube.com/watch?v=6liDTvfWpCc',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Zeno_Paradox_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1919,'When the Smoke Clears','Xenogears','2026-08-14T17:28:06.217253+00:00','https://www.youtube.com/watch?v=7QsbVIYjKHU',70,'https://ocrmirror.org/files/music/remixes/Xenogears_When_the_Smoke_Clears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1920,'Omen (R3 Mix)','Xenogears','2026-08-14T00:07:03.136232+00:00','https://www.youtube.com/watch?v=EaHuYxCaH3c',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Omen_(R3_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1921,'Of Sea and Fire','Xenogears','2026-08-14T03:05:55.690581+00:00','https://www.youtube.com/watch?v=8Ot0Hm39pfY',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Of_Sea_and_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1922,'Akkadia Rising','Xenogears','2026-08-14T12:07:53.156626+00:00','https://www.youtube.com/watch?v=BXr-mLvPu0g',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Akkadia_Rising_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1923,'Daijiru (Too Hot for Clothes)','Xenogears','2026-08-14T17:28:06.527804+00:00','https://www.youtube.com/watch?v=nCZsp7bM-d8',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Daijiru_(Too_Hot_for_Clothes)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1924,'Swingin'' with Death','Castlevania: Harmony of Dissonance','2026-08-14T10:32:08.788574+00:00','https://www.youtube.com/watch?v=FSwn76B0l6Q',464,'https://ocrmirror.org/files/music/remixes/Castlevania_Harmony_of_Dissonance_Swingin''_with_Death_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1925,'Door into Chaotix','Knuckles'' Chaotix','2026-08-14T05:13:58.470315+00:00','https://www.youtube.com/watch?v=IJlGJPipMY8',239,'https://ocrmirror.org/files/music/remixes/Knuckles''_Chaotix_Door_into_Chaotix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1926,'Down to the Hydrocity''s Nightclub','Sonic the Hedgehog 3','2026-08-14T00:07:04.542487+00:00','https://www.youtube.com/watch?v=CoxLxTlD5rw',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Down_to_the_Hydrocity''s_Nightclub_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1927,'Vampire Snap','Castlevania','2026-08-14T06:53:04.846204+00:00','https://www.youtube.com/watch?v=tX_aRjaRl5Y',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Vampire_Snap_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1928,'The Solace of the Daylight','Castlevania II: Simon''s Quest','2026-08-14T08:44:31.478324+00:00','https://www.youtube.com/watch?v=1s-rlqwtNTU',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_The_Solace_of_the_Daylight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1929,'Madd Forest','Castlevania III: Dracula''s Curse','2026-08-14T06:53:06.457957+00:00','https://www.youtube.com/watch?v=atpUm_Het-E',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Madd_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1930,'The Still Land','Final Fantasy IV','2026-08-14T05:13:58.642299+00:00','https://www.youtube.com/watch?v=UYqybNI7JBE',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Still_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1931,'Exodus to Sanctuary','The Legend of Zelda: A Link to the Past','2026-08-14T15:21:26.336598+00:00','https://www.youtube.com/watch?v=RZFW2DKppgk',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Exodus_to_Sanctuary_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1932,'Pixelated Tales','Tales of Symphonia','2026-08-14T06:53:05.205637+00:00','https://www.youtube.com/watch?v=PiVCaEcedSo',533,'https://ocrmirror.org/files/music/remixes/Tales_of_Symphonia_Pixelated_Tales_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1933,'Berinstar','Super Metroid','2026-08-14T12:07:52.458749+00:00','https://www.youtube.com/watch?v=zEs16z_gp28',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Berinstar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1934,'The Masked Man','Street Fighter II: The World Warrior','2026-08-13T23:11:08.426122+00:00','https://www.youtube.com/watch?v=sD2Kr3vR0ZA',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_The_Masked_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1935,'A Mighty Enemy on the Battlefield','Lost Odyssey','2026-08-14T12:07:52.808777+00:00','https://www.youtube.com/watch?v=RoqcoQJOIYc',571,'https://ocrmirror.org/files/music/remixes/Lost_Odyssey_A_Mighty_Enemy_on_the_Battlefield_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1936,'Minibadass','Aquaria','2026-08-14T16:22:56.830172+00:00','https://www.youtube.com/watch?v=_FpuBEv-rvE',585,'https://ocrmirror.org/files/music/remixes/Aquaria_Minibadass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1937,'Ravaging Reptile','Mega Man 3','2026-08-14T13:52:43.908562+00:00','https://www.youtube.com/watch?v=7-DcWmrJ_1M',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Ravaging_Reptile_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1938,'Psi Piano Omega','EarthBound','2026-08-14T13:52:45.290494+00:00','https://www.youtube.com/watch?v=Xr0ehzsGs3k',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Psi_Piano_Omega_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1939,'BTMNTBAMLOL','Teenage Mutant Ninja Turtles III: The Manhattan Project','2026-08-14T17:28:06.061607+00:00','https://www.youtube.com/watch?v=iaEfhrLBs48',391,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_3_BTMNTBAMLOL_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1940,'Waking the Fish','The Legend of Zelda: Link''s Awakening','2026-08-14T15:21:25.099346+00:00','https://www.youtube.com/watch?v=J522_Mq1z3Y',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Waking_the_Fish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1941,'Wallachian Prince','Banjo-Kazooie','2026-08-14T15:21:25.632781+00:00','https://www.youtube.com/watch?v=Q4vAL47g26o',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_Wallachian_Prince_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1942,'Bros with Dix','Super Mario Bros.','2026-08-14T16:22:58.078756+00:00','https://www.youtube.com/watch?v=FVy8vs2W5Yc',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Bros_with_Dix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1943,'Behind Enemy Lines','Final Fantasy VI','2026-08-14T06:53:05.740236+00:00','https://www.youtube.com/watch?v=CbsuC4w0of0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Behind_Enemy_Lines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1944,'Meteorites and Rabbits','Super Mario Galaxy','2026-08-14T18:26:17.555840+00:00','https://www.youtube.com/watch?v=N2ifVxlhRKs',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Meteorites_and_Rabbits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1945,'Mystic Chemicals','Sonic the Hedgehog 2','2026-08-14T10:32:08.965786+00:00','https://www.youtube.com/watch?v=8Rx1KGl9l1w',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Mystic_Chemicals_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1946,'A World of Decisions','Final Fantasy VI','2026-08-14T10:32:10.029625+00:00','https://www.youtube.com/watch?v=HmqtL1XJOkA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_A_World_of_Decisions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1947,'Big-Band Battlefield','Super Mario 64','2026-08-14T17:28:06.682592+00:00','https://www.youtube.com/watch?v=ZwMjnsJ0HMo',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Big-Band_Battlefield_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1948,'SeeD Mission','Final Fantasy VIII','2026-08-14T12:07:52.283045+00:00','https://www.youtube.com/watch?v=3vtA6s3B9R4',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_SeeD_Mission_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1949,'Lagi''s Takeoff','Panzer Dragoon II Zwei','2026-08-14T13:52:44.604751+00:00','https://www.youtube.com/watch?v=QO2QwB5g85s',582,'https://ocrmirror.org/files/music/remixes/Panzer_Dragoon_2_Zwei_Lagi''s_Takeoff_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1950,'Eye of the Storm','The Legend of Zelda: Ocarina of Time','2026-08-14T17:28:05.849523+00:00','https://www.youtube.com/watch?v=NWzLu1xRyK4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Eye_of_the_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1951,'Canine Labyrinth','Secret of Evermore','2026-08-14T06:53:05.026925+00:00','https://www.youtube.com/watch?v=a_C2b13CeM0',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_Canine_Labyrinth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1952,'Sonic Gargles with Garden Marbles','Sonic the Hedgehog 3','2026-08-14T13:52:44.086497+00:00','https://www.youtube.com/watch?v=P_8Xg72n0IM',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Sonic_Gargles_with_Garden_Marbles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1953,'Cut Man''s Lullaby','Mega Man','2026-08-14T08:44:31.917379+00:00','https://www.youtube.com/watch?v=94-DXNr8rjE',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Cut_Man''s_Lullaby_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1954,'C.H.E.E.T.A.H.','Cheetahmen II','2026-08-14T18:26:18.269267+00:00','https://www.youtube.com/watch?v=c7b0pp9O4Ec',524,'https://ocrmirror.org/files/music/remixes/Cheetahmen_2_CHEETAH_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1955,'Sea/Sky','Secret of Mana','2026-08-14T13:52:44.775698+00:00','https://www.youtube.com/watch?v=FHo9V-2lzsA',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Sea_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1956,'A Ring and a Promise','Wild Arms','2026-08-14T23:47:27.275340+00:00','https://www.youtube.com/watch?v=mrdx1LjxcfI',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_A_Ring_and_a_Promise_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1957,'A Fine Place to Live','Final Fantasy X','2026-08-14T16:22:57.292500+00:00','https://www.youtube.com/watch?v=AdPveMvFW7g',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_A_Fine_Place_to_Live_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1958,'Hidden Within','Sonic & Knuckles','2026-08-14T16:22:57.614859+00:00','https://www.youtube.com/watch?v=h7f5deRz7Hc',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Hidden_Within_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1959,'Thrash''s Snakebone Pit','Radical Dreamers: Nusumenai Houseki','2026-08-14T12:07:53.678028+00:00','https://www.youtube.com/watch?v=NdOLQQIx3t4',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Thrash''s_Snakebone_Pit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1960,'Shiny New Ferrari','OutRun','2026-08-14T19:28:52.489998+00:00','https://www.youtube.com/watch?v=wgv_IZOHek0',139,'https://ocrmirror.org/files/music/remixes/OutRun_Shiny_New_Ferrari_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1961,'Ghosts''n Condoms','Ghosts''n Goblins','2026-08-14T12:07:53.504772+00:00','https://www.youtube.com/watch?v=uKPNIzcJna4',119,'https://ocrmirror.org/files/music/remixes/Ghosts''n_Goblins_Ghosts''n_Condoms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1962,'Juunen Hayaindayou','Virtua Fighter 2','2026-08-14T20:55:33.850920+00:00','https://www.youtube.com/watch?v=X3H2md_oO3E',584,'https://ocrmirror.org/files/music/remixes/Virtua_Fighter_2_Juunen_Hayaindayou_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1963,'The Flying Machine','Final Fantasy IV','2026-08-14T18:26:17.382304+00:00','https://www.youtube.com/watch?v=gNHamEMhpfA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Flying_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1964,'Aire Tam Break','Final Fantasy VII','2026-08-14T19:28:52.663084+00:00','https://www.youtube.com/watch?v=1d-LqPod19Q',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Aire_Tam_Break_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1965,'as time goes on (you are love to me)','Tales of Phantasia','2026-08-14T17:28:06.372654+00:00','https://www.youtube.com/watch?v=3YxaVBjFK6Q',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_as_time_goes_on_(you_are_love_to_me)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1966,'Flames of Darkness','Mega Man ZX','2026-08-14T06:53:06.101898+00:00','https://www.youtube.com/watch?v=n14TFvSb39g',580,'https://ocrmirror.org/files/music/remixes/Mega_Man_ZX_Flames_of_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1967,'Romancing the Bossa','Romancing SaGa 3','2026-08-14T12:07:52.101744+00:00','https://www.youtube.com/watch?v=aGRaZQRBycw',590,'https://ocrmirror.org/files/music/remixes/Romancing_SaGa_3_Romancing_the_Bossa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1968,'The Skies Hold No Angels for Us','Final Fantasy IV','2026-08-14T20:55:34.024698+00:00','https://www.youtube.com/watch?v=05ldCINDHlI',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Skies_Hold_No_Angels_for_Us_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1969,'raMble and Mess','Marble Madness','2026-08-14T15:21:25.281514+00:00','https://www.youtube.com/watch?v=5uwMrqbYXUE',286,'https://ocrmirror.org/files/music/remixes/Marble_Madness_raMble_and_Mess_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1970,'A Path to Hyrule','The Legend of Zelda: A Link to the Past','2026-08-14T16:22:57.770260+00:00','https://www.youtube.com/watch?v=IPIhDAUskCo',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_A_Path_to_Hyrule_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1971,'The Prophecy of Alhazard','Langrisser II','2026-08-14T20:04:33.113302+00:00','https://www.youtube.com/watch?v=PNAiv3wEfjQ',593,'https://ocrmirror.org/files/music/remixes/Langrisser_2_The_Prophecy_of_Alhazard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1972,'My Child','Xenogears','2026-08-14T19:28:53.362286+00:00','https://www.youtube.com/watch?v=EUoKVz4wSMM',70,'https://ocrmirror.org/files/music/remixes/Xenogears_My_Child_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1973,'Wet Dreams','Castlevania: Symphony of the Night','2026-08-14T16:22:57.138043+00:00','https://www.youtube.com/watch?v=9mTXEMDgX24',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Wet_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1974,'Trance Turnabout!','Phoenix Wright: Ace Attorney','2026-08-14T20:04:34.169003+00:00','https://www.youtube.com/watch?v=fObINP_cVkU',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_Trance_Turnabout_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1975,'Absolution Comes in Dreams','Sonic the Hedgehog','2026-08-15T01:56:14.589789+00:00','https://www.youtube.com/watch?v=FWtdLdi2USU',583,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Absolution_Comes_in_Dreams_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1976,'Forgone Rejuvenation','Unreal Tournament','2026-08-14T20:55:33.326890+00:00','https://www.youtube.com/watch?v=pYXVdgvjQAE',445,'https://ocrmirror.org/files/music/remixes/Unreal_Tournament_Forgone_Rejuvenation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1977,'Morse''s Morsecode','Fittest','2026-08-14T15:21:25.986130+00:00','https://www.youtube.com/watch?v=GjijF85aJHA',594,'https://ocrmirror.org/files/music/remixes/Fittest_Morse''s_Morsecode_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1978,'The Electric Flute','The Legend of Zelda: Four Swords Adventures','2026-08-14T17:28:05.415175+00:00','https://www.youtube.com/watch?v=tv0DGsK9yPw',589,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Four_Swords_Adventures_The_Electric_Flute_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1979,'Altar Perception','Tales of Symphonia','2026-08-14T19:28:53.188326+00:00','https://www.youtube.com/watch?v=oCbfc_N5nHM',533,'https://ocrmirror.org/files/music/remixes/Tales_of_Symphonia_Altar_Perception_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1980,'Destiny Forgotten','Kingdom Hearts','2026-08-14T21:49:19.918570+00:00','https://www.youtube.com/watch?v=LjWREabIibs',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Destiny_Forgotten_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1981,'Chun-Li (Nemesis Mix)','Marvel vs. Capcom: Clash of Super Heroes','2026-08-14T15:21:26.686516+00:00','https://www.youtube.com/watch?v=6vs0XXkSOmc',595,'https://ocrmirror.org/files/music/remixes/Marvel_vs_Capcom_Chun-Li_(Nemesis_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1982,'Naito Obu [br00tl]','Touhou Kaeidzuka: Phantasmagoria of Flower View','2026-08-14T20:04:33.817789+00:00','https://www.youtube.com/watch?v=27Nk3tfbKH8',587,'https://ocrmirror.org/files/music/remixes/Touhou_Kaeidzuka_Phantasmagoria_of_Flower_View_Naito_Obu_br00tl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1983,'Letting Go','Animal Crossing','2026-08-14T20:04:34.363134+00:00','https://www.youtube.com/watch?v=LGy2JrYRX1U',521,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_Letting_Go_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1984,'Step Off My Flower Bed','Secret of Mana','2026-08-14T22:49:19.780895+00:00','https://www.youtube.com/watch?v=rGUEBT2o394',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Step_Off_My_Flower_Bed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1985,'Echoes','Xenogears','2026-08-14T13:52:45.461644+00:00','https://www.youtube.com/watch?v=QdoKR5ZDBKQ',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Echoes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1986,'Cold Metal','Mega Man 2','2026-08-14T20:55:32.974466+00:00','https://www.youtube.com/watch?v=NRB2RlKaHGU',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Cold_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1987,'Farore Lies in Wait','The Legend of Zelda: A Link to the Past','2026-08-14T20:55:34.378673+00:00','https://www.youtube.com/watch?v=RYEK4kSWPWE',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Farore_Lies_in_Wait_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1988,'Serenity''s Wake','Wave Race 64','2026-08-14T15:21:26.512015+00:00','https://www.youtube.com/watch?v=nBum3ea8PhI',598,'https://ocrmirror.org/files/music/remixes/Wave_Race_64_Serenity''s_Wake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1989,'...And in Her Self-Loathing and Despair, She Found Wrath','Chrono Trigger','2026-08-14T21:49:19.213162+00:00','https://www.youtube.com/watch?v=ngH9ut0ayPM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_And_in_Her_Self-Loathing_and_Despair_She_Found_Wrath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1990,'Desertion','Final Fantasy VI','2026-08-14T23:47:26.838728+00:00','https://www.youtube.com/watch?v=rCGfkYzY4kA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Desertion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1991,'Seasons','Final Fantasy VIII','2026-08-14T20:55:33.151870+00:00','https://www.youtube.com/watch?v=NrIhcXM9h1M',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Seasons_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1992,'Latis Surrounded','Salamander','2026-08-14T18:26:18.095034+00:00','https://www.youtube.com/watch?v=IUzIU1QvL30',600,'https://ocrmirror.org/files/music/remixes/Salamander_Latis_Surrounded_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1993,'Moving Forward','Mega Man Zero 2','2026-08-14T18:26:17.919607+00:00','https://www.youtube.com/watch?v=BjfM1E2zXHo',434,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_2_Moving_Forward_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1994,'Lacrima','Final Fantasy IV','2026-08-14T17:28:05.601701+00:00','https://www.youtube.com/watch?v=i6kI6SicEPw',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Lacrima_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1995,'Link to the Mask','The Legend of Zelda: Majora''s Mask','2026-08-14T23:47:27.057224+00:00','https://www.youtube.com/watch?v=9cixzSUU5QU',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Link_to_the_Mask_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(1996,'Before Everything Happened','Dark Cloud 2','2026-08-14T20:55:32.797357+00:00','https://www.youtube.com/watch?v=JGFHhwjfvRk',602,'https://ocrmirror.org/files/music/remixes/Dark_Cloud_2_Before_Everything_Happened_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1997,'Waves of Stone','Ecco: The Tides of Time','2026-08-14T19:28:52.836477+00:00','https://www.youtube.com/watch?v=ItevK4lBf8A',364,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Waves_of_Stone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1998,'Atmosphere','Sonic the Hedgehog 2','2026-08-14T17:28:06.839380+00:00','https://www.youtube.com/watch?v=Siscym9Qd5Y',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Atmosphere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(1999,'Rhymes with Elixir','Final Fantasy IV','2026-08-15T03:11:40.889594+00:00','https://www.youtube.com/watch?v=y6GMsJVP9fE',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Rhymes_with_Elixir_OC_ReMix.mp3',1);
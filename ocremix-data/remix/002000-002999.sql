@@ -0,0 +1,952 @@
+INSERT INTO "remix" VALUES(2000,'Re-Skewed','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T04:56:35.704236+00:00','https://www.youtube.com/watch?v=lj4iss5zij4',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Re-Skewed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2001,'Sturm und Kong','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-14T21:49:19.741886+00:00','https://www.youtube.com/watch?v=2uWf_MZgWxg',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Sturm_und_Kong_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2002,'Beneath the Canopy','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-14T19:28:53.535930+00:00','https://www.youtube.com/watch?v=o9O2Y7JgdPA',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Beneath_the_Canopy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2003,'A New Place','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T04:56:35.883533+00:00','https://www.youtube.com/watch?v=W9DyTcJNlUA',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_A_New_Place_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2004,'It''s a Jungle Out There!','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-14T17:28:05.256015+00:00','https://www.youtube.com/watch?v=CkygKQkt8To',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_It''s_a_Jungle_Out_There_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2005,'Dance of the Zinger','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-14T22:49:20.657539+00:00','https://www.youtube.com/watch?v=zXK2s9vVuEw',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Dance_of_the_Zinger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2006,'Trapped in the Minds','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T05:50:43.035253+00:00','https://www.youtube.com/watch?v=5aWfCLkigB4',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Trapped_in_the_Minds_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2007,'Rare Respite','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T03:11:41.246833+00:00','https://www.youtube.com/watch?v=j-Vefzz42WI',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Rare_Respite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2008,'Fossil''s Oasis','Star Fox Adventures','2026-08-14T22:49:20.073190+00:00','https://www.youtube.com/watch?v=Prgn8A3iYkk',601,'https://ocrmirror.org/files/music/remixes/Star_Fox_Adventures_Fossil''s_Oasis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2009,'Thanks for Dinner','Uru: Ages Beyond Myst','2026-08-14T18:26:16.860375+00:00','https://www.youtube.com/watch?v=-32TO0WGA78',603,'https://ocrmirror.org/files/music/remixes/Uru_Thanks_for_Dinner_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2010,'Neon Glaciers','Omega Five','2026-08-14T15:21:25.808749+00:00','https://www.youtube.com/watch?v=AYL0ilDmaxs',605,'https://ocrmirror.org/files/music/remixes/Omega_Five_Neon_Glaciers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2011,'Awakening the Giant','The Legend of Zelda: Majora''s Mask','2026-08-14T19:28:52.136228+00:00','https://www.youtube.com/watch?v=-2lffsPne0c',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Awakening_the_Giant_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2012,'Full of Courage','Final Fantasy IV','2026-08-14T20:04:35.488080+00:00','https://www.youtube.com/watch?v=zeNuOfdGv3Y',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Full_of_Courage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2013,'How Machines Fly','Sonic the Hedgehog 3','2026-08-14T16:22:58.220551+00:00','https://www.youtube.com/watch?v=nD_3mFrSutw',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_How_Machines_Fly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2014,'Utopia','The Legend of Zelda: A Link to the Past','2026-08-14T20:04:35.312356+00:00','https://www.youtube.com/watch?v=ZZYp4in11wE',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Utopia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2015,'Sparkle','Castlevania: Order of Ecclesia','2026-08-14T22:49:19.631651+00:00','https://www.youtube.com/watch?v=NjbKKRnVjSs',579,'https://ocrmirror.org/files/music/remixes/Castlevania_Order_of_Ecclesia_Sparkle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2016,'Rygar''s Anthem','Rygar','2026-08-14T16:22:56.980556+00:00','https://www.youtube.com/watch?v=WBcY09yCfUs',150,'https://ocrmirror.org/files/music/remixes/Rygar_Rygar''s_Anthem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2017,'Welcome Home, DK','Donkey Kong Country','2026-08-14T16:22:57.444931+00:00','https://www.youtube.com/watch?v=UPy2pYbk_l0',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Welcome_Home_DK_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2018,'Electrodispenser','Team Fortress 2','2026-08-15T03:11:41.067259+00:00','https://www.youtube.com/watch?v=GzbbDu52uEs',604,'https://ocrmirror.org/files/music/remixes/Team_Fortress_2_Electrodispenser_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2019,'Seizing the Castle','Super Mario Land 2: 6 Golden Coins','2026-08-14T22:49:20.217645+00:00','https://www.youtube.com/watch?v=XbDvhT__yao',606,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_2_Seizing_the_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2020,'Blazkowicz''s Great Escape','Wolfenstein 3D','2026-08-14T18:26:17.035774+00:00','https://www.youtube.com/watch?v=qYq-mXNDNHM',357,'https://ocrmirror.org/files/music/remixes/Wolfenstein_3D_Blazkowicz''s_Great_Escape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2021,'Another Seascape','Ecco: The Tides of Time','2026-08-14T23:47:26.728806+00:00','https://www.youtube.com/watch?v=mXOYAXH9B2I',607,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Another_Seascape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2022,'Dreamscape','Xenogears','2026-08-14T21:49:19.389064+00:00','https://www.youtube.com/watch?v=MhYwnpLCNek',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Dreamscape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2023,'Shine Tonight','Final Fantasy VIII','2026-08-15T05:50:42.325553+00:00','https://www.youtube.com/watch?v=VoAiCsbMTM0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Shine_Tonight_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2024,'Breakout','Kirby''s Block Ball','2026-08-14T20:55:34.202212+00:00','https://www.youtube.com/watch?v=5wuLQ0cF198',586,'https://ocrmirror.org/files/music/remixes/Kirby''s_Block_Ball_Breakout_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2025,'Space Ace','Gradius III','2026-08-14T21:49:20.095276+00:00','https://www.youtube.com/watch?v=bkQDI6LAnH8',555,'https://ocrmirror.org/files/music/remixes/Gradius_3_Space_Ace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2026,'Battle Axe-Wielding Dwarf','Golden Axe II','2026-08-14T19:28:52.316726+00:00','https://www.youtube.com/watch?v=7DizyUKmjbI',608,'https://ocrmirror.org/files/music/remixes/Golden_Axe_2_Battle_Axe-Wielding_Dwarf_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2027,'Frets of Fury','Street Fighter II: The World Warrior','2026-08-14T20:04:33.290821+00:00','https://www.youtube.com/watch?v=0Y0zVI0nZio',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Frets_of_Fury_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2028,'Time to Oil Up','Super Street Fighter IV','2026-08-15T03:11:40.710541+00:00','https://www.youtube.com/watch?v=Il0SHqrHIzw',609,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_4_Time_to_Oil_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2029,'Samus''s Lonesome Waltz','Metroid Prime','2026-08-15T01:56:13.697213+00:00','https://www.youtube.com/watch?v=PFR2v5yKaxY',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Samus''s_Lonesome_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2030,'Brambles Open Minds Like Bubbles','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T01:56:14.054867+00:00','https://www.youtube.com/watch?v=TqlV4sKEkjc',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Brambles_Open_Minds_Like_Bubbles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2031,'The 2-2 Blues','Super Mario Bros.','2026-08-15T07:06:09.417041+00:00','https://www.youtube.com/watch?v=PIxwZ58_wxE',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_The_2-2_Blues_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2032,'Funky Mario Circuit (Radio Edit)','Super Mario Kart','2026-08-14T20:04:33.993456+00:00','https://www.youtube.com/watch?v=XSsC9lmrHmg',269,'https://ocrmirror.org/files/music/remixes/Super_Mario_Kart_Funky_Mario_Circuit_(Radio_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2033,'Unintentional','Castlevania: Bloodlines','2026-08-14T21:49:19.566967+00:00','https://www.youtube.com/watch?v=s38Xu8biINo',610,'https://ocrmirror.org/files/music/remixes/Castlevania_Bloodlines_Unintentional_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2034,'Bridge to Eternity','Final Fantasy IV','2026-08-15T04:03:23.169550+00:00','https://www.youtube.com/watch?v=tXrsvC25GH8',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Bridge_to_Eternity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2035,'Agahnim Arsenik','The Legend of Zelda: A Link to the Past','2026-08-14T23:47:27.384670+00:00','https://www.youtube.com/watch?v=hBnTv0fFpxo',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Agahnim_Arsenik_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2036,'Nova Siberia','Mass Effect','2026-08-14T20:55:33.502387+00:00','https://www.youtube.com/watch?v=pccc5VPwavo',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_Nova_Siberia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2037,'The Sound of the Galaxy','Mass Effect 2','2026-08-14T22:49:19.930242+00:00','https://www.youtube.com/watch?v=inV0m_qE55s',597,'https://ocrmirror.org/files/music/remixes/Mass_Effect_2_The_Sound_of_the_Galaxy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2038,'The Might of Baron','Final Fantasy IV','2026-08-15T04:03:23.527220+00:00','https://www.youtube.com/watch?v=BNxDpOiqBP0',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Might_of_Baron_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2039,'Mr. Pink Poncho''s Western Rock Band','Sunset Riders','2026-08-15T03:11:40.354977+00:00','https://www.youtube.com/watch?v=4wG6BkuKbE0',618,'https://ocrmirror.org/files/music/remixes/Sunset_Riders_Mr_Pink_Poncho''s_Western_Rock_Band_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2040,'Craving for Burning Blood','Final Fantasy Legend II','2026-08-14T20:04:33.466397+00:00','https://www.youtube.com/watch?v=JhIKFFh4ki8',116,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Legend_2_Craving_for_Burning_Blood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2041,'Coiled Copper Wire','Mega Man 2','2026-08-15T07:52:14.209176+00:00','https://www.youtube.com/watch?v=7XCoLrYpVKw',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Coiled_Copper_Wire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2042,'No Escape, No Hurry','Final Fantasy X','2026-08-14T21:49:19.036669+00:00','https://www.youtube.com/watch?v=Y8dpUBeuKvE',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_No_Escape_No_Hurry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2043,'G.E.R.U.D.O.','The Legend of Zelda: Ocarina of Time','2026-08-15T01:56:14.412227+00:00','https://www.youtube.com/watch?v=sKbWTE_C5bo',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_GERUDO_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2044,'That''s Besaid the Point','Final Fantasy X','2026-08-15T03:11:39.992267+00:00','https://www.youtube.com/watch?v=AwS0-Ogwn4k',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_That''s_Besaid_the_Point_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2045,'Wandering Latinas','Castlevania: Symphony of the Night','2026-08-15T01:56:12.970650+00:00','https://www.youtube.com/watch?v=2eh57U1vnxg',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Wandering_Latinas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2046,'Creeper at the Train Depot','GoldenEye 007','2026-08-14T21:49:18.859763+00:00','https://www.youtube.com/watch?v=z3RbzIpU62c',120,'https://ocrmirror.org/files/music/remixes/GoldenEye_007_Creeper_at_the_Train_Depot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2047,'Great Job!','The Legend of Zelda: A Link to the Past','2026-08-15T04:03:22.452949+00:00','https://www.youtube.com/watch?v=IeO3ZdmKpjo',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Great_Job_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2048,'purdieoldays','Animal Crossing','2026-08-15T05:50:41.435081+00:00','https://www.youtube.com/watch?v=N2hWyf9DXL4',521,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_purdieoldays_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2049,'Pipes','Super Mario Bros. 3','2026-08-14T20:04:33.640391+00:00','https://www.youtube.com/watch?v=um1fUH9Ld64',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Pipes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2050,'SimFunkadelic','SimCity 2000','2026-08-14T23:47:26.617062+00:00','https://www.youtube.com/watch?v=O6VvD48h3Ag',616,'https://ocrmirror.org/files/music/remixes/SimCity_2000_SimFunkadelic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2051,'Do Droids Dream of Ramboids?','One Man and His Droid','2026-08-14T23:47:27.166338+00:00','https://www.youtube.com/watch?v=UrieJykKcLI',614,'https://ocrmirror.org/files/music/remixes/One_Man_and_His_Droid_Do_Droids_Dream_of_Ramboids_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2052,'True Evening','Phoenix Wright: Ace Attorney','2026-08-14T21:49:18.679827+00:00','https://www.youtube.com/watch?v=czHre7YSHmo',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_True_Evening_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2053,'Moonlight Vibin''','Mega Man X5','2026-08-14T22:49:20.364795+00:00','https://www.youtube.com/watch?v=8FwQKfb7h9U',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Moonlight_Vibin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2054,'Essence of Lime','The Legend of Zelda: Oracle of Ages','2026-08-15T03:11:40.533231+00:00','https://www.youtube.com/watch?v=wfIgGTwlB98',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Essence_of_Lime_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2055,'Past, Present, and Future Perfect','The Legend of Zelda: Oracle of Ages','2026-08-15T04:03:22.812852+00:00','https://www.youtube.com/watch?v=Q5mZ_fpNsl0',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Past_Present_and_Future_Perfect_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2056,'Les Gnomes Exotiques','World of Warcraft','2026-08-15T05:50:42.681313+00:00','https://www.youtube.com/watch?v=hVAbvgce_Og',462,'https://ocrmirror.org/files/music/remixes/World_of_Warcraft_Les_Gnomes_Exotiques_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2057,'Hymn of Aveh','Xenogears','2026-08-15T08:55:04.098194+00:00','https://www.youtube.com/watch?v=fQ2-xBdnUaQ',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Hymn_of_Aveh_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2058,'Magic Fountain','The Legend of Zelda: A Link to the Past','2026-08-14T22:49:20.951315+00:00','https://www.youtube.com/watch?v=h7hK8WykJdg',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Magic_Fountain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2059,'Type Valentine MX5','Street Fighter 2010: The Final Fight','2026-08-15T04:03:23.884715+00:00','https://www.youtube.com/watch?v=gAgoWVRX-mw',617,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2010_Type_Valentine_MX5_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2060,'It''s Morphin Time!','Mighty Morphin Power Rangers','2026-08-15T04:56:34.813928+00:00','https://www.youtube.com/watch?v=xZBkiR7FET4',613,'https://ocrmirror.org/files/music/remixes/Mighty_Morphin_Power_Rangers_It''s_Morphin_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2061,'Aurora Borealis','Seiken Densetsu 3','2026-08-15T03:11:40.176405+00:00','https://www.youtube.com/watch?v=5nEHceGl3Pc',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Aurora_Borealis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2062,'The Life and Death of the Mario Brothers','Super Mario Bros.','2026-08-15T08:55:04.643216+00:00','https://www.youtube.com/watch?v=lDOQzyH1LlU',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_The_Life_and_Death_of_the_Mario_Brothers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2063,'Drowning My Lives Away','Sonic the Hedgehog','2026-08-14T20:55:33.676421+00:00','https://www.youtube.com/watch?v=Qe7uAlpWjXc',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Drowning_My_Lives_Away_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2064,'Chemixtrixx','Sonic the Hedgehog 2','2026-08-15T10:48:19.643189+00:00','https://www.youtube.com/watch?v=WQz0PvxGXY0',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Chemixtrixx_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2065,'Ice Cold Retro','Sonic the Hedgehog 3','2026-08-15T01:56:13.513477+00:00','https://www.youtube.com/watch?v=S-F3DHQCIcs',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Ice_Cold_Retro_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2066,'Chromium Asphyxiation','Sonic & Knuckles','2026-08-15T01:56:14.233874+00:00','https://www.youtube.com/watch?v=jx6P64XPSyM',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Chromium_Asphyxiation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2067,'Pipe Dream Mystics','Chrono Trigger','2026-08-15T01:56:13.875112+00:00','https://www.youtube.com/watch?v=98czNG6nOTA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Pipe_Dream_Mystics_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2068,'Mr. Stork! May I Go Home...','Super Mario World 2: Yoshi''s Island','2026-08-14T23:47:27.602933+00:00','https://www.youtube.com/watch?v=yb-1B94XFJY',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Mr_Stork_May_I_Go_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2069,'Castlemania 2010','Castlevania','2026-08-15T04:56:34.991809+00:00','https://www.youtube.com/watch?v=u3UnNvI6rWQ',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Castlemania_2010_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2070,'Dokuta Wairi, Rival to the Light','Mega Man 2','2026-08-15T07:06:09.237375+00:00','https://www.youtube.com/watch?v=yqwkXj3vJQM',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Dokuta_Wairi_Rival_to_the_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2071,'Everclear Hangover IV','Final Fantasy IV','2026-08-15T18:56:02.888954+00:00','https://www.youtube.com/watch?v=thCSBi-Bmg0',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Everclear_Hangover_IV_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2072,'Shiva Nataraja','Diddy Kong Racing','2026-08-15T04:56:35.525124+00:00','https://www.youtube.com/watch?v=AIvaz7L4Ttg',620,'https://ocrmirror.org/files/music/remixes/Diddy_Kong_Racing_Shiva_Nataraja_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2073,'You Gon'' Get Whipped','Castlevania','2026-08-15T04:03:23.706586+00:00','https://www.youtube.com/watch?v=WBlFaanPrg4',18,'https://ocrmirror.org/files/music/remixes/Castlevania_You_Gon''_Get_Whipped_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2074,'Chivalry Begins','Final Fantasy Adventure','2026-08-15T14:48:15.215361+00:00','https://www.youtube.com/watch?v=wqmC2IsBZqg',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Chivalry_Begins_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2075,'This Ain''t No Bloc Party! This Is World War!','Trenches','2026-08-15T04:03:24.063740+00:00','https://www.youtube.com/watch?v=2H6cdLpAHiY',621,'https://ocrmirror.org/files/music/remixes/Trenches_This_Ain''t_No_Bloc_Party_This_Is_World_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2076,'Burning Vigil','Trenches','2026-08-15T11:44:43.206312+00:00','https://www.youtube.com/watch?v=9oCfEdzgV3c',621,'https://ocrmirror.org/files/music/remixes/Trenches_Burning_Vigil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2077,'The Fallout of Eli','Fallout 3','2026-08-15T08:55:05.110049+00:00','https://www.youtube.com/watch?v=RPUnkD7iZ54',623,'https://ocrmirror.org/files/music/remixes/Fallout_3_The_Fallout_of_Eli_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2078,'Us Monkeys Together','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T07:06:10.302226+00:00','https://www.youtube.com/watch?v=LLK-QinSw20',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Us_Monkeys_Together_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2079,'Lost Forever','Final Fantasy VI','2026-08-15T07:52:13.498235+00:00','https://www.youtube.com/watch?v=Qf6gVPqrao8',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Lost_Forever_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2080,'Swamp Gases','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-14T23:47:26.948079+00:00','https://www.youtube.com/watch?v=6xqvtkW9X9A',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Swamp_Gases_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2081,'Super Mario Western Show','Super Mario World','2026-08-15T14:48:15.055384+00:00','https://www.youtube.com/watch?v=PTZ1StR_XyM',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Super_Mario_Western_Show_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2082,'Castle Crescendo','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T04:56:36.238439+00:00','https://www.youtube.com/watch?v=JGVUIj8WppU',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Castle_Crescendo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2083,'NO (resub)','Scribblenauts','2026-08-15T07:52:13.143896+00:00','https://www.youtube.com/watch?v=rZelHlm8e-A',615,'https://ocrmirror.org/files/music/remixes/Scribblenauts_NO_(resub)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2084,'INVASION!','Rush''n Attack','2026-08-14T22:49:20.511150+00:00','https://www.youtube.com/watch?v=g4eZi6ffjVw',395,'https://ocrmirror.org/files/music/remixes/Rush''n_Attack_INVASION_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2085,'Quickening','Xenogears','2026-08-15T05:50:41.971110+00:00','https://www.youtube.com/watch?v=q9-bAkPMwMM',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Quickening_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2086,'Hyrulian Highlands','The Legend of Zelda: The Wind Waker','2026-08-15T10:48:20.263819+00:00','https://www.youtube.com/watch?v=eczMB-mJyd0',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Hyrulian_Highlands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2087,'The Fall of Iselia','Tales of Symphonia','2026-08-15T01:56:13.333784+00:00','https://www.youtube.com/watch?v=G0xBPsp4DQg',533,'https://ocrmirror.org/files/music/remixes/Tales_of_Symphonia_The_Fall_of_Iselia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2088,'Solid Snake''s Cigarette Break','Metal Gear Solid 2: Sons of Liberty','2026-08-15T07:52:14.031166+00:00','https://www.youtube.com/watch?v=lrnm7ZunzmM',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Solid_Snake''s_Cigarette_Break_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2089,'Solitude in Arlia','Star Ocean: The Second Story','2026-08-15T04:03:22.634842+00:00','https://www.youtube.com/watch?v=Ie1s4jSYBiQ',283,'https://ocrmirror.org/files/music/remixes/Star_Ocean_The_Second_Story_Solitude_in_Arlia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2090,'The Quick and the Blue','Mega Man 2','2026-08-15T15:45:12.982778+00:00','https://www.youtube.com/watch?v=CY0pGGZZomM',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Quick_and_the_Blue_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2091,'The Path to Glory','Final Fantasy V','2026-08-15T07:06:10.125119+00:00','https://www.youtube.com/watch?v=5bneSTKsnYg',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_The_Path_to_Glory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2092,'Lore of the Ancients','Final Fantasy V','2026-08-15T04:03:23.348647+00:00','https://www.youtube.com/watch?v=yWQGGNK9CJg',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Lore_of_the_Ancients_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2093,'Vessel of the Void','Final Fantasy V','2026-08-15T13:07:36.344948+00:00','https://www.youtube.com/watch?v=zIm61FM-6Ls',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Vessel_of_the_Void_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2094,'Gentle Fist','Final Fantasy V','2026-08-15T04:56:35.347745+00:00','https://www.youtube.com/watch?v=OLj7roGnEbw',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Gentle_Fist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2095,'Tetanus','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T09:49:31.756466+00:00','https://www.youtube.com/watch?v=dh1KSr5gehg',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Tetanus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2096,'The Very End','Lufia II: Rise of the Sinistrals','2026-08-15T08:55:04.449985+00:00','https://www.youtube.com/watch?v=ScqOJql6eO8',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_The_Very_End_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2097,'How K. Rool Went Insane','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T05:50:42.502861+00:00','https://www.youtube.com/watch?v=QNNMnqYzsmM',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_How_K_Rool_Went_Insane_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2098,'Third Eye','Chrono Trigger','2026-08-15T08:55:03.743512+00:00','https://www.youtube.com/watch?v=z7LpJL75jR0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Third_Eye_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2099,'Morning, Thinker','Silent Line: Armored Core','2026-08-15T14:48:15.538206+00:00','https://www.youtube.com/watch?v=ARy0ISY8kJQ',625,'https://ocrmirror.org/files/music/remixes/Silent_Line_Armored_Core_Morning_Thinker_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2100,'Rime of the Wanderin'' Seafarer','The Legend of Zelda: The Wind Waker','2026-08-15T17:45:26.760686+00:00','https://www.youtube.com/watch?v=e9YpmyO97EQ',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Rime_of_the_Wanderin''_Seafarer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2101,'Party''s Over Here','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T10:48:19.485649+00:00','https://www.youtube.com/watch?v=dvn6np8hGaM',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Party''s_Over_Here_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2102,'Morning Walk in the Burning City','Mega Man','2026-08-14T21:49:20.271637+00:00','https://www.youtube.com/watch?v=SVL_imRQZak',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Morning_Walk_in_the_Burning_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2103,'Old School','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T05:50:42.148952+00:00','https://www.youtube.com/watch?v=4FC4QPECCAA',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Old_School_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2104,'Things We Didn''t Know','Secret of Mana','2026-08-15T08:55:05.732374+00:00','https://www.youtube.com/watch?v=itD_6A27FLY',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Things_We_Didn''t_Know_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2105,'Fear of Haze','Castlevania: Portrait of Ruin','2026-08-15T04:56:35.170066+00:00','https://www.youtube.com/watch?v=uDII7qBv5Ms',578,'https://ocrmirror.org/files/music/remixes/Castlevania_Portrait_of_Ruin_Fear_of_Haze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2106,'Get a Weapon Weapon','Mega Man 4','2026-08-15T07:06:09.946938+00:00','https://www.youtube.com/watch?v=nYpEptm9jCA',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Get_a_Weapon_Weapon_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2107,'This Chase Is Haunted','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T07:52:13.321345+00:00','https://www.youtube.com/watch?v=sEMwH4PZD90',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_This_Chase_Is_Haunted_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2108,'Lunar Dioxide','Gran Turismo 3 A-spec','2026-08-15T09:49:31.205705+00:00','https://www.youtube.com/watch?v=XAI7ZldXR0Y',523,'https://ocrmirror.org/files/music/remixes/Gran_Turismo_3_A-spec_Lunar_Dioxide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2109,'Bias, Groove','Kirby''s Dream Land','2026-08-15T13:51:09.166427+00:00','https://www.youtube.com/watch?v=HFqY3MAkhp0',234,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_Bias_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2110,'Monkeys Disarm Their Kremlings','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T16:50:13.648183+00:00','https://www.youtube.com/watch?v=965EdnLpt2Q',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Monkeys_Disarm_Their_Kremlings_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2111,'From Downtown','NBA Jam','2026-08-15T07:52:13.674703+00:00','https://www.youtube.com/watch?v=3PBgPRpSyEI',630,'https://ocrmirror.org/files/music/remixes/NBA_Jam_From_Downtown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2112,'Baal Bhaagna','Shantae: Risky''s Revenge','2026-08-15T13:51:09.852136+00:00','https://www.youtube.com/watch?v=m1ISuCuuvnQ',631,'https://ocrmirror.org/files/music/remixes/Shantae_Risky''s_Revenge_Baal_Bhaagna_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2113,'Devil''s Advocate','Touhou Koumakyou: The Embodiment of Scarlet Devil','2026-08-15T09:49:32.305992+00:00','https://www.youtube.com/watch?v=Z4atoTU-vwE',632,'https://ocrmirror.org/files/music/remixes/Touhou_Koumakyou_the_Embodiment_of_Scarlet_Devil_Devil''s_Advocate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2114,'Edward''s Dream Quartet','Final Fantasy IV','2026-08-15T09:49:31.938802+00:00','https://www.youtube.com/watch?v=7YpjMsyF7cU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Edward''s_Dream_Quartet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2115,'Melancholy Dreams','Super Mario Bros. 2','2026-08-15T07:52:12.966130+00:00','https://www.youtube.com/watch?v=23Cvc9N0Nos',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Melancholy_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2116,'Eyes in the Deep','The Legend of Zelda: Oracle of Ages','2026-08-15T07:06:09.594040+00:00','https://www.youtube.com/watch?v=D3KmmkdN_zc',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Eyes_in_the_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2117,'Insomniac Skies','DDRMAX Dance Dance Revolution','2026-08-15T14:48:15.696920+00:00','https://www.youtube.com/watch?v=ELkyjHjMECY',633,'https://ocrmirror.org/files/music/remixes/DDRMAX_Dance_Dance_Revolution_Insomniac_Skies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2118,'Power of the Meat','Super Meat Boy','2026-08-15T15:45:12.800135+00:00','https://www.youtube.com/watch?v=Ojzg-dTHvyY',644,'https://ocrmirror.org/files/music/remixes/Super_Meat_Boy_Power_of_the_Meat_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2119,'Demonic Conception','Castlevania III: Dracula''s Curse','2026-08-15T05:50:41.794646+00:00','https://www.youtube.com/watch?v=gDVib7g7fHg',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Demonic_Conception_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2120,'All Outta Gum','Duke Nukem 3D','2026-08-15T09:49:32.121964+00:00','https://www.youtube.com/watch?v=s3z158iVpkI',645,'https://ocrmirror.org/files/music/remixes/Duke_Nukem_3D_All_Outta_Gum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2121,'For You','Mega Man 2','2026-08-15T19:44:41.706790+00:00','https://www.youtube.com/watch?v=9bVfJjjiEys',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_For_You_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2122,'Above the Sky','Sonic the Hedgehog 2','2026-08-15T13:07:36.875374+00:00','https://www.youtube.com/watch?v=M-pCZOGYOiE',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Above_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2123,'Red Sphere, Blue Sphere','Sonic the Hedgehog 3','2026-08-15T13:51:09.988644+00:00','https://www.youtube.com/watch?v=9veHTYaluI0',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Red_Sphere_Blue_Sphere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2124,'This Triforce Has Too Many Pieces','The Legend of Zelda: A Link to the Past','2026-08-15T09:49:31.390538+00:00','https://www.youtube.com/watch?v=sAqB5Hpd6PE',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_This_Triforce_Has_Too_Many_Pieces_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2125,'Fiesta Amongst the Trees','Ristar','2026-08-15T07:06:09.770225+00:00','https://www.youtube.com/watch?v=Yrsam0efy1w',131,'https://ocrmirror.org/files/music/remixes/Ristar_Fiesta_Amongst_the_Trees_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2126,'End of the Adventure','King Kong 2: Yomigaeru Densetsu','2026-08-15T05:50:41.615963+00:00','https://www.youtube.com/watch?v=oVZBr8jnr40',638,'https://ocrmirror.org/files/music/remixes/King_Kong_2_End_of_the_Adventure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2127,'Camrade','Animal Crossing','2026-08-15T14:48:15.857336+00:00','https://www.youtube.com/watch?v=Az4C0CVy0-k',521,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_Camrade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2129,'A Village''s Welcome','Teen Agent','2026-08-15T08:55:03.921352+00:00','https://www.youtube.com/watch?v=pZECp6q8WfM',596,'https://ocrmirror.org/files/music/remixes/Teen_Agent_A_Village''s_Welcome_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2131,'Treason','Final Fantasy IV','2026-08-15T11:44:43.841365+00:00','https://www.youtube.com/watch?v=BbV6-dvyFH4',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Treason_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2132,'Dystopian Future','Contra III: The Alien Wars','2026-08-15T07:52:13.851961+00:00','https://www.youtube.com/watch?v=0Kmbiik5gvY',637,'https://ocrmirror.org/files/music/remixes/Contra_3_Dystopian_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2133,'Touchdown Hoedown','Tecmo Bowl','2026-08-15T05:50:42.858676+00:00','https://www.youtube.com/watch?v=nS8I53yrBA0',646,'https://ocrmirror.org/files/music/remixes/Tecmo_Bowl_Touchdown_Hoedown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2134,'High Seas','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T08:55:05.361856+00:00','https://www.youtube.com/watch?v=ZT4U2cCTYTI',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_High_Seas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2135,'Transient Shadows','The Legend of Zelda: A Link to the Past','2026-08-15T16:50:12.582691+00:00','https://www.youtube.com/watch?v=mDbJt3445CA',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Transient_Shadows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2136,'Power Trip','Contra Force','2026-08-15T13:07:35.993432+00:00','https://www.youtube.com/watch?v=WACKl2ckBUY',611,'https://ocrmirror.org/files/music/remixes/Contra_Force_Power_Trip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2137,'Rondo Sanctuary','Final Fantasy X','2026-08-15T07:52:12.788287+00:00','https://www.youtube.com/watch?v=Q20XCm2L_ts',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Rondo_Sanctuary_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2138,'The Polar Express','NiGHTS into dreams...','2026-08-15T10:48:20.577190+00:00','https://www.youtube.com/watch?v=zWbNbo4Ohz4',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_The_Polar_Express_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2139,'Crazy Old Betty','Final Fantasy IV','2026-08-15T14:48:14.580036+00:00','https://www.youtube.com/watch?v=qrIqsPxaivY',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Crazy_Old_Betty_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2140,'Breathe Deep','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T13:51:09.715151+00:00','https://www.youtube.com/watch?v=9bDOo44tIAo',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Breathe_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2141,'Serious Moon Business','The Legend of Zelda: Majora''s Mask','2026-08-15T18:56:02.206493+00:00','https://www.youtube.com/watch?v=MGVVwtYvpbc',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Serious_Moon_Business_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2142,'Full Moon Cello','The Legend of Zelda: Link''s Awakening','2026-08-15T20:47:59.594231+00:00','https://www.youtube.com/watch?v=0fr11Ainkr0',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Full_Moon_Cello_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2143,'Climb My Mountain, This High','The Legend of Zelda: Link''s Awakening','2026-08-15T10:48:20.420355+00:00','https://www.youtube.com/watch?v=jVJF8AHJcBo',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Climb_My_Mountain_This_High_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2144,'House of Frogs','The Legend of Zelda: Link''s Awakening','2026-08-15T19:44:41.100256+00:00','https://www.youtube.com/watch?v=_b6xkvHYF9Q',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_House_of_Frogs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2145,'Cookin'' with Fire','PaRappa the Rapper','2026-08-15T20:47:59.237823+00:00','https://www.youtube.com/watch?v=VxJCC7Ezf98',640,'https://ocrmirror.org/files/music/remixes/PaRappa_the_Rapper_Cookin''_with_Fire_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2146,'Can''t Stop the Hot-Head Bop','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T11:44:43.523272+00:00','https://www.youtube.com/watch?v=ugE9KAPrFZ8',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Can''t_Stop_the_Hot-Head_Bop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2147,'Light''s Out','Mega Man','2026-08-15T08:55:04.852356+00:00','https://www.youtube.com/watch?v=ILfoyvLoMO0',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Light''s_Out_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2148,'Treasure Hunter','Mega Man & Bass','2026-08-15T13:07:36.698641+00:00','https://www.youtube.com/watch?v=ULMBh82MauU',657,'https://ocrmirror.org/files/music/remixes/Mega_Man_&_Bass_Treasure_Hunter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2149,'Little Black Book','Final Fantasy V','2026-08-15T09:49:30.653248+00:00','https://www.youtube.com/watch?v=vHvlKubu1ao',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Little_Black_Book_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2150,'Quicksilver','Return All Robots!','2026-08-15T11:44:43.363940+00:00','https://www.youtube.com/watch?v=uRI9LGfTP_4',656,'https://ocrmirror.org/files/music/remixes/Return_All_Robots_Quicksilver_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2151,'Robotastic Dub-o-Matic Genetic Lab','Return All Robots!','2026-08-15T09:49:31.573134+00:00','https://www.youtube.com/watch?v=Z1MnRWgMxSU',656,'https://ocrmirror.org/files/music/remixes/Return_All_Robots_Robotastic_Dub-o-Matic_Genetic_Lab_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2152,'Winter NiGHTS (Hey, Dreamer)','Christmas NiGHTS into dreams...','2026-08-15T13:51:08.749403+00:00','https://www.youtube.com/watch?v=qPwcNrzZDco',159,'https://ocrmirror.org/files/music/remixes/Christmas_NiGHTS_into_dreams_Winter_NiGHTS_(Hey_Dreamer)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2153,'Luke, a True Gentleman Prefers a Touch of Light Jazz','Professor Layton and the Curious Village','2026-08-15T16:50:13.294520+00:00','https://www.youtube.com/watch?v=IdAJ2dqVxPU',634,'https://ocrmirror.org/files/music/remixes/Professor_Layton_and_the_Curious_Village_Luke_a_True_Gentleman_Prefers_a_Touch_of_Light_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2154,'The Angels of Hell','Cave Story','2026-08-15T17:45:26.174071+00:00','https://www.youtube.com/watch?v=hyzMUv0tdqo',486,'https://ocrmirror.org/files/music/remixes/Cave_Story_The_Angels_of_Hell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2155,'Daft Drafts','Mega Man 9','2026-08-15T18:56:02.072871+00:00','https://www.youtube.com/watch?v=Go0Tynris64',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Daft_Drafts_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2156,'With the Gold Comes the Curse','Wild Guns','2026-08-15T09:49:31.021910+00:00','https://www.youtube.com/watch?v=1dzZs4vRDRo',649,'https://ocrmirror.org/files/music/remixes/Wild_Guns_With_the_Gold_Comes_the_Curse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2157,'Uncharted Depths','Mass Effect','2026-08-15T13:51:09.301532+00:00','https://www.youtube.com/watch?v=1qchqtxEteY',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_Uncharted_Depths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2158,'Spoiled R0TT3N','Super Meat Boy','2026-08-15T15:45:12.081133+00:00','https://www.youtube.com/watch?v=mFwQrfi63J0',644,'https://ocrmirror.org/files/music/remixes/Super_Meat_Boy_Spoiled_R0TT3N_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2159,'mAEt b0y','Super Meat Boy','2026-08-15T18:56:01.801253+00:00','https://www.youtube.com/watch?v=uewv3uahpbE',644,'https://ocrmirror.org/files/music/remixes/Super_Meat_Boy_mAEt_b0y_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2160,'Hyper Monkey Likes the Dancefloor','Armored Core: Nexus','2026-08-15T13:51:09.028533+00:00','https://www.youtube.com/watch?v=LdrQIDawOqQ',659,'https://ocrmirror.org/files/music/remixes/Armored_Core_Nexus_Hyper_Monkey_Likes_the_Dancefloor_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2161,'We Can See No.373','Armored Core: Formula Front - Extreme Battle','2026-08-15T17:45:26.956023+00:00','https://www.youtube.com/watch?v=jVmmdE6pYyk',660,'https://ocrmirror.org/files/music/remixes/Armored_Core_Formula_Front_Extreme_Battle_We_Can_See_No-373_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2162,'Goodbye, Thinker','Armored Core 4','2026-08-15T19:44:41.862096+00:00','https://www.youtube.com/watch?v=7pDe2bRJLqQ',626,'https://ocrmirror.org/files/music/remixes/Armored_Core_4_Goodbye_Thinker_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2164,'Time Slips Away','Final Fantasy X','2026-08-15T15:45:13.099302+00:00','https://www.youtube.com/watch?v=fXk-ET0hcmE',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Time_Slips_Away_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2165,'Koopa Nova','Super Mario Kart','2026-08-15T16:50:13.117052+00:00','https://www.youtube.com/watch?v=lU7abY60T4I',269,'https://ocrmirror.org/files/music/remixes/Super_Mario_Kart_Koopa_Nova_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2166,'The Night of Lukifell','Ninja Gaiden','2026-08-15T16:50:12.761278+00:00','https://www.youtube.com/watch?v=yr2WwXbyefs',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_The_Night_of_Lukifell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2167,'Blown Mind Bolero','Mega Man 9','2026-08-15T15:45:12.318131+00:00','https://www.youtube.com/watch?v=1ZGcN1ujfvc',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Blown_Mind_Bolero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2168,'Steriloids','Reset Generation','2026-08-15T04:56:36.060764+00:00','https://www.youtube.com/watch?v=bKGn0Ytpmog',569,'https://ocrmirror.org/files/music/remixes/Reset_Generation_Steriloids_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2169,'Plumber''s Last Stand','Reset Generation','2026-08-15T07:52:12.608098+00:00','https://www.youtube.com/watch?v=6vUHYAhAR1s',569,'https://ocrmirror.org/files/music/remixes/Reset_Generation_Plumber''s_Last_Stand_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2170,'Remix Generation','Reset Generation','2026-08-15T13:51:08.890953+00:00','https://www.youtube.com/watch?v=mFzivfksiIw',569,'https://ocrmirror.org/files/music/remixes/Reset_Generation_Remix_Generation_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2171,'The Forest That Never Sleeps','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T22:47:09.099868+00:00','https://www.youtube.com/watch?v=yjFItucaQyo',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_The_Forest_That_Never_Sleeps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2172,'A Belmont''s Curse','Castlevania II: Simon''s Quest','2026-08-15T13:07:35.816633+00:00','https://www.youtube.com/watch?v=8DsnB4N7oNE',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_A_Belmont''s_Curse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2173,'Tao Is Taokaka','BlazBlue: Calamity Trigger','2026-08-15T11:44:44.000116+00:00','https://www.youtube.com/watch?v=zTrAb0W8xOI',663,'https://ocrmirror.org/files/music/remixes/BlazBlue_Tao_Is_Taokaka_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2174,'I''m Taking It All Back','The Goonies II','2026-08-15T14:48:15.374062+00:00','https://www.youtube.com/watch?v=KNvYNppCL8Q',652,'https://ocrmirror.org/files/music/remixes/Goonies_2_I''m_Taking_It_All_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2175,'Passing Breeze (Latin Jazz Samba 2010 Edition)','OutRun','2026-08-15T19:44:42.153264+00:00','https://www.youtube.com/watch?v=mDiX8wAyCoo',648,'https://ocrmirror.org/files/music/remixes/OutRun_Passing_Breeze_(Latin_Jazz_Samba_2010_Edition)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2176,'Picolescence','Tails and the Music Maker','2026-08-16T02:05:23.152399+00:00','https://www.youtube.com/watch?v=OeuMHOZ_bcY',664,'https://ocrmirror.org/files/music/remixes/Tails_and_the_Music_Maker_Picolescence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2177,'Go Ninja, Go','Teenage Mutant Ninja Turtles','2026-08-15T18:56:02.756187+00:00','https://www.youtube.com/watch?v=GY5SqdE5nUA',224,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_Go_Ninja_Go_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2178,'Enter the Shredder','Teenage Mutant Ninja Turtles III: The Manhattan Project','2026-08-15T17:45:27.344129+00:00','https://www.youtube.com/watch?v=m3bwy7BbRIc',391,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_3_Enter_the_Shredder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2179,'Pirate Shout','The Secret of Monkey Island','2026-08-15T21:45:21.564864+00:00','https://www.youtube.com/watch?v=aT_lTfhOtlw',212,'https://ocrmirror.org/files/music/remixes/Secret_of_Monkey_Island_Pirate_Shout_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2180,'Voodoo, Roots ''n Grog','The Secret of Monkey Island','2026-08-16T04:07:49.202342+00:00','https://www.youtube.com/watch?v=PQhtR-yoObs',212,'https://ocrmirror.org/files/music/remixes/Secret_of_Monkey_Island_Voodoo_Roots_''n_Grog_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2181,'The Bounty of a Brain','Super Metroid','2026-08-15T16:50:13.470757+00:00','https://www.youtube.com/watch?v=N9KZ48YpsZY',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_The_Bounty_of_a_Brain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2182,'Dieselbrainage','Super Metroid','2026-08-15T18:56:03.155687+00:00','https://www.youtube.com/watch?v=JcBmIq8vIWs',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Dieselbrainage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2183,'Gusty Piano in a Garden','Super Mario Galaxy','2026-08-15T21:45:22.091023+00:00','https://www.youtube.com/watch?v=G8HstByrIiY',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Gusty_Piano_in_a_Garden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2184,'Eternal Tears','The Revenge of Shinobi','2026-08-15T15:45:12.200531+00:00','https://www.youtube.com/watch?v=jz7-9oRH6Gg',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_Eternal_Tears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2185,'Desktop Dynamite','Dennis','2026-08-15T11:44:43.044035+00:00','https://www.youtube.com/watch?v=HVoYTAFqhnQ',647,'https://ocrmirror.org/files/music/remixes/Dennis_Desktop_Dynamite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2186,'Snake Infiltrates','Metal Gear','2026-08-15T13:07:35.636582+00:00','https://www.youtube.com/watch?v=MM9HCoBxyuI',140,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Snake_Infiltrates_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2187,'Peacemaker','Sonic Adventure','2026-08-16T03:26:11.049900+00:00','https://www.youtube.com/watch?v=F3orLVg69jU',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_Peacemaker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2188,'A Cinematic Heaven','Final Fantasy XI Online','2026-08-15T13:07:36.522074+00:00','https://www.youtube.com/watch?v=fS5qmgzMmXc',546,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_A_Cinematic_Heaven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2189,'The Frog Dance','Chrono Trigger','2026-08-15T21:45:21.215055+00:00','https://www.youtube.com/watch?v=UlKb822l2nU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Frog_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2190,'April Rain','Sonic the Hedgehog','2026-08-15T21:45:20.866400+00:00','https://www.youtube.com/watch?v=PYCpC1f9gsg',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_April_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2191,'Frozen Hotslug','Missile Master','2026-08-15T13:07:37.051600+00:00','https://www.youtube.com/watch?v=vRwlu7VVwUk',670,'https://ocrmirror.org/files/music/remixes/Missile_Master_Frozen_Hotslug_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2192,'Bullet for My Piloswine','Pokémon Diamond Version','2026-08-16T02:05:23.328990+00:00','https://www.youtube.com/watch?v=3S8UQJwWvE4',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Bullet_for_My_Piloswine_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2193,'Argent Vexemon','Pokémon Silver Version','2026-08-15T15:45:12.665152+00:00','https://www.youtube.com/watch?v=ENSHKOHbyfI',674,'https://ocrmirror.org/files/music/remixes/Pokemon_Silver_Version_Argent_Vexemon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2194,'Battle for the Badge','Pokémon Red Version','2026-08-16T04:07:49.375615+00:00','https://www.youtube.com/watch?v=1dnBM10cyK4',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Battle_for_the_Badge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2195,'Champion''s Horizon','Pokémon Gold Version','2026-08-15T20:47:59.948333+00:00','https://www.youtube.com/watch?v=IrfWIK9Tjx8',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Champion''s_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2196,'My Friend Mudkip','Pokémon Sapphire Version','2026-08-15T22:47:08.744966+00:00','https://www.youtube.com/watch?v=VC1D1usCmho',636,'https://ocrmirror.org/files/music/remixes/Pokemon_Sapphire_Version_My_Friend_Mudkip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2197,'Out of Antidote','Pokémon Red Version','2026-08-15T16:50:12.401273+00:00','https://www.youtube.com/watch?v=M7KkQO41bTs',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Out_of_Antidote_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2198,'Drowning Blue','Pokémon Red Version','2026-08-15T13:51:09.577081+00:00','https://www.youtube.com/watch?v=LRSIBcTQlXM',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Drowning_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2199,'Home Is Where the Luvdisc Is...','Pokémon Diamond Version','2026-08-15T19:44:41.414243+00:00','https://www.youtube.com/watch?v=xm9TM9Jxb0w',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Home_Is_Where_the_Luvdisc_Is_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2200,'Smooth Steel','Mega Man 2','2026-08-15T23:44:38.587479+00:00','https://www.youtube.com/watch?v=f1eAVKQHaoA',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Smooth_Steel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2201,'Mr. Soccerball','Animal Crossing','2026-08-15T14:48:14.739584+00:00','https://www.youtube.com/watch?v=3AMRbOBCEcI',521,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_Mr_Soccerball_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2202,'The Peddler''s Legacy','Tetris','2026-08-15T18:56:01.940112+00:00','https://www.youtube.com/watch?v=wDvNRed98c0',510,'https://ocrmirror.org/files/music/remixes/Tetris_The_Peddler''s_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2203,'Rain Prayer','Pokémon Red Version','2026-08-15T20:47:59.770733+00:00','https://www.youtube.com/watch?v=esuXq9scYUk',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Rain_Prayer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2204,'Four Friends of the Elements','Final Fantasy IV','2026-08-15T17:45:26.569403+00:00','https://www.youtube.com/watch?v=ByPGMIL9lF4',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Four_Friends_of_the_Elements_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2205,'Clubbed Baby VVVVVVeal','VVVVVV','2026-08-15T20:47:59.416194+00:00','https://www.youtube.com/watch?v=cA7NdYGvKx4',662,'https://ocrmirror.org/files/music/remixes/VVVVVV_Clubbed_Baby_VVVVVVeal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2206,'Crispy Crimson','The Ninja Warriors','2026-08-15T14:48:14.899328+00:00','https://www.youtube.com/watch?v=jf4HCbVKW14',653,'https://ocrmirror.org/files/music/remixes/Ninja_Warriors_Crispy_Crimson_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2207,'Dragon Wings','Final Fantasy V','2026-08-15T22:47:08.922724+00:00','https://www.youtube.com/watch?v=htlyYX7T3Qo',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Dragon_Wings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2208,'Air Shooter','Mega Man 2','2026-08-15T15:45:12.433853+00:00','https://www.youtube.com/watch?v=wUGGhvk7CSs',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Air_Shooter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2209,'Slash Claw','Mega Man 7','2026-08-15T14:48:16.018638+00:00','https://www.youtube.com/watch?v=RidpZDe6BzE',460,'https://ocrmirror.org/files/music/remixes/Mega_Man_7_Slash_Claw_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2210,'Yamato Spear','Mega Man 6','2026-08-15T19:44:41.559148+00:00','https://www.youtube.com/watch?v=ONhhj6XCub4',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Yamato_Spear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2211,'Electrotherapy','Crush','2026-08-16T02:05:24.033323+00:00','https://www.youtube.com/watch?v=BpQM9iL5JGE',679,'https://ocrmirror.org/files/music/remixes/Crush_Electrotherapy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2212,'Forever, Young Rachel','Final Fantasy VI','2026-08-15T23:44:37.500989+00:00','https://www.youtube.com/watch?v=0ku-9RTAyW4',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Forever_Young_Rachel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2213,'Immortalized','Halo 3','2026-08-15T20:48:00.302561+00:00','https://www.youtube.com/watch?v=kM4OSLJfqHw',643,'https://ocrmirror.org/files/music/remixes/Halo_3_Immortalized_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2214,'Fire in the Tires','Rad Racer II','2026-08-15T17:45:25.978053+00:00','https://www.youtube.com/watch?v=trFfjaNtySI',651,'https://ocrmirror.org/files/music/remixes/Rad_Racer_2_Fire_in_the_Tires_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2215,'Mechanical Flare','Mega Man 2','2026-08-16T02:05:23.681747+00:00','https://www.youtube.com/watch?v=99gtANG9Klw',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Mechanical_Flare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2216,'Shades of Red','Pokémon Red Version','2026-08-15T19:44:40.948842+00:00','https://www.youtube.com/watch?v=znXLYNjV_G0',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Shades_of_Red_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2217,'Crimson Twilight','Castlevania: Bloodlines','2026-08-15T15:45:13.215407+00:00','https://www.youtube.com/watch?v=h-xh1nbQWYM',610,'https://ocrmirror.org/files/music/remixes/Castlevania_Bloodlines_Crimson_Twilight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2218,'Knowing Heart, Distant Noise','Chaos Field','2026-08-15T13:07:36.169089+00:00','https://www.youtube.com/watch?v=torMSDm2X5Q',650,'https://ocrmirror.org/files/music/remixes/Chaos_Field_Knowing_Heart_Distant_Noise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2219,'The Sound of Speed','Sonic the Hedgehog','2026-08-16T04:07:49.027743+00:00','https://www.youtube.com/watch?v=9uflNpF1E9g',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_The_Sound_of_Speed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2220,'Spring Junkie','Sonic the Hedgehog','2026-08-16T04:07:49.548957+00:00','https://www.youtube.com/watch?v=WcnDez14_Nk',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Spring_Junkie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2221,'Bubble Junkie','Sonic the Hedgehog','2026-08-15T18:56:02.539148+00:00','https://www.youtube.com/watch?v=6DH22yC4fNQ',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Bubble_Junkie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2222,'Under Construction','Sonic the Hedgehog','2026-08-16T04:07:49.895796+00:00','https://www.youtube.com/watch?v=REe_tCIt9u8',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Under_Construction_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2223,'Subsonic Sparkle','Sonic the Hedgehog','2026-08-15T17:45:26.372523+00:00','https://www.youtube.com/watch?v=FT8O46UDu4Q',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Subsonic_Sparkle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2224,'Leaf Storm','Mega Man 2','2026-08-15T19:44:40.792399+00:00','https://www.youtube.com/watch?v=6zQSty82bJ8',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Leaf_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2225,'To Far Away Inspirations','Chrono Trigger','2026-08-15T20:47:58.880222+00:00','https://www.youtube.com/watch?v=9ncJaQbwHA0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_To_Far_Away_Inspirations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2226,'Nullification','The Legend of Zelda','2026-08-16T04:07:48.851562+00:00','https://www.youtube.com/watch?v=gRo6tnRBzqM',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Nullification_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2227,'Jazz Castle Adventure','Jazz Jackrabbit 2','2026-08-15T20:48:00.125416+00:00','https://www.youtube.com/watch?v=eU6CkzF0FpU',506,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_2_Jazz_Castle_Adventure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2228,'Edge of Valor','Final Fantasy V','2026-08-15T16:50:13.826313+00:00','https://www.youtube.com/watch?v=SLlPZMLV9o8',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Edge_of_Valor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2229,'In the Shadows','Final Fantasy V','2026-08-15T15:45:12.549045+00:00','https://www.youtube.com/watch?v=kZe6-Cy3p7Y',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_In_the_Shadows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2230,'A Healer''s Touch','Final Fantasy V','2026-08-15T21:45:21.740602+00:00','https://www.youtube.com/watch?v=Wb7ddodOoPI',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_A_Healer''s_Touch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2231,'Twisted Devil, Grinding Soul','Final Fantasy V','2026-08-15T17:45:25.781110+00:00','https://www.youtube.com/watch?v=s8g7yl_li7g',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Twisted_Devil_Grinding_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2232,'Sinking Deeper','Final Fantasy V','2026-08-15T18:56:02.406894+00:00','https://www.youtube.com/watch?v=4as6TXgS944',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Sinking_Deeper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2233,'Four Years Since...','Streets of Rage','2026-08-15T20:47:59.057152+00:00','https://www.youtube.com/watch?v=PEiBYDr9pXw',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Four_Years_Since_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2234,'A Dream That Seems Far Off','Lunar: Silver Star Story Complete','2026-08-16T03:26:11.747191+00:00','https://www.youtube.com/watch?v=7ids7uR-Exk',692,'https://ocrmirror.org/files/music/remixes/Lunar_Silver_Star_Story_Complete_A_Dream_That_Seems_Far_Off_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2235,'The Wingless Butoh','Sonic Heroes','2026-08-16T05:53:20.190632+00:00','https://www.youtube.com/watch?v=NO9nCErA7iE',654,'https://ocrmirror.org/files/music/remixes/Sonic_Heroes_The_Wingless_Butoh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2236,'Out of the Palace','Pokémon Red Version','2026-08-15T16:50:14.002915+00:00','https://www.youtube.com/watch?v=OyaM2LZ80h0',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Out_of_the_Palace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2237,'Showdown','Mega Man 9','2026-08-15T23:44:37.316181+00:00','https://www.youtube.com/watch?v=nWpwrLSlypQ',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Showdown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2238,'Path of Deception','Final Fantasy IV','2026-08-16T03:26:11.397326+00:00','https://www.youtube.com/watch?v=zqrH1R-wAJA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Path_of_Deception_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2239,'Facing Fears','Super Mario World 2: Yoshi''s Island','2026-08-15T22:47:09.458116+00:00','https://www.youtube.com/watch?v=bZlm8mTFQtE',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Facing_Fears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2240,'Final Progression','Sonic the Hedgehog','2026-08-16T03:26:11.919060+00:00','https://www.youtube.com/watch?v=3jOsp8KBB5g',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Final_Progression_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2241,'SeeK','Final Fantasy VIII','2026-08-15T23:44:38.225619+00:00','https://www.youtube.com/watch?v=D9lWt7EVEhU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_SeeK_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2242,'Blue Skies','Final Fantasy XIII','2026-08-16T05:00:23.465635+00:00','https://www.youtube.com/watch?v=J1Ri9PcmpyI',694,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_13_Blue_Skies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2243,'Keep Your Nightmares','The Legend of Zelda: Oracle of Ages','2026-08-15T21:45:20.512615+00:00','https://www.youtube.com/watch?v=rxb4dwBnk_Y',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Keep_Your_Nightmares_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2244,'Clockwork Criminal','Sonic the Hedgehog','2026-08-15T23:44:38.043606+00:00','https://www.youtube.com/watch?v=qF_E61H9tGE',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Clockwork_Criminal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2245,'Monsoon in the Concrete Jungle','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-16T05:00:22.041657+00:00','https://www.youtube.com/watch?v=2gco5po4u1g',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Monsoon_in_the_Concrete_Jungle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2246,'Heaven Awaits','Final Fantasy VI','2026-08-15T23:44:37.862926+00:00','https://www.youtube.com/watch?v=StDuv4Z89FQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Heaven_Awaits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2247,'Heavy Mako','Final Fantasy VII','2026-08-16T02:05:23.858234+00:00','https://www.youtube.com/watch?v=p_BWHe-MAAg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Heavy_Mako_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2248,'Night City Funk','Final Fantasy VIII','2026-08-15T22:47:08.390097+00:00','https://www.youtube.com/watch?v=GcwFa7hLFw4',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Night_City_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2249,'Weeping Shards','Final Fantasy IX','2026-08-15T23:44:38.955222+00:00','https://www.youtube.com/watch?v=vB9JOSbab7U',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Weeping_Shards_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2250,'Bare Knuckle Blitz','Streets of Rage','2026-08-16T07:53:30.360679+00:00','https://www.youtube.com/watch?v=VqHDTe_KHKA',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Bare_Knuckle_Blitz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2251,'Groove On','Streets of Rage','2026-08-15T22:47:08.212484+00:00','https://www.youtube.com/watch?v=JeaA1nQYsSY',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Groove_On_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2252,'Heroes','Final Fantasy Legend II','2026-08-15T22:47:08.034134+00:00','https://www.youtube.com/watch?v=_srXsVEOl7I',116,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Legend_2_Heroes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2253,'The Last Schala Mix Ever','Chrono Trigger','2026-08-16T05:53:20.729692+00:00','https://www.youtube.com/watch?v=zQKo6HDYVo8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Last_Schala_Mix_Ever_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2254,'Ska Buffet (All You Can Eat: Clean Version)','Kirby Super Star','2026-08-16T11:44:54.971850+00:00','https://www.youtube.com/watch?v=QYZQIUwezg8',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Ska_Buffet_(All_You_Can_Eat_Clean_Version)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2255,'Bleeding Guns','Sunset Riders','2026-08-15T18:56:03.023179+00:00','https://www.youtube.com/watch?v=pB4_tIDUKaI',689,'https://ocrmirror.org/files/music/remixes/Sunset_Riders_Bleeding_Guns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2256,'May I Have This Swords Dance?','Pokémon Diamond Version','2026-08-16T02:05:23.506018+00:00','https://www.youtube.com/watch?v=n_tQrZ7s340',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_May_I_Have_This_Swords_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2257,'Above the Clouds','Mega Man 8','2026-08-16T05:00:22.932250+00:00','https://www.youtube.com/watch?v=rM9axKW4J4s',160,'https://ocrmirror.org/files/music/remixes/Mega_Man_8_Above_the_Clouds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2258,'Starlight Festival','Seiken Densetsu 3','2026-08-15T23:44:38.406916+00:00','https://www.youtube.com/watch?v=fSDoA6lP8qY',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Starlight_Festival_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2259,'Dreams Dreams (Disco NiGHTS Mix)','NiGHTS into dreams...','2026-08-16T07:08:29.587400+00:00','https://www.youtube.com/watch?v=KrPQ7CJeLyg',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Dreams_Dreams_(Disco_NiGHTS_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2260,'New Jack Mantle','NiGHTS into dreams...','2026-08-16T13:52:26.935439+00:00','https://www.youtube.com/watch?v=_Ayma5xlb08',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_New_Jack_Mantle_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2261,'Overnight Cloverleaf','NiGHTS into dreams...','2026-08-15T21:45:21.390410+00:00','https://www.youtube.com/watch?v=Km4mutffZ3E',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Overnight_Cloverleaf_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2262,'The Nemesis Schema','NiGHTS into dreams...','2026-08-16T03:26:10.874138+00:00','https://www.youtube.com/watch?v=NySq-h9_4Ro',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_The_Nemesis_Schema_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2263,'Dies, Nox et Omnia','NiGHTS into dreams...','2026-08-16T07:08:29.764913+00:00','https://www.youtube.com/watch?v=lk6L2ZPVx60',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Dies_Nox_et_Omnia_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2264,'The NiGHT Has Just Begun...','NiGHTS into dreams...','2026-08-16T03:26:11.570854+00:00','https://www.youtube.com/watch?v=w4qumtdzNUY',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_The_NiGHT_Has_Just_Begun_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2266,'Lucidic','The Legend of Zelda: Link''s Awakening','2026-08-16T05:53:20.549209+00:00','https://www.youtube.com/watch?v=fNBsipkdQ0k',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Lucidic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2267,'Slowpoke Shuffle','Pokémon Gold Version','2026-08-15T23:44:37.682183+00:00','https://www.youtube.com/watch?v=d5SngH8dXns',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Slowpoke_Shuffle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2268,'Memories of a Master','Street Fighter II: The World Warrior','2026-08-16T03:26:11.224786+00:00','https://www.youtube.com/watch?v=K6Tbi6eoPVk',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Memories_of_a_Master_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2269,'Shifting Islands','Sonic the Hedgehog','2026-08-16T07:08:29.941255+00:00','https://www.youtube.com/watch?v=bL2gqTkK0IE',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Shifting_Islands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2270,'Dark Shores of Hyrule','The Legend of Zelda: Ocarina of Time','2026-08-16T02:05:24.386042+00:00','https://www.youtube.com/watch?v=twBKxdoJzK0',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Dark_Shores_of_Hyrule_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2271,'Temporal Despair','Pokémon Mystery Dungeon: Explorers of Time','2026-08-16T07:53:30.713913+00:00','https://www.youtube.com/watch?v=PMiJcO_-dls',690,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Explorers_of_Time_Temporal_Despair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2272,'Estharian Airs','Final Fantasy VIII','2026-08-16T02:05:22.974985+00:00','https://www.youtube.com/watch?v=4UJaLp-50rc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Estharian_Airs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2273,'Central Park (Metal Mix)','Last Ninja 2: Back with a Vengeance','2026-08-16T05:00:22.754930+00:00','https://www.youtube.com/watch?v=JPSeakVR9tE',696,'https://ocrmirror.org/files/music/remixes/Last_Ninja_2_Central_Park_(Metal_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2274,'Avien','Super Metroid','2026-08-16T08:56:15.647275+00:00','https://www.youtube.com/watch?v=frfKbXxmpM8',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Avien_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2275,'The Crimson Depths','Metroid','2026-08-16T05:00:23.109775+00:00','https://www.youtube.com/watch?v=s6ngIL-6vno',73,'https://ocrmirror.org/files/music/remixes/Metroid_The_Crimson_Depths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2276,'Solitude','Metroid Prime','2026-08-16T07:53:31.598676+00:00','https://www.youtube.com/watch?v=7biB1aFvnSU',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Solitude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2277,'Lore Hunter','Metroid Prime 3: Corruption','2026-08-16T14:49:01.534513+00:00','https://www.youtube.com/watch?v=6yw9PtKVwP0',518,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_3_Lore_Hunter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2278,'Suite for Violin and Piano','Metroid','2026-08-16T08:56:15.471773+00:00','https://www.youtube.com/watch?v=NPzbYZrhA7c',73,'https://ocrmirror.org/files/music/remixes/Metroid_Suite_for_Violin_and_Piano_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2279,'Mortal Konfrontation','Mortal Kombat 3','2026-08-16T05:53:20.010032+00:00','https://www.youtube.com/watch?v=w_U2x2iuHdg',697,'https://ocrmirror.org/files/music/remixes/Mortal_Kombat_3_Mortal_Konfrontation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2280,'WillRocky','Return All Robots!','2026-08-16T03:26:12.265608+00:00','https://www.youtube.com/watch?v=LHcp7lxhyuc',656,'https://ocrmirror.org/files/music/remixes/Return_All_Robots_WillRocky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2281,'Electric Hotslug','Missile Master','2026-08-15T17:45:27.151572+00:00','https://www.youtube.com/watch?v=CmXvnm5OI0g',670,'https://ocrmirror.org/files/music/remixes/Missile_Master_Electric_Hotslug_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2282,'Celestial Entrance','NiGHTS into dreams...','2026-08-15T22:47:07.840003+00:00','https://www.youtube.com/watch?v=64PcU1ZK0xM',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Celestial_Entrance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2283,'I Need Scissors! 61!','Metal Gear Solid 2: Substance','2026-08-16T05:53:19.827767+00:00','https://www.youtube.com/watch?v=dsn1Uv6qWG4',684,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Substance_I_Need_Scissors_61_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2284,'Ready to March','Final Fantasy VIII','2026-08-15T22:47:09.279074+00:00','https://www.youtube.com/watch?v=aGkH_kTLkeM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Ready_to_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2285,'Twin Seeds Flyby','NiGHTS into dreams...','2026-08-16T07:53:30.890548+00:00','https://www.youtube.com/watch?v=6isTK_eqr0k',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Twin_Seeds_Flyby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2286,'Fill Me Up with Snacky Happiness','Super Mario Galaxy','2026-08-16T13:09:03.707691+00:00','https://www.youtube.com/watch?v=M3oD99Bscwk',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Fill_Me_Up_with_Snacky_Happiness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2287,'Fore on the Floor','Mario Golf','2026-08-15T23:44:38.768174+00:00','https://www.youtube.com/watch?v=adwKuv9m_ms',706,'https://ocrmirror.org/files/music/remixes/Mario_Golf_Fore_on_the_Floor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2288,'Abandoned Battlefield','Pokémon Red Version','2026-08-16T05:00:21.861207+00:00','https://www.youtube.com/watch?v=kn1SSPViEmw',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Abandoned_Battlefield_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2289,'Origami Robots','Mega Man 9','2026-08-16T04:07:48.674628+00:00','https://www.youtube.com/watch?v=GVaJ0T18Als',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Origami_Robots_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2290,'Smooth As Honey','Mega Man 9','2026-08-16T15:46:12.058940+00:00','https://www.youtube.com/watch?v=fsaBsI0_viE',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Smooth_As_Honey_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2291,'A New Beginning','Mega Man 9','2026-08-16T07:08:29.055996+00:00','https://www.youtube.com/watch?v=VS-ZG9JWM4w',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_A_New_Beginning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2292,'Pitched in Suspense','Mega Man 9','2026-08-16T07:08:29.410856+00:00','https://www.youtube.com/watch?v=UW4No8ty6Zw',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Pitched_in_Suspense_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2293,'The Skull Fortress','Mega Man 9','2026-08-16T09:50:38.466625+00:00','https://www.youtube.com/watch?v=B5nMWTR7wb0',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_The_Skull_Fortress_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2294,'Darkness Fears Light, and We Fear the Darkness','Boktai: The Sun is in Your Hand','2026-08-15T21:45:20.691769+00:00','https://www.youtube.com/watch?v=26x8maMn_eQ',681,'https://ocrmirror.org/files/music/remixes/Boktai_Darkness_Fears_Light_and_We_Fear_the_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2295,'Hogtied','Sonic the Hedgehog','2026-08-16T07:53:31.420719+00:00','https://www.youtube.com/watch?v=nSpt_vJk_Pw',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Hogtied_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2296,'Tomorrow Should Have Been Last Night','NiGHTS into dreams...','2026-08-16T05:00:22.576982+00:00','https://www.youtube.com/watch?v=A_S9cPmQVxQ',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Tomorrow_Should_Have_Been_Last_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2297,'Fifty Rings to Ride','Sonic the Hedgehog','2026-08-16T07:08:30.295375+00:00','https://www.youtube.com/watch?v=4j22sCGBpcA',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Fifty_Rings_to_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2298,'where threads connect','Chrono Trigger','2026-08-16T10:48:39.723907+00:00','https://www.youtube.com/watch?v=FwJ8Ew5B4v0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_where_threads_connect_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2299,'One Must Rise 2011','One Must Fall 2097','2026-08-16T07:08:28.697511+00:00','https://www.youtube.com/watch?v=Z5WfOsZ61lc',307,'https://ocrmirror.org/files/music/remixes/One_Must_Fall_2097_One_Must_Rise_2011_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2300,'Beyond the Dream','NiGHTS into dreams...','2026-08-16T05:00:23.287762+00:00','https://www.youtube.com/watch?v=3GsBoVbbvfA',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Beyond_the_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2301,'HydroFunk','Sonic the Hedgehog 3','2026-08-16T07:08:29.234082+00:00','https://www.youtube.com/watch?v=4iAuuAl8Qkc',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_HydroFunk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2302,'The Clubbing of Isaac','The Binding of Isaac','2026-08-16T08:56:15.822630+00:00','https://www.youtube.com/watch?v=j5RdMPALG2I',714,'https://ocrmirror.org/files/music/remixes/Binding_of_Isaac_The_Clubbing_of_Isaac_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2303,'Cement Extacy','Mega Man 9','2026-08-16T02:05:22.795977+00:00','https://www.youtube.com/watch?v=3M3hJAFz4NE',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Cement_Extacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2304,'Byte Blocks','Mega Man 9','2026-08-15T22:47:08.568049+00:00','https://www.youtube.com/watch?v=pM-npGGnDM4',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Byte_Blocks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2305,'Pharaoh''s Last Dance','Mega Man 4','2026-08-16T03:26:10.698239+00:00','https://www.youtube.com/watch?v=nqAjRS08y3w',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Pharaoh''s_Last_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2306,'Friendly Fire','Super Dodge Ball','2026-08-16T08:56:16.174086+00:00','https://www.youtube.com/watch?v=dAWXvosjJgc',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Friendly_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2307,'Dodge Mahal','Super Dodge Ball','2026-08-16T05:53:20.369874+00:00','https://www.youtube.com/watch?v=J0FAu4EyGHM',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Dodge_Mahal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2308,'Go Balls Deep!','Super Dodge Ball','2026-08-16T07:53:30.538052+00:00','https://www.youtube.com/watch?v=ZLUlKpD6o1k',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Go_Balls_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2309,'Nairobi Hop','Super Dodge Ball','2026-08-16T14:49:00.835117+00:00','https://www.youtube.com/watch?v=GtqqCJ2jsvY',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Nairobi_Hop_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2310,'Deadbeat','The Legend of Dragoon','2026-08-16T05:00:22.221530+00:00','https://www.youtube.com/watch?v=VEZKJI3iKkU',715,'https://ocrmirror.org/files/music/remixes/Legend_of_Dragoon_Deadbeat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2311,'Improvisation on a Moment Seized by Time','Chrono Cross','2026-08-16T09:50:38.058775+00:00','https://www.youtube.com/watch?v=uhr_Gv3Q9Mc',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Improvisation_on_a_Moment_Seized_by_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2312,'Dancing Leaves','The Legend of Zelda: A Link to the Past','2026-08-16T13:52:27.292320+00:00','https://www.youtube.com/watch?v=iDNzfi2Ny68',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dancing_Leaves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2313,'Big Bad Koopa Dubstep','Super Mario RPG: Legend of the Seven Stars','2026-08-16T13:52:25.835057+00:00','https://www.youtube.com/watch?v=qZudJX5aTbE',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Big_Bad_Koopa_Dubstep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2314,'Parasite X','Metroid Prime','2026-08-16T05:53:19.466602+00:00','https://www.youtube.com/watch?v=lm5cdMP_pSc',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Parasite_X_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2315,'Healing Majora','The Legend of Zelda: Majora''s Mask','2026-08-16T11:44:55.688801+00:00','https://www.youtube.com/watch?v=uc6g0z0uQsc',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Healing_Majora_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2316,'She Can Has Long Ears','NiGHTS into dreams...','2026-08-16T05:53:20.909615+00:00','https://www.youtube.com/watch?v=BqhIEd1WY_Y',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_She_Can_Has_Long_Ears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2317,'FML (If I Could Drift Away)','Gitaroo Man','2026-08-16T16:51:01.342985+00:00','https://www.youtube.com/watch?v=R_C0tX6m1XU',719,'https://ocrmirror.org/files/music/remixes/Gitaroo_Man_FML_(If_I_Could_Drift_Away)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2318,'Ashes to Ashes','Super Metroid','2026-08-16T13:09:04.769700+00:00','https://www.youtube.com/watch?v=d7eaUfAEFGg',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Ashes_to_Ashes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2319,'Juese Belmont','Castlevania','2026-08-16T13:52:26.397717+00:00','https://www.youtube.com/watch?v=kECyw2C9BEs',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Juese_Belmont_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2320,'Cover Your Light','Deflektor','2026-08-16T13:52:26.756414+00:00','https://www.youtube.com/watch?v=vaqRm94a_1o',107,'https://ocrmirror.org/files/music/remixes/Deflektor_Cover_Your_Light_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2321,'Precious Metals','Pokémon Gold Version','2026-08-16T07:53:31.067900+00:00','https://www.youtube.com/watch?v=eveOlX9ZX_g',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Precious_Metals_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2322,'Smashinarium','Machinarium','2026-08-16T07:08:30.118840+00:00','https://www.youtube.com/watch?v=_K358C1FdMY',705,'https://ocrmirror.org/files/music/remixes/Machinarium_Smashinarium_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2324,'Ascent Through the Atmosphere','Pokémon Trading Card Game','2026-08-16T13:09:04.063544+00:00','https://www.youtube.com/watch?v=feLkggXGuvw',710,'https://ocrmirror.org/files/music/remixes/Pokemon_Trading_Card_Game_Ascent_Through_the_Atmosphere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2325,'Finality (Radio Edit)','Sonic the Hedgehog','2026-08-16T14:49:01.358295+00:00','https://www.youtube.com/watch?v=y3UtZSRlGq0',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Finality_(Radio_Edit)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2326,'Magnetic Fireworks','Mega Man 3','2026-08-16T14:49:00.306083+00:00','https://www.youtube.com/watch?v=KPtp83PEDiY',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Magnetic_Fireworks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2327,'Squishy''s Theme','Minecraft','2026-08-16T07:08:28.876750+00:00','https://www.youtube.com/watch?v=aGYiaWUxWNw',708,'https://ocrmirror.org/files/music/remixes/Minecraft_Squishy''s_Theme_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2328,'Thunderstruck','The Legend of Zelda: Ocarina of Time','2026-08-16T15:46:12.218383+00:00','https://www.youtube.com/watch?v=Y3HVHNf-oW4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Thunderstruck_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2329,'Fushigina Forest','The Legend of Zelda: A Link to the Past','2026-08-16T08:56:15.998614+00:00','https://www.youtube.com/watch?v=OpMtGN0LDNA',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Fushigina_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2330,'Hoy, Small Fry!','The Legend of Zelda: The Wind Waker','2026-08-16T19:44:06.552609+00:00','https://www.youtube.com/watch?v=DRiPHZXK1Ts',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Hoy_Small_Fry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2331,'Link''s Epoch','The Legend of Zelda: A Link to the Past','2026-08-16T10:48:40.076417+00:00','https://www.youtube.com/watch?v=fQciYzTLtPw',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Link''s_Epoch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2332,'Zelda''s First Trip to the "Village"','Zelda II: The Adventure of Link','2026-08-16T13:09:04.415824+00:00','https://www.youtube.com/watch?v=jLOCmDJgixo',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Zelda''s_First_Trip_to_the_''Village''_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2333,'Labyrinth of Dance Floors','The Legend of Zelda: A Link to the Past','2026-08-16T13:09:05.124035+00:00','https://www.youtube.com/watch?v=Cfv56cXOclk',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Labyrinth_of_Dance_Floors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2334,'Skyward','The Legend of Zelda: Skyward Sword','2026-08-16T08:56:15.296356+00:00','https://www.youtube.com/watch?v=DWsVunHPciw',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Skyward_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2335,'The Planet Is Dead','Final Fantasy VII','2026-08-16T11:44:54.448114+00:00','https://www.youtube.com/watch?v=c3haLKkffD4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Planet_Is_Dead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2336,'The Whip''s Memory','Castlevania: Portrait of Ruin','2026-08-16T17:44:56.035396+00:00','https://www.youtube.com/watch?v=dUIe9yl30Y0',578,'https://ocrmirror.org/files/music/remixes/Castlevania_Portrait_of_Ruin_The_Whip''s_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2337,'Chemical Blip','Sonic the Hedgehog 2','2026-08-16T05:53:21.089444+00:00','https://www.youtube.com/watch?v=_qM30uW4lbQ',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Chemical_Blip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2338,'Glenn','Chrono Trigger','2026-08-16T18:55:40.679844+00:00','https://www.youtube.com/watch?v=cmB6MyK_TUU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Glenn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2340,'BadAzz','Final Fantasy VII','2026-08-16T20:47:34.075765+00:00','https://www.youtube.com/watch?v=uoAwyHQ19Z0',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_BadAzz_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2341,'Real American Hero','G.I. Joe: A Real American Hero','2026-08-16T15:46:11.671566+00:00','https://www.youtube.com/watch?v=HMrozHE3_8Y',724,'https://ocrmirror.org/files/music/remixes/GI_Joe_Real_American_Hero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2342,'Routine of War','Metal Gear Solid 4: Guns of the Patriots','2026-08-16T13:09:03.887285+00:00','https://www.youtube.com/watch?v=ormx7YrLKLQ',707,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_4_Routine_of_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2343,'A Daring Escape','Mega Man 3','2026-08-16T14:49:00.661035+00:00','https://www.youtube.com/watch?v=M_vXd4lCcC0',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_A_Daring_Escape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2344,'Duel of the Apes','Donkey Kong','2026-08-16T20:47:34.254030+00:00','https://www.youtube.com/watch?v=haagWOAuJ0A',642,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Duel_of_the_Apes_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2345,'Turrimann','Mega Turrican','2026-08-16T10:48:39.369400+00:00','https://www.youtube.com/watch?v=MMqbsPlXZ9Q',693,'https://ocrmirror.org/files/music/remixes/Mega_Turrican_Turrimann_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2346,'The Feather''s Reflection','The Legend of Zelda: Link''s Awakening','2026-08-16T11:44:54.622502+00:00','https://www.youtube.com/watch?v=geKDuZolzPg',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_The_Feather''s_Reflection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2347,'Lost in the Mines','Descent','2026-08-16T14:49:01.010014+00:00','https://www.youtube.com/watch?v=myYasKp5Nzg',729,'https://ocrmirror.org/files/music/remixes/Descent_Lost_in_the_Mines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2348,'Succumb to the Wilderness','Wild Arms','2026-08-16T16:51:02.434498+00:00','https://www.youtube.com/watch?v=V1dseXE4CXo',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Succumb_to_the_Wilderness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2349,'Fireflight','Wild Arms','2026-08-16T16:51:02.085438+00:00','https://www.youtube.com/watch?v=axGpCx_zs8Q',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Fireflight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2350,'The Long Journey Ahead','Wild Arms','2026-08-16T17:44:56.384579+00:00','https://www.youtube.com/watch?v=NDZuwrH8cSw',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_The_Long_Journey_Ahead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2351,'Godspeed','Wild Arms','2026-08-16T18:55:41.036182+00:00','https://www.youtube.com/watch?v=vc9sv9ajw_U',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Godspeed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2352,'Return to Dust','Wild Arms','2026-08-16T11:44:55.321059+00:00','https://www.youtube.com/watch?v=IBboXt3S2tI',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Return_to_Dust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2353,'Holy Mother!','Wild Arms','2026-08-16T05:00:22.399039+00:00','https://www.youtube.com/watch?v=N2wlJOe2Vuo',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Holy_Mother_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2354,'Unstoppable','Wild Arms','2026-08-16T09:50:38.332505+00:00','https://www.youtube.com/watch?v=pzfEjzRnvjE',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Unstoppable_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2355,'Desirous Sacrifice','Wild Arms','2026-08-16T04:07:49.721599+00:00','https://www.youtube.com/watch?v=UAG92Xc_ywo',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Desirous_Sacrifice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2356,'What''s Left','Wild Arms','2026-08-16T09:50:37.705189+00:00','https://www.youtube.com/watch?v=JRWzfdwhgh4',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_What''s_Left_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2357,'Telepath Tower','Wild Arms','2026-08-16T07:53:31.244647+00:00','https://www.youtube.com/watch?v=noAGmLBinF8',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Telepath_Tower_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2358,'KR44441D','Metroid','2026-08-16T22:46:29.805255+00:00','https://www.youtube.com/watch?v=FZgoXMEY-tc',73,'https://ocrmirror.org/files/music/remixes/Metroid_KR44441D_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2359,'The Great Blizzard of ''9X','EarthBound','2026-08-16T14:49:00.483280+00:00','https://www.youtube.com/watch?v=K620Xfxc1W8',51,'https://ocrmirror.org/files/music/remixes/EarthBound_The_Great_Blizzard_of_''9X_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2360,'Ebbed Tides and Webbed Feet','DuckTales','2026-08-16T16:51:02.815910+00:00','https://www.youtube.com/watch?v=gOUKvZbhC-g',50,'https://ocrmirror.org/files/music/remixes/DuckTales_Ebbed_Tides_and_Webbed_Feet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2361,'Blue Haze','Pokémon Blue Version','2026-08-16T17:44:56.740564+00:00','https://www.youtube.com/watch?v=oV4WMs02FRQ',676,'https://ocrmirror.org/files/music/remixes/Pokemon_Blue_Version_Blue_Haze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2362,'Serpent''s Spiral','Mega Man 3','2026-08-16T10:48:38.834819+00:00','https://www.youtube.com/watch?v=e1Ep6-mSn24',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Serpent''s_Spiral_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2363,'The Unbroken','Cave Story','2026-08-16T19:44:05.663435+00:00','https://www.youtube.com/watch?v=IsNKq4g0W3w',486,'https://ocrmirror.org/files/music/remixes/Cave_Story_The_Unbroken_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2364,'The Life and Death of Kirby','Super Smash Bros.','2026-08-16T21:44:33.344447+00:00','https://www.youtube.com/watch?v=2VsushAM8_A',667,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_The_Life_and_Death_of_Kirby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2365,'By the Old Mill','Chrono Trigger','2026-08-16T13:52:26.576532+00:00','https://www.youtube.com/watch?v=_1e2vv1cpbU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_By_the_Old_Mill_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2366,'The Shredder','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-16T11:44:54.797076+00:00','https://www.youtube.com/watch?v=GohrfPEthmI',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_The_Shredder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2367,'Chaos Nightmares','Sonic Adventure','2026-08-16T17:44:56.563477+00:00','https://www.youtube.com/watch?v=ASq4xiLok3Q',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_Chaos_Nightmares_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2368,'The Price of Freedom','Metal Gear Solid','2026-08-16T20:47:33.898340+00:00','https://www.youtube.com/watch?v=2N2X27ZZgmg',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_The_Price_of_Freedom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2369,'This Treasure','Pokémon Ruby Version','2026-08-16T15:46:11.447968+00:00','https://www.youtube.com/watch?v=cZ-gyTodbQc',673,'https://ocrmirror.org/files/music/remixes/Pokemon_Ruby_Version_This_Treasure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2370,'The Glacier''s Peak','Sonic Advance','2026-08-16T16:51:00.966799+00:00','https://www.youtube.com/watch?v=Hg7VVxXucWY',730,'https://ocrmirror.org/files/music/remixes/Sonic_Advance_The_Glacier''s_Peak_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2371,'Trouble Brewin''','Dynamite Headdy','2026-08-16T14:49:01.184114+00:00','https://www.youtube.com/watch?v=dNMwttDXCHw',731,'https://ocrmirror.org/files/music/remixes/Dynamite_Headdy_Trouble_Brewin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2372,'Zeal Feels Good','Chrono Trigger','2026-08-16T20:47:33.542748+00:00','https://www.youtube.com/watch?v=YsLZp14uz2M',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Zeal_Feels_Good_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2373,'Dragonfood','Super Metroid','2026-08-16T13:09:04.239477+00:00','https://www.youtube.com/watch?v=WUxNvwJ6FjM',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Dragonfood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2374,'Wrath Industrial','God of War','2026-08-16T09:50:37.919665+00:00','https://www.youtube.com/watch?v=5HE6LeNMxUs',504,'https://ocrmirror.org/files/music/remixes/God_of_War_Wrath_Industrial_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2375,'Deforestation','Super Castlevania IV','2026-08-16T18:55:41.944253+00:00','https://www.youtube.com/watch?v=oq_EOSgY_zA',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Deforestation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2376,'Heroes Unsung','The 7th Saga','2026-08-16T22:46:31.483781+00:00','https://www.youtube.com/watch?v=4IIHXYzqozQ',732,'https://ocrmirror.org/files/music/remixes/7th_Saga_Heroes_Unsung_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2377,'Somber Memory','Secret of Evermore','2026-08-16T18:55:41.582172+00:00','https://www.youtube.com/watch?v=3zd6QvtJzEg',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_Somber_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2378,'Shimmering','SaGa Frontier 2','2026-08-16T15:46:11.332904+00:00','https://www.youtube.com/watch?v=F_O6shfB06E',588,'https://ocrmirror.org/files/music/remixes/SaGa_Frontier_2_Shimmering_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2379,'Weeping Willow','Willow','2026-08-16T18:55:41.394980+00:00','https://www.youtube.com/watch?v=e89s8hYQQNs',737,'https://ocrmirror.org/files/music/remixes/Willow_Weeping_Willow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2380,'Stockholm','Bahamut Lagoon','2026-08-16T13:52:26.012818+00:00','https://www.youtube.com/watch?v=rZ8FYhs7VGQ',340,'https://ocrmirror.org/files/music/remixes/Bahamut_Lagoon_Stockholm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2381,'elegy of the solipsist','The Legend of Zelda: Link''s Awakening','2026-08-16T20:47:34.609311+00:00','https://www.youtube.com/watch?v=mSr5IkfCHeA',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_elegy_of_the_solipsist_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2382,'Quicksander','Sonic & Knuckles','2026-08-17T02:03:43.742276+00:00','https://www.youtube.com/watch?v=CfX6SlwMBi0',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Quicksander_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2383,'Coconut Milk','Street Fighter II: The World Warrior','2026-08-16T21:44:33.520181+00:00','https://www.youtube.com/watch?v=b4UjSEE9iKk',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Coconut_Milk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2384,'Heroes Fall','Zelda II: The Adventure of Link','2026-08-16T23:43:58.808236+00:00','https://www.youtube.com/watch?v=P-1zKQZlNXc',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Heroes_Fall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2386,'Of Dreams and Time','Final Fantasy VIII','2026-08-16T15:46:11.782658+00:00','https://www.youtube.com/watch?v=5DY5ilepIE8',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Of_Dreams_and_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2387,'Above the Clouds','Ufouria: The Saga','2026-08-16T09:50:37.422781+00:00','https://www.youtube.com/watch?v=LpsgdOUQEnA',711,'https://ocrmirror.org/files/music/remixes/Ufouria_Above_the_Clouds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2388,'Prancing Dad','Final Fantasy VI','2026-08-17T05:59:56.635366+00:00','https://www.youtube.com/watch?v=8xsbTlrpkg4',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Prancing_Dad_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2389,'Lucid States','Chrono Trigger','2026-08-16T15:46:11.948603+00:00','https://www.youtube.com/watch?v=fgmyIECp05E',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Lucid_States_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2390,'Sephiroth''s Deliverance','Final Fantasy VII','2026-08-16T07:53:30.179157+00:00','https://www.youtube.com/watch?v=rvqk8qMS4K0',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Sephiroth''s_Deliverance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2391,'Spume','Pokémon Red Version','2026-08-16T18:55:41.214863+00:00','https://www.youtube.com/watch?v=mYu4pyKeiWg',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Spume_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2392,'Prelude, Fugue, and Groove','Katamari Damacy','2026-08-16T08:56:14.938486+00:00','https://www.youtube.com/watch?v=UwO2mrOJjPk',702,'https://ocrmirror.org/files/music/remixes/Katamari_Damacy_Prelude_Fugue_and_Groove_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2393,'Late Snows of Winter','Quest for Glory: So You Want to Be a Hero','2026-08-16T18:55:40.501172+00:00','https://www.youtube.com/watch?v=Ww5xVnycwC4',740,'https://ocrmirror.org/files/music/remixes/Quest_for_Glory_Late_Snows_of_Winter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2394,'Carry the Moment','Phoenix Wright: Ace Attorney','2026-08-16T15:46:12.526661+00:00','https://www.youtube.com/watch?v=HvbzsC13Wic',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_Carry_the_Moment_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2395,'~to be loved is to love~','Wild Arms','2026-08-16T13:09:03.529119+00:00','https://www.youtube.com/watch?v=d5kFFoL2ero',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_to_be_loved_is_to_love_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2396,'Toads in the Suite','Battletoads','2026-08-16T13:09:04.591999+00:00','https://www.youtube.com/watch?v=MwBJj7PSHQs',741,'https://ocrmirror.org/files/music/remixes/Battletoads_Toads_in_the_Suite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2397,'Lucid Dream, Latent Gate','NiGHTS: Journey of Dreams','2026-08-16T13:52:26.191259+00:00','https://www.youtube.com/watch?v=ci5PjXEihj8',742,'https://ocrmirror.org/files/music/remixes/NiGHTS_Journey_of_Dreams_Lucid_Dream_Latent_Gate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2398,'Samba Primata','Diddy Kong Racing','2026-08-16T08:56:16.528421+00:00','https://www.youtube.com/watch?v=xBab5gxmCiI',620,'https://ocrmirror.org/files/music/remixes/Diddy_Kong_Racing_Samba_Primata_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2399,'Duality','Mega Man X5','2026-08-16T23:43:58.987005+00:00','https://www.youtube.com/watch?v=xhwvX_8l7Yw',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Duality_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2400,'Vile Needs to Galvanize','Mega Man X','2026-08-16T20:47:33.364359+00:00','https://www.youtube.com/watch?v=BEvsZBIsKac',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Vile_Needs_to_Galvanize_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2401,'Tuck ''n Roll','Mega Man X','2026-08-17T04:19:25.364465+00:00','https://www.youtube.com/watch?v=46tjKe39ZSU',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Tuck_''n_Roll_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2402,'Winged Reploid (Revelation)','Mega Man X8','2026-08-16T16:51:01.145518+00:00','https://www.youtube.com/watch?v=xUk-uVwHcRI',687,'https://ocrmirror.org/files/music/remixes/Mega_Man_X8_Winged_Reploid_(Revelation)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2403,'Intruder Alert','Mega Man X2','2026-08-16T19:44:05.487025+00:00','https://www.youtube.com/watch?v=FWFIaJU4zdI',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Intruder_Alert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2404,'Put Ya Guns On','Mega Man X5','2026-08-16T19:44:06.199000+00:00','https://www.youtube.com/watch?v=cwrVYWMrf-Y',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Put_Ya_Guns_On_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2405,'X-Hunted','Mega Man X2','2026-08-16T19:44:06.907220+00:00','https://www.youtube.com/watch?v=8iAGhDYt1xo',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_X-Hunted_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2406,'Insecta Robotica','Mega Man X6','2026-08-16T22:46:30.314560+00:00','https://www.youtube.com/watch?v=qulc8MDD1M8',685,'https://ocrmirror.org/files/music/remixes/Mega_Man_X6_Insecta_Robotica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2407,'Noble Creature of Snow','Mega Man X3','2026-08-16T10:48:40.251957+00:00','https://www.youtube.com/watch?v=AuY-Pbqyx-0',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Noble_Creature_of_Snow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2408,'End of the Beginning','Mega Man X','2026-08-16T23:43:58.628879+00:00','https://www.youtube.com/watch?v=inexsSP_9Mk',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_End_of_the_Beginning_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2409,'Jammin'' with My NES','Teenage Mutant Ninja Turtles','2026-08-16T23:43:59.688881+00:00','https://www.youtube.com/watch?v=p0efyWanRxU',224,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_Jammin''_with_My_NES_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2410,'Days Long Passed, Seldom Remembered','Suikoden','2026-08-16T15:46:12.328880+00:00','https://www.youtube.com/watch?v=VZBxBqHebnk',316,'https://ocrmirror.org/files/music/remixes/Suikoden_Days_Long_Passed_Seldom_Remembered_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2411,'Amorelle','Shenmue','2026-08-16T21:44:32.459219+00:00','https://www.youtube.com/watch?v=kmb66p1Uilk',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Amorelle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2412,'Her Smile in Every Summer','The Legend of Zelda: The Wind Waker','2026-08-17T07:31:52.059813+00:00','https://www.youtube.com/watch?v=5nvODr-AWcI',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Her_Smile_in_Every_Summer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2413,'Hogging Molly','Crash Bandicoot','2026-08-16T23:43:59.864586+00:00','https://www.youtube.com/watch?v=_NLBCbMpH4Q',746,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_Hogging_Molly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2414,'All for Wumpa','Crash Bandicoot','2026-08-16T22:46:31.308006+00:00','https://www.youtube.com/watch?v=0N-NUCtYd8U',746,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_All_for_Wumpa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2415,'Flaming Hearts','Elemental Master','2026-08-16T17:44:57.090806+00:00','https://www.youtube.com/watch?v=HsIRd083ReE',747,'https://ocrmirror.org/files/music/remixes/Elemental_Master_Flaming_Hearts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2416,'Battle in the Far North','Final Fantasy X','2026-08-17T02:03:43.016301+00:00','https://www.youtube.com/watch?v=SeWcNoPIs04',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Battle_in_the_Far_North_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2417,'Laser Quick','Mega Man 2','2026-08-17T03:27:01.679359+00:00','https://www.youtube.com/watch?v=FiQbTAMqhrc',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Laser_Quick_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2418,'Ignition','Retro City Rampage','2026-08-16T18:55:40.857696+00:00','https://www.youtube.com/watch?v=JuBAoGNvOGE',749,'https://ocrmirror.org/files/music/remixes/Retro_City_Rampage_Ignition_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2419,'Premonitions','Wild Arms','2026-08-16T11:44:55.514779+00:00','https://www.youtube.com/watch?v=F_0GwzUurMc',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Premonitions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2420,'Musicolours','The Sims 3','2026-08-16T22:46:30.063619+00:00','https://www.youtube.com/watch?v=DZYHfpZYyS8',748,'https://ocrmirror.org/files/music/remixes/Sims_3_Musicolours_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2421,'Panzer Nightopia','NiGHTS into dreams...','2026-08-16T21:44:32.991882+00:00','https://www.youtube.com/watch?v=FP0aMdFf8uo',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Panzer_Nightopia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2422,'Nemesis the Doorlock','Nemesis the Warlock','2026-08-16T20:47:34.431491+00:00','https://www.youtube.com/watch?v=LrpwhNmhPaE',709,'https://ocrmirror.org/files/music/remixes/Nemesis_the_Warlock_Nemesis_the_Doorlock_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2423,'Ice Cave Dynamo','Battletoads','2026-08-16T14:49:00.129117+00:00','https://www.youtube.com/watch?v=o1zYUyW7plg',741,'https://ocrmirror.org/files/music/remixes/Battletoads_Ice_Cave_Dynamo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2424,'The Birdman Cometh','Pilotwings 64','2026-08-16T17:44:56.209667+00:00','https://www.youtube.com/watch?v=IyUNe71tYNQ',207,'https://ocrmirror.org/files/music/remixes/Pilotwings_64_The_Birdman_Cometh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2425,'9-bit Skies','Pilotwings','2026-08-16T13:52:27.113030+00:00','https://www.youtube.com/watch?v=kgG68AVIkTA',570,'https://ocrmirror.org/files/music/remixes/Pilotwings_9-bit_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2426,'Depth Perception','Pilotwings Resort','2026-08-16T19:44:05.843670+00:00','https://www.youtube.com/watch?v=AVcFztNKCWQ',750,'https://ocrmirror.org/files/music/remixes/Pilotwings_Resort_Depth_Perception_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2427,'Depth of the Deep','Donkey Kong Country','2026-08-17T05:59:56.111001+00:00','https://www.youtube.com/watch?v=UWatKna9HIs',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Depth_of_the_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2428,'Round the Cape of Good Hope','Wild Arms','2026-08-17T03:27:02.552460+00:00','https://www.youtube.com/watch?v=6iiMO7Qz6fw',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Round_the_Cape_of_Good_Hope_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2429,'In the Robot Factory','Sonic the Hedgehog 2','2026-08-16T21:44:33.169097+00:00','https://www.youtube.com/watch?v=b-YNRFYD1EY',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_In_the_Robot_Factory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2430,'Countdown to Infinity','Mega Man X6','2026-08-17T04:19:25.114764+00:00','https://www.youtube.com/watch?v=SgIBwqlix0U',685,'https://ocrmirror.org/files/music/remixes/Mega_Man_X6_Countdown_to_Infinity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2431,'Dungeoneering','Sword of Vermilion','2026-08-16T16:51:01.718338+00:00','https://www.youtube.com/watch?v=8SlrmW8-qhM',236,'https://ocrmirror.org/files/music/remixes/Sword_of_Vermilion_Dungeoneering_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2433,'The Eggerlander March','Adventures of Lolo 3','2026-08-17T02:03:44.282564+00:00','https://www.youtube.com/watch?v=Ou6InFLkAzI',753,'https://ocrmirror.org/files/music/remixes/Adventures_of_Lolo_3_The_Eggerlander_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2434,'The Tragic Drowning of Heat Man','Mega Man 2','2026-08-16T15:46:11.560269+00:00','https://www.youtube.com/watch?v=ATvbE-iPhso',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Tragic_Drowning_of_Heat_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2435,'The Obsequious Heterophobia of Dr. Melefam Buttfink','Sonic the Hedgehog 4: Episode I','2026-08-17T04:19:25.548171+00:00','https://www.youtube.com/watch?v=Otf8ctp1zNM',762,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_4_Episode_1_The_Obsequious_Heterophobia_of_Dr_Melefam_Buttfink_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2436,'Cries of Earth','Wild Arms','2026-08-16T16:51:01.537755+00:00','https://www.youtube.com/watch?v=WRHFtDFQ_Ls',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Cries_of_Earth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2437,'Death Tap','Castlevania','2026-08-17T02:03:43.202018+00:00','https://www.youtube.com/watch?v=fafmskx6MSM',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Death_Tap_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2438,'Autumn Painter','Luminous Arc','2026-08-17T03:27:02.902048+00:00','https://www.youtube.com/watch?v=4vktZKbzPt8',735,'https://ocrmirror.org/files/music/remixes/Luminous_Arc_Autumn_Painter_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2439,'Gliding on a Silver Lining','Kirby''s Dream Land','2026-08-17T03:27:02.028031+00:00','https://www.youtube.com/watch?v=eu-KC5v4dSE',234,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_Gliding_on_a_Silver_Lining_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2440,'High Voltage','Mega Man 9','2026-08-16T19:44:05.304291+00:00','https://www.youtube.com/watch?v=aHOFRXbJ8Ds',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_High_Voltage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2441,'Wonderful Shadows by the Electric Sheep Orchestra (stereo)','Mega Man','2026-08-17T04:19:24.907604+00:00','https://www.youtube.com/watch?v=nrW9htqeTQU',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Wonderful_Shadows_by_the_Electric_Sheep_Orchestra_(stereo)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2442,'bra reloCaTing','Cobra Triangle','2026-08-16T17:44:55.686116+00:00','https://www.youtube.com/watch?v=mf3gz1U9QBA',701,'https://ocrmirror.org/files/music/remixes/Cobra_Triangle_bra_reloCaTing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2443,'RDX Necklace','Final Fantasy IV','2026-08-17T02:03:43.562799+00:00','https://www.youtube.com/watch?v=QaYwHExTNIE',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_RDX_Necklace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2444,'A Tale of the God Slayer','Crystalis','2026-08-16T13:52:25.649957+00:00','https://www.youtube.com/watch?v=60-8nGXML6c',282,'https://ocrmirror.org/files/music/remixes/Crystalis_A_Tale_of_the_God_Slayer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2445,'Metroid Legacy','Super Metroid','2026-08-17T05:08:06.750344+00:00','https://www.youtube.com/watch?v=WGIGfPaS5OQ',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Metroid_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2446,'The Desert Had a Strange Dream','NiGHTS into dreams...','2026-08-17T09:08:33.650082+00:00','https://www.youtube.com/watch?v=KcSE5wexjXM',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_The_Desert_Had_a_Strange_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2448,'A Lesson from Teacher','PaRappa the Rapper','2026-08-16T22:46:30.616917+00:00','https://www.youtube.com/watch?v=GyPKRwmjXTs',640,'https://ocrmirror.org/files/music/remixes/PaRappa_the_Rapper_A_Lesson_from_Teacher_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2449,'Blowin''em Outta the Water','Mega Man 2','2026-08-16T13:09:04.947098+00:00','https://www.youtube.com/watch?v=Y53XJGVSQG4',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Blowin''em_Outta_the_Water_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2450,'The Broken Front','Red Zone','2026-08-16T17:44:55.860701+00:00','https://www.youtube.com/watch?v=Q1egmHTGiUg',755,'https://ocrmirror.org/files/music/remixes/Red_Zone_The_Broken_Front_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2451,'The First Story','Final Fantasy','2026-08-16T22:46:31.125532+00:00','https://www.youtube.com/watch?v=TRc6z6acTAo',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_The_First_Story_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2452,'Secrets Abound','Final Fantasy','2026-08-16T17:44:56.915945+00:00','https://www.youtube.com/watch?v=kVZCyfHrMtg',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Secrets_Abound_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2453,'Dance of Descent','Final Fantasy','2026-08-17T02:03:44.640025+00:00','https://www.youtube.com/watch?v=bDulANrycxY',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Dance_of_Descent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2454,'Fierce Fairground Fight','Final Fantasy','2026-08-17T05:08:07.272498+00:00','https://www.youtube.com/watch?v=QBEuhjEf2OU',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Fierce_Fairground_Fight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2455,'Onward (The Travelin'' Song)','Final Fantasy','2026-08-17T05:08:06.925165+00:00','https://www.youtube.com/watch?v=RdGCzX3zHRs',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Onward_(The_Travelin''_Song)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2456,'Just Passing Through','Final Fantasy','2026-08-16T20:47:33.185711+00:00','https://www.youtube.com/watch?v=9mSPHzKvZhw',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Just_Passing_Through_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2457,'Tetris Plays You!','Tetris','2026-08-17T09:08:33.465693+00:00','https://www.youtube.com/watch?v=rHfzXpeCsuY',510,'https://ocrmirror.org/files/music/remixes/Tetris_Tetris_Plays_You_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2458,'East Meets Western','Wild Arms','2026-08-16T21:44:33.697180+00:00','https://www.youtube.com/watch?v=ktN8xLEszsE',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_East_Meets_Western_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2459,'Zero''s Plight','Mega Man X5','2026-08-16T22:46:31.660567+00:00','https://www.youtube.com/watch?v=RfjhhU0gHEQ',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Zero''s_Plight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2460,'Hypnotica','Ecco: The Tides of Time','2026-08-17T03:27:01.326464+00:00','https://www.youtube.com/watch?v=sDnAOsYfZ_M',607,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Hypnotica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2461,'Star King','Star Fox 64','2026-08-17T10:04:41.072495+00:00','https://www.youtube.com/watch?v=Gtcn0_fgCY0',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Star_King_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2462,'Stealth Lizard','Mega Man X','2026-08-17T05:59:55.405355+00:00','https://www.youtube.com/watch?v=e_W6KEPxjMM',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Stealth_Lizard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2464,'Duel of the Blades','Final Fantasy VII','2026-08-17T05:08:06.402974+00:00','https://www.youtube.com/watch?v=fn1Vo2IPjVk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Duel_of_the_Blades_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2465,'You and I','Xenogears','2026-08-17T05:08:06.055471+00:00','https://www.youtube.com/watch?v=-eAW8DZ2w4s',70,'https://ocrmirror.org/files/music/remixes/Xenogears_You_and_I_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2466,'Switchblade Fangs','Mega Man 3','2026-08-16T21:44:33.872761+00:00','https://www.youtube.com/watch?v=STtF-PxhTuQ',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Switchblade_Fangs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2467,'Paradis','Final Fantasy XI Online','2026-08-17T10:56:23.228570+00:00','https://www.youtube.com/watch?v=g5kc7HzAWp4',546,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_Paradis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2468,'Mother','Final Fantasy VII','2026-08-17T07:31:52.413644+00:00','https://www.youtube.com/watch?v=HV-QrEAnF-E',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Mother_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2469,'Ice Cap Zone Rescue','Sonic the Hedgehog 3','2026-08-17T04:19:24.529422+00:00','https://www.youtube.com/watch?v=uN28MG2s8mk',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Ice_Cap_Zone_Rescue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2470,'Sign of Fortune','Metal Gear Solid 4: Guns of the Patriots','2026-08-17T03:27:01.503843+00:00','https://www.youtube.com/watch?v=6RdA8eCmzNQ',707,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_4_Sign_of_Fortune_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2471,'The 51st','No More Heroes','2026-08-16T23:43:59.162914+00:00','https://www.youtube.com/watch?v=kSFmSQOQmE4',756,'https://ocrmirror.org/files/music/remixes/No_More_Heroes_The_51st_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2472,'Super Fighting Robot X','Mega Man X3','2026-08-17T05:59:56.286024+00:00','https://www.youtube.com/watch?v=2waR96OYdLA',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Super_Fighting_Robot_X_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2473,'Last Lucky Planet','Puggsy','2026-08-16T20:47:33.720060+00:00','https://www.youtube.com/watch?v=yxWlWKDNKkE',761,'https://ocrmirror.org/files/music/remixes/Puggsy_Last_Lucky_Planet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2474,'Ancient Dreams','NieR','2026-08-17T10:56:23.574537+00:00','https://www.youtube.com/watch?v=n7VhpCBdfY4',758,'https://ocrmirror.org/files/music/remixes/NieR_Ancient_Dreams_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2475,'affirmation','Mega Man X5','2026-08-17T07:31:52.236307+00:00','https://www.youtube.com/watch?v=eixjPijRX5Q',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_affirmation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2476,'The Will of the Forest','Mega Man II','2026-08-16T19:44:06.375600+00:00','https://www.youtube.com/watch?v=VMdo_ktFroY',764,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Will_of_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2478,'Blackout Tower','Mega Man 9','2026-08-16T16:51:00.788743+00:00','https://www.youtube.com/watch?v=FUP1ZBwK2S0',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Blackout_Tower_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2479,'The Ultimate Sacrifice','Wild Arms','2026-08-16T16:51:02.617136+00:00','https://www.youtube.com/watch?v=IATkcgpJMpw',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_The_Ultimate_Sacrifice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2480,'Of Whips and Strings','Castlevania','2026-08-17T10:56:23.750374+00:00','https://www.youtube.com/watch?v=ausjldeefhU',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Of_Whips_and_Strings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2481,'Shikashi''s Dream','The Legend of Zelda: Majora''s Mask','2026-08-16T23:43:59.338279+00:00','https://www.youtube.com/watch?v=FO6dOHCSgpE',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Shikashi''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2482,'Ruffneck Terra','Final Fantasy VI','2026-08-17T11:50:09.991665+00:00','https://www.youtube.com/watch?v=VzUbK4Yq7IM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Ruffneck_Terra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2483,'Fire Move','Doom Troopers: Mutant Chronicles','2026-08-16T18:55:40.316595+00:00','https://www.youtube.com/watch?v=KCm78A8DVrw',759,'https://ocrmirror.org/files/music/remixes/Doom_Troopers_Fire_Move_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2484,'Four Seasons of the Blues','Harvest Moon','2026-08-17T05:08:06.577187+00:00','https://www.youtube.com/watch?v=gdyBtM0QUnI',682,'https://ocrmirror.org/files/music/remixes/Harvest_Moon_Four_Seasons_of_the_Blues_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2485,'The Sky Will Be Your Limit','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-17T05:08:05.703292+00:00','https://www.youtube.com/watch?v=6IQzFq67dHg',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_The_Sky_Will_Be_Your_Limit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2486,'Mayan Malfunction','Pitfall: The Mayan Adventure','2026-08-17T11:50:10.703086+00:00','https://www.youtube.com/watch?v=lut-nGe21p4',770,'https://ocrmirror.org/files/music/remixes/Pitfall_The_Mayan_Adventure_Mayan_Malfunction_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2487,'Tangolomango','QuackShot','2026-08-16T19:44:06.021957+00:00','https://www.youtube.com/watch?v=4iUqjRfdUKk',688,'https://ocrmirror.org/files/music/remixes/QuackShot_Tangolomango_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2488,'A Hint of Blue','Donkey Kong Country','2026-08-17T14:53:29.262492+00:00','https://www.youtube.com/watch?v=bytIrcr42M4',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_A_Hint_of_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2489,'Anoplophora','Mega Man X3','2026-08-16T21:44:32.813598+00:00','https://www.youtube.com/watch?v=b_pZULmkBsI',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Anoplophora_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2490,'Running the Cyberpunks','Shadowrun','2026-08-17T09:08:34.740380+00:00','https://www.youtube.com/watch?v=FwBpOwkZMc8',769,'https://ocrmirror.org/files/music/remixes/Shadowrun_Running_the_Cyberpunks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2491,'Ryu Next Generation (RNG)','Street Fighter II: The World Warrior','2026-08-17T07:31:53.125705+00:00','https://www.youtube.com/watch?v=ADCvYmwkG9Y',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Ryu_Next_Generation_(RNG)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2492,'Wanking with the Alien','Silver Surfer','2026-08-17T09:08:33.278818+00:00','https://www.youtube.com/watch?v=rfrh-yBriA4',768,'https://ocrmirror.org/files/music/remixes/Silver_Surfer_Wanking_with_the_Alien_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2496,'Memories of an Ocarina','The Legend of Zelda: Majora''s Mask','2026-08-17T09:08:33.830801+00:00','https://www.youtube.com/watch?v=OeLUK4a6Ojc',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Memories_of_an_Ocarina_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2497,'Rebirth of Venus','Golden Sun','2026-08-17T14:01:13.250609+00:00','https://www.youtube.com/watch?v=pGaxaHVJRdY',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Rebirth_of_Venus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2498,'All Who Oppose','Final Fantasy VI','2026-08-17T04:19:24.708583+00:00','https://www.youtube.com/watch?v=b3x5NtwiRNc',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_All_Who_Oppose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2499,'Death, Rebirth, Life - 1986','Final Fantasy VII','2026-08-17T14:01:13.425307+00:00','https://www.youtube.com/watch?v=F7sWOIyTvzE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Death_Rebirth_Life_1986_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2500,'Hot Pursuit in the Lost City of Wily','Mega Man 3','2026-08-17T15:49:38.053392+00:00','https://www.youtube.com/watch?v=NFilGyMhdAQ',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Hot_Pursuit_in_the_Lost_City_of_Wily_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2501,'Wizard''s Bride','Wizards & Warriors','2026-08-16T19:44:06.729228+00:00','https://www.youtube.com/watch?v=g95ePyzHzYA',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_Wizard''s_Bride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2502,'RabaNasty','Final Fantasy XII','2026-08-16T23:44:00.041102+00:00','https://www.youtube.com/watch?v=dtIc8EuiE84',525,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_12_RabaNasty_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2503,'STING','Mega Man X3','2026-08-17T05:08:06.228439+00:00','https://www.youtube.com/watch?v=N7kDovRwpxo',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_STING_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2504,'Sunrise over Mardia','MapleStory','2026-08-17T03:27:02.377587+00:00','https://www.youtube.com/watch?v=xPuc4bz1Meo',766,'https://ocrmirror.org/files/music/remixes/MapleStory_Sunrise_over_Mardia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2505,'Melting Sun','Metroid Prime 3: Corruption','2026-08-17T02:03:44.462540+00:00','https://www.youtube.com/watch?v=-NoqDqz8mXs',518,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_3_Melting_Sun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2506,'Dramatic Dark World','Final Fantasy VI','2026-08-16T21:44:32.278006+00:00','https://www.youtube.com/watch?v=e6r1s2LqqHs',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dramatic_Dark_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2507,'Bubbling Adrenaline','Mega Man 2','2026-08-16T20:47:33.004778+00:00','https://www.youtube.com/watch?v=qT0lxNlmkwo',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Bubbling_Adrenaline_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2508,'My Loved Ones Are Gone','Wolfenstein 3D','2026-08-17T02:03:43.383194+00:00','https://www.youtube.com/watch?v=Y2lvUMF1wto',357,'https://ocrmirror.org/files/music/remixes/Wolfenstein_3D_My_Loved_Ones_Are_Gone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2509,'Lies Within Dreams','NiGHTS into dreams...','2026-08-17T10:56:23.401462+00:00','https://www.youtube.com/watch?v=FjaVxe37tdk',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Lies_Within_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2510,'Plains, Capes and Turnips','New Super Mario Bros.','2026-08-17T14:01:13.601306+00:00','https://www.youtube.com/watch?v=9rzsHDrX684',489,'https://ocrmirror.org/files/music/remixes/New_Super_Mario_Bros_Plains_Capes_and_Turnips_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2511,'Strange Rock in the Heavens','Impulse','2026-08-17T10:04:40.612115+00:00','https://www.youtube.com/watch?v=RAEy_nrffeQ',819,'https://ocrmirror.org/files/music/remixes/Impulse_Strange_Rock_in_the_Heavens_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2512,'Concrete Heart','Mega Man 9','2026-08-17T14:53:29.436430+00:00','https://www.youtube.com/watch?v=D6TYwUme0-k',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Concrete_Heart_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2513,'From Here On','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-16T21:44:32.636124+00:00','https://www.youtube.com/watch?v=G1RnqwW2Ufk',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_From_Here_On_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2514,'Moondrops','Pokémon Red Version','2026-08-17T11:50:09.458701+00:00','https://www.youtube.com/watch?v=jlCwMnuNIQw',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Moondrops_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2515,'Into the Green World','Super Metroid','2026-08-17T13:20:47.202740+00:00','https://www.youtube.com/watch?v=KsgbMuIVLnU',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Into_the_Green_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2516,'The Beginning of a Legacy','Final Fantasy','2026-08-17T02:03:44.102645+00:00','https://www.youtube.com/watch?v=XvCAjwTaKRE',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_The_Beginning_of_a_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2517,'Islands in the Sky','Chrono Trigger','2026-08-17T09:08:34.377431+00:00','https://www.youtube.com/watch?v=d4YmjP6pctU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Islands_in_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2518,'I''m a Force of Nature','Wild Arms','2026-08-17T03:27:02.202236+00:00','https://www.youtube.com/watch?v=gjbvjZ-xb-M',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_I''m_a_Force_of_Nature_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2520,'Full Mast','The Legend of Zelda: The Wind Waker','2026-08-17T19:06:58.324900+00:00','https://www.youtube.com/watch?v=9VV2Enalo0c',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Full_Mast_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2521,'Children of the Wicked','Castlevania','2026-08-17T10:56:23.054152+00:00','https://www.youtube.com/watch?v=2TeYYpAoX-g',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Children_of_the_Wicked_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2522,'Through the Castle','Super Mario World','2026-08-17T10:04:40.499487+00:00','https://www.youtube.com/watch?v=M5lcg2rVSKk',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Through_the_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2523,'Where the Demon Sleeps','Silent Hill 2','2026-08-16T23:44:00.216797+00:00','https://www.youtube.com/watch?v=f5OvVVg8bEc',63,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_Where_the_Demon_Sleeps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2524,'Where''s the Ocean, Andrew?','Donkey Kong Country','2026-08-17T19:06:58.504623+00:00','https://www.youtube.com/watch?v=ZEGqJjIaCw8',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Where''s_the_Ocean_Andrew_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2525,'Morricone Man','Mega Man 9','2026-08-17T09:08:34.014391+00:00','https://www.youtube.com/watch?v=SfptXP9v3mY',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Morricone_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2527,'Lady in Black','Bayonetta','2026-08-17T10:56:24.098140+00:00','https://www.youtube.com/watch?v=PRr1Q4iWjdE',700,'https://ocrmirror.org/files/music/remixes/Bayonetta_Lady_in_Black_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2528,'Royal Treasure','The Legend of Zelda: Ocarina of Time','2026-08-17T16:54:42.804766+00:00','https://www.youtube.com/watch?v=UBfqFi07UJs',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Royal_Treasure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2530,'Solarcoil','Mega Man 10','2026-08-17T10:04:40.258044+00:00','https://www.youtube.com/watch?v=ozt1sD22A0o',757,'https://ocrmirror.org/files/music/remixes/Mega_Man_10_Solarcoil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2531,'White Magic Is for Sissies','Final Fantasy VIII','2026-08-16T23:43:59.513342+00:00','https://www.youtube.com/watch?v=VFxzSz9lo9U',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_White_Magic_Is_for_Sissies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2532,'Doomsday','Sonic & Knuckles','2026-08-17T07:31:52.591909+00:00','https://www.youtube.com/watch?v=sIT6Jhnl2Rk',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Doomsday_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2533,'WoodChipper','Mega Man 2','2026-08-17T10:56:22.690442+00:00','https://www.youtube.com/watch?v=icjBiufEO4s',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_WoodChipper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2534,'Kind of Betus Blue (Betus Blues Piano)','Super Meat Boy','2026-08-16T22:46:29.611143+00:00','https://www.youtube.com/watch?v=tKl0ticDUBs',644,'https://ocrmirror.org/files/music/remixes/Super_Meat_Boy_Kind_of_Betus_Blue_(Betus_Blues_Piano)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2535,'Enough Time to Dance','Castlevania','2026-08-17T14:53:29.957273+00:00','https://www.youtube.com/watch?v=veh0i74ZlO8',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Enough_Time_to_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2536,'120 Ways to Chill Out','Pokémon Ruby Version','2026-08-17T04:19:25.907239+00:00','https://www.youtube.com/watch?v=gvdj9P2q_eo',673,'https://ocrmirror.org/files/music/remixes/Pokemon_Ruby_Verision_120_Ways_to_Chill_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2537,'Synthesize This!','Mega Man 6','2026-08-17T17:55:42.013321+00:00','https://www.youtube.com/watch?v=jZ_o1-Lygeo',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Synthesize_This_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2538,'Spanish Jitters','Donkey Kong Country 3','2026-08-17T23:46:44.574394+00:00','https://www.youtube.com/watch?v=t52__IEs1Bk',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Spanish_Jitters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2539,'The Submap Emissary','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T07:31:52.947670+00:00','https://www.youtube.com/watch?v=LqKzBDvyuSE',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_The_Submap_Emissary_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2540,'Tangerine Fever','Donkey Kong Country 3','2026-08-17T05:59:55.935562+00:00','https://www.youtube.com/watch?v=q9tI-2nuAMI',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Tangerine_Fever_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2541,'Bash the Bastards!','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T14:53:29.783316+00:00','https://www.youtube.com/watch?v=3LTzIi8i824',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Bash_the_Bastards_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2542,'Epic Bananas','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T13:20:46.494447+00:00','https://www.youtube.com/watch?v=4Wy21QohWwI',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Epic_Bananas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2543,'Thump Brothers','Donkey Kong Country 3','2026-08-17T03:27:01.853733+00:00','https://www.youtube.com/watch?v=eZKpSTEwpKU',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Thump_Brothers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2544,'Kingfisher''s Stream','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T14:53:29.609248+00:00','https://www.youtube.com/watch?v=K8WyS5gzkdE',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Kingfisher''s_Stream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2545,'Exploration C','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T11:50:10.525963+00:00','https://www.youtube.com/watch?v=ylEthA8EoCA',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Exploration_C_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2546,'The Paper Chase','Donkey Kong Country 3','2026-08-17T10:04:40.848238+00:00','https://www.youtube.com/watch?v=oV6s1XYWVnU',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_The_Paper_Chase_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2547,'Blast Beatdown','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T16:54:41.748819+00:00','https://www.youtube.com/watch?v=e3XmWgJ83kw',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Blast_Beatdown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2548,'Sea Breeze Concerto','Donkey Kong Country 3','2026-08-17T17:55:41.657968+00:00','https://www.youtube.com/watch?v=bl9kYRjo-rA',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Sea_Breeze_Concerto_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2549,'Intoxica','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T17:55:41.302973+00:00','https://www.youtube.com/watch?v=GikvajSCLlE',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Intoxica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2550,'Corn-fed Kong','Donkey Kong Country 3','2026-08-17T15:49:38.520512+00:00','https://www.youtube.com/watch?v=PcLmitwL0zI',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Corn-fed_Kong_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2551,'Cliffside Clamber','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T10:04:40.388144+00:00','https://www.youtube.com/watch?v=UTn6q5sufQQ',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Cliffside_Clamber_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2552,'Beneath the Moonlight','Donkey Kong Country 3','2026-08-17T22:50:07.786200+00:00','https://www.youtube.com/watch?v=narYEk7CefQ',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Beneath_the_Moonlight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2553,'Drag Me Up (to Heaven)','Mega Man','2026-08-17T05:59:55.760889+00:00','https://www.youtube.com/watch?v=M7N3EEG42kU',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Drag_Me_Up_(to_Heaven)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2554,'Hylia''s Fear','The Legend of Zelda: Skyward Sword','2026-08-17T04:19:23.990150+00:00','https://www.youtube.com/watch?v=w7ErA7H-h1o',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Hylia''s_Fear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2555,'Gurgling Desert Pond','Final Fantasy','2026-08-17T05:08:05.879890+00:00','https://www.youtube.com/watch?v=dH8mxbosRhU',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Gurgling_Desert_Pond_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2556,'Oboro Drive','Shinobi III: Return of the Ninja Master','2026-08-17T03:27:02.727283+00:00','https://www.youtube.com/watch?v=PnEyXEBd-S8',353,'https://ocrmirror.org/files/music/remixes/Shinobi_3_Oboro_Drive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2557,'Wild Night','Castlevania','2026-08-17T04:19:24.351544+00:00','https://www.youtube.com/watch?v=MdQeZBpdscY',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Wild_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2558,'Silence Before Repentance','Final Fantasy X','2026-08-17T09:08:34.196133+00:00','https://www.youtube.com/watch?v=5lSXaDANvtQ',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Silence_Before_Repentance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2559,'Practicing Retrocognition','EarthBound','2026-08-17T16:54:42.279761+00:00','https://www.youtube.com/watch?v=LGE1fBIltrQ',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Practicing_Retrocognition_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2561,'resolut(-ion)','Mega Man Zero 4','2026-08-17T14:53:29.089195+00:00','https://www.youtube.com/watch?v=xd1cmt9ZAm4',744,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_4_resolut(-ion)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2562,'Not the Taxi You Whistled For','Final Fantasy VII','2026-08-17T23:46:44.751260+00:00','https://www.youtube.com/watch?v=kgMhS9fVsFg',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Not_the_Taxi_You_Whistled_For_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2563,'Airborne','Sonic & Knuckles','2026-08-17T14:01:13.951645+00:00','https://www.youtube.com/watch?v=jcExvvbtFpA',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Airborne_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2564,'A Morning at the Abbey','Wild Arms','2026-08-17T11:50:10.347770+00:00','https://www.youtube.com/watch?v=i1HCxmMMfEE',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_A_Morning_at_the_Abbey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2565,'The World After Asterion','Cardinal Quest','2026-08-17T07:31:51.704597+00:00','https://www.youtube.com/watch?v=IIUVmHUHuzQ',817,'https://ocrmirror.org/files/music/remixes/Cardinal_Quest_The_World_After_Asterion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2566,'Requiem for a Dying World','Final Fantasy','2026-08-17T13:20:46.849218+00:00','https://www.youtube.com/watch?v=5PRo-3jOi3A',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Requiem_for_a_Dying_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2567,'Relics of an Ancient Race','Metroid Prime','2026-08-17T15:49:37.702402+00:00','https://www.youtube.com/watch?v=x21k14XcHow',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Relics_of_an_Ancient_Race_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2568,'Dawn of a New Day','The Legend of Zelda: Majora''s Mask','2026-08-17T21:50:09.076000+00:00','https://www.youtube.com/watch?v=1NryFD9_hR0',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Dawn_of_a_New_Day_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2569,'mojo gogo','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T05:59:56.460687+00:00','https://www.youtube.com/watch?v=kzPNyzN_g1c',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_mojo_gogo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2571,'Stars on Ice','Ristar','2026-08-17T09:08:33.094716+00:00','https://www.youtube.com/watch?v=9RABA5jyU-w',131,'https://ocrmirror.org/files/music/remixes/Ristar_Stars_on_Ice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2572,'A Dream Between Worlds','Chrono Cross','2026-08-17T11:50:09.635209+00:00','https://www.youtube.com/watch?v=g9sp3De7ocA',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_A_Dream_Between_Worlds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2573,'Innocent Deception','Metal Gear Solid 3: Snake Eater','2026-08-18T01:57:02.236973+00:00','https://www.youtube.com/watch?v=0tkIij0Bn-o',481,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_3_Innocent_Deception_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2574,'Hero of Celceta','Ys IV: The Dawn of Ys','2026-08-17T07:31:51.882588+00:00','https://www.youtube.com/watch?v=j1YlN4tCnWE',738,'https://ocrmirror.org/files/music/remixes/Ys_4_Hero_of_Celceta_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2575,'Trigger, Please','Chrono Trigger','2026-08-17T19:50:40.615231+00:00','https://www.youtube.com/watch?v=jxOUM8Rxx-M',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Trigger_Please_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2576,'Almost Frozen','Super Dodge Ball','2026-08-17T14:01:12.899350+00:00','https://www.youtube.com/watch?v=blR_HlD9N2A',532,'https://ocrmirror.org/files/music/remixes/Super_Dodge_Ball_Almost_Frozen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2577,'Solace','The Legend of Zelda: Ocarina of Time','2026-08-17T15:49:37.878156+00:00','https://www.youtube.com/watch?v=cihZX0e2EBY',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Solace_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2578,'Priority Nemesis','Wild Arms','2026-08-17T05:59:56.985077+00:00','https://www.youtube.com/watch?v=CiMO8iqQE9A',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Priority_Nemesis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2579,'Polygons Are Inaccurate','Super Smash Bros.','2026-08-17T20:53:40.317671+00:00','https://www.youtube.com/watch?v=o-cwL5Q71yI',667,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Polygons_Are_Inaccurate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2580,'Little Arena','Persona 4 Arena','2026-08-17T13:20:46.673247+00:00','https://www.youtube.com/watch?v=DMbEsIMjbBs',823,'https://ocrmirror.org/files/music/remixes/Persona_4_Arena_Little_Arena_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2581,'One-Hit KO (Bye Esaka Mix)','The King of Fighters XIII','2026-08-17T19:50:40.257882+00:00','https://www.youtube.com/watch?v=vNwMjVnvwdg',822,'https://ocrmirror.org/files/music/remixes/King_of_Fighters_13_One-Hit_KO_(Bye_Esaka_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2583,'Marblelous Garden','Sonic the Hedgehog 3','2026-08-17T14:53:30.132510+00:00','https://www.youtube.com/watch?v=A2JCdHaOpy4',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Marblelous_Garden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2584,'Liftoff (Get High)','Pilotwings','2026-08-17T07:31:51.519977+00:00','https://www.youtube.com/watch?v=Xbb5AkmveUc',570,'https://ocrmirror.org/files/music/remixes/Pilotwings_Liftoff_(Get_High)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2585,'OMAKE 8 (Type-R)','Lightening Force: Quest for the Darkstar','2026-08-18T01:57:01.536906+00:00','https://www.youtube.com/watch?v=_IA7mPnHr3E',315,'https://ocrmirror.org/files/music/remixes/Lightening_Force_OMAKE_8_(Type-R)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2586,'Pull the Plug','Mega Man','2026-08-17T13:20:47.391539+00:00','https://www.youtube.com/watch?v=Kp2uxi5P7Uk',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Pull_the_Plug_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2587,'Dirty Coins','Super Mario Bros.','2026-08-18T01:57:01.887369+00:00','https://www.youtube.com/watch?v=Wde8HUN77RA',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Dirty_Coins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2588,'The Traveling Band''s Last Song','Wild Arms','2026-08-17T05:08:07.098400+00:00','https://www.youtube.com/watch?v=D1idWTRqycw',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_The_Traveling_Band''s_Last_Song_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2589,'PaNic AttaCk','Sonic 3D Blast','2026-08-17T14:01:12.544954+00:00','https://www.youtube.com/watch?v=VRyFM4JrEdc',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_PaNic_AttaCk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2590,'Mega Manhood 3: The Blasting of Hard Man','Mega Man 3','2026-08-17T21:50:08.897546+00:00','https://www.youtube.com/watch?v=QMNJIulheEo',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Mega_Manhood_3_The_Blasting_of_Hard_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2591,'Lone Star','Metroid Prime','2026-08-17T05:59:55.584884+00:00','https://www.youtube.com/watch?v=tUxoD6zsY10',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Lone_Star_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2592,'Saren''s Prayer','Mass Effect','2026-08-17T16:54:42.455397+00:00','https://www.youtube.com/watch?v=T0BQF3n73iQ',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_Saren''s_Prayer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2593,'99 Floors Underground','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-17T05:59:56.810031+00:00','https://www.youtube.com/watch?v=P6zJSU4CpRU',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_99_Floors_Underground_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2594,'Sentient Machines','Final Fantasy','2026-08-17T19:50:39.361303+00:00','https://www.youtube.com/watch?v=dGl0I1hXXEw',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Sentient_Machines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2595,'Little Glockenspiel','Super Mario Galaxy','2026-08-17T09:08:34.558899+00:00','https://www.youtube.com/watch?v=wVgGfOW38gQ',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Little_Glockenspiel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2596,'Dusty Dune Devil','Mega Man X2','2026-08-17T14:53:28.914061+00:00','https://www.youtube.com/watch?v=cYRht5r8Il0',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Dusty_Dune_Devil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2597,'Not Another Full Metal Squad!','Lightening Force: Quest for the Darkstar','2026-08-17T17:55:41.480284+00:00','https://www.youtube.com/watch?v=LXeU2_A_4RI',315,'https://ocrmirror.org/files/music/remixes/Lightening_Force_Not_Another_Full_Metal_Squad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2598,'The Myth of Darkmoon','Eye of the Beholder II: The Legend of Darkmoon','2026-08-17T20:53:40.885655+00:00','https://www.youtube.com/watch?v=ZPgkFIDp7ZE',807,'https://ocrmirror.org/files/music/remixes/Eye_of_the_Beholder_2_The_Myth_of_Darkmoon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2599,'Iron Will March','Mega Man X8','2026-08-17T19:06:58.148744+00:00','https://www.youtube.com/watch?v=Zk0sX05bN08',687,'https://ocrmirror.org/files/music/remixes/Mega_Man_X8_Iron_Will_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2600,'Hogs of War','Hedgewars','2026-08-17T16:54:42.102051+00:00','https://www.youtube.com/watch?v=N0tfccTQglQ',818,'https://ocrmirror.org/files/music/remixes/Hedgewars_Hogs_of_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2601,'This Winding Road','Faxanadu','2026-08-17T17:55:41.126042+00:00','https://www.youtube.com/watch?v=RJnNoGV5nv0',114,'https://ocrmirror.org/files/music/remixes/Faxanadu_This_Winding_Road_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2602,'Incorrigible','Chrono Trigger','2026-08-17T11:50:09.276423+00:00','https://www.youtube.com/watch?v=yFdo6jJ_Bxw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Incorrigible_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2603,'Lullaby of Flame','Touhou Chireiden: Subterranean Animism','2026-08-17T19:50:39.541721+00:00','https://www.youtube.com/watch?v=8gIrWZEEQeM',813,'https://ocrmirror.org/files/music/remixes/Touhou_Chireiden_Subterranean_Animism_Lullaby_of_Flame_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2604,'Biologica Robotica','Return All Robots!','2026-08-17T10:56:22.864582+00:00','https://www.youtube.com/watch?v=Z412z-LKJLc',656,'https://ocrmirror.org/files/music/remixes/Return_All_Robots_Biologica_Robotica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2605,'Fragments of a Legend','The Legend of Zelda: Ocarina of Time','2026-08-17T19:50:39.900179+00:00','https://www.youtube.com/watch?v=rGNN35uIRxA',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Fragments_of_a_Legend_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2606,'Funky Side Up','Sonic & Knuckles','2026-08-17T20:53:40.065426+00:00','https://www.youtube.com/watch?v=LQJF4XFQh1s',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Funky_Side_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2607,'Memories of Blood & Bone','The Revenge of Shinobi','2026-08-17T10:04:40.033458+00:00','https://www.youtube.com/watch?v=d1dq1qQViWk',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_Memories_of_Blood_&_Bone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2608,'Dreams of Home','The Legend of Zelda: Link''s Awakening','2026-08-17T17:55:40.949012+00:00','https://www.youtube.com/watch?v=Mm7DHztmPF8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Dreams_of_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2609,'Shoto Spirits','Street Fighter II: The World Warrior','2026-08-18T05:54:38.052677+00:00','https://www.youtube.com/watch?v=50X2SWe-oT4',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Shoto_Spirits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2610,'Rusty Fingers','Sonic 3D Blast','2026-08-17T13:20:47.026004+00:00','https://www.youtube.com/watch?v=srzGKfbKqWA',251,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Rusty_Fingers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2611,'Welcome to Rainbow Resort','Kirby''s Adventure','2026-08-17T10:56:23.923891+00:00','https://www.youtube.com/watch?v=x0Ym2yWDUPs',442,'https://ocrmirror.org/files/music/remixes/Kirby''s_Adventure_Welcome_to_Rainbow_Resort_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2612,'Footloose Falls','Donkey Kong Country 3','2026-08-17T21:50:09.783737+00:00','https://www.youtube.com/watch?v=7hs_S3vF2e0',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Footloose_Falls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2613,'Derailed at Wily Temple','Mega Man 5','2026-08-17T14:53:28.737810+00:00','https://www.youtube.com/watch?v=eaoudvcGl9g',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_Derailed_at_Wily_Temple_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2614,'Light Your Way','Mega Man 2','2026-08-17T19:50:40.078371+00:00','https://www.youtube.com/watch?v=M1ZQZsVjT9M',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Light_Your_Way_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2615,'Unbreakable Heart','The Legend of Dragoon','2026-08-17T23:46:44.396231+00:00','https://www.youtube.com/watch?v=RX20iaMEFL4',715,'https://ocrmirror.org/files/music/remixes/Legend_of_Dragoon_Unbreakable_Heart_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2616,'spirit of law','Phoenix Wright: Ace Attorney','2026-08-18T05:54:37.878648+00:00','https://www.youtube.com/watch?v=dyuzSyLA8RI',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_spirit_of_law_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2617,'The Evolution of Flight','Pilotwings','2026-08-17T13:20:46.315657+00:00','https://www.youtube.com/watch?v=9kSRouiGWA0',570,'https://ocrmirror.org/files/music/remixes/Pilotwings_The_Evolution_of_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2618,'Liquid Metal','Mega Man 6','2026-08-17T22:50:07.605710+00:00','https://www.youtube.com/watch?v=nFoiTJru3zU',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Liquid_Metal_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2619,'Abstract Bond','Mega Man 9','2026-08-17T10:04:39.915766+00:00','https://www.youtube.com/watch?v=TO9anDa89P8',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Abstract_Bond_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2620,'The Orchestra Is a Lie','Portal 2','2026-08-17T14:01:12.365884+00:00','https://www.youtube.com/watch?v=c2T2knomWqQ',826,'https://ocrmirror.org/files/music/remixes/Portal_2_The_Orchestra_Is_a_Lie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2621,'Don''t Hold My Breath','Kirby Super Star','2026-08-17T14:01:13.776590+00:00','https://www.youtube.com/watch?v=5Vu7QBgPDTs',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Don''t_Hold_My_Breath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2622,'Chef Kawasaki''s 16-bit Jazz Orchestra - Walkway of Stars','Kirby Super Star','2026-08-17T21:50:09.431536+00:00','https://www.youtube.com/watch?v=2pwndGd-ggk',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Chef_Kawasaki''s_16-bit_Jazz_Orchestra_Walkway_of_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2623,'Spelunking in Space','Kirby Super Star','2026-08-17T16:54:41.926457+00:00','https://www.youtube.com/watch?v=DHsV0R-1--M',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Spelunking_in_Space_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2624,'The Incredible Star Machine','Kirby Super Star','2026-08-17T19:50:40.436008+00:00','https://www.youtube.com/watch?v=6T0bkLDCdHI',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_The_Incredible_Star_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2625,'The Savior of Dream Land','Kirby Super Star','2026-08-17T19:50:40.794150+00:00','https://www.youtube.com/watch?v=Hloi-DCf3Sw',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_The_Savior_of_Dream_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2626,'Cruise Control','Mega Man','2026-08-17T15:49:37.173214+00:00','https://www.youtube.com/watch?v=AWCqOomAajY',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Cruise_Control_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2627,'Blanka in Brasil','Street Fighter II: The World Warrior','2026-08-17T13:20:47.748966+00:00','https://www.youtube.com/watch?v=ieGQWsTpQlA',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Blanka_in_Brasil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2628,'Kastle Rock','Solstice: The Quest for the Staff of Demnos','2026-08-17T11:50:10.881069+00:00','https://www.youtube.com/watch?v=zWUb3_OMoSw',452,'https://ocrmirror.org/files/music/remixes/Solstice_Kastle_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2629,'Mario Ascends to the Clouds','Super Mario Land','2026-08-17T22:50:07.246386+00:00','https://www.youtube.com/watch?v=KDrWSQ3-ghQ',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Mario_Ascends_to_the_Clouds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2630,'For Great Justice','Zero Wing','2026-08-18T09:57:26.179504+00:00','https://www.youtube.com/watch?v=imgx-Ke3lyk',803,'https://ocrmirror.org/files/music/remixes/Zero_Wing_For_Great_Justice_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2631,'Sonicquarium','Sonic the Hedgehog','2026-08-17T16:54:43.156319+00:00','https://www.youtube.com/watch?v=9c93ljrAZAw',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Sonicquarium_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2632,'The Freak Winged Boy','Ys III: Wanderers from Ys','2026-08-17T11:50:09.813525+00:00','https://www.youtube.com/watch?v=3S0lA2zmHco',802,'https://ocrmirror.org/files/music/remixes/Ys_3_The_Freak_Winged_Boy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2633,'Submerged in Ambiance','Donkey Kong Country','2026-08-18T03:22:14.074919+00:00','https://www.youtube.com/watch?v=62zyEEL0XfU',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Submerged_in_Ambiance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2634,'Heart Beats','Zombies Ate My Neighbors','2026-08-17T20:53:40.639144+00:00','https://www.youtube.com/watch?v=dk630X0gEV8',344,'https://ocrmirror.org/files/music/remixes/Zombies_Ate_My_Neighbors_Heart_Beats_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2636,'Whiterun','The Elder Scrolls V: Skyrim','2026-08-17T22:50:07.966077+00:00','https://www.youtube.com/watch?v=hHQBMBUdaM0',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Whiterun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2637,'Thrill of the Chase','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T17:55:40.411213+00:00','https://www.youtube.com/watch?v=m0yCbEIUi0E',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Thrill_of_the_Chase_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2638,'Foiling Dr. Wily','Mega Man 4','2026-08-17T16:54:41.569622+00:00','https://www.youtube.com/watch?v=DTW8HX04Ru8',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Foiling_Dr_Wily_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2639,'Cranky''s Mojo','Donkey Kong Country 3','2026-08-18T04:07:12.991090+00:00','https://www.youtube.com/watch?v=lnfVgH4N2qo',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Cranky''s_Mojo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2640,'Now You''re All Alone','Yume Nikki','2026-08-17T14:53:30.307150+00:00','https://www.youtube.com/watch?v=gxIBq8NIIag',816,'https://ocrmirror.org/files/music/remixes/Yume_Nikki_Now_You''re_All_Alone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2641,'Tomato Tomahtoh','Shenmue','2026-08-18T03:22:13.935163+00:00','https://www.youtube.com/watch?v=PeKBPSu-wuo',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Tomato_Tomahtoh_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2642,'Eternal Descent','Descent II','2026-08-18T01:57:02.412236+00:00','https://www.youtube.com/watch?v=H_iaODfhu5U',454,'https://ocrmirror.org/files/music/remixes/Descent_2_Eternal_Descent_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2643,'Blowing Bubbles in Space','Kirby Super Star','2026-08-17T15:49:37.349595+00:00','https://www.youtube.com/watch?v=xhSFjXxrlRo',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Blowing_Bubbles_in_Space_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2644,'Over and Out','Mega Man 3','2026-08-17T15:49:37.526153+00:00','https://www.youtube.com/watch?v=ByEGEWF4ItA',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Over_and_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2645,'Demake Some Money','Final Fantasy VI','2026-08-17T21:50:10.138591+00:00','https://www.youtube.com/watch?v=oMmSdu2AL_c',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Demake_Some_Money_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2646,'Wily''s Bubble Bath','Mega Man 2','2026-08-17T15:49:38.320630+00:00','https://www.youtube.com/watch?v=dRCjWmYvjck',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wily''s_Bubble_Bath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2648,'Mission Complete: Ending Suite','Metroid','2026-08-18T09:02:28.887251+00:00','https://www.youtube.com/watch?v=Nh3tO7bGJHY',73,'https://ocrmirror.org/files/music/remixes/Metroid_Mission_Complete_Ending_Suite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2649,'The Root of All Things','Mega Man 2','2026-08-17T19:06:58.856401+00:00','https://www.youtube.com/watch?v=wz5y0YxXqdk',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Root_of_All_Things_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2650,'The Search for Ambrosia','Deus Ex','2026-08-17T22:50:06.885210+00:00','https://www.youtube.com/watch?v=i9PmzyuZcMg',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_The_Search_for_Ambrosia_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2651,'Distortion HQ','Deus Ex','2026-08-17T15:49:36.815977+00:00','https://www.youtube.com/watch?v=RXiPcW8R8KE',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Distortion_HQ_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2652,'Tears in Rain','Deus Ex: Invisible War','2026-08-17T19:06:57.442760+00:00','https://www.youtube.com/watch?v=osoI4AnKYNc',844,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Invisible_War_Tears_in_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2653,'The God Machine','Deus Ex','2026-08-18T08:02:54.408884+00:00','https://www.youtube.com/watch?v=8fnvArZlHtQ',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_The_God_Machine_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2654,'Water Warped','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T17:55:40.771567+00:00','https://www.youtube.com/watch?v=NwnGZTpG3oA',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Water_Warped_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2655,'Bleets of Lightning','Mega Man 10','2026-08-17T23:46:44.042834+00:00','https://www.youtube.com/watch?v=vAGBUEvQkBg',757,'https://ocrmirror.org/files/music/remixes/Mega_Man_10_Bleets_of_Lightning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2656,'Human Soldier','Deus Ex','2026-08-17T16:54:42.978557+00:00','https://www.youtube.com/watch?v=YwB_vqhvy8o',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Human_Soldier_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2657,'Adapt Evolve Survive','Deus Ex: Human Revolution','2026-08-18T01:57:01.360408+00:00','https://www.youtube.com/watch?v=BPnam8cTcqA',845,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Human_Revolution_Adapt_Evolve_Survive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2658,'Ma Chérie Nicolette','Deus Ex','2026-08-18T05:54:37.353480+00:00','https://www.youtube.com/watch?v=szc7HiS5rqQ',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Ma_Cherie_Nicolette_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2659,'Forrest of Illusion','Super Mario World','2026-08-17T20:53:40.526648+00:00','https://www.youtube.com/watch?v=MNULqB23KsE',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Forrest_of_Illusion_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2660,'Permafrost','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-17T23:46:43.504718+00:00','https://www.youtube.com/watch?v=EiG9sb6t6nQ',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Permafrost_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2661,'Banananaz','Donkey Kong Land','2026-08-17T20:53:39.782990+00:00','https://www.youtube.com/watch?v=9rimFoUSJ7Y',487,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Land_Banananaz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2662,'Roaming... Please Wait','Final Fantasy','2026-08-17T22:50:07.425894+00:00','https://www.youtube.com/watch?v=7tl_vFIYgd4',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Roaming_Please_Wait_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2664,'Hope for the Future','Wild Arms','2026-08-17T19:06:57.973066+00:00','https://www.youtube.com/watch?v=OSyWKHkTJaI',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Hope_for_the_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2665,'Beneath the Blaze','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-17T15:49:36.996351+00:00','https://www.youtube.com/watch?v=Ov14TooTdD4',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_Beneath_the_Blaze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2666,'Acid Flashbacks','Mega Man 2','2026-08-18T05:01:48.070113+00:00','https://www.youtube.com/watch?v=LlzHIEVKTdQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Acid_Flashbacks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2667,'Renewal','Sonic 3D Blast','2026-08-17T19:06:57.260594+00:00','https://www.youtube.com/watch?v=NBU1yV7Vmx0',158,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Renewal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2669,'The Drum of Basswall','Final Fantasy XII','2026-08-17T21:50:08.716557+00:00','https://www.youtube.com/watch?v=2pCzY801ZHE',525,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_12_The_Drum_of_Basswall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2670,'I Do It for the Faeries','The Legend of Zelda','2026-08-17T21:50:09.253194+00:00','https://www.youtube.com/watch?v=2YlGYZhUPkE',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_I_Do_It_for_the_Faeries_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2671,'Depths of Maridia','Super Metroid','2026-08-18T09:02:28.739208+00:00','https://www.youtube.com/watch?v=hp9Q4dM3hfg',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Depths_of_Maridia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2672,'You Don''t Talk About Flight Club','Pilotwings','2026-08-17T17:55:40.594436+00:00','https://www.youtube.com/watch?v=rXdgmoWkhdI',570,'https://ocrmirror.org/files/music/remixes/Pilotwings_You_Don''t_Talk_About_Flight_Club_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2673,'A ''Kid-pella','Bastion','2026-08-18T10:55:15.799758+00:00','https://www.youtube.com/watch?v=PjU6ORg4wMU',837,'https://ocrmirror.org/files/music/remixes/Bastion_A_''Kid-pella_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2674,'Flugel Rock','Batman','2026-08-18T04:07:13.150011+00:00','https://www.youtube.com/watch?v=wqI9JrzH0gk',847,'https://ocrmirror.org/files/music/remixes/Batman_Flugel_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2675,'Free Fall','Perfection.','2026-08-17T19:50:39.721071+00:00','https://www.youtube.com/watch?v=GJ3EUWEO8yU',846,'https://ocrmirror.org/files/music/remixes/Perfection_Free_Fall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2676,'Never Stop','Mega Man Zero 2','2026-08-17T22:50:06.704490+00:00','https://www.youtube.com/watch?v=bSzXdP1JDvY',434,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_2_Never_Stop_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2678,'Thinking Cap','Sonic the Hedgehog 3','2026-08-18T03:22:13.790647+00:00','https://www.youtube.com/watch?v=ZCfR37BG9wM',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Thinking_Cap_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2679,'Arichnophobia','Donkey Kong Country 3','2026-08-17T19:06:57.797983+00:00','https://www.youtube.com/watch?v=yNGxJhWKI78',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Arichnophobia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2680,'A Decent Challenge','Final Fantasy XI Online','2026-08-17T19:06:58.680576+00:00','https://www.youtube.com/watch?v=wpb0351YtJQ',546,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_A_Decent_Challenge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2681,'Runaway Faith','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-17T19:50:39.179283+00:00','https://www.youtube.com/watch?v=wnGS6OGhV8w',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_Runaway_Faith_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2682,'Song of Ruin 2','Chrono Cross','2026-08-17T21:50:09.607912+00:00','https://www.youtube.com/watch?v=3CIBrj-KSDI',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Song_of_Ruin_2_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2683,'Halo of the Sun','Silent Hill 2: Restless Dreams','2026-08-17T20:53:39.896619+00:00','https://www.youtube.com/watch?v=OAYgC-cAhZk',39576,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_Halo_of_the_Sun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2684,'Weaving the Threads of Time','Chrono Trigger','2026-08-17T21:50:08.535469+00:00','https://www.youtube.com/watch?v=tCzIgkeA7-M',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Weaving_the_Threads_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2685,'Quick!!','Mega Man 2','2026-08-18T04:07:13.472457+00:00','https://www.youtube.com/watch?v=ctxrnARif_Y',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Quick_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2686,'Prologue','Final Fantasy VI','2026-08-18T09:02:28.455058+00:00','https://www.youtube.com/watch?v=PTvE4627c1w',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Prologue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2687,'A Fistful of Nickels','Final Fantasy VI','2026-08-18T15:56:52.030064+00:00','https://www.youtube.com/watch?v=3PbAebwc2zE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_A_Fistful_of_Nickels_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2688,'13th Floor Demonstration','Final Fantasy VI','2026-08-17T23:46:45.105568+00:00','https://www.youtube.com/watch?v=CZOnQ_vR3Yw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_13th_Floor_Demonstration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2689,'Smoke and Clouds','Final Fantasy VI','2026-08-18T08:02:54.587127+00:00','https://www.youtube.com/watch?v=5oih7D2yPAY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Smoke_and_Clouds_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2690,'Ascension of a Madman','Final Fantasy VI','2026-08-18T05:54:37.704651+00:00','https://www.youtube.com/watch?v=qOUmYK3BH4Q',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Ascension_of_a_Madman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2691,'Gobble, Snarf, Snap','Final Fantasy VI','2026-08-18T13:22:49.324454+00:00','https://www.youtube.com/watch?v=NL-Q0TLsu6k',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Gobble_Snarf_Snap_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2692,'A Simple Flip Can Change Fate','Final Fantasy VI','2026-08-18T01:57:02.587863+00:00','https://www.youtube.com/watch?v=FIzJVTb6-8k',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_A_Simple_Flip_Can_Change_Fate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2693,'Katabasis','Final Fantasy VI','2026-08-18T05:01:48.596729+00:00','https://www.youtube.com/watch?v=19dMLvYjSr0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Katabasis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2694,'Tastes Like Victory','Final Fantasy VI','2026-08-18T11:51:04.759804+00:00','https://www.youtube.com/watch?v=_p39iF_GS3A',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Tastes_Like_Victory_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2695,'Event Horizon','Final Fantasy VI','2026-08-18T01:57:02.062385+00:00','https://www.youtube.com/watch?v=gi6ECxVpb24',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Event_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2696,'Pure Essence','Final Fantasy VI','2026-08-17T20:53:39.669396+00:00','https://www.youtube.com/watch?v=d6WXJUpoRL0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Pure_Essence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2697,'There Will Be Blood','Final Fantasy VI','2026-08-18T09:57:25.665339+00:00','https://www.youtube.com/watch?v=IrZFkKcq_xM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_There_Will_Be_Blood_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2698,'Slam Davis','Final Fantasy VI','2026-08-17T23:46:43.689325+00:00','https://www.youtube.com/watch?v=nQyUBzlyM6k',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Slam_Davis_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2699,'The Impresario','Final Fantasy VI','2026-08-18T16:57:43.505733+00:00','https://www.youtube.com/watch?v=7xFhULStbkQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Impresario_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2700,'Terra''s Resolve','Final Fantasy VI','2026-08-18T07:19:03.675999+00:00','https://www.youtube.com/watch?v=puRsvgjqySU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra''s_Resolve_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2702,'Bowser Is a Champion','Super Mario World','2026-08-17T23:46:43.866007+00:00','https://www.youtube.com/watch?v=duc_KyTTBaA',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Bowser_Is_a_Champion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2703,'Fearful Minds','Half-Life 2','2026-08-17T22:50:06.518173+00:00','https://www.youtube.com/watch?v=qC6xw8Npo08',827,'https://ocrmirror.org/files/music/remixes/Half-Life_2_Fearful_Minds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2705,'Go into the Light','Sonic Colors','2026-08-18T07:19:04.245351+00:00','https://www.youtube.com/watch?v=LJbFdqaWcDg',834,'https://ocrmirror.org/files/music/remixes/Sonic_Colors_Go_into_the_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2706,'Dreams of Heroism','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-18T03:22:14.633636+00:00','https://www.youtube.com/watch?v=MwX1DbFQ0wA',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_Dreams_of_Heroism_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2707,'Can''t Boss Us Around (Robot Anarchists from Hell Mix)','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-18T10:55:15.092637+00:00','https://www.youtube.com/watch?v=TPOsS_0s4xo',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Can''t_Boss_Us_Around_(Robot_Anarchists_from_Hell_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2708,'Kraidzy Dance','Metroid','2026-08-17T21:50:09.960846+00:00','https://www.youtube.com/watch?v=x2GUEvvonmg',73,'https://ocrmirror.org/files/music/remixes/Metroid_Kraidzy_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2709,'Call of the Cut Man','Mega Man','2026-08-18T07:19:04.941719+00:00','https://www.youtube.com/watch?v=3JhJXHgpX50',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_Call_of_the_Cut_Man_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2710,'Shadow''s Lounge','Mega Man 3','2026-08-18T07:19:04.593334+00:00','https://www.youtube.com/watch?v=igGoEKBt4fo',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Shadow''s_Lounge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2711,'Totally Rad Winter','Mega Man 10','2026-08-18T07:19:04.065537+00:00','https://www.youtube.com/watch?v=uNQ5VWQhl10',757,'https://ocrmirror.org/files/music/remixes/Mega_Man_10_Totally_Rad_Winter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2712,'Shinesparks','Super Metroid','2026-08-18T10:55:15.975672+00:00','https://www.youtube.com/watch?v=YR_MThd5cqk',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Shinesparks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2713,'Dat Disjointed Chemical','Sonic the Hedgehog 2','2026-08-18T11:51:04.285466+00:00','https://www.youtube.com/watch?v=Rl-Gw6JHxm0',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Dat_Disjointed_Chemical_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2714,'Curious','Secret of Mana','2026-08-17T23:46:44.219085+00:00','https://www.youtube.com/watch?v=HPVhxZpqGiY',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Curious_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2715,'Pwntera','Ragnarök Online','2026-08-18T03:22:13.600017+00:00','https://www.youtube.com/watch?v=PHiOdRSK3j8',542,'https://ocrmirror.org/files/music/remixes/Ragnarok_Online_Pwntera_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2716,'Reverie of the Broken Phoenix','Final Fantasy VI','2026-08-18T03:22:14.494218+00:00','https://www.youtube.com/watch?v=yXTQpWTNrCE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Reverie_of_the_Broken_Phoenix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2717,'Trauermarsch','Final Fantasy VI','2026-08-18T05:01:47.894469+00:00','https://www.youtube.com/watch?v=AKzZofmHWO0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Trauermarsch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2718,'The 6th Kingdom','Final Fantasy VI','2026-08-17T23:46:44.928427+00:00','https://www.youtube.com/watch?v=EEhQBsULnxA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_6th_Kingdom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2719,'Following Forgotten','Final Fantasy VI','2026-08-17T22:50:08.145417+00:00','https://www.youtube.com/watch?v=HFoNuK1DfGo',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Following_Forgotten_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2720,'Fiddlesticks Rag','Final Fantasy VI','2026-08-18T09:02:28.317852+00:00','https://www.youtube.com/watch?v=9AvqNaN1d_Q',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Fiddlesticks_Rag_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2721,'The Endless Stair','Final Fantasy VI','2026-08-18T14:05:29.288568+00:00','https://www.youtube.com/watch?v=EB7yiP4XuHU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Endless_Stair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2722,'Blackjack''s Breakup Bossa','Final Fantasy VI','2026-08-18T08:02:54.231423+00:00','https://www.youtube.com/watch?v=3x5r2Uy5-P0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Blackjack''s_Breakup_Bossa_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2723,'Dark Blue Substance','Final Fantasy VI','2026-08-17T20:53:40.773488+00:00','https://www.youtube.com/watch?v=0CsC0H8BSiM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dark_Blue_Substance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2724,'The Megiddo Brigade','Final Fantasy VI','2026-08-18T09:02:28.180585+00:00','https://www.youtube.com/watch?v=hF7UDZ3DfhQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Megiddo_Brigade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2725,'Till We Meet Again','Final Fantasy VI','2026-08-18T14:05:28.576344+00:00','https://www.youtube.com/watch?v=r11LiadLCRU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Till_We_Meet_Again_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2726,'Devotio Aeternus','Chrono Trigger','2026-08-18T15:56:51.033185+00:00','https://www.youtube.com/watch?v=wExtoUNFsx8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Devotio_Aeternus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2727,'Wet Dreams','Pokémon Blue Version','2026-08-18T09:02:28.592884+00:00','https://www.youtube.com/watch?v=uXcQLU-l3_A',676,'https://ocrmirror.org/files/music/remixes/Pokemon_Blue_Version_Wet_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2728,'Half Steps','Pokémon Gold Version','2026-08-18T09:57:25.436397+00:00','https://www.youtube.com/watch?v=SZp0vSMT52Q',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Half_Steps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2729,'Conundrum','Pokémon Blue Version','2026-08-17T22:50:07.066274+00:00','https://www.youtube.com/watch?v=ypliDFVNhF0',676,'https://ocrmirror.org/files/music/remixes/Pokemon_Blue_Version_Conundrum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2730,'WHAT TYPE ARE YOU','Pokémon X','2026-08-18T01:57:01.711803+00:00','https://www.youtube.com/watch?v=Kr0X8ltkU60',850,'https://ocrmirror.org/files/music/remixes/Pokemon_X_WHAT_TYPE_ARE_YOU_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2731,'Photosynthesis','Pokémon Diamond Version','2026-08-18T03:22:14.354914+00:00','https://www.youtube.com/watch?v=ToBX6tWNx9k',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Photosynthesis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2732,'stands like a statue, becomes part of the machine','Kid Chameleon','2026-08-18T15:01:10.470315+00:00','https://www.youtube.com/watch?v=ejDP2cFNawg',853,'https://ocrmirror.org/files/music/remixes/Kid_Chameleon_stands_like_a_statue_becomes_part_of_the_machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2733,'Wisdom Courage Power','The Legend of Zelda: Ocarina of Time','2026-08-18T10:55:15.269795+00:00','https://www.youtube.com/watch?v=kGFJXaxlDMQ',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Wisdom_Courage_Power_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2734,'Cloud Garden','Pac-Man','2026-08-18T11:51:03.932441+00:00','https://www.youtube.com/watch?v=LN1tb2qPkF4',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_Cloud_Garden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2735,'Sweet Wet Nectar','Mega Man 9','2026-08-18T13:22:49.465898+00:00','https://www.youtube.com/watch?v=epaoE59TLiw',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Sweet_Wet_Nectar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2736,'Percussion Hijinx','Donkey Kong Country','2026-08-18T05:54:37.528378+00:00','https://www.youtube.com/watch?v=CiPVS8CRyRg',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Percussion_Hijinx_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2737,'The Dreamer Departs','Final Fantasy X','2026-08-18T04:07:12.668315+00:00','https://www.youtube.com/watch?v=DTOZUHtdvJY',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_The_Dreamer_Departs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2738,'Lightning Chaser','Gunstar Heroes','2026-08-18T05:01:47.345073+00:00','https://www.youtube.com/watch?v=rq88XvaDHt8',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Lightning_Chaser_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2739,'Pursued by the Subordinate of Ignorant Sin','Gunstar Heroes','2026-08-18T04:07:12.829246+00:00','https://www.youtube.com/watch?v=Oc60yWQttog',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Pursued_by_the_Subordinate_of_Ignorant_Sin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2740,'Rolling Gun Changer','Gunstar Heroes','2026-08-18T09:02:27.902440+00:00','https://www.youtube.com/watch?v=xpY3Zu5ntuQ',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Rolling_Gun_Changer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2741,'Be Aggressive!','Gunstar Heroes','2026-08-18T04:07:12.344965+00:00','https://www.youtube.com/watch?v=2qamhfouSa4',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Be_Aggressive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2742,'No Time to Rest','Gunstar Heroes','2026-08-18T03:22:14.773288+00:00','https://www.youtube.com/watch?v=USBv9mMSOUc',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_No_Time_to_Rest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2743,'''Round the Bonfire','Dark Cloud','2026-08-18T10:55:14.555979+00:00','https://www.youtube.com/watch?v=OsYDAE5757A',320,'https://ocrmirror.org/files/music/remixes/Dark_Cloud_''Round_the_Bonfire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2744,'Everything''s Alright (Short Steps Mix)','To the Moon','2026-08-18T09:02:29.194595+00:00','https://www.youtube.com/watch?v=lxRcOuQB-Bo',864,'https://ocrmirror.org/files/music/remixes/To_the_Moon_Everything''s_Alright_(Short_Steps_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2745,'Mountain Prayer','Final Fantasy X','2026-08-18T07:19:05.289664+00:00','https://www.youtube.com/watch?v=fcjfULJQyDs',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Mountain_Prayer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2746,'Mythic Mist','Sonic the Hedgehog 2','2026-08-18T11:51:04.404322+00:00','https://www.youtube.com/watch?v=8mIkYiHx_d0',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Mythic_Mist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2747,'Time Traveller''s Delight','Sonic CD','2026-08-18T21:47:54.315790+00:00','https://www.youtube.com/watch?v=_mrfGB8j4ng',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Time_Traveller''s_Delight_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2749,'Bowzilla','Super Mario World 2: Yoshi''s Island','2026-08-18T14:05:29.466249+00:00','https://www.youtube.com/watch?v=z6PGUE_-PVI',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Bowzilla_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2750,'Tough It Out!','Kirby 64: The Crystal Shards','2026-08-18T09:57:26.446546+00:00','https://www.youtube.com/watch?v=eSkrKgqCi1c',577,'https://ocrmirror.org/files/music/remixes/Kirby_64_Tough_It_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2751,'Hunger','Splatterhouse 3','2026-08-18T04:07:12.016946+00:00','https://www.youtube.com/watch?v=ow3URYpOINE',554,'https://ocrmirror.org/files/music/remixes/Splatterhouse_3_Hunger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2753,'Double Rainbow','Kirby''s Adventure','2026-08-18T14:05:28.757879+00:00','https://www.youtube.com/watch?v=Oz9UWKGtjNg',442,'https://ocrmirror.org/files/music/remixes/Kirby''s_Adventure_Double_Rainbow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2754,'I Am the One Who Designed and Built Mega Man X','Mega Man X4','2026-08-18T15:01:10.187609+00:00','https://www.youtube.com/watch?v=Q9vILEwGUUw',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_I_Am_the_One_Who_Designed_and_Built_Mega_Man_X_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2755,'Femmes Fatales','Street Fighter II: The World Warrior','2026-08-18T07:19:04.419410+00:00','https://www.youtube.com/watch?v=usWuKCyA-gw',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Femmes_Fatales_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2756,'The Fog of War','Lemmings 3D','2026-08-18T01:57:01.005205+00:00','https://www.youtube.com/watch?v=0id2vRRceqw',639,'https://ocrmirror.org/files/music/remixes/Lemmings_3D_The_Fog_of_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2757,'Bad Octopus','Final Fantasy VI','2026-08-18T19:06:30.324462+00:00','https://www.youtube.com/watch?v=AfYQnsK71gA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Bad_Octopus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2758,'Hero of the Heartlands','Baldur''s Gate','2026-08-18T05:01:48.773254+00:00','https://www.youtube.com/watch?v=crmCWHbOE0s',463,'https://ocrmirror.org/files/music/remixes/Baldur''s_Gate_Hero_of_the_Heartlands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2759,'Take My Hand','Ico','2026-08-18T05:01:47.706383+00:00','https://www.youtube.com/watch?v=izJHIZZgEH8',372,'https://ocrmirror.org/files/music/remixes/Ico_Take_My_Hand_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2761,'Punched by a Rose','Street Fighter II: The World Warrior','2026-08-18T11:51:04.166612+00:00','https://www.youtube.com/watch?v=m8RWnfeCPyA',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Punched_by_a_Rose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2762,'Rearming Commandus','Bionic Commando','2026-08-18T05:01:48.421008+00:00','https://www.youtube.com/watch?v=v8sOsWSfwNc',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Rearming_Commandus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2764,'Hold Your Weapon','Bionic Commando','2026-08-18T05:01:48.951141+00:00','https://www.youtube.com/watch?v=yBbBOUgnWc0',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Hold_Your_Weapon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2765,'Proceed Without Caution','Bionic Commando','2026-08-18T03:22:13.406613+00:00','https://www.youtube.com/watch?v=i_p5hQSP_kM',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Proceed_Without_Caution_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2766,'Ghetto Palm','Final Fantasy VI','2026-08-18T14:05:29.820440+00:00','https://www.youtube.com/watch?v=KjXP8pVKxnw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Ghetto_Palm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2767,'Electro Killer 6000','Castlevania','2026-08-18T08:02:54.941672+00:00','https://www.youtube.com/watch?v=NfZj9qETL8A',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Electro_Killer_6000_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2768,'Prussian Bones','Castlevania: Bloodlines','2026-08-18T04:07:13.309903+00:00','https://www.youtube.com/watch?v=qnfVEH35DqY',610,'https://ocrmirror.org/files/music/remixes/Castlevania_Bloodlines_Prussian_Bones_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2769,'I Am Dracula (Club Mix)','Castlevania','2026-08-18T07:19:04.767327+00:00','https://www.youtube.com/watch?v=xHkzENGzjN8',18,'https://ocrmirror.org/files/music/remixes/Castlevania_I_Am_Dracula_(Club_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2770,'Tears of Blood','Castlevania II: Simon''s Quest','2026-08-18T15:01:09.982621+00:00','https://www.youtube.com/watch?v=NDhK8zwHs94',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Tears_of_Blood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2771,'The Wandering Hero','The Elder Scrolls IV: Oblivion','2026-08-18T09:57:25.904393+00:00','https://www.youtube.com/watch?v=l0gEGxx-1EM',553,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_4_Oblivion_The_Wandering_Hero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2772,'Bowser''s Castle','Super Mario World','2026-08-18T16:57:42.788265+00:00','https://www.youtube.com/watch?v=1xlmVHFlCz4',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Bowser''s_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2773,'Challenge Accepted!','Gunstar Heroes','2026-08-18T15:56:52.164718+00:00','https://www.youtube.com/watch?v=2EIlMm9EnM8',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Challenge_Accepted_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2774,'There in My Dreams','Wild Arms','2026-08-18T15:01:10.613658+00:00','https://www.youtube.com/watch?v=DZ0onmg56lg',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_There_in_My_Dreams_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2775,'Pyroclastic Tides','Sonic CD','2026-08-18T19:48:44.081255+00:00','https://www.youtube.com/watch?v=YZeRnPhwGLE',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Pyroclastic_Tides_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2777,'Sunrise','Chrono Trigger','2026-08-18T04:07:12.506903+00:00','https://www.youtube.com/watch?v=vzsPFB1QsPg',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Sunrise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2778,'Top This','Mega Man 3','2026-08-18T10:55:15.622838+00:00','https://www.youtube.com/watch?v=JfTstoiiVOE',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Top_This_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2779,'Secretive Terrors','Pokémon Crystal Version','2026-08-18T09:57:25.028422+00:00','https://www.youtube.com/watch?v=EkrNw3jgk4Q',573,'https://ocrmirror.org/files/music/remixes/Pokemon_Crystal_Version_Secretive_Terrors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2780,'Raging Ranman','Street Fighter III: 3rd Strike: Fight for the Future','2026-08-18T14:05:29.111971+00:00','https://www.youtube.com/watch?v=WR9pYQbOUAs',238,'https://ocrmirror.org/files/music/remixes/Street_Fighter_3_3rd_Strike_Raging_Ranman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2781,'The Boom (Undeleted)','Sonic CD','2026-08-18T15:56:51.763117+00:00','https://www.youtube.com/watch?v=faZMVOcVugw',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_The_Boom_(Undeleted)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2782,'Forever in Your Mind','Sonic CD','2026-08-18T13:22:49.606209+00:00','https://www.youtube.com/watch?v=WiuFZIFJx1Y',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Forever_in_Your_Mind_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2783,'Undertow to Leatow','Sonic CD','2026-08-18T05:54:38.402730+00:00','https://www.youtube.com/watch?v=qwbeY3i9SBg',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Undertow_to_Leatow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2784,'Yours Truly, Satan','Sonic CD','2026-08-18T07:19:03.862197+00:00','https://www.youtube.com/watch?v=cufAKKgCcgE',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Yours_Truly_Satan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2785,'Paradise Paradox','Sonic CD','2026-08-18T04:07:12.184157+00:00','https://www.youtube.com/watch?v=Af3tDoxXSlI',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Paradise_Paradox_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2786,'WhACKASS WORKShIFTS','Sonic CD','2026-08-18T19:48:43.905421+00:00','https://www.youtube.com/watch?v=H93Brxt3zzs',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_WhACKASS_WORKShIFTS_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2787,'Future Crystalline Luminosity','Sonic CD','2026-08-19T02:00:25.473885+00:00','https://www.youtube.com/watch?v=eLSLMQZ1Uww',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Future_Crystalline_Luminosity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2788,'Two Futures','Sonic CD','2026-08-18T05:54:37.178652+00:00','https://www.youtube.com/watch?v=8R7upeqQBvM',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Two_Futures_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2789,'Schizophrenic','Sonic CD','2026-08-18T10:55:14.916589+00:00','https://www.youtube.com/watch?v=9aTjtdflpBY',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Schizophrenic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2790,'Running to the Beat','Sonic CD','2026-08-18T11:51:04.876139+00:00','https://www.youtube.com/watch?v=UYAP906k0F0',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Running_to_the_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2791,'Harushiden','Okami','2026-08-18T20:49:43.729199+00:00','https://www.youtube.com/watch?v=D-oDP2lyvSE',537,'https://ocrmirror.org/files/music/remixes/Okami_Harushiden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2793,'Royal Blood, Fraternal Love','Final Fantasy VI','2026-08-18T08:02:53.342355+00:00','https://www.youtube.com/watch?v=VwOqJnvk2sc',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Royal_Blood_Fraternal_Love_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2794,'Diddy Kong Luau Party','Diddy Kong Racing','2026-08-18T05:54:38.228187+00:00','https://www.youtube.com/watch?v=Z-V5T_JAw_A',620,'https://ocrmirror.org/files/music/remixes/Diddy_Kong_Racing_Diddy_Kong_Luau_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2795,'Ethereal Skies','Sonic the Hedgehog 2','2026-08-18T20:49:43.907696+00:00','https://www.youtube.com/watch?v=_Ps11WNr9ww',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Ethereal_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2796,'Black Genesis','Final Fantasy VI','2026-08-18T16:57:43.142852+00:00','https://www.youtube.com/watch?v=fP0RBIE4muw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Black_Genesis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2797,'Fight for the Broken Spirit','Street Fighter II: The World Warrior','2026-08-18T05:54:37.001790+00:00','https://www.youtube.com/watch?v=z5wfz-KKQBU',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Fight_for_the_Broken_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2798,'Radiance','Mario Kart 64','2026-08-18T22:50:57.287613+00:00','https://www.youtube.com/watch?v=HftNT3UDaEg',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Radiance_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2799,'Forest of Purple Mist','The Legend of Zelda: Twilight Princess','2026-08-18T15:56:51.629726+00:00','https://www.youtube.com/watch?v=G66sQgotBSQ',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Forest_of_Purple_Mist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2800,'Broken Wings','StarCraft II: Wings of Liberty','2026-08-18T19:48:43.030099+00:00','https://www.youtube.com/watch?v=XComSohkUVs',862,'https://ocrmirror.org/files/music/remixes/StarCraft_2_Broken_Wings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2801,'Snowflakes in Her Hair','Pokémon Diamond Version','2026-08-18T14:05:29.643167+00:00','https://www.youtube.com/watch?v=TzF3enT-fbY',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Snowflakes_in_Her_Hair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2802,'Square Zero','Gunstar Heroes','2026-08-18T11:51:04.642886+00:00','https://www.youtube.com/watch?v=A-A4hSe81Mo',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Square_Zero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2803,'Oh, Traveller from an Arcane Land','Chrono Trigger','2026-08-18T09:57:26.043548+00:00','https://www.youtube.com/watch?v=mSJBG_m6mcM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Oh_Traveller_from_an_Arcane_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2804,'Focus','Donkey Kong Country','2026-08-18T15:01:10.975875+00:00','https://www.youtube.com/watch?v=0x6WAeAeCWI',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Focus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2805,'Sinfonía del Sabio','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-18T09:02:29.056689+00:00','https://www.youtube.com/watch?v=cEKgEmxSgYQ',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Sinfonia_del_Sabio_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2807,'Stepping Out','Super Street Fighter II: The New Challengers','2026-08-18T11:51:04.049132+00:00','https://www.youtube.com/watch?v=ALdP_KiDiss',575,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Stepping_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2808,'Rainfall','SmartBall','2026-08-18T13:22:48.613537+00:00','https://www.youtube.com/watch?v=wOiBHfUNCqI',860,'https://ocrmirror.org/files/music/remixes/SmartBall_Rainfall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2809,'Heavenly Horrors','Corpse Party','2026-08-18T07:19:05.115895+00:00','https://www.youtube.com/watch?v=n_zbWsJq-fk',840,'https://ocrmirror.org/files/music/remixes/Corpse_Party_Heavenly_Horrors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2810,'Full Paragon','Mass Effect','2026-08-18T08:02:53.524506+00:00','https://www.youtube.com/watch?v=QNCoruzNgvs',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_Full_Paragon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2811,'Dolphin with a Shotgun','Plok','2026-08-18T09:02:28.043012+00:00','https://www.youtube.com/watch?v=x3gRZAv1k5A',298,'https://ocrmirror.org/files/music/remixes/Plok_Dolphin_with_a_Shotgun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2812,'Clockwork Groove','Castlevania','2026-08-18T13:22:49.886603+00:00','https://www.youtube.com/watch?v=WcyfE58tAdI',104,'https://ocrmirror.org/files/music/remixes/Castlevania_Clockwork_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2813,'What We Left Behind','Sonic the Hedgehog 3','2026-08-18T17:53:54.129849+00:00','https://www.youtube.com/watch?v=rxNQpzhZ1Fc',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_What_We_Left_Behind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2814,'Itsutsu no Chikara','Choujin Sentai Jetman','2026-08-18T08:02:53.877432+00:00','https://www.youtube.com/watch?v=nmyWacOhuSc',859,'https://ocrmirror.org/files/music/remixes/Choujin_Sentai_Jetman_Itsutsu_no_Chikara_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2815,'Quest in Peace','Breath of Death VII: The Beginning','2026-08-18T20:49:43.015078+00:00','https://www.youtube.com/watch?v=_L22AOIHTks',838,'https://ocrmirror.org/files/music/remixes/Breath_of_Death_7_Quest_in_Peace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2816,'Fishing Spirit','Dark Cloud 2','2026-08-18T13:22:49.041898+00:00','https://www.youtube.com/watch?v=X8YDWYmYhxY',602,'https://ocrmirror.org/files/music/remixes/Dark_Cloud_2_Fishing_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2817,'Sting Chameleon Uses Bubble Crab''s Very Essence As a Cheap Bathroom Product','Mega Man X2','2026-08-18T22:50:57.107293+00:00','https://www.youtube.com/watch?v=wNWDeQeZjzc',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Sting_Chameleon_Uses_Bubble_Crab''s_Very_Essence_As_a_Cheap_Bathroom_Product_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2818,'Super Hipster Land','Super Mario Land','2026-08-18T09:57:25.301465+00:00','https://www.youtube.com/watch?v=andsI1eVRuo',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Super_Hipster_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2819,'Mystical Groove','Sonic the Hedgehog 3','2026-08-18T16:57:42.609513+00:00','https://www.youtube.com/watch?v=kp0PwAK592I',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Mystical_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2820,'Tengen Toppa Dairantou: Part 1 - Game Set','Super Smash Bros. Melee','2026-08-18T20:49:44.262675+00:00','https://www.youtube.com/watch?v=rIPEZ8L-Yds',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Tengen_Toppa_Dairantou_Part_1_Game_Set_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2821,'Tengen Toppa Dairantou: Part 2 - Sudden Death','Super Smash Bros. Brawl','2026-08-18T21:47:54.487187+00:00','https://www.youtube.com/watch?v=bjFMHziP0U0',879,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Brawl_Tengen_Toppa_Dairantou_Part_2_Sudden_Death_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2822,'Tengen Toppa Dairantou: Part 3 - All-Stars','Super Smash Bros. Melee','2026-08-18T23:46:53.919812+00:00','https://www.youtube.com/watch?v=u3FGvKj6BhE',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Tengen_Toppa_Dairantou_Part_3_All-Stars_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2823,'Get Ready for the Next Battle!','Tekken Tag Tournament 2','2026-08-18T21:47:54.143082+00:00','https://www.youtube.com/watch?v=g4UemULXbY8',880,'https://ocrmirror.org/files/music/remixes/Tekken_Tag_Tournament_2_Get_Ready_for_the_Next_Battle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2824,'Sonic Boom (American Mix)','Street Fighter II: The World Warrior','2026-08-18T16:57:42.429921+00:00','https://www.youtube.com/watch?v=UtLjjxCwPCg',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Sonic_Boom_(American_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2826,'Requiem for a Damaged Spirit','The Legend of Zelda: Ocarina of Time','2026-08-18T16:57:42.965392+00:00','https://www.youtube.com/watch?v=p5MFd_ojq_c',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Requiem_for_a_Damaged_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2827,'Standing on Top','Mega Man 4','2026-08-18T19:06:30.146886+00:00','https://www.youtube.com/watch?v=Nzy5TQjqiLo',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Standing_on_Top_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2828,'Bogged Down','Metroid Prime 2: Echoes','2026-08-19T03:24:23.332873+00:00','https://www.youtube.com/watch?v=uG7Sdzbkfhk',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Bogged_Down_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2829,'Mega Blocked','Mega Man 9','2026-08-18T13:22:48.898645+00:00','https://www.youtube.com/watch?v=sDYDPP0ziMc',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Mega_Blocked_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2830,'Street Fighter or Streetest Fighter?','Street Fighter Alpha: Warriors'' Dreams','2026-08-18T17:53:54.807099+00:00','https://www.youtube.com/watch?v=9RtJfK88-Ik',875,'https://ocrmirror.org/files/music/remixes/Street_Fighter_Alpha_Street_Fighter_or_Streetest_Fighter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2831,'The Friendly Shadows','Tom Clancy''s Splinter Cell: Chaos Theory','2026-08-18T10:55:15.445348+00:00','https://www.youtube.com/watch?v=VN8mgXKDAoY',856,'https://ocrmirror.org/files/music/remixes/Splinter_Cell_Chaos_Theory_The_Friendly_Shadows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2832,'Trico Flies','Shadow of the Colossus','2026-08-18T15:01:09.472177+00:00','https://www.youtube.com/watch?v=51GfOyvXduE',502,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Colossus_Trico_Flies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2833,'Network Is Searching','Mega Man Battle Network 3: Blue Version','2026-08-18T17:53:55.314178+00:00','https://www.youtube.com/watch?v=kVy0OkvYeXM',883,'https://ocrmirror.org/files/music/remixes/Mega_Man_Battle_Network_3_Blue_Version_Network_Is_Searching_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2834,'Cluck, Old Cucco!','The Legend of Zelda: A Link to the Past','2026-08-19T02:00:24.765780+00:00','https://www.youtube.com/watch?v=47BHhv-BUlY',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Cluck_Old_Cucco_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2835,'Echoes of the Forest','Chrono Trigger','2026-08-18T19:48:43.729414+00:00','https://www.youtube.com/watch?v=boe93mlbdT0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Echoes_of_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2836,'Experiments of a Fiend','Final Fantasy VI','2026-08-18T19:48:42.848960+00:00','https://www.youtube.com/watch?v=eEMNGAKBt9Y',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Experiments_of_a_Fiend_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2837,'Al Bhed Ec Faent','Final Fantasy X','2026-08-18T13:22:48.756352+00:00','https://www.youtube.com/watch?v=mjuMWrMWNnY',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Al_Bhed_Ec_Faent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2838,'Gods and Crystals','Final Fantasy Type-0','2026-08-18T11:51:04.523827+00:00','https://www.youtube.com/watch?v=EwJZE5ip2qA',884,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Type-0_Gods_and_Crystals_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2839,'Paralyzed','Donkey Kong Country','2026-08-18T11:51:03.813760+00:00','https://www.youtube.com/watch?v=FaIn7PyjHy0',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Paralyzed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2840,'Enemy Underworld','Bionic Commando','2026-08-18T19:06:29.969267+00:00','https://www.youtube.com/watch?v=PtlniNNSybc',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Enemy_Underworld_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2842,'Bibamus, Moriendum Est','Mega Man X3','2026-08-18T22:50:57.468605+00:00','https://www.youtube.com/watch?v=dqAQpeJKIEY',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Bibamus_Moriendum_Est_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2843,'Black Onslaught','Paper Mario: The Thousand-Year Door','2026-08-18T20:49:43.375494+00:00','https://www.youtube.com/watch?v=WERqZUC1Iug',804,'https://ocrmirror.org/files/music/remixes/Paper_Mario_The_Thousand-Year_Door_Black_Onslaught_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2844,'Bulls ''N Beers','Conker''s Bad Fur Day','2026-08-18T13:22:49.183408+00:00','https://www.youtube.com/watch?v=jxJ7prv2vMg',526,'https://ocrmirror.org/files/music/remixes/Conker''s_Bad_Fur_Day_Bulls_''N_Beers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2845,'Warrior of the Galaxy','Kirby Super Star Ultra','2026-08-18T10:55:14.736625+00:00','https://www.youtube.com/watch?v=bEqsArxZNjs',861,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Ultra_Warrior_of_the_Galaxy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2846,'Aquatic Transformations','Donkey Kong Country 3','2026-08-18T23:46:54.096642+00:00','https://www.youtube.com/watch?v=4YVnkipJDsI',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Aquatic_Transformations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2847,'Quirón''s Mallets','Mega Man 6','2026-08-18T15:01:10.331610+00:00','https://www.youtube.com/watch?v=2h2zHV8WSGg',321,'https://ocrmirror.org/files/music/remixes/Mega_Man_6_Quiron''s_Mallets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2848,'Optimist Prime','Wild Arms','2026-08-18T15:56:52.297897+00:00','https://www.youtube.com/watch?v=PRGrMAZsLv4',230,'https://ocrmirror.org/files/music/remixes/Wild_Arms_Optimist_Prime_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2849,'Dream Land Dance Party','Kirby''s Dream Land','2026-08-18T17:53:53.957969+00:00','https://www.youtube.com/watch?v=vAah2rK7_kU',234,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_Dream_Land_Dance_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2850,'Boss Key','Final Fantasy V','2026-08-18T21:47:53.449119+00:00','https://www.youtube.com/watch?v=rzMLODlYQNQ',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Boss_Key_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2852,'Bubble Dragon','Bubble Bobble','2026-08-19T05:01:53.727841+00:00','https://www.youtube.com/watch?v=8LYi9tcE0y0',661,'https://ocrmirror.org/files/music/remixes/Bubble_Bobble_Bubble_Dragon_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2853,'Wang. You Want?','Shadow Warrior','2026-08-18T13:22:49.746981+00:00','https://www.youtube.com/watch?v=bzi_RA1TziM',855,'https://ocrmirror.org/files/music/remixes/Shadow_Warrior_Wang_You_Want_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2854,'La Montaña de los Caballos Jóvenes','Final Fantasy VI','2026-08-19T04:07:07.736832+00:00','https://www.youtube.com/watch?v=TRkxNbWvQdg',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_La_Montana_de_los_Caballos_Jovenes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2855,'Stealth Chameleon','Mega Man X6','2026-08-18T19:06:29.433090+00:00','https://www.youtube.com/watch?v=TAb6raarwl0',685,'https://ocrmirror.org/files/music/remixes/Mega_Man_X6_Stealth_Chameleon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2856,'Velocity Shift','Top Gear 2','2026-08-18T16:57:43.320564+00:00','https://www.youtube.com/watch?v=Q03xwERndzo',513,'https://ocrmirror.org/files/music/remixes/Top_Gear_2_Velocity_Shift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2857,'Electro Termites','Army Men: Air Attack','2026-08-18T14:05:28.934453+00:00','https://www.youtube.com/watch?v=3fApowXqxp0',858,'https://ocrmirror.org/files/music/remixes/Army_Men_Air_Attack_Electro_Termites_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2858,'Copacabana Beach','Super Spike V''Ball','2026-08-18T15:56:51.325931+00:00','https://www.youtube.com/watch?v=vVCUKnml-y4',886,'https://ocrmirror.org/files/music/remixes/Super_Spike_V''Ball_Copacabana_Beach_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2859,'Cloudhopping','Yoshi Touch & Go','2026-08-18T23:46:53.388612+00:00','https://www.youtube.com/watch?v=Il8dXWtB5MA',887,'https://ocrmirror.org/files/music/remixes/Yoshi_Touch_&_Go_Cloudhopping_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2860,'Crow Note Rigger','Chrono Trigger','2026-08-18T20:49:43.195118+00:00','https://www.youtube.com/watch?v=a9LGX9gnKnk',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Crow_Note_Rigger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2861,'Generations','The Legend of Zelda: Ocarina of Time','2026-08-19T08:02:47.037202+00:00','https://www.youtube.com/watch?v=p4vPW9HDhd0',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Generations_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2862,'Kirby''s Cabbage Salad','Kirby''s Dream Land','2026-08-18T16:57:43.858425+00:00','https://www.youtube.com/watch?v=i_GP1tt6_Fk',234,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_Kirby''s_Cabbage_Salad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2863,'Rock the Plank','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-18T23:46:53.032733+00:00','https://www.youtube.com/watch?v=crmD4iGVXLM',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Rock_the_Plank_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2864,'Turtle in the Shredder''s Shadow','Teenage Mutant Ninja Turtles: The Hyperstone Heist','2026-08-18T19:06:30.502976+00:00','https://www.youtube.com/watch?v=CrOhHnJkRqo',801,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_The_Hyperstone_Heist_Turtle_in_the_Shredder''s_Shadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2865,'Casiopizza vs. TMNT-Square','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-19T05:01:53.374393+00:00','https://www.youtube.com/watch?v=3AMDaMGtJWY',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Casiopizza_vs_TMNT-Square_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2866,'Trail Dust and Turtle Wax','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-19T02:00:25.298032+00:00','https://www.youtube.com/watch?v=u1hW8CUD0os',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Trail_Dust_and_Turtle_Wax_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2867,'Cowabunga!','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-19T07:20:08.264582+00:00','https://www.youtube.com/watch?v=9-1D2vu76_A',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Cowabunga_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2868,'Star Turtles II: The Wrath of Mann','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-18T20:49:43.552768+00:00','https://www.youtube.com/watch?v=D8LODNSRR-g',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Star_Turtles_II_The_Wrath_of_Mann_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2869,'Hot for April!','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-18T19:06:30.862007+00:00','https://www.youtube.com/watch?v=PpJvX64PFTs',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Hot_for_April_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2870,'Dead Raggening','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-18T17:53:54.639263+00:00','https://www.youtube.com/watch?v=ZLIkGY-eRGs',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Dead_Raggening_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2872,'Ganonize','The Legend of Zelda: Ocarina of Time','2026-08-19T04:07:07.914492+00:00','https://www.youtube.com/watch?v=ovi1_HMNvo4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Ganonize_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2873,'A Link to Zelda','The Legend of Zelda: A Link to the Past','2026-08-18T15:56:51.171792+00:00','https://www.youtube.com/watch?v=NU4EYnJ06Ng',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_A_Link_to_Zelda_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2874,'Road Trip','Sonic CD','2026-08-19T02:00:25.651073+00:00','https://www.youtube.com/watch?v=XbOAECyM27o',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Road_Trip_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2875,'Transistor','Command & Conquer: Red Alert','2026-08-19T07:20:08.979670+00:00','https://www.youtube.com/watch?v=TxySe8Snh80',75,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Red_Alert_Transistor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2876,'Welcome to My Kastle','Super Mario 64','2026-08-19T04:07:07.201575+00:00','https://www.youtube.com/watch?v=lBCdJ5VqOuc',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Welcome_to_My_Kastle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2877,'Sonicstep','Sonic the Hedgehog','2026-08-19T09:03:59.085526+00:00','https://www.youtube.com/watch?v=CIdlrhZ4fus',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Sonicstep_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2878,'Childhood (Act 2)','Sonic the Hedgehog','2026-08-18T17:53:54.298021+00:00','https://www.youtube.com/watch?v=wimTNLoT1L4',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Childhood_(Act_2)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2879,'This Ain''t No Shower (It''s a Downpour)','OutRun','2026-08-18T20:49:44.085389+00:00','https://www.youtube.com/watch?v=OpaYdZsDLFo',139,'https://ocrmirror.org/files/music/remixes/OutRun_This_Ain''t_No_Shower_(It''s_a_Downpour)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2880,'Reflection','Pokémon Diamond Version','2026-08-18T14:05:30.176593+00:00','https://www.youtube.com/watch?v=iaK2zTOBpHA',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Reflection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2882,'Power Glove (It''s So Bad)','MiG-29: Soviet Fighter','2026-08-18T15:01:09.820006+00:00','https://www.youtube.com/watch?v=sh263Hcp-gE',852,'https://ocrmirror.org/files/music/remixes/MiG-29_Power_Glove_(It''s_So_Bad)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2883,'Just This Once','Final Fantasy X','2026-08-19T07:20:09.157266+00:00','https://www.youtube.com/watch?v=z_mrkrU8uzk',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Just_This_Once_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2884,'Torvus Chips','Metroid Prime 2: Echoes','2026-08-18T19:48:43.554673+00:00','https://www.youtube.com/watch?v=6kAKSCNV6Rk',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Torvus_Chips_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2885,'Go-Go Gadget Gonkulator','Final Fantasy VI','2026-08-18T21:47:53.796902+00:00','https://www.youtube.com/watch?v=G-YTF4Nfp9E',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Go-Go_Gadget_Gonkulator_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2886,'The Strongest!','Street Fighter Alpha 2','2026-08-18T19:06:29.251864+00:00','https://www.youtube.com/watch?v=KffD0W1k9eA',576,'https://ocrmirror.org/files/music/remixes/Street_Fighter_Alpha_2_The_Strongest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2887,'A Journey in Solitude','SaGa Frontier','2026-08-18T16:57:43.681963+00:00','https://www.youtube.com/watch?v=lwfICqwtC2w',331,'https://ocrmirror.org/files/music/remixes/SaGa_Frontier_A_Journey_in_Solitude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2888,'TornadosaurusRex','Mega Man 9','2026-08-19T02:00:24.944320+00:00','https://www.youtube.com/watch?v=XrUQw9JHiNk',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_TornadosaurusRex_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2889,'The Metal Side of Lance','Pokémon Gold Version','2026-08-18T19:48:44.257297+00:00','https://www.youtube.com/watch?v=VYHycq6VZU0',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_The_Metal_Side_of_Lance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2890,'Race the Phoenix','Mega Man X4','2026-08-18T19:06:29.792290+00:00','https://www.youtube.com/watch?v=V9ugSv40dZ0',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Race_the_Phoenix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2891,'Nice Legs','Gunstar Heroes','2026-08-18T23:46:53.742292+00:00','https://www.youtube.com/watch?v=Omsw1zbvG5c',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Nice_Legs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2892,'The Unnamed Frontier','Metroid II: Return of Samus','2026-08-19T03:24:24.219466+00:00','https://www.youtube.com/watch?v=1M3CllXIFVA',202,'https://ocrmirror.org/files/music/remixes/Metroid_2_The_Unnamed_Frontier_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2893,'Cryomentus','The Legend of Zelda: Oracle of Seasons','2026-08-18T19:06:29.613587+00:00','https://www.youtube.com/watch?v=4SVprzcYYCM',726,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Seasons_Cryomentus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2895,'Captain of the Skies','Final Fantasy VII','2026-08-18T23:46:54.273645+00:00','https://www.youtube.com/watch?v=ik8I-SZxWEY',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Captain_of_the_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2896,'Rebirth of Mars','Golden Sun: The Lost Age','2026-08-18T22:50:56.925756+00:00','https://www.youtube.com/watch?v=Ld7AZY49k4Y',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_Rebirth_of_Mars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2897,'Rawk-It Night','Sparkster','2026-08-18T15:01:10.753313+00:00','https://www.youtube.com/watch?v=R81BvjMnwAw',893,'https://ocrmirror.org/files/music/remixes/Sparkster_Rawk-It_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2898,'Lost in Time','Chrono Trigger','2026-08-19T04:07:07.559320+00:00','https://www.youtube.com/watch?v=7STkPv6RLxc',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Lost_in_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2899,'Wonderfall','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-19T02:00:24.588814+00:00','https://www.youtube.com/watch?v=j8XAqyz-uqs',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Wonderfall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2900,'Unsealed','The Legend of Zelda: A Link to the Past','2026-08-19T13:24:38.611918+00:00','https://www.youtube.com/watch?v=jglG4bUg5Iw',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Unsealed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2901,'Killing Hope','Perfect Dark','2026-08-18T17:53:54.467633+00:00','https://www.youtube.com/watch?v=osKfUZRXouY',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Killing_Hope_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2902,'Pluvia Veris','The Legend of Zelda: Oracle of Seasons','2026-08-18T22:50:58.010697+00:00','https://www.youtube.com/watch?v=RDw7VS01KWA',726,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Seasons_Pluvia_Veris_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2904,'Air Man in a G String','Mega Man 5','2026-08-18T20:49:44.615765+00:00','https://www.youtube.com/watch?v=NAKM28wREYg',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_Air_Man_in_a_G_String_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2905,'Sheik''s Groove','The Legend of Zelda: Ocarina of Time','2026-08-19T08:02:47.262618+00:00','https://www.youtube.com/watch?v=sPXSVvFEelk',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Sheik''s_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2906,'Dreams of Glory','Final Fantasy IV','2026-08-18T23:46:53.211437+00:00','https://www.youtube.com/watch?v=ABiAQ1-Lo4Y',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Dreams_of_Glory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2907,'Through the Flames','Super Mario 64','2026-08-19T08:02:45.875128+00:00','https://www.youtube.com/watch?v=27tHbNl5S30',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Through_the_Flames_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2908,'Grab the Blue Coin!','Super Mario 64','2026-08-18T21:47:53.970035+00:00','https://www.youtube.com/watch?v=Xtn4LYFfzBI',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Grab_the_Blue_Coin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2909,'Sunken Secrets','Super Mario 64','2026-08-18T19:48:43.205827+00:00','https://www.youtube.com/watch?v=3SfS7CnvDu0',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Sunken_Secrets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2910,'Somebody Set Up Us the Bob-omb','Super Mario 64','2026-08-19T09:57:42.100517+00:00','https://www.youtube.com/watch?v=h2_gluqj62A',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Somebody_Set_Up_Us_the_Bob-omb_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2911,'Hush Hour','Super Mario 64','2026-08-19T09:03:58.546625+00:00','https://www.youtube.com/watch?v=p7jSCAFyvPo',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Hush_Hour_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2912,'The Third Dimension','Super Mario 64','2026-08-18T17:53:55.485359+00:00','https://www.youtube.com/watch?v=_XYNayXqto4',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_The_Third_Dimension_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2913,'Perilous Pathway','Super Mario 64','2026-08-18T23:46:53.565686+00:00','https://www.youtube.com/watch?v=QxBiCR11F7M',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Perilous_Pathway_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2914,'They See Me Rolling','The Legend of Zelda: Ocarina of Time','2026-08-19T09:03:59.263580+00:00','https://www.youtube.com/watch?v=c92smqvMS5M',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_They_See_Me_Rolling_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2915,'Opening to Hades','Doom II: Hell on Earth','2026-08-18T19:48:43.380833+00:00','https://www.youtube.com/watch?v=3LJGlNHwWZM',841,'https://ocrmirror.org/files/music/remixes/Doom_2_Opening_to_Hades_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2917,'Dancing Spirits','Getsu Fuuma Den','2026-08-18T19:06:30.683639+00:00','https://www.youtube.com/watch?v=Ej0-blVfArE',851,'https://ocrmirror.org/files/music/remixes/Getsu_Fuuma_Den_Dancing_Spirits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2918,'Data Flux','Tyrian','2026-08-19T05:01:52.643902+00:00','https://www.youtube.com/watch?v=N7J6jld33II',358,'https://ocrmirror.org/files/music/remixes/Tyrian_Data_Flux_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2919,'Justice for All','The Legend of Zelda: A Link to the Past','2026-08-19T13:24:38.065933+00:00','https://www.youtube.com/watch?v=Fju18W0lhvs',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Justice_for_All_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2920,'Notes from a Small Island','Chrono Trigger','2026-08-19T11:50:11.782265+00:00','https://www.youtube.com/watch?v=ojoW-6CJ0Ps',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Notes_from_a_Small_Island_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2921,'The King Awaits','Super Mario Bros.','2026-08-19T04:07:06.662089+00:00','https://www.youtube.com/watch?v=CBBq6aPHjRc',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_The_King_Awaits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2922,'Hope Never Walks Alone','Mega Man Soccer','2026-08-19T09:57:42.278305+00:00','https://www.youtube.com/watch?v=gdwUNuIddls',912,'https://ocrmirror.org/files/music/remixes/Mega_Man_Soccer_Hope_Never_Walks_Alone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2924,'Eclipse Apocalypse','The Legend of Zelda: Majora''s Mask','2026-08-19T15:01:27.443091+00:00','https://www.youtube.com/watch?v=IGad5R2OA6M',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Eclipse_Apocalypse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2925,'Find Me','Castlevania: Bloodlines','2026-08-19T02:00:25.120462+00:00','https://www.youtube.com/watch?v=XM-Hvw5s8nU',610,'https://ocrmirror.org/files/music/remixes/Castlevania_Bloodlines_Find_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2926,'Wily''s Inferno','Mega Man 2','2026-08-19T03:24:23.864251+00:00','https://www.youtube.com/watch?v=zsY9dMpORGQ',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Wily''s_Inferno_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2927,'Beyond the Glass','Super Metroid','2026-08-19T09:57:42.455395+00:00','https://www.youtube.com/watch?v=B8oybBQaANQ',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Beyond_the_Glass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2928,'Fragments of Time v.1','The Legend of Zelda: Skyward Sword','2026-08-19T03:24:23.686652+00:00','https://www.youtube.com/watch?v=7rLk5X798DE',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Fragments_of_Time_v1_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2929,'Heart of the Moon','World of Warcraft','2026-08-19T09:03:58.180069+00:00','https://www.youtube.com/watch?v=Vi9R1O62_30',462,'https://ocrmirror.org/files/music/remixes/World_of_Warcraft_Heart_of_the_Moon_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2930,'Shield of Legend','Mega Man X6','2026-08-19T02:00:26.004220+00:00','https://www.youtube.com/watch?v=UkPPj92_n90',685,'https://ocrmirror.org/files/music/remixes/Mega_Man_X6_Shield_of_Legend_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2931,'I Tried','Half-Life 2','2026-08-19T04:07:07.024403+00:00','https://www.youtube.com/watch?v=-7krtILz_nc',827,'https://ocrmirror.org/files/music/remixes/Half-Life_2_I_Tried_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2932,'Phantasmal Hellfire','Akumajo Dracula X: Rondo of Blood','2026-08-19T05:01:54.077747+00:00','https://www.youtube.com/watch?v=gV7uaXkOJRo',112,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_X_Rondo_of_Blood_Phantasmal_Hellfire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2933,'La Fin de Zeromus','Final Fantasy IV','2026-08-18T21:47:53.622939+00:00','https://www.youtube.com/watch?v=k0nhhIxDUzg',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_La_Fin_de_Zeromus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2934,'Mummy Dance','Kirby Super Star','2026-08-18T22:50:56.563491+00:00','https://www.youtube.com/watch?v=OQ0-5ZOvFUE',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Mummy_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2935,'Get Down','Rockman & Forte','2026-08-19T05:01:52.822336+00:00','https://www.youtube.com/watch?v=H9bJXCM7kuY',308,'https://ocrmirror.org/files/music/remixes/Rockman_&_Forte_Get_Down_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2936,'A Different Kind of Peace','Donkey Kong Country','2026-08-19T08:02:46.755835+00:00','https://www.youtube.com/watch?v=smG_rXqrH5k',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_A_Different_Kind_of_Peace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2937,'Mother','Secret of Mana','2026-08-18T22:50:56.376554+00:00','https://www.youtube.com/watch?v=KVKErb-73to',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Mother_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2938,'Dex','Metroid','2026-08-19T03:24:23.509538+00:00','https://www.youtube.com/watch?v=bjPo7uhkw_w',73,'https://ocrmirror.org/files/music/remixes/Metroid_Dex_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2939,'Let''s Upset a ''Troid!','Metroid Prime','2026-08-19T11:50:11.597432+00:00','https://www.youtube.com/watch?v=uUz5nnAmkBo',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Let''s_Upset_a_''Troid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2940,'Take It All the Way','Sonic CD','2026-08-19T04:07:08.092900+00:00','https://www.youtube.com/watch?v=RjfOMJOWF7o',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Take_It_All_the_Way_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2941,'A Breeze in the Night','Shenmue','2026-08-18T19:48:44.432737+00:00','https://www.youtube.com/watch?v=Vr52wAzrTy0',148,'https://ocrmirror.org/files/music/remixes/Shenmue_A_Breeze_in_the_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2942,'BITE','Pokémon Gold Version','2026-08-18T21:47:54.661310+00:00','https://www.youtube.com/watch?v=UO5VMz3ARrY',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_BITE_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2943,'Beat the Woods','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-18T22:50:56.743927+00:00','https://www.youtube.com/watch?v=bLaYUjIVrG0',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Beat_the_Woods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2945,'Banaqua','Donkey Kong Land','2026-08-19T11:50:12.862058+00:00','https://www.youtube.com/watch?v=sqg6Fpw_kfo',487,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Land_Banaqua_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2946,'Face Your Nightmares','The Legend of Zelda: Link''s Awakening','2026-08-19T14:05:58.254664+00:00','https://www.youtube.com/watch?v=VPhMcAl4HSM',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Face_Your_Nightmares_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2947,'Gift of the MAGI','Final Fantasy Legend II','2026-08-19T09:03:59.623058+00:00','https://www.youtube.com/watch?v=hxcVF41nxTc',116,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Legend_2_Gift_of_the_MAGI_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2948,'Crimea River','Tetris','2026-08-19T13:24:38.751850+00:00','https://www.youtube.com/watch?v=Y0qpgLWhje8',510,'https://ocrmirror.org/files/music/remixes/Tetris_Crimea_River_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2949,'Welcome to Switzerland','Astérix','2026-08-19T15:57:11.730636+00:00','https://www.youtube.com/watch?v=Wzi4pTPo7Vc',919,'https://ocrmirror.org/files/music/remixes/Asterix_Welcome_to_Switzerland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2950,'Clouds Away','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-19T16:55:27.363819+00:00','https://www.youtube.com/watch?v=hMZVa6JFQj8',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Clouds_Away_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2951,'Melodies of Mabe Village','The Legend of Zelda: Link''s Awakening','2026-08-19T05:01:53.184430+00:00','https://www.youtube.com/watch?v=oxKeHrZqios',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Melodies_of_Mabe_Village_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2952,'Loadout (Single-Player Edit)','Gunstar Heroes','2026-08-18T21:47:54.835157+00:00','https://www.youtube.com/watch?v=h3753EylRmQ',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Loadout_(Single-Player_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2953,'Mystical Mist','Final Fantasy Mystic Quest','2026-08-19T08:02:46.085539+00:00','https://www.youtube.com/watch?v=vCBAUh6lFhI',332,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Mystic_Quest_Mystical_Mist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2954,'A Royal Appearance','The Legend of Zelda: Ocarina of Time','2026-08-19T07:20:08.443530+00:00','https://www.youtube.com/watch?v=GBwFPW7wkkw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_A_Royal_Appearance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2955,'Sadevakio','Deus Ex','2026-08-19T03:24:24.042234+00:00','https://www.youtube.com/watch?v=ZbsSJ5EzG80',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Sadevakio_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2956,'Love Everlasting','Katamari Damacy','2026-08-19T08:02:46.316637+00:00','https://www.youtube.com/watch?v=KeiXKsYQJ1A',702,'https://ocrmirror.org/files/music/remixes/Katamari_Damacy_Love_Everlasting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2957,'Streets of Rave','Streets of Rage','2026-08-19T09:57:41.921875+00:00','https://www.youtube.com/watch?v=8ngaKie_rik',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Streets_of_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2959,'Coming to Chimerica','Harlequin','2026-08-18T21:47:53.273244+00:00','https://www.youtube.com/watch?v=wSZZaOBu8aw',923,'https://ocrmirror.org/files/music/remixes/Harlequin_Coming_to_Chimerica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2960,'Courage ~ Failure ~ Rosebud','Final Fantasy VI','2026-08-19T08:02:46.912769+00:00','https://www.youtube.com/watch?v=tJK_Egqq7cY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Courage_Failure_Rosebud_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2961,'The Clocktower','Luigi''s Mansion: Dark Moon','2026-08-19T04:07:06.845443+00:00','https://www.youtube.com/watch?v=kVVTNHGd8v4',924,'https://ocrmirror.org/files/music/remixes/Luigi''s_Mansion_Dark_Moon_The_Clocktower_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2962,'Wrinkly''s Nightcap','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-19T05:01:53.551336+00:00','https://www.youtube.com/watch?v=ufx739x3kKo',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Wrinkly''s_Nightcap_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2963,'Kingdom of Magic','Chrono Trigger','2026-08-19T15:57:11.377603+00:00','https://www.youtube.com/watch?v=uYKNHCW6jNk',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Kingdom_of_Magic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2964,'Bullet Hell','Gunstar Heroes','2026-08-18T23:46:52.854977+00:00','https://www.youtube.com/watch?v=P6rXQeotae8',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Bullet_Hell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2966,'Hey, Listen','The Legend of Zelda: Ocarina of Time','2026-08-19T05:01:52.999470+00:00','https://www.youtube.com/watch?v=H-Bx-L6NmG4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Hey_Listen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2967,'Lady of the Lake','The Legend of Zelda: Twilight Princess','2026-08-19T13:24:38.205976+00:00','https://www.youtube.com/watch?v=Ts2sTdRpD24',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Lady_of_the_Lake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2968,'Duel in the Desert!','Yu-Gi-Oh! Dark Duel Stories','2026-08-19T09:57:42.812643+00:00','https://www.youtube.com/watch?v=QBKLp6sYL1Q',905,'https://ocrmirror.org/files/music/remixes/Yu-Gi-Oh_Dark_Duel_Stories_Duel_in_the_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2969,'Walking Weapons Unit','Mega Man 5','2026-08-19T03:24:24.575406+00:00','https://www.youtube.com/watch?v=ZPHn1-Vxfbs',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_Walking_Weapons_Unit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2970,'Find the Red Coin','Super Mario 64','2026-08-18T22:50:57.830353+00:00','https://www.youtube.com/watch?v=Hw-6JBpHGEM',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Find_the_Red_Coin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2972,'Roads to Everywhere','Super Mario 64','2026-08-19T10:54:30.280403+00:00','https://www.youtube.com/watch?v=onpBZP3HBrg',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Roads_to_Everywhere_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2973,'Devastation''s Duel','Super Mario 64','2026-08-19T10:54:31.176446+00:00','https://www.youtube.com/watch?v=YJjsSdj3sts',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Devastation''s_Duel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2974,'Wings to the Sky','Super Mario 64','2026-08-18T23:46:52.675456+00:00','https://www.youtube.com/watch?v=1kO77b8hj9E',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Wings_to_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2975,'Cruisin'' (Live Edit)','Chrono Cross','2026-08-19T09:57:41.202281+00:00','https://www.youtube.com/watch?v=F82NBieXmDk',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Cruisin''_(Live_Edit)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2976,'In the Green Gloom','Chrono Trigger','2026-08-19T15:01:26.167602+00:00','https://www.youtube.com/watch?v=ighsYc-lyFY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_In_the_Green_Gloom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2977,'Zanarkand String Quartet','Final Fantasy X','2026-08-19T02:00:25.827608+00:00','https://www.youtube.com/watch?v=MY5FeVtnWvo',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Zanarkand_String_Quartet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2978,'(You Give Me) Wings','Xenogears','2026-08-19T08:02:47.150561+00:00','https://www.youtube.com/watch?v=h3sKIzKmJ1M',70,'https://ocrmirror.org/files/music/remixes/Xenogears_(You_Give_Me)_Wings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2979,'Jewel of Enhasa','Chrono Trigger','2026-08-19T09:57:41.564366+00:00','https://www.youtube.com/watch?v=OkBT2YfNIdo',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Jewel_of_Enhasa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2980,'Shenanigans Bananigans','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-19T08:02:46.532590+00:00','https://www.youtube.com/watch?v=-8npSaWWp6g',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Shenanigans_Bananigans_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2982,'Cancer','Metroid','2026-08-19T17:50:03.939903+00:00','https://www.youtube.com/watch?v=KCmX1rkTk1A',73,'https://ocrmirror.org/files/music/remixes/Metroid_Cancer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2983,'Forever Yours','The Legend of Zelda: The Wind Waker','2026-08-19T07:20:09.334887+00:00','https://www.youtube.com/watch?v=j__8QcHIgv0',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Forever_Yours_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2984,'Skull-Head','Doom Troopers: Mutant Chronicles','2026-08-19T05:01:52.464499+00:00','https://www.youtube.com/watch?v=V0mdcWvMskU',759,'https://ocrmirror.org/files/music/remixes/Doom_Troopers_Skull-Head_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2985,'Zenpyo!','Dynamite Headdy','2026-08-19T03:24:24.398153+00:00','https://www.youtube.com/watch?v=5rI1BvGhJy8',731,'https://ocrmirror.org/files/music/remixes/Dynamite_Headdy_Zenpyo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2986,'Did a Hedgehog Just Come Through Here?','Sonic the Hedgehog','2026-08-19T08:02:45.659431+00:00','https://www.youtube.com/watch?v=OylReYY96ZU',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Did_a_Hedgehog_Just_Come_Through_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2987,'Satanic Spire','Castlevania: Bloodlines','2026-08-19T13:24:37.889817+00:00','https://www.youtube.com/watch?v=h6G9rme0Oyc',610,'https://ocrmirror.org/files/music/remixes/Castlevania_Bloodlines_Satanic_Spire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2988,'Biohazard','Sonic the Hedgehog 2','2026-08-19T03:24:24.752207+00:00','https://www.youtube.com/watch?v=0OlgHMpS-IQ',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Biohazard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2989,'Toxic','Final Fantasy VI','2026-08-19T16:55:27.185532+00:00','https://www.youtube.com/watch?v=VpCs3EVK6lY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Toxic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2990,'The Eyepatch of the Tiger','Street Fighter II: The World Warrior','2026-08-19T09:03:58.904792+00:00','https://www.youtube.com/watch?v=E31ZTgPsZrk',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_The_Eyepatch_of_the_Tiger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2991,'Eau Charix','Metal Slug 4','2026-08-19T04:07:08.296872+00:00','https://www.youtube.com/watch?v=hYnd3F6yblA',925,'https://ocrmirror.org/files/music/remixes/Metal_Slug_4_Eau_Charix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2992,'Then the Healing Came','The Legend of Zelda: Majora''s Mask','2026-08-19T07:20:08.063902+00:00','https://www.youtube.com/watch?v=2yJDWfk-0-k',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Then_the_Healing_Came_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2993,'Take Turns','Phantasy Star II','2026-08-19T05:01:53.903011+00:00','https://www.youtube.com/watch?v=CsPvtJVSu1A',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_Take_Turns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2994,'A Brief Winter Trek','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-19T03:24:23.147338+00:00','https://www.youtube.com/watch?v=PNzGNla1Xns',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_A_Brief_Winter_Trek_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2995,'Sarah','The Last of Us','2026-08-19T07:20:07.820032+00:00','https://www.youtube.com/watch?v=fuqzJBxJoM8',913,'https://ocrmirror.org/files/music/remixes/Last_of_Us_Sarah_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2996,'Drunken Monkey','Monkey Island 2: LeChuck''s Revenge','2026-08-19T09:57:41.386535+00:00','https://www.youtube.com/watch?v=O8hPIIKdfBo',302,'https://ocrmirror.org/files/music/remixes/Monkey_Island_2_Drunken_Monkey_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2997,'Neonature','Deus Ex','2026-08-19T07:20:08.801209+00:00','https://www.youtube.com/watch?v=H9X1DmaQBdM',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Neonature_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(2998,'Hot Machine, Cold Surface','Metroid Prime','2026-08-19T11:50:13.041998+00:00','https://www.youtube.com/watch?v=52UxZM9fDRI',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Hot_Machine_Cold_Surface_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(2999,'Who''s There?','Hotline Miami','2026-08-19T09:57:41.743250+00:00','https://www.youtube.com/watch?v=SqNPesQaxyI',926,'https://ocrmirror.org/files/music/remixes/Hotline_Miami_Who''s_There_OC_ReMix.mp3',1);
@@ -0,0 +1,976 @@
+INSERT INTO "remix" VALUES(3000,'Dark Storm','The Legend of Zelda: A Link to the Past','2026-08-19T20:53:55.861781+00:00','https://www.youtube.com/watch?v=3_T90vHFkbI',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3001,'Lost in a Nightmare','Castlevania: Symphony of the Night','2026-08-19T17:50:04.475993+00:00','https://www.youtube.com/watch?v=RnhB7bspSjA',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Lost_in_a_Nightmare_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3002,'Hope Rising','Destiny','2026-08-19T20:53:55.699832+00:00','https://www.youtube.com/watch?v=VdQZaFuizXY',928,'https://ocrmirror.org/files/music/remixes/Destiny_Hope_Rising_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3003,'Clear Reflections','Mirror''s Edge','2026-08-19T14:05:58.608063+00:00','https://www.youtube.com/watch?v=To0oqslp5mU',910,'https://ocrmirror.org/files/music/remixes/Mirror''s_Edge_Clear_Reflections_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3004,'Rock and Ride','Biker Mice from Mars','2026-08-19T14:05:57.725561+00:00','https://www.youtube.com/watch?v=mtGQvMRaAfs',901,'https://ocrmirror.org/files/music/remixes/Biker_Mice_from_Mars_Rock_and_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3005,'Funky Moles & Trashy Ducks','Darkwing Duck','2026-08-19T11:50:11.964366+00:00','https://www.youtube.com/watch?v=4-ZsWDzydyU',356,'https://ocrmirror.org/files/music/remixes/Darkwing_Duck_Funky_Moles_&_Trashy_Ducks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3006,'It''s Raining Zen','Tenchu: Shadow Assassins','2026-08-19T10:54:30.819971+00:00','https://www.youtube.com/watch?v=f39I3mUMFwI',911,'https://ocrmirror.org/files/music/remixes/Tenchu_Shadow_Assassins_It''s_Raining_Zen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3008,'Cleaning Out Axis','Batman','2026-08-19T15:57:12.084182+00:00','https://www.youtube.com/watch?v=dtpdxAB3EoA',37,'https://ocrmirror.org/files/music/remixes/Batman_Cleaning_Out_Axis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3009,'Polka Center','Pokémon Red Version','2026-08-19T15:57:11.024061+00:00','https://www.youtube.com/watch?v=m7NlqGwYVUk',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Polka_Center_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3011,'Marble Bombast','Castlevania: Symphony of the Night','2026-08-19T17:50:04.118499+00:00','https://www.youtube.com/watch?v=ccRQrIa9nJQ',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Marble_Bombast_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3012,'Graveyard Theory','Sonic Adventure 2','2026-08-20T01:58:47.145512+00:00','https://www.youtube.com/watch?v=Nx424nD7x6k',277,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_2_Graveyard_Theory_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3013,'See You Next Time','Super Mario 64','2026-08-19T14:05:58.078098+00:00','https://www.youtube.com/watch?v=9CFtQLFb49E',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_See_You_Next_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3014,'Enigmatic Melody','Sonic 3D Blast','2026-08-19T11:50:12.682507+00:00','https://www.youtube.com/watch?v=DvnUUeu2_FA',251,'https://ocrmirror.org/files/music/remixes/Sonic_3D_Blast_Enigmatic_Melody_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3015,'Saria''s Drop','The Legend of Zelda: Ocarina of Time','2026-08-19T17:50:03.224215+00:00','https://www.youtube.com/watch?v=bd6lR0yRSy0',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Saria''s_Drop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3016,'Tread a Little Heavier','Shuttle Rush','2026-08-19T11:50:12.323005+00:00','https://www.youtube.com/watch?v=jMSBAiJbbWw',931,'https://ocrmirror.org/files/music/remixes/Shuttle_Rush_Tread_a_Little_Heavier_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3017,'The Observer','Shuttle Rush','2026-08-19T10:54:30.460329+00:00','https://www.youtube.com/watch?v=BLqluedoJNk',931,'https://ocrmirror.org/files/music/remixes/Shuttle_Rush_The_Observer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3018,'Hero''s Rest','The Legend of Zelda: Twilight Princess','2026-08-19T14:05:58.431452+00:00','https://www.youtube.com/watch?v=WVg2LhlQxfA',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Hero''s_Rest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3019,'A Derelict Machine','Ecco: The Tides of Time','2026-08-19T14:05:57.902014+00:00','https://www.youtube.com/watch?v=Srh17wU2RcM',607,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_A_Derelict_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3020,'Zelda''s Lament','The Legend of Zelda: Twilight Princess','2026-08-19T15:01:27.623881+00:00','https://www.youtube.com/watch?v=ZxpsQ7l9uB4',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Zelda''s_Lament_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3021,'Trinity','Kingdom Hearts','2026-08-19T11:50:12.143506+00:00','https://www.youtube.com/watch?v=Ui1QJ2qjkYo',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Trinity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3022,'The Nightmare Oath','Final Fantasy VI','2026-08-19T22:50:59.514312+00:00','https://www.youtube.com/watch?v=qvUTwXEsuko',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Nightmare_Oath_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3023,'Sounds of Liberty','Metal Gear Solid 2: Sons of Liberty','2026-08-19T15:01:26.889987+00:00','https://www.youtube.com/watch?v=ir_ljnBdEhc',270,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_2_Sounds_of_Liberty_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3025,'Strange World','Final Fantasy VI','2026-08-19T15:01:27.263695+00:00','https://www.youtube.com/watch?v=cP_p6vjX9vg',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Strange_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3026,'Red Pearl','Castlevania: Bloodlines','2026-08-19T09:03:57.998528+00:00','https://www.youtube.com/watch?v=sfDetPkdmik',610,'https://ocrmirror.org/files/music/remixes/Castlevania_Bloodlines_Red_Pearl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3027,'Chips out of Water','Sonic CD','2026-08-19T15:57:11.554207+00:00','https://www.youtube.com/watch?v=A1hN9h5649M',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Chips_out_of_Water_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3028,'Oblivium Sempiternum Daemonis','Super Castlevania IV','2026-08-19T22:51:00.291946+00:00','https://www.youtube.com/watch?v=qYVewcygfSA',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Oblivium_Sempiternum_Daemonis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3029,'Food Frenzy','Kirby Super Star','2026-08-19T14:05:57.549127+00:00','https://www.youtube.com/watch?v=WScOwVbUjzk',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Food_Frenzy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3030,'Entropic Dream','Metroid Prime 3: Corruption','2026-08-19T21:50:34.780548+00:00','https://www.youtube.com/watch?v=PCiShrKVIQY',518,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_3_Entropic_Dream_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3031,'Savage Triumph','Final Fantasy VI','2026-08-19T19:02:12.741350+00:00','https://www.youtube.com/watch?v=hJ84kKAGzUc',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Savage_Triumph_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3032,'Groovin'' Through the Cosmos','Shuttle Rush','2026-08-19T10:54:30.999200+00:00','https://www.youtube.com/watch?v=DfOlVdZ44IE',931,'https://ocrmirror.org/files/music/remixes/Shuttle_Rush_Groovin''_Through_the_Cosmos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3033,'Acoustic Fields','Spyro: Year of the Dragon','2026-08-19T10:54:30.639626+00:00','https://www.youtube.com/watch?v=D54tMNL8_S8',945,'https://ocrmirror.org/files/music/remixes/Spyro_Year_of_the_Dragon_Acoustic_Fields_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3034,'A Legacy Forgotten','Final Fantasy VI','2026-08-19T16:55:27.543650+00:00','https://www.youtube.com/watch?v=-lkEXmXMQfw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_A_Legacy_Forgotten_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3035,'S.C.A.T.','WinBack: Covert Operations','2026-08-19T13:24:37.610147+00:00','https://www.youtube.com/watch?v=NDnGnHNTJOA',935,'https://ocrmirror.org/files/music/remixes/WinBack_SCAT_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3036,'Let''s Bust Some Viruses!','Mega Man Battle Network','2026-08-19T19:02:13.020888+00:00','https://www.youtube.com/watch?v=3xJrDjIcly8',873,'https://ocrmirror.org/files/music/remixes/Mega_Man_Battle_Network_Let''s_Bust_Some_Viruses_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3037,'Dream Eater Mix','Pokémon Red Version','2026-08-19T15:57:10.845469+00:00','https://www.youtube.com/watch?v=aMWFfm0lSdg',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Dream_Eater_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3038,'SZRC Anthem (Busiest Days of My Life)','Sonic the Hedgehog 3','2026-08-20T05:04:02.710672+00:00','https://www.youtube.com/watch?v=ZKM-VKcW7K4',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_SZRC_Anthem_(Busiest_Days_of_My_Life)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3039,'Meus Caligo Hora','Puella Magi Madoka Magica Portable','2026-08-19T10:54:30.100479+00:00','https://www.youtube.com/watch?v=rDy8OI81y3M',916,'https://ocrmirror.org/files/music/remixes/Puella_Magi_Madoka_Magica_Portable_Meus_Caligo_Hora_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3040,'Audiophobe','Xenophobe','2026-08-19T10:54:29.917725+00:00','https://www.youtube.com/watch?v=OA7c0Vo8lNY',938,'https://ocrmirror.org/files/music/remixes/Xenophobe_Audiophobe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3041,'Aqua Tides','Kirby 64: The Crystal Shards','2026-08-19T17:50:03.760988+00:00','https://www.youtube.com/watch?v=GbSBSrQt7p8',577,'https://ocrmirror.org/files/music/remixes/Kirby_64_Aqua_Tides_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3042,'Bloody Mayhem','Akumajo Dracula X: Nocturne in the Moonlight','2026-08-19T17:50:03.406235+00:00','https://www.youtube.com/watch?v=3lCNqST5lAQ',939,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_X_Nocturne_in_the_Moonlight_Bloody_Mayhem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3043,'Epitaph for Boletaria','Demon''s Souls','2026-08-19T10:54:31.536077+00:00','https://www.youtube.com/watch?v=Nz10oXXpfY0',946,'https://ocrmirror.org/files/music/remixes/Demon''s_Souls_Epitaph_for_Boletaria_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3044,'Welcome to Our Castle','3-D Ultra Pinball: Creep Night','2026-08-19T14:05:57.371861+00:00','https://www.youtube.com/watch?v=6CMz-YcF1g0',943,'https://ocrmirror.org/files/music/remixes/3-D_Ultra_Pinball_Creep_Night_Welcome_to_Our_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3045,'Tutti I Frutti: The Ballad of Piantee Joe','Super Mario Sunshine','2026-08-19T19:49:35.928194+00:00','https://www.youtube.com/watch?v=XeLnQhcv8EY',937,'https://ocrmirror.org/files/music/remixes/Super_Mario_Sunshine_Tutti_I_Frutti_The_Ballad_of_Piantee_Joe_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3046,'Pixel Storms in the Planetary System','Supremacy: Your Will Be Done','2026-08-19T09:03:58.725375+00:00','https://www.youtube.com/watch?v=twepqtuC_pU',944,'https://ocrmirror.org/files/music/remixes/Supremacy_Pixel_Storms_in_the_Planetary_System_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3047,'Simply Be-groove-ed','Kingdom Hearts','2026-08-19T23:47:01.089481+00:00','https://www.youtube.com/watch?v=KmM8eGYbXAk',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Simply_Be-groove-ed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3048,'Wistful','The Legend of Zelda: Twilight Princess','2026-08-19T20:53:55.215101+00:00','https://www.youtube.com/watch?v=8h3D8XcL3Ac',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Wistful_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3049,'BUTTS','Detana!! TwinBee','2026-08-19T13:24:37.749532+00:00','https://www.youtube.com/watch?v=Sl6KjSqGXkk',904,'https://ocrmirror.org/files/music/remixes/Detana_TwinBee_BUTTS_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3050,'Cosmic Whispers','Chrono Trigger','2026-08-19T19:49:36.464385+00:00','https://www.youtube.com/watch?v=qX6DDo2vv1c',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Cosmic_Whispers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3052,'Fisherman''s Horizon (Christmas Ver.)','Final Fantasy VIII','2026-08-19T10:54:31.354769+00:00','https://www.youtube.com/watch?v=BTo0TeGVwv8',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Fisherman''s_Horizon_(Christmas_Ver)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3053,'Crystal Cipher','Mega Man X3','2026-08-19T19:49:35.223999+00:00','https://www.youtube.com/watch?v=zP-ExVYLcps',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Crystal_Cipher_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3054,'The Icy Journey Through Hope and Sorrow','Sonic and the Black Knight','2026-08-19T15:01:27.805082+00:00','https://www.youtube.com/watch?v=rTaY6ORBGK8',947,'https://ocrmirror.org/files/music/remixes/Sonic_and_the_Black_Knight_The_Icy_Journey_Through_Hope_and_Sorrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3055,'Umaro''s New Groove','Final Fantasy VI','2026-08-20T01:58:46.792030+00:00','https://www.youtube.com/watch?v=YjYHgcEdzQo',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Umaro''s_New_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3056,'The Iceman Clubbeth','Mega Man','2026-08-19T09:57:42.634301+00:00','https://www.youtube.com/watch?v=psnVd6SzdfU',1,'https://ocrmirror.org/files/music/remixes/Mega_Man_The_Iceman_Clubbeth_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3057,'Lights Out','Mega Man 9','2026-08-19T17:50:03.583791+00:00','https://www.youtube.com/watch?v=9b71y6sTKcg',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Lights_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3058,'The Goddess Gets Groovy Tonight','The Legend of Zelda: A Link to the Past','2026-08-19T17:50:04.829818+00:00','https://www.youtube.com/watch?v=Dxe-F2PBYv4',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Goddess_Gets_Groovy_Tonight_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3059,'Medieval Koopa Jam','Super Mario 64','2026-08-19T19:02:13.854699+00:00','https://www.youtube.com/watch?v=6pyEmF86OFw',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Medieval_Koopa_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3060,'Born from the Ashes','Pokémon X','2026-08-19T19:02:13.160221+00:00','https://www.youtube.com/watch?v=T2eX0RHZ3AQ',850,'https://ocrmirror.org/files/music/remixes/Pokemon_X_Born_from_the_Ashes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3062,'You Will Not Survive','The Legend of Zelda','2026-08-20T04:07:06.690754+00:00','https://www.youtube.com/watch?v=LtnZpJNC2UU',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_You_Will_Not_Survive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3063,'Big Donut-Slammin'' Moe','Dungeonmans','2026-08-19T20:53:55.538513+00:00','https://www.youtube.com/watch?v=QAMd0OUDb7Y',971,'https://ocrmirror.org/files/music/remixes/Dungeonmans_Big_Donut-Slammin''_Moe_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3064,'Play with Me','The Legend of Zelda: Link''s Awakening','2026-08-19T19:49:34.864776+00:00','https://www.youtube.com/watch?v=DLB3f1zA278',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Play_with_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3065,'House of Healing','The Legend of Zelda: Majora''s Mask','2026-08-19T19:02:13.437774+00:00','https://www.youtube.com/watch?v=7r1tn6DaAd8',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_House_of_Healing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3066,'Eye of the Beeholder','Dungeonmans','2026-08-19T16:55:27.005134+00:00','https://www.youtube.com/watch?v=1zhg9By188g',971,'https://ocrmirror.org/files/music/remixes/Dungeonmans_Eye_of_the_Beeholder_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3067,'Charge! Towards the Sunset of Intergalactic Dictatorship','Mega Man X','2026-08-19T19:02:13.298943+00:00','https://www.youtube.com/watch?v=AHkYkw2jv6g',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Charge_Towards_the_Sunset_of_Intergalactic_Dictatorship_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3068,'S-Tier','Super Smash Bros. Melee','2026-08-20T04:07:06.865841+00:00','https://www.youtube.com/watch?v=D62mEMSGVXc',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_S-Tier_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3069,'Times Like These','Pokémon Mystery Dungeon: Red Rescue Team','2026-08-19T21:50:34.423354+00:00','https://www.youtube.com/watch?v=4RrKQq-3cjg',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_Times_Like_These_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3070,'Mountain''s Wind','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-19T19:49:36.287521+00:00','https://www.youtube.com/watch?v=tD_e3Q_gLtM',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Mountain''s_Wind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3071,'The Guy from the Woods Is Back in Town','The Legend of Zelda: Ocarina of Time','2026-08-19T21:50:34.245253+00:00','https://www.youtube.com/watch?v=ia2drtx8Po0',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_The_Guy_from_the_Woods_Is_Back_in_Town_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3072,'Chillin'' with the Bros.','Super Smash Bros.','2026-08-19T15:01:27.084477+00:00','https://www.youtube.com/watch?v=hq8hH32lEVw',667,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Chillin''_with_the_Bros_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3074,'Got My Mind on My Money Match','Super Smash Bros. for Wii U','2026-08-19T21:50:34.959619+00:00','https://www.youtube.com/watch?v=wLjwZzoUl3I',973,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_for_Wii_U_Got_My_Mind_on_My_Money_Match_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3075,'May the Stars Light Your Way','Guilty Gear Xrd -SIGN-','2026-08-19T16:55:27.722571+00:00','https://www.youtube.com/watch?v=9M-Z02EGkb4',974,'https://ocrmirror.org/files/music/remixes/Guilty_Gear_Xrd_May_the_Stars_Light_Your_Way_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3076,'Forest Fire','Pokémon X','2026-08-19T16:55:26.648174+00:00','https://www.youtube.com/watch?v=Ug9bNYjiBTI',850,'https://ocrmirror.org/files/music/remixes/Pokemon_X_Forest_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3077,'Boiling Point','Gunstar Heroes','2026-08-19T22:51:00.080789+00:00','https://www.youtube.com/watch?v=X0arRbwoWoM',258,'https://ocrmirror.org/files/music/remixes/Gunstar_Heroes_Boiling_Point_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3078,'Guile''s Theme Goes with Metal','Street Fighter II: The World Warrior','2026-08-19T15:01:26.351489+00:00','https://www.youtube.com/watch?v=u56Hl0WJDhU',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Guile''s_Theme_Goes_with_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3079,'Dragonfireplace','Seiken Densetsu 3','2026-08-19T14:05:58.783976+00:00','https://www.youtube.com/watch?v=nxjzcdVM8V0',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Dragonfireplace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3080,'Pearly Gates','Flimbo''s Quest','2026-08-19T20:53:54.891087+00:00','https://www.youtube.com/watch?v=DxqvDAqJmp0',1135,'https://ocrmirror.org/files/music/remixes/Flimbo''s_Quest_Pearly_Gates_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3081,'A World in Motion (Super Peel Out Edit)','Sonic CD','2026-08-20T03:23:56.724611+00:00','https://www.youtube.com/watch?v=_TtqSSyFkQ0',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_A_World_in_Motion_(Super_Peel_Out_Edit)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3082,'Edward Penelo''s Waltz','Final Fantasy IV','2026-08-19T19:02:12.882099+00:00','https://www.youtube.com/watch?v=aLqngcJgO14',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Edward_Penelo''s_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3083,'Day of Ruin','Final Fantasy VI','2026-08-19T19:49:35.401276+00:00','https://www.youtube.com/watch?v=aeapzKZNu8c',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Day_of_Ruin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3084,'Frosty Wilderness','Mega Man Zero 3','2026-08-19T13:24:39.067869+00:00','https://www.youtube.com/watch?v=0Ddx8b0bqV4',941,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_3_Frosty_Wilderness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3085,'Kirb Your Enthusiasm','Kirby Super Star','2026-08-19T22:50:59.938171+00:00','https://www.youtube.com/watch?v=Qfo_TBPThnY',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Kirb_Your_Enthusiasm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3086,'The Fall of Artorias','Dark Souls','2026-08-19T15:57:10.667751+00:00','https://www.youtube.com/watch?v=64dDEQG8Bc4',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_The_Fall_of_Artorias_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3087,'This Love, Our Love','Star Ocean: The Second Story','2026-08-19T20:53:55.376804+00:00','https://www.youtube.com/watch?v=C3f9cRMqGis',283,'https://ocrmirror.org/files/music/remixes/Star_Ocean_The_Second_Story_This_Love_Our_Love_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3088,'Nocturne for Paula','EarthBound','2026-08-19T11:50:13.220754+00:00','https://www.youtube.com/watch?v=4-EBp_uE5pU',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Nocturne_for_Paula_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3089,'5 Minutes of Glory','Super Final Match Tennis','2026-08-20T08:05:11.732376+00:00','https://www.youtube.com/watch?v=g4PJNIHpGD0',967,'https://ocrmirror.org/files/music/remixes/Super_Final_Match_Tennis_5_Minutes_of_Glory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3090,'Ocean View','Sonic the Hedgehog','2026-08-20T01:58:46.438241+00:00','https://www.youtube.com/watch?v=P3vQM4MPUqY',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Ocean_View_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3091,'Reborn','Shadowrun','2026-08-19T19:49:35.044212+00:00','https://www.youtube.com/watch?v=HFiARngbq0k',769,'https://ocrmirror.org/files/music/remixes/Shadowrun_Reborn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3093,'Dynasty','Mega Man 4','2026-08-19T17:50:04.653433+00:00','https://www.youtube.com/watch?v=7N2cp9-ryJE',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Dynasty_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3094,'Elegy for a Ruined World','Final Fantasy VI','2026-08-19T22:50:59.300379+00:00','https://www.youtube.com/watch?v=3w9U3EIjEu0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Elegy_for_a_Ruined_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3095,'Soap Globe','Space Station: Silicon Valley','2026-08-20T05:56:24.742914+00:00','https://www.youtube.com/watch?v=RYcC_UsBR0Q',977,'https://ocrmirror.org/files/music/remixes/Space_Station_Silicon_Valley_Soap_Globe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3096,'Simon Says: Let There Be Jazz','Castlevania II: Simon''s Quest','2026-08-20T03:23:57.799778+00:00','https://www.youtube.com/watch?v=-5NXpQj7rs0',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Simon_Says_Let_There_Be_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3097,'Seven Songs for Seventh Saga: II. Water','The 7th Saga','2026-08-20T04:07:06.514835+00:00','https://www.youtube.com/watch?v=AL7RwcNcAkQ',732,'https://ocrmirror.org/files/music/remixes/7th_Saga_Seven_Songs_for_Seventh_Saga_II_Water_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3098,'Seven Songs for Seventh Saga: IV. Sky','The 7th Saga','2026-08-19T16:55:26.827019+00:00','https://www.youtube.com/watch?v=Z4mQS97BFWA',732,'https://ocrmirror.org/files/music/remixes/7th_Saga_Seven_Songs_for_Seventh_Saga_IV_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3099,'No Rain in the Desert','The Legend of Zelda: Oracle of Seasons','2026-08-19T23:47:00.601067+00:00','https://www.youtube.com/watch?v=lSBGTQFN-hc',726,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Seasons_No_Rain_in_the_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3100,'Me and Mario Down by the Schoolyard','Super Mario Bros.','2026-08-20T05:56:25.097469+00:00','https://www.youtube.com/watch?v=chJb8Fi1Y90',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Me_and_Mario_Down_by_the_Schoolyard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3101,'I Had a Name','Dark Souls','2026-08-19T19:49:36.112050+00:00','https://www.youtube.com/watch?v=-ApNYwM_pmI',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_I_Had_a_Name_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3102,'Smooth Dream','Sonic Chaos','2026-08-19T23:47:00.926902+00:00','https://www.youtube.com/watch?v=jbzczcmn4go',978,'https://ocrmirror.org/files/music/remixes/Sonic_Chaos_Smooth_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3104,'Crystal Gradient','Final Fantasy XII','2026-08-19T21:50:34.065524+00:00','https://www.youtube.com/watch?v=VWAJZ7rU2PY',525,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_12_Crystal_Gradient_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3105,'The Locker Room','Mega Man 2','2026-08-19T15:01:26.531628+00:00','https://www.youtube.com/watch?v=Lw6Kjp6e3Ok',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Locker_Room_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3106,'Lullaby of the Sky','The Legend of Zelda: Ocarina of Time','2026-08-20T05:04:02.184644+00:00','https://www.youtube.com/watch?v=ikquU7HcTdw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Lullaby_of_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3107,'Sub-Zero','Metroid Prime','2026-08-20T08:05:12.612219+00:00','https://www.youtube.com/watch?v=nt7pVid_MAs',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Sub-Zero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3108,'Flicky''s Night Out','Sonic the Hedgehog','2026-08-20T05:56:24.563899+00:00','https://www.youtube.com/watch?v=7EBBxZRsFe8',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Flicky''s_Night_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3109,'Banish','Donkey Kong Country','2026-08-20T07:22:11.598698+00:00','https://www.youtube.com/watch?v=j6FM6ADpcMo',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Banish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3110,'Playing in the Park','Tehkan World Cup','2026-08-19T19:02:12.599896+00:00','https://www.youtube.com/watch?v=9WTlIRQBZng',903,'https://ocrmirror.org/files/music/remixes/Tehkan_World_Cup_Playing_in_the_Park_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3112,'Eclipse','Final Fantasy IV','2026-08-19T20:53:55.052968+00:00','https://www.youtube.com/watch?v=kiu3MpwrwmU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Eclipse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3113,'Adagio pour Mallow','Super Mario RPG: Legend of the Seven Stars','2026-08-19T16:55:26.290126+00:00','https://www.youtube.com/watch?v=GpjUpnHxBzg',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Adagio_pour_Mallow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3114,'To the End of the Sea and Sky','Mega Man 5','2026-08-20T01:58:46.968725+00:00','https://www.youtube.com/watch?v=2XiNEysgt-M',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_To_the_End_of_the_Sea_and_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3115,'Not Your Above-Average Joe','Viewtiful Joe','2026-08-19T14:05:57.190509+00:00','https://www.youtube.com/watch?v=z_waoADlWbE',981,'https://ocrmirror.org/files/music/remixes/Viewtiful_Joe_Not_Your_Above-Average_Joe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3116,'Swing When You''re Killing','Castlevania','2026-08-20T04:07:07.213625+00:00','https://www.youtube.com/watch?v=fp_Fbt9aXDE',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Swing_When_You''re_Killing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3117,'G-R-O-O-V-E of a God','Final Fantasy VII','2026-08-20T03:23:57.443708+00:00','https://www.youtube.com/watch?v=SOL640K4TYs',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_G-R-O-O-V-E_of_a_God_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3118,'Seventh Climb','Mega Man 7','2026-08-20T03:23:58.334880+00:00','https://www.youtube.com/watch?v=QGn8o-JpraA',460,'https://ocrmirror.org/files/music/remixes/Mega_Man_7_Seventh_Climb_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3119,'Like a Dream','Dark Souls II','2026-08-19T22:50:59.407970+00:00','https://www.youtube.com/watch?v=mWYMoGQ1PZA',982,'https://ocrmirror.org/files/music/remixes/Dark_Souls_2_Like_a_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3120,'Dreamscapes','Anodyne','2026-08-19T15:57:10.486348+00:00','https://www.youtube.com/watch?v=xknxlZOvBwU',985,'https://ocrmirror.org/files/music/remixes/Anodyne_Dreamscapes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3121,'Laguna Tides','Final Fantasy X','2026-08-20T04:07:06.164362+00:00','https://www.youtube.com/watch?v=sNrz64SnQIA',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Laguna_Tides_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3122,'Girl from Another World','Ultra Street Fighter IV','2026-08-19T23:47:00.763099+00:00','https://www.youtube.com/watch?v=BB5Ni-uz9Hs',983,'https://ocrmirror.org/files/music/remixes/Ultra_Street_Fighter_4_Girl_from_Another_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3123,'Metropolis Pt. 3: Scenes from a Demon Realm','Demon''s Crest','2026-08-20T01:58:47.322872+00:00','https://www.youtube.com/watch?v=4jXxrvbQQ-Y',292,'https://ocrmirror.org/files/music/remixes/Demon''s_Crest_Metropolis_Pt_3_Scenes_from_a_Demon_Realm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3124,'Monsieur Mega','Rockman & Forte','2026-08-19T21:50:35.138431+00:00','https://www.youtube.com/watch?v=BgJsYo9O9DU',308,'https://ocrmirror.org/files/music/remixes/Rockman_&_Forte_Monsieur_Mega_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3125,'Flash Man and the Sorcerer''s Stone Man','Mega Man 2','2026-08-20T08:05:12.260045+00:00','https://www.youtube.com/watch?v=VRrAxi7mnGc',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Flash_Man_and_the_Sorcerer''s_Stone_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3126,'All Aboard the Glitter Express','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-20T01:58:46.084387+00:00','https://www.youtube.com/watch?v=1NVvp7hcQDE',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_All_Aboard_the_Glitter_Express_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3127,'Sakit Chills Out','La-Mulana','2026-08-19T19:49:35.576751+00:00','https://www.youtube.com/watch?v=hZZ5BCWb2wM',986,'https://ocrmirror.org/files/music/remixes/La-Mulana_Sakit_Chills_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3128,'Gentle Oblivion','Monarch: Heroes of a New Age','2026-08-19T22:50:59.832281+00:00','https://www.youtube.com/watch?v=6uDElLIMQkM',988,'https://ocrmirror.org/files/music/remixes/Monarch_Gentle_Oblivion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3129,'The Seven Wise Men Shot First','The Legend of Zelda: A Link to the Past','2026-08-19T23:47:00.391823+00:00','https://www.youtube.com/watch?v=8ySIhxJL2Fg',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Seven_Wise_Men_Shot_First_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3130,'Killer Toe Funk','ToeJam & Earl','2026-08-20T03:23:57.266187+00:00','https://www.youtube.com/watch?v=6PseflpDhpc',99,'https://ocrmirror.org/files/music/remixes/ToeJam_&_Earl_Killer_Toe_Funk_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3131,'Let Strength Be Granted','Demon''s Souls','2026-08-20T15:04:20.155288+00:00','https://www.youtube.com/watch?v=rB_7sxKWfh0',946,'https://ocrmirror.org/files/music/remixes/Demon''s_Souls_Let_Strength_Be_Granted_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3132,'Inter5tellar 5a5uke 5ever','3D Pinball: Space Cadet','2026-08-20T13:26:37.721831+00:00','https://www.youtube.com/watch?v=Bw2db1jxzfs',942,'https://ocrmirror.org/files/music/remixes/3D_Pinball_Space_Cadet_Inter5tellar_5a5uke_5ever_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3133,'Chemical Plant Zone (Subtractive Dispatch Mix)','Sonic the Hedgehog 2','2026-08-20T01:58:45.901919+00:00','https://www.youtube.com/watch?v=z57fSWIX-w8',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Chemical_Plant_Zone_(Subtractive_Dispatch_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3134,'Medieval Rave','Jazz Jackrabbit 2','2026-08-19T23:47:01.577229+00:00','https://www.youtube.com/watch?v=uyaSQimT2dY',506,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_2_Medieval_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3135,'Pizza in the Van','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-20T05:04:02.009001+00:00','https://www.youtube.com/watch?v=4Qu-fAIbkgg',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Pizza_in_the_Van_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3136,'Ninja-Godteri','Zool: Ninja of the "Nth" Dimension','2026-08-19T19:02:13.715606+00:00','https://www.youtube.com/watch?v=EMCQKN5vWuI',8437,'https://ocrmirror.org/files/music/remixes/Zool_Ninja-Godteri_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3137,'Faster Than Rock','FTL: Faster Than Light','2026-08-20T09:59:51.307790+00:00','https://www.youtube.com/watch?v=EXJUJjlG0ls',95033,'https://ocrmirror.org/files/music/remixes/FTL_Faster_Than_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3138,'Guitar for Zanarkand','Final Fantasy X','2026-08-19T21:50:35.317666+00:00','https://www.youtube.com/watch?v=I6jc55zpYbA',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Guitar_for_Zanarkand_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3139,'Helljam','Doom','2026-08-19T21:50:33.888510+00:00','https://www.youtube.com/watch?v=hqRSmXcSAKM',14512,'https://ocrmirror.org/files/music/remixes/Doom_Helljam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3140,'Culminating Domination','Final Fantasy II','2026-08-20T03:23:56.906026+00:00','https://www.youtube.com/watch?v=QvfVhix6Hto',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Culminating_Domination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3141,'The Narshemellow','Final Fantasy VI','2026-08-20T07:22:11.762118+00:00','https://www.youtube.com/watch?v=XFtTeqdpn4I',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Narshemellow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3142,'A Stormy Affair','The Legend of Zelda: Ocarina of Time','2026-08-20T04:07:05.814365+00:00','https://www.youtube.com/watch?v=_meOo1rtULI',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_A_Stormy_Affair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3143,'M-COR Rising','Titanfall','2026-08-19T16:55:26.104678+00:00','https://www.youtube.com/watch?v=Gg-nIDdXXNU',95030,'https://ocrmirror.org/files/music/remixes/Titanfall_M-COR_Rising_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3144,'Signs of Lust','Gunbird 2','2026-08-19T20:53:54.723796+00:00','https://www.youtube.com/watch?v=xkcRCJ4xioY',13271,'https://ocrmirror.org/files/music/remixes/Gunbird_2_Signs_of_Lust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3145,'Fleaman''s Groove','Castlevania','2026-08-19T20:53:56.024118+00:00','https://www.youtube.com/watch?v=e3HYwBJ_fyI',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Fleaman''s_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3146,'Preluematsude','Final Fantasy II','2026-08-20T07:22:10.946925+00:00','https://www.youtube.com/watch?v=QX60kko_lN0',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Preluematsude_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3147,'Rebel Dream','Final Fantasy II','2026-08-20T08:05:12.084446+00:00','https://www.youtube.com/watch?v=7ayq366jA8I',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Rebel_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3148,'The Last March','Final Fantasy II','2026-08-19T20:53:56.185432+00:00','https://www.youtube.com/watch?v=DulJ3dYQIOA',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_The_Last_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3149,'the final WON','Final Fantasy I & II: Dawn of Souls','2026-08-20T09:05:09.429370+00:00','https://www.youtube.com/watch?v=U5Nu8ybN13U',821,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_1_&_2_Dawn_of_Souls_the_final_WON_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3150,'Heroes of Dawn','Final Fantasy III','2026-08-20T03:23:57.977877+00:00','https://www.youtube.com/watch?v=qg8kBMPDbb0',10,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_3_Heroes_of_Dawn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3151,'Rebellion','Final Fantasy II','2026-08-20T11:53:00.175717+00:00','https://www.youtube.com/watch?v=nU06ttrbqcM',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Rebellion_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3152,'Icebreaker','Sonic the Hedgehog 3','2026-08-20T04:07:06.340186+00:00','https://www.youtube.com/watch?v=60YY9BToETM',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Icebreaker_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3153,'There''s Nothing Like Flying','Final Fantasy VI','2026-08-20T05:56:24.920669+00:00','https://www.youtube.com/watch?v=OankmIq-Twk',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_There''s_Nothing_Like_Flying_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3154,'Harder Than Steel','Mega Man 3','2026-08-20T09:05:08.730327+00:00','https://www.youtube.com/watch?v=UYZ1_I_wG9U',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Harder_Than_Steel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3155,'Marble Clouds in Azure Skies','Sonic the Hedgehog 3','2026-08-20T05:56:24.386216+00:00','https://www.youtube.com/watch?v=G9JrVckuxYE',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Marble_Clouds_in_Azure_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3156,'Smash Superstars','Super Smash Bros. Melee','2026-08-20T03:23:57.621730+00:00','https://www.youtube.com/watch?v=IaOK8V8C4JU',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Smash_Superstars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3158,'Imperial Rapture','Final Fantasy II','2026-08-20T01:58:47.499140+00:00','https://www.youtube.com/watch?v=wzByfF74cms',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Imperial_Rapture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3159,'Analog Freedom','Final Fantasy II','2026-08-20T08:05:11.908674+00:00','https://www.youtube.com/watch?v=HNaJAlPygRY',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Analog_Freedom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3160,'Grind My Crank','Final Fantasy II','2026-08-20T09:59:50.782137+00:00','https://www.youtube.com/watch?v=SJLbUBpGSi8',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_Grind_My_Crank_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3161,'A Kingdom Fallen','Final Fantasy II','2026-08-20T03:23:57.087554+00:00','https://www.youtube.com/watch?v=zdOfmWeO3QQ',241,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_2_A_Kingdom_Fallen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3162,'Chipped Bone','Mega Man 4','2026-08-19T23:47:00.042678+00:00','https://www.youtube.com/watch?v=P-XmIO8ufK4',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Chipped_Bone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3163,'Dash Cancel','Ultra Street Fighter IV','2026-08-20T01:58:46.261100+00:00','https://www.youtube.com/watch?v=LSkPdl43nNw',983,'https://ocrmirror.org/files/music/remixes/Ultra_Street_Fighter_4_Dash_Cancel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3164,'It''s Okay, I Still Made Money','Divekick','2026-08-19T22:50:59.620973+00:00','https://www.youtube.com/watch?v=3mZ_hT7oWX4',95039,'https://ocrmirror.org/files/music/remixes/Divekick_It''s_Okay_I_Still_Made_Money_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3165,'Kuro Yuki','Persona 4 Arena','2026-08-19T23:47:00.208721+00:00','https://www.youtube.com/watch?v=7ozoMy2xQmo',823,'https://ocrmirror.org/files/music/remixes/Persona_4_Arena_Kuro_Yuki_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3166,'Finding Somebody to Love in This Meager World','Final Fantasy Tactics','2026-08-20T13:26:37.199481+00:00','https://www.youtube.com/watch?v=kU3sdLa9t1k',279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Tactics_Finding_Somebody_to_Love_in_This_Meager_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3167,'Final Fantasy Forest Medley','Final Fantasy XII','2026-08-20T13:26:37.373924+00:00','https://www.youtube.com/watch?v=UW55JTZirdU',525,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_12_Final_Fantasy_Forest_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3168,'The Guru','The Legend of Zelda: Ocarina of Time','2026-08-20T15:04:19.265618+00:00','https://www.youtube.com/watch?v=O_ce06iOGQA',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_The_Guru_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3169,'Blue Blur Your Brain','Sonic Adventure 2','2026-08-20T07:22:11.273400+00:00','https://www.youtube.com/watch?v=xWQeCnl1-0w',277,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_2_Blue_Blur_Your_Brain_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3171,'Dark Horizons','The Legend of Zelda: A Link to the Past','2026-08-20T11:53:00.587395+00:00','https://www.youtube.com/watch?v=6Vb_uA0Xvn8',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_Horizons_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3172,'Catch Me','Shovel Knight','2026-08-20T09:59:51.481618+00:00','https://www.youtube.com/watch?v=M0Zw4VqkNEo',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_Catch_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3173,'Cyber Mower','The Lawnmower Man','2026-08-20T05:04:02.359853+00:00','https://www.youtube.com/watch?v=0f4iZi7IIa0',11134,'https://ocrmirror.org/files/music/remixes/Lawnmower_Man_Cyber_Mower_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3174,'Deep Red','Super Metroid','2026-08-19T21:50:33.705628+00:00','https://www.youtube.com/watch?v=ysv5Aew2-Kk',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Deep_Red_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3175,'Dreamin'' of Them Funky Ripples!','Kirby''s Dream Land 3','2026-08-19T23:47:01.251519+00:00','https://www.youtube.com/watch?v=_D4nWrbdsPE',11121,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_3_Dreamin''_of_Them_Funky_Ripples_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3176,'Kaikuluotain','Batman','2026-08-20T04:07:05.989393+00:00','https://www.youtube.com/watch?v=Ocqs3h_iJo4',921,'https://ocrmirror.org/files/music/remixes/Batman_Kaikuluotain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3177,'A Doctor You Can Trust','Dr. Mario','2026-08-20T17:55:50.128628+00:00','https://www.youtube.com/watch?v=Nr7bn4xEvqI',491,'https://ocrmirror.org/files/music/remixes/Dr_Mario_A_Doctor_You_Can_Trust_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3178,'Where''s the Wall Chicken At?','Akumajo Dracula X: Nocturne in the Moonlight','2026-08-20T05:04:03.061418+00:00','https://www.youtube.com/watch?v=4p2_mjWR9QE',939,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_X_Nocturne_in_the_Moonlight_Where''s_the_Wall_Chicken_At_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3181,'Xoldin'' Out for a Xero','Xenon','2026-08-20T05:56:24.208601+00:00','https://www.youtube.com/watch?v=nWmnVL5I1e0',8417,'https://ocrmirror.org/files/music/remixes/Xenon_Xoldin''_Out_for_a_Xero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3182,'Cáemm elaine luned','The Witcher 2: Assassins of Kings','2026-08-20T07:22:11.924737+00:00','https://www.youtube.com/watch?v=5GkisGy2eI8',95050,'https://ocrmirror.org/files/music/remixes/Witcher_2_Caemm_elaine_luned_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3183,'Dire on the Rocks','Super Mario 64','2026-08-20T15:58:33.330798+00:00','https://www.youtube.com/watch?v=63o8TPlJRxQ',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Dire_on_the_Rocks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3184,'Bull in a China Shop','Super Smash Bros. Melee','2026-08-20T09:05:07.852952+00:00','https://www.youtube.com/watch?v=NTDLe8YuvA4',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Bull_in_a_China_Shop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3185,'Timewarp','Chrono Cross','2026-08-20T15:04:20.509379+00:00','https://www.youtube.com/watch?v=DBefUnKOXws',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Timewarp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3186,'Sword of Sand','The Legend of Zelda: Phantom Hourglass','2026-08-20T09:05:08.905194+00:00','https://www.youtube.com/watch?v=ojyz_-N5oJM',38825,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Phantom_Hourglass_Sword_of_Sand_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3187,'Flow of Time','Chrono Trigger','2026-08-20T09:59:50.958347+00:00','https://www.youtube.com/watch?v=wLW1ywZgdik',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Flow_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3188,'Temple of the Omnisword','Touhou Fuujinroku: Mountain of Faith','2026-08-20T05:04:02.535418+00:00','https://www.youtube.com/watch?v=Y5ZE7bYxDSo',51885,'https://ocrmirror.org/files/music/remixes/Touhou_Fuujinroku_Mountain_of_Faith_Temple_of_the_Omnisword_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3189,'Never Go Away','Metal Gear Solid','2026-08-20T14:08:31.017899+00:00','https://www.youtube.com/watch?v=fQeB84cnbjM',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_Never_Go_Away_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3190,'Back to Zebes','Metroid','2026-08-20T07:22:11.110877+00:00','https://www.youtube.com/watch?v=pVgRB32BFyU',73,'https://ocrmirror.org/files/music/remixes/Metroid_Back_to_Zebes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3191,'The Champion','Kunio Kun no Nekketsu Soccer League','2026-08-20T04:07:07.039525+00:00','https://www.youtube.com/watch?v=tSbcYAcqHM0',900,'https://ocrmirror.org/files/music/remixes/Kunio_Kun_no_Nekketsu_Soccer_League_The_Champion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3192,'Gestahlian Sonata','Final Fantasy VI','2026-08-20T15:04:19.089031+00:00','https://www.youtube.com/watch?v=FfTeF4frfzk',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Gestahlian_Sonata_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3193,'Sunken Ship','Super Mario 64','2026-08-19T22:51:00.186463+00:00','https://www.youtube.com/watch?v=ivlIyMOnhd4',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Sunken_Ship_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3194,'Windmill Advisory','Donkey Kong Country: Tropical Freeze','2026-08-20T10:56:44.754576+00:00','https://www.youtube.com/watch?v=2WMVDPuBR4Q',94869,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Tropical_Freeze_Windmill_Advisory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3195,'Make Who React Her','Final Fantasy VII','2026-08-20T09:59:51.655242+00:00','https://www.youtube.com/watch?v=q16GGczEkuA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Make_Who_React_Her_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3196,'Ruinous Ruins!','Sonic the Hedgehog 2','2026-08-20T09:05:09.254663+00:00','https://www.youtube.com/watch?v=b2ZKie8UiJo',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Ruinous_Ruins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3197,'Fire Still Burns in My Frozen Heart','Ys III: Wanderers from Ys','2026-08-19T23:47:01.415395+00:00','https://www.youtube.com/watch?v=2PwePPDMuZg',4587,'https://ocrmirror.org/files/music/remixes/Ys_3_Fire_Still_Burns_in_My_Frozen_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3198,'Sierra-117','Halo: Combat Evolved','2026-08-20T09:05:08.207475+00:00','https://www.youtube.com/watch?v=WW_B0fYZVBI',393,'https://ocrmirror.org/files/music/remixes/Halo_Sierra-117_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3199,'Chasing Waterfalls','Donkey Kong Country 3','2026-08-20T05:04:01.656988+00:00','https://www.youtube.com/watch?v=oPeKNQZR_B4',683,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Chasing_Waterfalls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3200,'Drowning in Iron Oxide','Super Metroid','2026-08-20T09:59:51.136157+00:00','https://www.youtube.com/watch?v=gY67qV1sEo8',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Drowning_in_Iron_Oxide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3201,'Storm Force Seven','The Legend of Zelda: Ocarina of Time','2026-08-20T11:53:00.034818+00:00','https://www.youtube.com/watch?v=tYEhf2hFVD4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Storm_Force_Seven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3202,'Together, We Fly','Super Smash Bros. Melee','2026-08-20T11:52:59.897060+00:00','https://www.youtube.com/watch?v=Fy7O5NrKjDA',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Together_We_Fly_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3203,'Ocean Lanterns','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-20T17:00:29.021139+00:00','https://www.youtube.com/watch?v=kzn-7iZusBo',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Ocean_Lanterns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3204,'Miles and Miles Away','Final Fantasy IX','2026-08-20T11:53:00.449433+00:00','https://www.youtube.com/watch?v=uneAfxl8e3o',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Miles_and_Miles_Away_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3205,'Late Night Lindblum','Final Fantasy IX','2026-08-20T05:04:01.834742+00:00','https://www.youtube.com/watch?v=wPDQTZm2DmI',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Late_Night_Lindblum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3206,'Birth Under a Blue Light','Final Fantasy IX','2026-08-20T05:56:24.031820+00:00','https://www.youtube.com/watch?v=b4vuQjA1unQ',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Birth_Under_a_Blue_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3207,'Four Score and Six-Eight','Final Fantasy IX','2026-08-20T13:26:36.500195+00:00','https://www.youtube.com/watch?v=XvIN4AXyqsc',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Four_Score_and_Six-Eight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3209,'Ground Zero','Final Fantasy IX','2026-08-20T09:59:50.600205+00:00','https://www.youtube.com/watch?v=k1po6ViG5-U',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Ground_Zero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3210,'Crystalline Tempest','Final Fantasy IX','2026-08-20T08:05:12.436604+00:00','https://www.youtube.com/watch?v=IijLbKcwrbo',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Crystalline_Tempest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3211,'Bibliotheca ~ Dreamer in the Library','Final Fantasy IX','2026-08-20T14:08:30.839543+00:00','https://www.youtube.com/watch?v=DonpPhX24F8',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Bibliotheca_Dreamer_in_the_Library_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3212,'Zero World','Final Fantasy IX','2026-08-20T15:04:19.799102+00:00','https://www.youtube.com/watch?v=mrmuqDj_exw',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Zero_World_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3213,'Shiitake Kingdom','Super Mario Bros. 2','2026-08-20T09:05:09.079891+00:00','https://www.youtube.com/watch?v=xcW1It_ZW7M',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Shiitake_Kingdom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3214,'Psy Castle','Super Mario World','2026-08-20T14:08:30.660573+00:00','https://www.youtube.com/watch?v=qJnMx1voqgc',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Psy_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3215,'Toadstool''s Groove','Super Mario 64','2026-08-20T13:26:36.675335+00:00','https://www.youtube.com/watch?v=w2ZAsvzL4vM',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Toadstool''s_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3216,'To the Stars','Super Mario Galaxy','2026-08-20T15:04:19.621390+00:00','https://www.youtube.com/watch?v=xii-VZmfhvQ',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_To_the_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3217,'happy breakfast','Super Mario Kart','2026-08-20T17:55:49.679974+00:00','https://www.youtube.com/watch?v=xTSfhD43oNU',269,'https://ocrmirror.org/files/music/remixes/Super_Mario_Kart_happy_breakfast_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3218,'A Blue-Green Color','Sonic the Hedgehog','2026-08-20T11:53:00.860252+00:00','https://www.youtube.com/watch?v=z8fUMXP106g',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_A_Blue-Green_Color_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3219,'Sailing on Lava','Sonic the Hedgehog','2026-08-20T09:05:08.032989+00:00','https://www.youtube.com/watch?v=dDx_BgpOuKU',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Sailing_on_Lava_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3220,'Forest Glade','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-20T09:59:52.180952+00:00','https://www.youtube.com/watch?v=eMN-HFZMaKc',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Forest_Glade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3221,'Ominous Waltz','Xenogears','2026-08-20T05:04:01.478724+00:00','https://www.youtube.com/watch?v=NogoeJswaWE',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Ominous_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3222,'Only in Novels','Deus Ex','2026-08-20T03:23:58.156802+00:00','https://www.youtube.com/watch?v=ni7AWwwQBtM',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Only_in_Novels_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3223,'The Other Side','The Legend of Zelda: Twilight Princess','2026-08-20T05:56:25.274657+00:00','https://www.youtube.com/watch?v=lMYBhsQ0krw',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_The_Other_Side_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3224,'The Depetrification of the Submerged Forest','Chrono Trigger','2026-08-20T17:00:28.662953+00:00','https://www.youtube.com/watch?v=H3HWIM32JNs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Depetrification_of_the_Submerged_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3225,'Contrapuntal Field','Fittest','2026-08-20T09:59:51.828191+00:00','https://www.youtube.com/watch?v=QrwWbZX1igs',594,'https://ocrmirror.org/files/music/remixes/Fittest_Contrapuntal_Field_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3226,'Enter the Illusion','Illusion City','2026-08-20T17:00:29.197272+00:00','https://www.youtube.com/watch?v=OAVbr9Wk0Dw',3848,'https://ocrmirror.org/files/music/remixes/Illusion_City_Enter_the_Illusion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3227,'Intercept','Freedom Planet','2026-08-20T05:56:23.854806+00:00','https://www.youtube.com/watch?v=Ri81M3ESYks',95032,'https://ocrmirror.org/files/music/remixes/Freedom_Planet_Intercept_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3228,'AY YO','Cybernoid: The Fighting Machine','2026-08-20T07:22:11.435877+00:00','https://www.youtube.com/watch?v=vbIQAm_pkfo',18760,'https://ocrmirror.org/files/music/remixes/Cybernoid_AY_YO_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3229,'Ushas'' Dark Gift','Uşas','2026-08-20T05:56:23.672738+00:00','https://www.youtube.com/watch?v=90jLNuVf_uY',4164,'https://ocrmirror.org/files/music/remixes/Usas_Ushas''_Dark_Gift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3230,'ADA','Zone of the Enders: The 2nd Runner','2026-08-20T10:56:44.398471+00:00','https://www.youtube.com/watch?v=vShp9mD2UPE',10825,'https://ocrmirror.org/files/music/remixes/Zone_of_the_Enders_The_2nd_Runner_ADA_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3231,'Battle Aboard the Galleon','Donkey Kong Country','2026-08-20T08:05:12.788477+00:00','https://www.youtube.com/watch?v=6RBaE-mp_2A',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Battle_Aboard_the_Galleon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3232,'My Monkey Drives a Maserati','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-20T17:55:49.906378+00:00','https://www.youtube.com/watch?v=pTTomWj-tNw',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_My_Monkey_Drives_a_Maserati_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3233,'A Mystic Lineage','Freedom Planet','2026-08-20T15:58:33.146275+00:00','https://www.youtube.com/watch?v=e0x6Et1fryE',95032,'https://ocrmirror.org/files/music/remixes/Freedom_Planet_A_Mystic_Lineage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3234,'To Endor','Dragon Warrior IV','2026-08-20T15:58:33.927112+00:00','https://www.youtube.com/watch?v=cCMviHKpntM',422,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_4_To_Endor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3235,'Gambling Nights','Sonic the Hedgehog 2','2026-08-20T04:07:05.635961+00:00','https://www.youtube.com/watch?v=ewpEoJLlKdE',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Gambling_Nights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3236,'Ragnarok','Xenogears','2026-08-20T11:53:00.312670+00:00','https://www.youtube.com/watch?v=uv65i36ZtvI',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Ragnarok_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3237,'Miljoonamiehen Muistelmat','Mega Man II','2026-08-20T09:05:08.382143+00:00','https://www.youtube.com/watch?v=c1zvJ5L5jCI',764,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Miljoonamiehen_Muistelmat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3238,'Abandoned by God','Demon''s Souls','2026-08-20T07:22:12.250791+00:00','https://www.youtube.com/watch?v=_2hwXP8XrMo',946,'https://ocrmirror.org/files/music/remixes/Demon''s_Souls_Abandoned_by_God_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3240,'The End of Madness','Guild Wars 2','2026-08-20T09:59:52.003529+00:00','https://www.youtube.com/watch?v=kP4_4HserQM',948,'https://ocrmirror.org/files/music/remixes/Guild_Wars_2_The_End_of_Madness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3241,'Honour, Pride, Green Tea','Final Fantasy VII','2026-08-20T15:04:19.976673+00:00','https://www.youtube.com/watch?v=AmbuFUKwG8M',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Honour_Pride_Green_Tea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3242,'Because Eels','Street Fighter II: The World Warrior','2026-08-20T10:56:44.043349+00:00','https://www.youtube.com/watch?v=geTOlF1K_iM',11375,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Because_Eels_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3244,'Don''t Go','The Walking Dead: Season One','2026-08-20T09:05:08.556337+00:00','https://www.youtube.com/watch?v=NHSG7gTA9pw',930,'https://ocrmirror.org/files/music/remixes/Walking_Dead_Season_One_Don''t_Go_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3245,'Digital Horrors','System Shock','2026-08-20T07:22:10.776161+00:00','https://www.youtube.com/watch?v=KdnrexRH-Zw',16825,'https://ocrmirror.org/files/music/remixes/System_Shock_Digital_Horrors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3247,'Heart of Limestone','Super Castlevania IV','2026-08-20T14:08:31.553366+00:00','https://www.youtube.com/watch?v=WlA2Cn4T1Mc',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Heart_of_Limestone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3248,'Whipped into Shape','Super Castlevania IV','2026-08-20T14:08:31.196656+00:00','https://www.youtube.com/watch?v=XOxI-Qi8NZA',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Whipped_into_Shape_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3249,'The Harbinger of Death','Super Castlevania IV','2026-08-20T14:08:30.481850+00:00','https://www.youtube.com/watch?v=zZPn4PdEwLA',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_The_Harbinger_of_Death_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3250,'Dark Cellar','Super Castlevania IV','2026-08-20T08:05:12.964526+00:00','https://www.youtube.com/watch?v=mLdfViCbN34',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Dark_Cellar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3251,'The Night King''s Lament','Super Castlevania IV','2026-08-20T17:00:29.553085+00:00','https://www.youtube.com/watch?v=mcU2zVHLzfw',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_The_Night_King''s_Lament_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3252,'How Many Heavens Are There?','Final Fantasy VII','2026-08-20T19:09:43.182339+00:00','https://www.youtube.com/watch?v=kOBgkmD9Q5w',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_How_Many_Heavens_Are_There_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3253,'Dungeons to Explore','The Legend of Zelda: A Link to the Past','2026-08-20T08:05:11.550673+00:00','https://www.youtube.com/watch?v=GUjXgz8pNCU',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dungeons_to_Explore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3254,'Passing Through History','Chrono Cross','2026-08-20T10:56:45.110346+00:00','https://www.youtube.com/watch?v=GMRDzr3j014',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Passing_Through_History_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3255,'Coming Darkness','Chrono Trigger','2026-08-20T17:00:29.732626+00:00','https://www.youtube.com/watch?v=0PFx8AYmA1w',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Coming_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3256,'Seven Pipes to Heaven','Super Mario Land','2026-08-20T20:56:04.125743+00:00','https://www.youtube.com/watch?v=adiLSesBGNs',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Seven_Pipes_to_Heaven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3257,'Larry','Leisure Suit Larry in the Land of the Lounge Lizards','2026-08-20T15:58:34.285688+00:00','https://www.youtube.com/watch?v=r5eIAdTCjwo',535,'https://ocrmirror.org/files/music/remixes/Leisure_Suit_Larry_in_the_Land_of_the_Lounge_Lizards_Larry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3258,'If You Believe','Mother','2026-08-20T23:50:17.901821+00:00','https://www.youtube.com/watch?v=Gl7KR1SsY_8',4289,'https://ocrmirror.org/files/music/remixes/Mother_If_You_Believe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3259,'Motion Sickness','Portal 2','2026-08-20T08:05:13.140390+00:00','https://www.youtube.com/watch?v=3WKwj0ZR5MU',826,'https://ocrmirror.org/files/music/remixes/Portal_2_Motion_Sickness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3261,'Kodoku','Dark Souls II','2026-08-20T13:26:37.548550+00:00','https://www.youtube.com/watch?v=EeBdxasnG6E',982,'https://ocrmirror.org/files/music/remixes/Dark_Souls_2_Kodoku_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3262,'Soggy Carousel','The Legend of Zelda: Ocarina of Time','2026-08-20T14:08:30.303721+00:00','https://www.youtube.com/watch?v=P-33W1QG1K0',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Soggy_Carousel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3263,'Caravan Bowser','Super Mario 3D World','2026-08-20T22:54:43.523431+00:00','https://www.youtube.com/watch?v=WpBiI49_lHI',94861,'https://ocrmirror.org/files/music/remixes/Super_Mario_3D_World_Caravan_Bowser_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3264,'2D Beat','Super Mario 3D Land','2026-08-20T13:26:36.323332+00:00','https://www.youtube.com/watch?v=qQQa6YdPc4k',94802,'https://ocrmirror.org/files/music/remixes/Super_Mario_3D_Land_2D_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3265,'Koopa Reaper','Super Mario World','2026-08-20T20:56:04.483114+00:00','https://www.youtube.com/watch?v=tx6ZSCvKbY8',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Koopa_Reaper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3266,'It''s-a-Me','Super Mario World','2026-08-20T19:54:50.259563+00:00','https://www.youtube.com/watch?v=roQVTEvCvks',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_It''s-a-Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3267,'Golden Flowers','Undertale','2026-08-21T02:07:16.222843+00:00','https://www.youtube.com/watch?v=rDmjEejUmEU',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Golden_Flowers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3268,'Super Skeet Fighter Turbo Alphamale IV','Street Fighter Alpha: Warriors'' Dreams','2026-08-20T23:50:17.769242+00:00','https://www.youtube.com/watch?v=KdoJZ5EL4pM',875,'https://ocrmirror.org/files/music/remixes/Street_Fighter_Alpha_Super_Skeet_Fighter_Turbo_Alphamale_IV_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3269,'Choose Your Character!','Super Smash Bros. Melee','2026-08-20T23:50:18.034744+00:00','https://www.youtube.com/watch?v=A6hlsSQ9MTk',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Choose_Your_Character_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3270,'New Horizons','Pokémon Gold Version','2026-08-20T22:54:43.345395+00:00','https://www.youtube.com/watch?v=R6B4JQR_bpM',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_New_Horizons_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3271,'Deadly Furniture','Super Castlevania IV','2026-08-20T15:04:20.332417+00:00','https://www.youtube.com/watch?v=NqIZX57L9fk',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Deadly_Furniture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3272,'Very... Very Wrong Castle','Super Mario World','2026-08-20T19:54:49.372335+00:00','https://www.youtube.com/watch?v=eADeDwHcPmo',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Very_Very_Wrong_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3273,'Tibetan Tussle','Dungeonmans','2026-08-20T17:00:29.375388+00:00','https://www.youtube.com/watch?v=bvAxhQkWph4',971,'https://ocrmirror.org/files/music/remixes/Dungeonmans_Tibetan_Tussle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3274,'Orbital Space Junk','Clystron','2026-08-20T10:56:43.683443+00:00','https://www.youtube.com/watch?v=9oxkF-JwRIQ',33306,'https://ocrmirror.org/files/music/remixes/Clystron_Orbital_Space_Junk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3275,'Aliens in My Waterfall!','Contra','2026-08-20T19:54:50.435914+00:00','https://www.youtube.com/watch?v=wsfJDSAjIX8',21,'https://ocrmirror.org/files/music/remixes/Contra_Aliens_in_My_Waterfall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3276,'Madcap Magma','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-20T19:54:49.905183+00:00','https://www.youtube.com/watch?v=_e_Y_-twWTQ',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Madcap_Magma_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3277,'stratification','Chrono Trigger','2026-08-21T05:57:29.240692+00:00','https://www.youtube.com/watch?v=N2MT7nzH_NY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_stratification_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3278,'Ripples','Super Castlevania IV','2026-08-20T21:53:20.812420+00:00','https://www.youtube.com/watch?v=k31Qx1UxPGs',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Ripples_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3279,'Ignus','Drakengard 3','2026-08-20T13:26:37.026369+00:00','https://www.youtube.com/watch?v=NSKOdePC72Q',95061,'https://ocrmirror.org/files/music/remixes/Drakengard_3_Ignus_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3280,'One Wintersday Night','Guild Wars 2','2026-08-20T10:56:44.576883+00:00','https://www.youtube.com/watch?v=zoZJ1HNUvjM',948,'https://ocrmirror.org/files/music/remixes/Guild_Wars_2_One_Wintersday_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3281,'Prayer for the Azure Waters','Aquaria','2026-08-20T20:56:03.946749+00:00','https://www.youtube.com/watch?v=FGro2RlKYoA',585,'https://ocrmirror.org/files/music/remixes/Aquaria_Prayer_for_the_Azure_Waters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3282,'Frosty Britches','Super Mario 64','2026-08-21T05:04:16.391778+00:00','https://www.youtube.com/watch?v=xEgRZd05JrQ',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Frosty_Britches_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3283,'Chaotic 5','Knuckles'' Chaotix','2026-08-20T17:55:50.017543+00:00','https://www.youtube.com/watch?v=0gRa2WdkUs8',239,'https://ocrmirror.org/files/music/remixes/Knuckles''_Chaotix_Chaotic_5_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3284,'Apollo Duck','DuckTales','2026-08-21T05:04:15.909034+00:00','https://www.youtube.com/watch?v=KfmiPl4oPiQ',50,'https://ocrmirror.org/files/music/remixes/DuckTales_Apollo_Duck_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3285,'Bimmy Whatchu Got','Double Dragon','2026-08-20T21:53:19.924171+00:00','https://www.youtube.com/watch?v=9s1SzChefrA',318,'https://ocrmirror.org/files/music/remixes/Double_Dragon_Bimmy_Whatchu_Got_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3286,'Katumus','Final Fantasy X','2026-08-20T10:56:45.288055+00:00','https://www.youtube.com/watch?v=MedSQ0f8wNA',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Katumus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3287,'Darker Than Black','Sonic Rush','2026-08-20T19:54:49.728009+00:00','https://www.youtube.com/watch?v=omqIt_AjdGM',38902,'https://ocrmirror.org/files/music/remixes/Sonic_Rush_Darker_Than_Black_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3288,'Once More ~A Last TIME~','The Legend of Zelda: Ocarina of Time','2026-08-20T11:53:00.724061+00:00','https://www.youtube.com/watch?v=Ess29eUJYhA',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Once_More_A_Last_TIME_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3289,'Dreamcatcher','NiGHTS into dreams...','2026-08-20T15:58:33.746818+00:00','https://www.youtube.com/watch?v=HNzhzfq6TAo',136,'https://ocrmirror.org/files/music/remixes/NiGHTS_into_dreams_Dreamcatcher_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3290,'Aquatic Shrediance','Donkey Kong Country','2026-08-20T21:53:19.740883+00:00','https://www.youtube.com/watch?v=-33_lJEwMwE',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Aquatic_Shrediance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3291,'Советский Космонавт','Street Fighter II: The World Warrior','2026-08-20T22:54:43.166706+00:00','https://www.youtube.com/watch?v=-xh6OLmyKR0',11375,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Cobetcknn_Kocmohabt_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3292,'Holding Hands','Final Fantasy VII','2026-08-21T05:04:16.022344+00:00','https://www.youtube.com/watch?v=sUjemTes8sA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Holding_Hands_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3293,'Mechanical Salvation','Akumajo Dracula X: Rondo of Blood','2026-08-20T19:54:50.612604+00:00','https://www.youtube.com/watch?v=3WN1Hd9caDI',112,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_X_Rondo_of_Blood_Mechanical_Salvation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3294,'Big Boo Badman','Super Mario World','2026-08-20T20:56:03.769134+00:00','https://www.youtube.com/watch?v=vI9d034xrMU',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Big_Boo_Badman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3295,'An Angel''s Wish for the Forest','Secret of Mana','2026-08-20T15:58:33.515153+00:00','https://www.youtube.com/watch?v=tL5HGLtTuFs',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_An_Angel''s_Wish_for_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3296,'La Gran Fuente de Salsa','The Legend of Zelda: Ocarina of Time','2026-08-20T15:04:19.443335+00:00','https://www.youtube.com/watch?v=xUandXQxEIY',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_La_Gran_Fuente_de_Salsa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3297,'The Jazzassin','Mega Man 3','2026-08-21T02:07:15.533899+00:00','https://www.youtube.com/watch?v=NCcbCL_0Vm4',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_The_Jazzassin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3298,'''Vators Gonna Bait','Tiny Barbarian DX','2026-08-20T10:56:44.221604+00:00','https://www.youtube.com/watch?v=JxIikhJt2Rw',95083,'https://ocrmirror.org/files/music/remixes/Tiny_Barbarian_DX_''Vators_Gonna_Bait_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3299,'Flight of Rock','Mega Man 4','2026-08-20T11:52:59.619824+00:00','https://www.youtube.com/watch?v=8Si7LUQHl10',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Flight_of_Rock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3300,'Into the Funk of It','Secret of Mana','2026-08-21T02:07:15.878657+00:00','https://www.youtube.com/watch?v=E9pDjBOwtYw',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Into_the_Funk_of_It_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3301,'Red Barrage Aquarium','Sonic Adventure','2026-08-21T05:57:30.523872+00:00','https://www.youtube.com/watch?v=-7P-KfdmUtY',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_Red_Barrage_Aquarium_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3302,'Big Brute Force of Nature','Mega Man 9','2026-08-20T11:52:59.759232+00:00','https://www.youtube.com/watch?v=-pHHdrlbF1w',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Big_Brute_Force_of_Nature_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3303,'Spunktastic','Sonic the Hedgehog 2','2026-08-20T19:09:41.953214+00:00','https://www.youtube.com/watch?v=MH9fe0aJ9EI',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Spunktastic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3304,'Ballad on the Sea','The Legend of Zelda: The Wind Waker','2026-08-20T19:09:42.478797+00:00','https://www.youtube.com/watch?v=bD8ix9dARKw',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Ballad_on_the_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3306,'Footprints on Zebes','Metroid','2026-08-21T03:29:10.917989+00:00','https://www.youtube.com/watch?v=K_qRKUMyjHc',73,'https://ocrmirror.org/files/music/remixes/Metroid_Footprints_on_Zebes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3307,'Trouble in Japan','Double Dragon III: The Sacred Stones','2026-08-20T23:50:17.503185+00:00','https://www.youtube.com/watch?v=r7R4K0C49Cg',439,'https://ocrmirror.org/files/music/remixes/Double_Dragon_3_Trouble_in_Japan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3308,'The Imprisoning War','The Legend of Zelda: A Link to the Past','2026-08-20T21:53:20.280387+00:00','https://www.youtube.com/watch?v=Uj9rnRy349E',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Imprisoning_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3309,'Glow Worm Jim','Earthworm Jim 2','2026-08-20T19:09:42.828569+00:00','https://www.youtube.com/watch?v=Dkq1ELYQqbk',189,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_2_Glow_Worm_Jim_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3310,'Reconstructing Lemons','Portal 2','2026-08-20T19:54:50.789261+00:00','https://www.youtube.com/watch?v=WyZh_Nxu7rM',826,'https://ocrmirror.org/files/music/remixes/Portal_2_Reconstructing_Lemons_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3311,'Stepping Out','Final Fantasy IV','2026-08-20T13:26:36.144137+00:00','https://www.youtube.com/watch?v=dRc6RvaDIbY',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Stepping_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3312,'The Nightmare Ends','Bloodborne','2026-08-20T19:09:42.653317+00:00','https://www.youtube.com/watch?v=REA9rhThLi4',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_The_Nightmare_Ends_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3313,'Zeromus Sum Game','Final Fantasy IV','2026-08-20T15:58:32.776345+00:00','https://www.youtube.com/watch?v=rsDtK2OHFkY',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Zeromus_Sum_Game_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3314,'Fortress of Doom','Super Mario World','2026-08-20T14:08:30.122526+00:00','https://www.youtube.com/watch?v=48QZ52atYCE',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Fortress_of_Doom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3315,'Mad Jack''s Drop','Donkey Kong 64','2026-08-20T17:55:49.793193+00:00','https://www.youtube.com/watch?v=zpBEuzLOrpU',2955,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_64_Mad_Jack''s_Drop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3316,'Become Death','VectorMan','2026-08-21T02:07:16.051021+00:00','https://www.youtube.com/watch?v=Y1Wps1CY6QQ',173,'https://ocrmirror.org/files/music/remixes/Vectorman_Become_Death_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3317,'Monument of Non-Existence','Final Fantasy VI','2026-08-20T17:55:49.567808+00:00','https://www.youtube.com/watch?v=LUZH7gvoctw',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Monument_of_Non-Existence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3318,'Frozen Fantasie','Kirby Air Ride','2026-08-20T13:26:36.850886+00:00','https://www.youtube.com/watch?v=GOUS-FdHauM',7334,'https://ocrmirror.org/files/music/remixes/Kirby_Air_Ride_Frozen_Fantasie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3319,'Comeback of the Green Rabbit','Jazz Jackrabbit','2026-08-20T15:58:32.592786+00:00','https://www.youtube.com/watch?v=f6uzi6XMqvI',15244,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_Comeback_of_the_Green_Rabbit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3320,'Crescendo to Chaos','Pokémon Red Version','2026-08-20T23:50:17.637149+00:00','https://www.youtube.com/watch?v=F-6gabCJbRk',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Crescendo_to_Chaos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3321,'Life of a Bowling Pin','The Legend of Zelda: Twilight Princess','2026-08-20T17:00:28.842445+00:00','https://www.youtube.com/watch?v=nJYdKl7BTTM',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Life_of_a_Bowling_Pin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3323,'Aerobotics','Mega Man 8','2026-08-20T22:54:42.252648+00:00','https://www.youtube.com/watch?v=AP7a4JEgbdg',160,'https://ocrmirror.org/files/music/remixes/Mega_Man_8_Aerobotics_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3324,'Wisp Inc.','Sonic Colors','2026-08-20T17:55:49.340794+00:00','https://www.youtube.com/watch?v=YA5E9Lhut1Y',834,'https://ocrmirror.org/files/music/remixes/Sonic_Colors_Wisp_Inc_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3325,'Dancing in the Jungle','Super Metroid','2026-08-20T14:08:31.374605+00:00','https://www.youtube.com/watch?v=fqy9F17F1A8',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Dancing_in_the_Jungle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3326,'Those Inkblots Are Pandas!','The Elder Scrolls V: Skyrim','2026-08-20T21:53:20.635250+00:00','https://www.youtube.com/watch?v=CY285aznOuI',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Those_Inkblots_Are_Pandas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3327,'High Tide','Donkey Kong Country','2026-08-20T20:56:03.591645+00:00','https://www.youtube.com/watch?v=FMb4EbY6aH8',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_High_Tide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3328,'Virgin Mojito at Bubble Joseph''s','Bravely Default','2026-08-20T15:04:18.907534+00:00','https://www.youtube.com/watch?v=3LFfGH_b-Kg',961,'https://ocrmirror.org/files/music/remixes/Bravely_Default_Virgin_Mojito_at_Bubble_Joseph''s_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3329,'Ravaged Metal','Golden Axe II','2026-08-20T20:56:04.304445+00:00','https://www.youtube.com/watch?v=_2wXaxy027A',608,'https://ocrmirror.org/files/music/remixes/Golden_Axe_2_Ravaged_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3330,'Come to the Dark Side, It''s a Funky Place','The Legend of Zelda: A Link to the Past','2026-08-21T05:57:29.063267+00:00','https://www.youtube.com/watch?v=EDwbCUFJR4U',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Come_to_the_Dark_Side_It''s_a_Funky_Place_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3331,'Evisceration','Final Fantasy VI','2026-08-20T19:09:42.128568+00:00','https://www.youtube.com/watch?v=QgrjTWKxEjg',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Evisceration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3332,'Jaded by Death','Breath of Fire II','2026-08-21T05:04:15.355200+00:00','https://www.youtube.com/watch?v=7dPvM6f1gpM',349,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_2_Jaded_by_Death_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3333,'Reactive','Threes','2026-08-21T04:18:09.128193+00:00','https://www.youtube.com/watch?v=tfOqI7mwsuk',95154,'https://ocrmirror.org/files/music/remixes/Threes_Reactive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3334,'The Power','Xenogears','2026-08-21T05:57:29.416617+00:00','https://www.youtube.com/watch?v=ifjjwW7x1iM',70,'https://ocrmirror.org/files/music/remixes/Xenogears_The_Power_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3335,'Rise of the Piggies','Bad Piggies','2026-08-20T19:09:41.597846+00:00','https://www.youtube.com/watch?v=fhWtr7rUkEg',95160,'https://ocrmirror.org/files/music/remixes/Bad_Piggies_Rise_of_the_Piggies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3336,'Amputate Your Metal','Wild Guns','2026-08-21T05:57:28.710523+00:00','https://www.youtube.com/watch?v=KCdEbtD0vyo',649,'https://ocrmirror.org/files/music/remixes/Wild_Guns_Amputate_Your_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3337,'Prime Directive','Metroid Prime','2026-08-20T14:08:29.934851+00:00','https://www.youtube.com/watch?v=zupJiZ1IHFA',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Prime_Directive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3338,'Punk Hairdo Kid','Chrono Trigger','2026-08-21T07:23:17.778090+00:00','https://www.youtube.com/watch?v=Kmw2NsPeRiQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Punk_Hairdo_Kid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3339,'A Silver Light Shines','Final Fantasy V','2026-08-21T10:57:20.259916+00:00','https://www.youtube.com/watch?v=mdJ6d8Ow6qU',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_A_Silver_Light_Shines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3340,'Micker Cripper Mime','Final Fantasy V','2026-08-20T20:56:03.412574+00:00','https://www.youtube.com/watch?v=Dqn80DBamC4',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Micker_Cripper_Mime_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3341,'BZKR','Final Fantasy V','2026-08-21T05:04:15.570790+00:00','https://www.youtube.com/watch?v=Y4K7qUFt0Hw',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_BZKR_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3343,'Dracula''s Secretaries','Super Castlevania IV','2026-08-20T21:53:21.165032+00:00','https://www.youtube.com/watch?v=a0WBmAegnbo',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Dracula''s_Secretaries_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3344,'Jin''s Tonic','BlazBlue: Calamity Trigger','2026-08-20T19:09:42.304104+00:00','https://www.youtube.com/watch?v=PYO2e6jWodE',663,'https://ocrmirror.org/files/music/remixes/BlazBlue_Jin''s_Tonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3345,'The Wrath of Tiny','Crash Bandicoot 2: Cortex Strikes Back','2026-08-21T03:29:10.739076+00:00','https://www.youtube.com/watch?v=TqmT5E_FXRE',41568,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_2_Cortex_Strikes_Back_The_Wrath_of_Tiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3346,'Hometown (Unabashed Mix)','Silent Hill 3','2026-08-20T19:54:50.082404+00:00','https://www.youtube.com/watch?v=QW-cgyl2vzw',10484,'https://ocrmirror.org/files/music/remixes/Silent_Hill_3_Hometown_(Unabashed_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3347,'Please, please make it rain...','The Legend of Zelda: Ocarina of Time','2026-08-21T04:18:09.490377+00:00','https://www.youtube.com/watch?v=ieoNGTrrJwk',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Please_please_make_it_rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3348,'Melody of Love','Mother','2026-08-20T17:55:49.455948+00:00','https://www.youtube.com/watch?v=EavDsB8SXK8',4289,'https://ocrmirror.org/files/music/remixes/Mother_Melody_of_Love_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3350,'Saving Earth','Mass Effect 3','2026-08-20T20:56:03.056559+00:00','https://www.youtube.com/watch?v=eniz2J5QedI',95163,'https://ocrmirror.org/files/music/remixes/Mass_Effect_3_Saving_Earth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3351,'The Dark Defender','Chrono Trigger','2026-08-21T04:18:09.897195+00:00','https://www.youtube.com/watch?v=FbeIenjlQYI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Dark_Defender_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3352,'Valoo''s Honor','The Legend of Zelda: The Wind Waker','2026-08-20T17:00:29.911040+00:00','https://www.youtube.com/watch?v=-wfsqWqMj1U',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Valoo''s_Honor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3353,'Village Beautification in 5/4','Golden Sun','2026-08-20T19:09:41.775556+00:00','https://www.youtube.com/watch?v=o-NA8Sw795o',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Village_Beautification_in_5-4_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3354,'Knight and Executioner','Dark Souls','2026-08-20T17:00:28.477125+00:00','https://www.youtube.com/watch?v=1zR-4z9mkA4',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Knight_and_Executioner_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3355,'Having Risen, the Phoenix Stops for a Spot of Tea','Shenmue','2026-08-20T19:54:49.551437+00:00','https://www.youtube.com/watch?v=3lZTl3wmN8s',148,'https://ocrmirror.org/files/music/remixes/Shenmue_Having_Risen_the_Phoenix_Stops_for_a_Spot_of_Tea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3356,'Hang in There','Pilotwings 64','2026-08-20T19:54:50.966273+00:00','https://www.youtube.com/watch?v=xaEN5-2i4qs',207,'https://ocrmirror.org/files/music/remixes/Pilotwings_64_Hang_in_There_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3357,'The Journey Home','Final Fantasy IX','2026-08-21T05:57:28.886819+00:00','https://www.youtube.com/watch?v=G3tn42Nwj0E',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_The_Journey_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3358,'Miria''s Ascent','The Guardian Legend','2026-08-21T02:07:15.188445+00:00','https://www.youtube.com/watch?v=P_mNlGm_FuM',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Miria''s_Ascent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3359,'(Don''t Wanna) Hurt You','Mega Man X2','2026-08-20T21:53:20.457383+00:00','https://www.youtube.com/watch?v=jORUvTmclT8',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_(Don''t_Wanna)_Hurt_You_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3360,'Chao Cave Rave','Sonic Adventure 2','2026-08-20T22:54:42.615227+00:00','https://www.youtube.com/watch?v=2afjGTbA5gA',277,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_2_Chao_Cave_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3361,'Battle the Terrible Fate','The Legend of Zelda: Majora''s Mask','2026-08-20T20:56:02.875420+00:00','https://www.youtube.com/watch?v=ADifL9rCSVI',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Battle_the_Terrible_Fate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3362,'Lucre','Metroid','2026-08-21T04:18:08.951579+00:00','https://www.youtube.com/watch?v=xDXr15l53-4',73,'https://ocrmirror.org/files/music/remixes/Metroid_Lucre_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3363,'Spitfire''s Boom','Street Fighter II: The World Warrior','2026-08-21T03:29:09.783620+00:00','https://www.youtube.com/watch?v=u5k4lH4Ok6Q',11375,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Spitfire''s_Boom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3364,'Hajonta','Xenon','2026-08-20T21:53:20.102655+00:00','https://www.youtube.com/watch?v=1RyQncyTebA',21244,'https://ocrmirror.org/files/music/remixes/Xenon_Hajonta_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3365,'Acoustic Jam at the Lucifer-Alpha','Snatcher','2026-08-20T23:50:18.300526+00:00','https://www.youtube.com/watch?v=TJmOpNuCWwo',4100,'https://ocrmirror.org/files/music/remixes/Snatcher_Acoustic_Jam_at_the_Lucifer-Alpha_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3366,'Ripples of Hope','Super Mario 64','2026-08-21T10:57:19.986019+00:00','https://www.youtube.com/watch?v=8NcMTMvfdmQ',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Ripples_of_Hope_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3367,'Anathema, Quietus & Apotheosis','Final Fantasy VI','2026-08-21T14:06:03.690857+00:00','https://www.youtube.com/watch?v=rV5qW0El1pM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Anathema_Quietus_&_Apotheosis_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3368,'Iron-Headed Pursuit','Pokkén Tournament','2026-08-20T22:54:43.878023+00:00','https://www.youtube.com/watch?v=t5dOdGx6aco',95158,'https://ocrmirror.org/files/music/remixes/Pokken_Tournament_Iron-Headed_Pursuit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3369,'The Path of Heaven','Street Fighter II: The World Warrior','2026-08-21T07:23:17.420995+00:00','https://www.youtube.com/watch?v=2bKIOrSmkwc',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_The_Path_of_Heaven_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3370,'Incognito','Super Smash Bros. for Wii U','2026-08-20T20:56:03.234582+00:00','https://www.youtube.com/watch?v=Ens6csfhFZo',973,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_for_Wii_U_Incognito_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3371,'The Heavens Are Calling','Gradius Gaiden','2026-08-21T03:29:11.095881+00:00','https://www.youtube.com/watch?v=5-f3pH8eobY',41999,'https://ocrmirror.org/files/music/remixes/Gradius_Gaiden_The_Heavens_Are_Calling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3372,'The Moon of Bowser','Super Mario World','2026-08-21T09:06:56.932855+00:00','https://www.youtube.com/watch?v=PLRfaxTIrMg',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_The_Moon_of_Bowser_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3373,'Jeweled Scepter','Sonic Rush Adventure','2026-08-20T17:00:30.088285+00:00','https://www.youtube.com/watch?v=VqZ2IxO2H44',57243,'https://ocrmirror.org/files/music/remixes/Sonic_Rush_Adventure_Jeweled_Scepter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3374,'Burning Ice','Sonic the Hedgehog 3','2026-08-20T23:50:17.368958+00:00','https://www.youtube.com/watch?v=DzW9w-i98jY',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Burning_Ice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3375,'Sonik Cosmotronik','Sonic the Hedgehog','2026-08-21T08:04:54.810234+00:00','https://www.youtube.com/watch?v=oggeqYaZgpQ',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Sonik_Cosmotronik_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3376,'Hank Jankerson''s Wild Ride','Super Smash Bros. Melee','2026-08-21T08:04:55.363435+00:00','https://www.youtube.com/watch?v=qLvjZOAmmO4',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Hank_Jankerson''s_Wild_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3377,'Sanfter Flügel Weilt','Jazz Jackrabbit 2','2026-08-20T17:55:50.239275+00:00','https://www.youtube.com/watch?v=dXBlH62W72k',506,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_2_Sanfter_Flugel_Weilt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3378,'Baby Blue Sky','Yoshi Touch & Go','2026-08-21T09:59:57.474022+00:00','https://www.youtube.com/watch?v=Lzy-8bhTFdc',887,'https://ocrmirror.org/files/music/remixes/Yoshi_Touch_&_Go_Baby_Blue_Sky_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3379,'Another Sky','Skylanders: Spyro''s Adventure','2026-08-21T02:07:15.706462+00:00','https://www.youtube.com/watch?v=c9holKUEOu0',962,'https://ocrmirror.org/files/music/remixes/Skylanders_Spyro''s_Adventure_Another_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3380,'Iso ilo','ilomilo','2026-08-21T03:29:10.560174+00:00','https://www.youtube.com/watch?v=CH-uPISF4yg',963,'https://ocrmirror.org/files/music/remixes/ilomilo_Iso_ilo_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3382,'Namors Gnudlib Theme (djp Naptime Edit)','The Legend of Zelda: Ocarina of Time','2026-08-21T09:06:56.754388+00:00','https://www.youtube.com/watch?v=m79ongikFtE',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Namors_Gnudlib_Theme_(djp_Naptime_Edit)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3383,'Dawn of a New Dream','The Legend of Zelda: Majora''s Mask','2026-08-20T22:54:42.433889+00:00','https://www.youtube.com/watch?v=YVWSF-gWEG0',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Dawn_of_a_New_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3384,'Judgement-Funkadelic','Final Fantasy VII','2026-08-21T07:23:18.129051+00:00','https://www.youtube.com/watch?v=2LnbMvmxQB0',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Judgement-Funkadelic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3385,'More Than MoN','Global Gladiators','2026-08-21T09:59:56.586742+00:00','https://www.youtube.com/watch?v=cdr9vU38KSY',551,'https://ocrmirror.org/files/music/remixes/Global_Gladiators_More_Than_MoN_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3386,'Searing Aggression','Lufia II: Rise of the Sinistrals','2026-08-21T04:18:09.668613+00:00','https://www.youtube.com/watch?v=rYZ5suUrN38',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Searing_Aggression_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3387,'An Enjoyable Face Remodelling','Super Street Fighter II: The New Challengers','2026-08-21T02:07:15.361486+00:00','https://www.youtube.com/watch?v=92LuVSOTL4k',575,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_An_Enjoyable_Face_Remodelling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3388,'Aveh Mountain Breakdown','Xenogears','2026-08-21T13:25:43.848874+00:00','https://www.youtube.com/watch?v=E7ugdmrBETY',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Aveh_Mountain_Breakdown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3389,'Sky-High Rollers','Rollerball','2026-08-21T08:04:54.534661+00:00','https://www.youtube.com/watch?v=C-7vBjSz3pg',4395,'https://ocrmirror.org/files/music/remixes/Rollerball_Sky-High_Rollers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3390,'Kainé (Absolution)','NieR','2026-08-21T11:52:15.891231+00:00','https://www.youtube.com/watch?v=y6vzBsDvHUY',758,'https://ocrmirror.org/files/music/remixes/NieR_Kaine_(Absolution)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3391,'The Light of My Father','Final Fantasy IV','2026-08-21T14:06:03.513903+00:00','https://www.youtube.com/watch?v=Mcbv9NLdnLA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Light_of_My_Father_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3392,'Psalm of the Summer Sky','Secret of Mana','2026-08-21T04:18:09.312780+00:00','https://www.youtube.com/watch?v=GXj9th9P3aM',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Psalm_of_the_Summer_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3393,'A Kingdom Under the Sea','Alex Kidd in Miracle World','2026-08-21T07:23:18.481537+00:00','https://www.youtube.com/watch?v=3sD_PR9O_sU',27,'https://ocrmirror.org/files/music/remixes/Alex_Kidd_in_Miracle_World_A_Kingdom_Under_the_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3394,'Filtering Through the Memories','Final Fantasy IX','2026-08-20T23:50:17.096539+00:00','https://www.youtube.com/watch?v=J3ZH_1XveIQ',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Filtering_Through_the_Memories_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3395,'The Beautiful Spaceships','Tyrian','2026-08-21T02:07:16.567802+00:00','https://www.youtube.com/watch?v=L4AQvsDkDCQ',358,'https://ocrmirror.org/files/music/remixes/Tyrian_The_Beautiful_Spaceships_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3396,'Underground Pipe Society','Super Mario Bros. 3','2026-08-21T10:57:20.533669+00:00','https://www.youtube.com/watch?v=_1cT5ZtdbaI',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Underground_Pipe_Society_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3397,'Dark Depths of Wily''s Castle','Mega Man 2','2026-08-21T08:04:55.087163+00:00','https://www.youtube.com/watch?v=YowWDKgdaZc',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Dark_Depths_of_Wily''s_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3398,'Dream','The Legend of Zelda: Ocarina of Time','2026-08-21T09:59:57.119767+00:00','https://www.youtube.com/watch?v=9L2ZxM7V5II',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Dream_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3399,'Have Ship, Will Travel','The Legend of Zelda: Link''s Awakening','2026-08-20T21:53:19.556307+00:00','https://www.youtube.com/watch?v=92vJAOEacfo',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Have_Ship_Will_Travel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3400,'The Phoenix Rises','Shenmue','2026-08-21T05:04:15.683553+00:00','https://www.youtube.com/watch?v=hFVqcdJdYtY',148,'https://ocrmirror.org/files/music/remixes/Shenmue_The_Phoenix_Rises_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3401,'Soiled by the Egyptians','VectorMan','2026-08-21T13:25:42.830477+00:00','https://www.youtube.com/watch?v=lVo8Hu1-jCA',173,'https://ocrmirror.org/files/music/remixes/Vectorman_Soiled_by_the_Egyptians_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3402,'Yearnings na Gaoithe','Chrono Trigger','2026-08-21T15:03:06.562434+00:00','https://www.youtube.com/watch?v=wGx_dv6IAkM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Yearnings_na_Gaoithe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3404,'Zaghnol Comes','Final Fantasy IX','2026-08-20T22:54:42.811678+00:00','https://www.youtube.com/watch?v=J0izPNWTqC8',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Zaghnol_Comes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3405,'On Wings of Steel','After Burner','2026-08-20T23:50:17.232856+00:00','https://www.youtube.com/watch?v=v8OATTA4Nig',12508,'https://ocrmirror.org/files/music/remixes/After_Burner_On_Wings_of_Steel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3406,'IR-Type','R-Type','2026-08-21T09:59:57.832962+00:00','https://www.youtube.com/watch?v=xiD5b8CTDf8',1901,'https://ocrmirror.org/files/music/remixes/R-Type_IR-Type_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3407,'Undone by the Blood','Bloodborne','2026-08-21T11:52:16.244568+00:00','https://www.youtube.com/watch?v=gGPUwZuGzgo',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_Undone_by_the_Blood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3408,'But You''re Still Hungry','Chrono Trigger','2026-08-21T03:29:10.325402+00:00','https://www.youtube.com/watch?v=jEHrRaQDWgY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_But_You''re_Still_Hungry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3409,'Ambitious Whispers, Immoral Chants','Final Fantasy IX','2026-08-21T03:29:10.143920+00:00','https://www.youtube.com/watch?v=_2L4LI_HYA4',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Ambitious_Whispers_Immoral_Chants_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3410,'Way Before the Day Before Yesterday','Chrono Trigger','2026-08-21T09:59:57.296927+00:00','https://www.youtube.com/watch?v=wPWbRGNUAMA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Way_Before_the_Day_Before_Yesterday_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3411,'Neuga, Ziena, Zieber, Zom...','Chrono Trigger','2026-08-21T13:25:43.642538+00:00','https://www.youtube.com/watch?v=RfKzTEb6Ujw',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Neuga_Ziena_Zieber_Zom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3412,'Driftwood','Chrono Trigger','2026-08-21T08:04:54.672608+00:00','https://www.youtube.com/watch?v=GgxSBQRxmA8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Driftwood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3413,'Kirbland','Kirby''s Dream Land 3','2026-08-21T09:06:55.865894+00:00','https://www.youtube.com/watch?v=SMaPQst7yqk',11121,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_3_Kirbland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3414,'Pure Heart','Secret of Mana','2026-08-21T09:59:56.942556+00:00','https://www.youtube.com/watch?v=cfhJ4LqfN9o',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Pure_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3415,'Thick Jams','Secret of Mana','2026-08-21T09:06:56.042914+00:00','https://www.youtube.com/watch?v=_dC1SkGJ68k',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Thick_Jams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3416,'Greedbuilt','Wario Land: Super Mario Land 3','2026-08-21T08:04:54.948834+00:00','https://www.youtube.com/watch?v=2tA_Dk2h1nE',7140,'https://ocrmirror.org/files/music/remixes/Wario_Land_Greedbuilt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3417,'Plastic Smile','Super Mario World 2: Yoshi''s Island','2026-08-21T05:04:16.278478+00:00','https://www.youtube.com/watch?v=Fx5azQnrqPM',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Plastic_Smile_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3418,'Pickin'' Colors','Mario Paint','2026-08-21T19:06:04.751410+00:00','https://www.youtube.com/watch?v=ThzR-418uE0',126,'https://ocrmirror.org/files/music/remixes/Mario_Paint_Pickin''_Colors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3419,'The Ballad of Bowser''s Balls','Super Mario Bros.','2026-08-21T10:57:19.710831+00:00','https://www.youtube.com/watch?v=k3RzEBefMRk',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_The_Ballad_of_Bowser''s_Balls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3420,'Somniatis','Castlevania: Order of Ecclesia','2026-08-21T08:04:54.396523+00:00','https://www.youtube.com/watch?v=oNM91fwqJOM',579,'https://ocrmirror.org/files/music/remixes/Castlevania_Order_of_Ecclesia_Somniatis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3421,'Wicked Chip','Vampire Killer','2026-08-21T04:18:10.442019+00:00','https://www.youtube.com/watch?v=tfQOb-29l5k',4183,'https://ocrmirror.org/files/music/remixes/Vampire_Killer_Wicked_Chip_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3422,'Your Last Dream','Undertale','2026-08-20T23:50:18.166805+00:00','https://www.youtube.com/watch?v=pQ3vDF2JF5o',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Your_Last_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3423,'Medium Funk','Undertale','2026-08-21T03:29:09.596343+00:00','https://www.youtube.com/watch?v=hADnZFBSO0Y',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Medium_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3424,'Make Your Life Hell','Undertale','2026-08-20T22:54:43.701250+00:00','https://www.youtube.com/watch?v=vLiTAxIBojk',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Make_Your_Life_Hell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3425,'That''s Not Funny','Undertale','2026-08-21T05:57:28.534665+00:00','https://www.youtube.com/watch?v=BC3PfAj5AuA',95077,'https://ocrmirror.org/files/music/remixes/Undertale_That''s_Not_Funny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3426,'Diabolus ex Machina','Pony Island','2026-08-21T09:59:56.408667+00:00','https://www.youtube.com/watch?v=yn4fWJ5AqX4',95212,'https://ocrmirror.org/files/music/remixes/Pony_Island_Diabolus_ex_Machina_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3427,'Misty Night','Sonic Colors','2026-08-21T15:58:40.298666+00:00','https://www.youtube.com/watch?v=1HZ86yL00a0',834,'https://ocrmirror.org/files/music/remixes/Sonic_Colors_Misty_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3428,'Unworldly Invasion','Advance Wars','2026-08-21T02:07:15.011269+00:00','https://www.youtube.com/watch?v=Jv3vRXdLZEQ',8800,'https://ocrmirror.org/files/music/remixes/Advance_Wars_Unworldly_Invasion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3429,'Those Who Seek the End','Final Fantasy X','2026-08-21T15:58:39.650175+00:00','https://www.youtube.com/watch?v=k-7bxeHM12Y',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Those_Who_Seek_the_End_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3430,'A Long Way Home','Super Mario World 2: Yoshi''s Island','2026-08-21T20:49:50.399553+00:00','https://www.youtube.com/watch?v=n0BKvonZlYo',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_A_Long_Way_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3431,'The Torment of a Twili','The Legend of Zelda: Twilight Princess','2026-08-21T08:04:55.225274+00:00','https://www.youtube.com/watch?v=YrfLueMzuhY',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_The_Torment_of_a_Twili_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3432,'Island Hospitality','StarTropics','2026-08-21T05:57:28.358099+00:00','https://www.youtube.com/watch?v=x8Pt2XX7ZQo',129,'https://ocrmirror.org/files/music/remixes/StarTropics_Island_Hospitality_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3433,'Army Worthy of Phobos','Doom','2026-08-21T07:23:17.953472+00:00','https://www.youtube.com/watch?v=K-pVeeDIxaE',14512,'https://ocrmirror.org/files/music/remixes/Doom_Army_Worthy_of_Phobos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3434,'Turkish Coffee','Spelunky','2026-08-21T13:25:43.396949+00:00','https://www.youtube.com/watch?v=HFCD2JqIi-E',95278,'https://ocrmirror.org/files/music/remixes/Spelunky_Turkish_Coffee_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3435,'Tag Team','Double Dragon II: The Revenge','2026-08-21T19:47:52.990013+00:00','https://www.youtube.com/watch?v=sk9Pqzs5m9Q',417,'https://ocrmirror.org/files/music/remixes/Double_Dragon_2_Tag_Team_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3436,'Battle Against a Malignant & Repugnant Opponent','EarthBound','2026-08-21T08:04:54.256822+00:00','https://www.youtube.com/watch?v=_wOPPEBhumk',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Battle_Against_a_Malignant_&_Repugnant_Opponent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3437,'With Indifference','Half-Life: Opposing Force','2026-08-21T09:06:56.221123+00:00','https://www.youtube.com/watch?v=t_ot6Zje4fE',829,'https://ocrmirror.org/files/music/remixes/Half-Life_Opposing_Force_With_Indifference_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3438,'Dance of the Kokiri','The Legend of Zelda: Ocarina of Time','2026-08-21T11:52:16.067836+00:00','https://www.youtube.com/watch?v=XrvEq3fZcdA',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Dance_of_the_Kokiri_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3439,'Aqua Wave','Donkey Kong Country','2026-08-21T13:25:43.008084+00:00','https://www.youtube.com/watch?v=eaTYagKj_bo',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Aqua_Wave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3440,'Soothing Rain','Animal Crossing','2026-08-21T11:52:15.529872+00:00','https://www.youtube.com/watch?v=TQWfhVQEDg8',521,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_Soothing_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3441,'Não Está Sozinho','Final Fantasy IX','2026-08-21T07:23:17.245799+00:00','https://www.youtube.com/watch?v=6YGeMa36rVI',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Nao_Esta_Sozinho_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3442,'Divinity','The Legend of Zelda: A Link to the Past','2026-08-21T10:57:19.846987+00:00','https://www.youtube.com/watch?v=7NeJg3pFnFk',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Divinity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3443,'The Old Mansion by the Road','Uninvited','2026-08-21T15:58:40.624005+00:00','https://www.youtube.com/watch?v=k_LlyvDic90',4541,'https://ocrmirror.org/files/music/remixes/Uninvited_The_Old_Mansion_by_the_Road_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3444,'Dance of Maddness','Castlevania: Portrait of Ruin','2026-08-21T17:55:54.992419+00:00','https://www.youtube.com/watch?v=5Q-6T3OAQME',578,'https://ocrmirror.org/files/music/remixes/Castlevania_Portrait_of_Ruin_Dance_of_Maddness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3445,'Fritz Was Here','Chrono Trigger','2026-08-21T10:57:20.123269+00:00','https://www.youtube.com/watch?v=pPPZsePHIbM',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Fritz_Was_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3446,'I Never Drink... Wine','Castlevania: Symphony of the Night','2026-08-21T09:06:57.110379+00:00','https://www.youtube.com/watch?v=HMCnuU9HxTE',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_I_Never_Drink_Wine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3447,'Dracula''s Madness','Castlevania','2026-08-21T05:57:30.346716+00:00','https://www.youtube.com/watch?v=prt6_p2_1Y8',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Dracula''s_Madness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3448,'Cataclysm','Chrono Trigger','2026-08-21T07:23:17.069157+00:00','https://www.youtube.com/watch?v=3bayuwsTmOY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Cataclysm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3449,'Helljam II','Doom','2026-08-21T04:18:10.261828+00:00','https://www.youtube.com/watch?v=5m_LJSEn4KA',14512,'https://ocrmirror.org/files/music/remixes/Doom_Helljam_II_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3450,'Time Crush','The Legend of Zelda: Ocarina of Time','2026-08-21T09:06:56.399201+00:00','https://www.youtube.com/watch?v=v26JcJl4B30',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Time_Crush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3451,'Marowak''s Revenge','Pokémon Red Version','2026-08-21T10:57:19.430498+00:00','https://www.youtube.com/watch?v=CBn1uJjmhy4',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Marowak''s_Revenge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3452,'Interstellar Action','Kirby 64: The Crystal Shards','2026-08-21T07:23:16.891439+00:00','https://www.youtube.com/watch?v=g7ZhVzon-k0',577,'https://ocrmirror.org/files/music/remixes/Kirby_64_Interstellar_Action_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3453,'The Eye of Osiris','Halo 5: Guardians','2026-08-21T03:29:11.273772+00:00','https://www.youtube.com/watch?v=QXM199Tr37s',95344,'https://ocrmirror.org/files/music/remixes/Halo_5_The_Eye_of_Osiris_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3454,'Gotta Catch a Wave and a Memory','Pokémon Sapphire Version','2026-08-21T11:52:15.344133+00:00','https://www.youtube.com/watch?v=7wEcipDBbsE',636,'https://ocrmirror.org/files/music/remixes/Pokemon_Sapphire_Version_Gotta_Catch_a_Wave_and_a_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3455,'Nanny Goatmom''s Purple Puzzle Basement','Undertale','2026-08-21T11:52:15.715457+00:00','https://www.youtube.com/watch?v=vhqz0LXyS-4',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Nanny_Goatmom''s_Purple_Puzzle_Basement_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3456,'Home','Terranigma','2026-08-21T20:49:50.220947+00:00','https://www.youtube.com/watch?v=2A-pHPtFdL4',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3457,'Kong''s Final Swim','Donkey Kong Country','2026-08-21T21:49:18.132731+00:00','https://www.youtube.com/watch?v=h-17Sq-MUuM',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Kong''s_Final_Swim_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3458,'Have You Met Sir Belmont?','Super Castlevania IV','2026-08-21T05:57:28.178967+00:00','https://www.youtube.com/watch?v=v164C2uWUmI',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Have_You_Met_Sir_Belmont_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3459,'Raccoon Rhapsody','Super Mario Bros. 3','2026-08-21T09:59:56.764314+00:00','https://www.youtube.com/watch?v=ZmwrTTOd8LU',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Raccoon_Rhapsody_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3460,'Tropical Relaxation Method','Mega Man X3','2026-08-21T15:03:06.735718+00:00','https://www.youtube.com/watch?v=YCJaXVdp6j0',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Tropical_Relaxation_Method_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3461,'Crowded Minds and Lonely Roads','Silent Hill 2','2026-08-21T09:06:55.664683+00:00','https://www.youtube.com/watch?v=1laykxT9AoU',63,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_Crowded_Minds_and_Lonely_Roads_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3462,'The Slumber of the Beast','Super Mario 64','2026-08-21T15:58:40.136895+00:00','https://www.youtube.com/watch?v=V8AN6piJY5c',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_The_Slumber_of_the_Beast_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3463,'Mare Undarum','Paper Mario: The Thousand-Year Door','2026-08-21T19:06:04.212010+00:00','https://www.youtube.com/watch?v=WEweubLT4ys',804,'https://ocrmirror.org/files/music/remixes/Paper_Mario_The_Thousand-Year_Door_Mare_Undarum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3464,'The Dream Will Never Die (Uplifter Mix)','Tales of Phantasia','2026-08-21T21:49:17.780382+00:00','https://www.youtube.com/watch?v=5n95hWaQwg0',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_The_Dream_Will_Never_Die_(Uplifter_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3465,'Number of the Beats','Vampire Killer','2026-08-21T17:00:42.796936+00:00','https://www.youtube.com/watch?v=iFxQBDRle68',4183,'https://ocrmirror.org/files/music/remixes/Vampire_Killer_Number_of_the_Beats_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3466,'Rock My Socket','Mega Man 3','2026-08-21T09:06:57.289698+00:00','https://www.youtube.com/watch?v=Qu70UlA8Gdo',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Rock_My_Socket_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3467,'ZED EX FUTURE ''85','Future Games','2026-08-21T09:59:57.650535+00:00','https://www.youtube.com/watch?v=IU5G-G49rzg',18931,'https://ocrmirror.org/files/music/remixes/Future_Games_ZED_EX_FUTURE_''85_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3468,'Vivo Revenis','Final Fantasy','2026-08-21T03:29:09.962811+00:00','https://www.youtube.com/watch?v=76sRWcEHhZw',41871,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Vivo_Revenis_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3469,'Afternoon in the Sacred Forest Meadow','The Legend of Zelda: Ocarina of Time','2026-08-21T19:06:05.108359+00:00','https://www.youtube.com/watch?v=AXWfWipHCZU',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Afternoon_in_the_Sacred_Forest_Meadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3470,'Popsicle','Sonic the Hedgehog 3','2026-08-21T13:25:43.203868+00:00','https://www.youtube.com/watch?v=aMt6CRbqJNY',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Popsicle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3471,'Amorphous Freeze','Mega Man Zero 2','2026-08-21T17:55:54.468415+00:00','https://www.youtube.com/watch?v=0JF3Pa5d33g',434,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_2_Amorphous_Freeze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3472,'Frozen Rose','Secret of Mana','2026-08-21T10:57:19.572991+00:00','https://www.youtube.com/watch?v=CZIWZUnfJKE',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Frozen_Rose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3473,'Errorize','Remember Me','2026-08-21T19:06:04.391737+00:00','https://www.youtube.com/watch?v=94eK7kKhJZ8',95346,'https://ocrmirror.org/files/music/remixes/Remember_Me_Errorize_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3474,'Sunny Day Drive','Undertale','2026-08-21T11:52:16.597287+00:00','https://www.youtube.com/watch?v=bCxPbdFT0L8',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Sunny_Day_Drive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3475,'Marching Towards Roshufa''s Spirit','Undeadline','2026-08-21T07:23:18.306430+00:00','https://www.youtube.com/watch?v=l3HoZeW1PU4',95347,'https://ocrmirror.org/files/music/remixes/Undeadline_Marching_Towards_Roshufa''s_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3476,'Lucky Coin','Pokémon Silver Version','2026-08-21T10:57:19.278397+00:00','https://www.youtube.com/watch?v=oDcWQhn_2to',674,'https://ocrmirror.org/files/music/remixes/Pokemon_Silver_Version_Lucky_Coin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3477,'Our Darkest Dreams','Final Fantasy IX','2026-08-21T17:00:43.355441+00:00','https://www.youtube.com/watch?v=7OOO729tO1I',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Our_Darkest_Dreams_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3478,'Child of Legend','The Legend of Zelda: Ocarina of Time','2026-08-21T22:50:51.697462+00:00','https://www.youtube.com/watch?v=NNgONkIa2nQ',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Child_of_Legend_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3479,'OMG Mr. Write','The Legend of Zelda: Link''s Awakening','2026-08-21T11:52:14.987603+00:00','https://www.youtube.com/watch?v=KyZlfMp7L60',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_OMG_Mr_Write_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3480,'Cazador de Recompensas','Metroid','2026-08-21T22:50:50.985929+00:00','https://www.youtube.com/watch?v=evvEu1HHyhA',73,'https://ocrmirror.org/files/music/remixes/Metroid_Cazador_de_Recompensas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3481,'Kindle the Soul','Dark Souls','2026-08-21T19:06:04.030804+00:00','https://www.youtube.com/watch?v=DKw3uDW-BzQ',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Kindle_the_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3482,'Fi, Emissary of the Goddess','The Legend of Zelda: Skyward Sword','2026-08-21T15:03:07.430899+00:00','https://www.youtube.com/watch?v=49FxVA22_MQ',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Fi_Emissary_of_the_Goddess_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3483,'Dream of Green','Chrono Trigger','2026-08-21T15:58:40.461526+00:00','https://www.youtube.com/watch?v=Wp_cw5EbFKU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Dream_of_Green_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3484,'Love and Loss','The Witcher 3: Wild Hunt','2026-08-21T13:25:42.650977+00:00','https://www.youtube.com/watch?v=OIXxF7IJroY',95349,'https://ocrmirror.org/files/music/remixes/Witcher_3_Love_and_Loss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3485,'Monumental Subterranean eXploration','La-Mulana','2026-08-21T15:58:40.788627+00:00','https://www.youtube.com/watch?v=YA4h82xLWdY',986,'https://ocrmirror.org/files/music/remixes/La-Mulana_Monumental_Subterranean_eXploration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3486,'Chivalrous Medicinal Murder','Mega Man 10','2026-08-21T13:25:44.713489+00:00','https://www.youtube.com/watch?v=_yVsUk_WPdo',757,'https://ocrmirror.org/files/music/remixes/Mega_Man_10_Chivalrous_Medicinal_Murder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3487,'Super Mega Ultra Pipe House','Super Mario RPG: Legend of the Seven Stars','2026-08-21T23:48:38.519429+00:00','https://www.youtube.com/watch?v=z_G-9gbmxdI',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Super_Mega_Ultra_Pipe_House_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3488,'Fight Against a Somewhat Delicious Cake','Super Mario RPG: Legend of the Seven Stars','2026-08-21T20:49:50.755264+00:00','https://www.youtube.com/watch?v=NlH9lD0tFdQ',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Fight_Against_a_Somewhat_Delicious_Cake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3489,'Just One Wish','Super Mario RPG: Legend of the Seven Stars','2026-08-21T17:55:55.346341+00:00','https://www.youtube.com/watch?v=2RlgU0_oP1A',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Just_One_Wish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3490,'Club King Bowser','Super Mario RPG: Legend of the Seven Stars','2026-08-21T15:03:07.083409+00:00','https://www.youtube.com/watch?v=NfdIy5AAt3A',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Club_King_Bowser_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3491,'A Yo''ster Sunset','Super Mario RPG: Legend of the Seven Stars','2026-08-21T14:06:03.339114+00:00','https://www.youtube.com/watch?v=WpV8l-sXAm0',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_A_Yo''ster_Sunset_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3492,'Oyster Me Timbers','Super Mario RPG: Legend of the Seven Stars','2026-08-21T23:48:38.874623+00:00','https://www.youtube.com/watch?v=JxniAM9A8Hg',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Oyster_Me_Timbers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3493,'CONNECTED!','Pokémon Super Mystery Dungeon','2026-08-21T19:47:53.169624+00:00','https://www.youtube.com/watch?v=RGhornkNSxQ',95099,'https://ocrmirror.org/files/music/remixes/Pokemon_Super_Mystery_Dungeon_CONNECTED_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3494,'Lonely in Space, with a Waltz','Star Fox','2026-08-21T15:58:39.974198+00:00','https://www.youtube.com/watch?v=fl3Hk52qoa0',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Lonely_in_Space_with_a_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3495,'Chemical Burn','Sonic the Hedgehog 2','2026-08-21T13:25:42.470926+00:00','https://www.youtube.com/watch?v=BkuqaE6HdsU',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Chemical_Burn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3496,'Mordrem Stomp','Guild Wars 2','2026-08-21T09:06:56.577128+00:00','https://www.youtube.com/watch?v=mKSorRfHB_4',948,'https://ocrmirror.org/files/music/remixes/Guild_Wars_2_Mordrem_Stomp_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3497,'Weapons of Mass Production','Super Mario RPG: Legend of the Seven Stars','2026-08-21T19:47:52.810764+00:00','https://www.youtube.com/watch?v=ooSL0B3VSzY',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Weapons_of_Mass_Production_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3498,'Blue Star Prayer','Lunar 2: Eternal Blue Complete','2026-08-21T22:50:51.875173+00:00','https://www.youtube.com/watch?v=T9PLJpGLW_0',42328,'https://ocrmirror.org/files/music/remixes/Lunar_2_Blue_Star_Prayer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3499,'Retrohead Five','Retro City Rampage','2026-08-21T17:00:42.936186+00:00','https://www.youtube.com/watch?v=LMQEst1zZWU',749,'https://ocrmirror.org/files/music/remixes/Retro_City_Rampage_Retrohead_Five_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3500,'The Usurper Queen','Super Mario RPG: Legend of the Seven Stars','2026-08-22T04:59:15.475318+00:00','https://www.youtube.com/watch?v=vKuuaoeP8WQ',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_The_Usurper_Queen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3501,'Find Your Way','Final Fantasy','2026-08-22T04:05:27.287179+00:00','https://www.youtube.com/watch?v=BYm3Su5-cnE',8,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Find_Your_Way_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3502,'Bramble Blaster','Super Smash Bros. Brawl','2026-08-21T23:48:38.697777+00:00','https://www.youtube.com/watch?v=UFPsIQaz3gg',879,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Brawl_Bramble_Blaster_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3503,'Historia Medley','The Legend of Zelda: The Wind Waker','2026-08-21T19:06:04.930217+00:00','https://www.youtube.com/watch?v=wV0uN4KBEWs',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Historia_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3504,'The Climb Above','Pokémon Red Version','2026-08-21T20:49:50.044420+00:00','https://www.youtube.com/watch?v=WLoc7bF5NY8',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_The_Climb_Above_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3505,'Seeing Red','Pokémon Silver Version','2026-08-21T09:59:56.224734+00:00','https://www.youtube.com/watch?v=sf9-lE2bZe8',674,'https://ocrmirror.org/files/music/remixes/Pokemon_Silver_Version_Seeing_Red_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3506,'The Last Sequence','Warframe','2026-08-21T15:03:08.565203+00:00','https://www.youtube.com/watch?v=ne-fP7dF0ZA',95356,'https://ocrmirror.org/files/music/remixes/Warframe_The_Last_Sequence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3507,'Nostalgic Dump','Duke Nukem 3D','2026-08-21T15:03:07.256765+00:00','https://www.youtube.com/watch?v=S4FpxzyFNe4',645,'https://ocrmirror.org/files/music/remixes/Duke_Nukem_3D_Nostalgic_Dump_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3508,'Exploda','Final Fantasy IX','2026-08-21T17:00:42.096643+00:00','https://www.youtube.com/watch?v=6W1PLAO-cBQ',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Exploda_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3509,'Mergo Reborn','Bloodborne','2026-08-21T11:52:16.421000+00:00','https://www.youtube.com/watch?v=EoMHw7hY7jE',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_Mergo_Reborn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3510,'Craic in the Castle Walls','Final Fantasy IX','2026-08-21T15:58:40.950778+00:00','https://www.youtube.com/watch?v=FsyZsYc0Tdo',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Craic_in_the_Castle_Walls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3511,'Floor Is Lava','Super Mario RPG: Legend of the Seven Stars','2026-08-21T20:49:50.576973+00:00','https://www.youtube.com/watch?v=oBlm5lCovbU',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Floor_Is_Lava_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3512,'Hail to the Present','Castlevania: Portrait of Ruin','2026-08-21T14:06:02.809638+00:00','https://www.youtube.com/watch?v=EzMQyNLGxE0',578,'https://ocrmirror.org/files/music/remixes/Castlevania_Portrait_of_Ruin_Hail_to_the_Present_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3513,'Hyrulean Overture #1','The Legend of Zelda: Ocarina of Time','2026-08-22T03:20:42.061432+00:00','https://www.youtube.com/watch?v=R49s2ZKLrPw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Hyrulean_Overture_1_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3514,'Re-act','Command & Conquer','2026-08-21T15:03:06.387568+00:00','https://www.youtube.com/watch?v=-pOhlZcOA3w',41542,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Re-act_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3515,'sleepy baby weasel dook','Mickey Saves the Day','2026-08-21T10:57:20.398653+00:00','https://www.youtube.com/watch?v=is6rgZaWbGE',22756,'https://ocrmirror.org/files/music/remixes/Mickey_Saves_the_Day_sleep_baby_weasel_dook_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3516,'Fixations','Final Fantasy IX','2026-08-21T17:55:54.817958+00:00','https://www.youtube.com/watch?v=qgXBznpSbOs',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Fixations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3517,'Chun-Li''s Theme (Funky Flute Mix)','Street Fighter II: The World Warrior','2026-08-21T20:49:49.685455+00:00','https://www.youtube.com/watch?v=SgCaoxUSR3I',11375,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Chun-Li''s_Theme_(Funky_Flute_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3518,'Traversing the Aether','Chrono Cross','2026-08-21T17:55:55.170782+00:00','https://www.youtube.com/watch?v=dXR8c74z9JU',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Traversing_the_Aether_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3519,'Magitek Research Symphony','Final Fantasy VI','2026-08-21T14:06:02.632896+00:00','https://www.youtube.com/watch?v=sDL8bc_UHHA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Magitek_Research_Symphony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3520,'Time''s Seal','Chrono Trigger','2026-08-21T17:00:42.657518+00:00','https://www.youtube.com/watch?v=vAj5Ge9slWs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Time''s_Seal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3521,'Es-cop-ay','Mega Man X8','2026-08-22T03:20:42.236652+00:00','https://www.youtube.com/watch?v=27mvcN2TqAU',687,'https://ocrmirror.org/files/music/remixes/Mega_Man_X8_Es-cop-ay_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3522,'Beyond the Imperial Prison','The Elder Scrolls IV: Oblivion','2026-08-21T17:55:54.643444+00:00','https://www.youtube.com/watch?v=ZEWPkzgdp3A',553,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_4_Oblivion_Beyond_the_Imperial_Prison_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3523,'Hyrule''s Deadly Palaces!','Zelda II: The Adventure of Link','2026-08-22T01:57:06.813819+00:00','https://www.youtube.com/watch?v=IUTWZm75EV0',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Hyrule''s_Deadly_Palaces_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3524,'Dreams of Summer','Knuckles'' Chaotix','2026-08-21T21:49:17.603638+00:00','https://www.youtube.com/watch?v=NwXht0M-uos',239,'https://ocrmirror.org/files/music/remixes/Knuckles''_Chaotix_Dreams_of_Summer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3525,'True Calling (Unplugged)','Shin Megami Tensei: Persona 3 FES','2026-08-21T14:06:03.162556+00:00','https://www.youtube.com/watch?v=uCrSrSOgXa4',94625,'https://ocrmirror.org/files/music/remixes/Shin_Megami_Tensei_Persona_3_FES_True_Calling_(Unplugged)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3526,'March of Robbers in Treno City','Final Fantasy IX','2026-08-21T15:03:06.910170+00:00','https://www.youtube.com/watch?v=f4aDD9Rtrlo',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_March_of_Robbers_in_Treno_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3527,'One Two Three, One Two Three, WHIP!','Super Castlevania IV','2026-08-21T17:00:42.238220+00:00','https://www.youtube.com/watch?v=7G3MxFLupxk',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_One_Two_Three_One_Two_Three_WHIP_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3528,'Vincent''s Longing','Final Fantasy VII','2026-08-21T19:47:52.631419+00:00','https://www.youtube.com/watch?v=8bRKbupR_Z4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Vincent''s_Longing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3529,'All I Wanna Do','Akumajo Dracula X: Rondo of Blood','2026-08-22T10:49:13.583987+00:00','https://www.youtube.com/watch?v=aCbiaWumYN8',112,'https://ocrmirror.org/files/music/remixes/Akumajo_Dracula_X_Rondo_of_Blood_All_I_Wanna_Do_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3530,'Wind in Your Hair','Mario Kart Wii','2026-08-22T03:20:41.708815+00:00','https://www.youtube.com/watch?v=I1_c4jIq1OI',45659,'https://ocrmirror.org/files/music/remixes/Mario_Kart_Wii_Wind_in_Your_Hair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3531,'Thy Everlasting Winter Wind Blows','Pokémon X','2026-08-21T19:06:04.570394+00:00','https://www.youtube.com/watch?v=nNn9nj54zPE',850,'https://ocrmirror.org/files/music/remixes/Pokemon_X_Thy_Everlasting_Winter_Wind_Blows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3532,'Protect Your Kingdom','Kingdom Hearts','2026-08-21T14:06:03.866695+00:00','https://www.youtube.com/watch?v=djfZz_9F0iQ',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Protect_Your_Kingdom_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3533,'Laser Power','Mega Man X2','2026-08-21T21:49:17.426118+00:00','https://www.youtube.com/watch?v=U75oil_Uj7k',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Laser_Power_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3534,'Piano Meets Girl','EarthBound','2026-08-21T17:00:42.518513+00:00','https://www.youtube.com/watch?v=MdEKiN-qjmU',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Piano_Meets_Girl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3535,'Honky Town','Super Mario RPG: Legend of the Seven Stars','2026-08-22T04:05:27.818470+00:00','https://www.youtube.com/watch?v=cHsmi1tkhSA',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Honky_Town_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3536,'Get Psyched','Wolfenstein 3D','2026-08-21T17:55:54.293639+00:00','https://www.youtube.com/watch?v=IRqVgOxy7cs',357,'https://ocrmirror.org/files/music/remixes/Wolfenstein_3D_Get_Psyched_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3537,'Seagull Sonata','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-22T04:05:26.934134+00:00','https://www.youtube.com/watch?v=-SawS_pRg18',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Seagull_Sonata_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3538,'When Hell Freezes Over','Chrono Trigger','2026-08-22T01:57:07.090506+00:00','https://www.youtube.com/watch?v=D6-E5w_rmUk',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_When_Hell_Freezes_Over_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3539,'Shrouded Reactor','Final Fantasy VII','2026-08-21T15:03:08.738162+00:00','https://www.youtube.com/watch?v=wRA3gHFoh4c',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Shrouded_Reactor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3540,'Selva Oscura','Super Castlevania IV','2026-08-22T04:05:27.994752+00:00','https://www.youtube.com/watch?v=6XQqAyXaSg4',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Selva_Oscura_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3541,'Do You Remember?','Suikoden II','2026-08-22T05:53:07.011111+00:00','https://www.youtube.com/watch?v=xBkgn9zRyEI',245,'https://ocrmirror.org/files/music/remixes/Suikoden_2_Do_You_Remember_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3542,'Agent Smithy','Super Mario RPG: Legend of the Seven Stars','2026-08-21T17:55:54.118733+00:00','https://www.youtube.com/watch?v=pvxk_YtmHz0',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Agent_Smithy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3543,'Fluffball Rampage','Kirby Super Star','2026-08-22T08:56:50.922257+00:00','https://www.youtube.com/watch?v=hk3kECOpp_k',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Fluffball_Rampage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3544,'The Throes of Death(guise)','Final Fantasy IX','2026-08-22T07:08:58.749948+00:00','https://www.youtube.com/watch?v=EjGdoefisnE',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_The_Throes_of_Death(guise)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3545,'The Bloodline Bounce','Castlevania: Dracula X','2026-08-22T03:20:41.533290+00:00','https://www.youtube.com/watch?v=XNzASNOIs3I',10916,'https://ocrmirror.org/files/music/remixes/Castlevania_Dracula_X_The_Bloodline_Bounce_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3546,'Attack on Dollet','Final Fantasy VIII','2026-08-22T03:20:42.589196+00:00','https://www.youtube.com/watch?v=f3_nc0osFMI',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Attack_on_Dollet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3547,'Extinction Party','Lemmings','2026-08-22T09:50:33.768579+00:00','https://www.youtube.com/watch?v=gu6Nfz8V8K4',6476,'https://ocrmirror.org/files/music/remixes/Lemmings_Extinction_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3548,'Reflections','Super Castlevania IV','2026-08-22T01:57:06.675825+00:00','https://www.youtube.com/watch?v=Yo45-qnwXAU',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Reflections_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3549,'The Madness','Sonic CD','2026-08-22T04:59:15.117594+00:00','https://www.youtube.com/watch?v=zBfNJN4bQZU',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_The_Madness_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3550,'The Fallen Savior','Final Fantasy IX','2026-08-21T21:49:18.492110+00:00','https://www.youtube.com/watch?v=-wX8kbK3hOs',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_The_Fallen_Savior_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3551,'Robots Aren''t Made of This...','Undertale','2026-08-21T17:55:53.934345+00:00','https://www.youtube.com/watch?v=bMpuBf7RVTM',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Robots_Aren''t_Made_of_This_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3552,'Gehrman and Maria','Bloodborne','2026-08-21T22:50:50.807476+00:00','https://www.youtube.com/watch?v=UJl1nbvTSuo',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_Gehrman_and_Maria_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3553,'Spartans of the Church','Bloodborne','2026-08-21T15:58:39.482110+00:00','https://www.youtube.com/watch?v=5HiFwJZBhCM',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_Spartans_of_the_Church_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3554,'Thardus Lives!','Metroid Prime','2026-08-21T23:48:39.051810+00:00','https://www.youtube.com/watch?v=4OK4jHMoZ2U',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Thardus_Lives_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3555,'Shredding the Rainbow','Mario Kart: Double Dash!!','2026-08-21T19:47:52.272344+00:00','https://www.youtube.com/watch?v=U8koP8Zimxo',7366,'https://ocrmirror.org/files/music/remixes/Mario_Kart_Double_Dash_Shredding_the_Rainbow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3556,'Prelude to Fantasy','Final Fantasy IX','2026-08-21T22:50:50.631035+00:00','https://www.youtube.com/watch?v=dMlCI4ExhRs',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Prelude_to_Fantasy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3557,'Sleep, Beloved Child','Paladin''s Quest','2026-08-21T20:49:49.504397+00:00','https://www.youtube.com/watch?v=2ogCxFa3XTU',11250,'https://ocrmirror.org/files/music/remixes/Paladin''s_Quest_Sleep_Beloved_Child_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3558,'Frozen Mourning','The Legend of Zelda: Twilight Princess','2026-08-21T19:47:52.091503+00:00','https://www.youtube.com/watch?v=iwgi72wiXyo',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Frozen_Mourning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3559,'Mario for Airports (1-1)','Super Mario World','2026-08-22T07:08:59.053591+00:00','https://www.youtube.com/watch?v=mxlBnznjNoY',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Mario_for_Airports_(1-1)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3560,'Magical Forest Medley','Tales of Phantasia','2026-08-21T21:49:17.247819+00:00','https://www.youtube.com/watch?v=Ye1FED52y5E',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_Magical_Forest_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3561,'Speeding Towards Adventure','Sonic the Hedgehog','2026-08-22T07:54:16.897207+00:00','https://www.youtube.com/watch?v=grADRNE8q7w',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Speeding_Towards_Adventure_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3562,'Electromotive Skyforce','Sonic & Knuckles','2026-08-21T22:50:51.520191+00:00','https://www.youtube.com/watch?v=Aml-4IzD-pI',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Electromotive_Skyforce_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3563,'Chemical Fusion','Sonic the Hedgehog 2','2026-08-22T04:05:27.641946+00:00','https://www.youtube.com/watch?v=2mbRK0glzzs',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Chemical_Fusion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3564,'The Long War','Sonic the Hedgehog 2','2026-08-22T03:20:41.884903+00:00','https://www.youtube.com/watch?v=XeLXp6tqy-Q',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_The_Long_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3565,'Siilin Melankolia','Sonic the Hedgehog','2026-08-22T07:54:17.438999+00:00','https://www.youtube.com/watch?v=Tshl8jazGpI',979,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Siilin_Melankolia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3566,'A Reflection of Tyranny','Street Fighter III: 3rd Strike: Fight for the Future','2026-08-21T17:00:42.378280+00:00','https://www.youtube.com/watch?v=JcgeYVYAdWg',238,'https://ocrmirror.org/files/music/remixes/Street_Fighter_3_3rd_Strike_A_Reflection_of_Tyranny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3567,'Sapphire Oceans','Lufia II: Rise of the Sinistrals','2026-08-21T19:47:53.528868+00:00','https://www.youtube.com/watch?v=D9gHqtp5_eo',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Sapphire_Oceans_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3568,'Sub-Dimensions','Crash Bandicoot 2: Cortex Strikes Back','2026-08-21T21:49:17.067596+00:00','https://www.youtube.com/watch?v=WhUC44fo0dM',41568,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_2_Cortex_Strikes_Back_Sub-Dimensions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3569,'Angelhenge','Brütal Legend','2026-08-22T04:59:15.834109+00:00','https://www.youtube.com/watch?v=ZNUtMEZOcMc',52074,'https://ocrmirror.org/files/music/remixes/Brutal_Legend_Angelhenge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3570,'Dream of Salikawood','Final Fantasy XII','2026-08-21T19:06:03.663902+00:00','https://www.youtube.com/watch?v=1L8mGiJTpTI',525,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_12_Dream_of_Salikawood_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3571,'Another Marbule Homestead','Chrono Cross','2026-08-21T20:49:49.865060+00:00','https://www.youtube.com/watch?v=bnZcVU6nOaM',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Another_Marbule_Homestead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3572,'Once Upon a Piano Sonata No. 0 in F major','Undertale','2026-08-21T19:06:03.847955+00:00','https://www.youtube.com/watch?v=mzsHUQTQFwU',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Once_Upon_a_Piano_Sonata_No_0_in_F_major_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3573,'Gotta Start from Somewhere','Sonic the Hedgehog','2026-08-22T10:49:13.406364+00:00','https://www.youtube.com/watch?v=-Ex2e99j14A',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Gotta_Start_from_Somewhere_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3574,'Attack of the Drones','Metroid Prime 2: Echoes','2026-08-22T07:08:58.901616+00:00','https://www.youtube.com/watch?v=00EmGu3Rbfg',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Attack_of_the_Drones_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3575,'You Dirty, You Nasty, But You Mine','Super Mario RPG: Legend of the Seven Stars','2026-08-22T07:08:59.204660+00:00','https://www.youtube.com/watch?v=vHQ69BfwHvw',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_You_Dirty_You_Nasty_But_You_Mine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3576,'The Profaned Vanguard','Dark Souls III','2026-08-21T22:50:51.163492+00:00','https://www.youtube.com/watch?v=-q8YC40cDMQ',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_The_Profaned_Vanguard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3577,'My Beautiful Vampire Hunter','Castlevania Legends','2026-08-21T19:47:52.450911+00:00','https://www.youtube.com/watch?v=75mURvoeulY',6876,'https://ocrmirror.org/files/music/remixes/Castlevania_Legends_My_Beautiful_Vampire_Hunter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3578,'Break My Strider','Run Saber','2026-08-21T20:49:50.932747+00:00','https://www.youtube.com/watch?v=9qBsZ5ggB2g',11316,'https://ocrmirror.org/files/music/remixes/Run_Saber_Break_My_Strider_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3579,'Vamo alla Django','Final Fantasy IX','2026-08-22T04:05:27.110514+00:00','https://www.youtube.com/watch?v=2wt2kbau3T0',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Vamo_alla_Django_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3580,'Choose Your Character! (VERSUS)','Super Smash Bros. Melee','2026-08-22T07:54:17.615284+00:00','https://www.youtube.com/watch?v=aL7nhoBRdfw',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Choose_Your_Character_(VERSUS)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3581,'Into the Sandstorm','Final Fantasy IX','2026-08-21T21:49:18.310214+00:00','https://www.youtube.com/watch?v=2YeL0zp2A6c',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Into_the_Sandstorm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3582,'Vampithrillic','Castlevania','2026-08-22T05:53:07.897793+00:00','https://www.youtube.com/watch?v=eHY7Hse6300',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Vampithrillic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3583,'Nimbus Can Wait','Super Mario RPG: Legend of the Seven Stars','2026-08-22T01:57:06.246259+00:00','https://www.youtube.com/watch?v=_PahBp4pwcs',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Nimbus_Can_Wait_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3584,'Watery Castle','The Legend of Zelda: A Link Between Worlds','2026-08-21T19:47:53.709319+00:00','https://www.youtube.com/watch?v=XLeBkgZ3lBs',94860,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_Between_Worlds_Watery_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3585,'Grand Flight','Xenogears','2026-08-21T22:50:50.450320+00:00','https://www.youtube.com/watch?v=u11YO7xQGLQ',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Grand_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3586,'Tales from Arctic Katamari Roundabouts, and You and I, in Cherry Blossom Season','Katamari Forever','2026-08-22T13:51:44.588469+00:00','https://www.youtube.com/watch?v=0kiy_Jhv3tE',59073,'https://ocrmirror.org/files/music/remixes/Katamari_Forever_Tales_from_Arctic_Katamari_Roundabouts_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3587,'Timeless Journey','The Legend of Zelda: A Link to the Past','2026-08-22T15:46:01.881337+00:00','https://www.youtube.com/watch?v=yEuFZ0dcWr8',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Timeless_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3588,'Raining at Hyrule Castle','The Legend of Zelda: A Link to the Past','2026-08-22T04:59:14.938045+00:00','https://www.youtube.com/watch?v=atxS8gglX7M',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Raining_at_Hyrule_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3589,'Technicolor Thunderstorm','The Legend of Zelda: A Link to the Past','2026-08-22T08:56:51.306026+00:00','https://www.youtube.com/watch?v=PX22n91YDho',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Technicolor_Thunderstorm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3590,'The Triforce of Sorrow','The Legend of Zelda: A Link to the Past','2026-08-22T11:45:17.381227+00:00','https://www.youtube.com/watch?v=-p9GVOzgjkU',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Triforce_of_Sorrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3591,'(Progeny) Of a Frail Humanity','Resident Evil: The Umbrella Chronicles','2026-08-22T13:51:44.411233+00:00','https://www.youtube.com/watch?v=_If1oDkYfcQ',45434,'https://ocrmirror.org/files/music/remixes/Resident_Evil_The_Umbrella_Chronicles_(Progeny)_Of_a_Frail_Humanity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3592,'I''ll Torch Him!','Spyro the Dragon','2026-08-21T23:48:37.803904+00:00','https://www.youtube.com/watch?v=R7pdBeY58xo',43180,'https://ocrmirror.org/files/music/remixes/Spyro_the_Dragon_I''ll_Torch_Him_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3593,'Big Room Gobi','Banjo-Kazooie','2026-08-21T23:48:38.165119+00:00','https://www.youtube.com/watch?v=2uZy5zaGr8U',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_Big_Room_Gobi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3594,'Fortress at Night','Super Mario World 2: Yoshi''s Island','2026-08-21T23:48:39.230054+00:00','https://www.youtube.com/watch?v=L0ZdQDfdLvU',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Fortress_at_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3595,'Kraid''s Forgotten Lair','Metroid','2026-08-22T01:57:05.681056+00:00','https://www.youtube.com/watch?v=izkQEzJO1U0',73,'https://ocrmirror.org/files/music/remixes/Metroid_Kraid''s_Forgotten_Lair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3596,'Comix Bubbles','Comix Zone','2026-08-22T03:20:41.000254+00:00','https://www.youtube.com/watch?v=Vsc1wTackmQ',6308,'https://ocrmirror.org/files/music/remixes/Comix_Zone_Comix_Bubbles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3597,'We''re the Fugawe Forest','The Legend of Zelda: A Link to the Past','2026-08-22T13:09:00.793368+00:00','https://www.youtube.com/watch?v=KxNE8RnP5Zk',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_We''re_the_Fugawe_Forest_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3598,'All for One','Dark Souls III','2026-08-21T21:49:17.956637+00:00','https://www.youtube.com/watch?v=ZkXZG0lfcHA',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_All_for_One_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3599,'The Wander','Final Fantasy V','2026-08-22T04:59:15.654311+00:00','https://www.youtube.com/watch?v=ejifpmRflJs',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_The_Wander_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3600,'A Road That You Go','Super Mario Kart','2026-08-22T16:49:54.152269+00:00','https://www.youtube.com/watch?v=yLMwDL8cPj8',269,'https://ocrmirror.org/files/music/remixes/Super_Mario_Kart_A_Road_That_You_Go_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3601,'Viking Funeral for the Damned','Final Fantasy IX','2026-08-22T10:49:13.228106+00:00','https://www.youtube.com/watch?v=UB9ur-1ZWgE',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Viking_Funeral_for_the_Damned_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3602,'The Legacy','The Legend of Zelda: The Wind Waker','2026-08-21T21:49:16.888437+00:00','https://www.youtube.com/watch?v=LkI8A_eR1FI',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_The_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3603,'I''ll Always Be There','Final Fantasy IX','2026-08-22T05:53:07.543554+00:00','https://www.youtube.com/watch?v=wLyYXnEUHS4',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_I''ll_Always_Be_There_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3604,'The Cost of Vengeance','Ninja Gaiden','2026-08-21T23:48:39.407382+00:00','https://www.youtube.com/watch?v=3Fbu52eARrU',134,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_The_Cost_of_Vengeance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3605,'When Love Must Be Saved','Final Fantasy IX','2026-08-22T01:57:06.523299+00:00','https://www.youtube.com/watch?v=9llgBNzAlzc',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_When_Love_Must_Be_Saved_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3606,'Alpha, the Defect','Mega Man Battle Network 3: Blue Version','2026-08-21T23:48:37.985509+00:00','https://www.youtube.com/watch?v=wjC2nPNXpF4',883,'https://ocrmirror.org/files/music/remixes/Mega_Man_Battle_Network_3_Blue_Version_Alpha_the_Defect_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3607,'The Super Star Returns','Kirby Super Star','2026-08-22T07:08:58.446913+00:00','https://www.youtube.com/watch?v=qXUcRuoxPuY',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_The_Super_Star_Returns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3608,'Smash and Burn','Super Smash Bros. for Wii U','2026-08-22T04:59:14.759557+00:00','https://www.youtube.com/watch?v=fYOlb8Sui1Q',973,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_for_Wii_U_Smash_and_Burn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3609,'The Ultimate Armor','Mega Man X5','2026-08-22T07:54:17.260026+00:00','https://www.youtube.com/watch?v=80HftHVmK68',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_The_Ultimate_Armor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3610,'La Princesa de Taikun','Final Fantasy V','2026-08-22T08:56:52.122902+00:00','https://www.youtube.com/watch?v=K8VVjd7jy7A',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_La_Princesa_de_Taikun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3611,'E.S. Cinder','Dark Souls III','2026-08-22T03:20:41.356188+00:00','https://www.youtube.com/watch?v=lRGh0PFkGXg',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_ES_Cinder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3612,'A Link to the Future','The Legend of Zelda: A Link to the Past','2026-08-22T15:46:02.155997+00:00','https://www.youtube.com/watch?v=SgcdBOmu708',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_A_Link_to_the_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3613,'Sky High','Sonic the Hedgehog 2','2026-08-22T03:20:41.180720+00:00','https://www.youtube.com/watch?v=cyKKbGuOlyE',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Sky_High_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3614,'Yummy-yummies','Final Fantasy IX','2026-08-22T09:50:34.120699+00:00','https://www.youtube.com/watch?v=CTbVszhoFC8',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Yummy-yummies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3615,'Vacuum Shell','Beneath a Steel Sky','2026-08-22T01:57:06.385496+00:00','https://www.youtube.com/watch?v=YLUMdCxhXoY',13854,'https://ocrmirror.org/files/music/remixes/Beneath_a_Steel_Sky_Vacuum_Shell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3616,'Space Garden','Quest for Glory IV: Shadows of Darkness','2026-08-22T04:05:28.348279+00:00','https://www.youtube.com/watch?v=enAg_z7ap_E',16193,'https://ocrmirror.org/files/music/remixes/Quest_for_Glory_4_Space_Garden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3617,'Tricky Labyrinth','Super Mario RPG: Legend of the Seven Stars','2026-08-22T13:09:01.148640+00:00','https://www.youtube.com/watch?v=b6fKXLrZJmQ',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Tricky_Labyrinth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3618,'No Place Like Home','The Legend of Zelda: The Wind Waker','2026-08-22T04:59:16.012660+00:00','https://www.youtube.com/watch?v=545T0M8Y5Oo',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_No_Place_Like_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3619,'Mana''s Requiem','Secret of Mana','2026-08-21T22:50:52.054233+00:00','https://www.youtube.com/watch?v=OsM2bvd1Jgc',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Mana''s_Requiem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3620,'Da Funk Do You Know ''Bout Chip?','Chip''s Challenge','2026-08-22T01:57:06.107912+00:00','https://www.youtube.com/watch?v=8z_FB2Xg5gw',95474,'https://ocrmirror.org/files/music/remixes/Chip''s_Challenge_Da_Funk_Do_You_Know_''Bout_Chip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3621,'Hymn to the Crystals','Final Fantasy IV','2026-08-22T10:49:12.872983+00:00','https://www.youtube.com/watch?v=KBDe4TrbzcM',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Hymn_to_the_Crystals_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3622,'Kill the Groove','Castlevania: Order of Ecclesia','2026-08-22T05:53:06.657430+00:00','https://www.youtube.com/watch?v=LEgnDEuD4tk',579,'https://ocrmirror.org/files/music/remixes/Castlevania_Order_of_Ecclesia_Kill_the_Groove_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3623,'Morning Jazz','Animal Crossing: New Leaf','2026-08-22T05:53:07.187242+00:00','https://www.youtube.com/watch?v=8UCvLE6Yl_0',94800,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_New_Leaf_Morning_Jazz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3624,'The Curse That Binds Us','Dark Souls III','2026-08-22T11:45:17.908613+00:00','https://www.youtube.com/watch?v=iReq1lbsBc0',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_The_Curse_That_Binds_Us_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3625,'The Demon Star','Phantasy Star II','2026-08-22T04:59:14.578573+00:00','https://www.youtube.com/watch?v=m8304V7LkpY',94,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_2_The_Demon_Star_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3626,'Ebb and Flow','Bitstream','2026-08-22T01:57:06.951382+00:00','https://www.youtube.com/watch?v=qgnd5JvpAFc',95475,'https://ocrmirror.org/files/music/remixes/Bitstream_Ebb_and_Flow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3627,'Sunrise over the Silver City','Kirby: Canvas Curse','2026-08-22T13:51:44.233831+00:00','https://www.youtube.com/watch?v=LoQvDktTptw',572,'https://ocrmirror.org/files/music/remixes/Kirby_Canvas_Curse_Sunrise_over_the_Silver_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3628,'Lunar Phase','The Silver Case','2026-08-22T07:54:17.074155+00:00','https://www.youtube.com/watch?v=8hISHhZ2RU0',95477,'https://ocrmirror.org/files/music/remixes/Silver_Case_Lunar_Phase_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3629,'Cathedral of Carnage','Heretic','2026-08-22T13:09:00.616567+00:00','https://www.youtube.com/watch?v=pnM-JgVo4rQ',15050,'https://ocrmirror.org/files/music/remixes/Heretic_Cathedral_of_Carnage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3630,'Embrace the Darkness','Heretic','2026-08-22T07:54:16.538672+00:00','https://www.youtube.com/watch?v=T6X3kSf2rrg',15050,'https://ocrmirror.org/files/music/remixes/Heretic_Embrace_the_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3631,'Heart, Home, and Hearth','The Legend of Zelda: Ocarina of Time','2026-08-22T03:20:42.412735+00:00','https://www.youtube.com/watch?v=EWrRAI0DZgY',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Heart_Home_and_Hearth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3632,'Through the Clouds','Super Mario Bros. 3','2026-08-22T05:53:07.720779+00:00','https://www.youtube.com/watch?v=UJ2SOPgAXSw',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Through_the_Clouds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3633,'In the Beginning','Final Fantasy VII','2026-08-22T04:05:26.752323+00:00','https://www.youtube.com/watch?v=uxREPrsgw4Y',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_In_the_Beginning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3634,'Proto Man''s French Horn Concert','Mega Man 3','2026-08-22T05:53:07.364452+00:00','https://www.youtube.com/watch?v=DFFFPiPBqsA',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Proto_Man''s_French_Horn_Concert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3635,'Be Kind, Rewind','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-22T14:47:56.237092+00:00','https://www.youtube.com/watch?v=lns0V1VZHJw',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Be_Kind_Rewind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3636,'Feelings of Hometownishness','Dragon Slayer: The Legend of Heroes','2026-08-22T16:49:54.507966+00:00','https://www.youtube.com/watch?v=uRRvj7Ian6A',3723,'https://ocrmirror.org/files/music/remixes/Dragon_Slayer_The_Legend_of_Heroes_Feelings_of_Hometownishness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3637,'The Land of the Fayth','Final Fantasy X','2026-08-22T09:50:34.294641+00:00','https://www.youtube.com/watch?v=R5q8Eg3o1-M',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_The_Land_of_the_Fayth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3638,'S Is for: Solid Snake, Scrambled Signal, and Silenced SIG Sauer','Metal Gear','2026-08-22T10:49:13.762348+00:00','https://www.youtube.com/watch?v=LPH4j5RjfBo',140,'https://ocrmirror.org/files/music/remixes/Metal_Gear_S_Is_for_Solid_Snake_Scrambled_Signal_and_Silenced_SIG_Sauer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3639,'Conflagration','Dark Souls','2026-08-22T05:53:06.480156+00:00','https://www.youtube.com/watch?v=m7WlIBKbGP8',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Conflagration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3640,'Geofractura','Ecco: The Tides of Time','2026-08-22T07:54:16.717737+00:00','https://www.youtube.com/watch?v=KmiJtg9dP_M',607,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Geofractura_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3641,'Zeal Breeze','Chrono Trigger','2026-08-22T08:56:51.648211+00:00','https://www.youtube.com/watch?v=dLLwQ0u6gqg',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Zeal_Breeze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3642,'Forest Blast','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-22T05:53:06.834602+00:00','https://www.youtube.com/watch?v=ocqZZ86Ee2c',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Forest_Blast_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3643,'Launch the Cow!','Earthworm Jim','2026-08-22T17:46:12.230919+00:00','https://www.youtube.com/watch?v=u8e3r1ecCtM',499,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_Launch_the_Cow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3644,'Chaos, Cookies, and Cider','Undertale','2026-08-22T11:45:17.732588+00:00','https://www.youtube.com/watch?v=VyrP3VBECrM',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Chaos_Cookies_and_Cider_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3645,'Legacy of Darkness','Castlevania: Symphony of the Night','2026-08-22T16:49:53.617141+00:00','https://www.youtube.com/watch?v=IkvqjFLfu_8',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Legacy_of_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3646,'Are You BadAss?','Advance Wars','2026-08-22T16:49:53.972459+00:00','https://www.youtube.com/watch?v=39fUo_rf0Rs',8800,'https://ocrmirror.org/files/music/remixes/Advance_Wars_Are_You_BadAss_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3647,'Variations of Fear','Secret of Mana','2026-08-22T15:46:01.743559+00:00','https://www.youtube.com/watch?v=HyqTKLpTnZI',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Variations_of_Fear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3648,'Flying Fortress Foray','Secret of Mana','2026-08-22T09:50:34.467675+00:00','https://www.youtube.com/watch?v=nFHx_KiO1L8',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Flying_Fortress_Foray_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3649,'Footsteps to Destiny','Secret of Mana','2026-08-22T13:09:00.258882+00:00','https://www.youtube.com/watch?v=qI_wvy9D0UU',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Footsteps_to_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3650,'Azure Your Cause','Secret of Mana','2026-08-22T17:46:12.577058+00:00','https://www.youtube.com/watch?v=3IpxgUEpPWQ',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Azure_Your_Cause_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3651,'Reminiscence Beneath a Great Tree','Secret of Mana','2026-08-22T04:05:27.464067+00:00','https://www.youtube.com/watch?v=Td2E0EpM_1g',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Reminiscence_Beneath_a_Great_Tree_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3652,'Whispers','Secret of Mana','2026-07-21T03:55:30.225000+00:00','https://www.youtube.com/watch?v=hgzsSPnXqLc',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Whispers_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3653,'Tarmac Chill','R4: Ridge Racer Type 4','2026-08-22T14:47:57.838102+00:00','https://www.youtube.com/watch?v=45IWSmNwFVU',42860,'https://ocrmirror.org/files/music/remixes/R4_Ridge_Racer_Type_4_Tarmac_Chill_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3654,'Fathoms','Donkey Kong Country','2026-08-22T09:50:34.641422+00:00','https://www.youtube.com/watch?v=rsqucwuHY04',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Fathoms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3655,'The Still Night Stirs','Secret of Mana','2026-07-20T23:33:20.671729+00:00','https://www.youtube.com/watch?v=6OFZlzZvQmo',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_The_Still_Night_Stirs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3656,'Through the Mirror and Back','The Legend of Zelda: A Link to the Past','2026-08-22T10:49:12.330083+00:00','https://www.youtube.com/watch?v=Xzw8YnnXveI',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Through_the_Mirror_and_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3657,'Under Cover of Night','Secret of Mana','2026-08-22T14:47:56.773555+00:00','https://www.youtube.com/watch?v=sIp_nFld9KM',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Under_Cover_of_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3658,'Multi-track Drifting','The Legend of Zelda: Spirit Tracks','2026-08-22T04:05:28.171969+00:00','https://www.youtube.com/watch?v=S_XH6N_Js2I',57688,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Spirit_Tracks_Multi-track_Drifting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3659,'Lullaby of the Desert','The Legend of Zelda: Ocarina of Time','2026-08-22T13:51:43.878573+00:00','https://www.youtube.com/watch?v=1Uj9PnRGK0A',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Lullaby_of_the_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3660,'The Lost Explorer','Pokémon Mystery Dungeon: Explorers of Time','2026-08-22T07:08:59.356278+00:00','https://www.youtube.com/watch?v=gDhXnCEcBr8',690,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Explorers_of_Time_The_Lost_Explorer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3661,'Lies My Snifits Told Me','Super Mario RPG: Legend of the Seven Stars','2026-07-20T23:33:19.614397+00:00','https://www.youtube.com/watch?v=mTPR2MoWvn0',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Lies_My_Snifits_Told_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3662,'The Triforce Needs Five More Minutes','The Legend of Zelda: Breath of the Wild','2026-07-20T23:33:20.318796+00:00','https://www.youtube.com/watch?v=MmdVbNq8LSI',95360,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_The_Triforce_Needs_Five_More_Minutes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3663,'A Wistful Heart','Secret of Mana','2026-08-22T16:49:53.794402+00:00','https://www.youtube.com/watch?v=S1Dxi_nckos',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_A_Wistful_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3664,'Terror Plant','Donkey Kong Country','2026-08-22T09:50:33.946528+00:00','https://www.youtube.com/watch?v=mrokVMul7n4',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Terror_Plant_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3665,'The Journey Never Ends','Super Mario Bros. 3','2026-08-22T15:46:02.293978+00:00','https://www.youtube.com/watch?v=F0s3_N3QC-k',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_The_Journey_Never_Ends_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3666,'Beautiful Rise','NieR: Automata','2026-07-21T10:01:18.308257+00:00','https://www.youtube.com/watch?v=rpWzIUyCcZQ',95449,'https://ocrmirror.org/files/music/remixes/NieR_Automata_Beautiful_Rise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3667,'Masters of Mischief','Secret of Mana','2026-08-22T15:46:02.018737+00:00','https://www.youtube.com/watch?v=CdtWiPvHTro',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Masters_of_Mischief_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3668,'Morning Sunlight','Pokémon Gold Version','2026-08-22T14:47:57.304952+00:00','https://www.youtube.com/watch?v=EmQ_Hbd2lv8',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Morning_Sunlight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3669,'Snowy Pines','Final Fantasy VI','2026-08-22T08:56:50.744232+00:00','https://www.youtube.com/watch?v=LDx8N5tnkRQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Snowy_Pines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3670,'God from the Machine','Deus Ex','2026-08-22T17:46:13.266355+00:00','https://www.youtube.com/watch?v=ATf1G3GSXq0',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_God_from_the_Machine_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3671,'Fight or Flight','Chrono Trigger','2026-08-22T08:56:50.566168+00:00','https://www.youtube.com/watch?v=4q79y1SO-xU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Fight_or_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3672,'Wings of Glass','Delta','2026-08-22T05:53:06.298800+00:00','https://www.youtube.com/watch?v=TvcJg5hN5Io',360,'https://ocrmirror.org/files/music/remixes/Delta_Wings_of_Glass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3673,'Happy Times Are Back Again','Super Mario RPG: Legend of the Seven Stars','2026-08-22T11:45:17.201532+00:00','https://www.youtube.com/watch?v=xYU3aQnGSJk',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Happy_Times_Are_Back_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3674,'Far Away','Mirror''s Edge','2026-08-22T07:08:58.135251+00:00','https://www.youtube.com/watch?v=E-qXn25FYew',910,'https://ocrmirror.org/files/music/remixes/Mirror''s_Edge_Far_Away_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3675,'Samba del Anjos','Sonic the Hedgehog 3','2026-07-21T12:07:27.670909+00:00','https://www.youtube.com/watch?v=hSRPMhIHd2U',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Samba_del_Anjos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3676,'Springtime Smoothness','Sonic the Hedgehog','2026-08-22T10:49:13.050110+00:00','https://www.youtube.com/watch?v=JJ3J4MsE824',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Springtime_Smoothness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3677,'Chromed Gadgetry','Sonic the Hedgehog 3','2026-08-22T11:45:18.260006+00:00','https://www.youtube.com/watch?v=y-jkdczDSUQ',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Chromed_Gadgetry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3678,'Reversing the Alien Attack','Line Defense','2026-08-22T07:08:58.598716+00:00','https://www.youtube.com/watch?v=8s-2Cwq50fU',95495,'https://ocrmirror.org/files/music/remixes/Line_Defense_Reversing_the_Alien_Attack_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3679,'A Crook Man''s Eyes','Mega Man 5','2026-08-22T08:56:52.463112+00:00','https://www.youtube.com/watch?v=WL3g-I5MZb4',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_A_Crook_Man''s_Eyes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3680,'Sunny with a Chance of Thunder','Secret of Mana','2026-08-22T17:46:11.885664+00:00','https://www.youtube.com/watch?v=OSw6lSZdGVM',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Sunny_with_a_Chance_of_Thunder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3681,'Arrghus''s Lair','The Legend of Zelda: A Link Between Worlds','2026-08-22T07:54:16.361182+00:00','https://www.youtube.com/watch?v=zo4Z1UfWQW8',94860,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_Between_Worlds_Arrghus''s_Lair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3682,'The Universe','Final Fantasy IV','2026-08-22T10:49:12.695052+00:00','https://www.youtube.com/watch?v=uWoiqqeBURA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_The_Universe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3683,'The Last Laugh','Banjo-Kazooie','2026-08-22T10:49:12.512989+00:00','https://www.youtube.com/watch?v=c5KghtNdY9o',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_The_Last_Laugh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3684,'Moonlight Dance','Seiken Densetsu 3','2026-08-22T08:56:50.387009+00:00','https://www.youtube.com/watch?v=u4gREGoguwc',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Moonlight_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3685,'The Ultimate Ab Solution','Sonic the Hedgehog','2026-07-21T10:01:17.078819+00:00','https://www.youtube.com/watch?v=gO4ZOYZIkjw',583,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_The_Ultimate_Ab_Solution_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3686,'Finding Your Inner Alien','Final Fantasy VII','2026-08-22T14:47:57.127609+00:00','https://www.youtube.com/watch?v=OkanJx5mA5M',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Finding_Your_Inner_Alien_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3687,'Homecoming','Turrican 3','2026-08-22T10:49:13.940515+00:00','https://www.youtube.com/watch?v=DsVgzmhCbeQ',8283,'https://ocrmirror.org/files/music/remixes/Turrican_3_Homecoming_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3688,'Terra''s Love','Final Fantasy VI','2026-08-22T08:56:50.209887+00:00','https://www.youtube.com/watch?v=Hf7paBBPn5s',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra''s_Love_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3689,'Non-Sense Paradise','Parodius','2026-08-22T07:54:17.790300+00:00','https://www.youtube.com/watch?v=o19eSIs6ktU',11252,'https://ocrmirror.org/files/music/remixes/Parodius_Non-Sense_Paradise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3690,'Funky Morty','Crypt of the NecroDancer','2026-08-22T11:45:18.084996+00:00','https://www.youtube.com/watch?v=Cu5EjmNjwk0',95499,'https://ocrmirror.org/files/music/remixes/Crypt_of_the_NecroDancer_Funky_Morty_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3691,'Aquapump','Sonic the Hedgehog 3','2026-08-22T13:51:44.947013+00:00','https://www.youtube.com/watch?v=5kCgbsdt3NU',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Aquapump_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3692,'Arkista Girl and I Liked It','Arkista''s Ring','2026-08-22T14:47:56.950384+00:00','https://www.youtube.com/watch?v=JtmJXesqIo0',3214,'https://ocrmirror.org/files/music/remixes/Arkista''s_Ring_Arkista_Girl_and_I_Liked_It_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3693,'Binding','The Wolf Among Us: Season One','2026-08-22T11:45:18.435866+00:00','https://www.youtube.com/watch?v=BYjOG9vjElE',95500,'https://ocrmirror.org/files/music/remixes/Wolf_Among_Us_Season_One_Binding_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3694,'The Spectral Mire','Undertale','2026-07-21T14:33:22.537108+00:00','https://www.youtube.com/watch?v=Yp1wjKGMxpk',95077,'https://ocrmirror.org/files/music/remixes/Undertale_The_Spectral_Mire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3695,'Only Link Can Do the Duck Walk','Zelda: The Wand of Gamelon','2026-08-22T13:51:43.342236+00:00','https://www.youtube.com/watch?v=qYWVvvBikTI',95459,'https://ocrmirror.org/files/music/remixes/Zelda_The_Wand_of_Gamelon_Only_Link_Can_Do_the_Duck_Walk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3696,'All I Want for Christmas Is Grandma''s Sweet Elixir Soup','The Legend of Zelda: The Wind Waker','2026-08-22T17:46:12.058785+00:00','https://www.youtube.com/watch?v=dwFXeGT1LxY',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_All_I_Want_for_Christmas_Is_Grandma''s_Sweet_Elixir_Soup_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3697,'Squitter''s Dream','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-21T03:55:28.986764+00:00','https://www.youtube.com/watch?v=pRzP_JVlaEg',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Squitter''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3698,'Cymbals and Screams','Kingdom Hearts','2026-07-20T23:33:20.142989+00:00','https://www.youtube.com/watch?v=okr2nPlPkfM',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Cymbals_and_Screams_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3699,'Epic Steps','Dance Dance Revolution Extreme','2026-08-22T07:08:59.509233+00:00','https://www.youtube.com/watch?v=0_yejkBoTyk',28094,'https://ocrmirror.org/files/music/remixes/Dance_Dance_Revolution_Extreme_Epic_Steps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3700,'Cannon Straits','Cannon Fodder','2026-08-22T16:49:54.328974+00:00','https://www.youtube.com/watch?v=yNW2HyATe34',5234,'https://ocrmirror.org/files/music/remixes/Cannon_Fodder_Cannon_Straits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3701,'The First Look at Gold','The Legend of Zelda','2026-08-22T13:51:44.056292+00:00','https://www.youtube.com/watch?v=Ix14nXKPMtA',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_First_Look_at_Gold_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3702,'The Jazzy Cosmos','Sonic CD','2026-08-22T14:47:56.596587+00:00','https://www.youtube.com/watch?v=7DMK0rHAIeg',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_The_Jazzy_Cosmos_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3703,'Late in the Caribbean','The Secret of Monkey Island','2026-08-22T09:50:35.336074+00:00','https://www.youtube.com/watch?v=qjrBc9N7Vr4',212,'https://ocrmirror.org/files/music/remixes/Secret_of_Monkey_Island_Late_in_the_Caribbean_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3704,'Looser Tool','Lunar Pool','2026-08-22T14:47:56.418656+00:00','https://www.youtube.com/watch?v=gdSPNLUo_PY',4248,'https://ocrmirror.org/files/music/remixes/Lunar_Pool_Looser_Tool_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3705,'The Call from the Mine','Final Fantasy VII','2026-08-22T13:09:01.324960+00:00','https://www.youtube.com/watch?v=YgUk6MBl5go',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Call_from_the_Mine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3706,'The Champion of Hyrule','The Legend of Zelda: Breath of the Wild','2026-07-21T10:01:17.255727+00:00','https://www.youtube.com/watch?v=6wbl2t_GNBs',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_The_Champion_of_Hyrule_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3707,'Anthropoid Overture','Donkey Kong 64','2026-08-22T13:08:59.901446+00:00','https://www.youtube.com/watch?v=7a39MLawKT4',2955,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_64_Anthropoid_Overture_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3708,'Welcome Goombo Probably','Super Mario Land','2026-07-21T14:33:23.247684+00:00','https://www.youtube.com/watch?v=LrTwoIWBxNY',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Welcome_Goombo_Probably_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3709,'Feastal Procession','Front Mission: Gun Hazard','2026-08-22T13:08:59.720040+00:00','https://www.youtube.com/watch?v=8WLoHGJxe98',11028,'https://ocrmirror.org/files/music/remixes/Front_Mission_Gun_Hazard_Feastal_Procession_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3710,'Memory: Night','Super Paper Mario','2026-08-22T15:46:02.431894+00:00','https://www.youtube.com/watch?v=gDxWDuZVbWI',45416,'https://ocrmirror.org/files/music/remixes/Super_Paper_Mario_Memory_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3711,'Dance Like Popcorn','Maui Mallard in Cold Shadow','2026-08-22T17:46:12.748899+00:00','https://www.youtube.com/watch?v=w5dDbO6xp1E',24382,'https://ocrmirror.org/files/music/remixes/Maui_Mallard_in_Cold_Shadow_Dance_Like_Popcorn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3712,'Legends Around the Fire','The Elder Scrolls V: Skyrim','2026-08-22T13:51:43.523420+00:00','https://www.youtube.com/watch?v=b3HldRHxuMQ',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Legends_Around_the_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3713,'Burning the Clocktower','Castlevania: Dracula X','2026-08-22T16:49:53.257491+00:00','https://www.youtube.com/watch?v=V36GJr9mI5Y',10916,'https://ocrmirror.org/files/music/remixes/Castlevania_Dracula_X_Burning_the_Clocktower_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3714,'Sword of God','Jeanne d''Arc','2026-08-22T15:46:01.326005+00:00','https://www.youtube.com/watch?v=SvHr-GeCijc',47705,'https://ocrmirror.org/files/music/remixes/Jeanne_d''Arc_Sword_of_God_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3715,'Autos, Arps & Minimoogs','Sega Rally Championship','2026-07-20T23:33:20.494919+00:00','https://www.youtube.com/watch?v=xqfrCFgIbIU',940,'https://ocrmirror.org/files/music/remixes/Sega_Rally_Championship_Autos_Arps_&_Minimoogs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3716,'Dracula Is Our Vampire!','Super Castlevania IV','2026-07-21T03:55:30.047595+00:00','https://www.youtube.com/watch?v=zmZBsDpRlzY',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Dracula_Is_Our_Vampire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3717,'Together We Will Stand','Secret of Mana','2026-07-21T03:55:29.517504+00:00','https://www.youtube.com/watch?v=ot9KC_0J7tU',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Together_We_Will_Stand_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3718,'A Journey Through Grand Oceans','Donkey Kong Country','2026-08-22T11:45:17.016080+00:00','https://www.youtube.com/watch?v=CYMFFWu8NJg',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_A_Journey_Through_Grand_Oceans_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3719,'One Small Step','Mass Effect','2026-07-21T20:44:10.207883+00:00','https://www.youtube.com/watch?v=a6TdxwLrEFw',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_One_Small_Step_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3720,'Gerudo Desert Party','The Legend of Zelda: Ocarina of Time','2026-08-22T13:51:44.769504+00:00','https://www.youtube.com/watch?v=ez8UVARP5MQ',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Gerudo_Desert_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3721,'The Rules of the Road','Final Fantasy VII','2026-07-22T01:00:06.752439+00:00','https://www.youtube.com/watch?v=EoKTXAyoWK0',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Rules_of_the_Road_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3722,'X''s Demise','Mega Man X2','2026-07-21T18:48:59.407341+00:00','https://www.youtube.com/watch?v=SiNLDoH8AKQ',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_X''s_Demise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3723,'Seeds in the Frost','The Legend of Zelda: Oracle of Seasons','2026-08-22T16:49:53.080343+00:00','https://www.youtube.com/watch?v=J8sH913RKZM',726,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Seasons_Seeds_in_the_Frost_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3724,'Divine Princess of Destiny','The Legend of Zelda: A Link to the Past','2026-07-21T16:54:26.258484+00:00','https://www.youtube.com/watch?v=KhnNqOjj7U8',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Divine_Princess_of_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3725,'In the Heat of Battle','Assassin''s Creed Brotherhood','2026-07-20T23:33:19.258376+00:00','https://www.youtube.com/watch?v=FDqShyYLz6I',95511,'https://ocrmirror.org/files/music/remixes/Assassin''s_Creed_Brotherhood_In_the_Heat_of_Battle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3726,'Plastik Skies','Daytona USA','2026-07-21T12:07:28.530052+00:00','https://www.youtube.com/watch?v=j-lkwdFlVn4',28149,'https://ocrmirror.org/files/music/remixes/Daytona_USA_Plastik_Skies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3727,'Final Ride','OutRun','2026-07-21T10:01:17.782589+00:00','https://www.youtube.com/watch?v=XVfpSV2GwOY',139,'https://ocrmirror.org/files/music/remixes/OutRun_Final_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3728,'Tail Chaser','Metropolis Street Racer','2026-07-21T23:29:54.210643+00:00','https://www.youtube.com/watch?v=1g6S_Tma1dM',13313,'https://ocrmirror.org/files/music/remixes/Metropolis_Street_Racer_Tail_Chaser_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3729,'Sixty Force Techno','Shining Force II','2026-07-20T23:33:19.967361+00:00','https://www.youtube.com/watch?v=YmV62hC4GM4',6653,'https://ocrmirror.org/files/music/remixes/Shining_Force_2_Sixty_Force_Techno_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3730,'Rolling','Mega Man X','2026-07-22T01:00:06.581038+00:00','https://www.youtube.com/watch?v=XIeECpV3I1s',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Rolling_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3731,'Interruptible Power','Donkey Kong Country','2026-07-21T03:55:29.342061+00:00','https://www.youtube.com/watch?v=s2WLNLGyDqs',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Interruptible_Power_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3732,'Factory of Fear','Donkey Kong Country','2026-07-21T03:55:30.578643+00:00','https://www.youtube.com/watch?v=kvMPPjAo2JQ',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Factory_of_Fear_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3733,'Burning Vigor','Street Fighter II: The World Warrior','2026-08-22T13:09:00.437890+00:00','https://www.youtube.com/watch?v=l_EyqklF3-8',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Burning_Vigor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3734,'Glitterbomb','Undertale','2026-07-21T18:48:58.635296+00:00','https://www.youtube.com/watch?v=3PUwYH-i-Ok',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Glitterbomb_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3735,'Flight of the Peacock','Mega Man X4','2026-07-21T16:54:26.083155+00:00','https://www.youtube.com/watch?v=Dz6bB_JWsQ8',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Flight_of_the_Peacock_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3736,'Dark Side of the Moon','DuckTales','2026-07-21T07:07:13.117922+00:00','https://www.youtube.com/watch?v=oQ9mzW5ckR4',50,'https://ocrmirror.org/files/music/remixes/DuckTales_Dark_Side_of_the_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3737,'GROAN ver. T7','Street Fighter Alpha 3','2026-07-21T03:55:30.400681+00:00','https://www.youtube.com/watch?v=wuC_-T2QUmc',867,'https://ocrmirror.org/files/music/remixes/Street_Fighter_Alpha_3_GROAN_ver_T7_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3738,'Mysterious Gold Edition','The Legend of Zelda: Link''s Awakening','2026-07-22T04:45:49.803963+00:00','https://www.youtube.com/watch?v=_jA-TBJtYKM',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Mysterious_Gold_Edition_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3739,'Dreams of the Deep','Tangledeep','2026-07-21T14:33:23.425432+00:00','https://www.youtube.com/watch?v=4LWls4RSJ2M',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_Dreams_of_the_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3740,'Ecstatic Heights','Final Fantasy VI','2026-07-21T03:55:29.166163+00:00','https://www.youtube.com/watch?v=Rm-jDK4Mrd8',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Ecstatic_Heights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3741,'Galuf''s World','Final Fantasy V','2026-07-21T07:07:12.938849+00:00','https://www.youtube.com/watch?v=-kaKCa9SKIQ',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Galuf''s_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3742,'Tema de Simón','Super Castlevania IV','2026-07-21T07:07:12.578687+00:00','https://www.youtube.com/watch?v=rGyBJ-6BDBA',20,'https://ocrmirror.org/files/music/remixes/Super_Castlevania_4_Tema_de_Simon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3743,'Choose Your Destiny','Super Smash Bros. Melee','2026-07-21T18:48:58.859454+00:00','https://www.youtube.com/watch?v=dQyp3u8z2ac',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Choose_Your_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3744,'Awakening of the Forest Sage','The Legend of Zelda: Ocarina of Time','2026-08-22T14:47:57.661626+00:00','https://www.youtube.com/watch?v=DEFOfzExfvE',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Awakening_of_the_Forest_Sage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3745,'Echoes of Dusk','The Legend of Zelda: Twilight Princess','2026-07-20T23:33:19.435287+00:00','https://www.youtube.com/watch?v=yfvBvnwECpg',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Echoes_of_Dusk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3746,'Elements of Time','Chrono Trigger','2026-07-21T12:07:28.186384+00:00','https://www.youtube.com/watch?v=1ELDCrSmSIE',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Elements_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3747,'Lady in Black','Cat Lady','2026-07-21T16:54:25.025317+00:00','https://www.youtube.com/watch?v=R25mR4XMzRM',95516,'https://ocrmirror.org/files/music/remixes/Cat_Lady_Lady_in_Black_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3748,'Supersonic','Sonic the Hedgehog','2026-08-22T15:46:01.185982+00:00','https://www.youtube.com/watch?v=KtOAHWbJGdo',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Supersonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3749,'The Old Man and the Devil','Tekken 7','2026-08-22T16:49:52.899112+00:00','https://www.youtube.com/watch?v=bOXOUruGsJ8',95512,'https://ocrmirror.org/files/music/remixes/Tekken_7_The_Old_Man_and_the_Devil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3750,'Cosmo','Final Fantasy VII','2026-07-21T16:54:25.560146+00:00','https://www.youtube.com/watch?v=vROefHNYqwc',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Cosmo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3751,'Riptide Rush','Super Mario RPG: Legend of the Seven Stars','2026-07-21T07:07:13.834608+00:00','https://www.youtube.com/watch?v=hxs2Ut0R-dY',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Riptide_Rush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3752,'Save the Animals','Super Metroid','2026-07-21T07:07:12.212346+00:00','https://www.youtube.com/watch?v=eZxT4m5gMyc',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Save_the_Animals_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3753,'All That Remains','Mario & Luigi: Bowser''s Inside Story','2026-07-21T10:01:18.483409+00:00','https://www.youtube.com/watch?v=JnNIrZdkGRs',51128,'https://ocrmirror.org/files/music/remixes/Mario_&_Luigi_Bowser''s_Inside_Story_All_That_Remains_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3754,'Blue Lava, Grass Landing','Kirby''s Epic Yarn','2026-07-21T07:07:12.759683+00:00','https://www.youtube.com/watch?v=nCeSZ8HzcM0',94413,'https://ocrmirror.org/files/music/remixes/Kirby''s_Epic_Yarn_Blue_Lava_Grass_Landing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3755,'Do You Need a Light?','Zelda II: The Adventure of Link','2026-08-22T16:49:53.439159+00:00','https://www.youtube.com/watch?v=-CGEAk_kOGQ',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Do_You_Need_a_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3756,'Variations on a Lost Soul','BioShock','2026-08-22T15:46:01.604713+00:00','https://www.youtube.com/watch?v=lYjWcCY3sw4',51460,'https://ocrmirror.org/files/music/remixes/BioShock_Variations_on_a_Lost_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3757,'Trichotomy','Final Fantasy Tactics','2026-07-22T01:00:06.069377+00:00','https://www.youtube.com/watch?v=q3Syo0q6WGs',279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Tactics_Trichotomy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3758,'Shovel Power','Shovel Knight','2026-07-21T12:07:28.702837+00:00','https://www.youtube.com/watch?v=PaskSfYZ7g8',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_Shovel_Power_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3759,'On Fire','Shantae and the Pirate''s Curse','2026-07-21T18:48:59.624512+00:00','https://www.youtube.com/watch?v=ypBUQSPhy9g',95454,'https://ocrmirror.org/files/music/remixes/Shantae_and_the_Pirate''s_Curse_On_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3760,'Waltz of the Wind God','Mega Man 9','2026-07-21T10:01:17.958243+00:00','https://www.youtube.com/watch?v=G8pbvipV0Ds',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Waltz_of_the_Wind_God_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3761,'Gaster''s Legacy','Undertale','2026-08-22T17:46:13.094038+00:00','https://www.youtube.com/watch?v=tLn-7fEeaIc',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Gaster''s_Legacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3762,'Deeper in the Heart','Dragon Warrior VII','2026-07-21T12:07:28.358122+00:00','https://www.youtube.com/watch?v=Zh4VF3l-8Uc',41764,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_7_Deeper_in_the_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3763,'Windborne','The Legend of Zelda: Breath of the Wild','2026-07-21T12:07:28.014406+00:00','https://www.youtube.com/watch?v=pnjkAr0qeiQ',95360,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Windborne_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3764,'The Ashes Judge','Dark Souls III','2026-07-21T03:55:29.870317+00:00','https://www.youtube.com/watch?v=ZYqev7eGhnE',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_The_Ashes_Judge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3765,'The Children of Yharnam','Bloodborne','2026-08-22T17:46:11.708730+00:00','https://www.youtube.com/watch?v=s8SefRrHguo',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_The_Children_of_Yharnam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3766,'The Swaggin'' Dragon','The Legend of Zelda: The Wind Waker','2026-07-21T07:07:12.396886+00:00','https://www.youtube.com/watch?v=zvzWH5yRGUY',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_The_Swaggin''_Dragon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3767,'Snake Buster','Mega Man 3','2026-07-21T12:07:27.495587+00:00','https://www.youtube.com/watch?v=qYywx1gXIiE',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Snake_Buster_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3768,'No Cab, Fan Pride: Boku No Infinite Thotty Gaiden','Secret of Mana','2026-07-21T22:27:01.077347+00:00','https://www.youtube.com/watch?v=59qP-tRuFeQ',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_No_Cab_Fan_Pride_Boku_No_Infinite_Thotty_Gaiden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3769,'Digging into Memories','Shovel Knight','2026-07-22T01:00:05.898381+00:00','https://www.youtube.com/watch?v=tqs9bAfBCUQ',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_Digging_into_Memories_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3770,'This Wicked Heart of Mine','Castlevania','2026-07-21T20:44:10.069990+00:00','https://www.youtube.com/watch?v=N-ZjnalwOzI',18,'https://ocrmirror.org/files/music/remixes/Castlevania_This_Wicked_Heart_of_Mine_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3771,'Revelation','Final Fantasy X','2026-07-22T10:37:56.041592+00:00','https://www.youtube.com/watch?v=SsT5pbV17f0',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Revelation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3772,'Sanctity','Assassin''s Creed IV: Black Flag','2026-07-21T07:07:13.656201+00:00','https://www.youtube.com/watch?v=oIGfJpmeYks',95526,'https://ocrmirror.org/files/music/remixes/Assassin''s_Creed_4_Sanctity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3773,'Blue Wolves and Ice','Secret of Mana','2026-07-21T12:07:29.046404+00:00','https://www.youtube.com/watch?v=E7vpjiLCfmk',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Blue_Wolves_and_Ice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3774,'Forest Wraiths','The Legend of Zelda: Ocarina of Time','2026-07-21T12:07:28.875400+00:00','https://www.youtube.com/watch?v=dNKz4vIIGec',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Forest_Wraiths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3775,'Ruby Distortions','Sonic Mania','2026-08-22T17:46:12.404162+00:00','https://www.youtube.com/watch?v=0uIyHpIGX8M',95531,'https://ocrmirror.org/files/music/remixes/Sonic_Mania_Ruby_Distortions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3776,'Journey''s End','Dark Souls III','2026-07-22T16:55:01.684259+00:00','https://www.youtube.com/watch?v=ty0Lf-ktBLM',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_Journey''s%20End_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3777,'Pour the Poison Out','Final Fantasy VII','2026-07-21T10:01:17.606475+00:00','https://www.youtube.com/watch?v=F4bIcMjtET4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Pour_the_Poison_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3778,'Some Distance','Uncharted 4: A Thief''s End','2026-07-21T20:44:09.493681+00:00','https://www.youtube.com/watch?v=YUWqbDnAQZw',95530,'https://ocrmirror.org/files/music/remixes/Uncharted_4_Some_Distance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3779,'So It Goes','Final Fantasy X-2','2026-07-21T14:33:22.714584+00:00','https://www.youtube.com/watch?v=APdcOJ4qU0U',438,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10-2_So_It_Goes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3780,'Wishing on a Snowman','EarthBound','2026-07-21T16:54:26.434934+00:00','https://www.youtube.com/watch?v=Z9Gx_OoQ4XI',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Wishing_on_a_Snowman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3781,'Skipper Supreme','The Legend of Zelda: Skyward Sword','2026-07-21T03:55:29.693862+00:00','https://www.youtube.com/watch?v=UnnizoCj5Gg',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Skipper_Supreme_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3782,'Progressive Memory','Final Fantasy IV','2026-07-22T15:19:29.101082+00:00','https://www.youtube.com/watch?v=_QbWDucfEKM',52276,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Progressive_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3783,'Fayth in You','Final Fantasy X','2026-07-21T22:26:59.838260+00:00','https://www.youtube.com/watch?v=UdfQhvd4Ee4',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Fayth_in_You_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3784,'Whale of September','Breath of Fire II','2026-07-21T10:01:17.430753+00:00','https://www.youtube.com/watch?v=_k67EvdsPMQ',349,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_2_Whale_of_September_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3785,'The Nature of Evil','Castlevania II: Simon''s Quest','2026-07-21T16:54:26.608826+00:00','https://www.youtube.com/watch?v=rQIz5y-oo6Q',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_The_Nature_of_Evil_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3786,'Family Man','Street Fighter II: The World Warrior','2026-07-22T12:57:08.683724+00:00','https://www.youtube.com/watch?v=hQ7rsG9Kkbc',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Family_Man_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3787,'Take Flight','The Legend of Zelda: Breath of the Wild','2026-07-21T18:48:59.188312+00:00','https://www.youtube.com/watch?v=9Re7itOSNhk',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Take_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3788,'Beyond the Big Infinity','Secret of Mana','2026-07-22T04:45:49.628299+00:00','https://www.youtube.com/watch?v=AQg4XYqPg4I',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Beyond_the_Big_Infinity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3789,'Block Invaders','Quarth','2026-07-21T14:33:22.892840+00:00','https://www.youtube.com/watch?v=JuvQwZ5yOM0',4036,'https://ocrmirror.org/files/music/remixes/Quarth_Block_Invaders_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3790,'Red Shifting Drift','Mega Man X','2026-07-21T23:29:54.911025+00:00','https://www.youtube.com/watch?v=AdnOBFmBozg',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Red_Shifting_Drift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3791,'For Her Soul','Shadow of the Colossus','2026-07-21T22:27:00.019941+00:00','https://www.youtube.com/watch?v=6MICPpBVlKU',502,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Colossus_For_Her_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3792,'Smell the Steamy Flowers','Super Mario Odyssey','2026-07-21T18:48:59.298008+00:00','https://www.youtube.com/watch?v=HkDroy7PTgQ',95486,'https://ocrmirror.org/files/music/remixes/Super_Mario_Odyssey_Smell_the_Steamy_Flowers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3793,'Time of Courage','The Legend of Zelda: A Link to the Past','2026-07-21T18:48:59.516027+00:00','https://www.youtube.com/watch?v=pUmg2trqhhU',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Time_of_Courage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3794,'Children of Zakarum','Diablo II','2026-07-22T04:45:48.570256+00:00','https://www.youtube.com/watch?v=NzIV2iWEOHY',109,'https://ocrmirror.org/files/music/remixes/Diablo_2_Children_of_Zakarum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3795,'Six Feet Beneath the Veldt','Final Fantasy VI','2026-07-22T16:55:02.233179+00:00','https://www.youtube.com/watch?v=_MxbUmQy5w8',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Six_Feet_Beneath_the_Veldt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3796,'Surpassing the Gods','Seiken Densetsu 3','2026-07-23T01:00:26.724538+00:00','https://www.youtube.com/watch?v=KyJVsIyi8EY',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Surpassing_the_Gods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3797,'Brooding Tolerance','Seiken Densetsu 3','2026-07-21T16:54:25.909343+00:00','https://www.youtube.com/watch?v=0bcpAv-pb4Q',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Brooding_Tolerance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3798,'Summer Tea Time','Seiken Densetsu 3','2026-07-21T23:29:54.560579+00:00','https://www.youtube.com/watch?v=uxMglqIb9uA',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Summer_Tea_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3799,'Scavenger','Seiken Densetsu 3','2026-07-21T23:29:53.542026+00:00','https://www.youtube.com/watch?v=e8VpcazfU0w',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Scavenger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3800,'Do the Splash Hop','Seiken Densetsu 3','2026-07-22T15:19:30.130499+00:00','https://www.youtube.com/watch?v=sTmrjIw0QZE',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Do_the_Splash_Hop_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3801,'Gate Total Peril','Seiken Densetsu 3','2026-07-21T23:29:54.735275+00:00','https://www.youtube.com/watch?v=oun4WGQi4fQ',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Gate_Total_Peril_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3802,'Radiate Me - A Brief Dream of Victory','Seiken Densetsu 3','2026-07-21T20:44:09.210135+00:00','https://www.youtube.com/watch?v=Z9C0VXwAM88',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Radiate_Me_A_Brief_Dream_of_Victory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3803,'The Fairy and the Water Dragon','Chrono Cross','2026-07-21T12:07:27.842817+00:00','https://www.youtube.com/watch?v=JQUL-FvkMjk',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_The_Fairy_and_the_Water_Dragon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3804,'Mother of Turmoil','Seiken Densetsu 3','2026-07-21T14:33:22.355800+00:00','https://www.youtube.com/watch?v=dEax9OTSMwM',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Mother_of_Turmoil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3805,'Sword of Storms','The Legend of Zelda: Skyward Sword','2026-07-21T14:33:23.070435+00:00','https://www.youtube.com/watch?v=X0XwG_JiXPU',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Sword_of_Storms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3806,'The Vast Glass Orb','Tyrants: Fight Through Time','2026-07-21T10:01:16.897963+00:00','https://www.youtube.com/watch?v=4pV7hzO3F9s',6511,'https://ocrmirror.org/files/music/remixes/Tyrants_The_Vast_Glass_Orb_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3807,'The Fairytale Fair','Seiken Densetsu 3','2026-07-21T23:29:54.034697+00:00','https://www.youtube.com/watch?v=3BYh1gnypNc',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_The_Fairytale_Fair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3808,'Nightshade Masques','Seiken Densetsu 3','2026-07-21T22:27:00.548453+00:00','https://www.youtube.com/watch?v=kj56Iigsurk',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Nightshade_Masques_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3809,'Playtime''s Over','Darkwing Duck','2026-07-21T20:44:09.932591+00:00','https://www.youtube.com/watch?v=dl4wRGMJX6U',356,'https://ocrmirror.org/files/music/remixes/Darkwing_Duck_Playtime''s_Over_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3810,'Made of Metal','Mega Man 2','2026-07-21T16:54:25.385839+00:00','https://www.youtube.com/watch?v=I_2-BsMhXI0',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Made_of_Metal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3811,'The Fearless Angel','Seiken Densetsu 3','2026-07-22T20:37:34.118043+00:00','https://www.youtube.com/watch?v=OuEcqXV98GA',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_The_Fearless_Angel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3812,'I Accidentally the Whole Mario','Super Mario Land','2026-07-22T04:45:50.153649+00:00','https://www.youtube.com/watch?v=KgrdgzdpoVY',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_I_Accidentally_the_Whole_Mario_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3813,'The Final Moments','Seiken Densetsu 3','2026-07-21T10:01:18.133370+00:00','https://www.youtube.com/watch?v=SK9JZJsQTak',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_The_Final_Moments_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3814,'Dark World of Beats','Final Fantasy VI','2026-07-22T01:00:06.410933+00:00','https://www.youtube.com/watch?v=kgM5xfHn3mI',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dark_World_of_Beats_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3815,'Tilt & Drift','Mario Kart DS','2026-07-21T14:33:23.779658+00:00','https://www.youtube.com/watch?v=AWMVcZ2X2W8',517,'https://ocrmirror.org/files/music/remixes/Mario_Kart_DS_Tilt_&_Drift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3816,'Envenomation','Mega Man 3','2026-07-21T18:48:58.969065+00:00','https://www.youtube.com/watch?v=SeugOktkiR8',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Envenomation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3817,'March to High','Seiken Densetsu 3','2026-07-22T12:57:08.161227+00:00','https://www.youtube.com/watch?v=FZoM8mpq1nA',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_March_to_High_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3818,'One Dream, One Destiny','Final Fantasy X','2026-07-21T23:29:53.721903+00:00','https://www.youtube.com/watch?v=kt557XleFss',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_One_Dream_One_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3819,'The Dragon Emperor''s Calling','Seiken Densetsu 3','2026-07-22T15:19:29.958717+00:00','https://www.youtube.com/watch?v=L-_1vrgJk9c',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_The_Dragon_Emperor''s_Calling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3820,'Electric Monstro Carnival','Super Mario RPG: Legend of the Seven Stars','2026-07-22T07:54:01.626819+00:00','https://www.youtube.com/watch?v=A-Q4dtsOU6c',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Electric_Monstro_Carnival_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3821,'Kung-Fu Step','Yie Ar Kung-Fu','2026-07-21T16:54:25.209674+00:00','https://www.youtube.com/watch?v=ZzOGTBCPioM',4581,'https://ocrmirror.org/files/music/remixes/Yie_Ar_Kung-Fu_Kung-Fu_Step_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3822,'The Eternal Heartbeat of Mana','Seiken Densetsu 3','2026-07-22T07:54:01.112975+00:00','https://www.youtube.com/watch?v=1umomYWluW0',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_The_Eternal_Heartbeat_of_Mana_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3823,'Bag Full of Kinstones','The Legend of Zelda: The Minish Cap','2026-07-23T04:51:00.530197+00:00','https://www.youtube.com/watch?v=3vfuye4VuC0',9081,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Minish_Cap_Bag_Full_of_Kinstones_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3824,'A Town That''s Right for Me','Phantasy Star III: Generations of Doom','2026-07-22T16:55:01.860915+00:00','https://www.youtube.com/watch?v=TJLFQPBL30Q',95,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_3_A_Town_That''s_Right_for_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3825,'Sweet Dreams, Koholint','The Legend of Zelda: Link''s Awakening','2026-07-22T10:37:55.474235+00:00','https://www.youtube.com/watch?v=J2LLhmZSwbc',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Sweet_Dreams_Koholint_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3826,'Home Again','Suikoden III','2026-07-22T20:37:34.292733+00:00','https://www.youtube.com/watch?v=t5kq-hjqxDY',10586,'https://ocrmirror.org/files/music/remixes/Suikoden_3_Home_Again_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3827,'Nine Inch Super Mushrooms','Super Mario World','2026-07-22T12:57:08.507690+00:00','https://www.youtube.com/watch?v=2NKrYsU7o9A',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Nine_Inch_Super_Mushrooms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3828,'In a Thousand Years','Seiken Densetsu 3','2026-07-21T16:54:25.734835+00:00','https://www.youtube.com/watch?v=eeDPLMAju0g',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_In_a_Thousand_Years_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3829,'Dream ''til Tomorrow','Final Fantasy VI','2026-07-22T22:32:49.229890+00:00','https://www.youtube.com/watch?v=b1wbegi3YyU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dream_''til_Tomorrow_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3830,'Me and My Game Boy','Brave Fencer Musashi','2026-07-22T07:54:00.942137+00:00','https://www.youtube.com/watch?v=QylrGXePZkA',275,'https://ocrmirror.org/files/music/remixes/Brave_Fencer_Musashi_Me_and_My_Game_Boy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3831,'Pajarito Paisa','The Legend of Zelda: The Wind Waker','2026-07-21T20:44:10.482039+00:00','https://www.youtube.com/watch?v=AtPxtddHJaI',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Pajarito_Paisa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3832,'Pale Ale from Bale','The Legend of Dragoon','2026-07-21T20:44:09.351849+00:00','https://www.youtube.com/watch?v=A64brvCeH38',715,'https://ocrmirror.org/files/music/remixes/Legend_of_Dragoon_Pale_Ale_from_Bale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3833,'You Got the Power','Mega Man 3','2026-07-21T14:33:23.956156+00:00','https://www.youtube.com/watch?v=vL1wNXW7q1o',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_You_Got_the_Power_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3834,'Midsummer Sorcery','Seiken Densetsu 3','2026-07-22T10:37:55.191431+00:00','https://www.youtube.com/watch?v=_rwnSiCNflw',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Midsummer_Sorcery_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3835,'Maverick Twilight','Mega Man X','2026-07-21T22:27:00.372623+00:00','https://www.youtube.com/watch?v=CzTDxSLB3qY',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Maverick_Twilight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3836,'Valhorteka','Skies of Arcadia','2026-07-22T18:41:26.421517+00:00','https://www.youtube.com/watch?v=tvpxMWQnE30',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Valhorteka_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3837,'Black Moon','Skies of Arcadia','2026-07-22T10:37:56.184524+00:00','https://www.youtube.com/watch?v=bamT0AO8zhI',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Black_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3838,'Hearth and Home','Skies of Arcadia','2026-07-22T22:32:48.880830+00:00','https://www.youtube.com/watch?v=p4rILO2J3n0',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Hearth_and_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3839,'This Binary Drifter','Metroid Prime','2026-07-22T18:41:25.355641+00:00','https://www.youtube.com/watch?v=sETJjC5alZ4',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_This_Binary_Drifter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3840,'From the Perilous Skies to Your Heart','Skies of Arcadia','2026-07-22T10:37:56.323817+00:00','https://www.youtube.com/watch?v=aGH8PaYHOHA',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_From_the_Perilous_Skies_to_Your_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3841,'Legend in the Making','Skies of Arcadia','2026-07-21T22:27:01.254000+00:00','https://www.youtube.com/watch?v=2WPDdmaDjzw',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Legend_in_the_Making_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3842,'Victory! Glory! Profit?','Skies of Arcadia','2026-07-22T07:54:01.284072+00:00','https://www.youtube.com/watch?v=ALtNZNBHolg',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Victory_Glory_Profit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3843,'Rusted Hopes','Skies of Arcadia','2026-07-22T20:37:34.643695+00:00','https://www.youtube.com/watch?v=4epa6hUFIrs',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Rusted_Hopes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3844,'Shining Silver','Skies of Arcadia','2026-07-22T15:19:29.786476+00:00','https://www.youtube.com/watch?v=8-nO46q7yhg',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Shining_Silver_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3845,'Rogue Sanctuary','Skies of Arcadia','2026-07-22T18:41:25.889199+00:00','https://www.youtube.com/watch?v=BSITyHnQI00',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Rogue_Sanctuary_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3846,'Holographic Projection','Deus Ex','2026-07-22T12:57:09.031729+00:00','https://www.youtube.com/watch?v=n5ZaaBEt4HU',574,'https://ocrmirror.org/files/music/remixes/Deus_Ex_Holographic_Projection_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3847,'Terra: [Magitek Perfect]','Final Fantasy VI','2026-07-22T04:45:49.978698+00:00','https://www.youtube.com/watch?v=4JyOBZ9wQCU',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra_Magitek_Perfect_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3848,'Buy or Bye','The Legend of Zelda: Ocarina of Time','2026-07-22T07:54:00.082544+00:00','https://www.youtube.com/watch?v=hyZ6YCiljds',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Buy_or_Bye_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3849,'Maximum Contra Overdrive','Contra: Hard Corps','2026-07-22T04:45:49.453229+00:00','https://www.youtube.com/watch?v=ulFsNYU8EAM',6309,'https://ocrmirror.org/files/music/remixes/Contra_Hard_Corps_Maximum_Contra_Overdrive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3850,'Portal Storm','Half-Life 2','2026-07-21T18:48:58.747906+00:00','https://www.youtube.com/watch?v=eiDFAb465bs',827,'https://ocrmirror.org/files/music/remixes/Half-Life_2_Portal_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3851,'Dream Current','Sonic CD','2026-07-22T01:00:07.095804+00:00','https://www.youtube.com/watch?v=9k2E3gciFsM',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_Dream_Current_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3852,'Man-Eating Spores of Agony','Suikoden','2026-07-21T22:27:00.196158+00:00','https://www.youtube.com/watch?v=E5eq1dtSkfw',316,'https://ocrmirror.org/files/music/remixes/Suikoden_Man-Eating_Spores_of_Agony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3853,'Full Sleeve [InK Me uP]','Splatoon','2026-07-22T10:37:55.757774+00:00','https://www.youtube.com/watch?v=vAH-E0z3tbY',95051,'https://ocrmirror.org/files/music/remixes/Splatoon_Full_Sleeve_InK_Me_uP_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3854,'Save the Future','Chrono Trigger','2026-07-21T18:48:59.077893+00:00','https://www.youtube.com/watch?v=2q2L31Dtp7E',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Save_the_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3855,'To the Horizon','Skies of Arcadia','2026-07-23T19:54:55.684295+00:00','https://www.youtube.com/watch?v=hhZNgqVZT-k',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_To_the_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3856,'Better Days','Skies of Arcadia','2026-07-23T04:51:00.353227+00:00','https://www.youtube.com/watch?v=GoXIwB2AR-0',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Better_Days_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3857,'The MFD','Skies of Arcadia','2026-07-23T10:38:57.063272+00:00','https://www.youtube.com/watch?v=8Sp4IcMdQ_0',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_The_MFD_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3858,'Devotion to the Motif','Final Fantasy IV','2026-07-22T12:57:07.988336+00:00','https://www.youtube.com/watch?v=q1Ei8VpDE08',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Devotion_to_the_Motif_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3859,'Destined','The Legend of Zelda','2026-07-22T01:00:05.722790+00:00','https://www.youtube.com/watch?v=iMgeeMNaHlk',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Destined_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3860,'Slipgate','Quake','2026-07-21T20:44:10.344752+00:00','https://www.youtube.com/watch?v=f5a44c5SYQc',16178,'https://ocrmirror.org/files/music/remixes/Quake_Slipgate_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3861,'Late-night Ambience','Animal Crossing: New Leaf','2026-07-21T20:44:09.632181+00:00','https://www.youtube.com/watch?v=6cjiISvFrvo',94800,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_New_Leaf_Late-night_Ambience_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3862,'Colours of the Winter Sky','Secret of Mana','2026-07-22T04:45:48.924269+00:00','https://www.youtube.com/watch?v=-VC21SRogiA',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Colours_of_the_Winter_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3863,'More Might','Shovel Knight','2026-07-22T04:45:49.098970+00:00','https://www.youtube.com/watch?v=F4dJKWfUaXY',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_More_Might_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3864,'Wanderlust','Final Fantasy VIII','2026-07-22T20:37:33.592082+00:00','https://www.youtube.com/watch?v=faojpoxJOHE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Wanderlust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3865,'Avalanche','Snowboard Kids','2026-07-22T10:37:55.046621+00:00','https://www.youtube.com/watch?v=Lvg3zicxF6U',47752,'https://ocrmirror.org/files/music/remixes/Snowboard_Kids_Avalanche_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3866,'The Princess of Destiny','The Legend of Zelda: Ocarina of Time','2026-07-21T23:29:53.354521+00:00','https://www.youtube.com/watch?v=tQdE5fOHzHc',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_The_Princess_of_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3867,'Baño de Sangre','Castlevania III: Dracula''s Curse','2026-07-21T22:27:01.429278+00:00','https://www.youtube.com/watch?v=KFtEIvQdhZg',280,'https://ocrmirror.org/files/music/remixes/Castlevania_3_Bano_de_Sangre_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3868,'While the Wind Fish Sleeps','The Legend of Zelda: Link''s Awakening','2026-07-22T22:32:49.579574+00:00','https://www.youtube.com/watch?v=_Cb-9c2C-5s',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_While_the_Wind_Fish_Sleeps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3869,'Chamber of the Goddess','The Legend of Zelda: A Link to the Past','2026-07-22T01:00:06.239289+00:00','https://www.youtube.com/watch?v=OstEK7m8u9I',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Chamber_of_the_Goddess_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3870,'Windrose','Fez','2026-07-22T01:00:06.923446+00:00','https://www.youtube.com/watch?v=ftpvNB3yoFA',95038,'https://ocrmirror.org/files/music/remixes/Fez_Windrose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3871,'The Crystal Guillotine','Hyper Light Drifter','2026-07-22T07:54:00.256258+00:00','https://www.youtube.com/watch?v=C32gJawo8Pw',95544,'https://ocrmirror.org/files/music/remixes/Hyper_Light_Drifter_The_Crystal_Guillotine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3872,'Au Clair de la Lune','Golden Sun: The Lost Age','2026-07-22T07:54:01.455433+00:00','https://www.youtube.com/watch?v=LEGius7cfqo',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_Au_Clair_de_la_Lune_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3873,'The teCtonic reCords','Donkey Kong Country','2026-07-22T16:55:01.334398+00:00','https://www.youtube.com/watch?v=DoZ1PBXac64',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_The_teCtonic_reCords_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3874,'My Friend, the Wind','Detana!! TwinBee','2026-07-21T23:29:53.174988+00:00','https://www.youtube.com/watch?v=echf4Qs5NRg',904,'https://ocrmirror.org/files/music/remixes/Detana_TwinBee_My_Friend_the_Wind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3875,'Woodland Intermission','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-22T15:19:30.473361+00:00','https://www.youtube.com/watch?v=ySr9K88djoI',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Woodland_Intermission_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3876,'Nayru''s Hymn','The Legend of Zelda: A Link to the Past','2026-07-23T01:00:26.545032+00:00','https://www.youtube.com/watch?v=ZRiovqVHnuM',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Nayru''s_Hymn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3877,'Heart of the Sacred Grove','The Legend of Zelda: Twilight Princess','2026-07-22T15:19:28.926254+00:00','https://www.youtube.com/watch?v=-v_N1Cx82bA',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Heart_of_the_Sacred_Grove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3878,'Blazing Mines','Donkey Kong Country','2026-07-21T22:27:00.725488+00:00','https://www.youtube.com/watch?v=Bz6v8zOSvpw',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Blazing_Mines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3879,'Follow the Sun','Nemesis 3: The Eve of Destruction','2026-07-23T07:56:20.667716+00:00','https://www.youtube.com/watch?v=PwMTx4MxSeA',3978,'https://ocrmirror.org/files/music/remixes/Nemesis_3_Follow_the_Sun_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3880,'Three-Headed Monkey Combat','Monkey Island 2: LeChuck''s Revenge','2026-07-22T12:57:07.634601+00:00','https://www.youtube.com/watch?v=5xGvaeT_VXg',302,'https://ocrmirror.org/files/music/remixes/Monkey_Island_2_Three-Headed_Monkey_Combat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3881,'Hold onto the Dream','Chrono Cross','2026-07-23T10:38:57.585460+00:00','https://www.youtube.com/watch?v=tLyVWSYNAqk',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Hold_onto_the_Dream_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3882,'Cosmic Kleptomaniac','Chrono Cross','2026-07-23T07:56:20.842742+00:00','https://www.youtube.com/watch?v=gQf_quBeii0',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Cosmic_Kleptomaniac_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3883,'Under Cerulean Skies','Chrono Cross','2026-07-23T17:54:21.680751+00:00','https://www.youtube.com/watch?v=xkNMd5c-oQQ',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Under_Cerulean_Skies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3884,'A Timely Victory','Chrono Cross','2026-07-22T07:54:00.770918+00:00','https://www.youtube.com/watch?v=O_Jgk9FW5v4',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_A_Timely_Victory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3885,'The End of Time','Chrono Cross','2026-07-22T07:54:00.600506+00:00','https://www.youtube.com/watch?v=pw9AT-RE9OE',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_The_End_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3886,'Dear Serenity','Kingdom Hearts II','2026-07-22T22:32:49.403737+00:00','https://www.youtube.com/watch?v=70YFdw10FpI',549,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_2_Dear_Serenity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3887,'Liskojytä','Chrono Cross','2026-07-23T10:38:57.410851+00:00','https://www.youtube.com/watch?v=I4lYTUUkXqE',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Liskojyta_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3888,'If I Could... (Synthwave Mix)','Chrono Cross','2026-07-23T15:30:41.281708+00:00','https://www.youtube.com/watch?v=Ex9lUmaQxbM',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_If_I_Could_(Synthwave_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3889,'Zelda''s Legend','The Legend of Zelda: Ocarina of Time','2026-07-22T15:19:29.442906+00:00','https://www.youtube.com/watch?v=9XeN_5kp0q4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Zelda''s_Legend_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3890,'I''m the Soul Blazer','Soul Blazer','2026-07-23T07:56:20.492370+00:00','https://www.youtube.com/watch?v=0qWBHTlHqp0',248,'https://ocrmirror.org/files/music/remixes/Soul_Blazer_I''m_the_Soul_Blazer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3891,'Blue Skies, Pirate Surprise','Skies of Arcadia','2026-07-22T12:57:08.334262+00:00','https://www.youtube.com/watch?v=WoDaH3QCt9U',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Blue_Skies_Pirate_Surprise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3892,'Rainbow in Your Eyes','Mario Kart 7','2026-07-22T16:55:00.806434+00:00','https://www.youtube.com/watch?v=Rd7M5eNXAow',94775,'https://ocrmirror.org/files/music/remixes/Mario_Kart_7_Rainbow_in_Your_Eyes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3893,'Undervalued','Skies of Arcadia','2026-07-23T19:54:55.822962+00:00','https://www.youtube.com/watch?v=9GaplZW4GME',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Undervalued_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3894,'Eternal Beginnings','Secret of Mana','2026-07-23T15:30:41.106471+00:00','https://www.youtube.com/watch?v=NyjY1BldJBM',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Eternal_Beginnings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3895,'Goldpath','Hollow Knight','2026-07-22T15:19:29.614522+00:00','https://www.youtube.com/watch?v=GmoweLUQrv0',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_Goldpath_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3896,'Partons à l''Aventure','Tintin: Prisoners of the Sun','2026-07-22T07:54:00.429477+00:00','https://www.youtube.com/watch?v=or4o0gqSSwg',61403,'https://ocrmirror.org/files/music/remixes/Tintin_Prisoners_of_the_Sun_Partons_a_l''Aventure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3897,'0373','Journey to Silius','2026-07-22T18:41:25.534237+00:00','https://www.youtube.com/watch?v=440uaW-6cOQ',154,'https://ocrmirror.org/files/music/remixes/Journey_to_Silius_0373_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3898,'Air Man''s 9-bit Rock and Roll','Mega Man 2','2026-07-22T10:37:55.900415+00:00','https://www.youtube.com/watch?v=3gDJCLsIi68',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Air_Man''s_9-bit_Rock_and_Roll_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3899,'Sakura Storm','Phantasy Star IV: The End of the Millennium','2026-07-22T15:19:30.301834+00:00','https://www.youtube.com/watch?v=ORY1xR1twfE',96,'https://ocrmirror.org/files/music/remixes/Phantasy_Star_4_Sakura_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3900,'What the Ocean Taught the Forest','Secret of Mana','2026-07-23T10:38:57.236764+00:00','https://www.youtube.com/watch?v=qzg53VAONng',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_What_the_Ocean_Taught_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3901,'Il buono, il brutto, il pirata dell''aria','Skies of Arcadia','2026-07-24T07:53:15.428682+00:00','https://www.youtube.com/watch?v=4uUrK6BFcxw',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Il_buono_il_brutto_il_pirata_dell''aria_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3902,'Operation Dragon Wolf','Operation Wolf','2026-07-22T10:37:55.332218+00:00','https://www.youtube.com/watch?v=wL67raLFFpg',1682,'https://ocrmirror.org/files/music/remixes/Operation_Wolf_Operation_Dragon_Wolf_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3903,'Beetle Dopplerganger','Mega Man X3','2026-07-23T01:00:26.365964+00:00','https://www.youtube.com/watch?v=1D0LxUhoZ-s',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Beetle_Dopplerganger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3904,'Nocturnal','Legend of Mana','2026-07-22T04:45:48.748917+00:00','https://www.youtube.com/watch?v=Vv5s-jVqWvo',42288,'https://ocrmirror.org/files/music/remixes/Legend_of_Mana_Nocturnal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3905,'A Sailor''s Respite','Skies of Arcadia','2026-07-22T22:32:49.055582+00:00','https://www.youtube.com/watch?v=MCS43U6zK2Q',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_A_Sailor''s_Respite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3906,'Hateno Racing','The Legend of Zelda: Breath of the Wild','2026-07-22T22:32:49.754508+00:00','https://www.youtube.com/watch?v=EdQ4q75DJ6s',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Hateno_Racing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3907,'As Blew the Winds, So Forward Marched Time','Chrono Trigger','2026-07-23T01:00:27.082165+00:00','https://www.youtube.com/watch?v=rMlrinPXVOQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_As_Blew_the_Winds_So_Forward_Marched_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3908,'Fire Fade with Me','Dark Souls','2026-07-22T20:37:33.942738+00:00','https://www.youtube.com/watch?v=-KcQM9RULzI',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Fire_Fade_with_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3909,'Snowmen and Starmen','Mother','2026-07-22T16:55:00.624751+00:00','https://www.youtube.com/watch?v=AB77CosKGlg',4289,'https://ocrmirror.org/files/music/remixes/Mother_Snowmen_and_Starmen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3910,'Double KO','Street Fighter II: The World Warrior','2026-07-22T16:55:01.158307+00:00','https://www.youtube.com/watch?v=twgIIbEFbfw',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Double_KO_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3911,'Take It Easy','The Legend of Heroes V: A Cagesong of the Ocean','2026-07-23T15:30:41.630616+00:00','https://www.youtube.com/watch?v=cR3niutTjsU',40735,'https://ocrmirror.org/files/music/remixes/Legend_of_Heroes_5_Take_It_Easy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3912,'Tales of Courage and Sorrow','Final Fantasy IV','2026-07-22T18:41:26.775835+00:00','https://www.youtube.com/watch?v=svRoMPODj5s',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Tales_of_Courage_and_Sorrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3913,'Butterfly Spy','Jet Grind Radio','2026-07-22T22:32:48.704654+00:00','https://www.youtube.com/watch?v=qTSkIPMvPLo',392,'https://ocrmirror.org/files/music/remixes/Jet_Grind_Radio_Butterfly_Spy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3914,'Groove Before the Storm','Final Fantasy X','2026-07-22T12:57:07.812526+00:00','https://www.youtube.com/watch?v=McYvB9u_Xhk',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Groove_Before_the_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3915,'Lancer Vs. Lancer','Deltarune','2026-07-23T01:00:26.008000+00:00','https://www.youtube.com/watch?v=EzaHh1mcgaI',95557,'https://ocrmirror.org/files/music/remixes/Deltarune_Lancer_Vs_Lancer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3916,'Abomination','SaGa Frontier','2026-07-23T07:56:21.016959+00:00','https://www.youtube.com/watch?v=EGl7mf_2KEQ',331,'https://ocrmirror.org/files/music/remixes/SaGa_Frontier_Abomination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3917,'The Darkest World','The Legend of Zelda: A Link to the Past','2026-07-23T10:38:56.890140+00:00','https://www.youtube.com/watch?v=Zx2lIy5uLiw',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Darkest_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3918,'Unearthed','Halo 3','2026-07-22T04:45:49.277205+00:00','https://www.youtube.com/watch?v=2dPT2AF811s',643,'https://ocrmirror.org/files/music/remixes/Halo_3_Unearthed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3919,'Princess Ruto','The Legend of Zelda: Ocarina of Time','2026-07-22T16:55:00.982683+00:00','https://www.youtube.com/watch?v=Pm8ibnuGn3A',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Princess_Ruto_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3920,'It''s Payback Time','Contra: Hard Corps','2026-07-22T12:57:08.858103+00:00','https://www.youtube.com/watch?v=z_uCZPd6TiU',6309,'https://ocrmirror.org/files/music/remixes/Contra_Hard_Corps_It''s_Payback_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3921,'Rum Barrel','Escape from Monkey Island','2026-07-22T20:37:33.239967+00:00','https://www.youtube.com/watch?v=3nuL6WSaKjg',809,'https://ocrmirror.org/files/music/remixes/Escape_from_Monkey_Island_Rum_Barrel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3922,'Cocoa ''n'' Cookies','Kirby''s Return to Dream Land','2026-07-22T18:41:26.597937+00:00','https://www.youtube.com/watch?v=8Yal7YjK-xA',94508,'https://ocrmirror.org/files/music/remixes/Kirby''s_Return_to_Dream_Land_Cocoa_''n''_Cookies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3923,'Hayride Dreams','Super Mario Bros. 2','2026-07-23T12:58:59.645182+00:00','https://www.youtube.com/watch?v=qCfXpny1jMI',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Hayride_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3924,'Garden of Venus','The Legend of Zelda: Ocarina of Time','2026-07-22T16:55:01.509272+00:00','https://www.youtube.com/watch?v=syDoDo4YpW8',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Garden_of_Venus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3925,'A Biting Voice Upon the Wind','The Legend of Zelda: Twilight Princess','2026-07-23T04:50:59.470992+00:00','https://www.youtube.com/watch?v=gt0xb_r8c3s',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_A_Biting_Voice_Upon_the_Wind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3926,'A Higher Place','Seiken Densetsu 3','2026-07-22T10:37:55.617644+00:00','https://www.youtube.com/watch?v=8sg7ZXGJH5M',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_A_Higher_Place_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3927,'A Formidable Mischief','Final Fantasy IX','2026-07-23T21:34:26.277945+00:00','https://www.youtube.com/watch?v=akK9KVxVEq4',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_A_Formidable_Mischief_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3928,'Chill Waves','Super Mario Odyssey','2026-07-22T18:41:25.712005+00:00','https://www.youtube.com/watch?v=YAtBHw4s88Q',95486,'https://ocrmirror.org/files/music/remixes/Super_Mario_Odyssey_Chill_Waves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3929,'To the Moon or Bust!','DuckTales','2026-07-22T15:19:29.271530+00:00','https://www.youtube.com/watch?v=YpExxywMGDc',50,'https://ocrmirror.org/files/music/remixes/DuckTales_To_the_Moon_or_Bust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3930,'Our Destiny','Final Fantasy VIII','2026-07-22T20:37:33.061511+00:00','https://www.youtube.com/watch?v=cxo8NqoWOQs',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Our_Destiny_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3931,'Fearless','Donkey Kong Country','2026-07-23T21:34:26.453626+00:00','https://www.youtube.com/watch?v=Q-0_1OuGbNE',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Fearless_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3932,'Dark World''s Prophet','The Legend of Zelda: A Link to the Past','2026-07-23T04:50:59.287291+00:00','https://www.youtube.com/watch?v=lfm6TqHKDko',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Dark_World''s_Prophet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3933,'Baby Dreams of Lost Civilizations','Paper Mario: The Thousand-Year Door','2026-07-23T07:56:20.138832+00:00','https://www.youtube.com/watch?v=IF7rJ1EJhPs',804,'https://ocrmirror.org/files/music/remixes/Paper_Mario_The_Thousand-Year_Door_Baby_Dreams_of_Lost_Civilizations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3934,'Ain''t No Riddim Like at My Place','Final Fantasy IX','2026-07-24T15:12:33.466736+00:00','https://www.youtube.com/watch?v=VLy9E4J3IV0',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Ain''t_No_Riddim_Like_at_My_Place_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3935,'Elemental Harmony','The Legend of Zelda: The Minish Cap','2026-07-22T20:37:33.767904+00:00','https://www.youtube.com/watch?v=sIsElFF86dw',9081,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Minish_Cap_Elemental_Harmony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3936,'Tanglesleep','Tangledeep','2026-07-23T04:51:00.174021+00:00','https://www.youtube.com/watch?v=n1HdMSDu69g',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_Tanglesleep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3937,'Crystalbound Chant','Donkey Kong 64','2026-07-23T12:58:58.938572+00:00','https://www.youtube.com/watch?v=KtCr7PdLzxg',2955,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_64_Crystalbound_Chant_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3938,'Down the Rabite Hole','Secret of Mana','2026-07-23T17:54:21.330854+00:00','https://www.youtube.com/watch?v=Djp8oqoM1Gk',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Down_the_Rabite_Hole_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3939,'Build It Up [Sky toweR]','Pokémon Mystery Dungeon: Blue Rescue Team','2026-07-22T18:41:26.244371+00:00','https://www.youtube.com/watch?v=SKyOYJkMIHs',38876,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Blue_Rescue_Team_Build_It_Up_Sky_toweR_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3940,'Outside Looking In','Chrono Cross','2026-07-22T22:32:49.928417+00:00','https://www.youtube.com/watch?v=ajcmMaOwwsM',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Outside_Looking_In_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3941,'I Just Skipped Time Yesterday','Puyo Puyo','2026-07-23T12:58:59.294052+00:00','https://www.youtube.com/watch?v=N5o5l27d06Y',6611,'https://ocrmirror.org/files/music/remixes/Puyo_Puyo_I_Just_Skipped_Time_Yesterday_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3942,'Morning Coffee','Sonic Colors','2026-07-24T00:57:38.786907+00:00','https://www.youtube.com/watch?v=vV1v_errkRk',834,'https://ocrmirror.org/files/music/remixes/Sonic_Colors_Morning_Coffee_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3943,'Post Hyper Room','Bomberman Hero','2026-07-23T04:50:59.646829+00:00','https://www.youtube.com/watch?v=76YKFvKhZkw',2931,'https://ocrmirror.org/files/music/remixes/Bomberman_Hero_Post_Hyper_Room_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3944,'When Two Worlds Meet','Chrono Cross','2026-07-24T04:47:20.476514+00:00','https://www.youtube.com/watch?v=nXgdJgUqt9U',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_When_Two_Worlds_Meet_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3945,'Guided by Hopes and Dreams','Undertale','2026-07-24T10:33:13.200401+00:00','https://www.youtube.com/watch?v=RpRBEQ-vxHE',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Guided_by_Hopes_and_Dreams_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3946,'Pax Eggmanica ~Sear & Reave~','Sonic the Hedgehog','2026-07-24T07:53:15.820073+00:00','https://www.youtube.com/watch?v=mtk5ESDAtjY',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Pax_Eggmanica_Sear_&_Reave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3947,'Las Calles de la Rabia','Streets of Rage 2','2026-07-23T01:00:27.260881+00:00','https://www.youtube.com/watch?v=YU_bTSw-pBY',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Las_Calles_de_la_Rabia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3948,'Brain Sound Tilt','Skies of Arcadia','2026-07-23T12:58:59.469307+00:00','https://www.youtube.com/watch?v=FZqrIBi3Vbk',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Brain_Sound_Tilt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3949,'Yesterday''s Dream','Chrono Cross','2026-07-22T18:41:26.067163+00:00','https://www.youtube.com/watch?v=CkZrDmKe5PU',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Yesterday''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3950,'Firefly','Mega Man X5','2026-07-23T23:27:51.843087+00:00','https://www.youtube.com/watch?v=3MVYAhm2zE0',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Firefly_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3951,'Rock the Masters','Mega Man 3','2026-07-22T16:55:02.048481+00:00','https://www.youtube.com/watch?v=Ti4ZSVTcyoc',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Rock_the_Masters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3952,'Dawn of the Instinct','Killer Instinct','2026-07-23T07:56:19.962643+00:00','https://www.youtube.com/watch?v=WdLCNDcGbp0',29292,'https://ocrmirror.org/files/music/remixes/Killer_Instinct_Dawn_of_the_Instinct_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3953,'Magma Bomb','Chrono Cross','2026-07-23T12:58:59.821819+00:00','https://www.youtube.com/watch?v=h-rUgK8LyEU',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Magma_Bomb_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3954,'Opa and Over','Fantasy Zone','2026-07-23T07:56:19.597451+00:00','https://www.youtube.com/watch?v=8I61nwk29tA',28497,'https://ocrmirror.org/files/music/remixes/Fantasy_Zone_Opa_and_Over_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3955,'Monstrosity/Abhorrence','Chrono Trigger','2026-07-23T04:50:59.997799+00:00','https://www.youtube.com/watch?v=etHWSCGVsf0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Monstrosity_Abhorrence_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3956,'By the Flame','Octopath Traveler','2026-07-23T07:56:19.415268+00:00','https://www.youtube.com/watch?v=ZC_UnTdKSHU',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_By_the_Flame_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3957,'A Snowy Wonderland','Pokémon Diamond Version','2026-07-22T22:32:48.529492+00:00','https://www.youtube.com/watch?v=zFCLt1q5jKE',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_A_Snowy_Wonderland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3958,'In the Heart of Home','Tangledeep','2026-07-23T19:54:55.409127+00:00','https://www.youtube.com/watch?v=b4s4t8rFgoU',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_In_the_Heart_of_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3959,'Enantiodromia','Metroid Prime 2: Echoes','2026-07-24T10:33:13.070331+00:00','https://www.youtube.com/watch?v=dW1udKsChyA',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Enantiodromia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3960,'Hydra Shadow','Chrono Cross','2026-07-22T20:37:34.467819+00:00','https://www.youtube.com/watch?v=7Ia6SnIPzMA',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Hydra_Shadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3961,'A Brief Respite','Undertale','2026-07-23T01:00:25.829068+00:00','https://www.youtube.com/watch?v=Vb2hYxPdZY8',95077,'https://ocrmirror.org/files/music/remixes/Undertale_A_Brief_Respite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3962,'Blade Pitch','Twin Cobra','2026-07-23T12:58:59.997771+00:00','https://www.youtube.com/watch?v=6ucRe2jPD-w',6753,'https://ocrmirror.org/files/music/remixes/Twin_Cobra_Blade_Pitch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3963,'An Open Galaxy','FTL: Faster Than Light','2026-07-23T01:00:25.647831+00:00','https://www.youtube.com/watch?v=ledmaKUn0ME',95033,'https://ocrmirror.org/files/music/remixes/FTL_An_Open_Galaxy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3964,'Driver''s Delight [Dweller''s Duelight]','Wangan Midnight Maximum Tune','2026-07-23T19:54:55.271855+00:00','https://www.youtube.com/watch?v=KwaJkLH8i1A',32278,'https://ocrmirror.org/files/music/remixes/Wangan_Midnight_Maximum_Tune_Driver''s_Delight_Dweller''s_Duelight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3965,'Stickerbrush','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-23T19:54:55.546660+00:00','https://www.youtube.com/watch?v=lBnZ73n9vn4',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Stickerbrush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3966,'Drowning in Brambles','Donkey Kong Country','2026-07-23T21:34:26.628996+00:00','https://www.youtube.com/watch?v=9R6IdEQublk',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Drowning_in_Brambles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3967,'Coding Angel','Skies of Arcadia','2026-07-24T07:53:14.880017+00:00','https://www.youtube.com/watch?v=4Eh-K4t_AgE',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Coding_Angel_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3968,'Eclipse of the Fourth Empire','Plasma Sword: Nightmare of Bilstein','2026-07-23T04:51:00.883112+00:00','https://www.youtube.com/watch?v=Ne5yTL0CsaE',13345,'https://ocrmirror.org/files/music/remixes/Plasma_Sword_Eclipse_of_the_Fourth_Empire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3969,'Aviated Spirit','Sonic Adventure','2026-07-23T12:58:58.763086+00:00','https://www.youtube.com/watch?v=SfScnZjsRI0',217,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_Aviated_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3970,'Reflecting Pool','Super Mario Bros.','2026-07-24T20:45:50.291495+00:00','https://www.youtube.com/watch?v=pcxrPNbBCrM',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Reflecting_Pool_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3971,'OSHA Violation','Donkey Kong Country','2026-07-23T21:34:25.925961+00:00','https://www.youtube.com/watch?v=1jhPR2HkXBA',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_OSHA_Violation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3972,'Font of Life','Chrono Cross','2026-07-23T04:51:00.707175+00:00','https://www.youtube.com/watch?v=WXeQqnZwozI',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Font_of_Life_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3973,'Kelesis with a Mandolin','Golvellius: Valley of Doom','2026-07-22T22:32:48.352842+00:00','https://www.youtube.com/watch?v=JRGUVhBfqac',12612,'https://ocrmirror.org/files/music/remixes/Golvellius_Valley_of_Doom_Kelesis_with_a_Mandolin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3974,'Cozy Campfire','Monkey Island 2: LeChuck''s Revenge','2026-07-23T12:58:59.115978+00:00','https://www.youtube.com/watch?v=i4nwr6La4wA',302,'https://ocrmirror.org/files/music/remixes/Monkey_Island_2_Cozy_Campfire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3975,'A Shark Hunter''s Tale','Sea of Thieves','2026-07-23T07:56:19.786747+00:00','https://www.youtube.com/watch?v=7O2lu3y3_HQ',95562,'https://ocrmirror.org/files/music/remixes/Sea_of_Thieves_A_Shark_Hunter''s_Tale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3976,'"To the Finder..."','The Legend of Zelda: Link''s Awakening','2026-07-24T18:57:24.534840+00:00','https://www.youtube.com/watch?v=-e4NiYd_8xk',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_To_the_Finder_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3977,'Le Mystère du Poisson-Rêve','The Legend of Zelda: Link''s Awakening','2026-07-23T15:30:41.979903+00:00','https://www.youtube.com/watch?v=zkyCjxpeQgk',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Le_Mystere_du_Poisson-Reve_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3978,'Mah Boi','The Legend of Zelda: Link''s Awakening','2026-07-24T00:57:39.828424+00:00','https://www.youtube.com/watch?v=1RvCbc8nbro',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Mah_Boi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3979,'Animal''s Avenue','The Legend of Zelda: Link''s Awakening','2026-07-23T23:27:51.490388+00:00','https://www.youtube.com/watch?v=eNu7trEiZLY',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Animal''s_Avenue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3980,'The Waker''s Tale','The Legend of Zelda: Link''s Awakening','2026-07-23T23:27:52.727179+00:00','https://www.youtube.com/watch?v=Opo2RtiFTTM',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_The_Waker''s_Tale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3981,'Marin''s Mambo','The Legend of Zelda: Link''s Awakening','2026-07-23T17:54:20.983410+00:00','https://www.youtube.com/watch?v=PC0Ej_JEWig',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Marin''s_Mambo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3982,'Terra Et Cetera','Terra Cresta','2026-07-23T04:50:59.822495+00:00','https://www.youtube.com/watch?v=5KEVf9KBLCs',2203,'https://ocrmirror.org/files/music/remixes/Terra_Cresta_Terra_Et_Cetera_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3983,'Knowing Your Roots','Pokémon Diamond Version','2026-07-23T07:56:20.314796+00:00','https://www.youtube.com/watch?v=GyYbP4q9ETg',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Knowing_Your_Roots_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3984,'Hypersonic','XGIII: Extreme G Racing','2026-07-23T17:54:20.628668+00:00','https://www.youtube.com/watch?v=KnYisnHNHd4',10810,'https://ocrmirror.org/files/music/remixes/XG3_Hypersonic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3985,'Essence of the Four Elements','Golden Sun','2026-07-23T12:58:58.586043+00:00','https://www.youtube.com/watch?v=exdUk2V0eN4',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Essence_of_the_Four_Elements_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3986,'The Loneliest Bounty Hunter in the Universe','Super Metroid','2026-07-24T00:57:38.610788+00:00','https://www.youtube.com/watch?v=Nq7V1DiI93k',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_The_Loneliest_Bounty_Hunter_in_the_Universe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3987,'For King and Country','Seiken Densetsu 3','2026-07-23T19:54:55.960422+00:00','https://www.youtube.com/watch?v=V6IbyxN_yKA',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_For_King_and_Country_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3988,'The Path of Now and Never','Star Control II','2026-07-23T17:54:20.807205+00:00','https://www.youtube.com/watch?v=NfSafV1hm_M',351,'https://ocrmirror.org/files/music/remixes/Star_Control_2_The_Path_of_Now_and_Never_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3989,'Jupiter Jellie','Chrono Cross','2026-07-24T00:57:39.479790+00:00','https://www.youtube.com/watch?v=tlFMTCbU1Og',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Jupiter_Jellie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3990,'The Princess and the Wolf','The Legend of Zelda: Twilight Princess','2026-07-23T15:30:40.402123+00:00','https://www.youtube.com/watch?v=db3rorDbIKQ',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_The_Princess_and_the_Wolf_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3991,'Domain of Darkness','The Legend of Zelda: Link''s Awakening','2026-07-24T12:57:18.928361+00:00','https://www.youtube.com/watch?v=rhbW9eamPS8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Domain_of_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3992,'Crosswind','Star Fox','2026-07-23T15:30:40.756817+00:00','https://www.youtube.com/watch?v=mVbREKiLQuI',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Crosswind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3993,'God''s Ambition','Skies of Arcadia','2026-07-24T07:53:15.056297+00:00','https://www.youtube.com/watch?v=_vbgspoMgkc',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_God''s_Ambition_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3994,'Infiltration','Bionic Commando','2026-07-23T12:58:58.407582+00:00','https://www.youtube.com/watch?v=-y7Dc-df4q0',38,'https://ocrmirror.org/files/music/remixes/Bionic_Commando_Infiltration_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3995,'Sepulchre Soirée','Crypt of the NecroDancer','2026-07-23T23:27:51.134171+00:00','https://www.youtube.com/watch?v=LnYzLlouAGA',95499,'https://ocrmirror.org/files/music/remixes/Crypt_of_the_NecroDancer_Sepulchre_Soiree_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3996,'Numbness & Knives','Silent Hill 2','2026-07-23T10:38:57.760070+00:00','https://www.youtube.com/watch?v=rNiGTWdtCgk',63,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_Numbness_&_Knives_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3997,'If I Could...','Chrono Cross','2026-07-24T12:57:19.282290+00:00','https://www.youtube.com/watch?v=eq3KlE9qRxk',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_If_I_Could_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(3998,'The Forbidden Treasure','Astérix','2026-07-23T10:38:57.933708+00:00','https://www.youtube.com/watch?v=b7SCWQQpygo',919,'https://ocrmirror.org/files/music/remixes/Asterix_The_Forbidden_Treasure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(3999,'The Voyage Begins','Skies of Arcadia','2026-07-24T10:33:13.334638+00:00','https://www.youtube.com/watch?v=KyaeWBQ-NyM',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_The_Voyage_Begins_OC_ReMix.mp3',0);
@@ -0,0 +1,1000 @@
+INSERT INTO "remix" VALUES(4000,'The Cosmofarian','Final Fantasy VII','2026-07-24T15:12:32.396062+00:00','https://www.youtube.com/watch?v=m-jRmTTP80s',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_Cosmofarian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4001,'The Beat That Time Forgot','Chrono Cross','2026-07-23T15:30:40.930846+00:00','https://www.youtube.com/watch?v=WmdxPuZu5V8',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_The_Beat_That_Time_Forgot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4002,'Takeyabu Resort Promo Package, 1991','The Legend of Zelda: Skyward Sword','2026-07-24T20:45:49.919933+00:00','https://www.youtube.com/watch?v=kcMidbSwGqY',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Takeyabu_Resort_Promo_Package_1991_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4003,'Drop the Façade','Mega Man X5','2026-07-24T18:57:24.711426+00:00','https://www.youtube.com/watch?v=hhYB6hr6jN0',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Drop_the_Facade_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4004,'X over Zero','Mega Man Zero 2','2026-07-23T19:54:56.233068+00:00','https://www.youtube.com/watch?v=OADg3OEmlY0',434,'https://ocrmirror.org/files/music/remixes/Mega_Man_Zero_2_X_over_Zero_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4005,'Trust My Unwavering Heart','Chrono Cross','2026-07-24T12:57:19.460404+00:00','https://www.youtube.com/watch?v=0w8EI_-ZDck',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Trust_My_Unwavering_Heart_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4006,'Lullaby for a World','The Legend of Zelda: Ocarina of Time','2026-07-24T12:57:18.575973+00:00','https://www.youtube.com/watch?v=8sRfxDiOILU',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Lullaby_for_a_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4007,'Wavering Reflection','Xenogears','2026-07-24T07:53:15.231508+00:00','https://www.youtube.com/watch?v=yuMteHkniKE',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Wavering_Reflection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4008,'Such Sweet Sorrow','Lufia II: Rise of the Sinistrals','2026-07-24T10:33:12.822333+00:00','https://www.youtube.com/watch?v=03mePJdtgoo',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Such_Sweet_Sorrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4009,'Wings of Freedom','Final Fantasy VIII','2026-07-23T21:34:25.568588+00:00','https://www.youtube.com/watch?v=mCDGcXpWXqA',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Wings_of_Freedom_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4010,'Abyssal Reverie','The Legend of Zelda: Link''s Awakening','2026-07-23T23:27:52.550313+00:00','https://www.youtube.com/watch?v=2NmUetvLOQ8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Abyssal_Reverie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4011,'Beginning of the Journey','Terranigma','2026-07-25T10:07:13.496395+00:00','https://www.youtube.com/watch?v=uBqFj-6WFVc',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Beginning_of_the_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4012,'Find My Way','Terranigma','2026-07-24T20:45:50.182300+00:00','https://www.youtube.com/watch?v=wAENmheH8tk',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Find_My_Way_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4013,'An American Expanse','Terranigma','2026-07-24T04:47:20.614617+00:00','https://www.youtube.com/watch?v=fUywlqmQ-EQ',257,'https://ocrmirror.org/files/music/remixes/Terranigma_An_American_Expanse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4014,'Protectress','Terranigma','2026-07-24T00:57:38.260919+00:00','https://www.youtube.com/watch?v=dVH9l2zK6ws',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Protectress_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4015,'Royd Rage','Terranigma','2026-07-25T04:42:56.862848+00:00','https://www.youtube.com/watch?v=Dc385e02WrA',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Royd_Rage_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4016,'Green Rabbit Dreams','Jazz Jackrabbit: Holiday Hare 1995','2026-07-24T04:47:20.887743+00:00','https://www.youtube.com/watch?v=spkzDzCbahg',15247,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_Holiday_Hare_1995_Green_Rabbit_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4017,'Stockings by the Fire','.hack//Infection - Part 1','2026-07-23T15:30:41.455712+00:00','https://www.youtube.com/watch?v=CvwlBSrf4qg',956,'https://ocrmirror.org/files/music/remixes/dot_hack_Infection_Part_1_Stockings_by_the_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4018,'Cossack Skies²','Mega Man 4','2026-07-23T17:54:21.157773+00:00','https://www.youtube.com/watch?v=Gr-fdC3NzwY',4,'https://ocrmirror.org/files/music/remixes/Mega_Man_4_Cossack_Skies2_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4019,'89 Is the New 19','Shadow of the Beast','2026-07-24T10:33:13.516496+00:00','https://www.youtube.com/watch?v=g-BJj6acAwg',151,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Beast_89_Is_the_New_19_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4020,'Will We Meet Again?','Terranigma','2026-07-25T11:43:50.406668+00:00','https://www.youtube.com/watch?v=D4O88wadtyg',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Will_We_Meet_Again_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4021,'Streets of Mysidia','Final Fantasy IV','2026-07-23T15:30:40.581598+00:00','https://www.youtube.com/watch?v=6MlpQO7lBWQ',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Streets_of_Mysidia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4022,'Destiny''s Spire','Terranigma','2026-07-23T15:30:41.806143+00:00','https://www.youtube.com/watch?v=LCZu7jqmuEw',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Destiny''s_Spire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4023,'Hallucinatory Province','Secret of Mana','2026-07-23T17:54:21.503387+00:00','https://www.youtube.com/watch?v=TNT9htkffa4',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Hallucinatory_Province_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4024,'Solace, Within & Aethernium','Ys: The Oath in Felghana','2026-07-23T23:27:51.314442+00:00','https://www.youtube.com/watch?v=pdb_Wb-Tbx4',27107,'https://ocrmirror.org/files/music/remixes/Ys_The_Oath_in_Felghana_Solace_Within_&_Aethernium_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4025,'To See Like Me','The Legend of Zelda: Ocarina of Time','2026-07-25T15:39:26.499580+00:00','https://www.youtube.com/watch?v=JuT7vi-I6-o',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_To_See_Like_Me_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4026,'One Man and His Metal Gun!','Final Fantasy VIII','2026-07-23T21:34:26.979401+00:00','https://www.youtube.com/watch?v=A1SXI_KH2ig',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_One_Man_and_His_Metal_Gun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4027,'Groove Buster','Deltarune','2026-07-23T17:54:22.025571+00:00','https://www.youtube.com/watch?v=5GbQtc3Uzoo',95557,'https://ocrmirror.org/files/music/remixes/Deltarune_Groove_Buster_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4028,'Shadows from the Past','Secret of Mana','2026-07-24T12:57:18.399547+00:00','https://www.youtube.com/watch?v=Yl5w_xXLZMQ',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Shadows_from_the_Past_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4029,'Peace and Bliss','Final Fantasy X','2026-07-23T19:54:54.994983+00:00','https://www.youtube.com/watch?v=aifPrUUFVro',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Peace_and_Bliss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4030,'The Silver Crystal','Skies of Arcadia','2026-07-24T00:57:39.652927+00:00','https://www.youtube.com/watch?v=cNFBoc1Rgsw',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_The_Silver_Crystal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4031,'It''s Our Time','The Goonies','2026-07-23T19:54:56.096814+00:00','https://www.youtube.com/watch?v=R1QLKj5AgaE',3454,'https://ocrmirror.org/files/music/remixes/Goonies_It''s_Our_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4032,'Empty Nest','The Legend of Zelda: Link''s Awakening','2026-07-23T17:54:22.197336+00:00','https://www.youtube.com/watch?v=E96vFtKmRtg',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Empty_Nest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4033,'Enigma of a Broken Soul','Terranigma','2026-07-24T17:04:21.243076+00:00','https://www.youtube.com/watch?v=zQYda8rQOy4',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Enigma_of_a_Broken_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4034,'Prepare to Learn','Tangledeep','2026-07-25T04:42:57.223666+00:00','https://www.youtube.com/watch?v=tzkgjYUL_aE',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_Prepare_to_Learn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4035,'Tranquil Homesteads','The Legend of Zelda: Oracle of Ages','2026-07-23T21:34:27.155097+00:00','https://www.youtube.com/watch?v=dS5v9rcA13s',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Tranquil_Homesteads_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4036,'Homecoming','Final Fantasy IX','2026-07-24T10:33:13.749023+00:00','https://www.youtube.com/watch?v=DecQ5TLvUj4',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Homecoming_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4037,'Skaði, Fjallið Veiði Gyðja','Terranigma','2026-07-24T22:34:04.287422+00:00','https://www.youtube.com/watch?v=tNoaSyVw6jQ',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Skadi_Fjallid_Veidi_Gydja_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4038,'Dark Awaits','Hunt: Showdown','2026-07-24T00:57:39.132846+00:00','https://www.youtube.com/watch?v=Azr6ABqnYvk',95585,'https://ocrmirror.org/files/music/remixes/Hunt_Showdown_Dark_Awaits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4039,'Machine Wash','The Legend of Zelda: Majora''s Mask','2026-07-24T00:57:38.959636+00:00','https://www.youtube.com/watch?v=1fNrldX0UCQ',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Machine_Wash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4040,'Mother Earth (Bound by Fate)','Terranigma','2026-07-24T18:57:24.359400+00:00','https://www.youtube.com/watch?v=UD8NyKr8IaE',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Mother_Earth_(Bound_by_Fate)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4041,'Pot of Greed Is Banned for a Reason','Yu-Gi-Oh!: Forbidden Memories','2026-07-24T12:57:18.752547+00:00','https://www.youtube.com/watch?v=Y3_4hRimR_I',43637,'https://ocrmirror.org/files/music/remixes/Yu-Gi-Oh_Forbidden_Memories_Pot_of_Greed_Is_Banned_for_a_Reason_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4042,'Misdirection','Dragon Ball Z: Budokai Tenkaichi 2','2026-07-24T07:53:16.240666+00:00','https://www.youtube.com/watch?v=9b6uC2QFwYo',9684,'https://ocrmirror.org/files/music/remixes/Dragon_Ball_Z_Budokai_Tenkaichi_2_Misdirection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4043,'In Bayshire','Yu-Gi-Oh! 5D''s: Duel Transer','2026-07-24T20:45:50.399823+00:00','https://www.youtube.com/watch?v=oSMbWfeAgI4',94482,'https://ocrmirror.org/files/music/remixes/Yu-Gi-Oh_5D''s_Duel_Transer_In_Bayshire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4044,'Among the Glaciers','One Piece: Unlimited Cruise 1 - The Treasure Beneath the Waves','2026-07-23T23:27:52.019243+00:00','https://www.youtube.com/watch?v=liXk4RsesN4',49613,'https://ocrmirror.org/files/music/remixes/One_Piece_Unlimited_Cruise_1_Among_the_Glaciers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4045,'Not Just Elevator Music','Yu-Gi-Oh!: Forbidden Memories','2026-07-24T15:12:33.098119+00:00','https://www.youtube.com/watch?v=6YPOiROlybA',43637,'https://ocrmirror.org/files/music/remixes/Yu-Gi-Oh_Forbidden_Memories_Not_Just_Elevator_Music_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4046,'Mind Flip~','Mega Man X4','2026-07-24T04:47:20.203343+00:00','https://www.youtube.com/watch?v=DMxcuMR6C_4',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Mind_Flip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4047,'Our Home','The Legend of Zelda: Breath of the Wild','2026-07-25T07:31:57.973180+00:00','https://www.youtube.com/watch?v=_OWL3CWdZgU',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Our_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4048,'Anti-Annihilation Matrix','Chrono Cross','2026-07-24T00:57:38.437499+00:00','https://www.youtube.com/watch?v=RbxlLVS15fw',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Anti-Annihilation_Matrix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4049,'Hidden Shrines','The Legend of Zelda: Skyward Sword','2026-07-24T15:12:33.919625+00:00','https://www.youtube.com/watch?v=pNOQUspGDW4',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Hidden_Shrines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4050,'Dirty Secret','Chrono Trigger','2026-07-24T20:45:50.071684+00:00','https://www.youtube.com/watch?v=2wmVblMS32I',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Dirty_Secret_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4051,'Eighties Ate My Zombies','Zombies Ate My Neighbors','2026-07-23T21:34:25.749224+00:00','https://www.youtube.com/watch?v=jWBWvyZ2b80',344,'https://ocrmirror.org/files/music/remixes/Zombies_Ate_My_Neighbors_Eighties_Ate_My_Zombies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4052,'Wade into the Changing Tide','Terranigma','2026-07-25T01:02:13.476903+00:00','https://www.youtube.com/watch?v=k7cN7MNFqa8',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Wade_into_the_Changing_Tide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4053,'Stormbringer','Guild Wars 2','2026-07-24T07:53:14.524724+00:00','https://www.youtube.com/watch?v=ZWYMkDxTvF8',948,'https://ocrmirror.org/files/music/remixes/Guild_Wars_2_Stormbringer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4054,'Clockworks','The Legend of Zelda: Skyward Sword','2026-07-24T00:57:39.306335+00:00','https://www.youtube.com/watch?v=KBaBfBNCTRk',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Clockworks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4055,'TEYANDEE!','Kyatto Ninden Teyandee','2026-07-24T04:47:21.026108+00:00','https://www.youtube.com/watch?v=dDQH5zA-2GY',47232,'https://ocrmirror.org/files/music/remixes/Kyatto_Ninden_Teyandee_TEYANDEE_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4056,'Flow State Undercurrents','The Legend of Zelda: Ocarina of Time','2026-07-24T17:04:20.363685+00:00','https://www.youtube.com/watch?v=rD9zvu9HDnU',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Flow_State_Undercurrents_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4057,'With Heart and Soul','Final Fantasy VII','2026-07-25T10:07:12.800101+00:00','https://www.youtube.com/watch?v=13_3Yb96HqA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_With_Heart_and_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4058,'Groovin'' Like a ''90s Kid','Terranigma','2026-07-25T23:31:58.275620+00:00','https://www.youtube.com/watch?v=nsCcAsTUCfU',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Groovin''_Like_a_''90s_Kid_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4059,'Kuwanga Banga','Mega Man X','2026-07-24T07:53:15.617954+00:00','https://www.youtube.com/watch?v=mJRy3IcoFt0',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Kuwanga_Banga_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4060,'A Beakful of Beatdown','Tangledeep','2026-07-24T17:04:21.418805+00:00','https://www.youtube.com/watch?v=edoSRCgOaww',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_A_Beakful_of_Beatdown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4061,'The Lost Legend of Lylat','Star Fox 2','2026-07-24T07:53:14.703242+00:00','https://www.youtube.com/watch?v=9wXl1PKmE0Y',453,'https://ocrmirror.org/files/music/remixes/Star_Fox_2_The_Lost_Legend_of_Lylat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4062,'Never Gonna Give (Up the Funk)','Mega Man X5','2026-07-25T15:39:26.152942+00:00','https://www.youtube.com/watch?v=0ONQkJ1C4Zc',612,'https://ocrmirror.org/files/music/remixes/Mega_Man_X5_Never_Gonna_Give_(Up_the_Funk)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4063,'Blessings of the Moon','Final Fantasy IX','2026-07-23T23:27:51.667478+00:00','https://www.youtube.com/watch?v=7Q8ivIQoitY',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Blessings_of_the_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4064,'A Toadstool Mix...','The Legend of Zelda: Link''s Awakening','2026-07-24T18:57:25.065893+00:00','https://www.youtube.com/watch?v=1Z607_MTMt4',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_A_Toadstool_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4065,'Dragonborn Concerto','The Elder Scrolls V: Skyrim','2026-07-25T07:31:58.148769+00:00','https://www.youtube.com/watch?v=6C366FoTvjA',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Dragonborn_Concerto_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4066,'Oh Daisy, Daisy!','Super Mario Land','2026-07-24T22:34:04.112650+00:00','https://www.youtube.com/watch?v=pksYo7MWioU',145,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_Oh_Daisy_Daisy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4067,'Unchain Me','Final Fantasy IX','2026-07-25T07:31:58.687917+00:00','https://www.youtube.com/watch?v=qkDrM71zqrw',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Unchain_Me_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4068,'Across the Hills','Final Fantasy IX','2026-07-24T22:34:03.938473+00:00','https://www.youtube.com/watch?v=WjbbdNPUBb8',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Across_the_Hills_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4069,'Arctic Mayhem','Battletoads','2026-07-24T04:47:21.162768+00:00','https://www.youtube.com/watch?v=LdEzkBgpaUc',741,'https://ocrmirror.org/files/music/remixes/Battletoads_Arctic_Mayhem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4070,'Vacation in the Mushroom Kingdom','Mario Kart: Double Dash!!','2026-07-25T04:42:57.401461+00:00','https://www.youtube.com/watch?v=x3zAJyeeHOs',7366,'https://ocrmirror.org/files/music/remixes/Mario_Kart_Double_Dash_Vacation_in_the_Mushroom_Kingdom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4071,'Irreversible','Undertale','2026-07-25T01:02:14.530438+00:00','https://www.youtube.com/watch?v=rW3grqZa4h8',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Irreversible_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4072,'Grav''iton''s Dream','Final Fantasy XI Online: Rise of the Zilart','2026-07-24T07:53:16.056019+00:00','https://www.youtube.com/watch?v=BOc8akdtSlA',23192,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_Rise_of_the_Zilart_Grav''iton''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4073,'Howling Winds','Final Fantasy VII','2026-07-24T12:57:19.638558+00:00','https://www.youtube.com/watch?v=32Y7DTcQgDw',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Howling_Winds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4074,'Snake''s in the Jungle','Metal Gear','2026-07-24T17:04:21.597020+00:00','https://www.youtube.com/watch?v=Suw_kF-zCiM',140,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Snake''s_in_the_Jungle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4075,'Faxanadoom','Faxanadu','2026-07-23T23:27:52.195694+00:00','https://www.youtube.com/watch?v=7oGo7sK1DKc',114,'https://ocrmirror.org/files/music/remixes/Faxanadu_Faxanadoom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4076,'Proxy Challenge','The Legend of Zelda: Twilight Princess','2026-07-24T04:47:20.064929+00:00','https://www.youtube.com/watch?v=H7nWQePXMiE',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Proxy_Challenge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4077,'Funk Buster','Deltarune','2026-07-24T20:45:50.509838+00:00','https://www.youtube.com/watch?v=YntnzaXf8wY',95557,'https://ocrmirror.org/files/music/remixes/Deltarune_Funk_Buster_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4078,'Seeing Stars','Super Mario Land 2: 6 Golden Coins','2026-07-24T15:12:32.926410+00:00','https://www.youtube.com/watch?v=pPImGHs61Wg',606,'https://ocrmirror.org/files/music/remixes/Super_Mario_Land_2_Seeing_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4079,'Farewell, Beloved Ones','Pokémon Red Version','2026-07-25T01:02:13.655102+00:00','https://www.youtube.com/watch?v=jbOAWpWoXA4',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Farewell_Beloved_Ones_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4080,'Hortus Conclusus','Seiken Densetsu 3','2026-07-25T10:07:12.265435+00:00','https://www.youtube.com/watch?v=ZstpW-QzG-g',149,'https://ocrmirror.org/files/music/remixes/Seiken_Densetsu_3_Hortus_Conclusus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4081,'Birdo''s Revenge','Super Mario Bros. 2','2026-07-25T15:39:25.808557+00:00','https://www.youtube.com/watch?v=f5ghRJ5m0aI',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Birdo''s_Revenge_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4082,'The Bubbleologists','Mega Man 2','2026-07-24T17:04:20.891033+00:00','https://www.youtube.com/watch?v=y563eaF0Z8o',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Bubbleologists_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4083,'Kamomilla','Psycho Pinball','2026-07-24T10:33:12.930660+00:00','https://www.youtube.com/watch?v=VlQafElWo58',16150,'https://ocrmirror.org/files/music/remixes/Psycho_Pinball_Kamomilla_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4084,'Brave New World','Terranigma','2026-07-25T22:26:09.588420+00:00','https://www.youtube.com/watch?v=YrdM5Thw_mM',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Brave_New_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4085,'Teenage Mutant Ninja Koopa','Paper Mario','2026-07-25T15:39:25.980342+00:00','https://www.youtube.com/watch?v=FsNyKQ_J8TM',3070,'https://ocrmirror.org/files/music/remixes/Paper_Mario_Teenage_Mutant_Ninja_Koopa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4086,'Guldove Shaman','Chrono Cross','2026-07-24T04:47:19.926592+00:00','https://www.youtube.com/watch?v=h5OV2O0wbYk',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Guldove_Shaman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4087,'Land of the Eidolons','Final Fantasy VI','2026-07-24T10:33:12.462674+00:00','https://www.youtube.com/watch?v=k2htUb3cKuA',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Land_of_the_Eidolons_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4088,'Treacherous Road','Sword of Vermilion','2026-07-24T04:47:20.751093+00:00','https://www.youtube.com/watch?v=5G_7xCLgvUg',236,'https://ocrmirror.org/files/music/remixes/Sword_of_Vermilion_Treacherous_Road_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4089,'Golden Sunrise','Golden Sun','2026-07-25T04:42:56.507305+00:00','https://www.youtube.com/watch?v=Cxugq92o2jk',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Golden_Sunrise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4090,'Hand of the Fire Clan','Golden Sun','2026-07-25T01:02:13.298543+00:00','https://www.youtube.com/watch?v=cEQWVfMBQxM',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Hand_of_the_Fire_Clan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4091,'Angarian Vigil','Golden Sun','2026-07-25T10:07:12.090707+00:00','https://www.youtube.com/watch?v=PtPKG2KpW8Q',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Angarian_Vigil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4092,'Sorrow of the Forest','Golden Sun','2026-07-24T15:12:32.745891+00:00','https://www.youtube.com/watch?v=riH_vKCvcJg',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Sorrow_of_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4093,'I''m Golden, Son!','Golden Sun','2026-07-26T04:05:17.422133+00:00','https://www.youtube.com/watch?v=oTA8M-vvkBY',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_I''m_Golden_Son_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4094,'Smooth Sailing','Golden Sun','2026-07-25T14:09:21.150696+00:00','https://www.youtube.com/watch?v=boWFJZ4i40I',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Smooth_Sailing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4095,'Reflection of the Wolf Moon','Golden Sun: The Lost Age','2026-07-25T04:42:56.329259+00:00','https://www.youtube.com/watch?v=VKQR7GqAANY',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_Reflection_of_the_Wolf_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4096,'Riding the Desert Winds','Golden Sun','2026-07-24T15:12:32.571869+00:00','https://www.youtube.com/watch?v=beUwpbWIe2I',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Riding_the_Desert_Winds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4097,'Treason Deserves Death','Golden Sun: The Lost Age','2026-07-24T15:12:33.678423+00:00','https://www.youtube.com/watch?v=WpN7ln-81F4',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_Treason_Deserves_Death_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4098,'Going Down the Line','Golden Sun: The Lost Age','2026-07-25T21:24:48.316045+00:00','https://www.youtube.com/watch?v=nej6jU8ZPJI',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_Going_Down_the_Line_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4099,'What I Want to Say','Golden Sun: The Lost Age','2026-07-26T11:44:22.779043+00:00','https://www.youtube.com/watch?v=kOI47oQpF1Y',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_What_I_Want_to_Say_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4100,'Galaxy Drifter','Super Mario Galaxy','2026-07-24T12:57:19.815153+00:00','https://www.youtube.com/watch?v=vphrQxM_Rv4',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Galaxy_Drifter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4101,'Thermal Encouragement','Portal 2','2026-07-24T10:33:12.577448+00:00','https://www.youtube.com/watch?v=0IpfzIIjG8s',826,'https://ocrmirror.org/files/music/remixes/Portal_2_Thermal_Encouragement_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4102,'To the Open Seas!','Golden Sun: The Lost Age','2026-07-24T15:12:33.270631+00:00','https://www.youtube.com/watch?v=qlcjy25vMnM',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_To_the_Open_Seas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4103,'Starting a New Chapter','Golden Sun','2026-07-24T17:04:21.772731+00:00','https://www.youtube.com/watch?v=zkm3UPLwr7Q',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Starting_a_New_Chapter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4104,'Foraging Melodies','The Legend of Zelda: Breath of the Wild','2026-07-24T17:04:20.538984+00:00','https://www.youtube.com/watch?v=4eJT-B1oAU4',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Foraging_Melodies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4105,'Burning Shine','Super Mario Bros. 3','2026-07-25T10:07:13.322387+00:00','https://www.youtube.com/watch?v=YseFPYNEsTs',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Burning_Shine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4106,'Chillaxing Day','Undertale','2026-07-24T12:57:18.218881+00:00','https://www.youtube.com/watch?v=6wi9-OKWJN8',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Chillaxing_Day_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4107,'Neon Black Apocalypse','Final Fantasy IX','2026-07-25T01:02:14.355462+00:00','https://www.youtube.com/watch?v=TP9V0hIamb4',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Neon_Black_Apocalypse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4108,'Volcanic Glass','Sonic & Knuckles','2026-07-26T04:05:17.693392+00:00','https://www.youtube.com/watch?v=9cJH2Dpf_tA',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Volcanic_Glass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4109,'Weight of the Other Promise (Overdrive Battle Mix)','Kingdom Hearts II Final Mix','2026-07-25T10:07:12.973388+00:00','https://www.youtube.com/watch?v=jW5l9OSzC44',9998,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_2_Final_Mix_Weight_of_the_Other_Promise_(Overdrive_Battle_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4110,'Sleeping Beauty Makes a Horrible Nightmare','Kingdom Hearts: Birth by Sleep','2026-07-24T10:33:12.687106+00:00','https://www.youtube.com/watch?v=b0bXK8J1xd8',93674,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Birth_by_Sleep_Sleeping_Beauty_Makes_a_Horrible_Nightmare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4111,'The Shimmering Ether of Satorl','Xenoblade Chronicles','2026-07-24T22:34:03.232549+00:00','https://www.youtube.com/watch?v=5jbCPpCaA_o',825,'https://ocrmirror.org/files/music/remixes/Xenoblade_Chronicles_The_Shimmering_Ether_of_Satorl_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4112,'T-Spin','Tetris','2026-07-25T04:42:55.968153+00:00','https://www.youtube.com/watch?v=uXtohha4kEI',510,'https://ocrmirror.org/files/music/remixes/Tetris_T-Spin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4113,'Bright Moon','Shin Megami Tensei: Persona 3','2026-07-24T18:57:25.241767+00:00','https://www.youtube.com/watch?v=B0yM0-Q8R6U',736,'https://ocrmirror.org/files/music/remixes/Shin_Megami_Tensei_Persona_3_Bright_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4114,'Brother','Elemental Master','2026-07-24T22:34:03.589021+00:00','https://www.youtube.com/watch?v=_rFMTteQn7Y',747,'https://ocrmirror.org/files/music/remixes/Elemental_Master_Brother_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4115,'A Maiden''s Prayer','Final Fantasy X','2026-07-24T18:57:24.002922+00:00','https://www.youtube.com/watch?v=14CIcpaTy7I',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_A_Maiden''s_Prayer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4116,'Macalania Shaman','Final Fantasy X','2026-07-25T04:42:56.150375+00:00','https://www.youtube.com/watch?v=7hM4KXVDjmo',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Macalania_Shaman_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4117,'Horizons of Time','Chrono Trigger','2026-07-25T17:30:16.358186+00:00','https://www.youtube.com/watch?v=gO9F2t1fnfA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Horizons_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4118,'Velocity: Fueled by Sake','Power Drift','2026-07-25T07:31:57.269322+00:00','https://www.youtube.com/watch?v=1BPgJKSJSEg',30400,'https://ocrmirror.org/files/music/remixes/Power_Drift_Velocity_Fueled_by_Sake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4119,'Zacatecas','Super Mario Galaxy','2026-07-26T04:05:17.828919+00:00','https://www.youtube.com/watch?v=aDwgJ2kvf7A',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Zacatecas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4120,'Poseidon at the Cinema','Assassin''s Creed Odyssey','2026-07-24T18:57:25.417615+00:00','https://www.youtube.com/watch?v=oIvf4wwO6mg',95612,'https://ocrmirror.org/files/music/remixes/Assassin''s_Creed_Odyssey_Poseidon_at_the_Cinema_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4121,'Front Move','Teenage Mutant Ninja Turtles: Tournament Fighters','2026-07-24T20:45:49.587168+00:00','https://www.youtube.com/watch?v=IpaCrwLJoH4',4495,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_Tournament_Fighters_Front_Move_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4122,'Legends of Warcraft','World of Warcraft','2026-07-25T14:09:22.220071+00:00','https://www.youtube.com/watch?v=oPp2zt6ly70',462,'https://ocrmirror.org/files/music/remixes/World_of_Warcraft_Legends_of_Warcraft_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4123,'At the End of the Road','Golden Sun: The Lost Age','2026-07-25T11:43:49.876382+00:00','https://www.youtube.com/watch?v=954Upgjd6N0',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_At_the_End_of_the_Road_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4124,'Tomorrow''s Starting','Stardew Valley','2026-07-25T22:26:09.697697+00:00','https://www.youtube.com/watch?v=oQ8E4-bWWZc',95613,'https://ocrmirror.org/files/music/remixes/Stardew_Valley_Tomorrow''s_Starting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4125,'Streets of Tolbi','Golden Sun','2026-07-26T14:08:10.970027+00:00','https://www.youtube.com/watch?v=zUh_kVAMDo0',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Streets_of_Tolbi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4126,'Dreaming Down the Lane','Pokémon Gold Version','2026-07-25T10:07:11.913135+00:00','https://www.youtube.com/watch?v=Gs7K6LzD6_w',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Dreaming_Down_the_Lane_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4127,'DJ Snivy''s Smooth Moves','Pokémon Black Version','2026-07-25T14:09:22.027309+00:00','https://www.youtube.com/watch?v=50h-Te_qdoQ',95615,'https://ocrmirror.org/files/music/remixes/Pokemon_Black_Version_DJ_Snivy''s_Smooth_Moves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4128,'On the Shores of Canalave','Pokémon Diamond Version','2026-07-25T11:43:48.810773+00:00','https://www.youtube.com/watch?v=a78IAfo5Fhc',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_On_the_Shores_of_Canalave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4129,'One Must Fall 2064','One Must Fall 2097','2026-07-25T01:02:14.004341+00:00','https://www.youtube.com/watch?v=QOJlVpxpPpk',307,'https://ocrmirror.org/files/music/remixes/One_Must_Fall_2097_One_Must_Fall_2064_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4130,'Galaheart''s Journey','Firelord','2026-07-24T20:45:50.618197+00:00','https://www.youtube.com/watch?v=D4dYicEMQT8',1127,'https://ocrmirror.org/files/music/remixes/Firelord_Galaheart''s_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4131,'Gravidade','Mega Man 5','2026-07-25T11:43:50.230924+00:00','https://www.youtube.com/watch?v=SYWfcE3GrF0',296,'https://ocrmirror.org/files/music/remixes/Mega_Man_5_Gravidade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4132,'Farewell to Tranquility','Octopath Traveler','2026-07-25T07:31:57.798175+00:00','https://www.youtube.com/watch?v=oTmgN_Dus_0',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_Farewell_to_Tranquility_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4133,'Blue Magic','Terranigma','2026-07-25T23:31:57.921538+00:00','https://www.youtube.com/watch?v=IhOLQq7q9ZI',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Blue_Magic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4134,'All I Am','Chrono Cross','2026-07-25T21:24:48.668310+00:00','https://www.youtube.com/watch?v=L1PDg7fSlGg',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_All_I_Am_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4135,'Home Is Where You Belong','Final Fantasy IX','2026-07-25T10:07:12.625384+00:00','https://www.youtube.com/watch?v=4BCpe20MBno',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Home_Is_Where_You_Belong_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4136,'Curb Your N. Thusiasm','Crash Bandicoot: Warped','2026-07-25T17:30:15.076065+00:00','https://www.youtube.com/watch?v=-YM8NqmuBc0',41569,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_Warped_Curb_Your_N_Thusiasm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4137,'Treading the Maze of Trials','The Legend of Zelda: Skyward Sword','2026-07-25T07:31:58.325096+00:00','https://www.youtube.com/watch?v=n607FnupG78',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Treading_the_Maze_of_Trials_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4138,'Dungeoneering','The Legend of Zelda','2026-07-25T01:02:13.829042+00:00','https://www.youtube.com/watch?v=Tix0uhIQgs0',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Dungeoneering_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4139,'Wires of Sponges','Mega Man X2','2026-07-25T11:43:48.991198+00:00','https://www.youtube.com/watch?v=g6Fwb4W-R8o',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Wires_of_Sponges_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4140,'War Never Changes','God of War','2026-07-24T17:04:20.182530+00:00','https://www.youtube.com/watch?v=YA2yZChfsp4',95627,'https://ocrmirror.org/files/music/remixes/God_of_War_War_Never_Changes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4141,'Flight over the Enchanted Forest','Final Fantasy V','2026-07-25T04:42:57.580305+00:00','https://www.youtube.com/watch?v=PU3ZwOtuTcM',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Flight_over_the_Enchanted_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4142,'Now the Flowers Will Grow!','Super Mario Odyssey','2026-07-25T22:26:10.024366+00:00','https://www.youtube.com/watch?v=iRR6F2lK_lk',95486,'https://ocrmirror.org/files/music/remixes/Super_Mario_Odyssey_Now_the_Flowers_Will_Grow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4143,'Serenity & Grace','Chrono Cross','2026-07-26T17:31:59.784152+00:00','https://www.youtube.com/watch?v=sEArghyCzJQ',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Serenity_&_Grace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4144,'Climb into the Air and Close the Sky','Night in the Woods','2026-07-26T09:32:30.152139+00:00','https://www.youtube.com/watch?v=W2Lr3lP94g8',95628,'https://ocrmirror.org/files/music/remixes/Night_in_the_Woods_Climb_into_the_Air_and_Close_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4145,'Toadwise','Battletoads in Battlemaniacs','2026-07-24T15:12:32.219380+00:00','https://www.youtube.com/watch?v=_rLDz6h7moI',10878,'https://ocrmirror.org/files/music/remixes/Battletoads_in_Battlemaniacs_Toadwise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4146,'Digital Illusions','Pinball Dreams','2026-07-26T11:44:22.427206+00:00','https://www.youtube.com/watch?v=iBrAjfXyF8c',7693,'https://ocrmirror.org/files/music/remixes/Pinball_Dreams_Digital_Illusions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4147,'The Dark Rebirth: 1983','Amnesia: The Dark Descent','2026-07-24T18:57:24.182307+00:00','https://www.youtube.com/watch?v=-uy7k6oPRsM',95630,'https://ocrmirror.org/files/music/remixes/Amnesia_The_Dark_Descent_The_Dark_Rebirth_1983_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4148,'The Zombies Are Coming','Plants vs. Zombies','2026-07-26T11:44:22.603222+00:00','https://www.youtube.com/watch?v=VKRhwOBYqzM',727,'https://ocrmirror.org/files/music/remixes/Plants_vs_Zombies_The_Zombies_Are_Coming_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4149,'Cerebral','Plants vs. Zombies','2026-07-24T18:57:25.592765+00:00','https://www.youtube.com/watch?v=ox_56iKMSIE',727,'https://ocrmirror.org/files/music/remixes/Plants_vs_Zombies_Cerebral_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4150,'Winter Is Coming','Plants vs. Zombies','2026-07-25T10:07:12.442422+00:00','https://www.youtube.com/watch?v=8WQWmCcG9Rw',727,'https://ocrmirror.org/files/music/remixes/Plants_vs_Zombies_Winter_Is_Coming_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4151,'There''s a Zomboss on My Roof','Plants vs. Zombies','2026-07-25T14:09:21.500508+00:00','https://www.youtube.com/watch?v=VRI5VaMAQXw',727,'https://ocrmirror.org/files/music/remixes/Plants_vs_Zombies_There''s_a_Zomboss_on_My_Roof_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4152,'Surgical Strike','Life Force','2026-07-25T22:26:09.301083+00:00','https://www.youtube.com/watch?v=HrvteCE1V4I',237,'https://ocrmirror.org/files/music/remixes/Life_Force_Surgical_Strike_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4153,'999 Knives of Yellow Magikarp Orchestra','Pokémon Sun','2026-07-25T23:31:58.452434+00:00','https://www.youtube.com/watch?v=E6arcoldPcM',95452,'https://ocrmirror.org/files/music/remixes/Pokemon_Sun_999_Knives_of_Yellow_Magikarp_Orchestra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4154,'Transcendent Discovery','Final Fantasy XIII','2026-07-25T11:43:49.347104+00:00','https://www.youtube.com/watch?v=csQv10XlwB4',694,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_13_Transcendent_Discovery_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4155,'It''s Been a Wily','Mega Man 2','2026-07-25T14:09:21.325006+00:00','https://www.youtube.com/watch?v=TakNh6wRTRE',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_It''s_Been_a_Wily_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4156,'Arboreality','The Guardian Legend','2026-07-25T17:30:15.424602+00:00','https://www.youtube.com/watch?v=f0XdYlMl5Hw',195,'https://ocrmirror.org/files/music/remixes/Guardian_Legend_Arboreality_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4157,'Past Meets Present','Pokémon Gold Version','2026-07-25T14:09:21.852275+00:00','https://www.youtube.com/watch?v=3auHxBi2nTQ',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Past_Meets_Present_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4158,'Slowpoke Paradise','Pokémon Gold Version','2026-07-25T21:24:47.441536+00:00','https://www.youtube.com/watch?v=pk1igxW5WQA',641,'https://ocrmirror.org/files/music/remixes/Pokemon_Gold_Version_Slowpoke_Paradise_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4159,'Reminiscing by the River','Octopath Traveler','2026-07-25T11:43:49.522285+00:00','https://www.youtube.com/watch?v=D9Fi67Be_iA',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_Reminiscing_by_the_River_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4160,'Selphie''s Operation','Final Fantasy VIII','2026-07-24T20:45:49.699579+00:00','https://www.youtube.com/watch?v=noHArlg-e3E',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Selphie''s_Operation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4161,'Bald Monkey at Barbery Coast','The Curse of Monkey Island','2026-07-25T01:02:14.705414+00:00','https://www.youtube.com/watch?v=BqVISxHW5N0',668,'https://ocrmirror.org/files/music/remixes/Curse_of_Monkey_Island_Bald_Monkey_at_Barbery_Coast_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4162,'Force of Nature','Golden Sun','2026-07-25T07:31:57.447057+00:00','https://www.youtube.com/watch?v=7dNlL6W5YyU',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Force_of_Nature_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4163,'And Hell Followed Him','Darksiders II','2026-07-26T14:08:10.794022+00:00','https://www.youtube.com/watch?v=F0Sfq5tsAyE',885,'https://ocrmirror.org/files/music/remixes/Darksiders_2_And_Hell_Followed_Him_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4164,'Spirit of the Sword','The Legend of Zelda: Skyward Sword','2026-07-26T11:44:21.719400+00:00','https://www.youtube.com/watch?v=N8ic6O9IIoo',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Spirit_of_the_Sword_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4165,'Righteous Ragemaster Rocketship Rampage','ToeJam & Earl','2026-07-26T17:32:00.139035+00:00','https://www.youtube.com/watch?v=L03lotK44RM',99,'https://ocrmirror.org/files/music/remixes/ToeJam_&_Earl_Righteous_Ragemaster_Rocketship_Rampage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4166,'The Butcher of Blaviken','The Witcher 3: Wild Hunt','2026-07-25T15:39:25.289740+00:00','https://www.youtube.com/watch?v=33CCwTTXAh8',95349,'https://ocrmirror.org/files/music/remixes/Witcher_3_The_Butcher_of_Blaviken_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4167,'City of Lost Things','Earthworm Jim','2026-07-26T09:32:29.974562+00:00','https://www.youtube.com/watch?v=pc9BWw_PGgY',54064,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_City_of_Lost_Things_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4168,'Devil''s Lament','Doom','2026-07-26T17:31:59.252406+00:00','https://www.youtube.com/watch?v=hlIDXh_p3Ic',14512,'https://ocrmirror.org/files/music/remixes/Doom_Devil''s_Lament_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4169,'Chariot of the Moon','Final Fantasy IV','2026-07-25T21:24:47.266346+00:00','https://www.youtube.com/watch?v=OzDpAn-mW6g',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Chariot_of_the_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4170,'Sunset Heroes','Ys III: Wanderers from Ys','2026-07-25T11:43:50.052935+00:00','https://www.youtube.com/watch?v=m4nXbSMm9hU',4221,'https://ocrmirror.org/files/music/remixes/Ys_3_Sunset_Heroes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4171,'Feena''s Premonition','Ys III: Wanderers from Ys','2026-07-25T17:30:15.833778+00:00','https://www.youtube.com/watch?v=Pznp2LW4AzE',4221,'https://ocrmirror.org/files/music/remixes/Ys_3_Feena''s_Premonition_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4172,'Great Success','Shin Megami Tensei: Persona 4','2026-07-25T21:24:47.086145+00:00','https://www.youtube.com/watch?v=oOE2PoGq0X4',47072,'https://ocrmirror.org/files/music/remixes/Shin_Megami_Tensei_Persona_4_Great_Success_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4173,'Xerrox Salad/Memories of Memories','Conker''s Bad Fur Day','2026-07-25T15:39:25.635622+00:00','https://www.youtube.com/watch?v=Zs00LMOnMro',526,'https://ocrmirror.org/files/music/remixes/Conker''s_Bad_Fur_Day_Xerrox_Salad_Memories_of_Memories_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4174,'Rytlock''s Super Critter Rave','Guild Wars 2','2026-07-25T22:26:08.935130+00:00','https://www.youtube.com/watch?v=C4opkhLUyZo',948,'https://ocrmirror.org/files/music/remixes/Guild_Wars_2_Rytlock''s_Super_Critter_Rave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4175,'Cyber Chrome','Journey to Silius','2026-07-25T22:26:09.156076+00:00','https://www.youtube.com/watch?v=NE067-QFG2s',154,'https://ocrmirror.org/files/music/remixes/Journey_to_Silius_Cyber_Chrome_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4176,'Acting on Instinct','Command & Conquer','2026-07-25T07:31:58.500154+00:00','https://www.youtube.com/watch?v=wQqgd0ws-BI',839,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Acting_on_Instinct_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4177,'Run for Hope','Mega Man X','2026-07-25T15:39:24.935590+00:00','https://www.youtube.com/watch?v=mhiPAyZ55Fo',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_Run_for_Hope_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4178,'Tactile Snowfall','Sonic the Hedgehog','2026-07-26T22:30:00.826209+00:00','https://www.youtube.com/watch?v=qClsMT4NyW0',583,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_Tactile_Snowfall_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4179,'Small Steps (Just Breathe)','Celeste','2026-07-25T21:24:48.141307+00:00','https://www.youtube.com/watch?v=wiTLD3kVOWs',95636,'https://ocrmirror.org/files/music/remixes/Celeste_Small_Steps_(Just_Breathe)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4180,'We''re All Falling','Lemmings','2026-07-26T07:09:42.509000+00:00','https://www.youtube.com/watch?v=v2LidTc11kY',831,'https://ocrmirror.org/files/music/remixes/Lemmings_We''re_All_Falling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4181,'Riddim de Chocobo','Final Fantasy IV','2026-07-25T11:43:49.169333+00:00','https://www.youtube.com/watch?v=NEBZgPPOy7c',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Riddim_de_Chocobo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4182,'Amarant''s Night Ride','Final Fantasy IX','2026-07-25T17:30:16.009089+00:00','https://www.youtube.com/watch?v=5y86sHTbVEs',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Amarant''s_Night_Ride_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4183,'For Sacrifice','Super 3D Noah''s Ark','2026-07-25T07:31:57.621466+00:00','https://www.youtube.com/watch?v=5AGgd5ApnZY',11401,'https://ocrmirror.org/files/music/remixes/Super_3D_Noah''s_Ark_For_Sacrifice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4184,'Run','The Legend of Zelda: Breath of the Wild','2026-07-26T17:31:59.606735+00:00','https://www.youtube.com/watch?v=WoGxTOqU95k',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Run_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4185,'When the Planet Fights Back','Final Fantasy VII','2026-07-25T17:30:16.533131+00:00','https://www.youtube.com/watch?v=EB0aKqXo8U4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_When_the_Planet_Fights_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4186,'Egg Death Machine','Sonic & Knuckles','2026-07-25T21:24:47.616863+00:00','https://www.youtube.com/watch?v=qRLMtCMSjSQ',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Egg_Death_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4187,'Vast Infinities','Metroid','2026-07-26T07:09:41.978433+00:00','https://www.youtube.com/watch?v=WpRGDqyKP2Y',73,'https://ocrmirror.org/files/music/remixes/Metroid_Vast_Infinities_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4188,'EEVEE used Swift!','Pokémon Diamond Version','2026-07-26T22:30:00.300812+00:00','https://www.youtube.com/watch?v=4oqaHGXvDb4',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_EEVEE_used_Swift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4189,'The King of All Monsters','Undertale','2026-07-25T15:39:26.325650+00:00','https://www.youtube.com/watch?v=7KqHwl0oiNg',95077,'https://ocrmirror.org/files/music/remixes/Undertale_The_King_of_All_Monsters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4190,'Zeal','Chrono Trigger','2026-07-25T23:31:58.099173+00:00','https://www.youtube.com/watch?v=vqrvJg7chcs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Zeal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4191,'And the Woods Shall Dance','The Legend of Zelda: Ocarina of Time','2026-07-26T21:26:17.549075+00:00','https://www.youtube.com/watch?v=wIZ0vFidAvM',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_And_the_Woods_Shall_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4192,'Malicious Intent','Streets of Rage 2','2026-07-25T22:26:09.046233+00:00','https://www.youtube.com/watch?v=GsS5BxAhZDI',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Malicious_Intent_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4193,'Together, We''ll Shine','Final Fantasy Crystal Chronicles','2026-07-25T17:30:15.250106+00:00','https://www.youtube.com/watch?v=ClSUTCVbvqY',7279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Crystal_Chronicles_Together_We''ll_Shine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4194,'Mysterious Invasion','Dahna: Megami Tanjou','2026-07-25T17:30:14.896937+00:00','https://www.youtube.com/watch?v=VwDE8heYaL0',53998,'https://ocrmirror.org/files/music/remixes/Dahna_Mysterious_Invasion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4195,'Forgotten Palace','Final Fantasy Adventure','2026-07-25T17:30:16.182606+00:00','https://www.youtube.com/watch?v=ynhBXaN3KIA',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Forgotten_Palace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4196,'Saturated Media','2064: Read Only Memories','2026-07-26T04:05:16.879442+00:00','https://www.youtube.com/watch?v=n16rwbCfZK8',95643,'https://ocrmirror.org/files/music/remixes/2064_Read_Only_Memories_Saturated_Media_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4197,'FAT32 at Night','Digimon World','2026-07-26T04:05:17.557766+00:00','https://www.youtube.com/watch?v=cF3_ZNuxdmo',41698,'https://ocrmirror.org/files/music/remixes/Digimon_World_FAT32_at_Night_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4198,'Adabat''s Sunset Speedway','Sonic Unleashed','2026-07-26T09:32:29.798515+00:00','https://www.youtube.com/watch?v=tsrl94VUXNU',50178,'https://ocrmirror.org/files/music/remixes/Sonic_Unleashed_Adabat''s_Sunset_Speedway_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4199,'The Retired Hero','Suikoden II','2026-07-26T15:38:10.175099+00:00','https://www.youtube.com/watch?v=-fmsDVP7LLg',245,'https://ocrmirror.org/files/music/remixes/Suikoden_2_The_Retired_Hero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4200,'Black Feathers in the Sky','Kid Icarus: Uprising','2026-07-26T15:38:10.709281+00:00','https://www.youtube.com/watch?v=mgqwJ9hHepo',94601,'https://ocrmirror.org/files/music/remixes/Kid_Icarus_Uprising_Black_Feathers_in_the_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4201,'Jamrock Dash','Boulder Dash','2026-07-25T21:24:48.492304+00:00','https://www.youtube.com/watch?v=ojd60q3l0KU',70770,'https://ocrmirror.org/files/music/remixes/Boulder_Dash_Jamrock_Dash_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4202,'Bollywood Nights','Tangledeep','2026-07-25T22:26:09.806850+00:00','https://www.youtube.com/watch?v=GOSNlTYkZxg',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_Bollywood_Nights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4203,'Be Still, My Wicked Heart','Final Fantasy IX','2026-07-26T04:05:17.963992+00:00','https://www.youtube.com/watch?v=4qNAs783cKM',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Be_Still_My_Wicked_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4204,'Let the Decisive Battle on the Big Bridge Begin!','Final Fantasy VII','2026-07-26T09:32:30.501259+00:00','https://www.youtube.com/watch?v=xz0G1X8UyOk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Let_the_Decisive_Battle_on_the_Big_Bridge_Begin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4205,'The Journey to the Darkest Depths','Chrono Trigger','2026-07-26T22:30:01.000247+00:00','https://www.youtube.com/watch?v=63h1lAAWBd0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Journey_to_the_Darkest_Depths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4206,'Hacking the JANUS System','The Legend of Zelda: Link''s Awakening','2026-07-26T19:43:19.178782+00:00','https://www.youtube.com/watch?v=tXYzauR98nc',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Hacking_the_JANUS_System_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4207,'Open Your Mind','Final Fantasy VII','2026-07-26T07:09:41.621628+00:00','https://www.youtube.com/watch?v=d9lQCbMJyhk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Open_Your_Mind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4208,'SEGA Space Station Big Dome, 2094','Sonic Adventure 2','2026-07-26T21:26:18.610094+00:00','https://www.youtube.com/watch?v=zeSSRDa0wLQ',277,'https://ocrmirror.org/files/music/remixes/Sonic_Adventure_2_SEGA_Space_Station_Big_Dome_2094_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4209,'A Dream of Home','Final Fantasy V','2026-07-25T15:39:25.113765+00:00','https://www.youtube.com/watch?v=Y9Trs6PJhP8',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_A_Dream_of_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4210,'Secret Garden','Tangledeep','2026-07-26T09:32:29.622031+00:00','https://www.youtube.com/watch?v=J7g-VqP8L_A',95513,'https://ocrmirror.org/files/music/remixes/Tangledeep_Secret_Garden_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4211,'Hope in 8','Golden Sun','2026-07-27T11:50:27.178233+00:00','https://www.youtube.com/watch?v=8jhkkcyUVr8',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Hope_in_8_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4212,'Bubbles for Lunch','Bubble Bobble','2026-07-25T23:31:57.032137+00:00','https://www.youtube.com/watch?v=OHs4RYY641o',46,'https://ocrmirror.org/files/music/remixes/Bubble_Bobble_Bubbles_for_Lunch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4213,'Terminal Funk','Chrono Trigger','2026-07-26T07:09:42.685445+00:00','https://www.youtube.com/watch?v=7r6X0twU3Bs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Terminal_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4214,'Wiped Out','Donkey Kong Country','2026-07-26T07:09:42.155891+00:00','https://www.youtube.com/watch?v=GH9yM3Uy0KM',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Wiped_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4215,'Gang-Plank Country','Donkey Kong Country','2026-07-26T17:31:58.538920+00:00','https://www.youtube.com/watch?v=fmMT4m4ILhM',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Gang-Plank_Country_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4216,'Arcane Anticipation','Deltarune','2026-07-26T04:05:17.150972+00:00','https://www.youtube.com/watch?v=mQT9kQQxTUg',95557,'https://ocrmirror.org/files/music/remixes/Deltarune_Arcane_Anticipation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4217,'I''m Not Going to Lose to You!','Pokémon Trading Card Game','2026-07-26T09:32:29.271341+00:00','https://www.youtube.com/watch?v=QiodLttu2fQ',710,'https://ocrmirror.org/files/music/remixes/Pokemon_Trading_Card_Game_I''m_Not_Going_to_Lose_to_You_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4218,'Noodlin''','Final Fantasy VII','2026-07-25T23:31:57.388955+00:00','https://www.youtube.com/watch?v=yByVoyZ8utE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Noodlin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4219,'Devotion of a Caring Soul','Final Fantasy VII','2026-07-27T18:55:14.902623+00:00','https://www.youtube.com/watch?v=of2dH5fZI8Q',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Devotion_of_a_Caring_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4220,'Giant Alien Spiders','FTL: Faster Than Light','2026-07-25T23:31:57.742940+00:00','https://www.youtube.com/watch?v=2B6zLCZwd4A',95033,'https://ocrmirror.org/files/music/remixes/FTL_Giant_Alien_Spiders_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4221,'Zora''s Dharma','The Legend of Zelda: Twilight Princess','2026-07-26T11:44:22.249765+00:00','https://www.youtube.com/watch?v=-xbE0X9DniY',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Zora''s_Dharma_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4222,'The Power of Mom','Wargroove','2026-07-25T14:09:22.395830+00:00','https://www.youtube.com/watch?v=2nKK5xavM3I',95701,'https://ocrmirror.org/files/music/remixes/Wargroove_The_Power_of_Mom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4223,'Until the Next Dance','Kirby Super Star','2026-07-27T08:00:45.455985+00:00','https://www.youtube.com/watch?v=aeEvMkYAU1o',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Until_the_Next_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4224,'Torchlight','The Legend of Zelda: Breath of the Wild','2026-07-26T23:32:10.615816+00:00','https://www.youtube.com/watch?v=qCkLjetVUSI',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Torchlight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4225,'Hard Knuckle Swing','Mega Man 3','2026-07-26T09:32:30.326119+00:00','https://www.youtube.com/watch?v=vMEnI7HUIYI',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Hard_Knuckle_Swing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4226,'Sanctuary Scrapbook','Metroid Prime 2: Echoes','2026-07-25T21:24:47.965759+00:00','https://www.youtube.com/watch?v=gA0BUbwWdhQ',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Sanctuary_Scrapbook_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4227,'A Royal Tournament in Cleyra','Final Fantasy IX','2026-07-26T19:43:18.824486+00:00','https://www.youtube.com/watch?v=y9nwx25jpjk',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_A_Royal_Tournament_in_Cleyra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4228,'Firewalker','The Legend of Zelda: Ocarina of Time','2026-07-26T04:05:17.285721+00:00','https://www.youtube.com/watch?v=rJJMGHKiHnM',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Firewalker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4229,'Into the Cold Light','Half-Life 2','2026-07-26T11:44:22.073402+00:00','https://www.youtube.com/watch?v=awKK8Hv9N4w',827,'https://ocrmirror.org/files/music/remixes/Half-Life_2_Into_the_Cold_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4230,'My Old Kakariko Home','The Legend of Zelda: Ocarina of Time','2026-07-25T15:39:25.462767+00:00','https://www.youtube.com/watch?v=QgRJXAlwaaY',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_My_Old_Kakariko_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4231,'Silver Sands','Ys VIII: Lacrimosa of Dana','2026-07-26T19:43:19.001334+00:00','https://www.youtube.com/watch?v=b1vmyVyYZAg',95702,'https://ocrmirror.org/files/music/remixes/Ys_8_Silver_Sands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4232,'The Mind Takes Flight','The Legend of Zelda: Twilight Princess','2026-07-26T21:26:17.725346+00:00','https://www.youtube.com/watch?v=-i3fgXHEla8',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_The_Mind_Takes_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4233,'Looking for the Lazy Guy','Nicky Boom','2026-07-26T07:09:41.801212+00:00','https://www.youtube.com/watch?v=3-5OluT2wZE',6158,'https://ocrmirror.org/files/music/remixes/Nicky_Boom_Looking_for_the_Lazy_Guy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4234,'Strike a Pose','Streets of Rage 2','2026-07-26T15:38:10.000815+00:00','https://www.youtube.com/watch?v=03lkjocytCo',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Strike_a_Pose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4235,'Brevity Is... Wit?','The Legend of Zelda: Ocarina of Time','2026-07-26T07:09:41.443436+00:00','https://www.youtube.com/watch?v=MnZq-qMp9qw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Brevity_Is_Wit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4236,'Sav''aaq','The Legend of Zelda: Breath of the Wild','2026-07-25T21:24:47.791461+00:00','https://www.youtube.com/watch?v=HICq3CxFOeM',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Sav''aaq_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4237,'World Destroyer','Jet Force Gemini','2026-07-27T04:12:20.229318+00:00','https://www.youtube.com/watch?v=oTKHvC1k2PY',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_World_Destroyer_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4238,'Fury Cutter','Jet Force Gemini','2026-07-26T14:08:10.252962+00:00','https://www.youtube.com/watch?v=L1iLkvs9058',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Fury_Cutter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4239,'The Edge Calls Me','Jet Force Gemini','2026-07-26T14:08:10.441047+00:00','https://www.youtube.com/watch?v=Ct0XN7Guc14',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_The_Edge_Calls_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4240,'Ruins in the Deep','Jet Force Gemini','2026-07-26T14:08:10.076223+00:00','https://www.youtube.com/watch?v=_INETg-JxLk',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Ruins_in_the_Deep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4241,'Bone and Marrow','Jet Force Gemini','2026-07-26T09:32:29.447211+00:00','https://www.youtube.com/watch?v=EU4d0K78QXc',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Bone_and_Marrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4242,'Another World','Chrono Cross','2026-07-27T11:50:27.349142+00:00','https://www.youtube.com/watch?v=_tJ2tgLCMP8',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Another_World_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4243,'Gâteau Romani','The Legend of Zelda: Majora''s Mask','2026-07-26T19:43:18.106249+00:00','https://www.youtube.com/watch?v=GlzCuyuByF0',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Gateau_Romani_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4244,'Anthem Anubis','Jet Force Gemini','2026-07-26T14:08:10.617668+00:00','https://www.youtube.com/watch?v=NmJQZVsyxj8',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Anthem_Anubis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4245,'Dreadnaught of War','Jet Force Gemini','2026-07-26T07:09:41.261569+00:00','https://www.youtube.com/watch?v=KHaJ4C-R5S8',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Dreadnaught_of_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4246,'I Can''t Go On (I''ll Goron)','The Legend of Zelda: Ocarina of Time','2026-07-26T21:26:18.078533+00:00','https://www.youtube.com/watch?v=9k8tf0BcNio',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_I_Can''t_Go_On_(I''ll_Goron)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4247,'Hanagasumi','Okami','2026-07-27T11:50:26.838594+00:00','https://www.youtube.com/watch?v=FVtr-4-pTA4',537,'https://ocrmirror.org/files/music/remixes/Okami_Hanagasumi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4248,'Autumn Delights','Stardew Valley','2026-07-26T11:44:21.360827+00:00','https://www.youtube.com/watch?v=fCSZG6e9ljA',95611,'https://ocrmirror.org/files/music/remixes/Stardew_Valley_Autumn_Delights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4249,'8-bit Dragon Awakening','Breath of Fire IV','2026-07-26T15:38:10.890279+00:00','https://www.youtube.com/watch?v=rNZq5umolAs',522,'https://ocrmirror.org/files/music/remixes/Breath_of_Fire_4_8-bit_Dragon_Awakening_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4250,'Seal of Seven Sages','The Legend of Zelda: A Link to the Past','2026-07-26T09:32:29.096580+00:00','https://www.youtube.com/watch?v=MXzpQlgebJM',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Seal_of_Seven_Sages_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4251,'CompuSiege','Jet Force Gemini','2026-07-27T17:17:31.705564+00:00','https://www.youtube.com/watch?v=ydLLWpplH3c',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_CompuSiege_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4252,'The Last Metroid','Super Metroid','2026-07-27T04:12:19.804896+00:00','https://www.youtube.com/watch?v=v9P2zkPuO9Y',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_The_Last_Metroid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4253,'Warriors','Tecmo World Wrestling','2026-07-26T04:05:16.741441+00:00','https://www.youtube.com/watch?v=9h9FLHoSaAM',4493,'https://ocrmirror.org/files/music/remixes/Tecmo_World_Wrestling_Warriors_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4254,'R.K. Nu Hrizns','Animal Crossing: New Horizons','2026-07-26T14:08:09.861167+00:00','https://www.youtube.com/watch?v=mOz07cSMhgQ',95587,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_New_Horizons_RK_Nu_Hrizns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4255,'The Wind That Turns the Page','VectorMan 2','2026-07-25T22:26:09.410245+00:00','https://www.youtube.com/watch?v=Kkki2ofpBG0',6763,'https://ocrmirror.org/files/music/remixes/VectorMan_2_The_Wind_That_Turns_the_Page_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4256,'Garden of Zebes','Super Metroid','2026-07-27T04:12:20.995067+00:00','https://www.youtube.com/watch?v=laBL7eXZcAU',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Garden_of_Zebes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4257,'Cradle of the Chozo','Metroid Prime','2026-07-27T11:50:27.691163+00:00','https://www.youtube.com/watch?v=JetW8AJbpc0',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Cradle_of_the_Chozo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4258,'Bowels of Torment','Super Metroid','2026-07-27T17:17:32.946400+00:00','https://www.youtube.com/watch?v=ALODBCori5Y',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Bowels_of_Torment_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4259,'Whispers in the Dark','The Legend of Zelda: Twilight Princess','2026-07-26T21:26:17.372611+00:00','https://www.youtube.com/watch?v=2J4XOyBb4Bs',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Whispers_in_the_Dark_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4260,'Big Bug Funk','Jet Force Gemini','2026-07-26T15:38:10.529277+00:00','https://www.youtube.com/watch?v=Y0N2aM3ayfQ',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Big_Bug_Funk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4261,'Hunter''s Landing','Final Fantasy VIII','2026-07-26T17:31:59.961384+00:00','https://www.youtube.com/watch?v=CDdDWjedFG0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Hunter''s_Landing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4262,'Back to the Fields','Golden Sun','2026-07-27T11:50:27.008688+00:00','https://www.youtube.com/watch?v=IYk-d6IjVCY',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Back_to_the_Fields_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4263,'My Past Is Not a Memory','Metroid','2026-07-27T15:23:46.316841+00:00','https://www.youtube.com/watch?v=h_6xPZMlDvU',73,'https://ocrmirror.org/files/music/remixes/Metroid_My_Past_Is_Not_a_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4264,'Under Cerulean Skies','Jet Force Gemini','2026-07-26T11:44:21.179541+00:00','https://www.youtube.com/watch?v=ywxy0v3Stco',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Under_Cerulean_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4265,'Temple Spirits','The Legend of Zelda: Oracle of Seasons','2026-07-26T14:08:09.681331+00:00','https://www.youtube.com/watch?v=rzYYv-qxI2E',726,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Seasons_Temple_Spirits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4266,'3,770 m Later','Paper Mario','2026-07-26T23:32:10.438737+00:00','https://www.youtube.com/watch?v=VnmFGScEErE',3070,'https://ocrmirror.org/files/music/remixes/Paper_Mario_3770_m_Later_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4267,'Dancing in Kokiri Bottom','The Legend of Zelda: Ocarina of Time','2026-07-26T15:38:09.457764+00:00','https://www.youtube.com/watch?v=unnZoifbMFk',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Dancing_in_Kokiri_Bottom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4268,'Wumpa for All','Crash Bandicoot 4: It''s About Time','2026-07-26T04:05:17.014649+00:00','https://www.youtube.com/watch?v=v4lianQUMJc',95783,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_4_Wumpa_for_All_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4269,'Creep Colony','StarCraft','2026-07-27T04:12:20.640905+00:00','https://www.youtube.com/watch?v=06Bp8RCwxBU',220,'https://ocrmirror.org/files/music/remixes/StarCraft_Creep_Colony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4270,'Dry Towns','Secret of Mana','2026-07-26T11:44:21.541956+00:00','https://www.youtube.com/watch?v=TWxlvnpAX5M',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Dry_Towns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4271,'Part of Me','Celeste','2026-07-28T00:54:35.896232+00:00','https://www.youtube.com/watch?v=SWjvVKp9CXo',95636,'https://ocrmirror.org/files/music/remixes/Celeste_Part_of_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4272,'Where It All Began','Pokémon Diamond Version','2026-07-26T17:31:59.074075+00:00','https://www.youtube.com/watch?v=R47gX--E2_w',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_Where_It_All_Began_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4273,'A Quest for Identity','Flashback: The Quest for Identity','2026-07-26T14:08:09.324116+00:00','https://www.youtube.com/watch?v=AldxliEwZJ0',12812,'https://ocrmirror.org/files/music/remixes/Flashback_A_Quest_for_Identity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4274,'Operation: Golem','Metroid Prime: Federation Force','2026-07-26T17:31:58.717041+00:00','https://www.youtube.com/watch?v=_Xe501eMAv8',95784,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Federation_Force_Operation_Golem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4275,'Probe','Mega Man X3','2026-07-26T23:32:09.379868+00:00','https://www.youtube.com/watch?v=4DyshClx3OE',177,'https://ocrmirror.org/files/music/remixes/Mega_Man_X3_Probe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4276,'Coming Home','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-28T04:41:55.201788+00:00','https://www.youtube.com/watch?v=pI8Nt7wzI4E',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Coming_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4277,'Melting Point','Metroid: Other M','2026-07-26T15:38:09.271508+00:00','https://www.youtube.com/watch?v=WGTw0bzlh6E',94494,'https://ocrmirror.org/files/music/remixes/Metroid_Other_M_Melting_Point_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4278,'Spirits of the Fallen','Hollow Knight','2026-07-26T09:32:28.918427+00:00','https://www.youtube.com/watch?v=ol24iL57H8k',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_Spirits_of_the_Fallen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4279,'Hylian Knights','The Legend of Zelda: A Link to the Past','2026-07-26T21:26:17.902670+00:00','https://www.youtube.com/watch?v=A9EYUdZxHK8',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Hylian_Knights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4280,'Esuna Is Busy Again','The 7th Saga','2026-07-25T23:31:56.853103+00:00','https://www.youtube.com/watch?v=w-zHunNaDv4',732,'https://ocrmirror.org/files/music/remixes/7th_Saga_Esuna_Is_Busy_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4281,'Bolero of Bolero of Fire','The Legend of Zelda: Ocarina of Time','2026-07-26T23:32:09.556777+00:00','https://www.youtube.com/watch?v=oXm-OEObnss',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Bolero_of_Bolero_of_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4282,'The Groose Is Loose','The Legend of Zelda: Skyward Sword','2026-07-26T15:38:09.818934+00:00','https://www.youtube.com/watch?v=r8DTnSIggUc',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_The_Groose_Is_Loose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4283,'Fire and Flames','Golden Sun','2026-07-27T08:00:45.095748+00:00','https://www.youtube.com/watch?v=-EShnwIY180',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Fire_and_Flames_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4284,'Dos Alas','The Binding of Isaac: Rebirth','2026-07-26T22:29:59.774794+00:00','https://www.youtube.com/watch?v=OKkj5qNnVtw',95787,'https://ocrmirror.org/files/music/remixes/Binding_of_Isaac_Rebirth_Dos_Alas_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4285,'First Time Down Here?','Metroid','2026-07-26T15:38:10.355887+00:00','https://www.youtube.com/watch?v=ux_91H04qiQ',73,'https://ocrmirror.org/files/music/remixes/Metroid_First_Time_Down_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4286,'Night Walk','Teenage Mutant Ninja Turtles','2026-07-26T21:26:17.196075+00:00','https://www.youtube.com/watch?v=I-RyAZ-aAZA',224,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_Night_Walk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4287,'It''s Dangerous to Go Alone','The Legend of Zelda: Ocarina of Time','2026-07-27T08:00:44.917050+00:00','https://www.youtube.com/watch?v=XNtIjbmC0bo',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_It''s_Dangerous_to_Go_Alone_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4288,'Mr. Green Hill','Pop''n TwinBee: Rainbow Bell Adventures','2026-07-27T22:33:18.266715+00:00','https://www.youtube.com/watch?v=xsRHYVLQZWg',11271,'https://ocrmirror.org/files/music/remixes/Pop''n_TwinBee_Rainbow_Bell_Adventures_Mr_Green_Hill_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4289,'Secret Labyrinths','Zelda II: The Adventure of Link','2026-07-26T21:26:18.432457+00:00','https://www.youtube.com/watch?v=R3w7gZr4QqE',65,'https://ocrmirror.org/files/music/remixes/Zelda_2_Secret_Labyrinths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4290,'Bluesuperstructure','Super Mario 64','2026-07-26T23:32:10.262956+00:00','https://www.youtube.com/watch?v=31xenW6YTyI',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Bluesuperstructure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4291,'Crime Boss Nomad','SaGa Frontier','2026-07-27T04:12:19.582627+00:00','https://www.youtube.com/watch?v=1td5mP94toE',331,'https://ocrmirror.org/files/music/remixes/SaGa_Frontier_Crime_Boss_Nomad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4292,'Burning Up the Floor','Mega Man 9','2026-07-26T19:43:18.645097+00:00','https://www.youtube.com/watch?v=MDD5lBzl3iM',655,'https://ocrmirror.org/files/music/remixes/Mega_Man_9_Burning_Up_the_Floor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4293,'Harding','Mega Man 3','2026-07-26T19:43:18.283518+00:00','https://www.youtube.com/watch?v=Rrc9L-15Gec',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Harding_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4294,'Cold Boot','FTL: Faster Than Light','2026-07-27T04:12:19.036456+00:00','https://www.youtube.com/watch?v=QMgEU88RkY8',95033,'https://ocrmirror.org/files/music/remixes/FTL_Cold_Boot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4295,'Tal Tal Funkin''','The Legend of Zelda: Link''s Awakening','2026-07-26T11:44:21.897077+00:00','https://www.youtube.com/watch?v=Ec4NL_qDchc',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Tal_Tal_Funkin''_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4296,'Everstreams Through Evermore','Secret of Evermore','2026-07-26T22:29:59.595840+00:00','https://www.youtube.com/watch?v=SAr_TqClXqw',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_Everstreams_Through_Evermore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4297,'Terra of the Bells','Final Fantasy VI','2026-07-26T23:32:09.733004+00:00','https://www.youtube.com/watch?v=rUGfYIGGS3M',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terra_of_the_Bells_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4298,'Another Dream Will Start from Here','The Legend of Zelda','2026-07-27T20:50:15.558984+00:00','https://www.youtube.com/watch?v=Oggyg6p3oyY',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Another_Dream_Will_Start_from_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4299,'Silent Disruptor','Perfect Dark','2026-07-27T04:12:19.220587+00:00','https://www.youtube.com/watch?v=TVKMQa9gGIw',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_Silent_Disruptor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4300,'Rainfall Rush','Sonic Unleashed','2026-07-28T04:41:55.030481+00:00','https://www.youtube.com/watch?v=ebXewU_9A5E',50178,'https://ocrmirror.org/files/music/remixes/Sonic_Unleashed_Rainfall_Rush_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4301,'Whimsyland','RollerCoaster Tycoon','2026-07-28T17:53:55.896840+00:00','https://www.youtube.com/watch?v=lGve5iSvbHg',25537,'https://ocrmirror.org/files/music/remixes/RollerCoaster_Tycoon_Whimsyland_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4302,'Dragon''s Oath','Final Fantasy IX','2026-07-27T15:23:45.603256+00:00','https://www.youtube.com/watch?v=y7_hx-UxA3E',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Dragon''s_Oath_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4303,'The Chicken''s Tale','The Legend of Zelda: A Link to the Past','2026-07-27T22:33:18.087874+00:00','https://www.youtube.com/watch?v=nSqMrMPff54',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_The_Chicken''s_Tale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4304,'Where Hot and Cold Collide','Super Mario Galaxy','2026-07-26T22:30:01.175414+00:00','https://www.youtube.com/watch?v=x6QjKmxoD08',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Where_Hot_and_Cold_Collide_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4305,'A Glitch Hop''s World','Deltarune','2026-07-26T23:32:08.975649+00:00','https://www.youtube.com/watch?v=_E4iyYPdwGk',95557,'https://ocrmirror.org/files/music/remixes/Deltarune_A_Glitch_Hop''s_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4306,'Dark Waters','Sonic the Hedgehog 2','2026-07-26T14:08:09.503092+00:00','https://www.youtube.com/watch?v=WLXerMaViFc',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Dark_Waters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4307,'Twisted Soul','Dragon Ball Z Budokai 2','2026-07-26T19:43:17.748061+00:00','https://www.youtube.com/watch?v=xI-3CULr3vU',9681,'https://ocrmirror.org/files/music/remixes/Dragon_Ball_Z_Budokai_2_Twisted_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4308,'Underground City','Super Mario World','2026-07-27T11:50:26.494077+00:00','https://www.youtube.com/watch?v=kKPtAqW5SZs',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Underground_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4309,'Simon''s Epic Symphonic Quest','Castlevania II: Simon''s Quest','2026-07-27T11:50:27.520886+00:00','https://www.youtube.com/watch?v=TDfFmrW-uv8',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Simon''s_Epic_Symphonic_Quest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4310,'The Hourglass Ritual','Prince of Persia','2026-07-27T22:33:17.909525+00:00','https://www.youtube.com/watch?v=GD_wpDlbcxU',11278,'https://ocrmirror.org/files/music/remixes/Prince_of_Persia_The_Hourglass_Ritual_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4311,'Black Suits','Final Fantasy VII','2026-07-26T19:43:17.927434+00:00','https://www.youtube.com/watch?v=7FfK5C-EOXk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Black_Suits_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4312,'Perfect Day','Tales of Symphonia','2026-07-27T15:23:45.425227+00:00','https://www.youtube.com/watch?v=d54OyJ81JNE',533,'https://ocrmirror.org/files/music/remixes/Tales_of_Symphonia_Perfect_Day_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4313,'The Witching Hour','Castlevania: Symphony of the Night','2026-07-27T15:23:45.066739+00:00','https://www.youtube.com/watch?v=CMu1U6gZM0k',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_The_Witching_Hour_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4314,'Grand Shovel March','Shovel Knight','2026-07-27T04:12:20.014637+00:00','https://www.youtube.com/watch?v=YhWSmpSGR4U',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_Grand_Shovel_March_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4315,'The Slums of Traverse','Kingdom Hearts','2026-07-28T15:41:39.196750+00:00','https://www.youtube.com/watch?v=wgbZnCpBtf0',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_The_Slums_of_Traverse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4316,'Cosmic Meadow','Final Fantasy VII','2026-07-27T17:17:30.894794+00:00','https://www.youtube.com/watch?v=3bDAU2TX3aE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Cosmic_Meadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4317,'Octopath Unraveled','Octopath Traveler','2026-07-27T08:00:44.560549+00:00','https://www.youtube.com/watch?v=1_Ms20p129E',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_Octopath_Unraveled_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4318,'Empress Waltz','Final Fantasy IV','2026-07-28T20:00:19.618447+00:00','https://www.youtube.com/watch?v=nbp2pMZVyZA',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Empress_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4319,'Tifa''s Love','Final Fantasy VII','2026-07-27T15:23:45.959920+00:00','https://www.youtube.com/watch?v=A_apzJQOPk8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Tifa''s_Love_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4320,'Raven''s Dream','Stardew Valley','2026-07-27T18:55:13.850816+00:00','https://www.youtube.com/watch?v=v-t-V4Td_sg',95611,'https://ocrmirror.org/files/music/remixes/Stardew_Valley_Raven''s_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4321,'Ajetreo del Castillo','Mega Man 2','2026-07-26T23:32:09.909843+00:00','https://www.youtube.com/watch?v=vYHlcnXpAJs',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_Ajetreo_del_Castillo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4322,'Neons of Time','Chrono Trigger','2026-07-27T20:50:14.655427+00:00','https://www.youtube.com/watch?v=q9ha5Ou3pmg',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Neons_of_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4323,'Verdensrommet','Space Quest III: The Pirates of Pestulon','2026-07-26T22:30:00.475842+00:00','https://www.youtube.com/watch?v=96_lHbvvLGo',8023,'https://ocrmirror.org/files/music/remixes/Space_Quest_3_Verdensrommet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4324,'Concealed Caverns','Super Metroid','2026-07-27T18:55:14.199160+00:00','https://www.youtube.com/watch?v=lk05jz4wmpg',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Concealed_Caverns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4325,'Bavarian Kackle','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-28T13:09:04.408556+00:00','https://www.youtube.com/watch?v=Lk5DpD39PfA',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Bavarian_Kackle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4326,'Palace of Memory','Final Fantasy Adventure','2026-07-27T11:50:26.144278+00:00','https://www.youtube.com/watch?v=lNB7FCkGa68',115,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Adventure_Palace_of_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4327,'Sailing on the Vaporwaves','King''s Quest VI: Heir Today, Gone Tomorrow','2026-07-27T11:50:26.320152+00:00','https://www.youtube.com/watch?v=Zilzct9gMC0',95810,'https://ocrmirror.org/files/music/remixes/King''s_Quest_6_Sailing_on_the_Vaporwaves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4328,'Dancing Bossanova','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-27T20:50:15.217088+00:00','https://www.youtube.com/watch?v=mn1wWqFMlCs',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Dancing_Bossanova_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4329,'Mansion of Delete (No Sleep Demon)','Resident Evil','2026-07-28T07:59:16.380134+00:00','https://www.youtube.com/watch?v=O60VU6FJFg8',7480,'https://ocrmirror.org/files/music/remixes/Resident_Evil_Mansion_of_Delete_(No_Sleep_Demon)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4330,'Blotto Grotto','Paper Mario: The Thousand-Year Door','2026-07-27T04:12:19.402111+00:00','https://www.youtube.com/watch?v=bCQvbh5TBJM',804,'https://ocrmirror.org/files/music/remixes/Paper_Mario_The_Thousand-Year_Door_Blotto_Grotto_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4331,'Mysteries of the Marsh','Final Fantasy IX','2026-07-28T20:00:20.160341+00:00','https://www.youtube.com/watch?v=afvfqZZ5h1A',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Mysteries_of_the_Marsh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4332,'Fight for Excalabria','Sword of Vermilion','2026-07-27T08:00:44.024744+00:00','https://www.youtube.com/watch?v=biOPG6FSByQ',236,'https://ocrmirror.org/files/music/remixes/Sword_of_Vermilion_Fight_for_Excalabria_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4333,'Joyful Forest','Chrono Trigger','2026-07-27T15:23:45.782062+00:00','https://www.youtube.com/watch?v=BEYwb4bv5TQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Joyful_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4334,'Predestination','Chrono Trigger','2026-07-27T15:23:45.244435+00:00','https://www.youtube.com/watch?v=EDMQnB0hYo8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Predestination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4335,'The Secret Was Clarinet','Chrono Trigger','2026-07-28T10:57:15.434998+00:00','https://www.youtube.com/watch?v=a1JNtEKgFvI',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Secret_Was_Clarinet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4336,'Vic Viper Serum','Life Force','2026-07-26T19:43:18.460392+00:00','https://www.youtube.com/watch?v=K0HflvEzZwg',237,'https://ocrmirror.org/files/music/remixes/Life_Force_Vic_Viper_Serum_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4337,'Sweet Summer Breeze','OutRun','2026-07-27T15:23:44.882922+00:00','https://www.youtube.com/watch?v=nEVjA_CXoxk',139,'https://ocrmirror.org/files/music/remixes/OutRun_Sweet_Summer_Breeze_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4338,'Ballad of the THIEF Fish','The Legend of Zelda: Link''s Awakening','2026-07-28T21:37:59.723670+00:00','https://www.youtube.com/watch?v=n5wmBT32kP8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Ballad_of_the_THIEF_Fish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4339,'Over the Horizon','Final Fantasy VII','2026-07-26T22:30:00.124830+00:00','https://www.youtube.com/watch?v=n_zWrJm4-As',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Over_the_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4340,'Vision of Hades','Chrono Cross','2026-07-27T11:50:26.667109+00:00','https://www.youtube.com/watch?v=atUsvllX8C4',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Vision_of_Hades_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4341,'A Sacred Place','Star Fox Adventures','2026-07-28T00:54:36.424969+00:00','https://www.youtube.com/watch?v=DO-2MTkihRc',601,'https://ocrmirror.org/files/music/remixes/Star_Fox_Adventures_A_Sacred_Place_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4342,'Vice','Pac-Man','2026-07-26T21:26:18.255416+00:00','https://www.youtube.com/watch?v=6GU0dvCR4WA',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_Vice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4343,'You Had Me at Yellow','Pac-Man','2026-07-27T18:55:14.373886+00:00','https://www.youtube.com/watch?v=3iDlTyg2QHc',142,'https://ocrmirror.org/files/music/remixes/Pac-Man_You_Had_Me_at_Yellow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4344,'Catch the Fire','Journey to Silius','2026-07-28T10:57:14.540993+00:00','https://www.youtube.com/watch?v=k-XcwIGKLEk',154,'https://ocrmirror.org/files/music/remixes/Journey_to_Silius_Catch_the_Fire_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4345,'Dancing in the Sky','Xenogears','2026-07-28T10:57:16.142740+00:00','https://www.youtube.com/watch?v=69vBWlODvNo',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Dancing_in_the_Sky_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4346,'Chun-Li: Lady Dragon','Street Fighter II: The World Warrior','2026-07-28T10:57:15.962986+00:00','https://www.youtube.com/watch?v=oPp8Q0Cus-Q',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Chun-Li_Lady_Dragon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4347,'Qfwfq''s Origin of Birds','Paper Mario: The Thousand-Year Door','2026-07-28T13:09:04.292706+00:00','https://www.youtube.com/watch?v=UKn_bMESx-Q',804,'https://ocrmirror.org/files/music/remixes/Paper_Mario_The_Thousand-Year_Door_Qfwfq''s_Origin_of_Birds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4348,'Immemorial Waters','Aquaria','2026-07-27T08:00:43.843393+00:00','https://www.youtube.com/watch?v=_qw3dgsAX-E',585,'https://ocrmirror.org/files/music/remixes/Aquaria_Immemorial_Waters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4349,'Temple of Time: Chant & Carillon','The Legend of Zelda: Ocarina of Time','2026-07-28T23:29:50.881737+00:00','https://www.youtube.com/watch?v=QfEdO9iHsRg',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Temple_of_Time_Chant_&_Carillon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4350,'Spooky Casos','Super Mario World 2: Yoshi''s Island','2026-07-27T17:17:32.359686+00:00','https://www.youtube.com/watch?v=ZR6ia-BrxpY',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Spooky_Casos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4351,'Sprouting Omens','Final Fantasy X','2026-07-27T08:00:44.382138+00:00','https://www.youtube.com/watch?v=HjWARpX22PE',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Sprouting_Omens_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4352,'Fly to Tomorrow','Raiden III','2026-07-27T04:12:20.408518+00:00','https://www.youtube.com/watch?v=s-YSXJ_qac0',30646,'https://ocrmirror.org/files/music/remixes/Raiden_3_Fly_to_Tomorrow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4353,'Find the Computer Room!','Shadow the Hedgehog','2026-07-26T23:32:10.086887+00:00','https://www.youtube.com/watch?v=P-6ryTFF0zc',7501,'https://ocrmirror.org/files/music/remixes/Shadow_the_Hedgehog_Find_the_Computer_Room!_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4354,'Hypervigilance','Command & Conquer: Tiberian Sun','2026-07-28T17:53:56.075093+00:00','https://www.youtube.com/watch?v=L29aBOJCpWs',373,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Tiberian_Sun_Hypervigilance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4355,'When Your Mom Mistakes Captain Falcon for Captain America Again','F-Zero','2026-07-28T07:59:16.207002+00:00','https://www.youtube.com/watch?v=vqVuBwZ4qZc',89,'https://ocrmirror.org/files/music/remixes/F-Zero_When_Your_Mom_Mistakes_Captain_Falcon_for_Captain_America_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4356,'Sinister Signs','The Legend of Zelda: Majora''s Mask','2026-07-27T17:17:31.073902+00:00','https://www.youtube.com/watch?v=UI5fcYTHjnY',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Sinister_Signs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4357,'Eyes of Umbra','The Legend of Zelda: Twilight Princess','2026-07-27T15:23:46.494806+00:00','https://www.youtube.com/watch?v=bGwO6upMAFI',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Eyes_of_Umbra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4358,'A Scent of Lavender','Pokémon Red Version','2026-07-27T20:50:15.017136+00:00','https://www.youtube.com/watch?v=Q-8dtLlwLeE',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_A_Scent_of_Lavender_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4359,'At Finis Gate','Octopath Traveler','2026-07-28T21:37:59.305897+00:00','https://www.youtube.com/watch?v=S3g6e7e_ogQ',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_At_Finis_Gate_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4360,'Cowboy','Pokémon Mystery Dungeon: Red Rescue Team','2026-07-27T22:33:17.552226+00:00','https://www.youtube.com/watch?v=tSIUQhmIFyo',765,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Red_Rescue_Team_Cowboy_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4361,'Mystic Mycology','Hollow Knight','2026-07-27T18:55:14.724199+00:00','https://www.youtube.com/watch?v=FjJApAQFjd8',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_Mystic_Mycology_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4362,'Songs of Skies','The Legend of Zelda: Skyward Sword','2026-07-27T18:55:14.024082+00:00','https://www.youtube.com/watch?v=CIUHWH1hMe4',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Songs_of_Skies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4363,'Transformation','The Legend of Zelda: Skyward Sword','2026-07-27T15:23:46.138269+00:00','https://www.youtube.com/watch?v=9nF7wASXq2k',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Transformation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4364,'Valse pour un Prince Rebelle','Skies of Arcadia','2026-07-28T04:41:54.858684+00:00','https://www.youtube.com/watch?v=VFjcCwGe-e8',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Valse_pour_un_Prince_Rebelle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4365,'The Ivory Gambit','Secret of Evermore','2026-07-28T17:53:55.363293+00:00','https://www.youtube.com/watch?v=rcM_Q0wobX4',413,'https://ocrmirror.org/files/music/remixes/Secret_of_Evermore_The_Ivory_Gambit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4366,'None Above the Law','Shatterhand','2026-07-28T10:57:15.787221+00:00','https://www.youtube.com/watch?v=vGVFx-QXcV4',443,'https://ocrmirror.org/files/music/remixes/Shatterhand_None_Above_the_Law_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4367,'Protector in Green','Chrono Trigger','2026-07-27T17:17:31.314812+00:00','https://www.youtube.com/watch?v=jEMjLdS68z0',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Protector_in_Green_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4368,'Everybody Wants to Rule the Wisps','Sonic Colors','2026-07-28T04:41:55.543623+00:00','https://www.youtube.com/watch?v=jDocrSncDvs',834,'https://ocrmirror.org/files/music/remixes/Sonic_Colors_Everybody_Wants_to_Rule_the_Wisps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4369,'Save File Corrupted','SaGa Frontier','2026-07-27T22:33:17.010337+00:00','https://www.youtube.com/watch?v=1ihiqPi60Vs',331,'https://ocrmirror.org/files/music/remixes/SaGa_Frontier_Save_File_Corrupted_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4370,'Trapped in a Cave','Super Mario Bros. 2','2026-07-27T18:55:14.549206+00:00','https://www.youtube.com/watch?v=Uzwg7YJO0_U',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Trapped_in_a_Cave_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4371,'B&M','Super Mario Galaxy','2026-07-28T04:41:54.687529+00:00','https://www.youtube.com/watch?v=9ixuuTyLVyQ',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_B&M_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4372,'Peachy Sunbite Down Bubble Tea Quarry','The Legend of Zelda: Breath of the Wild','2026-07-28T00:54:36.072283+00:00','https://www.youtube.com/watch?v=lHd58MTyosw',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Peachy_Sunbite_Down_Bubble_Tea_Quarry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4373,'Oceanic Aura','Donkey Kong Country','2026-07-28T20:00:18.899853+00:00','https://www.youtube.com/watch?v=Z9W72LZTlPo',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Oceanic_Aura_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4374,'Hallownest Below the Wastes','Hollow Knight','2026-07-28T04:41:53.997400+00:00','https://www.youtube.com/watch?v=FhaquFdUlDw',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_Hallownest_Below_the_Wastes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4375,'Hear Her Cries','Final Fantasy VII','2026-07-28T21:38:00.003303+00:00','https://www.youtube.com/watch?v=05Rpn__h89U',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Hear_Her_Cries_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4376,'Ancient Waves','Final Fantasy V','2026-07-27T08:00:45.275118+00:00','https://www.youtube.com/watch?v=t_mDEC3Eii0',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Ancient_Waves_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4377,'The Bat','Batman: Return of the Joker','2026-07-27T20:50:14.132339+00:00','https://www.youtube.com/watch?v=kZPF5D606g8',3253,'https://ocrmirror.org/files/music/remixes/Batman_Return_of_the_Joker_The_Bat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4378,'Rainbow Forms','Final Fantasy IV','2026-07-28T00:54:35.543214+00:00','https://www.youtube.com/watch?v=PlvStpFplP4',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Rainbow_Forms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4379,'Until Dawn','Final Fantasy XIII','2026-07-29T11:02:05.335562+00:00','https://www.youtube.com/watch?v=NR1X-rF98JY',694,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_13_Until_Dawn_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4380,'Serene Spacefish','Metroid Fusion','2026-07-28T17:53:54.833226+00:00','https://www.youtube.com/watch?v=msfYzIEnb38',843,'https://ocrmirror.org/files/music/remixes/Metroid_Fusion_Serene_Spacefish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4381,'Dracula''s Tears','Castlevania II: Simon''s Quest','2026-07-28T17:53:54.650144+00:00','https://www.youtube.com/watch?v=i-MuLoTKMK0',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_Dracula''s_Tears_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4382,'The Shadow','Amnesia: The Dark Descent','2026-07-27T18:55:13.323214+00:00','https://www.youtube.com/watch?v=baBElMbf-Ds',95630,'https://ocrmirror.org/files/music/remixes/Amnesia_The_Dark_Descent_The_Shadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4383,'Ahh!! The Zombies Ate John Carpenter!','Terranigma','2026-07-29T04:46:20.235050+00:00','https://www.youtube.com/watch?v=ikjpL9oreJo',257,'https://ocrmirror.org/files/music/remixes/Terranigma_Ahh_The_Zombies_Ate_John_Carpenter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4384,'Violetville','Pokémon Red Version','2026-07-28T00:54:34.826038+00:00','https://www.youtube.com/watch?v=G_ulWxbmNgI',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Violetville_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4385,'Pigmosh','Minecraft','2026-07-27T20:50:15.906136+00:00','https://www.youtube.com/watch?v=hghA9llsEI8',708,'https://ocrmirror.org/files/music/remixes/Minecraft_Pigmosh_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4386,'Black Moonrise (Midnight Mix)','Celeste','2026-07-27T17:17:32.536251+00:00','https://www.youtube.com/watch?v=R75ZVmv-qiE',95636,'https://ocrmirror.org/files/music/remixes/Celeste_Black_Moonrise_(Midnight_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4387,'Live Mega, Live Más','Live A Live','2026-07-28T17:53:56.258342+00:00','https://www.youtube.com/watch?v=a3b2JaGerBI',556,'https://ocrmirror.org/files/music/remixes/Live_A_Live_Live_Mega_Live_Mas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4388,'Combo Breaker','Killer Instinct','2026-07-28T23:29:51.163399+00:00','https://www.youtube.com/watch?v=Lm5Phc-_QIg',122,'https://ocrmirror.org/files/music/remixes/Killer_Instinct_Combo_Breaker_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4389,'Brushwork','Mario Paint','2026-07-29T08:05:46.087601+00:00','https://www.youtube.com/watch?v=i-IRJ3OUP0c',126,'https://ocrmirror.org/files/music/remixes/Mario_Paint_Brushwork_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4390,'Dovahkiin in Jamaica','The Elder Scrolls V: Skyrim','2026-07-27T22:33:17.373538+00:00','https://www.youtube.com/watch?v=bU-MhCB5OrA',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Dovahkiin_in_Jamaica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4391,'Reunion','Fire Emblem: Genealogy of the Holy War','2026-07-28T04:41:55.372705+00:00','https://www.youtube.com/watch?v=-mw9TY8nZC4',11016,'https://ocrmirror.org/files/music/remixes/Fire_Emblem_Genealogy_of_the_Holy_War_Reunion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4392,'Gravity Suit','Metroid Prime','2026-07-29T04:46:20.418319+00:00','https://www.youtube.com/watch?v=6h_M5XRGmeo',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Gravity_Suit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4393,'Chill Beats to Race To','Diddy Kong Racing','2026-07-28T07:59:16.033855+00:00','https://www.youtube.com/watch?v=kV7l7WyILWc',620,'https://ocrmirror.org/files/music/remixes/Diddy_Kong_Racing_Chill_Beats_to_Race_To_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4394,'A Different Kind of Dance','Octopath Traveler','2026-07-27T22:33:17.729650+00:00','https://www.youtube.com/watch?v=hcU9nX2oDqU',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_A_Different_Kind_of_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4395,'Nibelung Valesti','Valkyrie Profile','2026-07-28T07:59:17.073979+00:00','https://www.youtube.com/watch?v=HP-nDD05UYA',547,'https://ocrmirror.org/files/music/remixes/Valkyrie_Profile_Nibelung_Valesti_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4396,'Dance of the Ant Spawn','Jet Force Gemini','2026-07-28T10:57:14.721080+00:00','https://www.youtube.com/watch?v=QvINFjY4T4s',3003,'https://ocrmirror.org/files/music/remixes/Jet_Force_Gemini_Dance_of_the_Ant_Spawn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4397,'Subcon on Mushrooms','Super Mario Bros. 2','2026-07-27T22:33:17.193118+00:00','https://www.youtube.com/watch?v=WcYi9rBYTDY',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_Subcon_on_Mushrooms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4398,'Semper Saltare','Xenogears','2026-07-28T20:00:19.437632+00:00','https://www.youtube.com/watch?v=VqFcmOpgstk',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Semper_Saltare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4399,'Back to the Island','Super Mario World 2: Yoshi''s Island','2026-07-28T04:41:54.345514+00:00','https://www.youtube.com/watch?v=Ju2IjcmOvKg',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Back_to_the_Island_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4400,'Ice Cap Zone (Pulse Mix)','Sonic the Hedgehog 3','2026-07-27T20:50:13.953437+00:00','https://www.youtube.com/watch?v=8nXuD2koq7Y',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Ice_Cap_Zone_(Pulse_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4401,'J-Type','Tetris','2026-07-28T07:59:16.553269+00:00','https://www.youtube.com/watch?v=0T_v9fUrgmM',510,'https://ocrmirror.org/files/music/remixes/Tetris_J-Type_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4402,'The Beginning','The Legend of Zelda: Skyward Sword','2026-07-28T15:41:38.339841+00:00','https://www.youtube.com/watch?v=eVg_UTIKOWQ',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_The_Beginning_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4403,'Run Pony Run','Pony Island','2026-07-28T15:41:38.165497+00:00','https://www.youtube.com/watch?v=-VJfSvlD4yA',95212,'https://ocrmirror.org/files/music/remixes/Pony_Island_Run_Pony_Run_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4404,'A Truth Found in Storms','Ori and the Blind Forest: Definitive Edition','2026-07-28T20:00:18.535324+00:00','https://www.youtube.com/watch?v=DJvgpPVOL5o',95826,'https://ocrmirror.org/files/music/remixes/Ori_and_the_Blind_Forest_Definitive_Edition_A_Truth_Found_in_Storms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4405,'Sovitus','Final Fantasy V','2026-07-28T00:54:35.006487+00:00','https://www.youtube.com/watch?v=DCWqRmdtuiQ',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Sovitus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4406,'Welcome to Pixeland','Final Fantasy X','2026-07-27T20:50:14.481478+00:00','https://www.youtube.com/watch?v=kS3vPSmOP8g',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Welcome_to_Pixeland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4407,'Sands of Da''at','Shin Megami Tensei V','2026-07-28T00:54:35.365315+00:00','https://www.youtube.com/watch?v=xDRS4VswLoY',95827,'https://ocrmirror.org/files/music/remixes/Shin_Megami_Tensei_V_Sands_of_Da''at_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4408,'The Heart Beats with the Rhythm of the Rain','Goemon''s Great Adventure','2026-07-29T13:13:49.783493+00:00','https://www.youtube.com/watch?v=5DlSGUI_ZPk',548,'https://ocrmirror.org/files/music/remixes/Goemon%E2%80%99s_Great_Adventure_The_Heart_Beats_with_the_Rhythm_of_the_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4409,'Treasure Beyond Dreams','Radical Dreamers: Nusumenai Houseki','2026-07-28T15:41:38.854809+00:00','https://www.youtube.com/watch?v=C2t2OtqSTXc',53,'https://ocrmirror.org/files/music/remixes/Radical_Dreamers_Treasure_Beyond_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4410,'NoMercy','Undertale','2026-07-27T20:50:14.306455+00:00','https://www.youtube.com/watch?v=hnmrq52Z4O4',95077,'https://ocrmirror.org/files/music/remixes/Undertale_NoMercy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4411,'A Hunter''s Epilogue','Super Metroid','2026-07-28T07:59:16.726872+00:00','https://www.youtube.com/watch?v=6mQIkWuRvuY',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_A_Hunter''s_Epilogue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4412,'Postcards from Silius','Journey to Silius','2026-07-29T08:05:46.383672+00:00','https://www.youtube.com/watch?v=gkSXQD02Ctc',154,'https://ocrmirror.org/files/music/remixes/Journey_to_Silius_Postcards_from_Silius_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4413,'Hang Castle (Team Sonic Racing Mix)','Sonic Heroes','2026-07-28T20:00:19.258644+00:00','https://www.youtube.com/watch?v=jCFdNygkIQg',654,'https://ocrmirror.org/files/music/remixes/Sonic_Heroes_Hang_Castle_(Team_Sonic_Racing_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4414,'Yuna at Zanarkand, Her Mind on Lost Friends','Final Fantasy X','2026-07-29T15:28:40.895007+00:00','https://www.youtube.com/watch?v=0m3f1-jt_Yo',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Yuna_at_Zanarkand_Her_Mind_on_Lost_Friends_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4415,'A Broken Waltz','Final Fantasy VII Remake','2026-07-28T04:41:54.170993+00:00','https://www.youtube.com/watch?v=K1DTXWuY12k',95829,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Remake_A_Broken_Waltz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4416,'Shadow Hunter','Gabriel Knight: Sins of the Fathers','2026-07-28T21:37:59.165067+00:00','https://www.youtube.com/watch?v=IgwAfFgZNcA',14871,'https://ocrmirror.org/files/music/remixes/Gabriel_Knight_Shadow_Hunter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4417,'A Cursed Land','The Legend of Zelda: Majora''s Mask','2026-07-28T07:59:15.680898+00:00','https://www.youtube.com/watch?v=9nGT2h1eK44',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_A_Cursed_Land_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4418,'W3 4RE TH3 ROB0TS','Stray','2026-07-29T18:31:21.712987+00:00','https://www.youtube.com/watch?v=jMWal2WJy7Y',95830,'https://ocrmirror.org/files/music/remixes/Stray_W3_4RE_TH3_ROB0TS_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4419,'Into the Ocean, We Walk Peering Way Past the Snake','Okami','2026-07-28T07:59:16.899798+00:00','https://www.youtube.com/watch?v=Hm03g6W5mgY',537,'https://ocrmirror.org/files/music/remixes/Okami_Into_the_Ocean_We_Walk_Peering_Way_Past_the_Snake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4420,'Songs of Spirit','The Legend of Zelda: Skyward Sword','2026-07-28T20:00:19.980889+00:00','https://www.youtube.com/watch?v=KvC3S4wTL4s',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Songs_of_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4421,'Castle Creep','Super Mario World','2026-07-28T15:41:39.025942+00:00','https://www.youtube.com/watch?v=H3McThoAGlI',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Castle_Creep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4422,'The Arc That Spans the Heavens','Yu-Gi-Oh! Duel Links','2026-07-28T21:37:59.585169+00:00','https://www.youtube.com/watch?v=sAlPoyy1_0g',95831,'https://ocrmirror.org/files/music/remixes/Yu-Gi-Oh_Duel_Links_The_Arc_That_Spans_the_Heavens_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4423,'Club Lavender','Pokémon Red Version','2026-07-29T01:01:37.881065+00:00','https://www.youtube.com/watch?v=0U463tyQH-A',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Club_Lavender_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4424,'Booster and the Snifit Quartet','Super Mario RPG: Legend of the Seven Stars','2026-07-29T11:02:04.784425+00:00','https://www.youtube.com/watch?v=LuIcAoYSA1M',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Booster_and_the_Snifit_Quartet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4425,'Super Star','Super Mario Bros.','2026-07-28T20:00:19.079062+00:00','https://www.youtube.com/watch?v=h5Ff8i3RC7c',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Super_Star_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4426,'The Muu Dream Machine','Super Mario Bros. 2','2026-07-29T04:46:20.707677+00:00','https://www.youtube.com/watch?v=jBDgq4iVz6A',57,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_2_The_Muu_Dream_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4427,'Watercolours','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-29T04:46:20.545331+00:00','https://www.youtube.com/watch?v=vjuhp9XkK80',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Watercolours_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4428,'Banned Wagon Mix','Super Mario Maker 2','2026-07-29T04:46:19.591361+00:00','https://www.youtube.com/watch?v=yHEZNF0CSvs',95832,'https://ocrmirror.org/files/music/remixes/Super_Mario_Maker_2_Banned_Wagon_Mix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4429,'I have Seen the yellow paint','Mario Paint','2026-07-28T17:53:55.540141+00:00','https://www.youtube.com/watch?v=Ozyb0sWOCUM',126,'https://ocrmirror.org/files/music/remixes/Mario_Paint_I_have_Seen_the_yellow_paint_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4430,'Welcome to Our House','New Super Mario Bros. Wii','2026-07-28T15:41:38.510867+00:00','https://www.youtube.com/watch?v=e9TBBZdWy7w',51936,'https://ocrmirror.org/files/music/remixes/New_Super_Mario_Bros_Wii_Welcome_to_Our_House_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4431,'First Jumps','Super Mario World','2026-07-28T17:53:55.186897+00:00','https://www.youtube.com/watch?v=8Wk-u2xm3X4',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_First_Jumps_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4432,'Distorted Forest','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-28T17:53:55.717968+00:00','https://www.youtube.com/watch?v=WRglNTJok1I',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Distorted_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4433,'Paint It Black','Paper Mario: Color Splash','2026-07-29T01:01:38.056503+00:00','https://www.youtube.com/watch?v=1jnzGshFRgM',95277,'https://ocrmirror.org/files/music/remixes/Paper_Mario_Color_Splash_Paint_It_Black_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4434,'DK''s Mushroom Trip','Donkey Kong 64','2026-07-29T01:01:37.175831+00:00','https://www.youtube.com/watch?v=F-vPnuWS6Ck',2955,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_64_DK''s_Mushroom_Trip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4435,'IsseLand','Super Mario Bros. 3','2026-07-28T13:09:04.757696+00:00','https://www.youtube.com/watch?v=vjkVEwEgVyo',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_IsseLand_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4436,'Meteorites and Rabbits (Ultimate Version)','Super Mario Galaxy','2026-07-28T21:37:59.445328+00:00','https://www.youtube.com/watch?v=IaINDgC6k4Q',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Meteorites_and_Rabbits_(Ultimate_Version)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4437,'Green Glade Groove','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-29T15:28:40.721690+00:00','https://www.youtube.com/watch?v=F1kSunjrrWc',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Green_Glade_Groove_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4438,'Yoshi Race (Love Mix Version)','Mario Kart 8','2026-07-29T21:28:58.980831+00:00','https://www.youtube.com/watch?v=acAHr06tQ04',94917,'https://ocrmirror.org/files/music/remixes/Mario_Kart_8_Yoshi_Race_(Love_Mix_Version)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4439,'Aroma of Sugary Warmth','Final Fantasy VIII','2026-07-29T11:02:05.159132+00:00','https://www.youtube.com/watch?v=286KoOMbHeU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Aroma_of_Sugary_Warmth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4440,'Longing for the Horizon','Final Fantasy VIII','2026-07-29T01:01:37.352186+00:00','https://www.youtube.com/watch?v=aAhcEJO9mkc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Longing_for_the_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4441,'Queen of Cards','Final Fantasy VIII','2026-07-28T15:41:37.990766+00:00','https://www.youtube.com/watch?v=XFX5lK7gzpU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Queen_of_Cards_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4442,'Final Force','Final Fantasy VIII','2026-07-28T07:59:15.857920+00:00','https://www.youtube.com/watch?v=4UGqMW2XQh0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Final_Force_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4443,'A Scar to Match','Final Fantasy VIII','2026-07-29T11:02:03.836292+00:00','https://www.youtube.com/watch?v=d9Mm3G1y2OA',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_A_Scar_to_Match_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4444,'Concédeme Un Momento','Final Fantasy VIII','2026-07-29T18:31:21.352712+00:00','https://www.youtube.com/watch?v=yxf2VRuAtls',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Concedeme_Un_Momento_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4445,'Song of the Desperado','Final Fantasy VIII','2026-07-29T11:02:04.961092+00:00','https://www.youtube.com/watch?v=albUcVebHyM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Song_of_the_Desperado_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4446,'SeeDs of Pandora','Final Fantasy VIII','2026-07-29T15:28:41.586812+00:00','https://www.youtube.com/watch?v=zoUIcsBl7uE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_SeeDs_of_Pandora_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4447,'Swallowed by the Woods','The Legend of Zelda: Breath of the Wild','2026-07-29T04:46:19.993782+00:00','https://www.youtube.com/watch?v=vmkuCjKl0SU',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Swallowed_by_the_Woods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4448,'Hyrule Castle (Pulse Mix)','The Legend of Zelda: A Link to the Past','2026-07-28T23:29:50.454206+00:00','https://www.youtube.com/watch?v=A_8t1tbFlGw',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Hyrule_Castle_(Pulse_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4449,'Forgotten Ruins','The Legend of Zelda: Oracle of Seasons','2026-07-28T00:54:35.186423+00:00','https://www.youtube.com/watch?v=3l-klrxrAbQ',726,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Seasons_Forgotten_Ruins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4450,'Koholint Serenade','The Legend of Zelda: Link''s Awakening','2026-07-29T22:30:48.611429+00:00','https://www.youtube.com/watch?v=lPRe5zYy-S8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Koholint_Serenade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4451,'Potion','The Legend of Zelda: A Link Between Worlds','2026-07-29T01:01:37.705346+00:00','https://www.youtube.com/watch?v=jafWJUe2iBs',94860,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_Between_Worlds_Potion_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4452,'Lost in Time','Final Fantasy VIII','2026-07-29T04:46:19.457650+00:00','https://www.youtube.com/watch?v=Q4aKF0NKeik',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Lost_in_Time_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4453,'Find Your Way to the East','Final Fantasy VIII','2026-07-29T15:28:40.546995+00:00','https://www.youtube.com/watch?v=CHncK5nIOOU',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Find_Your_Way_to_the_East_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4454,'Your Smile','Final Fantasy VIII','2026-07-28T21:38:00.282752+00:00','https://www.youtube.com/watch?v=uorc2ICQvwg',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Your_Smile_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4455,'Warheads','Final Fantasy VIII','2026-07-28T15:41:38.682393+00:00','https://www.youtube.com/watch?v=6FHcPUOfmVE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Warheads_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4456,'El Vuelo de los Búhos','Final Fantasy VIII','2026-07-29T22:30:48.788007+00:00','https://www.youtube.com/watch?v=2tMXMqVlUe4',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_El_Vuelo_de_los_Buhos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4457,'Succession of Magical Girls','Final Fantasy VIII','2026-07-28T23:29:51.305422+00:00','https://www.youtube.com/watch?v=QRtnbNqueYM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Succession_of_Magical_Girls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4458,'Voces Maledictionis et Spei: Children Fated to Lead','Final Fantasy VIII','2026-07-29T20:29:28.445125+00:00','https://www.youtube.com/watch?v=mwLrr7irw0I',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Voces_Maledictionis_et_Spei_Children_Fated_to_Lead_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4459,'The Definition of Insanity','Final Fantasy VIII','2026-07-30T07:54:04.552780+00:00','https://www.youtube.com/watch?v=55EzIAE5yvg',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Definition_of_Insanity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4460,'Snake Man (Pulse Mix)','Mega Man 3','2026-07-28T13:09:03.757193+00:00','https://www.youtube.com/watch?v=Y8K7uNXdk6k',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Snake_Man_(Pulse_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4461,'Stuck in My Mind','Final Fantasy VIII','2026-07-29T18:31:21.172062+00:00','https://www.youtube.com/watch?v=dWYVXCVy42I',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Stuck_in_My_Mind_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4462,'Submergence','Super Metroid','2026-07-29T13:13:50.307638+00:00','https://www.youtube.com/watch?v=rHexPwrebrQ',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Submergence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4463,'Pathogen Zero','Bio-Hazard Battle','2026-07-28T21:38:00.143037+00:00','https://www.youtube.com/watch?v=mjYehsWT7vs',6256,'https://ocrmirror.org/files/music/remixes/Bio-Hazard_Battle_Pathogen_Zero_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4464,'The Last Dead Angel','Kirby 64: The Crystal Shards','2026-07-29T04:46:19.878060+00:00','https://www.youtube.com/watch?v=KdGTgA-UILI',577,'https://ocrmirror.org/files/music/remixes/Kirby_64_The_Last_Dead_Angel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4465,'Sentinel','Command & Conquer: Tiberian Sun','2026-07-28T15:41:39.367977+00:00','https://www.youtube.com/watch?v=26z_l-U47yQ',373,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Tiberian_Sun_Sentinel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4466,'The Floor Is Lava','Mischief Makers','2026-07-28T23:29:50.596621+00:00','https://www.youtube.com/watch?v=Cs6aHjUYYoo',3031,'https://ocrmirror.org/files/music/remixes/Mischief_Makers_The_Floor_Is_Lava_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4467,'Lovers'' Quarrel','Fire Emblem: Genealogy of the Holy War','2026-07-28T10:57:15.079149+00:00','https://www.youtube.com/watch?v=YksardO2o28',11016,'https://ocrmirror.org/files/music/remixes/Fire_Emblem_Genealogy_of_the_Holy_War_Lovers''_Quarrel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4468,'Courage in the Dark','Celeste','2026-07-28T13:09:04.042868+00:00','https://www.youtube.com/watch?v=7VNVX8v7dkY',95636,'https://ocrmirror.org/files/music/remixes/Celeste_Courage_in_the_Dark_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4469,'Save Your Valediction','Final Fantasy IX','2026-07-29T13:13:50.483205+00:00','https://www.youtube.com/watch?v=atVk7uG7Dkw',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Save_Your_Valediction_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4470,'The Oscar Goes to Laguna Loire','Final Fantasy VIII','2026-07-29T01:01:37.527441+00:00','https://www.youtube.com/watch?v=tUoH2bofNFo',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Oscar_Goes_to_Laguna_Loire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4471,'Together Again','Animal Crossing: New Horizons','2026-07-28T17:53:55.010444+00:00','https://www.youtube.com/watch?v=Iqv39FQta3I',95587,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_New_Horizons_Together_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4472,'Toriel''s Pain','Undertale','2026-07-28T10:57:14.899160+00:00','https://www.youtube.com/watch?v=pK3-xWK3-fk',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Toriel''s_Pain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4473,'The HUNT Begins','Rise of the Triad: Dark War','2026-07-28T23:29:50.740087+00:00','https://www.youtube.com/watch?v=cbZiDfrVj-I',16294,'https://ocrmirror.org/files/music/remixes/Rise_of_the_Triad_The_HUNT_Begins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4474,'Dark Waters','The Legend of Zelda: The Minish Cap','2026-07-28T21:37:59.021451+00:00','https://www.youtube.com/watch?v=puWzq2K9bAA',9081,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Minish_Cap_Dark_Waters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4475,'Spirit of the Desert','Xenogears','2026-07-28T20:00:18.718638+00:00','https://www.youtube.com/watch?v=8MxyBrdAmFE',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Spirit_of_the_Desert_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4476,'Project Blue','F-Zero','2026-07-29T18:31:22.605303+00:00','https://www.youtube.com/watch?v=ZgR5O8PDTMs',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Project_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4477,'Guardian Unknown','Thunder Force V','2026-07-29T21:28:58.285480+00:00','https://www.youtube.com/watch?v=kEDVD-h2jCA',8748,'https://ocrmirror.org/files/music/remixes/Thunder_Force_5_Guardian_Unknown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4478,'Isaac''s Only Shot','Golden Sun','2026-07-29T18:31:21.533982+00:00','https://www.youtube.com/watch?v=XIjk6L0ddag',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Isaac''s_Only_Shot_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4479,'Strife','Final Fantasy VII','2026-07-29T16:51:20.041975+00:00','https://www.youtube.com/watch?v=kApP1phQno8',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Strife_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4480,'Flooded Caverns','Super Metroid','2026-07-28T15:41:39.540092+00:00','https://www.youtube.com/watch?v=pCd-PQqIjfY',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Flooded_Caverns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4481,'Starlit Sails','Atelier Shallie: Alchemists of the Dusk Sea','2026-07-29T21:28:59.318305+00:00','https://www.youtube.com/watch?v=0Ovbr8GkcaM',95828,'https://ocrmirror.org/files/music/remixes/Atelier_Shallie_Starlit_Sails_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4482,'The Secret Lullaby','The Legend of Zelda: Ocarina of Time','2026-07-29T18:31:22.247397+00:00','https://www.youtube.com/watch?v=9rnNalfWN40',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_The_Secret_Lullaby_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4483,'Run Like a Ninja','Guilty Gear','2026-07-29T13:13:49.608016+00:00','https://www.youtube.com/watch?v=5b5r9FUVviU',42022,'https://ocrmirror.org/files/music/remixes/Guilty_Gear_Run_Like_a_Ninja_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4484,'Forest Through the Trees','Final Fantasy Mystic Quest','2026-07-29T08:05:45.941580+00:00','https://www.youtube.com/watch?v=YVzCNeoayQY',332,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Mystic_Quest_Forest_Through_the_Trees_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4485,'wily theme','Mega Man 2','2026-07-30T13:05:38.892210+00:00','https://www.youtube.com/watch?v=AObVeb8j6eM',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_wily_theme_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4486,'Waka Waka','Okami','2026-07-30T00:53:40.551866+00:00','https://www.youtube.com/watch?v=uD1aaWcBNf8',537,'https://ocrmirror.org/files/music/remixes/Okami_Waka_Waka_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4487,'Clash at the Koopas','Paper Mario','2026-07-30T07:54:04.728068+00:00','https://www.youtube.com/watch?v=NYCglvcb-VY',3070,'https://ocrmirror.org/files/music/remixes/Paper_Mario_Clash_at_the_Koopas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4488,'Sing, Sing, Sing Your Heart Out','Paper Mario','2026-07-28T20:00:19.800186+00:00','https://www.youtube.com/watch?v=jjwmLPPkXvU',3070,'https://ocrmirror.org/files/music/remixes/Paper_Mario_Sing_Sing_Sing_Your_Heart_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4489,'Crocodile Kroctoberfest (Prost Mix)','Super Smash Bros. Ultimate','2026-07-30T10:37:29.119559+00:00','https://www.youtube.com/watch?v=_YEMpGbN6zk',95840,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Ultimate_Crocodile_Kroctoberfest_(Prost_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4490,'Tyrano''s Stash','Chrono Trigger','2026-07-29T20:29:28.621523+00:00','https://www.youtube.com/watch?v=FxTI3WqTQVY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Tyrano''s_Stash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4491,'A Battle Across Time','Chrono Trigger','2026-07-30T10:37:29.298128+00:00','https://www.youtube.com/watch?v=JZhaGab6YaE',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_A_Battle_Across_Time_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4492,'Jumped in the Serpent Trench','Final Fantasy VI','2026-07-29T16:51:19.863963+00:00','https://www.youtube.com/watch?v=Xsg8H1nziac',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Jumped_in_the_Serpent_Trench_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4493,'Orwellian','Half-Life 2','2026-07-29T18:31:22.426772+00:00','https://www.youtube.com/watch?v=c-fsBfzNxfk',827,'https://ocrmirror.org/files/music/remixes/Half-Life_2_Orwellian_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4494,'The Infested Arena','Final Fantasy VIII','2026-07-28T23:29:50.310710+00:00','https://www.youtube.com/watch?v=z-icQ12c9tY',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Infested_Arena_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4495,'The First Playing','Final Fantasy VII','2026-07-29T16:51:19.684972+00:00','https://www.youtube.com/watch?v=rdEmQl9KBTE',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_The_First_Playing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4496,'Vega''s Theme (Pulse Mix)','Street Fighter II: The World Warrior','2026-07-29T21:28:57.765689+00:00','https://www.youtube.com/watch?v=s5KfGMoAC0s',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Vega''s_Theme_(Pulse_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4497,'You''ve Got the Body, I''ve Got the Synth','A Nightmare on Elm Street','2026-07-28T23:29:51.022261+00:00','https://www.youtube.com/watch?v=2nLDOht8Opg',3206,'https://ocrmirror.org/files/music/remixes/Nightmare_on_Elm_Street_You''ve_Got_the_Body_I''ve_Got_the_Synth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4498,'Shadows of Hyrule','The Legend of Zelda','2026-07-29T16:51:19.506209+00:00','https://www.youtube.com/watch?v=n917IlwcNCw',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Shadows_of_Hyrule_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4499,'Blue Magic','Minecraft','2026-07-28T21:37:59.863759+00:00','https://www.youtube.com/watch?v=PJcLmtOd5e8',708,'https://ocrmirror.org/files/music/remixes/Minecraft_Blue_Magic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4500,'In Mountains We Will Sleep','Final Fantasy XIV','2026-07-30T00:53:40.699716+00:00','https://www.youtube.com/watch?v=DJFavwZwWXk',95839,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_14_In_Mountains_We_Will_Sleep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4501,'Deku Meets Knuckleduster','Streets of Rage','2026-07-29T11:02:04.607867+00:00','https://www.youtube.com/watch?v=45utD2PI-Jw',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Deku_Meets_Knuckleduster_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4502,'DRWNXD','The Legend of Zelda: Majora''s Mask','2026-07-29T11:02:05.511763+00:00','https://www.youtube.com/watch?v=ghOSmgFMK4Y',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_DRWNXD_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4503,'Seedrun','Plants vs. Zombies','2026-07-29T01:01:36.999609+00:00','https://www.youtube.com/watch?v=H30R9R7cRww',727,'https://ocrmirror.org/files/music/remixes/Plants_vs_Zombies_Seedrun_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4504,'Simon''s Madness','Castlevania','2026-07-29T01:01:38.408594+00:00','https://www.youtube.com/watch?v=3aLwxrfkZ_4',18,'https://ocrmirror.org/files/music/remixes/Castlevania_Simon''s_Madness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4505,'Koopalings','Super Mario World','2026-07-29T04:46:20.119713+00:00','https://www.youtube.com/watch?v=CiZ1rna9fdM',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Koopalings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4506,'Beginnings','The Legend of Zelda: Ocarina of Time','2026-07-29T11:02:04.077647+00:00','https://www.youtube.com/watch?v=_zexkClA2Ug',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Beginnings_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4507,'The Future Is Bright','Sonic CD','2026-07-29T22:30:48.434603+00:00','https://www.youtube.com/watch?v=Z67Xgiu3xdQ',146,'https://ocrmirror.org/files/music/remixes/Sonic_CD_The_Future_Is_Bright_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4508,'Can''t Stop Me!','Streets of Rage 2','2026-07-28T23:29:51.446480+00:00','https://www.youtube.com/watch?v=fca9WNK_CqQ',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Can''t_Stop_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4509,'Sega FM Drum and Bass','Streets of Rage 2','2026-07-29T08:05:46.829610+00:00','https://www.youtube.com/watch?v=4oMCJtpVETA',80,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_2_Sega_FM_Drum_and_Bass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4510,'Release the Kraken','Mega Man X4','2026-07-30T13:05:39.248294+00:00','https://www.youtube.com/watch?v=QXn_rIq-xOA',255,'https://ocrmirror.org/files/music/remixes/Mega_Man_X4_Release_the_Kraken_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4511,'Mountain of Light','Final Fantasy IV','2026-07-28T23:29:51.588539+00:00','https://www.youtube.com/watch?v=wPtyZTbim9U',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Mountain_of_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4512,'A Golden Axe Journey','Golden Axe','2026-07-30T13:05:39.878166+00:00','https://www.youtube.com/watch?v=HPCBKxjNDnc',90,'https://ocrmirror.org/files/music/remixes/Golden_Axe_A_Golden_Axe_Journey_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4513,'Carnival of Life','Chrono Trigger','2026-07-29T11:02:03.627991+00:00','https://www.youtube.com/watch?v=6I6oJpbPGoY',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Carnival_of_Life_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4514,'12,000 B.C.','Chrono Trigger','2026-07-29T08:05:46.678567+00:00','https://www.youtube.com/watch?v=Cn-iWOP3Glg',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_12000_BC_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4515,'119 Minutes Left','Prince of Persia','2026-07-29T01:01:38.232139+00:00','https://www.youtube.com/watch?v=_rTrNvxZabs',11278,'https://ocrmirror.org/files/music/remixes/Prince_of_Persia_119_Minutes_Left_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4516,'Time Will Compress','Final Fantasy VIII','2026-07-29T08:05:46.531213+00:00','https://www.youtube.com/watch?v=O6qQELPi918',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Time_Will_Compress_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4517,'Filthy Lies / Wasted Virtue','Final Fantasy VIII','2026-07-29T21:28:58.805478+00:00','https://www.youtube.com/watch?v=OWPLSSGSs2c',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Filthy_Lies_Wasted_Virtue_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4518,'Deling City Nights','Final Fantasy VIII','2026-07-30T00:53:40.403436+00:00','https://www.youtube.com/watch?v=z4H0mM43VrM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Deling_City_Nights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4519,'Dancefloorphans','Final Fantasy VIII','2026-07-29T08:05:45.797138+00:00','https://www.youtube.com/watch?v=vpztwF5qUIk',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Dancefloorphans_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4520,'Witch Hunter','Final Fantasy VIII','2026-07-29T22:30:49.141030+00:00','https://www.youtube.com/watch?v=5NEE9dZP-5s',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Witch_Hunter_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4521,'For a Few Draws More','Final Fantasy VIII','2026-07-30T21:42:32.699621+00:00','https://www.youtube.com/watch?v=1TYZjbQKy3s',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_For_a_Few_Draws_More_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4522,'Into the Singularity','Final Fantasy VIII','2026-07-30T07:54:04.202907+00:00','https://www.youtube.com/watch?v=bdWP3XaZrqs',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Into_the_Singularity_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4523,'Where Is My Fault?','Final Fantasy VIII','2026-07-30T07:54:04.378146+00:00','https://www.youtube.com/watch?v=7M_p6gnsjC0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Where_Is_My_Fault_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4524,'Taiga/Tundra','Sonic the Hedgehog 3','2026-07-29T15:28:41.760016+00:00','https://www.youtube.com/watch?v=zjTg0KqIOEQ',24,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_3_Taiga_Tundra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4525,'Winters Is Coming','EarthBound','2026-07-29T01:01:36.821271+00:00','https://www.youtube.com/watch?v=Cyd1RPtpgCc',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Winters_Is_Coming_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4526,'Chaos on Screen','Spider-Man and Venom: Maximum Carnage','2026-07-29T13:13:50.132256+00:00','https://www.youtube.com/watch?v=CwxdW_AncNU',11364,'https://ocrmirror.org/files/music/remixes/Spider-Man_and_Venom_Maximum_Carnage_Chaos_on_Screen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4527,'Timeshift','The Legend of Zelda: Skyward Sword','2026-07-30T15:30:47.265432+00:00','https://www.youtube.com/watch?v=l7XGMklpxjE',725,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Skyward_Sword_Timeshift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4528,'Bitter Sweets','Castle of Illusion','2026-07-29T22:30:48.258296+00:00','https://www.youtube.com/watch?v=mj79juox1No',12546,'https://ocrmirror.org/files/music/remixes/Castle_of_Illusion_Bitter_Sweets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4529,'The Simulation','Yu-Gi-Oh! World Championship Tournament 2004','2026-07-29T15:28:41.068359+00:00','https://www.youtube.com/watch?v=ph_eHQH2b5U',9399,'https://ocrmirror.org/files/music/remixes/Yu-Gi-Oh_World_Championship_Tournament_2004_The_Simulation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4530,'A Long Road','The Lord of the Rings, Vol. I','2026-07-29T15:28:40.370381+00:00','https://www.youtube.com/watch?v=Vl4vR5ieVDc',15297,'https://ocrmirror.org/files/music/remixes/Lord_of_the_Rings_Vol_1_A_Long_Road_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4531,'Experienite Tinderbox','RuneScape','2026-07-30T07:54:04.028854+00:00','https://www.youtube.com/watch?v=0uEH-JDLGzA',25584,'https://ocrmirror.org/files/music/remixes/RuneScape_Experienite_Tinderbox_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4532,'Frozen Echoes','Metroid Prime','2026-07-29T13:13:49.957472+00:00','https://www.youtube.com/watch?v=Ix4vDf0Ih7w',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Frozen_Echoes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4533,'Binary Stars','Super Metroid','2026-07-30T04:34:06.364056+00:00','https://www.youtube.com/watch?v=CXRvMVmLQEA',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Binary_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4534,'The Brinstar Chemical','Sonic the Hedgehog 2','2026-07-29T15:28:41.241208+00:00','https://www.youtube.com/watch?v=lieCB52Q_-c',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_The_Brinstar_Chemical_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4535,'Sol Searching','Mass Effect','2026-07-30T04:34:05.840624+00:00','https://www.youtube.com/watch?v=JR3caW4gTkU',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_Sol_Searching_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4536,'Mushy Metal Aura Headd','Dynamite Headdy','2026-07-29T11:02:03.404141+00:00','https://www.youtube.com/watch?v=EelklKgv-Fk',731,'https://ocrmirror.org/files/music/remixes/Dynamite_Headdy_Mushy_Metal_Aura_Headd_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4537,'The Flooded Temple','Final Fantasy X','2026-07-29T16:51:20.220991+00:00','https://www.youtube.com/watch?v=0gHK2y3UicM',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_The_Flooded_Temple_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4538,'Terranian Faith','Final Fantasy IX','2026-07-29T20:29:28.869996+00:00','https://www.youtube.com/watch?v=fXPKWspj9UQ',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Terranian_Faith_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4539,'The Tolls of Stringent Obligation','Final Fantasy VIII','2026-07-30T20:01:29.475884+00:00','https://www.youtube.com/watch?v=DoEG3MxBaG0',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Tolls_of_Stringent_Obligation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4540,'Fantasy Fighting','Final Fantasy VII','2026-07-29T08:05:45.508804+00:00','https://www.youtube.com/watch?v=g8wM82d6Ec4',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Fantasy_Fighting_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4541,'Terrastrial','Final Fantasy VI','2026-07-29T20:29:29.020303+00:00','https://www.youtube.com/watch?v=z5lVCcPfuqE',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Terrastrial_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4542,'What Lurks Behind the Door','Final Fantasy V','2026-07-29T22:30:47.731820+00:00','https://www.youtube.com/watch?v=ptTkafIPhdg',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_What_Lurks_Behind_the_Door_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4543,'Genesis of Destruction','Final Fantasy IV','2026-07-31T03:59:40.104515+00:00','https://www.youtube.com/watch?v=lEE9VpiK8SU',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Genesis_of_Destruction_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4544,'When the Walls of Time Fell...','Chrono Trigger','2026-07-29T16:51:19.326772+00:00','https://www.youtube.com/watch?v=MjoP6Pijjxs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_When_the_Walls_of_Time_Fell_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4545,'Kraidiance','Metroid','2026-07-29T16:51:18.965463+00:00','https://www.youtube.com/watch?v=dFBFd3cd1Xs',73,'https://ocrmirror.org/files/music/remixes/Metroid_Kraidiance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4546,'Even Ill Omens Need a Break','Final Fantasy VIII','2026-07-30T23:32:34.590581+00:00','https://www.youtube.com/watch?v=gZxlUrgI3kE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Even_Ill_Omens_Need_a_Break_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4547,'Make Them Bleed','Final Fantasy VIII','2026-07-30T20:01:29.658082+00:00','https://www.youtube.com/watch?v=RbLIyBHH7NE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Make_Them_Bleed_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4548,'Moments','Final Fantasy VIII','2026-07-29T21:28:58.110874+00:00','https://www.youtube.com/watch?v=DFTyFOS5kSY',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Moments_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4549,'Moments (Synthwave Mix)','Final Fantasy VIII','2026-07-30T10:37:29.476926+00:00','https://www.youtube.com/watch?v=ZD14xyJiOJM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Moments_(Synthwave_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4550,'Cloud Sailing Sky Robots','Rygar','2026-07-29T16:51:20.400634+00:00','https://www.youtube.com/watch?v=js_ue1YrBBw',150,'https://ocrmirror.org/files/music/remixes/Rygar_Cloud_Sailing_Sky_Robots_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4551,'Yoshi Dorifto','Super Mario World','2026-07-29T13:13:49.430960+00:00','https://www.youtube.com/watch?v=ag3AEz4xQUc',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Yoshi_Dorifto_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4552,'Sonic the Chemist','Sonic the Hedgehog 2','2026-07-30T00:53:40.259910+00:00','https://www.youtube.com/watch?v=0i_FYGn6kBg',23,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_2_Sonic_the_Chemist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4553,'Salut Voisin!','Final Fantasy IV','2026-07-30T23:32:34.416984+00:00','https://www.youtube.com/watch?v=6bjFTcmqg1s',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Salut_Voisin_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4554,'Ambient Fusion Water','Metroid Fusion','2026-07-30T04:34:05.145531+00:00','https://www.youtube.com/watch?v=_TswFaRECXc',843,'https://ocrmirror.org/files/music/remixes/Metroid_Fusion_Ambient_Fusion_Water_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4555,'Vivid Orbs','Marble Madness','2026-07-30T00:53:40.981678+00:00','https://www.youtube.com/watch?v=JuVWSdIqMwA',6059,'https://ocrmirror.org/files/music/remixes/Marble_Madness_Vivid_Orbs_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4556,'There''s Something in the Church...','Silent Hill','2026-07-29T20:29:28.068906+00:00','https://www.youtube.com/watch?v=VmtH11iX7RU',62,'https://ocrmirror.org/files/music/remixes/Silent_Hill_There''s_Something_in_the_Church_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4557,'Prayers of the Earth','Final Fantasy VII','2026-07-29T18:31:22.069233+00:00','https://www.youtube.com/watch?v=FoLIwwh80jk',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Prayers_of_the_Earth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4558,'Sunny Side Up','Yoshi''s Island DS','2026-07-29T13:13:49.254031+00:00','https://www.youtube.com/watch?v=pZ2BMNMVqG4',38947,'https://ocrmirror.org/files/music/remixes/Yoshi''s_Island_DS_Sunny_Side_Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4559,'Gusty Garden Galaxy, But It Sounds Like T-Square','Super Mario Galaxy','2026-07-30T10:37:28.940310+00:00','https://www.youtube.com/watch?v=XypxVRNB4BQ',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Gusty_Garden_Galaxy_But_It_Sounds_Like_T-Square_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4560,'Swing Indigo','The Legend of Zelda: Majora''s Mask','2026-07-30T20:01:29.295226+00:00','https://www.youtube.com/watch?v=vuEhyzg3cLI',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Swing_Indigo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4561,'Meditations on a Beam of Light','Minecraft','2026-07-30T13:05:38.144801+00:00','https://www.youtube.com/watch?v=HuqpMvdYY5c',708,'https://ocrmirror.org/files/music/remixes/Minecraft_Meditations_on_a_Beam_of_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4562,'The Glass Tower','Ender Lilies: Quietus of the Knights','2026-07-29T20:29:28.203562+00:00','https://www.youtube.com/watch?v=32xTlF6nGFU',95838,'https://ocrmirror.org/files/music/remixes/Ender_Lilies_The_Glass_Tower_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4563,'I Picked the Wrong Test Subject','Genshin Impact','2026-07-29T15:28:41.413932+00:00','https://www.youtube.com/watch?v=pANpsepuIjU',95846,'https://ocrmirror.org/files/music/remixes/Genshin_Impact_I_Picked_the_Wrong_Test_Subject_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4564,'Existence Still Denied','Final Fantasy VIII','2026-07-31T03:59:39.925014+00:00','https://www.youtube.com/watch?v=jyvray2PTWc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Existence_Still_Denied_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4565,'Witches Be Witches','Final Fantasy VIII','2026-07-30T04:34:06.014958+00:00','https://www.youtube.com/watch?v=OJ5jfzh8h3E',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Witches_Be_Witches_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4566,'Large Hard Man Collider','Mega Man 3','2026-07-29T22:30:48.963718+00:00','https://www.youtube.com/watch?v=0iCkXv42EfY',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Large_Hard_Man_Collider_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4567,'Lament for a Fallen Warrior','Kingdom Hearts','2026-07-29T16:51:19.147954+00:00','https://www.youtube.com/watch?v=DThHgdIoOks',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_Lament_for_a_Fallen_Warrior_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4568,'Remy Is a Rave Dad','Street Fighter III: 3rd Strike: Fight for the Future','2026-07-30T13:05:38.729966+00:00','https://www.youtube.com/watch?v=MC8hB9Wh9Ls',238,'https://ocrmirror.org/files/music/remixes/Street_Fighter_3_3rd_Strike_Remy_Is_a_Rave_Dad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4569,'Ancient Relics','Donkey Kong Country','2026-07-30T20:01:29.838047+00:00','https://www.youtube.com/watch?v=Oo8DwdXp22M',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Ancient_Relics_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4570,'The Art of Zoning Out','Pokémon Scarlet','2026-07-30T17:56:10.480268+00:00','https://www.youtube.com/watch?v=EOtVSs7iJNg',95823,'https://ocrmirror.org/files/music/remixes/Pokemon_Scarlet_The_Art_of_Zoning_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4571,'Kannonball','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-29T21:28:59.151455+00:00','https://www.youtube.com/watch?v=LHDp3Zf-Uio',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Kannonball_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4572,'Heart''s Lullaby','Final Fantasy V','2026-07-29T21:28:58.460685+00:00','https://www.youtube.com/watch?v=hOMiozm85nU',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Heart''s_Lullaby_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4573,'Meister der Magie','Secret of Mana','2026-07-31T03:59:39.566654+00:00','https://www.youtube.com/watch?v=F6EbljUhFro',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_Meister_der_Magie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4574,'We''re All Ali Down Here','RuneScape','2026-07-30T07:54:05.076690+00:00','https://www.youtube.com/watch?v=DYTkuc0Ujqk',25584,'https://ocrmirror.org/files/music/remixes/RuneScape_We''re_All_Ali_Down_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4575,'Tears in Rain','Final Fantasy VIII','2026-07-29T16:51:20.578790+00:00','https://www.youtube.com/watch?v=AP7-rzDTGS4',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Tears_in_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4576,'The Lighthouse','Golden Sun','2026-07-29T15:28:40.195454+00:00','https://www.youtube.com/watch?v=oVOLoIlJ3c4',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lighthouse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4577,'Memories of a Green Shinra','Final Fantasy VII','2026-07-30T00:53:39.797470+00:00','https://www.youtube.com/watch?v=0oCThIplUqw',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Memories_of_a_Green_Shinra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4578,'Dance of the Moth','Dark Souls','2026-07-29T20:29:27.947613+00:00','https://www.youtube.com/watch?v=kCtJ6XV-pOo',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Dance_of_the_Moth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4579,'Valorous Heart, Onward!','Micro Mages','2026-07-29T18:31:21.890878+00:00','https://www.youtube.com/watch?v=R0IHR_MC1ao',95841,'https://ocrmirror.org/files/music/remixes/Micro_Mages_Valorous_Heart_Onward_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4580,'Simmer Down, Sparky!','Sparkster','2026-07-30T04:34:06.190154+00:00','https://www.youtube.com/watch?v=YKTlDnB5kRY',893,'https://ocrmirror.org/files/music/remixes/Sparkster_Simmer_Down_Sparky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4581,'Twin Millennium (Nitrous Mix)','Lotus III: The Ultimate Challenge','2026-07-29T13:13:50.661040+00:00','https://www.youtube.com/watch?v=c0bMjDYazOg',6031,'https://ocrmirror.org/files/music/remixes/Lotus_3_Twin_Millennium_(Nitrous_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4582,'Liquid Puzzles','Baba Is You','2026-07-29T22:30:47.907468+00:00','https://www.youtube.com/watch?v=NldQGwYDdHc',95843,'https://ocrmirror.org/files/music/remixes/Baba_Is_You_Liquid_Puzzles_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4583,'Moonlit Woods','The Legend of Zelda: Breath of the Wild','2026-07-30T15:30:47.964728+00:00','https://www.youtube.com/watch?v=6CNyrcWlqGg',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Moonlit_Woods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4584,'A Secret, Submerged','Final Fantasy VII','2026-07-29T20:29:29.178602+00:00','https://www.youtube.com/watch?v=dotYoI2o_4o',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_A_Secret_Submerged_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4585,'Look at All the Ships!','Pokémon Red Version','2026-07-30T17:56:11.368674+00:00','https://www.youtube.com/watch?v=ljLsCD_xA-Q',508,'https://ocrmirror.org/files/music/remixes/Pokemon_Red_Version_Look_at_All_the_Ships_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4586,'Al Otro Lado del Espejo','Celeste','2026-07-29T21:28:57.941716+00:00','https://www.youtube.com/watch?v=JyRJrvHDn_Y',95636,'https://ocrmirror.org/files/music/remixes/Celeste_Al_Otro_Lado_del_Espejo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4587,'Dear Wielder...','Chicory: A Colorful Tale','2026-07-30T00:53:39.646306+00:00','https://www.youtube.com/watch?v=Aa3aj20YEMg',95833,'https://ocrmirror.org/files/music/remixes/Chicory_Dear_Wielder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4588,'Skipping Stones Down Sips River','Chicory: A Colorful Tale','2026-07-30T10:37:28.403043+00:00','https://www.youtube.com/watch?v=LHBIiyFdWoI',95833,'https://ocrmirror.org/files/music/remixes/Chicory_Skipping_Stones_Down_Sips_River_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4589,'Guns, Glory, Sad Ending','MapleStory','2026-07-30T17:56:10.302062+00:00','https://www.youtube.com/watch?v=hHu6qOIl7pE',766,'https://ocrmirror.org/files/music/remixes/MapleStory_Guns_Glory_Sad_Ending_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4590,'Eternal Rain','Final Fantasy IX','2026-07-30T00:53:39.955575+00:00','https://www.youtube.com/watch?v=6q9y2lQMWpQ',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Eternal_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4591,'Threed, Doomed at Last','EarthBound','2026-07-30T00:53:40.111246+00:00','https://www.youtube.com/watch?v=WcnFsquTjo8',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Threed_Doomed_at_Last_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4592,'Astral Office','Gremlins 2: The New Batch','2026-07-30T04:34:05.492514+00:00','https://www.youtube.com/watch?v=C2rQlFnvzjI',3457,'https://ocrmirror.org/files/music/remixes/Gremlins_2_Astral_Office_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4593,'Strain On You Insane Diamond','Chrono Trigger','2026-07-30T04:34:05.665796+00:00','https://www.youtube.com/watch?v=3LFsaWycgFg',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Strain_On_You_Insane_Diamond_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4594,'Sun and Mist','The Legend of Zelda: Ocarina of Time','2026-07-30T21:42:31.874987+00:00','https://www.youtube.com/watch?v=7trmD-0Ekjc',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Sun_and_Mist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4595,'The Definition of Lunacy','Final Fantasy VIII','2026-07-30T17:56:10.125290+00:00','https://www.youtube.com/watch?v=moa6Z0jkeZ8',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Definition_of_Lunacy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4596,'The Edgerunner with Blazing Hair','Horizon Zero Dawn','2026-07-30T15:30:46.425859+00:00','https://www.youtube.com/watch?v=768g4eZc9XM',95847,'https://ocrmirror.org/files/music/remixes/Horizon_Zero_Dawn_The_Edgerunner_with_Blazing_Hair_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4597,'Troppe Houseland','Mario Kart 64','2026-07-30T10:37:28.581844+00:00','https://www.youtube.com/watch?v=hbrHafDxxlU',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Troppe_Houseland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4598,'Heroes','Monster Hunter','2026-07-30T13:05:38.590101+00:00','https://www.youtube.com/watch?v=Hsqi87sy8nY',10142,'https://ocrmirror.org/files/music/remixes/Monster_Hunter_Heroes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4599,'Level Three (Pulse Mix)','Journey to Silius','2026-07-30T17:56:10.835103+00:00','https://www.youtube.com/watch?v=qxBuVlmUWhM',154,'https://ocrmirror.org/files/music/remixes/Journey_to_Silius_Level_Three_(Pulse_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4600,'Killer Studiopolis Chops','Sonic Mania','2026-07-30T04:34:04.968207+00:00','https://www.youtube.com/watch?v=_uk-Pv5zJOc',95531,'https://ocrmirror.org/files/music/remixes/Sonic_Mania_Killer_Studiopolis_Chops_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4601,'En Garde','Super Smash Bros. Brawl','2026-07-30T15:30:47.615763+00:00','https://www.youtube.com/watch?v=MAcJIuPMEuY',879,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Brawl_En_Garde_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4602,'G.F.S. Jukebox Playlist: Track 1','Metroid Prime 2: Echoes','2026-07-30T15:30:46.739847+00:00','https://www.youtube.com/watch?v=NkBkWTfdsvs',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_GFS_Jukebox_Playlist_Track_1_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4603,'Charred and Cauterized','Parasite Eve','2026-07-30T07:54:05.251780+00:00','https://www.youtube.com/watch?v=dEKy211oyQY',83,'https://ocrmirror.org/files/music/remixes/Parasite_Eve_Charred_and_Cauterized_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4604,'Sieluraiteet','The Legend of Zelda: Spirit Tracks','2026-07-30T00:53:40.840309+00:00','https://www.youtube.com/watch?v=8qgYShTTxuk',57688,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Spirit_Tracks_Sieluraiteet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4605,'Dreaded Mist','Silent Hill','2026-07-29T22:30:48.082648+00:00','https://www.youtube.com/watch?v=jNrLS5tsViA',62,'https://ocrmirror.org/files/music/remixes/Silent_Hill_Dreaded_Mist_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4606,'A Chronicle of Ivalice','Final Fantasy Tactics','2026-07-30T13:05:39.387626+00:00','https://www.youtube.com/watch?v=cfCcSqXebCk',279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Tactics_A_Chronicle_of_Ivalice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4607,'Prismatic','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-30T13:05:39.109249+00:00','https://www.youtube.com/watch?v=-Q9JA-S1i40',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Prismatic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4608,'Compression of Light and Shadow','Final Fantasy VIII','2026-07-29T21:28:58.636080+00:00','https://www.youtube.com/watch?v=OBu9YgH6Xyc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Compression_of_Light_and_Shadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4609,'Birth of Knowledge','Threads of Fate','2026-07-30T04:34:05.318971+00:00','https://www.youtube.com/watch?v=hLzrr7WOswA',519,'https://ocrmirror.org/files/music/remixes/Threads_of_Fate_Birth_of_Knowledge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4610,'See Me Again','Valis III','2026-07-29T20:29:28.328522+00:00','https://www.youtube.com/watch?v=4RdqI11mP4s',174,'https://ocrmirror.org/files/music/remixes/Valis_3_See_Me_Again_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4611,'Set the Stage on Fire','Final Fantasy VIII','2026-07-30T15:30:47.090889+00:00','https://www.youtube.com/watch?v=fLl8Yak3-BE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Set_the_Stage_on_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4612,'Branching Out to Adventure','Ori and the Blind Forest','2026-07-30T10:37:28.760872+00:00','https://www.youtube.com/watch?v=CW8j8hdw4Rk',95825,'https://ocrmirror.org/files/music/remixes/Ori_and_the_Blind_Forest_Branching_Out_to_Adventure_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4613,'La Danza Macabra del Tren de los Muertos','Cuphead','2026-07-30T04:34:06.537210+00:00','https://www.youtube.com/watch?v=ShkSboZrubM',95852,'https://ocrmirror.org/files/music/remixes/Cuphead_La_Danza_Macabra_del_Tren_de_los_Muertos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4614,'Eternal Reverie','Finding Paradise','2026-08-01T19:42:56.826264+00:00','https://www.youtube.com/watch?v=LMhBTiVchF0',95857,'https://ocrmirror.org/files/music/remixes/Finding_Paradise_Eternal_Reverie_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4615,'Scars Worn by Time','Chrono Cross','2026-08-09T17:58:39.485274+00:00','https://www.youtube.com/watch?v=y4917nMz3kE',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Scars_Worn_by_Time_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4616,'The Blue Bomber','Mega Man 3','2026-08-12T19:36:47.211175+00:00','https://www.youtube.com/watch?v=ewcC8KJ1-WM',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_The_Blue_Bomber_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4617,'The Oud, The Santoor, and The Sitar','Dungeonmans','2026-08-12T21:19:27.501468+00:00','https://www.youtube.com/watch?v=Qt8hKhluWrA',971,'https://ocrmirror.org/files/music/remixes/Dungeonmans_The_Oud_The_Santoor_and_The_Sitar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4618,'Moving Out','Undertale','2026-08-15T17:45:25.579876+00:00','https://www.youtube.com/watch?v=iOs_VftZMQ4',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Moving_Out_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4619,'Rib Eye Rodeo','Cuphead','2026-08-15T16:50:12.937784+00:00','https://www.youtube.com/watch?v=ck5Y3cB5A7c',95852,'https://ocrmirror.org/files/music/remixes/Cuphead_Rib_Eye_Rodeo_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4620,'High Clive','Gunman Clive 2','2026-08-15T19:44:41.269601+00:00','https://www.youtube.com/watch?v=iVhVZDJ9xQE',95845,'https://ocrmirror.org/files/music/remixes/Gunman_Clive_2_High_Clive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4621,'Great Fairy''s Tribulation','The Legend of Zelda: Ocarina of Time','2026-08-22T13:09:00.079797+00:00','https://www.youtube.com/watch?v=lbpebJtfM_E',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Great_Fairy''s_Tribulation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4622,'Back to the Sea, Black to the Fire','Xenogears','2026-07-21T14:33:23.602305+00:00','https://www.youtube.com/watch?v=OnvBbnlFVEk',70,'https://ocrmirror.org/files/music/remixes/Xenogears_Back_to_the_Sea_Black_to_the_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4623,'Vigorous Pace','VVVVVV','2026-07-25T01:02:14.179752+00:00','https://www.youtube.com/watch?v=eERYM3GkSm8',662,'https://ocrmirror.org/files/music/remixes/VVVVVV_Vigorous_Pace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4624,'Find the Frozen Flame','Chrono Trigger','2026-08-03T16:01:36.183171+00:00','https://www.youtube.com/watch?v=4zVkrTKSaJQ',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Find_the_Frozen_Flame_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4625,'Electric','Monkey Island 2: LeChuck''s Revenge','2026-08-03T18:16:15.419837+00:00','https://www.youtube.com/watch?v=3KZoJDrZxXE',302,'https://ocrmirror.org/files/music/remixes/Monkey_Island_2_Electric_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4626,'Ghost Touch','Sonic & Knuckles','2026-08-08T07:28:46.662094+00:00','https://www.youtube.com/watch?v=ITYbpc00-l0',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Ghost_Touch_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4627,'An Endless Sleep','Metroid Prime 3: Corruption','2026-08-14T08:44:31.698793+00:00','https://www.youtube.com/watch?v=nmgBEwKFoKw',518,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_3_An_Endless_Sleep_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4628,'Truthful Symphony','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-16T14:49:01.730581+00:00','https://www.youtube.com/watch?v=Auv7V5SPRaE',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Truthful_Symphony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4629,'A Breath of Fresh Air','Mega Man 2','2026-08-18T20:49:44.438374+00:00','https://www.youtube.com/watch?v=z1TSDs0en8o',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_A_Breath_of_Fresh_Air_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4630,'Antipyretic for Your Precipitous Apoplexy','Final Fantasy Tactics','2026-08-21T14:06:04.043376+00:00','https://www.youtube.com/watch?v=r8RfB75lhRE',279,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Tactics_Antipyretic_for_Your_Precipitous_Apoplexy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4631,'Sacred Core','The Legend of Zelda: Tears of the Kingdom','2026-08-22T01:57:05.822453+00:00','https://www.youtube.com/watch?v=mJxr484B7mU',95834,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Tears_of_the_Kingdom_Sacred_Core_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4632,'Mega Jam Disco Network','Mega Man Battle Network','2026-07-24T18:57:24.889211+00:00','https://www.youtube.com/watch?v=yKmDtJZwrLo',873,'https://ocrmirror.org/files/music/remixes/Mega_Man_Battle_Network_Mega_Jam_Disco_Network_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4633,'The Lonely Lover','The Revenge of Shinobi','2026-07-23T10:38:56.542818+00:00','https://www.youtube.com/watch?v=3NPDewZcnX8',82,'https://ocrmirror.org/files/music/remixes/Revenge_of_Shinobi_The_Lonely_Lover_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4634,'Mysterious Woods','The Legend of Zelda: Ocarina of Time','2026-08-02T22:26:53.809135+00:00','https://www.youtube.com/watch?v=ofEd6gvA9yw',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Mysterious_Woods_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4635,'Catacumbas Subterraneas','Turok: Dinosaur Hunter','2026-08-07T17:23:01.631686+00:00','https://www.youtube.com/watch?v=HLpkuhcFp2k',3137,'https://ocrmirror.org/files/music/remixes/Turok_Dinosaur_Hunter_Catacumbas_Subterraneas_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4636,'Black Ice Mire','Metroid Prime 2: Echoes','2026-08-08T02:27:33.528283+00:00','https://www.youtube.com/watch?v=qkg4qoJ5-Wc',482,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_2_Black_Ice_Mire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4637,'Dreams; Nightmares','Final Fantasy VII','2026-08-13T10:35:26.116584+00:00','https://www.youtube.com/watch?v=LY17Fe7QpVI',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Dreams_Nightmares_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4638,'Heads or Tails','Final Fantasy VI','2026-08-16T03:26:12.091738+00:00','https://www.youtube.com/watch?v=KeycYsziFl0',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Heads_or_Tails_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4639,'Phytotoxin','Super Metroid','2026-08-16T02:05:24.209335+00:00','https://www.youtube.com/watch?v=V_mrEe5s8q0',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Phytotoxin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4640,'This Boss Are Sick','Final Fantasy VII','2026-08-21T02:07:16.395075+00:00','https://www.youtube.com/watch?v=XwyHkiI9cis',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_This_Boss_Are_Sick_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4641,'We Are the Winners','Final Fantasy VIII','2026-08-15T21:45:21.039670+00:00','https://www.youtube.com/watch?v=IIgkCyamsZk',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_We_Are_the_Winners_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4642,'Net Fish and Chill','Final Fantasy VIII','2026-08-19T09:03:58.361753+00:00','https://www.youtube.com/watch?v=Y1Z1GTjCmsc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Net_Fish_and_Chill_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4643,'Diablo Has to Synth','Diablo','2026-08-09T04:46:08.676927+00:00','https://www.youtube.com/watch?v=8_eC3UVHb3c',108,'https://ocrmirror.org/files/music/remixes/Diablo_Diablo_Has_to_Synth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4644,'Mechanical Delights (NeverEnding Love Mix)','Final Fantasy IV','2026-08-19T11:50:12.502464+00:00','https://www.youtube.com/watch?v=I1XHzFp8_-k',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Mechanical_Delights_(NeverEnding_Love_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4645,'Into the Horizon','Final Fantasy V','2026-07-31T17:04:15.606940+00:00','https://www.youtube.com/watch?v=mSg345EoSdY',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Into_the_Horizon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4646,'The Parallax Effect','Final Fantasy VI','2026-08-01T07:41:22.570842+00:00','https://www.youtube.com/watch?v=uMPYBCf0NFM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_The_Parallax_Effect_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4647,'Steeling Hearts','Final Fantasy VII','2026-07-21T07:07:13.297880+00:00','https://www.youtube.com/watch?v=xvcz0oYhjGc',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Steeling_Hearts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4648,'Infinite Collapse','Final Fantasy VIII','2026-07-26T07:09:42.862075+00:00','https://www.youtube.com/watch?v=09mH6Q1Pqsg',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Infinite_Collapse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4649,'Freya''s Curse','Final Fantasy IX','2026-07-26T22:30:00.651659+00:00','https://www.youtube.com/watch?v=6eMdtQlJGGs',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Freya''s_Curse_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4650,'Valse di Scholastica','Octopath Traveler','2026-07-29T08:05:45.651499+00:00','https://www.youtube.com/watch?v=cDfDJgDbNEg',95560,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_Valse_di_Scholastica_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4651,'Ancient Dragons','The Legend of Zelda: Tears of the Kingdom','2026-08-01T14:06:17.944308+00:00','https://www.youtube.com/watch?v=Ww3BL8-x63w',95834,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Tears_of_the_Kingdom_Ancient_Dragons_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4652,'Condenado a Las Penas del Infierno','Doom 64','2026-08-07T12:08:29.603489+00:00','https://www.youtube.com/watch?v=YBFpViJmyiU',2956,'https://ocrmirror.org/files/music/remixes/Doom_64_Condenado_a_Las_Penas_del_Infierno_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4653,'Mole Total Destroy','Shovel Knight','2026-08-10T15:29:52.342869+00:00','https://www.youtube.com/watch?v=3NkQDEcVAro',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_Mole_Total_Destroy_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4654,'The World That Was','Bastion','2026-08-10T06:50:56.961332+00:00','https://www.youtube.com/watch?v=NS-Paw7iGpM',837,'https://ocrmirror.org/files/music/remixes/Bastion_The_World_That_Was_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4655,'Tell Me... Why?','Final Fantasy VIII','2026-08-10T05:05:08.088026+00:00','https://www.youtube.com/watch?v=11QWSeJJ52A',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Tell_Me_Why_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4656,'Brinstar Depths (Sin City Mix)','Super Metroid','2026-08-10T05:05:09.474400+00:00','https://www.youtube.com/watch?v=OBUloRmGNH4',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Brinstar_Depths_(Sin_City_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4657,'Photogenic Ghosts','Mystical Ninja Starring Goemon','2026-08-13T23:11:07.384941+00:00','https://www.youtube.com/watch?v=dUDvvWbFgrw',3039,'https://ocrmirror.org/files/music/remixes/Mystical_Ninja_Starring_Goemon_Photogenic_Ghosts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4658,'The True Final Fight!','Pokémon Mystery Dungeon: Explorers of Sky','2026-08-13T23:11:06.859811+00:00','https://www.youtube.com/watch?v=3QGO-3jsJ1A',57617,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Explorers_of_Sky_The_True_Final_Fight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4659,'Twilight Zone','Metroid Prime: Federation Force','2026-08-14T05:13:59.332042+00:00','https://www.youtube.com/watch?v=8qKt1DvTfaE',95784,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Federation_Force_Twilight_Zone_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4660,'In My Mother''s Name','Castlevania II: Simon''s Quest','2026-08-16T08:56:15.117952+00:00','https://www.youtube.com/watch?v=z4ii1AkpEz4',19,'https://ocrmirror.org/files/music/remixes/Castlevania_2_In_My_Mother''s_Name_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4661,'Insidious Hazard','Menace','2026-08-16T22:46:31.837116+00:00','https://www.youtube.com/watch?v=cu_bIZ99_3Q',6081,'https://ocrmirror.org/files/music/remixes/Menace_Insidious_Hazard_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4662,'Underwater Caves','Aquaria','2026-08-19T17:50:04.298797+00:00','https://www.youtube.com/watch?v=q3NEhBd71e8',585,'https://ocrmirror.org/files/music/remixes/Aquaria_Underwater_Caves_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4663,'Jump and Flare','Super Mario Bros. 3','2026-08-22T13:09:00.970565+00:00','https://www.youtube.com/watch?v=niCgiFnI3H0',58,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_3_Jump_and_Flare_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4664,'Raga Koopa','Super Mario 64','2026-08-22T09:50:34.813935+00:00','https://www.youtube.com/watch?v=zVv2cSrV7Oc',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Raga_Koopa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4665,'Flight of the Cosmonauts','Final Fantasy VII','2026-07-23T21:34:26.803904+00:00','https://www.youtube.com/watch?v=d_Dp_yt0-II',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Flight_of_the_Cosmonauts_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4666,'Down Where Evil Dwells (El Hijo del Diablo)','Graffiti Kingdom','2026-07-22T18:41:25.174192+00:00','https://www.youtube.com/watch?v=7cfKKAnr--k',965,'https://ocrmirror.org/files/music/remixes/Graffiti_Kingdom_Down_Where_Evil_Dwells_(El_Hijo_del_Diablo)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4667,'Time Flies','Final Fantasy IV','2026-07-23T21:34:26.102449+00:00','https://www.youtube.com/watch?v=bozQL4K5b88',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Time_Flies_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4668,'To the Sky and the Stars','Child of Light','2026-07-28T10:57:15.611191+00:00','https://www.youtube.com/watch?v=Ce0yq6Dw818',95842,'https://ocrmirror.org/files/music/remixes/Child_of_Light_To_the_Sky_and_the_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4669,'The Healer of Worlds','Star Ocean: The Second Story','2026-07-29T22:30:47.553486+00:00','https://www.youtube.com/watch?v=ImDMBddNkCY',283,'https://ocrmirror.org/files/music/remixes/Star_Ocean_The_Second_Story_The_Healer_of_Worlds_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4670,'Top Gear in Mute City','F-Zero','2026-08-01T19:42:57.699700+00:00','https://www.youtube.com/watch?v=iJYLYde53XI',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Top_Gear_in_Mute_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4671,'The Fountain of Doubt','Octopath Traveler II','2026-08-01T15:36:18.164775+00:00','https://www.youtube.com/watch?v=r8Z9YAZ90ak',95861,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_2_The_Fountain_of_Doubt_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4672,'Forgotten Shrines','Octopath Traveler II','2026-08-05T04:42:19.703023+00:00','https://www.youtube.com/watch?v=wSpmngyTdBQ',95861,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_2_Forgotten_Shrines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4673,'Watery Graves! Majestic Views!','Mario Kart 64','2026-08-07T19:29:02.033093+00:00','https://www.youtube.com/watch?v=Z6NhfD7Og3I',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Watery_Graves_Majestic_Views_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4674,'Until the Very End','Pokémon Mystery Dungeon: Explorers of Sky','2026-08-07T18:11:12.560456+00:00','https://www.youtube.com/watch?v=ePGsAksIzJc',57617,'https://ocrmirror.org/files/music/remixes/Pokemon_Mystery_Dungeon_Explorers_of_Sky_Until_the_Very_End_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4675,'Unseen Realities','The Legend of Zelda: Twilight Princess','2026-08-10T05:05:08.438163+00:00','https://www.youtube.com/watch?v=qJ8uHJ8FHnY',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Unseen_Realities_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4676,'Solace','The Legend of Zelda: Twilight Princess','2026-08-13T10:35:26.481140+00:00','https://www.youtube.com/watch?v=STEKU1bmZ60',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Solace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4677,'Strange Abyss','The Legend of Zelda: Tears of the Kingdom','2026-08-13T08:50:30.852060+00:00','https://www.youtube.com/watch?v=6OqJvl3HsW0',95834,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Tears_of_the_Kingdom_Strange_Abyss_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4678,'Withered and Forgotten','The Legend of Zelda: Majora''s Mask','2026-08-15T20:47:58.697994+00:00','https://www.youtube.com/watch?v=o14DyZJx_oQ',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Withered_and_Forgotten_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4679,'Cucco Feathers','The Legend of Zelda: Ocarina of Time','2026-08-15T19:44:42.009645+00:00','https://www.youtube.com/watch?v=FeXmHPdjkYo',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Cucco_Feathers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4680,'Time Is of the Essence','The Legend of Zelda: Breath of the Wild','2026-08-16T18:55:41.761346+00:00','https://www.youtube.com/watch?v=3x2NM7RwAFg',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Time_Is_of_the_Essence_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4681,'Two Tides (Sin City Mix)','Ecco: The Tides of Time','2026-08-17T16:54:42.630976+00:00','https://www.youtube.com/watch?v=zHeaaPrUpDc',607,'https://ocrmirror.org/files/music/remixes/Ecco_The_Tides_of_Time_Two_Tides_(Sin_City_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4682,'Twin Fire','Streets of Rage','2026-08-18T22:50:57.649003+00:00','https://www.youtube.com/watch?v=yWnfOlw9244',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Twin_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4683,'Upping the Ante','Balatro','2026-08-18T15:56:51.896098+00:00','https://www.youtube.com/watch?v=byQofKiHrLs',95859,'https://ocrmirror.org/files/music/remixes/Balatro_Upping_the_Ante_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4684,'The Slow Pull of the Space Docks','Super Mario 64','2026-08-21T11:52:15.167431+00:00','https://www.youtube.com/watch?v=RRqlfZJrNnI',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_The_Slow_Pull_of_the_Space_Docks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4685,'dataDyne Global HQ','Perfect Dark','2026-08-21T14:06:02.986190+00:00','https://www.youtube.com/watch?v=CGG8llGvbsU',252,'https://ocrmirror.org/files/music/remixes/Perfect_Dark_dataDyne_Global_HQ_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4686,'Focused','Super Hexagon','2026-08-21T13:25:44.334747+00:00','https://www.youtube.com/watch?v=hR_ES_yBmfY',95860,'https://ocrmirror.org/files/music/remixes/Super_Hexagon_Focused_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4687,'BLOOD CONSTRICTION','Super Metroid','2026-07-26T22:29:59.948997+00:00','https://www.youtube.com/watch?v=yYDvwTqTFTI',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_BLOOD_CONSTRICTION_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4688,'Hide & Seek','Luigi''s Mansion','2026-07-26T21:26:17.017038+00:00','https://www.youtube.com/watch?v=3AyD7J_pRco',305,'https://ocrmirror.org/files/music/remixes/Luigi''s_Mansion_Hide_&_Seek_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4689,'Forever Spirit','The Legend of Zelda: Ocarina of Time','2026-07-26T19:43:17.567450+00:00','https://www.youtube.com/watch?v=SOQvr321dJ4',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Forever_Spirit_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4690,'Going Deeper','Castlevania: Aria of Sorrow','2026-08-14T15:21:26.162185+00:00','https://www.youtube.com/watch?v=jRtiouRf_nU',541,'https://ocrmirror.org/files/music/remixes/Castlevania_Aria_of_Sorrow_Going_Deeper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4691,'You''re in the Wilderness Now','RuneScape','2026-08-15T13:51:09.438548+00:00','https://www.youtube.com/watch?v=QtWUWZiq9vg',25584,'https://ocrmirror.org/files/music/remixes/RuneScape_You''re_in_the_Wilderness_Now_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4692,'Goldscourge','Elden Ring','2026-07-26T07:09:42.332535+00:00','https://www.youtube.com/watch?v=mQsMxEV0Zq8',95869,'https://ocrmirror.org/files/music/remixes/Elden_Ring_Goldscourge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4693,'The Chill of the Rain','Mega Man ZX','2026-08-02T01:08:30.998256+00:00','https://www.youtube.com/watch?v=wqi1iTb2SyE',580,'https://ocrmirror.org/files/music/remixes/Mega_Man_ZX_The_Chill_of_the_Rain_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4694,'Standard of Light','Final Fantasy V','2026-08-06T13:09:22.061851+00:00','https://www.youtube.com/watch?v=0STvya0wqd4',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Standard_of_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4695,'Mission Final','Metroid Prime','2026-08-07T11:21:34.653546+00:00','https://www.youtube.com/watch?v=_eaIuoQ4LRE',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Mission_Final_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4696,'FATE has no forgiveness for those who dare stand against it...','Chrono Cross','2026-08-08T13:26:18.354226+00:00','https://www.youtube.com/watch?v=L0DZBr4jy3U',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_FATE_has_no_forgiveness_for_those_who_dare_stand_against_it_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4697,'Fate of a Goddess','The Legend of Zelda: Oracle of Ages','2026-08-09T13:30:19.962760+00:00','https://www.youtube.com/watch?v=8nhMpL-swHc',456,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Oracle_of_Ages_Fate_of_a_Goddess_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4698,'Rain in Winter','NieR','2026-08-11T04:48:56.247776+00:00','https://www.youtube.com/watch?v=1XSkTMK7evw',758,'https://ocrmirror.org/files/music/remixes/NieR_Rain_in_Winter_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4699,'N•E•O','Crash Bandicoot N. Sane Trilogy','2026-08-07T18:11:14.135920+00:00','https://www.youtube.com/watch?v=5fhyT-X7uGw',95867,'https://ocrmirror.org/files/music/remixes/Crash_Bandicoot_N_Sane_Trilogy_NEO_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4700,'On the Shoulders of Giants','Shadow of the Colossus','2026-08-09T17:58:38.975064+00:00','https://www.youtube.com/watch?v=-ejtXrhdq7o',502,'https://ocrmirror.org/files/music/remixes/Shadow_of_the_Colossus_On_the_Shoulders_of_Giants_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4701,'Don''t Leave Me','Final Fantasy IV','2026-07-25T14:09:20.973823+00:00','https://www.youtube.com/watch?v=mTes2fvMWTY',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Don''t_Leave_Me_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4702,'Cristal Galáctico','Bravely Second: End Layer','2026-07-27T17:17:30.524222+00:00','https://www.youtube.com/watch?v=9gvc7nxKJRA',95865,'https://ocrmirror.org/files/music/remixes/Bravely_Second_Cristal_Galactico_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4703,'You Can Always Come Back Here','Undertale','2026-07-30T10:37:28.224336+00:00','https://www.youtube.com/watch?v=BzyRC0iz9q0',95077,'https://ocrmirror.org/files/music/remixes/Undertale_You_Can_Always_Come_Back_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4704,'Battle Against a Sponge','Mega Man X2','2026-08-01T23:29:14.734015+00:00','https://www.youtube.com/watch?v=t1c6LJf4Lzw',412,'https://ocrmirror.org/files/music/remixes/Mega_Man_X2_Battle_Against_a_Sponge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4705,'Berdly Unleashed','Deltarune','2026-08-04T03:48:01.348655+00:00','https://www.youtube.com/watch?v=Na-j5sVa934',95557,'https://ocrmirror.org/files/music/remixes/Deltarune_Berdly_Unleashed_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4706,'Fear of a Blank Deathcard','Inscryption','2026-08-07T06:46:02.582915+00:00','https://www.youtube.com/watch?v=TlqCICawxy4',95873,'https://ocrmirror.org/files/music/remixes/Inscryption_Fear_of_a_Blank_Deathcard_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4707,'Home Sweet Home','The Legend of Zelda: The Wind Waker','2026-08-06T13:09:23.487935+00:00','https://www.youtube.com/watch?v=Gv7UjL68lXs',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Home_Sweet_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4708,'Howling and Hollow','Final Fantasy VII Remake','2026-08-09T15:57:29.453331+00:00','https://www.youtube.com/watch?v=jY0LFr-SZu8',95829,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Remake_Howling_and_Hollow_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4709,'Legendary Depths','The Legend of Zelda: Ocarina of Time','2026-08-11T00:00:15.436590+00:00','https://www.youtube.com/watch?v=9eAIuPFvn5E',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Legendary_Depths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4710,'Big Apple Bass','Teenage Mutant Ninja Turtles IV: Turtles in Time','2026-08-12T06:52:48.599955+00:00','https://www.youtube.com/watch?v=3Gb-NCQhy44',421,'https://ocrmirror.org/files/music/remixes/Teenage_Mutant_Ninja_Turtles_4_Big_Apple_Bass_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4711,'Flying High','Aleste 2','2026-08-13T22:10:26.817698+00:00','https://www.youtube.com/watch?v=Rd2vru78-QY',3565,'https://ocrmirror.org/files/music/remixes/Aleste_2_Flying_High_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4712,'Cosmic Contemplation','Mass Effect','2026-08-15T09:49:30.839328+00:00','https://www.youtube.com/watch?v=r5YrQqunO2I',619,'https://ocrmirror.org/files/music/remixes/Mass_Effect_Cosmic_Contemplation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4713,'Stuck in My Head','Touhou Fuujinroku: Mountain of Faith','2026-08-15T10:48:20.108091+00:00','https://www.youtube.com/watch?v=IgTo9lM7RGM',51885,'https://ocrmirror.org/files/music/remixes/Touhou_Fuujinroku_Mountain_of_Faith_Stuck_in_My_Head_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4714,'Smoke & Marbles','Castlevania: Symphony of the Night','2026-08-16T11:44:55.146089+00:00','https://www.youtube.com/watch?v=zk-5uGKPurk',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Smoke_&_Marbles_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4715,'From the Edge of Defeat','Secret of Mana','2026-08-17T20:53:40.177621+00:00','https://www.youtube.com/watch?v=p_6p89Pqs_4',61,'https://ocrmirror.org/files/music/remixes/Secret_of_Mana_From_the_Edge_of_Defeat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4716,'Stunt Course on Easy Street','Paperboy 2','2026-08-18T15:01:09.612324+00:00','https://www.youtube.com/watch?v=8g8A6KlJ610',11251,'https://ocrmirror.org/files/music/remixes/Paperboy_2_Stunt_Course_on_Easy_Street_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4717,'Just Like an Eagle','Shovel Knight','2026-08-19T21:50:34.602751+00:00','https://www.youtube.com/watch?v=I5qhtCEZyWI',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_Just_Like_an_Eagle_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4718,'Banjo''s Signature Bar','Banjo-Kazooie','2026-08-21T23:48:38.342028+00:00','https://www.youtube.com/watch?v=LtpRDbVTOqI',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_Banjo''s_Signature_Bar_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4719,'Love Thaws the Heart','The Legend of Zelda: A Link Between Worlds','2026-07-21T22:27:00.901997+00:00','https://www.youtube.com/watch?v=0pWu5h_MVik',94860,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_Between_Worlds_Love_Thaws_the_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4720,'Tangerines for Moose','Earthworm Jim 2','2026-07-24T04:47:20.340487+00:00','https://www.youtube.com/watch?v=-mXRW6a8qcc',189,'https://ocrmirror.org/files/music/remixes/Earthworm_Jim_2_Tangerines_for_Moose_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4721,'Red Harvest','Super Metroid','2026-07-24T12:57:19.105372+00:00','https://www.youtube.com/watch?v=5A2yLuhRniE',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Red_Harvest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4722,'Bonhomme de Neige','EarthBound','2026-07-29T20:29:28.736870+00:00','https://www.youtube.com/watch?v=0cLwT-vcMno',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Bonhomme_de_Neige_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4723,'Think on Your Feet','Brain Age: Train Your Brain in Minutes a Day!','2026-08-10T13:55:02.659965+00:00','https://www.youtube.com/watch?v=JDa7fj5AjgM',38763,'https://ocrmirror.org/files/music/remixes/Brain_Age_Think_on_Your_Feet_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4724,'Wish You Were Here (Live from Balamb Garden)','Final Fantasy VIII','2026-08-17T02:03:43.921445+00:00','https://www.youtube.com/watch?v=AlhmDHUjacc',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Wish_You_Were_Here_(Live_from_Balamb_Garden)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4725,'Cybernetic Skullstorm','Mega Man 3','2026-08-18T01:57:01.183238+00:00','https://www.youtube.com/watch?v=aLoOMdKBb00',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Cybernetic_Skullstorm_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4726,'Parasol to the Stars','Kirby''s Adventure','2026-08-18T03:22:14.214849+00:00','https://www.youtube.com/watch?v=tN66GEL49cc',442,'https://ocrmirror.org/files/music/remixes/Kirby''s_Adventure_Parasol_to_the_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4727,'Beyond the Shores','Final Fantasy VIII','2026-08-19T04:07:07.381856+00:00','https://www.youtube.com/watch?v=kWlYvE7MyIY',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Beyond_the_Shores_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4728,'The Sorceress''s Knight','Final Fantasy VIII','2026-08-19T02:00:24.407384+00:00','https://www.youtube.com/watch?v=arLJU66CeFE',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Sorceress''s_Knight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4729,'Sportsball','Wii Sports','2026-08-20T10:56:44.932636+00:00','https://www.youtube.com/watch?v=5amEfBlrsmM',45424,'https://ocrmirror.org/files/music/remixes/Wii_Sports_Sportsball_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4730,'Funky Mountain Peaks','Kirby''s Dream Course','2026-08-21T17:00:43.075598+00:00','https://www.youtube.com/watch?v=Ja7Oq-IfPXQ',11120,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Course_Funky_Mountain_Peaks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4731,'Ambience of the Forest','Chrono Trigger','2026-08-22T17:46:12.921768+00:00','https://www.youtube.com/watch?v=JOeHEgD47rA',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Ambience_of_the_Forest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4732,'Gold Soul','Pokémon SoulSilver Version','2026-07-23T17:54:21.853642+00:00','https://www.youtube.com/watch?v=kUm1NemzkV8',57748,'https://ocrmirror.org/files/music/remixes/Pokemon_SoulSilver_Version_Gold_Soul_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4733,'Ashes in the Snow Man','EarthBound','2026-07-25T04:42:57.046211+00:00','https://www.youtube.com/watch?v=qBnx0O5F65s',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Ashes_in_the_Snow_Man_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4734,'Eggerland Swagger','Eggerland Mystery','2026-07-27T22:33:18.445741+00:00','https://www.youtube.com/watch?v=z25j2dyMdtc',3738,'https://ocrmirror.org/files/music/remixes/Eggerland_Mystery_Eggerland_Swagger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4735,'DIABLO ALADO','Metroid Fusion','2026-07-30T13:05:38.447533+00:00','https://www.youtube.com/watch?v=D1onQRPMTuM',843,'https://ocrmirror.org/files/music/remixes/Metroid_Fusion_DIABLO_ALADO_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4736,'Guided to the Infinite','The Legend of Zelda: Breath of the Wild','2026-07-30T15:30:47.440136+00:00','https://www.youtube.com/watch?v=xPhg9kGLYcM',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Guided_to_the_Infinite_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4737,'Hydraulic Beat','Streets of Rage','2026-08-02T22:26:53.985786+00:00','https://www.youtube.com/watch?v=125d5rBSedk',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_Hydraulic_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4738,'Chozodynamic','Metroid Prime','2026-08-15T10:48:19.797476+00:00','https://www.youtube.com/watch?v=sy33fPy4g90',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Chozodynamic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4739,'When the Moon Shines','Flowstone Saga','2026-08-14T23:47:27.493903+00:00','https://www.youtube.com/watch?v=eneJXtKd_IA',95858,'https://ocrmirror.org/files/music/remixes/Flowstone_Saga_When_the_Moon_Shines_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4740,'Ruins of the Future','Flowstone Saga','2026-08-14T22:49:20.805894+00:00','https://www.youtube.com/watch?v=ifIpnFR5hDU',95858,'https://ocrmirror.org/files/music/remixes/Flowstone_Saga_Ruins_of_the_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4741,'Hanagasumi ~ A Mist of White Upon the Lake','Flowstone Saga','2026-08-15T04:03:22.991185+00:00','https://www.youtube.com/watch?v=WOohyP--2ts',95858,'https://ocrmirror.org/files/music/remixes/Flowstone_Saga_Hanagasumi_A_Mist_of_White_Upon_the_Lake_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4742,'Pocket Arcade','Pokémon Pinball','2026-07-27T18:55:13.502133+00:00','https://www.youtube.com/watch?v=gHsUgOczyK0',40407,'https://ocrmirror.org/files/music/remixes/Pokemon_Pinball_Pocket_Arcade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4743,'With a Little Help from My Friends','Super Smash Bros. Brawl','2026-08-14T10:32:09.675715+00:00','https://www.youtube.com/watch?v=M9yzz_QkbAs',879,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Brawl_With_a_Little_Help_from_My_Friends_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4744,'Reincarnation on Otherside','Silent Hill','2026-08-08T14:06:22.411331+00:00','https://www.youtube.com/watch?v=aCcFFE-Lt6A',62,'https://ocrmirror.org/files/music/remixes/Silent_Hill_Reincarnation_on_Otherside_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4745,'Broken Reflection','Silent Hill 2','2026-08-08T11:00:18.539322+00:00','https://www.youtube.com/watch?v=w2BfMP7WO6E',63,'https://ocrmirror.org/files/music/remixes/Silent_Hill_2_Broken_Reflection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4746,'ETERNAL PARADISE','Silent Hill 3','2026-08-08T10:02:35.773834+00:00','https://www.youtube.com/watch?v=LDjqDLIGBTM',10484,'https://ocrmirror.org/files/music/remixes/Silent_Hill_3_ETERNAL_PARADISE_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4747,'There Are No Angels Here Anymore','Silent Hill 4: The Room','2026-08-08T17:02:10.588523+00:00','https://www.youtube.com/watch?v=8DRHiE4Xho4',854,'https://ocrmirror.org/files/music/remixes/Silent_Hill_4_There_Are_No_Angels_Here_Anymore_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4748,'Apparitions','Super Mario World','2026-08-11T02:34:30.238062+00:00','https://www.youtube.com/watch?v=WEEPj32VBFY',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Apparitions_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4749,'Mind Lost in a Program','Kirby: Planet Robobot','2026-08-11T07:46:07.084304+00:00','https://www.youtube.com/watch?v=I_iWv1fjs18',95162,'https://ocrmirror.org/files/music/remixes/Kirby_Planet_Robobot_Mind_Lost_in_a_Program_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4750,'Life Is Peachy','Super Mario Bros.','2026-08-11T09:30:51.318446+00:00','https://www.youtube.com/watch?v=pSV_OlNSLKQ',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_Life_Is_Peachy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4751,'Anachronistic Axes','Dynasty Warriors 3','2026-08-05T10:59:41.207497+00:00','https://www.youtube.com/watch?v=juxs4Y6oLBs',9705,'https://ocrmirror.org/files/music/remixes/Dynasty_Warriors_3_Anachronistic_Axes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4752,'A Translator''s Tale','Dragon Warrior','2026-07-23T01:00:26.902384+00:00','https://www.youtube.com/watch?v=ZoKlAcReFa0',49,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_A_Translator''s_Tale_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4753,'Gimme Back My Cat','Lyle in Cube Sector','2026-07-24T17:04:21.066328+00:00','https://www.youtube.com/watch?v=M1FRHssy7Gs',95822,'https://ocrmirror.org/files/music/remixes/Lyle_in_Cube_Sector_Gimme_Back_My_Cat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4754,'Lost Orphan','Chrono Cross','2026-07-26T23:32:09.183136+00:00','https://www.youtube.com/watch?v=XQgPHAHGYPs',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_Lost_Orphan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4755,'Sumo Swagger','Aah! Harimanada','2026-07-29T18:31:20.986262+00:00','https://www.youtube.com/watch?v=5ZLtrOxinuI',47578,'https://ocrmirror.org/files/music/remixes/Aah_Harimanada_Sumo_Swagger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4756,'Infinite Starship Sausage Journey','Skitchin''','2026-07-31T17:04:13.968310+00:00','https://www.youtube.com/watch?v=rDK27cDV-lE',6662,'https://ocrmirror.org/files/music/remixes/Skitchin''_Infinite_Starship_Sausage_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4757,'Corridors of TimeShift','Chrono Trigger','2026-08-11T16:26:36.127644+00:00','https://www.youtube.com/watch?v=uHiIeiLFR1U',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Corridors_of_TimeShift_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4758,'Gallery of Mysteries','Castlevania: Symphony of the Night','2026-08-14T19:28:53.708540+00:00','https://www.youtube.com/watch?v=MZp5QUeOtw0',105,'https://ocrmirror.org/files/music/remixes/Castlevania_Symphony_of_the_Night_Gallery_of_Mysteries_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4759,'Flashback from the Future','Flashback','2026-08-18T05:01:47.528499+00:00','https://www.youtube.com/watch?v=CSwmJPfknms',5615,'https://ocrmirror.org/files/music/remixes/Flashback_Flashback_from_the_Future_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4760,'The Shrine of Twisted Shadows','Lufia II: Rise of the Sinistrals','2026-07-27T08:00:44.203456+00:00','https://www.youtube.com/watch?v=AEurRvwusu8',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_The_Shrine_of_Twisted_Shadows_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4761,'A Little Bit of Mercy','Undertale','2026-07-27T18:55:13.677208+00:00','https://www.youtube.com/watch?v=VX1Ku5EvvaI',95077,'https://ocrmirror.org/files/music/remixes/Undertale_A_Little_Bit_of_Mercy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4762,'Spacious Beauty','Pokémon Crystal Version','2026-08-09T07:31:59.059812+00:00','https://www.youtube.com/watch?v=ogv5ab1TV3o',573,'https://ocrmirror.org/files/music/remixes/Pokemon_Crystal_Version_Spacious_Beauty_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4763,'They Say Lightning Never Strikes 200 Times','Final Fantasy X','2026-08-10T13:55:01.413712+00:00','https://www.youtube.com/watch?v=RHtbxCrSqTc',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_They_Say_Lightning_Never_Strikes_200_Times_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4764,'Dragonborn Symphony','The Elder Scrolls V: Skyrim','2026-08-10T12:07:47.786694+00:00','https://www.youtube.com/watch?v=EnC7oec9-5Y',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Dragonborn_Symphony_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4765,'Mysterious Forest: Witch''s Strut','The Legend of Zelda: Link''s Awakening','2026-08-11T22:11:24.041956+00:00','https://www.youtube.com/watch?v=psVahj731GM',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Mysterious_Forest_Witch''s_Strut_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4766,'Dawn of the Chosen','Final Fantasy V','2026-08-12T00:06:33.543009+00:00','https://www.youtube.com/watch?v=nfIQDk3O2XQ',12,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_5_Dawn_of_the_Chosen_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4767,'Down','The Legend of Zelda: Tears of the Kingdom','2026-08-15T03:11:41.424507+00:00','https://www.youtube.com/watch?v=ikPRJ_RShZ4',95834,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Tears_of_the_Kingdom_Down_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4768,'Frozen Light','Final Fantasy VI','2026-08-16T04:07:48.495526+00:00','https://www.youtube.com/watch?v=ndQ6ZFIMhpY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Frozen_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4769,'Sunshine Coaster','Sonic Heroes','2026-08-09T09:11:07.283423+00:00','https://www.youtube.com/watch?v=QcQti_FguBs',654,'https://ocrmirror.org/files/music/remixes/Sonic_Heroes_Sunshine_Coaster_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4770,'{This Title Intentionally Left Blank}','Signalis','2026-08-17T13:20:47.951726+00:00','https://www.youtube.com/watch?v=RObRg2oQD-8',95868,'https://ocrmirror.org/files/music/remixes/Signalis_This_Title_Intentionally_Left_Blank_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4771,'Livin'' Out Our Last Days','Metroid Prime','2026-08-17T14:01:12.724563+00:00','https://www.youtube.com/watch?v=RYmhx8_BCN4',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Livin''_Out_Our_Last_Days_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4772,'Road Rage','Mach Rider','2026-07-23T23:27:52.372348+00:00','https://www.youtube.com/watch?v=gMWbsag4Zq0',285,'https://ocrmirror.org/files/music/remixes/Mach_Rider_Road_Rage_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4773,'About to Turn It All Around!','Phoenix Wright: Ace Attorney','2026-08-15T10:48:19.952426+00:00','https://www.youtube.com/watch?v=YVm8ikWcoYs',493,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_About_to_Turn_It_All_Around_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4774,'Thunderbird Rising','Genshin Impact','2026-08-15T07:06:09.058262+00:00','https://www.youtube.com/watch?v=Ol1tXZJ19GU',95846,'https://ocrmirror.org/files/music/remixes/Genshin_Impact_Thunderbird_Rising_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4775,'Digital Saṃsāra','Genshin Impact','2026-08-17T10:56:22.513877+00:00','https://www.youtube.com/watch?v=DMkgn-hDfpc',95846,'https://ocrmirror.org/files/music/remixes/Genshin_Impact_Digital_Samsara_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4776,'World of Pink','Kirby and the Forgotten Land','2026-08-17T14:01:13.074893+00:00','https://www.youtube.com/watch?v=KYUOsbMcBH8',95866,'https://ocrmirror.org/files/music/remixes/Kirby_and_the_Forgotten_Land_World_of_Pink_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4777,'A View from the Top (of Shinra HQ)','Final Fantasy VII Remake','2026-08-19T19:49:35.753260+00:00','https://www.youtube.com/watch?v=3xoFiJXkCdw',95829,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Remake_A_View_from_the_Top_(of_Shinra_HQ)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4778,'Hyōryū Kioku','Final Fantasy VIII','2026-08-20T17:55:50.351651+00:00','https://www.youtube.com/watch?v=cV3h8PKrvYM',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Hyoryu_Kioku_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4779,'Terra Calls','Final Fantasy IX','2026-08-21T15:58:39.811741+00:00','https://www.youtube.com/watch?v=aePwHyLrapw',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Terra_Calls_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4780,'Lo-fi Musashi','Shinobi','2026-07-20T23:33:19.790727+00:00','https://www.youtube.com/watch?v=fsGQaPHabeM',666,'https://ocrmirror.org/files/music/remixes/Shinobi_Lo-fi_Musashi_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4781,'Zombie Chicken','Contra: Hard Corps','2026-07-23T10:38:56.363617+00:00','https://www.youtube.com/watch?v=F6Z7vz-FhtU',6309,'https://ocrmirror.org/files/music/remixes/Contra_Hard_Corps_Zombie_Chicken_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4782,'You Can''t Just Shoot a Hole into the Surface of Zebes','Super Metroid','2026-07-29T04:46:19.337008+00:00','https://www.youtube.com/watch?v=Ohs4jNrfui8',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_You_Can''t_Just_Shoot_a_Hole_into_the_Surface_of_Zebes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4783,'No Eraser, 10B Only, Final Destination!','Pictionary','2026-07-28T00:54:35.719909+00:00','https://www.youtube.com/watch?v=XE6TcoHZTeY',492,'https://ocrmirror.org/files/music/remixes/Pictionary_No_Eraser_10B_Only_Final_Destination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4784,'Furry Beat','Bubsy in: Claws Encounters of the Furred Kind','2026-08-01T21:25:07.240552+00:00','https://www.youtube.com/watch?v=Wgh4MnFXzq8',10903,'https://ocrmirror.org/files/music/remixes/Bubsy_in_Claws_Encounters_of_the_Furred_Kind_Furry_Beat_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4785,'Big Earl Funk','ToeJam & Earl','2026-08-04T10:09:34.130847+00:00','https://www.youtube.com/watch?v=aULGg8wLknE',99,'https://ocrmirror.org/files/music/remixes/ToeJam_&_Earl_Big_Earl_Funk_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4786,'A God from the Machine','Super Metroid','2026-08-07T05:16:18.936459+00:00','https://www.youtube.com/watch?v=VZ2ji6SYnWE',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_A_God_from_the_Machine_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4787,'Lord Gwyn''s Age of Fire','Dark Souls','2026-08-09T02:34:46.230910+00:00','https://www.youtube.com/watch?v=fW_j10gATsk',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Lord_Gwyn''s_Age_of_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4788,'Zelda''s Daydream','The Legend of Zelda: Ocarina of Time','2026-08-09T02:34:46.052229+00:00','https://www.youtube.com/watch?v=15liwW-Fssc',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_Zelda''s_Daydream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4789,'Að leggja höfuðið í bleyti (Lay Your Head in the Water)','Chicory: A Colorful Tale','2026-08-09T04:46:10.065265+00:00','https://www.youtube.com/watch?v=baHOhWrjoME',95833,'https://ocrmirror.org/files/music/remixes/Chicory_Ao_leggja_hofuoio_i_bleyti_(Lay_Your_Head_in_the_Water)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4790,'Leave Me Behind','Celeste','2026-08-10T21:12:00.839943+00:00','https://www.youtube.com/watch?v=1-hHPxgwn5g',95636,'https://ocrmirror.org/files/music/remixes/Celeste_Leave_Me_Behind_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4791,'The Heart of Atlantis','Castlevania: Aria of Sorrow','2026-08-12T10:34:03.486447+00:00','https://www.youtube.com/watch?v=2vj1r5J3vl4',541,'https://ocrmirror.org/files/music/remixes/Castlevania_Aria_of_Sorrow_The_Heart_of_Atlantis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4792,'War Eternal','Final Fantasy XIV','2026-08-15T07:06:10.478584+00:00','https://www.youtube.com/watch?v=v4u-ZYzowzI',95839,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_14_War_Eternal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4793,'Solid','Metal Gear Solid','2026-08-16T10:48:39.015261+00:00','https://www.youtube.com/watch?v=aTEIjWXxc1I',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_Solid_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4794,'10 Years','EarthBound','2026-08-16T05:53:19.648712+00:00','https://www.youtube.com/watch?v=0Xrd4xRq7rM',51,'https://ocrmirror.org/files/music/remixes/EarthBound_10_Years_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4795,'Astral Projection','Globulous','2026-08-18T10:55:16.152924+00:00','https://www.youtube.com/watch?v=ifflZLPaUJM',95862,'https://ocrmirror.org/files/music/remixes/Globulous_Astral_Projection_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4796,'Circles in the Sand','Golden Sun','2026-08-18T17:53:55.144236+00:00','https://www.youtube.com/watch?v=2h3nrnHH0yk',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Circles_in_the_Sand_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4797,'To Be Forgotten','Final Fantasy IX','2026-08-19T13:24:37.467806+00:00','https://www.youtube.com/watch?v=-mDHK-HBCAk',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_To_Be_Forgotten_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4798,'Get Down with Your Bad Self, Mr. Saturn!','EarthBound','2026-08-19T16:55:26.468826+00:00','https://www.youtube.com/watch?v=S-oEDuuBsIM',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Get_Down_with_Your_Bad_Self_Mr_Saturn_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4799,'Implements of War','Final Fantasy VI','2026-08-19T15:57:11.201371+00:00','https://www.youtube.com/watch?v=9-4nJYFdpXY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Implements_of_War_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4800,'Riparian Rhythms','The Legend of Zelda: Twilight Princess','2026-08-19T15:01:26.710983+00:00','https://www.youtube.com/watch?v=PDJtKCZH2fk',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Riparian_Rhythms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4801,'Fountain of Youth','The Legend of Zelda: Link''s Awakening','2026-08-19T19:02:13.576389+00:00','https://www.youtube.com/watch?v=JHIMBDsJotk',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Fountain_of_Youth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4802,'Chrono Hopper','Ultimate Paintball Challenge','2026-08-21T08:04:54.115591+00:00','https://www.youtube.com/watch?v=G88yHrj2h_I',95874,'https://ocrmirror.org/files/music/remixes/Ultimate_Paintball_Challenge_Chrono_Hopper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4803,'Dancing with the Wind','Super Mario Galaxy','2026-08-21T15:03:07.603571+00:00','https://www.youtube.com/watch?v=fWuISMO5RlM',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_Dancing_with_the_Wind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4804,'A Synonym for Death','Chrono Cross','2026-08-22T09:50:35.161669+00:00','https://www.youtube.com/watch?v=CtkNYKyZfoI',17,'https://ocrmirror.org/files/music/remixes/Chrono_Cross_A_Synonym_for_Death_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4805,'Eschala Them','Chrono Trigger','2026-08-22T04:59:14.396140+00:00','https://www.youtube.com/watch?v=ez2DKdvtJc8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Eschala_Them_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4806,'Skylands','Chrono Trigger','2026-08-22T07:08:58.292146+00:00','https://www.youtube.com/watch?v=sCITgsLgU-Y',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Skylands_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4807,'Whispers of Ash','Jazz Jackrabbit 2','2026-07-25T14:09:21.675829+00:00','https://www.youtube.com/watch?v=H7e1ddywFgM',506,'https://ocrmirror.org/files/music/remixes/Jazz_Jackrabbit_2_Whispers_of_Ash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4808,'Waterfall (Sin City Mix)','Undertale','2026-07-28T10:57:15.255376+00:00','https://www.youtube.com/watch?v=e5uWTDiwgSQ',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Waterfall_(Sin_City_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4809,'Remachination','Super Mario RPG: Legend of the Seven Stars','2026-07-30T07:54:04.902381+00:00','https://www.youtube.com/watch?v=jpcrGnhlRFg',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Remachination_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4810,'Spiral Deepens','GoldenEye 007','2026-08-01T17:32:33.931483+00:00','https://www.youtube.com/watch?v=ckazFBC6CfU',120,'https://ocrmirror.org/files/music/remixes/GoldenEye_007_Spiral_Deepens_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4811,'Cave Diving','Spelunker','2026-08-04T22:35:27.225398+00:00','https://www.youtube.com/watch?v=6vPM40UU77w',4440,'https://ocrmirror.org/files/music/remixes/Spelunker_Cave_Diving_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4812,'Zelda by Lamplight','The Legend of Zelda','2026-08-07T05:16:19.464672+00:00','https://www.youtube.com/watch?v=xAF7PB3YJcY',64,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Zelda_by_Lamplight_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4813,'Bard in the Rain','The Legend of Zelda: Breath of the Wild','2026-08-07T00:23:36.496680+00:00','https://www.youtube.com/watch?v=NMVPQLV3KZY',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Bard_in_the_Rain_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4814,'Omnia in Dubium Voca','Phoenix Wright: Ace Attorney - Justice for All','2026-08-09T15:00:47.743688+00:00','https://www.youtube.com/watch?v=MeIyplp67K0',38867,'https://ocrmirror.org/files/music/remixes/Phoenix_Wright_Ace_Attorney_Justice_for_All_Omnia_in_Dubium_Voca_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4815,'No More Games Now!','The Great Ace Attorney 2: Resolve','2026-08-10T20:10:12.089784+00:00','https://www.youtube.com/watch?v=XlkzodxRqOU',95876,'https://ocrmirror.org/files/music/remixes/Great_Ace_Attorney_2_No_More_Games_Now_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4816,'Bringer of Ruin','Final Fantasy VI','2026-08-10T22:06:35.944741+00:00','https://www.youtube.com/watch?v=6a0JCC0o4dQ',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Bringer_of_Ruin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4817,'Quiet Wish','Final Fantasy VII','2026-08-10T19:30:04.987947+00:00','https://www.youtube.com/watch?v=4OA1d4g9BeA',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Quiet_Wish_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4818,'Adrift Eternal','Metroid Prime','2026-08-12T15:28:26.406937+00:00','https://www.youtube.com/watch?v=z7TQvvqP2YU',425,'https://ocrmirror.org/files/music/remixes/Metroid_Prime_Adrift_Eternal_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4819,'Infected Waters','Super Metroid','2026-08-14T05:13:58.814235+00:00','https://www.youtube.com/watch?v=Zv-5lx2VoeI',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Infected_Waters_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4820,'Dark Toxin','Doom','2026-08-15T04:56:34.628723+00:00','https://www.youtube.com/watch?v=p5L2ROOkBZo',14512,'https://ocrmirror.org/files/music/remixes/Doom_Dark_Toxin_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4821,'Fight or Flight','Bloodborne','2026-08-17T10:04:40.145960+00:00','https://www.youtube.com/watch?v=4EcqSTsuRT4',95152,'https://ocrmirror.org/files/music/remixes/Bloodborne_Fight_or_Flight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4822,'Witchcraft','Banjo-Kazooie','2026-08-18T09:57:26.313707+00:00','https://www.youtube.com/watch?v=MOnO8h062Nc',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_Witchcraft_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4823,'Flashback','Final Fantasy VIII','2026-08-19T13:24:38.927504+00:00','https://www.youtube.com/watch?v=E2eP12GuIjs',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_Flashback_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4824,'Still More Sailing','Ys II: Ancient Ys Vanished - The Final Chapter','2026-08-20T15:58:32.960143+00:00','https://www.youtube.com/watch?v=G-uN8I4XL78',40166,'https://ocrmirror.org/files/music/remixes/Ys_2_Still_More_Sailing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4825,'Batallia Ruins','Final Fantasy XI Online','2026-08-21T14:06:02.451985+00:00','https://www.youtube.com/watch?v=qQD7ZL9jAEs',546,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_11_Online_Batallia_Ruins_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4826,'The Darkening Sky','Metal Gear 2: Solid Snake','2026-08-22T15:46:01.465842+00:00','https://www.youtube.com/watch?v=f8K_zOyws2M',763,'https://ocrmirror.org/files/music/remixes/Metal_Gear_2_The_Darkening_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4827,'Soul''s Mission','The Legend of Zelda: A Link to the Past','2026-07-22T01:00:05.548809+00:00','https://www.youtube.com/watch?v=V1XU6PiwUfs',66,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_A_Link_to_the_Past_Soul''s_Mission_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4828,'Highway Star 20X6','Rad Racer','2026-07-25T10:07:13.148236+00:00','https://www.youtube.com/watch?v=wBjusR7teNs',4368,'https://ocrmirror.org/files/music/remixes/Rad_Racer_Highway_Star_20X6_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4829,'Sidon''s Serenade','The Legend of Zelda: Breath of the Wild','2026-07-27T17:17:32.122437+00:00','https://www.youtube.com/watch?v=QhcALwQSiZ0',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Sidon''s_Serenade_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4830,'SIU MAI','Super Street Fighter II Turbo','2026-07-30T10:37:28.040993+00:00','https://www.youtube.com/watch?v=5Ma8fo-2Kx8',472,'https://ocrmirror.org/files/music/remixes/Super_Street_Fighter_2_Turbo_SIU_MAI_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4831,'So Good!','Puyo Puyo','2026-08-01T19:42:57.179409+00:00','https://www.youtube.com/watch?v=Jbx8hpLwm8k',6611,'https://ocrmirror.org/files/music/remixes/Puyo_Puyo_So_Good_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4832,'Stay Away','Final Fantasy VII','2026-08-04T17:11:51.240163+00:00','https://www.youtube.com/watch?v=u7l9aTYJZto',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Stay_Away_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4833,'We Built an Edifice Towards a Dark Sky','Shinobi III: Return of the Ninja Master','2026-08-07T06:46:02.935935+00:00','https://www.youtube.com/watch?v=BM0uS-MUAQY',353,'https://ocrmirror.org/files/music/remixes/Shinobi_3_We_Built_an_Edifice_Towards_a_Dark_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4834,'In Space, No One Can Hear You Party','Mario Party 2','2026-08-08T06:05:31.178629+00:00','https://www.youtube.com/watch?v=Tz1VC_EjyZU',933,'https://ocrmirror.org/files/music/remixes/Mario_Party_2_In_Space_No_One_Can_Hear_You_Party_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4835,'Flipside Part L: The Jester and The Void','Super Paper Mario','2026-08-09T11:55:35.804713+00:00','https://www.youtube.com/watch?v=Fets2ycTv_4',45416,'https://ocrmirror.org/files/music/remixes/Super_Paper_Mario_Flipside_Part_L_The_Jester_and_The_Void_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4836,'Put the lime in the Koopa shell and drink it all up','Mario Party','2026-08-10T17:24:48.902892+00:00','https://www.youtube.com/watch?v=Eiihko9FU9s',3022,'https://ocrmirror.org/files/music/remixes/Mario_Party_Put_the_lime_in_the_Koopa_shell_and_drink_it_all_up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4837,'Smash Those Records!','Super Smash Bros. Melee','2026-08-12T03:04:00.819219+00:00','https://www.youtube.com/watch?v=2ZI5ct8s5e8',805,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Melee_Smash_Those_Records_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4838,'Door to the Unknown','The Final Fantasy Legend','2026-08-13T12:09:01.414319+00:00','https://www.youtube.com/watch?v=0GeO1e2-rCk',6929,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_Legend_Door_to_the_Unknown_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4839,'The Castle Whispers','Kingdom Hearts','2026-08-15T03:11:41.601058+00:00','https://www.youtube.com/watch?v=0-trJHU0Ogg',409,'https://ocrmirror.org/files/music/remixes/Kingdom_Hearts_The_Castle_Whispers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4840,'À Venda','EarthBound','2026-08-16T04:07:48.316834+00:00','https://www.youtube.com/watch?v=WuQrw9fzwiU',51,'https://ocrmirror.org/files/music/remixes/EarthBound_A_Venda_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4841,'Twisted Systerz','Dragon Warrior IV','2026-08-18T08:02:53.700484+00:00','https://www.youtube.com/watch?v=oMFfoq745ec',422,'https://ocrmirror.org/files/music/remixes/Dragon_Warrior_4_Twisted_Systerz_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4842,'Sacrulen Shroud','Skies of Arcadia','2026-08-22T11:45:18.611653+00:00','https://www.youtube.com/watch?v=WOrPu757780',281,'https://ocrmirror.org/files/music/remixes/Skies_of_Arcadia_Sacrulen_Shroud_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4843,'Ninjan graali','Ninja Gaiden','2026-08-22T09:50:34.987425+00:00','https://www.youtube.com/watch?v=FRwYPeT6V2s',39462,'https://ocrmirror.org/files/music/remixes/Ninja_Gaiden_Ninjan_graali_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4844,'First Death of the Heart','Disco Elysium','2026-08-22T14:47:57.482149+00:00','https://www.youtube.com/watch?v=qorkIw3taS4',95878,'https://ocrmirror.org/files/music/remixes/Disco_Elysium_First_Death_of_the_Heart_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4845,'A Man from Outer Space','Pikmin','2026-08-22T13:51:43.700628+00:00','https://www.youtube.com/watch?v=PtSD7wfZndM',7456,'https://ocrmirror.org/files/music/remixes/Pikmin_A_Man_from_Outer_Space_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4846,'The Caterkiller''s Jam','Sonic the Hedgehog','2026-07-25T07:31:57.090736+00:00','https://www.youtube.com/watch?v=8tkweZpm1wA',22,'https://ocrmirror.org/files/music/remixes/Sonic_the_Hedgehog_The_Caterkiller''s_Jam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4847,'Saving Private Raynor','StarCraft','2026-07-27T17:17:30.699669+00:00','https://www.youtube.com/watch?v=veosqx30pWM',220,'https://ocrmirror.org/files/music/remixes/StarCraft_Saving_Private_Raynor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4848,'Daylight!','Metal Gear Solid','2026-08-13T03:07:11.417116+00:00','https://www.youtube.com/watch?v=vPDGKbNHjhI',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_Daylight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4849,'At the Drop of a Coin Flip','Pokémon Trading Card Game Pocket','2026-08-14T18:26:17.209062+00:00','https://www.youtube.com/watch?v=BSEpUARWnsk',95882,'https://ocrmirror.org/files/music/remixes/Pokemon_Trading_Card_Game_Pocket_At_the_Drop_of_a_Coin_Flip_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4850,'Your Warmth','Mother 3','2026-07-21T20:44:09.774318+00:00','https://www.youtube.com/watch?v=urlXzb_1YLc',9159,'https://ocrmirror.org/files/music/remixes/Mother_3_Your_Warmth_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4851,'Doomonic Monarchia','Doom','2026-07-30T21:42:31.709024+00:00','https://www.youtube.com/watch?v=6BtKGD_55Ec',14512,'https://ocrmirror.org/files/music/remixes/Doom_Doomonic_Monarchia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4852,'Mercurial Mechanisms','Golden Sun','2026-07-22T20:37:33.416558+00:00','https://www.youtube.com/watch?v=ivtU4MfF1Xc',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_Mercurial_Mechanisms_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4853,'That Night, 40 Years Ago','Golden Sun','2026-07-22T12:57:09.204920+00:00','https://www.youtube.com/watch?v=tlXBHwQrrA0',433,'https://ocrmirror.org/files/music/remixes/Golden_Sun_That_Night_40_Years_Ago_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4854,'Dreamy Ring Around the Forest','Silent Hill 4: The Room','2026-07-25T11:43:49.700188+00:00','https://www.youtube.com/watch?v=FfHIO1b5TUo',854,'https://ocrmirror.org/files/music/remixes/Silent_Hill_4_Dreamy_Ring_Around_the_Forest_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4855,'...And There Was Light','FTL: Faster Than Light','2026-08-14T03:05:55.157272+00:00','https://www.youtube.com/watch?v=KcwMiCRyMFE',95033,'https://ocrmirror.org/files/music/remixes/FTL_And_There_Was_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4856,'Follow the Tornado','Shadow the Hedgehog','2026-08-14T00:07:03.313144+00:00','https://www.youtube.com/watch?v=HY00vb6ehuc',7501,'https://ocrmirror.org/files/music/remixes/Shadow_the_Hedgehog_Follow_the_Tornado_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4857,'Death by Hammer (Mettaton vs. Smithy)','Undertale','2026-08-15T08:55:04.274492+00:00','https://www.youtube.com/watch?v=SDWxcKPWbww',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Death_by_Hammer_(Mettaton_vs_Smithy)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4858,'It All Ends Here','Super Smash Bros. Brawl','2026-08-16T10:48:39.899685+00:00','https://www.youtube.com/watch?v=_eE95XywZcY',879,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Brawl_It_All_Ends_Here_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4859,'Where the Fire Burns Brightest','Final Fantasy IX','2026-08-20T10:56:43.864715+00:00','https://www.youtube.com/watch?v=6pBlUWVWVl0',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Where_the_Fire_Burns_Brightest_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4860,'Alone in the Stars','The Last Story','2026-08-09T15:00:47.391533+00:00','https://www.youtube.com/watch?v=iDv-JArq2ZU',890,'https://ocrmirror.org/files/music/remixes/Last_Story_Alone_in_the_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4861,'Chill Out, Smithy','Super Mario RPG: Legend of the Seven Stars','2026-08-09T15:00:47.567750+00:00','https://www.youtube.com/watch?v=1vj_2sYSDsw',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Chill_Out_Smithy_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4862,'The Imminent Arrival of the Bioroids','Snatcher','2026-08-10T21:12:02.263828+00:00','https://www.youtube.com/watch?v=EFB7j_6Bshk',40026,'https://ocrmirror.org/files/music/remixes/Snatcher_The_Imminent_Arrival_of_the_Bioroids_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4863,'Solid Center','Ys: Ancient Ys Vanished','2026-08-13T21:20:29.661594+00:00','https://www.youtube.com/watch?v=efYrUboVdbU',40165,'https://ocrmirror.org/files/music/remixes/Ys_Solid_Center_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4864,'Glorious Exercise of Freedom','Helldivers II','2026-08-13T22:10:28.213350+00:00','https://www.youtube.com/watch?v=5Ezf69PI2Tc',95880,'https://ocrmirror.org/files/music/remixes/Helldivers_2_Glorious_Exercise_of_Freedom_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4865,'Falling in Love, Under That Sky','Super Smash Bros. Brawl','2026-08-15T07:06:10.654464+00:00','https://www.youtube.com/watch?v=Pj1VtG7W5-s',879,'https://ocrmirror.org/files/music/remixes/Super_Smash_Bros_Brawl_Falling_in_Love_Under_That_Sky_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4866,'Dragonborn Symphony, Movement 2','The Elder Scrolls V: Skyrim','2026-08-17T04:19:24.172605+00:00','https://www.youtube.com/watch?v=y7yUSTp1Q04',721,'https://ocrmirror.org/files/music/remixes/Elder_Scrolls_5_Skyrim_Dragonborn_Symphony_Movement_2_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4867,'Despair, Down at the Docks...','Super Mario 64','2026-07-26T17:31:59.429664+00:00','https://www.youtube.com/watch?v=RXZfrzhZSrY',59,'https://ocrmirror.org/files/music/remixes/Super_Mario_64_Despair_Down_at_the_Docks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4868,'Kremland''s Stupid Happy Boat Ride (Komplete Ride Through Mix)','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-21T04:18:10.074417+00:00','https://www.youtube.com/watch?v=8hzAsFu8u7w',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Kremland''s_Stupid_Happy_Boat_Ride_(Komplete_Ride_Through_Mix)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4869,'Fiama de Vampiri','Darkstalkers: The Night Warriors','2026-08-21T20:49:51.111356+00:00','https://www.youtube.com/watch?v=zFCc8xpufH8',28135,'https://ocrmirror.org/files/music/remixes/Darkstalkers_Fiama_de_Vampiri_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4870,'The Madness of Luca Blight','Suikoden II','2026-08-18T15:56:51.459536+00:00','https://www.youtube.com/watch?v=EK-dDyBFPH0',245,'https://ocrmirror.org/files/music/remixes/Suikoden_2_The_Madness_of_Luca_Blight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4871,'Aurum Borealis','Kid Icarus: Uprising','2026-08-18T16:57:42.250949+00:00','https://www.youtube.com/watch?v=G1VftpwXowc',94601,'https://ocrmirror.org/files/music/remixes/Kid_Icarus_Uprising_Aurum_Borealis_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4872,'Up and Away','The Legend of Zelda: The Wind Waker','2026-08-18T17:53:54.976341+00:00','https://www.youtube.com/watch?v=rVbV3-Kz4Tw',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Up_and_Away_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4873,'The Kabuki Warrior Kicks Back','Mystical Ninja Starring Goemon','2026-08-20T15:58:34.107494+00:00','https://www.youtube.com/watch?v=VQxi_dFd1yI',3039,'https://ocrmirror.org/files/music/remixes/Mystical_Ninja_Starring_Goemon_The_Kabuki_Warrior_Kicks_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4874,'The Leaflands (Reflections Version)','Octopath Traveler II','2026-08-21T19:06:05.288084+00:00','https://www.youtube.com/watch?v=Y_AijmpfEqc',95861,'https://ocrmirror.org/files/music/remixes/Octopath_Traveler_2_The_Leaflands_(Reflections_Version)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4875,'Eternal Summers of the Spotless Mind','EarthBound','2026-08-21T17:55:53.756271+00:00','https://www.youtube.com/watch?v=Nk92MMhbiOo',51,'https://ocrmirror.org/files/music/remixes/EarthBound_Eternal_Summers_of_the_Spotless_Mind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4876,'Ceremony at Terra','Final Fantasy IX','2026-07-23T01:00:26.186370+00:00','https://www.youtube.com/watch?v=kTgfNfo0GiA',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Ceremony_at_Terra_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4877,'Hyrulian Helminths','The Legend of Zelda: Breath of the Wild','2026-07-25T17:30:15.659278+00:00','https://www.youtube.com/watch?v=mwqQ9I_youw',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Hyrulian_Helminths_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4878,'Inimical Planets','Metroid','2026-07-27T20:50:14.832669+00:00','https://www.youtube.com/watch?v=DVZJwLLclb8',73,'https://ocrmirror.org/files/music/remixes/Metroid_Inimical_Planets_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4879,'A Stroll Down Memory Lane','Okami','2026-07-30T07:54:03.854645+00:00','https://www.youtube.com/watch?v=H0BH55s_nwk',537,'https://ocrmirror.org/files/music/remixes/Okami_A_Stroll_Down_Memory_Lane_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4880,'Who Needs Allies When You Have a Demon Sword?','Bloodstained: Curse of the Moon','2026-08-03T23:35:51.859020+00:00','https://www.youtube.com/watch?v=zUX7Ur00gI8',95896,'https://ocrmirror.org/files/music/remixes/Bloodstained_Curse_of_the_Moon_Who_Needs_Allies_When_You_Have_a_Demon_Sword_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4881,'The Snake Eater''s Palace, Outer Heaven (VGM CON 2025 Live Version)','Metal Gear Solid 3: Snake Eater','2026-08-03T23:35:53.411768+00:00','https://www.youtube.com/watch?v=_dy6W-DGzsI',481,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_3_The_Snake_Eater''s_Palace_Outer_Heaven_(VGM_CON_2025_Live_Version)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4882,'Like Stars in the Ceiling','Super Mario World 2: Yoshi''s Island','2026-08-06T11:00:34.607233+00:00','https://www.youtube.com/watch?v=Iv3C299Y2n0',71,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_2_Yoshi''s_Island_Like_Stars_in_the_Ceiling_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4883,'Nest of Dreams','The Legend of Zelda: Breath of the Wild','2026-08-07T00:23:37.565804+00:00','https://www.youtube.com/watch?v=z4tEijx_tUs',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Nest_of_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4884,'A Dream','Hollow Knight','2026-08-13T16:27:35.125820+00:00','https://www.youtube.com/watch?v=Hzwog2S6PVA',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_A_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4885,'Valoo''s Big Gay Dance','The Legend of Zelda: The Wind Waker','2026-08-15T01:56:13.154299+00:00','https://www.youtube.com/watch?v=U2r9cDVqu_U',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_Valoo''s_Big_Gay_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4886,'I Can''t Be Your Ray of Hope','Final Fantasy VI','2026-08-15T21:45:21.914978+00:00','https://www.youtube.com/watch?v=XkC_dFrP2qI',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_I_Can''t_Be_Your_Ray_of_Hope_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4887,'Plus Musici, Plus Victoriae','Final Fantasy VII','2026-08-17T07:31:52.769230+00:00','https://www.youtube.com/watch?v=Jb65_V8dbcQ',7,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Plus_Musici_Plus_Victoriae_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4888,'Death''s Last Dance','Shin Megami Tensei: Persona 3','2026-08-18T05:54:36.825749+00:00','https://www.youtube.com/watch?v=T6Ha0qkI_iE',736,'https://ocrmirror.org/files/music/remixes/Shin_Megami_Tensei_Persona_3_Death''s_Last_Dance_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4889,'Dearly Departing','Final Fantasy VI','2026-08-18T05:01:48.245440+00:00','https://www.youtube.com/watch?v=xV1FXiwKZQM',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Dearly_Departing_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4890,'Nightmare Glasses','Animal Well','2026-08-20T05:04:02.886278+00:00','https://www.youtube.com/watch?v=F4VCzi9o-u8',95899,'https://ocrmirror.org/files/music/remixes/Animal_Well_Nightmare_Glasses_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4891,'The Real Trigger Was the Friends We Made Along the Way','Chrono Trigger','2026-07-24T17:04:20.714921+00:00','https://www.youtube.com/watch?v=ugYLbq-Zpu4',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_The_Real_Trigger_Was_the_Friends_We_Made_Along_the_Way_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4892,'Twili Lamentations','The Legend of Zelda: Twilight Princess','2026-07-26T17:31:58.895959+00:00','https://www.youtube.com/watch?v=_1jXpt2q-28',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Twili_Lamentations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4893,'Aeternal Wonder','Pokémon Sleep','2026-07-29T13:13:50.837128+00:00','https://www.youtube.com/watch?v=MfsAUJlXCK8',95894,'https://ocrmirror.org/files/music/remixes/Pokemon_Sleep_Aeternal_Wonder_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4894,'Fight for My Friends','Flowstone Saga','2026-07-31T12:26:14.927137+00:00','https://www.youtube.com/watch?v=y-xM5Z9u8qU',95858,'https://ocrmirror.org/files/music/remixes/Flowstone_Saga_Fight_for_My_Friends_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4895,'20,000 Bananas Under the Sea','Donkey Kong Country: Tropical Freeze','2026-08-02T15:37:11.501858+00:00','https://www.youtube.com/watch?v=0uEk8FveFso',94869,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Tropical_Freeze_20000_Bananas_Under_the_Sea_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4896,'Ready to Go','Super Mario RPG: Legend of the Seven Stars','2026-08-05T00:54:43.821147+00:00','https://www.youtube.com/watch?v=LIk9pmrDMY8',84,'https://ocrmirror.org/files/music/remixes/Super_Mario_RPG_Ready_to_Go_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4897,'Sweep Beyond','Crypt Custodian','2026-08-07T13:48:43.148362+00:00','https://www.youtube.com/watch?v=uT1xMyV4_iw',95902,'https://ocrmirror.org/files/music/remixes/Crypt_Custodian_Sweep_Beyond_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4898,'This Is My Memory!','Remember Me','2026-08-07T15:25:11.023771+00:00','https://www.youtube.com/watch?v=6HdYPwa0lZ8',95346,'https://ocrmirror.org/files/music/remixes/Remember_Me_This_Is_My_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4899,'A Choice','Hollow Knight','2026-08-08T17:02:09.362368+00:00','https://www.youtube.com/watch?v=_5HwrzPjb-M',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_A_Choice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4900,'Bonkers!','Kirby: Triple Deluxe','2026-08-09T21:02:01.040313+00:00','https://www.youtube.com/watch?v=FG9wt-MAERo',94868,'https://ocrmirror.org/files/music/remixes/Kirby_Triple_Deluxe_Bonkers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4901,'VTuber Emblem Enrage','Fire Emblem Engage','2026-08-12T19:36:46.367630+00:00','https://www.youtube.com/watch?v=75T0UIT4dOQ',95903,'https://ocrmirror.org/files/music/remixes/Fire_Emblem_Engage_VTuber_Emblem_Enrage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4902,'Temporary Tina','Final Fantasy VI','2026-08-14T08:44:31.588350+00:00','https://www.youtube.com/watch?v=xDwkKfia0uk',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Temporary_Tina_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4903,'Tron Looper','Command & Conquer: Tiberian Sun','2026-08-14T08:44:32.275862+00:00','https://www.youtube.com/watch?v=6Q_EYS-GjMo',373,'https://ocrmirror.org/files/music/remixes/Command_&_Conquer_Tiberian_Sun_Tron_Looper_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4904,'El Gran Timoteo Cayendo','Sky Shark','2026-08-16T11:44:54.093685+00:00','https://www.youtube.com/watch?v=7tKrRYSCC9U',4427,'https://ocrmirror.org/files/music/remixes/Sky_Shark_El_Gran_Timoteo_Cayendo_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4905,'Hoist the Sails!','Golden Sun: The Lost Age','2026-08-17T13:20:47.570188+00:00','https://www.youtube.com/watch?v=jfKfnu1m4SI',892,'https://ocrmirror.org/files/music/remixes/Golden_Sun_The_Lost_Age_Hoist_the_Sails_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4906,'Guardia at Peace','Chrono Trigger','2026-08-18T14:05:29.998610+00:00','https://www.youtube.com/watch?v=n7n5h0NAqow',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Guardia_at_Peace_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4907,'The Dr. Is Back','Mega Man 2','2026-08-19T15:57:11.909073+00:00','https://www.youtube.com/watch?v=KaqJKzBs-VM',2,'https://ocrmirror.org/files/music/remixes/Mega_Man_2_The_Dr_Is_Back_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4908,'Slow Dancing at the End of the World','Gitaroo Man','2026-08-21T19:47:53.348779+00:00','https://www.youtube.com/watch?v=0IrsJnK6-zQ',719,'https://ocrmirror.org/files/music/remixes/Gitaroo_Man_Slow_Dancing_at_the_End_of_the_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4909,'Adventures Ahead','A Short Hike','2026-08-21T17:00:43.215444+00:00','https://www.youtube.com/watch?v=C4jsoRqe4x4',95900,'https://ocrmirror.org/files/music/remixes/Short_Hike_Adventures_Ahead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4910,'Nirvana','The Legend of Zelda: Tears of the Kingdom','2026-07-21T07:07:13.476611+00:00','https://www.youtube.com/watch?v=jccZyiax7Kw',95834,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Tears_of_the_Kingdom_Nirvana_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4911,'Never Forget Her Name','Fire Emblem: Awakening','2026-07-23T10:38:56.716440+00:00','https://www.youtube.com/watch?v=SSEDJ6PRtbs',94790,'https://ocrmirror.org/files/music/remixes/Fire_Emblem_Awakening_Never_Forget_Her_Name_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4912,'Gunslinger','La Tale','2026-07-25T14:09:20.795702+00:00','https://www.youtube.com/watch?v=_QTQ1zqB3SQ',703,'https://ocrmirror.org/files/music/remixes/La_Tale_Gunslinger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4913,'A Path','Hollow Knight','2026-07-28T00:54:36.248189+00:00','https://www.youtube.com/watch?v=TzWWGOAs-c4',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_A_Path_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4914,'Million Dollar Death Trap','Sonic & Knuckles','2026-07-30T07:54:03.677533+00:00','https://www.youtube.com/watch?v=D2BURFuRp_E',147,'https://ocrmirror.org/files/music/remixes/Sonic_&_Knuckles_Million_Dollar_Death_Trap_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4915,'Into Darkness','Star Fox 64','2026-08-02T22:26:54.162845+00:00','https://www.youtube.com/watch?v=Uufpo0AHWOo',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Into_Darkness_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4916,'Memories of Mabe','The Legend of Zelda: Link''s Awakening','2026-08-02T23:29:44.985678+00:00','https://www.youtube.com/watch?v=0nZ4wv4oYo8',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Memories_of_Mabe_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4917,'Manoria Cathedral: Corruption','Chrono Trigger','2026-08-05T15:37:22.762136+00:00','https://www.youtube.com/watch?v=wkKm8k8XncU',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Manoria_Cathedral_Corruption_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4918,'I''m Gonna DOUSE Dhaos!','Tales of Phantasia','2026-08-07T22:05:45.473464+00:00','https://www.youtube.com/watch?v=fUsgsmMk8wM',223,'https://ocrmirror.org/files/music/remixes/Tales_of_Phantasia_I''m_Gonna_DOUSE_Dhaos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4919,'Dark Revelations','Tunic','2026-08-07T21:10:13.971575+00:00','https://www.youtube.com/watch?v=dQxNju79hzE',95821,'https://ocrmirror.org/files/music/remixes/Tunic_Dark_Revelations_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4920,'Blood on the Riviera','Bomberman ''93','2026-08-10T06:50:56.781501+00:00','https://www.youtube.com/watch?v=qiJ0O3xPQDA',4799,'https://ocrmirror.org/files/music/remixes/Bomberman_''93_Blood_on_the_Riviera_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4921,'Ash','A Short Hike','2026-08-11T15:28:32.766016+00:00','https://www.youtube.com/watch?v=UJDFTqtqT5s',95900,'https://ocrmirror.org/files/music/remixes/Short_Hike_Ash_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4922,'Forest in the Night','Xenoblade Chronicles X','2026-08-13T05:17:01.620976+00:00','https://www.youtube.com/watch?v=qcJiXPbGkCw',95901,'https://ocrmirror.org/files/music/remixes/Xenoblade_Chronicles_X_Forest_in_the_Night_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4923,'The Road Home','Xenoblade Chronicles','2026-08-14T18:26:16.684552+00:00','https://www.youtube.com/watch?v=7K4evWds8js',825,'https://ocrmirror.org/files/music/remixes/Xenoblade_Chronicles_The_Road_Home_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4924,'War Never Changes','Mega Man ZX','2026-08-14T18:26:17.742541+00:00','https://www.youtube.com/watch?v=qt4AgucPMHI',580,'https://ocrmirror.org/files/music/remixes/Mega_Man_ZX_War_Never_Changes_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4925,'Cosmic Knowledge','Katamari Damacy','2026-08-16T17:44:55.507774+00:00','https://www.youtube.com/watch?v=VK4cGGLFMkw',702,'https://ocrmirror.org/files/music/remixes/Katamari_Damacy_Cosmic_Knowledge_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4926,'Guile''s Theme (Reflections Version)','Street Fighter II: The World Warrior','2026-08-17T17:55:41.834497+00:00','https://www.youtube.com/watch?v=mMqnEqWoD9w',54,'https://ocrmirror.org/files/music/remixes/Street_Fighter_2_Guile''s_Theme_(Reflections_Version)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4927,'Prepare to Fry','Dark Souls','2026-08-17T19:06:57.622033+00:00','https://www.youtube.com/watch?v=VXl5G_CNpTI',976,'https://ocrmirror.org/files/music/remixes/Dark_Souls_Prepare_to_Fry_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4928,'Dawn Chorus','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-19T22:50:59.726896+00:00','https://www.youtube.com/watch?v=TGIo9kPVBfc',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Dawn_Chorus_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4929,'Despierta la Bestia Que Hay en Ti','Altered Beast','2026-08-20T19:09:43.003672+00:00','https://www.youtube.com/watch?v=MnTfOa_9PFc',717,'https://ocrmirror.org/files/music/remixes/Altered_Beast_Despierta_la_Bestia_Que_Hay_en_Ti_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4930,'Diamonds and Dust','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-21T22:50:51.340733+00:00','https://www.youtube.com/watch?v=vS0gdx_Qm3A',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Diamonds_and_Dust_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4931,'Illuminated Dystopia','Invaders of the Lost Tomb','2026-07-24T22:34:04.640592+00:00','https://www.youtube.com/watch?v=t6W8YBIqVnY',1354,'https://ocrmirror.org/files/music/remixes/Invaders_of_the_Lost_Tomb_Illuminated_Dystopia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4932,'Make a Note','Persona 5','2026-07-25T01:02:14.883406+00:00','https://www.youtube.com/watch?v=RtqUHHHddsE',95907,'https://ocrmirror.org/files/music/remixes/Persona_5_Make_a_Note_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4933,'Do You See?','The Legend of Zelda: Majora''s Mask','2026-07-25T04:42:56.684846+00:00','https://www.youtube.com/watch?v=fJBvioceKZA',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Do_You_See_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4934,'Healing Termina','The Legend of Zelda: Majora''s Mask','2026-07-24T20:45:49.810179+00:00','https://www.youtube.com/watch?v=Dm6dROSBhGs',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Healing_Termina_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4935,'Kremling Kraic','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-27T22:33:18.624249+00:00','https://www.youtube.com/watch?v=mP2iRU0v9Cw',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Kremling_Kraic_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4936,'Do Re Dedede','Kirby Super Star','2026-07-28T04:41:54.516817+00:00','https://www.youtube.com/watch?v=dGkjIJeX1-c',199,'https://ocrmirror.org/files/music/remixes/Kirby_Super_Star_Do_Re_Dedede_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4937,'Tema de Amor','Final Fantasy IV','2026-08-01T11:42:26.922827+00:00','https://www.youtube.com/watch?v=43lfCKT2LqQ',11,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_4_Tema_de_Amor_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4938,'Sakura Wa Karenai','Etrian Odyssey II: Heroes of Lagaard','2026-08-03T21:40:01.207941+00:00','https://www.youtube.com/watch?v=-7uNjP4NVCs',812,'https://ocrmirror.org/files/music/remixes/Etrian_Odyssey_2_Sakura_Wa_Karenai_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4939,'This Ain''t Your Dracula''s Castle','Wizards & Warriors','2026-08-03T20:10:53.362878+00:00','https://www.youtube.com/watch?v=aTbI06R7wXs',102,'https://ocrmirror.org/files/music/remixes/Wizards_&_Warriors_This_Ain''t_Your_Dracula''s_Castle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4940,'Original Koopa','Super Mario World','2026-08-03T08:47:04.886717+00:00','https://www.youtube.com/watch?v=Yc7C_0xGDQg',98,'https://ocrmirror.org/files/music/remixes/Super_Mario_World_Original_Koopa_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4941,'Deathly Cursed Uber Ride of Painful Hyper Doom','Look Outside','2026-08-03T16:01:35.646684+00:00','https://www.youtube.com/watch?v=nobS7DHaGL4',95911,'https://ocrmirror.org/files/music/remixes/Look_Outside_Deathly_Cursed_Uber_Ride_of_Painful_Hyper_Doom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4942,'Into the Wasteland','Grim Dawn','2026-08-03T18:16:15.595892+00:00','https://www.youtube.com/watch?v=L-bjVYMpCeQ',95898,'https://ocrmirror.org/files/music/remixes/Grim_Dawn_Into_the_Wasteland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4943,'Sell It to Me','The Legend of Zelda: Twilight Princess','2026-08-03T18:16:15.056936+00:00','https://www.youtube.com/watch?v=hhpPntGljsM',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Sell_It_to_Me_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4944,'BLOOD','Castlevania: Dawn of Sorrow','2026-08-03T16:01:36.542525+00:00','https://www.youtube.com/watch?v=DP_q5Qw6X20',723,'https://ocrmirror.org/files/music/remixes/Castlevania_Dawn_of_Sorrow_BLOOD_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4945,'You and Your Friends Are Dead.','Friday the 13th','2026-08-03T12:41:41.153618+00:00','https://www.youtube.com/watch?v=qc570TmgkR0',311,'https://ocrmirror.org/files/music/remixes/Friday_the_13th_You_and_Your_Friends_are_Dead_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4946,'Ancient Skyline','Final Fantasy XIV','2026-08-05T21:46:18.247729+00:00','https://www.youtube.com/watch?v=TJXki0pBXPM',95839,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_14_Ancient_Skyline_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4947,'A Flower for Your Funeral','Undertale','2026-08-07T21:10:14.838259+00:00','https://www.youtube.com/watch?v=FZddJFzJyhM',95077,'https://ocrmirror.org/files/music/remixes/Undertale_A_Flower_for_Your_Funeral_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4948,'Rescue Corps Anthem','Pikmin 4','2026-08-14T06:53:06.281006+00:00','https://www.youtube.com/watch?v=porzH7zegBY',95913,'https://ocrmirror.org/files/music/remixes/Pikmin_4_Rescue_Corps_Anthem_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4949,'In Memoriam','MegaRace','2026-08-14T08:44:31.261043+00:00','https://www.youtube.com/watch?v=vLvvhsx7Zwc',15669,'https://ocrmirror.org/files/music/remixes/MegaRace_In_Memoriam_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4950,'A Memory','Hollow Knight','2026-08-15T11:44:42.878939+00:00','https://www.youtube.com/watch?v=-TuQKppqaAI',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_A_Memory_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4951,'If You Could Only See (The Best Is Yet to Come)','Metal Gear Solid','2026-08-15T11:44:44.316914+00:00','https://www.youtube.com/watch?v=wMUHN38Y0wA',328,'https://ocrmirror.org/files/music/remixes/Metal_Gear_Solid_If_You_Could_Only_See_(The_Best_Is_Yet_to_Come)_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4952,'Rigging Rampage','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-15T10:48:20.733078+00:00','https://www.youtube.com/watch?v=9mFQtLotSSo',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Rigging_Rampage_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4953,'Five More, Nevermore','Chrono Trigger','2026-08-16T11:44:54.272051+00:00','https://www.youtube.com/watch?v=29q8iVhgRE8',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Five_More_Nevermore_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4954,'The 7 Habits of Highly Effective Weed Wackers','The Legend of Zelda: The Wind Waker','2026-08-16T10:48:39.192221+00:00','https://www.youtube.com/watch?v=tGcFaLOXPtg',377,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_The_Wind_Waker_The_7_Habits_of_Highly_Effective_Weed_Wackers_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4955,'A Walk in Snowpoint City','Pokémon Diamond Version','2026-08-18T09:57:25.167357+00:00','https://www.youtube.com/watch?v=QzI1fBNU6WM',635,'https://ocrmirror.org/files/music/remixes/Pokemon_Diamond_Version_A_Walk_in_Snowpoint_City_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4956,'Above the Borders','Microsoft Flight Simulator','2026-08-19T09:03:59.444343+00:00','https://www.youtube.com/watch?v=xdsW9TP1xPM',95906,'https://ocrmirror.org/files/music/remixes/Microsoft_Flight_Simulator_Above_the_Borders_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4957,'We, Under the Stars','Shovel Knight','2026-08-20T07:22:12.088098+00:00','https://www.youtube.com/watch?v=C4EzM0oSEIY',95031,'https://ocrmirror.org/files/music/remixes/Shovel_Knight_We_Under_the_Stars_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4958,'House of Shadow','The Legend of Zelda: Ocarina of Time','2026-08-22T07:54:17.966801+00:00','https://www.youtube.com/watch?v=Rvy1JBzbPlk',67,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Ocarina_of_Time_House_of_Shadow_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4959,'Under a Summer Moon','The Oregon Trail','2026-08-22T08:56:51.123305+00:00','https://www.youtube.com/watch?v=mA-MNfMQ2rw',95910,'https://ocrmirror.org/files/music/remixes/Oregon_Trail_Under_a_Summer_Moon_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4960,'Howls of the Black Wind','Chrono Trigger','2026-07-21T23:29:54.385781+00:00','https://www.youtube.com/watch?v=p4Zc1fZPaPs',16,'https://ocrmirror.org/files/music/remixes/Chrono_Trigger_Howls_of_the_Black_Wind_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4961,'Pasillo de los Hermanos','Brothers: A Tale of Two Sons','2026-07-25T23:31:57.212642+00:00','https://www.youtube.com/watch?v=3l2Jdt-IysE',95914,'https://ocrmirror.org/files/music/remixes/Brothers_A_Tale_of_Two_Sons_Pasillo_de_los_Hermanos_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4962,'Into the Icy Caverns','Pokémon Crystal Version','2026-07-25T23:31:57.567051+00:00','https://www.youtube.com/watch?v=gGOJxg0fK24',573,'https://ocrmirror.org/files/music/remixes/Pokemon_Crystal_Version_Into_the_Icy_Caverns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4963,'I Want to Go Home','Donkey Kong Country','2026-07-28T13:09:04.526864+00:00','https://www.youtube.com/watch?v=TwZrov6545A',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_I_Want_to_Go_Home_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4964,'Rose Gray','Donkey Kong Country 2: Diddy''s Kong Quest','2026-07-28T13:09:04.931390+00:00','https://www.youtube.com/watch?v=YksvyQFt-5o',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Rose_Gray_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4965,'Thalassophobia','Donkey Kong Country 3: Dixie Kong''s Double Trouble!','2026-08-03T16:01:36.721179+00:00','https://www.youtube.com/watch?v=IWUATmBGe4U',310,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_3_Thalassophobia_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4966,'Toyworks Terror','Donkey Kong 64','2026-08-03T16:01:35.094353+00:00','https://www.youtube.com/watch?v=2_YSLCkulsA',2955,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_64_Toyworks_Terror_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4967,'Kommand & Kongquer','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-06T00:54:23.074092+00:00','https://www.youtube.com/watch?v=Mn3Vdem3VtA',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Kommand_&_Kongquer_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4968,'Blackthorne','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-06T04:42:52.456117+00:00','https://www.youtube.com/watch?v=L3U3yY8Utjc',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Blackthorne_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4969,'Mechanomania','Donkey Kong Country','2026-08-07T23:58:27.467263+00:00','https://www.youtube.com/watch?v=VKosIibcm50',47,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_Mechanomania_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4970,'At the Heart of Yggdrasil','Streets of Rage','2026-08-11T17:28:29.195869+00:00','https://www.youtube.com/watch?v=VWG9VOXb_98',79,'https://ocrmirror.org/files/music/remixes/Streets_of_Rage_At_the_Heart_of_Yggdrasil_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4971,'YAZOO!','Croc: Legend of the Gobbos','2026-08-16T09:50:38.603751+00:00','https://www.youtube.com/watch?v=MxJZLCiS9p8',41584,'https://ocrmirror.org/files/music/remixes/Croc_Legend_of_the_Gobbos_YAZOO_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4972,'Asgore in Wonderland','Undertale','2026-08-16T10:48:38.651082+00:00','https://www.youtube.com/watch?v=WwRTWRuVfr8',95077,'https://ocrmirror.org/files/music/remixes/Undertale_Asgore_in_Wonderland_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4973,'Midi''s Lament','The Legend of Zelda: Twilight Princess','2026-08-17T11:50:10.170433+00:00','https://www.youtube.com/watch?v=xXs24pejW7A',505,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Twilight_Princess_Midi''s_Lament_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4974,'Catactras','Chronicon','2026-08-17T10:04:40.960119+00:00','https://www.youtube.com/watch?v=qsvNFw6Nak4',95916,'https://ocrmirror.org/files/music/remixes/Chronicon_Catactras_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4975,'Accept the Truth','Final Fantasy XVI','2026-08-03T12:41:42.001938+00:00','https://www.youtube.com/watch?v=iqtfBcmRhkk',95884,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_16_Accept_the_Truth_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4976,'All for One and One for All','Castle Crashers','2026-08-07T11:21:33.388384+00:00','https://www.youtube.com/watch?v=IHmjtjTK5TE',48217,'https://ocrmirror.org/files/music/remixes/Castle_Crashers_All_for_One_and_One_for_All_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4977,'Known Unknowns','Outer Wilds','2026-08-10T10:42:47.982804+00:00','https://www.youtube.com/watch?v=WH9JM40S3yc',95888,'https://ocrmirror.org/files/music/remixes/Outer_Wilds_Known_Unknowns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4978,'Beat of the Heart','Slay the Spire','2026-08-10T13:55:01.773956+00:00','https://www.youtube.com/watch?v=zGvALDACpLc',95889,'https://ocrmirror.org/files/music/remixes/Slay_the_Spire_Beat_of_the_Heart_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4979,'Children of Light','Final Fantasy XIV','2026-08-10T15:29:52.688373+00:00','https://www.youtube.com/watch?v=-RpwQlBBY08',95839,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_14_Children_of_Light_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4980,'Snowboarding Through a Mine Field','Bomberman Hero','2026-08-14T15:21:25.456979+00:00','https://www.youtube.com/watch?v=Lylqe7hPxeY',2931,'https://ocrmirror.org/files/music/remixes/Bomberman_Hero_Snowboarding_Through_a_Mine_Field_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4981,'Stupid Thorns!','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-14T13:52:45.119247+00:00','https://www.youtube.com/watch?v=z8uaWTRTXKA',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Stupid_Thorns_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4982,'THE ALL-INCLUSIVE EXCLUSIVE-CLUB FOR HAIRY FISH-MEN WHO SHOOT FOREVER-TURBO ALARM-CLOCKS','Lisa: The Painful','2026-08-15T11:44:43.681874+00:00','https://www.youtube.com/watch?v=JAO_bhfaF8c',95886,'https://ocrmirror.org/files/music/remixes/Lisa_The_Painful_THE_ALL-INCLUSIVE_EXCLUSIVE-CLUB_FOR_HAIRY_FISH-MEN_WHO_SHOOT_FOREVER-TURBO_ALARM-CLOCKS_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4983,'Shafts of Sunlight','Horizon Zero Dawn','2026-08-15T11:44:44.158861+00:00','https://www.youtube.com/watch?v=5R5Pf4IiE1Q',95847,'https://ocrmirror.org/files/music/remixes/Horizon_Zero_Dawn_Shafts_of_Sunlight_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4984,'Absolutely No Bones About It','Sky Shark','2026-08-15T10:48:19.324992+00:00','https://www.youtube.com/watch?v=UsyiQHcSAW4',4427,'https://ocrmirror.org/files/music/remixes/Sky_Shark_Absolutely_No_Bones_About_It_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4985,'Clock Capital','The Legend of Zelda: Majora''s Mask','2026-08-16T07:53:31.774417+00:00','https://www.youtube.com/watch?v=C8lNIThqQns',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Clock_Capital_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4986,'A Long Night, ''Til Morning Comes','Animal Crossing: Wild World','2026-08-16T09:50:38.197915+00:00','https://www.youtube.com/watch?v=ftgDDhj0KFM',38752,'https://ocrmirror.org/files/music/remixes/Animal_Crossing_Wild_World_A_Long_Night_''Til_Morning_Comes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4987,'Queen of the Groove','Final Fantasy VII Rebirth','2026-08-16T10:48:39.547555+00:00','https://www.youtube.com/watch?v=eZblFi2s_x0',95892,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_7_Rebirth_Queen_of_the_Groove_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4988,'Time to Shuffle to Time to Shuffle to Time to Shuffle','Final Fantasy VI','2026-08-16T08:56:16.350793+00:00','https://www.youtube.com/watch?v=NboukKqBjbY',6,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_6_Time_to_Shuffle_to_Time_to_Shuffle_to_Time_to_Shuffle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4989,'Ancient Vessel','The Legend of Zelda: Tears of the Kingdom','2026-08-16T09:50:38.828454+00:00','https://www.youtube.com/watch?v=Z0VLYjbNx08',95834,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Tears_of_the_Kingdom_Ancient_Vessel_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4990,'Light a Torch, It''s Dark Down Here','Minecraft','2026-08-16T09:50:37.280837+00:00','https://www.youtube.com/watch?v=drCXpzOkOyM',708,'https://ocrmirror.org/files/music/remixes/Minecraft_Light_a_Torch_It''s_Dark_Down_Here_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4991,'Lead Where You Belong','Baldur''s Gate III','2026-08-18T08:02:54.764430+00:00','https://www.youtube.com/watch?v=o4660wl0Iuk',95877,'https://ocrmirror.org/files/music/remixes/Baldur''s_Gate_3_Lead_Where_You_Belong_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(4992,'Wadafuskle','The Legend of Zelda: Majora''s Mask','2026-08-18T08:02:54.053897+00:00','https://www.youtube.com/watch?v=7QyDhd-HnTI',490,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Majora''s_Mask_Wadafuskle_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4993,'I''MMM THE BEST!','Mario Kart 64','2026-08-19T07:20:08.622174+00:00','https://www.youtube.com/watch?v=KHwyY_E6f7w',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_I''MMM_THE_BEST_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4994,'Demon Fusion','Shin Megami Tensei IV','2026-08-19T07:20:09.513764+00:00','https://www.youtube.com/watch?v=kL-AfCm3A0Q',95908,'https://ocrmirror.org/files/music/remixes/Shin_Megami_Tensei_4_Demon_Fusion_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4995,'Let It Besaid','Final Fantasy X','2026-08-21T04:18:08.772564+00:00','https://www.youtube.com/watch?v=2Hv5x3tQpYk',15,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_10_Let_It_Besaid_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4996,'Once More, Into the Storm','Outer Wilds','2026-08-21T05:04:15.796135+00:00','https://www.youtube.com/watch?v=Rc2me3sG8g0',95888,'https://ocrmirror.org/files/music/remixes/Outer_Wilds_Once_More_Into_the_Storm_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4997,'World 7/4','Super Mario Bros.','2026-08-21T05:04:16.165369+00:00','https://www.youtube.com/watch?v=TPM9xofsYXk',56,'https://ocrmirror.org/files/music/remixes/Super_Mario_Bros_World_7-4_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4998,'Cuando Cae la Noche','Castlevania: The Adventure','2026-08-21T05:04:15.239147+00:00','https://www.youtube.com/watch?v=soKw0A6bHvY',341,'https://ocrmirror.org/files/music/remixes/Castlevania_The_Adventure_Cuando_Cae_la_Noche_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(4999,'A Brief Respite','Salt and Sanctuary','2026-08-21T07:23:17.600625+00:00','https://www.youtube.com/watch?v=Ss2Swznjk4M',95917,'https://ocrmirror.org/files/music/remixes/Salt_and_Sanctuary_A_Brief_Respite_OC_ReMix.mp3',0);
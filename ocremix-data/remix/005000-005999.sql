@@ -0,0 +1,62 @@
+INSERT INTO "remix" VALUES(5000,'Hotel Koholint','The Legend of Zelda: Link''s Awakening','2026-08-22T04:59:15.296591+00:00','https://www.youtube.com/watch?v=6rk1A3tSxHc',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Hotel_Koholint_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5001,'The First Sip of Coffee As a Grown-Up','I Was a Teenage Exocolonist','2026-07-23T19:54:55.134959+00:00','https://www.youtube.com/watch?v=1OFNhnAxB3Q',95915,'https://ocrmirror.org/files/music/remixes/I_Was_a_Teenage_Exocolonist_The_First_Sip_of_Coffee_As_a_Grown-Up_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5002,'Super Double Espresso','Super Double Dragon','2026-08-03T23:35:53.603481+00:00','https://www.youtube.com/watch?v=tLU8CxpKVqw',469,'https://ocrmirror.org/files/music/remixes/Super_Double_Dragon_Super_Double_Espresso_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5003,'Hope You Brought Your Airshoes','Mega Man Battle Network 5: Team Protoman','2026-08-04T03:48:01.526609+00:00','https://www.youtube.com/watch?v=_YPQ43FPR1Q',954,'https://ocrmirror.org/files/music/remixes/Mega_Man_Battle_Network_5_Team_Protoman_Hope_You_Brought_Your_Airshoes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5004,'Temple of the Space Angler','F-Zero','2026-08-08T14:58:09.443657+00:00','https://www.youtube.com/watch?v=PuU9mpQDNiw',89,'https://ocrmirror.org/files/music/remixes/F-Zero_Temple_of_the_Space_Angler_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5005,'Endure and Survive','The Last of Us','2026-08-08T15:55:46.101417+00:00','https://www.youtube.com/watch?v=Fqgsn2a3RVo',913,'https://ocrmirror.org/files/music/remixes/Last_of_Us_Endure_and_Survive_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5006,'Adeptal Echoes','Genshin Impact','2026-08-11T22:11:25.462718+00:00','https://www.youtube.com/watch?v=Degyvxaml0U',95846,'https://ocrmirror.org/files/music/remixes/Genshin_Impact_Adeptal_Echoes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5007,'Pipe Frame Dreams','Mario Kart 64','2026-08-11T23:11:47.709775+00:00','https://www.youtube.com/watch?v=S3DEyd9C440',264,'https://ocrmirror.org/files/music/remixes/Mario_Kart_64_Pipe_Frame_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5008,'Sidon''s Wet Dream','The Legend of Zelda: Breath of the Wild','2026-08-20T01:58:46.615778+00:00','https://www.youtube.com/watch?v=P5ZfBEwS2ME',95359,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Breath_of_the_Wild_Sidon''s_Wet_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5009,'Heroes of the Tempest','Fire Emblem Heroes','2026-08-20T22:54:42.989260+00:00','https://www.youtube.com/watch?v=y4bm-ws80cE',95354,'https://ocrmirror.org/files/music/remixes/Fire_Emblem_Heroes_Heroes_of_the_Tempest_OC_ReMix_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5010,'The Universe Said I Love You','Minecraft','2026-08-20T21:53:20.988307+00:00','https://www.youtube.com/watch?v=B__s7lWs--c',708,'https://ocrmirror.org/files/music/remixes/Minecraft_The_Universe_Said_I_Love_You_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5011,'Hollow Nights','Star Fox Adventures','2026-07-28T07:59:17.247004+00:00','https://www.youtube.com/watch?v=X-Vs9M4Cdyg',601,'https://ocrmirror.org/files/music/remixes/Star_Fox_Adventures_Hollow_Nights_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5012,'Initiate Code Blue','Star Fox 64','2026-08-07T19:29:03.611533+00:00','https://www.youtube.com/watch?v=bcPvK7cyIX8',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Initiate_Code_Blue_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5013,'Dark Star','Star Fox','2026-08-07T19:29:02.736652+00:00','https://www.youtube.com/watch?v=Jl4mRalWgtY',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Dark_Star_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5014,'Cries from Crystal Eyes','Star Fox Adventures','2026-08-09T19:11:01.992054+00:00','https://www.youtube.com/watch?v=CvgMVZYvtKs',601,'https://ocrmirror.org/files/music/remixes/Star_Fox_Adventures_Cries_from_Crystal_Eyes_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5015,'Weapon Warp Punk','Star Fox 64','2026-08-09T19:57:24.736199+00:00','https://www.youtube.com/watch?v=SIF5TkgTD1Y',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Weapon_Warp_Punk_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5016,'Les Venimeux','Pokémon Emerald Version','2026-08-09T19:11:00.752834+00:00','https://www.youtube.com/watch?v=nsdJ9vMMY54',672,'https://ocrmirror.org/files/music/remixes/Pokemon_Emerald_Version_Les_Venimeux_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5017,'V I R U L E N T','Star Fox 64','2026-08-03T21:40:00.676193+00:00','https://www.youtube.com/watch?v=Z6ZxfcxLuTM',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_V_I_R_U_L_E_N_T_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5018,'Cinnamon Soil','Super Metroid','2026-08-15T13:07:35.457371+00:00','https://www.youtube.com/watch?v=U-VDoOI2fQg',74,'https://ocrmirror.org/files/music/remixes/Super_Metroid_Cinnamon_Soil_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5019,'Wing Men','Star Fox','2026-08-22T11:45:17.556930+00:00','https://www.youtube.com/watch?v=juNrlMuZmGw',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Wing_Men_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5020,'Prog Wrong/Enmity','ValiDate: Struggling Singles in Your Area','2026-07-27T08:00:44.739416+00:00','https://www.youtube.com/watch?v=QKTUj1igP2w',95893,'https://ocrmirror.org/files/music/remixes/ValiDate_Prog_Wrong-Enmity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5021,'Dunes of the Lost','Star Fox 2','2026-08-02T23:29:46.405379+00:00','https://www.youtube.com/watch?v=DaVb1xz6kxE',453,'https://ocrmirror.org/files/music/remixes/Star_Fox_2_Dunes_of_the_Lost_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5022,'Rock and Ice','Star Fox Adventures','2026-08-04T17:11:52.844880+00:00','https://www.youtube.com/watch?v=BNFJzth2oQU',601,'https://ocrmirror.org/files/music/remixes/Star_Fox_Adventures_Rock_and_Ice_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5023,'Playing Crazy (with the 6th Blockade)','Star Fox 64','2026-08-06T11:00:34.779106+00:00','https://www.youtube.com/watch?v=iVH8HFORLHc',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Playing_Crazy_(with_the_6th_Blockade)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5024,'Now Boarding Flight 6 to Venom','Star Fox 64','2026-08-06T11:00:35.313582+00:00','https://www.youtube.com/watch?v=KLSWBvV5gZc',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Now_Boarding_Flight_6_to_Venom_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5025,'Boundless Skies','Star Fox','2026-08-06T13:09:22.772837+00:00','https://www.youtube.com/watch?v=tvBa4ZNcdmA',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Boundless_Skies_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5026,'Star Fox Capture Plan','Star Fox 64','2026-08-08T20:58:12.492151+00:00','https://www.youtube.com/watch?v=NTP_D1H-YF4',475,'https://ocrmirror.org/files/music/remixes/Star_Fox_64_Star_Fox_Capture_Plan_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5027,'Unmoored, Undeserved','Neon White','2026-08-10T19:30:03.565498+00:00','https://www.youtube.com/watch?v=Ex-Tr6tq0rs',95925,'https://ocrmirror.org/files/music/remixes/Neon_White_Unmoored_Undeserved_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5028,'Boss Bossanova (Bossanova Mix)','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-11T16:26:37.194934+00:00','https://www.youtube.com/watch?v=xah9NV-id_I',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Boss_Bossanova_(Bossanova_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5029,'Token Tango (Tango Mix)','Donkey Kong Country 2: Diddy''s Kong Quest','2026-08-12T15:28:27.090140+00:00','https://www.youtube.com/watch?v=6fuSbY46Qm0',48,'https://ocrmirror.org/files/music/remixes/Donkey_Kong_Country_2_Token_Tango_(Tango_Mix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5030,'The 18th Greek Chad','Mega Man X','2026-08-12T16:27:53.583975+00:00','https://www.youtube.com/watch?v=nGYGsgTkv5w',138,'https://ocrmirror.org/files/music/remixes/Mega_Man_X_The_18th_Greek_Chad_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5031,'Doma Doma','Hollow Knight','2026-08-12T16:27:53.343543+00:00','https://www.youtube.com/watch?v=nm1t6eGA4Jc',95554,'https://ocrmirror.org/files/music/remixes/Hollow_Knight_Doma_Doma_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5032,'The Laboratory Liberator','Final Fantasy VIII','2026-08-12T15:28:26.919860+00:00','https://www.youtube.com/watch?v=L1vNry3SegI',13,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_8_The_Laboratory_Liberator_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5033,'Cliffhanger','Contra','2026-07-24T22:34:03.411697+00:00','https://www.youtube.com/watch?v=74IvxhTYlj4',21,'https://ocrmirror.org/files/music/remixes/Contra_Cliffhanger_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5034,'Fortuna Protocol','Star Fox Zero','2026-07-24T22:34:04.463329+00:00','https://www.youtube.com/watch?v=XSth7L6diNU',95159,'https://ocrmirror.org/files/music/remixes/Star_Fox_Zero_Fortuna_Protocol_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5035,'The Summer Reefs by the Docks','Kirby 64: The Crystal Shards','2026-07-24T22:34:03.764313+00:00','https://www.youtube.com/watch?v=2BaNuPlfs1s',577,'https://ocrmirror.org/files/music/remixes/Kirby_64_The_Summer_Reefs_by_the_Docks_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5036,'The Deepest Layer of the Kirby Iceberg','Kirby''s Dream Land 3','2026-07-24T22:34:04.815283+00:00','https://www.youtube.com/watch?v=14E17w-rW28',11121,'https://ocrmirror.org/files/music/remixes/Kirby''s_Dream_Land_3_The_Deepest_Layer_of_the_Kirby_Iceberg_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5037,'Arwing Dreams','Star Fox','2026-07-25T22:26:09.915463+00:00','https://www.youtube.com/watch?v=pRbg9vubj7o',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Arwing_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5038,'Liyue''s Light','Genshin Impact','2026-07-26T15:38:09.638104+00:00','https://www.youtube.com/watch?v=hZ_bsyahCtU',95846,'https://ocrmirror.org/files/music/remixes/Genshin_Impact_Liyue''s_Light_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5039,'Magnet Man Sonata','Mega Man 3','2026-07-28T13:09:04.159424+00:00','https://www.youtube.com/watch?v=d6EmVcAnImg',3,'https://ocrmirror.org/files/music/remixes/Mega_Man_3_Magnet_Man_Sonata_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5040,'Mélange Brew','Banjo-Kazooie','2026-07-28T13:09:03.874241+00:00','https://www.youtube.com/watch?v=KyhAnft4Vwo',36,'https://ocrmirror.org/files/music/remixes/Banjo-Kazooie_Melange_Brew_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5041,'Beasts All Over the Shop','Final Fantasy IX','2026-07-28T13:09:04.642289+00:00','https://www.youtube.com/watch?v=TMrKZoEQtAM',14,'https://ocrmirror.org/files/music/remixes/Final_Fantasy_9_Beasts_All_Over_the_Shop_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5042,'Rhythm of the Dream','The Legend of Zelda: Link''s Awakening','2026-07-29T08:05:46.235068+00:00','https://www.youtube.com/watch?v=pnNq9gw4O8Y',68,'https://ocrmirror.org/files/music/remixes/Legend_of_Zelda_Link''s_Awakening_Rhythm_of_the_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5043,'Under a Leaden Sky','Pyre','2026-08-10T12:07:46.573734+00:00','https://www.youtube.com/watch?v=JfpOL9ZDQ4M',95926,'https://ocrmirror.org/files/music/remixes/Pyre_Under_a_Leaden_Sky_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5044,'Geo Stelar ~ Wave Rider!','Mega Man Star Force: Pegasus','2026-08-10T12:07:46.395149+00:00','https://www.youtube.com/watch?v=l9-XFLRG8rU',38846,'https://ocrmirror.org/files/music/remixes/Mega_Man_Star_Force_Pegasus_Geo_Stelar_Wave_Rider_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5045,'Fighting Storms in Titania','Star Fox','2026-08-10T12:07:47.092777+00:00','https://www.youtube.com/watch?v=IU_2bWss2h8',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Fighting_Storms_in_Titania_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5046,'Idura''s Desperation','Lufia II: Rise of the Sinistrals','2026-08-13T00:06:26.827337+00:00','https://www.youtube.com/watch?v=Fs2Ws7fSwZs',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Idura''s_Desperation_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5047,'Of Twin Compasses','Lufia II: Rise of the Sinistrals','2026-07-24T01:59:10.878223+00:00','https://www.youtube.com/watch?v=ef4BDcBwe1Q',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Of_Twin_Compasses_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5048,'Hello, Goodbye','Lufia II: Rise of the Sinistrals','2026-07-26T02:02:51.520910+00:00','https://www.youtube.com/watch?v=0H7KMAjU_Gk',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Hello_Goodbye_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5049,'Excerion Dives Under','Lufia II: Rise of the Sinistrals','2026-07-27T02:10:32.334050+00:00','https://www.youtube.com/watch?v=6Yzp5MIs5d4',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Excerion_Dives_Under_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5050,'I''m Gonna Do What''s Called the World''s Most Difficult Trick (Mountain Mover RE:setMix)','Lufia II: Rise of the Sinistrals','2026-07-28T01:50:57.746008+00:00','https://www.youtube.com/watch?v=XYfq25V19Ak',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_I''m_Gonna_Do_What''s_Called_the_World''s_Most_Difficult_Trick_(Mountain_Mover_RE-setMix)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5051,'What Has Been (And What Can Never Be)','Super Mario Galaxy','2026-07-29T01:54:08.322748+00:00','https://www.youtube.com/watch?v=8GMB7uxbLX4',581,'https://ocrmirror.org/files/music/remixes/Super_Mario_Galaxy_What_Has_Been_(And_What_Can_Never_Be)_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5052,'The End of Fire','Dark Souls III','2026-07-29T01:54:08.795509+00:00','https://www.youtube.com/watch?v=3iCsxktSIAs',95446,'https://ocrmirror.org/files/music/remixes/Dark_Souls_3_The_End_of_Fire_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5053,'A Vile Medley','Gravity Circuit','2026-08-02T02:02:10.810504+00:00','https://www.youtube.com/watch?v=b54ZgC-P9fI',95921,'https://ocrmirror.org/files/music/remixes/Gravity_Circuit_A_Vile_Medley_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5054,'A Dance into a Dream','Child of Light','2026-08-02T02:02:11.308435+00:00','https://www.youtube.com/watch?v=0EplUrdv9Us',95842,'https://ocrmirror.org/files/music/remixes/Child_of_Light_A_Dance_into_a_Dream_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5055,'Cinnamon Rolls','Valdis Story: Abyssal City','2026-08-02T02:02:11.936262+00:00','https://www.youtube.com/watch?v=aa0HjQEMjQ4',95928,'https://ocrmirror.org/files/music/remixes/Valdis_Story_Abyssal_City_Cinnamon_Rolls_OC_ReMix.mp3',1);
+INSERT INTO "remix" VALUES(5056,'Step to the Journey','Lufia II: Rise of the Sinistrals','2026-08-02T02:02:12.477215+00:00','https://www.youtube.com/watch?v=xQUDfUWCxAc',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Step_to_the_Journey_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5057,'Cosmic Placidity','Lufia II: Rise of the Sinistrals','2026-08-03T02:04:28.907002+00:00','https://www.youtube.com/watch?v=2vv-UG7Oltk',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Cosmic_Placidity_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5058,'Panic at the Disc Golf Course','Lufia II: Rise of the Sinistrals','2026-08-16T00:51:04.354454+00:00','https://www.youtube.com/watch?v=4G44yZyO3qI',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Panic_at_the_Disc_Golf_Course_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5059,'Savior of the World','Lufia II: Rise of the Sinistrals','2026-08-17T00:49:15.163701+00:00','https://www.youtube.com/watch?v=fYXgcelYTSk',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Savior_of_the_World_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5060,'Toccata and Fugue in Dreams','Lufia II: Rise of the Sinistrals','2026-08-17T00:49:15.628355+00:00','https://www.youtube.com/watch?v=qUOjtgVepdw',157,'https://ocrmirror.org/files/music/remixes/Lufia_2_Toccata_and_Fugue_in_Dreams_OC_ReMix.mp3',0);
+INSERT INTO "remix" VALUES(5061,'Meteoric Slipstream','Star Fox','2026-08-17T00:49:15.910440+00:00','https://www.youtube.com/watch?v=brBEDE4TRwA',128,'https://ocrmirror.org/files/music/remixes/Star_Fox_Meteoric_Slipstream_OC_ReMix.mp3',0);
@@ -0,0 +1,935 @@
+INSERT INTO "remix_artist" VALUES(1,4279,1);
+INSERT INTO "remix_artist" VALUES(2,4279,1);
+INSERT INTO "remix_artist" VALUES(3,4279,1);
+INSERT INTO "remix_artist" VALUES(4,4339,1);
+INSERT INTO "remix_artist" VALUES(5,4339,1);
+INSERT INTO "remix_artist" VALUES(6,4279,1);
+INSERT INTO "remix_artist" VALUES(7,4279,1);
+INSERT INTO "remix_artist" VALUES(8,4341,1);
+INSERT INTO "remix_artist" VALUES(9,4279,1);
+INSERT INTO "remix_artist" VALUES(10,4279,1);
+INSERT INTO "remix_artist" VALUES(11,4279,1);
+INSERT INTO "remix_artist" VALUES(12,4397,1);
+INSERT INTO "remix_artist" VALUES(13,4279,1);
+INSERT INTO "remix_artist" VALUES(14,4279,1);
+INSERT INTO "remix_artist" VALUES(15,4279,1);
+INSERT INTO "remix_artist" VALUES(19,4405,1);
+INSERT INTO "remix_artist" VALUES(21,4343,1);
+INSERT INTO "remix_artist" VALUES(22,4421,1);
+INSERT INTO "remix_artist" VALUES(26,4279,1);
+INSERT INTO "remix_artist" VALUES(28,4396,1);
+INSERT INTO "remix_artist" VALUES(29,4295,1);
+INSERT INTO "remix_artist" VALUES(30,4279,1);
+INSERT INTO "remix_artist" VALUES(34,4387,1);
+INSERT INTO "remix_artist" VALUES(35,4344,1);
+INSERT INTO "remix_artist" VALUES(37,4281,1);
+INSERT INTO "remix_artist" VALUES(40,4279,1);
+INSERT INTO "remix_artist" VALUES(41,4279,1);
+INSERT INTO "remix_artist" VALUES(42,4341,1);
+INSERT INTO "remix_artist" VALUES(44,4340,1);
+INSERT INTO "remix_artist" VALUES(45,4281,1);
+INSERT INTO "remix_artist" VALUES(46,4400,1);
+INSERT INTO "remix_artist" VALUES(48,4295,1);
+INSERT INTO "remix_artist" VALUES(50,4279,1);
+INSERT INTO "remix_artist" VALUES(53,4414,1);
+INSERT INTO "remix_artist" VALUES(54,4333,1);
+INSERT INTO "remix_artist" VALUES(55,4279,1);
+INSERT INTO "remix_artist" VALUES(58,4279,1);
+INSERT INTO "remix_artist" VALUES(59,4414,1);
+INSERT INTO "remix_artist" VALUES(60,4366,1);
+INSERT INTO "remix_artist" VALUES(61,4279,1);
+INSERT INTO "remix_artist" VALUES(62,4373,1);
+INSERT INTO "remix_artist" VALUES(63,4328,1);
+INSERT INTO "remix_artist" VALUES(64,4373,1);
+INSERT INTO "remix_artist" VALUES(64,4716,1);
+INSERT INTO "remix_artist" VALUES(65,4290,1);
+INSERT INTO "remix_artist" VALUES(66,4279,1);
+INSERT INTO "remix_artist" VALUES(67,4284,1);
+INSERT INTO "remix_artist" VALUES(68,4318,1);
+INSERT INTO "remix_artist" VALUES(69,36,1);
+INSERT INTO "remix_artist" VALUES(71,4304,1);
+INSERT INTO "remix_artist" VALUES(72,4292,1);
+INSERT INTO "remix_artist" VALUES(73,4378,1);
+INSERT INTO "remix_artist" VALUES(76,4284,1);
+INSERT INTO "remix_artist" VALUES(77,4279,1);
+INSERT INTO "remix_artist" VALUES(78,4279,1);
+INSERT INTO "remix_artist" VALUES(80,4297,1);
+INSERT INTO "remix_artist" VALUES(81,4314,1);
+INSERT INTO "remix_artist" VALUES(82,4412,1);
+INSERT INTO "remix_artist" VALUES(83,4340,1);
+INSERT INTO "remix_artist" VALUES(84,4283,1);
+INSERT INTO "remix_artist" VALUES(85,4295,1);
+INSERT INTO "remix_artist" VALUES(87,4344,1);
+INSERT INTO "remix_artist" VALUES(88,4314,1);
+INSERT INTO "remix_artist" VALUES(89,4279,1);
+INSERT INTO "remix_artist" VALUES(90,4279,1);
+INSERT INTO "remix_artist" VALUES(93,4356,1);
+INSERT INTO "remix_artist" VALUES(94,4356,1);
+INSERT INTO "remix_artist" VALUES(95,4290,1);
+INSERT INTO "remix_artist" VALUES(96,4279,1);
+INSERT INTO "remix_artist" VALUES(98,4281,1);
+INSERT INTO "remix_artist" VALUES(100,4279,1);
+INSERT INTO "remix_artist" VALUES(102,4335,1);
+INSERT INTO "remix_artist" VALUES(105,4390,1);
+INSERT INTO "remix_artist" VALUES(109,4335,1);
+INSERT INTO "remix_artist" VALUES(110,4287,1);
+INSERT INTO "remix_artist" VALUES(111,4332,1);
+INSERT INTO "remix_artist" VALUES(112,4287,1);
+INSERT INTO "remix_artist" VALUES(115,4294,1);
+INSERT INTO "remix_artist" VALUES(118,4282,1);
+INSERT INTO "remix_artist" VALUES(120,4283,1);
+INSERT INTO "remix_artist" VALUES(122,4335,1);
+INSERT INTO "remix_artist" VALUES(123,4381,1);
+INSERT INTO "remix_artist" VALUES(124,4282,1);
+INSERT INTO "remix_artist" VALUES(126,4280,1);
+INSERT INTO "remix_artist" VALUES(127,4281,1);
+INSERT INTO "remix_artist" VALUES(129,4281,1);
+INSERT INTO "remix_artist" VALUES(130,4280,1);
+INSERT INTO "remix_artist" VALUES(132,4370,1);
+INSERT INTO "remix_artist" VALUES(134,4280,1);
+INSERT INTO "remix_artist" VALUES(137,4280,1);
+INSERT INTO "remix_artist" VALUES(139,4280,1);
+INSERT INTO "remix_artist" VALUES(140,4280,1);
+INSERT INTO "remix_artist" VALUES(143,4382,1);
+INSERT INTO "remix_artist" VALUES(145,4311,1);
+INSERT INTO "remix_artist" VALUES(146,4280,1);
+INSERT INTO "remix_artist" VALUES(148,4335,1);
+INSERT INTO "remix_artist" VALUES(149,4280,1);
+INSERT INTO "remix_artist" VALUES(150,4281,1);
+INSERT INTO "remix_artist" VALUES(151,4280,1);
+INSERT INTO "remix_artist" VALUES(152,4280,1);
+INSERT INTO "remix_artist" VALUES(155,4280,1);
+INSERT INTO "remix_artist" VALUES(156,4294,1);
+INSERT INTO "remix_artist" VALUES(157,4334,1);
+INSERT INTO "remix_artist" VALUES(158,4332,1);
+INSERT INTO "remix_artist" VALUES(159,4322,1);
+INSERT INTO "remix_artist" VALUES(160,4279,1);
+INSERT INTO "remix_artist" VALUES(161,4281,1);
+INSERT INTO "remix_artist" VALUES(162,4338,1);
+INSERT INTO "remix_artist" VALUES(163,4304,1);
+INSERT INTO "remix_artist" VALUES(165,4335,1);
+INSERT INTO "remix_artist" VALUES(166,4280,1);
+INSERT INTO "remix_artist" VALUES(167,4382,1);
+INSERT INTO "remix_artist" VALUES(168,4410,1);
+INSERT INTO "remix_artist" VALUES(170,4283,1);
+INSERT INTO "remix_artist" VALUES(171,4335,1);
+INSERT INTO "remix_artist" VALUES(172,4292,1);
+INSERT INTO "remix_artist" VALUES(173,4280,1);
+INSERT INTO "remix_artist" VALUES(175,4338,1);
+INSERT INTO "remix_artist" VALUES(176,4295,1);
+INSERT INTO "remix_artist" VALUES(177,4394,1);
+INSERT INTO "remix_artist" VALUES(178,4280,1);
+INSERT INTO "remix_artist" VALUES(179,4338,1);
+INSERT INTO "remix_artist" VALUES(180,4332,1);
+INSERT INTO "remix_artist" VALUES(181,4280,1);
+INSERT INTO "remix_artist" VALUES(182,4279,1);
+INSERT INTO "remix_artist" VALUES(183,4301,1);
+INSERT INTO "remix_artist" VALUES(184,4280,1);
+INSERT INTO "remix_artist" VALUES(186,4292,1);
+INSERT INTO "remix_artist" VALUES(188,4280,1);
+INSERT INTO "remix_artist" VALUES(189,4294,1);
+INSERT INTO "remix_artist" VALUES(190,4338,1);
+INSERT INTO "remix_artist" VALUES(191,4282,1);
+INSERT INTO "remix_artist" VALUES(192,4332,1);
+INSERT INTO "remix_artist" VALUES(193,36,1);
+INSERT INTO "remix_artist" VALUES(194,4280,1);
+INSERT INTO "remix_artist" VALUES(196,4385,1);
+INSERT INTO "remix_artist" VALUES(198,4283,1);
+INSERT INTO "remix_artist" VALUES(199,4324,1);
+INSERT INTO "remix_artist" VALUES(200,4301,1);
+INSERT INTO "remix_artist" VALUES(201,4280,1);
+INSERT INTO "remix_artist" VALUES(202,4317,1);
+INSERT INTO "remix_artist" VALUES(202,4422,1);
+INSERT INTO "remix_artist" VALUES(203,4336,1);
+INSERT INTO "remix_artist" VALUES(204,4304,1);
+INSERT INTO "remix_artist" VALUES(204,4427,1);
+INSERT INTO "remix_artist" VALUES(205,4281,1);
+INSERT INTO "remix_artist" VALUES(206,4328,1);
+INSERT INTO "remix_artist" VALUES(208,4279,1);
+INSERT INTO "remix_artist" VALUES(209,4357,1);
+INSERT INTO "remix_artist" VALUES(210,4392,1);
+INSERT INTO "remix_artist" VALUES(211,4280,1);
+INSERT INTO "remix_artist" VALUES(212,4375,1);
+INSERT INTO "remix_artist" VALUES(213,36,1);
+INSERT INTO "remix_artist" VALUES(214,4279,1);
+INSERT INTO "remix_artist" VALUES(215,4281,1);
+INSERT INTO "remix_artist" VALUES(216,4334,1);
+INSERT INTO "remix_artist" VALUES(217,4280,1);
+INSERT INTO "remix_artist" VALUES(218,4338,1);
+INSERT INTO "remix_artist" VALUES(221,4280,1);
+INSERT INTO "remix_artist" VALUES(222,4367,1);
+INSERT INTO "remix_artist" VALUES(224,4296,1);
+INSERT INTO "remix_artist" VALUES(225,4338,1);
+INSERT INTO "remix_artist" VALUES(226,4325,1);
+INSERT INTO "remix_artist" VALUES(226,4542,1);
+INSERT INTO "remix_artist" VALUES(227,4304,1);
+INSERT INTO "remix_artist" VALUES(227,4335,1);
+INSERT INTO "remix_artist" VALUES(228,4292,1);
+INSERT INTO "remix_artist" VALUES(229,4281,1);
+INSERT INTO "remix_artist" VALUES(231,4319,1);
+INSERT INTO "remix_artist" VALUES(232,4279,1);
+INSERT INTO "remix_artist" VALUES(233,4306,1);
+INSERT INTO "remix_artist" VALUES(234,4429,1);
+INSERT INTO "remix_artist" VALUES(235,4282,1);
+INSERT INTO "remix_artist" VALUES(237,4292,1);
+INSERT INTO "remix_artist" VALUES(238,4359,1);
+INSERT INTO "remix_artist" VALUES(239,4325,1);
+INSERT INTO "remix_artist" VALUES(240,4280,1);
+INSERT INTO "remix_artist" VALUES(241,4320,1);
+INSERT INTO "remix_artist" VALUES(245,4348,1);
+INSERT INTO "remix_artist" VALUES(246,4280,1);
+INSERT INTO "remix_artist" VALUES(247,4306,1);
+INSERT INTO "remix_artist" VALUES(248,4287,1);
+INSERT INTO "remix_artist" VALUES(249,4429,1);
+INSERT INTO "remix_artist" VALUES(250,4280,1);
+INSERT INTO "remix_artist" VALUES(251,4294,1);
+INSERT INTO "remix_artist" VALUES(252,4351,1);
+INSERT INTO "remix_artist" VALUES(254,4429,1);
+INSERT INTO "remix_artist" VALUES(255,4320,1);
+INSERT INTO "remix_artist" VALUES(256,4301,1);
+INSERT INTO "remix_artist" VALUES(256,4427,1);
+INSERT INTO "remix_artist" VALUES(257,4279,1);
+INSERT INTO "remix_artist" VALUES(258,4417,1);
+INSERT INTO "remix_artist" VALUES(260,14053,1);
+INSERT INTO "remix_artist" VALUES(261,4283,1);
+INSERT INTO "remix_artist" VALUES(262,4290,1);
+INSERT INTO "remix_artist" VALUES(263,4295,1);
+INSERT INTO "remix_artist" VALUES(264,4324,1);
+INSERT INTO "remix_artist" VALUES(264,4713,1);
+INSERT INTO "remix_artist" VALUES(268,4345,1);
+INSERT INTO "remix_artist" VALUES(269,4319,1);
+INSERT INTO "remix_artist" VALUES(270,4328,1);
+INSERT INTO "remix_artist" VALUES(271,4288,1);
+INSERT INTO "remix_artist" VALUES(273,4316,1);
+INSERT INTO "remix_artist" VALUES(274,4370,1);
+INSERT INTO "remix_artist" VALUES(275,4313,1);
+INSERT INTO "remix_artist" VALUES(276,4299,1);
+INSERT INTO "remix_artist" VALUES(277,4429,1);
+INSERT INTO "remix_artist" VALUES(278,14053,1);
+INSERT INTO "remix_artist" VALUES(280,4286,1);
+INSERT INTO "remix_artist" VALUES(282,4328,1);
+INSERT INTO "remix_artist" VALUES(283,4429,1);
+INSERT INTO "remix_artist" VALUES(285,14053,1);
+INSERT INTO "remix_artist" VALUES(286,4298,1);
+INSERT INTO "remix_artist" VALUES(287,4301,1);
+INSERT INTO "remix_artist" VALUES(291,4313,1);
+INSERT INTO "remix_artist" VALUES(292,4374,1);
+INSERT INTO "remix_artist" VALUES(294,4335,1);
+INSERT INTO "remix_artist" VALUES(294,4429,1);
+INSERT INTO "remix_artist" VALUES(295,4304,1);
+INSERT INTO "remix_artist" VALUES(295,4318,1);
+INSERT INTO "remix_artist" VALUES(295,4427,1);
+INSERT INTO "remix_artist" VALUES(295,4430,1);
+INSERT INTO "remix_artist" VALUES(296,4328,1);
+INSERT INTO "remix_artist" VALUES(300,4279,1);
+INSERT INTO "remix_artist" VALUES(301,4301,1);
+INSERT INTO "remix_artist" VALUES(302,4338,1);
+INSERT INTO "remix_artist" VALUES(303,4361,1);
+INSERT INTO "remix_artist" VALUES(304,4362,1);
+INSERT INTO "remix_artist" VALUES(305,4287,1);
+INSERT INTO "remix_artist" VALUES(307,4347,1);
+INSERT INTO "remix_artist" VALUES(308,4384,1);
+INSERT INTO "remix_artist" VALUES(309,4280,1);
+INSERT INTO "remix_artist" VALUES(310,4320,1);
+INSERT INTO "remix_artist" VALUES(311,4281,1);
+INSERT INTO "remix_artist" VALUES(312,4315,1);
+INSERT INTO "remix_artist" VALUES(313,4304,1);
+INSERT INTO "remix_artist" VALUES(313,4318,1);
+INSERT INTO "remix_artist" VALUES(314,4296,1);
+INSERT INTO "remix_artist" VALUES(316,4283,1);
+INSERT INTO "remix_artist" VALUES(316,4710,1);
+INSERT INTO "remix_artist" VALUES(317,4328,1);
+INSERT INTO "remix_artist" VALUES(318,4338,1);
+INSERT INTO "remix_artist" VALUES(319,4292,1);
+INSERT INTO "remix_artist" VALUES(320,4324,1);
+INSERT INTO "remix_artist" VALUES(322,4281,1);
+INSERT INTO "remix_artist" VALUES(323,4304,1);
+INSERT INTO "remix_artist" VALUES(324,4407,1);
+INSERT INTO "remix_artist" VALUES(325,4283,1);
+INSERT INTO "remix_artist" VALUES(326,4398,1);
+INSERT INTO "remix_artist" VALUES(327,4301,1);
+INSERT INTO "remix_artist" VALUES(328,4338,1);
+INSERT INTO "remix_artist" VALUES(329,4292,1);
+INSERT INTO "remix_artist" VALUES(330,4318,1);
+INSERT INTO "remix_artist" VALUES(331,4281,1);
+INSERT INTO "remix_artist" VALUES(332,4328,1);
+INSERT INTO "remix_artist" VALUES(333,4429,1);
+INSERT INTO "remix_artist" VALUES(334,4349,1);
+INSERT INTO "remix_artist" VALUES(335,4335,1);
+INSERT INTO "remix_artist" VALUES(336,4280,1);
+INSERT INTO "remix_artist" VALUES(337,4320,1);
+INSERT INTO "remix_artist" VALUES(338,4395,1);
+INSERT INTO "remix_artist" VALUES(339,4296,1);
+INSERT INTO "remix_artist" VALUES(340,4291,1);
+INSERT INTO "remix_artist" VALUES(341,4287,1);
+INSERT INTO "remix_artist" VALUES(342,4329,1);
+INSERT INTO "remix_artist" VALUES(343,4380,1);
+INSERT INTO "remix_artist" VALUES(344,4429,1);
+INSERT INTO "remix_artist" VALUES(345,4402,1);
+INSERT INTO "remix_artist" VALUES(346,4347,1);
+INSERT INTO "remix_artist" VALUES(347,4305,1);
+INSERT INTO "remix_artist" VALUES(348,4307,1);
+INSERT INTO "remix_artist" VALUES(349,4318,1);
+INSERT INTO "remix_artist" VALUES(349,4424,1);
+INSERT INTO "remix_artist" VALUES(350,4372,1);
+INSERT INTO "remix_artist" VALUES(352,4294,1);
+INSERT INTO "remix_artist" VALUES(353,4285,1);
+INSERT INTO "remix_artist" VALUES(354,4313,1);
+INSERT INTO "remix_artist" VALUES(355,4320,1);
+INSERT INTO "remix_artist" VALUES(355,4328,1);
+INSERT INTO "remix_artist" VALUES(356,4279,1);
+INSERT INTO "remix_artist" VALUES(357,4299,1);
+INSERT INTO "remix_artist" VALUES(358,4338,1);
+INSERT INTO "remix_artist" VALUES(360,4335,1);
+INSERT INTO "remix_artist" VALUES(361,4307,1);
+INSERT INTO "remix_artist" VALUES(362,4287,1);
+INSERT INTO "remix_artist" VALUES(363,4320,1);
+INSERT INTO "remix_artist" VALUES(363,4426,1);
+INSERT INTO "remix_artist" VALUES(364,4284,1);
+INSERT INTO "remix_artist" VALUES(365,4299,1);
+INSERT INTO "remix_artist" VALUES(366,4302,1);
+INSERT INTO "remix_artist" VALUES(368,4279,1);
+INSERT INTO "remix_artist" VALUES(369,4329,1);
+INSERT INTO "remix_artist" VALUES(370,4299,1);
+INSERT INTO "remix_artist" VALUES(370,4383,1);
+INSERT INTO "remix_artist" VALUES(371,4313,1);
+INSERT INTO "remix_artist" VALUES(372,4279,1);
+INSERT INTO "remix_artist" VALUES(373,4282,1);
+INSERT INTO "remix_artist" VALUES(374,4320,1);
+INSERT INTO "remix_artist" VALUES(375,4284,1);
+INSERT INTO "remix_artist" VALUES(376,4283,1);
+INSERT INTO "remix_artist" VALUES(376,4291,1);
+INSERT INTO "remix_artist" VALUES(377,4290,1);
+INSERT INTO "remix_artist" VALUES(378,4279,1);
+INSERT INTO "remix_artist" VALUES(379,4352,1);
+INSERT INTO "remix_artist" VALUES(379,5138,1);
+INSERT INTO "remix_artist" VALUES(380,4346,1);
+INSERT INTO "remix_artist" VALUES(381,4313,1);
+INSERT INTO "remix_artist" VALUES(382,36,1);
+INSERT INTO "remix_artist" VALUES(383,4279,1);
+INSERT INTO "remix_artist" VALUES(384,4338,1);
+INSERT INTO "remix_artist" VALUES(385,4288,1);
+INSERT INTO "remix_artist" VALUES(386,4301,1);
+INSERT INTO "remix_artist" VALUES(387,4280,1);
+INSERT INTO "remix_artist" VALUES(388,4318,1);
+INSERT INTO "remix_artist" VALUES(389,4354,1);
+INSERT INTO "remix_artist" VALUES(390,4408,1);
+INSERT INTO "remix_artist" VALUES(391,4292,1);
+INSERT INTO "remix_artist" VALUES(392,4331,1);
+INSERT INTO "remix_artist" VALUES(393,4324,1);
+INSERT INTO "remix_artist" VALUES(394,4281,1);
+INSERT INTO "remix_artist" VALUES(395,4371,1);
+INSERT INTO "remix_artist" VALUES(396,4429,1);
+INSERT INTO "remix_artist" VALUES(397,4285,1);
+INSERT INTO "remix_artist" VALUES(398,4282,1);
+INSERT INTO "remix_artist" VALUES(399,4279,1);
+INSERT INTO "remix_artist" VALUES(401,4334,1);
+INSERT INTO "remix_artist" VALUES(401,4715,1);
+INSERT INTO "remix_artist" VALUES(402,4294,1);
+INSERT INTO "remix_artist" VALUES(403,4301,1);
+INSERT INTO "remix_artist" VALUES(404,4318,1);
+INSERT INTO "remix_artist" VALUES(405,4279,1);
+INSERT INTO "remix_artist" VALUES(406,14053,1);
+INSERT INTO "remix_artist" VALUES(407,4360,1);
+INSERT INTO "remix_artist" VALUES(408,4298,1);
+INSERT INTO "remix_artist" VALUES(409,4362,1);
+INSERT INTO "remix_artist" VALUES(410,4283,1);
+INSERT INTO "remix_artist" VALUES(411,4296,1);
+INSERT INTO "remix_artist" VALUES(412,4286,1);
+INSERT INTO "remix_artist" VALUES(413,4291,1);
+INSERT INTO "remix_artist" VALUES(414,4403,1);
+INSERT INTO "remix_artist" VALUES(415,4358,1);
+INSERT INTO "remix_artist" VALUES(416,4323,1);
+INSERT INTO "remix_artist" VALUES(417,4335,1);
+INSERT INTO "remix_artist" VALUES(418,4280,1);
+INSERT INTO "remix_artist" VALUES(419,4372,1);
+INSERT INTO "remix_artist" VALUES(420,4285,1);
+INSERT INTO "remix_artist" VALUES(421,4393,1);
+INSERT INTO "remix_artist" VALUES(422,4305,1);
+INSERT INTO "remix_artist" VALUES(423,14053,1);
+INSERT INTO "remix_artist" VALUES(424,4291,1);
+INSERT INTO "remix_artist" VALUES(425,4328,1);
+INSERT INTO "remix_artist" VALUES(426,4298,1);
+INSERT INTO "remix_artist" VALUES(427,4287,1);
+INSERT INTO "remix_artist" VALUES(428,4291,1);
+INSERT INTO "remix_artist" VALUES(429,4320,1);
+INSERT INTO "remix_artist" VALUES(430,4288,1);
+INSERT INTO "remix_artist" VALUES(431,4310,1);
+INSERT INTO "remix_artist" VALUES(431,4711,1);
+INSERT INTO "remix_artist" VALUES(432,4312,1);
+INSERT INTO "remix_artist" VALUES(433,4295,1);
+INSERT INTO "remix_artist" VALUES(433,4423,1);
+INSERT INTO "remix_artist" VALUES(434,4279,1);
+INSERT INTO "remix_artist" VALUES(435,36,1);
+INSERT INTO "remix_artist" VALUES(436,4324,1);
+INSERT INTO "remix_artist" VALUES(437,4301,1);
+INSERT INTO "remix_artist" VALUES(438,4280,1);
+INSERT INTO "remix_artist" VALUES(439,4279,1);
+INSERT INTO "remix_artist" VALUES(440,4327,1);
+INSERT INTO "remix_artist" VALUES(442,4161,1);
+INSERT INTO "remix_artist" VALUES(442,4354,1);
+INSERT INTO "remix_artist" VALUES(443,4313,1);
+INSERT INTO "remix_artist" VALUES(444,4304,1);
+INSERT INTO "remix_artist" VALUES(444,4425,1);
+INSERT INTO "remix_artist" VALUES(445,4345,1);
+INSERT INTO "remix_artist" VALUES(446,4355,1);
+INSERT INTO "remix_artist" VALUES(447,4281,1);
+INSERT INTO "remix_artist" VALUES(448,4299,1);
+INSERT INTO "remix_artist" VALUES(449,4291,1);
+INSERT INTO "remix_artist" VALUES(449,4428,1);
+INSERT INTO "remix_artist" VALUES(450,4304,1);
+INSERT INTO "remix_artist" VALUES(450,4347,1);
+INSERT INTO "remix_artist" VALUES(451,4283,1);
+INSERT INTO "remix_artist" VALUES(451,4299,1);
+INSERT INTO "remix_artist" VALUES(453,4280,1);
+INSERT INTO "remix_artist" VALUES(454,4409,1);
+INSERT INTO "remix_artist" VALUES(455,4327,1);
+INSERT INTO "remix_artist" VALUES(456,4306,1);
+INSERT INTO "remix_artist" VALUES(457,4414,1);
+INSERT INTO "remix_artist" VALUES(458,4286,1);
+INSERT INTO "remix_artist" VALUES(459,4301,1);
+INSERT INTO "remix_artist" VALUES(460,4303,1);
+INSERT INTO "remix_artist" VALUES(461,36,1);
+INSERT INTO "remix_artist" VALUES(462,4296,1);
+INSERT INTO "remix_artist" VALUES(463,4301,1);
+INSERT INTO "remix_artist" VALUES(463,4320,1);
+INSERT INTO "remix_artist" VALUES(464,4285,1);
+INSERT INTO "remix_artist" VALUES(465,4295,1);
+INSERT INTO "remix_artist" VALUES(466,4280,1);
+INSERT INTO "remix_artist" VALUES(467,4279,1);
+INSERT INTO "remix_artist" VALUES(468,4292,1);
+INSERT INTO "remix_artist" VALUES(469,4330,1);
+INSERT INTO "remix_artist" VALUES(470,4311,1);
+INSERT INTO "remix_artist" VALUES(471,4376,1);
+INSERT INTO "remix_artist" VALUES(472,4304,1);
+INSERT INTO "remix_artist" VALUES(473,4313,1);
+INSERT INTO "remix_artist" VALUES(474,4297,1);
+INSERT INTO "remix_artist" VALUES(475,4281,1);
+INSERT INTO "remix_artist" VALUES(476,4309,1);
+INSERT INTO "remix_artist" VALUES(477,4298,1);
+INSERT INTO "remix_artist" VALUES(478,4280,1);
+INSERT INTO "remix_artist" VALUES(479,4379,1);
+INSERT INTO "remix_artist" VALUES(480,4286,1);
+INSERT INTO "remix_artist" VALUES(481,4401,1);
+INSERT INTO "remix_artist" VALUES(482,4288,1);
+INSERT INTO "remix_artist" VALUES(483,4300,1);
+INSERT INTO "remix_artist" VALUES(484,4289,1);
+INSERT INTO "remix_artist" VALUES(485,4280,1);
+INSERT INTO "remix_artist" VALUES(486,4303,1);
+INSERT INTO "remix_artist" VALUES(487,4318,1);
+INSERT INTO "remix_artist" VALUES(488,4350,1);
+INSERT INTO "remix_artist" VALUES(489,4287,1);
+INSERT INTO "remix_artist" VALUES(490,4279,1);
+INSERT INTO "remix_artist" VALUES(491,4386,1);
+INSERT INTO "remix_artist" VALUES(492,4347,1);
+INSERT INTO "remix_artist" VALUES(493,4406,1);
+INSERT INTO "remix_artist" VALUES(494,4293,1);
+INSERT INTO "remix_artist" VALUES(495,4289,1);
+INSERT INTO "remix_artist" VALUES(496,4280,1);
+INSERT INTO "remix_artist" VALUES(497,4304,1);
+INSERT INTO "remix_artist" VALUES(498,4279,1);
+INSERT INTO "remix_artist" VALUES(499,4294,1);
+INSERT INTO "remix_artist" VALUES(501,4416,1);
+INSERT INTO "remix_artist" VALUES(501,10681,1);
+INSERT INTO "remix_artist" VALUES(502,4350,1);
+INSERT INTO "remix_artist" VALUES(503,4365,1);
+INSERT INTO "remix_artist" VALUES(504,4284,1);
+INSERT INTO "remix_artist" VALUES(505,4297,1);
+INSERT INTO "remix_artist" VALUES(506,4301,1);
+INSERT INTO "remix_artist" VALUES(508,4286,1);
+INSERT INTO "remix_artist" VALUES(509,4279,1);
+INSERT INTO "remix_artist" VALUES(510,4326,1);
+INSERT INTO "remix_artist" VALUES(511,4335,1);
+INSERT INTO "remix_artist" VALUES(512,4299,1);
+INSERT INTO "remix_artist" VALUES(513,4413,1);
+INSERT INTO "remix_artist" VALUES(514,4280,1);
+INSERT INTO "remix_artist" VALUES(515,4349,1);
+INSERT INTO "remix_artist" VALUES(516,4308,1);
+INSERT INTO "remix_artist" VALUES(517,4295,1);
+INSERT INTO "remix_artist" VALUES(518,4283,1);
+INSERT INTO "remix_artist" VALUES(519,4289,1);
+INSERT INTO "remix_artist" VALUES(520,4288,1);
+INSERT INTO "remix_artist" VALUES(521,4290,1);
+INSERT INTO "remix_artist" VALUES(522,4296,1);
+INSERT INTO "remix_artist" VALUES(523,4291,1);
+INSERT INTO "remix_artist" VALUES(524,4360,1);
+INSERT INTO "remix_artist" VALUES(525,4351,1);
+INSERT INTO "remix_artist" VALUES(526,4298,1);
+INSERT INTO "remix_artist" VALUES(527,4369,1);
+INSERT INTO "remix_artist" VALUES(528,4338,1);
+INSERT INTO "remix_artist" VALUES(529,4293,1);
+INSERT INTO "remix_artist" VALUES(530,4287,1);
+INSERT INTO "remix_artist" VALUES(531,4324,1);
+INSERT INTO "remix_artist" VALUES(532,4399,1);
+INSERT INTO "remix_artist" VALUES(533,4326,1);
+INSERT INTO "remix_artist" VALUES(534,4346,1);
+INSERT INTO "remix_artist" VALUES(535,4281,1);
+INSERT INTO "remix_artist" VALUES(536,4391,1);
+INSERT INTO "remix_artist" VALUES(537,4285,1);
+INSERT INTO "remix_artist" VALUES(538,4313,1);
+INSERT INTO "remix_artist" VALUES(539,4289,1);
+INSERT INTO "remix_artist" VALUES(541,4279,1);
+INSERT INTO "remix_artist" VALUES(542,4323,1);
+INSERT INTO "remix_artist" VALUES(543,4364,1);
+INSERT INTO "remix_artist" VALUES(544,4280,1);
+INSERT INTO "remix_artist" VALUES(545,4359,1);
+INSERT INTO "remix_artist" VALUES(546,4297,1);
+INSERT INTO "remix_artist" VALUES(547,4388,1);
+INSERT INTO "remix_artist" VALUES(549,4415,1);
+INSERT INTO "remix_artist" VALUES(550,4326,1);
+INSERT INTO "remix_artist" VALUES(551,4299,1);
+INSERT INTO "remix_artist" VALUES(552,4293,1);
+INSERT INTO "remix_artist" VALUES(553,4321,1);
+INSERT INTO "remix_artist" VALUES(555,4331,1);
+INSERT INTO "remix_artist" VALUES(556,4337,1);
+INSERT INTO "remix_artist" VALUES(557,4399,1);
+INSERT INTO "remix_artist" VALUES(558,4404,1);
+INSERT INTO "remix_artist" VALUES(559,4320,1);
+INSERT INTO "remix_artist" VALUES(560,4297,1);
+INSERT INTO "remix_artist" VALUES(561,4357,1);
+INSERT INTO "remix_artist" VALUES(562,4377,1);
+INSERT INTO "remix_artist" VALUES(563,4285,1);
+INSERT INTO "remix_artist" VALUES(564,4353,1);
+INSERT INTO "remix_artist" VALUES(565,4389,1);
+INSERT INTO "remix_artist" VALUES(567,4280,1);
+INSERT INTO "remix_artist" VALUES(568,4321,1);
+INSERT INTO "remix_artist" VALUES(569,4293,1);
+INSERT INTO "remix_artist" VALUES(570,4362,1);
+INSERT INTO "remix_artist" VALUES(571,4364,1);
+INSERT INTO "remix_artist" VALUES(572,4290,1);
+INSERT INTO "remix_artist" VALUES(573,4363,1);
+INSERT INTO "remix_artist" VALUES(574,4295,1);
+INSERT INTO "remix_artist" VALUES(575,4326,1);
+INSERT INTO "remix_artist" VALUES(576,4419,1);
+INSERT INTO "remix_artist" VALUES(577,4418,1);
+INSERT INTO "remix_artist" VALUES(578,4420,1);
+INSERT INTO "remix_artist" VALUES(580,4313,1);
+INSERT INTO "remix_artist" VALUES(581,4280,1);
+INSERT INTO "remix_artist" VALUES(582,4279,1);
+INSERT INTO "remix_artist" VALUES(583,10709,1);
+INSERT INTO "remix_artist" VALUES(584,4324,1);
+INSERT INTO "remix_artist" VALUES(585,4330,1);
+INSERT INTO "remix_artist" VALUES(586,4432,1);
+INSERT INTO "remix_artist" VALUES(587,4433,1);
+INSERT INTO "remix_artist" VALUES(588,4434,1);
+INSERT INTO "remix_artist" VALUES(589,4435,1);
+INSERT INTO "remix_artist" VALUES(591,4293,1);
+INSERT INTO "remix_artist" VALUES(591,4326,1);
+INSERT INTO "remix_artist" VALUES(592,4388,1);
+INSERT INTO "remix_artist" VALUES(593,4436,1);
+INSERT INTO "remix_artist" VALUES(594,4293,1);
+INSERT INTO "remix_artist" VALUES(595,4306,1);
+INSERT INTO "remix_artist" VALUES(596,4279,1);
+INSERT INTO "remix_artist" VALUES(597,4321,1);
+INSERT INTO "remix_artist" VALUES(598,4437,1);
+INSERT INTO "remix_artist" VALUES(599,4438,1);
+INSERT INTO "remix_artist" VALUES(600,4288,1);
+INSERT INTO "remix_artist" VALUES(601,4283,1);
+INSERT INTO "remix_artist" VALUES(602,4313,1);
+INSERT INTO "remix_artist" VALUES(603,4337,1);
+INSERT INTO "remix_artist" VALUES(604,4364,1);
+INSERT INTO "remix_artist" VALUES(605,4439,1);
+INSERT INTO "remix_artist" VALUES(605,18843,1);
+INSERT INTO "remix_artist" VALUES(606,4295,1);
+INSERT INTO "remix_artist" VALUES(607,4420,1);
+INSERT INTO "remix_artist" VALUES(608,4331,1);
+INSERT INTO "remix_artist" VALUES(609,4440,1);
+INSERT INTO "remix_artist" VALUES(610,4441,1);
+INSERT INTO "remix_artist" VALUES(611,4354,1);
+INSERT INTO "remix_artist" VALUES(612,4442,1);
+INSERT INTO "remix_artist" VALUES(613,4297,1);
+INSERT INTO "remix_artist" VALUES(614,4299,1);
+INSERT INTO "remix_artist" VALUES(615,4407,1);
+INSERT INTO "remix_artist" VALUES(616,4357,1);
+INSERT INTO "remix_artist" VALUES(617,4443,1);
+INSERT INTO "remix_artist" VALUES(618,4444,1);
+INSERT INTO "remix_artist" VALUES(619,4402,1);
+INSERT INTO "remix_artist" VALUES(620,4326,1);
+INSERT INTO "remix_artist" VALUES(621,4445,1);
+INSERT INTO "remix_artist" VALUES(622,4446,1);
+INSERT INTO "remix_artist" VALUES(623,4298,1);
+INSERT INTO "remix_artist" VALUES(624,4346,1);
+INSERT INTO "remix_artist" VALUES(625,4302,1);
+INSERT INTO "remix_artist" VALUES(626,4323,1);
+INSERT INTO "remix_artist" VALUES(627,4286,1);
+INSERT INTO "remix_artist" VALUES(628,4324,1);
+INSERT INTO "remix_artist" VALUES(629,4302,1);
+INSERT INTO "remix_artist" VALUES(630,4391,1);
+INSERT INTO "remix_artist" VALUES(631,4420,1);
+INSERT INTO "remix_artist" VALUES(632,4440,1);
+INSERT INTO "remix_artist" VALUES(633,4281,1);
+INSERT INTO "remix_artist" VALUES(634,4434,1);
+INSERT INTO "remix_artist" VALUES(636,4434,1);
+INSERT INTO "remix_artist" VALUES(637,4434,1);
+INSERT INTO "remix_artist" VALUES(638,4434,1);
+INSERT INTO "remix_artist" VALUES(639,4434,1);
+INSERT INTO "remix_artist" VALUES(640,4434,1);
+INSERT INTO "remix_artist" VALUES(641,4434,1);
+INSERT INTO "remix_artist" VALUES(642,4434,1);
+INSERT INTO "remix_artist" VALUES(643,4434,1);
+INSERT INTO "remix_artist" VALUES(643,4447,1);
+INSERT INTO "remix_artist" VALUES(644,4434,1);
+INSERT INTO "remix_artist" VALUES(645,4434,1);
+INSERT INTO "remix_artist" VALUES(646,4434,1);
+INSERT INTO "remix_artist" VALUES(647,4328,1);
+INSERT INTO "remix_artist" VALUES(647,4331,1);
+INSERT INTO "remix_artist" VALUES(647,4434,1);
+INSERT INTO "remix_artist" VALUES(648,4434,1);
+INSERT INTO "remix_artist" VALUES(649,4434,1);
+INSERT INTO "remix_artist" VALUES(650,4434,1);
+INSERT INTO "remix_artist" VALUES(651,4298,1);
+INSERT INTO "remix_artist" VALUES(652,4326,1);
+INSERT INTO "remix_artist" VALUES(653,4304,1);
+INSERT INTO "remix_artist" VALUES(654,4331,1);
+INSERT INTO "remix_artist" VALUES(655,4279,1);
+INSERT INTO "remix_artist" VALUES(656,4296,1);
+INSERT INTO "remix_artist" VALUES(657,4302,1);
+INSERT INTO "remix_artist" VALUES(658,4448,1);
+INSERT INTO "remix_artist" VALUES(659,4449,1);
+INSERT INTO "remix_artist" VALUES(660,4450,1);
+INSERT INTO "remix_artist" VALUES(661,4451,1);
+INSERT INTO "remix_artist" VALUES(662,4453,1);
+INSERT INTO "remix_artist" VALUES(663,4388,1);
+INSERT INTO "remix_artist" VALUES(664,4391,1);
+INSERT INTO "remix_artist" VALUES(665,4286,1);
+INSERT INTO "remix_artist" VALUES(665,4287,1);
+INSERT INTO "remix_artist" VALUES(666,4454,1);
+INSERT INTO "remix_artist" VALUES(667,4452,1);
+INSERT INTO "remix_artist" VALUES(668,4303,1);
+INSERT INTO "remix_artist" VALUES(670,4455,1);
+INSERT INTO "remix_artist" VALUES(671,4456,1);
+INSERT INTO "remix_artist" VALUES(673,4443,1);
+INSERT INTO "remix_artist" VALUES(674,4279,1);
+INSERT INTO "remix_artist" VALUES(675,4326,1);
+INSERT INTO "remix_artist" VALUES(676,4298,1);
+INSERT INTO "remix_artist" VALUES(677,4331,1);
+INSERT INTO "remix_artist" VALUES(678,4323,1);
+INSERT INTO "remix_artist" VALUES(680,4458,1);
+INSERT INTO "remix_artist" VALUES(681,4297,1);
+INSERT INTO "remix_artist" VALUES(682,4280,1);
+INSERT INTO "remix_artist" VALUES(683,4459,1);
+INSERT INTO "remix_artist" VALUES(683,4607,1);
+INSERT INTO "remix_artist" VALUES(683,4708,1);
+INSERT INTO "remix_artist" VALUES(684,4325,1);
+INSERT INTO "remix_artist" VALUES(684,4395,1);
+INSERT INTO "remix_artist" VALUES(684,4542,1);
+INSERT INTO "remix_artist" VALUES(685,4460,1);
+INSERT INTO "remix_artist" VALUES(686,4313,1);
+INSERT INTO "remix_artist" VALUES(687,4293,1);
+INSERT INTO "remix_artist" VALUES(688,4461,1);
+INSERT INTO "remix_artist" VALUES(689,4362,1);
+INSERT INTO "remix_artist" VALUES(689,4714,1);
+INSERT INTO "remix_artist" VALUES(690,4388,1);
+INSERT INTO "remix_artist" VALUES(691,4279,1);
+INSERT INTO "remix_artist" VALUES(692,4462,1);
+INSERT INTO "remix_artist" VALUES(693,4296,1);
+INSERT INTO "remix_artist" VALUES(694,4300,1);
+INSERT INTO "remix_artist" VALUES(697,4463,1);
+INSERT INTO "remix_artist" VALUES(698,4419,1);
+INSERT INTO "remix_artist" VALUES(699,4403,1);
+INSERT INTO "remix_artist" VALUES(700,4446,1);
+INSERT INTO "remix_artist" VALUES(701,4326,1);
+INSERT INTO "remix_artist" VALUES(702,4391,1);
+INSERT INTO "remix_artist" VALUES(703,4330,1);
+INSERT INTO "remix_artist" VALUES(704,4464,1);
+INSERT INTO "remix_artist" VALUES(705,4365,1);
+INSERT INTO "remix_artist" VALUES(706,4331,1);
+INSERT INTO "remix_artist" VALUES(707,4445,1);
+INSERT INTO "remix_artist" VALUES(708,4335,1);
+INSERT INTO "remix_artist" VALUES(709,4354,1);
+INSERT INTO "remix_artist" VALUES(710,4465,1);
+INSERT INTO "remix_artist" VALUES(711,4420,1);
+INSERT INTO "remix_artist" VALUES(712,4463,1);
+INSERT INTO "remix_artist" VALUES(713,4466,1);
+INSERT INTO "remix_artist" VALUES(714,4467,1);
+INSERT INTO "remix_artist" VALUES(715,4432,1);
+INSERT INTO "remix_artist" VALUES(716,4468,1);
+INSERT INTO "remix_artist" VALUES(717,4429,1);
+INSERT INTO "remix_artist" VALUES(717,4469,1);
+INSERT INTO "remix_artist" VALUES(717,5900,1);
+INSERT INTO "remix_artist" VALUES(718,4470,1);
+INSERT INTO "remix_artist" VALUES(719,4471,1);
+INSERT INTO "remix_artist" VALUES(720,4303,1);
+INSERT INTO "remix_artist" VALUES(721,4450,1);
+INSERT INTO "remix_artist" VALUES(722,4472,1);
+INSERT INTO "remix_artist" VALUES(723,4804,1);
+INSERT INTO "remix_artist" VALUES(724,4443,1);
+INSERT INTO "remix_artist" VALUES(725,4473,1);
+INSERT INTO "remix_artist" VALUES(726,4324,1);
+INSERT INTO "remix_artist" VALUES(727,4802,1);
+INSERT INTO "remix_artist" VALUES(728,4456,1);
+INSERT INTO "remix_artist" VALUES(729,4419,1);
+INSERT INTO "remix_artist" VALUES(730,4299,1);
+INSERT INTO "remix_artist" VALUES(731,4455,1);
+INSERT INTO "remix_artist" VALUES(732,4313,1);
+INSERT INTO "remix_artist" VALUES(733,4474,1);
+INSERT INTO "remix_artist" VALUES(734,4475,1);
+INSERT INTO "remix_artist" VALUES(735,4318,1);
+INSERT INTO "remix_artist" VALUES(736,4476,1);
+INSERT INTO "remix_artist" VALUES(738,4388,1);
+INSERT INTO "remix_artist" VALUES(739,4477,1);
+INSERT INTO "remix_artist" VALUES(740,4335,1);
+INSERT INTO "remix_artist" VALUES(741,68,1);
+INSERT INTO "remix_artist" VALUES(742,4478,1);
+INSERT INTO "remix_artist" VALUES(743,4468,1);
+INSERT INTO "remix_artist" VALUES(744,4293,1);
+INSERT INTO "remix_artist" VALUES(745,4443,1);
+INSERT INTO "remix_artist" VALUES(746,4462,1);
+INSERT INTO "remix_artist" VALUES(747,4388,1);
+INSERT INTO "remix_artist" VALUES(748,4296,1);
+INSERT INTO "remix_artist" VALUES(749,14053,1);
+INSERT INTO "remix_artist" VALUES(750,4479,1);
+INSERT INTO "remix_artist" VALUES(751,4804,1);
+INSERT INTO "remix_artist" VALUES(752,4321,1);
+INSERT INTO "remix_artist" VALUES(753,4279,1);
+INSERT INTO "remix_artist" VALUES(754,4313,1);
+INSERT INTO "remix_artist" VALUES(755,4480,1);
+INSERT INTO "remix_artist" VALUES(756,4481,1);
+INSERT INTO "remix_artist" VALUES(757,4463,1);
+INSERT INTO "remix_artist" VALUES(758,4482,1);
+INSERT INTO "remix_artist" VALUES(759,4483,1);
+INSERT INTO "remix_artist" VALUES(760,4484,1);
+INSERT INTO "remix_artist" VALUES(761,4291,1);
+INSERT INTO "remix_artist" VALUES(762,4485,1);
+INSERT INTO "remix_artist" VALUES(763,4486,1);
+INSERT INTO "remix_artist" VALUES(764,4487,1);
+INSERT INTO "remix_artist" VALUES(765,4488,1);
+INSERT INTO "remix_artist" VALUES(766,4293,1);
+INSERT INTO "remix_artist" VALUES(767,4489,1);
+INSERT INTO "remix_artist" VALUES(768,4283,1);
+INSERT INTO "remix_artist" VALUES(769,4490,1);
+INSERT INTO "remix_artist" VALUES(770,4357,1);
+INSERT INTO "remix_artist" VALUES(771,4299,1);
+INSERT INTO "remix_artist" VALUES(772,4434,1);
+INSERT INTO "remix_artist" VALUES(773,4326,1);
+INSERT INTO "remix_artist" VALUES(774,4420,1);
+INSERT INTO "remix_artist" VALUES(775,4491,1);
+INSERT INTO "remix_artist" VALUES(776,4443,1);
+INSERT INTO "remix_artist" VALUES(777,4296,1);
+INSERT INTO "remix_artist" VALUES(778,4440,1);
+INSERT INTO "remix_artist" VALUES(779,4419,1);
+INSERT INTO "remix_artist" VALUES(780,4391,1);
+INSERT INTO "remix_artist" VALUES(781,4461,1);
+INSERT INTO "remix_artist" VALUES(782,4313,1);
+INSERT INTO "remix_artist" VALUES(784,4492,1);
+INSERT INTO "remix_artist" VALUES(785,4493,1);
+INSERT INTO "remix_artist" VALUES(786,4420,1);
+INSERT INTO "remix_artist" VALUES(787,4441,1);
+INSERT INTO "remix_artist" VALUES(788,4402,1);
+INSERT INTO "remix_artist" VALUES(789,4403,1);
+INSERT INTO "remix_artist" VALUES(790,4323,1);
+INSERT INTO "remix_artist" VALUES(791,4494,1);
+INSERT INTO "remix_artist" VALUES(792,4279,1);
+INSERT INTO "remix_artist" VALUES(793,4479,1);
+INSERT INTO "remix_artist" VALUES(794,14053,1);
+INSERT INTO "remix_artist" VALUES(795,4495,1);
+INSERT INTO "remix_artist" VALUES(796,4463,1);
+INSERT INTO "remix_artist" VALUES(797,4496,1);
+INSERT INTO "remix_artist" VALUES(798,4331,1);
+INSERT INTO "remix_artist" VALUES(799,4497,1);
+INSERT INTO "remix_artist" VALUES(800,4381,1);
+INSERT INTO "remix_artist" VALUES(801,4284,1);
+INSERT INTO "remix_artist" VALUES(802,4320,1);
+INSERT INTO "remix_artist" VALUES(803,4388,1);
+INSERT INTO "remix_artist" VALUES(804,4498,1);
+INSERT INTO "remix_artist" VALUES(805,4486,1);
+INSERT INTO "remix_artist" VALUES(806,4440,1);
+INSERT INTO "remix_artist" VALUES(807,4443,1);
+INSERT INTO "remix_artist" VALUES(808,4313,1);
+INSERT INTO "remix_artist" VALUES(809,4432,1);
+INSERT INTO "remix_artist" VALUES(810,4499,1);
+INSERT INTO "remix_artist" VALUES(811,4438,1);
+INSERT INTO "remix_artist" VALUES(812,14053,1);
+INSERT INTO "remix_artist" VALUES(813,4467,1);
+INSERT INTO "remix_artist" VALUES(814,4279,1);
+INSERT INTO "remix_artist" VALUES(815,4465,1);
+INSERT INTO "remix_artist" VALUES(816,4321,1);
+INSERT INTO "remix_artist" VALUES(817,4500,1);
+INSERT INTO "remix_artist" VALUES(818,4291,1);
+INSERT INTO "remix_artist" VALUES(819,4419,1);
+INSERT INTO "remix_artist" VALUES(821,4501,1);
+INSERT INTO "remix_artist" VALUES(822,4502,1);
+INSERT INTO "remix_artist" VALUES(823,4377,1);
+INSERT INTO "remix_artist" VALUES(824,4450,1);
+INSERT INTO "remix_artist" VALUES(825,4313,1);
+INSERT INTO "remix_artist" VALUES(826,4280,1);
+INSERT INTO "remix_artist" VALUES(827,4503,1);
+INSERT INTO "remix_artist" VALUES(828,4504,1);
+INSERT INTO "remix_artist" VALUES(828,4709,1);
+INSERT INTO "remix_artist" VALUES(829,4505,1);
+INSERT INTO "remix_artist" VALUES(830,4506,1);
+INSERT INTO "remix_artist" VALUES(831,4507,1);
+INSERT INTO "remix_artist" VALUES(832,4443,1);
+INSERT INTO "remix_artist" VALUES(833,4324,1);
+INSERT INTO "remix_artist" VALUES(834,4508,1);
+INSERT INTO "remix_artist" VALUES(835,4509,1);
+INSERT INTO "remix_artist" VALUES(836,4455,1);
+INSERT INTO "remix_artist" VALUES(837,4288,1);
+INSERT INTO "remix_artist" VALUES(838,4510,1);
+INSERT INTO "remix_artist" VALUES(839,4493,1);
+INSERT INTO "remix_artist" VALUES(840,4479,1);
+INSERT INTO "remix_artist" VALUES(841,4291,1);
+INSERT INTO "remix_artist" VALUES(841,4323,1);
+INSERT INTO "remix_artist" VALUES(842,4450,1);
+INSERT INTO "remix_artist" VALUES(843,4511,1);
+INSERT INTO "remix_artist" VALUES(844,4386,1);
+INSERT INTO "remix_artist" VALUES(845,4297,1);
+INSERT INTO "remix_artist" VALUES(846,4318,1);
+INSERT INTO "remix_artist" VALUES(847,4475,1);
+INSERT INTO "remix_artist" VALUES(848,4285,1);
+INSERT INTO "remix_artist" VALUES(849,4512,1);
+INSERT INTO "remix_artist" VALUES(850,4283,1);
+INSERT INTO "remix_artist" VALUES(851,4391,1);
+INSERT INTO "remix_artist" VALUES(852,4331,1);
+INSERT INTO "remix_artist" VALUES(853,4468,1);
+INSERT INTO "remix_artist" VALUES(854,4505,1);
+INSERT INTO "remix_artist" VALUES(855,4513,1);
+INSERT INTO "remix_artist" VALUES(856,4463,1);
+INSERT INTO "remix_artist" VALUES(857,4514,1);
+INSERT INTO "remix_artist" VALUES(858,4368,1);
+INSERT INTO "remix_artist" VALUES(859,4486,1);
+INSERT INTO "remix_artist" VALUES(860,4280,1);
+INSERT INTO "remix_artist" VALUES(861,4168,1);
+INSERT INTO "remix_artist" VALUES(862,4515,1);
+INSERT INTO "remix_artist" VALUES(863,4516,1);
+INSERT INTO "remix_artist" VALUES(864,4517,1);
+INSERT INTO "remix_artist" VALUES(865,4518,1);
+INSERT INTO "remix_artist" VALUES(866,4311,1);
+INSERT INTO "remix_artist" VALUES(867,4443,1);
+INSERT INTO "remix_artist" VALUES(868,4449,1);
+INSERT INTO "remix_artist" VALUES(869,4519,1);
+INSERT INTO "remix_artist" VALUES(871,4433,1);
+INSERT INTO "remix_artist" VALUES(872,4521,1);
+INSERT INTO "remix_artist" VALUES(873,4438,1);
+INSERT INTO "remix_artist" VALUES(874,4297,1);
+INSERT INTO "remix_artist" VALUES(875,4522,1);
+INSERT INTO "remix_artist" VALUES(876,4420,1);
+INSERT INTO "remix_artist" VALUES(877,4523,1);
+INSERT INTO "remix_artist" VALUES(878,4391,1);
+INSERT INTO "remix_artist" VALUES(879,4419,1);
+INSERT INTO "remix_artist" VALUES(880,4402,1);
+INSERT INTO "remix_artist" VALUES(881,4313,1);
+INSERT INTO "remix_artist" VALUES(882,4518,1);
+INSERT INTO "remix_artist" VALUES(883,4285,1);
+INSERT INTO "remix_artist" VALUES(884,4279,1);
+INSERT INTO "remix_artist" VALUES(885,4287,1);
+INSERT INTO "remix_artist" VALUES(886,4297,1);
+INSERT INTO "remix_artist" VALUES(887,4318,1);
+INSERT INTO "remix_artist" VALUES(888,4803,1);
+INSERT INTO "remix_artist" VALUES(889,4381,1);
+INSERT INTO "remix_artist" VALUES(890,4412,1);
+INSERT INTO "remix_artist" VALUES(891,4283,1);
+INSERT INTO "remix_artist" VALUES(891,4288,1);
+INSERT INTO "remix_artist" VALUES(891,4331,1);
+INSERT INTO "remix_artist" VALUES(892,4320,1);
+INSERT INTO "remix_artist" VALUES(893,4463,1);
+INSERT INTO "remix_artist" VALUES(894,4377,1);
+INSERT INTO "remix_artist" VALUES(895,4524,1);
+INSERT INTO "remix_artist" VALUES(896,4441,1);
+INSERT INTO "remix_artist" VALUES(897,4433,1);
+INSERT INTO "remix_artist" VALUES(897,4525,1);
+INSERT INTO "remix_artist" VALUES(898,4330,1);
+INSERT INTO "remix_artist" VALUES(899,4526,1);
+INSERT INTO "remix_artist" VALUES(900,4292,1);
+INSERT INTO "remix_artist" VALUES(901,4527,1);
+INSERT INTO "remix_artist" VALUES(902,4331,1);
+INSERT INTO "remix_artist" VALUES(902,4434,1);
+INSERT INTO "remix_artist" VALUES(903,4528,1);
+INSERT INTO "remix_artist" VALUES(904,4386,1);
+INSERT INTO "remix_artist" VALUES(905,4293,1);
+INSERT INTO "remix_artist" VALUES(906,4368,1);
+INSERT INTO "remix_artist" VALUES(907,4426,1);
+INSERT INTO "remix_artist" VALUES(908,4529,1);
+INSERT INTO "remix_artist" VALUES(909,4518,1);
+INSERT INTO "remix_artist" VALUES(910,4443,1);
+INSERT INTO "remix_artist" VALUES(911,4391,1);
+INSERT INTO "remix_artist" VALUES(912,4486,1);
+INSERT INTO "remix_artist" VALUES(913,4512,1);
+INSERT INTO "remix_artist" VALUES(914,4280,1);
+INSERT INTO "remix_artist" VALUES(916,4331,1);
+INSERT INTO "remix_artist" VALUES(917,4530,1);
+INSERT INTO "remix_artist" VALUES(918,4531,1);
+INSERT INTO "remix_artist" VALUES(919,4496,1);
+INSERT INTO "remix_artist" VALUES(920,4432,1);
+INSERT INTO "remix_artist" VALUES(920,4455,1);
+INSERT INTO "remix_artist" VALUES(921,4313,1);
+INSERT INTO "remix_artist" VALUES(922,4532,1);
+INSERT INTO "remix_artist" VALUES(923,4297,1);
+INSERT INTO "remix_artist" VALUES(924,4326,1);
+INSERT INTO "remix_artist" VALUES(925,4533,1);
+INSERT INTO "remix_artist" VALUES(926,4287,1);
+INSERT INTO "remix_artist" VALUES(927,4301,1);
+INSERT INTO "remix_artist" VALUES(927,4318,1);
+INSERT INTO "remix_artist" VALUES(928,4534,1);
+INSERT INTO "remix_artist" VALUES(929,4286,1);
+INSERT INTO "remix_artist" VALUES(930,4535,1);
+INSERT INTO "remix_artist" VALUES(931,4524,1);
+INSERT INTO "remix_artist" VALUES(932,4536,1);
+INSERT INTO "remix_artist" VALUES(933,4426,1);
+INSERT INTO "remix_artist" VALUES(934,4512,1);
+INSERT INTO "remix_artist" VALUES(935,4446,1);
+INSERT INTO "remix_artist" VALUES(936,4537,1);
+INSERT INTO "remix_artist" VALUES(937,4450,1);
+INSERT INTO "remix_artist" VALUES(938,4513,1);
+INSERT INTO "remix_artist" VALUES(939,4279,1);
+INSERT INTO "remix_artist" VALUES(940,4479,1);
+INSERT INTO "remix_artist" VALUES(941,4313,1);
+INSERT INTO "remix_artist" VALUES(942,4538,1);
+INSERT INTO "remix_artist" VALUES(943,4482,1);
+INSERT INTO "remix_artist" VALUES(944,4391,1);
+INSERT INTO "remix_artist" VALUES(945,4468,1);
+INSERT INTO "remix_artist" VALUES(946,4299,1);
+INSERT INTO "remix_artist" VALUES(947,4539,1);
+INSERT INTO "remix_artist" VALUES(948,4540,1);
+INSERT INTO "remix_artist" VALUES(949,4297,1);
+INSERT INTO "remix_artist" VALUES(950,4324,1);
+INSERT INTO "remix_artist" VALUES(951,4412,1);
+INSERT INTO "remix_artist" VALUES(951,4511,1);
+INSERT INTO "remix_artist" VALUES(952,4420,1);
+INSERT INTO "remix_artist" VALUES(953,4518,1);
+INSERT INTO "remix_artist" VALUES(954,4463,1);
+INSERT INTO "remix_artist" VALUES(955,4530,1);
+INSERT INTO "remix_artist" VALUES(956,4403,1);
+INSERT INTO "remix_artist" VALUES(957,4526,1);
+INSERT INTO "remix_artist" VALUES(958,4541,1);
+INSERT INTO "remix_artist" VALUES(959,4313,1);
+INSERT INTO "remix_artist" VALUES(960,4443,1);
+INSERT INTO "remix_artist" VALUES(961,4510,1);
+INSERT INTO "remix_artist" VALUES(962,4477,1);
+INSERT INTO "remix_artist" VALUES(963,4542,1);
+INSERT INTO "remix_artist" VALUES(964,4297,1);
+INSERT INTO "remix_artist" VALUES(965,4493,1);
+INSERT INTO "remix_artist" VALUES(966,4377,1);
+INSERT INTO "remix_artist" VALUES(967,4524,1);
+INSERT INTO "remix_artist" VALUES(968,4543,1);
+INSERT INTO "remix_artist" VALUES(969,4313,1);
+INSERT INTO "remix_artist" VALUES(970,4281,1);
+INSERT INTO "remix_artist" VALUES(971,4331,1);
+INSERT INTO "remix_artist" VALUES(972,4544,1);
+INSERT INTO "remix_artist" VALUES(973,4515,1);
+INSERT INTO "remix_artist" VALUES(974,4301,1);
+INSERT INTO "remix_artist" VALUES(974,4304,1);
+INSERT INTO "remix_artist" VALUES(974,4425,1);
+INSERT INTO "remix_artist" VALUES(975,4501,1);
+INSERT INTO "remix_artist" VALUES(976,4426,1);
+INSERT INTO "remix_artist" VALUES(977,4326,1);
+INSERT INTO "remix_artist" VALUES(978,4506,1);
+INSERT INTO "remix_artist" VALUES(980,4293,1);
+INSERT INTO "remix_artist" VALUES(981,4545,1);
+INSERT INTO "remix_artist" VALUES(982,4482,1);
+INSERT INTO "remix_artist" VALUES(983,4516,1);
+INSERT INTO "remix_artist" VALUES(984,4546,1);
+INSERT INTO "remix_artist" VALUES(985,4547,1);
+INSERT INTO "remix_artist" VALUES(986,4297,1);
+INSERT INTO "remix_artist" VALUES(987,4313,1);
+INSERT INTO "remix_artist" VALUES(988,4403,1);
+INSERT INTO "remix_artist" VALUES(989,4548,1);
+INSERT INTO "remix_artist" VALUES(990,4549,1);
+INSERT INTO "remix_artist" VALUES(991,4550,1);
+INSERT INTO "remix_artist" VALUES(992,4551,1);
+INSERT INTO "remix_artist" VALUES(993,4391,1);
+INSERT INTO "remix_artist" VALUES(994,4553,1);
+INSERT INTO "remix_artist" VALUES(995,4552,1);
+INSERT INTO "remix_artist" VALUES(996,4420,1);
+INSERT INTO "remix_artist" VALUES(998,4555,1);
+INSERT INTO "remix_artist" VALUES(999,4293,1);
@@ -0,0 +1,1193 @@
+INSERT INTO "remix_artist" VALUES(1000,4279,1);
+INSERT INTO "remix_artist" VALUES(1001,4313,1);
+INSERT INTO "remix_artist" VALUES(1002,4556,1);
+INSERT INTO "remix_artist" VALUES(1003,4529,1);
+INSERT INTO "remix_artist" VALUES(1004,4510,1);
+INSERT INTO "remix_artist" VALUES(1005,4487,1);
+INSERT INTO "remix_artist" VALUES(1006,4518,1);
+INSERT INTO "remix_artist" VALUES(1007,4557,1);
+INSERT INTO "remix_artist" VALUES(1008,4558,1);
+INSERT INTO "remix_artist" VALUES(1009,4440,1);
+INSERT INTO "remix_artist" VALUES(1010,4482,1);
+INSERT INTO "remix_artist" VALUES(1011,4559,1);
+INSERT INTO "remix_artist" VALUES(1012,4486,1);
+INSERT INTO "remix_artist" VALUES(1013,4511,1);
+INSERT INTO "remix_artist" VALUES(1014,4443,1);
+INSERT INTO "remix_artist" VALUES(1015,4313,1);
+INSERT INTO "remix_artist" VALUES(1016,4331,1);
+INSERT INTO "remix_artist" VALUES(1017,4388,1);
+INSERT INTO "remix_artist" VALUES(1017,11677,1);
+INSERT INTO "remix_artist" VALUES(1018,4560,1);
+INSERT INTO "remix_artist" VALUES(1019,4447,1);
+INSERT INTO "remix_artist" VALUES(1020,4285,1);
+INSERT INTO "remix_artist" VALUES(1021,4433,1);
+INSERT INTO "remix_artist" VALUES(1021,4516,1);
+INSERT INTO "remix_artist" VALUES(1021,4561,1);
+INSERT INTO "remix_artist" VALUES(1021,4562,1);
+INSERT INTO "remix_artist" VALUES(1022,4515,1);
+INSERT INTO "remix_artist" VALUES(1023,4174,1);
+INSERT INTO "remix_artist" VALUES(1024,4516,1);
+INSERT INTO "remix_artist" VALUES(1025,4409,1);
+INSERT INTO "remix_artist" VALUES(1026,4563,1);
+INSERT INTO "remix_artist" VALUES(1027,4503,1);
+INSERT INTO "remix_artist" VALUES(1028,4283,1);
+INSERT INTO "remix_artist" VALUES(1029,4279,1);
+INSERT INTO "remix_artist" VALUES(1030,4501,1);
+INSERT INTO "remix_artist" VALUES(1030,4564,1);
+INSERT INTO "remix_artist" VALUES(1031,4524,1);
+INSERT INTO "remix_artist" VALUES(1032,4565,1);
+INSERT INTO "remix_artist" VALUES(1033,4530,1);
+INSERT INTO "remix_artist" VALUES(1034,4566,1);
+INSERT INTO "remix_artist" VALUES(1035,4567,1);
+INSERT INTO "remix_artist" VALUES(1036,4475,1);
+INSERT INTO "remix_artist" VALUES(1037,4391,1);
+INSERT INTO "remix_artist" VALUES(1038,4486,1);
+INSERT INTO "remix_artist" VALUES(1039,4501,1);
+INSERT INTO "remix_artist" VALUES(1040,4438,1);
+INSERT INTO "remix_artist" VALUES(1041,4297,1);
+INSERT INTO "remix_artist" VALUES(1042,4516,1);
+INSERT INTO "remix_artist" VALUES(1043,4568,1);
+INSERT INTO "remix_artist" VALUES(1044,4482,1);
+INSERT INTO "remix_artist" VALUES(1045,4569,1);
+INSERT INTO "remix_artist" VALUES(1047,4570,1);
+INSERT INTO "remix_artist" VALUES(1048,4420,1);
+INSERT INTO "remix_artist" VALUES(1049,4571,1);
+INSERT INTO "remix_artist" VALUES(1050,4548,1);
+INSERT INTO "remix_artist" VALUES(1050,10693,1);
+INSERT INTO "remix_artist" VALUES(1052,4324,1);
+INSERT INTO "remix_artist" VALUES(1052,4511,1);
+INSERT INTO "remix_artist" VALUES(1053,4528,1);
+INSERT INTO "remix_artist" VALUES(1054,4572,1);
+INSERT INTO "remix_artist" VALUES(1055,4412,1);
+INSERT INTO "remix_artist" VALUES(1056,4511,1);
+INSERT INTO "remix_artist" VALUES(1057,4573,1);
+INSERT INTO "remix_artist" VALUES(1058,4574,1);
+INSERT INTO "remix_artist" VALUES(1059,14053,1);
+INSERT INTO "remix_artist" VALUES(1060,4484,1);
+INSERT INTO "remix_artist" VALUES(1061,4486,1);
+INSERT INTO "remix_artist" VALUES(1062,4540,1);
+INSERT INTO "remix_artist" VALUES(1063,4575,1);
+INSERT INTO "remix_artist" VALUES(1064,4576,1);
+INSERT INTO "remix_artist" VALUES(1065,4516,1);
+INSERT INTO "remix_artist" VALUES(1066,4501,1);
+INSERT INTO "remix_artist" VALUES(1067,4360,1);
+INSERT INTO "remix_artist" VALUES(1068,4550,1);
+INSERT INTO "remix_artist" VALUES(1069,4482,1);
+INSERT INTO "remix_artist" VALUES(1071,4577,1);
+INSERT INTO "remix_artist" VALUES(1072,4391,1);
+INSERT INTO "remix_artist" VALUES(1073,4578,1);
+INSERT INTO "remix_artist" VALUES(1073,4579,1);
+INSERT INTO "remix_artist" VALUES(1074,4516,1);
+INSERT INTO "remix_artist" VALUES(1075,4580,1);
+INSERT INTO "remix_artist" VALUES(1076,4450,1);
+INSERT INTO "remix_artist" VALUES(1077,4581,1);
+INSERT INTO "remix_artist" VALUES(1077,10708,1);
+INSERT INTO "remix_artist" VALUES(1078,4582,1);
+INSERT INTO "remix_artist" VALUES(1079,4482,1);
+INSERT INTO "remix_artist" VALUES(1080,4420,1);
+INSERT INTO "remix_artist" VALUES(1081,4540,1);
+INSERT INTO "remix_artist" VALUES(1082,4331,1);
+INSERT INTO "remix_artist" VALUES(1083,4440,1);
+INSERT INTO "remix_artist" VALUES(1084,4283,1);
+INSERT INTO "remix_artist" VALUES(1085,4285,1);
+INSERT INTO "remix_artist" VALUES(1086,4583,1);
+INSERT INTO "remix_artist" VALUES(1087,4297,1);
+INSERT INTO "remix_artist" VALUES(1088,4584,1);
+INSERT INTO "remix_artist" VALUES(1089,4585,1);
+INSERT INTO "remix_artist" VALUES(1091,4546,1);
+INSERT INTO "remix_artist" VALUES(1092,4290,1);
+INSERT INTO "remix_artist" VALUES(1093,4586,1);
+INSERT INTO "remix_artist" VALUES(1094,4501,1);
+INSERT INTO "remix_artist" VALUES(1095,4482,1);
+INSERT INTO "remix_artist" VALUES(1096,4461,1);
+INSERT INTO "remix_artist" VALUES(1097,4463,1);
+INSERT INTO "remix_artist" VALUES(1098,4518,1);
+INSERT INTO "remix_artist" VALUES(1099,4516,1);
+INSERT INTO "remix_artist" VALUES(1099,4562,1);
+INSERT INTO "remix_artist" VALUES(1100,4587,1);
+INSERT INTO "remix_artist" VALUES(1102,4588,1);
+INSERT INTO "remix_artist" VALUES(1103,4589,1);
+INSERT INTO "remix_artist" VALUES(1104,4514,1);
+INSERT INTO "remix_artist" VALUES(1105,4403,1);
+INSERT INTO "remix_artist" VALUES(1106,4510,1);
+INSERT INTO "remix_artist" VALUES(1107,4553,1);
+INSERT INTO "remix_artist" VALUES(1108,4168,1);
+INSERT INTO "remix_artist" VALUES(1109,4590,1);
+INSERT INTO "remix_artist" VALUES(1110,4586,1);
+INSERT INTO "remix_artist" VALUES(1111,4311,1);
+INSERT INTO "remix_artist" VALUES(1112,4529,1);
+INSERT INTO "remix_artist" VALUES(1113,4412,1);
+INSERT INTO "remix_artist" VALUES(1113,4578,1);
+INSERT INTO "remix_artist" VALUES(1114,4412,1);
+INSERT INTO "remix_artist" VALUES(1114,4511,1);
+INSERT INTO "remix_artist" VALUES(1115,4579,1);
+INSERT INTO "remix_artist" VALUES(1116,4591,1);
+INSERT INTO "remix_artist" VALUES(1117,4530,1);
+INSERT INTO "remix_artist" VALUES(1118,4592,1);
+INSERT INTO "remix_artist" VALUES(1119,4594,1);
+INSERT INTO "remix_artist" VALUES(1120,4593,1);
+INSERT INTO "remix_artist" VALUES(1121,4313,1);
+INSERT INTO "remix_artist" VALUES(1122,4588,1);
+INSERT INTO "remix_artist" VALUES(1123,4516,1);
+INSERT INTO "remix_artist" VALUES(1123,4562,1);
+INSERT INTO "remix_artist" VALUES(1124,4484,1);
+INSERT INTO "remix_artist" VALUES(1125,4552,1);
+INSERT INTO "remix_artist" VALUES(1125,4558,1);
+INSERT INTO "remix_artist" VALUES(1126,4445,1);
+INSERT INTO "remix_artist" VALUES(1126,4595,1);
+INSERT INTO "remix_artist" VALUES(1127,4508,1);
+INSERT INTO "remix_artist" VALUES(1128,4596,1);
+INSERT INTO "remix_artist" VALUES(1129,4482,1);
+INSERT INTO "remix_artist" VALUES(1130,51,1);
+INSERT INTO "remix_artist" VALUES(1131,4597,1);
+INSERT INTO "remix_artist" VALUES(1132,4547,1);
+INSERT INTO "remix_artist" VALUES(1133,4575,1);
+INSERT INTO "remix_artist" VALUES(1134,4598,1);
+INSERT INTO "remix_artist" VALUES(1135,4599,1);
+INSERT INTO "remix_artist" VALUES(1136,4513,1);
+INSERT INTO "remix_artist" VALUES(1137,4440,1);
+INSERT INTO "remix_artist" VALUES(1138,4293,1);
+INSERT INTO "remix_artist" VALUES(1139,4600,1);
+INSERT INTO "remix_artist" VALUES(1140,4501,1);
+INSERT INTO "remix_artist" VALUES(1141,4601,1);
+INSERT INTO "remix_artist" VALUES(1143,4540,1);
+INSERT INTO "remix_artist" VALUES(1144,4313,1);
+INSERT INTO "remix_artist" VALUES(1145,4558,1);
+INSERT INTO "remix_artist" VALUES(1145,4589,1);
+INSERT INTO "remix_artist" VALUES(1146,4603,1);
+INSERT INTO "remix_artist" VALUES(1147,4602,1);
+INSERT INTO "remix_artist" VALUES(1148,4575,1);
+INSERT INTO "remix_artist" VALUES(1149,4293,1);
+INSERT INTO "remix_artist" VALUES(1149,4403,1);
+INSERT INTO "remix_artist" VALUES(1150,4605,1);
+INSERT INTO "remix_artist" VALUES(1151,4604,1);
+INSERT INTO "remix_artist" VALUES(1152,4606,1);
+INSERT INTO "remix_artist" VALUES(1153,4484,1);
+INSERT INTO "remix_artist" VALUES(1154,4482,1);
+INSERT INTO "remix_artist" VALUES(1155,4512,1);
+INSERT INTO "remix_artist" VALUES(1156,4511,1);
+INSERT INTO "remix_artist" VALUES(1157,4607,1);
+INSERT INTO "remix_artist" VALUES(1158,4313,1);
+INSERT INTO "remix_artist" VALUES(1159,4608,1);
+INSERT INTO "remix_artist" VALUES(1160,4543,1);
+INSERT INTO "remix_artist" VALUES(1161,4609,1);
+INSERT INTO "remix_artist" VALUES(1162,4610,1);
+INSERT INTO "remix_artist" VALUES(1163,4593,1);
+INSERT INTO "remix_artist" VALUES(1164,4599,1);
+INSERT INTO "remix_artist" VALUES(1165,4611,1);
+INSERT INTO "remix_artist" VALUES(1166,4612,1);
+INSERT INTO "remix_artist" VALUES(1167,4613,1);
+INSERT INTO "remix_artist" VALUES(1168,4463,1);
+INSERT INTO "remix_artist" VALUES(1169,4286,1);
+INSERT INTO "remix_artist" VALUES(1170,4589,1);
+INSERT INTO "remix_artist" VALUES(1171,4614,1);
+INSERT INTO "remix_artist" VALUES(1172,4554,1);
+INSERT INTO "remix_artist" VALUES(1173,4512,1);
+INSERT INTO "remix_artist" VALUES(1174,4516,1);
+INSERT INTO "remix_artist" VALUES(1175,4615,1);
+INSERT INTO "remix_artist" VALUES(1176,4313,1);
+INSERT INTO "remix_artist" VALUES(1177,4320,1);
+INSERT INTO "remix_artist" VALUES(1178,4482,1);
+INSERT INTO "remix_artist" VALUES(1179,4501,1);
+INSERT INTO "remix_artist" VALUES(1180,4518,1);
+INSERT INTO "remix_artist" VALUES(1181,4297,1);
+INSERT INTO "remix_artist" VALUES(1182,4516,1);
+INSERT INTO "remix_artist" VALUES(1182,4562,1);
+INSERT INTO "remix_artist" VALUES(1183,4293,1);
+INSERT INTO "remix_artist" VALUES(1184,4285,1);
+INSERT INTO "remix_artist" VALUES(1185,4280,1);
+INSERT INTO "remix_artist" VALUES(1186,4279,1);
+INSERT INTO "remix_artist" VALUES(1187,4403,1);
+INSERT INTO "remix_artist" VALUES(1188,4579,1);
+INSERT INTO "remix_artist" VALUES(1189,4511,1);
+INSERT INTO "remix_artist" VALUES(1189,4611,1);
+INSERT INTO "remix_artist" VALUES(1189,4616,1);
+INSERT INTO "remix_artist" VALUES(1190,4513,1);
+INSERT INTO "remix_artist" VALUES(1191,4617,1);
+INSERT INTO "remix_artist" VALUES(1192,4429,1);
+INSERT INTO "remix_artist" VALUES(1192,4469,1);
+INSERT INTO "remix_artist" VALUES(1192,10668,1);
+INSERT INTO "remix_artist" VALUES(1194,4453,1);
+INSERT INTO "remix_artist" VALUES(1195,4578,1);
+INSERT INTO "remix_artist" VALUES(1196,4618,1);
+INSERT INTO "remix_artist" VALUES(1197,4548,1);
+INSERT INTO "remix_artist" VALUES(1197,10694,1);
+INSERT INTO "remix_artist" VALUES(1198,4619,1);
+INSERT INTO "remix_artist" VALUES(1199,4516,1);
+INSERT INTO "remix_artist" VALUES(1200,4620,1);
+INSERT INTO "remix_artist" VALUES(1201,4621,1);
+INSERT INTO "remix_artist" VALUES(1202,4293,1);
+INSERT INTO "remix_artist" VALUES(1203,4552,1);
+INSERT INTO "remix_artist" VALUES(1204,4622,1);
+INSERT INTO "remix_artist" VALUES(1205,4609,1);
+INSERT INTO "remix_artist" VALUES(1206,4623,1);
+INSERT INTO "remix_artist" VALUES(1207,4562,1);
+INSERT INTO "remix_artist" VALUES(1208,4420,1);
+INSERT INTO "remix_artist" VALUES(1208,4589,1);
+INSERT INTO "remix_artist" VALUES(1209,4624,1);
+INSERT INTO "remix_artist" VALUES(1210,4582,1);
+INSERT INTO "remix_artist" VALUES(1211,4625,1);
+INSERT INTO "remix_artist" VALUES(1212,4554,1);
+INSERT INTO "remix_artist" VALUES(1214,4331,1);
+INSERT INTO "remix_artist" VALUES(1215,4537,1);
+INSERT INTO "remix_artist" VALUES(1216,4626,1);
+INSERT INTO "remix_artist" VALUES(1217,4513,1);
+INSERT INTO "remix_artist" VALUES(1218,4627,1);
+INSERT INTO "remix_artist" VALUES(1219,4628,1);
+INSERT INTO "remix_artist" VALUES(1220,4516,1);
+INSERT INTO "remix_artist" VALUES(1220,4625,1);
+INSERT INTO "remix_artist" VALUES(1221,4629,1);
+INSERT INTO "remix_artist" VALUES(1222,4558,1);
+INSERT INTO "remix_artist" VALUES(1222,4589,1);
+INSERT INTO "remix_artist" VALUES(1223,4501,1);
+INSERT INTO "remix_artist" VALUES(1223,5009,1);
+INSERT INTO "remix_artist" VALUES(1224,4439,1);
+INSERT INTO "remix_artist" VALUES(1225,4403,1);
+INSERT INTO "remix_artist" VALUES(1226,4630,1);
+INSERT INTO "remix_artist" VALUES(1227,4631,1);
+INSERT INTO "remix_artist" VALUES(1228,4547,1);
+INSERT INTO "remix_artist" VALUES(1229,4587,1);
+INSERT INTO "remix_artist" VALUES(1230,4608,1);
+INSERT INTO "remix_artist" VALUES(1231,4548,1);
+INSERT INTO "remix_artist" VALUES(1231,10693,1);
+INSERT INTO "remix_artist" VALUES(1232,4613,1);
+INSERT INTO "remix_artist" VALUES(1233,4516,1);
+INSERT INTO "remix_artist" VALUES(1234,4618,1);
+INSERT INTO "remix_artist" VALUES(1235,4482,1);
+INSERT INTO "remix_artist" VALUES(1236,4403,1);
+INSERT INTO "remix_artist" VALUES(1237,4619,1);
+INSERT INTO "remix_artist" VALUES(1237,4632,1);
+INSERT INTO "remix_artist" VALUES(1238,4509,1);
+INSERT INTO "remix_artist" VALUES(1238,4633,1);
+INSERT INTO "remix_artist" VALUES(1239,4547,1);
+INSERT INTO "remix_artist" VALUES(1240,4512,1);
+INSERT INTO "remix_artist" VALUES(1241,4634,1);
+INSERT INTO "remix_artist" VALUES(1242,4524,1);
+INSERT INTO "remix_artist" VALUES(1243,4516,1);
+INSERT INTO "remix_artist" VALUES(1244,4540,1);
+INSERT INTO "remix_artist" VALUES(1245,4635,1);
+INSERT INTO "remix_artist" VALUES(1246,4627,1);
+INSERT INTO "remix_artist" VALUES(1247,4636,1);
+INSERT INTO "remix_artist" VALUES(1248,4584,1);
+INSERT INTO "remix_artist" VALUES(1249,4637,1);
+INSERT INTO "remix_artist" VALUES(1250,4279,1);
+INSERT INTO "remix_artist" VALUES(1251,4486,1);
+INSERT INTO "remix_artist" VALUES(1252,4638,1);
+INSERT INTO "remix_artist" VALUES(1253,4639,1);
+INSERT INTO "remix_artist" VALUES(1254,4297,1);
+INSERT INTO "remix_artist" VALUES(1255,4588,1);
+INSERT INTO "remix_artist" VALUES(1256,4529,1);
+INSERT INTO "remix_artist" VALUES(1257,4640,1);
+INSERT INTO "remix_artist" VALUES(1258,4484,1);
+INSERT INTO "remix_artist" VALUES(1258,4628,1);
+INSERT INTO "remix_artist" VALUES(1259,4512,1);
+INSERT INTO "remix_artist" VALUES(1260,4559,1);
+INSERT INTO "remix_artist" VALUES(1261,4516,1);
+INSERT INTO "remix_artist" VALUES(1262,4584,1);
+INSERT INTO "remix_artist" VALUES(1263,4313,1);
+INSERT INTO "remix_artist" VALUES(1264,4607,1);
+INSERT INTO "remix_artist" VALUES(1265,4293,1);
+INSERT INTO "remix_artist" VALUES(1266,4641,1);
+INSERT INTO "remix_artist" VALUES(1267,4627,1);
+INSERT INTO "remix_artist" VALUES(1268,4586,1);
+INSERT INTO "remix_artist" VALUES(1269,4543,1);
+INSERT INTO "remix_artist" VALUES(1269,4560,1);
+INSERT INTO "remix_artist" VALUES(1270,4286,1);
+INSERT INTO "remix_artist" VALUES(1271,4463,1);
+INSERT INTO "remix_artist" VALUES(1272,4625,1);
+INSERT INTO "remix_artist" VALUES(1273,4486,1);
+INSERT INTO "remix_artist" VALUES(1274,4388,1);
+INSERT INTO "remix_artist" VALUES(1275,4627,1);
+INSERT INTO "remix_artist" VALUES(1276,4642,1);
+INSERT INTO "remix_artist" VALUES(1277,4501,1);
+INSERT INTO "remix_artist" VALUES(1277,4524,1);
+INSERT INTO "remix_artist" VALUES(1277,4558,1);
+INSERT INTO "remix_artist" VALUES(1278,4403,1);
+INSERT INTO "remix_artist" VALUES(1279,4293,1);
+INSERT INTO "remix_artist" VALUES(1280,4613,1);
+INSERT INTO "remix_artist" VALUES(1280,4628,1);
+INSERT INTO "remix_artist" VALUES(1281,4455,1);
+INSERT INTO "remix_artist" VALUES(1282,4643,1);
+INSERT INTO "remix_artist" VALUES(1283,4331,1);
+INSERT INTO "remix_artist" VALUES(1283,4712,1);
+INSERT INTO "remix_artist" VALUES(1284,4486,1);
+INSERT INTO "remix_artist" VALUES(1285,4619,1);
+INSERT INTO "remix_artist" VALUES(1285,4640,1);
+INSERT INTO "remix_artist" VALUES(1286,4482,1);
+INSERT INTO "remix_artist" VALUES(1287,4644,1);
+INSERT INTO "remix_artist" VALUES(1287,4645,1);
+INSERT INTO "remix_artist" VALUES(1288,4516,1);
+INSERT INTO "remix_artist" VALUES(1289,4627,1);
+INSERT INTO "remix_artist" VALUES(1290,4403,1);
+INSERT INTO "remix_artist" VALUES(1291,4635,1);
+INSERT INTO "remix_artist" VALUES(1292,4433,1);
+INSERT INTO "remix_artist" VALUES(1293,4337,1);
+INSERT INTO "remix_artist" VALUES(1294,4558,1);
+INSERT INTO "remix_artist" VALUES(1295,4646,1);
+INSERT INTO "remix_artist" VALUES(1296,68,1);
+INSERT INTO "remix_artist" VALUES(1296,171,1);
+INSERT INTO "remix_artist" VALUES(1296,226,1);
+INSERT INTO "remix_artist" VALUES(1296,328,1);
+INSERT INTO "remix_artist" VALUES(1297,4584,1);
+INSERT INTO "remix_artist" VALUES(1298,4484,1);
+INSERT INTO "remix_artist" VALUES(1299,4313,1);
+INSERT INTO "remix_artist" VALUES(1300,4647,1);
+INSERT INTO "remix_artist" VALUES(1301,4648,1);
+INSERT INTO "remix_artist" VALUES(1302,4403,1);
+INSERT INTO "remix_artist" VALUES(1303,4486,1);
+INSERT INTO "remix_artist" VALUES(1304,4649,1);
+INSERT INTO "remix_artist" VALUES(1304,4665,1);
+INSERT INTO "remix_artist" VALUES(1305,4530,1);
+INSERT INTO "remix_artist" VALUES(1306,4608,1);
+INSERT INTO "remix_artist" VALUES(1307,4650,1);
+INSERT INTO "remix_artist" VALUES(1308,4628,1);
+INSERT INTO "remix_artist" VALUES(1309,4516,1);
+INSERT INTO "remix_artist" VALUES(1310,4279,1);
+INSERT INTO "remix_artist" VALUES(1311,4651,1);
+INSERT INTO "remix_artist" VALUES(1312,4652,1);
+INSERT INTO "remix_artist" VALUES(1312,4653,1);
+INSERT INTO "remix_artist" VALUES(1313,4524,1);
+INSERT INTO "remix_artist" VALUES(1313,4755,1);
+INSERT INTO "remix_artist" VALUES(1314,4601,1);
+INSERT INTO "remix_artist" VALUES(1315,4426,1);
+INSERT INTO "remix_artist" VALUES(1316,4482,1);
+INSERT INTO "remix_artist" VALUES(1317,4654,1);
+INSERT INTO "remix_artist" VALUES(1318,4516,1);
+INSERT INTO "remix_artist" VALUES(1318,4640,1);
+INSERT INTO "remix_artist" VALUES(1319,4507,1);
+INSERT INTO "remix_artist" VALUES(1320,4607,1);
+INSERT INTO "remix_artist" VALUES(1321,4543,1);
+INSERT INTO "remix_artist" VALUES(1322,4608,1);
+INSERT INTO "remix_artist" VALUES(1323,4639,1);
+INSERT INTO "remix_artist" VALUES(1324,4655,1);
+INSERT INTO "remix_artist" VALUES(1325,4656,1);
+INSERT INTO "remix_artist" VALUES(1326,4657,1);
+INSERT INTO "remix_artist" VALUES(1327,4518,1);
+INSERT INTO "remix_artist" VALUES(1328,4658,1);
+INSERT INTO "remix_artist" VALUES(1329,4463,1);
+INSERT INTO "remix_artist" VALUES(1330,4619,1);
+INSERT INTO "remix_artist" VALUES(1331,4628,1);
+INSERT INTO "remix_artist" VALUES(1332,4640,1);
+INSERT INTO "remix_artist" VALUES(1333,4659,1);
+INSERT INTO "remix_artist" VALUES(1334,4660,1);
+INSERT INTO "remix_artist" VALUES(1335,4547,1);
+INSERT INTO "remix_artist" VALUES(1336,4661,1);
+INSERT INTO "remix_artist" VALUES(1337,4518,1);
+INSERT INTO "remix_artist" VALUES(1338,4662,1);
+INSERT INTO "remix_artist" VALUES(1339,4637,1);
+INSERT INTO "remix_artist" VALUES(1340,4663,1);
+INSERT INTO "remix_artist" VALUES(1341,4649,1);
+INSERT INTO "remix_artist" VALUES(1341,4664,1);
+INSERT INTO "remix_artist" VALUES(1341,4665,1);
+INSERT INTO "remix_artist" VALUES(1342,4666,1);
+INSERT INTO "remix_artist" VALUES(1343,4482,1);
+INSERT INTO "remix_artist" VALUES(1344,4516,1);
+INSERT INTO "remix_artist" VALUES(1345,4667,1);
+INSERT INTO "remix_artist" VALUES(1346,4661,1);
+INSERT INTO "remix_artist" VALUES(1347,4357,1);
+INSERT INTO "remix_artist" VALUES(1348,4559,1);
+INSERT INTO "remix_artist" VALUES(1349,4670,1);
+INSERT INTO "remix_artist" VALUES(1350,4668,1);
+INSERT INTO "remix_artist" VALUES(1350,4669,1);
+INSERT INTO "remix_artist" VALUES(1351,4553,1);
+INSERT INTO "remix_artist" VALUES(1352,4575,1);
+INSERT INTO "remix_artist" VALUES(1353,4512,1);
+INSERT INTO "remix_artist" VALUES(1354,4520,1);
+INSERT INTO "remix_artist" VALUES(1355,4613,1);
+INSERT INTO "remix_artist" VALUES(1356,4671,1);
+INSERT INTO "remix_artist" VALUES(1357,4587,1);
+INSERT INTO "remix_artist" VALUES(1357,4630,1);
+INSERT INTO "remix_artist" VALUES(1358,4672,1);
+INSERT INTO "remix_artist" VALUES(1359,4656,1);
+INSERT INTO "remix_artist" VALUES(1360,4637,1);
+INSERT INTO "remix_artist" VALUES(1361,4279,1);
+INSERT INTO "remix_artist" VALUES(1362,4658,1);
+INSERT INTO "remix_artist" VALUES(1363,4620,1);
+INSERT INTO "remix_artist" VALUES(1364,4651,1);
+INSERT INTO "remix_artist" VALUES(1365,4553,1);
+INSERT INTO "remix_artist" VALUES(1366,4673,1);
+INSERT INTO "remix_artist" VALUES(1367,4537,1);
+INSERT INTO "remix_artist" VALUES(1368,4660,1);
+INSERT INTO "remix_artist" VALUES(1368,18861,1);
+INSERT INTO "remix_artist" VALUES(1369,4529,1);
+INSERT INTO "remix_artist" VALUES(1370,4584,1);
+INSERT INTO "remix_artist" VALUES(1371,4313,1);
+INSERT INTO "remix_artist" VALUES(1372,4625,1);
+INSERT INTO "remix_artist" VALUES(1372,4674,1);
+INSERT INTO "remix_artist" VALUES(1373,4675,1);
+INSERT INTO "remix_artist" VALUES(1374,4482,1);
+INSERT INTO "remix_artist" VALUES(1375,4593,1);
+INSERT INTO "remix_artist" VALUES(1376,4287,1);
+INSERT INTO "remix_artist" VALUES(1377,4637,1);
+INSERT INTO "remix_artist" VALUES(1378,4676,1);
+INSERT INTO "remix_artist" VALUES(1379,4635,1);
+INSERT INTO "remix_artist" VALUES(1380,4627,1);
+INSERT INTO "remix_artist" VALUES(1381,4516,1);
+INSERT INTO "remix_artist" VALUES(1381,4587,1);
+INSERT INTO "remix_artist" VALUES(1381,4659,1);
+INSERT INTO "remix_artist" VALUES(1382,4677,1);
+INSERT INTO "remix_artist" VALUES(1383,4660,1);
+INSERT INTO "remix_artist" VALUES(1384,4673,1);
+INSERT INTO "remix_artist" VALUES(1385,4678,1);
+INSERT INTO "remix_artist" VALUES(1386,4574,1);
+INSERT INTO "remix_artist" VALUES(1387,4501,1);
+INSERT INTO "remix_artist" VALUES(1388,4679,1);
+INSERT INTO "remix_artist" VALUES(1389,4560,1);
+INSERT INTO "remix_artist" VALUES(1390,4680,1);
+INSERT INTO "remix_artist" VALUES(1391,4640,1);
+INSERT INTO "remix_artist" VALUES(1392,4649,1);
+INSERT INTO "remix_artist" VALUES(1392,4664,1);
+INSERT INTO "remix_artist" VALUES(1393,4331,1);
+INSERT INTO "remix_artist" VALUES(1394,4598,1);
+INSERT INTO "remix_artist" VALUES(1395,4537,1);
+INSERT INTO "remix_artist" VALUES(1395,5095,1);
+INSERT INTO "remix_artist" VALUES(1396,4666,1);
+INSERT INTO "remix_artist" VALUES(1397,4619,1);
+INSERT INTO "remix_artist" VALUES(1398,4558,1);
+INSERT INTO "remix_artist" VALUES(1399,4681,1);
+INSERT INTO "remix_artist" VALUES(1399,4682,1);
+INSERT INTO "remix_artist" VALUES(1399,4683,1);
+INSERT INTO "remix_artist" VALUES(1400,4651,1);
+INSERT INTO "remix_artist" VALUES(1401,4579,1);
+INSERT INTO "remix_artist" VALUES(1402,4515,1);
+INSERT INTO "remix_artist" VALUES(1403,4433,1);
+INSERT INTO "remix_artist" VALUES(1404,4661,1);
+INSERT INTO "remix_artist" VALUES(1405,4627,1);
+INSERT INTO "remix_artist" VALUES(1406,4684,1);
+INSERT INTO "remix_artist" VALUES(1407,4685,1);
+INSERT INTO "remix_artist" VALUES(1408,4548,1);
+INSERT INTO "remix_artist" VALUES(1409,4673,1);
+INSERT INTO "remix_artist" VALUES(1410,4593,1);
+INSERT INTO "remix_artist" VALUES(1411,4290,1);
+INSERT INTO "remix_artist" VALUES(1411,4553,1);
+INSERT INTO "remix_artist" VALUES(1412,4619,1);
+INSERT INTO "remix_artist" VALUES(1413,4559,1);
+INSERT INTO "remix_artist" VALUES(1414,4649,1);
+INSERT INTO "remix_artist" VALUES(1415,4433,1);
+INSERT INTO "remix_artist" VALUES(1416,4686,1);
+INSERT INTO "remix_artist" VALUES(1417,4516,1);
+INSERT INTO "remix_artist" VALUES(1417,4579,1);
+INSERT INTO "remix_artist" VALUES(1418,4687,1);
+INSERT INTO "remix_artist" VALUES(1419,4666,1);
+INSERT INTO "remix_artist" VALUES(1420,4688,1);
+INSERT INTO "remix_artist" VALUES(1421,4627,1);
+INSERT INTO "remix_artist" VALUES(1422,4664,1);
+INSERT INTO "remix_artist" VALUES(1423,4440,1);
+INSERT INTO "remix_artist" VALUES(1424,4666,1);
+INSERT INTO "remix_artist" VALUES(1424,8359,1);
+INSERT INTO "remix_artist" VALUES(1425,4691,1);
+INSERT INTO "remix_artist" VALUES(1426,4628,1);
+INSERT INTO "remix_artist" VALUES(1427,4279,1);
+INSERT INTO "remix_artist" VALUES(1428,4692,1);
+INSERT INTO "remix_artist" VALUES(1429,4290,1);
+INSERT INTO "remix_artist" VALUES(1429,4553,1);
+INSERT INTO "remix_artist" VALUES(1430,4693,1);
+INSERT INTO "remix_artist" VALUES(1431,4619,1);
+INSERT INTO "remix_artist" VALUES(1431,4640,1);
+INSERT INTO "remix_artist" VALUES(1432,4313,1);
+INSERT INTO "remix_artist" VALUES(1433,4694,1);
+INSERT INTO "remix_artist" VALUES(1433,4695,1);
+INSERT INTO "remix_artist" VALUES(1434,4640,1);
+INSERT INTO "remix_artist" VALUES(1435,4637,1);
+INSERT INTO "remix_artist" VALUES(1436,4627,1);
+INSERT INTO "remix_artist" VALUES(1437,4331,1);
+INSERT INTO "remix_artist" VALUES(1438,4696,1);
+INSERT INTO "remix_artist" VALUES(1439,4607,1);
+INSERT INTO "remix_artist" VALUES(1440,4691,1);
+INSERT INTO "remix_artist" VALUES(1440,4695,1);
+INSERT INTO "remix_artist" VALUES(1441,4440,1);
+INSERT INTO "remix_artist" VALUES(1442,4642,1);
+INSERT INTO "remix_artist" VALUES(1443,4586,1);
+INSERT INTO "remix_artist" VALUES(1444,4559,1);
+INSERT INTO "remix_artist" VALUES(1445,4647,1);
+INSERT INTO "remix_artist" VALUES(1446,4619,1);
+INSERT INTO "remix_artist" VALUES(1446,4640,1);
+INSERT INTO "remix_artist" VALUES(1447,4420,1);
+INSERT INTO "remix_artist" VALUES(1448,4595,1);
+INSERT INTO "remix_artist" VALUES(1449,4529,1);
+INSERT INTO "remix_artist" VALUES(1450,4628,1);
+INSERT INTO "remix_artist" VALUES(1451,4637,1);
+INSERT INTO "remix_artist" VALUES(1452,4697,1);
+INSERT INTO "remix_artist" VALUES(1453,4403,1);
+INSERT INTO "remix_artist" VALUES(1454,4649,1);
+INSERT INTO "remix_artist" VALUES(1455,4694,1);
+INSERT INTO "remix_artist" VALUES(1455,4698,1);
+INSERT INTO "remix_artist" VALUES(1456,4627,1);
+INSERT INTO "remix_artist" VALUES(1457,4699,1);
+INSERT INTO "remix_artist" VALUES(1458,4608,1);
+INSERT INTO "remix_artist" VALUES(1458,4659,1);
+INSERT INTO "remix_artist" VALUES(1458,6015,1);
+INSERT INTO "remix_artist" VALUES(1459,4420,1);
+INSERT INTO "remix_artist" VALUES(1460,4290,1);
+INSERT INTO "remix_artist" VALUES(1461,4511,1);
+INSERT INTO "remix_artist" VALUES(1461,4587,1);
+INSERT INTO "remix_artist" VALUES(1462,4635,1);
+INSERT INTO "remix_artist" VALUES(1463,4482,1);
+INSERT INTO "remix_artist" VALUES(1464,4516,1);
+INSERT INTO "remix_artist" VALUES(1464,4655,1);
+INSERT INTO "remix_artist" VALUES(1465,4628,1);
+INSERT INTO "remix_artist" VALUES(1465,4659,1);
+INSERT INTO "remix_artist" VALUES(1465,4690,1);
+INSERT INTO "remix_artist" VALUES(1465,4694,1);
+INSERT INTO "remix_artist" VALUES(1465,4700,1);
+INSERT INTO "remix_artist" VALUES(1466,4701,1);
+INSERT INTO "remix_artist" VALUES(1467,4540,1);
+INSERT INTO "remix_artist" VALUES(1468,4637,1);
+INSERT INTO "remix_artist" VALUES(1469,4313,1);
+INSERT INTO "remix_artist" VALUES(1470,4664,1);
+INSERT INTO "remix_artist" VALUES(1471,4682,1);
+INSERT INTO "remix_artist" VALUES(1472,4638,1);
+INSERT INTO "remix_artist" VALUES(1473,4691,1);
+INSERT INTO "remix_artist" VALUES(1474,4702,1);
+INSERT INTO "remix_artist" VALUES(1475,4618,1);
+INSERT INTO "remix_artist" VALUES(1476,4651,1);
+INSERT INTO "remix_artist" VALUES(1477,4595,1);
+INSERT INTO "remix_artist" VALUES(1478,4607,1);
+INSERT INTO "remix_artist" VALUES(1479,4673,1);
+INSERT INTO "remix_artist" VALUES(1480,4628,1);
+INSERT INTO "remix_artist" VALUES(1481,4619,1);
+INSERT INTO "remix_artist" VALUES(1482,4703,1);
+INSERT INTO "remix_artist" VALUES(1483,4579,1);
+INSERT INTO "remix_artist" VALUES(1484,4513,1);
+INSERT INTO "remix_artist" VALUES(1485,4627,1);
+INSERT INTO "remix_artist" VALUES(1486,4673,1);
+INSERT INTO "remix_artist" VALUES(1487,4704,1);
+INSERT INTO "remix_artist" VALUES(1488,4684,1);
+INSERT INTO "remix_artist" VALUES(1489,4705,1);
+INSERT INTO "remix_artist" VALUES(1490,4706,1);
+INSERT INTO "remix_artist" VALUES(1491,4313,1);
+INSERT INTO "remix_artist" VALUES(1492,4429,1);
+INSERT INTO "remix_artist" VALUES(1492,4469,1);
+INSERT INTO "remix_artist" VALUES(1493,4649,1);
+INSERT INTO "remix_artist" VALUES(1494,4540,1);
+INSERT INTO "remix_artist" VALUES(1495,4279,1);
+INSERT INTO "remix_artist" VALUES(1495,4694,1);
+INSERT INTO "remix_artist" VALUES(1496,4439,1);
+INSERT INTO "remix_artist" VALUES(1497,4628,1);
+INSERT INTO "remix_artist" VALUES(1498,4286,1);
+INSERT INTO "remix_artist" VALUES(1498,4691,1);
+INSERT INTO "remix_artist" VALUES(1499,4707,1);
+INSERT INTO "remix_artist" VALUES(1500,4279,1);
+INSERT INTO "remix_artist" VALUES(1501,4574,1);
+INSERT INTO "remix_artist" VALUES(1502,4619,1);
+INSERT INTO "remix_artist" VALUES(1503,4642,1);
+INSERT INTO "remix_artist" VALUES(1504,4635,1);
+INSERT INTO "remix_artist" VALUES(1505,4608,1);
+INSERT INTO "remix_artist" VALUES(1506,4685,1);
+INSERT INTO "remix_artist" VALUES(1507,4482,1);
+INSERT INTO "remix_artist" VALUES(1508,4512,1);
+INSERT INTO "remix_artist" VALUES(1509,4313,1);
+INSERT INTO "remix_artist" VALUES(1510,4331,1);
+INSERT INTO "remix_artist" VALUES(1511,4463,1);
+INSERT INTO "remix_artist" VALUES(1512,4717,1);
+INSERT INTO "remix_artist" VALUES(1512,11028,1);
+INSERT INTO "remix_artist" VALUES(1513,4718,1);
+INSERT INTO "remix_artist" VALUES(1514,4719,1);
+INSERT INTO "remix_artist" VALUES(1515,4720,1);
+INSERT INTO "remix_artist" VALUES(1516,4548,1);
+INSERT INTO "remix_artist" VALUES(1517,4699,1);
+INSERT INTO "remix_artist" VALUES(1518,4721,1);
+INSERT INTO "remix_artist" VALUES(1519,4722,1);
+INSERT INTO "remix_artist" VALUES(1520,4682,1);
+INSERT INTO "remix_artist" VALUES(1521,4619,1);
+INSERT INTO "remix_artist" VALUES(1521,4659,1);
+INSERT INTO "remix_artist" VALUES(1521,4692,1);
+INSERT INTO "remix_artist" VALUES(1522,4671,1);
+INSERT INTO "remix_artist" VALUES(1523,4723,1);
+INSERT INTO "remix_artist" VALUES(1524,4724,1);
+INSERT INTO "remix_artist" VALUES(1524,4780,1);
+INSERT INTO "remix_artist" VALUES(1525,4725,1);
+INSERT INTO "remix_artist" VALUES(1526,4501,1);
+INSERT INTO "remix_artist" VALUES(1527,4671,1);
+INSERT INTO "remix_artist" VALUES(1528,4625,1);
+INSERT INTO "remix_artist" VALUES(1528,4647,1);
+INSERT INTO "remix_artist" VALUES(1529,4326,1);
+INSERT INTO "remix_artist" VALUES(1530,4549,1);
+INSERT INTO "remix_artist" VALUES(1531,4531,1);
+INSERT INTO "remix_artist" VALUES(1532,4558,1);
+INSERT INTO "remix_artist" VALUES(1533,4555,1);
+INSERT INTO "remix_artist" VALUES(1534,4574,1);
+INSERT INTO "remix_artist" VALUES(1535,4635,1);
+INSERT INTO "remix_artist" VALUES(1536,4537,1);
+INSERT INTO "remix_artist" VALUES(1537,4726,1);
+INSERT INTO "remix_artist" VALUES(1537,4727,1);
+INSERT INTO "remix_artist" VALUES(1538,4627,1);
+INSERT INTO "remix_artist" VALUES(1539,4728,1);
+INSERT INTO "remix_artist" VALUES(1540,4486,1);
+INSERT INTO "remix_artist" VALUES(1541,4582,1);
+INSERT INTO "remix_artist" VALUES(1542,4579,1);
+INSERT INTO "remix_artist" VALUES(1543,4664,1);
+INSERT INTO "remix_artist" VALUES(1544,4687,1);
+INSERT INTO "remix_artist" VALUES(1545,4318,1);
+INSERT INTO "remix_artist" VALUES(1546,4656,1);
+INSERT INTO "remix_artist" VALUES(1547,4593,1);
+INSERT INTO "remix_artist" VALUES(1548,4619,1);
+INSERT INTO "remix_artist" VALUES(1549,4614,1);
+INSERT INTO "remix_artist" VALUES(1550,4729,1);
+INSERT INTO "remix_artist" VALUES(1551,4608,1);
+INSERT INTO "remix_artist" VALUES(1552,4659,1);
+INSERT INTO "remix_artist" VALUES(1553,4730,1);
+INSERT INTO "remix_artist" VALUES(1554,4326,1);
+INSERT INTO "remix_artist" VALUES(1555,4515,1);
+INSERT INTO "remix_artist" VALUES(1556,4687,1);
+INSERT INTO "remix_artist" VALUES(1557,4587,1);
+INSERT INTO "remix_artist" VALUES(1558,4628,1);
+INSERT INTO "remix_artist" VALUES(1559,4640,1);
+INSERT INTO "remix_artist" VALUES(1559,4692,1);
+INSERT INTO "remix_artist" VALUES(1560,4699,1);
+INSERT INTO "remix_artist" VALUES(1561,4731,1);
+INSERT INTO "remix_artist" VALUES(1562,4703,1);
+INSERT INTO "remix_artist" VALUES(1563,4636,1);
+INSERT INTO "remix_artist" VALUES(1564,4692,1);
+INSERT INTO "remix_artist" VALUES(1565,4733,1);
+INSERT INTO "remix_artist" VALUES(1566,4635,1);
+INSERT INTO "remix_artist" VALUES(1567,4726,1);
+INSERT INTO "remix_artist" VALUES(1567,4732,1);
+INSERT INTO "remix_artist" VALUES(1568,4734,1);
+INSERT INTO "remix_artist" VALUES(1569,4735,1);
+INSERT INTO "remix_artist" VALUES(1570,4736,1);
+INSERT INTO "remix_artist" VALUES(1571,4556,1);
+INSERT INTO "remix_artist" VALUES(1572,4486,1);
+INSERT INTO "remix_artist" VALUES(1573,4403,1);
+INSERT INTO "remix_artist" VALUES(1573,5096,1);
+INSERT INTO "remix_artist" VALUES(1574,4656,1);
+INSERT INTO "remix_artist" VALUES(1575,4697,1);
+INSERT INTO "remix_artist" VALUES(1576,4326,1);
+INSERT INTO "remix_artist" VALUES(1577,4737,1);
+INSERT INTO "remix_artist" VALUES(1578,4613,1);
+INSERT INTO "remix_artist" VALUES(1578,4628,1);
+INSERT INTO "remix_artist" VALUES(1579,4587,1);
+INSERT INTO "remix_artist" VALUES(1579,4730,1);
+INSERT INTO "remix_artist" VALUES(1580,4595,1);
+INSERT INTO "remix_artist" VALUES(1581,4723,1);
+INSERT INTO "remix_artist" VALUES(1582,4559,1);
+INSERT INTO "remix_artist" VALUES(1582,4738,1);
+INSERT INTO "remix_artist" VALUES(1583,4582,1);
+INSERT INTO "remix_artist" VALUES(1584,4739,1);
+INSERT INTO "remix_artist" VALUES(1585,4699,1);
+INSERT INTO "remix_artist" VALUES(1586,4587,1);
+INSERT INTO "remix_artist" VALUES(1586,4740,1);
+INSERT INTO "remix_artist" VALUES(1587,4741,1);
+INSERT INTO "remix_artist" VALUES(1588,4594,1);
+INSERT INTO "remix_artist" VALUES(1589,4313,1);
+INSERT INTO "remix_artist" VALUES(1590,4640,1);
+INSERT INTO "remix_artist" VALUES(1591,4482,1);
+INSERT INTO "remix_artist" VALUES(1592,4625,1);
+INSERT INTO "remix_artist" VALUES(1593,4515,1);
+INSERT INTO "remix_artist" VALUES(1594,4619,1);
+INSERT INTO "remix_artist" VALUES(1595,4512,1);
+INSERT INTO "remix_artist" VALUES(1596,4588,1);
+INSERT INTO "remix_artist" VALUES(1597,4635,1);
+INSERT INTO "remix_artist" VALUES(1598,4313,1);
+INSERT INTO "remix_artist" VALUES(1599,4627,1);
+INSERT INTO "remix_artist" VALUES(1600,4808,1);
+INSERT INTO "remix_artist" VALUES(1601,4549,1);
+INSERT INTO "remix_artist" VALUES(1601,4742,1);
+INSERT INTO "remix_artist" VALUES(1602,4682,1);
+INSERT INTO "remix_artist" VALUES(1602,4743,1);
+INSERT INTO "remix_artist" VALUES(1603,4730,1);
+INSERT INTO "remix_artist" VALUES(1604,4574,1);
+INSERT INTO "remix_artist" VALUES(1605,4744,1);
+INSERT INTO "remix_artist" VALUES(1606,4745,1);
+INSERT INTO "remix_artist" VALUES(1607,4746,1);
+INSERT INTO "remix_artist" VALUES(1608,4705,1);
+INSERT INTO "remix_artist" VALUES(1609,4651,1);
+INSERT INTO "remix_artist" VALUES(1610,4747,1);
+INSERT INTO "remix_artist" VALUES(1611,4748,1);
+INSERT INTO "remix_artist" VALUES(1612,4628,1);
+INSERT INTO "remix_artist" VALUES(1612,4659,1);
+INSERT INTO "remix_artist" VALUES(1613,4720,1);
+INSERT INTO "remix_artist" VALUES(1614,4625,1);
+INSERT INTO "remix_artist" VALUES(1614,4753,1);
+INSERT INTO "remix_artist" VALUES(1615,4501,1);
+INSERT INTO "remix_artist" VALUES(1616,4559,1);
+INSERT INTO "remix_artist" VALUES(1617,4279,1);
+INSERT INTO "remix_artist" VALUES(1617,4524,1);
+INSERT INTO "remix_artist" VALUES(1618,4304,1);
+INSERT INTO "remix_artist" VALUES(1618,5901,1);
+INSERT INTO "remix_artist" VALUES(1618,5902,1);
+INSERT INTO "remix_artist" VALUES(1618,5903,1);
+INSERT INTO "remix_artist" VALUES(1619,4479,1);
+INSERT INTO "remix_artist" VALUES(1620,4440,1);
+INSERT INTO "remix_artist" VALUES(1620,4460,1);
+INSERT INTO "remix_artist" VALUES(1621,4619,1);
+INSERT INTO "remix_artist" VALUES(1621,4749,1);
+INSERT INTO "remix_artist" VALUES(1622,4540,1);
+INSERT INTO "remix_artist" VALUES(1623,4381,1);
+INSERT INTO "remix_artist" VALUES(1623,4440,1);
+INSERT INTO "remix_artist" VALUES(1623,4515,1);
+INSERT INTO "remix_artist" VALUES(1623,4613,1);
+INSERT INTO "remix_artist" VALUES(1623,4659,1);
+INSERT INTO "remix_artist" VALUES(1623,4685,1);
+INSERT INTO "remix_artist" VALUES(1623,4754,1);
+INSERT INTO "remix_artist" VALUES(1624,4692,1);
+INSERT INTO "remix_artist" VALUES(1624,4723,1);
+INSERT INTO "remix_artist" VALUES(1625,4756,1);
+INSERT INTO "remix_artist" VALUES(1626,4752,1);
+INSERT INTO "remix_artist" VALUES(1627,4723,1);
+INSERT INTO "remix_artist" VALUES(1628,4757,1);
+INSERT INTO "remix_artist" VALUES(1629,4751,1);
+INSERT INTO "remix_artist" VALUES(1630,4432,1);
+INSERT INTO "remix_artist" VALUES(1630,4455,1);
+INSERT INTO "remix_artist" VALUES(1631,4293,1);
+INSERT INTO "remix_artist" VALUES(1632,4285,1);
+INSERT INTO "remix_artist" VALUES(1633,4297,1);
+INSERT INTO "remix_artist" VALUES(1634,4721,1);
+INSERT INTO "remix_artist" VALUES(1635,4620,1);
+INSERT INTO "remix_artist" VALUES(1636,4440,1);
+INSERT INTO "remix_artist" VALUES(1637,4758,1);
+INSERT INTO "remix_artist" VALUES(1638,4313,1);
+INSERT INTO "remix_artist" VALUES(1639,4558,1);
+INSERT INTO "remix_artist" VALUES(1640,4628,1);
+INSERT INTO "remix_artist" VALUES(1640,4685,1);
+INSERT INTO "remix_artist" VALUES(1641,4595,1);
+INSERT INTO "remix_artist" VALUES(1642,4759,1);
+INSERT INTO "remix_artist" VALUES(1643,4685,1);
+INSERT INTO "remix_artist" VALUES(1644,4751,1);
+INSERT INTO "remix_artist" VALUES(1645,4559,1);
+INSERT INTO "remix_artist" VALUES(1645,4738,1);
+INSERT INTO "remix_artist" VALUES(1646,4635,1);
+INSERT INTO "remix_artist" VALUES(1646,4720,1);
+INSERT INTO "remix_artist" VALUES(1646,4732,1);
+INSERT INTO "remix_artist" VALUES(1647,4671,1);
+INSERT INTO "remix_artist" VALUES(1648,4635,1);
+INSERT INTO "remix_artist" VALUES(1649,4515,1);
+INSERT INTO "remix_artist" VALUES(1649,4628,1);
+INSERT INTO "remix_artist" VALUES(1649,4685,1);
+INSERT INTO "remix_artist" VALUES(1650,4619,1);
+INSERT INTO "remix_artist" VALUES(1651,4313,1);
+INSERT INTO "remix_artist" VALUES(1652,4588,1);
+INSERT INTO "remix_artist" VALUES(1653,4679,1);
+INSERT INTO "remix_artist" VALUES(1654,4743,1);
+INSERT INTO "remix_artist" VALUES(1655,4754,1);
+INSERT INTO "remix_artist" VALUES(1656,4760,1);
+INSERT INTO "remix_artist" VALUES(1657,4685,1);
+INSERT INTO "remix_artist" VALUES(1657,4761,1);
+INSERT INTO "remix_artist" VALUES(1657,4762,1);
+INSERT INTO "remix_artist" VALUES(1657,4763,1);
+INSERT INTO "remix_artist" VALUES(1658,4579,1);
+INSERT INTO "remix_artist" VALUES(1659,4764,1);
+INSERT INTO "remix_artist" VALUES(1660,4764,1);
+INSERT INTO "remix_artist" VALUES(1661,4482,1);
+INSERT INTO "remix_artist" VALUES(1662,4313,1);
+INSERT INTO "remix_artist" VALUES(1663,4730,1);
+INSERT INTO "remix_artist" VALUES(1664,4331,1);
+INSERT INTO "remix_artist" VALUES(1665,4586,1);
+INSERT INTO "remix_artist" VALUES(1665,5097,1);
+INSERT INTO "remix_artist" VALUES(1666,4574,1);
+INSERT INTO "remix_artist" VALUES(1667,4751,1);
+INSERT INTO "remix_artist" VALUES(1668,4765,1);
+INSERT INTO "remix_artist" VALUES(1669,4766,1);
+INSERT INTO "remix_artist" VALUES(1670,4694,1);
+INSERT INTO "remix_artist" VALUES(1670,4767,1);
+INSERT INTO "remix_artist" VALUES(1671,4691,1);
+INSERT INTO "remix_artist" VALUES(1672,4661,1);
+INSERT INTO "remix_artist" VALUES(1673,4730,1);
+INSERT INTO "remix_artist" VALUES(1674,4768,1);
+INSERT INTO "remix_artist" VALUES(1675,4758,1);
+INSERT INTO "remix_artist" VALUES(1676,4553,1);
+INSERT INTO "remix_artist" VALUES(1676,4769,1);
+INSERT INTO "remix_artist" VALUES(1677,4751,1);
+INSERT INTO "remix_artist" VALUES(1678,4699,1);
+INSERT INTO "remix_artist" VALUES(1679,4728,1);
+INSERT INTO "remix_artist" VALUES(1680,4556,1);
+INSERT INTO "remix_artist" VALUES(1681,4770,1);
+INSERT INTO "remix_artist" VALUES(1682,4381,1);
+INSERT INTO "remix_artist" VALUES(1683,4482,1);
+INSERT INTO "remix_artist" VALUES(1684,4320,1);
+INSERT INTO "remix_artist" VALUES(1685,4628,1);
+INSERT INTO "remix_artist" VALUES(1686,4753,1);
+INSERT INTO "remix_artist" VALUES(1687,4771,1);
+INSERT INTO "remix_artist" VALUES(1688,4772,1);
+INSERT INTO "remix_artist" VALUES(1689,4730,1);
+INSERT INTO "remix_artist" VALUES(1690,4313,1);
+INSERT INTO "remix_artist" VALUES(1691,4751,1);
+INSERT INTO "remix_artist" VALUES(1692,4807,1);
+INSERT INTO "remix_artist" VALUES(1693,4283,1);
+INSERT INTO "remix_artist" VALUES(1693,4299,1);
+INSERT INTO "remix_artist" VALUES(1694,4628,1);
+INSERT INTO "remix_artist" VALUES(1694,4635,1);
+INSERT INTO "remix_artist" VALUES(1694,4755,1);
+INSERT INTO "remix_artist" VALUES(1695,4558,1);
+INSERT INTO "remix_artist" VALUES(1696,4773,1);
+INSERT INTO "remix_artist" VALUES(1697,4540,1);
+INSERT INTO "remix_artist" VALUES(1698,4751,1);
+INSERT INTO "remix_artist" VALUES(1699,4774,1);
+INSERT INTO "remix_artist" VALUES(1700,4280,1);
+INSERT INTO "remix_artist" VALUES(1701,4775,1);
+INSERT INTO "remix_artist" VALUES(1702,4628,1);
+INSERT INTO "remix_artist" VALUES(1702,4685,1);
+INSERT INTO "remix_artist" VALUES(1703,4663,1);
+INSERT INTO "remix_artist" VALUES(1704,4776,1);
+INSERT INTO "remix_artist" VALUES(1705,4749,1);
+INSERT INTO "remix_artist" VALUES(1706,4730,1);
+INSERT INTO "remix_artist" VALUES(1706,4748,1);
+INSERT INTO "remix_artist" VALUES(1707,4505,1);
+INSERT INTO "remix_artist" VALUES(1708,4765,1);
+INSERT INTO "remix_artist" VALUES(1709,4313,1);
+INSERT INTO "remix_artist" VALUES(1710,4751,1);
+INSERT INTO "remix_artist" VALUES(1711,4805,1);
+INSERT INTO "remix_artist" VALUES(1712,4482,1);
+INSERT INTO "remix_artist" VALUES(1712,4685,1);
+INSERT INTO "remix_artist" VALUES(1713,4290,1);
+INSERT INTO "remix_artist" VALUES(1713,4304,1);
+INSERT INTO "remix_artist" VALUES(1713,4427,1);
+INSERT INTO "remix_artist" VALUES(1713,4540,1);
+INSERT INTO "remix_artist" VALUES(1713,4558,1);
+INSERT INTO "remix_artist" VALUES(1714,4313,1);
+INSERT INTO "remix_artist" VALUES(1715,4432,1);
+INSERT INTO "remix_artist" VALUES(1716,4292,1);
+INSERT INTO "remix_artist" VALUES(1716,4595,1);
+INSERT INTO "remix_artist" VALUES(1717,4773,1);
+INSERT INTO "remix_artist" VALUES(1718,4574,1);
+INSERT INTO "remix_artist" VALUES(1719,4777,1);
+INSERT INTO "remix_artist" VALUES(1720,4553,1);
+INSERT INTO "remix_artist" VALUES(1721,4729,1);
+INSERT INTO "remix_artist" VALUES(1722,4511,1);
+INSERT INTO "remix_artist" VALUES(1722,4587,1);
+INSERT INTO "remix_artist" VALUES(1723,4628,1);
+INSERT INTO "remix_artist" VALUES(1723,4685,1);
+INSERT INTO "remix_artist" VALUES(1723,4778,1);
+INSERT INTO "remix_artist" VALUES(1724,4779,1);
+INSERT INTO "remix_artist" VALUES(1725,4759,1);
+INSERT INTO "remix_artist" VALUES(1726,4748,1);
+INSERT INTO "remix_artist" VALUES(1727,4331,1);
+INSERT INTO "remix_artist" VALUES(1728,4751,1);
+INSERT INTO "remix_artist" VALUES(1729,4724,1);
+INSERT INTO "remix_artist" VALUES(1729,4780,1);
+INSERT INTO "remix_artist" VALUES(1730,4628,1);
+INSERT INTO "remix_artist" VALUES(1730,4685,1);
+INSERT INTO "remix_artist" VALUES(1731,4781,1);
+INSERT INTO "remix_artist" VALUES(1732,4595,1);
+INSERT INTO "remix_artist" VALUES(1733,4635,1);
+INSERT INTO "remix_artist" VALUES(1733,4730,1);
+INSERT INTO "remix_artist" VALUES(1733,4748,1);
+INSERT INTO "remix_artist" VALUES(1734,4743,1);
+INSERT INTO "remix_artist" VALUES(1735,4553,1);
+INSERT INTO "remix_artist" VALUES(1736,4765,1);
+INSERT INTO "remix_artist" VALUES(1737,4782,1);
+INSERT INTO "remix_artist" VALUES(1737,11002,1);
+INSERT INTO "remix_artist" VALUES(1738,4656,1);
+INSERT INTO "remix_artist" VALUES(1739,4628,1);
+INSERT INTO "remix_artist" VALUES(1739,4659,1);
+INSERT INTO "remix_artist" VALUES(1740,4279,1);
+INSERT INTO "remix_artist" VALUES(1741,4311,1);
+INSERT INTO "remix_artist" VALUES(1742,4783,1);
+INSERT INTO "remix_artist" VALUES(1743,4619,1);
+INSERT INTO "remix_artist" VALUES(1744,4645,1);
+INSERT INTO "remix_artist" VALUES(1745,4685,1);
+INSERT INTO "remix_artist" VALUES(1746,4643,1);
+INSERT INTO "remix_artist" VALUES(1747,4784,1);
+INSERT INTO "remix_artist" VALUES(1748,4785,1);
+INSERT INTO "remix_artist" VALUES(1749,4313,1);
+INSERT INTO "remix_artist" VALUES(1750,4320,1);
+INSERT INTO "remix_artist" VALUES(1751,4729,1);
+INSERT INTO "remix_artist" VALUES(1752,4786,1);
+INSERT INTO "remix_artist" VALUES(1753,4772,1);
+INSERT INTO "remix_artist" VALUES(1754,4594,1);
+INSERT INTO "remix_artist" VALUES(1755,4518,1);
+INSERT INTO "remix_artist" VALUES(1755,4750,1);
+INSERT INTO "remix_artist" VALUES(1756,4787,1);
+INSERT INTO "remix_artist" VALUES(1757,4682,1);
+INSERT INTO "remix_artist" VALUES(1757,4726,1);
+INSERT INTO "remix_artist" VALUES(1758,4751,1);
+INSERT INTO "remix_artist" VALUES(1758,4754,1);
+INSERT INTO "remix_artist" VALUES(1759,4788,1);
+INSERT INTO "remix_artist" VALUES(1760,4723,1);
+INSERT INTO "remix_artist" VALUES(1761,4520,1);
+INSERT INTO "remix_artist" VALUES(1762,4803,1);
+INSERT INTO "remix_artist" VALUES(1763,4705,1);
+INSERT INTO "remix_artist" VALUES(1764,4691,1);
+INSERT INTO "remix_artist" VALUES(1765,4765,1);
+INSERT INTO "remix_artist" VALUES(1766,4556,1);
+INSERT INTO "remix_artist" VALUES(1767,4781,1);
+INSERT INTO "remix_artist" VALUES(1768,4553,1);
+INSERT INTO "remix_artist" VALUES(1769,4751,1);
+INSERT INTO "remix_artist" VALUES(1770,4627,1);
+INSERT INTO "remix_artist" VALUES(1771,4685,1);
+INSERT INTO "remix_artist" VALUES(1772,4758,1);
+INSERT INTO "remix_artist" VALUES(1773,4748,1);
+INSERT INTO "remix_artist" VALUES(1773,4789,1);
+INSERT INTO "remix_artist" VALUES(1774,4579,1);
+INSERT INTO "remix_artist" VALUES(1775,4304,1);
+INSERT INTO "remix_artist" VALUES(1776,4290,1);
+INSERT INTO "remix_artist" VALUES(1777,4790,1);
+INSERT INTO "remix_artist" VALUES(1778,4791,1);
+INSERT INTO "remix_artist" VALUES(1779,4792,1);
+INSERT INTO "remix_artist" VALUES(1780,4793,1);
+INSERT INTO "remix_artist" VALUES(1781,4794,1);
+INSERT INTO "remix_artist" VALUES(1782,4279,1);
+INSERT INTO "remix_artist" VALUES(1783,4809,1);
+INSERT INTO "remix_artist" VALUES(1784,4284,1);
+INSERT INTO "remix_artist" VALUES(1784,4429,1);
+INSERT INTO "remix_artist" VALUES(1785,4635,1);
+INSERT INTO "remix_artist" VALUES(1786,4795,1);
+INSERT INTO "remix_artist" VALUES(1787,4685,1);
+INSERT INTO "remix_artist" VALUES(1787,4796,1);
+INSERT INTO "remix_artist" VALUES(1788,4797,1);
+INSERT INTO "remix_artist" VALUES(1789,4798,1);
+INSERT INTO "remix_artist" VALUES(1790,4799,1);
+INSERT INTO "remix_artist" VALUES(1791,4765,1);
+INSERT INTO "remix_artist" VALUES(1791,4800,1);
+INSERT INTO "remix_artist" VALUES(1792,4730,1);
+INSERT INTO "remix_artist" VALUES(1793,4311,1);
+INSERT INTO "remix_artist" VALUES(1794,4598,1);
+INSERT INTO "remix_artist" VALUES(1795,4729,1);
+INSERT INTO "remix_artist" VALUES(1796,4789,1);
+INSERT INTO "remix_artist" VALUES(1797,4805,1);
+INSERT INTO "remix_artist" VALUES(1798,4508,1);
+INSERT INTO "remix_artist" VALUES(1799,4313,1);
+INSERT INTO "remix_artist" VALUES(1800,4440,1);
+INSERT INTO "remix_artist" VALUES(1801,4553,1);
+INSERT INTO "remix_artist" VALUES(1801,4769,1);
+INSERT INTO "remix_artist" VALUES(1802,4751,1);
+INSERT INTO "remix_artist" VALUES(1803,4588,1);
+INSERT INTO "remix_artist" VALUES(1804,4787,1);
+INSERT INTO "remix_artist" VALUES(1805,4724,1);
+INSERT INTO "remix_artist" VALUES(1806,4291,1);
+INSERT INTO "remix_artist" VALUES(1806,4846,1);
+INSERT INTO "remix_artist" VALUES(1806,10899,1);
+INSERT INTO "remix_artist" VALUES(1807,4403,1);
+INSERT INTO "remix_artist" VALUES(1808,4790,1);
+INSERT INTO "remix_artist" VALUES(1809,4574,1);
+INSERT INTO "remix_artist" VALUES(1810,4754,1);
+INSERT INTO "remix_artist" VALUES(1810,4765,1);
+INSERT INTO "remix_artist" VALUES(1811,4553,1);
+INSERT INTO "remix_artist" VALUES(1811,4769,1);
+INSERT INTO "remix_artist" VALUES(1812,4579,1);
+INSERT INTO "remix_artist" VALUES(1812,4685,1);
+INSERT INTO "remix_artist" VALUES(1813,4639,1);
+INSERT INTO "remix_artist" VALUES(1813,4720,1);
+INSERT INTO "remix_artist" VALUES(1814,4579,1);
+INSERT INTO "remix_artist" VALUES(1814,4769,1);
+INSERT INTO "remix_artist" VALUES(1815,4649,1);
+INSERT INTO "remix_artist" VALUES(1815,4750,1);
+INSERT INTO "remix_artist" VALUES(1816,4540,1);
+INSERT INTO "remix_artist" VALUES(1816,4558,1);
+INSERT INTO "remix_artist" VALUES(1816,4967,1);
+INSERT INTO "remix_artist" VALUES(1817,4754,1);
+INSERT INTO "remix_artist" VALUES(1817,4787,1);
+INSERT INTO "remix_artist" VALUES(1818,4986,1);
+INSERT INTO "remix_artist" VALUES(1819,4994,1);
+INSERT INTO "remix_artist" VALUES(1820,4635,1);
+INSERT INTO "remix_artist" VALUES(1821,4283,1);
+INSERT INTO "remix_artist" VALUES(1821,4331,1);
+INSERT INTO "remix_artist" VALUES(1822,4730,1);
+INSERT INTO "remix_artist" VALUES(1823,4699,1);
+INSERT INTO "remix_artist" VALUES(1824,4439,1);
+INSERT INTO "remix_artist" VALUES(1825,5012,1);
+INSERT INTO "remix_artist" VALUES(1826,4789,1);
+INSERT INTO "remix_artist" VALUES(1827,4685,1);
+INSERT INTO "remix_artist" VALUES(1828,4482,1);
+INSERT INTO "remix_artist" VALUES(1829,4751,1);
+INSERT INTO "remix_artist" VALUES(1830,4729,1);
+INSERT INTO "remix_artist" VALUES(1830,4765,1);
+INSERT INTO "remix_artist" VALUES(1831,4723,1);
+INSERT INTO "remix_artist" VALUES(1832,4777,1);
+INSERT INTO "remix_artist" VALUES(1833,4753,1);
+INSERT INTO "remix_artist" VALUES(1834,4619,1);
+INSERT INTO "remix_artist" VALUES(1835,4440,1);
+INSERT INTO "remix_artist" VALUES(1836,4730,1);
+INSERT INTO "remix_artist" VALUES(1836,5012,1);
+INSERT INTO "remix_artist" VALUES(1837,5034,1);
+INSERT INTO "remix_artist" VALUES(1838,5037,1);
+INSERT INTO "remix_artist" VALUES(1839,5038,1);
+INSERT INTO "remix_artist" VALUES(1840,5043,1);
+INSERT INTO "remix_artist" VALUES(1841,4628,1);
+INSERT INTO "remix_artist" VALUES(1841,4635,1);
+INSERT INTO "remix_artist" VALUES(1842,4634,1);
+INSERT INTO "remix_artist" VALUES(1842,4635,1);
+INSERT INTO "remix_artist" VALUES(1843,4694,1);
+INSERT INTO "remix_artist" VALUES(1843,4695,1);
+INSERT INTO "remix_artist" VALUES(1844,4724,1);
+INSERT INTO "remix_artist" VALUES(1845,4464,1);
+INSERT INTO "remix_artist" VALUES(1846,4781,1);
+INSERT INTO "remix_artist" VALUES(1847,5042,1);
+INSERT INTO "remix_artist" VALUES(1848,4504,1);
+INSERT INTO "remix_artist" VALUES(1849,4628,1);
+INSERT INTO "remix_artist" VALUES(1850,4685,1);
+INSERT INTO "remix_artist" VALUES(1851,4559,1);
+INSERT INTO "remix_artist" VALUES(1851,4738,1);
+INSERT INTO "remix_artist" VALUES(1852,4751,1);
+INSERT INTO "remix_artist" VALUES(1853,5128,1);
+INSERT INTO "remix_artist" VALUES(1854,4779,1);
+INSERT INTO "remix_artist" VALUES(1855,4313,1);
+INSERT INTO "remix_artist" VALUES(1856,5035,1);
+INSERT INTO "remix_artist" VALUES(1857,5127,1);
+INSERT INTO "remix_artist" VALUES(1858,4695,1);
+INSERT INTO "remix_artist" VALUES(1859,5040,1);
+INSERT INTO "remix_artist" VALUES(1860,5131,1);
+INSERT INTO "remix_artist" VALUES(1861,5130,1);
+INSERT INTO "remix_artist" VALUES(1862,4797,1);
+INSERT INTO "remix_artist" VALUES(1863,5036,1);
+INSERT INTO "remix_artist" VALUES(1864,4627,1);
+INSERT INTO "remix_artist" VALUES(1864,5041,1);
+INSERT INTO "remix_artist" VALUES(1865,5039,1);
+INSERT INTO "remix_artist" VALUES(1866,9947,1);
+INSERT INTO "remix_artist" VALUES(1867,4645,1);
+INSERT INTO "remix_artist" VALUES(1868,4751,1);
+INSERT INTO "remix_artist" VALUES(1869,4724,1);
+INSERT INTO "remix_artist" VALUES(1870,4729,1);
+INSERT INTO "remix_artist" VALUES(1871,4626,1);
+INSERT INTO "remix_artist" VALUES(1871,4742,1);
+INSERT INTO "remix_artist" VALUES(1872,4705,1);
+INSERT INTO "remix_artist" VALUES(1873,4764,1);
+INSERT INTO "remix_artist" VALUES(1874,5012,1);
+INSERT INTO "remix_artist" VALUES(1875,4729,1);
+INSERT INTO "remix_artist" VALUES(1875,4787,1);
+INSERT INTO "remix_artist" VALUES(1875,5200,1);
+INSERT INTO "remix_artist" VALUES(1876,4440,1);
+INSERT INTO "remix_artist" VALUES(1877,4723,1);
+INSERT INTO "remix_artist" VALUES(1878,4748,1);
+INSERT INTO "remix_artist" VALUES(1879,4699,1);
+INSERT INTO "remix_artist" VALUES(1880,4752,1);
+INSERT INTO "remix_artist" VALUES(1880,5199,1);
+INSERT INTO "remix_artist" VALUES(1881,4574,1);
+INSERT INTO "remix_artist" VALUES(1882,4721,1);
+INSERT INTO "remix_artist" VALUES(1883,4576,1);
+INSERT INTO "remix_artist" VALUES(1884,5041,1);
+INSERT INTO "remix_artist" VALUES(1885,4697,1);
+INSERT INTO "remix_artist" VALUES(1885,4749,1);
+INSERT INTO "remix_artist" VALUES(1885,5198,1);
+INSERT INTO "remix_artist" VALUES(1885,5201,1);
+INSERT INTO "remix_artist" VALUES(1886,4730,1);
+INSERT INTO "remix_artist" VALUES(1887,4795,1);
+INSERT INTO "remix_artist" VALUES(1888,5043,1);
+INSERT INTO "remix_artist" VALUES(1889,5130,1);
+INSERT INTO "remix_artist" VALUES(1890,5071,1);
+INSERT INTO "remix_artist" VALUES(1891,4297,1);
+INSERT INTO "remix_artist" VALUES(1892,4726,1);
+INSERT INTO "remix_artist" VALUES(1892,4729,1);
+INSERT INTO "remix_artist" VALUES(1893,4789,1);
+INSERT INTO "remix_artist" VALUES(1894,4313,1);
+INSERT INTO "remix_artist" VALUES(1895,4588,1);
+INSERT INTO "remix_artist" VALUES(1896,4304,1);
+INSERT INTO "remix_artist" VALUES(1896,4579,1);
+INSERT INTO "remix_artist" VALUES(1897,4692,1);
+INSERT INTO "remix_artist" VALUES(1898,5178,1);
+INSERT INTO "remix_artist" VALUES(1899,4743,1);
+INSERT INTO "remix_artist" VALUES(1899,4751,1);
+INSERT INTO "remix_artist" VALUES(1900,4331,1);
+INSERT INTO "remix_artist" VALUES(1901,4787,1);
+INSERT INTO "remix_artist" VALUES(1902,4793,1);
+INSERT INTO "remix_artist" VALUES(1903,5132,1);
+INSERT INTO "remix_artist" VALUES(1904,4685,1);
+INSERT INTO "remix_artist" VALUES(1905,5176,1);
+INSERT INTO "remix_artist" VALUES(1905,5177,1);
+INSERT INTO "remix_artist" VALUES(1906,5179,1);
+INSERT INTO "remix_artist" VALUES(1907,4613,1);
+INSERT INTO "remix_artist" VALUES(1908,5186,1);
+INSERT INTO "remix_artist" VALUES(1909,5033,1);
+INSERT INTO "remix_artist" VALUES(1910,4508,1);
+INSERT INTO "remix_artist" VALUES(1911,4787,1);
+INSERT INTO "remix_artist" VALUES(1912,4772,1);
+INSERT INTO "remix_artist" VALUES(1913,4789,1);
+INSERT INTO "remix_artist" VALUES(1914,177,1);
+INSERT INTO "remix_artist" VALUES(1914,4635,1);
+INSERT INTO "remix_artist" VALUES(1915,4781,1);
+INSERT INTO "remix_artist" VALUES(1916,4795,1);
+INSERT INTO "remix_artist" VALUES(1917,4793,1);
+INSERT INTO "remix_artist" VALUES(1918,4555,1);
+INSERT INTO "remix_artist" VALUES(1919,4694,1);
+INSERT INTO "remix_artist" VALUES(1920,4707,1);
+INSERT INTO "remix_artist" VALUES(1921,4486,1);
+INSERT INTO "remix_artist" VALUES(1922,4695,1);
+INSERT INTO "remix_artist" VALUES(1922,4777,1);
+INSERT INTO "remix_artist" VALUES(1923,4751,1);
+INSERT INTO "remix_artist" VALUES(1923,4777,1);
+INSERT INTO "remix_artist" VALUES(1924,5180,1);
+INSERT INTO "remix_artist" VALUES(1925,5043,1);
+INSERT INTO "remix_artist" VALUES(1926,5315,1);
+INSERT INTO "remix_artist" VALUES(1927,4553,1);
+INSERT INTO "remix_artist" VALUES(1928,4553,1);
+INSERT INTO "remix_artist" VALUES(1929,4553,1);
+INSERT INTO "remix_artist" VALUES(1930,4549,1);
+INSERT INTO "remix_artist" VALUES(1931,4786,1);
+INSERT INTO "remix_artist" VALUES(1931,5320,1);
+INSERT INTO "remix_artist" VALUES(1931,5321,1);
+INSERT INTO "remix_artist" VALUES(1931,5322,1);
+INSERT INTO "remix_artist" VALUES(1932,4543,1);
+INSERT INTO "remix_artist" VALUES(1933,4768,1);
+INSERT INTO "remix_artist" VALUES(1934,4787,1);
+INSERT INTO "remix_artist" VALUES(1935,5187,1);
+INSERT INTO "remix_artist" VALUES(1936,4501,1);
+INSERT INTO "remix_artist" VALUES(1937,4723,1);
+INSERT INTO "remix_artist" VALUES(1938,4627,1);
+INSERT INTO "remix_artist" VALUES(1939,4760,1);
+INSERT INTO "remix_artist" VALUES(1939,5181,1);
+INSERT INTO "remix_artist" VALUES(1939,5182,1);
+INSERT INTO "remix_artist" VALUES(1940,5043,1);
+INSERT INTO "remix_artist" VALUES(1941,4729,1);
+INSERT INTO "remix_artist" VALUES(1942,5180,1);
+INSERT INTO "remix_artist" VALUES(1943,4787,1);
+INSERT INTO "remix_artist" VALUES(1944,5386,1);
+INSERT INTO "remix_artist" VALUES(1945,4744,1);
+INSERT INTO "remix_artist" VALUES(1946,5390,1);
+INSERT INTO "remix_artist" VALUES(1947,5393,1);
+INSERT INTO "remix_artist" VALUES(1948,5187,1);
+INSERT INTO "remix_artist" VALUES(1949,5392,1);
+INSERT INTO "remix_artist" VALUES(1950,4795,1);
+INSERT INTO "remix_artist" VALUES(1951,4627,1);
+INSERT INTO "remix_artist" VALUES(1952,5041,1);
+INSERT INTO "remix_artist" VALUES(1952,5391,1);
+INSERT INTO "remix_artist" VALUES(1953,4699,1);
+INSERT INTO "remix_artist" VALUES(1954,4781,1);
+INSERT INTO "remix_artist" VALUES(1955,4486,1);
+INSERT INTO "remix_artist" VALUES(1956,4440,1);
+INSERT INTO "remix_artist" VALUES(1956,5394,1);
+INSERT INTO "remix_artist" VALUES(1957,4793,1);
+INSERT INTO "remix_artist" VALUES(1958,5396,1);
+INSERT INTO "remix_artist" VALUES(1959,4729,1);
+INSERT INTO "remix_artist" VALUES(1960,4720,1);
+INSERT INTO "remix_artist" VALUES(1961,4313,1);
+INSERT INTO "remix_artist" VALUES(1962,5043,1);
+INSERT INTO "remix_artist" VALUES(1963,4790,1);
+INSERT INTO "remix_artist" VALUES(1964,4754,1);
+INSERT INTO "remix_artist" VALUES(1965,4695,1);
+INSERT INTO "remix_artist" VALUES(1966,5415,1);
+INSERT INTO "remix_artist" VALUES(1967,4640,1);
+INSERT INTO "remix_artist" VALUES(1968,5198,1);
+INSERT INTO "remix_artist" VALUES(1968,5420,1);
+INSERT INTO "remix_artist" VALUES(1969,5425,1);
+INSERT INTO "remix_artist" VALUES(1970,4784,1);
+INSERT INTO "remix_artist" VALUES(1971,4765,1);
+INSERT INTO "remix_artist" VALUES(1971,5315,1);
+INSERT INTO "remix_artist" VALUES(1972,4697,1);
+INSERT INTO "remix_artist" VALUES(1972,4726,1);
+INSERT INTO "remix_artist" VALUES(1972,4787,1);
+INSERT INTO "remix_artist" VALUES(1973,4664,1);
+INSERT INTO "remix_artist" VALUES(1974,4594,1);
+INSERT INTO "remix_artist" VALUES(1975,5473,1);
+INSERT INTO "remix_artist" VALUES(1975,5474,1);
+INSERT INTO "remix_artist" VALUES(1976,5511,1);
+INSERT INTO "remix_artist" VALUES(1977,4553,1);
+INSERT INTO "remix_artist" VALUES(1978,4793,1);
+INSERT INTO "remix_artist" VALUES(1979,4291,1);
+INSERT INTO "remix_artist" VALUES(1979,4293,1);
+INSERT INTO "remix_artist" VALUES(1979,4723,1);
+INSERT INTO "remix_artist" VALUES(1979,5183,1);
+INSERT INTO "remix_artist" VALUES(1980,5184,1);
+INSERT INTO "remix_artist" VALUES(1980,5548,1);
+INSERT INTO "remix_artist" VALUES(1981,5549,1);
+INSERT INTO "remix_artist" VALUES(1982,4773,1);
+INSERT INTO "remix_artist" VALUES(1983,4729,1);
+INSERT INTO "remix_artist" VALUES(1984,5180,1);
+INSERT INTO "remix_artist" VALUES(1985,4754,1);
+INSERT INTO "remix_artist" VALUES(1986,5043,1);
+INSERT INTO "remix_artist" VALUES(1987,4651,1);
+INSERT INTO "remix_artist" VALUES(1988,4748,1);
+INSERT INTO "remix_artist" VALUES(1989,4720,1);
+INSERT INTO "remix_artist" VALUES(1990,4628,1);
+INSERT INTO "remix_artist" VALUES(1991,4486,1);
+INSERT INTO "remix_artist" VALUES(1992,5035,1);
+INSERT INTO "remix_artist" VALUES(1993,5628,1);
+INSERT INTO "remix_artist" VALUES(1994,4795,1);
+INSERT INTO "remix_artist" VALUES(1995,5653,1);
+INSERT INTO "remix_artist" VALUES(1995,5654,1);
+INSERT INTO "remix_artist" VALUES(1996,5655,1);
+INSERT INTO "remix_artist" VALUES(1997,4729,1);
+INSERT INTO "remix_artist" VALUES(1997,5420,1);
+INSERT INTO "remix_artist" VALUES(1997,5496,1);
+INSERT INTO "remix_artist" VALUES(1998,4793,1);
+INSERT INTO "remix_artist" VALUES(1999,4755,1);
+INSERT INTO "remix_artist" VALUES(1999,5717,1);
@@ -0,0 +1,1197 @@
+INSERT INTO "remix_artist" VALUES(2000,21,1);
+INSERT INTO "remix_artist" VALUES(2000,100,1);
+INSERT INTO "remix_artist" VALUES(2000,102,1);
+INSERT INTO "remix_artist" VALUES(2001,4279,1);
+INSERT INTO "remix_artist" VALUES(2002,4754,1);
+INSERT INTO "remix_artist" VALUES(2003,4291,1);
+INSERT INTO "remix_artist" VALUES(2003,4692,1);
+INSERT INTO "remix_artist" VALUES(2003,4846,1);
+INSERT INTO "remix_artist" VALUES(2003,5706,1);
+INSERT INTO "remix_artist" VALUES(2004,4553,1);
+INSERT INTO "remix_artist" VALUES(2005,36,1);
+INSERT INTO "remix_artist" VALUES(2006,4598,1);
+INSERT INTO "remix_artist" VALUES(2006,4679,1);
+INSERT INTO "remix_artist" VALUES(2006,4694,1);
+INSERT INTO "remix_artist" VALUES(2007,4722,1);
+INSERT INTO "remix_artist" VALUES(2008,4720,1);
+INSERT INTO "remix_artist" VALUES(2008,5420,1);
+INSERT INTO "remix_artist" VALUES(2009,4306,1);
+INSERT INTO "remix_artist" VALUES(2010,4751,1);
+INSERT INTO "remix_artist" VALUES(2011,5792,1);
+INSERT INTO "remix_artist" VALUES(2012,4787,1);
+INSERT INTO "remix_artist" VALUES(2013,4463,1);
+INSERT INTO "remix_artist" VALUES(2014,5793,1);
+INSERT INTO "remix_artist" VALUES(2015,4553,1);
+INSERT INTO "remix_artist" VALUES(2016,4673,1);
+INSERT INTO "remix_artist" VALUES(2017,4656,1);
+INSERT INTO "remix_artist" VALUES(2018,4628,1);
+INSERT INTO "remix_artist" VALUES(2019,5043,1);
+INSERT INTO "remix_artist" VALUES(2020,4758,1);
+INSERT INTO "remix_artist" VALUES(2021,4793,1);
+INSERT INTO "remix_artist" VALUES(2022,4787,1);
+INSERT INTO "remix_artist" VALUES(2023,5939,1);
+INSERT INTO "remix_artist" VALUES(2024,5405,1);
+INSERT INTO "remix_artist" VALUES(2025,4440,1);
+INSERT INTO "remix_artist" VALUES(2026,4595,1);
+INSERT INTO "remix_artist" VALUES(2027,6016,1);
+INSERT INTO "remix_artist" VALUES(2028,4628,1);
+INSERT INTO "remix_artist" VALUES(2028,4659,1);
+INSERT INTO "remix_artist" VALUES(2029,5877,1);
+INSERT INTO "remix_artist" VALUES(2030,4767,1);
+INSERT INTO "remix_artist" VALUES(2031,5879,1);
+INSERT INTO "remix_artist" VALUES(2032,4803,1);
+INSERT INTO "remix_artist" VALUES(2033,5876,1);
+INSERT INTO "remix_artist" VALUES(2034,4440,1);
+INSERT INTO "remix_artist" VALUES(2035,4723,1);
+INSERT INTO "remix_artist" VALUES(2036,4635,1);
+INSERT INTO "remix_artist" VALUES(2037,4751,1);
+INSERT INTO "remix_artist" VALUES(2038,5198,1);
+INSERT INTO "remix_artist" VALUES(2039,5315,1);
+INSERT INTO "remix_artist" VALUES(2040,5878,1);
+INSERT INTO "remix_artist" VALUES(2041,5420,1);
+INSERT INTO "remix_artist" VALUES(2042,4795,1);
+INSERT INTO "remix_artist" VALUES(2043,4692,1);
+INSERT INTO "remix_artist" VALUES(2044,8893,1);
+INSERT INTO "remix_artist" VALUES(2045,4553,1);
+INSERT INTO "remix_artist" VALUES(2046,6106,1);
+INSERT INTO "remix_artist" VALUES(2047,9947,1);
+INSERT INTO "remix_artist" VALUES(2048,4290,1);
+INSERT INTO "remix_artist" VALUES(2049,5569,1);
+INSERT INTO "remix_artist" VALUES(2050,6107,1);
+INSERT INTO "remix_artist" VALUES(2050,6112,1);
+INSERT INTO "remix_artist" VALUES(2051,8981,1);
+INSERT INTO "remix_artist" VALUES(2052,5043,1);
+INSERT INTO "remix_artist" VALUES(2053,4668,1);
+INSERT INTO "remix_artist" VALUES(2054,8998,1);
+INSERT INTO "remix_artist" VALUES(2055,5178,1);
+INSERT INTO "remix_artist" VALUES(2056,4643,1);
+INSERT INTO "remix_artist" VALUES(2057,5040,1);
+INSERT INTO "remix_artist" VALUES(2058,4584,1);
+INSERT INTO "remix_artist" VALUES(2059,5315,1);
+INSERT INTO "remix_artist" VALUES(2060,5043,1);
+INSERT INTO "remix_artist" VALUES(2061,4795,1);
+INSERT INTO "remix_artist" VALUES(2062,4751,1);
+INSERT INTO "remix_artist" VALUES(2063,4793,1);
+INSERT INTO "remix_artist" VALUES(2064,4781,1);
+INSERT INTO "remix_artist" VALUES(2065,4553,1);
+INSERT INTO "remix_artist" VALUES(2066,5420,1);
+INSERT INTO "remix_artist" VALUES(2067,4440,1);
+INSERT INTO "remix_artist" VALUES(2068,8119,1);
+INSERT INTO "remix_artist" VALUES(2069,4651,1);
+INSERT INTO "remix_artist" VALUES(2070,4685,1);
+INSERT INTO "remix_artist" VALUES(2071,4304,1);
+INSERT INTO "remix_artist" VALUES(2071,4664,1);
+INSERT INTO "remix_artist" VALUES(2071,6131,1);
+INSERT INTO "remix_artist" VALUES(2071,6132,1);
+INSERT INTO "remix_artist" VALUES(2071,8359,1);
+INSERT INTO "remix_artist" VALUES(2072,9047,1);
+INSERT INTO "remix_artist" VALUES(2073,4579,1);
+INSERT INTO "remix_artist" VALUES(2074,4635,1);
+INSERT INTO "remix_artist" VALUES(2075,5406,1);
+INSERT INTO "remix_artist" VALUES(2076,4440,1);
+INSERT INTO "remix_artist" VALUES(2077,4313,1);
+INSERT INTO "remix_artist" VALUES(2077,9079,1);
+INSERT INTO "remix_artist" VALUES(2078,5707,1);
+INSERT INTO "remix_artist" VALUES(2079,9080,1);
+INSERT INTO "remix_artist" VALUES(2080,4751,1);
+INSERT INTO "remix_artist" VALUES(2081,9076,1);
+INSERT INTO "remix_artist" VALUES(2082,4748,1);
+INSERT INTO "remix_artist" VALUES(2083,5178,1);
+INSERT INTO "remix_artist" VALUES(2084,4758,1);
+INSERT INTO "remix_artist" VALUES(2085,4777,1);
+INSERT INTO "remix_artist" VALUES(2085,5420,1);
+INSERT INTO "remix_artist" VALUES(2086,5037,1);
+INSERT INTO "remix_artist" VALUES(2087,4698,1);
+INSERT INTO "remix_artist" VALUES(2087,4994,1);
+INSERT INTO "remix_artist" VALUES(2088,9264,1);
+INSERT INTO "remix_artist" VALUES(2089,4721,1);
+INSERT INTO "remix_artist" VALUES(2090,4771,1);
+INSERT INTO "remix_artist" VALUES(2091,4685,1);
+INSERT INTO "remix_artist" VALUES(2092,4723,1);
+INSERT INTO "remix_artist" VALUES(2093,4628,1);
+INSERT INTO "remix_artist" VALUES(2094,4482,1);
+INSERT INTO "remix_artist" VALUES(2095,4750,1);
+INSERT INTO "remix_artist" VALUES(2096,4789,1);
+INSERT INTO "remix_artist" VALUES(2097,4767,1);
+INSERT INTO "remix_artist" VALUES(2098,4508,1);
+INSERT INTO "remix_artist" VALUES(2099,4726,1);
+INSERT INTO "remix_artist" VALUES(2099,4751,1);
+INSERT INTO "remix_artist" VALUES(2100,4558,1);
+INSERT INTO "remix_artist" VALUES(2101,4729,1);
+INSERT INTO "remix_artist" VALUES(2102,4699,1);
+INSERT INTO "remix_artist" VALUES(2103,4787,1);
+INSERT INTO "remix_artist" VALUES(2104,4574,1);
+INSERT INTO "remix_artist" VALUES(2105,4553,1);
+INSERT INTO "remix_artist" VALUES(2106,6114,1);
+INSERT INTO "remix_artist" VALUES(2107,5041,1);
+INSERT INTO "remix_artist" VALUES(2108,5420,1);
+INSERT INTO "remix_artist" VALUES(2109,9947,1);
+INSERT INTO "remix_artist" VALUES(2110,4789,1);
+INSERT INTO "remix_artist" VALUES(2110,5409,1);
+INSERT INTO "remix_artist" VALUES(2111,4304,1);
+INSERT INTO "remix_artist" VALUES(2111,4664,1);
+INSERT INTO "remix_artist" VALUES(2111,8358,1);
+INSERT INTO "remix_artist" VALUES(2112,36,1);
+INSERT INTO "remix_artist" VALUES(2113,4781,1);
+INSERT INTO "remix_artist" VALUES(2114,4549,1);
+INSERT INTO "remix_artist" VALUES(2114,4697,1);
+INSERT INTO "remix_artist" VALUES(2115,4673,1);
+INSERT INTO "remix_artist" VALUES(2116,4695,1);
+INSERT INTO "remix_artist" VALUES(2116,8998,1);
+INSERT INTO "remix_artist" VALUES(2117,5184,1);
+INSERT INTO "remix_artist" VALUES(2118,5406,1);
+INSERT INTO "remix_artist" VALUES(2118,5940,1);
+INSERT INTO "remix_artist" VALUES(2119,4553,1);
+INSERT INTO "remix_artist" VALUES(2120,4313,1);
+INSERT INTO "remix_artist" VALUES(2121,4660,1);
+INSERT INTO "remix_artist" VALUES(2122,5043,1);
+INSERT INTO "remix_artist" VALUES(2123,4651,1);
+INSERT INTO "remix_artist" VALUES(2124,4793,1);
+INSERT INTO "remix_artist" VALUES(2125,9514,1);
+INSERT INTO "remix_artist" VALUES(2126,5035,1);
+INSERT INTO "remix_artist" VALUES(2127,4595,1);
+INSERT INTO "remix_artist" VALUES(2129,4574,1);
+INSERT INTO "remix_artist" VALUES(2131,4773,1);
+INSERT INTO "remix_artist" VALUES(2132,9511,1);
+INSERT INTO "remix_artist" VALUES(2133,4673,1);
+INSERT INTO "remix_artist" VALUES(2134,4787,1);
+INSERT INTO "remix_artist" VALUES(2135,5043,1);
+INSERT INTO "remix_artist" VALUES(2136,6113,1);
+INSERT INTO "remix_artist" VALUES(2137,4553,1);
+INSERT INTO "remix_artist" VALUES(2138,4668,1);
+INSERT INTO "remix_artist" VALUES(2139,9516,1);
+INSERT INTO "remix_artist" VALUES(2140,4797,1);
+INSERT INTO "remix_artist" VALUES(2140,9512,1);
+INSERT INTO "remix_artist" VALUES(2141,4793,1);
+INSERT INTO "remix_artist" VALUES(2141,9962,1);
+INSERT INTO "remix_artist" VALUES(2142,4605,1);
+INSERT INTO "remix_artist" VALUES(2143,4651,1);
+INSERT INTO "remix_artist" VALUES(2144,4695,1);
+INSERT INTO "remix_artist" VALUES(2144,4754,1);
+INSERT INTO "remix_artist" VALUES(2145,4666,1);
+INSERT INTO "remix_artist" VALUES(2146,5628,1);
+INSERT INTO "remix_artist" VALUES(2147,4439,1);
+INSERT INTO "remix_artist" VALUES(2148,5043,1);
+INSERT INTO "remix_artist" VALUES(2149,4482,1);
+INSERT INTO "remix_artist" VALUES(2150,4759,1);
+INSERT INTO "remix_artist" VALUES(2151,4751,1);
+INSERT INTO "remix_artist" VALUES(2152,5420,1);
+INSERT INTO "remix_artist" VALUES(2153,5178,1);
+INSERT INTO "remix_artist" VALUES(2154,4705,1);
+INSERT INTO "remix_artist" VALUES(2155,4628,1);
+INSERT INTO "remix_artist" VALUES(2156,4699,1);
+INSERT INTO "remix_artist" VALUES(2157,4752,1);
+INSERT INTO "remix_artist" VALUES(2158,4651,1);
+INSERT INTO "remix_artist" VALUES(2159,4284,1);
+INSERT INTO "remix_artist" VALUES(2160,4726,1);
+INSERT INTO "remix_artist" VALUES(2160,4751,1);
+INSERT INTO "remix_artist" VALUES(2161,4659,1);
+INSERT INTO "remix_artist" VALUES(2161,4751,1);
+INSERT INTO "remix_artist" VALUES(2162,4659,1);
+INSERT INTO "remix_artist" VALUES(2162,4751,1);
+INSERT INTO "remix_artist" VALUES(2164,4482,1);
+INSERT INTO "remix_artist" VALUES(2165,5184,1);
+INSERT INTO "remix_artist" VALUES(2166,4673,1);
+INSERT INTO "remix_artist" VALUES(2167,10123,1);
+INSERT INTO "remix_artist" VALUES(2168,10202,1);
+INSERT INTO "remix_artist" VALUES(2169,5392,1);
+INSERT INTO "remix_artist" VALUES(2170,4724,1);
+INSERT INTO "remix_artist" VALUES(2170,4780,1);
+INSERT INTO "remix_artist" VALUES(2170,5041,1);
+INSERT INTO "remix_artist" VALUES(2171,4793,1);
+INSERT INTO "remix_artist" VALUES(2172,10125,1);
+INSERT INTO "remix_artist" VALUES(2173,10225,1);
+INSERT INTO "remix_artist" VALUES(2174,10007,1);
+INSERT INTO "remix_artist" VALUES(2175,10224,1);
+INSERT INTO "remix_artist" VALUES(2176,4628,1);
+INSERT INTO "remix_artist" VALUES(2177,4440,1);
+INSERT INTO "remix_artist" VALUES(2178,4760,1);
+INSERT INTO "remix_artist" VALUES(2179,5198,1);
+INSERT INTO "remix_artist" VALUES(2179,10270,1);
+INSERT INTO "remix_artist" VALUES(2179,10271,1);
+INSERT INTO "remix_artist" VALUES(2179,10272,1);
+INSERT INTO "remix_artist" VALUES(2180,4595,1);
+INSERT INTO "remix_artist" VALUES(2180,10273,1);
+INSERT INTO "remix_artist" VALUES(2181,4635,1);
+INSERT INTO "remix_artist" VALUES(2182,4313,1);
+INSERT INTO "remix_artist" VALUES(2183,10277,1);
+INSERT INTO "remix_artist" VALUES(2184,10222,1);
+INSERT INTO "remix_artist" VALUES(2185,10172,1);
+INSERT INTO "remix_artist" VALUES(2186,4758,1);
+INSERT INTO "remix_artist" VALUES(2187,4793,1);
+INSERT INTO "remix_artist" VALUES(2188,10204,1);
+INSERT INTO "remix_artist" VALUES(2189,5415,1);
+INSERT INTO "remix_artist" VALUES(2190,10319,1);
+INSERT INTO "remix_artist" VALUES(2191,4313,1);
+INSERT INTO "remix_artist" VALUES(2192,4793,1);
+INSERT INTO "remix_artist" VALUES(2192,5043,1);
+INSERT INTO "remix_artist" VALUES(2192,5178,1);
+INSERT INTO "remix_artist" VALUES(2193,4619,1);
+INSERT INTO "remix_artist" VALUES(2194,4754,1);
+INSERT INTO "remix_artist" VALUES(2195,5043,1);
+INSERT INTO "remix_artist" VALUES(2196,4793,1);
+INSERT INTO "remix_artist" VALUES(2197,4761,1);
+INSERT INTO "remix_artist" VALUES(2198,4651,1);
+INSERT INTO "remix_artist" VALUES(2199,5178,1);
+INSERT INTO "remix_artist" VALUES(2200,4286,1);
+INSERT INTO "remix_artist" VALUES(2200,4628,1);
+INSERT INTO "remix_artist" VALUES(2201,4796,1);
+INSERT INTO "remix_artist" VALUES(2202,4673,1);
+INSERT INTO "remix_artist" VALUES(2203,5178,1);
+INSERT INTO "remix_artist" VALUES(2204,9076,1);
+INSERT INTO "remix_artist" VALUES(2205,4501,1);
+INSERT INTO "remix_artist" VALUES(2206,5182,1);
+INSERT INTO "remix_artist" VALUES(2207,10136,1);
+INSERT INTO "remix_artist" VALUES(2208,4553,1);
+INSERT INTO "remix_artist" VALUES(2209,4553,1);
+INSERT INTO "remix_artist" VALUES(2210,4553,1);
+INSERT INTO "remix_artist" VALUES(2211,4279,1);
+INSERT INTO "remix_artist" VALUES(2212,5826,1);
+INSERT INTO "remix_artist" VALUES(2212,5939,1);
+INSERT INTO "remix_artist" VALUES(2213,4748,1);
+INSERT INTO "remix_artist" VALUES(2214,5420,1);
+INSERT INTO "remix_artist" VALUES(2215,5043,1);
+INSERT INTO "remix_artist" VALUES(2216,4793,1);
+INSERT INTO "remix_artist" VALUES(2217,5315,1);
+INSERT INTO "remix_artist" VALUES(2218,4751,1);
+INSERT INTO "remix_artist" VALUES(2219,4729,1);
+INSERT INTO "remix_artist" VALUES(2219,4765,1);
+INSERT INTO "remix_artist" VALUES(2220,4793,1);
+INSERT INTO "remix_artist" VALUES(2221,4651,1);
+INSERT INTO "remix_artist" VALUES(2222,4661,1);
+INSERT INTO "remix_artist" VALUES(2222,4724,1);
+INSERT INTO "remix_artist" VALUES(2223,4687,1);
+INSERT INTO "remix_artist" VALUES(2224,4723,1);
+INSERT INTO "remix_artist" VALUES(2225,10277,1);
+INSERT INTO "remix_artist" VALUES(2226,4781,1);
+INSERT INTO "remix_artist" VALUES(2227,9080,1);
+INSERT INTO "remix_artist" VALUES(2228,4787,1);
+INSERT INTO "remix_artist" VALUES(2229,4751,1);
+INSERT INTO "remix_artist" VALUES(2230,4777,1);
+INSERT INTO "remix_artist" VALUES(2230,5420,1);
+INSERT INTO "remix_artist" VALUES(2231,4799,1);
+INSERT INTO "remix_artist" VALUES(2232,4793,1);
+INSERT INTO "remix_artist" VALUES(2233,10661,1);
+INSERT INTO "remix_artist" VALUES(2234,4318,1);
+INSERT INTO "remix_artist" VALUES(2235,10226,1);
+INSERT INTO "remix_artist" VALUES(2236,10674,1);
+INSERT INTO "remix_artist" VALUES(2237,5043,1);
+INSERT INTO "remix_artist" VALUES(2238,4440,1);
+INSERT INTO "remix_artist" VALUES(2239,9947,1);
+INSERT INTO "remix_artist" VALUES(2240,4798,1);
+INSERT INTO "remix_artist" VALUES(2241,4625,1);
+INSERT INTO "remix_artist" VALUES(2241,4753,1);
+INSERT INTO "remix_artist" VALUES(2241,10667,1);
+INSERT INTO "remix_artist" VALUES(2242,4440,1);
+INSERT INTO "remix_artist" VALUES(2242,5394,1);
+INSERT INTO "remix_artist" VALUES(2243,5655,1);
+INSERT INTO "remix_artist" VALUES(2244,5043,1);
+INSERT INTO "remix_artist" VALUES(2245,5012,1);
+INSERT INTO "remix_artist" VALUES(2245,5396,1);
+INSERT INTO "remix_artist" VALUES(2245,10692,1);
+INSERT INTO "remix_artist" VALUES(2246,10663,1);
+INSERT INTO "remix_artist" VALUES(2247,10221,1);
+INSERT INTO "remix_artist" VALUES(2248,10669,1);
+INSERT INTO "remix_artist" VALUES(2249,10223,1);
+INSERT INTO "remix_artist" VALUES(2250,5043,1);
+INSERT INTO "remix_artist" VALUES(2251,4682,1);
+INSERT INTO "remix_artist" VALUES(2252,4486,1);
+INSERT INTO "remix_artist" VALUES(2253,4793,1);
+INSERT INTO "remix_artist" VALUES(2253,5409,1);
+INSERT INTO "remix_artist" VALUES(2254,10662,1);
+INSERT INTO "remix_artist" VALUES(2255,10222,1);
+INSERT INTO "remix_artist" VALUES(2256,5178,1);
+INSERT INTO "remix_artist" VALUES(2257,4798,1);
+INSERT INTO "remix_artist" VALUES(2258,10704,1);
+INSERT INTO "remix_artist" VALUES(2259,4660,1);
+INSERT INTO "remix_artist" VALUES(2259,5420,1);
+INSERT INTO "remix_artist" VALUES(2260,10771,1);
+INSERT INTO "remix_artist" VALUES(2260,10772,1);
+INSERT INTO "remix_artist" VALUES(2261,4598,1);
+INSERT INTO "remix_artist" VALUES(2262,4695,1);
+INSERT INTO "remix_artist" VALUES(2262,4777,1);
+INSERT INTO "remix_artist" VALUES(2262,5420,1);
+INSERT INTO "remix_artist" VALUES(2263,5406,1);
+INSERT INTO "remix_artist" VALUES(2263,10773,1);
+INSERT INTO "remix_artist" VALUES(2263,10774,1);
+INSERT INTO "remix_artist" VALUES(2264,5178,1);
+INSERT INTO "remix_artist" VALUES(2266,4651,1);
+INSERT INTO "remix_artist" VALUES(2267,5043,1);
+INSERT INTO "remix_artist" VALUES(2268,10724,1);
+INSERT INTO "remix_artist" VALUES(2269,4793,1);
+INSERT INTO "remix_artist" VALUES(2269,5178,1);
+INSERT INTO "remix_artist" VALUES(2269,9962,1);
+INSERT INTO "remix_artist" VALUES(2270,10672,1);
+INSERT INTO "remix_artist" VALUES(2271,10665,1);
+INSERT INTO "remix_artist" VALUES(2272,4754,1);
+INSERT INTO "remix_artist" VALUES(2273,10666,1);
+INSERT INTO "remix_artist" VALUES(2274,4605,1);
+INSERT INTO "remix_artist" VALUES(2275,10900,1);
+INSERT INTO "remix_artist" VALUES(2276,4628,1);
+INSERT INTO "remix_artist" VALUES(2276,10901,1);
+INSERT INTO "remix_artist" VALUES(2277,4482,1);
+INSERT INTO "remix_artist" VALUES(2278,4627,1);
+INSERT INTO "remix_artist" VALUES(2278,10902,1);
+INSERT INTO "remix_artist" VALUES(2279,5187,1);
+INSERT INTO "remix_artist" VALUES(2280,5043,1);
+INSERT INTO "remix_artist" VALUES(2281,4553,1);
+INSERT INTO "remix_artist" VALUES(2282,4793,1);
+INSERT INTO "remix_artist" VALUES(2282,5409,1);
+INSERT INTO "remix_artist" VALUES(2283,5041,1);
+INSERT INTO "remix_artist" VALUES(2284,10669,1);
+INSERT INTO "remix_artist" VALUES(2285,5420,1);
+INSERT INTO "remix_artist" VALUES(2286,5178,1);
+INSERT INTO "remix_artist" VALUES(2287,10172,1);
+INSERT INTO "remix_artist" VALUES(2288,9847,1);
+INSERT INTO "remix_artist" VALUES(2289,4525,1);
+INSERT INTO "remix_artist" VALUES(2290,10893,1);
+INSERT INTO "remix_artist" VALUES(2291,4639,1);
+INSERT INTO "remix_artist" VALUES(2292,4440,1);
+INSERT INTO "remix_artist" VALUES(2293,4685,1);
+INSERT INTO "remix_artist" VALUES(2294,10660,1);
+INSERT INTO "remix_artist" VALUES(2295,4655,1);
+INSERT INTO "remix_artist" VALUES(2295,5409,1);
+INSERT INTO "remix_artist" VALUES(2296,4726,1);
+INSERT INTO "remix_artist" VALUES(2296,4729,1);
+INSERT INTO "remix_artist" VALUES(2297,4553,1);
+INSERT INTO "remix_artist" VALUES(2298,10671,1);
+INSERT INTO "remix_artist" VALUES(2298,10692,1);
+INSERT INTO "remix_artist" VALUES(2299,4594,1);
+INSERT INTO "remix_artist" VALUES(2300,4685,1);
+INSERT INTO "remix_artist" VALUES(2301,5043,1);
+INSERT INTO "remix_artist" VALUES(2302,4635,1);
+INSERT INTO "remix_artist" VALUES(2303,5655,1);
+INSERT INTO "remix_artist" VALUES(2304,4543,1);
+INSERT INTO "remix_artist" VALUES(2305,4673,1);
+INSERT INTO "remix_artist" VALUES(2306,5043,1);
+INSERT INTO "remix_artist" VALUES(2306,5420,1);
+INSERT INTO "remix_artist" VALUES(2307,4293,1);
+INSERT INTO "remix_artist" VALUES(2307,4749,1);
+INSERT INTO "remix_artist" VALUES(2307,5420,1);
+INSERT INTO "remix_artist" VALUES(2307,10683,1);
+INSERT INTO "remix_artist" VALUES(2308,4685,1);
+INSERT INTO "remix_artist" VALUES(2309,4668,1);
+INSERT INTO "remix_artist" VALUES(2309,4720,1);
+INSERT INTO "remix_artist" VALUES(2309,8498,1);
+INSERT INTO "remix_artist" VALUES(2309,10691,1);
+INSERT INTO "remix_artist" VALUES(2309,11082,1);
+INSERT INTO "remix_artist" VALUES(2310,6106,1);
+INSERT INTO "remix_artist" VALUES(2311,4724,1);
+INSERT INTO "remix_artist" VALUES(2312,10670,1);
+INSERT INTO "remix_artist" VALUES(2313,10710,1);
+INSERT INTO "remix_artist" VALUES(2314,4313,1);
+INSERT INTO "remix_artist" VALUES(2315,10897,1);
+INSERT INTO "remix_artist" VALUES(2316,4754,1);
+INSERT INTO "remix_artist" VALUES(2317,10893,1);
+INSERT INTO "remix_artist" VALUES(2318,4628,1);
+INSERT INTO "remix_artist" VALUES(2319,10711,1);
+INSERT INTO "remix_artist" VALUES(2319,10712,1);
+INSERT INTO "remix_artist" VALUES(2320,10203,1);
+INSERT INTO "remix_artist" VALUES(2321,9947,1);
+INSERT INTO "remix_artist" VALUES(2322,10172,1);
+INSERT INTO "remix_artist" VALUES(2324,5420,1);
+INSERT INTO "remix_artist" VALUES(2324,10690,1);
+INSERT INTO "remix_artist" VALUES(2325,5473,1);
+INSERT INTO "remix_artist" VALUES(2325,10685,1);
+INSERT INTO "remix_artist" VALUES(2326,5043,1);
+INSERT INTO "remix_artist" VALUES(2327,4619,1);
+INSERT INTO "remix_artist" VALUES(2328,4635,1);
+INSERT INTO "remix_artist" VALUES(2328,10683,1);
+INSERT INTO "remix_artist" VALUES(2329,9528,1);
+INSERT INTO "remix_artist" VALUES(2330,11143,1);
+INSERT INTO "remix_artist" VALUES(2331,4553,1);
+INSERT INTO "remix_artist" VALUES(2332,5406,1);
+INSERT INTO "remix_artist" VALUES(2333,10683,1);
+INSERT INTO "remix_artist" VALUES(2334,10576,1);
+INSERT INTO "remix_artist" VALUES(2335,4789,1);
+INSERT INTO "remix_artist" VALUES(2336,10665,1);
+INSERT INTO "remix_artist" VALUES(2337,10669,1);
+INSERT INTO "remix_artist" VALUES(2338,10277,1);
+INSERT INTO "remix_artist" VALUES(2340,4781,1);
+INSERT INTO "remix_artist" VALUES(2341,4787,1);
+INSERT INTO "remix_artist" VALUES(2342,5187,1);
+INSERT INTO "remix_artist" VALUES(2343,9520,1);
+INSERT INTO "remix_artist" VALUES(2344,4635,1);
+INSERT INTO "remix_artist" VALUES(2345,4765,1);
+INSERT INTO "remix_artist" VALUES(2345,10656,1);
+INSERT INTO "remix_artist" VALUES(2346,4655,1);
+INSERT INTO "remix_artist" VALUES(2347,10988,1);
+INSERT INTO "remix_artist" VALUES(2348,5420,1);
+INSERT INTO "remix_artist" VALUES(2349,4440,1);
+INSERT INTO "remix_artist" VALUES(2350,4595,1);
+INSERT INTO "remix_artist" VALUES(2351,4605,1);
+INSERT INTO "remix_artist" VALUES(2351,5198,1);
+INSERT INTO "remix_artist" VALUES(2352,4367,1);
+INSERT INTO "remix_artist" VALUES(2352,5420,1);
+INSERT INTO "remix_artist" VALUES(2353,4555,1);
+INSERT INTO "remix_artist" VALUES(2354,5655,1);
+INSERT INTO "remix_artist" VALUES(2355,4798,1);
+INSERT INTO "remix_artist" VALUES(2356,4759,1);
+INSERT INTO "remix_artist" VALUES(2357,11356,1);
+INSERT INTO "remix_artist" VALUES(2358,4304,1);
+INSERT INTO "remix_artist" VALUES(2359,4793,1);
+INSERT INTO "remix_artist" VALUES(2360,10670,1);
+INSERT INTO "remix_artist" VALUES(2360,10896,1);
+INSERT INTO "remix_artist" VALUES(2361,4795,1);
+INSERT INTO "remix_artist" VALUES(2361,5043,1);
+INSERT INTO "remix_artist" VALUES(2362,10990,1);
+INSERT INTO "remix_artist" VALUES(2363,4787,1);
+INSERT INTO "remix_artist" VALUES(2364,9947,1);
+INSERT INTO "remix_artist" VALUES(2365,5793,1);
+INSERT INTO "remix_artist" VALUES(2366,4685,1);
+INSERT INTO "remix_artist" VALUES(2367,4781,1);
+INSERT INTO "remix_artist" VALUES(2368,4757,1);
+INSERT INTO "remix_artist" VALUES(2368,11479,1);
+INSERT INTO "remix_artist" VALUES(2368,11480,1);
+INSERT INTO "remix_artist" VALUES(2369,10665,1);
+INSERT INTO "remix_artist" VALUES(2370,5386,1);
+INSERT INTO "remix_artist" VALUES(2371,5655,1);
+INSERT INTO "remix_artist" VALUES(2372,10866,1);
+INSERT INTO "remix_artist" VALUES(2373,4795,1);
+INSERT INTO "remix_artist" VALUES(2374,4664,1);
+INSERT INTO "remix_artist" VALUES(2375,11481,1);
+INSERT INTO "remix_artist" VALUES(2376,4726,1);
+INSERT INTO "remix_artist" VALUES(2376,4729,1);
+INSERT INTO "remix_artist" VALUES(2377,5198,1);
+INSERT INTO "remix_artist" VALUES(2377,11582,1);
+INSERT INTO "remix_artist" VALUES(2378,4729,1);
+INSERT INTO "remix_artist" VALUES(2379,4699,1);
+INSERT INTO "remix_artist" VALUES(2380,4777,1);
+INSERT INTO "remix_artist" VALUES(2381,10692,1);
+INSERT INTO "remix_artist" VALUES(2382,10989,1);
+INSERT INTO "remix_artist" VALUES(2383,4290,1);
+INSERT INTO "remix_artist" VALUES(2383,4553,1);
+INSERT INTO "remix_artist" VALUES(2383,10274,1);
+INSERT INTO "remix_artist" VALUES(2384,4671,1);
+INSERT INTO "remix_artist" VALUES(2386,4789,1);
+INSERT INTO "remix_artist" VALUES(2387,10898,1);
+INSERT INTO "remix_artist" VALUES(2388,5041,1);
+INSERT INTO "remix_artist" VALUES(2389,4682,1);
+INSERT INTO "remix_artist" VALUES(2389,4726,1);
+INSERT INTO "remix_artist" VALUES(2390,11240,1);
+INSERT INTO "remix_artist" VALUES(2391,4795,1);
+INSERT INTO "remix_artist" VALUES(2392,5037,1);
+INSERT INTO "remix_artist" VALUES(2393,5386,1);
+INSERT INTO "remix_artist" VALUES(2394,4729,1);
+INSERT INTO "remix_artist" VALUES(2395,10692,1);
+INSERT INTO "remix_artist" VALUES(2396,4313,1);
+INSERT INTO "remix_artist" VALUES(2397,10994,1);
+INSERT INTO "remix_artist" VALUES(2397,10995,1);
+INSERT INTO "remix_artist" VALUES(2398,9047,1);
+INSERT INTO "remix_artist" VALUES(2399,5315,1);
+INSERT INTO "remix_artist" VALUES(2400,4440,1);
+INSERT INTO "remix_artist" VALUES(2401,10662,1);
+INSERT INTO "remix_artist" VALUES(2402,4685,1);
+INSERT INTO "remix_artist" VALUES(2403,9282,1);
+INSERT INTO "remix_artist" VALUES(2404,4595,1);
+INSERT INTO "remix_artist" VALUES(2405,11800,1);
+INSERT INTO "remix_artist" VALUES(2405,11879,1);
+INSERT INTO "remix_artist" VALUES(2406,4793,1);
+INSERT INTO "remix_artist" VALUES(2407,10124,1);
+INSERT INTO "remix_artist" VALUES(2408,4661,1);
+INSERT INTO "remix_artist" VALUES(2408,5198,1);
+INSERT INTO "remix_artist" VALUES(2408,5473,1);
+INSERT INTO "remix_artist" VALUES(2408,11799,1);
+INSERT INTO "remix_artist" VALUES(2409,4627,1);
+INSERT INTO "remix_artist" VALUES(2410,4586,1);
+INSERT INTO "remix_artist" VALUES(2411,4759,1);
+INSERT INTO "remix_artist" VALUES(2412,11496,1);
+INSERT INTO "remix_artist" VALUES(2413,4655,1);
+INSERT INTO "remix_artist" VALUES(2413,5409,1);
+INSERT INTO "remix_artist" VALUES(2414,4655,1);
+INSERT INTO "remix_artist" VALUES(2415,10222,1);
+INSERT INTO "remix_artist" VALUES(2416,11497,1);
+INSERT INTO "remix_artist" VALUES(2417,10665,1);
+INSERT INTO "remix_artist" VALUES(2418,4729,1);
+INSERT INTO "remix_artist" VALUES(2418,4787,1);
+INSERT INTO "remix_artist" VALUES(2419,4777,1);
+INSERT INTO "remix_artist" VALUES(2420,9047,1);
+INSERT INTO "remix_artist" VALUES(2421,5392,1);
+INSERT INTO "remix_artist" VALUES(2422,4537,1);
+INSERT INTO "remix_artist" VALUES(2423,4553,1);
+INSERT INTO "remix_artist" VALUES(2424,4793,1);
+INSERT INTO "remix_artist" VALUES(2424,9947,1);
+INSERT INTO "remix_artist" VALUES(2425,4793,1);
+INSERT INTO "remix_artist" VALUES(2426,9947,1);
+INSERT INTO "remix_artist" VALUES(2427,11495,1);
+INSERT INTO "remix_artist" VALUES(2428,4695,1);
+INSERT INTO "remix_artist" VALUES(2428,4720,1);
+INSERT INTO "remix_artist" VALUES(2428,5420,1);
+INSERT INTO "remix_artist" VALUES(2429,10669,1);
+INSERT INTO "remix_artist" VALUES(2430,5043,1);
+INSERT INTO "remix_artist" VALUES(2431,11551,1);
+INSERT INTO "remix_artist" VALUES(2433,10670,1);
+INSERT INTO "remix_artist" VALUES(2434,10665,1);
+INSERT INTO "remix_artist" VALUES(2435,4440,1);
+INSERT INTO "remix_artist" VALUES(2435,4799,1);
+INSERT INTO "remix_artist" VALUES(2436,4574,1);
+INSERT INTO "remix_artist" VALUES(2437,11959,1);
+INSERT INTO "remix_artist" VALUES(2438,4726,1);
+INSERT INTO "remix_artist" VALUES(2438,4729,1);
+INSERT INTO "remix_artist" VALUES(2439,5420,1);
+INSERT INTO "remix_artist" VALUES(2440,4685,1);
+INSERT INTO "remix_artist" VALUES(2441,11960,1);
+INSERT INTO "remix_artist" VALUES(2442,5425,1);
+INSERT INTO "remix_artist" VALUES(2443,4283,1);
+INSERT INTO "remix_artist" VALUES(2443,5198,1);
+INSERT INTO "remix_artist" VALUES(2444,11493,1);
+INSERT INTO "remix_artist" VALUES(2445,11797,1);
+INSERT INTO "remix_artist" VALUES(2446,11967,1);
+INSERT INTO "remix_artist" VALUES(2448,10669,1);
+INSERT INTO "remix_artist" VALUES(2449,10665,1);
+INSERT INTO "remix_artist" VALUES(2450,11774,1);
+INSERT INTO "remix_artist" VALUES(2451,11499,1);
+INSERT INTO "remix_artist" VALUES(2452,10895,1);
+INSERT INTO "remix_artist" VALUES(2453,5409,1);
+INSERT INTO "remix_artist" VALUES(2453,11941,1);
+INSERT INTO "remix_artist" VALUES(2454,5877,1);
+INSERT INTO "remix_artist" VALUES(2455,5406,1);
+INSERT INTO "remix_artist" VALUES(2455,10774,1);
+INSERT INTO "remix_artist" VALUES(2456,4651,1);
+INSERT INTO "remix_artist" VALUES(2457,11895,1);
+INSERT INTO "remix_artist" VALUES(2458,11937,1);
+INSERT INTO "remix_artist" VALUES(2459,10684,1);
+INSERT INTO "remix_artist" VALUES(2460,11782,1);
+INSERT INTO "remix_artist" VALUES(2461,11940,1);
+INSERT INTO "remix_artist" VALUES(2462,4673,1);
+INSERT INTO "remix_artist" VALUES(2464,11490,1);
+INSERT INTO "remix_artist" VALUES(2465,4318,1);
+INSERT INTO "remix_artist" VALUES(2466,10990,1);
+INSERT INTO "remix_artist" VALUES(2467,4547,1);
+INSERT INTO "remix_artist" VALUES(2468,11930,1);
+INSERT INTO "remix_artist" VALUES(2469,4758,1);
+INSERT INTO "remix_artist" VALUES(2470,4726,1);
+INSERT INTO "remix_artist" VALUES(2470,4729,1);
+INSERT INTO "remix_artist" VALUES(2470,5420,1);
+INSERT INTO "remix_artist" VALUES(2471,11785,1);
+INSERT INTO "remix_artist" VALUES(2472,5043,1);
+INSERT INTO "remix_artist" VALUES(2473,11494,1);
+INSERT INTO "remix_artist" VALUES(2474,10222,1);
+INSERT INTO "remix_artist" VALUES(2474,11915,1);
+INSERT INTO "remix_artist" VALUES(2475,10692,1);
+INSERT INTO "remix_artist" VALUES(2476,11931,1);
+INSERT INTO "remix_artist" VALUES(2478,10663,1);
+INSERT INTO "remix_artist" VALUES(2479,5184,1);
+INSERT INTO "remix_artist" VALUES(2480,11942,1);
+INSERT INTO "remix_artist" VALUES(2481,11773,1);
+INSERT INTO "remix_artist" VALUES(2482,4793,1);
+INSERT INTO "remix_artist" VALUES(2483,11782,1);
+INSERT INTO "remix_artist" VALUES(2484,10664,1);
+INSERT INTO "remix_artist" VALUES(2484,12149,1);
+INSERT INTO "remix_artist" VALUES(2485,10665,1);
+INSERT INTO "remix_artist" VALUES(2486,11939,1);
+INSERT INTO "remix_artist" VALUES(2487,9047,1);
+INSERT INTO "remix_artist" VALUES(2488,11501,1);
+INSERT INTO "remix_artist" VALUES(2488,11503,1);
+INSERT INTO "remix_artist" VALUES(2489,4798,1);
+INSERT INTO "remix_artist" VALUES(2490,4324,1);
+INSERT INTO "remix_artist" VALUES(2491,4641,1);
+INSERT INTO "remix_artist" VALUES(2492,4429,1);
+INSERT INTO "remix_artist" VALUES(2492,4469,1);
+INSERT INTO "remix_artist" VALUES(2496,11928,1);
+INSERT INTO "remix_artist" VALUES(2497,11777,1);
+INSERT INTO "remix_artist" VALUES(2497,11778,1);
+INSERT INTO "remix_artist" VALUES(2498,4574,1);
+INSERT INTO "remix_artist" VALUES(2499,10669,1);
+INSERT INTO "remix_artist" VALUES(2500,4285,1);
+INSERT INTO "remix_artist" VALUES(2501,4313,1);
+INSERT INTO "remix_artist" VALUES(2502,4796,1);
+INSERT INTO "remix_artist" VALUES(2503,4553,1);
+INSERT INTO "remix_artist" VALUES(2504,5420,1);
+INSERT INTO "remix_artist" VALUES(2504,11781,1);
+INSERT INTO "remix_artist" VALUES(2505,5643,1);
+INSERT INTO "remix_artist" VALUES(2506,11780,1);
+INSERT INTO "remix_artist" VALUES(2507,10665,1);
+INSERT INTO "remix_artist" VALUES(2508,11945,1);
+INSERT INTO "remix_artist" VALUES(2509,4720,1);
+INSERT INTO "remix_artist" VALUES(2510,12318,1);
+INSERT INTO "remix_artist" VALUES(2510,12319,1);
+INSERT INTO "remix_artist" VALUES(2510,12320,1);
+INSERT INTO "remix_artist" VALUES(2510,12321,1);
+INSERT INTO "remix_artist" VALUES(2510,12322,1);
+INSERT INTO "remix_artist" VALUES(2511,10663,1);
+INSERT INTO "remix_artist" VALUES(2512,4650,1);
+INSERT INTO "remix_artist" VALUES(2512,4660,1);
+INSERT INTO "remix_artist" VALUES(2513,11489,1);
+INSERT INTO "remix_artist" VALUES(2514,11776,1);
+INSERT INTO "remix_artist" VALUES(2515,10900,1);
+INSERT INTO "remix_artist" VALUES(2516,5187,1);
+INSERT INTO "remix_artist" VALUES(2516,5409,1);
+INSERT INTO "remix_artist" VALUES(2517,4777,1);
+INSERT INTO "remix_artist" VALUES(2518,11943,1);
+INSERT INTO "remix_artist" VALUES(2520,11961,1);
+INSERT INTO "remix_artist" VALUES(2521,11499,1);
+INSERT INTO "remix_artist" VALUES(2522,11932,1);
+INSERT INTO "remix_artist" VALUES(2523,5040,1);
+INSERT INTO "remix_artist" VALUES(2524,12421,1);
+INSERT INTO "remix_artist" VALUES(2525,4313,1);
+INSERT INTO "remix_artist" VALUES(2527,10222,1);
+INSERT INTO "remix_artist" VALUES(2528,5396,1);
+INSERT INTO "remix_artist" VALUES(2530,10723,1);
+INSERT INTO "remix_artist" VALUES(2531,10221,1);
+INSERT INTO "remix_artist" VALUES(2532,5876,1);
+INSERT INTO "remix_artist" VALUES(2533,5043,1);
+INSERT INTO "remix_artist" VALUES(2534,11429,1);
+INSERT INTO "remix_artist" VALUES(2535,11929,1);
+INSERT INTO "remix_artist" VALUES(2536,10665,1);
+INSERT INTO "remix_artist" VALUES(2537,4655,1);
+INSERT INTO "remix_artist" VALUES(2538,100,1);
+INSERT INTO "remix_artist" VALUES(2538,102,1);
+INSERT INTO "remix_artist" VALUES(2538,4540,1);
+INSERT INTO "remix_artist" VALUES(2538,4558,1);
+INSERT INTO "remix_artist" VALUES(2538,4595,1);
+INSERT INTO "remix_artist" VALUES(2538,4661,1);
+INSERT INTO "remix_artist" VALUES(2538,4695,1);
+INSERT INTO "remix_artist" VALUES(2538,4729,1);
+INSERT INTO "remix_artist" VALUES(2538,4749,1);
+INSERT INTO "remix_artist" VALUES(2538,5420,1);
+INSERT INTO "remix_artist" VALUES(2538,12484,1);
+INSERT INTO "remix_artist" VALUES(2539,4693,1);
+INSERT INTO "remix_artist" VALUES(2540,4313,1);
+INSERT INTO "remix_artist" VALUES(2541,5043,1);
+INSERT INTO "remix_artist" VALUES(2541,5420,1);
+INSERT INTO "remix_artist" VALUES(2542,4748,1);
+INSERT INTO "remix_artist" VALUES(2543,5655,1);
+INSERT INTO "remix_artist" VALUES(2544,4751,1);
+INSERT INTO "remix_artist" VALUES(2544,4793,1);
+INSERT INTO "remix_artist" VALUES(2545,5183,1);
+INSERT INTO "remix_artist" VALUES(2546,4595,1);
+INSERT INTO "remix_artist" VALUES(2547,4613,1);
+INSERT INTO "remix_artist" VALUES(2547,4628,1);
+INSERT INTO "remix_artist" VALUES(2548,100,1);
+INSERT INTO "remix_artist" VALUES(2548,5179,1);
+INSERT INTO "remix_artist" VALUES(2549,4759,1);
+INSERT INTO "remix_artist" VALUES(2550,4558,1);
+INSERT INTO "remix_artist" VALUES(2550,4595,1);
+INSERT INTO "remix_artist" VALUES(2550,5184,1);
+INSERT INTO "remix_artist" VALUES(2551,12483,1);
+INSERT INTO "remix_artist" VALUES(2552,4605,1);
+INSERT INTO "remix_artist" VALUES(2552,4661,1);
+INSERT INTO "remix_artist" VALUES(2552,4754,1);
+INSERT INTO "remix_artist" VALUES(2552,10683,1);
+INSERT INTO "remix_artist" VALUES(2553,10866,1);
+INSERT INTO "remix_artist" VALUES(2554,12107,1);
+INSERT INTO "remix_artist" VALUES(2555,5877,1);
+INSERT INTO "remix_artist" VALUES(2556,11774,1);
+INSERT INTO "remix_artist" VALUES(2557,9047,1);
+INSERT INTO "remix_artist" VALUES(2558,11944,1);
+INSERT INTO "remix_artist" VALUES(2559,10994,1);
+INSERT INTO "remix_artist" VALUES(2561,10692,1);
+INSERT INTO "remix_artist" VALUES(2562,12064,1);
+INSERT INTO "remix_artist" VALUES(2563,11943,1);
+INSERT INTO "remix_artist" VALUES(2564,10136,1);
+INSERT INTO "remix_artist" VALUES(2565,10683,1);
+INSERT INTO "remix_artist" VALUES(2566,5409,1);
+INSERT INTO "remix_artist" VALUES(2566,12540,1);
+INSERT INTO "remix_artist" VALUES(2567,12541,1);
+INSERT INTO "remix_artist" VALUES(2568,4605,1);
+INSERT INTO "remix_artist" VALUES(2568,12064,1);
+INSERT INTO "remix_artist" VALUES(2568,12546,1);
+INSERT INTO "remix_artist" VALUES(2568,12547,1);
+INSERT INTO "remix_artist" VALUES(2569,4695,1);
+INSERT INTO "remix_artist" VALUES(2571,4655,1);
+INSERT INTO "remix_artist" VALUES(2571,11774,1);
+INSERT INTO "remix_artist" VALUES(2572,10671,1);
+INSERT INTO "remix_artist" VALUES(2572,11510,1);
+INSERT INTO "remix_artist" VALUES(2573,10222,1);
+INSERT INTO "remix_artist" VALUES(2573,12106,1);
+INSERT INTO "remix_artist" VALUES(2574,4729,1);
+INSERT INTO "remix_artist" VALUES(2574,4765,1);
+INSERT INTO "remix_artist" VALUES(2575,4627,1);
+INSERT INTO "remix_artist" VALUES(2576,4655,1);
+INSERT INTO "remix_artist" VALUES(2576,5183,1);
+INSERT INTO "remix_artist" VALUES(2577,4732,1);
+INSERT INTO "remix_artist" VALUES(2577,8353,1);
+INSERT INTO "remix_artist" VALUES(2578,5655,1);
+INSERT INTO "remix_artist" VALUES(2579,10226,1);
+INSERT INTO "remix_artist" VALUES(2580,4482,1);
+INSERT INTO "remix_artist" VALUES(2581,5043,1);
+INSERT INTO "remix_artist" VALUES(2583,12352,1);
+INSERT INTO "remix_artist" VALUES(2584,4793,1);
+INSERT INTO "remix_artist" VALUES(2585,12317,1);
+INSERT INTO "remix_artist" VALUES(2586,5043,1);
+INSERT INTO "remix_artist" VALUES(2587,4440,1);
+INSERT INTO "remix_artist" VALUES(2588,11937,1);
+INSERT INTO "remix_artist" VALUES(2589,4656,1);
+INSERT INTO "remix_artist" VALUES(2590,4760,1);
+INSERT INTO "remix_artist" VALUES(2591,5643,1);
+INSERT INTO "remix_artist" VALUES(2592,4313,1);
+INSERT INTO "remix_artist" VALUES(2593,10665,1);
+INSERT INTO "remix_artist" VALUES(2594,5409,1);
+INSERT INTO "remix_artist" VALUES(2594,8587,1);
+INSERT INTO "remix_artist" VALUES(2595,9047,1);
+INSERT INTO "remix_artist" VALUES(2596,4673,1);
+INSERT INTO "remix_artist" VALUES(2597,11499,1);
+INSERT INTO "remix_artist" VALUES(2598,10136,1);
+INSERT INTO "remix_artist" VALUES(2599,11962,1);
+INSERT INTO "remix_artist" VALUES(2600,10172,1);
+INSERT INTO "remix_artist" VALUES(2601,4655,1);
+INSERT INTO "remix_artist" VALUES(2601,4726,1);
+INSERT INTO "remix_artist" VALUES(2601,4729,1);
+INSERT INTO "remix_artist" VALUES(2601,5409,1);
+INSERT INTO "remix_artist" VALUES(2602,4682,1);
+INSERT INTO "remix_artist" VALUES(2603,11963,1);
+INSERT INTO "remix_artist" VALUES(2604,5655,1);
+INSERT INTO "remix_artist" VALUES(2605,5043,1);
+INSERT INTO "remix_artist" VALUES(2606,5131,1);
+INSERT INTO "remix_artist" VALUES(2607,10661,1);
+INSERT INTO "remix_artist" VALUES(2608,10671,1);
+INSERT INTO "remix_artist" VALUES(2608,12065,1);
+INSERT INTO "remix_artist" VALUES(2609,4586,1);
+INSERT INTO "remix_artist" VALUES(2609,5097,1);
+INSERT INTO "remix_artist" VALUES(2609,12712,1);
+INSERT INTO "remix_artist" VALUES(2610,5315,1);
+INSERT INTO "remix_artist" VALUES(2611,4614,1);
+INSERT INTO "remix_artist" VALUES(2612,10690,1);
+INSERT INTO "remix_artist" VALUES(2613,11939,1);
+INSERT INTO "remix_artist" VALUES(2614,5628,1);
+INSERT INTO "remix_artist" VALUES(2614,10663,1);
+INSERT INTO "remix_artist" VALUES(2615,10222,1);
+INSERT INTO "remix_artist" VALUES(2615,12106,1);
+INSERT INTO "remix_artist" VALUES(2616,10692,1);
+INSERT INTO "remix_artist" VALUES(2616,12559,1);
+INSERT INTO "remix_artist" VALUES(2617,4793,1);
+INSERT INTO "remix_artist" VALUES(2618,4655,1);
+INSERT INTO "remix_artist" VALUES(2618,5409,1);
+INSERT INTO "remix_artist" VALUES(2619,10990,1);
+INSERT INTO "remix_artist" VALUES(2620,8981,1);
+INSERT INTO "remix_artist" VALUES(2621,4651,1);
+INSERT INTO "remix_artist" VALUES(2622,5178,1);
+INSERT INTO "remix_artist" VALUES(2623,8998,1);
+INSERT INTO "remix_artist" VALUES(2624,4793,1);
+INSERT INTO "remix_artist" VALUES(2625,4685,1);
+INSERT INTO "remix_artist" VALUES(2626,4787,1);
+INSERT INTO "remix_artist" VALUES(2626,5043,1);
+INSERT INTO "remix_artist" VALUES(2627,12312,1);
+INSERT INTO "remix_artist" VALUES(2628,5041,1);
+INSERT INTO "remix_artist" VALUES(2629,12541,1);
+INSERT INTO "remix_artist" VALUES(2630,5409,1);
+INSERT INTO "remix_artist" VALUES(2630,5420,1);
+INSERT INTO "remix_artist" VALUES(2630,11899,1);
+INSERT INTO "remix_artist" VALUES(2631,10319,1);
+INSERT INTO "remix_artist" VALUES(2632,5315,1);
+INSERT INTO "remix_artist" VALUES(2633,12708,1);
+INSERT INTO "remix_artist" VALUES(2634,4313,1);
+INSERT INTO "remix_artist" VALUES(2636,4347,1);
+INSERT INTO "remix_artist" VALUES(2637,5655,1);
+INSERT INTO "remix_artist" VALUES(2638,12355,1);
+INSERT INTO "remix_artist" VALUES(2639,5748,1);
+INSERT INTO "remix_artist" VALUES(2640,12364,1);
+INSERT INTO "remix_artist" VALUES(2641,4318,1);
+INSERT INTO "remix_artist" VALUES(2642,12703,1);
+INSERT INTO "remix_artist" VALUES(2643,4793,1);
+INSERT INTO "remix_artist" VALUES(2644,4595,1);
+INSERT INTO "remix_artist" VALUES(2645,4301,1);
+INSERT INTO "remix_artist" VALUES(2646,10665,1);
+INSERT INTO "remix_artist" VALUES(2648,10900,1);
+INSERT INTO "remix_artist" VALUES(2649,4655,1);
+INSERT INTO "remix_artist" VALUES(2650,4628,1);
+INSERT INTO "remix_artist" VALUES(2650,4659,1);
+INSERT INTO "remix_artist" VALUES(2651,4787,1);
+INSERT INTO "remix_artist" VALUES(2652,5420,1);
+INSERT INTO "remix_artist" VALUES(2653,4524,1);
+INSERT INTO "remix_artist" VALUES(2654,4737,1);
+INSERT INTO "remix_artist" VALUES(2654,12480,1);
+INSERT INTO "remix_artist" VALUES(2655,5043,1);
+INSERT INTO "remix_artist" VALUES(2656,4793,1);
+INSERT INTO "remix_artist" VALUES(2657,11774,1);
+INSERT INTO "remix_artist" VALUES(2657,11967,1);
+INSERT INTO "remix_artist" VALUES(2658,177,1);
+INSERT INTO "remix_artist" VALUES(2658,4635,1);
+INSERT INTO "remix_artist" VALUES(2659,12422,1);
+INSERT INTO "remix_artist" VALUES(2660,5655,1);
+INSERT INTO "remix_artist" VALUES(2660,10723,1);
+INSERT INTO "remix_artist" VALUES(2661,12316,1);
+INSERT INTO "remix_artist" VALUES(2662,11499,1);
+INSERT INTO "remix_artist" VALUES(2664,5043,1);
+INSERT INTO "remix_artist" VALUES(2665,10665,1);
+INSERT INTO "remix_artist" VALUES(2666,12314,1);
+INSERT INTO "remix_artist" VALUES(2666,12315,1);
+INSERT INTO "remix_artist" VALUES(2667,9047,1);
+INSERT INTO "remix_artist" VALUES(2669,12542,1);
+INSERT INTO "remix_artist" VALUES(2670,4803,1);
+INSERT INTO "remix_artist" VALUES(2671,12351,1);
+INSERT INTO "remix_artist" VALUES(2672,4793,1);
+INSERT INTO "remix_artist" VALUES(2673,12785,1);
+INSERT INTO "remix_artist" VALUES(2673,12786,1);
+INSERT INTO "remix_artist" VALUES(2673,12787,1);
+INSERT INTO "remix_artist" VALUES(2673,12788,1);
+INSERT INTO "remix_artist" VALUES(2673,12789,1);
+INSERT INTO "remix_artist" VALUES(2674,11481,1);
+INSERT INTO "remix_artist" VALUES(2675,11797,1);
+INSERT INTO "remix_artist" VALUES(2675,12932,1);
+INSERT INTO "remix_artist" VALUES(2676,5473,1);
+INSERT INTO "remix_artist" VALUES(2678,4772,1);
+INSERT INTO "remix_artist" VALUES(2679,5655,1);
+INSERT INTO "remix_artist" VALUES(2679,12481,1);
+INSERT INTO "remix_artist" VALUES(2680,4730,1);
+INSERT INTO "remix_artist" VALUES(2681,10665,1);
+INSERT INTO "remix_artist" VALUES(2682,4656,1);
+INSERT INTO "remix_artist" VALUES(2683,12701,1);
+INSERT INTO "remix_artist" VALUES(2684,10671,1);
+INSERT INTO "remix_artist" VALUES(2685,9076,1);
+INSERT INTO "remix_artist" VALUES(2686,4749,1);
+INSERT INTO "remix_artist" VALUES(2687,4628,1);
+INSERT INTO "remix_artist" VALUES(2687,4659,1);
+INSERT INTO "remix_artist" VALUES(2687,10683,1);
+INSERT INTO "remix_artist" VALUES(2687,12064,1);
+INSERT INTO "remix_artist" VALUES(2688,5655,1);
+INSERT INTO "remix_artist" VALUES(2689,10683,1);
+INSERT INTO "remix_artist" VALUES(2689,12942,1);
+INSERT INTO "remix_artist" VALUES(2690,4381,1);
+INSERT INTO "remix_artist" VALUES(2691,12064,1);
+INSERT INTO "remix_artist" VALUES(2692,5420,1);
+INSERT INTO "remix_artist" VALUES(2693,12941,1);
+INSERT INTO "remix_artist" VALUES(2693,12942,1);
+INSERT INTO "remix_artist" VALUES(2694,12943,1);
+INSERT INTO "remix_artist" VALUES(2695,4588,1);
+INSERT INTO "remix_artist" VALUES(2695,4729,1);
+INSERT INTO "remix_artist" VALUES(2696,4598,1);
+INSERT INTO "remix_artist" VALUES(2697,10669,1);
+INSERT INTO "remix_artist" VALUES(2698,4313,1);
+INSERT INTO "remix_artist" VALUES(2699,36,1);
+INSERT INTO "remix_artist" VALUES(2699,12944,1);
+INSERT INTO "remix_artist" VALUES(2700,3617,1);
+INSERT INTO "remix_artist" VALUES(2702,11938,1);
+INSERT INTO "remix_artist" VALUES(2703,12703,1);
+INSERT INTO "remix_artist" VALUES(2705,4655,1);
+INSERT INTO "remix_artist" VALUES(2706,10665,1);
+INSERT INTO "remix_artist" VALUES(2707,5655,1);
+INSERT INTO "remix_artist" VALUES(2707,11498,1);
+INSERT INTO "remix_artist" VALUES(2708,12702,1);
+INSERT INTO "remix_artist" VALUES(2709,12705,1);
+INSERT INTO "remix_artist" VALUES(2710,10897,1);
+INSERT INTO "remix_artist" VALUES(2710,12783,1);
+INSERT INTO "remix_artist" VALUES(2711,4543,1);
+INSERT INTO "remix_artist" VALUES(2712,9851,1);
+INSERT INTO "remix_artist" VALUES(2713,12131,1);
+INSERT INTO "remix_artist" VALUES(2714,13047,1);
+INSERT INTO "remix_artist" VALUES(2715,4729,1);
+INSERT INTO "remix_artist" VALUES(2716,4280,1);
+INSERT INTO "remix_artist" VALUES(2717,4559,1);
+INSERT INTO "remix_artist" VALUES(2717,4738,1);
+INSERT INTO "remix_artist" VALUES(2718,4479,1);
+INSERT INTO "remix_artist" VALUES(2719,4722,1);
+INSERT INTO "remix_artist" VALUES(2720,5184,1);
+INSERT INTO "remix_artist" VALUES(2721,12541,1);
+INSERT INTO "remix_artist" VALUES(2722,12953,1);
+INSERT INTO "remix_artist" VALUES(2722,12957,1);
+INSERT INTO "remix_artist" VALUES(2723,4751,1);
+INSERT INTO "remix_artist" VALUES(2724,4279,1);
+INSERT INTO "remix_artist" VALUES(2725,4628,1);
+INSERT INTO "remix_artist" VALUES(2725,4659,1);
+INSERT INTO "remix_artist" VALUES(2725,4723,1);
+INSERT INTO "remix_artist" VALUES(2726,4637,1);
+INSERT INTO "remix_artist" VALUES(2727,11939,1);
+INSERT INTO "remix_artist" VALUES(2728,13080,1);
+INSERT INTO "remix_artist" VALUES(2729,10990,1);
+INSERT INTO "remix_artist" VALUES(2729,13081,1);
+INSERT INTO "remix_artist" VALUES(2730,4796,1);
+INSERT INTO "remix_artist" VALUES(2731,4793,1);
+INSERT INTO "remix_artist" VALUES(2732,10893,1);
+INSERT INTO "remix_artist" VALUES(2733,5131,1);
+INSERT INTO "remix_artist" VALUES(2734,138,1);
+INSERT INTO "remix_artist" VALUES(2734,13148,1);
+INSERT INTO "remix_artist" VALUES(2735,4655,1);
+INSERT INTO "remix_artist" VALUES(2735,5409,1);
+INSERT INTO "remix_artist" VALUES(2735,8998,1);
+INSERT INTO "remix_artist" VALUES(2736,8361,1);
+INSERT INTO "remix_artist" VALUES(2736,12359,1);
+INSERT INTO "remix_artist" VALUES(2737,11929,1);
+INSERT INTO "remix_artist" VALUES(2738,11494,1);
+INSERT INTO "remix_artist" VALUES(2739,10226,1);
+INSERT INTO "remix_artist" VALUES(2740,4286,1);
+INSERT INTO "remix_artist" VALUES(2741,11774,1);
+INSERT INTO "remix_artist" VALUES(2742,13045,1);
+INSERT INTO "remix_artist" VALUES(2743,5040,1);
+INSERT INTO "remix_artist" VALUES(2744,4318,1);
+INSERT INTO "remix_artist" VALUES(2745,13056,1);
+INSERT INTO "remix_artist" VALUES(2746,12706,1);
+INSERT INTO "remix_artist" VALUES(2747,10893,1);
+INSERT INTO "remix_artist" VALUES(2747,13217,1);
+INSERT INTO "remix_artist" VALUES(2749,13052,1);
+INSERT INTO "remix_artist" VALUES(2750,11940,1);
+INSERT INTO "remix_artist" VALUES(2750,13054,1);
+INSERT INTO "remix_artist" VALUES(2751,11782,1);
+INSERT INTO "remix_artist" VALUES(2753,4722,1);
+INSERT INTO "remix_artist" VALUES(2754,11499,1);
+INSERT INTO "remix_artist" VALUES(2755,4729,1);
+INSERT INTO "remix_artist" VALUES(2756,4588,1);
+INSERT INTO "remix_artist" VALUES(2757,4754,1);
+INSERT INTO "remix_artist" VALUES(2757,12064,1);
+INSERT INTO "remix_artist" VALUES(2758,12560,1);
+INSERT INTO "remix_artist" VALUES(2759,12421,1);
+INSERT INTO "remix_artist" VALUES(2759,13290,1);
+INSERT INTO "remix_artist" VALUES(2761,4444,1);
+INSERT INTO "remix_artist" VALUES(2762,11932,1);
+INSERT INTO "remix_artist" VALUES(2764,4777,1);
+INSERT INTO "remix_artist" VALUES(2765,4543,1);
+INSERT INTO "remix_artist" VALUES(2766,4759,1);
+INSERT INTO "remix_artist" VALUES(2767,4628,1);
+INSERT INTO "remix_artist" VALUES(2768,11940,1);
+INSERT INTO "remix_artist" VALUES(2769,4440,1);
+INSERT INTO "remix_artist" VALUES(2770,4553,1);
+INSERT INTO "remix_artist" VALUES(2771,12541,1);
+INSERT INTO "remix_artist" VALUES(2772,13361,1);
+INSERT INTO "remix_artist" VALUES(2773,13147,1);
+INSERT INTO "remix_artist" VALUES(2774,4697,1);
+INSERT INTO "remix_artist" VALUES(2774,4726,1);
+INSERT INTO "remix_artist" VALUES(2774,4787,1);
+INSERT INTO "remix_artist" VALUES(2775,10897,1);
+INSERT INTO "remix_artist" VALUES(2775,12707,1);
+INSERT INTO "remix_artist" VALUES(2777,13045,1);
+INSERT INTO "remix_artist" VALUES(2778,5655,1);
+INSERT INTO "remix_artist" VALUES(2779,10665,1);
+INSERT INTO "remix_artist" VALUES(2780,6106,1);
+INSERT INTO "remix_artist" VALUES(2781,4287,1);
+INSERT INTO "remix_artist" VALUES(2781,13437,1);
+INSERT INTO "remix_artist" VALUES(2782,10893,1);
+INSERT INTO "remix_artist" VALUES(2782,13214,1);
+INSERT INTO "remix_artist" VALUES(2783,13434,1);
+INSERT INTO "remix_artist" VALUES(2784,11939,1);
+INSERT INTO "remix_artist" VALUES(2785,12707,1);
+INSERT INTO "remix_artist" VALUES(2786,4793,1);
+INSERT INTO "remix_artist" VALUES(2786,10893,1);
+INSERT INTO "remix_artist" VALUES(2787,5420,1);
+INSERT INTO "remix_artist" VALUES(2787,10894,1);
+INSERT INTO "remix_artist" VALUES(2788,13435,1);
+INSERT INTO "remix_artist" VALUES(2789,13496,1);
+INSERT INTO "remix_artist" VALUES(2790,13049,1);
+INSERT INTO "remix_artist" VALUES(2791,4793,1);
+INSERT INTO "remix_artist" VALUES(2793,9847,1);
+INSERT INTO "remix_artist" VALUES(2794,9047,1);
+INSERT INTO "remix_artist" VALUES(2795,12711,1);
+INSERT INTO "remix_artist" VALUES(2796,4655,1);
+INSERT INTO "remix_artist" VALUES(2796,5409,1);
+INSERT INTO "remix_artist" VALUES(2797,10866,1);
+INSERT INTO "remix_artist" VALUES(2798,4651,1);
+INSERT INTO "remix_artist" VALUES(2798,5420,1);
+INSERT INTO "remix_artist" VALUES(2799,10690,1);
+INSERT INTO "remix_artist" VALUES(2799,13046,1);
+INSERT INTO "remix_artist" VALUES(2799,13053,1);
+INSERT INTO "remix_artist" VALUES(2800,5655,1);
+INSERT INTO "remix_artist" VALUES(2800,12364,1);
+INSERT INTO "remix_artist" VALUES(2801,4656,1);
+INSERT INTO "remix_artist" VALUES(2802,12710,1);
+INSERT INTO "remix_artist" VALUES(2803,11785,1);
+INSERT INTO "remix_artist" VALUES(2804,10172,1);
+INSERT INTO "remix_artist" VALUES(2805,12352,1);
+INSERT INTO "remix_artist" VALUES(2807,4543,1);
+INSERT INTO "remix_artist" VALUES(2808,4729,1);
+INSERT INTO "remix_artist" VALUES(2809,4594,1);
+INSERT INTO "remix_artist" VALUES(2810,11945,1);
+INSERT INTO "remix_artist" VALUES(2811,4313,1);
+INSERT INTO "remix_artist" VALUES(2812,12710,1);
+INSERT INTO "remix_artist" VALUES(2813,13051,1);
+INSERT INTO "remix_artist" VALUES(2814,11929,1);
+INSERT INTO "remix_artist" VALUES(2815,4655,1);
+INSERT INTO "remix_artist" VALUES(2815,5043,1);
+INSERT INTO "remix_artist" VALUES(2815,5409,1);
+INSERT INTO "remix_artist" VALUES(2815,10683,1);
+INSERT INTO "remix_artist" VALUES(2816,11930,1);
+INSERT INTO "remix_artist" VALUES(2817,4796,1);
+INSERT INTO "remix_artist" VALUES(2818,13050,1);
+INSERT INTO "remix_artist" VALUES(2819,13049,1);
+INSERT INTO "remix_artist" VALUES(2820,13217,1);
+INSERT INTO "remix_artist" VALUES(2821,13217,1);
+INSERT INTO "remix_artist" VALUES(2822,13217,1);
+INSERT INTO "remix_artist" VALUES(2823,13045,1);
+INSERT INTO "remix_artist" VALUES(2824,10663,1);
+INSERT INTO "remix_artist" VALUES(2826,13046,1);
+INSERT INTO "remix_artist" VALUES(2827,4650,1);
+INSERT INTO "remix_artist" VALUES(2827,5655,1);
+INSERT INTO "remix_artist" VALUES(2828,12541,1);
+INSERT INTO "remix_artist" VALUES(2829,11940,1);
+INSERT INTO "remix_artist" VALUES(2829,13054,1);
+INSERT INTO "remix_artist" VALUES(2830,11499,1);
+INSERT INTO "remix_artist" VALUES(2831,12703,1);
+INSERT INTO "remix_artist" VALUES(2832,11490,1);
+INSERT INTO "remix_artist" VALUES(2833,12317,1);
+INSERT INTO "remix_artist" VALUES(2834,13042,1);
+INSERT INTO "remix_artist" VALUES(2835,4723,1);
+INSERT INTO "remix_artist" VALUES(2836,10990,1);
+INSERT INTO "remix_artist" VALUES(2837,4796,1);
+INSERT INTO "remix_artist" VALUES(2838,11930,1);
+INSERT INTO "remix_artist" VALUES(2839,10990,1);
+INSERT INTO "remix_artist" VALUES(2840,4787,1);
+INSERT INTO "remix_artist" VALUES(2842,5473,1);
+INSERT INTO "remix_artist" VALUES(2842,12704,1);
+INSERT INTO "remix_artist" VALUES(2843,11775,1);
+INSERT INTO "remix_artist" VALUES(2844,9047,1);
+INSERT INTO "remix_artist" VALUES(2845,13576,1);
+INSERT INTO "remix_artist" VALUES(2846,4793,1);
+INSERT INTO "remix_artist" VALUES(2846,5420,1);
+INSERT INTO "remix_artist" VALUES(2847,14582,1);
+INSERT INTO "remix_artist" VALUES(2848,5655,1);
+INSERT INTO "remix_artist" VALUES(2849,12541,1);
+INSERT INTO "remix_artist" VALUES(2850,4753,1);
+INSERT INTO "remix_artist" VALUES(2852,13663,1);
+INSERT INTO "remix_artist" VALUES(2853,13043,1);
+INSERT INTO "remix_artist" VALUES(2854,12064,1);
+INSERT INTO "remix_artist" VALUES(2855,4796,1);
+INSERT INTO "remix_artist" VALUES(2856,4543,1);
+INSERT INTO "remix_artist" VALUES(2857,11494,1);
+INSERT INTO "remix_artist" VALUES(2858,12352,1);
+INSERT INTO "remix_artist" VALUES(2859,13046,1);
+INSERT INTO "remix_artist" VALUES(2859,13147,1);
+INSERT INTO "remix_artist" VALUES(2860,13044,1);
+INSERT INTO "remix_artist" VALUES(2861,4628,1);
+INSERT INTO "remix_artist" VALUES(2861,4659,1);
+INSERT INTO "remix_artist" VALUES(2861,4724,1);
+INSERT INTO "remix_artist" VALUES(2861,12064,1);
+INSERT INTO "remix_artist" VALUES(2862,13057,1);
+INSERT INTO "remix_artist" VALUES(2863,5182,1);
+INSERT INTO "remix_artist" VALUES(2863,13432,1);
+INSERT INTO "remix_artist" VALUES(2864,11929,1);
+INSERT INTO "remix_artist" VALUES(2865,5041,1);
+INSERT INTO "remix_artist" VALUES(2866,13432,1);
+INSERT INTO "remix_artist" VALUES(2867,4685,1);
+INSERT INTO "remix_artist" VALUES(2867,5043,1);
+INSERT INTO "remix_artist" VALUES(2868,13678,1);
+INSERT INTO "remix_artist" VALUES(2869,4685,1);
+INSERT INTO "remix_artist" VALUES(2870,4313,1);
+INSERT INTO "remix_artist" VALUES(2872,11940,1);
+INSERT INTO "remix_artist" VALUES(2872,13054,1);
+INSERT INTO "remix_artist" VALUES(2873,13665,1);
+INSERT INTO "remix_artist" VALUES(2874,13666,1);
+INSERT INTO "remix_artist" VALUES(2875,4331,1);
+INSERT INTO "remix_artist" VALUES(2876,11963,1);
+INSERT INTO "remix_artist" VALUES(2877,13671,1);
+INSERT INTO "remix_artist" VALUES(2877,13672,1);
+INSERT INTO "remix_artist" VALUES(2878,13664,1);
+INSERT INTO "remix_artist" VALUES(2879,11929,1);
+INSERT INTO "remix_artist" VALUES(2880,10665,1);
+INSERT INTO "remix_artist" VALUES(2882,4651,1);
+INSERT INTO "remix_artist" VALUES(2882,12803,1);
+INSERT INTO "remix_artist" VALUES(2883,10222,1);
+INSERT INTO "remix_artist" VALUES(2883,10671,1);
+INSERT INTO "remix_artist" VALUES(2883,11915,1);
+INSERT INTO "remix_artist" VALUES(2883,11929,1);
+INSERT INTO "remix_artist" VALUES(2884,4313,1);
+INSERT INTO "remix_artist" VALUES(2885,12064,1);
+INSERT INTO "remix_artist" VALUES(2886,13213,1);
+INSERT INTO "remix_artist" VALUES(2887,4656,1);
+INSERT INTO "remix_artist" VALUES(2888,4781,1);
+INSERT INTO "remix_artist" VALUES(2889,12706,1);
+INSERT INTO "remix_artist" VALUES(2890,10866,1);
+INSERT INTO "remix_artist" VALUES(2891,10893,1);
+INSERT INTO "remix_artist" VALUES(2892,5643,1);
+INSERT INTO "remix_artist" VALUES(2892,13432,1);
+INSERT INTO "remix_artist" VALUES(2893,8998,1);
+INSERT INTO "remix_artist" VALUES(2895,13667,1);
+INSERT INTO "remix_artist" VALUES(2896,11777,1);
+INSERT INTO "remix_artist" VALUES(2896,11778,1);
+INSERT INTO "remix_artist" VALUES(2897,11774,1);
+INSERT INTO "remix_artist" VALUES(2898,12064,1);
+INSERT INTO "remix_artist" VALUES(2898,12364,1);
+INSERT INTO "remix_artist" VALUES(2899,4547,1);
+INSERT INTO "remix_artist" VALUES(2900,4639,1);
+INSERT INTO "remix_artist" VALUES(2901,4696,1);
+INSERT INTO "remix_artist" VALUES(2902,4655,1);
+INSERT INTO "remix_artist" VALUES(2902,11914,1);
+INSERT INTO "remix_artist" VALUES(2904,5043,1);
+INSERT INTO "remix_artist" VALUES(2904,13055,1);
+INSERT INTO "remix_artist" VALUES(2905,12312,1);
+INSERT INTO "remix_artist" VALUES(2906,12541,1);
+INSERT INTO "remix_artist" VALUES(2907,4787,1);
+INSERT INTO "remix_artist" VALUES(2908,4748,1);
+INSERT INTO "remix_artist" VALUES(2909,4754,1);
+INSERT INTO "remix_artist" VALUES(2910,4796,1);
+INSERT INTO "remix_artist" VALUES(2911,10893,1);
+INSERT INTO "remix_artist" VALUES(2911,13845,1);
+INSERT INTO "remix_artist" VALUES(2912,4793,1);
+INSERT INTO "remix_artist" VALUES(2913,4787,1);
+INSERT INTO "remix_artist" VALUES(2914,11773,1);
+INSERT INTO "remix_artist" VALUES(2914,13046,1);
+INSERT INTO "remix_artist" VALUES(2914,13147,1);
+INSERT INTO "remix_artist" VALUES(2915,4313,1);
+INSERT INTO "remix_artist" VALUES(2917,10222,1);
+INSERT INTO "remix_artist" VALUES(2918,11929,1);
+INSERT INTO "remix_artist" VALUES(2919,13669,1);
+INSERT INTO "remix_artist" VALUES(2920,4540,1);
+INSERT INTO "remix_artist" VALUES(2921,12422,1);
+INSERT INTO "remix_artist" VALUES(2922,13045,1);
+INSERT INTO "remix_artist" VALUES(2922,13500,1);
+INSERT INTO "remix_artist" VALUES(2924,13856,1);
+INSERT INTO "remix_artist" VALUES(2925,11782,1);
+INSERT INTO "remix_artist" VALUES(2926,4787,1);
+INSERT INTO "remix_artist" VALUES(2926,5043,1);
+INSERT INTO "remix_artist" VALUES(2927,10900,1);
+INSERT INTO "remix_artist" VALUES(2928,12711,1);
+INSERT INTO "remix_artist" VALUES(2929,5040,1);
+INSERT INTO "remix_artist" VALUES(2930,11797,1);
+INSERT INTO "remix_artist" VALUES(2930,11939,1);
+INSERT INTO "remix_artist" VALUES(2931,12703,1);
+INSERT INTO "remix_artist" VALUES(2932,13147,1);
+INSERT INTO "remix_artist" VALUES(2933,11932,1);
+INSERT INTO "remix_artist" VALUES(2934,4313,1);
+INSERT INTO "remix_artist" VALUES(2935,11963,1);
+INSERT INTO "remix_artist" VALUES(2936,5039,1);
+INSERT INTO "remix_artist" VALUES(2937,4777,1);
+INSERT INTO "remix_artist" VALUES(2938,12703,1);
+INSERT INTO "remix_artist" VALUES(2939,13147,1);
+INSERT INTO "remix_artist" VALUES(2939,13851,1);
+INSERT INTO "remix_artist" VALUES(2940,5178,1);
+INSERT INTO "remix_artist" VALUES(2940,11929,1);
+INSERT INTO "remix_artist" VALUES(2941,4656,1);
+INSERT INTO "remix_artist" VALUES(2942,4651,1);
+INSERT INTO "remix_artist" VALUES(2943,14582,1);
+INSERT INTO "remix_artist" VALUES(2945,4655,1);
+INSERT INTO "remix_artist" VALUES(2946,8998,1);
+INSERT INTO "remix_artist" VALUES(2947,12541,1);
+INSERT INTO "remix_artist" VALUES(2948,4543,1);
+INSERT INTO "remix_artist" VALUES(2949,12064,1);
+INSERT INTO "remix_artist" VALUES(2949,13668,1);
+INSERT INTO "remix_artist" VALUES(2950,4588,1);
+INSERT INTO "remix_artist" VALUES(2950,10772,1);
+INSERT INTO "remix_artist" VALUES(2950,13748,1);
+INSERT INTO "remix_artist" VALUES(2951,13854,1);
+INSERT INTO "remix_artist" VALUES(2952,11774,1);
+INSERT INTO "remix_artist" VALUES(2953,14011,1);
+INSERT INTO "remix_artist" VALUES(2954,13849,1);
+INSERT INTO "remix_artist" VALUES(2955,12710,1);
+INSERT INTO "remix_artist" VALUES(2956,11963,1);
+INSERT INTO "remix_artist" VALUES(2957,12783,1);
+INSERT INTO "remix_artist" VALUES(2959,4607,1);
+INSERT INTO "remix_artist" VALUES(2960,4726,1);
+INSERT INTO "remix_artist" VALUES(2960,4729,1);
+INSERT INTO "remix_artist" VALUES(2961,4685,1);
+INSERT INTO "remix_artist" VALUES(2962,10670,1);
+INSERT INTO "remix_artist" VALUES(2963,12541,1);
+INSERT INTO "remix_artist" VALUES(2964,11774,1);
+INSERT INTO "remix_artist" VALUES(2966,4751,1);
+INSERT INTO "remix_artist" VALUES(2967,13046,1);
+INSERT INTO "remix_artist" VALUES(2968,13147,1);
+INSERT INTO "remix_artist" VALUES(2969,5043,1);
+INSERT INTO "remix_artist" VALUES(2970,4748,1);
+INSERT INTO "remix_artist" VALUES(2972,12541,1);
+INSERT INTO "remix_artist" VALUES(2973,4748,1);
+INSERT INTO "remix_artist" VALUES(2973,4754,1);
+INSERT INTO "remix_artist" VALUES(2974,4793,1);
+INSERT INTO "remix_artist" VALUES(2975,13045,1);
+INSERT INTO "remix_artist" VALUES(2976,12541,1);
+INSERT INTO "remix_artist" VALUES(2977,13920,1);
+INSERT INTO "remix_artist" VALUES(2978,13045,1);
+INSERT INTO "remix_artist" VALUES(2979,11797,1);
+INSERT INTO "remix_artist" VALUES(2979,12932,1);
+INSERT INTO "remix_artist" VALUES(2980,10136,1);
+INSERT INTO "remix_artist" VALUES(2982,12703,1);
+INSERT INTO "remix_artist" VALUES(2983,4320,1);
+INSERT INTO "remix_artist" VALUES(2984,11782,1);
+INSERT INTO "remix_artist" VALUES(2985,11774,1);
+INSERT INTO "remix_artist" VALUES(2985,11967,1);
+INSERT INTO "remix_artist" VALUES(2986,12541,1);
+INSERT INTO "remix_artist" VALUES(2986,13578,1);
+INSERT INTO "remix_artist" VALUES(2987,10866,1);
+INSERT INTO "remix_artist" VALUES(2988,10990,1);
+INSERT INTO "remix_artist" VALUES(2989,4331,1);
+INSERT INTO "remix_artist" VALUES(2990,13849,1);
+INSERT INTO "remix_artist" VALUES(2991,13740,1);
+INSERT INTO "remix_artist" VALUES(2992,6002,1);
+INSERT INTO "remix_artist" VALUES(2993,13850,1);
+INSERT INTO "remix_artist" VALUES(2994,13853,1);
+INSERT INTO "remix_artist" VALUES(2995,13852,1);
+INSERT INTO "remix_artist" VALUES(2996,13921,1);
+INSERT INTO "remix_artist" VALUES(2997,13499,1);
+INSERT INTO "remix_artist" VALUES(2998,14054,1);
+INSERT INTO "remix_artist" VALUES(2999,10172,1);
@@ -0,0 +1,1313 @@
+INSERT INTO "remix_artist" VALUES(3000,4279,1);
+INSERT INTO "remix_artist" VALUES(3001,4588,1);
+INSERT INTO "remix_artist" VALUES(3002,4628,1);
+INSERT INTO "remix_artist" VALUES(3002,4659,1);
+INSERT INTO "remix_artist" VALUES(3003,4543,1);
+INSERT INTO "remix_artist" VALUES(3004,5043,1);
+INSERT INTO "remix_artist" VALUES(3005,13147,1);
+INSERT INTO "remix_artist" VALUES(3006,13147,1);
+INSERT INTO "remix_artist" VALUES(3006,13851,1);
+INSERT INTO "remix_artist" VALUES(3008,4469,1);
+INSERT INTO "remix_artist" VALUES(3009,13042,1);
+INSERT INTO "remix_artist" VALUES(3011,10032,1);
+INSERT INTO "remix_artist" VALUES(3011,14061,1);
+INSERT INTO "remix_artist" VALUES(3012,14062,1);
+INSERT INTO "remix_artist" VALUES(3013,4748,1);
+INSERT INTO "remix_artist" VALUES(3014,13049,1);
+INSERT INTO "remix_artist" VALUES(3015,14064,1);
+INSERT INTO "remix_artist" VALUES(3016,11963,1);
+INSERT INTO "remix_artist" VALUES(3017,11939,1);
+INSERT INTO "remix_artist" VALUES(3018,13046,1);
+INSERT INTO "remix_artist" VALUES(3018,13053,1);
+INSERT INTO "remix_artist" VALUES(3019,4670,1);
+INSERT INTO "remix_artist" VALUES(3020,14126,1);
+INSERT INTO "remix_artist" VALUES(3021,14047,1);
+INSERT INTO "remix_artist" VALUES(3022,4726,1);
+INSERT INTO "remix_artist" VALUES(3022,4729,1);
+INSERT INTO "remix_artist" VALUES(3022,5496,1);
+INSERT INTO "remix_artist" VALUES(3022,12942,1);
+INSERT INTO "remix_artist" VALUES(3022,12956,1);
+INSERT INTO "remix_artist" VALUES(3023,4639,1);
+INSERT INTO "remix_artist" VALUES(3023,4765,1);
+INSERT INTO "remix_artist" VALUES(3025,5043,1);
+INSERT INTO "remix_artist" VALUES(3026,9047,1);
+INSERT INTO "remix_artist" VALUES(3027,4655,1);
+INSERT INTO "remix_artist" VALUES(3028,4703,1);
+INSERT INTO "remix_artist" VALUES(3029,14139,1);
+INSERT INTO "remix_artist" VALUES(3030,5643,1);
+INSERT INTO "remix_artist" VALUES(3030,12942,1);
+INSERT INTO "remix_artist" VALUES(3031,4729,1);
+INSERT INTO "remix_artist" VALUES(3031,4787,1);
+INSERT INTO "remix_artist" VALUES(3031,5655,1);
+INSERT INTO "remix_artist" VALUES(3032,12783,1);
+INSERT INTO "remix_artist" VALUES(3033,13049,1);
+INSERT INTO "remix_artist" VALUES(3034,13667,1);
+INSERT INTO "remix_artist" VALUES(3034,14127,1);
+INSERT INTO "remix_artist" VALUES(3034,14128,1);
+INSERT INTO "remix_artist" VALUES(3035,4703,1);
+INSERT INTO "remix_artist" VALUES(3036,13147,1);
+INSERT INTO "remix_artist" VALUES(3037,14039,1);
+INSERT INTO "remix_artist" VALUES(3038,5655,1);
+INSERT INTO "remix_artist" VALUES(3038,12421,1);
+INSERT INTO "remix_artist" VALUES(3039,12364,1);
+INSERT INTO "remix_artist" VALUES(3040,4543,1);
+INSERT INTO "remix_artist" VALUES(3041,14143,1);
+INSERT INTO "remix_artist" VALUES(3042,11499,1);
+INSERT INTO "remix_artist" VALUES(3043,4703,1);
+INSERT INTO "remix_artist" VALUES(3044,12540,1);
+INSERT INTO "remix_artist" VALUES(3045,10893,1);
+INSERT INTO "remix_artist" VALUES(3045,13511,1);
+INSERT INTO "remix_artist" VALUES(3046,4543,1);
+INSERT INTO "remix_artist" VALUES(3047,14134,1);
+INSERT INTO "remix_artist" VALUES(3048,13046,1);
+INSERT INTO "remix_artist" VALUES(3049,4429,1);
+INSERT INTO "remix_artist" VALUES(3050,4724,1);
+INSERT INTO "remix_artist" VALUES(3052,4961,1);
+INSERT INTO "remix_artist" VALUES(3053,4651,1);
+INSERT INTO "remix_artist" VALUES(3053,10990,1);
+INSERT INTO "remix_artist" VALUES(3053,13080,1);
+INSERT INTO "remix_artist" VALUES(3054,12541,1);
+INSERT INTO "remix_artist" VALUES(3054,14131,1);
+INSERT INTO "remix_artist" VALUES(3055,10136,1);
+INSERT INTO "remix_artist" VALUES(3056,12705,1);
+INSERT INTO "remix_artist" VALUES(3057,12707,1);
+INSERT INTO "remix_artist" VALUES(3058,10893,1);
+INSERT INTO "remix_artist" VALUES(3058,13845,1);
+INSERT INTO "remix_artist" VALUES(3059,11940,1);
+INSERT INTO "remix_artist" VALUES(3060,13147,1);
+INSERT INTO "remix_artist" VALUES(3062,12703,1);
+INSERT INTO "remix_artist" VALUES(3062,14041,1);
+INSERT INTO "remix_artist" VALUES(3063,10893,1);
+INSERT INTO "remix_artist" VALUES(3064,11963,1);
+INSERT INTO "remix_artist" VALUES(3065,14129,1);
+INSERT INTO "remix_artist" VALUES(3066,12064,1);
+INSERT INTO "remix_artist" VALUES(3067,13740,1);
+INSERT INTO "remix_artist" VALUES(3068,4729,1);
+INSERT INTO "remix_artist" VALUES(3068,5655,1);
+INSERT INTO "remix_artist" VALUES(3069,10665,1);
+INSERT INTO "remix_artist" VALUES(3070,14133,1);
+INSERT INTO "remix_artist" VALUES(3071,13849,1);
+INSERT INTO "remix_artist" VALUES(3072,12783,1);
+INSERT INTO "remix_artist" VALUES(3074,4482,1);
+INSERT INTO "remix_artist" VALUES(3075,13045,1);
+INSERT INTO "remix_artist" VALUES(3076,12783,1);
+INSERT INTO "remix_artist" VALUES(3077,13080,1);
+INSERT INTO "remix_artist" VALUES(3078,14038,1);
+INSERT INTO "remix_artist" VALUES(3079,4795,1);
+INSERT INTO "remix_artist" VALUES(3080,4543,1);
+INSERT INTO "remix_artist" VALUES(3081,11774,1);
+INSERT INTO "remix_artist" VALUES(3082,13046,1);
+INSERT INTO "remix_artist" VALUES(3083,14130,1);
+INSERT INTO "remix_artist" VALUES(3084,13147,1);
+INSERT INTO "remix_artist" VALUES(3085,4793,1);
+INSERT INTO "remix_artist" VALUES(3085,5409,1);
+INSERT INTO "remix_artist" VALUES(3086,4703,1);
+INSERT INTO "remix_artist" VALUES(3087,11774,1);
+INSERT INTO "remix_artist" VALUES(3088,14328,1);
+INSERT INTO "remix_artist" VALUES(3089,10656,1);
+INSERT INTO "remix_artist" VALUES(3089,12064,1);
+INSERT INTO "remix_artist" VALUES(3089,13045,1);
+INSERT INTO "remix_artist" VALUES(3089,13500,1);
+INSERT INTO "remix_artist" VALUES(3090,4668,1);
+INSERT INTO "remix_artist" VALUES(3090,14333,1);
+INSERT INTO "remix_artist" VALUES(3091,11481,1);
+INSERT INTO "remix_artist" VALUES(3091,14330,1);
+INSERT INTO "remix_artist" VALUES(3093,12707,1);
+INSERT INTO "remix_artist" VALUES(3093,12783,1);
+INSERT INTO "remix_artist" VALUES(3094,4559,1);
+INSERT INTO "remix_artist" VALUES(3094,4738,1);
+INSERT INTO "remix_artist" VALUES(3095,5180,1);
+INSERT INTO "remix_artist" VALUES(3096,13849,1);
+INSERT INTO "remix_artist" VALUES(3097,4723,1);
+INSERT INTO "remix_artist" VALUES(3098,4723,1);
+INSERT INTO "remix_artist" VALUES(3099,5409,1);
+INSERT INTO "remix_artist" VALUES(3099,6144,1);
+INSERT INTO "remix_artist" VALUES(3099,8998,1);
+INSERT INTO "remix_artist" VALUES(3099,13677,1);
+INSERT INTO "remix_artist" VALUES(3100,4324,1);
+INSERT INTO "remix_artist" VALUES(3100,4694,1);
+INSERT INTO "remix_artist" VALUES(3101,4703,1);
+INSERT INTO "remix_artist" VALUES(3102,10894,1);
+INSERT INTO "remix_artist" VALUES(3102,14339,1);
+INSERT INTO "remix_artist" VALUES(3104,13147,1);
+INSERT INTO "remix_artist" VALUES(3105,13057,1);
+INSERT INTO "remix_artist" VALUES(3106,4628,1);
+INSERT INTO "remix_artist" VALUES(3106,4659,1);
+INSERT INTO "remix_artist" VALUES(3107,10690,1);
+INSERT INTO "remix_artist" VALUES(3107,12483,1);
+INSERT INTO "remix_artist" VALUES(3108,4655,1);
+INSERT INTO "remix_artist" VALUES(3109,12703,1);
+INSERT INTO "remix_artist" VALUES(3110,12710,1);
+INSERT INTO "remix_artist" VALUES(3112,4777,1);
+INSERT INTO "remix_artist" VALUES(3113,14329,1);
+INSERT INTO "remix_artist" VALUES(3114,8998,1);
+INSERT INTO "remix_artist" VALUES(3114,11939,1);
+INSERT INTO "remix_artist" VALUES(3115,13045,1);
+INSERT INTO "remix_artist" VALUES(3116,13849,1);
+INSERT INTO "remix_artist" VALUES(3117,14134,1);
+INSERT INTO "remix_artist" VALUES(3118,5473,1);
+INSERT INTO "remix_artist" VALUES(3119,4703,1);
+INSERT INTO "remix_artist" VALUES(3120,10898,1);
+INSERT INTO "remix_artist" VALUES(3121,10690,1);
+INSERT INTO "remix_artist" VALUES(3122,10663,1);
+INSERT INTO "remix_artist" VALUES(3123,14356,1);
+INSERT INTO "remix_artist" VALUES(3124,14332,1);
+INSERT INTO "remix_artist" VALUES(3125,14357,1);
+INSERT INTO "remix_artist" VALUES(3126,9939,1);
+INSERT INTO "remix_artist" VALUES(3127,8998,1);
+INSERT INTO "remix_artist" VALUES(3128,14366,1);
+INSERT INTO "remix_artist" VALUES(3129,14040,1);
+INSERT INTO "remix_artist" VALUES(3130,4324,1);
+INSERT INTO "remix_artist" VALUES(3130,4694,1);
+INSERT INTO "remix_artist" VALUES(3131,4703,1);
+INSERT INTO "remix_artist" VALUES(3132,10893,1);
+INSERT INTO "remix_artist" VALUES(3133,13670,1);
+INSERT INTO "remix_artist" VALUES(3134,14037,1);
+INSERT INTO "remix_artist" VALUES(3135,6114,1);
+INSERT INTO "remix_artist" VALUES(3135,14379,1);
+INSERT INTO "remix_artist" VALUES(3135,14380,1);
+INSERT INTO "remix_artist" VALUES(3135,14381,1);
+INSERT INTO "remix_artist" VALUES(3136,14369,1);
+INSERT INTO "remix_artist" VALUES(3137,14373,1);
+INSERT INTO "remix_artist" VALUES(3138,14338,1);
+INSERT INTO "remix_artist" VALUES(3139,12703,1);
+INSERT INTO "remix_artist" VALUES(3140,10221,1);
+INSERT INTO "remix_artist" VALUES(3141,12064,1);
+INSERT INTO "remix_artist" VALUES(3142,11773,1);
+INSERT INTO "remix_artist" VALUES(3142,13046,1);
+INSERT INTO "remix_artist" VALUES(3143,11774,1);
+INSERT INTO "remix_artist" VALUES(3144,13045,1);
+INSERT INTO "remix_artist" VALUES(3145,13849,1);
+INSERT INTO "remix_artist" VALUES(3146,10683,1);
+INSERT INTO "remix_artist" VALUES(3147,11499,1);
+INSERT INTO "remix_artist" VALUES(3148,5315,1);
+INSERT INTO "remix_artist" VALUES(3149,10893,1);
+INSERT INTO "remix_artist" VALUES(3150,14388,1);
+INSERT INTO "remix_artist" VALUES(3151,5409,1);
+INSERT INTO "remix_artist" VALUES(3151,12540,1);
+INSERT INTO "remix_artist" VALUES(3151,12559,1);
+INSERT INTO "remix_artist" VALUES(3152,4793,1);
+INSERT INTO "remix_artist" VALUES(3152,4798,1);
+INSERT INTO "remix_artist" VALUES(3153,11963,1);
+INSERT INTO "remix_artist" VALUES(3154,4771,1);
+INSERT INTO "remix_artist" VALUES(3155,12783,1);
+INSERT INTO "remix_artist" VALUES(3156,4628,1);
+INSERT INTO "remix_artist" VALUES(3158,14387,1);
+INSERT INTO "remix_artist" VALUES(3159,11499,1);
+INSERT INTO "remix_artist" VALUES(3160,12064,1);
+INSERT INTO "remix_artist" VALUES(3161,4685,1);
+INSERT INTO "remix_artist" VALUES(3162,4543,1);
+INSERT INTO "remix_artist" VALUES(3163,4787,1);
+INSERT INTO "remix_artist" VALUES(3164,5655,1);
+INSERT INTO "remix_artist" VALUES(3165,4482,1);
+INSERT INTO "remix_artist" VALUES(3166,5420,1);
+INSERT INTO "remix_artist" VALUES(3167,14375,1);
+INSERT INTO "remix_artist" VALUES(3168,8640,1);
+INSERT INTO "remix_artist" VALUES(3168,14337,1);
+INSERT INTO "remix_artist" VALUES(3169,13420,1);
+INSERT INTO "remix_artist" VALUES(3171,10900,1);
+INSERT INTO "remix_artist" VALUES(3172,4703,1);
+INSERT INTO "remix_artist" VALUES(3173,14374,1);
+INSERT INTO "remix_artist" VALUES(3174,13849,1);
+INSERT INTO "remix_artist" VALUES(3175,14461,1);
+INSERT INTO "remix_artist" VALUES(3176,12710,1);
+INSERT INTO "remix_artist" VALUES(3176,13677,1);
+INSERT INTO "remix_artist" VALUES(3177,14372,1);
+INSERT INTO "remix_artist" VALUES(3178,14134,1);
+INSERT INTO "remix_artist" VALUES(3181,4607,1);
+INSERT INTO "remix_artist" VALUES(3182,4695,1);
+INSERT INTO "remix_artist" VALUES(3182,14360,1);
+INSERT INTO "remix_artist" VALUES(3183,4324,1);
+INSERT INTO "remix_artist" VALUES(3183,4694,1);
+INSERT INTO "remix_artist" VALUES(3184,10990,1);
+INSERT INTO "remix_artist" VALUES(3185,4651,1);
+INSERT INTO "remix_artist" VALUES(3185,4793,1);
+INSERT INTO "remix_artist" VALUES(3185,9080,1);
+INSERT INTO "remix_artist" VALUES(3185,10683,1);
+INSERT INTO "remix_artist" VALUES(3185,10990,1);
+INSERT INTO "remix_artist" VALUES(3185,11931,1);
+INSERT INTO "remix_artist" VALUES(3185,14473,1);
+INSERT INTO "remix_artist" VALUES(3186,8998,1);
+INSERT INTO "remix_artist" VALUES(3187,14481,1);
+INSERT INTO "remix_artist" VALUES(3188,13740,1);
+INSERT INTO "remix_artist" VALUES(3189,10222,1);
+INSERT INTO "remix_artist" VALUES(3189,10671,1);
+INSERT INTO "remix_artist" VALUES(3189,12106,1);
+INSERT INTO "remix_artist" VALUES(3190,14490,1);
+INSERT INTO "remix_artist" VALUES(3191,11782,1);
+INSERT INTO "remix_artist" VALUES(3192,4655,1);
+INSERT INTO "remix_artist" VALUES(3193,12352,1);
+INSERT INTO "remix_artist" VALUES(3194,12711,1);
+INSERT INTO "remix_artist" VALUES(3195,14498,1);
+INSERT INTO "remix_artist" VALUES(3196,4651,1);
+INSERT INTO "remix_artist" VALUES(3196,11939,1);
+INSERT INTO "remix_artist" VALUES(3197,10124,1);
+INSERT INTO "remix_artist" VALUES(3198,14126,1);
+INSERT INTO "remix_artist" VALUES(3199,4656,1);
+INSERT INTO "remix_artist" VALUES(3200,4772,1);
+INSERT INTO "remix_artist" VALUES(3201,13849,1);
+INSERT INTO "remix_artist" VALUES(3202,10663,1);
+INSERT INTO "remix_artist" VALUES(3203,10690,1);
+INSERT INTO "remix_artist" VALUES(3204,12064,1);
+INSERT INTO "remix_artist" VALUES(3205,4751,1);
+INSERT INTO "remix_artist" VALUES(3206,10221,1);
+INSERT INTO "remix_artist" VALUES(3207,4279,1);
+INSERT INTO "remix_artist" VALUES(3209,4793,1);
+INSERT INTO "remix_artist" VALUES(3210,10136,1);
+INSERT INTO "remix_artist" VALUES(3211,5040,1);
+INSERT INTO "remix_artist" VALUES(3211,14484,1);
+INSERT INTO "remix_artist" VALUES(3212,4754,1);
+INSERT INTO "remix_artist" VALUES(3212,14486,1);
+INSERT INTO "remix_artist" VALUES(3213,14492,1);
+INSERT INTO "remix_artist" VALUES(3214,14495,1);
+INSERT INTO "remix_artist" VALUES(3215,14134,1);
+INSERT INTO "remix_artist" VALUES(3216,12942,1);
+INSERT INTO "remix_artist" VALUES(3216,14577,1);
+INSERT INTO "remix_artist" VALUES(3217,4290,1);
+INSERT INTO "remix_artist" VALUES(3218,5131,1);
+INSERT INTO "remix_artist" VALUES(3219,4543,1);
+INSERT INTO "remix_artist" VALUES(3220,14579,1);
+INSERT INTO "remix_artist" VALUES(3221,14376,1);
+INSERT INTO "remix_artist" VALUES(3222,14493,1);
+INSERT INTO "remix_artist" VALUES(3223,14494,1);
+INSERT INTO "remix_artist" VALUES(3224,14501,1);
+INSERT INTO "remix_artist" VALUES(3225,13147,1);
+INSERT INTO "remix_artist" VALUES(3226,14461,1);
+INSERT INTO "remix_artist" VALUES(3226,14583,1);
+INSERT INTO "remix_artist" VALUES(3227,4787,1);
+INSERT INTO "remix_artist" VALUES(3228,4607,1);
+INSERT INTO "remix_artist" VALUES(3229,4543,1);
+INSERT INTO "remix_artist" VALUES(3230,10669,1);
+INSERT INTO "remix_artist" VALUES(3231,14580,1);
+INSERT INTO "remix_artist" VALUES(3232,5386,1);
+INSERT INTO "remix_artist" VALUES(3232,14464,1);
+INSERT INTO "remix_artist" VALUES(3232,14465,1);
+INSERT INTO "remix_artist" VALUES(3233,14496,1);
+INSERT INTO "remix_artist" VALUES(3233,14497,1);
+INSERT INTO "remix_artist" VALUES(3234,14491,1);
+INSERT INTO "remix_artist" VALUES(3235,14582,1);
+INSERT INTO "remix_artist" VALUES(3236,4324,1);
+INSERT INTO "remix_artist" VALUES(3236,4694,1);
+INSERT INTO "remix_artist" VALUES(3237,12710,1);
+INSERT INTO "remix_artist" VALUES(3238,4703,1);
+INSERT INTO "remix_artist" VALUES(3240,11774,1);
+INSERT INTO "remix_artist" VALUES(3241,13677,1);
+INSERT INTO "remix_artist" VALUES(3242,14593,1);
+INSERT INTO "remix_artist" VALUES(3244,4703,1);
+INSERT INTO "remix_artist" VALUES(3245,4543,1);
+INSERT INTO "remix_artist" VALUES(3247,4655,1);
+INSERT INTO "remix_artist" VALUES(3248,14607,1);
+INSERT INTO "remix_artist" VALUES(3249,13147,1);
+INSERT INTO "remix_artist" VALUES(3250,14605,1);
+INSERT INTO "remix_artist" VALUES(3250,14606,1);
+INSERT INTO "remix_artist" VALUES(3251,10900,1);
+INSERT INTO "remix_artist" VALUES(3252,8640,1);
+INSERT INTO "remix_artist" VALUES(3252,12064,1);
+INSERT INTO "remix_artist" VALUES(3253,14594,1);
+INSERT INTO "remix_artist" VALUES(3254,14733,1);
+INSERT INTO "remix_artist" VALUES(3255,4324,1);
+INSERT INTO "remix_artist" VALUES(3255,4694,1);
+INSERT INTO "remix_artist" VALUES(3255,14595,1);
+INSERT INTO "remix_artist" VALUES(3256,13849,1);
+INSERT INTO "remix_artist" VALUES(3257,5043,1);
+INSERT INTO "remix_artist" VALUES(3257,13046,1);
+INSERT INTO "remix_artist" VALUES(3258,10683,1);
+INSERT INTO "remix_artist" VALUES(3258,13667,1);
+INSERT INTO "remix_artist" VALUES(3258,14127,1);
+INSERT INTO "remix_artist" VALUES(3258,14137,1);
+INSERT INTO "remix_artist" VALUES(3259,12710,1);
+INSERT INTO "remix_artist" VALUES(3261,4703,1);
+INSERT INTO "remix_artist" VALUES(3262,13042,1);
+INSERT INTO "remix_artist" VALUES(3263,5655,1);
+INSERT INTO "remix_artist" VALUES(3263,12064,1);
+INSERT INTO "remix_artist" VALUES(3264,13049,1);
+INSERT INTO "remix_artist" VALUES(3265,4440,1);
+INSERT INTO "remix_artist" VALUES(3266,13436,1);
+INSERT INTO "remix_artist" VALUES(3267,4729,1);
+INSERT INTO "remix_artist" VALUES(3267,5420,1);
+INSERT INTO "remix_artist" VALUES(3267,12421,1);
+INSERT INTO "remix_artist" VALUES(3268,5041,1);
+INSERT INTO "remix_artist" VALUES(3269,14607,1);
+INSERT INTO "remix_artist" VALUES(3270,14594,1);
+INSERT INTO "remix_artist" VALUES(3271,14736,1);
+INSERT INTO "remix_artist" VALUES(3272,14734,1);
+INSERT INTO "remix_artist" VALUES(3273,13147,1);
+INSERT INTO "remix_artist" VALUES(3274,4543,1);
+INSERT INTO "remix_artist" VALUES(3275,4685,1);
+INSERT INTO "remix_artist" VALUES(3275,13045,1);
+INSERT INTO "remix_artist" VALUES(3275,14461,1);
+INSERT INTO "remix_artist" VALUES(3275,14499,1);
+INSERT INTO "remix_artist" VALUES(3276,4743,1);
+INSERT INTO "remix_artist" VALUES(3276,14492,1);
+INSERT INTO "remix_artist" VALUES(3277,10692,1);
+INSERT INTO "remix_artist" VALUES(3278,11939,1);
+INSERT INTO "remix_artist" VALUES(3279,14463,1);
+INSERT INTO "remix_artist" VALUES(3280,11774,1);
+INSERT INTO "remix_artist" VALUES(3281,14925,1);
+INSERT INTO "remix_artist" VALUES(3282,14927,1);
+INSERT INTO "remix_artist" VALUES(3283,5131,1);
+INSERT INTO "remix_artist" VALUES(3283,13217,1);
+INSERT INTO "remix_artist" VALUES(3284,5043,1);
+INSERT INTO "remix_artist" VALUES(3285,4627,1);
+INSERT INTO "remix_artist" VALUES(3286,12710,1);
+INSERT INTO "remix_artist" VALUES(3287,13496,1);
+INSERT INTO "remix_artist" VALUES(3288,14931,1);
+INSERT INTO "remix_artist" VALUES(3289,4743,1);
+INSERT INTO "remix_artist" VALUES(3290,14928,1);
+INSERT INTO "remix_artist" VALUES(3291,4543,1);
+INSERT INTO "remix_artist" VALUES(3292,4724,1);
+INSERT INTO "remix_artist" VALUES(3293,12710,1);
+INSERT INTO "remix_artist" VALUES(3293,13677,1);
+INSERT INTO "remix_artist" VALUES(3294,14737,1);
+INSERT INTO "remix_artist" VALUES(3295,4723,1);
+INSERT INTO "remix_artist" VALUES(3296,14596,1);
+INSERT INTO "remix_artist" VALUES(3297,13849,1);
+INSERT INTO "remix_artist" VALUES(3298,8998,1);
+INSERT INTO "remix_artist" VALUES(3299,12355,1);
+INSERT INTO "remix_artist" VALUES(3300,14134,1);
+INSERT INTO "remix_artist" VALUES(3301,14938,1);
+INSERT INTO "remix_artist" VALUES(3301,14939,1);
+INSERT INTO "remix_artist" VALUES(3301,14940,1);
+INSERT INTO "remix_artist" VALUES(3301,14941,1);
+INSERT INTO "remix_artist" VALUES(3301,14942,1);
+INSERT INTO "remix_artist" VALUES(3302,13147,1);
+INSERT INTO "remix_artist" VALUES(3303,10990,1);
+INSERT INTO "remix_artist" VALUES(3303,13080,1);
+INSERT INTO "remix_artist" VALUES(3304,14944,1);
+INSERT INTO "remix_artist" VALUES(3306,14736,1);
+INSERT INTO "remix_artist" VALUES(3307,13849,1);
+INSERT INTO "remix_artist" VALUES(3308,14964,1);
+INSERT INTO "remix_artist" VALUES(3309,4313,1);
+INSERT INTO "remix_artist" VALUES(3310,13046,1);
+INSERT INTO "remix_artist" VALUES(3311,12542,1);
+INSERT INTO "remix_artist" VALUES(3312,4703,1);
+INSERT INTO "remix_artist" VALUES(3313,14607,1);
+INSERT INTO "remix_artist" VALUES(3314,14983,1);
+INSERT INTO "remix_artist" VALUES(3315,14979,1);
+INSERT INTO "remix_artist" VALUES(3316,10893,1);
+INSERT INTO "remix_artist" VALUES(3316,13147,1);
+INSERT INTO "remix_artist" VALUES(3317,13052,1);
+INSERT INTO "remix_artist" VALUES(3318,14143,1);
+INSERT INTO "remix_artist" VALUES(3319,15046,1);
+INSERT INTO "remix_artist" VALUES(3320,12540,1);
+INSERT INTO "remix_artist" VALUES(3321,8998,1);
+INSERT INTO "remix_artist" VALUES(3323,15047,1);
+INSERT INTO "remix_artist" VALUES(3324,14064,1);
+INSERT INTO "remix_artist" VALUES(3325,5473,1);
+INSERT INTO "remix_artist" VALUES(3326,4767,1);
+INSERT INTO "remix_artist" VALUES(3327,14976,1);
+INSERT INTO "remix_artist" VALUES(3328,13740,1);
+INSERT INTO "remix_artist" VALUES(3329,14038,1);
+INSERT INTO "remix_artist" VALUES(3330,13849,1);
+INSERT INTO "remix_artist" VALUES(3331,5655,1);
+INSERT INTO "remix_artist" VALUES(3332,11498,1);
+INSERT INTO "remix_artist" VALUES(3333,13147,1);
+INSERT INTO "remix_artist" VALUES(3334,12064,1);
+INSERT INTO "remix_artist" VALUES(3335,15056,1);
+INSERT INTO "remix_artist" VALUES(3336,11782,1);
+INSERT INTO "remix_artist" VALUES(3337,15058,1);
+INSERT INTO "remix_artist" VALUES(3338,11143,1);
+INSERT INTO "remix_artist" VALUES(3339,4482,1);
+INSERT INTO "remix_artist" VALUES(3340,4313,1);
+INSERT INTO "remix_artist" VALUES(3341,4685,1);
+INSERT INTO "remix_artist" VALUES(3341,10683,1);
+INSERT INTO "remix_artist" VALUES(3343,14736,1);
+INSERT INTO "remix_artist" VALUES(3344,4729,1);
+INSERT INTO "remix_artist" VALUES(3344,12421,1);
+INSERT INTO "remix_artist" VALUES(3345,15060,1);
+INSERT INTO "remix_artist" VALUES(3346,14923,1);
+INSERT INTO "remix_artist" VALUES(3347,14932,1);
+INSERT INTO "remix_artist" VALUES(3348,14143,1);
+INSERT INTO "remix_artist" VALUES(3350,15061,1);
+INSERT INTO "remix_artist" VALUES(3351,9847,1);
+INSERT INTO "remix_artist" VALUES(3352,15062,1);
+INSERT INTO "remix_artist" VALUES(3353,4722,1);
+INSERT INTO "remix_artist" VALUES(3354,4703,1);
+INSERT INTO "remix_artist" VALUES(3355,4627,1);
+INSERT INTO "remix_artist" VALUES(3356,13666,1);
+INSERT INTO "remix_artist" VALUES(3356,14734,1);
+INSERT INTO "remix_artist" VALUES(3357,14937,1);
+INSERT INTO "remix_artist" VALUES(3358,4772,1);
+INSERT INTO "remix_artist" VALUES(3359,14461,1);
+INSERT INTO "remix_artist" VALUES(3360,12131,1);
+INSERT INTO "remix_artist" VALUES(3361,6002,1);
+INSERT INTO "remix_artist" VALUES(3362,12703,1);
+INSERT INTO "remix_artist" VALUES(3363,15066,1);
+INSERT INTO "remix_artist" VALUES(3364,12710,1);
+INSERT INTO "remix_artist" VALUES(3365,15067,1);
+INSERT INTO "remix_artist" VALUES(3366,10690,1);
+INSERT INTO "remix_artist" VALUES(3366,13046,1);
+INSERT INTO "remix_artist" VALUES(3367,13740,1);
+INSERT INTO "remix_artist" VALUES(3368,13147,1);
+INSERT INTO "remix_artist" VALUES(3369,10663,1);
+INSERT INTO "remix_artist" VALUES(3370,10990,1);
+INSERT INTO "remix_artist" VALUES(3371,4685,1);
+INSERT INTO "remix_artist" VALUES(3371,13045,1);
+INSERT INTO "remix_artist" VALUES(3372,15136,1);
+INSERT INTO "remix_artist" VALUES(3373,13046,1);
+INSERT INTO "remix_artist" VALUES(3374,14038,1);
+INSERT INTO "remix_artist" VALUES(3375,4543,1);
+INSERT INTO "remix_artist" VALUES(3376,14927,1);
+INSERT INTO "remix_artist" VALUES(3377,13740,1);
+INSERT INTO "remix_artist" VALUES(3378,4793,1);
+INSERT INTO "remix_artist" VALUES(3378,13046,1);
+INSERT INTO "remix_artist" VALUES(3379,4655,1);
+INSERT INTO "remix_artist" VALUES(3380,12710,1);
+INSERT INTO "remix_artist" VALUES(3380,15137,1);
+INSERT INTO "remix_artist" VALUES(3382,10893,1);
+INSERT INTO "remix_artist" VALUES(3383,4759,1);
+INSERT INTO "remix_artist" VALUES(3384,4724,1);
+INSERT INTO "remix_artist" VALUES(3384,5036,1);
+INSERT INTO "remix_artist" VALUES(3384,14463,1);
+INSERT INTO "remix_artist" VALUES(3384,15199,1);
+INSERT INTO "remix_artist" VALUES(3384,15200,1);
+INSERT INTO "remix_artist" VALUES(3384,15201,1);
+INSERT INTO "remix_artist" VALUES(3384,15202,1);
+INSERT INTO "remix_artist" VALUES(3384,15203,1);
+INSERT INTO "remix_artist" VALUES(3384,15204,1);
+INSERT INTO "remix_artist" VALUES(3385,4313,1);
+INSERT INTO "remix_artist" VALUES(3386,4628,1);
+INSERT INTO "remix_artist" VALUES(3387,15205,1);
+INSERT INTO "remix_artist" VALUES(3388,10670,1);
+INSERT INTO "remix_artist" VALUES(3388,10671,1);
+INSERT INTO "remix_artist" VALUES(3389,13147,1);
+INSERT INTO "remix_artist" VALUES(3390,4594,1);
+INSERT INTO "remix_artist" VALUES(3390,14924,1);
+INSERT INTO "remix_artist" VALUES(3391,4304,1);
+INSERT INTO "remix_artist" VALUES(3392,4799,1);
+INSERT INTO "remix_artist" VALUES(3393,13668,1);
+INSERT INTO "remix_artist" VALUES(3394,4587,1);
+INSERT INTO "remix_artist" VALUES(3395,4313,1);
+INSERT INTO "remix_artist" VALUES(3396,11963,1);
+INSERT INTO "remix_artist" VALUES(3397,6126,1);
+INSERT INTO "remix_artist" VALUES(3398,11774,1);
+INSERT INTO "remix_artist" VALUES(3398,13677,1);
+INSERT INTO "remix_artist" VALUES(3399,13849,1);
+INSERT INTO "remix_artist" VALUES(3400,4703,1);
+INSERT INTO "remix_artist" VALUES(3401,13147,1);
+INSERT INTO "remix_artist" VALUES(3402,11143,1);
+INSERT INTO "remix_artist" VALUES(3404,4685,1);
+INSERT INTO "remix_artist" VALUES(3405,4685,1);
+INSERT INTO "remix_artist" VALUES(3406,4339,1);
+INSERT INTO "remix_artist" VALUES(3407,4703,1);
+INSERT INTO "remix_artist" VALUES(3408,14465,1);
+INSERT INTO "remix_artist" VALUES(3409,10136,1);
+INSERT INTO "remix_artist" VALUES(3410,8640,1);
+INSERT INTO "remix_artist" VALUES(3410,14337,1);
+INSERT INTO "remix_artist" VALUES(3411,8640,1);
+INSERT INTO "remix_artist" VALUES(3411,14337,1);
+INSERT INTO "remix_artist" VALUES(3412,8640,1);
+INSERT INTO "remix_artist" VALUES(3412,14336,1);
+INSERT INTO "remix_artist" VALUES(3412,14337,1);
+INSERT INTO "remix_artist" VALUES(3413,13147,1);
+INSERT INTO "remix_artist" VALUES(3414,5036,1);
+INSERT INTO "remix_artist" VALUES(3415,15232,1);
+INSERT INTO "remix_artist" VALUES(3416,14858,1);
+INSERT INTO "remix_artist" VALUES(3417,4656,1);
+INSERT INTO "remix_artist" VALUES(3418,15304,1);
+INSERT INTO "remix_artist" VALUES(3419,13046,1);
+INSERT INTO "remix_artist" VALUES(3420,4320,1);
+INSERT INTO "remix_artist" VALUES(3421,14461,1);
+INSERT INTO "remix_artist" VALUES(3421,14499,1);
+INSERT INTO "remix_artist" VALUES(3422,10665,1);
+INSERT INTO "remix_artist" VALUES(3423,4724,1);
+INSERT INTO "remix_artist" VALUES(3424,14927,1);
+INSERT INTO "remix_artist" VALUES(3425,4724,1);
+INSERT INTO "remix_artist" VALUES(3425,12559,1);
+INSERT INTO "remix_artist" VALUES(3426,15305,1);
+INSERT INTO "remix_artist" VALUES(3427,15309,1);
+INSERT INTO "remix_artist" VALUES(3428,15308,1);
+INSERT INTO "remix_artist" VALUES(3429,15307,1);
+INSERT INTO "remix_artist" VALUES(3430,15059,1);
+INSERT INTO "remix_artist" VALUES(3431,15311,1);
+INSERT INTO "remix_artist" VALUES(3432,4729,1);
+INSERT INTO "remix_artist" VALUES(3432,12421,1);
+INSERT INTO "remix_artist" VALUES(3433,13740,1);
+INSERT INTO "remix_artist" VALUES(3434,4627,1);
+INSERT INTO "remix_artist" VALUES(3434,10902,1);
+INSERT INTO "remix_artist" VALUES(3435,4287,1);
+INSERT INTO "remix_artist" VALUES(3435,4543,1);
+INSERT INTO "remix_artist" VALUES(3436,15315,1);
+INSERT INTO "remix_artist" VALUES(3437,12703,1);
+INSERT INTO "remix_artist" VALUES(3438,10670,1);
+INSERT INTO "remix_artist" VALUES(3438,10671,1);
+INSERT INTO "remix_artist" VALUES(3439,14133,1);
+INSERT INTO "remix_artist" VALUES(3440,12783,1);
+INSERT INTO "remix_artist" VALUES(3441,15316,1);
+INSERT INTO "remix_artist" VALUES(3442,13849,1);
+INSERT INTO "remix_artist" VALUES(3443,4543,1);
+INSERT INTO "remix_artist" VALUES(3443,5043,1);
+INSERT INTO "remix_artist" VALUES(3443,15320,1);
+INSERT INTO "remix_artist" VALUES(3444,14734,1);
+INSERT INTO "remix_artist" VALUES(3445,14734,1);
+INSERT INTO "remix_artist" VALUES(3446,14734,1);
+INSERT INTO "remix_artist" VALUES(3447,4543,1);
+INSERT INTO "remix_artist" VALUES(3448,10690,1);
+INSERT INTO "remix_artist" VALUES(3449,12703,1);
+INSERT INTO "remix_artist" VALUES(3450,4729,1);
+INSERT INTO "remix_artist" VALUES(3450,12421,1);
+INSERT INTO "remix_artist" VALUES(3451,14734,1);
+INSERT INTO "remix_artist" VALUES(3452,15458,1);
+INSERT INTO "remix_artist" VALUES(3453,11774,1);
+INSERT INTO "remix_artist" VALUES(3454,15298,1);
+INSERT INTO "remix_artist" VALUES(3455,14927,1);
+INSERT INTO "remix_artist" VALUES(3456,4703,1);
+INSERT INTO "remix_artist" VALUES(3457,14501,1);
+INSERT INTO "remix_artist" VALUES(3458,13849,1);
+INSERT INTO "remix_artist" VALUES(3459,5043,1);
+INSERT INTO "remix_artist" VALUES(3460,13147,1);
+INSERT INTO "remix_artist" VALUES(3461,15461,1);
+INSERT INTO "remix_artist" VALUES(3462,11940,1);
+INSERT INTO "remix_artist" VALUES(3463,8998,1);
+INSERT INTO "remix_artist" VALUES(3464,15462,1);
+INSERT INTO "remix_artist" VALUES(3465,14461,1);
+INSERT INTO "remix_artist" VALUES(3466,13849,1);
+INSERT INTO "remix_artist" VALUES(3467,13057,1);
+INSERT INTO "remix_artist" VALUES(3468,18305,1);
+INSERT INTO "remix_artist" VALUES(3469,10670,1);
+INSERT INTO "remix_artist" VALUES(3470,15465,1);
+INSERT INTO "remix_artist" VALUES(3471,13147,1);
+INSERT INTO "remix_artist" VALUES(3472,4795,1);
+INSERT INTO "remix_artist" VALUES(3473,13147,1);
+INSERT INTO "remix_artist" VALUES(3474,15047,1);
+INSERT INTO "remix_artist" VALUES(3475,14461,1);
+INSERT INTO "remix_artist" VALUES(3476,15467,1);
+INSERT INTO "remix_artist" VALUES(3477,15468,1);
+INSERT INTO "remix_artist" VALUES(3478,4624,1);
+INSERT INTO "remix_artist" VALUES(3479,15315,1);
+INSERT INTO "remix_artist" VALUES(3480,15474,1);
+INSERT INTO "remix_artist" VALUES(3481,4703,1);
+INSERT INTO "remix_artist" VALUES(3482,14375,1);
+INSERT INTO "remix_artist" VALUES(3483,8640,1);
+INSERT INTO "remix_artist" VALUES(3483,14337,1);
+INSERT INTO "remix_artist" VALUES(3484,14328,1);
+INSERT INTO "remix_artist" VALUES(3485,15481,1);
+INSERT INTO "remix_artist" VALUES(3486,11929,1);
+INSERT INTO "remix_artist" VALUES(3487,11963,1);
+INSERT INTO "remix_artist" VALUES(3488,5043,1);
+INSERT INTO "remix_artist" VALUES(3489,10670,1);
+INSERT INTO "remix_artist" VALUES(3490,4440,1);
+INSERT INTO "remix_artist" VALUES(3491,12783,1);
+INSERT INTO "remix_artist" VALUES(3492,8998,1);
+INSERT INTO "remix_artist" VALUES(3492,11939,1);
+INSERT INTO "remix_artist" VALUES(3493,13147,1);
+INSERT INTO "remix_artist" VALUES(3494,14736,1);
+INSERT INTO "remix_artist" VALUES(3495,15557,1);
+INSERT INTO "remix_artist" VALUES(3496,11774,1);
+INSERT INTO "remix_artist" VALUES(3497,4787,1);
+INSERT INTO "remix_artist" VALUES(3498,15559,1);
+INSERT INTO "remix_artist" VALUES(3499,4313,1);
+INSERT INTO "remix_artist" VALUES(3500,4279,1);
+INSERT INTO "remix_artist" VALUES(3501,4637,1);
+INSERT INTO "remix_artist" VALUES(3502,15560,1);
+INSERT INTO "remix_artist" VALUES(3503,14375,1);
+INSERT INTO "remix_artist" VALUES(3504,15311,1);
+INSERT INTO "remix_artist" VALUES(3505,5473,1);
+INSERT INTO "remix_artist" VALUES(3506,15561,1);
+INSERT INTO "remix_artist" VALUES(3507,15562,1);
+INSERT INTO "remix_artist" VALUES(3508,4754,1);
+INSERT INTO "remix_artist" VALUES(3508,5473,1);
+INSERT INTO "remix_artist" VALUES(3509,4703,1);
+INSERT INTO "remix_artist" VALUES(3510,12064,1);
+INSERT INTO "remix_artist" VALUES(3511,11940,1);
+INSERT INTO "remix_artist" VALUES(3512,14734,1);
+INSERT INTO "remix_artist" VALUES(3513,15564,1);
+INSERT INTO "remix_artist" VALUES(3514,15060,1);
+INSERT INTO "remix_artist" VALUES(3514,15581,1);
+INSERT INTO "remix_artist" VALUES(3515,15582,1);
+INSERT INTO "remix_artist" VALUES(3516,13048,1);
+INSERT INTO "remix_artist" VALUES(3517,15583,1);
+INSERT INTO "remix_artist" VALUES(3518,4777,1);
+INSERT INTO "remix_artist" VALUES(3519,14375,1);
+INSERT INTO "remix_artist" VALUES(3520,13849,1);
+INSERT INTO "remix_artist" VALUES(3520,14337,1);
+INSERT INTO "remix_artist" VALUES(3521,13666,1);
+INSERT INTO "remix_artist" VALUES(3522,11143,1);
+INSERT INTO "remix_artist" VALUES(3523,15612,1);
+INSERT INTO "remix_artist" VALUES(3524,14461,1);
+INSERT INTO "remix_artist" VALUES(3524,15618,1);
+INSERT INTO "remix_artist" VALUES(3525,5184,1);
+INSERT INTO "remix_artist" VALUES(3525,15586,1);
+INSERT INTO "remix_artist" VALUES(3526,13668,1);
+INSERT INTO "remix_artist" VALUES(3527,4627,1);
+INSERT INTO "remix_artist" VALUES(3528,14375,1);
+INSERT INTO "remix_artist" VALUES(3529,15685,1);
+INSERT INTO "remix_artist" VALUES(3530,4729,1);
+INSERT INTO "remix_artist" VALUES(3530,12421,1);
+INSERT INTO "remix_artist" VALUES(3531,13147,1);
+INSERT INTO "remix_artist" VALUES(3532,15747,1);
+INSERT INTO "remix_artist" VALUES(3533,4543,1);
+INSERT INTO "remix_artist" VALUES(3533,4698,1);
+INSERT INTO "remix_artist" VALUES(3534,15750,1);
+INSERT INTO "remix_artist" VALUES(3535,8640,1);
+INSERT INTO "remix_artist" VALUES(3535,12064,1);
+INSERT INTO "remix_artist" VALUES(3536,15751,1);
+INSERT INTO "remix_artist" VALUES(3537,11501,1);
+INSERT INTO "remix_artist" VALUES(3538,8640,1);
+INSERT INTO "remix_artist" VALUES(3538,14337,1);
+INSERT INTO "remix_artist" VALUES(3539,8640,1);
+INSERT INTO "remix_artist" VALUES(3540,13677,1);
+INSERT INTO "remix_artist" VALUES(3540,14461,1);
+INSERT INTO "remix_artist" VALUES(3540,14980,1);
+INSERT INTO "remix_artist" VALUES(3541,12064,1);
+INSERT INTO "remix_artist" VALUES(3541,14461,1);
+INSERT INTO "remix_artist" VALUES(3541,15680,1);
+INSERT INTO "remix_artist" VALUES(3541,15681,1);
+INSERT INTO "remix_artist" VALUES(3541,15682,1);
+INSERT INTO "remix_artist" VALUES(3542,11940,1);
+INSERT INTO "remix_artist" VALUES(3543,11940,1);
+INSERT INTO "remix_artist" VALUES(3544,10866,1);
+INSERT INTO "remix_artist" VALUES(3545,10866,1);
+INSERT INTO "remix_artist" VALUES(3546,15749,1);
+INSERT INTO "remix_artist" VALUES(3547,15761,1);
+INSERT INTO "remix_artist" VALUES(3548,11498,1);
+INSERT INTO "remix_artist" VALUES(3548,12540,1);
+INSERT INTO "remix_artist" VALUES(3549,14930,1);
+INSERT INTO "remix_artist" VALUES(3550,4637,1);
+INSERT INTO "remix_artist" VALUES(3551,5043,1);
+INSERT INTO "remix_artist" VALUES(3552,4703,1);
+INSERT INTO "remix_artist" VALUES(3553,4703,1);
+INSERT INTO "remix_artist" VALUES(3554,15767,1);
+INSERT INTO "remix_artist" VALUES(3555,15768,1);
+INSERT INTO "remix_artist" VALUES(3556,10136,1);
+INSERT INTO "remix_artist" VALUES(3557,10136,1);
+INSERT INTO "remix_artist" VALUES(3558,15770,1);
+INSERT INTO "remix_artist" VALUES(3559,15769,1);
+INSERT INTO "remix_artist" VALUES(3560,14375,1);
+INSERT INTO "remix_artist" VALUES(3561,13677,1);
+INSERT INTO "remix_artist" VALUES(3561,14461,1);
+INSERT INTO "remix_artist" VALUES(3561,14980,1);
+INSERT INTO "remix_artist" VALUES(3561,15771,1);
+INSERT INTO "remix_artist" VALUES(3561,15772,1);
+INSERT INTO "remix_artist" VALUES(3562,5043,1);
+INSERT INTO "remix_artist" VALUES(3563,13500,1);
+INSERT INTO "remix_artist" VALUES(3564,4558,1);
+INSERT INTO "remix_artist" VALUES(3565,12710,1);
+INSERT INTO "remix_artist" VALUES(3566,15833,1);
+INSERT INTO "remix_artist" VALUES(3567,10136,1);
+INSERT INTO "remix_artist" VALUES(3568,4655,1);
+INSERT INTO "remix_artist" VALUES(3569,4313,1);
+INSERT INTO "remix_artist" VALUES(3569,4558,1);
+INSERT INTO "remix_artist" VALUES(3570,14375,1);
+INSERT INTO "remix_artist" VALUES(3571,14375,1);
+INSERT INTO "remix_artist" VALUES(3572,15835,1);
+INSERT INTO "remix_artist" VALUES(3573,14461,1);
+INSERT INTO "remix_artist" VALUES(3573,15618,1);
+INSERT INTO "remix_artist" VALUES(3573,15682,1);
+INSERT INTO "remix_artist" VALUES(3573,15840,1);
+INSERT INTO "remix_artist" VALUES(3574,13147,1);
+INSERT INTO "remix_artist" VALUES(3574,13851,1);
+INSERT INTO "remix_artist" VALUES(3575,12064,1);
+INSERT INTO "remix_artist" VALUES(3576,4703,1);
+INSERT INTO "remix_artist" VALUES(3576,15839,1);
+INSERT INTO "remix_artist" VALUES(3577,4543,1);
+INSERT INTO "remix_artist" VALUES(3578,4543,1);
+INSERT INTO "remix_artist" VALUES(3579,4754,1);
+INSERT INTO "remix_artist" VALUES(3579,14466,1);
+INSERT INTO "remix_artist" VALUES(3579,14483,1);
+INSERT INTO "remix_artist" VALUES(3580,15062,1);
+INSERT INTO "remix_artist" VALUES(3581,12541,1);
+INSERT INTO "remix_artist" VALUES(3581,13500,1);
+INSERT INTO "remix_artist" VALUES(3582,15047,1);
+INSERT INTO "remix_artist" VALUES(3583,10866,1);
+INSERT INTO "remix_artist" VALUES(3584,13046,1);
+INSERT INTO "remix_artist" VALUES(3585,4729,1);
+INSERT INTO "remix_artist" VALUES(3586,4403,1);
+INSERT INTO "remix_artist" VALUES(3587,10900,1);
+INSERT INTO "remix_artist" VALUES(3588,5043,1);
+INSERT INTO "remix_artist" VALUES(3589,8998,1);
+INSERT INTO "remix_artist" VALUES(3590,10670,1);
+INSERT INTO "remix_artist" VALUES(3590,10683,1);
+INSERT INTO "remix_artist" VALUES(3590,15850,1);
+INSERT INTO "remix_artist" VALUES(3590,15851,1);
+INSERT INTO "remix_artist" VALUES(3591,4732,1);
+INSERT INTO "remix_artist" VALUES(3591,11782,1);
+INSERT INTO "remix_artist" VALUES(3592,15060,1);
+INSERT INTO "remix_artist" VALUES(3593,14495,1);
+INSERT INTO "remix_artist" VALUES(3594,14495,1);
+INSERT INTO "remix_artist" VALUES(3595,15912,1);
+INSERT INTO "remix_artist" VALUES(3596,4313,1);
+INSERT INTO "remix_artist" VALUES(3597,8640,1);
+INSERT INTO "remix_artist" VALUES(3597,12064,1);
+INSERT INTO "remix_artist" VALUES(3598,4703,1);
+INSERT INTO "remix_artist" VALUES(3599,13048,1);
+INSERT INTO "remix_artist" VALUES(3600,15914,1);
+INSERT INTO "remix_artist" VALUES(3600,15920,1);
+INSERT INTO "remix_artist" VALUES(3601,10221,1);
+INSERT INTO "remix_artist" VALUES(3601,14485,1);
+INSERT INTO "remix_artist" VALUES(3602,12541,1);
+INSERT INTO "remix_artist" VALUES(3603,5655,1);
+INSERT INTO "remix_artist" VALUES(3604,15921,1);
+INSERT INTO "remix_artist" VALUES(3604,15922,1);
+INSERT INTO "remix_artist" VALUES(3605,13668,1);
+INSERT INTO "remix_artist" VALUES(3606,15923,1);
+INSERT INTO "remix_artist" VALUES(3607,4482,1);
+INSERT INTO "remix_artist" VALUES(3608,5043,1);
+INSERT INTO "remix_artist" VALUES(3609,10663,1);
+INSERT INTO "remix_artist" VALUES(3610,4685,1);
+INSERT INTO "remix_artist" VALUES(3611,4703,1);
+INSERT INTO "remix_artist" VALUES(3612,11963,1);
+INSERT INTO "remix_artist" VALUES(3613,4656,1);
+INSERT INTO "remix_artist" VALUES(3614,4751,1);
+INSERT INTO "remix_artist" VALUES(3615,15984,1);
+INSERT INTO "remix_artist" VALUES(3616,4313,1);
+INSERT INTO "remix_artist" VALUES(3617,10990,1);
+INSERT INTO "remix_artist" VALUES(3617,15985,1);
+INSERT INTO "remix_artist" VALUES(3618,12541,1);
+INSERT INTO "remix_artist" VALUES(3619,15998,1);
+INSERT INTO "remix_artist" VALUES(3620,13213,1);
+INSERT INTO "remix_artist" VALUES(3621,14375,1);
+INSERT INTO "remix_artist" VALUES(3622,14461,1);
+INSERT INTO "remix_artist" VALUES(3623,15560,1);
+INSERT INTO "remix_artist" VALUES(3624,4703,1);
+INSERT INTO "remix_artist" VALUES(3625,4543,1);
+INSERT INTO "remix_artist" VALUES(3625,15320,1);
+INSERT INTO "remix_artist" VALUES(3626,11963,1);
+INSERT INTO "remix_artist" VALUES(3627,14143,1);
+INSERT INTO "remix_artist" VALUES(3628,13577,1);
+INSERT INTO "remix_artist" VALUES(3629,4450,1);
+INSERT INTO "remix_artist" VALUES(3630,4450,1);
+INSERT INTO "remix_artist" VALUES(3631,14375,1);
+INSERT INTO "remix_artist" VALUES(3632,14492,1);
+INSERT INTO "remix_artist" VALUES(3633,14734,1);
+INSERT INTO "remix_artist" VALUES(3634,15473,1);
+INSERT INTO "remix_artist" VALUES(3635,14734,1);
+INSERT INTO "remix_artist" VALUES(3636,10671,1);
+INSERT INTO "remix_artist" VALUES(3636,12064,1);
+INSERT INTO "remix_artist" VALUES(3636,14461,1);
+INSERT INTO "remix_artist" VALUES(3636,14980,1);
+INSERT INTO "remix_artist" VALUES(3637,4703,1);
+INSERT INTO "remix_artist" VALUES(3638,14734,1);
+INSERT INTO "remix_artist" VALUES(3639,11939,1);
+INSERT INTO "remix_artist" VALUES(3640,16101,1);
+INSERT INTO "remix_artist" VALUES(3641,14375,1);
+INSERT INTO "remix_artist" VALUES(3642,14375,1);
+INSERT INTO "remix_artist" VALUES(3643,4280,1);
+INSERT INTO "remix_artist" VALUES(3644,15309,1);
+INSERT INTO "remix_artist" VALUES(3644,16102,1);
+INSERT INTO "remix_artist" VALUES(3645,4729,1);
+INSERT INTO "remix_artist" VALUES(3646,5409,1);
+INSERT INTO "remix_artist" VALUES(3646,12540,1);
+INSERT INTO "remix_artist" VALUES(3646,13677,1);
+INSERT INTO "remix_artist" VALUES(3646,14980,1);
+INSERT INTO "remix_artist" VALUES(3646,14985,1);
+INSERT INTO "remix_artist" VALUES(3647,15232,1);
+INSERT INTO "remix_artist" VALUES(3647,15682,1);
+INSERT INTO "remix_artist" VALUES(3647,16114,1);
+INSERT INTO "remix_artist" VALUES(3648,14139,1);
+INSERT INTO "remix_artist" VALUES(3649,9047,1);
+INSERT INTO "remix_artist" VALUES(3649,10671,1);
+INSERT INTO "remix_artist" VALUES(3650,4655,1);
+INSERT INTO "remix_artist" VALUES(3651,15067,1);
+INSERT INTO "remix_artist" VALUES(3652,14461,1);
+INSERT INTO "remix_artist" VALUES(3652,15473,1);
+INSERT INTO "remix_artist" VALUES(3652,15681,1);
+INSERT INTO "remix_artist" VALUES(3653,12957,1);
+INSERT INTO "remix_artist" VALUES(3653,14461,1);
+INSERT INTO "remix_artist" VALUES(3654,4656,1);
+INSERT INTO "remix_artist" VALUES(3655,14375,1);
+INSERT INTO "remix_artist" VALUES(3656,16180,1);
+INSERT INTO "remix_artist" VALUES(3657,4795,1);
+INSERT INTO "remix_artist" VALUES(3658,8998,1);
+INSERT INTO "remix_artist" VALUES(3659,16181,1);
+INSERT INTO "remix_artist" VALUES(3660,13147,1);
+INSERT INTO "remix_artist" VALUES(3661,12064,1);
+INSERT INTO "remix_artist" VALUES(3662,16182,1);
+INSERT INTO "remix_artist" VALUES(3663,14461,1);
+INSERT INTO "remix_artist" VALUES(3663,15473,1);
+INSERT INTO "remix_artist" VALUES(3663,15680,1);
+INSERT INTO "remix_artist" VALUES(3664,12351,1);
+INSERT INTO "remix_artist" VALUES(3665,4685,1);
+INSERT INTO "remix_artist" VALUES(3665,15473,1);
+INSERT INTO "remix_artist" VALUES(3666,4703,1);
+INSERT INTO "remix_artist" VALUES(3667,14461,1);
+INSERT INTO "remix_artist" VALUES(3667,15747,1);
+INSERT INTO "remix_artist" VALUES(3668,4699,1);
+INSERT INTO "remix_artist" VALUES(3668,9847,1);
+INSERT INTO "remix_artist" VALUES(3669,14375,1);
+INSERT INTO "remix_artist" VALUES(3670,16190,1);
+INSERT INTO "remix_artist" VALUES(3671,13849,1);
+INSERT INTO "remix_artist" VALUES(3671,14337,1);
+INSERT INTO "remix_artist" VALUES(3672,4772,1);
+INSERT INTO "remix_artist" VALUES(3673,8640,1);
+INSERT INTO "remix_artist" VALUES(3674,16192,1);
+INSERT INTO "remix_artist" VALUES(3675,15234,1);
+INSERT INTO "remix_artist" VALUES(3675,16191,1);
+INSERT INTO "remix_artist" VALUES(3676,12352,1);
+INSERT INTO "remix_artist" VALUES(3676,16196,1);
+INSERT INTO "remix_artist" VALUES(3676,16197,1);
+INSERT INTO "remix_artist" VALUES(3676,16198,1);
+INSERT INTO "remix_artist" VALUES(3676,16199,1);
+INSERT INTO "remix_artist" VALUES(3676,16200,1);
+INSERT INTO "remix_artist" VALUES(3677,12352,1);
+INSERT INTO "remix_artist" VALUES(3677,16196,1);
+INSERT INTO "remix_artist" VALUES(3677,16197,1);
+INSERT INTO "remix_artist" VALUES(3677,16198,1);
+INSERT INTO "remix_artist" VALUES(3677,16199,1);
+INSERT INTO "remix_artist" VALUES(3678,16194,1);
+INSERT INTO "remix_artist" VALUES(3679,16193,1);
+INSERT INTO "remix_artist" VALUES(3680,4793,1);
+INSERT INTO "remix_artist" VALUES(3681,14375,1);
+INSERT INTO "remix_artist" VALUES(3682,14375,1);
+INSERT INTO "remix_artist" VALUES(3683,16195,1);
+INSERT INTO "remix_artist" VALUES(3684,16204,1);
+INSERT INTO "remix_artist" VALUES(3685,12958,1);
+INSERT INTO "remix_artist" VALUES(3685,13045,1);
+INSERT INTO "remix_artist" VALUES(3686,4772,1);
+INSERT INTO "remix_artist" VALUES(3687,4729,1);
+INSERT INTO "remix_artist" VALUES(3687,5420,1);
+INSERT INTO "remix_artist" VALUES(3688,14375,1);
+INSERT INTO "remix_artist" VALUES(3689,15066,1);
+INSERT INTO "remix_artist" VALUES(3690,5655,1);
+INSERT INTO "remix_artist" VALUES(3691,12706,1);
+INSERT INTO "remix_artist" VALUES(3692,16269,1);
+INSERT INTO "remix_artist" VALUES(3693,4582,1);
+INSERT INTO "remix_artist" VALUES(3694,14927,1);
+INSERT INTO "remix_artist" VALUES(3694,15475,1);
+INSERT INTO "remix_artist" VALUES(3694,15476,1);
+INSERT INTO "remix_artist" VALUES(3694,16343,1);
+INSERT INTO "remix_artist" VALUES(3695,8998,1);
+INSERT INTO "remix_artist" VALUES(3696,16412,1);
+INSERT INTO "remix_artist" VALUES(3697,12351,1);
+INSERT INTO "remix_artist" VALUES(3698,16413,1);
+INSERT INTO "remix_artist" VALUES(3698,16414,1);
+INSERT INTO "remix_artist" VALUES(3699,16415,1);
+INSERT INTO "remix_artist" VALUES(3700,11960,1);
+INSERT INTO "remix_artist" VALUES(3701,14375,1);
+INSERT INTO "remix_artist" VALUES(3702,9498,1);
+INSERT INTO "remix_artist" VALUES(3702,16416,1);
+INSERT INTO "remix_artist" VALUES(3703,4795,1);
+INSERT INTO "remix_artist" VALUES(3704,16417,1);
+INSERT INTO "remix_artist" VALUES(3705,13668,1);
+INSERT INTO "remix_artist" VALUES(3706,4703,1);
+INSERT INTO "remix_artist" VALUES(3707,12541,1);
+INSERT INTO "remix_artist" VALUES(3708,4515,1);
+INSERT INTO "remix_artist" VALUES(3709,16422,1);
+INSERT INTO "remix_artist" VALUES(3710,15560,1);
+INSERT INTO "remix_artist" VALUES(3711,9047,1);
+INSERT INTO "remix_artist" VALUES(3712,14375,1);
+INSERT INTO "remix_artist" VALUES(3713,10866,1);
+INSERT INTO "remix_artist" VALUES(3714,4685,1);
+INSERT INTO "remix_artist" VALUES(3715,14361,1);
+INSERT INTO "remix_artist" VALUES(3716,14461,1);
+INSERT INTO "remix_artist" VALUES(3716,16428,1);
+INSERT INTO "remix_artist" VALUES(3717,12710,1);
+INSERT INTO "remix_artist" VALUES(3717,14461,1);
+INSERT INTO "remix_artist" VALUES(3718,16429,1);
+INSERT INTO "remix_artist" VALUES(3719,16190,1);
+INSERT INTO "remix_artist" VALUES(3720,16430,1);
+INSERT INTO "remix_artist" VALUES(3721,12064,1);
+INSERT INTO "remix_artist" VALUES(3722,9847,1);
+INSERT INTO "remix_artist" VALUES(3723,14375,1);
+INSERT INTO "remix_artist" VALUES(3724,14375,1);
+INSERT INTO "remix_artist" VALUES(3725,10683,1);
+INSERT INTO "remix_artist" VALUES(3725,13147,1);
+INSERT INTO "remix_artist" VALUES(3726,4588,1);
+INSERT INTO "remix_artist" VALUES(3726,5184,1);
+INSERT INTO "remix_artist" VALUES(3727,5420,1);
+INSERT INTO "remix_artist" VALUES(3728,10772,1);
+INSERT INTO "remix_artist" VALUES(3728,10893,1);
+INSERT INTO "remix_artist" VALUES(3728,13512,1);
+INSERT INTO "remix_artist" VALUES(3729,12710,1);
+INSERT INTO "remix_artist" VALUES(3730,15587,1);
+INSERT INTO "remix_artist" VALUES(3731,15770,1);
+INSERT INTO "remix_artist" VALUES(3732,16436,1);
+INSERT INTO "remix_artist" VALUES(3733,16435,1);
+INSERT INTO "remix_artist" VALUES(3734,14927,1);
+INSERT INTO "remix_artist" VALUES(3734,16437,1);
+INSERT INTO "remix_artist" VALUES(3735,13147,1);
+INSERT INTO "remix_artist" VALUES(3736,16438,1);
+INSERT INTO "remix_artist" VALUES(3737,12317,1);
+INSERT INTO "remix_artist" VALUES(3738,12317,1);
+INSERT INTO "remix_artist" VALUES(3738,12559,1);
+INSERT INTO "remix_artist" VALUES(3738,15684,1);
+INSERT INTO "remix_artist" VALUES(3739,4724,1);
+INSERT INTO "remix_artist" VALUES(3739,10663,1);
+INSERT INTO "remix_artist" VALUES(3740,14375,1);
+INSERT INTO "remix_artist" VALUES(3741,14375,1);
+INSERT INTO "remix_artist" VALUES(3742,16423,1);
+INSERT INTO "remix_artist" VALUES(3742,16424,1);
+INSERT INTO "remix_artist" VALUES(3742,16425,1);
+INSERT INTO "remix_artist" VALUES(3742,16426,1);
+INSERT INTO "remix_artist" VALUES(3742,16427,1);
+INSERT INTO "remix_artist" VALUES(3743,11940,1);
+INSERT INTO "remix_artist" VALUES(3744,15612,1);
+INSERT INTO "remix_artist" VALUES(3745,14357,1);
+INSERT INTO "remix_artist" VALUES(3746,5269,1);
+INSERT INTO "remix_artist" VALUES(3746,16418,1);
+INSERT INTO "remix_artist" VALUES(3746,16419,1);
+INSERT INTO "remix_artist" VALUES(3747,16517,1);
+INSERT INTO "remix_artist" VALUES(3748,13664,1);
+INSERT INTO "remix_artist" VALUES(3749,13045,1);
+INSERT INTO "remix_artist" VALUES(3750,4280,1);
+INSERT INTO "remix_artist" VALUES(3751,12541,1);
+INSERT INTO "remix_artist" VALUES(3752,9511,1);
+INSERT INTO "remix_artist" VALUES(3753,10683,1);
+INSERT INTO "remix_artist" VALUES(3753,13667,1);
+INSERT INTO "remix_artist" VALUES(3754,16518,1);
+INSERT INTO "remix_artist" VALUES(3755,4772,1);
+INSERT INTO "remix_artist" VALUES(3756,14463,1);
+INSERT INTO "remix_artist" VALUES(3756,15999,1);
+INSERT INTO "remix_artist" VALUES(3757,12706,1);
+INSERT INTO "remix_artist" VALUES(3757,14463,1);
+INSERT INTO "remix_artist" VALUES(3757,15199,1);
+INSERT INTO "remix_artist" VALUES(3757,16102,1);
+INSERT INTO "remix_artist" VALUES(3757,16525,1);
+INSERT INTO "remix_artist" VALUES(3758,14461,1);
+INSERT INTO "remix_artist" VALUES(3759,13147,1);
+INSERT INTO "remix_artist" VALUES(3760,14126,1);
+INSERT INTO "remix_artist" VALUES(3761,16113,1);
+INSERT INTO "remix_artist" VALUES(3762,10671,1);
+INSERT INTO "remix_artist" VALUES(3762,13668,1);
+INSERT INTO "remix_artist" VALUES(3762,15833,1);
+INSERT INTO "remix_artist" VALUES(3762,16526,1);
+INSERT INTO "remix_artist" VALUES(3763,4795,1);
+INSERT INTO "remix_artist" VALUES(3764,16183,1);
+INSERT INTO "remix_artist" VALUES(3765,16183,1);
+INSERT INTO "remix_artist" VALUES(3766,14928,1);
+INSERT INTO "remix_artist" VALUES(3767,14038,1);
+INSERT INTO "remix_artist" VALUES(3768,10893,1);
+INSERT INTO "remix_artist" VALUES(3769,14461,1);
+INSERT INTO "remix_artist" VALUES(3769,15320,1);
+INSERT INTO "remix_artist" VALUES(3769,15612,1);
+INSERT INTO "remix_artist" VALUES(3770,13677,1);
+INSERT INTO "remix_artist" VALUES(3770,14461,1);
+INSERT INTO "remix_artist" VALUES(3770,15468,1);
+INSERT INTO "remix_artist" VALUES(3771,14463,1);
+INSERT INTO "remix_artist" VALUES(3771,16530,1);
+INSERT INTO "remix_artist" VALUES(3772,13147,1);
+INSERT INTO "remix_artist" VALUES(3773,15232,1);
+INSERT INTO "remix_artist" VALUES(3773,16114,1);
+INSERT INTO "remix_artist" VALUES(3774,10690,1);
+INSERT INTO "remix_artist" VALUES(3775,12706,1);
+INSERT INTO "remix_artist" VALUES(3776,4703,1);
+INSERT INTO "remix_artist" VALUES(3777,4772,1);
+INSERT INTO "remix_artist" VALUES(3778,4759,1);
+INSERT INTO "remix_artist" VALUES(3779,4785,1);
+INSERT INTO "remix_artist" VALUES(3780,14944,1);
+INSERT INTO "remix_artist" VALUES(3781,16540,1);
+INSERT INTO "remix_artist" VALUES(3782,13147,1);
+INSERT INTO "remix_artist" VALUES(3783,4699,1);
+INSERT INTO "remix_artist" VALUES(3784,4699,1);
+INSERT INTO "remix_artist" VALUES(3785,12421,1);
+INSERT INTO "remix_artist" VALUES(3786,5496,1);
+INSERT INTO "remix_artist" VALUES(3786,12421,1);
+INSERT INTO "remix_artist" VALUES(3787,16610,1);
+INSERT INTO "remix_artist" VALUES(3788,14461,1);
+INSERT INTO "remix_artist" VALUES(3788,16118,1);
+INSERT INTO "remix_artist" VALUES(3789,14461,1);
+INSERT INTO "remix_artist" VALUES(3790,10866,1);
+INSERT INTO "remix_artist" VALUES(3791,4703,1);
+INSERT INTO "remix_artist" VALUES(3792,16430,1);
+INSERT INTO "remix_artist" VALUES(3792,16615,1);
+INSERT INTO "remix_artist" VALUES(3793,4723,1);
+INSERT INTO "remix_artist" VALUES(3794,4772,1);
+INSERT INTO "remix_artist" VALUES(3795,16118,1);
+INSERT INTO "remix_artist" VALUES(3795,16431,1);
+INSERT INTO "remix_artist" VALUES(3795,16432,1);
+INSERT INTO "remix_artist" VALUES(3795,16433,1);
+INSERT INTO "remix_artist" VALUES(3796,10136,1);
+INSERT INTO "remix_artist" VALUES(3796,11498,1);
+INSERT INTO "remix_artist" VALUES(3797,5187,1);
+INSERT INTO "remix_artist" VALUES(3798,5198,1);
+INSERT INTO "remix_artist" VALUES(3798,16616,1);
+INSERT INTO "remix_artist" VALUES(3799,4795,1);
+INSERT INTO "remix_artist" VALUES(3799,11782,1);
+INSERT INTO "remix_artist" VALUES(3799,16619,1);
+INSERT INTO "remix_artist" VALUES(3800,10662,1);
+INSERT INTO "remix_artist" VALUES(3801,4698,1);
+INSERT INTO "remix_artist" VALUES(3801,4994,1);
+INSERT INTO "remix_artist" VALUES(3801,12366,1);
+INSERT INTO "remix_artist" VALUES(3802,4799,1);
+INSERT INTO "remix_artist" VALUES(3803,14375,1);
+INSERT INTO "remix_artist" VALUES(3804,11779,1);
+INSERT INTO "remix_artist" VALUES(3805,16693,1);
+INSERT INTO "remix_artist" VALUES(3806,16694,1);
+INSERT INTO "remix_artist" VALUES(3807,10136,1);
+INSERT INTO "remix_artist" VALUES(3808,10136,1);
+INSERT INTO "remix_artist" VALUES(3809,12314,1);
+INSERT INTO "remix_artist" VALUES(3810,12314,1);
+INSERT INTO "remix_artist" VALUES(3810,12315,1);
+INSERT INTO "remix_artist" VALUES(3811,4479,1);
+INSERT INTO "remix_artist" VALUES(3811,5185,1);
+INSERT INTO "remix_artist" VALUES(3812,4809,1);
+INSERT INTO "remix_artist" VALUES(3813,9847,1);
+INSERT INTO "remix_artist" VALUES(3814,16696,1);
+INSERT INTO "remix_artist" VALUES(3815,14734,1);
+INSERT INTO "remix_artist" VALUES(3816,14734,1);
+INSERT INTO "remix_artist" VALUES(3817,11782,1);
+INSERT INTO "remix_artist" VALUES(3818,13668,1);
+INSERT INTO "remix_artist" VALUES(3819,4655,1);
+INSERT INTO "remix_artist" VALUES(3820,11963,1);
+INSERT INTO "remix_artist" VALUES(3821,16843,1);
+INSERT INTO "remix_artist" VALUES(3822,10136,1);
+INSERT INTO "remix_artist" VALUES(3823,8998,1);
+INSERT INTO "remix_artist" VALUES(3824,4279,1);
+INSERT INTO "remix_artist" VALUES(3825,11940,1);
+INSERT INTO "remix_artist" VALUES(3825,15850,1);
+INSERT INTO "remix_artist" VALUES(3825,16845,1);
+INSERT INTO "remix_artist" VALUES(3826,14461,1);
+INSERT INTO "remix_artist" VALUES(3826,16844,1);
+INSERT INTO "remix_artist" VALUES(3827,4440,1);
+INSERT INTO "remix_artist" VALUES(3827,13046,1);
+INSERT INTO "remix_artist" VALUES(3828,4685,1);
+INSERT INTO "remix_artist" VALUES(3829,16844,1);
+INSERT INTO "remix_artist" VALUES(3830,11963,1);
+INSERT INTO "remix_artist" VALUES(3831,15612,1);
+INSERT INTO "remix_artist" VALUES(3832,12710,1);
+INSERT INTO "remix_artist" VALUES(3833,12314,1);
+INSERT INTO "remix_artist" VALUES(3834,10136,1);
+INSERT INTO "remix_artist" VALUES(3835,16858,1);
+INSERT INTO "remix_artist" VALUES(3836,14925,1);
+INSERT INTO "remix_artist" VALUES(3836,16850,1);
+INSERT INTO "remix_artist" VALUES(3837,4781,1);
+INSERT INTO "remix_artist" VALUES(3838,16846,1);
+INSERT INTO "remix_artist" VALUES(3839,11963,1);
+INSERT INTO "remix_artist" VALUES(3840,14357,1);
+INSERT INTO "remix_artist" VALUES(3841,14607,1);
+INSERT INTO "remix_artist" VALUES(3842,14064,1);
+INSERT INTO "remix_artist" VALUES(3843,14375,1);
+INSERT INTO "remix_artist" VALUES(3844,10900,1);
+INSERT INTO "remix_artist" VALUES(3845,15066,1);
+INSERT INTO "remix_artist" VALUES(3846,4543,1);
+INSERT INTO "remix_artist" VALUES(3846,15320,1);
+INSERT INTO "remix_artist" VALUES(3847,4729,1);
+INSERT INTO "remix_artist" VALUES(3848,13849,1);
+INSERT INTO "remix_artist" VALUES(3849,16934,1);
+INSERT INTO "remix_artist" VALUES(3850,12703,1);
+INSERT INTO "remix_artist" VALUES(3851,14375,1);
+INSERT INTO "remix_artist" VALUES(3852,4699,1);
+INSERT INTO "remix_artist" VALUES(3853,4729,1);
+INSERT INTO "remix_artist" VALUES(3854,16935,1);
+INSERT INTO "remix_artist" VALUES(3855,4724,1);
+INSERT INTO "remix_artist" VALUES(3855,12956,1);
+INSERT INTO "remix_artist" VALUES(3855,14461,1);
+INSERT INTO "remix_artist" VALUES(3855,15473,1);
+INSERT INTO "remix_artist" VALUES(3855,15680,1);
+INSERT INTO "remix_artist" VALUES(3855,16615,1);
+INSERT INTO "remix_artist" VALUES(3855,16844,1);
+INSERT INTO "remix_artist" VALUES(3855,16853,1);
+INSERT INTO "remix_artist" VALUES(3855,16854,1);
+INSERT INTO "remix_artist" VALUES(3855,16855,1);
+INSERT INTO "remix_artist" VALUES(3855,16856,1);
+INSERT INTO "remix_artist" VALUES(3856,14357,1);
+INSERT INTO "remix_artist" VALUES(3856,16848,1);
+INSERT INTO "remix_artist" VALUES(3857,4279,1);
+INSERT INTO "remix_artist" VALUES(3858,14374,1);
+INSERT INTO "remix_artist" VALUES(3859,4624,1);
+INSERT INTO "remix_artist" VALUES(3859,16937,1);
+INSERT INTO "remix_artist" VALUES(3860,15751,1);
+INSERT INTO "remix_artist" VALUES(3861,16939,1);
+INSERT INTO "remix_artist" VALUES(3862,14375,1);
+INSERT INTO "remix_artist" VALUES(3862,16615,1);
+INSERT INTO "remix_artist" VALUES(3863,16940,1);
+INSERT INTO "remix_artist" VALUES(3864,14501,1);
+INSERT INTO "remix_artist" VALUES(3865,16941,1);
+INSERT INTO "remix_artist" VALUES(3866,14964,1);
+INSERT INTO "remix_artist" VALUES(3867,16101,1);
+INSERT INTO "remix_artist" VALUES(3868,16943,1);
+INSERT INTO "remix_artist" VALUES(3869,10682,1);
+INSERT INTO "remix_artist" VALUES(3870,15062,1);
+INSERT INTO "remix_artist" VALUES(3870,16103,1);
+INSERT INTO "remix_artist" VALUES(3870,16104,1);
+INSERT INTO "remix_artist" VALUES(3871,16936,1);
+INSERT INTO "remix_artist" VALUES(3872,12540,1);
+INSERT INTO "remix_artist" VALUES(3872,14980,1);
+INSERT INTO "remix_artist" VALUES(3872,15612,1);
+INSERT INTO "remix_artist" VALUES(3873,5425,1);
+INSERT INTO "remix_artist" VALUES(3874,16946,1);
+INSERT INTO "remix_artist" VALUES(3875,11501,1);
+INSERT INTO "remix_artist" VALUES(3875,16949,1);
+INSERT INTO "remix_artist" VALUES(3876,4440,1);
+INSERT INTO "remix_artist" VALUES(3877,14375,1);
+INSERT INTO "remix_artist" VALUES(3877,16615,1);
+INSERT INTO "remix_artist" VALUES(3878,16951,1);
+INSERT INTO "remix_artist" VALUES(3879,12956,1);
+INSERT INTO "remix_artist" VALUES(3879,14461,1);
+INSERT INTO "remix_artist" VALUES(3879,15473,1);
+INSERT INTO "remix_artist" VALUES(3879,16113,1);
+INSERT INTO "remix_artist" VALUES(3879,16615,1);
+INSERT INTO "remix_artist" VALUES(3879,16855,1);
+INSERT INTO "remix_artist" VALUES(3880,13921,1);
+INSERT INTO "remix_artist" VALUES(3881,4695,1);
+INSERT INTO "remix_artist" VALUES(3881,4726,1);
+INSERT INTO "remix_artist" VALUES(3881,10671,1);
+INSERT INTO "remix_artist" VALUES(3882,8640,1);
+INSERT INTO "remix_artist" VALUES(3882,14337,1);
+INSERT INTO "remix_artist" VALUES(3883,14572,1);
+INSERT INTO "remix_artist" VALUES(3883,16844,1);
+INSERT INTO "remix_artist" VALUES(3884,8998,1);
+INSERT INTO "remix_artist" VALUES(3885,16183,1);
+INSERT INTO "remix_artist" VALUES(3886,15851,1);
+INSERT INTO "remix_artist" VALUES(3886,17020,1);
+INSERT INTO "remix_artist" VALUES(3886,17021,1);
+INSERT INTO "remix_artist" VALUES(3887,12710,1);
+INSERT INTO "remix_artist" VALUES(3888,14461,1);
+INSERT INTO "remix_artist" VALUES(3888,15681,1);
+INSERT INTO "remix_artist" VALUES(3889,4624,1);
+INSERT INTO "remix_artist" VALUES(3890,11498,1);
+INSERT INTO "remix_artist" VALUES(3890,13216,1);
+INSERT INTO "remix_artist" VALUES(3890,15747,1);
+INSERT INTO "remix_artist" VALUES(3891,4729,1);
+INSERT INTO "remix_artist" VALUES(3892,17026,1);
+INSERT INTO "remix_artist" VALUES(3893,15232,1);
+INSERT INTO "remix_artist" VALUES(3893,16114,1);
+INSERT INTO "remix_artist" VALUES(3894,10671,1);
+INSERT INTO "remix_artist" VALUES(3894,12064,1);
+INSERT INTO "remix_artist" VALUES(3894,14375,1);
+INSERT INTO "remix_artist" VALUES(3894,15473,1);
+INSERT INTO "remix_artist" VALUES(3894,16615,1);
+INSERT INTO "remix_artist" VALUES(3894,16856,1);
+INSERT INTO "remix_artist" VALUES(3894,17031,1);
+INSERT INTO "remix_artist" VALUES(3894,17032,1);
+INSERT INTO "remix_artist" VALUES(3894,17033,1);
+INSERT INTO "remix_artist" VALUES(3894,17034,1);
+INSERT INTO "remix_artist" VALUES(3894,17035,1);
+INSERT INTO "remix_artist" VALUES(3894,17036,1);
+INSERT INTO "remix_artist" VALUES(3894,17037,1);
+INSERT INTO "remix_artist" VALUES(3894,17038,1);
+INSERT INTO "remix_artist" VALUES(3895,14375,1);
+INSERT INTO "remix_artist" VALUES(3895,17039,1);
+INSERT INTO "remix_artist" VALUES(3896,4543,1);
+INSERT INTO "remix_artist" VALUES(3897,4543,1);
+INSERT INTO "remix_artist" VALUES(3898,11963,1);
+INSERT INTO "remix_artist" VALUES(3899,9047,1);
+INSERT INTO "remix_artist" VALUES(3900,4279,1);
+INSERT INTO "remix_artist" VALUES(3901,14461,1);
+INSERT INTO "remix_artist" VALUES(3901,14980,1);
+INSERT INTO "remix_artist" VALUES(3901,15680,1);
+INSERT INTO "remix_artist" VALUES(3901,16852,1);
+INSERT INTO "remix_artist" VALUES(3902,17042,1);
+INSERT INTO "remix_artist" VALUES(3903,13500,1);
+INSERT INTO "remix_artist" VALUES(3904,4772,1);
+INSERT INTO "remix_artist" VALUES(3905,13668,1);
+INSERT INTO "remix_artist" VALUES(3905,16851,1);
+INSERT INTO "remix_artist" VALUES(3906,15560,1);
+INSERT INTO "remix_artist" VALUES(3907,15473,1);
+INSERT INTO "remix_artist" VALUES(3908,16183,1);
+INSERT INTO "remix_artist" VALUES(3909,16430,1);
+INSERT INTO "remix_artist" VALUES(3909,16615,1);
+INSERT INTO "remix_artist" VALUES(3910,14582,1);
+INSERT INTO "remix_artist" VALUES(3911,4695,1);
+INSERT INTO "remix_artist" VALUES(3911,14461,1);
+INSERT INTO "remix_artist" VALUES(3911,16615,1);
+INSERT INTO "remix_artist" VALUES(3912,14375,1);
+INSERT INTO "remix_artist" VALUES(3913,16416,1);
+INSERT INTO "remix_artist" VALUES(3914,16696,1);
+INSERT INTO "remix_artist" VALUES(3915,12706,1);
+INSERT INTO "remix_artist" VALUES(3916,4734,1);
+INSERT INTO "remix_artist" VALUES(3917,11940,1);
+INSERT INTO "remix_artist" VALUES(3918,4699,1);
+INSERT INTO "remix_artist" VALUES(3919,15747,1);
+INSERT INTO "remix_artist" VALUES(3920,16934,1);
+INSERT INTO "remix_artist" VALUES(3921,13921,1);
+INSERT INTO "remix_artist" VALUES(3922,14143,1);
+INSERT INTO "remix_artist" VALUES(3923,17048,1);
+INSERT INTO "remix_artist" VALUES(3924,14375,1);
+INSERT INTO "remix_artist" VALUES(3925,14375,1);
+INSERT INTO "remix_artist" VALUES(3926,4656,1);
+INSERT INTO "remix_artist" VALUES(3927,4290,1);
+INSERT INTO "remix_artist" VALUES(3927,4558,1);
+INSERT INTO "remix_artist" VALUES(3928,17020,1);
+INSERT INTO "remix_artist" VALUES(3929,12706,1);
+INSERT INTO "remix_artist" VALUES(3930,17049,1);
+INSERT INTO "remix_artist" VALUES(3931,10690,1);
+INSERT INTO "remix_artist" VALUES(3932,17051,1);
+INSERT INTO "remix_artist" VALUES(3933,8998,1);
+INSERT INTO "remix_artist" VALUES(3934,5473,1);
+INSERT INTO "remix_artist" VALUES(3934,9690,1);
+INSERT INTO "remix_artist" VALUES(3934,14461,1);
+INSERT INTO "remix_artist" VALUES(3934,15473,1);
+INSERT INTO "remix_artist" VALUES(3934,16844,1);
+INSERT INTO "remix_artist" VALUES(3934,17052,1);
+INSERT INTO "remix_artist" VALUES(3934,17053,1);
+INSERT INTO "remix_artist" VALUES(3934,17054,1);
+INSERT INTO "remix_artist" VALUES(3935,14375,1);
+INSERT INTO "remix_artist" VALUES(3936,4313,1);
+INSERT INTO "remix_artist" VALUES(3937,14375,1);
+INSERT INTO "remix_artist" VALUES(3938,14461,1);
+INSERT INTO "remix_artist" VALUES(3938,14980,1);
+INSERT INTO "remix_artist" VALUES(3938,15199,1);
+INSERT INTO "remix_artist" VALUES(3938,16117,1);
+INSERT INTO "remix_artist" VALUES(3938,16119,1);
+INSERT INTO "remix_artist" VALUES(3939,4729,1);
+INSERT INTO "remix_artist" VALUES(3939,12421,1);
+INSERT INTO "remix_artist" VALUES(3940,4695,1);
+INSERT INTO "remix_artist" VALUES(3941,4655,1);
+INSERT INTO "remix_artist" VALUES(3942,17020,1);
+INSERT INTO "remix_artist" VALUES(3942,17055,1);
+INSERT INTO "remix_artist" VALUES(3942,17056,1);
+INSERT INTO "remix_artist" VALUES(3943,12131,1);
+INSERT INTO "remix_artist" VALUES(3944,14461,1);
+INSERT INTO "remix_artist" VALUES(3944,16844,1);
+INSERT INTO "remix_artist" VALUES(3945,14461,1);
+INSERT INTO "remix_artist" VALUES(3945,17058,1);
+INSERT INTO "remix_artist" VALUES(3945,17059,1);
+INSERT INTO "remix_artist" VALUES(3945,17060,1);
+INSERT INTO "remix_artist" VALUES(3946,13740,1);
+INSERT INTO "remix_artist" VALUES(3947,14594,1);
+INSERT INTO "remix_artist" VALUES(3948,9047,1);
+INSERT INTO "remix_artist" VALUES(3949,14375,1);
+INSERT INTO "remix_artist" VALUES(3950,4543,1);
+INSERT INTO "remix_artist" VALUES(3950,4698,1);
+INSERT INTO "remix_artist" VALUES(3951,17057,1);
+INSERT INTO "remix_artist" VALUES(3952,14133,1);
+INSERT INTO "remix_artist" VALUES(3953,4695,1);
+INSERT INTO "remix_artist" VALUES(3953,16933,1);
+INSERT INTO "remix_artist" VALUES(3954,4655,1);
+INSERT INTO "remix_artist" VALUES(3955,16517,1);
+INSERT INTO "remix_artist" VALUES(3956,4795,1);
+INSERT INTO "remix_artist" VALUES(3957,17064,1);
+INSERT INTO "remix_artist" VALUES(3958,13147,1);
+INSERT INTO "remix_artist" VALUES(3959,17068,1);
+INSERT INTO "remix_artist" VALUES(3960,14375,1);
+INSERT INTO "remix_artist" VALUES(3961,12546,1);
+INSERT INTO "remix_artist" VALUES(3961,14375,1);
+INSERT INTO "remix_artist" VALUES(3962,4543,1);
+INSERT INTO "remix_artist" VALUES(3963,4543,1);
+INSERT INTO "remix_artist" VALUES(3964,4729,1);
+INSERT INTO "remix_artist" VALUES(3965,4729,1);
+INSERT INTO "remix_artist" VALUES(3966,15770,1);
+INSERT INTO "remix_artist" VALUES(3967,4650,1);
+INSERT INTO "remix_artist" VALUES(3968,14925,1);
+INSERT INTO "remix_artist" VALUES(3969,4655,1);
+INSERT INTO "remix_artist" VALUES(3970,15473,1);
+INSERT INTO "remix_artist" VALUES(3971,16430,1);
+INSERT INTO "remix_artist" VALUES(3971,16844,1);
+INSERT INTO "remix_artist" VALUES(3971,17070,1);
+INSERT INTO "remix_artist" VALUES(3972,14375,1);
+INSERT INTO "remix_artist" VALUES(3973,14375,1);
+INSERT INTO "remix_artist" VALUES(3974,13921,1);
+INSERT INTO "remix_artist" VALUES(3975,11774,1);
+INSERT INTO "remix_artist" VALUES(3976,5043,1);
+INSERT INTO "remix_artist" VALUES(3976,12064,1);
+INSERT INTO "remix_artist" VALUES(3977,10670,1);
+INSERT INTO "remix_artist" VALUES(3978,5178,1);
+INSERT INTO "remix_artist" VALUES(3979,15849,1);
+INSERT INTO "remix_artist" VALUES(3980,11940,1);
+INSERT INTO "remix_artist" VALUES(3980,13054,1);
+INSERT INTO "remix_artist" VALUES(3980,16845,1);
+INSERT INTO "remix_artist" VALUES(3981,8998,1);
+INSERT INTO "remix_artist" VALUES(3982,17042,1);
+INSERT INTO "remix_artist" VALUES(3983,13049,1);
+INSERT INTO "remix_artist" VALUES(3984,16192,1);
+INSERT INTO "remix_artist" VALUES(3985,17062,1);
+INSERT INTO "remix_artist" VALUES(3986,17146,1);
+INSERT INTO "remix_artist" VALUES(3987,9847,1);
+INSERT INTO "remix_artist" VALUES(3988,17147,1);
+INSERT INTO "remix_artist" VALUES(3988,17148,1);
+INSERT INTO "remix_artist" VALUES(3989,4777,1);
+INSERT INTO "remix_artist" VALUES(3990,16937,1);
+INSERT INTO "remix_artist" VALUES(3990,17061,1);
+INSERT INTO "remix_artist" VALUES(3991,11963,1);
+INSERT INTO "remix_artist" VALUES(3992,14495,1);
+INSERT INTO "remix_artist" VALUES(3993,14357,1);
+INSERT INTO "remix_artist" VALUES(3994,12314,1);
+INSERT INTO "remix_artist" VALUES(3995,13046,1);
+INSERT INTO "remix_artist" VALUES(3996,11498,1);
+INSERT INTO "remix_artist" VALUES(3997,4695,1);
+INSERT INTO "remix_artist" VALUES(3997,14461,1);
+INSERT INTO "remix_artist" VALUES(3997,15681,1);
+INSERT INTO "remix_artist" VALUES(3997,15682,1);
+INSERT INTO "remix_artist" VALUES(3998,13668,1);
+INSERT INTO "remix_artist" VALUES(3999,9847,1);
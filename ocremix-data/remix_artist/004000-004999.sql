@@ -0,0 +1,1984 @@
+INSERT INTO "remix_artist" VALUES(4000,4279,1);
+INSERT INTO "remix_artist" VALUES(4001,4695,1);
+INSERT INTO "remix_artist" VALUES(4002,17158,1);
+INSERT INTO "remix_artist" VALUES(4003,5473,1);
+INSERT INTO "remix_artist" VALUES(4004,5473,1);
+INSERT INTO "remix_artist" VALUES(4005,4695,1);
+INSERT INTO "remix_artist" VALUES(4005,5473,1);
+INSERT INTO "remix_artist" VALUES(4005,16950,1);
+INSERT INTO "remix_artist" VALUES(4006,5655,1);
+INSERT INTO "remix_artist" VALUES(4006,10690,1);
+INSERT INTO "remix_artist" VALUES(4007,13854,1);
+INSERT INTO "remix_artist" VALUES(4007,14375,1);
+INSERT INTO "remix_artist" VALUES(4007,16615,1);
+INSERT INTO "remix_artist" VALUES(4007,16856,1);
+INSERT INTO "remix_artist" VALUES(4007,17039,1);
+INSERT INTO "remix_artist" VALUES(4008,4279,1);
+INSERT INTO "remix_artist" VALUES(4009,17049,1);
+INSERT INTO "remix_artist" VALUES(4010,14375,1);
+INSERT INTO "remix_artist" VALUES(4011,5036,1);
+INSERT INTO "remix_artist" VALUES(4011,5269,1);
+INSERT INTO "remix_artist" VALUES(4011,15473,1);
+INSERT INTO "remix_artist" VALUES(4011,15680,1);
+INSERT INTO "remix_artist" VALUES(4011,16103,1);
+INSERT INTO "remix_artist" VALUES(4011,16615,1);
+INSERT INTO "remix_artist" VALUES(4011,16855,1);
+INSERT INTO "remix_artist" VALUES(4011,16856,1);
+INSERT INTO "remix_artist" VALUES(4011,17037,1);
+INSERT INTO "remix_artist" VALUES(4011,17038,1);
+INSERT INTO "remix_artist" VALUES(4011,17316,1);
+INSERT INTO "remix_artist" VALUES(4011,17317,1);
+INSERT INTO "remix_artist" VALUES(4011,17318,1);
+INSERT INTO "remix_artist" VALUES(4011,17319,1);
+INSERT INTO "remix_artist" VALUES(4011,17320,1);
+INSERT INTO "remix_artist" VALUES(4011,17321,1);
+INSERT INTO "remix_artist" VALUES(4011,17322,1);
+INSERT INTO "remix_artist" VALUES(4011,17323,1);
+INSERT INTO "remix_artist" VALUES(4011,17324,1);
+INSERT INTO "remix_artist" VALUES(4012,14461,1);
+INSERT INTO "remix_artist" VALUES(4012,15680,1);
+INSERT INTO "remix_artist" VALUES(4012,15681,1);
+INSERT INTO "remix_artist" VALUES(4012,16844,1);
+INSERT INTO "remix_artist" VALUES(4012,17237,1);
+INSERT INTO "remix_artist" VALUES(4013,4279,1);
+INSERT INTO "remix_artist" VALUES(4014,13849,1);
+INSERT INTO "remix_artist" VALUES(4015,13046,1);
+INSERT INTO "remix_artist" VALUES(4015,14461,1);
+INSERT INTO "remix_artist" VALUES(4015,17244,1);
+INSERT INTO "remix_artist" VALUES(4016,17325,1);
+INSERT INTO "remix_artist" VALUES(4017,14925,1);
+INSERT INTO "remix_artist" VALUES(4018,17057,1);
+INSERT INTO "remix_artist" VALUES(4019,4543,1);
+INSERT INTO "remix_artist" VALUES(4019,15320,1);
+INSERT INTO "remix_artist" VALUES(4020,4685,1);
+INSERT INTO "remix_artist" VALUES(4020,14461,1);
+INSERT INTO "remix_artist" VALUES(4020,17241,1);
+INSERT INTO "remix_artist" VALUES(4021,14375,1);
+INSERT INTO "remix_artist" VALUES(4022,15058,1);
+INSERT INTO "remix_artist" VALUES(4023,5182,1);
+INSERT INTO "remix_artist" VALUES(4023,16119,1);
+INSERT INTO "remix_artist" VALUES(4023,17063,1);
+INSERT INTO "remix_artist" VALUES(4024,13740,1);
+INSERT INTO "remix_artist" VALUES(4025,15234,1);
+INSERT INTO "remix_artist" VALUES(4025,17329,1);
+INSERT INTO "remix_artist" VALUES(4025,17330,1);
+INSERT INTO "remix_artist" VALUES(4025,17331,1);
+INSERT INTO "remix_artist" VALUES(4025,17332,1);
+INSERT INTO "remix_artist" VALUES(4025,17333,1);
+INSERT INTO "remix_artist" VALUES(4025,17334,1);
+INSERT INTO "remix_artist" VALUES(4025,17335,1);
+INSERT INTO "remix_artist" VALUES(4025,17336,1);
+INSERT INTO "remix_artist" VALUES(4025,17337,1);
+INSERT INTO "remix_artist" VALUES(4025,17338,1);
+INSERT INTO "remix_artist" VALUES(4026,12706,1);
+INSERT INTO "remix_artist" VALUES(4027,17339,1);
+INSERT INTO "remix_artist" VALUES(4028,15468,1);
+INSERT INTO "remix_artist" VALUES(4029,13668,1);
+INSERT INTO "remix_artist" VALUES(4030,14357,1);
+INSERT INTO "remix_artist" VALUES(4031,4673,1);
+INSERT INTO "remix_artist" VALUES(4032,14375,1);
+INSERT INTO "remix_artist" VALUES(4033,11498,1);
+INSERT INTO "remix_artist" VALUES(4033,17239,1);
+INSERT INTO "remix_artist" VALUES(4034,11940,1);
+INSERT INTO "remix_artist" VALUES(4035,14375,1);
+INSERT INTO "remix_artist" VALUES(4036,14572,1);
+INSERT INTO "remix_artist" VALUES(4036,16844,1);
+INSERT INTO "remix_artist" VALUES(4037,13677,1);
+INSERT INTO "remix_artist" VALUES(4037,14461,1);
+INSERT INTO "remix_artist" VALUES(4037,15058,1);
+INSERT INTO "remix_artist" VALUES(4037,15680,1);
+INSERT INTO "remix_artist" VALUES(4038,4703,1);
+INSERT INTO "remix_artist" VALUES(4039,17158,1);
+INSERT INTO "remix_artist" VALUES(4040,14461,1);
+INSERT INTO "remix_artist" VALUES(4040,15058,1);
+INSERT INTO "remix_artist" VALUES(4040,15681,1);
+INSERT INTO "remix_artist" VALUES(4040,17246,1);
+INSERT INTO "remix_artist" VALUES(4040,17247,1);
+INSERT INTO "remix_artist" VALUES(4041,13677,1);
+INSERT INTO "remix_artist" VALUES(4042,4286,1);
+INSERT INTO "remix_artist" VALUES(4043,4759,1);
+INSERT INTO "remix_artist" VALUES(4044,11940,1);
+INSERT INTO "remix_artist" VALUES(4045,13147,1);
+INSERT INTO "remix_artist" VALUES(4046,13147,1);
+INSERT INTO "remix_artist" VALUES(4047,16846,1);
+INSERT INTO "remix_artist" VALUES(4048,14375,1);
+INSERT INTO "remix_artist" VALUES(4048,17039,1);
+INSERT INTO "remix_artist" VALUES(4049,14375,1);
+INSERT INTO "remix_artist" VALUES(4049,17459,1);
+INSERT INTO "remix_artist" VALUES(4050,4547,1);
+INSERT INTO "remix_artist" VALUES(4051,15562,1);
+INSERT INTO "remix_artist" VALUES(4051,17461,1);
+INSERT INTO "remix_artist" VALUES(4052,15067,1);
+INSERT INTO "remix_artist" VALUES(4052,16615,1);
+INSERT INTO "remix_artist" VALUES(4053,11774,1);
+INSERT INTO "remix_artist" VALUES(4054,17020,1);
+INSERT INTO "remix_artist" VALUES(4054,17055,1);
+INSERT INTO "remix_artist" VALUES(4055,16934,1);
+INSERT INTO "remix_artist" VALUES(4056,10690,1);
+INSERT INTO "remix_artist" VALUES(4057,4543,1);
+INSERT INTO "remix_artist" VALUES(4057,4560,1);
+INSERT INTO "remix_artist" VALUES(4058,4685,1);
+INSERT INTO "remix_artist" VALUES(4058,14461,1);
+INSERT INTO "remix_artist" VALUES(4058,17245,1);
+INSERT INTO "remix_artist" VALUES(4059,12706,1);
+INSERT INTO "remix_artist" VALUES(4060,5043,1);
+INSERT INTO "remix_artist" VALUES(4061,16113,1);
+INSERT INTO "remix_artist" VALUES(4062,12559,1);
+INSERT INTO "remix_artist" VALUES(4062,12710,1);
+INSERT INTO "remix_artist" VALUES(4062,13677,1);
+INSERT INTO "remix_artist" VALUES(4062,14461,1);
+INSERT INTO "remix_artist" VALUES(4063,14375,1);
+INSERT INTO "remix_artist" VALUES(4063,16615,1);
+INSERT INTO "remix_artist" VALUES(4064,16430,1);
+INSERT INTO "remix_artist" VALUES(4064,16615,1);
+INSERT INTO "remix_artist" VALUES(4065,4313,1);
+INSERT INTO "remix_artist" VALUES(4065,4579,1);
+INSERT INTO "remix_artist" VALUES(4066,4793,1);
+INSERT INTO "remix_artist" VALUES(4067,14461,1);
+INSERT INTO "remix_artist" VALUES(4067,16844,1);
+INSERT INTO "remix_artist" VALUES(4068,14461,1);
+INSERT INTO "remix_artist" VALUES(4068,16844,1);
+INSERT INTO "remix_artist" VALUES(4068,17052,1);
+INSERT INTO "remix_artist" VALUES(4069,16934,1);
+INSERT INTO "remix_artist" VALUES(4070,16846,1);
+INSERT INTO "remix_artist" VALUES(4071,4734,1);
+INSERT INTO "remix_artist" VALUES(4072,17328,1);
+INSERT INTO "remix_artist" VALUES(4073,17049,1);
+INSERT INTO "remix_artist" VALUES(4074,17467,1);
+INSERT INTO "remix_artist" VALUES(4075,17473,1);
+INSERT INTO "remix_artist" VALUES(4076,14375,1);
+INSERT INTO "remix_artist" VALUES(4076,17475,1);
+INSERT INTO "remix_artist" VALUES(4077,17468,1);
+INSERT INTO "remix_artist" VALUES(4078,17476,1);
+INSERT INTO "remix_artist" VALUES(4079,17061,1);
+INSERT INTO "remix_artist" VALUES(4080,4559,1);
+INSERT INTO "remix_artist" VALUES(4080,4799,1);
+INSERT INTO "remix_artist" VALUES(4081,17478,1);
+INSERT INTO "remix_artist" VALUES(4082,12314,1);
+INSERT INTO "remix_artist" VALUES(4082,12315,1);
+INSERT INTO "remix_artist" VALUES(4083,12710,1);
+INSERT INTO "remix_artist" VALUES(4084,4558,1);
+INSERT INTO "remix_artist" VALUES(4084,4699,1);
+INSERT INTO "remix_artist" VALUES(4084,13045,1);
+INSERT INTO "remix_artist" VALUES(4084,13500,1);
+INSERT INTO "remix_artist" VALUES(4084,14461,1);
+INSERT INTO "remix_artist" VALUES(4084,15682,1);
+INSERT INTO "remix_artist" VALUES(4085,10893,1);
+INSERT INTO "remix_artist" VALUES(4085,12064,1);
+INSERT INTO "remix_artist" VALUES(4085,13500,1);
+INSERT INTO "remix_artist" VALUES(4086,14375,1);
+INSERT INTO "remix_artist" VALUES(4087,10663,1);
+INSERT INTO "remix_artist" VALUES(4087,14375,1);
+INSERT INTO "remix_artist" VALUES(4088,4734,1);
+INSERT INTO "remix_artist" VALUES(4089,10900,1);
+INSERT INTO "remix_artist" VALUES(4090,10671,1);
+INSERT INTO "remix_artist" VALUES(4090,13668,1);
+INSERT INTO "remix_artist" VALUES(4090,15473,1);
+INSERT INTO "remix_artist" VALUES(4091,16848,1);
+INSERT INTO "remix_artist" VALUES(4091,17052,1);
+INSERT INTO "remix_artist" VALUES(4092,14375,1);
+INSERT INTO "remix_artist" VALUES(4092,16615,1);
+INSERT INTO "remix_artist" VALUES(4093,9690,1);
+INSERT INTO "remix_artist" VALUES(4093,15473,1);
+INSERT INTO "remix_artist" VALUES(4093,15618,1);
+INSERT INTO "remix_artist" VALUES(4093,16848,1);
+INSERT INTO "remix_artist" VALUES(4093,16935,1);
+INSERT INTO "remix_artist" VALUES(4093,17038,1);
+INSERT INTO "remix_artist" VALUES(4093,17486,1);
+INSERT INTO "remix_artist" VALUES(4094,14357,1);
+INSERT INTO "remix_artist" VALUES(4094,16848,1);
+INSERT INTO "remix_artist" VALUES(4095,17052,1);
+INSERT INTO "remix_artist" VALUES(4096,17485,1);
+INSERT INTO "remix_artist" VALUES(4097,16935,1);
+INSERT INTO "remix_artist" VALUES(4098,4279,1);
+INSERT INTO "remix_artist" VALUES(4099,16847,1);
+INSERT INTO "remix_artist" VALUES(4099,16848,1);
+INSERT INTO "remix_artist" VALUES(4099,17488,1);
+INSERT INTO "remix_artist" VALUES(4100,14927,1);
+INSERT INTO "remix_artist" VALUES(4101,14375,1);
+INSERT INTO "remix_artist" VALUES(4102,14357,1);
+INSERT INTO "remix_artist" VALUES(4103,16430,1);
+INSERT INTO "remix_artist" VALUES(4103,16615,1);
+INSERT INTO "remix_artist" VALUES(4104,14375,1);
+INSERT INTO "remix_artist" VALUES(4105,11782,1);
+INSERT INTO "remix_artist" VALUES(4106,17020,1);
+INSERT INTO "remix_artist" VALUES(4107,16188,1);
+INSERT INTO "remix_artist" VALUES(4108,17485,1);
+INSERT INTO "remix_artist" VALUES(4109,17578,1);
+INSERT INTO "remix_artist" VALUES(4110,17579,1);
+INSERT INTO "remix_artist" VALUES(4111,16939,1);
+INSERT INTO "remix_artist" VALUES(4112,15467,1);
+INSERT INTO "remix_artist" VALUES(4113,17158,1);
+INSERT INTO "remix_artist" VALUES(4114,14356,1);
+INSERT INTO "remix_artist" VALUES(4115,14375,1);
+INSERT INTO "remix_artist" VALUES(4116,14375,1);
+INSERT INTO "remix_artist" VALUES(4117,11963,1);
+INSERT INTO "remix_artist" VALUES(4118,16118,1);
+INSERT INTO "remix_artist" VALUES(4118,16526,1);
+INSERT INTO "remix_artist" VALUES(4118,17582,1);
+INSERT INTO "remix_artist" VALUES(4118,17583,1);
+INSERT INTO "remix_artist" VALUES(4119,15473,1);
+INSERT INTO "remix_artist" VALUES(4119,16113,1);
+INSERT INTO "remix_artist" VALUES(4119,16615,1);
+INSERT INTO "remix_artist" VALUES(4119,17037,1);
+INSERT INTO "remix_artist" VALUES(4119,17584,1);
+INSERT INTO "remix_artist" VALUES(4119,17585,1);
+INSERT INTO "remix_artist" VALUES(4119,17586,1);
+INSERT INTO "remix_artist" VALUES(4120,4286,1);
+INSERT INTO "remix_artist" VALUES(4121,11782,1);
+INSERT INTO "remix_artist" VALUES(4122,17581,1);
+INSERT INTO "remix_artist" VALUES(4123,13668,1);
+INSERT INTO "remix_artist" VALUES(4124,17158,1);
+INSERT INTO "remix_artist" VALUES(4125,14357,1);
+INSERT INTO "remix_artist" VALUES(4125,15473,1);
+INSERT INTO "remix_artist" VALUES(4125,16112,1);
+INSERT INTO "remix_artist" VALUES(4125,16848,1);
+INSERT INTO "remix_artist" VALUES(4125,17037,1);
+INSERT INTO "remix_artist" VALUES(4125,17038,1);
+INSERT INTO "remix_artist" VALUES(4125,17473,1);
+INSERT INTO "remix_artist" VALUES(4126,13046,1);
+INSERT INTO "remix_artist" VALUES(4126,14375,1);
+INSERT INTO "remix_artist" VALUES(4127,4729,1);
+INSERT INTO "remix_artist" VALUES(4127,12421,1);
+INSERT INTO "remix_artist" VALUES(4128,10690,1);
+INSERT INTO "remix_artist" VALUES(4129,12710,1);
+INSERT INTO "remix_artist" VALUES(4130,17589,1);
+INSERT INTO "remix_artist" VALUES(4131,12352,1);
+INSERT INTO "remix_artist" VALUES(4131,16196,1);
+INSERT INTO "remix_artist" VALUES(4131,16197,1);
+INSERT INTO "remix_artist" VALUES(4131,16198,1);
+INSERT INTO "remix_artist" VALUES(4131,16199,1);
+INSERT INTO "remix_artist" VALUES(4132,16112,1);
+INSERT INTO "remix_artist" VALUES(4132,16935,1);
+INSERT INTO "remix_artist" VALUES(4133,8361,1);
+INSERT INTO "remix_artist" VALUES(4133,16615,1);
+INSERT INTO "remix_artist" VALUES(4134,13432,1);
+INSERT INTO "remix_artist" VALUES(4134,16190,1);
+INSERT INTO "remix_artist" VALUES(4135,16430,1);
+INSERT INTO "remix_artist" VALUES(4135,16844,1);
+INSERT INTO "remix_artist" VALUES(4136,4655,1);
+INSERT INTO "remix_artist" VALUES(4137,14375,1);
+INSERT INTO "remix_artist" VALUES(4137,16615,1);
+INSERT INTO "remix_artist" VALUES(4138,14375,1);
+INSERT INTO "remix_artist" VALUES(4139,9690,1);
+INSERT INTO "remix_artist" VALUES(4139,10656,1);
+INSERT INTO "remix_artist" VALUES(4139,17070,1);
+INSERT INTO "remix_artist" VALUES(4140,17594,1);
+INSERT INTO "remix_artist" VALUES(4141,13668,1);
+INSERT INTO "remix_artist" VALUES(4142,16934,1);
+INSERT INTO "remix_artist" VALUES(4143,13147,1);
+INSERT INTO "remix_artist" VALUES(4144,16430,1);
+INSERT INTO "remix_artist" VALUES(4144,17596,1);
+INSERT INTO "remix_artist" VALUES(4145,4313,1);
+INSERT INTO "remix_artist" VALUES(4146,10172,1);
+INSERT INTO "remix_artist" VALUES(4147,15562,1);
+INSERT INTO "remix_artist" VALUES(4148,13046,1);
+INSERT INTO "remix_artist" VALUES(4148,13147,1);
+INSERT INTO "remix_artist" VALUES(4149,4777,1);
+INSERT INTO "remix_artist" VALUES(4150,10683,1);
+INSERT INTO "remix_artist" VALUES(4150,12540,1);
+INSERT INTO "remix_artist" VALUES(4151,13046,1);
+INSERT INTO "remix_artist" VALUES(4151,13147,1);
+INSERT INTO "remix_artist" VALUES(4152,4787,1);
+INSERT INTO "remix_artist" VALUES(4153,17158,1);
+INSERT INTO "remix_artist" VALUES(4154,10663,1);
+INSERT INTO "remix_artist" VALUES(4154,14375,1);
+INSERT INTO "remix_artist" VALUES(4155,4595,1);
+INSERT INTO "remix_artist" VALUES(4156,4734,1);
+INSERT INTO "remix_artist" VALUES(4157,17599,1);
+INSERT INTO "remix_artist" VALUES(4158,16430,1);
+INSERT INTO "remix_artist" VALUES(4158,16615,1);
+INSERT INTO "remix_artist" VALUES(4158,17324,1);
+INSERT INTO "remix_artist" VALUES(4159,16615,1);
+INSERT INTO "remix_artist" VALUES(4160,13668,1);
+INSERT INTO "remix_artist" VALUES(4161,13921,1);
+INSERT INTO "remix_artist" VALUES(4162,17600,1);
+INSERT INTO "remix_artist" VALUES(4163,4732,1);
+INSERT INTO "remix_artist" VALUES(4163,11782,1);
+INSERT INTO "remix_artist" VALUES(4164,4280,1);
+INSERT INTO "remix_artist" VALUES(4165,5043,1);
+INSERT INTO "remix_artist" VALUES(4165,14925,1);
+INSERT INTO "remix_artist" VALUES(4166,17601,1);
+INSERT INTO "remix_artist" VALUES(4167,17920,1);
+INSERT INTO "remix_artist" VALUES(4168,13052,1);
+INSERT INTO "remix_artist" VALUES(4169,14375,1);
+INSERT INTO "remix_artist" VALUES(4170,13740,1);
+INSERT INTO "remix_artist" VALUES(4170,14461,1);
+INSERT INTO "remix_artist" VALUES(4171,14461,1);
+INSERT INTO "remix_artist" VALUES(4172,12783,1);
+INSERT INTO "remix_artist" VALUES(4173,17158,1);
+INSERT INTO "remix_artist" VALUES(4174,15461,1);
+INSERT INTO "remix_artist" VALUES(4175,15462,1);
+INSERT INTO "remix_artist" VALUES(4176,15562,1);
+INSERT INTO "remix_artist" VALUES(4177,17059,1);
+INSERT INTO "remix_artist" VALUES(4178,4655,1);
+INSERT INTO "remix_artist" VALUES(4179,10690,1);
+INSERT INTO "remix_artist" VALUES(4180,4734,1);
+INSERT INTO "remix_artist" VALUES(4181,16696,1);
+INSERT INTO "remix_artist" VALUES(4182,15461,1);
+INSERT INTO "remix_artist" VALUES(4183,17473,1);
+INSERT INTO "remix_artist" VALUES(4184,17158,1);
+INSERT INTO "remix_artist" VALUES(4185,17930,1);
+INSERT INTO "remix_artist" VALUES(4186,14064,1);
+INSERT INTO "remix_artist" VALUES(4187,17929,1);
+INSERT INTO "remix_artist" VALUES(4188,17939,1);
+INSERT INTO "remix_artist" VALUES(4189,17941,1);
+INSERT INTO "remix_artist" VALUES(4190,17942,1);
+INSERT INTO "remix_artist" VALUES(4191,17946,1);
+INSERT INTO "remix_artist" VALUES(4192,17947,1);
+INSERT INTO "remix_artist" VALUES(4193,13668,1);
+INSERT INTO "remix_artist" VALUES(4194,15612,1);
+INSERT INTO "remix_artist" VALUES(4194,17059,1);
+INSERT INTO "remix_artist" VALUES(4195,14375,1);
+INSERT INTO "remix_artist" VALUES(4196,17948,1);
+INSERT INTO "remix_artist" VALUES(4197,16430,1);
+INSERT INTO "remix_artist" VALUES(4197,17237,1);
+INSERT INTO "remix_artist" VALUES(4198,13055,1);
+INSERT INTO "remix_artist" VALUES(4198,15309,1);
+INSERT INTO "remix_artist" VALUES(4199,16615,1);
+INSERT INTO "remix_artist" VALUES(4199,17058,1);
+INSERT INTO "remix_artist" VALUES(4200,4280,1);
+INSERT INTO "remix_artist" VALUES(4201,4537,1);
+INSERT INTO "remix_artist" VALUES(4202,13046,1);
+INSERT INTO "remix_artist" VALUES(4203,14375,1);
+INSERT INTO "remix_artist" VALUES(4204,4685,1);
+INSERT INTO "remix_artist" VALUES(4204,13045,1);
+INSERT INTO "remix_artist" VALUES(4205,17976,1);
+INSERT INTO "remix_artist" VALUES(4206,17966,1);
+INSERT INTO "remix_artist" VALUES(4207,13668,1);
+INSERT INTO "remix_artist" VALUES(4208,17158,1);
+INSERT INTO "remix_artist" VALUES(4209,14375,1);
+INSERT INTO "remix_artist" VALUES(4210,13046,1);
+INSERT INTO "remix_artist" VALUES(4211,15913,1);
+INSERT INTO "remix_artist" VALUES(4211,16113,1);
+INSERT INTO "remix_artist" VALUES(4211,16119,1);
+INSERT INTO "remix_artist" VALUES(4211,16848,1);
+INSERT INTO "remix_artist" VALUES(4211,16855,1);
+INSERT INTO "remix_artist" VALUES(4211,17489,1);
+INSERT INTO "remix_artist" VALUES(4211,17490,1);
+INSERT INTO "remix_artist" VALUES(4211,17491,1);
+INSERT INTO "remix_artist" VALUES(4212,4699,1);
+INSERT INTO "remix_artist" VALUES(4213,14357,1);
+INSERT INTO "remix_artist" VALUES(4214,4543,1);
+INSERT INTO "remix_artist" VALUES(4215,17942,1);
+INSERT INTO "remix_artist" VALUES(4216,18030,1);
+INSERT INTO "remix_artist" VALUES(4217,4685,1);
+INSERT INTO "remix_artist" VALUES(4217,15473,1);
+INSERT INTO "remix_artist" VALUES(4217,17473,1);
+INSERT INTO "remix_artist" VALUES(4218,4586,1);
+INSERT INTO "remix_artist" VALUES(4219,14461,1);
+INSERT INTO "remix_artist" VALUES(4219,15473,1);
+INSERT INTO "remix_artist" VALUES(4219,15680,1);
+INSERT INTO "remix_artist" VALUES(4219,16103,1);
+INSERT INTO "remix_artist" VALUES(4219,16615,1);
+INSERT INTO "remix_artist" VALUES(4219,16844,1);
+INSERT INTO "remix_artist" VALUES(4219,16848,1);
+INSERT INTO "remix_artist" VALUES(4219,16855,1);
+INSERT INTO "remix_artist" VALUES(4219,17321,1);
+INSERT INTO "remix_artist" VALUES(4219,17322,1);
+INSERT INTO "remix_artist" VALUES(4219,17324,1);
+INSERT INTO "remix_artist" VALUES(4219,18031,1);
+INSERT INTO "remix_artist" VALUES(4219,18032,1);
+INSERT INTO "remix_artist" VALUES(4219,18033,1);
+INSERT INTO "remix_artist" VALUES(4219,18034,1);
+INSERT INTO "remix_artist" VALUES(4220,15770,1);
+INSERT INTO "remix_artist" VALUES(4221,14375,1);
+INSERT INTO "remix_artist" VALUES(4221,16615,1);
+INSERT INTO "remix_artist" VALUES(4222,8998,1);
+INSERT INTO "remix_artist" VALUES(4223,9690,1);
+INSERT INTO "remix_artist" VALUES(4223,16848,1);
+INSERT INTO "remix_artist" VALUES(4223,17485,1);
+INSERT INTO "remix_artist" VALUES(4223,17486,1);
+INSERT INTO "remix_artist" VALUES(4223,18029,1);
+INSERT INTO "remix_artist" VALUES(4224,10690,1);
+INSERT INTO "remix_artist" VALUES(4224,13046,1);
+INSERT INTO "remix_artist" VALUES(4225,6002,1);
+INSERT INTO "remix_artist" VALUES(4226,17158,1);
+INSERT INTO "remix_artist" VALUES(4227,10671,1);
+INSERT INTO "remix_artist" VALUES(4227,13668,1);
+INSERT INTO "remix_artist" VALUES(4227,15234,1);
+INSERT INTO "remix_artist" VALUES(4228,18063,1);
+INSERT INTO "remix_artist" VALUES(4229,15305,1);
+INSERT INTO "remix_artist" VALUES(4229,17473,1);
+INSERT INTO "remix_artist" VALUES(4230,4696,1);
+INSERT INTO "remix_artist" VALUES(4231,13045,1);
+INSERT INTO "remix_artist" VALUES(4232,14375,1);
+INSERT INTO "remix_artist" VALUES(4233,17977,1);
+INSERT INTO "remix_artist" VALUES(4234,4280,1);
+INSERT INTO "remix_artist" VALUES(4235,4696,1);
+INSERT INTO "remix_artist" VALUES(4236,13046,1);
+INSERT INTO "remix_artist" VALUES(4237,14357,1);
+INSERT INTO "remix_artist" VALUES(4238,12706,1);
+INSERT INTO "remix_artist" VALUES(4239,4280,1);
+INSERT INTO "remix_artist" VALUES(4240,10900,1);
+INSERT INTO "remix_artist" VALUES(4241,14357,1);
+INSERT INTO "remix_artist" VALUES(4242,13432,1);
+INSERT INTO "remix_artist" VALUES(4242,16190,1);
+INSERT INTO "remix_artist" VALUES(4242,18166,1);
+INSERT INTO "remix_artist" VALUES(4243,4655,1);
+INSERT INTO "remix_artist" VALUES(4244,4440,1);
+INSERT INTO "remix_artist" VALUES(4245,16429,1);
+INSERT INTO "remix_artist" VALUES(4246,4696,1);
+INSERT INTO "remix_artist" VALUES(4247,4685,1);
+INSERT INTO "remix_artist" VALUES(4247,14461,1);
+INSERT INTO "remix_artist" VALUES(4247,16615,1);
+INSERT INTO "remix_artist" VALUES(4248,14375,1);
+INSERT INTO "remix_artist" VALUES(4249,11963,1);
+INSERT INTO "remix_artist" VALUES(4250,4554,1);
+INSERT INTO "remix_artist" VALUES(4251,4582,1);
+INSERT INTO "remix_artist" VALUES(4252,17942,1);
+INSERT INTO "remix_artist" VALUES(4253,17467,1);
+INSERT INTO "remix_artist" VALUES(4254,11932,1);
+INSERT INTO "remix_artist" VALUES(4254,18198,1);
+INSERT INTO "remix_artist" VALUES(4255,17158,1);
+INSERT INTO "remix_artist" VALUES(4256,10866,1);
+INSERT INTO "remix_artist" VALUES(4257,4695,1);
+INSERT INTO "remix_artist" VALUES(4258,13432,1);
+INSERT INTO "remix_artist" VALUES(4258,18204,1);
+INSERT INTO "remix_artist" VALUES(4259,14375,1);
+INSERT INTO "remix_artist" VALUES(4260,14357,1);
+INSERT INTO "remix_artist" VALUES(4261,13045,1);
+INSERT INTO "remix_artist" VALUES(4262,9847,1);
+INSERT INTO "remix_artist" VALUES(4263,13667,1);
+INSERT INTO "remix_artist" VALUES(4263,18206,1);
+INSERT INTO "remix_artist" VALUES(4263,18207,1);
+INSERT INTO "remix_artist" VALUES(4264,10866,1);
+INSERT INTO "remix_artist" VALUES(4265,14375,1);
+INSERT INTO "remix_artist" VALUES(4266,17158,1);
+INSERT INTO "remix_artist" VALUES(4267,15612,1);
+INSERT INTO "remix_artist" VALUES(4268,4655,1);
+INSERT INTO "remix_artist" VALUES(4269,18300,1);
+INSERT INTO "remix_artist" VALUES(4270,4575,1);
+INSERT INTO "remix_artist" VALUES(4271,16540,1);
+INSERT INTO "remix_artist" VALUES(4272,18298,1);
+INSERT INTO "remix_artist" VALUES(4273,17467,1);
+INSERT INTO "remix_artist" VALUES(4274,4695,1);
+INSERT INTO "remix_artist" VALUES(4275,11782,1);
+INSERT INTO "remix_artist" VALUES(4276,4280,1);
+INSERT INTO "remix_artist" VALUES(4277,13667,1);
+INSERT INTO "remix_artist" VALUES(4278,16540,1);
+INSERT INTO "remix_artist" VALUES(4279,4554,1);
+INSERT INTO "remix_artist" VALUES(4280,11932,1);
+INSERT INTO "remix_artist" VALUES(4281,18301,1);
+INSERT INTO "remix_artist" VALUES(4282,15612,1);
+INSERT INTO "remix_artist" VALUES(4283,5473,1);
+INSERT INTO "remix_artist" VALUES(4283,12540,1);
+INSERT INTO "remix_artist" VALUES(4283,13740,1);
+INSERT INTO "remix_artist" VALUES(4283,14980,1);
+INSERT INTO "remix_artist" VALUES(4284,16101,1);
+INSERT INTO "remix_artist" VALUES(4284,18311,1);
+INSERT INTO "remix_artist" VALUES(4285,18312,1);
+INSERT INTO "remix_artist" VALUES(4286,16934,1);
+INSERT INTO "remix_artist" VALUES(4287,18314,1);
+INSERT INTO "remix_artist" VALUES(4288,13045,1);
+INSERT INTO "remix_artist" VALUES(4289,17929,1);
+INSERT INTO "remix_artist" VALUES(4290,17158,1);
+INSERT INTO "remix_artist" VALUES(4291,18315,1);
+INSERT INTO "remix_artist" VALUES(4292,4280,1);
+INSERT INTO "remix_artist" VALUES(4293,14369,1);
+INSERT INTO "remix_artist" VALUES(4294,15770,1);
+INSERT INTO "remix_artist" VALUES(4295,4603,1);
+INSERT INTO "remix_artist" VALUES(4296,17328,1);
+INSERT INTO "remix_artist" VALUES(4297,12541,1);
+INSERT INTO "remix_artist" VALUES(4298,4558,1);
+INSERT INTO "remix_artist" VALUES(4299,17158,1);
+INSERT INTO "remix_artist" VALUES(4300,18313,1);
+INSERT INTO "remix_artist" VALUES(4301,10172,1);
+INSERT INTO "remix_artist" VALUES(4301,18326,1);
+INSERT INTO "remix_artist" VALUES(4302,13056,1);
+INSERT INTO "remix_artist" VALUES(4302,16844,1);
+INSERT INTO "remix_artist" VALUES(4303,12064,1);
+INSERT INTO "remix_artist" VALUES(4304,13849,1);
+INSERT INTO "remix_artist" VALUES(4305,18329,1);
+INSERT INTO "remix_artist" VALUES(4306,4280,1);
+INSERT INTO "remix_artist" VALUES(4307,14495,1);
+INSERT INTO "remix_artist" VALUES(4308,18328,1);
+INSERT INTO "remix_artist" VALUES(4309,18332,1);
+INSERT INTO "remix_artist" VALUES(4310,13052,1);
+INSERT INTO "remix_artist" VALUES(4311,17483,1);
+INSERT INTO "remix_artist" VALUES(4311,17930,1);
+INSERT INTO "remix_artist" VALUES(4312,17158,1);
+INSERT INTO "remix_artist" VALUES(4313,4729,1);
+INSERT INTO "remix_artist" VALUES(4314,18298,1);
+INSERT INTO "remix_artist" VALUES(4315,4695,1);
+INSERT INTO "remix_artist" VALUES(4315,18333,1);
+INSERT INTO "remix_artist" VALUES(4316,17942,1);
+INSERT INTO "remix_artist" VALUES(4317,17059,1);
+INSERT INTO "remix_artist" VALUES(4317,18301,1);
+INSERT INTO "remix_artist" VALUES(4317,18335,1);
+INSERT INTO "remix_artist" VALUES(4318,14375,1);
+INSERT INTO "remix_artist" VALUES(4318,15851,1);
+INSERT INTO "remix_artist" VALUES(4318,16937,1);
+INSERT INTO "remix_artist" VALUES(4318,17484,1);
+INSERT INTO "remix_artist" VALUES(4318,18291,1);
+INSERT INTO "remix_artist" VALUES(4318,18292,1);
+INSERT INTO "remix_artist" VALUES(4318,18293,1);
+INSERT INTO "remix_artist" VALUES(4318,18294,1);
+INSERT INTO "remix_artist" VALUES(4318,18295,1);
+INSERT INTO "remix_artist" VALUES(4318,18296,1);
+INSERT INTO "remix_artist" VALUES(4318,18297,1);
+INSERT INTO "remix_artist" VALUES(4319,14375,1);
+INSERT INTO "remix_artist" VALUES(4319,18295,1);
+INSERT INTO "remix_artist" VALUES(4320,18313,1);
+INSERT INTO "remix_artist" VALUES(4321,17940,1);
+INSERT INTO "remix_artist" VALUES(4322,18328,1);
+INSERT INTO "remix_artist" VALUES(4323,14369,1);
+INSERT INTO "remix_artist" VALUES(4324,17929,1);
+INSERT INTO "remix_artist" VALUES(4325,17937,1);
+INSERT INTO "remix_artist" VALUES(4325,18326,1);
+INSERT INTO "remix_artist" VALUES(4326,14375,1);
+INSERT INTO "remix_artist" VALUES(4327,18340,1);
+INSERT INTO "remix_artist" VALUES(4328,18341,1);
+INSERT INTO "remix_artist" VALUES(4329,17158,1);
+INSERT INTO "remix_artist" VALUES(4330,17158,1);
+INSERT INTO "remix_artist" VALUES(4331,14461,1);
+INSERT INTO "remix_artist" VALUES(4331,15473,1);
+INSERT INTO "remix_artist" VALUES(4331,15681,1);
+INSERT INTO "remix_artist" VALUES(4331,16533,1);
+INSERT INTO "remix_artist" VALUES(4331,16615,1);
+INSERT INTO "remix_artist" VALUES(4331,16844,1);
+INSERT INTO "remix_artist" VALUES(4331,16853,1);
+INSERT INTO "remix_artist" VALUES(4331,16855,1);
+INSERT INTO "remix_artist" VALUES(4331,16856,1);
+INSERT INTO "remix_artist" VALUES(4331,17037,1);
+INSERT INTO "remix_artist" VALUES(4331,17318,1);
+INSERT INTO "remix_artist" VALUES(4331,18361,1);
+INSERT INTO "remix_artist" VALUES(4331,18362,1);
+INSERT INTO "remix_artist" VALUES(4331,18363,1);
+INSERT INTO "remix_artist" VALUES(4332,17059,1);
+INSERT INTO "remix_artist" VALUES(4332,18364,1);
+INSERT INTO "remix_artist" VALUES(4333,14375,1);
+INSERT INTO "remix_artist" VALUES(4333,16615,1);
+INSERT INTO "remix_artist" VALUES(4333,16856,1);
+INSERT INTO "remix_artist" VALUES(4334,4508,1);
+INSERT INTO "remix_artist" VALUES(4335,18360,1);
+INSERT INTO "remix_artist" VALUES(4336,18367,1);
+INSERT INTO "remix_artist" VALUES(4337,4280,1);
+INSERT INTO "remix_artist" VALUES(4338,18372,1);
+INSERT INTO "remix_artist" VALUES(4339,14375,1);
+INSERT INTO "remix_artist" VALUES(4340,14375,1);
+INSERT INTO "remix_artist" VALUES(4341,18376,1);
+INSERT INTO "remix_artist" VALUES(4342,18378,1);
+INSERT INTO "remix_artist" VALUES(4343,18379,1);
+INSERT INTO "remix_artist" VALUES(4344,16934,1);
+INSERT INTO "remix_artist" VALUES(4344,18377,1);
+INSERT INTO "remix_artist" VALUES(4345,14461,1);
+INSERT INTO "remix_artist" VALUES(4345,17063,1);
+INSERT INTO "remix_artist" VALUES(4345,17482,1);
+INSERT INTO "remix_artist" VALUES(4345,17483,1);
+INSERT INTO "remix_artist" VALUES(4346,18380,1);
+INSERT INTO "remix_artist" VALUES(4347,17158,1);
+INSERT INTO "remix_artist" VALUES(4348,14925,1);
+INSERT INTO "remix_artist" VALUES(4349,18382,1);
+INSERT INTO "remix_artist" VALUES(4350,11932,1);
+INSERT INTO "remix_artist" VALUES(4351,14375,1);
+INSERT INTO "remix_artist" VALUES(4352,13045,1);
+INSERT INTO "remix_artist" VALUES(4353,4655,1);
+INSERT INTO "remix_artist" VALUES(4354,17158,1);
+INSERT INTO "remix_artist" VALUES(4355,15921,1);
+INSERT INTO "remix_artist" VALUES(4356,17929,1);
+INSERT INTO "remix_artist" VALUES(4357,18313,1);
+INSERT INTO "remix_artist" VALUES(4358,18386,1);
+INSERT INTO "remix_artist" VALUES(4359,14461,1);
+INSERT INTO "remix_artist" VALUES(4359,17324,1);
+INSERT INTO "remix_artist" VALUES(4359,18344,1);
+INSERT INTO "remix_artist" VALUES(4360,12364,1);
+INSERT INTO "remix_artist" VALUES(4361,18387,1);
+INSERT INTO "remix_artist" VALUES(4361,18388,1);
+INSERT INTO "remix_artist" VALUES(4361,18391,1);
+INSERT INTO "remix_artist" VALUES(4362,14375,1);
+INSERT INTO "remix_artist" VALUES(4363,14375,1);
+INSERT INTO "remix_artist" VALUES(4363,16615,1);
+INSERT INTO "remix_artist" VALUES(4364,14357,1);
+INSERT INTO "remix_artist" VALUES(4365,16848,1);
+INSERT INTO "remix_artist" VALUES(4365,18392,1);
+INSERT INTO "remix_artist" VALUES(4365,18393,1);
+INSERT INTO "remix_artist" VALUES(4366,16934,1);
+INSERT INTO "remix_artist" VALUES(4366,18377,1);
+INSERT INTO "remix_artist" VALUES(4366,18394,1);
+INSERT INTO "remix_artist" VALUES(4367,4280,1);
+INSERT INTO "remix_artist" VALUES(4368,18313,1);
+INSERT INTO "remix_artist" VALUES(4369,4750,1);
+INSERT INTO "remix_artist" VALUES(4370,4440,1);
+INSERT INTO "remix_artist" VALUES(4371,12540,1);
+INSERT INTO "remix_artist" VALUES(4371,13677,1);
+INSERT INTO "remix_artist" VALUES(4371,14980,1);
+INSERT INTO "remix_artist" VALUES(4372,17158,1);
+INSERT INTO "remix_artist" VALUES(4373,18328,1);
+INSERT INTO "remix_artist" VALUES(4374,17324,1);
+INSERT INTO "remix_artist" VALUES(4374,18034,1);
+INSERT INTO "remix_artist" VALUES(4374,18402,1);
+INSERT INTO "remix_artist" VALUES(4375,18403,1);
+INSERT INTO "remix_artist" VALUES(4376,14375,1);
+INSERT INTO "remix_artist" VALUES(4377,17467,1);
+INSERT INTO "remix_artist" VALUES(4378,17158,1);
+INSERT INTO "remix_artist" VALUES(4379,14461,1);
+INSERT INTO "remix_artist" VALUES(4379,15473,1);
+INSERT INTO "remix_artist" VALUES(4379,15681,1);
+INSERT INTO "remix_artist" VALUES(4379,16533,1);
+INSERT INTO "remix_artist" VALUES(4379,16615,1);
+INSERT INTO "remix_artist" VALUES(4379,16853,1);
+INSERT INTO "remix_artist" VALUES(4379,16855,1);
+INSERT INTO "remix_artist" VALUES(4380,18408,1);
+INSERT INTO "remix_artist" VALUES(4381,18328,1);
+INSERT INTO "remix_artist" VALUES(4382,15562,1);
+INSERT INTO "remix_artist" VALUES(4383,4698,1);
+INSERT INTO "remix_artist" VALUES(4383,11498,1);
+INSERT INTO "remix_artist" VALUES(4384,13046,1);
+INSERT INTO "remix_artist" VALUES(4385,18412,1);
+INSERT INTO "remix_artist" VALUES(4386,18413,1);
+INSERT INTO "remix_artist" VALUES(4387,14337,1);
+INSERT INTO "remix_artist" VALUES(4387,17489,1);
+INSERT INTO "remix_artist" VALUES(4388,8640,1);
+INSERT INTO "remix_artist" VALUES(4388,14337,1);
+INSERT INTO "remix_artist" VALUES(4389,8640,1);
+INSERT INTO "remix_artist" VALUES(4389,14336,1);
+INSERT INTO "remix_artist" VALUES(4389,14337,1);
+INSERT INTO "remix_artist" VALUES(4390,16696,1);
+INSERT INTO "remix_artist" VALUES(4390,18579,1);
+INSERT INTO "remix_artist" VALUES(4391,4734,1);
+INSERT INTO "remix_artist" VALUES(4392,4724,1);
+INSERT INTO "remix_artist" VALUES(4392,15062,1);
+INSERT INTO "remix_artist" VALUES(4392,16103,1);
+INSERT INTO "remix_artist" VALUES(4392,18580,1);
+INSERT INTO "remix_artist" VALUES(4392,18581,1);
+INSERT INTO "remix_artist" VALUES(4393,11963,1);
+INSERT INTO "remix_artist" VALUES(4394,13147,1);
+INSERT INTO "remix_artist" VALUES(4395,17058,1);
+INSERT INTO "remix_artist" VALUES(4395,17059,1);
+INSERT INTO "remix_artist" VALUES(4396,14064,1);
+INSERT INTO "remix_artist" VALUES(4397,18589,1);
+INSERT INTO "remix_artist" VALUES(4398,4729,1);
+INSERT INTO "remix_artist" VALUES(4398,5420,1);
+INSERT INTO "remix_artist" VALUES(4398,12421,1);
+INSERT INTO "remix_artist" VALUES(4399,18328,1);
+INSERT INTO "remix_artist" VALUES(4400,4280,1);
+INSERT INTO "remix_artist" VALUES(4401,13849,1);
+INSERT INTO "remix_artist" VALUES(4402,14375,1);
+INSERT INTO "remix_artist" VALUES(4402,18590,1);
+INSERT INTO "remix_artist" VALUES(4403,13046,1);
+INSERT INTO "remix_artist" VALUES(4404,17158,1);
+INSERT INTO "remix_artist" VALUES(4405,12710,1);
+INSERT INTO "remix_artist" VALUES(4406,18341,1);
+INSERT INTO "remix_artist" VALUES(4407,16934,1);
+INSERT INTO "remix_artist" VALUES(4408,18591,1);
+INSERT INTO "remix_artist" VALUES(4409,18600,1);
+INSERT INTO "remix_artist" VALUES(4410,18607,1);
+INSERT INTO "remix_artist" VALUES(4411,18608,1);
+INSERT INTO "remix_artist" VALUES(4412,9690,1);
+INSERT INTO "remix_artist" VALUES(4412,16848,1);
+INSERT INTO "remix_artist" VALUES(4412,17485,1);
+INSERT INTO "remix_artist" VALUES(4412,17486,1);
+INSERT INTO "remix_artist" VALUES(4412,18029,1);
+INSERT INTO "remix_artist" VALUES(4413,14137,1);
+INSERT INTO "remix_artist" VALUES(4413,17240,1);
+INSERT INTO "remix_artist" VALUES(4413,18345,1);
+INSERT INTO "remix_artist" VALUES(4413,18609,1);
+INSERT INTO "remix_artist" VALUES(4413,18610,1);
+INSERT INTO "remix_artist" VALUES(4413,18611,1);
+INSERT INTO "remix_artist" VALUES(4414,18648,1);
+INSERT INTO "remix_artist" VALUES(4415,18616,1);
+INSERT INTO "remix_artist" VALUES(4416,18651,1);
+INSERT INTO "remix_artist" VALUES(4417,18652,1);
+INSERT INTO "remix_artist" VALUES(4418,16526,1);
+INSERT INTO "remix_artist" VALUES(4418,18653,1);
+INSERT INTO "remix_artist" VALUES(4418,18654,1);
+INSERT INTO "remix_artist" VALUES(4418,18655,1);
+INSERT INTO "remix_artist" VALUES(4419,17473,1);
+INSERT INTO "remix_artist" VALUES(4420,14375,1);
+INSERT INTO "remix_artist" VALUES(4421,4440,1);
+INSERT INTO "remix_artist" VALUES(4422,13147,1);
+INSERT INTO "remix_artist" VALUES(4423,18656,1);
+INSERT INTO "remix_artist" VALUES(4424,4750,1);
+INSERT INTO "remix_artist" VALUES(4425,18328,1);
+INSERT INTO "remix_artist" VALUES(4426,4432,1);
+INSERT INTO "remix_artist" VALUES(4427,17600,1);
+INSERT INTO "remix_artist" VALUES(4428,18659,1);
+INSERT INTO "remix_artist" VALUES(4429,5386,1);
+INSERT INTO "remix_artist" VALUES(4430,4668,1);
+INSERT INTO "remix_artist" VALUES(4431,18413,1);
+INSERT INTO "remix_artist" VALUES(4432,11932,1);
+INSERT INTO "remix_artist" VALUES(4433,18653,1);
+INSERT INTO "remix_artist" VALUES(4434,18652,1);
+INSERT INTO "remix_artist" VALUES(4435,11932,1);
+INSERT INTO "remix_artist" VALUES(4436,14465,1);
+INSERT INTO "remix_artist" VALUES(4436,15835,1);
+INSERT INTO "remix_artist" VALUES(4436,18300,1);
+INSERT INTO "remix_artist" VALUES(4436,18662,1);
+INSERT INTO "remix_artist" VALUES(4437,16848,1);
+INSERT INTO "remix_artist" VALUES(4437,17486,1);
+INSERT INTO "remix_artist" VALUES(4437,18029,1);
+INSERT INTO "remix_artist" VALUES(4437,18596,1);
+INSERT INTO "remix_artist" VALUES(4437,18665,1);
+INSERT INTO "remix_artist" VALUES(4437,18666,1);
+INSERT INTO "remix_artist" VALUES(4437,18667,1);
+INSERT INTO "remix_artist" VALUES(4437,18668,1);
+INSERT INTO "remix_artist" VALUES(4438,18663,1);
+INSERT INTO "remix_artist" VALUES(4438,18664,1);
+INSERT INTO "remix_artist" VALUES(4439,16615,1);
+INSERT INTO "remix_artist" VALUES(4439,17240,1);
+INSERT INTO "remix_artist" VALUES(4439,18593,1);
+INSERT INTO "remix_artist" VALUES(4439,18594,1);
+INSERT INTO "remix_artist" VALUES(4440,13667,1);
+INSERT INTO "remix_artist" VALUES(4440,14128,1);
+INSERT INTO "remix_artist" VALUES(4440,18362,1);
+INSERT INTO "remix_artist" VALUES(4440,18631,1);
+INSERT INTO "remix_artist" VALUES(4441,14064,1);
+INSERT INTO "remix_artist" VALUES(4442,13045,1);
+INSERT INTO "remix_artist" VALUES(4443,17324,1);
+INSERT INTO "remix_artist" VALUES(4443,18601,1);
+INSERT INTO "remix_artist" VALUES(4443,18621,1);
+INSERT INTO "remix_artist" VALUES(4443,18623,1);
+INSERT INTO "remix_artist" VALUES(4444,14461,1);
+INSERT INTO "remix_artist" VALUES(4444,16844,1);
+INSERT INTO "remix_artist" VALUES(4444,18298,1);
+INSERT INTO "remix_artist" VALUES(4444,18622,1);
+INSERT INTO "remix_artist" VALUES(4445,16103,1);
+INSERT INTO "remix_artist" VALUES(4445,16119,1);
+INSERT INTO "remix_artist" VALUES(4445,17324,1);
+INSERT INTO "remix_artist" VALUES(4445,18601,1);
+INSERT INTO "remix_artist" VALUES(4446,4685,1);
+INSERT INTO "remix_artist" VALUES(4446,14461,1);
+INSERT INTO "remix_artist" VALUES(4446,17241,1);
+INSERT INTO "remix_artist" VALUES(4446,17324,1);
+INSERT INTO "remix_artist" VALUES(4447,15921,1);
+INSERT INTO "remix_artist" VALUES(4447,18670,1);
+INSERT INTO "remix_artist" VALUES(4447,18671,1);
+INSERT INTO "remix_artist" VALUES(4448,4280,1);
+INSERT INTO "remix_artist" VALUES(4449,17929,1);
+INSERT INTO "remix_artist" VALUES(4450,18382,1);
+INSERT INTO "remix_artist" VALUES(4451,12364,1);
+INSERT INTO "remix_artist" VALUES(4451,13046,1);
+INSERT INTO "remix_artist" VALUES(4452,5473,1);
+INSERT INTO "remix_artist" VALUES(4452,18632,1);
+INSERT INTO "remix_artist" VALUES(4452,18634,1);
+INSERT INTO "remix_artist" VALUES(4453,17052,1);
+INSERT INTO "remix_artist" VALUES(4453,17322,1);
+INSERT INTO "remix_artist" VALUES(4453,17324,1);
+INSERT INTO "remix_artist" VALUES(4453,18594,1);
+INSERT INTO "remix_artist" VALUES(4453,18615,1);
+INSERT INTO "remix_artist" VALUES(4453,18624,1);
+INSERT INTO "remix_artist" VALUES(4453,18629,1);
+INSERT INTO "remix_artist" VALUES(4453,18630,1);
+INSERT INTO "remix_artist" VALUES(4454,4685,1);
+INSERT INTO "remix_artist" VALUES(4454,18612,1);
+INSERT INTO "remix_artist" VALUES(4455,18636,1);
+INSERT INTO "remix_artist" VALUES(4456,14357,1);
+INSERT INTO "remix_artist" VALUES(4456,16848,1);
+INSERT INTO "remix_artist" VALUES(4456,17322,1);
+INSERT INTO "remix_artist" VALUES(4456,18622,1);
+INSERT INTO "remix_artist" VALUES(4456,18624,1);
+INSERT INTO "remix_artist" VALUES(4456,18637,1);
+INSERT INTO "remix_artist" VALUES(4457,18604,1);
+INSERT INTO "remix_artist" VALUES(4457,18639,1);
+INSERT INTO "remix_artist" VALUES(4457,18640,1);
+INSERT INTO "remix_artist" VALUES(4458,13740,1);
+INSERT INTO "remix_artist" VALUES(4458,15681,1);
+INSERT INTO "remix_artist" VALUES(4458,18361,1);
+INSERT INTO "remix_artist" VALUES(4458,18362,1);
+INSERT INTO "remix_artist" VALUES(4458,18606,1);
+INSERT INTO "remix_artist" VALUES(4458,18623,1);
+INSERT INTO "remix_artist" VALUES(4459,13667,1);
+INSERT INTO "remix_artist" VALUES(4459,16119,1);
+INSERT INTO "remix_artist" VALUES(4459,16850,1);
+INSERT INTO "remix_artist" VALUES(4459,18602,1);
+INSERT INTO "remix_artist" VALUES(4459,18606,1);
+INSERT INTO "remix_artist" VALUES(4460,4280,1);
+INSERT INTO "remix_artist" VALUES(4461,14461,1);
+INSERT INTO "remix_artist" VALUES(4461,17241,1);
+INSERT INTO "remix_artist" VALUES(4462,15770,1);
+INSERT INTO "remix_artist" VALUES(4463,17947,1);
+INSERT INTO "remix_artist" VALUES(4464,18684,1);
+INSERT INTO "remix_artist" VALUES(4465,18693,1);
+INSERT INTO "remix_artist" VALUES(4466,18698,1);
+INSERT INTO "remix_artist" VALUES(4467,18372,1);
+INSERT INTO "remix_artist" VALUES(4468,14375,1);
+INSERT INTO "remix_artist" VALUES(4469,18594,1);
+INSERT INTO "remix_artist" VALUES(4469,18701,1);
+INSERT INTO "remix_artist" VALUES(4469,18702,1);
+INSERT INTO "remix_artist" VALUES(4469,18703,1);
+INSERT INTO "remix_artist" VALUES(4470,13668,1);
+INSERT INTO "remix_artist" VALUES(4471,15047,1);
+INSERT INTO "remix_artist" VALUES(4472,18704,1);
+INSERT INTO "remix_artist" VALUES(4473,12314,1);
+INSERT INTO "remix_artist" VALUES(4474,17929,1);
+INSERT INTO "remix_artist" VALUES(4475,10709,1);
+INSERT INTO "remix_artist" VALUES(4476,15557,1);
+INSERT INTO "remix_artist" VALUES(4477,4510,1);
+INSERT INTO "remix_artist" VALUES(4478,9690,1);
+INSERT INTO "remix_artist" VALUES(4478,16119,1);
+INSERT INTO "remix_artist" VALUES(4478,16615,1);
+INSERT INTO "remix_artist" VALUES(4478,16935,1);
+INSERT INTO "remix_artist" VALUES(4478,17052,1);
+INSERT INTO "remix_artist" VALUES(4479,18712,1);
+INSERT INTO "remix_artist" VALUES(4480,18705,1);
+INSERT INTO "remix_artist" VALUES(4481,13045,1);
+INSERT INTO "remix_artist" VALUES(4482,13045,1);
+INSERT INTO "remix_artist" VALUES(4482,13500,1);
+INSERT INTO "remix_artist" VALUES(4482,18742,1);
+INSERT INTO "remix_artist" VALUES(4483,18735,1);
+INSERT INTO "remix_artist" VALUES(4484,18601,1);
+INSERT INTO "remix_artist" VALUES(4485,16615,1);
+INSERT INTO "remix_artist" VALUES(4485,18653,1);
+INSERT INTO "remix_artist" VALUES(4485,18654,1);
+INSERT INTO "remix_artist" VALUES(4485,18730,1);
+INSERT INTO "remix_artist" VALUES(4485,18731,1);
+INSERT INTO "remix_artist" VALUES(4486,13045,1);
+INSERT INTO "remix_artist" VALUES(4486,13500,1);
+INSERT INTO "remix_artist" VALUES(4486,15473,1);
+INSERT INTO "remix_artist" VALUES(4486,18737,1);
+INSERT INTO "remix_artist" VALUES(4486,18738,1);
+INSERT INTO "remix_artist" VALUES(4486,18739,1);
+INSERT INTO "remix_artist" VALUES(4487,13045,1);
+INSERT INTO "remix_artist" VALUES(4487,15473,1);
+INSERT INTO "remix_artist" VALUES(4487,16119,1);
+INSERT INTO "remix_artist" VALUES(4487,18029,1);
+INSERT INTO "remix_artist" VALUES(4487,18362,1);
+INSERT INTO "remix_artist" VALUES(4487,18637,1);
+INSERT INTO "remix_artist" VALUES(4487,18698,1);
+INSERT INTO "remix_artist" VALUES(4487,18728,1);
+INSERT INTO "remix_artist" VALUES(4487,18729,1);
+INSERT INTO "remix_artist" VALUES(4488,18724,1);
+INSERT INTO "remix_artist" VALUES(4488,18725,1);
+INSERT INTO "remix_artist" VALUES(4489,16119,1);
+INSERT INTO "remix_artist" VALUES(4489,17937,1);
+INSERT INTO "remix_artist" VALUES(4489,18326,1);
+INSERT INTO "remix_artist" VALUES(4489,18362,1);
+INSERT INTO "remix_artist" VALUES(4489,18601,1);
+INSERT INTO "remix_artist" VALUES(4489,18624,1);
+INSERT INTO "remix_artist" VALUES(4489,18742,1);
+INSERT INTO "remix_artist" VALUES(4489,18749,1);
+INSERT INTO "remix_artist" VALUES(4489,18750,1);
+INSERT INTO "remix_artist" VALUES(4490,16119,1);
+INSERT INTO "remix_artist" VALUES(4490,17063,1);
+INSERT INTO "remix_artist" VALUES(4490,18300,1);
+INSERT INTO "remix_artist" VALUES(4490,18737,1);
+INSERT INTO "remix_artist" VALUES(4490,18741,1);
+INSERT INTO "remix_artist" VALUES(4491,13045,1);
+INSERT INTO "remix_artist" VALUES(4491,13500,1);
+INSERT INTO "remix_artist" VALUES(4491,16119,1);
+INSERT INTO "remix_artist" VALUES(4491,16615,1);
+INSERT INTO "remix_artist" VALUES(4492,15769,1);
+INSERT INTO "remix_artist" VALUES(4493,15305,1);
+INSERT INTO "remix_artist" VALUES(4493,18723,1);
+INSERT INTO "remix_artist" VALUES(4494,13668,1);
+INSERT INTO "remix_artist" VALUES(4495,13668,1);
+INSERT INTO "remix_artist" VALUES(4495,15234,1);
+INSERT INTO "remix_artist" VALUES(4495,16848,1);
+INSERT INTO "remix_artist" VALUES(4495,18034,1);
+INSERT INTO "remix_artist" VALUES(4496,4280,1);
+INSERT INTO "remix_artist" VALUES(4497,4458,1);
+INSERT INTO "remix_artist" VALUES(4498,4432,1);
+INSERT INTO "remix_artist" VALUES(4498,18685,1);
+INSERT INTO "remix_artist" VALUES(4499,4656,1);
+INSERT INTO "remix_artist" VALUES(4500,4482,1);
+INSERT INTO "remix_artist" VALUES(4501,10893,1);
+INSERT INTO "remix_artist" VALUES(4502,17937,1);
+INSERT INTO "remix_artist" VALUES(4502,18602,1);
+INSERT INTO "remix_artist" VALUES(4503,18736,1);
+INSERT INTO "remix_artist" VALUES(4504,18727,1);
+INSERT INTO "remix_artist" VALUES(4505,18752,1);
+INSERT INTO "remix_artist" VALUES(4506,10690,1);
+INSERT INTO "remix_artist" VALUES(4506,13046,1);
+INSERT INTO "remix_artist" VALUES(4507,11939,1);
+INSERT INTO "remix_artist" VALUES(4507,12707,1);
+INSERT INTO "remix_artist" VALUES(4508,17947,1);
+INSERT INTO "remix_artist" VALUES(4509,17947,1);
+INSERT INTO "remix_artist" VALUES(4510,12707,1);
+INSERT INTO "remix_artist" VALUES(4510,13147,1);
+INSERT INTO "remix_artist" VALUES(4511,14375,1);
+INSERT INTO "remix_artist" VALUES(4512,12540,1);
+INSERT INTO "remix_artist" VALUES(4512,16615,1);
+INSERT INTO "remix_artist" VALUES(4512,16848,1);
+INSERT INTO "remix_artist" VALUES(4512,17058,1);
+INSERT INTO "remix_artist" VALUES(4512,17059,1);
+INSERT INTO "remix_artist" VALUES(4512,17324,1);
+INSERT INTO "remix_artist" VALUES(4512,18034,1);
+INSERT INTO "remix_artist" VALUES(4512,18335,1);
+INSERT INTO "remix_artist" VALUES(4512,18362,1);
+INSERT INTO "remix_artist" VALUES(4512,18716,1);
+INSERT INTO "remix_artist" VALUES(4512,18717,1);
+INSERT INTO "remix_artist" VALUES(4512,18718,1);
+INSERT INTO "remix_artist" VALUES(4513,14375,1);
+INSERT INTO "remix_artist" VALUES(4513,16615,1);
+INSERT INTO "remix_artist" VALUES(4514,15062,1);
+INSERT INTO "remix_artist" VALUES(4514,18713,1);
+INSERT INTO "remix_artist" VALUES(4515,4575,1);
+INSERT INTO "remix_artist" VALUES(4516,13667,1);
+INSERT INTO "remix_artist" VALUES(4517,11932,1);
+INSERT INTO "remix_artist" VALUES(4517,18606,1);
+INSERT INTO "remix_artist" VALUES(4518,16119,1);
+INSERT INTO "remix_artist" VALUES(4518,17473,1);
+INSERT INTO "remix_artist" VALUES(4518,18596,1);
+INSERT INTO "remix_artist" VALUES(4518,18605,1);
+INSERT INTO "remix_artist" VALUES(4518,18638,1);
+INSERT INTO "remix_artist" VALUES(4519,18341,1);
+INSERT INTO "remix_artist" VALUES(4520,10866,1);
+INSERT INTO "remix_artist" VALUES(4521,4750,1);
+INSERT INTO "remix_artist" VALUES(4521,5473,1);
+INSERT INTO "remix_artist" VALUES(4521,13667,1);
+INSERT INTO "remix_artist" VALUES(4521,15612,1);
+INSERT INTO "remix_artist" VALUES(4521,16119,1);
+INSERT INTO "remix_artist" VALUES(4521,16848,1);
+INSERT INTO "remix_artist" VALUES(4521,18362,1);
+INSERT INTO "remix_artist" VALUES(4521,18596,1);
+INSERT INTO "remix_artist" VALUES(4521,18602,1);
+INSERT INTO "remix_artist" VALUES(4521,18615,1);
+INSERT INTO "remix_artist" VALUES(4521,18619,1);
+INSERT INTO "remix_artist" VALUES(4521,18621,1);
+INSERT INTO "remix_artist" VALUES(4522,14461,1);
+INSERT INTO "remix_artist" VALUES(4522,17241,1);
+INSERT INTO "remix_artist" VALUES(4523,13668,1);
+INSERT INTO "remix_artist" VALUES(4523,17052,1);
+INSERT INTO "remix_artist" VALUES(4523,18362,1);
+INSERT INTO "remix_artist" VALUES(4523,18594,1);
+INSERT INTO "remix_artist" VALUES(4523,18595,1);
+INSERT INTO "remix_artist" VALUES(4523,18596,1);
+INSERT INTO "remix_artist" VALUES(4523,18597,1);
+INSERT INTO "remix_artist" VALUES(4524,17158,1);
+INSERT INTO "remix_artist" VALUES(4525,13500,1);
+INSERT INTO "remix_artist" VALUES(4526,18686,1);
+INSERT INTO "remix_artist" VALUES(4527,13046,1);
+INSERT INTO "remix_artist" VALUES(4528,12710,1);
+INSERT INTO "remix_artist" VALUES(4529,14930,1);
+INSERT INTO "remix_artist" VALUES(4529,18751,1);
+INSERT INTO "remix_artist" VALUES(4530,18733,1);
+INSERT INTO "remix_artist" VALUES(4531,10893,1);
+INSERT INTO "remix_artist" VALUES(4532,17929,1);
+INSERT INTO "remix_artist" VALUES(4532,18804,1);
+INSERT INTO "remix_artist" VALUES(4533,10690,1);
+INSERT INTO "remix_artist" VALUES(4533,16119,1);
+INSERT INTO "remix_artist" VALUES(4533,16615,1);
+INSERT INTO "remix_artist" VALUES(4533,18601,1);
+INSERT INTO "remix_artist" VALUES(4534,18732,1);
+INSERT INTO "remix_artist" VALUES(4535,18313,1);
+INSERT INTO "remix_artist" VALUES(4536,18792,1);
+INSERT INTO "remix_artist" VALUES(4537,13668,1);
+INSERT INTO "remix_artist" VALUES(4538,18386,1);
+INSERT INTO "remix_artist" VALUES(4539,5473,1);
+INSERT INTO "remix_artist" VALUES(4539,13667,1);
+INSERT INTO "remix_artist" VALUES(4539,14127,1);
+INSERT INTO "remix_artist" VALUES(4539,17324,1);
+INSERT INTO "remix_artist" VALUES(4539,18204,1);
+INSERT INTO "remix_artist" VALUES(4540,18341,1);
+INSERT INTO "remix_artist" VALUES(4541,4432,1);
+INSERT INTO "remix_artist" VALUES(4542,16103,1);
+INSERT INTO "remix_artist" VALUES(4542,16119,1);
+INSERT INTO "remix_artist" VALUES(4543,4729,1);
+INSERT INTO "remix_artist" VALUES(4543,4787,1);
+INSERT INTO "remix_artist" VALUES(4543,5198,1);
+INSERT INTO "remix_artist" VALUES(4543,5473,1);
+INSERT INTO "remix_artist" VALUES(4543,18785,1);
+INSERT INTO "remix_artist" VALUES(4543,18786,1);
+INSERT INTO "remix_artist" VALUES(4544,18403,1);
+INSERT INTO "remix_artist" VALUES(4545,13046,1);
+INSERT INTO "remix_artist" VALUES(4546,16112,1);
+INSERT INTO "remix_artist" VALUES(4546,16615,1);
+INSERT INTO "remix_artist" VALUES(4546,16848,1);
+INSERT INTO "remix_artist" VALUES(4546,18596,1);
+INSERT INTO "remix_artist" VALUES(4546,18601,1);
+INSERT INTO "remix_artist" VALUES(4546,18606,1);
+INSERT INTO "remix_artist" VALUES(4547,13432,1);
+INSERT INTO "remix_artist" VALUES(4547,13667,1);
+INSERT INTO "remix_artist" VALUES(4547,16844,1);
+INSERT INTO "remix_artist" VALUES(4548,10671,1);
+INSERT INTO "remix_artist" VALUES(4548,14461,1);
+INSERT INTO "remix_artist" VALUES(4548,15681,1);
+INSERT INTO "remix_artist" VALUES(4549,14461,1);
+INSERT INTO "remix_artist" VALUES(4549,15681,1);
+INSERT INTO "remix_artist" VALUES(4549,16119,1);
+INSERT INTO "remix_artist" VALUES(4549,17241,1);
+INSERT INTO "remix_artist" VALUES(4550,4313,1);
+INSERT INTO "remix_artist" VALUES(4551,14495,1);
+INSERT INTO "remix_artist" VALUES(4552,18328,1);
+INSERT INTO "remix_artist" VALUES(4553,18623,1);
+INSERT INTO "remix_artist" VALUES(4553,18812,1);
+INSERT INTO "remix_artist" VALUES(4554,4750,1);
+INSERT INTO "remix_artist" VALUES(4554,11498,1);
+INSERT INTO "remix_artist" VALUES(4554,17937,1);
+INSERT INTO "remix_artist" VALUES(4555,17929,1);
+INSERT INTO "remix_artist" VALUES(4556,18403,1);
+INSERT INTO "remix_artist" VALUES(4557,14375,1);
+INSERT INTO "remix_artist" VALUES(4558,13667,1);
+INSERT INTO "remix_artist" VALUES(4559,5043,1);
+INSERT INTO "remix_artist" VALUES(4559,5178,1);
+INSERT INTO "remix_artist" VALUES(4560,4724,1);
+INSERT INTO "remix_artist" VALUES(4560,5036,1);
+INSERT INTO "remix_artist" VALUES(4560,14463,1);
+INSERT INTO "remix_artist" VALUES(4560,16936,1);
+INSERT INTO "remix_artist" VALUES(4560,17038,1);
+INSERT INTO "remix_artist" VALUES(4560,17317,1);
+INSERT INTO "remix_artist" VALUES(4560,17586,1);
+INSERT INTO "remix_artist" VALUES(4560,18389,1);
+INSERT INTO "remix_artist" VALUES(4560,18814,1);
+INSERT INTO "remix_artist" VALUES(4560,18815,1);
+INSERT INTO "remix_artist" VALUES(4561,10690,1);
+INSERT INTO "remix_artist" VALUES(4562,17158,1);
+INSERT INTO "remix_artist" VALUES(4563,11932,1);
+INSERT INTO "remix_artist" VALUES(4564,13667,1);
+INSERT INTO "remix_artist" VALUES(4564,18606,1);
+INSERT INTO "remix_artist" VALUES(4565,13667,1);
+INSERT INTO "remix_artist" VALUES(4565,18606,1);
+INSERT INTO "remix_artist" VALUES(4566,12314,1);
+INSERT INTO "remix_artist" VALUES(4567,13056,1);
+INSERT INTO "remix_artist" VALUES(4568,18794,1);
+INSERT INTO "remix_artist" VALUES(4568,18795,1);
+INSERT INTO "remix_artist" VALUES(4569,10690,1);
+INSERT INTO "remix_artist" VALUES(4569,18734,1);
+INSERT INTO "remix_artist" VALUES(4570,13147,1);
+INSERT INTO "remix_artist" VALUES(4571,18313,1);
+INSERT INTO "remix_artist" VALUES(4572,14375,1);
+INSERT INTO "remix_artist" VALUES(4572,16615,1);
+INSERT INTO "remix_artist" VALUES(4572,18714,1);
+INSERT INTO "remix_artist" VALUES(4572,18715,1);
+INSERT INTO "remix_artist" VALUES(4573,5269,1);
+INSERT INTO "remix_artist" VALUES(4573,14461,1);
+INSERT INTO "remix_artist" VALUES(4573,16533,1);
+INSERT INTO "remix_artist" VALUES(4573,16615,1);
+INSERT INTO "remix_artist" VALUES(4573,16844,1);
+INSERT INTO "remix_artist" VALUES(4573,17473,1);
+INSERT INTO "remix_artist" VALUES(4574,10893,1);
+INSERT INTO "remix_artist" VALUES(4575,13667,1);
+INSERT INTO "remix_artist" VALUES(4576,17600,1);
+INSERT INTO "remix_artist" VALUES(4577,18732,1);
+INSERT INTO "remix_artist" VALUES(4578,17158,1);
+INSERT INTO "remix_artist" VALUES(4579,18602,1);
+INSERT INTO "remix_artist" VALUES(4580,4685,1);
+INSERT INTO "remix_artist" VALUES(4580,5043,1);
+INSERT INTO "remix_artist" VALUES(4581,13052,1);
+INSERT INTO "remix_artist" VALUES(4582,17929,1);
+INSERT INTO "remix_artist" VALUES(4583,14375,1);
+INSERT INTO "remix_artist" VALUES(4583,16615,1);
+INSERT INTO "remix_artist" VALUES(4583,16937,1);
+INSERT INTO "remix_artist" VALUES(4583,18590,1);
+INSERT INTO "remix_artist" VALUES(4584,4752,1);
+INSERT INTO "remix_artist" VALUES(4585,10683,1);
+INSERT INTO "remix_artist" VALUES(4585,13667,1);
+INSERT INTO "remix_artist" VALUES(4585,14127,1);
+INSERT INTO "remix_artist" VALUES(4586,16101,1);
+INSERT INTO "remix_artist" VALUES(4587,4666,1);
+INSERT INTO "remix_artist" VALUES(4587,18660,1);
+INSERT INTO "remix_artist" VALUES(4588,10690,1);
+INSERT INTO "remix_artist" VALUES(4589,16848,1);
+INSERT INTO "remix_artist" VALUES(4589,17052,1);
+INSERT INTO "remix_artist" VALUES(4589,17324,1);
+INSERT INTO "remix_artist" VALUES(4589,18392,1);
+INSERT INTO "remix_artist" VALUES(4589,18631,1);
+INSERT INTO "remix_artist" VALUES(4589,18718,1);
+INSERT INTO "remix_artist" VALUES(4589,18744,1);
+INSERT INTO "remix_artist" VALUES(4590,18386,1);
+INSERT INTO "remix_artist" VALUES(4591,16119,1);
+INSERT INTO "remix_artist" VALUES(4592,17467,1);
+INSERT INTO "remix_artist" VALUES(4593,15769,1);
+INSERT INTO "remix_artist" VALUES(4594,14375,1);
+INSERT INTO "remix_artist" VALUES(4594,16615,1);
+INSERT INTO "remix_artist" VALUES(4594,16937,1);
+INSERT INTO "remix_artist" VALUES(4594,18590,1);
+INSERT INTO "remix_artist" VALUES(4595,13667,1);
+INSERT INTO "remix_artist" VALUES(4595,18606,1);
+INSERT INTO "remix_artist" VALUES(4596,18602,1);
+INSERT INTO "remix_artist" VALUES(4597,18817,1);
+INSERT INTO "remix_artist" VALUES(4598,5036,1);
+INSERT INTO "remix_artist" VALUES(4598,5269,1);
+INSERT INTO "remix_artist" VALUES(4598,15203,1);
+INSERT INTO "remix_artist" VALUES(4598,15473,1);
+INSERT INTO "remix_artist" VALUES(4598,16533,1);
+INSERT INTO "remix_artist" VALUES(4598,16615,1);
+INSERT INTO "remix_artist" VALUES(4598,18756,1);
+INSERT INTO "remix_artist" VALUES(4598,18757,1);
+INSERT INTO "remix_artist" VALUES(4599,4280,1);
+INSERT INTO "remix_artist" VALUES(4600,5043,1);
+INSERT INTO "remix_artist" VALUES(4601,13667,1);
+INSERT INTO "remix_artist" VALUES(4602,18653,1);
+INSERT INTO "remix_artist" VALUES(4602,18654,1);
+INSERT INTO "remix_artist" VALUES(4602,18655,1);
+INSERT INTO "remix_artist" VALUES(4603,4750,1);
+INSERT INTO "remix_artist" VALUES(4603,17486,1);
+INSERT INTO "remix_artist" VALUES(4604,12710,1);
+INSERT INTO "remix_artist" VALUES(4605,18386,1);
+INSERT INTO "remix_artist" VALUES(4606,15201,1);
+INSERT INTO "remix_artist" VALUES(4606,16119,1);
+INSERT INTO "remix_artist" VALUES(4606,18706,1);
+INSERT INTO "remix_artist" VALUES(4606,18707,1);
+INSERT INTO "remix_artist" VALUES(4606,18708,1);
+INSERT INTO "remix_artist" VALUES(4607,17600,1);
+INSERT INTO "remix_artist" VALUES(4608,18403,1);
+INSERT INTO "remix_artist" VALUES(4609,14375,1);
+INSERT INTO "remix_artist" VALUES(4610,9690,1);
+INSERT INTO "remix_artist" VALUES(4611,13667,1);
+INSERT INTO "remix_artist" VALUES(4612,18601,1);
+INSERT INTO "remix_artist" VALUES(4612,18708,1);
+INSERT INTO "remix_artist" VALUES(4612,18739,1);
+INSERT INTO "remix_artist" VALUES(4613,17038,1);
+INSERT INTO "remix_artist" VALUES(4613,18362,1);
+INSERT INTO "remix_artist" VALUES(4613,18653,1);
+INSERT INTO "remix_artist" VALUES(4613,18805,1);
+INSERT INTO "remix_artist" VALUES(4614,18608,1);
+INSERT INTO "remix_artist" VALUES(4615,5473,1);
+INSERT INTO "remix_artist" VALUES(4616,12314,1);
+INSERT INTO "remix_artist" VALUES(4617,13147,1);
+INSERT INTO "remix_artist" VALUES(4618,18793,1);
+INSERT INTO "remix_artist" VALUES(4619,18806,1);
+INSERT INTO "remix_artist" VALUES(4620,13500,1);
+INSERT INTO "remix_artist" VALUES(4620,18724,1);
+INSERT INTO "remix_artist" VALUES(4621,18824,1);
+INSERT INTO "remix_artist" VALUES(4622,18403,1);
+INSERT INTO "remix_artist" VALUES(4623,17929,1);
+INSERT INTO "remix_artist" VALUES(4624,13045,1);
+INSERT INTO "remix_artist" VALUES(4625,18823,1);
+INSERT INTO "remix_artist" VALUES(4626,11494,1);
+INSERT INTO "remix_artist" VALUES(4627,13667,1);
+INSERT INTO "remix_artist" VALUES(4627,17058,1);
+INSERT INTO "remix_artist" VALUES(4627,17324,1);
+INSERT INTO "remix_artist" VALUES(4627,18702,1);
+INSERT INTO "remix_artist" VALUES(4628,16951,1);
+INSERT INTO "remix_artist" VALUES(4629,12314,1);
+INSERT INTO "remix_artist" VALUES(4629,12315,1);
+INSERT INTO "remix_artist" VALUES(4630,13500,1);
+INSERT INTO "remix_artist" VALUES(4630,18724,1);
+INSERT INTO "remix_artist" VALUES(4631,14375,1);
+INSERT INTO "remix_artist" VALUES(4632,5473,1);
+INSERT INTO "remix_artist" VALUES(4632,18698,1);
+INSERT INTO "remix_artist" VALUES(4632,18706,1);
+INSERT INTO "remix_artist" VALUES(4632,18724,1);
+INSERT INTO "remix_artist" VALUES(4632,18819,1);
+INSERT INTO "remix_artist" VALUES(4633,5043,1);
+INSERT INTO "remix_artist" VALUES(4634,17929,1);
+INSERT INTO "remix_artist" VALUES(4635,16101,1);
+INSERT INTO "remix_artist" VALUES(4636,10690,1);
+INSERT INTO "remix_artist" VALUES(4636,16615,1);
+INSERT INTO "remix_artist" VALUES(4636,17241,1);
+INSERT INTO "remix_artist" VALUES(4637,18403,1);
+INSERT INTO "remix_artist" VALUES(4638,13667,1);
+INSERT INTO "remix_artist" VALUES(4639,15770,1);
+INSERT INTO "remix_artist" VALUES(4640,13500,1);
+INSERT INTO "remix_artist" VALUES(4640,18633,1);
+INSERT INTO "remix_artist" VALUES(4641,5473,1);
+INSERT INTO "remix_artist" VALUES(4641,14461,1);
+INSERT INTO "remix_artist" VALUES(4641,16848,1);
+INSERT INTO "remix_artist" VALUES(4641,17241,1);
+INSERT INTO "remix_artist" VALUES(4641,18034,1);
+INSERT INTO "remix_artist" VALUES(4641,18642,1);
+INSERT INTO "remix_artist" VALUES(4642,10690,1);
+INSERT INTO "remix_artist" VALUES(4642,13667,1);
+INSERT INTO "remix_artist" VALUES(4642,16119,1);
+INSERT INTO "remix_artist" VALUES(4642,16615,1);
+INSERT INTO "remix_artist" VALUES(4642,18632,1);
+INSERT INTO "remix_artist" VALUES(4643,18832,1);
+INSERT INTO "remix_artist" VALUES(4644,13667,1);
+INSERT INTO "remix_artist" VALUES(4644,18606,1);
+INSERT INTO "remix_artist" VALUES(4645,18403,1);
+INSERT INTO "remix_artist" VALUES(4646,4750,1);
+INSERT INTO "remix_artist" VALUES(4646,10690,1);
+INSERT INTO "remix_artist" VALUES(4646,18712,1);
+INSERT INTO "remix_artist" VALUES(4647,4750,1);
+INSERT INTO "remix_artist" VALUES(4648,10690,1);
+INSERT INTO "remix_artist" VALUES(4649,13667,1);
+INSERT INTO "remix_artist" VALUES(4649,18818,1);
+INSERT INTO "remix_artist" VALUES(4650,18604,1);
+INSERT INTO "remix_artist" VALUES(4650,18821,1);
+INSERT INTO "remix_artist" VALUES(4651,17929,1);
+INSERT INTO "remix_artist" VALUES(4652,16101,1);
+INSERT INTO "remix_artist" VALUES(4653,5409,1);
+INSERT INTO "remix_artist" VALUES(4653,18601,1);
+INSERT INTO "remix_artist" VALUES(4653,18724,1);
+INSERT INTO "remix_artist" VALUES(4653,18828,1);
+INSERT INTO "remix_artist" VALUES(4654,15062,1);
+INSERT INTO "remix_artist" VALUES(4655,18403,1);
+INSERT INTO "remix_artist" VALUES(4656,4280,1);
+INSERT INTO "remix_artist" VALUES(4657,13500,1);
+INSERT INTO "remix_artist" VALUES(4657,18633,1);
+INSERT INTO "remix_artist" VALUES(4658,13147,1);
+INSERT INTO "remix_artist" VALUES(4659,13667,1);
+INSERT INTO "remix_artist" VALUES(4659,14127,1);
+INSERT INTO "remix_artist" VALUES(4659,18802,1);
+INSERT INTO "remix_artist" VALUES(4659,18803,1);
+INSERT INTO "remix_artist" VALUES(4660,18816,1);
+INSERT INTO "remix_artist" VALUES(4661,17929,1);
+INSERT INTO "remix_artist" VALUES(4662,17929,1);
+INSERT INTO "remix_artist" VALUES(4663,18724,1);
+INSERT INTO "remix_artist" VALUES(4664,18752,1);
+INSERT INTO "remix_artist" VALUES(4665,10690,1);
+INSERT INTO "remix_artist" VALUES(4665,18601,1);
+INSERT INTO "remix_artist" VALUES(4666,18653,1);
+INSERT INTO "remix_artist" VALUES(4667,4432,1);
+INSERT INTO "remix_artist" VALUES(4667,13667,1);
+INSERT INTO "remix_artist" VALUES(4667,18685,1);
+INSERT INTO "remix_artist" VALUES(4667,18812,1);
+INSERT INTO "remix_artist" VALUES(4668,13668,1);
+INSERT INTO "remix_artist" VALUES(4668,15234,1);
+INSERT INTO "remix_artist" VALUES(4668,18034,1);
+INSERT INTO "remix_artist" VALUES(4668,18362,1);
+INSERT INTO "remix_artist" VALUES(4669,13667,1);
+INSERT INTO "remix_artist" VALUES(4669,14128,1);
+INSERT INTO "remix_artist" VALUES(4670,18732,1);
+INSERT INTO "remix_artist" VALUES(4671,9690,1);
+INSERT INTO "remix_artist" VALUES(4672,17937,1);
+INSERT INTO "remix_artist" VALUES(4672,18831,1);
+INSERT INTO "remix_artist" VALUES(4673,17158,1);
+INSERT INTO "remix_artist" VALUES(4674,17324,1);
+INSERT INTO "remix_artist" VALUES(4675,17929,1);
+INSERT INTO "remix_artist" VALUES(4675,18804,1);
+INSERT INTO "remix_artist" VALUES(4676,10690,1);
+INSERT INTO "remix_artist" VALUES(4677,17929,1);
+INSERT INTO "remix_artist" VALUES(4678,14328,1);
+INSERT INTO "remix_artist" VALUES(4679,15201,1);
+INSERT INTO "remix_artist" VALUES(4679,16119,1);
+INSERT INTO "remix_artist" VALUES(4680,13669,1);
+INSERT INTO "remix_artist" VALUES(4681,4280,1);
+INSERT INTO "remix_artist" VALUES(4682,11494,1);
+INSERT INTO "remix_artist" VALUES(4683,18839,1);
+INSERT INTO "remix_artist" VALUES(4684,18632,1);
+INSERT INTO "remix_artist" VALUES(4685,16101,1);
+INSERT INTO "remix_artist" VALUES(4686,18810,1);
+INSERT INTO "remix_artist" VALUES(4687,18844,1);
+INSERT INTO "remix_artist" VALUES(4688,17929,1);
+INSERT INTO "remix_artist" VALUES(4689,17158,1);
+INSERT INTO "remix_artist" VALUES(4690,18632,1);
+INSERT INTO "remix_artist" VALUES(4690,18705,1);
+INSERT INTO "remix_artist" VALUES(4690,18712,1);
+INSERT INTO "remix_artist" VALUES(4690,18847,1);
+INSERT INTO "remix_artist" VALUES(4691,5655,1);
+INSERT INTO "remix_artist" VALUES(4691,10690,1);
+INSERT INTO "remix_artist" VALUES(4692,10690,1);
+INSERT INTO "remix_artist" VALUES(4692,18840,1);
+INSERT INTO "remix_artist" VALUES(4693,5473,1);
+INSERT INTO "remix_artist" VALUES(4693,17160,1);
+INSERT INTO "remix_artist" VALUES(4694,13668,1);
+INSERT INTO "remix_artist" VALUES(4695,4432,1);
+INSERT INTO "remix_artist" VALUES(4695,10690,1);
+INSERT INTO "remix_artist" VALUES(4695,13667,1);
+INSERT INTO "remix_artist" VALUES(4695,16119,1);
+INSERT INTO "remix_artist" VALUES(4695,17937,1);
+INSERT INTO "remix_artist" VALUES(4695,18736,1);
+INSERT INTO "remix_artist" VALUES(4695,18845,1);
+INSERT INTO "remix_artist" VALUES(4695,18846,1);
+INSERT INTO "remix_artist" VALUES(4696,13045,1);
+INSERT INTO "remix_artist" VALUES(4696,13500,1);
+INSERT INTO "remix_artist" VALUES(4696,16119,1);
+INSERT INTO "remix_artist" VALUES(4696,17063,1);
+INSERT INTO "remix_artist" VALUES(4696,18839,1);
+INSERT INTO "remix_artist" VALUES(4697,17929,1);
+INSERT INTO "remix_artist" VALUES(4698,10690,1);
+INSERT INTO "remix_artist" VALUES(4698,13667,1);
+INSERT INTO "remix_artist" VALUES(4698,18606,1);
+INSERT INTO "remix_artist" VALUES(4699,18653,1);
+INSERT INTO "remix_artist" VALUES(4699,18654,1);
+INSERT INTO "remix_artist" VALUES(4699,18742,1);
+INSERT INTO "remix_artist" VALUES(4700,18653,1);
+INSERT INTO "remix_artist" VALUES(4700,18654,1);
+INSERT INTO "remix_artist" VALUES(4700,18852,1);
+INSERT INTO "remix_artist" VALUES(4701,18857,1);
+INSERT INTO "remix_artist" VALUES(4702,9690,1);
+INSERT INTO "remix_artist" VALUES(4703,10690,1);
+INSERT INTO "remix_artist" VALUES(4703,18840,1);
+INSERT INTO "remix_artist" VALUES(4704,13500,1);
+INSERT INTO "remix_artist" VALUES(4704,17980,1);
+INSERT INTO "remix_artist" VALUES(4704,18839,1);
+INSERT INTO "remix_artist" VALUES(4705,18329,1);
+INSERT INTO "remix_artist" VALUES(4706,13500,1);
+INSERT INTO "remix_artist" VALUES(4706,18601,1);
+INSERT INTO "remix_artist" VALUES(4706,18724,1);
+INSERT INTO "remix_artist" VALUES(4707,17929,1);
+INSERT INTO "remix_artist" VALUES(4708,16844,1);
+INSERT INTO "remix_artist" VALUES(4708,18643,1);
+INSERT INTO "remix_artist" VALUES(4709,14375,1);
+INSERT INTO "remix_artist" VALUES(4709,16615,1);
+INSERT INTO "remix_artist" VALUES(4709,16937,1);
+INSERT INTO "remix_artist" VALUES(4709,18590,1);
+INSERT INTO "remix_artist" VALUES(4710,18752,1);
+INSERT INTO "remix_artist" VALUES(4711,14461,1);
+INSERT INTO "remix_artist" VALUES(4712,4695,1);
+INSERT INTO "remix_artist" VALUES(4713,12364,1);
+INSERT INTO "remix_artist" VALUES(4713,13046,1);
+INSERT INTO "remix_artist" VALUES(4714,10690,1);
+INSERT INTO "remix_artist" VALUES(4714,13667,1);
+INSERT INTO "remix_artist" VALUES(4714,16119,1);
+INSERT INTO "remix_artist" VALUES(4715,13500,1);
+INSERT INTO "remix_artist" VALUES(4715,18601,1);
+INSERT INTO "remix_artist" VALUES(4715,18724,1);
+INSERT INTO "remix_artist" VALUES(4716,18724,1);
+INSERT INTO "remix_artist" VALUES(4716,18725,1);
+INSERT INTO "remix_artist" VALUES(4717,5043,1);
+INSERT INTO "remix_artist" VALUES(4717,18855,1);
+INSERT INTO "remix_artist" VALUES(4717,18856,1);
+INSERT INTO "remix_artist" VALUES(4718,16119,1);
+INSERT INTO "remix_artist" VALUES(4718,17317,1);
+INSERT INTO "remix_artist" VALUES(4718,17489,1);
+INSERT INTO "remix_artist" VALUES(4718,18859,1);
+INSERT INTO "remix_artist" VALUES(4719,14375,1);
+INSERT INTO "remix_artist" VALUES(4719,16615,1);
+INSERT INTO "remix_artist" VALUES(4719,16937,1);
+INSERT INTO "remix_artist" VALUES(4719,18590,1);
+INSERT INTO "remix_artist" VALUES(4720,4313,1);
+INSERT INTO "remix_artist" VALUES(4721,4432,1);
+INSERT INTO "remix_artist" VALUES(4721,10690,1);
+INSERT INTO "remix_artist" VALUES(4721,13667,1);
+INSERT INTO "remix_artist" VALUES(4721,17937,1);
+INSERT INTO "remix_artist" VALUES(4721,18736,1);
+INSERT INTO "remix_artist" VALUES(4722,16844,1);
+INSERT INTO "remix_artist" VALUES(4722,17937,1);
+INSERT INTO "remix_artist" VALUES(4723,16848,1);
+INSERT INTO "remix_artist" VALUES(4723,17324,1);
+INSERT INTO "remix_artist" VALUES(4723,18388,1);
+INSERT INTO "remix_artist" VALUES(4723,18621,1);
+INSERT INTO "remix_artist" VALUES(4723,18624,1);
+INSERT INTO "remix_artist" VALUES(4723,18631,1);
+INSERT INTO "remix_artist" VALUES(4723,18667,1);
+INSERT INTO "remix_artist" VALUES(4723,18718,1);
+INSERT INTO "remix_artist" VALUES(4723,18862,1);
+INSERT INTO "remix_artist" VALUES(4723,18863,1);
+INSERT INTO "remix_artist" VALUES(4723,18864,1);
+INSERT INTO "remix_artist" VALUES(4723,18865,1);
+INSERT INTO "remix_artist" VALUES(4723,18866,1);
+INSERT INTO "remix_artist" VALUES(4724,17486,1);
+INSERT INTO "remix_artist" VALUES(4724,18387,1);
+INSERT INTO "remix_artist" VALUES(4724,18710,1);
+INSERT INTO "remix_artist" VALUES(4724,18739,1);
+INSERT INTO "remix_artist" VALUES(4724,18886,1);
+INSERT INTO "remix_artist" VALUES(4724,18889,1);
+INSERT INTO "remix_artist" VALUES(4725,4432,1);
+INSERT INTO "remix_artist" VALUES(4725,4455,1);
+INSERT INTO "remix_artist" VALUES(4725,13667,1);
+INSERT INTO "remix_artist" VALUES(4725,18711,1);
+INSERT INTO "remix_artist" VALUES(4726,16119,1);
+INSERT INTO "remix_artist" VALUES(4726,16615,1);
+INSERT INTO "remix_artist" VALUES(4726,18590,1);
+INSERT INTO "remix_artist" VALUES(4726,18863,1);
+INSERT INTO "remix_artist" VALUES(4726,18868,1);
+INSERT INTO "remix_artist" VALUES(4727,15199,1);
+INSERT INTO "remix_artist" VALUES(4727,18858,1);
+INSERT INTO "remix_artist" VALUES(4728,14357,1);
+INSERT INTO "remix_artist" VALUES(4729,4750,1);
+INSERT INTO "remix_artist" VALUES(4729,16119,1);
+INSERT INTO "remix_artist" VALUES(4729,16615,1);
+INSERT INTO "remix_artist" VALUES(4729,16848,1);
+INSERT INTO "remix_artist" VALUES(4729,17322,1);
+INSERT INTO "remix_artist" VALUES(4730,5473,1);
+INSERT INTO "remix_artist" VALUES(4730,13667,1);
+INSERT INTO "remix_artist" VALUES(4730,16848,1);
+INSERT INTO "remix_artist" VALUES(4731,10690,1);
+INSERT INTO "remix_artist" VALUES(4731,13500,1);
+INSERT INTO "remix_artist" VALUES(4732,10690,1);
+INSERT INTO "remix_artist" VALUES(4732,13667,1);
+INSERT INTO "remix_artist" VALUES(4732,16103,1);
+INSERT INTO "remix_artist" VALUES(4732,16119,1);
+INSERT INTO "remix_artist" VALUES(4732,16615,1);
+INSERT INTO "remix_artist" VALUES(4732,16848,1);
+INSERT INTO "remix_artist" VALUES(4732,17324,1);
+INSERT INTO "remix_artist" VALUES(4732,18590,1);
+INSERT INTO "remix_artist" VALUES(4732,18622,1);
+INSERT INTO "remix_artist" VALUES(4732,18662,1);
+INSERT INTO "remix_artist" VALUES(4732,18734,1);
+INSERT INTO "remix_artist" VALUES(4732,18737,1);
+INSERT INTO "remix_artist" VALUES(4732,18863,1);
+INSERT INTO "remix_artist" VALUES(4732,18868,1);
+INSERT INTO "remix_artist" VALUES(4733,5386,1);
+INSERT INTO "remix_artist" VALUES(4734,14461,1);
+INSERT INTO "remix_artist" VALUES(4735,4432,1);
+INSERT INTO "remix_artist" VALUES(4735,10690,1);
+INSERT INTO "remix_artist" VALUES(4735,13667,1);
+INSERT INTO "remix_artist" VALUES(4735,16119,1);
+INSERT INTO "remix_artist" VALUES(4735,17937,1);
+INSERT INTO "remix_artist" VALUES(4735,18736,1);
+INSERT INTO "remix_artist" VALUES(4735,18845,1);
+INSERT INTO "remix_artist" VALUES(4736,17158,1);
+INSERT INTO "remix_artist" VALUES(4737,18860,1);
+INSERT INTO "remix_artist" VALUES(4738,13667,1);
+INSERT INTO "remix_artist" VALUES(4738,16615,1);
+INSERT INTO "remix_artist" VALUES(4738,16848,1);
+INSERT INTO "remix_artist" VALUES(4738,18606,1);
+INSERT INTO "remix_artist" VALUES(4738,18622,1);
+INSERT INTO "remix_artist" VALUES(4739,4432,1);
+INSERT INTO "remix_artist" VALUES(4739,13667,1);
+INSERT INTO "remix_artist" VALUES(4739,18685,1);
+INSERT INTO "remix_artist" VALUES(4740,4695,1);
+INSERT INTO "remix_artist" VALUES(4741,10690,1);
+INSERT INTO "remix_artist" VALUES(4741,13667,1);
+INSERT INTO "remix_artist" VALUES(4741,18711,1);
+INSERT INTO "remix_artist" VALUES(4742,18602,1);
+INSERT INTO "remix_artist" VALUES(4743,18653,1);
+INSERT INTO "remix_artist" VALUES(4743,18654,1);
+INSERT INTO "remix_artist" VALUES(4743,18829,1);
+INSERT INTO "remix_artist" VALUES(4743,18830,1);
+INSERT INTO "remix_artist" VALUES(4744,5182,1);
+INSERT INTO "remix_artist" VALUES(4744,10690,1);
+INSERT INTO "remix_artist" VALUES(4744,16119,1);
+INSERT INTO "remix_artist" VALUES(4744,17324,1);
+INSERT INTO "remix_artist" VALUES(4745,17324,1);
+INSERT INTO "remix_artist" VALUES(4745,18890,1);
+INSERT INTO "remix_artist" VALUES(4746,17937,1);
+INSERT INTO "remix_artist" VALUES(4746,18606,1);
+INSERT INTO "remix_artist" VALUES(4747,4605,1);
+INSERT INTO "remix_artist" VALUES(4747,10690,1);
+INSERT INTO "remix_artist" VALUES(4747,16119,1);
+INSERT INTO "remix_artist" VALUES(4747,17058,1);
+INSERT INTO "remix_artist" VALUES(4747,17324,1);
+INSERT INTO "remix_artist" VALUES(4747,17937,1);
+INSERT INTO "remix_artist" VALUES(4747,18712,1);
+INSERT INTO "remix_artist" VALUES(4748,10690,1);
+INSERT INTO "remix_artist" VALUES(4748,13046,1);
+INSERT INTO "remix_artist" VALUES(4749,13045,1);
+INSERT INTO "remix_artist" VALUES(4749,13500,1);
+INSERT INTO "remix_artist" VALUES(4749,18633,1);
+INSERT INTO "remix_artist" VALUES(4750,10690,1);
+INSERT INTO "remix_artist" VALUES(4750,13667,1);
+INSERT INTO "remix_artist" VALUES(4751,18698,1);
+INSERT INTO "remix_artist" VALUES(4751,18724,1);
+INSERT INTO "remix_artist" VALUES(4751,18828,1);
+INSERT INTO "remix_artist" VALUES(4752,4432,1);
+INSERT INTO "remix_artist" VALUES(4752,16848,1);
+INSERT INTO "remix_artist" VALUES(4752,17324,1);
+INSERT INTO "remix_artist" VALUES(4752,17486,1);
+INSERT INTO "remix_artist" VALUES(4752,18594,1);
+INSERT INTO "remix_artist" VALUES(4752,18869,1);
+INSERT INTO "remix_artist" VALUES(4753,13052,1);
+INSERT INTO "remix_artist" VALUES(4754,18600,1);
+INSERT INTO "remix_artist" VALUES(4755,18724,1);
+INSERT INTO "remix_artist" VALUES(4755,18730,1);
+INSERT INTO "remix_artist" VALUES(4755,18738,1);
+INSERT INTO "remix_artist" VALUES(4756,11494,1);
+INSERT INTO "remix_artist" VALUES(4757,18736,1);
+INSERT INTO "remix_artist" VALUES(4758,5473,1);
+INSERT INTO "remix_artist" VALUES(4758,18705,1);
+INSERT INTO "remix_artist" VALUES(4758,18712,1);
+INSERT INTO "remix_artist" VALUES(4758,18847,1);
+INSERT INTO "remix_artist" VALUES(4759,18832,1);
+INSERT INTO "remix_artist" VALUES(4760,18895,1);
+INSERT INTO "remix_artist" VALUES(4761,4732,1);
+INSERT INTO "remix_artist" VALUES(4762,13147,1);
+INSERT INTO "remix_artist" VALUES(4763,18724,1);
+INSERT INTO "remix_artist" VALUES(4764,18896,1);
+INSERT INTO "remix_artist" VALUES(4765,18659,1);
+INSERT INTO "remix_artist" VALUES(4766,13667,1);
+INSERT INTO "remix_artist" VALUES(4766,18710,1);
+INSERT INTO "remix_artist" VALUES(4767,10690,1);
+INSERT INTO "remix_artist" VALUES(4767,13046,1);
+INSERT INTO "remix_artist" VALUES(4768,18898,1);
+INSERT INTO "remix_artist" VALUES(4769,17158,1);
+INSERT INTO "remix_artist" VALUES(4770,18653,1);
+INSERT INTO "remix_artist" VALUES(4770,18654,1);
+INSERT INTO "remix_artist" VALUES(4770,18836,1);
+INSERT INTO "remix_artist" VALUES(4770,18837,1);
+INSERT INTO "remix_artist" VALUES(4771,13667,1);
+INSERT INTO "remix_artist" VALUES(4771,16119,1);
+INSERT INTO "remix_artist" VALUES(4771,17937,1);
+INSERT INTO "remix_artist" VALUES(4772,17486,1);
+INSERT INTO "remix_artist" VALUES(4772,18635,1);
+INSERT INTO "remix_artist" VALUES(4773,4729,1);
+INSERT INTO "remix_artist" VALUES(4773,5655,1);
+INSERT INTO "remix_artist" VALUES(4773,10690,1);
+INSERT INTO "remix_artist" VALUES(4773,13046,1);
+INSERT INTO "remix_artist" VALUES(4773,13500,1);
+INSERT INTO "remix_artist" VALUES(4773,13667,1);
+INSERT INTO "remix_artist" VALUES(4773,18698,1);
+INSERT INTO "remix_artist" VALUES(4774,4729,1);
+INSERT INTO "remix_artist" VALUES(4775,4729,1);
+INSERT INTO "remix_artist" VALUES(4776,18623,1);
+INSERT INTO "remix_artist" VALUES(4776,18653,1);
+INSERT INTO "remix_artist" VALUES(4776,18654,1);
+INSERT INTO "remix_artist" VALUES(4776,18886,1);
+INSERT INTO "remix_artist" VALUES(4777,13500,1);
+INSERT INTO "remix_artist" VALUES(4777,16853,1);
+INSERT INTO "remix_artist" VALUES(4777,17316,1);
+INSERT INTO "remix_artist" VALUES(4777,17980,1);
+INSERT INTO "remix_artist" VALUES(4777,18653,1);
+INSERT INTO "remix_artist" VALUES(4777,18655,1);
+INSERT INTO "remix_artist" VALUES(4777,18819,1);
+INSERT INTO "remix_artist" VALUES(4778,11967,1);
+INSERT INTO "remix_artist" VALUES(4779,14375,1);
+INSERT INTO "remix_artist" VALUES(4780,4617,1);
+INSERT INTO "remix_artist" VALUES(4781,11494,1);
+INSERT INTO "remix_artist" VALUES(4782,16847,1);
+INSERT INTO "remix_artist" VALUES(4782,18602,1);
+INSERT INTO "remix_artist" VALUES(4782,18623,1);
+INSERT INTO "remix_artist" VALUES(4782,18705,1);
+INSERT INTO "remix_artist" VALUES(4782,18712,1);
+INSERT INTO "remix_artist" VALUES(4783,13500,1);
+INSERT INTO "remix_artist" VALUES(4784,14495,1);
+INSERT INTO "remix_artist" VALUES(4785,16853,1);
+INSERT INTO "remix_artist" VALUES(4785,18362,1);
+INSERT INTO "remix_artist" VALUES(4785,18653,1);
+INSERT INTO "remix_artist" VALUES(4785,18654,1);
+INSERT INTO "remix_artist" VALUES(4785,18655,1);
+INSERT INTO "remix_artist" VALUES(4786,10690,1);
+INSERT INTO "remix_artist" VALUES(4786,13046,1);
+INSERT INTO "remix_artist" VALUES(4786,18710,1);
+INSERT INTO "remix_artist" VALUES(4787,18899,1);
+INSERT INTO "remix_artist" VALUES(4788,18601,1);
+INSERT INTO "remix_artist" VALUES(4789,10690,1);
+INSERT INTO "remix_artist" VALUES(4789,12483,1);
+INSERT INTO "remix_artist" VALUES(4789,18712,1);
+INSERT INTO "remix_artist" VALUES(4790,4666,1);
+INSERT INTO "remix_artist" VALUES(4790,18907,1);
+INSERT INTO "remix_artist" VALUES(4791,13667,1);
+INSERT INTO "remix_artist" VALUES(4791,16119,1);
+INSERT INTO "remix_artist" VALUES(4791,17937,1);
+INSERT INTO "remix_artist" VALUES(4791,18736,1);
+INSERT INTO "remix_artist" VALUES(4792,18376,1);
+INSERT INTO "remix_artist" VALUES(4793,18694,1);
+INSERT INTO "remix_artist" VALUES(4793,18695,1);
+INSERT INTO "remix_artist" VALUES(4793,18696,1);
+INSERT INTO "remix_artist" VALUES(4793,18697,1);
+INSERT INTO "remix_artist" VALUES(4794,18652,1);
+INSERT INTO "remix_artist" VALUES(4795,13147,1);
+INSERT INTO "remix_artist" VALUES(4796,10690,1);
+INSERT INTO "remix_artist" VALUES(4796,16181,1);
+INSERT INTO "remix_artist" VALUES(4796,16848,1);
+INSERT INTO "remix_artist" VALUES(4796,17324,1);
+INSERT INTO "remix_artist" VALUES(4796,18388,1);
+INSERT INTO "remix_artist" VALUES(4796,18908,1);
+INSERT INTO "remix_artist" VALUES(4797,18898,1);
+INSERT INTO "remix_artist" VALUES(4798,18606,1);
+INSERT INTO "remix_artist" VALUES(4799,18632,1);
+INSERT INTO "remix_artist" VALUES(4800,10690,1);
+INSERT INTO "remix_artist" VALUES(4800,13046,1);
+INSERT INTO "remix_artist" VALUES(4801,14375,1);
+INSERT INTO "remix_artist" VALUES(4801,16615,1);
+INSERT INTO "remix_artist" VALUES(4801,16937,1);
+INSERT INTO "remix_artist" VALUES(4801,18590,1);
+INSERT INTO "remix_artist" VALUES(4802,11494,1);
+INSERT INTO "remix_artist" VALUES(4803,10690,1);
+INSERT INTO "remix_artist" VALUES(4803,13667,1);
+INSERT INTO "remix_artist" VALUES(4803,14127,1);
+INSERT INTO "remix_artist" VALUES(4803,16615,1);
+INSERT INTO "remix_artist" VALUES(4803,16848,1);
+INSERT INTO "remix_artist" VALUES(4803,17324,1);
+INSERT INTO "remix_artist" VALUES(4803,18388,1);
+INSERT INTO "remix_artist" VALUES(4803,18601,1);
+INSERT INTO "remix_artist" VALUES(4804,18724,1);
+INSERT INTO "remix_artist" VALUES(4804,18906,1);
+INSERT INTO "remix_artist" VALUES(4805,11932,1);
+INSERT INTO "remix_artist" VALUES(4806,4695,1);
+INSERT INTO "remix_artist" VALUES(4807,18901,1);
+INSERT INTO "remix_artist" VALUES(4808,4280,1);
+INSERT INTO "remix_artist" VALUES(4809,11963,1);
+INSERT INTO "remix_artist" VALUES(4810,17158,1);
+INSERT INTO "remix_artist" VALUES(4811,16430,1);
+INSERT INTO "remix_artist" VALUES(4811,16848,1);
+INSERT INTO "remix_artist" VALUES(4811,17052,1);
+INSERT INTO "remix_artist" VALUES(4811,17486,1);
+INSERT INTO "remix_artist" VALUES(4811,18029,1);
+INSERT INTO "remix_artist" VALUES(4811,18034,1);
+INSERT INTO "remix_artist" VALUES(4811,18388,1);
+INSERT INTO "remix_artist" VALUES(4811,18665,1);
+INSERT INTO "remix_artist" VALUES(4811,18667,1);
+INSERT INTO "remix_artist" VALUES(4811,18668,1);
+INSERT INTO "remix_artist" VALUES(4812,18900,1);
+INSERT INTO "remix_artist" VALUES(4813,14375,1);
+INSERT INTO "remix_artist" VALUES(4813,16615,1);
+INSERT INTO "remix_artist" VALUES(4814,5473,1);
+INSERT INTO "remix_artist" VALUES(4814,10690,1);
+INSERT INTO "remix_artist" VALUES(4814,13667,1);
+INSERT INTO "remix_artist" VALUES(4814,16848,1);
+INSERT INTO "remix_artist" VALUES(4814,18623,1);
+INSERT INTO "remix_artist" VALUES(4814,18712,1);
+INSERT INTO "remix_artist" VALUES(4815,13500,1);
+INSERT INTO "remix_artist" VALUES(4815,16615,1);
+INSERT INTO "remix_artist" VALUES(4815,17980,1);
+INSERT INTO "remix_artist" VALUES(4815,18601,1);
+INSERT INTO "remix_artist" VALUES(4815,18724,1);
+INSERT INTO "remix_artist" VALUES(4816,13500,1);
+INSERT INTO "remix_artist" VALUES(4816,18633,1);
+INSERT INTO "remix_artist" VALUES(4816,18724,1);
+INSERT INTO "remix_artist" VALUES(4816,18904,1);
+INSERT INTO "remix_artist" VALUES(4817,14375,1);
+INSERT INTO "remix_artist" VALUES(4818,4432,1);
+INSERT INTO "remix_artist" VALUES(4818,10690,1);
+INSERT INTO "remix_artist" VALUES(4818,13667,1);
+INSERT INTO "remix_artist" VALUES(4818,16119,1);
+INSERT INTO "remix_artist" VALUES(4818,17937,1);
+INSERT INTO "remix_artist" VALUES(4818,18846,1);
+INSERT INTO "remix_artist" VALUES(4819,4432,1);
+INSERT INTO "remix_artist" VALUES(4819,10690,1);
+INSERT INTO "remix_artist" VALUES(4819,13667,1);
+INSERT INTO "remix_artist" VALUES(4819,16119,1);
+INSERT INTO "remix_artist" VALUES(4819,18685,1);
+INSERT INTO "remix_artist" VALUES(4819,18845,1);
+INSERT INTO "remix_artist" VALUES(4820,15562,1);
+INSERT INTO "remix_artist" VALUES(4821,18601,1);
+INSERT INTO "remix_artist" VALUES(4821,18653,1);
+INSERT INTO "remix_artist" VALUES(4821,18654,1);
+INSERT INTO "remix_artist" VALUES(4822,14495,1);
+INSERT INTO "remix_artist" VALUES(4823,10669,1);
+INSERT INTO "remix_artist" VALUES(4824,13045,1);
+INSERT INTO "remix_artist" VALUES(4825,13668,1);
+INSERT INTO "remix_artist" VALUES(4826,4734,1);
+INSERT INTO "remix_artist" VALUES(4827,14375,1);
+INSERT INTO "remix_artist" VALUES(4828,15770,1);
+INSERT INTO "remix_artist" VALUES(4829,10690,1);
+INSERT INTO "remix_artist" VALUES(4829,13046,1);
+INSERT INTO "remix_artist" VALUES(4830,18925,1);
+INSERT INTO "remix_artist" VALUES(4831,18653,1);
+INSERT INTO "remix_artist" VALUES(4832,4432,1);
+INSERT INTO "remix_artist" VALUES(4832,13667,1);
+INSERT INTO "remix_artist" VALUES(4832,18712,1);
+INSERT INTO "remix_artist" VALUES(4833,13667,1);
+INSERT INTO "remix_artist" VALUES(4833,16615,1);
+INSERT INTO "remix_artist" VALUES(4833,18594,1);
+INSERT INTO "remix_artist" VALUES(4833,18606,1);
+INSERT INTO "remix_artist" VALUES(4834,13500,1);
+INSERT INTO "remix_artist" VALUES(4834,18724,1);
+INSERT INTO "remix_artist" VALUES(4834,18886,1);
+INSERT INTO "remix_artist" VALUES(4834,18913,1);
+INSERT INTO "remix_artist" VALUES(4835,13500,1);
+INSERT INTO "remix_artist" VALUES(4835,16119,1);
+INSERT INTO "remix_artist" VALUES(4835,17324,1);
+INSERT INTO "remix_artist" VALUES(4835,18653,1);
+INSERT INTO "remix_artist" VALUES(4835,18737,1);
+INSERT INTO "remix_artist" VALUES(4835,18927,1);
+INSERT INTO "remix_artist" VALUES(4836,17486,1);
+INSERT INTO "remix_artist" VALUES(4836,17982,1);
+INSERT INTO "remix_artist" VALUES(4836,18632,1);
+INSERT INTO "remix_artist" VALUES(4836,18739,1);
+INSERT INTO "remix_artist" VALUES(4837,13500,1);
+INSERT INTO "remix_artist" VALUES(4838,4695,1);
+INSERT INTO "remix_artist" VALUES(4839,18868,1);
+INSERT INTO "remix_artist" VALUES(4840,9690,1);
+INSERT INTO "remix_artist" VALUES(4841,18929,1);
+INSERT INTO "remix_artist" VALUES(4842,17158,1);
+INSERT INTO "remix_artist" VALUES(4843,12710,1);
+INSERT INTO "remix_artist" VALUES(4844,18300,1);
+INSERT INTO "remix_artist" VALUES(4844,18653,1);
+INSERT INTO "remix_artist" VALUES(4844,18654,1);
+INSERT INTO "remix_artist" VALUES(4844,18930,1);
+INSERT INTO "remix_artist" VALUES(4845,18941,1);
+INSERT INTO "remix_artist" VALUES(4846,18942,1);
+INSERT INTO "remix_artist" VALUES(4847,13045,1);
+INSERT INTO "remix_artist" VALUES(4847,13500,1);
+INSERT INTO "remix_artist" VALUES(4847,18633,1);
+INSERT INTO "remix_artist" VALUES(4848,18943,1);
+INSERT INTO "remix_artist" VALUES(4849,13147,1);
+INSERT INTO "remix_artist" VALUES(4850,14328,1);
+INSERT INTO "remix_artist" VALUES(4851,15562,1);
+INSERT INTO "remix_artist" VALUES(4852,16119,1);
+INSERT INTO "remix_artist" VALUES(4852,17485,1);
+INSERT INTO "remix_artist" VALUES(4853,9690,1);
+INSERT INTO "remix_artist" VALUES(4854,16615,1);
+INSERT INTO "remix_artist" VALUES(4854,16844,1);
+INSERT INTO "remix_artist" VALUES(4854,18388,1);
+INSERT INTO "remix_artist" VALUES(4854,18653,1);
+INSERT INTO "remix_artist" VALUES(4854,18654,1);
+INSERT INTO "remix_artist" VALUES(4854,18964,1);
+INSERT INTO "remix_artist" VALUES(4855,10690,1);
+INSERT INTO "remix_artist" VALUES(4855,13667,1);
+INSERT INTO "remix_artist" VALUES(4856,13500,1);
+INSERT INTO "remix_artist" VALUES(4857,18655,1);
+INSERT INTO "remix_artist" VALUES(4857,18698,1);
+INSERT INTO "remix_artist" VALUES(4857,18724,1);
+INSERT INTO "remix_artist" VALUES(4858,18653,1);
+INSERT INTO "remix_artist" VALUES(4858,18654,1);
+INSERT INTO "remix_artist" VALUES(4858,18940,1);
+INSERT INTO "remix_artist" VALUES(4859,4695,1);
+INSERT INTO "remix_artist" VALUES(4860,13668,1);
+INSERT INTO "remix_artist" VALUES(4861,14148,1);
+INSERT INTO "remix_artist" VALUES(4862,12064,1);
+INSERT INTO "remix_artist" VALUES(4862,13147,1);
+INSERT INTO "remix_artist" VALUES(4863,10709,1);
+INSERT INTO "remix_artist" VALUES(4863,18963,1);
+INSERT INTO "remix_artist" VALUES(4864,13046,1);
+INSERT INTO "remix_artist" VALUES(4864,18602,1);
+INSERT INTO "remix_artist" VALUES(4865,4605,1);
+INSERT INTO "remix_artist" VALUES(4865,10690,1);
+INSERT INTO "remix_artist" VALUES(4865,13667,1);
+INSERT INTO "remix_artist" VALUES(4865,16615,1);
+INSERT INTO "remix_artist" VALUES(4865,17324,1);
+INSERT INTO "remix_artist" VALUES(4865,18601,1);
+INSERT INTO "remix_artist" VALUES(4865,18712,1);
+INSERT INTO "remix_artist" VALUES(4865,18938,1);
+INSERT INTO "remix_artist" VALUES(4866,18896,1);
+INSERT INTO "remix_artist" VALUES(4867,18941,1);
+INSERT INTO "remix_artist" VALUES(4868,18326,1);
+INSERT INTO "remix_artist" VALUES(4868,18362,1);
+INSERT INTO "remix_artist" VALUES(4868,18601,1);
+INSERT INTO "remix_artist" VALUES(4868,18655,1);
+INSERT INTO "remix_artist" VALUES(4868,18712,1);
+INSERT INTO "remix_artist" VALUES(4868,18739,1);
+INSERT INTO "remix_artist" VALUES(4868,18742,1);
+INSERT INTO "remix_artist" VALUES(4868,18819,1);
+INSERT INTO "remix_artist" VALUES(4868,18928,1);
+INSERT INTO "remix_artist" VALUES(4868,18966,1);
+INSERT INTO "remix_artist" VALUES(4868,18967,1);
+INSERT INTO "remix_artist" VALUES(4869,18710,1);
+INSERT INTO "remix_artist" VALUES(4869,18926,1);
+INSERT INTO "remix_artist" VALUES(4870,18632,1);
+INSERT INTO "remix_artist" VALUES(4871,13500,1);
+INSERT INTO "remix_artist" VALUES(4871,18633,1);
+INSERT INTO "remix_artist" VALUES(4871,18655,1);
+INSERT INTO "remix_artist" VALUES(4871,18738,1);
+INSERT INTO "remix_artist" VALUES(4872,14375,1);
+INSERT INTO "remix_artist" VALUES(4872,16615,1);
+INSERT INTO "remix_artist" VALUES(4872,16937,1);
+INSERT INTO "remix_artist" VALUES(4872,18590,1);
+INSERT INTO "remix_artist" VALUES(4873,13147,1);
+INSERT INTO "remix_artist" VALUES(4874,4280,1);
+INSERT INTO "remix_artist" VALUES(4875,10690,1);
+INSERT INTO "remix_artist" VALUES(4875,17937,1);
+INSERT INTO "remix_artist" VALUES(4875,18662,1);
+INSERT INTO "remix_artist" VALUES(4876,13668,1);
+INSERT INTO "remix_artist" VALUES(4877,13046,1);
+INSERT INTO "remix_artist" VALUES(4877,18602,1);
+INSERT INTO "remix_artist" VALUES(4878,17929,1);
+INSERT INTO "remix_artist" VALUES(4879,16615,1);
+INSERT INTO "remix_artist" VALUES(4879,18376,1);
+INSERT INTO "remix_artist" VALUES(4880,17473,1);
+INSERT INTO "remix_artist" VALUES(4881,15612,1);
+INSERT INTO "remix_artist" VALUES(4881,18821,1);
+INSERT INTO "remix_artist" VALUES(4881,18864,1);
+INSERT INTO "remix_artist" VALUES(4882,18941,1);
+INSERT INTO "remix_artist" VALUES(4883,14375,1);
+INSERT INTO "remix_artist" VALUES(4883,16615,1);
+INSERT INTO "remix_artist" VALUES(4883,16937,1);
+INSERT INTO "remix_artist" VALUES(4883,18590,1);
+INSERT INTO "remix_artist" VALUES(4884,11940,1);
+INSERT INTO "remix_artist" VALUES(4884,16845,1);
+INSERT INTO "remix_artist" VALUES(4885,18606,1);
+INSERT INTO "remix_artist" VALUES(4886,18989,1);
+INSERT INTO "remix_artist" VALUES(4887,4432,1);
+INSERT INTO "remix_artist" VALUES(4887,4695,1);
+INSERT INTO "remix_artist" VALUES(4887,4750,1);
+INSERT INTO "remix_artist" VALUES(4887,5473,1);
+INSERT INTO "remix_artist" VALUES(4887,10690,1);
+INSERT INTO "remix_artist" VALUES(4887,13667,1);
+INSERT INTO "remix_artist" VALUES(4887,14127,1);
+INSERT INTO "remix_artist" VALUES(4887,15473,1);
+INSERT INTO "remix_artist" VALUES(4887,16119,1);
+INSERT INTO "remix_artist" VALUES(4887,16615,1);
+INSERT INTO "remix_artist" VALUES(4887,16844,1);
+INSERT INTO "remix_artist" VALUES(4887,16848,1);
+INSERT INTO "remix_artist" VALUES(4887,17241,1);
+INSERT INTO "remix_artist" VALUES(4887,17322,1);
+INSERT INTO "remix_artist" VALUES(4887,17324,1);
+INSERT INTO "remix_artist" VALUES(4887,18601,1);
+INSERT INTO "remix_artist" VALUES(4887,18623,1);
+INSERT INTO "remix_artist" VALUES(4887,18631,1);
+INSERT INTO "remix_artist" VALUES(4887,18632,1);
+INSERT INTO "remix_artist" VALUES(4887,18633,1);
+INSERT INTO "remix_artist" VALUES(4887,18712,1);
+INSERT INTO "remix_artist" VALUES(4887,18812,1);
+INSERT INTO "remix_artist" VALUES(4887,18837,1);
+INSERT INTO "remix_artist" VALUES(4887,18863,1);
+INSERT INTO "remix_artist" VALUES(4887,18965,1);
+INSERT INTO "remix_artist" VALUES(4888,19000,1);
+INSERT INTO "remix_artist" VALUES(4889,13667,1);
+INSERT INTO "remix_artist" VALUES(4890,17158,1);
+INSERT INTO "remix_artist" VALUES(4891,13500,1);
+INSERT INTO "remix_artist" VALUES(4891,14464,1);
+INSERT INTO "remix_artist" VALUES(4891,18964,1);
+INSERT INTO "remix_artist" VALUES(4891,18995,1);
+INSERT INTO "remix_artist" VALUES(4891,18997,1);
+INSERT INTO "remix_artist" VALUES(4891,18998,1);
+INSERT INTO "remix_artist" VALUES(4892,19007,1);
+INSERT INTO "remix_artist" VALUES(4893,13147,1);
+INSERT INTO "remix_artist" VALUES(4894,4750,1);
+INSERT INTO "remix_artist" VALUES(4894,16848,1);
+INSERT INTO "remix_artist" VALUES(4895,13500,1);
+INSERT INTO "remix_artist" VALUES(4896,12541,1);
+INSERT INTO "remix_artist" VALUES(4897,17929,1);
+INSERT INTO "remix_artist" VALUES(4898,13668,1);
+INSERT INTO "remix_artist" VALUES(4899,11940,1);
+INSERT INTO "remix_artist" VALUES(4900,13500,1);
+INSERT INTO "remix_artist" VALUES(4901,5041,1);
+INSERT INTO "remix_artist" VALUES(4901,16519,1);
+INSERT INTO "remix_artist" VALUES(4901,18655,1);
+INSERT INTO "remix_artist" VALUES(4901,18991,1);
+INSERT INTO "remix_artist" VALUES(4902,18929,1);
+INSERT INTO "remix_artist" VALUES(4903,15562,1);
+INSERT INTO "remix_artist" VALUES(4904,9690,1);
+INSERT INTO "remix_artist" VALUES(4905,18602,1);
+INSERT INTO "remix_artist" VALUES(4906,12541,1);
+INSERT INTO "remix_artist" VALUES(4907,14047,1);
+INSERT INTO "remix_artist" VALUES(4908,5655,1);
+INSERT INTO "remix_artist" VALUES(4908,10690,1);
+INSERT INTO "remix_artist" VALUES(4908,13046,1);
+INSERT INTO "remix_artist" VALUES(4908,13500,1);
+INSERT INTO "remix_artist" VALUES(4908,13667,1);
+INSERT INTO "remix_artist" VALUES(4909,17929,1);
+INSERT INTO "remix_artist" VALUES(4910,14375,1);
+INSERT INTO "remix_artist" VALUES(4910,16615,1);
+INSERT INTO "remix_artist" VALUES(4910,16937,1);
+INSERT INTO "remix_artist" VALUES(4910,18590,1);
+INSERT INTO "remix_artist" VALUES(4911,13500,1);
+INSERT INTO "remix_artist" VALUES(4911,16848,1);
+INSERT INTO "remix_artist" VALUES(4911,16853,1);
+INSERT INTO "remix_artist" VALUES(4911,18633,1);
+INSERT INTO "remix_artist" VALUES(4911,18724,1);
+INSERT INTO "remix_artist" VALUES(4912,4553,1);
+INSERT INTO "remix_artist" VALUES(4913,11940,1);
+INSERT INTO "remix_artist" VALUES(4914,18999,1);
+INSERT INTO "remix_artist" VALUES(4915,19008,1);
+INSERT INTO "remix_artist" VALUES(4916,12541,1);
+INSERT INTO "remix_artist" VALUES(4917,18403,1);
+INSERT INTO "remix_artist" VALUES(4918,13500,1);
+INSERT INTO "remix_artist" VALUES(4918,18712,1);
+INSERT INTO "remix_artist" VALUES(4918,18724,1);
+INSERT INTO "remix_artist" VALUES(4918,18904,1);
+INSERT INTO "remix_artist" VALUES(4919,17929,1);
+INSERT INTO "remix_artist" VALUES(4920,4558,1);
+INSERT INTO "remix_artist" VALUES(4921,18971,1);
+INSERT INTO "remix_artist" VALUES(4922,5473,1);
+INSERT INTO "remix_artist" VALUES(4922,18724,1);
+INSERT INTO "remix_artist" VALUES(4922,18913,1);
+INSERT INTO "remix_artist" VALUES(4922,18983,1);
+INSERT INTO "remix_artist" VALUES(4922,18984,1);
+INSERT INTO "remix_artist" VALUES(4923,16119,1);
+INSERT INTO "remix_artist" VALUES(4923,16848,1);
+INSERT INTO "remix_artist" VALUES(4923,18653,1);
+INSERT INTO "remix_artist" VALUES(4924,5473,1);
+INSERT INTO "remix_artist" VALUES(4924,13667,1);
+INSERT INTO "remix_artist" VALUES(4925,16412,1);
+INSERT INTO "remix_artist" VALUES(4926,4280,1);
+INSERT INTO "remix_artist" VALUES(4927,12541,1);
+INSERT INTO "remix_artist" VALUES(4928,5043,1);
+INSERT INTO "remix_artist" VALUES(4928,15850,1);
+INSERT INTO "remix_artist" VALUES(4928,16845,1);
+INSERT INTO "remix_artist" VALUES(4929,16101,1);
+INSERT INTO "remix_artist" VALUES(4930,10690,1);
+INSERT INTO "remix_artist" VALUES(4930,13046,1);
+INSERT INTO "remix_artist" VALUES(4930,13667,1);
+INSERT INTO "remix_artist" VALUES(4930,18710,1);
+INSERT INTO "remix_artist" VALUES(4931,18832,1);
+INSERT INTO "remix_artist" VALUES(4932,12364,1);
+INSERT INTO "remix_artist" VALUES(4932,13046,1);
+INSERT INTO "remix_artist" VALUES(4933,17158,1);
+INSERT INTO "remix_artist" VALUES(4934,18752,1);
+INSERT INTO "remix_artist" VALUES(4935,18909,1);
+INSERT INTO "remix_artist" VALUES(4935,19011,1);
+INSERT INTO "remix_artist" VALUES(4936,16119,1);
+INSERT INTO "remix_artist" VALUES(4937,19009,1);
+INSERT INTO "remix_artist" VALUES(4937,19010,1);
+INSERT INTO "remix_artist" VALUES(4938,4432,1);
+INSERT INTO "remix_artist" VALUES(4938,11967,1);
+INSERT INTO "remix_artist" VALUES(4938,18623,1);
+INSERT INTO "remix_artist" VALUES(4938,18736,1);
+INSERT INTO "remix_artist" VALUES(4938,19017,1);
+INSERT INTO "remix_artist" VALUES(4938,19018,1);
+INSERT INTO "remix_artist" VALUES(4939,13667,1);
+INSERT INTO "remix_artist" VALUES(4939,18712,1);
+INSERT INTO "remix_artist" VALUES(4940,16412,1);
+INSERT INTO "remix_artist" VALUES(4941,18653,1);
+INSERT INTO "remix_artist" VALUES(4941,18654,1);
+INSERT INTO "remix_artist" VALUES(4941,18698,1);
+INSERT INTO "remix_artist" VALUES(4942,12541,1);
+INSERT INTO "remix_artist" VALUES(4943,10690,1);
+INSERT INTO "remix_artist" VALUES(4943,13046,1);
+INSERT INTO "remix_artist" VALUES(4943,18988,1);
+INSERT INTO "remix_artist" VALUES(4944,5473,1);
+INSERT INTO "remix_artist" VALUES(4944,13667,1);
+INSERT INTO "remix_artist" VALUES(4944,18712,1);
+INSERT INTO "remix_artist" VALUES(4945,4685,1);
+INSERT INTO "remix_artist" VALUES(4946,18711,1);
+INSERT INTO "remix_artist" VALUES(4946,18989,1);
+INSERT INTO "remix_artist" VALUES(4947,13500,1);
+INSERT INTO "remix_artist" VALUES(4947,18653,1);
+INSERT INTO "remix_artist" VALUES(4948,19019,1);
+INSERT INTO "remix_artist" VALUES(4949,18724,1);
+INSERT INTO "remix_artist" VALUES(4950,11940,1);
+INSERT INTO "remix_artist" VALUES(4950,16845,1);
+INSERT INTO "remix_artist" VALUES(4951,10690,1);
+INSERT INTO "remix_artist" VALUES(4951,13667,1);
+INSERT INTO "remix_artist" VALUES(4951,18724,1);
+INSERT INTO "remix_artist" VALUES(4951,18742,1);
+INSERT INTO "remix_artist" VALUES(4951,18941,1);
+INSERT INTO "remix_artist" VALUES(4951,18968,1);
+INSERT INTO "remix_artist" VALUES(4952,12541,1);
+INSERT INTO "remix_artist" VALUES(4953,13667,1);
+INSERT INTO "remix_artist" VALUES(4954,13500,1);
+INSERT INTO "remix_artist" VALUES(4954,18712,1);
+INSERT INTO "remix_artist" VALUES(4954,18724,1);
+INSERT INTO "remix_artist" VALUES(4954,18913,1);
+INSERT INTO "remix_artist" VALUES(4955,19020,1);
+INSERT INTO "remix_artist" VALUES(4955,19021,1);
+INSERT INTO "remix_artist" VALUES(4956,9690,1);
+INSERT INTO "remix_artist" VALUES(4957,10690,1);
+INSERT INTO "remix_artist" VALUES(4957,13500,1);
+INSERT INTO "remix_artist" VALUES(4958,13046,1);
+INSERT INTO "remix_artist" VALUES(4958,18941,1);
+INSERT INTO "remix_artist" VALUES(4959,18590,1);
+INSERT INTO "remix_artist" VALUES(4959,18624,1);
+INSERT INTO "remix_artist" VALUES(4959,18724,1);
+INSERT INTO "remix_artist" VALUES(4959,18739,1);
+INSERT INTO "remix_artist" VALUES(4959,18839,1);
+INSERT INTO "remix_artist" VALUES(4959,19028,1);
+INSERT INTO "remix_artist" VALUES(4960,18868,1);
+INSERT INTO "remix_artist" VALUES(4961,15612,1);
+INSERT INTO "remix_artist" VALUES(4962,13147,1);
+INSERT INTO "remix_artist" VALUES(4963,18632,1);
+INSERT INTO "remix_artist" VALUES(4963,18711,1);
+INSERT INTO "remix_artist" VALUES(4963,18742,1);
+INSERT INTO "remix_artist" VALUES(4964,18962,1);
+INSERT INTO "remix_artist" VALUES(4965,10690,1);
+INSERT INTO "remix_artist" VALUES(4965,18941,1);
+INSERT INTO "remix_artist" VALUES(4966,12541,1);
+INSERT INTO "remix_artist" VALUES(4967,13500,1);
+INSERT INTO "remix_artist" VALUES(4967,16853,1);
+INSERT INTO "remix_artist" VALUES(4967,18653,1);
+INSERT INTO "remix_artist" VALUES(4968,4695,1);
+INSERT INTO "remix_artist" VALUES(4968,4750,1);
+INSERT INTO "remix_artist" VALUES(4968,18992,1);
+INSERT INTO "remix_artist" VALUES(4969,10690,1);
+INSERT INTO "remix_artist" VALUES(4969,18941,1);
+INSERT INTO "remix_artist" VALUES(4970,18403,1);
+INSERT INTO "remix_artist" VALUES(4970,18712,1);
+INSERT INTO "remix_artist" VALUES(4970,18846,1);
+INSERT INTO "remix_artist" VALUES(4970,18847,1);
+INSERT INTO "remix_artist" VALUES(4970,18860,1);
+INSERT INTO "remix_artist" VALUES(4971,4695,1);
+INSERT INTO "remix_artist" VALUES(4971,13667,1);
+INSERT INTO "remix_artist" VALUES(4971,16615,1);
+INSERT INTO "remix_artist" VALUES(4971,16848,1);
+INSERT INTO "remix_artist" VALUES(4972,16119,1);
+INSERT INTO "remix_artist" VALUES(4973,13046,1);
+INSERT INTO "remix_artist" VALUES(4973,18602,1);
+INSERT INTO "remix_artist" VALUES(4974,11932,1);
+INSERT INTO "remix_artist" VALUES(4975,4432,1);
+INSERT INTO "remix_artist" VALUES(4975,8498,1);
+INSERT INTO "remix_artist" VALUES(4975,18685,1);
+INSERT INTO "remix_artist" VALUES(4975,18869,1);
+INSERT INTO "remix_artist" VALUES(4976,14607,1);
+INSERT INTO "remix_artist" VALUES(4977,17937,1);
+INSERT INTO "remix_artist" VALUES(4978,4695,1);
+INSERT INTO "remix_artist" VALUES(4979,18606,1);
+INSERT INTO "remix_artist" VALUES(4979,18632,1);
+INSERT INTO "remix_artist" VALUES(4979,18712,1);
+INSERT INTO "remix_artist" VALUES(4979,18837,1);
+INSERT INTO "remix_artist" VALUES(4979,18847,1);
+INSERT INTO "remix_artist" VALUES(4979,18860,1);
+INSERT INTO "remix_artist" VALUES(4979,19018,1);
+INSERT INTO "remix_artist" VALUES(4980,16412,1);
+INSERT INTO "remix_artist" VALUES(4981,18736,1);
+INSERT INTO "remix_artist" VALUES(4982,18844,1);
+INSERT INTO "remix_artist" VALUES(4983,18602,1);
+INSERT INTO "remix_artist" VALUES(4983,18632,1);
+INSERT INTO "remix_artist" VALUES(4984,18980,1);
+INSERT INTO "remix_artist" VALUES(4985,5748,1);
+INSERT INTO "remix_artist" VALUES(4986,18941,1);
+INSERT INTO "remix_artist" VALUES(4987,4695,1);
+INSERT INTO "remix_artist" VALUES(4987,14461,1);
+INSERT INTO "remix_artist" VALUES(4987,17241,1);
+INSERT INTO "remix_artist" VALUES(4987,18710,1);
+INSERT INTO "remix_artist" VALUES(4988,16103,1);
+INSERT INTO "remix_artist" VALUES(4988,16119,1);
+INSERT INTO "remix_artist" VALUES(4989,14375,1);
+INSERT INTO "remix_artist" VALUES(4989,16615,1);
+INSERT INTO "remix_artist" VALUES(4990,13667,1);
+INSERT INTO "remix_artist" VALUES(4991,11774,1);
+INSERT INTO "remix_artist" VALUES(4991,18969,1);
+INSERT INTO "remix_artist" VALUES(4992,4695,1);
+INSERT INTO "remix_artist" VALUES(4992,18712,1);
+INSERT INTO "remix_artist" VALUES(4992,18724,1);
+INSERT INTO "remix_artist" VALUES(4992,18913,1);
+INSERT INTO "remix_artist" VALUES(4993,16412,1);
+INSERT INTO "remix_artist" VALUES(4994,18980,1);
+INSERT INTO "remix_artist" VALUES(4995,13046,1);
+INSERT INTO "remix_artist" VALUES(4995,18736,1);
+INSERT INTO "remix_artist" VALUES(4995,18941,1);
+INSERT INTO "remix_artist" VALUES(4996,10690,1);
+INSERT INTO "remix_artist" VALUES(4996,13667,1);
+INSERT INTO "remix_artist" VALUES(4996,18710,1);
+INSERT INTO "remix_artist" VALUES(4997,4695,1);
+INSERT INTO "remix_artist" VALUES(4997,13500,1);
+INSERT INTO "remix_artist" VALUES(4997,18654,1);
+INSERT INTO "remix_artist" VALUES(4997,18724,1);
+INSERT INTO "remix_artist" VALUES(4998,16101,1);
+INSERT INTO "remix_artist" VALUES(4999,12541,1);
@@ -0,0 +1,122 @@
+INSERT INTO "remix_artist" VALUES(5000,4694,1);
+INSERT INTO "remix_artist" VALUES(5001,19030,1);
+INSERT INTO "remix_artist" VALUES(5002,4313,1);
+INSERT INTO "remix_artist" VALUES(5003,16853,1);
+INSERT INTO "remix_artist" VALUES(5003,18724,1);
+INSERT INTO "remix_artist" VALUES(5003,18837,1);
+INSERT INTO "remix_artist" VALUES(5004,11776,1);
+INSERT INTO "remix_artist" VALUES(5005,10690,1);
+INSERT INTO "remix_artist" VALUES(5005,13500,1);
+INSERT INTO "remix_artist" VALUES(5005,13667,1);
+INSERT INTO "remix_artist" VALUES(5005,18601,1);
+INSERT INTO "remix_artist" VALUES(5005,18837,1);
+INSERT INTO "remix_artist" VALUES(5006,19042,1);
+INSERT INTO "remix_artist" VALUES(5007,16412,1);
+INSERT INTO "remix_artist" VALUES(5008,13046,1);
+INSERT INTO "remix_artist" VALUES(5008,18602,1);
+INSERT INTO "remix_artist" VALUES(5009,13500,1);
+INSERT INTO "remix_artist" VALUES(5009,18724,1);
+INSERT INTO "remix_artist" VALUES(5009,19035,1);
+INSERT INTO "remix_artist" VALUES(5010,4732,1);
+INSERT INTO "remix_artist" VALUES(5011,10690,1);
+INSERT INTO "remix_artist" VALUES(5011,13667,1);
+INSERT INTO "remix_artist" VALUES(5011,16615,1);
+INSERT INTO "remix_artist" VALUES(5011,17324,1);
+INSERT INTO "remix_artist" VALUES(5011,18601,1);
+INSERT INTO "remix_artist" VALUES(5012,18602,1);
+INSERT INTO "remix_artist" VALUES(5013,4432,1);
+INSERT INTO "remix_artist" VALUES(5014,18941,1);
+INSERT INTO "remix_artist" VALUES(5015,16615,1);
+INSERT INTO "remix_artist" VALUES(5015,18601,1);
+INSERT INTO "remix_artist" VALUES(5015,18621,1);
+INSERT INTO "remix_artist" VALUES(5015,18633,1);
+INSERT INTO "remix_artist" VALUES(5015,18710,1);
+INSERT INTO "remix_artist" VALUES(5016,17939,1);
+INSERT INTO "remix_artist" VALUES(5017,17324,1);
+INSERT INTO "remix_artist" VALUES(5017,18606,1);
+INSERT INTO "remix_artist" VALUES(5017,18631,1);
+INSERT INTO "remix_artist" VALUES(5018,11932,1);
+INSERT INTO "remix_artist" VALUES(5019,4750,1);
+INSERT INTO "remix_artist" VALUES(5020,18860,1);
+INSERT INTO "remix_artist" VALUES(5021,14064,1);
+INSERT INTO "remix_artist" VALUES(5022,11932,1);
+INSERT INTO "remix_artist" VALUES(5022,18198,1);
+INSERT INTO "remix_artist" VALUES(5022,18860,1);
+INSERT INTO "remix_artist" VALUES(5023,18606,1);
+INSERT INTO "remix_artist" VALUES(5024,10690,1);
+INSERT INTO "remix_artist" VALUES(5024,14463,1);
+INSERT INTO "remix_artist" VALUES(5024,16113,1);
+INSERT INTO "remix_artist" VALUES(5024,16119,1);
+INSERT INTO "remix_artist" VALUES(5024,17937,1);
+INSERT INTO "remix_artist" VALUES(5025,13667,1);
+INSERT INTO "remix_artist" VALUES(5025,16615,1);
+INSERT INTO "remix_artist" VALUES(5025,16848,1);
+INSERT INTO "remix_artist" VALUES(5026,19056,1);
+INSERT INTO "remix_artist" VALUES(5027,17158,1);
+INSERT INTO "remix_artist" VALUES(5028,13500,1);
+INSERT INTO "remix_artist" VALUES(5028,16853,1);
+INSERT INTO "remix_artist" VALUES(5028,18653,1);
+INSERT INTO "remix_artist" VALUES(5028,18654,1);
+INSERT INTO "remix_artist" VALUES(5028,18739,1);
+INSERT INTO "remix_artist" VALUES(5028,18983,1);
+INSERT INTO "remix_artist" VALUES(5028,19050,1);
+INSERT INTO "remix_artist" VALUES(5028,19051,1);
+INSERT INTO "remix_artist" VALUES(5029,16853,1);
+INSERT INTO "remix_artist" VALUES(5029,18653,1);
+INSERT INTO "remix_artist" VALUES(5029,18741,1);
+INSERT INTO "remix_artist" VALUES(5029,18928,1);
+INSERT INTO "remix_artist" VALUES(5029,19049,1);
+INSERT INTO "remix_artist" VALUES(5030,4695,1);
+INSERT INTO "remix_artist" VALUES(5030,13500,1);
+INSERT INTO "remix_artist" VALUES(5030,18631,1);
+INSERT INTO "remix_artist" VALUES(5030,18712,1);
+INSERT INTO "remix_artist" VALUES(5030,18724,1);
+INSERT INTO "remix_artist" VALUES(5030,18913,1);
+INSERT INTO "remix_artist" VALUES(5031,4754,1);
+INSERT INTO "remix_artist" VALUES(5032,13668,1);
+INSERT INTO "remix_artist" VALUES(5033,15047,1);
+INSERT INTO "remix_artist" VALUES(5034,4432,1);
+INSERT INTO "remix_artist" VALUES(5034,18712,1);
+INSERT INTO "remix_artist" VALUES(5035,10690,1);
+INSERT INTO "remix_artist" VALUES(5035,16119,1);
+INSERT INTO "remix_artist" VALUES(5035,18913,1);
+INSERT INTO "remix_artist" VALUES(5036,13500,1);
+INSERT INTO "remix_artist" VALUES(5037,4440,1);
+INSERT INTO "remix_artist" VALUES(5038,4729,1);
+INSERT INTO "remix_artist" VALUES(5038,16541,1);
+INSERT INTO "remix_artist" VALUES(5039,4280,1);
+INSERT INTO "remix_artist" VALUES(5040,5748,1);
+INSERT INTO "remix_artist" VALUES(5041,4754,1);
+INSERT INTO "remix_artist" VALUES(5042,13046,1);
+INSERT INTO "remix_artist" VALUES(5042,18602,1);
+INSERT INTO "remix_artist" VALUES(5043,4694,1);
+INSERT INTO "remix_artist" VALUES(5043,4695,1);
+INSERT INTO "remix_artist" VALUES(5044,13147,1);
+INSERT INTO "remix_artist" VALUES(5045,16438,1);
+INSERT INTO "remix_artist" VALUES(5045,18710,1);
+INSERT INTO "remix_artist" VALUES(5046,10866,1);
+INSERT INTO "remix_artist" VALUES(5047,10896,1);
+INSERT INTO "remix_artist" VALUES(5048,4637,1);
+INSERT INTO "remix_artist" VALUES(5049,11937,1);
+INSERT INTO "remix_artist" VALUES(5050,18606,1);
+INSERT INTO "remix_artist" VALUES(5051,19084,1);
+INSERT INTO "remix_artist" VALUES(5052,19095,1);
+INSERT INTO "remix_artist" VALUES(5053,4750,1);
+INSERT INTO "remix_artist" VALUES(5053,18711,1);
+INSERT INTO "remix_artist" VALUES(5053,18741,1);
+INSERT INTO "remix_artist" VALUES(5053,19094,1);
+INSERT INTO "remix_artist" VALUES(5054,19020,1);
+INSERT INTO "remix_artist" VALUES(5055,4432,1);
+INSERT INTO "remix_artist" VALUES(5055,13667,1);
+INSERT INTO "remix_artist" VALUES(5055,18712,1);
+INSERT INTO "remix_artist" VALUES(5055,18736,1);
+INSERT INTO "remix_artist" VALUES(5055,18913,1);
+INSERT INTO "remix_artist" VALUES(5056,11932,1);
+INSERT INTO "remix_artist" VALUES(5057,10990,1);
+INSERT INTO "remix_artist" VALUES(5058,13667,1);
+INSERT INTO "remix_artist" VALUES(5059,14461,1);
+INSERT INTO "remix_artist" VALUES(5060,4697,1);
+INSERT INTO "remix_artist" VALUES(5061,4432,1);
+INSERT INTO "remix_artist" VALUES(5061,13667,1);
+INSERT INTO "remix_artist" VALUES(5061,17324,1);
+INSERT INTO "remix_artist" VALUES(5061,18685,1);
@@ -0,0 +1,5169 @@
+INSERT INTO "remix_tag" VALUES(1,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1,'flute',1);
+INSERT INTO "remix_tag" VALUES(1,'funk',1);
+INSERT INTO "remix_tag" VALUES(1,'funky',1);
+INSERT INTO "remix_tag" VALUES(1,'happy',1);
+INSERT INTO "remix_tag" VALUES(1,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1,'koto',1);
+INSERT INTO "remix_tag" VALUES(1,'synth',1);
+INSERT INTO "remix_tag" VALUES(1,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(1,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2,'happy',1);
+INSERT INTO "remix_tag" VALUES(2,'synth',1);
+INSERT INTO "remix_tag" VALUES(2,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3,'synth',1);
+INSERT INTO "remix_tag" VALUES(3,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(3,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4,'bells',1);
+INSERT INTO "remix_tag" VALUES(4,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4,'dance',1);
+INSERT INTO "remix_tag" VALUES(4,'dark',1);
+INSERT INTO "remix_tag" VALUES(4,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4,'synth',1);
+INSERT INTO "remix_tag" VALUES(4,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4,'trance',1);
+INSERT INTO "remix_tag" VALUES(5,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(5,'dance',1);
+INSERT INTO "remix_tag" VALUES(5,'edm',1);
+INSERT INTO "remix_tag" VALUES(5,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5,'happy',1);
+INSERT INTO "remix_tag" VALUES(5,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5,'synth',1);
+INSERT INTO "remix_tag" VALUES(5,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(5,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5,'trance',1);
+INSERT INTO "remix_tag" VALUES(6,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(6,'flute',1);
+INSERT INTO "remix_tag" VALUES(6,'happy',1);
+INSERT INTO "remix_tag" VALUES(6,'harp',1);
+INSERT INTO "remix_tag" VALUES(6,'mellow',1);
+INSERT INTO "remix_tag" VALUES(6,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(6,'strings',1);
+INSERT INTO "remix_tag" VALUES(6,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(6,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(6,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(7,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(7,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(7,'happy',1);
+INSERT INTO "remix_tag" VALUES(7,'latin',1);
+INSERT INTO "remix_tag" VALUES(7,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(7,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(7,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(7,'world',1);
+INSERT INTO "remix_tag" VALUES(8,'choir',1);
+INSERT INTO "remix_tag" VALUES(8,'dark',1);
+INSERT INTO "remix_tag" VALUES(8,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(8,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(8,'electronic',1);
+INSERT INTO "remix_tag" VALUES(8,'glitching',1);
+INSERT INTO "remix_tag" VALUES(8,'industrial',1);
+INSERT INTO "remix_tag" VALUES(8,'synth',1);
+INSERT INTO "remix_tag" VALUES(8,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(8,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(9,'dance',1);
+INSERT INTO "remix_tag" VALUES(9,'disco',1);
+INSERT INTO "remix_tag" VALUES(9,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(9,'electronic',1);
+INSERT INTO "remix_tag" VALUES(9,'funky',1);
+INSERT INTO "remix_tag" VALUES(9,'happy',1);
+INSERT INTO "remix_tag" VALUES(9,'synth',1);
+INSERT INTO "remix_tag" VALUES(9,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(9,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(10,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(10,'brass',1);
+INSERT INTO "remix_tag" VALUES(10,'distortion',1);
+INSERT INTO "remix_tag" VALUES(10,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(10,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(10,'funky',1);
+INSERT INTO "remix_tag" VALUES(10,'fusion',1);
+INSERT INTO "remix_tag" VALUES(10,'jazz',1);
+INSERT INTO "remix_tag" VALUES(10,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(10,'piano',1);
+INSERT INTO "remix_tag" VALUES(10,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(10,'sitar',1);
+INSERT INTO "remix_tag" VALUES(10,'synth',1);
+INSERT INTO "remix_tag" VALUES(10,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(10,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(11,'experimental',1);
+INSERT INTO "remix_tag" VALUES(11,'funky',1);
+INSERT INTO "remix_tag" VALUES(11,'happy',1);
+INSERT INTO "remix_tag" VALUES(11,'organ',1);
+INSERT INTO "remix_tag" VALUES(11,'synth',1);
+INSERT INTO "remix_tag" VALUES(11,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(11,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(11,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(11,'trance',1);
+INSERT INTO "remix_tag" VALUES(12,'distortion',1);
+INSERT INTO "remix_tag" VALUES(12,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(12,'funky',1);
+INSERT INTO "remix_tag" VALUES(12,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(12,'industrial',1);
+INSERT INTO "remix_tag" VALUES(12,'mellow',1);
+INSERT INTO "remix_tag" VALUES(12,'piano',1);
+INSERT INTO "remix_tag" VALUES(12,'synth',1);
+INSERT INTO "remix_tag" VALUES(12,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(12,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(12,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(12,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(12,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(13,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(13,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(13,'flute',1);
+INSERT INTO "remix_tag" VALUES(13,'happy',1);
+INSERT INTO "remix_tag" VALUES(13,'harp',1);
+INSERT INTO "remix_tag" VALUES(13,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(13,'piano',1);
+INSERT INTO "remix_tag" VALUES(13,'romantic',1);
+INSERT INTO "remix_tag" VALUES(13,'solemn',1);
+INSERT INTO "remix_tag" VALUES(13,'strings',1);
+INSERT INTO "remix_tag" VALUES(13,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(13,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(13,'violin',1);
+INSERT INTO "remix_tag" VALUES(13,'wedding',1);
+INSERT INTO "remix_tag" VALUES(13,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(14,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(14,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(14,'dance',1);
+INSERT INTO "remix_tag" VALUES(14,'dnb',1);
+INSERT INTO "remix_tag" VALUES(14,'electronic',1);
+INSERT INTO "remix_tag" VALUES(14,'glitching',1);
+INSERT INTO "remix_tag" VALUES(14,'happy',1);
+INSERT INTO "remix_tag" VALUES(14,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(14,'slavic',1);
+INSERT INTO "remix_tag" VALUES(14,'strings',1);
+INSERT INTO "remix_tag" VALUES(14,'synth',1);
+INSERT INTO "remix_tag" VALUES(14,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(14,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(15,'appalachian',1);
+INSERT INTO "remix_tag" VALUES(15,'banjo',1);
+INSERT INTO "remix_tag" VALUES(15,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(15,'country',1);
+INSERT INTO "remix_tag" VALUES(15,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(15,'funny',1);
+INSERT INTO "remix_tag" VALUES(15,'goofy',1);
+INSERT INTO "remix_tag" VALUES(15,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(15,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(15,'singing',1);
+INSERT INTO "remix_tag" VALUES(15,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(15,'strings',1);
+INSERT INTO "remix_tag" VALUES(15,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(15,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(15,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(15,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(19,'collab',1);
+INSERT INTO "remix_tag" VALUES(19,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(19,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(19,'happy',1);
+INSERT INTO "remix_tag" VALUES(19,'jazz',1);
+INSERT INTO "remix_tag" VALUES(19,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(19,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(19,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(19,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(19,'medley',1);
+INSERT INTO "remix_tag" VALUES(19,'rock',1);
+INSERT INTO "remix_tag" VALUES(19,'screaming',1);
+INSERT INTO "remix_tag" VALUES(19,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(19,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(19,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(19,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(21,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(21,'electro',1);
+INSERT INTO "remix_tag" VALUES(21,'electronic',1);
+INSERT INTO "remix_tag" VALUES(21,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(21,'funky',1);
+INSERT INTO "remix_tag" VALUES(21,'happy',1);
+INSERT INTO "remix_tag" VALUES(21,'quirky',1);
+INSERT INTO "remix_tag" VALUES(21,'synth',1);
+INSERT INTO "remix_tag" VALUES(21,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(22,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(22,'duet',1);
+INSERT INTO "remix_tag" VALUES(22,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(22,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(22,'goofy',1);
+INSERT INTO "remix_tag" VALUES(22,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(22,'pop',1);
+INSERT INTO "remix_tag" VALUES(22,'quirky',1);
+INSERT INTO "remix_tag" VALUES(22,'rock',1);
+INSERT INTO "remix_tag" VALUES(22,'singing',1);
+INSERT INTO "remix_tag" VALUES(22,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(22,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(22,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(26,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(26,'distortion',1);
+INSERT INTO "remix_tag" VALUES(26,'dnb',1);
+INSERT INTO "remix_tag" VALUES(26,'edm',1);
+INSERT INTO "remix_tag" VALUES(26,'funky',1);
+INSERT INTO "remix_tag" VALUES(26,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(26,'jungle',1);
+INSERT INTO "remix_tag" VALUES(26,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(26,'quirky',1);
+INSERT INTO "remix_tag" VALUES(26,'strings',1);
+INSERT INTO "remix_tag" VALUES(26,'synth',1);
+INSERT INTO "remix_tag" VALUES(26,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(26,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(28,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(28,'dark',1);
+INSERT INTO "remix_tag" VALUES(28,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(28,'funky',1);
+INSERT INTO "remix_tag" VALUES(28,'funny',1);
+INSERT INTO "remix_tag" VALUES(28,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(28,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(28,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(28,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(28,'quintet',1);
+INSERT INTO "remix_tag" VALUES(28,'rap',1);
+INSERT INTO "remix_tag" VALUES(28,'rock',1);
+INSERT INTO "remix_tag" VALUES(28,'screaming',1);
+INSERT INTO "remix_tag" VALUES(28,'ska',1);
+INSERT INTO "remix_tag" VALUES(28,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(28,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(28,'world',1);
+INSERT INTO "remix_tag" VALUES(29,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(29,'edm',1);
+INSERT INTO "remix_tag" VALUES(29,'happy',1);
+INSERT INTO "remix_tag" VALUES(29,'piano',1);
+INSERT INTO "remix_tag" VALUES(29,'strings',1);
+INSERT INTO "remix_tag" VALUES(29,'synth',1);
+INSERT INTO "remix_tag" VALUES(29,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(29,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(29,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(30,'distortion',1);
+INSERT INTO "remix_tag" VALUES(30,'edm',1);
+INSERT INTO "remix_tag" VALUES(30,'electro',1);
+INSERT INTO "remix_tag" VALUES(30,'electronic',1);
+INSERT INTO "remix_tag" VALUES(30,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(30,'quirky',1);
+INSERT INTO "remix_tag" VALUES(30,'synth',1);
+INSERT INTO "remix_tag" VALUES(30,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(34,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(34,'edm',1);
+INSERT INTO "remix_tag" VALUES(34,'electronic',1);
+INSERT INTO "remix_tag" VALUES(34,'happy',1);
+INSERT INTO "remix_tag" VALUES(34,'medley',1);
+INSERT INTO "remix_tag" VALUES(34,'synth',1);
+INSERT INTO "remix_tag" VALUES(34,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(35,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(35,'edm',1);
+INSERT INTO "remix_tag" VALUES(35,'electronic',1);
+INSERT INTO "remix_tag" VALUES(35,'indian',1);
+INSERT INTO "remix_tag" VALUES(35,'mellow',1);
+INSERT INTO "remix_tag" VALUES(35,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(35,'sitar',1);
+INSERT INTO "remix_tag" VALUES(35,'synth',1);
+INSERT INTO "remix_tag" VALUES(35,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(37,'chill',1);
+INSERT INTO "remix_tag" VALUES(37,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(37,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(37,'jazz',1);
+INSERT INTO "remix_tag" VALUES(37,'mellow',1);
+INSERT INTO "remix_tag" VALUES(37,'piano',1);
+INSERT INTO "remix_tag" VALUES(37,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(37,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(40,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(40,'epic',1);
+INSERT INTO "remix_tag" VALUES(40,'harp',1);
+INSERT INTO "remix_tag" VALUES(40,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(40,'piano',1);
+INSERT INTO "remix_tag" VALUES(40,'solemn',1);
+INSERT INTO "remix_tag" VALUES(40,'strings',1);
+INSERT INTO "remix_tag" VALUES(40,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(41,'brass',1);
+INSERT INTO "remix_tag" VALUES(41,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(41,'disco',1);
+INSERT INTO "remix_tag" VALUES(41,'edm',1);
+INSERT INTO "remix_tag" VALUES(41,'epic',1);
+INSERT INTO "remix_tag" VALUES(41,'harp',1);
+INSERT INTO "remix_tag" VALUES(41,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(41,'synth',1);
+INSERT INTO "remix_tag" VALUES(41,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(42,'chill',1);
+INSERT INTO "remix_tag" VALUES(42,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(42,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(42,'happy',1);
+INSERT INTO "remix_tag" VALUES(42,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(42,'latin',1);
+INSERT INTO "remix_tag" VALUES(42,'mellow',1);
+INSERT INTO "remix_tag" VALUES(42,'synth',1);
+INSERT INTO "remix_tag" VALUES(42,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(42,'world',1);
+INSERT INTO "remix_tag" VALUES(44,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(44,'brass',1);
+INSERT INTO "remix_tag" VALUES(44,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(44,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(44,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(44,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(44,'electro',1);
+INSERT INTO "remix_tag" VALUES(44,'electronic',1);
+INSERT INTO "remix_tag" VALUES(44,'glitching',1);
+INSERT INTO "remix_tag" VALUES(44,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(44,'mellow',1);
+INSERT INTO "remix_tag" VALUES(44,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(44,'quirky',1);
+INSERT INTO "remix_tag" VALUES(44,'rock',1);
+INSERT INTO "remix_tag" VALUES(44,'strings',1);
+INSERT INTO "remix_tag" VALUES(44,'synth',1);
+INSERT INTO "remix_tag" VALUES(44,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(45,'accordion',1);
+INSERT INTO "remix_tag" VALUES(45,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(45,'folk',1);
+INSERT INTO "remix_tag" VALUES(45,'marimba',1);
+INSERT INTO "remix_tag" VALUES(45,'mellow',1);
+INSERT INTO "remix_tag" VALUES(45,'oboe',1);
+INSERT INTO "remix_tag" VALUES(45,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(45,'world',1);
+INSERT INTO "remix_tag" VALUES(46,'chill',1);
+INSERT INTO "remix_tag" VALUES(46,'dark',1);
+INSERT INTO "remix_tag" VALUES(46,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(46,'edm',1);
+INSERT INTO "remix_tag" VALUES(46,'industrial',1);
+INSERT INTO "remix_tag" VALUES(46,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(46,'organ',1);
+INSERT INTO "remix_tag" VALUES(46,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(46,'synth',1);
+INSERT INTO "remix_tag" VALUES(46,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(48,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(48,'funny',1);
+INSERT INTO "remix_tag" VALUES(48,'goofy',1);
+INSERT INTO "remix_tag" VALUES(48,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(48,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(48,'pop',1);
+INSERT INTO "remix_tag" VALUES(48,'synth',1);
+INSERT INTO "remix_tag" VALUES(48,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(48,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(50,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(50,'distortion',1);
+INSERT INTO "remix_tag" VALUES(50,'edm',1);
+INSERT INTO "remix_tag" VALUES(50,'electro',1);
+INSERT INTO "remix_tag" VALUES(50,'funky',1);
+INSERT INTO "remix_tag" VALUES(50,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(50,'quirky',1);
+INSERT INTO "remix_tag" VALUES(50,'synth',1);
+INSERT INTO "remix_tag" VALUES(50,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(53,'distortion',1);
+INSERT INTO "remix_tag" VALUES(53,'edm',1);
+INSERT INTO "remix_tag" VALUES(53,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(53,'electro',1);
+INSERT INTO "remix_tag" VALUES(53,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(53,'mellow',1);
+INSERT INTO "remix_tag" VALUES(53,'quirky',1);
+INSERT INTO "remix_tag" VALUES(53,'synth',1);
+INSERT INTO "remix_tag" VALUES(53,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(53,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(54,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(54,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(54,'epic',1);
+INSERT INTO "remix_tag" VALUES(54,'piano',1);
+INSERT INTO "remix_tag" VALUES(54,'rock',1);
+INSERT INTO "remix_tag" VALUES(54,'solemn',1);
+INSERT INTO "remix_tag" VALUES(54,'strings',1);
+INSERT INTO "remix_tag" VALUES(54,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(54,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(55,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(55,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(55,'flute',1);
+INSERT INTO "remix_tag" VALUES(55,'jazz',1);
+INSERT INTO "remix_tag" VALUES(55,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(55,'mellow',1);
+INSERT INTO "remix_tag" VALUES(55,'piano',1);
+INSERT INTO "remix_tag" VALUES(55,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(55,'trio',1);
+INSERT INTO "remix_tag" VALUES(58,'distortion',1);
+INSERT INTO "remix_tag" VALUES(58,'edm',1);
+INSERT INTO "remix_tag" VALUES(58,'electro',1);
+INSERT INTO "remix_tag" VALUES(58,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(58,'funky',1);
+INSERT INTO "remix_tag" VALUES(58,'quirky',1);
+INSERT INTO "remix_tag" VALUES(58,'synth',1);
+INSERT INTO "remix_tag" VALUES(58,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(59,'distortion',1);
+INSERT INTO "remix_tag" VALUES(59,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(59,'edm',1);
+INSERT INTO "remix_tag" VALUES(59,'funky',1);
+INSERT INTO "remix_tag" VALUES(59,'happy',1);
+INSERT INTO "remix_tag" VALUES(59,'quirky',1);
+INSERT INTO "remix_tag" VALUES(59,'strings',1);
+INSERT INTO "remix_tag" VALUES(59,'synth',1);
+INSERT INTO "remix_tag" VALUES(59,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(59,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(60,'ambient',1);
+INSERT INTO "remix_tag" VALUES(60,'chill',1);
+INSERT INTO "remix_tag" VALUES(60,'dark',1);
+INSERT INTO "remix_tag" VALUES(60,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(60,'jungle',1);
+INSERT INTO "remix_tag" VALUES(60,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(60,'strings',1);
+INSERT INTO "remix_tag" VALUES(60,'synth',1);
+INSERT INTO "remix_tag" VALUES(60,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(61,'edm',1);
+INSERT INTO "remix_tag" VALUES(61,'electronic',1);
+INSERT INTO "remix_tag" VALUES(61,'glitching',1);
+INSERT INTO "remix_tag" VALUES(61,'happy',1);
+INSERT INTO "remix_tag" VALUES(61,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(61,'synth',1);
+INSERT INTO "remix_tag" VALUES(61,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(62,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(62,'dance',1);
+INSERT INTO "remix_tag" VALUES(62,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(62,'electronic',1);
+INSERT INTO "remix_tag" VALUES(62,'happy',1);
+INSERT INTO "remix_tag" VALUES(62,'synth',1);
+INSERT INTO "remix_tag" VALUES(62,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(62,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(63,'ambient',1);
+INSERT INTO "remix_tag" VALUES(63,'chill',1);
+INSERT INTO "remix_tag" VALUES(63,'choir',1);
+INSERT INTO "remix_tag" VALUES(63,'distortion',1);
+INSERT INTO "remix_tag" VALUES(63,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(63,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(63,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(63,'mellow',1);
+INSERT INTO "remix_tag" VALUES(63,'rock',1);
+INSERT INTO "remix_tag" VALUES(63,'sad',1);
+INSERT INTO "remix_tag" VALUES(63,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(63,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(64,'bells',1);
+INSERT INTO "remix_tag" VALUES(64,'dance',1);
+INSERT INTO "remix_tag" VALUES(64,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(64,'happy',1);
+INSERT INTO "remix_tag" VALUES(64,'marimba',1);
+INSERT INTO "remix_tag" VALUES(64,'slavic',1);
+INSERT INTO "remix_tag" VALUES(64,'strings',1);
+INSERT INTO "remix_tag" VALUES(64,'synth',1);
+INSERT INTO "remix_tag" VALUES(64,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(64,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(65,'chill',1);
+INSERT INTO "remix_tag" VALUES(65,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(65,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(65,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(65,'mellow',1);
+INSERT INTO "remix_tag" VALUES(65,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(65,'piano',1);
+INSERT INTO "remix_tag" VALUES(65,'synth',1);
+INSERT INTO "remix_tag" VALUES(65,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(65,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(66,'happy',1);
+INSERT INTO "remix_tag" VALUES(66,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(66,'quirky',1);
+INSERT INTO "remix_tag" VALUES(66,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(66,'synth',1);
+INSERT INTO "remix_tag" VALUES(66,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(66,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(66,'turntable',1);
+INSERT INTO "remix_tag" VALUES(67,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(67,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(67,'dance',1);
+INSERT INTO "remix_tag" VALUES(67,'dnb',1);
+INSERT INTO "remix_tag" VALUES(67,'electronic',1);
+INSERT INTO "remix_tag" VALUES(67,'happy',1);
+INSERT INTO "remix_tag" VALUES(67,'synth',1);
+INSERT INTO "remix_tag" VALUES(67,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(67,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(68,'ambient',1);
+INSERT INTO "remix_tag" VALUES(68,'choir',1);
+INSERT INTO "remix_tag" VALUES(68,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(68,'harp',1);
+INSERT INTO "remix_tag" VALUES(68,'medley',1);
+INSERT INTO "remix_tag" VALUES(68,'oboe',1);
+INSERT INTO "remix_tag" VALUES(68,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(68,'piano',1);
+INSERT INTO "remix_tag" VALUES(68,'romantic',1);
+INSERT INTO "remix_tag" VALUES(68,'sad',1);
+INSERT INTO "remix_tag" VALUES(68,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(68,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(69,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(69,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(69,'dark',1);
+INSERT INTO "remix_tag" VALUES(69,'distortion',1);
+INSERT INTO "remix_tag" VALUES(69,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(69,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(69,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(69,'medley',1);
+INSERT INTO "remix_tag" VALUES(69,'metal',1);
+INSERT INTO "remix_tag" VALUES(69,'rock',1);
+INSERT INTO "remix_tag" VALUES(69,'synth',1);
+INSERT INTO "remix_tag" VALUES(69,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(69,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(71,'brass',1);
+INSERT INTO "remix_tag" VALUES(71,'dance',1);
+INSERT INTO "remix_tag" VALUES(71,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(71,'flute',1);
+INSERT INTO "remix_tag" VALUES(71,'happy',1);
+INSERT INTO "remix_tag" VALUES(71,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(71,'medley',1);
+INSERT INTO "remix_tag" VALUES(71,'piano',1);
+INSERT INTO "remix_tag" VALUES(71,'strings',1);
+INSERT INTO "remix_tag" VALUES(71,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(71,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(71,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(71,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(71,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(72,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(72,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(72,'chill',1);
+INSERT INTO "remix_tag" VALUES(72,'dnb',1);
+INSERT INTO "remix_tag" VALUES(72,'edm',1);
+INSERT INTO "remix_tag" VALUES(72,'glitching',1);
+INSERT INTO "remix_tag" VALUES(72,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(72,'piano',1);
+INSERT INTO "remix_tag" VALUES(72,'synth',1);
+INSERT INTO "remix_tag" VALUES(72,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(72,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(73,'dance',1);
+INSERT INTO "remix_tag" VALUES(73,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(73,'happy',1);
+INSERT INTO "remix_tag" VALUES(73,'synth',1);
+INSERT INTO "remix_tag" VALUES(73,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(73,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(73,'trance',1);
+INSERT INTO "remix_tag" VALUES(76,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(76,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(76,'dnb',1);
+INSERT INTO "remix_tag" VALUES(76,'electronic',1);
+INSERT INTO "remix_tag" VALUES(76,'glitching',1);
+INSERT INTO "remix_tag" VALUES(76,'happy',1);
+INSERT INTO "remix_tag" VALUES(76,'synth',1);
+INSERT INTO "remix_tag" VALUES(76,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(76,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(77,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(77,'chill',1);
+INSERT INTO "remix_tag" VALUES(77,'dnb',1);
+INSERT INTO "remix_tag" VALUES(77,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(77,'electronic',1);
+INSERT INTO "remix_tag" VALUES(77,'glitching',1);
+INSERT INTO "remix_tag" VALUES(77,'jazz',1);
+INSERT INTO "remix_tag" VALUES(77,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(77,'strings',1);
+INSERT INTO "remix_tag" VALUES(77,'synth',1);
+INSERT INTO "remix_tag" VALUES(77,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(77,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(78,'edm',1);
+INSERT INTO "remix_tag" VALUES(78,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(78,'electronic',1);
+INSERT INTO "remix_tag" VALUES(78,'glitching',1);
+INSERT INTO "remix_tag" VALUES(78,'happy',1);
+INSERT INTO "remix_tag" VALUES(78,'piano',1);
+INSERT INTO "remix_tag" VALUES(78,'strings',1);
+INSERT INTO "remix_tag" VALUES(78,'synth',1);
+INSERT INTO "remix_tag" VALUES(78,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(78,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(80,'dark',1);
+INSERT INTO "remix_tag" VALUES(80,'electronic',1);
+INSERT INTO "remix_tag" VALUES(80,'glitching',1);
+INSERT INTO "remix_tag" VALUES(80,'house',1);
+INSERT INTO "remix_tag" VALUES(80,'synth',1);
+INSERT INTO "remix_tag" VALUES(80,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(80,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(81,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(81,'electronic',1);
+INSERT INTO "remix_tag" VALUES(81,'glitching',1);
+INSERT INTO "remix_tag" VALUES(81,'happy',1);
+INSERT INTO "remix_tag" VALUES(81,'synth',1);
+INSERT INTO "remix_tag" VALUES(81,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(81,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(82,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(82,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(82,'happy',1);
+INSERT INTO "remix_tag" VALUES(82,'jazz',1);
+INSERT INTO "remix_tag" VALUES(82,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(82,'latin',1);
+INSERT INTO "remix_tag" VALUES(82,'piano',1);
+INSERT INTO "remix_tag" VALUES(82,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(82,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(82,'trio',1);
+INSERT INTO "remix_tag" VALUES(83,'distortion',1);
+INSERT INTO "remix_tag" VALUES(83,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(83,'electronic',1);
+INSERT INTO "remix_tag" VALUES(83,'happy',1);
+INSERT INTO "remix_tag" VALUES(83,'organ',1);
+INSERT INTO "remix_tag" VALUES(83,'quartet',1);
+INSERT INTO "remix_tag" VALUES(83,'rock',1);
+INSERT INTO "remix_tag" VALUES(83,'synth',1);
+INSERT INTO "remix_tag" VALUES(83,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(83,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(84,'dance',1);
+INSERT INTO "remix_tag" VALUES(84,'dark',1);
+INSERT INTO "remix_tag" VALUES(84,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(84,'electronic',1);
+INSERT INTO "remix_tag" VALUES(84,'marimba',1);
+INSERT INTO "remix_tag" VALUES(84,'synth',1);
+INSERT INTO "remix_tag" VALUES(84,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(84,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(85,'bells',1);
+INSERT INTO "remix_tag" VALUES(85,'brass',1);
+INSERT INTO "remix_tag" VALUES(85,'edm',1);
+INSERT INTO "remix_tag" VALUES(85,'electronic',1);
+INSERT INTO "remix_tag" VALUES(85,'happy',1);
+INSERT INTO "remix_tag" VALUES(85,'synth',1);
+INSERT INTO "remix_tag" VALUES(85,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(85,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(87,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(87,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(87,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(87,'edm',1);
+INSERT INTO "remix_tag" VALUES(87,'halloween',1);
+INSERT INTO "remix_tag" VALUES(87,'organ',1);
+INSERT INTO "remix_tag" VALUES(87,'spooky',1);
+INSERT INTO "remix_tag" VALUES(87,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(87,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(88,'bells',1);
+INSERT INTO "remix_tag" VALUES(88,'chill',1);
+INSERT INTO "remix_tag" VALUES(88,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(88,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(88,'mellow',1);
+INSERT INTO "remix_tag" VALUES(88,'sitar',1);
+INSERT INTO "remix_tag" VALUES(88,'synth',1);
+INSERT INTO "remix_tag" VALUES(88,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(88,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(88,'world',1);
+INSERT INTO "remix_tag" VALUES(89,'bells',1);
+INSERT INTO "remix_tag" VALUES(89,'dance',1);
+INSERT INTO "remix_tag" VALUES(89,'electronic',1);
+INSERT INTO "remix_tag" VALUES(89,'happy',1);
+INSERT INTO "remix_tag" VALUES(89,'synth',1);
+INSERT INTO "remix_tag" VALUES(89,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(89,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(90,'disco',1);
+INSERT INTO "remix_tag" VALUES(90,'edm',1);
+INSERT INTO "remix_tag" VALUES(90,'electronic',1);
+INSERT INTO "remix_tag" VALUES(90,'funky',1);
+INSERT INTO "remix_tag" VALUES(90,'spooky',1);
+INSERT INTO "remix_tag" VALUES(90,'synth',1);
+INSERT INTO "remix_tag" VALUES(90,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(90,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(93,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(93,'edm',1);
+INSERT INTO "remix_tag" VALUES(93,'electronic',1);
+INSERT INTO "remix_tag" VALUES(93,'piano',1);
+INSERT INTO "remix_tag" VALUES(93,'quirky',1);
+INSERT INTO "remix_tag" VALUES(93,'synth',1);
+INSERT INTO "remix_tag" VALUES(93,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(93,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(94,'happy',1);
+INSERT INTO "remix_tag" VALUES(94,'synth',1);
+INSERT INTO "remix_tag" VALUES(94,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(94,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(94,'trance',1);
+INSERT INTO "remix_tag" VALUES(95,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(95,'chill',1);
+INSERT INTO "remix_tag" VALUES(95,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(95,'house',1);
+INSERT INTO "remix_tag" VALUES(95,'jazz',1);
+INSERT INTO "remix_tag" VALUES(95,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(95,'piano',1);
+INSERT INTO "remix_tag" VALUES(95,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(95,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(95,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(96,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(96,'distortion',1);
+INSERT INTO "remix_tag" VALUES(96,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(96,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(96,'funky',1);
+INSERT INTO "remix_tag" VALUES(96,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(96,'rock',1);
+INSERT INTO "remix_tag" VALUES(96,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(96,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(96,'turntable',1);
+INSERT INTO "remix_tag" VALUES(98,'brass',1);
+INSERT INTO "remix_tag" VALUES(98,'dance',1);
+INSERT INTO "remix_tag" VALUES(98,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(98,'electronic',1);
+INSERT INTO "remix_tag" VALUES(98,'happy',1);
+INSERT INTO "remix_tag" VALUES(98,'synth',1);
+INSERT INTO "remix_tag" VALUES(98,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(98,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(100,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(100,'edm',1);
+INSERT INTO "remix_tag" VALUES(100,'electronic',1);
+INSERT INTO "remix_tag" VALUES(100,'happy',1);
+INSERT INTO "remix_tag" VALUES(100,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(100,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(102,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(102,'dance',1);
+INSERT INTO "remix_tag" VALUES(102,'dark',1);
+INSERT INTO "remix_tag" VALUES(102,'distortion',1);
+INSERT INTO "remix_tag" VALUES(102,'edm',1);
+INSERT INTO "remix_tag" VALUES(102,'electronic',1);
+INSERT INTO "remix_tag" VALUES(102,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(102,'piano',1);
+INSERT INTO "remix_tag" VALUES(102,'strings',1);
+INSERT INTO "remix_tag" VALUES(102,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(102,'synth',1);
+INSERT INTO "remix_tag" VALUES(102,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(105,'distortion',1);
+INSERT INTO "remix_tag" VALUES(105,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(105,'edm',1);
+INSERT INTO "remix_tag" VALUES(105,'electronic',1);
+INSERT INTO "remix_tag" VALUES(105,'happy',1);
+INSERT INTO "remix_tag" VALUES(105,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(105,'mellow',1);
+INSERT INTO "remix_tag" VALUES(105,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(105,'synth',1);
+INSERT INTO "remix_tag" VALUES(105,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(105,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(109,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(109,'chill',1);
+INSERT INTO "remix_tag" VALUES(109,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(109,'flute',1);
+INSERT INTO "remix_tag" VALUES(109,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(109,'mellow',1);
+INSERT INTO "remix_tag" VALUES(109,'new-age',1);
+INSERT INTO "remix_tag" VALUES(109,'strings',1);
+INSERT INTO "remix_tag" VALUES(109,'synth',1);
+INSERT INTO "remix_tag" VALUES(109,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(110,'dance',1);
+INSERT INTO "remix_tag" VALUES(110,'distortion',1);
+INSERT INTO "remix_tag" VALUES(110,'edm',1);
+INSERT INTO "remix_tag" VALUES(110,'electro',1);
+INSERT INTO "remix_tag" VALUES(110,'funky',1);
+INSERT INTO "remix_tag" VALUES(110,'quirky',1);
+INSERT INTO "remix_tag" VALUES(110,'synth',1);
+INSERT INTO "remix_tag" VALUES(110,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(111,'dark',1);
+INSERT INTO "remix_tag" VALUES(111,'distortion',1);
+INSERT INTO "remix_tag" VALUES(111,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(111,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(111,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(111,'synth',1);
+INSERT INTO "remix_tag" VALUES(111,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(112,'dance',1);
+INSERT INTO "remix_tag" VALUES(112,'dark',1);
+INSERT INTO "remix_tag" VALUES(112,'edm',1);
+INSERT INTO "remix_tag" VALUES(112,'electronic',1);
+INSERT INTO "remix_tag" VALUES(112,'epic',1);
+INSERT INTO "remix_tag" VALUES(112,'synth',1);
+INSERT INTO "remix_tag" VALUES(112,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(112,'trance',1);
+INSERT INTO "remix_tag" VALUES(112,'workout',1);
+INSERT INTO "remix_tag" VALUES(115,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(115,'bells',1);
+INSERT INTO "remix_tag" VALUES(115,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(115,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(115,'epic',1);
+INSERT INTO "remix_tag" VALUES(115,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(115,'strings',1);
+INSERT INTO "remix_tag" VALUES(115,'synth',1);
+INSERT INTO "remix_tag" VALUES(115,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(118,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(118,'dark',1);
+INSERT INTO "remix_tag" VALUES(118,'distortion',1);
+INSERT INTO "remix_tag" VALUES(118,'edm',1);
+INSERT INTO "remix_tag" VALUES(118,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(118,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(118,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(118,'rock',1);
+INSERT INTO "remix_tag" VALUES(118,'synth',1);
+INSERT INTO "remix_tag" VALUES(118,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(118,'workout',1);
+INSERT INTO "remix_tag" VALUES(120,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(120,'angry',1);
+INSERT INTO "remix_tag" VALUES(120,'dark',1);
+INSERT INTO "remix_tag" VALUES(120,'distortion',1);
+INSERT INTO "remix_tag" VALUES(120,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(120,'edm',1);
+INSERT INTO "remix_tag" VALUES(120,'electronic',1);
+INSERT INTO "remix_tag" VALUES(120,'industrial',1);
+INSERT INTO "remix_tag" VALUES(120,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(120,'synth',1);
+INSERT INTO "remix_tag" VALUES(120,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(122,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(122,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(122,'dnb',1);
+INSERT INTO "remix_tag" VALUES(122,'electronic',1);
+INSERT INTO "remix_tag" VALUES(122,'epic',1);
+INSERT INTO "remix_tag" VALUES(122,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(122,'strings',1);
+INSERT INTO "remix_tag" VALUES(122,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(123,'ballad',1);
+INSERT INTO "remix_tag" VALUES(123,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(123,'piano',1);
+INSERT INTO "remix_tag" VALUES(123,'romantic',1);
+INSERT INTO "remix_tag" VALUES(123,'sad',1);
+INSERT INTO "remix_tag" VALUES(123,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(123,'strings',1);
+INSERT INTO "remix_tag" VALUES(123,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(124,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(124,'edm',1);
+INSERT INTO "remix_tag" VALUES(124,'epic',1);
+INSERT INTO "remix_tag" VALUES(124,'flute',1);
+INSERT INTO "remix_tag" VALUES(124,'happy',1);
+INSERT INTO "remix_tag" VALUES(124,'piano',1);
+INSERT INTO "remix_tag" VALUES(124,'strings',1);
+INSERT INTO "remix_tag" VALUES(124,'synth',1);
+INSERT INTO "remix_tag" VALUES(124,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(126,'chill',1);
+INSERT INTO "remix_tag" VALUES(126,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(126,'edm',1);
+INSERT INTO "remix_tag" VALUES(126,'funky',1);
+INSERT INTO "remix_tag" VALUES(126,'reggae',1);
+INSERT INTO "remix_tag" VALUES(126,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(126,'synth',1);
+INSERT INTO "remix_tag" VALUES(126,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(127,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(127,'dark',1);
+INSERT INTO "remix_tag" VALUES(127,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(127,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(127,'epic',1);
+INSERT INTO "remix_tag" VALUES(127,'halloween',1);
+INSERT INTO "remix_tag" VALUES(127,'piano',1);
+INSERT INTO "remix_tag" VALUES(127,'spooky',1);
+INSERT INTO "remix_tag" VALUES(127,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(127,'synth',1);
+INSERT INTO "remix_tag" VALUES(127,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(127,'violin',1);
+INSERT INTO "remix_tag" VALUES(129,'ambient',1);
+INSERT INTO "remix_tag" VALUES(129,'chill',1);
+INSERT INTO "remix_tag" VALUES(129,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(129,'epic',1);
+INSERT INTO "remix_tag" VALUES(129,'new-age',1);
+INSERT INTO "remix_tag" VALUES(129,'solemn',1);
+INSERT INTO "remix_tag" VALUES(129,'strings',1);
+INSERT INTO "remix_tag" VALUES(129,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(130,'classical',1);
+INSERT INTO "remix_tag" VALUES(130,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(130,'flute',1);
+INSERT INTO "remix_tag" VALUES(130,'meditation',1);
+INSERT INTO "remix_tag" VALUES(130,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(130,'new-age',1);
+INSERT INTO "remix_tag" VALUES(130,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(130,'piano',1);
+INSERT INTO "remix_tag" VALUES(130,'sad',1);
+INSERT INTO "remix_tag" VALUES(130,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(130,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(130,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(132,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(132,'dance',1);
+INSERT INTO "remix_tag" VALUES(132,'edm',1);
+INSERT INTO "remix_tag" VALUES(132,'electro',1);
+INSERT INTO "remix_tag" VALUES(132,'electronic',1);
+INSERT INTO "remix_tag" VALUES(132,'happy',1);
+INSERT INTO "remix_tag" VALUES(132,'quirky',1);
+INSERT INTO "remix_tag" VALUES(132,'synth',1);
+INSERT INTO "remix_tag" VALUES(132,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(132,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(134,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(134,'distortion',1);
+INSERT INTO "remix_tag" VALUES(134,'edm',1);
+INSERT INTO "remix_tag" VALUES(134,'funky',1);
+INSERT INTO "remix_tag" VALUES(134,'glitching',1);
+INSERT INTO "remix_tag" VALUES(134,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(134,'strings',1);
+INSERT INTO "remix_tag" VALUES(134,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(134,'synth',1);
+INSERT INTO "remix_tag" VALUES(134,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(137,'chill',1);
+INSERT INTO "remix_tag" VALUES(137,'edm',1);
+INSERT INTO "remix_tag" VALUES(137,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(137,'electro',1);
+INSERT INTO "remix_tag" VALUES(137,'mellow',1);
+INSERT INTO "remix_tag" VALUES(137,'synth',1);
+INSERT INTO "remix_tag" VALUES(137,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(139,'classical',1);
+INSERT INTO "remix_tag" VALUES(139,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(139,'flute',1);
+INSERT INTO "remix_tag" VALUES(139,'piano',1);
+INSERT INTO "remix_tag" VALUES(139,'romantic',1);
+INSERT INTO "remix_tag" VALUES(139,'sad',1);
+INSERT INTO "remix_tag" VALUES(139,'solo',1);
+INSERT INTO "remix_tag" VALUES(139,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(139,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(140,'ambient',1);
+INSERT INTO "remix_tag" VALUES(140,'chill',1);
+INSERT INTO "remix_tag" VALUES(140,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(140,'mellow',1);
+INSERT INTO "remix_tag" VALUES(140,'piano',1);
+INSERT INTO "remix_tag" VALUES(140,'strings',1);
+INSERT INTO "remix_tag" VALUES(140,'synth',1);
+INSERT INTO "remix_tag" VALUES(140,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(140,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(143,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(143,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(143,'compo',1);
+INSERT INTO "remix_tag" VALUES(143,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(143,'electronic',1);
+INSERT INTO "remix_tag" VALUES(143,'experimental',1);
+INSERT INTO "remix_tag" VALUES(143,'piano',1);
+INSERT INTO "remix_tag" VALUES(143,'quirky',1);
+INSERT INTO "remix_tag" VALUES(143,'strings',1);
+INSERT INTO "remix_tag" VALUES(143,'synth',1);
+INSERT INTO "remix_tag" VALUES(143,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(143,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(143,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(143,'workout',1);
+INSERT INTO "remix_tag" VALUES(145,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(145,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(145,'edm',1);
+INSERT INTO "remix_tag" VALUES(145,'electro',1);
+INSERT INTO "remix_tag" VALUES(145,'electronic',1);
+INSERT INTO "remix_tag" VALUES(145,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(145,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(145,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(145,'synth',1);
+INSERT INTO "remix_tag" VALUES(145,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(145,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(146,'compo',1);
+INSERT INTO "remix_tag" VALUES(146,'electronic',1);
+INSERT INTO "remix_tag" VALUES(146,'flute',1);
+INSERT INTO "remix_tag" VALUES(146,'funky',1);
+INSERT INTO "remix_tag" VALUES(146,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(146,'jazz',1);
+INSERT INTO "remix_tag" VALUES(146,'latin',1);
+INSERT INTO "remix_tag" VALUES(146,'mellow',1);
+INSERT INTO "remix_tag" VALUES(146,'piano',1);
+INSERT INTO "remix_tag" VALUES(146,'strings',1);
+INSERT INTO "remix_tag" VALUES(146,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(146,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(148,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(148,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(148,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(148,'compo',1);
+INSERT INTO "remix_tag" VALUES(148,'edm',1);
+INSERT INTO "remix_tag" VALUES(148,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(148,'electronic',1);
+INSERT INTO "remix_tag" VALUES(148,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(148,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(148,'marimba',1);
+INSERT INTO "remix_tag" VALUES(148,'piano',1);
+INSERT INTO "remix_tag" VALUES(148,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(148,'synth',1);
+INSERT INTO "remix_tag" VALUES(148,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(149,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(149,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(149,'edm',1);
+INSERT INTO "remix_tag" VALUES(149,'electronic',1);
+INSERT INTO "remix_tag" VALUES(149,'japanese',1);
+INSERT INTO "remix_tag" VALUES(149,'koto',1);
+INSERT INTO "remix_tag" VALUES(149,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(149,'synth',1);
+INSERT INTO "remix_tag" VALUES(149,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(150,'bells',1);
+INSERT INTO "remix_tag" VALUES(150,'brass',1);
+INSERT INTO "remix_tag" VALUES(150,'chill',1);
+INSERT INTO "remix_tag" VALUES(150,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(150,'classical',1);
+INSERT INTO "remix_tag" VALUES(150,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(150,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(150,'harp',1);
+INSERT INTO "remix_tag" VALUES(150,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(150,'marimba',1);
+INSERT INTO "remix_tag" VALUES(150,'meditation',1);
+INSERT INTO "remix_tag" VALUES(150,'medley',1);
+INSERT INTO "remix_tag" VALUES(150,'mellow',1);
+INSERT INTO "remix_tag" VALUES(150,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(150,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(150,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(150,'strings',1);
+INSERT INTO "remix_tag" VALUES(150,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(150,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(151,'chill',1);
+INSERT INTO "remix_tag" VALUES(151,'experimental',1);
+INSERT INTO "remix_tag" VALUES(151,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(151,'latin',1);
+INSERT INTO "remix_tag" VALUES(151,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(151,'marimba',1);
+INSERT INTO "remix_tag" VALUES(151,'strings',1);
+INSERT INTO "remix_tag" VALUES(151,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(151,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(152,'ballad',1);
+INSERT INTO "remix_tag" VALUES(152,'chill',1);
+INSERT INTO "remix_tag" VALUES(152,'duet',1);
+INSERT INTO "remix_tag" VALUES(152,'meditation',1);
+INSERT INTO "remix_tag" VALUES(152,'mellow',1);
+INSERT INTO "remix_tag" VALUES(152,'oboe',1);
+INSERT INTO "remix_tag" VALUES(152,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(152,'piano',1);
+INSERT INTO "remix_tag" VALUES(152,'romantic',1);
+INSERT INTO "remix_tag" VALUES(152,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(152,'strings',1);
+INSERT INTO "remix_tag" VALUES(152,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(155,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(155,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(155,'edm',1);
+INSERT INTO "remix_tag" VALUES(155,'electro',1);
+INSERT INTO "remix_tag" VALUES(155,'electronic',1);
+INSERT INTO "remix_tag" VALUES(155,'happy',1);
+INSERT INTO "remix_tag" VALUES(155,'house',1);
+INSERT INTO "remix_tag" VALUES(155,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(155,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(155,'piano',1);
+INSERT INTO "remix_tag" VALUES(155,'quirky',1);
+INSERT INTO "remix_tag" VALUES(155,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(155,'strings',1);
+INSERT INTO "remix_tag" VALUES(155,'synth',1);
+INSERT INTO "remix_tag" VALUES(155,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(155,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(155,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(156,'chill',1);
+INSERT INTO "remix_tag" VALUES(156,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(156,'jazz',1);
+INSERT INTO "remix_tag" VALUES(156,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(156,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(156,'piano',1);
+INSERT INTO "remix_tag" VALUES(156,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(156,'swing',1);
+INSERT INTO "remix_tag" VALUES(156,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(156,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(157,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(157,'brass',1);
+INSERT INTO "remix_tag" VALUES(157,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(157,'experimental',1);
+INSERT INTO "remix_tag" VALUES(157,'piano',1);
+INSERT INTO "remix_tag" VALUES(157,'strings',1);
+INSERT INTO "remix_tag" VALUES(157,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(157,'synth',1);
+INSERT INTO "remix_tag" VALUES(157,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(157,'workout',1);
+INSERT INTO "remix_tag" VALUES(158,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(158,'dance',1);
+INSERT INTO "remix_tag" VALUES(158,'distortion',1);
+INSERT INTO "remix_tag" VALUES(158,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(158,'happy',1);
+INSERT INTO "remix_tag" VALUES(158,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(158,'synth',1);
+INSERT INTO "remix_tag" VALUES(158,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(158,'workout',1);
+INSERT INTO "remix_tag" VALUES(159,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(159,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(159,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(159,'experimental',1);
+INSERT INTO "remix_tag" VALUES(159,'happy',1);
+INSERT INTO "remix_tag" VALUES(159,'mellow',1);
+INSERT INTO "remix_tag" VALUES(159,'piano',1);
+INSERT INTO "remix_tag" VALUES(159,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(160,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(160,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(160,'edm',1);
+INSERT INTO "remix_tag" VALUES(160,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(160,'synth',1);
+INSERT INTO "remix_tag" VALUES(160,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(161,'chill',1);
+INSERT INTO "remix_tag" VALUES(161,'dark',1);
+INSERT INTO "remix_tag" VALUES(161,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(161,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(161,'funky',1);
+INSERT INTO "remix_tag" VALUES(161,'mellow',1);
+INSERT INTO "remix_tag" VALUES(161,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(161,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(161,'synth',1);
+INSERT INTO "remix_tag" VALUES(161,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(161,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(161,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(162,'chill',1);
+INSERT INTO "remix_tag" VALUES(162,'dark',1);
+INSERT INTO "remix_tag" VALUES(162,'distortion',1);
+INSERT INTO "remix_tag" VALUES(162,'dub',1);
+INSERT INTO "remix_tag" VALUES(162,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(162,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(162,'spooky',1);
+INSERT INTO "remix_tag" VALUES(162,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(162,'synth',1);
+INSERT INTO "remix_tag" VALUES(162,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(162,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(163,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(163,'angry',1);
+INSERT INTO "remix_tag" VALUES(163,'dark',1);
+INSERT INTO "remix_tag" VALUES(163,'distortion',1);
+INSERT INTO "remix_tag" VALUES(163,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(163,'goofy',1);
+INSERT INTO "remix_tag" VALUES(163,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(163,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(163,'metal',1);
+INSERT INTO "remix_tag" VALUES(163,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(163,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(163,'screaming',1);
+INSERT INTO "remix_tag" VALUES(163,'spooky',1);
+INSERT INTO "remix_tag" VALUES(163,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(163,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(163,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(165,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(165,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(165,'dark',1);
+INSERT INTO "remix_tag" VALUES(165,'dnb',1);
+INSERT INTO "remix_tag" VALUES(165,'piano',1);
+INSERT INTO "remix_tag" VALUES(165,'strings',1);
+INSERT INTO "remix_tag" VALUES(165,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(165,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(166,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(166,'flute',1);
+INSERT INTO "remix_tag" VALUES(166,'happy',1);
+INSERT INTO "remix_tag" VALUES(166,'harp',1);
+INSERT INTO "remix_tag" VALUES(166,'new-age',1);
+INSERT INTO "remix_tag" VALUES(166,'oboe',1);
+INSERT INTO "remix_tag" VALUES(166,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(166,'strings',1);
+INSERT INTO "remix_tag" VALUES(166,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(166,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(166,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(166,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(167,'brass',1);
+INSERT INTO "remix_tag" VALUES(167,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(167,'goofy',1);
+INSERT INTO "remix_tag" VALUES(167,'happy',1);
+INSERT INTO "remix_tag" VALUES(167,'ska',1);
+INSERT INTO "remix_tag" VALUES(167,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(167,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(168,'electro',1);
+INSERT INTO "remix_tag" VALUES(168,'solemn',1);
+INSERT INTO "remix_tag" VALUES(168,'strings',1);
+INSERT INTO "remix_tag" VALUES(168,'synth',1);
+INSERT INTO "remix_tag" VALUES(168,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(168,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(170,'chill',1);
+INSERT INTO "remix_tag" VALUES(170,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(170,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(170,'mellow',1);
+INSERT INTO "remix_tag" VALUES(170,'piano',1);
+INSERT INTO "remix_tag" VALUES(170,'synth',1);
+INSERT INTO "remix_tag" VALUES(170,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(170,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(171,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(171,'chill',1);
+INSERT INTO "remix_tag" VALUES(171,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(171,'flute',1);
+INSERT INTO "remix_tag" VALUES(171,'mellow',1);
+INSERT INTO "remix_tag" VALUES(171,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(171,'piano',1);
+INSERT INTO "remix_tag" VALUES(171,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(171,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(172,'edm',1);
+INSERT INTO "remix_tag" VALUES(172,'electronic',1);
+INSERT INTO "remix_tag" VALUES(172,'happy',1);
+INSERT INTO "remix_tag" VALUES(172,'organ',1);
+INSERT INTO "remix_tag" VALUES(172,'synth',1);
+INSERT INTO "remix_tag" VALUES(172,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(172,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(172,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(173,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(173,'dark',1);
+INSERT INTO "remix_tag" VALUES(173,'electronic',1);
+INSERT INTO "remix_tag" VALUES(173,'funky',1);
+INSERT INTO "remix_tag" VALUES(173,'glitching',1);
+INSERT INTO "remix_tag" VALUES(173,'jungle',1);
+INSERT INTO "remix_tag" VALUES(173,'solemn',1);
+INSERT INTO "remix_tag" VALUES(173,'strings',1);
+INSERT INTO "remix_tag" VALUES(173,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(173,'synth',1);
+INSERT INTO "remix_tag" VALUES(173,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(173,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(175,'chill',1);
+INSERT INTO "remix_tag" VALUES(175,'dark',1);
+INSERT INTO "remix_tag" VALUES(175,'dnb',1);
+INSERT INTO "remix_tag" VALUES(175,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(175,'electronic',1);
+INSERT INTO "remix_tag" VALUES(175,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(175,'solemn',1);
+INSERT INTO "remix_tag" VALUES(175,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(175,'synth',1);
+INSERT INTO "remix_tag" VALUES(175,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(175,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(176,'ambient',1);
+INSERT INTO "remix_tag" VALUES(176,'chill',1);
+INSERT INTO "remix_tag" VALUES(176,'mellow',1);
+INSERT INTO "remix_tag" VALUES(176,'piano',1);
+INSERT INTO "remix_tag" VALUES(176,'solemn',1);
+INSERT INTO "remix_tag" VALUES(176,'strings',1);
+INSERT INTO "remix_tag" VALUES(176,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(176,'synth',1);
+INSERT INTO "remix_tag" VALUES(176,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(176,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(177,'blues',1);
+INSERT INTO "remix_tag" VALUES(177,'distortion',1);
+INSERT INTO "remix_tag" VALUES(177,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(177,'experimental',1);
+INSERT INTO "remix_tag" VALUES(177,'goofy',1);
+INSERT INTO "remix_tag" VALUES(177,'happy',1);
+INSERT INTO "remix_tag" VALUES(177,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(177,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(177,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(177,'mellow',1);
+INSERT INTO "remix_tag" VALUES(177,'quirky',1);
+INSERT INTO "remix_tag" VALUES(177,'rock',1);
+INSERT INTO "remix_tag" VALUES(177,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(177,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(177,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(177,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(177,'whistling',1);
+INSERT INTO "remix_tag" VALUES(178,'chill',1);
+INSERT INTO "remix_tag" VALUES(178,'flute',1);
+INSERT INTO "remix_tag" VALUES(178,'happy',1);
+INSERT INTO "remix_tag" VALUES(178,'harp',1);
+INSERT INTO "remix_tag" VALUES(178,'mellow',1);
+INSERT INTO "remix_tag" VALUES(178,'oboe',1);
+INSERT INTO "remix_tag" VALUES(178,'piano',1);
+INSERT INTO "remix_tag" VALUES(178,'strings',1);
+INSERT INTO "remix_tag" VALUES(178,'synth',1);
+INSERT INTO "remix_tag" VALUES(178,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(178,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(178,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(179,'ambient',1);
+INSERT INTO "remix_tag" VALUES(179,'chill',1);
+INSERT INTO "remix_tag" VALUES(179,'dark',1);
+INSERT INTO "remix_tag" VALUES(179,'electronic',1);
+INSERT INTO "remix_tag" VALUES(179,'flute',1);
+INSERT INTO "remix_tag" VALUES(179,'japanese',1);
+INSERT INTO "remix_tag" VALUES(179,'jungle',1);
+INSERT INTO "remix_tag" VALUES(179,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(179,'singing',1);
+INSERT INTO "remix_tag" VALUES(179,'solemn',1);
+INSERT INTO "remix_tag" VALUES(179,'strings',1);
+INSERT INTO "remix_tag" VALUES(179,'synth',1);
+INSERT INTO "remix_tag" VALUES(179,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(179,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(180,'chill',1);
+INSERT INTO "remix_tag" VALUES(180,'dark',1);
+INSERT INTO "remix_tag" VALUES(180,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(180,'electronic',1);
+INSERT INTO "remix_tag" VALUES(180,'funky',1);
+INSERT INTO "remix_tag" VALUES(180,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(180,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(180,'synth',1);
+INSERT INTO "remix_tag" VALUES(180,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(180,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(181,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(181,'distortion',1);
+INSERT INTO "remix_tag" VALUES(181,'electro',1);
+INSERT INTO "remix_tag" VALUES(181,'funky',1);
+INSERT INTO "remix_tag" VALUES(181,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(181,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(181,'mellow',1);
+INSERT INTO "remix_tag" VALUES(181,'piano',1);
+INSERT INTO "remix_tag" VALUES(181,'strings',1);
+INSERT INTO "remix_tag" VALUES(181,'synth',1);
+INSERT INTO "remix_tag" VALUES(181,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(182,'bells',1);
+INSERT INTO "remix_tag" VALUES(182,'chill',1);
+INSERT INTO "remix_tag" VALUES(182,'dance',1);
+INSERT INTO "remix_tag" VALUES(182,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(182,'edm',1);
+INSERT INTO "remix_tag" VALUES(182,'organ',1);
+INSERT INTO "remix_tag" VALUES(182,'quirky',1);
+INSERT INTO "remix_tag" VALUES(182,'solemn',1);
+INSERT INTO "remix_tag" VALUES(182,'synth',1);
+INSERT INTO "remix_tag" VALUES(182,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(183,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(183,'dance',1);
+INSERT INTO "remix_tag" VALUES(183,'dark',1);
+INSERT INTO "remix_tag" VALUES(183,'distortion',1);
+INSERT INTO "remix_tag" VALUES(183,'edm',1);
+INSERT INTO "remix_tag" VALUES(183,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(183,'synth',1);
+INSERT INTO "remix_tag" VALUES(183,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(184,'chill',1);
+INSERT INTO "remix_tag" VALUES(184,'indian',1);
+INSERT INTO "remix_tag" VALUES(184,'new-age',1);
+INSERT INTO "remix_tag" VALUES(184,'sitar',1);
+INSERT INTO "remix_tag" VALUES(184,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(184,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(186,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(186,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(186,'dark',1);
+INSERT INTO "remix_tag" VALUES(186,'distortion',1);
+INSERT INTO "remix_tag" VALUES(186,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(186,'edm',1);
+INSERT INTO "remix_tag" VALUES(186,'electro',1);
+INSERT INTO "remix_tag" VALUES(186,'glitching',1);
+INSERT INTO "remix_tag" VALUES(186,'spooky',1);
+INSERT INTO "remix_tag" VALUES(186,'strings',1);
+INSERT INTO "remix_tag" VALUES(186,'synth',1);
+INSERT INTO "remix_tag" VALUES(186,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(188,'cello',1);
+INSERT INTO "remix_tag" VALUES(188,'chill',1);
+INSERT INTO "remix_tag" VALUES(188,'harp',1);
+INSERT INTO "remix_tag" VALUES(188,'latin',1);
+INSERT INTO "remix_tag" VALUES(188,'oboe',1);
+INSERT INTO "remix_tag" VALUES(188,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(188,'tango',1);
+INSERT INTO "remix_tag" VALUES(188,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(189,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(189,'epic',1);
+INSERT INTO "remix_tag" VALUES(189,'quirky',1);
+INSERT INTO "remix_tag" VALUES(189,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(189,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(189,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(190,'chill',1);
+INSERT INTO "remix_tag" VALUES(190,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(190,'dance',1);
+INSERT INTO "remix_tag" VALUES(190,'edm',1);
+INSERT INTO "remix_tag" VALUES(190,'happy',1);
+INSERT INTO "remix_tag" VALUES(190,'piano',1);
+INSERT INTO "remix_tag" VALUES(190,'strings',1);
+INSERT INTO "remix_tag" VALUES(190,'synth',1);
+INSERT INTO "remix_tag" VALUES(190,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(191,'dark',1);
+INSERT INTO "remix_tag" VALUES(191,'distortion',1);
+INSERT INTO "remix_tag" VALUES(191,'edm',1);
+INSERT INTO "remix_tag" VALUES(191,'epic',1);
+INSERT INTO "remix_tag" VALUES(191,'glitching',1);
+INSERT INTO "remix_tag" VALUES(191,'industrial',1);
+INSERT INTO "remix_tag" VALUES(191,'piano',1);
+INSERT INTO "remix_tag" VALUES(191,'sad',1);
+INSERT INTO "remix_tag" VALUES(191,'synth',1);
+INSERT INTO "remix_tag" VALUES(191,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(191,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(192,'dark',1);
+INSERT INTO "remix_tag" VALUES(192,'distortion',1);
+INSERT INTO "remix_tag" VALUES(192,'edm',1);
+INSERT INTO "remix_tag" VALUES(192,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(192,'synth',1);
+INSERT INTO "remix_tag" VALUES(192,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(193,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(193,'funk',1);
+INSERT INTO "remix_tag" VALUES(193,'funky',1);
+INSERT INTO "remix_tag" VALUES(193,'happy',1);
+INSERT INTO "remix_tag" VALUES(193,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(193,'organ',1);
+INSERT INTO "remix_tag" VALUES(193,'rock',1);
+INSERT INTO "remix_tag" VALUES(193,'ska',1);
+INSERT INTO "remix_tag" VALUES(193,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(194,'edm',1);
+INSERT INTO "remix_tag" VALUES(194,'funk',1);
+INSERT INTO "remix_tag" VALUES(194,'funky',1);
+INSERT INTO "remix_tag" VALUES(194,'jazz',1);
+INSERT INTO "remix_tag" VALUES(194,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(194,'piano',1);
+INSERT INTO "remix_tag" VALUES(194,'strings',1);
+INSERT INTO "remix_tag" VALUES(194,'synth',1);
+INSERT INTO "remix_tag" VALUES(194,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(196,'distortion',1);
+INSERT INTO "remix_tag" VALUES(196,'edm',1);
+INSERT INTO "remix_tag" VALUES(196,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(196,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(196,'electronic',1);
+INSERT INTO "remix_tag" VALUES(196,'experimental',1);
+INSERT INTO "remix_tag" VALUES(196,'glitching',1);
+INSERT INTO "remix_tag" VALUES(196,'goofy',1);
+INSERT INTO "remix_tag" VALUES(196,'piano',1);
+INSERT INTO "remix_tag" VALUES(196,'quirky',1);
+INSERT INTO "remix_tag" VALUES(196,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(198,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(198,'dark',1);
+INSERT INTO "remix_tag" VALUES(198,'distortion',1);
+INSERT INTO "remix_tag" VALUES(198,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(198,'electronic',1);
+INSERT INTO "remix_tag" VALUES(198,'industrial',1);
+INSERT INTO "remix_tag" VALUES(198,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(198,'synth',1);
+INSERT INTO "remix_tag" VALUES(199,'dance',1);
+INSERT INTO "remix_tag" VALUES(199,'edm',1);
+INSERT INTO "remix_tag" VALUES(199,'happy',1);
+INSERT INTO "remix_tag" VALUES(199,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(199,'synth',1);
+INSERT INTO "remix_tag" VALUES(199,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(200,'ambient',1);
+INSERT INTO "remix_tag" VALUES(200,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(200,'distortion',1);
+INSERT INTO "remix_tag" VALUES(200,'harp',1);
+INSERT INTO "remix_tag" VALUES(200,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(200,'mellow',1);
+INSERT INTO "remix_tag" VALUES(200,'oboe',1);
+INSERT INTO "remix_tag" VALUES(200,'quirky',1);
+INSERT INTO "remix_tag" VALUES(200,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(200,'synth',1);
+INSERT INTO "remix_tag" VALUES(200,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(201,'classical',1);
+INSERT INTO "remix_tag" VALUES(201,'piano',1);
+INSERT INTO "remix_tag" VALUES(201,'romantic',1);
+INSERT INTO "remix_tag" VALUES(201,'sad',1);
+INSERT INTO "remix_tag" VALUES(201,'solo',1);
+INSERT INTO "remix_tag" VALUES(201,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(201,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(202,'collab',1);
+INSERT INTO "remix_tag" VALUES(202,'distortion',1);
+INSERT INTO "remix_tag" VALUES(202,'electro',1);
+INSERT INTO "remix_tag" VALUES(202,'quirky',1);
+INSERT INTO "remix_tag" VALUES(202,'synth',1);
+INSERT INTO "remix_tag" VALUES(202,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(203,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(203,'dance',1);
+INSERT INTO "remix_tag" VALUES(203,'edm',1);
+INSERT INTO "remix_tag" VALUES(203,'happy',1);
+INSERT INTO "remix_tag" VALUES(203,'synth',1);
+INSERT INTO "remix_tag" VALUES(203,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(204,'classical',1);
+INSERT INTO "remix_tag" VALUES(204,'collab',1);
+INSERT INTO "remix_tag" VALUES(204,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(204,'goofy',1);
+INSERT INTO "remix_tag" VALUES(204,'happy',1);
+INSERT INTO "remix_tag" VALUES(204,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(204,'piano',1);
+INSERT INTO "remix_tag" VALUES(204,'strings',1);
+INSERT INTO "remix_tag" VALUES(204,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(205,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(205,'brass',1);
+INSERT INTO "remix_tag" VALUES(205,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(205,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(205,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(205,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(205,'piano',1);
+INSERT INTO "remix_tag" VALUES(205,'sad',1);
+INSERT INTO "remix_tag" VALUES(205,'solemn',1);
+INSERT INTO "remix_tag" VALUES(205,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(205,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(206,'brass',1);
+INSERT INTO "remix_tag" VALUES(206,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(206,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(206,'epic',1);
+INSERT INTO "remix_tag" VALUES(206,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(206,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(206,'rock',1);
+INSERT INTO "remix_tag" VALUES(206,'solemn',1);
+INSERT INTO "remix_tag" VALUES(206,'strings',1);
+INSERT INTO "remix_tag" VALUES(206,'synth',1);
+INSERT INTO "remix_tag" VALUES(206,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(208,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(208,'edm',1);
+INSERT INTO "remix_tag" VALUES(208,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(208,'electro',1);
+INSERT INTO "remix_tag" VALUES(208,'funky',1);
+INSERT INTO "remix_tag" VALUES(208,'happy',1);
+INSERT INTO "remix_tag" VALUES(208,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(208,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(208,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(208,'quirky',1);
+INSERT INTO "remix_tag" VALUES(208,'synth',1);
+INSERT INTO "remix_tag" VALUES(208,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(208,'turntable',1);
+INSERT INTO "remix_tag" VALUES(209,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(209,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(209,'funny',1);
+INSERT INTO "remix_tag" VALUES(209,'goofy',1);
+INSERT INTO "remix_tag" VALUES(209,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(209,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(209,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(209,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(209,'pop',1);
+INSERT INTO "remix_tag" VALUES(209,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(209,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(210,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(210,'distortion',1);
+INSERT INTO "remix_tag" VALUES(210,'edm',1);
+INSERT INTO "remix_tag" VALUES(210,'synth',1);
+INSERT INTO "remix_tag" VALUES(210,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(211,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(211,'edm',1);
+INSERT INTO "remix_tag" VALUES(211,'electronic',1);
+INSERT INTO "remix_tag" VALUES(211,'energetic',1);
+INSERT INTO "remix_tag" VALUES(211,'funky',1);
+INSERT INTO "remix_tag" VALUES(211,'glitching',1);
+INSERT INTO "remix_tag" VALUES(211,'piano',1);
+INSERT INTO "remix_tag" VALUES(211,'synth',1);
+INSERT INTO "remix_tag" VALUES(211,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(211,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(212,'banjo',1);
+INSERT INTO "remix_tag" VALUES(212,'bells',1);
+INSERT INTO "remix_tag" VALUES(212,'chill',1);
+INSERT INTO "remix_tag" VALUES(212,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(212,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(212,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(212,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(213,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(213,'funky',1);
+INSERT INTO "remix_tag" VALUES(213,'fusion',1);
+INSERT INTO "remix_tag" VALUES(213,'jazz',1);
+INSERT INTO "remix_tag" VALUES(213,'latin',1);
+INSERT INTO "remix_tag" VALUES(213,'medley',1);
+INSERT INTO "remix_tag" VALUES(213,'mellow',1);
+INSERT INTO "remix_tag" VALUES(213,'organ',1);
+INSERT INTO "remix_tag" VALUES(213,'piano',1);
+INSERT INTO "remix_tag" VALUES(214,'distortion',1);
+INSERT INTO "remix_tag" VALUES(214,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(214,'electro',1);
+INSERT INTO "remix_tag" VALUES(214,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(214,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(214,'pop',1);
+INSERT INTO "remix_tag" VALUES(214,'quirky',1);
+INSERT INTO "remix_tag" VALUES(214,'singing',1);
+INSERT INTO "remix_tag" VALUES(214,'synth',1);
+INSERT INTO "remix_tag" VALUES(214,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(214,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(215,'blues',1);
+INSERT INTO "remix_tag" VALUES(215,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(215,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(215,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(215,'organ',1);
+INSERT INTO "remix_tag" VALUES(215,'rock',1);
+INSERT INTO "remix_tag" VALUES(215,'screaming',1);
+INSERT INTO "remix_tag" VALUES(215,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(216,'brass',1);
+INSERT INTO "remix_tag" VALUES(216,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(216,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(216,'electro',1);
+INSERT INTO "remix_tag" VALUES(216,'funky',1);
+INSERT INTO "remix_tag" VALUES(216,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(216,'piano',1);
+INSERT INTO "remix_tag" VALUES(216,'quirky',1);
+INSERT INTO "remix_tag" VALUES(216,'strings',1);
+INSERT INTO "remix_tag" VALUES(216,'synth',1);
+INSERT INTO "remix_tag" VALUES(216,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(217,'ambient',1);
+INSERT INTO "remix_tag" VALUES(217,'chill',1);
+INSERT INTO "remix_tag" VALUES(217,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(217,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(217,'edm',1);
+INSERT INTO "remix_tag" VALUES(217,'synth',1);
+INSERT INTO "remix_tag" VALUES(217,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(217,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(218,'ambient',1);
+INSERT INTO "remix_tag" VALUES(218,'dark',1);
+INSERT INTO "remix_tag" VALUES(218,'halloween',1);
+INSERT INTO "remix_tag" VALUES(218,'koto',1);
+INSERT INTO "remix_tag" VALUES(218,'meditation',1);
+INSERT INTO "remix_tag" VALUES(218,'mellow',1);
+INSERT INTO "remix_tag" VALUES(218,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(218,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(218,'synth',1);
+INSERT INTO "remix_tag" VALUES(218,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(218,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(221,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(221,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(221,'mellow',1);
+INSERT INTO "remix_tag" VALUES(221,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(221,'piano',1);
+INSERT INTO "remix_tag" VALUES(221,'strings',1);
+INSERT INTO "remix_tag" VALUES(221,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(221,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(221,'world',1);
+INSERT INTO "remix_tag" VALUES(222,'dance',1);
+INSERT INTO "remix_tag" VALUES(222,'edm',1);
+INSERT INTO "remix_tag" VALUES(222,'funky',1);
+INSERT INTO "remix_tag" VALUES(222,'quirky',1);
+INSERT INTO "remix_tag" VALUES(222,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(222,'synth',1);
+INSERT INTO "remix_tag" VALUES(222,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(224,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(224,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(224,'happy',1);
+INSERT INTO "remix_tag" VALUES(224,'oboe',1);
+INSERT INTO "remix_tag" VALUES(224,'rock',1);
+INSERT INTO "remix_tag" VALUES(224,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(224,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(224,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(225,'ambient',1);
+INSERT INTO "remix_tag" VALUES(225,'brass',1);
+INSERT INTO "remix_tag" VALUES(225,'chill',1);
+INSERT INTO "remix_tag" VALUES(225,'dark',1);
+INSERT INTO "remix_tag" VALUES(225,'dub',1);
+INSERT INTO "remix_tag" VALUES(225,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(225,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(225,'synth',1);
+INSERT INTO "remix_tag" VALUES(225,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(226,'choir',1);
+INSERT INTO "remix_tag" VALUES(226,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(226,'collab',1);
+INSERT INTO "remix_tag" VALUES(226,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(226,'epic',1);
+INSERT INTO "remix_tag" VALUES(226,'piano',1);
+INSERT INTO "remix_tag" VALUES(226,'rock',1);
+INSERT INTO "remix_tag" VALUES(226,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(227,'collab',1);
+INSERT INTO "remix_tag" VALUES(227,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(227,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(227,'jazz',1);
+INSERT INTO "remix_tag" VALUES(227,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(227,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(227,'mellow',1);
+INSERT INTO "remix_tag" VALUES(227,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(227,'piano',1);
+INSERT INTO "remix_tag" VALUES(227,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(227,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(227,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(228,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(228,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(228,'dark',1);
+INSERT INTO "remix_tag" VALUES(228,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(228,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(228,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(228,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(228,'piano',1);
+INSERT INTO "remix_tag" VALUES(228,'strings',1);
+INSERT INTO "remix_tag" VALUES(228,'synth',1);
+INSERT INTO "remix_tag" VALUES(228,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(228,'turntable',1);
+INSERT INTO "remix_tag" VALUES(229,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(229,'dance',1);
+INSERT INTO "remix_tag" VALUES(229,'distortion',1);
+INSERT INTO "remix_tag" VALUES(229,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(229,'edm',1);
+INSERT INTO "remix_tag" VALUES(229,'happy',1);
+INSERT INTO "remix_tag" VALUES(229,'quirky',1);
+INSERT INTO "remix_tag" VALUES(229,'synth',1);
+INSERT INTO "remix_tag" VALUES(229,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(231,'ambient',1);
+INSERT INTO "remix_tag" VALUES(231,'chill',1);
+INSERT INTO "remix_tag" VALUES(231,'dark',1);
+INSERT INTO "remix_tag" VALUES(231,'distortion',1);
+INSERT INTO "remix_tag" VALUES(231,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(231,'new-age',1);
+INSERT INTO "remix_tag" VALUES(231,'piano',1);
+INSERT INTO "remix_tag" VALUES(231,'sad',1);
+INSERT INTO "remix_tag" VALUES(231,'strings',1);
+INSERT INTO "remix_tag" VALUES(231,'synth',1);
+INSERT INTO "remix_tag" VALUES(231,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(232,'dance',1);
+INSERT INTO "remix_tag" VALUES(232,'distortion',1);
+INSERT INTO "remix_tag" VALUES(232,'edm',1);
+INSERT INTO "remix_tag" VALUES(232,'happy',1);
+INSERT INTO "remix_tag" VALUES(232,'quirky',1);
+INSERT INTO "remix_tag" VALUES(232,'synth',1);
+INSERT INTO "remix_tag" VALUES(232,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(233,'edm',1);
+INSERT INTO "remix_tag" VALUES(233,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(233,'happy',1);
+INSERT INTO "remix_tag" VALUES(233,'house',1);
+INSERT INTO "remix_tag" VALUES(233,'mellow',1);
+INSERT INTO "remix_tag" VALUES(233,'synth',1);
+INSERT INTO "remix_tag" VALUES(233,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(234,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(234,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(234,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(234,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(234,'happy',1);
+INSERT INTO "remix_tag" VALUES(234,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(234,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(234,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(234,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(234,'rock',1);
+INSERT INTO "remix_tag" VALUES(234,'solemn',1);
+INSERT INTO "remix_tag" VALUES(234,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(235,'edm',1);
+INSERT INTO "remix_tag" VALUES(235,'happy',1);
+INSERT INTO "remix_tag" VALUES(235,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(235,'harp',1);
+INSERT INTO "remix_tag" VALUES(235,'quirky',1);
+INSERT INTO "remix_tag" VALUES(235,'strings',1);
+INSERT INTO "remix_tag" VALUES(235,'synth',1);
+INSERT INTO "remix_tag" VALUES(235,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(235,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(235,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(237,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(237,'electro',1);
+INSERT INTO "remix_tag" VALUES(237,'happy',1);
+INSERT INTO "remix_tag" VALUES(237,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(237,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(237,'quirky',1);
+INSERT INTO "remix_tag" VALUES(237,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(237,'synth',1);
+INSERT INTO "remix_tag" VALUES(237,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(238,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(238,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(238,'piano',1);
+INSERT INTO "remix_tag" VALUES(238,'sad',1);
+INSERT INTO "remix_tag" VALUES(238,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(238,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(239,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(239,'dark',1);
+INSERT INTO "remix_tag" VALUES(239,'distortion',1);
+INSERT INTO "remix_tag" VALUES(239,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(239,'edm',1);
+INSERT INTO "remix_tag" VALUES(239,'electro',1);
+INSERT INTO "remix_tag" VALUES(239,'funky',1);
+INSERT INTO "remix_tag" VALUES(239,'quirky',1);
+INSERT INTO "remix_tag" VALUES(239,'synth',1);
+INSERT INTO "remix_tag" VALUES(239,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(240,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(240,'edm',1);
+INSERT INTO "remix_tag" VALUES(240,'glitching',1);
+INSERT INTO "remix_tag" VALUES(240,'harp',1);
+INSERT INTO "remix_tag" VALUES(240,'house',1);
+INSERT INTO "remix_tag" VALUES(240,'mellow',1);
+INSERT INTO "remix_tag" VALUES(240,'piano',1);
+INSERT INTO "remix_tag" VALUES(240,'synth',1);
+INSERT INTO "remix_tag" VALUES(240,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(240,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(240,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(241,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(241,'bells',1);
+INSERT INTO "remix_tag" VALUES(241,'chill',1);
+INSERT INTO "remix_tag" VALUES(241,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(241,'happy',1);
+INSERT INTO "remix_tag" VALUES(241,'new-age',1);
+INSERT INTO "remix_tag" VALUES(241,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(241,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(245,'dance',1);
+INSERT INTO "remix_tag" VALUES(245,'dark',1);
+INSERT INTO "remix_tag" VALUES(245,'distortion',1);
+INSERT INTO "remix_tag" VALUES(245,'electro',1);
+INSERT INTO "remix_tag" VALUES(245,'electronic',1);
+INSERT INTO "remix_tag" VALUES(245,'energetic',1);
+INSERT INTO "remix_tag" VALUES(245,'quirky',1);
+INSERT INTO "remix_tag" VALUES(245,'synth',1);
+INSERT INTO "remix_tag" VALUES(245,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(246,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(246,'flute',1);
+INSERT INTO "remix_tag" VALUES(246,'happy',1);
+INSERT INTO "remix_tag" VALUES(246,'latin',1);
+INSERT INTO "remix_tag" VALUES(246,'mellow',1);
+INSERT INTO "remix_tag" VALUES(246,'piano',1);
+INSERT INTO "remix_tag" VALUES(246,'strings',1);
+INSERT INTO "remix_tag" VALUES(246,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(247,'dark',1);
+INSERT INTO "remix_tag" VALUES(247,'distortion',1);
+INSERT INTO "remix_tag" VALUES(247,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(247,'edm',1);
+INSERT INTO "remix_tag" VALUES(247,'piano',1);
+INSERT INTO "remix_tag" VALUES(247,'spooky',1);
+INSERT INTO "remix_tag" VALUES(247,'strings',1);
+INSERT INTO "remix_tag" VALUES(247,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(247,'synth',1);
+INSERT INTO "remix_tag" VALUES(247,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(248,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(248,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(248,'dark',1);
+INSERT INTO "remix_tag" VALUES(248,'distortion',1);
+INSERT INTO "remix_tag" VALUES(248,'edm',1);
+INSERT INTO "remix_tag" VALUES(248,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(248,'strings',1);
+INSERT INTO "remix_tag" VALUES(248,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(248,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(249,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(249,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(249,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(249,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(249,'mellow',1);
+INSERT INTO "remix_tag" VALUES(249,'rock',1);
+INSERT INTO "remix_tag" VALUES(249,'solemn',1);
+INSERT INTO "remix_tag" VALUES(249,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(250,'dark',1);
+INSERT INTO "remix_tag" VALUES(250,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(250,'mellow',1);
+INSERT INTO "remix_tag" VALUES(250,'quirky',1);
+INSERT INTO "remix_tag" VALUES(250,'strings',1);
+INSERT INTO "remix_tag" VALUES(250,'synth',1);
+INSERT INTO "remix_tag" VALUES(250,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(251,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(251,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(251,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(251,'metal',1);
+INSERT INTO "remix_tag" VALUES(251,'rock',1);
+INSERT INTO "remix_tag" VALUES(251,'strings',1);
+INSERT INTO "remix_tag" VALUES(251,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(252,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(252,'dark',1);
+INSERT INTO "remix_tag" VALUES(252,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(252,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(252,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(252,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(252,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(252,'metal',1);
+INSERT INTO "remix_tag" VALUES(252,'rock',1);
+INSERT INTO "remix_tag" VALUES(252,'synth',1);
+INSERT INTO "remix_tag" VALUES(252,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(254,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(254,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(254,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(254,'happy',1);
+INSERT INTO "remix_tag" VALUES(254,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(254,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(254,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(254,'rock',1);
+INSERT INTO "remix_tag" VALUES(254,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(255,'chill',1);
+INSERT INTO "remix_tag" VALUES(255,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(255,'dance',1);
+INSERT INTO "remix_tag" VALUES(255,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(255,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(255,'piano',1);
+INSERT INTO "remix_tag" VALUES(255,'strings',1);
+INSERT INTO "remix_tag" VALUES(255,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(256,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(256,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(256,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(256,'experimental',1);
+INSERT INTO "remix_tag" VALUES(256,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(256,'jazz',1);
+INSERT INTO "remix_tag" VALUES(256,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(256,'jungle',1);
+INSERT INTO "remix_tag" VALUES(256,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(256,'quirky',1);
+INSERT INTO "remix_tag" VALUES(256,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(256,'synth',1);
+INSERT INTO "remix_tag" VALUES(256,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(257,'distortion',1);
+INSERT INTO "remix_tag" VALUES(257,'edm',1);
+INSERT INTO "remix_tag" VALUES(257,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(257,'funky',1);
+INSERT INTO "remix_tag" VALUES(257,'koto',1);
+INSERT INTO "remix_tag" VALUES(257,'quirky',1);
+INSERT INTO "remix_tag" VALUES(257,'strings',1);
+INSERT INTO "remix_tag" VALUES(257,'synth',1);
+INSERT INTO "remix_tag" VALUES(257,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(257,'world',1);
+INSERT INTO "remix_tag" VALUES(258,'distortion',1);
+INSERT INTO "remix_tag" VALUES(258,'edm',1);
+INSERT INTO "remix_tag" VALUES(258,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(258,'electro',1);
+INSERT INTO "remix_tag" VALUES(258,'happy',1);
+INSERT INTO "remix_tag" VALUES(258,'piano',1);
+INSERT INTO "remix_tag" VALUES(258,'quirky',1);
+INSERT INTO "remix_tag" VALUES(258,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(258,'synth',1);
+INSERT INTO "remix_tag" VALUES(258,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(260,'dark',1);
+INSERT INTO "remix_tag" VALUES(260,'distortion',1);
+INSERT INTO "remix_tag" VALUES(260,'edm',1);
+INSERT INTO "remix_tag" VALUES(260,'electronic',1);
+INSERT INTO "remix_tag" VALUES(260,'piano',1);
+INSERT INTO "remix_tag" VALUES(260,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(260,'spooky',1);
+INSERT INTO "remix_tag" VALUES(260,'synth',1);
+INSERT INTO "remix_tag" VALUES(260,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(260,'trance',1);
+INSERT INTO "remix_tag" VALUES(261,'dark',1);
+INSERT INTO "remix_tag" VALUES(261,'distortion',1);
+INSERT INTO "remix_tag" VALUES(261,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(261,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(261,'experimental',1);
+INSERT INTO "remix_tag" VALUES(261,'halloween',1);
+INSERT INTO "remix_tag" VALUES(261,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(261,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(261,'spooky',1);
+INSERT INTO "remix_tag" VALUES(261,'synth',1);
+INSERT INTO "remix_tag" VALUES(261,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(261,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(261,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(262,'ballad',1);
+INSERT INTO "remix_tag" VALUES(262,'duet',1);
+INSERT INTO "remix_tag" VALUES(262,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(262,'jazz',1);
+INSERT INTO "remix_tag" VALUES(262,'mellow',1);
+INSERT INTO "remix_tag" VALUES(262,'romantic',1);
+INSERT INTO "remix_tag" VALUES(262,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(262,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(262,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(262,'wedding',1);
+INSERT INTO "remix_tag" VALUES(263,'disco',1);
+INSERT INTO "remix_tag" VALUES(263,'edm',1);
+INSERT INTO "remix_tag" VALUES(263,'happy',1);
+INSERT INTO "remix_tag" VALUES(263,'piano',1);
+INSERT INTO "remix_tag" VALUES(263,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(263,'strings',1);
+INSERT INTO "remix_tag" VALUES(263,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(263,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(264,'ballad',1);
+INSERT INTO "remix_tag" VALUES(264,'collab',1);
+INSERT INTO "remix_tag" VALUES(264,'dance',1);
+INSERT INTO "remix_tag" VALUES(264,'happy',1);
+INSERT INTO "remix_tag" VALUES(264,'romantic',1);
+INSERT INTO "remix_tag" VALUES(264,'strings',1);
+INSERT INTO "remix_tag" VALUES(264,'synth',1);
+INSERT INTO "remix_tag" VALUES(264,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(264,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(264,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(264,'workout',1);
+INSERT INTO "remix_tag" VALUES(268,'dance',1);
+INSERT INTO "remix_tag" VALUES(268,'happy',1);
+INSERT INTO "remix_tag" VALUES(268,'synth',1);
+INSERT INTO "remix_tag" VALUES(268,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(268,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(269,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(269,'flute',1);
+INSERT INTO "remix_tag" VALUES(269,'happy',1);
+INSERT INTO "remix_tag" VALUES(269,'mellow',1);
+INSERT INTO "remix_tag" VALUES(269,'oboe',1);
+INSERT INTO "remix_tag" VALUES(269,'piano',1);
+INSERT INTO "remix_tag" VALUES(269,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(269,'strings',1);
+INSERT INTO "remix_tag" VALUES(269,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(269,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(269,'wedding',1);
+INSERT INTO "remix_tag" VALUES(269,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(270,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(270,'dark',1);
+INSERT INTO "remix_tag" VALUES(270,'distortion',1);
+INSERT INTO "remix_tag" VALUES(270,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(270,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(270,'mellow',1);
+INSERT INTO "remix_tag" VALUES(270,'metal',1);
+INSERT INTO "remix_tag" VALUES(270,'rock',1);
+INSERT INTO "remix_tag" VALUES(270,'synth',1);
+INSERT INTO "remix_tag" VALUES(270,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(270,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(271,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(271,'ambient',1);
+INSERT INTO "remix_tag" VALUES(271,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(271,'dark',1);
+INSERT INTO "remix_tag" VALUES(271,'distortion',1);
+INSERT INTO "remix_tag" VALUES(271,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(271,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(271,'sitar',1);
+INSERT INTO "remix_tag" VALUES(271,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(271,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(271,'world',1);
+INSERT INTO "remix_tag" VALUES(273,'bells',1);
+INSERT INTO "remix_tag" VALUES(273,'dark',1);
+INSERT INTO "remix_tag" VALUES(273,'synth',1);
+INSERT INTO "remix_tag" VALUES(273,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(273,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(273,'trance',1);
+INSERT INTO "remix_tag" VALUES(274,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(274,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(274,'edm',1);
+INSERT INTO "remix_tag" VALUES(274,'happy',1);
+INSERT INTO "remix_tag" VALUES(274,'synth',1);
+INSERT INTO "remix_tag" VALUES(274,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(274,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(275,'chill',1);
+INSERT INTO "remix_tag" VALUES(275,'choir',1);
+INSERT INTO "remix_tag" VALUES(275,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(275,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(275,'harp',1);
+INSERT INTO "remix_tag" VALUES(275,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(275,'sitar',1);
+INSERT INTO "remix_tag" VALUES(275,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(275,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(275,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(276,'ambient',1);
+INSERT INTO "remix_tag" VALUES(276,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(276,'piano',1);
+INSERT INTO "remix_tag" VALUES(276,'sad',1);
+INSERT INTO "remix_tag" VALUES(276,'strings',1);
+INSERT INTO "remix_tag" VALUES(276,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(276,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(277,'distortion',1);
+INSERT INTO "remix_tag" VALUES(277,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(277,'happy',1);
+INSERT INTO "remix_tag" VALUES(277,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(277,'organ',1);
+INSERT INTO "remix_tag" VALUES(277,'rock',1);
+INSERT INTO "remix_tag" VALUES(277,'synth',1);
+INSERT INTO "remix_tag" VALUES(277,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(277,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(278,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(278,'electronic',1);
+INSERT INTO "remix_tag" VALUES(278,'happy',1);
+INSERT INTO "remix_tag" VALUES(278,'synth',1);
+INSERT INTO "remix_tag" VALUES(278,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(278,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(278,'trance',1);
+INSERT INTO "remix_tag" VALUES(280,'bells',1);
+INSERT INTO "remix_tag" VALUES(280,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(280,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(280,'quirky',1);
+INSERT INTO "remix_tag" VALUES(280,'synth',1);
+INSERT INTO "remix_tag" VALUES(280,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(280,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(280,'turntable',1);
+INSERT INTO "remix_tag" VALUES(280,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(282,'appalachian',1);
+INSERT INTO "remix_tag" VALUES(282,'bells',1);
+INSERT INTO "remix_tag" VALUES(282,'distortion',1);
+INSERT INTO "remix_tag" VALUES(282,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(282,'folk',1);
+INSERT INTO "remix_tag" VALUES(282,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(282,'happy',1);
+INSERT INTO "remix_tag" VALUES(282,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(282,'mellow',1);
+INSERT INTO "remix_tag" VALUES(282,'rock',1);
+INSERT INTO "remix_tag" VALUES(282,'sitar',1);
+INSERT INTO "remix_tag" VALUES(282,'strings',1);
+INSERT INTO "remix_tag" VALUES(282,'synth',1);
+INSERT INTO "remix_tag" VALUES(282,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(282,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(283,'dark',1);
+INSERT INTO "remix_tag" VALUES(283,'distortion',1);
+INSERT INTO "remix_tag" VALUES(283,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(283,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(283,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(283,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(283,'rock',1);
+INSERT INTO "remix_tag" VALUES(283,'solo-guitar',1);
+INSERT INTO "remix_tag" VALUES(283,'spooky',1);
+INSERT INTO "remix_tag" VALUES(283,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(283,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(283,'trance',1);
+INSERT INTO "remix_tag" VALUES(285,'bells',1);
+INSERT INTO "remix_tag" VALUES(285,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(285,'electronic',1);
+INSERT INTO "remix_tag" VALUES(285,'happy',1);
+INSERT INTO "remix_tag" VALUES(285,'rock',1);
+INSERT INTO "remix_tag" VALUES(285,'synth',1);
+INSERT INTO "remix_tag" VALUES(285,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(285,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(286,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(286,'cello',1);
+INSERT INTO "remix_tag" VALUES(286,'choir',1);
+INSERT INTO "remix_tag" VALUES(286,'cowbell',1);
+INSERT INTO "remix_tag" VALUES(286,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(286,'flute',1);
+INSERT INTO "remix_tag" VALUES(286,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(286,'happy',1);
+INSERT INTO "remix_tag" VALUES(286,'mellow',1);
+INSERT INTO "remix_tag" VALUES(286,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(286,'piano',1);
+INSERT INTO "remix_tag" VALUES(286,'strings',1);
+INSERT INTO "remix_tag" VALUES(286,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(286,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(286,'violin',1);
+INSERT INTO "remix_tag" VALUES(286,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(287,'piano',1);
+INSERT INTO "remix_tag" VALUES(287,'sad',1);
+INSERT INTO "remix_tag" VALUES(287,'strings',1);
+INSERT INTO "remix_tag" VALUES(287,'synth',1);
+INSERT INTO "remix_tag" VALUES(287,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(287,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(287,'trance',1);
+INSERT INTO "remix_tag" VALUES(291,'experimental',1);
+INSERT INTO "remix_tag" VALUES(291,'koto',1);
+INSERT INTO "remix_tag" VALUES(291,'quirky',1);
+INSERT INTO "remix_tag" VALUES(291,'synth',1);
+INSERT INTO "remix_tag" VALUES(291,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(292,'electronic',1);
+INSERT INTO "remix_tag" VALUES(292,'funky',1);
+INSERT INTO "remix_tag" VALUES(292,'synth',1);
+INSERT INTO "remix_tag" VALUES(292,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(292,'trippy',1);
+INSERT INTO "remix_tag" VALUES(294,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(294,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(294,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(294,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(294,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(294,'synth',1);
+INSERT INTO "remix_tag" VALUES(294,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(295,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(295,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(295,'flute',1);
+INSERT INTO "remix_tag" VALUES(295,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(295,'latin',1);
+INSERT INTO "remix_tag" VALUES(295,'piano',1);
+INSERT INTO "remix_tag" VALUES(295,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(295,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(295,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(295,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(296,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(296,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(296,'energetic',1);
+INSERT INTO "remix_tag" VALUES(296,'rock',1);
+INSERT INTO "remix_tag" VALUES(296,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(300,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(300,'rock',1);
+INSERT INTO "remix_tag" VALUES(300,'solemn',1);
+INSERT INTO "remix_tag" VALUES(300,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(301,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(301,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(301,'electronic',1);
+INSERT INTO "remix_tag" VALUES(301,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(301,'synth',1);
+INSERT INTO "remix_tag" VALUES(301,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(302,'electronic',1);
+INSERT INTO "remix_tag" VALUES(302,'goofy',1);
+INSERT INTO "remix_tag" VALUES(302,'quirky',1);
+INSERT INTO "remix_tag" VALUES(302,'synth',1);
+INSERT INTO "remix_tag" VALUES(302,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(303,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(303,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(303,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(303,'electronic',1);
+INSERT INTO "remix_tag" VALUES(303,'glitching',1);
+INSERT INTO "remix_tag" VALUES(303,'happy',1);
+INSERT INTO "remix_tag" VALUES(303,'piano',1);
+INSERT INTO "remix_tag" VALUES(303,'quirky',1);
+INSERT INTO "remix_tag" VALUES(303,'strings',1);
+INSERT INTO "remix_tag" VALUES(303,'synth',1);
+INSERT INTO "remix_tag" VALUES(303,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(304,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(304,'dance',1);
+INSERT INTO "remix_tag" VALUES(304,'edm',1);
+INSERT INTO "remix_tag" VALUES(304,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(304,'electronic',1);
+INSERT INTO "remix_tag" VALUES(304,'halloween',1);
+INSERT INTO "remix_tag" VALUES(304,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(304,'medley',1);
+INSERT INTO "remix_tag" VALUES(304,'piano',1);
+INSERT INTO "remix_tag" VALUES(304,'spooky',1);
+INSERT INTO "remix_tag" VALUES(304,'synth',1);
+INSERT INTO "remix_tag" VALUES(304,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(305,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(305,'edm',1);
+INSERT INTO "remix_tag" VALUES(305,'electro',1);
+INSERT INTO "remix_tag" VALUES(305,'electronic',1);
+INSERT INTO "remix_tag" VALUES(305,'energetic',1);
+INSERT INTO "remix_tag" VALUES(305,'industrial',1);
+INSERT INTO "remix_tag" VALUES(305,'synth',1);
+INSERT INTO "remix_tag" VALUES(305,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(305,'workout',1);
+INSERT INTO "remix_tag" VALUES(307,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(307,'dark',1);
+INSERT INTO "remix_tag" VALUES(307,'edm',1);
+INSERT INTO "remix_tag" VALUES(307,'electronic',1);
+INSERT INTO "remix_tag" VALUES(307,'synth',1);
+INSERT INTO "remix_tag" VALUES(307,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(307,'trance',1);
+INSERT INTO "remix_tag" VALUES(307,'workout',1);
+INSERT INTO "remix_tag" VALUES(308,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(308,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(308,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(308,'energetic',1);
+INSERT INTO "remix_tag" VALUES(308,'rock',1);
+INSERT INTO "remix_tag" VALUES(308,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(309,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(310,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(311,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(313,'collab',1);
+INSERT INTO "remix_tag" VALUES(313,'funk',1);
+INSERT INTO "remix_tag" VALUES(313,'goofy',1);
+INSERT INTO "remix_tag" VALUES(313,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(313,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(313,'singing',1);
+INSERT INTO "remix_tag" VALUES(313,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(313,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(314,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(316,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(317,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(317,'rock',1);
+INSERT INTO "remix_tag" VALUES(317,'synth',1);
+INSERT INTO "remix_tag" VALUES(322,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(322,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(322,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(322,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(322,'piano',1);
+INSERT INTO "remix_tag" VALUES(322,'solemn',1);
+INSERT INTO "remix_tag" VALUES(322,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(322,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(322,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(323,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(323,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(323,'latin',1);
+INSERT INTO "remix_tag" VALUES(323,'mellow',1);
+INSERT INTO "remix_tag" VALUES(323,'quirky',1);
+INSERT INTO "remix_tag" VALUES(323,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(323,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(323,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(323,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(324,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(324,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(324,'experimental',1);
+INSERT INTO "remix_tag" VALUES(324,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(324,'piano',1);
+INSERT INTO "remix_tag" VALUES(324,'quirky',1);
+INSERT INTO "remix_tag" VALUES(324,'synth',1);
+INSERT INTO "remix_tag" VALUES(324,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(325,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(325,'angry',1);
+INSERT INTO "remix_tag" VALUES(325,'dark',1);
+INSERT INTO "remix_tag" VALUES(325,'distortion',1);
+INSERT INTO "remix_tag" VALUES(325,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(325,'experimental',1);
+INSERT INTO "remix_tag" VALUES(325,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(325,'synth',1);
+INSERT INTO "remix_tag" VALUES(325,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(326,'ballad',1);
+INSERT INTO "remix_tag" VALUES(326,'dark',1);
+INSERT INTO "remix_tag" VALUES(326,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(326,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(326,'piano',1);
+INSERT INTO "remix_tag" VALUES(326,'solemn',1);
+INSERT INTO "remix_tag" VALUES(326,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(327,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(327,'dark',1);
+INSERT INTO "remix_tag" VALUES(327,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(327,'rock',1);
+INSERT INTO "remix_tag" VALUES(327,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(328,'chill',1);
+INSERT INTO "remix_tag" VALUES(328,'dark',1);
+INSERT INTO "remix_tag" VALUES(328,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(328,'electronic',1);
+INSERT INTO "remix_tag" VALUES(328,'experimental',1);
+INSERT INTO "remix_tag" VALUES(328,'piano',1);
+INSERT INTO "remix_tag" VALUES(328,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(328,'synth',1);
+INSERT INTO "remix_tag" VALUES(328,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(329,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(329,'edm',1);
+INSERT INTO "remix_tag" VALUES(329,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(329,'piano',1);
+INSERT INTO "remix_tag" VALUES(329,'strings',1);
+INSERT INTO "remix_tag" VALUES(329,'synth',1);
+INSERT INTO "remix_tag" VALUES(329,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(330,'classical',1);
+INSERT INTO "remix_tag" VALUES(330,'dark',1);
+INSERT INTO "remix_tag" VALUES(330,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(330,'epic',1);
+INSERT INTO "remix_tag" VALUES(330,'oboe',1);
+INSERT INTO "remix_tag" VALUES(330,'strings',1);
+INSERT INTO "remix_tag" VALUES(330,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(330,'violin',1);
+INSERT INTO "remix_tag" VALUES(331,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(331,'brass',1);
+INSERT INTO "remix_tag" VALUES(331,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(331,'chill',1);
+INSERT INTO "remix_tag" VALUES(331,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(331,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(331,'experimental',1);
+INSERT INTO "remix_tag" VALUES(331,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(331,'piano',1);
+INSERT INTO "remix_tag" VALUES(331,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(332,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(332,'chill',1);
+INSERT INTO "remix_tag" VALUES(332,'dark',1);
+INSERT INTO "remix_tag" VALUES(332,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(332,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(332,'experimental',1);
+INSERT INTO "remix_tag" VALUES(332,'piano',1);
+INSERT INTO "remix_tag" VALUES(332,'rock',1);
+INSERT INTO "remix_tag" VALUES(332,'strings',1);
+INSERT INTO "remix_tag" VALUES(332,'synth',1);
+INSERT INTO "remix_tag" VALUES(332,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(333,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(333,'ballad',1);
+INSERT INTO "remix_tag" VALUES(333,'chill',1);
+INSERT INTO "remix_tag" VALUES(333,'dark',1);
+INSERT INTO "remix_tag" VALUES(333,'duet',1);
+INSERT INTO "remix_tag" VALUES(333,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(333,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(333,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(333,'mellow',1);
+INSERT INTO "remix_tag" VALUES(333,'solemn',1);
+INSERT INTO "remix_tag" VALUES(333,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(334,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(334,'dark',1);
+INSERT INTO "remix_tag" VALUES(334,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(334,'experimental',1);
+INSERT INTO "remix_tag" VALUES(334,'quirky',1);
+INSERT INTO "remix_tag" VALUES(334,'synth',1);
+INSERT INTO "remix_tag" VALUES(334,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(335,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(335,'flute',1);
+INSERT INTO "remix_tag" VALUES(335,'funky',1);
+INSERT INTO "remix_tag" VALUES(335,'jazz',1);
+INSERT INTO "remix_tag" VALUES(335,'mellow',1);
+INSERT INTO "remix_tag" VALUES(335,'quirky',1);
+INSERT INTO "remix_tag" VALUES(335,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(336,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(336,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(336,'chill',1);
+INSERT INTO "remix_tag" VALUES(336,'experimental',1);
+INSERT INTO "remix_tag" VALUES(336,'flute',1);
+INSERT INTO "remix_tag" VALUES(336,'piano',1);
+INSERT INTO "remix_tag" VALUES(336,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(337,'chill',1);
+INSERT INTO "remix_tag" VALUES(337,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(337,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(337,'experimental',1);
+INSERT INTO "remix_tag" VALUES(337,'happy',1);
+INSERT INTO "remix_tag" VALUES(337,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(337,'piano',1);
+INSERT INTO "remix_tag" VALUES(337,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(337,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(338,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(338,'synth',1);
+INSERT INTO "remix_tag" VALUES(338,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(338,'trance',1);
+INSERT INTO "remix_tag" VALUES(338,'workout',1);
+INSERT INTO "remix_tag" VALUES(341,'electronic',1);
+INSERT INTO "remix_tag" VALUES(341,'happy',1);
+INSERT INTO "remix_tag" VALUES(341,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(341,'synth',1);
+INSERT INTO "remix_tag" VALUES(341,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(341,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(342,'chill',1);
+INSERT INTO "remix_tag" VALUES(342,'electronic',1);
+INSERT INTO "remix_tag" VALUES(342,'house',1);
+INSERT INTO "remix_tag" VALUES(342,'strings',1);
+INSERT INTO "remix_tag" VALUES(342,'synth',1);
+INSERT INTO "remix_tag" VALUES(342,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(342,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(343,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(343,'chill',1);
+INSERT INTO "remix_tag" VALUES(343,'edm',1);
+INSERT INTO "remix_tag" VALUES(343,'flute',1);
+INSERT INTO "remix_tag" VALUES(343,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(343,'strings',1);
+INSERT INTO "remix_tag" VALUES(343,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(343,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(344,'ambient',1);
+INSERT INTO "remix_tag" VALUES(344,'chill',1);
+INSERT INTO "remix_tag" VALUES(344,'edm',1);
+INSERT INTO "remix_tag" VALUES(344,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(344,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(344,'mellow',1);
+INSERT INTO "remix_tag" VALUES(344,'strings',1);
+INSERT INTO "remix_tag" VALUES(344,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(344,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(345,'chill',1);
+INSERT INTO "remix_tag" VALUES(345,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(345,'mellow',1);
+INSERT INTO "remix_tag" VALUES(345,'piano',1);
+INSERT INTO "remix_tag" VALUES(345,'sad',1);
+INSERT INTO "remix_tag" VALUES(345,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(345,'strings',1);
+INSERT INTO "remix_tag" VALUES(345,'synth',1);
+INSERT INTO "remix_tag" VALUES(345,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(345,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(345,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(346,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(346,'chill',1);
+INSERT INTO "remix_tag" VALUES(346,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(346,'electronic',1);
+INSERT INTO "remix_tag" VALUES(346,'house',1);
+INSERT INTO "remix_tag" VALUES(346,'piano',1);
+INSERT INTO "remix_tag" VALUES(346,'strings',1);
+INSERT INTO "remix_tag" VALUES(346,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(346,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(346,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(347,'ambient',1);
+INSERT INTO "remix_tag" VALUES(347,'dark',1);
+INSERT INTO "remix_tag" VALUES(347,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(347,'mellow',1);
+INSERT INTO "remix_tag" VALUES(347,'new-age',1);
+INSERT INTO "remix_tag" VALUES(347,'piano',1);
+INSERT INTO "remix_tag" VALUES(347,'romantic',1);
+INSERT INTO "remix_tag" VALUES(347,'sad',1);
+INSERT INTO "remix_tag" VALUES(347,'solemn',1);
+INSERT INTO "remix_tag" VALUES(347,'strings',1);
+INSERT INTO "remix_tag" VALUES(347,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(347,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(348,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(348,'dark',1);
+INSERT INTO "remix_tag" VALUES(348,'dnb',1);
+INSERT INTO "remix_tag" VALUES(348,'electronic',1);
+INSERT INTO "remix_tag" VALUES(348,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(348,'synth',1);
+INSERT INTO "remix_tag" VALUES(348,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(348,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(349,'brass',1);
+INSERT INTO "remix_tag" VALUES(349,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(349,'goofy',1);
+INSERT INTO "remix_tag" VALUES(349,'piano',1);
+INSERT INTO "remix_tag" VALUES(349,'swing',1);
+INSERT INTO "remix_tag" VALUES(349,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(349,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(350,'dark',1);
+INSERT INTO "remix_tag" VALUES(350,'electronic',1);
+INSERT INTO "remix_tag" VALUES(350,'industrial',1);
+INSERT INTO "remix_tag" VALUES(350,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(350,'quirky',1);
+INSERT INTO "remix_tag" VALUES(350,'synth',1);
+INSERT INTO "remix_tag" VALUES(350,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(350,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(352,'chill',1);
+INSERT INTO "remix_tag" VALUES(352,'happy',1);
+INSERT INTO "remix_tag" VALUES(352,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(352,'piano',1);
+INSERT INTO "remix_tag" VALUES(352,'quartet',1);
+INSERT INTO "remix_tag" VALUES(352,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(352,'swing',1);
+INSERT INTO "remix_tag" VALUES(352,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(352,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(353,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(353,'chill',1);
+INSERT INTO "remix_tag" VALUES(353,'electronic',1);
+INSERT INTO "remix_tag" VALUES(353,'jungle',1);
+INSERT INTO "remix_tag" VALUES(353,'synth',1);
+INSERT INTO "remix_tag" VALUES(353,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(353,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(354,'ambient',1);
+INSERT INTO "remix_tag" VALUES(354,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(354,'dark',1);
+INSERT INTO "remix_tag" VALUES(354,'distortion',1);
+INSERT INTO "remix_tag" VALUES(354,'electronic',1);
+INSERT INTO "remix_tag" VALUES(354,'glitching',1);
+INSERT INTO "remix_tag" VALUES(354,'solemn',1);
+INSERT INTO "remix_tag" VALUES(354,'strings',1);
+INSERT INTO "remix_tag" VALUES(354,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(354,'synth',1);
+INSERT INTO "remix_tag" VALUES(354,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(354,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(355,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(355,'angry',1);
+INSERT INTO "remix_tag" VALUES(355,'choir',1);
+INSERT INTO "remix_tag" VALUES(355,'dark',1);
+INSERT INTO "remix_tag" VALUES(355,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(355,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(355,'metal',1);
+INSERT INTO "remix_tag" VALUES(355,'organ',1);
+INSERT INTO "remix_tag" VALUES(355,'synth',1);
+INSERT INTO "remix_tag" VALUES(355,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(355,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(356,'chill',1);
+INSERT INTO "remix_tag" VALUES(356,'dark',1);
+INSERT INTO "remix_tag" VALUES(356,'electronic',1);
+INSERT INTO "remix_tag" VALUES(356,'house',1);
+INSERT INTO "remix_tag" VALUES(356,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(356,'organ',1);
+INSERT INTO "remix_tag" VALUES(356,'synth',1);
+INSERT INTO "remix_tag" VALUES(356,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(356,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(357,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(357,'chill',1);
+INSERT INTO "remix_tag" VALUES(357,'dark',1);
+INSERT INTO "remix_tag" VALUES(357,'edm',1);
+INSERT INTO "remix_tag" VALUES(357,'electronic',1);
+INSERT INTO "remix_tag" VALUES(357,'funky',1);
+INSERT INTO "remix_tag" VALUES(357,'synth',1);
+INSERT INTO "remix_tag" VALUES(357,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(357,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(358,'dark',1);
+INSERT INTO "remix_tag" VALUES(358,'edm',1);
+INSERT INTO "remix_tag" VALUES(358,'electronic',1);
+INSERT INTO "remix_tag" VALUES(358,'synth',1);
+INSERT INTO "remix_tag" VALUES(358,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(358,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(358,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(360,'chill',1);
+INSERT INTO "remix_tag" VALUES(360,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(360,'dark',1);
+INSERT INTO "remix_tag" VALUES(360,'edm',1);
+INSERT INTO "remix_tag" VALUES(360,'electronic',1);
+INSERT INTO "remix_tag" VALUES(360,'flute',1);
+INSERT INTO "remix_tag" VALUES(360,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(360,'piano',1);
+INSERT INTO "remix_tag" VALUES(360,'spooky',1);
+INSERT INTO "remix_tag" VALUES(360,'strings',1);
+INSERT INTO "remix_tag" VALUES(360,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(360,'synth',1);
+INSERT INTO "remix_tag" VALUES(360,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(360,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(361,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(361,'chill',1);
+INSERT INTO "remix_tag" VALUES(361,'dnb',1);
+INSERT INTO "remix_tag" VALUES(361,'experimental',1);
+INSERT INTO "remix_tag" VALUES(361,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(361,'quirky',1);
+INSERT INTO "remix_tag" VALUES(361,'synth',1);
+INSERT INTO "remix_tag" VALUES(361,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(361,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(361,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(362,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(362,'distortion',1);
+INSERT INTO "remix_tag" VALUES(362,'dnb',1);
+INSERT INTO "remix_tag" VALUES(362,'funky',1);
+INSERT INTO "remix_tag" VALUES(362,'synth',1);
+INSERT INTO "remix_tag" VALUES(362,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(362,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(362,'workout',1);
+INSERT INTO "remix_tag" VALUES(363,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(363,'distortion',1);
+INSERT INTO "remix_tag" VALUES(363,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(363,'rock',1);
+INSERT INTO "remix_tag" VALUES(363,'synth',1);
+INSERT INTO "remix_tag" VALUES(363,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(363,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(363,'workout',1);
+INSERT INTO "remix_tag" VALUES(364,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(364,'electro',1);
+INSERT INTO "remix_tag" VALUES(364,'funky',1);
+INSERT INTO "remix_tag" VALUES(364,'synth',1);
+INSERT INTO "remix_tag" VALUES(364,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(364,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(366,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(369,'ambient',1);
+INSERT INTO "remix_tag" VALUES(369,'halloween',1);
+INSERT INTO "remix_tag" VALUES(369,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(370,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(376,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(377,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(377,'jazz',1);
+INSERT INTO "remix_tag" VALUES(377,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(377,'mellow',1);
+INSERT INTO "remix_tag" VALUES(377,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(378,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(379,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(380,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(381,'choir',1);
+INSERT INTO "remix_tag" VALUES(381,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(381,'dark',1);
+INSERT INTO "remix_tag" VALUES(381,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(381,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(381,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(381,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(382,'brass',1);
+INSERT INTO "remix_tag" VALUES(382,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(382,'goofy',1);
+INSERT INTO "remix_tag" VALUES(382,'happy',1);
+INSERT INTO "remix_tag" VALUES(382,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(382,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(382,'organ',1);
+INSERT INTO "remix_tag" VALUES(382,'piano',1);
+INSERT INTO "remix_tag" VALUES(382,'reggae',1);
+INSERT INTO "remix_tag" VALUES(382,'ska',1);
+INSERT INTO "remix_tag" VALUES(382,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(382,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(382,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(383,'dance',1);
+INSERT INTO "remix_tag" VALUES(383,'electronic',1);
+INSERT INTO "remix_tag" VALUES(383,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(383,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(383,'piano',1);
+INSERT INTO "remix_tag" VALUES(383,'pop',1);
+INSERT INTO "remix_tag" VALUES(383,'romantic',1);
+INSERT INTO "remix_tag" VALUES(383,'sad',1);
+INSERT INTO "remix_tag" VALUES(383,'singing',1);
+INSERT INTO "remix_tag" VALUES(383,'synth',1);
+INSERT INTO "remix_tag" VALUES(383,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(383,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(383,'trance',1);
+INSERT INTO "remix_tag" VALUES(383,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(383,'workout',1);
+INSERT INTO "remix_tag" VALUES(384,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(384,'ambient',1);
+INSERT INTO "remix_tag" VALUES(384,'dark',1);
+INSERT INTO "remix_tag" VALUES(384,'dnb',1);
+INSERT INTO "remix_tag" VALUES(384,'electronic',1);
+INSERT INTO "remix_tag" VALUES(384,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(384,'synth',1);
+INSERT INTO "remix_tag" VALUES(384,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(384,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(384,'workout',1);
+INSERT INTO "remix_tag" VALUES(385,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(385,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(385,'dark',1);
+INSERT INTO "remix_tag" VALUES(385,'distortion',1);
+INSERT INTO "remix_tag" VALUES(385,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(385,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(385,'rock',1);
+INSERT INTO "remix_tag" VALUES(385,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(385,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(386,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(386,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(386,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(386,'meditation',1);
+INSERT INTO "remix_tag" VALUES(386,'piano',1);
+INSERT INTO "remix_tag" VALUES(386,'sad',1);
+INSERT INTO "remix_tag" VALUES(386,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(386,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(386,'trio',1);
+INSERT INTO "remix_tag" VALUES(387,'dance',1);
+INSERT INTO "remix_tag" VALUES(387,'dark',1);
+INSERT INTO "remix_tag" VALUES(387,'electronic',1);
+INSERT INTO "remix_tag" VALUES(387,'halloween',1);
+INSERT INTO "remix_tag" VALUES(387,'strings',1);
+INSERT INTO "remix_tag" VALUES(387,'synth',1);
+INSERT INTO "remix_tag" VALUES(387,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(387,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(387,'trance',1);
+INSERT INTO "remix_tag" VALUES(387,'workout',1);
+INSERT INTO "remix_tag" VALUES(388,'ambient',1);
+INSERT INTO "remix_tag" VALUES(388,'chill',1);
+INSERT INTO "remix_tag" VALUES(388,'choir',1);
+INSERT INTO "remix_tag" VALUES(388,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(388,'electronic',1);
+INSERT INTO "remix_tag" VALUES(388,'mellow',1);
+INSERT INTO "remix_tag" VALUES(388,'synth',1);
+INSERT INTO "remix_tag" VALUES(388,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(388,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(389,'bells',1);
+INSERT INTO "remix_tag" VALUES(389,'brass',1);
+INSERT INTO "remix_tag" VALUES(389,'dance',1);
+INSERT INTO "remix_tag" VALUES(389,'happy',1);
+INSERT INTO "remix_tag" VALUES(389,'house',1);
+INSERT INTO "remix_tag" VALUES(389,'synth',1);
+INSERT INTO "remix_tag" VALUES(389,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(389,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(389,'workout',1);
+INSERT INTO "remix_tag" VALUES(390,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(390,'edm',1);
+INSERT INTO "remix_tag" VALUES(390,'sad',1);
+INSERT INTO "remix_tag" VALUES(390,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(390,'synth',1);
+INSERT INTO "remix_tag" VALUES(390,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(390,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(391,'ambient',1);
+INSERT INTO "remix_tag" VALUES(391,'chill',1);
+INSERT INTO "remix_tag" VALUES(391,'dark',1);
+INSERT INTO "remix_tag" VALUES(391,'electronic',1);
+INSERT INTO "remix_tag" VALUES(391,'meditation',1);
+INSERT INTO "remix_tag" VALUES(391,'mellow',1);
+INSERT INTO "remix_tag" VALUES(391,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(391,'synth',1);
+INSERT INTO "remix_tag" VALUES(391,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(391,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(391,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(392,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(392,'dnb',1);
+INSERT INTO "remix_tag" VALUES(392,'electronic',1);
+INSERT INTO "remix_tag" VALUES(392,'happy',1);
+INSERT INTO "remix_tag" VALUES(392,'synth',1);
+INSERT INTO "remix_tag" VALUES(392,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(392,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(392,'trance',1);
+INSERT INTO "remix_tag" VALUES(393,'bells',1);
+INSERT INTO "remix_tag" VALUES(393,'electronic',1);
+INSERT INTO "remix_tag" VALUES(393,'house',1);
+INSERT INTO "remix_tag" VALUES(393,'sad',1);
+INSERT INTO "remix_tag" VALUES(393,'synth',1);
+INSERT INTO "remix_tag" VALUES(393,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(393,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(394,'distortion',1);
+INSERT INTO "remix_tag" VALUES(394,'electronic',1);
+INSERT INTO "remix_tag" VALUES(394,'happy',1);
+INSERT INTO "remix_tag" VALUES(394,'house',1);
+INSERT INTO "remix_tag" VALUES(394,'organ',1);
+INSERT INTO "remix_tag" VALUES(394,'synth',1);
+INSERT INTO "remix_tag" VALUES(394,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(394,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(394,'workout',1);
+INSERT INTO "remix_tag" VALUES(395,'dark',1);
+INSERT INTO "remix_tag" VALUES(395,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(395,'electronic',1);
+INSERT INTO "remix_tag" VALUES(395,'experimental',1);
+INSERT INTO "remix_tag" VALUES(395,'glitching',1);
+INSERT INTO "remix_tag" VALUES(395,'industrial',1);
+INSERT INTO "remix_tag" VALUES(395,'spooky',1);
+INSERT INTO "remix_tag" VALUES(395,'synth',1);
+INSERT INTO "remix_tag" VALUES(395,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(395,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(395,'turntable',1);
+INSERT INTO "remix_tag" VALUES(396,'choir',1);
+INSERT INTO "remix_tag" VALUES(396,'distortion',1);
+INSERT INTO "remix_tag" VALUES(396,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(396,'happy',1);
+INSERT INTO "remix_tag" VALUES(396,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(396,'rock',1);
+INSERT INTO "remix_tag" VALUES(396,'solo-guitar',1);
+INSERT INTO "remix_tag" VALUES(396,'synth',1);
+INSERT INTO "remix_tag" VALUES(396,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(396,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(397,'electronic',1);
+INSERT INTO "remix_tag" VALUES(397,'happy',1);
+INSERT INTO "remix_tag" VALUES(397,'house',1);
+INSERT INTO "remix_tag" VALUES(397,'piano',1);
+INSERT INTO "remix_tag" VALUES(397,'sitar',1);
+INSERT INTO "remix_tag" VALUES(397,'synth',1);
+INSERT INTO "remix_tag" VALUES(397,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(397,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(397,'trance',1);
+INSERT INTO "remix_tag" VALUES(397,'violin',1);
+INSERT INTO "remix_tag" VALUES(397,'workout',1);
+INSERT INTO "remix_tag" VALUES(398,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(398,'electronic',1);
+INSERT INTO "remix_tag" VALUES(398,'happy',1);
+INSERT INTO "remix_tag" VALUES(398,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(398,'house',1);
+INSERT INTO "remix_tag" VALUES(398,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(398,'synth',1);
+INSERT INTO "remix_tag" VALUES(398,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(398,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(398,'workout',1);
+INSERT INTO "remix_tag" VALUES(399,'distortion',1);
+INSERT INTO "remix_tag" VALUES(399,'edm',1);
+INSERT INTO "remix_tag" VALUES(399,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(399,'electronic',1);
+INSERT INTO "remix_tag" VALUES(399,'happy',1);
+INSERT INTO "remix_tag" VALUES(399,'synth',1);
+INSERT INTO "remix_tag" VALUES(399,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(399,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(399,'trance',1);
+INSERT INTO "remix_tag" VALUES(401,'collab',1);
+INSERT INTO "remix_tag" VALUES(401,'dance',1);
+INSERT INTO "remix_tag" VALUES(401,'electronic',1);
+INSERT INTO "remix_tag" VALUES(401,'happy',1);
+INSERT INTO "remix_tag" VALUES(401,'organ',1);
+INSERT INTO "remix_tag" VALUES(401,'strings',1);
+INSERT INTO "remix_tag" VALUES(401,'synth',1);
+INSERT INTO "remix_tag" VALUES(401,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(401,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(401,'workout',1);
+INSERT INTO "remix_tag" VALUES(402,'accordion',1);
+INSERT INTO "remix_tag" VALUES(402,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(402,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(402,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(402,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(402,'jazz',1);
+INSERT INTO "remix_tag" VALUES(402,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(402,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(402,'mellow',1);
+INSERT INTO "remix_tag" VALUES(402,'quintet',1);
+INSERT INTO "remix_tag" VALUES(402,'solo-guitar',1);
+INSERT INTO "remix_tag" VALUES(402,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(402,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(403,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(403,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(403,'mellow',1);
+INSERT INTO "remix_tag" VALUES(403,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(403,'piano',1);
+INSERT INTO "remix_tag" VALUES(403,'sad',1);
+INSERT INTO "remix_tag" VALUES(403,'strings',1);
+INSERT INTO "remix_tag" VALUES(403,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(403,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(403,'violin',1);
+INSERT INTO "remix_tag" VALUES(404,'ballad',1);
+INSERT INTO "remix_tag" VALUES(404,'cello',1);
+INSERT INTO "remix_tag" VALUES(404,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(404,'piano',1);
+INSERT INTO "remix_tag" VALUES(404,'romantic',1);
+INSERT INTO "remix_tag" VALUES(404,'sad',1);
+INSERT INTO "remix_tag" VALUES(404,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(404,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(404,'trio',1);
+INSERT INTO "remix_tag" VALUES(404,'violin',1);
+INSERT INTO "remix_tag" VALUES(404,'wedding',1);
+INSERT INTO "remix_tag" VALUES(405,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(405,'cello',1);
+INSERT INTO "remix_tag" VALUES(405,'chill',1);
+INSERT INTO "remix_tag" VALUES(405,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(405,'classical',1);
+INSERT INTO "remix_tag" VALUES(405,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(405,'epic',1);
+INSERT INTO "remix_tag" VALUES(405,'mellow',1);
+INSERT INTO "remix_tag" VALUES(405,'oboe',1);
+INSERT INTO "remix_tag" VALUES(405,'piano',1);
+INSERT INTO "remix_tag" VALUES(405,'strings',1);
+INSERT INTO "remix_tag" VALUES(405,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(405,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(405,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(405,'violin',1);
+INSERT INTO "remix_tag" VALUES(406,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(406,'edm',1);
+INSERT INTO "remix_tag" VALUES(406,'electronic',1);
+INSERT INTO "remix_tag" VALUES(406,'piano',1);
+INSERT INTO "remix_tag" VALUES(406,'synth',1);
+INSERT INTO "remix_tag" VALUES(406,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(406,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(406,'trance',1);
+INSERT INTO "remix_tag" VALUES(407,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(407,'dark',1);
+INSERT INTO "remix_tag" VALUES(407,'halloween',1);
+INSERT INTO "remix_tag" VALUES(407,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(407,'spooky',1);
+INSERT INTO "remix_tag" VALUES(407,'strings',1);
+INSERT INTO "remix_tag" VALUES(407,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(407,'synth',1);
+INSERT INTO "remix_tag" VALUES(407,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(407,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(407,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(407,'waltz',1);
+INSERT INTO "remix_tag" VALUES(408,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(408,'chill',1);
+INSERT INTO "remix_tag" VALUES(408,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(408,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(408,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(408,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(408,'happy',1);
+INSERT INTO "remix_tag" VALUES(408,'marimba',1);
+INSERT INTO "remix_tag" VALUES(408,'piano',1);
+INSERT INTO "remix_tag" VALUES(408,'reggae',1);
+INSERT INTO "remix_tag" VALUES(408,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(408,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(409,'collab',1);
+INSERT INTO "remix_tag" VALUES(409,'dark',1);
+INSERT INTO "remix_tag" VALUES(409,'distortion',1);
+INSERT INTO "remix_tag" VALUES(409,'electronic',1);
+INSERT INTO "remix_tag" VALUES(409,'experimental',1);
+INSERT INTO "remix_tag" VALUES(409,'glitching',1);
+INSERT INTO "remix_tag" VALUES(409,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(409,'spooky',1);
+INSERT INTO "remix_tag" VALUES(409,'synth',1);
+INSERT INTO "remix_tag" VALUES(409,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(409,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(410,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(410,'dark',1);
+INSERT INTO "remix_tag" VALUES(410,'distortion',1);
+INSERT INTO "remix_tag" VALUES(410,'dnb',1);
+INSERT INTO "remix_tag" VALUES(410,'jungle',1);
+INSERT INTO "remix_tag" VALUES(410,'synth',1);
+INSERT INTO "remix_tag" VALUES(410,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(410,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(411,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(411,'ambient',1);
+INSERT INTO "remix_tag" VALUES(411,'bells',1);
+INSERT INTO "remix_tag" VALUES(411,'chill',1);
+INSERT INTO "remix_tag" VALUES(411,'choir',1);
+INSERT INTO "remix_tag" VALUES(411,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(411,'synth',1);
+INSERT INTO "remix_tag" VALUES(411,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(411,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(412,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(412,'distortion',1);
+INSERT INTO "remix_tag" VALUES(412,'edm',1);
+INSERT INTO "remix_tag" VALUES(412,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(412,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(412,'spooky',1);
+INSERT INTO "remix_tag" VALUES(412,'synth',1);
+INSERT INTO "remix_tag" VALUES(412,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(412,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(412,'trance',1);
+INSERT INTO "remix_tag" VALUES(413,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(413,'edm',1);
+INSERT INTO "remix_tag" VALUES(413,'electronic',1);
+INSERT INTO "remix_tag" VALUES(413,'happy',1);
+INSERT INTO "remix_tag" VALUES(413,'piano',1);
+INSERT INTO "remix_tag" VALUES(413,'synth',1);
+INSERT INTO "remix_tag" VALUES(413,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(413,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(413,'trance',1);
+INSERT INTO "remix_tag" VALUES(414,'ambient',1);
+INSERT INTO "remix_tag" VALUES(414,'edm',1);
+INSERT INTO "remix_tag" VALUES(414,'electronic',1);
+INSERT INTO "remix_tag" VALUES(414,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(414,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(414,'piano',1);
+INSERT INTO "remix_tag" VALUES(414,'sad',1);
+INSERT INTO "remix_tag" VALUES(414,'strings',1);
+INSERT INTO "remix_tag" VALUES(414,'synth',1);
+INSERT INTO "remix_tag" VALUES(414,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(414,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(415,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(415,'collab',1);
+INSERT INTO "remix_tag" VALUES(415,'dark',1);
+INSERT INTO "remix_tag" VALUES(415,'distortion',1);
+INSERT INTO "remix_tag" VALUES(415,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(415,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(415,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(415,'rock',1);
+INSERT INTO "remix_tag" VALUES(415,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(415,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(416,'cello',1);
+INSERT INTO "remix_tag" VALUES(416,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(416,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(416,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(416,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(416,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(416,'piano',1);
+INSERT INTO "remix_tag" VALUES(416,'sad',1);
+INSERT INTO "remix_tag" VALUES(416,'solemn',1);
+INSERT INTO "remix_tag" VALUES(416,'strings',1);
+INSERT INTO "remix_tag" VALUES(416,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(416,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(417,'ambient',1);
+INSERT INTO "remix_tag" VALUES(417,'bells',1);
+INSERT INTO "remix_tag" VALUES(417,'chill',1);
+INSERT INTO "remix_tag" VALUES(417,'dark',1);
+INSERT INTO "remix_tag" VALUES(417,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(417,'electronic',1);
+INSERT INTO "remix_tag" VALUES(417,'glitching',1);
+INSERT INTO "remix_tag" VALUES(417,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(417,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(417,'strings',1);
+INSERT INTO "remix_tag" VALUES(417,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(417,'synth',1);
+INSERT INTO "remix_tag" VALUES(417,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(417,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(417,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(417,'turntable',1);
+INSERT INTO "remix_tag" VALUES(418,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(418,'brass',1);
+INSERT INTO "remix_tag" VALUES(418,'chill',1);
+INSERT INTO "remix_tag" VALUES(418,'edm',1);
+INSERT INTO "remix_tag" VALUES(418,'latin',1);
+INSERT INTO "remix_tag" VALUES(418,'mellow',1);
+INSERT INTO "remix_tag" VALUES(418,'piano',1);
+INSERT INTO "remix_tag" VALUES(418,'strings',1);
+INSERT INTO "remix_tag" VALUES(418,'synth',1);
+INSERT INTO "remix_tag" VALUES(418,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(418,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(418,'violin',1);
+INSERT INTO "remix_tag" VALUES(419,'dark',1);
+INSERT INTO "remix_tag" VALUES(419,'edm',1);
+INSERT INTO "remix_tag" VALUES(419,'experimental',1);
+INSERT INTO "remix_tag" VALUES(419,'piano',1);
+INSERT INTO "remix_tag" VALUES(419,'spooky',1);
+INSERT INTO "remix_tag" VALUES(419,'synth',1);
+INSERT INTO "remix_tag" VALUES(419,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(419,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(420,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(420,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(420,'happy',1);
+INSERT INTO "remix_tag" VALUES(420,'strings',1);
+INSERT INTO "remix_tag" VALUES(420,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(420,'synth',1);
+INSERT INTO "remix_tag" VALUES(420,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(420,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(420,'trance',1);
+INSERT INTO "remix_tag" VALUES(421,'bells',1);
+INSERT INTO "remix_tag" VALUES(421,'dance',1);
+INSERT INTO "remix_tag" VALUES(421,'edm',1);
+INSERT INTO "remix_tag" VALUES(421,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(421,'happy',1);
+INSERT INTO "remix_tag" VALUES(421,'strings',1);
+INSERT INTO "remix_tag" VALUES(421,'synth',1);
+INSERT INTO "remix_tag" VALUES(421,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(421,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(421,'workout',1);
+INSERT INTO "remix_tag" VALUES(422,'ballad',1);
+INSERT INTO "remix_tag" VALUES(422,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(422,'funny',1);
+INSERT INTO "remix_tag" VALUES(422,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(422,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(422,'mellow',1);
+INSERT INTO "remix_tag" VALUES(422,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(422,'piano',1);
+INSERT INTO "remix_tag" VALUES(422,'quirky',1);
+INSERT INTO "remix_tag" VALUES(422,'romantic',1);
+INSERT INTO "remix_tag" VALUES(422,'singing',1);
+INSERT INTO "remix_tag" VALUES(422,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(422,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(422,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(423,'dance',1);
+INSERT INTO "remix_tag" VALUES(423,'edm',1);
+INSERT INTO "remix_tag" VALUES(423,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(423,'electronic',1);
+INSERT INTO "remix_tag" VALUES(423,'happy',1);
+INSERT INTO "remix_tag" VALUES(423,'piano',1);
+INSERT INTO "remix_tag" VALUES(423,'strings',1);
+INSERT INTO "remix_tag" VALUES(423,'synth',1);
+INSERT INTO "remix_tag" VALUES(423,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(423,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(423,'trance',1);
+INSERT INTO "remix_tag" VALUES(423,'workout',1);
+INSERT INTO "remix_tag" VALUES(424,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(424,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(424,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(424,'electronic',1);
+INSERT INTO "remix_tag" VALUES(424,'experimental',1);
+INSERT INTO "remix_tag" VALUES(424,'goofy',1);
+INSERT INTO "remix_tag" VALUES(424,'quirky',1);
+INSERT INTO "remix_tag" VALUES(424,'rock',1);
+INSERT INTO "remix_tag" VALUES(424,'synth',1);
+INSERT INTO "remix_tag" VALUES(424,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(424,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(425,'ambient',1);
+INSERT INTO "remix_tag" VALUES(425,'ballad',1);
+INSERT INTO "remix_tag" VALUES(425,'bells',1);
+INSERT INTO "remix_tag" VALUES(425,'chill',1);
+INSERT INTO "remix_tag" VALUES(425,'choir',1);
+INSERT INTO "remix_tag" VALUES(425,'flute',1);
+INSERT INTO "remix_tag" VALUES(425,'mellow',1);
+INSERT INTO "remix_tag" VALUES(425,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(425,'piano',1);
+INSERT INTO "remix_tag" VALUES(425,'romantic',1);
+INSERT INTO "remix_tag" VALUES(425,'sad',1);
+INSERT INTO "remix_tag" VALUES(425,'solo',1);
+INSERT INTO "remix_tag" VALUES(425,'synth',1);
+INSERT INTO "remix_tag" VALUES(425,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(425,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(425,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(426,'brass',1);
+INSERT INTO "remix_tag" VALUES(426,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(426,'goofy',1);
+INSERT INTO "remix_tag" VALUES(426,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(426,'latin',1);
+INSERT INTO "remix_tag" VALUES(426,'marimba',1);
+INSERT INTO "remix_tag" VALUES(426,'spooky',1);
+INSERT INTO "remix_tag" VALUES(426,'synth',1);
+INSERT INTO "remix_tag" VALUES(426,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(426,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(426,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(427,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(427,'ambient',1);
+INSERT INTO "remix_tag" VALUES(427,'chill',1);
+INSERT INTO "remix_tag" VALUES(427,'distortion',1);
+INSERT INTO "remix_tag" VALUES(427,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(427,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(427,'piano',1);
+INSERT INTO "remix_tag" VALUES(427,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(427,'synth',1);
+INSERT INTO "remix_tag" VALUES(427,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(427,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(428,'edm',1);
+INSERT INTO "remix_tag" VALUES(428,'electronic',1);
+INSERT INTO "remix_tag" VALUES(428,'goofy',1);
+INSERT INTO "remix_tag" VALUES(428,'happy',1);
+INSERT INTO "remix_tag" VALUES(428,'house',1);
+INSERT INTO "remix_tag" VALUES(428,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(428,'synth',1);
+INSERT INTO "remix_tag" VALUES(428,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(428,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(428,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(428,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(429,'choir',1);
+INSERT INTO "remix_tag" VALUES(429,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(429,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(429,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(429,'flute',1);
+INSERT INTO "remix_tag" VALUES(429,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(429,'piano',1);
+INSERT INTO "remix_tag" VALUES(429,'sad',1);
+INSERT INTO "remix_tag" VALUES(429,'solemn',1);
+INSERT INTO "remix_tag" VALUES(429,'strings',1);
+INSERT INTO "remix_tag" VALUES(429,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(429,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(430,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(430,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(430,'distortion',1);
+INSERT INTO "remix_tag" VALUES(430,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(430,'glitching',1);
+INSERT INTO "remix_tag" VALUES(430,'piano',1);
+INSERT INTO "remix_tag" VALUES(430,'rock',1);
+INSERT INTO "remix_tag" VALUES(430,'synth',1);
+INSERT INTO "remix_tag" VALUES(430,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(430,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(431,'chill',1);
+INSERT INTO "remix_tag" VALUES(431,'dark',1);
+INSERT INTO "remix_tag" VALUES(431,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(431,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(431,'halloween',1);
+INSERT INTO "remix_tag" VALUES(431,'indian',1);
+INSERT INTO "remix_tag" VALUES(431,'jazz',1);
+INSERT INTO "remix_tag" VALUES(431,'meditation',1);
+INSERT INTO "remix_tag" VALUES(431,'sad',1);
+INSERT INTO "remix_tag" VALUES(431,'sitar',1);
+INSERT INTO "remix_tag" VALUES(431,'synth',1);
+INSERT INTO "remix_tag" VALUES(431,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(431,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(431,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(432,'chill',1);
+INSERT INTO "remix_tag" VALUES(432,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(432,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(432,'jazz',1);
+INSERT INTO "remix_tag" VALUES(432,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(432,'organ',1);
+INSERT INTO "remix_tag" VALUES(432,'piano',1);
+INSERT INTO "remix_tag" VALUES(432,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(432,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(432,'trio',1);
+INSERT INTO "remix_tag" VALUES(433,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(433,'collab',1);
+INSERT INTO "remix_tag" VALUES(433,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(433,'edm',1);
+INSERT INTO "remix_tag" VALUES(433,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(433,'japanese',1);
+INSERT INTO "remix_tag" VALUES(433,'koto',1);
+INSERT INTO "remix_tag" VALUES(433,'marimba',1);
+INSERT INTO "remix_tag" VALUES(433,'piano',1);
+INSERT INTO "remix_tag" VALUES(433,'rock',1);
+INSERT INTO "remix_tag" VALUES(433,'synth',1);
+INSERT INTO "remix_tag" VALUES(433,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(433,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(434,'edm',1);
+INSERT INTO "remix_tag" VALUES(434,'flute',1);
+INSERT INTO "remix_tag" VALUES(434,'glitching',1);
+INSERT INTO "remix_tag" VALUES(434,'goofy',1);
+INSERT INTO "remix_tag" VALUES(434,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(434,'happy',1);
+INSERT INTO "remix_tag" VALUES(434,'house',1);
+INSERT INTO "remix_tag" VALUES(434,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(434,'sitar',1);
+INSERT INTO "remix_tag" VALUES(434,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(434,'synth',1);
+INSERT INTO "remix_tag" VALUES(434,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(434,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(434,'turntable',1);
+INSERT INTO "remix_tag" VALUES(434,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(435,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(435,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(435,'brass',1);
+INSERT INTO "remix_tag" VALUES(435,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(435,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(435,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(435,'flute',1);
+INSERT INTO "remix_tag" VALUES(435,'funk',1);
+INSERT INTO "remix_tag" VALUES(435,'funky',1);
+INSERT INTO "remix_tag" VALUES(435,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(435,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(435,'piano',1);
+INSERT INTO "remix_tag" VALUES(435,'synth',1);
+INSERT INTO "remix_tag" VALUES(435,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(435,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(435,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(435,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(435,'workout',1);
+INSERT INTO "remix_tag" VALUES(436,'happy',1);
+INSERT INTO "remix_tag" VALUES(436,'house',1);
+INSERT INTO "remix_tag" VALUES(436,'synth',1);
+INSERT INTO "remix_tag" VALUES(436,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(436,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(436,'trance',1);
+INSERT INTO "remix_tag" VALUES(437,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(437,'chill',1);
+INSERT INTO "remix_tag" VALUES(437,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(437,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(437,'jazz',1);
+INSERT INTO "remix_tag" VALUES(437,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(437,'piano',1);
+INSERT INTO "remix_tag" VALUES(437,'quartet',1);
+INSERT INTO "remix_tag" VALUES(437,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(437,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(438,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(438,'edm',1);
+INSERT INTO "remix_tag" VALUES(438,'funky',1);
+INSERT INTO "remix_tag" VALUES(438,'happy',1);
+INSERT INTO "remix_tag" VALUES(438,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(438,'japanese',1);
+INSERT INTO "remix_tag" VALUES(438,'koto',1);
+INSERT INTO "remix_tag" VALUES(438,'sitar',1);
+INSERT INTO "remix_tag" VALUES(438,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(438,'synth',1);
+INSERT INTO "remix_tag" VALUES(438,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(438,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(439,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(439,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(439,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(439,'happy',1);
+INSERT INTO "remix_tag" VALUES(439,'jazz',1);
+INSERT INTO "remix_tag" VALUES(439,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(439,'organ',1);
+INSERT INTO "remix_tag" VALUES(439,'piano',1);
+INSERT INTO "remix_tag" VALUES(439,'quintet',1);
+INSERT INTO "remix_tag" VALUES(439,'swing',1);
+INSERT INTO "remix_tag" VALUES(439,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(439,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(440,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(440,'cowbell',1);
+INSERT INTO "remix_tag" VALUES(440,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(440,'electronic',1);
+INSERT INTO "remix_tag" VALUES(440,'flute',1);
+INSERT INTO "remix_tag" VALUES(440,'goofy',1);
+INSERT INTO "remix_tag" VALUES(440,'happy',1);
+INSERT INTO "remix_tag" VALUES(440,'latin',1);
+INSERT INTO "remix_tag" VALUES(440,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(440,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(440,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(440,'workout',1);
+INSERT INTO "remix_tag" VALUES(442,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(442,'chill',1);
+INSERT INTO "remix_tag" VALUES(442,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(442,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(442,'collab',1);
+INSERT INTO "remix_tag" VALUES(442,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(442,'edm',1);
+INSERT INTO "remix_tag" VALUES(442,'happy',1);
+INSERT INTO "remix_tag" VALUES(442,'meditation',1);
+INSERT INTO "remix_tag" VALUES(442,'piano',1);
+INSERT INTO "remix_tag" VALUES(442,'synth',1);
+INSERT INTO "remix_tag" VALUES(442,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(442,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(443,'brass',1);
+INSERT INTO "remix_tag" VALUES(443,'celtic',1);
+INSERT INTO "remix_tag" VALUES(443,'choir',1);
+INSERT INTO "remix_tag" VALUES(443,'goofy',1);
+INSERT INTO "remix_tag" VALUES(443,'march',1);
+INSERT INTO "remix_tag" VALUES(443,'organ',1);
+INSERT INTO "remix_tag" VALUES(443,'solemn',1);
+INSERT INTO "remix_tag" VALUES(443,'synth',1);
+INSERT INTO "remix_tag" VALUES(443,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(443,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(444,'ambient',1);
+INSERT INTO "remix_tag" VALUES(444,'ballad',1);
+INSERT INTO "remix_tag" VALUES(444,'cello',1);
+INSERT INTO "remix_tag" VALUES(444,'collab',1);
+INSERT INTO "remix_tag" VALUES(444,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(444,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(444,'flute',1);
+INSERT INTO "remix_tag" VALUES(444,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(444,'meditation',1);
+INSERT INTO "remix_tag" VALUES(444,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(444,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(444,'piano',1);
+INSERT INTO "remix_tag" VALUES(444,'sad',1);
+INSERT INTO "remix_tag" VALUES(444,'solemn',1);
+INSERT INTO "remix_tag" VALUES(444,'strings',1);
+INSERT INTO "remix_tag" VALUES(444,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(444,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(445,'edm',1);
+INSERT INTO "remix_tag" VALUES(445,'happy',1);
+INSERT INTO "remix_tag" VALUES(445,'house',1);
+INSERT INTO "remix_tag" VALUES(445,'synth',1);
+INSERT INTO "remix_tag" VALUES(445,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(445,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(446,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(446,'bells',1);
+INSERT INTO "remix_tag" VALUES(446,'flute',1);
+INSERT INTO "remix_tag" VALUES(446,'happy',1);
+INSERT INTO "remix_tag" VALUES(446,'latin',1);
+INSERT INTO "remix_tag" VALUES(446,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(446,'synth',1);
+INSERT INTO "remix_tag" VALUES(446,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(446,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(447,'accordion',1);
+INSERT INTO "remix_tag" VALUES(447,'chill',1);
+INSERT INTO "remix_tag" VALUES(447,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(447,'experimental',1);
+INSERT INTO "remix_tag" VALUES(447,'mellow',1);
+INSERT INTO "remix_tag" VALUES(447,'organ',1);
+INSERT INTO "remix_tag" VALUES(447,'strings',1);
+INSERT INTO "remix_tag" VALUES(447,'synth',1);
+INSERT INTO "remix_tag" VALUES(447,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(447,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(448,'dark',1);
+INSERT INTO "remix_tag" VALUES(448,'house',1);
+INSERT INTO "remix_tag" VALUES(448,'synth',1);
+INSERT INTO "remix_tag" VALUES(448,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(448,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(448,'trance',1);
+INSERT INTO "remix_tag" VALUES(449,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(449,'collab',1);
+INSERT INTO "remix_tag" VALUES(449,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(449,'jazz',1);
+INSERT INTO "remix_tag" VALUES(449,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(449,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(449,'piano',1);
+INSERT INTO "remix_tag" VALUES(449,'quartet',1);
+INSERT INTO "remix_tag" VALUES(449,'sexy',1);
+INSERT INTO "remix_tag" VALUES(449,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(449,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(449,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(450,'ambient',1);
+INSERT INTO "remix_tag" VALUES(450,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(450,'collab',1);
+INSERT INTO "remix_tag" VALUES(450,'dark',1);
+INSERT INTO "remix_tag" VALUES(450,'experimental',1);
+INSERT INTO "remix_tag" VALUES(450,'halloween',1);
+INSERT INTO "remix_tag" VALUES(450,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(450,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(450,'piano',1);
+INSERT INTO "remix_tag" VALUES(450,'spooky',1);
+INSERT INTO "remix_tag" VALUES(450,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(450,'synth',1);
+INSERT INTO "remix_tag" VALUES(450,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(450,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(450,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(451,'collab',1);
+INSERT INTO "remix_tag" VALUES(451,'dark',1);
+INSERT INTO "remix_tag" VALUES(451,'distortion',1);
+INSERT INTO "remix_tag" VALUES(451,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(451,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(451,'electronic',1);
+INSERT INTO "remix_tag" VALUES(451,'experimental',1);
+INSERT INTO "remix_tag" VALUES(451,'glitching',1);
+INSERT INTO "remix_tag" VALUES(451,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(451,'piano',1);
+INSERT INTO "remix_tag" VALUES(451,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(451,'spooky',1);
+INSERT INTO "remix_tag" VALUES(451,'synth',1);
+INSERT INTO "remix_tag" VALUES(451,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(451,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(453,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(453,'bells',1);
+INSERT INTO "remix_tag" VALUES(453,'chill',1);
+INSERT INTO "remix_tag" VALUES(453,'edm',1);
+INSERT INTO "remix_tag" VALUES(453,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(453,'happy',1);
+INSERT INTO "remix_tag" VALUES(453,'piano',1);
+INSERT INTO "remix_tag" VALUES(453,'synth',1);
+INSERT INTO "remix_tag" VALUES(453,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(453,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(453,'workout',1);
+INSERT INTO "remix_tag" VALUES(454,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(454,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(454,'bells',1);
+INSERT INTO "remix_tag" VALUES(454,'chill',1);
+INSERT INTO "remix_tag" VALUES(454,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(454,'flute',1);
+INSERT INTO "remix_tag" VALUES(454,'harp',1);
+INSERT INTO "remix_tag" VALUES(454,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(454,'marimba',1);
+INSERT INTO "remix_tag" VALUES(454,'mellow',1);
+INSERT INTO "remix_tag" VALUES(454,'strings',1);
+INSERT INTO "remix_tag" VALUES(454,'synth',1);
+INSERT INTO "remix_tag" VALUES(454,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(454,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(454,'turntable',1);
+INSERT INTO "remix_tag" VALUES(455,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(455,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(455,'jazz',1);
+INSERT INTO "remix_tag" VALUES(455,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(455,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(455,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(455,'mellow',1);
+INSERT INTO "remix_tag" VALUES(455,'piano',1);
+INSERT INTO "remix_tag" VALUES(455,'synth',1);
+INSERT INTO "remix_tag" VALUES(455,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(455,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(455,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(455,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(456,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(456,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(456,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(456,'funk',1);
+INSERT INTO "remix_tag" VALUES(456,'funky',1);
+INSERT INTO "remix_tag" VALUES(456,'goofy',1);
+INSERT INTO "remix_tag" VALUES(456,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(456,'synth',1);
+INSERT INTO "remix_tag" VALUES(456,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(456,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(456,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(457,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(457,'choir',1);
+INSERT INTO "remix_tag" VALUES(457,'dance',1);
+INSERT INTO "remix_tag" VALUES(457,'dark',1);
+INSERT INTO "remix_tag" VALUES(457,'edm',1);
+INSERT INTO "remix_tag" VALUES(457,'glitching',1);
+INSERT INTO "remix_tag" VALUES(457,'happy',1);
+INSERT INTO "remix_tag" VALUES(457,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(457,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(457,'synth',1);
+INSERT INTO "remix_tag" VALUES(457,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(457,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(458,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(458,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(458,'choir',1);
+INSERT INTO "remix_tag" VALUES(458,'edm',1);
+INSERT INTO "remix_tag" VALUES(458,'happy',1);
+INSERT INTO "remix_tag" VALUES(458,'harp',1);
+INSERT INTO "remix_tag" VALUES(458,'koto',1);
+INSERT INTO "remix_tag" VALUES(458,'synth',1);
+INSERT INTO "remix_tag" VALUES(458,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(458,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(458,'trance',1);
+INSERT INTO "remix_tag" VALUES(458,'workout',1);
+INSERT INTO "remix_tag" VALUES(459,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(459,'brass',1);
+INSERT INTO "remix_tag" VALUES(459,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(459,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(459,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(459,'happy',1);
+INSERT INTO "remix_tag" VALUES(459,'jazz',1);
+INSERT INTO "remix_tag" VALUES(459,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(459,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(459,'rock',1);
+INSERT INTO "remix_tag" VALUES(459,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(459,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(459,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(459,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(461,'brass',1);
+INSERT INTO "remix_tag" VALUES(461,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(461,'latin',1);
+INSERT INTO "remix_tag" VALUES(461,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(463,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(464,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(465,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(465,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(471,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(474,'dance',1);
+INSERT INTO "remix_tag" VALUES(474,'electronic',1);
+INSERT INTO "remix_tag" VALUES(474,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(474,'synth',1);
+INSERT INTO "remix_tag" VALUES(474,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(474,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(476,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(479,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(483,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(486,'ambient',1);
+INSERT INTO "remix_tag" VALUES(486,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(486,'piano',1);
+INSERT INTO "remix_tag" VALUES(486,'strings',1);
+INSERT INTO "remix_tag" VALUES(486,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(487,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(487,'mellow',1);
+INSERT INTO "remix_tag" VALUES(487,'piano',1);
+INSERT INTO "remix_tag" VALUES(487,'strings',1);
+INSERT INTO "remix_tag" VALUES(487,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(488,'bells',1);
+INSERT INTO "remix_tag" VALUES(488,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(488,'happy',1);
+INSERT INTO "remix_tag" VALUES(488,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(488,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(489,'bells',1);
+INSERT INTO "remix_tag" VALUES(489,'happy',1);
+INSERT INTO "remix_tag" VALUES(489,'strings',1);
+INSERT INTO "remix_tag" VALUES(489,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(489,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(495,'electronic',1);
+INSERT INTO "remix_tag" VALUES(495,'synth',1);
+INSERT INTO "remix_tag" VALUES(501,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(501,'electronic',1);
+INSERT INTO "remix_tag" VALUES(501,'happy',1);
+INSERT INTO "remix_tag" VALUES(501,'house',1);
+INSERT INTO "remix_tag" VALUES(501,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(501,'quirky',1);
+INSERT INTO "remix_tag" VALUES(501,'synth',1);
+INSERT INTO "remix_tag" VALUES(501,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(501,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(502,'electronic',1);
+INSERT INTO "remix_tag" VALUES(502,'epic',1);
+INSERT INTO "remix_tag" VALUES(502,'happy',1);
+INSERT INTO "remix_tag" VALUES(502,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(502,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(502,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(502,'strings',1);
+INSERT INTO "remix_tag" VALUES(502,'synth',1);
+INSERT INTO "remix_tag" VALUES(502,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(502,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(503,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(503,'angry',1);
+INSERT INTO "remix_tag" VALUES(503,'dark',1);
+INSERT INTO "remix_tag" VALUES(503,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(503,'epic',1);
+INSERT INTO "remix_tag" VALUES(503,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(503,'rock',1);
+INSERT INTO "remix_tag" VALUES(503,'sad',1);
+INSERT INTO "remix_tag" VALUES(503,'solemn',1);
+INSERT INTO "remix_tag" VALUES(503,'strings',1);
+INSERT INTO "remix_tag" VALUES(503,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(503,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(504,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(504,'electro',1);
+INSERT INTO "remix_tag" VALUES(504,'electronic',1);
+INSERT INTO "remix_tag" VALUES(504,'glitching',1);
+INSERT INTO "remix_tag" VALUES(504,'happy',1);
+INSERT INTO "remix_tag" VALUES(504,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(504,'quirky',1);
+INSERT INTO "remix_tag" VALUES(504,'synth',1);
+INSERT INTO "remix_tag" VALUES(504,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(504,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(505,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(505,'edm',1);
+INSERT INTO "remix_tag" VALUES(505,'electronic',1);
+INSERT INTO "remix_tag" VALUES(505,'glitching',1);
+INSERT INTO "remix_tag" VALUES(505,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(505,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(505,'synth',1);
+INSERT INTO "remix_tag" VALUES(505,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(505,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(505,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(506,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(506,'distortion',1);
+INSERT INTO "remix_tag" VALUES(506,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(506,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(506,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(506,'metal',1);
+INSERT INTO "remix_tag" VALUES(506,'rock',1);
+INSERT INTO "remix_tag" VALUES(506,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(506,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(508,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(508,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(508,'choir',1);
+INSERT INTO "remix_tag" VALUES(508,'dnb',1);
+INSERT INTO "remix_tag" VALUES(508,'electronic',1);
+INSERT INTO "remix_tag" VALUES(508,'synth',1);
+INSERT INTO "remix_tag" VALUES(508,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(508,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(509,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(509,'cello',1);
+INSERT INTO "remix_tag" VALUES(509,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(509,'piano',1);
+INSERT INTO "remix_tag" VALUES(509,'romantic',1);
+INSERT INTO "remix_tag" VALUES(509,'sad',1);
+INSERT INTO "remix_tag" VALUES(509,'solemn',1);
+INSERT INTO "remix_tag" VALUES(509,'strings',1);
+INSERT INTO "remix_tag" VALUES(509,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(509,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(510,'dark',1);
+INSERT INTO "remix_tag" VALUES(510,'distortion',1);
+INSERT INTO "remix_tag" VALUES(510,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(510,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(510,'electronic',1);
+INSERT INTO "remix_tag" VALUES(510,'funky',1);
+INSERT INTO "remix_tag" VALUES(510,'organ',1);
+INSERT INTO "remix_tag" VALUES(510,'piano',1);
+INSERT INTO "remix_tag" VALUES(510,'rock',1);
+INSERT INTO "remix_tag" VALUES(510,'strings',1);
+INSERT INTO "remix_tag" VALUES(510,'synth',1);
+INSERT INTO "remix_tag" VALUES(510,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(510,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(510,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(513,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(525,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(525,'rock',1);
+INSERT INTO "remix_tag" VALUES(525,'synth',1);
+INSERT INTO "remix_tag" VALUES(527,'electronic',1);
+INSERT INTO "remix_tag" VALUES(527,'synth',1);
+INSERT INTO "remix_tag" VALUES(532,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(533,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(534,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(541,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(541,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(541,'flute',1);
+INSERT INTO "remix_tag" VALUES(541,'funk',1);
+INSERT INTO "remix_tag" VALUES(541,'funky',1);
+INSERT INTO "remix_tag" VALUES(541,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(541,'organ',1);
+INSERT INTO "remix_tag" VALUES(541,'rock',1);
+INSERT INTO "remix_tag" VALUES(541,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(541,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(544,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(545,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(552,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(552,'brass',1);
+INSERT INTO "remix_tag" VALUES(552,'synth',1);
+INSERT INTO "remix_tag" VALUES(552,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(557,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(558,'ambient',1);
+INSERT INTO "remix_tag" VALUES(558,'dark',1);
+INSERT INTO "remix_tag" VALUES(558,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(558,'halloween',1);
+INSERT INTO "remix_tag" VALUES(558,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(565,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(567,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(567,'funky',1);
+INSERT INTO "remix_tag" VALUES(567,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(567,'world',1);
+INSERT INTO "remix_tag" VALUES(569,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(570,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(571,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(572,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(574,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(576,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(581,'fusion',1);
+INSERT INTO "remix_tag" VALUES(581,'jazz',1);
+INSERT INTO "remix_tag" VALUES(581,'piano',1);
+INSERT INTO "remix_tag" VALUES(591,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(591,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(591,'bells',1);
+INSERT INTO "remix_tag" VALUES(591,'chill',1);
+INSERT INTO "remix_tag" VALUES(591,'collab',1);
+INSERT INTO "remix_tag" VALUES(591,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(591,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(591,'flute',1);
+INSERT INTO "remix_tag" VALUES(591,'latin',1);
+INSERT INTO "remix_tag" VALUES(591,'meditation',1);
+INSERT INTO "remix_tag" VALUES(591,'mellow',1);
+INSERT INTO "remix_tag" VALUES(591,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(591,'strings',1);
+INSERT INTO "remix_tag" VALUES(591,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(591,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(592,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(592,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(592,'classical',1);
+INSERT INTO "remix_tag" VALUES(592,'oboe',1);
+INSERT INTO "remix_tag" VALUES(592,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(592,'piano',1);
+INSERT INTO "remix_tag" VALUES(592,'strings',1);
+INSERT INTO "remix_tag" VALUES(592,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(592,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(593,'dark',1);
+INSERT INTO "remix_tag" VALUES(593,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(593,'dnb',1);
+INSERT INTO "remix_tag" VALUES(593,'halloween',1);
+INSERT INTO "remix_tag" VALUES(593,'piano',1);
+INSERT INTO "remix_tag" VALUES(593,'spooky',1);
+INSERT INTO "remix_tag" VALUES(593,'synth',1);
+INSERT INTO "remix_tag" VALUES(593,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(594,'distortion',1);
+INSERT INTO "remix_tag" VALUES(594,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(594,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(594,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(594,'mellow',1);
+INSERT INTO "remix_tag" VALUES(594,'piano',1);
+INSERT INTO "remix_tag" VALUES(594,'solemn',1);
+INSERT INTO "remix_tag" VALUES(594,'synth',1);
+INSERT INTO "remix_tag" VALUES(594,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(595,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(595,'carribean',1);
+INSERT INTO "remix_tag" VALUES(595,'energetic',1);
+INSERT INTO "remix_tag" VALUES(595,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(595,'flute',1);
+INSERT INTO "remix_tag" VALUES(595,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(595,'happy',1);
+INSERT INTO "remix_tag" VALUES(595,'latin',1);
+INSERT INTO "remix_tag" VALUES(595,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(595,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(595,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(596,'bells',1);
+INSERT INTO "remix_tag" VALUES(596,'chill',1);
+INSERT INTO "remix_tag" VALUES(596,'edm',1);
+INSERT INTO "remix_tag" VALUES(596,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(596,'electronic',1);
+INSERT INTO "remix_tag" VALUES(596,'energetic',1);
+INSERT INTO "remix_tag" VALUES(596,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(596,'funk',1);
+INSERT INTO "remix_tag" VALUES(596,'funky',1);
+INSERT INTO "remix_tag" VALUES(596,'synth',1);
+INSERT INTO "remix_tag" VALUES(596,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(596,'workout',1);
+INSERT INTO "remix_tag" VALUES(597,'dance',1);
+INSERT INTO "remix_tag" VALUES(597,'electronic',1);
+INSERT INTO "remix_tag" VALUES(597,'energetic',1);
+INSERT INTO "remix_tag" VALUES(597,'piano',1);
+INSERT INTO "remix_tag" VALUES(597,'synth',1);
+INSERT INTO "remix_tag" VALUES(597,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(597,'workout',1);
+INSERT INTO "remix_tag" VALUES(598,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(598,'distortion',1);
+INSERT INTO "remix_tag" VALUES(598,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(598,'electronic',1);
+INSERT INTO "remix_tag" VALUES(598,'energetic',1);
+INSERT INTO "remix_tag" VALUES(598,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(598,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(598,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(598,'rock',1);
+INSERT INTO "remix_tag" VALUES(598,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(599,'classical',1);
+INSERT INTO "remix_tag" VALUES(599,'happy',1);
+INSERT INTO "remix_tag" VALUES(599,'piano',1);
+INSERT INTO "remix_tag" VALUES(599,'romantic',1);
+INSERT INTO "remix_tag" VALUES(599,'solo',1);
+INSERT INTO "remix_tag" VALUES(599,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(599,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(599,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(599,'wedding',1);
+INSERT INTO "remix_tag" VALUES(600,'ambient',1);
+INSERT INTO "remix_tag" VALUES(600,'bells',1);
+INSERT INTO "remix_tag" VALUES(600,'chill',1);
+INSERT INTO "remix_tag" VALUES(600,'distortion',1);
+INSERT INTO "remix_tag" VALUES(600,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(600,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(600,'electronic',1);
+INSERT INTO "remix_tag" VALUES(600,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(600,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(600,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(600,'rock',1);
+INSERT INTO "remix_tag" VALUES(600,'solemn',1);
+INSERT INTO "remix_tag" VALUES(600,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(601,'ambient',1);
+INSERT INTO "remix_tag" VALUES(601,'dark',1);
+INSERT INTO "remix_tag" VALUES(601,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(601,'halloween',1);
+INSERT INTO "remix_tag" VALUES(601,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(601,'piano',1);
+INSERT INTO "remix_tag" VALUES(601,'sad',1);
+INSERT INTO "remix_tag" VALUES(601,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(601,'spooky',1);
+INSERT INTO "remix_tag" VALUES(601,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(601,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(602,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(602,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(602,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(602,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(602,'funk',1);
+INSERT INTO "remix_tag" VALUES(602,'funky',1);
+INSERT INTO "remix_tag" VALUES(602,'quirky',1);
+INSERT INTO "remix_tag" VALUES(602,'synth',1);
+INSERT INTO "remix_tag" VALUES(602,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(603,'dance',1);
+INSERT INTO "remix_tag" VALUES(603,'electronic',1);
+INSERT INTO "remix_tag" VALUES(603,'energetic',1);
+INSERT INTO "remix_tag" VALUES(603,'happy',1);
+INSERT INTO "remix_tag" VALUES(603,'synth',1);
+INSERT INTO "remix_tag" VALUES(603,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(603,'workout',1);
+INSERT INTO "remix_tag" VALUES(604,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(604,'electro',1);
+INSERT INTO "remix_tag" VALUES(604,'energetic',1);
+INSERT INTO "remix_tag" VALUES(604,'funk',1);
+INSERT INTO "remix_tag" VALUES(604,'funky',1);
+INSERT INTO "remix_tag" VALUES(604,'piano',1);
+INSERT INTO "remix_tag" VALUES(604,'synth',1);
+INSERT INTO "remix_tag" VALUES(604,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(605,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(605,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(605,'energetic',1);
+INSERT INTO "remix_tag" VALUES(605,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(605,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(605,'metal',1);
+INSERT INTO "remix_tag" VALUES(605,'rock',1);
+INSERT INTO "remix_tag" VALUES(605,'singing',1);
+INSERT INTO "remix_tag" VALUES(605,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(605,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(606,'bells',1);
+INSERT INTO "remix_tag" VALUES(606,'dance',1);
+INSERT INTO "remix_tag" VALUES(606,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(606,'electro',1);
+INSERT INTO "remix_tag" VALUES(606,'mellow',1);
+INSERT INTO "remix_tag" VALUES(606,'quirky',1);
+INSERT INTO "remix_tag" VALUES(606,'synth',1);
+INSERT INTO "remix_tag" VALUES(606,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(607,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(607,'classical',1);
+INSERT INTO "remix_tag" VALUES(607,'funky',1);
+INSERT INTO "remix_tag" VALUES(607,'mystical',1);
+INSERT INTO "remix_tag" VALUES(607,'piano',1);
+INSERT INTO "remix_tag" VALUES(607,'solemn',1);
+INSERT INTO "remix_tag" VALUES(607,'strings',1);
+INSERT INTO "remix_tag" VALUES(607,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(608,'distortion',1);
+INSERT INTO "remix_tag" VALUES(608,'edm',1);
+INSERT INTO "remix_tag" VALUES(608,'electronic',1);
+INSERT INTO "remix_tag" VALUES(608,'energetic',1);
+INSERT INTO "remix_tag" VALUES(608,'funky',1);
+INSERT INTO "remix_tag" VALUES(608,'industrial',1);
+INSERT INTO "remix_tag" VALUES(608,'quirky',1);
+INSERT INTO "remix_tag" VALUES(608,'synth',1);
+INSERT INTO "remix_tag" VALUES(608,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(608,'trippy',1);
+INSERT INTO "remix_tag" VALUES(608,'workout',1);
+INSERT INTO "remix_tag" VALUES(609,'chill',1);
+INSERT INTO "remix_tag" VALUES(609,'edm',1);
+INSERT INTO "remix_tag" VALUES(609,'electronic',1);
+INSERT INTO "remix_tag" VALUES(609,'funky',1);
+INSERT INTO "remix_tag" VALUES(609,'mystical',1);
+INSERT INTO "remix_tag" VALUES(609,'synth',1);
+INSERT INTO "remix_tag" VALUES(609,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(609,'trance',1);
+INSERT INTO "remix_tag" VALUES(610,'angry',1);
+INSERT INTO "remix_tag" VALUES(610,'choir',1);
+INSERT INTO "remix_tag" VALUES(610,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(610,'dark',1);
+INSERT INTO "remix_tag" VALUES(610,'halloween',1);
+INSERT INTO "remix_tag" VALUES(610,'organ',1);
+INSERT INTO "remix_tag" VALUES(610,'spooky',1);
+INSERT INTO "remix_tag" VALUES(610,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(612,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(614,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(614,'rock',1);
+INSERT INTO "remix_tag" VALUES(614,'synth',1);
+INSERT INTO "remix_tag" VALUES(621,'ballad',1);
+INSERT INTO "remix_tag" VALUES(621,'distortion',1);
+INSERT INTO "remix_tag" VALUES(621,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(621,'energetic',1);
+INSERT INTO "remix_tag" VALUES(621,'happy',1);
+INSERT INTO "remix_tag" VALUES(621,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(621,'punk',1);
+INSERT INTO "remix_tag" VALUES(621,'rock',1);
+INSERT INTO "remix_tag" VALUES(621,'synth',1);
+INSERT INTO "remix_tag" VALUES(621,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(621,'workout',1);
+INSERT INTO "remix_tag" VALUES(622,'dance',1);
+INSERT INTO "remix_tag" VALUES(622,'edm',1);
+INSERT INTO "remix_tag" VALUES(622,'electronic',1);
+INSERT INTO "remix_tag" VALUES(622,'energetic',1);
+INSERT INTO "remix_tag" VALUES(622,'happy',1);
+INSERT INTO "remix_tag" VALUES(622,'house',1);
+INSERT INTO "remix_tag" VALUES(622,'synth',1);
+INSERT INTO "remix_tag" VALUES(622,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(622,'workout',1);
+INSERT INTO "remix_tag" VALUES(623,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(623,'ballad',1);
+INSERT INTO "remix_tag" VALUES(623,'dub',1);
+INSERT INTO "remix_tag" VALUES(623,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(623,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(623,'mellow',1);
+INSERT INTO "remix_tag" VALUES(623,'piano',1);
+INSERT INTO "remix_tag" VALUES(623,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(623,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(624,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(624,'bells',1);
+INSERT INTO "remix_tag" VALUES(624,'dance',1);
+INSERT INTO "remix_tag" VALUES(624,'detuning',1);
+INSERT INTO "remix_tag" VALUES(624,'edm',1);
+INSERT INTO "remix_tag" VALUES(624,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(624,'electronic',1);
+INSERT INTO "remix_tag" VALUES(624,'energetic',1);
+INSERT INTO "remix_tag" VALUES(624,'happy',1);
+INSERT INTO "remix_tag" VALUES(624,'house',1);
+INSERT INTO "remix_tag" VALUES(624,'piano',1);
+INSERT INTO "remix_tag" VALUES(624,'synth',1);
+INSERT INTO "remix_tag" VALUES(624,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(624,'trance',1);
+INSERT INTO "remix_tag" VALUES(624,'workout',1);
+INSERT INTO "remix_tag" VALUES(625,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(625,'ballad',1);
+INSERT INTO "remix_tag" VALUES(625,'distortion',1);
+INSERT INTO "remix_tag" VALUES(625,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(625,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(625,'energetic',1);
+INSERT INTO "remix_tag" VALUES(625,'happy',1);
+INSERT INTO "remix_tag" VALUES(625,'medley',1);
+INSERT INTO "remix_tag" VALUES(625,'rock',1);
+INSERT INTO "remix_tag" VALUES(625,'synth',1);
+INSERT INTO "remix_tag" VALUES(625,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(626,'bells',1);
+INSERT INTO "remix_tag" VALUES(626,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(626,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(626,'flute',1);
+INSERT INTO "remix_tag" VALUES(626,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(626,'meditation',1);
+INSERT INTO "remix_tag" VALUES(626,'mellow',1);
+INSERT INTO "remix_tag" VALUES(626,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(626,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(626,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(626,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(626,'strings',1);
+INSERT INTO "remix_tag" VALUES(626,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(627,'dark',1);
+INSERT INTO "remix_tag" VALUES(627,'detuning',1);
+INSERT INTO "remix_tag" VALUES(627,'edm',1);
+INSERT INTO "remix_tag" VALUES(627,'electro',1);
+INSERT INTO "remix_tag" VALUES(627,'energetic',1);
+INSERT INTO "remix_tag" VALUES(627,'glitching',1);
+INSERT INTO "remix_tag" VALUES(627,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(627,'synth',1);
+INSERT INTO "remix_tag" VALUES(627,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(627,'trance',1);
+INSERT INTO "remix_tag" VALUES(627,'trap',1);
+INSERT INTO "remix_tag" VALUES(627,'workout',1);
+INSERT INTO "remix_tag" VALUES(628,'dance',1);
+INSERT INTO "remix_tag" VALUES(628,'detuning',1);
+INSERT INTO "remix_tag" VALUES(628,'edm',1);
+INSERT INTO "remix_tag" VALUES(628,'energetic',1);
+INSERT INTO "remix_tag" VALUES(628,'piano',1);
+INSERT INTO "remix_tag" VALUES(628,'synth',1);
+INSERT INTO "remix_tag" VALUES(628,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(628,'trance',1);
+INSERT INTO "remix_tag" VALUES(628,'workout',1);
+INSERT INTO "remix_tag" VALUES(629,'collab',1);
+INSERT INTO "remix_tag" VALUES(629,'distortion',1);
+INSERT INTO "remix_tag" VALUES(629,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(629,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(629,'funk',1);
+INSERT INTO "remix_tag" VALUES(629,'funky',1);
+INSERT INTO "remix_tag" VALUES(629,'goofy',1);
+INSERT INTO "remix_tag" VALUES(629,'happy',1);
+INSERT INTO "remix_tag" VALUES(629,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(629,'quirky',1);
+INSERT INTO "remix_tag" VALUES(629,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(629,'synth',1);
+INSERT INTO "remix_tag" VALUES(629,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(629,'trippy',1);
+INSERT INTO "remix_tag" VALUES(629,'turntable',1);
+INSERT INTO "remix_tag" VALUES(630,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(630,'detuning',1);
+INSERT INTO "remix_tag" VALUES(630,'edm',1);
+INSERT INTO "remix_tag" VALUES(630,'energetic',1);
+INSERT INTO "remix_tag" VALUES(630,'happy',1);
+INSERT INTO "remix_tag" VALUES(630,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(630,'piano',1);
+INSERT INTO "remix_tag" VALUES(630,'shamisen',1);
+INSERT INTO "remix_tag" VALUES(630,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(630,'synth',1);
+INSERT INTO "remix_tag" VALUES(630,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(630,'trance',1);
+INSERT INTO "remix_tag" VALUES(630,'workout',1);
+INSERT INTO "remix_tag" VALUES(631,'ambient',1);
+INSERT INTO "remix_tag" VALUES(631,'chill',1);
+INSERT INTO "remix_tag" VALUES(631,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(631,'mellow',1);
+INSERT INTO "remix_tag" VALUES(631,'mystical',1);
+INSERT INTO "remix_tag" VALUES(631,'piano',1);
+INSERT INTO "remix_tag" VALUES(631,'solemn',1);
+INSERT INTO "remix_tag" VALUES(631,'strings',1);
+INSERT INTO "remix_tag" VALUES(631,'synth',1);
+INSERT INTO "remix_tag" VALUES(631,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(632,'dance',1);
+INSERT INTO "remix_tag" VALUES(632,'electronic',1);
+INSERT INTO "remix_tag" VALUES(632,'energetic',1);
+INSERT INTO "remix_tag" VALUES(632,'funky',1);
+INSERT INTO "remix_tag" VALUES(632,'synth',1);
+INSERT INTO "remix_tag" VALUES(632,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(632,'trance',1);
+INSERT INTO "remix_tag" VALUES(632,'workout',1);
+INSERT INTO "remix_tag" VALUES(633,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(633,'dance',1);
+INSERT INTO "remix_tag" VALUES(633,'dark',1);
+INSERT INTO "remix_tag" VALUES(633,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(633,'electro',1);
+INSERT INTO "remix_tag" VALUES(633,'electronic',1);
+INSERT INTO "remix_tag" VALUES(633,'halloween',1);
+INSERT INTO "remix_tag" VALUES(633,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(633,'medley',1);
+INSERT INTO "remix_tag" VALUES(633,'metal',1);
+INSERT INTO "remix_tag" VALUES(633,'piano',1);
+INSERT INTO "remix_tag" VALUES(633,'spooky',1);
+INSERT INTO "remix_tag" VALUES(633,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(633,'synth',1);
+INSERT INTO "remix_tag" VALUES(633,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(634,'bells',1);
+INSERT INTO "remix_tag" VALUES(634,'chill',1);
+INSERT INTO "remix_tag" VALUES(634,'electro',1);
+INSERT INTO "remix_tag" VALUES(634,'electronic',1);
+INSERT INTO "remix_tag" VALUES(634,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(634,'medley',1);
+INSERT INTO "remix_tag" VALUES(634,'mellow',1);
+INSERT INTO "remix_tag" VALUES(634,'oboe',1);
+INSERT INTO "remix_tag" VALUES(634,'organ',1);
+INSERT INTO "remix_tag" VALUES(634,'piano',1);
+INSERT INTO "remix_tag" VALUES(634,'sad',1);
+INSERT INTO "remix_tag" VALUES(634,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(636,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(636,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(636,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(636,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(636,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(636,'halloween',1);
+INSERT INTO "remix_tag" VALUES(636,'metal',1);
+INSERT INTO "remix_tag" VALUES(636,'oboe',1);
+INSERT INTO "remix_tag" VALUES(636,'rock',1);
+INSERT INTO "remix_tag" VALUES(636,'solemn',1);
+INSERT INTO "remix_tag" VALUES(636,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(636,'synth',1);
+INSERT INTO "remix_tag" VALUES(636,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(637,'dance',1);
+INSERT INTO "remix_tag" VALUES(637,'electronic',1);
+INSERT INTO "remix_tag" VALUES(637,'energetic',1);
+INSERT INTO "remix_tag" VALUES(637,'experimental',1);
+INSERT INTO "remix_tag" VALUES(637,'funky',1);
+INSERT INTO "remix_tag" VALUES(637,'halloween',1);
+INSERT INTO "remix_tag" VALUES(637,'mellow',1);
+INSERT INTO "remix_tag" VALUES(637,'organ',1);
+INSERT INTO "remix_tag" VALUES(637,'spooky',1);
+INSERT INTO "remix_tag" VALUES(637,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(637,'synth',1);
+INSERT INTO "remix_tag" VALUES(637,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(638,'brass',1);
+INSERT INTO "remix_tag" VALUES(638,'dance',1);
+INSERT INTO "remix_tag" VALUES(638,'electro',1);
+INSERT INTO "remix_tag" VALUES(638,'energetic',1);
+INSERT INTO "remix_tag" VALUES(638,'funky',1);
+INSERT INTO "remix_tag" VALUES(638,'goofy',1);
+INSERT INTO "remix_tag" VALUES(638,'happy',1);
+INSERT INTO "remix_tag" VALUES(638,'medley',1);
+INSERT INTO "remix_tag" VALUES(638,'quirky',1);
+INSERT INTO "remix_tag" VALUES(638,'strings',1);
+INSERT INTO "remix_tag" VALUES(638,'synth',1);
+INSERT INTO "remix_tag" VALUES(638,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(638,'workout',1);
+INSERT INTO "remix_tag" VALUES(639,'dance',1);
+INSERT INTO "remix_tag" VALUES(639,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(639,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(639,'electro',1);
+INSERT INTO "remix_tag" VALUES(639,'electronic',1);
+INSERT INTO "remix_tag" VALUES(639,'energetic',1);
+INSERT INTO "remix_tag" VALUES(639,'funky',1);
+INSERT INTO "remix_tag" VALUES(639,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(639,'jungle',1);
+INSERT INTO "remix_tag" VALUES(639,'mellow',1);
+INSERT INTO "remix_tag" VALUES(639,'synth',1);
+INSERT INTO "remix_tag" VALUES(639,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(640,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(640,'bells',1);
+INSERT INTO "remix_tag" VALUES(640,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(640,'dark',1);
+INSERT INTO "remix_tag" VALUES(640,'distortion',1);
+INSERT INTO "remix_tag" VALUES(640,'electro',1);
+INSERT INTO "remix_tag" VALUES(640,'electronic',1);
+INSERT INTO "remix_tag" VALUES(640,'glitching',1);
+INSERT INTO "remix_tag" VALUES(640,'halloween',1);
+INSERT INTO "remix_tag" VALUES(640,'industrial',1);
+INSERT INTO "remix_tag" VALUES(640,'solemn',1);
+INSERT INTO "remix_tag" VALUES(640,'spooky',1);
+INSERT INTO "remix_tag" VALUES(640,'synth',1);
+INSERT INTO "remix_tag" VALUES(640,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(641,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(641,'edm',1);
+INSERT INTO "remix_tag" VALUES(641,'energetic',1);
+INSERT INTO "remix_tag" VALUES(641,'funky',1);
+INSERT INTO "remix_tag" VALUES(641,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(641,'synth',1);
+INSERT INTO "remix_tag" VALUES(641,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(641,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(642,'edm',1);
+INSERT INTO "remix_tag" VALUES(642,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(642,'electronic',1);
+INSERT INTO "remix_tag" VALUES(642,'mellow',1);
+INSERT INTO "remix_tag" VALUES(642,'strings',1);
+INSERT INTO "remix_tag" VALUES(642,'synth',1);
+INSERT INTO "remix_tag" VALUES(642,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(643,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(643,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(643,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(643,'energetic',1);
+INSERT INTO "remix_tag" VALUES(643,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(643,'rock',1);
+INSERT INTO "remix_tag" VALUES(643,'synth',1);
+INSERT INTO "remix_tag" VALUES(643,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(644,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(644,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(644,'harp',1);
+INSERT INTO "remix_tag" VALUES(644,'oboe',1);
+INSERT INTO "remix_tag" VALUES(644,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(644,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(644,'synth',1);
+INSERT INTO "remix_tag" VALUES(644,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(645,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(645,'chill',1);
+INSERT INTO "remix_tag" VALUES(645,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(645,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(645,'flute',1);
+INSERT INTO "remix_tag" VALUES(645,'mellow',1);
+INSERT INTO "remix_tag" VALUES(645,'piano',1);
+INSERT INTO "remix_tag" VALUES(645,'synth',1);
+INSERT INTO "remix_tag" VALUES(645,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(646,'chill',1);
+INSERT INTO "remix_tag" VALUES(646,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(646,'edm',1);
+INSERT INTO "remix_tag" VALUES(646,'piano',1);
+INSERT INTO "remix_tag" VALUES(646,'synth',1);
+INSERT INTO "remix_tag" VALUES(646,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(647,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(647,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(647,'electronic',1);
+INSERT INTO "remix_tag" VALUES(647,'energetic',1);
+INSERT INTO "remix_tag" VALUES(647,'industrial',1);
+INSERT INTO "remix_tag" VALUES(647,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(647,'synth',1);
+INSERT INTO "remix_tag" VALUES(647,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(648,'bells',1);
+INSERT INTO "remix_tag" VALUES(648,'chill',1);
+INSERT INTO "remix_tag" VALUES(648,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(648,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(648,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(648,'synth',1);
+INSERT INTO "remix_tag" VALUES(648,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(649,'brass',1);
+INSERT INTO "remix_tag" VALUES(649,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(649,'dance',1);
+INSERT INTO "remix_tag" VALUES(649,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(649,'energetic',1);
+INSERT INTO "remix_tag" VALUES(649,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(649,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(649,'latin',1);
+INSERT INTO "remix_tag" VALUES(649,'piano',1);
+INSERT INTO "remix_tag" VALUES(649,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(650,'dark',1);
+INSERT INTO "remix_tag" VALUES(650,'distortion',1);
+INSERT INTO "remix_tag" VALUES(650,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(650,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(650,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(650,'indian',1);
+INSERT INTO "remix_tag" VALUES(650,'rock',1);
+INSERT INTO "remix_tag" VALUES(650,'sitar',1);
+INSERT INTO "remix_tag" VALUES(650,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(650,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(651,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(651,'jazz',1);
+INSERT INTO "remix_tag" VALUES(651,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(651,'mellow',1);
+INSERT INTO "remix_tag" VALUES(651,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(651,'piano',1);
+INSERT INTO "remix_tag" VALUES(651,'solemn',1);
+INSERT INTO "remix_tag" VALUES(651,'strings',1);
+INSERT INTO "remix_tag" VALUES(651,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(652,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(652,'dance',1);
+INSERT INTO "remix_tag" VALUES(652,'disco',1);
+INSERT INTO "remix_tag" VALUES(652,'edm',1);
+INSERT INTO "remix_tag" VALUES(652,'happy',1);
+INSERT INTO "remix_tag" VALUES(652,'marimba',1);
+INSERT INTO "remix_tag" VALUES(652,'quirky',1);
+INSERT INTO "remix_tag" VALUES(652,'synth',1);
+INSERT INTO "remix_tag" VALUES(652,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(652,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(653,'bells',1);
+INSERT INTO "remix_tag" VALUES(653,'brass',1);
+INSERT INTO "remix_tag" VALUES(653,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(653,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(653,'funky',1);
+INSERT INTO "remix_tag" VALUES(653,'goofy',1);
+INSERT INTO "remix_tag" VALUES(653,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(653,'medley',1);
+INSERT INTO "remix_tag" VALUES(653,'piano',1);
+INSERT INTO "remix_tag" VALUES(653,'quirky',1);
+INSERT INTO "remix_tag" VALUES(653,'strings',1);
+INSERT INTO "remix_tag" VALUES(653,'swing',1);
+INSERT INTO "remix_tag" VALUES(653,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(653,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(655,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(655,'funky',1);
+INSERT INTO "remix_tag" VALUES(655,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(655,'synth',1);
+INSERT INTO "remix_tag" VALUES(655,'turntable',1);
+INSERT INTO "remix_tag" VALUES(657,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(662,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(670,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(671,'dance',1);
+INSERT INTO "remix_tag" VALUES(671,'dark',1);
+INSERT INTO "remix_tag" VALUES(671,'detuning',1);
+INSERT INTO "remix_tag" VALUES(671,'edm',1);
+INSERT INTO "remix_tag" VALUES(671,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(671,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(671,'synth',1);
+INSERT INTO "remix_tag" VALUES(671,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(671,'trance',1);
+INSERT INTO "remix_tag" VALUES(671,'workout',1);
+INSERT INTO "remix_tag" VALUES(673,'brass',1);
+INSERT INTO "remix_tag" VALUES(673,'cello',1);
+INSERT INTO "remix_tag" VALUES(673,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(673,'classical',1);
+INSERT INTO "remix_tag" VALUES(673,'flute',1);
+INSERT INTO "remix_tag" VALUES(673,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(673,'harp',1);
+INSERT INTO "remix_tag" VALUES(673,'medley',1);
+INSERT INTO "remix_tag" VALUES(673,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(673,'piano',1);
+INSERT INTO "remix_tag" VALUES(673,'romantic',1);
+INSERT INTO "remix_tag" VALUES(673,'sad',1);
+INSERT INTO "remix_tag" VALUES(673,'strings',1);
+INSERT INTO "remix_tag" VALUES(673,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(673,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(673,'viola',1);
+INSERT INTO "remix_tag" VALUES(673,'violin',1);
+INSERT INTO "remix_tag" VALUES(673,'wedding',1);
+INSERT INTO "remix_tag" VALUES(673,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(673,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(674,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(674,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(674,'distortion',1);
+INSERT INTO "remix_tag" VALUES(674,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(674,'electronic',1);
+INSERT INTO "remix_tag" VALUES(674,'energetic',1);
+INSERT INTO "remix_tag" VALUES(674,'happy',1);
+INSERT INTO "remix_tag" VALUES(674,'rock',1);
+INSERT INTO "remix_tag" VALUES(674,'swing',1);
+INSERT INTO "remix_tag" VALUES(674,'synth',1);
+INSERT INTO "remix_tag" VALUES(674,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(674,'workout',1);
+INSERT INTO "remix_tag" VALUES(675,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(675,'ballad',1);
+INSERT INTO "remix_tag" VALUES(675,'bells',1);
+INSERT INTO "remix_tag" VALUES(675,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(675,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(675,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(675,'mellow',1);
+INSERT INTO "remix_tag" VALUES(675,'sad',1);
+INSERT INTO "remix_tag" VALUES(675,'strings',1);
+INSERT INTO "remix_tag" VALUES(675,'synth',1);
+INSERT INTO "remix_tag" VALUES(675,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(676,'bells',1);
+INSERT INTO "remix_tag" VALUES(676,'celtic',1);
+INSERT INTO "remix_tag" VALUES(676,'chill',1);
+INSERT INTO "remix_tag" VALUES(676,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(676,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(676,'flute',1);
+INSERT INTO "remix_tag" VALUES(676,'mellow',1);
+INSERT INTO "remix_tag" VALUES(676,'piano',1);
+INSERT INTO "remix_tag" VALUES(676,'strings',1);
+INSERT INTO "remix_tag" VALUES(676,'synth',1);
+INSERT INTO "remix_tag" VALUES(676,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(676,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(676,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(677,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(677,'dance',1);
+INSERT INTO "remix_tag" VALUES(677,'edm',1);
+INSERT INTO "remix_tag" VALUES(677,'energetic',1);
+INSERT INTO "remix_tag" VALUES(677,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(677,'house',1);
+INSERT INTO "remix_tag" VALUES(677,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(677,'strings',1);
+INSERT INTO "remix_tag" VALUES(677,'synth',1);
+INSERT INTO "remix_tag" VALUES(677,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(677,'workout',1);
+INSERT INTO "remix_tag" VALUES(678,'cello',1);
+INSERT INTO "remix_tag" VALUES(678,'classical',1);
+INSERT INTO "remix_tag" VALUES(678,'flute',1);
+INSERT INTO "remix_tag" VALUES(678,'mellow',1);
+INSERT INTO "remix_tag" VALUES(678,'piano',1);
+INSERT INTO "remix_tag" VALUES(678,'sad',1);
+INSERT INTO "remix_tag" VALUES(678,'strings',1);
+INSERT INTO "remix_tag" VALUES(678,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(678,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(678,'viola',1);
+INSERT INTO "remix_tag" VALUES(678,'violin',1);
+INSERT INTO "remix_tag" VALUES(678,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(680,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(680,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(680,'funk',1);
+INSERT INTO "remix_tag" VALUES(680,'funky',1);
+INSERT INTO "remix_tag" VALUES(680,'happy',1);
+INSERT INTO "remix_tag" VALUES(680,'harp',1);
+INSERT INTO "remix_tag" VALUES(680,'piano',1);
+INSERT INTO "remix_tag" VALUES(680,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(680,'synth',1);
+INSERT INTO "remix_tag" VALUES(680,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(681,'dance',1);
+INSERT INTO "remix_tag" VALUES(681,'edm',1);
+INSERT INTO "remix_tag" VALUES(681,'energetic',1);
+INSERT INTO "remix_tag" VALUES(681,'happy',1);
+INSERT INTO "remix_tag" VALUES(681,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(681,'synth',1);
+INSERT INTO "remix_tag" VALUES(681,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(681,'trance',1);
+INSERT INTO "remix_tag" VALUES(681,'workout',1);
+INSERT INTO "remix_tag" VALUES(682,'chill',1);
+INSERT INTO "remix_tag" VALUES(682,'dizi',1);
+INSERT INTO "remix_tag" VALUES(682,'dnb',1);
+INSERT INTO "remix_tag" VALUES(682,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(682,'glitching',1);
+INSERT INTO "remix_tag" VALUES(682,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(682,'mellow',1);
+INSERT INTO "remix_tag" VALUES(682,'piano',1);
+INSERT INTO "remix_tag" VALUES(682,'santur',1);
+INSERT INTO "remix_tag" VALUES(682,'synth',1);
+INSERT INTO "remix_tag" VALUES(682,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(682,'trippy',1);
+INSERT INTO "remix_tag" VALUES(682,'world',1);
+INSERT INTO "remix_tag" VALUES(683,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(683,'brass',1);
+INSERT INTO "remix_tag" VALUES(683,'collab',1);
+INSERT INTO "remix_tag" VALUES(683,'dnb',1);
+INSERT INTO "remix_tag" VALUES(683,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(683,'energetic',1);
+INSERT INTO "remix_tag" VALUES(683,'glitching',1);
+INSERT INTO "remix_tag" VALUES(683,'goofy',1);
+INSERT INTO "remix_tag" VALUES(683,'piano',1);
+INSERT INTO "remix_tag" VALUES(683,'quirky',1);
+INSERT INTO "remix_tag" VALUES(683,'reversing',1);
+INSERT INTO "remix_tag" VALUES(683,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(683,'synth',1);
+INSERT INTO "remix_tag" VALUES(683,'trippy',1);
+INSERT INTO "remix_tag" VALUES(684,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(684,'collab',1);
+INSERT INTO "remix_tag" VALUES(684,'distortion',1);
+INSERT INTO "remix_tag" VALUES(684,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(684,'energetic',1);
+INSERT INTO "remix_tag" VALUES(684,'marimba',1);
+INSERT INTO "remix_tag" VALUES(684,'medley',1);
+INSERT INTO "remix_tag" VALUES(684,'rock',1);
+INSERT INTO "remix_tag" VALUES(684,'synth',1);
+INSERT INTO "remix_tag" VALUES(684,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(684,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(684,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(684,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(684,'workout',1);
+INSERT INTO "remix_tag" VALUES(685,'dance',1);
+INSERT INTO "remix_tag" VALUES(685,'edm',1);
+INSERT INTO "remix_tag" VALUES(685,'electronic',1);
+INSERT INTO "remix_tag" VALUES(685,'energetic',1);
+INSERT INTO "remix_tag" VALUES(685,'fusion',1);
+INSERT INTO "remix_tag" VALUES(685,'house',1);
+INSERT INTO "remix_tag" VALUES(685,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(685,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(685,'synth',1);
+INSERT INTO "remix_tag" VALUES(685,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(685,'workout',1);
+INSERT INTO "remix_tag" VALUES(686,'distortion',1);
+INSERT INTO "remix_tag" VALUES(686,'edm',1);
+INSERT INTO "remix_tag" VALUES(686,'experimental',1);
+INSERT INTO "remix_tag" VALUES(686,'glitching',1);
+INSERT INTO "remix_tag" VALUES(686,'happy',1);
+INSERT INTO "remix_tag" VALUES(686,'jazz',1);
+INSERT INTO "remix_tag" VALUES(686,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(686,'piano',1);
+INSERT INTO "remix_tag" VALUES(686,'quirky',1);
+INSERT INTO "remix_tag" VALUES(686,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(686,'strings',1);
+INSERT INTO "remix_tag" VALUES(686,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(686,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(686,'trippy',1);
+INSERT INTO "remix_tag" VALUES(686,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(686,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(687,'brass',1);
+INSERT INTO "remix_tag" VALUES(687,'cello',1);
+INSERT INTO "remix_tag" VALUES(687,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(687,'classical',1);
+INSERT INTO "remix_tag" VALUES(687,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(687,'energetic',1);
+INSERT INTO "remix_tag" VALUES(687,'epic',1);
+INSERT INTO "remix_tag" VALUES(687,'harp',1);
+INSERT INTO "remix_tag" VALUES(687,'medley',1);
+INSERT INTO "remix_tag" VALUES(687,'piano',1);
+INSERT INTO "remix_tag" VALUES(687,'sad',1);
+INSERT INTO "remix_tag" VALUES(687,'strings',1);
+INSERT INTO "remix_tag" VALUES(687,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(687,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(687,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(687,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(687,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(688,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(688,'dance',1);
+INSERT INTO "remix_tag" VALUES(688,'edm',1);
+INSERT INTO "remix_tag" VALUES(688,'flute',1);
+INSERT INTO "remix_tag" VALUES(688,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(688,'mellow',1);
+INSERT INTO "remix_tag" VALUES(688,'quirky',1);
+INSERT INTO "remix_tag" VALUES(688,'synth',1);
+INSERT INTO "remix_tag" VALUES(688,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(689,'collab',1);
+INSERT INTO "remix_tag" VALUES(689,'dark',1);
+INSERT INTO "remix_tag" VALUES(689,'distortion',1);
+INSERT INTO "remix_tag" VALUES(689,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(689,'energetic',1);
+INSERT INTO "remix_tag" VALUES(689,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(689,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(689,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(689,'medley',1);
+INSERT INTO "remix_tag" VALUES(689,'rock',1);
+INSERT INTO "remix_tag" VALUES(689,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(689,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(689,'workout',1);
+INSERT INTO "remix_tag" VALUES(690,'bells',1);
+INSERT INTO "remix_tag" VALUES(690,'brass',1);
+INSERT INTO "remix_tag" VALUES(690,'choir',1);
+INSERT INTO "remix_tag" VALUES(690,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(690,'classical',1);
+INSERT INTO "remix_tag" VALUES(690,'energetic',1);
+INSERT INTO "remix_tag" VALUES(690,'epic',1);
+INSERT INTO "remix_tag" VALUES(690,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(690,'organ',1);
+INSERT INTO "remix_tag" VALUES(690,'piano',1);
+INSERT INTO "remix_tag" VALUES(690,'sad',1);
+INSERT INTO "remix_tag" VALUES(690,'strings',1);
+INSERT INTO "remix_tag" VALUES(690,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(690,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(691,'chill',1);
+INSERT INTO "remix_tag" VALUES(691,'funk',1);
+INSERT INTO "remix_tag" VALUES(691,'jazz',1);
+INSERT INTO "remix_tag" VALUES(691,'pop',1);
+INSERT INTO "remix_tag" VALUES(694,'dark',1);
+INSERT INTO "remix_tag" VALUES(694,'halloween',1);
+INSERT INTO "remix_tag" VALUES(694,'synth',1);
+INSERT INTO "remix_tag" VALUES(697,'ambient',1);
+INSERT INTO "remix_tag" VALUES(697,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(697,'electronic',1);
+INSERT INTO "remix_tag" VALUES(697,'synth',1);
+INSERT INTO "remix_tag" VALUES(701,'brass',1);
+INSERT INTO "remix_tag" VALUES(701,'funky',1);
+INSERT INTO "remix_tag" VALUES(701,'organ',1);
+INSERT INTO "remix_tag" VALUES(701,'piano',1);
+INSERT INTO "remix_tag" VALUES(704,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(704,'rock',1);
+INSERT INTO "remix_tag" VALUES(704,'synth',1);
+INSERT INTO "remix_tag" VALUES(717,'collab',1);
+INSERT INTO "remix_tag" VALUES(717,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(717,'rock',1);
+INSERT INTO "remix_tag" VALUES(717,'synth',1);
+INSERT INTO "remix_tag" VALUES(718,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(719,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(723,'dance',1);
+INSERT INTO "remix_tag" VALUES(723,'detuning',1);
+INSERT INTO "remix_tag" VALUES(723,'electronic',1);
+INSERT INTO "remix_tag" VALUES(723,'energetic',1);
+INSERT INTO "remix_tag" VALUES(723,'synth',1);
+INSERT INTO "remix_tag" VALUES(723,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(723,'trance',1);
+INSERT INTO "remix_tag" VALUES(723,'workout',1);
+INSERT INTO "remix_tag" VALUES(725,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(727,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(727,'choir',1);
+INSERT INTO "remix_tag" VALUES(727,'strings',1);
+INSERT INTO "remix_tag" VALUES(727,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(736,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(739,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(741,'dark',1);
+INSERT INTO "remix_tag" VALUES(741,'halloween',1);
+INSERT INTO "remix_tag" VALUES(741,'synth',1);
+INSERT INTO "remix_tag" VALUES(744,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(744,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(744,'piano',1);
+INSERT INTO "remix_tag" VALUES(744,'synth',1);
+INSERT INTO "remix_tag" VALUES(744,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(745,'brass',1);
+INSERT INTO "remix_tag" VALUES(745,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(745,'epic',1);
+INSERT INTO "remix_tag" VALUES(745,'flute',1);
+INSERT INTO "remix_tag" VALUES(745,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(745,'harp',1);
+INSERT INTO "remix_tag" VALUES(745,'solemn',1);
+INSERT INTO "remix_tag" VALUES(745,'strings',1);
+INSERT INTO "remix_tag" VALUES(745,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(745,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(748,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(749,'electronic',1);
+INSERT INTO "remix_tag" VALUES(749,'piano',1);
+INSERT INTO "remix_tag" VALUES(749,'synth',1);
+INSERT INTO "remix_tag" VALUES(750,'chill',1);
+INSERT INTO "remix_tag" VALUES(750,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(750,'lang-french',1);
+INSERT INTO "remix_tag" VALUES(750,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(750,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(750,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(750,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(751,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(751,'edm',1);
+INSERT INTO "remix_tag" VALUES(751,'energetic',1);
+INSERT INTO "remix_tag" VALUES(751,'synth',1);
+INSERT INTO "remix_tag" VALUES(751,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(751,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(751,'trance',1);
+INSERT INTO "remix_tag" VALUES(751,'workout',1);
+INSERT INTO "remix_tag" VALUES(752,'chill',1);
+INSERT INTO "remix_tag" VALUES(752,'electronic',1);
+INSERT INTO "remix_tag" VALUES(752,'solemn',1);
+INSERT INTO "remix_tag" VALUES(752,'synth',1);
+INSERT INTO "remix_tag" VALUES(752,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(753,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(753,'cello',1);
+INSERT INTO "remix_tag" VALUES(753,'chill',1);
+INSERT INTO "remix_tag" VALUES(753,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(753,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(753,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(753,'synth',1);
+INSERT INTO "remix_tag" VALUES(753,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(754,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(754,'angry',1);
+INSERT INTO "remix_tag" VALUES(754,'choir',1);
+INSERT INTO "remix_tag" VALUES(754,'dark',1);
+INSERT INTO "remix_tag" VALUES(754,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(754,'industrial',1);
+INSERT INTO "remix_tag" VALUES(754,'organ',1);
+INSERT INTO "remix_tag" VALUES(754,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(755,'chill',1);
+INSERT INTO "remix_tag" VALUES(755,'electronic',1);
+INSERT INTO "remix_tag" VALUES(755,'glitching',1);
+INSERT INTO "remix_tag" VALUES(755,'synth',1);
+INSERT INTO "remix_tag" VALUES(755,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(755,'trippy',1);
+INSERT INTO "remix_tag" VALUES(756,'chill',1);
+INSERT INTO "remix_tag" VALUES(756,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(756,'flute',1);
+INSERT INTO "remix_tag" VALUES(756,'new-age',1);
+INSERT INTO "remix_tag" VALUES(756,'solemn',1);
+INSERT INTO "remix_tag" VALUES(756,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(757,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(757,'harp',1);
+INSERT INTO "remix_tag" VALUES(757,'mellow',1);
+INSERT INTO "remix_tag" VALUES(757,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(757,'waltz',1);
+INSERT INTO "remix_tag" VALUES(758,'edm',1);
+INSERT INTO "remix_tag" VALUES(758,'electronic',1);
+INSERT INTO "remix_tag" VALUES(758,'energetic',1);
+INSERT INTO "remix_tag" VALUES(758,'synth',1);
+INSERT INTO "remix_tag" VALUES(758,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(759,'dance',1);
+INSERT INTO "remix_tag" VALUES(759,'electronic',1);
+INSERT INTO "remix_tag" VALUES(759,'synth',1);
+INSERT INTO "remix_tag" VALUES(759,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(759,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(760,'electronic',1);
+INSERT INTO "remix_tag" VALUES(760,'synth',1);
+INSERT INTO "remix_tag" VALUES(760,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(761,'dance',1);
+INSERT INTO "remix_tag" VALUES(761,'electronic',1);
+INSERT INTO "remix_tag" VALUES(761,'synth',1);
+INSERT INTO "remix_tag" VALUES(761,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(762,'dance',1);
+INSERT INTO "remix_tag" VALUES(762,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(762,'electronic',1);
+INSERT INTO "remix_tag" VALUES(762,'synth',1);
+INSERT INTO "remix_tag" VALUES(762,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(763,'chill',1);
+INSERT INTO "remix_tag" VALUES(763,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(763,'mellow',1);
+INSERT INTO "remix_tag" VALUES(763,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(764,'edm',1);
+INSERT INTO "remix_tag" VALUES(764,'electronic',1);
+INSERT INTO "remix_tag" VALUES(764,'synth',1);
+INSERT INTO "remix_tag" VALUES(764,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(765,'dark',1);
+INSERT INTO "remix_tag" VALUES(765,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(765,'electronic',1);
+INSERT INTO "remix_tag" VALUES(765,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(765,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(766,'dark',1);
+INSERT INTO "remix_tag" VALUES(766,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(766,'electronic',1);
+INSERT INTO "remix_tag" VALUES(766,'piano',1);
+INSERT INTO "remix_tag" VALUES(766,'solemn',1);
+INSERT INTO "remix_tag" VALUES(766,'synth',1);
+INSERT INTO "remix_tag" VALUES(766,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(767,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(767,'distortion',1);
+INSERT INTO "remix_tag" VALUES(767,'electronic',1);
+INSERT INTO "remix_tag" VALUES(767,'synth',1);
+INSERT INTO "remix_tag" VALUES(767,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(768,'dark',1);
+INSERT INTO "remix_tag" VALUES(768,'electronic',1);
+INSERT INTO "remix_tag" VALUES(768,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(768,'quirky',1);
+INSERT INTO "remix_tag" VALUES(768,'synth',1);
+INSERT INTO "remix_tag" VALUES(768,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(768,'trippy',1);
+INSERT INTO "remix_tag" VALUES(769,'dark',1);
+INSERT INTO "remix_tag" VALUES(769,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(769,'electronic',1);
+INSERT INTO "remix_tag" VALUES(769,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(769,'synth',1);
+INSERT INTO "remix_tag" VALUES(769,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(770,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(770,'electronic',1);
+INSERT INTO "remix_tag" VALUES(770,'synth',1);
+INSERT INTO "remix_tag" VALUES(770,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(771,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(771,'angry',1);
+INSERT INTO "remix_tag" VALUES(771,'dark',1);
+INSERT INTO "remix_tag" VALUES(771,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(771,'electronic',1);
+INSERT INTO "remix_tag" VALUES(771,'metal',1);
+INSERT INTO "remix_tag" VALUES(771,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(772,'dark',1);
+INSERT INTO "remix_tag" VALUES(772,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(772,'piano',1);
+INSERT INTO "remix_tag" VALUES(772,'sad',1);
+INSERT INTO "remix_tag" VALUES(772,'solo',1);
+INSERT INTO "remix_tag" VALUES(772,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(772,'spooky',1);
+INSERT INTO "remix_tag" VALUES(772,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(773,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(773,'happy',1);
+INSERT INTO "remix_tag" VALUES(773,'mellow',1);
+INSERT INTO "remix_tag" VALUES(773,'piano',1);
+INSERT INTO "remix_tag" VALUES(773,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(774,'bells',1);
+INSERT INTO "remix_tag" VALUES(774,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(774,'piano',1);
+INSERT INTO "remix_tag" VALUES(774,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(775,'dance',1);
+INSERT INTO "remix_tag" VALUES(775,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(775,'electronic',1);
+INSERT INTO "remix_tag" VALUES(775,'energetic',1);
+INSERT INTO "remix_tag" VALUES(775,'happy',1);
+INSERT INTO "remix_tag" VALUES(775,'synth',1);
+INSERT INTO "remix_tag" VALUES(775,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(776,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(776,'brass',1);
+INSERT INTO "remix_tag" VALUES(776,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(776,'harp',1);
+INSERT INTO "remix_tag" VALUES(776,'mystical',1);
+INSERT INTO "remix_tag" VALUES(776,'oboe',1);
+INSERT INTO "remix_tag" VALUES(776,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(776,'strings',1);
+INSERT INTO "remix_tag" VALUES(776,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(777,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(777,'flute',1);
+INSERT INTO "remix_tag" VALUES(777,'happy',1);
+INSERT INTO "remix_tag" VALUES(777,'mellow',1);
+INSERT INTO "remix_tag" VALUES(777,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(777,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(777,'strings',1);
+INSERT INTO "remix_tag" VALUES(777,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(778,'chill',1);
+INSERT INTO "remix_tag" VALUES(778,'electronic',1);
+INSERT INTO "remix_tag" VALUES(778,'mellow',1);
+INSERT INTO "remix_tag" VALUES(778,'piano',1);
+INSERT INTO "remix_tag" VALUES(778,'synth',1);
+INSERT INTO "remix_tag" VALUES(778,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(779,'edm',1);
+INSERT INTO "remix_tag" VALUES(779,'electronic',1);
+INSERT INTO "remix_tag" VALUES(779,'energetic',1);
+INSERT INTO "remix_tag" VALUES(779,'synth',1);
+INSERT INTO "remix_tag" VALUES(779,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(780,'electronic',1);
+INSERT INTO "remix_tag" VALUES(780,'energetic',1);
+INSERT INTO "remix_tag" VALUES(780,'synth',1);
+INSERT INTO "remix_tag" VALUES(780,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(781,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(781,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(781,'flute',1);
+INSERT INTO "remix_tag" VALUES(781,'piano',1);
+INSERT INTO "remix_tag" VALUES(781,'strings',1);
+INSERT INTO "remix_tag" VALUES(781,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(782,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(782,'blues',1);
+INSERT INTO "remix_tag" VALUES(782,'energetic',1);
+INSERT INTO "remix_tag" VALUES(782,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(782,'funky',1);
+INSERT INTO "remix_tag" VALUES(782,'synth',1);
+INSERT INTO "remix_tag" VALUES(782,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(782,'trombone',1);
+INSERT INTO "remix_tag" VALUES(784,'piano',1);
+INSERT INTO "remix_tag" VALUES(784,'sad',1);
+INSERT INTO "remix_tag" VALUES(784,'solemn',1);
+INSERT INTO "remix_tag" VALUES(784,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(784,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(785,'brass',1);
+INSERT INTO "remix_tag" VALUES(785,'choir',1);
+INSERT INTO "remix_tag" VALUES(785,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(785,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(785,'epic',1);
+INSERT INTO "remix_tag" VALUES(785,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(785,'piano',1);
+INSERT INTO "remix_tag" VALUES(785,'strings',1);
+INSERT INTO "remix_tag" VALUES(785,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(786,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(786,'dark',1);
+INSERT INTO "remix_tag" VALUES(786,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(786,'harp',1);
+INSERT INTO "remix_tag" VALUES(786,'piano',1);
+INSERT INTO "remix_tag" VALUES(786,'quirky',1);
+INSERT INTO "remix_tag" VALUES(786,'solemn',1);
+INSERT INTO "remix_tag" VALUES(786,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(786,'trippy',1);
+INSERT INTO "remix_tag" VALUES(787,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(787,'flute',1);
+INSERT INTO "remix_tag" VALUES(787,'mellow',1);
+INSERT INTO "remix_tag" VALUES(787,'piano',1);
+INSERT INTO "remix_tag" VALUES(787,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(788,'chill',1);
+INSERT INTO "remix_tag" VALUES(788,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(788,'mellow',1);
+INSERT INTO "remix_tag" VALUES(788,'strings',1);
+INSERT INTO "remix_tag" VALUES(788,'synth',1);
+INSERT INTO "remix_tag" VALUES(788,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(789,'electronic',1);
+INSERT INTO "remix_tag" VALUES(789,'energetic',1);
+INSERT INTO "remix_tag" VALUES(789,'piano',1);
+INSERT INTO "remix_tag" VALUES(789,'synth',1);
+INSERT INTO "remix_tag" VALUES(789,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(790,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(790,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(790,'electronic',1);
+INSERT INTO "remix_tag" VALUES(790,'energetic',1);
+INSERT INTO "remix_tag" VALUES(790,'medley',1);
+INSERT INTO "remix_tag" VALUES(790,'solemn',1);
+INSERT INTO "remix_tag" VALUES(790,'synth',1);
+INSERT INTO "remix_tag" VALUES(790,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(791,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(791,'electronic',1);
+INSERT INTO "remix_tag" VALUES(791,'energetic',1);
+INSERT INTO "remix_tag" VALUES(791,'synth',1);
+INSERT INTO "remix_tag" VALUES(791,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(792,'brass',1);
+INSERT INTO "remix_tag" VALUES(792,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(792,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(792,'energetic',1);
+INSERT INTO "remix_tag" VALUES(792,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(792,'flute',1);
+INSERT INTO "remix_tag" VALUES(792,'fusion',1);
+INSERT INTO "remix_tag" VALUES(792,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(792,'organ',1);
+INSERT INTO "remix_tag" VALUES(792,'piano',1);
+INSERT INTO "remix_tag" VALUES(792,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(793,'dance',1);
+INSERT INTO "remix_tag" VALUES(793,'electronic',1);
+INSERT INTO "remix_tag" VALUES(793,'energetic',1);
+INSERT INTO "remix_tag" VALUES(793,'lang-japanese',1);
+INSERT INTO "remix_tag" VALUES(793,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(793,'piano',1);
+INSERT INTO "remix_tag" VALUES(793,'synth',1);
+INSERT INTO "remix_tag" VALUES(793,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(794,'ambient',1);
+INSERT INTO "remix_tag" VALUES(794,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(794,'electronic',1);
+INSERT INTO "remix_tag" VALUES(794,'synth',1);
+INSERT INTO "remix_tag" VALUES(794,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(795,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(795,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(795,'flute',1);
+INSERT INTO "remix_tag" VALUES(795,'harp',1);
+INSERT INTO "remix_tag" VALUES(795,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(795,'strings',1);
+INSERT INTO "remix_tag" VALUES(795,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(795,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(795,'waltz',1);
+INSERT INTO "remix_tag" VALUES(796,'harp',1);
+INSERT INTO "remix_tag" VALUES(796,'mellow',1);
+INSERT INTO "remix_tag" VALUES(796,'oboe',1);
+INSERT INTO "remix_tag" VALUES(796,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(796,'piano',1);
+INSERT INTO "remix_tag" VALUES(796,'sad',1);
+INSERT INTO "remix_tag" VALUES(796,'solemn',1);
+INSERT INTO "remix_tag" VALUES(796,'strings',1);
+INSERT INTO "remix_tag" VALUES(796,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(797,'electronic',1);
+INSERT INTO "remix_tag" VALUES(797,'energetic',1);
+INSERT INTO "remix_tag" VALUES(797,'piano',1);
+INSERT INTO "remix_tag" VALUES(797,'synth',1);
+INSERT INTO "remix_tag" VALUES(797,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(797,'trance',1);
+INSERT INTO "remix_tag" VALUES(798,'edm',1);
+INSERT INTO "remix_tag" VALUES(798,'electronic',1);
+INSERT INTO "remix_tag" VALUES(798,'energetic',1);
+INSERT INTO "remix_tag" VALUES(798,'synth',1);
+INSERT INTO "remix_tag" VALUES(798,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(799,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(799,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(799,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(799,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(799,'energetic',1);
+INSERT INTO "remix_tag" VALUES(799,'goofy',1);
+INSERT INTO "remix_tag" VALUES(799,'harp',1);
+INSERT INTO "remix_tag" VALUES(799,'medley',1);
+INSERT INTO "remix_tag" VALUES(799,'organ',1);
+INSERT INTO "remix_tag" VALUES(799,'piano',1);
+INSERT INTO "remix_tag" VALUES(799,'quirky',1);
+INSERT INTO "remix_tag" VALUES(799,'synth',1);
+INSERT INTO "remix_tag" VALUES(799,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(800,'classical',1);
+INSERT INTO "remix_tag" VALUES(800,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(800,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(800,'piano',1);
+INSERT INTO "remix_tag" VALUES(800,'solo',1);
+INSERT INTO "remix_tag" VALUES(800,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(800,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(801,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(801,'edm',1);
+INSERT INTO "remix_tag" VALUES(801,'electronic',1);
+INSERT INTO "remix_tag" VALUES(801,'energetic',1);
+INSERT INTO "remix_tag" VALUES(801,'piano',1);
+INSERT INTO "remix_tag" VALUES(801,'synth',1);
+INSERT INTO "remix_tag" VALUES(801,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(802,'ballad',1);
+INSERT INTO "remix_tag" VALUES(802,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(802,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(802,'mellow',1);
+INSERT INTO "remix_tag" VALUES(802,'piano',1);
+INSERT INTO "remix_tag" VALUES(802,'romantic',1);
+INSERT INTO "remix_tag" VALUES(802,'strings',1);
+INSERT INTO "remix_tag" VALUES(802,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(803,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(803,'dark',1);
+INSERT INTO "remix_tag" VALUES(803,'piano',1);
+INSERT INTO "remix_tag" VALUES(803,'solemn',1);
+INSERT INTO "remix_tag" VALUES(803,'strings',1);
+INSERT INTO "remix_tag" VALUES(803,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(803,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(804,'chill',1);
+INSERT INTO "remix_tag" VALUES(804,'electronic',1);
+INSERT INTO "remix_tag" VALUES(804,'mellow',1);
+INSERT INTO "remix_tag" VALUES(804,'synth',1);
+INSERT INTO "remix_tag" VALUES(804,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(805,'ambient',1);
+INSERT INTO "remix_tag" VALUES(805,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(805,'electronic',1);
+INSERT INTO "remix_tag" VALUES(805,'medley',1);
+INSERT INTO "remix_tag" VALUES(805,'piano',1);
+INSERT INTO "remix_tag" VALUES(805,'strings',1);
+INSERT INTO "remix_tag" VALUES(805,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(806,'dance',1);
+INSERT INTO "remix_tag" VALUES(806,'electronic',1);
+INSERT INTO "remix_tag" VALUES(806,'energetic',1);
+INSERT INTO "remix_tag" VALUES(806,'synth',1);
+INSERT INTO "remix_tag" VALUES(806,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(806,'trance',1);
+INSERT INTO "remix_tag" VALUES(807,'bells',1);
+INSERT INTO "remix_tag" VALUES(807,'brass',1);
+INSERT INTO "remix_tag" VALUES(807,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(807,'energetic',1);
+INSERT INTO "remix_tag" VALUES(807,'epic',1);
+INSERT INTO "remix_tag" VALUES(807,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(807,'strings',1);
+INSERT INTO "remix_tag" VALUES(807,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(808,'electronic',1);
+INSERT INTO "remix_tag" VALUES(808,'funky',1);
+INSERT INTO "remix_tag" VALUES(808,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(808,'quirky',1);
+INSERT INTO "remix_tag" VALUES(808,'synth',1);
+INSERT INTO "remix_tag" VALUES(808,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(808,'trippy',1);
+INSERT INTO "remix_tag" VALUES(808,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(809,'dark',1);
+INSERT INTO "remix_tag" VALUES(809,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(809,'electronic',1);
+INSERT INTO "remix_tag" VALUES(809,'spooky',1);
+INSERT INTO "remix_tag" VALUES(809,'strings',1);
+INSERT INTO "remix_tag" VALUES(809,'synth',1);
+INSERT INTO "remix_tag" VALUES(809,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(810,'dark',1);
+INSERT INTO "remix_tag" VALUES(810,'edm',1);
+INSERT INTO "remix_tag" VALUES(810,'electronic',1);
+INSERT INTO "remix_tag" VALUES(810,'synth',1);
+INSERT INTO "remix_tag" VALUES(810,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(811,'energetic',1);
+INSERT INTO "remix_tag" VALUES(811,'piano',1);
+INSERT INTO "remix_tag" VALUES(811,'solemn',1);
+INSERT INTO "remix_tag" VALUES(811,'solo',1);
+INSERT INTO "remix_tag" VALUES(811,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(811,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(812,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(812,'electronic',1);
+INSERT INTO "remix_tag" VALUES(812,'piano',1);
+INSERT INTO "remix_tag" VALUES(812,'synth',1);
+INSERT INTO "remix_tag" VALUES(812,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(813,'bells',1);
+INSERT INTO "remix_tag" VALUES(813,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(813,'dark',1);
+INSERT INTO "remix_tag" VALUES(813,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(813,'strings',1);
+INSERT INTO "remix_tag" VALUES(813,'synth',1);
+INSERT INTO "remix_tag" VALUES(813,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(814,'chill',1);
+INSERT INTO "remix_tag" VALUES(814,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(814,'flute',1);
+INSERT INTO "remix_tag" VALUES(814,'funky',1);
+INSERT INTO "remix_tag" VALUES(814,'reggae',1);
+INSERT INTO "remix_tag" VALUES(814,'synth',1);
+INSERT INTO "remix_tag" VALUES(814,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(815,'edm',1);
+INSERT INTO "remix_tag" VALUES(815,'electronic',1);
+INSERT INTO "remix_tag" VALUES(815,'energetic',1);
+INSERT INTO "remix_tag" VALUES(815,'synth',1);
+INSERT INTO "remix_tag" VALUES(815,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(816,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(816,'sad',1);
+INSERT INTO "remix_tag" VALUES(816,'solemn',1);
+INSERT INTO "remix_tag" VALUES(816,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(816,'synth',1);
+INSERT INTO "remix_tag" VALUES(816,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(817,'electronic',1);
+INSERT INTO "remix_tag" VALUES(817,'synth',1);
+INSERT INTO "remix_tag" VALUES(817,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(817,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(818,'cello',1);
+INSERT INTO "remix_tag" VALUES(818,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(818,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(818,'piano',1);
+INSERT INTO "remix_tag" VALUES(818,'sad',1);
+INSERT INTO "remix_tag" VALUES(818,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(818,'solemn',1);
+INSERT INTO "remix_tag" VALUES(818,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(819,'edm',1);
+INSERT INTO "remix_tag" VALUES(819,'electronic',1);
+INSERT INTO "remix_tag" VALUES(819,'energetic',1);
+INSERT INTO "remix_tag" VALUES(819,'piano',1);
+INSERT INTO "remix_tag" VALUES(819,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(819,'synth',1);
+INSERT INTO "remix_tag" VALUES(821,'brass',1);
+INSERT INTO "remix_tag" VALUES(821,'choir',1);
+INSERT INTO "remix_tag" VALUES(821,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(821,'dark',1);
+INSERT INTO "remix_tag" VALUES(821,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(821,'epic',1);
+INSERT INTO "remix_tag" VALUES(821,'oboe',1);
+INSERT INTO "remix_tag" VALUES(821,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(821,'strings',1);
+INSERT INTO "remix_tag" VALUES(821,'synth',1);
+INSERT INTO "remix_tag" VALUES(821,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(821,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(822,'dark',1);
+INSERT INTO "remix_tag" VALUES(822,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(822,'electronic',1);
+INSERT INTO "remix_tag" VALUES(822,'synth',1);
+INSERT INTO "remix_tag" VALUES(822,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(823,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(823,'electronic',1);
+INSERT INTO "remix_tag" VALUES(823,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(823,'strings',1);
+INSERT INTO "remix_tag" VALUES(823,'synth',1);
+INSERT INTO "remix_tag" VALUES(823,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(823,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(824,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(824,'dark',1);
+INSERT INTO "remix_tag" VALUES(824,'halloween',1);
+INSERT INTO "remix_tag" VALUES(824,'piano',1);
+INSERT INTO "remix_tag" VALUES(824,'solemn',1);
+INSERT INTO "remix_tag" VALUES(824,'strings',1);
+INSERT INTO "remix_tag" VALUES(824,'synth',1);
+INSERT INTO "remix_tag" VALUES(824,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(824,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(825,'bells',1);
+INSERT INTO "remix_tag" VALUES(825,'dark',1);
+INSERT INTO "remix_tag" VALUES(825,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(825,'halloween',1);
+INSERT INTO "remix_tag" VALUES(825,'industrial',1);
+INSERT INTO "remix_tag" VALUES(825,'medley',1);
+INSERT INTO "remix_tag" VALUES(825,'organ',1);
+INSERT INTO "remix_tag" VALUES(825,'piano',1);
+INSERT INTO "remix_tag" VALUES(825,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(825,'synth',1);
+INSERT INTO "remix_tag" VALUES(825,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(826,'accordion',1);
+INSERT INTO "remix_tag" VALUES(826,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(826,'piano',1);
+INSERT INTO "remix_tag" VALUES(826,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(827,'dark',1);
+INSERT INTO "remix_tag" VALUES(827,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(827,'electronic',1);
+INSERT INTO "remix_tag" VALUES(827,'synth',1);
+INSERT INTO "remix_tag" VALUES(827,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(827,'trippy',1);
+INSERT INTO "remix_tag" VALUES(828,'electronic',1);
+INSERT INTO "remix_tag" VALUES(828,'piano',1);
+INSERT INTO "remix_tag" VALUES(828,'solemn',1);
+INSERT INTO "remix_tag" VALUES(828,'synth',1);
+INSERT INTO "remix_tag" VALUES(828,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(829,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(829,'energetic',1);
+INSERT INTO "remix_tag" VALUES(829,'medley',1);
+INSERT INTO "remix_tag" VALUES(829,'rock',1);
+INSERT INTO "remix_tag" VALUES(829,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(830,'piano',1);
+INSERT INTO "remix_tag" VALUES(830,'strings',1);
+INSERT INTO "remix_tag" VALUES(830,'synth',1);
+INSERT INTO "remix_tag" VALUES(830,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(831,'ambient',1);
+INSERT INTO "remix_tag" VALUES(831,'dark',1);
+INSERT INTO "remix_tag" VALUES(831,'flute',1);
+INSERT INTO "remix_tag" VALUES(831,'oboe',1);
+INSERT INTO "remix_tag" VALUES(831,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(831,'piano',1);
+INSERT INTO "remix_tag" VALUES(831,'strings',1);
+INSERT INTO "remix_tag" VALUES(831,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(831,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(832,'brass',1);
+INSERT INTO "remix_tag" VALUES(832,'epic',1);
+INSERT INTO "remix_tag" VALUES(832,'harp',1);
+INSERT INTO "remix_tag" VALUES(832,'mellow',1);
+INSERT INTO "remix_tag" VALUES(832,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(832,'piano',1);
+INSERT INTO "remix_tag" VALUES(832,'strings',1);
+INSERT INTO "remix_tag" VALUES(832,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(832,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(832,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(833,'energetic',1);
+INSERT INTO "remix_tag" VALUES(833,'synth',1);
+INSERT INTO "remix_tag" VALUES(833,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(833,'trance',1);
+INSERT INTO "remix_tag" VALUES(833,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(834,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(834,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(834,'dnb',1);
+INSERT INTO "remix_tag" VALUES(834,'synth',1);
+INSERT INTO "remix_tag" VALUES(834,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(834,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(835,'happy',1);
+INSERT INTO "remix_tag" VALUES(835,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(835,'synth',1);
+INSERT INTO "remix_tag" VALUES(835,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(836,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(836,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(836,'rock',1);
+INSERT INTO "remix_tag" VALUES(836,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(837,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(837,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(837,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(837,'piano',1);
+INSERT INTO "remix_tag" VALUES(837,'rock',1);
+INSERT INTO "remix_tag" VALUES(837,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(838,'electronic',1);
+INSERT INTO "remix_tag" VALUES(838,'synth',1);
+INSERT INTO "remix_tag" VALUES(838,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(838,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(839,'brass',1);
+INSERT INTO "remix_tag" VALUES(839,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(839,'epic',1);
+INSERT INTO "remix_tag" VALUES(839,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(839,'piano',1);
+INSERT INTO "remix_tag" VALUES(839,'strings',1);
+INSERT INTO "remix_tag" VALUES(839,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(840,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(840,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(840,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(840,'lang-italian',1);
+INSERT INTO "remix_tag" VALUES(840,'lang-spanish',1);
+INSERT INTO "remix_tag" VALUES(840,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(840,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(840,'synth',1);
+INSERT INTO "remix_tag" VALUES(840,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(841,'collab',1);
+INSERT INTO "remix_tag" VALUES(841,'electronic',1);
+INSERT INTO "remix_tag" VALUES(841,'energetic',1);
+INSERT INTO "remix_tag" VALUES(841,'synth',1);
+INSERT INTO "remix_tag" VALUES(841,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(842,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(842,'electronic',1);
+INSERT INTO "remix_tag" VALUES(842,'synth',1);
+INSERT INTO "remix_tag" VALUES(842,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(842,'trance',1);
+INSERT INTO "remix_tag" VALUES(843,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(843,'piano',1);
+INSERT INTO "remix_tag" VALUES(843,'synth',1);
+INSERT INTO "remix_tag" VALUES(843,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(843,'trance',1);
+INSERT INTO "remix_tag" VALUES(844,'electronic',1);
+INSERT INTO "remix_tag" VALUES(844,'energetic',1);
+INSERT INTO "remix_tag" VALUES(844,'synth',1);
+INSERT INTO "remix_tag" VALUES(844,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(845,'edm',1);
+INSERT INTO "remix_tag" VALUES(845,'electronic',1);
+INSERT INTO "remix_tag" VALUES(845,'energetic',1);
+INSERT INTO "remix_tag" VALUES(845,'synth',1);
+INSERT INTO "remix_tag" VALUES(845,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(846,'chill',1);
+INSERT INTO "remix_tag" VALUES(846,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(846,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(846,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(846,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(846,'rnb',1);
+INSERT INTO "remix_tag" VALUES(846,'synth',1);
+INSERT INTO "remix_tag" VALUES(846,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(846,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(847,'electronic',1);
+INSERT INTO "remix_tag" VALUES(847,'funk',1);
+INSERT INTO "remix_tag" VALUES(847,'piano',1);
+INSERT INTO "remix_tag" VALUES(847,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(847,'synth',1);
+INSERT INTO "remix_tag" VALUES(847,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(848,'dance',1);
+INSERT INTO "remix_tag" VALUES(848,'electronic',1);
+INSERT INTO "remix_tag" VALUES(848,'synth',1);
+INSERT INTO "remix_tag" VALUES(848,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(848,'trance',1);
+INSERT INTO "remix_tag" VALUES(849,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(849,'distortion',1);
+INSERT INTO "remix_tag" VALUES(849,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(849,'metal',1);
+INSERT INTO "remix_tag" VALUES(849,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(850,'ambient',1);
+INSERT INTO "remix_tag" VALUES(850,'dark',1);
+INSERT INTO "remix_tag" VALUES(850,'distortion',1);
+INSERT INTO "remix_tag" VALUES(850,'electronic',1);
+INSERT INTO "remix_tag" VALUES(850,'halloween',1);
+INSERT INTO "remix_tag" VALUES(850,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(850,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(850,'synth',1);
+INSERT INTO "remix_tag" VALUES(851,'electronic',1);
+INSERT INTO "remix_tag" VALUES(851,'energetic',1);
+INSERT INTO "remix_tag" VALUES(851,'piano',1);
+INSERT INTO "remix_tag" VALUES(851,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(851,'synth',1);
+INSERT INTO "remix_tag" VALUES(851,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(852,'dark',1);
+INSERT INTO "remix_tag" VALUES(852,'distortion',1);
+INSERT INTO "remix_tag" VALUES(852,'industrial',1);
+INSERT INTO "remix_tag" VALUES(852,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(853,'chill',1);
+INSERT INTO "remix_tag" VALUES(853,'choir',1);
+INSERT INTO "remix_tag" VALUES(853,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(853,'mellow',1);
+INSERT INTO "remix_tag" VALUES(853,'synth',1);
+INSERT INTO "remix_tag" VALUES(853,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(854,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(854,'energetic',1);
+INSERT INTO "remix_tag" VALUES(854,'rock',1);
+INSERT INTO "remix_tag" VALUES(854,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(855,'electronic',1);
+INSERT INTO "remix_tag" VALUES(855,'mellow',1);
+INSERT INTO "remix_tag" VALUES(855,'synth',1);
+INSERT INTO "remix_tag" VALUES(855,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(856,'bells',1);
+INSERT INTO "remix_tag" VALUES(856,'choir',1);
+INSERT INTO "remix_tag" VALUES(856,'strings',1);
+INSERT INTO "remix_tag" VALUES(856,'synth',1);
+INSERT INTO "remix_tag" VALUES(856,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(857,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(857,'ambient',1);
+INSERT INTO "remix_tag" VALUES(857,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(857,'energetic',1);
+INSERT INTO "remix_tag" VALUES(857,'mellow',1);
+INSERT INTO "remix_tag" VALUES(857,'synth',1);
+INSERT INTO "remix_tag" VALUES(857,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(858,'dark',1);
+INSERT INTO "remix_tag" VALUES(858,'edm',1);
+INSERT INTO "remix_tag" VALUES(858,'energetic',1);
+INSERT INTO "remix_tag" VALUES(858,'strings',1);
+INSERT INTO "remix_tag" VALUES(858,'synth',1);
+INSERT INTO "remix_tag" VALUES(858,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(859,'energetic',1);
+INSERT INTO "remix_tag" VALUES(859,'flute',1);
+INSERT INTO "remix_tag" VALUES(859,'organ',1);
+INSERT INTO "remix_tag" VALUES(859,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(859,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(860,'chill',1);
+INSERT INTO "remix_tag" VALUES(860,'piano',1);
+INSERT INTO "remix_tag" VALUES(860,'synth',1);
+INSERT INTO "remix_tag" VALUES(860,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(861,'brass',1);
+INSERT INTO "remix_tag" VALUES(861,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(861,'happy',1);
+INSERT INTO "remix_tag" VALUES(861,'organ',1);
+INSERT INTO "remix_tag" VALUES(861,'surf',1);
+INSERT INTO "remix_tag" VALUES(861,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(862,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(862,'dark',1);
+INSERT INTO "remix_tag" VALUES(862,'solemn',1);
+INSERT INTO "remix_tag" VALUES(862,'strings',1);
+INSERT INTO "remix_tag" VALUES(862,'synth',1);
+INSERT INTO "remix_tag" VALUES(862,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(863,'ambient',1);
+INSERT INTO "remix_tag" VALUES(863,'mellow',1);
+INSERT INTO "remix_tag" VALUES(863,'piano',1);
+INSERT INTO "remix_tag" VALUES(863,'strings',1);
+INSERT INTO "remix_tag" VALUES(863,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(863,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(864,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(864,'piano',1);
+INSERT INTO "remix_tag" VALUES(864,'solo',1);
+INSERT INTO "remix_tag" VALUES(864,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(864,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(865,'brass',1);
+INSERT INTO "remix_tag" VALUES(865,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(865,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(865,'piano',1);
+INSERT INTO "remix_tag" VALUES(865,'strings',1);
+INSERT INTO "remix_tag" VALUES(865,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(865,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(872,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(873,'piano',1);
+INSERT INTO "remix_tag" VALUES(873,'solo',1);
+INSERT INTO "remix_tag" VALUES(875,'chill',1);
+INSERT INTO "remix_tag" VALUES(875,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(875,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(875,'jazz',1);
+INSERT INTO "remix_tag" VALUES(875,'mellow',1);
+INSERT INTO "remix_tag" VALUES(875,'piano',1);
+INSERT INTO "remix_tag" VALUES(875,'strings',1);
+INSERT INTO "remix_tag" VALUES(875,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(877,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(881,'quirky',1);
+INSERT INTO "remix_tag" VALUES(881,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(882,'compo',1);
+INSERT INTO "remix_tag" VALUES(882,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(882,'funk',1);
+INSERT INTO "remix_tag" VALUES(882,'happy',1);
+INSERT INTO "remix_tag" VALUES(882,'synth',1);
+INSERT INTO "remix_tag" VALUES(883,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(887,'bells',1);
+INSERT INTO "remix_tag" VALUES(887,'brass',1);
+INSERT INTO "remix_tag" VALUES(887,'chill',1);
+INSERT INTO "remix_tag" VALUES(887,'mellow',1);
+INSERT INTO "remix_tag" VALUES(887,'piano',1);
+INSERT INTO "remix_tag" VALUES(887,'strings',1);
+INSERT INTO "remix_tag" VALUES(887,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(888,'bells',1);
+INSERT INTO "remix_tag" VALUES(888,'brass',1);
+INSERT INTO "remix_tag" VALUES(888,'jazz',1);
+INSERT INTO "remix_tag" VALUES(888,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(888,'piano',1);
+INSERT INTO "remix_tag" VALUES(888,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(888,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(888,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(890,'classical',1);
+INSERT INTO "remix_tag" VALUES(890,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(890,'piano',1);
+INSERT INTO "remix_tag" VALUES(890,'solo',1);
+INSERT INTO "remix_tag" VALUES(891,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(896,'halloween',1);
+INSERT INTO "remix_tag" VALUES(899,'dark',1);
+INSERT INTO "remix_tag" VALUES(899,'electronic',1);
+INSERT INTO "remix_tag" VALUES(899,'synth',1);
+INSERT INTO "remix_tag" VALUES(901,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(905,'african',1);
+INSERT INTO "remix_tag" VALUES(905,'choir',1);
+INSERT INTO "remix_tag" VALUES(905,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(905,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(905,'strings',1);
+INSERT INTO "remix_tag" VALUES(905,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(905,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(905,'world',1);
+INSERT INTO "remix_tag" VALUES(908,'dark',1);
+INSERT INTO "remix_tag" VALUES(908,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(908,'halloween',1);
+INSERT INTO "remix_tag" VALUES(908,'spooky',1);
+INSERT INTO "remix_tag" VALUES(909,'compo',1);
+INSERT INTO "remix_tag" VALUES(909,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(909,'funk',1);
+INSERT INTO "remix_tag" VALUES(909,'happy',1);
+INSERT INTO "remix_tag" VALUES(909,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(909,'synth',1);
+INSERT INTO "remix_tag" VALUES(917,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(918,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(921,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(929,'brass',1);
+INSERT INTO "remix_tag" VALUES(929,'funky',1);
+INSERT INTO "remix_tag" VALUES(929,'jazz',1);
+INSERT INTO "remix_tag" VALUES(929,'piano',1);
+INSERT INTO "remix_tag" VALUES(932,'dance',1);
+INSERT INTO "remix_tag" VALUES(932,'electronic',1);
+INSERT INTO "remix_tag" VALUES(932,'synth',1);
+INSERT INTO "remix_tag" VALUES(936,'electronic',1);
+INSERT INTO "remix_tag" VALUES(936,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(936,'synth',1);
+INSERT INTO "remix_tag" VALUES(936,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(940,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(944,'brass',1);
+INSERT INTO "remix_tag" VALUES(944,'synth',1);
+INSERT INTO "remix_tag" VALUES(944,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(945,'jazz',1);
+INSERT INTO "remix_tag" VALUES(945,'piano',1);
+INSERT INTO "remix_tag" VALUES(945,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(945,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(945,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(949,'dance',1);
+INSERT INTO "remix_tag" VALUES(949,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(949,'electronic',1);
+INSERT INTO "remix_tag" VALUES(949,'synth',1);
+INSERT INTO "remix_tag" VALUES(950,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(953,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(953,'electronic',1);
+INSERT INTO "remix_tag" VALUES(953,'funk',1);
+INSERT INTO "remix_tag" VALUES(953,'happy',1);
+INSERT INTO "remix_tag" VALUES(953,'pop',1);
+INSERT INTO "remix_tag" VALUES(953,'synth',1);
+INSERT INTO "remix_tag" VALUES(956,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(962,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(963,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(966,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(967,'dark',1);
+INSERT INTO "remix_tag" VALUES(967,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(967,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(967,'jazz',1);
+INSERT INTO "remix_tag" VALUES(967,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(967,'mellow',1);
+INSERT INTO "remix_tag" VALUES(975,'choir',1);
+INSERT INTO "remix_tag" VALUES(975,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(975,'halloween',1);
+INSERT INTO "remix_tag" VALUES(975,'piano',1);
+INSERT INTO "remix_tag" VALUES(975,'synth',1);
+INSERT INTO "remix_tag" VALUES(975,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(980,'industrial',1);
+INSERT INTO "remix_tag" VALUES(980,'synth',1);
+INSERT INTO "remix_tag" VALUES(984,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(984,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(984,'funky',1);
+INSERT INTO "remix_tag" VALUES(984,'surf',1);
+INSERT INTO "remix_tag" VALUES(984,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(988,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(988,'singing',1);
+INSERT INTO "remix_tag" VALUES(988,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(989,'jazz',1);
+INSERT INTO "remix_tag" VALUES(991,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(991,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(994,'chill',1);
+INSERT INTO "remix_tag" VALUES(994,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(994,'jazz',1);
+INSERT INTO "remix_tag" VALUES(995,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(998,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(999,'duration-long',1);
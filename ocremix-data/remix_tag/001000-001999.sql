@@ -0,0 +1,3563 @@
+INSERT INTO "remix_tag" VALUES(1000,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1000,'funky',1);
+INSERT INTO "remix_tag" VALUES(1000,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(1000,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1000,'surf',1);
+INSERT INTO "remix_tag" VALUES(1001,'synth',1);
+INSERT INTO "remix_tag" VALUES(1001,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(1002,'dance',1);
+INSERT INTO "remix_tag" VALUES(1002,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1002,'synth',1);
+INSERT INTO "remix_tag" VALUES(1002,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1003,'fusion',1);
+INSERT INTO "remix_tag" VALUES(1003,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1003,'piano',1);
+INSERT INTO "remix_tag" VALUES(1003,'strings',1);
+INSERT INTO "remix_tag" VALUES(1003,'synth',1);
+INSERT INTO "remix_tag" VALUES(1003,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1005,'brass',1);
+INSERT INTO "remix_tag" VALUES(1005,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1005,'funky',1);
+INSERT INTO "remix_tag" VALUES(1005,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1005,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1006,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1006,'funk',1);
+INSERT INTO "remix_tag" VALUES(1006,'happy',1);
+INSERT INTO "remix_tag" VALUES(1006,'synth',1);
+INSERT INTO "remix_tag" VALUES(1008,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1010,'funky',1);
+INSERT INTO "remix_tag" VALUES(1010,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1010,'synth',1);
+INSERT INTO "remix_tag" VALUES(1010,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1011,'brass',1);
+INSERT INTO "remix_tag" VALUES(1011,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1011,'classical',1);
+INSERT INTO "remix_tag" VALUES(1011,'epic',1);
+INSERT INTO "remix_tag" VALUES(1011,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1011,'solemn',1);
+INSERT INTO "remix_tag" VALUES(1011,'strings',1);
+INSERT INTO "remix_tag" VALUES(1015,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1025,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1025,'piano',1);
+INSERT INTO "remix_tag" VALUES(1028,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1028,'dark',1);
+INSERT INTO "remix_tag" VALUES(1028,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1029,'accordion',1);
+INSERT INTO "remix_tag" VALUES(1029,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1029,'flute',1);
+INSERT INTO "remix_tag" VALUES(1029,'folk',1);
+INSERT INTO "remix_tag" VALUES(1029,'happy',1);
+INSERT INTO "remix_tag" VALUES(1029,'rock',1);
+INSERT INTO "remix_tag" VALUES(1030,'collab',1);
+INSERT INTO "remix_tag" VALUES(1030,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1030,'piano',1);
+INSERT INTO "remix_tag" VALUES(1030,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1030,'synth',1);
+INSERT INTO "remix_tag" VALUES(1031,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1031,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1031,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1031,'sexy',1);
+INSERT INTO "remix_tag" VALUES(1031,'singing',1);
+INSERT INTO "remix_tag" VALUES(1031,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1034,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1036,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1036,'piano',1);
+INSERT INTO "remix_tag" VALUES(1036,'synth',1);
+INSERT INTO "remix_tag" VALUES(1040,'piano',1);
+INSERT INTO "remix_tag" VALUES(1040,'solo',1);
+INSERT INTO "remix_tag" VALUES(1040,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1047,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1047,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1047,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1047,'piano',1);
+INSERT INTO "remix_tag" VALUES(1048,'dark',1);
+INSERT INTO "remix_tag" VALUES(1048,'piano',1);
+INSERT INTO "remix_tag" VALUES(1048,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(1048,'synth',1);
+INSERT INTO "remix_tag" VALUES(1050,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1052,'collab',1);
+INSERT INTO "remix_tag" VALUES(1052,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1052,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1052,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(1053,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1053,'piano',1);
+INSERT INTO "remix_tag" VALUES(1053,'synth',1);
+INSERT INTO "remix_tag" VALUES(1053,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1055,'piano',1);
+INSERT INTO "remix_tag" VALUES(1056,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1058,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1059,'dance',1);
+INSERT INTO "remix_tag" VALUES(1059,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1059,'organ',1);
+INSERT INTO "remix_tag" VALUES(1059,'piano',1);
+INSERT INTO "remix_tag" VALUES(1059,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1062,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1063,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1066,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1066,'medley',1);
+INSERT INTO "remix_tag" VALUES(1068,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1068,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1068,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1068,'rock',1);
+INSERT INTO "remix_tag" VALUES(1068,'singing',1);
+INSERT INTO "remix_tag" VALUES(1068,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1069,'bells',1);
+INSERT INTO "remix_tag" VALUES(1069,'choir',1);
+INSERT INTO "remix_tag" VALUES(1069,'funky',1);
+INSERT INTO "remix_tag" VALUES(1069,'happy',1);
+INSERT INTO "remix_tag" VALUES(1069,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1069,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1069,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1069,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1071,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1071,'chill',1);
+INSERT INTO "remix_tag" VALUES(1071,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(1071,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1071,'synth',1);
+INSERT INTO "remix_tag" VALUES(1073,'collab',1);
+INSERT INTO "remix_tag" VALUES(1073,'piano',1);
+INSERT INTO "remix_tag" VALUES(1073,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1073,'solo',1);
+INSERT INTO "remix_tag" VALUES(1073,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1074,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1074,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1074,'synth',1);
+INSERT INTO "remix_tag" VALUES(1076,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1083,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1083,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1083,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(1083,'synth',1);
+INSERT INTO "remix_tag" VALUES(1084,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1088,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1089,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1089,'chill',1);
+INSERT INTO "remix_tag" VALUES(1089,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1089,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1089,'synth',1);
+INSERT INTO "remix_tag" VALUES(1089,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1089,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1095,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(1098,'angry',1);
+INSERT INTO "remix_tag" VALUES(1098,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1098,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1098,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1098,'synth',1);
+INSERT INTO "remix_tag" VALUES(1100,'piano',1);
+INSERT INTO "remix_tag" VALUES(1100,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1100,'strings',1);
+INSERT INTO "remix_tag" VALUES(1107,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1107,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1107,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1107,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1108,'happy',1);
+INSERT INTO "remix_tag" VALUES(1108,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1111,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1111,'funky',1);
+INSERT INTO "remix_tag" VALUES(1111,'synth',1);
+INSERT INTO "remix_tag" VALUES(1113,'piano',1);
+INSERT INTO "remix_tag" VALUES(1114,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1114,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1115,'piano',1);
+INSERT INTO "remix_tag" VALUES(1115,'solo',1);
+INSERT INTO "remix_tag" VALUES(1115,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1122,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(1122,'synth',1);
+INSERT INTO "remix_tag" VALUES(1123,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1123,'collab',1);
+INSERT INTO "remix_tag" VALUES(1123,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1123,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(1123,'piano',1);
+INSERT INTO "remix_tag" VALUES(1123,'strings',1);
+INSERT INTO "remix_tag" VALUES(1123,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1123,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1125,'collab',1);
+INSERT INTO "remix_tag" VALUES(1125,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1125,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1125,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1125,'singing',1);
+INSERT INTO "remix_tag" VALUES(1125,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1125,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1127,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1127,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(1127,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1127,'synth',1);
+INSERT INTO "remix_tag" VALUES(1127,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1127,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1134,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1134,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1134,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1134,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1134,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1135,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1135,'piano',1);
+INSERT INTO "remix_tag" VALUES(1135,'solo',1);
+INSERT INTO "remix_tag" VALUES(1137,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1137,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1137,'synth',1);
+INSERT INTO "remix_tag" VALUES(1137,'trance',1);
+INSERT INTO "remix_tag" VALUES(1138,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1138,'piano',1);
+INSERT INTO "remix_tag" VALUES(1138,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1139,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1139,'synth',1);
+INSERT INTO "remix_tag" VALUES(1149,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1149,'rock',1);
+INSERT INTO "remix_tag" VALUES(1149,'singing',1);
+INSERT INTO "remix_tag" VALUES(1149,'synth',1);
+INSERT INTO "remix_tag" VALUES(1149,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1158,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1158,'bells',1);
+INSERT INTO "remix_tag" VALUES(1158,'synth',1);
+INSERT INTO "remix_tag" VALUES(1158,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1160,'collab',1);
+INSERT INTO "remix_tag" VALUES(1161,'choir',1);
+INSERT INTO "remix_tag" VALUES(1161,'dance',1);
+INSERT INTO "remix_tag" VALUES(1161,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1161,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1161,'synth',1);
+INSERT INTO "remix_tag" VALUES(1161,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1164,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1168,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1168,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1168,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1168,'piano',1);
+INSERT INTO "remix_tag" VALUES(1170,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1170,'piano',1);
+INSERT INTO "remix_tag" VALUES(1170,'singing',1);
+INSERT INTO "remix_tag" VALUES(1170,'strings',1);
+INSERT INTO "remix_tag" VALUES(1170,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1170,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1170,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1171,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(1171,'collab',1);
+INSERT INTO "remix_tag" VALUES(1171,'dark',1);
+INSERT INTO "remix_tag" VALUES(1171,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(1171,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1171,'strings',1);
+INSERT INTO "remix_tag" VALUES(1171,'violin',1);
+INSERT INTO "remix_tag" VALUES(1172,'brass',1);
+INSERT INTO "remix_tag" VALUES(1172,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1172,'classical',1);
+INSERT INTO "remix_tag" VALUES(1172,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1172,'strings',1);
+INSERT INTO "remix_tag" VALUES(1173,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1173,'dark',1);
+INSERT INTO "remix_tag" VALUES(1173,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1173,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1173,'metal',1);
+INSERT INTO "remix_tag" VALUES(1173,'rock',1);
+INSERT INTO "remix_tag" VALUES(1174,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1174,'piano',1);
+INSERT INTO "remix_tag" VALUES(1174,'strings',1);
+INSERT INTO "remix_tag" VALUES(1174,'synth',1);
+INSERT INTO "remix_tag" VALUES(1174,'world',1);
+INSERT INTO "remix_tag" VALUES(1175,'chill',1);
+INSERT INTO "remix_tag" VALUES(1175,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(1175,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1175,'piano',1);
+INSERT INTO "remix_tag" VALUES(1175,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1176,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1176,'funky',1);
+INSERT INTO "remix_tag" VALUES(1176,'piano',1);
+INSERT INTO "remix_tag" VALUES(1176,'swing',1);
+INSERT INTO "remix_tag" VALUES(1176,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1176,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1177,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1177,'ballad',1);
+INSERT INTO "remix_tag" VALUES(1177,'piano',1);
+INSERT INTO "remix_tag" VALUES(1177,'solo',1);
+INSERT INTO "remix_tag" VALUES(1177,'strings',1);
+INSERT INTO "remix_tag" VALUES(1177,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1178,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(1178,'choir',1);
+INSERT INTO "remix_tag" VALUES(1178,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1178,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1178,'piano',1);
+INSERT INTO "remix_tag" VALUES(1178,'solo',1);
+INSERT INTO "remix_tag" VALUES(1178,'synth',1);
+INSERT INTO "remix_tag" VALUES(1178,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1179,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1179,'dark',1);
+INSERT INTO "remix_tag" VALUES(1179,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1179,'synth',1);
+INSERT INTO "remix_tag" VALUES(1180,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1180,'funk',1);
+INSERT INTO "remix_tag" VALUES(1180,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1180,'pop',1);
+INSERT INTO "remix_tag" VALUES(1180,'synth',1);
+INSERT INTO "remix_tag" VALUES(1180,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1180,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(1180,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(1181,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1181,'funk',1);
+INSERT INTO "remix_tag" VALUES(1181,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1181,'synth',1);
+INSERT INTO "remix_tag" VALUES(1182,'celtic',1);
+INSERT INTO "remix_tag" VALUES(1182,'collab',1);
+INSERT INTO "remix_tag" VALUES(1182,'indian',1);
+INSERT INTO "remix_tag" VALUES(1182,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1182,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1183,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1183,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1183,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1183,'rock',1);
+INSERT INTO "remix_tag" VALUES(1183,'synth',1);
+INSERT INTO "remix_tag" VALUES(1184,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1184,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1184,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1184,'strings',1);
+INSERT INTO "remix_tag" VALUES(1184,'synth',1);
+INSERT INTO "remix_tag" VALUES(1185,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1185,'piano',1);
+INSERT INTO "remix_tag" VALUES(1185,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1185,'world',1);
+INSERT INTO "remix_tag" VALUES(1186,'funk',1);
+INSERT INTO "remix_tag" VALUES(1186,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1186,'synth',1);
+INSERT INTO "remix_tag" VALUES(1187,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1187,'epic',1);
+INSERT INTO "remix_tag" VALUES(1187,'strings',1);
+INSERT INTO "remix_tag" VALUES(1187,'synth',1);
+INSERT INTO "remix_tag" VALUES(1188,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1188,'piano',1);
+INSERT INTO "remix_tag" VALUES(1188,'solo',1);
+INSERT INTO "remix_tag" VALUES(1188,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1189,'collab',1);
+INSERT INTO "remix_tag" VALUES(1189,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1189,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1189,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1189,'singing',1);
+INSERT INTO "remix_tag" VALUES(1189,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1190,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1190,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1190,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1190,'piano',1);
+INSERT INTO "remix_tag" VALUES(1190,'sad',1);
+INSERT INTO "remix_tag" VALUES(1191,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1191,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1191,'synth',1);
+INSERT INTO "remix_tag" VALUES(1192,'collab',1);
+INSERT INTO "remix_tag" VALUES(1192,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1192,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1192,'rock',1);
+INSERT INTO "remix_tag" VALUES(1192,'synth',1);
+INSERT INTO "remix_tag" VALUES(1194,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1194,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1194,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1194,'rock',1);
+INSERT INTO "remix_tag" VALUES(1195,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1195,'piano',1);
+INSERT INTO "remix_tag" VALUES(1195,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1196,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1196,'synth',1);
+INSERT INTO "remix_tag" VALUES(1197,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1197,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1197,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1198,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1198,'synth',1);
+INSERT INTO "remix_tag" VALUES(1199,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1199,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1200,'piano',1);
+INSERT INTO "remix_tag" VALUES(1200,'solo',1);
+INSERT INTO "remix_tag" VALUES(1201,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1201,'brass',1);
+INSERT INTO "remix_tag" VALUES(1201,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1201,'happy',1);
+INSERT INTO "remix_tag" VALUES(1201,'piano',1);
+INSERT INTO "remix_tag" VALUES(1201,'pop',1);
+INSERT INTO "remix_tag" VALUES(1202,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1202,'pop',1);
+INSERT INTO "remix_tag" VALUES(1202,'synth',1);
+INSERT INTO "remix_tag" VALUES(1203,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1203,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(1203,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(1203,'dark',1);
+INSERT INTO "remix_tag" VALUES(1203,'distortion',1);
+INSERT INTO "remix_tag" VALUES(1203,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1203,'synth',1);
+INSERT INTO "remix_tag" VALUES(1203,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1204,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1204,'synth',1);
+INSERT INTO "remix_tag" VALUES(1205,'chill',1);
+INSERT INTO "remix_tag" VALUES(1205,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1205,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1205,'pop',1);
+INSERT INTO "remix_tag" VALUES(1205,'singing',1);
+INSERT INTO "remix_tag" VALUES(1205,'synth',1);
+INSERT INTO "remix_tag" VALUES(1205,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1206,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1206,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1206,'piano',1);
+INSERT INTO "remix_tag" VALUES(1206,'synth',1);
+INSERT INTO "remix_tag" VALUES(1207,'celtic',1);
+INSERT INTO "remix_tag" VALUES(1207,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1207,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1207,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1207,'piano',1);
+INSERT INTO "remix_tag" VALUES(1207,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1208,'collab',1);
+INSERT INTO "remix_tag" VALUES(1208,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1208,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1208,'piano',1);
+INSERT INTO "remix_tag" VALUES(1208,'singing',1);
+INSERT INTO "remix_tag" VALUES(1208,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1209,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1209,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1210,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1210,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1210,'piano',1);
+INSERT INTO "remix_tag" VALUES(1210,'synth',1);
+INSERT INTO "remix_tag" VALUES(1210,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1211,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1211,'rock',1);
+INSERT INTO "remix_tag" VALUES(1211,'synth',1);
+INSERT INTO "remix_tag" VALUES(1212,'classical',1);
+INSERT INTO "remix_tag" VALUES(1212,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1212,'strings',1);
+INSERT INTO "remix_tag" VALUES(1212,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1214,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1214,'synth',1);
+INSERT INTO "remix_tag" VALUES(1215,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1215,'pop',1);
+INSERT INTO "remix_tag" VALUES(1215,'singing',1);
+INSERT INTO "remix_tag" VALUES(1215,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1216,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1216,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1216,'piano',1);
+INSERT INTO "remix_tag" VALUES(1216,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1216,'strings',1);
+INSERT INTO "remix_tag" VALUES(1216,'synth',1);
+INSERT INTO "remix_tag" VALUES(1217,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1217,'synth',1);
+INSERT INTO "remix_tag" VALUES(1217,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1218,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1218,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1218,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1218,'synth',1);
+INSERT INTO "remix_tag" VALUES(1218,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1219,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1219,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1219,'strings',1);
+INSERT INTO "remix_tag" VALUES(1219,'synth',1);
+INSERT INTO "remix_tag" VALUES(1220,'collab',1);
+INSERT INTO "remix_tag" VALUES(1220,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1220,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1220,'synth',1);
+INSERT INTO "remix_tag" VALUES(1221,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1221,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1221,'piano',1);
+INSERT INTO "remix_tag" VALUES(1221,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1222,'celtic',1);
+INSERT INTO "remix_tag" VALUES(1222,'collab',1);
+INSERT INTO "remix_tag" VALUES(1222,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1222,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1222,'strings',1);
+INSERT INTO "remix_tag" VALUES(1222,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1222,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1223,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1223,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1223,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1224,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1224,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1224,'rock',1);
+INSERT INTO "remix_tag" VALUES(1224,'singing',1);
+INSERT INTO "remix_tag" VALUES(1224,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1225,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1225,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(1225,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1225,'singing',1);
+INSERT INTO "remix_tag" VALUES(1225,'synth',1);
+INSERT INTO "remix_tag" VALUES(1225,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1226,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1226,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1226,'synth',1);
+INSERT INTO "remix_tag" VALUES(1227,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1227,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1228,'chinese',1);
+INSERT INTO "remix_tag" VALUES(1228,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1228,'world',1);
+INSERT INTO "remix_tag" VALUES(1229,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1229,'piano',1);
+INSERT INTO "remix_tag" VALUES(1229,'strings',1);
+INSERT INTO "remix_tag" VALUES(1230,'piano',1);
+INSERT INTO "remix_tag" VALUES(1231,'chill',1);
+INSERT INTO "remix_tag" VALUES(1231,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1231,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1231,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1232,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1232,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1232,'strings',1);
+INSERT INTO "remix_tag" VALUES(1232,'synth',1);
+INSERT INTO "remix_tag" VALUES(1233,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1233,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1233,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1234,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1234,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1234,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1234,'synth',1);
+INSERT INTO "remix_tag" VALUES(1235,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1235,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1235,'synth',1);
+INSERT INTO "remix_tag" VALUES(1236,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1236,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1236,'strings',1);
+INSERT INTO "remix_tag" VALUES(1236,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1236,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1237,'chill',1);
+INSERT INTO "remix_tag" VALUES(1237,'collab',1);
+INSERT INTO "remix_tag" VALUES(1237,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1237,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1238,'collab',1);
+INSERT INTO "remix_tag" VALUES(1238,'piano',1);
+INSERT INTO "remix_tag" VALUES(1238,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1238,'solo',1);
+INSERT INTO "remix_tag" VALUES(1239,'chill',1);
+INSERT INTO "remix_tag" VALUES(1239,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1239,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1240,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1240,'rock',1);
+INSERT INTO "remix_tag" VALUES(1241,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1241,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1241,'pop',1);
+INSERT INTO "remix_tag" VALUES(1241,'romantic',1);
+INSERT INTO "remix_tag" VALUES(1241,'strings',1);
+INSERT INTO "remix_tag" VALUES(1242,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1242,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1242,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1242,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1242,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1242,'piano',1);
+INSERT INTO "remix_tag" VALUES(1242,'sad',1);
+INSERT INTO "remix_tag" VALUES(1242,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1243,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1243,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1243,'world',1);
+INSERT INTO "remix_tag" VALUES(1244,'brass',1);
+INSERT INTO "remix_tag" VALUES(1244,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1244,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1244,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1245,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1245,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1245,'synth',1);
+INSERT INTO "remix_tag" VALUES(1246,'piano',1);
+INSERT INTO "remix_tag" VALUES(1246,'solo',1);
+INSERT INTO "remix_tag" VALUES(1247,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1247,'folk',1);
+INSERT INTO "remix_tag" VALUES(1247,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1247,'rock',1);
+INSERT INTO "remix_tag" VALUES(1248,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1248,'piano',1);
+INSERT INTO "remix_tag" VALUES(1249,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1249,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1249,'rock',1);
+INSERT INTO "remix_tag" VALUES(1250,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1250,'piano',1);
+INSERT INTO "remix_tag" VALUES(1250,'world',1);
+INSERT INTO "remix_tag" VALUES(1251,'chill',1);
+INSERT INTO "remix_tag" VALUES(1251,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1252,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1252,'synth',1);
+INSERT INTO "remix_tag" VALUES(1253,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1253,'rock',1);
+INSERT INTO "remix_tag" VALUES(1254,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1254,'synth',1);
+INSERT INTO "remix_tag" VALUES(1254,'trance',1);
+INSERT INTO "remix_tag" VALUES(1255,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1255,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1255,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1255,'synth',1);
+INSERT INTO "remix_tag" VALUES(1256,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1256,'piano',1);
+INSERT INTO "remix_tag" VALUES(1256,'strings',1);
+INSERT INTO "remix_tag" VALUES(1256,'synth',1);
+INSERT INTO "remix_tag" VALUES(1257,'classical',1);
+INSERT INTO "remix_tag" VALUES(1257,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1257,'piano',1);
+INSERT INTO "remix_tag" VALUES(1257,'solo',1);
+INSERT INTO "remix_tag" VALUES(1258,'collab',1);
+INSERT INTO "remix_tag" VALUES(1258,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1258,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1258,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1258,'piano',1);
+INSERT INTO "remix_tag" VALUES(1258,'synth',1);
+INSERT INTO "remix_tag" VALUES(1259,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1259,'piano',1);
+INSERT INTO "remix_tag" VALUES(1259,'rock',1);
+INSERT INTO "remix_tag" VALUES(1260,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1260,'classical',1);
+INSERT INTO "remix_tag" VALUES(1260,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1260,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1261,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1261,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1261,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1262,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1262,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1262,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1262,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1262,'piano',1);
+INSERT INTO "remix_tag" VALUES(1262,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(1263,'choir',1);
+INSERT INTO "remix_tag" VALUES(1263,'dark',1);
+INSERT INTO "remix_tag" VALUES(1263,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1263,'strings',1);
+INSERT INTO "remix_tag" VALUES(1263,'synth',1);
+INSERT INTO "remix_tag" VALUES(1264,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1264,'synth',1);
+INSERT INTO "remix_tag" VALUES(1265,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1265,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1265,'pop',1);
+INSERT INTO "remix_tag" VALUES(1265,'synth',1);
+INSERT INTO "remix_tag" VALUES(1266,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1266,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1266,'rock',1);
+INSERT INTO "remix_tag" VALUES(1266,'singing',1);
+INSERT INTO "remix_tag" VALUES(1266,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1267,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1267,'synth',1);
+INSERT INTO "remix_tag" VALUES(1268,'strings',1);
+INSERT INTO "remix_tag" VALUES(1268,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1268,'world',1);
+INSERT INTO "remix_tag" VALUES(1269,'collab',1);
+INSERT INTO "remix_tag" VALUES(1269,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1269,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1269,'synth',1);
+INSERT INTO "remix_tag" VALUES(1269,'trance',1);
+INSERT INTO "remix_tag" VALUES(1270,'chill',1);
+INSERT INTO "remix_tag" VALUES(1270,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1270,'piano',1);
+INSERT INTO "remix_tag" VALUES(1270,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1270,'synth',1);
+INSERT INTO "remix_tag" VALUES(1271,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1271,'chill',1);
+INSERT INTO "remix_tag" VALUES(1271,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1271,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1271,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1271,'piano',1);
+INSERT INTO "remix_tag" VALUES(1271,'synth',1);
+INSERT INTO "remix_tag" VALUES(1272,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1272,'rock',1);
+INSERT INTO "remix_tag" VALUES(1272,'synth',1);
+INSERT INTO "remix_tag" VALUES(1273,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1273,'strings',1);
+INSERT INTO "remix_tag" VALUES(1273,'synth',1);
+INSERT INTO "remix_tag" VALUES(1273,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1274,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1274,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1275,'classical',1);
+INSERT INTO "remix_tag" VALUES(1275,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1275,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1276,'classical',1);
+INSERT INTO "remix_tag" VALUES(1276,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1277,'chill',1);
+INSERT INTO "remix_tag" VALUES(1277,'collab',1);
+INSERT INTO "remix_tag" VALUES(1277,'dark',1);
+INSERT INTO "remix_tag" VALUES(1277,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1277,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1277,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1277,'rock',1);
+INSERT INTO "remix_tag" VALUES(1277,'singing',1);
+INSERT INTO "remix_tag" VALUES(1277,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1277,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1278,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1278,'synth',1);
+INSERT INTO "remix_tag" VALUES(1279,'brass',1);
+INSERT INTO "remix_tag" VALUES(1279,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1279,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1279,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1279,'strings',1);
+INSERT INTO "remix_tag" VALUES(1279,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1280,'collab',1);
+INSERT INTO "remix_tag" VALUES(1280,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1280,'funk',1);
+INSERT INTO "remix_tag" VALUES(1280,'strings',1);
+INSERT INTO "remix_tag" VALUES(1280,'synth',1);
+INSERT INTO "remix_tag" VALUES(1281,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1281,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1281,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1281,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1281,'sad',1);
+INSERT INTO "remix_tag" VALUES(1282,'piano',1);
+INSERT INTO "remix_tag" VALUES(1282,'solo',1);
+INSERT INTO "remix_tag" VALUES(1283,'collab',1);
+INSERT INTO "remix_tag" VALUES(1283,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1283,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1283,'synth',1);
+INSERT INTO "remix_tag" VALUES(1283,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1283,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1284,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1284,'synth',1);
+INSERT INTO "remix_tag" VALUES(1285,'collab',1);
+INSERT INTO "remix_tag" VALUES(1285,'piano',1);
+INSERT INTO "remix_tag" VALUES(1285,'synth',1);
+INSERT INTO "remix_tag" VALUES(1286,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1286,'chill',1);
+INSERT INTO "remix_tag" VALUES(1286,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1286,'experimental',1);
+INSERT INTO "remix_tag" VALUES(1286,'harp',1);
+INSERT INTO "remix_tag" VALUES(1286,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1286,'piano',1);
+INSERT INTO "remix_tag" VALUES(1286,'strings',1);
+INSERT INTO "remix_tag" VALUES(1286,'synth',1);
+INSERT INTO "remix_tag" VALUES(1286,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1286,'trance',1);
+INSERT INTO "remix_tag" VALUES(1287,'collab',1);
+INSERT INTO "remix_tag" VALUES(1287,'piano',1);
+INSERT INTO "remix_tag" VALUES(1287,'solo',1);
+INSERT INTO "remix_tag" VALUES(1288,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1288,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1289,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1289,'experimental',1);
+INSERT INTO "remix_tag" VALUES(1289,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(1289,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1289,'piano',1);
+INSERT INTO "remix_tag" VALUES(1289,'strings',1);
+INSERT INTO "remix_tag" VALUES(1289,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1290,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1290,'piano',1);
+INSERT INTO "remix_tag" VALUES(1290,'strings',1);
+INSERT INTO "remix_tag" VALUES(1290,'synth',1);
+INSERT INTO "remix_tag" VALUES(1291,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1291,'strings',1);
+INSERT INTO "remix_tag" VALUES(1291,'synth',1);
+INSERT INTO "remix_tag" VALUES(1291,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1292,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1292,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1292,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(1292,'piano',1);
+INSERT INTO "remix_tag" VALUES(1292,'synth',1);
+INSERT INTO "remix_tag" VALUES(1293,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1293,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1293,'spooky',1);
+INSERT INTO "remix_tag" VALUES(1293,'strings',1);
+INSERT INTO "remix_tag" VALUES(1294,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1294,'funk',1);
+INSERT INTO "remix_tag" VALUES(1294,'rock',1);
+INSERT INTO "remix_tag" VALUES(1295,'piano',1);
+INSERT INTO "remix_tag" VALUES(1295,'solo',1);
+INSERT INTO "remix_tag" VALUES(1296,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1296,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1296,'rock',1);
+INSERT INTO "remix_tag" VALUES(1296,'surf',1);
+INSERT INTO "remix_tag" VALUES(1297,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1297,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1298,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1298,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1298,'strings',1);
+INSERT INTO "remix_tag" VALUES(1299,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1299,'synth',1);
+INSERT INTO "remix_tag" VALUES(1300,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1300,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1300,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1300,'rock',1);
+INSERT INTO "remix_tag" VALUES(1301,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1301,'rock',1);
+INSERT INTO "remix_tag" VALUES(1302,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1302,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1303,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1303,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1303,'synth',1);
+INSERT INTO "remix_tag" VALUES(1304,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1304,'rock',1);
+INSERT INTO "remix_tag" VALUES(1304,'synth',1);
+INSERT INTO "remix_tag" VALUES(1305,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1305,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1305,'synth',1);
+INSERT INTO "remix_tag" VALUES(1306,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1306,'piano',1);
+INSERT INTO "remix_tag" VALUES(1306,'strings',1);
+INSERT INTO "remix_tag" VALUES(1306,'world',1);
+INSERT INTO "remix_tag" VALUES(1307,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1307,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1307,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1307,'synth',1);
+INSERT INTO "remix_tag" VALUES(1308,'classical',1);
+INSERT INTO "remix_tag" VALUES(1308,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1309,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1309,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1309,'synth',1);
+INSERT INTO "remix_tag" VALUES(1310,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1310,'chill',1);
+INSERT INTO "remix_tag" VALUES(1310,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1310,'piano',1);
+INSERT INTO "remix_tag" VALUES(1310,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1310,'synth',1);
+INSERT INTO "remix_tag" VALUES(1311,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1311,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1311,'happy',1);
+INSERT INTO "remix_tag" VALUES(1311,'piano',1);
+INSERT INTO "remix_tag" VALUES(1311,'pop',1);
+INSERT INTO "remix_tag" VALUES(1311,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1311,'synth',1);
+INSERT INTO "remix_tag" VALUES(1311,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1312,'collab',1);
+INSERT INTO "remix_tag" VALUES(1312,'lang-italian',1);
+INSERT INTO "remix_tag" VALUES(1312,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1312,'piano',1);
+INSERT INTO "remix_tag" VALUES(1312,'pop',1);
+INSERT INTO "remix_tag" VALUES(1312,'singing',1);
+INSERT INTO "remix_tag" VALUES(1312,'synth',1);
+INSERT INTO "remix_tag" VALUES(1312,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1313,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1313,'funk',1);
+INSERT INTO "remix_tag" VALUES(1313,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1313,'rock',1);
+INSERT INTO "remix_tag" VALUES(1313,'singing',1);
+INSERT INTO "remix_tag" VALUES(1313,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1314,'classical',1);
+INSERT INTO "remix_tag" VALUES(1314,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1314,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1315,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1315,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1315,'piano',1);
+INSERT INTO "remix_tag" VALUES(1315,'rock',1);
+INSERT INTO "remix_tag" VALUES(1315,'strings',1);
+INSERT INTO "remix_tag" VALUES(1316,'chill',1);
+INSERT INTO "remix_tag" VALUES(1316,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1316,'piano',1);
+INSERT INTO "remix_tag" VALUES(1316,'synth',1);
+INSERT INTO "remix_tag" VALUES(1316,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1317,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1317,'angry',1);
+INSERT INTO "remix_tag" VALUES(1317,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1317,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1317,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1317,'metal',1);
+INSERT INTO "remix_tag" VALUES(1317,'rock',1);
+INSERT INTO "remix_tag" VALUES(1317,'singing',1);
+INSERT INTO "remix_tag" VALUES(1317,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1318,'collab',1);
+INSERT INTO "remix_tag" VALUES(1318,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1318,'piano',1);
+INSERT INTO "remix_tag" VALUES(1318,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1319,'brass',1);
+INSERT INTO "remix_tag" VALUES(1319,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1319,'sad',1);
+INSERT INTO "remix_tag" VALUES(1319,'singing',1);
+INSERT INTO "remix_tag" VALUES(1319,'strings',1);
+INSERT INTO "remix_tag" VALUES(1319,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1320,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1320,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1320,'synth',1);
+INSERT INTO "remix_tag" VALUES(1321,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1321,'piano',1);
+INSERT INTO "remix_tag" VALUES(1321,'synth',1);
+INSERT INTO "remix_tag" VALUES(1321,'trance',1);
+INSERT INTO "remix_tag" VALUES(1321,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1322,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1322,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1322,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1322,'piano',1);
+INSERT INTO "remix_tag" VALUES(1322,'strings',1);
+INSERT INTO "remix_tag" VALUES(1322,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1322,'world',1);
+INSERT INTO "remix_tag" VALUES(1323,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1323,'rock',1);
+INSERT INTO "remix_tag" VALUES(1324,'piano',1);
+INSERT INTO "remix_tag" VALUES(1324,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1324,'solo',1);
+INSERT INTO "remix_tag" VALUES(1325,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1325,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1325,'piano',1);
+INSERT INTO "remix_tag" VALUES(1325,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1326,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1326,'piano',1);
+INSERT INTO "remix_tag" VALUES(1326,'synth',1);
+INSERT INTO "remix_tag" VALUES(1327,'compo',1);
+INSERT INTO "remix_tag" VALUES(1327,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1327,'funk',1);
+INSERT INTO "remix_tag" VALUES(1327,'piano',1);
+INSERT INTO "remix_tag" VALUES(1327,'rock',1);
+INSERT INTO "remix_tag" VALUES(1327,'synth',1);
+INSERT INTO "remix_tag" VALUES(1328,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1328,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1328,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1328,'rock',1);
+INSERT INTO "remix_tag" VALUES(1328,'strings',1);
+INSERT INTO "remix_tag" VALUES(1328,'synth',1);
+INSERT INTO "remix_tag" VALUES(1329,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1329,'synth',1);
+INSERT INTO "remix_tag" VALUES(1330,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1330,'dark',1);
+INSERT INTO "remix_tag" VALUES(1330,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1330,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1330,'spooky',1);
+INSERT INTO "remix_tag" VALUES(1330,'strings',1);
+INSERT INTO "remix_tag" VALUES(1330,'synth',1);
+INSERT INTO "remix_tag" VALUES(1330,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(1331,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1331,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1331,'synth',1);
+INSERT INTO "remix_tag" VALUES(1332,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1332,'piano',1);
+INSERT INTO "remix_tag" VALUES(1332,'solo',1);
+INSERT INTO "remix_tag" VALUES(1333,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1333,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1333,'singing',1);
+INSERT INTO "remix_tag" VALUES(1333,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1334,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1334,'pop',1);
+INSERT INTO "remix_tag" VALUES(1334,'synth',1);
+INSERT INTO "remix_tag" VALUES(1335,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1335,'piano',1);
+INSERT INTO "remix_tag" VALUES(1335,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1336,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1336,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1336,'piano',1);
+INSERT INTO "remix_tag" VALUES(1336,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1337,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1337,'funk',1);
+INSERT INTO "remix_tag" VALUES(1337,'happy',1);
+INSERT INTO "remix_tag" VALUES(1337,'synth',1);
+INSERT INTO "remix_tag" VALUES(1338,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1338,'funk',1);
+INSERT INTO "remix_tag" VALUES(1338,'synth',1);
+INSERT INTO "remix_tag" VALUES(1339,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1339,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1339,'piano',1);
+INSERT INTO "remix_tag" VALUES(1339,'rock',1);
+INSERT INTO "remix_tag" VALUES(1340,'chill',1);
+INSERT INTO "remix_tag" VALUES(1340,'strings',1);
+INSERT INTO "remix_tag" VALUES(1340,'synth',1);
+INSERT INTO "remix_tag" VALUES(1341,'collab',1);
+INSERT INTO "remix_tag" VALUES(1341,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1341,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1341,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1341,'piano',1);
+INSERT INTO "remix_tag" VALUES(1341,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(1341,'rock',1);
+INSERT INTO "remix_tag" VALUES(1342,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1342,'synth',1);
+INSERT INTO "remix_tag" VALUES(1343,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1343,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1344,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1344,'world',1);
+INSERT INTO "remix_tag" VALUES(1345,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1345,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1345,'rock',1);
+INSERT INTO "remix_tag" VALUES(1346,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1346,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1346,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1346,'piano',1);
+INSERT INTO "remix_tag" VALUES(1346,'singing',1);
+INSERT INTO "remix_tag" VALUES(1346,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1347,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1347,'strings',1);
+INSERT INTO "remix_tag" VALUES(1347,'synth',1);
+INSERT INTO "remix_tag" VALUES(1348,'classical',1);
+INSERT INTO "remix_tag" VALUES(1348,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1348,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1349,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1349,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1349,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1349,'strings',1);
+INSERT INTO "remix_tag" VALUES(1350,'chill',1);
+INSERT INTO "remix_tag" VALUES(1350,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1350,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1350,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1350,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1350,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1350,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1351,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1351,'funk',1);
+INSERT INTO "remix_tag" VALUES(1351,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1351,'koto',1);
+INSERT INTO "remix_tag" VALUES(1351,'piano',1);
+INSERT INTO "remix_tag" VALUES(1352,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1352,'pop',1);
+INSERT INTO "remix_tag" VALUES(1352,'synth',1);
+INSERT INTO "remix_tag" VALUES(1353,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1353,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1353,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1353,'strings',1);
+INSERT INTO "remix_tag" VALUES(1353,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1354,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1354,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1355,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1355,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1355,'synth',1);
+INSERT INTO "remix_tag" VALUES(1356,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1356,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1356,'rock',1);
+INSERT INTO "remix_tag" VALUES(1356,'synth',1);
+INSERT INTO "remix_tag" VALUES(1357,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1357,'chill',1);
+INSERT INTO "remix_tag" VALUES(1357,'collab',1);
+INSERT INTO "remix_tag" VALUES(1357,'piano',1);
+INSERT INTO "remix_tag" VALUES(1357,'synth',1);
+INSERT INTO "remix_tag" VALUES(1358,'happy',1);
+INSERT INTO "remix_tag" VALUES(1358,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1358,'piano',1);
+INSERT INTO "remix_tag" VALUES(1358,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1358,'strings',1);
+INSERT INTO "remix_tag" VALUES(1358,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1359,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1359,'chill',1);
+INSERT INTO "remix_tag" VALUES(1359,'piano',1);
+INSERT INTO "remix_tag" VALUES(1360,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1360,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1360,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1360,'rock',1);
+INSERT INTO "remix_tag" VALUES(1360,'singing',1);
+INSERT INTO "remix_tag" VALUES(1360,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1361,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1361,'funk',1);
+INSERT INTO "remix_tag" VALUES(1361,'synth',1);
+INSERT INTO "remix_tag" VALUES(1362,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1362,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1362,'rock',1);
+INSERT INTO "remix_tag" VALUES(1362,'singing',1);
+INSERT INTO "remix_tag" VALUES(1362,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1363,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1363,'piano',1);
+INSERT INTO "remix_tag" VALUES(1363,'solo',1);
+INSERT INTO "remix_tag" VALUES(1364,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1364,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1364,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1364,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(1364,'synth',1);
+INSERT INTO "remix_tag" VALUES(1365,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1365,'funk',1);
+INSERT INTO "remix_tag" VALUES(1365,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1365,'piano',1);
+INSERT INTO "remix_tag" VALUES(1366,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1366,'chill',1);
+INSERT INTO "remix_tag" VALUES(1366,'piano',1);
+INSERT INTO "remix_tag" VALUES(1366,'strings',1);
+INSERT INTO "remix_tag" VALUES(1366,'synth',1);
+INSERT INTO "remix_tag" VALUES(1367,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1367,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1367,'pop',1);
+INSERT INTO "remix_tag" VALUES(1367,'rock',1);
+INSERT INTO "remix_tag" VALUES(1367,'singing',1);
+INSERT INTO "remix_tag" VALUES(1367,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1368,'disco',1);
+INSERT INTO "remix_tag" VALUES(1368,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1368,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1368,'piano',1);
+INSERT INTO "remix_tag" VALUES(1368,'pop',1);
+INSERT INTO "remix_tag" VALUES(1368,'singing',1);
+INSERT INTO "remix_tag" VALUES(1368,'synth',1);
+INSERT INTO "remix_tag" VALUES(1368,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1368,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1369,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1369,'synth',1);
+INSERT INTO "remix_tag" VALUES(1369,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1370,'classical',1);
+INSERT INTO "remix_tag" VALUES(1370,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1370,'piano',1);
+INSERT INTO "remix_tag" VALUES(1371,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1371,'funk',1);
+INSERT INTO "remix_tag" VALUES(1371,'synth',1);
+INSERT INTO "remix_tag" VALUES(1372,'collab',1);
+INSERT INTO "remix_tag" VALUES(1372,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1372,'rock',1);
+INSERT INTO "remix_tag" VALUES(1373,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1373,'chill',1);
+INSERT INTO "remix_tag" VALUES(1373,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1373,'synth',1);
+INSERT INTO "remix_tag" VALUES(1374,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1374,'synth',1);
+INSERT INTO "remix_tag" VALUES(1375,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1375,'synth',1);
+INSERT INTO "remix_tag" VALUES(1376,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1376,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1376,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1376,'synth',1);
+INSERT INTO "remix_tag" VALUES(1377,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1377,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1377,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1377,'rock',1);
+INSERT INTO "remix_tag" VALUES(1377,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1378,'brass',1);
+INSERT INTO "remix_tag" VALUES(1378,'latin',1);
+INSERT INTO "remix_tag" VALUES(1378,'piano',1);
+INSERT INTO "remix_tag" VALUES(1378,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1379,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1379,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1379,'synth',1);
+INSERT INTO "remix_tag" VALUES(1380,'synth',1);
+INSERT INTO "remix_tag" VALUES(1380,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1381,'collab',1);
+INSERT INTO "remix_tag" VALUES(1381,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1381,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1381,'piano',1);
+INSERT INTO "remix_tag" VALUES(1381,'singing',1);
+INSERT INTO "remix_tag" VALUES(1381,'synth',1);
+INSERT INTO "remix_tag" VALUES(1381,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1382,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1382,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1382,'synth',1);
+INSERT INTO "remix_tag" VALUES(1383,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1383,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1383,'pop',1);
+INSERT INTO "remix_tag" VALUES(1383,'singing',1);
+INSERT INTO "remix_tag" VALUES(1383,'synth',1);
+INSERT INTO "remix_tag" VALUES(1383,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1384,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1384,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1384,'world',1);
+INSERT INTO "remix_tag" VALUES(1385,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1385,'dark',1);
+INSERT INTO "remix_tag" VALUES(1385,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1385,'medley',1);
+INSERT INTO "remix_tag" VALUES(1385,'rock',1);
+INSERT INTO "remix_tag" VALUES(1385,'synth',1);
+INSERT INTO "remix_tag" VALUES(1386,'classical',1);
+INSERT INTO "remix_tag" VALUES(1386,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1386,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1387,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1387,'dark',1);
+INSERT INTO "remix_tag" VALUES(1387,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1387,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1387,'spooky',1);
+INSERT INTO "remix_tag" VALUES(1388,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1388,'happy',1);
+INSERT INTO "remix_tag" VALUES(1388,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1388,'rock',1);
+INSERT INTO "remix_tag" VALUES(1388,'singing',1);
+INSERT INTO "remix_tag" VALUES(1388,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1389,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1389,'pop',1);
+INSERT INTO "remix_tag" VALUES(1389,'synth',1);
+INSERT INTO "remix_tag" VALUES(1390,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1390,'piano',1);
+INSERT INTO "remix_tag" VALUES(1390,'synth',1);
+INSERT INTO "remix_tag" VALUES(1390,'trance',1);
+INSERT INTO "remix_tag" VALUES(1391,'piano',1);
+INSERT INTO "remix_tag" VALUES(1391,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1392,'collab',1);
+INSERT INTO "remix_tag" VALUES(1392,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1392,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1392,'piano',1);
+INSERT INTO "remix_tag" VALUES(1392,'strings',1);
+INSERT INTO "remix_tag" VALUES(1392,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1393,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(1393,'edm',1);
+INSERT INTO "remix_tag" VALUES(1393,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1393,'energetic',1);
+INSERT INTO "remix_tag" VALUES(1393,'synth',1);
+INSERT INTO "remix_tag" VALUES(1393,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1393,'workout',1);
+INSERT INTO "remix_tag" VALUES(1394,'funk',1);
+INSERT INTO "remix_tag" VALUES(1394,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1394,'piano',1);
+INSERT INTO "remix_tag" VALUES(1395,'celtic',1);
+INSERT INTO "remix_tag" VALUES(1395,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1395,'folk',1);
+INSERT INTO "remix_tag" VALUES(1395,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1395,'singing',1);
+INSERT INTO "remix_tag" VALUES(1395,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1395,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1396,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1396,'dark',1);
+INSERT INTO "remix_tag" VALUES(1397,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1397,'chill',1);
+INSERT INTO "remix_tag" VALUES(1397,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1398,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1398,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1398,'rock',1);
+INSERT INTO "remix_tag" VALUES(1399,'collab',1);
+INSERT INTO "remix_tag" VALUES(1399,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1399,'piano',1);
+INSERT INTO "remix_tag" VALUES(1399,'synth',1);
+INSERT INTO "remix_tag" VALUES(1400,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1400,'synth',1);
+INSERT INTO "remix_tag" VALUES(1400,'trance',1);
+INSERT INTO "remix_tag" VALUES(1400,'world',1);
+INSERT INTO "remix_tag" VALUES(1401,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1401,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1401,'piano',1);
+INSERT INTO "remix_tag" VALUES(1401,'solo',1);
+INSERT INTO "remix_tag" VALUES(1401,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(1402,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1402,'piano',1);
+INSERT INTO "remix_tag" VALUES(1402,'pop',1);
+INSERT INTO "remix_tag" VALUES(1402,'synth',1);
+INSERT INTO "remix_tag" VALUES(1403,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1403,'strings',1);
+INSERT INTO "remix_tag" VALUES(1404,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1404,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1404,'piano',1);
+INSERT INTO "remix_tag" VALUES(1404,'pop',1);
+INSERT INTO "remix_tag" VALUES(1404,'singing',1);
+INSERT INTO "remix_tag" VALUES(1404,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1405,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1405,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1406,'classical',1);
+INSERT INTO "remix_tag" VALUES(1406,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1407,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1407,'rock',1);
+INSERT INTO "remix_tag" VALUES(1407,'synth',1);
+INSERT INTO "remix_tag" VALUES(1408,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1408,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1409,'mediterranean',1);
+INSERT INTO "remix_tag" VALUES(1409,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1409,'strings',1);
+INSERT INTO "remix_tag" VALUES(1409,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1409,'world',1);
+INSERT INTO "remix_tag" VALUES(1410,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1410,'synth',1);
+INSERT INTO "remix_tag" VALUES(1411,'collab',1);
+INSERT INTO "remix_tag" VALUES(1411,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1411,'piano',1);
+INSERT INTO "remix_tag" VALUES(1411,'synth',1);
+INSERT INTO "remix_tag" VALUES(1412,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1412,'dark',1);
+INSERT INTO "remix_tag" VALUES(1412,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1412,'piano',1);
+INSERT INTO "remix_tag" VALUES(1413,'classical',1);
+INSERT INTO "remix_tag" VALUES(1413,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1413,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1413,'piano',1);
+INSERT INTO "remix_tag" VALUES(1414,'piano',1);
+INSERT INTO "remix_tag" VALUES(1414,'solo',1);
+INSERT INTO "remix_tag" VALUES(1415,'brass',1);
+INSERT INTO "remix_tag" VALUES(1415,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1415,'strings',1);
+INSERT INTO "remix_tag" VALUES(1416,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1416,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1416,'synth',1);
+INSERT INTO "remix_tag" VALUES(1416,'trance',1);
+INSERT INTO "remix_tag" VALUES(1417,'collab',1);
+INSERT INTO "remix_tag" VALUES(1417,'piano',1);
+INSERT INTO "remix_tag" VALUES(1417,'solo',1);
+INSERT INTO "remix_tag" VALUES(1418,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1418,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1418,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1418,'synth',1);
+INSERT INTO "remix_tag" VALUES(1419,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1419,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1419,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1419,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1419,'synth',1);
+INSERT INTO "remix_tag" VALUES(1419,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1419,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1420,'dark',1);
+INSERT INTO "remix_tag" VALUES(1420,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1420,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1420,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1420,'rock',1);
+INSERT INTO "remix_tag" VALUES(1420,'synth',1);
+INSERT INTO "remix_tag" VALUES(1421,'classical',1);
+INSERT INTO "remix_tag" VALUES(1421,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1421,'strings',1);
+INSERT INTO "remix_tag" VALUES(1421,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1422,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1422,'latin',1);
+INSERT INTO "remix_tag" VALUES(1422,'piano',1);
+INSERT INTO "remix_tag" VALUES(1422,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1423,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1423,'synth',1);
+INSERT INTO "remix_tag" VALUES(1423,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1423,'trance',1);
+INSERT INTO "remix_tag" VALUES(1423,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1424,'collab',1);
+INSERT INTO "remix_tag" VALUES(1424,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1424,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1424,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1424,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1424,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1424,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1424,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1425,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1425,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1425,'synth',1);
+INSERT INTO "remix_tag" VALUES(1425,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1426,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1426,'synth',1);
+INSERT INTO "remix_tag" VALUES(1427,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1427,'folk',1);
+INSERT INTO "remix_tag" VALUES(1427,'happy',1);
+INSERT INTO "remix_tag" VALUES(1427,'strings',1);
+INSERT INTO "remix_tag" VALUES(1428,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1428,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1428,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1429,'collab',1);
+INSERT INTO "remix_tag" VALUES(1429,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1429,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1429,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1429,'piano',1);
+INSERT INTO "remix_tag" VALUES(1429,'strings',1);
+INSERT INTO "remix_tag" VALUES(1430,'piano',1);
+INSERT INTO "remix_tag" VALUES(1430,'solo',1);
+INSERT INTO "remix_tag" VALUES(1431,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1431,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1431,'collab',1);
+INSERT INTO "remix_tag" VALUES(1431,'dark',1);
+INSERT INTO "remix_tag" VALUES(1431,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1431,'piano',1);
+INSERT INTO "remix_tag" VALUES(1431,'strings',1);
+INSERT INTO "remix_tag" VALUES(1432,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1432,'pop',1);
+INSERT INTO "remix_tag" VALUES(1432,'synth',1);
+INSERT INTO "remix_tag" VALUES(1433,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1433,'collab',1);
+INSERT INTO "remix_tag" VALUES(1433,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1433,'piano',1);
+INSERT INTO "remix_tag" VALUES(1433,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1433,'strings',1);
+INSERT INTO "remix_tag" VALUES(1434,'piano',1);
+INSERT INTO "remix_tag" VALUES(1434,'solo',1);
+INSERT INTO "remix_tag" VALUES(1435,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1435,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1435,'rock',1);
+INSERT INTO "remix_tag" VALUES(1435,'singing',1);
+INSERT INTO "remix_tag" VALUES(1435,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1436,'funk',1);
+INSERT INTO "remix_tag" VALUES(1436,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1436,'synth',1);
+INSERT INTO "remix_tag" VALUES(1437,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1437,'synth',1);
+INSERT INTO "remix_tag" VALUES(1438,'classical',1);
+INSERT INTO "remix_tag" VALUES(1438,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1438,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1438,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1439,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1439,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1439,'synth',1);
+INSERT INTO "remix_tag" VALUES(1440,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1440,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1440,'synth',1);
+INSERT INTO "remix_tag" VALUES(1441,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1441,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1441,'synth',1);
+INSERT INTO "remix_tag" VALUES(1441,'trance',1);
+INSERT INTO "remix_tag" VALUES(1442,'classical',1);
+INSERT INTO "remix_tag" VALUES(1442,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1443,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1443,'pop',1);
+INSERT INTO "remix_tag" VALUES(1443,'strings',1);
+INSERT INTO "remix_tag" VALUES(1443,'synth',1);
+INSERT INTO "remix_tag" VALUES(1444,'classical',1);
+INSERT INTO "remix_tag" VALUES(1444,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1445,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1445,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1445,'rock',1);
+INSERT INTO "remix_tag" VALUES(1445,'synth',1);
+INSERT INTO "remix_tag" VALUES(1446,'collab',1);
+INSERT INTO "remix_tag" VALUES(1446,'piano',1);
+INSERT INTO "remix_tag" VALUES(1446,'pop',1);
+INSERT INTO "remix_tag" VALUES(1446,'strings',1);
+INSERT INTO "remix_tag" VALUES(1447,'classical',1);
+INSERT INTO "remix_tag" VALUES(1447,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1447,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1447,'piano',1);
+INSERT INTO "remix_tag" VALUES(1447,'strings',1);
+INSERT INTO "remix_tag" VALUES(1448,'funk',1);
+INSERT INTO "remix_tag" VALUES(1448,'piano',1);
+INSERT INTO "remix_tag" VALUES(1448,'pop',1);
+INSERT INTO "remix_tag" VALUES(1448,'synth',1);
+INSERT INTO "remix_tag" VALUES(1449,'rock',1);
+INSERT INTO "remix_tag" VALUES(1449,'synth',1);
+INSERT INTO "remix_tag" VALUES(1450,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1450,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1450,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1450,'piano',1);
+INSERT INTO "remix_tag" VALUES(1450,'synth',1);
+INSERT INTO "remix_tag" VALUES(1451,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1451,'pop',1);
+INSERT INTO "remix_tag" VALUES(1451,'rock',1);
+INSERT INTO "remix_tag" VALUES(1451,'synth',1);
+INSERT INTO "remix_tag" VALUES(1452,'classical',1);
+INSERT INTO "remix_tag" VALUES(1452,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1452,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1452,'piano',1);
+INSERT INTO "remix_tag" VALUES(1452,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1452,'sad',1);
+INSERT INTO "remix_tag" VALUES(1452,'strings',1);
+INSERT INTO "remix_tag" VALUES(1452,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1453,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1453,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1453,'synth',1);
+INSERT INTO "remix_tag" VALUES(1454,'piano',1);
+INSERT INTO "remix_tag" VALUES(1454,'solo',1);
+INSERT INTO "remix_tag" VALUES(1455,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1455,'collab',1);
+INSERT INTO "remix_tag" VALUES(1455,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1455,'folk',1);
+INSERT INTO "remix_tag" VALUES(1455,'happy',1);
+INSERT INTO "remix_tag" VALUES(1455,'piano',1);
+INSERT INTO "remix_tag" VALUES(1455,'pop',1);
+INSERT INTO "remix_tag" VALUES(1455,'strings',1);
+INSERT INTO "remix_tag" VALUES(1455,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1455,'world',1);
+INSERT INTO "remix_tag" VALUES(1456,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1456,'piano',1);
+INSERT INTO "remix_tag" VALUES(1456,'synth',1);
+INSERT INTO "remix_tag" VALUES(1457,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1457,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1457,'piano',1);
+INSERT INTO "remix_tag" VALUES(1457,'rock',1);
+INSERT INTO "remix_tag" VALUES(1458,'collab',1);
+INSERT INTO "remix_tag" VALUES(1458,'duet',1);
+INSERT INTO "remix_tag" VALUES(1458,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1458,'piano',1);
+INSERT INTO "remix_tag" VALUES(1458,'singing',1);
+INSERT INTO "remix_tag" VALUES(1458,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1459,'classical',1);
+INSERT INTO "remix_tag" VALUES(1459,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1459,'piano',1);
+INSERT INTO "remix_tag" VALUES(1459,'sad',1);
+INSERT INTO "remix_tag" VALUES(1460,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1460,'funk',1);
+INSERT INTO "remix_tag" VALUES(1460,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1460,'strings',1);
+INSERT INTO "remix_tag" VALUES(1461,'collab',1);
+INSERT INTO "remix_tag" VALUES(1461,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1461,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1461,'strings',1);
+INSERT INTO "remix_tag" VALUES(1461,'synth',1);
+INSERT INTO "remix_tag" VALUES(1462,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1462,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1462,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1462,'strings',1);
+INSERT INTO "remix_tag" VALUES(1462,'synth',1);
+INSERT INTO "remix_tag" VALUES(1463,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1463,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1463,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1464,'collab',1);
+INSERT INTO "remix_tag" VALUES(1464,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1464,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1464,'strings',1);
+INSERT INTO "remix_tag" VALUES(1464,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1465,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1465,'collab',1);
+INSERT INTO "remix_tag" VALUES(1465,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1465,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1465,'pop',1);
+INSERT INTO "remix_tag" VALUES(1465,'singing',1);
+INSERT INTO "remix_tag" VALUES(1465,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1465,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1465,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1466,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1466,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1466,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1466,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(1466,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1466,'solo',1);
+INSERT INTO "remix_tag" VALUES(1467,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1467,'rock',1);
+INSERT INTO "remix_tag" VALUES(1468,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1468,'rock',1);
+INSERT INTO "remix_tag" VALUES(1468,'synth',1);
+INSERT INTO "remix_tag" VALUES(1469,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1469,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1469,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1469,'synth',1);
+INSERT INTO "remix_tag" VALUES(1470,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1470,'piano',1);
+INSERT INTO "remix_tag" VALUES(1470,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1470,'synth',1);
+INSERT INTO "remix_tag" VALUES(1471,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1471,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1471,'synth',1);
+INSERT INTO "remix_tag" VALUES(1472,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1472,'synth',1);
+INSERT INTO "remix_tag" VALUES(1473,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1473,'piano',1);
+INSERT INTO "remix_tag" VALUES(1473,'strings',1);
+INSERT INTO "remix_tag" VALUES(1473,'synth',1);
+INSERT INTO "remix_tag" VALUES(1474,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1474,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1474,'strings',1);
+INSERT INTO "remix_tag" VALUES(1475,'compo',1);
+INSERT INTO "remix_tag" VALUES(1475,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1475,'synth',1);
+INSERT INTO "remix_tag" VALUES(1476,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1476,'happy',1);
+INSERT INTO "remix_tag" VALUES(1476,'synth',1);
+INSERT INTO "remix_tag" VALUES(1476,'world',1);
+INSERT INTO "remix_tag" VALUES(1477,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1477,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1477,'piano',1);
+INSERT INTO "remix_tag" VALUES(1477,'strings',1);
+INSERT INTO "remix_tag" VALUES(1477,'synth',1);
+INSERT INTO "remix_tag" VALUES(1478,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1478,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1478,'synth',1);
+INSERT INTO "remix_tag" VALUES(1479,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1479,'bells',1);
+INSERT INTO "remix_tag" VALUES(1479,'brass',1);
+INSERT INTO "remix_tag" VALUES(1479,'native-american',1);
+INSERT INTO "remix_tag" VALUES(1480,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1480,'koto',1);
+INSERT INTO "remix_tag" VALUES(1480,'strings',1);
+INSERT INTO "remix_tag" VALUES(1480,'synth',1);
+INSERT INTO "remix_tag" VALUES(1480,'world',1);
+INSERT INTO "remix_tag" VALUES(1481,'chill',1);
+INSERT INTO "remix_tag" VALUES(1481,'dark',1);
+INSERT INTO "remix_tag" VALUES(1481,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1481,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1481,'singing',1);
+INSERT INTO "remix_tag" VALUES(1481,'synth',1);
+INSERT INTO "remix_tag" VALUES(1481,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1482,'rock',1);
+INSERT INTO "remix_tag" VALUES(1482,'synth',1);
+INSERT INTO "remix_tag" VALUES(1483,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1483,'piano',1);
+INSERT INTO "remix_tag" VALUES(1483,'solo',1);
+INSERT INTO "remix_tag" VALUES(1484,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1484,'pop',1);
+INSERT INTO "remix_tag" VALUES(1484,'synth',1);
+INSERT INTO "remix_tag" VALUES(1485,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1485,'synth',1);
+INSERT INTO "remix_tag" VALUES(1486,'bells',1);
+INSERT INTO "remix_tag" VALUES(1486,'brass',1);
+INSERT INTO "remix_tag" VALUES(1486,'choir',1);
+INSERT INTO "remix_tag" VALUES(1486,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1486,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1486,'rock',1);
+INSERT INTO "remix_tag" VALUES(1487,'piano',1);
+INSERT INTO "remix_tag" VALUES(1487,'solo',1);
+INSERT INTO "remix_tag" VALUES(1488,'classical',1);
+INSERT INTO "remix_tag" VALUES(1488,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1489,'classical',1);
+INSERT INTO "remix_tag" VALUES(1489,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1489,'piano',1);
+INSERT INTO "remix_tag" VALUES(1490,'synth',1);
+INSERT INTO "remix_tag" VALUES(1491,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1491,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1491,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1491,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(1491,'piano',1);
+INSERT INTO "remix_tag" VALUES(1491,'synth',1);
+INSERT INTO "remix_tag" VALUES(1492,'collab',1);
+INSERT INTO "remix_tag" VALUES(1492,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1492,'piano',1);
+INSERT INTO "remix_tag" VALUES(1492,'rock',1);
+INSERT INTO "remix_tag" VALUES(1492,'synth',1);
+INSERT INTO "remix_tag" VALUES(1493,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1493,'organ',1);
+INSERT INTO "remix_tag" VALUES(1493,'rock',1);
+INSERT INTO "remix_tag" VALUES(1494,'piano',1);
+INSERT INTO "remix_tag" VALUES(1494,'solo',1);
+INSERT INTO "remix_tag" VALUES(1495,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1495,'collab',1);
+INSERT INTO "remix_tag" VALUES(1495,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1495,'folk',1);
+INSERT INTO "remix_tag" VALUES(1495,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(1495,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1495,'singing',1);
+INSERT INTO "remix_tag" VALUES(1495,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1496,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1496,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1496,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1496,'rock',1);
+INSERT INTO "remix_tag" VALUES(1496,'singing',1);
+INSERT INTO "remix_tag" VALUES(1496,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1496,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1497,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1497,'rock',1);
+INSERT INTO "remix_tag" VALUES(1497,'synth',1);
+INSERT INTO "remix_tag" VALUES(1498,'chill',1);
+INSERT INTO "remix_tag" VALUES(1498,'collab',1);
+INSERT INTO "remix_tag" VALUES(1498,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1498,'piano',1);
+INSERT INTO "remix_tag" VALUES(1498,'synth',1);
+INSERT INTO "remix_tag" VALUES(1499,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1499,'synth',1);
+INSERT INTO "remix_tag" VALUES(1500,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1500,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1500,'koto',1);
+INSERT INTO "remix_tag" VALUES(1500,'synth',1);
+INSERT INTO "remix_tag" VALUES(1500,'violin',1);
+INSERT INTO "remix_tag" VALUES(1500,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1501,'classical',1);
+INSERT INTO "remix_tag" VALUES(1501,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1502,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1502,'synth',1);
+INSERT INTO "remix_tag" VALUES(1503,'classical',1);
+INSERT INTO "remix_tag" VALUES(1503,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1503,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1504,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1504,'pop',1);
+INSERT INTO "remix_tag" VALUES(1504,'synth',1);
+INSERT INTO "remix_tag" VALUES(1505,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1505,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1505,'piano',1);
+INSERT INTO "remix_tag" VALUES(1505,'world',1);
+INSERT INTO "remix_tag" VALUES(1506,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1506,'rock',1);
+INSERT INTO "remix_tag" VALUES(1507,'chill',1);
+INSERT INTO "remix_tag" VALUES(1507,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1507,'piano',1);
+INSERT INTO "remix_tag" VALUES(1507,'strings',1);
+INSERT INTO "remix_tag" VALUES(1507,'synth',1);
+INSERT INTO "remix_tag" VALUES(1507,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1508,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1508,'piano',1);
+INSERT INTO "remix_tag" VALUES(1508,'rock',1);
+INSERT INTO "remix_tag" VALUES(1509,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1509,'piano',1);
+INSERT INTO "remix_tag" VALUES(1509,'solo',1);
+INSERT INTO "remix_tag" VALUES(1510,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1510,'synth',1);
+INSERT INTO "remix_tag" VALUES(1511,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1511,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1511,'synth',1);
+INSERT INTO "remix_tag" VALUES(1512,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1512,'energetic',1);
+INSERT INTO "remix_tag" VALUES(1512,'synth',1);
+INSERT INTO "remix_tag" VALUES(1512,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1512,'trance',1);
+INSERT INTO "remix_tag" VALUES(1512,'workout',1);
+INSERT INTO "remix_tag" VALUES(1513,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1513,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1513,'piano',1);
+INSERT INTO "remix_tag" VALUES(1513,'synth',1);
+INSERT INTO "remix_tag" VALUES(1513,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1514,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1514,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1514,'rock',1);
+INSERT INTO "remix_tag" VALUES(1514,'synth',1);
+INSERT INTO "remix_tag" VALUES(1515,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1515,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1515,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1515,'medley',1);
+INSERT INTO "remix_tag" VALUES(1515,'rock',1);
+INSERT INTO "remix_tag" VALUES(1516,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1516,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1517,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1517,'piano',1);
+INSERT INTO "remix_tag" VALUES(1517,'pop',1);
+INSERT INTO "remix_tag" VALUES(1518,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1518,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1518,'solo',1);
+INSERT INTO "remix_tag" VALUES(1519,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1519,'chill',1);
+INSERT INTO "remix_tag" VALUES(1519,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1519,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1519,'synth',1);
+INSERT INTO "remix_tag" VALUES(1520,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1520,'synth',1);
+INSERT INTO "remix_tag" VALUES(1520,'trance',1);
+INSERT INTO "remix_tag" VALUES(1521,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1521,'piano',1);
+INSERT INTO "remix_tag" VALUES(1521,'singing',1);
+INSERT INTO "remix_tag" VALUES(1521,'strings',1);
+INSERT INTO "remix_tag" VALUES(1521,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1522,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1522,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1522,'rock',1);
+INSERT INTO "remix_tag" VALUES(1522,'synth',1);
+INSERT INTO "remix_tag" VALUES(1523,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1523,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1523,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1523,'synth',1);
+INSERT INTO "remix_tag" VALUES(1524,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1524,'strings',1);
+INSERT INTO "remix_tag" VALUES(1524,'synth',1);
+INSERT INTO "remix_tag" VALUES(1524,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1525,'classical',1);
+INSERT INTO "remix_tag" VALUES(1525,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1526,'funk',1);
+INSERT INTO "remix_tag" VALUES(1526,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1526,'piano',1);
+INSERT INTO "remix_tag" VALUES(1526,'pop',1);
+INSERT INTO "remix_tag" VALUES(1526,'singing',1);
+INSERT INTO "remix_tag" VALUES(1526,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1527,'brass',1);
+INSERT INTO "remix_tag" VALUES(1527,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1527,'funk',1);
+INSERT INTO "remix_tag" VALUES(1527,'rock',1);
+INSERT INTO "remix_tag" VALUES(1527,'synth',1);
+INSERT INTO "remix_tag" VALUES(1528,'collab',1);
+INSERT INTO "remix_tag" VALUES(1528,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1528,'rock',1);
+INSERT INTO "remix_tag" VALUES(1528,'synth',1);
+INSERT INTO "remix_tag" VALUES(1529,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1529,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1529,'piano',1);
+INSERT INTO "remix_tag" VALUES(1529,'synth',1);
+INSERT INTO "remix_tag" VALUES(1530,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1530,'piano',1);
+INSERT INTO "remix_tag" VALUES(1531,'classical',1);
+INSERT INTO "remix_tag" VALUES(1531,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1532,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1532,'synth',1);
+INSERT INTO "remix_tag" VALUES(1532,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1532,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1533,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1533,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1533,'synth',1);
+INSERT INTO "remix_tag" VALUES(1534,'classical',1);
+INSERT INTO "remix_tag" VALUES(1534,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1534,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1535,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1535,'pop',1);
+INSERT INTO "remix_tag" VALUES(1535,'synth',1);
+INSERT INTO "remix_tag" VALUES(1536,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1536,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1536,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1536,'synth',1);
+INSERT INTO "remix_tag" VALUES(1536,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1537,'ballad',1);
+INSERT INTO "remix_tag" VALUES(1537,'chill',1);
+INSERT INTO "remix_tag" VALUES(1537,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1537,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1537,'singing',1);
+INSERT INTO "remix_tag" VALUES(1537,'synth',1);
+INSERT INTO "remix_tag" VALUES(1537,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1538,'piano',1);
+INSERT INTO "remix_tag" VALUES(1538,'solo',1);
+INSERT INTO "remix_tag" VALUES(1539,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1539,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1539,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1539,'synth',1);
+INSERT INTO "remix_tag" VALUES(1540,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1540,'piano',1);
+INSERT INTO "remix_tag" VALUES(1540,'strings',1);
+INSERT INTO "remix_tag" VALUES(1541,'brass',1);
+INSERT INTO "remix_tag" VALUES(1541,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1541,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1541,'strings',1);
+INSERT INTO "remix_tag" VALUES(1541,'synth',1);
+INSERT INTO "remix_tag" VALUES(1542,'dark',1);
+INSERT INTO "remix_tag" VALUES(1542,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1542,'piano',1);
+INSERT INTO "remix_tag" VALUES(1542,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(1543,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1543,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1543,'piano',1);
+INSERT INTO "remix_tag" VALUES(1544,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1544,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1544,'synth',1);
+INSERT INTO "remix_tag" VALUES(1545,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1545,'piano',1);
+INSERT INTO "remix_tag" VALUES(1545,'pop',1);
+INSERT INTO "remix_tag" VALUES(1545,'singing',1);
+INSERT INTO "remix_tag" VALUES(1545,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1545,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1546,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1546,'chill',1);
+INSERT INTO "remix_tag" VALUES(1546,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1546,'piano',1);
+INSERT INTO "remix_tag" VALUES(1546,'synth',1);
+INSERT INTO "remix_tag" VALUES(1547,'chill',1);
+INSERT INTO "remix_tag" VALUES(1547,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1547,'funk',1);
+INSERT INTO "remix_tag" VALUES(1547,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1547,'synth',1);
+INSERT INTO "remix_tag" VALUES(1548,'chill',1);
+INSERT INTO "remix_tag" VALUES(1548,'piano',1);
+INSERT INTO "remix_tag" VALUES(1548,'pop',1);
+INSERT INTO "remix_tag" VALUES(1549,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1549,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1549,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1549,'piano',1);
+INSERT INTO "remix_tag" VALUES(1549,'strings',1);
+INSERT INTO "remix_tag" VALUES(1549,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1550,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1550,'piano',1);
+INSERT INTO "remix_tag" VALUES(1550,'pop',1);
+INSERT INTO "remix_tag" VALUES(1550,'strings',1);
+INSERT INTO "remix_tag" VALUES(1551,'piano',1);
+INSERT INTO "remix_tag" VALUES(1551,'solo',1);
+INSERT INTO "remix_tag" VALUES(1552,'chill',1);
+INSERT INTO "remix_tag" VALUES(1552,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1552,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1552,'pop',1);
+INSERT INTO "remix_tag" VALUES(1552,'singing',1);
+INSERT INTO "remix_tag" VALUES(1552,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1553,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1553,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1553,'piano',1);
+INSERT INTO "remix_tag" VALUES(1554,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1554,'synth',1);
+INSERT INTO "remix_tag" VALUES(1555,'chill',1);
+INSERT INTO "remix_tag" VALUES(1555,'piano',1);
+INSERT INTO "remix_tag" VALUES(1555,'pop',1);
+INSERT INTO "remix_tag" VALUES(1555,'synth',1);
+INSERT INTO "remix_tag" VALUES(1556,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1556,'funk',1);
+INSERT INTO "remix_tag" VALUES(1556,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1556,'synth',1);
+INSERT INTO "remix_tag" VALUES(1557,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1557,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1557,'strings',1);
+INSERT INTO "remix_tag" VALUES(1557,'synth',1);
+INSERT INTO "remix_tag" VALUES(1558,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1558,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1558,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1558,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1558,'organ',1);
+INSERT INTO "remix_tag" VALUES(1558,'synth',1);
+INSERT INTO "remix_tag" VALUES(1559,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1559,'collab',1);
+INSERT INTO "remix_tag" VALUES(1559,'piano',1);
+INSERT INTO "remix_tag" VALUES(1559,'pop',1);
+INSERT INTO "remix_tag" VALUES(1559,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1560,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1560,'piano',1);
+INSERT INTO "remix_tag" VALUES(1560,'pop',1);
+INSERT INTO "remix_tag" VALUES(1560,'rock',1);
+INSERT INTO "remix_tag" VALUES(1561,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1561,'pop',1);
+INSERT INTO "remix_tag" VALUES(1561,'synth',1);
+INSERT INTO "remix_tag" VALUES(1562,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1562,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1562,'synth',1);
+INSERT INTO "remix_tag" VALUES(1563,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1563,'dark',1);
+INSERT INTO "remix_tag" VALUES(1563,'piano',1);
+INSERT INTO "remix_tag" VALUES(1563,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1563,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1564,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1564,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(1564,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1564,'happy',1);
+INSERT INTO "remix_tag" VALUES(1564,'piano',1);
+INSERT INTO "remix_tag" VALUES(1564,'synth',1);
+INSERT INTO "remix_tag" VALUES(1565,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1565,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1565,'funk',1);
+INSERT INTO "remix_tag" VALUES(1565,'pop',1);
+INSERT INTO "remix_tag" VALUES(1565,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1565,'synth',1);
+INSERT INTO "remix_tag" VALUES(1566,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1566,'synth',1);
+INSERT INTO "remix_tag" VALUES(1566,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1566,'world',1);
+INSERT INTO "remix_tag" VALUES(1567,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1567,'collab',1);
+INSERT INTO "remix_tag" VALUES(1567,'dark',1);
+INSERT INTO "remix_tag" VALUES(1567,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1567,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1567,'piano',1);
+INSERT INTO "remix_tag" VALUES(1567,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1567,'singing',1);
+INSERT INTO "remix_tag" VALUES(1567,'spooky',1);
+INSERT INTO "remix_tag" VALUES(1567,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1568,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1568,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1568,'glitching',1);
+INSERT INTO "remix_tag" VALUES(1568,'piano',1);
+INSERT INTO "remix_tag" VALUES(1568,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1568,'synth',1);
+INSERT INTO "remix_tag" VALUES(1569,'classical',1);
+INSERT INTO "remix_tag" VALUES(1569,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1569,'strings',1);
+INSERT INTO "remix_tag" VALUES(1570,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1570,'rock',1);
+INSERT INTO "remix_tag" VALUES(1571,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1571,'synth',1);
+INSERT INTO "remix_tag" VALUES(1572,'chill',1);
+INSERT INTO "remix_tag" VALUES(1572,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1572,'piano',1);
+INSERT INTO "remix_tag" VALUES(1573,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1573,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1573,'piano',1);
+INSERT INTO "remix_tag" VALUES(1573,'pop',1);
+INSERT INTO "remix_tag" VALUES(1573,'rock',1);
+INSERT INTO "remix_tag" VALUES(1573,'singing',1);
+INSERT INTO "remix_tag" VALUES(1573,'synth',1);
+INSERT INTO "remix_tag" VALUES(1573,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1574,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1574,'piano',1);
+INSERT INTO "remix_tag" VALUES(1574,'strings',1);
+INSERT INTO "remix_tag" VALUES(1575,'classical',1);
+INSERT INTO "remix_tag" VALUES(1575,'happy',1);
+INSERT INTO "remix_tag" VALUES(1575,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1575,'piano',1);
+INSERT INTO "remix_tag" VALUES(1575,'strings',1);
+INSERT INTO "remix_tag" VALUES(1575,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1576,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1576,'synth',1);
+INSERT INTO "remix_tag" VALUES(1577,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1577,'synth',1);
+INSERT INTO "remix_tag" VALUES(1578,'collab',1);
+INSERT INTO "remix_tag" VALUES(1578,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1578,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1578,'synth',1);
+INSERT INTO "remix_tag" VALUES(1579,'collab',1);
+INSERT INTO "remix_tag" VALUES(1579,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1579,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1579,'piano',1);
+INSERT INTO "remix_tag" VALUES(1579,'synth',1);
+INSERT INTO "remix_tag" VALUES(1580,'funk',1);
+INSERT INTO "remix_tag" VALUES(1580,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1580,'piano',1);
+INSERT INTO "remix_tag" VALUES(1581,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1581,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1581,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1581,'synth',1);
+INSERT INTO "remix_tag" VALUES(1582,'classical',1);
+INSERT INTO "remix_tag" VALUES(1582,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1582,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1582,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1582,'singing',1);
+INSERT INTO "remix_tag" VALUES(1582,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1583,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1583,'piano',1);
+INSERT INTO "remix_tag" VALUES(1583,'synth',1);
+INSERT INTO "remix_tag" VALUES(1584,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1584,'rock',1);
+INSERT INTO "remix_tag" VALUES(1584,'synth',1);
+INSERT INTO "remix_tag" VALUES(1585,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1585,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1585,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1585,'rock',1);
+INSERT INTO "remix_tag" VALUES(1586,'collab',1);
+INSERT INTO "remix_tag" VALUES(1586,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1586,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1587,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1587,'world',1);
+INSERT INTO "remix_tag" VALUES(1588,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1588,'piano',1);
+INSERT INTO "remix_tag" VALUES(1588,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1588,'synth',1);
+INSERT INTO "remix_tag" VALUES(1588,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1589,'dark',1);
+INSERT INTO "remix_tag" VALUES(1589,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1589,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1589,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1589,'synth',1);
+INSERT INTO "remix_tag" VALUES(1590,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1590,'piano',1);
+INSERT INTO "remix_tag" VALUES(1590,'strings',1);
+INSERT INTO "remix_tag" VALUES(1591,'classical',1);
+INSERT INTO "remix_tag" VALUES(1591,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1592,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1592,'rock',1);
+INSERT INTO "remix_tag" VALUES(1592,'synth',1);
+INSERT INTO "remix_tag" VALUES(1593,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1593,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1593,'funk',1);
+INSERT INTO "remix_tag" VALUES(1593,'rock',1);
+INSERT INTO "remix_tag" VALUES(1594,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1594,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1594,'synth',1);
+INSERT INTO "remix_tag" VALUES(1595,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1595,'rock',1);
+INSERT INTO "remix_tag" VALUES(1596,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1596,'piano',1);
+INSERT INTO "remix_tag" VALUES(1596,'synth',1);
+INSERT INTO "remix_tag" VALUES(1597,'chill',1);
+INSERT INTO "remix_tag" VALUES(1597,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1597,'synth',1);
+INSERT INTO "remix_tag" VALUES(1598,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1598,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1598,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1598,'piano',1);
+INSERT INTO "remix_tag" VALUES(1598,'synth',1);
+INSERT INTO "remix_tag" VALUES(1599,'classical',1);
+INSERT INTO "remix_tag" VALUES(1599,'strings',1);
+INSERT INTO "remix_tag" VALUES(1600,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1600,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1600,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1600,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1600,'synth',1);
+INSERT INTO "remix_tag" VALUES(1600,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1600,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1601,'classical',1);
+INSERT INTO "remix_tag" VALUES(1601,'collab',1);
+INSERT INTO "remix_tag" VALUES(1601,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1601,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1602,'collab',1);
+INSERT INTO "remix_tag" VALUES(1602,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1602,'glitching',1);
+INSERT INTO "remix_tag" VALUES(1602,'strings',1);
+INSERT INTO "remix_tag" VALUES(1602,'synth',1);
+INSERT INTO "remix_tag" VALUES(1603,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1603,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1603,'synth',1);
+INSERT INTO "remix_tag" VALUES(1604,'brass',1);
+INSERT INTO "remix_tag" VALUES(1604,'classical',1);
+INSERT INTO "remix_tag" VALUES(1605,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1605,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1605,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1605,'rock',1);
+INSERT INTO "remix_tag" VALUES(1605,'strings',1);
+INSERT INTO "remix_tag" VALUES(1605,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1605,'world',1);
+INSERT INTO "remix_tag" VALUES(1606,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1606,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1606,'rock',1);
+INSERT INTO "remix_tag" VALUES(1607,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1607,'chill',1);
+INSERT INTO "remix_tag" VALUES(1607,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1607,'piano',1);
+INSERT INTO "remix_tag" VALUES(1607,'synth',1);
+INSERT INTO "remix_tag" VALUES(1608,'classical',1);
+INSERT INTO "remix_tag" VALUES(1608,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1608,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1608,'strings',1);
+INSERT INTO "remix_tag" VALUES(1608,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1609,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1609,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1609,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1609,'synth',1);
+INSERT INTO "remix_tag" VALUES(1610,'piano',1);
+INSERT INTO "remix_tag" VALUES(1610,'solo',1);
+INSERT INTO "remix_tag" VALUES(1611,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1611,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1611,'synth',1);
+INSERT INTO "remix_tag" VALUES(1612,'collab',1);
+INSERT INTO "remix_tag" VALUES(1612,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1612,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1612,'piano',1);
+INSERT INTO "remix_tag" VALUES(1612,'singing',1);
+INSERT INTO "remix_tag" VALUES(1612,'synth',1);
+INSERT INTO "remix_tag" VALUES(1612,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1613,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1613,'funk',1);
+INSERT INTO "remix_tag" VALUES(1613,'piano',1);
+INSERT INTO "remix_tag" VALUES(1613,'rock',1);
+INSERT INTO "remix_tag" VALUES(1614,'collab',1);
+INSERT INTO "remix_tag" VALUES(1614,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1614,'rock',1);
+INSERT INTO "remix_tag" VALUES(1614,'synth',1);
+INSERT INTO "remix_tag" VALUES(1615,'piano',1);
+INSERT INTO "remix_tag" VALUES(1615,'synth',1);
+INSERT INTO "remix_tag" VALUES(1616,'classical',1);
+INSERT INTO "remix_tag" VALUES(1616,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1616,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1617,'cello',1);
+INSERT INTO "remix_tag" VALUES(1617,'chill',1);
+INSERT INTO "remix_tag" VALUES(1617,'collab',1);
+INSERT INTO "remix_tag" VALUES(1617,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1617,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1617,'organ',1);
+INSERT INTO "remix_tag" VALUES(1617,'strings',1);
+INSERT INTO "remix_tag" VALUES(1617,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(1618,'chill',1);
+INSERT INTO "remix_tag" VALUES(1618,'collab',1);
+INSERT INTO "remix_tag" VALUES(1618,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1618,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1618,'piano',1);
+INSERT INTO "remix_tag" VALUES(1618,'synth',1);
+INSERT INTO "remix_tag" VALUES(1619,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1619,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1619,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1619,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1619,'rock',1);
+INSERT INTO "remix_tag" VALUES(1619,'singing',1);
+INSERT INTO "remix_tag" VALUES(1619,'synth',1);
+INSERT INTO "remix_tag" VALUES(1619,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1620,'collab',1);
+INSERT INTO "remix_tag" VALUES(1620,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1620,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1620,'synth',1);
+INSERT INTO "remix_tag" VALUES(1620,'trance',1);
+INSERT INTO "remix_tag" VALUES(1621,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1621,'collab',1);
+INSERT INTO "remix_tag" VALUES(1621,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1621,'synth',1);
+INSERT INTO "remix_tag" VALUES(1622,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1622,'brass',1);
+INSERT INTO "remix_tag" VALUES(1622,'piano',1);
+INSERT INTO "remix_tag" VALUES(1622,'synth',1);
+INSERT INTO "remix_tag" VALUES(1623,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1623,'collab',1);
+INSERT INTO "remix_tag" VALUES(1623,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1623,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1623,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(1623,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1623,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1623,'rock',1);
+INSERT INTO "remix_tag" VALUES(1623,'singing',1);
+INSERT INTO "remix_tag" VALUES(1623,'synth',1);
+INSERT INTO "remix_tag" VALUES(1623,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1623,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1624,'collab',1);
+INSERT INTO "remix_tag" VALUES(1624,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1624,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1624,'funk',1);
+INSERT INTO "remix_tag" VALUES(1624,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1624,'piano',1);
+INSERT INTO "remix_tag" VALUES(1624,'synth',1);
+INSERT INTO "remix_tag" VALUES(1625,'classical',1);
+INSERT INTO "remix_tag" VALUES(1625,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1626,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1626,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1626,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1626,'piano',1);
+INSERT INTO "remix_tag" VALUES(1626,'strings',1);
+INSERT INTO "remix_tag" VALUES(1627,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1627,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1627,'synth',1);
+INSERT INTO "remix_tag" VALUES(1628,'classical',1);
+INSERT INTO "remix_tag" VALUES(1628,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1629,'chill',1);
+INSERT INTO "remix_tag" VALUES(1629,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1629,'synth',1);
+INSERT INTO "remix_tag" VALUES(1629,'world',1);
+INSERT INTO "remix_tag" VALUES(1630,'collab',1);
+INSERT INTO "remix_tag" VALUES(1630,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1630,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1630,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1630,'synth',1);
+INSERT INTO "remix_tag" VALUES(1630,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(1631,'rock',1);
+INSERT INTO "remix_tag" VALUES(1631,'synth',1);
+INSERT INTO "remix_tag" VALUES(1632,'chill',1);
+INSERT INTO "remix_tag" VALUES(1632,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1632,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1632,'piano',1);
+INSERT INTO "remix_tag" VALUES(1632,'synth',1);
+INSERT INTO "remix_tag" VALUES(1633,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1633,'synth',1);
+INSERT INTO "remix_tag" VALUES(1634,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1634,'duet',1);
+INSERT INTO "remix_tag" VALUES(1634,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1635,'piano',1);
+INSERT INTO "remix_tag" VALUES(1635,'solo',1);
+INSERT INTO "remix_tag" VALUES(1636,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1636,'synth',1);
+INSERT INTO "remix_tag" VALUES(1636,'trance',1);
+INSERT INTO "remix_tag" VALUES(1637,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1637,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1638,'piano',1);
+INSERT INTO "remix_tag" VALUES(1638,'synth',1);
+INSERT INTO "remix_tag" VALUES(1638,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1639,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1639,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1639,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1639,'synth',1);
+INSERT INTO "remix_tag" VALUES(1639,'world',1);
+INSERT INTO "remix_tag" VALUES(1640,'collab',1);
+INSERT INTO "remix_tag" VALUES(1640,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1640,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1640,'rock',1);
+INSERT INTO "remix_tag" VALUES(1640,'synth',1);
+INSERT INTO "remix_tag" VALUES(1641,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1641,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1641,'piano',1);
+INSERT INTO "remix_tag" VALUES(1641,'synth',1);
+INSERT INTO "remix_tag" VALUES(1642,'chill',1);
+INSERT INTO "remix_tag" VALUES(1642,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1642,'piano',1);
+INSERT INTO "remix_tag" VALUES(1642,'strings',1);
+INSERT INTO "remix_tag" VALUES(1642,'synth',1);
+INSERT INTO "remix_tag" VALUES(1642,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(1643,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1643,'rock',1);
+INSERT INTO "remix_tag" VALUES(1643,'synth',1);
+INSERT INTO "remix_tag" VALUES(1644,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1644,'happy',1);
+INSERT INTO "remix_tag" VALUES(1644,'synth',1);
+INSERT INTO "remix_tag" VALUES(1644,'world',1);
+INSERT INTO "remix_tag" VALUES(1645,'classical',1);
+INSERT INTO "remix_tag" VALUES(1645,'collab',1);
+INSERT INTO "remix_tag" VALUES(1645,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1645,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(1645,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1645,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1645,'singing',1);
+INSERT INTO "remix_tag" VALUES(1645,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1645,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1646,'collab',1);
+INSERT INTO "remix_tag" VALUES(1646,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1646,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1646,'piano',1);
+INSERT INTO "remix_tag" VALUES(1647,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1647,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1647,'piano',1);
+INSERT INTO "remix_tag" VALUES(1647,'rock',1);
+INSERT INTO "remix_tag" VALUES(1647,'synth',1);
+INSERT INTO "remix_tag" VALUES(1648,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1648,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1648,'synth',1);
+INSERT INTO "remix_tag" VALUES(1649,'collab',1);
+INSERT INTO "remix_tag" VALUES(1649,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1649,'rock',1);
+INSERT INTO "remix_tag" VALUES(1649,'strings',1);
+INSERT INTO "remix_tag" VALUES(1649,'synth',1);
+INSERT INTO "remix_tag" VALUES(1650,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1650,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1650,'strings',1);
+INSERT INTO "remix_tag" VALUES(1650,'synth',1);
+INSERT INTO "remix_tag" VALUES(1651,'dark',1);
+INSERT INTO "remix_tag" VALUES(1651,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1651,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1651,'synth',1);
+INSERT INTO "remix_tag" VALUES(1652,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1652,'synth',1);
+INSERT INTO "remix_tag" VALUES(1653,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1653,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1653,'piano',1);
+INSERT INTO "remix_tag" VALUES(1653,'pop',1);
+INSERT INTO "remix_tag" VALUES(1653,'singing',1);
+INSERT INTO "remix_tag" VALUES(1653,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1654,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1654,'glitching',1);
+INSERT INTO "remix_tag" VALUES(1654,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1654,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1654,'synth',1);
+INSERT INTO "remix_tag" VALUES(1655,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1655,'rock',1);
+INSERT INTO "remix_tag" VALUES(1655,'synth',1);
+INSERT INTO "remix_tag" VALUES(1656,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1656,'rock',1);
+INSERT INTO "remix_tag" VALUES(1656,'synth',1);
+INSERT INTO "remix_tag" VALUES(1657,'collab',1);
+INSERT INTO "remix_tag" VALUES(1657,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1657,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1657,'rock',1);
+INSERT INTO "remix_tag" VALUES(1657,'strings',1);
+INSERT INTO "remix_tag" VALUES(1657,'synth',1);
+INSERT INTO "remix_tag" VALUES(1658,'piano',1);
+INSERT INTO "remix_tag" VALUES(1658,'solo',1);
+INSERT INTO "remix_tag" VALUES(1659,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1659,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1659,'strings',1);
+INSERT INTO "remix_tag" VALUES(1659,'synth',1);
+INSERT INTO "remix_tag" VALUES(1660,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1660,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1660,'synth',1);
+INSERT INTO "remix_tag" VALUES(1661,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1661,'piano',1);
+INSERT INTO "remix_tag" VALUES(1661,'synth',1);
+INSERT INTO "remix_tag" VALUES(1662,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1662,'synth',1);
+INSERT INTO "remix_tag" VALUES(1663,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1663,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1663,'piano',1);
+INSERT INTO "remix_tag" VALUES(1663,'sad',1);
+INSERT INTO "remix_tag" VALUES(1663,'synth',1);
+INSERT INTO "remix_tag" VALUES(1663,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1664,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1664,'synth',1);
+INSERT INTO "remix_tag" VALUES(1664,'trance',1);
+INSERT INTO "remix_tag" VALUES(1665,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1665,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1665,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1665,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(1665,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1665,'pop',1);
+INSERT INTO "remix_tag" VALUES(1665,'rock',1);
+INSERT INTO "remix_tag" VALUES(1665,'singing',1);
+INSERT INTO "remix_tag" VALUES(1665,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1666,'classical',1);
+INSERT INTO "remix_tag" VALUES(1666,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1666,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1667,'dark',1);
+INSERT INTO "remix_tag" VALUES(1667,'dub',1);
+INSERT INTO "remix_tag" VALUES(1667,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1667,'funky',1);
+INSERT INTO "remix_tag" VALUES(1667,'synth',1);
+INSERT INTO "remix_tag" VALUES(1668,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1668,'rock',1);
+INSERT INTO "remix_tag" VALUES(1668,'synth',1);
+INSERT INTO "remix_tag" VALUES(1669,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1669,'piano',1);
+INSERT INTO "remix_tag" VALUES(1669,'strings',1);
+INSERT INTO "remix_tag" VALUES(1670,'chill',1);
+INSERT INTO "remix_tag" VALUES(1670,'collab',1);
+INSERT INTO "remix_tag" VALUES(1670,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1670,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1670,'piano',1);
+INSERT INTO "remix_tag" VALUES(1670,'synth',1);
+INSERT INTO "remix_tag" VALUES(1671,'chill',1);
+INSERT INTO "remix_tag" VALUES(1671,'synth',1);
+INSERT INTO "remix_tag" VALUES(1671,'world',1);
+INSERT INTO "remix_tag" VALUES(1672,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1672,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1672,'piano',1);
+INSERT INTO "remix_tag" VALUES(1672,'pop',1);
+INSERT INTO "remix_tag" VALUES(1672,'singing',1);
+INSERT INTO "remix_tag" VALUES(1672,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1672,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(1673,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1673,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1673,'synth',1);
+INSERT INTO "remix_tag" VALUES(1674,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1674,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1674,'rock',1);
+INSERT INTO "remix_tag" VALUES(1675,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1675,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1676,'chill',1);
+INSERT INTO "remix_tag" VALUES(1676,'collab',1);
+INSERT INTO "remix_tag" VALUES(1676,'funk',1);
+INSERT INTO "remix_tag" VALUES(1676,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1676,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1676,'synth',1);
+INSERT INTO "remix_tag" VALUES(1677,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1677,'funk',1);
+INSERT INTO "remix_tag" VALUES(1677,'synth',1);
+INSERT INTO "remix_tag" VALUES(1678,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1678,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1678,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1678,'pop',1);
+INSERT INTO "remix_tag" VALUES(1678,'singing',1);
+INSERT INTO "remix_tag" VALUES(1678,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1678,'world',1);
+INSERT INTO "remix_tag" VALUES(1679,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1679,'rock',1);
+INSERT INTO "remix_tag" VALUES(1679,'synth',1);
+INSERT INTO "remix_tag" VALUES(1680,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1680,'synth',1);
+INSERT INTO "remix_tag" VALUES(1680,'trance',1);
+INSERT INTO "remix_tag" VALUES(1681,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1681,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1681,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1682,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1682,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1683,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1683,'strings',1);
+INSERT INTO "remix_tag" VALUES(1683,'synth',1);
+INSERT INTO "remix_tag" VALUES(1684,'pop',1);
+INSERT INTO "remix_tag" VALUES(1684,'synth',1);
+INSERT INTO "remix_tag" VALUES(1684,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1685,'compo',1);
+INSERT INTO "remix_tag" VALUES(1685,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1685,'funk',1);
+INSERT INTO "remix_tag" VALUES(1685,'synth',1);
+INSERT INTO "remix_tag" VALUES(1686,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1686,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1686,'rock',1);
+INSERT INTO "remix_tag" VALUES(1686,'synth',1);
+INSERT INTO "remix_tag" VALUES(1687,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1687,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1687,'rock',1);
+INSERT INTO "remix_tag" VALUES(1687,'singing',1);
+INSERT INTO "remix_tag" VALUES(1687,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1687,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(1688,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1688,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1688,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1688,'synth',1);
+INSERT INTO "remix_tag" VALUES(1689,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1689,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1689,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1690,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1690,'synth',1);
+INSERT INTO "remix_tag" VALUES(1690,'world',1);
+INSERT INTO "remix_tag" VALUES(1691,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1691,'synth',1);
+INSERT INTO "remix_tag" VALUES(1691,'world',1);
+INSERT INTO "remix_tag" VALUES(1692,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1692,'piano',1);
+INSERT INTO "remix_tag" VALUES(1692,'rock',1);
+INSERT INTO "remix_tag" VALUES(1692,'synth',1);
+INSERT INTO "remix_tag" VALUES(1693,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1693,'dark',1);
+INSERT INTO "remix_tag" VALUES(1693,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1693,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1693,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1693,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1693,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1694,'collab',1);
+INSERT INTO "remix_tag" VALUES(1694,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1694,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1694,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1694,'synth',1);
+INSERT INTO "remix_tag" VALUES(1694,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1695,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1695,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1695,'strings',1);
+INSERT INTO "remix_tag" VALUES(1695,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1695,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1696,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1696,'rock',1);
+INSERT INTO "remix_tag" VALUES(1696,'synth',1);
+INSERT INTO "remix_tag" VALUES(1697,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1697,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1697,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1697,'piano',1);
+INSERT INTO "remix_tag" VALUES(1697,'solo',1);
+INSERT INTO "remix_tag" VALUES(1697,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1698,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(1698,'disco',1);
+INSERT INTO "remix_tag" VALUES(1698,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1698,'funk',1);
+INSERT INTO "remix_tag" VALUES(1698,'funky',1);
+INSERT INTO "remix_tag" VALUES(1698,'organ',1);
+INSERT INTO "remix_tag" VALUES(1698,'synth',1);
+INSERT INTO "remix_tag" VALUES(1698,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1699,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1699,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1699,'synth',1);
+INSERT INTO "remix_tag" VALUES(1700,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1700,'piano',1);
+INSERT INTO "remix_tag" VALUES(1700,'pop',1);
+INSERT INTO "remix_tag" VALUES(1700,'strings',1);
+INSERT INTO "remix_tag" VALUES(1700,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1700,'world',1);
+INSERT INTO "remix_tag" VALUES(1701,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1701,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1701,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1701,'synth',1);
+INSERT INTO "remix_tag" VALUES(1702,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1702,'collab',1);
+INSERT INTO "remix_tag" VALUES(1702,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1702,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1702,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1702,'rock',1);
+INSERT INTO "remix_tag" VALUES(1702,'synth',1);
+INSERT INTO "remix_tag" VALUES(1703,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1703,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1703,'synth',1);
+INSERT INTO "remix_tag" VALUES(1704,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1704,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1704,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1705,'piano',1);
+INSERT INTO "remix_tag" VALUES(1705,'solo',1);
+INSERT INTO "remix_tag" VALUES(1706,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1706,'collab',1);
+INSERT INTO "remix_tag" VALUES(1706,'happy',1);
+INSERT INTO "remix_tag" VALUES(1706,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1706,'piano',1);
+INSERT INTO "remix_tag" VALUES(1706,'pop',1);
+INSERT INTO "remix_tag" VALUES(1707,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1707,'rock',1);
+INSERT INTO "remix_tag" VALUES(1708,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1708,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1708,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1708,'piano',1);
+INSERT INTO "remix_tag" VALUES(1708,'pop',1);
+INSERT INTO "remix_tag" VALUES(1708,'rock',1);
+INSERT INTO "remix_tag" VALUES(1708,'synth',1);
+INSERT INTO "remix_tag" VALUES(1709,'dark',1);
+INSERT INTO "remix_tag" VALUES(1709,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1709,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1709,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1709,'synth',1);
+INSERT INTO "remix_tag" VALUES(1710,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1710,'funk',1);
+INSERT INTO "remix_tag" VALUES(1710,'synth',1);
+INSERT INTO "remix_tag" VALUES(1711,'duet',1);
+INSERT INTO "remix_tag" VALUES(1711,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1711,'piano',1);
+INSERT INTO "remix_tag" VALUES(1712,'collab',1);
+INSERT INTO "remix_tag" VALUES(1712,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1712,'rock',1);
+INSERT INTO "remix_tag" VALUES(1712,'synth',1);
+INSERT INTO "remix_tag" VALUES(1713,'brass',1);
+INSERT INTO "remix_tag" VALUES(1713,'collab',1);
+INSERT INTO "remix_tag" VALUES(1713,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1713,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1713,'piano',1);
+INSERT INTO "remix_tag" VALUES(1713,'rock',1);
+INSERT INTO "remix_tag" VALUES(1713,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1714,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1714,'synth',1);
+INSERT INTO "remix_tag" VALUES(1715,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1715,'synth',1);
+INSERT INTO "remix_tag" VALUES(1716,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1716,'chill',1);
+INSERT INTO "remix_tag" VALUES(1716,'collab',1);
+INSERT INTO "remix_tag" VALUES(1716,'synth',1);
+INSERT INTO "remix_tag" VALUES(1717,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1717,'rock',1);
+INSERT INTO "remix_tag" VALUES(1717,'synth',1);
+INSERT INTO "remix_tag" VALUES(1718,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1718,'piano',1);
+INSERT INTO "remix_tag" VALUES(1719,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1719,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1719,'strings',1);
+INSERT INTO "remix_tag" VALUES(1719,'synth',1);
+INSERT INTO "remix_tag" VALUES(1720,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1720,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1720,'strings',1);
+INSERT INTO "remix_tag" VALUES(1720,'synth',1);
+INSERT INTO "remix_tag" VALUES(1720,'world',1);
+INSERT INTO "remix_tag" VALUES(1721,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1721,'happy',1);
+INSERT INTO "remix_tag" VALUES(1721,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1721,'piano',1);
+INSERT INTO "remix_tag" VALUES(1722,'collab',1);
+INSERT INTO "remix_tag" VALUES(1722,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1722,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1722,'piano',1);
+INSERT INTO "remix_tag" VALUES(1722,'synth',1);
+INSERT INTO "remix_tag" VALUES(1723,'collab',1);
+INSERT INTO "remix_tag" VALUES(1723,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1723,'piano',1);
+INSERT INTO "remix_tag" VALUES(1723,'rock',1);
+INSERT INTO "remix_tag" VALUES(1723,'synth',1);
+INSERT INTO "remix_tag" VALUES(1724,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1724,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1724,'rock',1);
+INSERT INTO "remix_tag" VALUES(1725,'piano',1);
+INSERT INTO "remix_tag" VALUES(1725,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1725,'sad',1);
+INSERT INTO "remix_tag" VALUES(1725,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1726,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1726,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1726,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1726,'synth',1);
+INSERT INTO "remix_tag" VALUES(1727,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1727,'piano',1);
+INSERT INTO "remix_tag" VALUES(1727,'synth',1);
+INSERT INTO "remix_tag" VALUES(1728,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1728,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1728,'synth',1);
+INSERT INTO "remix_tag" VALUES(1728,'world',1);
+INSERT INTO "remix_tag" VALUES(1729,'collab',1);
+INSERT INTO "remix_tag" VALUES(1729,'piano',1);
+INSERT INTO "remix_tag" VALUES(1729,'strings',1);
+INSERT INTO "remix_tag" VALUES(1729,'synth',1);
+INSERT INTO "remix_tag" VALUES(1730,'collab',1);
+INSERT INTO "remix_tag" VALUES(1730,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1730,'rock',1);
+INSERT INTO "remix_tag" VALUES(1730,'synth',1);
+INSERT INTO "remix_tag" VALUES(1731,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1731,'piano',1);
+INSERT INTO "remix_tag" VALUES(1731,'synth',1);
+INSERT INTO "remix_tag" VALUES(1731,'trance',1);
+INSERT INTO "remix_tag" VALUES(1732,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1732,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1732,'latin',1);
+INSERT INTO "remix_tag" VALUES(1732,'synth',1);
+INSERT INTO "remix_tag" VALUES(1733,'collab',1);
+INSERT INTO "remix_tag" VALUES(1733,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1733,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1733,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1733,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1733,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1733,'piano',1);
+INSERT INTO "remix_tag" VALUES(1733,'synth',1);
+INSERT INTO "remix_tag" VALUES(1734,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1734,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1734,'piano',1);
+INSERT INTO "remix_tag" VALUES(1734,'synth',1);
+INSERT INTO "remix_tag" VALUES(1735,'funk',1);
+INSERT INTO "remix_tag" VALUES(1735,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1735,'synth',1);
+INSERT INTO "remix_tag" VALUES(1735,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1736,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1736,'rock',1);
+INSERT INTO "remix_tag" VALUES(1736,'synth',1);
+INSERT INTO "remix_tag" VALUES(1737,'classical',1);
+INSERT INTO "remix_tag" VALUES(1737,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(1737,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1737,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1738,'chill',1);
+INSERT INTO "remix_tag" VALUES(1738,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1738,'latin',1);
+INSERT INTO "remix_tag" VALUES(1738,'piano',1);
+INSERT INTO "remix_tag" VALUES(1738,'synth',1);
+INSERT INTO "remix_tag" VALUES(1739,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1739,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1739,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1739,'singing',1);
+INSERT INTO "remix_tag" VALUES(1739,'synth',1);
+INSERT INTO "remix_tag" VALUES(1739,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1740,'bells',1);
+INSERT INTO "remix_tag" VALUES(1740,'cello',1);
+INSERT INTO "remix_tag" VALUES(1740,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1740,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1740,'strings',1);
+INSERT INTO "remix_tag" VALUES(1740,'waltz',1);
+INSERT INTO "remix_tag" VALUES(1741,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1741,'rock',1);
+INSERT INTO "remix_tag" VALUES(1742,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1742,'piano',1);
+INSERT INTO "remix_tag" VALUES(1743,'dark',1);
+INSERT INTO "remix_tag" VALUES(1743,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1743,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1743,'synth',1);
+INSERT INTO "remix_tag" VALUES(1744,'classical',1);
+INSERT INTO "remix_tag" VALUES(1744,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1745,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1745,'rock',1);
+INSERT INTO "remix_tag" VALUES(1745,'synth',1);
+INSERT INTO "remix_tag" VALUES(1746,'duet',1);
+INSERT INTO "remix_tag" VALUES(1746,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1746,'piano',1);
+INSERT INTO "remix_tag" VALUES(1747,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1747,'synth',1);
+INSERT INTO "remix_tag" VALUES(1748,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1748,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1748,'solo',1);
+INSERT INTO "remix_tag" VALUES(1749,'dark',1);
+INSERT INTO "remix_tag" VALUES(1749,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1749,'synth',1);
+INSERT INTO "remix_tag" VALUES(1750,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1750,'chill',1);
+INSERT INTO "remix_tag" VALUES(1750,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1750,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1750,'piano',1);
+INSERT INTO "remix_tag" VALUES(1750,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1751,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1751,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1751,'piano',1);
+INSERT INTO "remix_tag" VALUES(1751,'pop',1);
+INSERT INTO "remix_tag" VALUES(1751,'synth',1);
+INSERT INTO "remix_tag" VALUES(1752,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(1752,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1752,'cello',1);
+INSERT INTO "remix_tag" VALUES(1752,'chill',1);
+INSERT INTO "remix_tag" VALUES(1752,'compo',1);
+INSERT INTO "remix_tag" VALUES(1752,'dark',1);
+INSERT INTO "remix_tag" VALUES(1752,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(1752,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1752,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(1752,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1752,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1752,'sad',1);
+INSERT INTO "remix_tag" VALUES(1752,'solemn',1);
+INSERT INTO "remix_tag" VALUES(1752,'strings',1);
+INSERT INTO "remix_tag" VALUES(1752,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(1752,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(1753,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1753,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1753,'synth',1);
+INSERT INTO "remix_tag" VALUES(1754,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1754,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1754,'piano',1);
+INSERT INTO "remix_tag" VALUES(1754,'synth',1);
+INSERT INTO "remix_tag" VALUES(1755,'chill',1);
+INSERT INTO "remix_tag" VALUES(1755,'collab',1);
+INSERT INTO "remix_tag" VALUES(1755,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1755,'synth',1);
+INSERT INTO "remix_tag" VALUES(1756,'classical',1);
+INSERT INTO "remix_tag" VALUES(1756,'compo',1);
+INSERT INTO "remix_tag" VALUES(1756,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1757,'collab',1);
+INSERT INTO "remix_tag" VALUES(1757,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1757,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1757,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1757,'singing',1);
+INSERT INTO "remix_tag" VALUES(1757,'synth',1);
+INSERT INTO "remix_tag" VALUES(1757,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1758,'chill',1);
+INSERT INTO "remix_tag" VALUES(1758,'collab',1);
+INSERT INTO "remix_tag" VALUES(1758,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1758,'rock',1);
+INSERT INTO "remix_tag" VALUES(1759,'chill',1);
+INSERT INTO "remix_tag" VALUES(1759,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1759,'piano',1);
+INSERT INTO "remix_tag" VALUES(1759,'synth',1);
+INSERT INTO "remix_tag" VALUES(1760,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1760,'synth',1);
+INSERT INTO "remix_tag" VALUES(1761,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1761,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1761,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1762,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1762,'funk',1);
+INSERT INTO "remix_tag" VALUES(1762,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1762,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1762,'strings',1);
+INSERT INTO "remix_tag" VALUES(1763,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1763,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1763,'piano',1);
+INSERT INTO "remix_tag" VALUES(1763,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1763,'sad',1);
+INSERT INTO "remix_tag" VALUES(1764,'funk',1);
+INSERT INTO "remix_tag" VALUES(1764,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1764,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1764,'synth',1);
+INSERT INTO "remix_tag" VALUES(1765,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1765,'piano',1);
+INSERT INTO "remix_tag" VALUES(1765,'pop',1);
+INSERT INTO "remix_tag" VALUES(1765,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1766,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1766,'funk',1);
+INSERT INTO "remix_tag" VALUES(1766,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1766,'synth',1);
+INSERT INTO "remix_tag" VALUES(1767,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1767,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1767,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1767,'synth',1);
+INSERT INTO "remix_tag" VALUES(1767,'trance',1);
+INSERT INTO "remix_tag" VALUES(1768,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1768,'funk',1);
+INSERT INTO "remix_tag" VALUES(1768,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1768,'synth',1);
+INSERT INTO "remix_tag" VALUES(1769,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1769,'piano',1);
+INSERT INTO "remix_tag" VALUES(1769,'synth',1);
+INSERT INTO "remix_tag" VALUES(1770,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1770,'funk',1);
+INSERT INTO "remix_tag" VALUES(1770,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1771,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1771,'rock',1);
+INSERT INTO "remix_tag" VALUES(1771,'synth',1);
+INSERT INTO "remix_tag" VALUES(1772,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1772,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1772,'dark',1);
+INSERT INTO "remix_tag" VALUES(1772,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1772,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1773,'collab',1);
+INSERT INTO "remix_tag" VALUES(1773,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1773,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1773,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1773,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1773,'rock',1);
+INSERT INTO "remix_tag" VALUES(1773,'strings',1);
+INSERT INTO "remix_tag" VALUES(1773,'synth',1);
+INSERT INTO "remix_tag" VALUES(1774,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1774,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1774,'piano',1);
+INSERT INTO "remix_tag" VALUES(1775,'chill',1);
+INSERT INTO "remix_tag" VALUES(1775,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1775,'funk',1);
+INSERT INTO "remix_tag" VALUES(1776,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1776,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1776,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1776,'latin',1);
+INSERT INTO "remix_tag" VALUES(1776,'synth',1);
+INSERT INTO "remix_tag" VALUES(1777,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1777,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1778,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1778,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1778,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1778,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1779,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1779,'happy',1);
+INSERT INTO "remix_tag" VALUES(1779,'synth',1);
+INSERT INTO "remix_tag" VALUES(1780,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1780,'happy',1);
+INSERT INTO "remix_tag" VALUES(1780,'synth',1);
+INSERT INTO "remix_tag" VALUES(1781,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1781,'piano',1);
+INSERT INTO "remix_tag" VALUES(1781,'solo',1);
+INSERT INTO "remix_tag" VALUES(1782,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1782,'funk',1);
+INSERT INTO "remix_tag" VALUES(1782,'japanese',1);
+INSERT INTO "remix_tag" VALUES(1782,'synth',1);
+INSERT INTO "remix_tag" VALUES(1783,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1783,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1783,'rock',1);
+INSERT INTO "remix_tag" VALUES(1784,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1784,'collab',1);
+INSERT INTO "remix_tag" VALUES(1784,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1784,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1784,'rock',1);
+INSERT INTO "remix_tag" VALUES(1784,'synth',1);
+INSERT INTO "remix_tag" VALUES(1785,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1785,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1785,'strings',1);
+INSERT INTO "remix_tag" VALUES(1785,'synth',1);
+INSERT INTO "remix_tag" VALUES(1786,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1786,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1786,'synth',1);
+INSERT INTO "remix_tag" VALUES(1787,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1787,'collab',1);
+INSERT INTO "remix_tag" VALUES(1787,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1787,'rock',1);
+INSERT INTO "remix_tag" VALUES(1787,'synth',1);
+INSERT INTO "remix_tag" VALUES(1788,'dark',1);
+INSERT INTO "remix_tag" VALUES(1788,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1788,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1788,'piano',1);
+INSERT INTO "remix_tag" VALUES(1788,'synth',1);
+INSERT INTO "remix_tag" VALUES(1788,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1788,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1789,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1789,'synth',1);
+INSERT INTO "remix_tag" VALUES(1789,'trance',1);
+INSERT INTO "remix_tag" VALUES(1790,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1790,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1790,'piano',1);
+INSERT INTO "remix_tag" VALUES(1790,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1791,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1791,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1791,'rock',1);
+INSERT INTO "remix_tag" VALUES(1791,'synth',1);
+INSERT INTO "remix_tag" VALUES(1792,'brass',1);
+INSERT INTO "remix_tag" VALUES(1792,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(1792,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1792,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1792,'piano',1);
+INSERT INTO "remix_tag" VALUES(1792,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(1793,'brass',1);
+INSERT INTO "remix_tag" VALUES(1793,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1793,'funk',1);
+INSERT INTO "remix_tag" VALUES(1793,'latin',1);
+INSERT INTO "remix_tag" VALUES(1794,'funk',1);
+INSERT INTO "remix_tag" VALUES(1794,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1794,'synth',1);
+INSERT INTO "remix_tag" VALUES(1795,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1795,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1795,'rock',1);
+INSERT INTO "remix_tag" VALUES(1795,'synth',1);
+INSERT INTO "remix_tag" VALUES(1796,'dark',1);
+INSERT INTO "remix_tag" VALUES(1796,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1796,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1796,'rock',1);
+INSERT INTO "remix_tag" VALUES(1797,'duet',1);
+INSERT INTO "remix_tag" VALUES(1797,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1797,'piano',1);
+INSERT INTO "remix_tag" VALUES(1798,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1798,'synth',1);
+INSERT INTO "remix_tag" VALUES(1798,'trance',1);
+INSERT INTO "remix_tag" VALUES(1799,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1800,'dark',1);
+INSERT INTO "remix_tag" VALUES(1800,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1800,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1800,'synth',1);
+INSERT INTO "remix_tag" VALUES(1800,'trance',1);
+INSERT INTO "remix_tag" VALUES(1801,'collab',1);
+INSERT INTO "remix_tag" VALUES(1801,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1801,'piano',1);
+INSERT INTO "remix_tag" VALUES(1801,'synth',1);
+INSERT INTO "remix_tag" VALUES(1802,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1802,'synth',1);
+INSERT INTO "remix_tag" VALUES(1803,'dark',1);
+INSERT INTO "remix_tag" VALUES(1803,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1803,'synth',1);
+INSERT INTO "remix_tag" VALUES(1804,'classical',1);
+INSERT INTO "remix_tag" VALUES(1804,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1805,'piano',1);
+INSERT INTO "remix_tag" VALUES(1805,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1805,'rock',1);
+INSERT INTO "remix_tag" VALUES(1805,'synth',1);
+INSERT INTO "remix_tag" VALUES(1806,'collab',1);
+INSERT INTO "remix_tag" VALUES(1806,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1806,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1806,'singing',1);
+INSERT INTO "remix_tag" VALUES(1806,'synth',1);
+INSERT INTO "remix_tag" VALUES(1806,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1807,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1807,'piano',1);
+INSERT INTO "remix_tag" VALUES(1807,'strings',1);
+INSERT INTO "remix_tag" VALUES(1807,'synth',1);
+INSERT INTO "remix_tag" VALUES(1808,'dark',1);
+INSERT INTO "remix_tag" VALUES(1808,'piano',1);
+INSERT INTO "remix_tag" VALUES(1809,'classical',1);
+INSERT INTO "remix_tag" VALUES(1809,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1809,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1810,'collab',1);
+INSERT INTO "remix_tag" VALUES(1810,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1810,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1810,'rock',1);
+INSERT INTO "remix_tag" VALUES(1810,'synth',1);
+INSERT INTO "remix_tag" VALUES(1811,'collab',1);
+INSERT INTO "remix_tag" VALUES(1811,'funk',1);
+INSERT INTO "remix_tag" VALUES(1811,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1811,'piano',1);
+INSERT INTO "remix_tag" VALUES(1811,'synth',1);
+INSERT INTO "remix_tag" VALUES(1812,'collab',1);
+INSERT INTO "remix_tag" VALUES(1812,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1812,'piano',1);
+INSERT INTO "remix_tag" VALUES(1812,'rock',1);
+INSERT INTO "remix_tag" VALUES(1812,'synth',1);
+INSERT INTO "remix_tag" VALUES(1813,'collab',1);
+INSERT INTO "remix_tag" VALUES(1813,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1813,'rock',1);
+INSERT INTO "remix_tag" VALUES(1814,'collab',1);
+INSERT INTO "remix_tag" VALUES(1814,'duet',1);
+INSERT INTO "remix_tag" VALUES(1814,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1814,'piano',1);
+INSERT INTO "remix_tag" VALUES(1814,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1815,'classical',1);
+INSERT INTO "remix_tag" VALUES(1815,'collab',1);
+INSERT INTO "remix_tag" VALUES(1815,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1815,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1815,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1815,'rock',1);
+INSERT INTO "remix_tag" VALUES(1815,'sad',1);
+INSERT INTO "remix_tag" VALUES(1816,'brass',1);
+INSERT INTO "remix_tag" VALUES(1816,'collab',1);
+INSERT INTO "remix_tag" VALUES(1816,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1816,'rock',1);
+INSERT INTO "remix_tag" VALUES(1817,'brass',1);
+INSERT INTO "remix_tag" VALUES(1817,'collab',1);
+INSERT INTO "remix_tag" VALUES(1817,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1817,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1818,'chill',1);
+INSERT INTO "remix_tag" VALUES(1818,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1818,'synth',1);
+INSERT INTO "remix_tag" VALUES(1819,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1820,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1820,'synth',1);
+INSERT INTO "remix_tag" VALUES(1820,'trance',1);
+INSERT INTO "remix_tag" VALUES(1821,'angry',1);
+INSERT INTO "remix_tag" VALUES(1821,'dark',1);
+INSERT INTO "remix_tag" VALUES(1821,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1821,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1821,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1821,'singing',1);
+INSERT INTO "remix_tag" VALUES(1821,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1822,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1822,'synth',1);
+INSERT INTO "remix_tag" VALUES(1823,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1823,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1823,'piano',1);
+INSERT INTO "remix_tag" VALUES(1823,'rock',1);
+INSERT INTO "remix_tag" VALUES(1824,'dark',1);
+INSERT INTO "remix_tag" VALUES(1824,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1824,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1824,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1824,'rock',1);
+INSERT INTO "remix_tag" VALUES(1824,'singing',1);
+INSERT INTO "remix_tag" VALUES(1824,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1824,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1825,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1825,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1825,'rock',1);
+INSERT INTO "remix_tag" VALUES(1825,'synth',1);
+INSERT INTO "remix_tag" VALUES(1826,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1826,'rock',1);
+INSERT INTO "remix_tag" VALUES(1827,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1827,'rock',1);
+INSERT INTO "remix_tag" VALUES(1827,'strings',1);
+INSERT INTO "remix_tag" VALUES(1827,'synth',1);
+INSERT INTO "remix_tag" VALUES(1828,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1828,'synth',1);
+INSERT INTO "remix_tag" VALUES(1829,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1829,'synth',1);
+INSERT INTO "remix_tag" VALUES(1829,'world',1);
+INSERT INTO "remix_tag" VALUES(1830,'collab',1);
+INSERT INTO "remix_tag" VALUES(1830,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1830,'rock',1);
+INSERT INTO "remix_tag" VALUES(1830,'synth',1);
+INSERT INTO "remix_tag" VALUES(1831,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1831,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1831,'synth',1);
+INSERT INTO "remix_tag" VALUES(1832,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(1832,'chinese',1);
+INSERT INTO "remix_tag" VALUES(1832,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1832,'synth',1);
+INSERT INTO "remix_tag" VALUES(1832,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1833,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1833,'rock',1);
+INSERT INTO "remix_tag" VALUES(1833,'synth',1);
+INSERT INTO "remix_tag" VALUES(1834,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1834,'synth',1);
+INSERT INTO "remix_tag" VALUES(1835,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1835,'synth',1);
+INSERT INTO "remix_tag" VALUES(1835,'trance',1);
+INSERT INTO "remix_tag" VALUES(1836,'collab',1);
+INSERT INTO "remix_tag" VALUES(1836,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1836,'rock',1);
+INSERT INTO "remix_tag" VALUES(1836,'synth',1);
+INSERT INTO "remix_tag" VALUES(1837,'brass',1);
+INSERT INTO "remix_tag" VALUES(1837,'classical',1);
+INSERT INTO "remix_tag" VALUES(1837,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1837,'strings',1);
+INSERT INTO "remix_tag" VALUES(1837,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1838,'classical',1);
+INSERT INTO "remix_tag" VALUES(1838,'latin',1);
+INSERT INTO "remix_tag" VALUES(1838,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1838,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1838,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1838,'strings',1);
+INSERT INTO "remix_tag" VALUES(1838,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1839,'piano',1);
+INSERT INTO "remix_tag" VALUES(1839,'solo',1);
+INSERT INTO "remix_tag" VALUES(1840,'rock',1);
+INSERT INTO "remix_tag" VALUES(1840,'synth',1);
+INSERT INTO "remix_tag" VALUES(1841,'collab',1);
+INSERT INTO "remix_tag" VALUES(1841,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1841,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1841,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1841,'synth',1);
+INSERT INTO "remix_tag" VALUES(1842,'collab',1);
+INSERT INTO "remix_tag" VALUES(1842,'dark',1);
+INSERT INTO "remix_tag" VALUES(1842,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1842,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1842,'synth',1);
+INSERT INTO "remix_tag" VALUES(1843,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1843,'collab',1);
+INSERT INTO "remix_tag" VALUES(1843,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1843,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1843,'rock',1);
+INSERT INTO "remix_tag" VALUES(1843,'singing',1);
+INSERT INTO "remix_tag" VALUES(1843,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1843,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1843,'world',1);
+INSERT INTO "remix_tag" VALUES(1845,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1845,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1846,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1846,'chill',1);
+INSERT INTO "remix_tag" VALUES(1846,'dark',1);
+INSERT INTO "remix_tag" VALUES(1846,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1847,'brass',1);
+INSERT INTO "remix_tag" VALUES(1847,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1847,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1847,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1847,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1847,'swing',1);
+INSERT INTO "remix_tag" VALUES(1847,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1848,'brass',1);
+INSERT INTO "remix_tag" VALUES(1848,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1848,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1848,'strings',1);
+INSERT INTO "remix_tag" VALUES(1848,'world',1);
+INSERT INTO "remix_tag" VALUES(1849,'chill',1);
+INSERT INTO "remix_tag" VALUES(1849,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1849,'piano',1);
+INSERT INTO "remix_tag" VALUES(1849,'synth',1);
+INSERT INTO "remix_tag" VALUES(1850,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1850,'rock',1);
+INSERT INTO "remix_tag" VALUES(1850,'synth',1);
+INSERT INTO "remix_tag" VALUES(1851,'classical',1);
+INSERT INTO "remix_tag" VALUES(1851,'collab',1);
+INSERT INTO "remix_tag" VALUES(1851,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1851,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1851,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1851,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1851,'strings',1);
+INSERT INTO "remix_tag" VALUES(1851,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1851,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1852,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1852,'chill',1);
+INSERT INTO "remix_tag" VALUES(1852,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1853,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1853,'chill',1);
+INSERT INTO "remix_tag" VALUES(1853,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1853,'glitching',1);
+INSERT INTO "remix_tag" VALUES(1854,'classical',1);
+INSERT INTO "remix_tag" VALUES(1854,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1854,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1855,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1855,'distortion',1);
+INSERT INTO "remix_tag" VALUES(1855,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1855,'glitching',1);
+INSERT INTO "remix_tag" VALUES(1855,'synth',1);
+INSERT INTO "remix_tag" VALUES(1856,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(1856,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1856,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1856,'strings',1);
+INSERT INTO "remix_tag" VALUES(1857,'brass',1);
+INSERT INTO "remix_tag" VALUES(1857,'classical',1);
+INSERT INTO "remix_tag" VALUES(1857,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1857,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1857,'strings',1);
+INSERT INTO "remix_tag" VALUES(1857,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1858,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1858,'funk',1);
+INSERT INTO "remix_tag" VALUES(1858,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1858,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1858,'rock',1);
+INSERT INTO "remix_tag" VALUES(1858,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1859,'folk',1);
+INSERT INTO "remix_tag" VALUES(1859,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1859,'singing',1);
+INSERT INTO "remix_tag" VALUES(1859,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1859,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1860,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1860,'chill',1);
+INSERT INTO "remix_tag" VALUES(1860,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1860,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1861,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1861,'strings',1);
+INSERT INTO "remix_tag" VALUES(1861,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1862,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1862,'synth',1);
+INSERT INTO "remix_tag" VALUES(1863,'piano',1);
+INSERT INTO "remix_tag" VALUES(1863,'solo',1);
+INSERT INTO "remix_tag" VALUES(1864,'collab',1);
+INSERT INTO "remix_tag" VALUES(1864,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1864,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1864,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1864,'rock',1);
+INSERT INTO "remix_tag" VALUES(1865,'angry',1);
+INSERT INTO "remix_tag" VALUES(1865,'dark',1);
+INSERT INTO "remix_tag" VALUES(1865,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1865,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1865,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1865,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1865,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1865,'singing',1);
+INSERT INTO "remix_tag" VALUES(1865,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1866,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1866,'collab',1);
+INSERT INTO "remix_tag" VALUES(1866,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1866,'happy',1);
+INSERT INTO "remix_tag" VALUES(1866,'synth',1);
+INSERT INTO "remix_tag" VALUES(1867,'classical',1);
+INSERT INTO "remix_tag" VALUES(1867,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1867,'strings',1);
+INSERT INTO "remix_tag" VALUES(1867,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1868,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1868,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1868,'synth',1);
+INSERT INTO "remix_tag" VALUES(1869,'piano',1);
+INSERT INTO "remix_tag" VALUES(1869,'solo',1);
+INSERT INTO "remix_tag" VALUES(1870,'happy',1);
+INSERT INTO "remix_tag" VALUES(1870,'piano',1);
+INSERT INTO "remix_tag" VALUES(1870,'synth',1);
+INSERT INTO "remix_tag" VALUES(1871,'angry',1);
+INSERT INTO "remix_tag" VALUES(1871,'dark',1);
+INSERT INTO "remix_tag" VALUES(1871,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1871,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1871,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1871,'rock',1);
+INSERT INTO "remix_tag" VALUES(1871,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1872,'dark',1);
+INSERT INTO "remix_tag" VALUES(1872,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1872,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1872,'strings',1);
+INSERT INTO "remix_tag" VALUES(1872,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1873,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1873,'synth',1);
+INSERT INTO "remix_tag" VALUES(1874,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1874,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1874,'rock',1);
+INSERT INTO "remix_tag" VALUES(1874,'synth',1);
+INSERT INTO "remix_tag" VALUES(1875,'collab',1);
+INSERT INTO "remix_tag" VALUES(1875,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1875,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(1875,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1875,'rock',1);
+INSERT INTO "remix_tag" VALUES(1875,'synth',1);
+INSERT INTO "remix_tag" VALUES(1875,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1875,'world',1);
+INSERT INTO "remix_tag" VALUES(1876,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1876,'synth',1);
+INSERT INTO "remix_tag" VALUES(1876,'trance',1);
+INSERT INTO "remix_tag" VALUES(1877,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1877,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1877,'strings',1);
+INSERT INTO "remix_tag" VALUES(1877,'synth',1);
+INSERT INTO "remix_tag" VALUES(1878,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1878,'synth',1);
+INSERT INTO "remix_tag" VALUES(1879,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1879,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1879,'quirky',1);
+INSERT INTO "remix_tag" VALUES(1879,'rock',1);
+INSERT INTO "remix_tag" VALUES(1879,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1880,'collab',1);
+INSERT INTO "remix_tag" VALUES(1880,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1880,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1880,'singing',1);
+INSERT INTO "remix_tag" VALUES(1880,'synth',1);
+INSERT INTO "remix_tag" VALUES(1880,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1881,'classical',1);
+INSERT INTO "remix_tag" VALUES(1881,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1881,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1881,'strings',1);
+INSERT INTO "remix_tag" VALUES(1881,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1882,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1882,'duet',1);
+INSERT INTO "remix_tag" VALUES(1883,'chill',1);
+INSERT INTO "remix_tag" VALUES(1883,'dark',1);
+INSERT INTO "remix_tag" VALUES(1883,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1883,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1884,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1884,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1884,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1884,'rock',1);
+INSERT INTO "remix_tag" VALUES(1884,'strings',1);
+INSERT INTO "remix_tag" VALUES(1885,'chill',1);
+INSERT INTO "remix_tag" VALUES(1885,'collab',1);
+INSERT INTO "remix_tag" VALUES(1885,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1885,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1885,'world',1);
+INSERT INTO "remix_tag" VALUES(1886,'classical',1);
+INSERT INTO "remix_tag" VALUES(1886,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1886,'strings',1);
+INSERT INTO "remix_tag" VALUES(1887,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1887,'chill',1);
+INSERT INTO "remix_tag" VALUES(1887,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1888,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1888,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1888,'synth',1);
+INSERT INTO "remix_tag" VALUES(1888,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(1889,'classical',1);
+INSERT INTO "remix_tag" VALUES(1889,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1889,'strings',1);
+INSERT INTO "remix_tag" VALUES(1890,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1890,'chill',1);
+INSERT INTO "remix_tag" VALUES(1890,'classical',1);
+INSERT INTO "remix_tag" VALUES(1890,'dark',1);
+INSERT INTO "remix_tag" VALUES(1890,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1891,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1891,'synth',1);
+INSERT INTO "remix_tag" VALUES(1892,'collab',1);
+INSERT INTO "remix_tag" VALUES(1892,'dark',1);
+INSERT INTO "remix_tag" VALUES(1892,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1892,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1892,'singing',1);
+INSERT INTO "remix_tag" VALUES(1892,'synth',1);
+INSERT INTO "remix_tag" VALUES(1892,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1893,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1893,'rock',1);
+INSERT INTO "remix_tag" VALUES(1894,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1894,'dark',1);
+INSERT INTO "remix_tag" VALUES(1894,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1894,'halloween',1);
+INSERT INTO "remix_tag" VALUES(1894,'industrial',1);
+INSERT INTO "remix_tag" VALUES(1894,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(1894,'synth',1);
+INSERT INTO "remix_tag" VALUES(1895,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1895,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1895,'synth',1);
+INSERT INTO "remix_tag" VALUES(1896,'collab',1);
+INSERT INTO "remix_tag" VALUES(1896,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1896,'piano',1);
+INSERT INTO "remix_tag" VALUES(1896,'synth',1);
+INSERT INTO "remix_tag" VALUES(1897,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1897,'synth',1);
+INSERT INTO "remix_tag" VALUES(1898,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1898,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1898,'synth',1);
+INSERT INTO "remix_tag" VALUES(1899,'collab',1);
+INSERT INTO "remix_tag" VALUES(1899,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1899,'synth',1);
+INSERT INTO "remix_tag" VALUES(1900,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1900,'synth',1);
+INSERT INTO "remix_tag" VALUES(1901,'brass',1);
+INSERT INTO "remix_tag" VALUES(1901,'classical',1);
+INSERT INTO "remix_tag" VALUES(1901,'compo',1);
+INSERT INTO "remix_tag" VALUES(1901,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1901,'strings',1);
+INSERT INTO "remix_tag" VALUES(1901,'synth',1);
+INSERT INTO "remix_tag" VALUES(1902,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1902,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1902,'synth',1);
+INSERT INTO "remix_tag" VALUES(1903,'classical',1);
+INSERT INTO "remix_tag" VALUES(1903,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1903,'strings',1);
+INSERT INTO "remix_tag" VALUES(1904,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1904,'energetic',1);
+INSERT INTO "remix_tag" VALUES(1904,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(1904,'organ',1);
+INSERT INTO "remix_tag" VALUES(1904,'rock',1);
+INSERT INTO "remix_tag" VALUES(1904,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1904,'workout',1);
+INSERT INTO "remix_tag" VALUES(1905,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1905,'duet',1);
+INSERT INTO "remix_tag" VALUES(1905,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1905,'piano',1);
+INSERT INTO "remix_tag" VALUES(1906,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1906,'rock',1);
+INSERT INTO "remix_tag" VALUES(1906,'synth',1);
+INSERT INTO "remix_tag" VALUES(1907,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1907,'synth',1);
+INSERT INTO "remix_tag" VALUES(1908,'chill',1);
+INSERT INTO "remix_tag" VALUES(1908,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1908,'synth',1);
+INSERT INTO "remix_tag" VALUES(1909,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1909,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1909,'strings',1);
+INSERT INTO "remix_tag" VALUES(1909,'synth',1);
+INSERT INTO "remix_tag" VALUES(1910,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1910,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1910,'synth',1);
+INSERT INTO "remix_tag" VALUES(1911,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1912,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1912,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1912,'synth',1);
+INSERT INTO "remix_tag" VALUES(1913,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1913,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1913,'rock',1);
+INSERT INTO "remix_tag" VALUES(1914,'chill',1);
+INSERT INTO "remix_tag" VALUES(1914,'collab',1);
+INSERT INTO "remix_tag" VALUES(1914,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1914,'synth',1);
+INSERT INTO "remix_tag" VALUES(1915,'dark',1);
+INSERT INTO "remix_tag" VALUES(1915,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1915,'synth',1);
+INSERT INTO "remix_tag" VALUES(1916,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1916,'synth',1);
+INSERT INTO "remix_tag" VALUES(1917,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1917,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1917,'happy',1);
+INSERT INTO "remix_tag" VALUES(1917,'synth',1);
+INSERT INTO "remix_tag" VALUES(1918,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1918,'synth',1);
+INSERT INTO "remix_tag" VALUES(1918,'world',1);
+INSERT INTO "remix_tag" VALUES(1919,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(1919,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1919,'folk',1);
+INSERT INTO "remix_tag" VALUES(1919,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1919,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1919,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(1920,'dark',1);
+INSERT INTO "remix_tag" VALUES(1920,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1920,'synth',1);
+INSERT INTO "remix_tag" VALUES(1921,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1921,'violin',1);
+INSERT INTO "remix_tag" VALUES(1921,'world',1);
+INSERT INTO "remix_tag" VALUES(1922,'collab',1);
+INSERT INTO "remix_tag" VALUES(1922,'dark',1);
+INSERT INTO "remix_tag" VALUES(1922,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1923,'collab',1);
+INSERT INTO "remix_tag" VALUES(1923,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1923,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(1923,'sexy',1);
+INSERT INTO "remix_tag" VALUES(1924,'brass',1);
+INSERT INTO "remix_tag" VALUES(1924,'funk',1);
+INSERT INTO "remix_tag" VALUES(1924,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1924,'piano',1);
+INSERT INTO "remix_tag" VALUES(1924,'swing',1);
+INSERT INTO "remix_tag" VALUES(1925,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1925,'happy',1);
+INSERT INTO "remix_tag" VALUES(1925,'synth',1);
+INSERT INTO "remix_tag" VALUES(1926,'brass',1);
+INSERT INTO "remix_tag" VALUES(1926,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1926,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1926,'funk',1);
+INSERT INTO "remix_tag" VALUES(1926,'rock',1);
+INSERT INTO "remix_tag" VALUES(1926,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1927,'funk',1);
+INSERT INTO "remix_tag" VALUES(1927,'organ',1);
+INSERT INTO "remix_tag" VALUES(1928,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1928,'piano',1);
+INSERT INTO "remix_tag" VALUES(1928,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(1929,'funk',1);
+INSERT INTO "remix_tag" VALUES(1929,'synth',1);
+INSERT INTO "remix_tag" VALUES(1930,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1930,'piano',1);
+INSERT INTO "remix_tag" VALUES(1930,'strings',1);
+INSERT INTO "remix_tag" VALUES(1930,'synth',1);
+INSERT INTO "remix_tag" VALUES(1931,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(1931,'cello',1);
+INSERT INTO "remix_tag" VALUES(1931,'chill',1);
+INSERT INTO "remix_tag" VALUES(1931,'collab',1);
+INSERT INTO "remix_tag" VALUES(1931,'dark',1);
+INSERT INTO "remix_tag" VALUES(1931,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(1931,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1931,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(1931,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(1931,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1931,'piano',1);
+INSERT INTO "remix_tag" VALUES(1931,'quartet',1);
+INSERT INTO "remix_tag" VALUES(1931,'sad',1);
+INSERT INTO "remix_tag" VALUES(1931,'solemn',1);
+INSERT INTO "remix_tag" VALUES(1931,'strings',1);
+INSERT INTO "remix_tag" VALUES(1931,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(1931,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1932,'happy',1);
+INSERT INTO "remix_tag" VALUES(1932,'synth',1);
+INSERT INTO "remix_tag" VALUES(1933,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1933,'chill',1);
+INSERT INTO "remix_tag" VALUES(1933,'latin',1);
+INSERT INTO "remix_tag" VALUES(1934,'brass',1);
+INSERT INTO "remix_tag" VALUES(1934,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1934,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1934,'synth',1);
+INSERT INTO "remix_tag" VALUES(1935,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1935,'rock',1);
+INSERT INTO "remix_tag" VALUES(1935,'synth',1);
+INSERT INTO "remix_tag" VALUES(1936,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1936,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1936,'funky',1);
+INSERT INTO "remix_tag" VALUES(1937,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1937,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1937,'synth',1);
+INSERT INTO "remix_tag" VALUES(1938,'piano',1);
+INSERT INTO "remix_tag" VALUES(1938,'solo',1);
+INSERT INTO "remix_tag" VALUES(1939,'collab',1);
+INSERT INTO "remix_tag" VALUES(1939,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1939,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1939,'metal',1);
+INSERT INTO "remix_tag" VALUES(1939,'rock',1);
+INSERT INTO "remix_tag" VALUES(1940,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1940,'synth',1);
+INSERT INTO "remix_tag" VALUES(1941,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1941,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1941,'rock',1);
+INSERT INTO "remix_tag" VALUES(1941,'strings',1);
+INSERT INTO "remix_tag" VALUES(1942,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1942,'happy',1);
+INSERT INTO "remix_tag" VALUES(1942,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1942,'piano',1);
+INSERT INTO "remix_tag" VALUES(1943,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1943,'strings',1);
+INSERT INTO "remix_tag" VALUES(1944,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1944,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(1944,'strings',1);
+INSERT INTO "remix_tag" VALUES(1944,'synth',1);
+INSERT INTO "remix_tag" VALUES(1945,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1945,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1945,'rock',1);
+INSERT INTO "remix_tag" VALUES(1946,'piano',1);
+INSERT INTO "remix_tag" VALUES(1946,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1946,'solo',1);
+INSERT INTO "remix_tag" VALUES(1947,'brass',1);
+INSERT INTO "remix_tag" VALUES(1947,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1947,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1947,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(1948,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1948,'rock',1);
+INSERT INTO "remix_tag" VALUES(1948,'strings',1);
+INSERT INTO "remix_tag" VALUES(1948,'synth',1);
+INSERT INTO "remix_tag" VALUES(1949,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1949,'new-age',1);
+INSERT INTO "remix_tag" VALUES(1949,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1949,'world',1);
+INSERT INTO "remix_tag" VALUES(1950,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1950,'chill',1);
+INSERT INTO "remix_tag" VALUES(1950,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1951,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1951,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1951,'piano',1);
+INSERT INTO "remix_tag" VALUES(1951,'solo',1);
+INSERT INTO "remix_tag" VALUES(1952,'collab',1);
+INSERT INTO "remix_tag" VALUES(1952,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1952,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1952,'funky',1);
+INSERT INTO "remix_tag" VALUES(1952,'rock',1);
+INSERT INTO "remix_tag" VALUES(1953,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1953,'chill',1);
+INSERT INTO "remix_tag" VALUES(1953,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1954,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1954,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1954,'funky',1);
+INSERT INTO "remix_tag" VALUES(1954,'synth',1);
+INSERT INTO "remix_tag" VALUES(1955,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1955,'chill',1);
+INSERT INTO "remix_tag" VALUES(1955,'synth',1);
+INSERT INTO "remix_tag" VALUES(1956,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1956,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1956,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1956,'trance',1);
+INSERT INTO "remix_tag" VALUES(1956,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1957,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1957,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1957,'synth',1);
+INSERT INTO "remix_tag" VALUES(1958,'piano',1);
+INSERT INTO "remix_tag" VALUES(1958,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1958,'solo',1);
+INSERT INTO "remix_tag" VALUES(1959,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1959,'metal',1);
+INSERT INTO "remix_tag" VALUES(1959,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1959,'rock',1);
+INSERT INTO "remix_tag" VALUES(1959,'strings',1);
+INSERT INTO "remix_tag" VALUES(1959,'synth',1);
+INSERT INTO "remix_tag" VALUES(1960,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1960,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1960,'organ',1);
+INSERT INTO "remix_tag" VALUES(1960,'rock',1);
+INSERT INTO "remix_tag" VALUES(1961,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1961,'funky',1);
+INSERT INTO "remix_tag" VALUES(1961,'sexy',1);
+INSERT INTO "remix_tag" VALUES(1961,'synth',1);
+INSERT INTO "remix_tag" VALUES(1962,'synth',1);
+INSERT INTO "remix_tag" VALUES(1963,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(1963,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1964,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1964,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1964,'rock',1);
+INSERT INTO "remix_tag" VALUES(1964,'synth',1);
+INSERT INTO "remix_tag" VALUES(1965,'ballad',1);
+INSERT INTO "remix_tag" VALUES(1965,'funky',1);
+INSERT INTO "remix_tag" VALUES(1965,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1965,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(1965,'singing',1);
+INSERT INTO "remix_tag" VALUES(1965,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1966,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1966,'synth',1);
+INSERT INTO "remix_tag" VALUES(1967,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1967,'latin',1);
+INSERT INTO "remix_tag" VALUES(1967,'piano',1);
+INSERT INTO "remix_tag" VALUES(1968,'collab',1);
+INSERT INTO "remix_tag" VALUES(1968,'rock',1);
+INSERT INTO "remix_tag" VALUES(1969,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1969,'synth',1);
+INSERT INTO "remix_tag" VALUES(1970,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1970,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1970,'synth',1);
+INSERT INTO "remix_tag" VALUES(1971,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1971,'collab',1);
+INSERT INTO "remix_tag" VALUES(1971,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1971,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1971,'rock',1);
+INSERT INTO "remix_tag" VALUES(1971,'synth',1);
+INSERT INTO "remix_tag" VALUES(1972,'collab',1);
+INSERT INTO "remix_tag" VALUES(1972,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1972,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1972,'singing',1);
+INSERT INTO "remix_tag" VALUES(1972,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1973,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1973,'funky',1);
+INSERT INTO "remix_tag" VALUES(1973,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1974,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1974,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1974,'synth',1);
+INSERT INTO "remix_tag" VALUES(1974,'trance',1);
+INSERT INTO "remix_tag" VALUES(1975,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1975,'collab',1);
+INSERT INTO "remix_tag" VALUES(1975,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1975,'singing',1);
+INSERT INTO "remix_tag" VALUES(1975,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1976,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1976,'edm',1);
+INSERT INTO "remix_tag" VALUES(1976,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1976,'energetic',1);
+INSERT INTO "remix_tag" VALUES(1976,'piano',1);
+INSERT INTO "remix_tag" VALUES(1976,'synth',1);
+INSERT INTO "remix_tag" VALUES(1976,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(1976,'workout',1);
+INSERT INTO "remix_tag" VALUES(1977,'funky',1);
+INSERT INTO "remix_tag" VALUES(1977,'jazz',1);
+INSERT INTO "remix_tag" VALUES(1977,'piano',1);
+INSERT INTO "remix_tag" VALUES(1977,'synth',1);
+INSERT INTO "remix_tag" VALUES(1978,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1978,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1978,'flute',1);
+INSERT INTO "remix_tag" VALUES(1978,'strings',1);
+INSERT INTO "remix_tag" VALUES(1978,'synth',1);
+INSERT INTO "remix_tag" VALUES(1979,'cello',1);
+INSERT INTO "remix_tag" VALUES(1979,'collab',1);
+INSERT INTO "remix_tag" VALUES(1979,'synth',1);
+INSERT INTO "remix_tag" VALUES(1980,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(1980,'cello',1);
+INSERT INTO "remix_tag" VALUES(1980,'collab',1);
+INSERT INTO "remix_tag" VALUES(1980,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(1980,'singing',1);
+INSERT INTO "remix_tag" VALUES(1980,'strings',1);
+INSERT INTO "remix_tag" VALUES(1980,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1981,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1981,'synth',1);
+INSERT INTO "remix_tag" VALUES(1981,'world',1);
+INSERT INTO "remix_tag" VALUES(1982,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1982,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1982,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1982,'metal',1);
+INSERT INTO "remix_tag" VALUES(1982,'synth',1);
+INSERT INTO "remix_tag" VALUES(1983,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1983,'synth',1);
+INSERT INTO "remix_tag" VALUES(1984,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1984,'funky',1);
+INSERT INTO "remix_tag" VALUES(1984,'synth',1);
+INSERT INTO "remix_tag" VALUES(1985,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1985,'rock',1);
+INSERT INTO "remix_tag" VALUES(1986,'rock',1);
+INSERT INTO "remix_tag" VALUES(1986,'synth',1);
+INSERT INTO "remix_tag" VALUES(1987,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1987,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1987,'synth',1);
+INSERT INTO "remix_tag" VALUES(1988,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1988,'synth',1);
+INSERT INTO "remix_tag" VALUES(1989,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1989,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(1989,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1989,'metal',1);
+INSERT INTO "remix_tag" VALUES(1990,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1990,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1990,'rock',1);
+INSERT INTO "remix_tag" VALUES(1990,'synth',1);
+INSERT INTO "remix_tag" VALUES(1991,'ambient',1);
+INSERT INTO "remix_tag" VALUES(1991,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(1991,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1991,'piano',1);
+INSERT INTO "remix_tag" VALUES(1992,'brass',1);
+INSERT INTO "remix_tag" VALUES(1992,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(1992,'piano',1);
+INSERT INTO "remix_tag" VALUES(1992,'strings',1);
+INSERT INTO "remix_tag" VALUES(1992,'synth',1);
+INSERT INTO "remix_tag" VALUES(1993,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1993,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1993,'metal',1);
+INSERT INTO "remix_tag" VALUES(1993,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(1993,'rock',1);
+INSERT INTO "remix_tag" VALUES(1993,'synth',1);
+INSERT INTO "remix_tag" VALUES(1993,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1994,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1994,'mellow',1);
+INSERT INTO "remix_tag" VALUES(1994,'world',1);
+INSERT INTO "remix_tag" VALUES(1995,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1995,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1995,'singing',1);
+INSERT INTO "remix_tag" VALUES(1995,'synth',1);
+INSERT INTO "remix_tag" VALUES(1995,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1995,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1995,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(1996,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1996,'synth',1);
+INSERT INTO "remix_tag" VALUES(1997,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(1997,'compo',1);
+INSERT INTO "remix_tag" VALUES(1997,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(1997,'metal',1);
+INSERT INTO "remix_tag" VALUES(1997,'rock',1);
+INSERT INTO "remix_tag" VALUES(1997,'singing',1);
+INSERT INTO "remix_tag" VALUES(1997,'synth',1);
+INSERT INTO "remix_tag" VALUES(1998,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(1998,'electronic',1);
+INSERT INTO "remix_tag" VALUES(1998,'synth',1);
+INSERT INTO "remix_tag" VALUES(1999,'goofy',1);
+INSERT INTO "remix_tag" VALUES(1999,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(1999,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(1999,'singing',1);
+INSERT INTO "remix_tag" VALUES(1999,'synth',1);
+INSERT INTO "remix_tag" VALUES(1999,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(1999,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(1999,'vocals-rapping',1);
@@ -0,0 +1,5173 @@
+INSERT INTO "remix_tag" VALUES(2000,'collab',1);
+INSERT INTO "remix_tag" VALUES(2000,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2000,'rock',1);
+INSERT INTO "remix_tag" VALUES(2000,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2001,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2001,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2001,'synth',1);
+INSERT INTO "remix_tag" VALUES(2002,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2002,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2002,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2002,'rock',1);
+INSERT INTO "remix_tag" VALUES(2003,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2003,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2003,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2003,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2003,'singing',1);
+INSERT INTO "remix_tag" VALUES(2003,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2003,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2004,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2004,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2004,'world',1);
+INSERT INTO "remix_tag" VALUES(2005,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2005,'synth',1);
+INSERT INTO "remix_tag" VALUES(2005,'trance',1);
+INSERT INTO "remix_tag" VALUES(2006,'collab',1);
+INSERT INTO "remix_tag" VALUES(2006,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2006,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2006,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2006,'rock',1);
+INSERT INTO "remix_tag" VALUES(2006,'singing',1);
+INSERT INTO "remix_tag" VALUES(2006,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2006,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2007,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2007,'flute',1);
+INSERT INTO "remix_tag" VALUES(2007,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2007,'world',1);
+INSERT INTO "remix_tag" VALUES(2008,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2008,'collab',1);
+INSERT INTO "remix_tag" VALUES(2008,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2008,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2008,'rock',1);
+INSERT INTO "remix_tag" VALUES(2008,'synth',1);
+INSERT INTO "remix_tag" VALUES(2009,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2009,'synth',1);
+INSERT INTO "remix_tag" VALUES(2010,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2010,'funky',1);
+INSERT INTO "remix_tag" VALUES(2010,'synth',1);
+INSERT INTO "remix_tag" VALUES(2011,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2011,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2011,'synth',1);
+INSERT INTO "remix_tag" VALUES(2012,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2013,'funky',1);
+INSERT INTO "remix_tag" VALUES(2013,'synth',1);
+INSERT INTO "remix_tag" VALUES(2014,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2014,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2014,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2014,'solo',1);
+INSERT INTO "remix_tag" VALUES(2015,'funky',1);
+INSERT INTO "remix_tag" VALUES(2015,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2016,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2016,'brass',1);
+INSERT INTO "remix_tag" VALUES(2016,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2017,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2017,'world',1);
+INSERT INTO "remix_tag" VALUES(2018,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2018,'synth',1);
+INSERT INTO "remix_tag" VALUES(2019,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2019,'organ',1);
+INSERT INTO "remix_tag" VALUES(2019,'rock',1);
+INSERT INTO "remix_tag" VALUES(2019,'synth',1);
+INSERT INTO "remix_tag" VALUES(2020,'brass',1);
+INSERT INTO "remix_tag" VALUES(2020,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2020,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2020,'strings',1);
+INSERT INTO "remix_tag" VALUES(2021,'chill',1);
+INSERT INTO "remix_tag" VALUES(2021,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2021,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2021,'synth',1);
+INSERT INTO "remix_tag" VALUES(2022,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2022,'synth',1);
+INSERT INTO "remix_tag" VALUES(2023,'happy',1);
+INSERT INTO "remix_tag" VALUES(2023,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2023,'pop',1);
+INSERT INTO "remix_tag" VALUES(2023,'singing',1);
+INSERT INTO "remix_tag" VALUES(2023,'synth',1);
+INSERT INTO "remix_tag" VALUES(2023,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2023,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2024,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2024,'piano',1);
+INSERT INTO "remix_tag" VALUES(2024,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2024,'synth',1);
+INSERT INTO "remix_tag" VALUES(2025,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2025,'synth',1);
+INSERT INTO "remix_tag" VALUES(2025,'trance',1);
+INSERT INTO "remix_tag" VALUES(2026,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2026,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2026,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2026,'piano',1);
+INSERT INTO "remix_tag" VALUES(2026,'synth',1);
+INSERT INTO "remix_tag" VALUES(2026,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2027,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2027,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2027,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2027,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2027,'rock',1);
+INSERT INTO "remix_tag" VALUES(2028,'collab',1);
+INSERT INTO "remix_tag" VALUES(2028,'mediterranean',1);
+INSERT INTO "remix_tag" VALUES(2028,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(2028,'singing',1);
+INSERT INTO "remix_tag" VALUES(2028,'synth',1);
+INSERT INTO "remix_tag" VALUES(2028,'trance',1);
+INSERT INTO "remix_tag" VALUES(2028,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2029,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2029,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2029,'metal',1);
+INSERT INTO "remix_tag" VALUES(2029,'rock',1);
+INSERT INTO "remix_tag" VALUES(2030,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2030,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2030,'synth',1);
+INSERT INTO "remix_tag" VALUES(2031,'blues',1);
+INSERT INTO "remix_tag" VALUES(2031,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2031,'piano',1);
+INSERT INTO "remix_tag" VALUES(2031,'singing',1);
+INSERT INTO "remix_tag" VALUES(2031,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2032,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2032,'funk',1);
+INSERT INTO "remix_tag" VALUES(2032,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2032,'synth',1);
+INSERT INTO "remix_tag" VALUES(2033,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2033,'metal',1);
+INSERT INTO "remix_tag" VALUES(2033,'rock',1);
+INSERT INTO "remix_tag" VALUES(2033,'synth',1);
+INSERT INTO "remix_tag" VALUES(2034,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2034,'synth',1);
+INSERT INTO "remix_tag" VALUES(2034,'trance',1);
+INSERT INTO "remix_tag" VALUES(2035,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2035,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2035,'synth',1);
+INSERT INTO "remix_tag" VALUES(2036,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2036,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2036,'synth',1);
+INSERT INTO "remix_tag" VALUES(2037,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2037,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2037,'synth',1);
+INSERT INTO "remix_tag" VALUES(2038,'brass',1);
+INSERT INTO "remix_tag" VALUES(2038,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2038,'epic',1);
+INSERT INTO "remix_tag" VALUES(2038,'flute',1);
+INSERT INTO "remix_tag" VALUES(2038,'march',1);
+INSERT INTO "remix_tag" VALUES(2038,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2038,'rock',1);
+INSERT INTO "remix_tag" VALUES(2039,'brass',1);
+INSERT INTO "remix_tag" VALUES(2039,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2039,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2039,'latin',1);
+INSERT INTO "remix_tag" VALUES(2039,'rock',1);
+INSERT INTO "remix_tag" VALUES(2040,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2040,'rock',1);
+INSERT INTO "remix_tag" VALUES(2041,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2041,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2041,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2041,'solo',1);
+INSERT INTO "remix_tag" VALUES(2042,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2042,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2042,'synth',1);
+INSERT INTO "remix_tag" VALUES(2043,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2043,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2043,'funky',1);
+INSERT INTO "remix_tag" VALUES(2043,'synth',1);
+INSERT INTO "remix_tag" VALUES(2044,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2044,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2044,'synth',1);
+INSERT INTO "remix_tag" VALUES(2045,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2045,'brass',1);
+INSERT INTO "remix_tag" VALUES(2045,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2045,'funky',1);
+INSERT INTO "remix_tag" VALUES(2045,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2045,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2045,'latin',1);
+INSERT INTO "remix_tag" VALUES(2045,'organ',1);
+INSERT INTO "remix_tag" VALUES(2046,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2046,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2046,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2046,'synth',1);
+INSERT INTO "remix_tag" VALUES(2047,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2047,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2047,'happy',1);
+INSERT INTO "remix_tag" VALUES(2047,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2047,'synth',1);
+INSERT INTO "remix_tag" VALUES(2048,'funky',1);
+INSERT INTO "remix_tag" VALUES(2048,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2048,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2048,'singing',1);
+INSERT INTO "remix_tag" VALUES(2049,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2049,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2049,'metal',1);
+INSERT INTO "remix_tag" VALUES(2049,'rock',1);
+INSERT INTO "remix_tag" VALUES(2049,'synth',1);
+INSERT INTO "remix_tag" VALUES(2050,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(2050,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2050,'funk',1);
+INSERT INTO "remix_tag" VALUES(2050,'funky',1);
+INSERT INTO "remix_tag" VALUES(2050,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2050,'organ',1);
+INSERT INTO "remix_tag" VALUES(2051,'brass',1);
+INSERT INTO "remix_tag" VALUES(2051,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2051,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2051,'strings',1);
+INSERT INTO "remix_tag" VALUES(2051,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2052,'happy',1);
+INSERT INTO "remix_tag" VALUES(2052,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2052,'pop',1);
+INSERT INTO "remix_tag" VALUES(2052,'synth',1);
+INSERT INTO "remix_tag" VALUES(2053,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2053,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2053,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2053,'piano',1);
+INSERT INTO "remix_tag" VALUES(2053,'synth',1);
+INSERT INTO "remix_tag" VALUES(2054,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2054,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2054,'synth',1);
+INSERT INTO "remix_tag" VALUES(2055,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2055,'piano',1);
+INSERT INTO "remix_tag" VALUES(2055,'synth',1);
+INSERT INTO "remix_tag" VALUES(2056,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2056,'piano',1);
+INSERT INTO "remix_tag" VALUES(2056,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2056,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2057,'folk',1);
+INSERT INTO "remix_tag" VALUES(2057,'harp',1);
+INSERT INTO "remix_tag" VALUES(2057,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2057,'singing',1);
+INSERT INTO "remix_tag" VALUES(2057,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2058,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2058,'bells',1);
+INSERT INTO "remix_tag" VALUES(2058,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2058,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(2058,'piano',1);
+INSERT INTO "remix_tag" VALUES(2059,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2059,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2059,'metal',1);
+INSERT INTO "remix_tag" VALUES(2059,'rock',1);
+INSERT INTO "remix_tag" VALUES(2060,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2060,'rock',1);
+INSERT INTO "remix_tag" VALUES(2061,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2061,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2061,'synth',1);
+INSERT INTO "remix_tag" VALUES(2061,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2062,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2062,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2062,'synth',1);
+INSERT INTO "remix_tag" VALUES(2063,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2063,'happy',1);
+INSERT INTO "remix_tag" VALUES(2063,'synth',1);
+INSERT INTO "remix_tag" VALUES(2064,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2064,'dance',1);
+INSERT INTO "remix_tag" VALUES(2064,'edm',1);
+INSERT INTO "remix_tag" VALUES(2064,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2064,'energetic',1);
+INSERT INTO "remix_tag" VALUES(2064,'synth',1);
+INSERT INTO "remix_tag" VALUES(2064,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(2064,'workout',1);
+INSERT INTO "remix_tag" VALUES(2065,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2065,'funk',1);
+INSERT INTO "remix_tag" VALUES(2065,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2065,'piano',1);
+INSERT INTO "remix_tag" VALUES(2065,'synth',1);
+INSERT INTO "remix_tag" VALUES(2066,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2066,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2066,'rock',1);
+INSERT INTO "remix_tag" VALUES(2067,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2067,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2067,'synth',1);
+INSERT INTO "remix_tag" VALUES(2067,'trance',1);
+INSERT INTO "remix_tag" VALUES(2068,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2068,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2068,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2068,'piano',1);
+INSERT INTO "remix_tag" VALUES(2068,'synth',1);
+INSERT INTO "remix_tag" VALUES(2069,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2069,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2069,'synth',1);
+INSERT INTO "remix_tag" VALUES(2070,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2070,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2070,'metal',1);
+INSERT INTO "remix_tag" VALUES(2070,'rock',1);
+INSERT INTO "remix_tag" VALUES(2071,'collab',1);
+INSERT INTO "remix_tag" VALUES(2071,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2071,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2071,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2071,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2071,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2072,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2072,'indian',1);
+INSERT INTO "remix_tag" VALUES(2073,'piano',1);
+INSERT INTO "remix_tag" VALUES(2073,'solo',1);
+INSERT INTO "remix_tag" VALUES(2074,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2074,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2074,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2074,'pop',1);
+INSERT INTO "remix_tag" VALUES(2074,'singing',1);
+INSERT INTO "remix_tag" VALUES(2074,'synth',1);
+INSERT INTO "remix_tag" VALUES(2074,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2075,'brass',1);
+INSERT INTO "remix_tag" VALUES(2075,'dark',1);
+INSERT INTO "remix_tag" VALUES(2075,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2075,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2075,'strings',1);
+INSERT INTO "remix_tag" VALUES(2075,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2076,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2076,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2076,'synth',1);
+INSERT INTO "remix_tag" VALUES(2076,'trance',1);
+INSERT INTO "remix_tag" VALUES(2077,'collab',1);
+INSERT INTO "remix_tag" VALUES(2077,'dark',1);
+INSERT INTO "remix_tag" VALUES(2077,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2077,'piano',1);
+INSERT INTO "remix_tag" VALUES(2077,'synth',1);
+INSERT INTO "remix_tag" VALUES(2078,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2078,'pop',1);
+INSERT INTO "remix_tag" VALUES(2078,'singing',1);
+INSERT INTO "remix_tag" VALUES(2078,'synth',1);
+INSERT INTO "remix_tag" VALUES(2078,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2079,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2079,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2079,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2079,'synth',1);
+INSERT INTO "remix_tag" VALUES(2080,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2080,'chill',1);
+INSERT INTO "remix_tag" VALUES(2080,'dub',1);
+INSERT INTO "remix_tag" VALUES(2080,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2080,'synth',1);
+INSERT INTO "remix_tag" VALUES(2081,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2081,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2081,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2081,'pop',1);
+INSERT INTO "remix_tag" VALUES(2081,'singing',1);
+INSERT INTO "remix_tag" VALUES(2081,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2082,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2082,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2082,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2082,'strings',1);
+INSERT INTO "remix_tag" VALUES(2082,'synth',1);
+INSERT INTO "remix_tag" VALUES(2083,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2083,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2083,'happy',1);
+INSERT INTO "remix_tag" VALUES(2083,'synth',1);
+INSERT INTO "remix_tag" VALUES(2084,'brass',1);
+INSERT INTO "remix_tag" VALUES(2084,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2084,'dark',1);
+INSERT INTO "remix_tag" VALUES(2084,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2084,'strings',1);
+INSERT INTO "remix_tag" VALUES(2085,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2085,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2085,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2085,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2085,'collab',1);
+INSERT INTO "remix_tag" VALUES(2085,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2085,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(2086,'brass',1);
+INSERT INTO "remix_tag" VALUES(2086,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(2086,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2086,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(2086,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2086,'strings',1);
+INSERT INTO "remix_tag" VALUES(2087,'collab',1);
+INSERT INTO "remix_tag" VALUES(2087,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2087,'piano',1);
+INSERT INTO "remix_tag" VALUES(2087,'strings',1);
+INSERT INTO "remix_tag" VALUES(2088,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2088,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2088,'piano',1);
+INSERT INTO "remix_tag" VALUES(2089,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2089,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2089,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2089,'solo',1);
+INSERT INTO "remix_tag" VALUES(2090,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2090,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2090,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2090,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2091,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2091,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2091,'metal',1);
+INSERT INTO "remix_tag" VALUES(2091,'rock',1);
+INSERT INTO "remix_tag" VALUES(2091,'synth',1);
+INSERT INTO "remix_tag" VALUES(2092,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2092,'synth',1);
+INSERT INTO "remix_tag" VALUES(2093,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2093,'dark',1);
+INSERT INTO "remix_tag" VALUES(2093,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2093,'synth',1);
+INSERT INTO "remix_tag" VALUES(2094,'chinese',1);
+INSERT INTO "remix_tag" VALUES(2094,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2094,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2095,'brass',1);
+INSERT INTO "remix_tag" VALUES(2095,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(2095,'classical',1);
+INSERT INTO "remix_tag" VALUES(2095,'dark',1);
+INSERT INTO "remix_tag" VALUES(2095,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2095,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2095,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2095,'strings',1);
+INSERT INTO "remix_tag" VALUES(2096,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2096,'rock',1);
+INSERT INTO "remix_tag" VALUES(2097,'dark',1);
+INSERT INTO "remix_tag" VALUES(2097,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2097,'synth',1);
+INSERT INTO "remix_tag" VALUES(2098,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2098,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2098,'synth',1);
+INSERT INTO "remix_tag" VALUES(2099,'collab',1);
+INSERT INTO "remix_tag" VALUES(2099,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2099,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2099,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2099,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2099,'rock',1);
+INSERT INTO "remix_tag" VALUES(2099,'singing',1);
+INSERT INTO "remix_tag" VALUES(2099,'synth',1);
+INSERT INTO "remix_tag" VALUES(2099,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2100,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2100,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2100,'folk',1);
+INSERT INTO "remix_tag" VALUES(2100,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2100,'singing',1);
+INSERT INTO "remix_tag" VALUES(2100,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2101,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2101,'happy',1);
+INSERT INTO "remix_tag" VALUES(2101,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2101,'pop',1);
+INSERT INTO "remix_tag" VALUES(2101,'synth',1);
+INSERT INTO "remix_tag" VALUES(2101,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2101,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2102,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2102,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2102,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2102,'rock',1);
+INSERT INTO "remix_tag" VALUES(2103,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2103,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2103,'strings',1);
+INSERT INTO "remix_tag" VALUES(2103,'synth',1);
+INSERT INTO "remix_tag" VALUES(2104,'brass',1);
+INSERT INTO "remix_tag" VALUES(2104,'choir',1);
+INSERT INTO "remix_tag" VALUES(2104,'classical',1);
+INSERT INTO "remix_tag" VALUES(2104,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2104,'epic',1);
+INSERT INTO "remix_tag" VALUES(2104,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2104,'strings',1);
+INSERT INTO "remix_tag" VALUES(2104,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2105,'dark',1);
+INSERT INTO "remix_tag" VALUES(2105,'funk',1);
+INSERT INTO "remix_tag" VALUES(2105,'synth',1);
+INSERT INTO "remix_tag" VALUES(2106,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2106,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2106,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2106,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2107,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2107,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2107,'metal',1);
+INSERT INTO "remix_tag" VALUES(2107,'rock',1);
+INSERT INTO "remix_tag" VALUES(2107,'synth',1);
+INSERT INTO "remix_tag" VALUES(2108,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2108,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2108,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2108,'metal',1);
+INSERT INTO "remix_tag" VALUES(2108,'rock',1);
+INSERT INTO "remix_tag" VALUES(2109,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2109,'collab',1);
+INSERT INTO "remix_tag" VALUES(2109,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2109,'happy',1);
+INSERT INTO "remix_tag" VALUES(2109,'synth',1);
+INSERT INTO "remix_tag" VALUES(2110,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2110,'collab',1);
+INSERT INTO "remix_tag" VALUES(2110,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2110,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2110,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2110,'metal',1);
+INSERT INTO "remix_tag" VALUES(2110,'rock',1);
+INSERT INTO "remix_tag" VALUES(2110,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2111,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2111,'funk',1);
+INSERT INTO "remix_tag" VALUES(2111,'funky',1);
+INSERT INTO "remix_tag" VALUES(2111,'piano',1);
+INSERT INTO "remix_tag" VALUES(2111,'synth',1);
+INSERT INTO "remix_tag" VALUES(2112,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2112,'indian',1);
+INSERT INTO "remix_tag" VALUES(2112,'strings',1);
+INSERT INTO "remix_tag" VALUES(2112,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2113,'brass',1);
+INSERT INTO "remix_tag" VALUES(2113,'choir',1);
+INSERT INTO "remix_tag" VALUES(2113,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2113,'dark',1);
+INSERT INTO "remix_tag" VALUES(2113,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2113,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2113,'strings',1);
+INSERT INTO "remix_tag" VALUES(2113,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2113,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2114,'classical',1);
+INSERT INTO "remix_tag" VALUES(2114,'collab',1);
+INSERT INTO "remix_tag" VALUES(2114,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2114,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2114,'strings',1);
+INSERT INTO "remix_tag" VALUES(2115,'dark',1);
+INSERT INTO "remix_tag" VALUES(2115,'indian',1);
+INSERT INTO "remix_tag" VALUES(2115,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(2115,'sitar',1);
+INSERT INTO "remix_tag" VALUES(2115,'strings',1);
+INSERT INTO "remix_tag" VALUES(2115,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2115,'world',1);
+INSERT INTO "remix_tag" VALUES(2116,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2116,'collab',1);
+INSERT INTO "remix_tag" VALUES(2116,'dark',1);
+INSERT INTO "remix_tag" VALUES(2116,'piano',1);
+INSERT INTO "remix_tag" VALUES(2116,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2116,'synth',1);
+INSERT INTO "remix_tag" VALUES(2117,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2117,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2117,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2117,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2117,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2117,'pop',1);
+INSERT INTO "remix_tag" VALUES(2117,'singing',1);
+INSERT INTO "remix_tag" VALUES(2117,'synth',1);
+INSERT INTO "remix_tag" VALUES(2117,'violin',1);
+INSERT INTO "remix_tag" VALUES(2117,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2118,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2118,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2118,'pop',1);
+INSERT INTO "remix_tag" VALUES(2118,'singing',1);
+INSERT INTO "remix_tag" VALUES(2118,'synth',1);
+INSERT INTO "remix_tag" VALUES(2118,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2118,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2119,'dark',1);
+INSERT INTO "remix_tag" VALUES(2119,'funk',1);
+INSERT INTO "remix_tag" VALUES(2119,'funky',1);
+INSERT INTO "remix_tag" VALUES(2119,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2119,'synth',1);
+INSERT INTO "remix_tag" VALUES(2119,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2120,'choir',1);
+INSERT INTO "remix_tag" VALUES(2120,'dark',1);
+INSERT INTO "remix_tag" VALUES(2120,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2120,'organ',1);
+INSERT INTO "remix_tag" VALUES(2121,'chill',1);
+INSERT INTO "remix_tag" VALUES(2121,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2121,'pop',1);
+INSERT INTO "remix_tag" VALUES(2121,'singing',1);
+INSERT INTO "remix_tag" VALUES(2121,'synth',1);
+INSERT INTO "remix_tag" VALUES(2121,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2121,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2122,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2122,'piano',1);
+INSERT INTO "remix_tag" VALUES(2122,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2122,'solo',1);
+INSERT INTO "remix_tag" VALUES(2123,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2123,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2123,'happy',1);
+INSERT INTO "remix_tag" VALUES(2123,'synth',1);
+INSERT INTO "remix_tag" VALUES(2124,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2124,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2124,'happy',1);
+INSERT INTO "remix_tag" VALUES(2124,'synth',1);
+INSERT INTO "remix_tag" VALUES(2125,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2125,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2125,'latin',1);
+INSERT INTO "remix_tag" VALUES(2125,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(2125,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2125,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2126,'brass',1);
+INSERT INTO "remix_tag" VALUES(2126,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2126,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2126,'piano',1);
+INSERT INTO "remix_tag" VALUES(2126,'strings',1);
+INSERT INTO "remix_tag" VALUES(2127,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2127,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2127,'latin',1);
+INSERT INTO "remix_tag" VALUES(2127,'rock',1);
+INSERT INTO "remix_tag" VALUES(2129,'brass',1);
+INSERT INTO "remix_tag" VALUES(2129,'choir',1);
+INSERT INTO "remix_tag" VALUES(2129,'classical',1);
+INSERT INTO "remix_tag" VALUES(2129,'epic',1);
+INSERT INTO "remix_tag" VALUES(2129,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2129,'strings',1);
+INSERT INTO "remix_tag" VALUES(2129,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2131,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2131,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2131,'metal',1);
+INSERT INTO "remix_tag" VALUES(2131,'rock',1);
+INSERT INTO "remix_tag" VALUES(2132,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2132,'organ',1);
+INSERT INTO "remix_tag" VALUES(2132,'piano',1);
+INSERT INTO "remix_tag" VALUES(2132,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2133,'appalachian',1);
+INSERT INTO "remix_tag" VALUES(2133,'banjo',1);
+INSERT INTO "remix_tag" VALUES(2133,'folk',1);
+INSERT INTO "remix_tag" VALUES(2133,'happy',1);
+INSERT INTO "remix_tag" VALUES(2134,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2134,'strings',1);
+INSERT INTO "remix_tag" VALUES(2135,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2135,'synth',1);
+INSERT INTO "remix_tag" VALUES(2135,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2136,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2136,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2136,'metal',1);
+INSERT INTO "remix_tag" VALUES(2136,'rock',1);
+INSERT INTO "remix_tag" VALUES(2136,'synth',1);
+INSERT INTO "remix_tag" VALUES(2137,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2137,'funk',1);
+INSERT INTO "remix_tag" VALUES(2137,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2137,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2137,'piano',1);
+INSERT INTO "remix_tag" VALUES(2138,'bells',1);
+INSERT INTO "remix_tag" VALUES(2138,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2138,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2138,'pop',1);
+INSERT INTO "remix_tag" VALUES(2138,'synth',1);
+INSERT INTO "remix_tag" VALUES(2138,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2138,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2139,'brass',1);
+INSERT INTO "remix_tag" VALUES(2139,'choir',1);
+INSERT INTO "remix_tag" VALUES(2139,'dark',1);
+INSERT INTO "remix_tag" VALUES(2139,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2139,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2139,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2139,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2139,'strings',1);
+INSERT INTO "remix_tag" VALUES(2139,'swing',1);
+INSERT INTO "remix_tag" VALUES(2139,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2140,'collab',1);
+INSERT INTO "remix_tag" VALUES(2140,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2140,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2140,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2140,'synth',1);
+INSERT INTO "remix_tag" VALUES(2140,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2141,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2141,'collab',1);
+INSERT INTO "remix_tag" VALUES(2141,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2141,'happy',1);
+INSERT INTO "remix_tag" VALUES(2141,'synth',1);
+INSERT INTO "remix_tag" VALUES(2142,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2142,'cello',1);
+INSERT INTO "remix_tag" VALUES(2142,'dark',1);
+INSERT INTO "remix_tag" VALUES(2142,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2142,'strings',1);
+INSERT INTO "remix_tag" VALUES(2143,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2143,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2143,'synth',1);
+INSERT INTO "remix_tag" VALUES(2144,'collab',1);
+INSERT INTO "remix_tag" VALUES(2144,'duet',1);
+INSERT INTO "remix_tag" VALUES(2144,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2144,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2144,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2145,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2145,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2145,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2145,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2145,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2146,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2146,'rock',1);
+INSERT INTO "remix_tag" VALUES(2147,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2147,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2147,'metal',1);
+INSERT INTO "remix_tag" VALUES(2147,'rock',1);
+INSERT INTO "remix_tag" VALUES(2147,'singing',1);
+INSERT INTO "remix_tag" VALUES(2147,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2148,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2148,'synth',1);
+INSERT INTO "remix_tag" VALUES(2149,'dark',1);
+INSERT INTO "remix_tag" VALUES(2149,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2149,'fusion',1);
+INSERT INTO "remix_tag" VALUES(2149,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2149,'latin',1);
+INSERT INTO "remix_tag" VALUES(2149,'piano',1);
+INSERT INTO "remix_tag" VALUES(2150,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2150,'chill',1);
+INSERT INTO "remix_tag" VALUES(2150,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2150,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2150,'synth',1);
+INSERT INTO "remix_tag" VALUES(2150,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2151,'chill',1);
+INSERT INTO "remix_tag" VALUES(2151,'dub',1);
+INSERT INTO "remix_tag" VALUES(2151,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2151,'reggae',1);
+INSERT INTO "remix_tag" VALUES(2152,'bells',1);
+INSERT INTO "remix_tag" VALUES(2152,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2152,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2152,'rock',1);
+INSERT INTO "remix_tag" VALUES(2152,'singing',1);
+INSERT INTO "remix_tag" VALUES(2152,'synth',1);
+INSERT INTO "remix_tag" VALUES(2152,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2152,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2153,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2153,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2153,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2153,'piano',1);
+INSERT INTO "remix_tag" VALUES(2154,'brass',1);
+INSERT INTO "remix_tag" VALUES(2154,'epic',1);
+INSERT INTO "remix_tag" VALUES(2154,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2154,'strings',1);
+INSERT INTO "remix_tag" VALUES(2155,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2155,'funky',1);
+INSERT INTO "remix_tag" VALUES(2155,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2155,'synth',1);
+INSERT INTO "remix_tag" VALUES(2155,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2156,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2156,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2156,'synth',1);
+INSERT INTO "remix_tag" VALUES(2157,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2157,'chill',1);
+INSERT INTO "remix_tag" VALUES(2157,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2157,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2157,'synth',1);
+INSERT INTO "remix_tag" VALUES(2158,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2158,'disco',1);
+INSERT INTO "remix_tag" VALUES(2158,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2158,'funky',1);
+INSERT INTO "remix_tag" VALUES(2158,'synth',1);
+INSERT INTO "remix_tag" VALUES(2159,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2159,'choir',1);
+INSERT INTO "remix_tag" VALUES(2159,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2159,'piano',1);
+INSERT INTO "remix_tag" VALUES(2159,'synth',1);
+INSERT INTO "remix_tag" VALUES(2160,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2160,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2160,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2160,'synth',1);
+INSERT INTO "remix_tag" VALUES(2160,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2161,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2161,'funky',1);
+INSERT INTO "remix_tag" VALUES(2161,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2161,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2161,'synth',1);
+INSERT INTO "remix_tag" VALUES(2161,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2162,'collab',1);
+INSERT INTO "remix_tag" VALUES(2162,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2162,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2162,'rock',1);
+INSERT INTO "remix_tag" VALUES(2162,'singing',1);
+INSERT INTO "remix_tag" VALUES(2162,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2162,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2164,'dark',1);
+INSERT INTO "remix_tag" VALUES(2164,'strings',1);
+INSERT INTO "remix_tag" VALUES(2164,'world',1);
+INSERT INTO "remix_tag" VALUES(2165,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2165,'flute',1);
+INSERT INTO "remix_tag" VALUES(2165,'latin',1);
+INSERT INTO "remix_tag" VALUES(2165,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2166,'brass',1);
+INSERT INTO "remix_tag" VALUES(2166,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2166,'dark',1);
+INSERT INTO "remix_tag" VALUES(2166,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2166,'strings',1);
+INSERT INTO "remix_tag" VALUES(2167,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2167,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2167,'metal',1);
+INSERT INTO "remix_tag" VALUES(2167,'piano',1);
+INSERT INTO "remix_tag" VALUES(2167,'synth',1);
+INSERT INTO "remix_tag" VALUES(2168,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2168,'synth',1);
+INSERT INTO "remix_tag" VALUES(2169,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2169,'dark',1);
+INSERT INTO "remix_tag" VALUES(2169,'piano',1);
+INSERT INTO "remix_tag" VALUES(2169,'strings',1);
+INSERT INTO "remix_tag" VALUES(2169,'synth',1);
+INSERT INTO "remix_tag" VALUES(2170,'collab',1);
+INSERT INTO "remix_tag" VALUES(2170,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2170,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2170,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2170,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2170,'rock',1);
+INSERT INTO "remix_tag" VALUES(2170,'strings',1);
+INSERT INTO "remix_tag" VALUES(2170,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2170,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2171,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2171,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2171,'synth',1);
+INSERT INTO "remix_tag" VALUES(2172,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2172,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2172,'metal',1);
+INSERT INTO "remix_tag" VALUES(2172,'rock',1);
+INSERT INTO "remix_tag" VALUES(2173,'dance',1);
+INSERT INTO "remix_tag" VALUES(2173,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2173,'happy',1);
+INSERT INTO "remix_tag" VALUES(2173,'piano',1);
+INSERT INTO "remix_tag" VALUES(2173,'synth',1);
+INSERT INTO "remix_tag" VALUES(2173,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2174,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2174,'rock',1);
+INSERT INTO "remix_tag" VALUES(2174,'synth',1);
+INSERT INTO "remix_tag" VALUES(2174,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2175,'brass',1);
+INSERT INTO "remix_tag" VALUES(2175,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2175,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2175,'latin',1);
+INSERT INTO "remix_tag" VALUES(2175,'piano',1);
+INSERT INTO "remix_tag" VALUES(2176,'chill',1);
+INSERT INTO "remix_tag" VALUES(2176,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2176,'koto',1);
+INSERT INTO "remix_tag" VALUES(2176,'synth',1);
+INSERT INTO "remix_tag" VALUES(2176,'world',1);
+INSERT INTO "remix_tag" VALUES(2177,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2177,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2177,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2177,'synth',1);
+INSERT INTO "remix_tag" VALUES(2178,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2178,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2178,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2178,'metal',1);
+INSERT INTO "remix_tag" VALUES(2178,'synth',1);
+INSERT INTO "remix_tag" VALUES(2179,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2179,'collab',1);
+INSERT INTO "remix_tag" VALUES(2179,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2179,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2179,'metal',1);
+INSERT INTO "remix_tag" VALUES(2179,'rock',1);
+INSERT INTO "remix_tag" VALUES(2179,'singing',1);
+INSERT INTO "remix_tag" VALUES(2179,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2180,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2180,'brass',1);
+INSERT INTO "remix_tag" VALUES(2180,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(2180,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2180,'funk',1);
+INSERT INTO "remix_tag" VALUES(2180,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2180,'piano',1);
+INSERT INTO "remix_tag" VALUES(2181,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2181,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2181,'strings',1);
+INSERT INTO "remix_tag" VALUES(2181,'synth',1);
+INSERT INTO "remix_tag" VALUES(2182,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2182,'dark',1);
+INSERT INTO "remix_tag" VALUES(2182,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2182,'synth',1);
+INSERT INTO "remix_tag" VALUES(2182,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(2183,'classical',1);
+INSERT INTO "remix_tag" VALUES(2183,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2183,'piano',1);
+INSERT INTO "remix_tag" VALUES(2183,'solo',1);
+INSERT INTO "remix_tag" VALUES(2184,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2184,'chill',1);
+INSERT INTO "remix_tag" VALUES(2184,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2184,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2184,'sad',1);
+INSERT INTO "remix_tag" VALUES(2184,'synth',1);
+INSERT INTO "remix_tag" VALUES(2185,'dark',1);
+INSERT INTO "remix_tag" VALUES(2185,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2185,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2185,'synth',1);
+INSERT INTO "remix_tag" VALUES(2186,'choir',1);
+INSERT INTO "remix_tag" VALUES(2186,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2186,'dark',1);
+INSERT INTO "remix_tag" VALUES(2186,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2186,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2186,'strings',1);
+INSERT INTO "remix_tag" VALUES(2187,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2187,'funk',1);
+INSERT INTO "remix_tag" VALUES(2187,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2187,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2187,'strings',1);
+INSERT INTO "remix_tag" VALUES(2187,'world',1);
+INSERT INTO "remix_tag" VALUES(2188,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2188,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2188,'strings',1);
+INSERT INTO "remix_tag" VALUES(2188,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2188,'world',1);
+INSERT INTO "remix_tag" VALUES(2189,'dance',1);
+INSERT INTO "remix_tag" VALUES(2189,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2189,'synth',1);
+INSERT INTO "remix_tag" VALUES(2190,'dance',1);
+INSERT INTO "remix_tag" VALUES(2190,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2190,'happy',1);
+INSERT INTO "remix_tag" VALUES(2190,'piano',1);
+INSERT INTO "remix_tag" VALUES(2190,'pop',1);
+INSERT INTO "remix_tag" VALUES(2190,'synth',1);
+INSERT INTO "remix_tag" VALUES(2191,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2191,'chill',1);
+INSERT INTO "remix_tag" VALUES(2191,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2191,'synth',1);
+INSERT INTO "remix_tag" VALUES(2192,'collab',1);
+INSERT INTO "remix_tag" VALUES(2192,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2192,'piano',1);
+INSERT INTO "remix_tag" VALUES(2192,'rock',1);
+INSERT INTO "remix_tag" VALUES(2192,'synth',1);
+INSERT INTO "remix_tag" VALUES(2193,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2193,'dark',1);
+INSERT INTO "remix_tag" VALUES(2193,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2193,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2193,'piano',1);
+INSERT INTO "remix_tag" VALUES(2193,'synth',1);
+INSERT INTO "remix_tag" VALUES(2194,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2194,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2194,'rock',1);
+INSERT INTO "remix_tag" VALUES(2194,'synth',1);
+INSERT INTO "remix_tag" VALUES(2195,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2195,'rock',1);
+INSERT INTO "remix_tag" VALUES(2195,'synth',1);
+INSERT INTO "remix_tag" VALUES(2196,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2196,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2196,'happy',1);
+INSERT INTO "remix_tag" VALUES(2196,'synth',1);
+INSERT INTO "remix_tag" VALUES(2197,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2197,'dark',1);
+INSERT INTO "remix_tag" VALUES(2197,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2197,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2197,'synth',1);
+INSERT INTO "remix_tag" VALUES(2198,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2198,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2198,'happy',1);
+INSERT INTO "remix_tag" VALUES(2198,'synth',1);
+INSERT INTO "remix_tag" VALUES(2199,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2199,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2199,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2199,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2200,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2200,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2200,'rnb',1);
+INSERT INTO "remix_tag" VALUES(2200,'singing',1);
+INSERT INTO "remix_tag" VALUES(2200,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2201,'chill',1);
+INSERT INTO "remix_tag" VALUES(2201,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2201,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2201,'piano',1);
+INSERT INTO "remix_tag" VALUES(2201,'rock',1);
+INSERT INTO "remix_tag" VALUES(2202,'folk',1);
+INSERT INTO "remix_tag" VALUES(2202,'slavic',1);
+INSERT INTO "remix_tag" VALUES(2203,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2203,'piano',1);
+INSERT INTO "remix_tag" VALUES(2203,'synth',1);
+INSERT INTO "remix_tag" VALUES(2203,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2204,'funny',1);
+INSERT INTO "remix_tag" VALUES(2204,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2204,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2204,'singing',1);
+INSERT INTO "remix_tag" VALUES(2204,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2205,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2205,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2205,'synth',1);
+INSERT INTO "remix_tag" VALUES(2206,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2206,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2206,'rock',1);
+INSERT INTO "remix_tag" VALUES(2207,'epic',1);
+INSERT INTO "remix_tag" VALUES(2207,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2207,'piano',1);
+INSERT INTO "remix_tag" VALUES(2207,'strings',1);
+INSERT INTO "remix_tag" VALUES(2207,'world',1);
+INSERT INTO "remix_tag" VALUES(2208,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2208,'funk',1);
+INSERT INTO "remix_tag" VALUES(2208,'funky',1);
+INSERT INTO "remix_tag" VALUES(2208,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2208,'strings',1);
+INSERT INTO "remix_tag" VALUES(2209,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2209,'latin',1);
+INSERT INTO "remix_tag" VALUES(2209,'piano',1);
+INSERT INTO "remix_tag" VALUES(2210,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2210,'funk',1);
+INSERT INTO "remix_tag" VALUES(2210,'japanese',1);
+INSERT INTO "remix_tag" VALUES(2210,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2210,'koto',1);
+INSERT INTO "remix_tag" VALUES(2210,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2210,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2211,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2211,'funk',1);
+INSERT INTO "remix_tag" VALUES(2211,'piano',1);
+INSERT INTO "remix_tag" VALUES(2211,'synth',1);
+INSERT INTO "remix_tag" VALUES(2211,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2211,'world',1);
+INSERT INTO "remix_tag" VALUES(2212,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2212,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2212,'pop',1);
+INSERT INTO "remix_tag" VALUES(2212,'singing',1);
+INSERT INTO "remix_tag" VALUES(2212,'synth',1);
+INSERT INTO "remix_tag" VALUES(2212,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2212,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2213,'choir',1);
+INSERT INTO "remix_tag" VALUES(2213,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2213,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2213,'piano',1);
+INSERT INTO "remix_tag" VALUES(2213,'strings',1);
+INSERT INTO "remix_tag" VALUES(2214,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2214,'rock',1);
+INSERT INTO "remix_tag" VALUES(2214,'synth',1);
+INSERT INTO "remix_tag" VALUES(2214,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2215,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2215,'synth',1);
+INSERT INTO "remix_tag" VALUES(2215,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2216,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2216,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2216,'synth',1);
+INSERT INTO "remix_tag" VALUES(2216,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2217,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2217,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2217,'metal',1);
+INSERT INTO "remix_tag" VALUES(2217,'organ',1);
+INSERT INTO "remix_tag" VALUES(2217,'rock',1);
+INSERT INTO "remix_tag" VALUES(2218,'chill',1);
+INSERT INTO "remix_tag" VALUES(2218,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2218,'synth',1);
+INSERT INTO "remix_tag" VALUES(2219,'collab',1);
+INSERT INTO "remix_tag" VALUES(2219,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2219,'rock',1);
+INSERT INTO "remix_tag" VALUES(2219,'synth',1);
+INSERT INTO "remix_tag" VALUES(2219,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2220,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2220,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2220,'funky',1);
+INSERT INTO "remix_tag" VALUES(2220,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2220,'sexy',1);
+INSERT INTO "remix_tag" VALUES(2220,'synth',1);
+INSERT INTO "remix_tag" VALUES(2221,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2221,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2221,'funky',1);
+INSERT INTO "remix_tag" VALUES(2222,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2222,'collab',1);
+INSERT INTO "remix_tag" VALUES(2222,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2222,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2222,'singing',1);
+INSERT INTO "remix_tag" VALUES(2222,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2222,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2223,'funk',1);
+INSERT INTO "remix_tag" VALUES(2223,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2223,'synth',1);
+INSERT INTO "remix_tag" VALUES(2224,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2224,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2224,'synth',1);
+INSERT INTO "remix_tag" VALUES(2225,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2225,'piano',1);
+INSERT INTO "remix_tag" VALUES(2225,'solo',1);
+INSERT INTO "remix_tag" VALUES(2226,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2226,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2226,'synth',1);
+INSERT INTO "remix_tag" VALUES(2227,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2227,'synth',1);
+INSERT INTO "remix_tag" VALUES(2228,'brass',1);
+INSERT INTO "remix_tag" VALUES(2228,'epic',1);
+INSERT INTO "remix_tag" VALUES(2228,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2228,'strings',1);
+INSERT INTO "remix_tag" VALUES(2229,'chill',1);
+INSERT INTO "remix_tag" VALUES(2229,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2229,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(2229,'strings',1);
+INSERT INTO "remix_tag" VALUES(2229,'synth',1);
+INSERT INTO "remix_tag" VALUES(2230,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2230,'collab',1);
+INSERT INTO "remix_tag" VALUES(2230,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2231,'choir',1);
+INSERT INTO "remix_tag" VALUES(2231,'dark',1);
+INSERT INTO "remix_tag" VALUES(2231,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2231,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2231,'organ',1);
+INSERT INTO "remix_tag" VALUES(2232,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2232,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2232,'synth',1);
+INSERT INTO "remix_tag" VALUES(2233,'chill',1);
+INSERT INTO "remix_tag" VALUES(2233,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2233,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2233,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2233,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2233,'strings',1);
+INSERT INTO "remix_tag" VALUES(2234,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2234,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2234,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2234,'piano',1);
+INSERT INTO "remix_tag" VALUES(2234,'singing',1);
+INSERT INTO "remix_tag" VALUES(2234,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2235,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2235,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2235,'epic',1);
+INSERT INTO "remix_tag" VALUES(2235,'medley',1);
+INSERT INTO "remix_tag" VALUES(2235,'strings',1);
+INSERT INTO "remix_tag" VALUES(2235,'synth',1);
+INSERT INTO "remix_tag" VALUES(2236,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2236,'piano',1);
+INSERT INTO "remix_tag" VALUES(2236,'rock',1);
+INSERT INTO "remix_tag" VALUES(2237,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2237,'synth',1);
+INSERT INTO "remix_tag" VALUES(2238,'dark',1);
+INSERT INTO "remix_tag" VALUES(2238,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2238,'energetic',1);
+INSERT INTO "remix_tag" VALUES(2238,'singing',1);
+INSERT INTO "remix_tag" VALUES(2238,'synth',1);
+INSERT INTO "remix_tag" VALUES(2238,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(2238,'trance',1);
+INSERT INTO "remix_tag" VALUES(2238,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2238,'workout',1);
+INSERT INTO "remix_tag" VALUES(2239,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2239,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2239,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2239,'synth',1);
+INSERT INTO "remix_tag" VALUES(2240,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2240,'synth',1);
+INSERT INTO "remix_tag" VALUES(2240,'trance',1);
+INSERT INTO "remix_tag" VALUES(2241,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2241,'collab',1);
+INSERT INTO "remix_tag" VALUES(2241,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2241,'metal',1);
+INSERT INTO "remix_tag" VALUES(2241,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2241,'rock',1);
+INSERT INTO "remix_tag" VALUES(2241,'synth',1);
+INSERT INTO "remix_tag" VALUES(2242,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2242,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2242,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2242,'singing',1);
+INSERT INTO "remix_tag" VALUES(2242,'synth',1);
+INSERT INTO "remix_tag" VALUES(2242,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2243,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2243,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2243,'dark',1);
+INSERT INTO "remix_tag" VALUES(2243,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2243,'synth',1);
+INSERT INTO "remix_tag" VALUES(2244,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2244,'funky',1);
+INSERT INTO "remix_tag" VALUES(2244,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2244,'synth',1);
+INSERT INTO "remix_tag" VALUES(2245,'collab',1);
+INSERT INTO "remix_tag" VALUES(2245,'disco',1);
+INSERT INTO "remix_tag" VALUES(2245,'funk',1);
+INSERT INTO "remix_tag" VALUES(2245,'piano',1);
+INSERT INTO "remix_tag" VALUES(2245,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2245,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2245,'synth',1);
+INSERT INTO "remix_tag" VALUES(2246,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2246,'synth',1);
+INSERT INTO "remix_tag" VALUES(2247,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2247,'choir',1);
+INSERT INTO "remix_tag" VALUES(2247,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2247,'metal',1);
+INSERT INTO "remix_tag" VALUES(2247,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2247,'rock',1);
+INSERT INTO "remix_tag" VALUES(2248,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2248,'funky',1);
+INSERT INTO "remix_tag" VALUES(2248,'synth',1);
+INSERT INTO "remix_tag" VALUES(2249,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2249,'chill',1);
+INSERT INTO "remix_tag" VALUES(2249,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2249,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2249,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2249,'synth',1);
+INSERT INTO "remix_tag" VALUES(2250,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2250,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2250,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2250,'synth',1);
+INSERT INTO "remix_tag" VALUES(2251,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2251,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2251,'funky',1);
+INSERT INTO "remix_tag" VALUES(2251,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2251,'synth',1);
+INSERT INTO "remix_tag" VALUES(2252,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2252,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2252,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2252,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2252,'strings',1);
+INSERT INTO "remix_tag" VALUES(2252,'synth',1);
+INSERT INTO "remix_tag" VALUES(2253,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2253,'collab',1);
+INSERT INTO "remix_tag" VALUES(2253,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2253,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2253,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2253,'synth',1);
+INSERT INTO "remix_tag" VALUES(2254,'brass',1);
+INSERT INTO "remix_tag" VALUES(2254,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2254,'funny',1);
+INSERT INTO "remix_tag" VALUES(2254,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2254,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2254,'singing',1);
+INSERT INTO "remix_tag" VALUES(2254,'ska',1);
+INSERT INTO "remix_tag" VALUES(2254,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2254,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2255,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2255,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2255,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2255,'medley',1);
+INSERT INTO "remix_tag" VALUES(2255,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2255,'synth',1);
+INSERT INTO "remix_tag" VALUES(2256,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2256,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2256,'piano',1);
+INSERT INTO "remix_tag" VALUES(2256,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2256,'synth',1);
+INSERT INTO "remix_tag" VALUES(2257,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2257,'synth',1);
+INSERT INTO "remix_tag" VALUES(2257,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2258,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2258,'latin',1);
+INSERT INTO "remix_tag" VALUES(2258,'piano',1);
+INSERT INTO "remix_tag" VALUES(2258,'solo',1);
+INSERT INTO "remix_tag" VALUES(2259,'collab',1);
+INSERT INTO "remix_tag" VALUES(2259,'disco',1);
+INSERT INTO "remix_tag" VALUES(2259,'funky',1);
+INSERT INTO "remix_tag" VALUES(2259,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2259,'pop',1);
+INSERT INTO "remix_tag" VALUES(2259,'singing',1);
+INSERT INTO "remix_tag" VALUES(2259,'synth',1);
+INSERT INTO "remix_tag" VALUES(2259,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2260,'collab',1);
+INSERT INTO "remix_tag" VALUES(2260,'funky',1);
+INSERT INTO "remix_tag" VALUES(2260,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2260,'synth',1);
+INSERT INTO "remix_tag" VALUES(2260,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2260,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2261,'fusion',1);
+INSERT INTO "remix_tag" VALUES(2261,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2261,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2261,'piano',1);
+INSERT INTO "remix_tag" VALUES(2261,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2262,'collab',1);
+INSERT INTO "remix_tag" VALUES(2262,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2262,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2262,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2262,'metal',1);
+INSERT INTO "remix_tag" VALUES(2262,'rock',1);
+INSERT INTO "remix_tag" VALUES(2262,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2262,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2262,'synth',1);
+INSERT INTO "remix_tag" VALUES(2262,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2262,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2263,'brass',1);
+INSERT INTO "remix_tag" VALUES(2263,'classical',1);
+INSERT INTO "remix_tag" VALUES(2263,'collab',1);
+INSERT INTO "remix_tag" VALUES(2263,'dark',1);
+INSERT INTO "remix_tag" VALUES(2263,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2263,'lang-french',1);
+INSERT INTO "remix_tag" VALUES(2263,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(2263,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2263,'opera',1);
+INSERT INTO "remix_tag" VALUES(2263,'singing',1);
+INSERT INTO "remix_tag" VALUES(2263,'strings',1);
+INSERT INTO "remix_tag" VALUES(2263,'synth',1);
+INSERT INTO "remix_tag" VALUES(2263,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2263,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2263,'world',1);
+INSERT INTO "remix_tag" VALUES(2264,'dance',1);
+INSERT INTO "remix_tag" VALUES(2264,'happy',1);
+INSERT INTO "remix_tag" VALUES(2264,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2264,'pop',1);
+INSERT INTO "remix_tag" VALUES(2264,'singing',1);
+INSERT INTO "remix_tag" VALUES(2264,'synth',1);
+INSERT INTO "remix_tag" VALUES(2264,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2266,'chill',1);
+INSERT INTO "remix_tag" VALUES(2266,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2266,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2266,'synth',1);
+INSERT INTO "remix_tag" VALUES(2267,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2267,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2267,'pop',1);
+INSERT INTO "remix_tag" VALUES(2267,'synth',1);
+INSERT INTO "remix_tag" VALUES(2267,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2268,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2268,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2268,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2269,'chill',1);
+INSERT INTO "remix_tag" VALUES(2269,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2269,'collab',1);
+INSERT INTO "remix_tag" VALUES(2269,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2269,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2269,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2269,'synth',1);
+INSERT INTO "remix_tag" VALUES(2270,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2270,'dark',1);
+INSERT INTO "remix_tag" VALUES(2270,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2270,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2270,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2271,'chill',1);
+INSERT INTO "remix_tag" VALUES(2271,'choir',1);
+INSERT INTO "remix_tag" VALUES(2271,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2271,'piano',1);
+INSERT INTO "remix_tag" VALUES(2271,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2271,'synth',1);
+INSERT INTO "remix_tag" VALUES(2272,'organ',1);
+INSERT INTO "remix_tag" VALUES(2272,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2272,'rock',1);
+INSERT INTO "remix_tag" VALUES(2272,'synth',1);
+INSERT INTO "remix_tag" VALUES(2273,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2273,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2273,'metal',1);
+INSERT INTO "remix_tag" VALUES(2273,'rock',1);
+INSERT INTO "remix_tag" VALUES(2273,'synth',1);
+INSERT INTO "remix_tag" VALUES(2274,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2274,'choir',1);
+INSERT INTO "remix_tag" VALUES(2274,'dark',1);
+INSERT INTO "remix_tag" VALUES(2274,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2274,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2274,'piano',1);
+INSERT INTO "remix_tag" VALUES(2274,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2274,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2274,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(2275,'brass',1);
+INSERT INTO "remix_tag" VALUES(2275,'choir',1);
+INSERT INTO "remix_tag" VALUES(2275,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2275,'dark',1);
+INSERT INTO "remix_tag" VALUES(2275,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2275,'strings',1);
+INSERT INTO "remix_tag" VALUES(2276,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2276,'collab',1);
+INSERT INTO "remix_tag" VALUES(2276,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2276,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2276,'rock',1);
+INSERT INTO "remix_tag" VALUES(2276,'synth',1);
+INSERT INTO "remix_tag" VALUES(2277,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(2277,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2277,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2277,'piano',1);
+INSERT INTO "remix_tag" VALUES(2277,'strings',1);
+INSERT INTO "remix_tag" VALUES(2277,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2278,'classical',1);
+INSERT INTO "remix_tag" VALUES(2278,'collab',1);
+INSERT INTO "remix_tag" VALUES(2278,'duet',1);
+INSERT INTO "remix_tag" VALUES(2278,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2278,'medley',1);
+INSERT INTO "remix_tag" VALUES(2278,'piano',1);
+INSERT INTO "remix_tag" VALUES(2278,'violin',1);
+INSERT INTO "remix_tag" VALUES(2279,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2279,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2279,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2279,'metal',1);
+INSERT INTO "remix_tag" VALUES(2279,'rock',1);
+INSERT INTO "remix_tag" VALUES(2279,'synth',1);
+INSERT INTO "remix_tag" VALUES(2279,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2279,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2280,'rock',1);
+INSERT INTO "remix_tag" VALUES(2280,'synth',1);
+INSERT INTO "remix_tag" VALUES(2281,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2281,'funk',1);
+INSERT INTO "remix_tag" VALUES(2281,'synth',1);
+INSERT INTO "remix_tag" VALUES(2282,'collab',1);
+INSERT INTO "remix_tag" VALUES(2282,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2282,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2282,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2282,'synth',1);
+INSERT INTO "remix_tag" VALUES(2283,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2283,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2283,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2283,'fusion',1);
+INSERT INTO "remix_tag" VALUES(2283,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2283,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2283,'rock',1);
+INSERT INTO "remix_tag" VALUES(2283,'synth',1);
+INSERT INTO "remix_tag" VALUES(2284,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2284,'funky',1);
+INSERT INTO "remix_tag" VALUES(2284,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2284,'synth',1);
+INSERT INTO "remix_tag" VALUES(2285,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2285,'rock',1);
+INSERT INTO "remix_tag" VALUES(2285,'synth',1);
+INSERT INTO "remix_tag" VALUES(2285,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2286,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2286,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2286,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2286,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2286,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2286,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2286,'sexy',1);
+INSERT INTO "remix_tag" VALUES(2287,'dance',1);
+INSERT INTO "remix_tag" VALUES(2287,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2287,'synth',1);
+INSERT INTO "remix_tag" VALUES(2288,'dark',1);
+INSERT INTO "remix_tag" VALUES(2288,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2288,'piano',1);
+INSERT INTO "remix_tag" VALUES(2288,'strings',1);
+INSERT INTO "remix_tag" VALUES(2288,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2289,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2289,'synth',1);
+INSERT INTO "remix_tag" VALUES(2289,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2290,'disco',1);
+INSERT INTO "remix_tag" VALUES(2290,'funk',1);
+INSERT INTO "remix_tag" VALUES(2290,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2290,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2290,'singing',1);
+INSERT INTO "remix_tag" VALUES(2290,'synth',1);
+INSERT INTO "remix_tag" VALUES(2290,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2291,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2291,'punk',1);
+INSERT INTO "remix_tag" VALUES(2291,'rock',1);
+INSERT INTO "remix_tag" VALUES(2291,'synth',1);
+INSERT INTO "remix_tag" VALUES(2291,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2292,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2292,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2292,'synth',1);
+INSERT INTO "remix_tag" VALUES(2293,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2293,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2293,'rock',1);
+INSERT INTO "remix_tag" VALUES(2294,'brass',1);
+INSERT INTO "remix_tag" VALUES(2294,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2294,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2294,'strings',1);
+INSERT INTO "remix_tag" VALUES(2295,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2295,'collab',1);
+INSERT INTO "remix_tag" VALUES(2295,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2295,'metal',1);
+INSERT INTO "remix_tag" VALUES(2295,'organ',1);
+INSERT INTO "remix_tag" VALUES(2295,'piano',1);
+INSERT INTO "remix_tag" VALUES(2295,'rock',1);
+INSERT INTO "remix_tag" VALUES(2295,'synth',1);
+INSERT INTO "remix_tag" VALUES(2296,'collab',1);
+INSERT INTO "remix_tag" VALUES(2296,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2296,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2296,'rock',1);
+INSERT INTO "remix_tag" VALUES(2296,'singing',1);
+INSERT INTO "remix_tag" VALUES(2296,'synth',1);
+INSERT INTO "remix_tag" VALUES(2296,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2297,'funk',1);
+INSERT INTO "remix_tag" VALUES(2297,'funky',1);
+INSERT INTO "remix_tag" VALUES(2297,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2297,'piano',1);
+INSERT INTO "remix_tag" VALUES(2297,'sexy',1);
+INSERT INTO "remix_tag" VALUES(2297,'singing',1);
+INSERT INTO "remix_tag" VALUES(2297,'synth',1);
+INSERT INTO "remix_tag" VALUES(2297,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2298,'chill',1);
+INSERT INTO "remix_tag" VALUES(2298,'collab',1);
+INSERT INTO "remix_tag" VALUES(2298,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2298,'synth',1);
+INSERT INTO "remix_tag" VALUES(2298,'violin',1);
+INSERT INTO "remix_tag" VALUES(2299,'dance',1);
+INSERT INTO "remix_tag" VALUES(2299,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2299,'synth',1);
+INSERT INTO "remix_tag" VALUES(2300,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2300,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2300,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2300,'rock',1);
+INSERT INTO "remix_tag" VALUES(2301,'funk',1);
+INSERT INTO "remix_tag" VALUES(2301,'funky',1);
+INSERT INTO "remix_tag" VALUES(2301,'organ',1);
+INSERT INTO "remix_tag" VALUES(2301,'synth',1);
+INSERT INTO "remix_tag" VALUES(2301,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2302,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2302,'choir',1);
+INSERT INTO "remix_tag" VALUES(2302,'dance',1);
+INSERT INTO "remix_tag" VALUES(2302,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2302,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2302,'synth',1);
+INSERT INTO "remix_tag" VALUES(2303,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2303,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2303,'synth',1);
+INSERT INTO "remix_tag" VALUES(2303,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2303,'trance',1);
+INSERT INTO "remix_tag" VALUES(2304,'dance',1);
+INSERT INTO "remix_tag" VALUES(2304,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2304,'pop',1);
+INSERT INTO "remix_tag" VALUES(2304,'synth',1);
+INSERT INTO "remix_tag" VALUES(2304,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2305,'disco',1);
+INSERT INTO "remix_tag" VALUES(2305,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(2305,'strings',1);
+INSERT INTO "remix_tag" VALUES(2305,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2306,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2306,'collab',1);
+INSERT INTO "remix_tag" VALUES(2306,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2306,'rock',1);
+INSERT INTO "remix_tag" VALUES(2306,'synth',1);
+INSERT INTO "remix_tag" VALUES(2307,'collab',1);
+INSERT INTO "remix_tag" VALUES(2307,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2307,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2307,'indian',1);
+INSERT INTO "remix_tag" VALUES(2307,'strings',1);
+INSERT INTO "remix_tag" VALUES(2307,'synth',1);
+INSERT INTO "remix_tag" VALUES(2307,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2308,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2308,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2308,'metal',1);
+INSERT INTO "remix_tag" VALUES(2308,'rock',1);
+INSERT INTO "remix_tag" VALUES(2308,'synth',1);
+INSERT INTO "remix_tag" VALUES(2309,'collab',1);
+INSERT INTO "remix_tag" VALUES(2309,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2309,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2309,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2309,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2309,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2310,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2310,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2310,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2310,'synth',1);
+INSERT INTO "remix_tag" VALUES(2311,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2311,'piano',1);
+INSERT INTO "remix_tag" VALUES(2311,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2311,'solo',1);
+INSERT INTO "remix_tag" VALUES(2312,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(2312,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2312,'piano',1);
+INSERT INTO "remix_tag" VALUES(2312,'solo',1);
+INSERT INTO "remix_tag" VALUES(2313,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2313,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2313,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2313,'synth',1);
+INSERT INTO "remix_tag" VALUES(2314,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2314,'funky',1);
+INSERT INTO "remix_tag" VALUES(2314,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2314,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2314,'synth',1);
+INSERT INTO "remix_tag" VALUES(2315,'brass',1);
+INSERT INTO "remix_tag" VALUES(2315,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2315,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2315,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2315,'strings',1);
+INSERT INTO "remix_tag" VALUES(2316,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2316,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2316,'organ',1);
+INSERT INTO "remix_tag" VALUES(2316,'piano',1);
+INSERT INTO "remix_tag" VALUES(2316,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2316,'rock',1);
+INSERT INTO "remix_tag" VALUES(2316,'synth',1);
+INSERT INTO "remix_tag" VALUES(2317,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2317,'chill',1);
+INSERT INTO "remix_tag" VALUES(2317,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2317,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2317,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2317,'pop',1);
+INSERT INTO "remix_tag" VALUES(2317,'rock',1);
+INSERT INTO "remix_tag" VALUES(2318,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2318,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2318,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2318,'piano',1);
+INSERT INTO "remix_tag" VALUES(2318,'strings',1);
+INSERT INTO "remix_tag" VALUES(2318,'synth',1);
+INSERT INTO "remix_tag" VALUES(2319,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2319,'collab',1);
+INSERT INTO "remix_tag" VALUES(2319,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2319,'funny',1);
+INSERT INTO "remix_tag" VALUES(2319,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2319,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2319,'rock',1);
+INSERT INTO "remix_tag" VALUES(2319,'singing',1);
+INSERT INTO "remix_tag" VALUES(2319,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2319,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2320,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2320,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2320,'rock',1);
+INSERT INTO "remix_tag" VALUES(2320,'singing',1);
+INSERT INTO "remix_tag" VALUES(2320,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2320,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2321,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2321,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2321,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2321,'happy',1);
+INSERT INTO "remix_tag" VALUES(2321,'pop',1);
+INSERT INTO "remix_tag" VALUES(2321,'synth',1);
+INSERT INTO "remix_tag" VALUES(2321,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2322,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2322,'dance',1);
+INSERT INTO "remix_tag" VALUES(2322,'dark',1);
+INSERT INTO "remix_tag" VALUES(2322,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2322,'synth',1);
+INSERT INTO "remix_tag" VALUES(2324,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2324,'collab',1);
+INSERT INTO "remix_tag" VALUES(2324,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2324,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2324,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2324,'piano',1);
+INSERT INTO "remix_tag" VALUES(2324,'synth',1);
+INSERT INTO "remix_tag" VALUES(2325,'collab',1);
+INSERT INTO "remix_tag" VALUES(2325,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2325,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2325,'piano',1);
+INSERT INTO "remix_tag" VALUES(2325,'sad',1);
+INSERT INTO "remix_tag" VALUES(2325,'singing',1);
+INSERT INTO "remix_tag" VALUES(2325,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2325,'strings',1);
+INSERT INTO "remix_tag" VALUES(2325,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2325,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2326,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2326,'compo',1);
+INSERT INTO "remix_tag" VALUES(2326,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2326,'synth',1);
+INSERT INTO "remix_tag" VALUES(2326,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2327,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2327,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2327,'happy',1);
+INSERT INTO "remix_tag" VALUES(2327,'piano',1);
+INSERT INTO "remix_tag" VALUES(2327,'pop',1);
+INSERT INTO "remix_tag" VALUES(2327,'synth',1);
+INSERT INTO "remix_tag" VALUES(2327,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2328,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2328,'collab',1);
+INSERT INTO "remix_tag" VALUES(2328,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2328,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2328,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2328,'synth',1);
+INSERT INTO "remix_tag" VALUES(2328,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2328,'violin',1);
+INSERT INTO "remix_tag" VALUES(2329,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2329,'piano',1);
+INSERT INTO "remix_tag" VALUES(2329,'sad',1);
+INSERT INTO "remix_tag" VALUES(2329,'solo',1);
+INSERT INTO "remix_tag" VALUES(2330,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2330,'celtic',1);
+INSERT INTO "remix_tag" VALUES(2330,'folk',1);
+INSERT INTO "remix_tag" VALUES(2330,'singing',1);
+INSERT INTO "remix_tag" VALUES(2330,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2330,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2331,'brass',1);
+INSERT INTO "remix_tag" VALUES(2331,'funk',1);
+INSERT INTO "remix_tag" VALUES(2331,'funky',1);
+INSERT INTO "remix_tag" VALUES(2331,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2331,'strings',1);
+INSERT INTO "remix_tag" VALUES(2331,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2331,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2331,'world',1);
+INSERT INTO "remix_tag" VALUES(2332,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2332,'dark',1);
+INSERT INTO "remix_tag" VALUES(2332,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2332,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2332,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2332,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2332,'strings',1);
+INSERT INTO "remix_tag" VALUES(2332,'synth',1);
+INSERT INTO "remix_tag" VALUES(2333,'dance',1);
+INSERT INTO "remix_tag" VALUES(2333,'dark',1);
+INSERT INTO "remix_tag" VALUES(2333,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2333,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2333,'strings',1);
+INSERT INTO "remix_tag" VALUES(2333,'synth',1);
+INSERT INTO "remix_tag" VALUES(2333,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2333,'trance',1);
+INSERT INTO "remix_tag" VALUES(2334,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2334,'piano',1);
+INSERT INTO "remix_tag" VALUES(2334,'strings',1);
+INSERT INTO "remix_tag" VALUES(2334,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2334,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2335,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2335,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2335,'metal',1);
+INSERT INTO "remix_tag" VALUES(2335,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2336,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2336,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2336,'rock',1);
+INSERT INTO "remix_tag" VALUES(2336,'synth',1);
+INSERT INTO "remix_tag" VALUES(2336,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2337,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2337,'synth',1);
+INSERT INTO "remix_tag" VALUES(2337,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2338,'classical',1);
+INSERT INTO "remix_tag" VALUES(2338,'piano',1);
+INSERT INTO "remix_tag" VALUES(2338,'solo',1);
+INSERT INTO "remix_tag" VALUES(2340,'dark',1);
+INSERT INTO "remix_tag" VALUES(2340,'electro',1);
+INSERT INTO "remix_tag" VALUES(2340,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2340,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(2340,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2340,'synth',1);
+INSERT INTO "remix_tag" VALUES(2340,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(2341,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2341,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2341,'epic',1);
+INSERT INTO "remix_tag" VALUES(2341,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2341,'rock',1);
+INSERT INTO "remix_tag" VALUES(2341,'strings',1);
+INSERT INTO "remix_tag" VALUES(2341,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2342,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2342,'dark',1);
+INSERT INTO "remix_tag" VALUES(2342,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2342,'metal',1);
+INSERT INTO "remix_tag" VALUES(2342,'rock',1);
+INSERT INTO "remix_tag" VALUES(2342,'synth',1);
+INSERT INTO "remix_tag" VALUES(2343,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2343,'classical',1);
+INSERT INTO "remix_tag" VALUES(2343,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2343,'strings',1);
+INSERT INTO "remix_tag" VALUES(2343,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2344,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2344,'choir',1);
+INSERT INTO "remix_tag" VALUES(2344,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2344,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2344,'rock',1);
+INSERT INTO "remix_tag" VALUES(2344,'synth',1);
+INSERT INTO "remix_tag" VALUES(2344,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2345,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2345,'collab',1);
+INSERT INTO "remix_tag" VALUES(2345,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2345,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2345,'metal',1);
+INSERT INTO "remix_tag" VALUES(2345,'rock',1);
+INSERT INTO "remix_tag" VALUES(2345,'synth',1);
+INSERT INTO "remix_tag" VALUES(2346,'dark',1);
+INSERT INTO "remix_tag" VALUES(2346,'piano',1);
+INSERT INTO "remix_tag" VALUES(2346,'solo',1);
+INSERT INTO "remix_tag" VALUES(2346,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2347,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2347,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2347,'piano',1);
+INSERT INTO "remix_tag" VALUES(2347,'synth',1);
+INSERT INTO "remix_tag" VALUES(2347,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2348,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2348,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2348,'chill',1);
+INSERT INTO "remix_tag" VALUES(2348,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2348,'rock',1);
+INSERT INTO "remix_tag" VALUES(2349,'dark',1);
+INSERT INTO "remix_tag" VALUES(2349,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2349,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2349,'synth',1);
+INSERT INTO "remix_tag" VALUES(2350,'disco',1);
+INSERT INTO "remix_tag" VALUES(2350,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2350,'funk',1);
+INSERT INTO "remix_tag" VALUES(2350,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2350,'piano',1);
+INSERT INTO "remix_tag" VALUES(2350,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2350,'strings',1);
+INSERT INTO "remix_tag" VALUES(2351,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2351,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2351,'dark',1);
+INSERT INTO "remix_tag" VALUES(2351,'strings',1);
+INSERT INTO "remix_tag" VALUES(2352,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2352,'choir',1);
+INSERT INTO "remix_tag" VALUES(2352,'collab',1);
+INSERT INTO "remix_tag" VALUES(2352,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2352,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2352,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2352,'synth',1);
+INSERT INTO "remix_tag" VALUES(2353,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2353,'choir',1);
+INSERT INTO "remix_tag" VALUES(2353,'dark',1);
+INSERT INTO "remix_tag" VALUES(2353,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2353,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2353,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2354,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2354,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2354,'piano',1);
+INSERT INTO "remix_tag" VALUES(2354,'synth',1);
+INSERT INTO "remix_tag" VALUES(2354,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2355,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2355,'synth',1);
+INSERT INTO "remix_tag" VALUES(2355,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2356,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2356,'dark',1);
+INSERT INTO "remix_tag" VALUES(2356,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2356,'strings',1);
+INSERT INTO "remix_tag" VALUES(2356,'synth',1);
+INSERT INTO "remix_tag" VALUES(2356,'world',1);
+INSERT INTO "remix_tag" VALUES(2357,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2357,'dark',1);
+INSERT INTO "remix_tag" VALUES(2357,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2357,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2357,'synth',1);
+INSERT INTO "remix_tag" VALUES(2357,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2357,'trance',1);
+INSERT INTO "remix_tag" VALUES(2358,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2358,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2358,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2358,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2358,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2359,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2359,'synth',1);
+INSERT INTO "remix_tag" VALUES(2359,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2359,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2360,'collab',1);
+INSERT INTO "remix_tag" VALUES(2360,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2360,'piano',1);
+INSERT INTO "remix_tag" VALUES(2360,'romantic',1);
+INSERT INTO "remix_tag" VALUES(2360,'solo',1);
+INSERT INTO "remix_tag" VALUES(2360,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2361,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2361,'collab',1);
+INSERT INTO "remix_tag" VALUES(2361,'dark',1);
+INSERT INTO "remix_tag" VALUES(2361,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2361,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2361,'rock',1);
+INSERT INTO "remix_tag" VALUES(2361,'synth',1);
+INSERT INTO "remix_tag" VALUES(2362,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2362,'dark',1);
+INSERT INTO "remix_tag" VALUES(2362,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2362,'rock',1);
+INSERT INTO "remix_tag" VALUES(2362,'synth',1);
+INSERT INTO "remix_tag" VALUES(2363,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2363,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2363,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2363,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2363,'singing',1);
+INSERT INTO "remix_tag" VALUES(2363,'synth',1);
+INSERT INTO "remix_tag" VALUES(2363,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2363,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(2364,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2364,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2364,'synth',1);
+INSERT INTO "remix_tag" VALUES(2364,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2365,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2365,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2365,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2365,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2365,'organ',1);
+INSERT INTO "remix_tag" VALUES(2365,'solo-guitar',1);
+INSERT INTO "remix_tag" VALUES(2366,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2366,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2366,'metal',1);
+INSERT INTO "remix_tag" VALUES(2366,'rock',1);
+INSERT INTO "remix_tag" VALUES(2366,'synth',1);
+INSERT INTO "remix_tag" VALUES(2367,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2367,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2367,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2367,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2367,'singing',1);
+INSERT INTO "remix_tag" VALUES(2367,'synth',1);
+INSERT INTO "remix_tag" VALUES(2367,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2367,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2368,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2368,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2368,'brass',1);
+INSERT INTO "remix_tag" VALUES(2368,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2368,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2368,'epic',1);
+INSERT INTO "remix_tag" VALUES(2368,'piano',1);
+INSERT INTO "remix_tag" VALUES(2368,'singing',1);
+INSERT INTO "remix_tag" VALUES(2368,'strings',1);
+INSERT INTO "remix_tag" VALUES(2368,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2369,'chill',1);
+INSERT INTO "remix_tag" VALUES(2369,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2369,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2369,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2369,'synth',1);
+INSERT INTO "remix_tag" VALUES(2369,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2370,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2370,'piano',1);
+INSERT INTO "remix_tag" VALUES(2370,'pop',1);
+INSERT INTO "remix_tag" VALUES(2370,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2371,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2371,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2371,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(2371,'synth',1);
+INSERT INTO "remix_tag" VALUES(2371,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2372,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2372,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2372,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2372,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2372,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2372,'synth',1);
+INSERT INTO "remix_tag" VALUES(2373,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2373,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2373,'synth',1);
+INSERT INTO "remix_tag" VALUES(2374,'brass',1);
+INSERT INTO "remix_tag" VALUES(2374,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2374,'dark',1);
+INSERT INTO "remix_tag" VALUES(2374,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2374,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2374,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2374,'strings',1);
+INSERT INTO "remix_tag" VALUES(2374,'synth',1);
+INSERT INTO "remix_tag" VALUES(2375,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2375,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2375,'singing',1);
+INSERT INTO "remix_tag" VALUES(2375,'strings',1);
+INSERT INTO "remix_tag" VALUES(2375,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2376,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2376,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2376,'folk',1);
+INSERT INTO "remix_tag" VALUES(2376,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2376,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2376,'singing',1);
+INSERT INTO "remix_tag" VALUES(2376,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2376,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2377,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2377,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2377,'collab',1);
+INSERT INTO "remix_tag" VALUES(2377,'flute',1);
+INSERT INTO "remix_tag" VALUES(2377,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2377,'sad',1);
+INSERT INTO "remix_tag" VALUES(2378,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2378,'happy',1);
+INSERT INTO "remix_tag" VALUES(2378,'pop',1);
+INSERT INTO "remix_tag" VALUES(2378,'synth',1);
+INSERT INTO "remix_tag" VALUES(2378,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2379,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2379,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2379,'piano',1);
+INSERT INTO "remix_tag" VALUES(2379,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2380,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2380,'chill',1);
+INSERT INTO "remix_tag" VALUES(2380,'choir',1);
+INSERT INTO "remix_tag" VALUES(2380,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2380,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2381,'chill',1);
+INSERT INTO "remix_tag" VALUES(2381,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2381,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2381,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2381,'piano',1);
+INSERT INTO "remix_tag" VALUES(2381,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2382,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2382,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2382,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2382,'synth',1);
+INSERT INTO "remix_tag" VALUES(2383,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2383,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2383,'flute',1);
+INSERT INTO "remix_tag" VALUES(2383,'funk',1);
+INSERT INTO "remix_tag" VALUES(2383,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2383,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2383,'organ',1);
+INSERT INTO "remix_tag" VALUES(2383,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2384,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2384,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2384,'compo',1);
+INSERT INTO "remix_tag" VALUES(2384,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2384,'folk',1);
+INSERT INTO "remix_tag" VALUES(2384,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2386,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2386,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2386,'metal',1);
+INSERT INTO "remix_tag" VALUES(2386,'rock',1);
+INSERT INTO "remix_tag" VALUES(2387,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2387,'chill',1);
+INSERT INTO "remix_tag" VALUES(2387,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2387,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2387,'piano',1);
+INSERT INTO "remix_tag" VALUES(2387,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2387,'strings',1);
+INSERT INTO "remix_tag" VALUES(2387,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2388,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2388,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2388,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2388,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2388,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2388,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2388,'metal',1);
+INSERT INTO "remix_tag" VALUES(2388,'synth',1);
+INSERT INTO "remix_tag" VALUES(2389,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2389,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2389,'electro',1);
+INSERT INTO "remix_tag" VALUES(2389,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2389,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2389,'singing',1);
+INSERT INTO "remix_tag" VALUES(2389,'synth',1);
+INSERT INTO "remix_tag" VALUES(2389,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2389,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(2390,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2390,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2390,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2390,'medley',1);
+INSERT INTO "remix_tag" VALUES(2390,'metal',1);
+INSERT INTO "remix_tag" VALUES(2391,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2391,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2391,'synth',1);
+INSERT INTO "remix_tag" VALUES(2391,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2392,'brass',1);
+INSERT INTO "remix_tag" VALUES(2392,'choir',1);
+INSERT INTO "remix_tag" VALUES(2392,'classical',1);
+INSERT INTO "remix_tag" VALUES(2392,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2392,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2392,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2392,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2392,'singing',1);
+INSERT INTO "remix_tag" VALUES(2392,'strings',1);
+INSERT INTO "remix_tag" VALUES(2392,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2392,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2393,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2393,'compo',1);
+INSERT INTO "remix_tag" VALUES(2393,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2393,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2393,'rock',1);
+INSERT INTO "remix_tag" VALUES(2393,'strings',1);
+INSERT INTO "remix_tag" VALUES(2394,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2394,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2394,'pop',1);
+INSERT INTO "remix_tag" VALUES(2394,'rock',1);
+INSERT INTO "remix_tag" VALUES(2394,'synth',1);
+INSERT INTO "remix_tag" VALUES(2394,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2395,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2395,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2395,'piano',1);
+INSERT INTO "remix_tag" VALUES(2395,'rock',1);
+INSERT INTO "remix_tag" VALUES(2395,'synth',1);
+INSERT INTO "remix_tag" VALUES(2396,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2396,'funky',1);
+INSERT INTO "remix_tag" VALUES(2396,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2396,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2396,'synth',1);
+INSERT INTO "remix_tag" VALUES(2397,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2397,'chill',1);
+INSERT INTO "remix_tag" VALUES(2397,'choir',1);
+INSERT INTO "remix_tag" VALUES(2397,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2397,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2397,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2397,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2397,'synth',1);
+INSERT INTO "remix_tag" VALUES(2397,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2398,'latin',1);
+INSERT INTO "remix_tag" VALUES(2398,'synth',1);
+INSERT INTO "remix_tag" VALUES(2398,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2399,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2399,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2399,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(2399,'metal',1);
+INSERT INTO "remix_tag" VALUES(2399,'rock',1);
+INSERT INTO "remix_tag" VALUES(2400,'dark',1);
+INSERT INTO "remix_tag" VALUES(2400,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2400,'house',1);
+INSERT INTO "remix_tag" VALUES(2400,'synth',1);
+INSERT INTO "remix_tag" VALUES(2400,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2401,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2401,'brass',1);
+INSERT INTO "remix_tag" VALUES(2401,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2401,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(2401,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2401,'rock',1);
+INSERT INTO "remix_tag" VALUES(2401,'singing',1);
+INSERT INTO "remix_tag" VALUES(2401,'ska',1);
+INSERT INTO "remix_tag" VALUES(2401,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2401,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2402,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2402,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2402,'metal',1);
+INSERT INTO "remix_tag" VALUES(2402,'organ',1);
+INSERT INTO "remix_tag" VALUES(2402,'rock',1);
+INSERT INTO "remix_tag" VALUES(2402,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2403,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2403,'brass',1);
+INSERT INTO "remix_tag" VALUES(2403,'choir',1);
+INSERT INTO "remix_tag" VALUES(2403,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2403,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2403,'organ',1);
+INSERT INTO "remix_tag" VALUES(2403,'rock',1);
+INSERT INTO "remix_tag" VALUES(2403,'strings',1);
+INSERT INTO "remix_tag" VALUES(2403,'synth',1);
+INSERT INTO "remix_tag" VALUES(2403,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2404,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(2404,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2404,'flute',1);
+INSERT INTO "remix_tag" VALUES(2404,'funk',1);
+INSERT INTO "remix_tag" VALUES(2404,'funky',1);
+INSERT INTO "remix_tag" VALUES(2404,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2404,'rock',1);
+INSERT INTO "remix_tag" VALUES(2404,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2405,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2405,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2405,'metal',1);
+INSERT INTO "remix_tag" VALUES(2405,'rock',1);
+INSERT INTO "remix_tag" VALUES(2405,'synth',1);
+INSERT INTO "remix_tag" VALUES(2405,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2406,'chill',1);
+INSERT INTO "remix_tag" VALUES(2406,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2406,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2406,'funky',1);
+INSERT INTO "remix_tag" VALUES(2406,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2406,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2406,'koto',1);
+INSERT INTO "remix_tag" VALUES(2406,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2406,'world',1);
+INSERT INTO "remix_tag" VALUES(2407,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2407,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2407,'metal',1);
+INSERT INTO "remix_tag" VALUES(2407,'rock',1);
+INSERT INTO "remix_tag" VALUES(2408,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2408,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2408,'collab',1);
+INSERT INTO "remix_tag" VALUES(2408,'dark',1);
+INSERT INTO "remix_tag" VALUES(2408,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2408,'singing',1);
+INSERT INTO "remix_tag" VALUES(2408,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2408,'strings',1);
+INSERT INTO "remix_tag" VALUES(2408,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2409,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2409,'duet',1);
+INSERT INTO "remix_tag" VALUES(2409,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2409,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2409,'piano',1);
+INSERT INTO "remix_tag" VALUES(2409,'synth',1);
+INSERT INTO "remix_tag" VALUES(2410,'chill',1);
+INSERT INTO "remix_tag" VALUES(2410,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2410,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2410,'synth',1);
+INSERT INTO "remix_tag" VALUES(2410,'world',1);
+INSERT INTO "remix_tag" VALUES(2411,'chill',1);
+INSERT INTO "remix_tag" VALUES(2411,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2411,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2411,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2411,'japanese',1);
+INSERT INTO "remix_tag" VALUES(2411,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2412,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2412,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2412,'organ',1);
+INSERT INTO "remix_tag" VALUES(2412,'rock',1);
+INSERT INTO "remix_tag" VALUES(2412,'singing',1);
+INSERT INTO "remix_tag" VALUES(2412,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2413,'banjo',1);
+INSERT INTO "remix_tag" VALUES(2413,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2413,'folk',1);
+INSERT INTO "remix_tag" VALUES(2413,'rock',1);
+INSERT INTO "remix_tag" VALUES(2413,'strings',1);
+INSERT INTO "remix_tag" VALUES(2413,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2414,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2414,'piano',1);
+INSERT INTO "remix_tag" VALUES(2414,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2414,'solo',1);
+INSERT INTO "remix_tag" VALUES(2414,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2415,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2415,'medley',1);
+INSERT INTO "remix_tag" VALUES(2415,'rock',1);
+INSERT INTO "remix_tag" VALUES(2415,'synth',1);
+INSERT INTO "remix_tag" VALUES(2415,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2416,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2416,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2416,'strings',1);
+INSERT INTO "remix_tag" VALUES(2416,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(2417,'electro',1);
+INSERT INTO "remix_tag" VALUES(2417,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2417,'synth',1);
+INSERT INTO "remix_tag" VALUES(2417,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2418,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2418,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2418,'collab',1);
+INSERT INTO "remix_tag" VALUES(2418,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2418,'rock',1);
+INSERT INTO "remix_tag" VALUES(2418,'synth',1);
+INSERT INTO "remix_tag" VALUES(2419,'choir',1);
+INSERT INTO "remix_tag" VALUES(2419,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2419,'dark',1);
+INSERT INTO "remix_tag" VALUES(2419,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2419,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2419,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2419,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2419,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2419,'synth',1);
+INSERT INTO "remix_tag" VALUES(2420,'accordion',1);
+INSERT INTO "remix_tag" VALUES(2420,'happy',1);
+INSERT INTO "remix_tag" VALUES(2420,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2420,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2420,'strings',1);
+INSERT INTO "remix_tag" VALUES(2420,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2421,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2421,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2421,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2421,'strings',1);
+INSERT INTO "remix_tag" VALUES(2421,'synth',1);
+INSERT INTO "remix_tag" VALUES(2422,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2422,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2422,'organ',1);
+INSERT INTO "remix_tag" VALUES(2422,'rock',1);
+INSERT INTO "remix_tag" VALUES(2422,'singing',1);
+INSERT INTO "remix_tag" VALUES(2422,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2423,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2423,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2423,'funky',1);
+INSERT INTO "remix_tag" VALUES(2423,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2423,'organ',1);
+INSERT INTO "remix_tag" VALUES(2423,'synth',1);
+INSERT INTO "remix_tag" VALUES(2424,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2424,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2424,'funk',1);
+INSERT INTO "remix_tag" VALUES(2424,'funky',1);
+INSERT INTO "remix_tag" VALUES(2424,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2424,'piano',1);
+INSERT INTO "remix_tag" VALUES(2424,'sexy',1);
+INSERT INTO "remix_tag" VALUES(2424,'synth',1);
+INSERT INTO "remix_tag" VALUES(2425,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2425,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2425,'synth',1);
+INSERT INTO "remix_tag" VALUES(2425,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2426,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2426,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2426,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2426,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2427,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2427,'piano',1);
+INSERT INTO "remix_tag" VALUES(2427,'solo',1);
+INSERT INTO "remix_tag" VALUES(2427,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2428,'collab',1);
+INSERT INTO "remix_tag" VALUES(2428,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2428,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2428,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2428,'rock',1);
+INSERT INTO "remix_tag" VALUES(2428,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2428,'world',1);
+INSERT INTO "remix_tag" VALUES(2429,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2429,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2429,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2429,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2429,'synth',1);
+INSERT INTO "remix_tag" VALUES(2430,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2430,'rock',1);
+INSERT INTO "remix_tag" VALUES(2430,'synth',1);
+INSERT INTO "remix_tag" VALUES(2430,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2431,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2431,'dark',1);
+INSERT INTO "remix_tag" VALUES(2431,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2431,'metal',1);
+INSERT INTO "remix_tag" VALUES(2431,'rock',1);
+INSERT INTO "remix_tag" VALUES(2433,'brass',1);
+INSERT INTO "remix_tag" VALUES(2433,'happy',1);
+INSERT INTO "remix_tag" VALUES(2433,'march',1);
+INSERT INTO "remix_tag" VALUES(2433,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2433,'strings',1);
+INSERT INTO "remix_tag" VALUES(2433,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2433,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2434,'compo',1);
+INSERT INTO "remix_tag" VALUES(2434,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2434,'synth',1);
+INSERT INTO "remix_tag" VALUES(2434,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2435,'collab',1);
+INSERT INTO "remix_tag" VALUES(2435,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2435,'pop',1);
+INSERT INTO "remix_tag" VALUES(2435,'synth',1);
+INSERT INTO "remix_tag" VALUES(2435,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2436,'brass',1);
+INSERT INTO "remix_tag" VALUES(2436,'classical',1);
+INSERT INTO "remix_tag" VALUES(2436,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2436,'strings',1);
+INSERT INTO "remix_tag" VALUES(2436,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2437,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2437,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2437,'metal',1);
+INSERT INTO "remix_tag" VALUES(2437,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2438,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2438,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2438,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2438,'piano',1);
+INSERT INTO "remix_tag" VALUES(2438,'singing',1);
+INSERT INTO "remix_tag" VALUES(2438,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2438,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2439,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2439,'folk',1);
+INSERT INTO "remix_tag" VALUES(2439,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2439,'solo-guitar',1);
+INSERT INTO "remix_tag" VALUES(2440,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2440,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2440,'metal',1);
+INSERT INTO "remix_tag" VALUES(2440,'rock',1);
+INSERT INTO "remix_tag" VALUES(2440,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2441,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2441,'compo',1);
+INSERT INTO "remix_tag" VALUES(2441,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2441,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2441,'rock',1);
+INSERT INTO "remix_tag" VALUES(2441,'strings',1);
+INSERT INTO "remix_tag" VALUES(2442,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2442,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2442,'synth',1);
+INSERT INTO "remix_tag" VALUES(2442,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2443,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2443,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2443,'dark',1);
+INSERT INTO "remix_tag" VALUES(2443,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2443,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2443,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2444,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2444,'dark',1);
+INSERT INTO "remix_tag" VALUES(2444,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2444,'metal',1);
+INSERT INTO "remix_tag" VALUES(2444,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2444,'piano',1);
+INSERT INTO "remix_tag" VALUES(2444,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2445,'choir',1);
+INSERT INTO "remix_tag" VALUES(2445,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2445,'dark',1);
+INSERT INTO "remix_tag" VALUES(2445,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2445,'epic',1);
+INSERT INTO "remix_tag" VALUES(2445,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2445,'strings',1);
+INSERT INTO "remix_tag" VALUES(2445,'synth',1);
+INSERT INTO "remix_tag" VALUES(2446,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2446,'world',1);
+INSERT INTO "remix_tag" VALUES(2448,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2448,'dance',1);
+INSERT INTO "remix_tag" VALUES(2448,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2448,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2448,'synth',1);
+INSERT INTO "remix_tag" VALUES(2448,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2448,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2449,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2449,'compo',1);
+INSERT INTO "remix_tag" VALUES(2449,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2449,'happy',1);
+INSERT INTO "remix_tag" VALUES(2449,'synth',1);
+INSERT INTO "remix_tag" VALUES(2449,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2450,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2450,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2450,'metal',1);
+INSERT INTO "remix_tag" VALUES(2450,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2450,'synth',1);
+INSERT INTO "remix_tag" VALUES(2451,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2451,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2451,'epic',1);
+INSERT INTO "remix_tag" VALUES(2451,'metal',1);
+INSERT INTO "remix_tag" VALUES(2451,'rock',1);
+INSERT INTO "remix_tag" VALUES(2451,'synth',1);
+INSERT INTO "remix_tag" VALUES(2452,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2452,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2452,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2452,'rock',1);
+INSERT INTO "remix_tag" VALUES(2452,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2452,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2453,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2453,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2453,'collab',1);
+INSERT INTO "remix_tag" VALUES(2453,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2453,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2453,'medley',1);
+INSERT INTO "remix_tag" VALUES(2453,'metal',1);
+INSERT INTO "remix_tag" VALUES(2453,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2454,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2454,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2454,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2454,'medley',1);
+INSERT INTO "remix_tag" VALUES(2454,'metal',1);
+INSERT INTO "remix_tag" VALUES(2454,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2454,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2454,'rock',1);
+INSERT INTO "remix_tag" VALUES(2455,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2455,'collab',1);
+INSERT INTO "remix_tag" VALUES(2455,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2455,'happy',1);
+INSERT INTO "remix_tag" VALUES(2455,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2455,'pop',1);
+INSERT INTO "remix_tag" VALUES(2455,'singing',1);
+INSERT INTO "remix_tag" VALUES(2455,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2455,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2455,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2456,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2456,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2456,'happy',1);
+INSERT INTO "remix_tag" VALUES(2456,'synth',1);
+INSERT INTO "remix_tag" VALUES(2457,'brass',1);
+INSERT INTO "remix_tag" VALUES(2457,'collab',1);
+INSERT INTO "remix_tag" VALUES(2457,'folk',1);
+INSERT INTO "remix_tag" VALUES(2457,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2457,'happy',1);
+INSERT INTO "remix_tag" VALUES(2457,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2457,'singing',1);
+INSERT INTO "remix_tag" VALUES(2457,'slavic',1);
+INSERT INTO "remix_tag" VALUES(2457,'strings',1);
+INSERT INTO "remix_tag" VALUES(2457,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2457,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2457,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2458,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2458,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2458,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2458,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2459,'dance',1);
+INSERT INTO "remix_tag" VALUES(2459,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2459,'synth',1);
+INSERT INTO "remix_tag" VALUES(2459,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2459,'trance',1);
+INSERT INTO "remix_tag" VALUES(2460,'dark',1);
+INSERT INTO "remix_tag" VALUES(2460,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2460,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2460,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2460,'synth',1);
+INSERT INTO "remix_tag" VALUES(2460,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2461,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2461,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2461,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2461,'piano',1);
+INSERT INTO "remix_tag" VALUES(2461,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2461,'synth',1);
+INSERT INTO "remix_tag" VALUES(2461,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2462,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2462,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2462,'folk',1);
+INSERT INTO "remix_tag" VALUES(2462,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2462,'rock',1);
+INSERT INTO "remix_tag" VALUES(2462,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2462,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2462,'world',1);
+INSERT INTO "remix_tag" VALUES(2464,'brass',1);
+INSERT INTO "remix_tag" VALUES(2464,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2464,'classical',1);
+INSERT INTO "remix_tag" VALUES(2464,'epic',1);
+INSERT INTO "remix_tag" VALUES(2464,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2464,'strings',1);
+INSERT INTO "remix_tag" VALUES(2464,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2465,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2465,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2465,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2465,'piano',1);
+INSERT INTO "remix_tag" VALUES(2465,'romantic',1);
+INSERT INTO "remix_tag" VALUES(2466,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2466,'compo',1);
+INSERT INTO "remix_tag" VALUES(2466,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2466,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2466,'piano',1);
+INSERT INTO "remix_tag" VALUES(2466,'synth',1);
+INSERT INTO "remix_tag" VALUES(2466,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2467,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2467,'chill',1);
+INSERT INTO "remix_tag" VALUES(2467,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2467,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2467,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2467,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2467,'strings',1);
+INSERT INTO "remix_tag" VALUES(2467,'synth',1);
+INSERT INTO "remix_tag" VALUES(2468,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2468,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2468,'dark',1);
+INSERT INTO "remix_tag" VALUES(2468,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2468,'strings',1);
+INSERT INTO "remix_tag" VALUES(2468,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2469,'angry',1);
+INSERT INTO "remix_tag" VALUES(2469,'brass',1);
+INSERT INTO "remix_tag" VALUES(2469,'choir',1);
+INSERT INTO "remix_tag" VALUES(2469,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2469,'dark',1);
+INSERT INTO "remix_tag" VALUES(2469,'epic',1);
+INSERT INTO "remix_tag" VALUES(2469,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2469,'singing',1);
+INSERT INTO "remix_tag" VALUES(2469,'strings',1);
+INSERT INTO "remix_tag" VALUES(2469,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2470,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2470,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2470,'choir',1);
+INSERT INTO "remix_tag" VALUES(2470,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2470,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2470,'metal',1);
+INSERT INTO "remix_tag" VALUES(2470,'rock',1);
+INSERT INTO "remix_tag" VALUES(2470,'singing',1);
+INSERT INTO "remix_tag" VALUES(2470,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2470,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2471,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2471,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2471,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2471,'synth',1);
+INSERT INTO "remix_tag" VALUES(2472,'rock',1);
+INSERT INTO "remix_tag" VALUES(2472,'synth',1);
+INSERT INTO "remix_tag" VALUES(2472,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2473,'bells',1);
+INSERT INTO "remix_tag" VALUES(2473,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2473,'dark',1);
+INSERT INTO "remix_tag" VALUES(2473,'happy',1);
+INSERT INTO "remix_tag" VALUES(2473,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2473,'synth',1);
+INSERT INTO "remix_tag" VALUES(2473,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2474,'chill',1);
+INSERT INTO "remix_tag" VALUES(2474,'collab',1);
+INSERT INTO "remix_tag" VALUES(2474,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2474,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2474,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2474,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2474,'piano',1);
+INSERT INTO "remix_tag" VALUES(2474,'singing',1);
+INSERT INTO "remix_tag" VALUES(2474,'synth',1);
+INSERT INTO "remix_tag" VALUES(2474,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2474,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2474,'world',1);
+INSERT INTO "remix_tag" VALUES(2475,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2475,'chill',1);
+INSERT INTO "remix_tag" VALUES(2475,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2475,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2475,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2475,'piano',1);
+INSERT INTO "remix_tag" VALUES(2475,'synth',1);
+INSERT INTO "remix_tag" VALUES(2476,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2476,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2476,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2476,'metal',1);
+INSERT INTO "remix_tag" VALUES(2476,'rock',1);
+INSERT INTO "remix_tag" VALUES(2478,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2478,'compo',1);
+INSERT INTO "remix_tag" VALUES(2478,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2478,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2478,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2478,'synth',1);
+INSERT INTO "remix_tag" VALUES(2479,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2479,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2479,'piano',1);
+INSERT INTO "remix_tag" VALUES(2479,'singing',1);
+INSERT INTO "remix_tag" VALUES(2479,'strings',1);
+INSERT INTO "remix_tag" VALUES(2479,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2480,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2480,'duet',1);
+INSERT INTO "remix_tag" VALUES(2480,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2480,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2480,'medley',1);
+INSERT INTO "remix_tag" VALUES(2481,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2481,'bells',1);
+INSERT INTO "remix_tag" VALUES(2481,'dark',1);
+INSERT INTO "remix_tag" VALUES(2481,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2481,'piano',1);
+INSERT INTO "remix_tag" VALUES(2481,'synth',1);
+INSERT INTO "remix_tag" VALUES(2482,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2482,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2482,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2482,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2482,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2482,'synth',1);
+INSERT INTO "remix_tag" VALUES(2483,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2483,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2483,'metal',1);
+INSERT INTO "remix_tag" VALUES(2483,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2483,'rock',1);
+INSERT INTO "remix_tag" VALUES(2483,'synth',1);
+INSERT INTO "remix_tag" VALUES(2483,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2484,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2484,'appalachian',1);
+INSERT INTO "remix_tag" VALUES(2484,'blues',1);
+INSERT INTO "remix_tag" VALUES(2484,'folk',1);
+INSERT INTO "remix_tag" VALUES(2484,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2484,'medley',1);
+INSERT INTO "remix_tag" VALUES(2484,'organ',1);
+INSERT INTO "remix_tag" VALUES(2484,'singing',1);
+INSERT INTO "remix_tag" VALUES(2484,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2484,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2485,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2485,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2485,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2485,'house',1);
+INSERT INTO "remix_tag" VALUES(2485,'synth',1);
+INSERT INTO "remix_tag" VALUES(2485,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2486,'dark',1);
+INSERT INTO "remix_tag" VALUES(2486,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2486,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2486,'piano',1);
+INSERT INTO "remix_tag" VALUES(2486,'strings',1);
+INSERT INTO "remix_tag" VALUES(2486,'synth',1);
+INSERT INTO "remix_tag" VALUES(2487,'accordion',1);
+INSERT INTO "remix_tag" VALUES(2487,'latin',1);
+INSERT INTO "remix_tag" VALUES(2487,'piano',1);
+INSERT INTO "remix_tag" VALUES(2487,'strings',1);
+INSERT INTO "remix_tag" VALUES(2487,'tango',1);
+INSERT INTO "remix_tag" VALUES(2487,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2487,'violin',1);
+INSERT INTO "remix_tag" VALUES(2488,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2488,'chill',1);
+INSERT INTO "remix_tag" VALUES(2488,'collab',1);
+INSERT INTO "remix_tag" VALUES(2488,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2488,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2488,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2488,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2488,'synth',1);
+INSERT INTO "remix_tag" VALUES(2489,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2489,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2489,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2489,'synth',1);
+INSERT INTO "remix_tag" VALUES(2489,'trance',1);
+INSERT INTO "remix_tag" VALUES(2490,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2490,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2490,'synth',1);
+INSERT INTO "remix_tag" VALUES(2490,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2490,'trance',1);
+INSERT INTO "remix_tag" VALUES(2491,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2491,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2491,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2491,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2491,'rock',1);
+INSERT INTO "remix_tag" VALUES(2491,'singing',1);
+INSERT INTO "remix_tag" VALUES(2491,'synth',1);
+INSERT INTO "remix_tag" VALUES(2491,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2492,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2492,'collab',1);
+INSERT INTO "remix_tag" VALUES(2492,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2492,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(2492,'metal',1);
+INSERT INTO "remix_tag" VALUES(2492,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2492,'rock',1);
+INSERT INTO "remix_tag" VALUES(2492,'synth',1);
+INSERT INTO "remix_tag" VALUES(2496,'medley',1);
+INSERT INTO "remix_tag" VALUES(2496,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2496,'piano',1);
+INSERT INTO "remix_tag" VALUES(2496,'solo',1);
+INSERT INTO "remix_tag" VALUES(2496,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2497,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2497,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2497,'piano',1);
+INSERT INTO "remix_tag" VALUES(2497,'rock',1);
+INSERT INTO "remix_tag" VALUES(2497,'synth',1);
+INSERT INTO "remix_tag" VALUES(2497,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2498,'brass',1);
+INSERT INTO "remix_tag" VALUES(2498,'classical',1);
+INSERT INTO "remix_tag" VALUES(2498,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2498,'epic',1);
+INSERT INTO "remix_tag" VALUES(2498,'medley',1);
+INSERT INTO "remix_tag" VALUES(2498,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2498,'piano',1);
+INSERT INTO "remix_tag" VALUES(2498,'strings',1);
+INSERT INTO "remix_tag" VALUES(2498,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2499,'dance',1);
+INSERT INTO "remix_tag" VALUES(2499,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2499,'synth',1);
+INSERT INTO "remix_tag" VALUES(2499,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2500,'dance',1);
+INSERT INTO "remix_tag" VALUES(2500,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2500,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2500,'synth',1);
+INSERT INTO "remix_tag" VALUES(2500,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2501,'accordion',1);
+INSERT INTO "remix_tag" VALUES(2501,'celtic',1);
+INSERT INTO "remix_tag" VALUES(2501,'folk',1);
+INSERT INTO "remix_tag" VALUES(2501,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2501,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2502,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2502,'funky',1);
+INSERT INTO "remix_tag" VALUES(2502,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2502,'synth',1);
+INSERT INTO "remix_tag" VALUES(2502,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2503,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2503,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2503,'funky',1);
+INSERT INTO "remix_tag" VALUES(2503,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2503,'medley',1);
+INSERT INTO "remix_tag" VALUES(2503,'synth',1);
+INSERT INTO "remix_tag" VALUES(2503,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2504,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2504,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2504,'collab',1);
+INSERT INTO "remix_tag" VALUES(2504,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2504,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(2504,'synth',1);
+INSERT INTO "remix_tag" VALUES(2505,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2505,'piano',1);
+INSERT INTO "remix_tag" VALUES(2505,'solo',1);
+INSERT INTO "remix_tag" VALUES(2505,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2506,'brass',1);
+INSERT INTO "remix_tag" VALUES(2506,'classical',1);
+INSERT INTO "remix_tag" VALUES(2506,'dark',1);
+INSERT INTO "remix_tag" VALUES(2506,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2506,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2506,'strings',1);
+INSERT INTO "remix_tag" VALUES(2506,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2507,'compo',1);
+INSERT INTO "remix_tag" VALUES(2507,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2507,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2507,'synth',1);
+INSERT INTO "remix_tag" VALUES(2508,'dark',1);
+INSERT INTO "remix_tag" VALUES(2508,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2508,'rock',1);
+INSERT INTO "remix_tag" VALUES(2508,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2508,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2509,'disco',1);
+INSERT INTO "remix_tag" VALUES(2509,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2509,'funky',1);
+INSERT INTO "remix_tag" VALUES(2509,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2509,'organ',1);
+INSERT INTO "remix_tag" VALUES(2509,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2509,'world',1);
+INSERT INTO "remix_tag" VALUES(2510,'happy',1);
+INSERT INTO "remix_tag" VALUES(2510,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2510,'marimba',1);
+INSERT INTO "remix_tag" VALUES(2510,'medley',1);
+INSERT INTO "remix_tag" VALUES(2510,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2510,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(2511,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2511,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2511,'synth',1);
+INSERT INTO "remix_tag" VALUES(2511,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2512,'collab',1);
+INSERT INTO "remix_tag" VALUES(2512,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2512,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2512,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2512,'pop',1);
+INSERT INTO "remix_tag" VALUES(2512,'singing',1);
+INSERT INTO "remix_tag" VALUES(2512,'synth',1);
+INSERT INTO "remix_tag" VALUES(2512,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2513,'piano',1);
+INSERT INTO "remix_tag" VALUES(2513,'pop',1);
+INSERT INTO "remix_tag" VALUES(2513,'synth',1);
+INSERT INTO "remix_tag" VALUES(2513,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2514,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2514,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2514,'piano',1);
+INSERT INTO "remix_tag" VALUES(2514,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2514,'rock',1);
+INSERT INTO "remix_tag" VALUES(2514,'synth',1);
+INSERT INTO "remix_tag" VALUES(2514,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2515,'brass',1);
+INSERT INTO "remix_tag" VALUES(2515,'choir',1);
+INSERT INTO "remix_tag" VALUES(2515,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2515,'dark',1);
+INSERT INTO "remix_tag" VALUES(2515,'epic',1);
+INSERT INTO "remix_tag" VALUES(2515,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2515,'strings',1);
+INSERT INTO "remix_tag" VALUES(2515,'synth',1);
+INSERT INTO "remix_tag" VALUES(2516,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2516,'collab',1);
+INSERT INTO "remix_tag" VALUES(2516,'dark',1);
+INSERT INTO "remix_tag" VALUES(2516,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2516,'metal',1);
+INSERT INTO "remix_tag" VALUES(2516,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2517,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2517,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2517,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2517,'strings',1);
+INSERT INTO "remix_tag" VALUES(2517,'synth',1);
+INSERT INTO "remix_tag" VALUES(2517,'world',1);
+INSERT INTO "remix_tag" VALUES(2518,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2518,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2518,'epic',1);
+INSERT INTO "remix_tag" VALUES(2518,'metal',1);
+INSERT INTO "remix_tag" VALUES(2518,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2518,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2520,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2520,'brass',1);
+INSERT INTO "remix_tag" VALUES(2520,'collab',1);
+INSERT INTO "remix_tag" VALUES(2520,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2520,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2520,'epic',1);
+INSERT INTO "remix_tag" VALUES(2520,'metal',1);
+INSERT INTO "remix_tag" VALUES(2520,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2520,'rock',1);
+INSERT INTO "remix_tag" VALUES(2520,'strings',1);
+INSERT INTO "remix_tag" VALUES(2521,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2521,'dark',1);
+INSERT INTO "remix_tag" VALUES(2521,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2521,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(2521,'metal',1);
+INSERT INTO "remix_tag" VALUES(2521,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2521,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2522,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2522,'dark',1);
+INSERT INTO "remix_tag" VALUES(2522,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2522,'synth',1);
+INSERT INTO "remix_tag" VALUES(2523,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2523,'dark',1);
+INSERT INTO "remix_tag" VALUES(2523,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2523,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2523,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(2523,'piano',1);
+INSERT INTO "remix_tag" VALUES(2523,'singing',1);
+INSERT INTO "remix_tag" VALUES(2523,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2523,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2523,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2524,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2524,'rock',1);
+INSERT INTO "remix_tag" VALUES(2524,'synth',1);
+INSERT INTO "remix_tag" VALUES(2524,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2524,'violin',1);
+INSERT INTO "remix_tag" VALUES(2525,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2525,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2525,'folk',1);
+INSERT INTO "remix_tag" VALUES(2525,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2525,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2527,'chill',1);
+INSERT INTO "remix_tag" VALUES(2527,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2527,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2527,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2527,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2527,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2528,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2528,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2528,'medley',1);
+INSERT INTO "remix_tag" VALUES(2528,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2528,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2528,'piano',1);
+INSERT INTO "remix_tag" VALUES(2528,'strings',1);
+INSERT INTO "remix_tag" VALUES(2528,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2530,'compo',1);
+INSERT INTO "remix_tag" VALUES(2530,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2530,'synth',1);
+INSERT INTO "remix_tag" VALUES(2530,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2531,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2531,'dark',1);
+INSERT INTO "remix_tag" VALUES(2531,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2531,'metal',1);
+INSERT INTO "remix_tag" VALUES(2532,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2532,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2532,'metal',1);
+INSERT INTO "remix_tag" VALUES(2532,'rock',1);
+INSERT INTO "remix_tag" VALUES(2532,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2533,'compo',1);
+INSERT INTO "remix_tag" VALUES(2533,'pop',1);
+INSERT INTO "remix_tag" VALUES(2533,'rock',1);
+INSERT INTO "remix_tag" VALUES(2533,'synth',1);
+INSERT INTO "remix_tag" VALUES(2533,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2534,'classical',1);
+INSERT INTO "remix_tag" VALUES(2534,'piano',1);
+INSERT INTO "remix_tag" VALUES(2534,'solo',1);
+INSERT INTO "remix_tag" VALUES(2534,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2534,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2535,'dance',1);
+INSERT INTO "remix_tag" VALUES(2535,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2535,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2535,'synth',1);
+INSERT INTO "remix_tag" VALUES(2535,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2536,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2536,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2536,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2536,'piano',1);
+INSERT INTO "remix_tag" VALUES(2536,'synth',1);
+INSERT INTO "remix_tag" VALUES(2536,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2537,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2537,'compo',1);
+INSERT INTO "remix_tag" VALUES(2537,'disco',1);
+INSERT INTO "remix_tag" VALUES(2537,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2537,'funky',1);
+INSERT INTO "remix_tag" VALUES(2537,'synth',1);
+INSERT INTO "remix_tag" VALUES(2537,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2538,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2538,'brass',1);
+INSERT INTO "remix_tag" VALUES(2538,'collab',1);
+INSERT INTO "remix_tag" VALUES(2538,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2538,'funky',1);
+INSERT INTO "remix_tag" VALUES(2538,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2538,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2538,'piano',1);
+INSERT INTO "remix_tag" VALUES(2538,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2538,'synth',1);
+INSERT INTO "remix_tag" VALUES(2539,'choir',1);
+INSERT INTO "remix_tag" VALUES(2539,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2539,'piano',1);
+INSERT INTO "remix_tag" VALUES(2539,'synth',1);
+INSERT INTO "remix_tag" VALUES(2540,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2540,'funky',1);
+INSERT INTO "remix_tag" VALUES(2540,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2541,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2541,'collab',1);
+INSERT INTO "remix_tag" VALUES(2541,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2541,'singing',1);
+INSERT INTO "remix_tag" VALUES(2541,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2541,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2541,'world',1);
+INSERT INTO "remix_tag" VALUES(2542,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2542,'synth',1);
+INSERT INTO "remix_tag" VALUES(2542,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2543,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2543,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2543,'synth',1);
+INSERT INTO "remix_tag" VALUES(2543,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2543,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2544,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2544,'collab',1);
+INSERT INTO "remix_tag" VALUES(2544,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2544,'synth',1);
+INSERT INTO "remix_tag" VALUES(2544,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2545,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2545,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2545,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2545,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2545,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2546,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2546,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2546,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2546,'piano',1);
+INSERT INTO "remix_tag" VALUES(2546,'strings',1);
+INSERT INTO "remix_tag" VALUES(2546,'synth',1);
+INSERT INTO "remix_tag" VALUES(2546,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2546,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2547,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2547,'collab',1);
+INSERT INTO "remix_tag" VALUES(2547,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2547,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2547,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2548,'collab',1);
+INSERT INTO "remix_tag" VALUES(2548,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2548,'funky',1);
+INSERT INTO "remix_tag" VALUES(2548,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2548,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2548,'synth',1);
+INSERT INTO "remix_tag" VALUES(2548,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2549,'chill',1);
+INSERT INTO "remix_tag" VALUES(2549,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2549,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2549,'piano',1);
+INSERT INTO "remix_tag" VALUES(2549,'synth',1);
+INSERT INTO "remix_tag" VALUES(2550,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2550,'collab',1);
+INSERT INTO "remix_tag" VALUES(2550,'country',1);
+INSERT INTO "remix_tag" VALUES(2550,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2550,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2550,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(2550,'piano',1);
+INSERT INTO "remix_tag" VALUES(2550,'strings',1);
+INSERT INTO "remix_tag" VALUES(2551,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2551,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2551,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2552,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2552,'collab',1);
+INSERT INTO "remix_tag" VALUES(2552,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2552,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2552,'piano',1);
+INSERT INTO "remix_tag" VALUES(2552,'strings',1);
+INSERT INTO "remix_tag" VALUES(2552,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2552,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2552,'world',1);
+INSERT INTO "remix_tag" VALUES(2553,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2553,'compo',1);
+INSERT INTO "remix_tag" VALUES(2553,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2553,'synth',1);
+INSERT INTO "remix_tag" VALUES(2553,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2554,'brass',1);
+INSERT INTO "remix_tag" VALUES(2554,'classical',1);
+INSERT INTO "remix_tag" VALUES(2554,'epic',1);
+INSERT INTO "remix_tag" VALUES(2554,'harp',1);
+INSERT INTO "remix_tag" VALUES(2554,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2554,'strings',1);
+INSERT INTO "remix_tag" VALUES(2554,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2554,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2555,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2555,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2555,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2555,'organ',1);
+INSERT INTO "remix_tag" VALUES(2555,'rock',1);
+INSERT INTO "remix_tag" VALUES(2555,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2556,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2556,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2556,'metal',1);
+INSERT INTO "remix_tag" VALUES(2556,'rock',1);
+INSERT INTO "remix_tag" VALUES(2556,'synth',1);
+INSERT INTO "remix_tag" VALUES(2557,'dance',1);
+INSERT INTO "remix_tag" VALUES(2557,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2557,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2557,'synth',1);
+INSERT INTO "remix_tag" VALUES(2557,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2557,'world',1);
+INSERT INTO "remix_tag" VALUES(2558,'dark',1);
+INSERT INTO "remix_tag" VALUES(2558,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2558,'piano',1);
+INSERT INTO "remix_tag" VALUES(2558,'synth',1);
+INSERT INTO "remix_tag" VALUES(2559,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2559,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2559,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2559,'synth',1);
+INSERT INTO "remix_tag" VALUES(2561,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2561,'funky',1);
+INSERT INTO "remix_tag" VALUES(2561,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2561,'piano',1);
+INSERT INTO "remix_tag" VALUES(2561,'pop',1);
+INSERT INTO "remix_tag" VALUES(2561,'rock',1);
+INSERT INTO "remix_tag" VALUES(2561,'synth',1);
+INSERT INTO "remix_tag" VALUES(2561,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2562,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2562,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(2562,'folk',1);
+INSERT INTO "remix_tag" VALUES(2562,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(2562,'singing',1);
+INSERT INTO "remix_tag" VALUES(2562,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2562,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2562,'whistling',1);
+INSERT INTO "remix_tag" VALUES(2563,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2563,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2563,'metal',1);
+INSERT INTO "remix_tag" VALUES(2563,'rock',1);
+INSERT INTO "remix_tag" VALUES(2563,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2564,'classical',1);
+INSERT INTO "remix_tag" VALUES(2564,'happy',1);
+INSERT INTO "remix_tag" VALUES(2564,'harp',1);
+INSERT INTO "remix_tag" VALUES(2564,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2564,'strings',1);
+INSERT INTO "remix_tag" VALUES(2564,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2565,'brass',1);
+INSERT INTO "remix_tag" VALUES(2565,'classical',1);
+INSERT INTO "remix_tag" VALUES(2565,'epic',1);
+INSERT INTO "remix_tag" VALUES(2565,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2565,'strings',1);
+INSERT INTO "remix_tag" VALUES(2565,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2565,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2566,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2566,'classical',1);
+INSERT INTO "remix_tag" VALUES(2566,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2566,'metal',1);
+INSERT INTO "remix_tag" VALUES(2566,'piano',1);
+INSERT INTO "remix_tag" VALUES(2566,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2566,'rock',1);
+INSERT INTO "remix_tag" VALUES(2566,'strings',1);
+INSERT INTO "remix_tag" VALUES(2566,'violin',1);
+INSERT INTO "remix_tag" VALUES(2567,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2567,'dark',1);
+INSERT INTO "remix_tag" VALUES(2567,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2567,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2567,'synth',1);
+INSERT INTO "remix_tag" VALUES(2567,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2568,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2568,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2568,'folk',1);
+INSERT INTO "remix_tag" VALUES(2568,'happy',1);
+INSERT INTO "remix_tag" VALUES(2568,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2568,'strings',1);
+INSERT INTO "remix_tag" VALUES(2568,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2568,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2569,'brass',1);
+INSERT INTO "remix_tag" VALUES(2569,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2569,'organ',1);
+INSERT INTO "remix_tag" VALUES(2569,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2569,'singing',1);
+INSERT INTO "remix_tag" VALUES(2569,'soul',1);
+INSERT INTO "remix_tag" VALUES(2569,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2571,'bells',1);
+INSERT INTO "remix_tag" VALUES(2571,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2571,'piano',1);
+INSERT INTO "remix_tag" VALUES(2571,'rock',1);
+INSERT INTO "remix_tag" VALUES(2571,'strings',1);
+INSERT INTO "remix_tag" VALUES(2571,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2571,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2572,'classical',1);
+INSERT INTO "remix_tag" VALUES(2572,'collab',1);
+INSERT INTO "remix_tag" VALUES(2572,'duet',1);
+INSERT INTO "remix_tag" VALUES(2572,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2572,'piano',1);
+INSERT INTO "remix_tag" VALUES(2572,'violin',1);
+INSERT INTO "remix_tag" VALUES(2573,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2573,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2573,'collab',1);
+INSERT INTO "remix_tag" VALUES(2573,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2573,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2573,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2573,'rock',1);
+INSERT INTO "remix_tag" VALUES(2573,'singing',1);
+INSERT INTO "remix_tag" VALUES(2573,'synth',1);
+INSERT INTO "remix_tag" VALUES(2573,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2574,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2574,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2574,'collab',1);
+INSERT INTO "remix_tag" VALUES(2574,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2574,'metal',1);
+INSERT INTO "remix_tag" VALUES(2574,'rock',1);
+INSERT INTO "remix_tag" VALUES(2574,'synth',1);
+INSERT INTO "remix_tag" VALUES(2574,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2575,'classical',1);
+INSERT INTO "remix_tag" VALUES(2575,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2575,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2575,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2575,'medley',1);
+INSERT INTO "remix_tag" VALUES(2575,'piano',1);
+INSERT INTO "remix_tag" VALUES(2575,'strings',1);
+INSERT INTO "remix_tag" VALUES(2575,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2576,'collab',1);
+INSERT INTO "remix_tag" VALUES(2576,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2576,'organ',1);
+INSERT INTO "remix_tag" VALUES(2576,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2576,'rock',1);
+INSERT INTO "remix_tag" VALUES(2576,'synth',1);
+INSERT INTO "remix_tag" VALUES(2576,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2577,'collab',1);
+INSERT INTO "remix_tag" VALUES(2577,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2577,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2577,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2577,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2577,'strings',1);
+INSERT INTO "remix_tag" VALUES(2577,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2577,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2578,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2578,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2578,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2578,'synth',1);
+INSERT INTO "remix_tag" VALUES(2578,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2579,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2579,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2579,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2579,'synth',1);
+INSERT INTO "remix_tag" VALUES(2579,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2580,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2580,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2580,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2580,'synth',1);
+INSERT INTO "remix_tag" VALUES(2580,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2581,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2581,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2581,'rock',1);
+INSERT INTO "remix_tag" VALUES(2581,'synth',1);
+INSERT INTO "remix_tag" VALUES(2581,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2583,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2583,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2583,'funky',1);
+INSERT INTO "remix_tag" VALUES(2583,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2583,'rock',1);
+INSERT INTO "remix_tag" VALUES(2584,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2584,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2584,'funky',1);
+INSERT INTO "remix_tag" VALUES(2584,'synth',1);
+INSERT INTO "remix_tag" VALUES(2585,'dance',1);
+INSERT INTO "remix_tag" VALUES(2585,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2585,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2585,'synth',1);
+INSERT INTO "remix_tag" VALUES(2585,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2586,'compo',1);
+INSERT INTO "remix_tag" VALUES(2586,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2586,'piano',1);
+INSERT INTO "remix_tag" VALUES(2586,'synth',1);
+INSERT INTO "remix_tag" VALUES(2586,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2587,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2587,'dark',1);
+INSERT INTO "remix_tag" VALUES(2587,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2587,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2587,'synth',1);
+INSERT INTO "remix_tag" VALUES(2588,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2588,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2588,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2588,'rock',1);
+INSERT INTO "remix_tag" VALUES(2589,'dance',1);
+INSERT INTO "remix_tag" VALUES(2589,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2589,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2589,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2589,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2589,'piano',1);
+INSERT INTO "remix_tag" VALUES(2589,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2589,'synth',1);
+INSERT INTO "remix_tag" VALUES(2590,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2590,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2590,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2590,'metal',1);
+INSERT INTO "remix_tag" VALUES(2590,'rock',1);
+INSERT INTO "remix_tag" VALUES(2590,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2591,'dark',1);
+INSERT INTO "remix_tag" VALUES(2591,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2591,'piano',1);
+INSERT INTO "remix_tag" VALUES(2591,'solo',1);
+INSERT INTO "remix_tag" VALUES(2591,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2592,'dark',1);
+INSERT INTO "remix_tag" VALUES(2592,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2592,'synth',1);
+INSERT INTO "remix_tag" VALUES(2592,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2593,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2593,'synth',1);
+INSERT INTO "remix_tag" VALUES(2593,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2594,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2594,'collab',1);
+INSERT INTO "remix_tag" VALUES(2594,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2594,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2594,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2594,'metal',1);
+INSERT INTO "remix_tag" VALUES(2594,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2594,'rock',1);
+INSERT INTO "remix_tag" VALUES(2594,'singing',1);
+INSERT INTO "remix_tag" VALUES(2594,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2595,'bells',1);
+INSERT INTO "remix_tag" VALUES(2595,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2595,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2595,'strings',1);
+INSERT INTO "remix_tag" VALUES(2596,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2596,'folk',1);
+INSERT INTO "remix_tag" VALUES(2596,'rock',1);
+INSERT INTO "remix_tag" VALUES(2596,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2596,'violin',1);
+INSERT INTO "remix_tag" VALUES(2596,'world',1);
+INSERT INTO "remix_tag" VALUES(2597,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2597,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2597,'medley',1);
+INSERT INTO "remix_tag" VALUES(2597,'metal',1);
+INSERT INTO "remix_tag" VALUES(2597,'rock',1);
+INSERT INTO "remix_tag" VALUES(2597,'synth',1);
+INSERT INTO "remix_tag" VALUES(2597,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2598,'brass',1);
+INSERT INTO "remix_tag" VALUES(2598,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2598,'dark',1);
+INSERT INTO "remix_tag" VALUES(2598,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2598,'piano',1);
+INSERT INTO "remix_tag" VALUES(2598,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2598,'strings',1);
+INSERT INTO "remix_tag" VALUES(2598,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2599,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2599,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2599,'metal',1);
+INSERT INTO "remix_tag" VALUES(2599,'rock',1);
+INSERT INTO "remix_tag" VALUES(2599,'synth',1);
+INSERT INTO "remix_tag" VALUES(2599,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2600,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2600,'synth',1);
+INSERT INTO "remix_tag" VALUES(2600,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2600,'trance',1);
+INSERT INTO "remix_tag" VALUES(2601,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2601,'brass',1);
+INSERT INTO "remix_tag" VALUES(2601,'collab',1);
+INSERT INTO "remix_tag" VALUES(2601,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2601,'piano',1);
+INSERT INTO "remix_tag" VALUES(2601,'strings',1);
+INSERT INTO "remix_tag" VALUES(2601,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2601,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(2601,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2601,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2602,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2602,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2602,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2602,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2602,'synth',1);
+INSERT INTO "remix_tag" VALUES(2603,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2603,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2603,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2603,'synth',1);
+INSERT INTO "remix_tag" VALUES(2603,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2603,'waltz',1);
+INSERT INTO "remix_tag" VALUES(2604,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2604,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2604,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2604,'synth',1);
+INSERT INTO "remix_tag" VALUES(2604,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2605,'choir',1);
+INSERT INTO "remix_tag" VALUES(2605,'harp',1);
+INSERT INTO "remix_tag" VALUES(2605,'medley',1);
+INSERT INTO "remix_tag" VALUES(2605,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2605,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2605,'piano',1);
+INSERT INTO "remix_tag" VALUES(2605,'strings',1);
+INSERT INTO "remix_tag" VALUES(2606,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(2606,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2606,'funk',1);
+INSERT INTO "remix_tag" VALUES(2606,'funky',1);
+INSERT INTO "remix_tag" VALUES(2606,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2606,'synth',1);
+INSERT INTO "remix_tag" VALUES(2606,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2607,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2607,'piano',1);
+INSERT INTO "remix_tag" VALUES(2607,'synth',1);
+INSERT INTO "remix_tag" VALUES(2608,'classical',1);
+INSERT INTO "remix_tag" VALUES(2608,'collab',1);
+INSERT INTO "remix_tag" VALUES(2608,'duet',1);
+INSERT INTO "remix_tag" VALUES(2608,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2608,'piano',1);
+INSERT INTO "remix_tag" VALUES(2608,'violin',1);
+INSERT INTO "remix_tag" VALUES(2609,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2609,'collab',1);
+INSERT INTO "remix_tag" VALUES(2609,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2609,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2609,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2609,'japanese',1);
+INSERT INTO "remix_tag" VALUES(2609,'koto',1);
+INSERT INTO "remix_tag" VALUES(2609,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2609,'medley',1);
+INSERT INTO "remix_tag" VALUES(2609,'rock',1);
+INSERT INTO "remix_tag" VALUES(2609,'strings',1);
+INSERT INTO "remix_tag" VALUES(2609,'synth',1);
+INSERT INTO "remix_tag" VALUES(2609,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2609,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2610,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2610,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2610,'funky',1);
+INSERT INTO "remix_tag" VALUES(2610,'rock',1);
+INSERT INTO "remix_tag" VALUES(2611,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2611,'classical',1);
+INSERT INTO "remix_tag" VALUES(2611,'flute',1);
+INSERT INTO "remix_tag" VALUES(2611,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(2611,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2611,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2611,'quintet',1);
+INSERT INTO "remix_tag" VALUES(2611,'strings',1);
+INSERT INTO "remix_tag" VALUES(2612,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2612,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2612,'compo',1);
+INSERT INTO "remix_tag" VALUES(2612,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2612,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2612,'piano',1);
+INSERT INTO "remix_tag" VALUES(2612,'synth',1);
+INSERT INTO "remix_tag" VALUES(2613,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2613,'sitar',1);
+INSERT INTO "remix_tag" VALUES(2613,'strings',1);
+INSERT INTO "remix_tag" VALUES(2613,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2613,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2613,'world',1);
+INSERT INTO "remix_tag" VALUES(2614,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2614,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2614,'collab',1);
+INSERT INTO "remix_tag" VALUES(2614,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2614,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2614,'rock',1);
+INSERT INTO "remix_tag" VALUES(2614,'synth',1);
+INSERT INTO "remix_tag" VALUES(2614,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2615,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2615,'collab',1);
+INSERT INTO "remix_tag" VALUES(2615,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2615,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2615,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2615,'medley',1);
+INSERT INTO "remix_tag" VALUES(2615,'piano',1);
+INSERT INTO "remix_tag" VALUES(2615,'singing',1);
+INSERT INTO "remix_tag" VALUES(2615,'synth',1);
+INSERT INTO "remix_tag" VALUES(2615,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2616,'collab',1);
+INSERT INTO "remix_tag" VALUES(2616,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2616,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2616,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2616,'piano',1);
+INSERT INTO "remix_tag" VALUES(2616,'strings',1);
+INSERT INTO "remix_tag" VALUES(2616,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2617,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2617,'synth',1);
+INSERT INTO "remix_tag" VALUES(2617,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2617,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2617,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(2618,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2618,'compo',1);
+INSERT INTO "remix_tag" VALUES(2618,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2618,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2618,'metal',1);
+INSERT INTO "remix_tag" VALUES(2618,'rock',1);
+INSERT INTO "remix_tag" VALUES(2618,'screaming',1);
+INSERT INTO "remix_tag" VALUES(2618,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2618,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2618,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2619,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2619,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2619,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2619,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2619,'piano',1);
+INSERT INTO "remix_tag" VALUES(2619,'synth',1);
+INSERT INTO "remix_tag" VALUES(2620,'brass',1);
+INSERT INTO "remix_tag" VALUES(2620,'choir',1);
+INSERT INTO "remix_tag" VALUES(2620,'classical',1);
+INSERT INTO "remix_tag" VALUES(2620,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2620,'strings',1);
+INSERT INTO "remix_tag" VALUES(2620,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2620,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2621,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2621,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2621,'synth',1);
+INSERT INTO "remix_tag" VALUES(2621,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2621,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2622,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2622,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2622,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2622,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2622,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2622,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2623,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2623,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2623,'synth',1);
+INSERT INTO "remix_tag" VALUES(2623,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2624,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2624,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2624,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2624,'synth',1);
+INSERT INTO "remix_tag" VALUES(2624,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2624,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2625,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2625,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2625,'epic',1);
+INSERT INTO "remix_tag" VALUES(2625,'metal',1);
+INSERT INTO "remix_tag" VALUES(2625,'rock',1);
+INSERT INTO "remix_tag" VALUES(2625,'strings',1);
+INSERT INTO "remix_tag" VALUES(2625,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2626,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2626,'collab',1);
+INSERT INTO "remix_tag" VALUES(2626,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2626,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2626,'piano',1);
+INSERT INTO "remix_tag" VALUES(2626,'rock',1);
+INSERT INTO "remix_tag" VALUES(2626,'strings',1);
+INSERT INTO "remix_tag" VALUES(2626,'synth',1);
+INSERT INTO "remix_tag" VALUES(2627,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2627,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2627,'latin',1);
+INSERT INTO "remix_tag" VALUES(2627,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2627,'piano',1);
+INSERT INTO "remix_tag" VALUES(2627,'synth',1);
+INSERT INTO "remix_tag" VALUES(2627,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2628,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2628,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2628,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2628,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(2628,'metal',1);
+INSERT INTO "remix_tag" VALUES(2628,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2628,'rock',1);
+INSERT INTO "remix_tag" VALUES(2628,'strings',1);
+INSERT INTO "remix_tag" VALUES(2629,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2629,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2629,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2629,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2629,'strings',1);
+INSERT INTO "remix_tag" VALUES(2629,'synth',1);
+INSERT INTO "remix_tag" VALUES(2630,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2630,'collab',1);
+INSERT INTO "remix_tag" VALUES(2630,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2630,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2630,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2630,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2630,'rock',1);
+INSERT INTO "remix_tag" VALUES(2630,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2630,'synth',1);
+INSERT INTO "remix_tag" VALUES(2630,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2630,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2630,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2631,'harp',1);
+INSERT INTO "remix_tag" VALUES(2631,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2631,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2631,'strings',1);
+INSERT INTO "remix_tag" VALUES(2631,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2632,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2632,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2632,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2632,'metal',1);
+INSERT INTO "remix_tag" VALUES(2632,'rock',1);
+INSERT INTO "remix_tag" VALUES(2632,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2633,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2633,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2633,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2633,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2633,'metal',1);
+INSERT INTO "remix_tag" VALUES(2633,'rock',1);
+INSERT INTO "remix_tag" VALUES(2633,'synth',1);
+INSERT INTO "remix_tag" VALUES(2634,'compo',1);
+INSERT INTO "remix_tag" VALUES(2634,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2634,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2634,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2636,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2636,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2636,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2636,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2636,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2636,'rock',1);
+INSERT INTO "remix_tag" VALUES(2637,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2637,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2637,'synth',1);
+INSERT INTO "remix_tag" VALUES(2638,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2638,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2638,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2638,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2638,'synth',1);
+INSERT INTO "remix_tag" VALUES(2638,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2639,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2639,'piano',1);
+INSERT INTO "remix_tag" VALUES(2639,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2639,'rock',1);
+INSERT INTO "remix_tag" VALUES(2639,'strings',1);
+INSERT INTO "remix_tag" VALUES(2639,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2639,'world',1);
+INSERT INTO "remix_tag" VALUES(2640,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2640,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2640,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2640,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2640,'synth',1);
+INSERT INTO "remix_tag" VALUES(2641,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2641,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2641,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2641,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2641,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2641,'singing',1);
+INSERT INTO "remix_tag" VALUES(2641,'strings',1);
+INSERT INTO "remix_tag" VALUES(2641,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2642,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2642,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2642,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2642,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2642,'metal',1);
+INSERT INTO "remix_tag" VALUES(2642,'rock',1);
+INSERT INTO "remix_tag" VALUES(2642,'singing',1);
+INSERT INTO "remix_tag" VALUES(2642,'synth',1);
+INSERT INTO "remix_tag" VALUES(2642,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2642,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2643,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2643,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2643,'happy',1);
+INSERT INTO "remix_tag" VALUES(2643,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2643,'synth',1);
+INSERT INTO "remix_tag" VALUES(2643,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2644,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2644,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2644,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2644,'organ',1);
+INSERT INTO "remix_tag" VALUES(2644,'piano',1);
+INSERT INTO "remix_tag" VALUES(2644,'rock',1);
+INSERT INTO "remix_tag" VALUES(2644,'synth',1);
+INSERT INTO "remix_tag" VALUES(2645,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2645,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2645,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2645,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2645,'punk',1);
+INSERT INTO "remix_tag" VALUES(2645,'rock',1);
+INSERT INTO "remix_tag" VALUES(2646,'compo',1);
+INSERT INTO "remix_tag" VALUES(2646,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2646,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2646,'synth',1);
+INSERT INTO "remix_tag" VALUES(2646,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2646,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2648,'brass',1);
+INSERT INTO "remix_tag" VALUES(2648,'classical',1);
+INSERT INTO "remix_tag" VALUES(2648,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2648,'epic',1);
+INSERT INTO "remix_tag" VALUES(2648,'medley',1);
+INSERT INTO "remix_tag" VALUES(2648,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2648,'strings',1);
+INSERT INTO "remix_tag" VALUES(2648,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2649,'bells',1);
+INSERT INTO "remix_tag" VALUES(2649,'compo',1);
+INSERT INTO "remix_tag" VALUES(2649,'rock',1);
+INSERT INTO "remix_tag" VALUES(2649,'synth',1);
+INSERT INTO "remix_tag" VALUES(2649,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2649,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2650,'collab',1);
+INSERT INTO "remix_tag" VALUES(2650,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2650,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2650,'singing',1);
+INSERT INTO "remix_tag" VALUES(2650,'synth',1);
+INSERT INTO "remix_tag" VALUES(2650,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2650,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2651,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2651,'dark',1);
+INSERT INTO "remix_tag" VALUES(2651,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2651,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2651,'synth',1);
+INSERT INTO "remix_tag" VALUES(2652,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2652,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2652,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2652,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2652,'rock',1);
+INSERT INTO "remix_tag" VALUES(2652,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2652,'synth',1);
+INSERT INTO "remix_tag" VALUES(2653,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2653,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2653,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2653,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2653,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2653,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2653,'medley',1);
+INSERT INTO "remix_tag" VALUES(2653,'rock',1);
+INSERT INTO "remix_tag" VALUES(2653,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2653,'synth',1);
+INSERT INTO "remix_tag" VALUES(2653,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2654,'chill',1);
+INSERT INTO "remix_tag" VALUES(2654,'collab',1);
+INSERT INTO "remix_tag" VALUES(2654,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2654,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2654,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2654,'synth',1);
+INSERT INTO "remix_tag" VALUES(2655,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2655,'compo',1);
+INSERT INTO "remix_tag" VALUES(2655,'rock',1);
+INSERT INTO "remix_tag" VALUES(2655,'synth',1);
+INSERT INTO "remix_tag" VALUES(2655,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2656,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2656,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2656,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2656,'house',1);
+INSERT INTO "remix_tag" VALUES(2656,'synth',1);
+INSERT INTO "remix_tag" VALUES(2656,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2657,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2657,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2657,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2657,'medley',1);
+INSERT INTO "remix_tag" VALUES(2657,'singing',1);
+INSERT INTO "remix_tag" VALUES(2657,'synth',1);
+INSERT INTO "remix_tag" VALUES(2657,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2657,'world',1);
+INSERT INTO "remix_tag" VALUES(2658,'collab',1);
+INSERT INTO "remix_tag" VALUES(2658,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2658,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2658,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2658,'piano',1);
+INSERT INTO "remix_tag" VALUES(2658,'synth',1);
+INSERT INTO "remix_tag" VALUES(2659,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2659,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2659,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2659,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2659,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2659,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2659,'synth',1);
+INSERT INTO "remix_tag" VALUES(2659,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2660,'collab',1);
+INSERT INTO "remix_tag" VALUES(2660,'dance',1);
+INSERT INTO "remix_tag" VALUES(2660,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2660,'synth',1);
+INSERT INTO "remix_tag" VALUES(2660,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2660,'trance',1);
+INSERT INTO "remix_tag" VALUES(2661,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2661,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2661,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(2661,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2661,'synth',1);
+INSERT INTO "remix_tag" VALUES(2662,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2662,'metal',1);
+INSERT INTO "remix_tag" VALUES(2662,'rock',1);
+INSERT INTO "remix_tag" VALUES(2662,'synth',1);
+INSERT INTO "remix_tag" VALUES(2664,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2664,'synth',1);
+INSERT INTO "remix_tag" VALUES(2664,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2664,'trance',1);
+INSERT INTO "remix_tag" VALUES(2665,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2665,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2665,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2665,'synth',1);
+INSERT INTO "remix_tag" VALUES(2666,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2666,'collab',1);
+INSERT INTO "remix_tag" VALUES(2666,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2666,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2666,'synth',1);
+INSERT INTO "remix_tag" VALUES(2666,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2667,'brass',1);
+INSERT INTO "remix_tag" VALUES(2667,'choir',1);
+INSERT INTO "remix_tag" VALUES(2667,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2667,'epic',1);
+INSERT INTO "remix_tag" VALUES(2667,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2667,'piano',1);
+INSERT INTO "remix_tag" VALUES(2667,'strings',1);
+INSERT INTO "remix_tag" VALUES(2667,'synth',1);
+INSERT INTO "remix_tag" VALUES(2669,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2669,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2669,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2669,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2670,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2670,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2670,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2670,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2670,'rock',1);
+INSERT INTO "remix_tag" VALUES(2670,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2671,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2671,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2671,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2671,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2671,'piano',1);
+INSERT INTO "remix_tag" VALUES(2671,'strings',1);
+INSERT INTO "remix_tag" VALUES(2671,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2672,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2672,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2672,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2672,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2672,'synth',1);
+INSERT INTO "remix_tag" VALUES(2672,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2673,'acapella',1);
+INSERT INTO "remix_tag" VALUES(2673,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2673,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2673,'singing',1);
+INSERT INTO "remix_tag" VALUES(2673,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2673,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2673,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2674,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2674,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2674,'epic',1);
+INSERT INTO "remix_tag" VALUES(2674,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2674,'piano',1);
+INSERT INTO "remix_tag" VALUES(2674,'rock',1);
+INSERT INTO "remix_tag" VALUES(2674,'strings',1);
+INSERT INTO "remix_tag" VALUES(2675,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2675,'chill',1);
+INSERT INTO "remix_tag" VALUES(2675,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2675,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2675,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2675,'synth',1);
+INSERT INTO "remix_tag" VALUES(2675,'violin',1);
+INSERT INTO "remix_tag" VALUES(2675,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2676,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2676,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2676,'metal',1);
+INSERT INTO "remix_tag" VALUES(2676,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2676,'rock',1);
+INSERT INTO "remix_tag" VALUES(2676,'singing',1);
+INSERT INTO "remix_tag" VALUES(2676,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2678,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2678,'synth',1);
+INSERT INTO "remix_tag" VALUES(2678,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2679,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2679,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2679,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2679,'synth',1);
+INSERT INTO "remix_tag" VALUES(2679,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2680,'brass',1);
+INSERT INTO "remix_tag" VALUES(2680,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2680,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2680,'epic',1);
+INSERT INTO "remix_tag" VALUES(2680,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2680,'rock',1);
+INSERT INTO "remix_tag" VALUES(2680,'strings',1);
+INSERT INTO "remix_tag" VALUES(2681,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2681,'piano',1);
+INSERT INTO "remix_tag" VALUES(2681,'solo',1);
+INSERT INTO "remix_tag" VALUES(2681,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2681,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2682,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2682,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2682,'harp',1);
+INSERT INTO "remix_tag" VALUES(2682,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2682,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2682,'piano',1);
+INSERT INTO "remix_tag" VALUES(2682,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2682,'strings',1);
+INSERT INTO "remix_tag" VALUES(2682,'synth',1);
+INSERT INTO "remix_tag" VALUES(2683,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2683,'dark',1);
+INSERT INTO "remix_tag" VALUES(2683,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2683,'piano',1);
+INSERT INTO "remix_tag" VALUES(2684,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2684,'piano',1);
+INSERT INTO "remix_tag" VALUES(2684,'rock',1);
+INSERT INTO "remix_tag" VALUES(2684,'synth',1);
+INSERT INTO "remix_tag" VALUES(2684,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2684,'violin',1);
+INSERT INTO "remix_tag" VALUES(2685,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2685,'happy',1);
+INSERT INTO "remix_tag" VALUES(2685,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2685,'pop',1);
+INSERT INTO "remix_tag" VALUES(2685,'singing',1);
+INSERT INTO "remix_tag" VALUES(2685,'synth',1);
+INSERT INTO "remix_tag" VALUES(2685,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2685,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2685,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2685,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2686,'brass',1);
+INSERT INTO "remix_tag" VALUES(2686,'classical',1);
+INSERT INTO "remix_tag" VALUES(2686,'epic',1);
+INSERT INTO "remix_tag" VALUES(2686,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2686,'strings',1);
+INSERT INTO "remix_tag" VALUES(2686,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2687,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2687,'brass',1);
+INSERT INTO "remix_tag" VALUES(2687,'collab',1);
+INSERT INTO "remix_tag" VALUES(2687,'epic',1);
+INSERT INTO "remix_tag" VALUES(2687,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(2687,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2687,'rock',1);
+INSERT INTO "remix_tag" VALUES(2687,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(2687,'strings',1);
+INSERT INTO "remix_tag" VALUES(2687,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2687,'whistling',1);
+INSERT INTO "remix_tag" VALUES(2688,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2688,'dark',1);
+INSERT INTO "remix_tag" VALUES(2688,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2688,'synth',1);
+INSERT INTO "remix_tag" VALUES(2688,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2689,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2689,'collab',1);
+INSERT INTO "remix_tag" VALUES(2689,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2689,'flute',1);
+INSERT INTO "remix_tag" VALUES(2689,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2689,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2689,'singing',1);
+INSERT INTO "remix_tag" VALUES(2689,'strings',1);
+INSERT INTO "remix_tag" VALUES(2689,'synth',1);
+INSERT INTO "remix_tag" VALUES(2689,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2689,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2690,'brass',1);
+INSERT INTO "remix_tag" VALUES(2690,'choir',1);
+INSERT INTO "remix_tag" VALUES(2690,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2690,'classical',1);
+INSERT INTO "remix_tag" VALUES(2690,'dark',1);
+INSERT INTO "remix_tag" VALUES(2690,'epic',1);
+INSERT INTO "remix_tag" VALUES(2690,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2690,'strings',1);
+INSERT INTO "remix_tag" VALUES(2690,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2691,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2691,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(2691,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2691,'klezmer',1);
+INSERT INTO "remix_tag" VALUES(2691,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2691,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2691,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2691,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2691,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2692,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2692,'choir',1);
+INSERT INTO "remix_tag" VALUES(2692,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2692,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2693,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2693,'collab',1);
+INSERT INTO "remix_tag" VALUES(2693,'flute',1);
+INSERT INTO "remix_tag" VALUES(2693,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2693,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2693,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(2693,'piano',1);
+INSERT INTO "remix_tag" VALUES(2693,'strings',1);
+INSERT INTO "remix_tag" VALUES(2693,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2694,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2694,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2694,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2694,'pop',1);
+INSERT INTO "remix_tag" VALUES(2694,'singing',1);
+INSERT INTO "remix_tag" VALUES(2694,'synth',1);
+INSERT INTO "remix_tag" VALUES(2694,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2694,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2695,'collab',1);
+INSERT INTO "remix_tag" VALUES(2695,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2695,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2695,'pop',1);
+INSERT INTO "remix_tag" VALUES(2695,'synth',1);
+INSERT INTO "remix_tag" VALUES(2695,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2696,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2696,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2696,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2696,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2696,'rnb',1);
+INSERT INTO "remix_tag" VALUES(2696,'synth',1);
+INSERT INTO "remix_tag" VALUES(2697,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2697,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2697,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2697,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2697,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2697,'synth',1);
+INSERT INTO "remix_tag" VALUES(2697,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2698,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2698,'dark',1);
+INSERT INTO "remix_tag" VALUES(2698,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2698,'synth',1);
+INSERT INTO "remix_tag" VALUES(2698,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2698,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(2699,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2699,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2699,'epic',1);
+INSERT INTO "remix_tag" VALUES(2699,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(2699,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2699,'piano',1);
+INSERT INTO "remix_tag" VALUES(2699,'rock',1);
+INSERT INTO "remix_tag" VALUES(2699,'rock-opera',1);
+INSERT INTO "remix_tag" VALUES(2699,'singing',1);
+INSERT INTO "remix_tag" VALUES(2699,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2700,'brass',1);
+INSERT INTO "remix_tag" VALUES(2700,'classical',1);
+INSERT INTO "remix_tag" VALUES(2700,'epic',1);
+INSERT INTO "remix_tag" VALUES(2700,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2700,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2700,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2700,'strings',1);
+INSERT INTO "remix_tag" VALUES(2700,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2702,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2702,'dark',1);
+INSERT INTO "remix_tag" VALUES(2702,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2702,'metal',1);
+INSERT INTO "remix_tag" VALUES(2702,'rock',1);
+INSERT INTO "remix_tag" VALUES(2702,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2703,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2703,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2703,'dark',1);
+INSERT INTO "remix_tag" VALUES(2703,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2703,'synth',1);
+INSERT INTO "remix_tag" VALUES(2703,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2705,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2705,'compo',1);
+INSERT INTO "remix_tag" VALUES(2705,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2705,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2705,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2705,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2705,'rnb',1);
+INSERT INTO "remix_tag" VALUES(2705,'synth',1);
+INSERT INTO "remix_tag" VALUES(2705,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(2706,'medley',1);
+INSERT INTO "remix_tag" VALUES(2706,'piano',1);
+INSERT INTO "remix_tag" VALUES(2706,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2706,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2706,'solo',1);
+INSERT INTO "remix_tag" VALUES(2706,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2706,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2707,'collab',1);
+INSERT INTO "remix_tag" VALUES(2707,'dark',1);
+INSERT INTO "remix_tag" VALUES(2707,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2707,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2707,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2707,'synth',1);
+INSERT INTO "remix_tag" VALUES(2708,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2708,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2708,'house',1);
+INSERT INTO "remix_tag" VALUES(2708,'synth',1);
+INSERT INTO "remix_tag" VALUES(2708,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2709,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2709,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2709,'folk',1);
+INSERT INTO "remix_tag" VALUES(2709,'funny',1);
+INSERT INTO "remix_tag" VALUES(2709,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2709,'singing',1);
+INSERT INTO "remix_tag" VALUES(2709,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2709,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2710,'collab',1);
+INSERT INTO "remix_tag" VALUES(2710,'compo',1);
+INSERT INTO "remix_tag" VALUES(2710,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2710,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2710,'funk',1);
+INSERT INTO "remix_tag" VALUES(2710,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2710,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2710,'piano',1);
+INSERT INTO "remix_tag" VALUES(2710,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2710,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(2711,'compo',1);
+INSERT INTO "remix_tag" VALUES(2711,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2711,'pop',1);
+INSERT INTO "remix_tag" VALUES(2711,'synth',1);
+INSERT INTO "remix_tag" VALUES(2711,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2712,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(2712,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2712,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2712,'marimba',1);
+INSERT INTO "remix_tag" VALUES(2712,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2712,'piano',1);
+INSERT INTO "remix_tag" VALUES(2713,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2713,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2713,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2713,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2713,'synth',1);
+INSERT INTO "remix_tag" VALUES(2714,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2714,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2714,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2714,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2714,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2715,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2715,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2715,'metal',1);
+INSERT INTO "remix_tag" VALUES(2715,'rock',1);
+INSERT INTO "remix_tag" VALUES(2715,'synth',1);
+INSERT INTO "remix_tag" VALUES(2715,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2717,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2720,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2720,'piano',1);
+INSERT INTO "remix_tag" VALUES(2720,'solo',1);
+INSERT INTO "remix_tag" VALUES(2720,'violin',1);
+INSERT INTO "remix_tag" VALUES(2721,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2722,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2725,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2726,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2726,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2726,'metal',1);
+INSERT INTO "remix_tag" VALUES(2726,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2726,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2726,'rock',1);
+INSERT INTO "remix_tag" VALUES(2726,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2727,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2727,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2727,'synth',1);
+INSERT INTO "remix_tag" VALUES(2727,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2728,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2728,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2728,'funk',1);
+INSERT INTO "remix_tag" VALUES(2728,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2728,'piano',1);
+INSERT INTO "remix_tag" VALUES(2728,'synth',1);
+INSERT INTO "remix_tag" VALUES(2729,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2729,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2729,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2729,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2729,'synth',1);
+INSERT INTO "remix_tag" VALUES(2729,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2730,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2730,'synth',1);
+INSERT INTO "remix_tag" VALUES(2731,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2731,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2731,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2731,'synth',1);
+INSERT INTO "remix_tag" VALUES(2732,'funk',1);
+INSERT INTO "remix_tag" VALUES(2732,'funky',1);
+INSERT INTO "remix_tag" VALUES(2732,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2732,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2732,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2732,'synth',1);
+INSERT INTO "remix_tag" VALUES(2733,'funk',1);
+INSERT INTO "remix_tag" VALUES(2733,'funky',1);
+INSERT INTO "remix_tag" VALUES(2733,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2733,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2733,'rap',1);
+INSERT INTO "remix_tag" VALUES(2733,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2733,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2734,'collab',1);
+INSERT INTO "remix_tag" VALUES(2734,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2734,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2734,'rock',1);
+INSERT INTO "remix_tag" VALUES(2734,'synth',1);
+INSERT INTO "remix_tag" VALUES(2734,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2735,'collab',1);
+INSERT INTO "remix_tag" VALUES(2735,'compo',1);
+INSERT INTO "remix_tag" VALUES(2735,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2735,'piano',1);
+INSERT INTO "remix_tag" VALUES(2735,'rock',1);
+INSERT INTO "remix_tag" VALUES(2735,'synth',1);
+INSERT INTO "remix_tag" VALUES(2735,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2736,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(2736,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2736,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2736,'marimba',1);
+INSERT INTO "remix_tag" VALUES(2736,'quintet',1);
+INSERT INTO "remix_tag" VALUES(2736,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2736,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(2737,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2737,'dance',1);
+INSERT INTO "remix_tag" VALUES(2737,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2737,'harp',1);
+INSERT INTO "remix_tag" VALUES(2737,'piano',1);
+INSERT INTO "remix_tag" VALUES(2737,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2737,'strings',1);
+INSERT INTO "remix_tag" VALUES(2737,'synth',1);
+INSERT INTO "remix_tag" VALUES(2737,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2738,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2738,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2738,'synth',1);
+INSERT INTO "remix_tag" VALUES(2738,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2738,'trance',1);
+INSERT INTO "remix_tag" VALUES(2739,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2739,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2739,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2739,'metal',1);
+INSERT INTO "remix_tag" VALUES(2739,'rock',1);
+INSERT INTO "remix_tag" VALUES(2739,'synth',1);
+INSERT INTO "remix_tag" VALUES(2739,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2740,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2740,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2740,'synth',1);
+INSERT INTO "remix_tag" VALUES(2740,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2741,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2741,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2741,'metal',1);
+INSERT INTO "remix_tag" VALUES(2741,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2742,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2742,'pop',1);
+INSERT INTO "remix_tag" VALUES(2742,'rock',1);
+INSERT INTO "remix_tag" VALUES(2742,'synth',1);
+INSERT INTO "remix_tag" VALUES(2743,'folk',1);
+INSERT INTO "remix_tag" VALUES(2743,'harp',1);
+INSERT INTO "remix_tag" VALUES(2743,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2743,'singing',1);
+INSERT INTO "remix_tag" VALUES(2743,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2743,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2744,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2744,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2744,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2744,'piano',1);
+INSERT INTO "remix_tag" VALUES(2744,'rnb',1);
+INSERT INTO "remix_tag" VALUES(2744,'singing',1);
+INSERT INTO "remix_tag" VALUES(2744,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2745,'folk',1);
+INSERT INTO "remix_tag" VALUES(2745,'japanese',1);
+INSERT INTO "remix_tag" VALUES(2745,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2745,'meditation',1);
+INSERT INTO "remix_tag" VALUES(2745,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2745,'new-age',1);
+INSERT INTO "remix_tag" VALUES(2745,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(2745,'singing',1);
+INSERT INTO "remix_tag" VALUES(2745,'strings',1);
+INSERT INTO "remix_tag" VALUES(2745,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2745,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2746,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2746,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2746,'metal',1);
+INSERT INTO "remix_tag" VALUES(2746,'rock',1);
+INSERT INTO "remix_tag" VALUES(2746,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2747,'collab',1);
+INSERT INTO "remix_tag" VALUES(2747,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2747,'epic',1);
+INSERT INTO "remix_tag" VALUES(2747,'funky',1);
+INSERT INTO "remix_tag" VALUES(2747,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2747,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2747,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2747,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2747,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2749,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2749,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2749,'epic',1);
+INSERT INTO "remix_tag" VALUES(2749,'metal',1);
+INSERT INTO "remix_tag" VALUES(2749,'rock',1);
+INSERT INTO "remix_tag" VALUES(2749,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2750,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2750,'collab',1);
+INSERT INTO "remix_tag" VALUES(2750,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2750,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2750,'synth',1);
+INSERT INTO "remix_tag" VALUES(2750,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2751,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2751,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2751,'metal',1);
+INSERT INTO "remix_tag" VALUES(2751,'synth',1);
+INSERT INTO "remix_tag" VALUES(2751,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2753,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2753,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2753,'pop',1);
+INSERT INTO "remix_tag" VALUES(2753,'synth',1);
+INSERT INTO "remix_tag" VALUES(2754,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2754,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2754,'metal',1);
+INSERT INTO "remix_tag" VALUES(2754,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2754,'rock',1);
+INSERT INTO "remix_tag" VALUES(2754,'synth',1);
+INSERT INTO "remix_tag" VALUES(2754,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2755,'compo',1);
+INSERT INTO "remix_tag" VALUES(2755,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2755,'synth',1);
+INSERT INTO "remix_tag" VALUES(2755,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2755,'world',1);
+INSERT INTO "remix_tag" VALUES(2756,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2756,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2756,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2756,'strings',1);
+INSERT INTO "remix_tag" VALUES(2756,'synth',1);
+INSERT INTO "remix_tag" VALUES(2756,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2757,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2757,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(2757,'collab',1);
+INSERT INTO "remix_tag" VALUES(2757,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2757,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2757,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2757,'rock',1);
+INSERT INTO "remix_tag" VALUES(2757,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2758,'brass',1);
+INSERT INTO "remix_tag" VALUES(2758,'choir',1);
+INSERT INTO "remix_tag" VALUES(2758,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2758,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2758,'epic',1);
+INSERT INTO "remix_tag" VALUES(2758,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2758,'strings',1);
+INSERT INTO "remix_tag" VALUES(2758,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2758,'world',1);
+INSERT INTO "remix_tag" VALUES(2759,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2759,'collab',1);
+INSERT INTO "remix_tag" VALUES(2759,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2759,'rock',1);
+INSERT INTO "remix_tag" VALUES(2759,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2759,'violin',1);
+INSERT INTO "remix_tag" VALUES(2761,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2761,'compo',1);
+INSERT INTO "remix_tag" VALUES(2761,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2761,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2761,'synth',1);
+INSERT INTO "remix_tag" VALUES(2764,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2764,'electro',1);
+INSERT INTO "remix_tag" VALUES(2764,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2764,'synth',1);
+INSERT INTO "remix_tag" VALUES(2764,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2766,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2766,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2766,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2766,'pop',1);
+INSERT INTO "remix_tag" VALUES(2766,'synth',1);
+INSERT INTO "remix_tag" VALUES(2767,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2769,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2771,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2771,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2771,'piano',1);
+INSERT INTO "remix_tag" VALUES(2771,'strings',1);
+INSERT INTO "remix_tag" VALUES(2771,'synth',1);
+INSERT INTO "remix_tag" VALUES(2771,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2772,'cello',1);
+INSERT INTO "remix_tag" VALUES(2772,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2772,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(2772,'piano',1);
+INSERT INTO "remix_tag" VALUES(2772,'rock',1);
+INSERT INTO "remix_tag" VALUES(2772,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2772,'violin',1);
+INSERT INTO "remix_tag" VALUES(2773,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2773,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2773,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2773,'metal',1);
+INSERT INTO "remix_tag" VALUES(2773,'rock',1);
+INSERT INTO "remix_tag" VALUES(2773,'synth',1);
+INSERT INTO "remix_tag" VALUES(2773,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2774,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2774,'collab',1);
+INSERT INTO "remix_tag" VALUES(2774,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2774,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2774,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2774,'strings',1);
+INSERT INTO "remix_tag" VALUES(2774,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2774,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2774,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2775,'collab',1);
+INSERT INTO "remix_tag" VALUES(2775,'compo',1);
+INSERT INTO "remix_tag" VALUES(2775,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2775,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2775,'piano',1);
+INSERT INTO "remix_tag" VALUES(2775,'synth',1);
+INSERT INTO "remix_tag" VALUES(2775,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(2777,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2777,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2777,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2777,'rock',1);
+INSERT INTO "remix_tag" VALUES(2777,'synth',1);
+INSERT INTO "remix_tag" VALUES(2778,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2778,'compo',1);
+INSERT INTO "remix_tag" VALUES(2778,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2778,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2778,'synth',1);
+INSERT INTO "remix_tag" VALUES(2778,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2779,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2779,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2779,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2779,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2779,'synth',1);
+INSERT INTO "remix_tag" VALUES(2779,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2780,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2780,'funky',1);
+INSERT INTO "remix_tag" VALUES(2780,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(2780,'synth',1);
+INSERT INTO "remix_tag" VALUES(2780,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2782,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2784,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2786,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2787,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2791,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2791,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2791,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2791,'japanese',1);
+INSERT INTO "remix_tag" VALUES(2791,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2791,'synth',1);
+INSERT INTO "remix_tag" VALUES(2791,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(2791,'world',1);
+INSERT INTO "remix_tag" VALUES(2793,'choir',1);
+INSERT INTO "remix_tag" VALUES(2793,'flute',1);
+INSERT INTO "remix_tag" VALUES(2793,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2793,'piano',1);
+INSERT INTO "remix_tag" VALUES(2793,'strings',1);
+INSERT INTO "remix_tag" VALUES(2793,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2794,'happy',1);
+INSERT INTO "remix_tag" VALUES(2794,'organ',1);
+INSERT INTO "remix_tag" VALUES(2794,'piano',1);
+INSERT INTO "remix_tag" VALUES(2794,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2794,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(2794,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2795,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2795,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2795,'piano',1);
+INSERT INTO "remix_tag" VALUES(2795,'solo',1);
+INSERT INTO "remix_tag" VALUES(2795,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2795,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2796,'collab',1);
+INSERT INTO "remix_tag" VALUES(2796,'compo',1);
+INSERT INTO "remix_tag" VALUES(2796,'dark',1);
+INSERT INTO "remix_tag" VALUES(2796,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2796,'metal',1);
+INSERT INTO "remix_tag" VALUES(2796,'rock',1);
+INSERT INTO "remix_tag" VALUES(2796,'synth',1);
+INSERT INTO "remix_tag" VALUES(2797,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2797,'compo',1);
+INSERT INTO "remix_tag" VALUES(2797,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2797,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2797,'synth',1);
+INSERT INTO "remix_tag" VALUES(2797,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2798,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2798,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2798,'collab',1);
+INSERT INTO "remix_tag" VALUES(2798,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2798,'pop',1);
+INSERT INTO "remix_tag" VALUES(2798,'singing',1);
+INSERT INTO "remix_tag" VALUES(2798,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2798,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2799,'collab',1);
+INSERT INTO "remix_tag" VALUES(2799,'flute',1);
+INSERT INTO "remix_tag" VALUES(2799,'harp',1);
+INSERT INTO "remix_tag" VALUES(2799,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2799,'oboe',1);
+INSERT INTO "remix_tag" VALUES(2799,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2799,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2799,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2799,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2800,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2800,'collab',1);
+INSERT INTO "remix_tag" VALUES(2800,'compo',1);
+INSERT INTO "remix_tag" VALUES(2800,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2800,'piano',1);
+INSERT INTO "remix_tag" VALUES(2800,'synth',1);
+INSERT INTO "remix_tag" VALUES(2800,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2801,'bells',1);
+INSERT INTO "remix_tag" VALUES(2801,'funk',1);
+INSERT INTO "remix_tag" VALUES(2801,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2801,'piano',1);
+INSERT INTO "remix_tag" VALUES(2801,'pop',1);
+INSERT INTO "remix_tag" VALUES(2801,'strings',1);
+INSERT INTO "remix_tag" VALUES(2801,'synth',1);
+INSERT INTO "remix_tag" VALUES(2801,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2801,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(2802,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2802,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2802,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2802,'rock',1);
+INSERT INTO "remix_tag" VALUES(2802,'synth',1);
+INSERT INTO "remix_tag" VALUES(2802,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2803,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2803,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2803,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2803,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2803,'synth',1);
+INSERT INTO "remix_tag" VALUES(2804,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2814,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2814,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2814,'rock',1);
+INSERT INTO "remix_tag" VALUES(2814,'synth',1);
+INSERT INTO "remix_tag" VALUES(2814,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2815,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2815,'collab',1);
+INSERT INTO "remix_tag" VALUES(2815,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2815,'dark',1);
+INSERT INTO "remix_tag" VALUES(2815,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2815,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2815,'rock',1);
+INSERT INTO "remix_tag" VALUES(2815,'strings',1);
+INSERT INTO "remix_tag" VALUES(2815,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2815,'viola',1);
+INSERT INTO "remix_tag" VALUES(2816,'brass',1);
+INSERT INTO "remix_tag" VALUES(2816,'flute',1);
+INSERT INTO "remix_tag" VALUES(2816,'happy',1);
+INSERT INTO "remix_tag" VALUES(2816,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2816,'strings',1);
+INSERT INTO "remix_tag" VALUES(2816,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2816,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2817,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2817,'compo',1);
+INSERT INTO "remix_tag" VALUES(2817,'funk',1);
+INSERT INTO "remix_tag" VALUES(2817,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2817,'synth',1);
+INSERT INTO "remix_tag" VALUES(2817,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(2818,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2818,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2818,'metal',1);
+INSERT INTO "remix_tag" VALUES(2818,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2818,'ska',1);
+INSERT INTO "remix_tag" VALUES(2818,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2818,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2818,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2819,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2819,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2819,'happy',1);
+INSERT INTO "remix_tag" VALUES(2819,'synth',1);
+INSERT INTO "remix_tag" VALUES(2819,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2819,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(2820,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2820,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2821,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2822,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2822,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2822,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2823,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2823,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2823,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2823,'medley',1);
+INSERT INTO "remix_tag" VALUES(2823,'rock',1);
+INSERT INTO "remix_tag" VALUES(2823,'synth',1);
+INSERT INTO "remix_tag" VALUES(2823,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2824,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2824,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2824,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2824,'piano',1);
+INSERT INTO "remix_tag" VALUES(2824,'rock',1);
+INSERT INTO "remix_tag" VALUES(2824,'synth',1);
+INSERT INTO "remix_tag" VALUES(2826,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2826,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2826,'flute',1);
+INSERT INTO "remix_tag" VALUES(2826,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2826,'piano',1);
+INSERT INTO "remix_tag" VALUES(2826,'strings',1);
+INSERT INTO "remix_tag" VALUES(2826,'synth',1);
+INSERT INTO "remix_tag" VALUES(2827,'collab',1);
+INSERT INTO "remix_tag" VALUES(2827,'compo',1);
+INSERT INTO "remix_tag" VALUES(2827,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2827,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2827,'pop',1);
+INSERT INTO "remix_tag" VALUES(2827,'singing',1);
+INSERT INTO "remix_tag" VALUES(2827,'synth',1);
+INSERT INTO "remix_tag" VALUES(2827,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2828,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2828,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2828,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2828,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2828,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2828,'piano',1);
+INSERT INTO "remix_tag" VALUES(2828,'rock',1);
+INSERT INTO "remix_tag" VALUES(2828,'synth',1);
+INSERT INTO "remix_tag" VALUES(2828,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2829,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2829,'collab',1);
+INSERT INTO "remix_tag" VALUES(2829,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2829,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2829,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2829,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2829,'rock',1);
+INSERT INTO "remix_tag" VALUES(2829,'synth',1);
+INSERT INTO "remix_tag" VALUES(2829,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2830,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2830,'brass',1);
+INSERT INTO "remix_tag" VALUES(2830,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2830,'funk',1);
+INSERT INTO "remix_tag" VALUES(2830,'organ',1);
+INSERT INTO "remix_tag" VALUES(2830,'rock',1);
+INSERT INTO "remix_tag" VALUES(2830,'synth',1);
+INSERT INTO "remix_tag" VALUES(2831,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2831,'experimental',1);
+INSERT INTO "remix_tag" VALUES(2831,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2831,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2831,'synth',1);
+INSERT INTO "remix_tag" VALUES(2831,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2832,'brass',1);
+INSERT INTO "remix_tag" VALUES(2832,'choir',1);
+INSERT INTO "remix_tag" VALUES(2832,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2832,'epic',1);
+INSERT INTO "remix_tag" VALUES(2832,'medley',1);
+INSERT INTO "remix_tag" VALUES(2832,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2832,'strings',1);
+INSERT INTO "remix_tag" VALUES(2833,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(2833,'chill',1);
+INSERT INTO "remix_tag" VALUES(2833,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2833,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2833,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2833,'synth',1);
+INSERT INTO "remix_tag" VALUES(2834,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2834,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2834,'banjo',1);
+INSERT INTO "remix_tag" VALUES(2834,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(2834,'happy',1);
+INSERT INTO "remix_tag" VALUES(2834,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(2835,'cello',1);
+INSERT INTO "remix_tag" VALUES(2835,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2835,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2835,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2835,'strings',1);
+INSERT INTO "remix_tag" VALUES(2835,'synth',1);
+INSERT INTO "remix_tag" VALUES(2836,'dark',1);
+INSERT INTO "remix_tag" VALUES(2836,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2836,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2836,'strings',1);
+INSERT INTO "remix_tag" VALUES(2836,'synth',1);
+INSERT INTO "remix_tag" VALUES(2837,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2837,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2837,'happy',1);
+INSERT INTO "remix_tag" VALUES(2837,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2837,'synth',1);
+INSERT INTO "remix_tag" VALUES(2838,'bells',1);
+INSERT INTO "remix_tag" VALUES(2838,'brass',1);
+INSERT INTO "remix_tag" VALUES(2838,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2838,'dark',1);
+INSERT INTO "remix_tag" VALUES(2838,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2838,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2838,'strings',1);
+INSERT INTO "remix_tag" VALUES(2838,'synth',1);
+INSERT INTO "remix_tag" VALUES(2839,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2839,'synth',1);
+INSERT INTO "remix_tag" VALUES(2840,'brass',1);
+INSERT INTO "remix_tag" VALUES(2840,'choir',1);
+INSERT INTO "remix_tag" VALUES(2840,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2840,'epic',1);
+INSERT INTO "remix_tag" VALUES(2840,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2840,'strings',1);
+INSERT INTO "remix_tag" VALUES(2842,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2842,'collab',1);
+INSERT INTO "remix_tag" VALUES(2842,'dark',1);
+INSERT INTO "remix_tag" VALUES(2842,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2842,'metal',1);
+INSERT INTO "remix_tag" VALUES(2842,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2843,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2843,'dark',1);
+INSERT INTO "remix_tag" VALUES(2843,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2843,'metal',1);
+INSERT INTO "remix_tag" VALUES(2843,'rock',1);
+INSERT INTO "remix_tag" VALUES(2843,'singing',1);
+INSERT INTO "remix_tag" VALUES(2843,'synth',1);
+INSERT INTO "remix_tag" VALUES(2843,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2844,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2844,'brass',1);
+INSERT INTO "remix_tag" VALUES(2844,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2844,'latin',1);
+INSERT INTO "remix_tag" VALUES(2844,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2845,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2845,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2845,'metal',1);
+INSERT INTO "remix_tag" VALUES(2845,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2845,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2846,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2846,'collab',1);
+INSERT INTO "remix_tag" VALUES(2846,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2846,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2846,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2846,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2846,'synth',1);
+INSERT INTO "remix_tag" VALUES(2847,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(2847,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2847,'flute',1);
+INSERT INTO "remix_tag" VALUES(2847,'folk',1);
+INSERT INTO "remix_tag" VALUES(2847,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2847,'rock',1);
+INSERT INTO "remix_tag" VALUES(2848,'dance',1);
+INSERT INTO "remix_tag" VALUES(2848,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2848,'happy',1);
+INSERT INTO "remix_tag" VALUES(2848,'piano',1);
+INSERT INTO "remix_tag" VALUES(2848,'synth',1);
+INSERT INTO "remix_tag" VALUES(2848,'trance',1);
+INSERT INTO "remix_tag" VALUES(2849,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2849,'dance',1);
+INSERT INTO "remix_tag" VALUES(2849,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2849,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2849,'happy',1);
+INSERT INTO "remix_tag" VALUES(2849,'synth',1);
+INSERT INTO "remix_tag" VALUES(2850,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2850,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2850,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2850,'epic',1);
+INSERT INTO "remix_tag" VALUES(2850,'metal',1);
+INSERT INTO "remix_tag" VALUES(2850,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2850,'rock',1);
+INSERT INTO "remix_tag" VALUES(2850,'synth',1);
+INSERT INTO "remix_tag" VALUES(2850,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2852,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2853,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2853,'chinese',1);
+INSERT INTO "remix_tag" VALUES(2853,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2853,'synth',1);
+INSERT INTO "remix_tag" VALUES(2854,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2854,'flute',1);
+INSERT INTO "remix_tag" VALUES(2854,'folk',1);
+INSERT INTO "remix_tag" VALUES(2854,'latin',1);
+INSERT INTO "remix_tag" VALUES(2854,'singing',1);
+INSERT INTO "remix_tag" VALUES(2854,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(2854,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2855,'compo',1);
+INSERT INTO "remix_tag" VALUES(2855,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2855,'funk',1);
+INSERT INTO "remix_tag" VALUES(2855,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2855,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2855,'synth',1);
+INSERT INTO "remix_tag" VALUES(2856,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2856,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(2856,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2856,'synth',1);
+INSERT INTO "remix_tag" VALUES(2856,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2856,'trance',1);
+INSERT INTO "remix_tag" VALUES(2856,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2857,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2857,'choir',1);
+INSERT INTO "remix_tag" VALUES(2857,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2857,'synth',1);
+INSERT INTO "remix_tag" VALUES(2858,'brass',1);
+INSERT INTO "remix_tag" VALUES(2858,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2858,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2858,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2858,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2858,'piano',1);
+INSERT INTO "remix_tag" VALUES(2858,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2858,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(2859,'collab',1);
+INSERT INTO "remix_tag" VALUES(2859,'dance',1);
+INSERT INTO "remix_tag" VALUES(2859,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2859,'happy',1);
+INSERT INTO "remix_tag" VALUES(2859,'synth',1);
+INSERT INTO "remix_tag" VALUES(2860,'brass',1);
+INSERT INTO "remix_tag" VALUES(2860,'funk',1);
+INSERT INTO "remix_tag" VALUES(2860,'funky',1);
+INSERT INTO "remix_tag" VALUES(2860,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2860,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2860,'synth',1);
+INSERT INTO "remix_tag" VALUES(2861,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2861,'collab',1);
+INSERT INTO "remix_tag" VALUES(2861,'folk',1);
+INSERT INTO "remix_tag" VALUES(2861,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2861,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2861,'new-age',1);
+INSERT INTO "remix_tag" VALUES(2861,'singing',1);
+INSERT INTO "remix_tag" VALUES(2861,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2862,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2862,'funky',1);
+INSERT INTO "remix_tag" VALUES(2862,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2862,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2862,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2862,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2862,'ska',1);
+INSERT INTO "remix_tag" VALUES(2862,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2863,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2863,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2863,'rock',1);
+INSERT INTO "remix_tag" VALUES(2864,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2864,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2864,'rock',1);
+INSERT INTO "remix_tag" VALUES(2864,'synth',1);
+INSERT INTO "remix_tag" VALUES(2865,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2865,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2865,'piano',1);
+INSERT INTO "remix_tag" VALUES(2865,'rock',1);
+INSERT INTO "remix_tag" VALUES(2865,'synth',1);
+INSERT INTO "remix_tag" VALUES(2866,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2866,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2866,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2866,'rock',1);
+INSERT INTO "remix_tag" VALUES(2866,'surf',1);
+INSERT INTO "remix_tag" VALUES(2867,'collab',1);
+INSERT INTO "remix_tag" VALUES(2867,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2867,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2867,'rock',1);
+INSERT INTO "remix_tag" VALUES(2867,'synth',1);
+INSERT INTO "remix_tag" VALUES(2868,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2868,'medley',1);
+INSERT INTO "remix_tag" VALUES(2868,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2868,'rock',1);
+INSERT INTO "remix_tag" VALUES(2868,'synth',1);
+INSERT INTO "remix_tag" VALUES(2869,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2869,'rock',1);
+INSERT INTO "remix_tag" VALUES(2869,'swing',1);
+INSERT INTO "remix_tag" VALUES(2872,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2872,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2872,'collab',1);
+INSERT INTO "remix_tag" VALUES(2872,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2872,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2872,'experimental',1);
+INSERT INTO "remix_tag" VALUES(2872,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2872,'synth',1);
+INSERT INTO "remix_tag" VALUES(2872,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2872,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(2872,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(2873,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2873,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2873,'synth',1);
+INSERT INTO "remix_tag" VALUES(2874,'dance',1);
+INSERT INTO "remix_tag" VALUES(2874,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2874,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2874,'house',1);
+INSERT INTO "remix_tag" VALUES(2874,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2874,'synth',1);
+INSERT INTO "remix_tag" VALUES(2874,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2875,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2875,'electro',1);
+INSERT INTO "remix_tag" VALUES(2875,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2875,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2875,'synth',1);
+INSERT INTO "remix_tag" VALUES(2876,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2876,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2876,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2876,'synth',1);
+INSERT INTO "remix_tag" VALUES(2877,'collab',1);
+INSERT INTO "remix_tag" VALUES(2877,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2877,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2877,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(2877,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2877,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2877,'synth',1);
+INSERT INTO "remix_tag" VALUES(2877,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2877,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2877,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2878,'dance',1);
+INSERT INTO "remix_tag" VALUES(2878,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2878,'synth',1);
+INSERT INTO "remix_tag" VALUES(2878,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2878,'trance',1);
+INSERT INTO "remix_tag" VALUES(2879,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2879,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2879,'rock',1);
+INSERT INTO "remix_tag" VALUES(2879,'synth',1);
+INSERT INTO "remix_tag" VALUES(2879,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2880,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2880,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2880,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2880,'piano',1);
+INSERT INTO "remix_tag" VALUES(2880,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2880,'synth',1);
+INSERT INTO "remix_tag" VALUES(2880,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2882,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2882,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2882,'electro',1);
+INSERT INTO "remix_tag" VALUES(2882,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2882,'house',1);
+INSERT INTO "remix_tag" VALUES(2882,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2882,'synth',1);
+INSERT INTO "remix_tag" VALUES(2883,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2883,'collab',1);
+INSERT INTO "remix_tag" VALUES(2883,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2883,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2883,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2883,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2883,'pop',1);
+INSERT INTO "remix_tag" VALUES(2883,'singing',1);
+INSERT INTO "remix_tag" VALUES(2883,'synth',1);
+INSERT INTO "remix_tag" VALUES(2883,'violin',1);
+INSERT INTO "remix_tag" VALUES(2883,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2884,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2884,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2884,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2884,'synth',1);
+INSERT INTO "remix_tag" VALUES(2885,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2885,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(2885,'folk',1);
+INSERT INTO "remix_tag" VALUES(2885,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2885,'klezmer',1);
+INSERT INTO "remix_tag" VALUES(2885,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2885,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2886,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2886,'fusion',1);
+INSERT INTO "remix_tag" VALUES(2886,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2886,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2886,'synth',1);
+INSERT INTO "remix_tag" VALUES(2887,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2887,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2887,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2887,'piano',1);
+INSERT INTO "remix_tag" VALUES(2887,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2887,'strings',1);
+INSERT INTO "remix_tag" VALUES(2887,'synth',1);
+INSERT INTO "remix_tag" VALUES(2887,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2888,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2888,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2888,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2888,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2888,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2888,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2888,'synth',1);
+INSERT INTO "remix_tag" VALUES(2888,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2888,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2889,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2889,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2889,'metal',1);
+INSERT INTO "remix_tag" VALUES(2889,'rock',1);
+INSERT INTO "remix_tag" VALUES(2889,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2890,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2890,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2890,'compo',1);
+INSERT INTO "remix_tag" VALUES(2890,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2890,'synth',1);
+INSERT INTO "remix_tag" VALUES(2890,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2891,'brass',1);
+INSERT INTO "remix_tag" VALUES(2891,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2891,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2891,'funk',1);
+INSERT INTO "remix_tag" VALUES(2891,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2891,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2892,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2892,'collab',1);
+INSERT INTO "remix_tag" VALUES(2892,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2892,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2892,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2892,'piano',1);
+INSERT INTO "remix_tag" VALUES(2892,'synth',1);
+INSERT INTO "remix_tag" VALUES(2893,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2893,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2893,'synth',1);
+INSERT INTO "remix_tag" VALUES(2893,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2895,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2895,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2895,'dark',1);
+INSERT INTO "remix_tag" VALUES(2895,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2895,'epic',1);
+INSERT INTO "remix_tag" VALUES(2895,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2895,'strings',1);
+INSERT INTO "remix_tag" VALUES(2895,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2896,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2896,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2896,'epic',1);
+INSERT INTO "remix_tag" VALUES(2896,'metal',1);
+INSERT INTO "remix_tag" VALUES(2896,'rock',1);
+INSERT INTO "remix_tag" VALUES(2896,'synth',1);
+INSERT INTO "remix_tag" VALUES(2897,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2897,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2897,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2897,'metal',1);
+INSERT INTO "remix_tag" VALUES(2897,'rock',1);
+INSERT INTO "remix_tag" VALUES(2897,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2898,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2898,'collab',1);
+INSERT INTO "remix_tag" VALUES(2898,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2898,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2898,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2898,'piano',1);
+INSERT INTO "remix_tag" VALUES(2898,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2898,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2899,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2899,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2899,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2899,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2899,'strings',1);
+INSERT INTO "remix_tag" VALUES(2900,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2900,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(2900,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2900,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2900,'epic',1);
+INSERT INTO "remix_tag" VALUES(2900,'medley',1);
+INSERT INTO "remix_tag" VALUES(2900,'metal',1);
+INSERT INTO "remix_tag" VALUES(2900,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2900,'rock',1);
+INSERT INTO "remix_tag" VALUES(2900,'synth',1);
+INSERT INTO "remix_tag" VALUES(2900,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2901,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2901,'dark',1);
+INSERT INTO "remix_tag" VALUES(2901,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2901,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2901,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2901,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2901,'synth',1);
+INSERT INTO "remix_tag" VALUES(2901,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2901,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(2902,'collab',1);
+INSERT INTO "remix_tag" VALUES(2902,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2902,'piano',1);
+INSERT INTO "remix_tag" VALUES(2902,'solo',1);
+INSERT INTO "remix_tag" VALUES(2902,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2902,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2904,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2904,'collab',1);
+INSERT INTO "remix_tag" VALUES(2904,'compo',1);
+INSERT INTO "remix_tag" VALUES(2904,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2904,'rock',1);
+INSERT INTO "remix_tag" VALUES(2904,'synth',1);
+INSERT INTO "remix_tag" VALUES(2905,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2905,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2905,'funky',1);
+INSERT INTO "remix_tag" VALUES(2905,'harp',1);
+INSERT INTO "remix_tag" VALUES(2905,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2905,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2905,'synth',1);
+INSERT INTO "remix_tag" VALUES(2906,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2906,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2906,'rock',1);
+INSERT INTO "remix_tag" VALUES(2906,'synth',1);
+INSERT INTO "remix_tag" VALUES(2906,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2908,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2911,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2912,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2912,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2912,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2912,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2912,'synth',1);
+INSERT INTO "remix_tag" VALUES(2912,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2913,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2913,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2913,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2913,'strings',1);
+INSERT INTO "remix_tag" VALUES(2913,'synth',1);
+INSERT INTO "remix_tag" VALUES(2913,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2914,'collab',1);
+INSERT INTO "remix_tag" VALUES(2914,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2914,'goofy',1);
+INSERT INTO "remix_tag" VALUES(2914,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2914,'singing',1);
+INSERT INTO "remix_tag" VALUES(2914,'synth',1);
+INSERT INTO "remix_tag" VALUES(2914,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2915,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2915,'dark',1);
+INSERT INTO "remix_tag" VALUES(2915,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2915,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2915,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2915,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2915,'synth',1);
+INSERT INTO "remix_tag" VALUES(2915,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2917,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2917,'synth',1);
+INSERT INTO "remix_tag" VALUES(2918,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2918,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2918,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2918,'rock',1);
+INSERT INTO "remix_tag" VALUES(2919,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2919,'brass',1);
+INSERT INTO "remix_tag" VALUES(2919,'choir',1);
+INSERT INTO "remix_tag" VALUES(2919,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2919,'epic',1);
+INSERT INTO "remix_tag" VALUES(2919,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2919,'strings',1);
+INSERT INTO "remix_tag" VALUES(2919,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2920,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2920,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2920,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2920,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2920,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2920,'rock',1);
+INSERT INTO "remix_tag" VALUES(2920,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(2921,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2921,'dnb',1);
+INSERT INTO "remix_tag" VALUES(2921,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2921,'halloween',1);
+INSERT INTO "remix_tag" VALUES(2921,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2921,'synth',1);
+INSERT INTO "remix_tag" VALUES(2921,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2922,'collab',1);
+INSERT INTO "remix_tag" VALUES(2922,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2922,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2922,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(2922,'synth',1);
+INSERT INTO "remix_tag" VALUES(2924,'dark',1);
+INSERT INTO "remix_tag" VALUES(2924,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2924,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2924,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2924,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2924,'piano',1);
+INSERT INTO "remix_tag" VALUES(2924,'synth',1);
+INSERT INTO "remix_tag" VALUES(2925,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2925,'dark',1);
+INSERT INTO "remix_tag" VALUES(2925,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2925,'metal',1);
+INSERT INTO "remix_tag" VALUES(2925,'rock',1);
+INSERT INTO "remix_tag" VALUES(2925,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2925,'strings',1);
+INSERT INTO "remix_tag" VALUES(2926,'collab',1);
+INSERT INTO "remix_tag" VALUES(2926,'compo',1);
+INSERT INTO "remix_tag" VALUES(2926,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2926,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2926,'synth',1);
+INSERT INTO "remix_tag" VALUES(2927,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2927,'dark',1);
+INSERT INTO "remix_tag" VALUES(2927,'epic',1);
+INSERT INTO "remix_tag" VALUES(2927,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2927,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2927,'strings',1);
+INSERT INTO "remix_tag" VALUES(2928,'medley',1);
+INSERT INTO "remix_tag" VALUES(2928,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2928,'piano',1);
+INSERT INTO "remix_tag" VALUES(2928,'solo',1);
+INSERT INTO "remix_tag" VALUES(2928,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2929,'harp',1);
+INSERT INTO "remix_tag" VALUES(2929,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(2929,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2929,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2929,'new-age',1);
+INSERT INTO "remix_tag" VALUES(2929,'singing',1);
+INSERT INTO "remix_tag" VALUES(2929,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2929,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2930,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2930,'brass',1);
+INSERT INTO "remix_tag" VALUES(2930,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2930,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2930,'collab',1);
+INSERT INTO "remix_tag" VALUES(2930,'compo',1);
+INSERT INTO "remix_tag" VALUES(2930,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2930,'epic',1);
+INSERT INTO "remix_tag" VALUES(2930,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2930,'strings',1);
+INSERT INTO "remix_tag" VALUES(2930,'synth',1);
+INSERT INTO "remix_tag" VALUES(2931,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2931,'dark',1);
+INSERT INTO "remix_tag" VALUES(2931,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2931,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2932,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2932,'dark',1);
+INSERT INTO "remix_tag" VALUES(2932,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2932,'edm',1);
+INSERT INTO "remix_tag" VALUES(2932,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2932,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2932,'piano',1);
+INSERT INTO "remix_tag" VALUES(2932,'synth',1);
+INSERT INTO "remix_tag" VALUES(2932,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2933,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2933,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2933,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2933,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2933,'synth',1);
+INSERT INTO "remix_tag" VALUES(2933,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(2934,'funky',1);
+INSERT INTO "remix_tag" VALUES(2934,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(2934,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2935,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2935,'compo',1);
+INSERT INTO "remix_tag" VALUES(2935,'dance',1);
+INSERT INTO "remix_tag" VALUES(2935,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2935,'funky',1);
+INSERT INTO "remix_tag" VALUES(2935,'synth',1);
+INSERT INTO "remix_tag" VALUES(2936,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2936,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2936,'epic',1);
+INSERT INTO "remix_tag" VALUES(2936,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2936,'strings',1);
+INSERT INTO "remix_tag" VALUES(2936,'synth',1);
+INSERT INTO "remix_tag" VALUES(2937,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2937,'chill',1);
+INSERT INTO "remix_tag" VALUES(2937,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2937,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2937,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2938,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2938,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2938,'dark',1);
+INSERT INTO "remix_tag" VALUES(2938,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2938,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2938,'synth',1);
+INSERT INTO "remix_tag" VALUES(2938,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2939,'collab',1);
+INSERT INTO "remix_tag" VALUES(2939,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2939,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2939,'synth',1);
+INSERT INTO "remix_tag" VALUES(2939,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2940,'brass',1);
+INSERT INTO "remix_tag" VALUES(2940,'collab',1);
+INSERT INTO "remix_tag" VALUES(2940,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2940,'rock',1);
+INSERT INTO "remix_tag" VALUES(2940,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2941,'chill',1);
+INSERT INTO "remix_tag" VALUES(2941,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(2941,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2941,'rnb',1);
+INSERT INTO "remix_tag" VALUES(2941,'synth',1);
+INSERT INTO "remix_tag" VALUES(2941,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(2942,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2942,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2942,'funky',1);
+INSERT INTO "remix_tag" VALUES(2942,'synth',1);
+INSERT INTO "remix_tag" VALUES(2943,'brass',1);
+INSERT INTO "remix_tag" VALUES(2943,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2943,'flute',1);
+INSERT INTO "remix_tag" VALUES(2943,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(2943,'rock',1);
+INSERT INTO "remix_tag" VALUES(2947,'harp',1);
+INSERT INTO "remix_tag" VALUES(2947,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2947,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2947,'strings',1);
+INSERT INTO "remix_tag" VALUES(2948,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2948,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2948,'synth',1);
+INSERT INTO "remix_tag" VALUES(2949,'brass',1);
+INSERT INTO "remix_tag" VALUES(2949,'collab',1);
+INSERT INTO "remix_tag" VALUES(2949,'happy',1);
+INSERT INTO "remix_tag" VALUES(2949,'march',1);
+INSERT INTO "remix_tag" VALUES(2949,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2949,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2950,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2950,'collab',1);
+INSERT INTO "remix_tag" VALUES(2950,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2950,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(2950,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2950,'singing',1);
+INSERT INTO "remix_tag" VALUES(2950,'synth',1);
+INSERT INTO "remix_tag" VALUES(2950,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2950,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2950,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(2951,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2951,'brass',1);
+INSERT INTO "remix_tag" VALUES(2951,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2951,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2951,'piano',1);
+INSERT INTO "remix_tag" VALUES(2951,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2951,'rock',1);
+INSERT INTO "remix_tag" VALUES(2951,'strings',1);
+INSERT INTO "remix_tag" VALUES(2951,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2952,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2952,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2952,'rock',1);
+INSERT INTO "remix_tag" VALUES(2952,'synth',1);
+INSERT INTO "remix_tag" VALUES(2953,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2953,'synth',1);
+INSERT INTO "remix_tag" VALUES(2954,'jazz',1);
+INSERT INTO "remix_tag" VALUES(2954,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2954,'piano',1);
+INSERT INTO "remix_tag" VALUES(2954,'solo',1);
+INSERT INTO "remix_tag" VALUES(2954,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2955,'dark',1);
+INSERT INTO "remix_tag" VALUES(2955,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2955,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2955,'synth',1);
+INSERT INTO "remix_tag" VALUES(2956,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2956,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2956,'happy',1);
+INSERT INTO "remix_tag" VALUES(2956,'synth',1);
+INSERT INTO "remix_tag" VALUES(2957,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2957,'dance',1);
+INSERT INTO "remix_tag" VALUES(2957,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2957,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2957,'synth',1);
+INSERT INTO "remix_tag" VALUES(2959,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2959,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2959,'happy',1);
+INSERT INTO "remix_tag" VALUES(2959,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2959,'synth',1);
+INSERT INTO "remix_tag" VALUES(2960,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2960,'dark',1);
+INSERT INTO "remix_tag" VALUES(2960,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2960,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2960,'singing',1);
+INSERT INTO "remix_tag" VALUES(2960,'synth',1);
+INSERT INTO "remix_tag" VALUES(2960,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(2961,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2961,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2961,'rock',1);
+INSERT INTO "remix_tag" VALUES(2961,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2961,'synth',1);
+INSERT INTO "remix_tag" VALUES(2962,'classical',1);
+INSERT INTO "remix_tag" VALUES(2962,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2962,'piano',1);
+INSERT INTO "remix_tag" VALUES(2962,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2962,'solo',1);
+INSERT INTO "remix_tag" VALUES(2962,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(2963,'bells',1);
+INSERT INTO "remix_tag" VALUES(2963,'chill',1);
+INSERT INTO "remix_tag" VALUES(2963,'dance',1);
+INSERT INTO "remix_tag" VALUES(2963,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2963,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2963,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2963,'synth',1);
+INSERT INTO "remix_tag" VALUES(2964,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2964,'metal',1);
+INSERT INTO "remix_tag" VALUES(2964,'rock',1);
+INSERT INTO "remix_tag" VALUES(2964,'synth',1);
+INSERT INTO "remix_tag" VALUES(2964,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2966,'chill',1);
+INSERT INTO "remix_tag" VALUES(2966,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2966,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2966,'funky',1);
+INSERT INTO "remix_tag" VALUES(2966,'fusion',1);
+INSERT INTO "remix_tag" VALUES(2966,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2966,'synth',1);
+INSERT INTO "remix_tag" VALUES(2967,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2967,'choir',1);
+INSERT INTO "remix_tag" VALUES(2967,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(2967,'harp',1);
+INSERT INTO "remix_tag" VALUES(2967,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2967,'piano',1);
+INSERT INTO "remix_tag" VALUES(2967,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(2967,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(2968,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2968,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(2968,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(2968,'edm',1);
+INSERT INTO "remix_tag" VALUES(2968,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2968,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(2968,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(2968,'synth',1);
+INSERT INTO "remix_tag" VALUES(2969,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2969,'compo',1);
+INSERT INTO "remix_tag" VALUES(2969,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2969,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2969,'pop',1);
+INSERT INTO "remix_tag" VALUES(2969,'synth',1);
+INSERT INTO "remix_tag" VALUES(2970,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2970,'chill',1);
+INSERT INTO "remix_tag" VALUES(2970,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(2970,'strings',1);
+INSERT INTO "remix_tag" VALUES(2970,'synth',1);
+INSERT INTO "remix_tag" VALUES(2972,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2972,'folk',1);
+INSERT INTO "remix_tag" VALUES(2972,'happy',1);
+INSERT INTO "remix_tag" VALUES(2972,'marimba',1);
+INSERT INTO "remix_tag" VALUES(2972,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2972,'organ',1);
+INSERT INTO "remix_tag" VALUES(2972,'piano',1);
+INSERT INTO "remix_tag" VALUES(2972,'rock',1);
+INSERT INTO "remix_tag" VALUES(2972,'synth',1);
+INSERT INTO "remix_tag" VALUES(2973,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2973,'collab',1);
+INSERT INTO "remix_tag" VALUES(2973,'dark',1);
+INSERT INTO "remix_tag" VALUES(2973,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2973,'industrial',1);
+INSERT INTO "remix_tag" VALUES(2973,'metal',1);
+INSERT INTO "remix_tag" VALUES(2973,'rock',1);
+INSERT INTO "remix_tag" VALUES(2973,'strings',1);
+INSERT INTO "remix_tag" VALUES(2973,'synth',1);
+INSERT INTO "remix_tag" VALUES(2974,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2974,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2974,'synth',1);
+INSERT INTO "remix_tag" VALUES(2975,'accordion',1);
+INSERT INTO "remix_tag" VALUES(2975,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2975,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2975,'rock',1);
+INSERT INTO "remix_tag" VALUES(2976,'chill',1);
+INSERT INTO "remix_tag" VALUES(2976,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2982,'ambient',1);
+INSERT INTO "remix_tag" VALUES(2982,'dark',1);
+INSERT INTO "remix_tag" VALUES(2982,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2982,'synth',1);
+INSERT INTO "remix_tag" VALUES(2983,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2983,'ballad',1);
+INSERT INTO "remix_tag" VALUES(2983,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(2983,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2983,'piano',1);
+INSERT INTO "remix_tag" VALUES(2983,'strings',1);
+INSERT INTO "remix_tag" VALUES(2983,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(2984,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2984,'piano',1);
+INSERT INTO "remix_tag" VALUES(2984,'rock',1);
+INSERT INTO "remix_tag" VALUES(2984,'synth',1);
+INSERT INTO "remix_tag" VALUES(2985,'collab',1);
+INSERT INTO "remix_tag" VALUES(2985,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2985,'japanese',1);
+INSERT INTO "remix_tag" VALUES(2985,'koto',1);
+INSERT INTO "remix_tag" VALUES(2985,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2985,'rock',1);
+INSERT INTO "remix_tag" VALUES(2985,'synth',1);
+INSERT INTO "remix_tag" VALUES(2986,'collab',1);
+INSERT INTO "remix_tag" VALUES(2986,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2986,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2986,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(2986,'strings',1);
+INSERT INTO "remix_tag" VALUES(2986,'violin',1);
+INSERT INTO "remix_tag" VALUES(2987,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2987,'choir',1);
+INSERT INTO "remix_tag" VALUES(2987,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2987,'spooky',1);
+INSERT INTO "remix_tag" VALUES(2987,'synth',1);
+INSERT INTO "remix_tag" VALUES(2988,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2988,'synth',1);
+INSERT INTO "remix_tag" VALUES(2989,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2989,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2989,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2989,'synth',1);
+INSERT INTO "remix_tag" VALUES(2990,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(2990,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(2990,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(2990,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(2990,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2990,'piano',1);
+INSERT INTO "remix_tag" VALUES(2990,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2990,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(2991,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2991,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2991,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(2991,'metal',1);
+INSERT INTO "remix_tag" VALUES(2991,'organ',1);
+INSERT INTO "remix_tag" VALUES(2991,'piano',1);
+INSERT INTO "remix_tag" VALUES(2991,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2991,'rock',1);
+INSERT INTO "remix_tag" VALUES(2991,'synth',1);
+INSERT INTO "remix_tag" VALUES(2991,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(2992,'choir',1);
+INSERT INTO "remix_tag" VALUES(2992,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(2992,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(2992,'mellow',1);
+INSERT INTO "remix_tag" VALUES(2992,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(2992,'strings',1);
+INSERT INTO "remix_tag" VALUES(2993,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2993,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(2993,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2993,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(2993,'synth',1);
+INSERT INTO "remix_tag" VALUES(2994,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2994,'piano',1);
+INSERT INTO "remix_tag" VALUES(2994,'synth',1);
+INSERT INTO "remix_tag" VALUES(2995,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(2995,'cello',1);
+INSERT INTO "remix_tag" VALUES(2995,'piano',1);
+INSERT INTO "remix_tag" VALUES(2995,'solemn',1);
+INSERT INTO "remix_tag" VALUES(2995,'strings',1);
+INSERT INTO "remix_tag" VALUES(2995,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(2996,'accordion',1);
+INSERT INTO "remix_tag" VALUES(2996,'flute',1);
+INSERT INTO "remix_tag" VALUES(2996,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2996,'quirky',1);
+INSERT INTO "remix_tag" VALUES(2996,'singing',1);
+INSERT INTO "remix_tag" VALUES(2996,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2997,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(2997,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2997,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(2997,'synth',1);
+INSERT INTO "remix_tag" VALUES(2997,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(2998,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(2998,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(2998,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2998,'piano',1);
+INSERT INTO "remix_tag" VALUES(2998,'synth',1);
+INSERT INTO "remix_tag" VALUES(2999,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(2999,'electro',1);
+INSERT INTO "remix_tag" VALUES(2999,'electronic',1);
+INSERT INTO "remix_tag" VALUES(2999,'glitching',1);
+INSERT INTO "remix_tag" VALUES(2999,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(2999,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(2999,'synth',1);
+INSERT INTO "remix_tag" VALUES(2999,'vocals-voice-acting',1);
@@ -0,0 +1,8694 @@
+INSERT INTO "remix_tag" VALUES(3000,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3000,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3000,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3000,'organ',1);
+INSERT INTO "remix_tag" VALUES(3000,'rock',1);
+INSERT INTO "remix_tag" VALUES(3000,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3001,'edm',1);
+INSERT INTO "remix_tag" VALUES(3001,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3001,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3001,'pop',1);
+INSERT INTO "remix_tag" VALUES(3001,'singing',1);
+INSERT INTO "remix_tag" VALUES(3001,'synth',1);
+INSERT INTO "remix_tag" VALUES(3001,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3002,'collab',1);
+INSERT INTO "remix_tag" VALUES(3002,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3002,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3002,'pop',1);
+INSERT INTO "remix_tag" VALUES(3002,'singing',1);
+INSERT INTO "remix_tag" VALUES(3002,'synth',1);
+INSERT INTO "remix_tag" VALUES(3002,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3003,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3003,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3003,'piano',1);
+INSERT INTO "remix_tag" VALUES(3003,'synth',1);
+INSERT INTO "remix_tag" VALUES(3003,'trance',1);
+INSERT INTO "remix_tag" VALUES(3004,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3004,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3004,'rock',1);
+INSERT INTO "remix_tag" VALUES(3005,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3005,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3005,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3005,'funk',1);
+INSERT INTO "remix_tag" VALUES(3005,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3005,'strings',1);
+INSERT INTO "remix_tag" VALUES(3005,'synth',1);
+INSERT INTO "remix_tag" VALUES(3006,'collab',1);
+INSERT INTO "remix_tag" VALUES(3006,'edm',1);
+INSERT INTO "remix_tag" VALUES(3006,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3006,'piano',1);
+INSERT INTO "remix_tag" VALUES(3006,'synth',1);
+INSERT INTO "remix_tag" VALUES(3008,'brass',1);
+INSERT INTO "remix_tag" VALUES(3008,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3008,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3008,'organ',1);
+INSERT INTO "remix_tag" VALUES(3008,'rock',1);
+INSERT INTO "remix_tag" VALUES(3008,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3009,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3009,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3009,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3009,'folk',1);
+INSERT INTO "remix_tag" VALUES(3009,'happy',1);
+INSERT INTO "remix_tag" VALUES(3009,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3011,'classical',1);
+INSERT INTO "remix_tag" VALUES(3011,'collab',1);
+INSERT INTO "remix_tag" VALUES(3011,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3011,'piano',1);
+INSERT INTO "remix_tag" VALUES(3011,'solo',1);
+INSERT INTO "remix_tag" VALUES(3011,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3012,'funky',1);
+INSERT INTO "remix_tag" VALUES(3012,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3012,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3012,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3012,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3012,'singing',1);
+INSERT INTO "remix_tag" VALUES(3012,'synth',1);
+INSERT INTO "remix_tag" VALUES(3012,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3012,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3013,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3013,'happy',1);
+INSERT INTO "remix_tag" VALUES(3013,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3013,'piano',1);
+INSERT INTO "remix_tag" VALUES(3013,'pop',1);
+INSERT INTO "remix_tag" VALUES(3013,'strings',1);
+INSERT INTO "remix_tag" VALUES(3014,'edm',1);
+INSERT INTO "remix_tag" VALUES(3014,'piano',1);
+INSERT INTO "remix_tag" VALUES(3014,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3014,'synth',1);
+INSERT INTO "remix_tag" VALUES(3015,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3015,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3015,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3015,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3015,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3015,'synth',1);
+INSERT INTO "remix_tag" VALUES(3016,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3016,'edm',1);
+INSERT INTO "remix_tag" VALUES(3016,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3016,'synth',1);
+INSERT INTO "remix_tag" VALUES(3017,'brass',1);
+INSERT INTO "remix_tag" VALUES(3017,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3017,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3017,'piano',1);
+INSERT INTO "remix_tag" VALUES(3017,'synth',1);
+INSERT INTO "remix_tag" VALUES(3018,'collab',1);
+INSERT INTO "remix_tag" VALUES(3018,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3018,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3018,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3018,'harp',1);
+INSERT INTO "remix_tag" VALUES(3018,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3018,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3018,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3018,'synth',1);
+INSERT INTO "remix_tag" VALUES(3018,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3019,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3019,'dark',1);
+INSERT INTO "remix_tag" VALUES(3019,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3019,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3019,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3019,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3019,'piano',1);
+INSERT INTO "remix_tag" VALUES(3019,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3019,'strings',1);
+INSERT INTO "remix_tag" VALUES(3020,'classical',1);
+INSERT INTO "remix_tag" VALUES(3020,'medley',1);
+INSERT INTO "remix_tag" VALUES(3020,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3020,'piano',1);
+INSERT INTO "remix_tag" VALUES(3020,'sad',1);
+INSERT INTO "remix_tag" VALUES(3020,'solo',1);
+INSERT INTO "remix_tag" VALUES(3020,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3021,'edm',1);
+INSERT INTO "remix_tag" VALUES(3021,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3021,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3021,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3021,'synth',1);
+INSERT INTO "remix_tag" VALUES(3021,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3022,'brass',1);
+INSERT INTO "remix_tag" VALUES(3022,'collab',1);
+INSERT INTO "remix_tag" VALUES(3022,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3022,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3022,'epic',1);
+INSERT INTO "remix_tag" VALUES(3022,'flute',1);
+INSERT INTO "remix_tag" VALUES(3022,'harp',1);
+INSERT INTO "remix_tag" VALUES(3022,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3022,'rock-opera',1);
+INSERT INTO "remix_tag" VALUES(3022,'singing',1);
+INSERT INTO "remix_tag" VALUES(3022,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3022,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3023,'collab',1);
+INSERT INTO "remix_tag" VALUES(3023,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3023,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3023,'organ',1);
+INSERT INTO "remix_tag" VALUES(3023,'piano',1);
+INSERT INTO "remix_tag" VALUES(3023,'rock',1);
+INSERT INTO "remix_tag" VALUES(3023,'synth',1);
+INSERT INTO "remix_tag" VALUES(3023,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3025,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3025,'dark',1);
+INSERT INTO "remix_tag" VALUES(3025,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3025,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3025,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3025,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3025,'organ',1);
+INSERT INTO "remix_tag" VALUES(3025,'piano',1);
+INSERT INTO "remix_tag" VALUES(3025,'rock',1);
+INSERT INTO "remix_tag" VALUES(3025,'synth',1);
+INSERT INTO "remix_tag" VALUES(3026,'choir',1);
+INSERT INTO "remix_tag" VALUES(3026,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3026,'edm',1);
+INSERT INTO "remix_tag" VALUES(3026,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3026,'harp',1);
+INSERT INTO "remix_tag" VALUES(3026,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3026,'piano',1);
+INSERT INTO "remix_tag" VALUES(3026,'strings',1);
+INSERT INTO "remix_tag" VALUES(3026,'synth',1);
+INSERT INTO "remix_tag" VALUES(3027,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3027,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3027,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3027,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3027,'piano',1);
+INSERT INTO "remix_tag" VALUES(3027,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3028,'brass',1);
+INSERT INTO "remix_tag" VALUES(3028,'choir',1);
+INSERT INTO "remix_tag" VALUES(3028,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3028,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3028,'epic',1);
+INSERT INTO "remix_tag" VALUES(3028,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3028,'strings',1);
+INSERT INTO "remix_tag" VALUES(3029,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3029,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3029,'metal',1);
+INSERT INTO "remix_tag" VALUES(3029,'organ',1);
+INSERT INTO "remix_tag" VALUES(3029,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3030,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3030,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3030,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3030,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3030,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3030,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3030,'piano',1);
+INSERT INTO "remix_tag" VALUES(3030,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3030,'synth',1);
+INSERT INTO "remix_tag" VALUES(3030,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3030,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3031,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3031,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3031,'collab',1);
+INSERT INTO "remix_tag" VALUES(3031,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3031,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3031,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3031,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3031,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3031,'rock',1);
+INSERT INTO "remix_tag" VALUES(3031,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3031,'workout',1);
+INSERT INTO "remix_tag" VALUES(3032,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3032,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3032,'funky',1);
+INSERT INTO "remix_tag" VALUES(3032,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3032,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3032,'synth',1);
+INSERT INTO "remix_tag" VALUES(3033,'chill',1);
+INSERT INTO "remix_tag" VALUES(3033,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3033,'house',1);
+INSERT INTO "remix_tag" VALUES(3033,'organ',1);
+INSERT INTO "remix_tag" VALUES(3033,'synth',1);
+INSERT INTO "remix_tag" VALUES(3033,'tempo-moderate',1);
+INSERT INTO "remix_tag" VALUES(3033,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3034,'brass',1);
+INSERT INTO "remix_tag" VALUES(3034,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3034,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3034,'collab',1);
+INSERT INTO "remix_tag" VALUES(3034,'epic',1);
+INSERT INTO "remix_tag" VALUES(3034,'flute',1);
+INSERT INTO "remix_tag" VALUES(3034,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3034,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3034,'strings',1);
+INSERT INTO "remix_tag" VALUES(3034,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3036,'edm',1);
+INSERT INTO "remix_tag" VALUES(3036,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3036,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3036,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3036,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3036,'synth',1);
+INSERT INTO "remix_tag" VALUES(3036,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3037,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3037,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3037,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3037,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3037,'synth',1);
+INSERT INTO "remix_tag" VALUES(3037,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3038,'collab',1);
+INSERT INTO "remix_tag" VALUES(3038,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3038,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3038,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3038,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3038,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3038,'pop',1);
+INSERT INTO "remix_tag" VALUES(3038,'punk',1);
+INSERT INTO "remix_tag" VALUES(3039,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3039,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3039,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3039,'piano',1);
+INSERT INTO "remix_tag" VALUES(3039,'synth',1);
+INSERT INTO "remix_tag" VALUES(3039,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3039,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3040,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3040,'electro',1);
+INSERT INTO "remix_tag" VALUES(3040,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3040,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3040,'synth',1);
+INSERT INTO "remix_tag" VALUES(3040,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3041,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3041,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3041,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3041,'piano',1);
+INSERT INTO "remix_tag" VALUES(3041,'solo',1);
+INSERT INTO "remix_tag" VALUES(3041,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3042,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3042,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3042,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3042,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3042,'organ',1);
+INSERT INTO "remix_tag" VALUES(3042,'piano',1);
+INSERT INTO "remix_tag" VALUES(3042,'rock',1);
+INSERT INTO "remix_tag" VALUES(3042,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3043,'brass',1);
+INSERT INTO "remix_tag" VALUES(3043,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3043,'classical',1);
+INSERT INTO "remix_tag" VALUES(3043,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3043,'harp',1);
+INSERT INTO "remix_tag" VALUES(3043,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3043,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3043,'strings',1);
+INSERT INTO "remix_tag" VALUES(3044,'bells',1);
+INSERT INTO "remix_tag" VALUES(3044,'brass',1);
+INSERT INTO "remix_tag" VALUES(3044,'choir',1);
+INSERT INTO "remix_tag" VALUES(3044,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3044,'dark',1);
+INSERT INTO "remix_tag" VALUES(3044,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3044,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3044,'organ',1);
+INSERT INTO "remix_tag" VALUES(3044,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3045,'brass',1);
+INSERT INTO "remix_tag" VALUES(3045,'collab',1);
+INSERT INTO "remix_tag" VALUES(3045,'funky',1);
+INSERT INTO "remix_tag" VALUES(3045,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3045,'rap',1);
+INSERT INTO "remix_tag" VALUES(3045,'singing',1);
+INSERT INTO "remix_tag" VALUES(3045,'synth',1);
+INSERT INTO "remix_tag" VALUES(3045,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3045,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3045,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3046,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3046,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3046,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3046,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3047,'collab',1);
+INSERT INTO "remix_tag" VALUES(3047,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3047,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3047,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3047,'piano',1);
+INSERT INTO "remix_tag" VALUES(3047,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3048,'choir',1);
+INSERT INTO "remix_tag" VALUES(3048,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3048,'harp',1);
+INSERT INTO "remix_tag" VALUES(3048,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3048,'piano',1);
+INSERT INTO "remix_tag" VALUES(3048,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3048,'strings',1);
+INSERT INTO "remix_tag" VALUES(3048,'viola',1);
+INSERT INTO "remix_tag" VALUES(3048,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3049,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3049,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3049,'rock',1);
+INSERT INTO "remix_tag" VALUES(3049,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3050,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3050,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3050,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3050,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3050,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3052,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3052,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3052,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3052,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3052,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3052,'strings',1);
+INSERT INTO "remix_tag" VALUES(3052,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3052,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3053,'chill',1);
+INSERT INTO "remix_tag" VALUES(3053,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3053,'collab',1);
+INSERT INTO "remix_tag" VALUES(3053,'compo',1);
+INSERT INTO "remix_tag" VALUES(3053,'edm',1);
+INSERT INTO "remix_tag" VALUES(3053,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3053,'medley',1);
+INSERT INTO "remix_tag" VALUES(3053,'synth',1);
+INSERT INTO "remix_tag" VALUES(3054,'bells',1);
+INSERT INTO "remix_tag" VALUES(3054,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3054,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3054,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3054,'piano',1);
+INSERT INTO "remix_tag" VALUES(3054,'pop',1);
+INSERT INTO "remix_tag" VALUES(3054,'strings',1);
+INSERT INTO "remix_tag" VALUES(3054,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3054,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3055,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3055,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3055,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3055,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3056,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3056,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3056,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3056,'piano',1);
+INSERT INTO "remix_tag" VALUES(3056,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3056,'singing',1);
+INSERT INTO "remix_tag" VALUES(3056,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3057,'compo',1);
+INSERT INTO "remix_tag" VALUES(3057,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3057,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3057,'funk',1);
+INSERT INTO "remix_tag" VALUES(3057,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3057,'synth',1);
+INSERT INTO "remix_tag" VALUES(3058,'brass',1);
+INSERT INTO "remix_tag" VALUES(3058,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3058,'funk',1);
+INSERT INTO "remix_tag" VALUES(3058,'funky',1);
+INSERT INTO "remix_tag" VALUES(3058,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3058,'singing',1);
+INSERT INTO "remix_tag" VALUES(3058,'strings',1);
+INSERT INTO "remix_tag" VALUES(3058,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3058,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3059,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3059,'dance',1);
+INSERT INTO "remix_tag" VALUES(3059,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3059,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3059,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3059,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3059,'synth',1);
+INSERT INTO "remix_tag" VALUES(3059,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3060,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3060,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3060,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3060,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3060,'synth',1);
+INSERT INTO "remix_tag" VALUES(3062,'brass',1);
+INSERT INTO "remix_tag" VALUES(3062,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3062,'collab',1);
+INSERT INTO "remix_tag" VALUES(3062,'dark',1);
+INSERT INTO "remix_tag" VALUES(3062,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3062,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3062,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3062,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3062,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3062,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3062,'strings',1);
+INSERT INTO "remix_tag" VALUES(3062,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3062,'synth',1);
+INSERT INTO "remix_tag" VALUES(3063,'brass',1);
+INSERT INTO "remix_tag" VALUES(3063,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3063,'funk',1);
+INSERT INTO "remix_tag" VALUES(3063,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3063,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3063,'organ',1);
+INSERT INTO "remix_tag" VALUES(3063,'piano',1);
+INSERT INTO "remix_tag" VALUES(3063,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3064,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3064,'edm',1);
+INSERT INTO "remix_tag" VALUES(3064,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3064,'happy',1);
+INSERT INTO "remix_tag" VALUES(3064,'synth',1);
+INSERT INTO "remix_tag" VALUES(3064,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3065,'chill',1);
+INSERT INTO "remix_tag" VALUES(3065,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3065,'house',1);
+INSERT INTO "remix_tag" VALUES(3065,'synth',1);
+INSERT INTO "remix_tag" VALUES(3066,'brass',1);
+INSERT INTO "remix_tag" VALUES(3066,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3066,'funny',1);
+INSERT INTO "remix_tag" VALUES(3066,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3066,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3066,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3066,'rock',1);
+INSERT INTO "remix_tag" VALUES(3066,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3066,'singing',1);
+INSERT INTO "remix_tag" VALUES(3066,'synth',1);
+INSERT INTO "remix_tag" VALUES(3066,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3066,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3067,'compo',1);
+INSERT INTO "remix_tag" VALUES(3067,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3067,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3067,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3067,'rock',1);
+INSERT INTO "remix_tag" VALUES(3067,'synth',1);
+INSERT INTO "remix_tag" VALUES(3068,'collab',1);
+INSERT INTO "remix_tag" VALUES(3068,'edm',1);
+INSERT INTO "remix_tag" VALUES(3068,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3068,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3068,'rock',1);
+INSERT INTO "remix_tag" VALUES(3068,'synth',1);
+INSERT INTO "remix_tag" VALUES(3069,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3069,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3069,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3069,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3069,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3069,'synth',1);
+INSERT INTO "remix_tag" VALUES(3069,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3070,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3070,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3070,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3070,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3070,'synth',1);
+INSERT INTO "remix_tag" VALUES(3070,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3071,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3071,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3071,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3071,'piano',1);
+INSERT INTO "remix_tag" VALUES(3071,'solo',1);
+INSERT INTO "remix_tag" VALUES(3071,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3071,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3071,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3072,'chill',1);
+INSERT INTO "remix_tag" VALUES(3072,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3072,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3072,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3072,'synth',1);
+INSERT INTO "remix_tag" VALUES(3072,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3074,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3074,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3074,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3074,'strings',1);
+INSERT INTO "remix_tag" VALUES(3074,'synth',1);
+INSERT INTO "remix_tag" VALUES(3075,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3075,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3075,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3075,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3075,'synth',1);
+INSERT INTO "remix_tag" VALUES(3076,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3076,'edm',1);
+INSERT INTO "remix_tag" VALUES(3076,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3076,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3076,'rock',1);
+INSERT INTO "remix_tag" VALUES(3076,'synth',1);
+INSERT INTO "remix_tag" VALUES(3077,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3077,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3077,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3077,'strings',1);
+INSERT INTO "remix_tag" VALUES(3077,'synth',1);
+INSERT INTO "remix_tag" VALUES(3077,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3078,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3078,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3078,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3078,'rock',1);
+INSERT INTO "remix_tag" VALUES(3078,'synth',1);
+INSERT INTO "remix_tag" VALUES(3079,'edm',1);
+INSERT INTO "remix_tag" VALUES(3079,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3079,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3079,'synth',1);
+INSERT INTO "remix_tag" VALUES(3079,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3080,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3080,'compo',1);
+INSERT INTO "remix_tag" VALUES(3080,'dance',1);
+INSERT INTO "remix_tag" VALUES(3080,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3080,'funky',1);
+INSERT INTO "remix_tag" VALUES(3080,'happy',1);
+INSERT INTO "remix_tag" VALUES(3080,'pop',1);
+INSERT INTO "remix_tag" VALUES(3080,'synth',1);
+INSERT INTO "remix_tag" VALUES(3080,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3080,'workout',1);
+INSERT INTO "remix_tag" VALUES(3081,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3081,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3081,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3081,'punk',1);
+INSERT INTO "remix_tag" VALUES(3081,'singing',1);
+INSERT INTO "remix_tag" VALUES(3081,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3082,'choir',1);
+INSERT INTO "remix_tag" VALUES(3082,'compo',1);
+INSERT INTO "remix_tag" VALUES(3082,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3082,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3082,'strings',1);
+INSERT INTO "remix_tag" VALUES(3082,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3082,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3082,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3083,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3083,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3083,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3083,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3083,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3083,'strings',1);
+INSERT INTO "remix_tag" VALUES(3083,'synth',1);
+INSERT INTO "remix_tag" VALUES(3084,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3084,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3084,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3084,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3084,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3084,'pop',1);
+INSERT INTO "remix_tag" VALUES(3084,'strings',1);
+INSERT INTO "remix_tag" VALUES(3084,'synth',1);
+INSERT INTO "remix_tag" VALUES(3085,'chill',1);
+INSERT INTO "remix_tag" VALUES(3085,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3085,'collab',1);
+INSERT INTO "remix_tag" VALUES(3085,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3085,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3085,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3085,'happy',1);
+INSERT INTO "remix_tag" VALUES(3085,'rock',1);
+INSERT INTO "remix_tag" VALUES(3085,'synth',1);
+INSERT INTO "remix_tag" VALUES(3086,'brass',1);
+INSERT INTO "remix_tag" VALUES(3086,'choir',1);
+INSERT INTO "remix_tag" VALUES(3086,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3086,'dark',1);
+INSERT INTO "remix_tag" VALUES(3086,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3086,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3086,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3086,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3086,'strings',1);
+INSERT INTO "remix_tag" VALUES(3086,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3087,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3087,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3087,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3087,'piano',1);
+INSERT INTO "remix_tag" VALUES(3087,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3087,'strings',1);
+INSERT INTO "remix_tag" VALUES(3087,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3087,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3087,'wedding',1);
+INSERT INTO "remix_tag" VALUES(3088,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3088,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3088,'piano',1);
+INSERT INTO "remix_tag" VALUES(3088,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3088,'solo',1);
+INSERT INTO "remix_tag" VALUES(3088,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3089,'choir',1);
+INSERT INTO "remix_tag" VALUES(3089,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3089,'collab',1);
+INSERT INTO "remix_tag" VALUES(3089,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3089,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3089,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3089,'organ',1);
+INSERT INTO "remix_tag" VALUES(3089,'piano',1);
+INSERT INTO "remix_tag" VALUES(3089,'rock',1);
+INSERT INTO "remix_tag" VALUES(3089,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3089,'synth',1);
+INSERT INTO "remix_tag" VALUES(3089,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3090,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3090,'collab',1);
+INSERT INTO "remix_tag" VALUES(3090,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3090,'flute',1);
+INSERT INTO "remix_tag" VALUES(3090,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3090,'piano',1);
+INSERT INTO "remix_tag" VALUES(3090,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3090,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3090,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3091,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3091,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3091,'collab',1);
+INSERT INTO "remix_tag" VALUES(3091,'dark',1);
+INSERT INTO "remix_tag" VALUES(3091,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3091,'flute',1);
+INSERT INTO "remix_tag" VALUES(3091,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3091,'piano',1);
+INSERT INTO "remix_tag" VALUES(3091,'rock',1);
+INSERT INTO "remix_tag" VALUES(3091,'strings',1);
+INSERT INTO "remix_tag" VALUES(3091,'synth',1);
+INSERT INTO "remix_tag" VALUES(3091,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3093,'collab',1);
+INSERT INTO "remix_tag" VALUES(3093,'compo',1);
+INSERT INTO "remix_tag" VALUES(3093,'dance',1);
+INSERT INTO "remix_tag" VALUES(3093,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3093,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3093,'piano',1);
+INSERT INTO "remix_tag" VALUES(3093,'pop',1);
+INSERT INTO "remix_tag" VALUES(3093,'synth',1);
+INSERT INTO "remix_tag" VALUES(3094,'brass',1);
+INSERT INTO "remix_tag" VALUES(3094,'choir',1);
+INSERT INTO "remix_tag" VALUES(3094,'collab',1);
+INSERT INTO "remix_tag" VALUES(3094,'dark',1);
+INSERT INTO "remix_tag" VALUES(3094,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3094,'flute',1);
+INSERT INTO "remix_tag" VALUES(3094,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3094,'harp',1);
+INSERT INTO "remix_tag" VALUES(3094,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3094,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3094,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3094,'strings',1);
+INSERT INTO "remix_tag" VALUES(3094,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3094,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3095,'brass',1);
+INSERT INTO "remix_tag" VALUES(3095,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(3095,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3095,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3095,'flute',1);
+INSERT INTO "remix_tag" VALUES(3095,'funky',1);
+INSERT INTO "remix_tag" VALUES(3095,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3095,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3095,'organ',1);
+INSERT INTO "remix_tag" VALUES(3095,'strings',1);
+INSERT INTO "remix_tag" VALUES(3095,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3095,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3096,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3096,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3096,'piano',1);
+INSERT INTO "remix_tag" VALUES(3096,'solo',1);
+INSERT INTO "remix_tag" VALUES(3096,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3096,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3097,'cello',1);
+INSERT INTO "remix_tag" VALUES(3097,'classical',1);
+INSERT INTO "remix_tag" VALUES(3097,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3097,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3097,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3097,'trio',1);
+INSERT INTO "remix_tag" VALUES(3098,'cello',1);
+INSERT INTO "remix_tag" VALUES(3098,'classical',1);
+INSERT INTO "remix_tag" VALUES(3098,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3098,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3098,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3098,'trio',1);
+INSERT INTO "remix_tag" VALUES(3099,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3099,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3099,'collab',1);
+INSERT INTO "remix_tag" VALUES(3099,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3099,'folk',1);
+INSERT INTO "remix_tag" VALUES(3099,'latin',1);
+INSERT INTO "remix_tag" VALUES(3099,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3099,'piano',1);
+INSERT INTO "remix_tag" VALUES(3099,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3100,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3100,'collab',1);
+INSERT INTO "remix_tag" VALUES(3100,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3100,'folk',1);
+INSERT INTO "remix_tag" VALUES(3100,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3100,'happy',1);
+INSERT INTO "remix_tag" VALUES(3100,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3100,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3101,'choir',1);
+INSERT INTO "remix_tag" VALUES(3101,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3101,'classical',1);
+INSERT INTO "remix_tag" VALUES(3101,'dark',1);
+INSERT INTO "remix_tag" VALUES(3101,'piano',1);
+INSERT INTO "remix_tag" VALUES(3101,'sad',1);
+INSERT INTO "remix_tag" VALUES(3101,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3101,'strings',1);
+INSERT INTO "remix_tag" VALUES(3101,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3102,'collab',1);
+INSERT INTO "remix_tag" VALUES(3102,'compo',1);
+INSERT INTO "remix_tag" VALUES(3102,'dance',1);
+INSERT INTO "remix_tag" VALUES(3102,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3102,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3102,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3102,'pop',1);
+INSERT INTO "remix_tag" VALUES(3102,'singing',1);
+INSERT INTO "remix_tag" VALUES(3102,'synth',1);
+INSERT INTO "remix_tag" VALUES(3102,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3102,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3104,'compo',1);
+INSERT INTO "remix_tag" VALUES(3104,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3104,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3104,'happy',1);
+INSERT INTO "remix_tag" VALUES(3104,'piano',1);
+INSERT INTO "remix_tag" VALUES(3104,'pop',1);
+INSERT INTO "remix_tag" VALUES(3104,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3104,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3104,'strings',1);
+INSERT INTO "remix_tag" VALUES(3104,'synth',1);
+INSERT INTO "remix_tag" VALUES(3105,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3105,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3105,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3105,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3105,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3105,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3105,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3105,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3105,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3105,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3106,'collab',1);
+INSERT INTO "remix_tag" VALUES(3106,'epic',1);
+INSERT INTO "remix_tag" VALUES(3106,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3106,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3106,'singing',1);
+INSERT INTO "remix_tag" VALUES(3106,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3106,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3106,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3107,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3107,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3107,'chill',1);
+INSERT INTO "remix_tag" VALUES(3107,'choir',1);
+INSERT INTO "remix_tag" VALUES(3107,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3107,'collab',1);
+INSERT INTO "remix_tag" VALUES(3107,'edm',1);
+INSERT INTO "remix_tag" VALUES(3107,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3107,'piano',1);
+INSERT INTO "remix_tag" VALUES(3107,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3107,'synth',1);
+INSERT INTO "remix_tag" VALUES(3108,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3108,'dance',1);
+INSERT INTO "remix_tag" VALUES(3108,'disco',1);
+INSERT INTO "remix_tag" VALUES(3108,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3108,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3108,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3108,'funky',1);
+INSERT INTO "remix_tag" VALUES(3108,'happy',1);
+INSERT INTO "remix_tag" VALUES(3108,'strings',1);
+INSERT INTO "remix_tag" VALUES(3108,'synth',1);
+INSERT INTO "remix_tag" VALUES(3108,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3109,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3109,'dark',1);
+INSERT INTO "remix_tag" VALUES(3109,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3109,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3109,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3109,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3109,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3109,'synth',1);
+INSERT INTO "remix_tag" VALUES(3110,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3110,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3110,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3110,'happy',1);
+INSERT INTO "remix_tag" VALUES(3110,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3110,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3110,'rock',1);
+INSERT INTO "remix_tag" VALUES(3110,'synth',1);
+INSERT INTO "remix_tag" VALUES(3112,'compo',1);
+INSERT INTO "remix_tag" VALUES(3112,'dance',1);
+INSERT INTO "remix_tag" VALUES(3112,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3112,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3112,'synth',1);
+INSERT INTO "remix_tag" VALUES(3112,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3113,'brass',1);
+INSERT INTO "remix_tag" VALUES(3113,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3113,'dark',1);
+INSERT INTO "remix_tag" VALUES(3113,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3113,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3113,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3113,'strings',1);
+INSERT INTO "remix_tag" VALUES(3113,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3113,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3113,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3114,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3114,'collab',1);
+INSERT INTO "remix_tag" VALUES(3114,'compo',1);
+INSERT INTO "remix_tag" VALUES(3114,'edm',1);
+INSERT INTO "remix_tag" VALUES(3114,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3114,'funky',1);
+INSERT INTO "remix_tag" VALUES(3114,'pop',1);
+INSERT INTO "remix_tag" VALUES(3114,'strings',1);
+INSERT INTO "remix_tag" VALUES(3114,'synth',1);
+INSERT INTO "remix_tag" VALUES(3115,'choir',1);
+INSERT INTO "remix_tag" VALUES(3115,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3115,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3115,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3115,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3115,'piano',1);
+INSERT INTO "remix_tag" VALUES(3115,'rock',1);
+INSERT INTO "remix_tag" VALUES(3115,'synth',1);
+INSERT INTO "remix_tag" VALUES(3115,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3116,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3116,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3116,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3116,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3116,'piano',1);
+INSERT INTO "remix_tag" VALUES(3116,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3116,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3117,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3117,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3117,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3117,'piano',1);
+INSERT INTO "remix_tag" VALUES(3117,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3117,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3117,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3117,'violin',1);
+INSERT INTO "remix_tag" VALUES(3118,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3118,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3118,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3118,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3118,'organ',1);
+INSERT INTO "remix_tag" VALUES(3118,'rock',1);
+INSERT INTO "remix_tag" VALUES(3118,'singing',1);
+INSERT INTO "remix_tag" VALUES(3118,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3119,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3119,'brass',1);
+INSERT INTO "remix_tag" VALUES(3119,'choir',1);
+INSERT INTO "remix_tag" VALUES(3119,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3119,'dark',1);
+INSERT INTO "remix_tag" VALUES(3119,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3119,'latin',1);
+INSERT INTO "remix_tag" VALUES(3119,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3119,'piano',1);
+INSERT INTO "remix_tag" VALUES(3119,'strings',1);
+INSERT INTO "remix_tag" VALUES(3119,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3120,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3120,'chill',1);
+INSERT INTO "remix_tag" VALUES(3120,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3120,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3120,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3120,'piano',1);
+INSERT INTO "remix_tag" VALUES(3120,'synth',1);
+INSERT INTO "remix_tag" VALUES(3120,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3121,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3121,'chill',1);
+INSERT INTO "remix_tag" VALUES(3121,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3121,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3121,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3121,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3121,'synth',1);
+INSERT INTO "remix_tag" VALUES(3121,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3122,'dance',1);
+INSERT INTO "remix_tag" VALUES(3122,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3122,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3122,'piano',1);
+INSERT INTO "remix_tag" VALUES(3122,'strings',1);
+INSERT INTO "remix_tag" VALUES(3122,'synth',1);
+INSERT INTO "remix_tag" VALUES(3123,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3123,'bells',1);
+INSERT INTO "remix_tag" VALUES(3123,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3123,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3123,'piano',1);
+INSERT INTO "remix_tag" VALUES(3123,'rock',1);
+INSERT INTO "remix_tag" VALUES(3123,'synth',1);
+INSERT INTO "remix_tag" VALUES(3124,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3124,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3124,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3124,'funk',1);
+INSERT INTO "remix_tag" VALUES(3124,'funky',1);
+INSERT INTO "remix_tag" VALUES(3124,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3124,'synth',1);
+INSERT INTO "remix_tag" VALUES(3125,'bells',1);
+INSERT INTO "remix_tag" VALUES(3125,'brass',1);
+INSERT INTO "remix_tag" VALUES(3125,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3125,'dark',1);
+INSERT INTO "remix_tag" VALUES(3125,'epic',1);
+INSERT INTO "remix_tag" VALUES(3125,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3125,'strings',1);
+INSERT INTO "remix_tag" VALUES(3125,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3125,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3126,'disco',1);
+INSERT INTO "remix_tag" VALUES(3126,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3126,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3126,'strings',1);
+INSERT INTO "remix_tag" VALUES(3126,'synth',1);
+INSERT INTO "remix_tag" VALUES(3126,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3126,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3127,'bells',1);
+INSERT INTO "remix_tag" VALUES(3127,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3127,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3127,'dance',1);
+INSERT INTO "remix_tag" VALUES(3127,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3127,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3127,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3127,'swing',1);
+INSERT INTO "remix_tag" VALUES(3127,'synth',1);
+INSERT INTO "remix_tag" VALUES(3127,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3128,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3128,'duet',1);
+INSERT INTO "remix_tag" VALUES(3128,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3128,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3128,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3128,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3128,'piano',1);
+INSERT INTO "remix_tag" VALUES(3128,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3128,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3128,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3129,'bells',1);
+INSERT INTO "remix_tag" VALUES(3129,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3129,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3129,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3129,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3129,'piano',1);
+INSERT INTO "remix_tag" VALUES(3129,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3129,'strings',1);
+INSERT INTO "remix_tag" VALUES(3129,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3129,'synth',1);
+INSERT INTO "remix_tag" VALUES(3130,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3130,'collab',1);
+INSERT INTO "remix_tag" VALUES(3130,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3130,'funk',1);
+INSERT INTO "remix_tag" VALUES(3130,'funky',1);
+INSERT INTO "remix_tag" VALUES(3130,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3130,'organ',1);
+INSERT INTO "remix_tag" VALUES(3130,'rock',1);
+INSERT INTO "remix_tag" VALUES(3130,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3131,'brass',1);
+INSERT INTO "remix_tag" VALUES(3131,'choir',1);
+INSERT INTO "remix_tag" VALUES(3131,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3131,'piano',1);
+INSERT INTO "remix_tag" VALUES(3131,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3131,'strings',1);
+INSERT INTO "remix_tag" VALUES(3131,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3132,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3132,'disco',1);
+INSERT INTO "remix_tag" VALUES(3132,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3132,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3132,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3132,'funk',1);
+INSERT INTO "remix_tag" VALUES(3132,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3132,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3132,'organ',1);
+INSERT INTO "remix_tag" VALUES(3132,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3132,'singing',1);
+INSERT INTO "remix_tag" VALUES(3132,'soul',1);
+INSERT INTO "remix_tag" VALUES(3132,'strings',1);
+INSERT INTO "remix_tag" VALUES(3132,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3132,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3132,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3133,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3133,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3133,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3133,'electro',1);
+INSERT INTO "remix_tag" VALUES(3133,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3133,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3133,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3133,'synth',1);
+INSERT INTO "remix_tag" VALUES(3133,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3134,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3134,'choir',1);
+INSERT INTO "remix_tag" VALUES(3134,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3134,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3134,'synth',1);
+INSERT INTO "remix_tag" VALUES(3134,'trance',1);
+INSERT INTO "remix_tag" VALUES(3135,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3135,'collab',1);
+INSERT INTO "remix_tag" VALUES(3135,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3135,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3135,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3135,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3135,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3135,'organ',1);
+INSERT INTO "remix_tag" VALUES(3135,'rap',1);
+INSERT INTO "remix_tag" VALUES(3135,'singing',1);
+INSERT INTO "remix_tag" VALUES(3135,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3135,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3135,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3135,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3136,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3136,'edm',1);
+INSERT INTO "remix_tag" VALUES(3136,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3136,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3136,'synth',1);
+INSERT INTO "remix_tag" VALUES(3136,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3137,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3137,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3137,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3137,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3137,'metal',1);
+INSERT INTO "remix_tag" VALUES(3137,'rock',1);
+INSERT INTO "remix_tag" VALUES(3137,'synth',1);
+INSERT INTO "remix_tag" VALUES(3138,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3138,'classical',1);
+INSERT INTO "remix_tag" VALUES(3138,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3138,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3138,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3138,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3138,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3139,'dark',1);
+INSERT INTO "remix_tag" VALUES(3139,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3139,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3139,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3139,'synth',1);
+INSERT INTO "remix_tag" VALUES(3140,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3140,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3140,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3140,'metal',1);
+INSERT INTO "remix_tag" VALUES(3140,'strings',1);
+INSERT INTO "remix_tag" VALUES(3140,'synth',1);
+INSERT INTO "remix_tag" VALUES(3140,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3141,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3141,'flute',1);
+INSERT INTO "remix_tag" VALUES(3141,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3141,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3141,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3141,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(3141,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3141,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3141,'singing',1);
+INSERT INTO "remix_tag" VALUES(3141,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3141,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3142,'collab',1);
+INSERT INTO "remix_tag" VALUES(3142,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3142,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3142,'piano',1);
+INSERT INTO "remix_tag" VALUES(3142,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3142,'synth',1);
+INSERT INTO "remix_tag" VALUES(3142,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3142,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3142,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3143,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3143,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3143,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3143,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3143,'metal',1);
+INSERT INTO "remix_tag" VALUES(3143,'rock',1);
+INSERT INTO "remix_tag" VALUES(3143,'strings',1);
+INSERT INTO "remix_tag" VALUES(3144,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3144,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3144,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3144,'piano',1);
+INSERT INTO "remix_tag" VALUES(3144,'rock',1);
+INSERT INTO "remix_tag" VALUES(3144,'synth',1);
+INSERT INTO "remix_tag" VALUES(3145,'classical',1);
+INSERT INTO "remix_tag" VALUES(3145,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3145,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3145,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3145,'piano',1);
+INSERT INTO "remix_tag" VALUES(3145,'solo',1);
+INSERT INTO "remix_tag" VALUES(3145,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3146,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3146,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3146,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3146,'synth',1);
+INSERT INTO "remix_tag" VALUES(3146,'violin',1);
+INSERT INTO "remix_tag" VALUES(3147,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3147,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3147,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3147,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3147,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3147,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3147,'medley',1);
+INSERT INTO "remix_tag" VALUES(3147,'piano',1);
+INSERT INTO "remix_tag" VALUES(3147,'rock',1);
+INSERT INTO "remix_tag" VALUES(3147,'synth',1);
+INSERT INTO "remix_tag" VALUES(3147,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3147,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3148,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3148,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3148,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3148,'piano',1);
+INSERT INTO "remix_tag" VALUES(3148,'rock',1);
+INSERT INTO "remix_tag" VALUES(3149,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3149,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3149,'brass',1);
+INSERT INTO "remix_tag" VALUES(3149,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(3149,'choir',1);
+INSERT INTO "remix_tag" VALUES(3149,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3149,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3149,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3149,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3149,'singing',1);
+INSERT INTO "remix_tag" VALUES(3149,'synth',1);
+INSERT INTO "remix_tag" VALUES(3149,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3149,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3150,'classical',1);
+INSERT INTO "remix_tag" VALUES(3150,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3150,'medley',1);
+INSERT INTO "remix_tag" VALUES(3150,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3150,'piano',1);
+INSERT INTO "remix_tag" VALUES(3150,'solo',1);
+INSERT INTO "remix_tag" VALUES(3150,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3151,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3151,'collab',1);
+INSERT INTO "remix_tag" VALUES(3151,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3151,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(3151,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3151,'organ',1);
+INSERT INTO "remix_tag" VALUES(3151,'rock',1);
+INSERT INTO "remix_tag" VALUES(3151,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3151,'singing',1);
+INSERT INTO "remix_tag" VALUES(3151,'violin',1);
+INSERT INTO "remix_tag" VALUES(3151,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3151,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3151,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3152,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3152,'collab',1);
+INSERT INTO "remix_tag" VALUES(3152,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3152,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(3152,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3152,'rap',1);
+INSERT INTO "remix_tag" VALUES(3152,'singing',1);
+INSERT INTO "remix_tag" VALUES(3152,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3152,'synth',1);
+INSERT INTO "remix_tag" VALUES(3152,'trap',1);
+INSERT INTO "remix_tag" VALUES(3152,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3152,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3153,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3153,'compo',1);
+INSERT INTO "remix_tag" VALUES(3153,'edm',1);
+INSERT INTO "remix_tag" VALUES(3153,'happy',1);
+INSERT INTO "remix_tag" VALUES(3153,'synth',1);
+INSERT INTO "remix_tag" VALUES(3154,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3154,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3154,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3154,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3154,'rock',1);
+INSERT INTO "remix_tag" VALUES(3154,'singing',1);
+INSERT INTO "remix_tag" VALUES(3154,'synth',1);
+INSERT INTO "remix_tag" VALUES(3154,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3155,'compo',1);
+INSERT INTO "remix_tag" VALUES(3155,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3155,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3155,'funky',1);
+INSERT INTO "remix_tag" VALUES(3155,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3155,'synth',1);
+INSERT INTO "remix_tag" VALUES(3156,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3156,'edm',1);
+INSERT INTO "remix_tag" VALUES(3156,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3156,'synth',1);
+INSERT INTO "remix_tag" VALUES(3158,'dark',1);
+INSERT INTO "remix_tag" VALUES(3158,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3158,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3158,'metal',1);
+INSERT INTO "remix_tag" VALUES(3158,'rock',1);
+INSERT INTO "remix_tag" VALUES(3158,'strings',1);
+INSERT INTO "remix_tag" VALUES(3158,'synth',1);
+INSERT INTO "remix_tag" VALUES(3158,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3159,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3159,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3159,'epic',1);
+INSERT INTO "remix_tag" VALUES(3159,'rock',1);
+INSERT INTO "remix_tag" VALUES(3159,'synth',1);
+INSERT INTO "remix_tag" VALUES(3159,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3159,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3159,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3160,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3160,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3160,'brass',1);
+INSERT INTO "remix_tag" VALUES(3160,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3160,'folk',1);
+INSERT INTO "remix_tag" VALUES(3160,'klezmer',1);
+INSERT INTO "remix_tag" VALUES(3160,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3160,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3160,'organ',1);
+INSERT INTO "remix_tag" VALUES(3160,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3160,'sad',1);
+INSERT INTO "remix_tag" VALUES(3160,'singing',1);
+INSERT INTO "remix_tag" VALUES(3160,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3160,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3161,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3161,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3161,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3161,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3161,'epic',1);
+INSERT INTO "remix_tag" VALUES(3161,'metal',1);
+INSERT INTO "remix_tag" VALUES(3162,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3162,'compo',1);
+INSERT INTO "remix_tag" VALUES(3162,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3162,'funky',1);
+INSERT INTO "remix_tag" VALUES(3162,'house',1);
+INSERT INTO "remix_tag" VALUES(3162,'synth',1);
+INSERT INTO "remix_tag" VALUES(3162,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3163,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3163,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3163,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3163,'rock',1);
+INSERT INTO "remix_tag" VALUES(3163,'synth',1);
+INSERT INTO "remix_tag" VALUES(3163,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3164,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3164,'dance',1);
+INSERT INTO "remix_tag" VALUES(3164,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3164,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3164,'synth',1);
+INSERT INTO "remix_tag" VALUES(3164,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3164,'trap',1);
+INSERT INTO "remix_tag" VALUES(3165,'dance',1);
+INSERT INTO "remix_tag" VALUES(3165,'koto',1);
+INSERT INTO "remix_tag" VALUES(3165,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3165,'piano',1);
+INSERT INTO "remix_tag" VALUES(3165,'synth',1);
+INSERT INTO "remix_tag" VALUES(3165,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3166,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3166,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3166,'classical',1);
+INSERT INTO "remix_tag" VALUES(3166,'folk',1);
+INSERT INTO "remix_tag" VALUES(3166,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3166,'medley',1);
+INSERT INTO "remix_tag" VALUES(3166,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3167,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3167,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3167,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3167,'harp',1);
+INSERT INTO "remix_tag" VALUES(3167,'medley',1);
+INSERT INTO "remix_tag" VALUES(3167,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3167,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3167,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3167,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3167,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3168,'brass',1);
+INSERT INTO "remix_tag" VALUES(3168,'collab',1);
+INSERT INTO "remix_tag" VALUES(3168,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3168,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3168,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3168,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3168,'piano',1);
+INSERT INTO "remix_tag" VALUES(3168,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3168,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3169,'compo',1);
+INSERT INTO "remix_tag" VALUES(3169,'edm',1);
+INSERT INTO "remix_tag" VALUES(3169,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3169,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3169,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(3169,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3169,'synth',1);
+INSERT INTO "remix_tag" VALUES(3169,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3169,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3169,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3171,'brass',1);
+INSERT INTO "remix_tag" VALUES(3171,'choir',1);
+INSERT INTO "remix_tag" VALUES(3171,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3171,'epic',1);
+INSERT INTO "remix_tag" VALUES(3171,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3171,'strings',1);
+INSERT INTO "remix_tag" VALUES(3171,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3172,'classical',1);
+INSERT INTO "remix_tag" VALUES(3172,'harp',1);
+INSERT INTO "remix_tag" VALUES(3172,'piano',1);
+INSERT INTO "remix_tag" VALUES(3172,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3172,'sad',1);
+INSERT INTO "remix_tag" VALUES(3172,'strings',1);
+INSERT INTO "remix_tag" VALUES(3172,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3172,'violin',1);
+INSERT INTO "remix_tag" VALUES(3173,'edm',1);
+INSERT INTO "remix_tag" VALUES(3173,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3173,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3173,'synth',1);
+INSERT INTO "remix_tag" VALUES(3174,'classical',1);
+INSERT INTO "remix_tag" VALUES(3174,'dark',1);
+INSERT INTO "remix_tag" VALUES(3174,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3174,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3174,'piano',1);
+INSERT INTO "remix_tag" VALUES(3174,'solo',1);
+INSERT INTO "remix_tag" VALUES(3174,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3174,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3175,'brass',1);
+INSERT INTO "remix_tag" VALUES(3175,'choir',1);
+INSERT INTO "remix_tag" VALUES(3175,'compo',1);
+INSERT INTO "remix_tag" VALUES(3175,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3175,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3175,'funk',1);
+INSERT INTO "remix_tag" VALUES(3175,'funky',1);
+INSERT INTO "remix_tag" VALUES(3175,'organ',1);
+INSERT INTO "remix_tag" VALUES(3175,'rock',1);
+INSERT INTO "remix_tag" VALUES(3175,'strings',1);
+INSERT INTO "remix_tag" VALUES(3175,'synth',1);
+INSERT INTO "remix_tag" VALUES(3176,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3176,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3176,'dark',1);
+INSERT INTO "remix_tag" VALUES(3176,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3176,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3176,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3176,'rock',1);
+INSERT INTO "remix_tag" VALUES(3176,'synth',1);
+INSERT INTO "remix_tag" VALUES(3177,'cowbell',1);
+INSERT INTO "remix_tag" VALUES(3177,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3177,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3177,'funny',1);
+INSERT INTO "remix_tag" VALUES(3177,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3177,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3177,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3177,'rock',1);
+INSERT INTO "remix_tag" VALUES(3177,'singing',1);
+INSERT INTO "remix_tag" VALUES(3177,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3178,'disco',1);
+INSERT INTO "remix_tag" VALUES(3178,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3178,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3178,'funky',1);
+INSERT INTO "remix_tag" VALUES(3178,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3178,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3178,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3178,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3178,'violin',1);
+INSERT INTO "remix_tag" VALUES(3181,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3181,'edm',1);
+INSERT INTO "remix_tag" VALUES(3181,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3181,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3181,'strings',1);
+INSERT INTO "remix_tag" VALUES(3181,'synth',1);
+INSERT INTO "remix_tag" VALUES(3181,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3182,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3182,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3182,'collab',1);
+INSERT INTO "remix_tag" VALUES(3182,'folk',1);
+INSERT INTO "remix_tag" VALUES(3182,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3182,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3182,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3182,'singing',1);
+INSERT INTO "remix_tag" VALUES(3182,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3182,'strings',1);
+INSERT INTO "remix_tag" VALUES(3182,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3182,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3183,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3183,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3183,'collab',1);
+INSERT INTO "remix_tag" VALUES(3183,'folk',1);
+INSERT INTO "remix_tag" VALUES(3183,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3183,'happy',1);
+INSERT INTO "remix_tag" VALUES(3183,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3183,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3183,'piano',1);
+INSERT INTO "remix_tag" VALUES(3183,'synth',1);
+INSERT INTO "remix_tag" VALUES(3183,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3184,'edm',1);
+INSERT INTO "remix_tag" VALUES(3184,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3184,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3184,'synth',1);
+INSERT INTO "remix_tag" VALUES(3184,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3185,'bells',1);
+INSERT INTO "remix_tag" VALUES(3185,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3185,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3185,'collab',1);
+INSERT INTO "remix_tag" VALUES(3185,'dark',1);
+INSERT INTO "remix_tag" VALUES(3185,'edm',1);
+INSERT INTO "remix_tag" VALUES(3185,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3185,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3185,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3185,'synth',1);
+INSERT INTO "remix_tag" VALUES(3185,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3185,'violin',1);
+INSERT INTO "remix_tag" VALUES(3186,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3186,'compo',1);
+INSERT INTO "remix_tag" VALUES(3186,'edm',1);
+INSERT INTO "remix_tag" VALUES(3186,'folk',1);
+INSERT INTO "remix_tag" VALUES(3186,'happy',1);
+INSERT INTO "remix_tag" VALUES(3186,'harp',1);
+INSERT INTO "remix_tag" VALUES(3186,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3186,'synth',1);
+INSERT INTO "remix_tag" VALUES(3186,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3186,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3187,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3187,'brass',1);
+INSERT INTO "remix_tag" VALUES(3187,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3187,'march',1);
+INSERT INTO "remix_tag" VALUES(3187,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3187,'piano',1);
+INSERT INTO "remix_tag" VALUES(3187,'strings',1);
+INSERT INTO "remix_tag" VALUES(3187,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3187,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3187,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3187,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3187,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3188,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3188,'choir',1);
+INSERT INTO "remix_tag" VALUES(3188,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3188,'metal',1);
+INSERT INTO "remix_tag" VALUES(3188,'piano',1);
+INSERT INTO "remix_tag" VALUES(3188,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3188,'synth',1);
+INSERT INTO "remix_tag" VALUES(3188,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3188,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3189,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3189,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3189,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3189,'collab',1);
+INSERT INTO "remix_tag" VALUES(3189,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3189,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3189,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3189,'piano',1);
+INSERT INTO "remix_tag" VALUES(3189,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3189,'singing',1);
+INSERT INTO "remix_tag" VALUES(3189,'strings',1);
+INSERT INTO "remix_tag" VALUES(3189,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3189,'violin',1);
+INSERT INTO "remix_tag" VALUES(3189,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3190,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3190,'dark',1);
+INSERT INTO "remix_tag" VALUES(3190,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3190,'piano',1);
+INSERT INTO "remix_tag" VALUES(3190,'rock',1);
+INSERT INTO "remix_tag" VALUES(3191,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3191,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3191,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3191,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3191,'rock',1);
+INSERT INTO "remix_tag" VALUES(3191,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3192,'classical',1);
+INSERT INTO "remix_tag" VALUES(3192,'compo',1);
+INSERT INTO "remix_tag" VALUES(3192,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3192,'piano',1);
+INSERT INTO "remix_tag" VALUES(3192,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3192,'solo',1);
+INSERT INTO "remix_tag" VALUES(3192,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3192,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3192,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3193,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3193,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3193,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3193,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3194,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3194,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3194,'happy',1);
+INSERT INTO "remix_tag" VALUES(3194,'march',1);
+INSERT INTO "remix_tag" VALUES(3194,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3194,'strings',1);
+INSERT INTO "remix_tag" VALUES(3194,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3194,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3194,'world',1);
+INSERT INTO "remix_tag" VALUES(3195,'choir',1);
+INSERT INTO "remix_tag" VALUES(3195,'dark',1);
+INSERT INTO "remix_tag" VALUES(3195,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3195,'metal',1);
+INSERT INTO "remix_tag" VALUES(3195,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3196,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3196,'collab',1);
+INSERT INTO "remix_tag" VALUES(3196,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3196,'funk',1);
+INSERT INTO "remix_tag" VALUES(3196,'funky',1);
+INSERT INTO "remix_tag" VALUES(3196,'synth',1);
+INSERT INTO "remix_tag" VALUES(3196,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3197,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3197,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3197,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3197,'rock',1);
+INSERT INTO "remix_tag" VALUES(3197,'strings',1);
+INSERT INTO "remix_tag" VALUES(3197,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3198,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3198,'epic',1);
+INSERT INTO "remix_tag" VALUES(3198,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3198,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3198,'piano',1);
+INSERT INTO "remix_tag" VALUES(3198,'strings',1);
+INSERT INTO "remix_tag" VALUES(3198,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3198,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3198,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3199,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3199,'chill',1);
+INSERT INTO "remix_tag" VALUES(3199,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3199,'piano',1);
+INSERT INTO "remix_tag" VALUES(3199,'synth',1);
+INSERT INTO "remix_tag" VALUES(3199,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3200,'edm',1);
+INSERT INTO "remix_tag" VALUES(3200,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3200,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3200,'synth',1);
+INSERT INTO "remix_tag" VALUES(3200,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3200,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(3200,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3201,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(3201,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3201,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3201,'funk',1);
+INSERT INTO "remix_tag" VALUES(3201,'funky',1);
+INSERT INTO "remix_tag" VALUES(3201,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3201,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3201,'organ',1);
+INSERT INTO "remix_tag" VALUES(3201,'piano',1);
+INSERT INTO "remix_tag" VALUES(3201,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3202,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3202,'brass',1);
+INSERT INTO "remix_tag" VALUES(3202,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3202,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3202,'march',1);
+INSERT INTO "remix_tag" VALUES(3202,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3202,'rock',1);
+INSERT INTO "remix_tag" VALUES(3202,'strings',1);
+INSERT INTO "remix_tag" VALUES(3202,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3203,'bells',1);
+INSERT INTO "remix_tag" VALUES(3203,'chill',1);
+INSERT INTO "remix_tag" VALUES(3203,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3203,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3203,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3203,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3204,'chill',1);
+INSERT INTO "remix_tag" VALUES(3204,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3204,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3204,'piano',1);
+INSERT INTO "remix_tag" VALUES(3204,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3204,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3204,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3205,'edm',1);
+INSERT INTO "remix_tag" VALUES(3205,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3205,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3205,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3205,'funky',1);
+INSERT INTO "remix_tag" VALUES(3205,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3205,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3205,'piano',1);
+INSERT INTO "remix_tag" VALUES(3205,'synth',1);
+INSERT INTO "remix_tag" VALUES(3206,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3206,'angry',1);
+INSERT INTO "remix_tag" VALUES(3206,'dark',1);
+INSERT INTO "remix_tag" VALUES(3206,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3206,'metal',1);
+INSERT INTO "remix_tag" VALUES(3206,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3207,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3207,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3207,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3207,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3207,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3207,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3207,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3207,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3209,'chill',1);
+INSERT INTO "remix_tag" VALUES(3209,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3209,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3209,'edm',1);
+INSERT INTO "remix_tag" VALUES(3209,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3209,'piano',1);
+INSERT INTO "remix_tag" VALUES(3209,'synth',1);
+INSERT INTO "remix_tag" VALUES(3209,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3209,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3210,'choir',1);
+INSERT INTO "remix_tag" VALUES(3210,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3210,'classical',1);
+INSERT INTO "remix_tag" VALUES(3210,'dark',1);
+INSERT INTO "remix_tag" VALUES(3210,'harp',1);
+INSERT INTO "remix_tag" VALUES(3210,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3210,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3210,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3210,'strings',1);
+INSERT INTO "remix_tag" VALUES(3210,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3211,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3211,'collab',1);
+INSERT INTO "remix_tag" VALUES(3211,'folk',1);
+INSERT INTO "remix_tag" VALUES(3211,'happy',1);
+INSERT INTO "remix_tag" VALUES(3211,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(3211,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3211,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3211,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3211,'singing',1);
+INSERT INTO "remix_tag" VALUES(3211,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3212,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3212,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3212,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3212,'epic',1);
+INSERT INTO "remix_tag" VALUES(3212,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3212,'metal',1);
+INSERT INTO "remix_tag" VALUES(3212,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3212,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3212,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3212,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3213,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3213,'folk',1);
+INSERT INTO "remix_tag" VALUES(3213,'happy',1);
+INSERT INTO "remix_tag" VALUES(3213,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3213,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3213,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3213,'koto',1);
+INSERT INTO "remix_tag" VALUES(3213,'piano',1);
+INSERT INTO "remix_tag" VALUES(3213,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3213,'strings',1);
+INSERT INTO "remix_tag" VALUES(3213,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3213,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3214,'electro',1);
+INSERT INTO "remix_tag" VALUES(3214,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3214,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3214,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3214,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3214,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3214,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3214,'synth',1);
+INSERT INTO "remix_tag" VALUES(3214,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3215,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3215,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3215,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3215,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3215,'piano',1);
+INSERT INTO "remix_tag" VALUES(3215,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3215,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3215,'violin',1);
+INSERT INTO "remix_tag" VALUES(3216,'brass',1);
+INSERT INTO "remix_tag" VALUES(3216,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3216,'collab',1);
+INSERT INTO "remix_tag" VALUES(3216,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3216,'epic',1);
+INSERT INTO "remix_tag" VALUES(3216,'flute',1);
+INSERT INTO "remix_tag" VALUES(3216,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3216,'medley',1);
+INSERT INTO "remix_tag" VALUES(3216,'strings',1);
+INSERT INTO "remix_tag" VALUES(3216,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3216,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3217,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3217,'brass',1);
+INSERT INTO "remix_tag" VALUES(3217,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3217,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3217,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3217,'happy',1);
+INSERT INTO "remix_tag" VALUES(3217,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3217,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3217,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3217,'singing',1);
+INSERT INTO "remix_tag" VALUES(3217,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3218,'cowbell',1);
+INSERT INTO "remix_tag" VALUES(3218,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3218,'funky',1);
+INSERT INTO "remix_tag" VALUES(3218,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3218,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3218,'piano',1);
+INSERT INTO "remix_tag" VALUES(3218,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3218,'synth',1);
+INSERT INTO "remix_tag" VALUES(3218,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3218,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3219,'brass',1);
+INSERT INTO "remix_tag" VALUES(3219,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3219,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3219,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3219,'funk',1);
+INSERT INTO "remix_tag" VALUES(3219,'funky',1);
+INSERT INTO "remix_tag" VALUES(3219,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3219,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3219,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3220,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3220,'chill',1);
+INSERT INTO "remix_tag" VALUES(3220,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3220,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3220,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3220,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3220,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3220,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3220,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3221,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3221,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3221,'dark',1);
+INSERT INTO "remix_tag" VALUES(3221,'harp',1);
+INSERT INTO "remix_tag" VALUES(3221,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3221,'piano',1);
+INSERT INTO "remix_tag" VALUES(3221,'strings',1);
+INSERT INTO "remix_tag" VALUES(3221,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3221,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3222,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3222,'classical',1);
+INSERT INTO "remix_tag" VALUES(3222,'piano',1);
+INSERT INTO "remix_tag" VALUES(3222,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3222,'solo',1);
+INSERT INTO "remix_tag" VALUES(3222,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3223,'classical',1);
+INSERT INTO "remix_tag" VALUES(3223,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3223,'harp',1);
+INSERT INTO "remix_tag" VALUES(3223,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3223,'piano',1);
+INSERT INTO "remix_tag" VALUES(3223,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3223,'strings',1);
+INSERT INTO "remix_tag" VALUES(3223,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3223,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3224,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3224,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3224,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3224,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3224,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3224,'piano',1);
+INSERT INTO "remix_tag" VALUES(3224,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3224,'synth',1);
+INSERT INTO "remix_tag" VALUES(3225,'cowbell',1);
+INSERT INTO "remix_tag" VALUES(3225,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3225,'funky',1);
+INSERT INTO "remix_tag" VALUES(3225,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3225,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3225,'medley',1);
+INSERT INTO "remix_tag" VALUES(3225,'piano',1);
+INSERT INTO "remix_tag" VALUES(3225,'synth',1);
+INSERT INTO "remix_tag" VALUES(3226,'brass',1);
+INSERT INTO "remix_tag" VALUES(3226,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3226,'collab',1);
+INSERT INTO "remix_tag" VALUES(3226,'compo',1);
+INSERT INTO "remix_tag" VALUES(3226,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3226,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3226,'strings',1);
+INSERT INTO "remix_tag" VALUES(3226,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3226,'synth',1);
+INSERT INTO "remix_tag" VALUES(3226,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3226,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3227,'compo',1);
+INSERT INTO "remix_tag" VALUES(3227,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3227,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3227,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3227,'rock',1);
+INSERT INTO "remix_tag" VALUES(3227,'strings',1);
+INSERT INTO "remix_tag" VALUES(3227,'synth',1);
+INSERT INTO "remix_tag" VALUES(3227,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3228,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3228,'electro',1);
+INSERT INTO "remix_tag" VALUES(3228,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3228,'strings',1);
+INSERT INTO "remix_tag" VALUES(3228,'synth',1);
+INSERT INTO "remix_tag" VALUES(3228,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3229,'compo',1);
+INSERT INTO "remix_tag" VALUES(3229,'dark',1);
+INSERT INTO "remix_tag" VALUES(3229,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3229,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3229,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3229,'synth',1);
+INSERT INTO "remix_tag" VALUES(3229,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3230,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3230,'dark',1);
+INSERT INTO "remix_tag" VALUES(3230,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3230,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3230,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3230,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3230,'singing',1);
+INSERT INTO "remix_tag" VALUES(3230,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3230,'synth',1);
+INSERT INTO "remix_tag" VALUES(3230,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3230,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3230,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3231,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3231,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3231,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3231,'metal',1);
+INSERT INTO "remix_tag" VALUES(3231,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3232,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3232,'dark',1);
+INSERT INTO "remix_tag" VALUES(3232,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3232,'rock',1);
+INSERT INTO "remix_tag" VALUES(3232,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3232,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3233,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3233,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3233,'funky',1);
+INSERT INTO "remix_tag" VALUES(3233,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3233,'rock',1);
+INSERT INTO "remix_tag" VALUES(3233,'synth',1);
+INSERT INTO "remix_tag" VALUES(3233,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3234,'brass',1);
+INSERT INTO "remix_tag" VALUES(3234,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3234,'epic',1);
+INSERT INTO "remix_tag" VALUES(3234,'harp',1);
+INSERT INTO "remix_tag" VALUES(3234,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3234,'piano',1);
+INSERT INTO "remix_tag" VALUES(3234,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3234,'strings',1);
+INSERT INTO "remix_tag" VALUES(3234,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3234,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3234,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3235,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3235,'flute',1);
+INSERT INTO "remix_tag" VALUES(3235,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3235,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3235,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(3235,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3235,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3235,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3236,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3236,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3236,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3236,'choir',1);
+INSERT INTO "remix_tag" VALUES(3236,'collab',1);
+INSERT INTO "remix_tag" VALUES(3236,'dark',1);
+INSERT INTO "remix_tag" VALUES(3236,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3236,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3236,'folk',1);
+INSERT INTO "remix_tag" VALUES(3236,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3236,'synth',1);
+INSERT INTO "remix_tag" VALUES(3236,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3236,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3236,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3236,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3236,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3237,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(3237,'compo',1);
+INSERT INTO "remix_tag" VALUES(3237,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3237,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3237,'rock',1);
+INSERT INTO "remix_tag" VALUES(3237,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3238,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3238,'classical',1);
+INSERT INTO "remix_tag" VALUES(3238,'organ',1);
+INSERT INTO "remix_tag" VALUES(3238,'piano',1);
+INSERT INTO "remix_tag" VALUES(3238,'sad',1);
+INSERT INTO "remix_tag" VALUES(3238,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3238,'strings',1);
+INSERT INTO "remix_tag" VALUES(3238,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3238,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3238,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3240,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3240,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3240,'rock',1);
+INSERT INTO "remix_tag" VALUES(3240,'synth',1);
+INSERT INTO "remix_tag" VALUES(3240,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3241,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3241,'folk',1);
+INSERT INTO "remix_tag" VALUES(3241,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3241,'strings',1);
+INSERT INTO "remix_tag" VALUES(3241,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3241,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3242,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3242,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3242,'flute',1);
+INSERT INTO "remix_tag" VALUES(3242,'metal',1);
+INSERT INTO "remix_tag" VALUES(3242,'synth',1);
+INSERT INTO "remix_tag" VALUES(3242,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3244,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3244,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3244,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3244,'folk',1);
+INSERT INTO "remix_tag" VALUES(3244,'piano',1);
+INSERT INTO "remix_tag" VALUES(3244,'strings',1);
+INSERT INTO "remix_tag" VALUES(3244,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3244,'synth',1);
+INSERT INTO "remix_tag" VALUES(3244,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3245,'dark',1);
+INSERT INTO "remix_tag" VALUES(3245,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3245,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3245,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3245,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3245,'synth',1);
+INSERT INTO "remix_tag" VALUES(3245,'trance',1);
+INSERT INTO "remix_tag" VALUES(3245,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3247,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3247,'piano',1);
+INSERT INTO "remix_tag" VALUES(3247,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3247,'solo',1);
+INSERT INTO "remix_tag" VALUES(3247,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3248,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3248,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3248,'funk',1);
+INSERT INTO "remix_tag" VALUES(3248,'metal',1);
+INSERT INTO "remix_tag" VALUES(3248,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3248,'organ',1);
+INSERT INTO "remix_tag" VALUES(3248,'piano',1);
+INSERT INTO "remix_tag" VALUES(3248,'strings',1);
+INSERT INTO "remix_tag" VALUES(3249,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3249,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3249,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3249,'edm',1);
+INSERT INTO "remix_tag" VALUES(3249,'strings',1);
+INSERT INTO "remix_tag" VALUES(3249,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3249,'synth',1);
+INSERT INTO "remix_tag" VALUES(3249,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3250,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3250,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3250,'metal',1);
+INSERT INTO "remix_tag" VALUES(3250,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3251,'brass',1);
+INSERT INTO "remix_tag" VALUES(3251,'choir',1);
+INSERT INTO "remix_tag" VALUES(3251,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3251,'dark',1);
+INSERT INTO "remix_tag" VALUES(3251,'epic',1);
+INSERT INTO "remix_tag" VALUES(3251,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3251,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3251,'singing',1);
+INSERT INTO "remix_tag" VALUES(3251,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3251,'strings',1);
+INSERT INTO "remix_tag" VALUES(3251,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3251,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3251,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3252,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3252,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3252,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3252,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3252,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3252,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3252,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3252,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3252,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3253,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3253,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3253,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3253,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3253,'metal',1);
+INSERT INTO "remix_tag" VALUES(3253,'rock',1);
+INSERT INTO "remix_tag" VALUES(3253,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3253,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3253,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3254,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3254,'chill',1);
+INSERT INTO "remix_tag" VALUES(3254,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3254,'dark',1);
+INSERT INTO "remix_tag" VALUES(3254,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3254,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3254,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3254,'synth',1);
+INSERT INTO "remix_tag" VALUES(3254,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3254,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3255,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3255,'collab',1);
+INSERT INTO "remix_tag" VALUES(3255,'dark',1);
+INSERT INTO "remix_tag" VALUES(3255,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3255,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3255,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3255,'rock',1);
+INSERT INTO "remix_tag" VALUES(3255,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(3255,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3255,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3255,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3256,'chill',1);
+INSERT INTO "remix_tag" VALUES(3256,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3256,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3256,'piano',1);
+INSERT INTO "remix_tag" VALUES(3256,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3256,'trio',1);
+INSERT INTO "remix_tag" VALUES(3257,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3257,'collab',1);
+INSERT INTO "remix_tag" VALUES(3257,'dance',1);
+INSERT INTO "remix_tag" VALUES(3257,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3257,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3257,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3257,'happy',1);
+INSERT INTO "remix_tag" VALUES(3257,'synth',1);
+INSERT INTO "remix_tag" VALUES(3257,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3258,'bells',1);
+INSERT INTO "remix_tag" VALUES(3258,'brass',1);
+INSERT INTO "remix_tag" VALUES(3258,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3258,'collab',1);
+INSERT INTO "remix_tag" VALUES(3258,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3258,'epic',1);
+INSERT INTO "remix_tag" VALUES(3258,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3258,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3258,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3258,'strings',1);
+INSERT INTO "remix_tag" VALUES(3258,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3258,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3259,'compo',1);
+INSERT INTO "remix_tag" VALUES(3259,'edm',1);
+INSERT INTO "remix_tag" VALUES(3259,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3259,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3259,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3259,'synth',1);
+INSERT INTO "remix_tag" VALUES(3259,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3261,'brass',1);
+INSERT INTO "remix_tag" VALUES(3261,'choir',1);
+INSERT INTO "remix_tag" VALUES(3261,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3261,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3261,'epic',1);
+INSERT INTO "remix_tag" VALUES(3261,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3261,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3261,'strings',1);
+INSERT INTO "remix_tag" VALUES(3261,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3261,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3262,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3262,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3262,'folk',1);
+INSERT INTO "remix_tag" VALUES(3262,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3262,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3263,'collab',1);
+INSERT INTO "remix_tag" VALUES(3263,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3267,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3267,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3267,'piano',1);
+INSERT INTO "remix_tag" VALUES(3267,'synth',1);
+INSERT INTO "remix_tag" VALUES(3267,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3268,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3268,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3268,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3268,'funk',1);
+INSERT INTO "remix_tag" VALUES(3268,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3268,'medley',1);
+INSERT INTO "remix_tag" VALUES(3268,'piano',1);
+INSERT INTO "remix_tag" VALUES(3268,'rock',1);
+INSERT INTO "remix_tag" VALUES(3268,'synth',1);
+INSERT INTO "remix_tag" VALUES(3269,'bells',1);
+INSERT INTO "remix_tag" VALUES(3269,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3269,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3269,'piano',1);
+INSERT INTO "remix_tag" VALUES(3269,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3270,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3270,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3270,'singing',1);
+INSERT INTO "remix_tag" VALUES(3270,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3270,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3271,'brass',1);
+INSERT INTO "remix_tag" VALUES(3271,'dark',1);
+INSERT INTO "remix_tag" VALUES(3271,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3271,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3271,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3271,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3271,'piano',1);
+INSERT INTO "remix_tag" VALUES(3271,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3271,'strings',1);
+INSERT INTO "remix_tag" VALUES(3271,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3271,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3272,'choir',1);
+INSERT INTO "remix_tag" VALUES(3272,'dark',1);
+INSERT INTO "remix_tag" VALUES(3272,'electro',1);
+INSERT INTO "remix_tag" VALUES(3272,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3272,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3272,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3272,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3272,'synth',1);
+INSERT INTO "remix_tag" VALUES(3273,'compo',1);
+INSERT INTO "remix_tag" VALUES(3273,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3273,'edm',1);
+INSERT INTO "remix_tag" VALUES(3273,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3273,'folk',1);
+INSERT INTO "remix_tag" VALUES(3273,'indian',1);
+INSERT INTO "remix_tag" VALUES(3273,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3273,'synth',1);
+INSERT INTO "remix_tag" VALUES(3273,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3274,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3274,'edm',1);
+INSERT INTO "remix_tag" VALUES(3274,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3274,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3274,'synth',1);
+INSERT INTO "remix_tag" VALUES(3275,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3275,'brass',1);
+INSERT INTO "remix_tag" VALUES(3275,'collab',1);
+INSERT INTO "remix_tag" VALUES(3275,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3275,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3275,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3275,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3275,'rock',1);
+INSERT INTO "remix_tag" VALUES(3275,'strings',1);
+INSERT INTO "remix_tag" VALUES(3275,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3275,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3276,'collab',1);
+INSERT INTO "remix_tag" VALUES(3276,'edm',1);
+INSERT INTO "remix_tag" VALUES(3276,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3276,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3276,'happy',1);
+INSERT INTO "remix_tag" VALUES(3276,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3276,'pop',1);
+INSERT INTO "remix_tag" VALUES(3276,'synth',1);
+INSERT INTO "remix_tag" VALUES(3277,'choir',1);
+INSERT INTO "remix_tag" VALUES(3277,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3277,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3277,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3277,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3277,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3277,'piano',1);
+INSERT INTO "remix_tag" VALUES(3277,'rock',1);
+INSERT INTO "remix_tag" VALUES(3278,'bells',1);
+INSERT INTO "remix_tag" VALUES(3278,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3278,'dark',1);
+INSERT INTO "remix_tag" VALUES(3278,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3278,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3278,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3278,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3278,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3279,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3279,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3279,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3279,'folk',1);
+INSERT INTO "remix_tag" VALUES(3279,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3279,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3279,'piano',1);
+INSERT INTO "remix_tag" VALUES(3279,'rock',1);
+INSERT INTO "remix_tag" VALUES(3279,'singing',1);
+INSERT INTO "remix_tag" VALUES(3279,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3279,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3280,'bells',1);
+INSERT INTO "remix_tag" VALUES(3280,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3280,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3280,'metal',1);
+INSERT INTO "remix_tag" VALUES(3280,'rock',1);
+INSERT INTO "remix_tag" VALUES(3280,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3281,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3281,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3281,'choir',1);
+INSERT INTO "remix_tag" VALUES(3281,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3281,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3281,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3281,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3281,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3281,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3282,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3282,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3282,'happy',1);
+INSERT INTO "remix_tag" VALUES(3282,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3282,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3282,'rock',1);
+INSERT INTO "remix_tag" VALUES(3282,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3282,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3283,'chill',1);
+INSERT INTO "remix_tag" VALUES(3283,'collab',1);
+INSERT INTO "remix_tag" VALUES(3283,'funk',1);
+INSERT INTO "remix_tag" VALUES(3283,'funky',1);
+INSERT INTO "remix_tag" VALUES(3283,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3283,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3283,'piano',1);
+INSERT INTO "remix_tag" VALUES(3283,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3283,'singing',1);
+INSERT INTO "remix_tag" VALUES(3283,'synth',1);
+INSERT INTO "remix_tag" VALUES(3283,'turntable',1);
+INSERT INTO "remix_tag" VALUES(3283,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3283,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3283,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3284,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3284,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3284,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3284,'piano',1);
+INSERT INTO "remix_tag" VALUES(3284,'rock',1);
+INSERT INTO "remix_tag" VALUES(3284,'synth',1);
+INSERT INTO "remix_tag" VALUES(3285,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3285,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3285,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3285,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3285,'piano',1);
+INSERT INTO "remix_tag" VALUES(3286,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3286,'compo',1);
+INSERT INTO "remix_tag" VALUES(3286,'edm',1);
+INSERT INTO "remix_tag" VALUES(3286,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3286,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3286,'synth',1);
+INSERT INTO "remix_tag" VALUES(3287,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3287,'edm',1);
+INSERT INTO "remix_tag" VALUES(3287,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3287,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3287,'synth',1);
+INSERT INTO "remix_tag" VALUES(3287,'trap',1);
+INSERT INTO "remix_tag" VALUES(3288,'choir',1);
+INSERT INTO "remix_tag" VALUES(3288,'dark',1);
+INSERT INTO "remix_tag" VALUES(3288,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3288,'epic',1);
+INSERT INTO "remix_tag" VALUES(3288,'harp',1);
+INSERT INTO "remix_tag" VALUES(3288,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3288,'piano',1);
+INSERT INTO "remix_tag" VALUES(3288,'rock',1);
+INSERT INTO "remix_tag" VALUES(3288,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3288,'strings',1);
+INSERT INTO "remix_tag" VALUES(3288,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3288,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3289,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3289,'bells',1);
+INSERT INTO "remix_tag" VALUES(3289,'chill',1);
+INSERT INTO "remix_tag" VALUES(3289,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3289,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3289,'piano',1);
+INSERT INTO "remix_tag" VALUES(3289,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3289,'synth',1);
+INSERT INTO "remix_tag" VALUES(3289,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(3289,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3290,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3290,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3290,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3290,'metal',1);
+INSERT INTO "remix_tag" VALUES(3290,'rock',1);
+INSERT INTO "remix_tag" VALUES(3291,'disco',1);
+INSERT INTO "remix_tag" VALUES(3291,'edm',1);
+INSERT INTO "remix_tag" VALUES(3291,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3291,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3291,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3291,'synth',1);
+INSERT INTO "remix_tag" VALUES(3291,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3291,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3292,'choir',1);
+INSERT INTO "remix_tag" VALUES(3292,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3292,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3292,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3292,'piano',1);
+INSERT INTO "remix_tag" VALUES(3292,'singing',1);
+INSERT INTO "remix_tag" VALUES(3292,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3292,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3292,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3293,'collab',1);
+INSERT INTO "remix_tag" VALUES(3293,'dark',1);
+INSERT INTO "remix_tag" VALUES(3293,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3293,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3293,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3293,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3293,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3293,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3293,'rock',1);
+INSERT INTO "remix_tag" VALUES(3294,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3294,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3294,'choir',1);
+INSERT INTO "remix_tag" VALUES(3294,'edm',1);
+INSERT INTO "remix_tag" VALUES(3294,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3294,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3294,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3294,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3294,'synth',1);
+INSERT INTO "remix_tag" VALUES(3295,'cello',1);
+INSERT INTO "remix_tag" VALUES(3295,'chill',1);
+INSERT INTO "remix_tag" VALUES(3295,'classical',1);
+INSERT INTO "remix_tag" VALUES(3295,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3295,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3295,'rock',1);
+INSERT INTO "remix_tag" VALUES(3295,'strings',1);
+INSERT INTO "remix_tag" VALUES(3295,'synth',1);
+INSERT INTO "remix_tag" VALUES(3295,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3296,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3296,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3296,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3296,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3296,'happy',1);
+INSERT INTO "remix_tag" VALUES(3296,'latin',1);
+INSERT INTO "remix_tag" VALUES(3296,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3296,'piano',1);
+INSERT INTO "remix_tag" VALUES(3296,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3297,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3297,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3297,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3297,'piano',1);
+INSERT INTO "remix_tag" VALUES(3297,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3297,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3297,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3297,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3298,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3298,'compo',1);
+INSERT INTO "remix_tag" VALUES(3298,'edm',1);
+INSERT INTO "remix_tag" VALUES(3298,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3298,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3298,'synth',1);
+INSERT INTO "remix_tag" VALUES(3299,'edm',1);
+INSERT INTO "remix_tag" VALUES(3299,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3299,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3299,'synth',1);
+INSERT INTO "remix_tag" VALUES(3300,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3300,'funky',1);
+INSERT INTO "remix_tag" VALUES(3300,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3300,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3300,'organ',1);
+INSERT INTO "remix_tag" VALUES(3300,'piano',1);
+INSERT INTO "remix_tag" VALUES(3300,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3300,'synth',1);
+INSERT INTO "remix_tag" VALUES(3300,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3300,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3300,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3300,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3300,'violin',1);
+INSERT INTO "remix_tag" VALUES(3301,'collab',1);
+INSERT INTO "remix_tag" VALUES(3301,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3301,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3302,'edm',1);
+INSERT INTO "remix_tag" VALUES(3302,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3302,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3302,'synth',1);
+INSERT INTO "remix_tag" VALUES(3302,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3303,'collab',1);
+INSERT INTO "remix_tag" VALUES(3303,'edm',1);
+INSERT INTO "remix_tag" VALUES(3303,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3303,'funky',1);
+INSERT INTO "remix_tag" VALUES(3303,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3303,'synth',1);
+INSERT INTO "remix_tag" VALUES(3304,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3304,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3304,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3304,'organ',1);
+INSERT INTO "remix_tag" VALUES(3304,'piano',1);
+INSERT INTO "remix_tag" VALUES(3304,'rock',1);
+INSERT INTO "remix_tag" VALUES(3304,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3304,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3304,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3306,'brass',1);
+INSERT INTO "remix_tag" VALUES(3306,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3306,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3306,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3306,'piano',1);
+INSERT INTO "remix_tag" VALUES(3306,'strings',1);
+INSERT INTO "remix_tag" VALUES(3306,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3307,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3307,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3307,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3307,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3307,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3307,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3307,'piano',1);
+INSERT INTO "remix_tag" VALUES(3307,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3307,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3307,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3308,'brass',1);
+INSERT INTO "remix_tag" VALUES(3308,'choir',1);
+INSERT INTO "remix_tag" VALUES(3308,'epic',1);
+INSERT INTO "remix_tag" VALUES(3308,'flute',1);
+INSERT INTO "remix_tag" VALUES(3308,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3308,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3308,'strings',1);
+INSERT INTO "remix_tag" VALUES(3308,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3308,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3309,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3309,'chill',1);
+INSERT INTO "remix_tag" VALUES(3309,'edm',1);
+INSERT INTO "remix_tag" VALUES(3309,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3309,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3309,'funky',1);
+INSERT INTO "remix_tag" VALUES(3309,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3309,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3309,'synth',1);
+INSERT INTO "remix_tag" VALUES(3310,'edm',1);
+INSERT INTO "remix_tag" VALUES(3310,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3310,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3310,'funny',1);
+INSERT INTO "remix_tag" VALUES(3310,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3310,'synth',1);
+INSERT INTO "remix_tag" VALUES(3310,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3311,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3311,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3311,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3311,'synth',1);
+INSERT INTO "remix_tag" VALUES(3311,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3312,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3312,'dark',1);
+INSERT INTO "remix_tag" VALUES(3312,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3312,'piano',1);
+INSERT INTO "remix_tag" VALUES(3312,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3312,'strings',1);
+INSERT INTO "remix_tag" VALUES(3312,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3312,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3317,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3318,'classical',1);
+INSERT INTO "remix_tag" VALUES(3318,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3318,'piano',1);
+INSERT INTO "remix_tag" VALUES(3318,'solo',1);
+INSERT INTO "remix_tag" VALUES(3318,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3318,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3319,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3319,'edm',1);
+INSERT INTO "remix_tag" VALUES(3319,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3319,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3319,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3319,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3319,'synth',1);
+INSERT INTO "remix_tag" VALUES(3319,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3320,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3320,'brass',1);
+INSERT INTO "remix_tag" VALUES(3320,'choir',1);
+INSERT INTO "remix_tag" VALUES(3320,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3320,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3320,'dark',1);
+INSERT INTO "remix_tag" VALUES(3320,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3320,'strings',1);
+INSERT INTO "remix_tag" VALUES(3320,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3320,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3321,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3321,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3321,'edm',1);
+INSERT INTO "remix_tag" VALUES(3321,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3321,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3321,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3321,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3321,'marimba',1);
+INSERT INTO "remix_tag" VALUES(3321,'synth',1);
+INSERT INTO "remix_tag" VALUES(3323,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3323,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3323,'pop',1);
+INSERT INTO "remix_tag" VALUES(3323,'synth',1);
+INSERT INTO "remix_tag" VALUES(3323,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3323,'workout',1);
+INSERT INTO "remix_tag" VALUES(3324,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3324,'electro',1);
+INSERT INTO "remix_tag" VALUES(3324,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3324,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3324,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3324,'synth',1);
+INSERT INTO "remix_tag" VALUES(3324,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3324,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3325,'disco',1);
+INSERT INTO "remix_tag" VALUES(3325,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3325,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3325,'funk',1);
+INSERT INTO "remix_tag" VALUES(3325,'funky',1);
+INSERT INTO "remix_tag" VALUES(3325,'organ',1);
+INSERT INTO "remix_tag" VALUES(3326,'choir',1);
+INSERT INTO "remix_tag" VALUES(3326,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3326,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3326,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3326,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3326,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3326,'synth',1);
+INSERT INTO "remix_tag" VALUES(3326,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3327,'chill',1);
+INSERT INTO "remix_tag" VALUES(3327,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3327,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3327,'synth',1);
+INSERT INTO "remix_tag" VALUES(3327,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3327,'trap',1);
+INSERT INTO "remix_tag" VALUES(3328,'choir',1);
+INSERT INTO "remix_tag" VALUES(3328,'classical',1);
+INSERT INTO "remix_tag" VALUES(3328,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3328,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3328,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3328,'organ',1);
+INSERT INTO "remix_tag" VALUES(3328,'piano',1);
+INSERT INTO "remix_tag" VALUES(3328,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3328,'strings',1);
+INSERT INTO "remix_tag" VALUES(3329,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3329,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3329,'metal',1);
+INSERT INTO "remix_tag" VALUES(3329,'synth',1);
+INSERT INTO "remix_tag" VALUES(3330,'chill',1);
+INSERT INTO "remix_tag" VALUES(3330,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3330,'funk',1);
+INSERT INTO "remix_tag" VALUES(3330,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3330,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3330,'organ',1);
+INSERT INTO "remix_tag" VALUES(3330,'piano',1);
+INSERT INTO "remix_tag" VALUES(3330,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3330,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3331,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3331,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3331,'compo',1);
+INSERT INTO "remix_tag" VALUES(3331,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3331,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3331,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3331,'synth',1);
+INSERT INTO "remix_tag" VALUES(3332,'choir',1);
+INSERT INTO "remix_tag" VALUES(3332,'dark',1);
+INSERT INTO "remix_tag" VALUES(3332,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3332,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3332,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3332,'organ',1);
+INSERT INTO "remix_tag" VALUES(3332,'strings',1);
+INSERT INTO "remix_tag" VALUES(3332,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3332,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3332,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3333,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3333,'edm',1);
+INSERT INTO "remix_tag" VALUES(3333,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3333,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3333,'funky',1);
+INSERT INTO "remix_tag" VALUES(3333,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3333,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3333,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3333,'synth',1);
+INSERT INTO "remix_tag" VALUES(3333,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3333,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3334,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3334,'brass',1);
+INSERT INTO "remix_tag" VALUES(3334,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3334,'dark',1);
+INSERT INTO "remix_tag" VALUES(3334,'didgeridoo',1);
+INSERT INTO "remix_tag" VALUES(3334,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3334,'flute',1);
+INSERT INTO "remix_tag" VALUES(3334,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3334,'strings',1);
+INSERT INTO "remix_tag" VALUES(3334,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3334,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3334,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3335,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3335,'bells',1);
+INSERT INTO "remix_tag" VALUES(3335,'brass',1);
+INSERT INTO "remix_tag" VALUES(3335,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3335,'happy',1);
+INSERT INTO "remix_tag" VALUES(3335,'march',1);
+INSERT INTO "remix_tag" VALUES(3335,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3335,'strings',1);
+INSERT INTO "remix_tag" VALUES(3335,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3335,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3335,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3336,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3336,'brass',1);
+INSERT INTO "remix_tag" VALUES(3336,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3336,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3336,'metal',1);
+INSERT INTO "remix_tag" VALUES(3336,'strings',1);
+INSERT INTO "remix_tag" VALUES(3336,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3336,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3337,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3337,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3337,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3337,'metal',1);
+INSERT INTO "remix_tag" VALUES(3337,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3337,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3338,'chill',1);
+INSERT INTO "remix_tag" VALUES(3338,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3338,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3338,'funky',1);
+INSERT INTO "remix_tag" VALUES(3338,'pop',1);
+INSERT INTO "remix_tag" VALUES(3338,'synth',1);
+INSERT INTO "remix_tag" VALUES(3339,'african',1);
+INSERT INTO "remix_tag" VALUES(3339,'chill',1);
+INSERT INTO "remix_tag" VALUES(3339,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3339,'folk',1);
+INSERT INTO "remix_tag" VALUES(3339,'indian',1);
+INSERT INTO "remix_tag" VALUES(3339,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3339,'strings',1);
+INSERT INTO "remix_tag" VALUES(3339,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3339,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3340,'edm',1);
+INSERT INTO "remix_tag" VALUES(3340,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3340,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3340,'happy',1);
+INSERT INTO "remix_tag" VALUES(3340,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3340,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3340,'synth',1);
+INSERT INTO "remix_tag" VALUES(3341,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3341,'collab',1);
+INSERT INTO "remix_tag" VALUES(3341,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3341,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3341,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3341,'rock',1);
+INSERT INTO "remix_tag" VALUES(3341,'violin',1);
+INSERT INTO "remix_tag" VALUES(3343,'brass',1);
+INSERT INTO "remix_tag" VALUES(3343,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3343,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3343,'dark',1);
+INSERT INTO "remix_tag" VALUES(3343,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3343,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3343,'organ',1);
+INSERT INTO "remix_tag" VALUES(3343,'piano',1);
+INSERT INTO "remix_tag" VALUES(3343,'strings',1);
+INSERT INTO "remix_tag" VALUES(3343,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3343,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3343,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3343,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3344,'edm',1);
+INSERT INTO "remix_tag" VALUES(3344,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3344,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3344,'piano',1);
+INSERT INTO "remix_tag" VALUES(3344,'synth',1);
+INSERT INTO "remix_tag" VALUES(3344,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3345,'brass',1);
+INSERT INTO "remix_tag" VALUES(3345,'choir',1);
+INSERT INTO "remix_tag" VALUES(3345,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3345,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3345,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3345,'epic',1);
+INSERT INTO "remix_tag" VALUES(3345,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3345,'piano',1);
+INSERT INTO "remix_tag" VALUES(3345,'strings',1);
+INSERT INTO "remix_tag" VALUES(3345,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3345,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3346,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3346,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3346,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3346,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3346,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3346,'rock',1);
+INSERT INTO "remix_tag" VALUES(3346,'singing',1);
+INSERT INTO "remix_tag" VALUES(3346,'synth',1);
+INSERT INTO "remix_tag" VALUES(3346,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3346,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3346,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3347,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3347,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3347,'folk',1);
+INSERT INTO "remix_tag" VALUES(3347,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3347,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3347,'strings',1);
+INSERT INTO "remix_tag" VALUES(3347,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3348,'classical',1);
+INSERT INTO "remix_tag" VALUES(3348,'piano',1);
+INSERT INTO "remix_tag" VALUES(3348,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3348,'solo',1);
+INSERT INTO "remix_tag" VALUES(3348,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3348,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3350,'brass',1);
+INSERT INTO "remix_tag" VALUES(3350,'choir',1);
+INSERT INTO "remix_tag" VALUES(3350,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3350,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3350,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3350,'epic',1);
+INSERT INTO "remix_tag" VALUES(3350,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3350,'piano',1);
+INSERT INTO "remix_tag" VALUES(3350,'strings',1);
+INSERT INTO "remix_tag" VALUES(3350,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3351,'bells',1);
+INSERT INTO "remix_tag" VALUES(3351,'classical',1);
+INSERT INTO "remix_tag" VALUES(3351,'dark',1);
+INSERT INTO "remix_tag" VALUES(3351,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3351,'piano',1);
+INSERT INTO "remix_tag" VALUES(3351,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3351,'strings',1);
+INSERT INTO "remix_tag" VALUES(3352,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3352,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3352,'folk',1);
+INSERT INTO "remix_tag" VALUES(3352,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3352,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3352,'strings',1);
+INSERT INTO "remix_tag" VALUES(3352,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3353,'flute',1);
+INSERT INTO "remix_tag" VALUES(3353,'folk',1);
+INSERT INTO "remix_tag" VALUES(3353,'happy',1);
+INSERT INTO "remix_tag" VALUES(3353,'harp',1);
+INSERT INTO "remix_tag" VALUES(3353,'pop',1);
+INSERT INTO "remix_tag" VALUES(3353,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3353,'strings',1);
+INSERT INTO "remix_tag" VALUES(3353,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(3353,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3354,'brass',1);
+INSERT INTO "remix_tag" VALUES(3354,'choir',1);
+INSERT INTO "remix_tag" VALUES(3354,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3354,'dark',1);
+INSERT INTO "remix_tag" VALUES(3354,'epic',1);
+INSERT INTO "remix_tag" VALUES(3354,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3354,'strings',1);
+INSERT INTO "remix_tag" VALUES(3354,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3354,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3354,'synth',1);
+INSERT INTO "remix_tag" VALUES(3355,'classical',1);
+INSERT INTO "remix_tag" VALUES(3355,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3355,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3355,'piano',1);
+INSERT INTO "remix_tag" VALUES(3355,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3355,'solo',1);
+INSERT INTO "remix_tag" VALUES(3355,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3356,'chill',1);
+INSERT INTO "remix_tag" VALUES(3356,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3356,'compo',1);
+INSERT INTO "remix_tag" VALUES(3356,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3356,'edm',1);
+INSERT INTO "remix_tag" VALUES(3356,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3356,'happy',1);
+INSERT INTO "remix_tag" VALUES(3356,'synth',1);
+INSERT INTO "remix_tag" VALUES(3357,'brass',1);
+INSERT INTO "remix_tag" VALUES(3357,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3357,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3357,'epic',1);
+INSERT INTO "remix_tag" VALUES(3357,'flute',1);
+INSERT INTO "remix_tag" VALUES(3357,'harp',1);
+INSERT INTO "remix_tag" VALUES(3357,'medley',1);
+INSERT INTO "remix_tag" VALUES(3357,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3357,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3357,'piano',1);
+INSERT INTO "remix_tag" VALUES(3357,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3357,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3358,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3358,'edm',1);
+INSERT INTO "remix_tag" VALUES(3358,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3358,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3358,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3358,'synth',1);
+INSERT INTO "remix_tag" VALUES(3358,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3359,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3359,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3359,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3359,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3359,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3359,'singing',1);
+INSERT INTO "remix_tag" VALUES(3359,'synth',1);
+INSERT INTO "remix_tag" VALUES(3359,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3359,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3359,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3359,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3360,'bells',1);
+INSERT INTO "remix_tag" VALUES(3360,'edm',1);
+INSERT INTO "remix_tag" VALUES(3360,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3360,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3360,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3360,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3360,'synth',1);
+INSERT INTO "remix_tag" VALUES(3360,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3361,'brass',1);
+INSERT INTO "remix_tag" VALUES(3361,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3361,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3361,'piano',1);
+INSERT INTO "remix_tag" VALUES(3361,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3361,'strings',1);
+INSERT INTO "remix_tag" VALUES(3361,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3361,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3362,'dark',1);
+INSERT INTO "remix_tag" VALUES(3362,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3362,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3362,'synth',1);
+INSERT INTO "remix_tag" VALUES(3363,'brass',1);
+INSERT INTO "remix_tag" VALUES(3363,'choir',1);
+INSERT INTO "remix_tag" VALUES(3363,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3363,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3363,'epic',1);
+INSERT INTO "remix_tag" VALUES(3363,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3363,'strings',1);
+INSERT INTO "remix_tag" VALUES(3363,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3363,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3364,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3364,'compo',1);
+INSERT INTO "remix_tag" VALUES(3364,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3364,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3364,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3364,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3364,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(3365,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3365,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3365,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3365,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3365,'rock',1);
+INSERT INTO "remix_tag" VALUES(3365,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3366,'bells',1);
+INSERT INTO "remix_tag" VALUES(3366,'chill',1);
+INSERT INTO "remix_tag" VALUES(3366,'collab',1);
+INSERT INTO "remix_tag" VALUES(3366,'dance',1);
+INSERT INTO "remix_tag" VALUES(3366,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3366,'piano',1);
+INSERT INTO "remix_tag" VALUES(3366,'pop',1);
+INSERT INTO "remix_tag" VALUES(3366,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3366,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3367,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3367,'bells',1);
+INSERT INTO "remix_tag" VALUES(3367,'choir',1);
+INSERT INTO "remix_tag" VALUES(3367,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3367,'epic',1);
+INSERT INTO "remix_tag" VALUES(3367,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3367,'metal',1);
+INSERT INTO "remix_tag" VALUES(3367,'organ',1);
+INSERT INTO "remix_tag" VALUES(3367,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3367,'strings',1);
+INSERT INTO "remix_tag" VALUES(3367,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3368,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3368,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3368,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3368,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3368,'synth',1);
+INSERT INTO "remix_tag" VALUES(3368,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3369,'edm',1);
+INSERT INTO "remix_tag" VALUES(3369,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3369,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3369,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3369,'strings',1);
+INSERT INTO "remix_tag" VALUES(3369,'synth',1);
+INSERT INTO "remix_tag" VALUES(3369,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3370,'chill',1);
+INSERT INTO "remix_tag" VALUES(3370,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3370,'edm',1);
+INSERT INTO "remix_tag" VALUES(3370,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3370,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3370,'synth',1);
+INSERT INTO "remix_tag" VALUES(3371,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3371,'collab',1);
+INSERT INTO "remix_tag" VALUES(3371,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3371,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3371,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3371,'rock',1);
+INSERT INTO "remix_tag" VALUES(3371,'synth',1);
+INSERT INTO "remix_tag" VALUES(3372,'brass',1);
+INSERT INTO "remix_tag" VALUES(3372,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3372,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3372,'epic',1);
+INSERT INTO "remix_tag" VALUES(3372,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3372,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3372,'organ',1);
+INSERT INTO "remix_tag" VALUES(3372,'piano',1);
+INSERT INTO "remix_tag" VALUES(3372,'rock',1);
+INSERT INTO "remix_tag" VALUES(3372,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3372,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3372,'strings',1);
+INSERT INTO "remix_tag" VALUES(3372,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3372,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3372,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3373,'bells',1);
+INSERT INTO "remix_tag" VALUES(3373,'edm',1);
+INSERT INTO "remix_tag" VALUES(3373,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3373,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3373,'happy',1);
+INSERT INTO "remix_tag" VALUES(3373,'synth',1);
+INSERT INTO "remix_tag" VALUES(3374,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3374,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3374,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3374,'metal',1);
+INSERT INTO "remix_tag" VALUES(3374,'rock',1);
+INSERT INTO "remix_tag" VALUES(3374,'synth',1);
+INSERT INTO "remix_tag" VALUES(3375,'edm',1);
+INSERT INTO "remix_tag" VALUES(3375,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3375,'pop',1);
+INSERT INTO "remix_tag" VALUES(3375,'synth',1);
+INSERT INTO "remix_tag" VALUES(3375,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3376,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3376,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3376,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3376,'rock',1);
+INSERT INTO "remix_tag" VALUES(3376,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3376,'synth',1);
+INSERT INTO "remix_tag" VALUES(3376,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3377,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3377,'brass',1);
+INSERT INTO "remix_tag" VALUES(3377,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3377,'harp',1);
+INSERT INTO "remix_tag" VALUES(3377,'rock',1);
+INSERT INTO "remix_tag" VALUES(3377,'strings',1);
+INSERT INTO "remix_tag" VALUES(3377,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3378,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3378,'chill',1);
+INSERT INTO "remix_tag" VALUES(3378,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3378,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3378,'collab',1);
+INSERT INTO "remix_tag" VALUES(3378,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3378,'funky',1);
+INSERT INTO "remix_tag" VALUES(3378,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3378,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3378,'synth',1);
+INSERT INTO "remix_tag" VALUES(3378,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3379,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3379,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3379,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3379,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3379,'happy',1);
+INSERT INTO "remix_tag" VALUES(3379,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3379,'pop',1);
+INSERT INTO "remix_tag" VALUES(3379,'synth',1);
+INSERT INTO "remix_tag" VALUES(3379,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3380,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3380,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3380,'collab',1);
+INSERT INTO "remix_tag" VALUES(3380,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3380,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3380,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3380,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3380,'singing',1);
+INSERT INTO "remix_tag" VALUES(3380,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3382,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3382,'bells',1);
+INSERT INTO "remix_tag" VALUES(3382,'brass',1);
+INSERT INTO "remix_tag" VALUES(3382,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3382,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3382,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3382,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3382,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3382,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3382,'singing',1);
+INSERT INTO "remix_tag" VALUES(3382,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3382,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3382,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3382,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3383,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3383,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3383,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3383,'bells',1);
+INSERT INTO "remix_tag" VALUES(3383,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3383,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3383,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3383,'piano',1);
+INSERT INTO "remix_tag" VALUES(3384,'collab',1);
+INSERT INTO "remix_tag" VALUES(3384,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3384,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3384,'funk',1);
+INSERT INTO "remix_tag" VALUES(3384,'funky',1);
+INSERT INTO "remix_tag" VALUES(3384,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3384,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3384,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3384,'strings',1);
+INSERT INTO "remix_tag" VALUES(3385,'chill',1);
+INSERT INTO "remix_tag" VALUES(3385,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3385,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3385,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3385,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3385,'organ',1);
+INSERT INTO "remix_tag" VALUES(3385,'pop',1);
+INSERT INTO "remix_tag" VALUES(3385,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3385,'synth',1);
+INSERT INTO "remix_tag" VALUES(3385,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3386,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3386,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3386,'edm',1);
+INSERT INTO "remix_tag" VALUES(3386,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3386,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3386,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3386,'metal',1);
+INSERT INTO "remix_tag" VALUES(3386,'piano',1);
+INSERT INTO "remix_tag" VALUES(3386,'synth',1);
+INSERT INTO "remix_tag" VALUES(3386,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3386,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3387,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3387,'electro',1);
+INSERT INTO "remix_tag" VALUES(3387,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3387,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3387,'synth',1);
+INSERT INTO "remix_tag" VALUES(3387,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3388,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3388,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3388,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3388,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(3388,'collab',1);
+INSERT INTO "remix_tag" VALUES(3388,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3388,'piano',1);
+INSERT INTO "remix_tag" VALUES(3388,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3388,'violin',1);
+INSERT INTO "remix_tag" VALUES(3389,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3389,'electro',1);
+INSERT INTO "remix_tag" VALUES(3389,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3389,'funk',1);
+INSERT INTO "remix_tag" VALUES(3389,'funky',1);
+INSERT INTO "remix_tag" VALUES(3389,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3389,'piano',1);
+INSERT INTO "remix_tag" VALUES(3389,'synth',1);
+INSERT INTO "remix_tag" VALUES(3389,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3390,'collab',1);
+INSERT INTO "remix_tag" VALUES(3390,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3390,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3390,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3390,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3390,'singing',1);
+INSERT INTO "remix_tag" VALUES(3390,'synth',1);
+INSERT INTO "remix_tag" VALUES(3390,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3390,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3390,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3391,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3391,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3391,'funky',1);
+INSERT INTO "remix_tag" VALUES(3391,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3391,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3391,'synth',1);
+INSERT INTO "remix_tag" VALUES(3391,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3392,'edm',1);
+INSERT INTO "remix_tag" VALUES(3392,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3392,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3392,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3392,'happy',1);
+INSERT INTO "remix_tag" VALUES(3392,'pop',1);
+INSERT INTO "remix_tag" VALUES(3392,'synth',1);
+INSERT INTO "remix_tag" VALUES(3392,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3393,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3393,'brass',1);
+INSERT INTO "remix_tag" VALUES(3393,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3393,'happy',1);
+INSERT INTO "remix_tag" VALUES(3393,'harp',1);
+INSERT INTO "remix_tag" VALUES(3393,'march',1);
+INSERT INTO "remix_tag" VALUES(3393,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3393,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3393,'strings',1);
+INSERT INTO "remix_tag" VALUES(3393,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3393,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3394,'bells',1);
+INSERT INTO "remix_tag" VALUES(3394,'chill',1);
+INSERT INTO "remix_tag" VALUES(3394,'dark',1);
+INSERT INTO "remix_tag" VALUES(3394,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3394,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3394,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3394,'harp',1);
+INSERT INTO "remix_tag" VALUES(3394,'strings',1);
+INSERT INTO "remix_tag" VALUES(3394,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3394,'synth',1);
+INSERT INTO "remix_tag" VALUES(3394,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3395,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3395,'dark',1);
+INSERT INTO "remix_tag" VALUES(3395,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3395,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3395,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3395,'synth',1);
+INSERT INTO "remix_tag" VALUES(3395,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3396,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3396,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3396,'edm',1);
+INSERT INTO "remix_tag" VALUES(3396,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3396,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3396,'synth',1);
+INSERT INTO "remix_tag" VALUES(3397,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3397,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3397,'edm',1);
+INSERT INTO "remix_tag" VALUES(3397,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3397,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3397,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3397,'synth',1);
+INSERT INTO "remix_tag" VALUES(3398,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3398,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3398,'collab',1);
+INSERT INTO "remix_tag" VALUES(3398,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3398,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3398,'singing',1);
+INSERT INTO "remix_tag" VALUES(3398,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3398,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3399,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3399,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3399,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3399,'medley',1);
+INSERT INTO "remix_tag" VALUES(3399,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3399,'piano',1);
+INSERT INTO "remix_tag" VALUES(3399,'solo',1);
+INSERT INTO "remix_tag" VALUES(3399,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3400,'brass',1);
+INSERT INTO "remix_tag" VALUES(3400,'choir',1);
+INSERT INTO "remix_tag" VALUES(3400,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3400,'classical',1);
+INSERT INTO "remix_tag" VALUES(3400,'epic',1);
+INSERT INTO "remix_tag" VALUES(3400,'flute',1);
+INSERT INTO "remix_tag" VALUES(3400,'harp',1);
+INSERT INTO "remix_tag" VALUES(3400,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3400,'koto',1);
+INSERT INTO "remix_tag" VALUES(3400,'medley',1);
+INSERT INTO "remix_tag" VALUES(3400,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3400,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3400,'strings',1);
+INSERT INTO "remix_tag" VALUES(3400,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3401,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3401,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3401,'edm',1);
+INSERT INTO "remix_tag" VALUES(3401,'electro',1);
+INSERT INTO "remix_tag" VALUES(3401,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3401,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3401,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3401,'indian',1);
+INSERT INTO "remix_tag" VALUES(3401,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3401,'synth',1);
+INSERT INTO "remix_tag" VALUES(3402,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3402,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3402,'flute',1);
+INSERT INTO "remix_tag" VALUES(3402,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3402,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3402,'piano',1);
+INSERT INTO "remix_tag" VALUES(3404,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3404,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3404,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3404,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3404,'organ',1);
+INSERT INTO "remix_tag" VALUES(3404,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3404,'synth',1);
+INSERT INTO "remix_tag" VALUES(3404,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3404,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3404,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3405,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3405,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3405,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3405,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3405,'rock',1);
+INSERT INTO "remix_tag" VALUES(3405,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3406,'edm',1);
+INSERT INTO "remix_tag" VALUES(3406,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3406,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3406,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(3406,'synth',1);
+INSERT INTO "remix_tag" VALUES(3406,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3406,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3406,'workout',1);
+INSERT INTO "remix_tag" VALUES(3407,'brass',1);
+INSERT INTO "remix_tag" VALUES(3407,'choir',1);
+INSERT INTO "remix_tag" VALUES(3407,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3407,'dark',1);
+INSERT INTO "remix_tag" VALUES(3407,'epic',1);
+INSERT INTO "remix_tag" VALUES(3407,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3407,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3407,'organ',1);
+INSERT INTO "remix_tag" VALUES(3407,'piano',1);
+INSERT INTO "remix_tag" VALUES(3407,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3407,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3408,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3408,'chill',1);
+INSERT INTO "remix_tag" VALUES(3408,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3408,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3408,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3408,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3408,'rock',1);
+INSERT INTO "remix_tag" VALUES(3409,'choir',1);
+INSERT INTO "remix_tag" VALUES(3409,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3409,'dark',1);
+INSERT INTO "remix_tag" VALUES(3409,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3409,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3409,'organ',1);
+INSERT INTO "remix_tag" VALUES(3409,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3409,'strings',1);
+INSERT INTO "remix_tag" VALUES(3409,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3409,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3410,'chill',1);
+INSERT INTO "remix_tag" VALUES(3410,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3410,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3410,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3410,'piano',1);
+INSERT INTO "remix_tag" VALUES(3410,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3410,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3410,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3410,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3411,'chill',1);
+INSERT INTO "remix_tag" VALUES(3411,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3411,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3411,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3411,'piano',1);
+INSERT INTO "remix_tag" VALUES(3411,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3411,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3412,'chill',1);
+INSERT INTO "remix_tag" VALUES(3412,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3412,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3412,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3412,'piano',1);
+INSERT INTO "remix_tag" VALUES(3412,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3412,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3412,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3413,'funky',1);
+INSERT INTO "remix_tag" VALUES(3413,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3413,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3413,'piano',1);
+INSERT INTO "remix_tag" VALUES(3413,'synth',1);
+INSERT INTO "remix_tag" VALUES(3413,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3414,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3414,'bells',1);
+INSERT INTO "remix_tag" VALUES(3414,'harp',1);
+INSERT INTO "remix_tag" VALUES(3414,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3414,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3414,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3414,'piano',1);
+INSERT INTO "remix_tag" VALUES(3414,'strings',1);
+INSERT INTO "remix_tag" VALUES(3414,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3414,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3415,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3415,'flute',1);
+INSERT INTO "remix_tag" VALUES(3415,'folk',1);
+INSERT INTO "remix_tag" VALUES(3415,'funky',1);
+INSERT INTO "remix_tag" VALUES(3415,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3415,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3415,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3415,'singing',1);
+INSERT INTO "remix_tag" VALUES(3415,'trombone',1);
+INSERT INTO "remix_tag" VALUES(3415,'ukulele',1);
+INSERT INTO "remix_tag" VALUES(3415,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3416,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3416,'edm',1);
+INSERT INTO "remix_tag" VALUES(3416,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3416,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3416,'medley',1);
+INSERT INTO "remix_tag" VALUES(3416,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3416,'synth',1);
+INSERT INTO "remix_tag" VALUES(3416,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3417,'bells',1);
+INSERT INTO "remix_tag" VALUES(3417,'dark',1);
+INSERT INTO "remix_tag" VALUES(3417,'edm',1);
+INSERT INTO "remix_tag" VALUES(3417,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3417,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3417,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3417,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3417,'piano',1);
+INSERT INTO "remix_tag" VALUES(3417,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3417,'strings',1);
+INSERT INTO "remix_tag" VALUES(3417,'synth',1);
+INSERT INTO "remix_tag" VALUES(3417,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3418,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3418,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3418,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3418,'folk',1);
+INSERT INTO "remix_tag" VALUES(3418,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3418,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(3418,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3418,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3419,'chill',1);
+INSERT INTO "remix_tag" VALUES(3419,'edm',1);
+INSERT INTO "remix_tag" VALUES(3419,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3419,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3419,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3419,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3419,'synth',1);
+INSERT INTO "remix_tag" VALUES(3420,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3420,'brass',1);
+INSERT INTO "remix_tag" VALUES(3420,'dark',1);
+INSERT INTO "remix_tag" VALUES(3420,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3420,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3420,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3420,'rock',1);
+INSERT INTO "remix_tag" VALUES(3420,'strings',1);
+INSERT INTO "remix_tag" VALUES(3420,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3420,'violin',1);
+INSERT INTO "remix_tag" VALUES(3421,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3421,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3421,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3421,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3421,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3421,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3421,'synth',1);
+INSERT INTO "remix_tag" VALUES(3421,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3422,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3422,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3422,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3422,'happy',1);
+INSERT INTO "remix_tag" VALUES(3422,'synth',1);
+INSERT INTO "remix_tag" VALUES(3422,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3422,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3422,'workout',1);
+INSERT INTO "remix_tag" VALUES(3423,'chill',1);
+INSERT INTO "remix_tag" VALUES(3423,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3423,'funk',1);
+INSERT INTO "remix_tag" VALUES(3423,'funky',1);
+INSERT INTO "remix_tag" VALUES(3423,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3423,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3423,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3423,'piano',1);
+INSERT INTO "remix_tag" VALUES(3423,'singing',1);
+INSERT INTO "remix_tag" VALUES(3423,'synth',1);
+INSERT INTO "remix_tag" VALUES(3423,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3423,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3424,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3424,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3424,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3424,'rock',1);
+INSERT INTO "remix_tag" VALUES(3424,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3424,'synth',1);
+INSERT INTO "remix_tag" VALUES(3424,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3425,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3425,'chill',1);
+INSERT INTO "remix_tag" VALUES(3425,'collab',1);
+INSERT INTO "remix_tag" VALUES(3425,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3425,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3425,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3425,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3425,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3425,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3425,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3425,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3426,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3426,'dark',1);
+INSERT INTO "remix_tag" VALUES(3426,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3426,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3426,'metal',1);
+INSERT INTO "remix_tag" VALUES(3427,'bells',1);
+INSERT INTO "remix_tag" VALUES(3427,'chill',1);
+INSERT INTO "remix_tag" VALUES(3427,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3427,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3427,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3427,'funky',1);
+INSERT INTO "remix_tag" VALUES(3427,'house',1);
+INSERT INTO "remix_tag" VALUES(3427,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3427,'synth',1);
+INSERT INTO "remix_tag" VALUES(3428,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3428,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3428,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3428,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3428,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3428,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3428,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3428,'synth',1);
+INSERT INTO "remix_tag" VALUES(3428,'theremin',1);
+INSERT INTO "remix_tag" VALUES(3429,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3429,'chill',1);
+INSERT INTO "remix_tag" VALUES(3429,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3429,'metal',1);
+INSERT INTO "remix_tag" VALUES(3429,'rock',1);
+INSERT INTO "remix_tag" VALUES(3430,'bells',1);
+INSERT INTO "remix_tag" VALUES(3430,'chill',1);
+INSERT INTO "remix_tag" VALUES(3430,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3430,'edm',1);
+INSERT INTO "remix_tag" VALUES(3430,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3430,'happy',1);
+INSERT INTO "remix_tag" VALUES(3430,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3430,'synth',1);
+INSERT INTO "remix_tag" VALUES(3431,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3431,'chill',1);
+INSERT INTO "remix_tag" VALUES(3431,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3431,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3431,'piano',1);
+INSERT INTO "remix_tag" VALUES(3431,'synth',1);
+INSERT INTO "remix_tag" VALUES(3432,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3432,'dance',1);
+INSERT INTO "remix_tag" VALUES(3432,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3432,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3432,'happy',1);
+INSERT INTO "remix_tag" VALUES(3432,'synth',1);
+INSERT INTO "remix_tag" VALUES(3433,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3433,'brass',1);
+INSERT INTO "remix_tag" VALUES(3433,'choir',1);
+INSERT INTO "remix_tag" VALUES(3433,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3433,'epic',1);
+INSERT INTO "remix_tag" VALUES(3433,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3433,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3433,'strings',1);
+INSERT INTO "remix_tag" VALUES(3433,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3434,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3434,'collab',1);
+INSERT INTO "remix_tag" VALUES(3434,'duet',1);
+INSERT INTO "remix_tag" VALUES(3434,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3434,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3434,'piano',1);
+INSERT INTO "remix_tag" VALUES(3434,'violin',1);
+INSERT INTO "remix_tag" VALUES(3434,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3435,'collab',1);
+INSERT INTO "remix_tag" VALUES(3435,'edm',1);
+INSERT INTO "remix_tag" VALUES(3435,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3435,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3435,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3435,'pop',1);
+INSERT INTO "remix_tag" VALUES(3435,'singing',1);
+INSERT INTO "remix_tag" VALUES(3435,'synth',1);
+INSERT INTO "remix_tag" VALUES(3435,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3435,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3436,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3436,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3436,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3436,'funky',1);
+INSERT INTO "remix_tag" VALUES(3436,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3436,'synth',1);
+INSERT INTO "remix_tag" VALUES(3437,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3437,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3437,'dark',1);
+INSERT INTO "remix_tag" VALUES(3437,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3437,'epic',1);
+INSERT INTO "remix_tag" VALUES(3437,'metal',1);
+INSERT INTO "remix_tag" VALUES(3437,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3437,'strings',1);
+INSERT INTO "remix_tag" VALUES(3437,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3437,'violin',1);
+INSERT INTO "remix_tag" VALUES(3438,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3438,'collab',1);
+INSERT INTO "remix_tag" VALUES(3438,'duet',1);
+INSERT INTO "remix_tag" VALUES(3438,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3438,'happy',1);
+INSERT INTO "remix_tag" VALUES(3438,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3438,'piano',1);
+INSERT INTO "remix_tag" VALUES(3438,'violin',1);
+INSERT INTO "remix_tag" VALUES(3439,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3439,'chill',1);
+INSERT INTO "remix_tag" VALUES(3439,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3439,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3439,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3439,'synth',1);
+INSERT INTO "remix_tag" VALUES(3440,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3440,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3440,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3440,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3440,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3440,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3441,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3441,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3441,'flute',1);
+INSERT INTO "remix_tag" VALUES(3441,'folk',1);
+INSERT INTO "remix_tag" VALUES(3441,'latin',1);
+INSERT INTO "remix_tag" VALUES(3441,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3441,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3441,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3441,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3441,'violin',1);
+INSERT INTO "remix_tag" VALUES(3442,'blues',1);
+INSERT INTO "remix_tag" VALUES(3442,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3442,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3442,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3442,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3442,'funk',1);
+INSERT INTO "remix_tag" VALUES(3442,'funky',1);
+INSERT INTO "remix_tag" VALUES(3442,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3442,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3443,'collab',1);
+INSERT INTO "remix_tag" VALUES(3443,'edm',1);
+INSERT INTO "remix_tag" VALUES(3443,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3443,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3443,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3443,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3443,'pop',1);
+INSERT INTO "remix_tag" VALUES(3443,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3443,'synth',1);
+INSERT INTO "remix_tag" VALUES(3443,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3444,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3444,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3444,'dark',1);
+INSERT INTO "remix_tag" VALUES(3444,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3444,'edm',1);
+INSERT INTO "remix_tag" VALUES(3444,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3444,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3444,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3444,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3444,'synth',1);
+INSERT INTO "remix_tag" VALUES(3445,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3445,'bells',1);
+INSERT INTO "remix_tag" VALUES(3445,'dark',1);
+INSERT INTO "remix_tag" VALUES(3445,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3445,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3445,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3445,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3445,'synth',1);
+INSERT INTO "remix_tag" VALUES(3446,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3446,'dance',1);
+INSERT INTO "remix_tag" VALUES(3446,'disco',1);
+INSERT INTO "remix_tag" VALUES(3446,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3446,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3446,'funky',1);
+INSERT INTO "remix_tag" VALUES(3446,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3446,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3446,'synth',1);
+INSERT INTO "remix_tag" VALUES(3446,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3447,'edm',1);
+INSERT INTO "remix_tag" VALUES(3447,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3447,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3447,'funk',1);
+INSERT INTO "remix_tag" VALUES(3447,'funky',1);
+INSERT INTO "remix_tag" VALUES(3447,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3447,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3447,'synth',1);
+INSERT INTO "remix_tag" VALUES(3447,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3448,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3448,'bells',1);
+INSERT INTO "remix_tag" VALUES(3448,'chill',1);
+INSERT INTO "remix_tag" VALUES(3448,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3448,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3448,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3448,'epic',1);
+INSERT INTO "remix_tag" VALUES(3448,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3449,'dark',1);
+INSERT INTO "remix_tag" VALUES(3449,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3449,'edm',1);
+INSERT INTO "remix_tag" VALUES(3449,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3449,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3449,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3449,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3449,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3449,'synth',1);
+INSERT INTO "remix_tag" VALUES(3450,'edm',1);
+INSERT INTO "remix_tag" VALUES(3450,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3450,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3450,'synth',1);
+INSERT INTO "remix_tag" VALUES(3451,'dark',1);
+INSERT INTO "remix_tag" VALUES(3451,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3451,'edm',1);
+INSERT INTO "remix_tag" VALUES(3451,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3451,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3451,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3451,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3451,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3451,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3451,'synth',1);
+INSERT INTO "remix_tag" VALUES(3452,'bells',1);
+INSERT INTO "remix_tag" VALUES(3452,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3452,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3452,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3452,'happy',1);
+INSERT INTO "remix_tag" VALUES(3452,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3452,'synth',1);
+INSERT INTO "remix_tag" VALUES(3452,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3453,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3453,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3453,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3453,'epic',1);
+INSERT INTO "remix_tag" VALUES(3453,'metal',1);
+INSERT INTO "remix_tag" VALUES(3453,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3453,'piano',1);
+INSERT INTO "remix_tag" VALUES(3453,'strings',1);
+INSERT INTO "remix_tag" VALUES(3453,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3453,'synth',1);
+INSERT INTO "remix_tag" VALUES(3454,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3454,'chill',1);
+INSERT INTO "remix_tag" VALUES(3454,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3454,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3454,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3454,'rock',1);
+INSERT INTO "remix_tag" VALUES(3454,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3454,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3455,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3455,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3455,'funky',1);
+INSERT INTO "remix_tag" VALUES(3455,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3455,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3455,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3455,'rock',1);
+INSERT INTO "remix_tag" VALUES(3455,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3455,'synth',1);
+INSERT INTO "remix_tag" VALUES(3456,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3456,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3456,'country',1);
+INSERT INTO "remix_tag" VALUES(3456,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3456,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3456,'piano',1);
+INSERT INTO "remix_tag" VALUES(3456,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3456,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3456,'violin',1);
+INSERT INTO "remix_tag" VALUES(3456,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3457,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3457,'chill',1);
+INSERT INTO "remix_tag" VALUES(3457,'choir',1);
+INSERT INTO "remix_tag" VALUES(3457,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3457,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3457,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3457,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3457,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3457,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3457,'synth',1);
+INSERT INTO "remix_tag" VALUES(3458,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3458,'chill',1);
+INSERT INTO "remix_tag" VALUES(3458,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3458,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3458,'latin',1);
+INSERT INTO "remix_tag" VALUES(3458,'piano',1);
+INSERT INTO "remix_tag" VALUES(3458,'swing',1);
+INSERT INTO "remix_tag" VALUES(3459,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3459,'compo',1);
+INSERT INTO "remix_tag" VALUES(3459,'edm',1);
+INSERT INTO "remix_tag" VALUES(3459,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3459,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3459,'funk',1);
+INSERT INTO "remix_tag" VALUES(3459,'funky',1);
+INSERT INTO "remix_tag" VALUES(3459,'happy',1);
+INSERT INTO "remix_tag" VALUES(3459,'synth',1);
+INSERT INTO "remix_tag" VALUES(3460,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3460,'compo',1);
+INSERT INTO "remix_tag" VALUES(3460,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3460,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3460,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3460,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3460,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3460,'piano',1);
+INSERT INTO "remix_tag" VALUES(3460,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3460,'synth',1);
+INSERT INTO "remix_tag" VALUES(3461,'bells',1);
+INSERT INTO "remix_tag" VALUES(3461,'dark',1);
+INSERT INTO "remix_tag" VALUES(3461,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3461,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3461,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3461,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3461,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3461,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3461,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3461,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3461,'synth',1);
+INSERT INTO "remix_tag" VALUES(3461,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3462,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3462,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3462,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3462,'happy',1);
+INSERT INTO "remix_tag" VALUES(3462,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3462,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3462,'synth',1);
+INSERT INTO "remix_tag" VALUES(3462,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3463,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3463,'edm',1);
+INSERT INTO "remix_tag" VALUES(3463,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3463,'funky',1);
+INSERT INTO "remix_tag" VALUES(3463,'happy',1);
+INSERT INTO "remix_tag" VALUES(3463,'pop',1);
+INSERT INTO "remix_tag" VALUES(3463,'synth',1);
+INSERT INTO "remix_tag" VALUES(3463,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3464,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3464,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3464,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3464,'singing',1);
+INSERT INTO "remix_tag" VALUES(3464,'synth',1);
+INSERT INTO "remix_tag" VALUES(3464,'trance',1);
+INSERT INTO "remix_tag" VALUES(3464,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3465,'compo',1);
+INSERT INTO "remix_tag" VALUES(3465,'edm',1);
+INSERT INTO "remix_tag" VALUES(3465,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3465,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3465,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3465,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3465,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3465,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3466,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(3466,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3466,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3466,'funk',1);
+INSERT INTO "remix_tag" VALUES(3466,'funky',1);
+INSERT INTO "remix_tag" VALUES(3466,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3466,'organ',1);
+INSERT INTO "remix_tag" VALUES(3466,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3466,'violin',1);
+INSERT INTO "remix_tag" VALUES(3467,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3467,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3467,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3467,'funky',1);
+INSERT INTO "remix_tag" VALUES(3467,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3467,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3467,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3467,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3467,'rock',1);
+INSERT INTO "remix_tag" VALUES(3467,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3468,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3468,'collab',1);
+INSERT INTO "remix_tag" VALUES(3468,'folk',1);
+INSERT INTO "remix_tag" VALUES(3468,'lang-esperanto',1);
+INSERT INTO "remix_tag" VALUES(3468,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3468,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3468,'piano',1);
+INSERT INTO "remix_tag" VALUES(3468,'singing',1);
+INSERT INTO "remix_tag" VALUES(3468,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3468,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3468,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3469,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3469,'harp',1);
+INSERT INTO "remix_tag" VALUES(3469,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(3469,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3469,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3469,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3469,'strings',1);
+INSERT INTO "remix_tag" VALUES(3469,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3470,'chill',1);
+INSERT INTO "remix_tag" VALUES(3470,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3470,'edm',1);
+INSERT INTO "remix_tag" VALUES(3470,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3470,'electro',1);
+INSERT INTO "remix_tag" VALUES(3470,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3470,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3470,'funk',1);
+INSERT INTO "remix_tag" VALUES(3470,'funky',1);
+INSERT INTO "remix_tag" VALUES(3470,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3470,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3470,'synth',1);
+INSERT INTO "remix_tag" VALUES(3471,'bells',1);
+INSERT INTO "remix_tag" VALUES(3471,'chill',1);
+INSERT INTO "remix_tag" VALUES(3471,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3471,'edm',1);
+INSERT INTO "remix_tag" VALUES(3471,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3471,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3471,'funky',1);
+INSERT INTO "remix_tag" VALUES(3471,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3471,'synth',1);
+INSERT INTO "remix_tag" VALUES(3472,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3472,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3472,'flute',1);
+INSERT INTO "remix_tag" VALUES(3472,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3472,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3472,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3472,'pop',1);
+INSERT INTO "remix_tag" VALUES(3472,'synth',1);
+INSERT INTO "remix_tag" VALUES(3472,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3473,'bells',1);
+INSERT INTO "remix_tag" VALUES(3473,'dark',1);
+INSERT INTO "remix_tag" VALUES(3473,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3473,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3473,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3473,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3473,'piano',1);
+INSERT INTO "remix_tag" VALUES(3473,'synth',1);
+INSERT INTO "remix_tag" VALUES(3473,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3474,'edm',1);
+INSERT INTO "remix_tag" VALUES(3474,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3474,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3474,'happy',1);
+INSERT INTO "remix_tag" VALUES(3474,'pop',1);
+INSERT INTO "remix_tag" VALUES(3474,'synth',1);
+INSERT INTO "remix_tag" VALUES(3475,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3475,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3475,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3475,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3475,'synth',1);
+INSERT INTO "remix_tag" VALUES(3475,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3476,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3476,'edm',1);
+INSERT INTO "remix_tag" VALUES(3476,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3476,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3476,'synth',1);
+INSERT INTO "remix_tag" VALUES(3476,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3477,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3477,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3477,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3477,'epic',1);
+INSERT INTO "remix_tag" VALUES(3477,'folk',1);
+INSERT INTO "remix_tag" VALUES(3477,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3477,'rock-opera',1);
+INSERT INTO "remix_tag" VALUES(3477,'singing',1);
+INSERT INTO "remix_tag" VALUES(3477,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3477,'strings',1);
+INSERT INTO "remix_tag" VALUES(3477,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3478,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3478,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3478,'harp',1);
+INSERT INTO "remix_tag" VALUES(3478,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3478,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3478,'piano',1);
+INSERT INTO "remix_tag" VALUES(3478,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3478,'trio',1);
+INSERT INTO "remix_tag" VALUES(3479,'brass',1);
+INSERT INTO "remix_tag" VALUES(3479,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3479,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3479,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3479,'funky',1);
+INSERT INTO "remix_tag" VALUES(3479,'happy',1);
+INSERT INTO "remix_tag" VALUES(3479,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3479,'synth',1);
+INSERT INTO "remix_tag" VALUES(3480,'brass',1);
+INSERT INTO "remix_tag" VALUES(3480,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3480,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3480,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3480,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3480,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3480,'piano',1);
+INSERT INTO "remix_tag" VALUES(3480,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3481,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3481,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3481,'classical',1);
+INSERT INTO "remix_tag" VALUES(3481,'dark',1);
+INSERT INTO "remix_tag" VALUES(3481,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3481,'piano',1);
+INSERT INTO "remix_tag" VALUES(3481,'rock',1);
+INSERT INTO "remix_tag" VALUES(3481,'strings',1);
+INSERT INTO "remix_tag" VALUES(3481,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3482,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3482,'choir',1);
+INSERT INTO "remix_tag" VALUES(3482,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3482,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3482,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3482,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3482,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3482,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3482,'piano',1);
+INSERT INTO "remix_tag" VALUES(3483,'chill',1);
+INSERT INTO "remix_tag" VALUES(3483,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3483,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3483,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3483,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3483,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3484,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3484,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3484,'classical',1);
+INSERT INTO "remix_tag" VALUES(3484,'flute',1);
+INSERT INTO "remix_tag" VALUES(3484,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3484,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3484,'piano',1);
+INSERT INTO "remix_tag" VALUES(3484,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3484,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3484,'strings',1);
+INSERT INTO "remix_tag" VALUES(3484,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3485,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3485,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3485,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3485,'medley',1);
+INSERT INTO "remix_tag" VALUES(3485,'metal',1);
+INSERT INTO "remix_tag" VALUES(3486,'compo',1);
+INSERT INTO "remix_tag" VALUES(3486,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3486,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3486,'rock',1);
+INSERT INTO "remix_tag" VALUES(3486,'synth',1);
+INSERT INTO "remix_tag" VALUES(3486,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3486,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3487,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3487,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3487,'edm',1);
+INSERT INTO "remix_tag" VALUES(3487,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3487,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3487,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3487,'happy',1);
+INSERT INTO "remix_tag" VALUES(3487,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3487,'synth',1);
+INSERT INTO "remix_tag" VALUES(3487,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3488,'brass',1);
+INSERT INTO "remix_tag" VALUES(3488,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3488,'organ',1);
+INSERT INTO "remix_tag" VALUES(3488,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3488,'synth',1);
+INSERT INTO "remix_tag" VALUES(3489,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3489,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3489,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(3489,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3489,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3489,'piano',1);
+INSERT INTO "remix_tag" VALUES(3489,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3489,'strings',1);
+INSERT INTO "remix_tag" VALUES(3489,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3490,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3490,'dark',1);
+INSERT INTO "remix_tag" VALUES(3490,'edm',1);
+INSERT INTO "remix_tag" VALUES(3490,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3490,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3490,'synth',1);
+INSERT INTO "remix_tag" VALUES(3490,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3491,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3491,'funk',1);
+INSERT INTO "remix_tag" VALUES(3491,'funky',1);
+INSERT INTO "remix_tag" VALUES(3491,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3491,'happy',1);
+INSERT INTO "remix_tag" VALUES(3491,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3491,'synth',1);
+INSERT INTO "remix_tag" VALUES(3491,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3491,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3491,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3492,'bells',1);
+INSERT INTO "remix_tag" VALUES(3492,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3492,'collab',1);
+INSERT INTO "remix_tag" VALUES(3492,'dark',1);
+INSERT INTO "remix_tag" VALUES(3492,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3492,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3492,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3492,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3492,'strings',1);
+INSERT INTO "remix_tag" VALUES(3492,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3492,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3492,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3493,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3493,'bells',1);
+INSERT INTO "remix_tag" VALUES(3493,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3493,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3493,'dark',1);
+INSERT INTO "remix_tag" VALUES(3493,'flute',1);
+INSERT INTO "remix_tag" VALUES(3493,'strings',1);
+INSERT INTO "remix_tag" VALUES(3493,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3493,'synth',1);
+INSERT INTO "remix_tag" VALUES(3494,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3494,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3494,'epic',1);
+INSERT INTO "remix_tag" VALUES(3494,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3494,'piano',1);
+INSERT INTO "remix_tag" VALUES(3494,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3494,'strings',1);
+INSERT INTO "remix_tag" VALUES(3494,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3494,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3494,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3495,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3495,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3495,'edm',1);
+INSERT INTO "remix_tag" VALUES(3495,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3495,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3495,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3495,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3495,'synth',1);
+INSERT INTO "remix_tag" VALUES(3496,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3496,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3496,'metal',1);
+INSERT INTO "remix_tag" VALUES(3496,'rock',1);
+INSERT INTO "remix_tag" VALUES(3497,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3497,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3497,'edm',1);
+INSERT INTO "remix_tag" VALUES(3497,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3497,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3497,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3497,'synth',1);
+INSERT INTO "remix_tag" VALUES(3498,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3498,'bells',1);
+INSERT INTO "remix_tag" VALUES(3498,'brass',1);
+INSERT INTO "remix_tag" VALUES(3498,'flute',1);
+INSERT INTO "remix_tag" VALUES(3498,'harp',1);
+INSERT INTO "remix_tag" VALUES(3498,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3498,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3498,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3498,'singing',1);
+INSERT INTO "remix_tag" VALUES(3498,'strings',1);
+INSERT INTO "remix_tag" VALUES(3498,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3498,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3498,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3498,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3498,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3499,'edm',1);
+INSERT INTO "remix_tag" VALUES(3499,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3499,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3499,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3499,'funky',1);
+INSERT INTO "remix_tag" VALUES(3499,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3499,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3499,'organ',1);
+INSERT INTO "remix_tag" VALUES(3499,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3499,'synth',1);
+INSERT INTO "remix_tag" VALUES(3500,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3500,'brass',1);
+INSERT INTO "remix_tag" VALUES(3500,'choir',1);
+INSERT INTO "remix_tag" VALUES(3500,'dark',1);
+INSERT INTO "remix_tag" VALUES(3500,'flute',1);
+INSERT INTO "remix_tag" VALUES(3500,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3500,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3500,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3500,'strings',1);
+INSERT INTO "remix_tag" VALUES(3500,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3500,'trap',1);
+INSERT INTO "remix_tag" VALUES(3500,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3501,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3501,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3501,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3501,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3501,'pop',1);
+INSERT INTO "remix_tag" VALUES(3501,'rock',1);
+INSERT INTO "remix_tag" VALUES(3501,'singing',1);
+INSERT INTO "remix_tag" VALUES(3501,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3502,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3502,'chill',1);
+INSERT INTO "remix_tag" VALUES(3502,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3502,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3502,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3502,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3503,'chill',1);
+INSERT INTO "remix_tag" VALUES(3503,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3503,'flute',1);
+INSERT INTO "remix_tag" VALUES(3503,'folk',1);
+INSERT INTO "remix_tag" VALUES(3503,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3503,'harp',1);
+INSERT INTO "remix_tag" VALUES(3503,'medley',1);
+INSERT INTO "remix_tag" VALUES(3503,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3503,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3503,'strings',1);
+INSERT INTO "remix_tag" VALUES(3503,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3504,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3504,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3504,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3504,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3504,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3504,'synth',1);
+INSERT INTO "remix_tag" VALUES(3505,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3505,'angry',1);
+INSERT INTO "remix_tag" VALUES(3505,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3505,'metal',1);
+INSERT INTO "remix_tag" VALUES(3505,'synth',1);
+INSERT INTO "remix_tag" VALUES(3505,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3506,'dark',1);
+INSERT INTO "remix_tag" VALUES(3506,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3506,'edm',1);
+INSERT INTO "remix_tag" VALUES(3506,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3506,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3506,'piano',1);
+INSERT INTO "remix_tag" VALUES(3506,'synth',1);
+INSERT INTO "remix_tag" VALUES(3507,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3507,'dark',1);
+INSERT INTO "remix_tag" VALUES(3507,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3507,'koto',1);
+INSERT INTO "remix_tag" VALUES(3507,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3507,'synth',1);
+INSERT INTO "remix_tag" VALUES(3508,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3508,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3508,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3508,'metal',1);
+INSERT INTO "remix_tag" VALUES(3508,'punk',1);
+INSERT INTO "remix_tag" VALUES(3508,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3509,'choir',1);
+INSERT INTO "remix_tag" VALUES(3509,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3509,'dark',1);
+INSERT INTO "remix_tag" VALUES(3509,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3509,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3509,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3509,'strings',1);
+INSERT INTO "remix_tag" VALUES(3509,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3509,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3509,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3509,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3510,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3510,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3510,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3510,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3510,'folk',1);
+INSERT INTO "remix_tag" VALUES(3510,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3510,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3511,'chill',1);
+INSERT INTO "remix_tag" VALUES(3511,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3511,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3511,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3511,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3511,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3511,'funky',1);
+INSERT INTO "remix_tag" VALUES(3511,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3511,'synth',1);
+INSERT INTO "remix_tag" VALUES(3511,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3511,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3512,'dark',1);
+INSERT INTO "remix_tag" VALUES(3512,'edm',1);
+INSERT INTO "remix_tag" VALUES(3512,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3512,'funky',1);
+INSERT INTO "remix_tag" VALUES(3512,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3512,'strings',1);
+INSERT INTO "remix_tag" VALUES(3512,'synth',1);
+INSERT INTO "remix_tag" VALUES(3513,'brass',1);
+INSERT INTO "remix_tag" VALUES(3513,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3513,'epic',1);
+INSERT INTO "remix_tag" VALUES(3513,'medley',1);
+INSERT INTO "remix_tag" VALUES(3513,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3513,'strings',1);
+INSERT INTO "remix_tag" VALUES(3513,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3513,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3514,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3514,'angry',1);
+INSERT INTO "remix_tag" VALUES(3514,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3514,'metal',1);
+INSERT INTO "remix_tag" VALUES(3514,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3514,'synth',1);
+INSERT INTO "remix_tag" VALUES(3515,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3515,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3515,'folk',1);
+INSERT INTO "remix_tag" VALUES(3515,'harp',1);
+INSERT INTO "remix_tag" VALUES(3515,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3515,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3515,'strings',1);
+INSERT INTO "remix_tag" VALUES(3515,'violin',1);
+INSERT INTO "remix_tag" VALUES(3516,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3516,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3516,'chill',1);
+INSERT INTO "remix_tag" VALUES(3516,'folk',1);
+INSERT INTO "remix_tag" VALUES(3516,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3516,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3516,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3517,'brass',1);
+INSERT INTO "remix_tag" VALUES(3517,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3517,'flute',1);
+INSERT INTO "remix_tag" VALUES(3517,'funk',1);
+INSERT INTO "remix_tag" VALUES(3517,'funky',1);
+INSERT INTO "remix_tag" VALUES(3517,'synth',1);
+INSERT INTO "remix_tag" VALUES(3518,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3518,'chill',1);
+INSERT INTO "remix_tag" VALUES(3518,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3518,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3518,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3518,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3518,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(3519,'brass',1);
+INSERT INTO "remix_tag" VALUES(3519,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3519,'dark',1);
+INSERT INTO "remix_tag" VALUES(3519,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3519,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3519,'strings',1);
+INSERT INTO "remix_tag" VALUES(3519,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3520,'chill',1);
+INSERT INTO "remix_tag" VALUES(3520,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3520,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3520,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3520,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3520,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3520,'piano',1);
+INSERT INTO "remix_tag" VALUES(3520,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3520,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3521,'compo',1);
+INSERT INTO "remix_tag" VALUES(3521,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3521,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3521,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3521,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3521,'synth',1);
+INSERT INTO "remix_tag" VALUES(3521,'trap',1);
+INSERT INTO "remix_tag" VALUES(3521,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3521,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3522,'brass',1);
+INSERT INTO "remix_tag" VALUES(3522,'choir',1);
+INSERT INTO "remix_tag" VALUES(3522,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3522,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3522,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3522,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3522,'epic',1);
+INSERT INTO "remix_tag" VALUES(3522,'medley',1);
+INSERT INTO "remix_tag" VALUES(3522,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3522,'piano',1);
+INSERT INTO "remix_tag" VALUES(3522,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3522,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3522,'strings',1);
+INSERT INTO "remix_tag" VALUES(3522,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3522,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3522,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3523,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3523,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3523,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3523,'rock',1);
+INSERT INTO "remix_tag" VALUES(3523,'surf',1);
+INSERT INTO "remix_tag" VALUES(3524,'chill',1);
+INSERT INTO "remix_tag" VALUES(3524,'collab',1);
+INSERT INTO "remix_tag" VALUES(3524,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3524,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3524,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3524,'funk',1);
+INSERT INTO "remix_tag" VALUES(3524,'happy',1);
+INSERT INTO "remix_tag" VALUES(3524,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3524,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3524,'pop',1);
+INSERT INTO "remix_tag" VALUES(3524,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3524,'synth',1);
+INSERT INTO "remix_tag" VALUES(3524,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3525,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3525,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3525,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3525,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3525,'pop',1);
+INSERT INTO "remix_tag" VALUES(3525,'rock',1);
+INSERT INTO "remix_tag" VALUES(3525,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3525,'singing',1);
+INSERT INTO "remix_tag" VALUES(3525,'violin',1);
+INSERT INTO "remix_tag" VALUES(3525,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3526,'brass',1);
+INSERT INTO "remix_tag" VALUES(3526,'epic',1);
+INSERT INTO "remix_tag" VALUES(3526,'flute',1);
+INSERT INTO "remix_tag" VALUES(3526,'happy',1);
+INSERT INTO "remix_tag" VALUES(3526,'harp',1);
+INSERT INTO "remix_tag" VALUES(3526,'march',1);
+INSERT INTO "remix_tag" VALUES(3526,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3526,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3526,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3526,'strings',1);
+INSERT INTO "remix_tag" VALUES(3526,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3526,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3527,'classical',1);
+INSERT INTO "remix_tag" VALUES(3527,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3527,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3527,'piano',1);
+INSERT INTO "remix_tag" VALUES(3527,'solo',1);
+INSERT INTO "remix_tag" VALUES(3527,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3528,'bells',1);
+INSERT INTO "remix_tag" VALUES(3528,'classical',1);
+INSERT INTO "remix_tag" VALUES(3528,'dark',1);
+INSERT INTO "remix_tag" VALUES(3528,'flute',1);
+INSERT INTO "remix_tag" VALUES(3528,'harp',1);
+INSERT INTO "remix_tag" VALUES(3528,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3528,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3528,'strings',1);
+INSERT INTO "remix_tag" VALUES(3528,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3528,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3529,'collab',1);
+INSERT INTO "remix_tag" VALUES(3529,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3529,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3529,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3529,'funky',1);
+INSERT INTO "remix_tag" VALUES(3529,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3529,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3529,'pop',1);
+INSERT INTO "remix_tag" VALUES(3529,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3529,'sexy',1);
+INSERT INTO "remix_tag" VALUES(3529,'singing',1);
+INSERT INTO "remix_tag" VALUES(3529,'synth',1);
+INSERT INTO "remix_tag" VALUES(3529,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3529,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3530,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3530,'choir',1);
+INSERT INTO "remix_tag" VALUES(3530,'edm',1);
+INSERT INTO "remix_tag" VALUES(3530,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3530,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3530,'folk',1);
+INSERT INTO "remix_tag" VALUES(3530,'happy',1);
+INSERT INTO "remix_tag" VALUES(3530,'piano',1);
+INSERT INTO "remix_tag" VALUES(3530,'synth',1);
+INSERT INTO "remix_tag" VALUES(3530,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3531,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3531,'bells',1);
+INSERT INTO "remix_tag" VALUES(3531,'chill',1);
+INSERT INTO "remix_tag" VALUES(3531,'choir',1);
+INSERT INTO "remix_tag" VALUES(3531,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3531,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3531,'harp',1);
+INSERT INTO "remix_tag" VALUES(3531,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3531,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3531,'piano',1);
+INSERT INTO "remix_tag" VALUES(3531,'strings',1);
+INSERT INTO "remix_tag" VALUES(3531,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3531,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3532,'bells',1);
+INSERT INTO "remix_tag" VALUES(3532,'chill',1);
+INSERT INTO "remix_tag" VALUES(3532,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3532,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3532,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3532,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3532,'singing',1);
+INSERT INTO "remix_tag" VALUES(3532,'strings',1);
+INSERT INTO "remix_tag" VALUES(3532,'trap',1);
+INSERT INTO "remix_tag" VALUES(3532,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3532,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3533,'collab',1);
+INSERT INTO "remix_tag" VALUES(3533,'compo',1);
+INSERT INTO "remix_tag" VALUES(3533,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3533,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3533,'koto',1);
+INSERT INTO "remix_tag" VALUES(3533,'pop',1);
+INSERT INTO "remix_tag" VALUES(3533,'rock',1);
+INSERT INTO "remix_tag" VALUES(3533,'synth',1);
+INSERT INTO "remix_tag" VALUES(3534,'classical',1);
+INSERT INTO "remix_tag" VALUES(3534,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3534,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3534,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3534,'piano',1);
+INSERT INTO "remix_tag" VALUES(3534,'pop',1);
+INSERT INTO "remix_tag" VALUES(3534,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3534,'solo',1);
+INSERT INTO "remix_tag" VALUES(3534,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3535,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3535,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3535,'collab',1);
+INSERT INTO "remix_tag" VALUES(3535,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3535,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3535,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3535,'piano',1);
+INSERT INTO "remix_tag" VALUES(3535,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3535,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3535,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3536,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3536,'dark',1);
+INSERT INTO "remix_tag" VALUES(3536,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3536,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3536,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3536,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3536,'metal',1);
+INSERT INTO "remix_tag" VALUES(3536,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3537,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3537,'chill',1);
+INSERT INTO "remix_tag" VALUES(3537,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3537,'funk',1);
+INSERT INTO "remix_tag" VALUES(3537,'funky',1);
+INSERT INTO "remix_tag" VALUES(3537,'rock',1);
+INSERT INTO "remix_tag" VALUES(3537,'sexy',1);
+INSERT INTO "remix_tag" VALUES(3537,'synth',1);
+INSERT INTO "remix_tag" VALUES(3538,'brass',1);
+INSERT INTO "remix_tag" VALUES(3538,'chill',1);
+INSERT INTO "remix_tag" VALUES(3538,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3538,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3538,'funky',1);
+INSERT INTO "remix_tag" VALUES(3538,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3538,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3538,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3538,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3538,'sexy',1);
+INSERT INTO "remix_tag" VALUES(3538,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3539,'classical',1);
+INSERT INTO "remix_tag" VALUES(3539,'dark',1);
+INSERT INTO "remix_tag" VALUES(3539,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3539,'piano',1);
+INSERT INTO "remix_tag" VALUES(3539,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3539,'solo',1);
+INSERT INTO "remix_tag" VALUES(3539,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3539,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3540,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3540,'choir',1);
+INSERT INTO "remix_tag" VALUES(3540,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3540,'collab',1);
+INSERT INTO "remix_tag" VALUES(3540,'dark',1);
+INSERT INTO "remix_tag" VALUES(3540,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3540,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3540,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3540,'metal',1);
+INSERT INTO "remix_tag" VALUES(3540,'organ',1);
+INSERT INTO "remix_tag" VALUES(3540,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3540,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3540,'violin',1);
+INSERT INTO "remix_tag" VALUES(3541,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3541,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3541,'bells',1);
+INSERT INTO "remix_tag" VALUES(3541,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3541,'collab',1);
+INSERT INTO "remix_tag" VALUES(3541,'flute',1);
+INSERT INTO "remix_tag" VALUES(3541,'folk',1);
+INSERT INTO "remix_tag" VALUES(3541,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3541,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3541,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3541,'piano',1);
+INSERT INTO "remix_tag" VALUES(3541,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3541,'singing',1);
+INSERT INTO "remix_tag" VALUES(3541,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3541,'violin',1);
+INSERT INTO "remix_tag" VALUES(3541,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3541,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3542,'dark',1);
+INSERT INTO "remix_tag" VALUES(3542,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3542,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3542,'funky',1);
+INSERT INTO "remix_tag" VALUES(3542,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3542,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3542,'synth',1);
+INSERT INTO "remix_tag" VALUES(3542,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3543,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3543,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3543,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3543,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3543,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3543,'medley',1);
+INSERT INTO "remix_tag" VALUES(3543,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3543,'synth',1);
+INSERT INTO "remix_tag" VALUES(3543,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3544,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3544,'edm',1);
+INSERT INTO "remix_tag" VALUES(3544,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3544,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3544,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3544,'medley',1);
+INSERT INTO "remix_tag" VALUES(3544,'organ',1);
+INSERT INTO "remix_tag" VALUES(3544,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3544,'synth',1);
+INSERT INTO "remix_tag" VALUES(3544,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3545,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3545,'compo',1);
+INSERT INTO "remix_tag" VALUES(3545,'edm',1);
+INSERT INTO "remix_tag" VALUES(3545,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3545,'funky',1);
+INSERT INTO "remix_tag" VALUES(3545,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3545,'medley',1);
+INSERT INTO "remix_tag" VALUES(3545,'organ',1);
+INSERT INTO "remix_tag" VALUES(3545,'synth',1);
+INSERT INTO "remix_tag" VALUES(3546,'brass',1);
+INSERT INTO "remix_tag" VALUES(3546,'choir',1);
+INSERT INTO "remix_tag" VALUES(3546,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3546,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3546,'epic',1);
+INSERT INTO "remix_tag" VALUES(3546,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3546,'piano',1);
+INSERT INTO "remix_tag" VALUES(3546,'strings',1);
+INSERT INTO "remix_tag" VALUES(3546,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3546,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3547,'edm',1);
+INSERT INTO "remix_tag" VALUES(3547,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3547,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3547,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3547,'rock',1);
+INSERT INTO "remix_tag" VALUES(3547,'synth',1);
+INSERT INTO "remix_tag" VALUES(3547,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3547,'workout',1);
+INSERT INTO "remix_tag" VALUES(3548,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3548,'collab',1);
+INSERT INTO "remix_tag" VALUES(3548,'dark',1);
+INSERT INTO "remix_tag" VALUES(3548,'flute',1);
+INSERT INTO "remix_tag" VALUES(3548,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3548,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3548,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3548,'piano',1);
+INSERT INTO "remix_tag" VALUES(3548,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3548,'strings',1);
+INSERT INTO "remix_tag" VALUES(3548,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3548,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3549,'edm',1);
+INSERT INTO "remix_tag" VALUES(3549,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3549,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3549,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3549,'singing',1);
+INSERT INTO "remix_tag" VALUES(3549,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3549,'synth',1);
+INSERT INTO "remix_tag" VALUES(3549,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3549,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3549,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3549,'workout',1);
+INSERT INTO "remix_tag" VALUES(3550,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3550,'bells',1);
+INSERT INTO "remix_tag" VALUES(3550,'dark',1);
+INSERT INTO "remix_tag" VALUES(3550,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3550,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3550,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3550,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3550,'rock',1);
+INSERT INTO "remix_tag" VALUES(3550,'strings',1);
+INSERT INTO "remix_tag" VALUES(3551,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3551,'bells',1);
+INSERT INTO "remix_tag" VALUES(3551,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3551,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3551,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3551,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3551,'piano',1);
+INSERT INTO "remix_tag" VALUES(3551,'rock',1);
+INSERT INTO "remix_tag" VALUES(3551,'synth',1);
+INSERT INTO "remix_tag" VALUES(3552,'classical',1);
+INSERT INTO "remix_tag" VALUES(3552,'dark',1);
+INSERT INTO "remix_tag" VALUES(3552,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3552,'piano',1);
+INSERT INTO "remix_tag" VALUES(3552,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3552,'strings',1);
+INSERT INTO "remix_tag" VALUES(3552,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3553,'choir',1);
+INSERT INTO "remix_tag" VALUES(3553,'epic',1);
+INSERT INTO "remix_tag" VALUES(3553,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3553,'organ',1);
+INSERT INTO "remix_tag" VALUES(3553,'strings',1);
+INSERT INTO "remix_tag" VALUES(3553,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3553,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3554,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3554,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3554,'dark',1);
+INSERT INTO "remix_tag" VALUES(3554,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3554,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3554,'metal',1);
+INSERT INTO "remix_tag" VALUES(3554,'piano',1);
+INSERT INTO "remix_tag" VALUES(3554,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3555,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3555,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3555,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3555,'metal',1);
+INSERT INTO "remix_tag" VALUES(3555,'rock',1);
+INSERT INTO "remix_tag" VALUES(3555,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3556,'choir',1);
+INSERT INTO "remix_tag" VALUES(3556,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3556,'epic',1);
+INSERT INTO "remix_tag" VALUES(3556,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3556,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3556,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3556,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3556,'piano',1);
+INSERT INTO "remix_tag" VALUES(3556,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3556,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3557,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3557,'cello',1);
+INSERT INTO "remix_tag" VALUES(3557,'harp',1);
+INSERT INTO "remix_tag" VALUES(3557,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3557,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3557,'native-american',1);
+INSERT INTO "remix_tag" VALUES(3557,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3557,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3557,'piano',1);
+INSERT INTO "remix_tag" VALUES(3557,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3557,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3558,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3558,'bells',1);
+INSERT INTO "remix_tag" VALUES(3558,'brass',1);
+INSERT INTO "remix_tag" VALUES(3558,'chill',1);
+INSERT INTO "remix_tag" VALUES(3558,'flute',1);
+INSERT INTO "remix_tag" VALUES(3558,'harp',1);
+INSERT INTO "remix_tag" VALUES(3558,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3558,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3558,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3558,'piano',1);
+INSERT INTO "remix_tag" VALUES(3558,'strings',1);
+INSERT INTO "remix_tag" VALUES(3558,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3558,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3558,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3559,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3559,'chill',1);
+INSERT INTO "remix_tag" VALUES(3559,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3559,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3559,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3559,'piano',1);
+INSERT INTO "remix_tag" VALUES(3559,'synth',1);
+INSERT INTO "remix_tag" VALUES(3559,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3560,'bells',1);
+INSERT INTO "remix_tag" VALUES(3560,'classical',1);
+INSERT INTO "remix_tag" VALUES(3560,'harp',1);
+INSERT INTO "remix_tag" VALUES(3560,'medley',1);
+INSERT INTO "remix_tag" VALUES(3560,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3560,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3560,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3560,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3560,'strings',1);
+INSERT INTO "remix_tag" VALUES(3560,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3561,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3561,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3561,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3561,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3561,'pop',1);
+INSERT INTO "remix_tag" VALUES(3561,'rock',1);
+INSERT INTO "remix_tag" VALUES(3561,'singing',1);
+INSERT INTO "remix_tag" VALUES(3561,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3561,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3562,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3562,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3562,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3562,'rock',1);
+INSERT INTO "remix_tag" VALUES(3562,'synth',1);
+INSERT INTO "remix_tag" VALUES(3562,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3563,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3563,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3563,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3563,'funky',1);
+INSERT INTO "remix_tag" VALUES(3563,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3563,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3563,'synth',1);
+INSERT INTO "remix_tag" VALUES(3564,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3564,'chill',1);
+INSERT INTO "remix_tag" VALUES(3564,'dark',1);
+INSERT INTO "remix_tag" VALUES(3564,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3564,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3564,'funky',1);
+INSERT INTO "remix_tag" VALUES(3564,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3564,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3564,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3564,'synth',1);
+INSERT INTO "remix_tag" VALUES(3564,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3565,'chill',1);
+INSERT INTO "remix_tag" VALUES(3565,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3565,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3565,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3565,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3565,'rock',1);
+INSERT INTO "remix_tag" VALUES(3565,'synth',1);
+INSERT INTO "remix_tag" VALUES(3566,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3566,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3566,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3566,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3566,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3566,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3566,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3566,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3566,'rock',1);
+INSERT INTO "remix_tag" VALUES(3566,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3567,'choir',1);
+INSERT INTO "remix_tag" VALUES(3567,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3567,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3567,'epic',1);
+INSERT INTO "remix_tag" VALUES(3567,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3567,'piano',1);
+INSERT INTO "remix_tag" VALUES(3567,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3567,'strings',1);
+INSERT INTO "remix_tag" VALUES(3567,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3567,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3568,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3568,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3568,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3568,'happy',1);
+INSERT INTO "remix_tag" VALUES(3568,'piano',1);
+INSERT INTO "remix_tag" VALUES(3568,'pop',1);
+INSERT INTO "remix_tag" VALUES(3568,'synth',1);
+INSERT INTO "remix_tag" VALUES(3569,'collab',1);
+INSERT INTO "remix_tag" VALUES(3569,'dark',1);
+INSERT INTO "remix_tag" VALUES(3569,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3569,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3569,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3569,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3569,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3569,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(3570,'chill',1);
+INSERT INTO "remix_tag" VALUES(3570,'choir',1);
+INSERT INTO "remix_tag" VALUES(3570,'classical',1);
+INSERT INTO "remix_tag" VALUES(3570,'folk',1);
+INSERT INTO "remix_tag" VALUES(3570,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3570,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3570,'strings',1);
+INSERT INTO "remix_tag" VALUES(3570,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3570,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3571,'bells',1);
+INSERT INTO "remix_tag" VALUES(3571,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3571,'classical',1);
+INSERT INTO "remix_tag" VALUES(3571,'flute',1);
+INSERT INTO "remix_tag" VALUES(3571,'folk',1);
+INSERT INTO "remix_tag" VALUES(3571,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3571,'happy',1);
+INSERT INTO "remix_tag" VALUES(3571,'harp',1);
+INSERT INTO "remix_tag" VALUES(3571,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3571,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3571,'strings',1);
+INSERT INTO "remix_tag" VALUES(3571,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3572,'classical',1);
+INSERT INTO "remix_tag" VALUES(3572,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3572,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3572,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3572,'piano',1);
+INSERT INTO "remix_tag" VALUES(3572,'solo',1);
+INSERT INTO "remix_tag" VALUES(3572,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3572,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3573,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3573,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3573,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(3573,'collab',1);
+INSERT INTO "remix_tag" VALUES(3573,'dance',1);
+INSERT INTO "remix_tag" VALUES(3573,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3573,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3573,'folk',1);
+INSERT INTO "remix_tag" VALUES(3573,'funk',1);
+INSERT INTO "remix_tag" VALUES(3573,'funky',1);
+INSERT INTO "remix_tag" VALUES(3573,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3573,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3573,'violin',1);
+INSERT INTO "remix_tag" VALUES(3573,'workout',1);
+INSERT INTO "remix_tag" VALUES(3574,'brass',1);
+INSERT INTO "remix_tag" VALUES(3574,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3574,'collab',1);
+INSERT INTO "remix_tag" VALUES(3574,'dark',1);
+INSERT INTO "remix_tag" VALUES(3574,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3574,'edm',1);
+INSERT INTO "remix_tag" VALUES(3574,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3574,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3574,'medley',1);
+INSERT INTO "remix_tag" VALUES(3574,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3574,'piano',1);
+INSERT INTO "remix_tag" VALUES(3574,'strings',1);
+INSERT INTO "remix_tag" VALUES(3574,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3575,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3575,'blues',1);
+INSERT INTO "remix_tag" VALUES(3575,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3575,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3575,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3575,'organ',1);
+INSERT INTO "remix_tag" VALUES(3575,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3575,'sexy',1);
+INSERT INTO "remix_tag" VALUES(3575,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3576,'brass',1);
+INSERT INTO "remix_tag" VALUES(3576,'choir',1);
+INSERT INTO "remix_tag" VALUES(3576,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3576,'collab',1);
+INSERT INTO "remix_tag" VALUES(3576,'dark',1);
+INSERT INTO "remix_tag" VALUES(3576,'epic',1);
+INSERT INTO "remix_tag" VALUES(3576,'piano',1);
+INSERT INTO "remix_tag" VALUES(3576,'strings',1);
+INSERT INTO "remix_tag" VALUES(3576,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3577,'edm',1);
+INSERT INTO "remix_tag" VALUES(3577,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3577,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3577,'house',1);
+INSERT INTO "remix_tag" VALUES(3577,'synth',1);
+INSERT INTO "remix_tag" VALUES(3577,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3578,'edm',1);
+INSERT INTO "remix_tag" VALUES(3578,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3578,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3578,'rock',1);
+INSERT INTO "remix_tag" VALUES(3578,'synth',1);
+INSERT INTO "remix_tag" VALUES(3578,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3579,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3579,'collab',1);
+INSERT INTO "remix_tag" VALUES(3579,'folk',1);
+INSERT INTO "remix_tag" VALUES(3579,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3579,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3579,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3579,'trio',1);
+INSERT INTO "remix_tag" VALUES(3580,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3580,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3580,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3580,'chill',1);
+INSERT INTO "remix_tag" VALUES(3580,'folk',1);
+INSERT INTO "remix_tag" VALUES(3580,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3580,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3580,'piano',1);
+INSERT INTO "remix_tag" VALUES(3580,'rock',1);
+INSERT INTO "remix_tag" VALUES(3580,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3580,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3580,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3581,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3581,'collab',1);
+INSERT INTO "remix_tag" VALUES(3581,'dark',1);
+INSERT INTO "remix_tag" VALUES(3581,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3581,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3581,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3581,'metal',1);
+INSERT INTO "remix_tag" VALUES(3581,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3581,'synth',1);
+INSERT INTO "remix_tag" VALUES(3581,'violin',1);
+INSERT INTO "remix_tag" VALUES(3582,'dance',1);
+INSERT INTO "remix_tag" VALUES(3582,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3582,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3582,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3582,'pop',1);
+INSERT INTO "remix_tag" VALUES(3582,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3582,'synth',1);
+INSERT INTO "remix_tag" VALUES(3582,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3582,'workout',1);
+INSERT INTO "remix_tag" VALUES(3583,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3583,'edm',1);
+INSERT INTO "remix_tag" VALUES(3583,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3583,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3583,'happy',1);
+INSERT INTO "remix_tag" VALUES(3583,'synth',1);
+INSERT INTO "remix_tag" VALUES(3583,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3584,'chill',1);
+INSERT INTO "remix_tag" VALUES(3584,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3584,'dark',1);
+INSERT INTO "remix_tag" VALUES(3584,'edm',1);
+INSERT INTO "remix_tag" VALUES(3584,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3584,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3584,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3584,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3584,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3584,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3584,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3584,'trap',1);
+INSERT INTO "remix_tag" VALUES(3584,'violin',1);
+INSERT INTO "remix_tag" VALUES(3584,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3585,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3585,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3585,'happy',1);
+INSERT INTO "remix_tag" VALUES(3585,'rock',1);
+INSERT INTO "remix_tag" VALUES(3585,'strings',1);
+INSERT INTO "remix_tag" VALUES(3585,'synth',1);
+INSERT INTO "remix_tag" VALUES(3586,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3586,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3586,'epic',1);
+INSERT INTO "remix_tag" VALUES(3586,'funny',1);
+INSERT INTO "remix_tag" VALUES(3586,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3586,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3586,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3586,'pop',1);
+INSERT INTO "remix_tag" VALUES(3586,'rock',1);
+INSERT INTO "remix_tag" VALUES(3586,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3586,'singing',1);
+INSERT INTO "remix_tag" VALUES(3586,'strings',1);
+INSERT INTO "remix_tag" VALUES(3586,'synth',1);
+INSERT INTO "remix_tag" VALUES(3586,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3587,'brass',1);
+INSERT INTO "remix_tag" VALUES(3587,'choir',1);
+INSERT INTO "remix_tag" VALUES(3587,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3587,'epic',1);
+INSERT INTO "remix_tag" VALUES(3587,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3587,'strings',1);
+INSERT INTO "remix_tag" VALUES(3587,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3588,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3588,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3588,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3588,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3588,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3588,'metal',1);
+INSERT INTO "remix_tag" VALUES(3588,'organ',1);
+INSERT INTO "remix_tag" VALUES(3588,'rock',1);
+INSERT INTO "remix_tag" VALUES(3588,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3588,'synth',1);
+INSERT INTO "remix_tag" VALUES(3589,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3589,'edm',1);
+INSERT INTO "remix_tag" VALUES(3589,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3589,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3589,'funky',1);
+INSERT INTO "remix_tag" VALUES(3589,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3589,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3589,'workout',1);
+INSERT INTO "remix_tag" VALUES(3590,'chill',1);
+INSERT INTO "remix_tag" VALUES(3590,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3590,'collab',1);
+INSERT INTO "remix_tag" VALUES(3590,'flute',1);
+INSERT INTO "remix_tag" VALUES(3590,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3590,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3590,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3590,'strings',1);
+INSERT INTO "remix_tag" VALUES(3590,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3590,'violin',1);
+INSERT INTO "remix_tag" VALUES(3591,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3591,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3591,'collab',1);
+INSERT INTO "remix_tag" VALUES(3591,'dark',1);
+INSERT INTO "remix_tag" VALUES(3591,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3591,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3591,'piano',1);
+INSERT INTO "remix_tag" VALUES(3591,'rock',1);
+INSERT INTO "remix_tag" VALUES(3591,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3592,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3592,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3592,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3592,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3592,'rock',1);
+INSERT INTO "remix_tag" VALUES(3592,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3593,'edm',1);
+INSERT INTO "remix_tag" VALUES(3593,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3593,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3593,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3593,'house',1);
+INSERT INTO "remix_tag" VALUES(3593,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3593,'synth',1);
+INSERT INTO "remix_tag" VALUES(3594,'dark',1);
+INSERT INTO "remix_tag" VALUES(3594,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3594,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3594,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3594,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3594,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3594,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3594,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3594,'synth',1);
+INSERT INTO "remix_tag" VALUES(3594,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3595,'angry',1);
+INSERT INTO "remix_tag" VALUES(3595,'dark',1);
+INSERT INTO "remix_tag" VALUES(3595,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3595,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3595,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3595,'metal',1);
+INSERT INTO "remix_tag" VALUES(3596,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3596,'edm',1);
+INSERT INTO "remix_tag" VALUES(3596,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3596,'funky',1);
+INSERT INTO "remix_tag" VALUES(3596,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3596,'happy',1);
+INSERT INTO "remix_tag" VALUES(3596,'pop',1);
+INSERT INTO "remix_tag" VALUES(3596,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3596,'synth',1);
+INSERT INTO "remix_tag" VALUES(3597,'brass',1);
+INSERT INTO "remix_tag" VALUES(3597,'chill',1);
+INSERT INTO "remix_tag" VALUES(3597,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3597,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3597,'funny',1);
+INSERT INTO "remix_tag" VALUES(3597,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3597,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3597,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3597,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(3597,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3597,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3597,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3597,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3597,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3597,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3598,'bells',1);
+INSERT INTO "remix_tag" VALUES(3598,'choir',1);
+INSERT INTO "remix_tag" VALUES(3598,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3598,'dark',1);
+INSERT INTO "remix_tag" VALUES(3598,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3598,'piano',1);
+INSERT INTO "remix_tag" VALUES(3598,'strings',1);
+INSERT INTO "remix_tag" VALUES(3598,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3598,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3599,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3599,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3599,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3599,'bells',1);
+INSERT INTO "remix_tag" VALUES(3599,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3599,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3599,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3599,'epic',1);
+INSERT INTO "remix_tag" VALUES(3599,'folk',1);
+INSERT INTO "remix_tag" VALUES(3599,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3599,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(3599,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3599,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3599,'violin',1);
+INSERT INTO "remix_tag" VALUES(3600,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3600,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3600,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3600,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3600,'flute',1);
+INSERT INTO "remix_tag" VALUES(3600,'funny',1);
+INSERT INTO "remix_tag" VALUES(3600,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3600,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3600,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3600,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3600,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3600,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3600,'medley',1);
+INSERT INTO "remix_tag" VALUES(3600,'piano',1);
+INSERT INTO "remix_tag" VALUES(3600,'singing',1);
+INSERT INTO "remix_tag" VALUES(3600,'synth',1);
+INSERT INTO "remix_tag" VALUES(3600,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3600,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3600,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3600,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3600,'violin',1);
+INSERT INTO "remix_tag" VALUES(3600,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3600,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3601,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3601,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3601,'brass',1);
+INSERT INTO "remix_tag" VALUES(3601,'dark',1);
+INSERT INTO "remix_tag" VALUES(3601,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3601,'epic',1);
+INSERT INTO "remix_tag" VALUES(3601,'folk',1);
+INSERT INTO "remix_tag" VALUES(3601,'metal',1);
+INSERT INTO "remix_tag" VALUES(3601,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3601,'strings',1);
+INSERT INTO "remix_tag" VALUES(3601,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3601,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3602,'brass',1);
+INSERT INTO "remix_tag" VALUES(3602,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3602,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3602,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3602,'epic',1);
+INSERT INTO "remix_tag" VALUES(3602,'flute',1);
+INSERT INTO "remix_tag" VALUES(3602,'harp',1);
+INSERT INTO "remix_tag" VALUES(3602,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3602,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3602,'strings',1);
+INSERT INTO "remix_tag" VALUES(3602,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3602,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3603,'edm',1);
+INSERT INTO "remix_tag" VALUES(3603,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3603,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3603,'happy',1);
+INSERT INTO "remix_tag" VALUES(3603,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3603,'synth',1);
+INSERT INTO "remix_tag" VALUES(3603,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3603,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3604,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3604,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3604,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3604,'organ',1);
+INSERT INTO "remix_tag" VALUES(3604,'rock',1);
+INSERT INTO "remix_tag" VALUES(3604,'sad',1);
+INSERT INTO "remix_tag" VALUES(3604,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3604,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(3604,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3604,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3604,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3605,'brass',1);
+INSERT INTO "remix_tag" VALUES(3605,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3605,'harp',1);
+INSERT INTO "remix_tag" VALUES(3605,'march',1);
+INSERT INTO "remix_tag" VALUES(3605,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3605,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3605,'strings',1);
+INSERT INTO "remix_tag" VALUES(3605,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3605,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3605,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3606,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3606,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3606,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3606,'metal',1);
+INSERT INTO "remix_tag" VALUES(3606,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3606,'synth',1);
+INSERT INTO "remix_tag" VALUES(3606,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3607,'edm',1);
+INSERT INTO "remix_tag" VALUES(3607,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3607,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3607,'happy',1);
+INSERT INTO "remix_tag" VALUES(3607,'pop',1);
+INSERT INTO "remix_tag" VALUES(3607,'synth',1);
+INSERT INTO "remix_tag" VALUES(3607,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3608,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3608,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3608,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3608,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3608,'rock',1);
+INSERT INTO "remix_tag" VALUES(3608,'synth',1);
+INSERT INTO "remix_tag" VALUES(3608,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3608,'workout',1);
+INSERT INTO "remix_tag" VALUES(3609,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3609,'bells',1);
+INSERT INTO "remix_tag" VALUES(3609,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3609,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3609,'metal',1);
+INSERT INTO "remix_tag" VALUES(3609,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3609,'rock',1);
+INSERT INTO "remix_tag" VALUES(3609,'strings',1);
+INSERT INTO "remix_tag" VALUES(3609,'synth',1);
+INSERT INTO "remix_tag" VALUES(3610,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3610,'brass',1);
+INSERT INTO "remix_tag" VALUES(3610,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3610,'classical',1);
+INSERT INTO "remix_tag" VALUES(3610,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3610,'latin',1);
+INSERT INTO "remix_tag" VALUES(3610,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3610,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3610,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3610,'strings',1);
+INSERT INTO "remix_tag" VALUES(3610,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3610,'violin',1);
+INSERT INTO "remix_tag" VALUES(3611,'brass',1);
+INSERT INTO "remix_tag" VALUES(3611,'choir',1);
+INSERT INTO "remix_tag" VALUES(3611,'dark',1);
+INSERT INTO "remix_tag" VALUES(3611,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3611,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3611,'epic',1);
+INSERT INTO "remix_tag" VALUES(3611,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3611,'piano',1);
+INSERT INTO "remix_tag" VALUES(3611,'rock',1);
+INSERT INTO "remix_tag" VALUES(3611,'strings',1);
+INSERT INTO "remix_tag" VALUES(3611,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3612,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3612,'edm',1);
+INSERT INTO "remix_tag" VALUES(3612,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3612,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3612,'funky',1);
+INSERT INTO "remix_tag" VALUES(3612,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3612,'synth',1);
+INSERT INTO "remix_tag" VALUES(3612,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3612,'workout',1);
+INSERT INTO "remix_tag" VALUES(3613,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3613,'bells',1);
+INSERT INTO "remix_tag" VALUES(3613,'chill',1);
+INSERT INTO "remix_tag" VALUES(3613,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3613,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3613,'piano',1);
+INSERT INTO "remix_tag" VALUES(3613,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3613,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3613,'strings',1);
+INSERT INTO "remix_tag" VALUES(3613,'synth',1);
+INSERT INTO "remix_tag" VALUES(3613,'trap',1);
+INSERT INTO "remix_tag" VALUES(3614,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3614,'dub',1);
+INSERT INTO "remix_tag" VALUES(3614,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3614,'funky',1);
+INSERT INTO "remix_tag" VALUES(3614,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3614,'marimba',1);
+INSERT INTO "remix_tag" VALUES(3614,'organ',1);
+INSERT INTO "remix_tag" VALUES(3614,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3614,'synth',1);
+INSERT INTO "remix_tag" VALUES(3614,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3615,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3615,'dark',1);
+INSERT INTO "remix_tag" VALUES(3615,'dub',1);
+INSERT INTO "remix_tag" VALUES(3615,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3615,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3615,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3615,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3615,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3615,'synth',1);
+INSERT INTO "remix_tag" VALUES(3616,'chill',1);
+INSERT INTO "remix_tag" VALUES(3616,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3616,'edm',1);
+INSERT INTO "remix_tag" VALUES(3616,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3616,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3616,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3616,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3616,'synth',1);
+INSERT INTO "remix_tag" VALUES(3617,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3617,'chill',1);
+INSERT INTO "remix_tag" VALUES(3617,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3617,'collab',1);
+INSERT INTO "remix_tag" VALUES(3617,'edm',1);
+INSERT INTO "remix_tag" VALUES(3617,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3617,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3617,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3617,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3617,'synth',1);
+INSERT INTO "remix_tag" VALUES(3617,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3618,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3618,'edm',1);
+INSERT INTO "remix_tag" VALUES(3618,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3618,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3618,'happy',1);
+INSERT INTO "remix_tag" VALUES(3618,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3618,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3618,'synth',1);
+INSERT INTO "remix_tag" VALUES(3618,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3618,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3618,'turntable',1);
+INSERT INTO "remix_tag" VALUES(3618,'workout',1);
+INSERT INTO "remix_tag" VALUES(3619,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3619,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3619,'classical',1);
+INSERT INTO "remix_tag" VALUES(3619,'harp',1);
+INSERT INTO "remix_tag" VALUES(3619,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3619,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3619,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3619,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3619,'piano',1);
+INSERT INTO "remix_tag" VALUES(3619,'strings',1);
+INSERT INTO "remix_tag" VALUES(3619,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3620,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3620,'funk',1);
+INSERT INTO "remix_tag" VALUES(3620,'funky',1);
+INSERT INTO "remix_tag" VALUES(3620,'house',1);
+INSERT INTO "remix_tag" VALUES(3620,'organ',1);
+INSERT INTO "remix_tag" VALUES(3620,'piano',1);
+INSERT INTO "remix_tag" VALUES(3620,'synth',1);
+INSERT INTO "remix_tag" VALUES(3621,'choir',1);
+INSERT INTO "remix_tag" VALUES(3621,'classical',1);
+INSERT INTO "remix_tag" VALUES(3621,'harp',1);
+INSERT INTO "remix_tag" VALUES(3621,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3621,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3621,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3621,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3621,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3621,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3622,'compo',1);
+INSERT INTO "remix_tag" VALUES(3622,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3622,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3622,'funk',1);
+INSERT INTO "remix_tag" VALUES(3622,'funky',1);
+INSERT INTO "remix_tag" VALUES(3622,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3622,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3622,'synth',1);
+INSERT INTO "remix_tag" VALUES(3622,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3622,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3623,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3623,'brass',1);
+INSERT INTO "remix_tag" VALUES(3623,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3623,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3623,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3623,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3623,'piano',1);
+INSERT INTO "remix_tag" VALUES(3623,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3623,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3623,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3624,'brass',1);
+INSERT INTO "remix_tag" VALUES(3624,'cello',1);
+INSERT INTO "remix_tag" VALUES(3624,'choir',1);
+INSERT INTO "remix_tag" VALUES(3624,'dark',1);
+INSERT INTO "remix_tag" VALUES(3624,'epic',1);
+INSERT INTO "remix_tag" VALUES(3624,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3624,'organ',1);
+INSERT INTO "remix_tag" VALUES(3624,'piano',1);
+INSERT INTO "remix_tag" VALUES(3624,'strings',1);
+INSERT INTO "remix_tag" VALUES(3624,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3624,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3625,'collab',1);
+INSERT INTO "remix_tag" VALUES(3625,'edm',1);
+INSERT INTO "remix_tag" VALUES(3625,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3625,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3625,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3625,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3625,'synth',1);
+INSERT INTO "remix_tag" VALUES(3625,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3625,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3625,'workout',1);
+INSERT INTO "remix_tag" VALUES(3626,'chill',1);
+INSERT INTO "remix_tag" VALUES(3626,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3626,'edm',1);
+INSERT INTO "remix_tag" VALUES(3626,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3626,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3626,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3626,'synth',1);
+INSERT INTO "remix_tag" VALUES(3627,'classical',1);
+INSERT INTO "remix_tag" VALUES(3627,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3627,'happy',1);
+INSERT INTO "remix_tag" VALUES(3627,'piano',1);
+INSERT INTO "remix_tag" VALUES(3627,'pop',1);
+INSERT INTO "remix_tag" VALUES(3627,'solo',1);
+INSERT INTO "remix_tag" VALUES(3627,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3628,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3628,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3628,'chill',1);
+INSERT INTO "remix_tag" VALUES(3628,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3628,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3628,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3628,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3628,'piano',1);
+INSERT INTO "remix_tag" VALUES(3628,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3628,'synth',1);
+INSERT INTO "remix_tag" VALUES(3628,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3629,'dark',1);
+INSERT INTO "remix_tag" VALUES(3629,'edm',1);
+INSERT INTO "remix_tag" VALUES(3629,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3629,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3629,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3629,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3629,'piano',1);
+INSERT INTO "remix_tag" VALUES(3629,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3629,'strings',1);
+INSERT INTO "remix_tag" VALUES(3629,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3629,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3629,'synth',1);
+INSERT INTO "remix_tag" VALUES(3630,'choir',1);
+INSERT INTO "remix_tag" VALUES(3630,'dark',1);
+INSERT INTO "remix_tag" VALUES(3630,'edm',1);
+INSERT INTO "remix_tag" VALUES(3630,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3630,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3630,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3630,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3630,'piano',1);
+INSERT INTO "remix_tag" VALUES(3630,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3630,'strings',1);
+INSERT INTO "remix_tag" VALUES(3630,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3630,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3630,'synth',1);
+INSERT INTO "remix_tag" VALUES(3631,'flute',1);
+INSERT INTO "remix_tag" VALUES(3631,'happy',1);
+INSERT INTO "remix_tag" VALUES(3631,'harp',1);
+INSERT INTO "remix_tag" VALUES(3631,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3631,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3631,'strings',1);
+INSERT INTO "remix_tag" VALUES(3631,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3631,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3632,'edm',1);
+INSERT INTO "remix_tag" VALUES(3632,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3632,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3632,'funky',1);
+INSERT INTO "remix_tag" VALUES(3632,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3632,'happy',1);
+INSERT INTO "remix_tag" VALUES(3632,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3632,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3632,'synth',1);
+INSERT INTO "remix_tag" VALUES(3632,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3633,'edm',1);
+INSERT INTO "remix_tag" VALUES(3633,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3633,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3633,'synth',1);
+INSERT INTO "remix_tag" VALUES(3633,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3634,'brass',1);
+INSERT INTO "remix_tag" VALUES(3634,'chill',1);
+INSERT INTO "remix_tag" VALUES(3634,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3634,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3634,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3634,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3634,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3634,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3634,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3635,'chill',1);
+INSERT INTO "remix_tag" VALUES(3635,'edm',1);
+INSERT INTO "remix_tag" VALUES(3635,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3635,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3635,'pop',1);
+INSERT INTO "remix_tag" VALUES(3635,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3635,'synth',1);
+INSERT INTO "remix_tag" VALUES(3635,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3636,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3636,'carribean',1);
+INSERT INTO "remix_tag" VALUES(3636,'collab',1);
+INSERT INTO "remix_tag" VALUES(3636,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3636,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3636,'folk',1);
+INSERT INTO "remix_tag" VALUES(3636,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(3636,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3636,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3636,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3636,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3636,'violin',1);
+INSERT INTO "remix_tag" VALUES(3637,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3637,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3637,'bells',1);
+INSERT INTO "remix_tag" VALUES(3637,'chill',1);
+INSERT INTO "remix_tag" VALUES(3637,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3637,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3637,'piano',1);
+INSERT INTO "remix_tag" VALUES(3637,'strings',1);
+INSERT INTO "remix_tag" VALUES(3637,'synth',1);
+INSERT INTO "remix_tag" VALUES(3637,'violin',1);
+INSERT INTO "remix_tag" VALUES(3638,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3638,'dark',1);
+INSERT INTO "remix_tag" VALUES(3638,'edm',1);
+INSERT INTO "remix_tag" VALUES(3638,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3638,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3638,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3638,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3638,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3638,'synth',1);
+INSERT INTO "remix_tag" VALUES(3638,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3639,'brass',1);
+INSERT INTO "remix_tag" VALUES(3639,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3639,'dark',1);
+INSERT INTO "remix_tag" VALUES(3639,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3639,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3639,'strings',1);
+INSERT INTO "remix_tag" VALUES(3639,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3639,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3640,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3640,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3640,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3640,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3640,'metal',1);
+INSERT INTO "remix_tag" VALUES(3640,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3640,'synth',1);
+INSERT INTO "remix_tag" VALUES(3641,'bells',1);
+INSERT INTO "remix_tag" VALUES(3641,'chill',1);
+INSERT INTO "remix_tag" VALUES(3641,'choir',1);
+INSERT INTO "remix_tag" VALUES(3641,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3641,'classical',1);
+INSERT INTO "remix_tag" VALUES(3641,'flute',1);
+INSERT INTO "remix_tag" VALUES(3641,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3641,'harp',1);
+INSERT INTO "remix_tag" VALUES(3641,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3641,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3641,'strings',1);
+INSERT INTO "remix_tag" VALUES(3642,'chill',1);
+INSERT INTO "remix_tag" VALUES(3642,'choir',1);
+INSERT INTO "remix_tag" VALUES(3642,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3642,'classical',1);
+INSERT INTO "remix_tag" VALUES(3642,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3642,'flute',1);
+INSERT INTO "remix_tag" VALUES(3642,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3642,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3642,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3642,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3642,'strings',1);
+INSERT INTO "remix_tag" VALUES(3642,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3643,'edm',1);
+INSERT INTO "remix_tag" VALUES(3643,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3643,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3643,'funky',1);
+INSERT INTO "remix_tag" VALUES(3643,'organ',1);
+INSERT INTO "remix_tag" VALUES(3643,'synth',1);
+INSERT INTO "remix_tag" VALUES(3644,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3644,'bells',1);
+INSERT INTO "remix_tag" VALUES(3644,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3644,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3644,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3644,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3644,'funky',1);
+INSERT INTO "remix_tag" VALUES(3644,'piano',1);
+INSERT INTO "remix_tag" VALUES(3644,'synth',1);
+INSERT INTO "remix_tag" VALUES(3644,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3645,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3645,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3645,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3645,'metal',1);
+INSERT INTO "remix_tag" VALUES(3645,'rock',1);
+INSERT INTO "remix_tag" VALUES(3645,'synth',1);
+INSERT INTO "remix_tag" VALUES(3646,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3646,'collab',1);
+INSERT INTO "remix_tag" VALUES(3646,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3646,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3646,'epic',1);
+INSERT INTO "remix_tag" VALUES(3646,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3646,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(3646,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3646,'metal',1);
+INSERT INTO "remix_tag" VALUES(3646,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3646,'singing',1);
+INSERT INTO "remix_tag" VALUES(3646,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3647,'bells',1);
+INSERT INTO "remix_tag" VALUES(3647,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3647,'choir',1);
+INSERT INTO "remix_tag" VALUES(3647,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3647,'classical',1);
+INSERT INTO "remix_tag" VALUES(3647,'collab',1);
+INSERT INTO "remix_tag" VALUES(3647,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3647,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3647,'piano',1);
+INSERT INTO "remix_tag" VALUES(3647,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3647,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3647,'violin',1);
+INSERT INTO "remix_tag" VALUES(3647,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3647,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3648,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3648,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3648,'bells',1);
+INSERT INTO "remix_tag" VALUES(3648,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3648,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3648,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3648,'rock',1);
+INSERT INTO "remix_tag" VALUES(3648,'synth',1);
+INSERT INTO "remix_tag" VALUES(3648,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3649,'brass',1);
+INSERT INTO "remix_tag" VALUES(3649,'collab',1);
+INSERT INTO "remix_tag" VALUES(3649,'edm',1);
+INSERT INTO "remix_tag" VALUES(3649,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3649,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3649,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3649,'strings',1);
+INSERT INTO "remix_tag" VALUES(3649,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3649,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3649,'synth',1);
+INSERT INTO "remix_tag" VALUES(3649,'violin',1);
+INSERT INTO "remix_tag" VALUES(3649,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3650,'bells',1);
+INSERT INTO "remix_tag" VALUES(3650,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3650,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3650,'happy',1);
+INSERT INTO "remix_tag" VALUES(3650,'pop',1);
+INSERT INTO "remix_tag" VALUES(3650,'rock',1);
+INSERT INTO "remix_tag" VALUES(3650,'synth',1);
+INSERT INTO "remix_tag" VALUES(3651,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3651,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3651,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3651,'organ',1);
+INSERT INTO "remix_tag" VALUES(3651,'rock',1);
+INSERT INTO "remix_tag" VALUES(3651,'sad',1);
+INSERT INTO "remix_tag" VALUES(3651,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3651,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3651,'strings',1);
+INSERT INTO "remix_tag" VALUES(3651,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3652,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3652,'chill',1);
+INSERT INTO "remix_tag" VALUES(3652,'choir',1);
+INSERT INTO "remix_tag" VALUES(3652,'collab',1);
+INSERT INTO "remix_tag" VALUES(3652,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3652,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3652,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3652,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3652,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3652,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3652,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3652,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3652,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3652,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3653,'bells',1);
+INSERT INTO "remix_tag" VALUES(3653,'collab',1);
+INSERT INTO "remix_tag" VALUES(3653,'dance',1);
+INSERT INTO "remix_tag" VALUES(3653,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3653,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3653,'funky',1);
+INSERT INTO "remix_tag" VALUES(3653,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3653,'piano',1);
+INSERT INTO "remix_tag" VALUES(3653,'strings',1);
+INSERT INTO "remix_tag" VALUES(3653,'synth',1);
+INSERT INTO "remix_tag" VALUES(3653,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3653,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3653,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3654,'chill',1);
+INSERT INTO "remix_tag" VALUES(3654,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3654,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3654,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3654,'piano',1);
+INSERT INTO "remix_tag" VALUES(3654,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3654,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3654,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3654,'synth',1);
+INSERT INTO "remix_tag" VALUES(3655,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3655,'bells',1);
+INSERT INTO "remix_tag" VALUES(3655,'choir',1);
+INSERT INTO "remix_tag" VALUES(3655,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3655,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3655,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3655,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3655,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3655,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3655,'strings',1);
+INSERT INTO "remix_tag" VALUES(3655,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3655,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3656,'brass',1);
+INSERT INTO "remix_tag" VALUES(3656,'chill',1);
+INSERT INTO "remix_tag" VALUES(3656,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3656,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3656,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3656,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3656,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3656,'swing',1);
+INSERT INTO "remix_tag" VALUES(3656,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3657,'chill',1);
+INSERT INTO "remix_tag" VALUES(3657,'choir',1);
+INSERT INTO "remix_tag" VALUES(3657,'dance',1);
+INSERT INTO "remix_tag" VALUES(3657,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3657,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3657,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3657,'funky',1);
+INSERT INTO "remix_tag" VALUES(3657,'organ',1);
+INSERT INTO "remix_tag" VALUES(3657,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3658,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3658,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3658,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3658,'happy',1);
+INSERT INTO "remix_tag" VALUES(3658,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3658,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3658,'synth',1);
+INSERT INTO "remix_tag" VALUES(3658,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3659,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3659,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3659,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3659,'folk',1);
+INSERT INTO "remix_tag" VALUES(3659,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3659,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3659,'piano',1);
+INSERT INTO "remix_tag" VALUES(3659,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3659,'sad',1);
+INSERT INTO "remix_tag" VALUES(3659,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3659,'synth',1);
+INSERT INTO "remix_tag" VALUES(3659,'violin',1);
+INSERT INTO "remix_tag" VALUES(3660,'bells',1);
+INSERT INTO "remix_tag" VALUES(3660,'edm',1);
+INSERT INTO "remix_tag" VALUES(3660,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3660,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3660,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3660,'harp',1);
+INSERT INTO "remix_tag" VALUES(3660,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3660,'synth',1);
+INSERT INTO "remix_tag" VALUES(3661,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3661,'chill',1);
+INSERT INTO "remix_tag" VALUES(3661,'choir',1);
+INSERT INTO "remix_tag" VALUES(3661,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3661,'dark',1);
+INSERT INTO "remix_tag" VALUES(3661,'folk',1);
+INSERT INTO "remix_tag" VALUES(3661,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3661,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3661,'piano',1);
+INSERT INTO "remix_tag" VALUES(3661,'singing',1);
+INSERT INTO "remix_tag" VALUES(3661,'world',1);
+INSERT INTO "remix_tag" VALUES(3662,'chill',1);
+INSERT INTO "remix_tag" VALUES(3662,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3662,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3662,'funky',1);
+INSERT INTO "remix_tag" VALUES(3662,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3662,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3662,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3662,'piano',1);
+INSERT INTO "remix_tag" VALUES(3662,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3662,'synth',1);
+INSERT INTO "remix_tag" VALUES(3662,'trap',1);
+INSERT INTO "remix_tag" VALUES(3662,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3663,'bells',1);
+INSERT INTO "remix_tag" VALUES(3663,'brass',1);
+INSERT INTO "remix_tag" VALUES(3663,'choir',1);
+INSERT INTO "remix_tag" VALUES(3663,'collab',1);
+INSERT INTO "remix_tag" VALUES(3663,'dark',1);
+INSERT INTO "remix_tag" VALUES(3663,'epic',1);
+INSERT INTO "remix_tag" VALUES(3663,'flute',1);
+INSERT INTO "remix_tag" VALUES(3663,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3663,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3663,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3663,'piano',1);
+INSERT INTO "remix_tag" VALUES(3663,'singing',1);
+INSERT INTO "remix_tag" VALUES(3663,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3663,'strings',1);
+INSERT INTO "remix_tag" VALUES(3663,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3663,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3663,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3663,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3663,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3664,'bells',1);
+INSERT INTO "remix_tag" VALUES(3664,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3664,'edm',1);
+INSERT INTO "remix_tag" VALUES(3664,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3664,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3664,'piano',1);
+INSERT INTO "remix_tag" VALUES(3664,'synth',1);
+INSERT INTO "remix_tag" VALUES(3664,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3664,'trance',1);
+INSERT INTO "remix_tag" VALUES(3665,'brass',1);
+INSERT INTO "remix_tag" VALUES(3665,'collab',1);
+INSERT INTO "remix_tag" VALUES(3665,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3665,'funk',1);
+INSERT INTO "remix_tag" VALUES(3665,'funky',1);
+INSERT INTO "remix_tag" VALUES(3665,'happy',1);
+INSERT INTO "remix_tag" VALUES(3665,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3665,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3665,'trombone',1);
+INSERT INTO "remix_tag" VALUES(3666,'brass',1);
+INSERT INTO "remix_tag" VALUES(3666,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3666,'epic',1);
+INSERT INTO "remix_tag" VALUES(3666,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3666,'piano',1);
+INSERT INTO "remix_tag" VALUES(3666,'strings',1);
+INSERT INTO "remix_tag" VALUES(3666,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3666,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3666,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3667,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3667,'collab',1);
+INSERT INTO "remix_tag" VALUES(3667,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3667,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3667,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3667,'funky',1);
+INSERT INTO "remix_tag" VALUES(3667,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3667,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3667,'singing',1);
+INSERT INTO "remix_tag" VALUES(3667,'synth',1);
+INSERT INTO "remix_tag" VALUES(3667,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3667,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3668,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3668,'collab',1);
+INSERT INTO "remix_tag" VALUES(3668,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3668,'folk',1);
+INSERT INTO "remix_tag" VALUES(3668,'happy',1);
+INSERT INTO "remix_tag" VALUES(3668,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3668,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3668,'piano',1);
+INSERT INTO "remix_tag" VALUES(3668,'rock',1);
+INSERT INTO "remix_tag" VALUES(3669,'bells',1);
+INSERT INTO "remix_tag" VALUES(3669,'brass',1);
+INSERT INTO "remix_tag" VALUES(3669,'dark',1);
+INSERT INTO "remix_tag" VALUES(3669,'epic',1);
+INSERT INTO "remix_tag" VALUES(3669,'flute',1);
+INSERT INTO "remix_tag" VALUES(3669,'harp',1);
+INSERT INTO "remix_tag" VALUES(3669,'march',1);
+INSERT INTO "remix_tag" VALUES(3669,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3669,'strings',1);
+INSERT INTO "remix_tag" VALUES(3669,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3669,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3670,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3670,'dark',1);
+INSERT INTO "remix_tag" VALUES(3670,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3670,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3670,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3670,'metal',1);
+INSERT INTO "remix_tag" VALUES(3670,'rock',1);
+INSERT INTO "remix_tag" VALUES(3670,'singing',1);
+INSERT INTO "remix_tag" VALUES(3670,'synth',1);
+INSERT INTO "remix_tag" VALUES(3670,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3670,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3671,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3671,'chill',1);
+INSERT INTO "remix_tag" VALUES(3671,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3671,'funky',1);
+INSERT INTO "remix_tag" VALUES(3671,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3671,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3671,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3671,'piano',1);
+INSERT INTO "remix_tag" VALUES(3671,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3671,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3671,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3672,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3672,'edm',1);
+INSERT INTO "remix_tag" VALUES(3672,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3672,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3672,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3672,'synth',1);
+INSERT INTO "remix_tag" VALUES(3672,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3672,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3673,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3673,'carribean',1);
+INSERT INTO "remix_tag" VALUES(3673,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3673,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3673,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3673,'happy',1);
+INSERT INTO "remix_tag" VALUES(3673,'latin',1);
+INSERT INTO "remix_tag" VALUES(3673,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3673,'march',1);
+INSERT INTO "remix_tag" VALUES(3673,'marimba',1);
+INSERT INTO "remix_tag" VALUES(3673,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3673,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3674,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3674,'chill',1);
+INSERT INTO "remix_tag" VALUES(3674,'dark',1);
+INSERT INTO "remix_tag" VALUES(3674,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3674,'edm',1);
+INSERT INTO "remix_tag" VALUES(3674,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3674,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3674,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3674,'synth',1);
+INSERT INTO "remix_tag" VALUES(3675,'brass',1);
+INSERT INTO "remix_tag" VALUES(3675,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3675,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3675,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3675,'latin',1);
+INSERT INTO "remix_tag" VALUES(3675,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3675,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(3675,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3675,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3675,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3676,'brass',1);
+INSERT INTO "remix_tag" VALUES(3676,'collab',1);
+INSERT INTO "remix_tag" VALUES(3676,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3676,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3676,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3676,'funk',1);
+INSERT INTO "remix_tag" VALUES(3676,'funky',1);
+INSERT INTO "remix_tag" VALUES(3676,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3676,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3676,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3676,'trombone',1);
+INSERT INTO "remix_tag" VALUES(3676,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3677,'collab',1);
+INSERT INTO "remix_tag" VALUES(3677,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3677,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3677,'funk',1);
+INSERT INTO "remix_tag" VALUES(3677,'funky',1);
+INSERT INTO "remix_tag" VALUES(3677,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3677,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3677,'organ',1);
+INSERT INTO "remix_tag" VALUES(3677,'rock',1);
+INSERT INTO "remix_tag" VALUES(3677,'trombone',1);
+INSERT INTO "remix_tag" VALUES(3677,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3678,'cello',1);
+INSERT INTO "remix_tag" VALUES(3678,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3678,'dark',1);
+INSERT INTO "remix_tag" VALUES(3678,'edm',1);
+INSERT INTO "remix_tag" VALUES(3678,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3678,'piano',1);
+INSERT INTO "remix_tag" VALUES(3678,'strings',1);
+INSERT INTO "remix_tag" VALUES(3678,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3678,'synth',1);
+INSERT INTO "remix_tag" VALUES(3678,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3679,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3679,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3679,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3679,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3679,'rock',1);
+INSERT INTO "remix_tag" VALUES(3679,'synth',1);
+INSERT INTO "remix_tag" VALUES(3679,'violin',1);
+INSERT INTO "remix_tag" VALUES(3680,'chill',1);
+INSERT INTO "remix_tag" VALUES(3680,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3680,'edm',1);
+INSERT INTO "remix_tag" VALUES(3680,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3680,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3680,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3680,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3680,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3680,'synth',1);
+INSERT INTO "remix_tag" VALUES(3681,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3681,'bells',1);
+INSERT INTO "remix_tag" VALUES(3681,'choir',1);
+INSERT INTO "remix_tag" VALUES(3681,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3681,'classical',1);
+INSERT INTO "remix_tag" VALUES(3681,'dark',1);
+INSERT INTO "remix_tag" VALUES(3681,'harp',1);
+INSERT INTO "remix_tag" VALUES(3681,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3681,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3681,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3681,'piano',1);
+INSERT INTO "remix_tag" VALUES(3681,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3681,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3681,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3682,'brass',1);
+INSERT INTO "remix_tag" VALUES(3682,'choir',1);
+INSERT INTO "remix_tag" VALUES(3682,'flute',1);
+INSERT INTO "remix_tag" VALUES(3682,'harp',1);
+INSERT INTO "remix_tag" VALUES(3682,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(3682,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3682,'piano',1);
+INSERT INTO "remix_tag" VALUES(3682,'strings',1);
+INSERT INTO "remix_tag" VALUES(3682,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3682,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3682,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3683,'classical',1);
+INSERT INTO "remix_tag" VALUES(3683,'dark',1);
+INSERT INTO "remix_tag" VALUES(3683,'piano',1);
+INSERT INTO "remix_tag" VALUES(3683,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3683,'solo',1);
+INSERT INTO "remix_tag" VALUES(3683,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3684,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3684,'edm',1);
+INSERT INTO "remix_tag" VALUES(3684,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3684,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3684,'house',1);
+INSERT INTO "remix_tag" VALUES(3684,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3684,'synth',1);
+INSERT INTO "remix_tag" VALUES(3684,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3684,'trance',1);
+INSERT INTO "remix_tag" VALUES(3685,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3685,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3685,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3685,'funky',1);
+INSERT INTO "remix_tag" VALUES(3685,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3685,'happy',1);
+INSERT INTO "remix_tag" VALUES(3685,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3685,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3685,'pop',1);
+INSERT INTO "remix_tag" VALUES(3685,'rock',1);
+INSERT INTO "remix_tag" VALUES(3685,'singing',1);
+INSERT INTO "remix_tag" VALUES(3685,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3685,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3685,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3685,'workout',1);
+INSERT INTO "remix_tag" VALUES(3686,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3686,'edm',1);
+INSERT INTO "remix_tag" VALUES(3686,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3686,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3686,'synth',1);
+INSERT INTO "remix_tag" VALUES(3686,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3687,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3687,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3687,'bells',1);
+INSERT INTO "remix_tag" VALUES(3687,'collab',1);
+INSERT INTO "remix_tag" VALUES(3687,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3687,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3687,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3687,'rock',1);
+INSERT INTO "remix_tag" VALUES(3687,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3688,'bells',1);
+INSERT INTO "remix_tag" VALUES(3688,'choir',1);
+INSERT INTO "remix_tag" VALUES(3688,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3688,'classical',1);
+INSERT INTO "remix_tag" VALUES(3688,'flute',1);
+INSERT INTO "remix_tag" VALUES(3688,'harp',1);
+INSERT INTO "remix_tag" VALUES(3688,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3688,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3688,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3688,'piano',1);
+INSERT INTO "remix_tag" VALUES(3688,'strings',1);
+INSERT INTO "remix_tag" VALUES(3689,'choir',1);
+INSERT INTO "remix_tag" VALUES(3689,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3689,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3689,'epic',1);
+INSERT INTO "remix_tag" VALUES(3689,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3689,'harp',1);
+INSERT INTO "remix_tag" VALUES(3689,'march',1);
+INSERT INTO "remix_tag" VALUES(3689,'medley',1);
+INSERT INTO "remix_tag" VALUES(3689,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3689,'strings',1);
+INSERT INTO "remix_tag" VALUES(3689,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3689,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3689,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3690,'dark',1);
+INSERT INTO "remix_tag" VALUES(3690,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3690,'edm',1);
+INSERT INTO "remix_tag" VALUES(3690,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3690,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3690,'funky',1);
+INSERT INTO "remix_tag" VALUES(3690,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3690,'synth',1);
+INSERT INTO "remix_tag" VALUES(3691,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3691,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3691,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3691,'metal',1);
+INSERT INTO "remix_tag" VALUES(3691,'rock',1);
+INSERT INTO "remix_tag" VALUES(3692,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3692,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3692,'organ',1);
+INSERT INTO "remix_tag" VALUES(3692,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3692,'rock',1);
+INSERT INTO "remix_tag" VALUES(3692,'synth',1);
+INSERT INTO "remix_tag" VALUES(3693,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3693,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3693,'dark',1);
+INSERT INTO "remix_tag" VALUES(3693,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3693,'edm',1);
+INSERT INTO "remix_tag" VALUES(3693,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3693,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3693,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3693,'rock',1);
+INSERT INTO "remix_tag" VALUES(3693,'synth',1);
+INSERT INTO "remix_tag" VALUES(3693,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3694,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3694,'cello',1);
+INSERT INTO "remix_tag" VALUES(3694,'dark',1);
+INSERT INTO "remix_tag" VALUES(3694,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3694,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3694,'metal',1);
+INSERT INTO "remix_tag" VALUES(3694,'piano',1);
+INSERT INTO "remix_tag" VALUES(3694,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3694,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3695,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3695,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3695,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3695,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3695,'happy',1);
+INSERT INTO "remix_tag" VALUES(3695,'pop',1);
+INSERT INTO "remix_tag" VALUES(3695,'rock',1);
+INSERT INTO "remix_tag" VALUES(3695,'synth',1);
+INSERT INTO "remix_tag" VALUES(3696,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3696,'chill',1);
+INSERT INTO "remix_tag" VALUES(3696,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(3696,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3696,'funk',1);
+INSERT INTO "remix_tag" VALUES(3696,'funky',1);
+INSERT INTO "remix_tag" VALUES(3696,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3696,'piano',1);
+INSERT INTO "remix_tag" VALUES(3696,'strings',1);
+INSERT INTO "remix_tag" VALUES(3696,'synth',1);
+INSERT INTO "remix_tag" VALUES(3696,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3697,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3697,'bells',1);
+INSERT INTO "remix_tag" VALUES(3697,'chill',1);
+INSERT INTO "remix_tag" VALUES(3697,'choir',1);
+INSERT INTO "remix_tag" VALUES(3697,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3697,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3697,'piano',1);
+INSERT INTO "remix_tag" VALUES(3697,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3697,'synth',1);
+INSERT INTO "remix_tag" VALUES(3698,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3698,'angry',1);
+INSERT INTO "remix_tag" VALUES(3698,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3698,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3698,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3698,'metal',1);
+INSERT INTO "remix_tag" VALUES(3698,'screaming',1);
+INSERT INTO "remix_tag" VALUES(3698,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3699,'chill',1);
+INSERT INTO "remix_tag" VALUES(3699,'edm',1);
+INSERT INTO "remix_tag" VALUES(3699,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3699,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3699,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3699,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3699,'synth',1);
+INSERT INTO "remix_tag" VALUES(3699,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3700,'chill',1);
+INSERT INTO "remix_tag" VALUES(3700,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3700,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3700,'organ',1);
+INSERT INTO "remix_tag" VALUES(3700,'rock',1);
+INSERT INTO "remix_tag" VALUES(3700,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3700,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3701,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3701,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3701,'flute',1);
+INSERT INTO "remix_tag" VALUES(3701,'folk',1);
+INSERT INTO "remix_tag" VALUES(3701,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3701,'harp',1);
+INSERT INTO "remix_tag" VALUES(3701,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3701,'strings',1);
+INSERT INTO "remix_tag" VALUES(3701,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3701,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3702,'disco',1);
+INSERT INTO "remix_tag" VALUES(3702,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3702,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3702,'funky',1);
+INSERT INTO "remix_tag" VALUES(3702,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3702,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3702,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3702,'piano',1);
+INSERT INTO "remix_tag" VALUES(3702,'singing',1);
+INSERT INTO "remix_tag" VALUES(3702,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3702,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3702,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3703,'carribean',1);
+INSERT INTO "remix_tag" VALUES(3703,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3703,'edm',1);
+INSERT INTO "remix_tag" VALUES(3703,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3703,'marimba',1);
+INSERT INTO "remix_tag" VALUES(3703,'organ',1);
+INSERT INTO "remix_tag" VALUES(3703,'ska',1);
+INSERT INTO "remix_tag" VALUES(3703,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(3704,'chill',1);
+INSERT INTO "remix_tag" VALUES(3704,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3704,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3704,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3704,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3704,'funk',1);
+INSERT INTO "remix_tag" VALUES(3704,'funky',1);
+INSERT INTO "remix_tag" VALUES(3704,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3704,'medley',1);
+INSERT INTO "remix_tag" VALUES(3704,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3704,'strings',1);
+INSERT INTO "remix_tag" VALUES(3704,'synth',1);
+INSERT INTO "remix_tag" VALUES(3704,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3705,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3705,'classical',1);
+INSERT INTO "remix_tag" VALUES(3705,'dark',1);
+INSERT INTO "remix_tag" VALUES(3705,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3705,'piano',1);
+INSERT INTO "remix_tag" VALUES(3705,'pop',1);
+INSERT INTO "remix_tag" VALUES(3705,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3705,'solo',1);
+INSERT INTO "remix_tag" VALUES(3705,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3705,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3705,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3706,'brass',1);
+INSERT INTO "remix_tag" VALUES(3706,'choir',1);
+INSERT INTO "remix_tag" VALUES(3706,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3706,'epic',1);
+INSERT INTO "remix_tag" VALUES(3706,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3706,'piano',1);
+INSERT INTO "remix_tag" VALUES(3706,'strings',1);
+INSERT INTO "remix_tag" VALUES(3706,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3707,'brass',1);
+INSERT INTO "remix_tag" VALUES(3707,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3707,'march',1);
+INSERT INTO "remix_tag" VALUES(3707,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3707,'strings',1);
+INSERT INTO "remix_tag" VALUES(3707,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3707,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3707,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3708,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3708,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3708,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3708,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3708,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3708,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3708,'organ',1);
+INSERT INTO "remix_tag" VALUES(3708,'rock',1);
+INSERT INTO "remix_tag" VALUES(3708,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3709,'bells',1);
+INSERT INTO "remix_tag" VALUES(3709,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3709,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3709,'folk',1);
+INSERT INTO "remix_tag" VALUES(3709,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3709,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3709,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3709,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3709,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3710,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3710,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3710,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3710,'koto',1);
+INSERT INTO "remix_tag" VALUES(3710,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3710,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3710,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3710,'piano',1);
+INSERT INTO "remix_tag" VALUES(3710,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3710,'strings',1);
+INSERT INTO "remix_tag" VALUES(3711,'brass',1);
+INSERT INTO "remix_tag" VALUES(3711,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3711,'dance',1);
+INSERT INTO "remix_tag" VALUES(3711,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3711,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3711,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3711,'happy',1);
+INSERT INTO "remix_tag" VALUES(3711,'piano',1);
+INSERT INTO "remix_tag" VALUES(3711,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3711,'south-american',1);
+INSERT INTO "remix_tag" VALUES(3712,'brass',1);
+INSERT INTO "remix_tag" VALUES(3712,'choir',1);
+INSERT INTO "remix_tag" VALUES(3712,'epic',1);
+INSERT INTO "remix_tag" VALUES(3712,'folk',1);
+INSERT INTO "remix_tag" VALUES(3712,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3712,'harp',1);
+INSERT INTO "remix_tag" VALUES(3712,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3712,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3712,'strings',1);
+INSERT INTO "remix_tag" VALUES(3712,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3712,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3712,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3713,'compo',1);
+INSERT INTO "remix_tag" VALUES(3713,'edm',1);
+INSERT INTO "remix_tag" VALUES(3713,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3713,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3713,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3713,'pop',1);
+INSERT INTO "remix_tag" VALUES(3713,'synth',1);
+INSERT INTO "remix_tag" VALUES(3714,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3714,'dark',1);
+INSERT INTO "remix_tag" VALUES(3714,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3714,'epic',1);
+INSERT INTO "remix_tag" VALUES(3714,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3714,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(3714,'rock',1);
+INSERT INTO "remix_tag" VALUES(3714,'strings',1);
+INSERT INTO "remix_tag" VALUES(3714,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3714,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3715,'brass',1);
+INSERT INTO "remix_tag" VALUES(3715,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3715,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3715,'funk',1);
+INSERT INTO "remix_tag" VALUES(3715,'funky',1);
+INSERT INTO "remix_tag" VALUES(3715,'house',1);
+INSERT INTO "remix_tag" VALUES(3715,'strings',1);
+INSERT INTO "remix_tag" VALUES(3715,'synth',1);
+INSERT INTO "remix_tag" VALUES(3716,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3716,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3716,'dark',1);
+INSERT INTO "remix_tag" VALUES(3716,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3716,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3716,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3716,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3716,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3716,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3716,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3716,'strings',1);
+INSERT INTO "remix_tag" VALUES(3716,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3716,'synth',1);
+INSERT INTO "remix_tag" VALUES(3716,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3717,'brass',1);
+INSERT INTO "remix_tag" VALUES(3717,'choir',1);
+INSERT INTO "remix_tag" VALUES(3717,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3717,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3717,'funk',1);
+INSERT INTO "remix_tag" VALUES(3717,'happy',1);
+INSERT INTO "remix_tag" VALUES(3717,'organ',1);
+INSERT INTO "remix_tag" VALUES(3717,'rock',1);
+INSERT INTO "remix_tag" VALUES(3717,'synth',1);
+INSERT INTO "remix_tag" VALUES(3717,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3717,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3717,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3718,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3718,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3718,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3718,'edm',1);
+INSERT INTO "remix_tag" VALUES(3718,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3718,'epic',1);
+INSERT INTO "remix_tag" VALUES(3718,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3718,'synth',1);
+INSERT INTO "remix_tag" VALUES(3719,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3719,'choir',1);
+INSERT INTO "remix_tag" VALUES(3719,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3719,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3719,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3719,'metal',1);
+INSERT INTO "remix_tag" VALUES(3719,'rock',1);
+INSERT INTO "remix_tag" VALUES(3719,'singing',1);
+INSERT INTO "remix_tag" VALUES(3719,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3720,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3720,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3720,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3720,'chill',1);
+INSERT INTO "remix_tag" VALUES(3720,'folk',1);
+INSERT INTO "remix_tag" VALUES(3720,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3721,'acapella',1);
+INSERT INTO "remix_tag" VALUES(3721,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3721,'funny',1);
+INSERT INTO "remix_tag" VALUES(3721,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3721,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3721,'pop',1);
+INSERT INTO "remix_tag" VALUES(3721,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3721,'singing',1);
+INSERT INTO "remix_tag" VALUES(3721,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3721,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3721,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3722,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3722,'compo',1);
+INSERT INTO "remix_tag" VALUES(3722,'dark',1);
+INSERT INTO "remix_tag" VALUES(3722,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3722,'piano',1);
+INSERT INTO "remix_tag" VALUES(3722,'rock',1);
+INSERT INTO "remix_tag" VALUES(3722,'sad',1);
+INSERT INTO "remix_tag" VALUES(3722,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3722,'strings',1);
+INSERT INTO "remix_tag" VALUES(3722,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3723,'brass',1);
+INSERT INTO "remix_tag" VALUES(3723,'chill',1);
+INSERT INTO "remix_tag" VALUES(3723,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3723,'classical',1);
+INSERT INTO "remix_tag" VALUES(3723,'flute',1);
+INSERT INTO "remix_tag" VALUES(3723,'folk',1);
+INSERT INTO "remix_tag" VALUES(3723,'harp',1);
+INSERT INTO "remix_tag" VALUES(3723,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3723,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3723,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3723,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3724,'bells',1);
+INSERT INTO "remix_tag" VALUES(3724,'choir',1);
+INSERT INTO "remix_tag" VALUES(3724,'harp',1);
+INSERT INTO "remix_tag" VALUES(3724,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3724,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3724,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3724,'strings',1);
+INSERT INTO "remix_tag" VALUES(3724,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3724,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3724,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3724,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3724,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3725,'brass',1);
+INSERT INTO "remix_tag" VALUES(3725,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3725,'collab',1);
+INSERT INTO "remix_tag" VALUES(3725,'dark',1);
+INSERT INTO "remix_tag" VALUES(3725,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3725,'epic',1);
+INSERT INTO "remix_tag" VALUES(3725,'harp',1);
+INSERT INTO "remix_tag" VALUES(3725,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3725,'strings',1);
+INSERT INTO "remix_tag" VALUES(3725,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3725,'violin',1);
+INSERT INTO "remix_tag" VALUES(3725,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3726,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3726,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3726,'funky',1);
+INSERT INTO "remix_tag" VALUES(3726,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3726,'house',1);
+INSERT INTO "remix_tag" VALUES(3726,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3726,'organ',1);
+INSERT INTO "remix_tag" VALUES(3726,'piano',1);
+INSERT INTO "remix_tag" VALUES(3726,'singing',1);
+INSERT INTO "remix_tag" VALUES(3726,'synth',1);
+INSERT INTO "remix_tag" VALUES(3726,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3726,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3726,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3727,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3727,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3727,'folk',1);
+INSERT INTO "remix_tag" VALUES(3727,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3727,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3728,'collab',1);
+INSERT INTO "remix_tag" VALUES(3728,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3728,'funky',1);
+INSERT INTO "remix_tag" VALUES(3728,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3728,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3728,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3728,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3728,'turntable',1);
+INSERT INTO "remix_tag" VALUES(3728,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3728,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3728,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3729,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3729,'edm',1);
+INSERT INTO "remix_tag" VALUES(3729,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3729,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3729,'funky',1);
+INSERT INTO "remix_tag" VALUES(3729,'synth',1);
+INSERT INTO "remix_tag" VALUES(3730,'collab',1);
+INSERT INTO "remix_tag" VALUES(3730,'compo',1);
+INSERT INTO "remix_tag" VALUES(3730,'dark',1);
+INSERT INTO "remix_tag" VALUES(3730,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3730,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3730,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3730,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3730,'organ',1);
+INSERT INTO "remix_tag" VALUES(3730,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3730,'rock',1);
+INSERT INTO "remix_tag" VALUES(3730,'singing',1);
+INSERT INTO "remix_tag" VALUES(3730,'synth',1);
+INSERT INTO "remix_tag" VALUES(3730,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3730,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3731,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3731,'chill',1);
+INSERT INTO "remix_tag" VALUES(3731,'edm',1);
+INSERT INTO "remix_tag" VALUES(3731,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3731,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3731,'piano',1);
+INSERT INTO "remix_tag" VALUES(3731,'synth',1);
+INSERT INTO "remix_tag" VALUES(3731,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3732,'edm',1);
+INSERT INTO "remix_tag" VALUES(3732,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3732,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3732,'synth',1);
+INSERT INTO "remix_tag" VALUES(3732,'trance',1);
+INSERT INTO "remix_tag" VALUES(3733,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3733,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3733,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3733,'rock',1);
+INSERT INTO "remix_tag" VALUES(3733,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3733,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3734,'disco',1);
+INSERT INTO "remix_tag" VALUES(3734,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3734,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3734,'flute',1);
+INSERT INTO "remix_tag" VALUES(3734,'funk',1);
+INSERT INTO "remix_tag" VALUES(3734,'funky',1);
+INSERT INTO "remix_tag" VALUES(3734,'rock',1);
+INSERT INTO "remix_tag" VALUES(3734,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3734,'synth',1);
+INSERT INTO "remix_tag" VALUES(3734,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3735,'brass',1);
+INSERT INTO "remix_tag" VALUES(3735,'choir',1);
+INSERT INTO "remix_tag" VALUES(3735,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3735,'compo',1);
+INSERT INTO "remix_tag" VALUES(3735,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3735,'harp',1);
+INSERT INTO "remix_tag" VALUES(3735,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3735,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3735,'strings',1);
+INSERT INTO "remix_tag" VALUES(3735,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3735,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3736,'dark',1);
+INSERT INTO "remix_tag" VALUES(3736,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3736,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3736,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3736,'synth',1);
+INSERT INTO "remix_tag" VALUES(3736,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3736,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3737,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3737,'chill',1);
+INSERT INTO "remix_tag" VALUES(3737,'dark',1);
+INSERT INTO "remix_tag" VALUES(3737,'edm',1);
+INSERT INTO "remix_tag" VALUES(3737,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3737,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3737,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3737,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3737,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3737,'rock',1);
+INSERT INTO "remix_tag" VALUES(3737,'synth',1);
+INSERT INTO "remix_tag" VALUES(3738,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3738,'chill',1);
+INSERT INTO "remix_tag" VALUES(3738,'collab',1);
+INSERT INTO "remix_tag" VALUES(3738,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3738,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3738,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3738,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3738,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3738,'piano',1);
+INSERT INTO "remix_tag" VALUES(3738,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3738,'strings',1);
+INSERT INTO "remix_tag" VALUES(3738,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3738,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3739,'chill',1);
+INSERT INTO "remix_tag" VALUES(3739,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3739,'collab',1);
+INSERT INTO "remix_tag" VALUES(3739,'epic',1);
+INSERT INTO "remix_tag" VALUES(3739,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3739,'piano',1);
+INSERT INTO "remix_tag" VALUES(3739,'strings',1);
+INSERT INTO "remix_tag" VALUES(3739,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3740,'brass',1);
+INSERT INTO "remix_tag" VALUES(3740,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3740,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3740,'harp',1);
+INSERT INTO "remix_tag" VALUES(3740,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3740,'strings',1);
+INSERT INTO "remix_tag" VALUES(3740,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3740,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3740,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3741,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3741,'brass',1);
+INSERT INTO "remix_tag" VALUES(3741,'flute',1);
+INSERT INTO "remix_tag" VALUES(3741,'harp',1);
+INSERT INTO "remix_tag" VALUES(3741,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3741,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3741,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3741,'strings',1);
+INSERT INTO "remix_tag" VALUES(3741,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3741,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3741,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3742,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3742,'chill',1);
+INSERT INTO "remix_tag" VALUES(3742,'collab',1);
+INSERT INTO "remix_tag" VALUES(3742,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3742,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3742,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3742,'latin',1);
+INSERT INTO "remix_tag" VALUES(3742,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3742,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3742,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3742,'violin',1);
+INSERT INTO "remix_tag" VALUES(3743,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3743,'choir',1);
+INSERT INTO "remix_tag" VALUES(3743,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3743,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3743,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3743,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3743,'synth',1);
+INSERT INTO "remix_tag" VALUES(3743,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3744,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3744,'chill',1);
+INSERT INTO "remix_tag" VALUES(3744,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3744,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3744,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3744,'rock',1);
+INSERT INTO "remix_tag" VALUES(3745,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3745,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3745,'chill',1);
+INSERT INTO "remix_tag" VALUES(3745,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3745,'dark',1);
+INSERT INTO "remix_tag" VALUES(3745,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3745,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3745,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3745,'piano',1);
+INSERT INTO "remix_tag" VALUES(3745,'rock',1);
+INSERT INTO "remix_tag" VALUES(3745,'strings',1);
+INSERT INTO "remix_tag" VALUES(3745,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3745,'synth',1);
+INSERT INTO "remix_tag" VALUES(3745,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3746,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3746,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3746,'carribean',1);
+INSERT INTO "remix_tag" VALUES(3746,'classical',1);
+INSERT INTO "remix_tag" VALUES(3746,'collab',1);
+INSERT INTO "remix_tag" VALUES(3746,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3746,'flute',1);
+INSERT INTO "remix_tag" VALUES(3746,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3746,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3746,'latin',1);
+INSERT INTO "remix_tag" VALUES(3746,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3746,'medley',1);
+INSERT INTO "remix_tag" VALUES(3746,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3746,'piano',1);
+INSERT INTO "remix_tag" VALUES(3746,'south-american',1);
+INSERT INTO "remix_tag" VALUES(3746,'strings',1);
+INSERT INTO "remix_tag" VALUES(3746,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3747,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3747,'dark',1);
+INSERT INTO "remix_tag" VALUES(3747,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3747,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3747,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3747,'metal',1);
+INSERT INTO "remix_tag" VALUES(3747,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3747,'singing',1);
+INSERT INTO "remix_tag" VALUES(3747,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3748,'edm',1);
+INSERT INTO "remix_tag" VALUES(3748,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3748,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3748,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3748,'synth',1);
+INSERT INTO "remix_tag" VALUES(3749,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3749,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3749,'metal',1);
+INSERT INTO "remix_tag" VALUES(3749,'rock',1);
+INSERT INTO "remix_tag" VALUES(3749,'synth',1);
+INSERT INTO "remix_tag" VALUES(3750,'chill',1);
+INSERT INTO "remix_tag" VALUES(3750,'edm',1);
+INSERT INTO "remix_tag" VALUES(3750,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3750,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3750,'folk',1);
+INSERT INTO "remix_tag" VALUES(3750,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3750,'synth',1);
+INSERT INTO "remix_tag" VALUES(3750,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3750,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3751,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3751,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3751,'edm',1);
+INSERT INTO "remix_tag" VALUES(3751,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3751,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3751,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3751,'happy',1);
+INSERT INTO "remix_tag" VALUES(3751,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3751,'synth',1);
+INSERT INTO "remix_tag" VALUES(3751,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3751,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3751,'trance',1);
+INSERT INTO "remix_tag" VALUES(3752,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3752,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3752,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3752,'funk',1);
+INSERT INTO "remix_tag" VALUES(3752,'funky',1);
+INSERT INTO "remix_tag" VALUES(3752,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3752,'organ',1);
+INSERT INTO "remix_tag" VALUES(3752,'synth',1);
+INSERT INTO "remix_tag" VALUES(3753,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3753,'brass',1);
+INSERT INTO "remix_tag" VALUES(3753,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3753,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3753,'collab',1);
+INSERT INTO "remix_tag" VALUES(3753,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3753,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3753,'epic',1);
+INSERT INTO "remix_tag" VALUES(3753,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3753,'metal',1);
+INSERT INTO "remix_tag" VALUES(3753,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3753,'strings',1);
+INSERT INTO "remix_tag" VALUES(3753,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3753,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3753,'synth',1);
+INSERT INTO "remix_tag" VALUES(3753,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3753,'violin',1);
+INSERT INTO "remix_tag" VALUES(3754,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3754,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3754,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(3754,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3754,'folk',1);
+INSERT INTO "remix_tag" VALUES(3754,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3754,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(3755,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3755,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3755,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3755,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3755,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3755,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3755,'synth',1);
+INSERT INTO "remix_tag" VALUES(3755,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3756,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3756,'classical',1);
+INSERT INTO "remix_tag" VALUES(3756,'collab',1);
+INSERT INTO "remix_tag" VALUES(3756,'dark',1);
+INSERT INTO "remix_tag" VALUES(3756,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3756,'piano',1);
+INSERT INTO "remix_tag" VALUES(3756,'sad',1);
+INSERT INTO "remix_tag" VALUES(3756,'solo',1);
+INSERT INTO "remix_tag" VALUES(3756,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3756,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3757,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3757,'collab',1);
+INSERT INTO "remix_tag" VALUES(3757,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3757,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3757,'metal',1);
+INSERT INTO "remix_tag" VALUES(3757,'piano',1);
+INSERT INTO "remix_tag" VALUES(3757,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3757,'strings',1);
+INSERT INTO "remix_tag" VALUES(3757,'synth',1);
+INSERT INTO "remix_tag" VALUES(3757,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(3757,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3758,'compo',1);
+INSERT INTO "remix_tag" VALUES(3758,'edm',1);
+INSERT INTO "remix_tag" VALUES(3758,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3758,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3758,'funky',1);
+INSERT INTO "remix_tag" VALUES(3758,'happy',1);
+INSERT INTO "remix_tag" VALUES(3758,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3758,'pop',1);
+INSERT INTO "remix_tag" VALUES(3758,'synth',1);
+INSERT INTO "remix_tag" VALUES(3758,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3758,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3758,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3759,'edm',1);
+INSERT INTO "remix_tag" VALUES(3759,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3759,'funky',1);
+INSERT INTO "remix_tag" VALUES(3759,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3759,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3759,'indian',1);
+INSERT INTO "remix_tag" VALUES(3759,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3759,'singing',1);
+INSERT INTO "remix_tag" VALUES(3759,'strings',1);
+INSERT INTO "remix_tag" VALUES(3759,'synth',1);
+INSERT INTO "remix_tag" VALUES(3759,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3760,'classical',1);
+INSERT INTO "remix_tag" VALUES(3760,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(3760,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3760,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3760,'piano',1);
+INSERT INTO "remix_tag" VALUES(3760,'sad',1);
+INSERT INTO "remix_tag" VALUES(3760,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3760,'solo',1);
+INSERT INTO "remix_tag" VALUES(3760,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3760,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3760,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3760,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3761,'classical',1);
+INSERT INTO "remix_tag" VALUES(3761,'dark',1);
+INSERT INTO "remix_tag" VALUES(3761,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3761,'piano',1);
+INSERT INTO "remix_tag" VALUES(3761,'solo',1);
+INSERT INTO "remix_tag" VALUES(3761,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3761,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3761,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3762,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3762,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3762,'cello',1);
+INSERT INTO "remix_tag" VALUES(3762,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3762,'collab',1);
+INSERT INTO "remix_tag" VALUES(3762,'folk',1);
+INSERT INTO "remix_tag" VALUES(3762,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3762,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3762,'sad',1);
+INSERT INTO "remix_tag" VALUES(3762,'viola',1);
+INSERT INTO "remix_tag" VALUES(3762,'violin',1);
+INSERT INTO "remix_tag" VALUES(3763,'carribean',1);
+INSERT INTO "remix_tag" VALUES(3763,'chill',1);
+INSERT INTO "remix_tag" VALUES(3763,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3763,'edm',1);
+INSERT INTO "remix_tag" VALUES(3763,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3763,'medley',1);
+INSERT INTO "remix_tag" VALUES(3763,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3763,'piano',1);
+INSERT INTO "remix_tag" VALUES(3763,'synth',1);
+INSERT INTO "remix_tag" VALUES(3764,'brass',1);
+INSERT INTO "remix_tag" VALUES(3764,'choir',1);
+INSERT INTO "remix_tag" VALUES(3764,'dark',1);
+INSERT INTO "remix_tag" VALUES(3764,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3764,'epic',1);
+INSERT INTO "remix_tag" VALUES(3764,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3764,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3764,'strings',1);
+INSERT INTO "remix_tag" VALUES(3764,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3764,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3764,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3765,'brass',1);
+INSERT INTO "remix_tag" VALUES(3765,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3765,'dark',1);
+INSERT INTO "remix_tag" VALUES(3765,'harp',1);
+INSERT INTO "remix_tag" VALUES(3765,'march',1);
+INSERT INTO "remix_tag" VALUES(3765,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3765,'strings',1);
+INSERT INTO "remix_tag" VALUES(3765,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3765,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3765,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3765,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3766,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3766,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3766,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3766,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3766,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3766,'metal',1);
+INSERT INTO "remix_tag" VALUES(3766,'rock',1);
+INSERT INTO "remix_tag" VALUES(3766,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3767,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3767,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3767,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3767,'epic',1);
+INSERT INTO "remix_tag" VALUES(3767,'metal',1);
+INSERT INTO "remix_tag" VALUES(3767,'rock',1);
+INSERT INTO "remix_tag" VALUES(3767,'synth',1);
+INSERT INTO "remix_tag" VALUES(3768,'brass',1);
+INSERT INTO "remix_tag" VALUES(3768,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3768,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3768,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3768,'flute',1);
+INSERT INTO "remix_tag" VALUES(3768,'funk',1);
+INSERT INTO "remix_tag" VALUES(3768,'funky',1);
+INSERT INTO "remix_tag" VALUES(3768,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3768,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3768,'piano',1);
+INSERT INTO "remix_tag" VALUES(3768,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3768,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3768,'singing',1);
+INSERT INTO "remix_tag" VALUES(3768,'turntable',1);
+INSERT INTO "remix_tag" VALUES(3768,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3769,'chill',1);
+INSERT INTO "remix_tag" VALUES(3769,'collab',1);
+INSERT INTO "remix_tag" VALUES(3769,'compo',1);
+INSERT INTO "remix_tag" VALUES(3769,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3769,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3769,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3769,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3769,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3769,'organ',1);
+INSERT INTO "remix_tag" VALUES(3769,'rock',1);
+INSERT INTO "remix_tag" VALUES(3769,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3769,'synth',1);
+INSERT INTO "remix_tag" VALUES(3769,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3769,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3770,'collab',1);
+INSERT INTO "remix_tag" VALUES(3770,'compo',1);
+INSERT INTO "remix_tag" VALUES(3770,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3770,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3770,'epic',1);
+INSERT INTO "remix_tag" VALUES(3770,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3770,'metal',1);
+INSERT INTO "remix_tag" VALUES(3770,'rock',1);
+INSERT INTO "remix_tag" VALUES(3770,'singing',1);
+INSERT INTO "remix_tag" VALUES(3770,'synth',1);
+INSERT INTO "remix_tag" VALUES(3770,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3771,'cello',1);
+INSERT INTO "remix_tag" VALUES(3771,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3771,'classical',1);
+INSERT INTO "remix_tag" VALUES(3771,'collab',1);
+INSERT INTO "remix_tag" VALUES(3771,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3771,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3771,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3771,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3771,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3771,'strings',1);
+INSERT INTO "remix_tag" VALUES(3771,'viola',1);
+INSERT INTO "remix_tag" VALUES(3771,'violin',1);
+INSERT INTO "remix_tag" VALUES(3772,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3772,'chill',1);
+INSERT INTO "remix_tag" VALUES(3772,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3772,'didgeridoo',1);
+INSERT INTO "remix_tag" VALUES(3772,'epic',1);
+INSERT INTO "remix_tag" VALUES(3772,'folk',1);
+INSERT INTO "remix_tag" VALUES(3772,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3772,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3772,'strings',1);
+INSERT INTO "remix_tag" VALUES(3772,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3773,'bells',1);
+INSERT INTO "remix_tag" VALUES(3773,'chill',1);
+INSERT INTO "remix_tag" VALUES(3773,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3773,'classical',1);
+INSERT INTO "remix_tag" VALUES(3773,'collab',1);
+INSERT INTO "remix_tag" VALUES(3773,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3773,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3773,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3773,'singing',1);
+INSERT INTO "remix_tag" VALUES(3773,'strings',1);
+INSERT INTO "remix_tag" VALUES(3773,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3773,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3774,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3774,'chill',1);
+INSERT INTO "remix_tag" VALUES(3774,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3774,'edm',1);
+INSERT INTO "remix_tag" VALUES(3774,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3774,'flute',1);
+INSERT INTO "remix_tag" VALUES(3774,'funky',1);
+INSERT INTO "remix_tag" VALUES(3774,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3774,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3774,'medley',1);
+INSERT INTO "remix_tag" VALUES(3774,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3774,'synth',1);
+INSERT INTO "remix_tag" VALUES(3775,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3775,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3775,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3775,'epic',1);
+INSERT INTO "remix_tag" VALUES(3775,'metal',1);
+INSERT INTO "remix_tag" VALUES(3775,'synth',1);
+INSERT INTO "remix_tag" VALUES(3775,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3776,'brass',1);
+INSERT INTO "remix_tag" VALUES(3776,'choir',1);
+INSERT INTO "remix_tag" VALUES(3776,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3776,'dark',1);
+INSERT INTO "remix_tag" VALUES(3776,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3776,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3776,'epic',1);
+INSERT INTO "remix_tag" VALUES(3776,'harp',1);
+INSERT INTO "remix_tag" VALUES(3776,'medley',1);
+INSERT INTO "remix_tag" VALUES(3776,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3776,'piano',1);
+INSERT INTO "remix_tag" VALUES(3776,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3776,'strings',1);
+INSERT INTO "remix_tag" VALUES(3776,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3776,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3776,'violin',1);
+INSERT INTO "remix_tag" VALUES(3777,'dance',1);
+INSERT INTO "remix_tag" VALUES(3777,'edm',1);
+INSERT INTO "remix_tag" VALUES(3777,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3777,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3777,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3777,'synth',1);
+INSERT INTO "remix_tag" VALUES(3778,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3778,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3778,'chill',1);
+INSERT INTO "remix_tag" VALUES(3778,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3778,'dark',1);
+INSERT INTO "remix_tag" VALUES(3778,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3778,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3778,'piano',1);
+INSERT INTO "remix_tag" VALUES(3778,'rock',1);
+INSERT INTO "remix_tag" VALUES(3778,'strings',1);
+INSERT INTO "remix_tag" VALUES(3778,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3778,'synth',1);
+INSERT INTO "remix_tag" VALUES(3779,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(3779,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3779,'piano',1);
+INSERT INTO "remix_tag" VALUES(3779,'pop',1);
+INSERT INTO "remix_tag" VALUES(3779,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3779,'solo',1);
+INSERT INTO "remix_tag" VALUES(3779,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3780,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3780,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3780,'chill',1);
+INSERT INTO "remix_tag" VALUES(3780,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3780,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3780,'rock',1);
+INSERT INTO "remix_tag" VALUES(3780,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3780,'soul',1);
+INSERT INTO "remix_tag" VALUES(3780,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3781,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3781,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3781,'organ',1);
+INSERT INTO "remix_tag" VALUES(3781,'rock',1);
+INSERT INTO "remix_tag" VALUES(3782,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3782,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3782,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3782,'harp',1);
+INSERT INTO "remix_tag" VALUES(3782,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3782,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3782,'strings',1);
+INSERT INTO "remix_tag" VALUES(3782,'synth',1);
+INSERT INTO "remix_tag" VALUES(3782,'violin',1);
+INSERT INTO "remix_tag" VALUES(3783,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3783,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3783,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3783,'dark',1);
+INSERT INTO "remix_tag" VALUES(3783,'flute',1);
+INSERT INTO "remix_tag" VALUES(3783,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3783,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3783,'piano',1);
+INSERT INTO "remix_tag" VALUES(3783,'rock',1);
+INSERT INTO "remix_tag" VALUES(3783,'strings',1);
+INSERT INTO "remix_tag" VALUES(3783,'synth',1);
+INSERT INTO "remix_tag" VALUES(3784,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3784,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3784,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3784,'flute',1);
+INSERT INTO "remix_tag" VALUES(3784,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3784,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3784,'rock',1);
+INSERT INTO "remix_tag" VALUES(3784,'synth',1);
+INSERT INTO "remix_tag" VALUES(3785,'choir',1);
+INSERT INTO "remix_tag" VALUES(3785,'dark',1);
+INSERT INTO "remix_tag" VALUES(3785,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3785,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3785,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3785,'organ',1);
+INSERT INTO "remix_tag" VALUES(3785,'rock',1);
+INSERT INTO "remix_tag" VALUES(3785,'singing',1);
+INSERT INTO "remix_tag" VALUES(3785,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3785,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3786,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3786,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3786,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3786,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3786,'rock',1);
+INSERT INTO "remix_tag" VALUES(3786,'singing',1);
+INSERT INTO "remix_tag" VALUES(3786,'synth',1);
+INSERT INTO "remix_tag" VALUES(3786,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3787,'chill',1);
+INSERT INTO "remix_tag" VALUES(3787,'edm',1);
+INSERT INTO "remix_tag" VALUES(3787,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3787,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3787,'synth',1);
+INSERT INTO "remix_tag" VALUES(3787,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3787,'trance',1);
+INSERT INTO "remix_tag" VALUES(3788,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3788,'edm',1);
+INSERT INTO "remix_tag" VALUES(3788,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3788,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3788,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3788,'happy',1);
+INSERT INTO "remix_tag" VALUES(3788,'pop',1);
+INSERT INTO "remix_tag" VALUES(3788,'synth',1);
+INSERT INTO "remix_tag" VALUES(3788,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3789,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3789,'edm',1);
+INSERT INTO "remix_tag" VALUES(3789,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3789,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3789,'happy',1);
+INSERT INTO "remix_tag" VALUES(3789,'pop',1);
+INSERT INTO "remix_tag" VALUES(3789,'synth',1);
+INSERT INTO "remix_tag" VALUES(3789,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3790,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3790,'choir',1);
+INSERT INTO "remix_tag" VALUES(3790,'compo',1);
+INSERT INTO "remix_tag" VALUES(3790,'edm',1);
+INSERT INTO "remix_tag" VALUES(3790,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3790,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3790,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3790,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3790,'strings',1);
+INSERT INTO "remix_tag" VALUES(3790,'synth',1);
+INSERT INTO "remix_tag" VALUES(3790,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3790,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3791,'brass',1);
+INSERT INTO "remix_tag" VALUES(3791,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3791,'dark',1);
+INSERT INTO "remix_tag" VALUES(3791,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3791,'epic',1);
+INSERT INTO "remix_tag" VALUES(3791,'medley',1);
+INSERT INTO "remix_tag" VALUES(3791,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3791,'piano',1);
+INSERT INTO "remix_tag" VALUES(3791,'strings',1);
+INSERT INTO "remix_tag" VALUES(3791,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3791,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3792,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3792,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3792,'chill',1);
+INSERT INTO "remix_tag" VALUES(3792,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3792,'flute',1);
+INSERT INTO "remix_tag" VALUES(3792,'folk',1);
+INSERT INTO "remix_tag" VALUES(3792,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3792,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3792,'rock',1);
+INSERT INTO "remix_tag" VALUES(3792,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3793,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3793,'edm',1);
+INSERT INTO "remix_tag" VALUES(3793,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3793,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3793,'synth',1);
+INSERT INTO "remix_tag" VALUES(3793,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3793,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3794,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3794,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3794,'dark',1);
+INSERT INTO "remix_tag" VALUES(3794,'edm',1);
+INSERT INTO "remix_tag" VALUES(3794,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3794,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3794,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3794,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3794,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3794,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3794,'synth',1);
+INSERT INTO "remix_tag" VALUES(3794,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3795,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3795,'collab',1);
+INSERT INTO "remix_tag" VALUES(3795,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3795,'dark',1);
+INSERT INTO "remix_tag" VALUES(3795,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3795,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3795,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3795,'epic',1);
+INSERT INTO "remix_tag" VALUES(3795,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3795,'metal',1);
+INSERT INTO "remix_tag" VALUES(3795,'punk',1);
+INSERT INTO "remix_tag" VALUES(3795,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3796,'brass',1);
+INSERT INTO "remix_tag" VALUES(3796,'choir',1);
+INSERT INTO "remix_tag" VALUES(3796,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3796,'collab',1);
+INSERT INTO "remix_tag" VALUES(3796,'epic',1);
+INSERT INTO "remix_tag" VALUES(3796,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3796,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3796,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3796,'piano',1);
+INSERT INTO "remix_tag" VALUES(3796,'strings',1);
+INSERT INTO "remix_tag" VALUES(3796,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3796,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3796,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3796,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3796,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3797,'dark',1);
+INSERT INTO "remix_tag" VALUES(3797,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3797,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3797,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3797,'indian',1);
+INSERT INTO "remix_tag" VALUES(3797,'organ',1);
+INSERT INTO "remix_tag" VALUES(3797,'rock',1);
+INSERT INTO "remix_tag" VALUES(3797,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3797,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3798,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3798,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3798,'collab',1);
+INSERT INTO "remix_tag" VALUES(3798,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3798,'flute',1);
+INSERT INTO "remix_tag" VALUES(3798,'funky',1);
+INSERT INTO "remix_tag" VALUES(3798,'happy',1);
+INSERT INTO "remix_tag" VALUES(3798,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3798,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3798,'pop',1);
+INSERT INTO "remix_tag" VALUES(3798,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3798,'synth',1);
+INSERT INTO "remix_tag" VALUES(3798,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3798,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3799,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3799,'choir',1);
+INSERT INTO "remix_tag" VALUES(3799,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3799,'collab',1);
+INSERT INTO "remix_tag" VALUES(3799,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3799,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3799,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3799,'flute',1);
+INSERT INTO "remix_tag" VALUES(3799,'folk',1);
+INSERT INTO "remix_tag" VALUES(3799,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3799,'metal',1);
+INSERT INTO "remix_tag" VALUES(3799,'strings',1);
+INSERT INTO "remix_tag" VALUES(3800,'brass',1);
+INSERT INTO "remix_tag" VALUES(3800,'collab',1);
+INSERT INTO "remix_tag" VALUES(3800,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3800,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3800,'happy',1);
+INSERT INTO "remix_tag" VALUES(3800,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3800,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3800,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3800,'singing',1);
+INSERT INTO "remix_tag" VALUES(3800,'ska',1);
+INSERT INTO "remix_tag" VALUES(3800,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3801,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3801,'bells',1);
+INSERT INTO "remix_tag" VALUES(3801,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3801,'collab',1);
+INSERT INTO "remix_tag" VALUES(3801,'dark',1);
+INSERT INTO "remix_tag" VALUES(3801,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3801,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3801,'funky',1);
+INSERT INTO "remix_tag" VALUES(3801,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3801,'metal',1);
+INSERT INTO "remix_tag" VALUES(3801,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3801,'strings',1);
+INSERT INTO "remix_tag" VALUES(3801,'synth',1);
+INSERT INTO "remix_tag" VALUES(3802,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3802,'bells',1);
+INSERT INTO "remix_tag" VALUES(3802,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3802,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3802,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3802,'happy',1);
+INSERT INTO "remix_tag" VALUES(3802,'harp',1);
+INSERT INTO "remix_tag" VALUES(3802,'march',1);
+INSERT INTO "remix_tag" VALUES(3802,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3802,'piano',1);
+INSERT INTO "remix_tag" VALUES(3802,'strings',1);
+INSERT INTO "remix_tag" VALUES(3803,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3803,'choir',1);
+INSERT INTO "remix_tag" VALUES(3803,'flute',1);
+INSERT INTO "remix_tag" VALUES(3803,'harp',1);
+INSERT INTO "remix_tag" VALUES(3803,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3803,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3803,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3803,'singing',1);
+INSERT INTO "remix_tag" VALUES(3803,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3803,'strings',1);
+INSERT INTO "remix_tag" VALUES(3803,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3804,'bells',1);
+INSERT INTO "remix_tag" VALUES(3804,'brass',1);
+INSERT INTO "remix_tag" VALUES(3804,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3804,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3804,'epic',1);
+INSERT INTO "remix_tag" VALUES(3804,'flute',1);
+INSERT INTO "remix_tag" VALUES(3804,'march',1);
+INSERT INTO "remix_tag" VALUES(3804,'strings',1);
+INSERT INTO "remix_tag" VALUES(3804,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3804,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3805,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3805,'brass',1);
+INSERT INTO "remix_tag" VALUES(3805,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3805,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3805,'march',1);
+INSERT INTO "remix_tag" VALUES(3805,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3805,'piano',1);
+INSERT INTO "remix_tag" VALUES(3805,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3805,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3805,'synth',1);
+INSERT INTO "remix_tag" VALUES(3805,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3805,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3806,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3806,'dark',1);
+INSERT INTO "remix_tag" VALUES(3806,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3806,'metal',1);
+INSERT INTO "remix_tag" VALUES(3806,'piano',1);
+INSERT INTO "remix_tag" VALUES(3806,'rock',1);
+INSERT INTO "remix_tag" VALUES(3806,'strings',1);
+INSERT INTO "remix_tag" VALUES(3807,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3807,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3807,'folk',1);
+INSERT INTO "remix_tag" VALUES(3807,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3807,'happy',1);
+INSERT INTO "remix_tag" VALUES(3807,'harp',1);
+INSERT INTO "remix_tag" VALUES(3807,'march',1);
+INSERT INTO "remix_tag" VALUES(3807,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3807,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3808,'choir',1);
+INSERT INTO "remix_tag" VALUES(3808,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3808,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3808,'dark',1);
+INSERT INTO "remix_tag" VALUES(3808,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3808,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3808,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(3808,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3808,'piano',1);
+INSERT INTO "remix_tag" VALUES(3808,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3808,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3808,'strings',1);
+INSERT INTO "remix_tag" VALUES(3808,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3809,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3809,'edm',1);
+INSERT INTO "remix_tag" VALUES(3809,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3809,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3809,'funky',1);
+INSERT INTO "remix_tag" VALUES(3809,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3809,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3809,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3809,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3809,'synth',1);
+INSERT INTO "remix_tag" VALUES(3810,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3810,'collab',1);
+INSERT INTO "remix_tag" VALUES(3810,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3810,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3810,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3810,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3810,'synth',1);
+INSERT INTO "remix_tag" VALUES(3811,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3811,'collab',1);
+INSERT INTO "remix_tag" VALUES(3811,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3811,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3811,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3811,'piano',1);
+INSERT INTO "remix_tag" VALUES(3811,'pop',1);
+INSERT INTO "remix_tag" VALUES(3811,'rock',1);
+INSERT INTO "remix_tag" VALUES(3811,'singing',1);
+INSERT INTO "remix_tag" VALUES(3811,'strings',1);
+INSERT INTO "remix_tag" VALUES(3811,'synth',1);
+INSERT INTO "remix_tag" VALUES(3811,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3811,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3812,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3812,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3812,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3812,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3812,'funk',1);
+INSERT INTO "remix_tag" VALUES(3812,'funky',1);
+INSERT INTO "remix_tag" VALUES(3812,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3812,'happy',1);
+INSERT INTO "remix_tag" VALUES(3812,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3812,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3812,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3812,'synth',1);
+INSERT INTO "remix_tag" VALUES(3812,'turntable',1);
+INSERT INTO "remix_tag" VALUES(3813,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3813,'bells',1);
+INSERT INTO "remix_tag" VALUES(3813,'classical',1);
+INSERT INTO "remix_tag" VALUES(3813,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3813,'piano',1);
+INSERT INTO "remix_tag" VALUES(3813,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3813,'strings',1);
+INSERT INTO "remix_tag" VALUES(3814,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3814,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3814,'dark',1);
+INSERT INTO "remix_tag" VALUES(3814,'flute',1);
+INSERT INTO "remix_tag" VALUES(3814,'folk',1);
+INSERT INTO "remix_tag" VALUES(3814,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3814,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3814,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3814,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3814,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3814,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3814,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3814,'strings',1);
+INSERT INTO "remix_tag" VALUES(3815,'edm',1);
+INSERT INTO "remix_tag" VALUES(3815,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3815,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3815,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3815,'funk',1);
+INSERT INTO "remix_tag" VALUES(3815,'funky',1);
+INSERT INTO "remix_tag" VALUES(3815,'synth',1);
+INSERT INTO "remix_tag" VALUES(3815,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3816,'edm',1);
+INSERT INTO "remix_tag" VALUES(3816,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3816,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3816,'funky',1);
+INSERT INTO "remix_tag" VALUES(3816,'house',1);
+INSERT INTO "remix_tag" VALUES(3816,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3816,'synth',1);
+INSERT INTO "remix_tag" VALUES(3816,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3817,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3817,'bells',1);
+INSERT INTO "remix_tag" VALUES(3817,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3817,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3817,'flute',1);
+INSERT INTO "remix_tag" VALUES(3817,'march',1);
+INSERT INTO "remix_tag" VALUES(3817,'metal',1);
+INSERT INTO "remix_tag" VALUES(3817,'strings',1);
+INSERT INTO "remix_tag" VALUES(3817,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3817,'synth',1);
+INSERT INTO "remix_tag" VALUES(3818,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3818,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3818,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(3818,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3818,'piano',1);
+INSERT INTO "remix_tag" VALUES(3818,'pop',1);
+INSERT INTO "remix_tag" VALUES(3818,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3818,'sad',1);
+INSERT INTO "remix_tag" VALUES(3818,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3818,'solo',1);
+INSERT INTO "remix_tag" VALUES(3818,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3819,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3819,'classical',1);
+INSERT INTO "remix_tag" VALUES(3819,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3819,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3819,'piano',1);
+INSERT INTO "remix_tag" VALUES(3819,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3819,'solo',1);
+INSERT INTO "remix_tag" VALUES(3819,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3819,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3820,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3820,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3820,'edm',1);
+INSERT INTO "remix_tag" VALUES(3820,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3820,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3820,'folk',1);
+INSERT INTO "remix_tag" VALUES(3820,'funky',1);
+INSERT INTO "remix_tag" VALUES(3820,'happy',1);
+INSERT INTO "remix_tag" VALUES(3820,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3820,'synth',1);
+INSERT INTO "remix_tag" VALUES(3821,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3821,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3821,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3821,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3821,'funky',1);
+INSERT INTO "remix_tag" VALUES(3821,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3821,'synth',1);
+INSERT INTO "remix_tag" VALUES(3822,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3822,'bells',1);
+INSERT INTO "remix_tag" VALUES(3822,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3822,'choir',1);
+INSERT INTO "remix_tag" VALUES(3822,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3822,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3822,'epic',1);
+INSERT INTO "remix_tag" VALUES(3822,'flute',1);
+INSERT INTO "remix_tag" VALUES(3822,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3822,'happy',1);
+INSERT INTO "remix_tag" VALUES(3822,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3822,'piano',1);
+INSERT INTO "remix_tag" VALUES(3822,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3822,'strings',1);
+INSERT INTO "remix_tag" VALUES(3822,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3822,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3822,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3823,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3823,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3823,'funk',1);
+INSERT INTO "remix_tag" VALUES(3823,'funky',1);
+INSERT INTO "remix_tag" VALUES(3823,'happy',1);
+INSERT INTO "remix_tag" VALUES(3823,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3823,'pop',1);
+INSERT INTO "remix_tag" VALUES(3823,'synth',1);
+INSERT INTO "remix_tag" VALUES(3824,'choir',1);
+INSERT INTO "remix_tag" VALUES(3824,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3824,'edm',1);
+INSERT INTO "remix_tag" VALUES(3824,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3824,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3824,'flute',1);
+INSERT INTO "remix_tag" VALUES(3824,'funk',1);
+INSERT INTO "remix_tag" VALUES(3824,'funky',1);
+INSERT INTO "remix_tag" VALUES(3824,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3824,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3824,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3824,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3824,'strings',1);
+INSERT INTO "remix_tag" VALUES(3824,'synth',1);
+INSERT INTO "remix_tag" VALUES(3824,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3825,'bells',1);
+INSERT INTO "remix_tag" VALUES(3825,'cello',1);
+INSERT INTO "remix_tag" VALUES(3825,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3825,'classical',1);
+INSERT INTO "remix_tag" VALUES(3825,'collab',1);
+INSERT INTO "remix_tag" VALUES(3825,'flute',1);
+INSERT INTO "remix_tag" VALUES(3825,'happy',1);
+INSERT INTO "remix_tag" VALUES(3825,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3825,'trio',1);
+INSERT INTO "remix_tag" VALUES(3825,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3826,'chill',1);
+INSERT INTO "remix_tag" VALUES(3826,'collab',1);
+INSERT INTO "remix_tag" VALUES(3826,'edm',1);
+INSERT INTO "remix_tag" VALUES(3826,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3826,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3826,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3826,'funky',1);
+INSERT INTO "remix_tag" VALUES(3826,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3826,'pop',1);
+INSERT INTO "remix_tag" VALUES(3826,'singing',1);
+INSERT INTO "remix_tag" VALUES(3826,'synth',1);
+INSERT INTO "remix_tag" VALUES(3826,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3826,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3826,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3827,'collab',1);
+INSERT INTO "remix_tag" VALUES(3827,'dark',1);
+INSERT INTO "remix_tag" VALUES(3827,'edm',1);
+INSERT INTO "remix_tag" VALUES(3827,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3827,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3827,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3827,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3827,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3827,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3827,'synth',1);
+INSERT INTO "remix_tag" VALUES(3828,'bells',1);
+INSERT INTO "remix_tag" VALUES(3828,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3828,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3828,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3828,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3828,'rock',1);
+INSERT INTO "remix_tag" VALUES(3828,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3829,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3829,'folk',1);
+INSERT INTO "remix_tag" VALUES(3829,'happy',1);
+INSERT INTO "remix_tag" VALUES(3829,'harp',1);
+INSERT INTO "remix_tag" VALUES(3829,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3829,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3829,'piano',1);
+INSERT INTO "remix_tag" VALUES(3829,'singing',1);
+INSERT INTO "remix_tag" VALUES(3829,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(3829,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3829,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3829,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3830,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3830,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3830,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3830,'funky',1);
+INSERT INTO "remix_tag" VALUES(3830,'happy',1);
+INSERT INTO "remix_tag" VALUES(3830,'pop',1);
+INSERT INTO "remix_tag" VALUES(3830,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3830,'synth',1);
+INSERT INTO "remix_tag" VALUES(3831,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3831,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3831,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3831,'latin',1);
+INSERT INTO "remix_tag" VALUES(3831,'south-american',1);
+INSERT INTO "remix_tag" VALUES(3831,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3832,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3832,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3832,'funky',1);
+INSERT INTO "remix_tag" VALUES(3832,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3832,'marimba',1);
+INSERT INTO "remix_tag" VALUES(3832,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3832,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3832,'synth',1);
+INSERT INTO "remix_tag" VALUES(3833,'edm',1);
+INSERT INTO "remix_tag" VALUES(3833,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3833,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3833,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3833,'synth',1);
+INSERT INTO "remix_tag" VALUES(3833,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3834,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3834,'bells',1);
+INSERT INTO "remix_tag" VALUES(3834,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3834,'flute',1);
+INSERT INTO "remix_tag" VALUES(3834,'folk',1);
+INSERT INTO "remix_tag" VALUES(3834,'harp',1);
+INSERT INTO "remix_tag" VALUES(3834,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3834,'strings',1);
+INSERT INTO "remix_tag" VALUES(3834,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3834,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3835,'chill',1);
+INSERT INTO "remix_tag" VALUES(3835,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3835,'dance',1);
+INSERT INTO "remix_tag" VALUES(3835,'dark',1);
+INSERT INTO "remix_tag" VALUES(3835,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3835,'piano',1);
+INSERT INTO "remix_tag" VALUES(3835,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3835,'synth',1);
+INSERT INTO "remix_tag" VALUES(3835,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3836,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3836,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3836,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3836,'choir',1);
+INSERT INTO "remix_tag" VALUES(3836,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3836,'flute',1);
+INSERT INTO "remix_tag" VALUES(3836,'folk',1);
+INSERT INTO "remix_tag" VALUES(3836,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3836,'native-american',1);
+INSERT INTO "remix_tag" VALUES(3836,'rock',1);
+INSERT INTO "remix_tag" VALUES(3837,'brass',1);
+INSERT INTO "remix_tag" VALUES(3837,'choir',1);
+INSERT INTO "remix_tag" VALUES(3837,'dark',1);
+INSERT INTO "remix_tag" VALUES(3837,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3837,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3837,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3837,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3837,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3837,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3837,'synth',1);
+INSERT INTO "remix_tag" VALUES(3837,'trap',1);
+INSERT INTO "remix_tag" VALUES(3838,'brass',1);
+INSERT INTO "remix_tag" VALUES(3838,'cello',1);
+INSERT INTO "remix_tag" VALUES(3838,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3838,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3838,'classical',1);
+INSERT INTO "remix_tag" VALUES(3838,'flute',1);
+INSERT INTO "remix_tag" VALUES(3838,'happy',1);
+INSERT INTO "remix_tag" VALUES(3838,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3838,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3838,'piano',1);
+INSERT INTO "remix_tag" VALUES(3838,'singing',1);
+INSERT INTO "remix_tag" VALUES(3838,'strings',1);
+INSERT INTO "remix_tag" VALUES(3838,'violin',1);
+INSERT INTO "remix_tag" VALUES(3838,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3839,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3839,'bells',1);
+INSERT INTO "remix_tag" VALUES(3839,'chill',1);
+INSERT INTO "remix_tag" VALUES(3839,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3839,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3839,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3839,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3839,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3839,'synth',1);
+INSERT INTO "remix_tag" VALUES(3839,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3840,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3840,'edm',1);
+INSERT INTO "remix_tag" VALUES(3840,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3840,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3840,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3840,'synth',1);
+INSERT INTO "remix_tag" VALUES(3840,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3841,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3841,'brass',1);
+INSERT INTO "remix_tag" VALUES(3841,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3841,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3841,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3841,'rock',1);
+INSERT INTO "remix_tag" VALUES(3841,'strings',1);
+INSERT INTO "remix_tag" VALUES(3841,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3842,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3842,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3842,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3842,'edm',1);
+INSERT INTO "remix_tag" VALUES(3842,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3842,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3842,'happy',1);
+INSERT INTO "remix_tag" VALUES(3842,'piano',1);
+INSERT INTO "remix_tag" VALUES(3842,'synth',1);
+INSERT INTO "remix_tag" VALUES(3843,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3843,'flute',1);
+INSERT INTO "remix_tag" VALUES(3843,'folk',1);
+INSERT INTO "remix_tag" VALUES(3843,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3843,'harp',1);
+INSERT INTO "remix_tag" VALUES(3843,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3843,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3843,'sad',1);
+INSERT INTO "remix_tag" VALUES(3843,'strings',1);
+INSERT INTO "remix_tag" VALUES(3843,'violin',1);
+INSERT INTO "remix_tag" VALUES(3843,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3844,'brass',1);
+INSERT INTO "remix_tag" VALUES(3844,'choir',1);
+INSERT INTO "remix_tag" VALUES(3844,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3844,'epic',1);
+INSERT INTO "remix_tag" VALUES(3844,'harp',1);
+INSERT INTO "remix_tag" VALUES(3844,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3844,'piano',1);
+INSERT INTO "remix_tag" VALUES(3844,'strings',1);
+INSERT INTO "remix_tag" VALUES(3844,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3844,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3844,'synth',1);
+INSERT INTO "remix_tag" VALUES(3844,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3845,'brass',1);
+INSERT INTO "remix_tag" VALUES(3845,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3845,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3845,'happy',1);
+INSERT INTO "remix_tag" VALUES(3845,'march',1);
+INSERT INTO "remix_tag" VALUES(3845,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3845,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3845,'strings',1);
+INSERT INTO "remix_tag" VALUES(3845,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3845,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3846,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3846,'collab',1);
+INSERT INTO "remix_tag" VALUES(3846,'dark',1);
+INSERT INTO "remix_tag" VALUES(3846,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3846,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3846,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3846,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3846,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3846,'synth',1);
+INSERT INTO "remix_tag" VALUES(3846,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3846,'workout',1);
+INSERT INTO "remix_tag" VALUES(3847,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3847,'dark',1);
+INSERT INTO "remix_tag" VALUES(3847,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3847,'edm',1);
+INSERT INTO "remix_tag" VALUES(3847,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3847,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3847,'strings',1);
+INSERT INTO "remix_tag" VALUES(3847,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3847,'synth',1);
+INSERT INTO "remix_tag" VALUES(3847,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3847,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3848,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3848,'brass',1);
+INSERT INTO "remix_tag" VALUES(3848,'edm',1);
+INSERT INTO "remix_tag" VALUES(3848,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3848,'folk',1);
+INSERT INTO "remix_tag" VALUES(3848,'funny',1);
+INSERT INTO "remix_tag" VALUES(3848,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3848,'happy',1);
+INSERT INTO "remix_tag" VALUES(3848,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3848,'organ',1);
+INSERT INTO "remix_tag" VALUES(3848,'reggae',1);
+INSERT INTO "remix_tag" VALUES(3849,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3849,'dance',1);
+INSERT INTO "remix_tag" VALUES(3849,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3849,'piano',1);
+INSERT INTO "remix_tag" VALUES(3849,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3849,'synth',1);
+INSERT INTO "remix_tag" VALUES(3849,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3849,'workout',1);
+INSERT INTO "remix_tag" VALUES(3850,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3850,'dark',1);
+INSERT INTO "remix_tag" VALUES(3850,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3850,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3850,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3850,'metal',1);
+INSERT INTO "remix_tag" VALUES(3850,'synth',1);
+INSERT INTO "remix_tag" VALUES(3851,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3851,'bells',1);
+INSERT INTO "remix_tag" VALUES(3851,'chill',1);
+INSERT INTO "remix_tag" VALUES(3851,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3851,'flute',1);
+INSERT INTO "remix_tag" VALUES(3851,'harp',1);
+INSERT INTO "remix_tag" VALUES(3851,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3851,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3851,'strings',1);
+INSERT INTO "remix_tag" VALUES(3851,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3852,'chill',1);
+INSERT INTO "remix_tag" VALUES(3852,'dark',1);
+INSERT INTO "remix_tag" VALUES(3852,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3852,'march',1);
+INSERT INTO "remix_tag" VALUES(3852,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3852,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3852,'rock',1);
+INSERT INTO "remix_tag" VALUES(3852,'synth',1);
+INSERT INTO "remix_tag" VALUES(3852,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3852,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3852,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3853,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3853,'edm',1);
+INSERT INTO "remix_tag" VALUES(3853,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3853,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3853,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3853,'happy',1);
+INSERT INTO "remix_tag" VALUES(3853,'synth',1);
+INSERT INTO "remix_tag" VALUES(3854,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3854,'metal',1);
+INSERT INTO "remix_tag" VALUES(3854,'organ',1);
+INSERT INTO "remix_tag" VALUES(3854,'piano',1);
+INSERT INTO "remix_tag" VALUES(3854,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3854,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3854,'synth',1);
+INSERT INTO "remix_tag" VALUES(3855,'bells',1);
+INSERT INTO "remix_tag" VALUES(3855,'brass',1);
+INSERT INTO "remix_tag" VALUES(3855,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3855,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3855,'collab',1);
+INSERT INTO "remix_tag" VALUES(3855,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3855,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3855,'epic',1);
+INSERT INTO "remix_tag" VALUES(3855,'folk',1);
+INSERT INTO "remix_tag" VALUES(3855,'harp',1);
+INSERT INTO "remix_tag" VALUES(3855,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3855,'march',1);
+INSERT INTO "remix_tag" VALUES(3855,'medley',1);
+INSERT INTO "remix_tag" VALUES(3855,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3855,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3855,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3855,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3855,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3855,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3856,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3856,'collab',1);
+INSERT INTO "remix_tag" VALUES(3856,'folk',1);
+INSERT INTO "remix_tag" VALUES(3856,'happy',1);
+INSERT INTO "remix_tag" VALUES(3856,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3856,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3856,'piano',1);
+INSERT INTO "remix_tag" VALUES(3856,'strings',1);
+INSERT INTO "remix_tag" VALUES(3856,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3856,'waltz',1);
+INSERT INTO "remix_tag" VALUES(3857,'cello',1);
+INSERT INTO "remix_tag" VALUES(3857,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3857,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3857,'funk',1);
+INSERT INTO "remix_tag" VALUES(3857,'rock',1);
+INSERT INTO "remix_tag" VALUES(3857,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3857,'synth',1);
+INSERT INTO "remix_tag" VALUES(3857,'viola',1);
+INSERT INTO "remix_tag" VALUES(3858,'disco',1);
+INSERT INTO "remix_tag" VALUES(3858,'edm',1);
+INSERT INTO "remix_tag" VALUES(3858,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3858,'funky',1);
+INSERT INTO "remix_tag" VALUES(3858,'happy',1);
+INSERT INTO "remix_tag" VALUES(3858,'pop',1);
+INSERT INTO "remix_tag" VALUES(3858,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3858,'synth',1);
+INSERT INTO "remix_tag" VALUES(3858,'trance',1);
+INSERT INTO "remix_tag" VALUES(3859,'brass',1);
+INSERT INTO "remix_tag" VALUES(3859,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3859,'collab',1);
+INSERT INTO "remix_tag" VALUES(3859,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3859,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3859,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3859,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3859,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3859,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3859,'strings',1);
+INSERT INTO "remix_tag" VALUES(3859,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3859,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3859,'wedding',1);
+INSERT INTO "remix_tag" VALUES(3859,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3860,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3860,'angry',1);
+INSERT INTO "remix_tag" VALUES(3860,'dark',1);
+INSERT INTO "remix_tag" VALUES(3860,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3860,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3860,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3860,'metal',1);
+INSERT INTO "remix_tag" VALUES(3860,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3860,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3861,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3861,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3861,'bells',1);
+INSERT INTO "remix_tag" VALUES(3861,'chill',1);
+INSERT INTO "remix_tag" VALUES(3861,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3861,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3861,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3861,'rock',1);
+INSERT INTO "remix_tag" VALUES(3861,'synth',1);
+INSERT INTO "remix_tag" VALUES(3862,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3862,'bells',1);
+INSERT INTO "remix_tag" VALUES(3862,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3862,'classical',1);
+INSERT INTO "remix_tag" VALUES(3862,'collab',1);
+INSERT INTO "remix_tag" VALUES(3862,'flute',1);
+INSERT INTO "remix_tag" VALUES(3862,'folk',1);
+INSERT INTO "remix_tag" VALUES(3862,'happy',1);
+INSERT INTO "remix_tag" VALUES(3862,'harp',1);
+INSERT INTO "remix_tag" VALUES(3862,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3862,'medley',1);
+INSERT INTO "remix_tag" VALUES(3862,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3862,'strings',1);
+INSERT INTO "remix_tag" VALUES(3862,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3862,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3863,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3863,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3863,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3863,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3863,'metal',1);
+INSERT INTO "remix_tag" VALUES(3863,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3864,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3864,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3864,'classical',1);
+INSERT INTO "remix_tag" VALUES(3864,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3864,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3864,'piano',1);
+INSERT INTO "remix_tag" VALUES(3864,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3864,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3864,'strings',1);
+INSERT INTO "remix_tag" VALUES(3865,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3865,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3865,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3865,'happy',1);
+INSERT INTO "remix_tag" VALUES(3865,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3865,'metal',1);
+INSERT INTO "remix_tag" VALUES(3865,'strings',1);
+INSERT INTO "remix_tag" VALUES(3865,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3865,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3866,'brass',1);
+INSERT INTO "remix_tag" VALUES(3866,'choir',1);
+INSERT INTO "remix_tag" VALUES(3866,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3866,'epic',1);
+INSERT INTO "remix_tag" VALUES(3866,'harp',1);
+INSERT INTO "remix_tag" VALUES(3866,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3866,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3866,'piano',1);
+INSERT INTO "remix_tag" VALUES(3866,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3866,'strings',1);
+INSERT INTO "remix_tag" VALUES(3866,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3866,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3867,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3867,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3867,'dark',1);
+INSERT INTO "remix_tag" VALUES(3867,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3867,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3867,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3867,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3867,'metal',1);
+INSERT INTO "remix_tag" VALUES(3867,'strings',1);
+INSERT INTO "remix_tag" VALUES(3868,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3868,'classical',1);
+INSERT INTO "remix_tag" VALUES(3868,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3868,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3868,'happy',1);
+INSERT INTO "remix_tag" VALUES(3868,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3868,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3868,'piano',1);
+INSERT INTO "remix_tag" VALUES(3868,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3868,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3868,'strings',1);
+INSERT INTO "remix_tag" VALUES(3868,'synth',1);
+INSERT INTO "remix_tag" VALUES(3869,'bells',1);
+INSERT INTO "remix_tag" VALUES(3869,'chill',1);
+INSERT INTO "remix_tag" VALUES(3869,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3869,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3869,'flute',1);
+INSERT INTO "remix_tag" VALUES(3869,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3869,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3869,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3869,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3870,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3870,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3870,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3870,'classical',1);
+INSERT INTO "remix_tag" VALUES(3870,'folk',1);
+INSERT INTO "remix_tag" VALUES(3870,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3870,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3870,'piano',1);
+INSERT INTO "remix_tag" VALUES(3870,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3870,'violin',1);
+INSERT INTO "remix_tag" VALUES(3871,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3871,'dark',1);
+INSERT INTO "remix_tag" VALUES(3871,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3871,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3871,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3871,'epic',1);
+INSERT INTO "remix_tag" VALUES(3871,'medley',1);
+INSERT INTO "remix_tag" VALUES(3871,'metal',1);
+INSERT INTO "remix_tag" VALUES(3871,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3872,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3872,'chill',1);
+INSERT INTO "remix_tag" VALUES(3872,'collab',1);
+INSERT INTO "remix_tag" VALUES(3872,'dark',1);
+INSERT INTO "remix_tag" VALUES(3872,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3872,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3872,'organ',1);
+INSERT INTO "remix_tag" VALUES(3872,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3872,'rock',1);
+INSERT INTO "remix_tag" VALUES(3872,'sad',1);
+INSERT INTO "remix_tag" VALUES(3872,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3872,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(3873,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3873,'chill',1);
+INSERT INTO "remix_tag" VALUES(3873,'choir',1);
+INSERT INTO "remix_tag" VALUES(3873,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3873,'edm',1);
+INSERT INTO "remix_tag" VALUES(3873,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3873,'happy',1);
+INSERT INTO "remix_tag" VALUES(3873,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3873,'synth',1);
+INSERT INTO "remix_tag" VALUES(3874,'bells',1);
+INSERT INTO "remix_tag" VALUES(3874,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3874,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3874,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3874,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3874,'happy',1);
+INSERT INTO "remix_tag" VALUES(3874,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3874,'rock',1);
+INSERT INTO "remix_tag" VALUES(3874,'synth',1);
+INSERT INTO "remix_tag" VALUES(3874,'ukulele',1);
+INSERT INTO "remix_tag" VALUES(3875,'chill',1);
+INSERT INTO "remix_tag" VALUES(3875,'choir',1);
+INSERT INTO "remix_tag" VALUES(3875,'edm',1);
+INSERT INTO "remix_tag" VALUES(3875,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3875,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3875,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3875,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3875,'synth',1);
+INSERT INTO "remix_tag" VALUES(3875,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3876,'choir',1);
+INSERT INTO "remix_tag" VALUES(3876,'edm',1);
+INSERT INTO "remix_tag" VALUES(3876,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3876,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3876,'synth',1);
+INSERT INTO "remix_tag" VALUES(3876,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3877,'bells',1);
+INSERT INTO "remix_tag" VALUES(3877,'chill',1);
+INSERT INTO "remix_tag" VALUES(3877,'collab',1);
+INSERT INTO "remix_tag" VALUES(3877,'flute',1);
+INSERT INTO "remix_tag" VALUES(3877,'folk',1);
+INSERT INTO "remix_tag" VALUES(3877,'harp',1);
+INSERT INTO "remix_tag" VALUES(3877,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3877,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3877,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3877,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3877,'strings',1);
+INSERT INTO "remix_tag" VALUES(3877,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3878,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3878,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3878,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3878,'rock',1);
+INSERT INTO "remix_tag" VALUES(3878,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3879,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3879,'brass',1);
+INSERT INTO "remix_tag" VALUES(3879,'choir',1);
+INSERT INTO "remix_tag" VALUES(3879,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3879,'collab',1);
+INSERT INTO "remix_tag" VALUES(3879,'compo',1);
+INSERT INTO "remix_tag" VALUES(3879,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3879,'epic',1);
+INSERT INTO "remix_tag" VALUES(3879,'flute',1);
+INSERT INTO "remix_tag" VALUES(3879,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3879,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3879,'march',1);
+INSERT INTO "remix_tag" VALUES(3879,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3879,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3879,'singing',1);
+INSERT INTO "remix_tag" VALUES(3879,'strings',1);
+INSERT INTO "remix_tag" VALUES(3879,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3879,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3879,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3879,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3880,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3880,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3880,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3880,'flute',1);
+INSERT INTO "remix_tag" VALUES(3880,'folk',1);
+INSERT INTO "remix_tag" VALUES(3880,'funny',1);
+INSERT INTO "remix_tag" VALUES(3880,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3880,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(3880,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3880,'singing',1);
+INSERT INTO "remix_tag" VALUES(3880,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3880,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3881,'bells',1);
+INSERT INTO "remix_tag" VALUES(3881,'chill',1);
+INSERT INTO "remix_tag" VALUES(3881,'edm',1);
+INSERT INTO "remix_tag" VALUES(3881,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3881,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3881,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3881,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3881,'piano',1);
+INSERT INTO "remix_tag" VALUES(3881,'pop',1);
+INSERT INTO "remix_tag" VALUES(3881,'singing',1);
+INSERT INTO "remix_tag" VALUES(3881,'strings',1);
+INSERT INTO "remix_tag" VALUES(3881,'synth',1);
+INSERT INTO "remix_tag" VALUES(3881,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3882,'brass',1);
+INSERT INTO "remix_tag" VALUES(3882,'chill',1);
+INSERT INTO "remix_tag" VALUES(3882,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3882,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3882,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3882,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3882,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3882,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3882,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3882,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3883,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3883,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(3883,'chill',1);
+INSERT INTO "remix_tag" VALUES(3883,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3883,'folk',1);
+INSERT INTO "remix_tag" VALUES(3883,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3883,'harp',1);
+INSERT INTO "remix_tag" VALUES(3883,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3883,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3883,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3883,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3883,'piano',1);
+INSERT INTO "remix_tag" VALUES(3883,'singing',1);
+INSERT INTO "remix_tag" VALUES(3883,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3883,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3884,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3884,'edm',1);
+INSERT INTO "remix_tag" VALUES(3884,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3884,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3884,'happy',1);
+INSERT INTO "remix_tag" VALUES(3884,'pop',1);
+INSERT INTO "remix_tag" VALUES(3884,'synth',1);
+INSERT INTO "remix_tag" VALUES(3885,'brass',1);
+INSERT INTO "remix_tag" VALUES(3885,'choir',1);
+INSERT INTO "remix_tag" VALUES(3885,'epic',1);
+INSERT INTO "remix_tag" VALUES(3885,'harp',1);
+INSERT INTO "remix_tag" VALUES(3885,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3885,'strings',1);
+INSERT INTO "remix_tag" VALUES(3885,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3885,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3886,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3886,'chill',1);
+INSERT INTO "remix_tag" VALUES(3886,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3886,'collab',1);
+INSERT INTO "remix_tag" VALUES(3886,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3886,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3886,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3886,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3886,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3886,'piano',1);
+INSERT INTO "remix_tag" VALUES(3886,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3886,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3887,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3887,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3887,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3887,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3887,'funky',1);
+INSERT INTO "remix_tag" VALUES(3887,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3887,'pop',1);
+INSERT INTO "remix_tag" VALUES(3887,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3887,'rock',1);
+INSERT INTO "remix_tag" VALUES(3887,'synth',1);
+INSERT INTO "remix_tag" VALUES(3888,'chill',1);
+INSERT INTO "remix_tag" VALUES(3888,'collab',1);
+INSERT INTO "remix_tag" VALUES(3888,'dance',1);
+INSERT INTO "remix_tag" VALUES(3888,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3888,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3888,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3888,'pop',1);
+INSERT INTO "remix_tag" VALUES(3888,'singing',1);
+INSERT INTO "remix_tag" VALUES(3888,'synth',1);
+INSERT INTO "remix_tag" VALUES(3888,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3889,'brass',1);
+INSERT INTO "remix_tag" VALUES(3889,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3889,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3889,'epic',1);
+INSERT INTO "remix_tag" VALUES(3889,'flute',1);
+INSERT INTO "remix_tag" VALUES(3889,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3889,'piano',1);
+INSERT INTO "remix_tag" VALUES(3889,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3889,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3889,'strings',1);
+INSERT INTO "remix_tag" VALUES(3889,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3890,'collab',1);
+INSERT INTO "remix_tag" VALUES(3890,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3890,'funky',1);
+INSERT INTO "remix_tag" VALUES(3890,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3890,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3890,'rap',1);
+INSERT INTO "remix_tag" VALUES(3890,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3890,'singing',1);
+INSERT INTO "remix_tag" VALUES(3890,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3890,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3891,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3891,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3891,'piano',1);
+INSERT INTO "remix_tag" VALUES(3891,'pop',1);
+INSERT INTO "remix_tag" VALUES(3891,'rock',1);
+INSERT INTO "remix_tag" VALUES(3891,'synth',1);
+INSERT INTO "remix_tag" VALUES(3891,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3892,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3892,'edm',1);
+INSERT INTO "remix_tag" VALUES(3892,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3892,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3892,'happy',1);
+INSERT INTO "remix_tag" VALUES(3892,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3892,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3892,'synth',1);
+INSERT INTO "remix_tag" VALUES(3892,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3893,'chill',1);
+INSERT INTO "remix_tag" VALUES(3893,'choir',1);
+INSERT INTO "remix_tag" VALUES(3893,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3893,'collab',1);
+INSERT INTO "remix_tag" VALUES(3893,'dark',1);
+INSERT INTO "remix_tag" VALUES(3893,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3893,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3893,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3893,'singing',1);
+INSERT INTO "remix_tag" VALUES(3893,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3893,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3893,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3894,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3894,'bells',1);
+INSERT INTO "remix_tag" VALUES(3894,'cello',1);
+INSERT INTO "remix_tag" VALUES(3894,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3894,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3894,'collab',1);
+INSERT INTO "remix_tag" VALUES(3894,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3894,'flute',1);
+INSERT INTO "remix_tag" VALUES(3894,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3894,'harp',1);
+INSERT INTO "remix_tag" VALUES(3894,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3894,'medley',1);
+INSERT INTO "remix_tag" VALUES(3894,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3894,'piano',1);
+INSERT INTO "remix_tag" VALUES(3894,'strings',1);
+INSERT INTO "remix_tag" VALUES(3894,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3894,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3894,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3894,'trombone',1);
+INSERT INTO "remix_tag" VALUES(3894,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3894,'viola',1);
+INSERT INTO "remix_tag" VALUES(3894,'violin',1);
+INSERT INTO "remix_tag" VALUES(3894,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3895,'bells',1);
+INSERT INTO "remix_tag" VALUES(3895,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3895,'classical',1);
+INSERT INTO "remix_tag" VALUES(3895,'dark',1);
+INSERT INTO "remix_tag" VALUES(3895,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3895,'flute',1);
+INSERT INTO "remix_tag" VALUES(3895,'harp',1);
+INSERT INTO "remix_tag" VALUES(3895,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3895,'strings',1);
+INSERT INTO "remix_tag" VALUES(3895,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3896,'dance',1);
+INSERT INTO "remix_tag" VALUES(3896,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3896,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3896,'pop',1);
+INSERT INTO "remix_tag" VALUES(3896,'synth',1);
+INSERT INTO "remix_tag" VALUES(3896,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3896,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3897,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3897,'edm',1);
+INSERT INTO "remix_tag" VALUES(3897,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3897,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3897,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3897,'piano',1);
+INSERT INTO "remix_tag" VALUES(3897,'rock',1);
+INSERT INTO "remix_tag" VALUES(3897,'synth',1);
+INSERT INTO "remix_tag" VALUES(3898,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3898,'edm',1);
+INSERT INTO "remix_tag" VALUES(3898,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3898,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3898,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3898,'rock',1);
+INSERT INTO "remix_tag" VALUES(3898,'synth',1);
+INSERT INTO "remix_tag" VALUES(3899,'edm',1);
+INSERT INTO "remix_tag" VALUES(3899,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3899,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3899,'folk',1);
+INSERT INTO "remix_tag" VALUES(3899,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3899,'koto',1);
+INSERT INTO "remix_tag" VALUES(3899,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3899,'strings',1);
+INSERT INTO "remix_tag" VALUES(3899,'synth',1);
+INSERT INTO "remix_tag" VALUES(3899,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3899,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3900,'african',1);
+INSERT INTO "remix_tag" VALUES(3900,'balafon',1);
+INSERT INTO "remix_tag" VALUES(3900,'cello',1);
+INSERT INTO "remix_tag" VALUES(3900,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3900,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3900,'folk',1);
+INSERT INTO "remix_tag" VALUES(3900,'happy',1);
+INSERT INTO "remix_tag" VALUES(3900,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(3900,'japanese',1);
+INSERT INTO "remix_tag" VALUES(3900,'koto',1);
+INSERT INTO "remix_tag" VALUES(3900,'piano',1);
+INSERT INTO "remix_tag" VALUES(3900,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3900,'ukulele',1);
+INSERT INTO "remix_tag" VALUES(3900,'violin',1);
+INSERT INTO "remix_tag" VALUES(3900,'world',1);
+INSERT INTO "remix_tag" VALUES(3901,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3901,'brass',1);
+INSERT INTO "remix_tag" VALUES(3901,'collab',1);
+INSERT INTO "remix_tag" VALUES(3901,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3901,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3901,'epic',1);
+INSERT INTO "remix_tag" VALUES(3901,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(3901,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3901,'singing',1);
+INSERT INTO "remix_tag" VALUES(3901,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(3901,'strings',1);
+INSERT INTO "remix_tag" VALUES(3901,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3901,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3901,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3901,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3902,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3902,'edm',1);
+INSERT INTO "remix_tag" VALUES(3902,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3902,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3902,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3902,'synth',1);
+INSERT INTO "remix_tag" VALUES(3903,'compo',1);
+INSERT INTO "remix_tag" VALUES(3903,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3903,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3903,'piano',1);
+INSERT INTO "remix_tag" VALUES(3903,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3903,'rock',1);
+INSERT INTO "remix_tag" VALUES(3903,'synth',1);
+INSERT INTO "remix_tag" VALUES(3904,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3904,'dance',1);
+INSERT INTO "remix_tag" VALUES(3904,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3904,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3904,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3904,'synth',1);
+INSERT INTO "remix_tag" VALUES(3904,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3904,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3904,'trance',1);
+INSERT INTO "remix_tag" VALUES(3905,'brass',1);
+INSERT INTO "remix_tag" VALUES(3905,'classical',1);
+INSERT INTO "remix_tag" VALUES(3905,'collab',1);
+INSERT INTO "remix_tag" VALUES(3905,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3905,'happy',1);
+INSERT INTO "remix_tag" VALUES(3905,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(3905,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3905,'march',1);
+INSERT INTO "remix_tag" VALUES(3905,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3905,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3905,'strings',1);
+INSERT INTO "remix_tag" VALUES(3905,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3905,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3906,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3906,'edm',1);
+INSERT INTO "remix_tag" VALUES(3906,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3906,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3906,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3906,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3906,'piano',1);
+INSERT INTO "remix_tag" VALUES(3906,'pop',1);
+INSERT INTO "remix_tag" VALUES(3906,'synth',1);
+INSERT INTO "remix_tag" VALUES(3906,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3906,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3907,'brass',1);
+INSERT INTO "remix_tag" VALUES(3907,'classical',1);
+INSERT INTO "remix_tag" VALUES(3907,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3907,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3907,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3907,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3907,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3907,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3907,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3908,'cello',1);
+INSERT INTO "remix_tag" VALUES(3908,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3908,'classical',1);
+INSERT INTO "remix_tag" VALUES(3908,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3908,'quintet',1);
+INSERT INTO "remix_tag" VALUES(3908,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3908,'strings',1);
+INSERT INTO "remix_tag" VALUES(3908,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3909,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3909,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3909,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3909,'collab',1);
+INSERT INTO "remix_tag" VALUES(3909,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3909,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3909,'flute',1);
+INSERT INTO "remix_tag" VALUES(3909,'folk',1);
+INSERT INTO "remix_tag" VALUES(3909,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3909,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3909,'rock',1);
+INSERT INTO "remix_tag" VALUES(3909,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3909,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(3910,'brass',1);
+INSERT INTO "remix_tag" VALUES(3910,'chamber',1);
+INSERT INTO "remix_tag" VALUES(3910,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3910,'latin',1);
+INSERT INTO "remix_tag" VALUES(3910,'live-ensemble',1);
+INSERT INTO "remix_tag" VALUES(3910,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3910,'medley',1);
+INSERT INTO "remix_tag" VALUES(3910,'quartet',1);
+INSERT INTO "remix_tag" VALUES(3910,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3910,'trombone',1);
+INSERT INTO "remix_tag" VALUES(3910,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3911,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3911,'collab',1);
+INSERT INTO "remix_tag" VALUES(3911,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(3911,'flute',1);
+INSERT INTO "remix_tag" VALUES(3911,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3911,'latin',1);
+INSERT INTO "remix_tag" VALUES(3911,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3911,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3911,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3911,'strings',1);
+INSERT INTO "remix_tag" VALUES(3911,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3912,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3912,'flute',1);
+INSERT INTO "remix_tag" VALUES(3912,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3912,'harp',1);
+INSERT INTO "remix_tag" VALUES(3912,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3912,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3912,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3912,'strings',1);
+INSERT INTO "remix_tag" VALUES(3912,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3912,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3912,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3912,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3913,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3913,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3913,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3913,'funk',1);
+INSERT INTO "remix_tag" VALUES(3913,'funky',1);
+INSERT INTO "remix_tag" VALUES(3913,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3913,'organ',1);
+INSERT INTO "remix_tag" VALUES(3913,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3913,'synth',1);
+INSERT INTO "remix_tag" VALUES(3913,'turntable',1);
+INSERT INTO "remix_tag" VALUES(3914,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3914,'funk',1);
+INSERT INTO "remix_tag" VALUES(3914,'funky',1);
+INSERT INTO "remix_tag" VALUES(3914,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3914,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3914,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3914,'rock',1);
+INSERT INTO "remix_tag" VALUES(3914,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3914,'synth',1);
+INSERT INTO "remix_tag" VALUES(3915,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3915,'angry',1);
+INSERT INTO "remix_tag" VALUES(3915,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3915,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3915,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3915,'metal',1);
+INSERT INTO "remix_tag" VALUES(3915,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3915,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3915,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3915,'workout',1);
+INSERT INTO "remix_tag" VALUES(3916,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3916,'dark',1);
+INSERT INTO "remix_tag" VALUES(3916,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3916,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3916,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3916,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3916,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3916,'piano',1);
+INSERT INTO "remix_tag" VALUES(3916,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3916,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3916,'strings',1);
+INSERT INTO "remix_tag" VALUES(3916,'synth',1);
+INSERT INTO "remix_tag" VALUES(3917,'edm',1);
+INSERT INTO "remix_tag" VALUES(3917,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3917,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3917,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3917,'funk',1);
+INSERT INTO "remix_tag" VALUES(3917,'funky',1);
+INSERT INTO "remix_tag" VALUES(3917,'synth',1);
+INSERT INTO "remix_tag" VALUES(3918,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3918,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3918,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3918,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3918,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3918,'rock',1);
+INSERT INTO "remix_tag" VALUES(3918,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3918,'strings',1);
+INSERT INTO "remix_tag" VALUES(3919,'choir',1);
+INSERT INTO "remix_tag" VALUES(3919,'harp',1);
+INSERT INTO "remix_tag" VALUES(3919,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3919,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3919,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3919,'rnb',1);
+INSERT INTO "remix_tag" VALUES(3919,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3919,'sexy',1);
+INSERT INTO "remix_tag" VALUES(3919,'singing',1);
+INSERT INTO "remix_tag" VALUES(3919,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3919,'synth',1);
+INSERT INTO "remix_tag" VALUES(3919,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3919,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3919,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3920,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3920,'angry',1);
+INSERT INTO "remix_tag" VALUES(3920,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3920,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(3920,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3920,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3920,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3920,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3920,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3920,'synth',1);
+INSERT INTO "remix_tag" VALUES(3921,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3921,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3921,'folk',1);
+INSERT INTO "remix_tag" VALUES(3921,'funny',1);
+INSERT INTO "remix_tag" VALUES(3921,'goofy',1);
+INSERT INTO "remix_tag" VALUES(3921,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3921,'singing',1);
+INSERT INTO "remix_tag" VALUES(3921,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3922,'classical',1);
+INSERT INTO "remix_tag" VALUES(3922,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3922,'happy',1);
+INSERT INTO "remix_tag" VALUES(3922,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3922,'piano',1);
+INSERT INTO "remix_tag" VALUES(3922,'solo',1);
+INSERT INTO "remix_tag" VALUES(3922,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3923,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3923,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3923,'appalachian',1);
+INSERT INTO "remix_tag" VALUES(3923,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3923,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(3923,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3923,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3923,'medley',1);
+INSERT INTO "remix_tag" VALUES(3923,'piano',1);
+INSERT INTO "remix_tag" VALUES(3923,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(3924,'bells',1);
+INSERT INTO "remix_tag" VALUES(3924,'choir',1);
+INSERT INTO "remix_tag" VALUES(3924,'classical',1);
+INSERT INTO "remix_tag" VALUES(3924,'flute',1);
+INSERT INTO "remix_tag" VALUES(3924,'harp',1);
+INSERT INTO "remix_tag" VALUES(3924,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(3924,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3924,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3924,'strings',1);
+INSERT INTO "remix_tag" VALUES(3924,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(3925,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3925,'bells',1);
+INSERT INTO "remix_tag" VALUES(3925,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3925,'harp',1);
+INSERT INTO "remix_tag" VALUES(3925,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3925,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3925,'mystical',1);
+INSERT INTO "remix_tag" VALUES(3925,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3925,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3925,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3926,'chill',1);
+INSERT INTO "remix_tag" VALUES(3926,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3926,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3926,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3926,'folk',1);
+INSERT INTO "remix_tag" VALUES(3926,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3926,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3926,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3926,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3926,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3926,'strings',1);
+INSERT INTO "remix_tag" VALUES(3927,'chill',1);
+INSERT INTO "remix_tag" VALUES(3927,'collab',1);
+INSERT INTO "remix_tag" VALUES(3927,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3927,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(3927,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(3927,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3927,'piano',1);
+INSERT INTO "remix_tag" VALUES(3927,'rap',1);
+INSERT INTO "remix_tag" VALUES(3927,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3927,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(3928,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3928,'chill',1);
+INSERT INTO "remix_tag" VALUES(3928,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3928,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3928,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3928,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3928,'strings',1);
+INSERT INTO "remix_tag" VALUES(3928,'synth',1);
+INSERT INTO "remix_tag" VALUES(3928,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(3929,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3929,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3929,'metal',1);
+INSERT INTO "remix_tag" VALUES(3929,'rock',1);
+INSERT INTO "remix_tag" VALUES(3929,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3930,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3930,'folk',1);
+INSERT INTO "remix_tag" VALUES(3930,'harp',1);
+INSERT INTO "remix_tag" VALUES(3930,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3930,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3930,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3930,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3930,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3930,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3930,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3931,'chill',1);
+INSERT INTO "remix_tag" VALUES(3931,'edm',1);
+INSERT INTO "remix_tag" VALUES(3931,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3931,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3931,'house',1);
+INSERT INTO "remix_tag" VALUES(3931,'singing',1);
+INSERT INTO "remix_tag" VALUES(3931,'synth',1);
+INSERT INTO "remix_tag" VALUES(3931,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3932,'chill',1);
+INSERT INTO "remix_tag" VALUES(3932,'dark',1);
+INSERT INTO "remix_tag" VALUES(3932,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(3932,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3932,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3932,'piano',1);
+INSERT INTO "remix_tag" VALUES(3932,'synth',1);
+INSERT INTO "remix_tag" VALUES(3932,'trap',1);
+INSERT INTO "remix_tag" VALUES(3933,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3933,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3933,'classical',1);
+INSERT INTO "remix_tag" VALUES(3933,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3933,'flute',1);
+INSERT INTO "remix_tag" VALUES(3933,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3933,'piano',1);
+INSERT INTO "remix_tag" VALUES(3933,'synth',1);
+INSERT INTO "remix_tag" VALUES(3934,'brass',1);
+INSERT INTO "remix_tag" VALUES(3934,'chill',1);
+INSERT INTO "remix_tag" VALUES(3934,'collab',1);
+INSERT INTO "remix_tag" VALUES(3934,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3934,'funky',1);
+INSERT INTO "remix_tag" VALUES(3934,'funny',1);
+INSERT INTO "remix_tag" VALUES(3934,'reggae',1);
+INSERT INTO "remix_tag" VALUES(3934,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3934,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3934,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3934,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3935,'bells',1);
+INSERT INTO "remix_tag" VALUES(3935,'classical',1);
+INSERT INTO "remix_tag" VALUES(3935,'flute',1);
+INSERT INTO "remix_tag" VALUES(3935,'harp',1);
+INSERT INTO "remix_tag" VALUES(3935,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3935,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3935,'strings',1);
+INSERT INTO "remix_tag" VALUES(3936,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3936,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3936,'funky',1);
+INSERT INTO "remix_tag" VALUES(3936,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3936,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3936,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3936,'synth',1);
+INSERT INTO "remix_tag" VALUES(3937,'bells',1);
+INSERT INTO "remix_tag" VALUES(3937,'choir',1);
+INSERT INTO "remix_tag" VALUES(3937,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3937,'classical',1);
+INSERT INTO "remix_tag" VALUES(3937,'flute',1);
+INSERT INTO "remix_tag" VALUES(3937,'harp',1);
+INSERT INTO "remix_tag" VALUES(3937,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3937,'medley',1);
+INSERT INTO "remix_tag" VALUES(3937,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3937,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3937,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3937,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3937,'strings',1);
+INSERT INTO "remix_tag" VALUES(3937,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3937,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3938,'brass',1);
+INSERT INTO "remix_tag" VALUES(3938,'cello',1);
+INSERT INTO "remix_tag" VALUES(3938,'chill',1);
+INSERT INTO "remix_tag" VALUES(3938,'choir',1);
+INSERT INTO "remix_tag" VALUES(3938,'collab',1);
+INSERT INTO "remix_tag" VALUES(3938,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3938,'funky',1);
+INSERT INTO "remix_tag" VALUES(3938,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3938,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3938,'rock',1);
+INSERT INTO "remix_tag" VALUES(3939,'edm',1);
+INSERT INTO "remix_tag" VALUES(3939,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3939,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3939,'house',1);
+INSERT INTO "remix_tag" VALUES(3939,'piano',1);
+INSERT INTO "remix_tag" VALUES(3939,'synth',1);
+INSERT INTO "remix_tag" VALUES(3939,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3939,'trance',1);
+INSERT INTO "remix_tag" VALUES(3939,'workout',1);
+INSERT INTO "remix_tag" VALUES(3940,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3940,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3940,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3940,'chill',1);
+INSERT INTO "remix_tag" VALUES(3940,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3940,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3940,'piano',1);
+INSERT INTO "remix_tag" VALUES(3940,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3940,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(3940,'synth',1);
+INSERT INTO "remix_tag" VALUES(3941,'brass',1);
+INSERT INTO "remix_tag" VALUES(3941,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3941,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3941,'funk',1);
+INSERT INTO "remix_tag" VALUES(3941,'funky',1);
+INSERT INTO "remix_tag" VALUES(3941,'happy',1);
+INSERT INTO "remix_tag" VALUES(3941,'pop',1);
+INSERT INTO "remix_tag" VALUES(3941,'strings',1);
+INSERT INTO "remix_tag" VALUES(3941,'synth',1);
+INSERT INTO "remix_tag" VALUES(3942,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3942,'chill',1);
+INSERT INTO "remix_tag" VALUES(3942,'collab',1);
+INSERT INTO "remix_tag" VALUES(3942,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3942,'folk',1);
+INSERT INTO "remix_tag" VALUES(3942,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3942,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3942,'organ',1);
+INSERT INTO "remix_tag" VALUES(3942,'singing',1);
+INSERT INTO "remix_tag" VALUES(3942,'violin',1);
+INSERT INTO "remix_tag" VALUES(3942,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3943,'edm',1);
+INSERT INTO "remix_tag" VALUES(3943,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3943,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3943,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3943,'synth',1);
+INSERT INTO "remix_tag" VALUES(3943,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3943,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3944,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(3944,'collab',1);
+INSERT INTO "remix_tag" VALUES(3944,'dance',1);
+INSERT INTO "remix_tag" VALUES(3944,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(3944,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3944,'folk',1);
+INSERT INTO "remix_tag" VALUES(3944,'happy',1);
+INSERT INTO "remix_tag" VALUES(3944,'harp',1);
+INSERT INTO "remix_tag" VALUES(3944,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3944,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3944,'pop',1);
+INSERT INTO "remix_tag" VALUES(3944,'synth',1);
+INSERT INTO "remix_tag" VALUES(3944,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3944,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3944,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3945,'collab',1);
+INSERT INTO "remix_tag" VALUES(3945,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3945,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3945,'epic',1);
+INSERT INTO "remix_tag" VALUES(3945,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3945,'opera',1);
+INSERT INTO "remix_tag" VALUES(3945,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3945,'rock',1);
+INSERT INTO "remix_tag" VALUES(3945,'singing',1);
+INSERT INTO "remix_tag" VALUES(3945,'strings',1);
+INSERT INTO "remix_tag" VALUES(3945,'synth',1);
+INSERT INTO "remix_tag" VALUES(3945,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3946,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3946,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3946,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3946,'metal',1);
+INSERT INTO "remix_tag" VALUES(3946,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3946,'organ',1);
+INSERT INTO "remix_tag" VALUES(3946,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3947,'chill',1);
+INSERT INTO "remix_tag" VALUES(3947,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(3947,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3947,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3947,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(3947,'funk',1);
+INSERT INTO "remix_tag" VALUES(3947,'funky',1);
+INSERT INTO "remix_tag" VALUES(3947,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3947,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3947,'organ',1);
+INSERT INTO "remix_tag" VALUES(3947,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3947,'rock',1);
+INSERT INTO "remix_tag" VALUES(3948,'chill',1);
+INSERT INTO "remix_tag" VALUES(3948,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3948,'dark',1);
+INSERT INTO "remix_tag" VALUES(3948,'edm',1);
+INSERT INTO "remix_tag" VALUES(3948,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3948,'flute',1);
+INSERT INTO "remix_tag" VALUES(3948,'funky',1);
+INSERT INTO "remix_tag" VALUES(3948,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3948,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3948,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3948,'organ',1);
+INSERT INTO "remix_tag" VALUES(3948,'piano',1);
+INSERT INTO "remix_tag" VALUES(3948,'synth',1);
+INSERT INTO "remix_tag" VALUES(3949,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3949,'choir',1);
+INSERT INTO "remix_tag" VALUES(3949,'classical',1);
+INSERT INTO "remix_tag" VALUES(3949,'flute',1);
+INSERT INTO "remix_tag" VALUES(3949,'folk',1);
+INSERT INTO "remix_tag" VALUES(3949,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3949,'harp',1);
+INSERT INTO "remix_tag" VALUES(3949,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3949,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3949,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3949,'strings',1);
+INSERT INTO "remix_tag" VALUES(3949,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3950,'collab',1);
+INSERT INTO "remix_tag" VALUES(3950,'compo',1);
+INSERT INTO "remix_tag" VALUES(3950,'edm',1);
+INSERT INTO "remix_tag" VALUES(3950,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3950,'funky',1);
+INSERT INTO "remix_tag" VALUES(3950,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(3950,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3950,'piano',1);
+INSERT INTO "remix_tag" VALUES(3950,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3950,'synth',1);
+INSERT INTO "remix_tag" VALUES(3950,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(3951,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3951,'edm',1);
+INSERT INTO "remix_tag" VALUES(3951,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3951,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3951,'synth',1);
+INSERT INTO "remix_tag" VALUES(3951,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3952,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3952,'dark',1);
+INSERT INTO "remix_tag" VALUES(3952,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3952,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3952,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3952,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3952,'synth',1);
+INSERT INTO "remix_tag" VALUES(3953,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3953,'dark',1);
+INSERT INTO "remix_tag" VALUES(3953,'edm',1);
+INSERT INTO "remix_tag" VALUES(3953,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3953,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3953,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3953,'synth',1);
+INSERT INTO "remix_tag" VALUES(3954,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3954,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3954,'funk',1);
+INSERT INTO "remix_tag" VALUES(3954,'funky',1);
+INSERT INTO "remix_tag" VALUES(3954,'happy',1);
+INSERT INTO "remix_tag" VALUES(3954,'latin',1);
+INSERT INTO "remix_tag" VALUES(3954,'synth',1);
+INSERT INTO "remix_tag" VALUES(3955,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3955,'dark',1);
+INSERT INTO "remix_tag" VALUES(3955,'death-metal',1);
+INSERT INTO "remix_tag" VALUES(3955,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3955,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3955,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3955,'metal',1);
+INSERT INTO "remix_tag" VALUES(3955,'organ',1);
+INSERT INTO "remix_tag" VALUES(3955,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3956,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3956,'bells',1);
+INSERT INTO "remix_tag" VALUES(3956,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3956,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3956,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3956,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3956,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3956,'pop',1);
+INSERT INTO "remix_tag" VALUES(3956,'strings',1);
+INSERT INTO "remix_tag" VALUES(3956,'synth',1);
+INSERT INTO "remix_tag" VALUES(3956,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(3956,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3957,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3957,'march',1);
+INSERT INTO "remix_tag" VALUES(3957,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3957,'piano',1);
+INSERT INTO "remix_tag" VALUES(3957,'strings',1);
+INSERT INTO "remix_tag" VALUES(3957,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3957,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(3958,'chill',1);
+INSERT INTO "remix_tag" VALUES(3958,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3958,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3958,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3958,'epic',1);
+INSERT INTO "remix_tag" VALUES(3958,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3958,'harp',1);
+INSERT INTO "remix_tag" VALUES(3958,'new-age',1);
+INSERT INTO "remix_tag" VALUES(3958,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3958,'strings',1);
+INSERT INTO "remix_tag" VALUES(3958,'synth',1);
+INSERT INTO "remix_tag" VALUES(3959,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3959,'choir',1);
+INSERT INTO "remix_tag" VALUES(3959,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3959,'dark',1);
+INSERT INTO "remix_tag" VALUES(3959,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3959,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3959,'industrial',1);
+INSERT INTO "remix_tag" VALUES(3959,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3959,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3959,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3959,'synth',1);
+INSERT INTO "remix_tag" VALUES(3960,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3960,'brass',1);
+INSERT INTO "remix_tag" VALUES(3960,'chill',1);
+INSERT INTO "remix_tag" VALUES(3960,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3960,'dark',1);
+INSERT INTO "remix_tag" VALUES(3960,'didgeridoo',1);
+INSERT INTO "remix_tag" VALUES(3960,'flute',1);
+INSERT INTO "remix_tag" VALUES(3960,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3960,'harp',1);
+INSERT INTO "remix_tag" VALUES(3960,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3960,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3960,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3961,'classical',1);
+INSERT INTO "remix_tag" VALUES(3961,'collab',1);
+INSERT INTO "remix_tag" VALUES(3961,'folk',1);
+INSERT INTO "remix_tag" VALUES(3961,'happy',1);
+INSERT INTO "remix_tag" VALUES(3961,'harp',1);
+INSERT INTO "remix_tag" VALUES(3961,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3961,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3961,'strings',1);
+INSERT INTO "remix_tag" VALUES(3961,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(3961,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3962,'dance',1);
+INSERT INTO "remix_tag" VALUES(3962,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3962,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3962,'synth',1);
+INSERT INTO "remix_tag" VALUES(3962,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3963,'chill',1);
+INSERT INTO "remix_tag" VALUES(3963,'edm',1);
+INSERT INTO "remix_tag" VALUES(3963,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3963,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3963,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3963,'synth',1);
+INSERT INTO "remix_tag" VALUES(3964,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3964,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3964,'epic',1);
+INSERT INTO "remix_tag" VALUES(3964,'happy',1);
+INSERT INTO "remix_tag" VALUES(3964,'metal',1);
+INSERT INTO "remix_tag" VALUES(3964,'piano',1);
+INSERT INTO "remix_tag" VALUES(3964,'pop',1);
+INSERT INTO "remix_tag" VALUES(3964,'rock',1);
+INSERT INTO "remix_tag" VALUES(3964,'synth',1);
+INSERT INTO "remix_tag" VALUES(3965,'edm',1);
+INSERT INTO "remix_tag" VALUES(3965,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3965,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3965,'piano',1);
+INSERT INTO "remix_tag" VALUES(3965,'synth',1);
+INSERT INTO "remix_tag" VALUES(3966,'chill',1);
+INSERT INTO "remix_tag" VALUES(3966,'edm',1);
+INSERT INTO "remix_tag" VALUES(3966,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3966,'pop',1);
+INSERT INTO "remix_tag" VALUES(3966,'synth',1);
+INSERT INTO "remix_tag" VALUES(3966,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3967,'dance',1);
+INSERT INTO "remix_tag" VALUES(3967,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3967,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3967,'happy',1);
+INSERT INTO "remix_tag" VALUES(3967,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3967,'pop',1);
+INSERT INTO "remix_tag" VALUES(3967,'singing',1);
+INSERT INTO "remix_tag" VALUES(3967,'synth',1);
+INSERT INTO "remix_tag" VALUES(3967,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3968,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3968,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3968,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3968,'epic',1);
+INSERT INTO "remix_tag" VALUES(3968,'metal',1);
+INSERT INTO "remix_tag" VALUES(3968,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3968,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3968,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3969,'classical',1);
+INSERT INTO "remix_tag" VALUES(3969,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3969,'epic',1);
+INSERT INTO "remix_tag" VALUES(3969,'piano',1);
+INSERT INTO "remix_tag" VALUES(3969,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3969,'solo',1);
+INSERT INTO "remix_tag" VALUES(3969,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3969,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3970,'brass',1);
+INSERT INTO "remix_tag" VALUES(3970,'chill',1);
+INSERT INTO "remix_tag" VALUES(3970,'classical',1);
+INSERT INTO "remix_tag" VALUES(3970,'experimental',1);
+INSERT INTO "remix_tag" VALUES(3970,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(3970,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3970,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3971,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(3971,'banjo',1);
+INSERT INTO "remix_tag" VALUES(3971,'chill',1);
+INSERT INTO "remix_tag" VALUES(3971,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3971,'collab',1);
+INSERT INTO "remix_tag" VALUES(3971,'dark',1);
+INSERT INTO "remix_tag" VALUES(3971,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3971,'folk',1);
+INSERT INTO "remix_tag" VALUES(3971,'harp',1);
+INSERT INTO "remix_tag" VALUES(3971,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3971,'singing',1);
+INSERT INTO "remix_tag" VALUES(3971,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3971,'strings',1);
+INSERT INTO "remix_tag" VALUES(3971,'viola',1);
+INSERT INTO "remix_tag" VALUES(3971,'violin',1);
+INSERT INTO "remix_tag" VALUES(3972,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3972,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3972,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(3972,'meditation',1);
+INSERT INTO "remix_tag" VALUES(3972,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3972,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(3972,'synth',1);
+INSERT INTO "remix_tag" VALUES(3973,'classical',1);
+INSERT INTO "remix_tag" VALUES(3973,'folk',1);
+INSERT INTO "remix_tag" VALUES(3973,'harp',1);
+INSERT INTO "remix_tag" VALUES(3973,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3973,'strings',1);
+INSERT INTO "remix_tag" VALUES(3973,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3974,'accordion',1);
+INSERT INTO "remix_tag" VALUES(3974,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(3974,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3974,'flute',1);
+INSERT INTO "remix_tag" VALUES(3974,'folk',1);
+INSERT INTO "remix_tag" VALUES(3974,'happy',1);
+INSERT INTO "remix_tag" VALUES(3974,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3974,'singing',1);
+INSERT INTO "remix_tag" VALUES(3975,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3975,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3975,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3975,'epic',1);
+INSERT INTO "remix_tag" VALUES(3975,'folk',1);
+INSERT INTO "remix_tag" VALUES(3975,'metal',1);
+INSERT INTO "remix_tag" VALUES(3975,'rock',1);
+INSERT INTO "remix_tag" VALUES(3975,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3975,'strings',1);
+INSERT INTO "remix_tag" VALUES(3975,'violin',1);
+INSERT INTO "remix_tag" VALUES(3975,'whistling',1);
+INSERT INTO "remix_tag" VALUES(3976,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(3976,'medley',1);
+INSERT INTO "remix_tag" VALUES(3976,'organ',1);
+INSERT INTO "remix_tag" VALUES(3976,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3976,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3976,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(3976,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3977,'classical',1);
+INSERT INTO "remix_tag" VALUES(3977,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(3977,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3977,'piano',1);
+INSERT INTO "remix_tag" VALUES(3977,'solo',1);
+INSERT INTO "remix_tag" VALUES(3977,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3977,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3978,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3978,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3978,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3978,'funk',1);
+INSERT INTO "remix_tag" VALUES(3978,'funky',1);
+INSERT INTO "remix_tag" VALUES(3978,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3978,'jazz',1);
+INSERT INTO "remix_tag" VALUES(3978,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3978,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3978,'synth',1);
+INSERT INTO "remix_tag" VALUES(3978,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3978,'timesig-7-4',1);
+INSERT INTO "remix_tag" VALUES(3978,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(3979,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(3979,'celtic',1);
+INSERT INTO "remix_tag" VALUES(3979,'chill',1);
+INSERT INTO "remix_tag" VALUES(3979,'choir',1);
+INSERT INTO "remix_tag" VALUES(3979,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3979,'flute',1);
+INSERT INTO "remix_tag" VALUES(3979,'folk',1);
+INSERT INTO "remix_tag" VALUES(3979,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3979,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3979,'harp',1);
+INSERT INTO "remix_tag" VALUES(3979,'indian',1);
+INSERT INTO "remix_tag" VALUES(3979,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3979,'latin',1);
+INSERT INTO "remix_tag" VALUES(3979,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3979,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3979,'piano',1);
+INSERT INTO "remix_tag" VALUES(3979,'quirky',1);
+INSERT INTO "remix_tag" VALUES(3979,'strings',1);
+INSERT INTO "remix_tag" VALUES(3979,'synth',1);
+INSERT INTO "remix_tag" VALUES(3979,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3980,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3980,'cello',1);
+INSERT INTO "remix_tag" VALUES(3980,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3980,'collab',1);
+INSERT INTO "remix_tag" VALUES(3980,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3980,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3980,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3980,'epic',1);
+INSERT INTO "remix_tag" VALUES(3980,'fusion',1);
+INSERT INTO "remix_tag" VALUES(3980,'medley',1);
+INSERT INTO "remix_tag" VALUES(3980,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3980,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3980,'synth',1);
+INSERT INTO "remix_tag" VALUES(3980,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(3981,'brass',1);
+INSERT INTO "remix_tag" VALUES(3981,'carribean',1);
+INSERT INTO "remix_tag" VALUES(3981,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3981,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3981,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3981,'flute',1);
+INSERT INTO "remix_tag" VALUES(3981,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(3981,'happy',1);
+INSERT INTO "remix_tag" VALUES(3981,'latin',1);
+INSERT INTO "remix_tag" VALUES(3981,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(3981,'medley',1);
+INSERT INTO "remix_tag" VALUES(3981,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(3981,'synth',1);
+INSERT INTO "remix_tag" VALUES(3982,'chill',1);
+INSERT INTO "remix_tag" VALUES(3982,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3982,'edm',1);
+INSERT INTO "remix_tag" VALUES(3982,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3982,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3982,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3982,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3982,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3982,'synth',1);
+INSERT INTO "remix_tag" VALUES(3983,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3983,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(3983,'edm',1);
+INSERT INTO "remix_tag" VALUES(3983,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3983,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3983,'funky',1);
+INSERT INTO "remix_tag" VALUES(3983,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3983,'piano',1);
+INSERT INTO "remix_tag" VALUES(3983,'strings',1);
+INSERT INTO "remix_tag" VALUES(3983,'synth',1);
+INSERT INTO "remix_tag" VALUES(3984,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(3984,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3984,'edm',1);
+INSERT INTO "remix_tag" VALUES(3984,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3984,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3984,'synth',1);
+INSERT INTO "remix_tag" VALUES(3985,'chinese',1);
+INSERT INTO "remix_tag" VALUES(3985,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3985,'classical',1);
+INSERT INTO "remix_tag" VALUES(3985,'epic',1);
+INSERT INTO "remix_tag" VALUES(3985,'erhu',1);
+INSERT INTO "remix_tag" VALUES(3985,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3985,'singing',1);
+INSERT INTO "remix_tag" VALUES(3985,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3985,'strings',1);
+INSERT INTO "remix_tag" VALUES(3985,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3986,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3986,'dark',1);
+INSERT INTO "remix_tag" VALUES(3986,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(3986,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3986,'epic',1);
+INSERT INTO "remix_tag" VALUES(3986,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3986,'metal',1);
+INSERT INTO "remix_tag" VALUES(3986,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(3986,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3987,'blues',1);
+INSERT INTO "remix_tag" VALUES(3987,'classical',1);
+INSERT INTO "remix_tag" VALUES(3987,'dark',1);
+INSERT INTO "remix_tag" VALUES(3987,'piano',1);
+INSERT INTO "remix_tag" VALUES(3987,'solemn',1);
+INSERT INTO "remix_tag" VALUES(3987,'solo',1);
+INSERT INTO "remix_tag" VALUES(3987,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(3988,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(3988,'choir',1);
+INSERT INTO "remix_tag" VALUES(3988,'collab',1);
+INSERT INTO "remix_tag" VALUES(3988,'dark',1);
+INSERT INTO "remix_tag" VALUES(3988,'distortion',1);
+INSERT INTO "remix_tag" VALUES(3988,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(3988,'epic',1);
+INSERT INTO "remix_tag" VALUES(3988,'metal',1);
+INSERT INTO "remix_tag" VALUES(3988,'synth',1);
+INSERT INTO "remix_tag" VALUES(3988,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(3989,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3989,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(3989,'chill',1);
+INSERT INTO "remix_tag" VALUES(3989,'choir',1);
+INSERT INTO "remix_tag" VALUES(3989,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3989,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(3989,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3989,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(3990,'classical',1);
+INSERT INTO "remix_tag" VALUES(3990,'epic',1);
+INSERT INTO "remix_tag" VALUES(3990,'harp',1);
+INSERT INTO "remix_tag" VALUES(3990,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3990,'oboe',1);
+INSERT INTO "remix_tag" VALUES(3990,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3990,'piano',1);
+INSERT INTO "remix_tag" VALUES(3990,'strings',1);
+INSERT INTO "remix_tag" VALUES(3990,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3990,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3990,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3991,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(3991,'dark',1);
+INSERT INTO "remix_tag" VALUES(3991,'edm',1);
+INSERT INTO "remix_tag" VALUES(3991,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3991,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3991,'glitching',1);
+INSERT INTO "remix_tag" VALUES(3991,'reversing',1);
+INSERT INTO "remix_tag" VALUES(3991,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3991,'synth',1);
+INSERT INTO "remix_tag" VALUES(3992,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3992,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3992,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3992,'synth',1);
+INSERT INTO "remix_tag" VALUES(3992,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(3992,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(3993,'brass',1);
+INSERT INTO "remix_tag" VALUES(3993,'dnb',1);
+INSERT INTO "remix_tag" VALUES(3993,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3993,'epic',1);
+INSERT INTO "remix_tag" VALUES(3993,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3993,'strings',1);
+INSERT INTO "remix_tag" VALUES(3993,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3993,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3993,'synth',1);
+INSERT INTO "remix_tag" VALUES(3993,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(3994,'edm',1);
+INSERT INTO "remix_tag" VALUES(3994,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3994,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3994,'funky',1);
+INSERT INTO "remix_tag" VALUES(3994,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(3994,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(3994,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(3994,'synth',1);
+INSERT INTO "remix_tag" VALUES(3995,'edm',1);
+INSERT INTO "remix_tag" VALUES(3995,'electronic',1);
+INSERT INTO "remix_tag" VALUES(3995,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3995,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3995,'synth',1);
+INSERT INTO "remix_tag" VALUES(3995,'trance',1);
+INSERT INTO "remix_tag" VALUES(3996,'ambient',1);
+INSERT INTO "remix_tag" VALUES(3996,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(3996,'dark',1);
+INSERT INTO "remix_tag" VALUES(3996,'halloween',1);
+INSERT INTO "remix_tag" VALUES(3996,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(3996,'organ',1);
+INSERT INTO "remix_tag" VALUES(3996,'piano',1);
+INSERT INTO "remix_tag" VALUES(3996,'singing',1);
+INSERT INTO "remix_tag" VALUES(3996,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(3996,'spooky',1);
+INSERT INTO "remix_tag" VALUES(3996,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3997,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3997,'cello',1);
+INSERT INTO "remix_tag" VALUES(3997,'collab',1);
+INSERT INTO "remix_tag" VALUES(3997,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(3997,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(3997,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(3997,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3997,'pop',1);
+INSERT INTO "remix_tag" VALUES(3997,'romantic',1);
+INSERT INTO "remix_tag" VALUES(3997,'sad',1);
+INSERT INTO "remix_tag" VALUES(3997,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(3997,'singing',1);
+INSERT INTO "remix_tag" VALUES(3997,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(3998,'brass',1);
+INSERT INTO "remix_tag" VALUES(3998,'epic',1);
+INSERT INTO "remix_tag" VALUES(3998,'flute',1);
+INSERT INTO "remix_tag" VALUES(3998,'harp',1);
+INSERT INTO "remix_tag" VALUES(3998,'march',1);
+INSERT INTO "remix_tag" VALUES(3998,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(3998,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3998,'strings',1);
+INSERT INTO "remix_tag" VALUES(3998,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(3998,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(3998,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(3998,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(3999,'ballad',1);
+INSERT INTO "remix_tag" VALUES(3999,'bells',1);
+INSERT INTO "remix_tag" VALUES(3999,'energetic',1);
+INSERT INTO "remix_tag" VALUES(3999,'march',1);
+INSERT INTO "remix_tag" VALUES(3999,'mellow',1);
+INSERT INTO "remix_tag" VALUES(3999,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(3999,'piano',1);
+INSERT INTO "remix_tag" VALUES(3999,'pop',1);
+INSERT INTO "remix_tag" VALUES(3999,'strings',1);
@@ -0,0 +1,9981 @@
+INSERT INTO "remix_tag" VALUES(4000,'blues',1);
+INSERT INTO "remix_tag" VALUES(4000,'brass',1);
+INSERT INTO "remix_tag" VALUES(4000,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(4000,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4000,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4000,'funky',1);
+INSERT INTO "remix_tag" VALUES(4000,'happy',1);
+INSERT INTO "remix_tag" VALUES(4000,'organ',1);
+INSERT INTO "remix_tag" VALUES(4000,'reggae',1);
+INSERT INTO "remix_tag" VALUES(4000,'rock',1);
+INSERT INTO "remix_tag" VALUES(4001,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4001,'edm',1);
+INSERT INTO "remix_tag" VALUES(4001,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4001,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4001,'synth',1);
+INSERT INTO "remix_tag" VALUES(4002,'bells',1);
+INSERT INTO "remix_tag" VALUES(4002,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4002,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4002,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4002,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4002,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4002,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4002,'singing',1);
+INSERT INTO "remix_tag" VALUES(4002,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4002,'synth',1);
+INSERT INTO "remix_tag" VALUES(4002,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4002,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4003,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4003,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4003,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4003,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4003,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4003,'metal',1);
+INSERT INTO "remix_tag" VALUES(4003,'singing',1);
+INSERT INTO "remix_tag" VALUES(4003,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4004,'dark',1);
+INSERT INTO "remix_tag" VALUES(4004,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4004,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4004,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4004,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4004,'metal',1);
+INSERT INTO "remix_tag" VALUES(4004,'rock',1);
+INSERT INTO "remix_tag" VALUES(4004,'singing',1);
+INSERT INTO "remix_tag" VALUES(4004,'synth',1);
+INSERT INTO "remix_tag" VALUES(4004,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4004,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4005,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4005,'collab',1);
+INSERT INTO "remix_tag" VALUES(4005,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4005,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4005,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4005,'epic',1);
+INSERT INTO "remix_tag" VALUES(4005,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4005,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4005,'piano',1);
+INSERT INTO "remix_tag" VALUES(4005,'rock',1);
+INSERT INTO "remix_tag" VALUES(4005,'singing',1);
+INSERT INTO "remix_tag" VALUES(4005,'strings',1);
+INSERT INTO "remix_tag" VALUES(4005,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4006,'bells',1);
+INSERT INTO "remix_tag" VALUES(4006,'collab',1);
+INSERT INTO "remix_tag" VALUES(4006,'edm',1);
+INSERT INTO "remix_tag" VALUES(4006,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4006,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4006,'piano',1);
+INSERT INTO "remix_tag" VALUES(4006,'pop',1);
+INSERT INTO "remix_tag" VALUES(4006,'synth',1);
+INSERT INTO "remix_tag" VALUES(4007,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4007,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4007,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4007,'classical',1);
+INSERT INTO "remix_tag" VALUES(4007,'collab',1);
+INSERT INTO "remix_tag" VALUES(4007,'flute',1);
+INSERT INTO "remix_tag" VALUES(4007,'harp',1);
+INSERT INTO "remix_tag" VALUES(4007,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4007,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4007,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4007,'sad',1);
+INSERT INTO "remix_tag" VALUES(4007,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4007,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4008,'chill',1);
+INSERT INTO "remix_tag" VALUES(4008,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4008,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4008,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4008,'rock',1);
+INSERT INTO "remix_tag" VALUES(4008,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4008,'synth',1);
+INSERT INTO "remix_tag" VALUES(4008,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4009,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4009,'bells',1);
+INSERT INTO "remix_tag" VALUES(4009,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4009,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4009,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4009,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4009,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4009,'piano',1);
+INSERT INTO "remix_tag" VALUES(4009,'singing',1);
+INSERT INTO "remix_tag" VALUES(4009,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4009,'synth',1);
+INSERT INTO "remix_tag" VALUES(4009,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4009,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4010,'bells',1);
+INSERT INTO "remix_tag" VALUES(4010,'choir',1);
+INSERT INTO "remix_tag" VALUES(4010,'harp',1);
+INSERT INTO "remix_tag" VALUES(4010,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(4010,'medley',1);
+INSERT INTO "remix_tag" VALUES(4010,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4010,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4010,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4010,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4010,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4010,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4011,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4011,'cello',1);
+INSERT INTO "remix_tag" VALUES(4011,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4011,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4011,'collab',1);
+INSERT INTO "remix_tag" VALUES(4011,'epic',1);
+INSERT INTO "remix_tag" VALUES(4011,'flute',1);
+INSERT INTO "remix_tag" VALUES(4011,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4011,'harp',1);
+INSERT INTO "remix_tag" VALUES(4011,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4011,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4011,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4011,'strings',1);
+INSERT INTO "remix_tag" VALUES(4011,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4011,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4011,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4011,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4011,'viola',1);
+INSERT INTO "remix_tag" VALUES(4011,'violin',1);
+INSERT INTO "remix_tag" VALUES(4012,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4012,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4012,'collab',1);
+INSERT INTO "remix_tag" VALUES(4012,'flute',1);
+INSERT INTO "remix_tag" VALUES(4012,'folk',1);
+INSERT INTO "remix_tag" VALUES(4012,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4012,'happy',1);
+INSERT INTO "remix_tag" VALUES(4012,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4012,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4012,'pop',1);
+INSERT INTO "remix_tag" VALUES(4012,'singing',1);
+INSERT INTO "remix_tag" VALUES(4012,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4012,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4013,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4013,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4013,'epic',1);
+INSERT INTO "remix_tag" VALUES(4013,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4013,'synth',1);
+INSERT INTO "remix_tag" VALUES(4014,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4014,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4014,'funk',1);
+INSERT INTO "remix_tag" VALUES(4014,'funky',1);
+INSERT INTO "remix_tag" VALUES(4014,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4014,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4014,'organ',1);
+INSERT INTO "remix_tag" VALUES(4014,'piano',1);
+INSERT INTO "remix_tag" VALUES(4014,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4014,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4014,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4015,'collab',1);
+INSERT INTO "remix_tag" VALUES(4015,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4015,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4015,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4015,'synth',1);
+INSERT INTO "remix_tag" VALUES(4015,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4015,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4016,'chill',1);
+INSERT INTO "remix_tag" VALUES(4016,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4016,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4016,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4016,'pop',1);
+INSERT INTO "remix_tag" VALUES(4016,'strings',1);
+INSERT INTO "remix_tag" VALUES(4016,'synth',1);
+INSERT INTO "remix_tag" VALUES(4016,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4017,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4017,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4017,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4017,'folk',1);
+INSERT INTO "remix_tag" VALUES(4017,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4017,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4017,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4017,'violin',1);
+INSERT INTO "remix_tag" VALUES(4017,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4017,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4018,'chill',1);
+INSERT INTO "remix_tag" VALUES(4018,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4018,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4018,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4018,'synth',1);
+INSERT INTO "remix_tag" VALUES(4019,'dance',1);
+INSERT INTO "remix_tag" VALUES(4019,'disco',1);
+INSERT INTO "remix_tag" VALUES(4019,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4019,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4019,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4019,'synth',1);
+INSERT INTO "remix_tag" VALUES(4019,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4019,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4019,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4019,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4020,'collab',1);
+INSERT INTO "remix_tag" VALUES(4020,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4020,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4020,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4020,'medley',1);
+INSERT INTO "remix_tag" VALUES(4020,'pop',1);
+INSERT INTO "remix_tag" VALUES(4020,'singing',1);
+INSERT INTO "remix_tag" VALUES(4020,'synth',1);
+INSERT INTO "remix_tag" VALUES(4020,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4020,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4020,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4021,'choir',1);
+INSERT INTO "remix_tag" VALUES(4021,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4021,'classical',1);
+INSERT INTO "remix_tag" VALUES(4021,'folk',1);
+INSERT INTO "remix_tag" VALUES(4021,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4021,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4021,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4021,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4021,'strings',1);
+INSERT INTO "remix_tag" VALUES(4021,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4021,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4022,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4022,'dark',1);
+INSERT INTO "remix_tag" VALUES(4022,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4022,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4022,'metal',1);
+INSERT INTO "remix_tag" VALUES(4023,'chill',1);
+INSERT INTO "remix_tag" VALUES(4023,'collab',1);
+INSERT INTO "remix_tag" VALUES(4023,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4023,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4023,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4023,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4023,'rock',1);
+INSERT INTO "remix_tag" VALUES(4023,'sitar',1);
+INSERT INTO "remix_tag" VALUES(4024,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4024,'brass',1);
+INSERT INTO "remix_tag" VALUES(4024,'choir',1);
+INSERT INTO "remix_tag" VALUES(4024,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4024,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4024,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4024,'epic',1);
+INSERT INTO "remix_tag" VALUES(4024,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4024,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4024,'metal',1);
+INSERT INTO "remix_tag" VALUES(4024,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4024,'strings',1);
+INSERT INTO "remix_tag" VALUES(4024,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4024,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4025,'brass',1);
+INSERT INTO "remix_tag" VALUES(4025,'collab',1);
+INSERT INTO "remix_tag" VALUES(4025,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4025,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4025,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4025,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4025,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4025,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4025,'piano',1);
+INSERT INTO "remix_tag" VALUES(4025,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4025,'singing',1);
+INSERT INTO "remix_tag" VALUES(4025,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4025,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4025,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4026,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4026,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4026,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4026,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4026,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4026,'metal',1);
+INSERT INTO "remix_tag" VALUES(4027,'brass',1);
+INSERT INTO "remix_tag" VALUES(4027,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4027,'funk',1);
+INSERT INTO "remix_tag" VALUES(4027,'funky',1);
+INSERT INTO "remix_tag" VALUES(4027,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4027,'piano',1);
+INSERT INTO "remix_tag" VALUES(4027,'synth',1);
+INSERT INTO "remix_tag" VALUES(4027,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4028,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4028,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4028,'collab',1);
+INSERT INTO "remix_tag" VALUES(4028,'dark',1);
+INSERT INTO "remix_tag" VALUES(4028,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4028,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4028,'epic',1);
+INSERT INTO "remix_tag" VALUES(4028,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4028,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4028,'rock',1);
+INSERT INTO "remix_tag" VALUES(4028,'singing',1);
+INSERT INTO "remix_tag" VALUES(4028,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4029,'classical',1);
+INSERT INTO "remix_tag" VALUES(4029,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4029,'piano',1);
+INSERT INTO "remix_tag" VALUES(4029,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4029,'solo',1);
+INSERT INTO "remix_tag" VALUES(4029,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4030,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4030,'chill',1);
+INSERT INTO "remix_tag" VALUES(4030,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4030,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4030,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4030,'piano',1);
+INSERT INTO "remix_tag" VALUES(4030,'strings',1);
+INSERT INTO "remix_tag" VALUES(4030,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4031,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4031,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4031,'flute',1);
+INSERT INTO "remix_tag" VALUES(4031,'happy',1);
+INSERT INTO "remix_tag" VALUES(4031,'rock',1);
+INSERT INTO "remix_tag" VALUES(4031,'synth',1);
+INSERT INTO "remix_tag" VALUES(4031,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4032,'bells',1);
+INSERT INTO "remix_tag" VALUES(4032,'classical',1);
+INSERT INTO "remix_tag" VALUES(4032,'harp',1);
+INSERT INTO "remix_tag" VALUES(4032,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4032,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4032,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4032,'strings',1);
+INSERT INTO "remix_tag" VALUES(4032,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4032,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4033,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4033,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4033,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4033,'collab',1);
+INSERT INTO "remix_tag" VALUES(4033,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4033,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4033,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4033,'singing',1);
+INSERT INTO "remix_tag" VALUES(4033,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4033,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4033,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4034,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4034,'dance',1);
+INSERT INTO "remix_tag" VALUES(4034,'disco',1);
+INSERT INTO "remix_tag" VALUES(4034,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4034,'edm',1);
+INSERT INTO "remix_tag" VALUES(4034,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4034,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4034,'funky',1);
+INSERT INTO "remix_tag" VALUES(4034,'happy',1);
+INSERT INTO "remix_tag" VALUES(4034,'synth',1);
+INSERT INTO "remix_tag" VALUES(4035,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4035,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4035,'classical',1);
+INSERT INTO "remix_tag" VALUES(4035,'flute',1);
+INSERT INTO "remix_tag" VALUES(4035,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4035,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4035,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4035,'strings',1);
+INSERT INTO "remix_tag" VALUES(4035,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4036,'appalachian',1);
+INSERT INTO "remix_tag" VALUES(4036,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4036,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(4036,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4036,'collab',1);
+INSERT INTO "remix_tag" VALUES(4036,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(4036,'folk',1);
+INSERT INTO "remix_tag" VALUES(4036,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4036,'harp',1);
+INSERT INTO "remix_tag" VALUES(4036,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4036,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4036,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4036,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4036,'piano',1);
+INSERT INTO "remix_tag" VALUES(4036,'singing',1);
+INSERT INTO "remix_tag" VALUES(4036,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4036,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4036,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4037,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4037,'choir',1);
+INSERT INTO "remix_tag" VALUES(4037,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4037,'collab',1);
+INSERT INTO "remix_tag" VALUES(4037,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4037,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4037,'epic',1);
+INSERT INTO "remix_tag" VALUES(4037,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4037,'metal',1);
+INSERT INTO "remix_tag" VALUES(4037,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4037,'singing',1);
+INSERT INTO "remix_tag" VALUES(4037,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4037,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4038,'brass',1);
+INSERT INTO "remix_tag" VALUES(4038,'choir',1);
+INSERT INTO "remix_tag" VALUES(4038,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4038,'dark',1);
+INSERT INTO "remix_tag" VALUES(4038,'epic',1);
+INSERT INTO "remix_tag" VALUES(4038,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4038,'strings',1);
+INSERT INTO "remix_tag" VALUES(4038,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4038,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4039,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4039,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4039,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4039,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4039,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4039,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4040,'collab',1);
+INSERT INTO "remix_tag" VALUES(4040,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4040,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4040,'epic',1);
+INSERT INTO "remix_tag" VALUES(4040,'flute',1);
+INSERT INTO "remix_tag" VALUES(4040,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4040,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4040,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4040,'rock',1);
+INSERT INTO "remix_tag" VALUES(4040,'singing',1);
+INSERT INTO "remix_tag" VALUES(4040,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4040,'strings',1);
+INSERT INTO "remix_tag" VALUES(4040,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4040,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4040,'viola',1);
+INSERT INTO "remix_tag" VALUES(4040,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4040,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4041,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4041,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4041,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4041,'funk',1);
+INSERT INTO "remix_tag" VALUES(4041,'funky',1);
+INSERT INTO "remix_tag" VALUES(4041,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4041,'rock',1);
+INSERT INTO "remix_tag" VALUES(4041,'synth',1);
+INSERT INTO "remix_tag" VALUES(4041,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4042,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4042,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4042,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4042,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4042,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4042,'synth',1);
+INSERT INTO "remix_tag" VALUES(4042,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4043,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4043,'chill',1);
+INSERT INTO "remix_tag" VALUES(4043,'edm',1);
+INSERT INTO "remix_tag" VALUES(4043,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4043,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4043,'house',1);
+INSERT INTO "remix_tag" VALUES(4043,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4043,'piano',1);
+INSERT INTO "remix_tag" VALUES(4043,'synth',1);
+INSERT INTO "remix_tag" VALUES(4044,'classical',1);
+INSERT INTO "remix_tag" VALUES(4044,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4044,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4044,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4044,'piano',1);
+INSERT INTO "remix_tag" VALUES(4044,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4044,'solo',1);
+INSERT INTO "remix_tag" VALUES(4044,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4044,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4045,'bells',1);
+INSERT INTO "remix_tag" VALUES(4045,'chill',1);
+INSERT INTO "remix_tag" VALUES(4045,'edm',1);
+INSERT INTO "remix_tag" VALUES(4045,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4045,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4045,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4045,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4045,'synth',1);
+INSERT INTO "remix_tag" VALUES(4046,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4046,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4046,'edm',1);
+INSERT INTO "remix_tag" VALUES(4046,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4046,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4046,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4046,'metal',1);
+INSERT INTO "remix_tag" VALUES(4046,'synth',1);
+INSERT INTO "remix_tag" VALUES(4047,'cello',1);
+INSERT INTO "remix_tag" VALUES(4047,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4047,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4047,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(4047,'folk',1);
+INSERT INTO "remix_tag" VALUES(4047,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4047,'happy',1);
+INSERT INTO "remix_tag" VALUES(4047,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4047,'medley',1);
+INSERT INTO "remix_tag" VALUES(4047,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4047,'piano',1);
+INSERT INTO "remix_tag" VALUES(4047,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4047,'strings',1);
+INSERT INTO "remix_tag" VALUES(4047,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4047,'violin',1);
+INSERT INTO "remix_tag" VALUES(4047,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4048,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4048,'chill',1);
+INSERT INTO "remix_tag" VALUES(4048,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4048,'piano',1);
+INSERT INTO "remix_tag" VALUES(4048,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4048,'strings',1);
+INSERT INTO "remix_tag" VALUES(4048,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4048,'synth',1);
+INSERT INTO "remix_tag" VALUES(4048,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4049,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4049,'bells',1);
+INSERT INTO "remix_tag" VALUES(4049,'choir',1);
+INSERT INTO "remix_tag" VALUES(4049,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4049,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4049,'harp',1);
+INSERT INTO "remix_tag" VALUES(4049,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4049,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4049,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4049,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4049,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4049,'piano',1);
+INSERT INTO "remix_tag" VALUES(4049,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4049,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4050,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4050,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4050,'chill',1);
+INSERT INTO "remix_tag" VALUES(4050,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4050,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4050,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4050,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4050,'strings',1);
+INSERT INTO "remix_tag" VALUES(4050,'synth',1);
+INSERT INTO "remix_tag" VALUES(4051,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4051,'collab',1);
+INSERT INTO "remix_tag" VALUES(4051,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4051,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4051,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4051,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4051,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4051,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4051,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4051,'synth',1);
+INSERT INTO "remix_tag" VALUES(4052,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4052,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4052,'bells',1);
+INSERT INTO "remix_tag" VALUES(4052,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4052,'collab',1);
+INSERT INTO "remix_tag" VALUES(4052,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4052,'flute',1);
+INSERT INTO "remix_tag" VALUES(4052,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4052,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4052,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4052,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4052,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4052,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4053,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4053,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4053,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4053,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4053,'epic',1);
+INSERT INTO "remix_tag" VALUES(4053,'metal',1);
+INSERT INTO "remix_tag" VALUES(4053,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4053,'piano',1);
+INSERT INTO "remix_tag" VALUES(4053,'strings',1);
+INSERT INTO "remix_tag" VALUES(4053,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4054,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4054,'collab',1);
+INSERT INTO "remix_tag" VALUES(4054,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4054,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4054,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4054,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4054,'piano',1);
+INSERT INTO "remix_tag" VALUES(4054,'singing',1);
+INSERT INTO "remix_tag" VALUES(4054,'strings',1);
+INSERT INTO "remix_tag" VALUES(4055,'edm',1);
+INSERT INTO "remix_tag" VALUES(4055,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4055,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4055,'flute',1);
+INSERT INTO "remix_tag" VALUES(4055,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4055,'happy',1);
+INSERT INTO "remix_tag" VALUES(4055,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4055,'koto',1);
+INSERT INTO "remix_tag" VALUES(4055,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4055,'synth',1);
+INSERT INTO "remix_tag" VALUES(4055,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4056,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4056,'bells',1);
+INSERT INTO "remix_tag" VALUES(4056,'chinese',1);
+INSERT INTO "remix_tag" VALUES(4056,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4056,'folk',1);
+INSERT INTO "remix_tag" VALUES(4056,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4056,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4056,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4056,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4056,'singing',1);
+INSERT INTO "remix_tag" VALUES(4056,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4056,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4056,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4057,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4057,'collab',1);
+INSERT INTO "remix_tag" VALUES(4057,'edm',1);
+INSERT INTO "remix_tag" VALUES(4057,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4057,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4057,'piano',1);
+INSERT INTO "remix_tag" VALUES(4057,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4057,'strings',1);
+INSERT INTO "remix_tag" VALUES(4057,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4057,'synth',1);
+INSERT INTO "remix_tag" VALUES(4057,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4058,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(4058,'collab',1);
+INSERT INTO "remix_tag" VALUES(4058,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4058,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4058,'funky',1);
+INSERT INTO "remix_tag" VALUES(4058,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4058,'pop',1);
+INSERT INTO "remix_tag" VALUES(4058,'strings',1);
+INSERT INTO "remix_tag" VALUES(4058,'synth',1);
+INSERT INTO "remix_tag" VALUES(4058,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4058,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4059,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4059,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4059,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4059,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4059,'metal',1);
+INSERT INTO "remix_tag" VALUES(4059,'synth',1);
+INSERT INTO "remix_tag" VALUES(4060,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4060,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4060,'epic',1);
+INSERT INTO "remix_tag" VALUES(4060,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4060,'metal',1);
+INSERT INTO "remix_tag" VALUES(4060,'synth',1);
+INSERT INTO "remix_tag" VALUES(4060,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4061,'classical',1);
+INSERT INTO "remix_tag" VALUES(4061,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4061,'piano',1);
+INSERT INTO "remix_tag" VALUES(4061,'solo',1);
+INSERT INTO "remix_tag" VALUES(4061,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4062,'brass',1);
+INSERT INTO "remix_tag" VALUES(4062,'collab',1);
+INSERT INTO "remix_tag" VALUES(4062,'compo',1);
+INSERT INTO "remix_tag" VALUES(4062,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4062,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4062,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4062,'funky',1);
+INSERT INTO "remix_tag" VALUES(4062,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4062,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4062,'pop',1);
+INSERT INTO "remix_tag" VALUES(4062,'rock',1);
+INSERT INTO "remix_tag" VALUES(4062,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4062,'singing',1);
+INSERT INTO "remix_tag" VALUES(4062,'synth',1);
+INSERT INTO "remix_tag" VALUES(4062,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4062,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4063,'collab',1);
+INSERT INTO "remix_tag" VALUES(4063,'flute',1);
+INSERT INTO "remix_tag" VALUES(4063,'folk',1);
+INSERT INTO "remix_tag" VALUES(4063,'harp',1);
+INSERT INTO "remix_tag" VALUES(4063,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4063,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4063,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4063,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4063,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4064,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4064,'chill',1);
+INSERT INTO "remix_tag" VALUES(4064,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4064,'collab',1);
+INSERT INTO "remix_tag" VALUES(4064,'flute',1);
+INSERT INTO "remix_tag" VALUES(4064,'folk',1);
+INSERT INTO "remix_tag" VALUES(4064,'funky',1);
+INSERT INTO "remix_tag" VALUES(4064,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4064,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4064,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4064,'rock',1);
+INSERT INTO "remix_tag" VALUES(4065,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4065,'collab',1);
+INSERT INTO "remix_tag" VALUES(4065,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4065,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4065,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4065,'epic',1);
+INSERT INTO "remix_tag" VALUES(4065,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4065,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4065,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4065,'piano',1);
+INSERT INTO "remix_tag" VALUES(4065,'synth',1);
+INSERT INTO "remix_tag" VALUES(4066,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4066,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4066,'edm',1);
+INSERT INTO "remix_tag" VALUES(4066,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4066,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4066,'funky',1);
+INSERT INTO "remix_tag" VALUES(4066,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4066,'synth',1);
+INSERT INTO "remix_tag" VALUES(4066,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4067,'collab',1);
+INSERT INTO "remix_tag" VALUES(4067,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4067,'edm',1);
+INSERT INTO "remix_tag" VALUES(4067,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4067,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4067,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4067,'pop',1);
+INSERT INTO "remix_tag" VALUES(4067,'singing',1);
+INSERT INTO "remix_tag" VALUES(4067,'synth',1);
+INSERT INTO "remix_tag" VALUES(4067,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4067,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4068,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4068,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4068,'bells',1);
+INSERT INTO "remix_tag" VALUES(4068,'collab',1);
+INSERT INTO "remix_tag" VALUES(4068,'erhu',1);
+INSERT INTO "remix_tag" VALUES(4068,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4068,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4068,'pop',1);
+INSERT INTO "remix_tag" VALUES(4068,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4068,'singing',1);
+INSERT INTO "remix_tag" VALUES(4068,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4068,'synth',1);
+INSERT INTO "remix_tag" VALUES(4068,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4068,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4069,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4069,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4069,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4069,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4069,'edm',1);
+INSERT INTO "remix_tag" VALUES(4069,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4069,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4069,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4069,'rock',1);
+INSERT INTO "remix_tag" VALUES(4069,'synth',1);
+INSERT INTO "remix_tag" VALUES(4069,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4070,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4070,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4070,'carribean',1);
+INSERT INTO "remix_tag" VALUES(4070,'cello',1);
+INSERT INTO "remix_tag" VALUES(4070,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4070,'folk',1);
+INSERT INTO "remix_tag" VALUES(4070,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4070,'happy',1);
+INSERT INTO "remix_tag" VALUES(4070,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4070,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4070,'strings',1);
+INSERT INTO "remix_tag" VALUES(4070,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4070,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(4071,'bells',1);
+INSERT INTO "remix_tag" VALUES(4071,'chill',1);
+INSERT INTO "remix_tag" VALUES(4071,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4071,'edm',1);
+INSERT INTO "remix_tag" VALUES(4071,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4071,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4071,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4071,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4071,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4071,'synth',1);
+INSERT INTO "remix_tag" VALUES(4072,'chill',1);
+INSERT INTO "remix_tag" VALUES(4072,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4072,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4072,'synth',1);
+INSERT INTO "remix_tag" VALUES(4072,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4073,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4073,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4073,'chill',1);
+INSERT INTO "remix_tag" VALUES(4073,'djembe',1);
+INSERT INTO "remix_tag" VALUES(4073,'folk',1);
+INSERT INTO "remix_tag" VALUES(4073,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4073,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(4073,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4073,'mbira',1);
+INSERT INTO "remix_tag" VALUES(4073,'melodica',1);
+INSERT INTO "remix_tag" VALUES(4073,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4074,'bells',1);
+INSERT INTO "remix_tag" VALUES(4074,'choir',1);
+INSERT INTO "remix_tag" VALUES(4074,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4074,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4074,'pop',1);
+INSERT INTO "remix_tag" VALUES(4074,'synth',1);
+INSERT INTO "remix_tag" VALUES(4074,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4074,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4074,'workout',1);
+INSERT INTO "remix_tag" VALUES(4075,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4075,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4075,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4075,'dark',1);
+INSERT INTO "remix_tag" VALUES(4075,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4075,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4075,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4075,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4075,'metal',1);
+INSERT INTO "remix_tag" VALUES(4076,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4076,'choir',1);
+INSERT INTO "remix_tag" VALUES(4076,'classical',1);
+INSERT INTO "remix_tag" VALUES(4076,'collab',1);
+INSERT INTO "remix_tag" VALUES(4076,'flute',1);
+INSERT INTO "remix_tag" VALUES(4076,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4076,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4076,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4076,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4076,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4076,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4077,'edm',1);
+INSERT INTO "remix_tag" VALUES(4077,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4077,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4077,'funky',1);
+INSERT INTO "remix_tag" VALUES(4077,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4077,'house',1);
+INSERT INTO "remix_tag" VALUES(4077,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4077,'piano',1);
+INSERT INTO "remix_tag" VALUES(4077,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4078,'edm',1);
+INSERT INTO "remix_tag" VALUES(4078,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4078,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4078,'happy',1);
+INSERT INTO "remix_tag" VALUES(4078,'synth',1);
+INSERT INTO "remix_tag" VALUES(4078,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4079,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4079,'cello',1);
+INSERT INTO "remix_tag" VALUES(4079,'chill',1);
+INSERT INTO "remix_tag" VALUES(4079,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4079,'compo',1);
+INSERT INTO "remix_tag" VALUES(4079,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4079,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4079,'piano',1);
+INSERT INTO "remix_tag" VALUES(4079,'rock',1);
+INSERT INTO "remix_tag" VALUES(4079,'sad',1);
+INSERT INTO "remix_tag" VALUES(4079,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4080,'brass',1);
+INSERT INTO "remix_tag" VALUES(4080,'classical',1);
+INSERT INTO "remix_tag" VALUES(4080,'collab',1);
+INSERT INTO "remix_tag" VALUES(4080,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4080,'harp',1);
+INSERT INTO "remix_tag" VALUES(4080,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4080,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4080,'strings',1);
+INSERT INTO "remix_tag" VALUES(4080,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4080,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4080,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4080,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4081,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4081,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4081,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4081,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4081,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4081,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(4081,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4081,'metal',1);
+INSERT INTO "remix_tag" VALUES(4081,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4081,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4081,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4082,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4082,'collab',1);
+INSERT INTO "remix_tag" VALUES(4082,'edm',1);
+INSERT INTO "remix_tag" VALUES(4082,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4082,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4082,'funky',1);
+INSERT INTO "remix_tag" VALUES(4082,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4082,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4082,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4082,'synth',1);
+INSERT INTO "remix_tag" VALUES(4082,'trance',1);
+INSERT INTO "remix_tag" VALUES(4083,'compo',1);
+INSERT INTO "remix_tag" VALUES(4083,'edm',1);
+INSERT INTO "remix_tag" VALUES(4083,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4083,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4083,'happy',1);
+INSERT INTO "remix_tag" VALUES(4083,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4083,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4083,'synth',1);
+INSERT INTO "remix_tag" VALUES(4084,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4084,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4084,'collab',1);
+INSERT INTO "remix_tag" VALUES(4084,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4084,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4084,'folk',1);
+INSERT INTO "remix_tag" VALUES(4084,'funky',1);
+INSERT INTO "remix_tag" VALUES(4084,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4084,'organ',1);
+INSERT INTO "remix_tag" VALUES(4084,'piano',1);
+INSERT INTO "remix_tag" VALUES(4084,'rock',1);
+INSERT INTO "remix_tag" VALUES(4084,'strings',1);
+INSERT INTO "remix_tag" VALUES(4084,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4084,'violin',1);
+INSERT INTO "remix_tag" VALUES(4085,'brass',1);
+INSERT INTO "remix_tag" VALUES(4085,'chill',1);
+INSERT INTO "remix_tag" VALUES(4085,'collab',1);
+INSERT INTO "remix_tag" VALUES(4085,'funk',1);
+INSERT INTO "remix_tag" VALUES(4085,'funky',1);
+INSERT INTO "remix_tag" VALUES(4085,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4085,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4085,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4085,'organ',1);
+INSERT INTO "remix_tag" VALUES(4085,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4085,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4086,'bells',1);
+INSERT INTO "remix_tag" VALUES(4086,'choir',1);
+INSERT INTO "remix_tag" VALUES(4086,'harp',1);
+INSERT INTO "remix_tag" VALUES(4086,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4086,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4086,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4086,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4086,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4086,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4086,'strings',1);
+INSERT INTO "remix_tag" VALUES(4086,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4086,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4086,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4086,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4087,'bells',1);
+INSERT INTO "remix_tag" VALUES(4087,'brass',1);
+INSERT INTO "remix_tag" VALUES(4087,'collab',1);
+INSERT INTO "remix_tag" VALUES(4087,'dark',1);
+INSERT INTO "remix_tag" VALUES(4087,'harp',1);
+INSERT INTO "remix_tag" VALUES(4087,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4087,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4087,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4087,'strings',1);
+INSERT INTO "remix_tag" VALUES(4087,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4087,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4087,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4088,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4088,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4088,'dark',1);
+INSERT INTO "remix_tag" VALUES(4088,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4088,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4088,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4088,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4088,'synth',1);
+INSERT INTO "remix_tag" VALUES(4088,'trap',1);
+INSERT INTO "remix_tag" VALUES(4089,'brass',1);
+INSERT INTO "remix_tag" VALUES(4089,'choir',1);
+INSERT INTO "remix_tag" VALUES(4089,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4089,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4089,'epic',1);
+INSERT INTO "remix_tag" VALUES(4089,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4089,'strings',1);
+INSERT INTO "remix_tag" VALUES(4089,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4089,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4089,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4090,'brass',1);
+INSERT INTO "remix_tag" VALUES(4090,'collab',1);
+INSERT INTO "remix_tag" VALUES(4090,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4090,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4090,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4090,'march',1);
+INSERT INTO "remix_tag" VALUES(4090,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4090,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4090,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4090,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4090,'viola',1);
+INSERT INTO "remix_tag" VALUES(4090,'violin',1);
+INSERT INTO "remix_tag" VALUES(4091,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4091,'collab',1);
+INSERT INTO "remix_tag" VALUES(4091,'duet',1);
+INSERT INTO "remix_tag" VALUES(4091,'flugelhorn',1);
+INSERT INTO "remix_tag" VALUES(4091,'folk',1);
+INSERT INTO "remix_tag" VALUES(4091,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4091,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4091,'sad',1);
+INSERT INTO "remix_tag" VALUES(4091,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4092,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4092,'choir',1);
+INSERT INTO "remix_tag" VALUES(4092,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4092,'classical',1);
+INSERT INTO "remix_tag" VALUES(4092,'collab',1);
+INSERT INTO "remix_tag" VALUES(4092,'flute',1);
+INSERT INTO "remix_tag" VALUES(4092,'folk',1);
+INSERT INTO "remix_tag" VALUES(4092,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4092,'harp',1);
+INSERT INTO "remix_tag" VALUES(4092,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4092,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4092,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4092,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4092,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4093,'brass',1);
+INSERT INTO "remix_tag" VALUES(4093,'collab',1);
+INSERT INTO "remix_tag" VALUES(4093,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4093,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4093,'funk',1);
+INSERT INTO "remix_tag" VALUES(4093,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4093,'organ',1);
+INSERT INTO "remix_tag" VALUES(4093,'rock',1);
+INSERT INTO "remix_tag" VALUES(4093,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4093,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4093,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4094,'bossa-nova',1);
+INSERT INTO "remix_tag" VALUES(4094,'collab',1);
+INSERT INTO "remix_tag" VALUES(4094,'flugelhorn',1);
+INSERT INTO "remix_tag" VALUES(4094,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4094,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4094,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4094,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4094,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4094,'piano',1);
+INSERT INTO "remix_tag" VALUES(4094,'strings',1);
+INSERT INTO "remix_tag" VALUES(4094,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4095,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4095,'chinese',1);
+INSERT INTO "remix_tag" VALUES(4095,'erhu',1);
+INSERT INTO "remix_tag" VALUES(4095,'folk',1);
+INSERT INTO "remix_tag" VALUES(4095,'guzheng',1);
+INSERT INTO "remix_tag" VALUES(4095,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4095,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4095,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4095,'sad',1);
+INSERT INTO "remix_tag" VALUES(4095,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4096,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4096,'chill',1);
+INSERT INTO "remix_tag" VALUES(4096,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4096,'folk',1);
+INSERT INTO "remix_tag" VALUES(4096,'indian',1);
+INSERT INTO "remix_tag" VALUES(4096,'kora',1);
+INSERT INTO "remix_tag" VALUES(4096,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4096,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4096,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4096,'synth',1);
+INSERT INTO "remix_tag" VALUES(4096,'tanpura',1);
+INSERT INTO "remix_tag" VALUES(4097,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4097,'choir',1);
+INSERT INTO "remix_tag" VALUES(4097,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4097,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4097,'epic',1);
+INSERT INTO "remix_tag" VALUES(4097,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4097,'metal',1);
+INSERT INTO "remix_tag" VALUES(4097,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4097,'synth',1);
+INSERT INTO "remix_tag" VALUES(4098,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4098,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4098,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4098,'flute',1);
+INSERT INTO "remix_tag" VALUES(4098,'funk',1);
+INSERT INTO "remix_tag" VALUES(4098,'funky',1);
+INSERT INTO "remix_tag" VALUES(4098,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4098,'rock',1);
+INSERT INTO "remix_tag" VALUES(4098,'soul',1);
+INSERT INTO "remix_tag" VALUES(4098,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4099,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4099,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4099,'funky',1);
+INSERT INTO "remix_tag" VALUES(4099,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4099,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4099,'piano',1);
+INSERT INTO "remix_tag" VALUES(4099,'pop',1);
+INSERT INTO "remix_tag" VALUES(4099,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4099,'synth',1);
+INSERT INTO "remix_tag" VALUES(4099,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4099,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4099,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4100,'brass',1);
+INSERT INTO "remix_tag" VALUES(4100,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4100,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4100,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4100,'organ',1);
+INSERT INTO "remix_tag" VALUES(4100,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4100,'synth',1);
+INSERT INTO "remix_tag" VALUES(4101,'brass',1);
+INSERT INTO "remix_tag" VALUES(4101,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4101,'classical',1);
+INSERT INTO "remix_tag" VALUES(4101,'dark',1);
+INSERT INTO "remix_tag" VALUES(4101,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4101,'harp',1);
+INSERT INTO "remix_tag" VALUES(4101,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4101,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4101,'strings',1);
+INSERT INTO "remix_tag" VALUES(4101,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4101,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4102,'brass',1);
+INSERT INTO "remix_tag" VALUES(4102,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4102,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4102,'epic',1);
+INSERT INTO "remix_tag" VALUES(4102,'march',1);
+INSERT INTO "remix_tag" VALUES(4102,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4102,'strings',1);
+INSERT INTO "remix_tag" VALUES(4102,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4102,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4103,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4103,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4103,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4103,'collab',1);
+INSERT INTO "remix_tag" VALUES(4103,'flute',1);
+INSERT INTO "remix_tag" VALUES(4103,'folk',1);
+INSERT INTO "remix_tag" VALUES(4103,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4103,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4103,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4103,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4104,'brass',1);
+INSERT INTO "remix_tag" VALUES(4104,'classical',1);
+INSERT INTO "remix_tag" VALUES(4104,'harp',1);
+INSERT INTO "remix_tag" VALUES(4104,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4104,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4104,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4104,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4104,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4104,'piano',1);
+INSERT INTO "remix_tag" VALUES(4104,'strings',1);
+INSERT INTO "remix_tag" VALUES(4104,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4104,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4105,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4105,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4105,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4105,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4105,'metal',1);
+INSERT INTO "remix_tag" VALUES(4105,'rock',1);
+INSERT INTO "remix_tag" VALUES(4105,'strings',1);
+INSERT INTO "remix_tag" VALUES(4106,'bells',1);
+INSERT INTO "remix_tag" VALUES(4106,'chill',1);
+INSERT INTO "remix_tag" VALUES(4106,'choir',1);
+INSERT INTO "remix_tag" VALUES(4106,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4106,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4106,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4106,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4107,'dark',1);
+INSERT INTO "remix_tag" VALUES(4107,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4107,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4107,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4107,'synth',1);
+INSERT INTO "remix_tag" VALUES(4107,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4107,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4108,'chill',1);
+INSERT INTO "remix_tag" VALUES(4108,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4108,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4108,'edm',1);
+INSERT INTO "remix_tag" VALUES(4108,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4108,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4108,'synth',1);
+INSERT INTO "remix_tag" VALUES(4109,'brass',1);
+INSERT INTO "remix_tag" VALUES(4109,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4109,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4109,'edm',1);
+INSERT INTO "remix_tag" VALUES(4109,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4109,'epic',1);
+INSERT INTO "remix_tag" VALUES(4109,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4109,'piano',1);
+INSERT INTO "remix_tag" VALUES(4109,'strings',1);
+INSERT INTO "remix_tag" VALUES(4109,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4109,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4109,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4109,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4109,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4110,'brass',1);
+INSERT INTO "remix_tag" VALUES(4110,'choir',1);
+INSERT INTO "remix_tag" VALUES(4110,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4110,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4110,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4110,'march',1);
+INSERT INTO "remix_tag" VALUES(4110,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4110,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4110,'piano',1);
+INSERT INTO "remix_tag" VALUES(4110,'singing',1);
+INSERT INTO "remix_tag" VALUES(4110,'slavic',1);
+INSERT INTO "remix_tag" VALUES(4110,'strings',1);
+INSERT INTO "remix_tag" VALUES(4110,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4110,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4110,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4111,'dark',1);
+INSERT INTO "remix_tag" VALUES(4111,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4111,'epic',1);
+INSERT INTO "remix_tag" VALUES(4111,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4111,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4111,'metal',1);
+INSERT INTO "remix_tag" VALUES(4111,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4111,'rock',1);
+INSERT INTO "remix_tag" VALUES(4112,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4112,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4112,'edm',1);
+INSERT INTO "remix_tag" VALUES(4112,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4112,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4112,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4112,'synth',1);
+INSERT INTO "remix_tag" VALUES(4112,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4113,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4113,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4113,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4113,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4113,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4114,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4114,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4114,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4114,'epic',1);
+INSERT INTO "remix_tag" VALUES(4114,'medley',1);
+INSERT INTO "remix_tag" VALUES(4114,'metal',1);
+INSERT INTO "remix_tag" VALUES(4114,'piano',1);
+INSERT INTO "remix_tag" VALUES(4114,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4114,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4114,'synth',1);
+INSERT INTO "remix_tag" VALUES(4114,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4115,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4115,'bells',1);
+INSERT INTO "remix_tag" VALUES(4115,'folk',1);
+INSERT INTO "remix_tag" VALUES(4115,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4115,'harp',1);
+INSERT INTO "remix_tag" VALUES(4115,'indian',1);
+INSERT INTO "remix_tag" VALUES(4115,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4115,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4115,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4115,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4115,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4115,'singing',1);
+INSERT INTO "remix_tag" VALUES(4115,'sitar',1);
+INSERT INTO "remix_tag" VALUES(4115,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4115,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4116,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4116,'bells',1);
+INSERT INTO "remix_tag" VALUES(4116,'choir',1);
+INSERT INTO "remix_tag" VALUES(4116,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4116,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4116,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4116,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4116,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4116,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4116,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4116,'strings',1);
+INSERT INTO "remix_tag" VALUES(4116,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4116,'synth',1);
+INSERT INTO "remix_tag" VALUES(4117,'chill',1);
+INSERT INTO "remix_tag" VALUES(4117,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4117,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4117,'edm',1);
+INSERT INTO "remix_tag" VALUES(4117,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4117,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4117,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4117,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4117,'synth',1);
+INSERT INTO "remix_tag" VALUES(4117,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4117,'timesig-7-4',1);
+INSERT INTO "remix_tag" VALUES(4117,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4118,'collab',1);
+INSERT INTO "remix_tag" VALUES(4118,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4118,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4118,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4118,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4118,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4118,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4118,'rock',1);
+INSERT INTO "remix_tag" VALUES(4118,'synth',1);
+INSERT INTO "remix_tag" VALUES(4119,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4119,'collab',1);
+INSERT INTO "remix_tag" VALUES(4119,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4119,'flute',1);
+INSERT INTO "remix_tag" VALUES(4119,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4119,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4119,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4119,'latin',1);
+INSERT INTO "remix_tag" VALUES(4119,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4119,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4119,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4119,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4119,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4119,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4119,'tuba',1);
+INSERT INTO "remix_tag" VALUES(4120,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4120,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4120,'epic',1);
+INSERT INTO "remix_tag" VALUES(4120,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4120,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4120,'singing',1);
+INSERT INTO "remix_tag" VALUES(4120,'strings',1);
+INSERT INTO "remix_tag" VALUES(4120,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4121,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4121,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4121,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4121,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4121,'metal',1);
+INSERT INTO "remix_tag" VALUES(4121,'synth',1);
+INSERT INTO "remix_tag" VALUES(4122,'brass',1);
+INSERT INTO "remix_tag" VALUES(4122,'choir',1);
+INSERT INTO "remix_tag" VALUES(4122,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4122,'epic',1);
+INSERT INTO "remix_tag" VALUES(4122,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4122,'strings',1);
+INSERT INTO "remix_tag" VALUES(4122,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4122,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4122,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4123,'classical',1);
+INSERT INTO "remix_tag" VALUES(4123,'piano',1);
+INSERT INTO "remix_tag" VALUES(4123,'pop',1);
+INSERT INTO "remix_tag" VALUES(4123,'solo',1);
+INSERT INTO "remix_tag" VALUES(4123,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4124,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4124,'chill',1);
+INSERT INTO "remix_tag" VALUES(4124,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4124,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4124,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4124,'rock',1);
+INSERT INTO "remix_tag" VALUES(4124,'synth',1);
+INSERT INTO "remix_tag" VALUES(4124,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4125,'brass',1);
+INSERT INTO "remix_tag" VALUES(4125,'cajun',1);
+INSERT INTO "remix_tag" VALUES(4125,'collab',1);
+INSERT INTO "remix_tag" VALUES(4125,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4125,'happy',1);
+INSERT INTO "remix_tag" VALUES(4125,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4125,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4125,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4125,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4125,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4125,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4125,'tuba',1);
+INSERT INTO "remix_tag" VALUES(4126,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4126,'cello',1);
+INSERT INTO "remix_tag" VALUES(4126,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4126,'classical',1);
+INSERT INTO "remix_tag" VALUES(4126,'flute',1);
+INSERT INTO "remix_tag" VALUES(4126,'harp',1);
+INSERT INTO "remix_tag" VALUES(4126,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4126,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4126,'strings',1);
+INSERT INTO "remix_tag" VALUES(4126,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4127,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4127,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4127,'happy',1);
+INSERT INTO "remix_tag" VALUES(4127,'pop',1);
+INSERT INTO "remix_tag" VALUES(4127,'rock',1);
+INSERT INTO "remix_tag" VALUES(4127,'synth',1);
+INSERT INTO "remix_tag" VALUES(4127,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4128,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4128,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4128,'carribean',1);
+INSERT INTO "remix_tag" VALUES(4128,'chill',1);
+INSERT INTO "remix_tag" VALUES(4128,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4128,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4128,'folk',1);
+INSERT INTO "remix_tag" VALUES(4128,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4128,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4129,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4129,'compo',1);
+INSERT INTO "remix_tag" VALUES(4129,'edm',1);
+INSERT INTO "remix_tag" VALUES(4129,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4129,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4129,'funky',1);
+INSERT INTO "remix_tag" VALUES(4129,'synth',1);
+INSERT INTO "remix_tag" VALUES(4130,'brass',1);
+INSERT INTO "remix_tag" VALUES(4130,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4130,'choir',1);
+INSERT INTO "remix_tag" VALUES(4130,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4130,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4130,'epic',1);
+INSERT INTO "remix_tag" VALUES(4130,'harp',1);
+INSERT INTO "remix_tag" VALUES(4130,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4130,'strings',1);
+INSERT INTO "remix_tag" VALUES(4130,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4130,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4130,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4130,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4130,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4131,'brass',1);
+INSERT INTO "remix_tag" VALUES(4131,'collab',1);
+INSERT INTO "remix_tag" VALUES(4131,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4131,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4131,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4131,'funk',1);
+INSERT INTO "remix_tag" VALUES(4131,'funky',1);
+INSERT INTO "remix_tag" VALUES(4131,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4131,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4131,'rock',1);
+INSERT INTO "remix_tag" VALUES(4131,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4131,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4132,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4132,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4132,'collab',1);
+INSERT INTO "remix_tag" VALUES(4132,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4132,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4132,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4132,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4132,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4132,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4132,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4132,'rock',1);
+INSERT INTO "remix_tag" VALUES(4132,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4132,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4133,'chill',1);
+INSERT INTO "remix_tag" VALUES(4133,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4133,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4133,'collab',1);
+INSERT INTO "remix_tag" VALUES(4133,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4133,'flute',1);
+INSERT INTO "remix_tag" VALUES(4133,'folk',1);
+INSERT INTO "remix_tag" VALUES(4133,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4133,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4134,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4134,'collab',1);
+INSERT INTO "remix_tag" VALUES(4134,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4134,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4134,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4134,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4134,'rock',1);
+INSERT INTO "remix_tag" VALUES(4134,'singing',1);
+INSERT INTO "remix_tag" VALUES(4134,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4135,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4135,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4135,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4135,'collab',1);
+INSERT INTO "remix_tag" VALUES(4135,'folk',1);
+INSERT INTO "remix_tag" VALUES(4135,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4135,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4135,'recorder',1);
+INSERT INTO "remix_tag" VALUES(4135,'rock',1);
+INSERT INTO "remix_tag" VALUES(4136,'bells',1);
+INSERT INTO "remix_tag" VALUES(4136,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4136,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4136,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4136,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4136,'piano',1);
+INSERT INTO "remix_tag" VALUES(4136,'rock',1);
+INSERT INTO "remix_tag" VALUES(4136,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4136,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4136,'synth',1);
+INSERT INTO "remix_tag" VALUES(4136,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4137,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4137,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4137,'classical',1);
+INSERT INTO "remix_tag" VALUES(4137,'collab',1);
+INSERT INTO "remix_tag" VALUES(4137,'flute',1);
+INSERT INTO "remix_tag" VALUES(4137,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4137,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4137,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4137,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4138,'choir',1);
+INSERT INTO "remix_tag" VALUES(4138,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4138,'dark',1);
+INSERT INTO "remix_tag" VALUES(4138,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4138,'harp',1);
+INSERT INTO "remix_tag" VALUES(4138,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4138,'piano',1);
+INSERT INTO "remix_tag" VALUES(4138,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4138,'strings',1);
+INSERT INTO "remix_tag" VALUES(4138,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4138,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4138,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4139,'brass',1);
+INSERT INTO "remix_tag" VALUES(4139,'collab',1);
+INSERT INTO "remix_tag" VALUES(4139,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4139,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4139,'funky',1);
+INSERT INTO "remix_tag" VALUES(4139,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4139,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4139,'rock',1);
+INSERT INTO "remix_tag" VALUES(4139,'synth',1);
+INSERT INTO "remix_tag" VALUES(4139,'violin',1);
+INSERT INTO "remix_tag" VALUES(4140,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4140,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4140,'dark',1);
+INSERT INTO "remix_tag" VALUES(4140,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4140,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4140,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4140,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4140,'synth',1);
+INSERT INTO "remix_tag" VALUES(4141,'classical',1);
+INSERT INTO "remix_tag" VALUES(4141,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4141,'piano',1);
+INSERT INTO "remix_tag" VALUES(4141,'solo',1);
+INSERT INTO "remix_tag" VALUES(4141,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4141,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4142,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4142,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4142,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4142,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4142,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4142,'synth',1);
+INSERT INTO "remix_tag" VALUES(4142,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4143,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4143,'bells',1);
+INSERT INTO "remix_tag" VALUES(4143,'chill',1);
+INSERT INTO "remix_tag" VALUES(4143,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4143,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4143,'piano',1);
+INSERT INTO "remix_tag" VALUES(4143,'pop',1);
+INSERT INTO "remix_tag" VALUES(4143,'synth',1);
+INSERT INTO "remix_tag" VALUES(4143,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4143,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4144,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4144,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4144,'chill',1);
+INSERT INTO "remix_tag" VALUES(4144,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4144,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4144,'classical',1);
+INSERT INTO "remix_tag" VALUES(4144,'collab',1);
+INSERT INTO "remix_tag" VALUES(4144,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4144,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4144,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4144,'folk',1);
+INSERT INTO "remix_tag" VALUES(4144,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4144,'medley',1);
+INSERT INTO "remix_tag" VALUES(4144,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4144,'piano',1);
+INSERT INTO "remix_tag" VALUES(4144,'strings',1);
+INSERT INTO "remix_tag" VALUES(4144,'synth',1);
+INSERT INTO "remix_tag" VALUES(4144,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4145,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4145,'edm',1);
+INSERT INTO "remix_tag" VALUES(4145,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4145,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4145,'funky',1);
+INSERT INTO "remix_tag" VALUES(4145,'synth',1);
+INSERT INTO "remix_tag" VALUES(4146,'chill',1);
+INSERT INTO "remix_tag" VALUES(4146,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4146,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4146,'pop',1);
+INSERT INTO "remix_tag" VALUES(4146,'synth',1);
+INSERT INTO "remix_tag" VALUES(4146,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4146,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4147,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4147,'dark',1);
+INSERT INTO "remix_tag" VALUES(4147,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4147,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4147,'piano',1);
+INSERT INTO "remix_tag" VALUES(4147,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4147,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4147,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4148,'collab',1);
+INSERT INTO "remix_tag" VALUES(4148,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4148,'edm',1);
+INSERT INTO "remix_tag" VALUES(4148,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4148,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4148,'funky',1);
+INSERT INTO "remix_tag" VALUES(4148,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4148,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4148,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4148,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4148,'synth',1);
+INSERT INTO "remix_tag" VALUES(4149,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4149,'bells',1);
+INSERT INTO "remix_tag" VALUES(4149,'chill',1);
+INSERT INTO "remix_tag" VALUES(4149,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4149,'dark',1);
+INSERT INTO "remix_tag" VALUES(4149,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4149,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4149,'piano',1);
+INSERT INTO "remix_tag" VALUES(4149,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4149,'strings',1);
+INSERT INTO "remix_tag" VALUES(4149,'synth',1);
+INSERT INTO "remix_tag" VALUES(4150,'bells',1);
+INSERT INTO "remix_tag" VALUES(4150,'classical',1);
+INSERT INTO "remix_tag" VALUES(4150,'collab',1);
+INSERT INTO "remix_tag" VALUES(4150,'dark',1);
+INSERT INTO "remix_tag" VALUES(4150,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4150,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4150,'march',1);
+INSERT INTO "remix_tag" VALUES(4150,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4150,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4150,'strings',1);
+INSERT INTO "remix_tag" VALUES(4150,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4150,'violin',1);
+INSERT INTO "remix_tag" VALUES(4151,'choir',1);
+INSERT INTO "remix_tag" VALUES(4151,'collab',1);
+INSERT INTO "remix_tag" VALUES(4151,'dark',1);
+INSERT INTO "remix_tag" VALUES(4151,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4151,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4151,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4151,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4151,'happy',1);
+INSERT INTO "remix_tag" VALUES(4151,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4151,'rock',1);
+INSERT INTO "remix_tag" VALUES(4151,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4151,'synth',1);
+INSERT INTO "remix_tag" VALUES(4152,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4152,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4152,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4152,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4152,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4152,'strings',1);
+INSERT INTO "remix_tag" VALUES(4152,'synth',1);
+INSERT INTO "remix_tag" VALUES(4152,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4153,'chill',1);
+INSERT INTO "remix_tag" VALUES(4153,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4153,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4153,'funky',1);
+INSERT INTO "remix_tag" VALUES(4153,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4153,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4153,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4153,'synth',1);
+INSERT INTO "remix_tag" VALUES(4154,'choir',1);
+INSERT INTO "remix_tag" VALUES(4154,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4154,'classical',1);
+INSERT INTO "remix_tag" VALUES(4154,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4154,'harp',1);
+INSERT INTO "remix_tag" VALUES(4154,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4154,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4154,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4154,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4154,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4155,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4155,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4155,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4155,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4155,'metal',1);
+INSERT INTO "remix_tag" VALUES(4155,'rock',1);
+INSERT INTO "remix_tag" VALUES(4155,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4156,'chill',1);
+INSERT INTO "remix_tag" VALUES(4156,'dark',1);
+INSERT INTO "remix_tag" VALUES(4156,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4156,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4156,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4156,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4156,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4156,'organ',1);
+INSERT INTO "remix_tag" VALUES(4156,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4156,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4156,'synth',1);
+INSERT INTO "remix_tag" VALUES(4157,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4157,'edm',1);
+INSERT INTO "remix_tag" VALUES(4157,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4157,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4157,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4157,'epic',1);
+INSERT INTO "remix_tag" VALUES(4157,'happy',1);
+INSERT INTO "remix_tag" VALUES(4157,'pop',1);
+INSERT INTO "remix_tag" VALUES(4157,'rock',1);
+INSERT INTO "remix_tag" VALUES(4157,'singing',1);
+INSERT INTO "remix_tag" VALUES(4157,'synth',1);
+INSERT INTO "remix_tag" VALUES(4157,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4157,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4158,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4158,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4158,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4158,'cello',1);
+INSERT INTO "remix_tag" VALUES(4158,'collab',1);
+INSERT INTO "remix_tag" VALUES(4158,'flute',1);
+INSERT INTO "remix_tag" VALUES(4158,'folk',1);
+INSERT INTO "remix_tag" VALUES(4158,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4158,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4158,'rock',1);
+INSERT INTO "remix_tag" VALUES(4159,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4159,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4159,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4159,'flute',1);
+INSERT INTO "remix_tag" VALUES(4159,'folk',1);
+INSERT INTO "remix_tag" VALUES(4159,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4159,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4159,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4159,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4159,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4159,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4159,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4159,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4159,'piano',1);
+INSERT INTO "remix_tag" VALUES(4159,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4159,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4159,'strings',1);
+INSERT INTO "remix_tag" VALUES(4159,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4160,'classical',1);
+INSERT INTO "remix_tag" VALUES(4160,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4160,'piano',1);
+INSERT INTO "remix_tag" VALUES(4160,'solo',1);
+INSERT INTO "remix_tag" VALUES(4160,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4160,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4161,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4161,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4161,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4161,'flute',1);
+INSERT INTO "remix_tag" VALUES(4161,'folk',1);
+INSERT INTO "remix_tag" VALUES(4161,'happy',1);
+INSERT INTO "remix_tag" VALUES(4161,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4161,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4162,'brass',1);
+INSERT INTO "remix_tag" VALUES(4162,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4162,'epic',1);
+INSERT INTO "remix_tag" VALUES(4162,'piano',1);
+INSERT INTO "remix_tag" VALUES(4162,'singing',1);
+INSERT INTO "remix_tag" VALUES(4162,'strings',1);
+INSERT INTO "remix_tag" VALUES(4162,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4162,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4163,'brass',1);
+INSERT INTO "remix_tag" VALUES(4163,'choir',1);
+INSERT INTO "remix_tag" VALUES(4163,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4163,'collab',1);
+INSERT INTO "remix_tag" VALUES(4163,'dark',1);
+INSERT INTO "remix_tag" VALUES(4163,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4163,'epic',1);
+INSERT INTO "remix_tag" VALUES(4163,'rock',1);
+INSERT INTO "remix_tag" VALUES(4163,'strings',1);
+INSERT INTO "remix_tag" VALUES(4163,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4163,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4164,'chill',1);
+INSERT INTO "remix_tag" VALUES(4164,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4164,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4164,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4164,'piano',1);
+INSERT INTO "remix_tag" VALUES(4164,'strings',1);
+INSERT INTO "remix_tag" VALUES(4165,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4165,'brass',1);
+INSERT INTO "remix_tag" VALUES(4165,'collab',1);
+INSERT INTO "remix_tag" VALUES(4165,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4165,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4165,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4165,'funky',1);
+INSERT INTO "remix_tag" VALUES(4165,'metal',1);
+INSERT INTO "remix_tag" VALUES(4165,'rock',1);
+INSERT INTO "remix_tag" VALUES(4165,'synth',1);
+INSERT INTO "remix_tag" VALUES(4165,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4166,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4166,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4166,'dark',1);
+INSERT INTO "remix_tag" VALUES(4166,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4166,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4166,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4166,'metal',1);
+INSERT INTO "remix_tag" VALUES(4167,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4167,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4167,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4167,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4167,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4167,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4167,'rock',1);
+INSERT INTO "remix_tag" VALUES(4167,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4167,'strings',1);
+INSERT INTO "remix_tag" VALUES(4167,'synth',1);
+INSERT INTO "remix_tag" VALUES(4168,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4168,'brass',1);
+INSERT INTO "remix_tag" VALUES(4168,'choir',1);
+INSERT INTO "remix_tag" VALUES(4168,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4168,'dark',1);
+INSERT INTO "remix_tag" VALUES(4168,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4168,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4168,'epic',1);
+INSERT INTO "remix_tag" VALUES(4168,'metal',1);
+INSERT INTO "remix_tag" VALUES(4168,'organ',1);
+INSERT INTO "remix_tag" VALUES(4168,'piano',1);
+INSERT INTO "remix_tag" VALUES(4168,'strings',1);
+INSERT INTO "remix_tag" VALUES(4168,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4169,'brass',1);
+INSERT INTO "remix_tag" VALUES(4169,'classical',1);
+INSERT INTO "remix_tag" VALUES(4169,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4169,'harp',1);
+INSERT INTO "remix_tag" VALUES(4169,'march',1);
+INSERT INTO "remix_tag" VALUES(4169,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4169,'strings',1);
+INSERT INTO "remix_tag" VALUES(4169,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4169,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4170,'bells',1);
+INSERT INTO "remix_tag" VALUES(4170,'collab',1);
+INSERT INTO "remix_tag" VALUES(4170,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4170,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4170,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4170,'happy',1);
+INSERT INTO "remix_tag" VALUES(4170,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4170,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4170,'pop',1);
+INSERT INTO "remix_tag" VALUES(4170,'synth',1);
+INSERT INTO "remix_tag" VALUES(4170,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4170,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4170,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4171,'bells',1);
+INSERT INTO "remix_tag" VALUES(4171,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4171,'classical',1);
+INSERT INTO "remix_tag" VALUES(4171,'flute',1);
+INSERT INTO "remix_tag" VALUES(4171,'harp',1);
+INSERT INTO "remix_tag" VALUES(4171,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4171,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4171,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4171,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4171,'piano',1);
+INSERT INTO "remix_tag" VALUES(4171,'strings',1);
+INSERT INTO "remix_tag" VALUES(4171,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4171,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4172,'brass',1);
+INSERT INTO "remix_tag" VALUES(4172,'edm',1);
+INSERT INTO "remix_tag" VALUES(4172,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4172,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4172,'funk',1);
+INSERT INTO "remix_tag" VALUES(4172,'funky',1);
+INSERT INTO "remix_tag" VALUES(4172,'piano',1);
+INSERT INTO "remix_tag" VALUES(4172,'synth',1);
+INSERT INTO "remix_tag" VALUES(4172,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4173,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4173,'chill',1);
+INSERT INTO "remix_tag" VALUES(4173,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4173,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4173,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4173,'piano',1);
+INSERT INTO "remix_tag" VALUES(4173,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4173,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4173,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4173,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4174,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4174,'edm',1);
+INSERT INTO "remix_tag" VALUES(4174,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4174,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4174,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4174,'synth',1);
+INSERT INTO "remix_tag" VALUES(4175,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4175,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4175,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4175,'pop',1);
+INSERT INTO "remix_tag" VALUES(4175,'singing',1);
+INSERT INTO "remix_tag" VALUES(4175,'synth',1);
+INSERT INTO "remix_tag" VALUES(4175,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4175,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4175,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4176,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4176,'dark',1);
+INSERT INTO "remix_tag" VALUES(4176,'edm',1);
+INSERT INTO "remix_tag" VALUES(4176,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4176,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4176,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4176,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4176,'synth',1);
+INSERT INTO "remix_tag" VALUES(4176,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4177,'brass',1);
+INSERT INTO "remix_tag" VALUES(4177,'cello',1);
+INSERT INTO "remix_tag" VALUES(4177,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4177,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4177,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4177,'funk',1);
+INSERT INTO "remix_tag" VALUES(4177,'funky',1);
+INSERT INTO "remix_tag" VALUES(4177,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4177,'rock',1);
+INSERT INTO "remix_tag" VALUES(4177,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4177,'strings',1);
+INSERT INTO "remix_tag" VALUES(4177,'violin',1);
+INSERT INTO "remix_tag" VALUES(4178,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4178,'dance',1);
+INSERT INTO "remix_tag" VALUES(4178,'edm',1);
+INSERT INTO "remix_tag" VALUES(4178,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4178,'funky',1);
+INSERT INTO "remix_tag" VALUES(4178,'piano',1);
+INSERT INTO "remix_tag" VALUES(4178,'strings',1);
+INSERT INTO "remix_tag" VALUES(4178,'synth',1);
+INSERT INTO "remix_tag" VALUES(4178,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4178,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4179,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4179,'bells',1);
+INSERT INTO "remix_tag" VALUES(4179,'chill',1);
+INSERT INTO "remix_tag" VALUES(4179,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4179,'edm',1);
+INSERT INTO "remix_tag" VALUES(4179,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4179,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4179,'happy',1);
+INSERT INTO "remix_tag" VALUES(4179,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4179,'piano',1);
+INSERT INTO "remix_tag" VALUES(4179,'pop',1);
+INSERT INTO "remix_tag" VALUES(4179,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4179,'synth',1);
+INSERT INTO "remix_tag" VALUES(4179,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4180,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4180,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4180,'chill',1);
+INSERT INTO "remix_tag" VALUES(4180,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4180,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4180,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4180,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4180,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4180,'organ',1);
+INSERT INTO "remix_tag" VALUES(4180,'rock',1);
+INSERT INTO "remix_tag" VALUES(4180,'synth',1);
+INSERT INTO "remix_tag" VALUES(4180,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4180,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4180,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4181,'carribean',1);
+INSERT INTO "remix_tag" VALUES(4181,'chill',1);
+INSERT INTO "remix_tag" VALUES(4181,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4181,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4181,'funky',1);
+INSERT INTO "remix_tag" VALUES(4181,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4181,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4181,'organ',1);
+INSERT INTO "remix_tag" VALUES(4181,'piano',1);
+INSERT INTO "remix_tag" VALUES(4181,'reggae',1);
+INSERT INTO "remix_tag" VALUES(4181,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4182,'chill',1);
+INSERT INTO "remix_tag" VALUES(4182,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4182,'synth',1);
+INSERT INTO "remix_tag" VALUES(4182,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4182,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4183,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4183,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4183,'dark',1);
+INSERT INTO "remix_tag" VALUES(4183,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4183,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4183,'metal',1);
+INSERT INTO "remix_tag" VALUES(4183,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4183,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4184,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4184,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4184,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4184,'piano',1);
+INSERT INTO "remix_tag" VALUES(4184,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4184,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4184,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4184,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4185,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4185,'choir',1);
+INSERT INTO "remix_tag" VALUES(4185,'dark',1);
+INSERT INTO "remix_tag" VALUES(4185,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4185,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4185,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4185,'metal',1);
+INSERT INTO "remix_tag" VALUES(4185,'piano',1);
+INSERT INTO "remix_tag" VALUES(4185,'strings',1);
+INSERT INTO "remix_tag" VALUES(4186,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4186,'edm',1);
+INSERT INTO "remix_tag" VALUES(4186,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4186,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4186,'synth',1);
+INSERT INTO "remix_tag" VALUES(4186,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4187,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4187,'dark',1);
+INSERT INTO "remix_tag" VALUES(4187,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4187,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4187,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4187,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4187,'synth',1);
+INSERT INTO "remix_tag" VALUES(4188,'bells',1);
+INSERT INTO "remix_tag" VALUES(4188,'chill',1);
+INSERT INTO "remix_tag" VALUES(4188,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4188,'flute',1);
+INSERT INTO "remix_tag" VALUES(4188,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4188,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4188,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4188,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4188,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4189,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4189,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4189,'house',1);
+INSERT INTO "remix_tag" VALUES(4189,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4189,'piano',1);
+INSERT INTO "remix_tag" VALUES(4189,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4189,'synth',1);
+INSERT INTO "remix_tag" VALUES(4189,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4189,'trap',1);
+INSERT INTO "remix_tag" VALUES(4190,'bells',1);
+INSERT INTO "remix_tag" VALUES(4190,'chill',1);
+INSERT INTO "remix_tag" VALUES(4190,'edm',1);
+INSERT INTO "remix_tag" VALUES(4190,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4190,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4190,'house',1);
+INSERT INTO "remix_tag" VALUES(4190,'synth',1);
+INSERT INTO "remix_tag" VALUES(4190,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4191,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4191,'african',1);
+INSERT INTO "remix_tag" VALUES(4191,'brass',1);
+INSERT INTO "remix_tag" VALUES(4191,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4191,'choir',1);
+INSERT INTO "remix_tag" VALUES(4191,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4191,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4191,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4191,'epic',1);
+INSERT INTO "remix_tag" VALUES(4191,'folk',1);
+INSERT INTO "remix_tag" VALUES(4191,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4191,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4191,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4191,'south-american',1);
+INSERT INTO "remix_tag" VALUES(4191,'strings',1);
+INSERT INTO "remix_tag" VALUES(4191,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4191,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4192,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4192,'dance',1);
+INSERT INTO "remix_tag" VALUES(4192,'edm',1);
+INSERT INTO "remix_tag" VALUES(4192,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4192,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4192,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4192,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4192,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4192,'synth',1);
+INSERT INTO "remix_tag" VALUES(4192,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4193,'classical',1);
+INSERT INTO "remix_tag" VALUES(4193,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4193,'folk',1);
+INSERT INTO "remix_tag" VALUES(4193,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4193,'piano',1);
+INSERT INTO "remix_tag" VALUES(4193,'solo',1);
+INSERT INTO "remix_tag" VALUES(4193,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4193,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4194,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4194,'collab',1);
+INSERT INTO "remix_tag" VALUES(4194,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4194,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4194,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4194,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4194,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4194,'metal',1);
+INSERT INTO "remix_tag" VALUES(4194,'rock',1);
+INSERT INTO "remix_tag" VALUES(4194,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4195,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4195,'bells',1);
+INSERT INTO "remix_tag" VALUES(4195,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4195,'flute',1);
+INSERT INTO "remix_tag" VALUES(4195,'harp',1);
+INSERT INTO "remix_tag" VALUES(4195,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4195,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4195,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4195,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4195,'piano',1);
+INSERT INTO "remix_tag" VALUES(4195,'strings',1);
+INSERT INTO "remix_tag" VALUES(4195,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4195,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4196,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4196,'chill',1);
+INSERT INTO "remix_tag" VALUES(4196,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4196,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4196,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4196,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4196,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4196,'rnb',1);
+INSERT INTO "remix_tag" VALUES(4196,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4196,'synth',1);
+INSERT INTO "remix_tag" VALUES(4196,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4196,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4197,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4197,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4197,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4197,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4197,'collab',1);
+INSERT INTO "remix_tag" VALUES(4197,'folk',1);
+INSERT INTO "remix_tag" VALUES(4197,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4197,'piano',1);
+INSERT INTO "remix_tag" VALUES(4197,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4198,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4198,'collab',1);
+INSERT INTO "remix_tag" VALUES(4198,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4198,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4198,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4198,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4198,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4198,'jungle',1);
+INSERT INTO "remix_tag" VALUES(4198,'piano',1);
+INSERT INTO "remix_tag" VALUES(4198,'rock',1);
+INSERT INTO "remix_tag" VALUES(4198,'synth',1);
+INSERT INTO "remix_tag" VALUES(4198,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4199,'folk',1);
+INSERT INTO "remix_tag" VALUES(4199,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4199,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4199,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4199,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4199,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4199,'recorder',1);
+INSERT INTO "remix_tag" VALUES(4199,'shakuhachi',1);
+INSERT INTO "remix_tag" VALUES(4199,'singing',1);
+INSERT INTO "remix_tag" VALUES(4199,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4199,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4199,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4200,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4200,'dance',1);
+INSERT INTO "remix_tag" VALUES(4200,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4200,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4200,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4200,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4200,'pop',1);
+INSERT INTO "remix_tag" VALUES(4200,'synth',1);
+INSERT INTO "remix_tag" VALUES(4200,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4201,'chill',1);
+INSERT INTO "remix_tag" VALUES(4201,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4201,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4201,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4201,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4201,'organ',1);
+INSERT INTO "remix_tag" VALUES(4201,'piano',1);
+INSERT INTO "remix_tag" VALUES(4201,'reggae',1);
+INSERT INTO "remix_tag" VALUES(4201,'singing',1);
+INSERT INTO "remix_tag" VALUES(4201,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4202,'bells',1);
+INSERT INTO "remix_tag" VALUES(4202,'edm',1);
+INSERT INTO "remix_tag" VALUES(4202,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4202,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4202,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4202,'indian',1);
+INSERT INTO "remix_tag" VALUES(4202,'singing',1);
+INSERT INTO "remix_tag" VALUES(4202,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4202,'synth',1);
+INSERT INTO "remix_tag" VALUES(4202,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4202,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4203,'bells',1);
+INSERT INTO "remix_tag" VALUES(4203,'brass',1);
+INSERT INTO "remix_tag" VALUES(4203,'dark',1);
+INSERT INTO "remix_tag" VALUES(4203,'flute',1);
+INSERT INTO "remix_tag" VALUES(4203,'medley',1);
+INSERT INTO "remix_tag" VALUES(4203,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4203,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4203,'piano',1);
+INSERT INTO "remix_tag" VALUES(4203,'singing',1);
+INSERT INTO "remix_tag" VALUES(4203,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4203,'strings',1);
+INSERT INTO "remix_tag" VALUES(4203,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4203,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4203,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4204,'collab',1);
+INSERT INTO "remix_tag" VALUES(4204,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4204,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4204,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4204,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4204,'rock',1);
+INSERT INTO "remix_tag" VALUES(4204,'synth',1);
+INSERT INTO "remix_tag" VALUES(4205,'dark',1);
+INSERT INTO "remix_tag" VALUES(4205,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4205,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4205,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4205,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4205,'metal',1);
+INSERT INTO "remix_tag" VALUES(4205,'organ',1);
+INSERT INTO "remix_tag" VALUES(4205,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4205,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4205,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4205,'synth',1);
+INSERT INTO "remix_tag" VALUES(4205,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4206,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4206,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4206,'edm',1);
+INSERT INTO "remix_tag" VALUES(4206,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4206,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4206,'epic',1);
+INSERT INTO "remix_tag" VALUES(4206,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4206,'metal',1);
+INSERT INTO "remix_tag" VALUES(4206,'synth',1);
+INSERT INTO "remix_tag" VALUES(4206,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4207,'classical',1);
+INSERT INTO "remix_tag" VALUES(4207,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(4207,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4207,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4207,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4207,'piano',1);
+INSERT INTO "remix_tag" VALUES(4207,'solo',1);
+INSERT INTO "remix_tag" VALUES(4207,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4208,'dance',1);
+INSERT INTO "remix_tag" VALUES(4208,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4208,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4208,'funky',1);
+INSERT INTO "remix_tag" VALUES(4208,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4208,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4208,'medley',1);
+INSERT INTO "remix_tag" VALUES(4208,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4208,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4208,'synth',1);
+INSERT INTO "remix_tag" VALUES(4209,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4209,'folk',1);
+INSERT INTO "remix_tag" VALUES(4209,'harp',1);
+INSERT INTO "remix_tag" VALUES(4209,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4209,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4209,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4209,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4209,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4209,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4210,'bells',1);
+INSERT INTO "remix_tag" VALUES(4210,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4210,'classical',1);
+INSERT INTO "remix_tag" VALUES(4210,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4210,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4210,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4210,'piano',1);
+INSERT INTO "remix_tag" VALUES(4210,'pop',1);
+INSERT INTO "remix_tag" VALUES(4210,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4210,'strings',1);
+INSERT INTO "remix_tag" VALUES(4210,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4210,'synth',1);
+INSERT INTO "remix_tag" VALUES(4210,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4210,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4211,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4211,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4211,'funky',1);
+INSERT INTO "remix_tag" VALUES(4211,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4211,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4211,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4211,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4211,'piano',1);
+INSERT INTO "remix_tag" VALUES(4211,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4211,'swing',1);
+INSERT INTO "remix_tag" VALUES(4211,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4211,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4211,'violin',1);
+INSERT INTO "remix_tag" VALUES(4212,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4212,'chill',1);
+INSERT INTO "remix_tag" VALUES(4212,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4212,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4212,'funky',1);
+INSERT INTO "remix_tag" VALUES(4212,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4212,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4212,'rock',1);
+INSERT INTO "remix_tag" VALUES(4212,'strings',1);
+INSERT INTO "remix_tag" VALUES(4212,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4213,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4213,'compo',1);
+INSERT INTO "remix_tag" VALUES(4213,'edm',1);
+INSERT INTO "remix_tag" VALUES(4213,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4213,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4213,'funk',1);
+INSERT INTO "remix_tag" VALUES(4213,'funky',1);
+INSERT INTO "remix_tag" VALUES(4213,'happy',1);
+INSERT INTO "remix_tag" VALUES(4213,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4213,'piano',1);
+INSERT INTO "remix_tag" VALUES(4213,'synth',1);
+INSERT INTO "remix_tag" VALUES(4213,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4214,'edm',1);
+INSERT INTO "remix_tag" VALUES(4214,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4214,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4214,'synth',1);
+INSERT INTO "remix_tag" VALUES(4214,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4215,'chill',1);
+INSERT INTO "remix_tag" VALUES(4215,'edm',1);
+INSERT INTO "remix_tag" VALUES(4215,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4215,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4215,'synth',1);
+INSERT INTO "remix_tag" VALUES(4215,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4216,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4216,'edm',1);
+INSERT INTO "remix_tag" VALUES(4216,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4216,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4216,'synth',1);
+INSERT INTO "remix_tag" VALUES(4216,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4216,'trance',1);
+INSERT INTO "remix_tag" VALUES(4217,'brass',1);
+INSERT INTO "remix_tag" VALUES(4217,'collab',1);
+INSERT INTO "remix_tag" VALUES(4217,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4217,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4217,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4217,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4217,'funk',1);
+INSERT INTO "remix_tag" VALUES(4217,'funky',1);
+INSERT INTO "remix_tag" VALUES(4217,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4217,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4217,'rock',1);
+INSERT INTO "remix_tag" VALUES(4217,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4217,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4218,'classical',1);
+INSERT INTO "remix_tag" VALUES(4218,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4218,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(4218,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4218,'piano',1);
+INSERT INTO "remix_tag" VALUES(4218,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4218,'solo',1);
+INSERT INTO "remix_tag" VALUES(4218,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4219,'brass',1);
+INSERT INTO "remix_tag" VALUES(4219,'cello',1);
+INSERT INTO "remix_tag" VALUES(4219,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4219,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4219,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4219,'classical',1);
+INSERT INTO "remix_tag" VALUES(4219,'collab',1);
+INSERT INTO "remix_tag" VALUES(4219,'flute',1);
+INSERT INTO "remix_tag" VALUES(4219,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4219,'harp',1);
+INSERT INTO "remix_tag" VALUES(4219,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4219,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4219,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4219,'piano',1);
+INSERT INTO "remix_tag" VALUES(4219,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4219,'strings',1);
+INSERT INTO "remix_tag" VALUES(4219,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4219,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4219,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4219,'viola',1);
+INSERT INTO "remix_tag" VALUES(4219,'violin',1);
+INSERT INTO "remix_tag" VALUES(4219,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4220,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4220,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4220,'edm',1);
+INSERT INTO "remix_tag" VALUES(4220,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4220,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4220,'synth',1);
+INSERT INTO "remix_tag" VALUES(4221,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4221,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4221,'collab',1);
+INSERT INTO "remix_tag" VALUES(4221,'folk',1);
+INSERT INTO "remix_tag" VALUES(4221,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4221,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4221,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4221,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4221,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4221,'world',1);
+INSERT INTO "remix_tag" VALUES(4222,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4222,'edm',1);
+INSERT INTO "remix_tag" VALUES(4222,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4222,'funky',1);
+INSERT INTO "remix_tag" VALUES(4222,'synth',1);
+INSERT INTO "remix_tag" VALUES(4223,'brass',1);
+INSERT INTO "remix_tag" VALUES(4223,'collab',1);
+INSERT INTO "remix_tag" VALUES(4223,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4223,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4223,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4223,'rock',1);
+INSERT INTO "remix_tag" VALUES(4223,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(4223,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4224,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4224,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4224,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4224,'collab',1);
+INSERT INTO "remix_tag" VALUES(4224,'dark',1);
+INSERT INTO "remix_tag" VALUES(4224,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4224,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4224,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4224,'strings',1);
+INSERT INTO "remix_tag" VALUES(4224,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4224,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4225,'brass',1);
+INSERT INTO "remix_tag" VALUES(4225,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4225,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4225,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4225,'piano',1);
+INSERT INTO "remix_tag" VALUES(4225,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4225,'swing',1);
+INSERT INTO "remix_tag" VALUES(4225,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4225,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4226,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4226,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4226,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4226,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4226,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4227,'brass',1);
+INSERT INTO "remix_tag" VALUES(4227,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4227,'classical',1);
+INSERT INTO "remix_tag" VALUES(4227,'collab',1);
+INSERT INTO "remix_tag" VALUES(4227,'epic',1);
+INSERT INTO "remix_tag" VALUES(4227,'flute',1);
+INSERT INTO "remix_tag" VALUES(4227,'happy',1);
+INSERT INTO "remix_tag" VALUES(4227,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4227,'march',1);
+INSERT INTO "remix_tag" VALUES(4227,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4227,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4227,'strings',1);
+INSERT INTO "remix_tag" VALUES(4227,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4227,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4227,'violin',1);
+INSERT INTO "remix_tag" VALUES(4227,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4227,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4228,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4228,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4228,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4228,'metal',1);
+INSERT INTO "remix_tag" VALUES(4229,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4229,'collab',1);
+INSERT INTO "remix_tag" VALUES(4229,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4229,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4229,'metal',1);
+INSERT INTO "remix_tag" VALUES(4229,'piano',1);
+INSERT INTO "remix_tag" VALUES(4229,'rock',1);
+INSERT INTO "remix_tag" VALUES(4229,'strings',1);
+INSERT INTO "remix_tag" VALUES(4229,'synth',1);
+INSERT INTO "remix_tag" VALUES(4230,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4230,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4230,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4230,'brass',1);
+INSERT INTO "remix_tag" VALUES(4230,'folk',1);
+INSERT INTO "remix_tag" VALUES(4230,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4230,'organ',1);
+INSERT INTO "remix_tag" VALUES(4230,'piano',1);
+INSERT INTO "remix_tag" VALUES(4230,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4230,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4231,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4231,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4231,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4231,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4231,'epic',1);
+INSERT INTO "remix_tag" VALUES(4231,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4231,'rock',1);
+INSERT INTO "remix_tag" VALUES(4231,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4231,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4231,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4232,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4232,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4232,'classical',1);
+INSERT INTO "remix_tag" VALUES(4232,'flute',1);
+INSERT INTO "remix_tag" VALUES(4232,'harp',1);
+INSERT INTO "remix_tag" VALUES(4232,'medley',1);
+INSERT INTO "remix_tag" VALUES(4232,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4232,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4232,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4232,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4232,'strings',1);
+INSERT INTO "remix_tag" VALUES(4232,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4232,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4233,'chill',1);
+INSERT INTO "remix_tag" VALUES(4233,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4233,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4233,'happy',1);
+INSERT INTO "remix_tag" VALUES(4233,'organ',1);
+INSERT INTO "remix_tag" VALUES(4233,'rock',1);
+INSERT INTO "remix_tag" VALUES(4233,'synth',1);
+INSERT INTO "remix_tag" VALUES(4233,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4234,'dance',1);
+INSERT INTO "remix_tag" VALUES(4234,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4234,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4234,'funky',1);
+INSERT INTO "remix_tag" VALUES(4234,'piano',1);
+INSERT INTO "remix_tag" VALUES(4234,'synth',1);
+INSERT INTO "remix_tag" VALUES(4234,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4235,'classical',1);
+INSERT INTO "remix_tag" VALUES(4235,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4235,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4235,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4235,'strings',1);
+INSERT INTO "remix_tag" VALUES(4235,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4236,'edm',1);
+INSERT INTO "remix_tag" VALUES(4236,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4236,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4236,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4236,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4236,'singing',1);
+INSERT INTO "remix_tag" VALUES(4236,'synth',1);
+INSERT INTO "remix_tag" VALUES(4236,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4237,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4237,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4237,'dark',1);
+INSERT INTO "remix_tag" VALUES(4237,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4237,'edm',1);
+INSERT INTO "remix_tag" VALUES(4237,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4237,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4237,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4237,'synth',1);
+INSERT INTO "remix_tag" VALUES(4237,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4237,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4237,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4237,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4238,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4238,'angry',1);
+INSERT INTO "remix_tag" VALUES(4238,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4238,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4238,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4238,'epic',1);
+INSERT INTO "remix_tag" VALUES(4238,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4238,'metal',1);
+INSERT INTO "remix_tag" VALUES(4238,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4238,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4239,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4239,'dark',1);
+INSERT INTO "remix_tag" VALUES(4239,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4239,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4239,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4239,'synth',1);
+INSERT INTO "remix_tag" VALUES(4240,'brass',1);
+INSERT INTO "remix_tag" VALUES(4240,'choir',1);
+INSERT INTO "remix_tag" VALUES(4240,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4240,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4240,'dark',1);
+INSERT INTO "remix_tag" VALUES(4240,'epic',1);
+INSERT INTO "remix_tag" VALUES(4240,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4240,'piano',1);
+INSERT INTO "remix_tag" VALUES(4240,'strings',1);
+INSERT INTO "remix_tag" VALUES(4240,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4240,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4240,'violin',1);
+INSERT INTO "remix_tag" VALUES(4240,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4241,'brass',1);
+INSERT INTO "remix_tag" VALUES(4241,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4241,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4241,'epic',1);
+INSERT INTO "remix_tag" VALUES(4241,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4241,'strings',1);
+INSERT INTO "remix_tag" VALUES(4241,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4241,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4242,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4242,'collab',1);
+INSERT INTO "remix_tag" VALUES(4242,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4242,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4242,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4242,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4242,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4242,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4242,'rock',1);
+INSERT INTO "remix_tag" VALUES(4242,'singing',1);
+INSERT INTO "remix_tag" VALUES(4242,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4242,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4243,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4243,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4243,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4243,'happy',1);
+INSERT INTO "remix_tag" VALUES(4243,'pop',1);
+INSERT INTO "remix_tag" VALUES(4243,'synth',1);
+INSERT INTO "remix_tag" VALUES(4244,'brass',1);
+INSERT INTO "remix_tag" VALUES(4244,'choir',1);
+INSERT INTO "remix_tag" VALUES(4244,'edm',1);
+INSERT INTO "remix_tag" VALUES(4244,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4244,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4244,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4244,'piano',1);
+INSERT INTO "remix_tag" VALUES(4244,'strings',1);
+INSERT INTO "remix_tag" VALUES(4244,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4244,'synth',1);
+INSERT INTO "remix_tag" VALUES(4244,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4244,'trap',1);
+INSERT INTO "remix_tag" VALUES(4245,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4245,'brass',1);
+INSERT INTO "remix_tag" VALUES(4245,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4245,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4245,'epic',1);
+INSERT INTO "remix_tag" VALUES(4245,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4245,'reggae',1);
+INSERT INTO "remix_tag" VALUES(4245,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4245,'strings',1);
+INSERT INTO "remix_tag" VALUES(4245,'synth',1);
+INSERT INTO "remix_tag" VALUES(4245,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4246,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4246,'african',1);
+INSERT INTO "remix_tag" VALUES(4246,'brass',1);
+INSERT INTO "remix_tag" VALUES(4246,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4246,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4246,'folk',1);
+INSERT INTO "remix_tag" VALUES(4246,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4246,'happy',1);
+INSERT INTO "remix_tag" VALUES(4246,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4246,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4246,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4246,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4246,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4246,'south-american',1);
+INSERT INTO "remix_tag" VALUES(4246,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4247,'collab',1);
+INSERT INTO "remix_tag" VALUES(4247,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4247,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4247,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4247,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4247,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4247,'shakuhachi',1);
+INSERT INTO "remix_tag" VALUES(4247,'synth',1);
+INSERT INTO "remix_tag" VALUES(4247,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4248,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4248,'classical',1);
+INSERT INTO "remix_tag" VALUES(4248,'flute',1);
+INSERT INTO "remix_tag" VALUES(4248,'folk',1);
+INSERT INTO "remix_tag" VALUES(4248,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4248,'harp',1);
+INSERT INTO "remix_tag" VALUES(4248,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4248,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4248,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4248,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4248,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4248,'strings',1);
+INSERT INTO "remix_tag" VALUES(4248,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4249,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4249,'edm',1);
+INSERT INTO "remix_tag" VALUES(4249,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4249,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4249,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4249,'pop',1);
+INSERT INTO "remix_tag" VALUES(4249,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4249,'synth',1);
+INSERT INTO "remix_tag" VALUES(4250,'brass',1);
+INSERT INTO "remix_tag" VALUES(4250,'choir',1);
+INSERT INTO "remix_tag" VALUES(4250,'epic',1);
+INSERT INTO "remix_tag" VALUES(4250,'flute',1);
+INSERT INTO "remix_tag" VALUES(4250,'medley',1);
+INSERT INTO "remix_tag" VALUES(4250,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4250,'strings',1);
+INSERT INTO "remix_tag" VALUES(4250,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4250,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4250,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4251,'brass',1);
+INSERT INTO "remix_tag" VALUES(4251,'choir',1);
+INSERT INTO "remix_tag" VALUES(4251,'dance',1);
+INSERT INTO "remix_tag" VALUES(4251,'edm',1);
+INSERT INTO "remix_tag" VALUES(4251,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4251,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4251,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4251,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4251,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4251,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4251,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4251,'synth',1);
+INSERT INTO "remix_tag" VALUES(4252,'chill',1);
+INSERT INTO "remix_tag" VALUES(4252,'dark',1);
+INSERT INTO "remix_tag" VALUES(4252,'edm',1);
+INSERT INTO "remix_tag" VALUES(4252,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4252,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4252,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4252,'medley',1);
+INSERT INTO "remix_tag" VALUES(4252,'strings',1);
+INSERT INTO "remix_tag" VALUES(4252,'synth',1);
+INSERT INTO "remix_tag" VALUES(4253,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4253,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4253,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4253,'synth',1);
+INSERT INTO "remix_tag" VALUES(4253,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4253,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4253,'workout',1);
+INSERT INTO "remix_tag" VALUES(4254,'bells',1);
+INSERT INTO "remix_tag" VALUES(4254,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4254,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4254,'edm',1);
+INSERT INTO "remix_tag" VALUES(4254,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4254,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4254,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4254,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4254,'piano',1);
+INSERT INTO "remix_tag" VALUES(4254,'synth',1);
+INSERT INTO "remix_tag" VALUES(4254,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4255,'chill',1);
+INSERT INTO "remix_tag" VALUES(4255,'choir',1);
+INSERT INTO "remix_tag" VALUES(4255,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4255,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4255,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4255,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4255,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4255,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4255,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4255,'synth',1);
+INSERT INTO "remix_tag" VALUES(4256,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4256,'edm',1);
+INSERT INTO "remix_tag" VALUES(4256,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4256,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4256,'synth',1);
+INSERT INTO "remix_tag" VALUES(4256,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4257,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4257,'chill',1);
+INSERT INTO "remix_tag" VALUES(4257,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4257,'dark',1);
+INSERT INTO "remix_tag" VALUES(4257,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4257,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4257,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4257,'synth',1);
+INSERT INTO "remix_tag" VALUES(4257,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4258,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4258,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4258,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4258,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4258,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4258,'metal',1);
+INSERT INTO "remix_tag" VALUES(4258,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4259,'classical',1);
+INSERT INTO "remix_tag" VALUES(4259,'harp',1);
+INSERT INTO "remix_tag" VALUES(4259,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4259,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4259,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4259,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4259,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4259,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4259,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4259,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4259,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4259,'singing',1);
+INSERT INTO "remix_tag" VALUES(4259,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4259,'strings',1);
+INSERT INTO "remix_tag" VALUES(4259,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4259,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4259,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4260,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4260,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4260,'funky',1);
+INSERT INTO "remix_tag" VALUES(4260,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4260,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4260,'synth',1);
+INSERT INTO "remix_tag" VALUES(4260,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4261,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4261,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4261,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4261,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4261,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4261,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4261,'folk',1);
+INSERT INTO "remix_tag" VALUES(4261,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4261,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4261,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4261,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4262,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4262,'bells',1);
+INSERT INTO "remix_tag" VALUES(4262,'choir',1);
+INSERT INTO "remix_tag" VALUES(4262,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4262,'epic',1);
+INSERT INTO "remix_tag" VALUES(4262,'piano',1);
+INSERT INTO "remix_tag" VALUES(4262,'pop',1);
+INSERT INTO "remix_tag" VALUES(4262,'strings',1);
+INSERT INTO "remix_tag" VALUES(4262,'synth',1);
+INSERT INTO "remix_tag" VALUES(4263,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4263,'collab',1);
+INSERT INTO "remix_tag" VALUES(4263,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4263,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4263,'epic',1);
+INSERT INTO "remix_tag" VALUES(4263,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4263,'medley',1);
+INSERT INTO "remix_tag" VALUES(4263,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4263,'piano',1);
+INSERT INTO "remix_tag" VALUES(4263,'strings',1);
+INSERT INTO "remix_tag" VALUES(4263,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4264,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4264,'dark',1);
+INSERT INTO "remix_tag" VALUES(4264,'edm',1);
+INSERT INTO "remix_tag" VALUES(4264,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4264,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4264,'synth',1);
+INSERT INTO "remix_tag" VALUES(4264,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4265,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4265,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4265,'classical',1);
+INSERT INTO "remix_tag" VALUES(4265,'flute',1);
+INSERT INTO "remix_tag" VALUES(4265,'harp',1);
+INSERT INTO "remix_tag" VALUES(4265,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4265,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4265,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4265,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4265,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4265,'singing',1);
+INSERT INTO "remix_tag" VALUES(4265,'strings',1);
+INSERT INTO "remix_tag" VALUES(4265,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4265,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4266,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4266,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4266,'edm',1);
+INSERT INTO "remix_tag" VALUES(4266,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4266,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4266,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4266,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4266,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4266,'strings',1);
+INSERT INTO "remix_tag" VALUES(4266,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4266,'synth',1);
+INSERT INTO "remix_tag" VALUES(4267,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4267,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4267,'happy',1);
+INSERT INTO "remix_tag" VALUES(4267,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4267,'organ',1);
+INSERT INTO "remix_tag" VALUES(4267,'rock',1);
+INSERT INTO "remix_tag" VALUES(4267,'surf',1);
+INSERT INTO "remix_tag" VALUES(4268,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4268,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4268,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4268,'happy',1);
+INSERT INTO "remix_tag" VALUES(4268,'pop',1);
+INSERT INTO "remix_tag" VALUES(4268,'synth',1);
+INSERT INTO "remix_tag" VALUES(4268,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4268,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4269,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4269,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4269,'dark',1);
+INSERT INTO "remix_tag" VALUES(4269,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4269,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4269,'flute',1);
+INSERT INTO "remix_tag" VALUES(4269,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4269,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4269,'rock',1);
+INSERT INTO "remix_tag" VALUES(4269,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4269,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4269,'synth',1);
+INSERT INTO "remix_tag" VALUES(4269,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4269,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4269,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4270,'chill',1);
+INSERT INTO "remix_tag" VALUES(4270,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4270,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4270,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4270,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4270,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4270,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4270,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4270,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4270,'strings',1);
+INSERT INTO "remix_tag" VALUES(4270,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4271,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4271,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4271,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4271,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4271,'medley',1);
+INSERT INTO "remix_tag" VALUES(4271,'organ',1);
+INSERT INTO "remix_tag" VALUES(4271,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4271,'rock',1);
+INSERT INTO "remix_tag" VALUES(4272,'brass',1);
+INSERT INTO "remix_tag" VALUES(4272,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4272,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4272,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4272,'flute',1);
+INSERT INTO "remix_tag" VALUES(4272,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4272,'piano',1);
+INSERT INTO "remix_tag" VALUES(4272,'strings',1);
+INSERT INTO "remix_tag" VALUES(4272,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4272,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4272,'violin',1);
+INSERT INTO "remix_tag" VALUES(4272,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4273,'chill',1);
+INSERT INTO "remix_tag" VALUES(4273,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4273,'edm',1);
+INSERT INTO "remix_tag" VALUES(4273,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4273,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4273,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4273,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4273,'synth',1);
+INSERT INTO "remix_tag" VALUES(4273,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4274,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4274,'dark',1);
+INSERT INTO "remix_tag" VALUES(4274,'edm',1);
+INSERT INTO "remix_tag" VALUES(4274,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4274,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4274,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4274,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4274,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4274,'synth',1);
+INSERT INTO "remix_tag" VALUES(4275,'compo',1);
+INSERT INTO "remix_tag" VALUES(4275,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4275,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4275,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4275,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4275,'metal',1);
+INSERT INTO "remix_tag" VALUES(4275,'rock',1);
+INSERT INTO "remix_tag" VALUES(4276,'chill',1);
+INSERT INTO "remix_tag" VALUES(4276,'edm',1);
+INSERT INTO "remix_tag" VALUES(4276,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4276,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4276,'house',1);
+INSERT INTO "remix_tag" VALUES(4276,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4276,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4276,'singing',1);
+INSERT INTO "remix_tag" VALUES(4276,'synth',1);
+INSERT INTO "remix_tag" VALUES(4276,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4277,'brass',1);
+INSERT INTO "remix_tag" VALUES(4277,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4277,'dark',1);
+INSERT INTO "remix_tag" VALUES(4277,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4277,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4277,'epic',1);
+INSERT INTO "remix_tag" VALUES(4277,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4277,'piano',1);
+INSERT INTO "remix_tag" VALUES(4277,'strings',1);
+INSERT INTO "remix_tag" VALUES(4277,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4277,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4278,'dark',1);
+INSERT INTO "remix_tag" VALUES(4278,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4278,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4278,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4278,'rock',1);
+INSERT INTO "remix_tag" VALUES(4278,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4278,'synth',1);
+INSERT INTO "remix_tag" VALUES(4279,'brass',1);
+INSERT INTO "remix_tag" VALUES(4279,'choir',1);
+INSERT INTO "remix_tag" VALUES(4279,'classical',1);
+INSERT INTO "remix_tag" VALUES(4279,'epic',1);
+INSERT INTO "remix_tag" VALUES(4279,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4279,'strings',1);
+INSERT INTO "remix_tag" VALUES(4279,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4279,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4279,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4280,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4280,'edm',1);
+INSERT INTO "remix_tag" VALUES(4280,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4280,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4280,'funky',1);
+INSERT INTO "remix_tag" VALUES(4280,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4280,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4280,'synth',1);
+INSERT INTO "remix_tag" VALUES(4281,'brass',1);
+INSERT INTO "remix_tag" VALUES(4281,'classical',1);
+INSERT INTO "remix_tag" VALUES(4281,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4281,'harp',1);
+INSERT INTO "remix_tag" VALUES(4281,'march',1);
+INSERT INTO "remix_tag" VALUES(4281,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4281,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4281,'strings',1);
+INSERT INTO "remix_tag" VALUES(4281,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4281,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4281,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4282,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4282,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4282,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4282,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4282,'organ',1);
+INSERT INTO "remix_tag" VALUES(4282,'surf',1);
+INSERT INTO "remix_tag" VALUES(4283,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4283,'collab',1);
+INSERT INTO "remix_tag" VALUES(4283,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4283,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4283,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4283,'metal',1);
+INSERT INTO "remix_tag" VALUES(4283,'singing',1);
+INSERT INTO "remix_tag" VALUES(4283,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4284,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4284,'choir',1);
+INSERT INTO "remix_tag" VALUES(4284,'dark',1);
+INSERT INTO "remix_tag" VALUES(4284,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4284,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4284,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4284,'metal',1);
+INSERT INTO "remix_tag" VALUES(4284,'singing',1);
+INSERT INTO "remix_tag" VALUES(4284,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4284,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4285,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4285,'bells',1);
+INSERT INTO "remix_tag" VALUES(4285,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4285,'edm',1);
+INSERT INTO "remix_tag" VALUES(4285,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4285,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4285,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4285,'synth',1);
+INSERT INTO "remix_tag" VALUES(4286,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4286,'choir',1);
+INSERT INTO "remix_tag" VALUES(4286,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4286,'edm',1);
+INSERT INTO "remix_tag" VALUES(4286,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4286,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4286,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4286,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4286,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4286,'synth',1);
+INSERT INTO "remix_tag" VALUES(4286,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4287,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4287,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4287,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4287,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4287,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4287,'piano',1);
+INSERT INTO "remix_tag" VALUES(4287,'rnb',1);
+INSERT INTO "remix_tag" VALUES(4287,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4287,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4288,'brass',1);
+INSERT INTO "remix_tag" VALUES(4288,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4288,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4288,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4288,'funky',1);
+INSERT INTO "remix_tag" VALUES(4288,'happy',1);
+INSERT INTO "remix_tag" VALUES(4288,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4288,'piano',1);
+INSERT INTO "remix_tag" VALUES(4288,'rock',1);
+INSERT INTO "remix_tag" VALUES(4289,'bells',1);
+INSERT INTO "remix_tag" VALUES(4289,'chill',1);
+INSERT INTO "remix_tag" VALUES(4289,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4289,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4289,'edm',1);
+INSERT INTO "remix_tag" VALUES(4289,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4289,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4289,'synth',1);
+INSERT INTO "remix_tag" VALUES(4289,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4290,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4290,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4290,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4290,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4290,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4290,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4290,'piano',1);
+INSERT INTO "remix_tag" VALUES(4290,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4290,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4290,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4291,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4291,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4291,'funk',1);
+INSERT INTO "remix_tag" VALUES(4291,'funky',1);
+INSERT INTO "remix_tag" VALUES(4291,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4291,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4291,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4291,'synth',1);
+INSERT INTO "remix_tag" VALUES(4292,'chill',1);
+INSERT INTO "remix_tag" VALUES(4292,'choir',1);
+INSERT INTO "remix_tag" VALUES(4292,'edm',1);
+INSERT INTO "remix_tag" VALUES(4292,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4292,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4292,'synth',1);
+INSERT INTO "remix_tag" VALUES(4292,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4293,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4293,'edm',1);
+INSERT INTO "remix_tag" VALUES(4293,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4293,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4293,'funky',1);
+INSERT INTO "remix_tag" VALUES(4293,'synth',1);
+INSERT INTO "remix_tag" VALUES(4293,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4293,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4294,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4294,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4294,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4294,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4294,'happy',1);
+INSERT INTO "remix_tag" VALUES(4294,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4294,'pop',1);
+INSERT INTO "remix_tag" VALUES(4294,'synth',1);
+INSERT INTO "remix_tag" VALUES(4294,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4295,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(4295,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4295,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4295,'funk',1);
+INSERT INTO "remix_tag" VALUES(4295,'funky',1);
+INSERT INTO "remix_tag" VALUES(4295,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4295,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4295,'organ',1);
+INSERT INTO "remix_tag" VALUES(4295,'piano',1);
+INSERT INTO "remix_tag" VALUES(4296,'chill',1);
+INSERT INTO "remix_tag" VALUES(4296,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4296,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4296,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4296,'synth',1);
+INSERT INTO "remix_tag" VALUES(4296,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4296,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4297,'bells',1);
+INSERT INTO "remix_tag" VALUES(4297,'chill',1);
+INSERT INTO "remix_tag" VALUES(4297,'classical',1);
+INSERT INTO "remix_tag" VALUES(4297,'harp',1);
+INSERT INTO "remix_tag" VALUES(4297,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4297,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4297,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4297,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4297,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4297,'piano',1);
+INSERT INTO "remix_tag" VALUES(4297,'synth',1);
+INSERT INTO "remix_tag" VALUES(4297,'violin',1);
+INSERT INTO "remix_tag" VALUES(4297,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4298,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4298,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4298,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4298,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4298,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4298,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4298,'folk',1);
+INSERT INTO "remix_tag" VALUES(4298,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4298,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4298,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4298,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4299,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4299,'dark',1);
+INSERT INTO "remix_tag" VALUES(4299,'edm',1);
+INSERT INTO "remix_tag" VALUES(4299,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4299,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4299,'synth',1);
+INSERT INTO "remix_tag" VALUES(4299,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4300,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4300,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4300,'edm',1);
+INSERT INTO "remix_tag" VALUES(4300,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4300,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4300,'epic',1);
+INSERT INTO "remix_tag" VALUES(4300,'rock',1);
+INSERT INTO "remix_tag" VALUES(4300,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4300,'synth',1);
+INSERT INTO "remix_tag" VALUES(4300,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4301,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4301,'collab',1);
+INSERT INTO "remix_tag" VALUES(4301,'dark',1);
+INSERT INTO "remix_tag" VALUES(4301,'funny',1);
+INSERT INTO "remix_tag" VALUES(4301,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4301,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4301,'singing',1);
+INSERT INTO "remix_tag" VALUES(4301,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4301,'strings',1);
+INSERT INTO "remix_tag" VALUES(4301,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4301,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4301,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4301,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4302,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4302,'collab',1);
+INSERT INTO "remix_tag" VALUES(4302,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(4302,'folk',1);
+INSERT INTO "remix_tag" VALUES(4302,'harp',1);
+INSERT INTO "remix_tag" VALUES(4302,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4302,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4302,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4302,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4302,'recorder',1);
+INSERT INTO "remix_tag" VALUES(4302,'singing',1);
+INSERT INTO "remix_tag" VALUES(4302,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4302,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4302,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4302,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4303,'brass',1);
+INSERT INTO "remix_tag" VALUES(4303,'choir',1);
+INSERT INTO "remix_tag" VALUES(4303,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4303,'dark',1);
+INSERT INTO "remix_tag" VALUES(4303,'epic',1);
+INSERT INTO "remix_tag" VALUES(4303,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4303,'piano',1);
+INSERT INTO "remix_tag" VALUES(4303,'strings',1);
+INSERT INTO "remix_tag" VALUES(4303,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4304,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4304,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4304,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4304,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4304,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4304,'organ',1);
+INSERT INTO "remix_tag" VALUES(4304,'piano',1);
+INSERT INTO "remix_tag" VALUES(4304,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4305,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4305,'edm',1);
+INSERT INTO "remix_tag" VALUES(4305,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4305,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4305,'funky',1);
+INSERT INTO "remix_tag" VALUES(4305,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4305,'synth',1);
+INSERT INTO "remix_tag" VALUES(4306,'edm',1);
+INSERT INTO "remix_tag" VALUES(4306,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4306,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4306,'funky',1);
+INSERT INTO "remix_tag" VALUES(4306,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4306,'synth',1);
+INSERT INTO "remix_tag" VALUES(4306,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4307,'edm',1);
+INSERT INTO "remix_tag" VALUES(4307,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4307,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4307,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4307,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4307,'synth',1);
+INSERT INTO "remix_tag" VALUES(4307,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4307,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4308,'chill',1);
+INSERT INTO "remix_tag" VALUES(4308,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4308,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4308,'synth',1);
+INSERT INTO "remix_tag" VALUES(4308,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4308,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4309,'brass',1);
+INSERT INTO "remix_tag" VALUES(4309,'choir',1);
+INSERT INTO "remix_tag" VALUES(4309,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4309,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4309,'epic',1);
+INSERT INTO "remix_tag" VALUES(4309,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4309,'medley',1);
+INSERT INTO "remix_tag" VALUES(4309,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4309,'organ',1);
+INSERT INTO "remix_tag" VALUES(4309,'piano',1);
+INSERT INTO "remix_tag" VALUES(4309,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4309,'strings',1);
+INSERT INTO "remix_tag" VALUES(4309,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4309,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4309,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4310,'chill',1);
+INSERT INTO "remix_tag" VALUES(4310,'choir',1);
+INSERT INTO "remix_tag" VALUES(4310,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4310,'edm',1);
+INSERT INTO "remix_tag" VALUES(4310,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4310,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4310,'synth',1);
+INSERT INTO "remix_tag" VALUES(4310,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4310,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4311,'bells',1);
+INSERT INTO "remix_tag" VALUES(4311,'chill',1);
+INSERT INTO "remix_tag" VALUES(4311,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4311,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4311,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4311,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4311,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4311,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4311,'synth',1);
+INSERT INTO "remix_tag" VALUES(4312,'chill',1);
+INSERT INTO "remix_tag" VALUES(4312,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4312,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4312,'happy',1);
+INSERT INTO "remix_tag" VALUES(4312,'pop',1);
+INSERT INTO "remix_tag" VALUES(4312,'synth',1);
+INSERT INTO "remix_tag" VALUES(4312,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4312,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4312,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4313,'compo',1);
+INSERT INTO "remix_tag" VALUES(4313,'dance',1);
+INSERT INTO "remix_tag" VALUES(4313,'edm',1);
+INSERT INTO "remix_tag" VALUES(4313,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4313,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4313,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4313,'synth',1);
+INSERT INTO "remix_tag" VALUES(4313,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4314,'bells',1);
+INSERT INTO "remix_tag" VALUES(4314,'brass',1);
+INSERT INTO "remix_tag" VALUES(4314,'classical',1);
+INSERT INTO "remix_tag" VALUES(4314,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4314,'epic',1);
+INSERT INTO "remix_tag" VALUES(4314,'flute',1);
+INSERT INTO "remix_tag" VALUES(4314,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4314,'march',1);
+INSERT INTO "remix_tag" VALUES(4314,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4314,'piano',1);
+INSERT INTO "remix_tag" VALUES(4314,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4314,'strings',1);
+INSERT INTO "remix_tag" VALUES(4314,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4314,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4314,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4315,'classical',1);
+INSERT INTO "remix_tag" VALUES(4315,'collab',1);
+INSERT INTO "remix_tag" VALUES(4315,'duet',1);
+INSERT INTO "remix_tag" VALUES(4315,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4315,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4315,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4315,'piano',1);
+INSERT INTO "remix_tag" VALUES(4315,'sad',1);
+INSERT INTO "remix_tag" VALUES(4315,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4315,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4316,'chill',1);
+INSERT INTO "remix_tag" VALUES(4316,'edm',1);
+INSERT INTO "remix_tag" VALUES(4316,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4316,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4316,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4316,'house',1);
+INSERT INTO "remix_tag" VALUES(4316,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4316,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4316,'synth',1);
+INSERT INTO "remix_tag" VALUES(4316,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4317,'collab',1);
+INSERT INTO "remix_tag" VALUES(4317,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4317,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4317,'epic',1);
+INSERT INTO "remix_tag" VALUES(4317,'harp',1);
+INSERT INTO "remix_tag" VALUES(4317,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4317,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4317,'march',1);
+INSERT INTO "remix_tag" VALUES(4317,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4317,'piano',1);
+INSERT INTO "remix_tag" VALUES(4317,'rock',1);
+INSERT INTO "remix_tag" VALUES(4317,'strings',1);
+INSERT INTO "remix_tag" VALUES(4317,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4317,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4318,'choir',1);
+INSERT INTO "remix_tag" VALUES(4318,'classical',1);
+INSERT INTO "remix_tag" VALUES(4318,'collab',1);
+INSERT INTO "remix_tag" VALUES(4318,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4318,'flute',1);
+INSERT INTO "remix_tag" VALUES(4318,'harp',1);
+INSERT INTO "remix_tag" VALUES(4318,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4318,'medley',1);
+INSERT INTO "remix_tag" VALUES(4318,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4318,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4318,'singing',1);
+INSERT INTO "remix_tag" VALUES(4318,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4318,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4318,'viola',1);
+INSERT INTO "remix_tag" VALUES(4318,'violin',1);
+INSERT INTO "remix_tag" VALUES(4318,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4319,'classical',1);
+INSERT INTO "remix_tag" VALUES(4319,'collab',1);
+INSERT INTO "remix_tag" VALUES(4319,'harp',1);
+INSERT INTO "remix_tag" VALUES(4319,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4319,'opera',1);
+INSERT INTO "remix_tag" VALUES(4319,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4319,'piano',1);
+INSERT INTO "remix_tag" VALUES(4319,'singing',1);
+INSERT INTO "remix_tag" VALUES(4319,'strings',1);
+INSERT INTO "remix_tag" VALUES(4319,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4319,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4320,'bells',1);
+INSERT INTO "remix_tag" VALUES(4320,'chill',1);
+INSERT INTO "remix_tag" VALUES(4320,'flute',1);
+INSERT INTO "remix_tag" VALUES(4320,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4320,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4320,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4320,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4320,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4320,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4320,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4321,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4321,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4321,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4321,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4321,'latin',1);
+INSERT INTO "remix_tag" VALUES(4321,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4321,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4321,'piano',1);
+INSERT INTO "remix_tag" VALUES(4321,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4322,'chill',1);
+INSERT INTO "remix_tag" VALUES(4322,'edm',1);
+INSERT INTO "remix_tag" VALUES(4322,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4322,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4322,'pop',1);
+INSERT INTO "remix_tag" VALUES(4322,'synth',1);
+INSERT INTO "remix_tag" VALUES(4322,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4322,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4323,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4323,'edm',1);
+INSERT INTO "remix_tag" VALUES(4323,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4323,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4323,'happy',1);
+INSERT INTO "remix_tag" VALUES(4323,'pop',1);
+INSERT INTO "remix_tag" VALUES(4323,'synth',1);
+INSERT INTO "remix_tag" VALUES(4323,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4324,'chill',1);
+INSERT INTO "remix_tag" VALUES(4324,'choir',1);
+INSERT INTO "remix_tag" VALUES(4324,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4324,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4324,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4324,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4324,'synth',1);
+INSERT INTO "remix_tag" VALUES(4325,'brass',1);
+INSERT INTO "remix_tag" VALUES(4325,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4325,'collab',1);
+INSERT INTO "remix_tag" VALUES(4325,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4325,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4325,'happy',1);
+INSERT INTO "remix_tag" VALUES(4325,'march',1);
+INSERT INTO "remix_tag" VALUES(4325,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4325,'polka',1);
+INSERT INTO "remix_tag" VALUES(4325,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4325,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4326,'bells',1);
+INSERT INTO "remix_tag" VALUES(4326,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4326,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4326,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4326,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4326,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4326,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4326,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4326,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4326,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4327,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4327,'happy',1);
+INSERT INTO "remix_tag" VALUES(4327,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4327,'pop',1);
+INSERT INTO "remix_tag" VALUES(4327,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4327,'synth',1);
+INSERT INTO "remix_tag" VALUES(4327,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4327,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4328,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4328,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4328,'dance',1);
+INSERT INTO "remix_tag" VALUES(4328,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4328,'edm',1);
+INSERT INTO "remix_tag" VALUES(4328,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4328,'epic',1);
+INSERT INTO "remix_tag" VALUES(4328,'funky',1);
+INSERT INTO "remix_tag" VALUES(4328,'synth',1);
+INSERT INTO "remix_tag" VALUES(4329,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4329,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4329,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4329,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4329,'harp',1);
+INSERT INTO "remix_tag" VALUES(4329,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4329,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4329,'piano',1);
+INSERT INTO "remix_tag" VALUES(4329,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4329,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4329,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4329,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4330,'chill',1);
+INSERT INTO "remix_tag" VALUES(4330,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4330,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4330,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4330,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4330,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4330,'synth',1);
+INSERT INTO "remix_tag" VALUES(4330,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4331,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4331,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4331,'brass',1);
+INSERT INTO "remix_tag" VALUES(4331,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4331,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4331,'classical',1);
+INSERT INTO "remix_tag" VALUES(4331,'collab',1);
+INSERT INTO "remix_tag" VALUES(4331,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(4331,'epic',1);
+INSERT INTO "remix_tag" VALUES(4331,'flute',1);
+INSERT INTO "remix_tag" VALUES(4331,'folk',1);
+INSERT INTO "remix_tag" VALUES(4331,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4331,'harp',1);
+INSERT INTO "remix_tag" VALUES(4331,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4331,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4331,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4331,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4331,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4331,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4331,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4331,'singing',1);
+INSERT INTO "remix_tag" VALUES(4331,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4331,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4331,'tuba',1);
+INSERT INTO "remix_tag" VALUES(4331,'violin',1);
+INSERT INTO "remix_tag" VALUES(4331,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4332,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4332,'collab',1);
+INSERT INTO "remix_tag" VALUES(4332,'dark',1);
+INSERT INTO "remix_tag" VALUES(4332,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4332,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4332,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4332,'medley',1);
+INSERT INTO "remix_tag" VALUES(4332,'metal',1);
+INSERT INTO "remix_tag" VALUES(4332,'organ',1);
+INSERT INTO "remix_tag" VALUES(4332,'rock',1);
+INSERT INTO "remix_tag" VALUES(4332,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4333,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4333,'bells',1);
+INSERT INTO "remix_tag" VALUES(4333,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4333,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4333,'classical',1);
+INSERT INTO "remix_tag" VALUES(4333,'collab',1);
+INSERT INTO "remix_tag" VALUES(4333,'flute',1);
+INSERT INTO "remix_tag" VALUES(4333,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4333,'harp',1);
+INSERT INTO "remix_tag" VALUES(4333,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4333,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4333,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4333,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4333,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4333,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4333,'strings',1);
+INSERT INTO "remix_tag" VALUES(4333,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4334,'chill',1);
+INSERT INTO "remix_tag" VALUES(4334,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4334,'edm',1);
+INSERT INTO "remix_tag" VALUES(4334,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4334,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4334,'house',1);
+INSERT INTO "remix_tag" VALUES(4334,'piano',1);
+INSERT INTO "remix_tag" VALUES(4334,'synth',1);
+INSERT INTO "remix_tag" VALUES(4334,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4335,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4335,'collab',1);
+INSERT INTO "remix_tag" VALUES(4335,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4335,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4335,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4335,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4335,'flute',1);
+INSERT INTO "remix_tag" VALUES(4335,'funky',1);
+INSERT INTO "remix_tag" VALUES(4335,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4335,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4335,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4335,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4335,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4335,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4336,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4336,'choir',1);
+INSERT INTO "remix_tag" VALUES(4336,'dark',1);
+INSERT INTO "remix_tag" VALUES(4336,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4336,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4336,'piano',1);
+INSERT INTO "remix_tag" VALUES(4336,'rock',1);
+INSERT INTO "remix_tag" VALUES(4336,'synth',1);
+INSERT INTO "remix_tag" VALUES(4337,'carribean',1);
+INSERT INTO "remix_tag" VALUES(4337,'dance',1);
+INSERT INTO "remix_tag" VALUES(4337,'edm',1);
+INSERT INTO "remix_tag" VALUES(4337,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4337,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4337,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4337,'happy',1);
+INSERT INTO "remix_tag" VALUES(4337,'latin',1);
+INSERT INTO "remix_tag" VALUES(4337,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4337,'organ',1);
+INSERT INTO "remix_tag" VALUES(4337,'piano',1);
+INSERT INTO "remix_tag" VALUES(4337,'synth',1);
+INSERT INTO "remix_tag" VALUES(4337,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4338,'bells',1);
+INSERT INTO "remix_tag" VALUES(4338,'chill',1);
+INSERT INTO "remix_tag" VALUES(4338,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4338,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4338,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4338,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4338,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4338,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4338,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4338,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4338,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4339,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4339,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4339,'classical',1);
+INSERT INTO "remix_tag" VALUES(4339,'flute',1);
+INSERT INTO "remix_tag" VALUES(4339,'harp',1);
+INSERT INTO "remix_tag" VALUES(4339,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(4339,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4339,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4339,'piano',1);
+INSERT INTO "remix_tag" VALUES(4339,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4339,'strings',1);
+INSERT INTO "remix_tag" VALUES(4339,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4340,'choir',1);
+INSERT INTO "remix_tag" VALUES(4340,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4340,'folk',1);
+INSERT INTO "remix_tag" VALUES(4340,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4340,'harp',1);
+INSERT INTO "remix_tag" VALUES(4340,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4340,'organ',1);
+INSERT INTO "remix_tag" VALUES(4340,'oud',1);
+INSERT INTO "remix_tag" VALUES(4340,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4340,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4340,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4340,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4341,'cello',1);
+INSERT INTO "remix_tag" VALUES(4341,'chinese',1);
+INSERT INTO "remix_tag" VALUES(4341,'compo',1);
+INSERT INTO "remix_tag" VALUES(4341,'dark',1);
+INSERT INTO "remix_tag" VALUES(4341,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4341,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4341,'harp',1);
+INSERT INTO "remix_tag" VALUES(4341,'rock',1);
+INSERT INTO "remix_tag" VALUES(4341,'synth',1);
+INSERT INTO "remix_tag" VALUES(4341,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4341,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4342,'bells',1);
+INSERT INTO "remix_tag" VALUES(4342,'dark',1);
+INSERT INTO "remix_tag" VALUES(4342,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4342,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4342,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4342,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4342,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4342,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4343,'edm',1);
+INSERT INTO "remix_tag" VALUES(4343,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4343,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4343,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4343,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4343,'piano',1);
+INSERT INTO "remix_tag" VALUES(4343,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4343,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4343,'synth',1);
+INSERT INTO "remix_tag" VALUES(4343,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4343,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4344,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4344,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4344,'collab',1);
+INSERT INTO "remix_tag" VALUES(4344,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4344,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4344,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4344,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4344,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4344,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4344,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4344,'singing',1);
+INSERT INTO "remix_tag" VALUES(4344,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4344,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4345,'collab',1);
+INSERT INTO "remix_tag" VALUES(4345,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4345,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4345,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4345,'pop',1);
+INSERT INTO "remix_tag" VALUES(4345,'singing',1);
+INSERT INTO "remix_tag" VALUES(4345,'synth',1);
+INSERT INTO "remix_tag" VALUES(4345,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4345,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4345,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4346,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4346,'edm',1);
+INSERT INTO "remix_tag" VALUES(4346,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4346,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4346,'flute',1);
+INSERT INTO "remix_tag" VALUES(4346,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4346,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4346,'synth',1);
+INSERT INTO "remix_tag" VALUES(4346,'turntable',1);
+INSERT INTO "remix_tag" VALUES(4347,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4347,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4347,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4347,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4347,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4347,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4347,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4347,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4347,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4347,'synth',1);
+INSERT INTO "remix_tag" VALUES(4348,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4348,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4348,'epic',1);
+INSERT INTO "remix_tag" VALUES(4348,'erhu',1);
+INSERT INTO "remix_tag" VALUES(4348,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4348,'piano',1);
+INSERT INTO "remix_tag" VALUES(4348,'singing',1);
+INSERT INTO "remix_tag" VALUES(4348,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4348,'strings',1);
+INSERT INTO "remix_tag" VALUES(4348,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4348,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4349,'classical',1);
+INSERT INTO "remix_tag" VALUES(4349,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4349,'epic',1);
+INSERT INTO "remix_tag" VALUES(4349,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4349,'organ',1);
+INSERT INTO "remix_tag" VALUES(4349,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4349,'solo',1);
+INSERT INTO "remix_tag" VALUES(4349,'wedding',1);
+INSERT INTO "remix_tag" VALUES(4350,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4350,'bells',1);
+INSERT INTO "remix_tag" VALUES(4350,'dark',1);
+INSERT INTO "remix_tag" VALUES(4350,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4350,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4350,'edm',1);
+INSERT INTO "remix_tag" VALUES(4350,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4350,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4350,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4350,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4350,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4350,'synth',1);
+INSERT INTO "remix_tag" VALUES(4351,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4351,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4351,'choir',1);
+INSERT INTO "remix_tag" VALUES(4351,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4351,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4351,'classical',1);
+INSERT INTO "remix_tag" VALUES(4351,'flute',1);
+INSERT INTO "remix_tag" VALUES(4351,'folk',1);
+INSERT INTO "remix_tag" VALUES(4351,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4351,'harp',1);
+INSERT INTO "remix_tag" VALUES(4351,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4351,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4351,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4351,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4351,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4351,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4351,'strings',1);
+INSERT INTO "remix_tag" VALUES(4351,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4352,'brass',1);
+INSERT INTO "remix_tag" VALUES(4352,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4352,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4352,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4352,'epic',1);
+INSERT INTO "remix_tag" VALUES(4352,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4352,'funky',1);
+INSERT INTO "remix_tag" VALUES(4352,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4352,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4352,'rock',1);
+INSERT INTO "remix_tag" VALUES(4352,'strings',1);
+INSERT INTO "remix_tag" VALUES(4352,'synth',1);
+INSERT INTO "remix_tag" VALUES(4352,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4353,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4353,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4353,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4353,'rock',1);
+INSERT INTO "remix_tag" VALUES(4353,'synth',1);
+INSERT INTO "remix_tag" VALUES(4354,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4354,'dark',1);
+INSERT INTO "remix_tag" VALUES(4354,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4354,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4354,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4354,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4354,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4354,'synth',1);
+INSERT INTO "remix_tag" VALUES(4355,'brass',1);
+INSERT INTO "remix_tag" VALUES(4355,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4355,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4355,'epic',1);
+INSERT INTO "remix_tag" VALUES(4355,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4355,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4355,'strings',1);
+INSERT INTO "remix_tag" VALUES(4355,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4355,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4355,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4355,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4356,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4356,'dark',1);
+INSERT INTO "remix_tag" VALUES(4356,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4356,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4356,'rock',1);
+INSERT INTO "remix_tag" VALUES(4356,'singing',1);
+INSERT INTO "remix_tag" VALUES(4356,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4356,'strings',1);
+INSERT INTO "remix_tag" VALUES(4357,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4357,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4357,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4357,'metal',1);
+INSERT INTO "remix_tag" VALUES(4357,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4357,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4357,'synth',1);
+INSERT INTO "remix_tag" VALUES(4358,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4358,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4358,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4358,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4358,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4358,'metal',1);
+INSERT INTO "remix_tag" VALUES(4358,'rock',1);
+INSERT INTO "remix_tag" VALUES(4358,'sad',1);
+INSERT INTO "remix_tag" VALUES(4358,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4359,'cello',1);
+INSERT INTO "remix_tag" VALUES(4359,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4359,'collab',1);
+INSERT INTO "remix_tag" VALUES(4359,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4359,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4359,'epic',1);
+INSERT INTO "remix_tag" VALUES(4359,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4359,'piano',1);
+INSERT INTO "remix_tag" VALUES(4359,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4359,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4359,'synth',1);
+INSERT INTO "remix_tag" VALUES(4359,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4359,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4359,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4360,'chill',1);
+INSERT INTO "remix_tag" VALUES(4360,'dark',1);
+INSERT INTO "remix_tag" VALUES(4360,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4360,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4360,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4360,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4360,'pop',1);
+INSERT INTO "remix_tag" VALUES(4360,'singing',1);
+INSERT INTO "remix_tag" VALUES(4360,'synth',1);
+INSERT INTO "remix_tag" VALUES(4360,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4360,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4360,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4361,'bells',1);
+INSERT INTO "remix_tag" VALUES(4361,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4361,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4361,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4361,'collab',1);
+INSERT INTO "remix_tag" VALUES(4361,'folk',1);
+INSERT INTO "remix_tag" VALUES(4361,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4361,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4361,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4361,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4361,'recorder',1);
+INSERT INTO "remix_tag" VALUES(4361,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4361,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4361,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4362,'bells',1);
+INSERT INTO "remix_tag" VALUES(4362,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4362,'classical',1);
+INSERT INTO "remix_tag" VALUES(4362,'flute',1);
+INSERT INTO "remix_tag" VALUES(4362,'harp',1);
+INSERT INTO "remix_tag" VALUES(4362,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4362,'medley',1);
+INSERT INTO "remix_tag" VALUES(4362,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4362,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4362,'singing',1);
+INSERT INTO "remix_tag" VALUES(4362,'strings',1);
+INSERT INTO "remix_tag" VALUES(4362,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4362,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4363,'bells',1);
+INSERT INTO "remix_tag" VALUES(4363,'classical',1);
+INSERT INTO "remix_tag" VALUES(4363,'collab',1);
+INSERT INTO "remix_tag" VALUES(4363,'flute',1);
+INSERT INTO "remix_tag" VALUES(4363,'folk',1);
+INSERT INTO "remix_tag" VALUES(4363,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4363,'indian',1);
+INSERT INTO "remix_tag" VALUES(4363,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4363,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4363,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4363,'strings',1);
+INSERT INTO "remix_tag" VALUES(4363,'violin',1);
+INSERT INTO "remix_tag" VALUES(4363,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4364,'brass',1);
+INSERT INTO "remix_tag" VALUES(4364,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4364,'flute',1);
+INSERT INTO "remix_tag" VALUES(4364,'happy',1);
+INSERT INTO "remix_tag" VALUES(4364,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4364,'strings',1);
+INSERT INTO "remix_tag" VALUES(4364,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4364,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4364,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4364,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4364,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4365,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4365,'collab',1);
+INSERT INTO "remix_tag" VALUES(4365,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4365,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4365,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4365,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4365,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4365,'piano',1);
+INSERT INTO "remix_tag" VALUES(4365,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4365,'trio',1);
+INSERT INTO "remix_tag" VALUES(4365,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4366,'collab',1);
+INSERT INTO "remix_tag" VALUES(4366,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4366,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4366,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4366,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4366,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4366,'rock',1);
+INSERT INTO "remix_tag" VALUES(4366,'singing',1);
+INSERT INTO "remix_tag" VALUES(4366,'synth',1);
+INSERT INTO "remix_tag" VALUES(4366,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4366,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4367,'dance',1);
+INSERT INTO "remix_tag" VALUES(4367,'edm',1);
+INSERT INTO "remix_tag" VALUES(4367,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4367,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4367,'happy',1);
+INSERT INTO "remix_tag" VALUES(4367,'synth',1);
+INSERT INTO "remix_tag" VALUES(4367,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4368,'chill',1);
+INSERT INTO "remix_tag" VALUES(4368,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4368,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4368,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4368,'pop',1);
+INSERT INTO "remix_tag" VALUES(4368,'synth',1);
+INSERT INTO "remix_tag" VALUES(4368,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4369,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4369,'chill',1);
+INSERT INTO "remix_tag" VALUES(4369,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4369,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4369,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4369,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4369,'piano',1);
+INSERT INTO "remix_tag" VALUES(4370,'chill',1);
+INSERT INTO "remix_tag" VALUES(4370,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4370,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4370,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4370,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4370,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4370,'synth',1);
+INSERT INTO "remix_tag" VALUES(4370,'trap',1);
+INSERT INTO "remix_tag" VALUES(4371,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4371,'brass',1);
+INSERT INTO "remix_tag" VALUES(4371,'collab',1);
+INSERT INTO "remix_tag" VALUES(4371,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4371,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4371,'epic',1);
+INSERT INTO "remix_tag" VALUES(4371,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4371,'rock',1);
+INSERT INTO "remix_tag" VALUES(4371,'strings',1);
+INSERT INTO "remix_tag" VALUES(4371,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4372,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4372,'edm',1);
+INSERT INTO "remix_tag" VALUES(4372,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4372,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4372,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4372,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4372,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4372,'synth',1);
+INSERT INTO "remix_tag" VALUES(4373,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4373,'chill',1);
+INSERT INTO "remix_tag" VALUES(4373,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4373,'edm',1);
+INSERT INTO "remix_tag" VALUES(4373,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4373,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4373,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4373,'synth',1);
+INSERT INTO "remix_tag" VALUES(4373,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4373,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4374,'cello',1);
+INSERT INTO "remix_tag" VALUES(4374,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4374,'collab',1);
+INSERT INTO "remix_tag" VALUES(4374,'dark',1);
+INSERT INTO "remix_tag" VALUES(4374,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4374,'euphonium',1);
+INSERT INTO "remix_tag" VALUES(4374,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4374,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4374,'organ',1);
+INSERT INTO "remix_tag" VALUES(4374,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4374,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4374,'synth',1);
+INSERT INTO "remix_tag" VALUES(4375,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4375,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4375,'piano',1);
+INSERT INTO "remix_tag" VALUES(4375,'singing',1);
+INSERT INTO "remix_tag" VALUES(4375,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4375,'strings',1);
+INSERT INTO "remix_tag" VALUES(4375,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4375,'synth',1);
+INSERT INTO "remix_tag" VALUES(4376,'choir',1);
+INSERT INTO "remix_tag" VALUES(4376,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4376,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4376,'flute',1);
+INSERT INTO "remix_tag" VALUES(4376,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4376,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4376,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4376,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4376,'sleepytime',1);
+INSERT INTO "remix_tag" VALUES(4376,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4376,'strings',1);
+INSERT INTO "remix_tag" VALUES(4376,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4376,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4377,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4377,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4377,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4377,'pop',1);
+INSERT INTO "remix_tag" VALUES(4377,'rock',1);
+INSERT INTO "remix_tag" VALUES(4377,'synth',1);
+INSERT INTO "remix_tag" VALUES(4377,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4377,'workout',1);
+INSERT INTO "remix_tag" VALUES(4378,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4378,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4378,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4378,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4378,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4378,'piano',1);
+INSERT INTO "remix_tag" VALUES(4378,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4379,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4379,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4379,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4379,'collab',1);
+INSERT INTO "remix_tag" VALUES(4379,'flute',1);
+INSERT INTO "remix_tag" VALUES(4379,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4379,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4379,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4379,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4379,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4379,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4379,'pop',1);
+INSERT INTO "remix_tag" VALUES(4379,'singing',1);
+INSERT INTO "remix_tag" VALUES(4379,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4379,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4379,'violin',1);
+INSERT INTO "remix_tag" VALUES(4379,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4380,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4380,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4380,'chill',1);
+INSERT INTO "remix_tag" VALUES(4380,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4380,'dark',1);
+INSERT INTO "remix_tag" VALUES(4380,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4380,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4380,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4380,'piano',1);
+INSERT INTO "remix_tag" VALUES(4380,'synth',1);
+INSERT INTO "remix_tag" VALUES(4381,'dance',1);
+INSERT INTO "remix_tag" VALUES(4381,'edm',1);
+INSERT INTO "remix_tag" VALUES(4381,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4381,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4381,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4381,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4381,'synth',1);
+INSERT INTO "remix_tag" VALUES(4381,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4382,'dark',1);
+INSERT INTO "remix_tag" VALUES(4382,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4382,'edm',1);
+INSERT INTO "remix_tag" VALUES(4382,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4382,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4382,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4382,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4382,'synth',1);
+INSERT INTO "remix_tag" VALUES(4382,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4382,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4383,'choir',1);
+INSERT INTO "remix_tag" VALUES(4383,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4383,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4383,'dark',1);
+INSERT INTO "remix_tag" VALUES(4383,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4383,'singing',1);
+INSERT INTO "remix_tag" VALUES(4383,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4383,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4383,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4384,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4384,'edm',1);
+INSERT INTO "remix_tag" VALUES(4384,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4384,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4384,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4384,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4384,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4384,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4384,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4384,'synth',1);
+INSERT INTO "remix_tag" VALUES(4384,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4384,'trap',1);
+INSERT INTO "remix_tag" VALUES(4385,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4385,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4385,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4385,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4385,'metal',1);
+INSERT INTO "remix_tag" VALUES(4385,'synth',1);
+INSERT INTO "remix_tag" VALUES(4386,'bells',1);
+INSERT INTO "remix_tag" VALUES(4386,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4386,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4386,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4386,'epic',1);
+INSERT INTO "remix_tag" VALUES(4386,'piano',1);
+INSERT INTO "remix_tag" VALUES(4386,'rock',1);
+INSERT INTO "remix_tag" VALUES(4386,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4386,'synth',1);
+INSERT INTO "remix_tag" VALUES(4387,'brass',1);
+INSERT INTO "remix_tag" VALUES(4387,'clavinet',1);
+INSERT INTO "remix_tag" VALUES(4387,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4387,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4387,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4387,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4387,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4387,'funky',1);
+INSERT INTO "remix_tag" VALUES(4387,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4387,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4387,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4387,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4387,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4388,'brass',1);
+INSERT INTO "remix_tag" VALUES(4388,'chill',1);
+INSERT INTO "remix_tag" VALUES(4388,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4388,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4388,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4388,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4388,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4388,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4388,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4388,'piano',1);
+INSERT INTO "remix_tag" VALUES(4388,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4388,'synth',1);
+INSERT INTO "remix_tag" VALUES(4388,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4388,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4389,'brass',1);
+INSERT INTO "remix_tag" VALUES(4389,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4389,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4389,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4389,'flute',1);
+INSERT INTO "remix_tag" VALUES(4389,'happy',1);
+INSERT INTO "remix_tag" VALUES(4389,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4389,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4389,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4389,'piano',1);
+INSERT INTO "remix_tag" VALUES(4389,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4389,'swing',1);
+INSERT INTO "remix_tag" VALUES(4389,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4389,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4390,'chill',1);
+INSERT INTO "remix_tag" VALUES(4390,'collab',1);
+INSERT INTO "remix_tag" VALUES(4390,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4390,'funky',1);
+INSERT INTO "remix_tag" VALUES(4390,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4390,'reggae',1);
+INSERT INTO "remix_tag" VALUES(4390,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4391,'choir',1);
+INSERT INTO "remix_tag" VALUES(4391,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4391,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4391,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4391,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4391,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4391,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4391,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4391,'synth',1);
+INSERT INTO "remix_tag" VALUES(4391,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4392,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4392,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4392,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(4392,'collab',1);
+INSERT INTO "remix_tag" VALUES(4392,'folk',1);
+INSERT INTO "remix_tag" VALUES(4392,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4392,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4392,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4392,'piano',1);
+INSERT INTO "remix_tag" VALUES(4392,'viola',1);
+INSERT INTO "remix_tag" VALUES(4393,'chill',1);
+INSERT INTO "remix_tag" VALUES(4393,'chinese',1);
+INSERT INTO "remix_tag" VALUES(4393,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4393,'guzheng',1);
+INSERT INTO "remix_tag" VALUES(4393,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4393,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4393,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4393,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4393,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4393,'synth',1);
+INSERT INTO "remix_tag" VALUES(4393,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4394,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4394,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4394,'edm',1);
+INSERT INTO "remix_tag" VALUES(4394,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4394,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4394,'folk',1);
+INSERT INTO "remix_tag" VALUES(4394,'funky',1);
+INSERT INTO "remix_tag" VALUES(4394,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4394,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4394,'piano',1);
+INSERT INTO "remix_tag" VALUES(4394,'pop',1);
+INSERT INTO "remix_tag" VALUES(4394,'synth',1);
+INSERT INTO "remix_tag" VALUES(4394,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4395,'choir',1);
+INSERT INTO "remix_tag" VALUES(4395,'collab',1);
+INSERT INTO "remix_tag" VALUES(4395,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4395,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4395,'metal',1);
+INSERT INTO "remix_tag" VALUES(4395,'organ',1);
+INSERT INTO "remix_tag" VALUES(4395,'rock',1);
+INSERT INTO "remix_tag" VALUES(4395,'singing',1);
+INSERT INTO "remix_tag" VALUES(4395,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4396,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4396,'edm',1);
+INSERT INTO "remix_tag" VALUES(4396,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4396,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4396,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4396,'funky',1);
+INSERT INTO "remix_tag" VALUES(4396,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4396,'house',1);
+INSERT INTO "remix_tag" VALUES(4396,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4396,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4396,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4397,'edm',1);
+INSERT INTO "remix_tag" VALUES(4397,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4397,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4397,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4397,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4397,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4397,'synth',1);
+INSERT INTO "remix_tag" VALUES(4397,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4398,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4398,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4398,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4398,'happy',1);
+INSERT INTO "remix_tag" VALUES(4398,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4398,'medley',1);
+INSERT INTO "remix_tag" VALUES(4398,'rock',1);
+INSERT INTO "remix_tag" VALUES(4398,'strings',1);
+INSERT INTO "remix_tag" VALUES(4398,'synth',1);
+INSERT INTO "remix_tag" VALUES(4398,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4399,'bells',1);
+INSERT INTO "remix_tag" VALUES(4399,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4399,'edm',1);
+INSERT INTO "remix_tag" VALUES(4399,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4399,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4399,'happy',1);
+INSERT INTO "remix_tag" VALUES(4399,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4399,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4399,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4399,'pop',1);
+INSERT INTO "remix_tag" VALUES(4399,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4399,'synth',1);
+INSERT INTO "remix_tag" VALUES(4400,'dance',1);
+INSERT INTO "remix_tag" VALUES(4400,'edm',1);
+INSERT INTO "remix_tag" VALUES(4400,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4400,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4400,'piano',1);
+INSERT INTO "remix_tag" VALUES(4400,'synth',1);
+INSERT INTO "remix_tag" VALUES(4400,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4401,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4401,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4401,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4401,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4401,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4401,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4401,'piano',1);
+INSERT INTO "remix_tag" VALUES(4401,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4402,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4402,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4402,'collab',1);
+INSERT INTO "remix_tag" VALUES(4402,'folk',1);
+INSERT INTO "remix_tag" VALUES(4402,'harp',1);
+INSERT INTO "remix_tag" VALUES(4402,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4402,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4402,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4402,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4402,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4402,'piano',1);
+INSERT INTO "remix_tag" VALUES(4402,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4402,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4403,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4403,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4403,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4403,'synth',1);
+INSERT INTO "remix_tag" VALUES(4404,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4404,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4404,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4404,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4404,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4404,'piano',1);
+INSERT INTO "remix_tag" VALUES(4404,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4405,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4405,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4405,'edm',1);
+INSERT INTO "remix_tag" VALUES(4405,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4405,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4405,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4405,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4405,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4405,'synth',1);
+INSERT INTO "remix_tag" VALUES(4406,'dance',1);
+INSERT INTO "remix_tag" VALUES(4406,'edm',1);
+INSERT INTO "remix_tag" VALUES(4406,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4406,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4406,'synth',1);
+INSERT INTO "remix_tag" VALUES(4407,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4407,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4407,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4407,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4407,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4407,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4407,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4407,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4407,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4407,'synth',1);
+INSERT INTO "remix_tag" VALUES(4408,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4408,'chill',1);
+INSERT INTO "remix_tag" VALUES(4408,'chinese',1);
+INSERT INTO "remix_tag" VALUES(4408,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4408,'edm',1);
+INSERT INTO "remix_tag" VALUES(4408,'erhu',1);
+INSERT INTO "remix_tag" VALUES(4408,'folk',1);
+INSERT INTO "remix_tag" VALUES(4408,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4408,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4408,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4408,'synth',1);
+INSERT INTO "remix_tag" VALUES(4409,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4409,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4409,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4409,'happy',1);
+INSERT INTO "remix_tag" VALUES(4409,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4409,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4409,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4409,'rock',1);
+INSERT INTO "remix_tag" VALUES(4409,'strings',1);
+INSERT INTO "remix_tag" VALUES(4409,'synth',1);
+INSERT INTO "remix_tag" VALUES(4409,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4409,'whistling',1);
+INSERT INTO "remix_tag" VALUES(4410,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4410,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4410,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4410,'rock',1);
+INSERT INTO "remix_tag" VALUES(4410,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4410,'synth',1);
+INSERT INTO "remix_tag" VALUES(4410,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4410,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4411,'classical',1);
+INSERT INTO "remix_tag" VALUES(4411,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4411,'piano',1);
+INSERT INTO "remix_tag" VALUES(4411,'solo',1);
+INSERT INTO "remix_tag" VALUES(4411,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4411,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4412,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4412,'collab',1);
+INSERT INTO "remix_tag" VALUES(4412,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4412,'flugelhorn',1);
+INSERT INTO "remix_tag" VALUES(4412,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4412,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4412,'pop',1);
+INSERT INTO "remix_tag" VALUES(4412,'rock',1);
+INSERT INTO "remix_tag" VALUES(4412,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4412,'synth',1);
+INSERT INTO "remix_tag" VALUES(4412,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4413,'brass',1);
+INSERT INTO "remix_tag" VALUES(4413,'cello',1);
+INSERT INTO "remix_tag" VALUES(4413,'collab',1);
+INSERT INTO "remix_tag" VALUES(4413,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4413,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4413,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4413,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4413,'metal',1);
+INSERT INTO "remix_tag" VALUES(4413,'rock',1);
+INSERT INTO "remix_tag" VALUES(4413,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4413,'violin',1);
+INSERT INTO "remix_tag" VALUES(4414,'cello',1);
+INSERT INTO "remix_tag" VALUES(4414,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4414,'classical',1);
+INSERT INTO "remix_tag" VALUES(4414,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4414,'piano',1);
+INSERT INTO "remix_tag" VALUES(4414,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4414,'trio',1);
+INSERT INTO "remix_tag" VALUES(4414,'violin',1);
+INSERT INTO "remix_tag" VALUES(4415,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4415,'brass',1);
+INSERT INTO "remix_tag" VALUES(4415,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4415,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4415,'classical',1);
+INSERT INTO "remix_tag" VALUES(4415,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4415,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4415,'organ',1);
+INSERT INTO "remix_tag" VALUES(4415,'piano',1);
+INSERT INTO "remix_tag" VALUES(4415,'sad',1);
+INSERT INTO "remix_tag" VALUES(4415,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4415,'strings',1);
+INSERT INTO "remix_tag" VALUES(4415,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4415,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4416,'bells',1);
+INSERT INTO "remix_tag" VALUES(4416,'collab',1);
+INSERT INTO "remix_tag" VALUES(4416,'dark',1);
+INSERT INTO "remix_tag" VALUES(4416,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4416,'edm',1);
+INSERT INTO "remix_tag" VALUES(4416,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4416,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4416,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4416,'piano',1);
+INSERT INTO "remix_tag" VALUES(4416,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4416,'synth',1);
+INSERT INTO "remix_tag" VALUES(4416,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4416,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4416,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4417,'chill',1);
+INSERT INTO "remix_tag" VALUES(4417,'dark',1);
+INSERT INTO "remix_tag" VALUES(4417,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4417,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4417,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4417,'funky',1);
+INSERT INTO "remix_tag" VALUES(4417,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4417,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4417,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4417,'rock',1);
+INSERT INTO "remix_tag" VALUES(4417,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4417,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4418,'collab',1);
+INSERT INTO "remix_tag" VALUES(4418,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4418,'disco',1);
+INSERT INTO "remix_tag" VALUES(4418,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4418,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4418,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4418,'funky',1);
+INSERT INTO "remix_tag" VALUES(4418,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4418,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4418,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4418,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4418,'strings',1);
+INSERT INTO "remix_tag" VALUES(4418,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4418,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4419,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4419,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4419,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4419,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4419,'epic',1);
+INSERT INTO "remix_tag" VALUES(4419,'folk',1);
+INSERT INTO "remix_tag" VALUES(4419,'metal',1);
+INSERT INTO "remix_tag" VALUES(4419,'rock',1);
+INSERT INTO "remix_tag" VALUES(4419,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4419,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4420,'bells',1);
+INSERT INTO "remix_tag" VALUES(4420,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4420,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4420,'flute',1);
+INSERT INTO "remix_tag" VALUES(4420,'medley',1);
+INSERT INTO "remix_tag" VALUES(4420,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4420,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4420,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4420,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4420,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4420,'strings',1);
+INSERT INTO "remix_tag" VALUES(4420,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4420,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4420,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4421,'dance',1);
+INSERT INTO "remix_tag" VALUES(4421,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4421,'edm',1);
+INSERT INTO "remix_tag" VALUES(4421,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4421,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4421,'funky',1);
+INSERT INTO "remix_tag" VALUES(4421,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4421,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4421,'synth',1);
+INSERT INTO "remix_tag" VALUES(4421,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4421,'trap',1);
+INSERT INTO "remix_tag" VALUES(4422,'chill',1);
+INSERT INTO "remix_tag" VALUES(4422,'funky',1);
+INSERT INTO "remix_tag" VALUES(4422,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4422,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4422,'piano',1);
+INSERT INTO "remix_tag" VALUES(4422,'synth',1);
+INSERT INTO "remix_tag" VALUES(4423,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4423,'edm',1);
+INSERT INTO "remix_tag" VALUES(4423,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4423,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4423,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4423,'piano',1);
+INSERT INTO "remix_tag" VALUES(4423,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4423,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4423,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4423,'synth',1);
+INSERT INTO "remix_tag" VALUES(4423,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4423,'workout',1);
+INSERT INTO "remix_tag" VALUES(4424,'chill',1);
+INSERT INTO "remix_tag" VALUES(4424,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4424,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4424,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4424,'synth',1);
+INSERT INTO "remix_tag" VALUES(4424,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4425,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4425,'edm',1);
+INSERT INTO "remix_tag" VALUES(4425,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4425,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4425,'happy',1);
+INSERT INTO "remix_tag" VALUES(4425,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4425,'synth',1);
+INSERT INTO "remix_tag" VALUES(4425,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4426,'dark',1);
+INSERT INTO "remix_tag" VALUES(4426,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4426,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4426,'piano',1);
+INSERT INTO "remix_tag" VALUES(4426,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4426,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4426,'synth',1);
+INSERT INTO "remix_tag" VALUES(4426,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4426,'violin',1);
+INSERT INTO "remix_tag" VALUES(4427,'chill',1);
+INSERT INTO "remix_tag" VALUES(4427,'choir',1);
+INSERT INTO "remix_tag" VALUES(4427,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4427,'edm',1);
+INSERT INTO "remix_tag" VALUES(4427,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4427,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4427,'synth',1);
+INSERT INTO "remix_tag" VALUES(4427,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4427,'trance',1);
+INSERT INTO "remix_tag" VALUES(4428,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4428,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4428,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4428,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4428,'happy',1);
+INSERT INTO "remix_tag" VALUES(4428,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4428,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4428,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4428,'synth',1);
+INSERT INTO "remix_tag" VALUES(4428,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4429,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4429,'chill',1);
+INSERT INTO "remix_tag" VALUES(4429,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4429,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4429,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4429,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4429,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4429,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4429,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4429,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4430,'chill',1);
+INSERT INTO "remix_tag" VALUES(4430,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4430,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4430,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4430,'funky',1);
+INSERT INTO "remix_tag" VALUES(4430,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4430,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4430,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4430,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4430,'piano',1);
+INSERT INTO "remix_tag" VALUES(4430,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4430,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4430,'strings',1);
+INSERT INTO "remix_tag" VALUES(4431,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4431,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4431,'funk',1);
+INSERT INTO "remix_tag" VALUES(4431,'funky',1);
+INSERT INTO "remix_tag" VALUES(4431,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4431,'happy',1);
+INSERT INTO "remix_tag" VALUES(4431,'piano',1);
+INSERT INTO "remix_tag" VALUES(4431,'rock',1);
+INSERT INTO "remix_tag" VALUES(4431,'synth',1);
+INSERT INTO "remix_tag" VALUES(4432,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4432,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4432,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4432,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4432,'synth',1);
+INSERT INTO "remix_tag" VALUES(4432,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4433,'choir',1);
+INSERT INTO "remix_tag" VALUES(4433,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4433,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4433,'dark',1);
+INSERT INTO "remix_tag" VALUES(4433,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4433,'epic',1);
+INSERT INTO "remix_tag" VALUES(4433,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(4433,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4433,'march',1);
+INSERT INTO "remix_tag" VALUES(4433,'rock',1);
+INSERT INTO "remix_tag" VALUES(4433,'strings',1);
+INSERT INTO "remix_tag" VALUES(4433,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4433,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4433,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4434,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4434,'edm',1);
+INSERT INTO "remix_tag" VALUES(4434,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4434,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4434,'funky',1);
+INSERT INTO "remix_tag" VALUES(4434,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4434,'happy',1);
+INSERT INTO "remix_tag" VALUES(4434,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4434,'synth',1);
+INSERT INTO "remix_tag" VALUES(4434,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4435,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4435,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4435,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4435,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4435,'piano',1);
+INSERT INTO "remix_tag" VALUES(4435,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4435,'synth',1);
+INSERT INTO "remix_tag" VALUES(4435,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4436,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4436,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4436,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4436,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4436,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4436,'piano',1);
+INSERT INTO "remix_tag" VALUES(4436,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4436,'rock',1);
+INSERT INTO "remix_tag" VALUES(4437,'chill',1);
+INSERT INTO "remix_tag" VALUES(4437,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4437,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4437,'funk',1);
+INSERT INTO "remix_tag" VALUES(4437,'funky',1);
+INSERT INTO "remix_tag" VALUES(4437,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4437,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4437,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4437,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4437,'piano',1);
+INSERT INTO "remix_tag" VALUES(4437,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4438,'collab',1);
+INSERT INTO "remix_tag" VALUES(4438,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4438,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4438,'funky',1);
+INSERT INTO "remix_tag" VALUES(4438,'happy',1);
+INSERT INTO "remix_tag" VALUES(4438,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4438,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4438,'medley',1);
+INSERT INTO "remix_tag" VALUES(4438,'organ',1);
+INSERT INTO "remix_tag" VALUES(4438,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4438,'rock',1);
+INSERT INTO "remix_tag" VALUES(4438,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4438,'whistling',1);
+INSERT INTO "remix_tag" VALUES(4438,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4439,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4439,'collab',1);
+INSERT INTO "remix_tag" VALUES(4439,'folk',1);
+INSERT INTO "remix_tag" VALUES(4439,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4439,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4439,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4439,'oud',1);
+INSERT INTO "remix_tag" VALUES(4439,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4440,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4440,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4440,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(4440,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4440,'chill',1);
+INSERT INTO "remix_tag" VALUES(4440,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4440,'collab',1);
+INSERT INTO "remix_tag" VALUES(4440,'flute',1);
+INSERT INTO "remix_tag" VALUES(4440,'folk',1);
+INSERT INTO "remix_tag" VALUES(4440,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4440,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4440,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4440,'violin',1);
+INSERT INTO "remix_tag" VALUES(4440,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4441,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4441,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4441,'edm',1);
+INSERT INTO "remix_tag" VALUES(4441,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4441,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4441,'synth',1);
+INSERT INTO "remix_tag" VALUES(4442,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4442,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4442,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4442,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4442,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4442,'metal',1);
+INSERT INTO "remix_tag" VALUES(4442,'organ',1);
+INSERT INTO "remix_tag" VALUES(4442,'synth',1);
+INSERT INTO "remix_tag" VALUES(4443,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4443,'cello',1);
+INSERT INTO "remix_tag" VALUES(4443,'collab',1);
+INSERT INTO "remix_tag" VALUES(4443,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4443,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4443,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4443,'south-american',1);
+INSERT INTO "remix_tag" VALUES(4443,'tango',1);
+INSERT INTO "remix_tag" VALUES(4443,'violin',1);
+INSERT INTO "remix_tag" VALUES(4444,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4444,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4444,'lang-spanish',1);
+INSERT INTO "remix_tag" VALUES(4444,'latin',1);
+INSERT INTO "remix_tag" VALUES(4444,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4444,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4444,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4444,'singing',1);
+INSERT INTO "remix_tag" VALUES(4444,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4444,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4444,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4444,'wedding',1);
+INSERT INTO "remix_tag" VALUES(4445,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4445,'cello',1);
+INSERT INTO "remix_tag" VALUES(4445,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4445,'classical',1);
+INSERT INTO "remix_tag" VALUES(4445,'collab',1);
+INSERT INTO "remix_tag" VALUES(4445,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4445,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4445,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4445,'strings',1);
+INSERT INTO "remix_tag" VALUES(4445,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4445,'viola',1);
+INSERT INTO "remix_tag" VALUES(4445,'violin',1);
+INSERT INTO "remix_tag" VALUES(4446,'cello',1);
+INSERT INTO "remix_tag" VALUES(4446,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4446,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4446,'collab',1);
+INSERT INTO "remix_tag" VALUES(4446,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4446,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4446,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4446,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4446,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4446,'singing',1);
+INSERT INTO "remix_tag" VALUES(4446,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4446,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4446,'synth',1);
+INSERT INTO "remix_tag" VALUES(4446,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4446,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4447,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4447,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4447,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4447,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4447,'collab',1);
+INSERT INTO "remix_tag" VALUES(4447,'dark',1);
+INSERT INTO "remix_tag" VALUES(4447,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4447,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4447,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4447,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4447,'metal',1);
+INSERT INTO "remix_tag" VALUES(4447,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4447,'piano',1);
+INSERT INTO "remix_tag" VALUES(4447,'rock',1);
+INSERT INTO "remix_tag" VALUES(4447,'singing',1);
+INSERT INTO "remix_tag" VALUES(4447,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4447,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4448,'edm',1);
+INSERT INTO "remix_tag" VALUES(4448,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4448,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4448,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4448,'synth',1);
+INSERT INTO "remix_tag" VALUES(4448,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4448,'trance',1);
+INSERT INTO "remix_tag" VALUES(4449,'bells',1);
+INSERT INTO "remix_tag" VALUES(4449,'chill',1);
+INSERT INTO "remix_tag" VALUES(4449,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4449,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4449,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4449,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4449,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4449,'synth',1);
+INSERT INTO "remix_tag" VALUES(4449,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4450,'classical',1);
+INSERT INTO "remix_tag" VALUES(4450,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4450,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4450,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4450,'organ',1);
+INSERT INTO "remix_tag" VALUES(4450,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4450,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4450,'solo',1);
+INSERT INTO "remix_tag" VALUES(4450,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4451,'chill',1);
+INSERT INTO "remix_tag" VALUES(4451,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4451,'collab',1);
+INSERT INTO "remix_tag" VALUES(4451,'dark',1);
+INSERT INTO "remix_tag" VALUES(4451,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4451,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4451,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4451,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(4451,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4451,'pop',1);
+INSERT INTO "remix_tag" VALUES(4451,'singing',1);
+INSERT INTO "remix_tag" VALUES(4451,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4451,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4451,'synth',1);
+INSERT INTO "remix_tag" VALUES(4451,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4451,'trap',1);
+INSERT INTO "remix_tag" VALUES(4451,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4451,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4452,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4452,'collab',1);
+INSERT INTO "remix_tag" VALUES(4452,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4452,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4452,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4452,'piano',1);
+INSERT INTO "remix_tag" VALUES(4452,'rock-opera',1);
+INSERT INTO "remix_tag" VALUES(4452,'sad',1);
+INSERT INTO "remix_tag" VALUES(4452,'singing',1);
+INSERT INTO "remix_tag" VALUES(4452,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4452,'strings',1);
+INSERT INTO "remix_tag" VALUES(4452,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4453,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4453,'cello',1);
+INSERT INTO "remix_tag" VALUES(4453,'chinese',1);
+INSERT INTO "remix_tag" VALUES(4453,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4453,'collab',1);
+INSERT INTO "remix_tag" VALUES(4453,'dizi',1);
+INSERT INTO "remix_tag" VALUES(4453,'erhu',1);
+INSERT INTO "remix_tag" VALUES(4453,'folk',1);
+INSERT INTO "remix_tag" VALUES(4453,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4453,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4453,'strings',1);
+INSERT INTO "remix_tag" VALUES(4453,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4453,'viola',1);
+INSERT INTO "remix_tag" VALUES(4453,'violin',1);
+INSERT INTO "remix_tag" VALUES(4454,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4454,'chill',1);
+INSERT INTO "remix_tag" VALUES(4454,'collab',1);
+INSERT INTO "remix_tag" VALUES(4454,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4454,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4454,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4454,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4454,'piano',1);
+INSERT INTO "remix_tag" VALUES(4454,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4454,'tempo-slow',1);
+INSERT INTO "remix_tag" VALUES(4454,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4455,'choir',1);
+INSERT INTO "remix_tag" VALUES(4455,'edm',1);
+INSERT INTO "remix_tag" VALUES(4455,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4455,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4455,'piano',1);
+INSERT INTO "remix_tag" VALUES(4455,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4455,'synth',1);
+INSERT INTO "remix_tag" VALUES(4455,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4456,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4456,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4456,'collab',1);
+INSERT INTO "remix_tag" VALUES(4456,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4456,'happy',1);
+INSERT INTO "remix_tag" VALUES(4456,'latin',1);
+INSERT INTO "remix_tag" VALUES(4456,'latin-american',1);
+INSERT INTO "remix_tag" VALUES(4456,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4456,'strings',1);
+INSERT INTO "remix_tag" VALUES(4456,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4456,'violin',1);
+INSERT INTO "remix_tag" VALUES(4457,'bells',1);
+INSERT INTO "remix_tag" VALUES(4457,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4457,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4457,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4457,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4457,'classical',1);
+INSERT INTO "remix_tag" VALUES(4457,'collab',1);
+INSERT INTO "remix_tag" VALUES(4457,'flute',1);
+INSERT INTO "remix_tag" VALUES(4457,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4457,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4457,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4457,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4457,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4457,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4457,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4458,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4458,'choir',1);
+INSERT INTO "remix_tag" VALUES(4458,'collab',1);
+INSERT INTO "remix_tag" VALUES(4458,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4458,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4458,'epic',1);
+INSERT INTO "remix_tag" VALUES(4458,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(4458,'metal',1);
+INSERT INTO "remix_tag" VALUES(4458,'organ',1);
+INSERT INTO "remix_tag" VALUES(4458,'piano',1);
+INSERT INTO "remix_tag" VALUES(4458,'rock',1);
+INSERT INTO "remix_tag" VALUES(4458,'rock-opera',1);
+INSERT INTO "remix_tag" VALUES(4458,'singing',1);
+INSERT INTO "remix_tag" VALUES(4458,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4458,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4459,'bells',1);
+INSERT INTO "remix_tag" VALUES(4459,'collab',1);
+INSERT INTO "remix_tag" VALUES(4459,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4459,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4459,'edm',1);
+INSERT INTO "remix_tag" VALUES(4459,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4459,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4459,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4459,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4459,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4459,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4459,'synth',1);
+INSERT INTO "remix_tag" VALUES(4459,'trap',1);
+INSERT INTO "remix_tag" VALUES(4460,'dance',1);
+INSERT INTO "remix_tag" VALUES(4460,'edm',1);
+INSERT INTO "remix_tag" VALUES(4460,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4460,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4460,'synth',1);
+INSERT INTO "remix_tag" VALUES(4460,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4460,'trance',1);
+INSERT INTO "remix_tag" VALUES(4461,'collab',1);
+INSERT INTO "remix_tag" VALUES(4461,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4461,'edm',1);
+INSERT INTO "remix_tag" VALUES(4461,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4461,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4461,'happy',1);
+INSERT INTO "remix_tag" VALUES(4461,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4461,'pop',1);
+INSERT INTO "remix_tag" VALUES(4461,'singing',1);
+INSERT INTO "remix_tag" VALUES(4461,'synth',1);
+INSERT INTO "remix_tag" VALUES(4461,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4462,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4462,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4462,'dark',1);
+INSERT INTO "remix_tag" VALUES(4462,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4462,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4462,'piano',1);
+INSERT INTO "remix_tag" VALUES(4462,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4462,'strings',1);
+INSERT INTO "remix_tag" VALUES(4462,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4462,'synth',1);
+INSERT INTO "remix_tag" VALUES(4462,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4463,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4463,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4463,'edm',1);
+INSERT INTO "remix_tag" VALUES(4463,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4463,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4463,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4463,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4463,'synth',1);
+INSERT INTO "remix_tag" VALUES(4464,'choir',1);
+INSERT INTO "remix_tag" VALUES(4464,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4464,'edm',1);
+INSERT INTO "remix_tag" VALUES(4464,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4464,'piano',1);
+INSERT INTO "remix_tag" VALUES(4464,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4464,'strings',1);
+INSERT INTO "remix_tag" VALUES(4464,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4464,'synth',1);
+INSERT INTO "remix_tag" VALUES(4464,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4465,'choir',1);
+INSERT INTO "remix_tag" VALUES(4465,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4465,'dark',1);
+INSERT INTO "remix_tag" VALUES(4465,'edm',1);
+INSERT INTO "remix_tag" VALUES(4465,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4465,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4465,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4465,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4465,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4465,'synth',1);
+INSERT INTO "remix_tag" VALUES(4466,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4466,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4466,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4466,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4466,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4466,'house',1);
+INSERT INTO "remix_tag" VALUES(4466,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4466,'piano',1);
+INSERT INTO "remix_tag" VALUES(4466,'pop',1);
+INSERT INTO "remix_tag" VALUES(4466,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4466,'synth',1);
+INSERT INTO "remix_tag" VALUES(4466,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4467,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4467,'dark',1);
+INSERT INTO "remix_tag" VALUES(4467,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4467,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4467,'synth',1);
+INSERT INTO "remix_tag" VALUES(4467,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4467,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4468,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4468,'choir',1);
+INSERT INTO "remix_tag" VALUES(4468,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4468,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4468,'classical',1);
+INSERT INTO "remix_tag" VALUES(4468,'flute',1);
+INSERT INTO "remix_tag" VALUES(4468,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4468,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4468,'strings',1);
+INSERT INTO "remix_tag" VALUES(4468,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4468,'violin',1);
+INSERT INTO "remix_tag" VALUES(4468,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4469,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4469,'brass',1);
+INSERT INTO "remix_tag" VALUES(4469,'classical',1);
+INSERT INTO "remix_tag" VALUES(4469,'collab',1);
+INSERT INTO "remix_tag" VALUES(4469,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4469,'harp',1);
+INSERT INTO "remix_tag" VALUES(4469,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4469,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4469,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4469,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4469,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4469,'strings',1);
+INSERT INTO "remix_tag" VALUES(4469,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4469,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4469,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4470,'brass',1);
+INSERT INTO "remix_tag" VALUES(4470,'classical',1);
+INSERT INTO "remix_tag" VALUES(4470,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4470,'happy',1);
+INSERT INTO "remix_tag" VALUES(4470,'march',1);
+INSERT INTO "remix_tag" VALUES(4470,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4470,'strings',1);
+INSERT INTO "remix_tag" VALUES(4470,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4470,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4471,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4471,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4471,'happy',1);
+INSERT INTO "remix_tag" VALUES(4471,'pop',1);
+INSERT INTO "remix_tag" VALUES(4471,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4471,'synth',1);
+INSERT INTO "remix_tag" VALUES(4471,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4471,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4472,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4472,'edm',1);
+INSERT INTO "remix_tag" VALUES(4472,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4472,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4472,'synth',1);
+INSERT INTO "remix_tag" VALUES(4472,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4473,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4473,'edm',1);
+INSERT INTO "remix_tag" VALUES(4473,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4473,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4473,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4473,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4473,'synth',1);
+INSERT INTO "remix_tag" VALUES(4473,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4473,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4474,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4474,'chill',1);
+INSERT INTO "remix_tag" VALUES(4474,'choir',1);
+INSERT INTO "remix_tag" VALUES(4474,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4474,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4474,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4474,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4474,'piano',1);
+INSERT INTO "remix_tag" VALUES(4474,'strings',1);
+INSERT INTO "remix_tag" VALUES(4474,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4474,'synth',1);
+INSERT INTO "remix_tag" VALUES(4475,'edm',1);
+INSERT INTO "remix_tag" VALUES(4475,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4475,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4475,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4475,'synth',1);
+INSERT INTO "remix_tag" VALUES(4475,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4475,'trance',1);
+INSERT INTO "remix_tag" VALUES(4476,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4476,'edm',1);
+INSERT INTO "remix_tag" VALUES(4476,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4476,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4476,'synth',1);
+INSERT INTO "remix_tag" VALUES(4476,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4476,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4476,'workout',1);
+INSERT INTO "remix_tag" VALUES(4477,'classical',1);
+INSERT INTO "remix_tag" VALUES(4477,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4477,'piano',1);
+INSERT INTO "remix_tag" VALUES(4477,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4477,'solo',1);
+INSERT INTO "remix_tag" VALUES(4477,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4477,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4478,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4478,'collab',1);
+INSERT INTO "remix_tag" VALUES(4478,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4478,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4478,'flute',1);
+INSERT INTO "remix_tag" VALUES(4478,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4478,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4478,'rock',1);
+INSERT INTO "remix_tag" VALUES(4478,'synth',1);
+INSERT INTO "remix_tag" VALUES(4478,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4479,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4479,'bells',1);
+INSERT INTO "remix_tag" VALUES(4479,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4479,'dark',1);
+INSERT INTO "remix_tag" VALUES(4479,'death-metal',1);
+INSERT INTO "remix_tag" VALUES(4479,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4479,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4479,'epic',1);
+INSERT INTO "remix_tag" VALUES(4479,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4479,'metal',1);
+INSERT INTO "remix_tag" VALUES(4479,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4479,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4479,'synth',1);
+INSERT INTO "remix_tag" VALUES(4480,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4480,'edm',1);
+INSERT INTO "remix_tag" VALUES(4480,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4480,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4480,'piano',1);
+INSERT INTO "remix_tag" VALUES(4480,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4480,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4480,'synth',1);
+INSERT INTO "remix_tag" VALUES(4480,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4480,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4481,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4481,'brass',1);
+INSERT INTO "remix_tag" VALUES(4481,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4481,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4481,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4481,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4481,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4481,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4481,'epic',1);
+INSERT INTO "remix_tag" VALUES(4481,'folk',1);
+INSERT INTO "remix_tag" VALUES(4481,'happy',1);
+INSERT INTO "remix_tag" VALUES(4481,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4481,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4481,'piano',1);
+INSERT INTO "remix_tag" VALUES(4481,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4481,'rock',1);
+INSERT INTO "remix_tag" VALUES(4481,'strings',1);
+INSERT INTO "remix_tag" VALUES(4481,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4482,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4482,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4482,'collab',1);
+INSERT INTO "remix_tag" VALUES(4482,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4482,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4482,'epic',1);
+INSERT INTO "remix_tag" VALUES(4482,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4482,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4482,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4482,'piano',1);
+INSERT INTO "remix_tag" VALUES(4482,'pop',1);
+INSERT INTO "remix_tag" VALUES(4482,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4483,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4483,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4483,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4483,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4483,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4483,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4483,'epic',1);
+INSERT INTO "remix_tag" VALUES(4483,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4483,'medley',1);
+INSERT INTO "remix_tag" VALUES(4483,'metal',1);
+INSERT INTO "remix_tag" VALUES(4483,'organ',1);
+INSERT INTO "remix_tag" VALUES(4483,'piano',1);
+INSERT INTO "remix_tag" VALUES(4483,'shakuhachi',1);
+INSERT INTO "remix_tag" VALUES(4483,'shamisen',1);
+INSERT INTO "remix_tag" VALUES(4483,'synth',1);
+INSERT INTO "remix_tag" VALUES(4483,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4483,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4483,'workout',1);
+INSERT INTO "remix_tag" VALUES(4484,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4484,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4484,'bossa-nova',1);
+INSERT INTO "remix_tag" VALUES(4484,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4484,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4484,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4484,'latin',1);
+INSERT INTO "remix_tag" VALUES(4484,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4484,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4484,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4484,'south-american',1);
+INSERT INTO "remix_tag" VALUES(4484,'violin',1);
+INSERT INTO "remix_tag" VALUES(4485,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4485,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4485,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4485,'collab',1);
+INSERT INTO "remix_tag" VALUES(4485,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4485,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4485,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4485,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4485,'epic',1);
+INSERT INTO "remix_tag" VALUES(4485,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4485,'flute',1);
+INSERT INTO "remix_tag" VALUES(4485,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4485,'latin',1);
+INSERT INTO "remix_tag" VALUES(4485,'medley',1);
+INSERT INTO "remix_tag" VALUES(4485,'metal',1);
+INSERT INTO "remix_tag" VALUES(4485,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4485,'rock',1);
+INSERT INTO "remix_tag" VALUES(4485,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4486,'collab',1);
+INSERT INTO "remix_tag" VALUES(4486,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4486,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4486,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4486,'funky',1);
+INSERT INTO "remix_tag" VALUES(4486,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4486,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4486,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4486,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4486,'melodica',1);
+INSERT INTO "remix_tag" VALUES(4486,'organ',1);
+INSERT INTO "remix_tag" VALUES(4486,'piano',1);
+INSERT INTO "remix_tag" VALUES(4486,'synth',1);
+INSERT INTO "remix_tag" VALUES(4486,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4487,'collab',1);
+INSERT INTO "remix_tag" VALUES(4487,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4487,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4487,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4487,'epic',1);
+INSERT INTO "remix_tag" VALUES(4487,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4487,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4487,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4487,'organ',1);
+INSERT INTO "remix_tag" VALUES(4487,'punk',1);
+INSERT INTO "remix_tag" VALUES(4487,'rock',1);
+INSERT INTO "remix_tag" VALUES(4487,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4487,'surf',1);
+INSERT INTO "remix_tag" VALUES(4487,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4488,'brass',1);
+INSERT INTO "remix_tag" VALUES(4488,'collab',1);
+INSERT INTO "remix_tag" VALUES(4488,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4488,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4488,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4488,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4488,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4488,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4488,'metal',1);
+INSERT INTO "remix_tag" VALUES(4488,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4488,'swing',1);
+INSERT INTO "remix_tag" VALUES(4489,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4489,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4489,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4489,'collab',1);
+INSERT INTO "remix_tag" VALUES(4489,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4489,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4489,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4489,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4489,'happy',1);
+INSERT INTO "remix_tag" VALUES(4489,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4489,'polka',1);
+INSERT INTO "remix_tag" VALUES(4489,'viola',1);
+INSERT INTO "remix_tag" VALUES(4489,'violin',1);
+INSERT INTO "remix_tag" VALUES(4490,'bells',1);
+INSERT INTO "remix_tag" VALUES(4490,'collab',1);
+INSERT INTO "remix_tag" VALUES(4490,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4490,'dark',1);
+INSERT INTO "remix_tag" VALUES(4490,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4490,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4490,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4490,'organ',1);
+INSERT INTO "remix_tag" VALUES(4490,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4490,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4490,'rock',1);
+INSERT INTO "remix_tag" VALUES(4490,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4490,'surf',1);
+INSERT INTO "remix_tag" VALUES(4490,'synth',1);
+INSERT INTO "remix_tag" VALUES(4490,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4490,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4490,'tuba',1);
+INSERT INTO "remix_tag" VALUES(4491,'brass',1);
+INSERT INTO "remix_tag" VALUES(4491,'collab',1);
+INSERT INTO "remix_tag" VALUES(4491,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4491,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4491,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4491,'flute',1);
+INSERT INTO "remix_tag" VALUES(4491,'funky',1);
+INSERT INTO "remix_tag" VALUES(4491,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4491,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4491,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4491,'medley',1);
+INSERT INTO "remix_tag" VALUES(4491,'organ',1);
+INSERT INTO "remix_tag" VALUES(4491,'piano',1);
+INSERT INTO "remix_tag" VALUES(4491,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4491,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4491,'synth',1);
+INSERT INTO "remix_tag" VALUES(4491,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4492,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4492,'brass',1);
+INSERT INTO "remix_tag" VALUES(4492,'chill',1);
+INSERT INTO "remix_tag" VALUES(4492,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4492,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4492,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4492,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4492,'piano',1);
+INSERT INTO "remix_tag" VALUES(4492,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4492,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4492,'singing',1);
+INSERT INTO "remix_tag" VALUES(4492,'strings',1);
+INSERT INTO "remix_tag" VALUES(4492,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4493,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4493,'collab',1);
+INSERT INTO "remix_tag" VALUES(4493,'dark',1);
+INSERT INTO "remix_tag" VALUES(4493,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4493,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4493,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4493,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4493,'metal',1);
+INSERT INTO "remix_tag" VALUES(4494,'classical',1);
+INSERT INTO "remix_tag" VALUES(4494,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4494,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4494,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4494,'piano',1);
+INSERT INTO "remix_tag" VALUES(4494,'solo',1);
+INSERT INTO "remix_tag" VALUES(4494,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4494,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4495,'brass',1);
+INSERT INTO "remix_tag" VALUES(4495,'collab',1);
+INSERT INTO "remix_tag" VALUES(4495,'flute',1);
+INSERT INTO "remix_tag" VALUES(4495,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4495,'happy',1);
+INSERT INTO "remix_tag" VALUES(4495,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4495,'march',1);
+INSERT INTO "remix_tag" VALUES(4495,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4495,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4495,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4496,'edm',1);
+INSERT INTO "remix_tag" VALUES(4496,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4496,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4496,'synth',1);
+INSERT INTO "remix_tag" VALUES(4496,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4496,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4497,'dark',1);
+INSERT INTO "remix_tag" VALUES(4497,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4497,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4497,'synth',1);
+INSERT INTO "remix_tag" VALUES(4497,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4497,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4498,'dark',1);
+INSERT INTO "remix_tag" VALUES(4498,'edm',1);
+INSERT INTO "remix_tag" VALUES(4498,'synth',1);
+INSERT INTO "remix_tag" VALUES(4498,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4498,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4498,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4498,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4498,'workout',1);
+INSERT INTO "remix_tag" VALUES(4499,'chill',1);
+INSERT INTO "remix_tag" VALUES(4499,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4499,'piano',1);
+INSERT INTO "remix_tag" VALUES(4499,'synth',1);
+INSERT INTO "remix_tag" VALUES(4499,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4500,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4500,'flute',1);
+INSERT INTO "remix_tag" VALUES(4500,'happy',1);
+INSERT INTO "remix_tag" VALUES(4500,'indian',1);
+INSERT INTO "remix_tag" VALUES(4500,'piano',1);
+INSERT INTO "remix_tag" VALUES(4500,'santur',1);
+INSERT INTO "remix_tag" VALUES(4500,'synth',1);
+INSERT INTO "remix_tag" VALUES(4500,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4501,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4501,'funk',1);
+INSERT INTO "remix_tag" VALUES(4501,'funky',1);
+INSERT INTO "remix_tag" VALUES(4501,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4501,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4501,'organ',1);
+INSERT INTO "remix_tag" VALUES(4501,'synth',1);
+INSERT INTO "remix_tag" VALUES(4501,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4501,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4501,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4502,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4502,'collab',1);
+INSERT INTO "remix_tag" VALUES(4502,'dark',1);
+INSERT INTO "remix_tag" VALUES(4502,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4502,'edm',1);
+INSERT INTO "remix_tag" VALUES(4502,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4502,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4502,'synth',1);
+INSERT INTO "remix_tag" VALUES(4502,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4503,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4503,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4503,'happy',1);
+INSERT INTO "remix_tag" VALUES(4503,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4503,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4504,'dark',1);
+INSERT INTO "remix_tag" VALUES(4504,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4504,'edm',1);
+INSERT INTO "remix_tag" VALUES(4504,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4504,'organ',1);
+INSERT INTO "remix_tag" VALUES(4504,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4504,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4504,'strings',1);
+INSERT INTO "remix_tag" VALUES(4504,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4504,'synth',1);
+INSERT INTO "remix_tag" VALUES(4504,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4505,'bossa-nova',1);
+INSERT INTO "remix_tag" VALUES(4505,'chill',1);
+INSERT INTO "remix_tag" VALUES(4505,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4505,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4505,'flute',1);
+INSERT INTO "remix_tag" VALUES(4505,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4505,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4505,'piano',1);
+INSERT INTO "remix_tag" VALUES(4505,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4506,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4506,'chill',1);
+INSERT INTO "remix_tag" VALUES(4506,'collab',1);
+INSERT INTO "remix_tag" VALUES(4506,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4506,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4506,'medley',1);
+INSERT INTO "remix_tag" VALUES(4506,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4506,'piano',1);
+INSERT INTO "remix_tag" VALUES(4506,'synth',1);
+INSERT INTO "remix_tag" VALUES(4506,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4507,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4507,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4507,'collab',1);
+INSERT INTO "remix_tag" VALUES(4507,'edm',1);
+INSERT INTO "remix_tag" VALUES(4507,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4507,'happy',1);
+INSERT INTO "remix_tag" VALUES(4507,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4507,'synth',1);
+INSERT INTO "remix_tag" VALUES(4507,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4508,'dance',1);
+INSERT INTO "remix_tag" VALUES(4508,'edm',1);
+INSERT INTO "remix_tag" VALUES(4508,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4508,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4508,'house',1);
+INSERT INTO "remix_tag" VALUES(4508,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4508,'piano',1);
+INSERT INTO "remix_tag" VALUES(4508,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4508,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4508,'synth',1);
+INSERT INTO "remix_tag" VALUES(4508,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4508,'workout',1);
+INSERT INTO "remix_tag" VALUES(4509,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4509,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4509,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4509,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4509,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4509,'jungle',1);
+INSERT INTO "remix_tag" VALUES(4509,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4509,'synth',1);
+INSERT INTO "remix_tag" VALUES(4509,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4510,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4510,'collab',1);
+INSERT INTO "remix_tag" VALUES(4510,'compo',1);
+INSERT INTO "remix_tag" VALUES(4510,'dance',1);
+INSERT INTO "remix_tag" VALUES(4510,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4510,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4510,'funky',1);
+INSERT INTO "remix_tag" VALUES(4510,'piano',1);
+INSERT INTO "remix_tag" VALUES(4510,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4510,'synth',1);
+INSERT INTO "remix_tag" VALUES(4510,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4511,'bells',1);
+INSERT INTO "remix_tag" VALUES(4511,'brass',1);
+INSERT INTO "remix_tag" VALUES(4511,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4511,'classical',1);
+INSERT INTO "remix_tag" VALUES(4511,'flute',1);
+INSERT INTO "remix_tag" VALUES(4511,'happy',1);
+INSERT INTO "remix_tag" VALUES(4511,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4511,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4511,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4511,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4511,'strings',1);
+INSERT INTO "remix_tag" VALUES(4511,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4511,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4511,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(4512,'cello',1);
+INSERT INTO "remix_tag" VALUES(4512,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4512,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4512,'collab',1);
+INSERT INTO "remix_tag" VALUES(4512,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4512,'epic',1);
+INSERT INTO "remix_tag" VALUES(4512,'flute',1);
+INSERT INTO "remix_tag" VALUES(4512,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4512,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4512,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(4512,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4512,'metal',1);
+INSERT INTO "remix_tag" VALUES(4512,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4512,'rock',1);
+INSERT INTO "remix_tag" VALUES(4512,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4512,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4512,'violin',1);
+INSERT INTO "remix_tag" VALUES(4512,'vocals-alto',1);
+INSERT INTO "remix_tag" VALUES(4512,'vocals-bass',1);
+INSERT INTO "remix_tag" VALUES(4512,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4512,'vocals-soprano',1);
+INSERT INTO "remix_tag" VALUES(4512,'vocals-tenor',1);
+INSERT INTO "remix_tag" VALUES(4513,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4513,'collab',1);
+INSERT INTO "remix_tag" VALUES(4513,'flute',1);
+INSERT INTO "remix_tag" VALUES(4513,'folk',1);
+INSERT INTO "remix_tag" VALUES(4513,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4513,'happy',1);
+INSERT INTO "remix_tag" VALUES(4513,'harp',1);
+INSERT INTO "remix_tag" VALUES(4513,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4513,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4513,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4513,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4513,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4514,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4514,'chill',1);
+INSERT INTO "remix_tag" VALUES(4514,'collab',1);
+INSERT INTO "remix_tag" VALUES(4514,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4514,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4514,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4514,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4514,'synth',1);
+INSERT INTO "remix_tag" VALUES(4514,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4515,'chill',1);
+INSERT INTO "remix_tag" VALUES(4515,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4515,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(4515,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4515,'funky',1);
+INSERT INTO "remix_tag" VALUES(4515,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4515,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4515,'synth',1);
+INSERT INTO "remix_tag" VALUES(4515,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4516,'brass',1);
+INSERT INTO "remix_tag" VALUES(4516,'choir',1);
+INSERT INTO "remix_tag" VALUES(4516,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4516,'dark',1);
+INSERT INTO "remix_tag" VALUES(4516,'epic',1);
+INSERT INTO "remix_tag" VALUES(4516,'lang-original',1);
+INSERT INTO "remix_tag" VALUES(4516,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4516,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4516,'piano',1);
+INSERT INTO "remix_tag" VALUES(4516,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4516,'strings',1);
+INSERT INTO "remix_tag" VALUES(4516,'synth',1);
+INSERT INTO "remix_tag" VALUES(4516,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4516,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4517,'collab',1);
+INSERT INTO "remix_tag" VALUES(4517,'dance',1);
+INSERT INTO "remix_tag" VALUES(4517,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4517,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4517,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4517,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4517,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4517,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4517,'singing',1);
+INSERT INTO "remix_tag" VALUES(4517,'synth',1);
+INSERT INTO "remix_tag" VALUES(4517,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4517,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4517,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4518,'collab',1);
+INSERT INTO "remix_tag" VALUES(4518,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4518,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4518,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4518,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4518,'piano',1);
+INSERT INTO "remix_tag" VALUES(4518,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4518,'swing',1);
+INSERT INTO "remix_tag" VALUES(4518,'tempo-fast',1);
+INSERT INTO "remix_tag" VALUES(4518,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4519,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4519,'dance',1);
+INSERT INTO "remix_tag" VALUES(4519,'dark',1);
+INSERT INTO "remix_tag" VALUES(4519,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4519,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4519,'synth',1);
+INSERT INTO "remix_tag" VALUES(4519,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4519,'trance',1);
+INSERT INTO "remix_tag" VALUES(4520,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4520,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4520,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4520,'edm',1);
+INSERT INTO "remix_tag" VALUES(4520,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4520,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4520,'epic',1);
+INSERT INTO "remix_tag" VALUES(4520,'lang-original',1);
+INSERT INTO "remix_tag" VALUES(4520,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4520,'medley',1);
+INSERT INTO "remix_tag" VALUES(4520,'strings',1);
+INSERT INTO "remix_tag" VALUES(4520,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4520,'synth',1);
+INSERT INTO "remix_tag" VALUES(4520,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4520,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4521,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4521,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4521,'collab',1);
+INSERT INTO "remix_tag" VALUES(4521,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4521,'epic',1);
+INSERT INTO "remix_tag" VALUES(4521,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(4521,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4521,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4521,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4521,'recorder',1);
+INSERT INTO "remix_tag" VALUES(4521,'singing',1);
+INSERT INTO "remix_tag" VALUES(4521,'spaghetti-western',1);
+INSERT INTO "remix_tag" VALUES(4521,'strings',1);
+INSERT INTO "remix_tag" VALUES(4521,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4521,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4521,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4521,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4521,'whistling',1);
+INSERT INTO "remix_tag" VALUES(4522,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4522,'collab',1);
+INSERT INTO "remix_tag" VALUES(4522,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4522,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4522,'lang-original',1);
+INSERT INTO "remix_tag" VALUES(4522,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4522,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4522,'singing',1);
+INSERT INTO "remix_tag" VALUES(4522,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4522,'synth',1);
+INSERT INTO "remix_tag" VALUES(4522,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4522,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4523,'collab',1);
+INSERT INTO "remix_tag" VALUES(4523,'dizi',1);
+INSERT INTO "remix_tag" VALUES(4523,'erhu',1);
+INSERT INTO "remix_tag" VALUES(4523,'folk',1);
+INSERT INTO "remix_tag" VALUES(4523,'guzheng',1);
+INSERT INTO "remix_tag" VALUES(4523,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4523,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4523,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4523,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4523,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4523,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4523,'synth',1);
+INSERT INTO "remix_tag" VALUES(4523,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4523,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4524,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4524,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4524,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4524,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4524,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4524,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4524,'synth',1);
+INSERT INTO "remix_tag" VALUES(4524,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4524,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4525,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4525,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4525,'funky',1);
+INSERT INTO "remix_tag" VALUES(4525,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4525,'happy',1);
+INSERT INTO "remix_tag" VALUES(4525,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4525,'piano',1);
+INSERT INTO "remix_tag" VALUES(4525,'rock',1);
+INSERT INTO "remix_tag" VALUES(4525,'synth',1);
+INSERT INTO "remix_tag" VALUES(4525,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4525,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4525,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4526,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4526,'dark',1);
+INSERT INTO "remix_tag" VALUES(4526,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4526,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4526,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4526,'metal',1);
+INSERT INTO "remix_tag" VALUES(4526,'rock',1);
+INSERT INTO "remix_tag" VALUES(4526,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4527,'dance',1);
+INSERT INTO "remix_tag" VALUES(4527,'dark',1);
+INSERT INTO "remix_tag" VALUES(4527,'edm',1);
+INSERT INTO "remix_tag" VALUES(4527,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4527,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4527,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4527,'synth',1);
+INSERT INTO "remix_tag" VALUES(4527,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4527,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4527,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4527,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(4528,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4528,'compo',1);
+INSERT INTO "remix_tag" VALUES(4528,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4528,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4528,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4528,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4528,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4528,'synth',1);
+INSERT INTO "remix_tag" VALUES(4528,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4529,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4529,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(4529,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4529,'collab',1);
+INSERT INTO "remix_tag" VALUES(4529,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4529,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4529,'piano',1);
+INSERT INTO "remix_tag" VALUES(4529,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4529,'synth',1);
+INSERT INTO "remix_tag" VALUES(4529,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4530,'bells',1);
+INSERT INTO "remix_tag" VALUES(4530,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4530,'epic',1);
+INSERT INTO "remix_tag" VALUES(4530,'harp',1);
+INSERT INTO "remix_tag" VALUES(4530,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4530,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4530,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4530,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4530,'piano',1);
+INSERT INTO "remix_tag" VALUES(4530,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4530,'strings',1);
+INSERT INTO "remix_tag" VALUES(4530,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4531,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4531,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4531,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4531,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4531,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4531,'epic',1);
+INSERT INTO "remix_tag" VALUES(4531,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4531,'medley',1);
+INSERT INTO "remix_tag" VALUES(4531,'rock',1);
+INSERT INTO "remix_tag" VALUES(4531,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4531,'synth',1);
+INSERT INTO "remix_tag" VALUES(4531,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4531,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4531,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4532,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4532,'collab',1);
+INSERT INTO "remix_tag" VALUES(4532,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4532,'medley',1);
+INSERT INTO "remix_tag" VALUES(4532,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4532,'piano',1);
+INSERT INTO "remix_tag" VALUES(4532,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4532,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4532,'synth',1);
+INSERT INTO "remix_tag" VALUES(4532,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4532,'violin',1);
+INSERT INTO "remix_tag" VALUES(4533,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4533,'collab',1);
+INSERT INTO "remix_tag" VALUES(4533,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4533,'flute',1);
+INSERT INTO "remix_tag" VALUES(4533,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4533,'medley',1);
+INSERT INTO "remix_tag" VALUES(4533,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4533,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4533,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4533,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4533,'violin',1);
+INSERT INTO "remix_tag" VALUES(4533,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4534,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4534,'chill',1);
+INSERT INTO "remix_tag" VALUES(4534,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4534,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4534,'medley',1);
+INSERT INTO "remix_tag" VALUES(4534,'synth',1);
+INSERT INTO "remix_tag" VALUES(4534,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4534,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4535,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4535,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4535,'chill',1);
+INSERT INTO "remix_tag" VALUES(4535,'dark',1);
+INSERT INTO "remix_tag" VALUES(4535,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4535,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4535,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4535,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4535,'synth',1);
+INSERT INTO "remix_tag" VALUES(4535,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4535,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4535,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4536,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(4536,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4536,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4536,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4536,'funky',1);
+INSERT INTO "remix_tag" VALUES(4536,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4536,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(4536,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4536,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4536,'synth',1);
+INSERT INTO "remix_tag" VALUES(4536,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4537,'dark',1);
+INSERT INTO "remix_tag" VALUES(4537,'piano',1);
+INSERT INTO "remix_tag" VALUES(4537,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4537,'solo',1);
+INSERT INTO "remix_tag" VALUES(4537,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4537,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4537,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4538,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4538,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4538,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4538,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4538,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4538,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4538,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4538,'metal',1);
+INSERT INTO "remix_tag" VALUES(4538,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4538,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4538,'synth',1);
+INSERT INTO "remix_tag" VALUES(4538,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4539,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4539,'bells',1);
+INSERT INTO "remix_tag" VALUES(4539,'cello',1);
+INSERT INTO "remix_tag" VALUES(4539,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4539,'collab',1);
+INSERT INTO "remix_tag" VALUES(4539,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4539,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4539,'flute',1);
+INSERT INTO "remix_tag" VALUES(4539,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4539,'rock',1);
+INSERT INTO "remix_tag" VALUES(4539,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4539,'strings',1);
+INSERT INTO "remix_tag" VALUES(4539,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4539,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4540,'dance',1);
+INSERT INTO "remix_tag" VALUES(4540,'edm',1);
+INSERT INTO "remix_tag" VALUES(4540,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4540,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4540,'synth',1);
+INSERT INTO "remix_tag" VALUES(4540,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4541,'compo',1);
+INSERT INTO "remix_tag" VALUES(4541,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4541,'dance',1);
+INSERT INTO "remix_tag" VALUES(4541,'dark',1);
+INSERT INTO "remix_tag" VALUES(4541,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4541,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4541,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4541,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4541,'synth',1);
+INSERT INTO "remix_tag" VALUES(4541,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4541,'workout',1);
+INSERT INTO "remix_tag" VALUES(4542,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4542,'classical',1);
+INSERT INTO "remix_tag" VALUES(4542,'collab',1);
+INSERT INTO "remix_tag" VALUES(4542,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4542,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4542,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4542,'solo',1);
+INSERT INTO "remix_tag" VALUES(4542,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4542,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4542,'viola',1);
+INSERT INTO "remix_tag" VALUES(4543,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4543,'angry',1);
+INSERT INTO "remix_tag" VALUES(4543,'choir',1);
+INSERT INTO "remix_tag" VALUES(4543,'collab',1);
+INSERT INTO "remix_tag" VALUES(4543,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4543,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4543,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4543,'epic',1);
+INSERT INTO "remix_tag" VALUES(4543,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4543,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4543,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4543,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4543,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4543,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4543,'rock-opera',1);
+INSERT INTO "remix_tag" VALUES(4543,'screaming',1);
+INSERT INTO "remix_tag" VALUES(4543,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4543,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4543,'synth',1);
+INSERT INTO "remix_tag" VALUES(4543,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4543,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4543,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4544,'chill',1);
+INSERT INTO "remix_tag" VALUES(4544,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4544,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4544,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4544,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4544,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4544,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4544,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4544,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4545,'dance',1);
+INSERT INTO "remix_tag" VALUES(4545,'dark',1);
+INSERT INTO "remix_tag" VALUES(4545,'edm',1);
+INSERT INTO "remix_tag" VALUES(4545,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4545,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4545,'synth',1);
+INSERT INTO "remix_tag" VALUES(4545,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4546,'collab',1);
+INSERT INTO "remix_tag" VALUES(4546,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4546,'flute',1);
+INSERT INTO "remix_tag" VALUES(4546,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4546,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4546,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4546,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4546,'piano',1);
+INSERT INTO "remix_tag" VALUES(4546,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4546,'sitar',1);
+INSERT INTO "remix_tag" VALUES(4546,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4546,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4546,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4546,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4546,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4546,'turntable',1);
+INSERT INTO "remix_tag" VALUES(4546,'violin',1);
+INSERT INTO "remix_tag" VALUES(4546,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4547,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4547,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4547,'angry',1);
+INSERT INTO "remix_tag" VALUES(4547,'brass',1);
+INSERT INTO "remix_tag" VALUES(4547,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4547,'dark',1);
+INSERT INTO "remix_tag" VALUES(4547,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4547,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4547,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4547,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4547,'metal',1);
+INSERT INTO "remix_tag" VALUES(4547,'screaming',1);
+INSERT INTO "remix_tag" VALUES(4547,'singing',1);
+INSERT INTO "remix_tag" VALUES(4547,'strings',1);
+INSERT INTO "remix_tag" VALUES(4547,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4547,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4548,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4548,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4548,'classical',1);
+INSERT INTO "remix_tag" VALUES(4548,'collab',1);
+INSERT INTO "remix_tag" VALUES(4548,'folk',1);
+INSERT INTO "remix_tag" VALUES(4548,'happy',1);
+INSERT INTO "remix_tag" VALUES(4548,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4548,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4548,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4548,'piano',1);
+INSERT INTO "remix_tag" VALUES(4548,'sad',1);
+INSERT INTO "remix_tag" VALUES(4548,'singing',1);
+INSERT INTO "remix_tag" VALUES(4548,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4548,'violin',1);
+INSERT INTO "remix_tag" VALUES(4548,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4548,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4549,'collab',1);
+INSERT INTO "remix_tag" VALUES(4549,'dark',1);
+INSERT INTO "remix_tag" VALUES(4549,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4549,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4549,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4549,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4549,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4549,'singing',1);
+INSERT INTO "remix_tag" VALUES(4549,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4549,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4549,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4549,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4550,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4550,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4550,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4550,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4550,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4550,'flute',1);
+INSERT INTO "remix_tag" VALUES(4550,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4550,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4550,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4550,'strings',1);
+INSERT INTO "remix_tag" VALUES(4550,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4550,'synth',1);
+INSERT INTO "remix_tag" VALUES(4550,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4551,'dance',1);
+INSERT INTO "remix_tag" VALUES(4551,'edm',1);
+INSERT INTO "remix_tag" VALUES(4551,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4551,'happy',1);
+INSERT INTO "remix_tag" VALUES(4551,'piano',1);
+INSERT INTO "remix_tag" VALUES(4551,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4551,'synth',1);
+INSERT INTO "remix_tag" VALUES(4551,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4552,'edm',1);
+INSERT INTO "remix_tag" VALUES(4552,'electro',1);
+INSERT INTO "remix_tag" VALUES(4552,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4552,'funky',1);
+INSERT INTO "remix_tag" VALUES(4552,'happy',1);
+INSERT INTO "remix_tag" VALUES(4552,'synth',1);
+INSERT INTO "remix_tag" VALUES(4552,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4552,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4553,'collab',1);
+INSERT INTO "remix_tag" VALUES(4553,'compo',1);
+INSERT INTO "remix_tag" VALUES(4553,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4553,'happy',1);
+INSERT INTO "remix_tag" VALUES(4553,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4553,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4553,'lang-french',1);
+INSERT INTO "remix_tag" VALUES(4553,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4553,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4553,'piano',1);
+INSERT INTO "remix_tag" VALUES(4553,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4553,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4554,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4554,'brass',1);
+INSERT INTO "remix_tag" VALUES(4554,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4554,'collab',1);
+INSERT INTO "remix_tag" VALUES(4554,'dark',1);
+INSERT INTO "remix_tag" VALUES(4554,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4554,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4554,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4554,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4554,'strings',1);
+INSERT INTO "remix_tag" VALUES(4554,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4554,'synth',1);
+INSERT INTO "remix_tag" VALUES(4554,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4554,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4555,'chill',1);
+INSERT INTO "remix_tag" VALUES(4555,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4555,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4555,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4555,'synth',1);
+INSERT INTO "remix_tag" VALUES(4555,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4555,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4556,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4556,'cello',1);
+INSERT INTO "remix_tag" VALUES(4556,'choir',1);
+INSERT INTO "remix_tag" VALUES(4556,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4556,'dark',1);
+INSERT INTO "remix_tag" VALUES(4556,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4556,'piano',1);
+INSERT INTO "remix_tag" VALUES(4556,'strings',1);
+INSERT INTO "remix_tag" VALUES(4556,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4556,'synth',1);
+INSERT INTO "remix_tag" VALUES(4556,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4556,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4556,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4556,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4557,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4557,'classical',1);
+INSERT INTO "remix_tag" VALUES(4557,'flute',1);
+INSERT INTO "remix_tag" VALUES(4557,'harp',1);
+INSERT INTO "remix_tag" VALUES(4557,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4557,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4557,'strings',1);
+INSERT INTO "remix_tag" VALUES(4557,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4557,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4557,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4558,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4558,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4558,'bells',1);
+INSERT INTO "remix_tag" VALUES(4558,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4558,'flute',1);
+INSERT INTO "remix_tag" VALUES(4558,'happy',1);
+INSERT INTO "remix_tag" VALUES(4558,'piano',1);
+INSERT INTO "remix_tag" VALUES(4558,'pop',1);
+INSERT INTO "remix_tag" VALUES(4558,'strings',1);
+INSERT INTO "remix_tag" VALUES(4558,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4558,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4559,'collab',1);
+INSERT INTO "remix_tag" VALUES(4559,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4559,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4559,'happy',1);
+INSERT INTO "remix_tag" VALUES(4559,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4559,'rock',1);
+INSERT INTO "remix_tag" VALUES(4559,'synth',1);
+INSERT INTO "remix_tag" VALUES(4559,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4560,'chill',1);
+INSERT INTO "remix_tag" VALUES(4560,'collab',1);
+INSERT INTO "remix_tag" VALUES(4560,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4560,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4560,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4560,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4560,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4560,'organ',1);
+INSERT INTO "remix_tag" VALUES(4560,'piano',1);
+INSERT INTO "remix_tag" VALUES(4560,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4560,'swing',1);
+INSERT INTO "remix_tag" VALUES(4560,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4560,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4560,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4561,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4561,'chill',1);
+INSERT INTO "remix_tag" VALUES(4561,'flute',1);
+INSERT INTO "remix_tag" VALUES(4561,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4561,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4561,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4561,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4561,'piano',1);
+INSERT INTO "remix_tag" VALUES(4561,'strings',1);
+INSERT INTO "remix_tag" VALUES(4561,'synth',1);
+INSERT INTO "remix_tag" VALUES(4562,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4562,'chill',1);
+INSERT INTO "remix_tag" VALUES(4562,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4562,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4562,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4562,'piano',1);
+INSERT INTO "remix_tag" VALUES(4562,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4562,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4562,'synth',1);
+INSERT INTO "remix_tag" VALUES(4562,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4562,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4563,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4563,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4563,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4563,'edm',1);
+INSERT INTO "remix_tag" VALUES(4563,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4563,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4563,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4563,'synth',1);
+INSERT INTO "remix_tag" VALUES(4564,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4564,'angry',1);
+INSERT INTO "remix_tag" VALUES(4564,'collab',1);
+INSERT INTO "remix_tag" VALUES(4564,'edm',1);
+INSERT INTO "remix_tag" VALUES(4564,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4564,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4564,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4564,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4564,'medley',1);
+INSERT INTO "remix_tag" VALUES(4564,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4564,'synth',1);
+INSERT INTO "remix_tag" VALUES(4564,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4564,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4564,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4565,'collab',1);
+INSERT INTO "remix_tag" VALUES(4565,'edm',1);
+INSERT INTO "remix_tag" VALUES(4565,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4565,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4565,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4565,'synth',1);
+INSERT INTO "remix_tag" VALUES(4565,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4565,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4566,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4566,'dance',1);
+INSERT INTO "remix_tag" VALUES(4566,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4566,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4566,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4566,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4566,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4566,'synth',1);
+INSERT INTO "remix_tag" VALUES(4566,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4567,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4567,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4567,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4567,'sad',1);
+INSERT INTO "remix_tag" VALUES(4567,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4567,'synth',1);
+INSERT INTO "remix_tag" VALUES(4567,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4567,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4568,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4568,'collab',1);
+INSERT INTO "remix_tag" VALUES(4568,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4568,'edm',1);
+INSERT INTO "remix_tag" VALUES(4568,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4568,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4568,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4568,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4568,'synth',1);
+INSERT INTO "remix_tag" VALUES(4569,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4569,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4569,'collab',1);
+INSERT INTO "remix_tag" VALUES(4569,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4569,'epic',1);
+INSERT INTO "remix_tag" VALUES(4569,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4569,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4569,'synth',1);
+INSERT INTO "remix_tag" VALUES(4569,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4569,'violin',1);
+INSERT INTO "remix_tag" VALUES(4570,'chill',1);
+INSERT INTO "remix_tag" VALUES(4570,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4570,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4570,'happy',1);
+INSERT INTO "remix_tag" VALUES(4570,'harp',1);
+INSERT INTO "remix_tag" VALUES(4570,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4570,'synth',1);
+INSERT INTO "remix_tag" VALUES(4570,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4571,'collab',1);
+INSERT INTO "remix_tag" VALUES(4571,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4571,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4571,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4571,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4571,'funky',1);
+INSERT INTO "remix_tag" VALUES(4571,'punk',1);
+INSERT INTO "remix_tag" VALUES(4571,'synth',1);
+INSERT INTO "remix_tag" VALUES(4571,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4572,'bells',1);
+INSERT INTO "remix_tag" VALUES(4572,'collab',1);
+INSERT INTO "remix_tag" VALUES(4572,'flute',1);
+INSERT INTO "remix_tag" VALUES(4572,'happy',1);
+INSERT INTO "remix_tag" VALUES(4572,'harp',1);
+INSERT INTO "remix_tag" VALUES(4572,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4572,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4572,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4572,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4572,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4572,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4572,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4572,'strings',1);
+INSERT INTO "remix_tag" VALUES(4572,'symphonic',1);
+INSERT INTO "remix_tag" VALUES(4573,'bells',1);
+INSERT INTO "remix_tag" VALUES(4573,'collab',1);
+INSERT INTO "remix_tag" VALUES(4573,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(4573,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4573,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4573,'epic',1);
+INSERT INTO "remix_tag" VALUES(4573,'flute',1);
+INSERT INTO "remix_tag" VALUES(4573,'folk',1);
+INSERT INTO "remix_tag" VALUES(4573,'harp',1);
+INSERT INTO "remix_tag" VALUES(4573,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4573,'recorder',1);
+INSERT INTO "remix_tag" VALUES(4573,'rock',1);
+INSERT INTO "remix_tag" VALUES(4573,'violin',1);
+INSERT INTO "remix_tag" VALUES(4573,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4573,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4573,'vocals-soprano',1);
+INSERT INTO "remix_tag" VALUES(4574,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4574,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4574,'funky',1);
+INSERT INTO "remix_tag" VALUES(4574,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4574,'indian',1);
+INSERT INTO "remix_tag" VALUES(4574,'medley',1);
+INSERT INTO "remix_tag" VALUES(4574,'rock',1);
+INSERT INTO "remix_tag" VALUES(4574,'synth',1);
+INSERT INTO "remix_tag" VALUES(4574,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4574,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4574,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4575,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4575,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4575,'dark',1);
+INSERT INTO "remix_tag" VALUES(4575,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4575,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4575,'synth',1);
+INSERT INTO "remix_tag" VALUES(4575,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4576,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4576,'choir',1);
+INSERT INTO "remix_tag" VALUES(4576,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4576,'epic',1);
+INSERT INTO "remix_tag" VALUES(4576,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4576,'piano',1);
+INSERT INTO "remix_tag" VALUES(4576,'sad',1);
+INSERT INTO "remix_tag" VALUES(4576,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4576,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4577,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4577,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4577,'dark',1);
+INSERT INTO "remix_tag" VALUES(4577,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4577,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4577,'synth',1);
+INSERT INTO "remix_tag" VALUES(4577,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4577,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4578,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4578,'dark',1);
+INSERT INTO "remix_tag" VALUES(4578,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4578,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4578,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4578,'harp',1);
+INSERT INTO "remix_tag" VALUES(4578,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4578,'piano',1);
+INSERT INTO "remix_tag" VALUES(4578,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4578,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4578,'synth',1);
+INSERT INTO "remix_tag" VALUES(4578,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4578,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4579,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4579,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4579,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4579,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4579,'happy',1);
+INSERT INTO "remix_tag" VALUES(4579,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4579,'strings',1);
+INSERT INTO "remix_tag" VALUES(4579,'synth',1);
+INSERT INTO "remix_tag" VALUES(4579,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4580,'collab',1);
+INSERT INTO "remix_tag" VALUES(4580,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4580,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4580,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4580,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4580,'rock',1);
+INSERT INTO "remix_tag" VALUES(4580,'synth',1);
+INSERT INTO "remix_tag" VALUES(4580,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4581,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4581,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4581,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4581,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4581,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4581,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4581,'synth',1);
+INSERT INTO "remix_tag" VALUES(4581,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4582,'dark',1);
+INSERT INTO "remix_tag" VALUES(4582,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4582,'synth',1);
+INSERT INTO "remix_tag" VALUES(4582,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4582,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4583,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4583,'collab',1);
+INSERT INTO "remix_tag" VALUES(4583,'medley',1);
+INSERT INTO "remix_tag" VALUES(4583,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4583,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4583,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4583,'strings',1);
+INSERT INTO "remix_tag" VALUES(4583,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4583,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4584,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4584,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4584,'dark',1);
+INSERT INTO "remix_tag" VALUES(4584,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4584,'piano',1);
+INSERT INTO "remix_tag" VALUES(4584,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4584,'synth',1);
+INSERT INTO "remix_tag" VALUES(4584,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4584,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4585,'brass',1);
+INSERT INTO "remix_tag" VALUES(4585,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4585,'epic',1);
+INSERT INTO "remix_tag" VALUES(4585,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4585,'happy',1);
+INSERT INTO "remix_tag" VALUES(4585,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4585,'piano',1);
+INSERT INTO "remix_tag" VALUES(4585,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4585,'strings',1);
+INSERT INTO "remix_tag" VALUES(4585,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4586,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4586,'dark',1);
+INSERT INTO "remix_tag" VALUES(4586,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4586,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4586,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4586,'metal',1);
+INSERT INTO "remix_tag" VALUES(4586,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4586,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4587,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4587,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4587,'chill',1);
+INSERT INTO "remix_tag" VALUES(4587,'collab',1);
+INSERT INTO "remix_tag" VALUES(4587,'synth',1);
+INSERT INTO "remix_tag" VALUES(4587,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4587,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4587,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4588,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4588,'chill',1);
+INSERT INTO "remix_tag" VALUES(4588,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4588,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4588,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4588,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4588,'piano',1);
+INSERT INTO "remix_tag" VALUES(4588,'synth',1);
+INSERT INTO "remix_tag" VALUES(4588,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4589,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4589,'cello',1);
+INSERT INTO "remix_tag" VALUES(4589,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4589,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4589,'collab',1);
+INSERT INTO "remix_tag" VALUES(4589,'compo',1);
+INSERT INTO "remix_tag" VALUES(4589,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4589,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4589,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4589,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4589,'sad',1);
+INSERT INTO "remix_tag" VALUES(4589,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4589,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4589,'violin',1);
+INSERT INTO "remix_tag" VALUES(4590,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4590,'dark',1);
+INSERT INTO "remix_tag" VALUES(4590,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4590,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4590,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4590,'metal',1);
+INSERT INTO "remix_tag" VALUES(4590,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4590,'synth',1);
+INSERT INTO "remix_tag" VALUES(4590,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4591,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4591,'compo',1);
+INSERT INTO "remix_tag" VALUES(4591,'dark',1);
+INSERT INTO "remix_tag" VALUES(4591,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4591,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4591,'metal',1);
+INSERT INTO "remix_tag" VALUES(4591,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4591,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4592,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4592,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4592,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4592,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4592,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4592,'synth',1);
+INSERT INTO "remix_tag" VALUES(4592,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4593,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4593,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4593,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4593,'piano',1);
+INSERT INTO "remix_tag" VALUES(4593,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4593,'rock',1);
+INSERT INTO "remix_tag" VALUES(4593,'strings',1);
+INSERT INTO "remix_tag" VALUES(4593,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4593,'synth',1);
+INSERT INTO "remix_tag" VALUES(4593,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4593,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4594,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4594,'collab',1);
+INSERT INTO "remix_tag" VALUES(4594,'flute',1);
+INSERT INTO "remix_tag" VALUES(4594,'happy',1);
+INSERT INTO "remix_tag" VALUES(4594,'medley',1);
+INSERT INTO "remix_tag" VALUES(4594,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4594,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4594,'strings',1);
+INSERT INTO "remix_tag" VALUES(4594,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4595,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4595,'collab',1);
+INSERT INTO "remix_tag" VALUES(4595,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4595,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4595,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4595,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4595,'medley',1);
+INSERT INTO "remix_tag" VALUES(4595,'piano',1);
+INSERT INTO "remix_tag" VALUES(4595,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4595,'synth',1);
+INSERT INTO "remix_tag" VALUES(4595,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4596,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4596,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4596,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4596,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4596,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4596,'synth',1);
+INSERT INTO "remix_tag" VALUES(4596,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4596,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4596,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4597,'dance',1);
+INSERT INTO "remix_tag" VALUES(4597,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4597,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4597,'flute',1);
+INSERT INTO "remix_tag" VALUES(4597,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4597,'happy',1);
+INSERT INTO "remix_tag" VALUES(4597,'house',1);
+INSERT INTO "remix_tag" VALUES(4597,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4597,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4597,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4597,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(4597,'synth',1);
+INSERT INTO "remix_tag" VALUES(4597,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4598,'brass',1);
+INSERT INTO "remix_tag" VALUES(4598,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4598,'collab',1);
+INSERT INTO "remix_tag" VALUES(4598,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4598,'epic',1);
+INSERT INTO "remix_tag" VALUES(4598,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4598,'metal',1);
+INSERT INTO "remix_tag" VALUES(4598,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4598,'strings',1);
+INSERT INTO "remix_tag" VALUES(4598,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4598,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4599,'dance',1);
+INSERT INTO "remix_tag" VALUES(4599,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4599,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4599,'piano',1);
+INSERT INTO "remix_tag" VALUES(4599,'synth',1);
+INSERT INTO "remix_tag" VALUES(4599,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4599,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4600,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4600,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4600,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4600,'funky',1);
+INSERT INTO "remix_tag" VALUES(4600,'rock',1);
+INSERT INTO "remix_tag" VALUES(4600,'synth',1);
+INSERT INTO "remix_tag" VALUES(4600,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4601,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4601,'brass',1);
+INSERT INTO "remix_tag" VALUES(4601,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4601,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4601,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4601,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4601,'rock',1);
+INSERT INTO "remix_tag" VALUES(4601,'strings',1);
+INSERT INTO "remix_tag" VALUES(4601,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4601,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4602,'chill',1);
+INSERT INTO "remix_tag" VALUES(4602,'collab',1);
+INSERT INTO "remix_tag" VALUES(4602,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4602,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4602,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4602,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4602,'funky',1);
+INSERT INTO "remix_tag" VALUES(4602,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4602,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4602,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4602,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4602,'piano',1);
+INSERT INTO "remix_tag" VALUES(4602,'rock',1);
+INSERT INTO "remix_tag" VALUES(4602,'strings',1);
+INSERT INTO "remix_tag" VALUES(4602,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4602,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4602,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4603,'collab',1);
+INSERT INTO "remix_tag" VALUES(4603,'dark',1);
+INSERT INTO "remix_tag" VALUES(4603,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4603,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4603,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4603,'metal',1);
+INSERT INTO "remix_tag" VALUES(4603,'piano',1);
+INSERT INTO "remix_tag" VALUES(4603,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4603,'synth',1);
+INSERT INTO "remix_tag" VALUES(4603,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4603,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4604,'compo',1);
+INSERT INTO "remix_tag" VALUES(4604,'edm',1);
+INSERT INTO "remix_tag" VALUES(4604,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4604,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4604,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4604,'synth',1);
+INSERT INTO "remix_tag" VALUES(4604,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4605,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4605,'dark',1);
+INSERT INTO "remix_tag" VALUES(4605,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4605,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4605,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4605,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4605,'metal',1);
+INSERT INTO "remix_tag" VALUES(4605,'synth',1);
+INSERT INTO "remix_tag" VALUES(4605,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4606,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4606,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4606,'collab',1);
+INSERT INTO "remix_tag" VALUES(4606,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4606,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4606,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4606,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4606,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4606,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4606,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4606,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4607,'dance',1);
+INSERT INTO "remix_tag" VALUES(4607,'edm',1);
+INSERT INTO "remix_tag" VALUES(4607,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4607,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4607,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4607,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4607,'synth',1);
+INSERT INTO "remix_tag" VALUES(4607,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4608,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4608,'dark',1);
+INSERT INTO "remix_tag" VALUES(4608,'harp',1);
+INSERT INTO "remix_tag" VALUES(4608,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4608,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4608,'strings',1);
+INSERT INTO "remix_tag" VALUES(4608,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4608,'synth',1);
+INSERT INTO "remix_tag" VALUES(4608,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4608,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4609,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4609,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4609,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4609,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4609,'strings',1);
+INSERT INTO "remix_tag" VALUES(4609,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4609,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4610,'chill',1);
+INSERT INTO "remix_tag" VALUES(4610,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4610,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4610,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4610,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4610,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4610,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4611,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4611,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4611,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4611,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4611,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4611,'strings',1);
+INSERT INTO "remix_tag" VALUES(4611,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4611,'synth',1);
+INSERT INTO "remix_tag" VALUES(4611,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4612,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4612,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4612,'collab',1);
+INSERT INTO "remix_tag" VALUES(4612,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4612,'epic',1);
+INSERT INTO "remix_tag" VALUES(4612,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4612,'piano',1);
+INSERT INTO "remix_tag" VALUES(4612,'strings',1);
+INSERT INTO "remix_tag" VALUES(4612,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4612,'violin',1);
+INSERT INTO "remix_tag" VALUES(4613,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4613,'collab',1);
+INSERT INTO "remix_tag" VALUES(4613,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4613,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4613,'piano',1);
+INSERT INTO "remix_tag" VALUES(4613,'rock',1);
+INSERT INTO "remix_tag" VALUES(4613,'strings',1);
+INSERT INTO "remix_tag" VALUES(4613,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4613,'theremin',1);
+INSERT INTO "remix_tag" VALUES(4613,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4614,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4614,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4614,'piano',1);
+INSERT INTO "remix_tag" VALUES(4614,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4614,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4615,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4615,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4615,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4615,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4615,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4615,'metal',1);
+INSERT INTO "remix_tag" VALUES(4615,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4615,'rock',1);
+INSERT INTO "remix_tag" VALUES(4615,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4615,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4615,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4616,'dance',1);
+INSERT INTO "remix_tag" VALUES(4616,'edm',1);
+INSERT INTO "remix_tag" VALUES(4616,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4616,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4616,'synth',1);
+INSERT INTO "remix_tag" VALUES(4616,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4617,'dark',1);
+INSERT INTO "remix_tag" VALUES(4617,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4617,'edm',1);
+INSERT INTO "remix_tag" VALUES(4617,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4617,'oud',1);
+INSERT INTO "remix_tag" VALUES(4617,'santur',1);
+INSERT INTO "remix_tag" VALUES(4617,'sitar',1);
+INSERT INTO "remix_tag" VALUES(4617,'synth',1);
+INSERT INTO "remix_tag" VALUES(4617,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4618,'brass',1);
+INSERT INTO "remix_tag" VALUES(4618,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4618,'epic',1);
+INSERT INTO "remix_tag" VALUES(4618,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4618,'piano',1);
+INSERT INTO "remix_tag" VALUES(4618,'strings',1);
+INSERT INTO "remix_tag" VALUES(4618,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4618,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4619,'bluegrass',1);
+INSERT INTO "remix_tag" VALUES(4619,'collab',1);
+INSERT INTO "remix_tag" VALUES(4619,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4619,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4619,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4619,'folk',1);
+INSERT INTO "remix_tag" VALUES(4619,'happy',1);
+INSERT INTO "remix_tag" VALUES(4619,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4619,'melodica',1);
+INSERT INTO "remix_tag" VALUES(4619,'piano',1);
+INSERT INTO "remix_tag" VALUES(4619,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4619,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4619,'violin',1);
+INSERT INTO "remix_tag" VALUES(4619,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4620,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4620,'collab',1);
+INSERT INTO "remix_tag" VALUES(4620,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4620,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4620,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4620,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4620,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4620,'metal',1);
+INSERT INTO "remix_tag" VALUES(4620,'rock',1);
+INSERT INTO "remix_tag" VALUES(4620,'synth',1);
+INSERT INTO "remix_tag" VALUES(4620,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4621,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4621,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4621,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4621,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4621,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4621,'synth',1);
+INSERT INTO "remix_tag" VALUES(4621,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4621,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4621,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4622,'bells',1);
+INSERT INTO "remix_tag" VALUES(4622,'choir',1);
+INSERT INTO "remix_tag" VALUES(4622,'flute',1);
+INSERT INTO "remix_tag" VALUES(4622,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4622,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4622,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4622,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4622,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4622,'strings',1);
+INSERT INTO "remix_tag" VALUES(4622,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4623,'edm',1);
+INSERT INTO "remix_tag" VALUES(4623,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4623,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4623,'synth',1);
+INSERT INTO "remix_tag" VALUES(4623,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4623,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4624,'brass',1);
+INSERT INTO "remix_tag" VALUES(4624,'choir',1);
+INSERT INTO "remix_tag" VALUES(4624,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4624,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4624,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4624,'epic',1);
+INSERT INTO "remix_tag" VALUES(4624,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4624,'medley',1);
+INSERT INTO "remix_tag" VALUES(4624,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4624,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4624,'synth',1);
+INSERT INTO "remix_tag" VALUES(4624,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4624,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4625,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4625,'dubstep',1);
+INSERT INTO "remix_tag" VALUES(4625,'edm',1);
+INSERT INTO "remix_tag" VALUES(4625,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4625,'strings',1);
+INSERT INTO "remix_tag" VALUES(4625,'synth',1);
+INSERT INTO "remix_tag" VALUES(4625,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4626,'edm',1);
+INSERT INTO "remix_tag" VALUES(4626,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4626,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4626,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4626,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4626,'synth',1);
+INSERT INTO "remix_tag" VALUES(4626,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4626,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4627,'cello',1);
+INSERT INTO "remix_tag" VALUES(4627,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4627,'collab',1);
+INSERT INTO "remix_tag" VALUES(4627,'harp',1);
+INSERT INTO "remix_tag" VALUES(4627,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4627,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4627,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4627,'piano',1);
+INSERT INTO "remix_tag" VALUES(4627,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4627,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4628,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4628,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4628,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4628,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4628,'rock',1);
+INSERT INTO "remix_tag" VALUES(4628,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4628,'synth',1);
+INSERT INTO "remix_tag" VALUES(4628,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4629,'collab',1);
+INSERT INTO "remix_tag" VALUES(4629,'edm',1);
+INSERT INTO "remix_tag" VALUES(4629,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4629,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4629,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4629,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4629,'synth',1);
+INSERT INTO "remix_tag" VALUES(4629,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4630,'brass',1);
+INSERT INTO "remix_tag" VALUES(4630,'collab',1);
+INSERT INTO "remix_tag" VALUES(4630,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4630,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4630,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4630,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4630,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4630,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4630,'piano',1);
+INSERT INTO "remix_tag" VALUES(4630,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4630,'strings',1);
+INSERT INTO "remix_tag" VALUES(4630,'synth',1);
+INSERT INTO "remix_tag" VALUES(4630,'violin',1);
+INSERT INTO "remix_tag" VALUES(4631,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4631,'dark',1);
+INSERT INTO "remix_tag" VALUES(4631,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4631,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4631,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4631,'strings',1);
+INSERT INTO "remix_tag" VALUES(4631,'synth',1);
+INSERT INTO "remix_tag" VALUES(4632,'collab',1);
+INSERT INTO "remix_tag" VALUES(4632,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4632,'disco',1);
+INSERT INTO "remix_tag" VALUES(4632,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4632,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4632,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4632,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4632,'organ',1);
+INSERT INTO "remix_tag" VALUES(4632,'piano',1);
+INSERT INTO "remix_tag" VALUES(4632,'pop',1);
+INSERT INTO "remix_tag" VALUES(4632,'rock',1);
+INSERT INTO "remix_tag" VALUES(4632,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4632,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4632,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4633,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4633,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4633,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4633,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4633,'rock',1);
+INSERT INTO "remix_tag" VALUES(4633,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4633,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4633,'synth',1);
+INSERT INTO "remix_tag" VALUES(4633,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4634,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4634,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4634,'dark',1);
+INSERT INTO "remix_tag" VALUES(4634,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4634,'medley',1);
+INSERT INTO "remix_tag" VALUES(4634,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4634,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4634,'strings',1);
+INSERT INTO "remix_tag" VALUES(4634,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4634,'synth',1);
+INSERT INTO "remix_tag" VALUES(4635,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4635,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4635,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4635,'metal',1);
+INSERT INTO "remix_tag" VALUES(4635,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4636,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4636,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4636,'collab',1);
+INSERT INTO "remix_tag" VALUES(4636,'flute',1);
+INSERT INTO "remix_tag" VALUES(4636,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4636,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4636,'piano',1);
+INSERT INTO "remix_tag" VALUES(4636,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4636,'synth',1);
+INSERT INTO "remix_tag" VALUES(4636,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4636,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4637,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4637,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4637,'dark',1);
+INSERT INTO "remix_tag" VALUES(4637,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4637,'piano',1);
+INSERT INTO "remix_tag" VALUES(4637,'strings',1);
+INSERT INTO "remix_tag" VALUES(4637,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4637,'synth',1);
+INSERT INTO "remix_tag" VALUES(4637,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4637,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4638,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4638,'compo',1);
+INSERT INTO "remix_tag" VALUES(4638,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4638,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4638,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4638,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4638,'piano',1);
+INSERT INTO "remix_tag" VALUES(4638,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4638,'synth',1);
+INSERT INTO "remix_tag" VALUES(4638,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4639,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4639,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4639,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4639,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4639,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4639,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4639,'piano',1);
+INSERT INTO "remix_tag" VALUES(4639,'strings',1);
+INSERT INTO "remix_tag" VALUES(4639,'synth',1);
+INSERT INTO "remix_tag" VALUES(4639,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4640,'collab',1);
+INSERT INTO "remix_tag" VALUES(4640,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4640,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4640,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4640,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4640,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4640,'organ',1);
+INSERT INTO "remix_tag" VALUES(4640,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4640,'synth',1);
+INSERT INTO "remix_tag" VALUES(4641,'collab',1);
+INSERT INTO "remix_tag" VALUES(4641,'funny',1);
+INSERT INTO "remix_tag" VALUES(4641,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4641,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4641,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4641,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4641,'rap',1);
+INSERT INTO "remix_tag" VALUES(4641,'synth',1);
+INSERT INTO "remix_tag" VALUES(4641,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4641,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4641,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4642,'chill',1);
+INSERT INTO "remix_tag" VALUES(4642,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4642,'collab',1);
+INSERT INTO "remix_tag" VALUES(4642,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4642,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4642,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4642,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4642,'piano',1);
+INSERT INTO "remix_tag" VALUES(4642,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4642,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4642,'synth',1);
+INSERT INTO "remix_tag" VALUES(4642,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4642,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4643,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4643,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4643,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4643,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4643,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4643,'synth',1);
+INSERT INTO "remix_tag" VALUES(4643,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4644,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4644,'collab',1);
+INSERT INTO "remix_tag" VALUES(4644,'compo',1);
+INSERT INTO "remix_tag" VALUES(4644,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4644,'edm',1);
+INSERT INTO "remix_tag" VALUES(4644,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4644,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4644,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4644,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4644,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4644,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4644,'synth',1);
+INSERT INTO "remix_tag" VALUES(4644,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4644,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4645,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4645,'compo',1);
+INSERT INTO "remix_tag" VALUES(4645,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4645,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4645,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4645,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4645,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4645,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4645,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4645,'strings',1);
+INSERT INTO "remix_tag" VALUES(4645,'synth',1);
+INSERT INTO "remix_tag" VALUES(4645,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4646,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4646,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4646,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4646,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4646,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4646,'piano',1);
+INSERT INTO "remix_tag" VALUES(4646,'synth',1);
+INSERT INTO "remix_tag" VALUES(4646,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4646,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4647,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4647,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4647,'piano',1);
+INSERT INTO "remix_tag" VALUES(4647,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4647,'sad',1);
+INSERT INTO "remix_tag" VALUES(4647,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4647,'solo',1);
+INSERT INTO "remix_tag" VALUES(4647,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4647,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4648,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4648,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4648,'edm',1);
+INSERT INTO "remix_tag" VALUES(4648,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4648,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4648,'piano',1);
+INSERT INTO "remix_tag" VALUES(4648,'synth',1);
+INSERT INTO "remix_tag" VALUES(4648,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4648,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4649,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4649,'collab',1);
+INSERT INTO "remix_tag" VALUES(4649,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4649,'flute',1);
+INSERT INTO "remix_tag" VALUES(4649,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4649,'strings',1);
+INSERT INTO "remix_tag" VALUES(4649,'synth',1);
+INSERT INTO "remix_tag" VALUES(4649,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4649,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4649,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4650,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4650,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4650,'collab',1);
+INSERT INTO "remix_tag" VALUES(4650,'flute',1);
+INSERT INTO "remix_tag" VALUES(4650,'happy',1);
+INSERT INTO "remix_tag" VALUES(4650,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4650,'piano',1);
+INSERT INTO "remix_tag" VALUES(4650,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4650,'waltz',1);
+INSERT INTO "remix_tag" VALUES(4651,'flute',1);
+INSERT INTO "remix_tag" VALUES(4651,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4651,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4651,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4651,'piano',1);
+INSERT INTO "remix_tag" VALUES(4651,'strings',1);
+INSERT INTO "remix_tag" VALUES(4651,'synth',1);
+INSERT INTO "remix_tag" VALUES(4651,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4651,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4651,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4652,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4652,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4652,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4652,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4652,'metal',1);
+INSERT INTO "remix_tag" VALUES(4652,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4653,'collab',1);
+INSERT INTO "remix_tag" VALUES(4653,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4653,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4653,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4653,'screaming',1);
+INSERT INTO "remix_tag" VALUES(4653,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4653,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4653,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4654,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4654,'chill',1);
+INSERT INTO "remix_tag" VALUES(4654,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4654,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4654,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4654,'piano',1);
+INSERT INTO "remix_tag" VALUES(4654,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4654,'synth',1);
+INSERT INTO "remix_tag" VALUES(4654,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4655,'cello',1);
+INSERT INTO "remix_tag" VALUES(4655,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4655,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4655,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4655,'piano',1);
+INSERT INTO "remix_tag" VALUES(4655,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4655,'strings',1);
+INSERT INTO "remix_tag" VALUES(4655,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4655,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4656,'dark',1);
+INSERT INTO "remix_tag" VALUES(4656,'edm',1);
+INSERT INTO "remix_tag" VALUES(4656,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4656,'synth',1);
+INSERT INTO "remix_tag" VALUES(4656,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4656,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4657,'collab',1);
+INSERT INTO "remix_tag" VALUES(4657,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4657,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4657,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4657,'funk',1);
+INSERT INTO "remix_tag" VALUES(4657,'funky',1);
+INSERT INTO "remix_tag" VALUES(4657,'rock',1);
+INSERT INTO "remix_tag" VALUES(4657,'synth',1);
+INSERT INTO "remix_tag" VALUES(4657,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4657,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4657,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4658,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4658,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4658,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4658,'synth',1);
+INSERT INTO "remix_tag" VALUES(4658,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4659,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4659,'collab',1);
+INSERT INTO "remix_tag" VALUES(4659,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4659,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4659,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4659,'rock',1);
+INSERT INTO "remix_tag" VALUES(4659,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4659,'strings',1);
+INSERT INTO "remix_tag" VALUES(4659,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4659,'synth',1);
+INSERT INTO "remix_tag" VALUES(4659,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4659,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4660,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4660,'angry',1);
+INSERT INTO "remix_tag" VALUES(4660,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4660,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4660,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4660,'piano',1);
+INSERT INTO "remix_tag" VALUES(4660,'rap',1);
+INSERT INTO "remix_tag" VALUES(4660,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4660,'synth',1);
+INSERT INTO "remix_tag" VALUES(4660,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4660,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4660,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4661,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4661,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4661,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4661,'synth',1);
+INSERT INTO "remix_tag" VALUES(4661,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4661,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4661,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4662,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4662,'dark',1);
+INSERT INTO "remix_tag" VALUES(4662,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4662,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4662,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4662,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4662,'synth',1);
+INSERT INTO "remix_tag" VALUES(4662,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4662,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4662,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4662,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4663,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4663,'dark',1);
+INSERT INTO "remix_tag" VALUES(4663,'death-metal',1);
+INSERT INTO "remix_tag" VALUES(4663,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4663,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4663,'metal',1);
+INSERT INTO "remix_tag" VALUES(4663,'synth',1);
+INSERT INTO "remix_tag" VALUES(4663,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4664,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4664,'flute',1);
+INSERT INTO "remix_tag" VALUES(4664,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4664,'indian',1);
+INSERT INTO "remix_tag" VALUES(4664,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4664,'sitar',1);
+INSERT INTO "remix_tag" VALUES(4664,'tanpura',1);
+INSERT INTO "remix_tag" VALUES(4664,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4664,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4664,'world',1);
+INSERT INTO "remix_tag" VALUES(4665,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4665,'collab',1);
+INSERT INTO "remix_tag" VALUES(4665,'compo',1);
+INSERT INTO "remix_tag" VALUES(4665,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4665,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4665,'epic',1);
+INSERT INTO "remix_tag" VALUES(4665,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4665,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4665,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4665,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4665,'synth',1);
+INSERT INTO "remix_tag" VALUES(4665,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4665,'violin',1);
+INSERT INTO "remix_tag" VALUES(4665,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4666,'bells',1);
+INSERT INTO "remix_tag" VALUES(4666,'choir',1);
+INSERT INTO "remix_tag" VALUES(4666,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4666,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4666,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4666,'harp',1);
+INSERT INTO "remix_tag" VALUES(4666,'metal',1);
+INSERT INTO "remix_tag" VALUES(4666,'piano',1);
+INSERT INTO "remix_tag" VALUES(4666,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4666,'strings',1);
+INSERT INTO "remix_tag" VALUES(4666,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4666,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4667,'collab',1);
+INSERT INTO "remix_tag" VALUES(4667,'compo',1);
+INSERT INTO "remix_tag" VALUES(4667,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4667,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4667,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4667,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4667,'singing',1);
+INSERT INTO "remix_tag" VALUES(4667,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4668,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4668,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4668,'collab',1);
+INSERT INTO "remix_tag" VALUES(4668,'flute',1);
+INSERT INTO "remix_tag" VALUES(4668,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4668,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4668,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4668,'piano',1);
+INSERT INTO "remix_tag" VALUES(4668,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4668,'rock',1);
+INSERT INTO "remix_tag" VALUES(4668,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4668,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4668,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4669,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4669,'collab',1);
+INSERT INTO "remix_tag" VALUES(4669,'epic',1);
+INSERT INTO "remix_tag" VALUES(4669,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4669,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4669,'piano',1);
+INSERT INTO "remix_tag" VALUES(4669,'sad',1);
+INSERT INTO "remix_tag" VALUES(4669,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4669,'strings',1);
+INSERT INTO "remix_tag" VALUES(4669,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4670,'chill',1);
+INSERT INTO "remix_tag" VALUES(4670,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4670,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4670,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4670,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4670,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4670,'synth',1);
+INSERT INTO "remix_tag" VALUES(4670,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4670,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4671,'dark',1);
+INSERT INTO "remix_tag" VALUES(4671,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4671,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4671,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4671,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4671,'synth',1);
+INSERT INTO "remix_tag" VALUES(4671,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4671,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4671,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4671,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4672,'chill',1);
+INSERT INTO "remix_tag" VALUES(4672,'collab',1);
+INSERT INTO "remix_tag" VALUES(4672,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4672,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4672,'piano',1);
+INSERT INTO "remix_tag" VALUES(4672,'synth',1);
+INSERT INTO "remix_tag" VALUES(4672,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4673,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4673,'dark',1);
+INSERT INTO "remix_tag" VALUES(4673,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4673,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4673,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4673,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4673,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4673,'synth',1);
+INSERT INTO "remix_tag" VALUES(4674,'cello',1);
+INSERT INTO "remix_tag" VALUES(4674,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4674,'harp',1);
+INSERT INTO "remix_tag" VALUES(4674,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4674,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4674,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4674,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4674,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4675,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4675,'collab',1);
+INSERT INTO "remix_tag" VALUES(4675,'dark',1);
+INSERT INTO "remix_tag" VALUES(4675,'electro',1);
+INSERT INTO "remix_tag" VALUES(4675,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4675,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4675,'strings',1);
+INSERT INTO "remix_tag" VALUES(4675,'synth',1);
+INSERT INTO "remix_tag" VALUES(4675,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4675,'violin',1);
+INSERT INTO "remix_tag" VALUES(4676,'chill',1);
+INSERT INTO "remix_tag" VALUES(4676,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4676,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4676,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4676,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4676,'synth',1);
+INSERT INTO "remix_tag" VALUES(4676,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4677,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(4677,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4677,'dark',1);
+INSERT INTO "remix_tag" VALUES(4677,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4677,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4677,'piano',1);
+INSERT INTO "remix_tag" VALUES(4677,'synth',1);
+INSERT INTO "remix_tag" VALUES(4677,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4677,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4678,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4678,'piano',1);
+INSERT INTO "remix_tag" VALUES(4678,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4678,'solo',1);
+INSERT INTO "remix_tag" VALUES(4678,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4678,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4679,'collab',1);
+INSERT INTO "remix_tag" VALUES(4679,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4679,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4679,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4679,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4679,'piano',1);
+INSERT INTO "remix_tag" VALUES(4679,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4679,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4679,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4679,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4680,'brass',1);
+INSERT INTO "remix_tag" VALUES(4680,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4680,'epic',1);
+INSERT INTO "remix_tag" VALUES(4680,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4680,'strings',1);
+INSERT INTO "remix_tag" VALUES(4680,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4680,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4681,'dark',1);
+INSERT INTO "remix_tag" VALUES(4681,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4681,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4681,'synth',1);
+INSERT INTO "remix_tag" VALUES(4681,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4681,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4682,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4682,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4682,'funky',1);
+INSERT INTO "remix_tag" VALUES(4682,'jungle',1);
+INSERT INTO "remix_tag" VALUES(4682,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4682,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4682,'synth',1);
+INSERT INTO "remix_tag" VALUES(4682,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4683,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4683,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4683,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4683,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4683,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4683,'funky',1);
+INSERT INTO "remix_tag" VALUES(4683,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4683,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4683,'synth',1);
+INSERT INTO "remix_tag" VALUES(4683,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4684,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4684,'chill',1);
+INSERT INTO "remix_tag" VALUES(4684,'dark',1);
+INSERT INTO "remix_tag" VALUES(4684,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4684,'piano',1);
+INSERT INTO "remix_tag" VALUES(4684,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4684,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4684,'strings',1);
+INSERT INTO "remix_tag" VALUES(4684,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4684,'synth',1);
+INSERT INTO "remix_tag" VALUES(4685,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4685,'dark',1);
+INSERT INTO "remix_tag" VALUES(4685,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4685,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4685,'metal',1);
+INSERT INTO "remix_tag" VALUES(4685,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4685,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4686,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4686,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4686,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4686,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4686,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4686,'rock',1);
+INSERT INTO "remix_tag" VALUES(4686,'singing',1);
+INSERT INTO "remix_tag" VALUES(4686,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4686,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4687,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4687,'dark',1);
+INSERT INTO "remix_tag" VALUES(4687,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4687,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4687,'piano',1);
+INSERT INTO "remix_tag" VALUES(4687,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4687,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4687,'synth',1);
+INSERT INTO "remix_tag" VALUES(4687,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4688,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4688,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4688,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4688,'funky',1);
+INSERT INTO "remix_tag" VALUES(4688,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4688,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4688,'synth',1);
+INSERT INTO "remix_tag" VALUES(4688,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4688,'whistling',1);
+INSERT INTO "remix_tag" VALUES(4689,'dark',1);
+INSERT INTO "remix_tag" VALUES(4689,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4689,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4689,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4689,'synth',1);
+INSERT INTO "remix_tag" VALUES(4690,'collab',1);
+INSERT INTO "remix_tag" VALUES(4690,'compo',1);
+INSERT INTO "remix_tag" VALUES(4690,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4690,'dark',1);
+INSERT INTO "remix_tag" VALUES(4690,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4690,'jungle',1);
+INSERT INTO "remix_tag" VALUES(4690,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4690,'synth',1);
+INSERT INTO "remix_tag" VALUES(4690,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4691,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4691,'chill',1);
+INSERT INTO "remix_tag" VALUES(4691,'collab',1);
+INSERT INTO "remix_tag" VALUES(4691,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4691,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4691,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4691,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4691,'piano',1);
+INSERT INTO "remix_tag" VALUES(4691,'synth',1);
+INSERT INTO "remix_tag" VALUES(4691,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4692,'bells',1);
+INSERT INTO "remix_tag" VALUES(4692,'choir',1);
+INSERT INTO "remix_tag" VALUES(4692,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4692,'collab',1);
+INSERT INTO "remix_tag" VALUES(4692,'dark',1);
+INSERT INTO "remix_tag" VALUES(4692,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4692,'harp',1);
+INSERT INTO "remix_tag" VALUES(4692,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4692,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4692,'strings',1);
+INSERT INTO "remix_tag" VALUES(4692,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4693,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4693,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4693,'angry',1);
+INSERT INTO "remix_tag" VALUES(4693,'collab',1);
+INSERT INTO "remix_tag" VALUES(4693,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4693,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4693,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4693,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4693,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4693,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4693,'rock',1);
+INSERT INTO "remix_tag" VALUES(4693,'singing',1);
+INSERT INTO "remix_tag" VALUES(4693,'synth',1);
+INSERT INTO "remix_tag" VALUES(4693,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4693,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4694,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4694,'piano',1);
+INSERT INTO "remix_tag" VALUES(4694,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4694,'solo',1);
+INSERT INTO "remix_tag" VALUES(4694,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4694,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4695,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4695,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4695,'collab',1);
+INSERT INTO "remix_tag" VALUES(4695,'compo',1);
+INSERT INTO "remix_tag" VALUES(4695,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4695,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4695,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4695,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4695,'epic',1);
+INSERT INTO "remix_tag" VALUES(4695,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4695,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4695,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4695,'piano',1);
+INSERT INTO "remix_tag" VALUES(4695,'strings',1);
+INSERT INTO "remix_tag" VALUES(4695,'synth',1);
+INSERT INTO "remix_tag" VALUES(4695,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4696,'collab',1);
+INSERT INTO "remix_tag" VALUES(4696,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4696,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4696,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4696,'piano',1);
+INSERT INTO "remix_tag" VALUES(4696,'rock',1);
+INSERT INTO "remix_tag" VALUES(4696,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4696,'surf',1);
+INSERT INTO "remix_tag" VALUES(4696,'synth',1);
+INSERT INTO "remix_tag" VALUES(4696,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4696,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4697,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4697,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4697,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4697,'synth',1);
+INSERT INTO "remix_tag" VALUES(4697,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4698,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4698,'bells',1);
+INSERT INTO "remix_tag" VALUES(4698,'cello',1);
+INSERT INTO "remix_tag" VALUES(4698,'choir',1);
+INSERT INTO "remix_tag" VALUES(4698,'collab',1);
+INSERT INTO "remix_tag" VALUES(4698,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4698,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4698,'organ',1);
+INSERT INTO "remix_tag" VALUES(4698,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4698,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4698,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4698,'synth',1);
+INSERT INTO "remix_tag" VALUES(4698,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4698,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4699,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4699,'angry',1);
+INSERT INTO "remix_tag" VALUES(4699,'collab',1);
+INSERT INTO "remix_tag" VALUES(4699,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4699,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4699,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4699,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4699,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4699,'medley',1);
+INSERT INTO "remix_tag" VALUES(4699,'metal',1);
+INSERT INTO "remix_tag" VALUES(4699,'punk',1);
+INSERT INTO "remix_tag" VALUES(4699,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4699,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4699,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4699,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4700,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4700,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(4700,'celtic',1);
+INSERT INTO "remix_tag" VALUES(4700,'choir',1);
+INSERT INTO "remix_tag" VALUES(4700,'collab',1);
+INSERT INTO "remix_tag" VALUES(4700,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4700,'folk',1);
+INSERT INTO "remix_tag" VALUES(4700,'irish-whistle',1);
+INSERT INTO "remix_tag" VALUES(4700,'lang-original',1);
+INSERT INTO "remix_tag" VALUES(4700,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4700,'medley',1);
+INSERT INTO "remix_tag" VALUES(4700,'metal',1);
+INSERT INTO "remix_tag" VALUES(4700,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4700,'synth',1);
+INSERT INTO "remix_tag" VALUES(4700,'ukulele',1);
+INSERT INTO "remix_tag" VALUES(4700,'violin',1);
+INSERT INTO "remix_tag" VALUES(4701,'chill',1);
+INSERT INTO "remix_tag" VALUES(4701,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4701,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4701,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4701,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4701,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4701,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4701,'rock',1);
+INSERT INTO "remix_tag" VALUES(4701,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4701,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4701,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4702,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4702,'chill',1);
+INSERT INTO "remix_tag" VALUES(4702,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4702,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4702,'rock',1);
+INSERT INTO "remix_tag" VALUES(4702,'synth',1);
+INSERT INTO "remix_tag" VALUES(4702,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4702,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4703,'chill',1);
+INSERT INTO "remix_tag" VALUES(4703,'collab',1);
+INSERT INTO "remix_tag" VALUES(4703,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4703,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4703,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4703,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4703,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4703,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4703,'piano',1);
+INSERT INTO "remix_tag" VALUES(4703,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4703,'synth',1);
+INSERT INTO "remix_tag" VALUES(4703,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4704,'collab',1);
+INSERT INTO "remix_tag" VALUES(4704,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4704,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4704,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4704,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4704,'funky',1);
+INSERT INTO "remix_tag" VALUES(4704,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4704,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4704,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4704,'synth',1);
+INSERT INTO "remix_tag" VALUES(4704,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4705,'edm',1);
+INSERT INTO "remix_tag" VALUES(4705,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4705,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4705,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(4705,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4705,'medley',1);
+INSERT INTO "remix_tag" VALUES(4705,'strings',1);
+INSERT INTO "remix_tag" VALUES(4705,'synth',1);
+INSERT INTO "remix_tag" VALUES(4705,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4706,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4706,'angry',1);
+INSERT INTO "remix_tag" VALUES(4706,'cello',1);
+INSERT INTO "remix_tag" VALUES(4706,'collab',1);
+INSERT INTO "remix_tag" VALUES(4706,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4706,'dark',1);
+INSERT INTO "remix_tag" VALUES(4706,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4706,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4706,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4706,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4706,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4706,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4706,'medley',1);
+INSERT INTO "remix_tag" VALUES(4706,'metal',1);
+INSERT INTO "remix_tag" VALUES(4706,'organ',1);
+INSERT INTO "remix_tag" VALUES(4706,'singing',1);
+INSERT INTO "remix_tag" VALUES(4706,'synth',1);
+INSERT INTO "remix_tag" VALUES(4706,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4706,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4707,'bells',1);
+INSERT INTO "remix_tag" VALUES(4707,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4707,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4707,'happy',1);
+INSERT INTO "remix_tag" VALUES(4707,'medley',1);
+INSERT INTO "remix_tag" VALUES(4707,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4707,'synth',1);
+INSERT INTO "remix_tag" VALUES(4707,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4707,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4708,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4708,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4708,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4708,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(4708,'collab',1);
+INSERT INTO "remix_tag" VALUES(4708,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4708,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4708,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4708,'harp',1);
+INSERT INTO "remix_tag" VALUES(4708,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4708,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4708,'organ',1);
+INSERT INTO "remix_tag" VALUES(4708,'piano',1);
+INSERT INTO "remix_tag" VALUES(4708,'rock',1);
+INSERT INTO "remix_tag" VALUES(4708,'sad',1);
+INSERT INTO "remix_tag" VALUES(4708,'singing',1);
+INSERT INTO "remix_tag" VALUES(4708,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4708,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4708,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4709,'bells',1);
+INSERT INTO "remix_tag" VALUES(4709,'choir',1);
+INSERT INTO "remix_tag" VALUES(4709,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4709,'collab',1);
+INSERT INTO "remix_tag" VALUES(4709,'flute',1);
+INSERT INTO "remix_tag" VALUES(4709,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4709,'medley',1);
+INSERT INTO "remix_tag" VALUES(4709,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4709,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4709,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4709,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4709,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4709,'strings',1);
+INSERT INTO "remix_tag" VALUES(4709,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4709,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4710,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4710,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4710,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4710,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4710,'swing',1);
+INSERT INTO "remix_tag" VALUES(4710,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4710,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4711,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4711,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4711,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4711,'happy',1);
+INSERT INTO "remix_tag" VALUES(4711,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4711,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4711,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4711,'singing',1);
+INSERT INTO "remix_tag" VALUES(4711,'synth',1);
+INSERT INTO "remix_tag" VALUES(4711,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4711,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4711,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4712,'dark',1);
+INSERT INTO "remix_tag" VALUES(4712,'edm',1);
+INSERT INTO "remix_tag" VALUES(4712,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4712,'synth',1);
+INSERT INTO "remix_tag" VALUES(4712,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4712,'trance',1);
+INSERT INTO "remix_tag" VALUES(4713,'collab',1);
+INSERT INTO "remix_tag" VALUES(4713,'edm',1);
+INSERT INTO "remix_tag" VALUES(4713,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4713,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4713,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4713,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4713,'sad',1);
+INSERT INTO "remix_tag" VALUES(4713,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4713,'synth',1);
+INSERT INTO "remix_tag" VALUES(4713,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4713,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4714,'chill',1);
+INSERT INTO "remix_tag" VALUES(4714,'collab',1);
+INSERT INTO "remix_tag" VALUES(4714,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4714,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4714,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4714,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4714,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4714,'piano',1);
+INSERT INTO "remix_tag" VALUES(4714,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4714,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4714,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4714,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4715,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4715,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4715,'collab',1);
+INSERT INTO "remix_tag" VALUES(4715,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4715,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4715,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4715,'piano',1);
+INSERT INTO "remix_tag" VALUES(4715,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4715,'synth',1);
+INSERT INTO "remix_tag" VALUES(4715,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4715,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4715,'violin',1);
+INSERT INTO "remix_tag" VALUES(4715,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(4716,'blues',1);
+INSERT INTO "remix_tag" VALUES(4716,'brass',1);
+INSERT INTO "remix_tag" VALUES(4716,'collab',1);
+INSERT INTO "remix_tag" VALUES(4716,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4716,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4716,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4716,'funky',1);
+INSERT INTO "remix_tag" VALUES(4716,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4717,'collab',1);
+INSERT INTO "remix_tag" VALUES(4717,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4717,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4717,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4717,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4717,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4717,'rock',1);
+INSERT INTO "remix_tag" VALUES(4717,'singing',1);
+INSERT INTO "remix_tag" VALUES(4717,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4717,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4717,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4718,'chill',1);
+INSERT INTO "remix_tag" VALUES(4718,'collab',1);
+INSERT INTO "remix_tag" VALUES(4718,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4718,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4718,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4718,'piano',1);
+INSERT INTO "remix_tag" VALUES(4718,'swing',1);
+INSERT INTO "remix_tag" VALUES(4718,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4718,'trio',1);
+INSERT INTO "remix_tag" VALUES(4719,'bells',1);
+INSERT INTO "remix_tag" VALUES(4719,'choir',1);
+INSERT INTO "remix_tag" VALUES(4719,'chromatic-percussion',1);
+INSERT INTO "remix_tag" VALUES(4719,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4719,'collab',1);
+INSERT INTO "remix_tag" VALUES(4719,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4719,'flute',1);
+INSERT INTO "remix_tag" VALUES(4719,'harp',1);
+INSERT INTO "remix_tag" VALUES(4719,'medley',1);
+INSERT INTO "remix_tag" VALUES(4719,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4719,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4719,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4719,'strings',1);
+INSERT INTO "remix_tag" VALUES(4719,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4720,'brass',1);
+INSERT INTO "remix_tag" VALUES(4720,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4720,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4720,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4720,'funk',1);
+INSERT INTO "remix_tag" VALUES(4720,'funky',1);
+INSERT INTO "remix_tag" VALUES(4720,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4720,'synth',1);
+INSERT INTO "remix_tag" VALUES(4720,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4721,'choir',1);
+INSERT INTO "remix_tag" VALUES(4721,'collab',1);
+INSERT INTO "remix_tag" VALUES(4721,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4721,'dark',1);
+INSERT INTO "remix_tag" VALUES(4721,'edm',1);
+INSERT INTO "remix_tag" VALUES(4721,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4721,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4721,'organ',1);
+INSERT INTO "remix_tag" VALUES(4721,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4721,'synth',1);
+INSERT INTO "remix_tag" VALUES(4721,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4721,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4722,'bells',1);
+INSERT INTO "remix_tag" VALUES(4722,'chill',1);
+INSERT INTO "remix_tag" VALUES(4722,'collab',1);
+INSERT INTO "remix_tag" VALUES(4722,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4722,'impressionist',1);
+INSERT INTO "remix_tag" VALUES(4722,'piano',1);
+INSERT INTO "remix_tag" VALUES(4722,'synth',1);
+INSERT INTO "remix_tag" VALUES(4722,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4722,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4722,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4723,'cello',1);
+INSERT INTO "remix_tag" VALUES(4723,'collab',1);
+INSERT INTO "remix_tag" VALUES(4723,'disco',1);
+INSERT INTO "remix_tag" VALUES(4723,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4723,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4723,'funky',1);
+INSERT INTO "remix_tag" VALUES(4723,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4723,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4723,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4723,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4723,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4723,'piano',1);
+INSERT INTO "remix_tag" VALUES(4723,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4723,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4723,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4723,'viola',1);
+INSERT INTO "remix_tag" VALUES(4723,'violin',1);
+INSERT INTO "remix_tag" VALUES(4724,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4724,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4724,'collab',1);
+INSERT INTO "remix_tag" VALUES(4724,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4724,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4724,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4724,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4724,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4724,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4724,'rock',1);
+INSERT INTO "remix_tag" VALUES(4724,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4724,'synth',1);
+INSERT INTO "remix_tag" VALUES(4724,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4724,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4725,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4725,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4725,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4725,'collab',1);
+INSERT INTO "remix_tag" VALUES(4725,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4725,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4725,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4725,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4725,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4725,'medley',1);
+INSERT INTO "remix_tag" VALUES(4725,'metal',1);
+INSERT INTO "remix_tag" VALUES(4725,'organ',1);
+INSERT INTO "remix_tag" VALUES(4725,'piano',1);
+INSERT INTO "remix_tag" VALUES(4725,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4725,'synth',1);
+INSERT INTO "remix_tag" VALUES(4725,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4725,'timesig-7-4',1);
+INSERT INTO "remix_tag" VALUES(4725,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4725,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4725,'workout',1);
+INSERT INTO "remix_tag" VALUES(4726,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4726,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4726,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4726,'collab',1);
+INSERT INTO "remix_tag" VALUES(4726,'flute',1);
+INSERT INTO "remix_tag" VALUES(4726,'happy',1);
+INSERT INTO "remix_tag" VALUES(4726,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4726,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4726,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4726,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4726,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4727,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4727,'brass',1);
+INSERT INTO "remix_tag" VALUES(4727,'collab',1);
+INSERT INTO "remix_tag" VALUES(4727,'happy',1);
+INSERT INTO "remix_tag" VALUES(4727,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4727,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4727,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4727,'organ',1);
+INSERT INTO "remix_tag" VALUES(4727,'singing',1);
+INSERT INTO "remix_tag" VALUES(4727,'strings',1);
+INSERT INTO "remix_tag" VALUES(4727,'synth',1);
+INSERT INTO "remix_tag" VALUES(4727,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4727,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4727,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4728,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4728,'brass',1);
+INSERT INTO "remix_tag" VALUES(4728,'choir',1);
+INSERT INTO "remix_tag" VALUES(4728,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4728,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4728,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4728,'strings',1);
+INSERT INTO "remix_tag" VALUES(4728,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4728,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4728,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4729,'collab',1);
+INSERT INTO "remix_tag" VALUES(4729,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4729,'flute',1);
+INSERT INTO "remix_tag" VALUES(4729,'happy',1);
+INSERT INTO "remix_tag" VALUES(4729,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4729,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4729,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4729,'piano',1);
+INSERT INTO "remix_tag" VALUES(4729,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4729,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4729,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4730,'collab',1);
+INSERT INTO "remix_tag" VALUES(4730,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4730,'funk',1);
+INSERT INTO "remix_tag" VALUES(4730,'funky',1);
+INSERT INTO "remix_tag" VALUES(4730,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4730,'happy',1);
+INSERT INTO "remix_tag" VALUES(4730,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4730,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4730,'synth',1);
+INSERT INTO "remix_tag" VALUES(4730,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4730,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4731,'chill',1);
+INSERT INTO "remix_tag" VALUES(4731,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4731,'collab',1);
+INSERT INTO "remix_tag" VALUES(4731,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4731,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4731,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4731,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4731,'piano',1);
+INSERT INTO "remix_tag" VALUES(4731,'synth',1);
+INSERT INTO "remix_tag" VALUES(4731,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4732,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4732,'brass',1);
+INSERT INTO "remix_tag" VALUES(4732,'cello',1);
+INSERT INTO "remix_tag" VALUES(4732,'collab',1);
+INSERT INTO "remix_tag" VALUES(4732,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4732,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4732,'flute',1);
+INSERT INTO "remix_tag" VALUES(4732,'funky',1);
+INSERT INTO "remix_tag" VALUES(4732,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4732,'piano',1);
+INSERT INTO "remix_tag" VALUES(4732,'pop',1);
+INSERT INTO "remix_tag" VALUES(4732,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4732,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4732,'soul',1);
+INSERT INTO "remix_tag" VALUES(4732,'strings',1);
+INSERT INTO "remix_tag" VALUES(4732,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4732,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4732,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4732,'viola',1);
+INSERT INTO "remix_tag" VALUES(4732,'violin',1);
+INSERT INTO "remix_tag" VALUES(4733,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4733,'bells',1);
+INSERT INTO "remix_tag" VALUES(4733,'chill',1);
+INSERT INTO "remix_tag" VALUES(4733,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4733,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4733,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4733,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4733,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4733,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4733,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4734,'blues',1);
+INSERT INTO "remix_tag" VALUES(4734,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4734,'funky',1);
+INSERT INTO "remix_tag" VALUES(4734,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4734,'happy',1);
+INSERT INTO "remix_tag" VALUES(4734,'synth',1);
+INSERT INTO "remix_tag" VALUES(4734,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4735,'collab',1);
+INSERT INTO "remix_tag" VALUES(4735,'compo',1);
+INSERT INTO "remix_tag" VALUES(4735,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4735,'dark',1);
+INSERT INTO "remix_tag" VALUES(4735,'edm',1);
+INSERT INTO "remix_tag" VALUES(4735,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4735,'lang-spanish',1);
+INSERT INTO "remix_tag" VALUES(4735,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4735,'synth',1);
+INSERT INTO "remix_tag" VALUES(4735,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4736,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4736,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4736,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4736,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4736,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4736,'piano',1);
+INSERT INTO "remix_tag" VALUES(4736,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4736,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4736,'strings',1);
+INSERT INTO "remix_tag" VALUES(4736,'synth',1);
+INSERT INTO "remix_tag" VALUES(4736,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4737,'edm',1);
+INSERT INTO "remix_tag" VALUES(4737,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4737,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4737,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4737,'piano',1);
+INSERT INTO "remix_tag" VALUES(4737,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4737,'synth',1);
+INSERT INTO "remix_tag" VALUES(4737,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4738,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4738,'collab',1);
+INSERT INTO "remix_tag" VALUES(4738,'dance',1);
+INSERT INTO "remix_tag" VALUES(4738,'edm',1);
+INSERT INTO "remix_tag" VALUES(4738,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4738,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4738,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4738,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4738,'medley',1);
+INSERT INTO "remix_tag" VALUES(4738,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4738,'synth',1);
+INSERT INTO "remix_tag" VALUES(4738,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4739,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4739,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4739,'collab',1);
+INSERT INTO "remix_tag" VALUES(4739,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4739,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4739,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4739,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4739,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4739,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4739,'strings',1);
+INSERT INTO "remix_tag" VALUES(4739,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4739,'synth',1);
+INSERT INTO "remix_tag" VALUES(4739,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4739,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4740,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4740,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4740,'electro',1);
+INSERT INTO "remix_tag" VALUES(4740,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4740,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4740,'synth',1);
+INSERT INTO "remix_tag" VALUES(4740,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4740,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4741,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4741,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4741,'collab',1);
+INSERT INTO "remix_tag" VALUES(4741,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4741,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4741,'piano',1);
+INSERT INTO "remix_tag" VALUES(4741,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4741,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4741,'synth',1);
+INSERT INTO "remix_tag" VALUES(4741,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4742,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4742,'edm',1);
+INSERT INTO "remix_tag" VALUES(4742,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4742,'happy',1);
+INSERT INTO "remix_tag" VALUES(4742,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4743,'chill',1);
+INSERT INTO "remix_tag" VALUES(4743,'collab',1);
+INSERT INTO "remix_tag" VALUES(4743,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4743,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4743,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4743,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4743,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4743,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4743,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4743,'pop',1);
+INSERT INTO "remix_tag" VALUES(4743,'singing',1);
+INSERT INTO "remix_tag" VALUES(4743,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4743,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4743,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4743,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4743,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4744,'cello',1);
+INSERT INTO "remix_tag" VALUES(4744,'collab',1);
+INSERT INTO "remix_tag" VALUES(4744,'dark',1);
+INSERT INTO "remix_tag" VALUES(4744,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4744,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4744,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4744,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4744,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4745,'cello',1);
+INSERT INTO "remix_tag" VALUES(4745,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4745,'collab',1);
+INSERT INTO "remix_tag" VALUES(4745,'dark',1);
+INSERT INTO "remix_tag" VALUES(4745,'piano',1);
+INSERT INTO "remix_tag" VALUES(4745,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4745,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4745,'trio',1);
+INSERT INTO "remix_tag" VALUES(4746,'collab',1);
+INSERT INTO "remix_tag" VALUES(4746,'dark',1);
+INSERT INTO "remix_tag" VALUES(4746,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4746,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4746,'piano',1);
+INSERT INTO "remix_tag" VALUES(4746,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4746,'synth',1);
+INSERT INTO "remix_tag" VALUES(4746,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4746,'trap',1);
+INSERT INTO "remix_tag" VALUES(4746,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4747,'cello',1);
+INSERT INTO "remix_tag" VALUES(4747,'collab',1);
+INSERT INTO "remix_tag" VALUES(4747,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4747,'dark',1);
+INSERT INTO "remix_tag" VALUES(4747,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4747,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4747,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4747,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4747,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4747,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4748,'cello',1);
+INSERT INTO "remix_tag" VALUES(4748,'collab',1);
+INSERT INTO "remix_tag" VALUES(4748,'dark',1);
+INSERT INTO "remix_tag" VALUES(4748,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4748,'synth',1);
+INSERT INTO "remix_tag" VALUES(4748,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4748,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4749,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4749,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4749,'collab',1);
+INSERT INTO "remix_tag" VALUES(4749,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4749,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4749,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4749,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4749,'synth',1);
+INSERT INTO "remix_tag" VALUES(4750,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4750,'chill',1);
+INSERT INTO "remix_tag" VALUES(4750,'collab',1);
+INSERT INTO "remix_tag" VALUES(4750,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4750,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4750,'happy',1);
+INSERT INTO "remix_tag" VALUES(4750,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4750,'piano',1);
+INSERT INTO "remix_tag" VALUES(4750,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4750,'strings',1);
+INSERT INTO "remix_tag" VALUES(4750,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4751,'collab',1);
+INSERT INTO "remix_tag" VALUES(4751,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4751,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4751,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4751,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4751,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4751,'metal',1);
+INSERT INTO "remix_tag" VALUES(4751,'rock',1);
+INSERT INTO "remix_tag" VALUES(4751,'synth',1);
+INSERT INTO "remix_tag" VALUES(4751,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4752,'cello',1);
+INSERT INTO "remix_tag" VALUES(4752,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4752,'collab',1);
+INSERT INTO "remix_tag" VALUES(4752,'dizi',1);
+INSERT INTO "remix_tag" VALUES(4752,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4752,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4752,'epic',1);
+INSERT INTO "remix_tag" VALUES(4752,'flute',1);
+INSERT INTO "remix_tag" VALUES(4752,'medley',1);
+INSERT INTO "remix_tag" VALUES(4752,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4752,'piano',1);
+INSERT INTO "remix_tag" VALUES(4752,'strings',1);
+INSERT INTO "remix_tag" VALUES(4752,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4752,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4752,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4752,'violin',1);
+INSERT INTO "remix_tag" VALUES(4753,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4753,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4753,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4753,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4753,'metal',1);
+INSERT INTO "remix_tag" VALUES(4753,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4753,'synth',1);
+INSERT INTO "remix_tag" VALUES(4753,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4754,'chill',1);
+INSERT INTO "remix_tag" VALUES(4754,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4754,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4754,'organ',1);
+INSERT INTO "remix_tag" VALUES(4754,'piano',1);
+INSERT INTO "remix_tag" VALUES(4754,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4754,'rock',1);
+INSERT INTO "remix_tag" VALUES(4754,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4754,'strings',1);
+INSERT INTO "remix_tag" VALUES(4754,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4755,'collab',1);
+INSERT INTO "remix_tag" VALUES(4755,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4755,'dark',1);
+INSERT INTO "remix_tag" VALUES(4755,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4755,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4755,'metal',1);
+INSERT INTO "remix_tag" VALUES(4755,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4755,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4756,'edm',1);
+INSERT INTO "remix_tag" VALUES(4756,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4756,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4756,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4756,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4756,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4756,'synth',1);
+INSERT INTO "remix_tag" VALUES(4756,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4757,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4757,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4757,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4757,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4757,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4758,'collab',1);
+INSERT INTO "remix_tag" VALUES(4758,'compo',1);
+INSERT INTO "remix_tag" VALUES(4758,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4758,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4758,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4758,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4758,'metal',1);
+INSERT INTO "remix_tag" VALUES(4758,'synth',1);
+INSERT INTO "remix_tag" VALUES(4758,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4759,'dark',1);
+INSERT INTO "remix_tag" VALUES(4759,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4759,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4759,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4759,'synth',1);
+INSERT INTO "remix_tag" VALUES(4759,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4759,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4760,'edm',1);
+INSERT INTO "remix_tag" VALUES(4760,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4760,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4760,'synth',1);
+INSERT INTO "remix_tag" VALUES(4760,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4760,'trance',1);
+INSERT INTO "remix_tag" VALUES(4761,'bells',1);
+INSERT INTO "remix_tag" VALUES(4761,'chill',1);
+INSERT INTO "remix_tag" VALUES(4761,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4761,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4761,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4761,'piano',1);
+INSERT INTO "remix_tag" VALUES(4761,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4761,'winter-holiday',1);
+INSERT INTO "remix_tag" VALUES(4762,'chill',1);
+INSERT INTO "remix_tag" VALUES(4762,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4762,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4762,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4762,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4762,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4762,'synth',1);
+INSERT INTO "remix_tag" VALUES(4762,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4763,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4763,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4763,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4763,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4763,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4763,'piano',1);
+INSERT INTO "remix_tag" VALUES(4763,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4763,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4764,'brass',1);
+INSERT INTO "remix_tag" VALUES(4764,'choir',1);
+INSERT INTO "remix_tag" VALUES(4764,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4764,'harp',1);
+INSERT INTO "remix_tag" VALUES(4764,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4764,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4764,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4764,'strings',1);
+INSERT INTO "remix_tag" VALUES(4764,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4764,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4765,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4765,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4765,'funk',1);
+INSERT INTO "remix_tag" VALUES(4765,'funky',1);
+INSERT INTO "remix_tag" VALUES(4765,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4765,'medley',1);
+INSERT INTO "remix_tag" VALUES(4765,'synth',1);
+INSERT INTO "remix_tag" VALUES(4765,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4766,'acoustic',1);
+INSERT INTO "remix_tag" VALUES(4766,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4766,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4766,'collab',1);
+INSERT INTO "remix_tag" VALUES(4766,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4766,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4766,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4766,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4766,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4767,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4767,'collab',1);
+INSERT INTO "remix_tag" VALUES(4767,'dark',1);
+INSERT INTO "remix_tag" VALUES(4767,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4767,'piano',1);
+INSERT INTO "remix_tag" VALUES(4767,'reversing',1);
+INSERT INTO "remix_tag" VALUES(4767,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4767,'synth',1);
+INSERT INTO "remix_tag" VALUES(4767,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4768,'dark',1);
+INSERT INTO "remix_tag" VALUES(4768,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4768,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4768,'metal',1);
+INSERT INTO "remix_tag" VALUES(4768,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4768,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4768,'synth',1);
+INSERT INTO "remix_tag" VALUES(4768,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4769,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4769,'edm',1);
+INSERT INTO "remix_tag" VALUES(4769,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4769,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4769,'happy',1);
+INSERT INTO "remix_tag" VALUES(4769,'synth',1);
+INSERT INTO "remix_tag" VALUES(4769,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4770,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4770,'collab',1);
+INSERT INTO "remix_tag" VALUES(4770,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4770,'dark',1);
+INSERT INTO "remix_tag" VALUES(4770,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4770,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4770,'harp',1);
+INSERT INTO "remix_tag" VALUES(4770,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4770,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4770,'medley',1);
+INSERT INTO "remix_tag" VALUES(4770,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4770,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4770,'strings',1);
+INSERT INTO "remix_tag" VALUES(4770,'synth',1);
+INSERT INTO "remix_tag" VALUES(4770,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4771,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4771,'collab',1);
+INSERT INTO "remix_tag" VALUES(4771,'compo',1);
+INSERT INTO "remix_tag" VALUES(4771,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4771,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4771,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4771,'funky',1);
+INSERT INTO "remix_tag" VALUES(4771,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4771,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4771,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(4771,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4771,'synth',1);
+INSERT INTO "remix_tag" VALUES(4771,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4771,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4771,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4772,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4772,'collab',1);
+INSERT INTO "remix_tag" VALUES(4772,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4772,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4772,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4772,'medley',1);
+INSERT INTO "remix_tag" VALUES(4772,'metal',1);
+INSERT INTO "remix_tag" VALUES(4772,'synth',1);
+INSERT INTO "remix_tag" VALUES(4772,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4773,'collab',1);
+INSERT INTO "remix_tag" VALUES(4773,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4773,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4773,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4773,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4773,'funky',1);
+INSERT INTO "remix_tag" VALUES(4773,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4773,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4773,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4773,'synth',1);
+INSERT INTO "remix_tag" VALUES(4773,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4774,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4774,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4774,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4774,'medley',1);
+INSERT INTO "remix_tag" VALUES(4774,'piano',1);
+INSERT INTO "remix_tag" VALUES(4774,'rock',1);
+INSERT INTO "remix_tag" VALUES(4774,'sad',1);
+INSERT INTO "remix_tag" VALUES(4774,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4774,'strings',1);
+INSERT INTO "remix_tag" VALUES(4774,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4775,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4775,'chill',1);
+INSERT INTO "remix_tag" VALUES(4775,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4775,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4775,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4775,'synth',1);
+INSERT INTO "remix_tag" VALUES(4775,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4776,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4776,'collab',1);
+INSERT INTO "remix_tag" VALUES(4776,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4776,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4776,'happy',1);
+INSERT INTO "remix_tag" VALUES(4776,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4776,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4776,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4776,'pop',1);
+INSERT INTO "remix_tag" VALUES(4776,'rock',1);
+INSERT INTO "remix_tag" VALUES(4776,'singing',1);
+INSERT INTO "remix_tag" VALUES(4776,'strings',1);
+INSERT INTO "remix_tag" VALUES(4776,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4776,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4777,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4777,'collab',1);
+INSERT INTO "remix_tag" VALUES(4777,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4777,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4777,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4777,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4777,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4777,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4777,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4777,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4777,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4777,'piano',1);
+INSERT INTO "remix_tag" VALUES(4777,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4777,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4777,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4777,'violin',1);
+INSERT INTO "remix_tag" VALUES(4777,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4777,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4778,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4778,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4778,'japanese',1);
+INSERT INTO "remix_tag" VALUES(4778,'koto',1);
+INSERT INTO "remix_tag" VALUES(4778,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4778,'shakuhachi',1);
+INSERT INTO "remix_tag" VALUES(4778,'shamisen',1);
+INSERT INTO "remix_tag" VALUES(4778,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4778,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4779,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4779,'bells',1);
+INSERT INTO "remix_tag" VALUES(4779,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4779,'flute',1);
+INSERT INTO "remix_tag" VALUES(4779,'harp',1);
+INSERT INTO "remix_tag" VALUES(4779,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4779,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4779,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4779,'strings',1);
+INSERT INTO "remix_tag" VALUES(4779,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4779,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4779,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4779,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4779,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4780,'chill',1);
+INSERT INTO "remix_tag" VALUES(4780,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4780,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4780,'synth',1);
+INSERT INTO "remix_tag" VALUES(4780,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4780,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4781,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4781,'electro',1);
+INSERT INTO "remix_tag" VALUES(4781,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4781,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4781,'funny',1);
+INSERT INTO "remix_tag" VALUES(4781,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4781,'synth',1);
+INSERT INTO "remix_tag" VALUES(4781,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4782,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4782,'collab',1);
+INSERT INTO "remix_tag" VALUES(4782,'compo',1);
+INSERT INTO "remix_tag" VALUES(4782,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4782,'dark',1);
+INSERT INTO "remix_tag" VALUES(4782,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4782,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4782,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4782,'metal',1);
+INSERT INTO "remix_tag" VALUES(4782,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4782,'synth',1);
+INSERT INTO "remix_tag" VALUES(4782,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4782,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4782,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4783,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4783,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4783,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4783,'synth',1);
+INSERT INTO "remix_tag" VALUES(4783,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4784,'edm',1);
+INSERT INTO "remix_tag" VALUES(4784,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4784,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4784,'funky',1);
+INSERT INTO "remix_tag" VALUES(4784,'happy',1);
+INSERT INTO "remix_tag" VALUES(4784,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(4784,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4784,'synth',1);
+INSERT INTO "remix_tag" VALUES(4784,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4785,'collab',1);
+INSERT INTO "remix_tag" VALUES(4785,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4785,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4785,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4785,'funk',1);
+INSERT INTO "remix_tag" VALUES(4785,'funky',1);
+INSERT INTO "remix_tag" VALUES(4785,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4785,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4785,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4785,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4785,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4785,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4786,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4786,'collab',1);
+INSERT INTO "remix_tag" VALUES(4786,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4786,'edm',1);
+INSERT INTO "remix_tag" VALUES(4786,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4786,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4786,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4786,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4786,'synth',1);
+INSERT INTO "remix_tag" VALUES(4786,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4787,'choir',1);
+INSERT INTO "remix_tag" VALUES(4787,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4787,'dark',1);
+INSERT INTO "remix_tag" VALUES(4787,'epic',1);
+INSERT INTO "remix_tag" VALUES(4787,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4787,'piano',1);
+INSERT INTO "remix_tag" VALUES(4787,'strings',1);
+INSERT INTO "remix_tag" VALUES(4787,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4788,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4788,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4788,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4788,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4788,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4788,'piano',1);
+INSERT INTO "remix_tag" VALUES(4788,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4788,'violin',1);
+INSERT INTO "remix_tag" VALUES(4789,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4789,'collab',1);
+INSERT INTO "remix_tag" VALUES(4789,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4789,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4789,'happy',1);
+INSERT INTO "remix_tag" VALUES(4789,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4789,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4789,'piano',1);
+INSERT INTO "remix_tag" VALUES(4789,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4789,'strings',1);
+INSERT INTO "remix_tag" VALUES(4789,'synth',1);
+INSERT INTO "remix_tag" VALUES(4789,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4790,'collab',1);
+INSERT INTO "remix_tag" VALUES(4790,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4790,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4790,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4790,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4790,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4790,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4790,'screaming',1);
+INSERT INTO "remix_tag" VALUES(4790,'singing',1);
+INSERT INTO "remix_tag" VALUES(4790,'synth',1);
+INSERT INTO "remix_tag" VALUES(4790,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4790,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4790,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4791,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4791,'collab',1);
+INSERT INTO "remix_tag" VALUES(4791,'compo',1);
+INSERT INTO "remix_tag" VALUES(4791,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4791,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4791,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4791,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4791,'metal',1);
+INSERT INTO "remix_tag" VALUES(4791,'organ',1);
+INSERT INTO "remix_tag" VALUES(4791,'rock',1);
+INSERT INTO "remix_tag" VALUES(4791,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4792,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4792,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4792,'harp',1);
+INSERT INTO "remix_tag" VALUES(4792,'sad',1);
+INSERT INTO "remix_tag" VALUES(4792,'synth',1);
+INSERT INTO "remix_tag" VALUES(4792,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4793,'brass',1);
+INSERT INTO "remix_tag" VALUES(4793,'choir',1);
+INSERT INTO "remix_tag" VALUES(4793,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4793,'collab',1);
+INSERT INTO "remix_tag" VALUES(4793,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4793,'epic',1);
+INSERT INTO "remix_tag" VALUES(4793,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4793,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4793,'medley',1);
+INSERT INTO "remix_tag" VALUES(4793,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4793,'strings',1);
+INSERT INTO "remix_tag" VALUES(4793,'synth',1);
+INSERT INTO "remix_tag" VALUES(4793,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4794,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4794,'happy',1);
+INSERT INTO "remix_tag" VALUES(4794,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4794,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4794,'strings',1);
+INSERT INTO "remix_tag" VALUES(4794,'synth',1);
+INSERT INTO "remix_tag" VALUES(4794,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4795,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4795,'chill',1);
+INSERT INTO "remix_tag" VALUES(4795,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4795,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4795,'piano',1);
+INSERT INTO "remix_tag" VALUES(4795,'synth',1);
+INSERT INTO "remix_tag" VALUES(4795,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4796,'cello',1);
+INSERT INTO "remix_tag" VALUES(4796,'chill',1);
+INSERT INTO "remix_tag" VALUES(4796,'collab',1);
+INSERT INTO "remix_tag" VALUES(4796,'dark',1);
+INSERT INTO "remix_tag" VALUES(4796,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4796,'flugelhorn',1);
+INSERT INTO "remix_tag" VALUES(4796,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4796,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4796,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4796,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4796,'oud',1);
+INSERT INTO "remix_tag" VALUES(4796,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4796,'synth',1);
+INSERT INTO "remix_tag" VALUES(4796,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4796,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4797,'brass',1);
+INSERT INTO "remix_tag" VALUES(4797,'choir',1);
+INSERT INTO "remix_tag" VALUES(4797,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4797,'epic',1);
+INSERT INTO "remix_tag" VALUES(4797,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4797,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4797,'strings',1);
+INSERT INTO "remix_tag" VALUES(4797,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4797,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4798,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4798,'funky',1);
+INSERT INTO "remix_tag" VALUES(4798,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4798,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4798,'piano',1);
+INSERT INTO "remix_tag" VALUES(4798,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4798,'synth',1);
+INSERT INTO "remix_tag" VALUES(4798,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4798,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4800,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4800,'collab',1);
+INSERT INTO "remix_tag" VALUES(4800,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4800,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4800,'jungle',1);
+INSERT INTO "remix_tag" VALUES(4800,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4800,'synth',1);
+INSERT INTO "remix_tag" VALUES(4800,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4801,'choir',1);
+INSERT INTO "remix_tag" VALUES(4801,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4801,'collab',1);
+INSERT INTO "remix_tag" VALUES(4801,'flute',1);
+INSERT INTO "remix_tag" VALUES(4801,'happy',1);
+INSERT INTO "remix_tag" VALUES(4801,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4801,'medley',1);
+INSERT INTO "remix_tag" VALUES(4801,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4801,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4801,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4801,'strings',1);
+INSERT INTO "remix_tag" VALUES(4801,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4801,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4802,'edm',1);
+INSERT INTO "remix_tag" VALUES(4802,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4802,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4802,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4802,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4802,'synth',1);
+INSERT INTO "remix_tag" VALUES(4802,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4803,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4803,'cello',1);
+INSERT INTO "remix_tag" VALUES(4803,'choir',1);
+INSERT INTO "remix_tag" VALUES(4803,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4803,'collab',1);
+INSERT INTO "remix_tag" VALUES(4803,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4803,'flute',1);
+INSERT INTO "remix_tag" VALUES(4803,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4803,'happy',1);
+INSERT INTO "remix_tag" VALUES(4803,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4803,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4803,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4803,'piano',1);
+INSERT INTO "remix_tag" VALUES(4803,'synth',1);
+INSERT INTO "remix_tag" VALUES(4803,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4803,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4803,'violin',1);
+INSERT INTO "remix_tag" VALUES(4804,'collab',1);
+INSERT INTO "remix_tag" VALUES(4804,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4804,'dark',1);
+INSERT INTO "remix_tag" VALUES(4804,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4804,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4804,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4804,'piano',1);
+INSERT INTO "remix_tag" VALUES(4804,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4804,'sad',1);
+INSERT INTO "remix_tag" VALUES(4804,'singing',1);
+INSERT INTO "remix_tag" VALUES(4804,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4804,'synth',1);
+INSERT INTO "remix_tag" VALUES(4804,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4804,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4804,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4805,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4805,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4805,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4805,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4805,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4805,'synth',1);
+INSERT INTO "remix_tag" VALUES(4805,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4806,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4806,'chill',1);
+INSERT INTO "remix_tag" VALUES(4806,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4806,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4806,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4806,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4806,'synth',1);
+INSERT INTO "remix_tag" VALUES(4806,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4807,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4807,'chill',1);
+INSERT INTO "remix_tag" VALUES(4807,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4807,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4807,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4807,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4807,'synth',1);
+INSERT INTO "remix_tag" VALUES(4807,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4808,'chill',1);
+INSERT INTO "remix_tag" VALUES(4808,'dark',1);
+INSERT INTO "remix_tag" VALUES(4808,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4808,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4808,'synth',1);
+INSERT INTO "remix_tag" VALUES(4808,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4808,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4808,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4808,'trap',1);
+INSERT INTO "remix_tag" VALUES(4809,'dark',1);
+INSERT INTO "remix_tag" VALUES(4809,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4809,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4809,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4809,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4809,'synth',1);
+INSERT INTO "remix_tag" VALUES(4809,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4809,'trap',1);
+INSERT INTO "remix_tag" VALUES(4810,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4810,'chill',1);
+INSERT INTO "remix_tag" VALUES(4810,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4810,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4810,'synth',1);
+INSERT INTO "remix_tag" VALUES(4810,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4811,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4811,'carribean',1);
+INSERT INTO "remix_tag" VALUES(4811,'collab',1);
+INSERT INTO "remix_tag" VALUES(4811,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4811,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4811,'happy',1);
+INSERT INTO "remix_tag" VALUES(4811,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4811,'medley',1);
+INSERT INTO "remix_tag" VALUES(4811,'piano',1);
+INSERT INTO "remix_tag" VALUES(4811,'ska',1);
+INSERT INTO "remix_tag" VALUES(4811,'steel-drum',1);
+INSERT INTO "remix_tag" VALUES(4811,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4811,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4811,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4812,'cello',1);
+INSERT INTO "remix_tag" VALUES(4812,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4812,'funny',1);
+INSERT INTO "remix_tag" VALUES(4812,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4812,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4812,'medley',1);
+INSERT INTO "remix_tag" VALUES(4812,'quartet',1);
+INSERT INTO "remix_tag" VALUES(4812,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4812,'strings',1);
+INSERT INTO "remix_tag" VALUES(4812,'viola',1);
+INSERT INTO "remix_tag" VALUES(4812,'violin',1);
+INSERT INTO "remix_tag" VALUES(4813,'bells',1);
+INSERT INTO "remix_tag" VALUES(4813,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4813,'collab',1);
+INSERT INTO "remix_tag" VALUES(4813,'flute',1);
+INSERT INTO "remix_tag" VALUES(4813,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4813,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4813,'sexy',1);
+INSERT INTO "remix_tag" VALUES(4813,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4813,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4813,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4814,'collab',1);
+INSERT INTO "remix_tag" VALUES(4814,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4814,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4814,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4814,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(4814,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4814,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4814,'piano',1);
+INSERT INTO "remix_tag" VALUES(4814,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4814,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4814,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4814,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4814,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4814,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4815,'collab',1);
+INSERT INTO "remix_tag" VALUES(4815,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4815,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4815,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4815,'flute',1);
+INSERT INTO "remix_tag" VALUES(4815,'happy',1);
+INSERT INTO "remix_tag" VALUES(4815,'piano',1);
+INSERT INTO "remix_tag" VALUES(4815,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4815,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4815,'violin',1);
+INSERT INTO "remix_tag" VALUES(4816,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4816,'collab',1);
+INSERT INTO "remix_tag" VALUES(4816,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4816,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4816,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4816,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4816,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4816,'metal',1);
+INSERT INTO "remix_tag" VALUES(4816,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4816,'organ',1);
+INSERT INTO "remix_tag" VALUES(4816,'piano',1);
+INSERT INTO "remix_tag" VALUES(4816,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4816,'synth',1);
+INSERT INTO "remix_tag" VALUES(4816,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4816,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4816,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4817,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4817,'bells',1);
+INSERT INTO "remix_tag" VALUES(4817,'choir',1);
+INSERT INTO "remix_tag" VALUES(4817,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4817,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4817,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4817,'strings',1);
+INSERT INTO "remix_tag" VALUES(4817,'synth',1);
+INSERT INTO "remix_tag" VALUES(4817,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4818,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4818,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4818,'cello',1);
+INSERT INTO "remix_tag" VALUES(4818,'choir',1);
+INSERT INTO "remix_tag" VALUES(4818,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4818,'collab',1);
+INSERT INTO "remix_tag" VALUES(4818,'compo',1);
+INSERT INTO "remix_tag" VALUES(4818,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4818,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4818,'epic',1);
+INSERT INTO "remix_tag" VALUES(4818,'piano',1);
+INSERT INTO "remix_tag" VALUES(4818,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4818,'strings',1);
+INSERT INTO "remix_tag" VALUES(4818,'synth',1);
+INSERT INTO "remix_tag" VALUES(4818,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4819,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4819,'collab',1);
+INSERT INTO "remix_tag" VALUES(4819,'compo',1);
+INSERT INTO "remix_tag" VALUES(4819,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4819,'edm',1);
+INSERT INTO "remix_tag" VALUES(4819,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4819,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4819,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4819,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4819,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4819,'synth',1);
+INSERT INTO "remix_tag" VALUES(4819,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4820,'dark',1);
+INSERT INTO "remix_tag" VALUES(4820,'edm',1);
+INSERT INTO "remix_tag" VALUES(4820,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4820,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4820,'synth',1);
+INSERT INTO "remix_tag" VALUES(4820,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4821,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4821,'collab',1);
+INSERT INTO "remix_tag" VALUES(4821,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4821,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4821,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4821,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4821,'metal',1);
+INSERT INTO "remix_tag" VALUES(4821,'strings',1);
+INSERT INTO "remix_tag" VALUES(4821,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4821,'violin',1);
+INSERT INTO "remix_tag" VALUES(4822,'edm',1);
+INSERT INTO "remix_tag" VALUES(4822,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4822,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4822,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4822,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(4822,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4822,'synth',1);
+INSERT INTO "remix_tag" VALUES(4822,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4823,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4823,'edm',1);
+INSERT INTO "remix_tag" VALUES(4823,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4823,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4823,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4823,'synth',1);
+INSERT INTO "remix_tag" VALUES(4823,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4823,'workout',1);
+INSERT INTO "remix_tag" VALUES(4824,'choir',1);
+INSERT INTO "remix_tag" VALUES(4824,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4824,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4824,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4824,'epic',1);
+INSERT INTO "remix_tag" VALUES(4824,'flute',1);
+INSERT INTO "remix_tag" VALUES(4824,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4824,'piano',1);
+INSERT INTO "remix_tag" VALUES(4824,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4824,'strings',1);
+INSERT INTO "remix_tag" VALUES(4824,'synth',1);
+INSERT INTO "remix_tag" VALUES(4824,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4824,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4825,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4825,'piano',1);
+INSERT INTO "remix_tag" VALUES(4825,'quirky',1);
+INSERT INTO "remix_tag" VALUES(4825,'solo',1);
+INSERT INTO "remix_tag" VALUES(4825,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4826,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4826,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4826,'flute',1);
+INSERT INTO "remix_tag" VALUES(4826,'piano',1);
+INSERT INTO "remix_tag" VALUES(4826,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4826,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4826,'synth',1);
+INSERT INTO "remix_tag" VALUES(4826,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4827,'bells',1);
+INSERT INTO "remix_tag" VALUES(4827,'brass',1);
+INSERT INTO "remix_tag" VALUES(4827,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4827,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4827,'harp',1);
+INSERT INTO "remix_tag" VALUES(4827,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4827,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4827,'strings',1);
+INSERT INTO "remix_tag" VALUES(4827,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4827,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4828,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4828,'edm',1);
+INSERT INTO "remix_tag" VALUES(4828,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4828,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4828,'funny',1);
+INSERT INTO "remix_tag" VALUES(4828,'piano',1);
+INSERT INTO "remix_tag" VALUES(4828,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4828,'synth',1);
+INSERT INTO "remix_tag" VALUES(4828,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4829,'chill',1);
+INSERT INTO "remix_tag" VALUES(4829,'collab',1);
+INSERT INTO "remix_tag" VALUES(4829,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4829,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4829,'piano',1);
+INSERT INTO "remix_tag" VALUES(4829,'synth',1);
+INSERT INTO "remix_tag" VALUES(4829,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4830,'chill',1);
+INSERT INTO "remix_tag" VALUES(4830,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4830,'funky',1);
+INSERT INTO "remix_tag" VALUES(4830,'pop',1);
+INSERT INTO "remix_tag" VALUES(4830,'synth',1);
+INSERT INTO "remix_tag" VALUES(4830,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4830,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4830,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4831,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4831,'edm',1);
+INSERT INTO "remix_tag" VALUES(4831,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4831,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4831,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4831,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4831,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4831,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4831,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4831,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4831,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4831,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4831,'synth',1);
+INSERT INTO "remix_tag" VALUES(4831,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4831,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4832,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4832,'angry',1);
+INSERT INTO "remix_tag" VALUES(4832,'collab',1);
+INSERT INTO "remix_tag" VALUES(4832,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4832,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4832,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4832,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4832,'metal',1);
+INSERT INTO "remix_tag" VALUES(4832,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4832,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4832,'timesig-7-4',1);
+INSERT INTO "remix_tag" VALUES(4832,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4832,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4832,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4833,'collab',1);
+INSERT INTO "remix_tag" VALUES(4833,'compo',1);
+INSERT INTO "remix_tag" VALUES(4833,'dark',1);
+INSERT INTO "remix_tag" VALUES(4833,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4833,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4833,'flute',1);
+INSERT INTO "remix_tag" VALUES(4833,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4833,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4833,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4833,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4833,'synth',1);
+INSERT INTO "remix_tag" VALUES(4833,'violin',1);
+INSERT INTO "remix_tag" VALUES(4834,'collab',1);
+INSERT INTO "remix_tag" VALUES(4834,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4835,'brass',1);
+INSERT INTO "remix_tag" VALUES(4835,'cello',1);
+INSERT INTO "remix_tag" VALUES(4835,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4835,'collab',1);
+INSERT INTO "remix_tag" VALUES(4835,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4835,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4835,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4835,'funny',1);
+INSERT INTO "remix_tag" VALUES(4835,'organ',1);
+INSERT INTO "remix_tag" VALUES(4835,'piano',1);
+INSERT INTO "remix_tag" VALUES(4835,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4835,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4835,'surf',1);
+INSERT INTO "remix_tag" VALUES(4835,'synth',1);
+INSERT INTO "remix_tag" VALUES(4835,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4835,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4835,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4835,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4836,'chill',1);
+INSERT INTO "remix_tag" VALUES(4836,'collab',1);
+INSERT INTO "remix_tag" VALUES(4836,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4836,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4836,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4836,'happy',1);
+INSERT INTO "remix_tag" VALUES(4836,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4836,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4836,'rock',1);
+INSERT INTO "remix_tag" VALUES(4836,'xylophone',1);
+INSERT INTO "remix_tag" VALUES(4837,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4837,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4837,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4837,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4837,'synth',1);
+INSERT INTO "remix_tag" VALUES(4837,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4838,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4838,'chill',1);
+INSERT INTO "remix_tag" VALUES(4838,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4838,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4838,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4838,'synth',1);
+INSERT INTO "remix_tag" VALUES(4838,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4838,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4839,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4839,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4839,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4839,'flute',1);
+INSERT INTO "remix_tag" VALUES(4839,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4839,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4839,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4839,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4840,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4840,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4840,'happy',1);
+INSERT INTO "remix_tag" VALUES(4840,'pop',1);
+INSERT INTO "remix_tag" VALUES(4840,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4840,'synth',1);
+INSERT INTO "remix_tag" VALUES(4840,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4841,'edm',1);
+INSERT INTO "remix_tag" VALUES(4841,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4841,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4841,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4841,'synth',1);
+INSERT INTO "remix_tag" VALUES(4841,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4841,'workout',1);
+INSERT INTO "remix_tag" VALUES(4842,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4842,'chill',1);
+INSERT INTO "remix_tag" VALUES(4842,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4842,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4842,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4842,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4842,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4842,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4842,'synth',1);
+INSERT INTO "remix_tag" VALUES(4843,'dark',1);
+INSERT INTO "remix_tag" VALUES(4843,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4843,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4843,'synth',1);
+INSERT INTO "remix_tag" VALUES(4843,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4843,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4844,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4844,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4844,'collab',1);
+INSERT INTO "remix_tag" VALUES(4844,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4844,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4844,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4844,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4844,'lyrics-explicit',1);
+INSERT INTO "remix_tag" VALUES(4844,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4844,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4844,'singing',1);
+INSERT INTO "remix_tag" VALUES(4844,'synth',1);
+INSERT INTO "remix_tag" VALUES(4844,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4844,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4844,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4845,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4845,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4845,'edm',1);
+INSERT INTO "remix_tag" VALUES(4845,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4845,'synth',1);
+INSERT INTO "remix_tag" VALUES(4845,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4845,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4846,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4846,'funky',1);
+INSERT INTO "remix_tag" VALUES(4846,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4846,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4846,'synth',1);
+INSERT INTO "remix_tag" VALUES(4846,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4846,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4846,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4847,'collab',1);
+INSERT INTO "remix_tag" VALUES(4847,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4847,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4847,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4847,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4847,'synth',1);
+INSERT INTO "remix_tag" VALUES(4848,'choir',1);
+INSERT INTO "remix_tag" VALUES(4848,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4848,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4848,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4848,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4848,'medley',1);
+INSERT INTO "remix_tag" VALUES(4848,'rock',1);
+INSERT INTO "remix_tag" VALUES(4848,'strings',1);
+INSERT INTO "remix_tag" VALUES(4848,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4849,'chill',1);
+INSERT INTO "remix_tag" VALUES(4849,'easy-listening',1);
+INSERT INTO "remix_tag" VALUES(4849,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4849,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4849,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4849,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4849,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4849,'synth',1);
+INSERT INTO "remix_tag" VALUES(4849,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4849,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4849,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4850,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4850,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4850,'piano',1);
+INSERT INTO "remix_tag" VALUES(4850,'solo',1);
+INSERT INTO "remix_tag" VALUES(4850,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4850,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4851,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4851,'dark',1);
+INSERT INTO "remix_tag" VALUES(4851,'edm',1);
+INSERT INTO "remix_tag" VALUES(4851,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4851,'synth',1);
+INSERT INTO "remix_tag" VALUES(4851,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4852,'collab',1);
+INSERT INTO "remix_tag" VALUES(4852,'dark',1);
+INSERT INTO "remix_tag" VALUES(4852,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4852,'edm',1);
+INSERT INTO "remix_tag" VALUES(4852,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4852,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4852,'synth',1);
+INSERT INTO "remix_tag" VALUES(4852,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4852,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4853,'dark',1);
+INSERT INTO "remix_tag" VALUES(4853,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4853,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4853,'synth',1);
+INSERT INTO "remix_tag" VALUES(4853,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4853,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4853,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4853,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(4853,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4854,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4854,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4854,'collab',1);
+INSERT INTO "remix_tag" VALUES(4854,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4854,'epic',1);
+INSERT INTO "remix_tag" VALUES(4854,'flute',1);
+INSERT INTO "remix_tag" VALUES(4854,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4854,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4854,'organ',1);
+INSERT INTO "remix_tag" VALUES(4854,'rock',1);
+INSERT INTO "remix_tag" VALUES(4854,'singing',1);
+INSERT INTO "remix_tag" VALUES(4854,'synth',1);
+INSERT INTO "remix_tag" VALUES(4854,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4854,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4854,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4855,'collab',1);
+INSERT INTO "remix_tag" VALUES(4855,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4855,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4855,'happy',1);
+INSERT INTO "remix_tag" VALUES(4855,'piano',1);
+INSERT INTO "remix_tag" VALUES(4855,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4855,'synth',1);
+INSERT INTO "remix_tag" VALUES(4855,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4856,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4856,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4856,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4856,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4856,'synth',1);
+INSERT INTO "remix_tag" VALUES(4856,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4857,'collab',1);
+INSERT INTO "remix_tag" VALUES(4857,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4857,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4857,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4857,'funky',1);
+INSERT INTO "remix_tag" VALUES(4857,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4857,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4857,'medley',1);
+INSERT INTO "remix_tag" VALUES(4857,'organ',1);
+INSERT INTO "remix_tag" VALUES(4857,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4857,'synth',1);
+INSERT INTO "remix_tag" VALUES(4857,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4858,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4858,'collab',1);
+INSERT INTO "remix_tag" VALUES(4858,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4858,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4858,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4858,'epic',1);
+INSERT INTO "remix_tag" VALUES(4858,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4858,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(4858,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4858,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4858,'piano',1);
+INSERT INTO "remix_tag" VALUES(4858,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4858,'strings',1);
+INSERT INTO "remix_tag" VALUES(4858,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4858,'violin',1);
+INSERT INTO "remix_tag" VALUES(4858,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4859,'dark',1);
+INSERT INTO "remix_tag" VALUES(4859,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4859,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4859,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4859,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4859,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4859,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4859,'synth',1);
+INSERT INTO "remix_tag" VALUES(4859,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4860,'classical',1);
+INSERT INTO "remix_tag" VALUES(4860,'piano',1);
+INSERT INTO "remix_tag" VALUES(4860,'sad',1);
+INSERT INTO "remix_tag" VALUES(4860,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4860,'solo',1);
+INSERT INTO "remix_tag" VALUES(4860,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4860,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4861,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4861,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4861,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4861,'organ',1);
+INSERT INTO "remix_tag" VALUES(4861,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4861,'synth',1);
+INSERT INTO "remix_tag" VALUES(4861,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4862,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4862,'collab',1);
+INSERT INTO "remix_tag" VALUES(4862,'dark',1);
+INSERT INTO "remix_tag" VALUES(4862,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4862,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4862,'strings',1);
+INSERT INTO "remix_tag" VALUES(4862,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4862,'synth',1);
+INSERT INTO "remix_tag" VALUES(4862,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4862,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4863,'collab',1);
+INSERT INTO "remix_tag" VALUES(4863,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4863,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4863,'happy-hardcore',1);
+INSERT INTO "remix_tag" VALUES(4863,'piano',1);
+INSERT INTO "remix_tag" VALUES(4863,'synth',1);
+INSERT INTO "remix_tag" VALUES(4863,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4863,'trance',1);
+INSERT INTO "remix_tag" VALUES(4864,'collab',1);
+INSERT INTO "remix_tag" VALUES(4864,'edm',1);
+INSERT INTO "remix_tag" VALUES(4864,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4864,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4864,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4864,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4864,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4864,'synth',1);
+INSERT INTO "remix_tag" VALUES(4864,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4864,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4864,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4864,'workout',1);
+INSERT INTO "remix_tag" VALUES(4865,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4865,'cello',1);
+INSERT INTO "remix_tag" VALUES(4865,'collab',1);
+INSERT INTO "remix_tag" VALUES(4865,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4865,'flute',1);
+INSERT INTO "remix_tag" VALUES(4865,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4865,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4865,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4865,'pop',1);
+INSERT INTO "remix_tag" VALUES(4865,'rock',1);
+INSERT INTO "remix_tag" VALUES(4865,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4865,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4865,'viola',1);
+INSERT INTO "remix_tag" VALUES(4865,'violin',1);
+INSERT INTO "remix_tag" VALUES(4865,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4866,'brass',1);
+INSERT INTO "remix_tag" VALUES(4866,'choir',1);
+INSERT INTO "remix_tag" VALUES(4866,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4866,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4866,'epic',1);
+INSERT INTO "remix_tag" VALUES(4866,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4866,'strings',1);
+INSERT INTO "remix_tag" VALUES(4866,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4866,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4867,'dark',1);
+INSERT INTO "remix_tag" VALUES(4867,'distortion',1);
+INSERT INTO "remix_tag" VALUES(4867,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4867,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4867,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4867,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4867,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4867,'metal',1);
+INSERT INTO "remix_tag" VALUES(4867,'piano',1);
+INSERT INTO "remix_tag" VALUES(4867,'sad',1);
+INSERT INTO "remix_tag" VALUES(4867,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4867,'synth',1);
+INSERT INTO "remix_tag" VALUES(4867,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4868,'accordion',1);
+INSERT INTO "remix_tag" VALUES(4868,'collab',1);
+INSERT INTO "remix_tag" VALUES(4868,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4868,'goofy',1);
+INSERT INTO "remix_tag" VALUES(4868,'happy',1);
+INSERT INTO "remix_tag" VALUES(4868,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4868,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4868,'medley',1);
+INSERT INTO "remix_tag" VALUES(4868,'singing',1);
+INSERT INTO "remix_tag" VALUES(4868,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4868,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4868,'viola',1);
+INSERT INTO "remix_tag" VALUES(4868,'violin',1);
+INSERT INTO "remix_tag" VALUES(4868,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4868,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4868,'vocals-voice-acting',1);
+INSERT INTO "remix_tag" VALUES(4869,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4869,'collab',1);
+INSERT INTO "remix_tag" VALUES(4869,'dark',1);
+INSERT INTO "remix_tag" VALUES(4869,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4869,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4869,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4869,'piano',1);
+INSERT INTO "remix_tag" VALUES(4869,'sad',1);
+INSERT INTO "remix_tag" VALUES(4869,'strings',1);
+INSERT INTO "remix_tag" VALUES(4869,'synth',1);
+INSERT INTO "remix_tag" VALUES(4869,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4869,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4870,'dark',1);
+INSERT INTO "remix_tag" VALUES(4870,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4870,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4870,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4870,'synth',1);
+INSERT INTO "remix_tag" VALUES(4870,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4870,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4870,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4870,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4871,'collab',1);
+INSERT INTO "remix_tag" VALUES(4871,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4871,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4871,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4871,'funky',1);
+INSERT INTO "remix_tag" VALUES(4871,'piano',1);
+INSERT INTO "remix_tag" VALUES(4871,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4871,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4871,'synth',1);
+INSERT INTO "remix_tag" VALUES(4871,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4871,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(4871,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4871,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4872,'choir',1);
+INSERT INTO "remix_tag" VALUES(4872,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4872,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4872,'collab',1);
+INSERT INTO "remix_tag" VALUES(4872,'flute',1);
+INSERT INTO "remix_tag" VALUES(4872,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4872,'medley',1);
+INSERT INTO "remix_tag" VALUES(4872,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4872,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4872,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4872,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4872,'strings',1);
+INSERT INTO "remix_tag" VALUES(4872,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4873,'dance',1);
+INSERT INTO "remix_tag" VALUES(4873,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4873,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4873,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4873,'funky',1);
+INSERT INTO "remix_tag" VALUES(4873,'piano',1);
+INSERT INTO "remix_tag" VALUES(4873,'synth',1);
+INSERT INTO "remix_tag" VALUES(4873,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4873,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4874,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4874,'happy',1);
+INSERT INTO "remix_tag" VALUES(4874,'piano',1);
+INSERT INTO "remix_tag" VALUES(4874,'solo',1);
+INSERT INTO "remix_tag" VALUES(4874,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4874,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4875,'chill',1);
+INSERT INTO "remix_tag" VALUES(4875,'collab',1);
+INSERT INTO "remix_tag" VALUES(4875,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4875,'synth',1);
+INSERT INTO "remix_tag" VALUES(4875,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4875,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4875,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4876,'piano',1);
+INSERT INTO "remix_tag" VALUES(4876,'solo',1);
+INSERT INTO "remix_tag" VALUES(4876,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4877,'brass',1);
+INSERT INTO "remix_tag" VALUES(4877,'collab',1);
+INSERT INTO "remix_tag" VALUES(4877,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4877,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4877,'piano',1);
+INSERT INTO "remix_tag" VALUES(4877,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4877,'synth',1);
+INSERT INTO "remix_tag" VALUES(4877,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4878,'choir',1);
+INSERT INTO "remix_tag" VALUES(4878,'dark',1);
+INSERT INTO "remix_tag" VALUES(4878,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4878,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4878,'synth',1);
+INSERT INTO "remix_tag" VALUES(4878,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4878,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4879,'collab',1);
+INSERT INTO "remix_tag" VALUES(4879,'compo',1);
+INSERT INTO "remix_tag" VALUES(4879,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4880,'dark',1);
+INSERT INTO "remix_tag" VALUES(4880,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4880,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4880,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4880,'metal',1);
+INSERT INTO "remix_tag" VALUES(4880,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4880,'workout',1);
+INSERT INTO "remix_tag" VALUES(4881,'collab',1);
+INSERT INTO "remix_tag" VALUES(4881,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4881,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4881,'happy',1);
+INSERT INTO "remix_tag" VALUES(4881,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4881,'live-recording',1);
+INSERT INTO "remix_tag" VALUES(4881,'organ',1);
+INSERT INTO "remix_tag" VALUES(4881,'surf',1);
+INSERT INTO "remix_tag" VALUES(4881,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4882,'bells',1);
+INSERT INTO "remix_tag" VALUES(4882,'dance',1);
+INSERT INTO "remix_tag" VALUES(4882,'dark',1);
+INSERT INTO "remix_tag" VALUES(4882,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4882,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4882,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4882,'minimalist',1);
+INSERT INTO "remix_tag" VALUES(4882,'synth',1);
+INSERT INTO "remix_tag" VALUES(4882,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4883,'choir',1);
+INSERT INTO "remix_tag" VALUES(4883,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4883,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4883,'collab',1);
+INSERT INTO "remix_tag" VALUES(4883,'flute',1);
+INSERT INTO "remix_tag" VALUES(4883,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4883,'medley',1);
+INSERT INTO "remix_tag" VALUES(4883,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4883,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4883,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4883,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4883,'strings',1);
+INSERT INTO "remix_tag" VALUES(4883,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4884,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4884,'cello',1);
+INSERT INTO "remix_tag" VALUES(4884,'collab',1);
+INSERT INTO "remix_tag" VALUES(4884,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4884,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4884,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4884,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4884,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4884,'synth',1);
+INSERT INTO "remix_tag" VALUES(4884,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4885,'edm',1);
+INSERT INTO "remix_tag" VALUES(4885,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4885,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4885,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4885,'synth',1);
+INSERT INTO "remix_tag" VALUES(4885,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4886,'chill',1);
+INSERT INTO "remix_tag" VALUES(4886,'collab',1);
+INSERT INTO "remix_tag" VALUES(4886,'dark',1);
+INSERT INTO "remix_tag" VALUES(4886,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4886,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4886,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4886,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4886,'medley',1);
+INSERT INTO "remix_tag" VALUES(4886,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4886,'piano',1);
+INSERT INTO "remix_tag" VALUES(4886,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4886,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4887,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4887,'brass',1);
+INSERT INTO "remix_tag" VALUES(4887,'cello',1);
+INSERT INTO "remix_tag" VALUES(4887,'choir',1);
+INSERT INTO "remix_tag" VALUES(4887,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4887,'collab',1);
+INSERT INTO "remix_tag" VALUES(4887,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4887,'dark',1);
+INSERT INTO "remix_tag" VALUES(4887,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4887,'epic',1);
+INSERT INTO "remix_tag" VALUES(4887,'flute',1);
+INSERT INTO "remix_tag" VALUES(4887,'french-horn',1);
+INSERT INTO "remix_tag" VALUES(4887,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4887,'harp',1);
+INSERT INTO "remix_tag" VALUES(4887,'lang-latin',1);
+INSERT INTO "remix_tag" VALUES(4887,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4887,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4887,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4887,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4887,'sad',1);
+INSERT INTO "remix_tag" VALUES(4887,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4887,'strings',1);
+INSERT INTO "remix_tag" VALUES(4887,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4887,'trombone',1);
+INSERT INTO "remix_tag" VALUES(4887,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4887,'viola',1);
+INSERT INTO "remix_tag" VALUES(4887,'violin',1);
+INSERT INTO "remix_tag" VALUES(4887,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4888,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4888,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4888,'collab',1);
+INSERT INTO "remix_tag" VALUES(4888,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4888,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4888,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4888,'strings',1);
+INSERT INTO "remix_tag" VALUES(4888,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4888,'world',1);
+INSERT INTO "remix_tag" VALUES(4889,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4889,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4889,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4889,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4889,'piano',1);
+INSERT INTO "remix_tag" VALUES(4889,'rock',1);
+INSERT INTO "remix_tag" VALUES(4889,'spooky',1);
+INSERT INTO "remix_tag" VALUES(4889,'strings',1);
+INSERT INTO "remix_tag" VALUES(4889,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4889,'synth',1);
+INSERT INTO "remix_tag" VALUES(4889,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4890,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4890,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4890,'dark',1);
+INSERT INTO "remix_tag" VALUES(4890,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4890,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4890,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4890,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4890,'synth',1);
+INSERT INTO "remix_tag" VALUES(4890,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4891,'collab',1);
+INSERT INTO "remix_tag" VALUES(4891,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4891,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4891,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4891,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4891,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4891,'rock',1);
+INSERT INTO "remix_tag" VALUES(4891,'synth',1);
+INSERT INTO "remix_tag" VALUES(4891,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4891,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4892,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4892,'bells',1);
+INSERT INTO "remix_tag" VALUES(4892,'choir',1);
+INSERT INTO "remix_tag" VALUES(4892,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4892,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4892,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4892,'piano',1);
+INSERT INTO "remix_tag" VALUES(4892,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4892,'strings',1);
+INSERT INTO "remix_tag" VALUES(4892,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4893,'chill',1);
+INSERT INTO "remix_tag" VALUES(4893,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4893,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4893,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4893,'medley',1);
+INSERT INTO "remix_tag" VALUES(4893,'piano',1);
+INSERT INTO "remix_tag" VALUES(4893,'synth',1);
+INSERT INTO "remix_tag" VALUES(4894,'collab',1);
+INSERT INTO "remix_tag" VALUES(4894,'dark',1);
+INSERT INTO "remix_tag" VALUES(4894,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4894,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4894,'piano',1);
+INSERT INTO "remix_tag" VALUES(4894,'strings',1);
+INSERT INTO "remix_tag" VALUES(4894,'synth',1);
+INSERT INTO "remix_tag" VALUES(4894,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4894,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4894,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4895,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4895,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4895,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4895,'funky',1);
+INSERT INTO "remix_tag" VALUES(4895,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4895,'piano',1);
+INSERT INTO "remix_tag" VALUES(4895,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4895,'strings',1);
+INSERT INTO "remix_tag" VALUES(4895,'synth',1);
+INSERT INTO "remix_tag" VALUES(4895,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4896,'chill',1);
+INSERT INTO "remix_tag" VALUES(4896,'dub',1);
+INSERT INTO "remix_tag" VALUES(4896,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4896,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4896,'happy',1);
+INSERT INTO "remix_tag" VALUES(4896,'organ',1);
+INSERT INTO "remix_tag" VALUES(4896,'reggae',1);
+INSERT INTO "remix_tag" VALUES(4896,'synth',1);
+INSERT INTO "remix_tag" VALUES(4896,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4897,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4897,'chill',1);
+INSERT INTO "remix_tag" VALUES(4897,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4897,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4897,'synth',1);
+INSERT INTO "remix_tag" VALUES(4897,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4897,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4898,'brass',1);
+INSERT INTO "remix_tag" VALUES(4898,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4898,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4898,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4898,'strings',1);
+INSERT INTO "remix_tag" VALUES(4898,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4898,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4899,'chill',1);
+INSERT INTO "remix_tag" VALUES(4899,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4899,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4899,'glitch-hop',1);
+INSERT INTO "remix_tag" VALUES(4899,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4899,'piano',1);
+INSERT INTO "remix_tag" VALUES(4899,'synth',1);
+INSERT INTO "remix_tag" VALUES(4899,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4900,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4900,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4900,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4900,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4900,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4900,'piano',1);
+INSERT INTO "remix_tag" VALUES(4900,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4900,'synth',1);
+INSERT INTO "remix_tag" VALUES(4900,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4901,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4901,'collab',1);
+INSERT INTO "remix_tag" VALUES(4901,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4901,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4901,'funky',1);
+INSERT INTO "remix_tag" VALUES(4901,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4901,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4901,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4901,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4901,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4901,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4901,'viola',1);
+INSERT INTO "remix_tag" VALUES(4901,'violin',1);
+INSERT INTO "remix_tag" VALUES(4902,'brass',1);
+INSERT INTO "remix_tag" VALUES(4902,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4902,'flute',1);
+INSERT INTO "remix_tag" VALUES(4902,'harp',1);
+INSERT INTO "remix_tag" VALUES(4902,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4902,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4902,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4902,'sad',1);
+INSERT INTO "remix_tag" VALUES(4902,'strings',1);
+INSERT INTO "remix_tag" VALUES(4902,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4902,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4902,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4902,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4903,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4903,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4903,'synth',1);
+INSERT INTO "remix_tag" VALUES(4903,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4903,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4904,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4904,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4904,'chill',1);
+INSERT INTO "remix_tag" VALUES(4904,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4904,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4904,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4904,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4904,'world',1);
+INSERT INTO "remix_tag" VALUES(4905,'dance',1);
+INSERT INTO "remix_tag" VALUES(4905,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4905,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4905,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4905,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4905,'synth',1);
+INSERT INTO "remix_tag" VALUES(4905,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4906,'chill',1);
+INSERT INTO "remix_tag" VALUES(4906,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4906,'flute',1);
+INSERT INTO "remix_tag" VALUES(4906,'harp',1);
+INSERT INTO "remix_tag" VALUES(4906,'piano',1);
+INSERT INTO "remix_tag" VALUES(4906,'strings',1);
+INSERT INTO "remix_tag" VALUES(4906,'synth',1);
+INSERT INTO "remix_tag" VALUES(4906,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4907,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4907,'edm',1);
+INSERT INTO "remix_tag" VALUES(4907,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4907,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4907,'synth',1);
+INSERT INTO "remix_tag" VALUES(4907,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4908,'ballad',1);
+INSERT INTO "remix_tag" VALUES(4908,'chill',1);
+INSERT INTO "remix_tag" VALUES(4908,'collab',1);
+INSERT INTO "remix_tag" VALUES(4908,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4908,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4908,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4908,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4908,'rock',1);
+INSERT INTO "remix_tag" VALUES(4908,'synth',1);
+INSERT INTO "remix_tag" VALUES(4908,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4909,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4909,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4909,'happy',1);
+INSERT INTO "remix_tag" VALUES(4909,'piano',1);
+INSERT INTO "remix_tag" VALUES(4909,'strings',1);
+INSERT INTO "remix_tag" VALUES(4909,'synth',1);
+INSERT INTO "remix_tag" VALUES(4909,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4909,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(4909,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4909,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4910,'choir',1);
+INSERT INTO "remix_tag" VALUES(4910,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4910,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4910,'collab',1);
+INSERT INTO "remix_tag" VALUES(4910,'flute',1);
+INSERT INTO "remix_tag" VALUES(4910,'medley',1);
+INSERT INTO "remix_tag" VALUES(4910,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4910,'oboe',1);
+INSERT INTO "remix_tag" VALUES(4910,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4910,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4910,'strings',1);
+INSERT INTO "remix_tag" VALUES(4910,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4911,'angry',1);
+INSERT INTO "remix_tag" VALUES(4911,'collab',1);
+INSERT INTO "remix_tag" VALUES(4911,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4911,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4911,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4911,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4911,'metal',1);
+INSERT INTO "remix_tag" VALUES(4911,'piano',1);
+INSERT INTO "remix_tag" VALUES(4911,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4911,'sad',1);
+INSERT INTO "remix_tag" VALUES(4911,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4911,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4911,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4911,'violin',1);
+INSERT INTO "remix_tag" VALUES(4912,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4912,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4912,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4912,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4912,'funky',1);
+INSERT INTO "remix_tag" VALUES(4912,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4912,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4912,'organ',1);
+INSERT INTO "remix_tag" VALUES(4912,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4912,'synth',1);
+INSERT INTO "remix_tag" VALUES(4912,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4913,'chill',1);
+INSERT INTO "remix_tag" VALUES(4913,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4913,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4913,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4913,'piano',1);
+INSERT INTO "remix_tag" VALUES(4913,'synth',1);
+INSERT INTO "remix_tag" VALUES(4913,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4913,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4914,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4914,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4914,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4914,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4914,'synth',1);
+INSERT INTO "remix_tag" VALUES(4914,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4914,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4915,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4915,'epic',1);
+INSERT INTO "remix_tag" VALUES(4915,'medley',1);
+INSERT INTO "remix_tag" VALUES(4915,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4915,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4915,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4916,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4916,'bells',1);
+INSERT INTO "remix_tag" VALUES(4916,'chill',1);
+INSERT INTO "remix_tag" VALUES(4916,'happy',1);
+INSERT INTO "remix_tag" VALUES(4916,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4916,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4916,'piano',1);
+INSERT INTO "remix_tag" VALUES(4916,'synth',1);
+INSERT INTO "remix_tag" VALUES(4916,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4917,'cello',1);
+INSERT INTO "remix_tag" VALUES(4917,'choir',1);
+INSERT INTO "remix_tag" VALUES(4917,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4917,'dark',1);
+INSERT INTO "remix_tag" VALUES(4917,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4917,'piano',1);
+INSERT INTO "remix_tag" VALUES(4917,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4917,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4917,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4918,'collab',1);
+INSERT INTO "remix_tag" VALUES(4918,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4918,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4918,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4918,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4918,'metal',1);
+INSERT INTO "remix_tag" VALUES(4918,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4918,'synth',1);
+INSERT INTO "remix_tag" VALUES(4918,'workout',1);
+INSERT INTO "remix_tag" VALUES(4919,'chill',1);
+INSERT INTO "remix_tag" VALUES(4919,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4919,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4919,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4919,'synth',1);
+INSERT INTO "remix_tag" VALUES(4919,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4919,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4920,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4920,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4920,'dance',1);
+INSERT INTO "remix_tag" VALUES(4920,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4920,'flute',1);
+INSERT INTO "remix_tag" VALUES(4920,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4920,'middle-eastern',1);
+INSERT INTO "remix_tag" VALUES(4920,'organ',1);
+INSERT INTO "remix_tag" VALUES(4920,'strings',1);
+INSERT INTO "remix_tag" VALUES(4920,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4921,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4921,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4921,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4921,'happy',1);
+INSERT INTO "remix_tag" VALUES(4921,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4921,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4921,'synth',1);
+INSERT INTO "remix_tag" VALUES(4921,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4922,'collab',1);
+INSERT INTO "remix_tag" VALUES(4922,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4922,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4923,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4923,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4923,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4923,'flute',1);
+INSERT INTO "remix_tag" VALUES(4923,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4923,'metal',1);
+INSERT INTO "remix_tag" VALUES(4923,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4923,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(4923,'strings',1);
+INSERT INTO "remix_tag" VALUES(4923,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4923,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4923,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4924,'collab',1);
+INSERT INTO "remix_tag" VALUES(4924,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4924,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4924,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4924,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4924,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4924,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4924,'metal',1);
+INSERT INTO "remix_tag" VALUES(4924,'rock',1);
+INSERT INTO "remix_tag" VALUES(4924,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4924,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4925,'chill',1);
+INSERT INTO "remix_tag" VALUES(4925,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4925,'piano',1);
+INSERT INTO "remix_tag" VALUES(4925,'synth',1);
+INSERT INTO "remix_tag" VALUES(4925,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4925,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4925,'vibraphone',1);
+INSERT INTO "remix_tag" VALUES(4926,'piano',1);
+INSERT INTO "remix_tag" VALUES(4926,'solo',1);
+INSERT INTO "remix_tag" VALUES(4926,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(4926,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4927,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4927,'bossa-nova',1);
+INSERT INTO "remix_tag" VALUES(4927,'chill',1);
+INSERT INTO "remix_tag" VALUES(4927,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4927,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4927,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4927,'organ',1);
+INSERT INTO "remix_tag" VALUES(4927,'piano',1);
+INSERT INTO "remix_tag" VALUES(4927,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4928,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4928,'cello',1);
+INSERT INTO "remix_tag" VALUES(4928,'chill',1);
+INSERT INTO "remix_tag" VALUES(4928,'collab',1);
+INSERT INTO "remix_tag" VALUES(4928,'flute',1);
+INSERT INTO "remix_tag" VALUES(4928,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4928,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4928,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4928,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4928,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4928,'synth',1);
+INSERT INTO "remix_tag" VALUES(4928,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4929,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4929,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4929,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4929,'metal',1);
+INSERT INTO "remix_tag" VALUES(4929,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4929,'workout',1);
+INSERT INTO "remix_tag" VALUES(4930,'collab',1);
+INSERT INTO "remix_tag" VALUES(4930,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4930,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4930,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4930,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4930,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4930,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4930,'rock',1);
+INSERT INTO "remix_tag" VALUES(4930,'synth',1);
+INSERT INTO "remix_tag" VALUES(4930,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4931,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4931,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4931,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4931,'synth',1);
+INSERT INTO "remix_tag" VALUES(4931,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4932,'chill',1);
+INSERT INTO "remix_tag" VALUES(4932,'collab',1);
+INSERT INTO "remix_tag" VALUES(4932,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4932,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4932,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4932,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4932,'synth',1);
+INSERT INTO "remix_tag" VALUES(4932,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4932,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4933,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4933,'dark',1);
+INSERT INTO "remix_tag" VALUES(4933,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4933,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4933,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4933,'piano',1);
+INSERT INTO "remix_tag" VALUES(4933,'synth',1);
+INSERT INTO "remix_tag" VALUES(4934,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4934,'duration-long',1);
+INSERT INTO "remix_tag" VALUES(4934,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4934,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4934,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4934,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4934,'synth',1);
+INSERT INTO "remix_tag" VALUES(4935,'brass',1);
+INSERT INTO "remix_tag" VALUES(4935,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4935,'collab',1);
+INSERT INTO "remix_tag" VALUES(4935,'folk',1);
+INSERT INTO "remix_tag" VALUES(4935,'happy',1);
+INSERT INTO "remix_tag" VALUES(4935,'medley',1);
+INSERT INTO "remix_tag" VALUES(4935,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4935,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4935,'strings',1);
+INSERT INTO "remix_tag" VALUES(4935,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4935,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4935,'violin',1);
+INSERT INTO "remix_tag" VALUES(4935,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4936,'chill',1);
+INSERT INTO "remix_tag" VALUES(4936,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4936,'synth',1);
+INSERT INTO "remix_tag" VALUES(4936,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4936,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4937,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4937,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4937,'collab',1);
+INSERT INTO "remix_tag" VALUES(4937,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4937,'latin',1);
+INSERT INTO "remix_tag" VALUES(4937,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4937,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4937,'violin',1);
+INSERT INTO "remix_tag" VALUES(4938,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4938,'collab',1);
+INSERT INTO "remix_tag" VALUES(4938,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4938,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4938,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4938,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4938,'koto',1);
+INSERT INTO "remix_tag" VALUES(4938,'lang-japanese',1);
+INSERT INTO "remix_tag" VALUES(4938,'lang-original',1);
+INSERT INTO "remix_tag" VALUES(4938,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4938,'shakuhachi',1);
+INSERT INTO "remix_tag" VALUES(4938,'singing',1);
+INSERT INTO "remix_tag" VALUES(4938,'strings',1);
+INSERT INTO "remix_tag" VALUES(4938,'synth',1);
+INSERT INTO "remix_tag" VALUES(4938,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4939,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4939,'collab',1);
+INSERT INTO "remix_tag" VALUES(4939,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4939,'dark',1);
+INSERT INTO "remix_tag" VALUES(4939,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4939,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4939,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4939,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(4939,'metal',1);
+INSERT INTO "remix_tag" VALUES(4939,'organ',1);
+INSERT INTO "remix_tag" VALUES(4939,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4939,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4940,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4940,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4940,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4940,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4940,'marimba',1);
+INSERT INTO "remix_tag" VALUES(4940,'piano',1);
+INSERT INTO "remix_tag" VALUES(4940,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4940,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4941,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4941,'collab',1);
+INSERT INTO "remix_tag" VALUES(4941,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4941,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4941,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4941,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4941,'metal',1);
+INSERT INTO "remix_tag" VALUES(4941,'organ',1);
+INSERT INTO "remix_tag" VALUES(4941,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4941,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4941,'synth',1);
+INSERT INTO "remix_tag" VALUES(4941,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4941,'workout',1);
+INSERT INTO "remix_tag" VALUES(4942,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4942,'dark',1);
+INSERT INTO "remix_tag" VALUES(4942,'edm',1);
+INSERT INTO "remix_tag" VALUES(4942,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4942,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4942,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4942,'piano',1);
+INSERT INTO "remix_tag" VALUES(4942,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4942,'synth',1);
+INSERT INTO "remix_tag" VALUES(4942,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4943,'collab',1);
+INSERT INTO "remix_tag" VALUES(4943,'dark',1);
+INSERT INTO "remix_tag" VALUES(4943,'detuning',1);
+INSERT INTO "remix_tag" VALUES(4943,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4943,'edm',1);
+INSERT INTO "remix_tag" VALUES(4943,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4943,'happy',1);
+INSERT INTO "remix_tag" VALUES(4943,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4943,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4943,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4943,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4943,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4944,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4944,'collab',1);
+INSERT INTO "remix_tag" VALUES(4944,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4944,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4944,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4944,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4944,'medley',1);
+INSERT INTO "remix_tag" VALUES(4944,'metal',1);
+INSERT INTO "remix_tag" VALUES(4944,'organ',1);
+INSERT INTO "remix_tag" VALUES(4944,'screaming',1);
+INSERT INTO "remix_tag" VALUES(4944,'singing',1);
+INSERT INTO "remix_tag" VALUES(4944,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4944,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4944,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4944,'vocals-metal',1);
+INSERT INTO "remix_tag" VALUES(4945,'dark',1);
+INSERT INTO "remix_tag" VALUES(4945,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4945,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4945,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4945,'metal',1);
+INSERT INTO "remix_tag" VALUES(4945,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4945,'suspenseful',1);
+INSERT INTO "remix_tag" VALUES(4945,'synth',1);
+INSERT INTO "remix_tag" VALUES(4945,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4946,'chill',1);
+INSERT INTO "remix_tag" VALUES(4946,'collab',1);
+INSERT INTO "remix_tag" VALUES(4946,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4946,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4946,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4946,'piano',1);
+INSERT INTO "remix_tag" VALUES(4946,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4946,'swing',1);
+INSERT INTO "remix_tag" VALUES(4946,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4947,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4947,'collab',1);
+INSERT INTO "remix_tag" VALUES(4947,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4947,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4947,'metal',1);
+INSERT INTO "remix_tag" VALUES(4947,'organ',1);
+INSERT INTO "remix_tag" VALUES(4947,'piano',1);
+INSERT INTO "remix_tag" VALUES(4947,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4947,'synth',1);
+INSERT INTO "remix_tag" VALUES(4947,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4948,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4948,'happy',1);
+INSERT INTO "remix_tag" VALUES(4948,'piano',1);
+INSERT INTO "remix_tag" VALUES(4948,'strings',1);
+INSERT INTO "remix_tag" VALUES(4948,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4948,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4949,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4949,'dark',1);
+INSERT INTO "remix_tag" VALUES(4949,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4949,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4949,'glitching',1);
+INSERT INTO "remix_tag" VALUES(4949,'metal',1);
+INSERT INTO "remix_tag" VALUES(4949,'organ',1);
+INSERT INTO "remix_tag" VALUES(4949,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4949,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4949,'synth',1);
+INSERT INTO "remix_tag" VALUES(4949,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4950,'cello',1);
+INSERT INTO "remix_tag" VALUES(4950,'chill',1);
+INSERT INTO "remix_tag" VALUES(4950,'collab',1);
+INSERT INTO "remix_tag" VALUES(4950,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4950,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4950,'synth',1);
+INSERT INTO "remix_tag" VALUES(4950,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4951,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4951,'collab',1);
+INSERT INTO "remix_tag" VALUES(4951,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4951,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4951,'epic',1);
+INSERT INTO "remix_tag" VALUES(4951,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4951,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4951,'piano',1);
+INSERT INTO "remix_tag" VALUES(4951,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4951,'singing',1);
+INSERT INTO "remix_tag" VALUES(4951,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4951,'viola',1);
+INSERT INTO "remix_tag" VALUES(4951,'violin',1);
+INSERT INTO "remix_tag" VALUES(4951,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4952,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4952,'duration-short',1);
+INSERT INTO "remix_tag" VALUES(4952,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4952,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4952,'flute',1);
+INSERT INTO "remix_tag" VALUES(4952,'folk',1);
+INSERT INTO "remix_tag" VALUES(4952,'metal',1);
+INSERT INTO "remix_tag" VALUES(4952,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4952,'violin',1);
+INSERT INTO "remix_tag" VALUES(4953,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4953,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4953,'new-age',1);
+INSERT INTO "remix_tag" VALUES(4953,'piano',1);
+INSERT INTO "remix_tag" VALUES(4953,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4953,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4953,'strings',1);
+INSERT INTO "remix_tag" VALUES(4953,'synth',1);
+INSERT INTO "remix_tag" VALUES(4953,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4954,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(4954,'collab',1);
+INSERT INTO "remix_tag" VALUES(4954,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4954,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4954,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4954,'metal',1);
+INSERT INTO "remix_tag" VALUES(4954,'organ',1);
+INSERT INTO "remix_tag" VALUES(4954,'piano',1);
+INSERT INTO "remix_tag" VALUES(4954,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4954,'synth',1);
+INSERT INTO "remix_tag" VALUES(4954,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4954,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4954,'trippy',1);
+INSERT INTO "remix_tag" VALUES(4955,'collab',1);
+INSERT INTO "remix_tag" VALUES(4955,'dance',1);
+INSERT INTO "remix_tag" VALUES(4955,'electro',1);
+INSERT INTO "remix_tag" VALUES(4955,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4955,'house',1);
+INSERT INTO "remix_tag" VALUES(4955,'piano',1);
+INSERT INTO "remix_tag" VALUES(4955,'synth',1);
+INSERT INTO "remix_tag" VALUES(4955,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4956,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4956,'chill',1);
+INSERT INTO "remix_tag" VALUES(4956,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4956,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4956,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4956,'meditation',1);
+INSERT INTO "remix_tag" VALUES(4956,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4956,'peaceful',1);
+INSERT INTO "remix_tag" VALUES(4956,'synth',1);
+INSERT INTO "remix_tag" VALUES(4957,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4957,'collab',1);
+INSERT INTO "remix_tag" VALUES(4957,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4957,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4957,'epic',1);
+INSERT INTO "remix_tag" VALUES(4957,'piano',1);
+INSERT INTO "remix_tag" VALUES(4957,'rock',1);
+INSERT INTO "remix_tag" VALUES(4957,'synth',1);
+INSERT INTO "remix_tag" VALUES(4957,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4957,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4958,'collab',1);
+INSERT INTO "remix_tag" VALUES(4958,'dance',1);
+INSERT INTO "remix_tag" VALUES(4958,'dark',1);
+INSERT INTO "remix_tag" VALUES(4958,'edm',1);
+INSERT INTO "remix_tag" VALUES(4958,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4958,'house',1);
+INSERT INTO "remix_tag" VALUES(4958,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4959,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4959,'collab',1);
+INSERT INTO "remix_tag" VALUES(4959,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4959,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4959,'flute',1);
+INSERT INTO "remix_tag" VALUES(4959,'folk',1);
+INSERT INTO "remix_tag" VALUES(4959,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4959,'happy',1);
+INSERT INTO "remix_tag" VALUES(4959,'harmonica',1);
+INSERT INTO "remix_tag" VALUES(4959,'medley',1);
+INSERT INTO "remix_tag" VALUES(4959,'native-american',1);
+INSERT INTO "remix_tag" VALUES(4959,'rock',1);
+INSERT INTO "remix_tag" VALUES(4959,'singing',1);
+INSERT INTO "remix_tag" VALUES(4959,'synth',1);
+INSERT INTO "remix_tag" VALUES(4959,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4959,'violin',1);
+INSERT INTO "remix_tag" VALUES(4959,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4960,'bassoon',1);
+INSERT INTO "remix_tag" VALUES(4960,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4960,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(4960,'collab',1);
+INSERT INTO "remix_tag" VALUES(4960,'flute',1);
+INSERT INTO "remix_tag" VALUES(4960,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4960,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4960,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4961,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4961,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4961,'flute',1);
+INSERT INTO "remix_tag" VALUES(4961,'folk',1);
+INSERT INTO "remix_tag" VALUES(4961,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(4961,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4961,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(4962,'dark',1);
+INSERT INTO "remix_tag" VALUES(4962,'edm',1);
+INSERT INTO "remix_tag" VALUES(4962,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4962,'synth',1);
+INSERT INTO "remix_tag" VALUES(4962,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4963,'collab',1);
+INSERT INTO "remix_tag" VALUES(4963,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4963,'downtempo',1);
+INSERT INTO "remix_tag" VALUES(4963,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4963,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4963,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4963,'piano',1);
+INSERT INTO "remix_tag" VALUES(4963,'singing',1);
+INSERT INTO "remix_tag" VALUES(4963,'strings',1);
+INSERT INTO "remix_tag" VALUES(4963,'synth',1);
+INSERT INTO "remix_tag" VALUES(4963,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4964,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4964,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4964,'lang-japanese',1);
+INSERT INTO "remix_tag" VALUES(4964,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4964,'piano',1);
+INSERT INTO "remix_tag" VALUES(4964,'pop',1);
+INSERT INTO "remix_tag" VALUES(4964,'singing',1);
+INSERT INTO "remix_tag" VALUES(4964,'synth',1);
+INSERT INTO "remix_tag" VALUES(4964,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4965,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4965,'collab',1);
+INSERT INTO "remix_tag" VALUES(4965,'dark',1);
+INSERT INTO "remix_tag" VALUES(4965,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4965,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4965,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4965,'synth',1);
+INSERT INTO "remix_tag" VALUES(4966,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4966,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(4966,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(4966,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4966,'dark',1);
+INSERT INTO "remix_tag" VALUES(4966,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4966,'halloween',1);
+INSERT INTO "remix_tag" VALUES(4966,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4966,'synth',1);
+INSERT INTO "remix_tag" VALUES(4966,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4967,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4967,'collab',1);
+INSERT INTO "remix_tag" VALUES(4967,'dark',1);
+INSERT INTO "remix_tag" VALUES(4967,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4967,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4967,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(4967,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4967,'organ',1);
+INSERT INTO "remix_tag" VALUES(4967,'piano',1);
+INSERT INTO "remix_tag" VALUES(4967,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4967,'synth',1);
+INSERT INTO "remix_tag" VALUES(4967,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4967,'violin',1);
+INSERT INTO "remix_tag" VALUES(4968,'collab',1);
+INSERT INTO "remix_tag" VALUES(4968,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4968,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4968,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4968,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4968,'piano',1);
+INSERT INTO "remix_tag" VALUES(4968,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4968,'synth',1);
+INSERT INTO "remix_tag" VALUES(4968,'timesig-9-8',1);
+INSERT INTO "remix_tag" VALUES(4969,'collab',1);
+INSERT INTO "remix_tag" VALUES(4969,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4969,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4969,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4969,'piano',1);
+INSERT INTO "remix_tag" VALUES(4969,'synth',1);
+INSERT INTO "remix_tag" VALUES(4969,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4969,'trip-hop',1);
+INSERT INTO "remix_tag" VALUES(4970,'blues',1);
+INSERT INTO "remix_tag" VALUES(4970,'collab',1);
+INSERT INTO "remix_tag" VALUES(4970,'compo-gsm',1);
+INSERT INTO "remix_tag" VALUES(4970,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4970,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4970,'lang-japanese',1);
+INSERT INTO "remix_tag" VALUES(4970,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4970,'organ',1);
+INSERT INTO "remix_tag" VALUES(4970,'rock',1);
+INSERT INTO "remix_tag" VALUES(4970,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4970,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4970,'synth',1);
+INSERT INTO "remix_tag" VALUES(4970,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4970,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4971,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4971,'bells',1);
+INSERT INTO "remix_tag" VALUES(4971,'collab',1);
+INSERT INTO "remix_tag" VALUES(4971,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4971,'flute',1);
+INSERT INTO "remix_tag" VALUES(4971,'happy',1);
+INSERT INTO "remix_tag" VALUES(4971,'piano',1);
+INSERT INTO "remix_tag" VALUES(4971,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4971,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4971,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(4972,'chill',1);
+INSERT INTO "remix_tag" VALUES(4972,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4972,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4972,'mellow',1);
+INSERT INTO "remix_tag" VALUES(4972,'synth',1);
+INSERT INTO "remix_tag" VALUES(4972,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4972,'vaporwave',1);
+INSERT INTO "remix_tag" VALUES(4973,'collab',1);
+INSERT INTO "remix_tag" VALUES(4973,'dark',1);
+INSERT INTO "remix_tag" VALUES(4973,'edm',1);
+INSERT INTO "remix_tag" VALUES(4973,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4973,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4973,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4973,'synth',1);
+INSERT INTO "remix_tag" VALUES(4973,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4974,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(4974,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(4974,'dark',1);
+INSERT INTO "remix_tag" VALUES(4974,'dnb',1);
+INSERT INTO "remix_tag" VALUES(4974,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4974,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4974,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4974,'piano',1);
+INSERT INTO "remix_tag" VALUES(4974,'synth',1);
+INSERT INTO "remix_tag" VALUES(4974,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4975,'collab',1);
+INSERT INTO "remix_tag" VALUES(4975,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4975,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4975,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4975,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4975,'piano',1);
+INSERT INTO "remix_tag" VALUES(4975,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4975,'strings',1);
+INSERT INTO "remix_tag" VALUES(4975,'synth',1);
+INSERT INTO "remix_tag" VALUES(4975,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4975,'violin',1);
+INSERT INTO "remix_tag" VALUES(4975,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4975,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4975,'vocals-rapping',1);
+INSERT INTO "remix_tag" VALUES(4976,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4976,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4976,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4976,'epic',1);
+INSERT INTO "remix_tag" VALUES(4976,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4976,'piano',1);
+INSERT INTO "remix_tag" VALUES(4976,'rock',1);
+INSERT INTO "remix_tag" VALUES(4976,'strings',1);
+INSERT INTO "remix_tag" VALUES(4976,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4976,'workout',1);
+INSERT INTO "remix_tag" VALUES(4977,'edm',1);
+INSERT INTO "remix_tag" VALUES(4977,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4977,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4977,'happy',1);
+INSERT INTO "remix_tag" VALUES(4977,'synth',1);
+INSERT INTO "remix_tag" VALUES(4977,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4978,'bells',1);
+INSERT INTO "remix_tag" VALUES(4978,'edm',1);
+INSERT INTO "remix_tag" VALUES(4978,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4978,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4978,'strings',1);
+INSERT INTO "remix_tag" VALUES(4978,'synth',1);
+INSERT INTO "remix_tag" VALUES(4978,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4978,'trance',1);
+INSERT INTO "remix_tag" VALUES(4979,'collab',1);
+INSERT INTO "remix_tag" VALUES(4979,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4979,'epic',1);
+INSERT INTO "remix_tag" VALUES(4979,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4979,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4979,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4979,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4979,'medley',1);
+INSERT INTO "remix_tag" VALUES(4979,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4979,'solemn',1);
+INSERT INTO "remix_tag" VALUES(4979,'synth',1);
+INSERT INTO "remix_tag" VALUES(4979,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4979,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4980,'breakbeat',1);
+INSERT INTO "remix_tag" VALUES(4980,'chill',1);
+INSERT INTO "remix_tag" VALUES(4980,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4980,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4980,'jazz',1);
+INSERT INTO "remix_tag" VALUES(4980,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(4980,'piano',1);
+INSERT INTO "remix_tag" VALUES(4980,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4981,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4981,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4981,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4982,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(4982,'experimental',1);
+INSERT INTO "remix_tag" VALUES(4982,'industrial',1);
+INSERT INTO "remix_tag" VALUES(4982,'medley',1);
+INSERT INTO "remix_tag" VALUES(4982,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4982,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4983,'collab',1);
+INSERT INTO "remix_tag" VALUES(4983,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4983,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4983,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(4983,'synth',1);
+INSERT INTO "remix_tag" VALUES(4983,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(4983,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4984,'collab',1);
+INSERT INTO "remix_tag" VALUES(4984,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4984,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4984,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4984,'funny',1);
+INSERT INTO "remix_tag" VALUES(4984,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4984,'piano',1);
+INSERT INTO "remix_tag" VALUES(4984,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4984,'synth',1);
+INSERT INTO "remix_tag" VALUES(4984,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4984,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(4985,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4986,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4987,'brass',1);
+INSERT INTO "remix_tag" VALUES(4987,'collab',1);
+INSERT INTO "remix_tag" VALUES(4987,'disco',1);
+INSERT INTO "remix_tag" VALUES(4987,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4987,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(4987,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4987,'funk',1);
+INSERT INTO "remix_tag" VALUES(4987,'funky',1);
+INSERT INTO "remix_tag" VALUES(4987,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4987,'lyrics-original',1);
+INSERT INTO "remix_tag" VALUES(4987,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(4987,'strings',1);
+INSERT INTO "remix_tag" VALUES(4987,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4987,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4987,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(4987,'vocoder',1);
+INSERT INTO "remix_tag" VALUES(4988,'chamber',1);
+INSERT INTO "remix_tag" VALUES(4988,'collab',1);
+INSERT INTO "remix_tag" VALUES(4988,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4988,'viola',1);
+INSERT INTO "remix_tag" VALUES(4989,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4989,'bells',1);
+INSERT INTO "remix_tag" VALUES(4989,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4989,'collab',1);
+INSERT INTO "remix_tag" VALUES(4989,'flute',1);
+INSERT INTO "remix_tag" VALUES(4989,'mystical',1);
+INSERT INTO "remix_tag" VALUES(4989,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(4989,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4989,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4989,'woodwinds',1);
+INSERT INTO "remix_tag" VALUES(4990,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4990,'bells',1);
+INSERT INTO "remix_tag" VALUES(4990,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(4990,'dark',1);
+INSERT INTO "remix_tag" VALUES(4990,'edm',1);
+INSERT INTO "remix_tag" VALUES(4990,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4990,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4990,'strings',1);
+INSERT INTO "remix_tag" VALUES(4990,'synth',1);
+INSERT INTO "remix_tag" VALUES(4990,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4991,'collab',1);
+INSERT INTO "remix_tag" VALUES(4991,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4991,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(4991,'lyrics-existing',1);
+INSERT INTO "remix_tag" VALUES(4991,'singing',1);
+INSERT INTO "remix_tag" VALUES(4991,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4991,'vocals-female',1);
+INSERT INTO "remix_tag" VALUES(4992,'collab',1);
+INSERT INTO "remix_tag" VALUES(4992,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4992,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4992,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4993,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4993,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4993,'fusion',1);
+INSERT INTO "remix_tag" VALUES(4993,'piano',1);
+INSERT INTO "remix_tag" VALUES(4993,'synth',1);
+INSERT INTO "remix_tag" VALUES(4993,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(4994,'collab',1);
+INSERT INTO "remix_tag" VALUES(4994,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4994,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4994,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4994,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4994,'organ',1);
+INSERT INTO "remix_tag" VALUES(4994,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(4994,'synth',1);
+INSERT INTO "remix_tag" VALUES(4994,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(4994,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4995,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(4995,'collab',1);
+INSERT INTO "remix_tag" VALUES(4995,'edm',1);
+INSERT INTO "remix_tag" VALUES(4995,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4995,'energetic',1);
+INSERT INTO "remix_tag" VALUES(4995,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(4995,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(4995,'synth',1);
+INSERT INTO "remix_tag" VALUES(4995,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4996,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(4996,'banjo',1);
+INSERT INTO "remix_tag" VALUES(4996,'collab',1);
+INSERT INTO "remix_tag" VALUES(4996,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4996,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4996,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4996,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(4996,'piano',1);
+INSERT INTO "remix_tag" VALUES(4996,'post-rock',1);
+INSERT INTO "remix_tag" VALUES(4996,'romantic',1);
+INSERT INTO "remix_tag" VALUES(4996,'strings',1);
+INSERT INTO "remix_tag" VALUES(4996,'synth',1);
+INSERT INTO "remix_tag" VALUES(4997,'collab',1);
+INSERT INTO "remix_tag" VALUES(4997,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(4997,'timesig-7-4',1);
+INSERT INTO "remix_tag" VALUES(4998,'dark',1);
+INSERT INTO "remix_tag" VALUES(4998,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4998,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(4998,'metal',1);
+INSERT INTO "remix_tag" VALUES(4998,'synth',1);
+INSERT INTO "remix_tag" VALUES(4998,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(4999,'ambient',1);
+INSERT INTO "remix_tag" VALUES(4999,'chill',1);
+INSERT INTO "remix_tag" VALUES(4999,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(4999,'electronic',1);
+INSERT INTO "remix_tag" VALUES(4999,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(4999,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(4999,'synth',1);
+INSERT INTO "remix_tag" VALUES(4999,'timesig-4-4',1);
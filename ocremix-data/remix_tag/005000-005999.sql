@@ -0,0 +1,448 @@
+INSERT INTO "remix_tag" VALUES(5000,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5000,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5000,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5000,'rock',1);
+INSERT INTO "remix_tag" VALUES(5000,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5000,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(5001,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(5001,'collab',1);
+INSERT INTO "remix_tag" VALUES(5001,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5001,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5001,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5001,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(5001,'timesig-7-4',1);
+INSERT INTO "remix_tag" VALUES(5001,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(5002,'brass',1);
+INSERT INTO "remix_tag" VALUES(5002,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5002,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5002,'funk',1);
+INSERT INTO "remix_tag" VALUES(5002,'funky',1);
+INSERT INTO "remix_tag" VALUES(5002,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(5002,'organ',1);
+INSERT INTO "remix_tag" VALUES(5002,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(5002,'synth',1);
+INSERT INTO "remix_tag" VALUES(5002,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5003,'collab',1);
+INSERT INTO "remix_tag" VALUES(5003,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5003,'dissonance',1);
+INSERT INTO "remix_tag" VALUES(5003,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5003,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5003,'harp',1);
+INSERT INTO "remix_tag" VALUES(5003,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5003,'medley',1);
+INSERT INTO "remix_tag" VALUES(5003,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(5003,'synth',1);
+INSERT INTO "remix_tag" VALUES(5003,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(5003,'violin',1);
+INSERT INTO "remix_tag" VALUES(5004,'ambient',1);
+INSERT INTO "remix_tag" VALUES(5004,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5004,'flute',1);
+INSERT INTO "remix_tag" VALUES(5004,'mellow',1);
+INSERT INTO "remix_tag" VALUES(5004,'new-age',1);
+INSERT INTO "remix_tag" VALUES(5004,'piano',1);
+INSERT INTO "remix_tag" VALUES(5004,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5004,'synth',1);
+INSERT INTO "remix_tag" VALUES(5004,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5005,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5005,'choir',1);
+INSERT INTO "remix_tag" VALUES(5005,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(5005,'collab',1);
+INSERT INTO "remix_tag" VALUES(5005,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5005,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5005,'harp',1);
+INSERT INTO "remix_tag" VALUES(5005,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5005,'mandolin',1);
+INSERT INTO "remix_tag" VALUES(5005,'organ',1);
+INSERT INTO "remix_tag" VALUES(5005,'piano',1);
+INSERT INTO "remix_tag" VALUES(5005,'solemn',1);
+INSERT INTO "remix_tag" VALUES(5005,'strings',1);
+INSERT INTO "remix_tag" VALUES(5005,'synth',1);
+INSERT INTO "remix_tag" VALUES(5005,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5005,'violin',1);
+INSERT INTO "remix_tag" VALUES(5006,'dnb',1);
+INSERT INTO "remix_tag" VALUES(5006,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5006,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5006,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5006,'synth',1);
+INSERT INTO "remix_tag" VALUES(5006,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5007,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(5007,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5007,'extended-soloing',1);
+INSERT INTO "remix_tag" VALUES(5007,'funky',1);
+INSERT INTO "remix_tag" VALUES(5007,'fusion',1);
+INSERT INTO "remix_tag" VALUES(5007,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(5007,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(5007,'piano',1);
+INSERT INTO "remix_tag" VALUES(5007,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5007,'synth',1);
+INSERT INTO "remix_tag" VALUES(5007,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5008,'collab',1);
+INSERT INTO "remix_tag" VALUES(5008,'edm',1);
+INSERT INTO "remix_tag" VALUES(5008,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5008,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5008,'synth',1);
+INSERT INTO "remix_tag" VALUES(5008,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5008,'workout',1);
+INSERT INTO "remix_tag" VALUES(5009,'collab',1);
+INSERT INTO "remix_tag" VALUES(5009,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5009,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5009,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5009,'piano',1);
+INSERT INTO "remix_tag" VALUES(5009,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(5009,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5009,'violin',1);
+INSERT INTO "remix_tag" VALUES(5010,'ambient',1);
+INSERT INTO "remix_tag" VALUES(5010,'chill',1);
+INSERT INTO "remix_tag" VALUES(5010,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5010,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(5010,'mellow',1);
+INSERT INTO "remix_tag" VALUES(5010,'piano',1);
+INSERT INTO "remix_tag" VALUES(5010,'synth',1);
+INSERT INTO "remix_tag" VALUES(5010,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5011,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5011,'brass',1);
+INSERT INTO "remix_tag" VALUES(5011,'cello',1);
+INSERT INTO "remix_tag" VALUES(5011,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(5011,'collab',1);
+INSERT INTO "remix_tag" VALUES(5011,'epic',1);
+INSERT INTO "remix_tag" VALUES(5011,'flute',1);
+INSERT INTO "remix_tag" VALUES(5011,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5011,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(5011,'piano',1);
+INSERT INTO "remix_tag" VALUES(5011,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5011,'strings',1);
+INSERT INTO "remix_tag" VALUES(5011,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5011,'violin',1);
+INSERT INTO "remix_tag" VALUES(5012,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(5012,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5012,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5012,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5012,'synth',1);
+INSERT INTO "remix_tag" VALUES(5012,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(5012,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5013,'brass',1);
+INSERT INTO "remix_tag" VALUES(5013,'choir',1);
+INSERT INTO "remix_tag" VALUES(5013,'dark',1);
+INSERT INTO "remix_tag" VALUES(5013,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5013,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5013,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(5013,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(5013,'strings',1);
+INSERT INTO "remix_tag" VALUES(5013,'synth',1);
+INSERT INTO "remix_tag" VALUES(5013,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5014,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5014,'detuning',1);
+INSERT INTO "remix_tag" VALUES(5014,'dnb',1);
+INSERT INTO "remix_tag" VALUES(5014,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5014,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5014,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5014,'synth',1);
+INSERT INTO "remix_tag" VALUES(5014,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5015,'accordion',1);
+INSERT INTO "remix_tag" VALUES(5015,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5015,'clarinet',1);
+INSERT INTO "remix_tag" VALUES(5015,'collab',1);
+INSERT INTO "remix_tag" VALUES(5015,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5015,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5015,'folk',1);
+INSERT INTO "remix_tag" VALUES(5015,'klezmer',1);
+INSERT INTO "remix_tag" VALUES(5015,'punk',1);
+INSERT INTO "remix_tag" VALUES(5015,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5015,'violin',1);
+INSERT INTO "remix_tag" VALUES(5016,'electro',1);
+INSERT INTO "remix_tag" VALUES(5016,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5016,'fusion',1);
+INSERT INTO "remix_tag" VALUES(5016,'organ',1);
+INSERT INTO "remix_tag" VALUES(5016,'piano',1);
+INSERT INTO "remix_tag" VALUES(5016,'spooky',1);
+INSERT INTO "remix_tag" VALUES(5016,'swing',1);
+INSERT INTO "remix_tag" VALUES(5016,'synth',1);
+INSERT INTO "remix_tag" VALUES(5016,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5017,'cello',1);
+INSERT INTO "remix_tag" VALUES(5017,'collab',1);
+INSERT INTO "remix_tag" VALUES(5017,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5017,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(5017,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5017,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(5017,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(5017,'synth',1);
+INSERT INTO "remix_tag" VALUES(5017,'violin',1);
+INSERT INTO "remix_tag" VALUES(5018,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(5018,'dark',1);
+INSERT INTO "remix_tag" VALUES(5018,'dnb',1);
+INSERT INTO "remix_tag" VALUES(5018,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5018,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5018,'synth',1);
+INSERT INTO "remix_tag" VALUES(5018,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5018,'workout',1);
+INSERT INTO "remix_tag" VALUES(5019,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5019,'happy',1);
+INSERT INTO "remix_tag" VALUES(5019,'synth',1);
+INSERT INTO "remix_tag" VALUES(5019,'synthwave',1);
+INSERT INTO "remix_tag" VALUES(5019,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5019,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(5020,'dark',1);
+INSERT INTO "remix_tag" VALUES(5020,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5020,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5020,'piano',1);
+INSERT INTO "remix_tag" VALUES(5020,'synth',1);
+INSERT INTO "remix_tag" VALUES(5020,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(5020,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5021,'dnb',1);
+INSERT INTO "remix_tag" VALUES(5021,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5021,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5021,'synth',1);
+INSERT INTO "remix_tag" VALUES(5021,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5021,'workout',1);
+INSERT INTO "remix_tag" VALUES(5022,'ambient',1);
+INSERT INTO "remix_tag" VALUES(5022,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(5022,'collab',1);
+INSERT INTO "remix_tag" VALUES(5022,'dnb',1);
+INSERT INTO "remix_tag" VALUES(5022,'dulcimer',1);
+INSERT INTO "remix_tag" VALUES(5022,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5022,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5022,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5022,'synth',1);
+INSERT INTO "remix_tag" VALUES(5022,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5023,'breakbeats',1);
+INSERT INTO "remix_tag" VALUES(5023,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5023,'experimental',1);
+INSERT INTO "remix_tag" VALUES(5023,'glitching',1);
+INSERT INTO "remix_tag" VALUES(5023,'ingame-fx',1);
+INSERT INTO "remix_tag" VALUES(5023,'jungle',1);
+INSERT INTO "remix_tag" VALUES(5023,'synth',1);
+INSERT INTO "remix_tag" VALUES(5024,'collab',1);
+INSERT INTO "remix_tag" VALUES(5024,'detuning',1);
+INSERT INTO "remix_tag" VALUES(5024,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(5024,'piano',1);
+INSERT INTO "remix_tag" VALUES(5024,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(5024,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(5024,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5024,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5024,'whistling',1);
+INSERT INTO "remix_tag" VALUES(5025,'brass',1);
+INSERT INTO "remix_tag" VALUES(5025,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(5025,'collab',1);
+INSERT INTO "remix_tag" VALUES(5025,'epic',1);
+INSERT INTO "remix_tag" VALUES(5025,'flute',1);
+INSERT INTO "remix_tag" VALUES(5025,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5025,'orchestral',1);
+INSERT INTO "remix_tag" VALUES(5025,'piano',1);
+INSERT INTO "remix_tag" VALUES(5025,'strings',1);
+INSERT INTO "remix_tag" VALUES(5025,'synth',1);
+INSERT INTO "remix_tag" VALUES(5025,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5025,'trumpet',1);
+INSERT INTO "remix_tag" VALUES(5026,'chill',1);
+INSERT INTO "remix_tag" VALUES(5026,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(5026,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5026,'jazz',1);
+INSERT INTO "remix_tag" VALUES(5026,'mellow',1);
+INSERT INTO "remix_tag" VALUES(5026,'piano',1);
+INSERT INTO "remix_tag" VALUES(5026,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(5026,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5027,'ambient',1);
+INSERT INTO "remix_tag" VALUES(5027,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5027,'experimental',1);
+INSERT INTO "remix_tag" VALUES(5027,'mystical',1);
+INSERT INTO "remix_tag" VALUES(5027,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5027,'synth',1);
+INSERT INTO "remix_tag" VALUES(5028,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5028,'bossa-nova',1);
+INSERT INTO "remix_tag" VALUES(5028,'collab',1);
+INSERT INTO "remix_tag" VALUES(5028,'hand-drums',1);
+INSERT INTO "remix_tag" VALUES(5028,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5028,'piano',1);
+INSERT INTO "remix_tag" VALUES(5028,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(5028,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5028,'violin',1);
+INSERT INTO "remix_tag" VALUES(5029,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5029,'collab',1);
+INSERT INTO "remix_tag" VALUES(5029,'happy',1);
+INSERT INTO "remix_tag" VALUES(5029,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5029,'tango',1);
+INSERT INTO "remix_tag" VALUES(5029,'timesig-3-4',1);
+INSERT INTO "remix_tag" VALUES(5029,'violin',1);
+INSERT INTO "remix_tag" VALUES(5030,'collab',1);
+INSERT INTO "remix_tag" VALUES(5030,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5030,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5030,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5030,'medley',1);
+INSERT INTO "remix_tag" VALUES(5030,'metal',1);
+INSERT INTO "remix_tag" VALUES(5030,'organ',1);
+INSERT INTO "remix_tag" VALUES(5030,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(5030,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(5030,'tempo-variable',1);
+INSERT INTO "remix_tag" VALUES(5030,'violin',1);
+INSERT INTO "remix_tag" VALUES(5031,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5031,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5031,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5031,'metal',1);
+INSERT INTO "remix_tag" VALUES(5031,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5032,'piano',1);
+INSERT INTO "remix_tag" VALUES(5032,'solo',1);
+INSERT INTO "remix_tag" VALUES(5032,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(5032,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5032,'timesig-irregular',1);
+INSERT INTO "remix_tag" VALUES(5032,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(5033,'edm',1);
+INSERT INTO "remix_tag" VALUES(5033,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5033,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5033,'synth',1);
+INSERT INTO "remix_tag" VALUES(5033,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5033,'workout',1);
+INSERT INTO "remix_tag" VALUES(5034,'collab',1);
+INSERT INTO "remix_tag" VALUES(5034,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5034,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5034,'industrial',1);
+INSERT INTO "remix_tag" VALUES(5034,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5034,'metal',1);
+INSERT INTO "remix_tag" VALUES(5034,'synth',1);
+INSERT INTO "remix_tag" VALUES(5034,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5034,'timesig-7-8',1);
+INSERT INTO "remix_tag" VALUES(5034,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(5035,'chill',1);
+INSERT INTO "remix_tag" VALUES(5035,'collab',1);
+INSERT INTO "remix_tag" VALUES(5035,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5035,'hip-hop',1);
+INSERT INTO "remix_tag" VALUES(5035,'lo-fi',1);
+INSERT INTO "remix_tag" VALUES(5035,'mellow',1);
+INSERT INTO "remix_tag" VALUES(5035,'synth',1);
+INSERT INTO "remix_tag" VALUES(5036,'compo-dod',1);
+INSERT INTO "remix_tag" VALUES(5036,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5036,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5036,'organ',1);
+INSERT INTO "remix_tag" VALUES(5036,'piano',1);
+INSERT INTO "remix_tag" VALUES(5036,'prog-rock',1);
+INSERT INTO "remix_tag" VALUES(5036,'synth',1);
+INSERT INTO "remix_tag" VALUES(5036,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5036,'timesig-5-4',1);
+INSERT INTO "remix_tag" VALUES(5036,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(5037,'edm',1);
+INSERT INTO "remix_tag" VALUES(5037,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5037,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5037,'synth',1);
+INSERT INTO "remix_tag" VALUES(5037,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5037,'trance',1);
+INSERT INTO "remix_tag" VALUES(5037,'workout',1);
+INSERT INTO "remix_tag" VALUES(5038,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5038,'ballad',1);
+INSERT INTO "remix_tag" VALUES(5038,'brass',1);
+INSERT INTO "remix_tag" VALUES(5038,'collab',1);
+INSERT INTO "remix_tag" VALUES(5038,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5038,'happy',1);
+INSERT INTO "remix_tag" VALUES(5038,'piano',1);
+INSERT INTO "remix_tag" VALUES(5038,'rock',1);
+INSERT INTO "remix_tag" VALUES(5039,'piano',1);
+INSERT INTO "remix_tag" VALUES(5039,'solo',1);
+INSERT INTO "remix_tag" VALUES(5039,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(5039,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5040,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5040,'bells',1);
+INSERT INTO "remix_tag" VALUES(5040,'brass',1);
+INSERT INTO "remix_tag" VALUES(5040,'country',1);
+INSERT INTO "remix_tag" VALUES(5040,'dark',1);
+INSERT INTO "remix_tag" VALUES(5040,'flute',1);
+INSERT INTO "remix_tag" VALUES(5040,'folk',1);
+INSERT INTO "remix_tag" VALUES(5040,'funny',1);
+INSERT INTO "remix_tag" VALUES(5040,'happy',1);
+INSERT INTO "remix_tag" VALUES(5040,'harpsichord',1);
+INSERT INTO "remix_tag" VALUES(5040,'jazz',1);
+INSERT INTO "remix_tag" VALUES(5040,'marimba',1);
+INSERT INTO "remix_tag" VALUES(5040,'medley',1);
+INSERT INTO "remix_tag" VALUES(5040,'piano',1);
+INSERT INTO "remix_tag" VALUES(5040,'sound-fx',1);
+INSERT INTO "remix_tag" VALUES(5040,'strings',1);
+INSERT INTO "remix_tag" VALUES(5040,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5041,'aggressive',1);
+INSERT INTO "remix_tag" VALUES(5041,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5041,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5041,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5041,'metal',1);
+INSERT INTO "remix_tag" VALUES(5041,'organ',1);
+INSERT INTO "remix_tag" VALUES(5041,'synth',1);
+INSERT INTO "remix_tag" VALUES(5042,'collab',1);
+INSERT INTO "remix_tag" VALUES(5042,'edm',1);
+INSERT INTO "remix_tag" VALUES(5042,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5042,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5042,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(5042,'synth',1);
+INSERT INTO "remix_tag" VALUES(5042,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5042,'timesig-variable',1);
+INSERT INTO "remix_tag" VALUES(5042,'workout',1);
+INSERT INTO "remix_tag" VALUES(5043,'acoustic-guitar',1);
+INSERT INTO "remix_tag" VALUES(5043,'banjo',1);
+INSERT INTO "remix_tag" VALUES(5043,'bouzouki',1);
+INSERT INTO "remix_tag" VALUES(5043,'collab',1);
+INSERT INTO "remix_tag" VALUES(5043,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5043,'folk',1);
+INSERT INTO "remix_tag" VALUES(5043,'rock',1);
+INSERT INTO "remix_tag" VALUES(5043,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(5043,'solemn',1);
+INSERT INTO "remix_tag" VALUES(5043,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5044,'big-beat',1);
+INSERT INTO "remix_tag" VALUES(5044,'chill',1);
+INSERT INTO "remix_tag" VALUES(5044,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5044,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5044,'synth',1);
+INSERT INTO "remix_tag" VALUES(5044,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5045,'collab',1);
+INSERT INTO "remix_tag" VALUES(5045,'detuning',1);
+INSERT INTO "remix_tag" VALUES(5045,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5045,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5045,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5045,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(5045,'synth',1);
+INSERT INTO "remix_tag" VALUES(5045,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5046,'edm',1);
+INSERT INTO "remix_tag" VALUES(5046,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5046,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5046,'synth',1);
+INSERT INTO "remix_tag" VALUES(5046,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5047,'chamber',1);
+INSERT INTO "remix_tag" VALUES(5047,'piano',1);
+INSERT INTO "remix_tag" VALUES(5047,'sad',1);
+INSERT INTO "remix_tag" VALUES(5047,'solo',1);
+INSERT INTO "remix_tag" VALUES(5047,'solo-piano',1);
+INSERT INTO "remix_tag" VALUES(5047,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5048,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5049,'timesig-6-8',1);
+INSERT INTO "remix_tag" VALUES(5050,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5051,'medley',1);
+INSERT INTO "remix_tag" VALUES(5051,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(5053,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5053,'electric-piano',1);
+INSERT INTO "remix_tag" VALUES(5053,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5053,'funk',1);
+INSERT INTO "remix_tag" VALUES(5053,'funky',1);
+INSERT INTO "remix_tag" VALUES(5053,'jazzy',1);
+INSERT INTO "remix_tag" VALUES(5053,'live-instruments',1);
+INSERT INTO "remix_tag" VALUES(5053,'piano',1);
+INSERT INTO "remix_tag" VALUES(5053,'saxophone',1);
+INSERT INTO "remix_tag" VALUES(5053,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5054,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5055,'collab',1);
+INSERT INTO "remix_tag" VALUES(5055,'lang-english',1);
+INSERT INTO "remix_tag" VALUES(5055,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5055,'vocals-male',1);
+INSERT INTO "remix_tag" VALUES(5056,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5057,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5058,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5059,'bells',1);
+INSERT INTO "remix_tag" VALUES(5059,'brass',1);
+INSERT INTO "remix_tag" VALUES(5059,'chiptune',1);
+INSERT INTO "remix_tag" VALUES(5059,'cinematic',1);
+INSERT INTO "remix_tag" VALUES(5059,'electronic',1);
+INSERT INTO "remix_tag" VALUES(5059,'energetic',1);
+INSERT INTO "remix_tag" VALUES(5059,'strings',1);
+INSERT INTO "remix_tag" VALUES(5059,'synth',1);
+INSERT INTO "remix_tag" VALUES(5059,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5060,'classical',1);
+INSERT INTO "remix_tag" VALUES(5060,'organ',1);
+INSERT INTO "remix_tag" VALUES(5060,'resubmission',1);
+INSERT INTO "remix_tag" VALUES(5060,'solo',1);
+INSERT INTO "remix_tag" VALUES(5061,'cello',1);
+INSERT INTO "remix_tag" VALUES(5061,'collab',1);
+INSERT INTO "remix_tag" VALUES(5061,'electric-guitar',1);
+INSERT INTO "remix_tag" VALUES(5061,'psytrance',1);
+INSERT INTO "remix_tag" VALUES(5061,'timesig-4-4',1);
+INSERT INTO "remix_tag" VALUES(5061,'vocals-female',1);
@@ -0,0 +1,55 @@
+CREATE TABLE artist (
+    id integer primary key,
+    name text not null,
+    url text not null
+) strict;
+CREATE TABLE game (
+    id integer primary key,
+    name text not null,
+    url text not null
+) strict;
+CREATE TABLE remix (
+    id integer primary key,
+    title text not null,
+    primary_game text not null,
+    import_datetime text,
+    youtube_url text,
+    primary_game_id int,
+    download_url text,
+    has_lyrics integer
+) strict;
+CREATE TABLE remix_artist (
+    remix_id integer not null,
+    artist_id integer not null,
+    _synced integer,
+    primary key (remix_id, artist_id)
+) strict;
+CREATE TABLE remix_change (
+    remix_id integer primary key,
+    first_check_datetime text not null,
+    checks integer not null,
+    changes integer not null,
+    change_datetime text
+) strict;
+CREATE TABLE remix_fetch (
+    remix_id integer primary key,
+    etag text,
+    last_modified text,
+    page_sha256 text,
+    fields_sha256 text
+) strict;
+CREATE TABLE remix_not_found (
+    remix_id integer primary key,
+    check_datetime text not null
+) strict;
+CREATE TABLE remix_tag (
+    remix_id integer not null,
+    tag_id text not null,
+    _synced integer,
+    primary key (remix_id, tag_id)
+) strict;
+CREATE TABLE tag (
+    id text primary key,
+    path text not null,
+    url text not null
+) strict;
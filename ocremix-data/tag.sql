@@ -0,0 +1,239 @@
+INSERT INTO "tag" VALUES('acapella','Instrumentation > Acapella','https://ocremix.org/tag/acapella');
+INSERT INTO "tag" VALUES('accordion','Instrumentation > Accordion','https://ocremix.org/tag/accordion');
+INSERT INTO "tag" VALUES('acoustic','Instrumentation > Acoustic','https://ocremix.org/tag/acoustic');
+INSERT INTO "tag" VALUES('acoustic-guitar','Instrumentation > Acoustic Guitar','https://ocremix.org/tag/acoustic-guitar');
+INSERT INTO "tag" VALUES('african','Regional > African','https://ocremix.org/tag/african');
+INSERT INTO "tag" VALUES('aggressive','Mood > Aggressive','https://ocremix.org/tag/aggressive');
+INSERT INTO "tag" VALUES('ambient','Genre > Easy Listening > Ambient','https://ocremix.org/tag/ambient');
+INSERT INTO "tag" VALUES('angry','Mood > Angry','https://ocremix.org/tag/angry');
+INSERT INTO "tag" VALUES('appalachian','Regional > Appalachian','https://ocremix.org/tag/appalachian');
+INSERT INTO "tag" VALUES('balafon','Instrumentation > Balafon','https://ocremix.org/tag/balafon');
+INSERT INTO "tag" VALUES('ballad','Genre > Easy Listening > Ballad','https://ocremix.org/tag/ballad');
+INSERT INTO "tag" VALUES('banjo','Instrumentation > Banjo','https://ocremix.org/tag/banjo');
+INSERT INTO "tag" VALUES('bassoon','Instrumentation > Bassoon','https://ocremix.org/tag/bassoon');
+INSERT INTO "tag" VALUES('bells','Instrumentation > Bells','https://ocremix.org/tag/bells');
+INSERT INTO "tag" VALUES('big-beat','Genre > EDM > Big Beat','https://ocremix.org/tag/big-beat');
+INSERT INTO "tag" VALUES('bluegrass','Genre > Folk > Bluegrass','https://ocremix.org/tag/bluegrass');
+INSERT INTO "tag" VALUES('blues','Genre > Blues','https://ocremix.org/tag/blues');
+INSERT INTO "tag" VALUES('bossa-nova','Genre > Latin > Bossa Nova','https://ocremix.org/tag/bossa-nova');
+INSERT INTO "tag" VALUES('bouzouki','Instrumentation > Bouzouki','https://ocremix.org/tag/bouzouki');
+INSERT INTO "tag" VALUES('brass','Instrumentation > Brass','https://ocremix.org/tag/brass');
+INSERT INTO "tag" VALUES('breakbeat','Genre > EDM > Breakbeat','https://ocremix.org/tag/breakbeat');
+INSERT INTO "tag" VALUES('breakbeats','Instrumentation > Breakbeats','https://ocremix.org/tag/breakbeats');
+INSERT INTO "tag" VALUES('cajun','Regional > Cajun','https://ocremix.org/tag/cajun');
+INSERT INTO "tag" VALUES('carribean','Regional > Carribean','https://ocremix.org/tag/carribean');
+INSERT INTO "tag" VALUES('cello','Instrumentation > Cello','https://ocremix.org/tag/cello');
+INSERT INTO "tag" VALUES('celtic','Regional > Celtic','https://ocremix.org/tag/celtic');
+INSERT INTO "tag" VALUES('chamber','Genre > Classical > Chamber','https://ocremix.org/tag/chamber');
+INSERT INTO "tag" VALUES('chill','Mood > Chill','https://ocremix.org/tag/chill');
+INSERT INTO "tag" VALUES('chinese','Regional > Chinese','https://ocremix.org/tag/chinese');
+INSERT INTO "tag" VALUES('chiptune','Instrumentation > Chiptune','https://ocremix.org/tag/chiptune');
+INSERT INTO "tag" VALUES('choir','Instrumentation > Choir','https://ocremix.org/tag/choir');
+INSERT INTO "tag" VALUES('chromatic-percussion','Instrumentation > Chromatic Percussion','https://ocremix.org/tag/chromatic-percussion');
+INSERT INTO "tag" VALUES('cinematic','Genre > Cinematic','https://ocremix.org/tag/cinematic');
+INSERT INTO "tag" VALUES('clarinet','Instrumentation > Clarinet','https://ocremix.org/tag/clarinet');
+INSERT INTO "tag" VALUES('classical','Genre > Classical','https://ocremix.org/tag/classical');
+INSERT INTO "tag" VALUES('clavinet','Instrumentation > Clavinet','https://ocremix.org/tag/clavinet');
+INSERT INTO "tag" VALUES('collab','Origin > Collaboration','https://ocremix.org/tag/collab');
+INSERT INTO "tag" VALUES('compo','Origin > Competition','https://ocremix.org/tag/compo');
+INSERT INTO "tag" VALUES('compo-dod','Origin > Competition > Dwelling of Duels','https://ocremix.org/tag/compo-dod');
+INSERT INTO "tag" VALUES('compo-gsm','Origin > Competition > Game Set Mash!!','https://ocremix.org/tag/compo-gsm');
+INSERT INTO "tag" VALUES('country','Genre > Folk > Country','https://ocremix.org/tag/country');
+INSERT INTO "tag" VALUES('cowbell','Instrumentation > Cowbell','https://ocremix.org/tag/cowbell');
+INSERT INTO "tag" VALUES('dance','Genre > EDM > Dance','https://ocremix.org/tag/dance');
+INSERT INTO "tag" VALUES('dark','Mood > Dark','https://ocremix.org/tag/dark');
+INSERT INTO "tag" VALUES('death-metal','Genre > Rock > Death Metal','https://ocremix.org/tag/death-metal');
+INSERT INTO "tag" VALUES('detuning','Effects > Detuning','https://ocremix.org/tag/detuning');
+INSERT INTO "tag" VALUES('didgeridoo','Instrumentation > Didgeridoo','https://ocremix.org/tag/didgeridoo');
+INSERT INTO "tag" VALUES('disco','Genre > R&B > Disco','https://ocremix.org/tag/disco');
+INSERT INTO "tag" VALUES('dissonance','Arrangement > Dissonance','https://ocremix.org/tag/dissonance');
+INSERT INTO "tag" VALUES('distortion','Effects > Distortion','https://ocremix.org/tag/distortion');
+INSERT INTO "tag" VALUES('dizi','Instrumentation > Dizi','https://ocremix.org/tag/dizi');
+INSERT INTO "tag" VALUES('djembe','Instrumentation > Djembe','https://ocremix.org/tag/djembe');
+INSERT INTO "tag" VALUES('dnb','Genre > EDM > Drum and bass','https://ocremix.org/tag/dnb');
+INSERT INTO "tag" VALUES('downtempo','Genre > EDM > Downtempo','https://ocremix.org/tag/downtempo');
+INSERT INTO "tag" VALUES('dub','Genre > Ska > Dub','https://ocremix.org/tag/dub');
+INSERT INTO "tag" VALUES('dubstep','Genre > EDM > Dubstep','https://ocremix.org/tag/dubstep');
+INSERT INTO "tag" VALUES('duet','Arrangement > Duet','https://ocremix.org/tag/duet');
+INSERT INTO "tag" VALUES('dulcimer','Instrumentation > Dulcimer','https://ocremix.org/tag/dulcimer');
+INSERT INTO "tag" VALUES('duration-long','Time > Duration: Long','https://ocremix.org/tag/duration-long');
+INSERT INTO "tag" VALUES('duration-short','Time > Duration: Short','https://ocremix.org/tag/duration-short');
+INSERT INTO "tag" VALUES('easy-listening','Genre > Easy Listening','https://ocremix.org/tag/easy-listening');
+INSERT INTO "tag" VALUES('edm','Genre > EDM','https://ocremix.org/tag/edm');
+INSERT INTO "tag" VALUES('electric-guitar','Instrumentation > Electric Guitar','https://ocremix.org/tag/electric-guitar');
+INSERT INTO "tag" VALUES('electric-piano','Instrumentation > Electric Piano','https://ocremix.org/tag/electric-piano');
+INSERT INTO "tag" VALUES('electro','Genre > EDM > Electro','https://ocremix.org/tag/electro');
+INSERT INTO "tag" VALUES('electronic','Instrumentation > Electronic','https://ocremix.org/tag/electronic');
+INSERT INTO "tag" VALUES('energetic','Mood > Energetic','https://ocremix.org/tag/energetic');
+INSERT INTO "tag" VALUES('epic','Mood > Epic','https://ocremix.org/tag/epic');
+INSERT INTO "tag" VALUES('erhu','Instrumentation > Erhu','https://ocremix.org/tag/erhu');
+INSERT INTO "tag" VALUES('euphonium','Instrumentation > Euphonium','https://ocremix.org/tag/euphonium');
+INSERT INTO "tag" VALUES('experimental','Genre > Experimental','https://ocremix.org/tag/experimental');
+INSERT INTO "tag" VALUES('extended-soloing','Arrangement > Extended Soloing','https://ocremix.org/tag/extended-soloing');
+INSERT INTO "tag" VALUES('flugelhorn','Instrumentation > Flugelhorn','https://ocremix.org/tag/flugelhorn');
+INSERT INTO "tag" VALUES('flute','Instrumentation > Flute','https://ocremix.org/tag/flute');
+INSERT INTO "tag" VALUES('folk','Genre > Folk','https://ocremix.org/tag/folk');
+INSERT INTO "tag" VALUES('french-horn','Instrumentation > French Horn','https://ocremix.org/tag/french-horn');
+INSERT INTO "tag" VALUES('funk','Genre > R&B > Funk','https://ocremix.org/tag/funk');
+INSERT INTO "tag" VALUES('funky','Mood > Funky','https://ocremix.org/tag/funky');
+INSERT INTO "tag" VALUES('funny','Mood > Funny','https://ocremix.org/tag/funny');
+INSERT INTO "tag" VALUES('fusion','Genre > Jazz > Fusion','https://ocremix.org/tag/fusion');
+INSERT INTO "tag" VALUES('glitch-hop','Genre > Hip Hop > Glitch Hop','https://ocremix.org/tag/glitch-hop');
+INSERT INTO "tag" VALUES('glitching','Effects > Glitching','https://ocremix.org/tag/glitching');
+INSERT INTO "tag" VALUES('goofy','Mood > Goofy','https://ocremix.org/tag/goofy');
+INSERT INTO "tag" VALUES('guzheng','Instrumentation > Guzheng','https://ocremix.org/tag/guzheng');
+INSERT INTO "tag" VALUES('halloween','Usage > Halloween','https://ocremix.org/tag/halloween');
+INSERT INTO "tag" VALUES('hand-drums','Instrumentation > Hand Drums','https://ocremix.org/tag/hand-drums');
+INSERT INTO "tag" VALUES('happy','Mood > Happy','https://ocremix.org/tag/happy');
+INSERT INTO "tag" VALUES('happy-hardcore','Genre > EDM > Happy Hardcore','https://ocremix.org/tag/happy-hardcore');
+INSERT INTO "tag" VALUES('harmonica','Instrumentation > Harmonica','https://ocremix.org/tag/harmonica');
+INSERT INTO "tag" VALUES('harp','Instrumentation > Harp','https://ocremix.org/tag/harp');
+INSERT INTO "tag" VALUES('harpsichord','Instrumentation > Harpsichord','https://ocremix.org/tag/harpsichord');
+INSERT INTO "tag" VALUES('hip-hop','Genre > Hip Hop','https://ocremix.org/tag/hip-hop');
+INSERT INTO "tag" VALUES('house','Genre > EDM > House','https://ocremix.org/tag/house');
+INSERT INTO "tag" VALUES('impressionist','Genre > Classical > Impressionist','https://ocremix.org/tag/impressionist');
+INSERT INTO "tag" VALUES('indian','Regional > Indian','https://ocremix.org/tag/indian');
+INSERT INTO "tag" VALUES('industrial','Genre > EDM > Industrial','https://ocremix.org/tag/industrial');
+INSERT INTO "tag" VALUES('ingame-fx','Instrumentation > In-game FX','https://ocremix.org/tag/ingame-fx');
+INSERT INTO "tag" VALUES('irish-whistle','Instrumentation > Irish Whistle','https://ocremix.org/tag/irish-whistle');
+INSERT INTO "tag" VALUES('japanese','Regional > Japanese','https://ocremix.org/tag/japanese');
+INSERT INTO "tag" VALUES('jazz','Genre > Jazz','https://ocremix.org/tag/jazz');
+INSERT INTO "tag" VALUES('jazzy','Mood > Jazzy','https://ocremix.org/tag/jazzy');
+INSERT INTO "tag" VALUES('jungle','Genre > EDM > Jungle','https://ocremix.org/tag/jungle');
+INSERT INTO "tag" VALUES('klezmer','Genre > Folk > Klezmer','https://ocremix.org/tag/klezmer');
+INSERT INTO "tag" VALUES('kora','Instrumentation > Kora','https://ocremix.org/tag/kora');
+INSERT INTO "tag" VALUES('koto','Instrumentation > Koto','https://ocremix.org/tag/koto');
+INSERT INTO "tag" VALUES('lang-english','Lyrics > Language: English','https://ocremix.org/tag/lang-english');
+INSERT INTO "tag" VALUES('lang-esperanto','Lyrics > Language: Esperanto','https://ocremix.org/tag/lang-esperanto');
+INSERT INTO "tag" VALUES('lang-french','Lyrics > Language: French','https://ocremix.org/tag/lang-french');
+INSERT INTO "tag" VALUES('lang-italian','Lyrics > Language: Italian','https://ocremix.org/tag/lang-italian');
+INSERT INTO "tag" VALUES('lang-japanese','Lyrics > Language: Japanese','https://ocremix.org/tag/lang-japanese');
+INSERT INTO "tag" VALUES('lang-latin','Lyrics > Language: Latin','https://ocremix.org/tag/lang-latin');
+INSERT INTO "tag" VALUES('lang-original','Lyrics > Language: Original','https://ocremix.org/tag/lang-original');
+INSERT INTO "tag" VALUES('lang-spanish','Lyrics > Language: Spanish','https://ocremix.org/tag/lang-spanish');
+INSERT INTO "tag" VALUES('latin','Genre > Latin','https://ocremix.org/tag/latin');
+INSERT INTO "tag" VALUES('latin-american','Regional > Latin American','https://ocremix.org/tag/latin-american');
+INSERT INTO "tag" VALUES('live-ensemble','Production > Live Ensemble','https://ocremix.org/tag/live-ensemble');
+INSERT INTO "tag" VALUES('live-instruments','Production > Live Instruments','https://ocremix.org/tag/live-instruments');
+INSERT INTO "tag" VALUES('live-recording','Production > Live Recording','https://ocremix.org/tag/live-recording');
+INSERT INTO "tag" VALUES('lo-fi','Effects > Lo-Fi','https://ocremix.org/tag/lo-fi');
+INSERT INTO "tag" VALUES('lyrics-existing','Lyrics > Lyrics: Existing','https://ocremix.org/tag/lyrics-existing');
+INSERT INTO "tag" VALUES('lyrics-explicit','Lyrics > Lyrics: Explicit','https://ocremix.org/tag/lyrics-explicit');
+INSERT INTO "tag" VALUES('lyrics-original','Lyrics > Lyrics: Original','https://ocremix.org/tag/lyrics-original');
+INSERT INTO "tag" VALUES('mandolin','Instrumentation > Mandolin','https://ocremix.org/tag/mandolin');
+INSERT INTO "tag" VALUES('march','Genre > Classical > March','https://ocremix.org/tag/march');
+INSERT INTO "tag" VALUES('marimba','Instrumentation > Marimba','https://ocremix.org/tag/marimba');
+INSERT INTO "tag" VALUES('mbira','Instrumentation > Mbira','https://ocremix.org/tag/mbira');
+INSERT INTO "tag" VALUES('meditation','Usage > Meditation','https://ocremix.org/tag/meditation');
+INSERT INTO "tag" VALUES('mediterranean','Regional > Mediterranean','https://ocremix.org/tag/mediterranean');
+INSERT INTO "tag" VALUES('medley','Arrangement > Medley','https://ocremix.org/tag/medley');
+INSERT INTO "tag" VALUES('mellow','Mood > Mellow','https://ocremix.org/tag/mellow');
+INSERT INTO "tag" VALUES('melodica','Instrumentation > Melodica','https://ocremix.org/tag/melodica');
+INSERT INTO "tag" VALUES('metal','Genre > Rock > Metal','https://ocremix.org/tag/metal');
+INSERT INTO "tag" VALUES('middle-eastern','Regional > Middle Eastern','https://ocremix.org/tag/middle-eastern');
+INSERT INTO "tag" VALUES('minimalist','Arrangement > Minimalist','https://ocremix.org/tag/minimalist');
+INSERT INTO "tag" VALUES('mystical','Mood > Mystical','https://ocremix.org/tag/mystical');
+INSERT INTO "tag" VALUES('native-american','Regional > Native American','https://ocremix.org/tag/native-american');
+INSERT INTO "tag" VALUES('new-age','Genre > Easy Listening > New Age','https://ocremix.org/tag/new-age');
+INSERT INTO "tag" VALUES('oboe','Instrumentation > Oboe','https://ocremix.org/tag/oboe');
+INSERT INTO "tag" VALUES('opera','Genre > Classical > Opera','https://ocremix.org/tag/opera');
+INSERT INTO "tag" VALUES('orchestral','Instrumentation > Orchestral','https://ocremix.org/tag/orchestral');
+INSERT INTO "tag" VALUES('organ','Instrumentation > Organ','https://ocremix.org/tag/organ');
+INSERT INTO "tag" VALUES('oud','Instrumentation > Oud','https://ocremix.org/tag/oud');
+INSERT INTO "tag" VALUES('peaceful','Mood > Peaceful','https://ocremix.org/tag/peaceful');
+INSERT INTO "tag" VALUES('piano','Instrumentation > Piano','https://ocremix.org/tag/piano');
+INSERT INTO "tag" VALUES('polka','Genre > Folk > Polka','https://ocremix.org/tag/polka');
+INSERT INTO "tag" VALUES('pop','Genre > Pop','https://ocremix.org/tag/pop');
+INSERT INTO "tag" VALUES('post-rock','Genre > Rock > Post-rock','https://ocremix.org/tag/post-rock');
+INSERT INTO "tag" VALUES('prog-rock','Genre > Rock > Progressive Rock','https://ocremix.org/tag/prog-rock');
+INSERT INTO "tag" VALUES('psytrance','Genre > EDM > Psytrance','https://ocremix.org/tag/psytrance');
+INSERT INTO "tag" VALUES('punk','Genre > Rock > Punk','https://ocremix.org/tag/punk');
+INSERT INTO "tag" VALUES('quartet','Arrangement > Quartet','https://ocremix.org/tag/quartet');
+INSERT INTO "tag" VALUES('quintet','Arrangement > Quintet','https://ocremix.org/tag/quintet');
+INSERT INTO "tag" VALUES('quirky','Mood > Quirky','https://ocremix.org/tag/quirky');
+INSERT INTO "tag" VALUES('rap','Genre > Hip Hop > Rap','https://ocremix.org/tag/rap');
+INSERT INTO "tag" VALUES('recorder','Instrumentation > Recorder','https://ocremix.org/tag/recorder');
+INSERT INTO "tag" VALUES('reggae','Genre > Ska > Reggae','https://ocremix.org/tag/reggae');
+INSERT INTO "tag" VALUES('resubmission','Origin > Resubmission','https://ocremix.org/tag/resubmission');
+INSERT INTO "tag" VALUES('reversing','Effects > Reversing','https://ocremix.org/tag/reversing');
+INSERT INTO "tag" VALUES('rnb','Genre > R&B','https://ocremix.org/tag/rnb');
+INSERT INTO "tag" VALUES('rock','Genre > Rock','https://ocremix.org/tag/rock');
+INSERT INTO "tag" VALUES('rock-opera','Genre > Rock > Rock Opera','https://ocremix.org/tag/rock-opera');
+INSERT INTO "tag" VALUES('romantic','Mood > Romantic','https://ocremix.org/tag/romantic');
+INSERT INTO "tag" VALUES('sad','Mood > Sad','https://ocremix.org/tag/sad');
+INSERT INTO "tag" VALUES('santur','Instrumentation > Santur','https://ocremix.org/tag/santur');
+INSERT INTO "tag" VALUES('saxophone','Instrumentation > Saxophone','https://ocremix.org/tag/saxophone');
+INSERT INTO "tag" VALUES('screaming','Instrumentation > Screaming','https://ocremix.org/tag/screaming');
+INSERT INTO "tag" VALUES('sexy','Mood > Sexy','https://ocremix.org/tag/sexy');
+INSERT INTO "tag" VALUES('shakuhachi','Instrumentation > Shakuhachi','https://ocremix.org/tag/shakuhachi');
+INSERT INTO "tag" VALUES('shamisen','Instrumentation > Shamisen','https://ocremix.org/tag/shamisen');
+INSERT INTO "tag" VALUES('singing','Instrumentation > Singing','https://ocremix.org/tag/singing');
+INSERT INTO "tag" VALUES('sitar','Instrumentation > Sitar','https://ocremix.org/tag/sitar');
+INSERT INTO "tag" VALUES('ska','Genre > Ska','https://ocremix.org/tag/ska');
+INSERT INTO "tag" VALUES('slavic','Regional > Slavic','https://ocremix.org/tag/slavic');
+INSERT INTO "tag" VALUES('sleepytime','Usage > Sleepytime','https://ocremix.org/tag/sleepytime');
+INSERT INTO "tag" VALUES('solemn','Mood > Solemn','https://ocremix.org/tag/solemn');
+INSERT INTO "tag" VALUES('solo','Arrangement > Solo','https://ocremix.org/tag/solo');
+INSERT INTO "tag" VALUES('solo-guitar','Instrumentation > Solo Guitar','https://ocremix.org/tag/solo-guitar');
+INSERT INTO "tag" VALUES('solo-piano','Instrumentation > Solo Piano','https://ocremix.org/tag/solo-piano');
+INSERT INTO "tag" VALUES('soul','Genre > R&B > Soul','https://ocremix.org/tag/soul');
+INSERT INTO "tag" VALUES('sound-fx','Instrumentation > Sound FX','https://ocremix.org/tag/sound-fx');
+INSERT INTO "tag" VALUES('south-american','Regional > South American','https://ocremix.org/tag/south-american');
+INSERT INTO "tag" VALUES('spaghetti-western','Genre > Cinematic > Spaghetti Western','https://ocremix.org/tag/spaghetti-western');
+INSERT INTO "tag" VALUES('spooky','Mood > Spooky','https://ocremix.org/tag/spooky');
+INSERT INTO "tag" VALUES('steel-drum','Instrumentation > Steel Drum','https://ocremix.org/tag/steel-drum');
+INSERT INTO "tag" VALUES('strings','Instrumentation > Strings','https://ocremix.org/tag/strings');
+INSERT INTO "tag" VALUES('surf','Genre > Rock > Surf','https://ocremix.org/tag/surf');
+INSERT INTO "tag" VALUES('suspenseful','Mood > Suspenseful','https://ocremix.org/tag/suspenseful');
+INSERT INTO "tag" VALUES('swing','Genre > Jazz > Swing','https://ocremix.org/tag/swing');
+INSERT INTO "tag" VALUES('symphonic','Genre > Classical > Symphonic','https://ocremix.org/tag/symphonic');
+INSERT INTO "tag" VALUES('synth','Instrumentation > Synth','https://ocremix.org/tag/synth');
+INSERT INTO "tag" VALUES('synthwave','Genre > EDM > Synthwave','https://ocremix.org/tag/synthwave');
+INSERT INTO "tag" VALUES('tango','Genre > Latin > Tango','https://ocremix.org/tag/tango');
+INSERT INTO "tag" VALUES('tanpura','Instrumentation > Tanpura','https://ocremix.org/tag/tanpura');
+INSERT INTO "tag" VALUES('tempo-fast','Time > Tempo: Fast','https://ocremix.org/tag/tempo-fast');
+INSERT INTO "tag" VALUES('tempo-moderate','Time > Tempo: Moderate','https://ocremix.org/tag/tempo-moderate');
+INSERT INTO "tag" VALUES('tempo-slow','Time > Tempo: Slow','https://ocremix.org/tag/tempo-slow');
+INSERT INTO "tag" VALUES('tempo-variable','Time > Tempo: Variable','https://ocremix.org/tag/tempo-variable');
+INSERT INTO "tag" VALUES('theremin','Instrumentation > Theremin','https://ocremix.org/tag/theremin');
+INSERT INTO "tag" VALUES('timesig-3-4','Time > 3/4 Time Signature','https://ocremix.org/tag/timesig-3-4');
+INSERT INTO "tag" VALUES('timesig-4-4','Time > 4/4 Time Signature','https://ocremix.org/tag/timesig-4-4');
+INSERT INTO "tag" VALUES('timesig-5-4','Time > 5/4 Time Signature','https://ocremix.org/tag/timesig-5-4');
+INSERT INTO "tag" VALUES('timesig-6-8','Time > 6/8 Time Signature','https://ocremix.org/tag/timesig-6-8');
+INSERT INTO "tag" VALUES('timesig-7-4','Time > 7/4 Time Signature','https://ocremix.org/tag/timesig-7-4');
+INSERT INTO "tag" VALUES('timesig-7-8','Time > 7/8 Time Signature','https://ocremix.org/tag/timesig-7-8');
+INSERT INTO "tag" VALUES('timesig-9-8','Time > 9/8 Time Signature','https://ocremix.org/tag/timesig-9-8');
+INSERT INTO "tag" VALUES('timesig-irregular','Time > Time Signature: Irregular','https://ocremix.org/tag/timesig-irregular');
+INSERT INTO "tag" VALUES('timesig-variable','Time > Time Signature: Variable','https://ocremix.org/tag/timesig-variable');
+INSERT INTO "tag" VALUES('trance','Genre > EDM > Trance','https://ocremix.org/tag/trance');
+INSERT INTO "tag" VALUES('trap','Genre > Hip Hop > Trap','https://ocremix.org/tag/trap');
+INSERT INTO "tag" VALUES('trio','Arrangement > Trio','https://ocremix.org/tag/trio');
+INSERT INTO "tag" VALUES('trip-hop','Genre > Hip Hop > Trip Hop','https://ocremix.org/tag/trip-hop');
+INSERT INTO "tag" VALUES('trippy','Mood > Trippy','https://ocremix.org/tag/trippy');
+INSERT INTO "tag" VALUES('trombone','Instrumentation > Trombone','https://ocremix.org/tag/trombone');
+INSERT INTO "tag" VALUES('trumpet','Instrumentation > Trumpet','https://ocremix.org/tag/trumpet');
+INSERT INTO "tag" VALUES('tuba','Instrumentation > Tuba','https://ocremix.org/tag/tuba');
+INSERT INTO "tag" VALUES('turntable','Instrumentation > Turntable','https://ocremix.org/tag/turntable');
+INSERT INTO "tag" VALUES('ukulele','Instrumentation > Ukulele','https://ocremix.org/tag/ukulele');
+INSERT INTO "tag" VALUES('vaporwave','Genre > Experimental > Vaporwave','https://ocremix.org/tag/vaporwave');
+INSERT INTO "tag" VALUES('vibraphone','Instrumentation > Vibraphone','https://ocremix.org/tag/vibraphone');
+INSERT INTO "tag" VALUES('viola','Instrumentation > Viola','https://ocremix.org/tag/viola');
+INSERT INTO "tag" VALUES('violin','Instrumentation > Violin','https://ocremix.org/tag/violin');
+INSERT INTO "tag" VALUES('vocals-alto','Instrumentation > Vocals: Alto','https://ocremix.org/tag/vocals-alto');
+INSERT INTO "tag" VALUES('vocals-bass','Instrumentation > Vocals: Bass','https://ocremix.org/tag/vocals-bass');
+INSERT INTO "tag" VALUES('vocals-female','Instrumentation > Vocals: Female','https://ocremix.org/tag/vocals-female');
+INSERT INTO "tag" VALUES('vocals-male','Instrumentation > Vocals: Male','https://ocremix.org/tag/vocals-male');
+INSERT INTO "tag" VALUES('vocals-metal','Instrumentation > Vocals: Metal','https://ocremix.org/tag/vocals-metal');
+INSERT INTO "tag" VALUES('vocals-rapping','Instrumentation > Vocals: Rapping','https://ocremix.org/tag/vocals-rapping');
+INSERT INTO "tag" VALUES('vocals-soprano','Instrumentation > Vocals: Soprano','https://ocremix.org/tag/vocals-soprano');
+INSERT INTO "tag" VALUES('vocals-tenor','Instrumentation > Vocals: Tenor','https://ocremix.org/tag/vocals-tenor');
+INSERT INTO "tag" VALUES('vocals-voice-acting','Instrumentation > Vocals: Voice Acting','https://ocremix.org/tag/vocals-voice-acting');
+INSERT INTO "tag" VALUES('vocoder','Effects > Vocoder','https://ocremix.org/tag/vocoder');
+INSERT INTO "tag" VALUES('waltz','Genre > Classical > Waltz','https://ocremix.org/tag/waltz');
+INSERT INTO "tag" VALUES('wedding','Usage > Wedding','https://ocremix.org/tag/wedding');
+INSERT INTO "tag" VALUES('whistling','Instrumentation > Whistling','https://ocremix.org/tag/whistling');
+INSERT INTO "tag" VALUES('winter-holiday','Usage > Winter Holiday','https://ocremix.org/tag/winter-holiday');
+INSERT INTO "tag" VALUES('woodwinds','Instrumentation > Woodwinds','https://ocremix.org/tag/woodwinds');
+INSERT INTO "tag" VALUES('workout','Usage > Workout','https://ocremix.org/tag/workout');
+INSERT INTO "tag" VALUES('world','Regional > World','https://ocremix.org/tag/world');
+INSERT INTO "tag" VALUES('xylophone','Instrumentation > Xylophone','https://ocremix.org/tag/xylophone');
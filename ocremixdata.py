@@ -1,24 +1,559 @@
 import argparse
+import asyncio
+import bisect
 import collections
+import collections.abc
 import concurrent.futures
+import contextlib
+import cProfile
+import csv
 import datetime
+import functools
+import gzip
+import hashlib
+import heapq
+import http.client
+import http.server
+import io
+import itertools
 import json
+import math
+import operator
+import os
 import pathlib
+import re
 import sqlite3
+import sys
+import tempfile
 import textwrap
-import urllib.error
-import urllib.request
+import threading
+import time
+import typing
+import urllib.parse
+import zlib
 
 import htpy
 import lxml.etree
 import lxml.html
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# one row for the remix_search index per remix: title, game, artist names and
+# tag paths
+_SQL_SEARCH_ROWS = """
+    select
+        r.id, r.title, r.primary_game,
+        (
+            select group_concat(a.name, ' ')
+            from remix_artist ra join artist a on a.id = ra.artist_id
+            where ra.remix_id = r.id
+        ),
+        (
+            select group_concat(t.path, ' ')
+            from remix_tag rt join tag t on t.id = rt.tag_id
+            where rt.remix_id = r.id
+        )
+    from remix r
+"""
+_SQL_INSERT = re.compile(
+    r"""INSERT INTO "(\w+)" VALUES\(((?:'[^']*'|[^'()]+)*)\);\n?"""
+)
+_SQL_VALUE = re.compile(
+    r"""'((?:[^']|'')*)'|(NULL)|(-?\d+)(?![\d.eE])|(-?[\d.]+(?:[eE][-+]?\d+)?)"""
+    r"""|X'([0-9A-Fa-f]*)'"""
+)
+# tables the import keeps for itself, left out of the published database
+_INTERNAL_TABLES = ("remix_change", "remix_fetch", "remix_not_found")
+# in the sharded source, these tables are split into one file for every range of
+# this many values of the column; the ReMix tables share their ranges, so an import
+# only touches the files for the range its ids are in
+_SHARDS = {
+    "artist": ("id", 10000),
+    "game": ("id", 10000),
+    "remix": ("id", 1000),
+    "remix_artist": ("remix_id", 1000),
+    "remix_change": ("remix_id", 1000),
+    "remix_fetch": ("remix_id", 1000),
+    "remix_not_found": ("remix_id", 1000),
+    "remix_tag": ("remix_id", 1000),
+}
+# upper bounds in seconds of the latency histogram buckets
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_XPATH_ARTISTS = lxml.etree.XPath('//h2/a[starts-with(@href, "/artist")]')
+_XPATH_DOWNLOAD_URL = lxml.etree.XPath(
+    '//div[@id="modalDownload"]//a[contains(@href, "ocrmirror.org")]/@href'
+)
+_XPATH_GAME = lxml.etree.XPath("//h1/a")
+_XPATH_LYRICS = lxml.etree.XPath('//a[@href="#tab-lyrics"]')
+_XPATH_TAGS = lxml.etree.XPath('//a[starts-with(@href, "/tag/")]')
+_XPATH_YOUTUBE_URL = lxml.etree.XPath(
+    '//a[starts-with(@data-preview, "https://www.youtube.com/watch?v=")]'
+)
+
+
+class ApiData:
+    # the data behind `serve`; encoded responses are kept in an LRU cache keyed
+    # by the snapshot key of the data source, and when it changes the database is
+    # loaded again and the cache is cleared
+    def __init__(self, cache_size: int = 1024, check_interval: float = 1.0) -> None:
+        self.check_interval = check_interval
+        self.cnx = None
+        self.key = None
+        self.get = functools.lru_cache(maxsize=cache_size)(self._get)
+        self.get_bulk_files = functools.lru_cache(maxsize=1)(self._get_bulk_files)
+        self._checked = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        now = time.monotonic()
+        if self._checked is not None and now - self._checked < self.check_interval:
+            return
+        with self._lock:
+            if self._checked is not None and now - self._checked < self.check_interval:
+                return
+            self._checked = now
+            key = get_snapshot_key(get_data_source())
+            if key == self.key:
+                return
+            if self.cnx is not None:
+                print("The data has changed, loading it again")
+                self.cnx.close()
+            self.cnx = get_cnx(check_same_thread=False)
+            self.key = key
+            self.get.cache_clear()
+
+    def _get(self, key: str, path: str) -> ApiResponse:
+        # the key is only there to keep responses from older data apart
+        if match := re.fullmatch(r"/remix/OCR(\d{5})\.json", path):
+            with self._lock:
+                data = get_remix_data(self.cnx, int(match.group(1)))
+        elif match := re.fullmatch(r"/tag/([^/]+)\.json", path):
+            with self._lock:
+                data = get_tag_data(self.cnx, match.group(1))
+        elif path == "/ocremix-data.db":
+            with tempfile.TemporaryDirectory() as tmp, self._lock:
+                do_write_sqlite(self.cnx, pathlib.Path(tmp) / "ocremix-data.db")
+                body = (pathlib.Path(tmp) / "ocremix-data.db").read_bytes()
+            return make_api_response(body, "application/octet-stream")
+        elif path in ("/remix-index.json", "/remixes.ndjson") or re.fullmatch(
+            r"/remixes/OCR\d{5}-OCR\d{5}\.json", path
+        ):
+            if body := self.get_bulk_files(key).get(path):
+                content_type = (
+                    "application/x-ndjson"
+                    if path.endswith(".ndjson")
+                    else "application/json"
+                )
+                return make_api_response(body, content_type)
+            data = {}
+        else:
+            data = {}
+        if "id" not in data:
+            return ApiResponse(b"Not Found\n", "text/plain", None, None, 404)
+        body = json.dumps(data, indent=4, sort_keys=True).encode()
+        return make_api_response(body, "application/json")
+
+    def _get_bulk_files(self, key: str) -> dict[str, bytes]:
+        # the remix index, the NDJSON export and the shards all come out of one
+        # pass over the remix rows, so the first request for any of them builds
+        # them all
+        ndjson = io.BytesIO()
+        root = pathlib.Path("/")
+        with self._lock:
+            files = {
+                str(path): text.encode()
+                for path, text in make_remix_files(
+                    root, get_all_remix_rows(self.cnx), lambda *_: False, ndjson
+                )
+            }
+        files["/remixes.ndjson"] = ndjson.getvalue()
+        return files
+
+
+class ApiRequestHandler(http.server.BaseHTTPRequestHandler):
+    # keep-alive, conditional requests with ETag, and gzip when the client
+    # accepts it; Nagle is off so the body does not wait for the ack of the headers
+    disable_nagle_algorithm = True
+    protocol_version = "HTTP/1.1"
+    server: http.server.ThreadingHTTPServer
+
+    def do_GET(self) -> None:
+        self.respond()
+
+    def do_HEAD(self) -> None:
+        self.respond(head=True)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def respond(self, *, head: bool = False) -> None:
+        api: ApiData = self.server.api
+        api.refresh()
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        response = api.get(api.key, path)
+        accept_encoding = self.headers.get("Accept-Encoding", "")
+        gzip_ok = response.gzip_body is not None and get_accepts_gzip(accept_encoding)
+        body = response.gzip_body if gzip_ok else response.body
+        etag = response.etag
+        if etag is not None and gzip_ok:
+            # the gzip bytes are a different representation, with their own ETag
+            etag = f'{etag[:-1]}-gz"'
+        if_none_match = self.headers.get("If-None-Match", "")
+        if etag is not None and (
+            etag in (tag.strip() for tag in if_none_match.split(","))
+            or if_none_match.strip() == "*"
+        ):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        if gzip_ok:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+class ApiResponse(typing.NamedTuple):
+    body: bytes
+    content_type: str
+    etag: str | None
+    gzip_body: bytes | None
+    status: int
+
+
+class Artist(typing.NamedTuple):
+    id: int
+    name: str
+    url: str
+
+
+class Fetcher:
+    # fetches pages from one site over a pool of persistent connections, with at
+    # most `concurrency` requests in flight and at most `rate` requests started per
+    # second; timeouts, connection errors and 5xx responses are retried with
+    # exponential backoff
+    def __init__(
+        self,
+        base_url: str = "https://ocremix.org",
+        *,
+        backoff: float = 1.0,
+        concurrency: int = 4,
+        rate: float = 4.0,
+        retries: int = 3,
+        timeout: float = 30.0,
+    ) -> None:
+        url = urllib.parse.urlsplit(base_url)
+        self.base_url = base_url.rstrip("/")
+        self.backoff = backoff
+        self.concurrency = concurrency
+        self.headers = {
+            "User-Agent": "ocremix-data (+https://github.com/williamjacksn/ocremix-data)"
+        }
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.rate = rate
+        self.retries = retries
+        self.scheme = url.scheme
+        self.timeout = timeout
+        self._connections = []
+        self._lock = threading.Lock()
+        self._loop = None
+        self._next_request = 0.0
+        self._semaphore = None
+
+    def close(self) -> None:
+        with self._lock:
+            while self._connections:
+                self._connections.pop().close()
+
+    async def get(self, path: str, headers: dict | None = None) -> Response | None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            response = None
+            redirects = 0
+            attempt = 0
+            while attempt <= self.retries:
+                if attempt:
+                    _METRICS.count("fetch retries")
+                    await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+                await self._throttle()
+                start = time.perf_counter()
+                try:
+                    response = await asyncio.to_thread(
+                        self._request, path, headers or {}
+                    )
+                except (OSError, http.client.HTTPException) as e:
+                    print(f"There was a problem reading {self.base_url}{path}: {e}")
+                    _METRICS.count("fetch errors")
+                    attempt += 1
+                    continue
+                finally:
+                    _METRICS.observe("fetch", time.perf_counter() - start)
+                _METRICS.count(f"fetch responses {response.status}")
+                _METRICS.count("fetch bytes", len(response.body))
+                location = response.headers.get("location")
+                if response.status in (301, 302, 303, 307, 308) and location:
+                    target = urllib.parse.urlsplit(location)
+                    if target.netloc in ("", self.netloc) and redirects < 5:
+                        path = urllib.parse.urlunsplit(("", "", *target[2:]))
+                        path = path.removeprefix(self.prefix)
+                        redirects += 1
+                        continue
+                if response.status < 500:
+                    return response
+                attempt += 1
+            return response
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def _request(self, path: str, headers: dict) -> Response:
+        # runs on a worker thread; a pooled connection that the server has closed
+        # in the meantime is replaced once before the error counts as a failure
+        with self._lock:
+            cnx = self._connections.pop() if self._connections else None
+        for fresh in (False, True):
+            if cnx is None or fresh:
+                cnx = self._connect()
+            try:
+                cnx.request("GET", self.prefix + path, headers=self.headers | headers)
+                response = cnx.getresponse()
+                body = response.read()
+                break
+            except ConnectionError, http.client.RemoteDisconnected:
+                cnx.close()
+                if fresh:
+                    raise
+            except OSError, http.client.HTTPException:
+                cnx.close()
+                raise
+        if response.will_close:
+            cnx.close()
+        else:
+            with self._lock:
+                self._connections.append(cnx)
+        return Response(
+            body=body,
+            headers={k.lower(): v for k, v in response.getheaders()},
+            status=response.status,
+        )
+
+    async def _throttle(self) -> None:
+        if not self.rate:
+            return
+        now = time.monotonic()
+        wait = self._next_request - now
+        self._next_request = max(now, self._next_request) + 1 / self.rate
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class Game(typing.NamedTuple):
+    id: int
+    name: str
+    url: str
+
+
+class Metrics:
+    # wall time per phase, counters and latency histograms for --metrics; while
+    # it is off every method returns straight away, and nothing is recorded in
+    # the worker processes of a process pool
+    def __init__(self) -> None:
+        self.counters = collections.Counter()
+        self.enabled = False
+        self.histograms = {}
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def as_dict(self) -> dict:
+        histograms = {}
+        for name, (buckets, count, total, longest) in self.histograms.items():
+            # cumulative, like a Prometheus histogram
+            bounds = [*_LATENCY_BUCKETS, "+Inf"]
+            histograms[name] = {
+                "buckets": [
+                    {"count": n, "le": bound}
+                    for bound, n in zip(
+                        bounds, itertools.accumulate(buckets), strict=True
+                    )
+                ],
+                "count": count,
+                "max": longest,
+                "sum": total,
+            }
+        return {
+            "counters": dict(self.counters),
+            "histograms": histograms,
+            "phases": {
+                name: {"calls": calls, "seconds": seconds}
+                for name, (calls, seconds) in self.phases.items()
+            },
+        }
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] += n
+
+    def observe(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            buckets, count, total, longest = self.histograms.get(
+                name, ([0] * (len(_LATENCY_BUCKETS) + 1), 0, 0.0, 0.0)
+            )
+            buckets[bisect.bisect_left(_LATENCY_BUCKETS, seconds)] += 1
+            self.histograms[name] = (
+                buckets,
+                count + 1,
+                total + seconds,
+                max(longest, seconds),
+            )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> collections.abc.Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                calls, seconds = self.phases.get(name, (0, 0.0))
+                self.phases[name] = (calls + 1, seconds + elapsed)
+
+
+class Remix(typing.NamedTuple):
+    # queries select a prefix of these columns, in this order and by these names
+    id: int
+    title: str
+    primary_game: str | None = None
+    youtube_url: str | None = None
+    download_url: str | None = None
+    has_lyrics: int | None = None
+    primary_game_id: int | None = None
+    import_datetime: str | None = None
+
+
+class RemixCheck(typing.NamedTuple):
+    remix_id: int
+    check_datetime: str | None
+    first_check_datetime: str | None
+    changes: int
+
+
+class RemixFetch(typing.NamedTuple):
+    remix_id: int
+    etag: str | None
+    last_modified: str | None
+    page_sha256: str | None
+    fields_sha256: str | None
+
+
+class Response(typing.NamedTuple):
+    body: bytes
+    headers: dict
+    status: int
+
+
+class Tag(typing.NamedTuple):
+    id: str
+    path: str
+    url: str
+
+
+_METRICS = Metrics()
+
+
+def _join_sorted(
+    parents: collections.abc.Iterable,
+    children: collections.abc.Iterable,
+    key: collections.abc.Callable = operator.attrgetter("id"),
+) -> collections.abc.Iterator[tuple[tuple, list]]:
+    # parents are ordered by key; children are (parent key, record) pairs ordered
+    # by parent key, and their records are grouped with the parent with that key
+    groups = itertools.groupby(children, key=operator.itemgetter(0))
+    group = next(groups, None)
+    for parent in parents:
+        parent_key = key(parent)
+        while group is not None and group[0] < parent_key:
+            group = next(groups, None)
+        if group is not None and group[0] == parent_key:
+            yield parent, [child[1] for child in group[1]]
+            group = next(groups, None)
+        else:
+            yield parent, []
+
 
 def _swagger_ui_version() -> str:
     data = json.loads(pathlib.Path("package.json").read_text())
     return data.get("dependencies").get("swagger-ui-dist")
 
 
+def add_fetch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--base-url",
+        default="https://ocremix.org",
+        help="the site to fetch ReMix pages from, default https://ocremix.org",
+    )
+    parser.add_argument(
+        "--concurrency",
+        default=4,
+        help="the number of requests to make at the same time, default 4",
+        type=int,
+    )
+    parser.add_argument(
+        "--rate",
+        default=4.0,
+        help="the maximum number of requests to start per second, default 4",
+        type=float,
+    )
+    parser.add_argument(
+        "--retries",
+        default=3,
+        help="how many times to retry a request that failed or timed out, or that "
+        "got a server error, default 3",
+        type=int,
+    )
+    parser.add_argument(
+        "--timeout",
+        default=30.0,
+        help="seconds to wait for the server before a request fails, default 30",
+        type=float,
+    )
+
+
+def add_parser_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--parsers",
+        default=os.cpu_count() or 1,
+        help="the number of pages to parse at the same time, default the number of "
+        "CPUs",
+        type=int,
+    )
+
+
 def cli_build_pages(args: argparse.Namespace) -> None:
     index_html = htpy.html(lang="en")[
         htpy.head[
@@ -37,11 +572,6 @@ def cli_build_pages(args: argparse.Namespace) -> None:
             htpy.script(src="index.js"),
         ],
     ]
-    target: pathlib.Path = args.directory / "index.html"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    print(f"writing to {target}")
-    target.write_text(str(index_html), newline="\n")
-
     index_js = textwrap.dedent("""\
         window.onload = () => {
             window.ui = SwaggerUIBundle({
@@ -50,104 +580,426 @@ def cli_build_pages(args: argparse.Namespace) -> None:
             });
         };
     """)
-    target = args.directory / "index.js"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    print(f"writing to {target}")
-    target.write_text(index_js, newline="\n")
 
     cnx = get_cnx()
 
-    for ocr_id in get_remix_ids(cnx):
-        target = args.directory / f"remix/OCR{ocr_id:05}.json"
-        target.parent.mkdir(parents=True, exist_ok=True)
-        with target.open("w") as f:
-            print(f"writing to {target}")
-            json.dump(get_remix_data(cnx, ocr_id), f, indent=4, sort_keys=True)
-
-    for tag_id in get_tag_ids(cnx):
-        target = args.directory / f"tag/{tag_id}.json"
-        target.parent.mkdir(parents=True, exist_ok=True)
-        with target.open("w") as f:
-            print(f"writing to {target}")
-            json.dump(get_tag_data(cnx, tag_id), f, indent=4, sort_keys=True)
+    # documents whose source rows have the same fingerprint as in the previous
+    # build, and whose file is still there, are not generated again; the manifest
+    # is kept in the cache directory, so it is never published with the pages
+    manifest_file = get_cache_dir() / "build-manifest.json"
+    manifest = {} if args.full else read_build_manifest(manifest_file, args.directory)
+    (args.directory / ".build-manifest.json").unlink(missing_ok=True)
+    documents = {}
+    up_to_date = []
+    # the variants are part of the fingerprint, so changing --compress or
+    # --minify builds every document again
+    variants = (
+        [p.suffix for p in get_compressed_paths(args.directory)]
+        if args.compress
+        else []
+    ) + ([".min.json"] if args.minify else [])
+
+    def changed(name: str, rows: tuple) -> bool:
+        fingerprint = hashlib.sha256(repr((rows, variants)).encode()).hexdigest()
+        previous = manifest.get(name, {})
+        if (
+            previous.get("fingerprint") == fingerprint
+            and (args.directory / name).exists()
+        ):
+            documents[name] = previous
+            up_to_date.append(name)
+            return False
+        documents[name] = {"fingerprint": fingerprint}
+        return True
+
+    # the bulk exports come out of the same pass over the remix rows; the NDJSON
+    # file is streamed to disk and only replaces the old one if it is different
+    ndjson_target = args.directory / "remixes.ndjson"
+    ndjson_target.parent.mkdir(parents=True, exist_ok=True)
+    with ndjson_target.with_suffix(".ndjson.tmp").open("wb") as ndjson:
+        files = itertools.chain(
+            [
+                (args.directory / "index.html", str(index_html)),
+                (args.directory / "index.js", index_js),
+            ],
+            make_remix_files(args.directory, get_all_remix_rows(cnx), changed, ndjson),
+            (
+                (args.directory / name, make_tag_data(*rows))
+                for rows in get_all_tag_rows(cnx)
+                if changed(name := f"tag/{rows[0].id}.json", rows)
+            ),
+        )
+        with _METRICS.phase("documents"):
+            totals = write_output_files(
+                files, compress=args.compress, minify=args.minify
+            )
+    if write_output_stream(
+        ndjson_target.with_suffix(".ndjson.tmp"), ndjson_target, compress=args.compress
+    ):
+        print(f"wrote {ndjson_target}")
+    _METRICS.count("files written", totals.get("written"))
+    _METRICS.count("files unchanged", totals.get("skipped"))
+    _METRICS.count("bytes written", totals.get("bytes"))
+    for target, sha256 in totals.get("sha256").items():
+        name = target.relative_to(args.directory).as_posix()
+        if name in documents:
+            documents[name]["sha256"] = sha256
+
+    removed = 0
+    for name in manifest.keys() - documents.keys() - {"ocremix-data.db"}:
+        target = args.directory / name
+        for path in (target, target.with_suffix(".min.json")):
+            path.unlink(missing_ok=True)
+            for compressed in get_compressed_paths(path):
+                compressed.unlink(missing_ok=True)
+        removed += 1
+
+    print(
+        f"{totals.get('written')} files written ({totals.get('bytes')} bytes), "
+        f"{totals.get('skipped')} unchanged, "
+        f"{len(up_to_date)} up to date, {removed} removed, in {args.directory}"
+    )
 
     target = args.directory / "ocremix-data.db"
     print(f"writing to {target}")
     do_write_sqlite(cnx, target)
+    data = target.read_bytes()
+    documents["ocremix-data.db"] = {"sha256": hashlib.sha256(data).hexdigest()}
+    db_changed = manifest.get("ocremix-data.db") != documents.get("ocremix-data.db")
+    if args.compress and (
+        db_changed or not all(p.exists() for p in get_compressed_paths(target))
+    ):
+        print(f"compressing {target}")
+        with _METRICS.phase("compress"):
+            _METRICS.count("bytes written", write_compressed_files(target, data))
+    elif not args.compress and db_changed:
+        for path in get_compressed_paths(target):
+            path.unlink(missing_ok=True)
+    write_build_manifest(manifest_file, args.directory, documents)
+
+
+def cli_check_query_plans(args: argparse.Namespace) -> None:
+    cnx = get_cnx()
+    # the writes below are never saved, so they must not reach the search index in
+    # the cache directory either
+    if get_search_schema(cnx) == "search":
+        cnx.execute("detach database search")
+    make_search_index(cnx)
+    statements = []
+    cnx.set_trace_callback(statements.append)
+
+    # run every query in this module once, against real ids; the writes only
+    # change the in-memory database and are never written to disk
+    ocr_id = get_last_local_remix_id(cnx)
+    remix_data = get_remix_data(cnx, ocr_id)
+    tag_id = remix_data.get("tags")[0].get("id")
+    get_tag_data(cnx, tag_id)
+    get_remix_ids(cnx)
+    get_remix_ids_first_imported(cnx)
+    get_remix_ids_to_check(cnx)
+    get_search_results(cnx, remix_data.get("title"))
+    get_missing_remix_ids(cnx, ocr_id)
+    get_tag_ids(cnx)
+    for table, shard in dict(sorted(get_shards(cnx))).items():
+        get_shard_text(cnx, table, shard)
+    collections.deque(get_all_remix_rows(cnx), maxlen=0)
+    collections.deque(get_all_tag_rows(cnx), maxlen=0)
+    game = execute_records(
+        cnx,
+        Game,
+        "select g.id, g.name, g.url from game g join remix r "
+        "on r.primary_game_id = g.id where r.id = :id",
+        {"id": ocr_id},
+    ).fetchone()
+    write_game(cnx, game._asdict())
+    write_remix(
+        cnx,
+        remix_data
+        | {
+            "has_lyrics": int(remix_data.get("has_lyrics")),
+            "import_datetime": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+            "primary_game_id": game.id,
+        },
+    )
+    write_artist_batch(cnx, remix_data.get("artists"))
+    write_remix_artist(cnx, ocr_id, [a.get("id") for a in remix_data.get("artists")])
+    write_tag_batch(cnx, remix_data.get("tags"))
+    write_remix_tags(cnx, ocr_id, [t.get("id") for t in remix_data.get("tags")])
+    write_remix_search(cnx, [ocr_id])
+    write_remix_fetch(
+        cnx,
+        {
+            "etag": None,
+            "fields_sha256": None,
+            "last_modified": None,
+            "page_sha256": None,
+            "remix_id": ocr_id,
+        },
+    )
+    get_remix_fetch(cnx, [ocr_id])
+    write_remix_fields_sha256(cnx, ocr_id, get_fields_sha256(remix_data))
+    write_remix_not_found(
+        cnx, ocr_id, datetime.datetime.now(tz=datetime.UTC).isoformat()
+    )
+    write_remix_found(cnx, ocr_id)
+    write_remix_change(
+        cnx, ocr_id, datetime.datetime.now(tz=datetime.UTC).isoformat(), True
+    )
+    write_remix_import_datetime(
+        cnx, ocr_id, datetime.datetime.now(tz=datetime.UTC).isoformat()
+    )
+    if get_data_source().is_dir():
+        # applying the changes again leaves the data as it is
+        write_row_changes(cnx, get_row_changes(cnx))
+    cnx.set_trace_callback(None)
+
+    archive = get_archive_cnx(":memory:")
+    archive_statements = []
+    archive.set_trace_callback(archive_statements.append)
+    write_archived_pages(
+        archive,
+        [
+            {
+                "body": zlib.compress(b""),
+                "fetch_datetime": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+                "page_sha256": hashlib.sha256(b"").hexdigest(),
+                "remix_id": ocr_id,
+            }
+        ],
+    )
+    collections.deque(get_archived_pages(archive), maxlen=0)
+    archive.set_trace_callback(None)
+
+    failed = False
+    for db, db_statements in ((cnx, statements), (archive, archive_statements)):
+        for sql in dict.fromkeys(db_statements):
+            if sql.split(None, 1)[0].lower() in ("begin", "commit", "pragma"):
+                continue
+            if sql.startswith("--"):
+                # run by a virtual table module on its own shadow tables
+                continue
+            problems = get_query_plan_problems(db, sql)
+            print(f"{'FAIL' if problems else 'ok  '} {' '.join(sql.split())[:100]}")
+            for problem in problems:
+                print(f"     {problem}")
+            failed = failed or bool(problems)
+    archive.close()
+    cnx.close()
+    if failed:
+        raise SystemExit(1)
+
+
+def cli_compact(args: argparse.Namespace) -> None:
+    source = get_data_source()
+    if not source.is_dir():
+        print(f"{source} is a single-file dump, which has no change journal")
+        return
+    journal = source / "changes.jsonl"
+    size = journal.stat().st_size if journal.exists() else 0
+    if size == 0:
+        print(f"there are no changes to fold into {source}")
+        return
+    if size < args.threshold:
+        print(
+            f"{journal} has {size:,} bytes, below the threshold of {args.threshold:,}"
+        )
+        return
+    cnx = get_cnx()
+    with _METRICS.phase("compact"):
+        written = do_compact(cnx, source)
+    write_snapshot(cnx, get_snapshot_key(source))
+    cnx.close()
+    print(f"folded {size:,} bytes of changes from {journal} into {written} files")
+
+
+def cli_convert_data(args: argparse.Namespace) -> None:
+    source = get_data_source()
+    cnx = get_cnx()
+    if args.format == "shards":
+        target = pathlib.Path("ocremix-data").resolve()
+        if source == target:
+            print(f"{source} is already in the sharded format")
+            return
+        written = write_shards(cnx, target)
+        source.unlink()
+        print(f"wrote {written} files to {target} and removed {source}")
+    else:
+        target = pathlib.Path("ocremix-data.sql").resolve()
+        if source == target:
+            print(f"{source} is already a single-file dump")
+            return
+        write_dump(cnx, target)
+        for path in source.rglob("*.sql"):
+            path.unlink()
+        (source / "changes.jsonl").unlink(missing_ok=True)
+        for path in sorted(source.rglob("*"), reverse=True):
+            path.rmdir()
+        source.rmdir()
+        print(f"wrote {target} and removed {source}")
+    write_snapshot(cnx, get_snapshot_key(target))
+    cnx.close()
 
 
 def cli_import(args: argparse.Namespace) -> None:
-    do_import(args.ocr_id)
+    cnx = get_cnx()
+    fetcher = get_fetcher(args)
+    do_import(cnx, args.ocr_id, fetcher)
+    fetcher.close()
+    write_data_and_close(cnx)
 
 
 def cli_import_missing(args: argparse.Namespace) -> None:
     cnx = get_cnx()
-    last_local_id = get_last_local_remix_id(cnx)
-    last_published_id = get_last_published_remix_id()
-    while last_local_id < last_published_id:
-        last_local_id += 1
-        do_import(last_local_id)
+    fetcher = get_fetcher(args)
+    last_published_id = get_last_published_remix_id(fetcher)
+    ocr_ids = get_missing_remix_ids(
+        cnx,
+        last_published_id,
+        recheck_after=datetime.timedelta(days=args.recheck_after),
+        retry_not_found=args.retry_not_found,
+    )
+    print(f"{len(ocr_ids)} ReMixes missing up to OCR{last_published_id:05}")
+    do_import_batch(cnx, ocr_ids, fetcher, 0, args.parsers)
+    fetcher.close()
+    write_data_and_close(cnx)
 
 
 def cli_json(args: argparse.Namespace) -> None:
     do_json(args.ocr_id)
 
 
+def cli_reparse(args: argparse.Namespace) -> None:
+    cnx = get_cnx()
+    archive = get_archive_cnx()
+    do_reparse(cnx, archive, args.parsers)
+    archive.close()
+    write_data_and_close(cnx)
+
+
+def cli_search(args: argparse.Namespace) -> None:
+    cnx = get_cnx()
+    write_search_index(cnx)
+    results = get_search_results(cnx, args.text, args.limit)
+    print(json.dumps(results, indent=4, sort_keys=True))
+    cnx.close()
+
+
+def cli_serve(args: argparse.Namespace) -> None:
+    api = ApiData(cache_size=args.cache_size)
+    api.refresh()
+    server = http.server.ThreadingHTTPServer((args.host, args.port), ApiRequestHandler)
+    server.api = api
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+
 def cli_update(args: argparse.Namespace) -> None:
     cnx = get_cnx()
-    with concurrent.futures.ThreadPoolExecutor() as ex:
-        future_to_ocr_id = {}
-        for remix_id in get_remix_ids_first_imported(cnx, args.limit):
-            future_to_ocr_id[ex.submit(get_html, remix_id)] = remix_id
-        for future in concurrent.futures.as_completed(future_to_ocr_id):
-            remix_id = future_to_ocr_id[future]
-            print(f"Processing OCR{remix_id:05}")
-            do_import_html(remix_id, future.result())
+    fetcher = get_fetcher(args)
+    if args.all:
+        # every finished batch goes into the journal, so a run that is interrupted
+        # picks up where it stopped; the journal is removed once the data is saved
+        journal = get_cache_dir() / "update-all.jsonl"
+        done = read_update_journal(cnx, journal)
+        if done:
+            print(f"Resuming, {len(done)} ReMixes already done")
+        ocr_ids = [
+            ocr_id
+            for ocr_id in get_remix_ids_first_imported(cnx, -1)
+            if ocr_id not in done
+        ]
+        do_import_batch(
+            cnx,
+            ocr_ids,
+            fetcher,
+            args.checkpoint,
+            args.parsers,
+            journal=journal,
+            processes=True,
+        )
+        fetcher.close()
+        write_data_and_close(cnx)
+        journal.unlink(missing_ok=True)
+        return
+    ocr_ids = get_remix_ids_to_check(
+        cnx,
+        args.limit,
+        max_age=datetime.timedelta(days=args.max_age),
+        policy=args.policy,
+    )
+    do_import_batch(cnx, ocr_ids, fetcher, args.checkpoint, args.parsers)
+    fetcher.close()
+    write_data_and_close(cnx)
 
 
 def cli_write_sqlite(args: argparse.Namespace) -> None:
     cnx = get_cnx()
-    do_write_sqlite(cnx, args.file)
+    do_write_sqlite(cnx, args.file, args.page_size)
     cnx.close()
 
 
-def do_import(ocr_id: int) -> None:
+def do_compact(cnx: sqlite3.Connection, directory: pathlib.Path) -> int:
+    # rewrites the shards the change journal has rows for, from a connection that
+    # has the journal applied, and removes the journal
+    journal = directory / "changes.jsonl"
+    written = write_shards(cnx, directory, get_change_journal_shards(journal))
+    journal.unlink(missing_ok=True)
+    return written
+
+
+def do_import(
+    cnx: sqlite3.Connection, ocr_id: int, fetcher: Fetcher | None = None
+) -> None:
     print(f"Processing OCR{ocr_id:05}")
 
-    html = get_html(ocr_id)
+    html = get_html(ocr_id, fetcher)
     if html is None:
         return
 
-    do_import_html(ocr_id, html)
-
-
-def do_import_html(ocr_id: int, html: lxml.html.HtmlElement) -> None:
-    cnx = get_cnx()
+    do_import_html(cnx, ocr_id, html)
 
-    primary_game = parse_remix_primary_game(html)
-    write_game(cnx, primary_game)
 
-    remix_params = {
-        "download_url": parse_download_url(html),
-        "has_lyrics": 1 if parse_has_lyrics(html) else 0,
-        "id": ocr_id,
-        "import_datetime": datetime.datetime.now(tz=datetime.UTC).isoformat(),
-        "primary_game": primary_game.get("name"),
-        "primary_game_id": primary_game.get("id"),
-        "title": parse_remix_title(html),
-        "youtube_url": parse_youtube_url(html),
-    }
-    write_remix(cnx, remix_params)
-
-    artists = parse_remix_artists(html)
-    write_artist_batch(cnx, artists)
-    write_remix_artist(cnx, ocr_id, [a.get("id") for a in artists])
+def do_import_batch(
+    cnx: sqlite3.Connection,
+    ocr_ids: collections.abc.Iterable[int],
+    fetcher: Fetcher,
+    checkpoint: int = 0,
+    parsers: int | None = None,
+    *,
+    batch_size: int = 50,
+    journal: pathlib.Path | None = None,
+    processes: bool = False,
+) -> None:
+    archive = get_archive_cnx()
+    results = asyncio.run(
+        import_pipeline(
+            cnx,
+            ocr_ids,
+            fetcher,
+            archive=archive,
+            batch_size=batch_size,
+            checkpoint=checkpoint,
+            journal=journal,
+            parsers=parsers,
+            processes=processes,
+        )
+    )
+    archive.close()
+    if results:
+        print(
+            ", ".join(f"{count} {result}" for result, count in sorted(results.items()))
+        )
 
-    tags = parse_remix_tags(html)
-    write_tag_batch(cnx, tags)
-    write_remix_tags(cnx, ocr_id, [t.get("id") for t in tags])
 
-    write_data_and_close(cnx)
+def do_import_html(
+    cnx: sqlite3.Connection, ocr_id: int, html: lxml.html.HtmlElement
+) -> None:
+    write_remix_page(cnx, ocr_id, parse_remix_page(html))
 
 
 def do_json(ocr_id: int) -> None:
@@ -156,30 +1008,330 @@ def do_json(ocr_id: int) -> None:
     print(json.dumps(data, indent=4, sort_keys=True))
 
 
-def do_write_sqlite(cnx: sqlite3.Connection, target: pathlib.Path) -> None:
-    target_cnx = sqlite3.connect(target)
-    with target_cnx:
+def do_reparse(
+    cnx: sqlite3.Connection, archive: sqlite3.Connection, parsers: int | None = None
+) -> None:
+    # runs the parser over the newest archived page of every ReMix on a pool of
+    # processes and writes the results in one transaction; import_datetime is set
+    # to the time the page was fetched unless the ReMix was checked later, and
+    # nothing is fetched from the site. The fields hash is stored again too, or the
+    # next fetch after a parser fix would count every ReMix as changed
+    results = collections.Counter()
+    archived_pages = get_archived_pages(archive)
+    with concurrent.futures.ProcessPoolExecutor(parsers) as pool:
+        cnx.execute("begin")
+        # hand the pool a slice at a time, so only that many pages are in memory
+        while chunk := list(itertools.islice(archived_pages, 1000)):
+            for remix_id, fetch_datetime, page in pool.map(
+                parse_archived_page, chunk, chunksize=16
+            ):
+                if page is None:
+                    print(
+                        "There was a problem parsing the archived page for "
+                        f"OCR{remix_id:05}"
+                    )
+                    results["failed"] += 1
+                    continue
+                write_remix_page(cnx, remix_id, page, fetch_datetime)
+                write_remix_fields_sha256(cnx, remix_id, get_fields_sha256(page))
+                results["reparsed"] += 1
+        cnx.commit()
+    for result, count in results.items():
+        _METRICS.count(f"pages {result}", count)
+    print(", ".join(f"{count} {result}" for result, count in sorted(results.items())))
+
+
+def do_write_sqlite(
+    cnx: sqlite3.Connection, target: pathlib.Path, page_size: int = 1024
+) -> None:
+    # the published file leaves out the tables and columns that only the import
+    # uses, gets indexes for lookups and ANALYZE statistics, and is vacuumed with
+    # small pages in rollback-journal mode, so readers that fetch pages over HTTP
+    # range requests, or open the file with immutable=1, read as little as
+    # possible; a fresh file every time, so the same data gives the same bytes
+    with _METRICS.phase("write-sqlite"):
+        target.unlink(missing_ok=True)
+        target_cnx = sqlite3.connect(target, isolation_level=None)
         cnx.backup(target_cnx)
-    target_cnx.close()
+        target_cnx.execute("begin")
+        for table in _INTERNAL_TABLES:
+            target_cnx.execute(f"drop table if exists {table}")
+        target_cnx.execute("drop index if exists remix_import_datetime")
+        tables = target_cnx.execute(
+            "select name from sqlite_schema where type = 'table'"
+        )
+        for (table,) in tables.fetchall():
+            for column in target_cnx.execute(f"pragma table_info({table})").fetchall():
+                if column[1].startswith("_"):
+                    target_cnx.execute(f"alter table {table} drop column {column[1]}")
+        target_cnx.execute(
+            "create index remix_primary_game_id on remix (primary_game_id, id)"
+        )
+        target_cnx.execute("commit")
+        make_search_index(target_cnx, "main", contentless=True)
+        target_cnx.execute(
+            "insert into remix_search (remix_search) values ('optimize')"
+        )
+        target_cnx.execute("analyze")
+        target_cnx.execute("pragma journal_mode = delete")
+        target_cnx.execute(f"pragma page_size = {int(page_size)}")
+        target_cnx.execute("vacuum")
+        target_cnx.close()
+    _METRICS.count("bytes written", target.stat().st_size)
 
 
-def get_cnx() -> sqlite3.Connection:
-    ocremix_data_sql = pathlib.Path("ocremix-data.sql").resolve()
-    cnx = sqlite3.connect(":memory:")
+def execute_statement(cnx: sqlite3.Connection, sql: str) -> None:
+    # executescript commits any open transaction first, so it is only used for
+    # input that holds more than one statement
+    try:
+        cnx.execute(sql)
+    except sqlite3.ProgrammingError:
+        cnx.executescript(sql)
+
+
+def execute_records(
+    cnx: sqlite3.Connection,
+    record: type,
+    sql: str,
+    params: dict | None = None,
+    *,
+    keyed: bool = False,
+) -> sqlite3.Cursor:
+    # rows are returned as record instances; with keyed, the first column is kept
+    # apart and rows are (first column, record) pairs. The rows are bound by
+    # position, so the column names are checked against the fields once per query
+    cursor = cnx.cursor()
+    cursor.execute(sql, params or {})
+    names = [d[0] for d in cursor.description][int(keyed) :]
+    if names != list(record._fields[: len(names)]):
+        msg = f"columns {names} do not match the fields of {record.__name__}"
+        raise ValueError(msg)
+    if keyed:
+        cursor.row_factory = lambda _, row: (row[0], record(*row[1:]))
+    else:
+        cursor.row_factory = lambda _, row: record(*row)
+    return cursor
+
+
+def get_all_remix_data(cnx: sqlite3.Connection) -> collections.abc.Iterator[dict]:
+    # same documents as get_remix_data, for every remix in id order
+    for rows in get_all_remix_rows(cnx):
+        yield make_remix_data(*rows)
+
+
+def get_all_remix_rows(
+    cnx: sqlite3.Connection,
+) -> collections.abc.Iterator[tuple[Remix, list[Artist], list[Tag]]]:
+    # every remix row with its artist and tag rows, built from one pass over each
+    # table
+    remix_sql = """
+        select id, title, primary_game, youtube_url, download_url, has_lyrics
+        from remix
+        order by id
+    """
+    artists_sql = """
+        select ra.remix_id, a.id, a.name, a.url
+        from remix_artist ra
+        join artist a on a.id = ra.artist_id
+        order by ra.remix_id, ra.artist_id
+    """
+    tags_sql = """
+        select rt.remix_id, t.id, t.path, t.url
+        from remix_tag rt
+        join tag t on t.id = rt.tag_id
+        order by rt.remix_id, rt.tag_id
+    """
+    remixes = _join_sorted(
+        _join_sorted(
+            execute_records(cnx, Remix, remix_sql),
+            execute_records(cnx, Artist, artists_sql, keyed=True),
+        ),
+        execute_records(cnx, Tag, tags_sql, keyed=True),
+        key=lambda remix: remix[0].id,
+    )
+    for (row, artist_rows), tag_rows in remixes:
+        yield row, artist_rows, tag_rows
+
+
+def get_all_tag_data(cnx: sqlite3.Connection) -> collections.abc.Iterator[dict]:
+    # same documents as get_tag_data, for every tag in id order
+    for rows in get_all_tag_rows(cnx):
+        yield make_tag_data(*rows)
+
+
+def get_all_tag_rows(
+    cnx: sqlite3.Connection,
+) -> collections.abc.Iterator[tuple[Tag, list[Remix]]]:
+    tag_sql = "select id, path, url from tag order by id"
+    remix_sql = """
+        select rt.tag_id, r.id, r.title, r.primary_game, r.youtube_url
+        from remix_tag rt
+        join remix r on r.id = rt.remix_id
+        order by rt.tag_id, rt.remix_id
+    """
+    yield from _join_sorted(
+        execute_records(cnx, Tag, tag_sql),
+        execute_records(cnx, Remix, remix_sql, keyed=True),
+    )
+
+
+def get_archive_cnx(path: pathlib.Path | str | None = None) -> sqlite3.Connection:
+    # fetched pages are kept zlib-compressed in their own database in the cache
+    # directory, one row for every distinct page seen for a ReMix
+    if path is None:
+        get_cache_dir().mkdir(parents=True, exist_ok=True)
+        path = get_cache_dir() / "pages.db"
+    archive = sqlite3.connect(path)
+    archive.row_factory = namedtuple_factory
+    archive.execute("""
+        create table if not exists page (
+            remix_id integer not null,
+            fetch_datetime text not null,
+            page_sha256 text not null,
+            body blob not null,
+            primary key (remix_id, fetch_datetime),
+            unique (remix_id, page_sha256)
+        ) strict
+    """)
+    return archive
+
+
+def get_archived_pages(
+    archive: sqlite3.Connection,
+) -> collections.abc.Iterator[tuple[int, str, bytes]]:
+    # the most recent page for every ReMix; with max(), SQLite takes the other
+    # columns from the row that has the maximum
+    sql = """
+        select remix_id, max(fetch_datetime) fetch_datetime, body
+        from page group by remix_id
+    """
+    for row in archive.execute(sql):
+        yield row.remix_id, row.fetch_datetime, row.body
+
+
+def get_cache_dir() -> pathlib.Path:
+    return pathlib.Path(os.environ.get("OCREMIX_DATA_CACHE", ".cache")).resolve()
+
+
+def get_cnx(*, check_same_thread: bool = True) -> sqlite3.Connection:
+    source = get_data_source()
+    cnx = sqlite3.connect(":memory:", check_same_thread=check_same_thread)
     cnx.row_factory = namedtuple_factory
-    with ocremix_data_sql.open(encoding="utf_8") as f:
-        cnx.executescript(f.read())
+    with _METRICS.phase("load"):
+        key = get_snapshot_key(source)
+        snapshot = get_cache_dir() / "ocremix-data.db"
+        loaded = False
+        try:
+            state = json.loads((get_cache_dir() / "ocremix-data.json").read_text())
+            if state.get("snapshot_key") == key:
+                cnx.deserialize(snapshot.read_bytes())
+                _METRICS.count("snapshot loads")
+                loaded = True
+        except OSError, ValueError, sqlite3.DatabaseError:
+            pass
+        if not loaded:
+            read_source(cnx, source)
+            write_snapshot(cnx, key)
+        read_search_index(cnx, key)
+        if source.is_dir():
+            make_change_triggers(cnx)
     return cnx
 
 
-def get_html(ocr_id: int) -> lxml.html.HtmlElement:
-    url = f"https://ocremix.org/remix/OCR{ocr_id:05}"
-    try:
-        data = urllib.request.urlopen(url)
-        page = data.read().decode()
-        return lxml.html.fromstring(page)
-    except urllib.error.HTTPError:
-        print(f"There was a problem reading {url}")
+def get_change_journal_shards(journal: pathlib.Path) -> set[tuple[str, int]]:
+    # every (table, shard) with a row in the change journal
+    result = set()
+    for record in read_change_journal(journal):
+        table = record.get("table")
+        if table not in _SHARDS:
+            result.add((table, 0))
+            continue
+        column, width = _SHARDS.get(table)
+        values = record.get("row") or record.get("key")
+        result.add((table, values.get(column) // width))
+    return result
+
+
+def get_change_probability(check: RemixCheck, now: datetime.datetime) -> float:
+    # changes are treated as a Poisson process: the rate is the changes seen per
+    # day of observation, with half a change over a week as the prior, and the
+    # result is the chance of at least one change since the last check
+    if check.check_datetime is None:
+        return 1.0
+    since_check = now - datetime.datetime.fromisoformat(check.check_datetime)
+    observed = datetime.timedelta(0)
+    if check.first_check_datetime is not None:
+        observed = now - datetime.datetime.fromisoformat(check.first_check_datetime)
+    rate = (check.changes + 0.5) / (observed / datetime.timedelta(days=1) + 7)
+    return 1 - math.exp(-rate * (since_check / datetime.timedelta(days=1)))
+
+
+def get_compressed_paths(target: pathlib.Path) -> list[pathlib.Path]:
+    # the precompressed copies that sit next to an output file; brotli is only
+    # used when the brotli extra is installed
+    suffixes = [".gz"] if brotli is None else [".gz", ".br"]
+    return [target.with_name(f"{target.name}{suffix}") for suffix in suffixes]
+
+
+def get_accepts_gzip(accept_encoding: str) -> bool:
+    # gzip is acceptable when it is listed, or covered by *, without q=0
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip().removeprefix("q=").strip() if "q=" in params else "1"
+        try:
+            return float(q) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def get_conditional_headers(state: RemixFetch) -> dict:
+    headers = {}
+    if state.etag:
+        headers["If-None-Match"] = state.etag
+    if state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+    return headers
+
+
+def get_data_source() -> pathlib.Path:
+    # the sharded directory when there is one, otherwise the single-file dump
+    directory = pathlib.Path("ocremix-data").resolve()
+    if directory.is_dir():
+        return directory
+    return pathlib.Path("ocremix-data.sql").resolve()
+
+
+def get_fetcher(args: argparse.Namespace) -> Fetcher:
+    return Fetcher(
+        args.base_url,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        retries=args.retries,
+        timeout=args.timeout,
+    )
+
+
+def get_fields_sha256(page: dict) -> str:
+    # what a parsed page is compared by, so a page that only changed in markup the
+    # parser ignores is not counted as a change
+    return hashlib.sha256(json.dumps(page, sort_keys=True).encode()).hexdigest()
+
+
+def get_html(
+    ocr_id: int, fetcher: Fetcher | None = None
+) -> lxml.html.HtmlElement | None:
+    fetcher = fetcher or Fetcher()
+    response = asyncio.run(fetcher.get(get_remix_path(ocr_id)))
+    return read_html(fetcher, ocr_id, response)
+
+
+def get_json_object_sql(row: str, columns: list[str]) -> str:
+    # a json_object() expression for some columns of a row or trigger row
+    pairs = ", ".join(f"'{c}', {row}.{c}" for c in columns)
+    return f"json_object({pairs})"
 
 
 def get_last_local_remix_id(cnx: sqlite3.Connection) -> int:
@@ -189,15 +1341,107 @@ def get_last_local_remix_id(cnx: sqlite3.Connection) -> int:
     return 0
 
 
-def get_last_published_remix_id() -> int:
-    data = urllib.request.urlopen("https://ocremix.org/feeds/ten20/")
-    xml = lxml.etree.parse(data)
+def get_last_published_remix_id(fetcher: Fetcher | None = None) -> int:
+    fetcher = fetcher or Fetcher()
+    response = asyncio.run(fetcher.get("/feeds/ten20/"))
+    if response is None or response.status != 200:
+        raise SystemExit(f"There was a problem reading {fetcher.base_url}/feeds/ten20/")
+    xml = lxml.etree.fromstring(response.body)
     for item_el in xml.iter("item"):
         link_el = item_el.find("link")
         return int(link_el.text.split("/")[4][3:])
     return 0
 
 
+def get_missing_remix_ids(
+    cnx: sqlite3.Connection,
+    last_id: int,
+    *,
+    recheck_after: datetime.timedelta = datetime.timedelta(days=30),
+    retry_not_found: bool = False,
+) -> list[int]:
+    # every id from 1 to last_id that is not in the remix table, and unless
+    # retry_not_found is set, that did not return 404 within recheck_after; a 404
+    # can be temporary, so it does not keep an id out for good
+    sql = """
+        with recursive ids (id) as (
+            select 1 where :last_id > 0
+            union all
+            select id + 1 from ids where id < :last_id
+        )
+        select id from ids
+        where not exists (select 1 from remix r where r.id = ids.id)
+        and (:retry_not_found or not exists (
+            select 1 from remix_not_found n
+            where n.remix_id = ids.id and n.check_datetime > :checked_since
+        ))
+    """
+    checked_since = datetime.datetime.now(tz=datetime.UTC) - recheck_after
+    params = {
+        "checked_since": checked_since.isoformat(),
+        "last_id": last_id,
+        "retry_not_found": retry_not_found,
+    }
+    return [row.id for row in cnx.execute(sql, params)]
+
+
+def get_query_plan_problems(cnx: sqlite3.Connection, sql: str) -> list[str]:
+    # a statement may only scan a whole table when it reads every row of that
+    # table; lookups, joins and sorts must all be served by an index. Virtual
+    # tables such as json_each over a list of ids are left to their module, and
+    # common table expressions only hold rows the statement generates itself.
+    result = []
+    ctes = re.findall(r"\b(\w+)\s*(?:\([\w\s,]*\))?\s+as\s*\(", sql, re.IGNORECASE)
+    plan = cnx.execute(f"explain query plan {sql}").fetchall()
+    for i, row in enumerate(plan):
+        if "TEMP B-TREE" in row.detail or (
+            row.detail.startswith("SCAN")
+            and row.detail != "SCAN CONSTANT ROW"
+            and "VIRTUAL TABLE" not in row.detail
+            and row.detail.split()[1] not in ctes
+            and (i > 0 or re.search(r"\bwhere\b", sql, re.IGNORECASE))
+        ):
+            result.append(row.detail)
+    return result
+
+
+def get_remix_fetch(
+    cnx: sqlite3.Connection, ocr_ids: list[int]
+) -> dict[int, RemixFetch]:
+    sql = """
+        select remix_id, etag, last_modified, page_sha256, fields_sha256
+        from remix_fetch
+        where remix_id in (select value from json_each(:ids))
+    """
+    params = {
+        "ids": json.dumps(ocr_ids),
+    }
+    return {row.remix_id: row for row in execute_records(cnx, RemixFetch, sql, params)}
+
+
+def get_remix_path(ocr_id: int) -> str:
+    return f"/remix/OCR{ocr_id:05}"
+
+
+def get_remix_ids_to_check(
+    cnx: sqlite3.Connection,
+    limit: int = 10,
+    *,
+    max_age: datetime.timedelta = datetime.timedelta(days=30),
+    policy: str = "adaptive",
+) -> list[int]:
+    if policy == "oldest":
+        return get_remix_ids_first_imported(cnx, limit)
+    sql = """
+        select r.id remix_id, r.import_datetime check_datetime,
+            c.first_check_datetime, coalesce(c.changes, 0) changes
+        from remix r left join remix_change c on c.remix_id = r.id
+    """
+    checks = execute_records(cnx, RemixCheck, sql)
+    now = datetime.datetime.now(tz=datetime.UTC)
+    return make_check_schedule(checks, limit, now, max_age=max_age)
+
+
 def get_remix_ids_first_imported(cnx: sqlite3.Connection, limit: int = 20) -> list[int]:
     sql = """
         select id from remix
@@ -213,7 +1457,7 @@ def get_remix_ids_first_imported(cnx: sqlite3.Connection, limit: int = 20) -> li
 def get_remix_data(cnx: sqlite3.Connection, ocr_id: int) -> dict:
     result = {}
     remix_sql = """
-        select download_url, has_lyrics, id, title, primary_game, youtube_url
+        select id, title, primary_game, youtube_url, download_url, has_lyrics
         from remix
         where id = :id
     """
@@ -222,20 +1466,20 @@ def get_remix_data(cnx: sqlite3.Connection, ocr_id: int) -> dict:
         from remix_artist ra
         join artist a on a.id = ra.artist_id
         where ra.remix_id = :id
-        order by a.id
+        order by ra.artist_id
     """
     tags_sql = """
         select t.id, t.path, t.url
         from remix_tag rt
         join tag t on t.id = rt.tag_id
         where rt.remix_id = :id
-        order by t.id
+        order by rt.tag_id
     """
     params = {
         "id": ocr_id,
     }
     with cnx:
-        for row in cnx.execute(remix_sql, params):
+        for row in execute_records(cnx, Remix, remix_sql, params):
             result = {
                 "download_url": row.download_url,
                 "has_lyrics": bool(row.has_lyrics),
@@ -248,11 +1492,11 @@ def get_remix_data(cnx: sqlite3.Connection, ocr_id: int) -> dict:
             }
         artists = [
             {"id": row.id, "name": row.name, "url": row.url}
-            for row in cnx.execute(artists_sql, params)
+            for row in execute_records(cnx, Artist, artists_sql, params)
         ]
         tags = [
             {"id": row.id, "path": row.path, "url": row.url}
-            for row in cnx.execute(tags_sql, params)
+            for row in execute_records(cnx, Tag, tags_sql, params)
         ]
     result["artists"] = artists
     result["tags"] = tags
@@ -265,7 +1509,194 @@ def get_remix_ids(cnx: sqlite3.Connection) -> list[int]:
         return [row.id for row in cnx.execute(sql)]
 
 
+def get_row_changes(cnx: sqlite3.Connection) -> list[dict]:
+    # the rows noted by the change triggers that are different now from before
+    # the first write to them: an upsert with the whole row, or a delete by key
+    records = []
+    for table in get_table_names(cnx):
+        info = cnx.execute(f'pragma table_info("{table}")').fetchall()
+        key = [c.name for c in sorted(info, key=lambda c: c.pk) if c.pk] or [
+            c.name for c in info
+        ]
+        join = " and ".join(f"t.{c} = json_extract(c.key, '$.{c}')" for c in key)
+        sql = f"""
+            select c.key, c.before, case when t.{key[0]} is null then null
+                else {get_json_object_sql("t", [c.name for c in info])} end after
+            from row_change c left join "{table}" t on {join}
+            where c.tbl = :table
+            order by c.key
+        """  # noqa: S608
+        for row in cnx.execute(sql, {"table": table}):
+            if row.after is None and row.before is not None:
+                records.append(
+                    {"key": json.loads(row.key), "op": "delete", "table": table}
+                )
+            elif row.after is not None and row.after != row.before:
+                records.append(
+                    {"op": "upsert", "row": json.loads(row.after), "table": table}
+                )
+    return records
+
+
+def get_search_query(text: str) -> str:
+    # every word in the text has to match the start of a word in the index
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def get_search_results(
+    cnx: sqlite3.Connection, text: str, limit: int = 20
+) -> list[dict]:
+    # best matches first, by the rank that make_search_index sets up; the index
+    # holds the title and game, so the remix table is not read at all
+    query = get_search_query(text)
+    if not query:
+        return []
+    sql = """
+        select rowid id, title, primary_game
+        from remix_search
+        where remix_search match :query
+        order by rank
+        limit :limit
+    """
+    params = {
+        "limit": limit,
+        "query": query,
+    }
+    return [
+        {
+            "id": row.id,
+            "ocr_id": f"OCR{row.id:05}",
+            "primary_game": row.primary_game,
+            "title": row.title,
+            "url": f"https://ocremix.org/remix/OCR{row.id:05}",
+        }
+        for row in execute_records(cnx, Remix, sql, params)
+    ]
+
+
+def get_search_schema(cnx: sqlite3.Connection) -> str | None:
+    # where the search index is: "search" when the one in the cache directory is
+    # attached, "temp" when it was built for this connection only, or None
+    row = cnx.execute(
+        "select schema from pragma_table_list('remix_search') "
+        "where schema in ('search', 'temp')"
+    ).fetchone()
+    return row and row.schema
+
+
+def get_shard_files(directory: pathlib.Path) -> list[pathlib.Path]:
+    return sorted(
+        path
+        for path in directory.rglob("*.sql")
+        if path.parent != directory or path.stem not in ("indexes", "schema")
+    )
+
+
+def get_shard_path(directory: pathlib.Path, table: str, shard: int) -> pathlib.Path:
+    if table not in _SHARDS:
+        return directory / f"{table}.sql"
+    _, width = _SHARDS.get(table)
+    start = shard * width
+    return directory / table / f"{start:06}-{start + width - 1:06}.sql"
+
+
+def get_shard_text(cnx: sqlite3.Connection, table: str, shard: int) -> str:
+    # the rows of one shard as INSERT statements in the format iterdump writes, in
+    # primary key order so the file only changes where the rows do
+    info = cnx.execute(f'pragma table_info("{table}")').fetchall()
+    values = " || ',' || ".join(f'quote("{c.name}")' for c in info)
+    key = [c.name for c in sorted(info, key=lambda c: c.pk) if c.pk] or ["rowid"]
+    sql = f"""
+        select 'INSERT INTO "{table}" VALUES(' || {values} || ');' line
+        from "{table}"
+    """  # noqa: S608
+    params = {}
+    if table in _SHARDS:
+        column, width = _SHARDS.get(table)
+        sql += f" where {column} >= :start and {column} < :end"
+        params = {"end": (shard + 1) * width, "start": shard * width}
+    sql += f" order by {', '.join(key)}"
+    return "".join(f"{row.line}\n" for row in cnx.execute(sql, params))
+
+
+def get_shards(cnx: sqlite3.Connection) -> set[tuple[str, int]]:
+    # every (table, shard) that has rows; tables that are not split are shard 0
+    result = set()
+    for table in get_table_names(cnx):
+        if table not in _SHARDS:
+            result.add((table, 0))
+            continue
+        column, width = _SHARDS.get(table)
+        sql = f'select {column} value from "{table}"'  # noqa: S608
+        result.update((table, row.value // width) for row in cnx.execute(sql))
+    return result
+
+
+def get_snapshot_key(source: pathlib.Path) -> str:
+    # hashing a file is only needed when its size or mtime has changed since the
+    # last time it was hashed; the key of a sharded source covers every file in
+    # it, the change journal too
+    state_file = get_cache_dir() / "ocremix-data.json"
+    try:
+        state = json.loads(state_file.read_text())
+    except OSError, ValueError:
+        state = {}
+    paths = [source]
+    if source.is_dir():
+        paths = sorted(p for p in source.rglob("*") if p.suffix in (".jsonl", ".sql"))
+    hashes = state.get("files", {})
+    files = {}
+    for path in paths:
+        stat = path.stat()
+        previous = hashes.get(path.as_posix(), {})
+        if (
+            previous.get("size") == stat.st_size
+            and previous.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            files[path.as_posix()] = previous
+            continue
+        with path.open("rb") as f:
+            sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+        files[path.as_posix()] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "size": stat.st_size,
+        }
+    if files != hashes:
+        state["files"] = files
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            state_file.write_text(json.dumps(state, indent=4, sort_keys=True))
+        except OSError:
+            pass
+    if not source.is_dir():
+        return files.get(source.as_posix()).get("sha256")
+    listing = "".join(
+        f"{path.relative_to(source).as_posix()} {files.get(path.as_posix()).get('sha256')}\n"
+        for path in paths
+    )
+    return hashlib.sha256(listing.encode()).hexdigest()
+
+
+def get_table_names(cnx: sqlite3.Connection) -> list[str]:
+    sql = "select type, name from main.sqlite_schema"
+    return sorted(
+        row.name
+        for row in cnx.execute(sql)
+        if row.type == "table" and not row.name.startswith("sqlite_")
+    )
+
+
+def get_table_shape(cnx: sqlite3.Connection, table: str) -> tuple[int, bool]:
+    # the number of columns, and whether every column has a type affinity that
+    # turns the text of a number back into a number
+    types = [row[2].lower() for row in cnx.execute(f'pragma table_info("{table}")')]
+    affinity = all(t and "blob" not in t and t != "any" for t in types)
+    return len(types), affinity
+
+
 def get_tag_data(cnx: sqlite3.Connection, tag_id: str) -> dict:
+    result = {}
     tag_sql = "select id, path, url from tag where id = :id"
     remix_sql = """
         select r.id, r.title, r.primary_game, r.youtube_url
@@ -273,13 +1704,13 @@ def get_tag_data(cnx: sqlite3.Connection, tag_id: str) -> dict:
         join remix_tag rt on rt.tag_id = t.id
         join remix r on r.id = rt.remix_id
         where t.id = :id
-        order by r.id
+        order by rt.remix_id
     """
     params = {
         "id": tag_id,
     }
     with cnx:
-        for row in cnx.execute(tag_sql, params):
+        for row in execute_records(cnx, Tag, tag_sql, params):
             result = {"id": row.id, "path": row.path, "url": row.url}
         remixes = [
             {
@@ -290,7 +1721,7 @@ def get_tag_data(cnx: sqlite3.Connection, tag_id: str) -> dict:
                 "url": f"https://ocremix.org/remix/OCR{row.id:05}",
                 "youtube_url": row.youtube_url,
             }
-            for row in cnx.execute(remix_sql, params)
+            for row in execute_records(cnx, Remix, remix_sql, params)
         ]
     result["remixes"] = remixes
     return result
@@ -302,21 +1733,374 @@ def get_tag_ids(cnx: sqlite3.Connection) -> list[str]:
         return [row.id for row in cnx.execute(sql)]
 
 
+async def import_pipeline(
+    cnx: sqlite3.Connection,
+    ocr_ids: collections.abc.Iterable[int],
+    fetcher: Fetcher,
+    *,
+    archive: sqlite3.Connection | None = None,
+    batch_size: int = 50,
+    checkpoint: int = 0,
+    journal: pathlib.Path | None = None,
+    parsers: int | None = None,
+    processes: bool = False,
+) -> collections.Counter:
+    # fetch workers feed raw responses into a bounded queue, parser threads (or
+    # processes) turn them into plain records, and this coroutine is the only one
+    # that writes; the bounded queues keep memory flat however many ids there are
+    loop = asyncio.get_running_loop()
+    fetched = asyncio.Queue(maxsize=2 * fetcher.concurrency)
+    parsed = asyncio.Queue(maxsize=batch_size)
+    ids = iter(ocr_ids)
+    parsers = parsers or os.cpu_count() or 1
+    results = collections.Counter()
+
+    async def fetch() -> None:
+        for ocr_id in ids:
+            state = get_remix_fetch(cnx, [ocr_id]).get(ocr_id)
+            headers = None
+            if state:
+                headers = get_conditional_headers(state)
+            response = await fetcher.get(get_remix_path(ocr_id), headers)
+            await fetched.put((ocr_id, response, state))
+
+    async def parse(pool: concurrent.futures.Executor) -> None:
+        while (item := await fetched.get()) is not None:
+            start = time.perf_counter()
+            record = await loop.run_in_executor(
+                pool, parse_response, fetcher.base_url, *item
+            )
+            _METRICS.observe("parse", time.perf_counter() - start)
+            await parsed.put(record)
+
+    async def write(journal_file: typing.TextIO | None) -> None:
+        # a batch is written once it is full or nothing else is waiting; every
+        # ReMix counts towards a checkpoint, whatever its result
+        processed = 0
+        batch = []
+        finished = False
+        while not finished:
+            record = await parsed.get()
+            finished = record is None
+            if not finished:
+                batch.append(record)
+                if len(batch) < batch_size and not parsed.empty():
+                    continue
+            if not batch:
+                continue
+            import_datetime = datetime.datetime.now(tz=datetime.UTC).isoformat()
+            with _METRICS.phase("write"):
+                total_changes = cnx.total_changes
+                cnx.execute("begin")
+                for item in batch:
+                    # a record that cannot be written is undone on its own, and
+                    # the rest of the batch is still saved
+                    cnx.execute("savepoint record")
+                    try:
+                        write_import_result(cnx, item, import_datetime)
+                    except sqlite3.Error as e:
+                        cnx.execute("rollback to record")
+                        print(
+                            "There was a problem writing the data for "
+                            f"OCR{item.get('remix_id'):05}: {e}"
+                        )
+                        item["result"] = "failed"
+                    cnx.execute("release record")
+                    results[item.get("result")] += 1
+                    _METRICS.count(f"pages {item.get('result')}")
+                cnx.commit()
+                _METRICS.count("rows written", cnx.total_changes - total_changes)
+            if archive is not None:
+                write_archived_pages(
+                    archive,
+                    [
+                        item.get("archive") | {"fetch_datetime": import_datetime}
+                        for item in batch
+                        if item.get("archive") is not None
+                    ],
+                )
+            if journal_file is not None:
+                for item in batch:
+                    if item.get("result") != "failed":
+                        entry = {
+                            "import_datetime": import_datetime,
+                            "record": item | {"archive": None},
+                        }
+                        journal_file.write(f"{json.dumps(entry)}\n")
+                journal_file.flush()
+            batch.clear()
+            if checkpoint and results.total() // checkpoint > processed // checkpoint:
+                write_data(cnx)
+                if journal_file is not None:
+                    # the records above are saved, and are not applied again
+                    journal_file.write(f"{json.dumps({'checkpoint': True})}\n")
+                    journal_file.flush()
+            processed = results.total()
+
+    if processes:
+        executor = concurrent.futures.ProcessPoolExecutor(parsers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(parsers)
+    with contextlib.ExitStack() as stack:
+        pool = stack.enter_context(executor)
+        journal_file = None
+        if journal is not None:
+            journal.parent.mkdir(parents=True, exist_ok=True)
+            journal_file = stack.enter_context(journal.open("a", encoding="utf_8"))
+        # each stage ends the next one once it is done; if any task fails, the
+        # task groups cancel the others, which could otherwise wait forever on a
+        # full queue
+        async with asyncio.TaskGroup() as writing:
+            writing.create_task(write(journal_file))
+            async with asyncio.TaskGroup() as parsing:
+                for _ in range(parsers):
+                    parsing.create_task(parse(pool))
+                async with asyncio.TaskGroup() as fetching:
+                    for _ in range(fetcher.concurrency):
+                        fetching.create_task(fetch())
+                for _ in range(parsers):
+                    await fetched.put(None)
+            await parsed.put(None)
+    return results
+
+
 def main() -> None:
     args = parse_args()
-    args.func(args)
+    _METRICS.enabled = args.metrics is not None
+    profile = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    try:
+        if profile is None:
+            args.func(args)
+        else:
+            profile.runcall(args.func, args)
+    finally:
+        # on stderr, so the output of json and search is still valid JSON
+        if profile is not None:
+            stats_file = get_cache_dir() / f"{args.command}.prof"
+            stats_file.parent.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(stats_file)
+            print(f"wrote {stats_file}", file=sys.stderr)
+        if args.metrics is not None:
+            data = _METRICS.as_dict() | {
+                "command": args.command,
+                "seconds": time.perf_counter() - start,
+            }
+            args.metrics.write_text(json.dumps(data, indent=4, sort_keys=True))
+            print(f"wrote {args.metrics}", file=sys.stderr)
+
+
+def make_api_response(body: bytes, content_type: str) -> ApiResponse:
+    return ApiResponse(
+        body=body,
+        content_type=content_type,
+        etag=f'"{hashlib.sha256(body).hexdigest()}"',
+        gzip_body=gzip.compress(body, compresslevel=6, mtime=0),
+        status=200,
+    )
+
+
+def make_change_triggers(cnx: sqlite3.Connection) -> None:
+    # temp triggers note the key of every row a write touches, with the row as it
+    # was before the first write to it, so write_data can append only the rows
+    # that ended up different to the change journal; like the search index, they
+    # never reach the data or the snapshot
+    with cnx:
+        cnx.execute("""
+            create table temp.row_change (
+                tbl text not null,
+                key text not null,
+                before text,
+                primary key (tbl, key)
+            )
+        """)
+        for table in get_table_names(cnx):
+            info = cnx.execute(f'pragma table_info("{table}")').fetchall()
+            key = [c.name for c in sorted(info, key=lambda c: c.pk) if c.pk] or [
+                c.name for c in info
+            ]
+            for event, rows in (
+                ("insert", (("new", False),)),
+                ("update", (("old", True), ("new", False))),
+                ("delete", (("old", True),)),
+            ):
+                inserts = []
+                for row, keep in rows:
+                    row_key = get_json_object_sql(row, key)
+                    before = get_json_object_sql(row, [c.name for c in info])
+                    # not "or ignore", which the conflict clause of an upsert that
+                    # fires the trigger would override
+                    inserts.append(f"""
+                        insert into row_change (tbl, key, before)
+                        select '{table}', {row_key}, {before if keep else "null"}
+                        where not exists (
+                            select 1 from row_change
+                            where tbl = '{table}' and key = {row_key}
+                        );
+                    """)  # noqa: S608
+                cnx.execute(f"""
+                    create temp trigger row_change_{table}_{event}
+                    after {event} on main.{table}
+                    begin {"".join(inserts)} end
+                """)
+
+
+def make_check_schedule(
+    checks: collections.abc.Iterable[RemixCheck],
+    limit: int,
+    now: datetime.datetime,
+    *,
+    max_age: datetime.timedelta,
+) -> list[int]:
+    # ReMixes not checked within max_age go first, oldest first; the rest of the
+    # batch goes to the ReMixes most likely to have changed since their last check
+    stale = []
+    scored = []
+    for check in checks:
+        if check.check_datetime is None:
+            stale.append(("", check.remix_id))
+        elif now - datetime.datetime.fromisoformat(check.check_datetime) > max_age:
+            stale.append((check.check_datetime, check.remix_id))
+        else:
+            scored.append((get_change_probability(check, now), check.remix_id))
+    result = [remix_id for _, remix_id in heapq.nsmallest(limit, stale)]
+    scored = heapq.nlargest(limit - len(result), scored)
+    return result + [remix_id for _, remix_id in scored]
+
+
+def make_remix_data(row: Remix, artist_rows: list[Artist], tag_rows: list[Tag]) -> dict:
+    return {
+        "artists": [{"id": a.id, "name": a.name, "url": a.url} for a in artist_rows],
+        "download_url": row.download_url,
+        "has_lyrics": bool(row.has_lyrics),
+        "id": row.id,
+        "ocr_id": f"OCR{row.id:05}",
+        "primary_game": row.primary_game,
+        "tags": [{"id": t.id, "path": t.path, "url": t.url} for t in tag_rows],
+        "title": row.title,
+        "url": f"https://ocremix.org/remix/OCR{row.id:05}",
+        "youtube_url": row.youtube_url,
+    }
+
+
+def make_remix_files(
+    directory: pathlib.Path,
+    remix_rows: collections.abc.Iterable[tuple[Remix, list[Artist], list[Tag]]],
+    changed: collections.abc.Callable[[str, tuple], bool],
+    ndjson: typing.BinaryIO,
+    shard_size: int = 500,
+) -> collections.abc.Iterator[tuple[pathlib.Path, dict | str]]:
+    # yields the document of every changed remix, a compact shard for every range
+    # of shard_size ids and a compact index of every remix, and writes every
+    # remix to the ndjson file as a line; only one shard is held in memory
+    index = {}
+    shard = []
+    shard_start = 1
+
+    def shard_file() -> tuple[pathlib.Path, str]:
+        name = f"OCR{shard_start:05}-OCR{shard_start + shard_size - 1:05}.json"
+        return directory / "remixes" / name, json.dumps(shard, separators=(",", ":"))
+
+    for rows in remix_rows:
+        data = make_remix_data(*rows)
+        if changed(name := f"remix/{data.get('ocr_id')}.json", rows):
+            yield directory / name, data
+        line = json.dumps(data, separators=(",", ":"), sort_keys=True)
+        ndjson.write(f"{line}\n".encode())
+        index[data.get("id")] = {
+            "primary_game": data.get("primary_game"),
+            "title": data.get("title"),
+        }
+        if data.get("id") >= shard_start + shard_size:
+            if shard:
+                yield shard_file()
+                shard = []
+            shard_start += (data.get("id") - shard_start) // shard_size * shard_size
+        shard.append(data)
+    if shard:
+        yield shard_file()
+    yield (
+        directory / "remix-index.json",
+        json.dumps(index, separators=(",", ":"), sort_keys=True),
+    )
+
+
+def make_search_index(
+    cnx: sqlite3.Connection, schema: str = "temp", *, contentless: bool = False
+) -> None:
+    # a full-text index over every remix, in its own schema so it is never dumped
+    # to the data source or the snapshot; write_remix_page keeps it current. A
+    # contentless index keeps only the terms, so the text is read from the remix
+    # table
+    content = ", content = ''" if contentless else ""
+    with cnx:
+        cnx.execute(f"""
+            create virtual table {schema}.remix_search using fts5 (
+                title, primary_game, artists, tags,
+                tokenize = 'unicode61 remove_diacritics 2'{content}
+            )
+        """)
+        # a match in the title counts the most, then the game and artists, then
+        # the tags
+        cnx.execute(f"""
+            insert into {schema}.remix_search (
+                remix_search, rank
+            ) values (
+                'rank', 'bm25(4.0, 2.0, 2.0, 1.0)'
+            )
+        """)  # noqa: S608
+        cnx.execute(f"""
+            insert into {schema}.remix_search (
+                rowid, title, primary_game, artists, tags
+            ) {_SQL_SEARCH_ROWS}
+        """)
+
+
+def make_tag_data(row: Tag, remix_rows: list[Remix]) -> dict:
+    return {
+        "id": row.id,
+        "path": row.path,
+        "remixes": [
+            {
+                "id": r.id,
+                "ocr_id": f"OCR{r.id:05}",
+                "primary_game": r.primary_game,
+                "title": r.title,
+                "url": f"https://ocremix.org/remix/OCR{r.id:05}",
+                "youtube_url": r.youtube_url,
+            }
+            for r in remix_rows
+        ],
+        "url": row.url,
+    }
+
+
+@functools.cache
+def namedtuple_class(description: tuple) -> type:
+    return collections.namedtuple("Row", [c[0] for c in description])
 
 
 def namedtuple_factory(cursor: sqlite3.Cursor, row: tuple) -> tuple:
-    fields = [c[0] for c in cursor.description]
-    cls = collections.namedtuple("Row", fields)
-    return cls(*row)
+    return namedtuple_class(cursor.description)(*row)
 
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(
         description="work with a local OC ReMix metadata database"
     )
+    ap.add_argument(
+        "--metrics",
+        help="write the time spent in each phase, counters and fetch latencies to "
+        "this JSON file",
+        metavar="FILE",
+        type=pathlib.Path,
+    )
+    ap.add_argument(
+        "--profile",
+        action="store_true",
+        help="run the command under cProfile and write the stats to "
+        ".cache/{command}.prof, for use with pstats or snakeviz",
+    )
     sp = ap.add_subparsers(dest="command", required=True, title="Available commands")
 
     ps_build = sp.add_parser(
@@ -329,8 +2113,58 @@ def parse_args() -> argparse.Namespace:
         help="output directory, default ./output",
         type=pathlib.Path,
     )
+    ps_build.add_argument(
+        "--full",
+        action="store_true",
+        help="rebuild every document, even if its data has not changed since the "
+        "last build",
+    )
+    ps_build.add_argument(
+        "--compress",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="write a gzip copy (.gz) of every file next to it, and a brotli copy "
+        "(.br) when the brotli package is installed; on by default",
+    )
+    ps_build.add_argument(
+        "--minify",
+        action="store_true",
+        help="also write every JSON document without indentation, as .min.json",
+    )
     ps_build.set_defaults(func=cli_build_pages)
 
+    ps_check_query_plans = sp.add_parser(
+        "check-query-plans",
+        description="run every query against the local database and fail if any of "
+        "them needs a table scan or a temporary sort",
+    )
+    ps_check_query_plans.set_defaults(func=cli_check_query_plans)
+
+    ps_compact = sp.add_parser(
+        "compact",
+        description="fold the change journal (ocremix-data/changes.jsonl) into the "
+        "shards it has rows for, once it is bigger than the threshold",
+    )
+    ps_compact.add_argument(
+        "--threshold",
+        default=1024 * 1024,
+        help="the size in bytes the journal has to reach, default 1 MiB; 0 folds "
+        "any journal",
+        type=int,
+    )
+    ps_compact.set_defaults(func=cli_compact)
+
+    ps_convert_data = sp.add_parser(
+        "convert-data",
+        description="convert the local data between the single-file dump "
+        "(ocremix-data.sql) and the sharded directory (ocremix-data/), with one "
+        "file per table and ID range, and remove the old one",
+    )
+    ps_convert_data.add_argument(
+        "format", choices=("dump", "shards"), help="the format to convert to"
+    )
+    ps_convert_data.set_defaults(func=cli_convert_data)
+
     ps_import = sp.add_parser(
         "import",
         description="fetch data for a single ReMix from ocremix.org and store in the "
@@ -339,6 +2173,7 @@ def parse_args() -> argparse.Namespace:
     ps_import.add_argument(
         "ocr_id", help="the numeric ID of the ReMix to fetch", type=int
     )
+    add_fetch_arguments(ps_import)
     ps_import.set_defaults(func=cli_import)
 
     ps_import_missing = sp.add_parser(
@@ -346,6 +2181,20 @@ def parse_args() -> argparse.Namespace:
         description="fetch data for all missing ReMixes from ocremix.org and store in "
         "the local database",
     )
+    ps_import_missing.add_argument(
+        "--recheck-after",
+        default=30.0,
+        help="fetch ReMixes again that returned 404 Not Found more than this many "
+        "days ago, default 30",
+        type=float,
+    )
+    ps_import_missing.add_argument(
+        "--retry-not-found",
+        action="store_true",
+        help="also fetch ReMixes that returned 404 Not Found on an earlier run",
+    )
+    add_fetch_arguments(ps_import_missing)
+    add_parser_arguments(ps_import_missing)
     ps_import_missing.set_defaults(func=cli_import_missing)
 
     ps_json = sp.add_parser(
@@ -356,17 +2205,99 @@ def parse_args() -> argparse.Namespace:
     )
     ps_json.set_defaults(func=cli_json)
 
+    ps_reparse = sp.add_parser(
+        "reparse",
+        description="parse the archived pages again and update the local database, "
+        "without fetching anything from ocremix.org",
+    )
+    add_parser_arguments(ps_reparse)
+    ps_reparse.set_defaults(func=cli_reparse)
+
+    ps_search = sp.add_parser(
+        "search",
+        description="print the ReMixes whose title, game, artists or tags match, "
+        "best matches first, as JSON",
+    )
+    ps_search.add_argument("text", help="the words to search for")
+    ps_search.add_argument(
+        "-l",
+        "--limit",
+        default=20,
+        help="the most ReMixes to print, default 20",
+        type=int,
+    )
+    ps_search.set_defaults(func=cli_search)
+
+    ps_serve = sp.add_parser(
+        "serve",
+        description="serve /remix/{remix_id}.json, /tag/{tag_id}.json, "
+        "/remix-index.json, /remixes.ndjson, /remixes/{range}.json and "
+        "/ocremix-data.db from the local database over HTTP, the same as the "
+        "published pages",
+    )
+    ps_serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="the address to listen on, default 127.0.0.1",
+    )
+    ps_serve.add_argument(
+        "--port", default=8000, help="the port to listen on, default 8000", type=int
+    )
+    ps_serve.add_argument(
+        "--cache-size",
+        default=1024,
+        help="the number of encoded responses to keep in memory, default 1024",
+        type=int,
+    )
+    ps_serve.set_defaults(func=cli_serve)
+
     ps_update = sp.add_parser(
         "update",
-        description="check and update data for ReMixes imported the longest ago",
+        description="check and update data for the ReMixes most likely to have "
+        "changed, judged by how often each one changed before and how long ago it "
+        "was checked, with any ReMix not checked within --max-age days first; "
+        "--policy oldest checks the ones checked the longest ago instead",
     )
-    ps_update.add_argument(
+    ps_update_scope = ps_update.add_mutually_exclusive_group()
+    ps_update_scope.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        help="check every ReMix, parsing pages on a pool of processes; an "
+        "interrupted run resumes where it stopped",
+    )
+    ps_update_scope.add_argument(
         "-l",
         "--limit",
         default="10",
         help="the number of ReMixes to check, default 10",
         type=int,
     )
+    ps_update.add_argument(
+        "-c",
+        "--checkpoint",
+        default=0,
+        help="write the local database to disk after every N ReMixes checked, "
+        "whatever the result, default 0 (only when finished)",
+        type=int,
+    )
+    ps_update.add_argument(
+        "--policy",
+        choices=("adaptive", "oldest"),
+        default="adaptive",
+        help="how to pick the ReMixes to check: the ones most likely to have "
+        "changed (adaptive), or the ones checked the longest ago (oldest); default "
+        "adaptive",
+    )
+    ps_update.add_argument(
+        "--max-age",
+        default=30.0,
+        help="with the adaptive policy, the most days a ReMix may go without a "
+        "check before it is picked ahead of the others, default 30",
+        type=float,
+    )
+    add_fetch_arguments(ps_update)
+    add_parser_arguments(ps_update)
     ps_update.set_defaults(func=cli_update)
 
     ps_write_sqlite = sp.add_parser(
@@ -378,39 +2309,46 @@ def parse_args() -> argparse.Namespace:
         help="name of file to write",
         type=pathlib.Path,
     )
+    ps_write_sqlite.add_argument(
+        "--page-size",
+        default=1024,
+        help="the database page size in bytes, a power of two from 512 to 65536; "
+        "small pages suit readers that fetch pages over HTTP, default 1024",
+        type=int,
+    )
     ps_write_sqlite.set_defaults(func=cli_write_sqlite)
 
     return ap.parse_args()
 
 
-def parse_has_lyrics(html: lxml.html.HtmlElement) -> bool:
-    return bool(html.xpath('//a[@href="#tab-lyrics"]'))
-
-
-def parse_remix_artists(html: lxml.html.HtmlElement) -> list[dict]:
-    result = []
-    for a in html.xpath('//h2/a[starts-with(@href, "/artist")]'):
-        artist_name = a.text.replace("\ufeff", "")
-        artist_url = f"https://ocremix.org{a.get('href')}"
-        artist_id = int(a.get("href").split("/")[2])
-        result.append(
-            {
-                "id": artist_id,
-                "name": artist_name,
-                "url": artist_url,
-            }
-        )
-    return result
+def parse_archived_page(item: tuple[int, str, bytes]) -> tuple[int, str, dict | None]:
+    remix_id, fetch_datetime, body = item
+    try:
+        html = lxml.html.fromstring(zlib.decompress(body).decode())
+        return remix_id, fetch_datetime, parse_remix_page(html)
+    except (
+        AttributeError,
+        IndexError,
+        TypeError,
+        ValueError,
+        lxml.etree.LxmlError,
+        zlib.error,
+    ):
+        return remix_id, fetch_datetime, None
 
 
-def parse_download_url(html: lxml.html.HtmlElement) -> str:
-    return html.xpath(
-        '//div[@id="modalDownload"]//a[contains(@href, "ocrmirror.org")]/@href'
-    )[0]
+def parse_artist_element(a: lxml.html.HtmlElement) -> dict:
+    artist_name = a.text.replace("\ufeff", "")
+    artist_url = f"https://ocremix.org{a.get('href')}"
+    artist_id = int(a.get("href").split("/")[2])
+    return {
+        "id": artist_id,
+        "name": artist_name,
+        "url": artist_url,
+    }
 
 
-def parse_remix_primary_game(html: lxml.html.HtmlElement) -> dict:
-    el = html.xpath("//h1/a")[0]
+def parse_game_element(el: lxml.html.HtmlElement) -> dict:
     game_name = el.text
     href = el.get("href")
     game_url = f"https://ocremix.org{href}"
@@ -422,49 +2360,610 @@ def parse_remix_primary_game(html: lxml.html.HtmlElement) -> dict:
     }
 
 
+def parse_has_lyrics(html: lxml.html.HtmlElement) -> bool:
+    return bool(_XPATH_LYRICS(html))
+
+
+def parse_remix_artists(html: lxml.html.HtmlElement) -> list[dict]:
+    return [parse_artist_element(a) for a in _XPATH_ARTISTS(html)]
+
+
+def parse_download_url(html: lxml.html.HtmlElement) -> str:
+    return _XPATH_DOWNLOAD_URL(html)[0]
+
+
+def parse_remix_page(html: lxml.html.HtmlElement) -> dict:
+    # one pass over the links in the page collects what the parse_* functions
+    # find with one XPath search each; the result is the same
+    game_el = None
+    artists = []
+    download_url = None
+    has_lyrics = False
+    tags = []
+    youtube_url = None
+    for el in html.iter("a", "div"):
+        if el.tag == "div":
+            if download_url is None and el.get("id") == "modalDownload":
+                for a in el.iter("a"):
+                    if "ocrmirror.org" in (a.get("href") or ""):
+                        download_url = a.get("href")
+                        break
+            continue
+        href = el.get("href") or ""
+        parent = el.getparent().tag
+        if parent == "h1" and game_el is None:
+            game_el = el
+        if parent == "h2" and href.startswith("/artist"):
+            artists.append(parse_artist_element(el))
+        if href.startswith("/tag/"):
+            tag = parse_tag_element(el)
+            if tag is not None:
+                tags.append(tag)
+        if href == "#tab-lyrics":
+            has_lyrics = True
+        if youtube_url is None:
+            preview = el.get("data-preview") or ""
+            if preview.startswith("https://www.youtube.com/watch?v="):
+                youtube_url = preview
+    if game_el is None or download_url is None:
+        raise IndexError("list index out of range")
+    primary_game = parse_game_element(game_el)
+    return {
+        "artists": artists,
+        "game": primary_game,
+        "remix": {
+            "download_url": download_url,
+            "has_lyrics": 1 if has_lyrics else 0,
+            "primary_game": primary_game.get("name"),
+            "primary_game_id": primary_game.get("id"),
+            "title": game_el.tail[2:-2],
+            "youtube_url": youtube_url,
+        },
+        "tags": tags,
+    }
+
+
+def parse_response(
+    base_url: str, ocr_id: int, response: Response | None, state: RemixFetch | None
+) -> dict:
+    # a page that is not modified, or whose bytes or extracted fields are the same
+    # as last time, only gets its import_datetime bumped by write_import_result
+    record = {
+        "archive": None,
+        "changed": False,
+        "fetch": None,
+        "page": None,
+        "remix_id": ocr_id,
+    }
+    if response is not None and response.status == 304 and state is not None:
+        return record | {"result": "not modified"}
+    if response is not None and response.status == 404:
+        return record | {"result": "not found"}
+    if response is None or response.status != 200:
+        print(f"There was a problem reading {base_url}{get_remix_path(ocr_id)}")
+        return record | {"result": "failed"}
+    record["fetch"] = {
+        "etag": response.headers.get("etag"),
+        "fields_sha256": state and state.fields_sha256,
+        "last_modified": response.headers.get("last-modified"),
+        "page_sha256": hashlib.sha256(response.body).hexdigest(),
+        "remix_id": ocr_id,
+    }
+    # every page is archived, even one that fails to parse, so `reparse` can try
+    # it again once the parser is fixed
+    record["archive"] = {
+        "body": zlib.compress(response.body),
+        "page_sha256": record["fetch"]["page_sha256"],
+        "remix_id": ocr_id,
+    }
+    if state is not None and state.page_sha256 == record["fetch"]["page_sha256"]:
+        return record | {"result": "same page"}
+    try:
+        page = parse_remix_page(lxml.html.fromstring(response.body.decode()))
+    except AttributeError, IndexError, TypeError, ValueError, lxml.etree.LxmlError:
+        print(f"There was a problem parsing {base_url}{get_remix_path(ocr_id)}")
+        return record | {"fetch": None, "result": "failed"}
+    record["fetch"]["fields_sha256"] = get_fields_sha256(page)
+    if state is not None and state.fields_sha256 == record["fetch"]["fields_sha256"]:
+        return record | {"result": "same data"}
+    # the first page seen for a ReMix is a baseline rather than a change
+    return record | {"changed": state is not None, "page": page, "result": "updated"}
+
+
+def parse_remix_primary_game(html: lxml.html.HtmlElement) -> dict:
+    return parse_game_element(_XPATH_GAME(html)[0])
+
+
 def parse_remix_tags(html: lxml.html.HtmlElement) -> list[dict]:
     result = []
-    for t in html.xpath('//a[starts-with(@href, "/tag/")]'):
-        tag_url = f"https://ocremix.org{t.get('href')}"
-        tag_id = t.text
-        tag_title = t.get("title")
-        if tag_id and tag_title:
-            result.append(
-                {
-                    "id": tag_id,
-                    "path": tag_title.strip(),
-                    "url": tag_url,
-                }
-            )
+    for t in _XPATH_TAGS(html):
+        tag = parse_tag_element(t)
+        if tag is not None:
+            result.append(tag)
     return result
 
 
 def parse_remix_title(html: lxml.html.HtmlElement) -> str:
-    return html.xpath("//h1/a")[0].tail[2:-2]
+    return _XPATH_GAME(html)[0].tail[2:-2]
+
+
+def parse_sql_rows(
+    texts: list[str], width: int, affinity: bool
+) -> tuple[list[list], list[str]]:
+    # the VALUES text of INSERT statements as rows for executemany, and the texts
+    # that have to be run as statements after all
+    rows = []
+    fallback = []
+    for text, fields in zip(texts, csv.reader(texts, quotechar="'")):
+        fast = affinity and len(fields) == width
+        if fast and "NULL" not in text and "X'" not in text:
+            rows.append(fields)
+            continue
+        values = parse_sql_values(text)
+        if values is None or len(values) != width:
+            fallback.append(text)
+        else:
+            rows.append(values)
+    return rows, fallback
+
+
+def parse_sql_values(text: str) -> list | None:
+    result = []
+    pos = 0
+    while pos < len(text):
+        m = _SQL_VALUE.match(text, pos)
+        if m is None:
+            return None
+        string, null, integer, real, blob = m.groups()
+        if string is not None:
+            result.append(string.replace("''", "'"))
+        elif null is not None:
+            result.append(None)
+        elif integer is not None:
+            result.append(int(integer))
+        elif real is not None:
+            result.append(float(real))
+        else:
+            result.append(bytes.fromhex(blob))
+        pos = m.end()
+        if pos < len(text):
+            if text[pos] != ",":
+                return None
+            pos += 1
+    return result
+
+
+def parse_tag_element(t: lxml.html.HtmlElement) -> dict | None:
+    tag_url = f"https://ocremix.org{t.get('href')}"
+    tag_id = t.text
+    tag_title = t.get("title")
+    if tag_id and tag_title:
+        return {
+            "id": tag_id,
+            "path": tag_title.strip(),
+            "url": tag_url,
+        }
+    return None
 
 
 def parse_youtube_url(html: lxml.html.HtmlElement) -> str:
-    for el in html.xpath(
-        '//a[starts-with(@data-preview, "https://www.youtube.com/watch?v=")]'
-    ):
+    for el in _XPATH_YOUTUBE_URL(html):
         return el.get("data-preview")
 
 
+def read_html(
+    fetcher: Fetcher, ocr_id: int, response: Response | None
+) -> lxml.html.HtmlElement | None:
+    if response is None or response.status != 200:
+        print(f"There was a problem reading {fetcher.base_url}{get_remix_path(ocr_id)}")
+        return None
+    return lxml.html.fromstring(response.body.decode())
+
+
+def read_build_manifest(manifest_file: pathlib.Path, directory: pathlib.Path) -> dict:
+    # a manifest from a build into another directory says nothing about this one
+    try:
+        data = json.loads(manifest_file.read_text())
+    except OSError, ValueError:
+        return {}
+    if data.get("version") != 1 or data.get("directory") != str(directory.resolve()):
+        return {}
+    return data.get("documents", {})
+
+
+def read_change_journal(journal: pathlib.Path) -> list[dict]:
+    try:
+        lines = journal.read_text(encoding="utf_8").splitlines()
+    except OSError:
+        return []
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            # the last line is cut short if a write stopped while appending it
+            continue
+    return records
+
+
+def read_data(
+    cnx: sqlite3.Connection, ocremix_data_sql: pathlib.Path, batch_size: int = 1000
+) -> None:
+    # INSERT statements in the format written by iterdump are collected per table
+    # and loaded with executemany. Most rows are split by the csv module and rely
+    # on column affinity to store numbers as numbers; rows with NULL or blob
+    # literals, and tables with columns that have no affinity, are parsed exactly.
+    # Everything else is handed to SQLite as it is.
+    isolation_level = cnx.isolation_level
+    cnx.isolation_level = None
+    columns = {}
+    table = None
+    pending = []
+    statement = ""
+
+    def flush() -> None:
+        if not pending:
+            return
+        if table not in columns:
+            columns[table] = get_table_shape(cnx, table)
+        width, affinity = columns[table]
+        rows, fallback = parse_sql_rows(pending, width, affinity)
+        placeholders = ", ".join("?" * width)
+        sql = f'insert into "{table}" values ({placeholders})'  # noqa: S608
+        cnx.executemany(sql, rows)
+        for text in fallback:
+            execute_statement(cnx, f'INSERT INTO "{table}" VALUES({text});')
+        pending.clear()
+
+    with ocremix_data_sql.open(encoding="utf_8") as f:
+        for line in f:
+            if not statement:
+                m = _SQL_INSERT.fullmatch(line)
+                if m is not None:
+                    if m.group(1) != table or len(pending) >= batch_size:
+                        flush()
+                        table = m.group(1)
+                    pending.append(m.group(2))
+                    continue
+            flush()
+            statement += line
+            if sqlite3.complete_statement(statement):
+                execute_statement(cnx, statement)
+                statement = ""
+    flush()
+    if statement.strip():
+        execute_statement(cnx, statement)
+    cnx.isolation_level = isolation_level
+
+
+def read_search_index(cnx: sqlite3.Connection, key: str) -> None:
+    # attaches the search index in the cache directory, but only when it was last
+    # saved with the data that was just loaded; otherwise it is left alone until
+    # write_search_index builds it again
+    index_file = get_cache_dir() / "search.db"
+    if not index_file.exists():
+        return
+    cnx.execute("attach database ? as search", (str(index_file),))
+    try:
+        row = cnx.execute("select key from search.search_key").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+    if row is None or row.key != key:
+        cnx.execute("detach database search")
+
+
+def read_shard(item: tuple[pathlib.Path, int, bool]) -> tuple[str, list, list[str]]:
+    # runs in a worker process: one shard file as rows for executemany, with the
+    # statements that cannot go through it
+    path, width, affinity = item
+    table = None
+    texts = []
+    statements = []
+    with path.open(encoding="utf_8") as f:
+        for line in f:
+            m = _SQL_INSERT.fullmatch(line)
+            if m is None:
+                statements.append(line)
+                continue
+            table = m.group(1)
+            texts.append(m.group(2))
+    rows, fallback = parse_sql_rows(texts, width, affinity)
+    statements.extend(f'INSERT INTO "{table}" VALUES({text});' for text in fallback)
+    return table, rows, statements
+
+
+def read_shards(
+    cnx: sqlite3.Connection, directory: pathlib.Path, parsers: int | None = None
+) -> None:
+    # the tables are created from schema.sql, the shard files are parsed on a pool
+    # of processes and inserted here in one transaction, and the indexes are
+    # created last, like in a dump
+    read_data(cnx, directory / "schema.sql")
+    shapes = {}
+    items = []
+    for path in get_shard_files(directory):
+        table = path.stem if path.parent == directory else path.parent.name
+        if table not in shapes:
+            shapes[table] = get_table_shape(cnx, table)
+        items.append((path, *shapes.get(table)))
+    isolation_level = cnx.isolation_level
+    cnx.isolation_level = None
+    cnx.execute("begin")
+    parsers = parsers or os.cpu_count() or 1
+    with contextlib.ExitStack() as stack:
+        # with one CPU the pool would only add the cost of moving rows between
+        # processes
+        shards = map(read_shard, items)
+        if parsers > 1:
+            pool = stack.enter_context(concurrent.futures.ProcessPoolExecutor(parsers))
+            shards = pool.map(read_shard, items)
+        for table, rows, statements in shards:
+            if rows:
+                placeholders = ", ".join("?" * len(rows[0]))
+                sql = f'insert into "{table}" values ({placeholders})'  # noqa: S608
+                cnx.executemany(sql, rows)
+            for statement in statements:
+                execute_statement(cnx, statement)
+    cnx.execute("commit")
+    cnx.isolation_level = isolation_level
+    read_data(cnx, directory / "indexes.sql")
+
+
+def read_source(cnx: sqlite3.Connection, source: pathlib.Path) -> None:
+    if source.is_dir():
+        read_shards(cnx, source)
+        write_row_changes(cnx, read_change_journal(source / "changes.jsonl"))
+    else:
+        read_data(cnx, source)
+
+
+def read_update_journal(cnx: sqlite3.Connection, journal: pathlib.Path) -> set[int]:
+    # applies the batches an interrupted `update --all` finished after its last
+    # checkpoint, and returns the ids that do not need to be fetched again; the
+    # records before a checkpoint are already in the data, and applying them
+    # again would count their checks twice
+    done = set()
+    try:
+        lines = journal.read_text(encoding="utf_8").splitlines()
+    except OSError:
+        return done
+    entries = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # the last line is cut short if the run stopped while writing it
+            continue
+        if entry.get("checkpoint"):
+            entries.clear()
+            continue
+        done.add(entry.get("record").get("remix_id"))
+        entries.append(entry)
+    cnx.execute("begin")
+    for entry in entries:
+        write_import_result(cnx, entry.get("record"), entry.get("import_datetime"))
+    cnx.commit()
+    return done
+
+
+@contextlib.contextmanager
+def transaction(cnx: sqlite3.Connection) -> collections.abc.Iterator[None]:
+    # commits like `with cnx:`, unless the caller already has a transaction open,
+    # which is then left for the caller to commit
+    if cnx.in_transaction:
+        yield
+        return
+    with cnx:
+        yield
+
+
+def write_archived_pages(archive: sqlite3.Connection, params: list[dict]) -> None:
+    # a page with the same bytes as one already archived for the ReMix is skipped
+    sql = """
+        insert into page (
+            remix_id, fetch_datetime, page_sha256, body
+        ) values (
+            :remix_id, :fetch_datetime, :page_sha256, :body
+        ) on conflict do nothing
+    """
+    with archive:
+        archive.executemany(sql, params)
+
+
 def write_artist_batch(cnx: sqlite3.Connection, params: list[dict]) -> None:
     sql = """
         insert into artist (id, name, url) values (:id, :name, :url)
         on conflict (id) do update set name = excluded.name, url = excluded.url
+        where name is not excluded.name or url is not excluded.url
     """
-    with cnx:
+    with transaction(cnx):
+        changes = cnx.total_changes
         cnx.executemany(sql, params)
+        if cnx.total_changes > changes:
+            # a new name changes the search rows of every remix by the artist
+            remix_ids = cnx.execute(
+                """
+                    select remix_id from remix_artist
+                    where artist_id in (select value from json_each(:artist_ids))
+                """,
+                {"artist_ids": json.dumps([p.get("id") for p in params])},
+            )
+            write_remix_search(cnx, [row.remix_id for row in remix_ids])
 
 
-def write_data_and_close(cnx: sqlite3.Connection) -> None:
+def write_build_manifest(
+    manifest_file: pathlib.Path, directory: pathlib.Path, documents: dict
+) -> None:
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "directory": str(directory.resolve()),
+        "documents": documents,
+        "version": 1,
+    }
+    manifest_file.write_text(json.dumps(data, indent=1, sort_keys=True), newline="\n")
+
+
+def write_data(cnx: sqlite3.Connection) -> None:
+    source = get_data_source()
+    with _METRICS.phase("dump"):
+        if source.is_dir():
+            # only the rows that changed since the last time go into the change
+            # journal; without the change triggers, every shard is rewritten
+            journal = source / "changes.jsonl"
+            if cnx.execute(
+                "select 1 found from temp.sqlite_schema where name = 'row_change'"
+            ).fetchone():
+                written = write_change_journal(cnx, journal)
+                print(f"wrote {written} changes to {journal}")
+            else:
+                written = write_shards(cnx, source)
+                journal.unlink(missing_ok=True)
+                print(f"wrote {written} files to {source}")
+        else:
+            write_dump(cnx, source)
+    with _METRICS.phase("snapshot"):
+        write_snapshot(cnx, get_snapshot_key(source))
+
+
+def write_dump(cnx: sqlite3.Connection, target: pathlib.Path) -> None:
+    row_factory = cnx.row_factory
     cnx.row_factory = sqlite3.Row
-    ocremix_data_sql = pathlib.Path("ocremix-data.sql").resolve()
-    with ocremix_data_sql.open("w", encoding="utf_8") as f:
+    with target.open("w", encoding="utf_8") as f:
         for line in cnx.iterdump():
             f.write(f"{line}\n")
+    cnx.row_factory = row_factory
+    _METRICS.count("bytes written", target.stat().st_size)
+
+
+def write_remix_search(cnx: sqlite3.Connection, remix_ids: list[int]) -> None:
+    # keeps the search index current, when there is one; the one in the cache
+    # directory loses its key until write_snapshot saves the data it now matches,
+    # so a run that stops before then does not leave it ahead of the data
+    schema = get_search_schema(cnx)
+    if not remix_ids or schema is None:
+        return
+    params = {
+        "remix_ids": json.dumps(remix_ids),
+    }
+    with transaction(cnx):
+        if schema == "search":
+            cnx.execute("delete from search.search_key")
+        cnx.execute(
+            """
+                delete from remix_search
+                where rowid in (select value from json_each(:remix_ids))
+            """,
+            params,
+        )
+        cnx.execute(
+            f"""
+                insert into remix_search (
+                    rowid, title, primary_game, artists, tags
+                ) {_SQL_SEARCH_ROWS}
+                where r.id in (select value from json_each(:remix_ids))
+            """,  # noqa: S608
+            params,
+        )
+
+
+def write_search_index(cnx: sqlite3.Connection) -> None:
+    # builds the search index in the cache directory, unless get_cnx attached a
+    # current one; every later write keeps it current, so only the first search
+    # after the data changed some other way pays for a full build
+    if get_search_schema(cnx) is not None:
+        return
+    cache_dir = get_cache_dir()
+    index_file = cache_dir / "search.db"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        index_file.unlink(missing_ok=True)
+        cnx.execute("attach database ? as search", (str(index_file),))
+    except OSError, sqlite3.OperationalError:
+        make_search_index(cnx)
+        return
+    make_search_index(cnx, "search")
+    with cnx:
+        cnx.execute("create table search.search_key (key text not null)")
+        cnx.execute(
+            "insert into search.search_key (key) values (:key)",
+            {"key": get_snapshot_key(get_data_source())},
+        )
+
+
+def write_shards(
+    cnx: sqlite3.Connection,
+    directory: pathlib.Path,
+    changes: set[tuple[str, int]] | None = None,
+) -> int:
+    # writes schema.sql, indexes.sql and the given shards, or every shard and no
+    # leftover files when changes is None; a file is only rewritten when its
+    # content is different, and a shard with no rows left is removed
+    directory.mkdir(parents=True, exist_ok=True)
+    # the tables, then the indexes, triggers and views, each sorted by name
+    schema = sorted(
+        (row.type != "table", row.type, row.name, row.sql)
+        for row in cnx.execute("select type, name, sql from main.sqlite_schema")
+        if row.sql is not None and not row.name.startswith("sqlite_")
+    )
+    files = {
+        directory / "schema.sql": "".join(
+            f"{sql};\n" for is_other, _, _, sql in schema if not is_other
+        ),
+        directory / "indexes.sql": "".join(
+            f"{sql};\n" for is_other, _, _, sql in schema if is_other
+        ),
+    }
+    shards = get_shards(cnx) if changes is None else changes
+    for table, shard in sorted(shards):
+        files[get_shard_path(directory, table, shard)] = get_shard_text(
+            cnx, table, shard
+        )
+    if changes is None:
+        for path in get_shard_files(directory):
+            files.setdefault(path, "")
+    written = 0
+    for path, text in files.items():
+        if not text:
+            path.unlink(missing_ok=True)
+            continue
+        data = text.encode()
+        if path.exists() and path.read_bytes() == data:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        _METRICS.count("bytes written", len(data))
+        written += 1
+    return written
+
+
+def write_snapshot(cnx: sqlite3.Connection, key: str) -> None:
+    cache_dir = get_cache_dir()
+    state_file = cache_dir / "ocremix-data.json"
+    try:
+        state = json.loads(state_file.read_text())
+    except OSError, ValueError:
+        state = {}
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / "ocremix-data.db.tmp"
+        tmp.write_bytes(cnx.serialize())
+        tmp.replace(cache_dir / "ocremix-data.db")
+        state["snapshot_key"] = key
+        state_file.write_text(json.dumps(state, indent=4, sort_keys=True))
+    except OSError:
+        pass
+    # an attached search index has been kept current with every write, so it
+    # matches the data under the new key too
+    if get_search_schema(cnx) == "search":
+        with transaction(cnx):
+            cnx.execute("delete from search.search_key")
+            cnx.execute(
+                "insert into search.search_key (key) values (:key)", {"key": key}
+            )
+
+
+def write_data_and_close(cnx: sqlite3.Connection) -> None:
+    write_data(cnx)
     cnx.close()
 
 
@@ -477,11 +2976,182 @@ def write_game(cnx: sqlite3.Connection, params: dict) -> None:
         ) on conflict (id) do update set
             name = excluded.name, url = excluded.url
     """
-    with cnx:
+    with transaction(cnx):
         cnx.execute(sql, params)
 
 
+def write_import_result(
+    cnx: sqlite3.Connection, record: dict, import_datetime: str
+) -> None:
+    remix_id = record.get("remix_id")
+    if record.get("result") == "failed":
+        return
+    if record.get("result") == "not found":
+        # a ReMix already in the database still counts as checked
+        write_remix_import_datetime(cnx, remix_id, import_datetime)
+        write_remix_not_found(cnx, remix_id, import_datetime)
+        return
+    write_remix_change(cnx, remix_id, import_datetime, record.get("changed"))
+    if record.get("page") is None:
+        write_remix_import_datetime(cnx, remix_id, import_datetime)
+    else:
+        print(f"Processing OCR{remix_id:05}")
+        write_remix_page(cnx, remix_id, record.get("page"), import_datetime)
+    if record.get("fetch") is not None:
+        write_remix_fetch(cnx, record.get("fetch"))
+
+
+def write_change_journal(cnx: sqlite3.Connection, journal: pathlib.Path) -> int:
+    # appends the rows that changed since the last time, and forgets them
+    records = get_row_changes(cnx)
+    if records:
+        text = "".join(f"{json.dumps(r, sort_keys=True)}\n" for r in records)
+        with journal.open("a", encoding="utf_8") as f:
+            f.write(text)
+        _METRICS.count("bytes written", len(text.encode()))
+    with transaction(cnx):
+        cnx.execute("delete from row_change")
+    _METRICS.count("changes written", len(records))
+    return len(records)
+
+
+def write_compressed_files(target: pathlib.Path, data: bytes) -> int:
+    # gzip with a fixed mtime, so the same data always gives the same bytes;
+    # brotli at quality 5 instead of its default of 11, which is many times slower
+    # for files only a few percent smaller
+    written = 0
+    for path in get_compressed_paths(target):
+        if path.suffix == ".br":
+            compressed = brotli.compress(data, quality=5)
+        else:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        path.write_bytes(compressed)
+        written += len(compressed)
+    return written
+
+
+def write_output_file(
+    target: pathlib.Path,
+    content: dict | str,
+    *,
+    compress: bool = False,
+    minify: bool = False,
+) -> dict:
+    if isinstance(content, str):
+        variants = [(target, content.encode())]
+    else:
+        variants = [(target, json.dumps(content, indent=4, sort_keys=True).encode())]
+        if minify:
+            minified = json.dumps(content, separators=(",", ":"), sort_keys=True)
+            variants.append((target.with_suffix(".min.json"), minified.encode()))
+    # copies left by an earlier build with other options would go stale
+    stale = []
+    if not minify and not isinstance(content, str):
+        minified_target = target.with_suffix(".min.json")
+        stale = [minified_target, *get_compressed_paths(minified_target)]
+    result = {
+        "bytes": 0,
+        "sha256": hashlib.sha256(variants[0][1]).hexdigest(),
+        "target": target,
+        "written": False,
+    }
+    for path, data in variants:
+        try:
+            with path.open("rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            unchanged = digest == hashlib.sha256(data).hexdigest()
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            path.write_bytes(data)
+            result["bytes"] += len(data)
+            result["written"] = True
+        # compressed copies are only made again for content that changed
+        if compress and not (
+            unchanged and all(p.exists() for p in get_compressed_paths(path))
+        ):
+            result["bytes"] += write_compressed_files(path, data)
+        elif not compress and not unchanged:
+            stale.extend(get_compressed_paths(path))
+    for path in stale:
+        path.unlink(missing_ok=True)
+    return result
+
+
+def write_output_files(
+    files: collections.abc.Iterable[tuple[pathlib.Path, dict | str]],
+    max_pending: int = 256,
+    *,
+    compress: bool = False,
+    minify: bool = False,
+) -> dict:
+    # JSON documents are serialized and written on a thread pool, or on a process
+    # pool when they are also compressed, which is CPU-bound; each directory is
+    # created once and files whose content has not changed are not rewritten
+    totals = {"bytes": 0, "sha256": {}, "skipped": 0, "written": 0}
+    directories = set()
+
+    def collect(future: concurrent.futures.Future) -> None:
+        result = future.result()
+        totals["bytes"] += result.get("bytes")
+        totals["sha256"][result.get("target")] = result.get("sha256")
+        totals["written" if result.get("written") else "skipped"] += 1
+
+    if compress:
+        executor = concurrent.futures.ProcessPoolExecutor()
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor()
+    with executor as ex:
+        pending = collections.deque()
+        for target, content in files:
+            if target.parent not in directories:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                directories.add(target.parent)
+            pending.append(
+                ex.submit(
+                    write_output_file,
+                    target,
+                    content,
+                    compress=compress,
+                    minify=minify,
+                )
+            )
+            if len(pending) >= max_pending:
+                collect(pending.popleft())
+        for future in pending:
+            collect(future)
+    return totals
+
+
+def write_output_stream(
+    source: pathlib.Path, target: pathlib.Path, *, compress: bool = False
+) -> bool:
+    # moves a file that was written in full into place, unless the target already
+    # has the same content; returns whether the target changed
+    with source.open("rb") as f:
+        sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+    try:
+        with target.open("rb") as f:
+            unchanged = hashlib.file_digest(f, "sha256").hexdigest() == sha256
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        source.unlink()
+    else:
+        source.replace(target)
+    if compress and not (
+        unchanged and all(p.exists() for p in get_compressed_paths(target))
+    ):
+        write_compressed_files(target, target.read_bytes())
+    elif not compress and not unchanged:
+        for path in get_compressed_paths(target):
+            path.unlink(missing_ok=True)
+    return not unchanged
+
+
 def write_remix(cnx: sqlite3.Connection, params: dict) -> None:
+    # import_datetime never goes back, so reparsing an archived page does not
+    # undo a later check
     sql = """
         insert into remix (
             download_url, has_lyrics, id, import_datetime, primary_game,
@@ -491,19 +3161,22 @@ def write_remix(cnx: sqlite3.Connection, params: dict) -> None:
             :primary_game_id, :title, :youtube_url
         ) on conflict (id) do update set
             download_url = excluded.download_url, has_lyrics = excluded.has_lyrics,
-            import_datetime = excluded.import_datetime,
+            import_datetime = max(
+                excluded.import_datetime,
+                coalesce(import_datetime, excluded.import_datetime)
+            ),
             primary_game = excluded.primary_game,
             primary_game_id = excluded.primary_game_id, title = excluded.title,
             youtube_url = excluded.youtube_url
     """
-    with cnx:
+    with transaction(cnx):
         cnx.execute(sql, params)
 
 
 def write_remix_artist(
     cnx: sqlite3.Connection, remix_id: int, artist_ids: list[int]
 ) -> None:
-    with cnx:
+    with transaction(cnx):
         cnx.execute(
             "update remix_artist set _synced = 0 where remix_id = :remix_id",
             {"remix_id": remix_id},
@@ -525,10 +3198,133 @@ def write_remix_artist(
         )
 
 
+def write_remix_change(
+    cnx: sqlite3.Connection, remix_id: int, check_datetime: str, changed: bool
+) -> None:
+    sql = """
+        insert into remix_change (
+            remix_id, first_check_datetime, checks, changes, change_datetime
+        ) values (
+            :remix_id, :check_datetime, 1, :changes,
+            case when :changes then :check_datetime end
+        ) on conflict (remix_id) do update set
+            checks = checks + 1, changes = changes + excluded.changes,
+            change_datetime = coalesce(excluded.change_datetime, change_datetime)
+    """
+    params = {
+        "changes": int(bool(changed)),
+        "check_datetime": check_datetime,
+        "remix_id": remix_id,
+    }
+    with transaction(cnx):
+        cnx.execute(sql, params)
+
+
+def write_remix_fetch(cnx: sqlite3.Connection, params: dict) -> None:
+    sql = """
+        insert into remix_fetch (
+            remix_id, etag, last_modified, page_sha256, fields_sha256
+        ) values (
+            :remix_id, :etag, :last_modified, :page_sha256, :fields_sha256
+        ) on conflict (remix_id) do update set
+            etag = excluded.etag, last_modified = excluded.last_modified,
+            page_sha256 = excluded.page_sha256,
+            fields_sha256 = excluded.fields_sha256
+    """
+    with transaction(cnx):
+        cnx.execute(sql, params)
+
+
+def write_remix_fields_sha256(
+    cnx: sqlite3.Connection, remix_id: int, fields_sha256: str
+) -> None:
+    sql = """
+        insert into remix_fetch (
+            remix_id, fields_sha256
+        ) values (
+            :remix_id, :fields_sha256
+        ) on conflict (remix_id) do update set
+            fields_sha256 = excluded.fields_sha256
+    """
+    params = {
+        "fields_sha256": fields_sha256,
+        "remix_id": remix_id,
+    }
+    with transaction(cnx):
+        cnx.execute(sql, params)
+
+
+def write_remix_found(cnx: sqlite3.Connection, remix_id: int) -> None:
+    sql = "delete from remix_not_found where remix_id = :remix_id"
+    params = {
+        "remix_id": remix_id,
+    }
+    with transaction(cnx):
+        cnx.execute(sql, params)
+
+
+def write_remix_import_datetime(
+    cnx: sqlite3.Connection, remix_id: int, import_datetime: str
+) -> None:
+    sql = "update remix set import_datetime = :import_datetime where id = :id"
+    params = {
+        "id": remix_id,
+        "import_datetime": import_datetime,
+    }
+    with transaction(cnx):
+        cnx.execute(sql, params)
+
+
+def write_remix_not_found(
+    cnx: sqlite3.Connection, remix_id: int, check_datetime: str
+) -> None:
+    sql = """
+        insert into remix_not_found (
+            remix_id, check_datetime
+        ) values (
+            :remix_id, :check_datetime
+        ) on conflict (remix_id) do update set
+            check_datetime = excluded.check_datetime
+    """
+    params = {
+        "check_datetime": check_datetime,
+        "remix_id": remix_id,
+    }
+    with transaction(cnx):
+        cnx.execute(sql, params)
+
+
+def write_remix_page(
+    cnx: sqlite3.Connection,
+    ocr_id: int,
+    page: dict,
+    import_datetime: str | None = None,
+) -> None:
+    write_game(cnx, page.get("game"))
+
+    remix_params = page.get("remix") | {
+        "id": ocr_id,
+        "import_datetime": import_datetime
+        or datetime.datetime.now(tz=datetime.UTC).isoformat(),
+    }
+    write_remix(cnx, remix_params)
+
+    artists = page.get("artists")
+    write_artist_batch(cnx, artists)
+    write_remix_artist(cnx, ocr_id, [a.get("id") for a in artists])
+
+    tags = page.get("tags")
+    write_tag_batch(cnx, tags)
+    write_remix_tags(cnx, ocr_id, [t.get("id") for t in tags])
+
+    write_remix_found(cnx, ocr_id)
+    write_remix_search(cnx, [ocr_id])
+
+
 def write_remix_tags(
     cnx: sqlite3.Connection, remix_id: int, tag_ids: list[str]
 ) -> None:
-    with cnx:
+    with transaction(cnx):
         cnx.execute(
             "update remix_tag set _synced = 0 where remix_id = :remix_id",
             {"remix_id": remix_id},
@@ -550,13 +3346,44 @@ def write_remix_tags(
         )
 
 
+def write_row_changes(cnx: sqlite3.Connection, records: list[dict]) -> None:
+    # applies change journal records in order; each one sets a row to what it was
+    # after the write, so applying a record again does nothing
+    with transaction(cnx):
+        for record in records:
+            table = record.get("table")
+            if record.get("op") == "upsert":
+                row = record.get("row")
+                sql = f"""
+                    insert or replace into "{table}" ({", ".join(row)})
+                    values ({", ".join(f":{c}" for c in row)})
+                """  # noqa: S608
+                cnx.execute(sql, row)
+            else:
+                key = record.get("key")
+                where = " and ".join(f"{c} = :{c}" for c in key)
+                cnx.execute(f'delete from "{table}" where {where}', key)  # noqa: S608
+
+
 def write_tag_batch(cnx: sqlite3.Connection, params: list[dict]) -> None:
     sql = """
         insert into tag (id, path, url) values (:id, :path, :url)
         on conflict (id) do update set path = excluded.path, url = excluded.url
+        where path is not excluded.path or url is not excluded.url
     """
-    with cnx:
+    with transaction(cnx):
+        changes = cnx.total_changes
         cnx.executemany(sql, params)
+        if cnx.total_changes > changes:
+            # a new path changes the search rows of every remix with the tag
+            remix_ids = cnx.execute(
+                """
+                    select remix_id from remix_tag
+                    where tag_id in (select value from json_each(:tag_ids))
+                """,
+                {"tag_ids": json.dumps([p.get("id") for p in params])},
+            )
+            write_remix_search(cnx, [row.remix_id for row in remix_ids])
 
 
 if __name__ == "__main__":